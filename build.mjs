@@ -1,10 +1,15 @@
-import { cpSync, readFileSync, writeFileSync, mkdirSync } from 'fs';
+import { cpSync, readFileSync, writeFileSync, mkdirSync, rmSync, existsSync, readdirSync } from 'fs';
 import { execSync } from 'child_process';
 
-// 1. Bundle + obfuscate JS
+// 1. Bundle + obfuscate JS (chunk names are content-hashed, so start clean)
 console.log('Bundling & obfuscating...');
+rmSync('dist', { recursive: true, force: true });
 execSync('npx rollup -c rollup.config.mjs', { stdio: 'inherit' });
 
+// Every lazily imported data module must have become its own chunk, and no
+// static import may reach it; otherwise it is downloaded at startup again.
+execSync('node tools/check-dist.mjs', { stdio: 'inherit' });
+
 // 2. Copy static assets
 console.log('Copying assets...');
 mkdirSync('dist/css',    { recursive: true });
@@ -16,17 +21,15 @@ cpSync('assets', 'dist/assets', { recursive: true });
 cpSync('node_modules/jspdf/dist/jspdf.umd.min.js', 'dist/jspdf.umd.min.js');
 
 // Copy root-level verification / SEO files if they exist
-import { existsSync } from 'fs';
 for (const file of ['robots.txt', '404.html']) {
     if (existsSync(file)) cpSync(file, `dist/${file}`);
 }
 // Copy any Google Search Console verification HTML files (googleXXXXXXXX.html)
-import { readdirSync } from 'fs';
 for (const file of readdirSync('.')) {
     if (/^google[a-f0-9]+\.html$/.test(file)) cpSync(file, `dist/${file}`);
 }
 
-// 3. Patch index.html — swap the module script tag for the bundle
+// 3. Patch index.html — point the module script tag at the bundled entry
 console.log('Patching index.html...');
 const html = readFileSync('index.html', 'utf8')
     .replace(
@@ -35,7 +38,7 @@ const html = readFileSync('index.html', 'utf8')
     )
     .replace(
         '<script type="module" src="js/main.js"></script>',
-        '<script src="bundle.js"></script>'
+        '<script type="module" src="main.js"></script>'
     );
 writeFileSync('dist/index.html', html);
 
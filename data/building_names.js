@@ -0,0 +1,4 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// Lazily imported building-name tables, one module per locale (see js/BuildingNames.js).
+export const NAME_TABLES = {
+};
@@ -0,0 +1,17 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 13 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_AgeBonus22a": { prod: {"BronzeAge":{"population":81,"demandHappiness":81,"supplies_24h":576},"IronAge":{"population":173,"demandHappiness":173,"supplies_24h":787},"EarlyMiddleAge":{"population":266,"demandHappiness":266,"supplies_24h":871},"HighMiddleAge":{"population":374,"demandHappiness":374,"supplies_24h":967},"LateMiddleAge":{"population":491,"demandHappiness":491,"supplies_24h":1080},"ColonialAge":{"population":620,"demandHappiness":620,"supplies_24h":1271},"IndustrialAge":{"population":757,"demandHappiness":757,"supplies_24h":1434},"ProgressiveEra":{"population":904,"demandHappiness":904,"supplies_24h":1575},"ModernEra":{"population":1061,"demandHappiness":1061,"supplies_24h":1687},"PostModernEra":{"population":1222,"demandHappiness":1222,"supplies_24h":1755},"ContemporaryEra":{"population":1393,"demandHappiness":1393,"supplies_24h":2041},"TomorrowEra":{"population":1570,"demandHappiness":1570,"supplies_24h":2475},"FutureEra":{"population":1755,"demandHappiness":1755,"supplies_24h":2964},"ArcticFuture":{"population":1947,"demandHappiness":1947,"supplies_24h":3453},"OceanicFuture":{"population":2145,"demandHappiness":2145,"supplies_24h":3987},"VirtualFuture":{"population":2349,"demandHappiness":2349,"supplies_24h":4764},"SpaceAgeMars":{"population":3718,"demandHappiness":3718,"supplies_24h":7621},"SpaceAgeAsteroidBelt":{"population":4040,"demandHappiness":4040,"supplies_24h":8280},"SpaceAgeVenus":{"population":4366,"demandHappiness":4366,"supplies_24h":8949},"SpaceAgeJupiterMoon":{"population":4715,"demandHappiness":4715,"supplies_24h":9665},"SpaceAgeTitan":{"population":5092,"demandHappiness":5092,"supplies_24h":10439},"SpaceAgeSpaceHub":{"population":5469,"demandHappiness":5469,"supplies_24h":11213}} },
+    "W_MultiAge_AgeBonus22j": { prod: {"BronzeAge":{"population":99,"demandHappiness":99,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":805},"IronAge":{"population":221,"demandHappiness":221,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":1104},"EarlyMiddleAge":{"population":341,"demandHappiness":341,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":1222},"HighMiddleAge":{"population":483,"demandHappiness":483,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":1357},"LateMiddleAge":{"population":637,"demandHappiness":637,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":1517},"ColonialAge":{"population":804,"demandHappiness":804,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":1787},"IndustrialAge":{"population":983,"demandHappiness":983,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":2016},"ProgressiveEra":{"population":1175,"demandHappiness":1175,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":2214},"ModernEra":{"population":1377,"demandHappiness":1377,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":2372},"PostModernEra":{"population":1588,"demandHappiness":1588,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":2467},"ContemporaryEra":{"population":1812,"demandHappiness":1812,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":2871},"TomorrowEra":{"population":2043,"demandHappiness":2043,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":3483},"FutureEra":{"population":2284,"demandHappiness":2284,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":4172},"ArcticFuture":{"population":2534,"demandHappiness":2534,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":4861},"OceanicFuture":{"population":2795,"demandHappiness":2795,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":5613},"VirtualFuture":{"population":3060,"demandHappiness":3060,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":6707},"SpaceAgeMars":{"population":4847,"demandHappiness":4847,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":10733},"SpaceAgeAsteroidBelt":{"population":5266,"demandHappiness":5266,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":11662},"SpaceAgeVenus":{"population":5690,"demandHappiness":5690,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":12604},"SpaceAgeJupiterMoon":{"population":6147,"demandHappiness":6147,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":13613},"SpaceAgeTitan":{"population":6639,"demandHappiness":6639,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":14705},"SpaceAgeSpaceHub":{"population":7131,"demandHappiness":7131,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"supplies_24h":15797}}, boosts: [{"type":"def_boost_attacker","value":11,"feature":"all"}] },
+    "W_MultiAge_AgeBonus22b": { prod: {"BronzeAge":{"population":83,"demandHappiness":83,"supplies_24h":593},"IronAge":{"population":178,"demandHappiness":178,"supplies_24h":810},"EarlyMiddleAge":{"population":273,"demandHappiness":273,"supplies_24h":897},"HighMiddleAge":{"population":385,"demandHappiness":385,"supplies_24h":996},"LateMiddleAge":{"population":505,"demandHappiness":505,"supplies_24h":1112},"ColonialAge":{"population":638,"demandHappiness":638,"supplies_24h":1309},"IndustrialAge":{"population":779,"demandHappiness":779,"supplies_24h":1477},"ProgressiveEra":{"population":931,"demandHappiness":931,"supplies_24h":1622},"ModernEra":{"population":1092,"demandHappiness":1092,"supplies_24h":1737},"PostModernEra":{"population":1258,"demandHappiness":1258,"supplies_24h":1807},"ContemporaryEra":{"population":1434,"demandHappiness":1434,"supplies_24h":2102},"TomorrowEra":{"population":1617,"demandHappiness":1617,"supplies_24h":2549},"FutureEra":{"population":1807,"demandHappiness":1807,"supplies_24h":3052},"ArcticFuture":{"population":2005,"demandHappiness":2005,"supplies_24h":3556},"OceanicFuture":{"population":2209,"demandHappiness":2209,"supplies_24h":4106},"VirtualFuture":{"population":2419,"demandHappiness":2419,"supplies_24h":4906},"SpaceAgeMars":{"population":3829,"demandHappiness":3829,"supplies_24h":7849},"SpaceAgeAsteroidBelt":{"population":4161,"demandHappiness":4161,"supplies_24h":8528},"SpaceAgeVenus":{"population":4496,"demandHappiness":4496,"supplies_24h":9217},"SpaceAgeJupiterMoon":{"population":4856,"demandHappiness":4856,"supplies_24h":9954},"SpaceAgeTitan":{"population":5244,"demandHappiness":5244,"supplies_24h":10752},"SpaceAgeSpaceHub":{"population":5632,"demandHappiness":5632,"supplies_24h":11550}} },
+    "W_MultiAge_AgeBonus22c": { prod: {"BronzeAge":{"population":85,"demandHappiness":85,"supplies_24h":610},"IronAge":{"population":183,"demandHappiness":183,"supplies_24h":834},"EarlyMiddleAge":{"population":281,"demandHappiness":281,"supplies_24h":923},"HighMiddleAge":{"population":396,"demandHappiness":396,"supplies_24h":1025},"LateMiddleAge":{"population":520,"demandHappiness":520,"supplies_24h":1145},"ColonialAge":{"population":657,"demandHappiness":657,"supplies_24h":1348},"IndustrialAge":{"population":802,"demandHappiness":802,"supplies_24h":1521},"ProgressiveEra":{"population":958,"demandHappiness":958,"supplies_24h":1670},"ModernEra":{"population":1124,"demandHappiness":1124,"supplies_24h":1789},"PostModernEra":{"population":1295,"demandHappiness":1295,"supplies_24h":1861},"ContemporaryEra":{"population":1477,"demandHappiness":1477,"supplies_24h":2165},"TomorrowEra":{"population":1665,"demandHappiness":1665,"supplies_24h":2625},"FutureEra":{"population":1861,"demandHappiness":1861,"supplies_24h":3143},"ArcticFuture":{"population":2065,"demandHappiness":2065,"supplies_24h":3662},"OceanicFuture":{"population":2275,"demandHappiness":2275,"supplies_24h":4229},"VirtualFuture":{"population":2491,"demandHappiness":2491,"supplies_24h":5053},"SpaceAgeMars":{"population":3943,"demandHappiness":3943,"supplies_24h":8084},"SpaceAgeAsteroidBelt":{"population":4285,"demandHappiness":4285,"supplies_24h":8783},"SpaceAgeVenus":{"population":4630,"demandHappiness":4630,"supplies_24h":9493},"SpaceAgeJupiterMoon":{"population":5001,"demandHappiness":5001,"supplies_24h":10252},"SpaceAgeTitan":{"population":5401,"demandHappiness":5401,"supplies_24h":11074},"SpaceAgeSpaceHub":{"population":5801,"demandHappiness":5801,"supplies_24h":11896}} },
+    "W_MultiAge_AgeBonus22d": { prod: {"BronzeAge":{"population":87,"demandHappiness":87,"strategy_points_24h":1,"supplies_24h":628},"IronAge":{"population":188,"demandHappiness":188,"strategy_points_24h":1,"supplies_24h":859},"EarlyMiddleAge":{"population":289,"demandHappiness":289,"strategy_points_24h":1,"supplies_24h":950},"HighMiddleAge":{"population":407,"demandHappiness":407,"strategy_points_24h":1,"supplies_24h":1055},"LateMiddleAge":{"population":535,"demandHappiness":535,"strategy_points_24h":1,"supplies_24h":1179},"ColonialAge":{"population":676,"demandHappiness":676,"strategy_points_24h":1,"supplies_24h":1388},"IndustrialAge":{"population":826,"demandHappiness":826,"strategy_points_24h":1,"supplies_24h":1566},"ProgressiveEra":{"population":986,"demandHappiness":986,"strategy_points_24h":1,"supplies_24h":1720},"ModernEra":{"population":1157,"demandHappiness":1157,"strategy_points_24h":1,"supplies_24h":1842},"PostModernEra":{"population":1333,"demandHappiness":1333,"strategy_points_24h":1,"supplies_24h":1916},"ContemporaryEra":{"population":1521,"demandHappiness":1521,"strategy_points_24h":1,"supplies_24h":2229},"TomorrowEra":{"population":1714,"demandHappiness":1714,"strategy_points_24h":1,"supplies_24h":2703},"FutureEra":{"population":1916,"demandHappiness":1916,"strategy_points_24h":1,"supplies_24h":3237},"ArcticFuture":{"population":2126,"demandHappiness":2126,"strategy_points_24h":1,"supplies_24h":3771},"OceanicFuture":{"population":2343,"demandHappiness":2343,"strategy_points_24h":1,"supplies_24h":4355},"VirtualFuture":{"population":2565,"demandHappiness":2565,"strategy_points_24h":1,"supplies_24h":5204},"SpaceAgeMars":{"population":4061,"demandHappiness":4061,"strategy_points_24h":1,"supplies_24h":8326},"SpaceAgeAsteroidBelt":{"population":4413,"demandHappiness":4413,"strategy_points_24h":1,"supplies_24h":9046},"SpaceAgeVenus":{"population":4768,"demandHappiness":4768,"strategy_points_24h":1,"supplies_24h":9777},"SpaceAgeJupiterMoon":{"population":5151,"demandHappiness":5151,"strategy_points_24h":1,"supplies_24h":10559},"SpaceAgeTitan":{"population":5563,"demandHappiness":5563,"strategy_points_24h":1,"supplies_24h":11406},"SpaceAgeSpaceHub":{"population":5975,"demandHappiness":5975,"strategy_points_24h":1,"supplies_24h":12253}} },
+    "W_MultiAge_AgeBonus22e": { prod: {"BronzeAge":{"population":89,"demandHappiness":89,"strategy_points_24h":2,"supplies_24h":646},"IronAge":{"population":193,"demandHappiness":193,"strategy_points_24h":2,"supplies_24h":884},"EarlyMiddleAge":{"population":297,"demandHappiness":297,"strategy_points_24h":2,"supplies_24h":978},"HighMiddleAge":{"population":419,"demandHappiness":419,"strategy_points_24h":2,"supplies_24h":1086},"LateMiddleAge":{"population":551,"demandHappiness":551,"strategy_points_24h":2,"supplies_24h":1214},"ColonialAge":{"population":696,"demandHappiness":696,"strategy_points_24h":2,"supplies_24h":1429},"IndustrialAge":{"population":850,"demandHappiness":850,"strategy_points_24h":2,"supplies_24h":1612},"ProgressiveEra":{"population":1015,"demandHappiness":1015,"strategy_points_24h":2,"supplies_24h":1771},"ModernEra":{"population":1191,"demandHappiness":1191,"strategy_points_24h":2,"supplies_24h":1897},"PostModernEra":{"population":1372,"demandHappiness":1372,"strategy_points_24h":2,"supplies_24h":1973},"ContemporaryEra":{"population":1566,"demandHappiness":1566,"strategy_points_24h":2,"supplies_24h":2295},"TomorrowEra":{"population":1765,"demandHappiness":1765,"strategy_points_24h":2,"supplies_24h":2784},"FutureEra":{"population":1973,"demandHappiness":1973,"strategy_points_24h":2,"supplies_24h":3334},"ArcticFuture":{"population":2189,"demandHappiness":2189,"strategy_points_24h":2,"supplies_24h":3884},"OceanicFuture":{"population":2413,"demandHappiness":2413,"strategy_points_24h":2,"supplies_24h":4485},"VirtualFuture":{"population":2641,"demandHappiness":2641,"strategy_points_24h":2,"supplies_24h":5360},"SpaceAgeMars":{"population":4182,"demandHappiness":4182,"strategy_points_24h":2,"supplies_24h":8575},"SpaceAgeAsteroidBelt":{"population":4545,"demandHappiness":4545,"strategy_points_24h":2,"supplies_24h":9317},"SpaceAgeVenus":{"population":4911,"demandHappiness":4911,"strategy_points_24h":2,"supplies_24h":10070},"SpaceAgeJupiterMoon":{"population":5305,"demandHappiness":5305,"strategy_points_24h":2,"supplies_24h":10875},"SpaceAgeTitan":{"population":5729,"demandHappiness":5729,"strategy_points_24h":2,"supplies_24h":11748},"SpaceAgeSpaceHub":{"population":6153,"demandHappiness":6153,"strategy_points_24h":2,"supplies_24h":12621}} },
+    "W_MultiAge_AgeBonus22f": { prod: {"BronzeAge":{"population":91,"demandHappiness":91,"strategy_points_24h":3,"supplies_24h":671},"IronAge":{"population":198,"demandHappiness":198,"strategy_points_24h":3,"supplies_24h":919},"EarlyMiddleAge":{"population":305,"demandHappiness":305,"strategy_points_24h":3,"supplies_24h":1017},"HighMiddleAge":{"population":431,"demandHappiness":431,"strategy_points_24h":3,"supplies_24h":1129},"LateMiddleAge":{"population":567,"demandHappiness":567,"strategy_points_24h":3,"supplies_24h":1262},"ColonialAge":{"population":716,"demandHappiness":716,"strategy_points_24h":3,"supplies_24h":1486},"IndustrialAge":{"population":875,"demandHappiness":875,"strategy_points_24h":3,"supplies_24h":1676},"ProgressiveEra":{"population":1045,"demandHappiness":1045,"strategy_points_24h":3,"supplies_24h":1841},"ModernEra":{"population":1226,"demandHappiness":1226,"strategy_points_24h":3,"supplies_24h":1972},"PostModernEra":{"population":1413,"demandHappiness":1413,"strategy_points_24h":3,"supplies_24h":2051},"ContemporaryEra":{"population":1612,"demandHappiness":1612,"strategy_points_24h":3,"supplies_24h":2386},"TomorrowEra":{"population":1817,"demandHappiness":1817,"strategy_points_24h":3,"supplies_24h":2895},"FutureEra":{"population":2032,"demandHappiness":2032,"strategy_points_24h":3,"supplies_24h":3467},"ArcticFuture":{"population":2254,"demandHappiness":2254,"strategy_points_24h":3,"supplies_24h":4039},"OceanicFuture":{"population":2485,"demandHappiness":2485,"strategy_points_24h":3,"supplies_24h":4664},"VirtualFuture":{"population":2720,"demandHappiness":2720,"strategy_points_24h":3,"supplies_24h":5574},"SpaceAgeMars":{"population":4307,"demandHappiness":4307,"strategy_points_24h":3,"supplies_24h":8918},"SpaceAgeAsteroidBelt":{"population":4681,"demandHappiness":4681,"strategy_points_24h":3,"supplies_24h":9689},"SpaceAgeVenus":{"population":5058,"demandHappiness":5058,"strategy_points_24h":3,"supplies_24h":10472},"SpaceAgeJupiterMoon":{"population":5464,"demandHappiness":5464,"strategy_points_24h":3,"supplies_24h":11310},"SpaceAgeTitan":{"population":5900,"demandHappiness":5900,"strategy_points_24h":3,"supplies_24h":12217},"SpaceAgeSpaceHub":{"population":6336,"demandHappiness":6336,"strategy_points_24h":3,"supplies_24h":13124}} },
+    "W_MultiAge_AgeBonus22g": { prod: {"BronzeAge":{"population":93,"demandHappiness":93,"strategy_points_24h":4,"supplies_24h":697},"IronAge":{"population":203,"demandHappiness":203,"strategy_points_24h":4,"supplies_24h":955},"EarlyMiddleAge":{"population":314,"demandHappiness":314,"strategy_points_24h":4,"supplies_24h":1057},"HighMiddleAge":{"population":443,"demandHappiness":443,"strategy_points_24h":4,"supplies_24h":1174},"LateMiddleAge":{"population":584,"demandHappiness":584,"strategy_points_24h":4,"supplies_24h":1312},"ColonialAge":{"population":737,"demandHappiness":737,"strategy_points_24h":4,"supplies_24h":1545},"IndustrialAge":{"population":901,"demandHappiness":901,"strategy_points_24h":4,"supplies_24h":1743},"ProgressiveEra":{"population":1076,"demandHappiness":1076,"strategy_points_24h":4,"supplies_24h":1914},"ModernEra":{"population":1262,"demandHappiness":1262,"strategy_points_24h":4,"supplies_24h":2050},"PostModernEra":{"population":1455,"demandHappiness":1455,"strategy_points_24h":4,"supplies_24h":2133},"ContemporaryEra":{"population":1660,"demandHappiness":1660,"strategy_points_24h":4,"supplies_24h":2481},"TomorrowEra":{"population":1871,"demandHappiness":1871,"strategy_points_24h":4,"supplies_24h":3010},"FutureEra":{"population":2092,"demandHappiness":2092,"strategy_points_24h":4,"supplies_24h":3605},"ArcticFuture":{"population":2321,"demandHappiness":2321,"strategy_points_24h":4,"supplies_24h":4200},"OceanicFuture":{"population":2559,"demandHappiness":2559,"strategy_points_24h":4,"supplies_24h":4850},"VirtualFuture":{"population":2801,"demandHappiness":2801,"strategy_points_24h":4,"supplies_24h":5796},"SpaceAgeMars":{"population":4436,"demandHappiness":4436,"strategy_points_24h":4,"supplies_24h":9274},"SpaceAgeAsteroidBelt":{"population":4821,"demandHappiness":4821,"strategy_points_24h":4,"supplies_24h":10076},"SpaceAgeVenus":{"population":5209,"demandHappiness":5209,"strategy_points_24h":4,"supplies_24h":10890},"SpaceAgeJupiterMoon":{"population":5627,"demandHappiness":5627,"strategy_points_24h":4,"supplies_24h":11762},"SpaceAgeTitan":{"population":6077,"demandHappiness":6077,"strategy_points_24h":4,"supplies_24h":12705},"SpaceAgeSpaceHub":{"population":6527,"demandHappiness":6527,"strategy_points_24h":4,"supplies_24h":13648}}, boosts: [{"type":"def_boost_attacker","value":4,"feature":"all"}] },
+    "W_MultiAge_AgeBonus22h": { prod: {"BronzeAge":{"population":95,"demandHappiness":95,"strategy_points_24h":6,"supplies_24h":724},"IronAge":{"population":209,"demandHappiness":209,"strategy_points_24h":6,"supplies_24h":993},"EarlyMiddleAge":{"population":323,"demandHappiness":323,"strategy_points_24h":6,"supplies_24h":1099},"HighMiddleAge":{"population":456,"demandHappiness":456,"strategy_points_24h":6,"supplies_24h":1220},"LateMiddleAge":{"population":601,"demandHappiness":601,"strategy_points_24h":6,"supplies_24h":1364},"ColonialAge":{"population":759,"demandHappiness":759,"strategy_points_24h":6,"supplies_24h":1606},"IndustrialAge":{"population":928,"demandHappiness":928,"strategy_points_24h":6,"supplies_24h":1812},"ProgressiveEra":{"population":1108,"demandHappiness":1108,"strategy_points_24h":6,"supplies_24h":1990},"ModernEra":{"population":1299,"demandHappiness":1299,"strategy_points_24h":6,"supplies_24h":2132},"PostModernEra":{"population":1498,"demandHappiness":1498,"strategy_points_24h":6,"supplies_24h":2218},"ContemporaryEra":{"population":1709,"demandHappiness":1709,"strategy_points_24h":6,"supplies_24h":2580},"TomorrowEra":{"population":1927,"demandHappiness":1927,"strategy_points_24h":6,"supplies_24h":3130},"FutureEra":{"population":2154,"demandHappiness":2154,"strategy_points_24h":6,"supplies_24h":3749},"ArcticFuture":{"population":2390,"demandHappiness":2390,"strategy_points_24h":6,"supplies_24h":4368},"OceanicFuture":{"population":2635,"demandHappiness":2635,"strategy_points_24h":6,"supplies_24h":5044},"VirtualFuture":{"population":2885,"demandHappiness":2885,"strategy_points_24h":6,"supplies_24h":6027},"SpaceAgeMars":{"population":4569,"demandHappiness":4569,"strategy_points_24h":6,"supplies_24h":9644},"SpaceAgeAsteroidBelt":{"population":4965,"demandHappiness":4965,"strategy_points_24h":6,"supplies_24h":10479},"SpaceAgeVenus":{"population":5365,"demandHappiness":5365,"strategy_points_24h":6,"supplies_24h":11325},"SpaceAgeJupiterMoon":{"population":5795,"demandHappiness":5795,"strategy_points_24h":6,"supplies_24h":12232},"SpaceAgeTitan":{"population":6259,"demandHappiness":6259,"strategy_points_24h":6,"supplies_24h":13213},"SpaceAgeSpaceHub":{"population":6723,"demandHappiness":6723,"strategy_points_24h":6,"supplies_24h":14194}}, boosts: [{"type":"def_boost_attacker","value":7,"feature":"all"}] },
+    "W_MultiAge_AgeBonus22i": { prod: {"BronzeAge":{"population":97,"demandHappiness":97,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":760},"IronAge":{"population":215,"demandHappiness":215,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":1042},"EarlyMiddleAge":{"population":332,"demandHappiness":332,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":1153},"HighMiddleAge":{"population":469,"demandHappiness":469,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":1281},"LateMiddleAge":{"population":619,"demandHappiness":619,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":1432},"ColonialAge":{"population":781,"demandHappiness":781,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":1686},"IndustrialAge":{"population":955,"demandHappiness":955,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":1902},"ProgressiveEra":{"population":1141,"demandHappiness":1141,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":2089},"ModernEra":{"population":1337,"demandHappiness":1337,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":2238},"PostModernEra":{"population":1542,"demandHappiness":1542,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":2328},"ContemporaryEra":{"population":1760,"demandHappiness":1760,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":2709},"TomorrowEra":{"population":1984,"demandHappiness":1984,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":3286},"FutureEra":{"population":2218,"demandHappiness":2218,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":3936},"ArcticFuture":{"population":2461,"demandHappiness":2461,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":4586},"OceanicFuture":{"population":2714,"demandHappiness":2714,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":5296},"VirtualFuture":{"population":2971,"demandHappiness":2971,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":6328},"SpaceAgeMars":{"population":4706,"demandHappiness":4706,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":10126},"SpaceAgeAsteroidBelt":{"population":5113,"demandHappiness":5113,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":11002},"SpaceAgeVenus":{"population":5525,"demandHappiness":5525,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":11891},"SpaceAgeJupiterMoon":{"population":5968,"demandHappiness":5968,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":12843},"SpaceAgeTitan":{"population":6446,"demandHappiness":6446,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":13873},"SpaceAgeSpaceHub":{"population":6924,"demandHappiness":6924,"strategy_points_24h":8,"all_goods_of_previous_age_24h":5,"supplies_24h":14903}}, boosts: [{"type":"def_boost_attacker","value":9,"feature":"all"}] },
+    "W_MultiAge_AgeBonus22": { prod: {"BronzeAge":{"population":82,"happiness":90,"demandHappiness":82,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"IronAge":{"population":179,"happiness":196,"demandHappiness":179,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"EarlyMiddleAge":{"population":276,"happiness":303,"demandHappiness":276,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"HighMiddleAge":{"population":389,"happiness":427,"demandHappiness":389,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"LateMiddleAge":{"population":512,"happiness":563,"demandHappiness":512,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"ColonialAge":{"population":647,"happiness":711,"demandHappiness":647,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"IndustrialAge":{"population":790,"happiness":869,"demandHappiness":790,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"ProgressiveEra":{"population":943,"happiness":1037,"demandHappiness":943,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"ModernEra":{"population":1107,"happiness":1217,"demandHappiness":1107,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"PostModernEra":{"population":1275,"happiness":1402,"demandHappiness":1275,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"ContemporaryEra":{"population":1456,"happiness":1601,"demandHappiness":1456,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"TomorrowEra":{"population":1641,"happiness":1805,"demandHappiness":1641,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"FutureEra":{"population":1834,"happiness":2017,"demandHappiness":1834,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"ArcticFuture":{"population":2035,"happiness":2238,"demandHappiness":2035,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"OceanicFuture":{"population":2244,"happiness":2468,"demandHappiness":2244,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"VirtualFuture":{"population":2456,"happiness":2701,"demandHappiness":2456,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"SpaceAgeMars":{"population":3889,"happiness":4277,"demandHappiness":3889,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"SpaceAgeAsteroidBelt":{"population":4226,"happiness":4648,"demandHappiness":4226,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"SpaceAgeVenus":{"population":4567,"happiness":5023,"demandHappiness":4567,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"SpaceAgeJupiterMoon":{"population":4933,"happiness":5425,"demandHappiness":4933,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"SpaceAgeTitan":{"population":5329,"happiness":5860,"demandHappiness":5329,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15},"SpaceAgeSpaceHub":{"population":5725,"happiness":6295,"demandHappiness":5725,"strategy_points_24h":4,"all_goods_of_previous_age_24h":15}}, boosts: [{"type":"att_boost_attacker","value":7,"feature":"all"}] },
+    "W_MultiAge_AgeBonus22stage": { prod: {"BronzeAge":{"population":220,"happiness":890,"demandHappiness":220,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"IronAge":{"population":470,"happiness":1540,"demandHappiness":470,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"EarlyMiddleAge":{"population":710,"happiness":1700,"demandHappiness":710,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"HighMiddleAge":{"population":1000,"happiness":1900,"demandHappiness":1000,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"LateMiddleAge":{"population":1320,"happiness":2120,"demandHappiness":1320,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"ColonialAge":{"population":1660,"happiness":2490,"demandHappiness":1660,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"IndustrialAge":{"population":2030,"happiness":2810,"demandHappiness":2030,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"ProgressiveEra":{"population":2420,"happiness":3090,"demandHappiness":2420,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"ModernEra":{"population":2840,"happiness":3300,"demandHappiness":2840,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"PostModernEra":{"population":3270,"happiness":3440,"demandHappiness":3270,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"ContemporaryEra":{"population":3730,"happiness":4000,"demandHappiness":3730,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"TomorrowEra":{"population":4200,"happiness":4850,"demandHappiness":4200,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"FutureEra":{"population":4700,"happiness":5810,"demandHappiness":4700,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"ArcticFuture":{"population":5210,"happiness":6770,"demandHappiness":5210,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"OceanicFuture":{"population":5740,"happiness":7810,"demandHappiness":5740,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"VirtualFuture":{"population":6290,"happiness":9330,"demandHappiness":6290,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"SpaceAgeMars":{"population":9950,"happiness":14930,"demandHappiness":9950,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"SpaceAgeAsteroidBelt":{"population":10810,"happiness":16220,"demandHappiness":10810,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"SpaceAgeVenus":{"population":11690,"happiness":17530,"demandHappiness":11690,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"SpaceAgeJupiterMoon":{"population":12590,"happiness":18880,"demandHappiness":12590,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"SpaceAgeTitan":{"population":13500,"happiness":20250,"demandHappiness":13500,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125},"SpaceAgeSpaceHub":{"population":14410,"happiness":21620,"demandHappiness":14410,"strategy_points_24h":22,"all_goods_of_previous_age_24h":125}}, boosts: [{"type":"att_boost_attacker","value":7,"feature":"all"},{"type":"att_boost_attacker","value":24,"feature":"battleground"},{"type":"att_boost_attacker","value":20,"feature":"guild_expedition"},{"type":"att_boost_defender","value":12,"feature":"all"},{"type":"att_boost_defender","value":28,"feature":"battleground"},{"type":"att_boost_defender","value":20,"feature":"guild_expedition"}] },
+    "W_MultiAge_AgeBonus22k": { prod: {"BronzeAge":{"population":260,"happiness":1090,"demandHappiness":260,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":1960},"IronAge":{"population":570,"happiness":1880,"demandHappiness":570,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":4700},"EarlyMiddleAge":{"population":870,"happiness":2080,"demandHappiness":870,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":7830},"HighMiddleAge":{"population":1230,"happiness":2320,"demandHappiness":1230,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":10970},"LateMiddleAge":{"population":1610,"happiness":2590,"demandHappiness":1610,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":14490},"ColonialAge":{"population":2030,"happiness":3040,"demandHappiness":2030,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":18410},"IndustrialAge":{"population":2480,"happiness":3430,"demandHappiness":2480,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":22330},"ProgressiveEra":{"population":2960,"happiness":3770,"demandHappiness":2960,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":26240},"ModernEra":{"population":3470,"happiness":4030,"demandHappiness":3470,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":30550},"PostModernEra":{"population":4000,"happiness":4200,"demandHappiness":4000,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":34860},"ContemporaryEra":{"population":4560,"happiness":4880,"demandHappiness":4560,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":39170},"TomorrowEra":{"population":5140,"happiness":5930,"demandHappiness":5140,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":43870},"FutureEra":{"population":5750,"happiness":7100,"demandHappiness":5750,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":48180},"ArcticFuture":{"population":6370,"happiness":8270,"demandHappiness":6370,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":52880},"OceanicFuture":{"population":7020,"happiness":9550,"demandHappiness":7020,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":57970},"VirtualFuture":{"population":7690,"happiness":11400,"demandHappiness":7690,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":62670},"SpaceAgeMars":{"population":12170,"happiness":18250,"demandHappiness":12170,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":101450},"SpaceAgeAsteroidBelt":{"population":13220,"happiness":19830,"demandHappiness":13220,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":108890},"SpaceAgeVenus":{"population":14280,"happiness":21420,"demandHappiness":14280,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":116720},"SpaceAgeJupiterMoon":{"population":15380,"happiness":23080,"demandHappiness":15380,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":124170},"SpaceAgeTitan":{"population":16500,"happiness":24750,"demandHappiness":16500,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":132000},"SpaceAgeSpaceHub":{"population":17620,"happiness":26420,"demandHappiness":17620,"strategy_points_24h":30,"all_goods_of_previous_age_24h":140,"supplies_24h":139830}}, boosts: [{"type":"def_boost_attacker","value":11,"feature":"all"},{"type":"def_boost_attacker","value":59,"feature":"battleground"},{"type":"def_boost_attacker","value":48,"feature":"guild_expedition"},{"type":"def_boost_defender","value":21,"feature":"all"},{"type":"def_boost_defender","value":70,"feature":"battleground"},{"type":"def_boost_defender","value":58,"feature":"guild_expedition"}] },
+};
@@ -0,0 +1,457 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 453 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "R_MultiAge_CarnivalBonus19c": { prod: {"BronzeAge":{"population":45,"demandHappiness":45,"money_24h":300},"IronAge":{"population":96,"demandHappiness":96,"money_24h":700},"EarlyMiddleAge":{"population":147,"demandHappiness":147,"money_24h":1200},"HighMiddleAge":{"population":206,"demandHappiness":206,"money_24h":1700},"LateMiddleAge":{"population":271,"demandHappiness":271,"money_24h":2200},"ColonialAge":{"population":342,"demandHappiness":342,"money_24h":3400},"IndustrialAge":{"population":417,"demandHappiness":417,"money_24h":4200},"ProgressiveEra":{"population":498,"demandHappiness":498,"money_24h":5100},"ModernEra":{"population":584,"demandHappiness":584,"money_24h":6400},"PostModernEra":{"population":673,"demandHappiness":673,"money_24h":8000},"ContemporaryEra":{"population":767,"demandHappiness":767,"money_24h":10400},"TomorrowEra":{"population":865,"demandHappiness":865,"money_24h":12100},"FutureEra":{"population":967,"demandHappiness":967,"money_24h":13800},"ArcticFuture":{"population":1073,"demandHappiness":1073,"money_24h":15700},"OceanicFuture":{"population":1181,"demandHappiness":1181,"money_24h":17700},"VirtualFuture":{"population":1294,"demandHappiness":1294,"money_24h":19800},"SpaceAgeMars":{"population":2048,"demandHappiness":2048,"money_24h":33100},"SpaceAgeAsteroidBelt":{"population":2224,"demandHappiness":2224,"money_24h":36700},"SpaceAgeVenus":{"population":2404,"demandHappiness":2404,"money_24h":40500},"SpaceAgeJupiterMoon":{"population":2589,"demandHappiness":2589,"money_24h":44400},"SpaceAgeTitan":{"population":2777,"demandHappiness":2777,"money_24h":48600},"SpaceAgeSpaceHub":{"population":2970,"demandHappiness":2970,"money_24h":52900}} },
+    "R_MultiAge_CarnivalBonus19a": { prod: {"BronzeAge":{"population":81,"demandHappiness":81,"money_24h":250},"IronAge":{"population":174,"demandHappiness":174,"money_24h":400},"EarlyMiddleAge":{"population":267,"demandHappiness":267,"money_24h":700},"HighMiddleAge":{"population":375,"demandHappiness":375,"money_24h":900},"LateMiddleAge":{"population":492,"demandHappiness":492,"money_24h":1200},"ColonialAge":{"population":621,"demandHappiness":621,"money_24h":1900},"IndustrialAge":{"population":759,"demandHappiness":759,"money_24h":2300},"ProgressiveEra":{"population":906,"demandHappiness":906,"money_24h":2800},"ModernEra":{"population":1062,"demandHappiness":1062,"money_24h":3500},"PostModernEra":{"population":1224,"demandHappiness":1224,"money_24h":4400},"ContemporaryEra":{"population":1395,"demandHappiness":1395,"money_24h":5700},"TomorrowEra":{"population":1572,"demandHappiness":1572,"money_24h":6600},"FutureEra":{"population":1758,"demandHappiness":1758,"money_24h":7600},"ArcticFuture":{"population":1950,"demandHappiness":1950,"money_24h":8600},"OceanicFuture":{"population":2148,"demandHappiness":2148,"money_24h":9700},"VirtualFuture":{"population":2352,"demandHappiness":2352,"money_24h":10900},"SpaceAgeMars":{"population":3723,"demandHappiness":3723,"money_24h":18200},"SpaceAgeAsteroidBelt":{"population":4044,"demandHappiness":4044,"money_24h":20200},"SpaceAgeVenus":{"population":4371,"demandHappiness":4371,"money_24h":22300},"SpaceAgeJupiterMoon":{"population":4707,"demandHappiness":4707,"money_24h":24400},"SpaceAgeTitan":{"population":5049,"demandHappiness":5049,"money_24h":26700},"SpaceAgeSpaceHub":{"population":5400,"demandHappiness":5400,"money_24h":29100}} },
+    "D_MultiAge_CarnivalBonus19a": { prod: {"BronzeAge":{"happiness":180},"IronAge":{"happiness":280},"EarlyMiddleAge":{"happiness":320},"HighMiddleAge":{"happiness":370},"LateMiddleAge":{"happiness":430},"ColonialAge":{"happiness":510},"IndustrialAge":{"happiness":570},"ProgressiveEra":{"happiness":630},"ModernEra":{"happiness":670},"PostModernEra":{"happiness":700},"ContemporaryEra":{"happiness":820},"TomorrowEra":{"happiness":990},"FutureEra":{"happiness":1230},"ArcticFuture":{"happiness":1430},"OceanicFuture":{"happiness":1710},"VirtualFuture":{"happiness":2050},"SpaceAgeMars":{"happiness":3270},"SpaceAgeAsteroidBelt":{"happiness":3560},"SpaceAgeVenus":{"happiness":3840},"SpaceAgeJupiterMoon":{"happiness":4140},"SpaceAgeTitan":{"happiness":4440},"SpaceAgeSpaceHub":{"happiness":4750}} },
+    "A_MultiAge_CarnivalBonus19a": { prod: {"BronzeAge":{"happiness":170},"IronAge":{"happiness":260},"EarlyMiddleAge":{"happiness":310},"HighMiddleAge":{"happiness":360},"LateMiddleAge":{"happiness":420},"ColonialAge":{"happiness":490},"IndustrialAge":{"happiness":550},"ProgressiveEra":{"happiness":610},"ModernEra":{"happiness":650},"PostModernEra":{"happiness":730},"ContemporaryEra":{"happiness":850},"TomorrowEra":{"happiness":1030},"FutureEra":{"happiness":1320},"ArcticFuture":{"happiness":1590},"OceanicFuture":{"happiness":1950},"VirtualFuture":{"happiness":2540},"SpaceAgeMars":{"happiness":4060},"SpaceAgeAsteroidBelt":{"happiness":4420},"SpaceAgeVenus":{"happiness":4770},"SpaceAgeJupiterMoon":{"happiness":5140},"SpaceAgeTitan":{"happiness":5510},"SpaceAgeSpaceHub":{"happiness":5900}} },
+    "R_MultiAge_CarnivalBonus19d": { prod: {"BronzeAge":{"population":65,"demandHappiness":65,"money_24h":400},"IronAge":{"population":131,"demandHappiness":131,"money_24h":900},"EarlyMiddleAge":{"population":200,"demandHappiness":200,"money_24h":1500},"HighMiddleAge":{"population":281,"demandHappiness":281,"money_24h":2100},"LateMiddleAge":{"population":369,"demandHappiness":369,"money_24h":2800},"ColonialAge":{"population":466,"demandHappiness":466,"money_24h":4200},"IndustrialAge":{"population":569,"demandHappiness":569,"money_24h":5300},"ProgressiveEra":{"population":680,"demandHappiness":680,"money_24h":6400},"ModernEra":{"population":797,"demandHappiness":797,"money_24h":8000},"PostModernEra":{"population":918,"demandHappiness":918,"money_24h":10000},"ContemporaryEra":{"population":1046,"demandHappiness":1046,"money_24h":13000},"TomorrowEra":{"population":1179,"demandHappiness":1179,"money_24h":15100},"FutureEra":{"population":1319,"demandHappiness":1319,"money_24h":17300},"ArcticFuture":{"population":1463,"demandHappiness":1463,"money_24h":19600},"OceanicFuture":{"population":1611,"demandHappiness":1611,"money_24h":22100},"VirtualFuture":{"population":1764,"demandHappiness":1764,"money_24h":24800},"SpaceAgeMars":{"population":2792,"demandHappiness":2792,"money_24h":41400},"SpaceAgeAsteroidBelt":{"population":3033,"demandHappiness":3033,"money_24h":45900},"SpaceAgeVenus":{"population":3278,"demandHappiness":3278,"money_24h":50600},"SpaceAgeJupiterMoon":{"population":3530,"demandHappiness":3530,"money_24h":55500},"SpaceAgeTitan":{"population":3787,"demandHappiness":3787,"money_24h":60700},"SpaceAgeSpaceHub":{"population":4050,"demandHappiness":4050,"money_24h":66100}} },
+    "R_MultiAge_CarnivalBonus19b": { prod: {"BronzeAge":{"population":101,"demandHappiness":101,"money_24h":300},"IronAge":{"population":218,"demandHappiness":218,"money_24h":500},"EarlyMiddleAge":{"population":334,"demandHappiness":334,"money_24h":900},"HighMiddleAge":{"population":469,"demandHappiness":469,"money_24h":1300},"LateMiddleAge":{"population":615,"demandHappiness":615,"money_24h":1700},"ColonialAge":{"population":776,"demandHappiness":776,"money_24h":2500},"IndustrialAge":{"population":949,"demandHappiness":949,"money_24h":3200},"ProgressiveEra":{"population":1133,"demandHappiness":1133,"money_24h":3800},"ModernEra":{"population":1328,"demandHappiness":1328,"money_24h":4800},"PostModernEra":{"population":1530,"demandHappiness":1530,"money_24h":6000},"ContemporaryEra":{"population":1744,"demandHappiness":1744,"money_24h":7800},"TomorrowEra":{"population":1965,"demandHappiness":1965,"money_24h":9100},"FutureEra":{"population":2198,"demandHappiness":2198,"money_24h":10400},"ArcticFuture":{"population":2438,"demandHappiness":2438,"money_24h":11800},"OceanicFuture":{"population":2685,"demandHappiness":2685,"money_24h":13300},"VirtualFuture":{"population":2940,"demandHappiness":2940,"money_24h":14900},"SpaceAgeMars":{"population":4654,"demandHappiness":4654,"money_24h":24900},"SpaceAgeAsteroidBelt":{"population":5055,"demandHappiness":5055,"money_24h":27500},"SpaceAgeVenus":{"population":5464,"demandHappiness":5464,"money_24h":30400},"SpaceAgeJupiterMoon":{"population":5884,"demandHappiness":5884,"money_24h":33300},"SpaceAgeTitan":{"population":6311,"demandHappiness":6311,"money_24h":36400},"SpaceAgeSpaceHub":{"population":6750,"demandHappiness":6750,"money_24h":39700}} },
+    "D_MultiAge_CarnivalBonus19b": { prod: {"BronzeAge":{"happiness":220},"IronAge":{"happiness":330},"EarlyMiddleAge":{"happiness":390},"HighMiddleAge":{"happiness":460},"LateMiddleAge":{"happiness":540},"ColonialAge":{"happiness":640},"IndustrialAge":{"happiness":720},"ProgressiveEra":{"happiness":790},"ModernEra":{"happiness":850},"PostModernEra":{"happiness":880},"ContemporaryEra":{"happiness":1030},"TomorrowEra":{"happiness":1250},"FutureEra":{"happiness":1580},"ArcticFuture":{"happiness":1840},"OceanicFuture":{"happiness":2240},"VirtualFuture":{"happiness":2680},"SpaceAgeMars":{"happiness":4290},"SpaceAgeAsteroidBelt":{"happiness":4660},"SpaceAgeVenus":{"happiness":5040},"SpaceAgeJupiterMoon":{"happiness":5430},"SpaceAgeTitan":{"happiness":5820},"SpaceAgeSpaceHub":{"happiness":6230}} },
+    "A_MultiAge_CarnivalBonus19b": { prod: {"BronzeAge":{"happiness":200},"IronAge":{"happiness":280},"EarlyMiddleAge":{"happiness":360},"HighMiddleAge":{"happiness":430},"LateMiddleAge":{"happiness":510},"ColonialAge":{"happiness":600},"IndustrialAge":{"happiness":680},"ProgressiveEra":{"happiness":750},"ModernEra":{"happiness":800},"PostModernEra":{"happiness":940},"ContemporaryEra":{"happiness":1090},"TomorrowEra":{"happiness":1320},"FutureEra":{"happiness":1760},"ArcticFuture":{"happiness":2150},"OceanicFuture":{"happiness":2720},"VirtualFuture":{"happiness":3670},"SpaceAgeMars":{"happiness":5870},"SpaceAgeAsteroidBelt":{"happiness":6380},"SpaceAgeVenus":{"happiness":6890},"SpaceAgeJupiterMoon":{"happiness":7430},"SpaceAgeTitan":{"happiness":7960},"SpaceAgeSpaceHub":{"happiness":8520}} },
+    "R_MultiAge_Battlegrounds1a": { prod: {"BronzeAge":{"money_24h":500},"IronAge":{"money_24h":1100},"EarlyMiddleAge":{"money_24h":1800},"HighMiddleAge":{"money_24h":2500},"LateMiddleAge":{"money_24h":3300},"ColonialAge":{"money_24h":5100},"IndustrialAge":{"money_24h":6300},"ProgressiveEra":{"money_24h":7700},"ModernEra":{"money_24h":9500},"PostModernEra":{"money_24h":12000},"ContemporaryEra":{"money_24h":15600},"TomorrowEra":{"money_24h":18100},"FutureEra":{"money_24h":20700},"ArcticFuture":{"money_24h":23600},"OceanicFuture":{"money_24h":26600},"VirtualFuture":{"money_24h":29800},"SpaceAgeMars":{"money_24h":49700},"SpaceAgeAsteroidBelt":{"money_24h":55100},"SpaceAgeVenus":{"money_24h":60700},"SpaceAgeJupiterMoon":{"money_24h":66600},"SpaceAgeTitan":{"money_24h":72800},"SpaceAgeSpaceHub":{"money_24h":79300}} },
+    "R_MultiAge_Battlegrounds1b": { prod: {"BronzeAge":{"money_24h":500},"IronAge":{"money_24h":1200},"EarlyMiddleAge":{"money_24h":2000},"HighMiddleAge":{"money_24h":2900},"LateMiddleAge":{"money_24h":3800},"ColonialAge":{"money_24h":5800},"IndustrialAge":{"money_24h":7200},"ProgressiveEra":{"money_24h":8700},"ModernEra":{"money_24h":10800},"PostModernEra":{"money_24h":13600},"ContemporaryEra":{"money_24h":17700},"TomorrowEra":{"money_24h":20500},"FutureEra":{"money_24h":23500},"ArcticFuture":{"money_24h":26700},"OceanicFuture":{"money_24h":30100},"VirtualFuture":{"money_24h":33700},"SpaceAgeMars":{"money_24h":56300},"SpaceAgeAsteroidBelt":{"money_24h":62400},"SpaceAgeVenus":{"money_24h":68800},"SpaceAgeJupiterMoon":{"money_24h":75500},"SpaceAgeTitan":{"money_24h":82500},"SpaceAgeSpaceHub":{"money_24h":89900}} },
+    "R_MultiAge_Battlegrounds1c": { prod: {"BronzeAge":{"money_24h":600},"IronAge":{"money_24h":1400},"EarlyMiddleAge":{"money_24h":2300},"HighMiddleAge":{"money_24h":3200},"LateMiddleAge":{"money_24h":4200},"ColonialAge":{"money_24h":6400},"IndustrialAge":{"money_24h":8000},"ProgressiveEra":{"money_24h":9700},"ModernEra":{"money_24h":12100},"PostModernEra":{"money_24h":15200},"ContemporaryEra":{"money_24h":19800},"TomorrowEra":{"money_24h":22900},"FutureEra":{"money_24h":26300},"ArcticFuture":{"money_24h":29900},"OceanicFuture":{"money_24h":33700},"VirtualFuture":{"money_24h":37700},"SpaceAgeMars":{"money_24h":63000},"SpaceAgeAsteroidBelt":{"money_24h":69700},"SpaceAgeVenus":{"money_24h":76900},"SpaceAgeJupiterMoon":{"money_24h":84400},"SpaceAgeTitan":{"money_24h":92300},"SpaceAgeSpaceHub":{"money_24h":100500}} },
+    "R_MultiAge_Battlegrounds1d": { prod: {"BronzeAge":{"money_24h":700},"IronAge":{"money_24h":1600},"EarlyMiddleAge":{"money_24h":2600},"HighMiddleAge":{"money_24h":3700},"LateMiddleAge":{"money_24h":4900},"ColonialAge":{"money_24h":7400},"IndustrialAge":{"money_24h":9300},"ProgressiveEra":{"money_24h":11300},"ModernEra":{"money_24h":14000},"PostModernEra":{"money_24h":17600},"ContemporaryEra":{"money_24h":22900},"TomorrowEra":{"money_24h":26500},"FutureEra":{"money_24h":30400},"ArcticFuture":{"money_24h":34600},"OceanicFuture":{"money_24h":39000},"VirtualFuture":{"money_24h":43700},"SpaceAgeMars":{"money_24h":72900},"SpaceAgeAsteroidBelt":{"money_24h":80800},"SpaceAgeVenus":{"money_24h":89000},"SpaceAgeJupiterMoon":{"money_24h":97700},"SpaceAgeTitan":{"money_24h":106800},"SpaceAgeSpaceHub":{"money_24h":116400}} },
+    "R_MultiAge_Battlegrounds1e": { prod: {"BronzeAge":{"money_24h":800},"IronAge":{"money_24h":1800},"EarlyMiddleAge":{"money_24h":3000},"HighMiddleAge":{"money_24h":4200},"LateMiddleAge":{"money_24h":5600},"ColonialAge":{"money_24h":8500},"IndustrialAge":{"money_24h":10500},"ProgressiveEra":{"money_24h":12800},"ModernEra":{"money_24h":15900},"PostModernEra":{"money_24h":20000},"ContemporaryEra":{"money_24h":26000},"TomorrowEra":{"money_24h":30200},"FutureEra":{"money_24h":34600},"ArcticFuture":{"money_24h":39300},"OceanicFuture":{"money_24h":44300},"VirtualFuture":{"money_24h":49600},"SpaceAgeMars":{"money_24h":82900},"SpaceAgeAsteroidBelt":{"money_24h":91800},"SpaceAgeVenus":{"money_24h":101200},"SpaceAgeJupiterMoon":{"money_24h":111000},"SpaceAgeTitan":{"money_24h":121400},"SpaceAgeSpaceHub":{"money_24h":132200}} },
+    "R_MultiAge_Battlegrounds1f": { prod: {"BronzeAge":{"money_24h":900},"IronAge":{"money_24h":2000},"EarlyMiddleAge":{"money_24h":3400},"HighMiddleAge":{"money_24h":4700},"LateMiddleAge":{"money_24h":6200},"ColonialAge":{"money_24h":9500},"IndustrialAge":{"money_24h":11800},"ProgressiveEra":{"money_24h":14300},"ModernEra":{"money_24h":17800},"PostModernEra":{"money_24h":22400},"ContemporaryEra":{"money_24h":29200},"TomorrowEra":{"money_24h":33800},"FutureEra":{"money_24h":38700},"ArcticFuture":{"money_24h":44000},"OceanicFuture":{"money_24h":49600},"VirtualFuture":{"money_24h":55600},"SpaceAgeMars":{"money_24h":92800},"SpaceAgeAsteroidBelt":{"money_24h":102800},"SpaceAgeVenus":{"money_24h":113300},"SpaceAgeJupiterMoon":{"money_24h":124400},"SpaceAgeTitan":{"money_24h":136000},"SpaceAgeSpaceHub":{"money_24h":148100}} },
+    "R_MultiAge_Battlegrounds1g": { prod: {"BronzeAge":{"money_24h":1000},"IronAge":{"money_24h":2200},"EarlyMiddleAge":{"money_24h":3700},"HighMiddleAge":{"money_24h":5200},"LateMiddleAge":{"money_24h":6900},"ColonialAge":{"money_24h":10500},"IndustrialAge":{"money_24h":13100},"ProgressiveEra":{"money_24h":15900},"ModernEra":{"money_24h":19700},"PostModernEra":{"money_24h":24800},"ContemporaryEra":{"money_24h":32300},"TomorrowEra":{"money_24h":37400},"FutureEra":{"money_24h":42900},"ArcticFuture":{"money_24h":48700},"OceanicFuture":{"money_24h":54900},"VirtualFuture":{"money_24h":61500},"SpaceAgeMars":{"money_24h":102700},"SpaceAgeAsteroidBelt":{"money_24h":113800},"SpaceAgeVenus":{"money_24h":125400},"SpaceAgeJupiterMoon":{"money_24h":137700},"SpaceAgeTitan":{"money_24h":150500},"SpaceAgeSpaceHub":{"money_24h":164000}} },
+    "R_MultiAge_Battlegrounds1h": { prod: {"BronzeAge":{"money_24h":1100},"IronAge":{"money_24h":2500},"EarlyMiddleAge":{"money_24h":4100},"HighMiddleAge":{"money_24h":5700},"LateMiddleAge":{"money_24h":7600},"ColonialAge":{"money_24h":11500},"IndustrialAge":{"money_24h":14300},"ProgressiveEra":{"money_24h":17400},"ModernEra":{"money_24h":21600},"PostModernEra":{"money_24h":27200},"ContemporaryEra":{"money_24h":35400},"TomorrowEra":{"money_24h":41000},"FutureEra":{"money_24h":47000},"ArcticFuture":{"money_24h":53400},"OceanicFuture":{"money_24h":60200},"VirtualFuture":{"money_24h":67500},"SpaceAgeMars":{"money_24h":112700},"SpaceAgeAsteroidBelt":{"money_24h":124800},"SpaceAgeVenus":{"money_24h":137600},"SpaceAgeJupiterMoon":{"money_24h":151000},"SpaceAgeTitan":{"money_24h":165100},"SpaceAgeSpaceHub":{"money_24h":179800}} },
+    "R_MultiAge_BirthdayBonus2": { prod: {"BronzeAge":{"population":1,"demandHappiness":1,"money_24h":480},"IronAge":{"population":1,"demandHappiness":1,"money_24h":660},"EarlyMiddleAge":{"population":1,"demandHappiness":1,"money_24h":1000},"HighMiddleAge":{"population":1,"demandHappiness":1,"money_24h":1400},"LateMiddleAge":{"population":1,"demandHappiness":1,"money_24h":1850},"ColonialAge":{"population":1,"demandHappiness":1,"money_24h":3100},"IndustrialAge":{"population":1,"demandHappiness":1,"money_24h":4200},"ProgressiveEra":{"population":1,"demandHappiness":1,"money_24h":6400},"ModernEra":{"population":1,"demandHappiness":1,"money_24h":8000},"PostModernEra":{"population":1,"demandHappiness":1,"money_24h":10000},"ContemporaryEra":{"population":1,"demandHappiness":1,"money_24h":13000},"TomorrowEra":{"population":1,"demandHappiness":1,"money_24h":15000},"FutureEra":{"population":1,"demandHappiness":1,"money_24h":17000},"ArcticFuture":{"population":1,"demandHappiness":1,"money_24h":19640},"OceanicFuture":{"population":1,"demandHappiness":1,"money_24h":22140},"VirtualFuture":{"population":1,"demandHappiness":1,"money_24h":24800},"SpaceAgeMars":{"population":1,"demandHappiness":1,"money_24h":41420},"SpaceAgeAsteroidBelt":{"population":1,"demandHappiness":1,"money_24h":45880},"SpaceAgeVenus":{"population":1,"demandHappiness":1,"money_24h":50580},"SpaceAgeJupiterMoon":{"population":1,"demandHappiness":1,"money_24h":55510},"SpaceAgeTitan":{"population":1,"demandHappiness":1,"money_24h":60690},"SpaceAgeSpaceHub":{"population":1,"demandHappiness":1,"money_24h":66110}} },
+    "R_MultiAge_Battlegrounds3a": { prod: {"BronzeAge":{"money_24h":500},"IronAge":{"money_24h":1100},"EarlyMiddleAge":{"money_24h":1800},"HighMiddleAge":{"money_24h":2500},"LateMiddleAge":{"money_24h":3300},"ColonialAge":{"money_24h":5100},"IndustrialAge":{"money_24h":6300},"ProgressiveEra":{"money_24h":7700},"ModernEra":{"money_24h":9500},"PostModernEra":{"money_24h":12000},"ContemporaryEra":{"money_24h":15600},"TomorrowEra":{"money_24h":18100},"FutureEra":{"money_24h":20700},"ArcticFuture":{"money_24h":23600},"OceanicFuture":{"money_24h":26600},"VirtualFuture":{"money_24h":29800},"SpaceAgeMars":{"money_24h":49700},"SpaceAgeAsteroidBelt":{"money_24h":55100},"SpaceAgeVenus":{"money_24h":60700},"SpaceAgeJupiterMoon":{"money_24h":66600},"SpaceAgeTitan":{"money_24h":72800},"SpaceAgeSpaceHub":{"money_24h":79300}} },
+    "R_MultiAge_Battlegrounds3b": { prod: {"BronzeAge":{"money_24h":500},"IronAge":{"money_24h":1200},"EarlyMiddleAge":{"money_24h":2000},"HighMiddleAge":{"money_24h":2900},"LateMiddleAge":{"money_24h":3800},"ColonialAge":{"money_24h":5800},"IndustrialAge":{"money_24h":7200},"ProgressiveEra":{"money_24h":8700},"ModernEra":{"money_24h":10800},"PostModernEra":{"money_24h":13600},"ContemporaryEra":{"money_24h":17700},"TomorrowEra":{"money_24h":20500},"FutureEra":{"money_24h":23500},"ArcticFuture":{"money_24h":26700},"OceanicFuture":{"money_24h":30100},"VirtualFuture":{"money_24h":33700},"SpaceAgeMars":{"money_24h":56300},"SpaceAgeAsteroidBelt":{"money_24h":62400},"SpaceAgeVenus":{"money_24h":68800},"SpaceAgeJupiterMoon":{"money_24h":75500},"SpaceAgeTitan":{"money_24h":82500},"SpaceAgeSpaceHub":{"money_24h":89900}} },
+    "R_MultiAge_Battlegrounds3c": { prod: {"BronzeAge":{"money_24h":600},"IronAge":{"money_24h":1400},"EarlyMiddleAge":{"money_24h":2300},"HighMiddleAge":{"money_24h":3200},"LateMiddleAge":{"money_24h":4200},"ColonialAge":{"money_24h":6400},"IndustrialAge":{"money_24h":8000},"ProgressiveEra":{"money_24h":9700},"ModernEra":{"money_24h":12100},"PostModernEra":{"money_24h":15200},"ContemporaryEra":{"money_24h":19800},"TomorrowEra":{"money_24h":22900},"FutureEra":{"money_24h":26300},"ArcticFuture":{"money_24h":29900},"OceanicFuture":{"money_24h":33700},"VirtualFuture":{"money_24h":37700},"SpaceAgeMars":{"money_24h":63000},"SpaceAgeAsteroidBelt":{"money_24h":69700},"SpaceAgeVenus":{"money_24h":76900},"SpaceAgeJupiterMoon":{"money_24h":84400},"SpaceAgeTitan":{"money_24h":92300},"SpaceAgeSpaceHub":{"money_24h":100500}} },
+    "R_MultiAge_Battlegrounds3d": { prod: {"BronzeAge":{"money_24h":700},"IronAge":{"money_24h":1600},"EarlyMiddleAge":{"money_24h":2600},"HighMiddleAge":{"money_24h":3700},"LateMiddleAge":{"money_24h":4900},"ColonialAge":{"money_24h":7400},"IndustrialAge":{"money_24h":9300},"ProgressiveEra":{"money_24h":11300},"ModernEra":{"money_24h":14000},"PostModernEra":{"money_24h":17600},"ContemporaryEra":{"money_24h":22900},"TomorrowEra":{"money_24h":26500},"FutureEra":{"money_24h":30400},"ArcticFuture":{"money_24h":34600},"OceanicFuture":{"money_24h":39000},"VirtualFuture":{"money_24h":43700},"SpaceAgeMars":{"money_24h":72900},"SpaceAgeAsteroidBelt":{"money_24h":80800},"SpaceAgeVenus":{"money_24h":89000},"SpaceAgeJupiterMoon":{"money_24h":97700},"SpaceAgeTitan":{"money_24h":106800},"SpaceAgeSpaceHub":{"money_24h":116400}} },
+    "R_MultiAge_Battlegrounds3e": { prod: {"BronzeAge":{"money_24h":800},"IronAge":{"money_24h":1800},"EarlyMiddleAge":{"money_24h":3000},"HighMiddleAge":{"money_24h":4200},"LateMiddleAge":{"money_24h":5600},"ColonialAge":{"money_24h":8500},"IndustrialAge":{"money_24h":10500},"ProgressiveEra":{"money_24h":12800},"ModernEra":{"money_24h":15900},"PostModernEra":{"money_24h":20000},"ContemporaryEra":{"money_24h":26000},"TomorrowEra":{"money_24h":30200},"FutureEra":{"money_24h":34600},"ArcticFuture":{"money_24h":39300},"OceanicFuture":{"money_24h":44300},"VirtualFuture":{"money_24h":49600},"SpaceAgeMars":{"money_24h":82900},"SpaceAgeAsteroidBelt":{"money_24h":91800},"SpaceAgeVenus":{"money_24h":101200},"SpaceAgeJupiterMoon":{"money_24h":111000},"SpaceAgeTitan":{"money_24h":121400},"SpaceAgeSpaceHub":{"money_24h":132200}} },
+    "R_MultiAge_Battlegrounds3f": { prod: {"BronzeAge":{"money_24h":900},"IronAge":{"money_24h":2000},"EarlyMiddleAge":{"money_24h":3400},"HighMiddleAge":{"money_24h":4700},"LateMiddleAge":{"money_24h":6200},"ColonialAge":{"money_24h":9500},"IndustrialAge":{"money_24h":11800},"ProgressiveEra":{"money_24h":14300},"ModernEra":{"money_24h":17800},"PostModernEra":{"money_24h":22400},"ContemporaryEra":{"money_24h":29200},"TomorrowEra":{"money_24h":33800},"FutureEra":{"money_24h":38700},"ArcticFuture":{"money_24h":44000},"OceanicFuture":{"money_24h":49600},"VirtualFuture":{"money_24h":55600},"SpaceAgeMars":{"money_24h":92800},"SpaceAgeAsteroidBelt":{"money_24h":102800},"SpaceAgeVenus":{"money_24h":113300},"SpaceAgeJupiterMoon":{"money_24h":124400},"SpaceAgeTitan":{"money_24h":136000},"SpaceAgeSpaceHub":{"money_24h":148100}} },
+    "R_MultiAge_Battlegrounds3g": { prod: {"BronzeAge":{"money_24h":1000},"IronAge":{"money_24h":2200},"EarlyMiddleAge":{"money_24h":3700},"HighMiddleAge":{"money_24h":5200},"LateMiddleAge":{"money_24h":6900},"ColonialAge":{"money_24h":10500},"IndustrialAge":{"money_24h":13100},"ProgressiveEra":{"money_24h":15900},"ModernEra":{"money_24h":19700},"PostModernEra":{"money_24h":24800},"ContemporaryEra":{"money_24h":32300},"TomorrowEra":{"money_24h":37400},"FutureEra":{"money_24h":42900},"ArcticFuture":{"money_24h":48700},"OceanicFuture":{"money_24h":54900},"VirtualFuture":{"money_24h":61500},"SpaceAgeMars":{"money_24h":102700},"SpaceAgeAsteroidBelt":{"money_24h":113800},"SpaceAgeVenus":{"money_24h":125400},"SpaceAgeJupiterMoon":{"money_24h":137700},"SpaceAgeTitan":{"money_24h":150500},"SpaceAgeSpaceHub":{"money_24h":164000}} },
+    "D_MultiAge_Expedition16b": { prod: {"BronzeAge":{"happiness":180},"IronAge":{"happiness":230},"EarlyMiddleAge":{"happiness":250},"HighMiddleAge":{"happiness":280},"LateMiddleAge":{"happiness":320},"ColonialAge":{"happiness":370},"IndustrialAge":{"happiness":400},"ProgressiveEra":{"happiness":440},"ModernEra":{"happiness":470},"PostModernEra":{"happiness":490},"ContemporaryEra":{"happiness":570},"TomorrowEra":{"happiness":691},"FutureEra":{"happiness":828},"ArcticFuture":{"happiness":965},"OceanicFuture":{"happiness":1113},"VirtualFuture":{"happiness":1330},"SpaceAgeMars":{"happiness":2128},"SpaceAgeAsteroidBelt":{"happiness":2312},"SpaceAgeVenus":{"happiness":2498},"SpaceAgeJupiterMoon":{"happiness":2691},"SpaceAgeTitan":{"happiness":2886},"SpaceAgeSpaceHub":{"happiness":3087}} },
+    "D_MultiAge_Expedition16d": { prod: {"BronzeAge":{"happiness":360},"IronAge":{"happiness":460},"EarlyMiddleAge":{"happiness":500},"HighMiddleAge":{"happiness":560},"LateMiddleAge":{"happiness":640},"ColonialAge":{"happiness":740},"IndustrialAge":{"happiness":801},"ProgressiveEra":{"happiness":880},"ModernEra":{"happiness":941},"PostModernEra":{"happiness":980},"ContemporaryEra":{"happiness":1139},"TomorrowEra":{"happiness":1383},"FutureEra":{"happiness":1657},"ArcticFuture":{"happiness":1930},"OceanicFuture":{"happiness":2227},"VirtualFuture":{"happiness":2660},"SpaceAgeMars":{"happiness":4256},"SpaceAgeAsteroidBelt":{"happiness":4626},"SpaceAgeVenus":{"happiness":4997},"SpaceAgeJupiterMoon":{"happiness":5383},"SpaceAgeTitan":{"happiness":5773},"SpaceAgeSpaceHub":{"happiness":6176}} },
+    "A_MultiAge_HalloweenBonusSet21a": { prod: {"BronzeAge":{"happiness":170},"IronAge":{"happiness":260},"EarlyMiddleAge":{"happiness":310},"HighMiddleAge":{"happiness":360},"LateMiddleAge":{"happiness":420},"ColonialAge":{"happiness":490},"IndustrialAge":{"happiness":550},"ProgressiveEra":{"happiness":610},"ModernEra":{"happiness":650},"PostModernEra":{"happiness":730},"ContemporaryEra":{"happiness":850},"TomorrowEra":{"happiness":1030},"FutureEra":{"happiness":1320},"ArcticFuture":{"happiness":1590},"OceanicFuture":{"happiness":1950},"VirtualFuture":{"happiness":2540},"SpaceAgeMars":{"happiness":4060},"SpaceAgeAsteroidBelt":{"happiness":4420},"SpaceAgeVenus":{"happiness":4770},"SpaceAgeJupiterMoon":{"happiness":5140},"SpaceAgeTitan":{"happiness":5510},"SpaceAgeSpaceHub":{"happiness":5900}} },
+    "A_MultiAge_HalloweenBonusSet21b": { prod: {"BronzeAge":{"happiness":200},"IronAge":{"happiness":280},"EarlyMiddleAge":{"happiness":360},"HighMiddleAge":{"happiness":430},"LateMiddleAge":{"happiness":510},"ColonialAge":{"happiness":600},"IndustrialAge":{"happiness":680},"ProgressiveEra":{"happiness":750},"ModernEra":{"happiness":800},"PostModernEra":{"happiness":940},"ContemporaryEra":{"happiness":1090},"TomorrowEra":{"happiness":1320},"FutureEra":{"happiness":1760},"ArcticFuture":{"happiness":2150},"OceanicFuture":{"happiness":2720},"VirtualFuture":{"happiness":3670},"SpaceAgeMars":{"happiness":5870},"SpaceAgeAsteroidBelt":{"happiness":6380},"SpaceAgeVenus":{"happiness":6890},"SpaceAgeJupiterMoon":{"happiness":7430},"SpaceAgeTitan":{"happiness":7960},"SpaceAgeSpaceHub":{"happiness":8520}} },
+    "P_MultiAge_ChristmasBonus16": { prod: {"BronzeAge":{"happiness":270},"IronAge":{"happiness":311},"EarlyMiddleAge":{"happiness":429},"HighMiddleAge":{"happiness":479},"LateMiddleAge":{"happiness":534},"ColonialAge":{"happiness":628},"IndustrialAge":{"happiness":708},"ProgressiveEra":{"happiness":778},"ModernEra":{"happiness":832},"PostModernEra":{"happiness":867},"ContemporaryEra":{"happiness":1007},"TomorrowEra":{"happiness":1223},"FutureEra":{"happiness":1465},"ArcticFuture":{"happiness":1706},"OceanicFuture":{"happiness":1969},"VirtualFuture":{"happiness":2352},"SpaceAgeMars":{"happiness":3764},"SpaceAgeAsteroidBelt":{"happiness":4090},"SpaceAgeVenus":{"happiness":4419},"SpaceAgeJupiterMoon":{"happiness":4760},"SpaceAgeTitan":{"happiness":5105},"SpaceAgeSpaceHub":{"happiness":5461}} },
+    "R_MultiAge_SummerBonus19a": { prod: {"BronzeAge":{"population":200,"demandHappiness":200,"money_24h":1000},"IronAge":{"population":440,"demandHappiness":440,"money_24h":2400},"EarlyMiddleAge":{"population":670,"demandHappiness":670,"money_24h":4000},"HighMiddleAge":{"population":940,"demandHappiness":940,"money_24h":5600},"LateMiddleAge":{"population":1230,"demandHappiness":1230,"money_24h":7400},"ColonialAge":{"population":1550,"demandHappiness":1550,"money_24h":11300},"IndustrialAge":{"population":1900,"demandHappiness":1900,"money_24h":14000},"ProgressiveEra":{"population":2270,"demandHappiness":2270,"money_24h":17000},"ModernEra":{"population":2660,"demandHappiness":2660,"money_24h":21200},"PostModernEra":{"population":3060,"demandHappiness":3060,"money_24h":26700},"ContemporaryEra":{"population":3490,"demandHappiness":3490,"money_24h":34700},"TomorrowEra":{"population":3930,"demandHappiness":3930,"money_24h":40200},"FutureEra":{"population":4400,"demandHappiness":4400,"money_24h":46100},"ArcticFuture":{"population":4880,"demandHappiness":4880,"money_24h":52400},"OceanicFuture":{"population":5370,"demandHappiness":5370,"money_24h":59000},"VirtualFuture":{"population":5880,"demandHappiness":5880,"money_24h":66100},"SpaceAgeMars":{"population":9310,"demandHappiness":9310,"money_24h":110500},"SpaceAgeAsteroidBelt":{"population":10110,"demandHappiness":10110,"money_24h":122400},"SpaceAgeVenus":{"population":10930,"demandHappiness":10930,"money_24h":134900},"SpaceAgeJupiterMoon":{"population":11770,"demandHappiness":11770,"money_24h":148000},"SpaceAgeTitan":{"population":12620,"demandHappiness":12620,"money_24h":161800},"SpaceAgeSpaceHub":{"population":13500,"demandHappiness":13500,"money_24h":176300}} },
+    "R_MultiAge_SummerBonus19b": { prod: {"BronzeAge":{"population":220,"demandHappiness":220,"money_24h":1100},"IronAge":{"population":470,"demandHappiness":470,"money_24h":2600},"EarlyMiddleAge":{"population":720,"demandHappiness":720,"money_24h":4300},"HighMiddleAge":{"population":1020,"demandHappiness":1020,"money_24h":6000},"LateMiddleAge":{"population":1330,"demandHappiness":1330,"money_24h":7900},"ColonialAge":{"population":1680,"demandHappiness":1680,"money_24h":12000},"IndustrialAge":{"population":2060,"demandHappiness":2060,"money_24h":14900},"ProgressiveEra":{"population":2450,"demandHappiness":2450,"money_24h":18100},"ModernEra":{"population":2880,"demandHappiness":2880,"money_24h":22500},"PostModernEra":{"population":3320,"demandHappiness":3320,"money_24h":28300},"ContemporaryEra":{"population":3780,"demandHappiness":3780,"money_24h":36900},"TomorrowEra":{"population":4260,"demandHappiness":4260,"money_24h":42700},"FutureEra":{"population":4760,"demandHappiness":4760,"money_24h":49000},"ArcticFuture":{"population":5280,"demandHappiness":5280,"money_24h":55600},"OceanicFuture":{"population":5820,"demandHappiness":5820,"money_24h":62700},"VirtualFuture":{"population":6370,"demandHappiness":6370,"money_24h":70300},"SpaceAgeMars":{"population":10080,"demandHappiness":10080,"money_24h":117400},"SpaceAgeAsteroidBelt":{"population":10950,"demandHappiness":10950,"money_24h":130000},"SpaceAgeVenus":{"population":11840,"demandHappiness":11840,"money_24h":143300},"SpaceAgeJupiterMoon":{"population":12750,"demandHappiness":12750,"money_24h":157300},"SpaceAgeTitan":{"population":13670,"demandHappiness":13670,"money_24h":172000},"SpaceAgeSpaceHub":{"population":14630,"demandHappiness":14630,"money_24h":187300}} },
+    "R_MultiAge_SummerBonus19c": { prod: {"BronzeAge":{"population":240,"demandHappiness":240,"money_24h":1100},"IronAge":{"population":510,"demandHappiness":510,"money_24h":2700},"EarlyMiddleAge":{"population":780,"demandHappiness":780,"money_24h":4500},"HighMiddleAge":{"population":1090,"demandHappiness":1090,"money_24h":6300},"LateMiddleAge":{"population":1440,"demandHappiness":1440,"money_24h":8300},"ColonialAge":{"population":1810,"demandHappiness":1810,"money_24h":12700},"IndustrialAge":{"population":2210,"demandHappiness":2210,"money_24h":15800},"ProgressiveEra":{"population":2640,"demandHappiness":2640,"money_24h":19200},"ModernEra":{"population":3100,"demandHappiness":3100,"money_24h":23900},"PostModernEra":{"population":3570,"demandHappiness":3570,"money_24h":30000},"ContemporaryEra":{"population":4070,"demandHappiness":4070,"money_24h":39100},"TomorrowEra":{"population":4590,"demandHappiness":4590,"money_24h":45200},"FutureEra":{"population":5130,"demandHappiness":5130,"money_24h":51800},"ArcticFuture":{"population":5690,"demandHappiness":5690,"money_24h":58900},"OceanicFuture":{"population":6270,"demandHappiness":6270,"money_24h":66400},"VirtualFuture":{"population":6860,"demandHappiness":6860,"money_24h":74400},"SpaceAgeMars":{"population":10860,"demandHappiness":10860,"money_24h":124300},"SpaceAgeAsteroidBelt":{"population":11800,"demandHappiness":11800,"money_24h":137600},"SpaceAgeVenus":{"population":12750,"demandHappiness":12750,"money_24h":151700},"SpaceAgeJupiterMoon":{"population":13730,"demandHappiness":13730,"money_24h":166500},"SpaceAgeTitan":{"population":14730,"demandHappiness":14730,"money_24h":182100},"SpaceAgeSpaceHub":{"population":15750,"demandHappiness":15750,"money_24h":198300}} },
+    "R_MultiAge_SummerBonus19d": { prod: {"BronzeAge":{"population":250,"demandHappiness":250,"money_24h":1200},"IronAge":{"population":540,"demandHappiness":540,"money_24h":2900},"EarlyMiddleAge":{"population":830,"demandHappiness":830,"money_24h":4800},"HighMiddleAge":{"population":1170,"demandHappiness":1170,"money_24h":6700},"LateMiddleAge":{"population":1540,"demandHappiness":1540,"money_24h":8800},"ColonialAge":{"population":1940,"demandHappiness":1940,"money_24h":13400},"IndustrialAge":{"population":2370,"demandHappiness":2370,"money_24h":16700},"ProgressiveEra":{"population":2830,"demandHappiness":2830,"money_24h":20200},"ModernEra":{"population":3320,"demandHappiness":3320,"money_24h":25200},"PostModernEra":{"population":3830,"demandHappiness":3830,"money_24h":31700},"ContemporaryEra":{"population":4360,"demandHappiness":4360,"money_24h":41200},"TomorrowEra":{"population":4910,"demandHappiness":4910,"money_24h":47700},"FutureEra":{"population":5490,"demandHappiness":5490,"money_24h":54700},"ArcticFuture":{"population":6090,"demandHappiness":6090,"money_24h":62200},"OceanicFuture":{"population":6710,"demandHappiness":6710,"money_24h":70100},"VirtualFuture":{"population":7350,"demandHappiness":7350,"money_24h":78500},"SpaceAgeMars":{"population":11630,"demandHappiness":11630,"money_24h":131200},"SpaceAgeAsteroidBelt":{"population":12640,"demandHappiness":12640,"money_24h":145300},"SpaceAgeVenus":{"population":13660,"demandHappiness":13660,"money_24h":160200},"SpaceAgeJupiterMoon":{"population":14710,"demandHappiness":14710,"money_24h":175800},"SpaceAgeTitan":{"population":15780,"demandHappiness":15780,"money_24h":192200},"SpaceAgeSpaceHub":{"population":16880,"demandHappiness":16880,"money_24h":209300}} },
+    "R_MultiAge_SummerBonus19e": { prod: {"BronzeAge":{"population":270,"demandHappiness":270,"money_24h":1300},"IronAge":{"population":580,"demandHappiness":580,"money_24h":3000},"EarlyMiddleAge":{"population":890,"demandHappiness":890,"money_24h":5000},"HighMiddleAge":{"population":1250,"demandHappiness":1250,"money_24h":7000},"LateMiddleAge":{"population":1640,"demandHappiness":1640,"money_24h":9300},"ColonialAge":{"population":2070,"demandHappiness":2070,"money_24h":14100},"IndustrialAge":{"population":2530,"demandHappiness":2530,"money_24h":17600},"ProgressiveEra":{"population":3020,"demandHappiness":3020,"money_24h":21300},"ModernEra":{"population":3540,"demandHappiness":3540,"money_24h":26500},"PostModernEra":{"population":4080,"demandHappiness":4080,"money_24h":33300},"ContemporaryEra":{"population":4650,"demandHappiness":4650,"money_24h":43400},"TomorrowEra":{"population":5240,"demandHappiness":5240,"money_24h":50300},"FutureEra":{"population":5860,"demandHappiness":5860,"money_24h":57600},"ArcticFuture":{"population":6500,"demandHappiness":6500,"money_24h":65500},"OceanicFuture":{"population":7160,"demandHappiness":7160,"money_24h":73800},"VirtualFuture":{"population":7840,"demandHappiness":7840,"money_24h":82700},"SpaceAgeMars":{"population":12410,"demandHappiness":12410,"money_24h":138100},"SpaceAgeAsteroidBelt":{"population":13480,"demandHappiness":13480,"money_24h":152900},"SpaceAgeVenus":{"population":14570,"demandHappiness":14570,"money_24h":168600},"SpaceAgeJupiterMoon":{"population":15690,"demandHappiness":15690,"money_24h":185000},"SpaceAgeTitan":{"population":16830,"demandHappiness":16830,"money_24h":202300},"SpaceAgeSpaceHub":{"population":18000,"demandHappiness":18000,"money_24h":220400}} },
+    "R_MultiAge_SummerBonus19f": { prod: {"BronzeAge":{"population":290,"demandHappiness":290,"money_24h":1300},"IronAge":{"population":620,"demandHappiness":620,"money_24h":3200},"EarlyMiddleAge":{"population":950,"demandHappiness":950,"money_24h":5300},"HighMiddleAge":{"population":1330,"demandHappiness":1330,"money_24h":7400},"LateMiddleAge":{"population":1740,"demandHappiness":1740,"money_24h":9700},"ColonialAge":{"population":2200,"demandHappiness":2200,"money_24h":14800},"IndustrialAge":{"population":2690,"demandHappiness":2690,"money_24h":18400},"ProgressiveEra":{"population":3210,"demandHappiness":3210,"money_24h":22400},"ModernEra":{"population":3760,"demandHappiness":3760,"money_24h":27800},"PostModernEra":{"population":4340,"demandHappiness":4340,"money_24h":35000},"ContemporaryEra":{"population":4940,"demandHappiness":4940,"money_24h":45600},"TomorrowEra":{"population":5570,"demandHappiness":5570,"money_24h":52800},"FutureEra":{"population":6230,"demandHappiness":6230,"money_24h":60500},"ArcticFuture":{"population":6910,"demandHappiness":6910,"money_24h":68700},"OceanicFuture":{"population":7610,"demandHappiness":7610,"money_24h":77500},"VirtualFuture":{"population":8330,"demandHappiness":8330,"money_24h":86800},"SpaceAgeMars":{"population":13190,"demandHappiness":13190,"money_24h":145000},"SpaceAgeAsteroidBelt":{"population":14320,"demandHappiness":14320,"money_24h":160600},"SpaceAgeVenus":{"population":15480,"demandHappiness":15480,"money_24h":177000},"SpaceAgeJupiterMoon":{"population":16670,"demandHappiness":16670,"money_24h":194300},"SpaceAgeTitan":{"population":17880,"demandHappiness":17880,"money_24h":212400},"SpaceAgeSpaceHub":{"population":19130,"demandHappiness":19130,"money_24h":231400}} },
+    "R_MultiAge_SummerBonus19g": { prod: {"BronzeAge":{"population":300,"demandHappiness":300,"money_24h":1400},"IronAge":{"population":650,"demandHappiness":650,"money_24h":3300},"EarlyMiddleAge":{"population":1000,"demandHappiness":1000,"money_24h":5500},"HighMiddleAge":{"population":1410,"demandHappiness":1410,"money_24h":7700},"LateMiddleAge":{"population":1850,"demandHappiness":1850,"money_24h":10200},"ColonialAge":{"population":2330,"demandHappiness":2330,"money_24h":15500},"IndustrialAge":{"population":2850,"demandHappiness":2850,"money_24h":19300},"ProgressiveEra":{"population":3400,"demandHappiness":3400,"money_24h":23400},"ModernEra":{"population":3980,"demandHappiness":3980,"money_24h":29200},"PostModernEra":{"population":4590,"demandHappiness":4590,"money_24h":36700},"ContemporaryEra":{"population":5230,"demandHappiness":5230,"money_24h":47700},"TomorrowEra":{"population":5900,"demandHappiness":5900,"money_24h":55300},"FutureEra":{"population":6590,"demandHappiness":6590,"money_24h":63400},"ArcticFuture":{"population":7310,"demandHappiness":7310,"money_24h":72000},"OceanicFuture":{"population":8060,"demandHappiness":8060,"money_24h":81200},"VirtualFuture":{"population":8820,"demandHappiness":8820,"money_24h":90900},"SpaceAgeMars":{"population":13960,"demandHappiness":13960,"money_24h":151900},"SpaceAgeAsteroidBelt":{"population":15170,"demandHappiness":15170,"money_24h":168200},"SpaceAgeVenus":{"population":16390,"demandHappiness":16390,"money_24h":185500},"SpaceAgeJupiterMoon":{"population":17650,"demandHappiness":17650,"money_24h":203500},"SpaceAgeTitan":{"population":18930,"demandHappiness":18930,"money_24h":222500},"SpaceAgeSpaceHub":{"population":20250,"demandHappiness":20250,"money_24h":242400}} },
+    "R_MultiAge_SummerBonus19h": { prod: {"BronzeAge":{"population":320,"demandHappiness":320,"money_24h":1400},"IronAge":{"population":690,"demandHappiness":690,"money_24h":3500},"EarlyMiddleAge":{"population":1060,"demandHappiness":1060,"money_24h":5800},"HighMiddleAge":{"population":1480,"demandHappiness":1480,"money_24h":8100},"LateMiddleAge":{"population":1950,"demandHappiness":1950,"money_24h":10600},"ColonialAge":{"population":2460,"demandHappiness":2460,"money_24h":16200},"IndustrialAge":{"population":3000,"demandHappiness":3000,"money_24h":20200},"ProgressiveEra":{"population":3590,"demandHappiness":3590,"money_24h":24500},"ModernEra":{"population":4200,"demandHappiness":4200,"money_24h":30500},"PostModernEra":{"population":4850,"demandHappiness":4850,"money_24h":38300},"ContemporaryEra":{"population":5520,"demandHappiness":5520,"money_24h":49900},"TomorrowEra":{"population":6220,"demandHappiness":6220,"money_24h":57800},"FutureEra":{"population":6960,"demandHappiness":6960,"money_24h":66200},"ArcticFuture":{"population":7720,"demandHappiness":7720,"money_24h":75300},"OceanicFuture":{"population":8500,"demandHappiness":8500,"money_24h":84900},"VirtualFuture":{"population":9310,"demandHappiness":9310,"money_24h":95100},"SpaceAgeMars":{"population":14740,"demandHappiness":14740,"money_24h":158800},"SpaceAgeAsteroidBelt":{"population":16010,"demandHappiness":16010,"money_24h":175900},"SpaceAgeVenus":{"population":17300,"demandHappiness":17300,"money_24h":193900},"SpaceAgeJupiterMoon":{"population":18630,"demandHappiness":18630,"money_24h":212800},"SpaceAgeTitan":{"population":19990,"demandHappiness":19990,"money_24h":232700},"SpaceAgeSpaceHub":{"population":21380,"demandHappiness":21380,"money_24h":253400}} },
+    "R_MultiAge_HalloweenBonus20gClown": { prod: {"BronzeAge":{"happiness":-50,"population":97,"demandHappiness":97,"money_24h":900},"IronAge":{"happiness":-90,"population":209,"demandHappiness":209,"money_24h":2200},"EarlyMiddleAge":{"happiness":-100,"population":320,"demandHappiness":320,"money_24h":3600},"HighMiddleAge":{"happiness":-110,"population":450,"demandHappiness":450,"money_24h":5000},"LateMiddleAge":{"happiness":-130,"population":590,"demandHappiness":590,"money_24h":6700},"ColonialAge":{"happiness":-150,"population":745,"demandHappiness":745,"money_24h":10100},"IndustrialAge":{"happiness":-170,"population":911,"demandHappiness":911,"money_24h":12600},"ProgressiveEra":{"happiness":-190,"population":1087,"demandHappiness":1087,"money_24h":15300},"ModernEra":{"happiness":-200,"population":1274,"demandHappiness":1274,"money_24h":19100},"PostModernEra":{"happiness":-210,"population":1469,"demandHappiness":1469,"money_24h":24000},"ContemporaryEra":{"happiness":-240,"population":1674,"demandHappiness":1674,"money_24h":31300},"TomorrowEra":{"happiness":-290,"population":1886,"demandHappiness":1886,"money_24h":36200},"FutureEra":{"happiness":-350,"population":2110,"demandHappiness":2110,"money_24h":41500},"ArcticFuture":{"happiness":-410,"population":2340,"demandHappiness":2340,"money_24h":47100},"OceanicFuture":{"happiness":-470,"population":2578,"demandHappiness":2578,"money_24h":53100},"VirtualFuture":{"happiness":-560,"population":2822,"demandHappiness":2822,"money_24h":59500},"SpaceAgeMars":{"happiness":-900,"population":4468,"demandHappiness":4468,"money_24h":99400},"SpaceAgeAsteroidBelt":{"happiness":-980,"population":4853,"demandHappiness":4853,"money_24h":110100},"SpaceAgeVenus":{"happiness":-1060,"population":5245,"demandHappiness":5245,"money_24h":121400},"SpaceAgeJupiterMoon":{"happiness":-1140,"population":5648,"demandHappiness":5648,"money_24h":133200},"SpaceAgeTitan":{"happiness":-1230,"population":6059,"demandHappiness":6059,"money_24h":145700},"SpaceAgeSpaceHub":{"happiness":-1310,"population":6480,"demandHappiness":6480,"money_24h":158700}} },
+    "R_MultiAge_HalloweenBonus20gDemon": { prod: {"BronzeAge":{"happiness":-50,"population":97,"demandHappiness":97,"money_24h":900},"IronAge":{"happiness":-90,"population":209,"demandHappiness":209,"money_24h":2200},"EarlyMiddleAge":{"happiness":-100,"population":320,"demandHappiness":320,"money_24h":3600},"HighMiddleAge":{"happiness":-110,"population":450,"demandHappiness":450,"money_24h":5000},"LateMiddleAge":{"happiness":-130,"population":590,"demandHappiness":590,"money_24h":6700},"ColonialAge":{"happiness":-150,"population":745,"demandHappiness":745,"money_24h":10100},"IndustrialAge":{"happiness":-170,"population":911,"demandHappiness":911,"money_24h":12600},"ProgressiveEra":{"happiness":-190,"population":1087,"demandHappiness":1087,"money_24h":15300},"ModernEra":{"happiness":-200,"population":1274,"demandHappiness":1274,"money_24h":19100},"PostModernEra":{"happiness":-210,"population":1469,"demandHappiness":1469,"money_24h":24000},"ContemporaryEra":{"happiness":-240,"population":1674,"demandHappiness":1674,"money_24h":31300},"TomorrowEra":{"happiness":-290,"population":1886,"demandHappiness":1886,"money_24h":36200},"FutureEra":{"happiness":-350,"population":2110,"demandHappiness":2110,"money_24h":41500},"ArcticFuture":{"happiness":-410,"population":2340,"demandHappiness":2340,"money_24h":47100},"OceanicFuture":{"happiness":-470,"population":2578,"demandHappiness":2578,"money_24h":53100},"VirtualFuture":{"happiness":-560,"population":2822,"demandHappiness":2822,"money_24h":59500},"SpaceAgeMars":{"happiness":-900,"population":4468,"demandHappiness":4468,"money_24h":99400},"SpaceAgeAsteroidBelt":{"happiness":-980,"population":4853,"demandHappiness":4853,"money_24h":110100},"SpaceAgeVenus":{"happiness":-1060,"population":5245,"demandHappiness":5245,"money_24h":121400},"SpaceAgeJupiterMoon":{"happiness":-1140,"population":5648,"demandHappiness":5648,"money_24h":133200},"SpaceAgeTitan":{"happiness":-1230,"population":6059,"demandHappiness":6059,"money_24h":145700},"SpaceAgeSpaceHub":{"happiness":-1310,"population":6480,"demandHappiness":6480,"money_24h":158700}} },
+    "R_MultiAge_HalloweenBonus20gWolf": { prod: {"BronzeAge":{"happiness":-50,"population":97,"demandHappiness":97,"money_24h":900},"IronAge":{"happiness":-90,"population":209,"demandHappiness":209,"money_24h":2200},"EarlyMiddleAge":{"happiness":-100,"population":320,"demandHappiness":320,"money_24h":3600},"HighMiddleAge":{"happiness":-110,"population":450,"demandHappiness":450,"money_24h":5000},"LateMiddleAge":{"happiness":-130,"population":590,"demandHappiness":590,"money_24h":6700},"ColonialAge":{"happiness":-150,"population":745,"demandHappiness":745,"money_24h":10100},"IndustrialAge":{"happiness":-170,"population":911,"demandHappiness":911,"money_24h":12600},"ProgressiveEra":{"happiness":-190,"population":1087,"demandHappiness":1087,"money_24h":15300},"ModernEra":{"happiness":-200,"population":1274,"demandHappiness":1274,"money_24h":19100},"PostModernEra":{"happiness":-210,"population":1469,"demandHappiness":1469,"money_24h":24000},"ContemporaryEra":{"happiness":-240,"population":1674,"demandHappiness":1674,"money_24h":31300},"TomorrowEra":{"happiness":-290,"population":1886,"demandHappiness":1886,"money_24h":36200},"FutureEra":{"happiness":-350,"population":2110,"demandHappiness":2110,"money_24h":41500},"ArcticFuture":{"happiness":-410,"population":2340,"demandHappiness":2340,"money_24h":47100},"OceanicFuture":{"happiness":-470,"population":2578,"demandHappiness":2578,"money_24h":53100},"VirtualFuture":{"happiness":-560,"population":2822,"demandHappiness":2822,"money_24h":59500},"SpaceAgeMars":{"happiness":-900,"population":4468,"demandHappiness":4468,"money_24h":99400},"SpaceAgeAsteroidBelt":{"happiness":-980,"population":4853,"demandHappiness":4853,"money_24h":110100},"SpaceAgeVenus":{"happiness":-1060,"population":5245,"demandHappiness":5245,"money_24h":121400},"SpaceAgeJupiterMoon":{"happiness":-1140,"population":5648,"demandHappiness":5648,"money_24h":133200},"SpaceAgeTitan":{"happiness":-1230,"population":6059,"demandHappiness":6059,"money_24h":145700},"SpaceAgeSpaceHub":{"happiness":-1310,"population":6480,"demandHappiness":6480,"money_24h":158700}} },
+    "R_MultiAge_SummerBonus18a": { prod: {"BronzeAge":{"population":14,"demandHappiness":14,"money_24h":800},"IronAge":{"population":30,"demandHappiness":30,"money_24h":2000},"EarlyMiddleAge":{"population":47,"demandHappiness":47,"money_24h":3400},"HighMiddleAge":{"population":66,"demandHappiness":66,"money_24h":4700},"LateMiddleAge":{"population":86,"demandHappiness":86,"money_24h":6200},"ColonialAge":{"population":109,"demandHappiness":109,"money_24h":9500},"IndustrialAge":{"population":133,"demandHappiness":133,"money_24h":11800},"ProgressiveEra":{"population":159,"demandHappiness":159,"money_24h":14300},"ModernEra":{"population":186,"demandHappiness":186,"money_24h":17800},"PostModernEra":{"population":214,"demandHappiness":214,"money_24h":22400},"ContemporaryEra":{"population":244,"demandHappiness":244,"money_24h":29200},"TomorrowEra":{"population":275,"demandHappiness":275,"money_24h":33800},"FutureEra":{"population":308,"demandHappiness":308,"money_24h":38700},"ArcticFuture":{"population":341,"demandHappiness":341,"money_24h":44000},"OceanicFuture":{"population":376,"demandHappiness":376,"money_24h":49600},"VirtualFuture":{"population":412,"demandHappiness":412,"money_24h":55600},"SpaceAgeMars":{"population":652,"demandHappiness":652,"money_24h":92800},"SpaceAgeAsteroidBelt":{"population":708,"demandHappiness":708,"money_24h":102800},"SpaceAgeVenus":{"population":765,"demandHappiness":765,"money_24h":113300},"SpaceAgeJupiterMoon":{"population":824,"demandHappiness":824,"money_24h":124400},"SpaceAgeTitan":{"population":884,"demandHappiness":884,"money_24h":136000},"SpaceAgeSpaceHub":{"population":945,"demandHappiness":945,"money_24h":148100}} },
+    "R_MultiAge_SummerBonus18b": { prod: {"BronzeAge":{"population":28,"demandHappiness":28,"money_24h":900},"IronAge":{"population":61,"demandHappiness":61,"money_24h":2100},"EarlyMiddleAge":{"population":93,"demandHappiness":93,"money_24h":3600},"HighMiddleAge":{"population":131,"demandHappiness":131,"money_24h":5000},"LateMiddleAge":{"population":172,"demandHappiness":172,"money_24h":6600},"ColonialAge":{"population":217,"demandHappiness":217,"money_24h":10100},"IndustrialAge":{"population":266,"demandHappiness":266,"money_24h":12500},"ProgressiveEra":{"population":317,"demandHappiness":317,"money_24h":15200},"ModernEra":{"population":372,"demandHappiness":372,"money_24h":18900},"PostModernEra":{"population":428,"demandHappiness":428,"money_24h":23800},"ContemporaryEra":{"population":488,"demandHappiness":488,"money_24h":31000},"TomorrowEra":{"population":550,"demandHappiness":550,"money_24h":35900},"FutureEra":{"population":615,"demandHappiness":615,"money_24h":41100},"ArcticFuture":{"population":683,"demandHappiness":683,"money_24h":46700},"OceanicFuture":{"population":752,"demandHappiness":752,"money_24h":52700},"VirtualFuture":{"population":823,"demandHappiness":823,"money_24h":59000},"SpaceAgeMars":{"population":1303,"demandHappiness":1303,"money_24h":98600},"SpaceAgeAsteroidBelt":{"population":1415,"demandHappiness":1415,"money_24h":109200},"SpaceAgeVenus":{"population":1530,"demandHappiness":1530,"money_24h":120400},"SpaceAgeJupiterMoon":{"population":1647,"demandHappiness":1647,"money_24h":132100},"SpaceAgeTitan":{"population":1767,"demandHappiness":1767,"money_24h":144400},"SpaceAgeSpaceHub":{"population":1890,"demandHappiness":1890,"money_24h":157300}} },
+    "R_MultiAge_SummerBonus18c": { prod: {"BronzeAge":{"population":43,"demandHappiness":43,"money_24h":1000},"IronAge":{"population":91,"demandHappiness":91,"money_24h":2300},"EarlyMiddleAge":{"population":140,"demandHappiness":140,"money_24h":3800},"HighMiddleAge":{"population":197,"demandHappiness":197,"money_24h":5300},"LateMiddleAge":{"population":258,"demandHappiness":258,"money_24h":7000},"ColonialAge":{"population":326,"demandHappiness":326,"money_24h":10700},"IndustrialAge":{"population":398,"demandHappiness":398,"money_24h":13300},"ProgressiveEra":{"population":476,"demandHappiness":476,"money_24h":16100},"ModernEra":{"population":558,"demandHappiness":558,"money_24h":20000},"PostModernEra":{"population":643,"demandHappiness":643,"money_24h":25200},"ContemporaryEra":{"population":732,"demandHappiness":732,"money_24h":32800},"TomorrowEra":{"population":825,"demandHappiness":825,"money_24h":38000},"FutureEra":{"population":923,"demandHappiness":923,"money_24h":43600},"ArcticFuture":{"population":1024,"demandHappiness":1024,"money_24h":49500},"OceanicFuture":{"population":1128,"demandHappiness":1128,"money_24h":55800},"VirtualFuture":{"population":1235,"demandHappiness":1235,"money_24h":62500},"SpaceAgeMars":{"population":1955,"demandHappiness":1955,"money_24h":104400},"SpaceAgeAsteroidBelt":{"population":2123,"demandHappiness":2123,"money_24h":115600},"SpaceAgeVenus":{"population":2295,"demandHappiness":2295,"money_24h":127500},"SpaceAgeJupiterMoon":{"population":2471,"demandHappiness":2471,"money_24h":139900},"SpaceAgeTitan":{"population":2651,"demandHappiness":2651,"money_24h":152900},"SpaceAgeSpaceHub":{"population":2835,"demandHappiness":2835,"money_24h":166600}} },
+    "R_MultiAge_SummerBonus18d": { prod: {"BronzeAge":{"population":57,"demandHappiness":57,"money_24h":1000},"IronAge":{"population":122,"demandHappiness":122,"money_24h":2400},"EarlyMiddleAge":{"population":187,"demandHappiness":187,"money_24h":4000},"HighMiddleAge":{"population":263,"demandHappiness":263,"money_24h":5600},"LateMiddleAge":{"population":344,"demandHappiness":344,"money_24h":7400},"ColonialAge":{"population":435,"demandHappiness":435,"money_24h":11200},"IndustrialAge":{"population":531,"demandHappiness":531,"money_24h":14000},"ProgressiveEra":{"population":634,"demandHappiness":634,"money_24h":17000},"ModernEra":{"population":743,"demandHappiness":743,"money_24h":21200},"PostModernEra":{"population":857,"demandHappiness":857,"money_24h":26600},"ContemporaryEra":{"population":977,"demandHappiness":977,"money_24h":34600},"TomorrowEra":{"population":1100,"demandHappiness":1100,"money_24h":40100},"FutureEra":{"population":1231,"demandHappiness":1231,"money_24h":46000},"ArcticFuture":{"population":1365,"demandHappiness":1365,"money_24h":52200},"OceanicFuture":{"population":1504,"demandHappiness":1504,"money_24h":58900},"VirtualFuture":{"population":1646,"demandHappiness":1646,"money_24h":66000},"SpaceAgeMars":{"population":2606,"demandHappiness":2606,"money_24h":110200},"SpaceAgeAsteroidBelt":{"population":2831,"demandHappiness":2831,"money_24h":122000},"SpaceAgeVenus":{"population":3060,"demandHappiness":3060,"money_24h":134500},"SpaceAgeJupiterMoon":{"population":3295,"demandHappiness":3295,"money_24h":147700},"SpaceAgeTitan":{"population":3534,"demandHappiness":3534,"money_24h":161400},"SpaceAgeSpaceHub":{"population":3780,"demandHappiness":3780,"money_24h":175900}} },
+    "R_MultiAge_SummerBonus18e": { prod: {"BronzeAge":{"population":71,"demandHappiness":71,"money_24h":1100},"IronAge":{"population":152,"demandHappiness":152,"money_24h":2500},"EarlyMiddleAge":{"population":234,"demandHappiness":234,"money_24h":4200},"HighMiddleAge":{"population":328,"demandHappiness":328,"money_24h":5900},"LateMiddleAge":{"population":431,"demandHappiness":431,"money_24h":7800},"ColonialAge":{"population":543,"demandHappiness":543,"money_24h":11800},"IndustrialAge":{"population":664,"demandHappiness":664,"money_24h":14700},"ProgressiveEra":{"population":793,"demandHappiness":793,"money_24h":17900},"ModernEra":{"population":929,"demandHappiness":929,"money_24h":22300},"PostModernEra":{"population":1071,"demandHappiness":1071,"money_24h":28000},"ContemporaryEra":{"population":1221,"demandHappiness":1221,"money_24h":36500},"TomorrowEra":{"population":1376,"demandHappiness":1376,"money_24h":42200},"FutureEra":{"population":1538,"demandHappiness":1538,"money_24h":48400},"ArcticFuture":{"population":1706,"demandHappiness":1706,"money_24h":55000},"OceanicFuture":{"population":1880,"demandHappiness":1880,"money_24h":62000},"VirtualFuture":{"population":2058,"demandHappiness":2058,"money_24h":69400},"SpaceAgeMars":{"population":3258,"demandHappiness":3258,"money_24h":116000},"SpaceAgeAsteroidBelt":{"population":3539,"demandHappiness":3539,"money_24h":128500},"SpaceAgeVenus":{"population":3825,"demandHappiness":3825,"money_24h":141600},"SpaceAgeJupiterMoon":{"population":4119,"demandHappiness":4119,"money_24h":155400},"SpaceAgeTitan":{"population":4418,"demandHappiness":4418,"money_24h":169900},"SpaceAgeSpaceHub":{"population":4725,"demandHappiness":4725,"money_24h":185100}} },
+    "R_MultiAge_SummerBonus18f": { prod: {"BronzeAge":{"population":85,"demandHappiness":85,"money_24h":1100},"IronAge":{"population":183,"demandHappiness":183,"money_24h":2700},"EarlyMiddleAge":{"population":280,"demandHappiness":280,"money_24h":4400},"HighMiddleAge":{"population":394,"demandHappiness":394,"money_24h":6200},"LateMiddleAge":{"population":517,"demandHappiness":517,"money_24h":8200},"ColonialAge":{"population":652,"demandHappiness":652,"money_24h":12400},"IndustrialAge":{"population":797,"demandHappiness":797,"money_24h":15500},"ProgressiveEra":{"population":951,"demandHappiness":951,"money_24h":18800},"ModernEra":{"population":1115,"demandHappiness":1115,"money_24h":23400},"PostModernEra":{"population":1285,"demandHappiness":1285,"money_24h":29400},"ContemporaryEra":{"population":1465,"demandHappiness":1465,"money_24h":38300},"TomorrowEra":{"population":1651,"demandHappiness":1651,"money_24h":44300},"FutureEra":{"population":1846,"demandHappiness":1846,"money_24h":50800},"ArcticFuture":{"population":2048,"demandHappiness":2048,"money_24h":57700},"OceanicFuture":{"population":2255,"demandHappiness":2255,"money_24h":65100},"VirtualFuture":{"population":2470,"demandHappiness":2470,"money_24h":72900},"SpaceAgeMars":{"population":3909,"demandHappiness":3909,"money_24h":121800},"SpaceAgeAsteroidBelt":{"population":4246,"demandHappiness":4246,"money_24h":134900},"SpaceAgeVenus":{"population":4590,"demandHappiness":4590,"money_24h":148700},"SpaceAgeJupiterMoon":{"population":4942,"demandHappiness":4942,"money_24h":163200},"SpaceAgeTitan":{"population":5301,"demandHappiness":5301,"money_24h":178400},"SpaceAgeSpaceHub":{"population":5670,"demandHappiness":5670,"money_24h":194400}} },
+    "R_MultiAge_SummerBonus18gPirate": { prod: {"BronzeAge":{"population":99,"demandHappiness":99,"money_24h":1200},"IronAge":{"population":213,"demandHappiness":213,"money_24h":2800},"EarlyMiddleAge":{"population":327,"demandHappiness":327,"money_24h":4600},"HighMiddleAge":{"population":459,"demandHappiness":459,"money_24h":6500},"LateMiddleAge":{"population":603,"demandHappiness":603,"money_24h":8600},"ColonialAge":{"population":761,"demandHappiness":761,"money_24h":13000},"IndustrialAge":{"population":930,"demandHappiness":930,"money_24h":16200},"ProgressiveEra":{"population":1110,"demandHappiness":1110,"money_24h":19700},"ModernEra":{"population":1301,"demandHappiness":1301,"money_24h":24500},"PostModernEra":{"population":1499,"demandHappiness":1499,"money_24h":30800},"ContemporaryEra":{"population":1709,"demandHappiness":1709,"money_24h":40100},"TomorrowEra":{"population":1926,"demandHappiness":1926,"money_24h":46400},"FutureEra":{"population":2154,"demandHappiness":2154,"money_24h":53200},"ArcticFuture":{"population":2389,"demandHappiness":2389,"money_24h":60500},"OceanicFuture":{"population":2631,"demandHappiness":2631,"money_24h":68200},"VirtualFuture":{"population":2881,"demandHappiness":2881,"money_24h":76400},"SpaceAgeMars":{"population":4561,"demandHappiness":4561,"money_24h":127600},"SpaceAgeAsteroidBelt":{"population":4954,"demandHappiness":4954,"money_24h":141300},"SpaceAgeVenus":{"population":5354,"demandHappiness":5354,"money_24h":155800},"SpaceAgeJupiterMoon":{"population":5766,"demandHappiness":5766,"money_24h":171000},"SpaceAgeTitan":{"population":6185,"demandHappiness":6185,"money_24h":186900},"SpaceAgeSpaceHub":{"population":6615,"demandHappiness":6615,"money_24h":203600}} },
+    "R_MultiAge_SummerBonus18gTrader": { prod: {"BronzeAge":{"population":99,"demandHappiness":99,"money_24h":1200},"IronAge":{"population":213,"demandHappiness":213,"money_24h":2800},"EarlyMiddleAge":{"population":327,"demandHappiness":327,"money_24h":4600},"HighMiddleAge":{"population":459,"demandHappiness":459,"money_24h":6500},"LateMiddleAge":{"population":603,"demandHappiness":603,"money_24h":8600},"ColonialAge":{"population":761,"demandHappiness":761,"money_24h":13000},"IndustrialAge":{"population":930,"demandHappiness":930,"money_24h":16200},"ProgressiveEra":{"population":1110,"demandHappiness":1110,"money_24h":19700},"ModernEra":{"population":1301,"demandHappiness":1301,"money_24h":24500},"PostModernEra":{"population":1499,"demandHappiness":1499,"money_24h":30800},"ContemporaryEra":{"population":1709,"demandHappiness":1709,"money_24h":40100},"TomorrowEra":{"population":1926,"demandHappiness":1926,"money_24h":46400},"FutureEra":{"population":2154,"demandHappiness":2154,"money_24h":53200},"ArcticFuture":{"population":2389,"demandHappiness":2389,"money_24h":60500},"OceanicFuture":{"population":2631,"demandHappiness":2631,"money_24h":68200},"VirtualFuture":{"population":2881,"demandHappiness":2881,"money_24h":76400},"SpaceAgeMars":{"population":4561,"demandHappiness":4561,"money_24h":127600},"SpaceAgeAsteroidBelt":{"population":4954,"demandHappiness":4954,"money_24h":141300},"SpaceAgeVenus":{"population":5354,"demandHappiness":5354,"money_24h":155800},"SpaceAgeJupiterMoon":{"population":5766,"demandHappiness":5766,"money_24h":171000},"SpaceAgeTitan":{"population":6185,"demandHappiness":6185,"money_24h":186900},"SpaceAgeSpaceHub":{"population":6615,"demandHappiness":6615,"money_24h":203600}} },
+    "R_MultiAge_BirthdayBonus1": { prod: {"BronzeAge":{"population":1,"demandHappiness":1,"money_24h":480},"IronAge":{"population":1,"demandHappiness":1,"money_24h":660},"EarlyMiddleAge":{"population":1,"demandHappiness":1,"money_24h":1000},"HighMiddleAge":{"population":1,"demandHappiness":1,"money_24h":1400},"LateMiddleAge":{"population":1,"demandHappiness":1,"money_24h":1850},"ColonialAge":{"population":1,"demandHappiness":1,"money_24h":3100},"IndustrialAge":{"population":1,"demandHappiness":1,"money_24h":4200},"ProgressiveEra":{"population":1,"demandHappiness":1,"money_24h":6400},"ModernEra":{"population":1,"demandHappiness":1,"money_24h":8000},"PostModernEra":{"population":1,"demandHappiness":1,"money_24h":10000},"ContemporaryEra":{"population":1,"demandHappiness":1,"money_24h":13000},"TomorrowEra":{"population":1,"demandHappiness":1,"money_24h":15000},"FutureEra":{"population":1,"demandHappiness":1,"money_24h":17000},"ArcticFuture":{"population":1,"demandHappiness":1,"money_24h":19640},"OceanicFuture":{"population":1,"demandHappiness":1,"money_24h":22140},"VirtualFuture":{"population":1,"demandHappiness":1,"money_24h":24800},"SpaceAgeMars":{"population":1,"demandHappiness":1,"money_24h":41420},"SpaceAgeAsteroidBelt":{"population":1,"demandHappiness":1,"money_24h":45880},"SpaceAgeVenus":{"population":1,"demandHappiness":1,"money_24h":50580},"SpaceAgeJupiterMoon":{"population":1,"demandHappiness":1,"money_24h":55510},"SpaceAgeTitan":{"population":1,"demandHappiness":1,"money_24h":60690},"SpaceAgeSpaceHub":{"population":1,"demandHappiness":1,"money_24h":66110}} },
+    "R_MultiAge_SummerBonus18gRoyal": { prod: {"BronzeAge":{"population":99,"demandHappiness":99,"money_24h":1200},"IronAge":{"population":213,"demandHappiness":213,"money_24h":2800},"EarlyMiddleAge":{"population":327,"demandHappiness":327,"money_24h":4600},"HighMiddleAge":{"population":459,"demandHappiness":459,"money_24h":6500},"LateMiddleAge":{"population":603,"demandHappiness":603,"money_24h":8600},"ColonialAge":{"population":761,"demandHappiness":761,"money_24h":13000},"IndustrialAge":{"population":930,"demandHappiness":930,"money_24h":16200},"ProgressiveEra":{"population":1110,"demandHappiness":1110,"money_24h":19700},"ModernEra":{"population":1301,"demandHappiness":1301,"money_24h":24500},"PostModernEra":{"population":1499,"demandHappiness":1499,"money_24h":30800},"ContemporaryEra":{"population":1709,"demandHappiness":1709,"money_24h":40100},"TomorrowEra":{"population":1926,"demandHappiness":1926,"money_24h":46400},"FutureEra":{"population":2154,"demandHappiness":2154,"money_24h":53200},"ArcticFuture":{"population":2389,"demandHappiness":2389,"money_24h":60500},"OceanicFuture":{"population":2631,"demandHappiness":2631,"money_24h":68200},"VirtualFuture":{"population":2881,"demandHappiness":2881,"money_24h":76400},"SpaceAgeMars":{"population":4561,"demandHappiness":4561,"money_24h":127600},"SpaceAgeAsteroidBelt":{"population":4954,"demandHappiness":4954,"money_24h":141300},"SpaceAgeVenus":{"population":5354,"demandHappiness":5354,"money_24h":155800},"SpaceAgeJupiterMoon":{"population":5766,"demandHappiness":5766,"money_24h":171000},"SpaceAgeTitan":{"population":6185,"demandHappiness":6185,"money_24h":186900},"SpaceAgeSpaceHub":{"population":6615,"demandHappiness":6615,"money_24h":203600}} },
+    "D_MultiAge_SummerBonusSetA17a": { prod: {"BronzeAge":{"happiness":100},"IronAge":{"happiness":140},"EarlyMiddleAge":{"happiness":150},"HighMiddleAge":{"happiness":170},"LateMiddleAge":{"happiness":190},"ColonialAge":{"happiness":230},"IndustrialAge":{"happiness":250},"ProgressiveEra":{"happiness":280},"ModernEra":{"happiness":300},"PostModernEra":{"happiness":310},"ContemporaryEra":{"happiness":360},"TomorrowEra":{"happiness":440},"FutureEra":{"happiness":530},"ArcticFuture":{"happiness":610},"OceanicFuture":{"happiness":710},"VirtualFuture":{"happiness":850},"SpaceAgeMars":{"happiness":1350},"SpaceAgeAsteroidBelt":{"happiness":1470},"SpaceAgeVenus":{"happiness":1590},"SpaceAgeJupiterMoon":{"happiness":1710},"SpaceAgeTitan":{"happiness":1840},"SpaceAgeSpaceHub":{"happiness":1970}} },
+    "R_MultiAge_SummerBonusSetA17a": { prod: {"BronzeAge":{"money_24h":880},"IronAge":{"money_24h":2110},"EarlyMiddleAge":{"money_24h":3520},"HighMiddleAge":{"money_24h":4930},"LateMiddleAge":{"money_24h":6510},"ColonialAge":{"money_24h":9920},"IndustrialAge":{"money_24h":12360},"ProgressiveEra":{"money_24h":15000},"ModernEra":{"money_24h":18660},"PostModernEra":{"money_24h":23470},"ContemporaryEra":{"money_24h":30550},"TomorrowEra":{"money_24h":35380},"FutureEra":{"money_24h":40550},"ArcticFuture":{"money_24h":46080},"OceanicFuture":{"money_24h":51960},"VirtualFuture":{"money_24h":58190},"SpaceAgeMars":{"money_24h":97200},"SpaceAgeAsteroidBelt":{"money_24h":107670},"SpaceAgeVenus":{"money_24h":118690},"SpaceAgeJupiterMoon":{"money_24h":130270},"SpaceAgeTitan":{"money_24h":142420},"SpaceAgeSpaceHub":{"money_24h":155140}} },
+    "D_MultiAge_ValentineBonus1": { prod: {"BronzeAge":{"happiness":180},"IronAge":{"happiness":230},"EarlyMiddleAge":{"happiness":250},"HighMiddleAge":{"happiness":280},"LateMiddleAge":{"happiness":320},"ColonialAge":{"happiness":370},"IndustrialAge":{"happiness":400},"ProgressiveEra":{"happiness":440},"ModernEra":{"happiness":470},"PostModernEra":{"happiness":490},"ContemporaryEra":{"happiness":570},"TomorrowEra":{"happiness":691},"FutureEra":{"happiness":828},"ArcticFuture":{"happiness":965},"OceanicFuture":{"happiness":1113},"VirtualFuture":{"happiness":1330},"SpaceAgeMars":{"happiness":2128},"SpaceAgeAsteroidBelt":{"happiness":2312},"SpaceAgeVenus":{"happiness":2498},"SpaceAgeJupiterMoon":{"happiness":2691},"SpaceAgeTitan":{"happiness":2886},"SpaceAgeSpaceHub":{"happiness":3087}} },
+    "D_MultiAge_ValentineBonus2": { prod: {"BronzeAge":{"happiness":280},"IronAge":{"happiness":360},"EarlyMiddleAge":{"happiness":390},"HighMiddleAge":{"happiness":440},"LateMiddleAge":{"happiness":500},"ColonialAge":{"happiness":580},"IndustrialAge":{"happiness":630},"ProgressiveEra":{"happiness":690},"ModernEra":{"happiness":740},"PostModernEra":{"happiness":770},"ContemporaryEra":{"happiness":890},"TomorrowEra":{"happiness":1080},"FutureEra":{"happiness":1290},"ArcticFuture":{"happiness":1500},"OceanicFuture":{"happiness":1730},"VirtualFuture":{"happiness":2070},"SpaceAgeMars":{"happiness":3310},"SpaceAgeAsteroidBelt":{"happiness":3600},"SpaceAgeVenus":{"happiness":3890},"SpaceAgeJupiterMoon":{"happiness":4190},"SpaceAgeTitan":{"happiness":4490},"SpaceAgeSpaceHub":{"happiness":4810}} },
+    "R_MultiAge_FallBonus19gPond": { prod: {"BronzeAge":{"population":200,"demandHappiness":200,"money_24h":800},"IronAge":{"population":440,"demandHappiness":440,"money_24h":2000},"EarlyMiddleAge":{"population":670,"demandHappiness":670,"money_24h":3400},"HighMiddleAge":{"population":940,"demandHappiness":940,"money_24h":4700},"LateMiddleAge":{"population":1230,"demandHappiness":1230,"money_24h":6200},"ColonialAge":{"population":1550,"demandHappiness":1550,"money_24h":9500},"IndustrialAge":{"population":1900,"demandHappiness":1900,"money_24h":11800},"ProgressiveEra":{"population":2270,"demandHappiness":2270,"money_24h":14300},"ModernEra":{"population":2660,"demandHappiness":2660,"money_24h":17800},"PostModernEra":{"population":3060,"demandHappiness":3060,"money_24h":22400},"ContemporaryEra":{"population":3490,"demandHappiness":3490,"money_24h":29200},"TomorrowEra":{"population":3930,"demandHappiness":3930,"money_24h":33800},"FutureEra":{"population":4400,"demandHappiness":4400,"money_24h":38700},"ArcticFuture":{"population":4880,"demandHappiness":4880,"money_24h":44000},"OceanicFuture":{"population":5370,"demandHappiness":5370,"money_24h":49600},"VirtualFuture":{"population":5880,"demandHappiness":5880,"money_24h":55600},"SpaceAgeMars":{"population":9310,"demandHappiness":9310,"money_24h":92800},"SpaceAgeAsteroidBelt":{"population":10110,"demandHappiness":10110,"money_24h":102800},"SpaceAgeVenus":{"population":10930,"demandHappiness":10930,"money_24h":113300},"SpaceAgeJupiterMoon":{"population":11770,"demandHappiness":11770,"money_24h":124400},"SpaceAgeTitan":{"population":12620,"demandHappiness":12620,"money_24h":136000},"SpaceAgeSpaceHub":{"population":13500,"demandHappiness":13500,"money_24h":148100}} },
+    "R_MultiAge_EasterBonus5": { prod: {"BronzeAge":{"population":1,"demandHappiness":1,"money_24h":350},"IronAge":{"population":3,"demandHappiness":3,"money_24h":600},"EarlyMiddleAge":{"population":4,"demandHappiness":4,"money_24h":1000},"HighMiddleAge":{"population":6,"demandHappiness":6,"money_24h":1400},"LateMiddleAge":{"population":8,"demandHappiness":8,"money_24h":1850},"ColonialAge":{"population":10,"demandHappiness":10,"money_24h":2820},"IndustrialAge":{"population":13,"demandHappiness":13,"money_24h":3510},"ProgressiveEra":{"population":15,"demandHappiness":15,"money_24h":4260},"ModernEra":{"population":18,"demandHappiness":18,"money_24h":5300},"PostModernEra":{"population":20,"demandHappiness":20,"money_24h":6670},"ContemporaryEra":{"population":23,"demandHappiness":23,"money_24h":8680},"TomorrowEra":{"population":26,"demandHappiness":26,"money_24h":10050},"FutureEra":{"population":29,"demandHappiness":29,"money_24h":11520},"ArcticFuture":{"population":33,"demandHappiness":33,"money_24h":13090},"OceanicFuture":{"population":36,"demandHappiness":36,"money_24h":14760},"VirtualFuture":{"population":39,"demandHappiness":39,"money_24h":16530},"SpaceAgeMars":{"population":62,"demandHappiness":62,"money_24h":27620},"SpaceAgeAsteroidBelt":{"population":67,"demandHappiness":67,"money_24h":30590},"SpaceAgeVenus":{"population":73,"demandHappiness":73,"money_24h":33720},"SpaceAgeJupiterMoon":{"population":78,"demandHappiness":78,"money_24h":37010},"SpaceAgeTitan":{"population":84,"demandHappiness":84,"money_24h":40460},"SpaceAgeSpaceHub":{"population":90,"demandHappiness":90,"money_24h":44070}} },
+    "R_MultiAge_EasterBonus5b": { prod: {"BronzeAge":{"population":16,"demandHappiness":16,"money_24h":420},"IronAge":{"population":35,"demandHappiness":35,"money_24h":860},"EarlyMiddleAge":{"population":53,"demandHappiness":53,"money_24h":1440},"HighMiddleAge":{"population":75,"demandHappiness":75,"money_24h":2020},"LateMiddleAge":{"population":98,"demandHappiness":98,"money_24h":2660},"ColonialAge":{"population":124,"demandHappiness":124,"money_24h":4060},"IndustrialAge":{"population":152,"demandHappiness":152,"money_24h":5050},"ProgressiveEra":{"population":181,"demandHappiness":181,"money_24h":6130},"ModernEra":{"population":212,"demandHappiness":212,"money_24h":7630},"PostModernEra":{"population":245,"demandHappiness":245,"money_24h":9600},"ContemporaryEra":{"population":279,"demandHappiness":279,"money_24h":12500},"TomorrowEra":{"population":314,"demandHappiness":314,"money_24h":14470},"FutureEra":{"population":352,"demandHappiness":352,"money_24h":16590},"ArcticFuture":{"population":390,"demandHappiness":390,"money_24h":18850},"OceanicFuture":{"population":430,"demandHappiness":430,"money_24h":21250},"VirtualFuture":{"population":470,"demandHappiness":470,"money_24h":23810},"SpaceAgeMars":{"population":745,"demandHappiness":745,"money_24h":39770},"SpaceAgeAsteroidBelt":{"population":809,"demandHappiness":809,"money_24h":44050},"SpaceAgeVenus":{"population":874,"demandHappiness":874,"money_24h":48550},"SpaceAgeJupiterMoon":{"population":941,"demandHappiness":941,"money_24h":53290},"SpaceAgeTitan":{"population":1010,"demandHappiness":1010,"money_24h":58260},"SpaceAgeSpaceHub":{"population":1080,"demandHappiness":1080,"money_24h":63460}} },
+    "R_MultiAge_FallBonus19gFlower": { prod: {"BronzeAge":{"population":200,"demandHappiness":200,"money_24h":800},"IronAge":{"population":440,"demandHappiness":440,"money_24h":2000},"EarlyMiddleAge":{"population":670,"demandHappiness":670,"money_24h":3400},"HighMiddleAge":{"population":940,"demandHappiness":940,"money_24h":4700},"LateMiddleAge":{"population":1230,"demandHappiness":1230,"money_24h":6200},"ColonialAge":{"population":1550,"demandHappiness":1550,"money_24h":9500},"IndustrialAge":{"population":1900,"demandHappiness":1900,"money_24h":11800},"ProgressiveEra":{"population":2270,"demandHappiness":2270,"money_24h":14300},"ModernEra":{"population":2660,"demandHappiness":2660,"money_24h":17800},"PostModernEra":{"population":3060,"demandHappiness":3060,"money_24h":22400},"ContemporaryEra":{"population":3490,"demandHappiness":3490,"money_24h":29200},"TomorrowEra":{"population":3930,"demandHappiness":3930,"money_24h":33800},"FutureEra":{"population":4400,"demandHappiness":4400,"money_24h":38700},"ArcticFuture":{"population":4880,"demandHappiness":4880,"money_24h":44000},"OceanicFuture":{"population":5370,"demandHappiness":5370,"money_24h":49600},"VirtualFuture":{"population":5880,"demandHappiness":5880,"money_24h":55600},"SpaceAgeMars":{"population":9310,"demandHappiness":9310,"money_24h":92800},"SpaceAgeAsteroidBelt":{"population":10110,"demandHappiness":10110,"money_24h":102800},"SpaceAgeVenus":{"population":10930,"demandHappiness":10930,"money_24h":113300},"SpaceAgeJupiterMoon":{"population":11770,"demandHappiness":11770,"money_24h":124400},"SpaceAgeTitan":{"population":12620,"demandHappiness":12620,"money_24h":136000},"SpaceAgeSpaceHub":{"population":13500,"demandHappiness":13500,"money_24h":148100}} },
+    "D_MultiAge_ChristmasBonus16": { prod: {"BronzeAge":{"happiness":60},"IronAge":{"happiness":76},"EarlyMiddleAge":{"happiness":90},"HighMiddleAge":{"happiness":110},"LateMiddleAge":{"happiness":131},"ColonialAge":{"happiness":148},"IndustrialAge":{"happiness":166},"ProgressiveEra":{"happiness":183},"ModernEra":{"happiness":200},"PostModernEra":{"happiness":221},"ContemporaryEra":{"happiness":257},"TomorrowEra":{"happiness":287},"FutureEra":{"happiness":322},"ArcticFuture":{"happiness":367},"OceanicFuture":{"happiness":423},"VirtualFuture":{"happiness":506},"SpaceAgeMars":{"happiness":809},"SpaceAgeAsteroidBelt":{"happiness":879},"SpaceAgeVenus":{"happiness":950},"SpaceAgeJupiterMoon":{"happiness":1023},"SpaceAgeTitan":{"happiness":1098},"SpaceAgeSpaceHub":{"happiness":1174}} },
+    "R_MultiAge_SoccerBonus19eAphrodite": { prod: {"BronzeAge":{"happiness":250,"population":61,"demandHappiness":61,"money_24h":350},"IronAge":{"happiness":430,"population":131,"demandHappiness":131,"money_24h":750},"EarlyMiddleAge":{"happiness":480,"population":200,"demandHappiness":200,"money_24h":1200},"HighMiddleAge":{"happiness":540,"population":281,"demandHappiness":281,"money_24h":1600},"LateMiddleAge":{"happiness":600,"population":369,"demandHappiness":369,"money_24h":2000},"ColonialAge":{"happiness":700,"population":466,"demandHappiness":466,"money_24h":3000},"IndustrialAge":{"happiness":790,"population":569,"demandHappiness":569,"money_24h":3800},"ProgressiveEra":{"happiness":870,"population":680,"demandHappiness":680,"money_24h":4600},"ModernEra":{"happiness":930,"population":797,"demandHappiness":797,"money_24h":5700},"PostModernEra":{"happiness":970,"population":918,"demandHappiness":918,"money_24h":7200},"ContemporaryEra":{"happiness":1130,"population":1046,"demandHappiness":1046,"money_24h":9400},"TomorrowEra":{"happiness":1370,"population":1179,"demandHappiness":1179,"money_24h":10900},"FutureEra":{"happiness":1640,"population":1319,"demandHappiness":1319,"money_24h":12400},"ArcticFuture":{"happiness":1910,"population":1463,"demandHappiness":1463,"money_24h":14100},"OceanicFuture":{"happiness":2210,"population":1611,"demandHappiness":1611,"money_24h":15900},"VirtualFuture":{"happiness":2630,"population":1764,"demandHappiness":1764,"money_24h":17900},"SpaceAgeMars":{"happiness":4220,"population":2792,"demandHappiness":2792,"money_24h":29800},"SpaceAgeAsteroidBelt":{"happiness":4580,"population":3033,"demandHappiness":3033,"money_24h":33000},"SpaceAgeVenus":{"happiness":4950,"population":3278,"demandHappiness":3278,"money_24h":36400},"SpaceAgeJupiterMoon":{"happiness":5330,"population":3530,"demandHappiness":3530,"money_24h":40000},"SpaceAgeTitan":{"happiness":5720,"population":3787,"demandHappiness":3787,"money_24h":43700},"SpaceAgeSpaceHub":{"happiness":6120,"population":4050,"demandHappiness":4050,"money_24h":47600}} },
+    "D_MultiAge_RankingFix16a": { prod: {"BronzeAge":{"happiness":113},"IronAge":{"happiness":194},"EarlyMiddleAge":{"happiness":215},"HighMiddleAge":{"happiness":239},"LateMiddleAge":{"happiness":267},"ColonialAge":{"happiness":314},"IndustrialAge":{"happiness":354},"ProgressiveEra":{"happiness":389},"ModernEra":{"happiness":416},"PostModernEra":{"happiness":433},"ContemporaryEra":{"happiness":504},"TomorrowEra":{"happiness":611},"FutureEra":{"happiness":733},"ArcticFuture":{"happiness":853},"OceanicFuture":{"happiness":984},"VirtualFuture":{"happiness":1176},"SpaceAgeMars":{"happiness":1882},"SpaceAgeAsteroidBelt":{"happiness":2045},"SpaceAgeVenus":{"happiness":2209},"SpaceAgeJupiterMoon":{"happiness":2380},"SpaceAgeTitan":{"happiness":2552},"SpaceAgeSpaceHub":{"happiness":2730}} },
+    "D_MultiAge_Expedition22FeathersGold": { prod: {"BronzeAge":{"happiness":200},"IronAge":{"happiness":350},"EarlyMiddleAge":{"happiness":390},"HighMiddleAge":{"happiness":430},"LateMiddleAge":{"happiness":480},"ColonialAge":{"happiness":570},"IndustrialAge":{"happiness":640},"ProgressiveEra":{"happiness":700},"ModernEra":{"happiness":750},"PostModernEra":{"happiness":780},"ContemporaryEra":{"happiness":910},"TomorrowEra":{"happiness":1100},"FutureEra":{"happiness":1320},"ArcticFuture":{"happiness":1540},"OceanicFuture":{"happiness":1770},"VirtualFuture":{"happiness":2120},"SpaceAgeMars":{"happiness":3390},"SpaceAgeAsteroidBelt":{"happiness":3680},"SpaceAgeVenus":{"happiness":3980},"SpaceAgeJupiterMoon":{"happiness":4280},"SpaceAgeTitan":{"happiness":4590},"SpaceAgeSpaceHub":{"happiness":4910}} },
+    "D_MultiAge_Expedition22SpikesGold": { prod: {"BronzeAge":{"happiness":200},"IronAge":{"happiness":350},"EarlyMiddleAge":{"happiness":390},"HighMiddleAge":{"happiness":430},"LateMiddleAge":{"happiness":480},"ColonialAge":{"happiness":570},"IndustrialAge":{"happiness":640},"ProgressiveEra":{"happiness":700},"ModernEra":{"happiness":750},"PostModernEra":{"happiness":780},"ContemporaryEra":{"happiness":910},"TomorrowEra":{"happiness":1100},"FutureEra":{"happiness":1320},"ArcticFuture":{"happiness":1540},"OceanicFuture":{"happiness":1770},"VirtualFuture":{"happiness":2120},"SpaceAgeMars":{"happiness":3390},"SpaceAgeAsteroidBelt":{"happiness":3680},"SpaceAgeVenus":{"happiness":3980},"SpaceAgeJupiterMoon":{"happiness":4280},"SpaceAgeTitan":{"happiness":4590},"SpaceAgeSpaceHub":{"happiness":4910}} },
+    "D_MultiAge_Expedition22ScalesGold": { prod: {"BronzeAge":{"happiness":200},"IronAge":{"happiness":350},"EarlyMiddleAge":{"happiness":390},"HighMiddleAge":{"happiness":430},"LateMiddleAge":{"happiness":480},"ColonialAge":{"happiness":570},"IndustrialAge":{"happiness":640},"ProgressiveEra":{"happiness":700},"ModernEra":{"happiness":750},"PostModernEra":{"happiness":780},"ContemporaryEra":{"happiness":910},"TomorrowEra":{"happiness":1100},"FutureEra":{"happiness":1320},"ArcticFuture":{"happiness":1540},"OceanicFuture":{"happiness":1770},"VirtualFuture":{"happiness":2120},"SpaceAgeMars":{"happiness":3390},"SpaceAgeAsteroidBelt":{"happiness":3680},"SpaceAgeVenus":{"happiness":3980},"SpaceAgeJupiterMoon":{"happiness":4280},"SpaceAgeTitan":{"happiness":4590},"SpaceAgeSpaceHub":{"happiness":4910}} },
+    "R_MultiAge_Expedition22eGold": { prod: {"BronzeAge":{"population":5,"demandHappiness":5,"money_24h":2800},"IronAge":{"population":5,"demandHappiness":5,"money_24h":4800},"EarlyMiddleAge":{"population":5,"demandHappiness":5,"money_24h":7990},"HighMiddleAge":{"population":5,"demandHappiness":5,"money_24h":11190},"LateMiddleAge":{"population":5,"demandHappiness":5,"money_24h":14790},"ColonialAge":{"population":5,"demandHappiness":5,"money_24h":22520},"IndustrialAge":{"population":5,"demandHappiness":5,"money_24h":28050},"ProgressiveEra":{"population":5,"demandHappiness":5,"money_24h":34050},"ModernEra":{"population":5,"demandHappiness":5,"money_24h":42360},"PostModernEra":{"population":5,"demandHappiness":5,"money_24h":53290},"ContemporaryEra":{"population":5,"demandHappiness":5,"money_24h":69370},"TomorrowEra":{"population":5,"demandHappiness":5,"money_24h":80320},"FutureEra":{"population":5,"demandHappiness":5,"money_24h":92070},"ArcticFuture":{"population":5,"demandHappiness":5,"money_24h":104620},"OceanicFuture":{"population":5,"demandHappiness":5,"money_24h":117960},"VirtualFuture":{"population":5,"demandHappiness":5,"money_24h":132130},"SpaceAgeMars":{"population":5,"demandHappiness":5,"money_24h":220700},"SpaceAgeAsteroidBelt":{"population":5,"demandHappiness":5,"money_24h":244460},"SpaceAgeVenus":{"population":5,"demandHappiness":5,"money_24h":269470},"SpaceAgeJupiterMoon":{"population":5,"demandHappiness":5,"money_24h":295760},"SpaceAgeTitan":{"population":5,"demandHappiness":5,"money_24h":323360},"SpaceAgeSpaceHub":{"population":5,"demandHappiness":5,"money_24h":352230}} },
+    "R_MultiAge_SoccerBonus19eArtemis": { prod: {"BronzeAge":{"happiness":250,"population":61,"demandHappiness":61,"money_24h":350},"IronAge":{"happiness":430,"population":131,"demandHappiness":131,"money_24h":750},"EarlyMiddleAge":{"happiness":480,"population":200,"demandHappiness":200,"money_24h":1200},"HighMiddleAge":{"happiness":540,"population":281,"demandHappiness":281,"money_24h":1600},"LateMiddleAge":{"happiness":600,"population":369,"demandHappiness":369,"money_24h":2000},"ColonialAge":{"happiness":700,"population":466,"demandHappiness":466,"money_24h":3000},"IndustrialAge":{"happiness":790,"population":569,"demandHappiness":569,"money_24h":3800},"ProgressiveEra":{"happiness":870,"population":680,"demandHappiness":680,"money_24h":4600},"ModernEra":{"happiness":930,"population":797,"demandHappiness":797,"money_24h":5700},"PostModernEra":{"happiness":970,"population":918,"demandHappiness":918,"money_24h":7200},"ContemporaryEra":{"happiness":1130,"population":1046,"demandHappiness":1046,"money_24h":9400},"TomorrowEra":{"happiness":1370,"population":1179,"demandHappiness":1179,"money_24h":10900},"FutureEra":{"happiness":1640,"population":1319,"demandHappiness":1319,"money_24h":12400},"ArcticFuture":{"happiness":1910,"population":1463,"demandHappiness":1463,"money_24h":14100},"OceanicFuture":{"happiness":2210,"population":1611,"demandHappiness":1611,"money_24h":15900},"VirtualFuture":{"happiness":2630,"population":1764,"demandHappiness":1764,"money_24h":17900},"SpaceAgeMars":{"happiness":4220,"population":2792,"demandHappiness":2792,"money_24h":29800},"SpaceAgeAsteroidBelt":{"happiness":4580,"population":3033,"demandHappiness":3033,"money_24h":33000},"SpaceAgeVenus":{"happiness":4950,"population":3278,"demandHappiness":3278,"money_24h":36400},"SpaceAgeJupiterMoon":{"happiness":5330,"population":3530,"demandHappiness":3530,"money_24h":40000},"SpaceAgeTitan":{"happiness":5720,"population":3787,"demandHappiness":3787,"money_24h":43700},"SpaceAgeSpaceHub":{"happiness":6120,"population":4050,"demandHappiness":4050,"money_24h":47600}} },
+    "R_MultiAge_SoccerBonus21a": { prod: {"BronzeAge":{"happiness":590,"population":149,"demandHappiness":149,"money_24h":800},"IronAge":{"happiness":1010,"population":319,"demandHappiness":319,"money_24h":1800},"EarlyMiddleAge":{"happiness":1120,"population":490,"demandHappiness":490,"money_24h":3000},"HighMiddleAge":{"happiness":1250,"population":688,"demandHappiness":688,"money_24h":4200},"LateMiddleAge":{"happiness":1390,"population":902,"demandHappiness":902,"money_24h":5600},"ColonialAge":{"happiness":1630,"population":1139,"demandHappiness":1139,"money_24h":8500},"IndustrialAge":{"happiness":1840,"population":1392,"demandHappiness":1392,"money_24h":10500},"ProgressiveEra":{"happiness":2020,"population":1661,"demandHappiness":1661,"money_24h":12800},"ModernEra":{"happiness":2160,"population":1947,"demandHappiness":1947,"money_24h":15900},"PostModernEra":{"happiness":2250,"population":2244,"demandHappiness":2244,"money_24h":20000},"ContemporaryEra":{"happiness":2620,"population":2558,"demandHappiness":2558,"money_24h":26000},"TomorrowEra":{"happiness":3180,"population":2882,"demandHappiness":2882,"money_24h":30200},"FutureEra":{"happiness":3810,"population":3223,"demandHappiness":3223,"money_24h":34600},"ArcticFuture":{"happiness":4440,"population":3575,"demandHappiness":3575,"money_24h":39300},"OceanicFuture":{"happiness":5120,"population":3938,"demandHappiness":3938,"money_24h":44300},"VirtualFuture":{"happiness":6120,"population":4312,"demandHappiness":4312,"money_24h":49600},"SpaceAgeMars":{"happiness":9790,"population":6826,"demandHappiness":6826,"money_24h":82900},"SpaceAgeAsteroidBelt":{"happiness":10630,"population":7414,"demandHappiness":7414,"money_24h":91800},"SpaceAgeVenus":{"happiness":11490,"population":8014,"demandHappiness":8014,"money_24h":101200},"SpaceAgeJupiterMoon":{"happiness":12380,"population":8630,"demandHappiness":8630,"money_24h":111000},"SpaceAgeTitan":{"happiness":13270,"population":9257,"demandHappiness":9257,"money_24h":121400},"SpaceAgeSpaceHub":{"happiness":14200,"population":9900,"demandHappiness":9900,"money_24h":132200}} },
+    "R_MultiAge_SoccerBonus21j": { prod: {"BronzeAge":{"happiness":990,"population":243,"demandHappiness":243,"money_24h":1700},"IronAge":{"happiness":1710,"population":522,"demandHappiness":522,"money_24h":4100},"EarlyMiddleAge":{"happiness":1890,"population":801,"demandHappiness":801,"money_24h":6800},"HighMiddleAge":{"happiness":2110,"population":1125,"demandHappiness":1125,"money_24h":9500},"LateMiddleAge":{"happiness":2350,"population":1476,"demandHappiness":1476,"money_24h":12600},"ColonialAge":{"happiness":2760,"population":1863,"demandHappiness":1863,"money_24h":19200},"IndustrialAge":{"happiness":3120,"population":2277,"demandHappiness":2277,"money_24h":23900},"ProgressiveEra":{"happiness":3420,"population":2718,"demandHappiness":2718,"money_24h":29000},"ModernEra":{"happiness":3660,"population":3186,"demandHappiness":3186,"money_24h":36000},"PostModernEra":{"happiness":3810,"population":3672,"demandHappiness":3672,"money_24h":45300},"ContemporaryEra":{"happiness":4430,"population":4185,"demandHappiness":4185,"money_24h":59000},"TomorrowEra":{"happiness":5380,"population":4716,"demandHappiness":4716,"money_24h":68300},"FutureEra":{"happiness":6450,"population":5274,"demandHappiness":5274,"money_24h":78300},"ArcticFuture":{"happiness":7510,"population":5850,"demandHappiness":5850,"money_24h":89000},"OceanicFuture":{"happiness":8660,"population":6444,"demandHappiness":6444,"money_24h":100400},"VirtualFuture":{"happiness":10350,"population":7056,"demandHappiness":7056,"money_24h":112400},"SpaceAgeMars":{"happiness":16560,"population":11169,"demandHappiness":11169,"money_24h":187800},"SpaceAgeAsteroidBelt":{"happiness":18000,"population":12132,"demandHappiness":12132,"money_24h":208000},"SpaceAgeVenus":{"happiness":19440,"population":13113,"demandHappiness":13113,"money_24h":229300},"SpaceAgeJupiterMoon":{"happiness":20940,"population":14121,"demandHappiness":14121,"money_24h":251700},"SpaceAgeTitan":{"happiness":22460,"population":15147,"demandHappiness":15147,"money_24h":275100},"SpaceAgeSpaceHub":{"happiness":24030,"population":16200,"demandHappiness":16200,"money_24h":299700}} },
+    "R_MultiAge_SoccerBonus21b": { prod: {"BronzeAge":{"happiness":630,"population":155,"demandHappiness":155,"money_24h":900},"IronAge":{"happiness":1080,"population":334,"demandHappiness":334,"money_24h":2100},"EarlyMiddleAge":{"happiness":1190,"population":512,"demandHappiness":512,"money_24h":3500},"HighMiddleAge":{"happiness":1330,"population":719,"demandHappiness":719,"money_24h":4900},"LateMiddleAge":{"happiness":1480,"population":943,"demandHappiness":943,"money_24h":6500},"ColonialAge":{"happiness":1750,"population":1190,"demandHappiness":1190,"money_24h":9900},"IndustrialAge":{"happiness":1970,"population":1455,"demandHappiness":1455,"money_24h":12300},"ProgressiveEra":{"happiness":2160,"population":1737,"demandHappiness":1737,"money_24h":14900},"ModernEra":{"happiness":2310,"population":2036,"demandHappiness":2036,"money_24h":18600},"PostModernEra":{"happiness":2410,"population":2346,"demandHappiness":2346,"money_24h":23300},"ContemporaryEra":{"happiness":2800,"population":2674,"demandHappiness":2674,"money_24h":30400},"TomorrowEra":{"happiness":3400,"population":3013,"demandHappiness":3013,"money_24h":35200},"FutureEra":{"happiness":4070,"population":3370,"demandHappiness":3370,"money_24h":40300},"ArcticFuture":{"happiness":4740,"population":3738,"demandHappiness":3738,"money_24h":45800},"OceanicFuture":{"happiness":5470,"population":4117,"demandHappiness":4117,"money_24h":51700},"VirtualFuture":{"happiness":6540,"population":4508,"demandHappiness":4508,"money_24h":57900},"SpaceAgeMars":{"happiness":10460,"population":7136,"demandHappiness":7136,"money_24h":96700},"SpaceAgeAsteroidBelt":{"happiness":11370,"population":7751,"demandHappiness":7751,"money_24h":107100},"SpaceAgeVenus":{"happiness":12280,"population":8378,"demandHappiness":8378,"money_24h":118000},"SpaceAgeJupiterMoon":{"happiness":13230,"population":9022,"demandHappiness":9022,"money_24h":129500},"SpaceAgeTitan":{"happiness":14190,"population":9677,"demandHappiness":9677,"money_24h":141600},"SpaceAgeSpaceHub":{"happiness":15180,"population":10350,"demandHappiness":10350,"money_24h":154300}} },
+    "R_MultiAge_SoccerBonus21c": { prod: {"BronzeAge":{"happiness":650,"population":162,"demandHappiness":162,"money_24h":1000},"IronAge":{"happiness":1130,"population":348,"demandHappiness":348,"money_24h":2300},"EarlyMiddleAge":{"happiness":1240,"population":534,"demandHappiness":534,"money_24h":3900},"HighMiddleAge":{"happiness":1390,"population":750,"demandHappiness":750,"money_24h":5500},"LateMiddleAge":{"happiness":1550,"population":984,"demandHappiness":984,"money_24h":7200},"ColonialAge":{"happiness":1820,"population":1242,"demandHappiness":1242,"money_24h":11000},"IndustrialAge":{"happiness":2050,"population":1518,"demandHappiness":1518,"money_24h":13700},"ProgressiveEra":{"happiness":2260,"population":1812,"demandHappiness":1812,"money_24h":16600},"ModernEra":{"happiness":2410,"population":2124,"demandHappiness":2124,"money_24h":20700},"PostModernEra":{"happiness":2510,"population":2448,"demandHappiness":2448,"money_24h":26000},"ContemporaryEra":{"happiness":2920,"population":2790,"demandHappiness":2790,"money_24h":33900},"TomorrowEra":{"happiness":3550,"population":3144,"demandHappiness":3144,"money_24h":39200},"FutureEra":{"happiness":4250,"population":3516,"demandHappiness":3516,"money_24h":44900},"ArcticFuture":{"happiness":4950,"population":3900,"demandHappiness":3900,"money_24h":51100},"OceanicFuture":{"happiness":5710,"population":4296,"demandHappiness":4296,"money_24h":57600},"VirtualFuture":{"happiness":6820,"population":4704,"demandHappiness":4704,"money_24h":64500},"SpaceAgeMars":{"happiness":10910,"population":7446,"demandHappiness":7446,"money_24h":107700},"SpaceAgeAsteroidBelt":{"happiness":11860,"population":8088,"demandHappiness":8088,"money_24h":119300},"SpaceAgeVenus":{"happiness":12810,"population":8742,"demandHappiness":8742,"money_24h":131500},"SpaceAgeJupiterMoon":{"happiness":13800,"population":9414,"demandHappiness":9414,"money_24h":144300},"SpaceAgeTitan":{"happiness":14800,"population":10098,"demandHappiness":10098,"money_24h":157800},"SpaceAgeSpaceHub":{"happiness":15840,"population":10800,"demandHappiness":10800,"money_24h":171900}} },
+    "R_MultiAge_SoccerBonus21d": { prod: {"BronzeAge":{"happiness":690,"population":169,"demandHappiness":169,"money_24h":1100},"IronAge":{"happiness":1200,"population":363,"demandHappiness":363,"money_24h":2500},"EarlyMiddleAge":{"happiness":1320,"population":556,"demandHappiness":556,"money_24h":4200},"HighMiddleAge":{"happiness":1480,"population":781,"demandHappiness":781,"money_24h":5900},"LateMiddleAge":{"happiness":1650,"population":1025,"demandHappiness":1025,"money_24h":7800},"ColonialAge":{"happiness":1930,"population":1294,"demandHappiness":1294,"money_24h":11800},"IndustrialAge":{"happiness":2180,"population":1581,"demandHappiness":1581,"money_24h":14700},"ProgressiveEra":{"happiness":2400,"population":1888,"demandHappiness":1888,"money_24h":17900},"ModernEra":{"happiness":2560,"population":2213,"demandHappiness":2213,"money_24h":22300},"PostModernEra":{"happiness":2670,"population":2550,"demandHappiness":2550,"money_24h":28000},"ContemporaryEra":{"happiness":3100,"population":2906,"demandHappiness":2906,"money_24h":36500},"TomorrowEra":{"happiness":3770,"population":3275,"demandHappiness":3275,"money_24h":42200},"FutureEra":{"happiness":4510,"population":3663,"demandHappiness":3663,"money_24h":48400},"ArcticFuture":{"happiness":5260,"population":4063,"demandHappiness":4063,"money_24h":55000},"OceanicFuture":{"happiness":6060,"population":4475,"demandHappiness":4475,"money_24h":62000},"VirtualFuture":{"happiness":7240,"population":4900,"demandHappiness":4900,"money_24h":69400},"SpaceAgeMars":{"happiness":11590,"population":7756,"demandHappiness":7756,"money_24h":116000},"SpaceAgeAsteroidBelt":{"happiness":12600,"population":8425,"demandHappiness":8425,"money_24h":128500},"SpaceAgeVenus":{"happiness":13610,"population":9106,"demandHappiness":9106,"money_24h":141600},"SpaceAgeJupiterMoon":{"happiness":14660,"population":9806,"demandHappiness":9806,"money_24h":155400},"SpaceAgeTitan":{"happiness":15720,"population":10519,"demandHappiness":10519,"money_24h":169900},"SpaceAgeSpaceHub":{"happiness":16820,"population":11250,"demandHappiness":11250,"money_24h":185100}} },
+    "R_MultiAge_SoccerBonus21e": { prod: {"BronzeAge":{"happiness":750,"population":176,"demandHappiness":176,"money_24h":1200},"IronAge":{"happiness":1300,"population":377,"demandHappiness":377,"money_24h":2800},"EarlyMiddleAge":{"happiness":1430,"population":579,"demandHappiness":579,"money_24h":4700},"HighMiddleAge":{"happiness":1600,"population":813,"demandHappiness":813,"money_24h":6600},"LateMiddleAge":{"happiness":1780,"population":1066,"demandHappiness":1066,"money_24h":8700},"ColonialAge":{"happiness":2100,"population":1346,"demandHappiness":1346,"money_24h":13200},"IndustrialAge":{"happiness":2370,"population":1645,"demandHappiness":1645,"money_24h":16500},"ProgressiveEra":{"happiness":2600,"population":1963,"demandHappiness":1963,"money_24h":20000},"ModernEra":{"happiness":2780,"population":2301,"demandHappiness":2301,"money_24h":24900},"PostModernEra":{"happiness":2900,"population":2652,"demandHappiness":2652,"money_24h":31300},"ContemporaryEra":{"happiness":3360,"population":3023,"demandHappiness":3023,"money_24h":40800},"TomorrowEra":{"happiness":4080,"population":3406,"demandHappiness":3406,"money_24h":47200},"FutureEra":{"happiness":4890,"population":3809,"demandHappiness":3809,"money_24h":54100},"ArcticFuture":{"happiness":5700,"population":4225,"demandHappiness":4225,"money_24h":61500},"OceanicFuture":{"happiness":6580,"population":4654,"demandHappiness":4654,"money_24h":69400},"VirtualFuture":{"happiness":7860,"population":5096,"demandHappiness":5096,"money_24h":77700},"SpaceAgeMars":{"happiness":12570,"population":8067,"demandHappiness":8067,"money_24h":129800},"SpaceAgeAsteroidBelt":{"happiness":13660,"population":8762,"demandHappiness":8762,"money_24h":143800},"SpaceAgeVenus":{"happiness":14760,"population":9471,"demandHappiness":9471,"money_24h":158500},"SpaceAgeJupiterMoon":{"happiness":15900,"population":10199,"demandHappiness":10199,"money_24h":173900},"SpaceAgeTitan":{"happiness":17050,"population":10940,"demandHappiness":10940,"money_24h":190200},"SpaceAgeSpaceHub":{"happiness":18240,"population":11700,"demandHappiness":11700,"money_24h":207100}} },
+    "R_MultiAge_SoccerBonus21f": { prod: {"BronzeAge":{"happiness":770,"population":182,"demandHappiness":182,"money_24h":1300},"IronAge":{"happiness":1340,"population":392,"demandHappiness":392,"money_24h":3100},"EarlyMiddleAge":{"happiness":1480,"population":601,"demandHappiness":601,"money_24h":5100},"HighMiddleAge":{"happiness":1650,"population":844,"demandHappiness":844,"money_24h":7100},"LateMiddleAge":{"happiness":1840,"population":1107,"demandHappiness":1107,"money_24h":9400},"ColonialAge":{"happiness":2160,"population":1397,"demandHappiness":1397,"money_24h":14400},"IndustrialAge":{"happiness":2440,"population":1708,"demandHappiness":1708,"money_24h":17900},"ProgressiveEra":{"happiness":2680,"population":2039,"demandHappiness":2039,"money_24h":21700},"ModernEra":{"happiness":2860,"population":2390,"demandHappiness":2390,"money_24h":27000},"PostModernEra":{"happiness":2980,"population":2754,"demandHappiness":2754,"money_24h":34000},"ContemporaryEra":{"happiness":3470,"population":3139,"demandHappiness":3139,"money_24h":44300},"TomorrowEra":{"happiness":4210,"population":3537,"demandHappiness":3537,"money_24h":51300},"FutureEra":{"happiness":5040,"population":3956,"demandHappiness":3956,"money_24h":58800},"ArcticFuture":{"happiness":5870,"population":4388,"demandHappiness":4388,"money_24h":66800},"OceanicFuture":{"happiness":6770,"population":4833,"demandHappiness":4833,"money_24h":75300},"VirtualFuture":{"happiness":8090,"population":5292,"demandHappiness":5292,"money_24h":84300},"SpaceAgeMars":{"happiness":12950,"population":8377,"demandHappiness":8377,"money_24h":140800},"SpaceAgeAsteroidBelt":{"happiness":14070,"population":9099,"demandHappiness":9099,"money_24h":156000},"SpaceAgeVenus":{"happiness":15200,"population":9835,"demandHappiness":9835,"money_24h":172000},"SpaceAgeJupiterMoon":{"happiness":16370,"population":10591,"demandHappiness":10591,"money_24h":188700},"SpaceAgeTitan":{"happiness":17560,"population":11360,"demandHappiness":11360,"money_24h":206400},"SpaceAgeSpaceHub":{"happiness":18790,"population":12150,"demandHappiness":12150,"money_24h":224800}} },
+    "R_MultiAge_SoccerBonus21g": { prod: {"BronzeAge":{"happiness":840,"population":196,"demandHappiness":196,"money_24h":1400},"IronAge":{"happiness":1440,"population":421,"demandHappiness":421,"money_24h":3200},"EarlyMiddleAge":{"happiness":1600,"population":645,"demandHappiness":645,"money_24h":5400},"HighMiddleAge":{"happiness":1780,"population":906,"demandHappiness":906,"money_24h":7600},"LateMiddleAge":{"happiness":1990,"population":1189,"demandHappiness":1189,"money_24h":10000},"ColonialAge":{"happiness":2340,"population":1501,"demandHappiness":1501,"money_24h":15200},"IndustrialAge":{"happiness":2630,"population":1834,"demandHappiness":1834,"money_24h":19000},"ProgressiveEra":{"happiness":2890,"population":2190,"demandHappiness":2190,"money_24h":23000},"ModernEra":{"happiness":3100,"population":2567,"demandHappiness":2567,"money_24h":28600},"PostModernEra":{"happiness":3230,"population":2958,"demandHappiness":2958,"money_24h":36000},"ContemporaryEra":{"happiness":3750,"population":3371,"demandHappiness":3371,"money_24h":46900},"TomorrowEra":{"happiness":4550,"population":3799,"demandHappiness":3799,"money_24h":54300},"FutureEra":{"happiness":5450,"population":4249,"demandHappiness":4249,"money_24h":62200},"ArcticFuture":{"happiness":6350,"population":4713,"demandHappiness":4713,"money_24h":70700},"OceanicFuture":{"happiness":7320,"population":5191,"demandHappiness":5191,"money_24h":79700},"VirtualFuture":{"happiness":8750,"population":5684,"demandHappiness":5684,"money_24h":89300},"SpaceAgeMars":{"happiness":14000,"population":8997,"demandHappiness":8997,"money_24h":149100},"SpaceAgeAsteroidBelt":{"happiness":15220,"population":9773,"demandHappiness":9773,"money_24h":165200},"SpaceAgeVenus":{"happiness":16440,"population":10563,"demandHappiness":10563,"money_24h":182100},"SpaceAgeJupiterMoon":{"happiness":17710,"population":11375,"demandHappiness":11375,"money_24h":199800},"SpaceAgeTitan":{"happiness":18990,"population":12202,"demandHappiness":12202,"money_24h":218500},"SpaceAgeSpaceHub":{"happiness":20310,"population":13050,"demandHappiness":13050,"money_24h":238000}} },
+    "R_MultiAge_SoccerBonus21h": { prod: {"BronzeAge":{"happiness":900,"population":213,"demandHappiness":213,"money_24h":1500},"IronAge":{"happiness":1550,"population":458,"demandHappiness":458,"money_24h":3500},"EarlyMiddleAge":{"happiness":1720,"population":703,"demandHappiness":703,"money_24h":5800},"HighMiddleAge":{"happiness":1920,"population":988,"demandHappiness":988,"money_24h":8100},"LateMiddleAge":{"happiness":2140,"population":1296,"demandHappiness":1296,"money_24h":10700},"ColonialAge":{"happiness":2510,"population":1635,"demandHappiness":1635,"money_24h":16300},"IndustrialAge":{"happiness":2830,"population":1999,"demandHappiness":1999,"money_24h":20400},"ProgressiveEra":{"happiness":3110,"population":2386,"demandHappiness":2386,"money_24h":24700},"ModernEra":{"happiness":3330,"population":2797,"demandHappiness":2797,"money_24h":30700},"PostModernEra":{"happiness":3470,"population":3223,"demandHappiness":3223,"money_24h":38700},"ContemporaryEra":{"happiness":4030,"population":3674,"demandHappiness":3674,"money_24h":50300},"TomorrowEra":{"happiness":4890,"population":4140,"demandHappiness":4140,"money_24h":58300},"FutureEra":{"happiness":5860,"population":4629,"demandHappiness":4629,"money_24h":66800},"ArcticFuture":{"happiness":6820,"population":5135,"demandHappiness":5135,"money_24h":75900},"OceanicFuture":{"happiness":7880,"population":5656,"demandHappiness":5656,"money_24h":85600},"VirtualFuture":{"happiness":9410,"population":6194,"demandHappiness":6194,"money_24h":95900},"SpaceAgeMars":{"happiness":15050,"population":9804,"demandHappiness":9804,"money_24h":160200},"SpaceAgeAsteroidBelt":{"happiness":16360,"population":10649,"demandHappiness":10649,"money_24h":177400},"SpaceAgeVenus":{"happiness":17680,"population":11510,"demandHappiness":11510,"money_24h":195600},"SpaceAgeJupiterMoon":{"happiness":19040,"population":12395,"demandHappiness":12395,"money_24h":214600},"SpaceAgeTitan":{"happiness":20420,"population":13296,"demandHappiness":13296,"money_24h":234700},"SpaceAgeSpaceHub":{"happiness":21840,"population":14220,"demandHappiness":14220,"money_24h":255600}} },
+    "R_MultiAge_SoccerBonus21i": { prod: {"BronzeAge":{"happiness":960,"population":224,"demandHappiness":224,"money_24h":1600},"IronAge":{"happiness":1650,"population":481,"demandHappiness":481,"money_24h":3700},"EarlyMiddleAge":{"happiness":1820,"population":739,"demandHappiness":739,"money_24h":6200},"HighMiddleAge":{"happiness":2030,"population":1038,"demandHappiness":1038,"money_24h":8700},"LateMiddleAge":{"happiness":2260,"population":1361,"demandHappiness":1361,"money_24h":11500},"ColonialAge":{"happiness":2660,"population":1718,"demandHappiness":1718,"money_24h":17500},"IndustrialAge":{"happiness":3000,"population":2100,"demandHappiness":2100,"money_24h":21800},"ProgressiveEra":{"happiness":3300,"population":2507,"demandHappiness":2507,"money_24h":26400},"ModernEra":{"happiness":3530,"population":2938,"demandHappiness":2938,"money_24h":32900},"PostModernEra":{"happiness":3680,"population":3386,"demandHappiness":3386,"money_24h":41300},"ContemporaryEra":{"happiness":4270,"population":3860,"demandHappiness":3860,"money_24h":53800},"TomorrowEra":{"happiness":5190,"population":4349,"demandHappiness":4349,"money_24h":62300},"FutureEra":{"happiness":6210,"population":4864,"demandHappiness":4864,"money_24h":71400},"ArcticFuture":{"happiness":7230,"population":5395,"demandHappiness":5395,"money_24h":81200},"OceanicFuture":{"happiness":8350,"population":5943,"demandHappiness":5943,"money_24h":91500},"VirtualFuture":{"happiness":9970,"population":6507,"demandHappiness":6507,"money_24h":102500},"SpaceAgeMars":{"happiness":15960,"population":10300,"demandHappiness":10300,"money_24h":171200},"SpaceAgeAsteroidBelt":{"happiness":17340,"population":11188,"demandHappiness":11188,"money_24h":189600},"SpaceAgeVenus":{"happiness":18740,"population":12093,"demandHappiness":12093,"money_24h":209100},"SpaceAgeJupiterMoon":{"happiness":20180,"population":13023,"demandHappiness":13023,"money_24h":229500},"SpaceAgeTitan":{"happiness":21640,"population":13969,"demandHappiness":13969,"money_24h":250900},"SpaceAgeSpaceHub":{"happiness":23150,"population":14940,"demandHappiness":14940,"money_24h":273300}} },
+    "R_MultiAge_SoccerBonus19eAthena": { prod: {"BronzeAge":{"happiness":250,"population":61,"demandHappiness":61,"money_24h":350},"IronAge":{"happiness":430,"population":131,"demandHappiness":131,"money_24h":750},"EarlyMiddleAge":{"happiness":480,"population":200,"demandHappiness":200,"money_24h":1200},"HighMiddleAge":{"happiness":540,"population":281,"demandHappiness":281,"money_24h":1600},"LateMiddleAge":{"happiness":600,"population":369,"demandHappiness":369,"money_24h":2000},"ColonialAge":{"happiness":700,"population":466,"demandHappiness":466,"money_24h":3000},"IndustrialAge":{"happiness":790,"population":569,"demandHappiness":569,"money_24h":3800},"ProgressiveEra":{"happiness":870,"population":680,"demandHappiness":680,"money_24h":4600},"ModernEra":{"happiness":930,"population":797,"demandHappiness":797,"money_24h":5700},"PostModernEra":{"happiness":970,"population":918,"demandHappiness":918,"money_24h":7200},"ContemporaryEra":{"happiness":1130,"population":1046,"demandHappiness":1046,"money_24h":9400},"TomorrowEra":{"happiness":1370,"population":1179,"demandHappiness":1179,"money_24h":10900},"FutureEra":{"happiness":1640,"population":1319,"demandHappiness":1319,"money_24h":12400},"ArcticFuture":{"happiness":1910,"population":1463,"demandHappiness":1463,"money_24h":14100},"OceanicFuture":{"happiness":2210,"population":1611,"demandHappiness":1611,"money_24h":15900},"VirtualFuture":{"happiness":2630,"population":1764,"demandHappiness":1764,"money_24h":17900},"SpaceAgeMars":{"happiness":4220,"population":2792,"demandHappiness":2792,"money_24h":29800},"SpaceAgeAsteroidBelt":{"happiness":4580,"population":3033,"demandHappiness":3033,"money_24h":33000},"SpaceAgeVenus":{"happiness":4950,"population":3278,"demandHappiness":3278,"money_24h":36400},"SpaceAgeJupiterMoon":{"happiness":5330,"population":3530,"demandHappiness":3530,"money_24h":40000},"SpaceAgeTitan":{"happiness":5720,"population":3787,"demandHappiness":3787,"money_24h":43700},"SpaceAgeSpaceHub":{"happiness":6120,"population":4050,"demandHappiness":4050,"money_24h":47600}} },
+    "R_MultiAge_SportBonus17": { prod: {"BronzeAge":{"population":30,"demandHappiness":30,"money_24h":500},"IronAge":{"population":70,"demandHappiness":70,"money_24h":1300},"EarlyMiddleAge":{"population":110,"demandHappiness":110,"money_24h":2200},"HighMiddleAge":{"population":150,"demandHappiness":150,"money_24h":3000},"LateMiddleAge":{"population":200,"demandHappiness":200,"money_24h":4000},"ColonialAge":{"population":250,"demandHappiness":250,"money_24h":6100},"IndustrialAge":{"population":300,"demandHappiness":300,"money_24h":7600},"ProgressiveEra":{"population":360,"demandHappiness":360,"money_24h":9200},"ModernEra":{"population":430,"demandHappiness":430,"money_24h":11500},"PostModernEra":{"population":490,"demandHappiness":490,"money_24h":14400},"ContemporaryEra":{"population":560,"demandHappiness":560,"money_24h":18800},"TomorrowEra":{"population":630,"demandHappiness":630,"money_24h":21700},"FutureEra":{"population":700,"demandHappiness":700,"money_24h":24900},"ArcticFuture":{"population":780,"demandHappiness":780,"money_24h":28300},"OceanicFuture":{"population":860,"demandHappiness":860,"money_24h":31900},"VirtualFuture":{"population":940,"demandHappiness":940,"money_24h":35700},"SpaceAgeMars":{"population":1490,"demandHappiness":1490,"money_24h":59700},"SpaceAgeAsteroidBelt":{"population":1620,"demandHappiness":1620,"money_24h":66100},"SpaceAgeVenus":{"population":1750,"demandHappiness":1750,"money_24h":72800},"SpaceAgeJupiterMoon":{"population":1880,"demandHappiness":1880,"money_24h":79900},"SpaceAgeTitan":{"population":2020,"demandHappiness":2020,"money_24h":87400},"SpaceAgeSpaceHub":{"population":2160,"demandHappiness":2160,"money_24h":95200}} },
+    "R_MultiAge_Battlegrounds3hBazaar": { prod: {"BronzeAge":{"money_24h":1100},"IronAge":{"money_24h":2500},"EarlyMiddleAge":{"money_24h":4100},"HighMiddleAge":{"money_24h":5700},"LateMiddleAge":{"money_24h":7600},"ColonialAge":{"money_24h":11500},"IndustrialAge":{"money_24h":14300},"ProgressiveEra":{"money_24h":17400},"ModernEra":{"money_24h":21600},"PostModernEra":{"money_24h":27200},"ContemporaryEra":{"money_24h":35400},"TomorrowEra":{"money_24h":41000},"FutureEra":{"money_24h":47000},"ArcticFuture":{"money_24h":53400},"OceanicFuture":{"money_24h":60200},"VirtualFuture":{"money_24h":67500},"SpaceAgeMars":{"money_24h":112700},"SpaceAgeAsteroidBelt":{"money_24h":124800},"SpaceAgeVenus":{"money_24h":137600},"SpaceAgeJupiterMoon":{"money_24h":151000},"SpaceAgeTitan":{"money_24h":165100},"SpaceAgeSpaceHub":{"money_24h":179800}} },
+    "R_MultiAge_Battlegrounds3hCitadel": { prod: {"BronzeAge":{"money_24h":1000},"IronAge":{"money_24h":2200},"EarlyMiddleAge":{"money_24h":3700},"HighMiddleAge":{"money_24h":5200},"LateMiddleAge":{"money_24h":6900},"ColonialAge":{"money_24h":10500},"IndustrialAge":{"money_24h":13100},"ProgressiveEra":{"money_24h":15900},"ModernEra":{"money_24h":19700},"PostModernEra":{"money_24h":24800},"ContemporaryEra":{"money_24h":32300},"TomorrowEra":{"money_24h":37400},"FutureEra":{"money_24h":42900},"ArcticFuture":{"money_24h":48700},"OceanicFuture":{"money_24h":54900},"VirtualFuture":{"money_24h":61500},"SpaceAgeMars":{"money_24h":102700},"SpaceAgeAsteroidBelt":{"money_24h":113800},"SpaceAgeVenus":{"money_24h":125400},"SpaceAgeJupiterMoon":{"money_24h":137700},"SpaceAgeTitan":{"money_24h":150500},"SpaceAgeSpaceHub":{"money_24h":164000}} },
+    "R_MultiAge_Battlegrounds3hRoyalty": { prod: {"BronzeAge":{"money_24h":1100},"IronAge":{"money_24h":2800},"EarlyMiddleAge":{"money_24h":4700},"HighMiddleAge":{"money_24h":6600},"LateMiddleAge":{"money_24h":8700},"ColonialAge":{"money_24h":13200},"IndustrialAge":{"money_24h":16400},"ProgressiveEra":{"money_24h":19900},"ModernEra":{"money_24h":24800},"PostModernEra":{"money_24h":31200},"ContemporaryEra":{"money_24h":40600},"TomorrowEra":{"money_24h":47000},"FutureEra":{"money_24h":53900},"ArcticFuture":{"money_24h":61300},"OceanicFuture":{"money_24h":69100},"VirtualFuture":{"money_24h":77400},"SpaceAgeMars":{"money_24h":129200},"SpaceAgeAsteroidBelt":{"money_24h":143200},"SpaceAgeVenus":{"money_24h":157800},"SpaceAgeJupiterMoon":{"money_24h":173200},"SpaceAgeTitan":{"money_24h":189400},"SpaceAgeSpaceHub":{"money_24h":206300}} },
+    "R_MultiAge_FallBonus19gApple": { prod: {"BronzeAge":{"population":200,"demandHappiness":200,"money_24h":800},"IronAge":{"population":440,"demandHappiness":440,"money_24h":2000},"EarlyMiddleAge":{"population":670,"demandHappiness":670,"money_24h":3400},"HighMiddleAge":{"population":940,"demandHappiness":940,"money_24h":4700},"LateMiddleAge":{"population":1230,"demandHappiness":1230,"money_24h":6200},"ColonialAge":{"population":1550,"demandHappiness":1550,"money_24h":9500},"IndustrialAge":{"population":1900,"demandHappiness":1900,"money_24h":11800},"ProgressiveEra":{"population":2270,"demandHappiness":2270,"money_24h":14300},"ModernEra":{"population":2660,"demandHappiness":2660,"money_24h":17800},"PostModernEra":{"population":3060,"demandHappiness":3060,"money_24h":22400},"ContemporaryEra":{"population":3490,"demandHappiness":3490,"money_24h":29200},"TomorrowEra":{"population":3930,"demandHappiness":3930,"money_24h":33800},"FutureEra":{"population":4400,"demandHappiness":4400,"money_24h":38700},"ArcticFuture":{"population":4880,"demandHappiness":4880,"money_24h":44000},"OceanicFuture":{"population":5370,"demandHappiness":5370,"money_24h":49600},"VirtualFuture":{"population":5880,"demandHappiness":5880,"money_24h":55600},"SpaceAgeMars":{"population":9310,"demandHappiness":9310,"money_24h":92800},"SpaceAgeAsteroidBelt":{"population":10110,"demandHappiness":10110,"money_24h":102800},"SpaceAgeVenus":{"population":10930,"demandHappiness":10930,"money_24h":113300},"SpaceAgeJupiterMoon":{"population":11770,"demandHappiness":11770,"money_24h":124400},"SpaceAgeTitan":{"population":12620,"demandHappiness":12620,"money_24h":136000},"SpaceAgeSpaceHub":{"population":13500,"demandHappiness":13500,"money_24h":148100}} },
+    "R_MultiAge_EasterBonus6": { prod: {"BronzeAge":{"population":1,"demandHappiness":1,"money_24h":350},"IronAge":{"population":3,"demandHappiness":3,"money_24h":600},"EarlyMiddleAge":{"population":4,"demandHappiness":4,"money_24h":1000},"HighMiddleAge":{"population":6,"demandHappiness":6,"money_24h":1400},"LateMiddleAge":{"population":8,"demandHappiness":8,"money_24h":1850},"ColonialAge":{"population":10,"demandHappiness":10,"money_24h":2820},"IndustrialAge":{"population":13,"demandHappiness":13,"money_24h":3510},"ProgressiveEra":{"population":15,"demandHappiness":15,"money_24h":4260},"ModernEra":{"population":18,"demandHappiness":18,"money_24h":5300},"PostModernEra":{"population":20,"demandHappiness":20,"money_24h":6670},"ContemporaryEra":{"population":23,"demandHappiness":23,"money_24h":8680},"TomorrowEra":{"population":26,"demandHappiness":26,"money_24h":10050},"FutureEra":{"population":29,"demandHappiness":29,"money_24h":11520},"ArcticFuture":{"population":33,"demandHappiness":33,"money_24h":13090},"OceanicFuture":{"population":36,"demandHappiness":36,"money_24h":14760},"VirtualFuture":{"population":39,"demandHappiness":39,"money_24h":16530},"SpaceAgeMars":{"population":62,"demandHappiness":62,"money_24h":27620},"SpaceAgeAsteroidBelt":{"population":67,"demandHappiness":67,"money_24h":30590},"SpaceAgeVenus":{"population":73,"demandHappiness":73,"money_24h":33720},"SpaceAgeJupiterMoon":{"population":78,"demandHappiness":78,"money_24h":37010},"SpaceAgeTitan":{"population":84,"demandHappiness":84,"money_24h":40460},"SpaceAgeSpaceHub":{"population":90,"demandHappiness":90,"money_24h":44070}} },
+    "D_MultiAge_ValentineBonus3": { prod: {"BronzeAge":{"happiness":420},"IronAge":{"happiness":650},"EarlyMiddleAge":{"happiness":720},"HighMiddleAge":{"happiness":800},"LateMiddleAge":{"happiness":900},"ColonialAge":{"happiness":1060},"IndustrialAge":{"happiness":1190},"ProgressiveEra":{"happiness":1310},"ModernEra":{"happiness":1400},"PostModernEra":{"happiness":1460},"ContemporaryEra":{"happiness":1690},"TomorrowEra":{"happiness":2050},"FutureEra":{"happiness":2460},"ArcticFuture":{"happiness":2870},"OceanicFuture":{"happiness":3310},"VirtualFuture":{"happiness":3950},"SpaceAgeMars":{"happiness":6320},"SpaceAgeAsteroidBelt":{"happiness":6870},"SpaceAgeVenus":{"happiness":7420},"SpaceAgeJupiterMoon":{"happiness":8000},"SpaceAgeTitan":{"happiness":8580},"SpaceAgeSpaceHub":{"happiness":9170}} },
+    "D_MultiAge_Expedition16a": { prod: {"BronzeAge":{"happiness":180},"IronAge":{"happiness":230},"EarlyMiddleAge":{"happiness":250},"HighMiddleAge":{"happiness":280},"LateMiddleAge":{"happiness":320},"ColonialAge":{"happiness":370},"IndustrialAge":{"happiness":400},"ProgressiveEra":{"happiness":440},"ModernEra":{"happiness":470},"PostModernEra":{"happiness":490},"ContemporaryEra":{"happiness":570},"TomorrowEra":{"happiness":691},"FutureEra":{"happiness":828},"ArcticFuture":{"happiness":965},"OceanicFuture":{"happiness":1113},"VirtualFuture":{"happiness":1330},"SpaceAgeMars":{"happiness":2128},"SpaceAgeAsteroidBelt":{"happiness":2312},"SpaceAgeVenus":{"happiness":2498},"SpaceAgeJupiterMoon":{"happiness":2691},"SpaceAgeTitan":{"happiness":2886},"SpaceAgeSpaceHub":{"happiness":3087}} },
+    "D_MultiAge_Expedition16c": { prod: {"BronzeAge":{"happiness":360},"IronAge":{"happiness":460},"EarlyMiddleAge":{"happiness":500},"HighMiddleAge":{"happiness":560},"LateMiddleAge":{"happiness":640},"ColonialAge":{"happiness":740},"IndustrialAge":{"happiness":801},"ProgressiveEra":{"happiness":880},"ModernEra":{"happiness":941},"PostModernEra":{"happiness":980},"ContemporaryEra":{"happiness":1139},"TomorrowEra":{"happiness":1383},"FutureEra":{"happiness":1657},"ArcticFuture":{"happiness":1930},"OceanicFuture":{"happiness":2227},"VirtualFuture":{"happiness":2660},"SpaceAgeMars":{"happiness":4256},"SpaceAgeAsteroidBelt":{"happiness":4626},"SpaceAgeVenus":{"happiness":4997},"SpaceAgeJupiterMoon":{"happiness":5383},"SpaceAgeTitan":{"happiness":5773},"SpaceAgeSpaceHub":{"happiness":6176}} },
+    "R_MultiAge_SoccerBonus21k": { prod: {"BronzeAge":{"happiness":1030,"population":262,"demandHappiness":262,"money_24h":1900},"IronAge":{"happiness":1770,"population":563,"demandHappiness":563,"money_24h":4400},"EarlyMiddleAge":{"happiness":1960,"population":863,"demandHappiness":863,"money_24h":7400},"HighMiddleAge":{"happiness":2180,"population":1213,"demandHappiness":1213,"money_24h":10400},"LateMiddleAge":{"happiness":2440,"population":1591,"demandHappiness":1591,"money_24h":13700},"ColonialAge":{"happiness":2860,"population":2008,"demandHappiness":2008,"money_24h":20900},"IndustrialAge":{"happiness":3230,"population":2454,"demandHappiness":2454,"money_24h":26000},"ProgressiveEra":{"happiness":3550,"population":2929,"demandHappiness":2929,"money_24h":31500},"ModernEra":{"happiness":3790,"population":3434,"demandHappiness":3434,"money_24h":39200},"PostModernEra":{"happiness":3950,"population":3958,"demandHappiness":3958,"money_24h":49300},"ContemporaryEra":{"happiness":4590,"population":4511,"demandHappiness":4511,"money_24h":64200},"TomorrowEra":{"happiness":5580,"population":5083,"demandHappiness":5083,"money_24h":74400},"FutureEra":{"happiness":6680,"population":5684,"demandHappiness":5684,"money_24h":85300},"ArcticFuture":{"happiness":7780,"population":6305,"demandHappiness":6305,"money_24h":96900},"OceanicFuture":{"happiness":8980,"population":6945,"demandHappiness":6945,"money_24h":109200},"VirtualFuture":{"happiness":10730,"population":7605,"demandHappiness":7605,"money_24h":122300},"SpaceAgeMars":{"happiness":17160,"population":12038,"demandHappiness":12038,"money_24h":204400},"SpaceAgeAsteroidBelt":{"happiness":18650,"population":13076,"demandHappiness":13076,"money_24h":226400},"SpaceAgeVenus":{"happiness":20150,"population":14133,"demandHappiness":14133,"money_24h":249500},"SpaceAgeJupiterMoon":{"happiness":21710,"population":15219,"demandHappiness":15219,"money_24h":273900},"SpaceAgeTitan":{"happiness":23280,"population":16325,"demandHappiness":16325,"money_24h":299400},"SpaceAgeSpaceHub":{"happiness":24900,"population":17460,"demandHappiness":17460,"money_24h":326100}} },
+    "D_MultiAge_SummerBonusSetA17b": { prod: {"BronzeAge":{"happiness":100},"IronAge":{"happiness":140},"EarlyMiddleAge":{"happiness":150},"HighMiddleAge":{"happiness":170},"LateMiddleAge":{"happiness":190},"ColonialAge":{"happiness":230},"IndustrialAge":{"happiness":250},"ProgressiveEra":{"happiness":280},"ModernEra":{"happiness":300},"PostModernEra":{"happiness":310},"ContemporaryEra":{"happiness":360},"TomorrowEra":{"happiness":440},"FutureEra":{"happiness":530},"ArcticFuture":{"happiness":610},"OceanicFuture":{"happiness":710},"VirtualFuture":{"happiness":850},"SpaceAgeMars":{"happiness":1350},"SpaceAgeAsteroidBelt":{"happiness":1470},"SpaceAgeVenus":{"happiness":1590},"SpaceAgeJupiterMoon":{"happiness":1710},"SpaceAgeTitan":{"happiness":1840},"SpaceAgeSpaceHub":{"happiness":1970}} },
+    "R_MultiAge_HalloweenBonusSet21c": { prod: {"BronzeAge":{"happiness":-90,"money_24h":400},"IronAge":{"happiness":-160,"money_24h":1000},"EarlyMiddleAge":{"happiness":-170,"money_24h":1700},"HighMiddleAge":{"happiness":-190,"money_24h":2400},"LateMiddleAge":{"happiness":-210,"money_24h":3200},"ColonialAge":{"happiness":-250,"money_24h":4800},"IndustrialAge":{"happiness":-280,"money_24h":6000},"ProgressiveEra":{"happiness":-310,"money_24h":7200},"ModernEra":{"happiness":-330,"money_24h":9000},"PostModernEra":{"happiness":-350,"money_24h":11300},"ContemporaryEra":{"happiness":-400,"money_24h":14800},"TomorrowEra":{"happiness":-490,"money_24h":17100},"FutureEra":{"happiness":-590,"money_24h":19600},"ArcticFuture":{"happiness":-680,"money_24h":22300},"OceanicFuture":{"happiness":-790,"money_24h":25100},"VirtualFuture":{"happiness":-940,"money_24h":28100},"SpaceAgeMars":{"happiness":-1510,"money_24h":47000},"SpaceAgeAsteroidBelt":{"happiness":-1640,"money_24h":52000},"SpaceAgeVenus":{"happiness":-1770,"money_24h":57300},"SpaceAgeJupiterMoon":{"happiness":-1900,"money_24h":62900},"SpaceAgeTitan":{"happiness":-2040,"money_24h":68800},"SpaceAgeSpaceHub":{"happiness":-2180,"money_24h":74900}} },
+    "R_MultiAge_HalloweenBonusSet21d": { prod: {"BronzeAge":{"happiness":-90,"money_24h":500},"IronAge":{"happiness":-160,"money_24h":1100},"EarlyMiddleAge":{"happiness":-170,"money_24h":1900},"HighMiddleAge":{"happiness":-190,"money_24h":2700},"LateMiddleAge":{"happiness":-210,"money_24h":3500},"ColonialAge":{"happiness":-250,"money_24h":5400},"IndustrialAge":{"happiness":-280,"money_24h":6700},"ProgressiveEra":{"happiness":-310,"money_24h":8100},"ModernEra":{"happiness":-330,"money_24h":10100},"PostModernEra":{"happiness":-350,"money_24h":12700},"ContemporaryEra":{"happiness":-400,"money_24h":16500},"TomorrowEra":{"happiness":-490,"money_24h":19100},"FutureEra":{"happiness":-590,"money_24h":21900},"ArcticFuture":{"happiness":-680,"money_24h":24900},"OceanicFuture":{"happiness":-790,"money_24h":28000},"VirtualFuture":{"happiness":-940,"money_24h":31400},"SpaceAgeMars":{"happiness":-1510,"money_24h":52500},"SpaceAgeAsteroidBelt":{"happiness":-1640,"money_24h":58100},"SpaceAgeVenus":{"happiness":-1770,"money_24h":64100},"SpaceAgeJupiterMoon":{"happiness":-1900,"money_24h":70300},"SpaceAgeTitan":{"happiness":-2040,"money_24h":76900},"SpaceAgeSpaceHub":{"happiness":-2180,"money_24h":83700}} },
+    "R_MultiAge_PatrickBonusSet20c": { prod: {"BronzeAge":{"population":67,"demandHappiness":67,"money_24h":500},"IronAge":{"population":144,"demandHappiness":144,"money_24h":1100},"EarlyMiddleAge":{"population":220,"demandHappiness":220,"money_24h":1800},"HighMiddleAge":{"population":309,"demandHappiness":309,"money_24h":2500},"LateMiddleAge":{"population":406,"demandHappiness":406,"money_24h":3300},"ColonialAge":{"population":512,"demandHappiness":512,"money_24h":5100},"IndustrialAge":{"population":626,"demandHappiness":626,"money_24h":6300},"ProgressiveEra":{"population":747,"demandHappiness":747,"money_24h":7700},"ModernEra":{"population":876,"demandHappiness":876,"money_24h":9500},"PostModernEra":{"population":1010,"demandHappiness":1010,"money_24h":12000},"ContemporaryEra":{"population":1151,"demandHappiness":1151,"money_24h":15600},"TomorrowEra":{"population":1297,"demandHappiness":1297,"money_24h":18100},"FutureEra":{"population":1450,"demandHappiness":1450,"money_24h":20700},"ArcticFuture":{"population":1609,"demandHappiness":1609,"money_24h":23600},"OceanicFuture":{"population":1772,"demandHappiness":1772,"money_24h":26600},"VirtualFuture":{"population":1940,"demandHappiness":1940,"money_24h":29800},"SpaceAgeMars":{"population":3071,"demandHappiness":3071,"money_24h":49700},"SpaceAgeAsteroidBelt":{"population":3336,"demandHappiness":3336,"money_24h":55100},"SpaceAgeVenus":{"population":3606,"demandHappiness":3606,"money_24h":60700},"SpaceAgeJupiterMoon":{"population":3883,"demandHappiness":3883,"money_24h":66600},"SpaceAgeTitan":{"population":4165,"demandHappiness":4165,"money_24h":72800},"SpaceAgeSpaceHub":{"population":4455,"demandHappiness":4455,"money_24h":79300}} },
+    "R_MultiAge_PatrickBonusSet20d": { prod: {"BronzeAge":{"population":97,"demandHappiness":97,"money_24h":600},"IronAge":{"population":196,"demandHappiness":196,"money_24h":1400},"EarlyMiddleAge":{"population":300,"demandHappiness":300,"money_24h":2300},"HighMiddleAge":{"population":422,"demandHappiness":422,"money_24h":3200},"LateMiddleAge":{"population":554,"demandHappiness":554,"money_24h":4200},"ColonialAge":{"population":699,"demandHappiness":699,"money_24h":6300},"IndustrialAge":{"population":854,"demandHappiness":854,"money_24h":7900},"ProgressiveEra":{"population":1019,"demandHappiness":1019,"money_24h":9600},"ModernEra":{"population":1195,"demandHappiness":1195,"money_24h":11900},"PostModernEra":{"population":1377,"demandHappiness":1377,"money_24h":15000},"ContemporaryEra":{"population":1569,"demandHappiness":1569,"money_24h":19500},"TomorrowEra":{"population":1769,"demandHappiness":1769,"money_24h":22600},"FutureEra":{"population":1978,"demandHappiness":1978,"money_24h":25900},"ArcticFuture":{"population":2194,"demandHappiness":2194,"money_24h":29500},"OceanicFuture":{"population":2417,"demandHappiness":2417,"money_24h":33200},"VirtualFuture":{"population":2646,"demandHappiness":2646,"money_24h":37200},"SpaceAgeMars":{"population":4188,"demandHappiness":4188,"money_24h":62100},"SpaceAgeAsteroidBelt":{"population":4550,"demandHappiness":4550,"money_24h":68800},"SpaceAgeVenus":{"population":4917,"demandHappiness":4917,"money_24h":75900},"SpaceAgeJupiterMoon":{"population":5295,"demandHappiness":5295,"money_24h":83300},"SpaceAgeTitan":{"population":5680,"demandHappiness":5680,"money_24h":91000},"SpaceAgeSpaceHub":{"population":6075,"demandHappiness":6075,"money_24h":99200}} },
+    "A_MultiAge_KhanBonus18": { prod: {"BronzeAge":{"happiness":410},"IronAge":{"happiness":590},"EarlyMiddleAge":{"happiness":660},"HighMiddleAge":{"happiness":710},"LateMiddleAge":{"happiness":770},"ColonialAge":{"happiness":880},"IndustrialAge":{"happiness":960},"ProgressiveEra":{"happiness":1050},"ModernEra":{"happiness":1120},"PostModernEra":{"happiness":1250},"ContemporaryEra":{"happiness":1360},"TomorrowEra":{"happiness":1650},"FutureEra":{"happiness":1980},"ArcticFuture":{"happiness":2300},"OceanicFuture":{"happiness":2660},"VirtualFuture":{"happiness":3180},"SpaceAgeMars":{"happiness":5080},"SpaceAgeAsteroidBelt":{"happiness":5520},"SpaceAgeVenus":{"happiness":5970},"SpaceAgeJupiterMoon":{"happiness":6430},"SpaceAgeTitan":{"happiness":6890},"SpaceAgeSpaceHub":{"happiness":7370}} },
+    "D_MultiAge_RankingFix16c": { prod: {"BronzeAge":{"happiness":90},"IronAge":{"happiness":155},"EarlyMiddleAge":{"happiness":172},"HighMiddleAge":{"happiness":192},"LateMiddleAge":{"happiness":214},"ColonialAge":{"happiness":251},"IndustrialAge":{"happiness":283},"ProgressiveEra":{"happiness":311},"ModernEra":{"happiness":333},"PostModernEra":{"happiness":347},"ContemporaryEra":{"happiness":403},"TomorrowEra":{"happiness":489},"FutureEra":{"happiness":586},"ArcticFuture":{"happiness":682},"OceanicFuture":{"happiness":788},"VirtualFuture":{"happiness":941},"SpaceAgeMars":{"happiness":1505},"SpaceAgeAsteroidBelt":{"happiness":1636},"SpaceAgeVenus":{"happiness":1768},"SpaceAgeJupiterMoon":{"happiness":1904},"SpaceAgeTitan":{"happiness":2042},"SpaceAgeSpaceHub":{"happiness":2184}} },
+    "D_MultiAge_WinterBonusSet17c": { prod: {"BronzeAge":{"happiness":50},"IronAge":{"happiness":70},"EarlyMiddleAge":{"happiness":80},"HighMiddleAge":{"happiness":90},"LateMiddleAge":{"happiness":100},"ColonialAge":{"happiness":110},"IndustrialAge":{"happiness":130},"ProgressiveEra":{"happiness":140},"ModernEra":{"happiness":150},"PostModernEra":{"happiness":160},"ContemporaryEra":{"happiness":180},"TomorrowEra":{"happiness":220},"FutureEra":{"happiness":260},"ArcticFuture":{"happiness":310},"OceanicFuture":{"happiness":350},"VirtualFuture":{"happiness":420},"SpaceAgeMars":{"happiness":680},"SpaceAgeAsteroidBelt":{"happiness":740},"SpaceAgeVenus":{"happiness":800},"SpaceAgeJupiterMoon":{"happiness":860},"SpaceAgeTitan":{"happiness":920},"SpaceAgeSpaceHub":{"happiness":980}} },
+    "R_MultiAge_SportBonus18a": { prod: {"BronzeAge":{"happiness":580,"money_24h":700},"IronAge":{"happiness":990,"money_24h":1700},"EarlyMiddleAge":{"happiness":1100,"money_24h":2900},"HighMiddleAge":{"happiness":1230,"money_24h":4000},"LateMiddleAge":{"happiness":1370,"money_24h":5300},"ColonialAge":{"happiness":1610,"money_24h":8100},"IndustrialAge":{"happiness":1810,"money_24h":10100},"ProgressiveEra":{"happiness":1990,"money_24h":12300},"ModernEra":{"happiness":2130,"money_24h":15300},"PostModernEra":{"happiness":2220,"money_24h":19200},"ContemporaryEra":{"happiness":2580,"money_24h":25000},"TomorrowEra":{"happiness":3130,"money_24h":28900},"FutureEra":{"happiness":3750,"money_24h":33200},"ArcticFuture":{"happiness":4370,"money_24h":37700},"OceanicFuture":{"happiness":5040,"money_24h":42500},"VirtualFuture":{"happiness":6020,"money_24h":47600},"SpaceAgeMars":{"happiness":9630,"money_24h":79500},"SpaceAgeAsteroidBelt":{"happiness":10470,"money_24h":88100},"SpaceAgeVenus":{"happiness":11310,"money_24h":97100},"SpaceAgeJupiterMoon":{"happiness":12190,"money_24h":106600},"SpaceAgeTitan":{"happiness":13070,"money_24h":116500},"SpaceAgeSpaceHub":{"happiness":13980,"money_24h":126900}} },
+    "R_MultiAge_SportBonus18j": { prod: {"BronzeAge":{"happiness":900,"money_24h":1300},"IronAge":{"happiness":1550,"money_24h":2900},"EarlyMiddleAge":{"happiness":1720,"money_24h":4300},"HighMiddleAge":{"happiness":1920,"money_24h":6100},"LateMiddleAge":{"happiness":2140,"money_24h":8000},"ColonialAge":{"happiness":2510,"money_24h":12200},"IndustrialAge":{"happiness":2830,"money_24h":15200},"ProgressiveEra":{"happiness":3110,"money_24h":18400},"ModernEra":{"happiness":3330,"money_24h":22900},"PostModernEra":{"happiness":3470,"money_24h":28800},"ContemporaryEra":{"happiness":4030,"money_24h":37500},"TomorrowEra":{"happiness":4890,"money_24h":43400},"FutureEra":{"happiness":5860,"money_24h":49800},"ArcticFuture":{"happiness":6820,"money_24h":56600},"OceanicFuture":{"happiness":7880,"money_24h":63800},"VirtualFuture":{"happiness":9410,"money_24h":71400},"SpaceAgeMars":{"happiness":15050,"money_24h":119300},"SpaceAgeAsteroidBelt":{"happiness":16360,"money_24h":132100},"SpaceAgeVenus":{"happiness":17680,"money_24h":145700},"SpaceAgeJupiterMoon":{"happiness":19040,"money_24h":159900},"SpaceAgeTitan":{"happiness":20420,"money_24h":174800},"SpaceAgeSpaceHub":{"happiness":21840,"money_24h":190400}} },
+    "R_MultiAge_SportBonus18b": { prod: {"BronzeAge":{"happiness":610,"money_24h":800},"IronAge":{"happiness":1060,"money_24h":1900},"EarlyMiddleAge":{"happiness":1170,"money_24h":3000},"HighMiddleAge":{"happiness":1300,"money_24h":4300},"LateMiddleAge":{"happiness":1450,"money_24h":5600},"ColonialAge":{"happiness":1710,"money_24h":8600},"IndustrialAge":{"happiness":1930,"money_24h":10700},"ProgressiveEra":{"happiness":2120,"money_24h":13000},"ModernEra":{"happiness":2260,"money_24h":16100},"PostModernEra":{"happiness":2360,"money_24h":20300},"ContemporaryEra":{"happiness":2740,"money_24h":26400},"TomorrowEra":{"happiness":3330,"money_24h":30600},"FutureEra":{"happiness":3990,"money_24h":35000},"ArcticFuture":{"happiness":4640,"money_24h":39800},"OceanicFuture":{"happiness":5360,"money_24h":44900},"VirtualFuture":{"happiness":6400,"money_24h":50300},"SpaceAgeMars":{"happiness":10240,"money_24h":84000},"SpaceAgeAsteroidBelt":{"happiness":11120,"money_24h":93000},"SpaceAgeVenus":{"happiness":12020,"money_24h":102500},"SpaceAgeJupiterMoon":{"happiness":12950,"money_24h":112500},"SpaceAgeTitan":{"happiness":13890,"money_24h":123000},"SpaceAgeSpaceHub":{"happiness":14850,"money_24h":134000}} },
+    "R_MultiAge_SportBonus18c": { prod: {"BronzeAge":{"happiness":650,"money_24h":900},"IronAge":{"happiness":1120,"money_24h":2000},"EarlyMiddleAge":{"happiness":1240,"money_24h":3200},"HighMiddleAge":{"happiness":1380,"money_24h":4500},"LateMiddleAge":{"happiness":1540,"money_24h":5900},"ColonialAge":{"happiness":1810,"money_24h":9000},"IndustrialAge":{"happiness":2040,"money_24h":11200},"ProgressiveEra":{"happiness":2240,"money_24h":13600},"ModernEra":{"happiness":2400,"money_24h":17000},"PostModernEra":{"happiness":2500,"money_24h":21300},"ContemporaryEra":{"happiness":2900,"money_24h":27800},"TomorrowEra":{"happiness":3520,"money_24h":32200},"FutureEra":{"happiness":4220,"money_24h":36900},"ArcticFuture":{"happiness":4910,"money_24h":41900},"OceanicFuture":{"happiness":5670,"money_24h":47200},"VirtualFuture":{"happiness":6770,"money_24h":52900},"SpaceAgeMars":{"happiness":10840,"money_24h":88400},"SpaceAgeAsteroidBelt":{"happiness":11780,"money_24h":97900},"SpaceAgeVenus":{"happiness":12730,"money_24h":107900},"SpaceAgeJupiterMoon":{"happiness":13710,"money_24h":118400},"SpaceAgeTitan":{"happiness":14700,"money_24h":129500},"SpaceAgeSpaceHub":{"happiness":15730,"money_24h":141000}} },
+    "R_MultiAge_SportBonus18d": { prod: {"BronzeAge":{"happiness":680,"money_24h":1000},"IronAge":{"happiness":1180,"money_24h":2200},"EarlyMiddleAge":{"happiness":1310,"money_24h":3400},"HighMiddleAge":{"happiness":1460,"money_24h":4700},"LateMiddleAge":{"happiness":1620,"money_24h":6200},"ColonialAge":{"happiness":1910,"money_24h":9500},"IndustrialAge":{"happiness":2150,"money_24h":11800},"ProgressiveEra":{"happiness":2360,"money_24h":14300},"ModernEra":{"happiness":2530,"money_24h":17800},"PostModernEra":{"happiness":2640,"money_24h":22400},"ContemporaryEra":{"happiness":3060,"money_24h":29200},"TomorrowEra":{"happiness":3720,"money_24h":33800},"FutureEra":{"happiness":4450,"money_24h":38700},"ArcticFuture":{"happiness":5190,"money_24h":44000},"OceanicFuture":{"happiness":5990,"money_24h":49600},"VirtualFuture":{"happiness":7150,"money_24h":55600},"SpaceAgeMars":{"happiness":11440,"money_24h":92800},"SpaceAgeAsteroidBelt":{"happiness":12430,"money_24h":102800},"SpaceAgeVenus":{"happiness":13430,"money_24h":113300},"SpaceAgeJupiterMoon":{"happiness":14470,"money_24h":124400},"SpaceAgeTitan":{"happiness":15520,"money_24h":136000},"SpaceAgeSpaceHub":{"happiness":16600,"money_24h":148100}} },
+    "R_MultiAge_SportBonus18e": { prod: {"BronzeAge":{"happiness":720,"money_24h":1100},"IronAge":{"happiness":1240,"money_24h":2400},"EarlyMiddleAge":{"happiness":1370,"money_24h":3500},"HighMiddleAge":{"happiness":1530,"money_24h":4900},"LateMiddleAge":{"happiness":1710,"money_24h":6500},"ColonialAge":{"happiness":2010,"money_24h":9900},"IndustrialAge":{"happiness":2270,"money_24h":12400},"ProgressiveEra":{"happiness":2490,"money_24h":15000},"ModernEra":{"happiness":2660,"money_24h":18700},"PostModernEra":{"happiness":2770,"money_24h":23500},"ContemporaryEra":{"happiness":3220,"money_24h":30600},"TomorrowEra":{"happiness":3910,"money_24h":35400},"FutureEra":{"happiness":4690,"money_24h":40600},"ArcticFuture":{"happiness":5460,"money_24h":46100},"OceanicFuture":{"happiness":6300,"money_24h":52000},"VirtualFuture":{"happiness":7530,"money_24h":58200},"SpaceAgeMars":{"happiness":12040,"money_24h":97200},"SpaceAgeAsteroidBelt":{"happiness":13090,"money_24h":107700},"SpaceAgeVenus":{"happiness":14140,"money_24h":118700},"SpaceAgeJupiterMoon":{"happiness":15230,"money_24h":130300},"SpaceAgeTitan":{"happiness":16340,"money_24h":142400},"SpaceAgeSpaceHub":{"happiness":17470,"money_24h":155100}} },
+    "R_MultiAge_SportBonus18f": { prod: {"BronzeAge":{"happiness":760,"money_24h":1100},"IronAge":{"happiness":1300,"money_24h":2500},"EarlyMiddleAge":{"happiness":1440,"money_24h":3700},"HighMiddleAge":{"happiness":1610,"money_24h":5200},"LateMiddleAge":{"happiness":1790,"money_24h":6800},"ColonialAge":{"happiness":2110,"money_24h":10400},"IndustrialAge":{"happiness":2380,"money_24h":12900},"ProgressiveEra":{"happiness":2610,"money_24h":15700},"ModernEra":{"happiness":2800,"money_24h":19500},"PostModernEra":{"happiness":2910,"money_24h":24500},"ContemporaryEra":{"happiness":3390,"money_24h":31900},"TomorrowEra":{"happiness":4110,"money_24h":37000},"FutureEra":{"happiness":4920,"money_24h":42400},"ArcticFuture":{"happiness":5730,"money_24h":48200},"OceanicFuture":{"happiness":6620,"money_24h":54300},"VirtualFuture":{"happiness":7900,"money_24h":60800},"SpaceAgeMars":{"happiness":12650,"money_24h":101600},"SpaceAgeAsteroidBelt":{"happiness":13740,"money_24h":112600},"SpaceAgeVenus":{"happiness":14850,"money_24h":124100},"SpaceAgeJupiterMoon":{"happiness":15990,"money_24h":136200},"SpaceAgeTitan":{"happiness":17150,"money_24h":148900},"SpaceAgeSpaceHub":{"happiness":18350,"money_24h":162200}} },
+    "R_MultiAge_SportBonus18g": { prod: {"BronzeAge":{"happiness":790,"money_24h":1200},"IronAge":{"happiness":1370,"money_24h":2600},"EarlyMiddleAge":{"happiness":1510,"money_24h":3800},"HighMiddleAge":{"happiness":1690,"money_24h":5400},"LateMiddleAge":{"happiness":1880,"money_24h":7100},"ColonialAge":{"happiness":2210,"money_24h":10800},"IndustrialAge":{"happiness":2490,"money_24h":13500},"ProgressiveEra":{"happiness":2740,"money_24h":16400},"ModernEra":{"happiness":2930,"money_24h":20400},"PostModernEra":{"happiness":3050,"money_24h":25600},"ContemporaryEra":{"happiness":3550,"money_24h":33300},"TomorrowEra":{"happiness":4300,"money_24h":38600},"FutureEra":{"happiness":5160,"money_24h":44200},"ArcticFuture":{"happiness":6010,"money_24h":50300},"OceanicFuture":{"happiness":6930,"money_24h":56700},"VirtualFuture":{"happiness":8280,"money_24h":63500},"SpaceAgeMars":{"happiness":13250,"money_24h":106000},"SpaceAgeAsteroidBelt":{"happiness":14400,"money_24h":117500},"SpaceAgeVenus":{"happiness":15550,"money_24h":129500},"SpaceAgeJupiterMoon":{"happiness":16760,"money_24h":142100},"SpaceAgeTitan":{"happiness":17970,"money_24h":155400},"SpaceAgeSpaceHub":{"happiness":19220,"money_24h":169200}} },
+    "R_MultiAge_SportBonus18h": { prod: {"BronzeAge":{"happiness":830,"money_24h":1200},"IronAge":{"happiness":1430,"money_24h":2700},"EarlyMiddleAge":{"happiness":1580,"money_24h":4000},"HighMiddleAge":{"happiness":1760,"money_24h":5600},"LateMiddleAge":{"happiness":1970,"money_24h":7400},"ColonialAge":{"happiness":2310,"money_24h":11300},"IndustrialAge":{"happiness":2610,"money_24h":14000},"ProgressiveEra":{"happiness":2860,"money_24h":17000},"ModernEra":{"happiness":3060,"money_24h":21200},"PostModernEra":{"happiness":3190,"money_24h":26700},"ContemporaryEra":{"happiness":3710,"money_24h":34700},"TomorrowEra":{"happiness":4500,"money_24h":40200},"FutureEra":{"happiness":5390,"money_24h":46100},"ArcticFuture":{"happiness":6280,"money_24h":52400},"OceanicFuture":{"happiness":7250,"money_24h":59000},"VirtualFuture":{"happiness":8660,"money_24h":66100},"SpaceAgeMars":{"happiness":13850,"money_24h":110500},"SpaceAgeAsteroidBelt":{"happiness":15050,"money_24h":122400},"SpaceAgeVenus":{"happiness":16260,"money_24h":134900},"SpaceAgeJupiterMoon":{"happiness":17520,"money_24h":148000},"SpaceAgeTitan":{"happiness":18790,"money_24h":161800},"SpaceAgeSpaceHub":{"happiness":20100,"money_24h":176300}} },
+    "R_MultiAge_SportBonus18i": { prod: {"BronzeAge":{"happiness":870,"money_24h":1300},"IronAge":{"happiness":1490,"money_24h":2800},"EarlyMiddleAge":{"happiness":1650,"money_24h":4200},"HighMiddleAge":{"happiness":1840,"money_24h":5800},"LateMiddleAge":{"happiness":2050,"money_24h":7700},"ColonialAge":{"happiness":2410,"money_24h":11700},"IndustrialAge":{"happiness":2720,"money_24h":14600},"ProgressiveEra":{"happiness":2990,"money_24h":17700},"ModernEra":{"happiness":3200,"money_24h":22100},"PostModernEra":{"happiness":3330,"money_24h":27700},"ContemporaryEra":{"happiness":3870,"money_24h":36100},"TomorrowEra":{"happiness":4700,"money_24h":41800},"FutureEra":{"happiness":5630,"money_24h":47900},"ArcticFuture":{"happiness":6550,"money_24h":54500},"OceanicFuture":{"happiness":7560,"money_24h":61400},"VirtualFuture":{"happiness":9030,"money_24h":68800},"SpaceAgeMars":{"happiness":14450,"money_24h":114900},"SpaceAgeAsteroidBelt":{"happiness":15710,"money_24h":127200},"SpaceAgeVenus":{"happiness":16970,"money_24h":140300},"SpaceAgeJupiterMoon":{"happiness":18280,"money_24h":154000},"SpaceAgeTitan":{"happiness":19600,"money_24h":168300},"SpaceAgeSpaceHub":{"happiness":20970,"money_24h":183300}} },
+    "D_MultiAge_FallBonus20a": { prod: {"BronzeAge":{"happiness":220},"IronAge":{"happiness":330},"EarlyMiddleAge":{"happiness":390},"HighMiddleAge":{"happiness":460},"LateMiddleAge":{"happiness":540},"ColonialAge":{"happiness":640},"IndustrialAge":{"happiness":720},"ProgressiveEra":{"happiness":790},"ModernEra":{"happiness":850},"PostModernEra":{"happiness":880},"ContemporaryEra":{"happiness":1030},"TomorrowEra":{"happiness":1250},"FutureEra":{"happiness":1580},"ArcticFuture":{"happiness":1840},"OceanicFuture":{"happiness":2240},"VirtualFuture":{"happiness":2820},"SpaceAgeMars":{"happiness":4520},"SpaceAgeAsteroidBelt":{"happiness":5150},"SpaceAgeVenus":{"happiness":5830},"SpaceAgeJupiterMoon":{"happiness":6570},"SpaceAgeTitan":{"happiness":7350},"SpaceAgeSpaceHub":{"happiness":8190}} },
+    "R_MultiAge_SummerBonusSetB17a": { prod: {"BronzeAge":{"money_24h":50},"IronAge":{"money_24h":120},"EarlyMiddleAge":{"money_24h":200},"HighMiddleAge":{"money_24h":280},"LateMiddleAge":{"money_24h":370},"ColonialAge":{"money_24h":560},"IndustrialAge":{"money_24h":700},"ProgressiveEra":{"money_24h":850},"ModernEra":{"money_24h":1060},"PostModernEra":{"money_24h":1330},"ContemporaryEra":{"money_24h":1740},"TomorrowEra":{"money_24h":2010},"FutureEra":{"money_24h":2300},"ArcticFuture":{"money_24h":2620},"OceanicFuture":{"money_24h":2950},"VirtualFuture":{"money_24h":3310},"SpaceAgeMars":{"money_24h":5520},"SpaceAgeAsteroidBelt":{"money_24h":6120},"SpaceAgeVenus":{"money_24h":6740},"SpaceAgeJupiterMoon":{"money_24h":7400},"SpaceAgeTitan":{"money_24h":8090},"SpaceAgeSpaceHub":{"money_24h":8810}} },
+    "D_MultiAge_SummerBonusSetB17b": { prod: {"BronzeAge":{"happiness":70},"IronAge":{"happiness":100},"EarlyMiddleAge":{"happiness":120},"HighMiddleAge":{"happiness":130},"LateMiddleAge":{"happiness":140},"ColonialAge":{"happiness":170},"IndustrialAge":{"happiness":190},"ProgressiveEra":{"happiness":210},"ModernEra":{"happiness":220},"PostModernEra":{"happiness":230},"ContemporaryEra":{"happiness":270},"TomorrowEra":{"happiness":330},"FutureEra":{"happiness":400},"ArcticFuture":{"happiness":460},"OceanicFuture":{"happiness":530},"VirtualFuture":{"happiness":640},"SpaceAgeMars":{"happiness":1020},"SpaceAgeAsteroidBelt":{"happiness":1100},"SpaceAgeVenus":{"happiness":1190},"SpaceAgeJupiterMoon":{"happiness":1290},"SpaceAgeTitan":{"happiness":1380},"SpaceAgeSpaceHub":{"happiness":1470}} },
+    "R_MultiAge_ArcheologyBonus21jWonder": { prod: {"BronzeAge":{"happiness":1300,"population":275,"demandHappiness":275,"money_24h":2000},"IronAge":{"happiness":2240,"population":592,"demandHappiness":592,"money_24h":4900},"EarlyMiddleAge":{"happiness":2470,"population":908,"demandHappiness":908,"money_24h":8200},"HighMiddleAge":{"happiness":2760,"population":1275,"demandHappiness":1275,"money_24h":11400},"LateMiddleAge":{"happiness":3080,"population":1673,"demandHappiness":1673,"money_24h":15100},"ColonialAge":{"happiness":3620,"population":2111,"demandHappiness":2111,"money_24h":23000},"IndustrialAge":{"happiness":4080,"population":2581,"demandHappiness":2581,"money_24h":28600},"ProgressiveEra":{"happiness":4480,"population":3080,"demandHappiness":3080,"money_24h":34800},"ModernEra":{"happiness":4790,"population":3611,"demandHappiness":3611,"money_24h":43300},"PostModernEra":{"happiness":4990,"population":4162,"demandHappiness":4162,"money_24h":54400},"ContemporaryEra":{"happiness":5800,"population":4743,"demandHappiness":4743,"money_24h":70800},"TomorrowEra":{"happiness":7040,"population":5345,"demandHappiness":5345,"money_24h":82000},"FutureEra":{"happiness":8440,"population":5977,"demandHappiness":5977,"money_24h":94000},"ArcticFuture":{"happiness":9830,"population":6630,"demandHappiness":6630,"money_24h":106800},"OceanicFuture":{"happiness":11340,"population":7303,"demandHappiness":7303,"money_24h":120400},"VirtualFuture":{"happiness":13550,"population":7997,"demandHappiness":7997,"money_24h":134900},"SpaceAgeMars":{"happiness":21680,"population":12658,"demandHappiness":12658,"money_24h":225300},"SpaceAgeAsteroidBelt":{"happiness":23560,"population":13750,"demandHappiness":13750,"money_24h":249600},"SpaceAgeVenus":{"happiness":25450,"population":14861,"demandHappiness":14861,"money_24h":275100},"SpaceAgeJupiterMoon":{"happiness":27420,"population":16004,"demandHappiness":16004,"money_24h":302000},"SpaceAgeTitan":{"happiness":29400,"population":17167,"demandHappiness":17167,"money_24h":330200},"SpaceAgeSpaceHub":{"happiness":31450,"population":18360,"demandHappiness":18360,"money_24h":359600}} },
+    "R_MultiAge_WinterBonusSet17a": { prod: {"BronzeAge":{"money_24h":200},"IronAge":{"money_24h":480},"EarlyMiddleAge":{"money_24h":800},"HighMiddleAge":{"money_24h":1120},"LateMiddleAge":{"money_24h":1480},"ColonialAge":{"money_24h":2250},"IndustrialAge":{"money_24h":2810},"ProgressiveEra":{"money_24h":3410},"ModernEra":{"money_24h":4240},"PostModernEra":{"money_24h":5330},"ContemporaryEra":{"money_24h":6940},"TomorrowEra":{"money_24h":8040},"FutureEra":{"money_24h":9220},"ArcticFuture":{"money_24h":10470},"OceanicFuture":{"money_24h":11810},"VirtualFuture":{"money_24h":13230},"SpaceAgeMars":{"money_24h":22090},"SpaceAgeAsteroidBelt":{"money_24h":24470},"SpaceAgeVenus":{"money_24h":26970},"SpaceAgeJupiterMoon":{"money_24h":29610},"SpaceAgeTitan":{"money_24h":32370},"SpaceAgeSpaceHub":{"money_24h":35260}} },
+    "D_MultiAge_ChristmasBonus1": { prod: {"BronzeAge":{"happiness":100},"IronAge":{"happiness":105},"EarlyMiddleAge":{"happiness":114},"HighMiddleAge":{"happiness":128},"LateMiddleAge":{"happiness":142},"ColonialAge":{"happiness":167},"IndustrialAge":{"happiness":205},"ProgressiveEra":{"happiness":220},"ModernEra":{"happiness":235},"PostModernEra":{"happiness":245},"ContemporaryEra":{"happiness":285},"TomorrowEra":{"happiness":346},"FutureEra":{"happiness":414},"ArcticFuture":{"happiness":482},"OceanicFuture":{"happiness":557},"VirtualFuture":{"happiness":665},"SpaceAgeMars":{"happiness":1064},"SpaceAgeAsteroidBelt":{"happiness":1156},"SpaceAgeVenus":{"happiness":1249},"SpaceAgeJupiterMoon":{"happiness":1346},"SpaceAgeTitan":{"happiness":1443},"SpaceAgeSpaceHub":{"happiness":1544}} },
+    "A_MultiAge_PatrickBonusSet20a": { prod: {"BronzeAge":{"happiness":170},"IronAge":{"happiness":260},"EarlyMiddleAge":{"happiness":310},"HighMiddleAge":{"happiness":360},"LateMiddleAge":{"happiness":420},"ColonialAge":{"happiness":490},"IndustrialAge":{"happiness":550},"ProgressiveEra":{"happiness":610},"ModernEra":{"happiness":650},"PostModernEra":{"happiness":730},"ContemporaryEra":{"happiness":850},"TomorrowEra":{"happiness":1030},"FutureEra":{"happiness":1320},"ArcticFuture":{"happiness":1590},"OceanicFuture":{"happiness":1950},"VirtualFuture":{"happiness":2540},"SpaceAgeMars":{"happiness":4060},"SpaceAgeAsteroidBelt":{"happiness":4420},"SpaceAgeVenus":{"happiness":4770},"SpaceAgeJupiterMoon":{"happiness":5140},"SpaceAgeTitan":{"happiness":5510},"SpaceAgeSpaceHub":{"happiness":5900}} },
+    "A_MultiAge_PatrickBonusSet20b": { prod: {"BronzeAge":{"happiness":200},"IronAge":{"happiness":280},"EarlyMiddleAge":{"happiness":360},"HighMiddleAge":{"happiness":430},"LateMiddleAge":{"happiness":510},"ColonialAge":{"happiness":600},"IndustrialAge":{"happiness":680},"ProgressiveEra":{"happiness":750},"ModernEra":{"happiness":800},"PostModernEra":{"happiness":940},"ContemporaryEra":{"happiness":1090},"TomorrowEra":{"happiness":1320},"FutureEra":{"happiness":1760},"ArcticFuture":{"happiness":2150},"OceanicFuture":{"happiness":2720},"VirtualFuture":{"happiness":3670},"SpaceAgeMars":{"happiness":5870},"SpaceAgeAsteroidBelt":{"happiness":6380},"SpaceAgeVenus":{"happiness":6890},"SpaceAgeJupiterMoon":{"happiness":7430},"SpaceAgeTitan":{"happiness":7960},"SpaceAgeSpaceHub":{"happiness":8520}} },
+    "R_MultiAge_SoccerBonus19eDemeter": { prod: {"BronzeAge":{"happiness":250,"population":61,"demandHappiness":61,"money_24h":600},"IronAge":{"happiness":430,"population":131,"demandHappiness":131,"money_24h":1450},"EarlyMiddleAge":{"happiness":480,"population":200,"demandHappiness":200,"money_24h":2400},"HighMiddleAge":{"happiness":540,"population":281,"demandHappiness":281,"money_24h":3350},"LateMiddleAge":{"happiness":600,"population":369,"demandHappiness":369,"money_24h":4400},"ColonialAge":{"happiness":700,"population":466,"demandHappiness":466,"money_24h":6800},"IndustrialAge":{"happiness":790,"population":569,"demandHappiness":569,"money_24h":8400},"ProgressiveEra":{"happiness":870,"population":680,"demandHappiness":680,"money_24h":10200},"ModernEra":{"happiness":930,"population":797,"demandHappiness":797,"money_24h":12700},"PostModernEra":{"happiness":970,"population":918,"demandHappiness":918,"money_24h":16000},"ContemporaryEra":{"happiness":1130,"population":1046,"demandHappiness":1046,"money_24h":20800},"TomorrowEra":{"happiness":1370,"population":1179,"demandHappiness":1179,"money_24h":24100},"FutureEra":{"happiness":1640,"population":1319,"demandHappiness":1319,"money_24h":27700},"ArcticFuture":{"happiness":1910,"population":1463,"demandHappiness":1463,"money_24h":31400},"OceanicFuture":{"happiness":2210,"population":1611,"demandHappiness":1611,"money_24h":35400},"VirtualFuture":{"happiness":2630,"population":1764,"demandHappiness":1764,"money_24h":39700},"SpaceAgeMars":{"happiness":4220,"population":2792,"demandHappiness":2792,"money_24h":66300},"SpaceAgeAsteroidBelt":{"happiness":4580,"population":3033,"demandHappiness":3033,"money_24h":73400},"SpaceAgeVenus":{"happiness":4950,"population":3278,"demandHappiness":3278,"money_24h":80900},"SpaceAgeJupiterMoon":{"happiness":5330,"population":3530,"demandHappiness":3530,"money_24h":88800},"SpaceAgeTitan":{"happiness":5720,"population":3787,"demandHappiness":3787,"money_24h":97100},"SpaceAgeSpaceHub":{"happiness":6120,"population":4050,"demandHappiness":4050,"money_24h":105800}} },
+    "D_MultiAge_AwardBonus1": { prod: {"BronzeAge":{"happiness":40},"IronAge":{"happiness":52},"EarlyMiddleAge":{"happiness":58},"HighMiddleAge":{"happiness":66},"LateMiddleAge":{"happiness":78},"ColonialAge":{"happiness":90},"IndustrialAge":{"happiness":105},"ProgressiveEra":{"happiness":115},"ModernEra":{"happiness":120},"PostModernEra":{"happiness":125},"ContemporaryEra":{"happiness":130},"TomorrowEra":{"happiness":135},"FutureEra":{"happiness":140},"ArcticFuture":{"happiness":150},"OceanicFuture":{"happiness":160},"VirtualFuture":{"happiness":170},"SpaceAgeMars":{"happiness":180},"SpaceAgeAsteroidBelt":{"happiness":190},"SpaceAgeVenus":{"happiness":200},"SpaceAgeJupiterMoon":{"happiness":210},"SpaceAgeTitan":{"happiness":220},"SpaceAgeSpaceHub":{"happiness":230}} },
+    "A_MultiAge_SportBonus18": { prod: {"BronzeAge":{"happiness":400},"IronAge":{"happiness":650},"EarlyMiddleAge":{"happiness":770},"HighMiddleAge":{"happiness":860},"LateMiddleAge":{"happiness":960},"ColonialAge":{"happiness":1130},"IndustrialAge":{"happiness":1270},"ProgressiveEra":{"happiness":1400},"ModernEra":{"happiness":1500},"PostModernEra":{"happiness":1560},"ContemporaryEra":{"happiness":1810},"TomorrowEra":{"happiness":2200},"FutureEra":{"happiness":2640},"ArcticFuture":{"happiness":3070},"OceanicFuture":{"happiness":3540},"VirtualFuture":{"happiness":4230},"SpaceAgeMars":{"happiness":6770},"SpaceAgeAsteroidBelt":{"happiness":7360},"SpaceAgeVenus":{"happiness":7950},"SpaceAgeJupiterMoon":{"happiness":8570},"SpaceAgeTitan":{"happiness":9190},"SpaceAgeSpaceHub":{"happiness":9830}} },
+    "R_MultiAge_WinterBonus18": { prod: {"BronzeAge":{"population":100,"demandHappiness":100,"money_24h":600},"IronAge":{"population":205,"demandHappiness":205,"money_24h":1370},"EarlyMiddleAge":{"population":320,"demandHappiness":320,"money_24h":2100},"HighMiddleAge":{"population":450,"demandHappiness":450,"money_24h":2940},"LateMiddleAge":{"population":600,"demandHappiness":600,"money_24h":3330},"ColonialAge":{"population":745,"demandHappiness":745,"money_24h":5070},"IndustrialAge":{"population":920,"demandHappiness":920,"money_24h":6320},"ProgressiveEra":{"population":1087,"demandHappiness":1087,"money_24h":7670},"ModernEra":{"population":1274,"demandHappiness":1274,"money_24h":9540},"PostModernEra":{"population":1469,"demandHappiness":1469,"money_24h":12000},"ContemporaryEra":{"population":1674,"demandHappiness":1674,"money_24h":15620},"TomorrowEra":{"population":1886,"demandHappiness":1886,"money_24h":18090},"FutureEra":{"population":2110,"demandHappiness":2110,"money_24h":20740},"ArcticFuture":{"population":2340,"demandHappiness":2340,"money_24h":23560},"OceanicFuture":{"population":2578,"demandHappiness":2578,"money_24h":26570},"VirtualFuture":{"population":2822,"demandHappiness":2822,"money_24h":29760},"SpaceAgeMars":{"population":4468,"demandHappiness":4468,"money_24h":49710},"SpaceAgeAsteroidBelt":{"population":4853,"demandHappiness":4853,"money_24h":55060},"SpaceAgeVenus":{"population":5245,"demandHappiness":5245,"money_24h":60690},"SpaceAgeJupiterMoon":{"population":5648,"demandHappiness":5648,"money_24h":66610},"SpaceAgeTitan":{"population":6059,"demandHappiness":6059,"money_24h":72830},"SpaceAgeSpaceHub":{"population":6480,"demandHappiness":6480,"money_24h":79330}} },
+    "A_MultiAge_SummerBonusSetB17a": { prod: {"BronzeAge":{"happiness":1120},"IronAge":{"happiness":1240},"EarlyMiddleAge":{"happiness":1510},"HighMiddleAge":{"happiness":1690},"LateMiddleAge":{"happiness":1880},"ColonialAge":{"happiness":2210},"IndustrialAge":{"happiness":2490},"ProgressiveEra":{"happiness":2740},"ModernEra":{"happiness":2930},"PostModernEra":{"happiness":3050},"ContemporaryEra":{"happiness":3550},"TomorrowEra":{"happiness":4300},"FutureEra":{"happiness":5160},"ArcticFuture":{"happiness":6010},"OceanicFuture":{"happiness":6930},"VirtualFuture":{"happiness":8280},"SpaceAgeMars":{"happiness":13250},"SpaceAgeAsteroidBelt":{"happiness":14400},"SpaceAgeVenus":{"happiness":15550},"SpaceAgeJupiterMoon":{"happiness":16760},"SpaceAgeTitan":{"happiness":17970},"SpaceAgeSpaceHub":{"happiness":19220}} },
+    "R_MultiAge_SummerBonusSetB17b": { prod: {"BronzeAge":{"money_24h":150},"IronAge":{"money_24h":360},"EarlyMiddleAge":{"money_24h":600},"HighMiddleAge":{"money_24h":840},"LateMiddleAge":{"money_24h":1110},"ColonialAge":{"money_24h":1690},"IndustrialAge":{"money_24h":2110},"ProgressiveEra":{"money_24h":2560},"ModernEra":{"money_24h":3180},"PostModernEra":{"money_24h":4000},"ContemporaryEra":{"money_24h":5210},"TomorrowEra":{"money_24h":6030},"FutureEra":{"money_24h":6910},"ArcticFuture":{"money_24h":7850},"OceanicFuture":{"money_24h":8860},"VirtualFuture":{"money_24h":9920},"SpaceAgeMars":{"money_24h":16570},"SpaceAgeAsteroidBelt":{"money_24h":18350},"SpaceAgeVenus":{"money_24h":20230},"SpaceAgeJupiterMoon":{"money_24h":22200},"SpaceAgeTitan":{"money_24h":24280},"SpaceAgeSpaceHub":{"money_24h":26440}} },
+    "D_MultiAge_SamsungBonus15": { prod: {"BronzeAge":{"happiness":85},"IronAge":{"happiness":90},"EarlyMiddleAge":{"happiness":95},"HighMiddleAge":{"happiness":100},"LateMiddleAge":{"happiness":105},"ColonialAge":{"happiness":110},"IndustrialAge":{"happiness":115},"ProgressiveEra":{"happiness":119},"ModernEra":{"happiness":122},"PostModernEra":{"happiness":127},"ContemporaryEra":{"happiness":148},"TomorrowEra":{"happiness":179},"FutureEra":{"happiness":215},"ArcticFuture":{"happiness":250},"OceanicFuture":{"happiness":289},"VirtualFuture":{"happiness":345},"SpaceAgeMars":{"happiness":552},"SpaceAgeAsteroidBelt":{"happiness":600},"SpaceAgeVenus":{"happiness":648},"SpaceAgeJupiterMoon":{"happiness":698},"SpaceAgeTitan":{"happiness":749},"SpaceAgeSpaceHub":{"happiness":801}} },
+    "D_MultiAge_RankingFix16b": { prod: {"BronzeAge":{"happiness":101},"IronAge":{"happiness":175},"EarlyMiddleAge":{"happiness":193},"HighMiddleAge":{"happiness":216},"LateMiddleAge":{"happiness":240},"ColonialAge":{"happiness":283},"IndustrialAge":{"happiness":319},"ProgressiveEra":{"happiness":350},"ModernEra":{"happiness":374},"PostModernEra":{"happiness":390},"ContemporaryEra":{"happiness":453},"TomorrowEra":{"happiness":550},"FutureEra":{"happiness":659},"ArcticFuture":{"happiness":768},"OceanicFuture":{"happiness":886},"VirtualFuture":{"happiness":1058},"SpaceAgeMars":{"happiness":1694},"SpaceAgeAsteroidBelt":{"happiness":1841},"SpaceAgeVenus":{"happiness":1988},"SpaceAgeJupiterMoon":{"happiness":2142},"SpaceAgeTitan":{"happiness":2297},"SpaceAgeSpaceHub":{"happiness":2457}} },
+    "D_MultiAge_Expedition22SpikesSilver": { prod: {"BronzeAge":{"happiness":180},"IronAge":{"happiness":310},"EarlyMiddleAge":{"happiness":340},"HighMiddleAge":{"happiness":380},"LateMiddleAge":{"happiness":430},"ColonialAge":{"happiness":500},"IndustrialAge":{"happiness":570},"ProgressiveEra":{"happiness":620},"ModernEra":{"happiness":670},"PostModernEra":{"happiness":690},"ContemporaryEra":{"happiness":810},"TomorrowEra":{"happiness":980},"FutureEra":{"happiness":1170},"ArcticFuture":{"happiness":1360},"OceanicFuture":{"happiness":1580},"VirtualFuture":{"happiness":1880},"SpaceAgeMars":{"happiness":3010},"SpaceAgeAsteroidBelt":{"happiness":3270},"SpaceAgeVenus":{"happiness":3540},"SpaceAgeJupiterMoon":{"happiness":3810},"SpaceAgeTitan":{"happiness":4080},"SpaceAgeSpaceHub":{"happiness":4370}} },
+    "D_MultiAge_Expedition22ScalesSilver": { prod: {"BronzeAge":{"happiness":180},"IronAge":{"happiness":310},"EarlyMiddleAge":{"happiness":340},"HighMiddleAge":{"happiness":380},"LateMiddleAge":{"happiness":430},"ColonialAge":{"happiness":500},"IndustrialAge":{"happiness":570},"ProgressiveEra":{"happiness":620},"ModernEra":{"happiness":670},"PostModernEra":{"happiness":690},"ContemporaryEra":{"happiness":810},"TomorrowEra":{"happiness":980},"FutureEra":{"happiness":1170},"ArcticFuture":{"happiness":1360},"OceanicFuture":{"happiness":1580},"VirtualFuture":{"happiness":1880},"SpaceAgeMars":{"happiness":3010},"SpaceAgeAsteroidBelt":{"happiness":3270},"SpaceAgeVenus":{"happiness":3540},"SpaceAgeJupiterMoon":{"happiness":3810},"SpaceAgeTitan":{"happiness":4080},"SpaceAgeSpaceHub":{"happiness":4370}} },
+    "D_MultiAge_Expedition22FeathersSilver": { prod: {"BronzeAge":{"happiness":180},"IronAge":{"happiness":310},"EarlyMiddleAge":{"happiness":340},"HighMiddleAge":{"happiness":380},"LateMiddleAge":{"happiness":430},"ColonialAge":{"happiness":500},"IndustrialAge":{"happiness":570},"ProgressiveEra":{"happiness":620},"ModernEra":{"happiness":670},"PostModernEra":{"happiness":690},"ContemporaryEra":{"happiness":810},"TomorrowEra":{"happiness":980},"FutureEra":{"happiness":1170},"ArcticFuture":{"happiness":1360},"OceanicFuture":{"happiness":1580},"VirtualFuture":{"happiness":1880},"SpaceAgeMars":{"happiness":3010},"SpaceAgeAsteroidBelt":{"happiness":3270},"SpaceAgeVenus":{"happiness":3540},"SpaceAgeJupiterMoon":{"happiness":3810},"SpaceAgeTitan":{"happiness":4080},"SpaceAgeSpaceHub":{"happiness":4370}} },
+    "R_MultiAge_Expedition22dSilver": { prod: {"BronzeAge":{"population":5,"demandHappiness":5,"money_24h":1400},"IronAge":{"population":5,"demandHappiness":5,"money_24h":2400},"EarlyMiddleAge":{"population":5,"demandHappiness":5,"money_24h":4000},"HighMiddleAge":{"population":5,"demandHappiness":5,"money_24h":5590},"LateMiddleAge":{"population":5,"demandHappiness":5,"money_24h":7390},"ColonialAge":{"population":5,"demandHappiness":5,"money_24h":11260},"IndustrialAge":{"population":5,"demandHappiness":5,"money_24h":14030},"ProgressiveEra":{"population":5,"demandHappiness":5,"money_24h":17020},"ModernEra":{"population":5,"demandHappiness":5,"money_24h":21180},"PostModernEra":{"population":5,"demandHappiness":5,"money_24h":26640},"ContemporaryEra":{"population":5,"demandHappiness":5,"money_24h":34690},"TomorrowEra":{"population":5,"demandHappiness":5,"money_24h":40160},"FutureEra":{"population":5,"demandHappiness":5,"money_24h":46030},"ArcticFuture":{"population":5,"demandHappiness":5,"money_24h":52310},"OceanicFuture":{"population":5,"demandHappiness":5,"money_24h":58980},"VirtualFuture":{"population":5,"demandHappiness":5,"money_24h":66060},"SpaceAgeMars":{"population":5,"demandHappiness":5,"money_24h":110350},"SpaceAgeAsteroidBelt":{"population":5,"demandHappiness":5,"money_24h":122230},"SpaceAgeVenus":{"population":5,"demandHappiness":5,"money_24h":134740},"SpaceAgeJupiterMoon":{"population":5,"demandHappiness":5,"money_24h":147880},"SpaceAgeTitan":{"population":5,"demandHappiness":5,"money_24h":161680},"SpaceAgeSpaceHub":{"population":5,"demandHappiness":5,"money_24h":176110}} },
+    "R_MultiAge_ChristmasBonus1": { prod: {"BronzeAge":{"population":24,"demandHappiness":24,"money_24h":680},"IronAge":{"population":52,"demandHappiness":52,"money_24h":1080},"EarlyMiddleAge":{"population":80,"demandHappiness":80,"money_24h":1580},"HighMiddleAge":{"population":113,"demandHappiness":113,"money_24h":2210},"LateMiddleAge":{"population":148,"demandHappiness":148,"money_24h":2910},"ColonialAge":{"population":186,"demandHappiness":186,"money_24h":4440},"IndustrialAge":{"population":228,"demandHappiness":228,"money_24h":5530},"ProgressiveEra":{"population":272,"demandHappiness":272,"money_24h":6710},"ModernEra":{"population":319,"demandHappiness":319,"money_24h":8350},"PostModernEra":{"population":367,"demandHappiness":367,"money_24h":10500},"ContemporaryEra":{"population":419,"demandHappiness":419,"money_24h":13510},"TomorrowEra":{"population":472,"demandHappiness":472,"money_24h":15800},"FutureEra":{"population":527,"demandHappiness":527,"money_24h":17590},"ArcticFuture":{"population":585,"demandHappiness":585,"money_24h":20030},"OceanicFuture":{"population":644,"demandHappiness":644,"money_24h":22580},"VirtualFuture":{"population":706,"demandHappiness":706,"money_24h":25290},"SpaceAgeMars":{"population":1117,"demandHappiness":1117,"money_24h":42250},"SpaceAgeAsteroidBelt":{"population":1213,"demandHappiness":1213,"money_24h":46800},"SpaceAgeVenus":{"population":1311,"demandHappiness":1311,"money_24h":51590},"SpaceAgeJupiterMoon":{"population":1412,"demandHappiness":1412,"money_24h":56620},"SpaceAgeTitan":{"population":1515,"demandHappiness":1515,"money_24h":61900},"SpaceAgeSpaceHub":{"population":1620,"demandHappiness":1620,"money_24h":67430}} },
+    "A_MultiAge_CupBonus16": { prod: {"BronzeAge":{"happiness":200},"IronAge":{"happiness":270},"EarlyMiddleAge":{"happiness":360},"HighMiddleAge":{"happiness":400},"LateMiddleAge":{"happiness":450},"ColonialAge":{"happiness":530},"IndustrialAge":{"happiness":590},"ProgressiveEra":{"happiness":660},"ModernEra":{"happiness":700},"PostModernEra":{"happiness":730},"ContemporaryEra":{"happiness":850},"TomorrowEra":{"happiness":1030},"FutureEra":{"happiness":1230},"ArcticFuture":{"happiness":1430},"OceanicFuture":{"happiness":1650},"VirtualFuture":{"happiness":1980},"SpaceAgeMars":{"happiness":3160},"SpaceAgeAsteroidBelt":{"happiness":3440},"SpaceAgeVenus":{"happiness":3710},"SpaceAgeJupiterMoon":{"happiness":4000},"SpaceAgeTitan":{"happiness":4290},"SpaceAgeSpaceHub":{"happiness":4590}} },
+    "D_MultiAge_SummerBonus3": { prod: {"BronzeAge":{"happiness":72},"IronAge":{"happiness":99},"EarlyMiddleAge":{"happiness":103},"HighMiddleAge":{"happiness":113},"LateMiddleAge":{"happiness":123},"ColonialAge":{"happiness":144},"IndustrialAge":{"happiness":163},"ProgressiveEra":{"happiness":179},"ModernEra":{"happiness":191},"PostModernEra":{"happiness":199},"ContemporaryEra":{"happiness":232},"TomorrowEra":{"happiness":281},"FutureEra":{"happiness":337},"ArcticFuture":{"happiness":392},"OceanicFuture":{"happiness":453},"VirtualFuture":{"happiness":541},"SpaceAgeMars":{"happiness":866},"SpaceAgeAsteroidBelt":{"happiness":941},"SpaceAgeVenus":{"happiness":1016},"SpaceAgeJupiterMoon":{"happiness":1095},"SpaceAgeTitan":{"happiness":1174},"SpaceAgeSpaceHub":{"happiness":1256}} },
+    "R_MultiAge_Expedition16b": { prod: {"BronzeAge":{"population":2,"demandHappiness":2,"money_24h":530},"IronAge":{"population":4,"demandHappiness":4,"money_24h":900},"EarlyMiddleAge":{"population":7,"demandHappiness":7,"money_24h":1500},"HighMiddleAge":{"population":9,"demandHappiness":9,"money_24h":2100},"LateMiddleAge":{"population":12,"demandHappiness":12,"money_24h":2780},"ColonialAge":{"population":16,"demandHappiness":16,"money_24h":4230},"IndustrialAge":{"population":19,"demandHappiness":19,"money_24h":5270},"ProgressiveEra":{"population":23,"demandHappiness":23,"money_24h":6390},"ModernEra":{"population":27,"demandHappiness":27,"money_24h":7950},"PostModernEra":{"population":31,"demandHappiness":31,"money_24h":10000},"ContemporaryEra":{"population":35,"demandHappiness":35,"money_24h":13020},"TomorrowEra":{"population":39,"demandHappiness":39,"money_24h":15080},"FutureEra":{"population":44,"demandHappiness":44,"money_24h":17280},"ArcticFuture":{"population":49,"demandHappiness":49,"money_24h":19640},"OceanicFuture":{"population":54,"demandHappiness":54,"money_24h":22140},"VirtualFuture":{"population":59,"demandHappiness":59,"money_24h":24800},"SpaceAgeMars":{"population":93,"demandHappiness":93,"money_24h":41420},"SpaceAgeAsteroidBelt":{"population":101,"demandHappiness":101,"money_24h":45880},"SpaceAgeVenus":{"population":109,"demandHappiness":109,"money_24h":50580},"SpaceAgeJupiterMoon":{"population":118,"demandHappiness":118,"money_24h":55510},"SpaceAgeTitan":{"population":126,"demandHappiness":126,"money_24h":60690},"SpaceAgeSpaceHub":{"population":135,"demandHappiness":135,"money_24h":66110}} },
+    "R_MultiAge_Expedition16d": { prod: {"BronzeAge":{"population":3,"demandHappiness":3,"money_24h":700},"IronAge":{"population":6,"demandHappiness":6,"money_24h":1200},"EarlyMiddleAge":{"population":9,"demandHappiness":9,"money_24h":2000},"HighMiddleAge":{"population":13,"demandHappiness":13,"money_24h":2800},"LateMiddleAge":{"population":17,"demandHappiness":17,"money_24h":3700},"ColonialAge":{"population":22,"demandHappiness":22,"money_24h":5630},"IndustrialAge":{"population":27,"demandHappiness":27,"money_24h":7010},"ProgressiveEra":{"population":32,"demandHappiness":32,"money_24h":8510},"ModernEra":{"population":37,"demandHappiness":37,"money_24h":10590},"PostModernEra":{"population":43,"demandHappiness":43,"money_24h":13320},"ContemporaryEra":{"population":49,"demandHappiness":49,"money_24h":17340},"TomorrowEra":{"population":55,"demandHappiness":55,"money_24h":20080},"FutureEra":{"population":62,"demandHappiness":62,"money_24h":23020},"ArcticFuture":{"population":68,"demandHappiness":68,"money_24h":26150},"OceanicFuture":{"population":75,"demandHappiness":75,"money_24h":29490},"VirtualFuture":{"population":82,"demandHappiness":82,"money_24h":33030},"SpaceAgeMars":{"population":130,"demandHappiness":130,"money_24h":55170},"SpaceAgeAsteroidBelt":{"population":142,"demandHappiness":142,"money_24h":61110},"SpaceAgeVenus":{"population":153,"demandHappiness":153,"money_24h":67370},"SpaceAgeJupiterMoon":{"population":165,"demandHappiness":165,"money_24h":73940},"SpaceAgeTitan":{"population":177,"demandHappiness":177,"money_24h":80840},"SpaceAgeSpaceHub":{"population":189,"demandHappiness":189,"money_24h":88060}} },
+    "A_MultiAge_MayDayBonus17b": { prod: {"BronzeAge":{"happiness":630},"IronAge":{"happiness":700},"EarlyMiddleAge":{"happiness":850},"HighMiddleAge":{"happiness":950},"LateMiddleAge":{"happiness":1060},"ColonialAge":{"happiness":1240},"IndustrialAge":{"happiness":1400},"ProgressiveEra":{"happiness":1540},"ModernEra":{"happiness":1650},"PostModernEra":{"happiness":1720},"ContemporaryEra":{"happiness":1990},"TomorrowEra":{"happiness":2420},"FutureEra":{"happiness":2900},"ArcticFuture":{"happiness":3380},"OceanicFuture":{"happiness":3900},"VirtualFuture":{"happiness":4660},"SpaceAgeMars":{"happiness":7450},"SpaceAgeAsteroidBelt":{"happiness":8100},"SpaceAgeVenus":{"happiness":8750},"SpaceAgeJupiterMoon":{"happiness":9420},"SpaceAgeTitan":{"happiness":10110},"SpaceAgeSpaceHub":{"happiness":10810}} },
+    "D_MultiAge_CupBonus16": { prod: {"BronzeAge":{"happiness":75},"IronAge":{"happiness":129},"EarlyMiddleAge":{"happiness":143},"HighMiddleAge":{"happiness":160},"LateMiddleAge":{"happiness":178},"ColonialAge":{"happiness":209},"IndustrialAge":{"happiness":236},"ProgressiveEra":{"happiness":259},"ModernEra":{"happiness":277},"PostModernEra":{"happiness":289},"ContemporaryEra":{"happiness":336},"TomorrowEra":{"happiness":408},"FutureEra":{"happiness":488},"ArcticFuture":{"happiness":569},"OceanicFuture":{"happiness":656},"VirtualFuture":{"happiness":784},"SpaceAgeMars":{"happiness":1255},"SpaceAgeAsteroidBelt":{"happiness":1363},"SpaceAgeVenus":{"happiness":1473},"SpaceAgeJupiterMoon":{"happiness":1587},"SpaceAgeTitan":{"happiness":1702},"SpaceAgeSpaceHub":{"happiness":1820}} },
+    "P_MultiAge_EasterBonus16": { prod: {"BronzeAge":{"happiness":70},"IronAge":{"happiness":116},"EarlyMiddleAge":{"happiness":129},"HighMiddleAge":{"happiness":144},"LateMiddleAge":{"happiness":160},"ColonialAge":{"happiness":188},"IndustrialAge":{"happiness":212},"ProgressiveEra":{"happiness":233},"ModernEra":{"happiness":250},"PostModernEra":{"happiness":260},"ContemporaryEra":{"happiness":302},"TomorrowEra":{"happiness":367},"FutureEra":{"happiness":440},"ArcticFuture":{"happiness":512},"OceanicFuture":{"happiness":591},"VirtualFuture":{"happiness":706},"SpaceAgeMars":{"happiness":1129},"SpaceAgeAsteroidBelt":{"happiness":1227},"SpaceAgeVenus":{"happiness":1326},"SpaceAgeJupiterMoon":{"happiness":1428},"SpaceAgeTitan":{"happiness":1531},"SpaceAgeSpaceHub":{"happiness":1638}} },
+    "D_MultiAge_SportBonus17": { prod: {"BronzeAge":{"happiness":45},"IronAge":{"happiness":66},"EarlyMiddleAge":{"happiness":86},"HighMiddleAge":{"happiness":105},"LateMiddleAge":{"happiness":125},"ColonialAge":{"happiness":144},"IndustrialAge":{"happiness":165},"ProgressiveEra":{"happiness":184},"ModernEra":{"happiness":202},"PostModernEra":{"happiness":223},"ContemporaryEra":{"happiness":245},"TomorrowEra":{"happiness":267},"FutureEra":{"happiness":288},"ArcticFuture":{"happiness":330},"OceanicFuture":{"happiness":381},"VirtualFuture":{"happiness":455},"SpaceAgeMars":{"happiness":728},"SpaceAgeAsteroidBelt":{"happiness":791},"SpaceAgeVenus":{"happiness":854},"SpaceAgeJupiterMoon":{"happiness":920},"SpaceAgeTitan":{"happiness":987},"SpaceAgeSpaceHub":{"happiness":1056}} },
+    "D_MultiAge_EasterBonus16": { prod: {"BronzeAge":{"happiness":72},"IronAge":{"happiness":99},"EarlyMiddleAge":{"happiness":103},"HighMiddleAge":{"happiness":113},"LateMiddleAge":{"happiness":123},"ColonialAge":{"happiness":144},"IndustrialAge":{"happiness":163},"ProgressiveEra":{"happiness":179},"ModernEra":{"happiness":191},"PostModernEra":{"happiness":199},"ContemporaryEra":{"happiness":232},"TomorrowEra":{"happiness":281},"FutureEra":{"happiness":337},"ArcticFuture":{"happiness":392},"OceanicFuture":{"happiness":453},"VirtualFuture":{"happiness":541},"SpaceAgeMars":{"happiness":866},"SpaceAgeAsteroidBelt":{"happiness":941},"SpaceAgeVenus":{"happiness":1016},"SpaceAgeJupiterMoon":{"happiness":1095},"SpaceAgeTitan":{"happiness":1174},"SpaceAgeSpaceHub":{"happiness":1256}} },
+    "A_MultiAge_ArcheologyBonus20": { prod: {"BronzeAge":{"happiness":300},"IronAge":{"happiness":420},"EarlyMiddleAge":{"happiness":540},"HighMiddleAge":{"happiness":650},"LateMiddleAge":{"happiness":770},"ColonialAge":{"happiness":900},"IndustrialAge":{"happiness":1020},"ProgressiveEra":{"happiness":1120},"ModernEra":{"happiness":1270},"PostModernEra":{"happiness":1440},"ContemporaryEra":{"happiness":1630},"TomorrowEra":{"happiness":1980},"FutureEra":{"happiness":2640},"ArcticFuture":{"happiness":3220},"OceanicFuture":{"happiness":4080},"VirtualFuture":{"happiness":5500},"SpaceAgeMars":{"happiness":8810},"SpaceAgeAsteroidBelt":{"happiness":9570},"SpaceAgeVenus":{"happiness":10340},"SpaceAgeJupiterMoon":{"happiness":11140},"SpaceAgeTitan":{"happiness":11950},"SpaceAgeSpaceHub":{"happiness":12780}} },
+    "R_MultiAge_SpringBonus17gGreen": { prod: {"BronzeAge":{"happiness":130,"population":130,"demandHappiness":130,"money_24h":880},"IronAge":{"happiness":278,"population":278,"demandHappiness":278,"money_24h":2110},"EarlyMiddleAge":{"happiness":427,"population":427,"demandHappiness":427,"money_24h":3520},"HighMiddleAge":{"happiness":600,"population":600,"demandHappiness":600,"money_24h":4930},"LateMiddleAge":{"happiness":787,"population":787,"demandHappiness":787,"money_24h":6510},"ColonialAge":{"happiness":994,"population":994,"demandHappiness":994,"money_24h":9920},"IndustrialAge":{"happiness":1214,"population":1214,"demandHappiness":1214,"money_24h":12360},"ProgressiveEra":{"happiness":1450,"population":1450,"demandHappiness":1450,"money_24h":15000},"ModernEra":{"happiness":1699,"population":1699,"demandHappiness":1699,"money_24h":18660},"PostModernEra":{"happiness":1958,"population":1958,"demandHappiness":1958,"money_24h":23470},"ContemporaryEra":{"happiness":2232,"population":2232,"demandHappiness":2232,"money_24h":30550},"TomorrowEra":{"happiness":2515,"population":2515,"demandHappiness":2515,"money_24h":35380},"FutureEra":{"happiness":2813,"population":2813,"demandHappiness":2813,"money_24h":40550},"ArcticFuture":{"happiness":3120,"population":3120,"demandHappiness":3120,"money_24h":46080},"OceanicFuture":{"happiness":3437,"population":3437,"demandHappiness":3437,"money_24h":51960},"VirtualFuture":{"happiness":3763,"population":3763,"demandHappiness":3763,"money_24h":58190},"SpaceAgeMars":{"happiness":5957,"population":5957,"demandHappiness":5957,"money_24h":97200},"SpaceAgeAsteroidBelt":{"happiness":6470,"population":6470,"demandHappiness":6470,"money_24h":107670},"SpaceAgeVenus":{"happiness":6994,"population":6994,"demandHappiness":6994,"money_24h":118690},"SpaceAgeJupiterMoon":{"happiness":7531,"population":7531,"demandHappiness":7531,"money_24h":130270},"SpaceAgeTitan":{"happiness":8078,"population":8078,"demandHappiness":8078,"money_24h":142420},"SpaceAgeSpaceHub":{"happiness":8640,"population":8640,"demandHappiness":8640,"money_24h":155140}} },
+    "D_MultiAge_SummerBonus18": { prod: {"BronzeAge":{"happiness":230},"IronAge":{"happiness":320},"EarlyMiddleAge":{"happiness":430},"HighMiddleAge":{"happiness":540},"LateMiddleAge":{"happiness":640},"ColonialAge":{"happiness":740},"IndustrialAge":{"happiness":850},"ProgressiveEra":{"happiness":950},"ModernEra":{"happiness":1050},"PostModernEra":{"happiness":1160},"ContemporaryEra":{"happiness":1270},"TomorrowEra":{"happiness":1350},"FutureEra":{"happiness":1440},"ArcticFuture":{"happiness":1640},"OceanicFuture":{"happiness":1890},"VirtualFuture":{"happiness":2260},"SpaceAgeMars":{"happiness":3610},"SpaceAgeAsteroidBelt":{"happiness":3930},"SpaceAgeVenus":{"happiness":4240},"SpaceAgeJupiterMoon":{"happiness":4570},"SpaceAgeTitan":{"happiness":4900},"SpaceAgeSpaceHub":{"happiness":5240}} },
+    "D_MultiAge_PhoenixStatue": { prod: {"BronzeAge":{"happiness":100},"IronAge":{"happiness":103},"EarlyMiddleAge":{"happiness":106},"HighMiddleAge":{"happiness":109},"LateMiddleAge":{"happiness":112},"ColonialAge":{"happiness":115},"IndustrialAge":{"happiness":118},"ProgressiveEra":{"happiness":120},"ModernEra":{"happiness":122},"PostModernEra":{"happiness":125},"ContemporaryEra":{"happiness":128},"TomorrowEra":{"happiness":131},"FutureEra":{"happiness":134},"ArcticFuture":{"happiness":140},"OceanicFuture":{"happiness":150},"VirtualFuture":{"happiness":160},"SpaceAgeMars":{"happiness":170},"SpaceAgeAsteroidBelt":{"happiness":180},"SpaceAgeVenus":{"happiness":190},"SpaceAgeJupiterMoon":{"happiness":200},"SpaceAgeTitan":{"happiness":210},"SpaceAgeSpaceHub":{"happiness":220}} },
+    "D_MultiAge_PhoenixStatue2": { prod: {"BronzeAge":{"happiness":100},"IronAge":{"happiness":103},"EarlyMiddleAge":{"happiness":106},"HighMiddleAge":{"happiness":109},"LateMiddleAge":{"happiness":112},"ColonialAge":{"happiness":115},"IndustrialAge":{"happiness":118},"ProgressiveEra":{"happiness":120},"ModernEra":{"happiness":122},"PostModernEra":{"happiness":125},"ContemporaryEra":{"happiness":128},"TomorrowEra":{"happiness":131},"FutureEra":{"happiness":134},"ArcticFuture":{"happiness":140},"OceanicFuture":{"happiness":150},"VirtualFuture":{"happiness":160},"SpaceAgeMars":{"happiness":170},"SpaceAgeAsteroidBelt":{"happiness":180},"SpaceAgeVenus":{"happiness":190},"SpaceAgeJupiterMoon":{"happiness":200},"SpaceAgeTitan":{"happiness":210},"SpaceAgeSpaceHub":{"happiness":220}} },
+    "R_MultiAge_FallBonus20a": { prod: {"BronzeAge":{"happiness":350,"population":85,"demandHappiness":85,"money_24h":500},"IronAge":{"happiness":610,"population":183,"demandHappiness":183,"money_24h":1200},"EarlyMiddleAge":{"happiness":670,"population":280,"demandHappiness":280,"money_24h":1900},"HighMiddleAge":{"happiness":750,"population":394,"demandHappiness":394,"money_24h":2700},"LateMiddleAge":{"happiness":830,"population":517,"demandHappiness":517,"money_24h":3600},"ColonialAge":{"happiness":980,"population":652,"demandHappiness":652,"money_24h":5400},"IndustrialAge":{"happiness":1100,"population":797,"demandHappiness":797,"money_24h":6700},"ProgressiveEra":{"happiness":1210,"population":951,"demandHappiness":951,"money_24h":8200},"ModernEra":{"happiness":1300,"population":1115,"demandHappiness":1115,"money_24h":10200},"PostModernEra":{"happiness":1350,"population":1285,"demandHappiness":1285,"money_24h":12800},"ContemporaryEra":{"happiness":1570,"population":1465,"demandHappiness":1465,"money_24h":16700},"TomorrowEra":{"happiness":1910,"population":1651,"demandHappiness":1651,"money_24h":19300},"FutureEra":{"happiness":2290,"population":1846,"demandHappiness":1846,"money_24h":22100},"ArcticFuture":{"happiness":2660,"population":2048,"demandHappiness":2048,"money_24h":25100},"OceanicFuture":{"happiness":3070,"population":2255,"demandHappiness":2255,"money_24h":28300},"VirtualFuture":{"happiness":3670,"population":2470,"demandHappiness":2470,"money_24h":31700},"SpaceAgeMars":{"happiness":5870,"population":3909,"demandHappiness":3909,"money_24h":53000},"SpaceAgeAsteroidBelt":{"happiness":6380,"population":4246,"demandHappiness":4246,"money_24h":58700},"SpaceAgeVenus":{"happiness":6890,"population":4590,"demandHappiness":4590,"money_24h":64700},"SpaceAgeJupiterMoon":{"happiness":7430,"population":4942,"demandHappiness":4942,"money_24h":71100},"SpaceAgeTitan":{"happiness":7960,"population":5301,"demandHappiness":5301,"money_24h":77700},"SpaceAgeSpaceHub":{"happiness":8520,"population":5670,"demandHappiness":5670,"money_24h":84600}} },
+    "R_MultiAge_FallBonus20b": { prod: {"BronzeAge":{"happiness":430,"population":89,"demandHappiness":89,"money_24h":600},"IronAge":{"happiness":750,"population":191,"demandHappiness":191,"money_24h":1300},"EarlyMiddleAge":{"happiness":820,"population":294,"demandHappiness":294,"money_24h":2200},"HighMiddleAge":{"happiness":920,"population":413,"demandHappiness":413,"money_24h":3100},"LateMiddleAge":{"happiness":1030,"population":541,"demandHappiness":541,"money_24h":4100},"ColonialAge":{"happiness":1210,"population":683,"demandHappiness":683,"money_24h":6300},"IndustrialAge":{"happiness":1360,"population":835,"demandHappiness":835,"money_24h":7800},"ProgressiveEra":{"happiness":1490,"population":997,"demandHappiness":997,"money_24h":9500},"ModernEra":{"happiness":1600,"population":1168,"demandHappiness":1168,"money_24h":11800},"PostModernEra":{"happiness":1660,"population":1346,"demandHappiness":1346,"money_24h":14800},"ContemporaryEra":{"happiness":1930,"population":1535,"demandHappiness":1535,"money_24h":19300},"TomorrowEra":{"happiness":2350,"population":1729,"demandHappiness":1729,"money_24h":22300},"FutureEra":{"happiness":2810,"population":1934,"demandHappiness":1934,"money_24h":25600},"ArcticFuture":{"happiness":3280,"population":2145,"demandHappiness":2145,"money_24h":29100},"OceanicFuture":{"happiness":3780,"population":2363,"demandHappiness":2363,"money_24h":32800},"VirtualFuture":{"happiness":4520,"population":2587,"demandHappiness":2587,"money_24h":36700},"SpaceAgeMars":{"happiness":7230,"population":4095,"demandHappiness":4095,"money_24h":61300},"SpaceAgeAsteroidBelt":{"happiness":7850,"population":4448,"demandHappiness":4448,"money_24h":67900},"SpaceAgeVenus":{"happiness":8480,"population":4808,"demandHappiness":4808,"money_24h":74900},"SpaceAgeJupiterMoon":{"happiness":9140,"population":5178,"demandHappiness":5178,"money_24h":82200},"SpaceAgeTitan":{"happiness":9800,"population":5554,"demandHappiness":5554,"money_24h":89800},"SpaceAgeSpaceHub":{"happiness":10480,"population":5940,"demandHappiness":5940,"money_24h":97800}} },
+    "R_MultiAge_FallBonus20c": { prod: {"BronzeAge":{"happiness":510,"population":97,"demandHappiness":97,"money_24h":700},"IronAge":{"happiness":890,"population":209,"demandHappiness":209,"money_24h":1600},"EarlyMiddleAge":{"happiness":980,"population":320,"demandHappiness":320,"money_24h":2600},"HighMiddleAge":{"happiness":1090,"population":450,"demandHappiness":450,"money_24h":3700},"LateMiddleAge":{"happiness":1220,"population":590,"demandHappiness":590,"money_24h":4900},"ColonialAge":{"happiness":1430,"population":745,"demandHappiness":745,"money_24h":7400},"IndustrialAge":{"happiness":1610,"population":911,"demandHappiness":911,"money_24h":9300},"ProgressiveEra":{"happiness":1770,"population":1087,"demandHappiness":1087,"money_24h":11300},"ModernEra":{"happiness":1900,"population":1274,"demandHappiness":1274,"money_24h":14000},"PostModernEra":{"happiness":1980,"population":1469,"demandHappiness":1469,"money_24h":17600},"ContemporaryEra":{"happiness":2300,"population":1674,"demandHappiness":1674,"money_24h":22900},"TomorrowEra":{"happiness":2790,"population":1886,"demandHappiness":1886,"money_24h":26500},"FutureEra":{"happiness":3340,"population":2110,"demandHappiness":2110,"money_24h":30400},"ArcticFuture":{"happiness":3890,"population":2340,"demandHappiness":2340,"money_24h":34600},"OceanicFuture":{"happiness":4490,"population":2578,"demandHappiness":2578,"money_24h":39000},"VirtualFuture":{"happiness":5360,"population":2822,"demandHappiness":2822,"money_24h":43700},"SpaceAgeMars":{"happiness":8580,"population":4468,"demandHappiness":4468,"money_24h":72900},"SpaceAgeAsteroidBelt":{"happiness":9330,"population":4853,"demandHappiness":4853,"money_24h":80800},"SpaceAgeVenus":{"happiness":10070,"population":5245,"demandHappiness":5245,"money_24h":89000},"SpaceAgeJupiterMoon":{"happiness":10850,"population":5648,"demandHappiness":5648,"money_24h":97700},"SpaceAgeTitan":{"happiness":11640,"population":6059,"demandHappiness":6059,"money_24h":106800},"SpaceAgeSpaceHub":{"happiness":12450,"population":6480,"demandHappiness":6480,"money_24h":116400}} },
+    "R_MultiAge_FallBonus20d": { prod: {"BronzeAge":{"happiness":590,"population":105,"demandHappiness":105,"money_24h":800},"IronAge":{"happiness":1020,"population":226,"demandHappiness":226,"money_24h":1800},"EarlyMiddleAge":{"happiness":1130,"population":347,"demandHappiness":347,"money_24h":3000},"HighMiddleAge":{"happiness":1260,"population":488,"demandHappiness":488,"money_24h":4200},"LateMiddleAge":{"happiness":1410,"population":640,"demandHappiness":640,"money_24h":5600},"ColonialAge":{"happiness":1660,"population":807,"demandHappiness":807,"money_24h":8500},"IndustrialAge":{"happiness":1870,"population":987,"demandHappiness":987,"money_24h":10500},"ProgressiveEra":{"happiness":2050,"population":1178,"demandHappiness":1178,"money_24h":12800},"ModernEra":{"happiness":2200,"population":1381,"demandHappiness":1381,"money_24h":15900},"PostModernEra":{"happiness":2290,"population":1591,"demandHappiness":1591,"money_24h":20000},"ContemporaryEra":{"happiness":2660,"population":1814,"demandHappiness":1814,"money_24h":26000},"TomorrowEra":{"happiness":3230,"population":2044,"demandHappiness":2044,"money_24h":30200},"FutureEra":{"happiness":3870,"population":2285,"demandHappiness":2285,"money_24h":34600},"ArcticFuture":{"happiness":4500,"population":2535,"demandHappiness":2535,"money_24h":39300},"OceanicFuture":{"happiness":5200,"population":2792,"demandHappiness":2792,"money_24h":44300},"VirtualFuture":{"happiness":6210,"population":3058,"demandHappiness":3058,"money_24h":49600},"SpaceAgeMars":{"happiness":9940,"population":4840,"demandHappiness":4840,"money_24h":82900},"SpaceAgeAsteroidBelt":{"happiness":10800,"population":5257,"demandHappiness":5257,"money_24h":91800},"SpaceAgeVenus":{"happiness":11670,"population":5682,"demandHappiness":5682,"money_24h":101200},"SpaceAgeJupiterMoon":{"happiness":12570,"population":6119,"demandHappiness":6119,"money_24h":111000},"SpaceAgeTitan":{"happiness":13480,"population":6564,"demandHappiness":6564,"money_24h":121400},"SpaceAgeSpaceHub":{"happiness":14420,"population":7020,"demandHappiness":7020,"money_24h":132200}} },
+    "D_MultiAge_WinterBonusSet17d": { prod: {"BronzeAge":{"happiness":50},"IronAge":{"happiness":70},"EarlyMiddleAge":{"happiness":80},"HighMiddleAge":{"happiness":90},"LateMiddleAge":{"happiness":100},"ColonialAge":{"happiness":110},"IndustrialAge":{"happiness":130},"ProgressiveEra":{"happiness":140},"ModernEra":{"happiness":150},"PostModernEra":{"happiness":160},"ContemporaryEra":{"happiness":180},"TomorrowEra":{"happiness":220},"FutureEra":{"happiness":260},"ArcticFuture":{"happiness":310},"OceanicFuture":{"happiness":350},"VirtualFuture":{"happiness":420},"SpaceAgeMars":{"happiness":680},"SpaceAgeAsteroidBelt":{"happiness":740},"SpaceAgeVenus":{"happiness":800},"SpaceAgeJupiterMoon":{"happiness":860},"SpaceAgeTitan":{"happiness":920},"SpaceAgeSpaceHub":{"happiness":980}} },
+    "A_MultiAge_SportBonus17": { prod: {"BronzeAge":{"happiness":510},"IronAge":{"happiness":630},"EarlyMiddleAge":{"happiness":770},"HighMiddleAge":{"happiness":860},"LateMiddleAge":{"happiness":960},"ColonialAge":{"happiness":1130},"IndustrialAge":{"happiness":1270},"ProgressiveEra":{"happiness":1400},"ModernEra":{"happiness":1500},"PostModernEra":{"happiness":1560},"ContemporaryEra":{"happiness":1810},"TomorrowEra":{"happiness":2200},"FutureEra":{"happiness":2640},"ArcticFuture":{"happiness":3070},"OceanicFuture":{"happiness":3540},"VirtualFuture":{"happiness":4230},"SpaceAgeMars":{"happiness":6770},"SpaceAgeAsteroidBelt":{"happiness":7360},"SpaceAgeVenus":{"happiness":7950},"SpaceAgeJupiterMoon":{"happiness":8570},"SpaceAgeTitan":{"happiness":9190},"SpaceAgeSpaceHub":{"happiness":9830}} },
+    "A_MultiAge_SportBonus17b": { prod: {"BronzeAge":{"happiness":510},"IronAge":{"happiness":630},"EarlyMiddleAge":{"happiness":770},"HighMiddleAge":{"happiness":860},"LateMiddleAge":{"happiness":960},"ColonialAge":{"happiness":1130},"IndustrialAge":{"happiness":1270},"ProgressiveEra":{"happiness":1400},"ModernEra":{"happiness":1500},"PostModernEra":{"happiness":1560},"ContemporaryEra":{"happiness":1810},"TomorrowEra":{"happiness":2200},"FutureEra":{"happiness":2640},"ArcticFuture":{"happiness":3070},"OceanicFuture":{"happiness":3540},"VirtualFuture":{"happiness":4230},"SpaceAgeMars":{"happiness":6770},"SpaceAgeAsteroidBelt":{"happiness":7360},"SpaceAgeVenus":{"happiness":7950},"SpaceAgeJupiterMoon":{"happiness":8570},"SpaceAgeTitan":{"happiness":9190},"SpaceAgeSpaceHub":{"happiness":9830}} },
+    "D_MultiAge_WinterBonusSet17a": { prod: {"BronzeAge":{"happiness":50},"IronAge":{"happiness":70},"EarlyMiddleAge":{"happiness":80},"HighMiddleAge":{"happiness":90},"LateMiddleAge":{"happiness":100},"ColonialAge":{"happiness":110},"IndustrialAge":{"happiness":130},"ProgressiveEra":{"happiness":140},"ModernEra":{"happiness":150},"PostModernEra":{"happiness":160},"ContemporaryEra":{"happiness":180},"TomorrowEra":{"happiness":220},"FutureEra":{"happiness":260},"ArcticFuture":{"happiness":310},"OceanicFuture":{"happiness":350},"VirtualFuture":{"happiness":420},"SpaceAgeMars":{"happiness":680},"SpaceAgeAsteroidBelt":{"happiness":740},"SpaceAgeVenus":{"happiness":800},"SpaceAgeJupiterMoon":{"happiness":860},"SpaceAgeTitan":{"happiness":920},"SpaceAgeSpaceHub":{"happiness":980}} },
+    "R_MultiAge_SummerBonus16b": { prod: {"BronzeAge":{"population":32,"demandHappiness":32,"money_24h":320},"IronAge":{"population":70,"demandHappiness":70,"money_24h":770},"EarlyMiddleAge":{"population":107,"demandHappiness":107,"money_24h":1240},"HighMiddleAge":{"population":150,"demandHappiness":150,"money_24h":1740},"LateMiddleAge":{"population":197,"demandHappiness":197,"money_24h":2290},"ColonialAge":{"population":248,"demandHappiness":248,"money_24h":3490},"IndustrialAge":{"population":304,"demandHappiness":304,"money_24h":4070},"ProgressiveEra":{"population":362,"demandHappiness":362,"money_24h":4940},"ModernEra":{"population":425,"demandHappiness":425,"money_24h":6020},"PostModernEra":{"population":490,"demandHappiness":490,"money_24h":7570},"ContemporaryEra":{"population":558,"demandHappiness":558,"money_24h":9860},"TomorrowEra":{"population":629,"demandHappiness":629,"money_24h":11420},"FutureEra":{"population":703,"demandHappiness":703,"money_24h":13820},"ArcticFuture":{"population":780,"demandHappiness":780,"money_24h":15710},"OceanicFuture":{"population":859,"demandHappiness":859,"money_24h":17710},"VirtualFuture":{"population":941,"demandHappiness":941,"money_24h":19840},"SpaceAgeMars":{"population":1489,"demandHappiness":1489,"money_24h":33140},"SpaceAgeAsteroidBelt":{"population":1618,"demandHappiness":1618,"money_24h":36710},"SpaceAgeVenus":{"population":1748,"demandHappiness":1748,"money_24h":40460},"SpaceAgeJupiterMoon":{"population":1883,"demandHappiness":1883,"money_24h":44410},"SpaceAgeTitan":{"population":2020,"demandHappiness":2020,"money_24h":48550},"SpaceAgeSpaceHub":{"population":2160,"demandHappiness":2160,"money_24h":52890}} },
+    "R_MultiAge_SpringBonus20a": { prod: {"BronzeAge":{"happiness":580,"population":162,"demandHappiness":162,"money_24h":1000},"IronAge":{"happiness":1010,"population":348,"demandHappiness":348,"money_24h":2500},"EarlyMiddleAge":{"happiness":1110,"population":534,"demandHappiness":534,"money_24h":4100},"HighMiddleAge":{"happiness":1240,"population":750,"demandHappiness":750,"money_24h":5700},"LateMiddleAge":{"happiness":1380,"population":984,"demandHappiness":984,"money_24h":7600},"ColonialAge":{"happiness":1630,"population":1242,"demandHappiness":1242,"money_24h":11500},"IndustrialAge":{"happiness":1840,"population":1518,"demandHappiness":1518,"money_24h":14300},"ProgressiveEra":{"happiness":2020,"population":1812,"demandHappiness":1812,"money_24h":17400},"ModernEra":{"happiness":2160,"population":2124,"demandHappiness":2124,"money_24h":21600},"PostModernEra":{"happiness":2250,"population":2448,"demandHappiness":2448,"money_24h":27200},"ContemporaryEra":{"happiness":2610,"population":2790,"demandHappiness":2790,"money_24h":35400},"TomorrowEra":{"happiness":3170,"population":3144,"demandHappiness":3144,"money_24h":41000},"FutureEra":{"happiness":3800,"population":3516,"demandHappiness":3516,"money_24h":47000},"ArcticFuture":{"happiness":4420,"population":3900,"demandHappiness":3900,"money_24h":53400},"OceanicFuture":{"happiness":5100,"population":4296,"demandHappiness":4296,"money_24h":60200},"VirtualFuture":{"happiness":6100,"population":4704,"demandHappiness":4704,"money_24h":67500},"SpaceAgeMars":{"happiness":9760,"population":7446,"demandHappiness":7446,"money_24h":112700},"SpaceAgeAsteroidBelt":{"happiness":10600,"population":8088,"demandHappiness":8088,"money_24h":124800},"SpaceAgeVenus":{"happiness":11450,"population":8742,"demandHappiness":8742,"money_24h":137600},"SpaceAgeJupiterMoon":{"happiness":12340,"population":9414,"demandHappiness":9414,"money_24h":151000},"SpaceAgeTitan":{"happiness":13230,"population":10098,"demandHappiness":10098,"money_24h":165100},"SpaceAgeSpaceHub":{"happiness":14150,"population":10800,"demandHappiness":10800,"money_24h":179800}} },
+    "R_MultiAge_SpringBonus20b": { prod: {"BronzeAge":{"happiness":700,"population":235,"demandHappiness":235,"money_24h":1100},"IronAge":{"happiness":1210,"population":505,"demandHappiness":505,"money_24h":2700},"EarlyMiddleAge":{"happiness":1340,"population":774,"demandHappiness":774,"money_24h":4600},"HighMiddleAge":{"happiness":1490,"population":1088,"demandHappiness":1088,"money_24h":6400},"LateMiddleAge":{"happiness":1670,"population":1427,"demandHappiness":1427,"money_24h":8400},"ColonialAge":{"happiness":1960,"population":1801,"demandHappiness":1801,"money_24h":12900},"IndustrialAge":{"happiness":2210,"population":2201,"demandHappiness":2201,"money_24h":16000},"ProgressiveEra":{"happiness":2430,"population":2627,"demandHappiness":2627,"money_24h":19400},"ModernEra":{"happiness":2600,"population":3080,"demandHappiness":3080,"money_24h":24200},"PostModernEra":{"happiness":2700,"population":3550,"demandHappiness":3550,"money_24h":30400},"ContemporaryEra":{"happiness":3140,"population":4046,"demandHappiness":4046,"money_24h":39600},"TomorrowEra":{"happiness":3820,"population":4559,"demandHappiness":4559,"money_24h":45800},"FutureEra":{"happiness":4570,"population":5098,"demandHappiness":5098,"money_24h":52500},"ArcticFuture":{"happiness":5320,"population":5655,"demandHappiness":5655,"money_24h":59700},"OceanicFuture":{"happiness":6140,"population":6229,"demandHappiness":6229,"money_24h":67300},"VirtualFuture":{"happiness":7340,"population":6821,"demandHappiness":6821,"money_24h":75400},"SpaceAgeMars":{"happiness":11740,"population":10797,"demandHappiness":10797,"money_24h":125900},"SpaceAgeAsteroidBelt":{"happiness":12760,"population":11728,"demandHappiness":11728,"money_24h":139500},"SpaceAgeVenus":{"happiness":13790,"population":12676,"demandHappiness":12676,"money_24h":153800},"SpaceAgeJupiterMoon":{"happiness":14850,"population":13650,"demandHappiness":13650,"money_24h":168800},"SpaceAgeTitan":{"happiness":15930,"population":14642,"demandHappiness":14642,"money_24h":184500},"SpaceAgeSpaceHub":{"happiness":17040,"population":15660,"demandHappiness":15660,"money_24h":201000}} },
+    "R_MultiAge_SpringBonus20c": { prod: {"BronzeAge":{"happiness":810,"population":248,"demandHappiness":248,"money_24h":1300},"IronAge":{"happiness":1400,"population":532,"demandHappiness":532,"money_24h":3100},"EarlyMiddleAge":{"happiness":1550,"population":817,"demandHappiness":817,"money_24h":5200},"HighMiddleAge":{"happiness":1720,"population":1148,"demandHappiness":1148,"money_24h":7200},"LateMiddleAge":{"happiness":1920,"population":1506,"demandHappiness":1506,"money_24h":9600},"ColonialAge":{"happiness":2260,"population":1900,"demandHappiness":1900,"money_24h":14500},"IndustrialAge":{"happiness":2550,"population":2323,"demandHappiness":2323,"money_24h":18100},"ProgressiveEra":{"happiness":2800,"population":2772,"demandHappiness":2772,"money_24h":22000},"ModernEra":{"happiness":3000,"population":3250,"demandHappiness":3250,"money_24h":27400},"PostModernEra":{"happiness":3120,"population":3745,"demandHappiness":3745,"money_24h":34400},"ContemporaryEra":{"happiness":3630,"population":4269,"demandHappiness":4269,"money_24h":44800},"TomorrowEra":{"happiness":4400,"population":4810,"demandHappiness":4810,"money_24h":51900},"FutureEra":{"happiness":5270,"population":5379,"demandHappiness":5379,"money_24h":59400},"ArcticFuture":{"happiness":6140,"population":5967,"demandHappiness":5967,"money_24h":67500},"OceanicFuture":{"happiness":7090,"population":6573,"demandHappiness":6573,"money_24h":76200},"VirtualFuture":{"happiness":8470,"population":7197,"demandHappiness":7197,"money_24h":85300},"SpaceAgeMars":{"happiness":13550,"population":11392,"demandHappiness":11392,"money_24h":142500},"SpaceAgeAsteroidBelt":{"happiness":14720,"population":12375,"demandHappiness":12375,"money_24h":157800},"SpaceAgeVenus":{"happiness":15910,"population":13375,"demandHappiness":13375,"money_24h":174000},"SpaceAgeJupiterMoon":{"happiness":17140,"population":14403,"demandHappiness":14403,"money_24h":191000},"SpaceAgeTitan":{"happiness":18380,"population":15450,"demandHappiness":15450,"money_24h":208800},"SpaceAgeSpaceHub":{"happiness":19660,"population":16524,"demandHappiness":16524,"money_24h":227400}} },
+    "R_MultiAge_SpringBonus20d": { prod: {"BronzeAge":{"happiness":910,"population":260,"demandHappiness":260,"money_24h":1400},"IronAge":{"happiness":1570,"population":559,"demandHappiness":559,"money_24h":3400},"EarlyMiddleAge":{"happiness":1730,"population":857,"demandHappiness":857,"money_24h":5700},"HighMiddleAge":{"happiness":1930,"population":1204,"demandHappiness":1204,"money_24h":8000},"LateMiddleAge":{"happiness":2150,"population":1579,"demandHappiness":1579,"money_24h":10600},"ColonialAge":{"happiness":2530,"population":1993,"demandHappiness":1993,"money_24h":16100},"IndustrialAge":{"happiness":2860,"population":2436,"demandHappiness":2436,"money_24h":20000},"ProgressiveEra":{"happiness":3140,"population":2908,"demandHappiness":2908,"money_24h":24300},"ModernEra":{"happiness":3360,"population":3409,"demandHappiness":3409,"money_24h":30200},"PostModernEra":{"happiness":3500,"population":3929,"demandHappiness":3929,"money_24h":38000},"ContemporaryEra":{"happiness":4060,"population":4478,"demandHappiness":4478,"money_24h":49500},"TomorrowEra":{"happiness":4930,"population":5046,"demandHappiness":5046,"money_24h":57300},"FutureEra":{"happiness":5910,"population":5643,"demandHappiness":5643,"money_24h":65700},"ArcticFuture":{"happiness":6880,"population":6260,"demandHappiness":6260,"money_24h":74600},"OceanicFuture":{"happiness":7940,"population":6895,"demandHappiness":6895,"money_24h":84100},"VirtualFuture":{"happiness":9480,"population":7550,"demandHappiness":7550,"money_24h":94200},"SpaceAgeMars":{"happiness":15180,"population":11951,"demandHappiness":11951,"money_24h":157400},"SpaceAgeAsteroidBelt":{"happiness":16490,"population":12981,"demandHappiness":12981,"money_24h":174400},"SpaceAgeVenus":{"happiness":17820,"population":14031,"demandHappiness":14031,"money_24h":192200},"SpaceAgeJupiterMoon":{"happiness":19190,"population":15109,"demandHappiness":15109,"money_24h":210900},"SpaceAgeTitan":{"happiness":20580,"population":16207,"demandHappiness":16207,"money_24h":230600},"SpaceAgeSpaceHub":{"happiness":22020,"population":17334,"demandHappiness":17334,"money_24h":251200}} },
+    "R_MultiAge_SpringBonus20e": { prod: {"BronzeAge":{"happiness":1000,"population":274,"demandHappiness":274,"money_24h":1600},"IronAge":{"happiness":1720,"population":588,"demandHappiness":588,"money_24h":3700},"EarlyMiddleAge":{"happiness":1910,"population":902,"demandHappiness":902,"money_24h":6200},"HighMiddleAge":{"happiness":2130,"population":1268,"demandHappiness":1268,"money_24h":8700},"LateMiddleAge":{"happiness":2370,"population":1663,"demandHappiness":1663,"money_24h":11500},"ColonialAge":{"happiness":2790,"population":2099,"demandHappiness":2099,"money_24h":17600},"IndustrialAge":{"happiness":3140,"population":2565,"demandHappiness":2565,"money_24h":21900},"ProgressiveEra":{"happiness":3450,"population":3062,"demandHappiness":3062,"money_24h":26600},"ModernEra":{"happiness":3690,"population":3590,"demandHappiness":3590,"money_24h":33100},"PostModernEra":{"happiness":3850,"population":4137,"demandHappiness":4137,"money_24h":41600},"ContemporaryEra":{"happiness":4470,"population":4715,"demandHappiness":4715,"money_24h":54200},"TomorrowEra":{"happiness":5430,"population":5313,"demandHappiness":5313,"money_24h":62700},"FutureEra":{"happiness":6510,"population":5942,"demandHappiness":5942,"money_24h":71900},"ArcticFuture":{"happiness":7580,"population":6591,"demandHappiness":6591,"money_24h":81700},"OceanicFuture":{"happiness":8740,"population":7260,"demandHappiness":7260,"money_24h":92100},"VirtualFuture":{"happiness":10440,"population":7950,"demandHappiness":7950,"money_24h":103200},"SpaceAgeMars":{"happiness":16710,"population":12584,"demandHappiness":12584,"money_24h":172300},"SpaceAgeAsteroidBelt":{"happiness":18160,"population":13669,"demandHappiness":13669,"money_24h":190900},"SpaceAgeVenus":{"happiness":19620,"population":14774,"demandHappiness":14774,"money_24h":210400},"SpaceAgeJupiterMoon":{"happiness":21130,"population":15910,"demandHappiness":15910,"money_24h":230900},"SpaceAgeTitan":{"happiness":22670,"population":17066,"demandHappiness":17066,"money_24h":252500},"SpaceAgeSpaceHub":{"happiness":24250,"population":18252,"demandHappiness":18252,"money_24h":275000}} },
+    "R_MultiAge_SpringBonus20f": { prod: {"BronzeAge":{"happiness":1100,"population":284,"demandHappiness":284,"money_24h":1700},"IronAge":{"happiness":1900,"population":609,"demandHappiness":609,"money_24h":4100},"EarlyMiddleAge":{"happiness":2100,"population":935,"demandHappiness":935,"money_24h":6800},"HighMiddleAge":{"happiness":2340,"population":1313,"demandHappiness":1313,"money_24h":9600},"LateMiddleAge":{"happiness":2620,"population":1722,"demandHappiness":1722,"money_24h":12700},"ColonialAge":{"happiness":3070,"population":2174,"demandHappiness":2174,"money_24h":19300},"IndustrialAge":{"happiness":3470,"population":2657,"demandHappiness":2657,"money_24h":24000},"ProgressiveEra":{"happiness":3810,"population":3171,"demandHappiness":3171,"money_24h":29100},"ModernEra":{"happiness":4070,"population":3717,"demandHappiness":3717,"money_24h":36300},"PostModernEra":{"happiness":4240,"population":4284,"demandHappiness":4284,"money_24h":45600},"ContemporaryEra":{"happiness":4930,"population":4883,"demandHappiness":4883,"money_24h":59400},"TomorrowEra":{"happiness":5990,"population":5502,"demandHappiness":5502,"money_24h":68700},"FutureEra":{"happiness":7170,"population":6153,"demandHappiness":6153,"money_24h":78800},"ArcticFuture":{"happiness":8350,"population":6825,"demandHappiness":6825,"money_24h":89500},"OceanicFuture":{"happiness":9640,"population":7518,"demandHappiness":7518,"money_24h":101000},"VirtualFuture":{"happiness":11520,"population":8232,"demandHappiness":8232,"money_24h":113100},"SpaceAgeMars":{"happiness":18430,"population":13031,"demandHappiness":13031,"money_24h":188900},"SpaceAgeAsteroidBelt":{"happiness":20020,"population":14154,"demandHappiness":14154,"money_24h":209200},"SpaceAgeVenus":{"happiness":21630,"population":15299,"demandHappiness":15299,"money_24h":230600},"SpaceAgeJupiterMoon":{"happiness":23310,"population":16475,"demandHappiness":16475,"money_24h":253100},"SpaceAgeTitan":{"happiness":24990,"population":17672,"demandHappiness":17672,"money_24h":276800},"SpaceAgeSpaceHub":{"happiness":26740,"population":18900,"demandHappiness":18900,"money_24h":301500}} },
+    "R_MultiAge_SpringBonus20g": { prod: {"BronzeAge":{"happiness":1190,"population":298,"demandHappiness":298,"money_24h":1800},"IronAge":{"happiness":2050,"population":640,"demandHappiness":640,"money_24h":4300},"EarlyMiddleAge":{"happiness":2270,"population":983,"demandHappiness":983,"money_24h":7200},"HighMiddleAge":{"happiness":2530,"population":1380,"demandHappiness":1380,"money_24h":10100},"LateMiddleAge":{"happiness":2820,"population":1811,"demandHappiness":1811,"money_24h":13300},"ColonialAge":{"happiness":3320,"population":2285,"demandHappiness":2285,"money_24h":20300},"IndustrialAge":{"happiness":3740,"population":2793,"demandHappiness":2793,"money_24h":25300},"ProgressiveEra":{"happiness":4110,"population":3334,"demandHappiness":3334,"money_24h":30700},"ModernEra":{"happiness":4390,"population":3908,"demandHappiness":3908,"money_24h":38200},"PostModernEra":{"happiness":4580,"population":4504,"demandHappiness":4504,"money_24h":48000},"ContemporaryEra":{"happiness":5320,"population":5134,"demandHappiness":5134,"money_24h":62500},"TomorrowEra":{"happiness":6460,"population":5785,"demandHappiness":5785,"money_24h":72400},"FutureEra":{"happiness":7740,"population":6469,"demandHappiness":6469,"money_24h":82900},"ArcticFuture":{"happiness":9010,"population":7176,"demandHappiness":7176,"money_24h":94300},"OceanicFuture":{"happiness":10400,"population":7905,"demandHappiness":7905,"money_24h":106300},"VirtualFuture":{"happiness":12420,"population":8655,"demandHappiness":8655,"money_24h":119000},"SpaceAgeMars":{"happiness":19870,"population":13701,"demandHappiness":13701,"money_24h":198800},"SpaceAgeAsteroidBelt":{"happiness":21600,"population":14882,"demandHappiness":14882,"money_24h":220200},"SpaceAgeVenus":{"happiness":23330,"population":16085,"demandHappiness":16085,"money_24h":242800},"SpaceAgeJupiterMoon":{"happiness":25130,"population":17322,"demandHappiness":17322,"money_24h":266500},"SpaceAgeTitan":{"happiness":26950,"population":18580,"demandHappiness":18580,"money_24h":291300},"SpaceAgeSpaceHub":{"happiness":28830,"population":19872,"demandHappiness":19872,"money_24h":317300}} },
+    "R_MultiAge_BirthdayBonus22c": { prod: {"BronzeAge":{"population":70,"demandHappiness":70,"money_24h":500},"IronAge":{"population":150,"demandHappiness":150,"money_24h":1100},"EarlyMiddleAge":{"population":230,"demandHappiness":230,"money_24h":1800},"HighMiddleAge":{"population":323,"demandHappiness":323,"money_24h":2500},"LateMiddleAge":{"population":424,"demandHappiness":424,"money_24h":3300},"ColonialAge":{"population":536,"demandHappiness":536,"money_24h":5100},"IndustrialAge":{"population":655,"demandHappiness":655,"money_24h":6300},"ProgressiveEra":{"population":781,"demandHappiness":781,"money_24h":7700},"ModernEra":{"population":916,"demandHappiness":916,"money_24h":9500},"PostModernEra":{"population":1056,"demandHappiness":1056,"money_24h":12000},"ContemporaryEra":{"population":1203,"demandHappiness":1203,"money_24h":15600},"TomorrowEra":{"population":1356,"demandHappiness":1356,"money_24h":18100},"FutureEra":{"population":1516,"demandHappiness":1516,"money_24h":20700},"ArcticFuture":{"population":1682,"demandHappiness":1682,"money_24h":23600},"OceanicFuture":{"population":1853,"demandHappiness":1853,"money_24h":26600},"VirtualFuture":{"population":2029,"demandHappiness":2029,"money_24h":29800},"SpaceAgeMars":{"population":3211,"demandHappiness":3211,"money_24h":49700},"SpaceAgeAsteroidBelt":{"population":3488,"demandHappiness":3488,"money_24h":55100},"SpaceAgeVenus":{"population":3770,"demandHappiness":3770,"money_24h":60700},"SpaceAgeJupiterMoon":{"population":4060,"demandHappiness":4060,"money_24h":66600},"SpaceAgeTitan":{"population":4355,"demandHappiness":4355,"money_24h":72800},"SpaceAgeSpaceHub":{"population":4658,"demandHappiness":4658,"money_24h":79300}} },
+    "R_MultiAge_BirthdayBonus22d": { prod: {"BronzeAge":{"population":97,"demandHappiness":97,"money_24h":600},"IronAge":{"population":209,"demandHappiness":209,"money_24h":1400},"EarlyMiddleAge":{"population":320,"demandHappiness":320,"money_24h":2300},"HighMiddleAge":{"population":450,"demandHappiness":450,"money_24h":3200},"LateMiddleAge":{"population":590,"demandHappiness":590,"money_24h":4200},"ColonialAge":{"population":745,"demandHappiness":745,"money_24h":6300},"IndustrialAge":{"population":911,"demandHappiness":911,"money_24h":7900},"ProgressiveEra":{"population":1087,"demandHappiness":1087,"money_24h":9600},"ModernEra":{"population":1274,"demandHappiness":1274,"money_24h":11900},"PostModernEra":{"population":1469,"demandHappiness":1469,"money_24h":15000},"ContemporaryEra":{"population":1674,"demandHappiness":1674,"money_24h":19500},"TomorrowEra":{"population":1886,"demandHappiness":1886,"money_24h":22600},"FutureEra":{"population":2110,"demandHappiness":2110,"money_24h":25900},"ArcticFuture":{"population":2340,"demandHappiness":2340,"money_24h":29500},"OceanicFuture":{"population":2578,"demandHappiness":2578,"money_24h":33200},"VirtualFuture":{"population":2822,"demandHappiness":2822,"money_24h":37200},"SpaceAgeMars":{"population":4468,"demandHappiness":4468,"money_24h":62100},"SpaceAgeAsteroidBelt":{"population":4853,"demandHappiness":4853,"money_24h":68800},"SpaceAgeVenus":{"population":5245,"demandHappiness":5245,"money_24h":75900},"SpaceAgeJupiterMoon":{"population":5648,"demandHappiness":5648,"money_24h":83300},"SpaceAgeTitan":{"population":6059,"demandHappiness":6059,"money_24h":91000},"SpaceAgeSpaceHub":{"population":6480,"demandHappiness":6480,"money_24h":99200}} },
+    "R_MultiAge_BirthdayBonus22a": { prod: {"BronzeAge":{"population":67,"demandHappiness":67,"money_24h":400},"IronAge":{"population":144,"demandHappiness":144,"money_24h":1000},"EarlyMiddleAge":{"population":220,"demandHappiness":220,"money_24h":1700},"HighMiddleAge":{"population":309,"demandHappiness":309,"money_24h":2400},"LateMiddleAge":{"population":406,"demandHappiness":406,"money_24h":3200},"ColonialAge":{"population":512,"demandHappiness":512,"money_24h":4800},"IndustrialAge":{"population":626,"demandHappiness":626,"money_24h":6000},"ProgressiveEra":{"population":747,"demandHappiness":747,"money_24h":7300},"ModernEra":{"population":876,"demandHappiness":876,"money_24h":9100},"PostModernEra":{"population":1010,"demandHappiness":1010,"money_24h":11400},"ContemporaryEra":{"population":1151,"demandHappiness":1151,"money_24h":14800},"TomorrowEra":{"population":1297,"demandHappiness":1297,"money_24h":17200},"FutureEra":{"population":1450,"demandHappiness":1450,"money_24h":19700},"ArcticFuture":{"population":1609,"demandHappiness":1609,"money_24h":22400},"OceanicFuture":{"population":1772,"demandHappiness":1772,"money_24h":25200},"VirtualFuture":{"population":1940,"demandHappiness":1940,"money_24h":28300},"SpaceAgeMars":{"population":3071,"demandHappiness":3071,"money_24h":47200},"SpaceAgeAsteroidBelt":{"population":3336,"demandHappiness":3336,"money_24h":52300},"SpaceAgeVenus":{"population":3606,"demandHappiness":3606,"money_24h":57700},"SpaceAgeJupiterMoon":{"population":3883,"demandHappiness":3883,"money_24h":63300},"SpaceAgeTitan":{"population":4165,"demandHappiness":4165,"money_24h":69200},"SpaceAgeSpaceHub":{"population":4455,"demandHappiness":4455,"money_24h":75400}} },
+    "R_MultiAge_BirthdayBonus22b": { prod: {"BronzeAge":{"population":85,"demandHappiness":85,"money_24h":500},"IronAge":{"population":183,"demandHappiness":183,"money_24h":1200},"EarlyMiddleAge":{"population":280,"demandHappiness":280,"money_24h":2100},"HighMiddleAge":{"population":394,"demandHappiness":394,"money_24h":2900},"LateMiddleAge":{"population":517,"demandHappiness":517,"money_24h":3800},"ColonialAge":{"population":652,"demandHappiness":652,"money_24h":5800},"IndustrialAge":{"population":797,"demandHappiness":797,"money_24h":7300},"ProgressiveEra":{"population":951,"demandHappiness":951,"money_24h":8800},"ModernEra":{"population":1115,"demandHappiness":1115,"money_24h":11000},"PostModernEra":{"population":1285,"demandHappiness":1285,"money_24h":13800},"ContemporaryEra":{"population":1465,"demandHappiness":1465,"money_24h":18000},"TomorrowEra":{"population":1651,"demandHappiness":1651,"money_24h":20800},"FutureEra":{"population":1846,"demandHappiness":1846,"money_24h":23900},"ArcticFuture":{"population":2048,"demandHappiness":2048,"money_24h":27100},"OceanicFuture":{"population":2255,"demandHappiness":2255,"money_24h":30600},"VirtualFuture":{"population":2470,"demandHappiness":2470,"money_24h":34200},"SpaceAgeMars":{"population":3909,"demandHappiness":3909,"money_24h":57200},"SpaceAgeAsteroidBelt":{"population":4246,"demandHappiness":4246,"money_24h":63300},"SpaceAgeVenus":{"population":4590,"demandHappiness":4590,"money_24h":69800},"SpaceAgeJupiterMoon":{"population":4942,"demandHappiness":4942,"money_24h":76600},"SpaceAgeTitan":{"population":5301,"demandHappiness":5301,"money_24h":83800},"SpaceAgeSpaceHub":{"population":5670,"demandHappiness":5670,"money_24h":91200}} },
+    "A_MultiAge_MayDayBonus17": { prod: {"BronzeAge":{"happiness":340},"IronAge":{"happiness":420},"EarlyMiddleAge":{"happiness":520},"HighMiddleAge":{"happiness":570},"LateMiddleAge":{"happiness":640},"ColonialAge":{"happiness":750},"IndustrialAge":{"happiness":850},"ProgressiveEra":{"happiness":930},"ModernEra":{"happiness":1000},"PostModernEra":{"happiness":1040},"ContemporaryEra":{"happiness":1210},"TomorrowEra":{"happiness":1470},"FutureEra":{"happiness":1760},"ArcticFuture":{"happiness":2050},"OceanicFuture":{"happiness":2360},"VirtualFuture":{"happiness":2820},"SpaceAgeMars":{"happiness":4520},"SpaceAgeAsteroidBelt":{"happiness":4910},"SpaceAgeVenus":{"happiness":5300},"SpaceAgeJupiterMoon":{"happiness":5710},"SpaceAgeTitan":{"happiness":6130},"SpaceAgeSpaceHub":{"happiness":6550}} },
+    "R_MultiAge_SoccerBonus19eHestia": { prod: {"BronzeAge":{"happiness":250,"population":61,"demandHappiness":61,"money_24h":350},"IronAge":{"happiness":430,"population":131,"demandHappiness":131,"money_24h":750},"EarlyMiddleAge":{"happiness":480,"population":200,"demandHappiness":200,"money_24h":1200},"HighMiddleAge":{"happiness":540,"population":281,"demandHappiness":281,"money_24h":1600},"LateMiddleAge":{"happiness":600,"population":369,"demandHappiness":369,"money_24h":2000},"ColonialAge":{"happiness":700,"population":466,"demandHappiness":466,"money_24h":3000},"IndustrialAge":{"happiness":790,"population":569,"demandHappiness":569,"money_24h":3800},"ProgressiveEra":{"happiness":870,"population":680,"demandHappiness":680,"money_24h":4600},"ModernEra":{"happiness":930,"population":797,"demandHappiness":797,"money_24h":5700},"PostModernEra":{"happiness":970,"population":918,"demandHappiness":918,"money_24h":7200},"ContemporaryEra":{"happiness":1130,"population":1046,"demandHappiness":1046,"money_24h":9400},"TomorrowEra":{"happiness":1370,"population":1179,"demandHappiness":1179,"money_24h":10900},"FutureEra":{"happiness":1640,"population":1319,"demandHappiness":1319,"money_24h":12400},"ArcticFuture":{"happiness":1910,"population":1463,"demandHappiness":1463,"money_24h":14100},"OceanicFuture":{"happiness":2210,"population":1611,"demandHappiness":1611,"money_24h":15900},"VirtualFuture":{"happiness":2630,"population":1764,"demandHappiness":1764,"money_24h":17900},"SpaceAgeMars":{"happiness":4220,"population":2792,"demandHappiness":2792,"money_24h":29800},"SpaceAgeAsteroidBelt":{"happiness":4580,"population":3033,"demandHappiness":3033,"money_24h":33000},"SpaceAgeVenus":{"happiness":4950,"population":3278,"demandHappiness":3278,"money_24h":36400},"SpaceAgeJupiterMoon":{"happiness":5330,"population":3530,"demandHappiness":3530,"money_24h":40000},"SpaceAgeTitan":{"happiness":5720,"population":3787,"demandHappiness":3787,"money_24h":43700},"SpaceAgeSpaceHub":{"happiness":6120,"population":4050,"demandHappiness":4050,"money_24h":47600}} },
+    "R_MultiAge_PatrickBonusSet20a": { prod: {"BronzeAge":{"population":162,"demandHappiness":162,"money_24h":450},"IronAge":{"population":348,"demandHappiness":348,"money_24h":800},"EarlyMiddleAge":{"population":534,"demandHappiness":534,"money_24h":1300},"HighMiddleAge":{"population":750,"demandHappiness":750,"money_24h":1900},"LateMiddleAge":{"population":984,"demandHappiness":984,"money_24h":2400},"ColonialAge":{"population":1242,"demandHappiness":1242,"money_24h":3700},"IndustrialAge":{"population":1518,"demandHappiness":1518,"money_24h":4600},"ProgressiveEra":{"population":1812,"demandHappiness":1812,"money_24h":5600},"ModernEra":{"population":2124,"demandHappiness":2124,"money_24h":7000},"PostModernEra":{"population":2448,"demandHappiness":2448,"money_24h":8800},"ContemporaryEra":{"population":2790,"demandHappiness":2790,"money_24h":11500},"TomorrowEra":{"population":3144,"demandHappiness":3144,"money_24h":13300},"FutureEra":{"population":3516,"demandHappiness":3516,"money_24h":15200},"ArcticFuture":{"population":3900,"demandHappiness":3900,"money_24h":17300},"OceanicFuture":{"population":4296,"demandHappiness":4296,"money_24h":19500},"VirtualFuture":{"population":4704,"demandHappiness":4704,"money_24h":21800},"SpaceAgeMars":{"population":7446,"demandHappiness":7446,"money_24h":36500},"SpaceAgeAsteroidBelt":{"population":8088,"demandHappiness":8088,"money_24h":40400},"SpaceAgeVenus":{"population":8742,"demandHappiness":8742,"money_24h":44500},"SpaceAgeJupiterMoon":{"population":9414,"demandHappiness":9414,"money_24h":48900},"SpaceAgeTitan":{"population":10098,"demandHappiness":10098,"money_24h":53400},"SpaceAgeSpaceHub":{"population":10800,"demandHappiness":10800,"money_24h":58200}} },
+    "R_MultiAge_PatrickBonusSet20b": { prod: {"BronzeAge":{"population":203,"demandHappiness":203,"money_24h":600},"IronAge":{"population":435,"demandHappiness":435,"money_24h":1100},"EarlyMiddleAge":{"population":668,"demandHappiness":668,"money_24h":1800},"HighMiddleAge":{"population":938,"demandHappiness":938,"money_24h":2500},"LateMiddleAge":{"population":1230,"demandHappiness":1230,"money_24h":3300},"ColonialAge":{"population":1553,"demandHappiness":1553,"money_24h":5100},"IndustrialAge":{"population":1898,"demandHappiness":1898,"money_24h":6300},"ProgressiveEra":{"population":2265,"demandHappiness":2265,"money_24h":7700},"ModernEra":{"population":2655,"demandHappiness":2655,"money_24h":9500},"PostModernEra":{"population":3060,"demandHappiness":3060,"money_24h":12000},"ContemporaryEra":{"population":3488,"demandHappiness":3488,"money_24h":15600},"TomorrowEra":{"population":3930,"demandHappiness":3930,"money_24h":18100},"FutureEra":{"population":4395,"demandHappiness":4395,"money_24h":20700},"ArcticFuture":{"population":4875,"demandHappiness":4875,"money_24h":23600},"OceanicFuture":{"population":5370,"demandHappiness":5370,"money_24h":26600},"VirtualFuture":{"population":5880,"demandHappiness":5880,"money_24h":29800},"SpaceAgeMars":{"population":9308,"demandHappiness":9308,"money_24h":49700},"SpaceAgeAsteroidBelt":{"population":10110,"demandHappiness":10110,"money_24h":55100},"SpaceAgeVenus":{"population":10928,"demandHappiness":10928,"money_24h":60700},"SpaceAgeJupiterMoon":{"population":11768,"demandHappiness":11768,"money_24h":66600},"SpaceAgeTitan":{"population":12623,"demandHappiness":12623,"money_24h":72800},"SpaceAgeSpaceHub":{"population":13500,"demandHappiness":13500,"money_24h":79300}} },
+    "A_MultiAge_SummerBonus1": { prod: {"BronzeAge":{"happiness":290},"IronAge":{"happiness":440},"EarlyMiddleAge":{"happiness":480},"HighMiddleAge":{"happiness":540},"LateMiddleAge":{"happiness":600},"ColonialAge":{"happiness":710},"IndustrialAge":{"happiness":800},"ProgressiveEra":{"happiness":870},"ModernEra":{"happiness":940},"PostModernEra":{"happiness":980},"ContemporaryEra":{"happiness":1130},"TomorrowEra":{"happiness":1380},"FutureEra":{"happiness":1650},"ArcticFuture":{"happiness":1920},"OceanicFuture":{"happiness":2220},"VirtualFuture":{"happiness":2650},"SpaceAgeMars":{"happiness":4230},"SpaceAgeAsteroidBelt":{"happiness":4600},"SpaceAgeVenus":{"happiness":4970},"SpaceAgeJupiterMoon":{"happiness":5360},"SpaceAgeTitan":{"happiness":5740},"SpaceAgeSpaceHub":{"happiness":6140}} },
+    "R_MultiAge_SoccerBonus19eHera": { prod: {"BronzeAge":{"happiness":250,"population":61,"demandHappiness":61,"money_24h":350},"IronAge":{"happiness":430,"population":131,"demandHappiness":131,"money_24h":750},"EarlyMiddleAge":{"happiness":480,"population":200,"demandHappiness":200,"money_24h":1200},"HighMiddleAge":{"happiness":540,"population":281,"demandHappiness":281,"money_24h":1600},"LateMiddleAge":{"happiness":600,"population":369,"demandHappiness":369,"money_24h":2000},"ColonialAge":{"happiness":700,"population":466,"demandHappiness":466,"money_24h":3000},"IndustrialAge":{"happiness":790,"population":569,"demandHappiness":569,"money_24h":3800},"ProgressiveEra":{"happiness":870,"population":680,"demandHappiness":680,"money_24h":4600},"ModernEra":{"happiness":930,"population":797,"demandHappiness":797,"money_24h":5700},"PostModernEra":{"happiness":970,"population":918,"demandHappiness":918,"money_24h":7200},"ContemporaryEra":{"happiness":1130,"population":1046,"demandHappiness":1046,"money_24h":9400},"TomorrowEra":{"happiness":1370,"population":1179,"demandHappiness":1179,"money_24h":10900},"FutureEra":{"happiness":1640,"population":1319,"demandHappiness":1319,"money_24h":12400},"ArcticFuture":{"happiness":1910,"population":1463,"demandHappiness":1463,"money_24h":14100},"OceanicFuture":{"happiness":2210,"population":1611,"demandHappiness":1611,"money_24h":15900},"VirtualFuture":{"happiness":2630,"population":1764,"demandHappiness":1764,"money_24h":17900},"SpaceAgeMars":{"happiness":4220,"population":2792,"demandHappiness":2792,"money_24h":29800},"SpaceAgeAsteroidBelt":{"happiness":4580,"population":3033,"demandHappiness":3033,"money_24h":33000},"SpaceAgeVenus":{"happiness":4950,"population":3278,"demandHappiness":3278,"money_24h":36400},"SpaceAgeJupiterMoon":{"happiness":5330,"population":3530,"demandHappiness":3530,"money_24h":40000},"SpaceAgeTitan":{"happiness":5720,"population":3787,"demandHappiness":3787,"money_24h":43700},"SpaceAgeSpaceHub":{"happiness":6120,"population":4050,"demandHappiness":4050,"money_24h":47600}} },
+    "R_MultiAge_ChristmasBonus2": { prod: {"BronzeAge":{"population":8,"demandHappiness":8,"money_24h":40},"IronAge":{"population":17,"demandHappiness":17,"money_24h":60},"EarlyMiddleAge":{"population":27,"demandHappiness":27,"money_24h":90},"HighMiddleAge":{"population":38,"demandHappiness":38,"money_24h":130},"LateMiddleAge":{"population":49,"demandHappiness":49,"money_24h":170},"ColonialAge":{"population":62,"demandHappiness":62,"money_24h":250},"IndustrialAge":{"population":76,"demandHappiness":76,"money_24h":320},"ProgressiveEra":{"population":91,"demandHappiness":91,"money_24h":380},"ModernEra":{"population":106,"demandHappiness":106,"money_24h":480},"PostModernEra":{"population":122,"demandHappiness":122,"money_24h":600},"ContemporaryEra":{"population":140,"demandHappiness":140,"money_24h":780},"TomorrowEra":{"population":157,"demandHappiness":157,"money_24h":900},"FutureEra":{"population":176,"demandHappiness":176,"money_24h":1040},"ArcticFuture":{"population":195,"demandHappiness":195,"money_24h":1180},"OceanicFuture":{"population":215,"demandHappiness":215,"money_24h":1330},"VirtualFuture":{"population":235,"demandHappiness":235,"money_24h":1490},"SpaceAgeMars":{"population":372,"demandHappiness":372,"money_24h":2490},"SpaceAgeAsteroidBelt":{"population":404,"demandHappiness":404,"money_24h":2750},"SpaceAgeVenus":{"population":437,"demandHappiness":437,"money_24h":3030},"SpaceAgeJupiterMoon":{"population":471,"demandHappiness":471,"money_24h":3330},"SpaceAgeTitan":{"population":505,"demandHappiness":505,"money_24h":3640},"SpaceAgeSpaceHub":{"population":540,"demandHappiness":540,"money_24h":3970}} },
+    "A_MultiAge_BalloonBonus16": { prod: {"BronzeAge":{"happiness":460},"IronAge":{"happiness":790},"EarlyMiddleAge":{"happiness":870},"HighMiddleAge":{"happiness":970},"LateMiddleAge":{"happiness":1080},"ColonialAge":{"happiness":1270},"IndustrialAge":{"happiness":1430},"ProgressiveEra":{"happiness":1570},"ModernEra":{"happiness":1690},"PostModernEra":{"happiness":1760},"ContemporaryEra":{"happiness":2040},"TomorrowEra":{"happiness":2480},"FutureEra":{"happiness":2970},"ArcticFuture":{"happiness":3460},"OceanicFuture":{"happiness":3990},"VirtualFuture":{"happiness":4760},"SpaceAgeMars":{"happiness":7620},"SpaceAgeAsteroidBelt":{"happiness":8280},"SpaceAgeVenus":{"happiness":8950},"SpaceAgeJupiterMoon":{"happiness":9640},"SpaceAgeTitan":{"happiness":10340},"SpaceAgeSpaceHub":{"happiness":11060}} },
+    "R_MultiAge_SportBonus17a": { prod: {"BronzeAge":{"money_24h":400},"IronAge":{"money_24h":1000},"EarlyMiddleAge":{"money_24h":1700},"HighMiddleAge":{"money_24h":2400},"LateMiddleAge":{"money_24h":3200},"ColonialAge":{"money_24h":4800},"IndustrialAge":{"money_24h":6000},"ProgressiveEra":{"money_24h":7300},"ModernEra":{"money_24h":9100},"PostModernEra":{"money_24h":11400},"ContemporaryEra":{"money_24h":14800},"TomorrowEra":{"money_24h":17200},"FutureEra":{"money_24h":19700},"ArcticFuture":{"money_24h":22400},"OceanicFuture":{"money_24h":25200},"VirtualFuture":{"money_24h":28300},"SpaceAgeMars":{"money_24h":47200},"SpaceAgeAsteroidBelt":{"money_24h":52300},"SpaceAgeVenus":{"money_24h":57700},"SpaceAgeJupiterMoon":{"money_24h":63300},"SpaceAgeTitan":{"money_24h":69200},"SpaceAgeSpaceHub":{"money_24h":75400}} },
+    "R_MultiAge_SportBonus17b": { prod: {"BronzeAge":{"money_24h":500},"IronAge":{"money_24h":1100},"EarlyMiddleAge":{"money_24h":1800},"HighMiddleAge":{"money_24h":2500},"LateMiddleAge":{"money_24h":3300},"ColonialAge":{"money_24h":5100},"IndustrialAge":{"money_24h":6300},"ProgressiveEra":{"money_24h":7700},"ModernEra":{"money_24h":9500},"PostModernEra":{"money_24h":12000},"ContemporaryEra":{"money_24h":15600},"TomorrowEra":{"money_24h":18100},"FutureEra":{"money_24h":20700},"ArcticFuture":{"money_24h":23600},"OceanicFuture":{"money_24h":26600},"VirtualFuture":{"money_24h":29800},"SpaceAgeMars":{"money_24h":49700},"SpaceAgeAsteroidBelt":{"money_24h":55100},"SpaceAgeVenus":{"money_24h":60700},"SpaceAgeJupiterMoon":{"money_24h":66600},"SpaceAgeTitan":{"money_24h":72800},"SpaceAgeSpaceHub":{"money_24h":79300}} },
+    "R_MultiAge_SportBonus17c": { prod: {"BronzeAge":{"money_24h":500},"IronAge":{"money_24h":1100},"EarlyMiddleAge":{"money_24h":1900},"HighMiddleAge":{"money_24h":2700},"LateMiddleAge":{"money_24h":3500},"ColonialAge":{"money_24h":5300},"IndustrialAge":{"money_24h":6600},"ProgressiveEra":{"money_24h":8100},"ModernEra":{"money_24h":10000},"PostModernEra":{"money_24h":12600},"ContemporaryEra":{"money_24h":16400},"TomorrowEra":{"money_24h":19000},"FutureEra":{"money_24h":21800},"ArcticFuture":{"money_24h":24700},"OceanicFuture":{"money_24h":27900},"VirtualFuture":{"money_24h":31300},"SpaceAgeMars":{"money_24h":52200},"SpaceAgeAsteroidBelt":{"money_24h":57800},"SpaceAgeVenus":{"money_24h":63700},"SpaceAgeJupiterMoon":{"money_24h":69900},"SpaceAgeTitan":{"money_24h":76500},"SpaceAgeSpaceHub":{"money_24h":83300}} },
+    "R_MultiAge_SportBonus17d": { prod: {"BronzeAge":{"money_24h":500},"IronAge":{"money_24h":1200},"EarlyMiddleAge":{"money_24h":2000},"HighMiddleAge":{"money_24h":2800},"LateMiddleAge":{"money_24h":3700},"ColonialAge":{"money_24h":5600},"IndustrialAge":{"money_24h":7000},"ProgressiveEra":{"money_24h":8400},"ModernEra":{"money_24h":10500},"PostModernEra":{"money_24h":13200},"ContemporaryEra":{"money_24h":17200},"TomorrowEra":{"money_24h":19900},"FutureEra":{"money_24h":22800},"ArcticFuture":{"money_24h":25900},"OceanicFuture":{"money_24h":29200},"VirtualFuture":{"money_24h":32700},"SpaceAgeMars":{"money_24h":54700},"SpaceAgeAsteroidBelt":{"money_24h":60600},"SpaceAgeVenus":{"money_24h":66800},"SpaceAgeJupiterMoon":{"money_24h":73300},"SpaceAgeTitan":{"money_24h":80100},"SpaceAgeSpaceHub":{"money_24h":87300}} },
+    "R_MultiAge_SportBonus17e": { prod: {"BronzeAge":{"money_24h":500},"IronAge":{"money_24h":1200},"EarlyMiddleAge":{"money_24h":2100},"HighMiddleAge":{"money_24h":2900},"LateMiddleAge":{"money_24h":3800},"ColonialAge":{"money_24h":5800},"IndustrialAge":{"money_24h":7300},"ProgressiveEra":{"money_24h":8800},"ModernEra":{"money_24h":11000},"PostModernEra":{"money_24h":13800},"ContemporaryEra":{"money_24h":18000},"TomorrowEra":{"money_24h":20800},"FutureEra":{"money_24h":23900},"ArcticFuture":{"money_24h":27100},"OceanicFuture":{"money_24h":30600},"VirtualFuture":{"money_24h":34200},"SpaceAgeMars":{"money_24h":57200},"SpaceAgeAsteroidBelt":{"money_24h":63300},"SpaceAgeVenus":{"money_24h":69800},"SpaceAgeJupiterMoon":{"money_24h":76600},"SpaceAgeTitan":{"money_24h":83800},"SpaceAgeSpaceHub":{"money_24h":91200}} },
+    "R_MultiAge_SportBonus17f": { prod: {"BronzeAge":{"money_24h":500},"IronAge":{"money_24h":1300},"EarlyMiddleAge":{"money_24h":2200},"HighMiddleAge":{"money_24h":3000},"LateMiddleAge":{"money_24h":4000},"ColonialAge":{"money_24h":6100},"IndustrialAge":{"money_24h":7600},"ProgressiveEra":{"money_24h":9200},"ModernEra":{"money_24h":11500},"PostModernEra":{"money_24h":14400},"ContemporaryEra":{"money_24h":18800},"TomorrowEra":{"money_24h":21700},"FutureEra":{"money_24h":24900},"ArcticFuture":{"money_24h":28300},"OceanicFuture":{"money_24h":31900},"VirtualFuture":{"money_24h":35700},"SpaceAgeMars":{"money_24h":59700},"SpaceAgeAsteroidBelt":{"money_24h":66100},"SpaceAgeVenus":{"money_24h":72800},"SpaceAgeJupiterMoon":{"money_24h":79900},"SpaceAgeTitan":{"money_24h":87400},"SpaceAgeSpaceHub":{"money_24h":95200}} },
+    "R_MultiAge_SportBonus17g": { prod: {"BronzeAge":{"money_24h":600},"IronAge":{"money_24h":1400},"EarlyMiddleAge":{"money_24h":2300},"HighMiddleAge":{"money_24h":3200},"LateMiddleAge":{"money_24h":4200},"ColonialAge":{"money_24h":6300},"IndustrialAge":{"money_24h":7900},"ProgressiveEra":{"money_24h":9600},"ModernEra":{"money_24h":11900},"PostModernEra":{"money_24h":15000},"ContemporaryEra":{"money_24h":19500},"TomorrowEra":{"money_24h":22600},"FutureEra":{"money_24h":25900},"ArcticFuture":{"money_24h":29500},"OceanicFuture":{"money_24h":33200},"VirtualFuture":{"money_24h":37200},"SpaceAgeMars":{"money_24h":62100},"SpaceAgeAsteroidBelt":{"money_24h":68800},"SpaceAgeVenus":{"money_24h":75900},"SpaceAgeJupiterMoon":{"money_24h":83300},"SpaceAgeTitan":{"money_24h":91000},"SpaceAgeSpaceHub":{"money_24h":99200}} },
+    "R_MultiAge_CulturalBuilding4a": { prod: {"BronzeAge":{"money_24h":200},"IronAge":{"money_24h":500},"EarlyMiddleAge":{"money_24h":900},"HighMiddleAge":{"money_24h":1300},"LateMiddleAge":{"money_24h":1700},"ColonialAge":{"money_24h":2500},"IndustrialAge":{"money_24h":3200},"ProgressiveEra":{"money_24h":3800},"ModernEra":{"money_24h":4800},"PostModernEra":{"money_24h":6000},"ContemporaryEra":{"money_24h":7800},"TomorrowEra":{"money_24h":9100},"FutureEra":{"money_24h":10400},"ArcticFuture":{"money_24h":11800},"OceanicFuture":{"money_24h":13300},"VirtualFuture":{"money_24h":14900},"SpaceAgeMars":{"money_24h":24900},"SpaceAgeAsteroidBelt":{"money_24h":27500},"SpaceAgeVenus":{"money_24h":30400},"SpaceAgeJupiterMoon":{"money_24h":33300},"SpaceAgeTitan":{"money_24h":36400},"SpaceAgeSpaceHub":{"money_24h":39700}} },
+    "R_MultiAge_CulturalBuilding4b": { prod: {"BronzeAge":{"money_24h":300},"IronAge":{"money_24h":700},"EarlyMiddleAge":{"money_24h":1100},"HighMiddleAge":{"money_24h":1500},"LateMiddleAge":{"money_24h":2000},"ColonialAge":{"money_24h":3000},"IndustrialAge":{"money_24h":3800},"ProgressiveEra":{"money_24h":4600},"ModernEra":{"money_24h":5700},"PostModernEra":{"money_24h":7200},"ContemporaryEra":{"money_24h":9400},"TomorrowEra":{"money_24h":10900},"FutureEra":{"money_24h":12400},"ArcticFuture":{"money_24h":14100},"OceanicFuture":{"money_24h":15900},"VirtualFuture":{"money_24h":17900},"SpaceAgeMars":{"money_24h":29800},"SpaceAgeAsteroidBelt":{"money_24h":33000},"SpaceAgeVenus":{"money_24h":36400},"SpaceAgeJupiterMoon":{"money_24h":40000},"SpaceAgeTitan":{"money_24h":43700},"SpaceAgeSpaceHub":{"money_24h":47600}} },
+    "R_MultiAge_CulturalBuilding4c": { prod: {"BronzeAge":{"money_24h":300},"IronAge":{"money_24h":800},"EarlyMiddleAge":{"money_24h":1300},"HighMiddleAge":{"money_24h":1800},"LateMiddleAge":{"money_24h":2300},"ColonialAge":{"money_24h":3600},"IndustrialAge":{"money_24h":4400},"ProgressiveEra":{"money_24h":5400},"ModernEra":{"money_24h":6700},"PostModernEra":{"money_24h":8400},"ContemporaryEra":{"money_24h":10900},"TomorrowEra":{"money_24h":12700},"FutureEra":{"money_24h":14500},"ArcticFuture":{"money_24h":16500},"OceanicFuture":{"money_24h":18600},"VirtualFuture":{"money_24h":20800},"SpaceAgeMars":{"money_24h":34800},"SpaceAgeAsteroidBelt":{"money_24h":38500},"SpaceAgeVenus":{"money_24h":42500},"SpaceAgeJupiterMoon":{"money_24h":46600},"SpaceAgeTitan":{"money_24h":51000},"SpaceAgeSpaceHub":{"money_24h":55500}} },
+    "R_MultiAge_CulturalBuilding4d": { prod: {"BronzeAge":{"money_24h":400},"IronAge":{"money_24h":900},"EarlyMiddleAge":{"money_24h":1400},"HighMiddleAge":{"money_24h":2000},"LateMiddleAge":{"money_24h":2700},"ColonialAge":{"money_24h":4100},"IndustrialAge":{"money_24h":5100},"ProgressiveEra":{"money_24h":6100},"ModernEra":{"money_24h":7600},"PostModernEra":{"money_24h":9600},"ContemporaryEra":{"money_24h":12500},"TomorrowEra":{"money_24h":14500},"FutureEra":{"money_24h":16600},"ArcticFuture":{"money_24h":18900},"OceanicFuture":{"money_24h":21300},"VirtualFuture":{"money_24h":23800},"SpaceAgeMars":{"money_24h":39800},"SpaceAgeAsteroidBelt":{"money_24h":44100},"SpaceAgeVenus":{"money_24h":48600},"SpaceAgeJupiterMoon":{"money_24h":53300},"SpaceAgeTitan":{"money_24h":58300},"SpaceAgeSpaceHub":{"money_24h":63500}} },
+    "R_MultiAge_CulturalBuilding4e": { prod: {"BronzeAge":{"money_24h":400},"IronAge":{"money_24h":1000},"EarlyMiddleAge":{"money_24h":1600},"HighMiddleAge":{"money_24h":2300},"LateMiddleAge":{"money_24h":3000},"ColonialAge":{"money_24h":4600},"IndustrialAge":{"money_24h":5700},"ProgressiveEra":{"money_24h":6900},"ModernEra":{"money_24h":8600},"PostModernEra":{"money_24h":10800},"ContemporaryEra":{"money_24h":14100},"TomorrowEra":{"money_24h":16300},"FutureEra":{"money_24h":18700},"ArcticFuture":{"money_24h":21200},"OceanicFuture":{"money_24h":23900},"VirtualFuture":{"money_24h":26800},"SpaceAgeMars":{"money_24h":44700},"SpaceAgeAsteroidBelt":{"money_24h":49600},"SpaceAgeVenus":{"money_24h":54600},"SpaceAgeJupiterMoon":{"money_24h":60000},"SpaceAgeTitan":{"money_24h":65600},"SpaceAgeSpaceHub":{"money_24h":71400}} },
+    "R_MultiAge_EasterBonus16": { prod: {"BronzeAge":{"population":3,"demandHappiness":3,"money_24h":680},"IronAge":{"population":7,"demandHappiness":7,"money_24h":1080},"EarlyMiddleAge":{"population":10,"demandHappiness":10,"money_24h":1800},"HighMiddleAge":{"population":14,"demandHappiness":14,"money_24h":2520},"LateMiddleAge":{"population":18,"demandHappiness":18,"money_24h":3330},"ColonialAge":{"population":23,"demandHappiness":23,"money_24h":5070},"IndustrialAge":{"population":28,"demandHappiness":28,"money_24h":6320},"ProgressiveEra":{"population":34,"demandHappiness":34,"money_24h":7670},"ModernEra":{"population":40,"demandHappiness":40,"money_24h":9540},"PostModernEra":{"population":46,"demandHappiness":46,"money_24h":12000},"ContemporaryEra":{"population":52,"demandHappiness":52,"money_24h":15620},"TomorrowEra":{"population":59,"demandHappiness":59,"money_24h":18090},"FutureEra":{"population":66,"demandHappiness":66,"money_24h":20740},"ArcticFuture":{"population":73,"demandHappiness":73,"money_24h":23560},"OceanicFuture":{"population":81,"demandHappiness":81,"money_24h":26570},"VirtualFuture":{"population":88,"demandHappiness":88,"money_24h":29760},"SpaceAgeMars":{"population":140,"demandHappiness":140,"money_24h":49710},"SpaceAgeAsteroidBelt":{"population":152,"demandHappiness":152,"money_24h":55060},"SpaceAgeVenus":{"population":164,"demandHappiness":164,"money_24h":60690},"SpaceAgeJupiterMoon":{"population":177,"demandHappiness":177,"money_24h":66610},"SpaceAgeTitan":{"population":189,"demandHappiness":189,"money_24h":72830},"SpaceAgeSpaceHub":{"population":203,"demandHappiness":203,"money_24h":79330}} },
+    "R_MultiAge_Expedition16e": { prod: {"BronzeAge":{"population":3,"demandHappiness":3,"money_24h":700},"IronAge":{"population":6,"demandHappiness":6,"money_24h":1200},"EarlyMiddleAge":{"population":9,"demandHappiness":9,"money_24h":2000},"HighMiddleAge":{"population":13,"demandHappiness":13,"money_24h":2800},"LateMiddleAge":{"population":17,"demandHappiness":17,"money_24h":3700},"ColonialAge":{"population":22,"demandHappiness":22,"money_24h":5630},"IndustrialAge":{"population":27,"demandHappiness":27,"money_24h":7010},"ProgressiveEra":{"population":32,"demandHappiness":32,"money_24h":8510},"ModernEra":{"population":37,"demandHappiness":37,"money_24h":10590},"PostModernEra":{"population":43,"demandHappiness":43,"money_24h":13320},"ContemporaryEra":{"population":49,"demandHappiness":49,"money_24h":17340},"TomorrowEra":{"population":55,"demandHappiness":55,"money_24h":20080},"FutureEra":{"population":62,"demandHappiness":62,"money_24h":23020},"ArcticFuture":{"population":68,"demandHappiness":68,"money_24h":26150},"OceanicFuture":{"population":75,"demandHappiness":75,"money_24h":29490},"VirtualFuture":{"population":82,"demandHappiness":82,"money_24h":33030},"SpaceAgeMars":{"population":130,"demandHappiness":130,"money_24h":55170},"SpaceAgeAsteroidBelt":{"population":142,"demandHappiness":142,"money_24h":61110},"SpaceAgeVenus":{"population":153,"demandHappiness":153,"money_24h":67370},"SpaceAgeJupiterMoon":{"population":165,"demandHappiness":165,"money_24h":73940},"SpaceAgeTitan":{"population":177,"demandHappiness":177,"money_24h":80840},"SpaceAgeSpaceHub":{"population":189,"demandHappiness":189,"money_24h":88060}} },
+    "D_MultiAge_HalloweenBonus16": { prod: {"BronzeAge":{"happiness":40},"IronAge":{"happiness":60},"EarlyMiddleAge":{"happiness":70},"HighMiddleAge":{"happiness":80},"LateMiddleAge":{"happiness":90},"ColonialAge":{"happiness":100},"IndustrialAge":{"happiness":110},"ProgressiveEra":{"happiness":120},"ModernEra":{"happiness":130},"PostModernEra":{"happiness":140},"ContemporaryEra":{"happiness":160},"TomorrowEra":{"happiness":190},"FutureEra":{"happiness":220},"ArcticFuture":{"happiness":250},"OceanicFuture":{"happiness":290},"VirtualFuture":{"happiness":340},"SpaceAgeMars":{"happiness":550},"SpaceAgeAsteroidBelt":{"happiness":600},"SpaceAgeVenus":{"happiness":650},"SpaceAgeJupiterMoon":{"happiness":700},"SpaceAgeTitan":{"happiness":750},"SpaceAgeSpaceHub":{"happiness":800}} },
+    "R_MultiAge_CulturalBuilding8a": { prod: {"BronzeAge":{"money_24h":100},"IronAge":{"money_24h":300},"EarlyMiddleAge":{"money_24h":600},"HighMiddleAge":{"money_24h":800},"LateMiddleAge":{"money_24h":1000},"ColonialAge":{"money_24h":1600},"IndustrialAge":{"money_24h":2000},"ProgressiveEra":{"money_24h":2400},"ModernEra":{"money_24h":3000},"PostModernEra":{"money_24h":3700},"ContemporaryEra":{"money_24h":4900},"TomorrowEra":{"money_24h":5600},"FutureEra":{"money_24h":6500},"ArcticFuture":{"money_24h":7300},"OceanicFuture":{"money_24h":8300},"VirtualFuture":{"money_24h":9300},"SpaceAgeMars":{"money_24h":15500},"SpaceAgeAsteroidBelt":{"money_24h":17100},"SpaceAgeVenus":{"money_24h":18900},"SpaceAgeJupiterMoon":{"money_24h":20700},"SpaceAgeTitan":{"money_24h":22700},"SpaceAgeSpaceHub":{"money_24h":24700}} },
+    "R_MultiAge_CulturalBuilding8b": { prod: {"BronzeAge":{"money_24h":200},"IronAge":{"money_24h":400},"EarlyMiddleAge":{"money_24h":600},"HighMiddleAge":{"money_24h":900},"LateMiddleAge":{"money_24h":1200},"ColonialAge":{"money_24h":1800},"IndustrialAge":{"money_24h":2300},"ProgressiveEra":{"money_24h":2700},"ModernEra":{"money_24h":3400},"PostModernEra":{"money_24h":4300},"ContemporaryEra":{"money_24h":5600},"TomorrowEra":{"money_24h":6400},"FutureEra":{"money_24h":7400},"ArcticFuture":{"money_24h":8400},"OceanicFuture":{"money_24h":9500},"VirtualFuture":{"money_24h":10600},"SpaceAgeMars":{"money_24h":17700},"SpaceAgeAsteroidBelt":{"money_24h":19600},"SpaceAgeVenus":{"money_24h":21600},"SpaceAgeJupiterMoon":{"money_24h":23700},"SpaceAgeTitan":{"money_24h":25900},"SpaceAgeSpaceHub":{"money_24h":28200}} },
+    "R_MultiAge_CulturalBuilding8c": { prod: {"BronzeAge":{"money_24h":200},"IronAge":{"money_24h":400},"EarlyMiddleAge":{"money_24h":700},"HighMiddleAge":{"money_24h":1000},"LateMiddleAge":{"money_24h":1300},"ColonialAge":{"money_24h":2000},"IndustrialAge":{"money_24h":2500},"ProgressiveEra":{"money_24h":3100},"ModernEra":{"money_24h":3800},"PostModernEra":{"money_24h":4800},"ContemporaryEra":{"money_24h":6300},"TomorrowEra":{"money_24h":7200},"FutureEra":{"money_24h":8300},"ArcticFuture":{"money_24h":9400},"OceanicFuture":{"money_24h":10600},"VirtualFuture":{"money_24h":11900},"SpaceAgeMars":{"money_24h":19900},"SpaceAgeAsteroidBelt":{"money_24h":22000},"SpaceAgeVenus":{"money_24h":24300},"SpaceAgeJupiterMoon":{"money_24h":26700},"SpaceAgeTitan":{"money_24h":29100},"SpaceAgeSpaceHub":{"money_24h":31700}} },
+    "R_MultiAge_CulturalBuilding8d": { prod: {"BronzeAge":{"money_24h":200},"IronAge":{"money_24h":500},"EarlyMiddleAge":{"money_24h":800},"HighMiddleAge":{"money_24h":1100},"LateMiddleAge":{"money_24h":1500},"ColonialAge":{"money_24h":2300},"IndustrialAge":{"money_24h":2800},"ProgressiveEra":{"money_24h":3400},"ModernEra":{"money_24h":4200},"PostModernEra":{"money_24h":5300},"ContemporaryEra":{"money_24h":6900},"TomorrowEra":{"money_24h":8000},"FutureEra":{"money_24h":9200},"ArcticFuture":{"money_24h":10500},"OceanicFuture":{"money_24h":11800},"VirtualFuture":{"money_24h":13200},"SpaceAgeMars":{"money_24h":22100},"SpaceAgeAsteroidBelt":{"money_24h":24500},"SpaceAgeVenus":{"money_24h":27000},"SpaceAgeJupiterMoon":{"money_24h":29600},"SpaceAgeTitan":{"money_24h":32400},"SpaceAgeSpaceHub":{"money_24h":35300}} },
+    "R_MultiAge_CulturalBuilding8e": { prod: {"BronzeAge":{"money_24h":200},"IronAge":{"money_24h":500},"EarlyMiddleAge":{"money_24h":900},"HighMiddleAge":{"money_24h":1200},"LateMiddleAge":{"money_24h":1600},"ColonialAge":{"money_24h":2500},"IndustrialAge":{"money_24h":3100},"ProgressiveEra":{"money_24h":3800},"ModernEra":{"money_24h":4700},"PostModernEra":{"money_24h":5900},"ContemporaryEra":{"money_24h":7600},"TomorrowEra":{"money_24h":8800},"FutureEra":{"money_24h":10100},"ArcticFuture":{"money_24h":11500},"OceanicFuture":{"money_24h":13000},"VirtualFuture":{"money_24h":14600},"SpaceAgeMars":{"money_24h":24300},"SpaceAgeAsteroidBelt":{"money_24h":26900},"SpaceAgeVenus":{"money_24h":29700},"SpaceAgeJupiterMoon":{"money_24h":32600},"SpaceAgeTitan":{"money_24h":35600},"SpaceAgeSpaceHub":{"money_24h":38800}} },
+    "R_MultiAge_WinterBonusSet17c": { prod: {"BronzeAge":{"money_24h":300},"IronAge":{"money_24h":720},"EarlyMiddleAge":{"money_24h":1200},"HighMiddleAge":{"money_24h":1680},"LateMiddleAge":{"money_24h":2220},"ColonialAge":{"money_24h":3380},"IndustrialAge":{"money_24h":4210},"ProgressiveEra":{"money_24h":5110},"ModernEra":{"money_24h":6360},"PostModernEra":{"money_24h":8000},"ContemporaryEra":{"money_24h":10420},"TomorrowEra":{"money_24h":12060},"FutureEra":{"money_24h":13820},"ArcticFuture":{"money_24h":15710},"OceanicFuture":{"money_24h":17710},"VirtualFuture":{"money_24h":19840},"SpaceAgeMars":{"money_24h":33140},"SpaceAgeAsteroidBelt":{"money_24h":36710},"SpaceAgeVenus":{"money_24h":40460},"SpaceAgeJupiterMoon":{"money_24h":44410},"SpaceAgeTitan":{"money_24h":48550},"SpaceAgeSpaceHub":{"money_24h":52890}} },
+    "R_MultiAge_WinterBonusSet17b": { prod: {"BronzeAge":{"money_24h":300},"IronAge":{"money_24h":720},"EarlyMiddleAge":{"money_24h":1200},"HighMiddleAge":{"money_24h":1680},"LateMiddleAge":{"money_24h":2220},"ColonialAge":{"money_24h":3380},"IndustrialAge":{"money_24h":4210},"ProgressiveEra":{"money_24h":5110},"ModernEra":{"money_24h":6360},"PostModernEra":{"money_24h":8000},"ContemporaryEra":{"money_24h":10420},"TomorrowEra":{"money_24h":12060},"FutureEra":{"money_24h":13820},"ArcticFuture":{"money_24h":15710},"OceanicFuture":{"money_24h":17710},"VirtualFuture":{"money_24h":19840},"SpaceAgeMars":{"money_24h":33140},"SpaceAgeAsteroidBelt":{"money_24h":36710},"SpaceAgeVenus":{"money_24h":40460},"SpaceAgeJupiterMoon":{"money_24h":44410},"SpaceAgeTitan":{"money_24h":48550},"SpaceAgeSpaceHub":{"money_24h":52890}} },
+    "D_MultiAge_SummerBonus19Pirate": { prod: {"BronzeAge":{"happiness":70},"IronAge":{"happiness":90},"EarlyMiddleAge":{"happiness":120},"HighMiddleAge":{"happiness":140},"LateMiddleAge":{"happiness":170},"ColonialAge":{"happiness":200},"IndustrialAge":{"happiness":230},"ProgressiveEra":{"happiness":250},"ModernEra":{"happiness":280},"PostModernEra":{"happiness":320},"ContemporaryEra":{"happiness":360},"TomorrowEra":{"happiness":440},"FutureEra":{"happiness":590},"ArcticFuture":{"happiness":720},"OceanicFuture":{"happiness":910},"VirtualFuture":{"happiness":1220},"SpaceAgeMars":{"happiness":1960},"SpaceAgeAsteroidBelt":{"happiness":2130},"SpaceAgeVenus":{"happiness":2300},"SpaceAgeJupiterMoon":{"happiness":2480},"SpaceAgeTitan":{"happiness":2650},"SpaceAgeSpaceHub":{"happiness":2840}} },
+    "A_MultiAge_FallBonus20": { prod: {"BronzeAge":{"happiness":200},"IronAge":{"happiness":280},"EarlyMiddleAge":{"happiness":360},"HighMiddleAge":{"happiness":430},"LateMiddleAge":{"happiness":510},"ColonialAge":{"happiness":600},"IndustrialAge":{"happiness":680},"ProgressiveEra":{"happiness":750},"ModernEra":{"happiness":800},"PostModernEra":{"happiness":940},"ContemporaryEra":{"happiness":1090},"TomorrowEra":{"happiness":1320},"FutureEra":{"happiness":1760},"ArcticFuture":{"happiness":2150},"OceanicFuture":{"happiness":2720},"VirtualFuture":{"happiness":3390},"SpaceAgeMars":{"happiness":5650},"SpaceAgeAsteroidBelt":{"happiness":6140},"SpaceAgeVenus":{"happiness":6630},"SpaceAgeJupiterMoon":{"happiness":7140},"SpaceAgeTitan":{"happiness":7660},"SpaceAgeSpaceHub":{"happiness":8190}} },
+    "R_MultiAge_SummerBonus15b": { prod: {"BronzeAge":{"population":14,"demandHappiness":14,"money_24h":250},"IronAge":{"population":29,"demandHappiness":29,"money_24h":600},"EarlyMiddleAge":{"population":45,"demandHappiness":45,"money_24h":1000},"HighMiddleAge":{"population":63,"demandHappiness":63,"money_24h":1400},"LateMiddleAge":{"population":82,"demandHappiness":82,"money_24h":1850},"ColonialAge":{"population":104,"demandHappiness":104,"money_24h":2820},"IndustrialAge":{"population":127,"demandHappiness":127,"money_24h":3510},"ProgressiveEra":{"population":151,"demandHappiness":151,"money_24h":4260},"ModernEra":{"population":177,"demandHappiness":177,"money_24h":5300},"PostModernEra":{"population":204,"demandHappiness":204,"money_24h":6670},"ContemporaryEra":{"population":233,"demandHappiness":233,"money_24h":8680},"TomorrowEra":{"population":262,"demandHappiness":262,"money_24h":10050},"FutureEra":{"population":293,"demandHappiness":293,"money_24h":11520},"ArcticFuture":{"population":325,"demandHappiness":325,"money_24h":13090},"OceanicFuture":{"population":358,"demandHappiness":358,"money_24h":14760},"VirtualFuture":{"population":392,"demandHappiness":392,"money_24h":16530},"SpaceAgeMars":{"population":621,"demandHappiness":621,"money_24h":27620},"SpaceAgeAsteroidBelt":{"population":674,"demandHappiness":674,"money_24h":30590},"SpaceAgeVenus":{"population":729,"demandHappiness":729,"money_24h":33720},"SpaceAgeJupiterMoon":{"population":785,"demandHappiness":785,"money_24h":37010},"SpaceAgeTitan":{"population":842,"demandHappiness":842,"money_24h":40460},"SpaceAgeSpaceHub":{"population":900,"demandHappiness":900,"money_24h":44070}} },
+    "D_MultiAge_ChristmasBonus2": { prod: {"BronzeAge":{"happiness":180},"IronAge":{"happiness":230},"EarlyMiddleAge":{"happiness":250},"HighMiddleAge":{"happiness":280},"LateMiddleAge":{"happiness":320},"ColonialAge":{"happiness":370},"IndustrialAge":{"happiness":400},"ProgressiveEra":{"happiness":440},"ModernEra":{"happiness":470},"PostModernEra":{"happiness":490},"ContemporaryEra":{"happiness":570},"TomorrowEra":{"happiness":690},"FutureEra":{"happiness":830},"ArcticFuture":{"happiness":960},"OceanicFuture":{"happiness":1110},"VirtualFuture":{"happiness":1330},"SpaceAgeMars":{"happiness":2130},"SpaceAgeAsteroidBelt":{"happiness":2310},"SpaceAgeVenus":{"happiness":2500},"SpaceAgeJupiterMoon":{"happiness":2690},"SpaceAgeTitan":{"happiness":2890},"SpaceAgeSpaceHub":{"happiness":3090}} },
+    "D_MultiAge_ChristmasBonusSet1b": { prod: {"BronzeAge":{"happiness":38},"IronAge":{"happiness":47},"EarlyMiddleAge":{"happiness":52},"HighMiddleAge":{"happiness":57},"LateMiddleAge":{"happiness":64},"ColonialAge":{"happiness":75},"IndustrialAge":{"happiness":85},"ProgressiveEra":{"happiness":93},"ModernEra":{"happiness":100},"PostModernEra":{"happiness":110},"ContemporaryEra":{"happiness":128},"TomorrowEra":{"happiness":155},"FutureEra":{"happiness":186},"ArcticFuture":{"happiness":216},"OceanicFuture":{"happiness":249},"VirtualFuture":{"happiness":298},"SpaceAgeMars":{"happiness":477},"SpaceAgeAsteroidBelt":{"happiness":518},"SpaceAgeVenus":{"happiness":560},"SpaceAgeJupiterMoon":{"happiness":603},"SpaceAgeTitan":{"happiness":647},"SpaceAgeSpaceHub":{"happiness":692}} },
+    "R_MultiAge_SummerBonusSetA17c": { prod: {"BronzeAge":{"money_24h":180},"IronAge":{"money_24h":430},"EarlyMiddleAge":{"money_24h":720},"HighMiddleAge":{"money_24h":1010},"LateMiddleAge":{"money_24h":1330},"ColonialAge":{"money_24h":2030},"IndustrialAge":{"money_24h":2530},"ProgressiveEra":{"money_24h":3070},"ModernEra":{"money_24h":3820},"PostModernEra":{"money_24h":4800},"ContemporaryEra":{"money_24h":6250},"TomorrowEra":{"money_24h":7240},"FutureEra":{"money_24h":8290},"ArcticFuture":{"money_24h":9420},"OceanicFuture":{"money_24h":10630},"VirtualFuture":{"money_24h":11900},"SpaceAgeMars":{"money_24h":19880},"SpaceAgeAsteroidBelt":{"money_24h":22020},"SpaceAgeVenus":{"money_24h":24280},"SpaceAgeJupiterMoon":{"money_24h":26650},"SpaceAgeTitan":{"money_24h":29130},"SpaceAgeSpaceHub":{"money_24h":31730}} },
+    "D_MultiAge_SummerBonus19Trader": { prod: {"BronzeAge":{"happiness":70},"IronAge":{"happiness":90},"EarlyMiddleAge":{"happiness":120},"HighMiddleAge":{"happiness":140},"LateMiddleAge":{"happiness":170},"ColonialAge":{"happiness":200},"IndustrialAge":{"happiness":230},"ProgressiveEra":{"happiness":250},"ModernEra":{"happiness":280},"PostModernEra":{"happiness":320},"ContemporaryEra":{"happiness":360},"TomorrowEra":{"happiness":440},"FutureEra":{"happiness":590},"ArcticFuture":{"happiness":720},"OceanicFuture":{"happiness":910},"VirtualFuture":{"happiness":1220},"SpaceAgeMars":{"happiness":1960},"SpaceAgeAsteroidBelt":{"happiness":2130},"SpaceAgeVenus":{"happiness":2300},"SpaceAgeJupiterMoon":{"happiness":2480},"SpaceAgeTitan":{"happiness":2650},"SpaceAgeSpaceHub":{"happiness":2840}} },
+    "R_MultiAge_TourBonus17": { prod: {"BronzeAge":{"population":1,"demandHappiness":1,"money_24h":230},"IronAge":{"population":1,"demandHappiness":1,"money_24h":540},"EarlyMiddleAge":{"population":1,"demandHappiness":1,"money_24h":900},"HighMiddleAge":{"population":1,"demandHappiness":1,"money_24h":1260},"LateMiddleAge":{"population":1,"demandHappiness":1,"money_24h":1670},"ColonialAge":{"population":1,"demandHappiness":1,"money_24h":2540},"IndustrialAge":{"population":1,"demandHappiness":1,"money_24h":3160},"ProgressiveEra":{"population":1,"demandHappiness":1,"money_24h":3830},"ModernEra":{"population":1,"demandHappiness":1,"money_24h":4770},"PostModernEra":{"population":1,"demandHappiness":1,"money_24h":6000},"ContemporaryEra":{"population":1,"demandHappiness":1,"money_24h":7810},"TomorrowEra":{"population":1,"demandHappiness":1,"money_24h":9050},"FutureEra":{"population":1,"demandHappiness":1,"money_24h":10370},"ArcticFuture":{"population":1,"demandHappiness":1,"money_24h":11780},"OceanicFuture":{"population":1,"demandHappiness":1,"money_24h":13280},"VirtualFuture":{"population":1,"demandHappiness":1,"money_24h":14880},"SpaceAgeMars":{"population":1,"demandHappiness":1,"money_24h":24850},"SpaceAgeAsteroidBelt":{"population":1,"demandHappiness":1,"money_24h":27530},"SpaceAgeVenus":{"population":1,"demandHappiness":1,"money_24h":30350},"SpaceAgeJupiterMoon":{"population":1,"demandHappiness":1,"money_24h":33310},"SpaceAgeTitan":{"population":1,"demandHappiness":1,"money_24h":36410},"SpaceAgeSpaceHub":{"population":1,"demandHappiness":1,"money_24h":39670}} },
+    "R_MultiAge_RoyalBonusSet17a": { prod: {"BronzeAge":{"money_24h":220},"IronAge":{"money_24h":530},"EarlyMiddleAge":{"money_24h":880},"HighMiddleAge":{"money_24h":1260},"LateMiddleAge":{"money_24h":1670},"ColonialAge":{"money_24h":2140},"IndustrialAge":{"money_24h":2670},"ProgressiveEra":{"money_24h":3320},"ModernEra":{"money_24h":4130},"PostModernEra":{"money_24h":5070},"ContemporaryEra":{"money_24h":6250},"TomorrowEra":{"money_24h":7640},"FutureEra":{"money_24h":9220},"ArcticFuture":{"money_24h":11000},"OceanicFuture":{"money_24h":12990},"VirtualFuture":{"money_24h":14550},"SpaceAgeMars":{"money_24h":24300},"SpaceAgeAsteroidBelt":{"money_24h":26920},"SpaceAgeVenus":{"money_24h":29670},"SpaceAgeJupiterMoon":{"money_24h":32570},"SpaceAgeTitan":{"money_24h":35600},"SpaceAgeSpaceHub":{"money_24h":38780}} },
+    "R_MultiAge_ParksBonus17": { prod: {"BronzeAge":{"happiness":40,"population":40,"demandHappiness":40,"money_24h":500},"IronAge":{"happiness":90,"population":90,"demandHappiness":90,"money_24h":1200},"EarlyMiddleAge":{"happiness":130,"population":130,"demandHappiness":130,"money_24h":2000},"HighMiddleAge":{"happiness":190,"population":190,"demandHappiness":190,"money_24h":2900},"LateMiddleAge":{"happiness":250,"population":250,"demandHappiness":250,"money_24h":3800},"ColonialAge":{"happiness":310,"population":310,"demandHappiness":310,"money_24h":5800},"IndustrialAge":{"happiness":380,"population":380,"demandHappiness":380,"money_24h":7200},"ProgressiveEra":{"happiness":450,"population":450,"demandHappiness":450,"money_24h":8700},"ModernEra":{"happiness":530,"population":530,"demandHappiness":530,"money_24h":10800},"PostModernEra":{"happiness":610,"population":610,"demandHappiness":610,"money_24h":13600},"ContemporaryEra":{"happiness":700,"population":700,"demandHappiness":700,"money_24h":17700},"TomorrowEra":{"happiness":790,"population":790,"demandHappiness":790,"money_24h":20500},"FutureEra":{"happiness":880,"population":880,"demandHappiness":880,"money_24h":23500},"ArcticFuture":{"happiness":980,"population":980,"demandHappiness":980,"money_24h":26700},"OceanicFuture":{"happiness":1070,"population":1070,"demandHappiness":1070,"money_24h":30100},"VirtualFuture":{"happiness":1180,"population":1180,"demandHappiness":1180,"money_24h":33700},"SpaceAgeMars":{"happiness":1860,"population":1860,"demandHappiness":1860,"money_24h":56300},"SpaceAgeAsteroidBelt":{"happiness":2020,"population":2020,"demandHappiness":2020,"money_24h":62400},"SpaceAgeVenus":{"happiness":2190,"population":2190,"demandHappiness":2190,"money_24h":68800},"SpaceAgeJupiterMoon":{"happiness":2350,"population":2350,"demandHappiness":2350,"money_24h":75500},"SpaceAgeTitan":{"happiness":2530,"population":2530,"demandHappiness":2530,"money_24h":82500},"SpaceAgeSpaceHub":{"happiness":2700,"population":2700,"demandHappiness":2700,"money_24h":89900}} },
+    "R_MultiAge_NapoleonBonus18": { prod: {"BronzeAge":{"happiness":45,"population":45,"demandHappiness":45,"money_24h":230},"IronAge":{"happiness":96,"population":96,"demandHappiness":96,"money_24h":500},"EarlyMiddleAge":{"happiness":147,"population":147,"demandHappiness":147,"money_24h":750},"HighMiddleAge":{"happiness":206,"population":206,"demandHappiness":206,"money_24h":970},"LateMiddleAge":{"happiness":271,"population":271,"demandHappiness":271,"money_24h":1170},"ColonialAge":{"happiness":342,"population":342,"demandHappiness":342,"money_24h":1610},"IndustrialAge":{"happiness":417,"population":417,"demandHappiness":417,"money_24h":1840},"ProgressiveEra":{"happiness":498,"population":498,"demandHappiness":498,"money_24h":2110},"ModernEra":{"happiness":584,"population":584,"demandHappiness":584,"money_24h":2620},"PostModernEra":{"happiness":673,"population":673,"demandHappiness":673,"money_24h":3300},"ContemporaryEra":{"happiness":767,"population":767,"demandHappiness":767,"money_24h":4300},"TomorrowEra":{"happiness":865,"population":865,"demandHappiness":865,"money_24h":4970},"FutureEra":{"happiness":967,"population":967,"demandHappiness":967,"money_24h":5700},"ArcticFuture":{"happiness":1073,"population":1073,"demandHappiness":1073,"money_24h":6480},"OceanicFuture":{"happiness":1181,"population":1181,"demandHappiness":1181,"money_24h":7500},"VirtualFuture":{"happiness":1294,"population":1294,"demandHappiness":1294,"money_24h":8400},"SpaceAgeMars":{"happiness":2048,"population":2048,"demandHappiness":2048,"money_24h":14030},"SpaceAgeAsteroidBelt":{"happiness":2224,"population":2224,"demandHappiness":2224,"money_24h":15540},"SpaceAgeVenus":{"happiness":2404,"population":2404,"demandHappiness":2404,"money_24h":17140},"SpaceAgeJupiterMoon":{"happiness":2589,"population":2589,"demandHappiness":2589,"money_24h":18810},"SpaceAgeTitan":{"happiness":2777,"population":2777,"demandHappiness":2777,"money_24h":20560},"SpaceAgeSpaceHub":{"happiness":2970,"population":2970,"demandHappiness":2970,"money_24h":22400}} },
+    "D_MultiAge_SummerBonus19Royal": { prod: {"BronzeAge":{"happiness":70},"IronAge":{"happiness":90},"EarlyMiddleAge":{"happiness":120},"HighMiddleAge":{"happiness":140},"LateMiddleAge":{"happiness":170},"ColonialAge":{"happiness":200},"IndustrialAge":{"happiness":230},"ProgressiveEra":{"happiness":250},"ModernEra":{"happiness":280},"PostModernEra":{"happiness":320},"ContemporaryEra":{"happiness":360},"TomorrowEra":{"happiness":440},"FutureEra":{"happiness":590},"ArcticFuture":{"happiness":720},"OceanicFuture":{"happiness":910},"VirtualFuture":{"happiness":1220},"SpaceAgeMars":{"happiness":1960},"SpaceAgeAsteroidBelt":{"happiness":2130},"SpaceAgeVenus":{"happiness":2300},"SpaceAgeJupiterMoon":{"happiness":2480},"SpaceAgeTitan":{"happiness":2650},"SpaceAgeSpaceHub":{"happiness":2840}} },
+    "R_MultiAge_RoyalBonusSet17b": { prod: {"BronzeAge":{"money_24h":220},"IronAge":{"money_24h":530},"EarlyMiddleAge":{"money_24h":880},"HighMiddleAge":{"money_24h":1260},"LateMiddleAge":{"money_24h":1670},"ColonialAge":{"money_24h":2140},"IndustrialAge":{"money_24h":2670},"ProgressiveEra":{"money_24h":3320},"ModernEra":{"money_24h":4130},"PostModernEra":{"money_24h":5070},"ContemporaryEra":{"money_24h":6250},"TomorrowEra":{"money_24h":7640},"FutureEra":{"money_24h":9220},"ArcticFuture":{"money_24h":11000},"OceanicFuture":{"money_24h":12990},"VirtualFuture":{"money_24h":14550},"SpaceAgeMars":{"money_24h":24300},"SpaceAgeAsteroidBelt":{"money_24h":26920},"SpaceAgeVenus":{"money_24h":29670},"SpaceAgeJupiterMoon":{"money_24h":32570},"SpaceAgeTitan":{"money_24h":35600},"SpaceAgeSpaceHub":{"money_24h":38780}} },
+    "A_MultiAge_SportBonusSet18": { prod: {"BronzeAge":{"happiness":290},"IronAge":{"happiness":370},"EarlyMiddleAge":{"happiness":480},"HighMiddleAge":{"happiness":570},"LateMiddleAge":{"happiness":680},"ColonialAge":{"happiness":800},"IndustrialAge":{"happiness":910},"ProgressiveEra":{"happiness":1000},"ModernEra":{"happiness":1070},"PostModernEra":{"happiness":1250},"ContemporaryEra":{"happiness":1450},"TomorrowEra":{"happiness":1760},"FutureEra":{"happiness":2340},"ArcticFuture":{"happiness":2870},"OceanicFuture":{"happiness":3620},"VirtualFuture":{"happiness":4890},"SpaceAgeMars":{"happiness":7830},"SpaceAgeAsteroidBelt":{"happiness":8510},"SpaceAgeVenus":{"happiness":9190},"SpaceAgeJupiterMoon":{"happiness":9900},"SpaceAgeTitan":{"happiness":10620},"SpaceAgeSpaceHub":{"happiness":11360}} },
+    "D_MultiAge_SportBonusSet18": { prod: {"BronzeAge":{"happiness":120},"IronAge":{"happiness":190},"EarlyMiddleAge":{"happiness":210},"HighMiddleAge":{"happiness":230},"LateMiddleAge":{"happiness":260},"ColonialAge":{"happiness":300},"IndustrialAge":{"happiness":340},"ProgressiveEra":{"happiness":370},"ModernEra":{"happiness":400},"PostModernEra":{"happiness":420},"ContemporaryEra":{"happiness":480},"TomorrowEra":{"happiness":590},"FutureEra":{"happiness":700},"ArcticFuture":{"happiness":820},"OceanicFuture":{"happiness":950},"VirtualFuture":{"happiness":1130},"SpaceAgeMars":{"happiness":1810},"SpaceAgeAsteroidBelt":{"happiness":1960},"SpaceAgeVenus":{"happiness":2120},"SpaceAgeJupiterMoon":{"happiness":2280},"SpaceAgeTitan":{"happiness":2450},"SpaceAgeSpaceHub":{"happiness":2620}} },
+    "R_MultiAge_SportBonusSet18": { prod: {"BronzeAge":{"money_24h":200},"IronAge":{"money_24h":480},"EarlyMiddleAge":{"money_24h":800},"HighMiddleAge":{"money_24h":1120},"LateMiddleAge":{"money_24h":1480},"ColonialAge":{"money_24h":2250},"IndustrialAge":{"money_24h":2810},"ProgressiveEra":{"money_24h":3410},"ModernEra":{"money_24h":4240},"PostModernEra":{"money_24h":5330},"ContemporaryEra":{"money_24h":6940},"TomorrowEra":{"money_24h":8040},"FutureEra":{"money_24h":9220},"ArcticFuture":{"money_24h":10470},"OceanicFuture":{"money_24h":11810},"VirtualFuture":{"money_24h":13230},"SpaceAgeMars":{"money_24h":22090},"SpaceAgeAsteroidBelt":{"money_24h":24470},"SpaceAgeVenus":{"money_24h":26970},"SpaceAgeJupiterMoon":{"money_24h":29610},"SpaceAgeTitan":{"money_24h":32370},"SpaceAgeSpaceHub":{"money_24h":35260}} },
+    "R_MultiAge_SportBonus19a": { prod: {"BronzeAge":{"population":22,"demandHappiness":22,"money_24h":600},"IronAge":{"population":46,"demandHappiness":46,"money_24h":1500},"EarlyMiddleAge":{"population":71,"demandHappiness":71,"money_24h":2500},"HighMiddleAge":{"population":100,"demandHappiness":100,"money_24h":3500},"LateMiddleAge":{"population":131,"demandHappiness":131,"money_24h":4600},"ColonialAge":{"population":166,"demandHappiness":166,"money_24h":7000},"IndustrialAge":{"population":202,"demandHappiness":202,"money_24h":8700},"ProgressiveEra":{"population":242,"demandHappiness":242,"money_24h":10600},"ModernEra":{"population":283,"demandHappiness":283,"money_24h":13100},"PostModernEra":{"population":326,"demandHappiness":326,"money_24h":16500},"ContemporaryEra":{"population":372,"demandHappiness":372,"money_24h":21500},"TomorrowEra":{"population":419,"demandHappiness":419,"money_24h":24900},"FutureEra":{"population":469,"demandHappiness":469,"money_24h":28600},"ArcticFuture":{"population":520,"demandHappiness":520,"money_24h":32500},"OceanicFuture":{"population":573,"demandHappiness":573,"money_24h":36600},"VirtualFuture":{"population":627,"demandHappiness":627,"money_24h":41000},"SpaceAgeMars":{"population":993,"demandHappiness":993,"money_24h":68500},"SpaceAgeAsteroidBelt":{"population":1078,"demandHappiness":1078,"money_24h":75900},"SpaceAgeVenus":{"population":1166,"demandHappiness":1166,"money_24h":83600},"SpaceAgeJupiterMoon":{"population":1255,"demandHappiness":1255,"money_24h":91800},"SpaceAgeTitan":{"population":1346,"demandHappiness":1346,"money_24h":100300},"SpaceAgeSpaceHub":{"population":1440,"demandHappiness":1440,"money_24h":109300}} },
+    "R_MultiAge_SportBonus19j": { prod: {"BronzeAge":{"population":119,"demandHappiness":119,"money_24h":800},"IronAge":{"population":255,"demandHappiness":255,"money_24h":1900},"EarlyMiddleAge":{"population":392,"demandHappiness":392,"money_24h":3200},"HighMiddleAge":{"population":550,"demandHappiness":550,"money_24h":4500},"LateMiddleAge":{"population":722,"demandHappiness":722,"money_24h":5900},"ColonialAge":{"population":911,"demandHappiness":911,"money_24h":9000},"IndustrialAge":{"population":1113,"demandHappiness":1113,"money_24h":11200},"ProgressiveEra":{"population":1329,"demandHappiness":1329,"money_24h":13600},"ModernEra":{"population":1558,"demandHappiness":1558,"money_24h":17000},"PostModernEra":{"population":1795,"demandHappiness":1795,"money_24h":21300},"ContemporaryEra":{"population":2046,"demandHappiness":2046,"money_24h":27800},"TomorrowEra":{"population":2306,"demandHappiness":2306,"money_24h":32200},"FutureEra":{"population":2578,"demandHappiness":2578,"money_24h":36900},"ArcticFuture":{"population":2860,"demandHappiness":2860,"money_24h":41900},"OceanicFuture":{"population":3150,"demandHappiness":3150,"money_24h":47200},"VirtualFuture":{"population":3450,"demandHappiness":3450,"money_24h":52900},"SpaceAgeMars":{"population":5460,"demandHappiness":5460,"money_24h":88400},"SpaceAgeAsteroidBelt":{"population":5931,"demandHappiness":5931,"money_24h":97900},"SpaceAgeVenus":{"population":6411,"demandHappiness":6411,"money_24h":107900},"SpaceAgeJupiterMoon":{"population":6904,"demandHappiness":6904,"money_24h":118400},"SpaceAgeTitan":{"population":7405,"demandHappiness":7405,"money_24h":129500},"SpaceAgeSpaceHub":{"population":7920,"demandHappiness":7920,"money_24h":141000}} },
+    "R_MultiAge_SportBonus19b": { prod: {"BronzeAge":{"population":32,"demandHappiness":32,"money_24h":600},"IronAge":{"population":70,"demandHappiness":70,"money_24h":1500},"EarlyMiddleAge":{"population":107,"demandHappiness":107,"money_24h":2600},"HighMiddleAge":{"population":150,"demandHappiness":150,"money_24h":3600},"LateMiddleAge":{"population":197,"demandHappiness":197,"money_24h":4700},"ColonialAge":{"population":248,"demandHappiness":248,"money_24h":7200},"IndustrialAge":{"population":304,"demandHappiness":304,"money_24h":9000},"ProgressiveEra":{"population":362,"demandHappiness":362,"money_24h":10900},"ModernEra":{"population":425,"demandHappiness":425,"money_24h":13600},"PostModernEra":{"population":490,"demandHappiness":490,"money_24h":17100},"ContemporaryEra":{"population":558,"demandHappiness":558,"money_24h":22200},"TomorrowEra":{"population":629,"demandHappiness":629,"money_24h":25700},"FutureEra":{"population":703,"demandHappiness":703,"money_24h":29500},"ArcticFuture":{"population":780,"demandHappiness":780,"money_24h":33500},"OceanicFuture":{"population":859,"demandHappiness":859,"money_24h":37800},"VirtualFuture":{"population":941,"demandHappiness":941,"money_24h":42300},"SpaceAgeMars":{"population":1489,"demandHappiness":1489,"money_24h":70700},"SpaceAgeAsteroidBelt":{"population":1618,"demandHappiness":1618,"money_24h":78300},"SpaceAgeVenus":{"population":1748,"demandHappiness":1748,"money_24h":86300},"SpaceAgeJupiterMoon":{"population":1883,"demandHappiness":1883,"money_24h":94700},"SpaceAgeTitan":{"population":2020,"demandHappiness":2020,"money_24h":103600},"SpaceAgeSpaceHub":{"population":2160,"demandHappiness":2160,"money_24h":112800}} },
+    "R_MultiAge_SportBonus19c": { prod: {"BronzeAge":{"population":43,"demandHappiness":43,"money_24h":700},"IronAge":{"population":93,"demandHappiness":93,"money_24h":1600},"EarlyMiddleAge":{"population":142,"demandHappiness":142,"money_24h":2600},"HighMiddleAge":{"population":200,"demandHappiness":200,"money_24h":3700},"LateMiddleAge":{"population":262,"demandHappiness":262,"money_24h":4900},"ColonialAge":{"population":331,"demandHappiness":331,"money_24h":7400},"IndustrialAge":{"population":405,"demandHappiness":405,"money_24h":9300},"ProgressiveEra":{"population":483,"demandHappiness":483,"money_24h":11300},"ModernEra":{"population":566,"demandHappiness":566,"money_24h":14000},"PostModernEra":{"population":653,"demandHappiness":653,"money_24h":17600},"ContemporaryEra":{"population":744,"demandHappiness":744,"money_24h":22900},"TomorrowEra":{"population":838,"demandHappiness":838,"money_24h":26500},"FutureEra":{"population":938,"demandHappiness":938,"money_24h":30400},"ArcticFuture":{"population":1040,"demandHappiness":1040,"money_24h":34600},"OceanicFuture":{"population":1146,"demandHappiness":1146,"money_24h":39000},"VirtualFuture":{"population":1254,"demandHappiness":1254,"money_24h":43700},"SpaceAgeMars":{"population":1986,"demandHappiness":1986,"money_24h":72900},"SpaceAgeAsteroidBelt":{"population":2157,"demandHappiness":2157,"money_24h":80800},"SpaceAgeVenus":{"population":2331,"demandHappiness":2331,"money_24h":89000},"SpaceAgeJupiterMoon":{"population":2510,"demandHappiness":2510,"money_24h":97700},"SpaceAgeTitan":{"population":2693,"demandHappiness":2693,"money_24h":106800},"SpaceAgeSpaceHub":{"population":2880,"demandHappiness":2880,"money_24h":116400}} },
+    "R_MultiAge_SportBonus19d": { prod: {"BronzeAge":{"population":54,"demandHappiness":54,"money_24h":700},"IronAge":{"population":116,"demandHappiness":116,"money_24h":1600},"EarlyMiddleAge":{"population":178,"demandHappiness":178,"money_24h":2700},"HighMiddleAge":{"population":250,"demandHappiness":250,"money_24h":3800},"LateMiddleAge":{"population":328,"demandHappiness":328,"money_24h":5000},"ColonialAge":{"population":414,"demandHappiness":414,"money_24h":7700},"IndustrialAge":{"population":506,"demandHappiness":506,"money_24h":9600},"ProgressiveEra":{"population":604,"demandHappiness":604,"money_24h":11600},"ModernEra":{"population":708,"demandHappiness":708,"money_24h":14400},"PostModernEra":{"population":816,"demandHappiness":816,"money_24h":18100},"ContemporaryEra":{"population":930,"demandHappiness":930,"money_24h":23600},"TomorrowEra":{"population":1048,"demandHappiness":1048,"money_24h":27300},"FutureEra":{"population":1172,"demandHappiness":1172,"money_24h":31300},"ArcticFuture":{"population":1300,"demandHappiness":1300,"money_24h":35600},"OceanicFuture":{"population":1432,"demandHappiness":1432,"money_24h":40200},"VirtualFuture":{"population":1568,"demandHappiness":1568,"money_24h":45000},"SpaceAgeMars":{"population":2482,"demandHappiness":2482,"money_24h":75100},"SpaceAgeAsteroidBelt":{"population":2696,"demandHappiness":2696,"money_24h":83200},"SpaceAgeVenus":{"population":2914,"demandHappiness":2914,"money_24h":91700},"SpaceAgeJupiterMoon":{"population":3138,"demandHappiness":3138,"money_24h":100700},"SpaceAgeTitan":{"population":3366,"demandHappiness":3366,"money_24h":110100},"SpaceAgeSpaceHub":{"population":3600,"demandHappiness":3600,"money_24h":119900}} },
+    "R_MultiAge_SportBonus19e": { prod: {"BronzeAge":{"population":65,"demandHappiness":65,"money_24h":700},"IronAge":{"population":139,"demandHappiness":139,"money_24h":1700},"EarlyMiddleAge":{"population":214,"demandHappiness":214,"money_24h":2800},"HighMiddleAge":{"population":300,"demandHappiness":300,"money_24h":3900},"LateMiddleAge":{"population":394,"demandHappiness":394,"money_24h":5200},"ColonialAge":{"population":497,"demandHappiness":497,"money_24h":7900},"IndustrialAge":{"population":607,"demandHappiness":607,"money_24h":9800},"ProgressiveEra":{"population":725,"demandHappiness":725,"money_24h":11900},"ModernEra":{"population":850,"demandHappiness":850,"money_24h":14800},"PostModernEra":{"population":979,"demandHappiness":979,"money_24h":18700},"ContemporaryEra":{"population":1116,"demandHappiness":1116,"money_24h":24300},"TomorrowEra":{"population":1258,"demandHappiness":1258,"money_24h":28100},"FutureEra":{"population":1406,"demandHappiness":1406,"money_24h":32300},"ArcticFuture":{"population":1560,"demandHappiness":1560,"money_24h":36700},"OceanicFuture":{"population":1718,"demandHappiness":1718,"money_24h":41300},"VirtualFuture":{"population":1882,"demandHappiness":1882,"money_24h":46300},"SpaceAgeMars":{"population":2978,"demandHappiness":2978,"money_24h":77300},"SpaceAgeAsteroidBelt":{"population":3235,"demandHappiness":3235,"money_24h":85700},"SpaceAgeVenus":{"population":3497,"demandHappiness":3497,"money_24h":94400},"SpaceAgeJupiterMoon":{"population":3766,"demandHappiness":3766,"money_24h":103600},"SpaceAgeTitan":{"population":4039,"demandHappiness":4039,"money_24h":113300},"SpaceAgeSpaceHub":{"population":4320,"demandHappiness":4320,"money_24h":123400}} },
+    "R_MultiAge_SportBonus19f": { prod: {"BronzeAge":{"population":76,"demandHappiness":76,"money_24h":700},"IronAge":{"population":162,"demandHappiness":162,"money_24h":1700},"EarlyMiddleAge":{"population":249,"demandHappiness":249,"money_24h":2900},"HighMiddleAge":{"population":350,"demandHappiness":350,"money_24h":4000},"LateMiddleAge":{"population":459,"demandHappiness":459,"money_24h":5300},"ColonialAge":{"population":580,"demandHappiness":580,"money_24h":8100},"IndustrialAge":{"population":708,"demandHappiness":708,"money_24h":10100},"ProgressiveEra":{"population":846,"demandHappiness":846,"money_24h":12300},"ModernEra":{"population":991,"demandHappiness":991,"money_24h":15300},"PostModernEra":{"population":1142,"demandHappiness":1142,"money_24h":19200},"ContemporaryEra":{"population":1302,"demandHappiness":1302,"money_24h":25000},"TomorrowEra":{"population":1467,"demandHappiness":1467,"money_24h":28900},"FutureEra":{"population":1641,"demandHappiness":1641,"money_24h":33200},"ArcticFuture":{"population":1820,"demandHappiness":1820,"money_24h":37700},"OceanicFuture":{"population":2005,"demandHappiness":2005,"money_24h":42500},"VirtualFuture":{"population":2195,"demandHappiness":2195,"money_24h":47600},"SpaceAgeMars":{"population":3475,"demandHappiness":3475,"money_24h":79500},"SpaceAgeAsteroidBelt":{"population":3774,"demandHappiness":3774,"money_24h":88100},"SpaceAgeVenus":{"population":4080,"demandHappiness":4080,"money_24h":97100},"SpaceAgeJupiterMoon":{"population":4393,"demandHappiness":4393,"money_24h":106600},"SpaceAgeTitan":{"population":4712,"demandHappiness":4712,"money_24h":116500},"SpaceAgeSpaceHub":{"population":5040,"demandHappiness":5040,"money_24h":126900}} },
+    "R_MultiAge_SportBonus19g": { prod: {"BronzeAge":{"population":86,"demandHappiness":86,"money_24h":700},"IronAge":{"population":186,"demandHappiness":186,"money_24h":1800},"EarlyMiddleAge":{"population":285,"demandHappiness":285,"money_24h":3000},"HighMiddleAge":{"population":400,"demandHappiness":400,"money_24h":4100},"LateMiddleAge":{"population":525,"demandHappiness":525,"money_24h":5500},"ColonialAge":{"population":662,"demandHappiness":662,"money_24h":8300},"IndustrialAge":{"population":810,"demandHappiness":810,"money_24h":10400},"ProgressiveEra":{"population":966,"demandHappiness":966,"money_24h":12600},"ModernEra":{"population":1133,"demandHappiness":1133,"money_24h":15700},"PostModernEra":{"population":1306,"demandHappiness":1306,"money_24h":19700},"ContemporaryEra":{"population":1488,"demandHappiness":1488,"money_24h":25700},"TomorrowEra":{"population":1677,"demandHappiness":1677,"money_24h":29800},"FutureEra":{"population":1875,"demandHappiness":1875,"money_24h":34100},"ArcticFuture":{"population":2080,"demandHappiness":2080,"money_24h":38800},"OceanicFuture":{"population":2291,"demandHappiness":2291,"money_24h":43700},"VirtualFuture":{"population":2509,"demandHappiness":2509,"money_24h":48900},"SpaceAgeMars":{"population":3971,"demandHappiness":3971,"money_24h":81700},"SpaceAgeAsteroidBelt":{"population":4314,"demandHappiness":4314,"money_24h":90500},"SpaceAgeVenus":{"population":4662,"demandHappiness":4662,"money_24h":99800},"SpaceAgeJupiterMoon":{"population":5021,"demandHappiness":5021,"money_24h":109500},"SpaceAgeTitan":{"population":5386,"demandHappiness":5386,"money_24h":119800},"SpaceAgeSpaceHub":{"population":5760,"demandHappiness":5760,"money_24h":130500}} },
+    "R_MultiAge_SportBonus19h": { prod: {"BronzeAge":{"population":97,"demandHappiness":97,"money_24h":800},"IronAge":{"population":209,"demandHappiness":209,"money_24h":1800},"EarlyMiddleAge":{"population":320,"demandHappiness":320,"money_24h":3000},"HighMiddleAge":{"population":450,"demandHappiness":450,"money_24h":4300},"LateMiddleAge":{"population":590,"demandHappiness":590,"money_24h":5600},"ColonialAge":{"population":745,"demandHappiness":745,"money_24h":8600},"IndustrialAge":{"population":911,"demandHappiness":911,"money_24h":10700},"ProgressiveEra":{"population":1087,"demandHappiness":1087,"money_24h":13000},"ModernEra":{"population":1274,"demandHappiness":1274,"money_24h":16100},"PostModernEra":{"population":1469,"demandHappiness":1469,"money_24h":20300},"ContemporaryEra":{"population":1674,"demandHappiness":1674,"money_24h":26400},"TomorrowEra":{"population":1886,"demandHappiness":1886,"money_24h":30600},"FutureEra":{"population":2110,"demandHappiness":2110,"money_24h":35000},"ArcticFuture":{"population":2340,"demandHappiness":2340,"money_24h":39800},"OceanicFuture":{"population":2578,"demandHappiness":2578,"money_24h":44900},"VirtualFuture":{"population":2822,"demandHappiness":2822,"money_24h":50300},"SpaceAgeMars":{"population":4468,"demandHappiness":4468,"money_24h":84000},"SpaceAgeAsteroidBelt":{"population":4853,"demandHappiness":4853,"money_24h":93000},"SpaceAgeVenus":{"population":5245,"demandHappiness":5245,"money_24h":102500},"SpaceAgeJupiterMoon":{"population":5648,"demandHappiness":5648,"money_24h":112500},"SpaceAgeTitan":{"population":6059,"demandHappiness":6059,"money_24h":123000},"SpaceAgeSpaceHub":{"population":6480,"demandHappiness":6480,"money_24h":134000}} },
+    "R_MultiAge_SportBonus19i": { prod: {"BronzeAge":{"population":108,"demandHappiness":108,"money_24h":800},"IronAge":{"population":232,"demandHappiness":232,"money_24h":1900},"EarlyMiddleAge":{"population":356,"demandHappiness":356,"money_24h":3100},"HighMiddleAge":{"population":500,"demandHappiness":500,"money_24h":4400},"LateMiddleAge":{"population":656,"demandHappiness":656,"money_24h":5800},"ColonialAge":{"population":828,"demandHappiness":828,"money_24h":8800},"IndustrialAge":{"population":1012,"demandHappiness":1012,"money_24h":11000},"ProgressiveEra":{"population":1208,"demandHappiness":1208,"money_24h":13300},"ModernEra":{"population":1416,"demandHappiness":1416,"money_24h":16500},"PostModernEra":{"population":1632,"demandHappiness":1632,"money_24h":20800},"ContemporaryEra":{"population":1860,"demandHappiness":1860,"money_24h":27100},"TomorrowEra":{"population":2096,"demandHappiness":2096,"money_24h":31400},"FutureEra":{"population":2344,"demandHappiness":2344,"money_24h":35900},"ArcticFuture":{"population":2600,"demandHappiness":2600,"money_24h":40800},"OceanicFuture":{"population":2864,"demandHappiness":2864,"money_24h":46100},"VirtualFuture":{"population":3136,"demandHappiness":3136,"money_24h":51600},"SpaceAgeMars":{"population":4964,"demandHappiness":4964,"money_24h":86200},"SpaceAgeAsteroidBelt":{"population":5392,"demandHappiness":5392,"money_24h":95400},"SpaceAgeVenus":{"population":5828,"demandHappiness":5828,"money_24h":105200},"SpaceAgeJupiterMoon":{"population":6276,"demandHappiness":6276,"money_24h":115500},"SpaceAgeTitan":{"population":6732,"demandHappiness":6732,"money_24h":126200},"SpaceAgeSpaceHub":{"population":7200,"demandHappiness":7200,"money_24h":137500}} },
+    "D_MultiAge_Expedition22Feathers": { prod: {"BronzeAge":{"happiness":130},"IronAge":{"happiness":190},"EarlyMiddleAge":{"happiness":220},"HighMiddleAge":{"happiness":280},"LateMiddleAge":{"happiness":320},"ColonialAge":{"happiness":380},"IndustrialAge":{"happiness":420},"ProgressiveEra":{"happiness":470},"ModernEra":{"happiness":530},"PostModernEra":{"happiness":610},"ContemporaryEra":{"happiness":710},"TomorrowEra":{"happiness":880},"FutureEra":{"happiness":1050},"ArcticFuture":{"happiness":1190},"OceanicFuture":{"happiness":1340},"VirtualFuture":{"happiness":1690},"SpaceAgeMars":{"happiness":2630},"SpaceAgeAsteroidBelt":{"happiness":2860},"SpaceAgeVenus":{"happiness":3090},"SpaceAgeJupiterMoon":{"happiness":3330},"SpaceAgeTitan":{"happiness":3570},"SpaceAgeSpaceHub":{"happiness":3820}} },
+    "D_MultiAge_Expedition22Spikes": { prod: {"BronzeAge":{"happiness":130},"IronAge":{"happiness":190},"EarlyMiddleAge":{"happiness":220},"HighMiddleAge":{"happiness":280},"LateMiddleAge":{"happiness":320},"ColonialAge":{"happiness":380},"IndustrialAge":{"happiness":420},"ProgressiveEra":{"happiness":470},"ModernEra":{"happiness":530},"PostModernEra":{"happiness":610},"ContemporaryEra":{"happiness":710},"TomorrowEra":{"happiness":880},"FutureEra":{"happiness":1050},"ArcticFuture":{"happiness":1190},"OceanicFuture":{"happiness":1340},"VirtualFuture":{"happiness":1690},"SpaceAgeMars":{"happiness":2630},"SpaceAgeAsteroidBelt":{"happiness":2860},"SpaceAgeVenus":{"happiness":3090},"SpaceAgeJupiterMoon":{"happiness":3330},"SpaceAgeTitan":{"happiness":3570},"SpaceAgeSpaceHub":{"happiness":3820}} },
+    "D_MultiAge_Expedition22Scales": { prod: {"BronzeAge":{"happiness":130},"IronAge":{"happiness":190},"EarlyMiddleAge":{"happiness":220},"HighMiddleAge":{"happiness":280},"LateMiddleAge":{"happiness":320},"ColonialAge":{"happiness":380},"IndustrialAge":{"happiness":420},"ProgressiveEra":{"happiness":470},"ModernEra":{"happiness":530},"PostModernEra":{"happiness":610},"ContemporaryEra":{"happiness":710},"TomorrowEra":{"happiness":880},"FutureEra":{"happiness":1050},"ArcticFuture":{"happiness":1190},"OceanicFuture":{"happiness":1340},"VirtualFuture":{"happiness":1690},"SpaceAgeMars":{"happiness":2630},"SpaceAgeAsteroidBelt":{"happiness":2860},"SpaceAgeVenus":{"happiness":3090},"SpaceAgeJupiterMoon":{"happiness":3330},"SpaceAgeTitan":{"happiness":3570},"SpaceAgeSpaceHub":{"happiness":3820}} },
+    "R_MultiAge_HalloweenBonus4": { prod: {"BronzeAge":{"happiness":-90,"money_24h":550},"IronAge":{"happiness":-160,"money_24h":1080},"EarlyMiddleAge":{"happiness":-170,"money_24h":1800},"HighMiddleAge":{"happiness":-190,"money_24h":2520},"LateMiddleAge":{"happiness":-210,"money_24h":3330},"ColonialAge":{"happiness":-250,"money_24h":5070},"IndustrialAge":{"happiness":-280,"money_24h":6320},"ProgressiveEra":{"happiness":-310,"money_24h":9370},"ModernEra":{"happiness":-330,"money_24h":11660},"PostModernEra":{"happiness":-350,"money_24h":14670},"ContemporaryEra":{"happiness":-400,"money_24h":19100},"TomorrowEra":{"happiness":-500,"money_24h":22220},"FutureEra":{"happiness":-600,"money_24h":25550},"ArcticFuture":{"happiness":-680,"money_24h":28800},"OceanicFuture":{"happiness":-790,"money_24h":32470},"VirtualFuture":{"happiness":-940,"money_24h":36370},"SpaceAgeMars":{"happiness":-1510,"money_24h":60750},"SpaceAgeAsteroidBelt":{"happiness":-1640,"money_24h":67290},"SpaceAgeVenus":{"happiness":-1770,"money_24h":74180},"SpaceAgeJupiterMoon":{"happiness":-1900,"money_24h":81420},"SpaceAgeTitan":{"happiness":-2040,"money_24h":89010},"SpaceAgeSpaceHub":{"happiness":-2180,"money_24h":96960}} },
+    "A_MultiAge_ArcheologyBonus19": { prod: {"BronzeAge":{"happiness":300},"IronAge":{"happiness":420},"EarlyMiddleAge":{"happiness":540},"HighMiddleAge":{"happiness":650},"LateMiddleAge":{"happiness":770},"ColonialAge":{"happiness":900},"IndustrialAge":{"happiness":1020},"ProgressiveEra":{"happiness":1120},"ModernEra":{"happiness":1270},"PostModernEra":{"happiness":1440},"ContemporaryEra":{"happiness":1630},"TomorrowEra":{"happiness":1980},"FutureEra":{"happiness":2640},"ArcticFuture":{"happiness":3220},"OceanicFuture":{"happiness":4080},"VirtualFuture":{"happiness":5500},"SpaceAgeMars":{"happiness":8810},"SpaceAgeAsteroidBelt":{"happiness":9570},"SpaceAgeVenus":{"happiness":10340},"SpaceAgeJupiterMoon":{"happiness":11140},"SpaceAgeTitan":{"happiness":11950},"SpaceAgeSpaceHub":{"happiness":12780}} },
+    "D_MultiAge_ArcheologyBonus22c": { prod: {"BronzeAge":{"happiness":220},"IronAge":{"happiness":330},"EarlyMiddleAge":{"happiness":390},"HighMiddleAge":{"happiness":460},"LateMiddleAge":{"happiness":540},"ColonialAge":{"happiness":640},"IndustrialAge":{"happiness":720},"ProgressiveEra":{"happiness":790},"ModernEra":{"happiness":850},"PostModernEra":{"happiness":880},"ContemporaryEra":{"happiness":1030},"TomorrowEra":{"happiness":1250},"FutureEra":{"happiness":1580},"ArcticFuture":{"happiness":1840},"OceanicFuture":{"happiness":2240},"VirtualFuture":{"happiness":2820},"SpaceAgeMars":{"happiness":4520},"SpaceAgeAsteroidBelt":{"happiness":5150},"SpaceAgeVenus":{"happiness":5830},"SpaceAgeJupiterMoon":{"happiness":6570},"SpaceAgeTitan":{"happiness":7350},"SpaceAgeSpaceHub":{"happiness":8190}} },
+    "D_MultiAge_MarketingBonus1": { prod: {"BronzeAge":{"happiness":35},"IronAge":{"happiness":61},"EarlyMiddleAge":{"happiness":67},"HighMiddleAge":{"happiness":75},"LateMiddleAge":{"happiness":84},"ColonialAge":{"happiness":98},"IndustrialAge":{"happiness":111},"ProgressiveEra":{"happiness":122},"ModernEra":{"happiness":130},"PostModernEra":{"happiness":136},"ContemporaryEra":{"happiness":158},"TomorrowEra":{"happiness":192},"FutureEra":{"happiness":230},"ArcticFuture":{"happiness":267},"OceanicFuture":{"happiness":308},"VirtualFuture":{"happiness":369},"SpaceAgeMars":{"happiness":590},"SpaceAgeAsteroidBelt":{"happiness":641},"SpaceAgeVenus":{"happiness":692},"SpaceAgeJupiterMoon":{"happiness":746},"SpaceAgeTitan":{"happiness":800},"SpaceAgeSpaceHub":{"happiness":856}} },
+    "D_MultiAge_RankingFix16d": { prod: {"BronzeAge":{"happiness":79},"IronAge":{"happiness":136},"EarlyMiddleAge":{"happiness":150},"HighMiddleAge":{"happiness":168},"LateMiddleAge":{"happiness":187},"ColonialAge":{"happiness":220},"IndustrialAge":{"happiness":248},"ProgressiveEra":{"happiness":272},"ModernEra":{"happiness":291},"PostModernEra":{"happiness":303},"ContemporaryEra":{"happiness":353},"TomorrowEra":{"happiness":428},"FutureEra":{"happiness":513},"ArcticFuture":{"happiness":597},"OceanicFuture":{"happiness":689},"VirtualFuture":{"happiness":823},"SpaceAgeMars":{"happiness":1317},"SpaceAgeAsteroidBelt":{"happiness":1432},"SpaceAgeVenus":{"happiness":1547},"SpaceAgeJupiterMoon":{"happiness":1666},"SpaceAgeTitan":{"happiness":1787},"SpaceAgeSpaceHub":{"happiness":1911}} },
+    "P_MultiAge_ChristmasBonus15": { prod: {"BronzeAge":{"happiness":150},"IronAge":{"happiness":260},"EarlyMiddleAge":{"happiness":290},"HighMiddleAge":{"happiness":320},"LateMiddleAge":{"happiness":360},"ColonialAge":{"happiness":420},"IndustrialAge":{"happiness":480},"ProgressiveEra":{"happiness":520},"ModernEra":{"happiness":560},"PostModernEra":{"happiness":590},"ContemporaryEra":{"happiness":680},"TomorrowEra":{"happiness":830},"FutureEra":{"happiness":990},"ArcticFuture":{"happiness":1150},"OceanicFuture":{"happiness":1330},"VirtualFuture":{"happiness":1590},"SpaceAgeMars":{"happiness":2540},"SpaceAgeAsteroidBelt":{"happiness":2760},"SpaceAgeVenus":{"happiness":2980},"SpaceAgeJupiterMoon":{"happiness":3210},"SpaceAgeTitan":{"happiness":3450},"SpaceAgeSpaceHub":{"happiness":3690}} },
+    "A_MultiAge_HalloweenBonus15": { prod: {"BronzeAge":{"happiness":1000},"IronAge":{"happiness":1400},"EarlyMiddleAge":{"happiness":1930},"HighMiddleAge":{"happiness":2160},"LateMiddleAge":{"happiness":2400},"ColonialAge":{"happiness":2830},"IndustrialAge":{"happiness":3190},"ProgressiveEra":{"happiness":3500},"ModernEra":{"happiness":3740},"PostModernEra":{"happiness":3900},"ContemporaryEra":{"happiness":4530},"TomorrowEra":{"happiness":5500},"FutureEra":{"happiness":6590},"ArcticFuture":{"happiness":7680},"OceanicFuture":{"happiness":8860},"VirtualFuture":{"happiness":10580},"SpaceAgeMars":{"happiness":16940},"SpaceAgeAsteroidBelt":{"happiness":18410},"SpaceAgeVenus":{"happiness":19880},"SpaceAgeJupiterMoon":{"happiness":21420},"SpaceAgeTitan":{"happiness":22970},"SpaceAgeSpaceHub":{"happiness":24570}} },
+    "D_MultiAge_CupBonus16b": { prod: {"BronzeAge":{"happiness":65},"IronAge":{"happiness":101},"EarlyMiddleAge":{"happiness":112},"HighMiddleAge":{"happiness":125},"LateMiddleAge":{"happiness":139},"ColonialAge":{"happiness":163},"IndustrialAge":{"happiness":184},"ProgressiveEra":{"happiness":202},"ModernEra":{"happiness":216},"PostModernEra":{"happiness":225},"ContemporaryEra":{"happiness":262},"TomorrowEra":{"happiness":318},"FutureEra":{"happiness":381},"ArcticFuture":{"happiness":444},"OceanicFuture":{"happiness":512},"VirtualFuture":{"happiness":612},"SpaceAgeMars":{"happiness":979},"SpaceAgeAsteroidBelt":{"happiness":1063},"SpaceAgeVenus":{"happiness":1149},"SpaceAgeJupiterMoon":{"happiness":1238},"SpaceAgeTitan":{"happiness":1327},"SpaceAgeSpaceHub":{"happiness":1420}} },
+    "P_MultiAge_SummerBonus16": { prod: {"BronzeAge":{"happiness":203},"IronAge":{"happiness":233},"EarlyMiddleAge":{"happiness":266},"HighMiddleAge":{"happiness":297},"LateMiddleAge":{"happiness":331},"ColonialAge":{"happiness":389},"IndustrialAge":{"happiness":439},"ProgressiveEra":{"happiness":482},"ModernEra":{"happiness":516},"PostModernEra":{"happiness":538},"ContemporaryEra":{"happiness":625},"TomorrowEra":{"happiness":758},"FutureEra":{"happiness":908},"ArcticFuture":{"happiness":1058},"OceanicFuture":{"happiness":1221},"VirtualFuture":{"happiness":1458},"SpaceAgeMars":{"happiness":2333},"SpaceAgeAsteroidBelt":{"happiness":2536},"SpaceAgeVenus":{"happiness":2740},"SpaceAgeJupiterMoon":{"happiness":2951},"SpaceAgeTitan":{"happiness":3165},"SpaceAgeSpaceHub":{"happiness":3386}} },
+    "R_MultiAge_WinterBonus20fLussebullar": { prod: {"BronzeAge":{"happiness":1170,"population":216,"demandHappiness":216,"money_24h":1600},"IronAge":{"happiness":2020,"population":464,"demandHappiness":464,"money_24h":3700},"EarlyMiddleAge":{"happiness":2230,"population":712,"demandHappiness":712,"money_24h":6200},"HighMiddleAge":{"happiness":2490,"population":1000,"demandHappiness":1000,"money_24h":8700},"LateMiddleAge":{"happiness":2780,"population":1312,"demandHappiness":1312,"money_24h":11500},"ColonialAge":{"happiness":3270,"population":1656,"demandHappiness":1656,"money_24h":17500},"IndustrialAge":{"happiness":3680,"population":2024,"demandHappiness":2024,"money_24h":21800},"ProgressiveEra":{"happiness":4040,"population":2416,"demandHappiness":2416,"money_24h":26400},"ModernEra":{"happiness":4330,"population":2832,"demandHappiness":2832,"money_24h":32900},"PostModernEra":{"happiness":4510,"population":3264,"demandHappiness":3264,"money_24h":41300},"ContemporaryEra":{"happiness":5240,"population":3720,"demandHappiness":3720,"money_24h":53800},"TomorrowEra":{"happiness":6360,"population":4192,"demandHappiness":4192,"money_24h":62300},"FutureEra":{"happiness":7620,"population":4688,"demandHappiness":4688,"money_24h":71400},"ArcticFuture":{"happiness":8870,"population":5200,"demandHappiness":5200,"money_24h":81200},"OceanicFuture":{"happiness":10240,"population":5728,"demandHappiness":5728,"money_24h":91500},"VirtualFuture":{"happiness":12230,"population":6272,"demandHappiness":6272,"money_24h":102500},"SpaceAgeMars":{"happiness":19570,"population":9928,"demandHappiness":9928,"money_24h":171200},"SpaceAgeAsteroidBelt":{"happiness":21270,"population":10784,"demandHappiness":10784,"money_24h":189600},"SpaceAgeVenus":{"happiness":22980,"population":11656,"demandHappiness":11656,"money_24h":209100},"SpaceAgeJupiterMoon":{"happiness":24750,"population":12552,"demandHappiness":12552,"money_24h":229500},"SpaceAgeTitan":{"happiness":26550,"population":13464,"demandHappiness":13464,"money_24h":250900},"SpaceAgeSpaceHub":{"happiness":28400,"population":14400,"demandHappiness":14400,"money_24h":273300}} },
+    "R_MultiAge_WinterBonus20fPatisserie": { prod: {"BronzeAge":{"happiness":1170,"population":216,"demandHappiness":216,"money_24h":1600},"IronAge":{"happiness":2020,"population":464,"demandHappiness":464,"money_24h":3700},"EarlyMiddleAge":{"happiness":2230,"population":712,"demandHappiness":712,"money_24h":6200},"HighMiddleAge":{"happiness":2490,"population":1000,"demandHappiness":1000,"money_24h":8700},"LateMiddleAge":{"happiness":2780,"population":1312,"demandHappiness":1312,"money_24h":11500},"ColonialAge":{"happiness":3270,"population":1656,"demandHappiness":1656,"money_24h":17500},"IndustrialAge":{"happiness":3680,"population":2024,"demandHappiness":2024,"money_24h":21800},"ProgressiveEra":{"happiness":4040,"population":2416,"demandHappiness":2416,"money_24h":26400},"ModernEra":{"happiness":4330,"population":2832,"demandHappiness":2832,"money_24h":32900},"PostModernEra":{"happiness":4510,"population":3264,"demandHappiness":3264,"money_24h":41300},"ContemporaryEra":{"happiness":5240,"population":3720,"demandHappiness":3720,"money_24h":53800},"TomorrowEra":{"happiness":6360,"population":4192,"demandHappiness":4192,"money_24h":62300},"FutureEra":{"happiness":7620,"population":4688,"demandHappiness":4688,"money_24h":71400},"ArcticFuture":{"happiness":8870,"population":5200,"demandHappiness":5200,"money_24h":81200},"OceanicFuture":{"happiness":10240,"population":5728,"demandHappiness":5728,"money_24h":91500},"VirtualFuture":{"happiness":12230,"population":6272,"demandHappiness":6272,"money_24h":102500},"SpaceAgeMars":{"happiness":19570,"population":9928,"demandHappiness":9928,"money_24h":171200},"SpaceAgeAsteroidBelt":{"happiness":21270,"population":10784,"demandHappiness":10784,"money_24h":189600},"SpaceAgeVenus":{"happiness":22980,"population":11656,"demandHappiness":11656,"money_24h":209100},"SpaceAgeJupiterMoon":{"happiness":24750,"population":12552,"demandHappiness":12552,"money_24h":229500},"SpaceAgeTitan":{"happiness":26550,"population":13464,"demandHappiness":13464,"money_24h":250900},"SpaceAgeSpaceHub":{"happiness":28400,"population":14400,"demandHappiness":14400,"money_24h":273300}} },
+    "P_MultiAge_Aviary": { prod: {"BronzeAge":{"happiness":76},"IronAge":{"happiness":163},"EarlyMiddleAge":{"happiness":191},"HighMiddleAge":{"happiness":253},"LateMiddleAge":{"happiness":320},"ColonialAge":{"happiness":377},"IndustrialAge":{"happiness":425},"ProgressiveEra":{"happiness":467},"ModernEra":{"happiness":519},"PostModernEra":{"happiness":520},"ContemporaryEra":{"happiness":665},"TomorrowEra":{"happiness":807},"FutureEra":{"happiness":967},"ArcticFuture":{"happiness":1024},"OceanicFuture":{"happiness":1181},"VirtualFuture":{"happiness":1411},"SpaceAgeMars":{"happiness":2258},"SpaceAgeAsteroidBelt":{"happiness":2454},"SpaceAgeVenus":{"happiness":2651},"SpaceAgeJupiterMoon":{"happiness":2856},"SpaceAgeTitan":{"happiness":3063},"SpaceAgeSpaceHub":{"happiness":3276}} },
+    "D_MultiAge_HalloweenBonus1": { prod: {"BronzeAge":{"happiness":240},"IronAge":{"happiness":330},"EarlyMiddleAge":{"happiness":360},"HighMiddleAge":{"happiness":430},"LateMiddleAge":{"happiness":480},"ColonialAge":{"happiness":570},"IndustrialAge":{"happiness":640},"ProgressiveEra":{"happiness":720},"ModernEra":{"happiness":770},"PostModernEra":{"happiness":810},"ContemporaryEra":{"happiness":940},"TomorrowEra":{"happiness":1140},"FutureEra":{"happiness":1360},"ArcticFuture":{"happiness":1590},"OceanicFuture":{"happiness":1830},"VirtualFuture":{"happiness":2190},"SpaceAgeMars":{"happiness":3500},"SpaceAgeAsteroidBelt":{"happiness":3800},"SpaceAgeVenus":{"happiness":4110},"SpaceAgeJupiterMoon":{"happiness":4430},"SpaceAgeTitan":{"happiness":4750},"SpaceAgeSpaceHub":{"happiness":5080}} },
+    "R_MultiAge_WinterBonus20fMarzipan": { prod: {"BronzeAge":{"happiness":1170,"population":254,"demandHappiness":254,"money_24h":1600},"IronAge":{"happiness":2020,"population":545,"demandHappiness":545,"money_24h":3700},"EarlyMiddleAge":{"happiness":2230,"population":837,"demandHappiness":837,"money_24h":6200},"HighMiddleAge":{"happiness":2490,"population":1175,"demandHappiness":1175,"money_24h":8700},"LateMiddleAge":{"happiness":2780,"population":1542,"demandHappiness":1542,"money_24h":11500},"ColonialAge":{"happiness":3270,"population":1946,"demandHappiness":1946,"money_24h":17500},"IndustrialAge":{"happiness":3680,"population":2378,"demandHappiness":2378,"money_24h":21800},"ProgressiveEra":{"happiness":4040,"population":2839,"demandHappiness":2839,"money_24h":26400},"ModernEra":{"happiness":4330,"population":3328,"demandHappiness":3328,"money_24h":32900},"PostModernEra":{"happiness":4510,"population":3835,"demandHappiness":3835,"money_24h":41300},"ContemporaryEra":{"happiness":5240,"population":4371,"demandHappiness":4371,"money_24h":53800},"TomorrowEra":{"happiness":6360,"population":4926,"demandHappiness":4926,"money_24h":62300},"FutureEra":{"happiness":7620,"population":5508,"demandHappiness":5508,"money_24h":71400},"ArcticFuture":{"happiness":8870,"population":6110,"demandHappiness":6110,"money_24h":81200},"OceanicFuture":{"happiness":10240,"population":6730,"demandHappiness":6730,"money_24h":91500},"VirtualFuture":{"happiness":12230,"population":7370,"demandHappiness":7370,"money_24h":102500},"SpaceAgeMars":{"happiness":19570,"population":11665,"demandHappiness":11665,"money_24h":171200},"SpaceAgeAsteroidBelt":{"happiness":21270,"population":12671,"demandHappiness":12671,"money_24h":189600},"SpaceAgeVenus":{"happiness":22980,"population":13696,"demandHappiness":13696,"money_24h":209100},"SpaceAgeJupiterMoon":{"happiness":24750,"population":14749,"demandHappiness":14749,"money_24h":229500},"SpaceAgeTitan":{"happiness":26550,"population":15820,"demandHappiness":15820,"money_24h":250900},"SpaceAgeSpaceHub":{"happiness":28400,"population":16920,"demandHappiness":16920,"money_24h":273300}} },
+    "R_MultiAge_SummerBonus18": { prod: {"BronzeAge":{"population":22,"demandHappiness":22,"money_24h":400},"IronAge":{"population":46,"demandHappiness":46,"money_24h":900},"EarlyMiddleAge":{"population":71,"demandHappiness":71,"money_24h":1400},"HighMiddleAge":{"population":100,"demandHappiness":100,"money_24h":2000},"LateMiddleAge":{"population":131,"demandHappiness":131,"money_24h":2700},"ColonialAge":{"population":166,"demandHappiness":166,"money_24h":4100},"IndustrialAge":{"population":202,"demandHappiness":202,"money_24h":5100},"ProgressiveEra":{"population":242,"demandHappiness":242,"money_24h":6100},"ModernEra":{"population":283,"demandHappiness":283,"money_24h":7600},"PostModernEra":{"population":326,"demandHappiness":326,"money_24h":9600},"ContemporaryEra":{"population":372,"demandHappiness":372,"money_24h":12500},"TomorrowEra":{"population":419,"demandHappiness":419,"money_24h":14500},"FutureEra":{"population":469,"demandHappiness":469,"money_24h":16600},"ArcticFuture":{"population":520,"demandHappiness":520,"money_24h":18900},"OceanicFuture":{"population":573,"demandHappiness":573,"money_24h":21300},"VirtualFuture":{"population":627,"demandHappiness":627,"money_24h":23800},"SpaceAgeMars":{"population":993,"demandHappiness":993,"money_24h":39800},"SpaceAgeAsteroidBelt":{"population":1078,"demandHappiness":1078,"money_24h":44100},"SpaceAgeVenus":{"population":1166,"demandHappiness":1166,"money_24h":48600},"SpaceAgeJupiterMoon":{"population":1255,"demandHappiness":1255,"money_24h":53300},"SpaceAgeTitan":{"population":1346,"demandHappiness":1346,"money_24h":58300},"SpaceAgeSpaceHub":{"population":1440,"demandHappiness":1440,"money_24h":63500}} },
+    "D_MultiAge_InviteBonus1": { prod: {"BronzeAge":{"happiness":90},"IronAge":{"happiness":100},"EarlyMiddleAge":{"happiness":110},"HighMiddleAge":{"happiness":120},"LateMiddleAge":{"happiness":130},"ColonialAge":{"happiness":150},"IndustrialAge":{"happiness":170},"ProgressiveEra":{"happiness":190},"ModernEra":{"happiness":200},"PostModernEra":{"happiness":210},"ContemporaryEra":{"happiness":250},"TomorrowEra":{"happiness":300},"FutureEra":{"happiness":360},"ArcticFuture":{"happiness":420},"OceanicFuture":{"happiness":480},"VirtualFuture":{"happiness":580},"SpaceAgeMars":{"happiness":920},"SpaceAgeAsteroidBelt":{"happiness":1000},"SpaceAgeVenus":{"happiness":1080},"SpaceAgeJupiterMoon":{"happiness":1170},"SpaceAgeTitan":{"happiness":1250},"SpaceAgeSpaceHub":{"happiness":1340}} },
+    "R_MultiAge_SacajaweaBonus18": { prod: {"BronzeAge":{"population":150,"demandHappiness":150,"money_24h":1500},"IronAge":{"population":319,"demandHappiness":319,"money_24h":3300},"EarlyMiddleAge":{"population":490,"demandHappiness":490,"money_24h":5000},"HighMiddleAge":{"population":688,"demandHappiness":688,"money_24h":6440},"LateMiddleAge":{"population":902,"demandHappiness":902,"money_24h":7770},"ColonialAge":{"population":1139,"demandHappiness":1139,"money_24h":10710},"IndustrialAge":{"population":1392,"demandHappiness":1392,"money_24h":12290},"ProgressiveEra":{"population":1661,"demandHappiness":1661,"money_24h":14060},"ModernEra":{"population":1947,"demandHappiness":1947,"money_24h":17490},"PostModernEra":{"population":2244,"demandHappiness":2244,"money_24h":22000},"ContemporaryEra":{"population":2558,"demandHappiness":2558,"money_24h":28640},"TomorrowEra":{"population":2882,"demandHappiness":2882,"money_24h":33170},"FutureEra":{"population":3223,"demandHappiness":3223,"money_24h":37990},"ArcticFuture":{"population":3575,"demandHappiness":3575,"money_24h":43170},"OceanicFuture":{"population":3938,"demandHappiness":3938,"money_24h":50000},"VirtualFuture":{"population":4312,"demandHappiness":4312,"money_24h":56000},"SpaceAgeMars":{"population":6826,"demandHappiness":6826,"money_24h":93540},"SpaceAgeAsteroidBelt":{"population":7414,"demandHappiness":7414,"money_24h":103610},"SpaceAgeVenus":{"population":8014,"demandHappiness":8014,"money_24h":114210},"SpaceAgeJupiterMoon":{"population":8630,"demandHappiness":8630,"money_24h":125350},"SpaceAgeTitan":{"population":9257,"demandHappiness":9257,"money_24h":137050},"SpaceAgeSpaceHub":{"population":9900,"demandHappiness":9900,"money_24h":149280}} },
+    "R_MultiAge_SpringBonus20hMikawa": { prod: {"BronzeAge":{"happiness":1300,"population":308,"demandHappiness":308,"money_24h":2100},"IronAge":{"happiness":2240,"population":661,"demandHappiness":661,"money_24h":5000},"EarlyMiddleAge":{"happiness":2470,"population":1015,"demandHappiness":1015,"money_24h":8400},"HighMiddleAge":{"happiness":2760,"population":1425,"demandHappiness":1425,"money_24h":11800},"LateMiddleAge":{"happiness":3080,"population":1870,"demandHappiness":1870,"money_24h":15500},"ColonialAge":{"happiness":3620,"population":2360,"demandHappiness":2360,"money_24h":23700},"IndustrialAge":{"happiness":4080,"population":2884,"demandHappiness":2884,"money_24h":29500},"ProgressiveEra":{"happiness":4480,"population":3443,"demandHappiness":3443,"money_24h":35800},"ModernEra":{"happiness":4790,"population":4036,"demandHappiness":4036,"money_24h":44500},"PostModernEra":{"happiness":4990,"population":4651,"demandHappiness":4651,"money_24h":56000},"ContemporaryEra":{"happiness":5800,"population":5301,"demandHappiness":5301,"money_24h":72900},"TomorrowEra":{"happiness":7040,"population":5974,"demandHappiness":5974,"money_24h":84400},"FutureEra":{"happiness":8440,"population":6680,"demandHappiness":6680,"money_24h":96800},"ArcticFuture":{"happiness":9830,"population":7410,"demandHappiness":7410,"money_24h":110000},"OceanicFuture":{"happiness":11340,"population":8162,"demandHappiness":8162,"money_24h":124000},"VirtualFuture":{"happiness":13550,"population":8938,"demandHappiness":8938,"money_24h":138900},"SpaceAgeMars":{"happiness":21680,"population":14147,"demandHappiness":14147,"money_24h":232000},"SpaceAgeAsteroidBelt":{"happiness":23560,"population":15367,"demandHappiness":15367,"money_24h":256900},"SpaceAgeVenus":{"happiness":25450,"population":16610,"demandHappiness":16610,"money_24h":283200},"SpaceAgeJupiterMoon":{"happiness":27420,"population":17887,"demandHappiness":17887,"money_24h":310900},"SpaceAgeTitan":{"happiness":29400,"population":19186,"demandHappiness":19186,"money_24h":339900},"SpaceAgeSpaceHub":{"happiness":31450,"population":20520,"demandHappiness":20520,"money_24h":370200}} },
+    "R_MultiAge_SpringBonus20hMikoto": { prod: {"BronzeAge":{"happiness":1300,"population":308,"demandHappiness":308,"money_24h":2000},"IronAge":{"happiness":2240,"population":661,"demandHappiness":661,"money_24h":4800},"EarlyMiddleAge":{"happiness":2470,"population":1015,"demandHappiness":1015,"money_24h":7900},"HighMiddleAge":{"happiness":2760,"population":1425,"demandHappiness":1425,"money_24h":11100},"LateMiddleAge":{"happiness":3080,"population":1870,"demandHappiness":1870,"money_24h":14700},"ColonialAge":{"happiness":3620,"population":2360,"demandHappiness":2360,"money_24h":22300},"IndustrialAge":{"happiness":4080,"population":2884,"demandHappiness":2884,"money_24h":27800},"ProgressiveEra":{"happiness":4480,"population":3443,"demandHappiness":3443,"money_24h":33700},"ModernEra":{"happiness":4790,"population":4036,"demandHappiness":4036,"money_24h":42000},"PostModernEra":{"happiness":4990,"population":4651,"demandHappiness":4651,"money_24h":52800},"ContemporaryEra":{"happiness":5800,"population":5301,"demandHappiness":5301,"money_24h":68800},"TomorrowEra":{"happiness":7040,"population":5974,"demandHappiness":5974,"money_24h":79600},"FutureEra":{"happiness":8440,"population":6680,"demandHappiness":6680,"money_24h":91200},"ArcticFuture":{"happiness":9830,"population":7410,"demandHappiness":7410,"money_24h":103700},"OceanicFuture":{"happiness":11340,"population":8162,"demandHappiness":8162,"money_24h":116900},"VirtualFuture":{"happiness":13550,"population":8938,"demandHappiness":8938,"money_24h":130900},"SpaceAgeMars":{"happiness":21680,"population":14147,"demandHappiness":14147,"money_24h":218700},"SpaceAgeAsteroidBelt":{"happiness":23560,"population":15367,"demandHappiness":15367,"money_24h":242300},"SpaceAgeVenus":{"happiness":25450,"population":16610,"demandHappiness":16610,"money_24h":267000},"SpaceAgeJupiterMoon":{"happiness":27420,"population":17887,"demandHappiness":17887,"money_24h":293100},"SpaceAgeTitan":{"happiness":29400,"population":19186,"demandHappiness":19186,"money_24h":320400},"SpaceAgeSpaceHub":{"happiness":31450,"population":20520,"demandHappiness":20520,"money_24h":349100}} },
+    "R_MultiAge_CulturalBuilding10a": { prod: {"BronzeAge":{"money_24h":100},"IronAge":{"money_24h":300},"EarlyMiddleAge":{"money_24h":400},"HighMiddleAge":{"money_24h":600},"LateMiddleAge":{"money_24h":800},"ColonialAge":{"money_24h":1200},"IndustrialAge":{"money_24h":1500},"ProgressiveEra":{"money_24h":1800},"ModernEra":{"money_24h":2200},"PostModernEra":{"money_24h":2800},"ContemporaryEra":{"money_24h":3700},"TomorrowEra":{"money_24h":4200},"FutureEra":{"money_24h":4800},"ArcticFuture":{"money_24h":5500},"OceanicFuture":{"money_24h":6200},"VirtualFuture":{"money_24h":6900},"SpaceAgeMars":{"money_24h":11600},"SpaceAgeAsteroidBelt":{"money_24h":12900},"SpaceAgeVenus":{"money_24h":14200},"SpaceAgeJupiterMoon":{"money_24h":15500},"SpaceAgeTitan":{"money_24h":17000},"SpaceAgeSpaceHub":{"money_24h":18500}} },
+    "R_MultiAge_CulturalBuilding10b": { prod: {"BronzeAge":{"money_24h":100},"IronAge":{"money_24h":300},"EarlyMiddleAge":{"money_24h":400},"HighMiddleAge":{"money_24h":600},"LateMiddleAge":{"money_24h":800},"ColonialAge":{"money_24h":1200},"IndustrialAge":{"money_24h":1500},"ProgressiveEra":{"money_24h":1900},"ModernEra":{"money_24h":2300},"PostModernEra":{"money_24h":2900},"ContemporaryEra":{"money_24h":3800},"TomorrowEra":{"money_24h":4400},"FutureEra":{"money_24h":5100},"ArcticFuture":{"money_24h":5800},"OceanicFuture":{"money_24h":6500},"VirtualFuture":{"money_24h":7300},"SpaceAgeMars":{"money_24h":12200},"SpaceAgeAsteroidBelt":{"money_24h":13500},"SpaceAgeVenus":{"money_24h":14800},"SpaceAgeJupiterMoon":{"money_24h":16300},"SpaceAgeTitan":{"money_24h":17800},"SpaceAgeSpaceHub":{"money_24h":19400}} },
+    "R_MultiAge_CulturalBuilding10c": { prod: {"BronzeAge":{"money_24h":100},"IronAge":{"money_24h":300},"EarlyMiddleAge":{"money_24h":500},"HighMiddleAge":{"money_24h":600},"LateMiddleAge":{"money_24h":900},"ColonialAge":{"money_24h":1300},"IndustrialAge":{"money_24h":1600},"ProgressiveEra":{"money_24h":2000},"ModernEra":{"money_24h":2400},"PostModernEra":{"money_24h":3100},"ContemporaryEra":{"money_24h":4000},"TomorrowEra":{"money_24h":4600},"FutureEra":{"money_24h":5300},"ArcticFuture":{"money_24h":6000},"OceanicFuture":{"money_24h":6800},"VirtualFuture":{"money_24h":7600},"SpaceAgeMars":{"money_24h":12700},"SpaceAgeAsteroidBelt":{"money_24h":14100},"SpaceAgeVenus":{"money_24h":15500},"SpaceAgeJupiterMoon":{"money_24h":17000},"SpaceAgeTitan":{"money_24h":18600},"SpaceAgeSpaceHub":{"money_24h":20300}} },
+    "R_MultiAge_CulturalBuilding10d": { prod: {"BronzeAge":{"money_24h":100},"IronAge":{"money_24h":300},"EarlyMiddleAge":{"money_24h":500},"HighMiddleAge":{"money_24h":700},"LateMiddleAge":{"money_24h":900},"ColonialAge":{"money_24h":1400},"IndustrialAge":{"money_24h":1700},"ProgressiveEra":{"money_24h":2000},"ModernEra":{"money_24h":2500},"PostModernEra":{"money_24h":3200},"ContemporaryEra":{"money_24h":4200},"TomorrowEra":{"money_24h":4800},"FutureEra":{"money_24h":5500},"ArcticFuture":{"money_24h":6300},"OceanicFuture":{"money_24h":7100},"VirtualFuture":{"money_24h":7900},"SpaceAgeMars":{"money_24h":13300},"SpaceAgeAsteroidBelt":{"money_24h":14700},"SpaceAgeVenus":{"money_24h":16200},"SpaceAgeJupiterMoon":{"money_24h":17800},"SpaceAgeTitan":{"money_24h":19400},"SpaceAgeSpaceHub":{"money_24h":21200}} },
+    "D_MultiAge_Monolith": { prod: {"BronzeAge":{"happiness":90},"IronAge":{"happiness":101},"EarlyMiddleAge":{"happiness":112},"HighMiddleAge":{"happiness":125},"LateMiddleAge":{"happiness":139},"ColonialAge":{"happiness":163},"IndustrialAge":{"happiness":184},"ProgressiveEra":{"happiness":202},"ModernEra":{"happiness":216},"PostModernEra":{"happiness":225},"ContemporaryEra":{"happiness":262},"TomorrowEra":{"happiness":318},"FutureEra":{"happiness":381},"ArcticFuture":{"happiness":444},"OceanicFuture":{"happiness":512},"VirtualFuture":{"happiness":612},"SpaceAgeMars":{"happiness":979},"SpaceAgeAsteroidBelt":{"happiness":1063},"SpaceAgeVenus":{"happiness":1149},"SpaceAgeJupiterMoon":{"happiness":1238},"SpaceAgeTitan":{"happiness":1327},"SpaceAgeSpaceHub":{"happiness":1420}} },
+    "A_MultiAge_HalloweenBonus16": { prod: {"BronzeAge":{"happiness":1280},"IronAge":{"happiness":1870},"EarlyMiddleAge":{"happiness":2480},"HighMiddleAge":{"happiness":2770},"LateMiddleAge":{"happiness":3080},"ColonialAge":{"happiness":3630},"IndustrialAge":{"happiness":4090},"ProgressiveEra":{"happiness":4490},"ModernEra":{"happiness":4810},"PostModernEra":{"happiness":5010},"ContemporaryEra":{"happiness":5820},"TomorrowEra":{"happiness":7060},"FutureEra":{"happiness":8460},"ArcticFuture":{"happiness":9850},"OceanicFuture":{"happiness":11370},"VirtualFuture":{"happiness":13580},"SpaceAgeMars":{"happiness":21740},"SpaceAgeAsteroidBelt":{"happiness":23620},"SpaceAgeVenus":{"happiness":25520},"SpaceAgeJupiterMoon":{"happiness":27490},"SpaceAgeTitan":{"happiness":29480},"SpaceAgeSpaceHub":{"happiness":31540}} },
+    "A_MultiAge_MayDayBonus16": { prod: {"BronzeAge":{"happiness":180},"IronAge":{"happiness":230},"EarlyMiddleAge":{"happiness":320},"HighMiddleAge":{"happiness":350},"LateMiddleAge":{"happiness":400},"ColonialAge":{"happiness":460},"IndustrialAge":{"happiness":510},"ProgressiveEra":{"happiness":580},"ModernEra":{"happiness":620},"PostModernEra":{"happiness":650},"ContemporaryEra":{"happiness":750},"TomorrowEra":{"happiness":910},"FutureEra":{"happiness":1090},"ArcticFuture":{"happiness":1270},"OceanicFuture":{"happiness":1460},"VirtualFuture":{"happiness":1750},"SpaceAgeMars":{"happiness":2800},"SpaceAgeAsteroidBelt":{"happiness":3040},"SpaceAgeVenus":{"happiness":3290},"SpaceAgeJupiterMoon":{"happiness":3540},"SpaceAgeTitan":{"happiness":3800},"SpaceAgeSpaceHub":{"happiness":4060}} },
+    "R_MultiAge_ChristmasBonus3": { prod: {"BronzeAge":{"happiness":200,"population":3,"demandHappiness":3,"money_24h":230},"IronAge":{"happiness":350,"population":3,"demandHappiness":3,"money_24h":450},"EarlyMiddleAge":{"happiness":390,"population":3,"demandHappiness":3,"money_24h":750},"HighMiddleAge":{"happiness":430,"population":3,"demandHappiness":3,"money_24h":1050},"LateMiddleAge":{"happiness":480,"population":3,"demandHappiness":3,"money_24h":1390},"ColonialAge":{"happiness":570,"population":3,"demandHappiness":3,"money_24h":2110},"IndustrialAge":{"happiness":640,"population":3,"demandHappiness":3,"money_24h":2630},"ProgressiveEra":{"happiness":700,"population":3,"demandHappiness":3,"money_24h":3200},"ModernEra":{"happiness":750,"population":3,"demandHappiness":3,"money_24h":3980},"PostModernEra":{"happiness":780,"population":3,"demandHappiness":3,"money_24h":5000},"ContemporaryEra":{"happiness":910,"population":3,"demandHappiness":3,"money_24h":6510},"TomorrowEra":{"happiness":1100,"population":3,"demandHappiness":3,"money_24h":7540},"FutureEra":{"happiness":1320,"population":3,"demandHappiness":3,"money_24h":8640},"ArcticFuture":{"happiness":1540,"population":3,"demandHappiness":3,"money_24h":9820},"OceanicFuture":{"happiness":1770,"population":3,"demandHappiness":3,"money_24h":11070},"VirtualFuture":{"happiness":2120,"population":3,"demandHappiness":3,"money_24h":12400},"SpaceAgeMars":{"happiness":3390,"population":3,"demandHappiness":3,"money_24h":20710},"SpaceAgeAsteroidBelt":{"happiness":3680,"population":3,"demandHappiness":3,"money_24h":22940},"SpaceAgeVenus":{"happiness":3980,"population":3,"demandHappiness":3,"money_24h":25290},"SpaceAgeJupiterMoon":{"happiness":4280,"population":3,"demandHappiness":3,"money_24h":27760},"SpaceAgeTitan":{"happiness":4590,"population":3,"demandHappiness":3,"money_24h":30350},"SpaceAgeSpaceHub":{"happiness":4910,"population":3,"demandHappiness":3,"money_24h":33050}} },
+    "R_MultiAge_WinterBonus20fGingerbread": { prod: {"BronzeAge":{"happiness":1170,"population":216,"demandHappiness":216,"money_24h":1600},"IronAge":{"happiness":2020,"population":464,"demandHappiness":464,"money_24h":3700},"EarlyMiddleAge":{"happiness":2230,"population":712,"demandHappiness":712,"money_24h":6200},"HighMiddleAge":{"happiness":2490,"population":1000,"demandHappiness":1000,"money_24h":8700},"LateMiddleAge":{"happiness":2780,"population":1312,"demandHappiness":1312,"money_24h":11500},"ColonialAge":{"happiness":3270,"population":1656,"demandHappiness":1656,"money_24h":17500},"IndustrialAge":{"happiness":3680,"population":2024,"demandHappiness":2024,"money_24h":21800},"ProgressiveEra":{"happiness":4040,"population":2416,"demandHappiness":2416,"money_24h":26400},"ModernEra":{"happiness":4330,"population":2832,"demandHappiness":2832,"money_24h":32900},"PostModernEra":{"happiness":4510,"population":3264,"demandHappiness":3264,"money_24h":41300},"ContemporaryEra":{"happiness":5240,"population":3720,"demandHappiness":3720,"money_24h":53800},"TomorrowEra":{"happiness":6360,"population":4192,"demandHappiness":4192,"money_24h":62300},"FutureEra":{"happiness":7620,"population":4688,"demandHappiness":4688,"money_24h":71400},"ArcticFuture":{"happiness":8870,"population":5200,"demandHappiness":5200,"money_24h":81200},"OceanicFuture":{"happiness":10240,"population":5728,"demandHappiness":5728,"money_24h":91500},"VirtualFuture":{"happiness":12230,"population":6272,"demandHappiness":6272,"money_24h":102500},"SpaceAgeMars":{"happiness":19570,"population":9928,"demandHappiness":9928,"money_24h":171200},"SpaceAgeAsteroidBelt":{"happiness":21270,"population":10784,"demandHappiness":10784,"money_24h":189600},"SpaceAgeVenus":{"happiness":22980,"population":11656,"demandHappiness":11656,"money_24h":209100},"SpaceAgeJupiterMoon":{"happiness":24750,"population":12552,"demandHappiness":12552,"money_24h":229500},"SpaceAgeTitan":{"happiness":26550,"population":13464,"demandHappiness":13464,"money_24h":250900},"SpaceAgeSpaceHub":{"happiness":28400,"population":14400,"demandHappiness":14400,"money_24h":273300}} },
+    "R_MultiAge_AntiquesDealerBonus19a": { prod: {"BronzeAge":{"happiness":530,"population":131,"demandHappiness":131,"money_24h":700},"IronAge":{"happiness":920,"population":281,"demandHappiness":281,"money_24h":1700},"EarlyMiddleAge":{"happiness":1020,"population":431,"demandHappiness":431,"money_24h":2800},"HighMiddleAge":{"happiness":1130,"population":605,"demandHappiness":605,"money_24h":3900},"LateMiddleAge":{"happiness":1260,"population":794,"demandHappiness":794,"money_24h":5200},"ColonialAge":{"happiness":1490,"population":1002,"demandHappiness":1002,"money_24h":7900},"IndustrialAge":{"happiness":1680,"population":1225,"demandHappiness":1225,"money_24h":9800},"ProgressiveEra":{"happiness":1840,"population":1462,"demandHappiness":1462,"money_24h":11900},"ModernEra":{"happiness":1970,"population":1713,"demandHappiness":1713,"money_24h":14800},"PostModernEra":{"happiness":2050,"population":1975,"demandHappiness":1975,"money_24h":18700},"ContemporaryEra":{"happiness":2390,"population":2251,"demandHappiness":2251,"money_24h":24300},"TomorrowEra":{"happiness":2900,"population":2536,"demandHappiness":2536,"money_24h":28100},"FutureEra":{"happiness":3470,"population":2836,"demandHappiness":2836,"money_24h":32300},"ArcticFuture":{"happiness":4040,"population":3146,"demandHappiness":3146,"money_24h":36700},"OceanicFuture":{"happiness":4660,"population":3465,"demandHappiness":3465,"money_24h":41300},"VirtualFuture":{"happiness":5570,"population":3795,"demandHappiness":3795,"money_24h":46300},"SpaceAgeMars":{"happiness":8910,"population":6006,"demandHappiness":6006,"money_24h":77300},"SpaceAgeAsteroidBelt":{"happiness":9690,"population":6524,"demandHappiness":6524,"money_24h":85700},"SpaceAgeVenus":{"happiness":10460,"population":7052,"demandHappiness":7052,"money_24h":94400},"SpaceAgeJupiterMoon":{"happiness":11270,"population":7594,"demandHappiness":7594,"money_24h":103600},"SpaceAgeTitan":{"happiness":12090,"population":8146,"demandHappiness":8146,"money_24h":113300},"SpaceAgeSpaceHub":{"happiness":12930,"population":8712,"demandHappiness":8712,"money_24h":123400}} },
+    "R_MultiAge_AntiquesDealerBonus19b": { prod: {"BronzeAge":{"happiness":560,"population":139,"demandHappiness":139,"money_24h":800},"IronAge":{"happiness":960,"population":299,"demandHappiness":299,"money_24h":1900},"EarlyMiddleAge":{"happiness":1060,"population":459,"demandHappiness":459,"money_24h":3200},"HighMiddleAge":{"happiness":1190,"population":645,"demandHappiness":645,"money_24h":4400},"LateMiddleAge":{"happiness":1320,"population":846,"demandHappiness":846,"money_24h":5900},"ColonialAge":{"happiness":1560,"population":1068,"demandHappiness":1068,"money_24h":8900},"IndustrialAge":{"happiness":1760,"population":1305,"demandHappiness":1305,"money_24h":11100},"ProgressiveEra":{"happiness":1930,"population":1558,"demandHappiness":1558,"money_24h":13500},"ModernEra":{"happiness":2060,"population":1827,"demandHappiness":1827,"money_24h":16800},"PostModernEra":{"happiness":2150,"population":2105,"demandHappiness":2105,"money_24h":21100},"ContemporaryEra":{"happiness":2500,"population":2399,"demandHappiness":2399,"money_24h":27500},"TomorrowEra":{"happiness":3030,"population":2704,"demandHappiness":2704,"money_24h":31800},"FutureEra":{"happiness":3630,"population":3024,"demandHappiness":3024,"money_24h":36500},"ArcticFuture":{"happiness":4230,"population":3354,"demandHappiness":3354,"money_24h":41500},"OceanicFuture":{"happiness":4880,"population":3695,"demandHappiness":3695,"money_24h":46800},"VirtualFuture":{"happiness":5830,"population":4045,"demandHappiness":4045,"money_24h":52400},"SpaceAgeMars":{"happiness":9330,"population":6404,"demandHappiness":6404,"money_24h":87500},"SpaceAgeAsteroidBelt":{"happiness":10140,"population":6956,"demandHappiness":6956,"money_24h":96900},"SpaceAgeVenus":{"happiness":10960,"population":7518,"demandHappiness":7518,"money_24h":106800},"SpaceAgeJupiterMoon":{"happiness":11800,"population":8096,"demandHappiness":8096,"money_24h":117200},"SpaceAgeTitan":{"happiness":12660,"population":8684,"demandHappiness":8684,"money_24h":128200},"SpaceAgeSpaceHub":{"happiness":13540,"population":9288,"demandHappiness":9288,"money_24h":139600}} },
+    "R_MultiAge_AntiquesDealerBonus19c": { prod: {"BronzeAge":{"happiness":590,"population":149,"demandHappiness":149,"money_24h":800},"IronAge":{"happiness":1010,"population":320,"demandHappiness":320,"money_24h":2000},"EarlyMiddleAge":{"happiness":1120,"population":491,"demandHappiness":491,"money_24h":3400},"HighMiddleAge":{"happiness":1250,"population":690,"demandHappiness":690,"money_24h":4700},"LateMiddleAge":{"happiness":1390,"population":905,"demandHappiness":905,"money_24h":6300},"ColonialAge":{"happiness":1640,"population":1143,"demandHappiness":1143,"money_24h":9500},"IndustrialAge":{"happiness":1850,"population":1397,"demandHappiness":1397,"money_24h":11900},"ProgressiveEra":{"happiness":2030,"population":1667,"demandHappiness":1667,"money_24h":14400},"ModernEra":{"happiness":2170,"population":1954,"demandHappiness":1954,"money_24h":17900},"PostModernEra":{"happiness":2260,"population":2252,"demandHappiness":2252,"money_24h":22500},"ContemporaryEra":{"happiness":2630,"population":2567,"demandHappiness":2567,"money_24h":29300},"TomorrowEra":{"happiness":3190,"population":2892,"demandHappiness":2892,"money_24h":33900},"FutureEra":{"happiness":3820,"population":3235,"demandHappiness":3235,"money_24h":38900},"ArcticFuture":{"happiness":4450,"population":3588,"demandHappiness":3588,"money_24h":44200},"OceanicFuture":{"happiness":5130,"population":3952,"demandHappiness":3952,"money_24h":49800},"VirtualFuture":{"happiness":6130,"population":4328,"demandHappiness":4328,"money_24h":55800},"SpaceAgeMars":{"happiness":9820,"population":6850,"demandHappiness":6850,"money_24h":93200},"SpaceAgeAsteroidBelt":{"happiness":10670,"population":7441,"demandHappiness":7441,"money_24h":103300},"SpaceAgeVenus":{"happiness":11520,"population":8043,"demandHappiness":8043,"money_24h":113800},"SpaceAgeJupiterMoon":{"happiness":12410,"population":8661,"demandHappiness":8661,"money_24h":124900},"SpaceAgeTitan":{"happiness":13310,"population":9290,"demandHappiness":9290,"money_24h":136600},"SpaceAgeSpaceHub":{"happiness":14240,"population":9936,"demandHappiness":9936,"money_24h":148800}} },
+    "R_MultiAge_AntiquesDealerBonus19d": { prod: {"BronzeAge":{"happiness":660,"population":159,"demandHappiness":159,"money_24h":900},"IronAge":{"happiness":1140,"population":341,"demandHappiness":341,"money_24h":2200},"EarlyMiddleAge":{"happiness":1260,"population":523,"demandHappiness":523,"money_24h":3600},"HighMiddleAge":{"happiness":1410,"population":735,"demandHappiness":735,"money_24h":5000},"LateMiddleAge":{"happiness":1570,"population":964,"demandHappiness":964,"money_24h":6600},"ColonialAge":{"happiness":1850,"population":1217,"demandHappiness":1217,"money_24h":10100},"IndustrialAge":{"happiness":2090,"population":1488,"demandHappiness":1488,"money_24h":12600},"ProgressiveEra":{"happiness":2290,"population":1776,"demandHappiness":1776,"money_24h":15300},"ModernEra":{"happiness":2450,"population":2082,"demandHappiness":2082,"money_24h":19000},"PostModernEra":{"happiness":2550,"population":2399,"demandHappiness":2399,"money_24h":23900},"ContemporaryEra":{"happiness":2970,"population":2734,"demandHappiness":2734,"money_24h":31100},"TomorrowEra":{"happiness":3600,"population":3081,"demandHappiness":3081,"money_24h":36000},"FutureEra":{"happiness":4310,"population":3446,"demandHappiness":3446,"money_24h":41300},"ArcticFuture":{"happiness":5020,"population":3822,"demandHappiness":3822,"money_24h":46900},"OceanicFuture":{"happiness":5800,"population":4210,"demandHappiness":4210,"money_24h":52900},"VirtualFuture":{"happiness":6920,"population":4610,"demandHappiness":4610,"money_24h":59300},"SpaceAgeMars":{"happiness":11080,"population":7297,"demandHappiness":7297,"money_24h":99000},"SpaceAgeAsteroidBelt":{"happiness":12040,"population":7926,"demandHappiness":7926,"money_24h":109600},"SpaceAgeVenus":{"happiness":13010,"population":8567,"demandHappiness":8567,"money_24h":120800},"SpaceAgeJupiterMoon":{"happiness":14010,"population":9226,"demandHappiness":9226,"money_24h":132600},"SpaceAgeTitan":{"happiness":15030,"population":9896,"demandHappiness":9896,"money_24h":145000},"SpaceAgeSpaceHub":{"happiness":16080,"population":10584,"demandHappiness":10584,"money_24h":158000}} },
+    "R_MultiAge_AntiquesDealerBonus19e": { prod: {"BronzeAge":{"happiness":720,"population":173,"demandHappiness":173,"money_24h":1000},"IronAge":{"happiness":1240,"population":371,"demandHappiness":371,"money_24h":2400},"EarlyMiddleAge":{"happiness":1370,"population":570,"demandHappiness":570,"money_24h":4000},"HighMiddleAge":{"happiness":1530,"population":800,"demandHappiness":800,"money_24h":5600},"LateMiddleAge":{"happiness":1710,"population":1050,"demandHappiness":1050,"money_24h":7300},"ColonialAge":{"happiness":2010,"population":1325,"demandHappiness":1325,"money_24h":11200},"IndustrialAge":{"happiness":2270,"population":1619,"demandHappiness":1619,"money_24h":13900},"ProgressiveEra":{"happiness":2490,"population":1933,"demandHappiness":1933,"money_24h":16900},"ModernEra":{"happiness":2660,"population":2266,"demandHappiness":2266,"money_24h":21000},"PostModernEra":{"happiness":2770,"population":2611,"demandHappiness":2611,"money_24h":26500},"ContemporaryEra":{"happiness":3220,"population":2976,"demandHappiness":2976,"money_24h":34400},"TomorrowEra":{"happiness":3910,"population":3354,"demandHappiness":3354,"money_24h":39900},"FutureEra":{"happiness":4690,"population":3750,"demandHappiness":3750,"money_24h":45700},"ArcticFuture":{"happiness":5460,"population":4160,"demandHappiness":4160,"money_24h":51900},"OceanicFuture":{"happiness":6300,"population":4582,"demandHappiness":4582,"money_24h":58600},"VirtualFuture":{"happiness":7530,"population":5018,"demandHappiness":5018,"money_24h":65600},"SpaceAgeMars":{"happiness":12040,"population":7942,"demandHappiness":7942,"money_24h":109600},"SpaceAgeAsteroidBelt":{"happiness":13090,"population":8627,"demandHappiness":8627,"money_24h":121400},"SpaceAgeVenus":{"happiness":14140,"population":9325,"demandHappiness":9325,"money_24h":133800},"SpaceAgeJupiterMoon":{"happiness":15230,"population":10042,"demandHappiness":10042,"money_24h":146900},"SpaceAgeTitan":{"happiness":16340,"population":10771,"demandHappiness":10771,"money_24h":160600},"SpaceAgeSpaceHub":{"happiness":17470,"population":11520,"demandHappiness":11520,"money_24h":174900}} },
+    "R_MultiAge_AntiquesDealerBonus19f": { prod: {"BronzeAge":{"happiness":800,"population":183,"demandHappiness":183,"money_24h":1100},"IronAge":{"happiness":1370,"population":392,"demandHappiness":392,"money_24h":2500},"EarlyMiddleAge":{"happiness":1520,"population":602,"demandHappiness":602,"money_24h":4200},"HighMiddleAge":{"happiness":1690,"population":845,"demandHappiness":845,"money_24h":5900},"LateMiddleAge":{"happiness":1890,"population":1109,"demandHappiness":1109,"money_24h":7800},"ColonialAge":{"happiness":2220,"population":1399,"demandHappiness":1399,"money_24h":11900},"IndustrialAge":{"happiness":2500,"population":1710,"demandHappiness":1710,"money_24h":14800},"ProgressiveEra":{"happiness":2750,"population":2042,"demandHappiness":2042,"money_24h":18000},"ModernEra":{"happiness":2940,"population":2393,"demandHappiness":2393,"money_24h":22400},"PostModernEra":{"happiness":3070,"population":2758,"demandHappiness":2758,"money_24h":28200},"ContemporaryEra":{"happiness":3560,"population":3143,"demandHappiness":3143,"money_24h":36700},"TomorrowEra":{"happiness":4320,"population":3542,"demandHappiness":3542,"money_24h":42500},"FutureEra":{"happiness":5180,"population":3961,"demandHappiness":3961,"money_24h":48700},"ArcticFuture":{"happiness":6030,"population":4394,"demandHappiness":4394,"money_24h":55300},"OceanicFuture":{"happiness":6960,"population":4840,"demandHappiness":4840,"money_24h":62400},"VirtualFuture":{"happiness":8320,"population":5300,"demandHappiness":5300,"money_24h":69800},"SpaceAgeMars":{"happiness":13310,"population":8389,"demandHappiness":8389,"money_24h":116700},"SpaceAgeAsteroidBelt":{"happiness":14460,"population":9112,"demandHappiness":9112,"money_24h":129200},"SpaceAgeVenus":{"happiness":15620,"population":9849,"demandHappiness":9849,"money_24h":142400},"SpaceAgeJupiterMoon":{"happiness":16830,"population":10606,"demandHappiness":10606,"money_24h":156300},"SpaceAgeTitan":{"happiness":18050,"population":11377,"demandHappiness":11377,"money_24h":170900},"SpaceAgeSpaceHub":{"happiness":19310,"population":12168,"demandHappiness":12168,"money_24h":186200}} },
+    "R_MultiAge_AntiquesDealerBonus19g": { prod: {"BronzeAge":{"happiness":870,"population":189,"demandHappiness":189,"money_24h":1100},"IronAge":{"happiness":1500,"population":406,"demandHappiness":406,"money_24h":2700},"EarlyMiddleAge":{"happiness":1660,"population":623,"demandHappiness":623,"money_24h":4600},"HighMiddleAge":{"happiness":1850,"population":875,"demandHappiness":875,"money_24h":6400},"LateMiddleAge":{"happiness":2070,"population":1148,"demandHappiness":1148,"money_24h":8400},"ColonialAge":{"happiness":2430,"population":1449,"demandHappiness":1449,"money_24h":12900},"IndustrialAge":{"happiness":2740,"population":1771,"demandHappiness":1771,"money_24h":16000},"ProgressiveEra":{"happiness":3010,"population":2114,"demandHappiness":2114,"money_24h":19400},"ModernEra":{"happiness":3220,"population":2478,"demandHappiness":2478,"money_24h":24200},"PostModernEra":{"happiness":3360,"population":2856,"demandHappiness":2856,"money_24h":30400},"ContemporaryEra":{"happiness":3900,"population":3255,"demandHappiness":3255,"money_24h":39600},"TomorrowEra":{"happiness":4740,"population":3668,"demandHappiness":3668,"money_24h":45800},"FutureEra":{"happiness":5670,"population":4102,"demandHappiness":4102,"money_24h":52500},"ArcticFuture":{"happiness":6610,"population":4550,"demandHappiness":4550,"money_24h":59700},"OceanicFuture":{"happiness":7620,"population":5012,"demandHappiness":5012,"money_24h":67300},"VirtualFuture":{"happiness":9110,"population":5488,"demandHappiness":5488,"money_24h":75400},"SpaceAgeMars":{"happiness":14570,"population":8687,"demandHappiness":8687,"money_24h":125900},"SpaceAgeAsteroidBelt":{"happiness":15840,"population":9436,"demandHappiness":9436,"money_24h":139500},"SpaceAgeVenus":{"happiness":17110,"population":10199,"demandHappiness":10199,"money_24h":153800},"SpaceAgeJupiterMoon":{"happiness":18430,"population":10983,"demandHappiness":10983,"money_24h":168800},"SpaceAgeTitan":{"happiness":19770,"population":11781,"demandHappiness":11781,"money_24h":184500},"SpaceAgeSpaceHub":{"happiness":21140,"population":12600,"demandHappiness":12600,"money_24h":201000}} },
+    "R_MultiAge_AntiquesDealerBonus19h": { prod: {"BronzeAge":{"happiness":940,"population":203,"demandHappiness":203,"money_24h":1200},"IronAge":{"happiness":1610,"population":436,"demandHappiness":436,"money_24h":3000},"EarlyMiddleAge":{"happiness":1790,"population":669,"demandHappiness":669,"money_24h":5000},"HighMiddleAge":{"happiness":1990,"population":940,"demandHappiness":940,"money_24h":6900},"LateMiddleAge":{"happiness":2220,"population":1233,"demandHappiness":1233,"money_24h":9200},"ColonialAge":{"happiness":2610,"population":1557,"demandHappiness":1557,"money_24h":14000},"IndustrialAge":{"happiness":2950,"population":1903,"demandHappiness":1903,"money_24h":17400},"ProgressiveEra":{"happiness":3240,"population":2271,"demandHappiness":2271,"money_24h":21100},"ModernEra":{"happiness":3460,"population":2662,"demandHappiness":2662,"money_24h":26300},"PostModernEra":{"happiness":3610,"population":3068,"demandHappiness":3068,"money_24h":33100},"ContemporaryEra":{"happiness":4190,"population":3497,"demandHappiness":3497,"money_24h":43100},"TomorrowEra":{"happiness":5090,"population":3940,"demandHappiness":3940,"money_24h":49900},"FutureEra":{"happiness":6100,"population":4407,"demandHappiness":4407,"money_24h":57100},"ArcticFuture":{"happiness":7100,"population":4888,"demandHappiness":4888,"money_24h":64900},"OceanicFuture":{"happiness":8190,"population":5384,"demandHappiness":5384,"money_24h":73200},"VirtualFuture":{"happiness":9780,"population":5896,"demandHappiness":5896,"money_24h":82000},"SpaceAgeMars":{"happiness":15660,"population":9332,"demandHappiness":9332,"money_24h":137000},"SpaceAgeAsteroidBelt":{"happiness":17010,"population":10137,"demandHappiness":10137,"money_24h":151700},"SpaceAgeVenus":{"happiness":18380,"population":10957,"demandHappiness":10957,"money_24h":167200},"SpaceAgeJupiterMoon":{"happiness":19800,"population":11799,"demandHappiness":11799,"money_24h":183600},"SpaceAgeTitan":{"happiness":21240,"population":12656,"demandHappiness":12656,"money_24h":200700},"SpaceAgeSpaceHub":{"happiness":22720,"population":13536,"demandHappiness":13536,"money_24h":218600}} },
+    "R_MultiAge_CarnivalBonus18a": { prod: {"BronzeAge":{"happiness":510,"money_24h":1000},"IronAge":{"happiness":890,"money_24h":2200},"EarlyMiddleAge":{"happiness":980,"money_24h":3100},"HighMiddleAge":{"happiness":1090,"money_24h":4000},"LateMiddleAge":{"happiness":1220,"money_24h":4900},"ColonialAge":{"happiness":1430,"money_24h":7100},"IndustrialAge":{"happiness":1610,"money_24h":8900},"ProgressiveEra":{"happiness":1770,"money_24h":10700},"ModernEra":{"happiness":1900,"money_24h":13400},"PostModernEra":{"happiness":1980,"money_24h":16800},"ContemporaryEra":{"happiness":2300,"money_24h":21900},"TomorrowEra":{"happiness":2790,"money_24h":25300},"FutureEra":{"happiness":3340,"money_24h":29000},"ArcticFuture":{"happiness":3890,"money_24h":33000},"OceanicFuture":{"happiness":4490,"money_24h":37200},"VirtualFuture":{"happiness":5360,"money_24h":41700},"SpaceAgeMars":{"happiness":8580,"money_24h":69600},"SpaceAgeAsteroidBelt":{"happiness":9330,"money_24h":77100},"SpaceAgeVenus":{"happiness":10070,"money_24h":85000},"SpaceAgeJupiterMoon":{"happiness":10850,"money_24h":93300},"SpaceAgeTitan":{"happiness":11640,"money_24h":102000},"SpaceAgeSpaceHub":{"happiness":12450,"money_24h":111100}} },
+    "R_MultiAge_CarnivalBonus18b": { prod: {"BronzeAge":{"happiness":540,"money_24h":1000},"IronAge":{"happiness":930,"money_24h":2200},"EarlyMiddleAge":{"happiness":1030,"money_24h":3100},"HighMiddleAge":{"happiness":1150,"money_24h":4000},"LateMiddleAge":{"happiness":1280,"money_24h":4900},"ColonialAge":{"happiness":1510,"money_24h":7400},"IndustrialAge":{"happiness":1700,"money_24h":9300},"ProgressiveEra":{"happiness":1870,"money_24h":11300},"ModernEra":{"happiness":2000,"money_24h":14000},"PostModernEra":{"happiness":2080,"money_24h":17600},"ContemporaryEra":{"happiness":2420,"money_24h":22900},"TomorrowEra":{"happiness":2940,"money_24h":26500},"FutureEra":{"happiness":3520,"money_24h":30400},"ArcticFuture":{"happiness":4090,"money_24h":34600},"OceanicFuture":{"happiness":4730,"money_24h":39000},"VirtualFuture":{"happiness":5650,"money_24h":43700},"SpaceAgeMars":{"happiness":9030,"money_24h":72900},"SpaceAgeAsteroidBelt":{"happiness":9820,"money_24h":80800},"SpaceAgeVenus":{"happiness":10610,"money_24h":89000},"SpaceAgeJupiterMoon":{"happiness":11420,"money_24h":97700},"SpaceAgeTitan":{"happiness":12250,"money_24h":106800},"SpaceAgeSpaceHub":{"happiness":13110,"money_24h":116400}} },
+    "R_MultiAge_CarnivalBonus18c": { prod: {"BronzeAge":{"happiness":570,"money_24h":1000},"IronAge":{"happiness":980,"money_24h":2200},"EarlyMiddleAge":{"happiness":1080,"money_24h":3100},"HighMiddleAge":{"happiness":1210,"money_24h":4000},"LateMiddleAge":{"happiness":1350,"money_24h":5100},"ColonialAge":{"happiness":1580,"money_24h":7800},"IndustrialAge":{"happiness":1780,"money_24h":9700},"ProgressiveEra":{"happiness":1960,"money_24h":11800},"ModernEra":{"happiness":2100,"money_24h":14600},"PostModernEra":{"happiness":2180,"money_24h":18400},"ContemporaryEra":{"happiness":2540,"money_24h":24000},"TomorrowEra":{"happiness":3080,"money_24h":27700},"FutureEra":{"happiness":3690,"money_24h":31800},"ArcticFuture":{"happiness":4300,"money_24h":36100},"OceanicFuture":{"happiness":4960,"money_24h":40700},"VirtualFuture":{"happiness":5930,"money_24h":45600},"SpaceAgeMars":{"happiness":9480,"money_24h":76200},"SpaceAgeAsteroidBelt":{"happiness":10310,"money_24h":84400},"SpaceAgeVenus":{"happiness":11140,"money_24h":93100},"SpaceAgeJupiterMoon":{"happiness":12000,"money_24h":102100},"SpaceAgeTitan":{"happiness":12860,"money_24h":111700},"SpaceAgeSpaceHub":{"happiness":13760,"money_24h":121600}} },
+    "R_MultiAge_CarnivalBonus18d": { prod: {"BronzeAge":{"happiness":590,"money_24h":1000},"IronAge":{"happiness":1020,"money_24h":2200},"EarlyMiddleAge":{"happiness":1130,"money_24h":3100},"HighMiddleAge":{"happiness":1260,"money_24h":4000},"LateMiddleAge":{"happiness":1410,"money_24h":5300},"ColonialAge":{"happiness":1660,"money_24h":8100},"IndustrialAge":{"happiness":1870,"money_24h":10100},"ProgressiveEra":{"happiness":2050,"money_24h":12300},"ModernEra":{"happiness":2200,"money_24h":15300},"PostModernEra":{"happiness":2290,"money_24h":19200},"ContemporaryEra":{"happiness":2660,"money_24h":25000},"TomorrowEra":{"happiness":3230,"money_24h":28900},"FutureEra":{"happiness":3870,"money_24h":33200},"ArcticFuture":{"happiness":4500,"money_24h":37700},"OceanicFuture":{"happiness":5200,"money_24h":42500},"VirtualFuture":{"happiness":6210,"money_24h":47600},"SpaceAgeMars":{"happiness":9940,"money_24h":79500},"SpaceAgeAsteroidBelt":{"happiness":10800,"money_24h":88100},"SpaceAgeVenus":{"happiness":11670,"money_24h":97100},"SpaceAgeJupiterMoon":{"happiness":12570,"money_24h":106600},"SpaceAgeTitan":{"happiness":13480,"money_24h":116500},"SpaceAgeSpaceHub":{"happiness":14420,"money_24h":126900}} },
+    "R_MultiAge_CarnivalBonus18e": { prod: {"BronzeAge":{"happiness":620,"money_24h":1000},"IronAge":{"happiness":1070,"money_24h":2200},"EarlyMiddleAge":{"happiness":1180,"money_24h":3100},"HighMiddleAge":{"happiness":1320,"money_24h":4200},"LateMiddleAge":{"happiness":1470,"money_24h":5600},"ColonialAge":{"happiness":1730,"money_24h":8500},"IndustrialAge":{"happiness":1950,"money_24h":10500},"ProgressiveEra":{"happiness":2150,"money_24h":12800},"ModernEra":{"happiness":2300,"money_24h":15900},"PostModernEra":{"happiness":2390,"money_24h":20000},"ContemporaryEra":{"happiness":2780,"money_24h":26000},"TomorrowEra":{"happiness":3380,"money_24h":30200},"FutureEra":{"happiness":4040,"money_24h":34600},"ArcticFuture":{"happiness":4710,"money_24h":39300},"OceanicFuture":{"happiness":5430,"money_24h":44300},"VirtualFuture":{"happiness":6490,"money_24h":49600},"SpaceAgeMars":{"happiness":10390,"money_24h":82900},"SpaceAgeAsteroidBelt":{"happiness":11290,"money_24h":91800},"SpaceAgeVenus":{"happiness":12200,"money_24h":101200},"SpaceAgeJupiterMoon":{"happiness":13140,"money_24h":111000},"SpaceAgeTitan":{"happiness":14090,"money_24h":121400},"SpaceAgeSpaceHub":{"happiness":15070,"money_24h":132200}} },
+    "R_MultiAge_CarnivalBonus18f": { prod: {"BronzeAge":{"happiness":650,"money_24h":1000},"IronAge":{"happiness":1120,"money_24h":2200},"EarlyMiddleAge":{"happiness":1240,"money_24h":3100},"HighMiddleAge":{"happiness":1380,"money_24h":4400},"LateMiddleAge":{"happiness":1540,"money_24h":5800},"ColonialAge":{"happiness":1810,"money_24h":8800},"IndustrialAge":{"happiness":2040,"money_24h":11000},"ProgressiveEra":{"happiness":2240,"money_24h":13300},"ModernEra":{"happiness":2400,"money_24h":16500},"PostModernEra":{"happiness":2500,"money_24h":20800},"ContemporaryEra":{"happiness":2900,"money_24h":27100},"TomorrowEra":{"happiness":3520,"money_24h":31400},"FutureEra":{"happiness":4220,"money_24h":35900},"ArcticFuture":{"happiness":4910,"money_24h":40800},"OceanicFuture":{"happiness":5670,"money_24h":46100},"VirtualFuture":{"happiness":6770,"money_24h":51600},"SpaceAgeMars":{"happiness":10840,"money_24h":86200},"SpaceAgeAsteroidBelt":{"happiness":11780,"money_24h":95400},"SpaceAgeVenus":{"happiness":12730,"money_24h":105200},"SpaceAgeJupiterMoon":{"happiness":13710,"money_24h":115500},"SpaceAgeTitan":{"happiness":14700,"money_24h":126200},"SpaceAgeSpaceHub":{"happiness":15730,"money_24h":137500}} },
+    "R_MultiAge_CarnivalBonus18g": { prod: {"BronzeAge":{"happiness":680,"money_24h":1000},"IronAge":{"happiness":1160,"money_24h":2200},"EarlyMiddleAge":{"happiness":1290,"money_24h":3200},"HighMiddleAge":{"happiness":1440,"money_24h":4500},"LateMiddleAge":{"happiness":1600,"money_24h":6000},"ColonialAge":{"happiness":1880,"money_24h":9100},"IndustrialAge":{"happiness":2120,"money_24h":11400},"ProgressiveEra":{"happiness":2330,"money_24h":13800},"ModernEra":{"happiness":2500,"money_24h":17200},"PostModernEra":{"happiness":2600,"money_24h":21600},"ContemporaryEra":{"happiness":3020,"money_24h":28100},"TomorrowEra":{"happiness":3670,"money_24h":32600},"FutureEra":{"happiness":4400,"money_24h":37300},"ArcticFuture":{"happiness":5120,"money_24h":42400},"OceanicFuture":{"happiness":5910,"money_24h":47800},"VirtualFuture":{"happiness":7060,"money_24h":53600},"SpaceAgeMars":{"happiness":11290,"money_24h":89500},"SpaceAgeAsteroidBelt":{"happiness":12270,"money_24h":99100},"SpaceAgeVenus":{"happiness":13260,"money_24h":109200},"SpaceAgeJupiterMoon":{"happiness":14280,"money_24h":119900},"SpaceAgeTitan":{"happiness":15310,"money_24h":131100},"SpaceAgeSpaceHub":{"happiness":16380,"money_24h":142800}} },
+    "R_MultiAge_ArcheologyBonus21jGreat": { prod: {"BronzeAge":{"happiness":1300,"population":275,"demandHappiness":275,"money_24h":2000},"IronAge":{"happiness":2240,"population":592,"demandHappiness":592,"money_24h":4900},"EarlyMiddleAge":{"happiness":2470,"population":908,"demandHappiness":908,"money_24h":8200},"HighMiddleAge":{"happiness":2760,"population":1275,"demandHappiness":1275,"money_24h":11400},"LateMiddleAge":{"happiness":3080,"population":1673,"demandHappiness":1673,"money_24h":15100},"ColonialAge":{"happiness":3620,"population":2111,"demandHappiness":2111,"money_24h":23000},"IndustrialAge":{"happiness":4080,"population":2581,"demandHappiness":2581,"money_24h":28600},"ProgressiveEra":{"happiness":4480,"population":3080,"demandHappiness":3080,"money_24h":34800},"ModernEra":{"happiness":4790,"population":3611,"demandHappiness":3611,"money_24h":43300},"PostModernEra":{"happiness":4990,"population":4162,"demandHappiness":4162,"money_24h":54400},"ContemporaryEra":{"happiness":5800,"population":4743,"demandHappiness":4743,"money_24h":70800},"TomorrowEra":{"happiness":7040,"population":5345,"demandHappiness":5345,"money_24h":82000},"FutureEra":{"happiness":8440,"population":5977,"demandHappiness":5977,"money_24h":94000},"ArcticFuture":{"happiness":9830,"population":6630,"demandHappiness":6630,"money_24h":106800},"OceanicFuture":{"happiness":11340,"population":7303,"demandHappiness":7303,"money_24h":120400},"VirtualFuture":{"happiness":13550,"population":7997,"demandHappiness":7997,"money_24h":134900},"SpaceAgeMars":{"happiness":21680,"population":12658,"demandHappiness":12658,"money_24h":225300},"SpaceAgeAsteroidBelt":{"happiness":23560,"population":13750,"demandHappiness":13750,"money_24h":249600},"SpaceAgeVenus":{"happiness":25450,"population":14861,"demandHappiness":14861,"money_24h":275100},"SpaceAgeJupiterMoon":{"happiness":27420,"population":16004,"demandHappiness":16004,"money_24h":302000},"SpaceAgeTitan":{"happiness":29400,"population":17167,"demandHappiness":17167,"money_24h":330200},"SpaceAgeSpaceHub":{"happiness":31450,"population":18360,"demandHappiness":18360,"money_24h":359600}} },
+    "R_MultiAge_CulturalBuilding2a": { prod: {"BronzeAge":{"money_24h":100},"IronAge":{"money_24h":300},"EarlyMiddleAge":{"money_24h":400},"HighMiddleAge":{"money_24h":600},"LateMiddleAge":{"money_24h":800},"ColonialAge":{"money_24h":1200},"IndustrialAge":{"money_24h":1500},"ProgressiveEra":{"money_24h":1900},"ModernEra":{"money_24h":2300},"PostModernEra":{"money_24h":2900},"ContemporaryEra":{"money_24h":3800},"TomorrowEra":{"money_24h":4400},"FutureEra":{"money_24h":5100},"ArcticFuture":{"money_24h":5800},"OceanicFuture":{"money_24h":6500},"VirtualFuture":{"money_24h":7300},"SpaceAgeMars":{"money_24h":12200},"SpaceAgeAsteroidBelt":{"money_24h":13500},"SpaceAgeVenus":{"money_24h":14800},"SpaceAgeJupiterMoon":{"money_24h":16300},"SpaceAgeTitan":{"money_24h":17800},"SpaceAgeSpaceHub":{"money_24h":19400}} },
+    "R_MultiAge_CulturalBuilding2b": { prod: {"BronzeAge":{"money_24h":100},"IronAge":{"money_24h":300},"EarlyMiddleAge":{"money_24h":500},"HighMiddleAge":{"money_24h":700},"LateMiddleAge":{"money_24h":900},"ColonialAge":{"money_24h":1400},"IndustrialAge":{"money_24h":1700},"ProgressiveEra":{"money_24h":2000},"ModernEra":{"money_24h":2500},"PostModernEra":{"money_24h":3200},"ContemporaryEra":{"money_24h":4200},"TomorrowEra":{"money_24h":4800},"FutureEra":{"money_24h":5500},"ArcticFuture":{"money_24h":6300},"OceanicFuture":{"money_24h":7100},"VirtualFuture":{"money_24h":7900},"SpaceAgeMars":{"money_24h":13300},"SpaceAgeAsteroidBelt":{"money_24h":14700},"SpaceAgeVenus":{"money_24h":16200},"SpaceAgeJupiterMoon":{"money_24h":17800},"SpaceAgeTitan":{"money_24h":19400},"SpaceAgeSpaceHub":{"money_24h":21200}} },
+    "R_MultiAge_CulturalBuilding2c": { prod: {"BronzeAge":{"money_24h":100},"IronAge":{"money_24h":300},"EarlyMiddleAge":{"money_24h":500},"HighMiddleAge":{"money_24h":700},"LateMiddleAge":{"money_24h":1000},"ColonialAge":{"money_24h":1500},"IndustrialAge":{"money_24h":1800},"ProgressiveEra":{"money_24h":2200},"ModernEra":{"money_24h":2800},"PostModernEra":{"money_24h":3500},"ContemporaryEra":{"money_24h":4500},"TomorrowEra":{"money_24h":5200},"FutureEra":{"money_24h":6000},"ArcticFuture":{"money_24h":6800},"OceanicFuture":{"money_24h":7700},"VirtualFuture":{"money_24h":8600},"SpaceAgeMars":{"money_24h":14400},"SpaceAgeAsteroidBelt":{"money_24h":15900},"SpaceAgeVenus":{"money_24h":17500},"SpaceAgeJupiterMoon":{"money_24h":19200},"SpaceAgeTitan":{"money_24h":21000},"SpaceAgeSpaceHub":{"money_24h":22900}} },
+    "R_MultiAge_CulturalBuilding2d": { prod: {"BronzeAge":{"money_24h":100},"IronAge":{"money_24h":300},"EarlyMiddleAge":{"money_24h":600},"HighMiddleAge":{"money_24h":800},"LateMiddleAge":{"money_24h":1000},"ColonialAge":{"money_24h":1600},"IndustrialAge":{"money_24h":2000},"ProgressiveEra":{"money_24h":2400},"ModernEra":{"money_24h":3000},"PostModernEra":{"money_24h":3700},"ContemporaryEra":{"money_24h":4900},"TomorrowEra":{"money_24h":5600},"FutureEra":{"money_24h":6500},"ArcticFuture":{"money_24h":7300},"OceanicFuture":{"money_24h":8300},"VirtualFuture":{"money_24h":9300},"SpaceAgeMars":{"money_24h":15500},"SpaceAgeAsteroidBelt":{"money_24h":17100},"SpaceAgeVenus":{"money_24h":18900},"SpaceAgeJupiterMoon":{"money_24h":20700},"SpaceAgeTitan":{"money_24h":22700},"SpaceAgeSpaceHub":{"money_24h":24700}} },
+    "R_MultiAge_CulturalBuilding2e": { prod: {"BronzeAge":{"money_24h":200},"IronAge":{"money_24h":400},"EarlyMiddleAge":{"money_24h":600},"HighMiddleAge":{"money_24h":800},"LateMiddleAge":{"money_24h":1100},"ColonialAge":{"money_24h":1700},"IndustrialAge":{"money_24h":2100},"ProgressiveEra":{"money_24h":2600},"ModernEra":{"money_24h":3200},"PostModernEra":{"money_24h":4000},"ContemporaryEra":{"money_24h":5200},"TomorrowEra":{"money_24h":6000},"FutureEra":{"money_24h":6900},"ArcticFuture":{"money_24h":7900},"OceanicFuture":{"money_24h":8900},"VirtualFuture":{"money_24h":9900},"SpaceAgeMars":{"money_24h":16600},"SpaceAgeAsteroidBelt":{"money_24h":18400},"SpaceAgeVenus":{"money_24h":20200},"SpaceAgeJupiterMoon":{"money_24h":22200},"SpaceAgeTitan":{"money_24h":24300},"SpaceAgeSpaceHub":{"money_24h":26400}} },
+    "R_MultiAge_FallBonus20e": { prod: {"BronzeAge":{"happiness":270,"population":51,"demandHappiness":51,"money_24h":300},"IronAge":{"happiness":470,"population":109,"demandHappiness":109,"money_24h":700},"EarlyMiddleAge":{"happiness":520,"population":167,"demandHappiness":167,"money_24h":1100},"HighMiddleAge":{"happiness":570,"population":234,"demandHappiness":234,"money_24h":1600},"LateMiddleAge":{"happiness":640,"population":308,"demandHappiness":308,"money_24h":2100},"ColonialAge":{"happiness":750,"population":388,"demandHappiness":388,"money_24h":3200},"IndustrialAge":{"happiness":850,"population":474,"demandHappiness":474,"money_24h":4000},"ProgressiveEra":{"happiness":930,"population":566,"demandHappiness":566,"money_24h":4900},"ModernEra":{"happiness":1000,"population":664,"demandHappiness":664,"money_24h":6000},"PostModernEra":{"happiness":1040,"population":765,"demandHappiness":765,"money_24h":7600},"ContemporaryEra":{"happiness":1210,"population":872,"demandHappiness":872,"money_24h":9900},"TomorrowEra":{"happiness":1470,"population":983,"demandHappiness":983,"money_24h":11500},"FutureEra":{"happiness":1760,"population":1099,"demandHappiness":1099,"money_24h":13100},"ArcticFuture":{"happiness":2050,"population":1219,"demandHappiness":1219,"money_24h":14900},"OceanicFuture":{"happiness":2360,"population":1343,"demandHappiness":1343,"money_24h":16800},"VirtualFuture":{"happiness":2820,"population":1470,"demandHappiness":1470,"money_24h":18900},"SpaceAgeMars":{"happiness":4520,"population":2327,"demandHappiness":2327,"money_24h":31500},"SpaceAgeAsteroidBelt":{"happiness":4910,"population":2528,"demandHappiness":2528,"money_24h":34900},"SpaceAgeVenus":{"happiness":5300,"population":2732,"demandHappiness":2732,"money_24h":38400},"SpaceAgeJupiterMoon":{"happiness":5710,"population":2942,"demandHappiness":2942,"money_24h":42200},"SpaceAgeTitan":{"happiness":6130,"population":3156,"demandHappiness":3156,"money_24h":46100},"SpaceAgeSpaceHub":{"happiness":6550,"population":3375,"demandHappiness":3375,"money_24h":50200}} },
+    "D_MultiAge_SummerBonus2": { prod: {"BronzeAge":{"happiness":40},"IronAge":{"happiness":52},"EarlyMiddleAge":{"happiness":58},"HighMiddleAge":{"happiness":66},"LateMiddleAge":{"happiness":78},"ColonialAge":{"happiness":90},"IndustrialAge":{"happiness":105},"ProgressiveEra":{"happiness":115},"ModernEra":{"happiness":122},"PostModernEra":{"happiness":130},"ContemporaryEra":{"happiness":135},"TomorrowEra":{"happiness":140},"FutureEra":{"happiness":145},"ArcticFuture":{"happiness":150},"OceanicFuture":{"happiness":160},"VirtualFuture":{"happiness":170},"SpaceAgeMars":{"happiness":180},"SpaceAgeAsteroidBelt":{"happiness":190},"SpaceAgeVenus":{"happiness":200},"SpaceAgeJupiterMoon":{"happiness":210},"SpaceAgeTitan":{"happiness":220},"SpaceAgeSpaceHub":{"happiness":230}} },
+    "R_MultiAge_GalileoBonus17": { prod: {"BronzeAge":{"population":2,"demandHappiness":2,"money_24h":380},"IronAge":{"population":4,"demandHappiness":4,"money_24h":720},"EarlyMiddleAge":{"population":7,"demandHappiness":7,"money_24h":1200},"HighMiddleAge":{"population":9,"demandHappiness":9,"money_24h":1680},"LateMiddleAge":{"population":12,"demandHappiness":12,"money_24h":2220},"ColonialAge":{"population":16,"demandHappiness":16,"money_24h":3380},"IndustrialAge":{"population":19,"demandHappiness":19,"money_24h":4210},"ProgressiveEra":{"population":23,"demandHappiness":23,"money_24h":5110},"ModernEra":{"population":27,"demandHappiness":27,"money_24h":6360},"PostModernEra":{"population":31,"demandHappiness":31,"money_24h":8000},"ContemporaryEra":{"population":35,"demandHappiness":35,"money_24h":10420},"TomorrowEra":{"population":39,"demandHappiness":39,"money_24h":12060},"FutureEra":{"population":44,"demandHappiness":44,"money_24h":13820},"ArcticFuture":{"population":49,"demandHappiness":49,"money_24h":15710},"OceanicFuture":{"population":54,"demandHappiness":54,"money_24h":17710},"VirtualFuture":{"population":59,"demandHappiness":59,"money_24h":19840},"SpaceAgeMars":{"population":93,"demandHappiness":93,"money_24h":33140},"SpaceAgeAsteroidBelt":{"population":101,"demandHappiness":101,"money_24h":36710},"SpaceAgeVenus":{"population":109,"demandHappiness":109,"money_24h":40460},"SpaceAgeJupiterMoon":{"population":118,"demandHappiness":118,"money_24h":44410},"SpaceAgeTitan":{"population":126,"demandHappiness":126,"money_24h":48550},"SpaceAgeSpaceHub":{"population":135,"demandHappiness":135,"money_24h":52890}} },
+    "A_MultiAge_HalloweenBonus17": { prod: {"BronzeAge":{"happiness":1400},"IronAge":{"happiness":2080},"EarlyMiddleAge":{"happiness":2700},"HighMiddleAge":{"happiness":3020},"LateMiddleAge":{"happiness":3370},"ColonialAge":{"happiness":3960},"IndustrialAge":{"happiness":4460},"ProgressiveEra":{"happiness":4900},"ModernEra":{"happiness":5240},"PostModernEra":{"happiness":5460},"ContemporaryEra":{"happiness":6350},"TomorrowEra":{"happiness":7700},"FutureEra":{"happiness":9230},"ArcticFuture":{"happiness":10750},"OceanicFuture":{"happiness":12400},"VirtualFuture":{"happiness":14820},"SpaceAgeMars":{"happiness":23710},"SpaceAgeAsteroidBelt":{"happiness":25770},"SpaceAgeVenus":{"happiness":27840},"SpaceAgeJupiterMoon":{"happiness":29990},"SpaceAgeTitan":{"happiness":32160},"SpaceAgeSpaceHub":{"happiness":34400}} },
+    "D_MultiAge_ChristmasBonusSet1a": { prod: {"BronzeAge":{"happiness":38},"IronAge":{"happiness":47},"EarlyMiddleAge":{"happiness":52},"HighMiddleAge":{"happiness":57},"LateMiddleAge":{"happiness":64},"ColonialAge":{"happiness":75},"IndustrialAge":{"happiness":85},"ProgressiveEra":{"happiness":93},"ModernEra":{"happiness":100},"PostModernEra":{"happiness":110},"ContemporaryEra":{"happiness":128},"TomorrowEra":{"happiness":155},"FutureEra":{"happiness":186},"ArcticFuture":{"happiness":216},"OceanicFuture":{"happiness":249},"VirtualFuture":{"happiness":298},"SpaceAgeMars":{"happiness":477},"SpaceAgeAsteroidBelt":{"happiness":518},"SpaceAgeVenus":{"happiness":560},"SpaceAgeJupiterMoon":{"happiness":603},"SpaceAgeTitan":{"happiness":647},"SpaceAgeSpaceHub":{"happiness":692}} },
+    "R_MultiAge_SummerBonusSetA17b": { prod: {"BronzeAge":{"money_24h":180},"IronAge":{"money_24h":430},"EarlyMiddleAge":{"money_24h":720},"HighMiddleAge":{"money_24h":1010},"LateMiddleAge":{"money_24h":1330},"ColonialAge":{"money_24h":2030},"IndustrialAge":{"money_24h":2530},"ProgressiveEra":{"money_24h":3070},"ModernEra":{"money_24h":3820},"PostModernEra":{"money_24h":4800},"ContemporaryEra":{"money_24h":6250},"TomorrowEra":{"money_24h":7240},"FutureEra":{"money_24h":8290},"ArcticFuture":{"money_24h":9420},"OceanicFuture":{"money_24h":10630},"VirtualFuture":{"money_24h":11900},"SpaceAgeMars":{"money_24h":19880},"SpaceAgeAsteroidBelt":{"money_24h":22020},"SpaceAgeVenus":{"money_24h":24280},"SpaceAgeJupiterMoon":{"money_24h":26650},"SpaceAgeTitan":{"money_24h":29130},"SpaceAgeSpaceHub":{"money_24h":31730}} },
+    "R_MultiAge_CleopatraBonus18": { prod: {"BronzeAge":{"population":1,"demandHappiness":1,"money_24h":310},"IronAge":{"population":3,"demandHappiness":3,"money_24h":660},"EarlyMiddleAge":{"population":4,"demandHappiness":4,"money_24h":1000},"HighMiddleAge":{"population":6,"demandHappiness":6,"money_24h":1290},"LateMiddleAge":{"population":8,"demandHappiness":8,"money_24h":1550},"ColonialAge":{"population":10,"demandHappiness":10,"money_24h":2140},"IndustrialAge":{"population":13,"demandHappiness":13,"money_24h":2460},"ProgressiveEra":{"population":15,"demandHappiness":15,"money_24h":2810},"ModernEra":{"population":18,"demandHappiness":18,"money_24h":3500},"PostModernEra":{"population":20,"demandHappiness":20,"money_24h":4400},"ContemporaryEra":{"population":23,"demandHappiness":23,"money_24h":5730},"TomorrowEra":{"population":26,"demandHappiness":26,"money_24h":6630},"FutureEra":{"population":29,"demandHappiness":29,"money_24h":7600},"ArcticFuture":{"population":33,"demandHappiness":33,"money_24h":8630},"OceanicFuture":{"population":36,"demandHappiness":36,"money_24h":10000},"VirtualFuture":{"population":39,"demandHappiness":39,"money_24h":11200},"SpaceAgeMars":{"population":62,"demandHappiness":62,"money_24h":18710},"SpaceAgeAsteroidBelt":{"population":67,"demandHappiness":67,"money_24h":20730},"SpaceAgeVenus":{"population":73,"demandHappiness":73,"money_24h":22850},"SpaceAgeJupiterMoon":{"population":78,"demandHappiness":78,"money_24h":25080},"SpaceAgeTitan":{"population":84,"demandHappiness":84,"money_24h":27420},"SpaceAgeSpaceHub":{"population":90,"demandHappiness":90,"money_24h":29860}} },
+    "R_MultiAge_SportBonus20a": { prod: {"BronzeAge":{"happiness":550,"population":135,"demandHappiness":135,"money_24h":600},"IronAge":{"happiness":950,"population":290,"demandHappiness":290,"money_24h":1500},"EarlyMiddleAge":{"happiness":1050,"population":445,"demandHappiness":445,"money_24h":2500},"HighMiddleAge":{"happiness":1170,"population":625,"demandHappiness":625,"money_24h":3500},"LateMiddleAge":{"happiness":1300,"population":820,"demandHappiness":820,"money_24h":4600},"ColonialAge":{"happiness":1530,"population":1035,"demandHappiness":1035,"money_24h":7000},"IndustrialAge":{"happiness":1730,"population":1265,"demandHappiness":1265,"money_24h":8800},"ProgressiveEra":{"happiness":1900,"population":1510,"demandHappiness":1510,"money_24h":10700},"ModernEra":{"happiness":2030,"population":1770,"demandHappiness":1770,"money_24h":13300},"PostModernEra":{"happiness":2120,"population":2040,"demandHappiness":2040,"money_24h":16700},"ContemporaryEra":{"happiness":2460,"population":2325,"demandHappiness":2325,"money_24h":21700},"TomorrowEra":{"happiness":2980,"population":2620,"demandHappiness":2620,"money_24h":25100},"FutureEra":{"happiness":3580,"population":2930,"demandHappiness":2930,"money_24h":28800},"ArcticFuture":{"happiness":4160,"population":3250,"demandHappiness":3250,"money_24h":32700},"OceanicFuture":{"happiness":4800,"population":3580,"demandHappiness":3580,"money_24h":36900},"VirtualFuture":{"happiness":5740,"population":3920,"demandHappiness":3920,"money_24h":41300},"SpaceAgeMars":{"happiness":9180,"population":6205,"demandHappiness":6205,"money_24h":69000},"SpaceAgeAsteroidBelt":{"happiness":9980,"population":6740,"demandHappiness":6740,"money_24h":76500},"SpaceAgeVenus":{"happiness":10780,"population":7285,"demandHappiness":7285,"money_24h":84300},"SpaceAgeJupiterMoon":{"happiness":11610,"population":7845,"demandHappiness":7845,"money_24h":92500},"SpaceAgeTitan":{"happiness":12460,"population":8415,"demandHappiness":8415,"money_24h":101200},"SpaceAgeSpaceHub":{"happiness":13320,"population":9000,"demandHappiness":9000,"money_24h":110200}} },
+    "R_MultiAge_SportBonus20j": { prod: {"BronzeAge":{"happiness":960,"population":223,"demandHappiness":223,"money_24h":1600},"IronAge":{"happiness":1660,"population":479,"demandHappiness":479,"money_24h":3800},"EarlyMiddleAge":{"happiness":1840,"population":734,"demandHappiness":734,"money_24h":6300},"HighMiddleAge":{"happiness":2050,"population":1031,"demandHappiness":1031,"money_24h":8800},"LateMiddleAge":{"happiness":2290,"population":1353,"demandHappiness":1353,"money_24h":11700},"ColonialAge":{"happiness":2690,"population":1708,"demandHappiness":1708,"money_24h":17800},"IndustrialAge":{"happiness":3030,"population":2087,"demandHappiness":2087,"money_24h":22100},"ProgressiveEra":{"happiness":3330,"population":2492,"demandHappiness":2492,"money_24h":26800},"ModernEra":{"happiness":3560,"population":2921,"demandHappiness":2921,"money_24h":33400},"PostModernEra":{"happiness":3710,"population":3366,"demandHappiness":3366,"money_24h":42000},"ContemporaryEra":{"happiness":4310,"population":3836,"demandHappiness":3836,"money_24h":54700},"TomorrowEra":{"happiness":5230,"population":4323,"demandHappiness":4323,"money_24h":63300},"FutureEra":{"happiness":6270,"population":4835,"demandHappiness":4835,"money_24h":72600},"ArcticFuture":{"happiness":7300,"population":5363,"demandHappiness":5363,"money_24h":82500},"OceanicFuture":{"happiness":8430,"population":5907,"demandHappiness":5907,"money_24h":93000},"VirtualFuture":{"happiness":10070,"population":6468,"demandHappiness":6468,"money_24h":104200},"SpaceAgeMars":{"happiness":16110,"population":10238,"demandHappiness":10238,"money_24h":174000},"SpaceAgeAsteroidBelt":{"happiness":17510,"population":11121,"demandHappiness":11121,"money_24h":192700},"SpaceAgeVenus":{"happiness":18910,"population":12020,"demandHappiness":12020,"money_24h":212400},"SpaceAgeJupiterMoon":{"happiness":20370,"population":12944,"demandHappiness":12944,"money_24h":233200},"SpaceAgeTitan":{"happiness":21850,"population":13885,"demandHappiness":13885,"money_24h":254900},"SpaceAgeSpaceHub":{"happiness":23370,"population":14850,"demandHappiness":14850,"money_24h":277700}} },
+    "R_MultiAge_SportBonus20b": { prod: {"BronzeAge":{"happiness":590,"population":149,"demandHappiness":149,"money_24h":800},"IronAge":{"happiness":1010,"population":319,"demandHappiness":319,"money_24h":1800},"EarlyMiddleAge":{"happiness":1120,"population":490,"demandHappiness":490,"money_24h":3000},"HighMiddleAge":{"happiness":1250,"population":688,"demandHappiness":688,"money_24h":4200},"LateMiddleAge":{"happiness":1390,"population":902,"demandHappiness":902,"money_24h":5600},"ColonialAge":{"happiness":1630,"population":1139,"demandHappiness":1139,"money_24h":8500},"IndustrialAge":{"happiness":1840,"population":1392,"demandHappiness":1392,"money_24h":10500},"ProgressiveEra":{"happiness":2020,"population":1661,"demandHappiness":1661,"money_24h":12800},"ModernEra":{"happiness":2160,"population":1947,"demandHappiness":1947,"money_24h":15900},"PostModernEra":{"happiness":2250,"population":2244,"demandHappiness":2244,"money_24h":20000},"ContemporaryEra":{"happiness":2620,"population":2558,"demandHappiness":2558,"money_24h":26000},"TomorrowEra":{"happiness":3180,"population":2882,"demandHappiness":2882,"money_24h":30200},"FutureEra":{"happiness":3810,"population":3223,"demandHappiness":3223,"money_24h":34600},"ArcticFuture":{"happiness":4440,"population":3575,"demandHappiness":3575,"money_24h":39300},"OceanicFuture":{"happiness":5120,"population":3938,"demandHappiness":3938,"money_24h":44300},"VirtualFuture":{"happiness":6120,"population":4312,"demandHappiness":4312,"money_24h":49600},"SpaceAgeMars":{"happiness":9790,"population":6826,"demandHappiness":6826,"money_24h":82900},"SpaceAgeAsteroidBelt":{"happiness":10630,"population":7414,"demandHappiness":7414,"money_24h":91800},"SpaceAgeVenus":{"happiness":11490,"population":8014,"demandHappiness":8014,"money_24h":101200},"SpaceAgeJupiterMoon":{"happiness":12380,"population":8630,"demandHappiness":8630,"money_24h":111000},"SpaceAgeTitan":{"happiness":13270,"population":9257,"demandHappiness":9257,"money_24h":121400},"SpaceAgeSpaceHub":{"happiness":14200,"population":9900,"demandHappiness":9900,"money_24h":132200}} },
+    "R_MultiAge_SportBonus20c": { prod: {"BronzeAge":{"happiness":630,"population":155,"demandHappiness":155,"money_24h":900},"IronAge":{"happiness":1080,"population":334,"demandHappiness":334,"money_24h":2100},"EarlyMiddleAge":{"happiness":1190,"population":512,"demandHappiness":512,"money_24h":3500},"HighMiddleAge":{"happiness":1330,"population":719,"demandHappiness":719,"money_24h":4900},"LateMiddleAge":{"happiness":1480,"population":943,"demandHappiness":943,"money_24h":6500},"ColonialAge":{"happiness":1750,"population":1190,"demandHappiness":1190,"money_24h":9900},"IndustrialAge":{"happiness":1970,"population":1455,"demandHappiness":1455,"money_24h":12300},"ProgressiveEra":{"happiness":2160,"population":1737,"demandHappiness":1737,"money_24h":14900},"ModernEra":{"happiness":2310,"population":2036,"demandHappiness":2036,"money_24h":18600},"PostModernEra":{"happiness":2410,"population":2346,"demandHappiness":2346,"money_24h":23300},"ContemporaryEra":{"happiness":2800,"population":2674,"demandHappiness":2674,"money_24h":30400},"TomorrowEra":{"happiness":3400,"population":3013,"demandHappiness":3013,"money_24h":35200},"FutureEra":{"happiness":4070,"population":3370,"demandHappiness":3370,"money_24h":40300},"ArcticFuture":{"happiness":4740,"population":3738,"demandHappiness":3738,"money_24h":45800},"OceanicFuture":{"happiness":5470,"population":4117,"demandHappiness":4117,"money_24h":51700},"VirtualFuture":{"happiness":6540,"population":4508,"demandHappiness":4508,"money_24h":57900},"SpaceAgeMars":{"happiness":10460,"population":7136,"demandHappiness":7136,"money_24h":96700},"SpaceAgeAsteroidBelt":{"happiness":11370,"population":7751,"demandHappiness":7751,"money_24h":107100},"SpaceAgeVenus":{"happiness":12280,"population":8378,"demandHappiness":8378,"money_24h":118000},"SpaceAgeJupiterMoon":{"happiness":13230,"population":9022,"demandHappiness":9022,"money_24h":129500},"SpaceAgeTitan":{"happiness":14190,"population":9677,"demandHappiness":9677,"money_24h":141600},"SpaceAgeSpaceHub":{"happiness":15180,"population":10350,"demandHappiness":10350,"money_24h":154300}} },
+    "R_MultiAge_SportBonus20d": { prod: {"BronzeAge":{"happiness":650,"population":162,"demandHappiness":162,"money_24h":1000},"IronAge":{"happiness":1130,"population":348,"demandHappiness":348,"money_24h":2300},"EarlyMiddleAge":{"happiness":1240,"population":534,"demandHappiness":534,"money_24h":3900},"HighMiddleAge":{"happiness":1390,"population":750,"demandHappiness":750,"money_24h":5500},"LateMiddleAge":{"happiness":1550,"population":984,"demandHappiness":984,"money_24h":7200},"ColonialAge":{"happiness":1820,"population":1242,"demandHappiness":1242,"money_24h":11000},"IndustrialAge":{"happiness":2050,"population":1518,"demandHappiness":1518,"money_24h":13700},"ProgressiveEra":{"happiness":2260,"population":1812,"demandHappiness":1812,"money_24h":16600},"ModernEra":{"happiness":2410,"population":2124,"demandHappiness":2124,"money_24h":20700},"PostModernEra":{"happiness":2510,"population":2448,"demandHappiness":2448,"money_24h":26000},"ContemporaryEra":{"happiness":2920,"population":2790,"demandHappiness":2790,"money_24h":33900},"TomorrowEra":{"happiness":3550,"population":3144,"demandHappiness":3144,"money_24h":39200},"FutureEra":{"happiness":4250,"population":3516,"demandHappiness":3516,"money_24h":44900},"ArcticFuture":{"happiness":4950,"population":3900,"demandHappiness":3900,"money_24h":51100},"OceanicFuture":{"happiness":5710,"population":4296,"demandHappiness":4296,"money_24h":57600},"VirtualFuture":{"happiness":6820,"population":4704,"demandHappiness":4704,"money_24h":64500},"SpaceAgeMars":{"happiness":10910,"population":7446,"demandHappiness":7446,"money_24h":107700},"SpaceAgeAsteroidBelt":{"happiness":11860,"population":8088,"demandHappiness":8088,"money_24h":119300},"SpaceAgeVenus":{"happiness":12810,"population":8742,"demandHappiness":8742,"money_24h":131500},"SpaceAgeJupiterMoon":{"happiness":13800,"population":9414,"demandHappiness":9414,"money_24h":144300},"SpaceAgeTitan":{"happiness":14800,"population":10098,"demandHappiness":10098,"money_24h":157800},"SpaceAgeSpaceHub":{"happiness":15840,"population":10800,"demandHappiness":10800,"money_24h":171900}} },
+    "R_MultiAge_SportBonus20e": { prod: {"BronzeAge":{"happiness":690,"population":169,"demandHappiness":169,"money_24h":1100},"IronAge":{"happiness":1200,"population":363,"demandHappiness":363,"money_24h":2500},"EarlyMiddleAge":{"happiness":1320,"population":556,"demandHappiness":556,"money_24h":4200},"HighMiddleAge":{"happiness":1480,"population":781,"demandHappiness":781,"money_24h":5900},"LateMiddleAge":{"happiness":1650,"population":1025,"demandHappiness":1025,"money_24h":7800},"ColonialAge":{"happiness":1930,"population":1294,"demandHappiness":1294,"money_24h":11800},"IndustrialAge":{"happiness":2180,"population":1581,"demandHappiness":1581,"money_24h":14700},"ProgressiveEra":{"happiness":2400,"population":1888,"demandHappiness":1888,"money_24h":17900},"ModernEra":{"happiness":2560,"population":2213,"demandHappiness":2213,"money_24h":22300},"PostModernEra":{"happiness":2670,"population":2550,"demandHappiness":2550,"money_24h":28000},"ContemporaryEra":{"happiness":3100,"population":2906,"demandHappiness":2906,"money_24h":36500},"TomorrowEra":{"happiness":3770,"population":3275,"demandHappiness":3275,"money_24h":42200},"FutureEra":{"happiness":4510,"population":3663,"demandHappiness":3663,"money_24h":48400},"ArcticFuture":{"happiness":5260,"population":4063,"demandHappiness":4063,"money_24h":55000},"OceanicFuture":{"happiness":6060,"population":4475,"demandHappiness":4475,"money_24h":62000},"VirtualFuture":{"happiness":7240,"population":4900,"demandHappiness":4900,"money_24h":69400},"SpaceAgeMars":{"happiness":11590,"population":7756,"demandHappiness":7756,"money_24h":116000},"SpaceAgeAsteroidBelt":{"happiness":12600,"population":8425,"demandHappiness":8425,"money_24h":128500},"SpaceAgeVenus":{"happiness":13610,"population":9106,"demandHappiness":9106,"money_24h":141600},"SpaceAgeJupiterMoon":{"happiness":14660,"population":9806,"demandHappiness":9806,"money_24h":155400},"SpaceAgeTitan":{"happiness":15720,"population":10519,"demandHappiness":10519,"money_24h":169900},"SpaceAgeSpaceHub":{"happiness":16820,"population":11250,"demandHappiness":11250,"money_24h":185100}} },
+    "R_MultiAge_SportBonus20f": { prod: {"BronzeAge":{"happiness":750,"population":176,"demandHappiness":176,"money_24h":1200},"IronAge":{"happiness":1300,"population":377,"demandHappiness":377,"money_24h":2800},"EarlyMiddleAge":{"happiness":1430,"population":579,"demandHappiness":579,"money_24h":4700},"HighMiddleAge":{"happiness":1600,"population":813,"demandHappiness":813,"money_24h":6600},"LateMiddleAge":{"happiness":1780,"population":1066,"demandHappiness":1066,"money_24h":8700},"ColonialAge":{"happiness":2100,"population":1346,"demandHappiness":1346,"money_24h":13200},"IndustrialAge":{"happiness":2370,"population":1645,"demandHappiness":1645,"money_24h":16500},"ProgressiveEra":{"happiness":2600,"population":1963,"demandHappiness":1963,"money_24h":20000},"ModernEra":{"happiness":2780,"population":2301,"demandHappiness":2301,"money_24h":24900},"PostModernEra":{"happiness":2900,"population":2652,"demandHappiness":2652,"money_24h":31300},"ContemporaryEra":{"happiness":3360,"population":3023,"demandHappiness":3023,"money_24h":40800},"TomorrowEra":{"happiness":4080,"population":3406,"demandHappiness":3406,"money_24h":47200},"FutureEra":{"happiness":4890,"population":3809,"demandHappiness":3809,"money_24h":54100},"ArcticFuture":{"happiness":5700,"population":4225,"demandHappiness":4225,"money_24h":61500},"OceanicFuture":{"happiness":6580,"population":4654,"demandHappiness":4654,"money_24h":69400},"VirtualFuture":{"happiness":7860,"population":5096,"demandHappiness":5096,"money_24h":77700},"SpaceAgeMars":{"happiness":12570,"population":8067,"demandHappiness":8067,"money_24h":129800},"SpaceAgeAsteroidBelt":{"happiness":13660,"population":8762,"demandHappiness":8762,"money_24h":143800},"SpaceAgeVenus":{"happiness":14760,"population":9471,"demandHappiness":9471,"money_24h":158500},"SpaceAgeJupiterMoon":{"happiness":15900,"population":10199,"demandHappiness":10199,"money_24h":173900},"SpaceAgeTitan":{"happiness":17050,"population":10940,"demandHappiness":10940,"money_24h":190200},"SpaceAgeSpaceHub":{"happiness":18240,"population":11700,"demandHappiness":11700,"money_24h":207100}} },
+    "R_MultiAge_SportBonus20g": { prod: {"BronzeAge":{"happiness":770,"population":182,"demandHappiness":182,"money_24h":1300},"IronAge":{"happiness":1340,"population":392,"demandHappiness":392,"money_24h":3100},"EarlyMiddleAge":{"happiness":1480,"population":601,"demandHappiness":601,"money_24h":5100},"HighMiddleAge":{"happiness":1650,"population":844,"demandHappiness":844,"money_24h":7100},"LateMiddleAge":{"happiness":1840,"population":1107,"demandHappiness":1107,"money_24h":9400},"ColonialAge":{"happiness":2160,"population":1397,"demandHappiness":1397,"money_24h":14400},"IndustrialAge":{"happiness":2440,"population":1708,"demandHappiness":1708,"money_24h":17900},"ProgressiveEra":{"happiness":2680,"population":2039,"demandHappiness":2039,"money_24h":21700},"ModernEra":{"happiness":2860,"population":2390,"demandHappiness":2390,"money_24h":27000},"PostModernEra":{"happiness":2980,"population":2754,"demandHappiness":2754,"money_24h":34000},"ContemporaryEra":{"happiness":3470,"population":3139,"demandHappiness":3139,"money_24h":44300},"TomorrowEra":{"happiness":4210,"population":3537,"demandHappiness":3537,"money_24h":51300},"FutureEra":{"happiness":5040,"population":3956,"demandHappiness":3956,"money_24h":58800},"ArcticFuture":{"happiness":5870,"population":4388,"demandHappiness":4388,"money_24h":66800},"OceanicFuture":{"happiness":6770,"population":4833,"demandHappiness":4833,"money_24h":75300},"VirtualFuture":{"happiness":8090,"population":5292,"demandHappiness":5292,"money_24h":84300},"SpaceAgeMars":{"happiness":12950,"population":8377,"demandHappiness":8377,"money_24h":140800},"SpaceAgeAsteroidBelt":{"happiness":14070,"population":9099,"demandHappiness":9099,"money_24h":156000},"SpaceAgeVenus":{"happiness":15200,"population":9835,"demandHappiness":9835,"money_24h":172000},"SpaceAgeJupiterMoon":{"happiness":16370,"population":10591,"demandHappiness":10591,"money_24h":188700},"SpaceAgeTitan":{"happiness":17560,"population":11360,"demandHappiness":11360,"money_24h":206400},"SpaceAgeSpaceHub":{"happiness":18790,"population":12150,"demandHappiness":12150,"money_24h":224800}} },
+    "R_MultiAge_SportBonus20h": { prod: {"BronzeAge":{"happiness":840,"population":196,"demandHappiness":196,"money_24h":1400},"IronAge":{"happiness":1440,"population":421,"demandHappiness":421,"money_24h":3200},"EarlyMiddleAge":{"happiness":1600,"population":645,"demandHappiness":645,"money_24h":5400},"HighMiddleAge":{"happiness":1780,"population":906,"demandHappiness":906,"money_24h":7600},"LateMiddleAge":{"happiness":1990,"population":1189,"demandHappiness":1189,"money_24h":10000},"ColonialAge":{"happiness":2340,"population":1501,"demandHappiness":1501,"money_24h":15200},"IndustrialAge":{"happiness":2630,"population":1834,"demandHappiness":1834,"money_24h":19000},"ProgressiveEra":{"happiness":2890,"population":2190,"demandHappiness":2190,"money_24h":23000},"ModernEra":{"happiness":3100,"population":2567,"demandHappiness":2567,"money_24h":28600},"PostModernEra":{"happiness":3230,"population":2958,"demandHappiness":2958,"money_24h":36000},"ContemporaryEra":{"happiness":3750,"population":3371,"demandHappiness":3371,"money_24h":46900},"TomorrowEra":{"happiness":4550,"population":3799,"demandHappiness":3799,"money_24h":54300},"FutureEra":{"happiness":5450,"population":4249,"demandHappiness":4249,"money_24h":62200},"ArcticFuture":{"happiness":6350,"population":4713,"demandHappiness":4713,"money_24h":70700},"OceanicFuture":{"happiness":7320,"population":5191,"demandHappiness":5191,"money_24h":79700},"VirtualFuture":{"happiness":8750,"population":5684,"demandHappiness":5684,"money_24h":89300},"SpaceAgeMars":{"happiness":14000,"population":8997,"demandHappiness":8997,"money_24h":149100},"SpaceAgeAsteroidBelt":{"happiness":15220,"population":9773,"demandHappiness":9773,"money_24h":165200},"SpaceAgeVenus":{"happiness":16440,"population":10563,"demandHappiness":10563,"money_24h":182100},"SpaceAgeJupiterMoon":{"happiness":17710,"population":11375,"demandHappiness":11375,"money_24h":199800},"SpaceAgeTitan":{"happiness":18990,"population":12202,"demandHappiness":12202,"money_24h":218500},"SpaceAgeSpaceHub":{"happiness":20310,"population":13050,"demandHappiness":13050,"money_24h":238000}} },
+    "R_MultiAge_SportBonus20i": { prod: {"BronzeAge":{"happiness":900,"population":209,"demandHappiness":209,"money_24h":1500},"IronAge":{"happiness":1550,"population":450,"demandHappiness":450,"money_24h":3500},"EarlyMiddleAge":{"happiness":1720,"population":690,"demandHappiness":690,"money_24h":5800},"HighMiddleAge":{"happiness":1920,"population":969,"demandHappiness":969,"money_24h":8100},"LateMiddleAge":{"happiness":2140,"population":1271,"demandHappiness":1271,"money_24h":10700},"ColonialAge":{"happiness":2510,"population":1604,"demandHappiness":1604,"money_24h":16300},"IndustrialAge":{"happiness":2830,"population":1961,"demandHappiness":1961,"money_24h":20400},"ProgressiveEra":{"happiness":3110,"population":2341,"demandHappiness":2341,"money_24h":24700},"ModernEra":{"happiness":3330,"population":2744,"demandHappiness":2744,"money_24h":30700},"PostModernEra":{"happiness":3470,"population":3162,"demandHappiness":3162,"money_24h":38700},"ContemporaryEra":{"happiness":4030,"population":3604,"demandHappiness":3604,"money_24h":50300},"TomorrowEra":{"happiness":4890,"population":4061,"demandHappiness":4061,"money_24h":58300},"FutureEra":{"happiness":5860,"population":4542,"demandHappiness":4542,"money_24h":66800},"ArcticFuture":{"happiness":6820,"population":5038,"demandHappiness":5038,"money_24h":75900},"OceanicFuture":{"happiness":7880,"population":5549,"demandHappiness":5549,"money_24h":85600},"VirtualFuture":{"happiness":9410,"population":6076,"demandHappiness":6076,"money_24h":95900},"SpaceAgeMars":{"happiness":15050,"population":9618,"demandHappiness":9618,"money_24h":160200},"SpaceAgeAsteroidBelt":{"happiness":16360,"population":10447,"demandHappiness":10447,"money_24h":177400},"SpaceAgeVenus":{"happiness":17680,"population":11292,"demandHappiness":11292,"money_24h":195600},"SpaceAgeJupiterMoon":{"happiness":19040,"population":12160,"demandHappiness":12160,"money_24h":214600},"SpaceAgeTitan":{"happiness":20420,"population":13043,"demandHappiness":13043,"money_24h":234700},"SpaceAgeSpaceHub":{"happiness":21840,"population":13950,"demandHappiness":13950,"money_24h":255600}} },
+    "R_MultiAge_SoccerBonus19a": { prod: {"BronzeAge":{"happiness":230,"population":45,"demandHappiness":45,"money_24h":200},"IronAge":{"happiness":310,"population":96,"demandHappiness":96,"money_24h":450},"EarlyMiddleAge":{"happiness":340,"population":147,"demandHappiness":147,"money_24h":850},"HighMiddleAge":{"happiness":380,"population":206,"demandHappiness":206,"money_24h":1200},"LateMiddleAge":{"happiness":430,"population":271,"demandHappiness":271,"money_24h":1600},"ColonialAge":{"happiness":500,"population":342,"demandHappiness":342,"money_24h":2400},"IndustrialAge":{"happiness":570,"population":417,"demandHappiness":417,"money_24h":3000},"ProgressiveEra":{"happiness":620,"population":498,"demandHappiness":498,"money_24h":3600},"ModernEra":{"happiness":670,"population":584,"demandHappiness":584,"money_24h":4500},"PostModernEra":{"happiness":690,"population":673,"demandHappiness":673,"money_24h":5600},"ContemporaryEra":{"happiness":810,"population":767,"demandHappiness":767,"money_24h":7300},"TomorrowEra":{"happiness":980,"population":865,"demandHappiness":865,"money_24h":8400},"FutureEra":{"happiness":1170,"population":967,"demandHappiness":967,"money_24h":9700},"ArcticFuture":{"happiness":1360,"population":1073,"demandHappiness":1073,"money_24h":11000},"OceanicFuture":{"happiness":1580,"population":1181,"demandHappiness":1181,"money_24h":12400},"VirtualFuture":{"happiness":1880,"population":1294,"demandHappiness":1294,"money_24h":13900},"SpaceAgeMars":{"happiness":3010,"population":2048,"demandHappiness":2048,"money_24h":23200},"SpaceAgeAsteroidBelt":{"happiness":3270,"population":2224,"demandHappiness":2224,"money_24h":25700},"SpaceAgeVenus":{"happiness":3540,"population":2404,"demandHappiness":2404,"money_24h":28300},"SpaceAgeJupiterMoon":{"happiness":3810,"population":2589,"demandHappiness":2589,"money_24h":31100},"SpaceAgeTitan":{"happiness":4080,"population":2777,"demandHappiness":2777,"money_24h":34000},"SpaceAgeSpaceHub":{"happiness":4370,"population":2970,"demandHappiness":2970,"money_24h":37000}} },
+    "R_MultiAge_SoccerBonus19b": { prod: {"BronzeAge":{"happiness":230,"population":49,"demandHappiness":49,"money_24h":250},"IronAge":{"happiness":340,"population":104,"demandHappiness":104,"money_24h":550},"EarlyMiddleAge":{"happiness":380,"population":160,"demandHappiness":160,"money_24h":900},"HighMiddleAge":{"happiness":420,"population":225,"demandHappiness":225,"money_24h":1250},"LateMiddleAge":{"happiness":470,"population":295,"demandHappiness":295,"money_24h":1700},"ColonialAge":{"happiness":550,"population":373,"demandHappiness":373,"money_24h":2500},"IndustrialAge":{"happiness":620,"population":455,"demandHappiness":455,"money_24h":3200},"ProgressiveEra":{"happiness":680,"population":544,"demandHappiness":544,"money_24h":3800},"ModernEra":{"happiness":730,"population":637,"demandHappiness":637,"money_24h":4800},"PostModernEra":{"happiness":760,"population":734,"demandHappiness":734,"money_24h":6000},"ContemporaryEra":{"happiness":890,"population":837,"demandHappiness":837,"money_24h":7800},"TomorrowEra":{"happiness":1080,"population":943,"demandHappiness":943,"money_24h":9100},"FutureEra":{"happiness":1290,"population":1055,"demandHappiness":1055,"money_24h":10400},"ArcticFuture":{"happiness":1500,"population":1170,"demandHappiness":1170,"money_24h":11800},"OceanicFuture":{"happiness":1730,"population":1289,"demandHappiness":1289,"money_24h":13300},"VirtualFuture":{"happiness":2070,"population":1411,"demandHappiness":1411,"money_24h":14900},"SpaceAgeMars":{"happiness":3310,"population":2234,"demandHappiness":2234,"money_24h":24900},"SpaceAgeAsteroidBelt":{"happiness":3600,"population":2426,"demandHappiness":2426,"money_24h":27500},"SpaceAgeVenus":{"happiness":3890,"population":2623,"demandHappiness":2623,"money_24h":30400},"SpaceAgeJupiterMoon":{"happiness":4190,"population":2824,"demandHappiness":2824,"money_24h":33300},"SpaceAgeTitan":{"happiness":4490,"population":3029,"demandHappiness":3029,"money_24h":36400},"SpaceAgeSpaceHub":{"happiness":4810,"population":3240,"demandHappiness":3240,"money_24h":39700}} },
+    "R_MultiAge_SoccerBonus19c": { prod: {"BronzeAge":{"happiness":240,"population":53,"demandHappiness":53,"money_24h":250},"IronAge":{"happiness":370,"population":113,"demandHappiness":113,"money_24h":600},"EarlyMiddleAge":{"happiness":410,"population":174,"demandHappiness":174,"money_24h":950},"HighMiddleAge":{"happiness":460,"population":244,"demandHappiness":244,"money_24h":1350},"LateMiddleAge":{"happiness":510,"population":320,"demandHappiness":320,"money_24h":1800},"ColonialAge":{"happiness":600,"population":404,"demandHappiness":404,"money_24h":2700},"IndustrialAge":{"happiness":680,"population":493,"demandHappiness":493,"money_24h":3400},"ProgressiveEra":{"happiness":750,"population":589,"demandHappiness":589,"money_24h":4100},"ModernEra":{"happiness":800,"population":690,"demandHappiness":690,"money_24h":5100},"PostModernEra":{"happiness":830,"population":796,"demandHappiness":796,"money_24h":6400},"ContemporaryEra":{"happiness":970,"population":907,"demandHappiness":907,"money_24h":8300},"TomorrowEra":{"happiness":1170,"population":1022,"demandHappiness":1022,"money_24h":9700},"FutureEra":{"happiness":1410,"population":1143,"demandHappiness":1143,"money_24h":11100},"ArcticFuture":{"happiness":1640,"population":1268,"demandHappiness":1268,"money_24h":12600},"OceanicFuture":{"happiness":1890,"population":1396,"demandHappiness":1396,"money_24h":14200},"VirtualFuture":{"happiness":2260,"population":1529,"demandHappiness":1529,"money_24h":15900},"SpaceAgeMars":{"happiness":3610,"population":2420,"demandHappiness":2420,"money_24h":26500},"SpaceAgeAsteroidBelt":{"happiness":3930,"population":2629,"demandHappiness":2629,"money_24h":29400},"SpaceAgeVenus":{"happiness":4240,"population":2841,"demandHappiness":2841,"money_24h":32400},"SpaceAgeJupiterMoon":{"happiness":4570,"population":3060,"demandHappiness":3060,"money_24h":35500},"SpaceAgeTitan":{"happiness":4900,"population":3282,"demandHappiness":3282,"money_24h":38800},"SpaceAgeSpaceHub":{"happiness":5240,"population":3510,"demandHappiness":3510,"money_24h":42300}} },
+    "R_MultiAge_SoccerBonus19d": { prod: {"BronzeAge":{"happiness":250,"population":57,"demandHappiness":57,"money_24h":300},"IronAge":{"happiness":400,"population":122,"demandHappiness":122,"money_24h":650},"EarlyMiddleAge":{"happiness":450,"population":187,"demandHappiness":187,"money_24h":1100},"HighMiddleAge":{"happiness":500,"population":263,"demandHappiness":263,"money_24h":1450},"LateMiddleAge":{"happiness":560,"population":344,"demandHappiness":344,"money_24h":1900},"ColonialAge":{"happiness":650,"population":435,"demandHappiness":435,"money_24h":2900},"IndustrialAge":{"happiness":740,"population":531,"demandHappiness":531,"money_24h":3600},"ProgressiveEra":{"happiness":810,"population":634,"demandHappiness":634,"money_24h":4400},"ModernEra":{"happiness":870,"population":743,"demandHappiness":743,"money_24h":5400},"PostModernEra":{"happiness":900,"population":857,"demandHappiness":857,"money_24h":6800},"ContemporaryEra":{"happiness":1050,"population":977,"demandHappiness":977,"money_24h":8900},"TomorrowEra":{"happiness":1270,"population":1100,"demandHappiness":1100,"money_24h":10300},"FutureEra":{"happiness":1520,"population":1231,"demandHappiness":1231,"money_24h":11800},"ArcticFuture":{"happiness":1770,"population":1365,"demandHappiness":1365,"money_24h":13400},"OceanicFuture":{"happiness":2050,"population":1504,"demandHappiness":1504,"money_24h":15100},"VirtualFuture":{"happiness":2450,"population":1646,"demandHappiness":1646,"money_24h":16900},"SpaceAgeMars":{"happiness":3910,"population":2606,"demandHappiness":2606,"money_24h":28200},"SpaceAgeAsteroidBelt":{"happiness":4250,"population":2831,"demandHappiness":2831,"money_24h":31200},"SpaceAgeVenus":{"happiness":4600,"population":3060,"demandHappiness":3060,"money_24h":34400},"SpaceAgeJupiterMoon":{"happiness":4950,"population":3295,"demandHappiness":3295,"money_24h":37800},"SpaceAgeTitan":{"happiness":5310,"population":3534,"demandHappiness":3534,"money_24h":41300},"SpaceAgeSpaceHub":{"happiness":5680,"population":3780,"demandHappiness":3780,"money_24h":45000}} },
+    "D_MultiAge_ArcheologyBonus22a": { prod: {"BronzeAge":{"happiness":220},"IronAge":{"happiness":330},"EarlyMiddleAge":{"happiness":390},"HighMiddleAge":{"happiness":460},"LateMiddleAge":{"happiness":540},"ColonialAge":{"happiness":640},"IndustrialAge":{"happiness":720},"ProgressiveEra":{"happiness":790},"ModernEra":{"happiness":850},"PostModernEra":{"happiness":880},"ContemporaryEra":{"happiness":1030},"TomorrowEra":{"happiness":1250},"FutureEra":{"happiness":1580},"ArcticFuture":{"happiness":1840},"OceanicFuture":{"happiness":2240},"VirtualFuture":{"happiness":2820},"SpaceAgeMars":{"happiness":4520},"SpaceAgeAsteroidBelt":{"happiness":5150},"SpaceAgeVenus":{"happiness":5830},"SpaceAgeJupiterMoon":{"happiness":6570},"SpaceAgeTitan":{"happiness":7350},"SpaceAgeSpaceHub":{"happiness":8190}} },
+    "R_MultiAge_SummerBonus16": { prod: {"BronzeAge":{"happiness":380,"population":7,"demandHappiness":7,"money_24h":380},"IronAge":{"happiness":650,"population":7,"demandHappiness":7,"money_24h":900},"EarlyMiddleAge":{"happiness":720,"population":7,"demandHappiness":7,"money_24h":1500},"HighMiddleAge":{"happiness":800,"population":7,"demandHappiness":7,"money_24h":2100},"LateMiddleAge":{"happiness":900,"population":7,"demandHappiness":7,"money_24h":2780},"ColonialAge":{"happiness":1060,"population":7,"demandHappiness":7,"money_24h":4230},"IndustrialAge":{"happiness":1190,"population":7,"demandHappiness":7,"money_24h":5270},"ProgressiveEra":{"happiness":1310,"population":7,"demandHappiness":7,"money_24h":6390},"ModernEra":{"happiness":1400,"population":7,"demandHappiness":7,"money_24h":8270},"PostModernEra":{"happiness":1460,"population":7,"demandHappiness":7,"money_24h":10000},"ContemporaryEra":{"happiness":1690,"population":7,"demandHappiness":7,"money_24h":12500},"TomorrowEra":{"happiness":2050,"population":7,"demandHappiness":7,"money_24h":14470},"FutureEra":{"happiness":2460,"population":7,"demandHappiness":7,"money_24h":15900},"ArcticFuture":{"happiness":2870,"population":7,"demandHappiness":7,"money_24h":18060},"OceanicFuture":{"happiness":3310,"population":7,"demandHappiness":7,"money_24h":20370},"VirtualFuture":{"happiness":3950,"population":7,"demandHappiness":7,"money_24h":22810},"SpaceAgeMars":{"happiness":6320,"population":7,"demandHappiness":7,"money_24h":38110},"SpaceAgeAsteroidBelt":{"happiness":6870,"population":7,"demandHappiness":7,"money_24h":42210},"SpaceAgeVenus":{"happiness":7420,"population":7,"demandHappiness":7,"money_24h":46530},"SpaceAgeJupiterMoon":{"happiness":8000,"population":7,"demandHappiness":7,"money_24h":51070},"SpaceAgeTitan":{"happiness":8580,"population":7,"demandHappiness":7,"money_24h":55830},"SpaceAgeSpaceHub":{"happiness":9170,"population":7,"demandHappiness":7,"money_24h":60820}} },
+    "R_MultiAge_SummerBonus2": { prod: {"BronzeAge":{"population":28,"demandHappiness":28,"money_24h":350},"IronAge":{"population":61,"demandHappiness":61,"money_24h":830},"EarlyMiddleAge":{"population":93,"demandHappiness":93,"money_24h":1380},"HighMiddleAge":{"population":131,"demandHappiness":131,"money_24h":1930},"LateMiddleAge":{"population":172,"demandHappiness":172,"money_24h":2550},"ColonialAge":{"population":217,"demandHappiness":217,"money_24h":3890},"IndustrialAge":{"population":266,"demandHappiness":266,"money_24h":4840},"ProgressiveEra":{"population":317,"demandHappiness":317,"money_24h":5880},"ModernEra":{"population":372,"demandHappiness":372,"money_24h":7310},"PostModernEra":{"population":428,"demandHappiness":428,"money_24h":9200},"ContemporaryEra":{"population":488,"demandHappiness":488,"money_24h":12000},"TomorrowEra":{"population":550,"demandHappiness":550,"money_24h":14000},"FutureEra":{"population":615,"demandHappiness":615,"money_24h":16000},"ArcticFuture":{"population":683,"demandHappiness":683,"money_24h":18060},"OceanicFuture":{"population":752,"demandHappiness":752,"money_24h":20370},"VirtualFuture":{"population":823,"demandHappiness":823,"money_24h":22810},"SpaceAgeMars":{"population":1303,"demandHappiness":1303,"money_24h":38110},"SpaceAgeAsteroidBelt":{"population":1415,"demandHappiness":1415,"money_24h":42210},"SpaceAgeVenus":{"population":1530,"demandHappiness":1530,"money_24h":46530},"SpaceAgeJupiterMoon":{"population":1647,"demandHappiness":1647,"money_24h":51070},"SpaceAgeTitan":{"population":1767,"demandHappiness":1767,"money_24h":55830},"SpaceAgeSpaceHub":{"population":1890,"demandHappiness":1890,"money_24h":60820}} },
+    "R_MultiAge_SpringBonus17a": { prod: {"BronzeAge":{"happiness":60,"population":60,"demandHappiness":60,"money_24h":650},"IronAge":{"happiness":130,"population":130,"demandHappiness":130,"money_24h":1500},"EarlyMiddleAge":{"happiness":200,"population":200,"demandHappiness":200,"money_24h":2500},"HighMiddleAge":{"happiness":275,"population":275,"demandHappiness":275,"money_24h":3500},"LateMiddleAge":{"happiness":360,"population":360,"demandHappiness":360,"money_24h":4800},"ColonialAge":{"happiness":450,"population":450,"demandHappiness":450,"money_24h":7200},"IndustrialAge":{"happiness":550,"population":550,"demandHappiness":550,"money_24h":9000},"ProgressiveEra":{"happiness":660,"population":660,"demandHappiness":660,"money_24h":11000},"ModernEra":{"happiness":780,"population":780,"demandHappiness":780,"money_24h":13500},"PostModernEra":{"happiness":900,"population":900,"demandHappiness":900,"money_24h":17000},"ContemporaryEra":{"happiness":1000,"population":1000,"demandHappiness":1000,"money_24h":22200},"TomorrowEra":{"happiness":1150,"population":1150,"demandHappiness":1150,"money_24h":25000},"FutureEra":{"happiness":1300,"population":1300,"demandHappiness":1300,"money_24h":30000},"ArcticFuture":{"happiness":1430,"population":1430,"demandHappiness":1430,"money_24h":33500},"OceanicFuture":{"happiness":1580,"population":1580,"demandHappiness":1580,"money_24h":37000},"VirtualFuture":{"happiness":1730,"population":1730,"demandHappiness":1730,"money_24h":41440},"SpaceAgeMars":{"happiness":2739,"population":2739,"demandHappiness":2739,"money_24h":69220},"SpaceAgeAsteroidBelt":{"happiness":2975,"population":2975,"demandHappiness":2975,"money_24h":76670},"SpaceAgeVenus":{"happiness":3216,"population":3216,"demandHappiness":3216,"money_24h":84520},"SpaceAgeJupiterMoon":{"happiness":3463,"population":3463,"demandHappiness":3463,"money_24h":92770},"SpaceAgeTitan":{"happiness":3715,"population":3715,"demandHappiness":3715,"money_24h":101420},"SpaceAgeSpaceHub":{"happiness":3973,"population":3973,"demandHappiness":3973,"money_24h":110480}} },
+    "R_MultiAge_SpringBonus17b": { prod: {"BronzeAge":{"happiness":76,"population":76,"demandHappiness":76,"money_24h":680},"IronAge":{"happiness":162,"population":162,"demandHappiness":162,"money_24h":1630},"EarlyMiddleAge":{"happiness":249,"population":249,"demandHappiness":249,"money_24h":2720},"HighMiddleAge":{"happiness":350,"population":350,"demandHappiness":350,"money_24h":3810},"LateMiddleAge":{"happiness":459,"population":459,"demandHappiness":459,"money_24h":5030},"ColonialAge":{"happiness":580,"population":580,"demandHappiness":580,"money_24h":7660},"IndustrialAge":{"happiness":708,"population":708,"demandHappiness":708,"money_24h":9550},"ProgressiveEra":{"happiness":846,"population":846,"demandHappiness":846,"money_24h":11590},"ModernEra":{"happiness":991,"population":991,"demandHappiness":991,"money_24h":14420},"PostModernEra":{"happiness":1142,"population":1142,"demandHappiness":1142,"money_24h":18140},"ContemporaryEra":{"happiness":1302,"population":1302,"demandHappiness":1302,"money_24h":23610},"TomorrowEra":{"happiness":1467,"population":1467,"demandHappiness":1467,"money_24h":27340},"FutureEra":{"happiness":1641,"population":1641,"demandHappiness":1641,"money_24h":31330},"ArcticFuture":{"happiness":1820,"population":1820,"demandHappiness":1820,"money_24h":35600},"OceanicFuture":{"happiness":2005,"population":2005,"demandHappiness":2005,"money_24h":40150},"VirtualFuture":{"happiness":2195,"population":2195,"demandHappiness":2195,"money_24h":44970},"SpaceAgeMars":{"happiness":3475,"population":3475,"demandHappiness":3475,"money_24h":75110},"SpaceAgeAsteroidBelt":{"happiness":3774,"population":3774,"demandHappiness":3774,"money_24h":83200},"SpaceAgeVenus":{"happiness":4080,"population":4080,"demandHappiness":4080,"money_24h":91710},"SpaceAgeJupiterMoon":{"happiness":4393,"population":4393,"demandHappiness":4393,"money_24h":100660},"SpaceAgeTitan":{"happiness":4712,"population":4712,"demandHappiness":4712,"money_24h":110050},"SpaceAgeSpaceHub":{"happiness":5040,"population":5040,"demandHappiness":5040,"money_24h":119880}} },
+    "R_MultiAge_SpringBonus17c": { prod: {"BronzeAge":{"happiness":86,"population":86,"demandHappiness":86,"money_24h":720},"IronAge":{"happiness":186,"population":186,"demandHappiness":186,"money_24h":1730},"EarlyMiddleAge":{"happiness":285,"population":285,"demandHappiness":285,"money_24h":2880},"HighMiddleAge":{"happiness":400,"population":400,"demandHappiness":400,"money_24h":4030},"LateMiddleAge":{"happiness":525,"population":525,"demandHappiness":525,"money_24h":5330},"ColonialAge":{"happiness":662,"population":662,"demandHappiness":662,"money_24h":8110},"IndustrialAge":{"happiness":810,"population":810,"demandHappiness":810,"money_24h":10110},"ProgressiveEra":{"happiness":966,"population":966,"demandHappiness":966,"money_24h":12270},"ModernEra":{"happiness":1133,"population":1133,"demandHappiness":1133,"money_24h":15260},"PostModernEra":{"happiness":1306,"population":1306,"demandHappiness":1306,"money_24h":19200},"ContemporaryEra":{"happiness":1488,"population":1488,"demandHappiness":1488,"money_24h":25000},"TomorrowEra":{"happiness":1677,"population":1677,"demandHappiness":1677,"money_24h":28940},"FutureEra":{"happiness":1875,"population":1875,"demandHappiness":1875,"money_24h":33180},"ArcticFuture":{"happiness":2080,"population":2080,"demandHappiness":2080,"money_24h":37700},"OceanicFuture":{"happiness":2291,"population":2291,"demandHappiness":2291,"money_24h":42510},"VirtualFuture":{"happiness":2509,"population":2509,"demandHappiness":2509,"money_24h":47610},"SpaceAgeMars":{"happiness":3971,"population":3971,"demandHappiness":3971,"money_24h":79530},"SpaceAgeAsteroidBelt":{"happiness":4314,"population":4314,"demandHappiness":4314,"money_24h":88090},"SpaceAgeVenus":{"happiness":4662,"population":4662,"demandHappiness":4662,"money_24h":97110},"SpaceAgeJupiterMoon":{"happiness":5021,"population":5021,"demandHappiness":5021,"money_24h":106580},"SpaceAgeTitan":{"happiness":5386,"population":5386,"demandHappiness":5386,"money_24h":116520},"SpaceAgeSpaceHub":{"happiness":5760,"population":5760,"demandHappiness":5760,"money_24h":126930}} },
+    "R_MultiAge_SpringBonus17d": { prod: {"BronzeAge":{"happiness":97,"population":97,"demandHappiness":97,"money_24h":760},"IronAge":{"happiness":209,"population":209,"demandHappiness":209,"money_24h":1820},"EarlyMiddleAge":{"happiness":320,"population":320,"demandHappiness":320,"money_24h":3040},"HighMiddleAge":{"happiness":450,"population":450,"demandHappiness":450,"money_24h":4260},"LateMiddleAge":{"happiness":590,"population":590,"demandHappiness":590,"money_24h":5620},"ColonialAge":{"happiness":745,"population":745,"demandHappiness":745,"money_24h":8570},"IndustrialAge":{"happiness":911,"population":911,"demandHappiness":911,"money_24h":10670},"ProgressiveEra":{"happiness":1087,"population":1087,"demandHappiness":1087,"money_24h":12950},"ModernEra":{"happiness":1274,"population":1274,"demandHappiness":1274,"money_24h":16110},"PostModernEra":{"happiness":1469,"population":1469,"demandHappiness":1469,"money_24h":20270},"ContemporaryEra":{"happiness":1674,"population":1674,"demandHappiness":1674,"money_24h":26390},"TomorrowEra":{"happiness":1886,"population":1886,"demandHappiness":1886,"money_24h":30550},"FutureEra":{"happiness":2110,"population":2110,"demandHappiness":2110,"money_24h":35020},"ArcticFuture":{"happiness":2340,"population":2340,"demandHappiness":2340,"money_24h":39790},"OceanicFuture":{"happiness":2578,"population":2578,"demandHappiness":2578,"money_24h":44870},"VirtualFuture":{"happiness":2822,"population":2822,"demandHappiness":2822,"money_24h":50260},"SpaceAgeMars":{"happiness":4468,"population":4468,"demandHappiness":4468,"money_24h":83950},"SpaceAgeAsteroidBelt":{"happiness":4853,"population":4853,"demandHappiness":4853,"money_24h":92990},"SpaceAgeVenus":{"happiness":5245,"population":5245,"demandHappiness":5245,"money_24h":102500},"SpaceAgeJupiterMoon":{"happiness":5648,"population":5648,"demandHappiness":5648,"money_24h":112500},"SpaceAgeTitan":{"happiness":6059,"population":6059,"demandHappiness":6059,"money_24h":123000},"SpaceAgeSpaceHub":{"happiness":6480,"population":6480,"demandHappiness":6480,"money_24h":133980}} },
+    "R_MultiAge_SpringBonus17e": { prod: {"BronzeAge":{"happiness":108,"population":108,"demandHappiness":108,"money_24h":800},"IronAge":{"happiness":232,"population":232,"demandHappiness":232,"money_24h":1920},"EarlyMiddleAge":{"happiness":356,"population":356,"demandHappiness":356,"money_24h":3200},"HighMiddleAge":{"happiness":500,"population":500,"demandHappiness":500,"money_24h":4480},"LateMiddleAge":{"happiness":656,"population":656,"demandHappiness":656,"money_24h":5920},"ColonialAge":{"happiness":828,"population":828,"demandHappiness":828,"money_24h":9020},"IndustrialAge":{"happiness":1012,"population":1012,"demandHappiness":1012,"money_24h":11230},"ProgressiveEra":{"happiness":1208,"population":1208,"demandHappiness":1208,"money_24h":13630},"ModernEra":{"happiness":1416,"population":1416,"demandHappiness":1416,"money_24h":16960},"PostModernEra":{"happiness":1632,"population":1632,"demandHappiness":1632,"money_24h":21340},"ContemporaryEra":{"happiness":1860,"population":1860,"demandHappiness":1860,"money_24h":27780},"TomorrowEra":{"happiness":2096,"population":2096,"demandHappiness":2096,"money_24h":32160},"FutureEra":{"happiness":2344,"population":2344,"demandHappiness":2344,"money_24h":36860},"ArcticFuture":{"happiness":2600,"population":2600,"demandHappiness":2600,"money_24h":41890},"OceanicFuture":{"happiness":2864,"population":2864,"demandHappiness":2864,"money_24h":47230},"VirtualFuture":{"happiness":3136,"population":3136,"demandHappiness":3136,"money_24h":52900},"SpaceAgeMars":{"happiness":4964,"population":4964,"demandHappiness":4964,"money_24h":88370},"SpaceAgeAsteroidBelt":{"happiness":5392,"population":5392,"demandHappiness":5392,"money_24h":97880},"SpaceAgeVenus":{"happiness":5828,"population":5828,"demandHappiness":5828,"money_24h":107900},"SpaceAgeJupiterMoon":{"happiness":6276,"population":6276,"demandHappiness":6276,"money_24h":118420},"SpaceAgeTitan":{"happiness":6732,"population":6732,"demandHappiness":6732,"money_24h":129470},"SpaceAgeSpaceHub":{"happiness":7200,"population":7200,"demandHappiness":7200,"money_24h":141030}} },
+    "R_MultiAge_SpringBonus17f": { prod: {"BronzeAge":{"happiness":119,"population":119,"demandHappiness":119,"money_24h":840},"IronAge":{"happiness":255,"population":255,"demandHappiness":255,"money_24h":2020},"EarlyMiddleAge":{"happiness":392,"population":392,"demandHappiness":392,"money_24h":3360},"HighMiddleAge":{"happiness":550,"population":550,"demandHappiness":550,"money_24h":4700},"LateMiddleAge":{"happiness":722,"population":722,"demandHappiness":722,"money_24h":6220},"ColonialAge":{"happiness":911,"population":911,"demandHappiness":911,"money_24h":9470},"IndustrialAge":{"happiness":1113,"population":1113,"demandHappiness":1113,"money_24h":11790},"ProgressiveEra":{"happiness":1329,"population":1329,"demandHappiness":1329,"money_24h":14310},"ModernEra":{"happiness":1558,"population":1558,"demandHappiness":1558,"money_24h":17810},"PostModernEra":{"happiness":1795,"population":1795,"demandHappiness":1795,"money_24h":22400},"ContemporaryEra":{"happiness":2046,"population":2046,"demandHappiness":2046,"money_24h":29160},"TomorrowEra":{"happiness":2306,"population":2306,"demandHappiness":2306,"money_24h":33770},"FutureEra":{"happiness":2578,"population":2578,"demandHappiness":2578,"money_24h":38710},"ArcticFuture":{"happiness":2860,"population":2860,"demandHappiness":2860,"money_24h":43980},"OceanicFuture":{"happiness":3150,"population":3150,"demandHappiness":3150,"money_24h":49590},"VirtualFuture":{"happiness":3450,"population":3450,"demandHappiness":3450,"money_24h":55550},"SpaceAgeMars":{"happiness":5460,"population":5460,"demandHappiness":5460,"money_24h":92790},"SpaceAgeAsteroidBelt":{"happiness":5931,"population":5931,"demandHappiness":5931,"money_24h":102770},"SpaceAgeVenus":{"happiness":6411,"population":6411,"demandHappiness":6411,"money_24h":113290},"SpaceAgeJupiterMoon":{"happiness":6904,"population":6904,"demandHappiness":6904,"money_24h":124350},"SpaceAgeTitan":{"happiness":7405,"population":7405,"demandHappiness":7405,"money_24h":135950},"SpaceAgeSpaceHub":{"happiness":7920,"population":7920,"demandHappiness":7920,"money_24h":148080}} },
+    "A_MultiAge_GandhiBonus17": { prod: {"BronzeAge":{"happiness":900},"IronAge":{"happiness":1120},"EarlyMiddleAge":{"happiness":1370},"HighMiddleAge":{"happiness":1530},"LateMiddleAge":{"happiness":1710},"ColonialAge":{"happiness":2010},"IndustrialAge":{"happiness":2270},"ProgressiveEra":{"happiness":2490},"ModernEra":{"happiness":2660},"PostModernEra":{"happiness":2770},"ContemporaryEra":{"happiness":3220},"TomorrowEra":{"happiness":3910},"FutureEra":{"happiness":4690},"ArcticFuture":{"happiness":5460},"OceanicFuture":{"happiness":6300},"VirtualFuture":{"happiness":6770},"SpaceAgeMars":{"happiness":10840},"SpaceAgeAsteroidBelt":{"happiness":11780},"SpaceAgeVenus":{"happiness":12730},"SpaceAgeJupiterMoon":{"happiness":13710},"SpaceAgeTitan":{"happiness":14700},"SpaceAgeSpaceHub":{"happiness":15730}} },
+    "R_MultiAge_ArcheologyBonus22a": { prod: {"BronzeAge":{"happiness":350,"population":85,"demandHappiness":85,"money_24h":500},"IronAge":{"happiness":610,"population":183,"demandHappiness":183,"money_24h":1200},"EarlyMiddleAge":{"happiness":670,"population":280,"demandHappiness":280,"money_24h":1900},"HighMiddleAge":{"happiness":750,"population":394,"demandHappiness":394,"money_24h":2700},"LateMiddleAge":{"happiness":830,"population":517,"demandHappiness":517,"money_24h":3600},"ColonialAge":{"happiness":980,"population":652,"demandHappiness":652,"money_24h":5400},"IndustrialAge":{"happiness":1100,"population":797,"demandHappiness":797,"money_24h":6700},"ProgressiveEra":{"happiness":1210,"population":951,"demandHappiness":951,"money_24h":8200},"ModernEra":{"happiness":1300,"population":1115,"demandHappiness":1115,"money_24h":10200},"PostModernEra":{"happiness":1350,"population":1285,"demandHappiness":1285,"money_24h":12800},"ContemporaryEra":{"happiness":1570,"population":1465,"demandHappiness":1465,"money_24h":16700},"TomorrowEra":{"happiness":1910,"population":1651,"demandHappiness":1651,"money_24h":19300},"FutureEra":{"happiness":2290,"population":1846,"demandHappiness":1846,"money_24h":22100},"ArcticFuture":{"happiness":2660,"population":2048,"demandHappiness":2048,"money_24h":25100},"OceanicFuture":{"happiness":3070,"population":2255,"demandHappiness":2255,"money_24h":28300},"VirtualFuture":{"happiness":3670,"population":2470,"demandHappiness":2470,"money_24h":31700},"SpaceAgeMars":{"happiness":5870,"population":3909,"demandHappiness":3909,"money_24h":53000},"SpaceAgeAsteroidBelt":{"happiness":6380,"population":4246,"demandHappiness":4246,"money_24h":58700},"SpaceAgeVenus":{"happiness":6890,"population":4590,"demandHappiness":4590,"money_24h":64700},"SpaceAgeJupiterMoon":{"happiness":7430,"population":4942,"demandHappiness":4942,"money_24h":71100},"SpaceAgeTitan":{"happiness":7960,"population":5301,"demandHappiness":5301,"money_24h":77700},"SpaceAgeSpaceHub":{"happiness":8520,"population":5670,"demandHappiness":5670,"money_24h":84600}} },
+    "R_MultiAge_ArcheologyBonus22b": { prod: {"BronzeAge":{"happiness":430,"population":89,"demandHappiness":89,"money_24h":600},"IronAge":{"happiness":750,"population":191,"demandHappiness":191,"money_24h":1300},"EarlyMiddleAge":{"happiness":820,"population":294,"demandHappiness":294,"money_24h":2200},"HighMiddleAge":{"happiness":920,"population":413,"demandHappiness":413,"money_24h":3100},"LateMiddleAge":{"happiness":1030,"population":541,"demandHappiness":541,"money_24h":4100},"ColonialAge":{"happiness":1210,"population":683,"demandHappiness":683,"money_24h":6300},"IndustrialAge":{"happiness":1360,"population":835,"demandHappiness":835,"money_24h":7800},"ProgressiveEra":{"happiness":1490,"population":997,"demandHappiness":997,"money_24h":9500},"ModernEra":{"happiness":1600,"population":1168,"demandHappiness":1168,"money_24h":11800},"PostModernEra":{"happiness":1660,"population":1346,"demandHappiness":1346,"money_24h":14800},"ContemporaryEra":{"happiness":1930,"population":1535,"demandHappiness":1535,"money_24h":19300},"TomorrowEra":{"happiness":2350,"population":1729,"demandHappiness":1729,"money_24h":22300},"FutureEra":{"happiness":2810,"population":1934,"demandHappiness":1934,"money_24h":25600},"ArcticFuture":{"happiness":3280,"population":2145,"demandHappiness":2145,"money_24h":29100},"OceanicFuture":{"happiness":3780,"population":2363,"demandHappiness":2363,"money_24h":32800},"VirtualFuture":{"happiness":4520,"population":2587,"demandHappiness":2587,"money_24h":36700},"SpaceAgeMars":{"happiness":7230,"population":4095,"demandHappiness":4095,"money_24h":61300},"SpaceAgeAsteroidBelt":{"happiness":7850,"population":4448,"demandHappiness":4448,"money_24h":67900},"SpaceAgeVenus":{"happiness":8480,"population":4808,"demandHappiness":4808,"money_24h":74900},"SpaceAgeJupiterMoon":{"happiness":9140,"population":5178,"demandHappiness":5178,"money_24h":82200},"SpaceAgeTitan":{"happiness":9800,"population":5554,"demandHappiness":5554,"money_24h":89800},"SpaceAgeSpaceHub":{"happiness":10480,"population":5940,"demandHappiness":5940,"money_24h":97800}} },
+    "R_MultiAge_ArcheologyBonus22c": { prod: {"BronzeAge":{"happiness":510,"population":97,"demandHappiness":97,"money_24h":700},"IronAge":{"happiness":890,"population":209,"demandHappiness":209,"money_24h":1600},"EarlyMiddleAge":{"happiness":980,"population":320,"demandHappiness":320,"money_24h":2600},"HighMiddleAge":{"happiness":1090,"population":450,"demandHappiness":450,"money_24h":3700},"LateMiddleAge":{"happiness":1220,"population":590,"demandHappiness":590,"money_24h":4900},"ColonialAge":{"happiness":1430,"population":745,"demandHappiness":745,"money_24h":7400},"IndustrialAge":{"happiness":1610,"population":911,"demandHappiness":911,"money_24h":9300},"ProgressiveEra":{"happiness":1770,"population":1087,"demandHappiness":1087,"money_24h":11300},"ModernEra":{"happiness":1900,"population":1274,"demandHappiness":1274,"money_24h":14000},"PostModernEra":{"happiness":1980,"population":1469,"demandHappiness":1469,"money_24h":17600},"ContemporaryEra":{"happiness":2300,"population":1674,"demandHappiness":1674,"money_24h":22900},"TomorrowEra":{"happiness":2790,"population":1886,"demandHappiness":1886,"money_24h":26500},"FutureEra":{"happiness":3340,"population":2110,"demandHappiness":2110,"money_24h":30400},"ArcticFuture":{"happiness":3890,"population":2340,"demandHappiness":2340,"money_24h":34600},"OceanicFuture":{"happiness":4490,"population":2578,"demandHappiness":2578,"money_24h":39000},"VirtualFuture":{"happiness":5360,"population":2822,"demandHappiness":2822,"money_24h":43700},"SpaceAgeMars":{"happiness":8580,"population":4468,"demandHappiness":4468,"money_24h":72900},"SpaceAgeAsteroidBelt":{"happiness":9330,"population":4853,"demandHappiness":4853,"money_24h":80800},"SpaceAgeVenus":{"happiness":10070,"population":5245,"demandHappiness":5245,"money_24h":89000},"SpaceAgeJupiterMoon":{"happiness":10850,"population":5648,"demandHappiness":5648,"money_24h":97700},"SpaceAgeTitan":{"happiness":11640,"population":6059,"demandHappiness":6059,"money_24h":106800},"SpaceAgeSpaceHub":{"happiness":12450,"population":6480,"demandHappiness":6480,"money_24h":116400}} },
+    "R_MultiAge_ArcheologyBonus22d": { prod: {"BronzeAge":{"happiness":590,"population":105,"demandHappiness":105,"money_24h":800},"IronAge":{"happiness":1020,"population":226,"demandHappiness":226,"money_24h":1800},"EarlyMiddleAge":{"happiness":1130,"population":347,"demandHappiness":347,"money_24h":3000},"HighMiddleAge":{"happiness":1260,"population":488,"demandHappiness":488,"money_24h":4200},"LateMiddleAge":{"happiness":1410,"population":640,"demandHappiness":640,"money_24h":5600},"ColonialAge":{"happiness":1660,"population":807,"demandHappiness":807,"money_24h":8500},"IndustrialAge":{"happiness":1870,"population":987,"demandHappiness":987,"money_24h":10500},"ProgressiveEra":{"happiness":2050,"population":1178,"demandHappiness":1178,"money_24h":12800},"ModernEra":{"happiness":2200,"population":1381,"demandHappiness":1381,"money_24h":15900},"PostModernEra":{"happiness":2290,"population":1591,"demandHappiness":1591,"money_24h":20000},"ContemporaryEra":{"happiness":2660,"population":1814,"demandHappiness":1814,"money_24h":26000},"TomorrowEra":{"happiness":3230,"population":2044,"demandHappiness":2044,"money_24h":30200},"FutureEra":{"happiness":3870,"population":2285,"demandHappiness":2285,"money_24h":34600},"ArcticFuture":{"happiness":4500,"population":2535,"demandHappiness":2535,"money_24h":39300},"OceanicFuture":{"happiness":5200,"population":2792,"demandHappiness":2792,"money_24h":44300},"VirtualFuture":{"happiness":6210,"population":3058,"demandHappiness":3058,"money_24h":49600},"SpaceAgeMars":{"happiness":9940,"population":4840,"demandHappiness":4840,"money_24h":82900},"SpaceAgeAsteroidBelt":{"happiness":10800,"population":5257,"demandHappiness":5257,"money_24h":91800},"SpaceAgeVenus":{"happiness":11670,"population":5682,"demandHappiness":5682,"money_24h":101200},"SpaceAgeJupiterMoon":{"happiness":12570,"population":6119,"demandHappiness":6119,"money_24h":111000},"SpaceAgeTitan":{"happiness":13480,"population":6564,"demandHappiness":6564,"money_24h":121400},"SpaceAgeSpaceHub":{"happiness":14420,"population":7020,"demandHappiness":7020,"money_24h":132200}} },
+    "R_MultiAge_ArcheologyBonus22e": { prod: {"BronzeAge":{"happiness":680,"population":113,"demandHappiness":113,"money_24h":800},"IronAge":{"happiness":1160,"population":244,"demandHappiness":244,"money_24h":2000},"EarlyMiddleAge":{"happiness":1290,"population":374,"demandHappiness":374,"money_24h":3400},"HighMiddleAge":{"happiness":1440,"population":525,"demandHappiness":525,"money_24h":4700},"LateMiddleAge":{"happiness":1600,"population":689,"demandHappiness":689,"money_24h":6200},"ColonialAge":{"happiness":1880,"population":869,"demandHappiness":869,"money_24h":9500},"IndustrialAge":{"happiness":2120,"population":1063,"demandHappiness":1063,"money_24h":11800},"ProgressiveEra":{"happiness":2330,"population":1268,"demandHappiness":1268,"money_24h":14300},"ModernEra":{"happiness":2500,"population":1487,"demandHappiness":1487,"money_24h":17800},"PostModernEra":{"happiness":2600,"population":1714,"demandHappiness":1714,"money_24h":22400},"ContemporaryEra":{"happiness":3020,"population":1953,"demandHappiness":1953,"money_24h":29200},"TomorrowEra":{"happiness":3670,"population":2201,"demandHappiness":2201,"money_24h":33800},"FutureEra":{"happiness":4400,"population":2461,"demandHappiness":2461,"money_24h":38700},"ArcticFuture":{"happiness":5120,"population":2730,"demandHappiness":2730,"money_24h":44000},"OceanicFuture":{"happiness":5910,"population":3007,"demandHappiness":3007,"money_24h":49600},"VirtualFuture":{"happiness":7060,"population":3293,"demandHappiness":3293,"money_24h":55600},"SpaceAgeMars":{"happiness":11290,"population":5212,"demandHappiness":5212,"money_24h":92800},"SpaceAgeAsteroidBelt":{"happiness":12270,"population":5662,"demandHappiness":5662,"money_24h":102800},"SpaceAgeVenus":{"happiness":13260,"population":6119,"demandHappiness":6119,"money_24h":113300},"SpaceAgeJupiterMoon":{"happiness":14280,"population":6590,"demandHappiness":6590,"money_24h":124400},"SpaceAgeTitan":{"happiness":15310,"population":7069,"demandHappiness":7069,"money_24h":136000},"SpaceAgeSpaceHub":{"happiness":16380,"population":7560,"demandHappiness":7560,"money_24h":148100}} },
+    "D_MultiAge_Expedition22FeathersPlatinum": { prod: {"BronzeAge":{"happiness":230},"IronAge":{"happiness":390},"EarlyMiddleAge":{"happiness":430},"HighMiddleAge":{"happiness":480},"LateMiddleAge":{"happiness":530},"ColonialAge":{"happiness":630},"IndustrialAge":{"happiness":710},"ProgressiveEra":{"happiness":780},"ModernEra":{"happiness":830},"PostModernEra":{"happiness":870},"ContemporaryEra":{"happiness":1010},"TomorrowEra":{"happiness":1220},"FutureEra":{"happiness":1470},"ArcticFuture":{"happiness":1710},"OceanicFuture":{"happiness":1970},"VirtualFuture":{"happiness":2350},"SpaceAgeMars":{"happiness":3760},"SpaceAgeAsteroidBelt":{"happiness":4090},"SpaceAgeVenus":{"happiness":4420},"SpaceAgeJupiterMoon":{"happiness":4760},"SpaceAgeTitan":{"happiness":5100},"SpaceAgeSpaceHub":{"happiness":5460}} },
+    "D_MultiAge_Expedition22SpikesPlatinum": { prod: {"BronzeAge":{"happiness":230},"IronAge":{"happiness":390},"EarlyMiddleAge":{"happiness":430},"HighMiddleAge":{"happiness":480},"LateMiddleAge":{"happiness":530},"ColonialAge":{"happiness":630},"IndustrialAge":{"happiness":710},"ProgressiveEra":{"happiness":780},"ModernEra":{"happiness":830},"PostModernEra":{"happiness":870},"ContemporaryEra":{"happiness":1010},"TomorrowEra":{"happiness":1220},"FutureEra":{"happiness":1470},"ArcticFuture":{"happiness":1710},"OceanicFuture":{"happiness":1970},"VirtualFuture":{"happiness":2350},"SpaceAgeMars":{"happiness":3760},"SpaceAgeAsteroidBelt":{"happiness":4090},"SpaceAgeVenus":{"happiness":4420},"SpaceAgeJupiterMoon":{"happiness":4760},"SpaceAgeTitan":{"happiness":5100},"SpaceAgeSpaceHub":{"happiness":5460}} },
+    "D_MultiAge_Expedition22ScalesPlatinum": { prod: {"BronzeAge":{"happiness":230},"IronAge":{"happiness":390},"EarlyMiddleAge":{"happiness":430},"HighMiddleAge":{"happiness":480},"LateMiddleAge":{"happiness":530},"ColonialAge":{"happiness":630},"IndustrialAge":{"happiness":710},"ProgressiveEra":{"happiness":780},"ModernEra":{"happiness":830},"PostModernEra":{"happiness":870},"ContemporaryEra":{"happiness":1010},"TomorrowEra":{"happiness":1220},"FutureEra":{"happiness":1470},"ArcticFuture":{"happiness":1710},"OceanicFuture":{"happiness":1970},"VirtualFuture":{"happiness":2350},"SpaceAgeMars":{"happiness":3760},"SpaceAgeAsteroidBelt":{"happiness":4090},"SpaceAgeVenus":{"happiness":4420},"SpaceAgeJupiterMoon":{"happiness":4760},"SpaceAgeTitan":{"happiness":5100},"SpaceAgeSpaceHub":{"happiness":5460}} },
+    "R_MultiAge_Expedition22fPlatinum": { prod: {"BronzeAge":{"population":5,"demandHappiness":5,"money_24h":4200},"IronAge":{"population":5,"demandHappiness":5,"money_24h":7150},"EarlyMiddleAge":{"population":5,"demandHappiness":5,"money_24h":11920},"HighMiddleAge":{"population":5,"demandHappiness":5,"money_24h":16680},"LateMiddleAge":{"population":5,"demandHappiness":5,"money_24h":22040},"ColonialAge":{"population":5,"demandHappiness":5,"money_24h":33570},"IndustrialAge":{"population":5,"demandHappiness":5,"money_24h":41830},"ProgressiveEra":{"population":5,"demandHappiness":5,"money_24h":50760},"ModernEra":{"population":5,"demandHappiness":5,"money_24h":63150},"PostModernEra":{"population":5,"demandHappiness":5,"money_24h":79450},"ContemporaryEra":{"population":5,"demandHappiness":5,"money_24h":103430},"TomorrowEra":{"population":5,"demandHappiness":5,"money_24h":119760},"FutureEra":{"population":5,"demandHappiness":5,"money_24h":137270},"ArcticFuture":{"population":5,"demandHappiness":5,"money_24h":155980},"OceanicFuture":{"population":5,"demandHappiness":5,"money_24h":175880},"VirtualFuture":{"population":5,"demandHappiness":5,"money_24h":197000},"SpaceAgeMars":{"population":5,"demandHappiness":5,"money_24h":329060},"SpaceAgeAsteroidBelt":{"population":5,"demandHappiness":5,"money_24h":364480},"SpaceAgeVenus":{"population":5,"demandHappiness":5,"money_24h":401780},"SpaceAgeJupiterMoon":{"population":5,"demandHappiness":5,"money_24h":440980},"SpaceAgeTitan":{"population":5,"demandHappiness":5,"money_24h":482120},"SpaceAgeSpaceHub":{"population":5,"demandHappiness":5,"money_24h":525170}} },
+    "R_MultiAge_HalloweenBonusSet21a": { prod: {"BronzeAge":{"happiness":-40,"money_24h":350},"IronAge":{"happiness":-70,"money_24h":800},"EarlyMiddleAge":{"happiness":-80,"money_24h":1400},"HighMiddleAge":{"happiness":-90,"money_24h":1900},"LateMiddleAge":{"happiness":-100,"money_24h":2500},"ColonialAge":{"happiness":-110,"money_24h":3800},"IndustrialAge":{"happiness":-130,"money_24h":4700},"ProgressiveEra":{"happiness":-140,"money_24h":5800},"ModernEra":{"happiness":-150,"money_24h":7200},"PostModernEra":{"happiness":-160,"money_24h":9000},"ContemporaryEra":{"happiness":-180,"money_24h":11700},"TomorrowEra":{"happiness":-220,"money_24h":13600},"FutureEra":{"happiness":-260,"money_24h":15600},"ArcticFuture":{"happiness":-310,"money_24h":17700},"OceanicFuture":{"happiness":-350,"money_24h":19900},"VirtualFuture":{"happiness":-420,"money_24h":22300},"SpaceAgeMars":{"happiness":-680,"money_24h":37300},"SpaceAgeAsteroidBelt":{"happiness":-740,"money_24h":41300},"SpaceAgeVenus":{"happiness":-800,"money_24h":45500},"SpaceAgeJupiterMoon":{"happiness":-860,"money_24h":50000},"SpaceAgeTitan":{"happiness":-920,"money_24h":54600},"SpaceAgeSpaceHub":{"happiness":-980,"money_24h":59500}} },
+    "R_MultiAge_HalloweenBonusSet21b": { prod: {"BronzeAge":{"happiness":-40,"money_24h":400},"IronAge":{"happiness":-70,"money_24h":1000},"EarlyMiddleAge":{"happiness":-80,"money_24h":1600},"HighMiddleAge":{"happiness":-90,"money_24h":2300},"LateMiddleAge":{"happiness":-100,"money_24h":3000},"ColonialAge":{"happiness":-110,"money_24h":4600},"IndustrialAge":{"happiness":-130,"money_24h":5700},"ProgressiveEra":{"happiness":-140,"money_24h":6900},"ModernEra":{"happiness":-150,"money_24h":8600},"PostModernEra":{"happiness":-160,"money_24h":10800},"ContemporaryEra":{"happiness":-180,"money_24h":14100},"TomorrowEra":{"happiness":-220,"money_24h":16300},"FutureEra":{"happiness":-260,"money_24h":18700},"ArcticFuture":{"happiness":-310,"money_24h":21200},"OceanicFuture":{"happiness":-350,"money_24h":23900},"VirtualFuture":{"happiness":-420,"money_24h":26800},"SpaceAgeMars":{"happiness":-680,"money_24h":44700},"SpaceAgeAsteroidBelt":{"happiness":-740,"money_24h":49600},"SpaceAgeVenus":{"happiness":-800,"money_24h":54600},"SpaceAgeJupiterMoon":{"happiness":-860,"money_24h":60000},"SpaceAgeTitan":{"happiness":-920,"money_24h":65600},"SpaceAgeSpaceHub":{"happiness":-980,"money_24h":71400}} },
+    "D_MultiAge_SummerBonus1": { prod: {"BronzeAge":{"happiness":27},"IronAge":{"happiness":33},"EarlyMiddleAge":{"happiness":38},"HighMiddleAge":{"happiness":43},"LateMiddleAge":{"happiness":54},"ColonialAge":{"happiness":64},"IndustrialAge":{"happiness":74},"ProgressiveEra":{"happiness":84},"ModernEra":{"happiness":90},"PostModernEra":{"happiness":96},"ContemporaryEra":{"happiness":101},"TomorrowEra":{"happiness":107},"FutureEra":{"happiness":113},"ArcticFuture":{"happiness":120},"OceanicFuture":{"happiness":131},"VirtualFuture":{"happiness":140},"SpaceAgeMars":{"happiness":149},"SpaceAgeAsteroidBelt":{"happiness":159},"SpaceAgeVenus":{"happiness":170},"SpaceAgeJupiterMoon":{"happiness":182},"SpaceAgeTitan":{"happiness":195},"SpaceAgeSpaceHub":{"happiness":209}} },
+    "D_MultiAge_HalloweenBonusSet21a": { prod: {"BronzeAge":{"happiness":90},"IronAge":{"happiness":140},"EarlyMiddleAge":{"happiness":160},"HighMiddleAge":{"happiness":190},"LateMiddleAge":{"happiness":220},"ColonialAge":{"happiness":250},"IndustrialAge":{"happiness":290},"ProgressiveEra":{"happiness":310},"ModernEra":{"happiness":340},"PostModernEra":{"happiness":350},"ContemporaryEra":{"happiness":410},"TomorrowEra":{"happiness":500},"FutureEra":{"happiness":620},"ArcticFuture":{"happiness":720},"OceanicFuture":{"happiness":860},"VirtualFuture":{"happiness":1020},"SpaceAgeMars":{"happiness":1640},"SpaceAgeAsteroidBelt":{"happiness":1780},"SpaceAgeVenus":{"happiness":1920},"SpaceAgeJupiterMoon":{"happiness":2070},"SpaceAgeTitan":{"happiness":2220},"SpaceAgeSpaceHub":{"happiness":2380}} },
+    "D_MultiAge_HalloweenBonusSet21b": { prod: {"BronzeAge":{"happiness":110},"IronAge":{"happiness":160},"EarlyMiddleAge":{"happiness":190},"HighMiddleAge":{"happiness":230},"LateMiddleAge":{"happiness":270},"ColonialAge":{"happiness":320},"IndustrialAge":{"happiness":360},"ProgressiveEra":{"happiness":400},"ModernEra":{"happiness":420},"PostModernEra":{"happiness":440},"ContemporaryEra":{"happiness":510},"TomorrowEra":{"happiness":620},"FutureEra":{"happiness":790},"ArcticFuture":{"happiness":920},"OceanicFuture":{"happiness":1120},"VirtualFuture":{"happiness":1340},"SpaceAgeMars":{"happiness":2150},"SpaceAgeAsteroidBelt":{"happiness":2330},"SpaceAgeVenus":{"happiness":2520},"SpaceAgeJupiterMoon":{"happiness":2710},"SpaceAgeTitan":{"happiness":2910},"SpaceAgeSpaceHub":{"happiness":3110}} },
+    "R_MultiAge_CarnivalBonus18": { prod: {"BronzeAge":{"happiness":100,"population":100,"demandHappiness":100,"money_24h":920},"IronAge":{"happiness":210,"population":210,"demandHappiness":210,"money_24h":1980},"EarlyMiddleAge":{"happiness":320,"population":320,"demandHappiness":320,"money_24h":3000},"HighMiddleAge":{"happiness":450,"population":450,"demandHappiness":450,"money_24h":3860},"LateMiddleAge":{"happiness":590,"population":590,"demandHappiness":590,"money_24h":4660},"ColonialAge":{"happiness":745,"population":745,"demandHappiness":745,"money_24h":6420},"IndustrialAge":{"happiness":911,"population":911,"demandHappiness":911,"money_24h":7370},"ProgressiveEra":{"happiness":1087,"population":1087,"demandHappiness":1087,"money_24h":8430},"ModernEra":{"happiness":1274,"population":1274,"demandHappiness":1274,"money_24h":10490},"PostModernEra":{"happiness":1469,"population":1469,"demandHappiness":1469,"money_24h":13200},"ContemporaryEra":{"happiness":1674,"population":1674,"demandHappiness":1674,"money_24h":17190},"TomorrowEra":{"happiness":1886,"population":1886,"demandHappiness":1886,"money_24h":19900},"FutureEra":{"happiness":2110,"population":2110,"demandHappiness":2110,"money_24h":22800},"ArcticFuture":{"happiness":2340,"population":2340,"demandHappiness":2340,"money_24h":25900},"OceanicFuture":{"happiness":2578,"population":2578,"demandHappiness":2578,"money_24h":30000},"VirtualFuture":{"happiness":2822,"population":2822,"demandHappiness":2822,"money_24h":33610},"SpaceAgeMars":{"happiness":4468,"population":4468,"demandHappiness":4468,"money_24h":56140},"SpaceAgeAsteroidBelt":{"happiness":4853,"population":4853,"demandHappiness":4853,"money_24h":62180},"SpaceAgeVenus":{"happiness":5245,"population":5245,"demandHappiness":5245,"money_24h":68540},"SpaceAgeJupiterMoon":{"happiness":5648,"population":5648,"demandHappiness":5648,"money_24h":75230},"SpaceAgeTitan":{"happiness":6059,"population":6059,"demandHappiness":6059,"money_24h":82250},"SpaceAgeSpaceHub":{"happiness":6480,"population":6480,"demandHappiness":6480,"money_24h":89590}} },
+    "R_MultiAge_CarnivalBonus17": { prod: {"BronzeAge":{"happiness":50,"population":50,"demandHappiness":50,"money_24h":230},"IronAge":{"happiness":104,"population":104,"demandHappiness":104,"money_24h":510},"EarlyMiddleAge":{"happiness":160,"population":160,"demandHappiness":160,"money_24h":860},"HighMiddleAge":{"happiness":225,"population":225,"demandHappiness":225,"money_24h":1200},"LateMiddleAge":{"happiness":295,"population":295,"demandHappiness":295,"money_24h":1580},"ColonialAge":{"happiness":373,"population":373,"demandHappiness":373,"money_24h":2410},"IndustrialAge":{"happiness":455,"population":455,"demandHappiness":455,"money_24h":3000},"ProgressiveEra":{"happiness":544,"population":544,"demandHappiness":544,"money_24h":3640},"ModernEra":{"happiness":637,"population":637,"demandHappiness":637,"money_24h":4530},"PostModernEra":{"happiness":734,"population":734,"demandHappiness":734,"money_24h":5700},"ContemporaryEra":{"happiness":837,"population":837,"demandHappiness":837,"money_24h":7420},"TomorrowEra":{"happiness":943,"population":943,"demandHappiness":943,"money_24h":8590},"FutureEra":{"happiness":1055,"population":1055,"demandHappiness":1055,"money_24h":9850},"ArcticFuture":{"happiness":1170,"population":1170,"demandHappiness":1170,"money_24h":11190},"OceanicFuture":{"happiness":1289,"population":1289,"demandHappiness":1289,"money_24h":12620},"VirtualFuture":{"happiness":1411,"population":1411,"demandHappiness":1411,"money_24h":14140},"SpaceAgeMars":{"happiness":2234,"population":2234,"demandHappiness":2234,"money_24h":23610},"SpaceAgeAsteroidBelt":{"happiness":2426,"population":2426,"demandHappiness":2426,"money_24h":26150},"SpaceAgeVenus":{"happiness":2623,"population":2623,"demandHappiness":2623,"money_24h":28830},"SpaceAgeJupiterMoon":{"happiness":2824,"population":2824,"demandHappiness":2824,"money_24h":31640},"SpaceAgeTitan":{"happiness":3029,"population":3029,"demandHappiness":3029,"money_24h":34590},"SpaceAgeSpaceHub":{"happiness":3240,"population":3240,"demandHappiness":3240,"money_24h":37680}} },
+    "D_MultiAge_RoyalBonusSet17a": { prod: {"BronzeAge":{"happiness":290},"IronAge":{"happiness":360},"EarlyMiddleAge":{"happiness":410},"HighMiddleAge":{"happiness":470},"LateMiddleAge":{"happiness":530},"ColonialAge":{"happiness":600},"IndustrialAge":{"happiness":670},"ProgressiveEra":{"happiness":750},"ModernEra":{"happiness":830},"PostModernEra":{"happiness":910},"ContemporaryEra":{"happiness":1000},"TomorrowEra":{"happiness":1160},"FutureEra":{"happiness":1360},"ArcticFuture":{"happiness":1580},"OceanicFuture":{"happiness":1830},"VirtualFuture":{"happiness":2180},"SpaceAgeMars":{"happiness":3490},"SpaceAgeAsteroidBelt":{"happiness":3790},"SpaceAgeVenus":{"happiness":4100},"SpaceAgeJupiterMoon":{"happiness":4410},"SpaceAgeTitan":{"happiness":4730},"SpaceAgeSpaceHub":{"happiness":5060}} },
+    "D_MultiAge_RoyalBonusSet17b": { prod: {"BronzeAge":{"happiness":310},"IronAge":{"happiness":380},"EarlyMiddleAge":{"happiness":430},"HighMiddleAge":{"happiness":500},"LateMiddleAge":{"happiness":560},"ColonialAge":{"happiness":630},"IndustrialAge":{"happiness":710},"ProgressiveEra":{"happiness":790},"ModernEra":{"happiness":870},"PostModernEra":{"happiness":960},"ContemporaryEra":{"happiness":1050},"TomorrowEra":{"happiness":1220},"FutureEra":{"happiness":1420},"ArcticFuture":{"happiness":1650},"OceanicFuture":{"happiness":1900},"VirtualFuture":{"happiness":2270},"SpaceAgeMars":{"happiness":3620},"SpaceAgeAsteroidBelt":{"happiness":3940},"SpaceAgeVenus":{"happiness":4260},"SpaceAgeJupiterMoon":{"happiness":4580},"SpaceAgeTitan":{"happiness":4920},"SpaceAgeSpaceHub":{"happiness":5260}} },
+    "A_MultiAge_HalloweenBonus2": { prod: {"BronzeAge":{"happiness":590},"IronAge":{"happiness":720},"EarlyMiddleAge":{"happiness":980},"HighMiddleAge":{"happiness":1090},"LateMiddleAge":{"happiness":1220},"ColonialAge":{"happiness":1430},"IndustrialAge":{"happiness":1610},"ProgressiveEra":{"happiness":1770},"ModernEra":{"happiness":1900},"PostModernEra":{"happiness":1980},"ContemporaryEra":{"happiness":2300},"TomorrowEra":{"happiness":2790},"FutureEra":{"happiness":3340},"ArcticFuture":{"happiness":3890},"OceanicFuture":{"happiness":4490},"VirtualFuture":{"happiness":5360},"SpaceAgeMars":{"happiness":8580},"SpaceAgeAsteroidBelt":{"happiness":9330},"SpaceAgeVenus":{"happiness":10070},"SpaceAgeJupiterMoon":{"happiness":10850},"SpaceAgeTitan":{"happiness":11640},"SpaceAgeSpaceHub":{"happiness":12450}} },
+    "R_MultiAge_HalloweenBonus20a": { prod: {"BronzeAge":{"happiness":-50,"population":82,"demandHappiness":82,"money_24h":500},"IronAge":{"happiness":-90,"population":176,"demandHappiness":176,"money_24h":1300},"EarlyMiddleAge":{"happiness":-100,"population":270,"demandHappiness":270,"money_24h":2200},"HighMiddleAge":{"happiness":-110,"population":379,"demandHappiness":379,"money_24h":3000},"LateMiddleAge":{"happiness":-130,"population":497,"demandHappiness":497,"money_24h":4000},"ColonialAge":{"happiness":-150,"population":627,"demandHappiness":627,"money_24h":6100},"IndustrialAge":{"happiness":-170,"population":767,"demandHappiness":767,"money_24h":7600},"ProgressiveEra":{"happiness":-190,"population":915,"demandHappiness":915,"money_24h":9200},"ModernEra":{"happiness":-200,"population":1073,"demandHappiness":1073,"money_24h":11500},"PostModernEra":{"happiness":-210,"population":1236,"demandHappiness":1236,"money_24h":14400},"ContemporaryEra":{"happiness":-240,"population":1409,"demandHappiness":1409,"money_24h":18800},"TomorrowEra":{"happiness":-290,"population":1588,"demandHappiness":1588,"money_24h":21700},"FutureEra":{"happiness":-350,"population":1776,"demandHappiness":1776,"money_24h":24900},"ArcticFuture":{"happiness":-410,"population":1970,"demandHappiness":1970,"money_24h":28300},"OceanicFuture":{"happiness":-470,"population":2169,"demandHappiness":2169,"money_24h":31900},"VirtualFuture":{"happiness":-560,"population":2376,"demandHappiness":2376,"money_24h":35700},"SpaceAgeMars":{"happiness":-900,"population":3760,"demandHappiness":3760,"money_24h":59700},"SpaceAgeAsteroidBelt":{"happiness":-980,"population":4084,"demandHappiness":4084,"money_24h":66100},"SpaceAgeVenus":{"happiness":-1060,"population":4415,"demandHappiness":4415,"money_24h":72800},"SpaceAgeJupiterMoon":{"happiness":-1140,"population":4754,"demandHappiness":4754,"money_24h":79900},"SpaceAgeTitan":{"happiness":-1230,"population":5099,"demandHappiness":5099,"money_24h":87400},"SpaceAgeSpaceHub":{"happiness":-1310,"population":5454,"demandHappiness":5454,"money_24h":95200}} },
+    "R_MultiAge_HalloweenBonus20b": { prod: {"BronzeAge":{"happiness":-50,"population":83,"demandHappiness":83,"money_24h":600},"IronAge":{"happiness":-90,"population":179,"demandHappiness":179,"money_24h":1400},"EarlyMiddleAge":{"happiness":-100,"population":275,"demandHappiness":275,"money_24h":2400},"HighMiddleAge":{"happiness":-110,"population":386,"demandHappiness":386,"money_24h":3400},"LateMiddleAge":{"happiness":-130,"population":507,"demandHappiness":507,"money_24h":4400},"ColonialAge":{"happiness":-150,"population":640,"demandHappiness":640,"money_24h":6800},"IndustrialAge":{"happiness":-170,"population":782,"demandHappiness":782,"money_24h":8400},"ProgressiveEra":{"happiness":-190,"population":933,"demandHappiness":933,"money_24h":10200},"ModernEra":{"happiness":-200,"population":1094,"demandHappiness":1094,"money_24h":12700},"PostModernEra":{"happiness":-210,"population":1261,"demandHappiness":1261,"money_24h":16000},"ContemporaryEra":{"happiness":-240,"population":1437,"demandHappiness":1437,"money_24h":20800},"TomorrowEra":{"happiness":-290,"population":1619,"demandHappiness":1619,"money_24h":24100},"FutureEra":{"happiness":-350,"population":1811,"demandHappiness":1811,"money_24h":27700},"ArcticFuture":{"happiness":-410,"population":2009,"demandHappiness":2009,"money_24h":31400},"OceanicFuture":{"happiness":-470,"population":2212,"demandHappiness":2212,"money_24h":35400},"VirtualFuture":{"happiness":-560,"population":2423,"demandHappiness":2423,"money_24h":39700},"SpaceAgeMars":{"happiness":-900,"population":3835,"demandHappiness":3835,"money_24h":66300},"SpaceAgeAsteroidBelt":{"happiness":-980,"population":4165,"demandHappiness":4165,"money_24h":73400},"SpaceAgeVenus":{"happiness":-1060,"population":4502,"demandHappiness":4502,"money_24h":80900},"SpaceAgeJupiterMoon":{"happiness":-1140,"population":4848,"demandHappiness":4848,"money_24h":88800},"SpaceAgeTitan":{"happiness":-1230,"population":5200,"demandHappiness":5200,"money_24h":97100},"SpaceAgeSpaceHub":{"happiness":-1310,"population":5562,"demandHappiness":5562,"money_24h":105800}} },
+    "R_MultiAge_HalloweenBonus20c": { prod: {"BronzeAge":{"happiness":-50,"population":85,"demandHappiness":85,"money_24h":700},"IronAge":{"happiness":-90,"population":183,"demandHappiness":183,"money_24h":1600},"EarlyMiddleAge":{"happiness":-100,"population":280,"demandHappiness":280,"money_24h":2600},"HighMiddleAge":{"happiness":-110,"population":394,"demandHappiness":394,"money_24h":3700},"LateMiddleAge":{"happiness":-130,"population":517,"demandHappiness":517,"money_24h":4900},"ColonialAge":{"happiness":-150,"population":652,"demandHappiness":652,"money_24h":7400},"IndustrialAge":{"happiness":-170,"population":797,"demandHappiness":797,"money_24h":9300},"ProgressiveEra":{"happiness":-190,"population":951,"demandHappiness":951,"money_24h":11300},"ModernEra":{"happiness":-200,"population":1115,"demandHappiness":1115,"money_24h":14000},"PostModernEra":{"happiness":-210,"population":1285,"demandHappiness":1285,"money_24h":17600},"ContemporaryEra":{"happiness":-240,"population":1465,"demandHappiness":1465,"money_24h":22900},"TomorrowEra":{"happiness":-290,"population":1651,"demandHappiness":1651,"money_24h":26500},"FutureEra":{"happiness":-350,"population":1846,"demandHappiness":1846,"money_24h":30400},"ArcticFuture":{"happiness":-410,"population":2048,"demandHappiness":2048,"money_24h":34600},"OceanicFuture":{"happiness":-470,"population":2255,"demandHappiness":2255,"money_24h":39000},"VirtualFuture":{"happiness":-560,"population":2470,"demandHappiness":2470,"money_24h":43700},"SpaceAgeMars":{"happiness":-900,"population":3909,"demandHappiness":3909,"money_24h":72900},"SpaceAgeAsteroidBelt":{"happiness":-980,"population":4246,"demandHappiness":4246,"money_24h":80800},"SpaceAgeVenus":{"happiness":-1060,"population":4590,"demandHappiness":4590,"money_24h":89000},"SpaceAgeJupiterMoon":{"happiness":-1140,"population":4942,"demandHappiness":4942,"money_24h":97700},"SpaceAgeTitan":{"happiness":-1230,"population":5301,"demandHappiness":5301,"money_24h":106800},"SpaceAgeSpaceHub":{"happiness":-1310,"population":5670,"demandHappiness":5670,"money_24h":116400}} },
+    "R_MultiAge_HalloweenBonus20d": { prod: {"BronzeAge":{"happiness":-50,"population":87,"demandHappiness":87,"money_24h":700},"IronAge":{"happiness":-90,"population":188,"demandHappiness":188,"money_24h":1700},"EarlyMiddleAge":{"happiness":-100,"population":288,"demandHappiness":288,"money_24h":2900},"HighMiddleAge":{"happiness":-110,"population":405,"demandHappiness":405,"money_24h":4000},"LateMiddleAge":{"happiness":-130,"population":531,"demandHappiness":531,"money_24h":5300},"ColonialAge":{"happiness":-150,"population":671,"demandHappiness":671,"money_24h":8100},"IndustrialAge":{"happiness":-170,"population":820,"demandHappiness":820,"money_24h":10100},"ProgressiveEra":{"happiness":-190,"population":978,"demandHappiness":978,"money_24h":12300},"ModernEra":{"happiness":-200,"population":1147,"demandHappiness":1147,"money_24h":15300},"PostModernEra":{"happiness":-210,"population":1322,"demandHappiness":1322,"money_24h":19200},"ContemporaryEra":{"happiness":-240,"population":1507,"demandHappiness":1507,"money_24h":25000},"TomorrowEra":{"happiness":-290,"population":1698,"demandHappiness":1698,"money_24h":28900},"FutureEra":{"happiness":-350,"population":1899,"demandHappiness":1899,"money_24h":33200},"ArcticFuture":{"happiness":-410,"population":2106,"demandHappiness":2106,"money_24h":37700},"OceanicFuture":{"happiness":-470,"population":2320,"demandHappiness":2320,"money_24h":42500},"VirtualFuture":{"happiness":-560,"population":2540,"demandHappiness":2540,"money_24h":47600},"SpaceAgeMars":{"happiness":-900,"population":4021,"demandHappiness":4021,"money_24h":79500},"SpaceAgeAsteroidBelt":{"happiness":-980,"population":4368,"demandHappiness":4368,"money_24h":88100},"SpaceAgeVenus":{"happiness":-1060,"population":4721,"demandHappiness":4721,"money_24h":97100},"SpaceAgeJupiterMoon":{"happiness":-1140,"population":5084,"demandHappiness":5084,"money_24h":106600},"SpaceAgeTitan":{"happiness":-1230,"population":5453,"demandHappiness":5453,"money_24h":116500},"SpaceAgeSpaceHub":{"happiness":-1310,"population":5832,"demandHappiness":5832,"money_24h":126900}} },
+    "R_MultiAge_HalloweenBonus20e": { prod: {"BronzeAge":{"happiness":-50,"population":91,"demandHappiness":91,"money_24h":800},"IronAge":{"happiness":-90,"population":195,"demandHappiness":195,"money_24h":1900},"EarlyMiddleAge":{"happiness":-100,"population":299,"demandHappiness":299,"money_24h":3100},"HighMiddleAge":{"happiness":-110,"population":420,"demandHappiness":420,"money_24h":4400},"LateMiddleAge":{"happiness":-130,"population":551,"demandHappiness":551,"money_24h":5800},"ColonialAge":{"happiness":-150,"population":696,"demandHappiness":696,"money_24h":8800},"IndustrialAge":{"happiness":-170,"population":850,"demandHappiness":850,"money_24h":11000},"ProgressiveEra":{"happiness":-190,"population":1015,"demandHappiness":1015,"money_24h":13300},"ModernEra":{"happiness":-200,"population":1189,"demandHappiness":1189,"money_24h":16500},"PostModernEra":{"happiness":-210,"population":1371,"demandHappiness":1371,"money_24h":20800},"ContemporaryEra":{"happiness":-240,"population":1562,"demandHappiness":1562,"money_24h":27100},"TomorrowEra":{"happiness":-290,"population":1761,"demandHappiness":1761,"money_24h":31400},"FutureEra":{"happiness":-350,"population":1969,"demandHappiness":1969,"money_24h":35900},"ArcticFuture":{"happiness":-410,"population":2184,"demandHappiness":2184,"money_24h":40800},"OceanicFuture":{"happiness":-470,"population":2406,"demandHappiness":2406,"money_24h":46100},"VirtualFuture":{"happiness":-560,"population":2634,"demandHappiness":2634,"money_24h":51600},"SpaceAgeMars":{"happiness":-900,"population":4170,"demandHappiness":4170,"money_24h":86200},"SpaceAgeAsteroidBelt":{"happiness":-980,"population":4529,"demandHappiness":4529,"money_24h":95400},"SpaceAgeVenus":{"happiness":-1060,"population":4896,"demandHappiness":4896,"money_24h":105200},"SpaceAgeJupiterMoon":{"happiness":-1140,"population":5272,"demandHappiness":5272,"money_24h":115500},"SpaceAgeTitan":{"happiness":-1230,"population":5655,"demandHappiness":5655,"money_24h":126200},"SpaceAgeSpaceHub":{"happiness":-1310,"population":6048,"demandHappiness":6048,"money_24h":137500}} },
+    "R_MultiAge_HalloweenBonus20f": { prod: {"BronzeAge":{"happiness":-50,"population":94,"demandHappiness":94,"money_24h":800},"IronAge":{"happiness":-90,"population":202,"demandHappiness":202,"money_24h":2000},"EarlyMiddleAge":{"happiness":-100,"population":310,"demandHappiness":310,"money_24h":3400},"HighMiddleAge":{"happiness":-110,"population":435,"demandHappiness":435,"money_24h":4700},"LateMiddleAge":{"happiness":-130,"population":571,"demandHappiness":571,"money_24h":6200},"ColonialAge":{"happiness":-150,"population":720,"demandHappiness":720,"money_24h":9500},"IndustrialAge":{"happiness":-170,"population":880,"demandHappiness":880,"money_24h":11800},"ProgressiveEra":{"happiness":-190,"population":1051,"demandHappiness":1051,"money_24h":14300},"ModernEra":{"happiness":-200,"population":1232,"demandHappiness":1232,"money_24h":17800},"PostModernEra":{"happiness":-210,"population":1420,"demandHappiness":1420,"money_24h":22400},"ContemporaryEra":{"happiness":-240,"population":1618,"demandHappiness":1618,"money_24h":29200},"TomorrowEra":{"happiness":-290,"population":1824,"demandHappiness":1824,"money_24h":33800},"FutureEra":{"happiness":-350,"population":2039,"demandHappiness":2039,"money_24h":38700},"ArcticFuture":{"happiness":-410,"population":2262,"demandHappiness":2262,"money_24h":44000},"OceanicFuture":{"happiness":-470,"population":2492,"demandHappiness":2492,"money_24h":49600},"VirtualFuture":{"happiness":-560,"population":2728,"demandHappiness":2728,"money_24h":55600},"SpaceAgeMars":{"happiness":-900,"population":4319,"demandHappiness":4319,"money_24h":92800},"SpaceAgeAsteroidBelt":{"happiness":-980,"population":4691,"demandHappiness":4691,"money_24h":102800},"SpaceAgeVenus":{"happiness":-1060,"population":5070,"demandHappiness":5070,"money_24h":113300},"SpaceAgeJupiterMoon":{"happiness":-1140,"population":5460,"demandHappiness":5460,"money_24h":124400},"SpaceAgeTitan":{"happiness":-1230,"population":5857,"demandHappiness":5857,"money_24h":136000},"SpaceAgeSpaceHub":{"happiness":-1310,"population":6264,"demandHappiness":6264,"money_24h":148100}} },
+    "D_MultiAge_ChristmasBonus15": { prod: {"BronzeAge":{"happiness":180},"IronAge":{"happiness":230},"EarlyMiddleAge":{"happiness":250},"HighMiddleAge":{"happiness":280},"LateMiddleAge":{"happiness":320},"ColonialAge":{"happiness":370},"IndustrialAge":{"happiness":400},"ProgressiveEra":{"happiness":440},"ModernEra":{"happiness":470},"PostModernEra":{"happiness":490},"ContemporaryEra":{"happiness":570},"TomorrowEra":{"happiness":691},"FutureEra":{"happiness":828},"ArcticFuture":{"happiness":965},"OceanicFuture":{"happiness":1113},"VirtualFuture":{"happiness":1330},"SpaceAgeMars":{"happiness":2128},"SpaceAgeAsteroidBelt":{"happiness":2312},"SpaceAgeVenus":{"happiness":2498},"SpaceAgeJupiterMoon":{"happiness":2691},"SpaceAgeTitan":{"happiness":2886},"SpaceAgeSpaceHub":{"happiness":3087}} },
+    "R_MultiAge_EinsteinBonus17": { prod: {"BronzeAge":{"population":55,"demandHappiness":55,"money_24h":270},"IronAge":{"population":117,"demandHappiness":117,"money_24h":650},"EarlyMiddleAge":{"population":180,"demandHappiness":180,"money_24h":1080},"HighMiddleAge":{"population":253,"demandHappiness":253,"money_24h":1510},"LateMiddleAge":{"population":332,"demandHappiness":332,"money_24h":2000},"ColonialAge":{"population":419,"demandHappiness":419,"money_24h":3040},"IndustrialAge":{"population":512,"demandHappiness":512,"money_24h":3790},"ProgressiveEra":{"population":612,"demandHappiness":612,"money_24h":4600},"ModernEra":{"population":717,"demandHappiness":717,"money_24h":5720},"PostModernEra":{"population":826,"demandHappiness":826,"money_24h":7200},"ContemporaryEra":{"population":942,"demandHappiness":942,"money_24h":9370},"TomorrowEra":{"population":1061,"demandHappiness":1061,"money_24h":10850},"FutureEra":{"population":1187,"demandHappiness":1187,"money_24h":12440},"ArcticFuture":{"population":1316,"demandHappiness":1316,"money_24h":14140},"OceanicFuture":{"population":1450,"demandHappiness":1450,"money_24h":15940},"VirtualFuture":{"population":1588,"demandHappiness":1588,"money_24h":17860},"SpaceAgeMars":{"population":2513,"demandHappiness":2513,"money_24h":29820},"SpaceAgeAsteroidBelt":{"population":2730,"demandHappiness":2730,"money_24h":33030},"SpaceAgeVenus":{"population":2950,"demandHappiness":2950,"money_24h":36410},"SpaceAgeJupiterMoon":{"population":3177,"demandHappiness":3177,"money_24h":39970},"SpaceAgeTitan":{"population":3408,"demandHappiness":3408,"money_24h":43700},"SpaceAgeSpaceHub":{"population":3645,"demandHappiness":3645,"money_24h":47600}} },
+    "D_MultiAge_SummerBonus15": { prod: {"BronzeAge":{"happiness":144},"IronAge":{"happiness":198},"EarlyMiddleAge":{"happiness":206},"HighMiddleAge":{"happiness":225},"LateMiddleAge":{"happiness":246},"ColonialAge":{"happiness":289},"IndustrialAge":{"happiness":326},"ProgressiveEra":{"happiness":358},"ModernEra":{"happiness":383},"PostModernEra":{"happiness":399},"ContemporaryEra":{"happiness":463},"TomorrowEra":{"happiness":563},"FutureEra":{"happiness":674},"ArcticFuture":{"happiness":785},"OceanicFuture":{"happiness":906},"VirtualFuture":{"happiness":1082},"SpaceAgeMars":{"happiness":1731},"SpaceAgeAsteroidBelt":{"happiness":1881},"SpaceAgeVenus":{"happiness":2033},"SpaceAgeJupiterMoon":{"happiness":2190},"SpaceAgeTitan":{"happiness":2348},"SpaceAgeSpaceHub":{"happiness":2512}} },
+    "R_MultiAge_SpringBonus21a": { prod: {"BronzeAge":{"happiness":590,"population":149,"demandHappiness":149,"money_24h":800},"IronAge":{"happiness":1010,"population":319,"demandHappiness":319,"money_24h":1800},"EarlyMiddleAge":{"happiness":1120,"population":490,"demandHappiness":490,"money_24h":3000},"HighMiddleAge":{"happiness":1250,"population":688,"demandHappiness":688,"money_24h":4200},"LateMiddleAge":{"happiness":1390,"population":902,"demandHappiness":902,"money_24h":5600},"ColonialAge":{"happiness":1630,"population":1139,"demandHappiness":1139,"money_24h":8500},"IndustrialAge":{"happiness":1840,"population":1392,"demandHappiness":1392,"money_24h":10500},"ProgressiveEra":{"happiness":2020,"population":1661,"demandHappiness":1661,"money_24h":12800},"ModernEra":{"happiness":2160,"population":1947,"demandHappiness":1947,"money_24h":15900},"PostModernEra":{"happiness":2250,"population":2244,"demandHappiness":2244,"money_24h":20000},"ContemporaryEra":{"happiness":2620,"population":2558,"demandHappiness":2558,"money_24h":26000},"TomorrowEra":{"happiness":3180,"population":2882,"demandHappiness":2882,"money_24h":30200},"FutureEra":{"happiness":3810,"population":3223,"demandHappiness":3223,"money_24h":34600},"ArcticFuture":{"happiness":4440,"population":3575,"demandHappiness":3575,"money_24h":39300},"OceanicFuture":{"happiness":5120,"population":3938,"demandHappiness":3938,"money_24h":44300},"VirtualFuture":{"happiness":6120,"population":4312,"demandHappiness":4312,"money_24h":49600},"SpaceAgeMars":{"happiness":9790,"population":6826,"demandHappiness":6826,"money_24h":82900},"SpaceAgeAsteroidBelt":{"happiness":10630,"population":7414,"demandHappiness":7414,"money_24h":91800},"SpaceAgeVenus":{"happiness":11490,"population":8014,"demandHappiness":8014,"money_24h":101200},"SpaceAgeJupiterMoon":{"happiness":12380,"population":8630,"demandHappiness":8630,"money_24h":111000},"SpaceAgeTitan":{"happiness":13270,"population":9257,"demandHappiness":9257,"money_24h":121400},"SpaceAgeSpaceHub":{"happiness":14200,"population":9900,"demandHappiness":9900,"money_24h":132200}} },
+    "R_MultiAge_SpringBonus21b": { prod: {"BronzeAge":{"happiness":630,"population":155,"demandHappiness":155,"money_24h":900},"IronAge":{"happiness":1080,"population":334,"demandHappiness":334,"money_24h":2100},"EarlyMiddleAge":{"happiness":1190,"population":512,"demandHappiness":512,"money_24h":3500},"HighMiddleAge":{"happiness":1330,"population":719,"demandHappiness":719,"money_24h":4900},"LateMiddleAge":{"happiness":1480,"population":943,"demandHappiness":943,"money_24h":6500},"ColonialAge":{"happiness":1750,"population":1190,"demandHappiness":1190,"money_24h":9900},"IndustrialAge":{"happiness":1970,"population":1455,"demandHappiness":1455,"money_24h":12300},"ProgressiveEra":{"happiness":2160,"population":1737,"demandHappiness":1737,"money_24h":14900},"ModernEra":{"happiness":2310,"population":2036,"demandHappiness":2036,"money_24h":18600},"PostModernEra":{"happiness":2410,"population":2346,"demandHappiness":2346,"money_24h":23300},"ContemporaryEra":{"happiness":2800,"population":2674,"demandHappiness":2674,"money_24h":30400},"TomorrowEra":{"happiness":3400,"population":3013,"demandHappiness":3013,"money_24h":35200},"FutureEra":{"happiness":4070,"population":3370,"demandHappiness":3370,"money_24h":40300},"ArcticFuture":{"happiness":4740,"population":3738,"demandHappiness":3738,"money_24h":45800},"OceanicFuture":{"happiness":5470,"population":4117,"demandHappiness":4117,"money_24h":51700},"VirtualFuture":{"happiness":6540,"population":4508,"demandHappiness":4508,"money_24h":57900},"SpaceAgeMars":{"happiness":10460,"population":7136,"demandHappiness":7136,"money_24h":96700},"SpaceAgeAsteroidBelt":{"happiness":11370,"population":7751,"demandHappiness":7751,"money_24h":107100},"SpaceAgeVenus":{"happiness":12280,"population":8378,"demandHappiness":8378,"money_24h":118000},"SpaceAgeJupiterMoon":{"happiness":13230,"population":9022,"demandHappiness":9022,"money_24h":129500},"SpaceAgeTitan":{"happiness":14190,"population":9677,"demandHappiness":9677,"money_24h":141600},"SpaceAgeSpaceHub":{"happiness":15180,"population":10350,"demandHappiness":10350,"money_24h":154300}} },
+    "R_MultiAge_SpringBonus21c": { prod: {"BronzeAge":{"happiness":650,"population":162,"demandHappiness":162,"money_24h":1000},"IronAge":{"happiness":1130,"population":348,"demandHappiness":348,"money_24h":2300},"EarlyMiddleAge":{"happiness":1240,"population":534,"demandHappiness":534,"money_24h":3900},"HighMiddleAge":{"happiness":1390,"population":750,"demandHappiness":750,"money_24h":5500},"LateMiddleAge":{"happiness":1550,"population":984,"demandHappiness":984,"money_24h":7200},"ColonialAge":{"happiness":1820,"population":1242,"demandHappiness":1242,"money_24h":11000},"IndustrialAge":{"happiness":2050,"population":1518,"demandHappiness":1518,"money_24h":13700},"ProgressiveEra":{"happiness":2260,"population":1812,"demandHappiness":1812,"money_24h":16600},"ModernEra":{"happiness":2410,"population":2124,"demandHappiness":2124,"money_24h":20700},"PostModernEra":{"happiness":2510,"population":2448,"demandHappiness":2448,"money_24h":26000},"ContemporaryEra":{"happiness":2920,"population":2790,"demandHappiness":2790,"money_24h":33900},"TomorrowEra":{"happiness":3550,"population":3144,"demandHappiness":3144,"money_24h":39200},"FutureEra":{"happiness":4250,"population":3516,"demandHappiness":3516,"money_24h":44900},"ArcticFuture":{"happiness":4950,"population":3900,"demandHappiness":3900,"money_24h":51100},"OceanicFuture":{"happiness":5710,"population":4296,"demandHappiness":4296,"money_24h":57600},"VirtualFuture":{"happiness":6820,"population":4704,"demandHappiness":4704,"money_24h":64500},"SpaceAgeMars":{"happiness":10910,"population":7446,"demandHappiness":7446,"money_24h":107700},"SpaceAgeAsteroidBelt":{"happiness":11860,"population":8088,"demandHappiness":8088,"money_24h":119300},"SpaceAgeVenus":{"happiness":12810,"population":8742,"demandHappiness":8742,"money_24h":131500},"SpaceAgeJupiterMoon":{"happiness":13800,"population":9414,"demandHappiness":9414,"money_24h":144300},"SpaceAgeTitan":{"happiness":14800,"population":10098,"demandHappiness":10098,"money_24h":157800},"SpaceAgeSpaceHub":{"happiness":15840,"population":10800,"demandHappiness":10800,"money_24h":171900}} },
+    "R_MultiAge_SpringBonus21d": { prod: {"BronzeAge":{"happiness":690,"population":169,"demandHappiness":169,"money_24h":1100},"IronAge":{"happiness":1200,"population":363,"demandHappiness":363,"money_24h":2500},"EarlyMiddleAge":{"happiness":1320,"population":556,"demandHappiness":556,"money_24h":4200},"HighMiddleAge":{"happiness":1480,"population":781,"demandHappiness":781,"money_24h":5900},"LateMiddleAge":{"happiness":1650,"population":1025,"demandHappiness":1025,"money_24h":7800},"ColonialAge":{"happiness":1930,"population":1294,"demandHappiness":1294,"money_24h":11800},"IndustrialAge":{"happiness":2180,"population":1581,"demandHappiness":1581,"money_24h":14700},"ProgressiveEra":{"happiness":2400,"population":1888,"demandHappiness":1888,"money_24h":17900},"ModernEra":{"happiness":2560,"population":2213,"demandHappiness":2213,"money_24h":22300},"PostModernEra":{"happiness":2670,"population":2550,"demandHappiness":2550,"money_24h":28000},"ContemporaryEra":{"happiness":3100,"population":2906,"demandHappiness":2906,"money_24h":36500},"TomorrowEra":{"happiness":3770,"population":3275,"demandHappiness":3275,"money_24h":42200},"FutureEra":{"happiness":4510,"population":3663,"demandHappiness":3663,"money_24h":48400},"ArcticFuture":{"happiness":5260,"population":4063,"demandHappiness":4063,"money_24h":55000},"OceanicFuture":{"happiness":6060,"population":4475,"demandHappiness":4475,"money_24h":62000},"VirtualFuture":{"happiness":7240,"population":4900,"demandHappiness":4900,"money_24h":69400},"SpaceAgeMars":{"happiness":11590,"population":7756,"demandHappiness":7756,"money_24h":116000},"SpaceAgeAsteroidBelt":{"happiness":12600,"population":8425,"demandHappiness":8425,"money_24h":128500},"SpaceAgeVenus":{"happiness":13610,"population":9106,"demandHappiness":9106,"money_24h":141600},"SpaceAgeJupiterMoon":{"happiness":14660,"population":9806,"demandHappiness":9806,"money_24h":155400},"SpaceAgeTitan":{"happiness":15720,"population":10519,"demandHappiness":10519,"money_24h":169900},"SpaceAgeSpaceHub":{"happiness":16820,"population":11250,"demandHappiness":11250,"money_24h":185100}} },
+    "R_MultiAge_SpringBonus21e": { prod: {"BronzeAge":{"happiness":750,"population":176,"demandHappiness":176,"money_24h":1200},"IronAge":{"happiness":1300,"population":377,"demandHappiness":377,"money_24h":2800},"EarlyMiddleAge":{"happiness":1430,"population":579,"demandHappiness":579,"money_24h":4700},"HighMiddleAge":{"happiness":1600,"population":813,"demandHappiness":813,"money_24h":6600},"LateMiddleAge":{"happiness":1780,"population":1066,"demandHappiness":1066,"money_24h":8700},"ColonialAge":{"happiness":2100,"population":1346,"demandHappiness":1346,"money_24h":13200},"IndustrialAge":{"happiness":2370,"population":1645,"demandHappiness":1645,"money_24h":16500},"ProgressiveEra":{"happiness":2600,"population":1963,"demandHappiness":1963,"money_24h":20000},"ModernEra":{"happiness":2780,"population":2301,"demandHappiness":2301,"money_24h":24900},"PostModernEra":{"happiness":2900,"population":2652,"demandHappiness":2652,"money_24h":31300},"ContemporaryEra":{"happiness":3360,"population":3023,"demandHappiness":3023,"money_24h":40800},"TomorrowEra":{"happiness":4080,"population":3406,"demandHappiness":3406,"money_24h":47200},"FutureEra":{"happiness":4890,"population":3809,"demandHappiness":3809,"money_24h":54100},"ArcticFuture":{"happiness":5700,"population":4225,"demandHappiness":4225,"money_24h":61500},"OceanicFuture":{"happiness":6580,"population":4654,"demandHappiness":4654,"money_24h":69400},"VirtualFuture":{"happiness":7860,"population":5096,"demandHappiness":5096,"money_24h":77700},"SpaceAgeMars":{"happiness":12570,"population":8067,"demandHappiness":8067,"money_24h":129800},"SpaceAgeAsteroidBelt":{"happiness":13660,"population":8762,"demandHappiness":8762,"money_24h":143800},"SpaceAgeVenus":{"happiness":14760,"population":9471,"demandHappiness":9471,"money_24h":158500},"SpaceAgeJupiterMoon":{"happiness":15900,"population":10199,"demandHappiness":10199,"money_24h":173900},"SpaceAgeTitan":{"happiness":17050,"population":10940,"demandHappiness":10940,"money_24h":190200},"SpaceAgeSpaceHub":{"happiness":18240,"population":11700,"demandHappiness":11700,"money_24h":207100}} },
+    "R_MultiAge_SpringBonus21f": { prod: {"BronzeAge":{"happiness":770,"population":182,"demandHappiness":182,"money_24h":1300},"IronAge":{"happiness":1340,"population":392,"demandHappiness":392,"money_24h":3100},"EarlyMiddleAge":{"happiness":1480,"population":601,"demandHappiness":601,"money_24h":5100},"HighMiddleAge":{"happiness":1650,"population":844,"demandHappiness":844,"money_24h":7100},"LateMiddleAge":{"happiness":1840,"population":1107,"demandHappiness":1107,"money_24h":9400},"ColonialAge":{"happiness":2160,"population":1397,"demandHappiness":1397,"money_24h":14400},"IndustrialAge":{"happiness":2440,"population":1708,"demandHappiness":1708,"money_24h":17900},"ProgressiveEra":{"happiness":2680,"population":2039,"demandHappiness":2039,"money_24h":21700},"ModernEra":{"happiness":2860,"population":2390,"demandHappiness":2390,"money_24h":27000},"PostModernEra":{"happiness":2980,"population":2754,"demandHappiness":2754,"money_24h":34000},"ContemporaryEra":{"happiness":3470,"population":3139,"demandHappiness":3139,"money_24h":44300},"TomorrowEra":{"happiness":4210,"population":3537,"demandHappiness":3537,"money_24h":51300},"FutureEra":{"happiness":5040,"population":3956,"demandHappiness":3956,"money_24h":58800},"ArcticFuture":{"happiness":5870,"population":4388,"demandHappiness":4388,"money_24h":66800},"OceanicFuture":{"happiness":6770,"population":4833,"demandHappiness":4833,"money_24h":75300},"VirtualFuture":{"happiness":8090,"population":5292,"demandHappiness":5292,"money_24h":84300},"SpaceAgeMars":{"happiness":12950,"population":8377,"demandHappiness":8377,"money_24h":140800},"SpaceAgeAsteroidBelt":{"happiness":14070,"population":9099,"demandHappiness":9099,"money_24h":156000},"SpaceAgeVenus":{"happiness":15200,"population":9835,"demandHappiness":9835,"money_24h":172000},"SpaceAgeJupiterMoon":{"happiness":16370,"population":10591,"demandHappiness":10591,"money_24h":188700},"SpaceAgeTitan":{"happiness":17560,"population":11360,"demandHappiness":11360,"money_24h":206400},"SpaceAgeSpaceHub":{"happiness":18790,"population":12150,"demandHappiness":12150,"money_24h":224800}} },
+    "R_MultiAge_SpringBonus21g": { prod: {"BronzeAge":{"happiness":840,"population":196,"demandHappiness":196,"money_24h":1400},"IronAge":{"happiness":1440,"population":421,"demandHappiness":421,"money_24h":3200},"EarlyMiddleAge":{"happiness":1600,"population":645,"demandHappiness":645,"money_24h":5400},"HighMiddleAge":{"happiness":1780,"population":906,"demandHappiness":906,"money_24h":7600},"LateMiddleAge":{"happiness":1990,"population":1189,"demandHappiness":1189,"money_24h":10000},"ColonialAge":{"happiness":2340,"population":1501,"demandHappiness":1501,"money_24h":15200},"IndustrialAge":{"happiness":2630,"population":1834,"demandHappiness":1834,"money_24h":19000},"ProgressiveEra":{"happiness":2890,"population":2190,"demandHappiness":2190,"money_24h":23000},"ModernEra":{"happiness":3100,"population":2567,"demandHappiness":2567,"money_24h":28600},"PostModernEra":{"happiness":3230,"population":2958,"demandHappiness":2958,"money_24h":36000},"ContemporaryEra":{"happiness":3750,"population":3371,"demandHappiness":3371,"money_24h":46900},"TomorrowEra":{"happiness":4550,"population":3799,"demandHappiness":3799,"money_24h":54300},"FutureEra":{"happiness":5450,"population":4249,"demandHappiness":4249,"money_24h":62200},"ArcticFuture":{"happiness":6350,"population":4713,"demandHappiness":4713,"money_24h":70700},"OceanicFuture":{"happiness":7320,"population":5191,"demandHappiness":5191,"money_24h":79700},"VirtualFuture":{"happiness":8750,"population":5684,"demandHappiness":5684,"money_24h":89300},"SpaceAgeMars":{"happiness":14000,"population":8997,"demandHappiness":8997,"money_24h":149100},"SpaceAgeAsteroidBelt":{"happiness":15220,"population":9773,"demandHappiness":9773,"money_24h":165200},"SpaceAgeVenus":{"happiness":16440,"population":10563,"demandHappiness":10563,"money_24h":182100},"SpaceAgeJupiterMoon":{"happiness":17710,"population":11375,"demandHappiness":11375,"money_24h":199800},"SpaceAgeTitan":{"happiness":18990,"population":12202,"demandHappiness":12202,"money_24h":218500},"SpaceAgeSpaceHub":{"happiness":20310,"population":13050,"demandHappiness":13050,"money_24h":238000}} },
+    "R_MultiAge_SpringBonus21h": { prod: {"BronzeAge":{"happiness":900,"population":209,"demandHappiness":209,"money_24h":1500},"IronAge":{"happiness":1550,"population":450,"demandHappiness":450,"money_24h":3500},"EarlyMiddleAge":{"happiness":1720,"population":690,"demandHappiness":690,"money_24h":5800},"HighMiddleAge":{"happiness":1920,"population":969,"demandHappiness":969,"money_24h":8100},"LateMiddleAge":{"happiness":2140,"population":1271,"demandHappiness":1271,"money_24h":10700},"ColonialAge":{"happiness":2510,"population":1604,"demandHappiness":1604,"money_24h":16300},"IndustrialAge":{"happiness":2830,"population":1961,"demandHappiness":1961,"money_24h":20400},"ProgressiveEra":{"happiness":3110,"population":2341,"demandHappiness":2341,"money_24h":24700},"ModernEra":{"happiness":3330,"population":2744,"demandHappiness":2744,"money_24h":30700},"PostModernEra":{"happiness":3470,"population":3162,"demandHappiness":3162,"money_24h":38700},"ContemporaryEra":{"happiness":4030,"population":3604,"demandHappiness":3604,"money_24h":50300},"TomorrowEra":{"happiness":4890,"population":4061,"demandHappiness":4061,"money_24h":58300},"FutureEra":{"happiness":5860,"population":4542,"demandHappiness":4542,"money_24h":66800},"ArcticFuture":{"happiness":6820,"population":5038,"demandHappiness":5038,"money_24h":75900},"OceanicFuture":{"happiness":7880,"population":5549,"demandHappiness":5549,"money_24h":85600},"VirtualFuture":{"happiness":9410,"population":6076,"demandHappiness":6076,"money_24h":95900},"SpaceAgeMars":{"happiness":15050,"population":9618,"demandHappiness":9618,"money_24h":160200},"SpaceAgeAsteroidBelt":{"happiness":16360,"population":10447,"demandHappiness":10447,"money_24h":177400},"SpaceAgeVenus":{"happiness":17680,"population":11292,"demandHappiness":11292,"money_24h":195600},"SpaceAgeJupiterMoon":{"happiness":19040,"population":12160,"demandHappiness":12160,"money_24h":214600},"SpaceAgeTitan":{"happiness":20420,"population":13043,"demandHappiness":13043,"money_24h":234700},"SpaceAgeSpaceHub":{"happiness":21840,"population":13950,"demandHappiness":13950,"money_24h":255600}} },
+    "R_MultiAge_SpringBonus21i": { prod: {"BronzeAge":{"happiness":960,"population":223,"demandHappiness":223,"money_24h":1600},"IronAge":{"happiness":1660,"population":479,"demandHappiness":479,"money_24h":3800},"EarlyMiddleAge":{"happiness":1840,"population":734,"demandHappiness":734,"money_24h":6300},"HighMiddleAge":{"happiness":2050,"population":1031,"demandHappiness":1031,"money_24h":8800},"LateMiddleAge":{"happiness":2290,"population":1353,"demandHappiness":1353,"money_24h":11700},"ColonialAge":{"happiness":2690,"population":1708,"demandHappiness":1708,"money_24h":17800},"IndustrialAge":{"happiness":3030,"population":2087,"demandHappiness":2087,"money_24h":22100},"ProgressiveEra":{"happiness":3330,"population":2492,"demandHappiness":2492,"money_24h":26800},"ModernEra":{"happiness":3560,"population":2921,"demandHappiness":2921,"money_24h":33400},"PostModernEra":{"happiness":3710,"population":3366,"demandHappiness":3366,"money_24h":42000},"ContemporaryEra":{"happiness":4310,"population":3836,"demandHappiness":3836,"money_24h":54700},"TomorrowEra":{"happiness":5230,"population":4323,"demandHappiness":4323,"money_24h":63300},"FutureEra":{"happiness":6270,"population":4835,"demandHappiness":4835,"money_24h":72600},"ArcticFuture":{"happiness":7300,"population":5363,"demandHappiness":5363,"money_24h":82500},"OceanicFuture":{"happiness":8430,"population":5907,"demandHappiness":5907,"money_24h":93000},"VirtualFuture":{"happiness":10070,"population":6468,"demandHappiness":6468,"money_24h":104200},"SpaceAgeMars":{"happiness":16110,"population":10238,"demandHappiness":10238,"money_24h":174000},"SpaceAgeAsteroidBelt":{"happiness":17510,"population":11121,"demandHappiness":11121,"money_24h":192700},"SpaceAgeVenus":{"happiness":18910,"population":12020,"demandHappiness":12020,"money_24h":212400},"SpaceAgeJupiterMoon":{"happiness":20370,"population":12944,"demandHappiness":12944,"money_24h":233200},"SpaceAgeTitan":{"happiness":21850,"population":13885,"demandHappiness":13885,"money_24h":254900},"SpaceAgeSpaceHub":{"happiness":23370,"population":14850,"demandHappiness":14850,"money_24h":277700}} },
+    "D_MultiAge_WinterBonusSet17b": { prod: {"BronzeAge":{"happiness":50},"IronAge":{"happiness":70},"EarlyMiddleAge":{"happiness":80},"HighMiddleAge":{"happiness":90},"LateMiddleAge":{"happiness":100},"ColonialAge":{"happiness":110},"IndustrialAge":{"happiness":130},"ProgressiveEra":{"happiness":140},"ModernEra":{"happiness":150},"PostModernEra":{"happiness":160},"ContemporaryEra":{"happiness":180},"TomorrowEra":{"happiness":220},"FutureEra":{"happiness":260},"ArcticFuture":{"happiness":310},"OceanicFuture":{"happiness":350},"VirtualFuture":{"happiness":420},"SpaceAgeMars":{"happiness":680},"SpaceAgeAsteroidBelt":{"happiness":740},"SpaceAgeVenus":{"happiness":800},"SpaceAgeJupiterMoon":{"happiness":860},"SpaceAgeTitan":{"happiness":920},"SpaceAgeSpaceHub":{"happiness":980}} },
+    "R_MultiAge_ShakespeareBonus18": { prod: {"BronzeAge":{"population":125,"demandHappiness":125,"money_24h":800},"IronAge":{"population":265,"demandHappiness":265,"money_24h":1920},"EarlyMiddleAge":{"population":400,"demandHappiness":400,"money_24h":2800},"HighMiddleAge":{"population":500,"demandHappiness":500,"money_24h":3920},"LateMiddleAge":{"population":656,"demandHappiness":656,"money_24h":4440},"ColonialAge":{"population":828,"demandHappiness":828,"money_24h":6760},"IndustrialAge":{"population":1012,"demandHappiness":1012,"money_24h":8420},"ProgressiveEra":{"population":1208,"demandHappiness":1208,"money_24h":10220},"ModernEra":{"population":1416,"demandHappiness":1416,"money_24h":12720},"PostModernEra":{"population":1632,"demandHappiness":1632,"money_24h":16000},"ContemporaryEra":{"population":1860,"demandHappiness":1860,"money_24h":20830},"TomorrowEra":{"population":2096,"demandHappiness":2096,"money_24h":24120},"FutureEra":{"population":2344,"demandHappiness":2344,"money_24h":27650},"ArcticFuture":{"population":2600,"demandHappiness":2600,"money_24h":31420},"OceanicFuture":{"population":2864,"demandHappiness":2864,"money_24h":35420},"VirtualFuture":{"population":3136,"demandHappiness":3136,"money_24h":39680},"SpaceAgeMars":{"population":4964,"demandHappiness":4964,"money_24h":66280},"SpaceAgeAsteroidBelt":{"population":5392,"demandHappiness":5392,"money_24h":73410},"SpaceAgeVenus":{"population":5828,"demandHappiness":5828,"money_24h":80920},"SpaceAgeJupiterMoon":{"population":6276,"demandHappiness":6276,"money_24h":88820},"SpaceAgeTitan":{"population":6732,"demandHappiness":6732,"money_24h":97100},"SpaceAgeSpaceHub":{"population":7200,"demandHappiness":7200,"money_24h":105770}} },
+    "R_MultiAge_SummerBonus1": { prod: {"BronzeAge":{"population":14,"demandHappiness":14,"money_24h":100},"IronAge":{"population":29,"demandHappiness":29,"money_24h":150},"EarlyMiddleAge":{"population":45,"demandHappiness":45,"money_24h":230},"HighMiddleAge":{"population":63,"demandHappiness":63,"money_24h":320},"LateMiddleAge":{"population":82,"demandHappiness":82,"money_24h":420},"ColonialAge":{"population":104,"demandHappiness":104,"money_24h":640},"IndustrialAge":{"population":127,"demandHappiness":127,"money_24h":800},"ProgressiveEra":{"population":151,"demandHappiness":151,"money_24h":970},"ModernEra":{"population":177,"demandHappiness":177,"money_24h":1200},"PostModernEra":{"population":204,"demandHappiness":204,"money_24h":1500},"ContemporaryEra":{"population":233,"demandHappiness":233,"money_24h":2000},"TomorrowEra":{"population":262,"demandHappiness":262,"money_24h":2300},"FutureEra":{"population":293,"demandHappiness":293,"money_24h":2600},"ArcticFuture":{"population":325,"demandHappiness":325,"money_24h":2970},"OceanicFuture":{"population":358,"demandHappiness":358,"money_24h":3350},"VirtualFuture":{"population":392,"demandHappiness":392,"money_24h":3750},"SpaceAgeMars":{"population":621,"demandHappiness":621,"money_24h":6260},"SpaceAgeAsteroidBelt":{"population":674,"demandHappiness":674,"money_24h":6930},"SpaceAgeVenus":{"population":729,"demandHappiness":729,"money_24h":7640},"SpaceAgeJupiterMoon":{"population":785,"demandHappiness":785,"money_24h":8390},"SpaceAgeTitan":{"population":842,"demandHappiness":842,"money_24h":9170},"SpaceAgeSpaceHub":{"population":900,"demandHappiness":900,"money_24h":9990}} },
+    "A_MultiAge_HalloweenBonus16b": { prod: {"BronzeAge":{"happiness":360},"IronAge":{"happiness":510},"EarlyMiddleAge":{"happiness":560},"HighMiddleAge":{"happiness":630},"LateMiddleAge":{"happiness":700},"ColonialAge":{"happiness":820},"IndustrialAge":{"happiness":920},"ProgressiveEra":{"happiness":1010},"ModernEra":{"happiness":1090},"PostModernEra":{"happiness":1130},"ContemporaryEra":{"happiness":1310},"TomorrowEra":{"happiness":1600},"FutureEra":{"happiness":1910},"ArcticFuture":{"happiness":2230},"OceanicFuture":{"happiness":2570},"VirtualFuture":{"happiness":3070},"SpaceAgeMars":{"happiness":4910},"SpaceAgeAsteroidBelt":{"happiness":5340},"SpaceAgeVenus":{"happiness":5770},"SpaceAgeJupiterMoon":{"happiness":6210},"SpaceAgeTitan":{"happiness":6660},"SpaceAgeSpaceHub":{"happiness":7130}} },
+    "R_MultiAge_FallBonus19a": { prod: {"BronzeAge":{"population":150,"demandHappiness":150,"money_24h":700},"IronAge":{"population":330,"demandHappiness":330,"money_24h":1600},"EarlyMiddleAge":{"population":510,"demandHappiness":510,"money_24h":2600},"HighMiddleAge":{"population":710,"demandHappiness":710,"money_24h":3700},"LateMiddleAge":{"population":930,"demandHappiness":930,"money_24h":4900},"ColonialAge":{"population":1180,"demandHappiness":1180,"money_24h":7400},"IndustrialAge":{"population":1440,"demandHappiness":1440,"money_24h":9300},"ProgressiveEra":{"population":1720,"demandHappiness":1720,"money_24h":11300},"ModernEra":{"population":2020,"demandHappiness":2020,"money_24h":14000},"PostModernEra":{"population":2330,"demandHappiness":2330,"money_24h":17600},"ContemporaryEra":{"population":2650,"demandHappiness":2650,"money_24h":22900},"TomorrowEra":{"population":2990,"demandHappiness":2990,"money_24h":26500},"FutureEra":{"population":3340,"demandHappiness":3340,"money_24h":30400},"ArcticFuture":{"population":3710,"demandHappiness":3710,"money_24h":34600},"OceanicFuture":{"population":4080,"demandHappiness":4080,"money_24h":39000},"VirtualFuture":{"population":4470,"demandHappiness":4470,"money_24h":43700},"SpaceAgeMars":{"population":7070,"demandHappiness":7070,"money_24h":72900},"SpaceAgeAsteroidBelt":{"population":7680,"demandHappiness":7680,"money_24h":80800},"SpaceAgeVenus":{"population":8300,"demandHappiness":8300,"money_24h":89000},"SpaceAgeJupiterMoon":{"population":8940,"demandHappiness":8940,"money_24h":97700},"SpaceAgeTitan":{"population":9590,"demandHappiness":9590,"money_24h":106800},"SpaceAgeSpaceHub":{"population":10260,"demandHappiness":10260,"money_24h":116400}} },
+    "R_MultiAge_FallBonus19b": { prod: {"BronzeAge":{"population":160,"demandHappiness":160,"money_24h":700},"IronAge":{"population":350,"demandHappiness":350,"money_24h":1700},"EarlyMiddleAge":{"population":530,"demandHappiness":530,"money_24h":2800},"HighMiddleAge":{"population":750,"demandHappiness":750,"money_24h":3900},"LateMiddleAge":{"population":980,"demandHappiness":980,"money_24h":5100},"ColonialAge":{"population":1240,"demandHappiness":1240,"money_24h":7800},"IndustrialAge":{"population":1520,"demandHappiness":1520,"money_24h":9700},"ProgressiveEra":{"population":1810,"demandHappiness":1810,"money_24h":11800},"ModernEra":{"population":2120,"demandHappiness":2120,"money_24h":14600},"PostModernEra":{"population":2450,"demandHappiness":2450,"money_24h":18400},"ContemporaryEra":{"population":2790,"demandHappiness":2790,"money_24h":24000},"TomorrowEra":{"population":3140,"demandHappiness":3140,"money_24h":27700},"FutureEra":{"population":3520,"demandHappiness":3520,"money_24h":31800},"ArcticFuture":{"population":3900,"demandHappiness":3900,"money_24h":36100},"OceanicFuture":{"population":4300,"demandHappiness":4300,"money_24h":40700},"VirtualFuture":{"population":4700,"demandHappiness":4700,"money_24h":45600},"SpaceAgeMars":{"population":7450,"demandHappiness":7450,"money_24h":76200},"SpaceAgeAsteroidBelt":{"population":8090,"demandHappiness":8090,"money_24h":84400},"SpaceAgeVenus":{"population":8740,"demandHappiness":8740,"money_24h":93100},"SpaceAgeJupiterMoon":{"population":9410,"demandHappiness":9410,"money_24h":102100},"SpaceAgeTitan":{"population":10100,"demandHappiness":10100,"money_24h":111700},"SpaceAgeSpaceHub":{"population":10800,"demandHappiness":10800,"money_24h":121600}} },
+    "R_MultiAge_FallBonus19c": { prod: {"BronzeAge":{"population":170,"demandHappiness":170,"money_24h":700},"IronAge":{"population":370,"demandHappiness":370,"money_24h":1700},"EarlyMiddleAge":{"population":560,"demandHappiness":560,"money_24h":2900},"HighMiddleAge":{"population":790,"demandHappiness":790,"money_24h":4000},"LateMiddleAge":{"population":1030,"demandHappiness":1030,"money_24h":5300},"ColonialAge":{"population":1300,"demandHappiness":1300,"money_24h":8100},"IndustrialAge":{"population":1590,"demandHappiness":1590,"money_24h":10100},"ProgressiveEra":{"population":1900,"demandHappiness":1900,"money_24h":12300},"ModernEra":{"population":2230,"demandHappiness":2230,"money_24h":15300},"PostModernEra":{"population":2570,"demandHappiness":2570,"money_24h":19200},"ContemporaryEra":{"population":2930,"demandHappiness":2930,"money_24h":25000},"TomorrowEra":{"population":3300,"demandHappiness":3300,"money_24h":28900},"FutureEra":{"population":3690,"demandHappiness":3690,"money_24h":33200},"ArcticFuture":{"population":4100,"demandHappiness":4100,"money_24h":37700},"OceanicFuture":{"population":4510,"demandHappiness":4510,"money_24h":42500},"VirtualFuture":{"population":4940,"demandHappiness":4940,"money_24h":47600},"SpaceAgeMars":{"population":7820,"demandHappiness":7820,"money_24h":79500},"SpaceAgeAsteroidBelt":{"population":8490,"demandHappiness":8490,"money_24h":88100},"SpaceAgeVenus":{"population":9180,"demandHappiness":9180,"money_24h":97100},"SpaceAgeJupiterMoon":{"population":9880,"demandHappiness":9880,"money_24h":106600},"SpaceAgeTitan":{"population":10600,"demandHappiness":10600,"money_24h":116500},"SpaceAgeSpaceHub":{"population":11340,"demandHappiness":11340,"money_24h":126900}} },
+    "R_MultiAge_FallBonus19d": { prod: {"BronzeAge":{"population":180,"demandHappiness":180,"money_24h":800},"IronAge":{"population":380,"demandHappiness":380,"money_24h":1800},"EarlyMiddleAge":{"population":590,"demandHappiness":590,"money_24h":3000},"HighMiddleAge":{"population":830,"demandHappiness":830,"money_24h":4200},"LateMiddleAge":{"population":1080,"demandHappiness":1080,"money_24h":5600},"ColonialAge":{"population":1370,"demandHappiness":1370,"money_24h":8500},"IndustrialAge":{"population":1670,"demandHappiness":1670,"money_24h":10500},"ProgressiveEra":{"population":1990,"demandHappiness":1990,"money_24h":12800},"ModernEra":{"population":2340,"demandHappiness":2340,"money_24h":15900},"PostModernEra":{"population":2690,"demandHappiness":2690,"money_24h":20000},"ContemporaryEra":{"population":3070,"demandHappiness":3070,"money_24h":26000},"TomorrowEra":{"population":3460,"demandHappiness":3460,"money_24h":30200},"FutureEra":{"population":3870,"demandHappiness":3870,"money_24h":34600},"ArcticFuture":{"population":4290,"demandHappiness":4290,"money_24h":39300},"OceanicFuture":{"population":4730,"demandHappiness":4730,"money_24h":44300},"VirtualFuture":{"population":5170,"demandHappiness":5170,"money_24h":49600},"SpaceAgeMars":{"population":8190,"demandHappiness":8190,"money_24h":82900},"SpaceAgeAsteroidBelt":{"population":8900,"demandHappiness":8900,"money_24h":91800},"SpaceAgeVenus":{"population":9620,"demandHappiness":9620,"money_24h":101200},"SpaceAgeJupiterMoon":{"population":10360,"demandHappiness":10360,"money_24h":111000},"SpaceAgeTitan":{"population":11110,"demandHappiness":11110,"money_24h":121400},"SpaceAgeSpaceHub":{"population":11880,"demandHappiness":11880,"money_24h":132200}} },
+    "R_MultiAge_FallBonus19e": { prod: {"BronzeAge":{"population":190,"demandHappiness":190,"money_24h":800},"IronAge":{"population":400,"demandHappiness":400,"money_24h":1900},"EarlyMiddleAge":{"population":610,"demandHappiness":610,"money_24h":3100},"HighMiddleAge":{"population":860,"demandHappiness":860,"money_24h":4400},"LateMiddleAge":{"population":1130,"demandHappiness":1130,"money_24h":5800},"ColonialAge":{"population":1430,"demandHappiness":1430,"money_24h":8800},"IndustrialAge":{"population":1750,"demandHappiness":1750,"money_24h":11000},"ProgressiveEra":{"population":2080,"demandHappiness":2080,"money_24h":13300},"ModernEra":{"population":2440,"demandHappiness":2440,"money_24h":16500},"PostModernEra":{"population":2820,"demandHappiness":2820,"money_24h":20800},"ContemporaryEra":{"population":3210,"demandHappiness":3210,"money_24h":27100},"TomorrowEra":{"population":3620,"demandHappiness":3620,"money_24h":31400},"FutureEra":{"population":4040,"demandHappiness":4040,"money_24h":35900},"ArcticFuture":{"population":4490,"demandHappiness":4490,"money_24h":40800},"OceanicFuture":{"population":4940,"demandHappiness":4940,"money_24h":46100},"VirtualFuture":{"population":5410,"demandHappiness":5410,"money_24h":51600},"SpaceAgeMars":{"population":8560,"demandHappiness":8560,"money_24h":86200},"SpaceAgeAsteroidBelt":{"population":9300,"demandHappiness":9300,"money_24h":95400},"SpaceAgeVenus":{"population":10050,"demandHappiness":10050,"money_24h":105200},"SpaceAgeJupiterMoon":{"population":10830,"demandHappiness":10830,"money_24h":115500},"SpaceAgeTitan":{"population":11610,"demandHappiness":11610,"money_24h":126200},"SpaceAgeSpaceHub":{"population":12420,"demandHappiness":12420,"money_24h":137500}} },
+    "R_MultiAge_FallBonus19f": { prod: {"BronzeAge":{"population":190,"demandHappiness":190,"money_24h":800},"IronAge":{"population":420,"demandHappiness":420,"money_24h":1900},"EarlyMiddleAge":{"population":640,"demandHappiness":640,"money_24h":3200},"HighMiddleAge":{"population":900,"demandHappiness":900,"money_24h":4500},"LateMiddleAge":{"population":1180,"demandHappiness":1180,"money_24h":6000},"ColonialAge":{"population":1490,"demandHappiness":1490,"money_24h":9100},"IndustrialAge":{"population":1820,"demandHappiness":1820,"money_24h":11400},"ProgressiveEra":{"population":2170,"demandHappiness":2170,"money_24h":13800},"ModernEra":{"population":2550,"demandHappiness":2550,"money_24h":17200},"PostModernEra":{"population":2940,"demandHappiness":2940,"money_24h":21600},"ContemporaryEra":{"population":3350,"demandHappiness":3350,"money_24h":28100},"TomorrowEra":{"population":3770,"demandHappiness":3770,"money_24h":32600},"FutureEra":{"population":4220,"demandHappiness":4220,"money_24h":37300},"ArcticFuture":{"population":4680,"demandHappiness":4680,"money_24h":42400},"OceanicFuture":{"population":5160,"demandHappiness":5160,"money_24h":47800},"VirtualFuture":{"population":5640,"demandHappiness":5640,"money_24h":53600},"SpaceAgeMars":{"population":8940,"demandHappiness":8940,"money_24h":89500},"SpaceAgeAsteroidBelt":{"population":9710,"demandHappiness":9710,"money_24h":99100},"SpaceAgeVenus":{"population":10490,"demandHappiness":10490,"money_24h":109200},"SpaceAgeJupiterMoon":{"population":11300,"demandHappiness":11300,"money_24h":119900},"SpaceAgeTitan":{"population":12120,"demandHappiness":12120,"money_24h":131100},"SpaceAgeSpaceHub":{"population":12960,"demandHappiness":12960,"money_24h":142800}} },
+    "R_MultiAge_SpringBonusSet17b": { prod: {"BronzeAge":{"money_24h":300},"IronAge":{"money_24h":720},"EarlyMiddleAge":{"money_24h":1200},"HighMiddleAge":{"money_24h":1700},"LateMiddleAge":{"money_24h":2200},"ColonialAge":{"money_24h":3400},"IndustrialAge":{"money_24h":4200},"ProgressiveEra":{"money_24h":5100},"ModernEra":{"money_24h":6500},"PostModernEra":{"money_24h":8000},"ContemporaryEra":{"money_24h":10400},"TomorrowEra":{"money_24h":12000},"FutureEra":{"money_24h":13800},"ArcticFuture":{"money_24h":15700},"OceanicFuture":{"money_24h":17700},"VirtualFuture":{"money_24h":19830},"SpaceAgeMars":{"money_24h":33120},"SpaceAgeAsteroidBelt":{"money_24h":36690},"SpaceAgeVenus":{"money_24h":40440},"SpaceAgeJupiterMoon":{"money_24h":44390},"SpaceAgeTitan":{"money_24h":48530},"SpaceAgeSpaceHub":{"money_24h":52860}} },
+    "D_MultiAge_SpringBonusSet17a": { prod: {"BronzeAge":{"happiness":200},"IronAge":{"happiness":260},"EarlyMiddleAge":{"happiness":280},"HighMiddleAge":{"happiness":320},"LateMiddleAge":{"happiness":350},"ColonialAge":{"happiness":410},"IndustrialAge":{"happiness":470},"ProgressiveEra":{"happiness":510},"ModernEra":{"happiness":550},"PostModernEra":{"happiness":570},"ContemporaryEra":{"happiness":660},"TomorrowEra":{"happiness":810},"FutureEra":{"happiness":970},"ArcticFuture":{"happiness":1130},"OceanicFuture":{"happiness":1300},"VirtualFuture":{"happiness":1550},"SpaceAgeMars":{"happiness":2480},"SpaceAgeAsteroidBelt":{"happiness":2700},"SpaceAgeVenus":{"happiness":2920},"SpaceAgeJupiterMoon":{"happiness":3140},"SpaceAgeTitan":{"happiness":3370},"SpaceAgeSpaceHub":{"happiness":3600}} },
+    "D_MultiAge_SpringBonusSet17b": { prod: {"BronzeAge":{"happiness":200},"IronAge":{"happiness":260},"EarlyMiddleAge":{"happiness":280},"HighMiddleAge":{"happiness":320},"LateMiddleAge":{"happiness":350},"ColonialAge":{"happiness":410},"IndustrialAge":{"happiness":470},"ProgressiveEra":{"happiness":510},"ModernEra":{"happiness":550},"PostModernEra":{"happiness":570},"ContemporaryEra":{"happiness":660},"TomorrowEra":{"happiness":810},"FutureEra":{"happiness":970},"ArcticFuture":{"happiness":1130},"OceanicFuture":{"happiness":1300},"VirtualFuture":{"happiness":1550},"SpaceAgeMars":{"happiness":2480},"SpaceAgeAsteroidBelt":{"happiness":2700},"SpaceAgeVenus":{"happiness":2920},"SpaceAgeJupiterMoon":{"happiness":3140},"SpaceAgeTitan":{"happiness":3370},"SpaceAgeSpaceHub":{"happiness":3600}} },
+    "R_MultiAge_SpringBonusSet17a": { prod: {"BronzeAge":{"money_24h":260},"IronAge":{"money_24h":630},"EarlyMiddleAge":{"money_24h":1050},"HighMiddleAge":{"money_24h":1450},"LateMiddleAge":{"money_24h":1950},"ColonialAge":{"money_24h":2950},"IndustrialAge":{"money_24h":3700},"ProgressiveEra":{"money_24h":4500},"ModernEra":{"money_24h":5600},"PostModernEra":{"money_24h":7000},"ContemporaryEra":{"money_24h":9100},"TomorrowEra":{"money_24h":10500},"FutureEra":{"money_24h":12000},"ArcticFuture":{"money_24h":13800},"OceanicFuture":{"money_24h":15500},"VirtualFuture":{"money_24h":17360},"SpaceAgeMars":{"money_24h":29000},"SpaceAgeAsteroidBelt":{"money_24h":32120},"SpaceAgeVenus":{"money_24h":35400},"SpaceAgeJupiterMoon":{"money_24h":38860},"SpaceAgeTitan":{"money_24h":42480},"SpaceAgeSpaceHub":{"money_24h":46280}} },
+    "R_MultiAge_SpringBonusSet18b": { prod: {"BronzeAge":{"money_24h":450},"IronAge":{"money_24h":1080},"EarlyMiddleAge":{"money_24h":1800},"HighMiddleAge":{"money_24h":2520},"LateMiddleAge":{"money_24h":3330},"ColonialAge":{"money_24h":5070},"IndustrialAge":{"money_24h":6320},"ProgressiveEra":{"money_24h":7670},"ModernEra":{"money_24h":9540},"PostModernEra":{"money_24h":12000},"ContemporaryEra":{"money_24h":15620},"TomorrowEra":{"money_24h":18090},"FutureEra":{"money_24h":20740},"ArcticFuture":{"money_24h":23560},"OceanicFuture":{"money_24h":26570},"VirtualFuture":{"money_24h":29760},"SpaceAgeMars":{"money_24h":49710},"SpaceAgeAsteroidBelt":{"money_24h":55060},"SpaceAgeVenus":{"money_24h":60690},"SpaceAgeJupiterMoon":{"money_24h":66610},"SpaceAgeTitan":{"money_24h":72830},"SpaceAgeSpaceHub":{"money_24h":79330}} },
+    "D_MultiAge_SpringBonusSet18a": { prod: {"BronzeAge":{"happiness":340},"IronAge":{"happiness":580},"EarlyMiddleAge":{"happiness":640},"HighMiddleAge":{"happiness":720},"LateMiddleAge":{"happiness":800},"ColonialAge":{"happiness":940},"IndustrialAge":{"happiness":1060},"ProgressiveEra":{"happiness":1170},"ModernEra":{"happiness":1250},"PostModernEra":{"happiness":1300},"ContemporaryEra":{"happiness":1510},"TomorrowEra":{"happiness":1830},"FutureEra":{"happiness":2200},"ArcticFuture":{"happiness":2560},"OceanicFuture":{"happiness":2950},"VirtualFuture":{"happiness":3530},"SpaceAgeMars":{"happiness":5650},"SpaceAgeAsteroidBelt":{"happiness":6140},"SpaceAgeVenus":{"happiness":6630},"SpaceAgeJupiterMoon":{"happiness":7140},"SpaceAgeTitan":{"happiness":7660},"SpaceAgeSpaceHub":{"happiness":8190}} },
+    "D_MultiAge_SpringBonusSet18b": { prod: {"BronzeAge":{"happiness":340},"IronAge":{"happiness":580},"EarlyMiddleAge":{"happiness":640},"HighMiddleAge":{"happiness":720},"LateMiddleAge":{"happiness":800},"ColonialAge":{"happiness":940},"IndustrialAge":{"happiness":1060},"ProgressiveEra":{"happiness":1170},"ModernEra":{"happiness":1250},"PostModernEra":{"happiness":1300},"ContemporaryEra":{"happiness":1510},"TomorrowEra":{"happiness":1830},"FutureEra":{"happiness":2200},"ArcticFuture":{"happiness":2560},"OceanicFuture":{"happiness":2950},"VirtualFuture":{"happiness":3530},"SpaceAgeMars":{"happiness":5650},"SpaceAgeAsteroidBelt":{"happiness":6140},"SpaceAgeVenus":{"happiness":6630},"SpaceAgeJupiterMoon":{"happiness":7140},"SpaceAgeTitan":{"happiness":7660},"SpaceAgeSpaceHub":{"happiness":8190}} },
+    "R_MultiAge_SpringBonusSet18a": { prod: {"BronzeAge":{"money_24h":380},"IronAge":{"money_24h":900},"EarlyMiddleAge":{"money_24h":1500},"HighMiddleAge":{"money_24h":2100},"LateMiddleAge":{"money_24h":2780},"ColonialAge":{"money_24h":4230},"IndustrialAge":{"money_24h":5270},"ProgressiveEra":{"money_24h":6390},"ModernEra":{"money_24h":7950},"PostModernEra":{"money_24h":10000},"ContemporaryEra":{"money_24h":13020},"TomorrowEra":{"money_24h":15080},"FutureEra":{"money_24h":17280},"ArcticFuture":{"money_24h":19640},"OceanicFuture":{"money_24h":22140},"VirtualFuture":{"money_24h":24800},"SpaceAgeMars":{"money_24h":41420},"SpaceAgeAsteroidBelt":{"money_24h":45880},"SpaceAgeVenus":{"money_24h":50580},"SpaceAgeJupiterMoon":{"money_24h":55510},"SpaceAgeTitan":{"money_24h":60690},"SpaceAgeSpaceHub":{"money_24h":66110}} },
+    "D_MultiAge_CupBonus1": { prod: {"BronzeAge":{"happiness":75},"IronAge":{"happiness":129},"EarlyMiddleAge":{"happiness":143},"HighMiddleAge":{"happiness":160},"LateMiddleAge":{"happiness":178},"ColonialAge":{"happiness":209},"IndustrialAge":{"happiness":236},"ProgressiveEra":{"happiness":259},"ModernEra":{"happiness":277},"PostModernEra":{"happiness":289},"ContemporaryEra":{"happiness":336},"TomorrowEra":{"happiness":408},"FutureEra":{"happiness":488},"ArcticFuture":{"happiness":569},"OceanicFuture":{"happiness":656},"VirtualFuture":{"happiness":784},"SpaceAgeMars":{"happiness":1255},"SpaceAgeAsteroidBelt":{"happiness":1363},"SpaceAgeVenus":{"happiness":1473},"SpaceAgeJupiterMoon":{"happiness":1587},"SpaceAgeTitan":{"happiness":1702},"SpaceAgeSpaceHub":{"happiness":1820}} },
+    "P_MultiAge_CupBonus1": { prod: {"BronzeAge":{"happiness":31},"IronAge":{"happiness":54},"EarlyMiddleAge":{"happiness":59},"HighMiddleAge":{"happiness":66},"LateMiddleAge":{"happiness":74},"ColonialAge":{"happiness":87},"IndustrialAge":{"happiness":98},"ProgressiveEra":{"happiness":107},"ModernEra":{"happiness":115},"PostModernEra":{"happiness":120},"ContemporaryEra":{"happiness":139},"TomorrowEra":{"happiness":169},"FutureEra":{"happiness":202},"ArcticFuture":{"happiness":235},"OceanicFuture":{"happiness":272},"VirtualFuture":{"happiness":325},"SpaceAgeMars":{"happiness":519},"SpaceAgeAsteroidBelt":{"happiness":564},"SpaceAgeVenus":{"happiness":610},"SpaceAgeJupiterMoon":{"happiness":657},"SpaceAgeTitan":{"happiness":704},"SpaceAgeSpaceHub":{"happiness":754}} },
+    "D_MultiAge_Battlegrounds4": { prod: {"BronzeAge":{"happiness":210},"IronAge":{"happiness":300},"EarlyMiddleAge":{"happiness":360},"HighMiddleAge":{"happiness":450},"LateMiddleAge":{"happiness":510},"ColonialAge":{"happiness":600},"IndustrialAge":{"happiness":680},"ProgressiveEra":{"happiness":750},"ModernEra":{"happiness":850},"PostModernEra":{"happiness":960},"ContemporaryEra":{"happiness":1120},"TomorrowEra":{"happiness":1390},"FutureEra":{"happiness":1670},"ArcticFuture":{"happiness":1890},"OceanicFuture":{"happiness":2130},"VirtualFuture":{"happiness":2680},"SpaceAgeMars":{"happiness":4180},"SpaceAgeAsteroidBelt":{"happiness":4540},"SpaceAgeVenus":{"happiness":4900},"SpaceAgeJupiterMoon":{"happiness":5280},"SpaceAgeTitan":{"happiness":5670},"SpaceAgeSpaceHub":{"happiness":6060}} },
+    "R_MultiAge_Anw15": { prod: {"BronzeAge":{"population":55,"demandHappiness":55,"money_24h":270},"IronAge":{"population":117,"demandHappiness":117,"money_24h":650},"EarlyMiddleAge":{"population":180,"demandHappiness":180,"money_24h":1080},"HighMiddleAge":{"population":253,"demandHappiness":253,"money_24h":1510},"LateMiddleAge":{"population":332,"demandHappiness":332,"money_24h":2000},"ColonialAge":{"population":419,"demandHappiness":419,"money_24h":3040},"IndustrialAge":{"population":512,"demandHappiness":512,"money_24h":3790},"ProgressiveEra":{"population":612,"demandHappiness":612,"money_24h":4600},"ModernEra":{"population":717,"demandHappiness":717,"money_24h":5720},"PostModernEra":{"population":826,"demandHappiness":826,"money_24h":7200},"ContemporaryEra":{"population":942,"demandHappiness":942,"money_24h":9370},"TomorrowEra":{"population":1061,"demandHappiness":1061,"money_24h":10850},"FutureEra":{"population":1187,"demandHappiness":1187,"money_24h":12440},"ArcticFuture":{"population":1316,"demandHappiness":1316,"money_24h":14140},"OceanicFuture":{"population":1450,"demandHappiness":1450,"money_24h":15940},"VirtualFuture":{"population":1588,"demandHappiness":1588,"money_24h":17860},"SpaceAgeMars":{"population":2513,"demandHappiness":2513,"money_24h":29820},"SpaceAgeAsteroidBelt":{"population":2730,"demandHappiness":2730,"money_24h":33030},"SpaceAgeVenus":{"population":2950,"demandHappiness":2950,"money_24h":36410},"SpaceAgeJupiterMoon":{"population":3177,"demandHappiness":3177,"money_24h":39970},"SpaceAgeTitan":{"population":3408,"demandHappiness":3408,"money_24h":43700},"SpaceAgeSpaceHub":{"population":3645,"demandHappiness":3645,"money_24h":47600}} },
+    "P_MultiAge_SummerBonus2": { prod: {"BronzeAge":{"happiness":68},"IronAge":{"happiness":116},"EarlyMiddleAge":{"happiness":129},"HighMiddleAge":{"happiness":144},"LateMiddleAge":{"happiness":160},"ColonialAge":{"happiness":188},"IndustrialAge":{"happiness":212},"ProgressiveEra":{"happiness":233},"ModernEra":{"happiness":250},"PostModernEra":{"happiness":260},"ContemporaryEra":{"happiness":302},"TomorrowEra":{"happiness":367},"FutureEra":{"happiness":440},"ArcticFuture":{"happiness":512},"OceanicFuture":{"happiness":591},"VirtualFuture":{"happiness":706},"SpaceAgeMars":{"happiness":1129},"SpaceAgeAsteroidBelt":{"happiness":1227},"SpaceAgeVenus":{"happiness":1326},"SpaceAgeJupiterMoon":{"happiness":1428},"SpaceAgeTitan":{"happiness":1531},"SpaceAgeSpaceHub":{"happiness":1638}} },
+    "D_MultiAge_ArcheologyBonus22b": { prod: {"BronzeAge":{"happiness":140},"IronAge":{"happiness":220},"EarlyMiddleAge":{"happiness":270},"HighMiddleAge":{"happiness":320},"LateMiddleAge":{"happiness":360},"ColonialAge":{"happiness":430},"IndustrialAge":{"happiness":500},"ProgressiveEra":{"happiness":540},"ModernEra":{"happiness":580},"PostModernEra":{"happiness":610},"ContemporaryEra":{"happiness":710},"TomorrowEra":{"happiness":880},"FutureEra":{"happiness":1050},"ArcticFuture":{"happiness":1300},"OceanicFuture":{"happiness":1500},"VirtualFuture":{"happiness":1790},"SpaceAgeMars":{"happiness":3010},"SpaceAgeAsteroidBelt":{"happiness":3270},"SpaceAgeVenus":{"happiness":3540},"SpaceAgeJupiterMoon":{"happiness":3810},"SpaceAgeTitan":{"happiness":4080},"SpaceAgeSpaceHub":{"happiness":4370}} },
+    "R_MultiAge_HalloweenBonus18": { prod: {"BronzeAge":{"population":49,"demandHappiness":49,"money_24h":690},"IronAge":{"population":103,"demandHappiness":103,"money_24h":1490},"EarlyMiddleAge":{"population":140,"demandHappiness":140,"money_24h":2250},"HighMiddleAge":{"population":188,"demandHappiness":188,"money_24h":2900},"LateMiddleAge":{"population":247,"demandHappiness":247,"money_24h":3500},"ColonialAge":{"population":303,"demandHappiness":303,"money_24h":4820},"IndustrialAge":{"population":381,"demandHappiness":381,"money_24h":5530},"ProgressiveEra":{"population":476,"demandHappiness":476,"money_24h":6330},"ModernEra":{"population":558,"demandHappiness":558,"money_24h":7870},"PostModernEra":{"population":597,"demandHappiness":597,"money_24h":9900},"ContemporaryEra":{"population":711,"demandHappiness":711,"money_24h":12890},"TomorrowEra":{"population":825,"demandHappiness":825,"money_24h":14920},"FutureEra":{"population":923,"demandHappiness":923,"money_24h":17100},"ArcticFuture":{"population":980,"demandHappiness":980,"money_24h":19430},"OceanicFuture":{"population":1160,"demandHappiness":1160,"money_24h":22500},"VirtualFuture":{"population":1288,"demandHappiness":1288,"money_24h":25210},"SpaceAgeMars":{"population":2038,"demandHappiness":2038,"money_24h":42100},"SpaceAgeAsteroidBelt":{"population":2214,"demandHappiness":2214,"money_24h":46630},"SpaceAgeVenus":{"population":2393,"demandHappiness":2393,"money_24h":51410},"SpaceAgeJupiterMoon":{"population":2577,"demandHappiness":2577,"money_24h":56420},"SpaceAgeTitan":{"population":2764,"demandHappiness":2764,"money_24h":61690},"SpaceAgeSpaceHub":{"population":2957,"demandHappiness":2957,"money_24h":67190}} },
+    "A_MultiAge_HalloweenBonus1": { prod: {"BronzeAge":{"happiness":420},"IronAge":{"happiness":520},"EarlyMiddleAge":{"happiness":710},"HighMiddleAge":{"happiness":800},"LateMiddleAge":{"happiness":890},"ColonialAge":{"happiness":1050},"IndustrialAge":{"happiness":1150},"ProgressiveEra":{"happiness":1290},"ModernEra":{"happiness":1390},"PostModernEra":{"happiness":1450},"ContemporaryEra":{"happiness":1690},"TomorrowEra":{"happiness":2050},"FutureEra":{"happiness":2450},"ArcticFuture":{"happiness":2860},"OceanicFuture":{"happiness":3300},"VirtualFuture":{"happiness":3940},"SpaceAgeMars":{"happiness":6300},"SpaceAgeAsteroidBelt":{"happiness":6850},"SpaceAgeVenus":{"happiness":7400},"SpaceAgeJupiterMoon":{"happiness":7970},"SpaceAgeTitan":{"happiness":8550},"SpaceAgeSpaceHub":{"happiness":9140}} },
+    "D_MultiAge_SummerBonus16": { prod: {"BronzeAge":{"happiness":73},"IronAge":{"happiness":101},"EarlyMiddleAge":{"happiness":116},"HighMiddleAge":{"happiness":132},"LateMiddleAge":{"happiness":147},"ColonialAge":{"happiness":166},"IndustrialAge":{"happiness":188},"ProgressiveEra":{"happiness":206},"ModernEra":{"happiness":225},"PostModernEra":{"happiness":234},"ContemporaryEra":{"happiness":267},"TomorrowEra":{"happiness":324},"FutureEra":{"happiness":366},"ArcticFuture":{"happiness":418},"OceanicFuture":{"happiness":482},"VirtualFuture":{"happiness":576},"SpaceAgeMars":{"happiness":922},"SpaceAgeAsteroidBelt":{"happiness":1002},"SpaceAgeVenus":{"happiness":1083},"SpaceAgeJupiterMoon":{"happiness":1166},"SpaceAgeTitan":{"happiness":1251},"SpaceAgeSpaceHub":{"happiness":1338}} },
+    "D_MultiAge_SummerBonusSetB17a": { prod: {"BronzeAge":{"happiness":20},"IronAge":{"happiness":25},"EarlyMiddleAge":{"happiness":30},"HighMiddleAge":{"happiness":35},"LateMiddleAge":{"happiness":40},"ColonialAge":{"happiness":45},"IndustrialAge":{"happiness":50},"ProgressiveEra":{"happiness":60},"ModernEra":{"happiness":70},"PostModernEra":{"happiness":80},"ContemporaryEra":{"happiness":95},"TomorrowEra":{"happiness":115},"FutureEra":{"happiness":130},"ArcticFuture":{"happiness":150},"OceanicFuture":{"happiness":180},"VirtualFuture":{"happiness":210},"SpaceAgeMars":{"happiness":340},"SpaceAgeAsteroidBelt":{"happiness":370},"SpaceAgeVenus":{"happiness":400},"SpaceAgeJupiterMoon":{"happiness":430},"SpaceAgeTitan":{"happiness":460},"SpaceAgeSpaceHub":{"happiness":490}} },
+    "R_MultiAge_Expedition22a": { prod: {"BronzeAge":{"population":5,"demandHappiness":5,"money_24h":700},"IronAge":{"population":5,"demandHappiness":5,"money_24h":1200},"EarlyMiddleAge":{"population":5,"demandHappiness":5,"money_24h":2000},"HighMiddleAge":{"population":5,"demandHappiness":5,"money_24h":2800},"LateMiddleAge":{"population":5,"demandHappiness":5,"money_24h":3700},"ColonialAge":{"population":5,"demandHappiness":5,"money_24h":5630},"IndustrialAge":{"population":5,"demandHappiness":5,"money_24h":7010},"ProgressiveEra":{"population":5,"demandHappiness":5,"money_24h":8510},"ModernEra":{"population":5,"demandHappiness":5,"money_24h":10590},"PostModernEra":{"population":5,"demandHappiness":5,"money_24h":13320},"ContemporaryEra":{"population":5,"demandHappiness":5,"money_24h":17340},"TomorrowEra":{"population":5,"demandHappiness":5,"money_24h":20080},"FutureEra":{"population":5,"demandHappiness":5,"money_24h":23020},"ArcticFuture":{"population":5,"demandHappiness":5,"money_24h":26150},"OceanicFuture":{"population":5,"demandHappiness":5,"money_24h":29490},"VirtualFuture":{"population":5,"demandHappiness":5,"money_24h":33030},"SpaceAgeMars":{"population":5,"demandHappiness":5,"money_24h":55170},"SpaceAgeAsteroidBelt":{"population":5,"demandHappiness":5,"money_24h":61110},"SpaceAgeVenus":{"population":5,"demandHappiness":5,"money_24h":67370},"SpaceAgeJupiterMoon":{"population":5,"demandHappiness":5,"money_24h":73940},"SpaceAgeTitan":{"population":5,"demandHappiness":5,"money_24h":80840},"SpaceAgeSpaceHub":{"population":5,"demandHappiness":5,"money_24h":88060}} },
+    "R_MultiAge_Expedition22b": { prod: {"BronzeAge":{"population":5,"demandHappiness":5,"money_24h":700},"IronAge":{"population":5,"demandHappiness":5,"money_24h":1200},"EarlyMiddleAge":{"population":5,"demandHappiness":5,"money_24h":2000},"HighMiddleAge":{"population":5,"demandHappiness":5,"money_24h":2800},"LateMiddleAge":{"population":5,"demandHappiness":5,"money_24h":3700},"ColonialAge":{"population":5,"demandHappiness":5,"money_24h":5630},"IndustrialAge":{"population":5,"demandHappiness":5,"money_24h":7010},"ProgressiveEra":{"population":5,"demandHappiness":5,"money_24h":8510},"ModernEra":{"population":5,"demandHappiness":5,"money_24h":10590},"PostModernEra":{"population":5,"demandHappiness":5,"money_24h":13320},"ContemporaryEra":{"population":5,"demandHappiness":5,"money_24h":17340},"TomorrowEra":{"population":5,"demandHappiness":5,"money_24h":20080},"FutureEra":{"population":5,"demandHappiness":5,"money_24h":23020},"ArcticFuture":{"population":5,"demandHappiness":5,"money_24h":26150},"OceanicFuture":{"population":5,"demandHappiness":5,"money_24h":29490},"VirtualFuture":{"population":5,"demandHappiness":5,"money_24h":33030},"SpaceAgeMars":{"population":5,"demandHappiness":5,"money_24h":55170},"SpaceAgeAsteroidBelt":{"population":5,"demandHappiness":5,"money_24h":61110},"SpaceAgeVenus":{"population":5,"demandHappiness":5,"money_24h":67370},"SpaceAgeJupiterMoon":{"population":5,"demandHappiness":5,"money_24h":73940},"SpaceAgeTitan":{"population":5,"demandHappiness":5,"money_24h":80840},"SpaceAgeSpaceHub":{"population":5,"demandHappiness":5,"money_24h":88060}} },
+    "R_MultiAge_Expedition22c": { prod: {"BronzeAge":{"population":5,"demandHappiness":5,"money_24h":700},"IronAge":{"population":5,"demandHappiness":5,"money_24h":1200},"EarlyMiddleAge":{"population":5,"demandHappiness":5,"money_24h":2000},"HighMiddleAge":{"population":5,"demandHappiness":5,"money_24h":2800},"LateMiddleAge":{"population":5,"demandHappiness":5,"money_24h":3700},"ColonialAge":{"population":5,"demandHappiness":5,"money_24h":5630},"IndustrialAge":{"population":5,"demandHappiness":5,"money_24h":7010},"ProgressiveEra":{"population":5,"demandHappiness":5,"money_24h":8510},"ModernEra":{"population":5,"demandHappiness":5,"money_24h":10590},"PostModernEra":{"population":5,"demandHappiness":5,"money_24h":13320},"ContemporaryEra":{"population":5,"demandHappiness":5,"money_24h":17340},"TomorrowEra":{"population":5,"demandHappiness":5,"money_24h":20080},"FutureEra":{"population":5,"demandHappiness":5,"money_24h":23020},"ArcticFuture":{"population":5,"demandHappiness":5,"money_24h":26150},"OceanicFuture":{"population":5,"demandHappiness":5,"money_24h":29490},"VirtualFuture":{"population":5,"demandHappiness":5,"money_24h":33030},"SpaceAgeMars":{"population":5,"demandHappiness":5,"money_24h":55170},"SpaceAgeAsteroidBelt":{"population":5,"demandHappiness":5,"money_24h":61110},"SpaceAgeVenus":{"population":5,"demandHappiness":5,"money_24h":67370},"SpaceAgeJupiterMoon":{"population":5,"demandHappiness":5,"money_24h":73940},"SpaceAgeTitan":{"population":5,"demandHappiness":5,"money_24h":80840},"SpaceAgeSpaceHub":{"population":5,"demandHappiness":5,"money_24h":88060}} },
+    "R_MultiAge_WinterBonus21a": { prod: {"BronzeAge":{"happiness":760,"population":178,"demandHappiness":178,"money_24h":700},"IronAge":{"happiness":1300,"population":383,"demandHappiness":383,"money_24h":1700},"EarlyMiddleAge":{"happiness":1440,"population":587,"demandHappiness":587,"money_24h":2900},"HighMiddleAge":{"happiness":1610,"population":825,"demandHappiness":825,"money_24h":4000},"LateMiddleAge":{"happiness":1790,"population":1082,"demandHappiness":1082,"money_24h":5300},"ColonialAge":{"happiness":2110,"population":1366,"demandHappiness":1366,"money_24h":8100},"IndustrialAge":{"happiness":2380,"population":1670,"demandHappiness":1670,"money_24h":10100},"ProgressiveEra":{"happiness":2610,"population":1993,"demandHappiness":1993,"money_24h":12300},"ModernEra":{"happiness":2800,"population":2336,"demandHappiness":2336,"money_24h":15300},"PostModernEra":{"happiness":2910,"population":2693,"demandHappiness":2693,"money_24h":19200},"ContemporaryEra":{"happiness":3390,"population":3069,"demandHappiness":3069,"money_24h":25000},"TomorrowEra":{"happiness":4110,"population":3458,"demandHappiness":3458,"money_24h":28900},"FutureEra":{"happiness":4920,"population":3868,"demandHappiness":3868,"money_24h":33200},"ArcticFuture":{"happiness":5730,"population":4290,"demandHappiness":4290,"money_24h":37700},"OceanicFuture":{"happiness":6620,"population":4726,"demandHappiness":4726,"money_24h":42500},"VirtualFuture":{"happiness":7900,"population":5174,"demandHappiness":5174,"money_24h":47600},"SpaceAgeMars":{"happiness":12650,"population":8191,"demandHappiness":8191,"money_24h":79500},"SpaceAgeAsteroidBelt":{"happiness":13740,"population":8897,"demandHappiness":8897,"money_24h":88100},"SpaceAgeVenus":{"happiness":14850,"population":9616,"demandHappiness":9616,"money_24h":97100},"SpaceAgeJupiterMoon":{"happiness":15990,"population":10355,"demandHappiness":10355,"money_24h":106600},"SpaceAgeTitan":{"happiness":17150,"population":11108,"demandHappiness":11108,"money_24h":116500},"SpaceAgeSpaceHub":{"happiness":18350,"population":11880,"demandHappiness":11880,"money_24h":126900}} },
+    "R_MultiAge_WinterBonus21b": { prod: {"BronzeAge":{"happiness":780,"population":180,"demandHappiness":180,"money_24h":800},"IronAge":{"happiness":1350,"population":386,"demandHappiness":386,"money_24h":2000},"EarlyMiddleAge":{"happiness":1490,"population":593,"demandHappiness":593,"money_24h":3400},"HighMiddleAge":{"happiness":1670,"population":833,"demandHappiness":833,"money_24h":4700},"LateMiddleAge":{"happiness":1860,"population":1092,"demandHappiness":1092,"money_24h":6200},"ColonialAge":{"happiness":2190,"population":1379,"demandHappiness":1379,"money_24h":9500},"IndustrialAge":{"happiness":2460,"population":1685,"demandHappiness":1685,"money_24h":11800},"ProgressiveEra":{"happiness":2710,"population":2011,"demandHappiness":2011,"money_24h":14300},"ModernEra":{"happiness":2900,"population":2358,"demandHappiness":2358,"money_24h":17800},"PostModernEra":{"happiness":3020,"population":2717,"demandHappiness":2717,"money_24h":22400},"ContemporaryEra":{"happiness":3510,"population":3097,"demandHappiness":3097,"money_24h":29200},"TomorrowEra":{"happiness":4260,"population":3490,"demandHappiness":3490,"money_24h":33800},"FutureEra":{"happiness":5100,"population":3903,"demandHappiness":3903,"money_24h":38700},"ArcticFuture":{"happiness":5940,"population":4329,"demandHappiness":4329,"money_24h":44000},"OceanicFuture":{"happiness":6850,"population":4769,"demandHappiness":4769,"money_24h":49600},"VirtualFuture":{"happiness":8190,"population":5221,"demandHappiness":5221,"money_24h":55600},"SpaceAgeMars":{"happiness":13100,"population":8265,"demandHappiness":8265,"money_24h":92800},"SpaceAgeAsteroidBelt":{"happiness":14230,"population":8978,"demandHappiness":8978,"money_24h":102800},"SpaceAgeVenus":{"happiness":15380,"population":9704,"demandHappiness":9704,"money_24h":113300},"SpaceAgeJupiterMoon":{"happiness":16560,"population":10450,"demandHappiness":10450,"money_24h":124400},"SpaceAgeTitan":{"happiness":17770,"population":11209,"demandHappiness":11209,"money_24h":136000},"SpaceAgeSpaceHub":{"happiness":19000,"population":11988,"demandHappiness":11988,"money_24h":148100}} },
+    "R_MultiAge_WinterBonus21c": { prod: {"BronzeAge":{"happiness":810,"population":183,"demandHappiness":183,"money_24h":1000},"IronAge":{"happiness":1400,"population":393,"demandHappiness":393,"money_24h":2300},"EarlyMiddleAge":{"happiness":1550,"population":603,"demandHappiness":603,"money_24h":3800},"HighMiddleAge":{"happiness":1720,"population":848,"demandHappiness":848,"money_24h":5400},"LateMiddleAge":{"happiness":1920,"population":1112,"demandHappiness":1112,"money_24h":7100},"ColonialAge":{"happiness":2260,"population":1403,"demandHappiness":1403,"money_24h":10800},"IndustrialAge":{"happiness":2550,"population":1715,"demandHappiness":1715,"money_24h":13500},"ProgressiveEra":{"happiness":2800,"population":2048,"demandHappiness":2048,"money_24h":16400},"ModernEra":{"happiness":3000,"population":2400,"demandHappiness":2400,"money_24h":20400},"PostModernEra":{"happiness":3120,"population":2766,"demandHappiness":2766,"money_24h":25600},"ContemporaryEra":{"happiness":3630,"population":3153,"demandHappiness":3153,"money_24h":33300},"TomorrowEra":{"happiness":4400,"population":3553,"demandHappiness":3553,"money_24h":38600},"FutureEra":{"happiness":5270,"population":3973,"demandHappiness":3973,"money_24h":44200},"ArcticFuture":{"happiness":6140,"population":4407,"demandHappiness":4407,"money_24h":50300},"OceanicFuture":{"happiness":7090,"population":4854,"demandHappiness":4854,"money_24h":56700},"VirtualFuture":{"happiness":8470,"population":5316,"demandHappiness":5316,"money_24h":63500},"SpaceAgeMars":{"happiness":13550,"population":8414,"demandHappiness":8414,"money_24h":106000},"SpaceAgeAsteroidBelt":{"happiness":14720,"population":9139,"demandHappiness":9139,"money_24h":117500},"SpaceAgeVenus":{"happiness":15910,"population":9878,"demandHappiness":9878,"money_24h":129500},"SpaceAgeJupiterMoon":{"happiness":17140,"population":10638,"demandHappiness":10638,"money_24h":142100},"SpaceAgeTitan":{"happiness":18380,"population":11411,"demandHappiness":11411,"money_24h":155400},"SpaceAgeSpaceHub":{"happiness":19660,"population":12204,"demandHappiness":12204,"money_24h":169200}} },
+    "R_MultiAge_WinterBonus21d": { prod: {"BronzeAge":{"happiness":870,"population":188,"demandHappiness":188,"money_24h":1100},"IronAge":{"happiness":1490,"population":404,"demandHappiness":404,"money_24h":2600},"EarlyMiddleAge":{"happiness":1650,"population":619,"demandHappiness":619,"money_24h":4300},"HighMiddleAge":{"happiness":1840,"population":870,"demandHappiness":870,"money_24h":6100},"LateMiddleAge":{"happiness":2050,"population":1141,"demandHappiness":1141,"money_24h":8000},"ColonialAge":{"happiness":2410,"population":1441,"demandHappiness":1441,"money_24h":12200},"IndustrialAge":{"happiness":2720,"population":1761,"demandHappiness":1761,"money_24h":15200},"ProgressiveEra":{"happiness":2990,"population":2102,"demandHappiness":2102,"money_24h":18400},"ModernEra":{"happiness":3200,"population":2464,"demandHappiness":2464,"money_24h":22900},"PostModernEra":{"happiness":3330,"population":2840,"demandHappiness":2840,"money_24h":28800},"ContemporaryEra":{"happiness":3870,"population":3236,"demandHappiness":3236,"money_24h":37500},"TomorrowEra":{"happiness":4700,"population":3647,"demandHappiness":3647,"money_24h":43400},"FutureEra":{"happiness":5630,"population":4079,"demandHappiness":4079,"money_24h":49800},"ArcticFuture":{"happiness":6550,"population":4524,"demandHappiness":4524,"money_24h":56600},"OceanicFuture":{"happiness":7560,"population":4983,"demandHappiness":4983,"money_24h":63800},"VirtualFuture":{"happiness":9030,"population":5457,"demandHappiness":5457,"money_24h":71400},"SpaceAgeMars":{"happiness":14450,"population":8637,"demandHappiness":8637,"money_24h":119300},"SpaceAgeAsteroidBelt":{"happiness":15710,"population":9382,"demandHappiness":9382,"money_24h":132100},"SpaceAgeVenus":{"happiness":16970,"population":10141,"demandHappiness":10141,"money_24h":145700},"SpaceAgeJupiterMoon":{"happiness":18280,"population":10920,"demandHappiness":10920,"money_24h":159900},"SpaceAgeTitan":{"happiness":19600,"population":11714,"demandHappiness":11714,"money_24h":174800},"SpaceAgeSpaceHub":{"happiness":20970,"population":12528,"demandHappiness":12528,"money_24h":190400}} },
+    "R_MultiAge_WinterBonus21e": { prod: {"BronzeAge":{"happiness":920,"population":194,"demandHappiness":194,"money_24h":1200},"IronAge":{"happiness":1580,"population":418,"demandHappiness":418,"money_24h":2900},"EarlyMiddleAge":{"happiness":1750,"population":641,"demandHappiness":641,"money_24h":4800},"HighMiddleAge":{"happiness":1950,"population":900,"demandHappiness":900,"money_24h":6700},"LateMiddleAge":{"happiness":2180,"population":1181,"demandHappiness":1181,"money_24h":8900},"ColonialAge":{"happiness":2560,"population":1490,"demandHappiness":1490,"money_24h":13500},"IndustrialAge":{"happiness":2890,"population":1822,"demandHappiness":1822,"money_24h":16900},"ProgressiveEra":{"happiness":3170,"population":2174,"demandHappiness":2174,"money_24h":20500},"ModernEra":{"happiness":3400,"population":2549,"demandHappiness":2549,"money_24h":25400},"PostModernEra":{"happiness":3540,"population":2938,"demandHappiness":2938,"money_24h":32000},"ContemporaryEra":{"happiness":4110,"population":3348,"demandHappiness":3348,"money_24h":41700},"TomorrowEra":{"happiness":4990,"population":3773,"demandHappiness":3773,"money_24h":48200},"FutureEra":{"happiness":5980,"population":4219,"demandHappiness":4219,"money_24h":55300},"ArcticFuture":{"happiness":6960,"population":4680,"demandHappiness":4680,"money_24h":62800},"OceanicFuture":{"happiness":8030,"population":5155,"demandHappiness":5155,"money_24h":70900},"VirtualFuture":{"happiness":9600,"population":5645,"demandHappiness":5645,"money_24h":79400},"SpaceAgeMars":{"happiness":15360,"population":8935,"demandHappiness":8935,"money_24h":132600},"SpaceAgeAsteroidBelt":{"happiness":16690,"population":9706,"demandHappiness":9706,"money_24h":146800},"SpaceAgeVenus":{"happiness":18030,"population":10490,"demandHappiness":10490,"money_24h":161800},"SpaceAgeJupiterMoon":{"happiness":19420,"population":11297,"demandHappiness":11297,"money_24h":177600},"SpaceAgeTitan":{"happiness":20830,"population":12118,"demandHappiness":12118,"money_24h":194200},"SpaceAgeSpaceHub":{"happiness":22280,"population":12960,"demandHappiness":12960,"money_24h":211600}} },
+    "R_MultiAge_WinterBonus21f": { prod: {"BronzeAge":{"happiness":970,"population":204,"demandHappiness":204,"money_24h":1300},"IronAge":{"happiness":1680,"population":438,"demandHappiness":438,"money_24h":3200},"EarlyMiddleAge":{"happiness":1850,"population":673,"demandHappiness":673,"money_24h":5300},"HighMiddleAge":{"happiness":2070,"population":945,"demandHappiness":945,"money_24h":7400},"LateMiddleAge":{"happiness":2310,"population":1240,"demandHappiness":1240,"money_24h":9800},"ColonialAge":{"happiness":2710,"population":1565,"demandHappiness":1565,"money_24h":14900},"IndustrialAge":{"happiness":3060,"population":1913,"demandHappiness":1913,"money_24h":18500},"ProgressiveEra":{"happiness":3360,"population":2283,"demandHappiness":2283,"money_24h":22500},"ModernEra":{"happiness":3590,"population":2676,"demandHappiness":2676,"money_24h":28000},"PostModernEra":{"happiness":3750,"population":3084,"demandHappiness":3084,"money_24h":35200},"ContemporaryEra":{"happiness":4350,"population":3515,"demandHappiness":3515,"money_24h":45800},"TomorrowEra":{"happiness":5280,"population":3961,"demandHappiness":3961,"money_24h":53100},"FutureEra":{"happiness":6330,"population":4430,"demandHappiness":4430,"money_24h":60800},"ArcticFuture":{"happiness":7370,"population":4914,"demandHappiness":4914,"money_24h":69100},"OceanicFuture":{"happiness":8510,"population":5413,"demandHappiness":5413,"money_24h":77900},"VirtualFuture":{"happiness":10160,"population":5927,"demandHappiness":5927,"money_24h":87300},"SpaceAgeMars":{"happiness":16260,"population":9382,"demandHappiness":9382,"money_24h":145800},"SpaceAgeAsteroidBelt":{"happiness":17670,"population":10191,"demandHappiness":10191,"money_24h":161500},"SpaceAgeVenus":{"happiness":19090,"population":11015,"demandHappiness":11015,"money_24h":178000},"SpaceAgeJupiterMoon":{"happiness":20560,"population":11862,"demandHappiness":11862,"money_24h":195400},"SpaceAgeTitan":{"happiness":22050,"population":12723,"demandHappiness":12723,"money_24h":213600},"SpaceAgeSpaceHub":{"happiness":23590,"population":13608,"demandHappiness":13608,"money_24h":232700}} },
+    "R_MultiAge_WinterBonus21g": { prod: {"BronzeAge":{"happiness":1030,"population":217,"demandHappiness":217,"money_24h":1400},"IronAge":{"happiness":1770,"population":466,"demandHappiness":466,"money_24h":3500},"EarlyMiddleAge":{"happiness":1960,"population":716,"demandHappiness":716,"money_24h":5800},"HighMiddleAge":{"happiness":2180,"population":1005,"demandHappiness":1005,"money_24h":8100},"LateMiddleAge":{"happiness":2440,"population":1319,"demandHappiness":1319,"money_24h":10700},"ColonialAge":{"happiness":2860,"population":1664,"demandHappiness":1664,"money_24h":16200},"IndustrialAge":{"happiness":3230,"population":2034,"demandHappiness":2034,"money_24h":20200},"ProgressiveEra":{"happiness":3550,"population":2428,"demandHappiness":2428,"money_24h":24500},"ModernEra":{"happiness":3790,"population":2846,"demandHappiness":2846,"money_24h":30500},"PostModernEra":{"happiness":3950,"population":3280,"demandHappiness":3280,"money_24h":38400},"ContemporaryEra":{"happiness":4590,"population":3739,"demandHappiness":3739,"money_24h":50000},"TomorrowEra":{"happiness":5580,"population":4213,"demandHappiness":4213,"money_24h":57900},"FutureEra":{"happiness":6680,"population":4711,"demandHappiness":4711,"money_24h":66400},"ArcticFuture":{"happiness":7780,"population":5226,"demandHappiness":5226,"money_24h":75400},"OceanicFuture":{"happiness":8980,"population":5757,"demandHappiness":5757,"money_24h":85000},"VirtualFuture":{"happiness":10730,"population":6303,"demandHappiness":6303,"money_24h":95200},"SpaceAgeMars":{"happiness":17160,"population":9978,"demandHappiness":9978,"money_24h":159100},"SpaceAgeAsteroidBelt":{"happiness":18650,"population":10838,"demandHappiness":10838,"money_24h":176200},"SpaceAgeVenus":{"happiness":20150,"population":11714,"demandHappiness":11714,"money_24h":194200},"SpaceAgeJupiterMoon":{"happiness":21710,"population":12615,"demandHappiness":12615,"money_24h":213200},"SpaceAgeTitan":{"happiness":23280,"population":13531,"demandHappiness":13531,"money_24h":233100},"SpaceAgeSpaceHub":{"happiness":24900,"population":14472,"demandHappiness":14472,"money_24h":253900}} },
+    "R_MultiAge_WinterBonus21h": { prod: {"BronzeAge":{"happiness":1080,"population":233,"demandHappiness":233,"money_24h":1600},"IronAge":{"happiness":1860,"population":501,"demandHappiness":501,"money_24h":3700},"EarlyMiddleAge":{"happiness":2060,"population":769,"demandHappiness":769,"money_24h":6200},"HighMiddleAge":{"happiness":2300,"population":1080,"demandHappiness":1080,"money_24h":8700},"LateMiddleAge":{"happiness":2560,"population":1417,"demandHappiness":1417,"money_24h":11500},"ColonialAge":{"happiness":3010,"population":1788,"demandHappiness":1788,"money_24h":17600},"IndustrialAge":{"happiness":3400,"population":2186,"demandHappiness":2186,"money_24h":21900},"ProgressiveEra":{"happiness":3730,"population":2609,"demandHappiness":2609,"money_24h":26600},"ModernEra":{"happiness":3990,"population":3059,"demandHappiness":3059,"money_24h":33100},"PostModernEra":{"happiness":4160,"population":3525,"demandHappiness":3525,"money_24h":41600},"ContemporaryEra":{"happiness":4840,"population":4018,"demandHappiness":4018,"money_24h":54200},"TomorrowEra":{"happiness":5870,"population":4527,"demandHappiness":4527,"money_24h":62700},"FutureEra":{"happiness":7030,"population":5063,"demandHappiness":5063,"money_24h":71900},"ArcticFuture":{"happiness":8190,"population":5616,"demandHappiness":5616,"money_24h":81700},"OceanicFuture":{"happiness":9450,"population":6186,"demandHappiness":6186,"money_24h":92100},"VirtualFuture":{"happiness":11290,"population":6774,"demandHappiness":6774,"money_24h":103200},"SpaceAgeMars":{"happiness":18070,"population":10722,"demandHappiness":10722,"money_24h":172300},"SpaceAgeAsteroidBelt":{"happiness":19630,"population":11647,"demandHappiness":11647,"money_24h":190900},"SpaceAgeVenus":{"happiness":21210,"population":12588,"demandHappiness":12588,"money_24h":210400},"SpaceAgeJupiterMoon":{"happiness":22850,"population":13556,"demandHappiness":13556,"money_24h":230900},"SpaceAgeTitan":{"happiness":24500,"population":14541,"demandHappiness":14541,"money_24h":252500},"SpaceAgeSpaceHub":{"happiness":26210,"population":15552,"demandHappiness":15552,"money_24h":275000}} },
+    "R_MultiAge_WinterBonus21i": { prod: {"BronzeAge":{"happiness":1190,"population":253,"demandHappiness":253,"money_24h":1700},"IronAge":{"happiness":2050,"population":543,"demandHappiness":543,"money_24h":4000},"EarlyMiddleAge":{"happiness":2270,"population":833,"demandHappiness":833,"money_24h":6700},"HighMiddleAge":{"happiness":2530,"population":1170,"demandHappiness":1170,"money_24h":9400},"LateMiddleAge":{"happiness":2820,"population":1535,"demandHappiness":1535,"money_24h":12400},"ColonialAge":{"happiness":3320,"population":1938,"demandHappiness":1938,"money_24h":18900},"IndustrialAge":{"happiness":3740,"population":2368,"demandHappiness":2368,"money_24h":23600},"ProgressiveEra":{"happiness":4110,"population":2827,"demandHappiness":2827,"money_24h":28600},"ModernEra":{"happiness":4390,"population":3313,"demandHappiness":3313,"money_24h":35600},"PostModernEra":{"happiness":4580,"population":3819,"demandHappiness":3819,"money_24h":44800},"ContemporaryEra":{"happiness":5320,"population":4352,"demandHappiness":4352,"money_24h":58300},"TomorrowEra":{"happiness":6460,"population":4905,"demandHappiness":4905,"money_24h":67500},"FutureEra":{"happiness":7740,"population":5485,"demandHappiness":5485,"money_24h":77400},"ArcticFuture":{"happiness":9010,"population":6084,"demandHappiness":6084,"money_24h":88000},"OceanicFuture":{"happiness":10400,"population":6702,"demandHappiness":6702,"money_24h":99200},"VirtualFuture":{"happiness":12420,"population":7338,"demandHappiness":7338,"money_24h":111100},"SpaceAgeMars":{"happiness":19870,"population":11616,"demandHappiness":11616,"money_24h":185600},"SpaceAgeAsteroidBelt":{"happiness":21600,"population":12617,"demandHappiness":12617,"money_24h":205600},"SpaceAgeVenus":{"happiness":23330,"population":13638,"demandHappiness":13638,"money_24h":226600},"SpaceAgeJupiterMoon":{"happiness":25130,"population":14686,"demandHappiness":14686,"money_24h":248700},"SpaceAgeTitan":{"happiness":26950,"population":15753,"demandHappiness":15753,"money_24h":271900},"SpaceAgeSpaceHub":{"happiness":28830,"population":16848,"demandHappiness":16848,"money_24h":296200}} },
+    "A_MultiAge_ChristmasBonusSet1": { prod: {"BronzeAge":{"happiness":80},"IronAge":{"happiness":110},"EarlyMiddleAge":{"happiness":150},"HighMiddleAge":{"happiness":160},"LateMiddleAge":{"happiness":180},"ColonialAge":{"happiness":210},"IndustrialAge":{"happiness":240},"ProgressiveEra":{"happiness":260},"ModernEra":{"happiness":280},"PostModernEra":{"happiness":300},"ContemporaryEra":{"happiness":340},"TomorrowEra":{"happiness":420},"FutureEra":{"happiness":500},"ArcticFuture":{"happiness":580},"OceanicFuture":{"happiness":670},"VirtualFuture":{"happiness":800},"SpaceAgeMars":{"happiness":1280},"SpaceAgeAsteroidBelt":{"happiness":1390},"SpaceAgeVenus":{"happiness":1500},"SpaceAgeJupiterMoon":{"happiness":1620},"SpaceAgeTitan":{"happiness":1740},"SpaceAgeSpaceHub":{"happiness":1860}} },
+    "A_MultiAge_ChristmasBonus1": { prod: {"BronzeAge":{"happiness":260},"IronAge":{"happiness":350},"EarlyMiddleAge":{"happiness":460},"HighMiddleAge":{"happiness":520},"LateMiddleAge":{"happiness":580},"ColonialAge":{"happiness":680},"IndustrialAge":{"happiness":760},"ProgressiveEra":{"happiness":840},"ModernEra":{"happiness":900},"PostModernEra":{"happiness":940},"ContemporaryEra":{"happiness":1090},"TomorrowEra":{"happiness":1320},"FutureEra":{"happiness":1580},"ArcticFuture":{"happiness":1840},"OceanicFuture":{"happiness":2130},"VirtualFuture":{"happiness":2540},"SpaceAgeMars":{"happiness":4060},"SpaceAgeAsteroidBelt":{"happiness":4420},"SpaceAgeVenus":{"happiness":4770},"SpaceAgeJupiterMoon":{"happiness":5140},"SpaceAgeTitan":{"happiness":5510},"SpaceAgeSpaceHub":{"happiness":5900}} },
+    "A_MultiAge_ChristmasBonus15": { prod: {"BronzeAge":{"happiness":290},"IronAge":{"happiness":440},"EarlyMiddleAge":{"happiness":480},"HighMiddleAge":{"happiness":540},"LateMiddleAge":{"happiness":600},"ColonialAge":{"happiness":710},"IndustrialAge":{"happiness":800},"ProgressiveEra":{"happiness":870},"ModernEra":{"happiness":940},"PostModernEra":{"happiness":980},"ContemporaryEra":{"happiness":1130},"TomorrowEra":{"happiness":1380},"FutureEra":{"happiness":1650},"ArcticFuture":{"happiness":1920},"OceanicFuture":{"happiness":2220},"VirtualFuture":{"happiness":2650},"SpaceAgeMars":{"happiness":4230},"SpaceAgeAsteroidBelt":{"happiness":4600},"SpaceAgeVenus":{"happiness":4970},"SpaceAgeJupiterMoon":{"happiness":5360},"SpaceAgeTitan":{"happiness":5740},"SpaceAgeSpaceHub":{"happiness":6140}} },
+    "R_MultiAge_WinterBonus20a": { prod: {"BronzeAge":{"happiness":730,"population":176,"demandHappiness":176,"money_24h":1100},"IronAge":{"happiness":1270,"population":377,"demandHappiness":377,"money_24h":2500},"EarlyMiddleAge":{"happiness":1400,"population":579,"demandHappiness":579,"money_24h":4200},"HighMiddleAge":{"happiness":1560,"population":813,"demandHappiness":813,"money_24h":5900},"LateMiddleAge":{"happiness":1740,"population":1066,"demandHappiness":1066,"money_24h":7800},"ColonialAge":{"happiness":2050,"population":1346,"demandHappiness":1346,"money_24h":11900},"IndustrialAge":{"happiness":2310,"population":1645,"demandHappiness":1645,"money_24h":14800},"ProgressiveEra":{"happiness":2540,"population":1963,"demandHappiness":1963,"money_24h":18000},"ModernEra":{"happiness":2710,"population":2301,"demandHappiness":2301,"money_24h":22400},"PostModernEra":{"happiness":2830,"population":2652,"demandHappiness":2652,"money_24h":28100},"ContemporaryEra":{"happiness":3280,"population":3023,"demandHappiness":3023,"money_24h":36600},"TomorrowEra":{"happiness":3990,"population":3406,"demandHappiness":3406,"money_24h":42400},"FutureEra":{"happiness":4780,"population":3809,"demandHappiness":3809,"money_24h":48600},"ArcticFuture":{"happiness":5560,"population":4225,"demandHappiness":4225,"money_24h":55200},"OceanicFuture":{"happiness":6420,"population":4654,"demandHappiness":4654,"money_24h":62300},"VirtualFuture":{"happiness":7670,"population":5096,"demandHappiness":5096,"money_24h":69800},"SpaceAgeMars":{"happiness":12270,"population":8067,"demandHappiness":8067,"money_24h":116500},"SpaceAgeAsteroidBelt":{"happiness":13330,"population":8762,"demandHappiness":8762,"money_24h":129100},"SpaceAgeVenus":{"happiness":14410,"population":9471,"demandHappiness":9471,"money_24h":142300},"SpaceAgeJupiterMoon":{"happiness":15520,"population":10199,"demandHappiness":10199,"money_24h":156200},"SpaceAgeTitan":{"happiness":16640,"population":10940,"demandHappiness":10940,"money_24h":170700},"SpaceAgeSpaceHub":{"happiness":17800,"population":11700,"demandHappiness":11700,"money_24h":186000}} },
+    "R_MultiAge_WinterBonus20b": { prod: {"BronzeAge":{"happiness":830,"population":178,"demandHappiness":178,"money_24h":1100},"IronAge":{"happiness":1430,"population":383,"demandHappiness":383,"money_24h":2700},"EarlyMiddleAge":{"happiness":1580,"population":587,"demandHappiness":587,"money_24h":4500},"HighMiddleAge":{"happiness":1760,"population":825,"demandHappiness":825,"money_24h":6300},"LateMiddleAge":{"happiness":1970,"population":1082,"demandHappiness":1082,"money_24h":8300},"ColonialAge":{"happiness":2310,"population":1366,"demandHappiness":1366,"money_24h":12600},"IndustrialAge":{"happiness":2610,"population":1670,"demandHappiness":1670,"money_24h":15700},"ProgressiveEra":{"happiness":2860,"population":1993,"demandHappiness":1993,"money_24h":19100},"ModernEra":{"happiness":3060,"population":2336,"demandHappiness":2336,"money_24h":23700},"PostModernEra":{"happiness":3190,"population":2693,"demandHappiness":2693,"money_24h":29900},"ContemporaryEra":{"happiness":3710,"population":3069,"demandHappiness":3069,"money_24h":38900},"TomorrowEra":{"happiness":4500,"population":3458,"demandHappiness":3458,"money_24h":45000},"FutureEra":{"happiness":5390,"population":3868,"demandHappiness":3868,"money_24h":51600},"ArcticFuture":{"happiness":6280,"population":4290,"demandHappiness":4290,"money_24h":58600},"OceanicFuture":{"happiness":7250,"population":4726,"demandHappiness":4726,"money_24h":66100},"VirtualFuture":{"happiness":8660,"population":5174,"demandHappiness":5174,"money_24h":74100},"SpaceAgeMars":{"happiness":13850,"population":8191,"demandHappiness":8191,"money_24h":123700},"SpaceAgeAsteroidBelt":{"happiness":15050,"population":8897,"demandHappiness":8897,"money_24h":137000},"SpaceAgeVenus":{"happiness":16260,"population":9616,"demandHappiness":9616,"money_24h":151100},"SpaceAgeJupiterMoon":{"happiness":17520,"population":10355,"demandHappiness":10355,"money_24h":165800},"SpaceAgeTitan":{"happiness":18790,"population":11108,"demandHappiness":11108,"money_24h":181300},"SpaceAgeSpaceHub":{"happiness":20100,"population":11880,"demandHappiness":11880,"money_24h":197400}} },
+    "R_MultiAge_WinterBonus20c": { prod: {"BronzeAge":{"happiness":900,"population":184,"demandHappiness":184,"money_24h":1200},"IronAge":{"happiness":1550,"population":394,"demandHappiness":394,"money_24h":3000},"EarlyMiddleAge":{"happiness":1720,"population":605,"demandHappiness":605,"money_24h":5000},"HighMiddleAge":{"happiness":1920,"population":850,"demandHappiness":850,"money_24h":6900},"LateMiddleAge":{"happiness":2140,"population":1115,"demandHappiness":1115,"money_24h":9200},"ColonialAge":{"happiness":2510,"population":1408,"demandHappiness":1408,"money_24h":14000},"IndustrialAge":{"happiness":2830,"population":1720,"demandHappiness":1720,"money_24h":17400},"ProgressiveEra":{"happiness":3110,"population":2054,"demandHappiness":2054,"money_24h":21100},"ModernEra":{"happiness":3330,"population":2407,"demandHappiness":2407,"money_24h":26300},"PostModernEra":{"happiness":3470,"population":2774,"demandHappiness":2774,"money_24h":33100},"ContemporaryEra":{"happiness":4030,"population":3162,"demandHappiness":3162,"money_24h":43100},"TomorrowEra":{"happiness":4890,"population":3563,"demandHappiness":3563,"money_24h":49900},"FutureEra":{"happiness":5860,"population":3985,"demandHappiness":3985,"money_24h":57100},"ArcticFuture":{"happiness":6820,"population":4420,"demandHappiness":4420,"money_24h":64900},"OceanicFuture":{"happiness":7880,"population":4869,"demandHappiness":4869,"money_24h":73200},"VirtualFuture":{"happiness":9410,"population":5331,"demandHappiness":5331,"money_24h":82000},"SpaceAgeMars":{"happiness":15050,"population":8439,"demandHappiness":8439,"money_24h":137000},"SpaceAgeAsteroidBelt":{"happiness":16360,"population":9166,"demandHappiness":9166,"money_24h":151700},"SpaceAgeVenus":{"happiness":17680,"population":9908,"demandHappiness":9908,"money_24h":167200},"SpaceAgeJupiterMoon":{"happiness":19040,"population":10669,"demandHappiness":10669,"money_24h":183600},"SpaceAgeTitan":{"happiness":20420,"population":11444,"demandHappiness":11444,"money_24h":200700},"SpaceAgeSpaceHub":{"happiness":21840,"population":12240,"demandHappiness":12240,"money_24h":218600}} },
+    "R_MultiAge_WinterBonus20d": { prod: {"BronzeAge":{"happiness":1000,"population":192,"demandHappiness":192,"money_24h":1300},"IronAge":{"happiness":1720,"population":412,"demandHappiness":412,"money_24h":3200},"EarlyMiddleAge":{"happiness":1900,"population":632,"demandHappiness":632,"money_24h":5300},"HighMiddleAge":{"happiness":2120,"population":888,"demandHappiness":888,"money_24h":7400},"LateMiddleAge":{"happiness":2360,"population":1164,"demandHappiness":1164,"money_24h":9800},"ColonialAge":{"happiness":2780,"population":1470,"demandHappiness":1470,"money_24h":14900},"IndustrialAge":{"happiness":3130,"population":1796,"demandHappiness":1796,"money_24h":18500},"ProgressiveEra":{"happiness":3440,"population":2144,"demandHappiness":2144,"money_24h":22500},"ModernEra":{"happiness":3680,"population":2513,"demandHappiness":2513,"money_24h":28000},"PostModernEra":{"happiness":3830,"population":2897,"demandHappiness":2897,"money_24h":35200},"ContemporaryEra":{"happiness":4450,"population":3302,"demandHappiness":3302,"money_24h":45800},"TomorrowEra":{"happiness":5410,"population":3720,"demandHappiness":3720,"money_24h":53100},"FutureEra":{"happiness":6480,"population":4161,"demandHappiness":4161,"money_24h":60800},"ArcticFuture":{"happiness":7540,"population":4615,"demandHappiness":4615,"money_24h":69100},"OceanicFuture":{"happiness":8700,"population":5084,"demandHappiness":5084,"money_24h":77900},"VirtualFuture":{"happiness":10400,"population":5566,"demandHappiness":5566,"money_24h":87300},"SpaceAgeMars":{"happiness":16640,"population":8811,"demandHappiness":8811,"money_24h":145800},"SpaceAgeAsteroidBelt":{"happiness":18080,"population":9571,"demandHappiness":9571,"money_24h":161500},"SpaceAgeVenus":{"happiness":19530,"population":10345,"demandHappiness":10345,"money_24h":178000},"SpaceAgeJupiterMoon":{"happiness":21040,"population":11140,"demandHappiness":11140,"money_24h":195400},"SpaceAgeTitan":{"happiness":22560,"population":11949,"demandHappiness":11949,"money_24h":213600},"SpaceAgeSpaceHub":{"happiness":24140,"population":12780,"demandHappiness":12780,"money_24h":232700}} },
+    "R_MultiAge_WinterBonus20e": { prod: {"BronzeAge":{"happiness":1090,"population":203,"demandHappiness":203,"money_24h":1400},"IronAge":{"happiness":1880,"population":435,"demandHappiness":435,"money_24h":3400},"EarlyMiddleAge":{"happiness":2080,"population":668,"demandHappiness":668,"money_24h":5700},"HighMiddleAge":{"happiness":2320,"population":938,"demandHappiness":938,"money_24h":8000},"LateMiddleAge":{"happiness":2590,"population":1230,"demandHappiness":1230,"money_24h":10600},"ColonialAge":{"happiness":3040,"population":1553,"demandHappiness":1553,"money_24h":16100},"IndustrialAge":{"happiness":3430,"population":1898,"demandHappiness":1898,"money_24h":20000},"ProgressiveEra":{"happiness":3760,"population":2265,"demandHappiness":2265,"money_24h":24300},"ModernEra":{"happiness":4030,"population":2655,"demandHappiness":2655,"money_24h":30200},"PostModernEra":{"happiness":4200,"population":3060,"demandHappiness":3060,"money_24h":38000},"ContemporaryEra":{"happiness":4880,"population":3488,"demandHappiness":3488,"money_24h":49500},"TomorrowEra":{"happiness":5920,"population":3930,"demandHappiness":3930,"money_24h":57300},"FutureEra":{"happiness":7090,"population":4395,"demandHappiness":4395,"money_24h":65700},"ArcticFuture":{"happiness":8260,"population":4875,"demandHappiness":4875,"money_24h":74600},"OceanicFuture":{"happiness":9530,"population":5370,"demandHappiness":5370,"money_24h":84100},"VirtualFuture":{"happiness":11380,"population":5880,"demandHappiness":5880,"money_24h":94200},"SpaceAgeMars":{"happiness":18220,"population":9308,"demandHappiness":9308,"money_24h":157400},"SpaceAgeAsteroidBelt":{"happiness":19800,"population":10110,"demandHappiness":10110,"money_24h":174400},"SpaceAgeVenus":{"happiness":21390,"population":10928,"demandHappiness":10928,"money_24h":192200},"SpaceAgeJupiterMoon":{"happiness":23040,"population":11768,"demandHappiness":11768,"money_24h":210900},"SpaceAgeTitan":{"happiness":24710,"population":12623,"demandHappiness":12623,"money_24h":230600},"SpaceAgeSpaceHub":{"happiness":26430,"population":13500,"demandHappiness":13500,"money_24h":251200}} },
+    "R_MultiAge_WinterBonus18a": { prod: {"BronzeAge":{"population":22,"demandHappiness":22,"money_24h":600},"IronAge":{"population":46,"demandHappiness":46,"money_24h":1500},"EarlyMiddleAge":{"population":71,"demandHappiness":71,"money_24h":2500},"HighMiddleAge":{"population":100,"demandHappiness":100,"money_24h":3500},"LateMiddleAge":{"population":131,"demandHappiness":131,"money_24h":4600},"ColonialAge":{"population":166,"demandHappiness":166,"money_24h":7000},"IndustrialAge":{"population":202,"demandHappiness":202,"money_24h":8700},"ProgressiveEra":{"population":242,"demandHappiness":242,"money_24h":10600},"ModernEra":{"population":283,"demandHappiness":283,"money_24h":13100},"PostModernEra":{"population":326,"demandHappiness":326,"money_24h":16500},"ContemporaryEra":{"population":372,"demandHappiness":372,"money_24h":21500},"TomorrowEra":{"population":419,"demandHappiness":419,"money_24h":24900},"FutureEra":{"population":469,"demandHappiness":469,"money_24h":28600},"ArcticFuture":{"population":520,"demandHappiness":520,"money_24h":32500},"OceanicFuture":{"population":573,"demandHappiness":573,"money_24h":36600},"VirtualFuture":{"population":627,"demandHappiness":627,"money_24h":41000},"SpaceAgeMars":{"population":993,"demandHappiness":993,"money_24h":68500},"SpaceAgeAsteroidBelt":{"population":1078,"demandHappiness":1078,"money_24h":75900},"SpaceAgeVenus":{"population":1166,"demandHappiness":1166,"money_24h":83600},"SpaceAgeJupiterMoon":{"population":1255,"demandHappiness":1255,"money_24h":91800},"SpaceAgeTitan":{"population":1346,"demandHappiness":1346,"money_24h":100300},"SpaceAgeSpaceHub":{"population":1440,"demandHappiness":1440,"money_24h":109300}} },
+    "R_MultiAge_WinterBonus18j": { prod: {"BronzeAge":{"population":119,"demandHappiness":119,"money_24h":800},"IronAge":{"population":255,"demandHappiness":255,"money_24h":1900},"EarlyMiddleAge":{"population":392,"demandHappiness":392,"money_24h":3200},"HighMiddleAge":{"population":550,"demandHappiness":550,"money_24h":4500},"LateMiddleAge":{"population":722,"demandHappiness":722,"money_24h":5900},"ColonialAge":{"population":911,"demandHappiness":911,"money_24h":9000},"IndustrialAge":{"population":1113,"demandHappiness":1113,"money_24h":11200},"ProgressiveEra":{"population":1329,"demandHappiness":1329,"money_24h":13600},"ModernEra":{"population":1558,"demandHappiness":1558,"money_24h":17000},"PostModernEra":{"population":1795,"demandHappiness":1795,"money_24h":21300},"ContemporaryEra":{"population":2046,"demandHappiness":2046,"money_24h":27800},"TomorrowEra":{"population":2306,"demandHappiness":2306,"money_24h":32200},"FutureEra":{"population":2578,"demandHappiness":2578,"money_24h":36900},"ArcticFuture":{"population":2860,"demandHappiness":2860,"money_24h":41900},"OceanicFuture":{"population":3150,"demandHappiness":3150,"money_24h":47200},"VirtualFuture":{"population":3450,"demandHappiness":3450,"money_24h":52900},"SpaceAgeMars":{"population":5460,"demandHappiness":5460,"money_24h":88400},"SpaceAgeAsteroidBelt":{"population":5931,"demandHappiness":5931,"money_24h":97900},"SpaceAgeVenus":{"population":6411,"demandHappiness":6411,"money_24h":107900},"SpaceAgeJupiterMoon":{"population":6904,"demandHappiness":6904,"money_24h":118400},"SpaceAgeTitan":{"population":7405,"demandHappiness":7405,"money_24h":129500},"SpaceAgeSpaceHub":{"population":7920,"demandHappiness":7920,"money_24h":141000}} },
+    "R_MultiAge_WinterBonus18k": { prod: {"BronzeAge":{"population":130,"demandHappiness":130,"money_24h":800},"IronAge":{"population":278,"demandHappiness":278,"money_24h":2000},"EarlyMiddleAge":{"population":427,"demandHappiness":427,"money_24h":3300},"HighMiddleAge":{"population":600,"demandHappiness":600,"money_24h":4600},"LateMiddleAge":{"population":787,"demandHappiness":787,"money_24h":6100},"ColonialAge":{"population":994,"demandHappiness":994,"money_24h":9200},"IndustrialAge":{"population":1214,"demandHappiness":1214,"money_24h":11500},"ProgressiveEra":{"population":1450,"demandHappiness":1450,"money_24h":14000},"ModernEra":{"population":1699,"demandHappiness":1699,"money_24h":17400},"PostModernEra":{"population":1958,"demandHappiness":1958,"money_24h":21900},"ContemporaryEra":{"population":2232,"demandHappiness":2232,"money_24h":28500},"TomorrowEra":{"population":2515,"demandHappiness":2515,"money_24h":33000},"FutureEra":{"population":2813,"demandHappiness":2813,"money_24h":37800},"ArcticFuture":{"population":3120,"demandHappiness":3120,"money_24h":42900},"OceanicFuture":{"population":3437,"demandHappiness":3437,"money_24h":48400},"VirtualFuture":{"population":3763,"demandHappiness":3763,"money_24h":54200},"SpaceAgeMars":{"population":5957,"demandHappiness":5957,"money_24h":90600},"SpaceAgeAsteroidBelt":{"population":6470,"demandHappiness":6470,"money_24h":100300},"SpaceAgeVenus":{"population":6994,"demandHappiness":6994,"money_24h":110600},"SpaceAgeJupiterMoon":{"population":7531,"demandHappiness":7531,"money_24h":121400},"SpaceAgeTitan":{"population":8078,"demandHappiness":8078,"money_24h":132700},"SpaceAgeSpaceHub":{"population":8640,"demandHappiness":8640,"money_24h":144600}} },
+    "R_MultiAge_WinterBonus18l": { prod: {"BronzeAge":{"population":140,"demandHappiness":140,"money_24h":800},"IronAge":{"population":302,"demandHappiness":302,"money_24h":2000},"EarlyMiddleAge":{"population":463,"demandHappiness":463,"money_24h":3400},"HighMiddleAge":{"population":650,"demandHappiness":650,"money_24h":4700},"LateMiddleAge":{"population":853,"demandHappiness":853,"money_24h":6200},"ColonialAge":{"population":1076,"demandHappiness":1076,"money_24h":9500},"IndustrialAge":{"population":1316,"demandHappiness":1316,"money_24h":11800},"ProgressiveEra":{"population":1570,"demandHappiness":1570,"money_24h":14300},"ModernEra":{"population":1841,"demandHappiness":1841,"money_24h":17800},"PostModernEra":{"population":2122,"demandHappiness":2122,"money_24h":22400},"ContemporaryEra":{"population":2418,"demandHappiness":2418,"money_24h":29200},"TomorrowEra":{"population":2725,"demandHappiness":2725,"money_24h":33800},"FutureEra":{"population":3047,"demandHappiness":3047,"money_24h":38700},"ArcticFuture":{"population":3380,"demandHappiness":3380,"money_24h":44000},"OceanicFuture":{"population":3723,"demandHappiness":3723,"money_24h":49600},"VirtualFuture":{"population":4077,"demandHappiness":4077,"money_24h":55600},"SpaceAgeMars":{"population":6453,"demandHappiness":6453,"money_24h":92800},"SpaceAgeAsteroidBelt":{"population":7010,"demandHappiness":7010,"money_24h":102800},"SpaceAgeVenus":{"population":7576,"demandHappiness":7576,"money_24h":113300},"SpaceAgeJupiterMoon":{"population":8159,"demandHappiness":8159,"money_24h":124400},"SpaceAgeTitan":{"population":8752,"demandHappiness":8752,"money_24h":136000},"SpaceAgeSpaceHub":{"population":9360,"demandHappiness":9360,"money_24h":148100}} },
+    "R_MultiAge_WinterBonus18b": { prod: {"BronzeAge":{"population":32,"demandHappiness":32,"money_24h":600},"IronAge":{"population":70,"demandHappiness":70,"money_24h":1500},"EarlyMiddleAge":{"population":107,"demandHappiness":107,"money_24h":2600},"HighMiddleAge":{"population":150,"demandHappiness":150,"money_24h":3600},"LateMiddleAge":{"population":197,"demandHappiness":197,"money_24h":4700},"ColonialAge":{"population":248,"demandHappiness":248,"money_24h":7200},"IndustrialAge":{"population":304,"demandHappiness":304,"money_24h":9000},"ProgressiveEra":{"population":362,"demandHappiness":362,"money_24h":10900},"ModernEra":{"population":425,"demandHappiness":425,"money_24h":13600},"PostModernEra":{"population":490,"demandHappiness":490,"money_24h":17100},"ContemporaryEra":{"population":558,"demandHappiness":558,"money_24h":22200},"TomorrowEra":{"population":629,"demandHappiness":629,"money_24h":25700},"FutureEra":{"population":703,"demandHappiness":703,"money_24h":29500},"ArcticFuture":{"population":780,"demandHappiness":780,"money_24h":33500},"OceanicFuture":{"population":859,"demandHappiness":859,"money_24h":37800},"VirtualFuture":{"population":941,"demandHappiness":941,"money_24h":42300},"SpaceAgeMars":{"population":1489,"demandHappiness":1489,"money_24h":70700},"SpaceAgeAsteroidBelt":{"population":1618,"demandHappiness":1618,"money_24h":78300},"SpaceAgeVenus":{"population":1748,"demandHappiness":1748,"money_24h":86300},"SpaceAgeJupiterMoon":{"population":1883,"demandHappiness":1883,"money_24h":94700},"SpaceAgeTitan":{"population":2020,"demandHappiness":2020,"money_24h":103600},"SpaceAgeSpaceHub":{"population":2160,"demandHappiness":2160,"money_24h":112800}} },
+    "R_MultiAge_WinterBonus18c": { prod: {"BronzeAge":{"population":43,"demandHappiness":43,"money_24h":700},"IronAge":{"population":93,"demandHappiness":93,"money_24h":1600},"EarlyMiddleAge":{"population":142,"demandHappiness":142,"money_24h":2600},"HighMiddleAge":{"population":200,"demandHappiness":200,"money_24h":3700},"LateMiddleAge":{"population":262,"demandHappiness":262,"money_24h":4900},"ColonialAge":{"population":331,"demandHappiness":331,"money_24h":7400},"IndustrialAge":{"population":405,"demandHappiness":405,"money_24h":9300},"ProgressiveEra":{"population":483,"demandHappiness":483,"money_24h":11300},"ModernEra":{"population":566,"demandHappiness":566,"money_24h":14000},"PostModernEra":{"population":653,"demandHappiness":653,"money_24h":17600},"ContemporaryEra":{"population":744,"demandHappiness":744,"money_24h":22900},"TomorrowEra":{"population":838,"demandHappiness":838,"money_24h":26500},"FutureEra":{"population":938,"demandHappiness":938,"money_24h":30400},"ArcticFuture":{"population":1040,"demandHappiness":1040,"money_24h":34600},"OceanicFuture":{"population":1146,"demandHappiness":1146,"money_24h":39000},"VirtualFuture":{"population":1254,"demandHappiness":1254,"money_24h":43700},"SpaceAgeMars":{"population":1986,"demandHappiness":1986,"money_24h":72900},"SpaceAgeAsteroidBelt":{"population":2157,"demandHappiness":2157,"money_24h":80800},"SpaceAgeVenus":{"population":2331,"demandHappiness":2331,"money_24h":89000},"SpaceAgeJupiterMoon":{"population":2510,"demandHappiness":2510,"money_24h":97700},"SpaceAgeTitan":{"population":2693,"demandHappiness":2693,"money_24h":106800},"SpaceAgeSpaceHub":{"population":2880,"demandHappiness":2880,"money_24h":116400}} },
+    "R_MultiAge_WinterBonus18d": { prod: {"BronzeAge":{"population":54,"demandHappiness":54,"money_24h":700},"IronAge":{"population":116,"demandHappiness":116,"money_24h":1600},"EarlyMiddleAge":{"population":178,"demandHappiness":178,"money_24h":2700},"HighMiddleAge":{"population":250,"demandHappiness":250,"money_24h":3800},"LateMiddleAge":{"population":328,"demandHappiness":328,"money_24h":5000},"ColonialAge":{"population":414,"demandHappiness":414,"money_24h":7700},"IndustrialAge":{"population":506,"demandHappiness":506,"money_24h":9600},"ProgressiveEra":{"population":604,"demandHappiness":604,"money_24h":11600},"ModernEra":{"population":708,"demandHappiness":708,"money_24h":14400},"PostModernEra":{"population":816,"demandHappiness":816,"money_24h":18100},"ContemporaryEra":{"population":930,"demandHappiness":930,"money_24h":23600},"TomorrowEra":{"population":1048,"demandHappiness":1048,"money_24h":27300},"FutureEra":{"population":1172,"demandHappiness":1172,"money_24h":31300},"ArcticFuture":{"population":1300,"demandHappiness":1300,"money_24h":35600},"OceanicFuture":{"population":1432,"demandHappiness":1432,"money_24h":40200},"VirtualFuture":{"population":1568,"demandHappiness":1568,"money_24h":45000},"SpaceAgeMars":{"population":2482,"demandHappiness":2482,"money_24h":75100},"SpaceAgeAsteroidBelt":{"population":2696,"demandHappiness":2696,"money_24h":83200},"SpaceAgeVenus":{"population":2914,"demandHappiness":2914,"money_24h":91700},"SpaceAgeJupiterMoon":{"population":3138,"demandHappiness":3138,"money_24h":100700},"SpaceAgeTitan":{"population":3366,"demandHappiness":3366,"money_24h":110100},"SpaceAgeSpaceHub":{"population":3600,"demandHappiness":3600,"money_24h":119900}} },
+    "R_MultiAge_WinterBonus18e": { prod: {"BronzeAge":{"population":65,"demandHappiness":65,"money_24h":700},"IronAge":{"population":139,"demandHappiness":139,"money_24h":1700},"EarlyMiddleAge":{"population":214,"demandHappiness":214,"money_24h":2800},"HighMiddleAge":{"population":300,"demandHappiness":300,"money_24h":3900},"LateMiddleAge":{"population":394,"demandHappiness":394,"money_24h":5200},"ColonialAge":{"population":497,"demandHappiness":497,"money_24h":7900},"IndustrialAge":{"population":607,"demandHappiness":607,"money_24h":9800},"ProgressiveEra":{"population":725,"demandHappiness":725,"money_24h":11900},"ModernEra":{"population":850,"demandHappiness":850,"money_24h":14800},"PostModernEra":{"population":979,"demandHappiness":979,"money_24h":18700},"ContemporaryEra":{"population":1116,"demandHappiness":1116,"money_24h":24300},"TomorrowEra":{"population":1258,"demandHappiness":1258,"money_24h":28100},"FutureEra":{"population":1406,"demandHappiness":1406,"money_24h":32300},"ArcticFuture":{"population":1560,"demandHappiness":1560,"money_24h":36700},"OceanicFuture":{"population":1718,"demandHappiness":1718,"money_24h":41300},"VirtualFuture":{"population":1882,"demandHappiness":1882,"money_24h":46300},"SpaceAgeMars":{"population":2978,"demandHappiness":2978,"money_24h":77300},"SpaceAgeAsteroidBelt":{"population":3235,"demandHappiness":3235,"money_24h":85700},"SpaceAgeVenus":{"population":3497,"demandHappiness":3497,"money_24h":94400},"SpaceAgeJupiterMoon":{"population":3766,"demandHappiness":3766,"money_24h":103600},"SpaceAgeTitan":{"population":4039,"demandHappiness":4039,"money_24h":113300},"SpaceAgeSpaceHub":{"population":4320,"demandHappiness":4320,"money_24h":123400}} },
+    "R_MultiAge_WinterBonus18f": { prod: {"BronzeAge":{"population":76,"demandHappiness":76,"money_24h":700},"IronAge":{"population":162,"demandHappiness":162,"money_24h":1700},"EarlyMiddleAge":{"population":249,"demandHappiness":249,"money_24h":2900},"HighMiddleAge":{"population":350,"demandHappiness":350,"money_24h":4000},"LateMiddleAge":{"population":459,"demandHappiness":459,"money_24h":5300},"ColonialAge":{"population":580,"demandHappiness":580,"money_24h":8100},"IndustrialAge":{"population":708,"demandHappiness":708,"money_24h":10100},"ProgressiveEra":{"population":846,"demandHappiness":846,"money_24h":12300},"ModernEra":{"population":991,"demandHappiness":991,"money_24h":15300},"PostModernEra":{"population":1142,"demandHappiness":1142,"money_24h":19200},"ContemporaryEra":{"population":1302,"demandHappiness":1302,"money_24h":25000},"TomorrowEra":{"population":1467,"demandHappiness":1467,"money_24h":28900},"FutureEra":{"population":1641,"demandHappiness":1641,"money_24h":33200},"ArcticFuture":{"population":1820,"demandHappiness":1820,"money_24h":37700},"OceanicFuture":{"population":2005,"demandHappiness":2005,"money_24h":42500},"VirtualFuture":{"population":2195,"demandHappiness":2195,"money_24h":47600},"SpaceAgeMars":{"population":3475,"demandHappiness":3475,"money_24h":79500},"SpaceAgeAsteroidBelt":{"population":3774,"demandHappiness":3774,"money_24h":88100},"SpaceAgeVenus":{"population":4080,"demandHappiness":4080,"money_24h":97100},"SpaceAgeJupiterMoon":{"population":4393,"demandHappiness":4393,"money_24h":106600},"SpaceAgeTitan":{"population":4712,"demandHappiness":4712,"money_24h":116500},"SpaceAgeSpaceHub":{"population":5040,"demandHappiness":5040,"money_24h":126900}} },
+    "R_MultiAge_WinterBonus18g": { prod: {"BronzeAge":{"population":86,"demandHappiness":86,"money_24h":700},"IronAge":{"population":186,"demandHappiness":186,"money_24h":1800},"EarlyMiddleAge":{"population":285,"demandHappiness":285,"money_24h":3000},"HighMiddleAge":{"population":400,"demandHappiness":400,"money_24h":4100},"LateMiddleAge":{"population":525,"demandHappiness":525,"money_24h":5500},"ColonialAge":{"population":662,"demandHappiness":662,"money_24h":8300},"IndustrialAge":{"population":810,"demandHappiness":810,"money_24h":10400},"ProgressiveEra":{"population":966,"demandHappiness":966,"money_24h":12600},"ModernEra":{"population":1133,"demandHappiness":1133,"money_24h":15700},"PostModernEra":{"population":1306,"demandHappiness":1306,"money_24h":19700},"ContemporaryEra":{"population":1488,"demandHappiness":1488,"money_24h":25700},"TomorrowEra":{"population":1677,"demandHappiness":1677,"money_24h":29800},"FutureEra":{"population":1875,"demandHappiness":1875,"money_24h":34100},"ArcticFuture":{"population":2080,"demandHappiness":2080,"money_24h":38800},"OceanicFuture":{"population":2291,"demandHappiness":2291,"money_24h":43700},"VirtualFuture":{"population":2509,"demandHappiness":2509,"money_24h":48900},"SpaceAgeMars":{"population":3971,"demandHappiness":3971,"money_24h":81700},"SpaceAgeAsteroidBelt":{"population":4314,"demandHappiness":4314,"money_24h":90500},"SpaceAgeVenus":{"population":4662,"demandHappiness":4662,"money_24h":99800},"SpaceAgeJupiterMoon":{"population":5021,"demandHappiness":5021,"money_24h":109500},"SpaceAgeTitan":{"population":5386,"demandHappiness":5386,"money_24h":119800},"SpaceAgeSpaceHub":{"population":5760,"demandHappiness":5760,"money_24h":130500}} },
+    "R_MultiAge_WinterBonus18h": { prod: {"BronzeAge":{"population":97,"demandHappiness":97,"money_24h":800},"IronAge":{"population":209,"demandHappiness":209,"money_24h":1800},"EarlyMiddleAge":{"population":320,"demandHappiness":320,"money_24h":3000},"HighMiddleAge":{"population":450,"demandHappiness":450,"money_24h":4300},"LateMiddleAge":{"population":590,"demandHappiness":590,"money_24h":5600},"ColonialAge":{"population":745,"demandHappiness":745,"money_24h":8600},"IndustrialAge":{"population":911,"demandHappiness":911,"money_24h":10700},"ProgressiveEra":{"population":1087,"demandHappiness":1087,"money_24h":13000},"ModernEra":{"population":1274,"demandHappiness":1274,"money_24h":16100},"PostModernEra":{"population":1469,"demandHappiness":1469,"money_24h":20300},"ContemporaryEra":{"population":1674,"demandHappiness":1674,"money_24h":26400},"TomorrowEra":{"population":1886,"demandHappiness":1886,"money_24h":30600},"FutureEra":{"population":2110,"demandHappiness":2110,"money_24h":35000},"ArcticFuture":{"population":2340,"demandHappiness":2340,"money_24h":39800},"OceanicFuture":{"population":2578,"demandHappiness":2578,"money_24h":44900},"VirtualFuture":{"population":2822,"demandHappiness":2822,"money_24h":50300},"SpaceAgeMars":{"population":4468,"demandHappiness":4468,"money_24h":84000},"SpaceAgeAsteroidBelt":{"population":4853,"demandHappiness":4853,"money_24h":93000},"SpaceAgeVenus":{"population":5245,"demandHappiness":5245,"money_24h":102500},"SpaceAgeJupiterMoon":{"population":5648,"demandHappiness":5648,"money_24h":112500},"SpaceAgeTitan":{"population":6059,"demandHappiness":6059,"money_24h":123000},"SpaceAgeSpaceHub":{"population":6480,"demandHappiness":6480,"money_24h":134000}} },
+    "R_MultiAge_WinterBonus18i": { prod: {"BronzeAge":{"population":108,"demandHappiness":108,"money_24h":800},"IronAge":{"population":232,"demandHappiness":232,"money_24h":1900},"EarlyMiddleAge":{"population":356,"demandHappiness":356,"money_24h":3100},"HighMiddleAge":{"population":500,"demandHappiness":500,"money_24h":4400},"LateMiddleAge":{"population":656,"demandHappiness":656,"money_24h":5800},"ColonialAge":{"population":828,"demandHappiness":828,"money_24h":8800},"IndustrialAge":{"population":1012,"demandHappiness":1012,"money_24h":11000},"ProgressiveEra":{"population":1208,"demandHappiness":1208,"money_24h":13300},"ModernEra":{"population":1416,"demandHappiness":1416,"money_24h":16500},"PostModernEra":{"population":1632,"demandHappiness":1632,"money_24h":20800},"ContemporaryEra":{"population":1860,"demandHappiness":1860,"money_24h":27100},"TomorrowEra":{"population":2096,"demandHappiness":2096,"money_24h":31400},"FutureEra":{"population":2344,"demandHappiness":2344,"money_24h":35900},"ArcticFuture":{"population":2600,"demandHappiness":2600,"money_24h":40800},"OceanicFuture":{"population":2864,"demandHappiness":2864,"money_24h":46100},"VirtualFuture":{"population":3136,"demandHappiness":3136,"money_24h":51600},"SpaceAgeMars":{"population":4964,"demandHappiness":4964,"money_24h":86200},"SpaceAgeAsteroidBelt":{"population":5392,"demandHappiness":5392,"money_24h":95400},"SpaceAgeVenus":{"population":5828,"demandHappiness":5828,"money_24h":105200},"SpaceAgeJupiterMoon":{"population":6276,"demandHappiness":6276,"money_24h":115500},"SpaceAgeTitan":{"population":6732,"demandHappiness":6732,"money_24h":126200},"SpaceAgeSpaceHub":{"population":7200,"demandHappiness":7200,"money_24h":137500}} },
+    "R_MultiAge_Expedition16a": { prod: {"BronzeAge":{"population":28,"demandHappiness":28,"money_24h":350},"IronAge":{"population":61,"demandHappiness":61,"money_24h":830},"EarlyMiddleAge":{"population":93,"demandHappiness":93,"money_24h":1380},"HighMiddleAge":{"population":131,"demandHappiness":131,"money_24h":1930},"LateMiddleAge":{"population":172,"demandHappiness":172,"money_24h":2550},"ColonialAge":{"population":217,"demandHappiness":217,"money_24h":3890},"IndustrialAge":{"population":266,"demandHappiness":266,"money_24h":4840},"ProgressiveEra":{"population":317,"demandHappiness":317,"money_24h":5880},"ModernEra":{"population":372,"demandHappiness":372,"money_24h":7310},"PostModernEra":{"population":428,"demandHappiness":428,"money_24h":9200},"ContemporaryEra":{"population":488,"demandHappiness":488,"money_24h":12000},"TomorrowEra":{"population":550,"demandHappiness":550,"money_24h":14000},"FutureEra":{"population":615,"demandHappiness":615,"money_24h":16000},"ArcticFuture":{"population":683,"demandHappiness":683,"money_24h":18060},"OceanicFuture":{"population":752,"demandHappiness":752,"money_24h":20370},"VirtualFuture":{"population":823,"demandHappiness":823,"money_24h":22810},"SpaceAgeMars":{"population":1303,"demandHappiness":1303,"money_24h":38110},"SpaceAgeAsteroidBelt":{"population":1415,"demandHappiness":1415,"money_24h":42210},"SpaceAgeVenus":{"population":1530,"demandHappiness":1530,"money_24h":46530},"SpaceAgeJupiterMoon":{"population":1647,"demandHappiness":1647,"money_24h":51070},"SpaceAgeTitan":{"population":1767,"demandHappiness":1767,"money_24h":55830},"SpaceAgeSpaceHub":{"population":1890,"demandHappiness":1890,"money_24h":60820}} },
+    "R_MultiAge_Expedition16c": { prod: {"BronzeAge":{"population":31,"demandHappiness":31,"money_24h":350},"IronAge":{"population":71,"demandHappiness":71,"money_24h":850},"EarlyMiddleAge":{"population":109,"demandHappiness":109,"money_24h":1420},"HighMiddleAge":{"population":154,"demandHappiness":154,"money_24h":1980},"LateMiddleAge":{"population":202,"demandHappiness":202,"money_24h":2620},"ColonialAge":{"population":255,"demandHappiness":255,"money_24h":3990},"IndustrialAge":{"population":311,"demandHappiness":311,"money_24h":4970},"ProgressiveEra":{"population":371,"demandHappiness":371,"money_24h":6030},"ModernEra":{"population":435,"demandHappiness":435,"money_24h":7500},"PostModernEra":{"population":502,"demandHappiness":502,"money_24h":9440},"ContemporaryEra":{"population":572,"demandHappiness":572,"money_24h":12310},"TomorrowEra":{"population":645,"demandHappiness":645,"money_24h":14360},"FutureEra":{"population":721,"demandHappiness":721,"money_24h":16420},"ArcticFuture":{"population":800,"demandHappiness":800,"money_24h":18540},"OceanicFuture":{"population":881,"demandHappiness":881,"money_24h":20900},"VirtualFuture":{"population":964,"demandHappiness":964,"money_24h":23410},"SpaceAgeMars":{"population":1526,"demandHappiness":1526,"money_24h":39100},"SpaceAgeAsteroidBelt":{"population":1658,"demandHappiness":1658,"money_24h":43310},"SpaceAgeVenus":{"population":1792,"demandHappiness":1792,"money_24h":47740},"SpaceAgeJupiterMoon":{"population":1930,"demandHappiness":1930,"money_24h":52400},"SpaceAgeTitan":{"population":2070,"demandHappiness":2070,"money_24h":57290},"SpaceAgeSpaceHub":{"population":2214,"demandHappiness":2214,"money_24h":62410}} },
+    "R_MultiAge_SpringBonus17gRed": { prod: {"BronzeAge":{"happiness":130,"population":130,"demandHappiness":130,"money_24h":880},"IronAge":{"happiness":278,"population":278,"demandHappiness":278,"money_24h":2110},"EarlyMiddleAge":{"happiness":427,"population":427,"demandHappiness":427,"money_24h":3520},"HighMiddleAge":{"happiness":600,"population":600,"demandHappiness":600,"money_24h":4930},"LateMiddleAge":{"happiness":787,"population":787,"demandHappiness":787,"money_24h":6510},"ColonialAge":{"happiness":994,"population":994,"demandHappiness":994,"money_24h":9920},"IndustrialAge":{"happiness":1214,"population":1214,"demandHappiness":1214,"money_24h":12360},"ProgressiveEra":{"happiness":1450,"population":1450,"demandHappiness":1450,"money_24h":15000},"ModernEra":{"happiness":1699,"population":1699,"demandHappiness":1699,"money_24h":18660},"PostModernEra":{"happiness":1958,"population":1958,"demandHappiness":1958,"money_24h":23470},"ContemporaryEra":{"happiness":2232,"population":2232,"demandHappiness":2232,"money_24h":30550},"TomorrowEra":{"happiness":2515,"population":2515,"demandHappiness":2515,"money_24h":35380},"FutureEra":{"happiness":2813,"population":2813,"demandHappiness":2813,"money_24h":40550},"ArcticFuture":{"happiness":3120,"population":3120,"demandHappiness":3120,"money_24h":46080},"OceanicFuture":{"happiness":3437,"population":3437,"demandHappiness":3437,"money_24h":51960},"VirtualFuture":{"happiness":3763,"population":3763,"demandHappiness":3763,"money_24h":58190},"SpaceAgeMars":{"happiness":5957,"population":5957,"demandHappiness":5957,"money_24h":97200},"SpaceAgeAsteroidBelt":{"happiness":6470,"population":6470,"demandHappiness":6470,"money_24h":107670},"SpaceAgeVenus":{"happiness":6994,"population":6994,"demandHappiness":6994,"money_24h":118690},"SpaceAgeJupiterMoon":{"happiness":7531,"population":7531,"demandHappiness":7531,"money_24h":130270},"SpaceAgeTitan":{"happiness":8078,"population":8078,"demandHappiness":8078,"money_24h":142420},"SpaceAgeSpaceHub":{"happiness":8640,"population":8640,"demandHappiness":8640,"money_24h":155140}} },
+    "A_MultiAge_ArcheologyBonus22a": { prod: {"BronzeAge":{"happiness":200},"IronAge":{"happiness":280},"EarlyMiddleAge":{"happiness":360},"HighMiddleAge":{"happiness":430},"LateMiddleAge":{"happiness":510},"ColonialAge":{"happiness":600},"IndustrialAge":{"happiness":680},"ProgressiveEra":{"happiness":750},"ModernEra":{"happiness":800},"PostModernEra":{"happiness":940},"ContemporaryEra":{"happiness":1090},"TomorrowEra":{"happiness":1320},"FutureEra":{"happiness":1760},"ArcticFuture":{"happiness":2150},"OceanicFuture":{"happiness":2720},"VirtualFuture":{"happiness":3390},"SpaceAgeMars":{"happiness":5650},"SpaceAgeAsteroidBelt":{"happiness":6140},"SpaceAgeVenus":{"happiness":6630},"SpaceAgeJupiterMoon":{"happiness":7140},"SpaceAgeTitan":{"happiness":7660},"SpaceAgeSpaceHub":{"happiness":8190}} },
+    "D_MultiAge_CarnivalBonus17": { prod: {"BronzeAge":{"happiness":81},"IronAge":{"happiness":109},"EarlyMiddleAge":{"happiness":129},"HighMiddleAge":{"happiness":153},"LateMiddleAge":{"happiness":182},"ColonialAge":{"happiness":214},"IndustrialAge":{"happiness":248},"ProgressiveEra":{"happiness":285},"ModernEra":{"happiness":325},"PostModernEra":{"happiness":373},"ContemporaryEra":{"happiness":423},"TomorrowEra":{"happiness":489},"FutureEra":{"happiness":571},"ArcticFuture":{"happiness":665},"OceanicFuture":{"happiness":768},"VirtualFuture":{"happiness":917},"SpaceAgeMars":{"happiness":1468},"SpaceAgeAsteroidBelt":{"happiness":1595},"SpaceAgeVenus":{"happiness":1723},"SpaceAgeJupiterMoon":{"happiness":1856},"SpaceAgeTitan":{"happiness":1991},"SpaceAgeSpaceHub":{"happiness":2130}} },
+    "R_MultiAge_SportBonus18": { prod: {"BronzeAge":{"population":20,"demandHappiness":20,"money_24h":300},"IronAge":{"population":40,"demandHappiness":40,"money_24h":700},"EarlyMiddleAge":{"population":50,"demandHappiness":50,"money_24h":1100},"HighMiddleAge":{"population":80,"demandHappiness":80,"money_24h":1500},"LateMiddleAge":{"population":100,"demandHappiness":100,"money_24h":2000},"ColonialAge":{"population":120,"demandHappiness":120,"money_24h":3000},"IndustrialAge":{"population":150,"demandHappiness":150,"money_24h":3800},"ProgressiveEra":{"population":180,"demandHappiness":180,"money_24h":4600},"ModernEra":{"population":210,"demandHappiness":210,"money_24h":5700},"PostModernEra":{"population":250,"demandHappiness":250,"money_24h":7200},"ContemporaryEra":{"population":280,"demandHappiness":280,"money_24h":9400},"TomorrowEra":{"population":310,"demandHappiness":310,"money_24h":10900},"FutureEra":{"population":350,"demandHappiness":350,"money_24h":12400},"ArcticFuture":{"population":390,"demandHappiness":390,"money_24h":14100},"OceanicFuture":{"population":430,"demandHappiness":430,"money_24h":15900},"VirtualFuture":{"population":470,"demandHappiness":470,"money_24h":17900},"SpaceAgeMars":{"population":750,"demandHappiness":750,"money_24h":29800},"SpaceAgeAsteroidBelt":{"population":810,"demandHappiness":810,"money_24h":33000},"SpaceAgeVenus":{"population":870,"demandHappiness":870,"money_24h":36400},"SpaceAgeJupiterMoon":{"population":940,"demandHappiness":940,"money_24h":40000},"SpaceAgeTitan":{"population":1010,"demandHappiness":1010,"money_24h":43700},"SpaceAgeSpaceHub":{"population":1080,"demandHappiness":1080,"money_24h":47600}} },
+    "R_MultiAge_WinterBonus21jJolie": { prod: {"BronzeAge":{"happiness":1300,"population":275,"demandHappiness":275,"money_24h":2100},"IronAge":{"happiness":2240,"population":592,"demandHappiness":592,"money_24h":5000},"EarlyMiddleAge":{"happiness":2470,"population":908,"demandHappiness":908,"money_24h":8400},"HighMiddleAge":{"happiness":2760,"population":1275,"demandHappiness":1275,"money_24h":11800},"LateMiddleAge":{"happiness":3080,"population":1673,"demandHappiness":1673,"money_24h":15500},"ColonialAge":{"happiness":3620,"population":2111,"demandHappiness":2111,"money_24h":23700},"IndustrialAge":{"happiness":4080,"population":2581,"demandHappiness":2581,"money_24h":29500},"ProgressiveEra":{"happiness":4480,"population":3080,"demandHappiness":3080,"money_24h":35800},"ModernEra":{"happiness":4790,"population":3611,"demandHappiness":3611,"money_24h":44500},"PostModernEra":{"happiness":4990,"population":4162,"demandHappiness":4162,"money_24h":56000},"ContemporaryEra":{"happiness":5800,"population":4743,"demandHappiness":4743,"money_24h":72900},"TomorrowEra":{"happiness":7040,"population":5345,"demandHappiness":5345,"money_24h":84400},"FutureEra":{"happiness":8440,"population":5977,"demandHappiness":5977,"money_24h":96800},"ArcticFuture":{"happiness":9830,"population":6630,"demandHappiness":6630,"money_24h":110000},"OceanicFuture":{"happiness":11340,"population":7303,"demandHappiness":7303,"money_24h":124000},"VirtualFuture":{"happiness":13550,"population":7997,"demandHappiness":7997,"money_24h":138900},"SpaceAgeMars":{"happiness":21680,"population":12658,"demandHappiness":12658,"money_24h":232000},"SpaceAgeAsteroidBelt":{"happiness":23560,"population":13750,"demandHappiness":13750,"money_24h":256900},"SpaceAgeVenus":{"happiness":25450,"population":14861,"demandHappiness":14861,"money_24h":283200},"SpaceAgeJupiterMoon":{"happiness":27420,"population":16004,"demandHappiness":16004,"money_24h":310900},"SpaceAgeTitan":{"happiness":29400,"population":17167,"demandHappiness":17167,"money_24h":339900},"SpaceAgeSpaceHub":{"happiness":31450,"population":18360,"demandHappiness":18360,"money_24h":370200}} },
+    "R_MultiAge_ArcheologyBonus19a": { prod: {"BronzeAge":{"population":178,"demandHappiness":178,"money_24h":900},"IronAge":{"population":383,"demandHappiness":383,"money_24h":2200},"EarlyMiddleAge":{"population":587,"demandHappiness":587,"money_24h":3600},"HighMiddleAge":{"population":825,"demandHappiness":825,"money_24h":5000},"LateMiddleAge":{"population":1082,"demandHappiness":1082,"money_24h":6700},"ColonialAge":{"population":1366,"demandHappiness":1366,"money_24h":10100},"IndustrialAge":{"population":1670,"demandHappiness":1670,"money_24h":12600},"ProgressiveEra":{"population":1993,"demandHappiness":1993,"money_24h":15300},"ModernEra":{"population":2336,"demandHappiness":2336,"money_24h":19100},"PostModernEra":{"population":2693,"demandHappiness":2693,"money_24h":24000},"ContemporaryEra":{"population":3069,"demandHappiness":3069,"money_24h":31300},"TomorrowEra":{"population":3458,"demandHappiness":3458,"money_24h":36200},"FutureEra":{"population":3868,"demandHappiness":3868,"money_24h":41500},"ArcticFuture":{"population":4290,"demandHappiness":4290,"money_24h":47100},"OceanicFuture":{"population":4726,"demandHappiness":4726,"money_24h":53100},"VirtualFuture":{"population":5174,"demandHappiness":5174,"money_24h":59500},"SpaceAgeMars":{"population":8191,"demandHappiness":8191,"money_24h":99400},"SpaceAgeAsteroidBelt":{"population":8897,"demandHappiness":8897,"money_24h":110100},"SpaceAgeVenus":{"population":9616,"demandHappiness":9616,"money_24h":121400},"SpaceAgeJupiterMoon":{"population":10355,"demandHappiness":10355,"money_24h":133200},"SpaceAgeTitan":{"population":11108,"demandHappiness":11108,"money_24h":145700},"SpaceAgeSpaceHub":{"population":11880,"demandHappiness":11880,"money_24h":158700}} },
+    "R_MultiAge_ArcheologyBonus19j": { prod: {"BronzeAge":{"population":324,"demandHappiness":324,"money_24h":1400},"IronAge":{"population":696,"demandHappiness":696,"money_24h":3500},"EarlyMiddleAge":{"population":1068,"demandHappiness":1068,"money_24h":5800},"HighMiddleAge":{"population":1500,"demandHappiness":1500,"money_24h":8100},"LateMiddleAge":{"population":1968,"demandHappiness":1968,"money_24h":10700},"ColonialAge":{"population":2484,"demandHappiness":2484,"money_24h":16200},"IndustrialAge":{"population":3036,"demandHappiness":3036,"money_24h":20200},"ProgressiveEra":{"population":3624,"demandHappiness":3624,"money_24h":24500},"ModernEra":{"population":4142,"demandHappiness":4142,"money_24h":30500},"PostModernEra":{"population":4774,"demandHappiness":4774,"money_24h":38400},"ContemporaryEra":{"population":5441,"demandHappiness":5441,"money_24h":50000},"TomorrowEra":{"population":6131,"demandHappiness":6131,"money_24h":57900},"FutureEra":{"population":6856,"demandHappiness":6856,"money_24h":66400},"ArcticFuture":{"population":7605,"demandHappiness":7605,"money_24h":75400},"OceanicFuture":{"population":8377,"demandHappiness":8377,"money_24h":85000},"VirtualFuture":{"population":9173,"demandHappiness":9173,"money_24h":95200},"SpaceAgeMars":{"population":14147,"demandHappiness":14147,"money_24h":159100},"SpaceAgeAsteroidBelt":{"population":15367,"demandHappiness":15367,"money_24h":176200},"SpaceAgeVenus":{"population":16610,"demandHappiness":16610,"money_24h":194200},"SpaceAgeJupiterMoon":{"population":17887,"demandHappiness":17887,"money_24h":213200},"SpaceAgeTitan":{"population":19186,"demandHappiness":19186,"money_24h":233100},"SpaceAgeSpaceHub":{"population":20520,"demandHappiness":20520,"money_24h":253900}} },
+    "R_MultiAge_ArcheologyBonus19b": { prod: {"BronzeAge":{"population":194,"demandHappiness":194,"money_24h":1000},"IronAge":{"population":418,"demandHappiness":418,"money_24h":2300},"EarlyMiddleAge":{"population":641,"demandHappiness":641,"money_24h":3800},"HighMiddleAge":{"population":900,"demandHappiness":900,"money_24h":5400},"LateMiddleAge":{"population":1181,"demandHappiness":1181,"money_24h":7100},"ColonialAge":{"population":1490,"demandHappiness":1490,"money_24h":10800},"IndustrialAge":{"population":1822,"demandHappiness":1822,"money_24h":13500},"ProgressiveEra":{"population":2174,"demandHappiness":2174,"money_24h":16400},"ModernEra":{"population":2549,"demandHappiness":2549,"money_24h":20400},"PostModernEra":{"population":2938,"demandHappiness":2938,"money_24h":25600},"ContemporaryEra":{"population":3348,"demandHappiness":3348,"money_24h":33300},"TomorrowEra":{"population":3773,"demandHappiness":3773,"money_24h":38600},"FutureEra":{"population":4219,"demandHappiness":4219,"money_24h":44200},"ArcticFuture":{"population":4680,"demandHappiness":4680,"money_24h":50300},"OceanicFuture":{"population":5155,"demandHappiness":5155,"money_24h":56700},"VirtualFuture":{"population":5645,"demandHappiness":5645,"money_24h":63500},"SpaceAgeMars":{"population":8935,"demandHappiness":8935,"money_24h":106000},"SpaceAgeAsteroidBelt":{"population":9706,"demandHappiness":9706,"money_24h":117500},"SpaceAgeVenus":{"population":10490,"demandHappiness":10490,"money_24h":129500},"SpaceAgeJupiterMoon":{"population":11297,"demandHappiness":11297,"money_24h":142100},"SpaceAgeTitan":{"population":12118,"demandHappiness":12118,"money_24h":155400},"SpaceAgeSpaceHub":{"population":12960,"demandHappiness":12960,"money_24h":169200}} },
+    "R_MultiAge_ArcheologyBonus19c": { prod: {"BronzeAge":{"population":211,"demandHappiness":211,"money_24h":1000},"IronAge":{"population":452,"demandHappiness":452,"money_24h":2500},"EarlyMiddleAge":{"population":694,"demandHappiness":694,"money_24h":4100},"HighMiddleAge":{"population":975,"demandHappiness":975,"money_24h":5700},"LateMiddleAge":{"population":1279,"demandHappiness":1279,"money_24h":7600},"ColonialAge":{"population":1615,"demandHappiness":1615,"money_24h":11500},"IndustrialAge":{"population":1973,"demandHappiness":1973,"money_24h":14300},"ProgressiveEra":{"population":2356,"demandHappiness":2356,"money_24h":17400},"ModernEra":{"population":2761,"demandHappiness":2761,"money_24h":21600},"PostModernEra":{"population":3182,"demandHappiness":3182,"money_24h":27200},"ContemporaryEra":{"population":3627,"demandHappiness":3627,"money_24h":35400},"TomorrowEra":{"population":4087,"demandHappiness":4087,"money_24h":41000},"FutureEra":{"population":4571,"demandHappiness":4571,"money_24h":47000},"ArcticFuture":{"population":5070,"demandHappiness":5070,"money_24h":53400},"OceanicFuture":{"population":5585,"demandHappiness":5585,"money_24h":60200},"VirtualFuture":{"population":6115,"demandHappiness":6115,"money_24h":67500},"SpaceAgeMars":{"population":9680,"demandHappiness":9680,"money_24h":112700},"SpaceAgeAsteroidBelt":{"population":10514,"demandHappiness":10514,"money_24h":124800},"SpaceAgeVenus":{"population":11365,"demandHappiness":11365,"money_24h":137600},"SpaceAgeJupiterMoon":{"population":12238,"demandHappiness":12238,"money_24h":151000},"SpaceAgeTitan":{"population":13127,"demandHappiness":13127,"money_24h":165100},"SpaceAgeSpaceHub":{"population":14040,"demandHappiness":14040,"money_24h":179800}} },
+    "R_MultiAge_ArcheologyBonus19d": { prod: {"BronzeAge":{"population":227,"demandHappiness":227,"money_24h":1100},"IronAge":{"population":487,"demandHappiness":487,"money_24h":2600},"EarlyMiddleAge":{"population":748,"demandHappiness":748,"money_24h":4300},"HighMiddleAge":{"population":1050,"demandHappiness":1050,"money_24h":6100},"LateMiddleAge":{"population":1378,"demandHappiness":1378,"money_24h":8000},"ColonialAge":{"population":1739,"demandHappiness":1739,"money_24h":12200},"IndustrialAge":{"population":2125,"demandHappiness":2125,"money_24h":15200},"ProgressiveEra":{"population":2537,"demandHappiness":2537,"money_24h":18400},"ModernEra":{"population":2974,"demandHappiness":2974,"money_24h":22900},"PostModernEra":{"population":3427,"demandHappiness":3427,"money_24h":28800},"ContemporaryEra":{"population":3906,"demandHappiness":3906,"money_24h":37500},"TomorrowEra":{"population":4402,"demandHappiness":4402,"money_24h":43400},"FutureEra":{"population":4922,"demandHappiness":4922,"money_24h":49800},"ArcticFuture":{"population":5460,"demandHappiness":5460,"money_24h":56600},"OceanicFuture":{"population":6014,"demandHappiness":6014,"money_24h":63800},"VirtualFuture":{"population":6586,"demandHappiness":6586,"money_24h":71400},"SpaceAgeMars":{"population":10424,"demandHappiness":10424,"money_24h":119300},"SpaceAgeAsteroidBelt":{"population":11323,"demandHappiness":11323,"money_24h":132100},"SpaceAgeVenus":{"population":12239,"demandHappiness":12239,"money_24h":145700},"SpaceAgeJupiterMoon":{"population":13180,"demandHappiness":13180,"money_24h":159900},"SpaceAgeTitan":{"population":14137,"demandHappiness":14137,"money_24h":174800},"SpaceAgeSpaceHub":{"population":15120,"demandHappiness":15120,"money_24h":190400}} },
+    "R_MultiAge_ArcheologyBonus19e": { prod: {"BronzeAge":{"population":243,"demandHappiness":243,"money_24h":1100},"IronAge":{"population":522,"demandHappiness":522,"money_24h":2700},"EarlyMiddleAge":{"population":801,"demandHappiness":801,"money_24h":4600},"HighMiddleAge":{"population":1125,"demandHappiness":1125,"money_24h":6400},"LateMiddleAge":{"population":1476,"demandHappiness":1476,"money_24h":8400},"ColonialAge":{"population":1863,"demandHappiness":1863,"money_24h":12900},"IndustrialAge":{"population":2277,"demandHappiness":2277,"money_24h":16000},"ProgressiveEra":{"population":2718,"demandHappiness":2718,"money_24h":19400},"ModernEra":{"population":3186,"demandHappiness":3186,"money_24h":24200},"PostModernEra":{"population":3672,"demandHappiness":3672,"money_24h":30400},"ContemporaryEra":{"population":4185,"demandHappiness":4185,"money_24h":39600},"TomorrowEra":{"population":4716,"demandHappiness":4716,"money_24h":45800},"FutureEra":{"population":5274,"demandHappiness":5274,"money_24h":52500},"ArcticFuture":{"population":5850,"demandHappiness":5850,"money_24h":59700},"OceanicFuture":{"population":6444,"demandHappiness":6444,"money_24h":67300},"VirtualFuture":{"population":7056,"demandHappiness":7056,"money_24h":75400},"SpaceAgeMars":{"population":11169,"demandHappiness":11169,"money_24h":125900},"SpaceAgeAsteroidBelt":{"population":12132,"demandHappiness":12132,"money_24h":139500},"SpaceAgeVenus":{"population":13113,"demandHappiness":13113,"money_24h":153800},"SpaceAgeJupiterMoon":{"population":14121,"demandHappiness":14121,"money_24h":168800},"SpaceAgeTitan":{"population":15147,"demandHappiness":15147,"money_24h":184500},"SpaceAgeSpaceHub":{"population":16200,"demandHappiness":16200,"money_24h":201000}} },
+    "R_MultiAge_ArcheologyBonus19f": { prod: {"BronzeAge":{"population":259,"demandHappiness":259,"money_24h":1200},"IronAge":{"population":557,"demandHappiness":557,"money_24h":2900},"EarlyMiddleAge":{"population":854,"demandHappiness":854,"money_24h":4800},"HighMiddleAge":{"population":1200,"demandHappiness":1200,"money_24h":6700},"LateMiddleAge":{"population":1574,"demandHappiness":1574,"money_24h":8900},"ColonialAge":{"population":1987,"demandHappiness":1987,"money_24h":13500},"IndustrialAge":{"population":2429,"demandHappiness":2429,"money_24h":16900},"ProgressiveEra":{"population":2899,"demandHappiness":2899,"money_24h":20500},"ModernEra":{"population":3398,"demandHappiness":3398,"money_24h":25400},"PostModernEra":{"population":3917,"demandHappiness":3917,"money_24h":32000},"ContemporaryEra":{"population":4464,"demandHappiness":4464,"money_24h":41700},"TomorrowEra":{"population":5030,"demandHappiness":5030,"money_24h":48200},"FutureEra":{"population":5626,"demandHappiness":5626,"money_24h":55300},"ArcticFuture":{"population":6240,"demandHappiness":6240,"money_24h":62800},"OceanicFuture":{"population":6874,"demandHappiness":6874,"money_24h":70900},"VirtualFuture":{"population":7526,"demandHappiness":7526,"money_24h":79400},"SpaceAgeMars":{"population":11914,"demandHappiness":11914,"money_24h":132600},"SpaceAgeAsteroidBelt":{"population":12941,"demandHappiness":12941,"money_24h":146800},"SpaceAgeVenus":{"population":13987,"demandHappiness":13987,"money_24h":161800},"SpaceAgeJupiterMoon":{"population":15062,"demandHappiness":15062,"money_24h":177600},"SpaceAgeTitan":{"population":16157,"demandHappiness":16157,"money_24h":194200},"SpaceAgeSpaceHub":{"population":17280,"demandHappiness":17280,"money_24h":211600}} },
+    "R_MultiAge_ArcheologyBonus19g": { prod: {"BronzeAge":{"population":275,"demandHappiness":275,"money_24h":1300},"IronAge":{"population":592,"demandHappiness":592,"money_24h":3000},"EarlyMiddleAge":{"population":908,"demandHappiness":908,"money_24h":5000},"HighMiddleAge":{"population":1275,"demandHappiness":1275,"money_24h":7100},"LateMiddleAge":{"population":1673,"demandHappiness":1673,"money_24h":9300},"ColonialAge":{"population":2111,"demandHappiness":2111,"money_24h":14200},"IndustrialAge":{"population":2581,"demandHappiness":2581,"money_24h":17700},"ProgressiveEra":{"population":3080,"demandHappiness":3080,"money_24h":21500},"ModernEra":{"population":3611,"demandHappiness":3611,"money_24h":26700},"PostModernEra":{"population":4162,"demandHappiness":4162,"money_24h":33600},"ContemporaryEra":{"population":4743,"demandHappiness":4743,"money_24h":43800},"TomorrowEra":{"population":5345,"demandHappiness":5345,"money_24h":50700},"FutureEra":{"population":5977,"demandHappiness":5977,"money_24h":58100},"ArcticFuture":{"population":6630,"demandHappiness":6630,"money_24h":66000},"OceanicFuture":{"population":7303,"demandHappiness":7303,"money_24h":74400},"VirtualFuture":{"population":7997,"demandHappiness":7997,"money_24h":83300},"SpaceAgeMars":{"population":12658,"demandHappiness":12658,"money_24h":139200},"SpaceAgeAsteroidBelt":{"population":13750,"demandHappiness":13750,"money_24h":154200},"SpaceAgeVenus":{"population":14861,"demandHappiness":14861,"money_24h":169900},"SpaceAgeJupiterMoon":{"population":16004,"demandHappiness":16004,"money_24h":186500},"SpaceAgeTitan":{"population":17167,"demandHappiness":17167,"money_24h":203900},"SpaceAgeSpaceHub":{"population":18360,"demandHappiness":18360,"money_24h":222100}} },
+    "R_MultiAge_ArcheologyBonus19h": { prod: {"BronzeAge":{"population":292,"demandHappiness":292,"money_24h":1300},"IronAge":{"population":626,"demandHappiness":626,"money_24h":3200},"EarlyMiddleAge":{"population":961,"demandHappiness":961,"money_24h":5300},"HighMiddleAge":{"population":1350,"demandHappiness":1350,"money_24h":7400},"LateMiddleAge":{"population":1771,"demandHappiness":1771,"money_24h":9800},"ColonialAge":{"population":2236,"demandHappiness":2236,"money_24h":14900},"IndustrialAge":{"population":2732,"demandHappiness":2732,"money_24h":18500},"ProgressiveEra":{"population":3262,"demandHappiness":3262,"money_24h":22500},"ModernEra":{"population":3823,"demandHappiness":3823,"money_24h":28000},"PostModernEra":{"population":4406,"demandHappiness":4406,"money_24h":35200},"ContemporaryEra":{"population":5022,"demandHappiness":5022,"money_24h":45800},"TomorrowEra":{"population":5659,"demandHappiness":5659,"money_24h":53100},"FutureEra":{"population":6329,"demandHappiness":6329,"money_24h":60800},"ArcticFuture":{"population":7020,"demandHappiness":7020,"money_24h":69100},"OceanicFuture":{"population":7733,"demandHappiness":7733,"money_24h":77900},"VirtualFuture":{"population":8467,"demandHappiness":8467,"money_24h":87300},"SpaceAgeMars":{"population":13403,"demandHappiness":13403,"money_24h":145800},"SpaceAgeAsteroidBelt":{"population":14558,"demandHappiness":14558,"money_24h":161500},"SpaceAgeVenus":{"population":15736,"demandHappiness":15736,"money_24h":178000},"SpaceAgeJupiterMoon":{"population":16945,"demandHappiness":16945,"money_24h":195400},"SpaceAgeTitan":{"population":18176,"demandHappiness":18176,"money_24h":213600},"SpaceAgeSpaceHub":{"population":19440,"demandHappiness":19440,"money_24h":232700}} },
+    "R_MultiAge_ArcheologyBonus19i": { prod: {"BronzeAge":{"population":308,"demandHappiness":308,"money_24h":1400},"IronAge":{"population":661,"demandHappiness":661,"money_24h":3300},"EarlyMiddleAge":{"population":1015,"demandHappiness":1015,"money_24h":5500},"HighMiddleAge":{"population":1425,"demandHappiness":1425,"money_24h":7700},"LateMiddleAge":{"population":1870,"demandHappiness":1870,"money_24h":10200},"ColonialAge":{"population":2360,"demandHappiness":2360,"money_24h":15600},"IndustrialAge":{"population":2884,"demandHappiness":2884,"money_24h":19400},"ProgressiveEra":{"population":3443,"demandHappiness":3443,"money_24h":23500},"ModernEra":{"population":4036,"demandHappiness":4036,"money_24h":29300},"PostModernEra":{"population":4651,"demandHappiness":4651,"money_24h":36800},"ContemporaryEra":{"population":5301,"demandHappiness":5301,"money_24h":47900},"TomorrowEra":{"population":5974,"demandHappiness":5974,"money_24h":55500},"FutureEra":{"population":6680,"demandHappiness":6680,"money_24h":63600},"ArcticFuture":{"population":7410,"demandHappiness":7410,"money_24h":72300},"OceanicFuture":{"population":8162,"demandHappiness":8162,"money_24h":81500},"VirtualFuture":{"population":8938,"demandHappiness":8938,"money_24h":91300},"SpaceAgeMars":{"population":13775,"demandHappiness":13775,"money_24h":152400},"SpaceAgeAsteroidBelt":{"population":14963,"demandHappiness":14963,"money_24h":168800},"SpaceAgeVenus":{"population":16173,"demandHappiness":16173,"money_24h":186100},"SpaceAgeJupiterMoon":{"population":17416,"demandHappiness":17416,"money_24h":204300},"SpaceAgeTitan":{"population":18681,"demandHappiness":18681,"money_24h":223300},"SpaceAgeSpaceHub":{"population":19980,"demandHappiness":19980,"money_24h":243300}} },
+    "R_MultiAge_HeroBonus22pass": { prod: {"BronzeAge":{"happiness":180,"population":95,"demandHappiness":95,"money_24h":200},"IronAge":{"happiness":310,"population":203,"demandHappiness":203,"money_24h":400},"EarlyMiddleAge":{"happiness":340,"population":312,"demandHappiness":312,"money_24h":600},"HighMiddleAge":{"happiness":380,"population":438,"demandHappiness":438,"money_24h":800},"LateMiddleAge":{"happiness":430,"population":574,"demandHappiness":574,"money_24h":1100},"ColonialAge":{"happiness":500,"population":725,"demandHappiness":725,"money_24h":1700},"IndustrialAge":{"happiness":570,"population":886,"demandHappiness":886,"money_24h":2100},"ProgressiveEra":{"happiness":620,"population":1057,"demandHappiness":1057,"money_24h":2600},"ModernEra":{"happiness":670,"population":1239,"demandHappiness":1239,"money_24h":3200},"PostModernEra":{"happiness":690,"population":1428,"demandHappiness":1428,"money_24h":4000},"ContemporaryEra":{"happiness":810,"population":1628,"demandHappiness":1628,"money_24h":5200},"TomorrowEra":{"happiness":980,"population":1834,"demandHappiness":1834,"money_24h":6000},"FutureEra":{"happiness":1170,"population":2051,"demandHappiness":2051,"money_24h":6900},"ArcticFuture":{"happiness":1360,"population":2275,"demandHappiness":2275,"money_24h":7900},"OceanicFuture":{"happiness":1580,"population":2506,"demandHappiness":2506,"money_24h":8900},"VirtualFuture":{"happiness":1880,"population":2744,"demandHappiness":2744,"money_24h":9900},"SpaceAgeMars":{"happiness":3010,"population":4344,"demandHappiness":4344,"money_24h":16600},"SpaceAgeAsteroidBelt":{"happiness":3270,"population":4718,"demandHappiness":4718,"money_24h":18400},"SpaceAgeVenus":{"happiness":3540,"population":5100,"demandHappiness":5100,"money_24h":20200},"SpaceAgeJupiterMoon":{"happiness":3810,"population":5492,"demandHappiness":5492,"money_24h":22200},"SpaceAgeTitan":{"happiness":4080,"population":5891,"demandHappiness":5891,"money_24h":24300},"SpaceAgeSpaceHub":{"happiness":4370,"population":6300,"demandHappiness":6300,"money_24h":26400}} },
+    "D_MultiAge_FallBonus20b": { prod: {"BronzeAge":{"happiness":140},"IronAge":{"happiness":220},"EarlyMiddleAge":{"happiness":270},"HighMiddleAge":{"happiness":320},"LateMiddleAge":{"happiness":360},"ColonialAge":{"happiness":430},"IndustrialAge":{"happiness":500},"ProgressiveEra":{"happiness":540},"ModernEra":{"happiness":580},"PostModernEra":{"happiness":610},"ContemporaryEra":{"happiness":710},"TomorrowEra":{"happiness":880},"FutureEra":{"happiness":1050},"ArcticFuture":{"happiness":1300},"OceanicFuture":{"happiness":1500},"VirtualFuture":{"happiness":1790},"SpaceAgeMars":{"happiness":3010},"SpaceAgeAsteroidBelt":{"happiness":3270},"SpaceAgeVenus":{"happiness":3540},"SpaceAgeJupiterMoon":{"happiness":3810},"SpaceAgeTitan":{"happiness":4080},"SpaceAgeSpaceHub":{"happiness":4370}} },
+    "D_MultiAge_DavinciBonus": { prod: {"StoneAge":{"happiness":80},"BronzeAge":{"happiness":85},"IronAge":{"happiness":90},"EarlyMiddleAge":{"happiness":95},"HighMiddleAge":{"happiness":100},"LateMiddleAge":{"happiness":105},"ColonialAge":{"happiness":110},"IndustrialAge":{"happiness":115},"ProgressiveEra":{"happiness":119},"ModernEra":{"happiness":122},"PostModernEra":{"happiness":127},"ContemporaryEra":{"happiness":148},"TomorrowEra":{"happiness":179},"FutureEra":{"happiness":215},"ArcticFuture":{"happiness":250},"OceanicFuture":{"happiness":289},"VirtualFuture":{"happiness":345},"SpaceAgeMars":{"happiness":552},"SpaceAgeAsteroidBelt":{"happiness":600},"SpaceAgeVenus":{"happiness":648},"SpaceAgeJupiterMoon":{"happiness":698},"SpaceAgeTitan":{"happiness":749},"SpaceAgeSpaceHub":{"happiness":801}} },
+    "R_MultiAge_SpringBonus17gBlue": { prod: {"BronzeAge":{"happiness":130,"population":130,"demandHappiness":130,"money_24h":880},"IronAge":{"happiness":278,"population":278,"demandHappiness":278,"money_24h":2110},"EarlyMiddleAge":{"happiness":427,"population":427,"demandHappiness":427,"money_24h":3520},"HighMiddleAge":{"happiness":600,"population":600,"demandHappiness":600,"money_24h":4930},"LateMiddleAge":{"happiness":787,"population":787,"demandHappiness":787,"money_24h":6510},"ColonialAge":{"happiness":994,"population":994,"demandHappiness":994,"money_24h":9920},"IndustrialAge":{"happiness":1214,"population":1214,"demandHappiness":1214,"money_24h":12360},"ProgressiveEra":{"happiness":1450,"population":1450,"demandHappiness":1450,"money_24h":15000},"ModernEra":{"happiness":1699,"population":1699,"demandHappiness":1699,"money_24h":18660},"PostModernEra":{"happiness":1958,"population":1958,"demandHappiness":1958,"money_24h":23470},"ContemporaryEra":{"happiness":2232,"population":2232,"demandHappiness":2232,"money_24h":30550},"TomorrowEra":{"happiness":2515,"population":2515,"demandHappiness":2515,"money_24h":35380},"FutureEra":{"happiness":2813,"population":2813,"demandHappiness":2813,"money_24h":40550},"ArcticFuture":{"happiness":3120,"population":3120,"demandHappiness":3120,"money_24h":46080},"OceanicFuture":{"happiness":3437,"population":3437,"demandHappiness":3437,"money_24h":51960},"VirtualFuture":{"happiness":3763,"population":3763,"demandHappiness":3763,"money_24h":58190},"SpaceAgeMars":{"happiness":5957,"population":5957,"demandHappiness":5957,"money_24h":97200},"SpaceAgeAsteroidBelt":{"happiness":6470,"population":6470,"demandHappiness":6470,"money_24h":107670},"SpaceAgeVenus":{"happiness":6994,"population":6994,"demandHappiness":6994,"money_24h":118690},"SpaceAgeJupiterMoon":{"happiness":7531,"population":7531,"demandHappiness":7531,"money_24h":130270},"SpaceAgeTitan":{"happiness":8078,"population":8078,"demandHappiness":8078,"money_24h":142420},"SpaceAgeSpaceHub":{"happiness":8640,"population":8640,"demandHappiness":8640,"money_24h":155140}} },
+    "D_MultiAge_CarnivalBonus18": { prod: {"BronzeAge":{"happiness":68},"IronAge":{"happiness":99},"EarlyMiddleAge":{"happiness":129},"HighMiddleAge":{"happiness":158},"LateMiddleAge":{"happiness":187},"ColonialAge":{"happiness":217},"IndustrialAge":{"happiness":248},"ProgressiveEra":{"happiness":276},"ModernEra":{"happiness":304},"PostModernEra":{"happiness":334},"ContemporaryEra":{"happiness":368},"TomorrowEra":{"happiness":400},"FutureEra":{"happiness":432},"ArcticFuture":{"happiness":495},"OceanicFuture":{"happiness":571},"VirtualFuture":{"happiness":682},"SpaceAgeMars":{"happiness":1091},"SpaceAgeAsteroidBelt":{"happiness":1186},"SpaceAgeVenus":{"happiness":1281},"SpaceAgeJupiterMoon":{"happiness":1380},"SpaceAgeTitan":{"happiness":1480},"SpaceAgeSpaceHub":{"happiness":1584}} },
+    "R_MultiAge_SummerBonus15": { prod: {"BronzeAge":{"happiness":75,"population":75,"demandHappiness":75,"money_24h":80},"IronAge":{"happiness":150,"population":150,"demandHappiness":150,"money_24h":190},"EarlyMiddleAge":{"happiness":240,"population":240,"demandHappiness":240,"money_24h":320},"HighMiddleAge":{"happiness":335,"population":335,"demandHappiness":335,"money_24h":450},"LateMiddleAge":{"happiness":450,"population":450,"demandHappiness":450,"money_24h":600},"ColonialAge":{"happiness":560,"population":560,"demandHappiness":560,"money_24h":910},"IndustrialAge":{"happiness":680,"population":680,"demandHappiness":680,"money_24h":1140},"ProgressiveEra":{"happiness":815,"population":815,"demandHappiness":815,"money_24h":1380},"ModernEra":{"happiness":950,"population":950,"demandHappiness":950,"money_24h":1720},"PostModernEra":{"happiness":1100,"population":1100,"demandHappiness":1100,"money_24h":2160},"ContemporaryEra":{"happiness":1245,"population":1245,"demandHappiness":1245,"money_24h":2810},"TomorrowEra":{"happiness":1415,"population":1415,"demandHappiness":1415,"money_24h":3260},"FutureEra":{"happiness":1582,"population":1582,"demandHappiness":1582,"money_24h":3730},"ArcticFuture":{"happiness":1755,"population":1755,"demandHappiness":1755,"money_24h":4240},"OceanicFuture":{"happiness":1933,"population":1933,"demandHappiness":1933,"money_24h":4780},"VirtualFuture":{"happiness":2117,"population":2117,"demandHappiness":2117,"money_24h":5360},"SpaceAgeMars":{"happiness":3351,"population":3351,"demandHappiness":3351,"money_24h":8950},"SpaceAgeAsteroidBelt":{"happiness":3640,"population":3640,"demandHappiness":3640,"money_24h":9910},"SpaceAgeVenus":{"happiness":3934,"population":3934,"demandHappiness":3934,"money_24h":10920},"SpaceAgeJupiterMoon":{"happiness":4236,"population":4236,"demandHappiness":4236,"money_24h":11990},"SpaceAgeTitan":{"happiness":4544,"population":4544,"demandHappiness":4544,"money_24h":13110},"SpaceAgeSpaceHub":{"happiness":4860,"population":4860,"demandHappiness":4860,"money_24h":14280}} },
+    "D_MultiAge_CarnivalBonus17b": { prod: {"BronzeAge":{"happiness":68},"IronAge":{"happiness":99},"EarlyMiddleAge":{"happiness":129},"HighMiddleAge":{"happiness":158},"LateMiddleAge":{"happiness":187},"ColonialAge":{"happiness":217},"IndustrialAge":{"happiness":248},"ProgressiveEra":{"happiness":276},"ModernEra":{"happiness":304},"PostModernEra":{"happiness":334},"ContemporaryEra":{"happiness":368},"TomorrowEra":{"happiness":400},"FutureEra":{"happiness":432},"ArcticFuture":{"happiness":495},"OceanicFuture":{"happiness":571},"VirtualFuture":{"happiness":682},"SpaceAgeMars":{"happiness":1091},"SpaceAgeAsteroidBelt":{"happiness":1186},"SpaceAgeVenus":{"happiness":1281},"SpaceAgeJupiterMoon":{"happiness":1380},"SpaceAgeTitan":{"happiness":1480},"SpaceAgeSpaceHub":{"happiness":1584}} },
+    "P_MultiAge_CarnivalBonus17": { prod: {"BronzeAge":{"happiness":203},"IronAge":{"happiness":233},"EarlyMiddleAge":{"happiness":266},"HighMiddleAge":{"happiness":297},"LateMiddleAge":{"happiness":331},"ColonialAge":{"happiness":389},"IndustrialAge":{"happiness":439},"ProgressiveEra":{"happiness":482},"ModernEra":{"happiness":516},"PostModernEra":{"happiness":538},"ContemporaryEra":{"happiness":625},"TomorrowEra":{"happiness":758},"FutureEra":{"happiness":908},"ArcticFuture":{"happiness":1058},"OceanicFuture":{"happiness":1221},"VirtualFuture":{"happiness":1458},"SpaceAgeMars":{"happiness":2333},"SpaceAgeAsteroidBelt":{"happiness":2536},"SpaceAgeVenus":{"happiness":2740},"SpaceAgeJupiterMoon":{"happiness":2951},"SpaceAgeTitan":{"happiness":3165},"SpaceAgeSpaceHub":{"happiness":3386}} },
+    "D_MultiAge_PatrickBonusSet20a": { prod: {"BronzeAge":{"happiness":60},"IronAge":{"happiness":90},"EarlyMiddleAge":{"happiness":110},"HighMiddleAge":{"happiness":120},"LateMiddleAge":{"happiness":140},"ColonialAge":{"happiness":170},"IndustrialAge":{"happiness":190},"ProgressiveEra":{"happiness":210},"ModernEra":{"happiness":220},"PostModernEra":{"happiness":230},"ContemporaryEra":{"happiness":270},"TomorrowEra":{"happiness":330},"FutureEra":{"happiness":410},"ArcticFuture":{"happiness":480},"OceanicFuture":{"happiness":570},"VirtualFuture":{"happiness":680},"SpaceAgeMars":{"happiness":1090},"SpaceAgeAsteroidBelt":{"happiness":1190},"SpaceAgeVenus":{"happiness":1280},"SpaceAgeJupiterMoon":{"happiness":1380},"SpaceAgeTitan":{"happiness":1480},"SpaceAgeSpaceHub":{"happiness":1580}} },
+    "D_MultiAge_PatrickBonusSet20b": { prod: {"BronzeAge":{"happiness":70},"IronAge":{"happiness":110},"EarlyMiddleAge":{"happiness":130},"HighMiddleAge":{"happiness":150},"LateMiddleAge":{"happiness":180},"ColonialAge":{"happiness":210},"IndustrialAge":{"happiness":240},"ProgressiveEra":{"happiness":260},"ModernEra":{"happiness":280},"PostModernEra":{"happiness":290},"ContemporaryEra":{"happiness":340},"TomorrowEra":{"happiness":420},"FutureEra":{"happiness":530},"ArcticFuture":{"happiness":610},"OceanicFuture":{"happiness":750},"VirtualFuture":{"happiness":890},"SpaceAgeMars":{"happiness":1430},"SpaceAgeAsteroidBelt":{"happiness":1550},"SpaceAgeVenus":{"happiness":1680},"SpaceAgeJupiterMoon":{"happiness":1810},"SpaceAgeTitan":{"happiness":1940},"SpaceAgeSpaceHub":{"happiness":2080}} },
+    "P_MultiAge_ChristmasBonus4": { prod: {"BronzeAge":{"happiness":140},"IronAge":{"happiness":230},"EarlyMiddleAge":{"happiness":260},"HighMiddleAge":{"happiness":290},"LateMiddleAge":{"happiness":320},"ColonialAge":{"happiness":380},"IndustrialAge":{"happiness":420},"ProgressiveEra":{"happiness":470},"ModernEra":{"happiness":500},"PostModernEra":{"happiness":520},"ContemporaryEra":{"happiness":600},"TomorrowEra":{"happiness":730},"FutureEra":{"happiness":880},"ArcticFuture":{"happiness":1020},"OceanicFuture":{"happiness":1180},"VirtualFuture":{"happiness":1410},"SpaceAgeMars":{"happiness":2260},"SpaceAgeAsteroidBelt":{"happiness":2450},"SpaceAgeVenus":{"happiness":2650},"SpaceAgeJupiterMoon":{"happiness":2860},"SpaceAgeTitan":{"happiness":3060},"SpaceAgeSpaceHub":{"happiness":3280}} },
+    "R_MultiAge_ArcheologyBonus21a": { prod: {"BronzeAge":{"happiness":760,"population":178,"demandHappiness":178,"money_24h":1000},"IronAge":{"happiness":1300,"population":383,"demandHappiness":383,"money_24h":2300},"EarlyMiddleAge":{"happiness":1440,"population":587,"demandHappiness":587,"money_24h":3800},"HighMiddleAge":{"happiness":1610,"population":825,"demandHappiness":825,"money_24h":5400},"LateMiddleAge":{"happiness":1790,"population":1082,"demandHappiness":1082,"money_24h":7100},"ColonialAge":{"happiness":2110,"population":1366,"demandHappiness":1366,"money_24h":10800},"IndustrialAge":{"happiness":2380,"population":1670,"demandHappiness":1670,"money_24h":13500},"ProgressiveEra":{"happiness":2610,"population":1993,"demandHappiness":1993,"money_24h":16400},"ModernEra":{"happiness":2800,"population":2336,"demandHappiness":2336,"money_24h":20400},"PostModernEra":{"happiness":2910,"population":2693,"demandHappiness":2693,"money_24h":25600},"ContemporaryEra":{"happiness":3390,"population":3069,"demandHappiness":3069,"money_24h":33300},"TomorrowEra":{"happiness":4110,"population":3458,"demandHappiness":3458,"money_24h":38600},"FutureEra":{"happiness":4920,"population":3868,"demandHappiness":3868,"money_24h":44200},"ArcticFuture":{"happiness":5730,"population":4290,"demandHappiness":4290,"money_24h":50300},"OceanicFuture":{"happiness":6620,"population":4726,"demandHappiness":4726,"money_24h":56700},"VirtualFuture":{"happiness":7900,"population":5174,"demandHappiness":5174,"money_24h":63500},"SpaceAgeMars":{"happiness":12650,"population":8191,"demandHappiness":8191,"money_24h":106000},"SpaceAgeAsteroidBelt":{"happiness":13740,"population":8897,"demandHappiness":8897,"money_24h":117500},"SpaceAgeVenus":{"happiness":14850,"population":9616,"demandHappiness":9616,"money_24h":129500},"SpaceAgeJupiterMoon":{"happiness":15990,"population":10355,"demandHappiness":10355,"money_24h":142100},"SpaceAgeTitan":{"happiness":17150,"population":11108,"demandHappiness":11108,"money_24h":155400},"SpaceAgeSpaceHub":{"happiness":18350,"population":11880,"demandHappiness":11880,"money_24h":169200}} },
+    "R_MultiAge_ArcheologyBonus21b": { prod: {"BronzeAge":{"happiness":780,"population":180,"demandHappiness":180,"money_24h":1100},"IronAge":{"happiness":1350,"population":386,"demandHappiness":386,"money_24h":2600},"EarlyMiddleAge":{"happiness":1490,"population":593,"demandHappiness":593,"money_24h":4300},"HighMiddleAge":{"happiness":1670,"population":833,"demandHappiness":833,"money_24h":6100},"LateMiddleAge":{"happiness":1860,"population":1092,"demandHappiness":1092,"money_24h":8000},"ColonialAge":{"happiness":2190,"population":1379,"demandHappiness":1379,"money_24h":12200},"IndustrialAge":{"happiness":2460,"population":1685,"demandHappiness":1685,"money_24h":15200},"ProgressiveEra":{"happiness":2710,"population":2011,"demandHappiness":2011,"money_24h":18400},"ModernEra":{"happiness":2900,"population":2358,"demandHappiness":2358,"money_24h":22900},"PostModernEra":{"happiness":3020,"population":2717,"demandHappiness":2717,"money_24h":28800},"ContemporaryEra":{"happiness":3510,"population":3097,"demandHappiness":3097,"money_24h":37500},"TomorrowEra":{"happiness":4260,"population":3490,"demandHappiness":3490,"money_24h":43400},"FutureEra":{"happiness":5100,"population":3903,"demandHappiness":3903,"money_24h":49800},"ArcticFuture":{"happiness":5940,"population":4329,"demandHappiness":4329,"money_24h":56600},"OceanicFuture":{"happiness":6850,"population":4769,"demandHappiness":4769,"money_24h":63800},"VirtualFuture":{"happiness":8190,"population":5221,"demandHappiness":5221,"money_24h":71400},"SpaceAgeMars":{"happiness":13100,"population":8265,"demandHappiness":8265,"money_24h":119300},"SpaceAgeAsteroidBelt":{"happiness":14230,"population":8978,"demandHappiness":8978,"money_24h":132100},"SpaceAgeVenus":{"happiness":15380,"population":9704,"demandHappiness":9704,"money_24h":145700},"SpaceAgeJupiterMoon":{"happiness":16560,"population":10450,"demandHappiness":10450,"money_24h":159900},"SpaceAgeTitan":{"happiness":17770,"population":11209,"demandHappiness":11209,"money_24h":174800},"SpaceAgeSpaceHub":{"happiness":19000,"population":11988,"demandHappiness":11988,"money_24h":190400}} },
+    "R_MultiAge_ArcheologyBonus21c": { prod: {"BronzeAge":{"happiness":810,"population":183,"demandHappiness":183,"money_24h":1200},"IronAge":{"happiness":1400,"population":393,"demandHappiness":393,"money_24h":2900},"EarlyMiddleAge":{"happiness":1550,"population":603,"demandHappiness":603,"money_24h":4800},"HighMiddleAge":{"happiness":1720,"population":848,"demandHappiness":848,"money_24h":6700},"LateMiddleAge":{"happiness":1920,"population":1112,"demandHappiness":1112,"money_24h":8900},"ColonialAge":{"happiness":2260,"population":1403,"demandHappiness":1403,"money_24h":13500},"IndustrialAge":{"happiness":2550,"population":1715,"demandHappiness":1715,"money_24h":16900},"ProgressiveEra":{"happiness":2800,"population":2048,"demandHappiness":2048,"money_24h":20500},"ModernEra":{"happiness":3000,"population":2400,"demandHappiness":2400,"money_24h":25400},"PostModernEra":{"happiness":3120,"population":2766,"demandHappiness":2766,"money_24h":32000},"ContemporaryEra":{"happiness":3630,"population":3153,"demandHappiness":3153,"money_24h":41700},"TomorrowEra":{"happiness":4400,"population":3553,"demandHappiness":3553,"money_24h":48200},"FutureEra":{"happiness":5270,"population":3973,"demandHappiness":3973,"money_24h":55300},"ArcticFuture":{"happiness":6140,"population":4407,"demandHappiness":4407,"money_24h":62800},"OceanicFuture":{"happiness":7090,"population":4854,"demandHappiness":4854,"money_24h":70900},"VirtualFuture":{"happiness":8470,"population":5316,"demandHappiness":5316,"money_24h":79400},"SpaceAgeMars":{"happiness":13550,"population":8414,"demandHappiness":8414,"money_24h":132600},"SpaceAgeAsteroidBelt":{"happiness":14720,"population":9139,"demandHappiness":9139,"money_24h":146800},"SpaceAgeVenus":{"happiness":15910,"population":9878,"demandHappiness":9878,"money_24h":161800},"SpaceAgeJupiterMoon":{"happiness":17140,"population":10638,"demandHappiness":10638,"money_24h":177600},"SpaceAgeTitan":{"happiness":18380,"population":11411,"demandHappiness":11411,"money_24h":194200},"SpaceAgeSpaceHub":{"happiness":19660,"population":12204,"demandHappiness":12204,"money_24h":211600}} },
+    "R_MultiAge_ArcheologyBonus21d": { prod: {"BronzeAge":{"happiness":870,"population":188,"demandHappiness":188,"money_24h":1300},"IronAge":{"happiness":1490,"population":404,"demandHappiness":404,"money_24h":3200},"EarlyMiddleAge":{"happiness":1650,"population":619,"demandHappiness":619,"money_24h":5300},"HighMiddleAge":{"happiness":1840,"population":870,"demandHappiness":870,"money_24h":7400},"LateMiddleAge":{"happiness":2050,"population":1141,"demandHappiness":1141,"money_24h":9800},"ColonialAge":{"happiness":2410,"population":1441,"demandHappiness":1441,"money_24h":14900},"IndustrialAge":{"happiness":2720,"population":1761,"demandHappiness":1761,"money_24h":18500},"ProgressiveEra":{"happiness":2990,"population":2102,"demandHappiness":2102,"money_24h":22500},"ModernEra":{"happiness":3200,"population":2464,"demandHappiness":2464,"money_24h":28000},"PostModernEra":{"happiness":3330,"population":2840,"demandHappiness":2840,"money_24h":35200},"ContemporaryEra":{"happiness":3870,"population":3236,"demandHappiness":3236,"money_24h":45800},"TomorrowEra":{"happiness":4700,"population":3647,"demandHappiness":3647,"money_24h":53100},"FutureEra":{"happiness":5630,"population":4079,"demandHappiness":4079,"money_24h":60800},"ArcticFuture":{"happiness":6550,"population":4524,"demandHappiness":4524,"money_24h":69100},"OceanicFuture":{"happiness":7560,"population":4983,"demandHappiness":4983,"money_24h":77900},"VirtualFuture":{"happiness":9030,"population":5457,"demandHappiness":5457,"money_24h":87300},"SpaceAgeMars":{"happiness":14450,"population":8637,"demandHappiness":8637,"money_24h":145800},"SpaceAgeAsteroidBelt":{"happiness":15710,"population":9382,"demandHappiness":9382,"money_24h":161500},"SpaceAgeVenus":{"happiness":16970,"population":10141,"demandHappiness":10141,"money_24h":178000},"SpaceAgeJupiterMoon":{"happiness":18280,"population":10920,"demandHappiness":10920,"money_24h":195400},"SpaceAgeTitan":{"happiness":19600,"population":11714,"demandHappiness":11714,"money_24h":213600},"SpaceAgeSpaceHub":{"happiness":20970,"population":12528,"demandHappiness":12528,"money_24h":232700}} },
+    "R_MultiAge_ArcheologyBonus21e": { prod: {"BronzeAge":{"happiness":920,"population":194,"demandHappiness":194,"money_24h":1400},"IronAge":{"happiness":1580,"population":418,"demandHappiness":418,"money_24h":3500},"EarlyMiddleAge":{"happiness":1750,"population":641,"demandHappiness":641,"money_24h":5800},"HighMiddleAge":{"happiness":1950,"population":900,"demandHappiness":900,"money_24h":8100},"LateMiddleAge":{"happiness":2180,"population":1181,"demandHappiness":1181,"money_24h":10700},"ColonialAge":{"happiness":2560,"population":1490,"demandHappiness":1490,"money_24h":16200},"IndustrialAge":{"happiness":2890,"population":1822,"demandHappiness":1822,"money_24h":20200},"ProgressiveEra":{"happiness":3170,"population":2174,"demandHappiness":2174,"money_24h":24500},"ModernEra":{"happiness":3400,"population":2549,"demandHappiness":2549,"money_24h":30500},"PostModernEra":{"happiness":3540,"population":2938,"demandHappiness":2938,"money_24h":38400},"ContemporaryEra":{"happiness":4110,"population":3348,"demandHappiness":3348,"money_24h":50000},"TomorrowEra":{"happiness":4990,"population":3773,"demandHappiness":3773,"money_24h":57900},"FutureEra":{"happiness":5980,"population":4219,"demandHappiness":4219,"money_24h":66400},"ArcticFuture":{"happiness":6960,"population":4680,"demandHappiness":4680,"money_24h":75400},"OceanicFuture":{"happiness":8030,"population":5155,"demandHappiness":5155,"money_24h":85000},"VirtualFuture":{"happiness":9600,"population":5645,"demandHappiness":5645,"money_24h":95200},"SpaceAgeMars":{"happiness":15360,"population":8935,"demandHappiness":8935,"money_24h":159100},"SpaceAgeAsteroidBelt":{"happiness":16690,"population":9706,"demandHappiness":9706,"money_24h":176200},"SpaceAgeVenus":{"happiness":18030,"population":10490,"demandHappiness":10490,"money_24h":194200},"SpaceAgeJupiterMoon":{"happiness":19420,"population":11297,"demandHappiness":11297,"money_24h":213200},"SpaceAgeTitan":{"happiness":20830,"population":12118,"demandHappiness":12118,"money_24h":233100},"SpaceAgeSpaceHub":{"happiness":22280,"population":12960,"demandHappiness":12960,"money_24h":253900}} },
+    "R_MultiAge_ArcheologyBonus21f": { prod: {"BronzeAge":{"happiness":970,"population":204,"demandHappiness":204,"money_24h":1600},"IronAge":{"happiness":1680,"population":438,"demandHappiness":438,"money_24h":3700},"EarlyMiddleAge":{"happiness":1850,"population":673,"demandHappiness":673,"money_24h":6200},"HighMiddleAge":{"happiness":2070,"population":945,"demandHappiness":945,"money_24h":8700},"LateMiddleAge":{"happiness":2310,"population":1240,"demandHappiness":1240,"money_24h":11500},"ColonialAge":{"happiness":2710,"population":1565,"demandHappiness":1565,"money_24h":17600},"IndustrialAge":{"happiness":3060,"population":1913,"demandHappiness":1913,"money_24h":21900},"ProgressiveEra":{"happiness":3360,"population":2283,"demandHappiness":2283,"money_24h":26600},"ModernEra":{"happiness":3590,"population":2676,"demandHappiness":2676,"money_24h":33100},"PostModernEra":{"happiness":3750,"population":3084,"demandHappiness":3084,"money_24h":41600},"ContemporaryEra":{"happiness":4350,"population":3515,"demandHappiness":3515,"money_24h":54200},"TomorrowEra":{"happiness":5280,"population":3961,"demandHappiness":3961,"money_24h":62700},"FutureEra":{"happiness":6330,"population":4430,"demandHappiness":4430,"money_24h":71900},"ArcticFuture":{"happiness":7370,"population":4914,"demandHappiness":4914,"money_24h":81700},"OceanicFuture":{"happiness":8510,"population":5413,"demandHappiness":5413,"money_24h":92100},"VirtualFuture":{"happiness":10160,"population":5927,"demandHappiness":5927,"money_24h":103200},"SpaceAgeMars":{"happiness":16260,"population":9382,"demandHappiness":9382,"money_24h":172300},"SpaceAgeAsteroidBelt":{"happiness":17670,"population":10191,"demandHappiness":10191,"money_24h":190900},"SpaceAgeVenus":{"happiness":19090,"population":11015,"demandHappiness":11015,"money_24h":210400},"SpaceAgeJupiterMoon":{"happiness":20560,"population":11862,"demandHappiness":11862,"money_24h":230900},"SpaceAgeTitan":{"happiness":22050,"population":12723,"demandHappiness":12723,"money_24h":252500},"SpaceAgeSpaceHub":{"happiness":23590,"population":13608,"demandHappiness":13608,"money_24h":275000}} },
+    "R_MultiAge_ArcheologyBonus21g": { prod: {"BronzeAge":{"happiness":1030,"population":217,"demandHappiness":217,"money_24h":1700},"IronAge":{"happiness":1770,"population":466,"demandHappiness":466,"money_24h":4000},"EarlyMiddleAge":{"happiness":1960,"population":716,"demandHappiness":716,"money_24h":6700},"HighMiddleAge":{"happiness":2180,"population":1005,"demandHappiness":1005,"money_24h":9400},"LateMiddleAge":{"happiness":2440,"population":1319,"demandHappiness":1319,"money_24h":12400},"ColonialAge":{"happiness":2860,"population":1664,"demandHappiness":1664,"money_24h":18900},"IndustrialAge":{"happiness":3230,"population":2034,"demandHappiness":2034,"money_24h":23600},"ProgressiveEra":{"happiness":3550,"population":2428,"demandHappiness":2428,"money_24h":28600},"ModernEra":{"happiness":3790,"population":2846,"demandHappiness":2846,"money_24h":35600},"PostModernEra":{"happiness":3950,"population":3280,"demandHappiness":3280,"money_24h":44800},"ContemporaryEra":{"happiness":4590,"population":3739,"demandHappiness":3739,"money_24h":58300},"TomorrowEra":{"happiness":5580,"population":4213,"demandHappiness":4213,"money_24h":67500},"FutureEra":{"happiness":6680,"population":4711,"demandHappiness":4711,"money_24h":77400},"ArcticFuture":{"happiness":7780,"population":5226,"demandHappiness":5226,"money_24h":88000},"OceanicFuture":{"happiness":8980,"population":5757,"demandHappiness":5757,"money_24h":99200},"VirtualFuture":{"happiness":10730,"population":6303,"demandHappiness":6303,"money_24h":111100},"SpaceAgeMars":{"happiness":17160,"population":9978,"demandHappiness":9978,"money_24h":185600},"SpaceAgeAsteroidBelt":{"happiness":18650,"population":10838,"demandHappiness":10838,"money_24h":205600},"SpaceAgeVenus":{"happiness":20150,"population":11714,"demandHappiness":11714,"money_24h":226600},"SpaceAgeJupiterMoon":{"happiness":21710,"population":12615,"demandHappiness":12615,"money_24h":248700},"SpaceAgeTitan":{"happiness":23280,"population":13531,"demandHappiness":13531,"money_24h":271900},"SpaceAgeSpaceHub":{"happiness":24900,"population":14472,"demandHappiness":14472,"money_24h":296200}} },
+    "R_MultiAge_ArcheologyBonus21h": { prod: {"BronzeAge":{"happiness":1080,"population":233,"demandHappiness":233,"money_24h":1800},"IronAge":{"happiness":1860,"population":501,"demandHappiness":501,"money_24h":4300},"EarlyMiddleAge":{"happiness":2060,"population":769,"demandHappiness":769,"money_24h":7200},"HighMiddleAge":{"happiness":2300,"population":1080,"demandHappiness":1080,"money_24h":10100},"LateMiddleAge":{"happiness":2560,"population":1417,"demandHappiness":1417,"money_24h":13300},"ColonialAge":{"happiness":3010,"population":1788,"demandHappiness":1788,"money_24h":20300},"IndustrialAge":{"happiness":3400,"population":2186,"demandHappiness":2186,"money_24h":25300},"ProgressiveEra":{"happiness":3730,"population":2609,"demandHappiness":2609,"money_24h":30700},"ModernEra":{"happiness":3990,"population":3059,"demandHappiness":3059,"money_24h":38200},"PostModernEra":{"happiness":4160,"population":3525,"demandHappiness":3525,"money_24h":48000},"ContemporaryEra":{"happiness":4840,"population":4018,"demandHappiness":4018,"money_24h":62500},"TomorrowEra":{"happiness":5870,"population":4527,"demandHappiness":4527,"money_24h":72400},"FutureEra":{"happiness":7030,"population":5063,"demandHappiness":5063,"money_24h":82900},"ArcticFuture":{"happiness":8190,"population":5616,"demandHappiness":5616,"money_24h":94300},"OceanicFuture":{"happiness":9450,"population":6186,"demandHappiness":6186,"money_24h":106300},"VirtualFuture":{"happiness":11290,"population":6774,"demandHappiness":6774,"money_24h":119000},"SpaceAgeMars":{"happiness":18070,"population":10722,"demandHappiness":10722,"money_24h":198800},"SpaceAgeAsteroidBelt":{"happiness":19630,"population":11647,"demandHappiness":11647,"money_24h":220200},"SpaceAgeVenus":{"happiness":21210,"population":12588,"demandHappiness":12588,"money_24h":242800},"SpaceAgeJupiterMoon":{"happiness":22850,"population":13556,"demandHappiness":13556,"money_24h":266500},"SpaceAgeTitan":{"happiness":24500,"population":14541,"demandHappiness":14541,"money_24h":291300},"SpaceAgeSpaceHub":{"happiness":26210,"population":15552,"demandHappiness":15552,"money_24h":317300}} },
+    "R_MultiAge_ArcheologyBonus21i": { prod: {"BronzeAge":{"happiness":1190,"population":253,"demandHappiness":253,"money_24h":1900},"IronAge":{"happiness":2050,"population":543,"demandHappiness":543,"money_24h":4600},"EarlyMiddleAge":{"happiness":2270,"population":833,"demandHappiness":833,"money_24h":7700},"HighMiddleAge":{"happiness":2530,"population":1170,"demandHappiness":1170,"money_24h":10800},"LateMiddleAge":{"happiness":2820,"population":1535,"demandHappiness":1535,"money_24h":14200},"ColonialAge":{"happiness":3320,"population":1938,"demandHappiness":1938,"money_24h":21600},"IndustrialAge":{"happiness":3740,"population":2368,"demandHappiness":2368,"money_24h":27000},"ProgressiveEra":{"happiness":4110,"population":2827,"demandHappiness":2827,"money_24h":32700},"ModernEra":{"happiness":4390,"population":3313,"demandHappiness":3313,"money_24h":40700},"PostModernEra":{"happiness":4580,"population":3819,"demandHappiness":3819,"money_24h":51200},"ContemporaryEra":{"happiness":5320,"population":4352,"demandHappiness":4352,"money_24h":66700},"TomorrowEra":{"happiness":6460,"population":4905,"demandHappiness":4905,"money_24h":77200},"FutureEra":{"happiness":7740,"population":5485,"demandHappiness":5485,"money_24h":88500},"ArcticFuture":{"happiness":9010,"population":6084,"demandHappiness":6084,"money_24h":100500},"OceanicFuture":{"happiness":10400,"population":6702,"demandHappiness":6702,"money_24h":113400},"VirtualFuture":{"happiness":12420,"population":7338,"demandHappiness":7338,"money_24h":127000},"SpaceAgeMars":{"happiness":19870,"population":11616,"demandHappiness":11616,"money_24h":212100},"SpaceAgeAsteroidBelt":{"happiness":21600,"population":12617,"demandHappiness":12617,"money_24h":234900},"SpaceAgeVenus":{"happiness":23330,"population":13638,"demandHappiness":13638,"money_24h":259000},"SpaceAgeJupiterMoon":{"happiness":25130,"population":14686,"demandHappiness":14686,"money_24h":284200},"SpaceAgeTitan":{"happiness":26950,"population":15753,"demandHappiness":15753,"money_24h":310700},"SpaceAgeSpaceHub":{"happiness":28830,"population":16848,"demandHappiness":16848,"money_24h":338500}} },
+    "R_MultiAge_DoyleBonus17": { prod: {"BronzeAge":{"population":130,"demandHappiness":130,"money_24h":1000},"IronAge":{"population":280,"demandHappiness":280,"money_24h":2000},"EarlyMiddleAge":{"population":430,"demandHappiness":430,"money_24h":3200},"HighMiddleAge":{"population":600,"demandHappiness":600,"money_24h":4400},"LateMiddleAge":{"population":790,"demandHappiness":790,"money_24h":5900},"ColonialAge":{"population":1000,"demandHappiness":1000,"money_24h":9000},"IndustrialAge":{"population":1200,"demandHappiness":1200,"money_24h":11200},"ProgressiveEra":{"population":1450,"demandHappiness":1450,"money_24h":13600},"ModernEra":{"population":1700,"demandHappiness":1700,"money_24h":17000},"PostModernEra":{"population":1950,"demandHappiness":1950,"money_24h":21300},"ContemporaryEra":{"population":2250,"demandHappiness":2250,"money_24h":27800},"TomorrowEra":{"population":2500,"demandHappiness":2500,"money_24h":32200},"FutureEra":{"population":2800,"demandHappiness":2800,"money_24h":36800},"ArcticFuture":{"population":3100,"demandHappiness":3100,"money_24h":42000},"OceanicFuture":{"population":3400,"demandHappiness":3400,"money_24h":47200},"VirtualFuture":{"population":3723,"demandHappiness":3723,"money_24h":52860},"SpaceAgeMars":{"population":5894,"demandHappiness":5894,"money_24h":88300},"SpaceAgeAsteroidBelt":{"population":6402,"demandHappiness":6402,"money_24h":97810},"SpaceAgeVenus":{"population":6920,"demandHappiness":6920,"money_24h":107820},"SpaceAgeJupiterMoon":{"population":7451,"demandHappiness":7451,"money_24h":118340},"SpaceAgeTitan":{"population":7993,"demandHappiness":7993,"money_24h":129370},"SpaceAgeSpaceHub":{"population":8549,"demandHappiness":8549,"money_24h":140930}} },
+    "D_MultiAge_Battlegrounds2": { prod: {"BronzeAge":{"happiness":210},"IronAge":{"happiness":300},"EarlyMiddleAge":{"happiness":360},"HighMiddleAge":{"happiness":450},"LateMiddleAge":{"happiness":510},"ColonialAge":{"happiness":600},"IndustrialAge":{"happiness":680},"ProgressiveEra":{"happiness":750},"ModernEra":{"happiness":850},"PostModernEra":{"happiness":960},"ContemporaryEra":{"happiness":1120},"TomorrowEra":{"happiness":1390},"FutureEra":{"happiness":1670},"ArcticFuture":{"happiness":1890},"OceanicFuture":{"happiness":2130},"VirtualFuture":{"happiness":2680},"SpaceAgeMars":{"happiness":4180},"SpaceAgeAsteroidBelt":{"happiness":4540},"SpaceAgeVenus":{"happiness":4900},"SpaceAgeJupiterMoon":{"happiness":5280},"SpaceAgeTitan":{"happiness":5670},"SpaceAgeSpaceHub":{"happiness":6060}} },
+    "D_MultiAge_Bonus": { prod: {"BronzeAge":{"happiness":168},"IronAge":{"happiness":197},"EarlyMiddleAge":{"happiness":210},"HighMiddleAge":{"happiness":234},"LateMiddleAge":{"happiness":261},"ColonialAge":{"happiness":307},"IndustrialAge":{"happiness":347},"ProgressiveEra":{"happiness":381},"ModernEra":{"happiness":407},"PostModernEra":{"happiness":424},"ContemporaryEra":{"happiness":493},"TomorrowEra":{"happiness":600},"FutureEra":{"happiness":719},"ArcticFuture":{"happiness":835},"OceanicFuture":{"happiness":963},"VirtualFuture":{"happiness":1151},"SpaceAgeMars":{"happiness":1842},"SpaceAgeAsteroidBelt":{"happiness":2001},"SpaceAgeVenus":{"happiness":2162},"SpaceAgeJupiterMoon":{"happiness":2329},"SpaceAgeTitan":{"happiness":2498},"SpaceAgeSpaceHub":{"happiness":2672}} },
+    "R_MultiAge_WinterBonus21jFestive": { prod: {"BronzeAge":{"happiness":1300,"population":275,"demandHappiness":275,"money_24h":1900},"IronAge":{"happiness":2240,"population":592,"demandHappiness":592,"money_24h":4500},"EarlyMiddleAge":{"happiness":2470,"population":908,"demandHappiness":908,"money_24h":7400},"HighMiddleAge":{"happiness":2760,"population":1275,"demandHappiness":1275,"money_24h":10400},"LateMiddleAge":{"happiness":3080,"population":1673,"demandHappiness":1673,"money_24h":13800},"ColonialAge":{"happiness":3620,"population":2111,"demandHappiness":2111,"money_24h":21000},"IndustrialAge":{"happiness":4080,"population":2581,"demandHappiness":2581,"money_24h":26100},"ProgressiveEra":{"happiness":4480,"population":3080,"demandHappiness":3080,"money_24h":31700},"ModernEra":{"happiness":4790,"population":3611,"demandHappiness":3611,"money_24h":39400},"PostModernEra":{"happiness":4990,"population":4162,"demandHappiness":4162,"money_24h":49600},"ContemporaryEra":{"happiness":5800,"population":4743,"demandHappiness":4743,"money_24h":64600},"TomorrowEra":{"happiness":7040,"population":5345,"demandHappiness":5345,"money_24h":74800},"FutureEra":{"happiness":8440,"population":5977,"demandHappiness":5977,"money_24h":85700},"ArcticFuture":{"happiness":9830,"population":6630,"demandHappiness":6630,"money_24h":97400},"OceanicFuture":{"happiness":11340,"population":7303,"demandHappiness":7303,"money_24h":109800},"VirtualFuture":{"happiness":13550,"population":7997,"demandHappiness":7997,"money_24h":123000},"SpaceAgeMars":{"happiness":21680,"population":12658,"demandHappiness":12658,"money_24h":205500},"SpaceAgeAsteroidBelt":{"happiness":23560,"population":13750,"demandHappiness":13750,"money_24h":227600},"SpaceAgeVenus":{"happiness":25450,"population":14861,"demandHappiness":14861,"money_24h":250900},"SpaceAgeJupiterMoon":{"happiness":27420,"population":16004,"demandHappiness":16004,"money_24h":275300},"SpaceAgeTitan":{"happiness":29400,"population":17167,"demandHappiness":17167,"money_24h":301000},"SpaceAgeSpaceHub":{"happiness":31450,"population":18360,"demandHappiness":18360,"money_24h":327900}} },
+    "R_MultiAge_CulturalBuilding5a": { prod: {"BronzeAge":{"money_24h":100},"IronAge":{"money_24h":300},"EarlyMiddleAge":{"money_24h":400},"HighMiddleAge":{"money_24h":600},"LateMiddleAge":{"money_24h":800},"ColonialAge":{"money_24h":1200},"IndustrialAge":{"money_24h":1500},"ProgressiveEra":{"money_24h":1900},"ModernEra":{"money_24h":2300},"PostModernEra":{"money_24h":2900},"ContemporaryEra":{"money_24h":3800},"TomorrowEra":{"money_24h":4400},"FutureEra":{"money_24h":5100},"ArcticFuture":{"money_24h":5800},"OceanicFuture":{"money_24h":6500},"VirtualFuture":{"money_24h":7300},"SpaceAgeMars":{"money_24h":12200},"SpaceAgeAsteroidBelt":{"money_24h":13500},"SpaceAgeVenus":{"money_24h":14800},"SpaceAgeJupiterMoon":{"money_24h":16300},"SpaceAgeTitan":{"money_24h":17800},"SpaceAgeSpaceHub":{"money_24h":19400}} },
+    "R_MultiAge_CulturalBuilding5b": { prod: {"BronzeAge":{"money_24h":100},"IronAge":{"money_24h":300},"EarlyMiddleAge":{"money_24h":500},"HighMiddleAge":{"money_24h":800},"LateMiddleAge":{"money_24h":1000},"ColonialAge":{"money_24h":1500},"IndustrialAge":{"money_24h":1900},"ProgressiveEra":{"money_24h":2300},"ModernEra":{"money_24h":2900},"PostModernEra":{"money_24h":3600},"ContemporaryEra":{"money_24h":4700},"TomorrowEra":{"money_24h":5400},"FutureEra":{"money_24h":6200},"ArcticFuture":{"money_24h":7100},"OceanicFuture":{"money_24h":8000},"VirtualFuture":{"money_24h":8900},"SpaceAgeMars":{"money_24h":14900},"SpaceAgeAsteroidBelt":{"money_24h":16500},"SpaceAgeVenus":{"money_24h":18200},"SpaceAgeJupiterMoon":{"money_24h":20000},"SpaceAgeTitan":{"money_24h":21900},"SpaceAgeSpaceHub":{"money_24h":23800}} },
+    "R_MultiAge_CulturalBuilding5c": { prod: {"BronzeAge":{"money_24h":200},"IronAge":{"money_24h":400},"EarlyMiddleAge":{"money_24h":600},"HighMiddleAge":{"money_24h":900},"LateMiddleAge":{"money_24h":1200},"ColonialAge":{"money_24h":1800},"IndustrialAge":{"money_24h":2300},"ProgressiveEra":{"money_24h":2700},"ModernEra":{"money_24h":3400},"PostModernEra":{"money_24h":4300},"ContemporaryEra":{"money_24h":5600},"TomorrowEra":{"money_24h":6400},"FutureEra":{"money_24h":7400},"ArcticFuture":{"money_24h":8400},"OceanicFuture":{"money_24h":9500},"VirtualFuture":{"money_24h":10600},"SpaceAgeMars":{"money_24h":17700},"SpaceAgeAsteroidBelt":{"money_24h":19600},"SpaceAgeVenus":{"money_24h":21600},"SpaceAgeJupiterMoon":{"money_24h":23700},"SpaceAgeTitan":{"money_24h":25900},"SpaceAgeSpaceHub":{"money_24h":28200}} },
+    "R_MultiAge_CulturalBuilding5d": { prod: {"BronzeAge":{"money_24h":200},"IronAge":{"money_24h":400},"EarlyMiddleAge":{"money_24h":700},"HighMiddleAge":{"money_24h":1000},"LateMiddleAge":{"money_24h":1400},"ColonialAge":{"money_24h":2100},"IndustrialAge":{"money_24h":2600},"ProgressiveEra":{"money_24h":3200},"ModernEra":{"money_24h":3900},"PostModernEra":{"money_24h":4900},"ContemporaryEra":{"money_24h":6400},"TomorrowEra":{"money_24h":7400},"FutureEra":{"money_24h":8500},"ArcticFuture":{"money_24h":9700},"OceanicFuture":{"money_24h":10900},"VirtualFuture":{"money_24h":12200},"SpaceAgeMars":{"money_24h":20400},"SpaceAgeAsteroidBelt":{"money_24h":22600},"SpaceAgeVenus":{"money_24h":25000},"SpaceAgeJupiterMoon":{"money_24h":27400},"SpaceAgeTitan":{"money_24h":29900},"SpaceAgeSpaceHub":{"money_24h":32600}} },
+    "A_MultiAge_HalloweenBonus3": { prod: {"BronzeAge":{"happiness":790},"IronAge":{"happiness":960},"EarlyMiddleAge":{"happiness":1320},"HighMiddleAge":{"happiness":1470},"LateMiddleAge":{"happiness":1640},"ColonialAge":{"happiness":1930},"IndustrialAge":{"happiness":2180},"ProgressiveEra":{"happiness":2390},"ModernEra":{"happiness":2560},"PostModernEra":{"happiness":2670},"ContemporaryEra":{"happiness":3100},"TomorrowEra":{"happiness":3760},"FutureEra":{"happiness":4510},"ArcticFuture":{"happiness":5250},"OceanicFuture":{"happiness":6050},"VirtualFuture":{"happiness":7230},"SpaceAgeMars":{"happiness":11570},"SpaceAgeAsteroidBelt":{"happiness":12580},"SpaceAgeVenus":{"happiness":13590},"SpaceAgeJupiterMoon":{"happiness":14640},"SpaceAgeTitan":{"happiness":15700},"SpaceAgeSpaceHub":{"happiness":16790}} },
+    "R_MultiAge_FallBonus18": { prod: {"BronzeAge":{"population":14,"demandHappiness":14,"money_24h":200},"IronAge":{"population":29,"demandHappiness":29,"money_24h":500},"EarlyMiddleAge":{"population":45,"demandHappiness":45,"money_24h":800},"HighMiddleAge":{"population":63,"demandHappiness":63,"money_24h":1100},"LateMiddleAge":{"population":82,"demandHappiness":82,"money_24h":1400},"ColonialAge":{"population":104,"demandHappiness":104,"money_24h":2100},"IndustrialAge":{"population":127,"demandHappiness":127,"money_24h":2700},"ProgressiveEra":{"population":151,"demandHappiness":151,"money_24h":3200},"ModernEra":{"population":177,"demandHappiness":177,"money_24h":4000},"PostModernEra":{"population":204,"demandHappiness":204,"money_24h":5100},"ContemporaryEra":{"population":233,"demandHappiness":233,"money_24h":6600},"TomorrowEra":{"population":262,"demandHappiness":262,"money_24h":7600},"FutureEra":{"population":293,"demandHappiness":293,"money_24h":8800},"ArcticFuture":{"population":325,"demandHappiness":325,"money_24h":10000},"OceanicFuture":{"population":358,"demandHappiness":358,"money_24h":11200},"VirtualFuture":{"population":392,"demandHappiness":392,"money_24h":12600},"SpaceAgeMars":{"population":621,"demandHappiness":621,"money_24h":21000},"SpaceAgeAsteroidBelt":{"population":674,"demandHappiness":674,"money_24h":23300},"SpaceAgeVenus":{"population":729,"demandHappiness":729,"money_24h":25600},"SpaceAgeJupiterMoon":{"population":785,"demandHappiness":785,"money_24h":28100},"SpaceAgeTitan":{"population":842,"demandHappiness":842,"money_24h":30800},"SpaceAgeSpaceHub":{"population":900,"demandHappiness":900,"money_24h":33500}} },
+    "R_MultiAge_FallBonus18a": { prod: {"BronzeAge":{"money_24h":400},"IronAge":{"population":13,"demandHappiness":13,"money_24h":900},"EarlyMiddleAge":{"population":20,"demandHappiness":20,"money_24h":1400},"HighMiddleAge":{"population":28,"demandHappiness":28,"money_24h":2000},"LateMiddleAge":{"population":37,"demandHappiness":37,"money_24h":2700},"ColonialAge":{"population":47,"demandHappiness":47,"money_24h":4100},"IndustrialAge":{"population":57,"demandHappiness":57,"money_24h":5100},"ProgressiveEra":{"population":68,"demandHappiness":68,"money_24h":6100},"ModernEra":{"population":80,"demandHappiness":80,"money_24h":7600},"PostModernEra":{"population":92,"demandHappiness":92,"money_24h":9600},"ContemporaryEra":{"population":105,"demandHappiness":105,"money_24h":12500},"TomorrowEra":{"population":118,"demandHappiness":118,"money_24h":14500},"FutureEra":{"population":132,"demandHappiness":132,"money_24h":16600},"ArcticFuture":{"population":146,"demandHappiness":146,"money_24h":18900},"OceanicFuture":{"population":161,"demandHappiness":161,"money_24h":21300},"VirtualFuture":{"population":176,"demandHappiness":176,"money_24h":23800},"SpaceAgeMars":{"population":279,"demandHappiness":279,"money_24h":39800},"SpaceAgeAsteroidBelt":{"population":303,"demandHappiness":303,"money_24h":44100},"SpaceAgeVenus":{"population":328,"demandHappiness":328,"money_24h":48600},"SpaceAgeJupiterMoon":{"population":353,"demandHappiness":353,"money_24h":53300},"SpaceAgeTitan":{"population":379,"demandHappiness":379,"money_24h":58300},"SpaceAgeSpaceHub":{"population":405,"demandHappiness":405,"money_24h":63500}} },
+    "R_MultiAge_FallBonus18b": { prod: {"BronzeAge":{"population":9,"demandHappiness":9,"money_24h":400},"IronAge":{"population":20,"demandHappiness":20,"money_24h":900},"EarlyMiddleAge":{"population":30,"demandHappiness":30,"money_24h":1500},"HighMiddleAge":{"population":42,"demandHappiness":42,"money_24h":2100},"LateMiddleAge":{"population":55,"demandHappiness":55,"money_24h":2800},"ColonialAge":{"population":70,"demandHappiness":70,"money_24h":4300},"IndustrialAge":{"population":85,"demandHappiness":85,"money_24h":5400},"ProgressiveEra":{"population":102,"demandHappiness":102,"money_24h":6500},"ModernEra":{"population":119,"demandHappiness":119,"money_24h":8100},"PostModernEra":{"population":138,"demandHappiness":138,"money_24h":10200},"ContemporaryEra":{"population":157,"demandHappiness":157,"money_24h":13300},"TomorrowEra":{"population":177,"demandHappiness":177,"money_24h":15400},"FutureEra":{"population":198,"demandHappiness":198,"money_24h":17600},"ArcticFuture":{"population":219,"demandHappiness":219,"money_24h":20000},"OceanicFuture":{"population":242,"demandHappiness":242,"money_24h":22600},"VirtualFuture":{"population":265,"demandHappiness":265,"money_24h":25300},"SpaceAgeMars":{"population":419,"demandHappiness":419,"money_24h":42300},"SpaceAgeAsteroidBelt":{"population":455,"demandHappiness":455,"money_24h":46800},"SpaceAgeVenus":{"population":492,"demandHappiness":492,"money_24h":51600},"SpaceAgeJupiterMoon":{"population":530,"demandHappiness":530,"money_24h":56600},"SpaceAgeTitan":{"population":568,"demandHappiness":568,"money_24h":61900},"SpaceAgeSpaceHub":{"population":608,"demandHappiness":608,"money_24h":67400}} },
+    "R_MultiAge_FallBonus18c": { prod: {"BronzeAge":{"population":15,"demandHappiness":15,"money_24h":400},"IronAge":{"population":33,"demandHappiness":33,"money_24h":1000},"EarlyMiddleAge":{"population":50,"demandHappiness":50,"money_24h":1600},"HighMiddleAge":{"population":70,"demandHappiness":70,"money_24h":2300},"LateMiddleAge":{"population":92,"demandHappiness":92,"money_24h":3000},"ColonialAge":{"population":116,"demandHappiness":116,"money_24h":4600},"IndustrialAge":{"population":142,"demandHappiness":142,"money_24h":5700},"ProgressiveEra":{"population":170,"demandHappiness":170,"money_24h":6900},"ModernEra":{"population":199,"demandHappiness":199,"money_24h":8600},"PostModernEra":{"population":230,"demandHappiness":230,"money_24h":10800},"ContemporaryEra":{"population":262,"demandHappiness":262,"money_24h":14100},"TomorrowEra":{"population":295,"demandHappiness":295,"money_24h":16300},"FutureEra":{"population":330,"demandHappiness":330,"money_24h":18700},"ArcticFuture":{"population":366,"demandHappiness":366,"money_24h":21200},"OceanicFuture":{"population":403,"demandHappiness":403,"money_24h":23900},"VirtualFuture":{"population":441,"demandHappiness":441,"money_24h":26800},"SpaceAgeMars":{"population":698,"demandHappiness":698,"money_24h":44700},"SpaceAgeAsteroidBelt":{"population":758,"demandHappiness":758,"money_24h":49600},"SpaceAgeVenus":{"population":820,"demandHappiness":820,"money_24h":54600},"SpaceAgeJupiterMoon":{"population":883,"demandHappiness":883,"money_24h":60000},"SpaceAgeTitan":{"population":947,"demandHappiness":947,"money_24h":65600},"SpaceAgeSpaceHub":{"population":1013,"demandHappiness":1013,"money_24h":71400}} },
+    "R_MultiAge_FallBonus18d": { prod: {"BronzeAge":{"population":24,"demandHappiness":24,"money_24h":400},"IronAge":{"population":52,"demandHappiness":52,"money_24h":1000},"EarlyMiddleAge":{"population":80,"demandHappiness":80,"money_24h":1700},"HighMiddleAge":{"population":113,"demandHappiness":113,"money_24h":2400},"LateMiddleAge":{"population":148,"demandHappiness":148,"money_24h":3200},"ColonialAge":{"population":186,"demandHappiness":186,"money_24h":4800},"IndustrialAge":{"population":228,"demandHappiness":228,"money_24h":6000},"ProgressiveEra":{"population":272,"demandHappiness":272,"money_24h":7300},"ModernEra":{"population":319,"demandHappiness":319,"money_24h":9100},"PostModernEra":{"population":367,"demandHappiness":367,"money_24h":11400},"ContemporaryEra":{"population":419,"demandHappiness":419,"money_24h":14800},"TomorrowEra":{"population":472,"demandHappiness":472,"money_24h":17200},"FutureEra":{"population":527,"demandHappiness":527,"money_24h":19700},"ArcticFuture":{"population":585,"demandHappiness":585,"money_24h":22400},"OceanicFuture":{"population":644,"demandHappiness":644,"money_24h":25200},"VirtualFuture":{"population":706,"demandHappiness":706,"money_24h":28300},"SpaceAgeMars":{"population":1117,"demandHappiness":1117,"money_24h":47200},"SpaceAgeAsteroidBelt":{"population":1213,"demandHappiness":1213,"money_24h":52300},"SpaceAgeVenus":{"population":1311,"demandHappiness":1311,"money_24h":57700},"SpaceAgeJupiterMoon":{"population":1412,"demandHappiness":1412,"money_24h":63300},"SpaceAgeTitan":{"population":1515,"demandHappiness":1515,"money_24h":69200},"SpaceAgeSpaceHub":{"population":1620,"demandHappiness":1620,"money_24h":75400}} },
+    "R_MultiAge_FallBonus18e": { prod: {"BronzeAge":{"population":30,"demandHappiness":30,"money_24h":500},"IronAge":{"population":65,"demandHappiness":65,"money_24h":1100},"EarlyMiddleAge":{"population":100,"demandHappiness":100,"money_24h":1800},"HighMiddleAge":{"population":141,"demandHappiness":141,"money_24h":2500},"LateMiddleAge":{"population":185,"demandHappiness":185,"money_24h":3300},"ColonialAge":{"population":233,"demandHappiness":233,"money_24h":5100},"IndustrialAge":{"population":285,"demandHappiness":285,"money_24h":6300},"ProgressiveEra":{"population":340,"demandHappiness":340,"money_24h":7700},"ModernEra":{"population":398,"demandHappiness":398,"money_24h":9500},"PostModernEra":{"population":459,"demandHappiness":459,"money_24h":12000},"ContemporaryEra":{"population":523,"demandHappiness":523,"money_24h":15600},"TomorrowEra":{"population":590,"demandHappiness":590,"money_24h":18100},"FutureEra":{"population":659,"demandHappiness":659,"money_24h":20700},"ArcticFuture":{"population":731,"demandHappiness":731,"money_24h":23600},"OceanicFuture":{"population":806,"demandHappiness":806,"money_24h":26600},"VirtualFuture":{"population":882,"demandHappiness":882,"money_24h":29800},"SpaceAgeMars":{"population":1396,"demandHappiness":1396,"money_24h":49700},"SpaceAgeAsteroidBelt":{"population":1517,"demandHappiness":1517,"money_24h":55100},"SpaceAgeVenus":{"population":1639,"demandHappiness":1639,"money_24h":60700},"SpaceAgeJupiterMoon":{"population":1765,"demandHappiness":1765,"money_24h":66600},"SpaceAgeTitan":{"population":1893,"demandHappiness":1893,"money_24h":72800},"SpaceAgeSpaceHub":{"population":2025,"demandHappiness":2025,"money_24h":79300}} },
+    "R_MultiAge_FallBonus18f": { prod: {"BronzeAge":{"population":36,"demandHappiness":36,"money_24h":500},"IronAge":{"population":78,"demandHappiness":78,"money_24h":1100},"EarlyMiddleAge":{"population":120,"demandHappiness":120,"money_24h":1900},"HighMiddleAge":{"population":169,"demandHappiness":169,"money_24h":2700},"LateMiddleAge":{"population":221,"demandHappiness":221,"money_24h":3500},"ColonialAge":{"population":279,"demandHappiness":279,"money_24h":5300},"IndustrialAge":{"population":342,"demandHappiness":342,"money_24h":6600},"ProgressiveEra":{"population":408,"demandHappiness":408,"money_24h":8100},"ModernEra":{"population":478,"demandHappiness":478,"money_24h":10000},"PostModernEra":{"population":551,"demandHappiness":551,"money_24h":12600},"ContemporaryEra":{"population":628,"demandHappiness":628,"money_24h":16400},"TomorrowEra":{"population":707,"demandHappiness":707,"money_24h":19000},"FutureEra":{"population":791,"demandHappiness":791,"money_24h":21800},"ArcticFuture":{"population":878,"demandHappiness":878,"money_24h":24700},"OceanicFuture":{"population":967,"demandHappiness":967,"money_24h":27900},"VirtualFuture":{"population":1058,"demandHappiness":1058,"money_24h":31300},"SpaceAgeMars":{"population":1675,"demandHappiness":1675,"money_24h":52200},"SpaceAgeAsteroidBelt":{"population":1820,"demandHappiness":1820,"money_24h":57800},"SpaceAgeVenus":{"population":1967,"demandHappiness":1967,"money_24h":63700},"SpaceAgeJupiterMoon":{"population":2118,"demandHappiness":2118,"money_24h":69900},"SpaceAgeTitan":{"population":2272,"demandHappiness":2272,"money_24h":76500},"SpaceAgeSpaceHub":{"population":2430,"demandHappiness":2430,"money_24h":83300}} },
+    "R_MultiAge_FallBonus18gsunflower": { prod: {"BronzeAge":{"population":43,"demandHappiness":43,"money_24h":500},"IronAge":{"population":91,"demandHappiness":91,"money_24h":1200},"EarlyMiddleAge":{"population":140,"demandHappiness":140,"money_24h":2000},"HighMiddleAge":{"population":197,"demandHappiness":197,"money_24h":2800},"LateMiddleAge":{"population":258,"demandHappiness":258,"money_24h":3700},"ColonialAge":{"population":326,"demandHappiness":326,"money_24h":5600},"IndustrialAge":{"population":398,"demandHappiness":398,"money_24h":7000},"ProgressiveEra":{"population":476,"demandHappiness":476,"money_24h":8400},"ModernEra":{"population":558,"demandHappiness":558,"money_24h":10500},"PostModernEra":{"population":643,"demandHappiness":643,"money_24h":13200},"ContemporaryEra":{"population":732,"demandHappiness":732,"money_24h":17200},"TomorrowEra":{"population":825,"demandHappiness":825,"money_24h":19900},"FutureEra":{"population":923,"demandHappiness":923,"money_24h":22800},"ArcticFuture":{"population":1024,"demandHappiness":1024,"money_24h":25900},"OceanicFuture":{"population":1128,"demandHappiness":1128,"money_24h":29200},"VirtualFuture":{"population":1235,"demandHappiness":1235,"money_24h":32700},"SpaceAgeMars":{"population":1955,"demandHappiness":1955,"money_24h":54700},"SpaceAgeAsteroidBelt":{"population":2123,"demandHappiness":2123,"money_24h":60600},"SpaceAgeVenus":{"population":2295,"demandHappiness":2295,"money_24h":66800},"SpaceAgeJupiterMoon":{"population":2471,"demandHappiness":2471,"money_24h":73300},"SpaceAgeTitan":{"population":2651,"demandHappiness":2651,"money_24h":80100},"SpaceAgeSpaceHub":{"population":2835,"demandHappiness":2835,"money_24h":87300}} },
+    "R_MultiAge_FallBonus18gcolorful": { prod: {"BronzeAge":{"population":43,"demandHappiness":43,"money_24h":600},"IronAge":{"population":91,"demandHappiness":91,"money_24h":1500},"EarlyMiddleAge":{"population":140,"demandHappiness":140,"money_24h":2500},"HighMiddleAge":{"population":197,"demandHappiness":197,"money_24h":3500},"LateMiddleAge":{"population":258,"demandHappiness":258,"money_24h":4700},"ColonialAge":{"population":326,"demandHappiness":326,"money_24h":7100},"IndustrialAge":{"population":398,"demandHappiness":398,"money_24h":8900},"ProgressiveEra":{"population":476,"demandHappiness":476,"money_24h":10700},"ModernEra":{"population":558,"demandHappiness":558,"money_24h":13400},"PostModernEra":{"population":643,"demandHappiness":643,"money_24h":16800},"ContemporaryEra":{"population":732,"demandHappiness":732,"money_24h":21900},"TomorrowEra":{"population":825,"demandHappiness":825,"money_24h":25300},"FutureEra":{"population":923,"demandHappiness":923,"money_24h":29000},"ArcticFuture":{"population":1024,"demandHappiness":1024,"money_24h":33000},"OceanicFuture":{"population":1128,"demandHappiness":1128,"money_24h":37200},"VirtualFuture":{"population":1235,"demandHappiness":1235,"money_24h":41700},"SpaceAgeMars":{"population":1955,"demandHappiness":1955,"money_24h":69600},"SpaceAgeAsteroidBelt":{"population":2123,"demandHappiness":2123,"money_24h":77100},"SpaceAgeVenus":{"population":2295,"demandHappiness":2295,"money_24h":85000},"SpaceAgeJupiterMoon":{"population":2471,"demandHappiness":2471,"money_24h":93300},"SpaceAgeTitan":{"population":2651,"demandHappiness":2651,"money_24h":102000},"SpaceAgeSpaceHub":{"population":2835,"demandHappiness":2835,"money_24h":111100}} },
+    "A_MultiAge_FallBonus18": { prod: {"BronzeAge":{"happiness":420},"IronAge":{"happiness":720},"EarlyMiddleAge":{"happiness":820},"HighMiddleAge":{"happiness":920},"LateMiddleAge":{"happiness":1030},"ColonialAge":{"happiness":1210},"IndustrialAge":{"happiness":1360},"ProgressiveEra":{"happiness":1490},"ModernEra":{"happiness":1650},"PostModernEra":{"happiness":1720},"ContemporaryEra":{"happiness":1990},"TomorrowEra":{"happiness":2420},"FutureEra":{"happiness":2900},"ArcticFuture":{"happiness":3380},"OceanicFuture":{"happiness":3900},"VirtualFuture":{"happiness":4660},"SpaceAgeMars":{"happiness":7450},"SpaceAgeAsteroidBelt":{"happiness":8100},"SpaceAgeVenus":{"happiness":8750},"SpaceAgeJupiterMoon":{"happiness":9420},"SpaceAgeTitan":{"happiness":10110},"SpaceAgeSpaceHub":{"happiness":10810}} },
+    "R_MultiAge_FallBonus18gaqueous": { prod: {"BronzeAge":{"population":43,"demandHappiness":43,"money_24h":500},"IronAge":{"population":91,"demandHappiness":91,"money_24h":1200},"EarlyMiddleAge":{"population":140,"demandHappiness":140,"money_24h":2000},"HighMiddleAge":{"population":197,"demandHappiness":197,"money_24h":2800},"LateMiddleAge":{"population":258,"demandHappiness":258,"money_24h":3700},"ColonialAge":{"population":326,"demandHappiness":326,"money_24h":5600},"IndustrialAge":{"population":398,"demandHappiness":398,"money_24h":7000},"ProgressiveEra":{"population":476,"demandHappiness":476,"money_24h":8400},"ModernEra":{"population":558,"demandHappiness":558,"money_24h":10500},"PostModernEra":{"population":643,"demandHappiness":643,"money_24h":13200},"ContemporaryEra":{"population":732,"demandHappiness":732,"money_24h":17200},"TomorrowEra":{"population":825,"demandHappiness":825,"money_24h":19900},"FutureEra":{"population":923,"demandHappiness":923,"money_24h":22800},"ArcticFuture":{"population":1024,"demandHappiness":1024,"money_24h":25900},"OceanicFuture":{"population":1128,"demandHappiness":1128,"money_24h":29200},"VirtualFuture":{"population":1235,"demandHappiness":1235,"money_24h":32700},"SpaceAgeMars":{"population":1955,"demandHappiness":1955,"money_24h":54700},"SpaceAgeAsteroidBelt":{"population":2123,"demandHappiness":2123,"money_24h":60600},"SpaceAgeVenus":{"population":2295,"demandHappiness":2295,"money_24h":66800},"SpaceAgeJupiterMoon":{"population":2471,"demandHappiness":2471,"money_24h":73300},"SpaceAgeTitan":{"population":2651,"demandHappiness":2651,"money_24h":80100},"SpaceAgeSpaceHub":{"population":2835,"demandHappiness":2835,"money_24h":87300}} },
+};
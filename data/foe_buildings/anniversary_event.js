@@ -0,0 +1,57 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 53 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_ANNI25E1": { prod: {"AllAge":{"random_special_good_up_to_age_24h":120},"BronzeAge":{"population":1440,"happiness":5950,"demandHappiness":1440},"IronAge":{"population":3100,"happiness":10260,"demandHappiness":3100},"EarlyMiddleAge":{"population":4750,"happiness":11340,"demandHappiness":4750},"HighMiddleAge":{"population":6680,"happiness":12650,"demandHappiness":6680},"LateMiddleAge":{"population":8760,"happiness":14110,"demandHappiness":8760},"ColonialAge":{"population":11060,"happiness":16590,"demandHappiness":11060},"IndustrialAge":{"population":13520,"happiness":18710,"demandHappiness":13520},"ProgressiveEra":{"population":16130,"happiness":20550,"demandHappiness":16130},"ModernEra":{"population":18910,"happiness":21990,"demandHappiness":18910},"PostModernEra":{"population":21800,"happiness":22910,"demandHappiness":21800},"ContemporaryEra":{"population":24840,"happiness":26620,"demandHappiness":24840},"TomorrowEra":{"population":27990,"happiness":32310,"demandHappiness":27990},"FutureEra":{"population":31310,"happiness":38710,"demandHappiness":31310},"ArcticFuture":{"population":34720,"happiness":45080,"demandHappiness":34720},"OceanicFuture":{"population":38250,"happiness":52020,"demandHappiness":38250},"VirtualFuture":{"population":41880,"happiness":62150,"demandHappiness":41880},"SpaceAgeMars":{"population":66300,"happiness":99450,"demandHappiness":66300},"SpaceAgeAsteroidBelt":{"population":72010,"happiness":108070,"demandHappiness":72010},"SpaceAgeVenus":{"population":77840,"happiness":116760,"demandHappiness":77840},"SpaceAgeJupiterMoon":{"population":83820,"happiness":125770,"demandHappiness":83820},"SpaceAgeTitan":{"population":89910,"happiness":134890,"demandHappiness":89910},"SpaceAgeSpaceHub":{"population":96000,"happiness":144000,"demandHappiness":96000}}, boosts: [{"type":"att_def_boost_attacker_defender","value":96,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":144,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":5,"feature":"guild_raids"}] },
+    "W_MultiAge_ANNI25D1": { prod: {"AllAge":{"all_goods_of_previous_age_24h":150}}, boosts: [{"type":"att_def_boost_attacker_defender","value":300,"feature":"guild_expedition"},{"type":"att_def_boost_attacker_defender","value":25,"feature":"guild_raids"}] },
+    "W_MultiAge_ANNI25A12": { prod: {"BronzeAge":{"population":980,"happiness":4030,"demandHappiness":980,"medals_24h":890,"all_goods_of_age_24h":195.0},"IronAge":{"population":2100,"happiness":6940,"demandHappiness":2100,"medals_24h":1140,"all_goods_of_age_24h":195.0},"EarlyMiddleAge":{"population":3220,"happiness":7680,"demandHappiness":3220,"medals_24h":1400,"all_goods_of_age_24h":195.0},"HighMiddleAge":{"population":4520,"happiness":8570,"demandHappiness":4520,"medals_24h":1650,"all_goods_of_age_24h":195.0},"LateMiddleAge":{"population":5930,"happiness":9560,"demandHappiness":5930,"medals_24h":1900,"all_goods_of_age_24h":195.0},"ColonialAge":{"population":7490,"happiness":11240,"demandHappiness":7490,"medals_24h":2290,"all_goods_of_age_24h":195.0},"IndustrialAge":{"population":9150,"happiness":12670,"demandHappiness":9150,"medals_24h":3170,"all_goods_of_age_24h":195.0},"ProgressiveEra":{"population":10920,"happiness":13910,"demandHappiness":10920,"medals_24h":4440,"all_goods_of_age_24h":195.0},"ModernEra":{"population":12800,"happiness":14890,"demandHappiness":12800,"medals_24h":6350,"all_goods_of_age_24h":195.0},"PostModernEra":{"population":14760,"happiness":15510,"demandHappiness":14760,"medals_24h":8890,"all_goods_of_age_24h":195.0},"ContemporaryEra":{"population":16820,"happiness":18020,"demandHappiness":16820,"medals_24h":12700,"all_goods_of_age_24h":195.0},"TomorrowEra":{"population":18950,"happiness":21880,"demandHappiness":18950,"medals_24h":17140,"all_goods_of_age_24h":195.0},"FutureEra":{"population":21200,"happiness":26210,"demandHappiness":21200,"medals_24h":20950,"all_goods_of_age_24h":195.0},"ArcticFuture":{"population":23510,"happiness":30520,"demandHappiness":23510,"medals_24h":25390,"all_goods_of_age_24h":195.0},"OceanicFuture":{"population":25900,"happiness":35220,"demandHappiness":25900,"medals_24h":29200,"all_goods_of_age_24h":195.0},"VirtualFuture":{"population":28360,"happiness":42080,"demandHappiness":28360,"medals_24h":35550,"all_goods_of_age_24h":195.0},"SpaceAgeMars":{"population":44890,"happiness":67330,"demandHappiness":44890,"medals_24h":43160,"all_goods_of_age_24h":195.0},"SpaceAgeAsteroidBelt":{"population":48760,"happiness":73170,"demandHappiness":48760,"medals_24h":50780,"all_goods_of_age_24h":195.0},"SpaceAgeVenus":{"population":52700,"happiness":79050,"demandHappiness":52700,"medals_24h":58400,"all_goods_of_age_24h":195.0},"SpaceAgeJupiterMoon":{"population":56750,"happiness":85160,"demandHappiness":56750,"medals_24h":66020,"all_goods_of_age_24h":195.0},"SpaceAgeTitan":{"population":60880,"happiness":91330,"demandHappiness":60880,"medals_24h":73630,"all_goods_of_age_24h":195.0},"SpaceAgeSpaceHub":{"population":65000,"happiness":97500,"demandHappiness":65000,"medals_24h":81250,"all_goods_of_age_24h":195.0}}, boosts: [{"type":"att_boost_attacker","value":88,"feature":"all"},{"type":"att_def_boost_attacker","value":174,"feature":"guild_expedition"}] },
+    "W_MultiAge_ANNI25B2": { prod: {"BronzeAge":{"population":-180,"happiness":740,"money_24h":1370,"supplies_24h":1680,"all_goods_of_previous_age_24h":90},"IronAge":{"population":-390,"happiness":1280,"money_24h":3280,"supplies_24h":4030,"all_goods_of_previous_age_24h":90},"EarlyMiddleAge":{"population":-590,"happiness":1420,"money_24h":5470,"supplies_24h":6720,"all_goods_of_previous_age_24h":90},"HighMiddleAge":{"population":-830,"happiness":1580,"money_24h":7650,"supplies_24h":9410,"all_goods_of_previous_age_24h":90},"LateMiddleAge":{"population":-1100,"happiness":1760,"money_24h":10110,"supplies_24h":12440,"all_goods_of_previous_age_24h":90},"ColonialAge":{"population":-1380,"happiness":2070,"money_24h":15400,"supplies_24h":15800,"all_goods_of_previous_age_24h":90},"IndustrialAge":{"population":-1690,"happiness":2340,"money_24h":19180,"supplies_24h":19160,"all_goods_of_previous_age_24h":90},"ProgressiveEra":{"population":-2020,"happiness":2570,"money_24h":23280,"supplies_24h":22520,"all_goods_of_previous_age_24h":90},"ModernEra":{"population":-2360,"happiness":2750,"money_24h":28970,"supplies_24h":26220,"all_goods_of_previous_age_24h":90},"PostModernEra":{"population":-2720,"happiness":2860,"money_24h":36440,"supplies_24h":29920,"all_goods_of_previous_age_24h":90},"ContemporaryEra":{"population":-3110,"happiness":3330,"money_24h":47440,"supplies_24h":33610,"all_goods_of_previous_age_24h":90},"TomorrowEra":{"population":-3500,"happiness":4040,"money_24h":54930,"supplies_24h":37650,"all_goods_of_previous_age_24h":90},"FutureEra":{"population":-3910,"happiness":4840,"money_24h":62960,"supplies_24h":41340,"all_goods_of_previous_age_24h":90},"ArcticFuture":{"population":-4340,"happiness":5640,"money_24h":71540,"supplies_24h":45380,"all_goods_of_previous_age_24h":90},"OceanicFuture":{"population":-4780,"happiness":6500,"money_24h":80670,"supplies_24h":49750,"all_goods_of_previous_age_24h":90},"VirtualFuture":{"population":-5240,"happiness":7770,"money_24h":90360,"supplies_24h":53780,"all_goods_of_previous_age_24h":90},"SpaceAgeMars":{"population":-8290,"happiness":12430,"money_24h":150930,"supplies_24h":87060,"all_goods_of_previous_age_24h":90},"SpaceAgeAsteroidBelt":{"population":-9000,"happiness":13510,"money_24h":167170,"supplies_24h":93450,"all_goods_of_previous_age_24h":90},"SpaceAgeVenus":{"population":-9730,"happiness":14590,"money_24h":184280,"supplies_24h":100170,"all_goods_of_previous_age_24h":90},"SpaceAgeJupiterMoon":{"population":-10480,"happiness":15720,"money_24h":202260,"supplies_24h":106550,"all_goods_of_previous_age_24h":90},"SpaceAgeTitan":{"population":-11240,"happiness":16860,"money_24h":221130,"supplies_24h":113280,"all_goods_of_previous_age_24h":90},"SpaceAgeSpaceHub":{"population":-12000,"happiness":18000,"money_24h":240000,"supplies_24h":120000,"all_goods_of_previous_age_24h":90}}, boosts: [{"type":"def_boost_attacker","value":78,"feature":"battleground"},{"type":"def_boost_attacker","value":78,"feature":"guild_expedition"},{"type":"guild_raids_coins_start","value":20000,"feature":"all"},{"type":"guild_raids_supplies_start","value":20000,"feature":"all"}] },
+    "W_MultiAge_ANNI25C2": { prod: {"BronzeAge":{"population":-1340,"medals_24h":100,"strategy_points_24h":46,"random_good_of_age_24h":46},"IronAge":{"population":-2870,"medals_24h":120,"strategy_points_24h":48,"random_good_of_age_24h":48},"EarlyMiddleAge":{"population":-4400,"medals_24h":150,"strategy_points_24h":50,"random_good_of_age_24h":50},"HighMiddleAge":{"population":-6180,"medals_24h":180,"strategy_points_24h":52,"random_good_of_age_24h":52},"LateMiddleAge":{"population":-8110,"medals_24h":210,"strategy_points_24h":54,"random_good_of_age_24h":54},"ColonialAge":{"population":-10240,"medals_24h":250,"strategy_points_24h":56,"random_good_of_age_24h":56},"IndustrialAge":{"population":-12510,"medals_24h":350,"strategy_points_24h":58,"random_good_of_age_24h":58},"ProgressiveEra":{"population":-14940,"medals_24h":490,"strategy_points_24h":60,"random_good_of_age_24h":60},"ModernEra":{"population":-17510,"medals_24h":690,"strategy_points_24h":62,"random_good_of_age_24h":62},"PostModernEra":{"population":-20180,"medals_24h":970,"strategy_points_24h":64,"random_good_of_age_24h":64},"ContemporaryEra":{"population":-23000,"medals_24h":1390,"strategy_points_24h":66,"random_good_of_age_24h":66},"TomorrowEra":{"population":-25920,"medals_24h":1870,"strategy_points_24h":68,"random_good_of_age_24h":68},"FutureEra":{"population":-28990,"medals_24h":2290,"strategy_points_24h":70,"random_good_of_age_24h":70},"ArcticFuture":{"population":-32150,"medals_24h":2780,"strategy_points_24h":72,"random_good_of_age_24h":72},"OceanicFuture":{"population":-35420,"medals_24h":3190,"strategy_points_24h":74,"random_good_of_age_24h":74},"VirtualFuture":{"population":-38780,"medals_24h":3890,"strategy_points_24h":76,"random_good_of_age_24h":76},"SpaceAgeMars":{"population":-61390,"medals_24h":4720,"strategy_points_24h":78,"random_good_of_age_24h":78},"SpaceAgeAsteroidBelt":{"population":-66680,"medals_24h":5560,"strategy_points_24h":80,"random_good_of_age_24h":80},"SpaceAgeVenus":{"population":-72070,"medals_24h":6390,"strategy_points_24h":82,"random_good_of_age_24h":82},"SpaceAgeJupiterMoon":{"population":-77610,"medals_24h":7220,"strategy_points_24h":84,"random_good_of_age_24h":84},"SpaceAgeTitan":{"population":-83250,"medals_24h":8050,"strategy_points_24h":86,"random_good_of_age_24h":86},"SpaceAgeSpaceHub":{"population":-88888,"medals_24h":8888,"strategy_points_24h":88,"random_good_of_age_24h":88}}, boosts: [{"type":"forge_points_production","value":1,"feature":"all"},{"type":"goods_production","value":1,"feature":"all"}] },
+    "W_MultiAge_ANNI25B1": { prod: {"BronzeAge":{"population":-180,"happiness":740,"money_24h":680,"supplies_24h":840,"all_goods_of_previous_age_24h":45},"IronAge":{"population":-390,"happiness":1280,"money_24h":1640,"supplies_24h":2020,"all_goods_of_previous_age_24h":45},"EarlyMiddleAge":{"population":-590,"happiness":1420,"money_24h":2730,"supplies_24h":3360,"all_goods_of_previous_age_24h":45},"HighMiddleAge":{"population":-830,"happiness":1580,"money_24h":3830,"supplies_24h":4710,"all_goods_of_previous_age_24h":45},"LateMiddleAge":{"population":-1100,"happiness":1760,"money_24h":5060,"supplies_24h":6220,"all_goods_of_previous_age_24h":45},"ColonialAge":{"population":-1380,"happiness":2070,"money_24h":7700,"supplies_24h":7900,"all_goods_of_previous_age_24h":45},"IndustrialAge":{"population":-1690,"happiness":2340,"money_24h":9590,"supplies_24h":9580,"all_goods_of_previous_age_24h":45},"ProgressiveEra":{"population":-2020,"happiness":2570,"money_24h":11640,"supplies_24h":11260,"all_goods_of_previous_age_24h":45},"ModernEra":{"population":-2360,"happiness":2750,"money_24h":14480,"supplies_24h":13110,"all_goods_of_previous_age_24h":45},"PostModernEra":{"population":-2720,"happiness":2860,"money_24h":18220,"supplies_24h":14960,"all_goods_of_previous_age_24h":45},"ContemporaryEra":{"population":-3110,"happiness":3330,"money_24h":23720,"supplies_24h":16810,"all_goods_of_previous_age_24h":45},"TomorrowEra":{"population":-3500,"happiness":4040,"money_24h":27460,"supplies_24h":18820,"all_goods_of_previous_age_24h":45},"FutureEra":{"population":-3910,"happiness":4840,"money_24h":31480,"supplies_24h":20670,"all_goods_of_previous_age_24h":45},"ArcticFuture":{"population":-4340,"happiness":5640,"money_24h":35770,"supplies_24h":22690,"all_goods_of_previous_age_24h":45},"OceanicFuture":{"population":-4780,"happiness":6500,"money_24h":40330,"supplies_24h":24870,"all_goods_of_previous_age_24h":45},"VirtualFuture":{"population":-5240,"happiness":7770,"money_24h":45180,"supplies_24h":26890,"all_goods_of_previous_age_24h":45},"SpaceAgeMars":{"population":-8290,"happiness":12430,"money_24h":75460,"supplies_24h":43530,"all_goods_of_previous_age_24h":45},"SpaceAgeAsteroidBelt":{"population":-9000,"happiness":13510,"money_24h":83590,"supplies_24h":46720,"all_goods_of_previous_age_24h":45},"SpaceAgeVenus":{"population":-9730,"happiness":14590,"money_24h":92140,"supplies_24h":50080,"all_goods_of_previous_age_24h":45},"SpaceAgeJupiterMoon":{"population":-10480,"happiness":15720,"money_24h":101130,"supplies_24h":53280,"all_goods_of_previous_age_24h":45},"SpaceAgeTitan":{"population":-11240,"happiness":16860,"money_24h":110570,"supplies_24h":56640,"all_goods_of_previous_age_24h":45},"SpaceAgeSpaceHub":{"population":-12000,"happiness":18000,"money_24h":120000,"supplies_24h":60000,"all_goods_of_previous_age_24h":45}}, boosts: [{"type":"def_boost_attacker","value":39,"feature":"battleground"},{"type":"def_boost_attacker","value":39,"feature":"guild_expedition"}] },
+    "W_MultiAge_ANNI23A11c": { prod: {"BronzeAge":{"medals_24h":63,"supplies_24h":1100,"strategy_points_24h":9,"random_good_of_age_24h":20},"IronAge":{"medals_24h":81,"supplies_24h":2500,"strategy_points_24h":9,"random_good_of_age_24h":20},"EarlyMiddleAge":{"medals_24h":99,"supplies_24h":4200,"strategy_points_24h":9,"random_good_of_age_24h":20},"HighMiddleAge":{"medals_24h":117,"supplies_24h":5900,"strategy_points_24h":9,"random_good_of_age_24h":20},"LateMiddleAge":{"medals_24h":135,"supplies_24h":7800,"strategy_points_24h":9,"random_good_of_age_24h":20},"ColonialAge":{"medals_24h":162,"supplies_24h":9900,"strategy_points_24h":9,"random_good_of_age_24h":20},"IndustrialAge":{"medals_24h":225,"supplies_24h":12000,"strategy_points_24h":9,"random_good_of_age_24h":20},"ProgressiveEra":{"medals_24h":315,"supplies_24h":14100,"strategy_points_24h":9,"random_good_of_age_24h":20},"ModernEra":{"medals_24h":450,"supplies_24h":16400,"strategy_points_24h":9,"random_good_of_age_24h":20},"PostModernEra":{"medals_24h":630,"supplies_24h":18700,"strategy_points_24h":9,"random_good_of_age_24h":20},"ContemporaryEra":{"medals_24h":900,"supplies_24h":21000,"strategy_points_24h":9,"random_good_of_age_24h":20},"TomorrowEra":{"medals_24h":1215,"supplies_24h":23500,"strategy_points_24h":9,"random_good_of_age_24h":20},"FutureEra":{"medals_24h":1485,"supplies_24h":25800,"strategy_points_24h":9,"random_good_of_age_24h":20},"ArcticFuture":{"medals_24h":1800,"supplies_24h":28400,"strategy_points_24h":10,"random_good_of_age_24h":21},"OceanicFuture":{"medals_24h":2070,"supplies_24h":31100,"strategy_points_24h":10,"random_good_of_age_24h":21},"VirtualFuture":{"medals_24h":2520,"supplies_24h":33600,"strategy_points_24h":10,"random_good_of_age_24h":21},"SpaceAgeMars":{"medals_24h":3060,"supplies_24h":54400,"strategy_points_24h":10,"random_good_of_age_24h":21},"SpaceAgeAsteroidBelt":{"medals_24h":3600,"supplies_24h":58400,"strategy_points_24h":10,"random_good_of_age_24h":21},"SpaceAgeVenus":{"medals_24h":4140,"supplies_24h":62600,"strategy_points_24h":10,"random_good_of_age_24h":21},"SpaceAgeJupiterMoon":{"medals_24h":4680,"supplies_24h":66600,"strategy_points_24h":11,"random_good_of_age_24h":22},"SpaceAgeTitan":{"medals_24h":5291,"supplies_24h":70856,"strategy_points_24h":11,"random_good_of_age_24h":22},"SpaceAgeSpaceHub":{"medals_24h":5902,"supplies_24h":75112,"strategy_points_24h":11,"random_good_of_age_24h":22}}, boosts: [{"type":"att_boost_attacker","value":25,"feature":"all"},{"type":"def_boost_attacker","value":18,"feature":"all"},{"type":"att_boost_defender","value":16,"feature":"all"},{"type":"def_boost_defender","value":17,"feature":"all"}] },
+    "W_MultiAge_ANNI23A11b": { prod: {"BronzeAge":{"medals_24h":63,"supplies_24h":1100,"money_24h":800,"strategy_points_24h":14,"random_good_of_age_24h":20},"IronAge":{"medals_24h":81,"supplies_24h":2500,"money_24h":1900,"strategy_points_24h":14,"random_good_of_age_24h":20},"EarlyMiddleAge":{"medals_24h":99,"supplies_24h":4200,"money_24h":3200,"strategy_points_24h":14,"random_good_of_age_24h":20},"HighMiddleAge":{"medals_24h":117,"supplies_24h":5900,"money_24h":4400,"strategy_points_24h":14,"random_good_of_age_24h":20},"LateMiddleAge":{"medals_24h":135,"supplies_24h":7800,"money_24h":5800,"strategy_points_24h":14,"random_good_of_age_24h":20},"ColonialAge":{"medals_24h":162,"supplies_24h":9900,"money_24h":8900,"strategy_points_24h":14,"random_good_of_age_24h":20},"IndustrialAge":{"medals_24h":225,"supplies_24h":12000,"money_24h":11100,"strategy_points_24h":14,"random_good_of_age_24h":20},"ProgressiveEra":{"medals_24h":315,"supplies_24h":14100,"money_24h":13400,"strategy_points_24h":14,"random_good_of_age_24h":20},"ModernEra":{"medals_24h":450,"supplies_24h":16400,"money_24h":16700,"strategy_points_24h":14,"random_good_of_age_24h":20},"PostModernEra":{"medals_24h":630,"supplies_24h":18700,"money_24h":21000,"strategy_points_24h":14,"random_good_of_age_24h":20},"ContemporaryEra":{"medals_24h":900,"supplies_24h":21000,"money_24h":27300,"strategy_points_24h":14,"random_good_of_age_24h":20},"TomorrowEra":{"medals_24h":1215,"supplies_24h":23500,"money_24h":31700,"strategy_points_24h":14,"random_good_of_age_24h":20},"FutureEra":{"medals_24h":1485,"supplies_24h":25800,"money_24h":36300,"strategy_points_24h":14,"random_good_of_age_24h":20},"ArcticFuture":{"medals_24h":1800,"supplies_24h":28400,"money_24h":41200,"strategy_points_24h":15,"random_good_of_age_24h":21},"OceanicFuture":{"medals_24h":2070,"supplies_24h":31100,"money_24h":46500,"strategy_points_24h":15,"random_good_of_age_24h":21},"VirtualFuture":{"medals_24h":2520,"supplies_24h":33600,"money_24h":52100,"strategy_points_24h":15,"random_good_of_age_24h":21},"SpaceAgeMars":{"medals_24h":3060,"supplies_24h":54400,"money_24h":87000,"strategy_points_24h":15,"random_good_of_age_24h":21},"SpaceAgeAsteroidBelt":{"medals_24h":3600,"supplies_24h":58400,"money_24h":96400,"strategy_points_24h":15,"random_good_of_age_24h":21},"SpaceAgeVenus":{"medals_24h":4140,"supplies_24h":62600,"money_24h":106200,"strategy_points_24h":15,"random_good_of_age_24h":21},"SpaceAgeJupiterMoon":{"medals_24h":4680,"supplies_24h":66600,"money_24h":116600,"strategy_points_24h":16,"random_good_of_age_24h":22},"SpaceAgeTitan":{"medals_24h":5291,"supplies_24h":70856,"money_24h":128019,"strategy_points_24h":16,"random_good_of_age_24h":22},"SpaceAgeSpaceHub":{"medals_24h":5902,"supplies_24h":75112,"money_24h":139438,"strategy_points_24h":16,"random_good_of_age_24h":22}}, boosts: [{"type":"att_boost_attacker","value":12,"feature":"all"},{"type":"coin_production","value":34,"feature":"all"}] },
+    "W_MultiAge_ANNI23A11a": { prod: {"BronzeAge":{"medals_24h":84,"supplies_24h":1600,"strategy_points_24h":9,"random_good_of_age_24h":27,"random_good_of_previous_age_24h":27},"IronAge":{"medals_24h":108,"supplies_24h":3800,"strategy_points_24h":9,"random_good_of_age_24h":27,"random_good_of_previous_age_24h":27},"EarlyMiddleAge":{"medals_24h":132,"supplies_24h":6300,"strategy_points_24h":9,"random_good_of_age_24h":27,"random_good_of_previous_age_24h":27},"HighMiddleAge":{"medals_24h":156,"supplies_24h":8800,"strategy_points_24h":9,"random_good_of_age_24h":27,"random_good_of_previous_age_24h":27},"LateMiddleAge":{"medals_24h":180,"supplies_24h":11700,"strategy_points_24h":9,"random_good_of_age_24h":27,"random_good_of_previous_age_24h":27},"ColonialAge":{"medals_24h":216,"supplies_24h":14800,"strategy_points_24h":9,"random_good_of_age_24h":27,"random_good_of_previous_age_24h":27},"IndustrialAge":{"medals_24h":300,"supplies_24h":18000,"strategy_points_24h":9,"random_good_of_age_24h":27,"random_good_of_previous_age_24h":27},"ProgressiveEra":{"medals_24h":420,"supplies_24h":21100,"strategy_points_24h":9,"random_good_of_age_24h":27,"random_good_of_previous_age_24h":27},"ModernEra":{"medals_24h":600,"supplies_24h":24600,"strategy_points_24h":9,"random_good_of_age_24h":27,"random_good_of_previous_age_24h":27},"PostModernEra":{"medals_24h":840,"supplies_24h":28000,"strategy_points_24h":9,"random_good_of_age_24h":27,"random_good_of_previous_age_24h":27},"ContemporaryEra":{"medals_24h":1200,"supplies_24h":31500,"strategy_points_24h":9,"random_good_of_age_24h":27,"random_good_of_previous_age_24h":27},"TomorrowEra":{"medals_24h":1620,"supplies_24h":35300,"strategy_points_24h":9,"random_good_of_age_24h":27,"random_good_of_previous_age_24h":27},"FutureEra":{"medals_24h":1980,"supplies_24h":38800,"strategy_points_24h":9,"random_good_of_age_24h":27,"random_good_of_previous_age_24h":27},"ArcticFuture":{"medals_24h":2400,"supplies_24h":42500,"strategy_points_24h":10,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":28},"OceanicFuture":{"medals_24h":2760,"supplies_24h":46600,"strategy_points_24h":10,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":28},"VirtualFuture":{"medals_24h":3360,"supplies_24h":50400,"strategy_points_24h":10,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":28},"SpaceAgeMars":{"medals_24h":4080,"supplies_24h":81600,"strategy_points_24h":10,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":28},"SpaceAgeAsteroidBelt":{"medals_24h":4800,"supplies_24h":87600,"strategy_points_24h":10,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":28},"SpaceAgeVenus":{"medals_24h":5520,"supplies_24h":93900,"strategy_points_24h":10,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":28},"SpaceAgeJupiterMoon":{"medals_24h":6240,"supplies_24h":99900,"strategy_points_24h":11,"random_good_of_age_24h":29,"random_good_of_previous_age_24h":29},"SpaceAgeTitan":{"medals_24h":7054,"supplies_24h":106284,"strategy_points_24h":11,"random_good_of_age_24h":29,"random_good_of_previous_age_24h":29},"SpaceAgeSpaceHub":{"medals_24h":7868,"supplies_24h":112668,"strategy_points_24h":11,"random_good_of_age_24h":29,"random_good_of_previous_age_24h":29}}, boosts: [{"type":"att_boost_attacker","value":12,"feature":"all"},{"type":"supply_production","value":40,"feature":"all"}] },
+    "W_MultiAge_ANNI23A1": { prod: {"BronzeAge":{"medals_24h":42},"IronAge":{"medals_24h":54},"EarlyMiddleAge":{"medals_24h":66},"HighMiddleAge":{"medals_24h":78},"LateMiddleAge":{"medals_24h":90},"ColonialAge":{"medals_24h":108},"IndustrialAge":{"medals_24h":150},"ProgressiveEra":{"medals_24h":210},"ModernEra":{"medals_24h":300},"PostModernEra":{"medals_24h":420},"ContemporaryEra":{"medals_24h":600},"TomorrowEra":{"medals_24h":810},"FutureEra":{"medals_24h":990},"ArcticFuture":{"medals_24h":1200},"OceanicFuture":{"medals_24h":1380},"VirtualFuture":{"medals_24h":1680},"SpaceAgeMars":{"medals_24h":2040},"SpaceAgeAsteroidBelt":{"medals_24h":2400},"SpaceAgeVenus":{"medals_24h":2760},"SpaceAgeJupiterMoon":{"medals_24h":3120},"SpaceAgeTitan":{"medals_24h":3527},"SpaceAgeSpaceHub":{"medals_24h":3934}} },
+    "W_MultiAge_ANNI23A10": { prod: {"BronzeAge":{"medals_24h":61,"supplies_24h":1000,"strategy_points_24h":9,"random_good_of_age_24h":20},"IronAge":{"medals_24h":79,"supplies_24h":2400,"strategy_points_24h":9,"random_good_of_age_24h":20},"EarlyMiddleAge":{"medals_24h":96,"supplies_24h":4000,"strategy_points_24h":9,"random_good_of_age_24h":20},"HighMiddleAge":{"medals_24h":114,"supplies_24h":5600,"strategy_points_24h":9,"random_good_of_age_24h":20},"LateMiddleAge":{"medals_24h":131,"supplies_24h":7400,"strategy_points_24h":9,"random_good_of_age_24h":20},"ColonialAge":{"medals_24h":157,"supplies_24h":9400,"strategy_points_24h":9,"random_good_of_age_24h":20},"IndustrialAge":{"medals_24h":218,"supplies_24h":11400,"strategy_points_24h":9,"random_good_of_age_24h":20},"ProgressiveEra":{"medals_24h":305,"supplies_24h":13400,"strategy_points_24h":9,"random_good_of_age_24h":20},"ModernEra":{"medals_24h":435,"supplies_24h":15600,"strategy_points_24h":9,"random_good_of_age_24h":20},"PostModernEra":{"medals_24h":609,"supplies_24h":17800,"strategy_points_24h":9,"random_good_of_age_24h":20},"ContemporaryEra":{"medals_24h":870,"supplies_24h":20000,"strategy_points_24h":9,"random_good_of_age_24h":20},"TomorrowEra":{"medals_24h":1175,"supplies_24h":22300,"strategy_points_24h":9,"random_good_of_age_24h":20},"FutureEra":{"medals_24h":1436,"supplies_24h":24500,"strategy_points_24h":9,"random_good_of_age_24h":20},"ArcticFuture":{"medals_24h":1740,"supplies_24h":26900,"strategy_points_24h":10,"random_good_of_age_24h":21},"OceanicFuture":{"medals_24h":2001,"supplies_24h":29500,"strategy_points_24h":10,"random_good_of_age_24h":21},"VirtualFuture":{"medals_24h":2436,"supplies_24h":31900,"strategy_points_24h":10,"random_good_of_age_24h":21},"SpaceAgeMars":{"medals_24h":2958,"supplies_24h":51700,"strategy_points_24h":10,"random_good_of_age_24h":21},"SpaceAgeAsteroidBelt":{"medals_24h":3480,"supplies_24h":55500,"strategy_points_24h":10,"random_good_of_age_24h":21},"SpaceAgeVenus":{"medals_24h":4002,"supplies_24h":59500,"strategy_points_24h":10,"random_good_of_age_24h":21},"SpaceAgeJupiterMoon":{"medals_24h":4524,"supplies_24h":63200,"strategy_points_24h":11,"random_good_of_age_24h":22},"SpaceAgeTitan":{"medals_24h":5115,"supplies_24h":67131,"strategy_points_24h":11,"random_good_of_age_24h":22},"SpaceAgeSpaceHub":{"medals_24h":5706,"supplies_24h":71062,"strategy_points_24h":11,"random_good_of_age_24h":22}}, boosts: [{"type":"att_boost_attacker","value":12,"feature":"all"}] },
+    "W_MultiAge_ANNI23A2": { prod: {"BronzeAge":{"medals_24h":45},"IronAge":{"medals_24h":57},"EarlyMiddleAge":{"medals_24h":70},"HighMiddleAge":{"medals_24h":82},"LateMiddleAge":{"medals_24h":95},"ColonialAge":{"medals_24h":114},"IndustrialAge":{"medals_24h":158},"ProgressiveEra":{"medals_24h":221},"ModernEra":{"medals_24h":315},"PostModernEra":{"medals_24h":441},"ContemporaryEra":{"medals_24h":630},"TomorrowEra":{"medals_24h":851},"FutureEra":{"medals_24h":1040},"ArcticFuture":{"medals_24h":1260},"OceanicFuture":{"medals_24h":1449},"VirtualFuture":{"medals_24h":1764},"SpaceAgeMars":{"medals_24h":2142},"SpaceAgeAsteroidBelt":{"medals_24h":2520},"SpaceAgeVenus":{"medals_24h":2898},"SpaceAgeJupiterMoon":{"medals_24h":3276},"SpaceAgeTitan":{"medals_24h":3704},"SpaceAgeSpaceHub":{"medals_24h":4132}} },
+    "W_MultiAge_ANNI23A3": { prod: {"BronzeAge":{"medals_24h":47,"supplies_24h":600},"IronAge":{"medals_24h":60,"supplies_24h":1500},"EarlyMiddleAge":{"medals_24h":73,"supplies_24h":2500},"HighMiddleAge":{"medals_24h":86,"supplies_24h":3500},"LateMiddleAge":{"medals_24h":99,"supplies_24h":4700},"ColonialAge":{"medals_24h":119,"supplies_24h":5900},"IndustrialAge":{"medals_24h":165,"supplies_24h":7200},"ProgressiveEra":{"medals_24h":231,"supplies_24h":8400},"ModernEra":{"medals_24h":330,"supplies_24h":9800},"PostModernEra":{"medals_24h":462,"supplies_24h":11200},"ContemporaryEra":{"medals_24h":660,"supplies_24h":12600},"TomorrowEra":{"medals_24h":891,"supplies_24h":14100},"FutureEra":{"medals_24h":1089,"supplies_24h":15500},"ArcticFuture":{"medals_24h":1320,"supplies_24h":17000},"OceanicFuture":{"medals_24h":1518,"supplies_24h":18700},"VirtualFuture":{"medals_24h":1848,"supplies_24h":20200},"SpaceAgeMars":{"medals_24h":2244,"supplies_24h":32600},"SpaceAgeAsteroidBelt":{"medals_24h":2640,"supplies_24h":35000},"SpaceAgeVenus":{"medals_24h":3036,"supplies_24h":37600},"SpaceAgeJupiterMoon":{"medals_24h":3432,"supplies_24h":39900},"SpaceAgeTitan":{"medals_24h":3880,"supplies_24h":42341},"SpaceAgeSpaceHub":{"medals_24h":4328,"supplies_24h":44782}} },
+    "W_MultiAge_ANNI23A4": { prod: {"BronzeAge":{"medals_24h":49,"supplies_24h":700},"IronAge":{"medals_24h":63,"supplies_24h":1600},"EarlyMiddleAge":{"medals_24h":76,"supplies_24h":2700},"HighMiddleAge":{"medals_24h":90,"supplies_24h":3800},"LateMiddleAge":{"medals_24h":104,"supplies_24h":5100},"ColonialAge":{"medals_24h":125,"supplies_24h":6400},"IndustrialAge":{"medals_24h":173,"supplies_24h":7800},"ProgressiveEra":{"medals_24h":242,"supplies_24h":9200},"ModernEra":{"medals_24h":345,"supplies_24h":10700},"PostModernEra":{"medals_24h":483,"supplies_24h":12200},"ContemporaryEra":{"medals_24h":690,"supplies_24h":13700},"TomorrowEra":{"medals_24h":932,"supplies_24h":15300},"FutureEra":{"medals_24h":1139,"supplies_24h":16800},"ArcticFuture":{"medals_24h":1380,"supplies_24h":18400},"OceanicFuture":{"medals_24h":1587,"supplies_24h":20200},"VirtualFuture":{"medals_24h":1932,"supplies_24h":21800},"SpaceAgeMars":{"medals_24h":2346,"supplies_24h":35400},"SpaceAgeAsteroidBelt":{"medals_24h":2760,"supplies_24h":38000},"SpaceAgeVenus":{"medals_24h":3174,"supplies_24h":40700},"SpaceAgeJupiterMoon":{"medals_24h":3588,"supplies_24h":43300},"SpaceAgeTitan":{"medals_24h":4056,"supplies_24h":46067},"SpaceAgeSpaceHub":{"medals_24h":4524,"supplies_24h":48834}} },
+    "W_MultiAge_ANNI23A5": { prod: {"BronzeAge":{"medals_24h":51,"supplies_24h":700,"strategy_points_24h":1},"IronAge":{"medals_24h":65,"supplies_24h":1800,"strategy_points_24h":1},"EarlyMiddleAge":{"medals_24h":80,"supplies_24h":2900,"strategy_points_24h":1},"HighMiddleAge":{"medals_24h":94,"supplies_24h":4100,"strategy_points_24h":1},"LateMiddleAge":{"medals_24h":108,"supplies_24h":5400,"strategy_points_24h":1},"ColonialAge":{"medals_24h":130,"supplies_24h":6900,"strategy_points_24h":1},"IndustrialAge":{"medals_24h":180,"supplies_24h":8400,"strategy_points_24h":1},"ProgressiveEra":{"medals_24h":252,"supplies_24h":9900,"strategy_points_24h":1},"ModernEra":{"medals_24h":360,"supplies_24h":11500,"strategy_points_24h":1},"PostModernEra":{"medals_24h":504,"supplies_24h":13100,"strategy_points_24h":1},"ContemporaryEra":{"medals_24h":720,"supplies_24h":14700,"strategy_points_24h":1},"TomorrowEra":{"medals_24h":972,"supplies_24h":16500,"strategy_points_24h":1},"FutureEra":{"medals_24h":1188,"supplies_24h":18100,"strategy_points_24h":1},"ArcticFuture":{"medals_24h":1440,"supplies_24h":19900,"strategy_points_24h":2},"OceanicFuture":{"medals_24h":1656,"supplies_24h":21800,"strategy_points_24h":2},"VirtualFuture":{"medals_24h":2016,"supplies_24h":23500,"strategy_points_24h":2},"SpaceAgeMars":{"medals_24h":2448,"supplies_24h":38100,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"medals_24h":2880,"supplies_24h":40900,"strategy_points_24h":2},"SpaceAgeVenus":{"medals_24h":3312,"supplies_24h":43800,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"medals_24h":3744,"supplies_24h":46600,"strategy_points_24h":3},"SpaceAgeTitan":{"medals_24h":4233,"supplies_24h":49579,"strategy_points_24h":3},"SpaceAgeSpaceHub":{"medals_24h":4722,"supplies_24h":52558,"strategy_points_24h":3}} },
+    "W_MultiAge_ANNI23A6": { prod: {"BronzeAge":{"medals_24h":53,"supplies_24h":800,"strategy_points_24h":2},"IronAge":{"medals_24h":68,"supplies_24h":1900,"strategy_points_24h":2},"EarlyMiddleAge":{"medals_24h":83,"supplies_24h":3200,"strategy_points_24h":2},"HighMiddleAge":{"medals_24h":98,"supplies_24h":4400,"strategy_points_24h":2},"LateMiddleAge":{"medals_24h":113,"supplies_24h":5800,"strategy_points_24h":2},"ColonialAge":{"medals_24h":135,"supplies_24h":7400,"strategy_points_24h":2},"IndustrialAge":{"medals_24h":188,"supplies_24h":9000,"strategy_points_24h":2},"ProgressiveEra":{"medals_24h":263,"supplies_24h":10600,"strategy_points_24h":2},"ModernEra":{"medals_24h":375,"supplies_24h":12300,"strategy_points_24h":2},"PostModernEra":{"medals_24h":525,"supplies_24h":14000,"strategy_points_24h":2},"ContemporaryEra":{"medals_24h":750,"supplies_24h":15800,"strategy_points_24h":2},"TomorrowEra":{"medals_24h":1013,"supplies_24h":17600,"strategy_points_24h":2},"FutureEra":{"medals_24h":1238,"supplies_24h":19400,"strategy_points_24h":2},"ArcticFuture":{"medals_24h":1500,"supplies_24h":21300,"strategy_points_24h":3},"OceanicFuture":{"medals_24h":1725,"supplies_24h":23300,"strategy_points_24h":3},"VirtualFuture":{"medals_24h":2100,"supplies_24h":25200,"strategy_points_24h":3},"SpaceAgeMars":{"medals_24h":2550,"supplies_24h":40800,"strategy_points_24h":3},"SpaceAgeAsteroidBelt":{"medals_24h":3000,"supplies_24h":43800,"strategy_points_24h":3},"SpaceAgeVenus":{"medals_24h":3450,"supplies_24h":46900,"strategy_points_24h":3},"SpaceAgeJupiterMoon":{"medals_24h":3900,"supplies_24h":49900,"strategy_points_24h":4},"SpaceAgeTitan":{"medals_24h":4409,"supplies_24h":53092,"strategy_points_24h":4},"SpaceAgeSpaceHub":{"medals_24h":4918,"supplies_24h":56284,"strategy_points_24h":4}} },
+    "W_MultiAge_ANNI23A7": { prod: {"BronzeAge":{"medals_24h":55,"supplies_24h":800,"strategy_points_24h":3,"random_good_of_age_24h":1},"IronAge":{"medals_24h":71,"supplies_24h":2000,"strategy_points_24h":3,"random_good_of_age_24h":1},"EarlyMiddleAge":{"medals_24h":86,"supplies_24h":3400,"strategy_points_24h":3,"random_good_of_age_24h":1},"HighMiddleAge":{"medals_24h":102,"supplies_24h":4700,"strategy_points_24h":3,"random_good_of_age_24h":1},"LateMiddleAge":{"medals_24h":117,"supplies_24h":6200,"strategy_points_24h":3,"random_good_of_age_24h":1},"ColonialAge":{"medals_24h":141,"supplies_24h":7900,"strategy_points_24h":3,"random_good_of_age_24h":1},"IndustrialAge":{"medals_24h":195,"supplies_24h":9600,"strategy_points_24h":3,"random_good_of_age_24h":1},"ProgressiveEra":{"medals_24h":273,"supplies_24h":11300,"strategy_points_24h":3,"random_good_of_age_24h":1},"ModernEra":{"medals_24h":390,"supplies_24h":13100,"strategy_points_24h":3,"random_good_of_age_24h":1},"PostModernEra":{"medals_24h":546,"supplies_24h":15000,"strategy_points_24h":3,"random_good_of_age_24h":1},"ContemporaryEra":{"medals_24h":780,"supplies_24h":16800,"strategy_points_24h":3,"random_good_of_age_24h":1},"TomorrowEra":{"medals_24h":1053,"supplies_24h":18800,"strategy_points_24h":3,"random_good_of_age_24h":1},"FutureEra":{"medals_24h":1287,"supplies_24h":20700,"strategy_points_24h":3,"random_good_of_age_24h":1},"ArcticFuture":{"medals_24h":1560,"supplies_24h":22700,"strategy_points_24h":4,"random_good_of_age_24h":2},"OceanicFuture":{"medals_24h":1794,"supplies_24h":24900,"strategy_points_24h":4,"random_good_of_age_24h":2},"VirtualFuture":{"medals_24h":2184,"supplies_24h":26900,"strategy_points_24h":4,"random_good_of_age_24h":2},"SpaceAgeMars":{"medals_24h":2652,"supplies_24h":43500,"strategy_points_24h":4,"random_good_of_age_24h":2},"SpaceAgeAsteroidBelt":{"medals_24h":3120,"supplies_24h":46700,"strategy_points_24h":4,"random_good_of_age_24h":2},"SpaceAgeVenus":{"medals_24h":3588,"supplies_24h":50100,"strategy_points_24h":4,"random_good_of_age_24h":2},"SpaceAgeJupiterMoon":{"medals_24h":4056,"supplies_24h":53300,"strategy_points_24h":5,"random_good_of_age_24h":3},"SpaceAgeTitan":{"medals_24h":4586,"supplies_24h":56705,"strategy_points_24h":5,"random_good_of_age_24h":3},"SpaceAgeSpaceHub":{"medals_24h":5116,"supplies_24h":60110,"strategy_points_24h":5,"random_good_of_age_24h":3}} },
+    "W_MultiAge_ANNI23A8": { prod: {"BronzeAge":{"medals_24h":57,"supplies_24h":900,"strategy_points_24h":4,"random_good_of_age_24h":3},"IronAge":{"medals_24h":73,"supplies_24h":2100,"strategy_points_24h":4,"random_good_of_age_24h":3},"EarlyMiddleAge":{"medals_24h":90,"supplies_24h":3600,"strategy_points_24h":4,"random_good_of_age_24h":3},"HighMiddleAge":{"medals_24h":106,"supplies_24h":5000,"strategy_points_24h":4,"random_good_of_age_24h":3},"LateMiddleAge":{"medals_24h":122,"supplies_24h":6600,"strategy_points_24h":4,"random_good_of_age_24h":3},"ColonialAge":{"medals_24h":146,"supplies_24h":8400,"strategy_points_24h":4,"random_good_of_age_24h":3},"IndustrialAge":{"medals_24h":203,"supplies_24h":10200,"strategy_points_24h":4,"random_good_of_age_24h":3},"ProgressiveEra":{"medals_24h":284,"supplies_24h":12000,"strategy_points_24h":4,"random_good_of_age_24h":3},"ModernEra":{"medals_24h":405,"supplies_24h":13900,"strategy_points_24h":4,"random_good_of_age_24h":3},"PostModernEra":{"medals_24h":567,"supplies_24h":15900,"strategy_points_24h":4,"random_good_of_age_24h":3},"ContemporaryEra":{"medals_24h":810,"supplies_24h":17900,"strategy_points_24h":4,"random_good_of_age_24h":3},"TomorrowEra":{"medals_24h":1094,"supplies_24h":20000,"strategy_points_24h":4,"random_good_of_age_24h":3},"FutureEra":{"medals_24h":1337,"supplies_24h":22000,"strategy_points_24h":4,"random_good_of_age_24h":3},"ArcticFuture":{"medals_24h":1620,"supplies_24h":24100,"strategy_points_24h":5,"random_good_of_age_24h":4},"OceanicFuture":{"medals_24h":1863,"supplies_24h":26400,"strategy_points_24h":5,"random_good_of_age_24h":4},"VirtualFuture":{"medals_24h":2268,"supplies_24h":28600,"strategy_points_24h":5,"random_good_of_age_24h":4},"SpaceAgeMars":{"medals_24h":2754,"supplies_24h":46200,"strategy_points_24h":5,"random_good_of_age_24h":4},"SpaceAgeAsteroidBelt":{"medals_24h":3240,"supplies_24h":49600,"strategy_points_24h":5,"random_good_of_age_24h":4},"SpaceAgeVenus":{"medals_24h":3726,"supplies_24h":53200,"strategy_points_24h":5,"random_good_of_age_24h":4},"SpaceAgeJupiterMoon":{"medals_24h":4212,"supplies_24h":56600,"strategy_points_24h":6,"random_good_of_age_24h":5},"SpaceAgeTitan":{"medals_24h":4762,"supplies_24h":60218,"strategy_points_24h":6,"random_good_of_age_24h":5},"SpaceAgeSpaceHub":{"medals_24h":5312,"supplies_24h":63836,"strategy_points_24h":6,"random_good_of_age_24h":5}} },
+    "W_MultiAge_ANNI23A9": { prod: {"BronzeAge":{"medals_24h":59,"supplies_24h":1000,"strategy_points_24h":5,"random_good_of_age_24h":9},"IronAge":{"medals_24h":76,"supplies_24h":2300,"strategy_points_24h":5,"random_good_of_age_24h":9},"EarlyMiddleAge":{"medals_24h":93,"supplies_24h":3800,"strategy_points_24h":5,"random_good_of_age_24h":9},"HighMiddleAge":{"medals_24h":110,"supplies_24h":5300,"strategy_points_24h":5,"random_good_of_age_24h":9},"LateMiddleAge":{"medals_24h":126,"supplies_24h":7000,"strategy_points_24h":5,"random_good_of_age_24h":9},"ColonialAge":{"medals_24h":152,"supplies_24h":8900,"strategy_points_24h":5,"random_good_of_age_24h":9},"IndustrialAge":{"medals_24h":210,"supplies_24h":10800,"strategy_points_24h":5,"random_good_of_age_24h":9},"ProgressiveEra":{"medals_24h":294,"supplies_24h":12700,"strategy_points_24h":5,"random_good_of_age_24h":9},"ModernEra":{"medals_24h":420,"supplies_24h":14700,"strategy_points_24h":5,"random_good_of_age_24h":9},"PostModernEra":{"medals_24h":588,"supplies_24h":16800,"strategy_points_24h":5,"random_good_of_age_24h":9},"ContemporaryEra":{"medals_24h":840,"supplies_24h":18900,"strategy_points_24h":5,"random_good_of_age_24h":9},"TomorrowEra":{"medals_24h":1134,"supplies_24h":21200,"strategy_points_24h":5,"random_good_of_age_24h":9},"FutureEra":{"medals_24h":1386,"supplies_24h":23300,"strategy_points_24h":5,"random_good_of_age_24h":9},"ArcticFuture":{"medals_24h":1680,"supplies_24h":25500,"strategy_points_24h":6,"random_good_of_age_24h":10},"OceanicFuture":{"medals_24h":1932,"supplies_24h":28000,"strategy_points_24h":6,"random_good_of_age_24h":10},"VirtualFuture":{"medals_24h":2352,"supplies_24h":30200,"strategy_points_24h":6,"random_good_of_age_24h":10},"SpaceAgeMars":{"medals_24h":2856,"supplies_24h":49000,"strategy_points_24h":6,"random_good_of_age_24h":10},"SpaceAgeAsteroidBelt":{"medals_24h":3360,"supplies_24h":52500,"strategy_points_24h":6,"random_good_of_age_24h":10},"SpaceAgeVenus":{"medals_24h":3864,"supplies_24h":56300,"strategy_points_24h":6,"random_good_of_age_24h":10},"SpaceAgeJupiterMoon":{"medals_24h":4368,"supplies_24h":59900,"strategy_points_24h":7,"random_good_of_age_24h":11},"SpaceAgeTitan":{"medals_24h":4938,"supplies_24h":63731,"strategy_points_24h":7,"random_good_of_age_24h":11},"SpaceAgeSpaceHub":{"medals_24h":5508,"supplies_24h":67562,"strategy_points_24h":7,"random_good_of_age_24h":11}}, boosts: [{"type":"att_boost_attacker","value":1,"feature":"all"}] },
+    "W_MultiAge_ANNI23A11d": { prod: {"BronzeAge":{"population":171,"happiness":710,"demandHappiness":171,"medals_24h":63,"supplies_24h":1100,"strategy_points_24h":9,"random_good_of_age_24h":20,"units_24h":4},"IronAge":{"population":366,"happiness":1230,"demandHappiness":366,"medals_24h":81,"supplies_24h":2500,"strategy_points_24h":9,"random_good_of_age_24h":20,"units_24h":4},"EarlyMiddleAge":{"population":561,"happiness":1360,"demandHappiness":561,"medals_24h":99,"supplies_24h":4200,"strategy_points_24h":9,"random_good_of_age_24h":20,"units_24h":4},"HighMiddleAge":{"population":788,"happiness":1510,"demandHappiness":788,"medals_24h":117,"supplies_24h":5900,"strategy_points_24h":9,"random_good_of_age_24h":20,"units_24h":4},"LateMiddleAge":{"population":1034,"happiness":1690,"demandHappiness":1034,"medals_24h":135,"supplies_24h":7800,"strategy_points_24h":9,"random_good_of_age_24h":20,"units_24h":4},"ColonialAge":{"population":1305,"happiness":1980,"demandHappiness":1305,"medals_24h":162,"supplies_24h":9900,"strategy_points_24h":9,"random_good_of_age_24h":20,"units_24h":4},"IndustrialAge":{"population":1594,"happiness":2240,"demandHappiness":1594,"medals_24h":225,"supplies_24h":12000,"strategy_points_24h":9,"random_good_of_age_24h":20,"units_24h":4},"ProgressiveEra":{"population":1903,"happiness":2450,"demandHappiness":1903,"medals_24h":315,"supplies_24h":14100,"strategy_points_24h":9,"random_good_of_age_24h":20,"units_24h":4},"ModernEra":{"population":2231,"happiness":2630,"demandHappiness":2231,"medals_24h":450,"supplies_24h":16400,"strategy_points_24h":9,"random_good_of_age_24h":20,"units_24h":4},"PostModernEra":{"population":2571,"happiness":2740,"demandHappiness":2571,"medals_24h":630,"supplies_24h":18700,"strategy_points_24h":9,"random_good_of_age_24h":20,"units_24h":4},"ContemporaryEra":{"population":2930,"happiness":3180,"demandHappiness":2930,"medals_24h":900,"supplies_24h":21000,"strategy_points_24h":9,"random_good_of_age_24h":20,"units_24h":4},"TomorrowEra":{"population":3302,"happiness":3860,"demandHappiness":3302,"medals_24h":1215,"supplies_24h":23500,"strategy_points_24h":9,"random_good_of_age_24h":20,"units_24h":4},"FutureEra":{"population":3692,"happiness":4620,"demandHappiness":3692,"medals_24h":1485,"supplies_24h":25800,"strategy_points_24h":9,"random_good_of_age_24h":20,"units_24h":5},"ArcticFuture":{"population":4095,"happiness":5380,"demandHappiness":4095,"medals_24h":1800,"supplies_24h":28400,"strategy_points_24h":10,"random_good_of_age_24h":21,"units_24h":5},"OceanicFuture":{"population":4511,"happiness":6210,"demandHappiness":4511,"medals_24h":2070,"supplies_24h":31100,"strategy_points_24h":10,"random_good_of_age_24h":21,"units_24h":5},"VirtualFuture":{"population":4940,"happiness":7410,"demandHappiness":4940,"medals_24h":2520,"supplies_24h":33600,"strategy_points_24h":10,"random_good_of_age_24h":21,"units_24h":5},"SpaceAgeMars":{"population":7819,"happiness":11860,"demandHappiness":7819,"medals_24h":3060,"supplies_24h":54400,"strategy_points_24h":10,"random_good_of_age_24h":21,"units_24h":5},"SpaceAgeAsteroidBelt":{"population":8493,"happiness":12890,"demandHappiness":8493,"medals_24h":3600,"supplies_24h":58400,"strategy_points_24h":10,"random_good_of_age_24h":21,"units_24h":5},"SpaceAgeVenus":{"population":9180,"happiness":13920,"demandHappiness":9180,"medals_24h":4140,"supplies_24h":62600,"strategy_points_24h":10,"random_good_of_age_24h":21,"units_24h":5},"SpaceAgeJupiterMoon":{"population":9885,"happiness":15000,"demandHappiness":9885,"medals_24h":4680,"supplies_24h":66600,"strategy_points_24h":11,"random_good_of_age_24h":22,"units_24h":6},"SpaceAgeTitan":{"population":10645,"happiness":16164,"demandHappiness":10645,"medals_24h":5291,"supplies_24h":70856,"strategy_points_24h":11,"random_good_of_age_24h":22,"units_24h":6},"SpaceAgeSpaceHub":{"population":11405,"happiness":17328,"demandHappiness":11405,"medals_24h":5902,"supplies_24h":75112,"strategy_points_24h":11,"random_good_of_age_24h":22,"units_24h":6}}, boosts: [{"type":"att_boost_attacker","value":12,"feature":"all"}] },
+    "W_MultiAge_ANNI23B1": { prod: {"BronzeAge":{"population":-98,"happiness":-610,"strategy_points_24h":3,"random_good_of_age_24h":9},"IronAge":{"population":-209,"happiness":-1050,"strategy_points_24h":3,"random_good_of_age_24h":9},"EarlyMiddleAge":{"population":-321,"happiness":-1160,"strategy_points_24h":3,"random_good_of_age_24h":9},"HighMiddleAge":{"population":-450,"happiness":-1300,"strategy_points_24h":3,"random_good_of_age_24h":9},"LateMiddleAge":{"population":-591,"happiness":-1450,"strategy_points_24h":3,"random_good_of_age_24h":9},"ColonialAge":{"population":-746,"happiness":-1700,"strategy_points_24h":3,"random_good_of_age_24h":9},"IndustrialAge":{"population":-911,"happiness":-1920,"strategy_points_24h":3,"random_good_of_age_24h":9},"ProgressiveEra":{"population":-1088,"happiness":-2100,"strategy_points_24h":3,"random_good_of_age_24h":9},"ModernEra":{"population":-1275,"happiness":-2250,"strategy_points_24h":3,"random_good_of_age_24h":9},"PostModernEra":{"population":-1469,"happiness":-2350,"strategy_points_24h":3,"random_good_of_age_24h":9},"ContemporaryEra":{"population":-1674,"happiness":-2730,"strategy_points_24h":3,"random_good_of_age_24h":9},"TomorrowEra":{"population":-1887,"happiness":-3310,"strategy_points_24h":3,"random_good_of_age_24h":9},"FutureEra":{"population":-2110,"happiness":-3960,"strategy_points_24h":3,"random_good_of_age_24h":9},"ArcticFuture":{"population":-2340,"happiness":-4610,"strategy_points_24h":4,"random_good_of_age_24h":10},"OceanicFuture":{"population":-2578,"happiness":-5320,"strategy_points_24h":4,"random_good_of_age_24h":10},"VirtualFuture":{"population":-2823,"happiness":-6360,"strategy_points_24h":4,"random_good_of_age_24h":10},"SpaceAgeMars":{"population":-4468,"happiness":-10170,"strategy_points_24h":4,"random_good_of_age_24h":10},"SpaceAgeAsteroidBelt":{"population":-4853,"happiness":-11050,"strategy_points_24h":4,"random_good_of_age_24h":10},"SpaceAgeVenus":{"population":-5246,"happiness":-11940,"strategy_points_24h":4,"random_good_of_age_24h":10},"SpaceAgeJupiterMoon":{"population":-5649,"happiness":-12860,"strategy_points_24h":5,"random_good_of_age_24h":11},"SpaceAgeTitan":{"population":-6083,"happiness":-13851,"strategy_points_24h":5,"random_good_of_age_24h":11},"SpaceAgeSpaceHub":{"population":-6517,"happiness":-14842,"strategy_points_24h":5,"random_good_of_age_24h":11}}, boosts: [{"type":"att_boost_attacker","value":3,"feature":"all"},{"type":"att_boost_defender","value":4,"feature":"all"}] },
+    "W_MultiAge_ANNI23B2": { prod: {"BronzeAge":{"population":-130,"happiness":-820,"strategy_points_24h":4,"random_good_of_age_24h":12},"IronAge":{"population":-279,"happiness":-1400,"strategy_points_24h":4,"random_good_of_age_24h":12},"EarlyMiddleAge":{"population":-428,"happiness":-1550,"strategy_points_24h":4,"random_good_of_age_24h":12},"HighMiddleAge":{"population":-600,"happiness":-1730,"strategy_points_24h":4,"random_good_of_age_24h":12},"LateMiddleAge":{"population":-788,"happiness":-1930,"strategy_points_24h":4,"random_good_of_age_24h":12},"ColonialAge":{"population":-994,"happiness":-2270,"strategy_points_24h":4,"random_good_of_age_24h":12},"IndustrialAge":{"population":-1215,"happiness":-2550,"strategy_points_24h":4,"random_good_of_age_24h":12},"ProgressiveEra":{"population":-1450,"happiness":-2800,"strategy_points_24h":4,"random_good_of_age_24h":12},"ModernEra":{"population":-1700,"happiness":-3000,"strategy_points_24h":4,"random_good_of_age_24h":12},"PostModernEra":{"population":-1959,"happiness":-3130,"strategy_points_24h":4,"random_good_of_age_24h":12},"ContemporaryEra":{"population":-2232,"happiness":-3630,"strategy_points_24h":4,"random_good_of_age_24h":12},"TomorrowEra":{"population":-2516,"happiness":-4410,"strategy_points_24h":4,"random_good_of_age_24h":12},"FutureEra":{"population":-2813,"happiness":-5280,"strategy_points_24h":4,"random_good_of_age_24h":12},"ArcticFuture":{"population":-3120,"happiness":-6150,"strategy_points_24h":5,"random_good_of_age_24h":13},"OceanicFuture":{"population":-3437,"happiness":-7090,"strategy_points_24h":5,"random_good_of_age_24h":13},"VirtualFuture":{"population":-3764,"happiness":-8470,"strategy_points_24h":5,"random_good_of_age_24h":13},"SpaceAgeMars":{"population":-5957,"happiness":-13550,"strategy_points_24h":5,"random_good_of_age_24h":13},"SpaceAgeAsteroidBelt":{"population":-6471,"happiness":-14730,"strategy_points_24h":5,"random_good_of_age_24h":13},"SpaceAgeVenus":{"population":-6994,"happiness":-15910,"strategy_points_24h":5,"random_good_of_age_24h":13},"SpaceAgeJupiterMoon":{"population":-7532,"happiness":-17140,"strategy_points_24h":6,"random_good_of_age_24h":14},"SpaceAgeTitan":{"population":-8112,"happiness":-18466,"strategy_points_24h":6,"random_good_of_age_24h":14},"SpaceAgeSpaceHub":{"population":-8692,"happiness":-19792,"strategy_points_24h":6,"random_good_of_age_24h":14}}, boosts: [{"type":"att_boost_attacker","value":5,"feature":"all"},{"type":"att_boost_defender","value":6,"feature":"all"}] },
+    "W_MultiAge_ANNI23B3": { prod: {"BronzeAge":{"population":-162,"happiness":-1020,"strategy_points_24h":5,"random_good_of_age_24h":15},"IronAge":{"population":-348,"happiness":-1750,"strategy_points_24h":5,"random_good_of_age_24h":15},"EarlyMiddleAge":{"population":-534,"happiness":-1940,"strategy_points_24h":5,"random_good_of_age_24h":15},"HighMiddleAge":{"population":-750,"happiness":-2160,"strategy_points_24h":5,"random_good_of_age_24h":15},"LateMiddleAge":{"population":-984,"happiness":-2410,"strategy_points_24h":5,"random_good_of_age_24h":15},"ColonialAge":{"population":-1242,"happiness":-2830,"strategy_points_24h":5,"random_good_of_age_24h":15},"IndustrialAge":{"population":-1518,"happiness":-3190,"strategy_points_24h":5,"random_good_of_age_24h":15},"ProgressiveEra":{"population":-1812,"happiness":-3500,"strategy_points_24h":5,"random_good_of_age_24h":15},"ModernEra":{"population":-2124,"happiness":-3750,"strategy_points_24h":5,"random_good_of_age_24h":15},"PostModernEra":{"population":-2448,"happiness":-3910,"strategy_points_24h":5,"random_good_of_age_24h":15},"ContemporaryEra":{"population":-2790,"happiness":-4540,"strategy_points_24h":5,"random_good_of_age_24h":15},"TomorrowEra":{"population":-3144,"happiness":-5510,"strategy_points_24h":5,"random_good_of_age_24h":15},"FutureEra":{"population":-3516,"happiness":-6600,"strategy_points_24h":5,"random_good_of_age_24h":15},"ArcticFuture":{"population":-3900,"happiness":-7680,"strategy_points_24h":6,"random_good_of_age_24h":16},"OceanicFuture":{"population":-4296,"happiness":-8870,"strategy_points_24h":6,"random_good_of_age_24h":16},"VirtualFuture":{"population":-4704,"happiness":-10590,"strategy_points_24h":6,"random_good_of_age_24h":16},"SpaceAgeMars":{"population":-7446,"happiness":-16940,"strategy_points_24h":6,"random_good_of_age_24h":16},"SpaceAgeAsteroidBelt":{"population":-8088,"happiness":-18410,"strategy_points_24h":6,"random_good_of_age_24h":16},"SpaceAgeVenus":{"population":-8742,"happiness":-19890,"strategy_points_24h":6,"random_good_of_age_24h":16},"SpaceAgeJupiterMoon":{"population":-9414,"happiness":-21430,"strategy_points_24h":7,"random_good_of_age_24h":17},"SpaceAgeTitan":{"population":-10138,"happiness":-23090,"strategy_points_24h":7,"random_good_of_age_24h":17},"SpaceAgeSpaceHub":{"population":-10862,"happiness":-24750,"strategy_points_24h":7,"random_good_of_age_24h":17}}, boosts: [{"type":"att_boost_attacker","value":7,"feature":"all"},{"type":"att_boost_defender","value":8,"feature":"all"}] },
+    "W_MultiAge_ANNI23B4": { prod: {"BronzeAge":{"population":-195,"happiness":-1220,"strategy_points_24h":6,"random_good_of_age_24h":18},"IronAge":{"population":-418,"happiness":-2100,"strategy_points_24h":6,"random_good_of_age_24h":18},"EarlyMiddleAge":{"population":-641,"happiness":-2320,"strategy_points_24h":6,"random_good_of_age_24h":18},"HighMiddleAge":{"population":-900,"happiness":-2590,"strategy_points_24h":6,"random_good_of_age_24h":18},"LateMiddleAge":{"population":-1181,"happiness":-2890,"strategy_points_24h":6,"random_good_of_age_24h":18},"ColonialAge":{"population":-1491,"happiness":-3400,"strategy_points_24h":6,"random_good_of_age_24h":18},"IndustrialAge":{"population":-1822,"happiness":-3830,"strategy_points_24h":6,"random_good_of_age_24h":18},"ProgressiveEra":{"population":-2175,"happiness":-4200,"strategy_points_24h":6,"random_good_of_age_24h":18},"ModernEra":{"population":-2549,"happiness":-4500,"strategy_points_24h":6,"random_good_of_age_24h":18},"PostModernEra":{"population":-2938,"happiness":-4690,"strategy_points_24h":6,"random_good_of_age_24h":18},"ContemporaryEra":{"population":-3348,"happiness":-5450,"strategy_points_24h":6,"random_good_of_age_24h":18},"TomorrowEra":{"population":-3773,"happiness":-6610,"strategy_points_24h":6,"random_good_of_age_24h":18},"FutureEra":{"population":-4220,"happiness":-7920,"strategy_points_24h":6,"random_good_of_age_24h":18},"ArcticFuture":{"population":-4680,"happiness":-9220,"strategy_points_24h":7,"random_good_of_age_24h":19},"OceanicFuture":{"population":-5156,"happiness":-10640,"strategy_points_24h":7,"random_good_of_age_24h":19},"VirtualFuture":{"population":-5645,"happiness":-12710,"strategy_points_24h":7,"random_good_of_age_24h":19},"SpaceAgeMars":{"population":-8936,"happiness":-20330,"strategy_points_24h":7,"random_good_of_age_24h":19},"SpaceAgeAsteroidBelt":{"population":-9706,"happiness":-22090,"strategy_points_24h":7,"random_good_of_age_24h":19},"SpaceAgeVenus":{"population":-10491,"happiness":-23870,"strategy_points_24h":7,"random_good_of_age_24h":19},"SpaceAgeJupiterMoon":{"population":-11297,"happiness":-25710,"strategy_points_24h":8,"random_good_of_age_24h":20},"SpaceAgeTitan":{"population":-12165,"happiness":-27692,"strategy_points_24h":8,"random_good_of_age_24h":20},"SpaceAgeSpaceHub":{"population":-13033,"happiness":-29674,"strategy_points_24h":8,"random_good_of_age_24h":20}}, boosts: [{"type":"att_boost_attacker","value":9,"feature":"all"},{"type":"att_boost_defender","value":10,"feature":"all"}] },
+    "W_MultiAge_ANNI25A11": { prod: {"BronzeAge":{"population":930,"happiness":3830,"demandHappiness":930,"medals_24h":820,"all_goods_of_age_24h":190.0},"IronAge":{"population":1990,"happiness":6600,"demandHappiness":1990,"medals_24h":1050,"all_goods_of_age_24h":190.0},"EarlyMiddleAge":{"population":3060,"happiness":7300,"demandHappiness":3060,"medals_24h":1280,"all_goods_of_age_24h":190.0},"HighMiddleAge":{"population":4300,"happiness":8140,"demandHappiness":4300,"medals_24h":1520,"all_goods_of_age_24h":190.0},"LateMiddleAge":{"population":5640,"happiness":9080,"demandHappiness":5640,"medals_24h":1750,"all_goods_of_age_24h":190.0},"ColonialAge":{"population":7110,"happiness":10670,"demandHappiness":7110,"medals_24h":2100,"all_goods_of_age_24h":190.0},"IndustrialAge":{"population":8690,"happiness":12040,"demandHappiness":8690,"medals_24h":2920,"all_goods_of_age_24h":190.0},"ProgressiveEra":{"population":10380,"happiness":13220,"demandHappiness":10380,"medals_24h":4090,"all_goods_of_age_24h":190.0},"ModernEra":{"population":12160,"happiness":14140,"demandHappiness":12160,"medals_24h":5840,"all_goods_of_age_24h":190.0},"PostModernEra":{"population":14020,"happiness":14740,"demandHappiness":14020,"medals_24h":8180,"all_goods_of_age_24h":190.0},"ContemporaryEra":{"population":15980,"happiness":17120,"demandHappiness":15980,"medals_24h":11680,"all_goods_of_age_24h":190.0},"TomorrowEra":{"population":18010,"happiness":20790,"demandHappiness":18010,"medals_24h":15770,"all_goods_of_age_24h":190.0},"FutureEra":{"population":20140,"happiness":24900,"demandHappiness":20140,"medals_24h":19270,"all_goods_of_age_24h":190.0},"ArcticFuture":{"population":22340,"happiness":29000,"demandHappiness":22340,"medals_24h":23360,"all_goods_of_age_24h":190.0},"OceanicFuture":{"population":24600,"happiness":33460,"demandHappiness":24600,"medals_24h":26860,"all_goods_of_age_24h":190.0},"VirtualFuture":{"population":26940,"happiness":39980,"demandHappiness":26940,"medals_24h":32700,"all_goods_of_age_24h":190.0},"SpaceAgeMars":{"population":42640,"happiness":63970,"demandHappiness":42640,"medals_24h":39710,"all_goods_of_age_24h":190.0},"SpaceAgeAsteroidBelt":{"population":46320,"happiness":69510,"demandHappiness":46320,"medals_24h":46720,"all_goods_of_age_24h":190.0},"SpaceAgeVenus":{"population":50070,"happiness":75100,"demandHappiness":50070,"medals_24h":53730,"all_goods_of_age_24h":190.0},"SpaceAgeJupiterMoon":{"population":53920,"happiness":80900,"demandHappiness":53920,"medals_24h":60730,"all_goods_of_age_24h":190.0},"SpaceAgeTitan":{"population":57830,"happiness":86760,"demandHappiness":57830,"medals_24h":67740,"all_goods_of_age_24h":190.0},"SpaceAgeSpaceHub":{"population":61750,"happiness":92625,"demandHappiness":61750,"medals_24h":74750,"all_goods_of_age_24h":190.0}}, boosts: [{"type":"att_boost_attacker","value":78,"feature":"all"},{"type":"att_def_boost_attacker","value":154,"feature":"guild_expedition"}] },
+    "W_MultiAge_ANNI24A11": { prod: {"BronzeAge":{"population":240,"happiness":1010,"demandHappiness":240,"money_24h":1680,"medals_24h":170,"strategy_points_24h":19,"random_good_of_age_24h":68},"IronAge":{"population":520,"happiness":1730,"demandHappiness":520,"money_24h":4030,"medals_24h":220,"strategy_points_24h":19,"random_good_of_age_24h":68},"EarlyMiddleAge":{"population":800,"happiness":1920,"demandHappiness":800,"money_24h":6720,"medals_24h":270,"strategy_points_24h":19,"random_good_of_age_24h":68},"HighMiddleAge":{"population":1130,"happiness":2140,"demandHappiness":1130,"money_24h":9410,"medals_24h":320,"strategy_points_24h":19,"random_good_of_age_24h":68},"LateMiddleAge":{"population":1480,"happiness":2390,"demandHappiness":1480,"money_24h":12440,"medals_24h":370,"strategy_points_24h":19,"random_good_of_age_24h":68},"ColonialAge":{"population":1870,"happiness":2800,"demandHappiness":1870,"money_24h":18940,"medals_24h":450,"strategy_points_24h":19,"random_good_of_age_24h":68},"IndustrialAge":{"population":2280,"happiness":3160,"demandHappiness":2280,"money_24h":23600,"medals_24h":620,"strategy_points_24h":19,"random_good_of_age_24h":68},"ProgressiveEra":{"population":2730,"happiness":3470,"demandHappiness":2730,"money_24h":28640,"medals_24h":870,"strategy_points_24h":19,"random_good_of_age_24h":68},"ModernEra":{"population":3200,"happiness":3720,"demandHappiness":3200,"money_24h":35630,"medals_24h":1240,"strategy_points_24h":19,"random_good_of_age_24h":68},"PostModernEra":{"population":3680,"happiness":3870,"demandHappiness":3680,"money_24h":44820,"medals_24h":1740,"strategy_points_24h":19,"random_good_of_age_24h":68},"ContemporaryEra":{"population":4200,"happiness":4500,"demandHappiness":4200,"money_24h":58350,"medals_24h":2480,"strategy_points_24h":19,"random_good_of_age_24h":68},"TomorrowEra":{"population":4730,"happiness":5460,"demandHappiness":4730,"money_24h":67560,"medals_24h":3350,"strategy_points_24h":19,"random_good_of_age_24h":68},"FutureEra":{"population":5290,"happiness":6540,"demandHappiness":5290,"money_24h":77450,"medals_24h":4100,"strategy_points_24h":19,"random_good_of_age_24h":68},"ArcticFuture":{"population":5870,"happiness":7620,"demandHappiness":5870,"money_24h":88000,"medals_24h":4970,"strategy_points_24h":19,"random_good_of_age_24h":68},"OceanicFuture":{"population":6470,"happiness":8790,"demandHappiness":6470,"money_24h":99230,"medals_24h":5710,"strategy_points_24h":19,"random_good_of_age_24h":68},"VirtualFuture":{"population":7080,"happiness":10510,"demandHappiness":7080,"money_24h":111140,"medals_24h":6950,"strategy_points_24h":19,"random_good_of_age_24h":68},"SpaceAgeMars":{"population":11210,"happiness":16810,"demandHappiness":11210,"money_24h":185650,"medals_24h":8440,"strategy_points_24h":19,"random_good_of_age_24h":68},"SpaceAgeAsteroidBelt":{"population":12170,"happiness":18270,"demandHappiness":12170,"money_24h":205630,"medals_24h":9930,"strategy_points_24h":19,"random_good_of_age_24h":68},"SpaceAgeVenus":{"population":13160,"happiness":19740,"demandHappiness":13160,"money_24h":226670,"medals_24h":11420,"strategy_points_24h":19,"random_good_of_age_24h":68},"SpaceAgeJupiterMoon":{"population":14170,"happiness":21260,"demandHappiness":14170,"money_24h":248790,"medals_24h":12910,"strategy_points_24h":19,"random_good_of_age_24h":68},"SpaceAgeTitan":{"population":15200,"happiness":22800,"demandHappiness":15200,"money_24h":272000,"medals_24h":14400,"strategy_points_24h":19,"random_good_of_age_24h":68},"SpaceAgeSpaceHub":{"population":16230,"happiness":24340,"demandHappiness":16230,"money_24h":295210,"medals_24h":15890,"strategy_points_24h":19,"random_good_of_age_24h":68}}, boosts: [{"type":"att_boost_attacker","value":16,"feature":"all"},{"type":"att_boost_attacker","value":18,"feature":"battleground"},{"type":"att_boost_attacker","value":14,"feature":"guild_expedition"},{"type":"att_boost_defender","value":20,"feature":"all"},{"type":"att_boost_defender","value":21,"feature":"battleground"},{"type":"att_boost_defender","value":15,"feature":"guild_expedition"}] },
+    "W_MultiAge_ANNI24A8": { prod: {"BronzeAge":{"population":210,"happiness":850,"demandHappiness":210,"money_24h":1380,"medals_24h":120,"strategy_points_24h":16,"random_good_of_age_24h":56},"IronAge":{"population":440,"happiness":1460,"demandHappiness":440,"money_24h":3320,"medals_24h":150,"strategy_points_24h":16,"random_good_of_age_24h":56},"EarlyMiddleAge":{"population":680,"happiness":1610,"demandHappiness":680,"money_24h":5540,"medals_24h":180,"strategy_points_24h":16,"random_good_of_age_24h":56},"HighMiddleAge":{"population":950,"happiness":1800,"demandHappiness":950,"money_24h":7750,"medals_24h":220,"strategy_points_24h":16,"random_good_of_age_24h":56},"LateMiddleAge":{"population":1250,"happiness":2010,"demandHappiness":1250,"money_24h":10240,"medals_24h":250,"strategy_points_24h":16,"random_good_of_age_24h":56},"ColonialAge":{"population":1570,"happiness":2360,"demandHappiness":1570,"money_24h":15600,"medals_24h":300,"strategy_points_24h":16,"random_good_of_age_24h":56},"IndustrialAge":{"population":1920,"happiness":2660,"demandHappiness":1920,"money_24h":19430,"medals_24h":410,"strategy_points_24h":16,"random_good_of_age_24h":56},"ProgressiveEra":{"population":2300,"happiness":2930,"demandHappiness":2300,"money_24h":23580,"medals_24h":580,"strategy_points_24h":16,"random_good_of_age_24h":56},"ModernEra":{"population":2690,"happiness":3130,"demandHappiness":2690,"money_24h":29340,"medals_24h":830,"strategy_points_24h":16,"random_good_of_age_24h":56},"PostModernEra":{"population":3100,"happiness":3260,"demandHappiness":3100,"money_24h":36910,"medals_24h":1160,"strategy_points_24h":16,"random_good_of_age_24h":56},"ContemporaryEra":{"population":3540,"happiness":3790,"demandHappiness":3540,"money_24h":48060,"medals_24h":1660,"strategy_points_24h":16,"random_good_of_age_24h":56},"TomorrowEra":{"population":3990,"happiness":4600,"demandHappiness":3990,"money_24h":55640,"medals_24h":2230,"strategy_points_24h":16,"random_good_of_age_24h":56},"FutureEra":{"population":4460,"happiness":5510,"demandHappiness":4460,"money_24h":63780,"medals_24h":2730,"strategy_points_24h":16,"random_good_of_age_24h":56},"ArcticFuture":{"population":4940,"happiness":6420,"demandHappiness":4940,"money_24h":72470,"medals_24h":3310,"strategy_points_24h":16,"random_good_of_age_24h":56},"OceanicFuture":{"population":5450,"happiness":7410,"demandHappiness":5450,"money_24h":81720,"medals_24h":3810,"strategy_points_24h":16,"random_good_of_age_24h":56},"VirtualFuture":{"population":5960,"happiness":8850,"demandHappiness":5960,"money_24h":91530,"medals_24h":4630,"strategy_points_24h":16,"random_good_of_age_24h":56},"SpaceAgeMars":{"population":9440,"happiness":14160,"demandHappiness":9440,"money_24h":152890,"medals_24h":5630,"strategy_points_24h":16,"random_good_of_age_24h":56},"SpaceAgeAsteroidBelt":{"population":10250,"happiness":15380,"demandHappiness":10250,"money_24h":169340,"medals_24h":6620,"strategy_points_24h":16,"random_good_of_age_24h":56},"SpaceAgeVenus":{"population":11080,"happiness":16620,"demandHappiness":11080,"money_24h":186670,"medals_24h":7610,"strategy_points_24h":16,"random_good_of_age_24h":56},"SpaceAgeJupiterMoon":{"population":11930,"happiness":17900,"demandHappiness":11930,"money_24h":204890,"medals_24h":8610,"strategy_points_24h":16,"random_good_of_age_24h":56},"SpaceAgeTitan":{"population":12800,"happiness":19200,"demandHappiness":12800,"money_24h":224000,"medals_24h":9600,"strategy_points_24h":16,"random_good_of_age_24h":56},"SpaceAgeSpaceHub":{"population":13670,"happiness":20500,"demandHappiness":13670,"money_24h":243110,"medals_24h":10590,"strategy_points_24h":16,"random_good_of_age_24h":56}}, boosts: [{"type":"att_boost_attacker","value":16,"feature":"all"},{"type":"att_boost_attacker","value":12,"feature":"battleground"},{"type":"att_boost_attacker","value":8,"feature":"guild_expedition"},{"type":"att_boost_defender","value":20,"feature":"all"},{"type":"att_boost_defender","value":12,"feature":"battleground"}] },
+    "W_MultiAge_ANNI24A1": { prod: {"BronzeAge":{"population":120,"happiness":480,"demandHappiness":120,"money_24h":690,"strategy_points_24h":9,"random_good_of_age_24h":28},"IronAge":{"population":250,"happiness":820,"demandHappiness":250,"money_24h":1660,"strategy_points_24h":9,"random_good_of_age_24h":28},"EarlyMiddleAge":{"population":380,"happiness":910,"demandHappiness":380,"money_24h":2770,"strategy_points_24h":9,"random_good_of_age_24h":28},"HighMiddleAge":{"population":530,"happiness":1010,"demandHappiness":530,"money_24h":3880,"strategy_points_24h":9,"random_good_of_age_24h":28},"LateMiddleAge":{"population":700,"happiness":1130,"demandHappiness":700,"money_24h":5120,"strategy_points_24h":9,"random_good_of_age_24h":28},"ColonialAge":{"population":890,"happiness":1330,"demandHappiness":890,"money_24h":7800,"strategy_points_24h":9,"random_good_of_age_24h":28},"IndustrialAge":{"population":1080,"happiness":1500,"demandHappiness":1080,"money_24h":9720,"strategy_points_24h":9,"random_good_of_age_24h":28},"ProgressiveEra":{"population":1290,"happiness":1650,"demandHappiness":1290,"money_24h":11790,"strategy_points_24h":9,"random_good_of_age_24h":28},"ModernEra":{"population":1510,"happiness":1760,"demandHappiness":1510,"money_24h":14670,"strategy_points_24h":9,"random_good_of_age_24h":28},"PostModernEra":{"population":1750,"happiness":1830,"demandHappiness":1750,"money_24h":18460,"strategy_points_24h":9,"random_good_of_age_24h":28},"ContemporaryEra":{"population":1990,"happiness":2130,"demandHappiness":1990,"money_24h":24030,"strategy_points_24h":9,"random_good_of_age_24h":28},"TomorrowEra":{"population":2240,"happiness":2590,"demandHappiness":2240,"money_24h":27820,"strategy_points_24h":9,"random_good_of_age_24h":28},"FutureEra":{"population":2510,"happiness":3100,"demandHappiness":2510,"money_24h":31890,"strategy_points_24h":9,"random_good_of_age_24h":28},"ArcticFuture":{"population":2780,"happiness":3610,"demandHappiness":2780,"money_24h":36240,"strategy_points_24h":9,"random_good_of_age_24h":28},"OceanicFuture":{"population":3060,"happiness":4170,"demandHappiness":3060,"money_24h":40860,"strategy_points_24h":9,"random_good_of_age_24h":28},"VirtualFuture":{"population":3350,"happiness":4980,"demandHappiness":3350,"money_24h":45760,"strategy_points_24h":9,"random_good_of_age_24h":28},"SpaceAgeMars":{"population":5310,"happiness":7960,"demandHappiness":5310,"money_24h":76440,"strategy_points_24h":9,"random_good_of_age_24h":28},"SpaceAgeAsteroidBelt":{"population":5770,"happiness":8650,"demandHappiness":5770,"money_24h":84670,"strategy_points_24h":9,"random_good_of_age_24h":28},"SpaceAgeVenus":{"population":6230,"happiness":9350,"demandHappiness":6230,"money_24h":93340,"strategy_points_24h":9,"random_good_of_age_24h":28},"SpaceAgeJupiterMoon":{"population":6710,"happiness":10070,"demandHappiness":6710,"money_24h":102440,"strategy_points_24h":9,"random_good_of_age_24h":28},"SpaceAgeTitan":{"population":7200,"happiness":10800,"demandHappiness":7200,"money_24h":112000,"strategy_points_24h":9,"random_good_of_age_24h":28},"SpaceAgeSpaceHub":{"population":7690,"happiness":11530,"demandHappiness":7690,"money_24h":121560,"strategy_points_24h":9,"random_good_of_age_24h":28}}, boosts: [{"type":"att_boost_attacker","value":4,"feature":"all"},{"type":"att_boost_defender","value":6,"feature":"all"}] },
+    "W_MultiAge_ANNI24A10": { prod: {"BronzeAge":{"population":230,"happiness":950,"demandHappiness":230,"money_24h":1580,"medals_24h":150,"strategy_points_24h":18,"random_good_of_age_24h":64},"IronAge":{"population":500,"happiness":1640,"demandHappiness":500,"money_24h":3800,"medals_24h":200,"strategy_points_24h":18,"random_good_of_age_24h":64},"EarlyMiddleAge":{"population":760,"happiness":1820,"demandHappiness":760,"money_24h":6330,"medals_24h":240,"strategy_points_24h":18,"random_good_of_age_24h":64},"HighMiddleAge":{"population":1070,"happiness":2030,"demandHappiness":1070,"money_24h":8860,"medals_24h":290,"strategy_points_24h":18,"random_good_of_age_24h":64},"LateMiddleAge":{"population":1400,"happiness":2260,"demandHappiness":1400,"money_24h":11710,"medals_24h":330,"strategy_points_24h":18,"random_good_of_age_24h":64},"ColonialAge":{"population":1770,"happiness":2660,"demandHappiness":1770,"money_24h":17830,"medals_24h":400,"strategy_points_24h":18,"random_good_of_age_24h":64},"IndustrialAge":{"population":2160,"happiness":3000,"demandHappiness":2160,"money_24h":22210,"medals_24h":550,"strategy_points_24h":18,"random_good_of_age_24h":64},"ProgressiveEra":{"population":2580,"happiness":3290,"demandHappiness":2580,"money_24h":26950,"medals_24h":770,"strategy_points_24h":18,"random_good_of_age_24h":64},"ModernEra":{"population":3030,"happiness":3520,"demandHappiness":3030,"money_24h":33530,"medals_24h":1100,"strategy_points_24h":18,"random_good_of_age_24h":64},"PostModernEra":{"population":3490,"happiness":3670,"demandHappiness":3490,"money_24h":42190,"medals_24h":1540,"strategy_points_24h":18,"random_good_of_age_24h":64},"ContemporaryEra":{"population":3980,"happiness":4260,"demandHappiness":3980,"money_24h":54920,"medals_24h":2210,"strategy_points_24h":18,"random_good_of_age_24h":64},"TomorrowEra":{"population":4480,"happiness":5170,"demandHappiness":4480,"money_24h":63590,"medals_24h":2980,"strategy_points_24h":18,"random_good_of_age_24h":64},"FutureEra":{"population":5010,"happiness":6200,"demandHappiness":5010,"money_24h":72890,"medals_24h":3640,"strategy_points_24h":18,"random_good_of_age_24h":64},"ArcticFuture":{"population":5560,"happiness":7220,"demandHappiness":5560,"money_24h":82820,"medals_24h":4410,"strategy_points_24h":18,"random_good_of_age_24h":64},"OceanicFuture":{"population":6130,"happiness":8330,"demandHappiness":6130,"money_24h":93390,"medals_24h":5080,"strategy_points_24h":18,"random_good_of_age_24h":64},"VirtualFuture":{"population":6710,"happiness":9950,"demandHappiness":6710,"money_24h":104610,"medals_24h":6180,"strategy_points_24h":18,"random_good_of_age_24h":64},"SpaceAgeMars":{"population":10620,"happiness":15920,"demandHappiness":10620,"money_24h":174730,"medals_24h":7500,"strategy_points_24h":18,"random_good_of_age_24h":64},"SpaceAgeAsteroidBelt":{"population":11530,"happiness":17310,"demandHappiness":11530,"money_24h":193530,"medals_24h":8830,"strategy_points_24h":18,"random_good_of_age_24h":64},"SpaceAgeVenus":{"population":12470,"happiness":18700,"demandHappiness":12470,"money_24h":213340,"medals_24h":10150,"strategy_points_24h":18,"random_good_of_age_24h":64},"SpaceAgeJupiterMoon":{"population":13420,"happiness":20140,"demandHappiness":13420,"money_24h":234160,"medals_24h":11480,"strategy_points_24h":18,"random_good_of_age_24h":64},"SpaceAgeTitan":{"population":14400,"happiness":21600,"demandHappiness":14400,"money_24h":256000,"medals_24h":12800,"strategy_points_24h":18,"random_good_of_age_24h":64},"SpaceAgeSpaceHub":{"population":15380,"happiness":23060,"demandHappiness":15380,"money_24h":277840,"medals_24h":14120,"strategy_points_24h":18,"random_good_of_age_24h":64}}, boosts: [{"type":"att_boost_attacker","value":16,"feature":"all"},{"type":"att_boost_attacker","value":16,"feature":"battleground"},{"type":"att_boost_attacker","value":12,"feature":"guild_expedition"},{"type":"att_boost_defender","value":20,"feature":"all"},{"type":"att_boost_defender","value":18,"feature":"battleground"},{"type":"att_boost_defender","value":12,"feature":"guild_expedition"}] },
+    "W_MultiAge_ANNI24A2": { prod: {"BronzeAge":{"population":130,"happiness":530,"demandHappiness":130,"money_24h":790,"strategy_points_24h":10,"random_good_of_age_24h":32},"IronAge":{"population":280,"happiness":910,"demandHappiness":280,"money_24h":1900,"strategy_points_24h":10,"random_good_of_age_24h":32},"EarlyMiddleAge":{"population":420,"happiness":1010,"demandHappiness":420,"money_24h":3160,"strategy_points_24h":10,"random_good_of_age_24h":32},"HighMiddleAge":{"population":590,"happiness":1130,"demandHappiness":590,"money_24h":4430,"strategy_points_24h":10,"random_good_of_age_24h":32},"LateMiddleAge":{"population":780,"happiness":1260,"demandHappiness":780,"money_24h":5850,"strategy_points_24h":10,"random_good_of_age_24h":32},"ColonialAge":{"population":980,"happiness":1480,"demandHappiness":980,"money_24h":8910,"strategy_points_24h":10,"random_good_of_age_24h":32},"IndustrialAge":{"population":1200,"happiness":1660,"demandHappiness":1200,"money_24h":11100,"strategy_points_24h":10,"random_good_of_age_24h":32},"ProgressiveEra":{"population":1440,"happiness":1830,"demandHappiness":1440,"money_24h":13480,"strategy_points_24h":10,"random_good_of_age_24h":32},"ModernEra":{"population":1680,"happiness":1960,"demandHappiness":1680,"money_24h":16770,"strategy_points_24h":10,"random_good_of_age_24h":32},"PostModernEra":{"population":1940,"happiness":2040,"demandHappiness":1940,"money_24h":21090,"strategy_points_24h":10,"random_good_of_age_24h":32},"ContemporaryEra":{"population":2210,"happiness":2370,"demandHappiness":2210,"money_24h":27460,"strategy_points_24h":10,"random_good_of_age_24h":32},"TomorrowEra":{"population":2490,"happiness":2870,"demandHappiness":2490,"money_24h":31790,"strategy_points_24h":10,"random_good_of_age_24h":32},"FutureEra":{"population":2790,"happiness":3440,"demandHappiness":2790,"money_24h":36440,"strategy_points_24h":10,"random_good_of_age_24h":32},"ArcticFuture":{"population":3090,"happiness":4010,"demandHappiness":3090,"money_24h":41410,"strategy_points_24h":10,"random_good_of_age_24h":32},"OceanicFuture":{"population":3400,"happiness":4630,"demandHappiness":3400,"money_24h":46700,"strategy_points_24h":10,"random_good_of_age_24h":32},"VirtualFuture":{"population":3730,"happiness":5530,"demandHappiness":3730,"money_24h":52300,"strategy_points_24h":10,"random_good_of_age_24h":32},"SpaceAgeMars":{"population":5900,"happiness":8850,"demandHappiness":5900,"money_24h":87360,"strategy_points_24h":10,"random_good_of_age_24h":32},"SpaceAgeAsteroidBelt":{"population":6410,"happiness":9610,"demandHappiness":6410,"money_24h":96770,"strategy_points_24h":10,"random_good_of_age_24h":32},"SpaceAgeVenus":{"population":6930,"happiness":10390,"demandHappiness":6930,"money_24h":106670,"strategy_points_24h":10,"random_good_of_age_24h":32},"SpaceAgeJupiterMoon":{"population":7460,"happiness":11190,"demandHappiness":7460,"money_24h":117080,"strategy_points_24h":10,"random_good_of_age_24h":32},"SpaceAgeTitan":{"population":8000,"happiness":12000,"demandHappiness":8000,"money_24h":128000,"strategy_points_24h":10,"random_good_of_age_24h":32},"SpaceAgeSpaceHub":{"population":8540,"happiness":12810,"demandHappiness":8540,"money_24h":138920,"strategy_points_24h":10,"random_good_of_age_24h":32}}, boosts: [{"type":"att_boost_attacker","value":6,"feature":"all"},{"type":"att_boost_defender","value":8,"feature":"all"}] },
+    "W_MultiAge_ANNI24A3": { prod: {"BronzeAge":{"population":140,"happiness":580,"demandHappiness":140,"money_24h":890,"medals_24h":20,"strategy_points_24h":11,"random_good_of_age_24h":36},"IronAge":{"population":300,"happiness":1000,"demandHappiness":300,"money_24h":2140,"medals_24h":20,"strategy_points_24h":11,"random_good_of_age_24h":36},"EarlyMiddleAge":{"population":470,"happiness":1110,"demandHappiness":470,"money_24h":3560,"medals_24h":30,"strategy_points_24h":11,"random_good_of_age_24h":36},"HighMiddleAge":{"population":650,"happiness":1240,"demandHappiness":650,"money_24h":4980,"medals_24h":40,"strategy_points_24h":11,"random_good_of_age_24h":36},"LateMiddleAge":{"population":860,"happiness":1380,"demandHappiness":860,"money_24h":6580,"medals_24h":40,"strategy_points_24h":11,"random_good_of_age_24h":36},"ColonialAge":{"population":1080,"happiness":1620,"demandHappiness":1080,"money_24h":10030,"medals_24h":50,"strategy_points_24h":11,"random_good_of_age_24h":36},"IndustrialAge":{"population":1320,"happiness":1830,"demandHappiness":1320,"money_24h":12490,"medals_24h":70,"strategy_points_24h":11,"random_good_of_age_24h":36},"ProgressiveEra":{"population":1580,"happiness":2010,"demandHappiness":1580,"money_24h":15160,"medals_24h":100,"strategy_points_24h":11,"random_good_of_age_24h":36},"ModernEra":{"population":1850,"happiness":2150,"demandHappiness":1850,"money_24h":18860,"medals_24h":140,"strategy_points_24h":11,"random_good_of_age_24h":36},"PostModernEra":{"population":2130,"happiness":2240,"demandHappiness":2130,"money_24h":23730,"medals_24h":190,"strategy_points_24h":11,"random_good_of_age_24h":36},"ContemporaryEra":{"population":2430,"happiness":2610,"demandHappiness":2430,"money_24h":30890,"medals_24h":280,"strategy_points_24h":11,"random_good_of_age_24h":36},"TomorrowEra":{"population":2740,"happiness":3160,"demandHappiness":2740,"money_24h":35770,"medals_24h":370,"strategy_points_24h":11,"random_good_of_age_24h":36},"FutureEra":{"population":3060,"happiness":3790,"demandHappiness":3060,"money_24h":41000,"medals_24h":460,"strategy_points_24h":11,"random_good_of_age_24h":36},"ArcticFuture":{"population":3400,"happiness":4410,"demandHappiness":3400,"money_24h":46590,"medals_24h":550,"strategy_points_24h":11,"random_good_of_age_24h":36},"OceanicFuture":{"population":3740,"happiness":5090,"demandHappiness":3740,"money_24h":52530,"medals_24h":630,"strategy_points_24h":11,"random_good_of_age_24h":36},"VirtualFuture":{"population":4100,"happiness":6080,"demandHappiness":4100,"money_24h":58840,"medals_24h":770,"strategy_points_24h":11,"random_good_of_age_24h":36},"SpaceAgeMars":{"population":6490,"happiness":9730,"demandHappiness":6490,"money_24h":98280,"medals_24h":940,"strategy_points_24h":11,"random_good_of_age_24h":36},"SpaceAgeAsteroidBelt":{"population":7050,"happiness":10580,"demandHappiness":7050,"money_24h":108860,"medals_24h":1100,"strategy_points_24h":11,"random_good_of_age_24h":36},"SpaceAgeVenus":{"population":7620,"happiness":11430,"demandHappiness":7620,"money_24h":120000,"medals_24h":1270,"strategy_points_24h":11,"random_good_of_age_24h":36},"SpaceAgeJupiterMoon":{"population":8200,"happiness":12310,"demandHappiness":8200,"money_24h":131710,"medals_24h":1430,"strategy_points_24h":11,"random_good_of_age_24h":36},"SpaceAgeTitan":{"population":8800,"happiness":13200,"demandHappiness":8800,"money_24h":144000,"medals_24h":1600,"strategy_points_24h":11,"random_good_of_age_24h":36},"SpaceAgeSpaceHub":{"population":9400,"happiness":14090,"demandHappiness":9400,"money_24h":156290,"medals_24h":1770,"strategy_points_24h":11,"random_good_of_age_24h":36}}, boosts: [{"type":"att_boost_attacker","value":8,"feature":"all"},{"type":"att_boost_defender","value":10,"feature":"all"}] },
+    "W_MultiAge_ANNI24A4": { prod: {"BronzeAge":{"population":150,"happiness":640,"demandHappiness":150,"money_24h":990,"medals_24h":40,"strategy_points_24h":12,"random_good_of_age_24h":40},"IronAge":{"population":330,"happiness":1100,"demandHappiness":330,"money_24h":2370,"medals_24h":50,"strategy_points_24h":12,"random_good_of_age_24h":40},"EarlyMiddleAge":{"population":510,"happiness":1210,"demandHappiness":510,"money_24h":3950,"medals_24h":60,"strategy_points_24h":12,"random_good_of_age_24h":40},"HighMiddleAge":{"population":710,"happiness":1350,"demandHappiness":710,"money_24h":5540,"medals_24h":70,"strategy_points_24h":12,"random_good_of_age_24h":40},"LateMiddleAge":{"population":940,"happiness":1510,"demandHappiness":940,"money_24h":7320,"medals_24h":80,"strategy_points_24h":12,"random_good_of_age_24h":40},"ColonialAge":{"population":1180,"happiness":1770,"demandHappiness":1180,"money_24h":11140,"medals_24h":100,"strategy_points_24h":12,"random_good_of_age_24h":40},"IndustrialAge":{"population":1440,"happiness":2000,"demandHappiness":1440,"money_24h":13880,"medals_24h":140,"strategy_points_24h":12,"random_good_of_age_24h":40},"ProgressiveEra":{"population":1720,"happiness":2190,"demandHappiness":1720,"money_24h":16850,"medals_24h":190,"strategy_points_24h":12,"random_good_of_age_24h":40},"ModernEra":{"population":2020,"happiness":2350,"demandHappiness":2020,"money_24h":20960,"medals_24h":280,"strategy_points_24h":12,"random_good_of_age_24h":40},"PostModernEra":{"population":2330,"happiness":2450,"demandHappiness":2330,"money_24h":26370,"medals_24h":390,"strategy_points_24h":12,"random_good_of_age_24h":40},"ContemporaryEra":{"population":2650,"happiness":2840,"demandHappiness":2650,"money_24h":34330,"medals_24h":550,"strategy_points_24h":12,"random_good_of_age_24h":40},"TomorrowEra":{"population":2990,"happiness":3450,"demandHappiness":2990,"money_24h":39740,"medals_24h":740,"strategy_points_24h":12,"random_good_of_age_24h":40},"FutureEra":{"population":3340,"happiness":4130,"demandHappiness":3340,"money_24h":45560,"medals_24h":910,"strategy_points_24h":12,"random_good_of_age_24h":40},"ArcticFuture":{"population":3710,"happiness":4810,"demandHappiness":3710,"money_24h":51760,"medals_24h":1100,"strategy_points_24h":12,"random_good_of_age_24h":40},"OceanicFuture":{"population":4080,"happiness":5550,"demandHappiness":4080,"money_24h":58370,"medals_24h":1270,"strategy_points_24h":12,"random_good_of_age_24h":40},"VirtualFuture":{"population":4470,"happiness":6630,"demandHappiness":4470,"money_24h":65380,"medals_24h":1540,"strategy_points_24h":12,"random_good_of_age_24h":40},"SpaceAgeMars":{"population":7080,"happiness":10620,"demandHappiness":7080,"money_24h":109200,"medals_24h":1880,"strategy_points_24h":12,"random_good_of_age_24h":40},"SpaceAgeAsteroidBelt":{"population":7690,"happiness":11540,"demandHappiness":7690,"money_24h":120960,"medals_24h":2210,"strategy_points_24h":12,"random_good_of_age_24h":40},"SpaceAgeVenus":{"population":8310,"happiness":12460,"demandHappiness":8310,"money_24h":133340,"medals_24h":2540,"strategy_points_24h":12,"random_good_of_age_24h":40},"SpaceAgeJupiterMoon":{"population":8950,"happiness":13430,"demandHappiness":8950,"money_24h":146350,"medals_24h":2870,"strategy_points_24h":12,"random_good_of_age_24h":40},"SpaceAgeTitan":{"population":9600,"happiness":14400,"demandHappiness":9600,"money_24h":160000,"medals_24h":3200,"strategy_points_24h":12,"random_good_of_age_24h":40},"SpaceAgeSpaceHub":{"population":10250,"happiness":15370,"demandHappiness":10250,"money_24h":173650,"medals_24h":3530,"strategy_points_24h":12,"random_good_of_age_24h":40}}, boosts: [{"type":"att_boost_attacker","value":10,"feature":"all"},{"type":"att_boost_attacker","value":4,"feature":"battleground"},{"type":"att_boost_defender","value":12,"feature":"all"}] },
+    "W_MultiAge_ANNI24A5": { prod: {"BronzeAge":{"population":170,"happiness":690,"demandHappiness":170,"money_24h":1090,"medals_24h":60,"strategy_points_24h":13,"random_good_of_age_24h":44},"IronAge":{"population":360,"happiness":1190,"demandHappiness":360,"money_24h":2610,"medals_24h":70,"strategy_points_24h":13,"random_good_of_age_24h":44},"EarlyMiddleAge":{"population":550,"happiness":1310,"demandHappiness":550,"money_24h":4350,"medals_24h":90,"strategy_points_24h":13,"random_good_of_age_24h":44},"HighMiddleAge":{"population":770,"happiness":1460,"demandHappiness":770,"money_24h":6090,"medals_24h":110,"strategy_points_24h":13,"random_good_of_age_24h":44},"LateMiddleAge":{"population":1010,"happiness":1630,"demandHappiness":1010,"money_24h":8050,"medals_24h":120,"strategy_points_24h":13,"random_good_of_age_24h":44},"ColonialAge":{"population":1280,"happiness":1920,"demandHappiness":1280,"money_24h":12260,"medals_24h":150,"strategy_points_24h":13,"random_good_of_age_24h":44},"IndustrialAge":{"population":1560,"happiness":2160,"demandHappiness":1560,"money_24h":15270,"medals_24h":210,"strategy_points_24h":13,"random_good_of_age_24h":44},"ProgressiveEra":{"population":1870,"happiness":2380,"demandHappiness":1870,"money_24h":18530,"medals_24h":290,"strategy_points_24h":13,"random_good_of_age_24h":44},"ModernEra":{"population":2190,"happiness":2540,"demandHappiness":2190,"money_24h":23050,"medals_24h":410,"strategy_points_24h":13,"random_good_of_age_24h":44},"PostModernEra":{"population":2520,"happiness":2650,"demandHappiness":2520,"money_24h":29000,"medals_24h":580,"strategy_points_24h":13,"random_good_of_age_24h":44},"ContemporaryEra":{"population":2870,"happiness":3080,"demandHappiness":2870,"money_24h":37760,"medals_24h":830,"strategy_points_24h":13,"random_good_of_age_24h":44},"TomorrowEra":{"population":3240,"happiness":3740,"demandHappiness":3240,"money_24h":43720,"medals_24h":1120,"strategy_points_24h":13,"random_good_of_age_24h":44},"FutureEra":{"population":3620,"happiness":4480,"demandHappiness":3620,"money_24h":50110,"medals_24h":1370,"strategy_points_24h":13,"random_good_of_age_24h":44},"ArcticFuture":{"population":4020,"happiness":5210,"demandHappiness":4020,"money_24h":56940,"medals_24h":1660,"strategy_points_24h":13,"random_good_of_age_24h":44},"OceanicFuture":{"population":4420,"happiness":6020,"demandHappiness":4420,"money_24h":64210,"medals_24h":1900,"strategy_points_24h":13,"random_good_of_age_24h":44},"VirtualFuture":{"population":4840,"happiness":7190,"demandHappiness":4840,"money_24h":71920,"medals_24h":2320,"strategy_points_24h":13,"random_good_of_age_24h":44},"SpaceAgeMars":{"population":7670,"happiness":11500,"demandHappiness":7670,"money_24h":120120,"medals_24h":2810,"strategy_points_24h":13,"random_good_of_age_24h":44},"SpaceAgeAsteroidBelt":{"population":8330,"happiness":12500,"demandHappiness":8330,"money_24h":133050,"medals_24h":3310,"strategy_points_24h":13,"random_good_of_age_24h":44},"SpaceAgeVenus":{"population":9000,"happiness":13500,"demandHappiness":9000,"money_24h":146670,"medals_24h":3810,"strategy_points_24h":13,"random_good_of_age_24h":44},"SpaceAgeJupiterMoon":{"population":9700,"happiness":14550,"demandHappiness":9700,"money_24h":160980,"medals_24h":4300,"strategy_points_24h":13,"random_good_of_age_24h":44},"SpaceAgeTitan":{"population":10400,"happiness":15600,"demandHappiness":10400,"money_24h":176000,"medals_24h":4800,"strategy_points_24h":13,"random_good_of_age_24h":44},"SpaceAgeSpaceHub":{"population":11100,"happiness":16650,"demandHappiness":11100,"money_24h":191020,"medals_24h":5300,"strategy_points_24h":13,"random_good_of_age_24h":44}}, boosts: [{"type":"att_boost_attacker","value":12,"feature":"all"},{"type":"att_boost_attacker","value":6,"feature":"battleground"},{"type":"att_boost_defender","value":14,"feature":"all"}] },
+    "W_MultiAge_ANNI24A6": { prod: {"BronzeAge":{"population":180,"happiness":740,"demandHappiness":180,"money_24h":1190,"medals_24h":80,"strategy_points_24h":14,"random_good_of_age_24h":48},"IronAge":{"population":390,"happiness":1280,"demandHappiness":390,"money_24h":2850,"medals_24h":100,"strategy_points_24h":14,"random_good_of_age_24h":48},"EarlyMiddleAge":{"population":590,"happiness":1410,"demandHappiness":590,"money_24h":4750,"medals_24h":120,"strategy_points_24h":14,"random_good_of_age_24h":48},"HighMiddleAge":{"population":830,"happiness":1580,"demandHappiness":830,"money_24h":6640,"medals_24h":140,"strategy_points_24h":14,"random_good_of_age_24h":48},"LateMiddleAge":{"population":1090,"happiness":1760,"demandHappiness":1090,"money_24h":8780,"medals_24h":170,"strategy_points_24h":14,"random_good_of_age_24h":48},"ColonialAge":{"population":1380,"happiness":2070,"demandHappiness":1380,"money_24h":13370,"medals_24h":200,"strategy_points_24h":14,"random_good_of_age_24h":48},"IndustrialAge":{"population":1680,"happiness":2330,"demandHappiness":1680,"money_24h":16660,"medals_24h":280,"strategy_points_24h":14,"random_good_of_age_24h":48},"ProgressiveEra":{"population":2010,"happiness":2560,"demandHappiness":2010,"money_24h":20220,"medals_24h":390,"strategy_points_24h":14,"random_good_of_age_24h":48},"ModernEra":{"population":2360,"happiness":2740,"demandHappiness":2360,"money_24h":25150,"medals_24h":550,"strategy_points_24h":14,"random_good_of_age_24h":48},"PostModernEra":{"population":2720,"happiness":2850,"demandHappiness":2720,"money_24h":31640,"medals_24h":770,"strategy_points_24h":14,"random_good_of_age_24h":48},"ContemporaryEra":{"population":3090,"happiness":3320,"demandHappiness":3090,"money_24h":41190,"medals_24h":1100,"strategy_points_24h":14,"random_good_of_age_24h":48},"TomorrowEra":{"population":3490,"happiness":4020,"demandHappiness":3490,"money_24h":47690,"medals_24h":1490,"strategy_points_24h":14,"random_good_of_age_24h":48},"FutureEra":{"population":3900,"happiness":4820,"demandHappiness":3900,"money_24h":54670,"medals_24h":1820,"strategy_points_24h":14,"random_good_of_age_24h":48},"ArcticFuture":{"population":4330,"happiness":5610,"demandHappiness":4330,"money_24h":62120,"medals_24h":2210,"strategy_points_24h":14,"random_good_of_age_24h":48},"OceanicFuture":{"population":4760,"happiness":6480,"demandHappiness":4760,"money_24h":70040,"medals_24h":2540,"strategy_points_24h":14,"random_good_of_age_24h":48},"VirtualFuture":{"population":5220,"happiness":7740,"demandHappiness":5220,"money_24h":78450,"medals_24h":3090,"strategy_points_24h":14,"random_good_of_age_24h":48},"SpaceAgeMars":{"population":8260,"happiness":12390,"demandHappiness":8260,"money_24h":131040,"medals_24h":3750,"strategy_points_24h":14,"random_good_of_age_24h":48},"SpaceAgeAsteroidBelt":{"population":8970,"happiness":13460,"demandHappiness":8970,"money_24h":145150,"medals_24h":4410,"strategy_points_24h":14,"random_good_of_age_24h":48},"SpaceAgeVenus":{"population":9700,"happiness":14540,"demandHappiness":9700,"money_24h":160000,"medals_24h":5080,"strategy_points_24h":14,"random_good_of_age_24h":48},"SpaceAgeJupiterMoon":{"population":10440,"happiness":15660,"demandHappiness":10440,"money_24h":175620,"medals_24h":5740,"strategy_points_24h":14,"random_good_of_age_24h":48},"SpaceAgeTitan":{"population":11200,"happiness":16800,"demandHappiness":11200,"money_24h":192000,"medals_24h":6400,"strategy_points_24h":14,"random_good_of_age_24h":48},"SpaceAgeSpaceHub":{"population":11960,"happiness":17940,"demandHappiness":11960,"money_24h":208380,"medals_24h":7060,"strategy_points_24h":14,"random_good_of_age_24h":48}}, boosts: [{"type":"att_boost_attacker","value":14,"feature":"all"},{"type":"att_boost_attacker","value":8,"feature":"battleground"},{"type":"att_boost_attacker","value":4,"feature":"guild_expedition"},{"type":"att_boost_defender","value":16,"feature":"all"}] },
+    "W_MultiAge_ANNI24A7": { prod: {"BronzeAge":{"population":190,"happiness":790,"demandHappiness":190,"money_24h":1290,"medals_24h":100,"strategy_points_24h":15,"random_good_of_age_24h":52},"IronAge":{"population":410,"happiness":1370,"demandHappiness":410,"money_24h":3080,"medals_24h":120,"strategy_points_24h":15,"random_good_of_age_24h":52},"EarlyMiddleAge":{"population":630,"happiness":1510,"demandHappiness":630,"money_24h":5140,"medals_24h":150,"strategy_points_24h":15,"random_good_of_age_24h":52},"HighMiddleAge":{"population":890,"happiness":1690,"demandHappiness":890,"money_24h":7200,"medals_24h":180,"strategy_points_24h":15,"random_good_of_age_24h":52},"LateMiddleAge":{"population":1170,"happiness":1880,"demandHappiness":1170,"money_24h":9510,"medals_24h":210,"strategy_points_24h":15,"random_good_of_age_24h":52},"ColonialAge":{"population":1480,"happiness":2210,"demandHappiness":1480,"money_24h":14480,"medals_24h":250,"strategy_points_24h":15,"random_good_of_age_24h":52},"IndustrialAge":{"population":1800,"happiness":2500,"demandHappiness":1800,"money_24h":18040,"medals_24h":340,"strategy_points_24h":15,"random_good_of_age_24h":52},"ProgressiveEra":{"population":2150,"happiness":2740,"demandHappiness":2150,"money_24h":21900,"medals_24h":480,"strategy_points_24h":15,"random_good_of_age_24h":52},"ModernEra":{"population":2520,"happiness":2930,"demandHappiness":2520,"money_24h":27250,"medals_24h":690,"strategy_points_24h":15,"random_good_of_age_24h":52},"PostModernEra":{"population":2910,"happiness":3060,"demandHappiness":2910,"money_24h":34280,"medals_24h":970,"strategy_points_24h":15,"random_good_of_age_24h":52},"ContemporaryEra":{"population":3320,"happiness":3550,"demandHappiness":3320,"money_24h":44620,"medals_24h":1380,"strategy_points_24h":15,"random_good_of_age_24h":52},"TomorrowEra":{"population":3740,"happiness":4310,"demandHappiness":3740,"money_24h":51670,"medals_24h":1860,"strategy_points_24h":15,"random_good_of_age_24h":52},"FutureEra":{"population":4180,"happiness":5170,"demandHappiness":4180,"money_24h":59220,"medals_24h":2280,"strategy_points_24h":15,"random_good_of_age_24h":52},"ArcticFuture":{"population":4630,"happiness":6020,"demandHappiness":4630,"money_24h":67290,"medals_24h":2760,"strategy_points_24h":15,"random_good_of_age_24h":52},"OceanicFuture":{"population":5110,"happiness":6940,"demandHappiness":5110,"money_24h":75880,"medals_24h":3170,"strategy_points_24h":15,"random_good_of_age_24h":52},"VirtualFuture":{"population":5590,"happiness":8290,"demandHappiness":5590,"money_24h":84990,"medals_24h":3860,"strategy_points_24h":15,"random_good_of_age_24h":52},"SpaceAgeMars":{"population":8850,"happiness":13270,"demandHappiness":8850,"money_24h":141970,"medals_24h":4690,"strategy_points_24h":15,"random_good_of_age_24h":52},"SpaceAgeAsteroidBelt":{"population":9610,"happiness":14420,"demandHappiness":9610,"money_24h":157250,"medals_24h":5520,"strategy_points_24h":15,"random_good_of_age_24h":52},"SpaceAgeVenus":{"population":10390,"happiness":15580,"demandHappiness":10390,"money_24h":173340,"medals_24h":6340,"strategy_points_24h":15,"random_good_of_age_24h":52},"SpaceAgeJupiterMoon":{"population":11190,"happiness":16780,"demandHappiness":11190,"money_24h":190250,"medals_24h":7170,"strategy_points_24h":15,"random_good_of_age_24h":52},"SpaceAgeTitan":{"population":12000,"happiness":18000,"demandHappiness":12000,"money_24h":208000,"medals_24h":8000,"strategy_points_24h":15,"random_good_of_age_24h":52},"SpaceAgeSpaceHub":{"population":12810,"happiness":19220,"demandHappiness":12810,"money_24h":225750,"medals_24h":8830,"strategy_points_24h":15,"random_good_of_age_24h":52}}, boosts: [{"type":"att_boost_attacker","value":16,"feature":"all"},{"type":"att_boost_attacker","value":10,"feature":"battleground"},{"type":"att_boost_attacker","value":6,"feature":"guild_expedition"},{"type":"att_boost_defender","value":18,"feature":"all"}] },
+    "W_MultiAge_ANNI24A9": { prod: {"BronzeAge":{"population":220,"happiness":900,"demandHappiness":220,"money_24h":1480,"medals_24h":140,"strategy_points_24h":17,"random_good_of_age_24h":60},"IronAge":{"population":470,"happiness":1550,"demandHappiness":470,"money_24h":3560,"medals_24h":170,"strategy_points_24h":17,"random_good_of_age_24h":60},"EarlyMiddleAge":{"population":720,"happiness":1720,"demandHappiness":720,"money_24h":5930,"medals_24h":210,"strategy_points_24h":17,"random_good_of_age_24h":60},"HighMiddleAge":{"population":1010,"happiness":1910,"demandHappiness":1010,"money_24h":8300,"medals_24h":250,"strategy_points_24h":17,"random_good_of_age_24h":60},"LateMiddleAge":{"population":1330,"happiness":2130,"demandHappiness":1330,"money_24h":10970,"medals_24h":290,"strategy_points_24h":17,"random_good_of_age_24h":60},"ColonialAge":{"population":1670,"happiness":2510,"demandHappiness":1670,"money_24h":16710,"medals_24h":350,"strategy_points_24h":17,"random_good_of_age_24h":60},"IndustrialAge":{"population":2040,"happiness":2830,"demandHappiness":2040,"money_24h":20820,"medals_24h":480,"strategy_points_24h":17,"random_good_of_age_24h":60},"ProgressiveEra":{"population":2440,"happiness":3110,"demandHappiness":2440,"money_24h":25270,"medals_24h":680,"strategy_points_24h":17,"random_good_of_age_24h":60},"ModernEra":{"population":2860,"happiness":3330,"demandHappiness":2860,"money_24h":31440,"medals_24h":970,"strategy_points_24h":17,"random_good_of_age_24h":60},"PostModernEra":{"population":3300,"happiness":3460,"demandHappiness":3300,"money_24h":39550,"medals_24h":1350,"strategy_points_24h":17,"random_good_of_age_24h":60},"ContemporaryEra":{"population":3760,"happiness":4030,"demandHappiness":3760,"money_24h":51490,"medals_24h":1930,"strategy_points_24h":17,"random_good_of_age_24h":60},"TomorrowEra":{"population":4230,"happiness":4890,"demandHappiness":4230,"money_24h":59610,"medals_24h":2610,"strategy_points_24h":17,"random_good_of_age_24h":60},"FutureEra":{"population":4740,"happiness":5860,"demandHappiness":4740,"money_24h":68330,"medals_24h":3190,"strategy_points_24h":17,"random_good_of_age_24h":60},"ArcticFuture":{"population":5250,"happiness":6820,"demandHappiness":5250,"money_24h":77650,"medals_24h":3860,"strategy_points_24h":17,"random_good_of_age_24h":60},"OceanicFuture":{"population":5790,"happiness":7870,"demandHappiness":5790,"money_24h":87550,"medals_24h":4440,"strategy_points_24h":17,"random_good_of_age_24h":60},"VirtualFuture":{"population":6340,"happiness":9400,"demandHappiness":6340,"money_24h":98070,"medals_24h":5410,"strategy_points_24h":17,"random_good_of_age_24h":60},"SpaceAgeMars":{"population":10030,"happiness":15040,"demandHappiness":10030,"money_24h":163810,"medals_24h":6570,"strategy_points_24h":17,"random_good_of_age_24h":60},"SpaceAgeAsteroidBelt":{"population":10890,"happiness":16340,"demandHappiness":10890,"money_24h":181440,"medals_24h":7720,"strategy_points_24h":17,"random_good_of_age_24h":60},"SpaceAgeVenus":{"population":11770,"happiness":17660,"demandHappiness":11770,"money_24h":200000,"medals_24h":8880,"strategy_points_24h":17,"random_good_of_age_24h":60},"SpaceAgeJupiterMoon":{"population":12680,"happiness":19020,"demandHappiness":12680,"money_24h":219520,"medals_24h":10040,"strategy_points_24h":17,"random_good_of_age_24h":60},"SpaceAgeTitan":{"population":13600,"happiness":20400,"demandHappiness":13600,"money_24h":240000,"medals_24h":11200,"strategy_points_24h":17,"random_good_of_age_24h":60},"SpaceAgeSpaceHub":{"population":14520,"happiness":21780,"demandHappiness":14520,"money_24h":260480,"medals_24h":12360,"strategy_points_24h":17,"random_good_of_age_24h":60}}, boosts: [{"type":"att_boost_attacker","value":16,"feature":"all"},{"type":"att_boost_attacker","value":14,"feature":"battleground"},{"type":"att_boost_attacker","value":10,"feature":"guild_expedition"},{"type":"att_boost_defender","value":20,"feature":"all"},{"type":"att_boost_defender","value":15,"feature":"battleground"}] },
+    "W_MultiAge_ANNI25C1": { prod: {"BronzeAge":{"population":-1340,"medals_24h":100,"strategy_points_24h":23,"random_good_of_age_24h":23},"IronAge":{"population":-2870,"medals_24h":120,"strategy_points_24h":24,"random_good_of_age_24h":24},"EarlyMiddleAge":{"population":-4400,"medals_24h":150,"strategy_points_24h":25,"random_good_of_age_24h":25},"HighMiddleAge":{"population":-6180,"medals_24h":180,"strategy_points_24h":26,"random_good_of_age_24h":26},"LateMiddleAge":{"population":-8110,"medals_24h":210,"strategy_points_24h":27,"random_good_of_age_24h":27},"ColonialAge":{"population":-10240,"medals_24h":250,"strategy_points_24h":28,"random_good_of_age_24h":28},"IndustrialAge":{"population":-12510,"medals_24h":350,"strategy_points_24h":29,"random_good_of_age_24h":29},"ProgressiveEra":{"population":-14940,"medals_24h":490,"strategy_points_24h":30,"random_good_of_age_24h":30},"ModernEra":{"population":-17510,"medals_24h":690,"strategy_points_24h":31,"random_good_of_age_24h":31},"PostModernEra":{"population":-20180,"medals_24h":970,"strategy_points_24h":32,"random_good_of_age_24h":32},"ContemporaryEra":{"population":-23000,"medals_24h":1390,"strategy_points_24h":33,"random_good_of_age_24h":33},"TomorrowEra":{"population":-25920,"medals_24h":1870,"strategy_points_24h":34,"random_good_of_age_24h":34},"FutureEra":{"population":-28990,"medals_24h":2290,"strategy_points_24h":35,"random_good_of_age_24h":35},"ArcticFuture":{"population":-32150,"medals_24h":2780,"strategy_points_24h":36,"random_good_of_age_24h":36},"OceanicFuture":{"population":-35420,"medals_24h":3190,"strategy_points_24h":37,"random_good_of_age_24h":37},"VirtualFuture":{"population":-38780,"medals_24h":3890,"strategy_points_24h":38,"random_good_of_age_24h":38},"SpaceAgeMars":{"population":-61390,"medals_24h":4720,"strategy_points_24h":39,"random_good_of_age_24h":39},"SpaceAgeAsteroidBelt":{"population":-66680,"medals_24h":5560,"strategy_points_24h":40,"random_good_of_age_24h":40},"SpaceAgeVenus":{"population":-72070,"medals_24h":6390,"strategy_points_24h":41,"random_good_of_age_24h":41},"SpaceAgeJupiterMoon":{"population":-77610,"medals_24h":7220,"strategy_points_24h":42,"random_good_of_age_24h":42},"SpaceAgeTitan":{"population":-83250,"medals_24h":8050,"strategy_points_24h":43,"random_good_of_age_24h":43},"SpaceAgeSpaceHub":{"population":-88888,"medals_24h":8888,"strategy_points_24h":44,"random_good_of_age_24h":44}} },
+    "W_MultiAge_ANNI25A1": { prod: {"BronzeAge":{"population":440,"happiness":1810,"demandHappiness":440,"medals_24h":110,"all_goods_of_age_24h":140},"IronAge":{"population":940,"happiness":3130,"demandHappiness":940,"medals_24h":140,"all_goods_of_age_24h":140},"EarlyMiddleAge":{"population":1450,"happiness":3460,"demandHappiness":1450,"medals_24h":170,"all_goods_of_age_24h":140},"HighMiddleAge":{"population":2030,"happiness":3860,"demandHappiness":2030,"medals_24h":200,"all_goods_of_age_24h":140},"LateMiddleAge":{"population":2670,"happiness":4300,"demandHappiness":2670,"medals_24h":230,"all_goods_of_age_24h":140},"ColonialAge":{"population":3370,"happiness":5060,"demandHappiness":3370,"medals_24h":270,"all_goods_of_age_24h":140},"IndustrialAge":{"population":4120,"happiness":5700,"demandHappiness":4120,"medals_24h":380,"all_goods_of_age_24h":140},"ProgressiveEra":{"population":4920,"happiness":6260,"demandHappiness":4920,"medals_24h":530,"all_goods_of_age_24h":140},"ModernEra":{"population":5760,"happiness":6700,"demandHappiness":5760,"medals_24h":760,"all_goods_of_age_24h":140},"PostModernEra":{"population":6640,"happiness":6980,"demandHappiness":6640,"medals_24h":1070,"all_goods_of_age_24h":140},"ContemporaryEra":{"population":7570,"happiness":8110,"demandHappiness":7570,"medals_24h":1520,"all_goods_of_age_24h":140},"TomorrowEra":{"population":8530,"happiness":9850,"demandHappiness":8530,"medals_24h":2060,"all_goods_of_age_24h":140},"FutureEra":{"population":9540,"happiness":11800,"demandHappiness":9540,"medals_24h":2510,"all_goods_of_age_24h":140},"ArcticFuture":{"population":10580,"happiness":13740,"demandHappiness":10580,"medals_24h":3050,"all_goods_of_age_24h":140},"OceanicFuture":{"population":11650,"happiness":15850,"demandHappiness":11650,"medals_24h":3500,"all_goods_of_age_24h":140},"VirtualFuture":{"population":12760,"happiness":18940,"demandHappiness":12760,"medals_24h":4270,"all_goods_of_age_24h":140},"SpaceAgeMars":{"population":20200,"happiness":30300,"demandHappiness":20200,"medals_24h":5180,"all_goods_of_age_24h":140},"SpaceAgeAsteroidBelt":{"population":21940,"happiness":32930,"demandHappiness":21940,"medals_24h":6090,"all_goods_of_age_24h":140},"SpaceAgeVenus":{"population":23720,"happiness":35570,"demandHappiness":23720,"medals_24h":7010,"all_goods_of_age_24h":140},"SpaceAgeJupiterMoon":{"population":25540,"happiness":38320,"demandHappiness":25540,"medals_24h":7920,"all_goods_of_age_24h":140},"SpaceAgeTitan":{"population":27390,"happiness":41100,"demandHappiness":27390,"medals_24h":8840,"all_goods_of_age_24h":140},"SpaceAgeSpaceHub":{"population":29250,"happiness":43880,"demandHappiness":29250,"medals_24h":9750,"all_goods_of_age_24h":140}}, boosts: [{"type":"att_boost_attacker","value":9,"feature":"all"}] },
+    "W_MultiAge_ANNI25A10": { prod: {"BronzeAge":{"population":880,"happiness":3630,"demandHappiness":880,"medals_24h":750,"all_goods_of_age_24h":185.0},"IronAge":{"population":1890,"happiness":6250,"demandHappiness":1890,"medals_24h":960,"all_goods_of_age_24h":185.0},"EarlyMiddleAge":{"population":2900,"happiness":6910,"demandHappiness":2900,"medals_24h":1170,"all_goods_of_age_24h":185.0},"HighMiddleAge":{"population":4070,"happiness":7710,"demandHappiness":4070,"medals_24h":1390,"all_goods_of_age_24h":185.0},"LateMiddleAge":{"population":5340,"happiness":8600,"demandHappiness":5340,"medals_24h":1600,"all_goods_of_age_24h":185.0},"ColonialAge":{"population":6740,"happiness":10110,"demandHappiness":6740,"medals_24h":1920,"all_goods_of_age_24h":185.0},"IndustrialAge":{"population":8240,"happiness":11400,"demandHappiness":8240,"medals_24h":2670,"all_goods_of_age_24h":185.0},"ProgressiveEra":{"population":9830,"happiness":12520,"demandHappiness":9830,"medals_24h":3730,"all_goods_of_age_24h":185.0},"ModernEra":{"population":11520,"happiness":13400,"demandHappiness":11520,"medals_24h":5330,"all_goods_of_age_24h":185.0},"PostModernEra":{"population":13280,"happiness":13960,"demandHappiness":13280,"medals_24h":7460,"all_goods_of_age_24h":185.0},"ContemporaryEra":{"population":15140,"happiness":16220,"demandHappiness":15140,"medals_24h":10660,"all_goods_of_age_24h":185.0},"TomorrowEra":{"population":17060,"happiness":19690,"demandHappiness":17060,"medals_24h":14400,"all_goods_of_age_24h":185.0},"FutureEra":{"population":19080,"happiness":23590,"demandHappiness":19080,"medals_24h":17600,"all_goods_of_age_24h":185.0},"ArcticFuture":{"population":21160,"happiness":27470,"demandHappiness":21160,"medals_24h":21330,"all_goods_of_age_24h":185.0},"OceanicFuture":{"population":23310,"happiness":31700,"demandHappiness":23310,"medals_24h":24530,"all_goods_of_age_24h":185.0},"VirtualFuture":{"population":25520,"happiness":37870,"demandHappiness":25520,"medals_24h":29860,"all_goods_of_age_24h":185.0},"SpaceAgeMars":{"population":40400,"happiness":60600,"demandHappiness":40400,"medals_24h":36260,"all_goods_of_age_24h":185.0},"SpaceAgeAsteroidBelt":{"population":43880,"happiness":65860,"demandHappiness":43880,"medals_24h":42660,"all_goods_of_age_24h":185.0},"SpaceAgeVenus":{"population":47430,"happiness":71150,"demandHappiness":47430,"medals_24h":49050,"all_goods_of_age_24h":185.0},"SpaceAgeJupiterMoon":{"population":51080,"happiness":76640,"demandHappiness":51080,"medals_24h":55450,"all_goods_of_age_24h":185.0},"SpaceAgeTitan":{"population":54790,"happiness":82200,"demandHappiness":54790,"medals_24h":61850,"all_goods_of_age_24h":185.0},"SpaceAgeSpaceHub":{"population":58500,"happiness":87750,"demandHappiness":58500,"medals_24h":68250,"all_goods_of_age_24h":185.0}}, boosts: [{"type":"att_boost_attacker","value":68,"feature":"all"},{"type":"att_def_boost_attacker","value":134,"feature":"guild_expedition"}] },
+    "W_MultiAge_ANNI25A2": { prod: {"BronzeAge":{"population":490,"happiness":2020,"demandHappiness":490,"medals_24h":180,"all_goods_of_age_24h":145},"IronAge":{"population":1050,"happiness":3470,"demandHappiness":1050,"medals_24h":230,"all_goods_of_age_24h":145},"EarlyMiddleAge":{"population":1610,"happiness":3840,"demandHappiness":1610,"medals_24h":280,"all_goods_of_age_24h":145},"HighMiddleAge":{"population":2260,"happiness":4280,"demandHappiness":2260,"medals_24h":330,"all_goods_of_age_24h":145},"LateMiddleAge":{"population":2970,"happiness":4780,"demandHappiness":2970,"medals_24h":380,"all_goods_of_age_24h":145},"ColonialAge":{"population":3740,"happiness":5620,"demandHappiness":3740,"medals_24h":460,"all_goods_of_age_24h":145},"IndustrialAge":{"population":4580,"happiness":6340,"demandHappiness":4580,"medals_24h":630,"all_goods_of_age_24h":145},"ProgressiveEra":{"population":5460,"happiness":6960,"demandHappiness":5460,"medals_24h":890,"all_goods_of_age_24h":145},"ModernEra":{"population":6400,"happiness":7440,"demandHappiness":6400,"medals_24h":1270,"all_goods_of_age_24h":145},"PostModernEra":{"population":7380,"happiness":7760,"demandHappiness":7380,"medals_24h":1780,"all_goods_of_age_24h":145},"ContemporaryEra":{"population":8410,"happiness":9010,"demandHappiness":8410,"medals_24h":2540,"all_goods_of_age_24h":145},"TomorrowEra":{"population":9480,"happiness":10940,"demandHappiness":9480,"medals_24h":3430,"all_goods_of_age_24h":145},"FutureEra":{"population":10600,"happiness":13110,"demandHappiness":10600,"medals_24h":4190,"all_goods_of_age_24h":145},"ArcticFuture":{"population":11760,"happiness":15260,"demandHappiness":11760,"medals_24h":5080,"all_goods_of_age_24h":145},"OceanicFuture":{"population":12950,"happiness":17610,"demandHappiness":12950,"medals_24h":5840,"all_goods_of_age_24h":145},"VirtualFuture":{"population":14180,"happiness":21040,"demandHappiness":14180,"medals_24h":7110,"all_goods_of_age_24h":145},"SpaceAgeMars":{"population":22440,"happiness":33670,"demandHappiness":22440,"medals_24h":8630,"all_goods_of_age_24h":145},"SpaceAgeAsteroidBelt":{"population":24380,"happiness":36590,"demandHappiness":24380,"medals_24h":10160,"all_goods_of_age_24h":145},"SpaceAgeVenus":{"population":26350,"happiness":39530,"demandHappiness":26350,"medals_24h":11680,"all_goods_of_age_24h":145},"SpaceAgeJupiterMoon":{"population":28380,"happiness":42580,"demandHappiness":28380,"medals_24h":13200,"all_goods_of_age_24h":145},"SpaceAgeTitan":{"population":30440,"happiness":45660,"demandHappiness":30440,"medals_24h":14730,"all_goods_of_age_24h":145},"SpaceAgeSpaceHub":{"population":32500,"happiness":48750,"demandHappiness":32500,"medals_24h":16250,"all_goods_of_age_24h":145}}, boosts: [{"type":"att_boost_attacker","value":14,"feature":"all"}] },
+    "W_MultiAge_ANNI25A3": { prod: {"BronzeAge":{"population":540,"happiness":2220,"demandHappiness":540,"medals_24h":250,"all_goods_of_age_24h":150},"IronAge":{"population":1150,"happiness":3820,"demandHappiness":1150,"medals_24h":320,"all_goods_of_age_24h":150},"EarlyMiddleAge":{"population":1770,"happiness":4220,"demandHappiness":1770,"medals_24h":390,"all_goods_of_age_24h":150},"HighMiddleAge":{"population":2490,"happiness":4710,"demandHappiness":2490,"medals_24h":460,"all_goods_of_age_24h":150},"LateMiddleAge":{"population":3260,"happiness":5260,"demandHappiness":3260,"medals_24h":530,"all_goods_of_age_24h":150},"ColonialAge":{"population":4120,"happiness":6180,"demandHappiness":4120,"medals_24h":640,"all_goods_of_age_24h":150},"IndustrialAge":{"population":5030,"happiness":6970,"demandHappiness":5030,"medals_24h":890,"all_goods_of_age_24h":150},"ProgressiveEra":{"population":6010,"happiness":7650,"demandHappiness":6010,"medals_24h":1240,"all_goods_of_age_24h":150},"ModernEra":{"population":7040,"happiness":8190,"demandHappiness":7040,"medals_24h":1780,"all_goods_of_age_24h":150},"PostModernEra":{"population":8120,"happiness":8530,"demandHappiness":8120,"medals_24h":2490,"all_goods_of_age_24h":150},"ContemporaryEra":{"population":9250,"happiness":9910,"demandHappiness":9250,"medals_24h":3550,"all_goods_of_age_24h":150},"TomorrowEra":{"population":10420,"happiness":12030,"demandHappiness":10420,"medals_24h":4800,"all_goods_of_age_24h":150},"FutureEra":{"population":11660,"happiness":14420,"demandHappiness":11660,"medals_24h":5870,"all_goods_of_age_24h":150},"ArcticFuture":{"population":12930,"happiness":16790,"demandHappiness":12930,"medals_24h":7110,"all_goods_of_age_24h":150},"OceanicFuture":{"population":14240,"happiness":19370,"demandHappiness":14240,"medals_24h":8180,"all_goods_of_age_24h":150},"VirtualFuture":{"population":15600,"happiness":23140,"demandHappiness":15600,"medals_24h":9950,"all_goods_of_age_24h":150},"SpaceAgeMars":{"population":24690,"happiness":37030,"demandHappiness":24690,"medals_24h":12090,"all_goods_of_age_24h":150},"SpaceAgeAsteroidBelt":{"population":26820,"happiness":40250,"demandHappiness":26820,"medals_24h":14220,"all_goods_of_age_24h":150},"SpaceAgeVenus":{"population":28990,"happiness":43480,"demandHappiness":28990,"medals_24h":16350,"all_goods_of_age_24h":150},"SpaceAgeJupiterMoon":{"population":31210,"happiness":46840,"demandHappiness":31210,"medals_24h":18480,"all_goods_of_age_24h":150},"SpaceAgeTitan":{"population":33480,"happiness":50230,"demandHappiness":33480,"medals_24h":20620,"all_goods_of_age_24h":150},"SpaceAgeSpaceHub":{"population":35750,"happiness":53630,"demandHappiness":35750,"medals_24h":22750,"all_goods_of_age_24h":150}}, boosts: [{"type":"att_boost_attacker","value":19,"feature":"all"},{"type":"att_def_boost_attacker","value":4,"feature":"guild_expedition"}] },
+    "W_MultiAge_ANNI25A4": { prod: {"BronzeAge":{"population":590,"happiness":2420,"demandHappiness":590,"medals_24h":320,"all_goods_of_age_24h":155},"IronAge":{"population":1260,"happiness":4170,"demandHappiness":1260,"medals_24h":410,"all_goods_of_age_24h":155},"EarlyMiddleAge":{"population":1930,"happiness":4610,"demandHappiness":1930,"medals_24h":500,"all_goods_of_age_24h":155},"HighMiddleAge":{"population":2710,"happiness":5140,"demandHappiness":2710,"medals_24h":590,"all_goods_of_age_24h":155},"LateMiddleAge":{"population":3560,"happiness":5730,"demandHappiness":3560,"medals_24h":690,"all_goods_of_age_24h":155},"ColonialAge":{"population":4490,"happiness":6740,"demandHappiness":4490,"medals_24h":820,"all_goods_of_age_24h":155},"IndustrialAge":{"population":5490,"happiness":7600,"demandHappiness":5490,"medals_24h":1140,"all_goods_of_age_24h":155},"ProgressiveEra":{"population":6550,"happiness":8350,"demandHappiness":6550,"medals_24h":1600,"all_goods_of_age_24h":155},"ModernEra":{"population":7680,"happiness":8930,"demandHappiness":7680,"medals_24h":2290,"all_goods_of_age_24h":155},"PostModernEra":{"population":8850,"happiness":9310,"demandHappiness":8850,"medals_24h":3200,"all_goods_of_age_24h":155},"ContemporaryEra":{"population":10090,"happiness":10810,"demandHappiness":10090,"medals_24h":4570,"all_goods_of_age_24h":155},"TomorrowEra":{"population":11370,"happiness":13130,"demandHappiness":11370,"medals_24h":6170,"all_goods_of_age_24h":155},"FutureEra":{"population":12720,"happiness":15730,"demandHappiness":12720,"medals_24h":7540,"all_goods_of_age_24h":155},"ArcticFuture":{"population":14110,"happiness":18310,"demandHappiness":14110,"medals_24h":9140,"all_goods_of_age_24h":155},"OceanicFuture":{"population":15540,"happiness":21130,"demandHappiness":15540,"medals_24h":10510,"all_goods_of_age_24h":155},"VirtualFuture":{"population":17020,"happiness":25250,"demandHappiness":17020,"medals_24h":12800,"all_goods_of_age_24h":155},"SpaceAgeMars":{"population":26930,"happiness":40400,"demandHappiness":26930,"medals_24h":15540,"all_goods_of_age_24h":155},"SpaceAgeAsteroidBelt":{"population":29260,"happiness":43900,"demandHappiness":29260,"medals_24h":18280,"all_goods_of_age_24h":155},"SpaceAgeVenus":{"population":31620,"happiness":47430,"demandHappiness":31620,"medals_24h":21020,"all_goods_of_age_24h":155},"SpaceAgeJupiterMoon":{"population":34050,"happiness":51100,"demandHappiness":34050,"medals_24h":23770,"all_goods_of_age_24h":155},"SpaceAgeTitan":{"population":36530,"happiness":54800,"demandHappiness":36530,"medals_24h":26510,"all_goods_of_age_24h":155},"SpaceAgeSpaceHub":{"population":39000,"happiness":58500,"demandHappiness":39000,"medals_24h":29250,"all_goods_of_age_24h":155}}, boosts: [{"type":"att_boost_attacker","value":23,"feature":"all"},{"type":"att_def_boost_attacker","value":19,"feature":"guild_expedition"}] },
+    "W_MultiAge_ANNI25A5": { prod: {"BronzeAge":{"population":630,"happiness":2620,"demandHappiness":630,"medals_24h":390,"all_goods_of_age_24h":160},"IronAge":{"population":1360,"happiness":4510,"demandHappiness":1360,"medals_24h":500,"all_goods_of_age_24h":160},"EarlyMiddleAge":{"population":2090,"happiness":4990,"demandHappiness":2090,"medals_24h":610,"all_goods_of_age_24h":160},"HighMiddleAge":{"population":2940,"happiness":5570,"demandHappiness":2940,"medals_24h":730,"all_goods_of_age_24h":160},"LateMiddleAge":{"population":3860,"happiness":6210,"demandHappiness":3860,"medals_24h":840,"all_goods_of_age_24h":160},"ColonialAge":{"population":4870,"happiness":7300,"demandHappiness":4870,"medals_24h":1010,"all_goods_of_age_24h":160},"IndustrialAge":{"population":5950,"happiness":8240,"demandHappiness":5950,"medals_24h":1400,"all_goods_of_age_24h":160},"ProgressiveEra":{"population":7100,"happiness":9040,"demandHappiness":7100,"medals_24h":1960,"all_goods_of_age_24h":160},"ModernEra":{"population":8320,"happiness":9680,"demandHappiness":8320,"medals_24h":2790,"all_goods_of_age_24h":160},"PostModernEra":{"population":9590,"happiness":10080,"demandHappiness":9590,"medals_24h":3910,"all_goods_of_age_24h":160},"ContemporaryEra":{"population":10930,"happiness":11720,"demandHappiness":10930,"medals_24h":5590,"all_goods_of_age_24h":160},"TomorrowEra":{"population":12320,"happiness":14220,"demandHappiness":12320,"medals_24h":7540,"all_goods_of_age_24h":160},"FutureEra":{"population":13780,"happiness":17040,"demandHappiness":13780,"medals_24h":9220,"all_goods_of_age_24h":160},"ArcticFuture":{"population":15280,"happiness":19840,"demandHappiness":15280,"medals_24h":11170,"all_goods_of_age_24h":160},"OceanicFuture":{"population":16830,"happiness":22900,"demandHappiness":16830,"medals_24h":12850,"all_goods_of_age_24h":160},"VirtualFuture":{"population":18430,"happiness":27350,"demandHappiness":18430,"medals_24h":15640,"all_goods_of_age_24h":160},"SpaceAgeMars":{"population":29180,"happiness":43770,"demandHappiness":29180,"medals_24h":18990,"all_goods_of_age_24h":160},"SpaceAgeAsteroidBelt":{"population":31690,"happiness":47560,"demandHappiness":31690,"medals_24h":22340,"all_goods_of_age_24h":160},"SpaceAgeVenus":{"population":34260,"happiness":51390,"demandHappiness":34260,"medals_24h":25700,"all_goods_of_age_24h":160},"SpaceAgeJupiterMoon":{"population":36890,"happiness":55350,"demandHappiness":36890,"medals_24h":29050,"all_goods_of_age_24h":160},"SpaceAgeTitan":{"population":39570,"happiness":59360,"demandHappiness":39570,"medals_24h":32400,"all_goods_of_age_24h":160},"SpaceAgeSpaceHub":{"population":42250,"happiness":63380,"demandHappiness":42250,"medals_24h":35750,"all_goods_of_age_24h":160}}, boosts: [{"type":"att_boost_attacker","value":28,"feature":"all"},{"type":"att_def_boost_attacker","value":34,"feature":"guild_expedition"}] },
+    "W_MultiAge_ANNI25A6": { prod: {"BronzeAge":{"population":680,"happiness":2820,"demandHappiness":680,"medals_24h":460,"all_goods_of_age_24h":165},"IronAge":{"population":1470,"happiness":4860,"demandHappiness":1470,"medals_24h":590,"all_goods_of_age_24h":165},"EarlyMiddleAge":{"population":2250,"happiness":5380,"demandHappiness":2250,"medals_24h":730,"all_goods_of_age_24h":165},"HighMiddleAge":{"population":3160,"happiness":6000,"demandHappiness":3160,"medals_24h":860,"all_goods_of_age_24h":165},"LateMiddleAge":{"population":4150,"happiness":6690,"demandHappiness":4150,"medals_24h":990,"all_goods_of_age_24h":165},"ColonialAge":{"population":5240,"happiness":7870,"demandHappiness":5240,"medals_24h":1190,"all_goods_of_age_24h":165},"IndustrialAge":{"population":6410,"happiness":8870,"demandHappiness":6410,"medals_24h":1650,"all_goods_of_age_24h":165},"ProgressiveEra":{"population":7650,"happiness":9740,"demandHappiness":7650,"medals_24h":2310,"all_goods_of_age_24h":165},"ModernEra":{"population":8960,"happiness":10420,"demandHappiness":8960,"medals_24h":3300,"all_goods_of_age_24h":165},"PostModernEra":{"population":10330,"happiness":10860,"demandHappiness":10330,"medals_24h":4620,"all_goods_of_age_24h":165},"ContemporaryEra":{"population":11770,"happiness":12620,"demandHappiness":11770,"medals_24h":6600,"all_goods_of_age_24h":165},"TomorrowEra":{"population":13270,"happiness":15320,"demandHappiness":13270,"medals_24h":8910,"all_goods_of_age_24h":165},"FutureEra":{"population":14840,"happiness":18350,"demandHappiness":14840,"medals_24h":10890,"all_goods_of_age_24h":165},"ArcticFuture":{"population":16460,"happiness":21370,"demandHappiness":16460,"medals_24h":13200,"all_goods_of_age_24h":165},"OceanicFuture":{"population":18130,"happiness":24660,"demandHappiness":18130,"medals_24h":15180,"all_goods_of_age_24h":165},"VirtualFuture":{"population":19850,"happiness":29460,"demandHappiness":19850,"medals_24h":18480,"all_goods_of_age_24h":165},"SpaceAgeMars":{"population":31420,"happiness":47130,"demandHappiness":31420,"medals_24h":22450,"all_goods_of_age_24h":165},"SpaceAgeAsteroidBelt":{"population":34130,"happiness":51220,"demandHappiness":34130,"medals_24h":26410,"all_goods_of_age_24h":165},"SpaceAgeVenus":{"population":36890,"happiness":55340,"demandHappiness":36890,"medals_24h":30370,"all_goods_of_age_24h":165},"SpaceAgeJupiterMoon":{"population":39730,"happiness":59610,"demandHappiness":39730,"medals_24h":34330,"all_goods_of_age_24h":165},"SpaceAgeTitan":{"population":42610,"happiness":63930,"demandHappiness":42610,"medals_24h":38290,"all_goods_of_age_24h":165},"SpaceAgeSpaceHub":{"population":45500,"happiness":68250,"demandHappiness":45500,"medals_24h":42250,"all_goods_of_age_24h":165}}, boosts: [{"type":"att_boost_attacker","value":33,"feature":"all"},{"type":"att_def_boost_attacker","value":54,"feature":"guild_expedition"}] },
+    "W_MultiAge_ANNI25A7": { prod: {"BronzeAge":{"population":730,"happiness":3020,"demandHappiness":730,"medals_24h":530,"all_goods_of_age_24h":170},"IronAge":{"population":1570,"happiness":5210,"demandHappiness":1570,"medals_24h":690,"all_goods_of_age_24h":170},"EarlyMiddleAge":{"population":2410,"happiness":5760,"demandHappiness":2410,"medals_24h":840,"all_goods_of_age_24h":170},"HighMiddleAge":{"population":3390,"happiness":6430,"demandHappiness":3390,"medals_24h":990,"all_goods_of_age_24h":170},"LateMiddleAge":{"population":4450,"happiness":7170,"demandHappiness":4450,"medals_24h":1140,"all_goods_of_age_24h":170},"ColonialAge":{"population":5620,"happiness":8430,"demandHappiness":5620,"medals_24h":1370,"all_goods_of_age_24h":170},"IndustrialAge":{"population":6860,"happiness":9500,"demandHappiness":6860,"medals_24h":1900,"all_goods_of_age_24h":170},"ProgressiveEra":{"population":8190,"happiness":10440,"demandHappiness":8190,"medals_24h":2670,"all_goods_of_age_24h":170},"ModernEra":{"population":9600,"happiness":11170,"demandHappiness":9600,"medals_24h":3810,"all_goods_of_age_24h":170},"PostModernEra":{"population":11070,"happiness":11630,"demandHappiness":11070,"medals_24h":5330,"all_goods_of_age_24h":170},"ContemporaryEra":{"population":12610,"happiness":13520,"demandHappiness":12610,"medals_24h":7620,"all_goods_of_age_24h":170},"TomorrowEra":{"population":14220,"happiness":16410,"demandHappiness":14220,"medals_24h":10280,"all_goods_of_age_24h":170},"FutureEra":{"population":15900,"happiness":19660,"demandHappiness":15900,"medals_24h":12570,"all_goods_of_age_24h":170},"ArcticFuture":{"population":17630,"happiness":22890,"demandHappiness":17630,"medals_24h":15230,"all_goods_of_age_24h":170},"OceanicFuture":{"population":19420,"happiness":26420,"demandHappiness":19420,"medals_24h":17520,"all_goods_of_age_24h":170},"VirtualFuture":{"population":21270,"happiness":31560,"demandHappiness":21270,"medals_24h":21330,"all_goods_of_age_24h":170},"SpaceAgeMars":{"population":33670,"happiness":50500,"demandHappiness":33670,"medals_24h":25900,"all_goods_of_age_24h":170},"SpaceAgeAsteroidBelt":{"population":36570,"happiness":54880,"demandHappiness":36570,"medals_24h":30470,"all_goods_of_age_24h":170},"SpaceAgeVenus":{"population":39530,"happiness":59290,"demandHappiness":39530,"medals_24h":35040,"all_goods_of_age_24h":170},"SpaceAgeJupiterMoon":{"population":42560,"happiness":63870,"demandHappiness":42560,"medals_24h":39610,"all_goods_of_age_24h":170},"SpaceAgeTitan":{"population":45660,"happiness":68500,"demandHappiness":45660,"medals_24h":44180,"all_goods_of_age_24h":170},"SpaceAgeSpaceHub":{"population":48750,"happiness":73130,"demandHappiness":48750,"medals_24h":48750,"all_goods_of_age_24h":170}}, boosts: [{"type":"att_boost_attacker","value":38,"feature":"all"},{"type":"att_def_boost_attacker","value":74,"feature":"guild_expedition"}] },
+    "W_MultiAge_ANNI25A8": { prod: {"BronzeAge":{"population":780,"happiness":3220,"demandHappiness":780,"medals_24h":600,"all_goods_of_age_24h":175},"IronAge":{"population":1680,"happiness":5560,"demandHappiness":1680,"medals_24h":780,"all_goods_of_age_24h":175},"EarlyMiddleAge":{"population":2580,"happiness":6140,"demandHappiness":2580,"medals_24h":950,"all_goods_of_age_24h":175},"HighMiddleAge":{"population":3620,"happiness":6850,"demandHappiness":3620,"medals_24h":1120,"all_goods_of_age_24h":175},"LateMiddleAge":{"population":4750,"happiness":7650,"demandHappiness":4750,"medals_24h":1290,"all_goods_of_age_24h":175},"ColonialAge":{"population":5990,"happiness":8990,"demandHappiness":5990,"medals_24h":1550,"all_goods_of_age_24h":175},"IndustrialAge":{"population":7320,"happiness":10140,"demandHappiness":7320,"medals_24h":2160,"all_goods_of_age_24h":175},"ProgressiveEra":{"population":8740,"happiness":11130,"demandHappiness":8740,"medals_24h":3020,"all_goods_of_age_24h":175},"ModernEra":{"population":10240,"happiness":11910,"demandHappiness":10240,"medals_24h":4320,"all_goods_of_age_24h":175},"PostModernEra":{"population":11810,"happiness":12410,"demandHappiness":11810,"medals_24h":6040,"all_goods_of_age_24h":175},"ContemporaryEra":{"population":13460,"happiness":14420,"demandHappiness":13460,"medals_24h":8630,"all_goods_of_age_24h":175},"TomorrowEra":{"population":15160,"happiness":17500,"demandHappiness":15160,"medals_24h":11650,"all_goods_of_age_24h":175},"FutureEra":{"population":16960,"happiness":20970,"demandHappiness":16960,"medals_24h":14240,"all_goods_of_age_24h":175},"ArcticFuture":{"population":18810,"happiness":24420,"demandHappiness":18810,"medals_24h":17270,"all_goods_of_age_24h":175},"OceanicFuture":{"population":20720,"happiness":28180,"demandHappiness":20720,"medals_24h":19860,"all_goods_of_age_24h":175},"VirtualFuture":{"population":22690,"happiness":33660,"demandHappiness":22690,"medals_24h":24170,"all_goods_of_age_24h":175},"SpaceAgeMars":{"population":35910,"happiness":53870,"demandHappiness":35910,"medals_24h":29350,"all_goods_of_age_24h":175},"SpaceAgeAsteroidBelt":{"population":39010,"happiness":58540,"demandHappiness":39010,"medals_24h":34530,"all_goods_of_age_24h":175},"SpaceAgeVenus":{"population":42160,"happiness":63240,"demandHappiness":42160,"medals_24h":39710,"all_goods_of_age_24h":175},"SpaceAgeJupiterMoon":{"population":45400,"happiness":68130,"demandHappiness":45400,"medals_24h":44890,"all_goods_of_age_24h":175},"SpaceAgeTitan":{"population":48700,"happiness":73060,"demandHappiness":48700,"medals_24h":50070,"all_goods_of_age_24h":175},"SpaceAgeSpaceHub":{"population":52000,"happiness":78000,"demandHappiness":52000,"medals_24h":55250,"all_goods_of_age_24h":175}}, boosts: [{"type":"att_boost_attacker","value":48,"feature":"all"},{"type":"att_def_boost_attacker","value":94,"feature":"guild_expedition"}] },
+    "W_MultiAge_ANNI25A9": { prod: {"BronzeAge":{"population":830,"happiness":3430,"demandHappiness":830,"medals_24h":680,"all_goods_of_age_24h":180},"IronAge":{"population":1780,"happiness":5900,"demandHappiness":1780,"medals_24h":870,"all_goods_of_age_24h":180},"EarlyMiddleAge":{"population":2740,"happiness":6530,"demandHappiness":2740,"medals_24h":1060,"all_goods_of_age_24h":180},"HighMiddleAge":{"population":3840,"happiness":7280,"demandHappiness":3840,"medals_24h":1250,"all_goods_of_age_24h":180},"LateMiddleAge":{"population":5040,"happiness":8120,"demandHappiness":5040,"medals_24h":1450,"all_goods_of_age_24h":180},"ColonialAge":{"population":6360,"happiness":9550,"demandHappiness":6360,"medals_24h":1740,"all_goods_of_age_24h":180},"IndustrialAge":{"population":7780,"happiness":10770,"demandHappiness":7780,"medals_24h":2410,"all_goods_of_age_24h":180},"ProgressiveEra":{"population":9290,"happiness":11830,"demandHappiness":9290,"medals_24h":3380,"all_goods_of_age_24h":180},"ModernEra":{"population":10880,"happiness":12650,"demandHappiness":10880,"medals_24h":4820,"all_goods_of_age_24h":180},"PostModernEra":{"population":12540,"happiness":13180,"demandHappiness":12540,"medals_24h":6750,"all_goods_of_age_24h":180},"ContemporaryEra":{"population":14300,"happiness":15320,"demandHappiness":14300,"medals_24h":9650,"all_goods_of_age_24h":180},"TomorrowEra":{"population":16110,"happiness":18600,"demandHappiness":16110,"medals_24h":13030,"all_goods_of_age_24h":180},"FutureEra":{"population":18020,"happiness":22280,"demandHappiness":18020,"medals_24h":15920,"all_goods_of_age_24h":180},"ArcticFuture":{"population":19980,"happiness":25950,"demandHappiness":19980,"medals_24h":19300,"all_goods_of_age_24h":180},"OceanicFuture":{"population":22010,"happiness":29940,"demandHappiness":22010,"medals_24h":22190,"all_goods_of_age_24h":180},"VirtualFuture":{"population":24100,"happiness":35770,"demandHappiness":24100,"medals_24h":27020,"all_goods_of_age_24h":180},"SpaceAgeMars":{"population":38160,"happiness":57230,"demandHappiness":38160,"medals_24h":32800,"all_goods_of_age_24h":180},"SpaceAgeAsteroidBelt":{"population":41450,"happiness":62200,"demandHappiness":41450,"medals_24h":38590,"all_goods_of_age_24h":180},"SpaceAgeVenus":{"population":44800,"happiness":67200,"demandHappiness":44800,"medals_24h":44380,"all_goods_of_age_24h":180},"SpaceAgeJupiterMoon":{"population":48240,"happiness":72390,"demandHappiness":48240,"medals_24h":50170,"all_goods_of_age_24h":180},"SpaceAgeTitan":{"population":51740,"happiness":77630,"demandHappiness":51740,"medals_24h":55960,"all_goods_of_age_24h":180},"SpaceAgeSpaceHub":{"population":55250,"happiness":82880,"demandHappiness":55250,"medals_24h":61750,"all_goods_of_age_24h":180}}, boosts: [{"type":"att_boost_attacker","value":58,"feature":"all"},{"type":"att_def_boost_attacker","value":114,"feature":"guild_expedition"}] },
+    "W_MultiAge_ANNI24C1": { prod: {"AllAge":{"strategy_points_24h":4,"random_good_of_age_24h":16},"BronzeAge":{"population":-40},"IronAge":{"population":-90},"EarlyMiddleAge":{"population":-130},"HighMiddleAge":{"population":-190},"LateMiddleAge":{"population":-240},"ColonialAge":{"population":-310},"IndustrialAge":{"population":-380},"ProgressiveEra":{"population":-450},"ModernEra":{"population":-530},"PostModernEra":{"population":-610},"ContemporaryEra":{"population":-690},"TomorrowEra":{"population":-780},"FutureEra":{"population":-870},"ArcticFuture":{"population":-970},"OceanicFuture":{"population":-1060},"VirtualFuture":{"population":-1160},"SpaceAgeMars":{"population":-1840},"SpaceAgeAsteroidBelt":{"population":-2000},"SpaceAgeVenus":{"population":-2160},"SpaceAgeJupiterMoon":{"population":-2330},"SpaceAgeTitan":{"population":-2500},"SpaceAgeSpaceHub":{"population":-2670}}, boosts: [{"type":"att_boost_defender","value":6,"feature":"all"},{"type":"att_boost_defender","value":3,"feature":"battleground"},{"type":"att_boost_defender","value":2,"feature":"guild_expedition"},{"type":"def_boost_defender","value":8,"feature":"all"},{"type":"def_boost_defender","value":5,"feature":"battleground"},{"type":"def_boost_defender","value":4,"feature":"guild_expedition"}] },
+    "W_MultiAge_ANNI24A12": { prod: {"BronzeAge":{"population":260,"happiness":1060,"demandHappiness":260,"money_24h":1780,"medals_24h":190,"strategy_points_24h":20,"random_good_of_age_24h":72},"IronAge":{"population":550,"happiness":1830,"demandHappiness":550,"money_24h":4270,"medals_24h":250,"strategy_points_24h":20,"random_good_of_age_24h":72},"EarlyMiddleAge":{"population":850,"happiness":2020,"demandHappiness":850,"money_24h":7120,"medals_24h":300,"strategy_points_24h":20,"random_good_of_age_24h":72},"HighMiddleAge":{"population":1190,"happiness":2250,"demandHappiness":1190,"money_24h":9970,"medals_24h":360,"strategy_points_24h":20,"random_good_of_age_24h":72},"LateMiddleAge":{"population":1560,"happiness":2510,"demandHappiness":1560,"money_24h":13170,"medals_24h":410,"strategy_points_24h":20,"random_good_of_age_24h":72},"ColonialAge":{"population":1970,"happiness":2950,"demandHappiness":1970,"money_24h":20060,"medals_24h":500,"strategy_points_24h":20,"random_good_of_age_24h":72},"IndustrialAge":{"population":2410,"happiness":3330,"demandHappiness":2410,"money_24h":24980,"medals_24h":690,"strategy_points_24h":20,"random_good_of_age_24h":72},"ProgressiveEra":{"population":2870,"happiness":3660,"demandHappiness":2870,"money_24h":30320,"medals_24h":970,"strategy_points_24h":20,"random_good_of_age_24h":72},"ModernEra":{"population":3370,"happiness":3910,"demandHappiness":3370,"money_24h":37730,"medals_24h":1380,"strategy_points_24h":20,"random_good_of_age_24h":72},"PostModernEra":{"population":3880,"happiness":4080,"demandHappiness":3880,"money_24h":47460,"medals_24h":1930,"strategy_points_24h":20,"random_good_of_age_24h":72},"ContemporaryEra":{"population":4420,"happiness":4740,"demandHappiness":4420,"money_24h":61790,"medals_24h":2760,"strategy_points_24h":20,"random_good_of_age_24h":72},"TomorrowEra":{"population":4980,"happiness":5750,"demandHappiness":4980,"money_24h":71540,"medals_24h":3720,"strategy_points_24h":20,"random_good_of_age_24h":72},"FutureEra":{"population":5570,"happiness":6890,"demandHappiness":5570,"money_24h":82000,"medals_24h":4550,"strategy_points_24h":20,"random_good_of_age_24h":72},"ArcticFuture":{"population":6180,"happiness":8020,"demandHappiness":6180,"money_24h":93180,"medals_24h":5520,"strategy_points_24h":20,"random_good_of_age_24h":72},"OceanicFuture":{"population":6810,"happiness":9260,"demandHappiness":6810,"money_24h":105060,"medals_24h":6340,"strategy_points_24h":20,"random_good_of_age_24h":72},"VirtualFuture":{"population":7450,"happiness":11060,"demandHappiness":7450,"money_24h":117680,"medals_24h":7720,"strategy_points_24h":20,"random_good_of_age_24h":72},"SpaceAgeMars":{"population":11800,"happiness":17690,"demandHappiness":11800,"money_24h":196570,"medals_24h":9380,"strategy_points_24h":20,"random_good_of_age_24h":72},"SpaceAgeAsteroidBelt":{"population":12820,"happiness":19230,"demandHappiness":12820,"money_24h":217730,"medals_24h":11030,"strategy_points_24h":20,"random_good_of_age_24h":72},"SpaceAgeVenus":{"population":13850,"happiness":20770,"demandHappiness":13850,"money_24h":240010,"medals_24h":12690,"strategy_points_24h":20,"random_good_of_age_24h":72},"SpaceAgeJupiterMoon":{"population":14920,"happiness":22380,"demandHappiness":14920,"money_24h":263420,"medals_24h":14340,"strategy_points_24h":20,"random_good_of_age_24h":72},"SpaceAgeTitan":{"population":16000,"happiness":24000,"demandHappiness":16000,"money_24h":288000,"medals_24h":16000,"strategy_points_24h":20,"random_good_of_age_24h":72},"SpaceAgeSpaceHub":{"population":17080,"happiness":25620,"demandHappiness":17080,"money_24h":312580,"medals_24h":17660,"strategy_points_24h":20,"random_good_of_age_24h":72}}, boosts: [{"type":"att_boost_attacker","value":16,"feature":"all"},{"type":"att_boost_attacker","value":20,"feature":"battleground"},{"type":"att_boost_attacker","value":16,"feature":"guild_expedition"},{"type":"att_boost_defender","value":20,"feature":"all"},{"type":"att_boost_defender","value":24,"feature":"battleground"},{"type":"att_boost_defender","value":18,"feature":"guild_expedition"}] },
+    "W_MultiAge_ANNI24B1": { prod: {"AllAge":{"strategy_points_24h":18,"random_good_of_age_24h":48}}, boosts: [{"type":"att_boost_attacker","value":24,"feature":"all"},{"type":"def_boost_attacker","value":30,"feature":"all"},{"type":"att_boost_defender","value":30,"feature":"all"},{"type":"def_boost_defender","value":36,"feature":"all"}] },
+    "W_MultiAge_ANNI24B2": { prod: {"AllAge":{"strategy_points_24h":24,"random_good_of_age_24h":48}}, boosts: [{"type":"att_boost_attacker","value":24,"feature":"all"},{"type":"def_boost_attacker","value":36,"feature":"all"},{"type":"att_boost_defender","value":30,"feature":"all"},{"type":"def_boost_defender","value":42,"feature":"all"}] },
+    "W_MultiAge_ANNI24B3": { prod: {"AllAge":{"strategy_points_24h":30,"random_good_of_age_24h":48}}, boosts: [{"type":"att_boost_attacker","value":24,"feature":"all"},{"type":"def_boost_attacker","value":42,"feature":"all"},{"type":"att_boost_defender","value":30,"feature":"all"},{"type":"def_boost_defender","value":48,"feature":"all"}] },
+    "W_MultiAge_ANNI24D1": { prod: {"BronzeAge":{"population":-60,"random_good_of_age_24h":16,"strategy_points_24h":9},"IronAge":{"population":-140,"random_good_of_age_24h":16,"strategy_points_24h":9},"EarlyMiddleAge":{"population":-210,"random_good_of_age_24h":16,"strategy_points_24h":9},"HighMiddleAge":{"population":-300,"random_good_of_age_24h":16,"strategy_points_24h":9},"LateMiddleAge":{"population":-390,"random_good_of_age_24h":16,"strategy_points_24h":9},"ColonialAge":{"population":-490,"random_good_of_age_24h":16,"strategy_points_24h":9},"IndustrialAge":{"population":-600,"random_good_of_age_24h":16,"strategy_points_24h":9},"ProgressiveEra":{"population":-720,"random_good_of_age_24h":16,"strategy_points_24h":9},"ModernEra":{"population":-840,"random_good_of_age_24h":16,"strategy_points_24h":9},"PostModernEra":{"population":-970,"random_good_of_age_24h":16,"strategy_points_24h":9},"ContemporaryEra":{"population":-1110,"random_good_of_age_24h":16,"strategy_points_24h":9},"TomorrowEra":{"population":-1250,"random_good_of_age_24h":16,"strategy_points_24h":9},"FutureEra":{"population":-1390,"random_good_of_age_24h":16,"strategy_points_24h":9},"ArcticFuture":{"population":-1540,"random_good_of_age_24h":16,"strategy_points_24h":9},"OceanicFuture":{"population":-1700,"random_good_of_age_24h":16,"strategy_points_24h":9},"VirtualFuture":{"population":-1860,"random_good_of_age_24h":16,"strategy_points_24h":9},"SpaceAgeMars":{"population":-2950,"random_good_of_age_24h":16,"strategy_points_24h":9},"SpaceAgeAsteroidBelt":{"population":-3200,"random_good_of_age_24h":16,"strategy_points_24h":9},"SpaceAgeVenus":{"population":-3460,"random_good_of_age_24h":16,"strategy_points_24h":9},"SpaceAgeJupiterMoon":{"population":-3730,"random_good_of_age_24h":16,"strategy_points_24h":9},"SpaceAgeTitan":{"population":-4000,"random_good_of_age_24h":16,"strategy_points_24h":9},"SpaceAgeSpaceHub":{"population":-4270,"random_good_of_age_24h":16,"strategy_points_24h":9}}, boosts: [{"type":"att_boost_attacker","value":7,"feature":"all"},{"type":"att_boost_attacker","value":5,"feature":"battleground"},{"type":"att_boost_attacker","value":4,"feature":"guild_expedition"},{"type":"def_boost_attacker","value":9,"feature":"all"},{"type":"def_boost_attacker","value":7,"feature":"battleground"},{"type":"def_boost_attacker","value":6,"feature":"guild_expedition"}] },
+};
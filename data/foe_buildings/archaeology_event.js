@@ -0,0 +1,18 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 14 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_ARCH20A14": { prod: {"BronzeAge":{"population":340,"happiness":1860,"demandHappiness":340,"money_24h":2560,"supplies_24h":4730,"strategy_points_24h":120,"all_goods_of_age_24h":200},"IronAge":{"population":730,"happiness":3210,"demandHappiness":730,"money_24h":6150,"supplies_24h":11340,"strategy_points_24h":120,"all_goods_of_age_24h":200},"EarlyMiddleAge":{"population":1110,"happiness":3540,"demandHappiness":1110,"money_24h":10250,"supplies_24h":18910,"strategy_points_24h":120,"all_goods_of_age_24h":200},"HighMiddleAge":{"population":1570,"happiness":3950,"demandHappiness":1570,"money_24h":14350,"supplies_24h":26470,"strategy_points_24h":120,"all_goods_of_age_24h":200},"LateMiddleAge":{"population":2050,"happiness":4410,"demandHappiness":2050,"money_24h":18960,"supplies_24h":34980,"strategy_points_24h":120,"all_goods_of_age_24h":200},"ColonialAge":{"population":2590,"happiness":5190,"demandHappiness":2590,"money_24h":28870,"supplies_24h":44430,"strategy_points_24h":120,"all_goods_of_age_24h":200},"IndustrialAge":{"population":3170,"happiness":5850,"demandHappiness":3170,"money_24h":35970,"supplies_24h":53890,"strategy_points_24h":120,"all_goods_of_age_24h":200},"ProgressiveEra":{"population":3780,"happiness":6420,"demandHappiness":3780,"money_24h":43650,"supplies_24h":63340,"strategy_points_24h":120,"all_goods_of_age_24h":200},"ModernEra":{"population":4430,"happiness":6870,"demandHappiness":4430,"money_24h":54310,"supplies_24h":73740,"strategy_points_24h":120,"all_goods_of_age_24h":200},"PostModernEra":{"population":5110,"happiness":7160,"demandHappiness":5110,"money_24h":68330,"supplies_24h":84140,"strategy_points_24h":120,"all_goods_of_age_24h":200},"ContemporaryEra":{"population":5820,"happiness":8320,"demandHappiness":5820,"money_24h":88950,"supplies_24h":94540,"strategy_points_24h":120,"all_goods_of_age_24h":200},"TomorrowEra":{"population":6560,"happiness":10100,"demandHappiness":6560,"money_24h":102990,"supplies_24h":105880,"strategy_points_24h":120,"all_goods_of_age_24h":200},"FutureEra":{"population":7340,"happiness":12100,"demandHappiness":7340,"money_24h":118050,"supplies_24h":116280,"strategy_points_24h":120,"all_goods_of_age_24h":200},"ArcticFuture":{"population":8140,"happiness":14090,"demandHappiness":8140,"money_24h":134140,"supplies_24h":127630,"strategy_points_24h":120,"all_goods_of_age_24h":200},"OceanicFuture":{"population":8960,"happiness":16260,"demandHappiness":8960,"money_24h":151260,"supplies_24h":139920,"strategy_points_24h":120,"all_goods_of_age_24h":200},"VirtualFuture":{"population":9820,"happiness":19420,"demandHappiness":9820,"money_24h":169420,"supplies_24h":151260,"strategy_points_24h":120,"all_goods_of_age_24h":200},"SpaceAgeMars":{"population":15540,"happiness":31080,"demandHappiness":15540,"money_24h":282990,"supplies_24h":244850,"strategy_points_24h":120,"all_goods_of_age_24h":200},"SpaceAgeAsteroidBelt":{"population":16880,"happiness":33770,"demandHappiness":16880,"money_24h":313450,"supplies_24h":262820,"strategy_points_24h":120,"all_goods_of_age_24h":200},"SpaceAgeVenus":{"population":18240,"happiness":36490,"demandHappiness":18240,"money_24h":345530,"supplies_24h":281720,"strategy_points_24h":120,"all_goods_of_age_24h":200},"SpaceAgeJupiterMoon":{"population":19650,"happiness":39300,"demandHappiness":19650,"money_24h":379240,"supplies_24h":299680,"strategy_points_24h":120,"all_goods_of_age_24h":200},"SpaceAgeTitan":{"population":21070,"happiness":42150,"demandHappiness":21070,"money_24h":414620,"supplies_24h":318590,"strategy_points_24h":120,"all_goods_of_age_24h":200},"SpaceAgeSpaceHub":{"population":22500,"happiness":45000,"demandHappiness":22500,"money_24h":450000,"supplies_24h":337500,"strategy_points_24h":120,"all_goods_of_age_24h":200}}, boosts: [{"type":"def_boost_attacker","value":30,"feature":"guild_raids"},{"type":"def_boost_defender","value":30,"feature":"guild_raids"}] },
+    "W_MultiAge_ARCH20A1": { prod: {"BronzeAge":{"population":142,"happiness":570,"demandHappiness":142,"money_24h":1000},"IronAge":{"population":305,"happiness":980,"demandHappiness":305,"money_24h":2300},"EarlyMiddleAge":{"population":467,"happiness":1080,"demandHappiness":467,"money_24h":3800},"HighMiddleAge":{"population":656,"happiness":1210,"demandHappiness":656,"money_24h":5300},"LateMiddleAge":{"population":861,"happiness":1350,"demandHappiness":861,"money_24h":7000},"ColonialAge":{"population":1087,"happiness":1580,"demandHappiness":1087,"money_24h":10700},"IndustrialAge":{"population":1328,"happiness":1780,"demandHappiness":1328,"money_24h":13300},"ProgressiveEra":{"population":1586,"happiness":1960,"demandHappiness":1586,"money_24h":16100},"ModernEra":{"population":1859,"happiness":2100,"demandHappiness":1859,"money_24h":20000},"PostModernEra":{"population":2142,"happiness":2180,"demandHappiness":2142,"money_24h":25200},"ContemporaryEra":{"population":2441,"happiness":2540,"demandHappiness":2441,"money_24h":32800},"TomorrowEra":{"population":2751,"happiness":3080,"demandHappiness":2751,"money_24h":38000},"FutureEra":{"population":3077,"happiness":3690,"demandHappiness":3077,"money_24h":43600},"ArcticFuture":{"population":3413,"happiness":4300,"demandHappiness":3413,"money_24h":49500},"OceanicFuture":{"population":3759,"happiness":4960,"demandHappiness":3759,"money_24h":55800},"VirtualFuture":{"population":4116,"happiness":5930,"demandHappiness":4116,"money_24h":62500},"SpaceAgeMars":{"population":6515,"happiness":9480,"demandHappiness":6515,"money_24h":104400},"SpaceAgeAsteroidBelt":{"population":7077,"happiness":10310,"demandHappiness":7077,"money_24h":115600},"SpaceAgeVenus":{"population":7649,"happiness":11140,"demandHappiness":7649,"money_24h":127500},"SpaceAgeJupiterMoon":{"population":8237,"happiness":12000,"demandHappiness":8237,"money_24h":139900},"SpaceAgeTitan":{"population":8836,"happiness":12860,"demandHappiness":8836,"money_24h":152900},"SpaceAgeSpaceHub":{"population":9450,"happiness":13760,"demandHappiness":9450,"money_24h":166600}} },
+    "W_MultiAge_ARCH20A10": { prod: {"BronzeAge":{"population":198,"happiness":990,"demandHappiness":198,"money_24h":1400,"supplies_24h":1370,"strategy_points_24h":8,"all_goods_of_age_24h":20},"IronAge":{"population":426,"happiness":1710,"demandHappiness":426,"money_24h":3400,"supplies_24h":2360,"strategy_points_24h":8,"all_goods_of_age_24h":20},"EarlyMiddleAge":{"population":654,"happiness":1890,"demandHappiness":654,"money_24h":5700,"supplies_24h":2610,"strategy_points_24h":8,"all_goods_of_age_24h":20},"HighMiddleAge":{"population":919,"happiness":2110,"demandHappiness":919,"money_24h":7900,"supplies_24h":2920,"strategy_points_24h":8,"all_goods_of_age_24h":20},"LateMiddleAge":{"population":1205,"happiness":2360,"demandHappiness":1205,"money_24h":10500,"supplies_24h":3250,"strategy_points_24h":8,"all_goods_of_age_24h":20},"ColonialAge":{"population":1521,"happiness":2770,"demandHappiness":1521,"money_24h":16000,"supplies_24h":3820,"strategy_points_24h":8,"all_goods_of_age_24h":20},"IndustrialAge":{"population":1860,"happiness":3120,"demandHappiness":1860,"money_24h":19900,"supplies_24h":4310,"strategy_points_24h":8,"all_goods_of_age_24h":20},"ProgressiveEra":{"population":2220,"happiness":3430,"demandHappiness":2220,"money_24h":24200,"supplies_24h":4740,"strategy_points_24h":8,"all_goods_of_age_24h":20},"ModernEra":{"population":2602,"happiness":3670,"demandHappiness":2602,"money_24h":30100,"supplies_24h":5070,"strategy_points_24h":8,"all_goods_of_age_24h":20},"PostModernEra":{"population":2999,"happiness":3820,"demandHappiness":2999,"money_24h":37800,"supplies_24h":5280,"strategy_points_24h":8,"all_goods_of_age_24h":20},"ContemporaryEra":{"population":3418,"happiness":4440,"demandHappiness":3418,"money_24h":49200,"supplies_24h":6140,"strategy_points_24h":8,"all_goods_of_age_24h":20},"TomorrowEra":{"population":3851,"happiness":5390,"demandHappiness":3851,"money_24h":57000,"supplies_24h":7450,"strategy_points_24h":8,"all_goods_of_age_24h":20},"FutureEra":{"population":4307,"happiness":6460,"demandHappiness":4307,"money_24h":65300,"supplies_24h":8920,"strategy_points_24h":8,"all_goods_of_age_24h":20},"ArcticFuture":{"population":4778,"happiness":7520,"demandHappiness":4778,"money_24h":74200,"supplies_24h":10390,"strategy_points_24h":8,"all_goods_of_age_24h":20},"OceanicFuture":{"population":5263,"happiness":8680,"demandHappiness":5263,"money_24h":83700,"supplies_24h":11990,"strategy_points_24h":8,"all_goods_of_age_24h":20},"VirtualFuture":{"population":5762,"happiness":10370,"demandHappiness":5762,"money_24h":93700,"supplies_24h":14320,"strategy_points_24h":8,"all_goods_of_age_24h":20},"SpaceAgeMars":{"population":9121,"happiness":16600,"demandHappiness":9121,"money_24h":156600,"supplies_24h":22920,"strategy_points_24h":8,"all_goods_of_age_24h":20},"SpaceAgeAsteroidBelt":{"population":9908,"happiness":18040,"demandHappiness":9908,"money_24h":173400,"supplies_24h":24910,"strategy_points_24h":8,"all_goods_of_age_24h":20},"SpaceAgeVenus":{"population":10709,"happiness":19490,"demandHappiness":10709,"money_24h":191200,"supplies_24h":26910,"strategy_points_24h":8,"all_goods_of_age_24h":20},"SpaceAgeJupiterMoon":{"population":11532,"happiness":20990,"demandHappiness":11532,"money_24h":209800,"supplies_24h":28990,"strategy_points_24h":8,"all_goods_of_age_24h":20},"SpaceAgeTitan":{"population":12370,"happiness":22510,"demandHappiness":12370,"money_24h":229400,"supplies_24h":31090,"strategy_points_24h":8,"all_goods_of_age_24h":20},"SpaceAgeSpaceHub":{"population":13230,"happiness":24080,"demandHappiness":13230,"money_24h":249900,"supplies_24h":33260,"strategy_points_24h":8,"all_goods_of_age_24h":20}} },
+    "W_MultiAge_ARCH20A11": { prod: {"BronzeAge":{"population":206,"happiness":1040,"demandHappiness":206,"money_24h":1500,"supplies_24h":1420,"strategy_points_24h":9,"all_goods_of_age_24h":20},"IronAge":{"population":442,"happiness":1790,"demandHappiness":442,"money_24h":3500,"supplies_24h":2450,"strategy_points_24h":9,"all_goods_of_age_24h":20},"EarlyMiddleAge":{"population":678,"happiness":1980,"demandHappiness":678,"money_24h":5900,"supplies_24h":2700,"strategy_points_24h":9,"all_goods_of_age_24h":20},"HighMiddleAge":{"population":952,"happiness":2210,"demandHappiness":952,"money_24h":8200,"supplies_24h":3020,"strategy_points_24h":9,"all_goods_of_age_24h":20},"LateMiddleAge":{"population":1248,"happiness":2470,"demandHappiness":1248,"money_24h":10900,"supplies_24h":3370,"strategy_points_24h":9,"all_goods_of_age_24h":20},"ColonialAge":{"population":1576,"happiness":2900,"demandHappiness":1576,"money_24h":16600,"supplies_24h":3960,"strategy_points_24h":9,"all_goods_of_age_24h":20},"IndustrialAge":{"population":1926,"happiness":3270,"demandHappiness":1926,"money_24h":20600,"supplies_24h":4460,"strategy_points_24h":9,"all_goods_of_age_24h":20},"ProgressiveEra":{"population":2299,"happiness":3590,"demandHappiness":2299,"money_24h":25100,"supplies_24h":4900,"strategy_points_24h":9,"all_goods_of_age_24h":20},"ModernEra":{"population":2695,"happiness":3840,"demandHappiness":2695,"money_24h":31200,"supplies_24h":5240,"strategy_points_24h":9,"all_goods_of_age_24h":20},"PostModernEra":{"population":3106,"happiness":4010,"demandHappiness":3106,"money_24h":39200,"supplies_24h":5460,"strategy_points_24h":9,"all_goods_of_age_24h":20},"ContemporaryEra":{"population":3540,"happiness":4650,"demandHappiness":3540,"money_24h":51000,"supplies_24h":6350,"strategy_points_24h":9,"all_goods_of_age_24h":20},"TomorrowEra":{"population":3989,"happiness":5650,"demandHappiness":3989,"money_24h":59100,"supplies_24h":7700,"strategy_points_24h":9,"all_goods_of_age_24h":20},"FutureEra":{"population":4461,"happiness":6770,"demandHappiness":4461,"money_24h":67700,"supplies_24h":9230,"strategy_points_24h":9,"all_goods_of_age_24h":20},"ArcticFuture":{"population":4948,"happiness":7880,"demandHappiness":4948,"money_24h":77000,"supplies_24h":10750,"strategy_points_24h":9,"all_goods_of_age_24h":20},"OceanicFuture":{"population":5451,"happiness":9100,"demandHappiness":5451,"money_24h":86800,"supplies_24h":12400,"strategy_points_24h":9,"all_goods_of_age_24h":20},"VirtualFuture":{"population":5968,"happiness":10870,"demandHappiness":5968,"money_24h":97200,"supplies_24h":14820,"strategy_points_24h":9,"all_goods_of_age_24h":20},"SpaceAgeMars":{"population":9447,"happiness":17390,"demandHappiness":9447,"money_24h":162400,"supplies_24h":23710,"strategy_points_24h":9,"all_goods_of_age_24h":20},"SpaceAgeAsteroidBelt":{"population":10262,"happiness":18900,"demandHappiness":10262,"money_24h":179900,"supplies_24h":25770,"strategy_points_24h":9,"all_goods_of_age_24h":20},"SpaceAgeVenus":{"population":11091,"happiness":20410,"demandHappiness":11091,"money_24h":198300,"supplies_24h":27840,"strategy_points_24h":9,"all_goods_of_age_24h":20},"SpaceAgeJupiterMoon":{"population":11944,"happiness":21990,"demandHappiness":11944,"money_24h":217600,"supplies_24h":29990,"strategy_points_24h":9,"all_goods_of_age_24h":20},"SpaceAgeTitan":{"population":12812,"happiness":23580,"demandHappiness":12812,"money_24h":237900,"supplies_24h":32160,"strategy_points_24h":9,"all_goods_of_age_24h":20},"SpaceAgeSpaceHub":{"population":13703,"happiness":25230,"demandHappiness":13703,"money_24h":259200,"supplies_24h":34400,"strategy_points_24h":9,"all_goods_of_age_24h":20}} },
+    "W_MultiAge_ARCH20A2": { prod: {"BronzeAge":{"population":142,"happiness":620,"demandHappiness":142,"money_24h":1000,"supplies_24h":990},"IronAge":{"population":305,"happiness":1060,"demandHappiness":305,"money_24h":2400,"supplies_24h":1710},"EarlyMiddleAge":{"population":467,"happiness":1170,"demandHappiness":467,"money_24h":4000,"supplies_24h":1890},"HighMiddleAge":{"population":656,"happiness":1310,"demandHappiness":656,"money_24h":5600,"supplies_24h":2110},"LateMiddleAge":{"population":861,"happiness":1460,"demandHappiness":861,"money_24h":7400,"supplies_24h":2360},"ColonialAge":{"population":1087,"happiness":1710,"demandHappiness":1087,"money_24h":11200,"supplies_24h":2770},"IndustrialAge":{"population":1328,"happiness":1930,"demandHappiness":1328,"money_24h":14000,"supplies_24h":3120},"ProgressiveEra":{"population":1586,"happiness":2120,"demandHappiness":1586,"money_24h":17000,"supplies_24h":3430},"ModernEra":{"population":1859,"happiness":2270,"demandHappiness":1859,"money_24h":21200,"supplies_24h":3670},"PostModernEra":{"population":2142,"happiness":2370,"demandHappiness":2142,"money_24h":26600,"supplies_24h":3820},"ContemporaryEra":{"population":2441,"happiness":2750,"demandHappiness":2441,"money_24h":34600,"supplies_24h":4440},"TomorrowEra":{"population":2751,"happiness":3340,"demandHappiness":2751,"money_24h":40100,"supplies_24h":5390},"FutureEra":{"population":3077,"happiness":4000,"demandHappiness":3077,"money_24h":46000,"supplies_24h":6460},"ArcticFuture":{"population":3413,"happiness":4660,"demandHappiness":3413,"money_24h":52200,"supplies_24h":7520},"OceanicFuture":{"population":3759,"happiness":5380,"demandHappiness":3759,"money_24h":58900,"supplies_24h":8680},"VirtualFuture":{"population":4116,"happiness":6420,"demandHappiness":4116,"money_24h":66000,"supplies_24h":10370},"SpaceAgeMars":{"population":6515,"happiness":10270,"demandHappiness":6515,"money_24h":110200,"supplies_24h":16600},"SpaceAgeAsteroidBelt":{"population":7077,"happiness":11170,"demandHappiness":7077,"money_24h":122000,"supplies_24h":18040},"SpaceAgeVenus":{"population":7649,"happiness":12060,"demandHappiness":7649,"money_24h":134500,"supplies_24h":19490},"SpaceAgeJupiterMoon":{"population":8237,"happiness":12990,"demandHappiness":8237,"money_24h":147700,"supplies_24h":20990},"SpaceAgeTitan":{"population":8836,"happiness":13940,"demandHappiness":8836,"money_24h":161400,"supplies_24h":22510},"SpaceAgeSpaceHub":{"population":9450,"happiness":14910,"demandHappiness":9450,"money_24h":175900,"supplies_24h":24080}} },
+    "W_MultiAge_ARCH20A3": { prod: {"BronzeAge":{"population":149,"happiness":660,"demandHappiness":149,"money_24h":1100,"supplies_24h":1040,"strategy_points_24h":2},"IronAge":{"population":320,"happiness":1140,"demandHappiness":320,"money_24h":2500,"supplies_24h":1790,"strategy_points_24h":2},"EarlyMiddleAge":{"population":491,"happiness":1260,"demandHappiness":491,"money_24h":4200,"supplies_24h":1980,"strategy_points_24h":2},"HighMiddleAge":{"population":689,"happiness":1410,"demandHappiness":689,"money_24h":5900,"supplies_24h":2210,"strategy_points_24h":2},"LateMiddleAge":{"population":904,"happiness":1570,"demandHappiness":904,"money_24h":7800,"supplies_24h":2470,"strategy_points_24h":2},"ColonialAge":{"population":1141,"happiness":1850,"demandHappiness":1141,"money_24h":11800,"supplies_24h":2900,"strategy_points_24h":2},"IndustrialAge":{"population":1395,"happiness":2080,"demandHappiness":1395,"money_24h":14700,"supplies_24h":3270,"strategy_points_24h":2},"ProgressiveEra":{"population":1665,"happiness":2290,"demandHappiness":1665,"money_24h":17900,"supplies_24h":3590,"strategy_points_24h":2},"ModernEra":{"population":1951,"happiness":2450,"demandHappiness":1951,"money_24h":22300,"supplies_24h":3840,"strategy_points_24h":2},"PostModernEra":{"population":2249,"happiness":2550,"demandHappiness":2249,"money_24h":28000,"supplies_24h":4010,"strategy_points_24h":2},"ContemporaryEra":{"population":2563,"happiness":2960,"demandHappiness":2563,"money_24h":36500,"supplies_24h":4650,"strategy_points_24h":2},"TomorrowEra":{"population":2889,"happiness":3600,"demandHappiness":2889,"money_24h":42200,"supplies_24h":5650,"strategy_points_24h":2},"FutureEra":{"population":3230,"happiness":4310,"demandHappiness":3230,"money_24h":48400,"supplies_24h":6770,"strategy_points_24h":2},"ArcticFuture":{"population":3583,"happiness":5020,"demandHappiness":3583,"money_24h":55000,"supplies_24h":7880,"strategy_points_24h":2},"OceanicFuture":{"population":3947,"happiness":5790,"demandHappiness":3947,"money_24h":62000,"supplies_24h":9100,"strategy_points_24h":2},"VirtualFuture":{"population":4322,"happiness":6920,"demandHappiness":4322,"money_24h":69400,"supplies_24h":10870,"strategy_points_24h":2},"SpaceAgeMars":{"population":6841,"happiness":11070,"demandHappiness":6841,"money_24h":116000,"supplies_24h":17390,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"population":7431,"happiness":12020,"demandHappiness":7431,"money_24h":128500,"supplies_24h":18900,"strategy_points_24h":2},"SpaceAgeVenus":{"population":8032,"happiness":12990,"demandHappiness":8032,"money_24h":141600,"supplies_24h":20410,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"population":8649,"happiness":13990,"demandHappiness":8649,"money_24h":155400,"supplies_24h":21990,"strategy_points_24h":2},"SpaceAgeTitan":{"population":9278,"happiness":15010,"demandHappiness":9278,"money_24h":169900,"supplies_24h":23580,"strategy_points_24h":2},"SpaceAgeSpaceHub":{"population":9923,"happiness":16050,"demandHappiness":9923,"money_24h":185100,"supplies_24h":25230,"strategy_points_24h":2}} },
+    "W_MultiAge_ARCH20A4": { prod: {"BronzeAge":{"population":156,"happiness":710,"demandHappiness":156,"money_24h":1100,"supplies_24h":1090,"strategy_points_24h":3},"IronAge":{"population":335,"happiness":1220,"demandHappiness":335,"money_24h":2700,"supplies_24h":1870,"strategy_points_24h":3},"EarlyMiddleAge":{"population":514,"happiness":1350,"demandHappiness":514,"money_24h":4400,"supplies_24h":2070,"strategy_points_24h":3},"HighMiddleAge":{"population":722,"happiness":1510,"demandHappiness":722,"money_24h":6200,"supplies_24h":2310,"strategy_points_24h":3},"LateMiddleAge":{"population":947,"happiness":1680,"demandHappiness":947,"money_24h":8200,"supplies_24h":2580,"strategy_points_24h":3},"ColonialAge":{"population":1195,"happiness":1980,"demandHappiness":1195,"money_24h":12400,"supplies_24h":3030,"strategy_points_24h":3},"IndustrialAge":{"population":1461,"happiness":2230,"demandHappiness":1461,"money_24h":15500,"supplies_24h":3420,"strategy_points_24h":3},"ProgressiveEra":{"population":1744,"happiness":2450,"demandHappiness":1744,"money_24h":18800,"supplies_24h":3760,"strategy_points_24h":3},"ModernEra":{"population":2044,"happiness":2620,"demandHappiness":2044,"money_24h":23400,"supplies_24h":4020,"strategy_points_24h":3},"PostModernEra":{"population":2356,"happiness":2730,"demandHappiness":2356,"money_24h":29400,"supplies_24h":4190,"strategy_points_24h":3},"ContemporaryEra":{"population":2685,"happiness":3170,"demandHappiness":2685,"money_24h":38300,"supplies_24h":4870,"strategy_points_24h":3},"TomorrowEra":{"population":3026,"happiness":3850,"demandHappiness":3026,"money_24h":44300,"supplies_24h":5910,"strategy_points_24h":3},"FutureEra":{"population":3384,"happiness":4620,"demandHappiness":3384,"money_24h":50800,"supplies_24h":7080,"strategy_points_24h":3},"ArcticFuture":{"population":3754,"happiness":5370,"demandHappiness":3754,"money_24h":57700,"supplies_24h":8240,"strategy_points_24h":3},"OceanicFuture":{"population":4135,"happiness":6200,"demandHappiness":4135,"money_24h":65100,"supplies_24h":9510,"strategy_points_24h":3},"VirtualFuture":{"population":4528,"happiness":7410,"demandHappiness":4528,"money_24h":72900,"supplies_24h":11360,"strategy_points_24h":3},"SpaceAgeMars":{"population":7167,"happiness":11860,"demandHappiness":7167,"money_24h":121800,"supplies_24h":18180,"strategy_points_24h":3},"SpaceAgeAsteroidBelt":{"population":7785,"happiness":12880,"demandHappiness":7785,"money_24h":134900,"supplies_24h":19750,"strategy_points_24h":3},"SpaceAgeVenus":{"population":8414,"happiness":13920,"demandHappiness":8414,"money_24h":148700,"supplies_24h":21340,"strategy_points_24h":3},"SpaceAgeJupiterMoon":{"population":9061,"happiness":14990,"demandHappiness":9061,"money_24h":163200,"supplies_24h":22990,"strategy_points_24h":3},"SpaceAgeTitan":{"population":9719,"happiness":16080,"demandHappiness":9719,"money_24h":178400,"supplies_24h":24660,"strategy_points_24h":3},"SpaceAgeSpaceHub":{"population":10395,"happiness":17200,"demandHappiness":10395,"money_24h":194400,"supplies_24h":26380,"strategy_points_24h":3}} },
+    "W_MultiAge_ARCH20A5": { prod: {"BronzeAge":{"population":163,"happiness":760,"demandHappiness":163,"money_24h":1200,"supplies_24h":1140,"strategy_points_24h":4},"IronAge":{"population":350,"happiness":1300,"demandHappiness":350,"money_24h":2800,"supplies_24h":1960,"strategy_points_24h":4},"EarlyMiddleAge":{"population":537,"happiness":1440,"demandHappiness":537,"money_24h":4600,"supplies_24h":2160,"strategy_points_24h":4},"HighMiddleAge":{"population":755,"happiness":1610,"demandHappiness":755,"money_24h":6500,"supplies_24h":2410,"strategy_points_24h":4},"LateMiddleAge":{"population":990,"happiness":1790,"demandHappiness":990,"money_24h":8600,"supplies_24h":2690,"strategy_points_24h":4},"ColonialAge":{"population":1250,"happiness":2110,"demandHappiness":1250,"money_24h":13000,"supplies_24h":3170,"strategy_points_24h":4},"IndustrialAge":{"population":1527,"happiness":2380,"demandHappiness":1527,"money_24h":16200,"supplies_24h":3570,"strategy_points_24h":4},"ProgressiveEra":{"population":1823,"happiness":2610,"demandHappiness":1823,"money_24h":19700,"supplies_24h":3920,"strategy_points_24h":4},"ModernEra":{"population":2137,"happiness":2800,"demandHappiness":2137,"money_24h":24500,"supplies_24h":4190,"strategy_points_24h":4},"PostModernEra":{"population":2463,"happiness":2910,"demandHappiness":2463,"money_24h":30800,"supplies_24h":4370,"strategy_points_24h":4},"ContemporaryEra":{"population":2807,"happiness":3390,"demandHappiness":2807,"money_24h":40100,"supplies_24h":5080,"strategy_points_24h":4},"TomorrowEra":{"population":3164,"happiness":4110,"demandHappiness":3164,"money_24h":46400,"supplies_24h":6160,"strategy_points_24h":4},"FutureEra":{"population":3538,"happiness":4920,"demandHappiness":3538,"money_24h":53200,"supplies_24h":7380,"strategy_points_24h":4},"ArcticFuture":{"population":3924,"happiness":5730,"demandHappiness":3924,"money_24h":60500,"supplies_24h":8600,"strategy_points_24h":4},"OceanicFuture":{"population":4323,"happiness":6620,"demandHappiness":4323,"money_24h":68200,"supplies_24h":9920,"strategy_points_24h":4},"VirtualFuture":{"population":4733,"happiness":7900,"demandHappiness":4733,"money_24h":76400,"supplies_24h":11850,"strategy_points_24h":4},"SpaceAgeMars":{"population":7493,"happiness":12650,"demandHappiness":7493,"money_24h":127600,"supplies_24h":18970,"strategy_points_24h":4},"SpaceAgeAsteroidBelt":{"population":8139,"happiness":13740,"demandHappiness":8139,"money_24h":141300,"supplies_24h":20610,"strategy_points_24h":4},"SpaceAgeVenus":{"population":8797,"happiness":14850,"demandHappiness":8797,"money_24h":155800,"supplies_24h":22270,"strategy_points_24h":4},"SpaceAgeJupiterMoon":{"population":9473,"happiness":15990,"demandHappiness":9473,"money_24h":171000,"supplies_24h":23990,"strategy_points_24h":4},"SpaceAgeTitan":{"population":10161,"happiness":17150,"demandHappiness":10161,"money_24h":186900,"supplies_24h":25730,"strategy_points_24h":4},"SpaceAgeSpaceHub":{"population":10868,"happiness":18350,"demandHappiness":10868,"money_24h":203600,"supplies_24h":27520,"strategy_points_24h":4}} },
+    "W_MultiAge_ARCH20A6": { prod: {"BronzeAge":{"population":170,"happiness":800,"demandHappiness":170,"money_24h":1200,"supplies_24h":1180,"strategy_points_24h":5,"all_goods_of_age_24h":5},"IronAge":{"population":365,"happiness":1390,"demandHappiness":365,"money_24h":2900,"supplies_24h":2040,"strategy_points_24h":5,"all_goods_of_age_24h":5},"EarlyMiddleAge":{"population":561,"happiness":1530,"demandHappiness":561,"money_24h":4800,"supplies_24h":2250,"strategy_points_24h":5,"all_goods_of_age_24h":5},"HighMiddleAge":{"population":788,"happiness":1710,"demandHappiness":788,"money_24h":6800,"supplies_24h":2510,"strategy_points_24h":5,"all_goods_of_age_24h":5},"LateMiddleAge":{"population":1033,"happiness":1910,"demandHappiness":1033,"money_24h":8900,"supplies_24h":2800,"strategy_points_24h":5,"all_goods_of_age_24h":5},"ColonialAge":{"population":1304,"happiness":2240,"demandHappiness":1304,"money_24h":13600,"supplies_24h":3300,"strategy_points_24h":5,"all_goods_of_age_24h":5},"IndustrialAge":{"population":1594,"happiness":2530,"demandHappiness":1594,"money_24h":17000,"supplies_24h":3720,"strategy_points_24h":5,"all_goods_of_age_24h":5},"ProgressiveEra":{"population":1903,"happiness":2780,"demandHappiness":1903,"money_24h":20600,"supplies_24h":4080,"strategy_points_24h":5,"all_goods_of_age_24h":5},"ModernEra":{"population":2230,"happiness":2970,"demandHappiness":2230,"money_24h":25600,"supplies_24h":4370,"strategy_points_24h":5,"all_goods_of_age_24h":5},"PostModernEra":{"population":2570,"happiness":3100,"demandHappiness":2570,"money_24h":32200,"supplies_24h":4550,"strategy_points_24h":5,"all_goods_of_age_24h":5},"ContemporaryEra":{"population":2930,"happiness":3600,"demandHappiness":2930,"money_24h":41900,"supplies_24h":5290,"strategy_points_24h":5,"all_goods_of_age_24h":5},"TomorrowEra":{"population":3301,"happiness":4370,"demandHappiness":3301,"money_24h":48500,"supplies_24h":6420,"strategy_points_24h":5,"all_goods_of_age_24h":5},"FutureEra":{"population":3692,"happiness":5230,"demandHappiness":3692,"money_24h":55600,"supplies_24h":7690,"strategy_points_24h":5,"all_goods_of_age_24h":5},"ArcticFuture":{"population":4095,"happiness":6090,"demandHappiness":4095,"money_24h":63200,"supplies_24h":8960,"strategy_points_24h":5,"all_goods_of_age_24h":5},"OceanicFuture":{"population":4511,"happiness":7030,"demandHappiness":4511,"money_24h":71300,"supplies_24h":10340,"strategy_points_24h":5,"all_goods_of_age_24h":5},"VirtualFuture":{"population":4939,"happiness":8400,"demandHappiness":4939,"money_24h":79900,"supplies_24h":12350,"strategy_points_24h":5,"all_goods_of_age_24h":5},"SpaceAgeMars":{"population":7818,"happiness":13440,"demandHappiness":7818,"money_24h":133400,"supplies_24h":19760,"strategy_points_24h":5,"all_goods_of_age_24h":5},"SpaceAgeAsteroidBelt":{"population":8492,"happiness":14600,"demandHappiness":8492,"money_24h":147700,"supplies_24h":21470,"strategy_points_24h":5,"all_goods_of_age_24h":5},"SpaceAgeVenus":{"population":9179,"happiness":15780,"demandHappiness":9179,"money_24h":162900,"supplies_24h":23200,"strategy_points_24h":5,"all_goods_of_age_24h":5},"SpaceAgeJupiterMoon":{"population":9885,"happiness":16990,"demandHappiness":9885,"money_24h":178800,"supplies_24h":24990,"strategy_points_24h":5,"all_goods_of_age_24h":5},"SpaceAgeTitan":{"population":10603,"happiness":18220,"demandHappiness":10603,"money_24h":195400,"supplies_24h":26800,"strategy_points_24h":5,"all_goods_of_age_24h":5},"SpaceAgeSpaceHub":{"population":11340,"happiness":19500,"demandHappiness":11340,"money_24h":212900,"supplies_24h":28670,"strategy_points_24h":5,"all_goods_of_age_24h":5}} },
+    "W_MultiAge_ARCH20A7": { prod: {"BronzeAge":{"population":177,"happiness":850,"demandHappiness":177,"money_24h":1300,"supplies_24h":1230,"strategy_points_24h":6,"all_goods_of_age_24h":5},"IronAge":{"population":381,"happiness":1470,"demandHappiness":381,"money_24h":3000,"supplies_24h":2120,"strategy_points_24h":6,"all_goods_of_age_24h":5},"EarlyMiddleAge":{"population":584,"happiness":1620,"demandHappiness":584,"money_24h":5000,"supplies_24h":2340,"strategy_points_24h":6,"all_goods_of_age_24h":5},"HighMiddleAge":{"population":820,"happiness":1810,"demandHappiness":820,"money_24h":7100,"supplies_24h":2610,"strategy_points_24h":6,"all_goods_of_age_24h":5},"LateMiddleAge":{"population":1076,"happiness":2020,"demandHappiness":1076,"money_24h":9300,"supplies_24h":2920,"strategy_points_24h":6,"all_goods_of_age_24h":5},"ColonialAge":{"population":1358,"happiness":2370,"demandHappiness":1358,"money_24h":14200,"supplies_24h":3430,"strategy_points_24h":6,"all_goods_of_age_24h":5},"IndustrialAge":{"population":1660,"happiness":2680,"demandHappiness":1660,"money_24h":17700,"supplies_24h":3870,"strategy_points_24h":6,"all_goods_of_age_24h":5},"ProgressiveEra":{"population":1982,"happiness":2940,"demandHappiness":1982,"money_24h":21500,"supplies_24h":4250,"strategy_points_24h":6,"all_goods_of_age_24h":5},"ModernEra":{"population":2323,"happiness":3150,"demandHappiness":2323,"money_24h":26700,"supplies_24h":4540,"strategy_points_24h":6,"all_goods_of_age_24h":5},"PostModernEra":{"population":2678,"happiness":3280,"demandHappiness":2678,"money_24h":33600,"supplies_24h":4730,"strategy_points_24h":6,"all_goods_of_age_24h":5},"ContemporaryEra":{"population":3052,"happiness":3810,"demandHappiness":3052,"money_24h":43800,"supplies_24h":5500,"strategy_points_24h":6,"all_goods_of_age_24h":5},"TomorrowEra":{"population":3439,"happiness":4620,"demandHappiness":3439,"money_24h":50700,"supplies_24h":6680,"strategy_points_24h":6,"all_goods_of_age_24h":5},"FutureEra":{"population":3846,"happiness":5540,"demandHappiness":3846,"money_24h":58100,"supplies_24h":8000,"strategy_points_24h":6,"all_goods_of_age_24h":5},"ArcticFuture":{"population":4266,"happiness":6450,"demandHappiness":4266,"money_24h":66000,"supplies_24h":9320,"strategy_points_24h":6,"all_goods_of_age_24h":5},"OceanicFuture":{"population":4699,"happiness":7440,"demandHappiness":4699,"money_24h":74400,"supplies_24h":10750,"strategy_points_24h":6,"all_goods_of_age_24h":5},"VirtualFuture":{"population":5145,"happiness":8890,"demandHappiness":5145,"money_24h":83300,"supplies_24h":12840,"strategy_points_24h":6,"all_goods_of_age_24h":5},"SpaceAgeMars":{"population":8144,"happiness":14230,"demandHappiness":8144,"money_24h":139200,"supplies_24h":20550,"strategy_points_24h":6,"all_goods_of_age_24h":5},"SpaceAgeAsteroidBelt":{"population":8846,"happiness":15460,"demandHappiness":8846,"money_24h":154200,"supplies_24h":22330,"strategy_points_24h":6,"all_goods_of_age_24h":5},"SpaceAgeVenus":{"population":9562,"happiness":16700,"demandHappiness":9562,"money_24h":169900,"supplies_24h":24130,"strategy_points_24h":6,"all_goods_of_age_24h":5},"SpaceAgeJupiterMoon":{"population":10297,"happiness":17990,"demandHappiness":10297,"money_24h":186500,"supplies_24h":25990,"strategy_points_24h":6,"all_goods_of_age_24h":5},"SpaceAgeTitan":{"population":11045,"happiness":19300,"demandHappiness":11045,"money_24h":203900,"supplies_24h":27870,"strategy_points_24h":6,"all_goods_of_age_24h":5},"SpaceAgeSpaceHub":{"population":11813,"happiness":20640,"demandHappiness":11813,"money_24h":222100,"supplies_24h":29820,"strategy_points_24h":6,"all_goods_of_age_24h":5}} },
+    "W_MultiAge_ARCH20A8": { prod: {"BronzeAge":{"population":184,"happiness":900,"demandHappiness":184,"money_24h":1300,"supplies_24h":1280,"strategy_points_24h":7,"all_goods_of_age_24h":10},"IronAge":{"population":396,"happiness":1550,"demandHappiness":396,"money_24h":3200,"supplies_24h":2200,"strategy_points_24h":7,"all_goods_of_age_24h":10},"EarlyMiddleAge":{"population":607,"happiness":1710,"demandHappiness":607,"money_24h":5300,"supplies_24h":2430,"strategy_points_24h":7,"all_goods_of_age_24h":10},"HighMiddleAge":{"population":853,"happiness":1910,"demandHappiness":853,"money_24h":7400,"supplies_24h":2720,"strategy_points_24h":7,"all_goods_of_age_24h":10},"LateMiddleAge":{"population":1119,"happiness":2130,"demandHappiness":1119,"money_24h":9700,"supplies_24h":3030,"strategy_points_24h":7,"all_goods_of_age_24h":10},"ColonialAge":{"population":1413,"happiness":2510,"demandHappiness":1413,"money_24h":14800,"supplies_24h":3560,"strategy_points_24h":7,"all_goods_of_age_24h":10},"IndustrialAge":{"population":1727,"happiness":2830,"demandHappiness":1727,"money_24h":18400,"supplies_24h":4020,"strategy_points_24h":7,"all_goods_of_age_24h":10},"ProgressiveEra":{"population":2061,"happiness":3100,"demandHappiness":2061,"money_24h":22400,"supplies_24h":4410,"strategy_points_24h":7,"all_goods_of_age_24h":10},"ModernEra":{"population":2416,"happiness":3320,"demandHappiness":2416,"money_24h":27800,"supplies_24h":4720,"strategy_points_24h":7,"all_goods_of_age_24h":10},"PostModernEra":{"population":2785,"happiness":3460,"demandHappiness":2785,"money_24h":35000,"supplies_24h":4920,"strategy_points_24h":7,"all_goods_of_age_24h":10},"ContemporaryEra":{"population":3174,"happiness":4020,"demandHappiness":3174,"money_24h":45600,"supplies_24h":5710,"strategy_points_24h":7,"all_goods_of_age_24h":10},"TomorrowEra":{"population":3576,"happiness":4880,"demandHappiness":3576,"money_24h":52800,"supplies_24h":6930,"strategy_points_24h":7,"all_goods_of_age_24h":10},"FutureEra":{"population":3999,"happiness":5850,"demandHappiness":3999,"money_24h":60500,"supplies_24h":8310,"strategy_points_24h":7,"all_goods_of_age_24h":10},"ArcticFuture":{"population":4436,"happiness":6810,"demandHappiness":4436,"money_24h":68700,"supplies_24h":9670,"strategy_points_24h":7,"all_goods_of_age_24h":10},"OceanicFuture":{"population":4887,"happiness":7860,"demandHappiness":4887,"money_24h":77500,"supplies_24h":11160,"strategy_points_24h":7,"all_goods_of_age_24h":10},"VirtualFuture":{"population":5351,"happiness":9390,"demandHappiness":5351,"money_24h":86800,"supplies_24h":13340,"strategy_points_24h":7,"all_goods_of_age_24h":10},"SpaceAgeMars":{"population":8470,"happiness":15020,"demandHappiness":8470,"money_24h":145000,"supplies_24h":21340,"strategy_points_24h":7,"all_goods_of_age_24h":10},"SpaceAgeAsteroidBelt":{"population":9200,"happiness":16320,"demandHappiness":9200,"money_24h":160600,"supplies_24h":23190,"strategy_points_24h":7,"all_goods_of_age_24h":10},"SpaceAgeVenus":{"population":9944,"happiness":17630,"demandHappiness":9944,"money_24h":177000,"supplies_24h":25050,"strategy_points_24h":7,"all_goods_of_age_24h":10},"SpaceAgeJupiterMoon":{"population":10708,"happiness":18990,"demandHappiness":10708,"money_24h":194300,"supplies_24h":26990,"strategy_points_24h":7,"all_goods_of_age_24h":10},"SpaceAgeTitan":{"population":11486,"happiness":20370,"demandHappiness":11486,"money_24h":212400,"supplies_24h":28940,"strategy_points_24h":7,"all_goods_of_age_24h":10},"SpaceAgeSpaceHub":{"population":12285,"happiness":21790,"demandHappiness":12285,"money_24h":231400,"supplies_24h":30960,"strategy_points_24h":7,"all_goods_of_age_24h":10}} },
+    "W_MultiAge_ARCH20A9": { prod: {"BronzeAge":{"population":191,"happiness":950,"demandHappiness":191,"money_24h":1400,"supplies_24h":1320,"strategy_points_24h":8,"all_goods_of_age_24h":15},"IronAge":{"population":411,"happiness":1630,"demandHappiness":411,"money_24h":3300,"supplies_24h":2280,"strategy_points_24h":8,"all_goods_of_age_24h":15},"EarlyMiddleAge":{"population":631,"happiness":1800,"demandHappiness":631,"money_24h":5500,"supplies_24h":2520,"strategy_points_24h":8,"all_goods_of_age_24h":15},"HighMiddleAge":{"population":886,"happiness":2010,"demandHappiness":886,"money_24h":7600,"supplies_24h":2820,"strategy_points_24h":8,"all_goods_of_age_24h":15},"LateMiddleAge":{"population":1162,"happiness":2240,"demandHappiness":1162,"money_24h":10100,"supplies_24h":3140,"strategy_points_24h":8,"all_goods_of_age_24h":15},"ColonialAge":{"population":1467,"happiness":2640,"demandHappiness":1467,"money_24h":15400,"supplies_24h":3690,"strategy_points_24h":8,"all_goods_of_age_24h":15},"IndustrialAge":{"population":1793,"happiness":2970,"demandHappiness":1793,"money_24h":19200,"supplies_24h":4160,"strategy_points_24h":8,"all_goods_of_age_24h":15},"ProgressiveEra":{"population":2140,"happiness":3270,"demandHappiness":2140,"money_24h":23300,"supplies_24h":4570,"strategy_points_24h":8,"all_goods_of_age_24h":15},"ModernEra":{"population":2509,"happiness":3490,"demandHappiness":2509,"money_24h":28900,"supplies_24h":4890,"strategy_points_24h":8,"all_goods_of_age_24h":15},"PostModernEra":{"population":2892,"happiness":3640,"demandHappiness":2892,"money_24h":36400,"supplies_24h":5100,"strategy_points_24h":8,"all_goods_of_age_24h":15},"ContemporaryEra":{"population":3296,"happiness":4230,"demandHappiness":3296,"money_24h":47400,"supplies_24h":5920,"strategy_points_24h":8,"all_goods_of_age_24h":15},"TomorrowEra":{"population":3714,"happiness":5140,"demandHappiness":3714,"money_24h":54900,"supplies_24h":7190,"strategy_points_24h":8,"all_goods_of_age_24h":15},"FutureEra":{"population":4153,"happiness":6150,"demandHappiness":4153,"money_24h":62900,"supplies_24h":8620,"strategy_points_24h":8,"all_goods_of_age_24h":15},"ArcticFuture":{"population":4607,"happiness":7170,"demandHappiness":4607,"money_24h":71500,"supplies_24h":10030,"strategy_points_24h":8,"all_goods_of_age_24h":15},"OceanicFuture":{"population":5075,"happiness":8270,"demandHappiness":5075,"money_24h":80600,"supplies_24h":11580,"strategy_points_24h":8,"all_goods_of_age_24h":15},"VirtualFuture":{"population":5557,"happiness":9880,"demandHappiness":5557,"money_24h":90300,"supplies_24h":13830,"strategy_points_24h":8,"all_goods_of_age_24h":15},"SpaceAgeMars":{"population":8796,"happiness":15810,"demandHappiness":8796,"money_24h":150800,"supplies_24h":22130,"strategy_points_24h":8,"all_goods_of_age_24h":15},"SpaceAgeAsteroidBelt":{"population":9554,"happiness":17180,"demandHappiness":9554,"money_24h":167000,"supplies_24h":24050,"strategy_points_24h":8,"all_goods_of_age_24h":15},"SpaceAgeVenus":{"population":10326,"happiness":18560,"demandHappiness":10326,"money_24h":184100,"supplies_24h":25980,"strategy_points_24h":8,"all_goods_of_age_24h":15},"SpaceAgeJupiterMoon":{"population":11120,"happiness":19990,"demandHappiness":11120,"money_24h":202100,"supplies_24h":27990,"strategy_points_24h":8,"all_goods_of_age_24h":15},"SpaceAgeTitan":{"population":11928,"happiness":21440,"demandHappiness":11928,"money_24h":220900,"supplies_24h":30020,"strategy_points_24h":8,"all_goods_of_age_24h":15},"SpaceAgeSpaceHub":{"population":12758,"happiness":22940,"demandHappiness":12758,"money_24h":240600,"supplies_24h":32110,"strategy_points_24h":8,"all_goods_of_age_24h":15}} },
+    "W_MultiAge_ARCH20A13": { prod: {"BronzeAge":{"population":300,"happiness":1670,"demandHappiness":300,"money_24h":2240,"supplies_24h":3940,"strategy_points_24h":100,"all_goods_of_age_24h":170},"IronAge":{"population":650,"happiness":2880,"demandHappiness":650,"money_24h":5380,"supplies_24h":9450,"strategy_points_24h":100,"all_goods_of_age_24h":170},"EarlyMiddleAge":{"population":1000,"happiness":3190,"demandHappiness":1000,"money_24h":8970,"supplies_24h":15760,"strategy_points_24h":100,"all_goods_of_age_24h":170},"HighMiddleAge":{"population":1410,"happiness":3560,"demandHappiness":1410,"money_24h":12550,"supplies_24h":22060,"strategy_points_24h":100,"all_goods_of_age_24h":170},"LateMiddleAge":{"population":1850,"happiness":3970,"demandHappiness":1850,"money_24h":16590,"supplies_24h":29150,"strategy_points_24h":100,"all_goods_of_age_24h":170},"ColonialAge":{"population":2330,"happiness":4670,"demandHappiness":2330,"money_24h":25260,"supplies_24h":37030,"strategy_points_24h":100,"all_goods_of_age_24h":170},"IndustrialAge":{"population":2850,"happiness":5260,"demandHappiness":2850,"money_24h":31470,"supplies_24h":44910,"strategy_points_24h":100,"all_goods_of_age_24h":170},"ProgressiveEra":{"population":3400,"happiness":5780,"demandHappiness":3400,"money_24h":38200,"supplies_24h":52780,"strategy_points_24h":100,"all_goods_of_age_24h":170},"ModernEra":{"population":3990,"happiness":6180,"demandHappiness":3990,"money_24h":47520,"supplies_24h":61450,"strategy_points_24h":100,"all_goods_of_age_24h":170},"PostModernEra":{"population":4600,"happiness":6440,"demandHappiness":4600,"money_24h":59790,"supplies_24h":70120,"strategy_points_24h":100,"all_goods_of_age_24h":170},"ContemporaryEra":{"population":5240,"happiness":7490,"demandHappiness":5240,"money_24h":77830,"supplies_24h":78780,"strategy_points_24h":100,"all_goods_of_age_24h":170},"TomorrowEra":{"population":5900,"happiness":9090,"demandHappiness":5900,"money_24h":90120,"supplies_24h":88240,"strategy_points_24h":100,"all_goods_of_age_24h":170},"FutureEra":{"population":6600,"happiness":10890,"demandHappiness":6600,"money_24h":103300,"supplies_24h":96900,"strategy_points_24h":100,"all_goods_of_age_24h":170},"ArcticFuture":{"population":7320,"happiness":12680,"demandHappiness":7320,"money_24h":117370,"supplies_24h":106360,"strategy_points_24h":100,"all_goods_of_age_24h":170},"OceanicFuture":{"population":8070,"happiness":14630,"demandHappiness":8070,"money_24h":132350,"supplies_24h":116600,"strategy_points_24h":100,"all_goods_of_age_24h":170},"VirtualFuture":{"population":8830,"happiness":17480,"demandHappiness":8830,"money_24h":148240,"supplies_24h":126050,"strategy_points_24h":100,"all_goods_of_age_24h":170},"SpaceAgeMars":{"population":13980,"happiness":27970,"demandHappiness":13980,"money_24h":247620,"supplies_24h":204040,"strategy_points_24h":100,"all_goods_of_age_24h":170},"SpaceAgeAsteroidBelt":{"population":15190,"happiness":30400,"demandHappiness":15190,"money_24h":274270,"supplies_24h":219010,"strategy_points_24h":100,"all_goods_of_age_24h":170},"SpaceAgeVenus":{"population":16420,"happiness":32840,"demandHappiness":16420,"money_24h":302330,"supplies_24h":234770,"strategy_points_24h":100,"all_goods_of_age_24h":170},"SpaceAgeJupiterMoon":{"population":17680,"happiness":35370,"demandHappiness":17680,"money_24h":331830,"supplies_24h":249740,"strategy_points_24h":100,"all_goods_of_age_24h":170},"SpaceAgeTitan":{"population":18970,"happiness":37940,"demandHappiness":18970,"money_24h":362790,"supplies_24h":265490,"strategy_points_24h":100,"all_goods_of_age_24h":170},"SpaceAgeSpaceHub":{"population":20250,"happiness":40500,"demandHappiness":20250,"money_24h":393750,"supplies_24h":281250,"strategy_points_24h":100,"all_goods_of_age_24h":170}}, boosts: [{"type":"def_boost_attacker","value":20,"feature":"guild_raids"},{"type":"def_boost_defender","value":20,"feature":"guild_raids"}] },
+    "W_MultiAge_ARCH20A12": { prod: {"BronzeAge":{"population":270,"happiness":1490,"demandHappiness":270,"money_24h":1920,"supplies_24h":3150,"strategy_points_24h":80,"all_goods_of_age_24h":140},"IronAge":{"population":580,"happiness":2560,"demandHappiness":580,"money_24h":4610,"supplies_24h":7560,"strategy_points_24h":80,"all_goods_of_age_24h":140},"EarlyMiddleAge":{"population":890,"happiness":2840,"demandHappiness":890,"money_24h":7690,"supplies_24h":12610,"strategy_points_24h":80,"all_goods_of_age_24h":140},"HighMiddleAge":{"population":1250,"happiness":3160,"demandHappiness":1250,"money_24h":10760,"supplies_24h":17650,"strategy_points_24h":80,"all_goods_of_age_24h":140},"LateMiddleAge":{"population":1640,"happiness":3530,"demandHappiness":1640,"money_24h":14220,"supplies_24h":23320,"strategy_points_24h":80,"all_goods_of_age_24h":140},"ColonialAge":{"population":2070,"happiness":4150,"demandHappiness":2070,"money_24h":21650,"supplies_24h":29620,"strategy_points_24h":80,"all_goods_of_age_24h":140},"IndustrialAge":{"population":2530,"happiness":4680,"demandHappiness":2530,"money_24h":26980,"supplies_24h":35920,"strategy_points_24h":80,"all_goods_of_age_24h":140},"ProgressiveEra":{"population":3030,"happiness":5140,"demandHappiness":3030,"money_24h":32740,"supplies_24h":42230,"strategy_points_24h":80,"all_goods_of_age_24h":140},"ModernEra":{"population":3550,"happiness":5500,"demandHappiness":3550,"money_24h":40730,"supplies_24h":49160,"strategy_points_24h":80,"all_goods_of_age_24h":140},"PostModernEra":{"population":4090,"happiness":5730,"demandHappiness":4090,"money_24h":51240,"supplies_24h":56090,"strategy_points_24h":80,"all_goods_of_age_24h":140},"ContemporaryEra":{"population":4660,"happiness":6660,"demandHappiness":4660,"money_24h":66710,"supplies_24h":63030,"strategy_points_24h":80,"all_goods_of_age_24h":140},"TomorrowEra":{"population":5250,"happiness":8080,"demandHappiness":5250,"money_24h":77240,"supplies_24h":70590,"strategy_points_24h":80,"all_goods_of_age_24h":140},"FutureEra":{"population":5870,"happiness":9680,"demandHappiness":5870,"money_24h":88540,"supplies_24h":77520,"strategy_points_24h":80,"all_goods_of_age_24h":140},"ArcticFuture":{"population":6510,"happiness":11270,"demandHappiness":6510,"money_24h":100610,"supplies_24h":85080,"strategy_points_24h":80,"all_goods_of_age_24h":140},"OceanicFuture":{"population":7170,"happiness":13010,"demandHappiness":7170,"money_24h":113440,"supplies_24h":93280,"strategy_points_24h":80,"all_goods_of_age_24h":140},"VirtualFuture":{"population":7850,"happiness":15540,"demandHappiness":7850,"money_24h":127060,"supplies_24h":100840,"strategy_points_24h":80,"all_goods_of_age_24h":140},"SpaceAgeMars":{"population":12430,"happiness":24860,"demandHappiness":12430,"money_24h":212240,"supplies_24h":163240,"strategy_points_24h":80,"all_goods_of_age_24h":140},"SpaceAgeAsteroidBelt":{"population":13500,"happiness":27020,"demandHappiness":13500,"money_24h":235090,"supplies_24h":175210,"strategy_points_24h":80,"all_goods_of_age_24h":140},"SpaceAgeVenus":{"population":14590,"happiness":29190,"demandHappiness":14590,"money_24h":259140,"supplies_24h":187820,"strategy_points_24h":80,"all_goods_of_age_24h":140},"SpaceAgeJupiterMoon":{"population":15720,"happiness":31440,"demandHappiness":15720,"money_24h":284430,"supplies_24h":199790,"strategy_points_24h":80,"all_goods_of_age_24h":140},"SpaceAgeTitan":{"population":16860,"happiness":33720,"demandHappiness":16860,"money_24h":310960,"supplies_24h":212390,"strategy_points_24h":80,"all_goods_of_age_24h":140},"SpaceAgeSpaceHub":{"population":18000,"happiness":36000,"demandHappiness":18000,"money_24h":337500,"supplies_24h":225000,"strategy_points_24h":80,"all_goods_of_age_24h":140}}, boosts: [{"type":"def_boost_attacker","value":10,"feature":"guild_raids"},{"type":"def_boost_defender","value":10,"feature":"guild_raids"}] },
+};
@@ -0,0 +1,41 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 37 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_BOWL23A11b": { prod: {"BronzeAge":{"supplies_24h":2000,"medals_24h":36,"strategy_points_24h":12,"random_good_of_age_24h":15},"IronAge":{"supplies_24h":4800,"medals_24h":47,"strategy_points_24h":12,"random_good_of_age_24h":15},"EarlyMiddleAge":{"supplies_24h":8000,"medals_24h":57,"strategy_points_24h":12,"random_good_of_age_24h":15},"HighMiddleAge":{"supplies_24h":11200,"medals_24h":67,"strategy_points_24h":12,"random_good_of_age_24h":15},"LateMiddleAge":{"supplies_24h":14800,"medals_24h":78,"strategy_points_24h":12,"random_good_of_age_24h":15},"ColonialAge":{"supplies_24h":18800,"medals_24h":93,"strategy_points_24h":12,"random_good_of_age_24h":15},"IndustrialAge":{"supplies_24h":22800,"medals_24h":129,"strategy_points_24h":12,"random_good_of_age_24h":15},"ProgressiveEra":{"supplies_24h":26800,"medals_24h":180,"strategy_points_24h":12,"random_good_of_age_24h":15},"ModernEra":{"supplies_24h":31200,"medals_24h":258,"strategy_points_24h":12,"random_good_of_age_24h":15},"PostModernEra":{"supplies_24h":35600,"medals_24h":360,"strategy_points_24h":12,"random_good_of_age_24h":15},"ContemporaryEra":{"supplies_24h":40000,"medals_24h":515,"strategy_points_24h":12,"random_good_of_age_24h":15},"TomorrowEra":{"supplies_24h":44800,"medals_24h":695,"strategy_points_24h":12,"random_good_of_age_24h":15},"FutureEra":{"supplies_24h":49200,"medals_24h":849,"strategy_points_24h":12,"random_good_of_age_24h":15},"ArcticFuture":{"supplies_24h":54000,"medals_24h":1029,"strategy_points_24h":12,"random_good_of_age_24h":15},"OceanicFuture":{"supplies_24h":59200,"medals_24h":1183,"strategy_points_24h":12,"random_good_of_age_24h":15},"VirtualFuture":{"supplies_24h":64000,"medals_24h":1440,"strategy_points_24h":12,"random_good_of_age_24h":15},"SpaceAgeMars":{"supplies_24h":103600,"medals_24h":1749,"strategy_points_24h":12,"random_good_of_age_24h":15},"SpaceAgeAsteroidBelt":{"supplies_24h":111200,"medals_24h":2058,"strategy_points_24h":12,"random_good_of_age_24h":15},"SpaceAgeVenus":{"supplies_24h":119200,"medals_24h":2366,"strategy_points_24h":12,"random_good_of_age_24h":15},"SpaceAgeJupiterMoon":{"supplies_24h":126800,"medals_24h":2675,"strategy_points_24h":12,"random_good_of_age_24h":15},"SpaceAgeTitan":{"supplies_24h":134885,"medals_24h":3025,"strategy_points_24h":12,"random_good_of_age_24h":15},"SpaceAgeSpaceHub":{"supplies_24h":142970,"medals_24h":3375,"strategy_points_24h":12,"random_good_of_age_24h":15}}, boosts: [{"type":"att_boost_attacker","value":16,"feature":"all"},{"type":"def_boost_attacker","value":8,"feature":"all"}] },
+    "W_MultiAge_BOWL21E1": { prod: {"BronzeAge":{"happiness":330},"IronAge":{"happiness":470},"EarlyMiddleAge":{"happiness":560},"HighMiddleAge":{"happiness":690},"LateMiddleAge":{"happiness":800},"ColonialAge":{"happiness":940},"IndustrialAge":{"happiness":1060},"ProgressiveEra":{"happiness":1170},"ModernEra":{"happiness":1330},"PostModernEra":{"happiness":1520},"ContemporaryEra":{"happiness":1760},"TomorrowEra":{"happiness":2200},"FutureEra":{"happiness":2640},"ArcticFuture":{"happiness":2990},"OceanicFuture":{"happiness":3350},"VirtualFuture":{"happiness":4230},"SpaceAgeMars":{"happiness":6590},"SpaceAgeAsteroidBelt":{"happiness":7160},"SpaceAgeVenus":{"happiness":7730},"SpaceAgeJupiterMoon":{"happiness":8330},"SpaceAgeTitan":{"happiness":8930},"SpaceAgeSpaceHub":{"happiness":9560}} },
+    "W_MultiAge_BOWL22A1": { prod: {"BronzeAge":{"population":178,"happiness":760,"demandHappiness":178,"money_24h":700},"IronAge":{"population":383,"happiness":1300,"demandHappiness":383,"money_24h":1700},"EarlyMiddleAge":{"population":587,"happiness":1440,"demandHappiness":587,"money_24h":2900},"HighMiddleAge":{"population":825,"happiness":1610,"demandHappiness":825,"money_24h":4000},"LateMiddleAge":{"population":1082,"happiness":1790,"demandHappiness":1082,"money_24h":5300},"ColonialAge":{"population":1366,"happiness":2110,"demandHappiness":1366,"money_24h":8100},"IndustrialAge":{"population":1670,"happiness":2380,"demandHappiness":1670,"money_24h":10100},"ProgressiveEra":{"population":1993,"happiness":2610,"demandHappiness":1993,"money_24h":12300},"ModernEra":{"population":2336,"happiness":2800,"demandHappiness":2336,"money_24h":15300},"PostModernEra":{"population":2693,"happiness":2910,"demandHappiness":2693,"money_24h":19200},"ContemporaryEra":{"population":3069,"happiness":3390,"demandHappiness":3069,"money_24h":25000},"TomorrowEra":{"population":3458,"happiness":4110,"demandHappiness":3458,"money_24h":28900},"FutureEra":{"population":3868,"happiness":4920,"demandHappiness":3868,"money_24h":33200},"ArcticFuture":{"population":4290,"happiness":5730,"demandHappiness":4290,"money_24h":37700},"OceanicFuture":{"population":4726,"happiness":6620,"demandHappiness":4726,"money_24h":42500},"VirtualFuture":{"population":5174,"happiness":7900,"demandHappiness":5174,"money_24h":47600},"SpaceAgeMars":{"population":8191,"happiness":12650,"demandHappiness":8191,"money_24h":79500},"SpaceAgeAsteroidBelt":{"population":8897,"happiness":13740,"demandHappiness":8897,"money_24h":88100},"SpaceAgeVenus":{"population":9616,"happiness":14850,"demandHappiness":9616,"money_24h":97100},"SpaceAgeJupiterMoon":{"population":10355,"happiness":15990,"demandHappiness":10355,"money_24h":106600},"SpaceAgeTitan":{"population":11108,"happiness":17150,"demandHappiness":11108,"money_24h":116500},"SpaceAgeSpaceHub":{"population":11880,"happiness":18350,"demandHappiness":11880,"money_24h":126900}} },
+    "W_MultiAge_BOWL22A10": { prod: {"BronzeAge":{"population":275,"happiness":1300,"demandHappiness":275,"money_24h":1900,"medals_24h":32,"strategy_points_24h":9,"random_good_of_age_24h":33},"IronAge":{"population":592,"happiness":2240,"demandHappiness":592,"money_24h":4500,"medals_24h":41,"strategy_points_24h":9,"random_good_of_age_24h":33},"EarlyMiddleAge":{"population":908,"happiness":2470,"demandHappiness":908,"money_24h":7400,"medals_24h":50,"strategy_points_24h":9,"random_good_of_age_24h":33},"HighMiddleAge":{"population":1275,"happiness":2760,"demandHappiness":1275,"money_24h":10400,"medals_24h":58,"strategy_points_24h":9,"random_good_of_age_24h":33},"LateMiddleAge":{"population":1673,"happiness":3080,"demandHappiness":1673,"money_24h":13800,"medals_24h":67,"strategy_points_24h":9,"random_good_of_age_24h":33},"ColonialAge":{"population":2111,"happiness":3620,"demandHappiness":2111,"money_24h":21000,"medals_24h":81,"strategy_points_24h":9,"random_good_of_age_24h":33},"IndustrialAge":{"population":2581,"happiness":4080,"demandHappiness":2581,"money_24h":26100,"medals_24h":112,"strategy_points_24h":9,"random_good_of_age_24h":33},"ProgressiveEra":{"population":3080,"happiness":4480,"demandHappiness":3080,"money_24h":31700,"medals_24h":156,"strategy_points_24h":9,"random_good_of_age_24h":33},"ModernEra":{"population":3611,"happiness":4790,"demandHappiness":3611,"money_24h":39400,"medals_24h":223,"strategy_points_24h":9,"random_good_of_age_24h":33},"PostModernEra":{"population":4162,"happiness":4990,"demandHappiness":4162,"money_24h":49600,"medals_24h":312,"strategy_points_24h":9,"random_good_of_age_24h":33},"ContemporaryEra":{"population":4743,"happiness":5800,"demandHappiness":4743,"money_24h":64600,"medals_24h":446,"strategy_points_24h":9,"random_good_of_age_24h":33},"TomorrowEra":{"population":5345,"happiness":7040,"demandHappiness":5345,"money_24h":74800,"medals_24h":602,"strategy_points_24h":9,"random_good_of_age_24h":33},"FutureEra":{"population":5977,"happiness":8440,"demandHappiness":5977,"money_24h":85700,"medals_24h":736,"strategy_points_24h":9,"random_good_of_age_24h":33},"ArcticFuture":{"population":6630,"happiness":9830,"demandHappiness":6630,"money_24h":97400,"medals_24h":892,"strategy_points_24h":9,"random_good_of_age_24h":33},"OceanicFuture":{"population":7303,"happiness":11340,"demandHappiness":7303,"money_24h":109800,"medals_24h":1026,"strategy_points_24h":9,"random_good_of_age_24h":33},"VirtualFuture":{"population":7997,"happiness":13550,"demandHappiness":7997,"money_24h":123000,"medals_24h":1248,"strategy_points_24h":9,"random_good_of_age_24h":33},"SpaceAgeMars":{"population":12658,"happiness":21680,"demandHappiness":12658,"money_24h":205500,"medals_24h":1516,"strategy_points_24h":9,"random_good_of_age_24h":33},"SpaceAgeAsteroidBelt":{"population":13750,"happiness":23560,"demandHappiness":13750,"money_24h":227600,"medals_24h":1783,"strategy_points_24h":9,"random_good_of_age_24h":33},"SpaceAgeVenus":{"population":14861,"happiness":25450,"demandHappiness":14861,"money_24h":250900,"medals_24h":2051,"strategy_points_24h":9,"random_good_of_age_24h":33},"SpaceAgeJupiterMoon":{"population":16004,"happiness":27420,"demandHappiness":16004,"money_24h":275300,"medals_24h":2318,"strategy_points_24h":9,"random_good_of_age_24h":33},"SpaceAgeTitan":{"population":17167,"happiness":29400,"demandHappiness":17167,"money_24h":301000,"medals_24h":2586,"strategy_points_24h":9,"random_good_of_age_24h":33},"SpaceAgeSpaceHub":{"population":18360,"happiness":31450,"demandHappiness":18360,"money_24h":327900,"medals_24h":2853,"strategy_points_24h":9,"random_good_of_age_24h":33}}, boosts: [{"type":"coin_production","value":19,"feature":"all"},{"type":"def_boost_attacker","value":19,"feature":"all"}] },
+    "W_MultiAge_BOWL22A2": { prod: {"BronzeAge":{"population":180,"happiness":780,"demandHappiness":180,"money_24h":800},"IronAge":{"population":386,"happiness":1350,"demandHappiness":386,"money_24h":2000},"EarlyMiddleAge":{"population":593,"happiness":1490,"demandHappiness":593,"money_24h":3400},"HighMiddleAge":{"population":833,"happiness":1670,"demandHappiness":833,"money_24h":4700},"LateMiddleAge":{"population":1092,"happiness":1860,"demandHappiness":1092,"money_24h":6200},"ColonialAge":{"population":1379,"happiness":2190,"demandHappiness":1379,"money_24h":9500},"IndustrialAge":{"population":1685,"happiness":2460,"demandHappiness":1685,"money_24h":11800},"ProgressiveEra":{"population":2011,"happiness":2710,"demandHappiness":2011,"money_24h":14300},"ModernEra":{"population":2358,"happiness":2900,"demandHappiness":2358,"money_24h":17800},"PostModernEra":{"population":2717,"happiness":3020,"demandHappiness":2717,"money_24h":22400},"ContemporaryEra":{"population":3097,"happiness":3510,"demandHappiness":3097,"money_24h":29200},"TomorrowEra":{"population":3490,"happiness":4260,"demandHappiness":3490,"money_24h":33800},"FutureEra":{"population":3903,"happiness":5100,"demandHappiness":3903,"money_24h":38700},"ArcticFuture":{"population":4329,"happiness":5940,"demandHappiness":4329,"money_24h":44000},"OceanicFuture":{"population":4769,"happiness":6850,"demandHappiness":4769,"money_24h":49600},"VirtualFuture":{"population":5221,"happiness":8190,"demandHappiness":5221,"money_24h":55600},"SpaceAgeMars":{"population":8265,"happiness":13100,"demandHappiness":8265,"money_24h":92800},"SpaceAgeAsteroidBelt":{"population":8978,"happiness":14230,"demandHappiness":8978,"money_24h":102800},"SpaceAgeVenus":{"population":9704,"happiness":15380,"demandHappiness":9704,"money_24h":113300},"SpaceAgeJupiterMoon":{"population":10450,"happiness":16560,"demandHappiness":10450,"money_24h":124400},"SpaceAgeTitan":{"population":11209,"happiness":17770,"demandHappiness":11209,"money_24h":136000},"SpaceAgeSpaceHub":{"population":11988,"happiness":19000,"demandHappiness":11988,"money_24h":148100}} },
+    "W_MultiAge_BOWL22A3": { prod: {"BronzeAge":{"population":183,"happiness":810,"demandHappiness":183,"money_24h":1000,"medals_24h":10},"IronAge":{"population":393,"happiness":1400,"demandHappiness":393,"money_24h":2300,"medals_24h":13},"EarlyMiddleAge":{"population":603,"happiness":1550,"demandHappiness":603,"money_24h":3800,"medals_24h":16},"HighMiddleAge":{"population":848,"happiness":1720,"demandHappiness":848,"money_24h":5400,"medals_24h":18},"LateMiddleAge":{"population":1112,"happiness":1920,"demandHappiness":1112,"money_24h":7100,"medals_24h":21},"ColonialAge":{"population":1403,"happiness":2260,"demandHappiness":1403,"money_24h":10800,"medals_24h":25},"IndustrialAge":{"population":1715,"happiness":2550,"demandHappiness":1715,"money_24h":13500,"medals_24h":35},"ProgressiveEra":{"population":2048,"happiness":2800,"demandHappiness":2048,"money_24h":16400,"medals_24h":48},"ModernEra":{"population":2400,"happiness":3000,"demandHappiness":2400,"money_24h":20400,"medals_24h":69},"PostModernEra":{"population":2766,"happiness":3120,"demandHappiness":2766,"money_24h":25600,"medals_24h":96},"ContemporaryEra":{"population":3153,"happiness":3630,"demandHappiness":3153,"money_24h":33300,"medals_24h":138},"TomorrowEra":{"population":3553,"happiness":4400,"demandHappiness":3553,"money_24h":38600,"medals_24h":186},"FutureEra":{"population":3973,"happiness":5270,"demandHappiness":3973,"money_24h":44200,"medals_24h":227},"ArcticFuture":{"population":4407,"happiness":6140,"demandHappiness":4407,"money_24h":50300,"medals_24h":275},"OceanicFuture":{"population":4854,"happiness":7090,"demandHappiness":4854,"money_24h":56700,"medals_24h":316},"VirtualFuture":{"population":5316,"happiness":8470,"demandHappiness":5316,"money_24h":63500,"medals_24h":384},"SpaceAgeMars":{"population":8414,"happiness":13550,"demandHappiness":8414,"money_24h":106000,"medals_24h":467},"SpaceAgeAsteroidBelt":{"population":9139,"happiness":14720,"demandHappiness":9139,"money_24h":117500,"medals_24h":549},"SpaceAgeVenus":{"population":9878,"happiness":15910,"demandHappiness":9878,"money_24h":129500,"medals_24h":631},"SpaceAgeJupiterMoon":{"population":10638,"happiness":17140,"demandHappiness":10638,"money_24h":142100,"medals_24h":714},"SpaceAgeTitan":{"population":11411,"happiness":18380,"demandHappiness":11411,"money_24h":155400,"medals_24h":796},"SpaceAgeSpaceHub":{"population":12204,"happiness":19660,"demandHappiness":12204,"money_24h":169200,"medals_24h":878}} },
+    "W_MultiAge_BOWL22A4": { prod: {"BronzeAge":{"population":188,"happiness":870,"demandHappiness":188,"money_24h":1100,"medals_24h":12,"strategy_points_24h":1},"IronAge":{"population":404,"happiness":1490,"demandHappiness":404,"money_24h":2600,"medals_24h":16,"strategy_points_24h":1},"EarlyMiddleAge":{"population":619,"happiness":1650,"demandHappiness":619,"money_24h":4300,"medals_24h":19,"strategy_points_24h":1},"HighMiddleAge":{"population":870,"happiness":1840,"demandHappiness":870,"money_24h":6100,"medals_24h":23,"strategy_points_24h":1},"LateMiddleAge":{"population":1141,"happiness":2050,"demandHappiness":1141,"money_24h":8000,"medals_24h":26,"strategy_points_24h":1},"ColonialAge":{"population":1441,"happiness":2410,"demandHappiness":1441,"money_24h":12200,"medals_24h":31,"strategy_points_24h":1},"IndustrialAge":{"population":1761,"happiness":2720,"demandHappiness":1761,"money_24h":15200,"medals_24h":43,"strategy_points_24h":1},"ProgressiveEra":{"population":2102,"happiness":2990,"demandHappiness":2102,"money_24h":18400,"medals_24h":60,"strategy_points_24h":1},"ModernEra":{"population":2464,"happiness":3200,"demandHappiness":2464,"money_24h":22900,"medals_24h":86,"strategy_points_24h":1},"PostModernEra":{"population":2840,"happiness":3330,"demandHappiness":2840,"money_24h":28800,"medals_24h":120,"strategy_points_24h":1},"ContemporaryEra":{"population":3236,"happiness":3870,"demandHappiness":3236,"money_24h":37500,"medals_24h":172,"strategy_points_24h":1},"TomorrowEra":{"population":3647,"happiness":4700,"demandHappiness":3647,"money_24h":43400,"medals_24h":232,"strategy_points_24h":1},"FutureEra":{"population":4079,"happiness":5630,"demandHappiness":4079,"money_24h":49800,"medals_24h":283,"strategy_points_24h":1},"ArcticFuture":{"population":4524,"happiness":6550,"demandHappiness":4524,"money_24h":56600,"medals_24h":343,"strategy_points_24h":1},"OceanicFuture":{"population":4983,"happiness":7560,"demandHappiness":4983,"money_24h":63800,"medals_24h":395,"strategy_points_24h":1},"VirtualFuture":{"population":5457,"happiness":9030,"demandHappiness":5457,"money_24h":71400,"medals_24h":480,"strategy_points_24h":1},"SpaceAgeMars":{"population":8637,"happiness":14450,"demandHappiness":8637,"money_24h":119300,"medals_24h":583,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"population":9382,"happiness":15710,"demandHappiness":9382,"money_24h":132100,"medals_24h":686,"strategy_points_24h":1},"SpaceAgeVenus":{"population":10141,"happiness":16970,"demandHappiness":10141,"money_24h":145700,"medals_24h":789,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"population":10920,"happiness":18280,"demandHappiness":10920,"money_24h":159900,"medals_24h":892,"strategy_points_24h":1},"SpaceAgeTitan":{"population":11714,"happiness":19600,"demandHappiness":11714,"money_24h":174800,"medals_24h":995,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"population":12528,"happiness":20970,"demandHappiness":12528,"money_24h":190400,"medals_24h":1098,"strategy_points_24h":1}} },
+    "W_MultiAge_BOWL22A5": { prod: {"BronzeAge":{"population":194,"happiness":920,"demandHappiness":194,"money_24h":1200,"medals_24h":15,"strategy_points_24h":2,"random_good_of_age_24h":5},"IronAge":{"population":418,"happiness":1580,"demandHappiness":418,"money_24h":2900,"medals_24h":19,"strategy_points_24h":2,"random_good_of_age_24h":5},"EarlyMiddleAge":{"population":641,"happiness":1750,"demandHappiness":641,"money_24h":4800,"medals_24h":23,"strategy_points_24h":2,"random_good_of_age_24h":5},"HighMiddleAge":{"population":900,"happiness":1950,"demandHappiness":900,"money_24h":6700,"medals_24h":27,"strategy_points_24h":2,"random_good_of_age_24h":5},"LateMiddleAge":{"population":1181,"happiness":2180,"demandHappiness":1181,"money_24h":8900,"medals_24h":31,"strategy_points_24h":2,"random_good_of_age_24h":5},"ColonialAge":{"population":1490,"happiness":2560,"demandHappiness":1490,"money_24h":13500,"medals_24h":38,"strategy_points_24h":2,"random_good_of_age_24h":5},"IndustrialAge":{"population":1822,"happiness":2890,"demandHappiness":1822,"money_24h":16900,"medals_24h":52,"strategy_points_24h":2,"random_good_of_age_24h":5},"ProgressiveEra":{"population":2174,"happiness":3170,"demandHappiness":2174,"money_24h":20500,"medals_24h":72,"strategy_points_24h":2,"random_good_of_age_24h":5},"ModernEra":{"population":2549,"happiness":3400,"demandHappiness":2549,"money_24h":25400,"medals_24h":103,"strategy_points_24h":2,"random_good_of_age_24h":5},"PostModernEra":{"population":2938,"happiness":3540,"demandHappiness":2938,"money_24h":32000,"medals_24h":144,"strategy_points_24h":2,"random_good_of_age_24h":5},"ContemporaryEra":{"population":3348,"happiness":4110,"demandHappiness":3348,"money_24h":41700,"medals_24h":206,"strategy_points_24h":2,"random_good_of_age_24h":5},"TomorrowEra":{"population":3773,"happiness":4990,"demandHappiness":3773,"money_24h":48200,"medals_24h":278,"strategy_points_24h":2,"random_good_of_age_24h":5},"FutureEra":{"population":4219,"happiness":5980,"demandHappiness":4219,"money_24h":55300,"medals_24h":340,"strategy_points_24h":2,"random_good_of_age_24h":5},"ArcticFuture":{"population":4680,"happiness":6960,"demandHappiness":4680,"money_24h":62800,"medals_24h":412,"strategy_points_24h":2,"random_good_of_age_24h":5},"OceanicFuture":{"population":5155,"happiness":8030,"demandHappiness":5155,"money_24h":70900,"medals_24h":474,"strategy_points_24h":2,"random_good_of_age_24h":5},"VirtualFuture":{"population":5645,"happiness":9600,"demandHappiness":5645,"money_24h":79400,"medals_24h":576,"strategy_points_24h":2,"random_good_of_age_24h":5},"SpaceAgeMars":{"population":8935,"happiness":15360,"demandHappiness":8935,"money_24h":132600,"medals_24h":700,"strategy_points_24h":2,"random_good_of_age_24h":5},"SpaceAgeAsteroidBelt":{"population":9706,"happiness":16690,"demandHappiness":9706,"money_24h":146800,"medals_24h":823,"strategy_points_24h":2,"random_good_of_age_24h":5},"SpaceAgeVenus":{"population":10490,"happiness":18030,"demandHappiness":10490,"money_24h":161800,"medals_24h":947,"strategy_points_24h":2,"random_good_of_age_24h":5},"SpaceAgeJupiterMoon":{"population":11297,"happiness":19420,"demandHappiness":11297,"money_24h":177600,"medals_24h":1070,"strategy_points_24h":2,"random_good_of_age_24h":5},"SpaceAgeTitan":{"population":12118,"happiness":20830,"demandHappiness":12118,"money_24h":194200,"medals_24h":1194,"strategy_points_24h":2,"random_good_of_age_24h":5},"SpaceAgeSpaceHub":{"population":12960,"happiness":22280,"demandHappiness":12960,"money_24h":211600,"medals_24h":1317,"strategy_points_24h":2,"random_good_of_age_24h":5}} },
+    "W_MultiAge_BOWL22A6": { prod: {"BronzeAge":{"population":204,"happiness":970,"demandHappiness":204,"money_24h":1300,"medals_24h":17,"strategy_points_24h":3,"random_good_of_age_24h":10},"IronAge":{"population":438,"happiness":1680,"demandHappiness":438,"money_24h":3200,"medals_24h":22,"strategy_points_24h":3,"random_good_of_age_24h":10},"EarlyMiddleAge":{"population":673,"happiness":1850,"demandHappiness":673,"money_24h":5300,"medals_24h":27,"strategy_points_24h":3,"random_good_of_age_24h":10},"HighMiddleAge":{"population":945,"happiness":2070,"demandHappiness":945,"money_24h":7400,"medals_24h":32,"strategy_points_24h":3,"random_good_of_age_24h":10},"LateMiddleAge":{"population":1240,"happiness":2310,"demandHappiness":1240,"money_24h":9800,"medals_24h":36,"strategy_points_24h":3,"random_good_of_age_24h":10},"ColonialAge":{"population":1565,"happiness":2710,"demandHappiness":1565,"money_24h":14900,"medals_24h":44,"strategy_points_24h":3,"random_good_of_age_24h":10},"IndustrialAge":{"population":1913,"happiness":3060,"demandHappiness":1913,"money_24h":18500,"medals_24h":60,"strategy_points_24h":3,"random_good_of_age_24h":10},"ProgressiveEra":{"population":2283,"happiness":3360,"demandHappiness":2283,"money_24h":22500,"medals_24h":84,"strategy_points_24h":3,"random_good_of_age_24h":10},"ModernEra":{"population":2676,"happiness":3590,"demandHappiness":2676,"money_24h":28000,"medals_24h":120,"strategy_points_24h":3,"random_good_of_age_24h":10},"PostModernEra":{"population":3084,"happiness":3750,"demandHappiness":3084,"money_24h":35200,"medals_24h":168,"strategy_points_24h":3,"random_good_of_age_24h":10},"ContemporaryEra":{"population":3515,"happiness":4350,"demandHappiness":3515,"money_24h":45800,"medals_24h":240,"strategy_points_24h":3,"random_good_of_age_24h":10},"TomorrowEra":{"population":3961,"happiness":5280,"demandHappiness":3961,"money_24h":53100,"medals_24h":324,"strategy_points_24h":3,"random_good_of_age_24h":10},"FutureEra":{"population":4430,"happiness":6330,"demandHappiness":4430,"money_24h":60800,"medals_24h":396,"strategy_points_24h":3,"random_good_of_age_24h":10},"ArcticFuture":{"population":4914,"happiness":7370,"demandHappiness":4914,"money_24h":69100,"medals_24h":480,"strategy_points_24h":3,"random_good_of_age_24h":10},"OceanicFuture":{"population":5413,"happiness":8510,"demandHappiness":5413,"money_24h":77900,"medals_24h":552,"strategy_points_24h":3,"random_good_of_age_24h":10},"VirtualFuture":{"population":5927,"happiness":10160,"demandHappiness":5927,"money_24h":87300,"medals_24h":672,"strategy_points_24h":3,"random_good_of_age_24h":10},"SpaceAgeMars":{"population":9382,"happiness":16260,"demandHappiness":9382,"money_24h":145800,"medals_24h":816,"strategy_points_24h":3,"random_good_of_age_24h":10},"SpaceAgeAsteroidBelt":{"population":10191,"happiness":17670,"demandHappiness":10191,"money_24h":161500,"medals_24h":960,"strategy_points_24h":3,"random_good_of_age_24h":10},"SpaceAgeVenus":{"population":11015,"happiness":19090,"demandHappiness":11015,"money_24h":178000,"medals_24h":1104,"strategy_points_24h":3,"random_good_of_age_24h":10},"SpaceAgeJupiterMoon":{"population":11862,"happiness":20560,"demandHappiness":11862,"money_24h":195400,"medals_24h":1248,"strategy_points_24h":3,"random_good_of_age_24h":10},"SpaceAgeTitan":{"population":12723,"happiness":22050,"demandHappiness":12723,"money_24h":213600,"medals_24h":1392,"strategy_points_24h":3,"random_good_of_age_24h":10},"SpaceAgeSpaceHub":{"population":13608,"happiness":23590,"demandHappiness":13608,"money_24h":232700,"medals_24h":1536,"strategy_points_24h":3,"random_good_of_age_24h":10}} },
+    "W_MultiAge_BOWL22A7": { prod: {"BronzeAge":{"population":217,"happiness":1030,"demandHappiness":217,"money_24h":1400,"medals_24h":20,"strategy_points_24h":4,"random_good_of_age_24h":15},"IronAge":{"population":466,"happiness":1770,"demandHappiness":466,"money_24h":3500,"medals_24h":25,"strategy_points_24h":4,"random_good_of_age_24h":15},"EarlyMiddleAge":{"population":716,"happiness":1960,"demandHappiness":716,"money_24h":5800,"medals_24h":31,"strategy_points_24h":4,"random_good_of_age_24h":15},"HighMiddleAge":{"population":1005,"happiness":2180,"demandHappiness":1005,"money_24h":8100,"medals_24h":36,"strategy_points_24h":4,"random_good_of_age_24h":15},"LateMiddleAge":{"population":1319,"happiness":2440,"demandHappiness":1319,"money_24h":10700,"medals_24h":42,"strategy_points_24h":4,"random_good_of_age_24h":15},"ColonialAge":{"population":1664,"happiness":2860,"demandHappiness":1664,"money_24h":16200,"medals_24h":50,"strategy_points_24h":4,"random_good_of_age_24h":15},"IndustrialAge":{"population":2034,"happiness":3230,"demandHappiness":2034,"money_24h":20200,"medals_24h":69,"strategy_points_24h":4,"random_good_of_age_24h":15},"ProgressiveEra":{"population":2428,"happiness":3550,"demandHappiness":2428,"money_24h":24500,"medals_24h":96,"strategy_points_24h":4,"random_good_of_age_24h":15},"ModernEra":{"population":2846,"happiness":3790,"demandHappiness":2846,"money_24h":30500,"medals_24h":138,"strategy_points_24h":4,"random_good_of_age_24h":15},"PostModernEra":{"population":3280,"happiness":3950,"demandHappiness":3280,"money_24h":38400,"medals_24h":192,"strategy_points_24h":4,"random_good_of_age_24h":15},"ContemporaryEra":{"population":3739,"happiness":4590,"demandHappiness":3739,"money_24h":50000,"medals_24h":275,"strategy_points_24h":4,"random_good_of_age_24h":15},"TomorrowEra":{"population":4213,"happiness":5580,"demandHappiness":4213,"money_24h":57900,"medals_24h":371,"strategy_points_24h":4,"random_good_of_age_24h":15},"FutureEra":{"population":4711,"happiness":6680,"demandHappiness":4711,"money_24h":66400,"medals_24h":453,"strategy_points_24h":4,"random_good_of_age_24h":15},"ArcticFuture":{"population":5226,"happiness":7780,"demandHappiness":5226,"money_24h":75400,"medals_24h":549,"strategy_points_24h":4,"random_good_of_age_24h":15},"OceanicFuture":{"population":5757,"happiness":8980,"demandHappiness":5757,"money_24h":85000,"medals_24h":631,"strategy_points_24h":4,"random_good_of_age_24h":15},"VirtualFuture":{"population":6303,"happiness":10730,"demandHappiness":6303,"money_24h":95200,"medals_24h":768,"strategy_points_24h":4,"random_good_of_age_24h":15},"SpaceAgeMars":{"population":9978,"happiness":17160,"demandHappiness":9978,"money_24h":159100,"medals_24h":933,"strategy_points_24h":4,"random_good_of_age_24h":15},"SpaceAgeAsteroidBelt":{"population":10838,"happiness":18650,"demandHappiness":10838,"money_24h":176200,"medals_24h":1098,"strategy_points_24h":4,"random_good_of_age_24h":15},"SpaceAgeVenus":{"population":11714,"happiness":20150,"demandHappiness":11714,"money_24h":194200,"medals_24h":1262,"strategy_points_24h":4,"random_good_of_age_24h":15},"SpaceAgeJupiterMoon":{"population":12615,"happiness":21710,"demandHappiness":12615,"money_24h":213200,"medals_24h":1427,"strategy_points_24h":4,"random_good_of_age_24h":15},"SpaceAgeTitan":{"population":13531,"happiness":23280,"demandHappiness":13531,"money_24h":233100,"medals_24h":1591,"strategy_points_24h":4,"random_good_of_age_24h":15},"SpaceAgeSpaceHub":{"population":14472,"happiness":24900,"demandHappiness":14472,"money_24h":253900,"medals_24h":1756,"strategy_points_24h":4,"random_good_of_age_24h":15}} },
+    "W_MultiAge_BOWL22A8": { prod: {"BronzeAge":{"population":233,"happiness":1080,"demandHappiness":233,"money_24h":1600,"medals_24h":22,"strategy_points_24h":5,"random_good_of_age_24h":20},"IronAge":{"population":501,"happiness":1860,"demandHappiness":501,"money_24h":3700,"medals_24h":28,"strategy_points_24h":5,"random_good_of_age_24h":20},"EarlyMiddleAge":{"population":769,"happiness":2060,"demandHappiness":769,"money_24h":6200,"medals_24h":34,"strategy_points_24h":5,"random_good_of_age_24h":20},"HighMiddleAge":{"population":1080,"happiness":2300,"demandHappiness":1080,"money_24h":8700,"medals_24h":41,"strategy_points_24h":5,"random_good_of_age_24h":20},"LateMiddleAge":{"population":1417,"happiness":2560,"demandHappiness":1417,"money_24h":11500,"medals_24h":47,"strategy_points_24h":5,"random_good_of_age_24h":20},"ColonialAge":{"population":1788,"happiness":3010,"demandHappiness":1788,"money_24h":17600,"medals_24h":56,"strategy_points_24h":5,"random_good_of_age_24h":20},"IndustrialAge":{"population":2186,"happiness":3400,"demandHappiness":2186,"money_24h":21900,"medals_24h":78,"strategy_points_24h":5,"random_good_of_age_24h":20},"ProgressiveEra":{"population":2609,"happiness":3730,"demandHappiness":2609,"money_24h":26600,"medals_24h":108,"strategy_points_24h":5,"random_good_of_age_24h":20},"ModernEra":{"population":3059,"happiness":3990,"demandHappiness":3059,"money_24h":33100,"medals_24h":155,"strategy_points_24h":5,"random_good_of_age_24h":20},"PostModernEra":{"population":3525,"happiness":4160,"demandHappiness":3525,"money_24h":41600,"medals_24h":216,"strategy_points_24h":5,"random_good_of_age_24h":20},"ContemporaryEra":{"population":4018,"happiness":4840,"demandHappiness":4018,"money_24h":54200,"medals_24h":309,"strategy_points_24h":5,"random_good_of_age_24h":20},"TomorrowEra":{"population":4527,"happiness":5870,"demandHappiness":4527,"money_24h":62700,"medals_24h":417,"strategy_points_24h":5,"random_good_of_age_24h":20},"FutureEra":{"population":5063,"happiness":7030,"demandHappiness":5063,"money_24h":71900,"medals_24h":510,"strategy_points_24h":5,"random_good_of_age_24h":20},"ArcticFuture":{"population":5616,"happiness":8190,"demandHappiness":5616,"money_24h":81700,"medals_24h":618,"strategy_points_24h":5,"random_good_of_age_24h":20},"OceanicFuture":{"population":6186,"happiness":9450,"demandHappiness":6186,"money_24h":92100,"medals_24h":710,"strategy_points_24h":5,"random_good_of_age_24h":20},"VirtualFuture":{"population":6774,"happiness":11290,"demandHappiness":6774,"money_24h":103200,"medals_24h":864,"strategy_points_24h":5,"random_good_of_age_24h":20},"SpaceAgeMars":{"population":10722,"happiness":18070,"demandHappiness":10722,"money_24h":172300,"medals_24h":1050,"strategy_points_24h":5,"random_good_of_age_24h":20},"SpaceAgeAsteroidBelt":{"population":11647,"happiness":19630,"demandHappiness":11647,"money_24h":190900,"medals_24h":1235,"strategy_points_24h":5,"random_good_of_age_24h":20},"SpaceAgeVenus":{"population":12588,"happiness":21210,"demandHappiness":12588,"money_24h":210400,"medals_24h":1420,"strategy_points_24h":5,"random_good_of_age_24h":20},"SpaceAgeJupiterMoon":{"population":13556,"happiness":22850,"demandHappiness":13556,"money_24h":230900,"medals_24h":1605,"strategy_points_24h":5,"random_good_of_age_24h":20},"SpaceAgeTitan":{"population":14541,"happiness":24500,"demandHappiness":14541,"money_24h":252500,"medals_24h":1790,"strategy_points_24h":5,"random_good_of_age_24h":20},"SpaceAgeSpaceHub":{"population":15552,"happiness":26210,"demandHappiness":15552,"money_24h":275000,"medals_24h":1975,"strategy_points_24h":5,"random_good_of_age_24h":20}}, boosts: [{"type":"coin_production","value":6,"feature":"all"}] },
+    "W_MultiAge_BOWL22A9": { prod: {"BronzeAge":{"population":253,"happiness":1190,"demandHappiness":253,"money_24h":1700,"medals_24h":27,"strategy_points_24h":7,"random_good_of_age_24h":25},"IronAge":{"population":543,"happiness":2050,"demandHappiness":543,"money_24h":4000,"medals_24h":34,"strategy_points_24h":7,"random_good_of_age_24h":25},"EarlyMiddleAge":{"population":833,"happiness":2270,"demandHappiness":833,"money_24h":6700,"medals_24h":42,"strategy_points_24h":7,"random_good_of_age_24h":25},"HighMiddleAge":{"population":1170,"happiness":2530,"demandHappiness":1170,"money_24h":9400,"medals_24h":50,"strategy_points_24h":7,"random_good_of_age_24h":25},"LateMiddleAge":{"population":1535,"happiness":2820,"demandHappiness":1535,"money_24h":12400,"medals_24h":57,"strategy_points_24h":7,"random_good_of_age_24h":25},"ColonialAge":{"population":1938,"happiness":3320,"demandHappiness":1938,"money_24h":18900,"medals_24h":68,"strategy_points_24h":7,"random_good_of_age_24h":25},"IndustrialAge":{"population":2368,"happiness":3740,"demandHappiness":2368,"money_24h":23600,"medals_24h":95,"strategy_points_24h":7,"random_good_of_age_24h":25},"ProgressiveEra":{"population":2827,"happiness":4110,"demandHappiness":2827,"money_24h":28600,"medals_24h":132,"strategy_points_24h":7,"random_good_of_age_24h":25},"ModernEra":{"population":3313,"happiness":4390,"demandHappiness":3313,"money_24h":35600,"medals_24h":189,"strategy_points_24h":7,"random_good_of_age_24h":25},"PostModernEra":{"population":3819,"happiness":4580,"demandHappiness":3819,"money_24h":44800,"medals_24h":264,"strategy_points_24h":7,"random_good_of_age_24h":25},"ContemporaryEra":{"population":4352,"happiness":5320,"demandHappiness":4352,"money_24h":58300,"medals_24h":378,"strategy_points_24h":7,"random_good_of_age_24h":25},"TomorrowEra":{"population":4905,"happiness":6460,"demandHappiness":4905,"money_24h":67500,"medals_24h":510,"strategy_points_24h":7,"random_good_of_age_24h":25},"FutureEra":{"population":5485,"happiness":7740,"demandHappiness":5485,"money_24h":77400,"medals_24h":623,"strategy_points_24h":7,"random_good_of_age_24h":25},"ArcticFuture":{"population":6084,"happiness":9010,"demandHappiness":6084,"money_24h":88000,"medals_24h":755,"strategy_points_24h":7,"random_good_of_age_24h":25},"OceanicFuture":{"population":6702,"happiness":10400,"demandHappiness":6702,"money_24h":99200,"medals_24h":868,"strategy_points_24h":7,"random_good_of_age_24h":25},"VirtualFuture":{"population":7338,"happiness":12420,"demandHappiness":7338,"money_24h":111100,"medals_24h":1056,"strategy_points_24h":7,"random_good_of_age_24h":25},"SpaceAgeMars":{"population":11616,"happiness":19870,"demandHappiness":11616,"money_24h":185600,"medals_24h":1283,"strategy_points_24h":7,"random_good_of_age_24h":25},"SpaceAgeAsteroidBelt":{"population":12617,"happiness":21600,"demandHappiness":12617,"money_24h":205600,"medals_24h":1509,"strategy_points_24h":7,"random_good_of_age_24h":25},"SpaceAgeVenus":{"population":13638,"happiness":23330,"demandHappiness":13638,"money_24h":226600,"medals_24h":1735,"strategy_points_24h":7,"random_good_of_age_24h":25},"SpaceAgeJupiterMoon":{"population":14686,"happiness":25130,"demandHappiness":14686,"money_24h":248700,"medals_24h":1962,"strategy_points_24h":7,"random_good_of_age_24h":25},"SpaceAgeTitan":{"population":15753,"happiness":26950,"demandHappiness":15753,"money_24h":271900,"medals_24h":2188,"strategy_points_24h":7,"random_good_of_age_24h":25},"SpaceAgeSpaceHub":{"population":16848,"happiness":28830,"demandHappiness":16848,"money_24h":296200,"medals_24h":2414,"strategy_points_24h":7,"random_good_of_age_24h":25}}, boosts: [{"type":"coin_production","value":12,"feature":"all"}] },
+    "W_MultiAge_BOWL21C1": { prod: {"BronzeAge":{"happiness":330},"IronAge":{"happiness":470},"EarlyMiddleAge":{"happiness":560},"HighMiddleAge":{"happiness":690},"LateMiddleAge":{"happiness":800},"ColonialAge":{"happiness":940},"IndustrialAge":{"happiness":1060},"ProgressiveEra":{"happiness":1170},"ModernEra":{"happiness":1330},"PostModernEra":{"happiness":1520},"ContemporaryEra":{"happiness":1760},"TomorrowEra":{"happiness":2200},"FutureEra":{"happiness":2640},"ArcticFuture":{"happiness":2990},"OceanicFuture":{"happiness":3350},"VirtualFuture":{"happiness":4230},"SpaceAgeMars":{"happiness":6590},"SpaceAgeAsteroidBelt":{"happiness":7160},"SpaceAgeVenus":{"happiness":7730},"SpaceAgeJupiterMoon":{"happiness":8330},"SpaceAgeTitan":{"happiness":8930},"SpaceAgeSpaceHub":{"happiness":9560}} },
+    "W_MultiAge_BOWL21B1": { prod: {"BronzeAge":{"happiness":330},"IronAge":{"happiness":470},"EarlyMiddleAge":{"happiness":560},"HighMiddleAge":{"happiness":690},"LateMiddleAge":{"happiness":800},"ColonialAge":{"happiness":940},"IndustrialAge":{"happiness":1060},"ProgressiveEra":{"happiness":1170},"ModernEra":{"happiness":1330},"PostModernEra":{"happiness":1520},"ContemporaryEra":{"happiness":1760},"TomorrowEra":{"happiness":2200},"FutureEra":{"happiness":2640},"ArcticFuture":{"happiness":2990},"OceanicFuture":{"happiness":3350},"VirtualFuture":{"happiness":4230},"SpaceAgeMars":{"happiness":6590},"SpaceAgeAsteroidBelt":{"happiness":7160},"SpaceAgeVenus":{"happiness":7730},"SpaceAgeJupiterMoon":{"happiness":8330},"SpaceAgeTitan":{"happiness":8930},"SpaceAgeSpaceHub":{"happiness":9560}} },
+    "W_MultiAge_BOWL23A1": { prod: {"BronzeAge":{"supplies_24h":1500},"IronAge":{"supplies_24h":3600},"EarlyMiddleAge":{"supplies_24h":6000},"HighMiddleAge":{"supplies_24h":8400},"LateMiddleAge":{"supplies_24h":11100},"ColonialAge":{"supplies_24h":14100},"IndustrialAge":{"supplies_24h":17100},"ProgressiveEra":{"supplies_24h":20100},"ModernEra":{"supplies_24h":23400},"PostModernEra":{"supplies_24h":26700},"ContemporaryEra":{"supplies_24h":30000},"TomorrowEra":{"supplies_24h":33600},"FutureEra":{"supplies_24h":36900},"ArcticFuture":{"supplies_24h":40500},"OceanicFuture":{"supplies_24h":44400},"VirtualFuture":{"supplies_24h":48000},"SpaceAgeMars":{"supplies_24h":77700},"SpaceAgeAsteroidBelt":{"supplies_24h":83400},"SpaceAgeVenus":{"supplies_24h":89400},"SpaceAgeJupiterMoon":{"supplies_24h":95100},"SpaceAgeTitan":{"supplies_24h":101164},"SpaceAgeSpaceHub":{"supplies_24h":107228}} },
+    "W_MultiAge_BOWL23A10": { prod: {"BronzeAge":{"supplies_24h":2000,"medals_24h":32,"strategy_points_24h":2,"random_good_of_age_24h":8},"IronAge":{"supplies_24h":4700,"medals_24h":42,"strategy_points_24h":2,"random_good_of_age_24h":8},"EarlyMiddleAge":{"supplies_24h":7800,"medals_24h":51,"strategy_points_24h":2,"random_good_of_age_24h":8},"HighMiddleAge":{"supplies_24h":10900,"medals_24h":60,"strategy_points_24h":2,"random_good_of_age_24h":8},"LateMiddleAge":{"supplies_24h":14400,"medals_24h":69,"strategy_points_24h":2,"random_good_of_age_24h":8},"ColonialAge":{"supplies_24h":18300,"medals_24h":83,"strategy_points_24h":2,"random_good_of_age_24h":8},"IndustrialAge":{"supplies_24h":22200,"medals_24h":115,"strategy_points_24h":2,"random_good_of_age_24h":8},"ProgressiveEra":{"supplies_24h":26100,"medals_24h":160,"strategy_points_24h":2,"random_good_of_age_24h":8},"ModernEra":{"supplies_24h":30400,"medals_24h":229,"strategy_points_24h":2,"random_good_of_age_24h":8},"PostModernEra":{"supplies_24h":34700,"medals_24h":320,"strategy_points_24h":2,"random_good_of_age_24h":8},"ContemporaryEra":{"supplies_24h":39000,"medals_24h":458,"strategy_points_24h":2,"random_good_of_age_24h":8},"TomorrowEra":{"supplies_24h":43700,"medals_24h":618,"strategy_points_24h":2,"random_good_of_age_24h":8},"FutureEra":{"supplies_24h":48000,"medals_24h":755,"strategy_points_24h":2,"random_good_of_age_24h":8},"ArcticFuture":{"supplies_24h":52700,"medals_24h":915,"strategy_points_24h":2,"random_good_of_age_24h":8},"OceanicFuture":{"supplies_24h":57700,"medals_24h":1052,"strategy_points_24h":2,"random_good_of_age_24h":8},"VirtualFuture":{"supplies_24h":62400,"medals_24h":1280,"strategy_points_24h":2,"random_good_of_age_24h":8},"SpaceAgeMars":{"supplies_24h":101000,"medals_24h":1555,"strategy_points_24h":2,"random_good_of_age_24h":8},"SpaceAgeAsteroidBelt":{"supplies_24h":108400,"medals_24h":1829,"strategy_points_24h":2,"random_good_of_age_24h":8},"SpaceAgeVenus":{"supplies_24h":116200,"medals_24h":2103,"strategy_points_24h":2,"random_good_of_age_24h":8},"SpaceAgeJupiterMoon":{"supplies_24h":123600,"medals_24h":2378,"strategy_points_24h":2,"random_good_of_age_24h":8},"SpaceAgeTitan":{"supplies_24h":131472,"medals_24h":2689,"strategy_points_24h":2,"random_good_of_age_24h":8},"SpaceAgeSpaceHub":{"supplies_24h":139344,"medals_24h":3000,"strategy_points_24h":2,"random_good_of_age_24h":8}}, boosts: [{"type":"att_boost_attacker","value":14,"feature":"all"}] },
+    "W_MultiAge_BOWL23A2": { prod: {"BronzeAge":{"supplies_24h":1600},"IronAge":{"supplies_24h":3700},"EarlyMiddleAge":{"supplies_24h":6200},"HighMiddleAge":{"supplies_24h":8700},"LateMiddleAge":{"supplies_24h":11500},"ColonialAge":{"supplies_24h":14600},"IndustrialAge":{"supplies_24h":17700},"ProgressiveEra":{"supplies_24h":20800},"ModernEra":{"supplies_24h":24200},"PostModernEra":{"supplies_24h":27600},"ContemporaryEra":{"supplies_24h":31000},"TomorrowEra":{"supplies_24h":34700},"FutureEra":{"supplies_24h":38100},"ArcticFuture":{"supplies_24h":41900},"OceanicFuture":{"supplies_24h":45900},"VirtualFuture":{"supplies_24h":49600},"SpaceAgeMars":{"supplies_24h":80300},"SpaceAgeAsteroidBelt":{"supplies_24h":86200},"SpaceAgeVenus":{"supplies_24h":92400},"SpaceAgeJupiterMoon":{"supplies_24h":98300},"SpaceAgeTitan":{"supplies_24h":104577},"SpaceAgeSpaceHub":{"supplies_24h":110854}} },
+    "W_MultiAge_BOWL23A3": { prod: {"BronzeAge":{"supplies_24h":1600},"IronAge":{"supplies_24h":3800},"EarlyMiddleAge":{"supplies_24h":6400},"HighMiddleAge":{"supplies_24h":9000},"LateMiddleAge":{"supplies_24h":11800},"ColonialAge":{"supplies_24h":15000},"IndustrialAge":{"supplies_24h":18200},"ProgressiveEra":{"supplies_24h":21400},"ModernEra":{"supplies_24h":25000},"PostModernEra":{"supplies_24h":28500},"ContemporaryEra":{"supplies_24h":32000},"TomorrowEra":{"supplies_24h":35800},"FutureEra":{"supplies_24h":39400},"ArcticFuture":{"supplies_24h":43200},"OceanicFuture":{"supplies_24h":47400},"VirtualFuture":{"supplies_24h":51200},"SpaceAgeMars":{"supplies_24h":82900},"SpaceAgeAsteroidBelt":{"supplies_24h":89000},"SpaceAgeVenus":{"supplies_24h":95400},"SpaceAgeJupiterMoon":{"supplies_24h":101400},"SpaceAgeTitan":{"supplies_24h":107778},"SpaceAgeSpaceHub":{"supplies_24h":114156}} },
+    "W_MultiAge_BOWL23A4": { prod: {"BronzeAge":{"supplies_24h":1700,"medals_24h":8},"IronAge":{"supplies_24h":4000,"medals_24h":11},"EarlyMiddleAge":{"supplies_24h":6600,"medals_24h":13},"HighMiddleAge":{"supplies_24h":9200,"medals_24h":15},"LateMiddleAge":{"supplies_24h":12200,"medals_24h":18},"ColonialAge":{"supplies_24h":15500,"medals_24h":21},"IndustrialAge":{"supplies_24h":18800,"medals_24h":29},"ProgressiveEra":{"supplies_24h":22100,"medals_24h":40},"ModernEra":{"supplies_24h":25700,"medals_24h":58},"PostModernEra":{"supplies_24h":29400,"medals_24h":80},"ContemporaryEra":{"supplies_24h":33000,"medals_24h":115},"TomorrowEra":{"supplies_24h":37000,"medals_24h":155},"FutureEra":{"supplies_24h":40600,"medals_24h":189},"ArcticFuture":{"supplies_24h":44600,"medals_24h":229},"OceanicFuture":{"supplies_24h":48800,"medals_24h":263},"VirtualFuture":{"supplies_24h":52800,"medals_24h":320},"SpaceAgeMars":{"supplies_24h":85500,"medals_24h":389},"SpaceAgeAsteroidBelt":{"supplies_24h":91700,"medals_24h":458},"SpaceAgeVenus":{"supplies_24h":98300,"medals_24h":526},"SpaceAgeJupiterMoon":{"supplies_24h":104600,"medals_24h":595},"SpaceAgeTitan":{"supplies_24h":111304,"medals_24h":674},"SpaceAgeSpaceHub":{"supplies_24h":118008,"medals_24h":753}} },
+    "W_MultiAge_BOWL23A5": { prod: {"BronzeAge":{"supplies_24h":1700,"medals_24h":12},"IronAge":{"supplies_24h":4100,"medals_24h":16},"EarlyMiddleAge":{"supplies_24h":6800,"medals_24h":19},"HighMiddleAge":{"supplies_24h":9500,"medals_24h":23},"LateMiddleAge":{"supplies_24h":12600,"medals_24h":26},"ColonialAge":{"supplies_24h":16000,"medals_24h":31},"IndustrialAge":{"supplies_24h":19400,"medals_24h":43},"ProgressiveEra":{"supplies_24h":22800,"medals_24h":60},"ModernEra":{"supplies_24h":26500,"medals_24h":86},"PostModernEra":{"supplies_24h":30300,"medals_24h":120},"ContemporaryEra":{"supplies_24h":34000,"medals_24h":172},"TomorrowEra":{"supplies_24h":38100,"medals_24h":232},"FutureEra":{"supplies_24h":41800,"medals_24h":283},"ArcticFuture":{"supplies_24h":45900,"medals_24h":343},"OceanicFuture":{"supplies_24h":50300,"medals_24h":395},"VirtualFuture":{"supplies_24h":54400,"medals_24h":480},"SpaceAgeMars":{"supplies_24h":88100,"medals_24h":583},"SpaceAgeAsteroidBelt":{"supplies_24h":94500,"medals_24h":686},"SpaceAgeVenus":{"supplies_24h":101300,"medals_24h":789},"SpaceAgeJupiterMoon":{"supplies_24h":107800,"medals_24h":892},"SpaceAgeTitan":{"supplies_24h":114718,"medals_24h":1009},"SpaceAgeSpaceHub":{"supplies_24h":121636,"medals_24h":1126}} },
+    "W_MultiAge_BOWL23A6": { prod: {"BronzeAge":{"supplies_24h":1800,"medals_24h":16},"IronAge":{"supplies_24h":4200,"medals_24h":21},"EarlyMiddleAge":{"supplies_24h":7000,"medals_24h":26},"HighMiddleAge":{"supplies_24h":9800,"medals_24h":30},"LateMiddleAge":{"supplies_24h":13000,"medals_24h":35},"ColonialAge":{"supplies_24h":16500,"medals_24h":42},"IndustrialAge":{"supplies_24h":20000,"medals_24h":58},"ProgressiveEra":{"supplies_24h":23500,"medals_24h":80},"ModernEra":{"supplies_24h":27300,"medals_24h":115},"PostModernEra":{"supplies_24h":31200,"medals_24h":160},"ContemporaryEra":{"supplies_24h":35000,"medals_24h":229},"TomorrowEra":{"supplies_24h":39200,"medals_24h":309},"FutureEra":{"supplies_24h":43100,"medals_24h":378},"ArcticFuture":{"supplies_24h":47300,"medals_24h":458},"OceanicFuture":{"supplies_24h":51800,"medals_24h":526},"VirtualFuture":{"supplies_24h":56000,"medals_24h":640},"SpaceAgeMars":{"supplies_24h":90700,"medals_24h":778},"SpaceAgeAsteroidBelt":{"supplies_24h":97300,"medals_24h":915},"SpaceAgeVenus":{"supplies_24h":104300,"medals_24h":1052},"SpaceAgeJupiterMoon":{"supplies_24h":111000,"medals_24h":1189},"SpaceAgeTitan":{"supplies_24h":118131,"medals_24h":1344},"SpaceAgeSpaceHub":{"supplies_24h":125262,"medals_24h":1499}} },
+    "W_MultiAge_BOWL23A7": { prod: {"BronzeAge":{"supplies_24h":1800,"medals_24h":20},"IronAge":{"supplies_24h":4300,"medals_24h":26},"EarlyMiddleAge":{"supplies_24h":7200,"medals_24h":32},"HighMiddleAge":{"supplies_24h":10100,"medals_24h":38},"LateMiddleAge":{"supplies_24h":13300,"medals_24h":43},"ColonialAge":{"supplies_24h":16900,"medals_24h":52},"IndustrialAge":{"supplies_24h":20500,"medals_24h":72},"ProgressiveEra":{"supplies_24h":24100,"medals_24h":100},"ModernEra":{"supplies_24h":28100,"medals_24h":143},"PostModernEra":{"supplies_24h":32000,"medals_24h":200},"ContemporaryEra":{"supplies_24h":36000,"medals_24h":286},"TomorrowEra":{"supplies_24h":40300,"medals_24h":386},"FutureEra":{"supplies_24h":44300,"medals_24h":472},"ArcticFuture":{"supplies_24h":48600,"medals_24h":572},"OceanicFuture":{"supplies_24h":53300,"medals_24h":658},"VirtualFuture":{"supplies_24h":57600,"medals_24h":800},"SpaceAgeMars":{"supplies_24h":93200,"medals_24h":972},"SpaceAgeAsteroidBelt":{"supplies_24h":100100,"medals_24h":1143},"SpaceAgeVenus":{"supplies_24h":107300,"medals_24h":1315},"SpaceAgeJupiterMoon":{"supplies_24h":114100,"medals_24h":1486},"SpaceAgeTitan":{"supplies_24h":121331,"medals_24h":1680},"SpaceAgeSpaceHub":{"supplies_24h":128562,"medals_24h":1874}}, boosts: [{"type":"att_boost_attacker","value":2,"feature":"all"}] },
+    "W_MultiAge_BOWL23A8": { prod: {"BronzeAge":{"supplies_24h":1900,"medals_24h":24},"IronAge":{"supplies_24h":4400,"medals_24h":31},"EarlyMiddleAge":{"supplies_24h":7400,"medals_24h":38},"HighMiddleAge":{"supplies_24h":10400,"medals_24h":45},"LateMiddleAge":{"supplies_24h":13700,"medals_24h":52},"ColonialAge":{"supplies_24h":17400,"medals_24h":62},"IndustrialAge":{"supplies_24h":21100,"medals_24h":86},"ProgressiveEra":{"supplies_24h":24800,"medals_24h":120},"ModernEra":{"supplies_24h":28900,"medals_24h":172},"PostModernEra":{"supplies_24h":32900,"medals_24h":240},"ContemporaryEra":{"supplies_24h":37000,"medals_24h":343},"TomorrowEra":{"supplies_24h":41400,"medals_24h":463},"FutureEra":{"supplies_24h":45500,"medals_24h":566},"ArcticFuture":{"supplies_24h":50000,"medals_24h":686},"OceanicFuture":{"supplies_24h":54800,"medals_24h":789},"VirtualFuture":{"supplies_24h":59200,"medals_24h":960},"SpaceAgeMars":{"supplies_24h":95800,"medals_24h":1166},"SpaceAgeAsteroidBelt":{"supplies_24h":102900,"medals_24h":1372},"SpaceAgeVenus":{"supplies_24h":110300,"medals_24h":1578},"SpaceAgeJupiterMoon":{"supplies_24h":117300,"medals_24h":1783},"SpaceAgeTitan":{"supplies_24h":124745,"medals_24h":2015},"SpaceAgeSpaceHub":{"supplies_24h":132190,"medals_24h":2247}}, boosts: [{"type":"att_boost_attacker","value":4,"feature":"all"}] },
+    "W_MultiAge_BOWL23A9": { prod: {"BronzeAge":{"supplies_24h":1900,"medals_24h":28},"IronAge":{"supplies_24h":4600,"medals_24h":36},"EarlyMiddleAge":{"supplies_24h":7600,"medals_24h":44},"HighMiddleAge":{"supplies_24h":10600,"medals_24h":52},"LateMiddleAge":{"supplies_24h":14100,"medals_24h":60},"ColonialAge":{"supplies_24h":17900,"medals_24h":72},"IndustrialAge":{"supplies_24h":21700,"medals_24h":100},"ProgressiveEra":{"supplies_24h":25500,"medals_24h":140},"ModernEra":{"supplies_24h":29600,"medals_24h":200},"PostModernEra":{"supplies_24h":33800,"medals_24h":280},"ContemporaryEra":{"supplies_24h":38000,"medals_24h":400},"TomorrowEra":{"supplies_24h":42600,"medals_24h":540},"FutureEra":{"supplies_24h":46700,"medals_24h":660},"ArcticFuture":{"supplies_24h":51300,"medals_24h":800},"OceanicFuture":{"supplies_24h":56200,"medals_24h":920},"VirtualFuture":{"supplies_24h":60800,"medals_24h":1120},"SpaceAgeMars":{"supplies_24h":98400,"medals_24h":1360},"SpaceAgeAsteroidBelt":{"supplies_24h":105600,"medals_24h":1600},"SpaceAgeVenus":{"supplies_24h":113200,"medals_24h":1840},"SpaceAgeJupiterMoon":{"supplies_24h":120500,"medals_24h":2080},"SpaceAgeTitan":{"supplies_24h":128271,"medals_24h":2352},"SpaceAgeSpaceHub":{"supplies_24h":136042,"medals_24h":2624}}, boosts: [{"type":"att_boost_attacker","value":6,"feature":"all"}] },
+    "W_MultiAge_BOWL23A11a": { prod: {"BronzeAge":{"supplies_24h":2000,"medals_24h":36,"strategy_points_24h":6,"random_good_of_age_24h":30},"IronAge":{"supplies_24h":4800,"medals_24h":47,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":10},"EarlyMiddleAge":{"supplies_24h":8000,"medals_24h":57,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":10},"HighMiddleAge":{"supplies_24h":11200,"medals_24h":67,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":11},"LateMiddleAge":{"supplies_24h":14800,"medals_24h":78,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":11},"ColonialAge":{"supplies_24h":18800,"medals_24h":93,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":12},"IndustrialAge":{"supplies_24h":22800,"medals_24h":129,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":12},"ProgressiveEra":{"supplies_24h":26800,"medals_24h":180,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":13},"ModernEra":{"supplies_24h":31200,"medals_24h":258,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":14},"PostModernEra":{"supplies_24h":35600,"medals_24h":360,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":15},"ContemporaryEra":{"supplies_24h":40000,"medals_24h":515,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":16},"TomorrowEra":{"supplies_24h":44800,"medals_24h":695,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":17},"FutureEra":{"supplies_24h":49200,"medals_24h":849,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":18},"ArcticFuture":{"supplies_24h":54000,"medals_24h":1029,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":19},"OceanicFuture":{"supplies_24h":59200,"medals_24h":1183,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":20},"VirtualFuture":{"supplies_24h":64000,"medals_24h":1440,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":22},"SpaceAgeMars":{"supplies_24h":103600,"medals_24h":1749,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":24},"SpaceAgeAsteroidBelt":{"supplies_24h":111200,"medals_24h":2058,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":26},"SpaceAgeVenus":{"supplies_24h":119200,"medals_24h":2366,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":28},"SpaceAgeJupiterMoon":{"supplies_24h":126800,"medals_24h":2675,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":30},"SpaceAgeTitan":{"supplies_24h":134885,"medals_24h":3025,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":32},"SpaceAgeSpaceHub":{"supplies_24h":142970,"medals_24h":3375,"strategy_points_24h":6,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":34}}, boosts: [{"type":"att_boost_attacker","value":16,"feature":"all"},{"type":"def_boost_attacker","value":8,"feature":"all"}] },
+    "W_MultiAge_BOWL21D1": { prod: {"BronzeAge":{"happiness":330},"IronAge":{"happiness":470},"EarlyMiddleAge":{"happiness":560},"HighMiddleAge":{"happiness":690},"LateMiddleAge":{"happiness":800},"ColonialAge":{"happiness":940},"IndustrialAge":{"happiness":1060},"ProgressiveEra":{"happiness":1170},"ModernEra":{"happiness":1330},"PostModernEra":{"happiness":1520},"ContemporaryEra":{"happiness":1760},"TomorrowEra":{"happiness":2200},"FutureEra":{"happiness":2640},"ArcticFuture":{"happiness":2990},"OceanicFuture":{"happiness":3350},"VirtualFuture":{"happiness":4230},"SpaceAgeMars":{"happiness":6590},"SpaceAgeAsteroidBelt":{"happiness":7160},"SpaceAgeVenus":{"happiness":7730},"SpaceAgeJupiterMoon":{"happiness":8330},"SpaceAgeTitan":{"happiness":8930},"SpaceAgeSpaceHub":{"happiness":9560}} },
+    "W_MultiAge_BOWL21A1": { prod: {"BronzeAge":{"population":101,"happiness":360,"demandHappiness":101,"money_24h":600},"IronAge":{"population":218,"happiness":630,"demandHappiness":218,"money_24h":1500},"EarlyMiddleAge":{"population":334,"happiness":700,"demandHappiness":334,"money_24h":2600},"HighMiddleAge":{"population":469,"happiness":780,"demandHappiness":469,"money_24h":3600},"LateMiddleAge":{"population":615,"happiness":870,"demandHappiness":615,"money_24h":4700},"ColonialAge":{"population":776,"happiness":1020,"demandHappiness":776,"money_24h":7200},"IndustrialAge":{"population":949,"happiness":1150,"demandHappiness":949,"money_24h":9000},"ProgressiveEra":{"population":1133,"happiness":1260,"demandHappiness":1133,"money_24h":10900},"ModernEra":{"population":1328,"happiness":1350,"demandHappiness":1328,"money_24h":13500},"PostModernEra":{"population":1530,"happiness":1400,"demandHappiness":1530,"money_24h":17000},"ContemporaryEra":{"population":1744,"happiness":1630,"demandHappiness":1744,"money_24h":22100},"TomorrowEra":{"population":1965,"happiness":1980,"demandHappiness":1965,"money_24h":25600},"FutureEra":{"population":2198,"happiness":2370,"demandHappiness":2198,"money_24h":29400},"ArcticFuture":{"population":2438,"happiness":2760,"demandHappiness":2438,"money_24h":33400},"OceanicFuture":{"population":2685,"happiness":3190,"demandHappiness":2685,"money_24h":37600},"VirtualFuture":{"population":2940,"happiness":3810,"demandHappiness":2940,"money_24h":42200},"SpaceAgeMars":{"population":4654,"happiness":6100,"demandHappiness":4654,"money_24h":70400},"SpaceAgeAsteroidBelt":{"population":5055,"happiness":6630,"demandHappiness":5055,"money_24h":78000},"SpaceAgeVenus":{"population":5464,"happiness":7160,"demandHappiness":5464,"money_24h":86000},"SpaceAgeJupiterMoon":{"population":5884,"happiness":7710,"demandHappiness":5884,"money_24h":94400},"SpaceAgeTitan":{"population":6311,"happiness":8270,"demandHappiness":6311,"money_24h":103200},"SpaceAgeSpaceHub":{"population":6750,"happiness":8850,"demandHappiness":6750,"money_24h":112400}} },
+    "W_MultiAge_BOWL21A2": { prod: {"BronzeAge":{"population":147,"happiness":440,"demandHappiness":147,"money_24h":700,"medals_24h":5},"IronAge":{"population":315,"happiness":760,"demandHappiness":315,"money_24h":1700,"medals_24h":6},"EarlyMiddleAge":{"population":484,"happiness":840,"demandHappiness":484,"money_24h":2900,"medals_24h":8},"HighMiddleAge":{"population":680,"happiness":930,"demandHappiness":680,"money_24h":4000,"medals_24h":9},"LateMiddleAge":{"population":892,"happiness":1040,"demandHappiness":892,"money_24h":5300,"medals_24h":10},"ColonialAge":{"population":1126,"happiness":1220,"demandHappiness":1126,"money_24h":8000,"medals_24h":12},"IndustrialAge":{"population":1376,"happiness":1380,"demandHappiness":1376,"money_24h":10000,"medals_24h":17},"ProgressiveEra":{"population":1642,"happiness":1520,"demandHappiness":1642,"money_24h":12100,"medals_24h":23},"ModernEra":{"population":1925,"happiness":1620,"demandHappiness":1925,"money_24h":15100,"medals_24h":33},"PostModernEra":{"population":2219,"happiness":1690,"demandHappiness":2219,"money_24h":19000,"medals_24h":45},"ContemporaryEra":{"population":2528,"happiness":1960,"demandHappiness":2528,"money_24h":24700,"medals_24h":65},"TomorrowEra":{"population":2849,"happiness":2380,"demandHappiness":2849,"money_24h":28600,"medals_24h":87},"FutureEra":{"population":3186,"happiness":2860,"demandHappiness":3186,"money_24h":32800,"medals_24h":107},"ArcticFuture":{"population":3534,"happiness":3330,"demandHappiness":3534,"money_24h":37300,"medals_24h":129},"OceanicFuture":{"population":3893,"happiness":3840,"demandHappiness":3893,"money_24h":42100,"medals_24h":148},"VirtualFuture":{"population":4263,"happiness":4590,"demandHappiness":4263,"money_24h":47100,"medals_24h":180},"SpaceAgeMars":{"population":6748,"happiness":7340,"demandHappiness":6748,"money_24h":78700,"medals_24h":219},"SpaceAgeAsteroidBelt":{"population":7330,"happiness":7980,"demandHappiness":7330,"money_24h":87200,"medals_24h":258},"SpaceAgeVenus":{"population":7922,"happiness":8620,"demandHappiness":7922,"money_24h":96100,"medals_24h":296},"SpaceAgeJupiterMoon":{"population":8531,"happiness":9280,"demandHappiness":8531,"money_24h":105500,"medals_24h":335},"SpaceAgeTitan":{"population":9151,"happiness":9950,"demandHappiness":9151,"money_24h":115300,"medals_24h":373},"SpaceAgeSpaceHub":{"population":9788,"happiness":10650,"demandHappiness":9788,"money_24h":125600,"medals_24h":412}} },
+    "W_MultiAge_BOWL21A3": { prod: {"BronzeAge":{"population":155,"happiness":510,"demandHappiness":155,"money_24h":800,"medals_24h":8,"random_good_of_age_24h":3},"IronAge":{"population":333,"happiness":870,"demandHappiness":333,"money_24h":1900,"medals_24h":10,"random_good_of_age_24h":3},"EarlyMiddleAge":{"population":511,"happiness":970,"demandHappiness":511,"money_24h":3200,"medals_24h":12,"random_good_of_age_24h":3},"HighMiddleAge":{"population":717,"happiness":1080,"demandHappiness":717,"money_24h":4500,"medals_24h":14,"random_good_of_age_24h":3},"LateMiddleAge":{"population":941,"happiness":1200,"demandHappiness":941,"money_24h":6000,"medals_24h":17,"random_good_of_age_24h":3},"ColonialAge":{"population":1188,"happiness":1410,"demandHappiness":1188,"money_24h":9100,"medals_24h":20,"random_good_of_age_24h":3},"IndustrialAge":{"population":1452,"happiness":1590,"demandHappiness":1452,"money_24h":11300,"medals_24h":27,"random_good_of_age_24h":3},"ProgressiveEra":{"population":1733,"happiness":1750,"demandHappiness":1733,"money_24h":13700,"medals_24h":38,"random_good_of_age_24h":3},"ModernEra":{"population":2031,"happiness":1870,"demandHappiness":2031,"money_24h":17100,"medals_24h":54,"random_good_of_age_24h":3},"PostModernEra":{"population":2341,"happiness":1950,"demandHappiness":2341,"money_24h":21500,"medals_24h":75,"random_good_of_age_24h":3},"ContemporaryEra":{"population":2668,"happiness":2270,"demandHappiness":2668,"money_24h":28000,"medals_24h":108,"random_good_of_age_24h":3},"TomorrowEra":{"population":3006,"happiness":2750,"demandHappiness":3006,"money_24h":32400,"medals_24h":145,"random_good_of_age_24h":3},"FutureEra":{"population":3362,"happiness":3300,"demandHappiness":3362,"money_24h":37200,"medals_24h":177,"random_good_of_age_24h":3},"ArcticFuture":{"population":3729,"happiness":3840,"demandHappiness":3729,"money_24h":42200,"medals_24h":215,"random_good_of_age_24h":3},"OceanicFuture":{"population":4108,"happiness":4430,"demandHappiness":4108,"money_24h":47600,"medals_24h":247,"random_good_of_age_24h":3},"VirtualFuture":{"population":4498,"happiness":5290,"demandHappiness":4498,"money_24h":53300,"medals_24h":300,"random_good_of_age_24h":3},"SpaceAgeMars":{"population":7120,"happiness":8470,"demandHappiness":7120,"money_24h":89100,"medals_24h":365,"random_good_of_age_24h":3},"SpaceAgeAsteroidBelt":{"population":7734,"happiness":9200,"demandHappiness":7734,"money_24h":98600,"medals_24h":429,"random_good_of_age_24h":3},"SpaceAgeVenus":{"population":8360,"happiness":9940,"demandHappiness":8360,"money_24h":108700,"medals_24h":493,"random_good_of_age_24h":3},"SpaceAgeJupiterMoon":{"population":9002,"happiness":10710,"demandHappiness":9002,"money_24h":119400,"medals_24h":558,"random_good_of_age_24h":3},"SpaceAgeTitan":{"population":9656,"happiness":11490,"demandHappiness":9656,"money_24h":130500,"medals_24h":622,"random_good_of_age_24h":3},"SpaceAgeSpaceHub":{"population":10328,"happiness":12290,"demandHappiness":10328,"money_24h":142100,"medals_24h":686,"random_good_of_age_24h":3}} },
+    "W_MultiAge_BOWL21A4": { prod: {"BronzeAge":{"population":163,"happiness":570,"demandHappiness":163,"money_24h":900,"medals_24h":9,"strategy_points_24h":1,"random_good_of_age_24h":6},"IronAge":{"population":349,"happiness":980,"demandHappiness":349,"money_24h":2100,"medals_24h":12,"strategy_points_24h":1,"random_good_of_age_24h":6},"EarlyMiddleAge":{"population":536,"happiness":1080,"demandHappiness":536,"money_24h":3600,"medals_24h":15,"strategy_points_24h":1,"random_good_of_age_24h":6},"HighMiddleAge":{"population":752,"happiness":1210,"demandHappiness":752,"money_24h":5000,"medals_24h":17,"strategy_points_24h":1,"random_good_of_age_24h":6},"LateMiddleAge":{"population":987,"happiness":1350,"demandHappiness":987,"money_24h":6600,"medals_24h":20,"strategy_points_24h":1,"random_good_of_age_24h":6},"ColonialAge":{"population":1246,"happiness":1580,"demandHappiness":1246,"money_24h":10000,"medals_24h":24,"strategy_points_24h":1,"random_good_of_age_24h":6},"IndustrialAge":{"population":1523,"happiness":1780,"demandHappiness":1523,"money_24h":12500,"medals_24h":33,"strategy_points_24h":1,"random_good_of_age_24h":6},"ProgressiveEra":{"population":1818,"happiness":1960,"demandHappiness":1818,"money_24h":15200,"medals_24h":45,"strategy_points_24h":1,"random_good_of_age_24h":6},"ModernEra":{"population":2131,"happiness":2100,"demandHappiness":2131,"money_24h":18900,"medals_24h":65,"strategy_points_24h":1,"random_good_of_age_24h":6},"PostModernEra":{"population":2456,"happiness":2180,"demandHappiness":2456,"money_24h":23800,"medals_24h":90,"strategy_points_24h":1,"random_good_of_age_24h":6},"ContemporaryEra":{"population":2799,"happiness":2540,"demandHappiness":2799,"money_24h":30900,"medals_24h":129,"strategy_points_24h":1,"random_good_of_age_24h":6},"TomorrowEra":{"population":3154,"happiness":3080,"demandHappiness":3154,"money_24h":35800,"medals_24h":174,"strategy_points_24h":1,"random_good_of_age_24h":6},"FutureEra":{"population":3527,"happiness":3690,"demandHappiness":3527,"money_24h":41000,"medals_24h":213,"strategy_points_24h":1,"random_good_of_age_24h":6},"ArcticFuture":{"population":3912,"happiness":4300,"demandHappiness":3912,"money_24h":46600,"medals_24h":258,"strategy_points_24h":1,"random_good_of_age_24h":6},"OceanicFuture":{"population":4309,"happiness":4960,"demandHappiness":4309,"money_24h":52600,"medals_24h":296,"strategy_points_24h":1,"random_good_of_age_24h":6},"VirtualFuture":{"population":4719,"happiness":5930,"demandHappiness":4719,"money_24h":58900,"medals_24h":360,"strategy_points_24h":1,"random_good_of_age_24h":6},"SpaceAgeMars":{"population":7469,"happiness":9480,"demandHappiness":7469,"money_24h":98400,"medals_24h":438,"strategy_points_24h":1,"random_good_of_age_24h":6},"SpaceAgeAsteroidBelt":{"population":8113,"happiness":10310,"demandHappiness":8113,"money_24h":109000,"medals_24h":515,"strategy_points_24h":1,"random_good_of_age_24h":6},"SpaceAgeVenus":{"population":8769,"happiness":11140,"demandHappiness":8769,"money_24h":120100,"medals_24h":592,"strategy_points_24h":1,"random_good_of_age_24h":6},"SpaceAgeJupiterMoon":{"population":9443,"happiness":12000,"demandHappiness":9443,"money_24h":131800,"medals_24h":669,"strategy_points_24h":1,"random_good_of_age_24h":6},"SpaceAgeTitan":{"population":10130,"happiness":12860,"demandHappiness":10130,"money_24h":144100,"medals_24h":746,"strategy_points_24h":1,"random_good_of_age_24h":6},"SpaceAgeSpaceHub":{"population":10834,"happiness":13760,"demandHappiness":10834,"money_24h":157000,"medals_24h":823,"strategy_points_24h":1,"random_good_of_age_24h":6}} },
+    "W_MultiAge_BOWL21A5": { prod: {"BronzeAge":{"population":171,"happiness":630,"demandHappiness":171,"money_24h":1000,"medals_24h":11,"strategy_points_24h":2,"random_good_of_age_24h":9},"IronAge":{"population":368,"happiness":1080,"demandHappiness":368,"money_24h":2300,"medals_24h":14,"strategy_points_24h":2,"random_good_of_age_24h":9},"EarlyMiddleAge":{"population":564,"happiness":1190,"demandHappiness":564,"money_24h":3900,"medals_24h":17,"strategy_points_24h":2,"random_good_of_age_24h":9},"HighMiddleAge":{"population":792,"happiness":1330,"demandHappiness":792,"money_24h":5500,"medals_24h":20,"strategy_points_24h":2,"random_good_of_age_24h":9},"LateMiddleAge":{"population":1039,"happiness":1480,"demandHappiness":1039,"money_24h":7200,"medals_24h":23,"strategy_points_24h":2,"random_good_of_age_24h":9},"ColonialAge":{"population":1312,"happiness":1740,"demandHappiness":1312,"money_24h":11000,"medals_24h":27,"strategy_points_24h":2,"random_good_of_age_24h":9},"IndustrialAge":{"population":1603,"happiness":1970,"demandHappiness":1603,"money_24h":13700,"medals_24h":38,"strategy_points_24h":2,"random_good_of_age_24h":9},"ProgressiveEra":{"population":1914,"happiness":2160,"demandHappiness":1914,"money_24h":16600,"medals_24h":53,"strategy_points_24h":2,"random_good_of_age_24h":9},"ModernEra":{"population":2243,"happiness":2310,"demandHappiness":2243,"money_24h":20700,"medals_24h":75,"strategy_points_24h":2,"random_good_of_age_24h":9},"PostModernEra":{"population":2586,"happiness":2410,"demandHappiness":2586,"money_24h":26000,"medals_24h":105,"strategy_points_24h":2,"random_good_of_age_24h":9},"ContemporaryEra":{"population":2947,"happiness":2800,"demandHappiness":2947,"money_24h":33900,"medals_24h":150,"strategy_points_24h":2,"random_good_of_age_24h":9},"TomorrowEra":{"population":3321,"happiness":3390,"demandHappiness":3321,"money_24h":39200,"medals_24h":203,"strategy_points_24h":2,"random_good_of_age_24h":9},"FutureEra":{"population":3714,"happiness":4070,"demandHappiness":3714,"money_24h":44900,"medals_24h":248,"strategy_points_24h":2,"random_good_of_age_24h":9},"ArcticFuture":{"population":4119,"happiness":4730,"demandHappiness":4119,"money_24h":51100,"medals_24h":300,"strategy_points_24h":2,"random_good_of_age_24h":9},"OceanicFuture":{"population":4538,"happiness":5460,"demandHappiness":4538,"money_24h":57600,"medals_24h":345,"strategy_points_24h":2,"random_good_of_age_24h":9},"VirtualFuture":{"population":4969,"happiness":6530,"demandHappiness":4969,"money_24h":64500,"medals_24h":420,"strategy_points_24h":2,"random_good_of_age_24h":9},"SpaceAgeMars":{"population":7865,"happiness":10440,"demandHappiness":7865,"money_24h":107700,"medals_24h":510,"strategy_points_24h":2,"random_good_of_age_24h":9},"SpaceAgeAsteroidBelt":{"population":8543,"happiness":11350,"demandHappiness":8543,"money_24h":119300,"medals_24h":600,"strategy_points_24h":2,"random_good_of_age_24h":9},"SpaceAgeVenus":{"population":9234,"happiness":12260,"demandHappiness":9234,"money_24h":131500,"medals_24h":690,"strategy_points_24h":2,"random_good_of_age_24h":9},"SpaceAgeJupiterMoon":{"population":9944,"happiness":13210,"demandHappiness":9944,"money_24h":144300,"medals_24h":780,"strategy_points_24h":2,"random_good_of_age_24h":9},"SpaceAgeTitan":{"population":10666,"happiness":14170,"demandHappiness":10666,"money_24h":157800,"medals_24h":870,"strategy_points_24h":2,"random_good_of_age_24h":9},"SpaceAgeSpaceHub":{"population":11408,"happiness":15150,"demandHappiness":11408,"money_24h":171900,"medals_24h":960,"strategy_points_24h":2,"random_good_of_age_24h":9}}, boosts: [{"type":"supply_production","value":16,"feature":"all"}] },
+    "W_MultiAge_BOWL21A6": { prod: {"BronzeAge":{"population":177,"happiness":690,"demandHappiness":177,"money_24h":1100,"medals_24h":12,"strategy_points_24h":4,"random_good_of_age_24h":12},"IronAge":{"population":381,"happiness":1190,"demandHappiness":381,"money_24h":2600,"medals_24h":16,"strategy_points_24h":4,"random_good_of_age_24h":12},"EarlyMiddleAge":{"population":584,"happiness":1310,"demandHappiness":584,"money_24h":4300,"medals_24h":19,"strategy_points_24h":4,"random_good_of_age_24h":12},"HighMiddleAge":{"population":820,"happiness":1470,"demandHappiness":820,"money_24h":6000,"medals_24h":23,"strategy_points_24h":4,"random_good_of_age_24h":12},"LateMiddleAge":{"population":1076,"happiness":1630,"demandHappiness":1076,"money_24h":7900,"medals_24h":26,"strategy_points_24h":4,"random_good_of_age_24h":12},"ColonialAge":{"population":1358,"happiness":1920,"demandHappiness":1358,"money_24h":12000,"medals_24h":31,"strategy_points_24h":4,"random_good_of_age_24h":12},"IndustrialAge":{"population":1660,"happiness":2170,"demandHappiness":1660,"money_24h":15000,"medals_24h":43,"strategy_points_24h":4,"random_good_of_age_24h":12},"ProgressiveEra":{"population":1982,"happiness":2380,"demandHappiness":1982,"money_24h":18200,"medals_24h":60,"strategy_points_24h":4,"random_good_of_age_24h":12},"ModernEra":{"population":2323,"happiness":2550,"demandHappiness":2323,"money_24h":22700,"medals_24h":86,"strategy_points_24h":4,"random_good_of_age_24h":12},"PostModernEra":{"population":2678,"happiness":2650,"demandHappiness":2678,"money_24h":28500,"medals_24h":120,"strategy_points_24h":4,"random_good_of_age_24h":12},"ContemporaryEra":{"population":3052,"happiness":3080,"demandHappiness":3052,"money_24h":37100,"medals_24h":172,"strategy_points_24h":4,"random_good_of_age_24h":12},"TomorrowEra":{"population":3439,"happiness":3740,"demandHappiness":3439,"money_24h":43000,"medals_24h":232,"strategy_points_24h":4,"random_good_of_age_24h":12},"FutureEra":{"population":3846,"happiness":4480,"demandHappiness":3846,"money_24h":49300,"medals_24h":283,"strategy_points_24h":4,"random_good_of_age_24h":12},"ArcticFuture":{"population":4266,"happiness":5220,"demandHappiness":4266,"money_24h":56000,"medals_24h":343,"strategy_points_24h":4,"random_good_of_age_24h":12},"OceanicFuture":{"population":4699,"happiness":6020,"demandHappiness":4699,"money_24h":63100,"medals_24h":395,"strategy_points_24h":4,"random_good_of_age_24h":12},"VirtualFuture":{"population":5145,"happiness":7200,"demandHappiness":5145,"money_24h":70700,"medals_24h":480,"strategy_points_24h":4,"random_good_of_age_24h":12},"SpaceAgeMars":{"population":8144,"happiness":11520,"demandHappiness":8144,"money_24h":118100,"medals_24h":583,"strategy_points_24h":4,"random_good_of_age_24h":12},"SpaceAgeAsteroidBelt":{"population":8846,"happiness":12520,"demandHappiness":8846,"money_24h":130800,"medals_24h":686,"strategy_points_24h":4,"random_good_of_age_24h":12},"SpaceAgeVenus":{"population":9562,"happiness":13520,"demandHappiness":9562,"money_24h":144100,"medals_24h":789,"strategy_points_24h":4,"random_good_of_age_24h":12},"SpaceAgeJupiterMoon":{"population":10297,"happiness":14570,"demandHappiness":10297,"money_24h":158200,"medals_24h":892,"strategy_points_24h":4,"random_good_of_age_24h":12},"SpaceAgeTitan":{"population":11045,"happiness":15620,"demandHappiness":11045,"money_24h":173000,"medals_24h":995,"strategy_points_24h":4,"random_good_of_age_24h":12},"SpaceAgeSpaceHub":{"population":11813,"happiness":16710,"demandHappiness":11813,"money_24h":188400,"medals_24h":1098,"strategy_points_24h":4,"random_good_of_age_24h":12}}, boosts: [{"type":"supply_production","value":19,"feature":"all"}] },
+    "W_MultiAge_BOWL21A7": { prod: {"BronzeAge":{"population":186,"happiness":740,"demandHappiness":186,"money_24h":1100,"medals_24h":14,"strategy_points_24h":6,"random_good_of_age_24h":15},"IronAge":{"population":400,"happiness":1280,"demandHappiness":400,"money_24h":2700,"medals_24h":18,"strategy_points_24h":6,"random_good_of_age_24h":15},"EarlyMiddleAge":{"population":614,"happiness":1420,"demandHappiness":614,"money_24h":4500,"medals_24h":22,"strategy_points_24h":6,"random_good_of_age_24h":15},"HighMiddleAge":{"population":863,"happiness":1580,"demandHappiness":863,"money_24h":6300,"medals_24h":26,"strategy_points_24h":6,"random_good_of_age_24h":15},"LateMiddleAge":{"population":1132,"happiness":1760,"demandHappiness":1132,"money_24h":8300,"medals_24h":29,"strategy_points_24h":6,"random_good_of_age_24h":15},"ColonialAge":{"population":1428,"happiness":2070,"demandHappiness":1428,"money_24h":12700,"medals_24h":35,"strategy_points_24h":6,"random_good_of_age_24h":15},"IndustrialAge":{"population":1746,"happiness":2340,"demandHappiness":1746,"money_24h":15800,"medals_24h":49,"strategy_points_24h":6,"random_good_of_age_24h":15},"ProgressiveEra":{"population":2084,"happiness":2570,"demandHappiness":2084,"money_24h":19200,"medals_24h":68,"strategy_points_24h":6,"random_good_of_age_24h":15},"ModernEra":{"population":2443,"happiness":2750,"demandHappiness":2443,"money_24h":23900,"medals_24h":97,"strategy_points_24h":6,"random_good_of_age_24h":15},"PostModernEra":{"population":2815,"happiness":2860,"demandHappiness":2815,"money_24h":30000,"medals_24h":135,"strategy_points_24h":6,"random_good_of_age_24h":15},"ContemporaryEra":{"population":3209,"happiness":3320,"demandHappiness":3209,"money_24h":39100,"medals_24h":193,"strategy_points_24h":6,"random_good_of_age_24h":15},"TomorrowEra":{"population":3616,"happiness":4040,"demandHappiness":3616,"money_24h":45200,"medals_24h":261,"strategy_points_24h":6,"random_good_of_age_24h":15},"FutureEra":{"population":4043,"happiness":4840,"demandHappiness":4043,"money_24h":51800,"medals_24h":319,"strategy_points_24h":6,"random_good_of_age_24h":15},"ArcticFuture":{"population":4485,"happiness":5630,"demandHappiness":4485,"money_24h":58900,"medals_24h":386,"strategy_points_24h":6,"random_good_of_age_24h":15},"OceanicFuture":{"population":4940,"happiness":6500,"demandHappiness":4940,"money_24h":66400,"medals_24h":444,"strategy_points_24h":6,"random_good_of_age_24h":15},"VirtualFuture":{"population":5410,"happiness":7760,"demandHappiness":5410,"money_24h":74400,"medals_24h":540,"strategy_points_24h":6,"random_good_of_age_24h":15},"SpaceAgeMars":{"population":8563,"happiness":12420,"demandHappiness":8563,"money_24h":124300,"medals_24h":656,"strategy_points_24h":6,"random_good_of_age_24h":15},"SpaceAgeAsteroidBelt":{"population":9301,"happiness":13500,"demandHappiness":9301,"money_24h":137600,"medals_24h":772,"strategy_points_24h":6,"random_good_of_age_24h":15},"SpaceAgeVenus":{"population":10053,"happiness":14580,"demandHappiness":10053,"money_24h":151700,"medals_24h":888,"strategy_points_24h":6,"random_good_of_age_24h":15},"SpaceAgeJupiterMoon":{"population":10826,"happiness":15710,"demandHappiness":10826,"money_24h":166500,"medals_24h":1003,"strategy_points_24h":6,"random_good_of_age_24h":15},"SpaceAgeTitan":{"population":11613,"happiness":16850,"demandHappiness":11613,"money_24h":182100,"medals_24h":1119,"strategy_points_24h":6,"random_good_of_age_24h":15},"SpaceAgeSpaceHub":{"population":12420,"happiness":18020,"demandHappiness":12420,"money_24h":198300,"medals_24h":1235,"strategy_points_24h":6,"random_good_of_age_24h":15}}, boosts: [{"type":"supply_production","value":22,"feature":"all"}] },
+    "W_MultiAge_BOWL21A8": { prod: {"BronzeAge":{"population":192,"happiness":810,"demandHappiness":192,"money_24h":1200,"medals_24h":18,"strategy_points_24h":8,"random_good_of_age_24h":18},"IronAge":{"population":413,"happiness":1400,"demandHappiness":413,"money_24h":3000,"medals_24h":24,"strategy_points_24h":8,"random_good_of_age_24h":18},"EarlyMiddleAge":{"population":634,"happiness":1550,"demandHappiness":634,"money_24h":5000,"medals_24h":29,"strategy_points_24h":8,"random_good_of_age_24h":18},"HighMiddleAge":{"population":891,"happiness":1720,"demandHappiness":891,"money_24h":6900,"medals_24h":34,"strategy_points_24h":8,"random_good_of_age_24h":18},"LateMiddleAge":{"population":1169,"happiness":1920,"demandHappiness":1169,"money_24h":9200,"medals_24h":39,"strategy_points_24h":8,"random_good_of_age_24h":18},"ColonialAge":{"population":1475,"happiness":2260,"demandHappiness":1475,"money_24h":14000,"medals_24h":47,"strategy_points_24h":8,"random_good_of_age_24h":18},"IndustrialAge":{"population":1803,"happiness":2550,"demandHappiness":1803,"money_24h":17400,"medals_24h":65,"strategy_points_24h":8,"random_good_of_age_24h":18},"ProgressiveEra":{"population":2152,"happiness":2800,"demandHappiness":2152,"money_24h":21100,"medals_24h":90,"strategy_points_24h":8,"random_good_of_age_24h":18},"ModernEra":{"population":2522,"happiness":3000,"demandHappiness":2522,"money_24h":26200,"medals_24h":129,"strategy_points_24h":8,"random_good_of_age_24h":18},"PostModernEra":{"population":2907,"happiness":3120,"demandHappiness":2907,"money_24h":33000,"medals_24h":180,"strategy_points_24h":8,"random_good_of_age_24h":18},"ContemporaryEra":{"population":3313,"happiness":3630,"demandHappiness":3313,"money_24h":43000,"medals_24h":258,"strategy_points_24h":8,"random_good_of_age_24h":18},"TomorrowEra":{"population":3734,"happiness":4400,"demandHappiness":3734,"money_24h":49800,"medals_24h":348,"strategy_points_24h":8,"random_good_of_age_24h":18},"FutureEra":{"population":4175,"happiness":5270,"demandHappiness":4175,"money_24h":57000,"medals_24h":425,"strategy_points_24h":8,"random_good_of_age_24h":18},"ArcticFuture":{"population":4631,"happiness":6140,"demandHappiness":4631,"money_24h":64800,"medals_24h":515,"strategy_points_24h":8,"random_good_of_age_24h":18},"OceanicFuture":{"population":5102,"happiness":7090,"demandHappiness":5102,"money_24h":73100,"medals_24h":592,"strategy_points_24h":8,"random_good_of_age_24h":18},"VirtualFuture":{"population":5586,"happiness":8470,"demandHappiness":5586,"money_24h":81800,"medals_24h":720,"strategy_points_24h":8,"random_good_of_age_24h":18},"SpaceAgeMars":{"population":8842,"happiness":13550,"demandHappiness":8842,"money_24h":136700,"medals_24h":875,"strategy_points_24h":8,"random_good_of_age_24h":18},"SpaceAgeAsteroidBelt":{"population":9605,"happiness":14720,"demandHappiness":9605,"money_24h":151400,"medals_24h":1029,"strategy_points_24h":8,"random_good_of_age_24h":18},"SpaceAgeVenus":{"population":10381,"happiness":15910,"demandHappiness":10381,"money_24h":166900,"medals_24h":1183,"strategy_points_24h":8,"random_good_of_age_24h":18},"SpaceAgeJupiterMoon":{"population":11179,"happiness":17140,"demandHappiness":11179,"money_24h":183200,"medals_24h":1338,"strategy_points_24h":8,"random_good_of_age_24h":18},"SpaceAgeTitan":{"population":11991,"happiness":18380,"demandHappiness":11991,"money_24h":200300,"medals_24h":1492,"strategy_points_24h":8,"random_good_of_age_24h":18},"SpaceAgeSpaceHub":{"population":12825,"happiness":19660,"demandHappiness":12825,"money_24h":218200,"medals_24h":1646,"strategy_points_24h":8,"random_good_of_age_24h":18}}, boosts: [{"type":"supply_production","value":25,"feature":"all"}] },
+    "W_MultiAge_BOWL22A12": { prod: {"BronzeAge":{"population":380,"happiness":1450,"demandHappiness":380,"money_24h":2280,"medals_24h":180,"strategy_points_24h":175,"random_good_of_age_24h":225},"IronAge":{"population":810,"happiness":2490,"demandHappiness":810,"money_24h":5480,"medals_24h":230,"strategy_points_24h":175,"random_good_of_age_24h":225},"EarlyMiddleAge":{"population":1240,"happiness":2760,"demandHappiness":1240,"money_24h":9130,"medals_24h":280,"strategy_points_24h":175,"random_good_of_age_24h":225},"HighMiddleAge":{"population":1740,"happiness":3080,"demandHappiness":1740,"money_24h":12780,"medals_24h":330,"strategy_points_24h":175,"random_good_of_age_24h":225},"LateMiddleAge":{"population":2280,"happiness":3430,"demandHappiness":2280,"money_24h":16890,"medals_24h":380,"strategy_points_24h":175,"random_good_of_age_24h":225},"ColonialAge":{"population":2880,"happiness":4030,"demandHappiness":2880,"money_24h":25720,"medals_24h":450,"strategy_points_24h":175,"random_good_of_age_24h":225},"IndustrialAge":{"population":3520,"happiness":4550,"demandHappiness":3520,"money_24h":32050,"medals_24h":630,"strategy_points_24h":175,"random_good_of_age_24h":225},"ProgressiveEra":{"population":4200,"happiness":4990,"demandHappiness":4200,"money_24h":38890,"medals_24h":880,"strategy_points_24h":175,"random_good_of_age_24h":225},"ModernEra":{"population":4920,"happiness":5340,"demandHappiness":4920,"money_24h":48390,"medals_24h":1250,"strategy_points_24h":175,"random_good_of_age_24h":225},"PostModernEra":{"population":5680,"happiness":5570,"demandHappiness":5680,"money_24h":60870,"medals_24h":1750,"strategy_points_24h":175,"random_good_of_age_24h":225},"ContemporaryEra":{"population":6470,"happiness":6470,"demandHappiness":6470,"money_24h":79250,"medals_24h":2500,"strategy_points_24h":175,"random_good_of_age_24h":225},"TomorrowEra":{"population":7290,"happiness":7850,"demandHappiness":7290,"money_24h":91760,"medals_24h":3380,"strategy_points_24h":175,"random_good_of_age_24h":225},"FutureEra":{"population":8150,"happiness":9410,"demandHappiness":8150,"money_24h":105180,"medals_24h":4130,"strategy_points_24h":175,"random_good_of_age_24h":225},"ArcticFuture":{"population":9040,"happiness":10960,"demandHappiness":9040,"money_24h":119510,"medals_24h":5000,"strategy_points_24h":175,"random_good_of_age_24h":225},"OceanicFuture":{"population":9960,"happiness":12640,"demandHappiness":9960,"money_24h":134760,"medals_24h":5750,"strategy_points_24h":175,"random_good_of_age_24h":225},"VirtualFuture":{"population":10910,"happiness":15110,"demandHappiness":10910,"money_24h":150940,"medals_24h":7000,"strategy_points_24h":175,"random_good_of_age_24h":225},"SpaceAgeMars":{"population":17260,"happiness":24170,"demandHappiness":17260,"money_24h":252120,"medals_24h":8500,"strategy_points_24h":175,"random_good_of_age_24h":225},"SpaceAgeAsteroidBelt":{"population":18750,"happiness":26270,"demandHappiness":18750,"money_24h":279260,"medals_24h":10000,"strategy_points_24h":175,"random_good_of_age_24h":225},"SpaceAgeVenus":{"population":20270,"happiness":28380,"demandHappiness":20270,"money_24h":307840,"medals_24h":11500,"strategy_points_24h":175,"random_good_of_age_24h":225},"SpaceAgeJupiterMoon":{"population":21830,"happiness":30570,"demandHappiness":21830,"money_24h":337880,"medals_24h":13000,"strategy_points_24h":175,"random_good_of_age_24h":225},"SpaceAgeTitan":{"population":23410,"happiness":32790,"demandHappiness":23410,"money_24h":369400,"medals_24h":14500,"strategy_points_24h":175,"random_good_of_age_24h":225},"SpaceAgeSpaceHub":{"population":25000,"happiness":35000,"demandHappiness":25000,"money_24h":400920,"medals_24h":16000,"strategy_points_24h":175,"random_good_of_age_24h":225}}, boosts: [{"type":"att_def_boost_attacker","value":58,"feature":"all"},{"type":"att_def_boost_attacker","value":66,"feature":"battleground"},{"type":"att_boost_defender","value":30,"feature":"guild_raids"},{"type":"coin_production","value":23,"feature":"all"}] },
+    "W_MultiAge_BOWL22A13": { prod: {"BronzeAge":{"population":380,"happiness":1570,"demandHappiness":380,"money_24h":2850,"medals_24h":350,"strategy_points_24h":350,"random_good_of_age_24h":450},"IronAge":{"population":810,"happiness":2710,"demandHappiness":810,"money_24h":6830,"medals_24h":450,"strategy_points_24h":350,"random_good_of_age_24h":450},"EarlyMiddleAge":{"population":1240,"happiness":2990,"demandHappiness":1240,"money_24h":11390,"medals_24h":550,"strategy_points_24h":350,"random_good_of_age_24h":450},"HighMiddleAge":{"population":1740,"happiness":3340,"demandHappiness":1740,"money_24h":15940,"medals_24h":650,"strategy_points_24h":350,"random_good_of_age_24h":450},"LateMiddleAge":{"population":2280,"happiness":3720,"demandHappiness":2280,"money_24h":21060,"medals_24h":750,"strategy_points_24h":350,"random_good_of_age_24h":450},"ColonialAge":{"population":2880,"happiness":4380,"demandHappiness":2880,"money_24h":32080,"medals_24h":900,"strategy_points_24h":350,"random_good_of_age_24h":450},"IndustrialAge":{"population":3520,"happiness":4940,"demandHappiness":3520,"money_24h":39970,"medals_24h":1250,"strategy_points_24h":350,"random_good_of_age_24h":450},"ProgressiveEra":{"population":4200,"happiness":5420,"demandHappiness":4200,"money_24h":48510,"medals_24h":1750,"strategy_points_24h":350,"random_good_of_age_24h":450},"ModernEra":{"population":4920,"happiness":5800,"demandHappiness":4920,"money_24h":60350,"medals_24h":2500,"strategy_points_24h":350,"random_good_of_age_24h":450},"PostModernEra":{"population":5680,"happiness":6050,"demandHappiness":5680,"money_24h":75920,"medals_24h":3500,"strategy_points_24h":350,"random_good_of_age_24h":450},"ContemporaryEra":{"population":6470,"happiness":7020,"demandHappiness":6470,"money_24h":98830,"medals_24h":5000,"strategy_points_24h":350,"random_good_of_age_24h":450},"TomorrowEra":{"population":7290,"happiness":8530,"demandHappiness":7290,"money_24h":114430,"medals_24h":6750,"strategy_points_24h":350,"random_good_of_age_24h":450},"FutureEra":{"population":8150,"happiness":10220,"demandHappiness":8150,"money_24h":131170,"medals_24h":8250,"strategy_points_24h":350,"random_good_of_age_24h":450},"ArcticFuture":{"population":9040,"happiness":11900,"demandHappiness":9040,"money_24h":149050,"medals_24h":10000,"strategy_points_24h":350,"random_good_of_age_24h":450},"OceanicFuture":{"population":9960,"happiness":13730,"demandHappiness":9960,"money_24h":168060,"medals_24h":11500,"strategy_points_24h":350,"random_good_of_age_24h":450},"VirtualFuture":{"population":10910,"happiness":16400,"demandHappiness":10910,"money_24h":188240,"medals_24h":14000,"strategy_points_24h":350,"random_good_of_age_24h":450},"SpaceAgeMars":{"population":17260,"happiness":26240,"demandHappiness":17260,"money_24h":314430,"medals_24h":17000,"strategy_points_24h":350,"random_good_of_age_24h":450},"SpaceAgeAsteroidBelt":{"population":18750,"happiness":28520,"demandHappiness":18750,"money_24h":348280,"medals_24h":20000,"strategy_points_24h":350,"random_good_of_age_24h":450},"SpaceAgeVenus":{"population":20270,"happiness":30810,"demandHappiness":20270,"money_24h":383920,"medals_24h":23000,"strategy_points_24h":350,"random_good_of_age_24h":450},"SpaceAgeJupiterMoon":{"population":21830,"happiness":33190,"demandHappiness":21830,"money_24h":421380,"medals_24h":26000,"strategy_points_24h":350,"random_good_of_age_24h":450},"SpaceAgeTitan":{"population":23410,"happiness":35600,"demandHappiness":23410,"money_24h":460690,"medals_24h":29000,"strategy_points_24h":350,"random_good_of_age_24h":450},"SpaceAgeSpaceHub":{"population":25000,"happiness":38000,"demandHappiness":25000,"money_24h":500000,"medals_24h":32000,"strategy_points_24h":350,"random_good_of_age_24h":450}}, boosts: [{"type":"att_def_boost_attacker","value":137,"feature":"all"},{"type":"att_def_boost_attacker","value":324,"feature":"battleground"},{"type":"att_boost_defender","value":60,"feature":"guild_raids"},{"type":"coin_production","value":27,"feature":"all"},{"type":"guild_raids_action_points_collection","value":200,"feature":"all"},{"type":"guild_raids_action_points_capacity","value":8000,"feature":"all"}] },
+    "W_MultiAge_BOWL22A11": { prod: {"BronzeAge":{"population":300,"happiness":1360,"demandHappiness":300,"money_24h":2040,"medals_24h":40,"strategy_points_24h":50,"random_good_of_age_24h":100},"IronAge":{"population":650,"happiness":2350,"demandHappiness":650,"money_24h":4890,"medals_24h":60,"strategy_points_24h":50,"random_good_of_age_24h":100},"EarlyMiddleAge":{"population":990,"happiness":2600,"demandHappiness":990,"money_24h":8150,"medals_24h":70,"strategy_points_24h":50,"random_good_of_age_24h":100},"HighMiddleAge":{"population":1390,"happiness":2900,"demandHappiness":1390,"money_24h":11410,"medals_24h":80,"strategy_points_24h":50,"random_good_of_age_24h":100},"LateMiddleAge":{"population":1830,"happiness":3230,"demandHappiness":1830,"money_24h":15080,"medals_24h":90,"strategy_points_24h":50,"random_good_of_age_24h":100},"ColonialAge":{"population":2300,"happiness":3800,"demandHappiness":2300,"money_24h":22960,"medals_24h":110,"strategy_points_24h":50,"random_good_of_age_24h":100},"IndustrialAge":{"population":2820,"happiness":4290,"demandHappiness":2820,"money_24h":28610,"medals_24h":160,"strategy_points_24h":50,"random_good_of_age_24h":100},"ProgressiveEra":{"population":3360,"happiness":4710,"demandHappiness":3360,"money_24h":34720,"medals_24h":220,"strategy_points_24h":50,"random_good_of_age_24h":100},"ModernEra":{"population":3940,"happiness":5040,"demandHappiness":3940,"money_24h":43200,"medals_24h":310,"strategy_points_24h":50,"random_good_of_age_24h":100},"PostModernEra":{"population":4540,"happiness":5250,"demandHappiness":4540,"money_24h":54340,"medals_24h":440,"strategy_points_24h":50,"random_good_of_age_24h":100},"ContemporaryEra":{"population":5180,"happiness":6100,"demandHappiness":5180,"money_24h":70740,"medals_24h":630,"strategy_points_24h":50,"random_good_of_age_24h":100},"TomorrowEra":{"population":5830,"happiness":7410,"demandHappiness":5830,"money_24h":81910,"medals_24h":840,"strategy_points_24h":50,"random_good_of_age_24h":100},"FutureEra":{"population":6520,"happiness":8870,"demandHappiness":6520,"money_24h":93890,"medals_24h":1030,"strategy_points_24h":50,"random_good_of_age_24h":100},"ArcticFuture":{"population":7230,"happiness":10330,"demandHappiness":7230,"money_24h":106690,"medals_24h":1250,"strategy_points_24h":50,"random_good_of_age_24h":100},"OceanicFuture":{"population":7970,"happiness":11920,"demandHappiness":7970,"money_24h":120300,"medals_24h":1440,"strategy_points_24h":50,"random_good_of_age_24h":100},"VirtualFuture":{"population":8730,"happiness":14240,"demandHappiness":8730,"money_24h":134740,"medals_24h":1750,"strategy_points_24h":50,"random_good_of_age_24h":100},"SpaceAgeMars":{"population":13810,"happiness":22790,"demandHappiness":13810,"money_24h":225070,"medals_24h":2130,"strategy_points_24h":50,"random_good_of_age_24h":100},"SpaceAgeAsteroidBelt":{"population":15000,"happiness":24770,"demandHappiness":15000,"money_24h":249300,"medals_24h":2500,"strategy_points_24h":50,"random_good_of_age_24h":100},"SpaceAgeVenus":{"population":16220,"happiness":26760,"demandHappiness":16220,"money_24h":274810,"medals_24h":2880,"strategy_points_24h":50,"random_good_of_age_24h":100},"SpaceAgeJupiterMoon":{"population":17460,"happiness":28820,"demandHappiness":17460,"money_24h":301620,"medals_24h":3250,"strategy_points_24h":50,"random_good_of_age_24h":100},"SpaceAgeTitan":{"population":18730,"happiness":30910,"demandHappiness":18730,"money_24h":329760,"medals_24h":3630,"strategy_points_24h":50,"random_good_of_age_24h":100},"SpaceAgeSpaceHub":{"population":20000,"happiness":33000,"demandHappiness":20000,"money_24h":357900,"medals_24h":4000,"strategy_points_24h":50,"random_good_of_age_24h":100}}, boosts: [{"type":"att_def_boost_attacker","value":38,"feature":"all"},{"type":"att_boost_defender","value":15,"feature":"guild_raids"},{"type":"coin_production","value":21,"feature":"all"}] },
+};
@@ -0,0 +1,41 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 37 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_CARE25D1": { prod: {"AllAge":{"strategy_points_24h":150,"all_goods_of_next_age_24h":80}}, boosts: [{"type":"att_def_boost_attacker_defender","value":75,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":125,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":25,"feature":"guild_raids"},{"type":"guild_goods_production","value":5,"feature":"all"}] },
+    "W_MultiAge_CARE25E1": { prod: {"AllAge":{"strategy_points_24h":234},"BronzeAge":{"population":1170,"happiness":4840,"demandHappiness":1170},"IronAge":{"population":2520,"happiness":8330,"demandHappiness":2520},"EarlyMiddleAge":{"population":3860,"happiness":9220,"demandHappiness":3860},"HighMiddleAge":{"population":5430,"happiness":10280,"demandHappiness":5430},"LateMiddleAge":{"population":7120,"happiness":11470,"demandHappiness":7120},"ColonialAge":{"population":8980,"happiness":13480,"demandHappiness":8980},"IndustrialAge":{"population":10980,"happiness":15210,"demandHappiness":10980},"ProgressiveEra":{"population":13110,"happiness":16700,"demandHappiness":13110},"ModernEra":{"population":15370,"happiness":17860,"demandHappiness":15370},"PostModernEra":{"population":17710,"happiness":18610,"demandHappiness":17710},"ContemporaryEra":{"population":20180,"happiness":21630,"demandHappiness":20180},"TomorrowEra":{"population":22740,"happiness":26250,"demandHappiness":22740},"FutureEra":{"population":25440,"happiness":31460,"demandHappiness":25440},"ArcticFuture":{"population":28210,"happiness":36630,"demandHappiness":28210},"OceanicFuture":{"population":31080,"happiness":42270,"demandHappiness":31080},"VirtualFuture":{"population":34030,"happiness":50500,"demandHappiness":34030},"SpaceAgeMars":{"population":53870,"happiness":80800,"demandHappiness":53870},"SpaceAgeAsteroidBelt":{"population":58510,"happiness":87810,"demandHappiness":58510},"SpaceAgeVenus":{"population":63240,"happiness":94870,"demandHappiness":63240},"SpaceAgeJupiterMoon":{"population":68100,"happiness":102190,"demandHappiness":68100},"SpaceAgeTitan":{"population":73050,"happiness":109600,"demandHappiness":73050},"SpaceAgeSpaceHub":{"population":78000,"happiness":117000,"demandHappiness":78000}}, boosts: [{"type":"att_def_boost_attacker_defender","value":60,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":96,"feature":"guild_expedition"},{"type":"att_def_boost_attacker_defender","value":5,"feature":"guild_raids"}] },
+    "W_MultiAge_CARE25E2": { prod: {"AllAge":{"strategy_points_24h":390},"BronzeAge":{"population":1950,"happiness":8060,"demandHappiness":1950},"IronAge":{"population":4200,"happiness":13890,"demandHappiness":4200},"EarlyMiddleAge":{"population":6440,"happiness":15360,"demandHappiness":6440},"HighMiddleAge":{"population":9040,"happiness":17140,"demandHappiness":9040},"LateMiddleAge":{"population":11860,"happiness":19110,"demandHappiness":11860},"ColonialAge":{"population":14970,"happiness":22470,"demandHappiness":14970},"IndustrialAge":{"population":18300,"happiness":25340,"demandHappiness":18300},"ProgressiveEra":{"population":21850,"happiness":27830,"demandHappiness":21850},"ModernEra":{"population":25610,"happiness":29770,"demandHappiness":25610},"PostModernEra":{"population":29520,"happiness":31020,"demandHappiness":29520},"ContemporaryEra":{"population":33640,"happiness":36050,"demandHappiness":33640},"TomorrowEra":{"population":37910,"happiness":43760,"demandHappiness":37910},"FutureEra":{"population":42390,"happiness":52430,"demandHappiness":42390},"ArcticFuture":{"population":47020,"happiness":61050,"demandHappiness":47020},"OceanicFuture":{"population":51800,"happiness":70450,"demandHappiness":51800},"VirtualFuture":{"population":56720,"happiness":84160,"demandHappiness":56720},"SpaceAgeMars":{"population":89780,"happiness":134670,"demandHappiness":89780},"SpaceAgeAsteroidBelt":{"population":97520,"happiness":146350,"demandHappiness":97520},"SpaceAgeVenus":{"population":105400,"happiness":158110,"demandHappiness":105400},"SpaceAgeJupiterMoon":{"population":113510,"happiness":170320,"demandHappiness":113510},"SpaceAgeTitan":{"population":121750,"happiness":182660,"demandHappiness":121750},"SpaceAgeSpaceHub":{"population":130000,"happiness":195000,"demandHappiness":130000}}, boosts: [{"type":"att_def_boost_attacker_defender","value":100,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":192,"feature":"guild_expedition"},{"type":"att_def_boost_attacker_defender","value":10,"feature":"guild_raids"}] },
+    "W_MultiAge_CARE25A11": { prod: {"BronzeAge":{"medals_24h":480,"strategy_points_24h":180},"IronAge":{"medals_24h":620,"strategy_points_24h":180},"EarlyMiddleAge":{"medals_24h":760,"strategy_points_24h":180},"HighMiddleAge":{"medals_24h":890,"strategy_points_24h":180},"LateMiddleAge":{"medals_24h":1030,"strategy_points_24h":180},"ColonialAge":{"medals_24h":1240,"strategy_points_24h":180},"IndustrialAge":{"medals_24h":1720,"strategy_points_24h":180},"ProgressiveEra":{"medals_24h":2410,"strategy_points_24h":180},"ModernEra":{"medals_24h":3440,"strategy_points_24h":180},"PostModernEra":{"medals_24h":4810,"strategy_points_24h":180},"ContemporaryEra":{"medals_24h":6880,"strategy_points_24h":180},"TomorrowEra":{"medals_24h":9280,"strategy_points_24h":180},"FutureEra":{"medals_24h":11340,"strategy_points_24h":180},"ArcticFuture":{"medals_24h":13750,"strategy_points_24h":180},"OceanicFuture":{"medals_24h":15810,"strategy_points_24h":180},"VirtualFuture":{"medals_24h":19250,"strategy_points_24h":180},"SpaceAgeMars":{"medals_24h":23380,"strategy_points_24h":180},"SpaceAgeAsteroidBelt":{"medals_24h":27500,"strategy_points_24h":180},"SpaceAgeVenus":{"medals_24h":31630,"strategy_points_24h":180},"SpaceAgeJupiterMoon":{"medals_24h":35750,"strategy_points_24h":180},"SpaceAgeTitan":{"medals_24h":39880,"strategy_points_24h":180},"SpaceAgeSpaceHub":{"medals_24h":44000,"strategy_points_24h":180}}, boosts: [{"type":"att_def_boost_defender","value":155,"feature":"battleground"},{"type":"att_def_boost_defender","value":285,"feature":"guild_expedition"}] },
+    "W_MultiAge_CARE25A1": { prod: {"BronzeAge":{"medals_24h":40,"strategy_points_24h":10},"IronAge":{"medals_24h":60,"strategy_points_24h":10},"EarlyMiddleAge":{"medals_24h":70,"strategy_points_24h":10},"HighMiddleAge":{"medals_24h":80,"strategy_points_24h":10},"LateMiddleAge":{"medals_24h":90,"strategy_points_24h":10},"ColonialAge":{"medals_24h":110,"strategy_points_24h":10},"IndustrialAge":{"medals_24h":160,"strategy_points_24h":10},"ProgressiveEra":{"medals_24h":220,"strategy_points_24h":10},"ModernEra":{"medals_24h":310,"strategy_points_24h":10},"PostModernEra":{"medals_24h":440,"strategy_points_24h":10},"ContemporaryEra":{"medals_24h":630,"strategy_points_24h":10},"TomorrowEra":{"medals_24h":840,"strategy_points_24h":10},"FutureEra":{"medals_24h":1030,"strategy_points_24h":10},"ArcticFuture":{"medals_24h":1250,"strategy_points_24h":10},"OceanicFuture":{"medals_24h":1440,"strategy_points_24h":10},"VirtualFuture":{"medals_24h":1750,"strategy_points_24h":10},"SpaceAgeMars":{"medals_24h":2130,"strategy_points_24h":10},"SpaceAgeAsteroidBelt":{"medals_24h":2500,"strategy_points_24h":10},"SpaceAgeVenus":{"medals_24h":2880,"strategy_points_24h":10},"SpaceAgeJupiterMoon":{"medals_24h":3250,"strategy_points_24h":10},"SpaceAgeTitan":{"medals_24h":3630,"strategy_points_24h":10},"SpaceAgeSpaceHub":{"medals_24h":4000,"strategy_points_24h":10}}, boosts: [{"type":"att_def_boost_defender","value":18,"feature":"battleground"}] },
+    "W_MultiAge_CARE25A2": { prod: {"BronzeAge":{"medals_24h":90,"strategy_points_24h":20},"IronAge":{"medals_24h":110,"strategy_points_24h":20},"EarlyMiddleAge":{"medals_24h":140,"strategy_points_24h":20},"HighMiddleAge":{"medals_24h":160,"strategy_points_24h":20},"LateMiddleAge":{"medals_24h":190,"strategy_points_24h":20},"ColonialAge":{"medals_24h":230,"strategy_points_24h":20},"IndustrialAge":{"medals_24h":310,"strategy_points_24h":20},"ProgressiveEra":{"medals_24h":440,"strategy_points_24h":20},"ModernEra":{"medals_24h":630,"strategy_points_24h":20},"PostModernEra":{"medals_24h":880,"strategy_points_24h":20},"ContemporaryEra":{"medals_24h":1250,"strategy_points_24h":20},"TomorrowEra":{"medals_24h":1690,"strategy_points_24h":20},"FutureEra":{"medals_24h":2060,"strategy_points_24h":20},"ArcticFuture":{"medals_24h":2500,"strategy_points_24h":20},"OceanicFuture":{"medals_24h":2880,"strategy_points_24h":20},"VirtualFuture":{"medals_24h":3500,"strategy_points_24h":20},"SpaceAgeMars":{"medals_24h":4250,"strategy_points_24h":20},"SpaceAgeAsteroidBelt":{"medals_24h":5000,"strategy_points_24h":20},"SpaceAgeVenus":{"medals_24h":5750,"strategy_points_24h":20},"SpaceAgeJupiterMoon":{"medals_24h":6500,"strategy_points_24h":20},"SpaceAgeTitan":{"medals_24h":7250,"strategy_points_24h":20},"SpaceAgeSpaceHub":{"medals_24h":8000,"strategy_points_24h":20}}, boosts: [{"type":"att_def_boost_defender","value":18,"feature":"battleground"},{"type":"att_def_boost_defender","value":9,"feature":"guild_expedition"}] },
+    "W_MultiAge_CARE25A3": { prod: {"BronzeAge":{"medals_24h":130,"strategy_points_24h":30},"IronAge":{"medals_24h":170,"strategy_points_24h":30},"EarlyMiddleAge":{"medals_24h":210,"strategy_points_24h":30},"HighMiddleAge":{"medals_24h":240,"strategy_points_24h":30},"LateMiddleAge":{"medals_24h":280,"strategy_points_24h":30},"ColonialAge":{"medals_24h":340,"strategy_points_24h":30},"IndustrialAge":{"medals_24h":470,"strategy_points_24h":30},"ProgressiveEra":{"medals_24h":660,"strategy_points_24h":30},"ModernEra":{"medals_24h":940,"strategy_points_24h":30},"PostModernEra":{"medals_24h":1310,"strategy_points_24h":30},"ContemporaryEra":{"medals_24h":1880,"strategy_points_24h":30},"TomorrowEra":{"medals_24h":2530,"strategy_points_24h":30},"FutureEra":{"medals_24h":3090,"strategy_points_24h":30},"ArcticFuture":{"medals_24h":3750,"strategy_points_24h":30},"OceanicFuture":{"medals_24h":4310,"strategy_points_24h":30},"VirtualFuture":{"medals_24h":5250,"strategy_points_24h":30},"SpaceAgeMars":{"medals_24h":6380,"strategy_points_24h":30},"SpaceAgeAsteroidBelt":{"medals_24h":7500,"strategy_points_24h":30},"SpaceAgeVenus":{"medals_24h":8630,"strategy_points_24h":30},"SpaceAgeJupiterMoon":{"medals_24h":9750,"strategy_points_24h":30},"SpaceAgeTitan":{"medals_24h":10880,"strategy_points_24h":30},"SpaceAgeSpaceHub":{"medals_24h":12000,"strategy_points_24h":30}}, boosts: [{"type":"att_def_boost_defender","value":18,"feature":"battleground"},{"type":"att_def_boost_defender","value":28,"feature":"guild_expedition"}] },
+    "W_MultiAge_CARE25A4": { prod: {"BronzeAge":{"medals_24h":180,"strategy_points_24h":40},"IronAge":{"medals_24h":230,"strategy_points_24h":40},"EarlyMiddleAge":{"medals_24h":280,"strategy_points_24h":40},"HighMiddleAge":{"medals_24h":330,"strategy_points_24h":40},"LateMiddleAge":{"medals_24h":380,"strategy_points_24h":40},"ColonialAge":{"medals_24h":450,"strategy_points_24h":40},"IndustrialAge":{"medals_24h":630,"strategy_points_24h":40},"ProgressiveEra":{"medals_24h":880,"strategy_points_24h":40},"ModernEra":{"medals_24h":1250,"strategy_points_24h":40},"PostModernEra":{"medals_24h":1750,"strategy_points_24h":40},"ContemporaryEra":{"medals_24h":2500,"strategy_points_24h":40},"TomorrowEra":{"medals_24h":3380,"strategy_points_24h":40},"FutureEra":{"medals_24h":4130,"strategy_points_24h":40},"ArcticFuture":{"medals_24h":5000,"strategy_points_24h":40},"OceanicFuture":{"medals_24h":5750,"strategy_points_24h":40},"VirtualFuture":{"medals_24h":7000,"strategy_points_24h":40},"SpaceAgeMars":{"medals_24h":8500,"strategy_points_24h":40},"SpaceAgeAsteroidBelt":{"medals_24h":10000,"strategy_points_24h":40},"SpaceAgeVenus":{"medals_24h":11500,"strategy_points_24h":40},"SpaceAgeJupiterMoon":{"medals_24h":13000,"strategy_points_24h":40},"SpaceAgeTitan":{"medals_24h":14500,"strategy_points_24h":40},"SpaceAgeSpaceHub":{"medals_24h":16000,"strategy_points_24h":40}}, boosts: [{"type":"att_def_boost_defender","value":18,"feature":"battleground"},{"type":"att_def_boost_defender","value":47,"feature":"guild_expedition"}] },
+    "W_MultiAge_CARE25A5": { prod: {"BronzeAge":{"medals_24h":220,"strategy_points_24h":50},"IronAge":{"medals_24h":280,"strategy_points_24h":50},"EarlyMiddleAge":{"medals_24h":340,"strategy_points_24h":50},"HighMiddleAge":{"medals_24h":410,"strategy_points_24h":50},"LateMiddleAge":{"medals_24h":470,"strategy_points_24h":50},"ColonialAge":{"medals_24h":560,"strategy_points_24h":50},"IndustrialAge":{"medals_24h":780,"strategy_points_24h":50},"ProgressiveEra":{"medals_24h":1090,"strategy_points_24h":50},"ModernEra":{"medals_24h":1560,"strategy_points_24h":50},"PostModernEra":{"medals_24h":2190,"strategy_points_24h":50},"ContemporaryEra":{"medals_24h":3130,"strategy_points_24h":50},"TomorrowEra":{"medals_24h":4220,"strategy_points_24h":50},"FutureEra":{"medals_24h":5160,"strategy_points_24h":50},"ArcticFuture":{"medals_24h":6250,"strategy_points_24h":50},"OceanicFuture":{"medals_24h":7190,"strategy_points_24h":50},"VirtualFuture":{"medals_24h":8750,"strategy_points_24h":50},"SpaceAgeMars":{"medals_24h":10630,"strategy_points_24h":50},"SpaceAgeAsteroidBelt":{"medals_24h":12500,"strategy_points_24h":50},"SpaceAgeVenus":{"medals_24h":14380,"strategy_points_24h":50},"SpaceAgeJupiterMoon":{"medals_24h":16250,"strategy_points_24h":50},"SpaceAgeTitan":{"medals_24h":18130,"strategy_points_24h":50},"SpaceAgeSpaceHub":{"medals_24h":20000,"strategy_points_24h":50}}, boosts: [{"type":"att_def_boost_defender","value":35,"feature":"battleground"},{"type":"att_def_boost_defender","value":66,"feature":"guild_expedition"}] },
+    "W_MultiAge_CARE25A6": { prod: {"BronzeAge":{"medals_24h":260,"strategy_points_24h":60},"IronAge":{"medals_24h":340,"strategy_points_24h":60},"EarlyMiddleAge":{"medals_24h":410,"strategy_points_24h":60},"HighMiddleAge":{"medals_24h":490,"strategy_points_24h":60},"LateMiddleAge":{"medals_24h":560,"strategy_points_24h":60},"ColonialAge":{"medals_24h":680,"strategy_points_24h":60},"IndustrialAge":{"medals_24h":940,"strategy_points_24h":60},"ProgressiveEra":{"medals_24h":1310,"strategy_points_24h":60},"ModernEra":{"medals_24h":1880,"strategy_points_24h":60},"PostModernEra":{"medals_24h":2630,"strategy_points_24h":60},"ContemporaryEra":{"medals_24h":3750,"strategy_points_24h":60},"TomorrowEra":{"medals_24h":5060,"strategy_points_24h":60},"FutureEra":{"medals_24h":6190,"strategy_points_24h":60},"ArcticFuture":{"medals_24h":7500,"strategy_points_24h":60},"OceanicFuture":{"medals_24h":8630,"strategy_points_24h":60},"VirtualFuture":{"medals_24h":10500,"strategy_points_24h":60},"SpaceAgeMars":{"medals_24h":12750,"strategy_points_24h":60},"SpaceAgeAsteroidBelt":{"medals_24h":15000,"strategy_points_24h":60},"SpaceAgeVenus":{"medals_24h":17250,"strategy_points_24h":60},"SpaceAgeJupiterMoon":{"medals_24h":19500,"strategy_points_24h":60},"SpaceAgeTitan":{"medals_24h":21750,"strategy_points_24h":60},"SpaceAgeSpaceHub":{"medals_24h":24000,"strategy_points_24h":60}}, boosts: [{"type":"att_def_boost_defender","value":55,"feature":"battleground"},{"type":"att_def_boost_defender","value":85,"feature":"guild_expedition"}] },
+    "W_MultiAge_CARE25A7": { prod: {"BronzeAge":{"medals_24h":310,"strategy_points_24h":70},"IronAge":{"medals_24h":390,"strategy_points_24h":70},"EarlyMiddleAge":{"medals_24h":480,"strategy_points_24h":70},"HighMiddleAge":{"medals_24h":570,"strategy_points_24h":70},"LateMiddleAge":{"medals_24h":660,"strategy_points_24h":70},"ColonialAge":{"medals_24h":790,"strategy_points_24h":70},"IndustrialAge":{"medals_24h":1090,"strategy_points_24h":70},"ProgressiveEra":{"medals_24h":1530,"strategy_points_24h":70},"ModernEra":{"medals_24h":2190,"strategy_points_24h":70},"PostModernEra":{"medals_24h":3060,"strategy_points_24h":70},"ContemporaryEra":{"medals_24h":4380,"strategy_points_24h":70},"TomorrowEra":{"medals_24h":5910,"strategy_points_24h":70},"FutureEra":{"medals_24h":7220,"strategy_points_24h":70},"ArcticFuture":{"medals_24h":8750,"strategy_points_24h":70},"OceanicFuture":{"medals_24h":10060,"strategy_points_24h":70},"VirtualFuture":{"medals_24h":12250,"strategy_points_24h":70},"SpaceAgeMars":{"medals_24h":14880,"strategy_points_24h":70},"SpaceAgeAsteroidBelt":{"medals_24h":17500,"strategy_points_24h":70},"SpaceAgeVenus":{"medals_24h":20130,"strategy_points_24h":70},"SpaceAgeJupiterMoon":{"medals_24h":22750,"strategy_points_24h":70},"SpaceAgeTitan":{"medals_24h":25380,"strategy_points_24h":70},"SpaceAgeSpaceHub":{"medals_24h":28000,"strategy_points_24h":70}}, boosts: [{"type":"att_def_boost_defender","value":75,"feature":"battleground"},{"type":"att_def_boost_defender","value":125,"feature":"guild_expedition"}] },
+    "W_MultiAge_CARE25A8": { prod: {"BronzeAge":{"medals_24h":350,"strategy_points_24h":80},"IronAge":{"medals_24h":450,"strategy_points_24h":80},"EarlyMiddleAge":{"medals_24h":550,"strategy_points_24h":80},"HighMiddleAge":{"medals_24h":650,"strategy_points_24h":80},"LateMiddleAge":{"medals_24h":750,"strategy_points_24h":80},"ColonialAge":{"medals_24h":900,"strategy_points_24h":80},"IndustrialAge":{"medals_24h":1250,"strategy_points_24h":80},"ProgressiveEra":{"medals_24h":1750,"strategy_points_24h":80},"ModernEra":{"medals_24h":2500,"strategy_points_24h":80},"PostModernEra":{"medals_24h":3500,"strategy_points_24h":80},"ContemporaryEra":{"medals_24h":5000,"strategy_points_24h":80},"TomorrowEra":{"medals_24h":6750,"strategy_points_24h":80},"FutureEra":{"medals_24h":8250,"strategy_points_24h":80},"ArcticFuture":{"medals_24h":10000,"strategy_points_24h":80},"OceanicFuture":{"medals_24h":11500,"strategy_points_24h":80},"VirtualFuture":{"medals_24h":14000,"strategy_points_24h":80},"SpaceAgeMars":{"medals_24h":17000,"strategy_points_24h":80},"SpaceAgeAsteroidBelt":{"medals_24h":20000,"strategy_points_24h":80},"SpaceAgeVenus":{"medals_24h":23000,"strategy_points_24h":80},"SpaceAgeJupiterMoon":{"medals_24h":26000,"strategy_points_24h":80},"SpaceAgeTitan":{"medals_24h":29000,"strategy_points_24h":80},"SpaceAgeSpaceHub":{"medals_24h":32000,"strategy_points_24h":80}}, boosts: [{"type":"att_def_boost_defender","value":95,"feature":"battleground"},{"type":"att_def_boost_defender","value":165,"feature":"guild_expedition"}] },
+    "W_MultiAge_CARE25A9": { prod: {"BronzeAge":{"medals_24h":390,"strategy_points_24h":100},"IronAge":{"medals_24h":510,"strategy_points_24h":100},"EarlyMiddleAge":{"medals_24h":620,"strategy_points_24h":100},"HighMiddleAge":{"medals_24h":730,"strategy_points_24h":100},"LateMiddleAge":{"medals_24h":840,"strategy_points_24h":100},"ColonialAge":{"medals_24h":1010,"strategy_points_24h":100},"IndustrialAge":{"medals_24h":1410,"strategy_points_24h":100},"ProgressiveEra":{"medals_24h":1970,"strategy_points_24h":100},"ModernEra":{"medals_24h":2810,"strategy_points_24h":100},"PostModernEra":{"medals_24h":3940,"strategy_points_24h":100},"ContemporaryEra":{"medals_24h":5630,"strategy_points_24h":100},"TomorrowEra":{"medals_24h":7590,"strategy_points_24h":100},"FutureEra":{"medals_24h":9280,"strategy_points_24h":100},"ArcticFuture":{"medals_24h":11250,"strategy_points_24h":100},"OceanicFuture":{"medals_24h":12940,"strategy_points_24h":100},"VirtualFuture":{"medals_24h":15750,"strategy_points_24h":100},"SpaceAgeMars":{"medals_24h":19130,"strategy_points_24h":100},"SpaceAgeAsteroidBelt":{"medals_24h":22500,"strategy_points_24h":100},"SpaceAgeVenus":{"medals_24h":25880,"strategy_points_24h":100},"SpaceAgeJupiterMoon":{"medals_24h":29250,"strategy_points_24h":100},"SpaceAgeTitan":{"medals_24h":32630,"strategy_points_24h":100},"SpaceAgeSpaceHub":{"medals_24h":36000,"strategy_points_24h":100}}, boosts: [{"type":"att_def_boost_defender","value":115,"feature":"battleground"},{"type":"att_def_boost_defender","value":205,"feature":"guild_expedition"}] },
+    "W_MultiAge_CARE25A10": { prod: {"BronzeAge":{"medals_24h":440,"strategy_points_24h":140},"IronAge":{"medals_24h":560,"strategy_points_24h":140},"EarlyMiddleAge":{"medals_24h":690,"strategy_points_24h":140},"HighMiddleAge":{"medals_24h":810,"strategy_points_24h":140},"LateMiddleAge":{"medals_24h":940,"strategy_points_24h":140},"ColonialAge":{"medals_24h":1130,"strategy_points_24h":140},"IndustrialAge":{"medals_24h":1560,"strategy_points_24h":140},"ProgressiveEra":{"medals_24h":2190,"strategy_points_24h":140},"ModernEra":{"medals_24h":3130,"strategy_points_24h":140},"PostModernEra":{"medals_24h":4380,"strategy_points_24h":140},"ContemporaryEra":{"medals_24h":6250,"strategy_points_24h":140},"TomorrowEra":{"medals_24h":8440,"strategy_points_24h":140},"FutureEra":{"medals_24h":10310,"strategy_points_24h":140},"ArcticFuture":{"medals_24h":12500,"strategy_points_24h":140},"OceanicFuture":{"medals_24h":14380,"strategy_points_24h":140},"VirtualFuture":{"medals_24h":17500,"strategy_points_24h":140},"SpaceAgeMars":{"medals_24h":21250,"strategy_points_24h":140},"SpaceAgeAsteroidBelt":{"medals_24h":25000,"strategy_points_24h":140},"SpaceAgeVenus":{"medals_24h":28750,"strategy_points_24h":140},"SpaceAgeJupiterMoon":{"medals_24h":32500,"strategy_points_24h":140},"SpaceAgeTitan":{"medals_24h":36250,"strategy_points_24h":140},"SpaceAgeSpaceHub":{"medals_24h":40000,"strategy_points_24h":140}}, boosts: [{"type":"att_def_boost_defender","value":135,"feature":"battleground"},{"type":"att_def_boost_defender","value":245,"feature":"guild_expedition"}] },
+    "W_MultiAge_CARE24B2": { prod: {"BronzeAge":{"population":-140,"happiness":1990,"supplies_24h":2670,"strategy_points_24h":36},"IronAge":{"population":-310,"happiness":3420,"supplies_24h":6410,"strategy_points_24h":36},"EarlyMiddleAge":{"population":-480,"happiness":3780,"supplies_24h":10680,"strategy_points_24h":36},"HighMiddleAge":{"population":-670,"happiness":4220,"supplies_24h":14960,"strategy_points_24h":36},"LateMiddleAge":{"population":-880,"happiness":4710,"supplies_24h":19760,"strategy_points_24h":36},"ColonialAge":{"population":-1110,"happiness":5540,"supplies_24h":25100,"strategy_points_24h":36},"IndustrialAge":{"population":-1350,"happiness":6240,"supplies_24h":30440,"strategy_points_24h":36},"ProgressiveEra":{"population":-1620,"happiness":6860,"supplies_24h":35790,"strategy_points_24h":36},"ModernEra":{"population":-1890,"happiness":7340,"supplies_24h":41660,"strategy_points_24h":36},"PostModernEra":{"population":-2180,"happiness":7640,"supplies_24h":47540,"strategy_points_24h":36},"ContemporaryEra":{"population":-2490,"happiness":8880,"supplies_24h":53410,"strategy_points_24h":36},"TomorrowEra":{"population":-2800,"happiness":10780,"supplies_24h":59820,"strategy_points_24h":36},"FutureEra":{"population":-3130,"happiness":12920,"supplies_24h":65700,"strategy_points_24h":36},"ArcticFuture":{"population":-3480,"happiness":15040,"supplies_24h":72110,"strategy_points_24h":36},"OceanicFuture":{"population":-3830,"happiness":17360,"supplies_24h":79050,"strategy_points_24h":36},"VirtualFuture":{"population":-4190,"happiness":20730,"supplies_24h":85460,"strategy_points_24h":36},"SpaceAgeMars":{"population":-6640,"happiness":33180,"supplies_24h":138340,"strategy_points_24h":36},"SpaceAgeAsteroidBelt":{"population":-7210,"happiness":36050,"supplies_24h":148480,"strategy_points_24h":36},"SpaceAgeVenus":{"population":-7790,"happiness":38950,"supplies_24h":159170,"strategy_points_24h":36},"SpaceAgeJupiterMoon":{"population":-8390,"happiness":41960,"supplies_24h":169320,"strategy_points_24h":36},"SpaceAgeTitan":{"population":-9000,"happiness":45000,"supplies_24h":180000,"strategy_points_24h":36},"SpaceAgeSpaceHub":{"population":-9610,"happiness":48040,"supplies_24h":190680,"strategy_points_24h":36}}, boosts: [{"type":"att_boost_attacker","value":68,"feature":"battleground"},{"type":"att_def_boost_defender","value":88,"feature":"guild_expedition"}] },
+    "W_MultiAge_CARE25B2": { prod: {"BronzeAge":{"population":-240,"money_24h":1820,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"IronAge":{"population":-520,"money_24h":4370,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"EarlyMiddleAge":{"population":-790,"money_24h":7290,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"HighMiddleAge":{"population":-1110,"money_24h":10200,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"LateMiddleAge":{"population":-1460,"money_24h":13480,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"ColonialAge":{"population":-1840,"money_24h":20530,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"IndustrialAge":{"population":-2250,"money_24h":25580,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"ProgressiveEra":{"population":-2690,"money_24h":31040,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"ModernEra":{"population":-3150,"money_24h":38620,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"PostModernEra":{"population":-3630,"money_24h":48590,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"ContemporaryEra":{"population":-4140,"money_24h":63250,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"TomorrowEra":{"population":-4670,"money_24h":73240,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"FutureEra":{"population":-5220,"money_24h":83950,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"ArcticFuture":{"population":-5790,"money_24h":95390,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"OceanicFuture":{"population":-6380,"money_24h":107560,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"VirtualFuture":{"population":-6980,"money_24h":120480,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"SpaceAgeMars":{"population":-11050,"money_24h":201240,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"SpaceAgeAsteroidBelt":{"population":-12000,"money_24h":222900,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"SpaceAgeVenus":{"population":-12970,"money_24h":245710,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"SpaceAgeJupiterMoon":{"population":-13970,"money_24h":269680,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"SpaceAgeTitan":{"population":-14980,"money_24h":294840,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85},"SpaceAgeSpaceHub":{"population":-16000,"money_24h":320000,"random_good_of_age_24h":85,"random_good_of_previous_age_24h":85}}, boosts: [{"type":"att_boost_attacker","value":56,"feature":"guild_expedition"},{"type":"def_boost_attacker","value":30,"feature":"guild_raids"},{"type":"att_boost_defender","value":56,"feature":"guild_expedition"},{"type":"guild_raids_goods_start","value":10,"feature":"all"}] },
+    "W_MultiAge_CARE25C2": { prod: {"BronzeAge":{"population":-60,"supplies_24h":560,"strategy_points_24h":28},"IronAge":{"population":-130,"supplies_24h":1340,"strategy_points_24h":28},"EarlyMiddleAge":{"population":-200,"supplies_24h":2240,"strategy_points_24h":28},"HighMiddleAge":{"population":-280,"supplies_24h":3140,"strategy_points_24h":28},"LateMiddleAge":{"population":-370,"supplies_24h":4150,"strategy_points_24h":28},"ColonialAge":{"population":-460,"supplies_24h":5270,"strategy_points_24h":28},"IndustrialAge":{"population":-560,"supplies_24h":6390,"strategy_points_24h":28},"ProgressiveEra":{"population":-670,"supplies_24h":7510,"strategy_points_24h":28},"ModernEra":{"population":-790,"supplies_24h":8740,"strategy_points_24h":28},"PostModernEra":{"population":-910,"supplies_24h":9970,"strategy_points_24h":28},"ContemporaryEra":{"population":-1040,"supplies_24h":11200,"strategy_points_24h":28},"TomorrowEra":{"population":-1170,"supplies_24h":12550,"strategy_points_24h":28},"FutureEra":{"population":-1300,"supplies_24h":13780,"strategy_points_24h":28},"ArcticFuture":{"population":-1450,"supplies_24h":15130,"strategy_points_24h":28},"OceanicFuture":{"population":-1590,"supplies_24h":16580,"strategy_points_24h":28},"VirtualFuture":{"population":-1750,"supplies_24h":17930,"strategy_points_24h":28},"SpaceAgeMars":{"population":-2760,"supplies_24h":29020,"strategy_points_24h":28},"SpaceAgeAsteroidBelt":{"population":-3000,"supplies_24h":31150,"strategy_points_24h":28},"SpaceAgeVenus":{"population":-3240,"supplies_24h":33390,"strategy_points_24h":28},"SpaceAgeJupiterMoon":{"population":-3490,"supplies_24h":35520,"strategy_points_24h":28},"SpaceAgeTitan":{"population":-3750,"supplies_24h":37760,"strategy_points_24h":28},"SpaceAgeSpaceHub":{"population":-4000,"supplies_24h":40000,"strategy_points_24h":28}}, boosts: [{"type":"def_boost_defender","value":19,"feature":"battleground"},{"type":"def_boost_defender","value":19,"feature":"guild_expedition"},{"type":"def_boost_defender","value":10,"feature":"guild_raids"},{"type":"guild_raids_coins_production","value":4,"feature":"all"},{"type":"guild_raids_supplies_production","value":4,"feature":"all"}] },
+    "W_MultiAge_CARE24C2": { prod: {"BronzeAge":{"population":-140,"happiness":1990,"money_24h":2220,"random_good_of_age_24h":81},"IronAge":{"population":-310,"happiness":3420,"money_24h":5340,"random_good_of_age_24h":81},"EarlyMiddleAge":{"population":-480,"happiness":3780,"money_24h":8900,"random_good_of_age_24h":81},"HighMiddleAge":{"population":-670,"happiness":4220,"money_24h":12460,"random_good_of_age_24h":81},"LateMiddleAge":{"population":-880,"happiness":4710,"money_24h":16460,"random_good_of_age_24h":81},"ColonialAge":{"population":-1110,"happiness":5540,"money_24h":25070,"random_good_of_age_24h":81},"IndustrialAge":{"population":-1350,"happiness":6240,"money_24h":31230,"random_good_of_age_24h":81},"ProgressiveEra":{"population":-1610,"happiness":6860,"money_24h":37900,"random_good_of_age_24h":81},"ModernEra":{"population":-1890,"happiness":7340,"money_24h":47160,"random_good_of_age_24h":81},"PostModernEra":{"population":-2180,"happiness":7640,"money_24h":59330,"random_good_of_age_24h":81},"ContemporaryEra":{"population":-2490,"happiness":8880,"money_24h":77230,"random_good_of_age_24h":81},"TomorrowEra":{"population":-2800,"happiness":10780,"money_24h":89420,"random_good_of_age_24h":81},"FutureEra":{"population":-3130,"happiness":12920,"money_24h":102500,"random_good_of_age_24h":81},"ArcticFuture":{"population":-3480,"happiness":15040,"money_24h":116470,"random_good_of_age_24h":81},"OceanicFuture":{"population":-3830,"happiness":17360,"money_24h":131330,"random_good_of_age_24h":81},"VirtualFuture":{"population":-4190,"happiness":20730,"money_24h":147100,"random_good_of_age_24h":81},"SpaceAgeMars":{"population":-6640,"happiness":33180,"money_24h":245710,"random_good_of_age_24h":81},"SpaceAgeAsteroidBelt":{"population":-7210,"happiness":36050,"money_24h":272160,"random_good_of_age_24h":81},"SpaceAgeVenus":{"population":-7790,"happiness":38950,"money_24h":300010,"random_good_of_age_24h":81},"SpaceAgeJupiterMoon":{"population":-8390,"happiness":41960,"money_24h":329280,"random_good_of_age_24h":81},"SpaceAgeTitan":{"population":-9000,"happiness":45000,"money_24h":360000,"random_good_of_age_24h":81},"SpaceAgeSpaceHub":{"population":-9610,"happiness":48040,"money_24h":390720,"random_good_of_age_24h":81}}, boosts: [{"type":"att_def_boost_attacker","value":35,"feature":"battleground"},{"type":"att_boost_defender","value":48,"feature":"guild_expedition"}] },
+    "W_MultiAge_CARE24B1": { prod: {"BronzeAge":{"population":-140,"happiness":990,"supplies_24h":1340,"strategy_points_24h":18},"IronAge":{"population":-310,"happiness":1710,"supplies_24h":3200,"strategy_points_24h":18},"EarlyMiddleAge":{"population":-480,"happiness":1890,"supplies_24h":5340,"strategy_points_24h":18},"HighMiddleAge":{"population":-670,"happiness":2110,"supplies_24h":7480,"strategy_points_24h":18},"LateMiddleAge":{"population":-880,"happiness":2350,"supplies_24h":9880,"strategy_points_24h":18},"ColonialAge":{"population":-1110,"happiness":2770,"supplies_24h":12550,"strategy_points_24h":18},"IndustrialAge":{"population":-1350,"happiness":3120,"supplies_24h":15220,"strategy_points_24h":18},"ProgressiveEra":{"population":-1620,"happiness":3430,"supplies_24h":17890,"strategy_points_24h":18},"ModernEra":{"population":-1890,"happiness":3670,"supplies_24h":20830,"strategy_points_24h":18},"PostModernEra":{"population":-2180,"happiness":3820,"supplies_24h":23770,"strategy_points_24h":18},"ContemporaryEra":{"population":-2490,"happiness":4440,"supplies_24h":26710,"strategy_points_24h":18},"TomorrowEra":{"population":-2800,"happiness":5390,"supplies_24h":29910,"strategy_points_24h":18},"FutureEra":{"population":-3130,"happiness":6460,"supplies_24h":32850,"strategy_points_24h":18},"ArcticFuture":{"population":-3480,"happiness":7520,"supplies_24h":36050,"strategy_points_24h":18},"OceanicFuture":{"population":-3830,"happiness":8680,"supplies_24h":39520,"strategy_points_24h":18},"VirtualFuture":{"population":-4190,"happiness":10370,"supplies_24h":42730,"strategy_points_24h":18},"SpaceAgeMars":{"population":-6640,"happiness":16590,"supplies_24h":69170,"strategy_points_24h":18},"SpaceAgeAsteroidBelt":{"population":-7210,"happiness":18030,"supplies_24h":74240,"strategy_points_24h":18},"SpaceAgeVenus":{"population":-7790,"happiness":19480,"supplies_24h":79580,"strategy_points_24h":18},"SpaceAgeJupiterMoon":{"population":-8390,"happiness":20980,"supplies_24h":84660,"strategy_points_24h":18},"SpaceAgeTitan":{"population":-9000,"happiness":22500,"supplies_24h":90000,"strategy_points_24h":18},"SpaceAgeSpaceHub":{"population":-9610,"happiness":24020,"supplies_24h":95340,"strategy_points_24h":18}}, boosts: [{"type":"att_boost_attacker","value":32,"feature":"battleground"},{"type":"att_def_boost_defender","value":24,"feature":"guild_expedition"}] },
+    "W_MultiAge_CARE25B1": { prod: {"BronzeAge":{"population":-240,"money_24h":910,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"IronAge":{"population":-520,"money_24h":2190,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"EarlyMiddleAge":{"population":-790,"money_24h":3640,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"HighMiddleAge":{"population":-1110,"money_24h":5100,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"LateMiddleAge":{"population":-1460,"money_24h":6740,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"ColonialAge":{"population":-1840,"money_24h":10270,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"IndustrialAge":{"population":-2250,"money_24h":12790,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"ProgressiveEra":{"population":-2690,"money_24h":15520,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"ModernEra":{"population":-3150,"money_24h":19310,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"PostModernEra":{"population":-3630,"money_24h":24290,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"ContemporaryEra":{"population":-4140,"money_24h":31630,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"TomorrowEra":{"population":-4670,"money_24h":36620,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"FutureEra":{"population":-5220,"money_24h":41970,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"ArcticFuture":{"population":-5790,"money_24h":47690,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"OceanicFuture":{"population":-6380,"money_24h":53780,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"VirtualFuture":{"population":-6980,"money_24h":60240,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"SpaceAgeMars":{"population":-11050,"money_24h":100620,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"SpaceAgeAsteroidBelt":{"population":-12000,"money_24h":111450,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"SpaceAgeVenus":{"population":-12970,"money_24h":122850,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"SpaceAgeJupiterMoon":{"population":-13970,"money_24h":134840,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"SpaceAgeTitan":{"population":-14980,"money_24h":147420,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35},"SpaceAgeSpaceHub":{"population":-16000,"money_24h":160000,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":35}}, boosts: [{"type":"att_boost_attacker","value":28,"feature":"guild_expedition"},{"type":"att_boost_defender","value":28,"feature":"guild_expedition"}] },
+    "W_MultiAge_CARE24E1": { prod: {"AllAge":{"all_goods_of_age_24h":140,"strategy_points_24h":125},"BronzeAge":{"population":1400,"happiness":2010,"demandHappiness":1400},"IronAge":{"population":3020,"happiness":4310,"demandHappiness":3020},"EarlyMiddleAge":{"population":4630,"happiness":6610,"demandHappiness":4630},"HighMiddleAge":{"population":6500,"happiness":9280,"demandHappiness":6500},"LateMiddleAge":{"population":8530,"happiness":12180,"demandHappiness":8530},"ColonialAge":{"population":10760,"happiness":15370,"demandHappiness":10760},"IndustrialAge":{"population":13150,"happiness":18790,"demandHappiness":13150},"ProgressiveEra":{"population":15700,"happiness":22430,"demandHappiness":15700},"ModernEra":{"population":18400,"happiness":26290,"demandHappiness":18400},"PostModernEra":{"population":21210,"happiness":30300,"demandHappiness":21210},"ContemporaryEra":{"population":24180,"happiness":34540,"demandHappiness":24180},"TomorrowEra":{"population":27240,"happiness":38920,"demandHappiness":27240},"FutureEra":{"population":30470,"happiness":43520,"demandHappiness":30470},"ArcticFuture":{"population":33790,"happiness":48280,"demandHappiness":33790},"OceanicFuture":{"population":37230,"happiness":53180,"demandHappiness":37230},"VirtualFuture":{"population":40760,"happiness":58230,"demandHappiness":40760},"SpaceAgeMars":{"population":64520,"happiness":92170,"demandHappiness":64520},"SpaceAgeAsteroidBelt":{"population":70080,"happiness":100120,"demandHappiness":70080},"SpaceAgeVenus":{"population":75750,"happiness":108210,"demandHappiness":75750},"SpaceAgeJupiterMoon":{"population":81570,"happiness":116530,"demandHappiness":81570},"SpaceAgeTitan":{"population":87500,"happiness":125000,"demandHappiness":87500},"SpaceAgeSpaceHub":{"population":93430,"happiness":133470,"demandHappiness":93430}}, boosts: [{"type":"def_boost_attacker","value":200,"feature":"battleground"},{"type":"def_boost_attacker","value":300,"feature":"guild_expedition"},{"type":"att_def_boost_attacker","value":5,"feature":"guild_raids"},{"type":"def_boost_defender","value":300,"feature":"battleground"},{"type":"def_boost_defender","value":200,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":5,"feature":"guild_raids"}] },
+    "W_MultiAge_CARE25C1": { prod: {"BronzeAge":{"population":-60,"supplies_24h":280,"strategy_points_24h":14},"IronAge":{"population":-130,"supplies_24h":670,"strategy_points_24h":14},"EarlyMiddleAge":{"population":-200,"supplies_24h":1120,"strategy_points_24h":14},"HighMiddleAge":{"population":-280,"supplies_24h":1570,"strategy_points_24h":14},"LateMiddleAge":{"population":-370,"supplies_24h":2070,"strategy_points_24h":14},"ColonialAge":{"population":-460,"supplies_24h":2630,"strategy_points_24h":14},"IndustrialAge":{"population":-560,"supplies_24h":3190,"strategy_points_24h":14},"ProgressiveEra":{"population":-670,"supplies_24h":3750,"strategy_points_24h":14},"ModernEra":{"population":-790,"supplies_24h":4370,"strategy_points_24h":14},"PostModernEra":{"population":-910,"supplies_24h":4990,"strategy_points_24h":14},"ContemporaryEra":{"population":-1040,"supplies_24h":5600,"strategy_points_24h":14},"TomorrowEra":{"population":-1170,"supplies_24h":6270,"strategy_points_24h":14},"FutureEra":{"population":-1300,"supplies_24h":6890,"strategy_points_24h":14},"ArcticFuture":{"population":-1450,"supplies_24h":7560,"strategy_points_24h":14},"OceanicFuture":{"population":-1590,"supplies_24h":8290,"strategy_points_24h":14},"VirtualFuture":{"population":-1750,"supplies_24h":8960,"strategy_points_24h":14},"SpaceAgeMars":{"population":-2760,"supplies_24h":14510,"strategy_points_24h":14},"SpaceAgeAsteroidBelt":{"population":-3000,"supplies_24h":15570,"strategy_points_24h":14},"SpaceAgeVenus":{"population":-3240,"supplies_24h":16690,"strategy_points_24h":14},"SpaceAgeJupiterMoon":{"population":-3490,"supplies_24h":17760,"strategy_points_24h":14},"SpaceAgeTitan":{"population":-3750,"supplies_24h":18880,"strategy_points_24h":14},"SpaceAgeSpaceHub":{"population":-4000,"supplies_24h":20000,"strategy_points_24h":14}}, boosts: [{"type":"def_boost_defender","value":9,"feature":"battleground"},{"type":"def_boost_defender","value":9,"feature":"guild_expedition"}] },
+    "W_MultiAge_CARE24C1": { prod: {"BronzeAge":{"population":-140,"happiness":990,"money_24h":1110,"random_good_of_age_24h":54},"IronAge":{"population":-310,"happiness":1710,"money_24h":2670,"random_good_of_age_24h":54},"EarlyMiddleAge":{"population":-480,"happiness":1890,"money_24h":4450,"random_good_of_age_24h":54},"HighMiddleAge":{"population":-670,"happiness":2110,"money_24h":6230,"random_good_of_age_24h":54},"LateMiddleAge":{"population":-880,"happiness":2350,"money_24h":8230,"random_good_of_age_24h":54},"ColonialAge":{"population":-1110,"happiness":2770,"money_24h":12530,"random_good_of_age_24h":54},"IndustrialAge":{"population":-1350,"happiness":3120,"money_24h":15620,"random_good_of_age_24h":54},"ProgressiveEra":{"population":-1610,"happiness":3430,"money_24h":18950,"random_good_of_age_24h":54},"ModernEra":{"population":-1890,"happiness":3670,"money_24h":23580,"random_good_of_age_24h":54},"PostModernEra":{"population":-2180,"happiness":3820,"money_24h":29660,"random_good_of_age_24h":54},"ContemporaryEra":{"population":-2490,"happiness":4440,"money_24h":38620,"random_good_of_age_24h":54},"TomorrowEra":{"population":-2800,"happiness":5390,"money_24h":44710,"random_good_of_age_24h":54},"FutureEra":{"population":-3130,"happiness":6460,"money_24h":51250,"random_good_of_age_24h":54},"ArcticFuture":{"population":-3480,"happiness":7520,"money_24h":58240,"random_good_of_age_24h":54},"OceanicFuture":{"population":-3830,"happiness":8680,"money_24h":65660,"random_good_of_age_24h":54},"VirtualFuture":{"population":-4190,"happiness":10370,"money_24h":73550,"random_good_of_age_24h":54},"SpaceAgeMars":{"population":-6640,"happiness":16590,"money_24h":122850,"random_good_of_age_24h":54},"SpaceAgeAsteroidBelt":{"population":-7210,"happiness":18030,"money_24h":136080,"random_good_of_age_24h":54},"SpaceAgeVenus":{"population":-7790,"happiness":19480,"money_24h":150000,"random_good_of_age_24h":54},"SpaceAgeJupiterMoon":{"population":-8390,"happiness":20980,"money_24h":164640,"random_good_of_age_24h":54},"SpaceAgeTitan":{"population":-9000,"happiness":22500,"money_24h":180000,"random_good_of_age_24h":54},"SpaceAgeSpaceHub":{"population":-9610,"happiness":24020,"money_24h":195360,"random_good_of_age_24h":54}}, boosts: [{"type":"att_def_boost_attacker","value":20,"feature":"battleground"},{"type":"att_boost_defender","value":32,"feature":"guild_expedition"}] },
+    "W_MultiAge_CARE24A10": { prod: {"BronzeAge":{"population":-810,"happiness":4130,"medals_24h":490,"strategy_points_24h":85,"random_good_of_next_age_24h":115,"units_24h":30},"IronAge":{"population":-1740,"happiness":7120,"medals_24h":630,"strategy_points_24h":88,"random_good_of_next_age_24h":120,"units_24h":30},"EarlyMiddleAge":{"population":-2670,"happiness":7880,"medals_24h":770,"strategy_points_24h":91,"random_good_of_next_age_24h":125,"units_24h":30},"HighMiddleAge":{"population":-3760,"happiness":8790,"medals_24h":910,"strategy_points_24h":94,"random_good_of_next_age_24h":130,"units_24h":30},"LateMiddleAge":{"population":-4930,"happiness":9800,"medals_24h":1050,"strategy_points_24h":97,"random_good_of_next_age_24h":135,"units_24h":30},"ColonialAge":{"population":-6220,"happiness":11520,"medals_24h":1270,"strategy_points_24h":100,"random_good_of_next_age_24h":140,"units_24h":30},"IndustrialAge":{"population":-7600,"happiness":13000,"medals_24h":1760,"strategy_points_24h":103,"random_good_of_next_age_24h":145,"units_24h":30},"ProgressiveEra":{"population":-9080,"happiness":14270,"medals_24h":2460,"strategy_points_24h":106,"random_good_of_next_age_24h":150,"units_24h":30},"ModernEra":{"population":-10640,"happiness":15270,"medals_24h":3520,"strategy_points_24h":109,"random_good_of_next_age_24h":155,"units_24h":30},"PostModernEra":{"population":-12260,"happiness":15910,"medals_24h":4920,"strategy_points_24h":112,"random_good_of_next_age_24h":160,"units_24h":30},"ContemporaryEra":{"population":-13970,"happiness":18490,"medals_24h":7030,"strategy_points_24h":115,"random_good_of_next_age_24h":165,"units_24h":30},"TomorrowEra":{"population":-15750,"happiness":22440,"medals_24h":9490,"strategy_points_24h":118,"random_good_of_next_age_24h":170,"units_24h":30},"FutureEra":{"population":-17610,"happiness":26890,"medals_24h":11600,"strategy_points_24h":121,"random_good_of_next_age_24h":175,"units_24h":30},"ArcticFuture":{"population":-19530,"happiness":31310,"medals_24h":14060,"strategy_points_24h":124,"random_good_of_next_age_24h":180,"units_24h":30},"OceanicFuture":{"population":-21520,"happiness":36130,"medals_24h":16170,"strategy_points_24h":127,"random_good_of_next_age_24h":185,"units_24h":30},"VirtualFuture":{"population":-23560,"happiness":43160,"medals_24h":19690,"strategy_points_24h":130,"random_good_of_next_age_24h":190,"units_24h":30},"SpaceAgeMars":{"population":-37290,"happiness":69060,"medals_24h":23910,"strategy_points_24h":133,"random_good_of_next_age_24h":195,"units_24h":30},"SpaceAgeAsteroidBelt":{"population":-40510,"happiness":75050,"medals_24h":28130,"strategy_points_24h":136,"random_good_of_next_age_24h":200,"units_24h":30},"SpaceAgeVenus":{"population":-43780,"happiness":81080,"medals_24h":32340,"strategy_points_24h":139,"random_good_of_next_age_24h":205,"units_24h":30},"SpaceAgeJupiterMoon":{"population":-47150,"happiness":87340,"medals_24h":36560,"strategy_points_24h":142,"random_good_of_next_age_24h":210,"units_24h":30},"SpaceAgeTitan":{"population":-50570,"happiness":93670,"medals_24h":40780,"strategy_points_24h":145,"random_good_of_next_age_24h":215,"units_24h":30},"SpaceAgeSpaceHub":{"population":-54000,"happiness":100000,"medals_24h":45000,"strategy_points_24h":148,"random_good_of_next_age_24h":220,"units_24h":30}}, boosts: [{"type":"forge_points_production","value":3,"feature":"all"}] },
+    "W_MultiAge_CARE24A11": { prod: {"BronzeAge":{"population":-1280,"happiness":8270,"medals_24h":980,"random_good_of_next_age_24h":230,"units_24h":60},"IronAge":{"population":-2740,"happiness":14250,"medals_24h":1270,"random_good_of_next_age_24h":240,"units_24h":60},"EarlyMiddleAge":{"population":-4210,"happiness":15750,"medals_24h":1550,"random_good_of_next_age_24h":250,"units_24h":60},"HighMiddleAge":{"population":-5910,"happiness":17580,"medals_24h":1830,"random_good_of_next_age_24h":260,"units_24h":60},"LateMiddleAge":{"population":-7760,"happiness":19600,"medals_24h":2110,"random_good_of_next_age_24h":270,"units_24h":60},"ColonialAge":{"population":-9790,"happiness":23050,"medals_24h":2530,"random_good_of_next_age_24h":280,"units_24h":60},"IndustrialAge":{"population":-11970,"happiness":25990,"medals_24h":3520,"random_good_of_next_age_24h":290,"units_24h":60},"ProgressiveEra":{"population":-14280,"happiness":28540,"medals_24h":4920,"random_good_of_next_age_24h":300,"units_24h":60},"ModernEra":{"population":-16740,"happiness":30540,"medals_24h":7030,"random_good_of_next_age_24h":310,"units_24h":60},"PostModernEra":{"population":-19300,"happiness":31820,"medals_24h":9840,"random_good_of_next_age_24h":320,"units_24h":60},"ContemporaryEra":{"population":-21990,"happiness":36970,"medals_24h":14060,"random_good_of_next_age_24h":330,"units_24h":60},"TomorrowEra":{"population":-24790,"happiness":44880,"medals_24h":18980,"random_good_of_next_age_24h":340,"units_24h":60},"FutureEra":{"population":-27720,"happiness":53770,"medals_24h":23200,"random_good_of_next_age_24h":350,"units_24h":60},"ArcticFuture":{"population":-30750,"happiness":62610,"medals_24h":28130,"random_good_of_next_age_24h":360,"units_24h":60},"OceanicFuture":{"population":-33870,"happiness":72260,"medals_24h":32340,"random_good_of_next_age_24h":370,"units_24h":60},"VirtualFuture":{"population":-37080,"happiness":86320,"medals_24h":39380,"random_good_of_next_age_24h":380,"units_24h":60},"SpaceAgeMars":{"population":-58700,"happiness":138120,"medals_24h":47810,"random_good_of_next_age_24h":390,"units_24h":60},"SpaceAgeAsteroidBelt":{"population":-63760,"happiness":150100,"medals_24h":56250,"random_good_of_next_age_24h":400,"units_24h":60},"SpaceAgeVenus":{"population":-68920,"happiness":162160,"medals_24h":64690,"random_good_of_next_age_24h":410,"units_24h":60},"SpaceAgeJupiterMoon":{"population":-74220,"happiness":174690,"medals_24h":73130,"random_good_of_next_age_24h":420,"units_24h":60},"SpaceAgeTitan":{"population":-79610,"happiness":187340,"medals_24h":81560,"random_good_of_next_age_24h":430,"units_24h":60},"SpaceAgeSpaceHub":{"population":-85000,"happiness":200000,"medals_24h":90000,"random_good_of_next_age_24h":440,"units_24h":60}}, boosts: [{"type":"forge_points_production","value":9,"feature":"all"}] },
+    "W_MultiAge_CARE24A8": { prod: {"BronzeAge":{"population":-280,"happiness":3610,"medals_24h":420,"strategy_points_24h":65,"random_good_of_next_age_24h":95,"units_24h":20},"IronAge":{"population":-600,"happiness":6230,"medals_24h":540,"strategy_points_24h":68,"random_good_of_next_age_24h":100,"units_24h":20},"EarlyMiddleAge":{"population":-930,"happiness":6890,"medals_24h":670,"strategy_points_24h":71,"random_good_of_next_age_24h":105,"units_24h":20},"HighMiddleAge":{"population":-1300,"happiness":7680,"medals_24h":790,"strategy_points_24h":74,"random_good_of_next_age_24h":110,"units_24h":20},"LateMiddleAge":{"population":-1710,"happiness":8570,"medals_24h":910,"strategy_points_24h":77,"random_good_of_next_age_24h":115,"units_24h":20},"ColonialAge":{"population":-2160,"happiness":10080,"medals_24h":1090,"strategy_points_24h":80,"random_good_of_next_age_24h":120,"units_24h":20},"IndustrialAge":{"population":-2640,"happiness":11360,"medals_24h":1510,"strategy_points_24h":83,"random_good_of_next_age_24h":125,"units_24h":20},"ProgressiveEra":{"population":-3150,"happiness":12480,"medals_24h":2120,"strategy_points_24h":86,"random_good_of_next_age_24h":130,"units_24h":20},"ModernEra":{"population":-3690,"happiness":13350,"medals_24h":3030,"strategy_points_24h":89,"random_good_of_next_age_24h":135,"units_24h":20},"PostModernEra":{"population":-4250,"happiness":13910,"medals_24h":4240,"strategy_points_24h":92,"random_good_of_next_age_24h":140,"units_24h":20},"ContemporaryEra":{"population":-4850,"happiness":16160,"medals_24h":6050,"strategy_points_24h":95,"random_good_of_next_age_24h":145,"units_24h":20},"TomorrowEra":{"population":-5460,"happiness":19620,"medals_24h":8170,"strategy_points_24h":98,"random_good_of_next_age_24h":150,"units_24h":20},"FutureEra":{"population":-6110,"happiness":23510,"medals_24h":9990,"strategy_points_24h":101,"random_good_of_next_age_24h":155,"units_24h":20},"ArcticFuture":{"population":-6780,"happiness":27370,"medals_24h":12100,"strategy_points_24h":104,"random_good_of_next_age_24h":160,"units_24h":20},"OceanicFuture":{"population":-7470,"happiness":31590,"medals_24h":13920,"strategy_points_24h":107,"random_good_of_next_age_24h":165,"units_24h":20},"VirtualFuture":{"population":-8180,"happiness":37740,"medals_24h":16940,"strategy_points_24h":110,"random_good_of_next_age_24h":170,"units_24h":20},"SpaceAgeMars":{"population":-12940,"happiness":60380,"medals_24h":20580,"strategy_points_24h":113,"random_good_of_next_age_24h":175,"units_24h":20},"SpaceAgeAsteroidBelt":{"population":-14060,"happiness":65620,"medals_24h":24210,"strategy_points_24h":116,"random_good_of_next_age_24h":180,"units_24h":20},"SpaceAgeVenus":{"population":-15190,"happiness":70890,"medals_24h":27840,"strategy_points_24h":119,"random_good_of_next_age_24h":185,"units_24h":20},"SpaceAgeJupiterMoon":{"population":-16360,"happiness":76370,"medals_24h":31470,"strategy_points_24h":122,"random_good_of_next_age_24h":190,"units_24h":20},"SpaceAgeTitan":{"population":-17550,"happiness":81900,"medals_24h":35100,"strategy_points_24h":125,"random_good_of_next_age_24h":195,"units_24h":20},"SpaceAgeSpaceHub":{"population":-18740,"happiness":87430,"medals_24h":38730,"strategy_points_24h":128,"random_good_of_next_age_24h":200,"units_24h":20}}, boosts: [{"type":"forge_points_production","value":1,"feature":"all"}] },
+    "W_MultiAge_CARE24A1": { prod: {"BronzeAge":{"population":-60,"happiness":1200,"medals_24h":90,"strategy_points_24h":3,"random_good_of_next_age_24h":3},"IronAge":{"population":-130,"happiness":2080,"medals_24h":120,"strategy_points_24h":6,"random_good_of_next_age_24h":8},"EarlyMiddleAge":{"population":-210,"happiness":2300,"medals_24h":150,"strategy_points_24h":9,"random_good_of_next_age_24h":13},"HighMiddleAge":{"population":-290,"happiness":2560,"medals_24h":170,"strategy_points_24h":12,"random_good_of_next_age_24h":18},"LateMiddleAge":{"population":-380,"happiness":2860,"medals_24h":200,"strategy_points_24h":15,"random_good_of_next_age_24h":23},"ColonialAge":{"population":-480,"happiness":3360,"medals_24h":240,"strategy_points_24h":18,"random_good_of_next_age_24h":28},"IndustrialAge":{"population":-590,"happiness":3790,"medals_24h":340,"strategy_points_24h":21,"random_good_of_next_age_24h":33},"ProgressiveEra":{"population":-700,"happiness":4160,"medals_24h":470,"strategy_points_24h":24,"random_good_of_next_age_24h":38},"ModernEra":{"population":-820,"happiness":4450,"medals_24h":670,"strategy_points_24h":27,"random_good_of_next_age_24h":43},"PostModernEra":{"population":-950,"happiness":4640,"medals_24h":940,"strategy_points_24h":30,"random_good_of_next_age_24h":48},"ContemporaryEra":{"population":-1080,"happiness":5390,"medals_24h":1340,"strategy_points_24h":33,"random_good_of_next_age_24h":53},"TomorrowEra":{"population":-1210,"happiness":6540,"medals_24h":1820,"strategy_points_24h":36,"random_good_of_next_age_24h":58},"FutureEra":{"population":-1360,"happiness":7840,"medals_24h":2220,"strategy_points_24h":39,"random_good_of_next_age_24h":63},"ArcticFuture":{"population":-1510,"happiness":9120,"medals_24h":2690,"strategy_points_24h":42,"random_good_of_next_age_24h":68},"OceanicFuture":{"population":-1660,"happiness":10530,"medals_24h":3090,"strategy_points_24h":45,"random_good_of_next_age_24h":73},"VirtualFuture":{"population":-1820,"happiness":12580,"medals_24h":3770,"strategy_points_24h":48,"random_good_of_next_age_24h":78},"SpaceAgeMars":{"population":-2880,"happiness":20130,"medals_24h":4570,"strategy_points_24h":51,"random_good_of_next_age_24h":83},"SpaceAgeAsteroidBelt":{"population":-3120,"happiness":21870,"medals_24h":5380,"strategy_points_24h":54,"random_good_of_next_age_24h":88},"SpaceAgeVenus":{"population":-3380,"happiness":23630,"medals_24h":6190,"strategy_points_24h":57,"random_good_of_next_age_24h":93},"SpaceAgeJupiterMoon":{"population":-3640,"happiness":25460,"medals_24h":6990,"strategy_points_24h":60,"random_good_of_next_age_24h":98},"SpaceAgeTitan":{"population":-3900,"happiness":27300,"medals_24h":7800,"strategy_points_24h":63,"random_good_of_next_age_24h":103},"SpaceAgeSpaceHub":{"population":-4160,"happiness":29140,"medals_24h":8610,"strategy_points_24h":66,"random_good_of_next_age_24h":108}} },
+    "W_MultiAge_CARE24A2": { prod: {"BronzeAge":{"population":-90,"happiness":1550,"medals_24h":140,"strategy_points_24h":10,"random_good_of_next_age_24h":15},"IronAge":{"population":-200,"happiness":2670,"medals_24h":180,"strategy_points_24h":13,"random_good_of_next_age_24h":20},"EarlyMiddleAge":{"population":-310,"happiness":2950,"medals_24h":220,"strategy_points_24h":16,"random_good_of_next_age_24h":25},"HighMiddleAge":{"population":-430,"happiness":3290,"medals_24h":260,"strategy_points_24h":19,"random_good_of_next_age_24h":30},"LateMiddleAge":{"population":-570,"happiness":3670,"medals_24h":300,"strategy_points_24h":22,"random_good_of_next_age_24h":35},"ColonialAge":{"population":-720,"happiness":4320,"medals_24h":360,"strategy_points_24h":25,"random_good_of_next_age_24h":40},"IndustrialAge":{"population":-880,"happiness":4870,"medals_24h":500,"strategy_points_24h":28,"random_good_of_next_age_24h":45},"ProgressiveEra":{"population":-1050,"happiness":5350,"medals_24h":710,"strategy_points_24h":31,"random_good_of_next_age_24h":50},"ModernEra":{"population":-1230,"happiness":5720,"medals_24h":1010,"strategy_points_24h":34,"random_good_of_next_age_24h":55},"PostModernEra":{"population":-1420,"happiness":5960,"medals_24h":1410,"strategy_points_24h":37,"random_good_of_next_age_24h":60},"ContemporaryEra":{"population":-1620,"happiness":6930,"medals_24h":2020,"strategy_points_24h":40,"random_good_of_next_age_24h":65},"TomorrowEra":{"population":-1820,"happiness":8410,"medals_24h":2720,"strategy_points_24h":43,"random_good_of_next_age_24h":70},"FutureEra":{"population":-2040,"happiness":10070,"medals_24h":3330,"strategy_points_24h":46,"random_good_of_next_age_24h":75},"ArcticFuture":{"population":-2260,"happiness":11730,"medals_24h":4030,"strategy_points_24h":49,"random_good_of_next_age_24h":80},"OceanicFuture":{"population":-2490,"happiness":13540,"medals_24h":4640,"strategy_points_24h":52,"random_good_of_next_age_24h":85},"VirtualFuture":{"population":-2730,"happiness":16170,"medals_24h":5650,"strategy_points_24h":55,"random_good_of_next_age_24h":90},"SpaceAgeMars":{"population":-4310,"happiness":25880,"medals_24h":6860,"strategy_points_24h":58,"random_good_of_next_age_24h":95},"SpaceAgeAsteroidBelt":{"population":-4690,"happiness":28120,"medals_24h":8070,"strategy_points_24h":61,"random_good_of_next_age_24h":100},"SpaceAgeVenus":{"population":-5060,"happiness":30380,"medals_24h":9280,"strategy_points_24h":64,"random_good_of_next_age_24h":105},"SpaceAgeJupiterMoon":{"population":-5450,"happiness":32730,"medals_24h":10490,"strategy_points_24h":67,"random_good_of_next_age_24h":110},"SpaceAgeTitan":{"population":-5850,"happiness":35100,"medals_24h":11700,"strategy_points_24h":70,"random_good_of_next_age_24h":115},"SpaceAgeSpaceHub":{"population":-6250,"happiness":37470,"medals_24h":12910,"strategy_points_24h":73,"random_good_of_next_age_24h":120}} },
+    "W_MultiAge_CARE24A3": { prod: {"BronzeAge":{"population":-130,"happiness":1890,"medals_24h":190,"strategy_points_24h":17,"random_good_of_next_age_24h":27},"IronAge":{"population":-270,"happiness":3260,"medals_24h":240,"strategy_points_24h":20,"random_good_of_next_age_24h":32},"EarlyMiddleAge":{"population":-410,"happiness":3610,"medals_24h":300,"strategy_points_24h":23,"random_good_of_next_age_24h":37},"HighMiddleAge":{"population":-580,"happiness":4020,"medals_24h":350,"strategy_points_24h":26,"random_good_of_next_age_24h":42},"LateMiddleAge":{"population":-760,"happiness":4490,"medals_24h":400,"strategy_points_24h":29,"random_good_of_next_age_24h":47},"ColonialAge":{"population":-960,"happiness":5280,"medals_24h":480,"strategy_points_24h":32,"random_good_of_next_age_24h":52},"IndustrialAge":{"population":-1170,"happiness":5950,"medals_24h":670,"strategy_points_24h":35,"random_good_of_next_age_24h":57},"ProgressiveEra":{"population":-1400,"happiness":6540,"medals_24h":940,"strategy_points_24h":38,"random_good_of_next_age_24h":62},"ModernEra":{"population":-1640,"happiness":6990,"medals_24h":1340,"strategy_points_24h":41,"random_good_of_next_age_24h":67},"PostModernEra":{"population":-1890,"happiness":7290,"medals_24h":1880,"strategy_points_24h":44,"random_good_of_next_age_24h":72},"ContemporaryEra":{"population":-2160,"happiness":8470,"medals_24h":2690,"strategy_points_24h":47,"random_good_of_next_age_24h":77},"TomorrowEra":{"population":-2430,"happiness":10280,"medals_24h":3630,"strategy_points_24h":50,"random_good_of_next_age_24h":82},"FutureEra":{"population":-2720,"happiness":12310,"medals_24h":4440,"strategy_points_24h":53,"random_good_of_next_age_24h":87},"ArcticFuture":{"population":-3010,"happiness":14340,"medals_24h":5380,"strategy_points_24h":56,"random_good_of_next_age_24h":92},"OceanicFuture":{"population":-3320,"happiness":16550,"medals_24h":6190,"strategy_points_24h":59,"random_good_of_next_age_24h":97},"VirtualFuture":{"population":-3630,"happiness":19770,"medals_24h":7530,"strategy_points_24h":62,"random_good_of_next_age_24h":102},"SpaceAgeMars":{"population":-5750,"happiness":31630,"medals_24h":9140,"strategy_points_24h":65,"random_good_of_next_age_24h":107},"SpaceAgeAsteroidBelt":{"population":-6250,"happiness":34370,"medals_24h":10760,"strategy_points_24h":68,"random_good_of_next_age_24h":112},"SpaceAgeVenus":{"population":-6750,"happiness":37130,"medals_24h":12370,"strategy_points_24h":71,"random_good_of_next_age_24h":117},"SpaceAgeJupiterMoon":{"population":-7270,"happiness":40000,"medals_24h":13990,"strategy_points_24h":74,"random_good_of_next_age_24h":122},"SpaceAgeTitan":{"population":-7800,"happiness":42900,"medals_24h":15600,"strategy_points_24h":77,"random_good_of_next_age_24h":127},"SpaceAgeSpaceHub":{"population":-8330,"happiness":45800,"medals_24h":17210,"strategy_points_24h":80,"random_good_of_next_age_24h":132}} },
+    "W_MultiAge_CARE24A4": { prod: {"BronzeAge":{"population":-160,"happiness":2240,"medals_24h":240,"strategy_points_24h":24,"random_good_of_next_age_24h":39},"IronAge":{"population":-340,"happiness":3860,"medals_24h":300,"strategy_points_24h":27,"random_good_of_next_age_24h":44},"EarlyMiddleAge":{"population":-520,"happiness":4260,"medals_24h":370,"strategy_points_24h":30,"random_good_of_next_age_24h":49},"HighMiddleAge":{"population":-720,"happiness":4760,"medals_24h":440,"strategy_points_24h":33,"random_good_of_next_age_24h":54},"LateMiddleAge":{"population":-950,"happiness":5310,"medals_24h":500,"strategy_points_24h":36,"random_good_of_next_age_24h":59},"ColonialAge":{"population":-1200,"happiness":6240,"medals_24h":610,"strategy_points_24h":39,"random_good_of_next_age_24h":64},"IndustrialAge":{"population":-1470,"happiness":7030,"medals_24h":840,"strategy_points_24h":42,"random_good_of_next_age_24h":69},"ProgressiveEra":{"population":-1750,"happiness":7720,"medals_24h":1180,"strategy_points_24h":45,"random_good_of_next_age_24h":74},"ModernEra":{"population":-2050,"happiness":8260,"medals_24h":1680,"strategy_points_24h":48,"random_good_of_next_age_24h":79},"PostModernEra":{"population":-2360,"happiness":8610,"medals_24h":2350,"strategy_points_24h":51,"random_good_of_next_age_24h":84},"ContemporaryEra":{"population":-2690,"happiness":10010,"medals_24h":3360,"strategy_points_24h":54,"random_good_of_next_age_24h":89},"TomorrowEra":{"population":-3040,"happiness":12150,"medals_24h":4540,"strategy_points_24h":57,"random_good_of_next_age_24h":94},"FutureEra":{"population":-3390,"happiness":14550,"medals_24h":5550,"strategy_points_24h":60,"random_good_of_next_age_24h":99},"ArcticFuture":{"population":-3770,"happiness":16950,"medals_24h":6720,"strategy_points_24h":63,"random_good_of_next_age_24h":104},"OceanicFuture":{"population":-4150,"happiness":19550,"medals_24h":7730,"strategy_points_24h":66,"random_good_of_next_age_24h":109},"VirtualFuture":{"population":-4540,"happiness":23360,"medals_24h":9410,"strategy_points_24h":69,"random_good_of_next_age_24h":114},"SpaceAgeMars":{"population":-7190,"happiness":37380,"medals_24h":11430,"strategy_points_24h":72,"random_good_of_next_age_24h":119},"SpaceAgeAsteroidBelt":{"population":-7810,"happiness":40620,"medals_24h":13450,"strategy_points_24h":75,"random_good_of_next_age_24h":124},"SpaceAgeVenus":{"population":-8440,"happiness":43890,"medals_24h":15470,"strategy_points_24h":78,"random_good_of_next_age_24h":129},"SpaceAgeJupiterMoon":{"population":-9090,"happiness":47270,"medals_24h":17480,"strategy_points_24h":81,"random_good_of_next_age_24h":134},"SpaceAgeTitan":{"population":-9750,"happiness":50700,"medals_24h":19500,"strategy_points_24h":84,"random_good_of_next_age_24h":139},"SpaceAgeSpaceHub":{"population":-10410,"happiness":54130,"medals_24h":21520,"strategy_points_24h":87,"random_good_of_next_age_24h":144}} },
+    "W_MultiAge_CARE24A5": { prod: {"BronzeAge":{"population":-190,"happiness":2580,"medals_24h":280,"strategy_points_24h":31,"random_good_of_next_age_24h":51},"IronAge":{"population":-400,"happiness":4450,"medals_24h":360,"strategy_points_24h":34,"random_good_of_next_age_24h":56},"EarlyMiddleAge":{"population":-620,"happiness":4920,"medals_24h":440,"strategy_points_24h":37,"random_good_of_next_age_24h":61},"HighMiddleAge":{"population":-870,"happiness":5490,"medals_24h":520,"strategy_points_24h":40,"random_good_of_next_age_24h":66},"LateMiddleAge":{"population":-1140,"happiness":6120,"medals_24h":610,"strategy_points_24h":43,"random_good_of_next_age_24h":71},"ColonialAge":{"population":-1440,"happiness":7200,"medals_24h":730,"strategy_points_24h":46,"random_good_of_next_age_24h":76},"IndustrialAge":{"population":-1760,"happiness":8120,"medals_24h":1010,"strategy_points_24h":49,"random_good_of_next_age_24h":81},"ProgressiveEra":{"population":-2100,"happiness":8910,"medals_24h":1410,"strategy_points_24h":52,"random_good_of_next_age_24h":86},"ModernEra":{"population":-2460,"happiness":9540,"medals_24h":2020,"strategy_points_24h":55,"random_good_of_next_age_24h":91},"PostModernEra":{"population":-2840,"happiness":9940,"medals_24h":2820,"strategy_points_24h":58,"random_good_of_next_age_24h":96},"ContemporaryEra":{"population":-3230,"happiness":11550,"medals_24h":4030,"strategy_points_24h":61,"random_good_of_next_age_24h":101},"TomorrowEra":{"population":-3640,"happiness":14010,"medals_24h":5450,"strategy_points_24h":64,"random_good_of_next_age_24h":106},"FutureEra":{"population":-4070,"happiness":16790,"medals_24h":6660,"strategy_points_24h":67,"random_good_of_next_age_24h":111},"ArcticFuture":{"population":-4520,"happiness":19550,"medals_24h":8070,"strategy_points_24h":70,"random_good_of_next_age_24h":116},"OceanicFuture":{"population":-4980,"happiness":22560,"medals_24h":9280,"strategy_points_24h":73,"random_good_of_next_age_24h":121},"VirtualFuture":{"population":-5450,"happiness":26950,"medals_24h":11300,"strategy_points_24h":76,"random_good_of_next_age_24h":126},"SpaceAgeMars":{"population":-8630,"happiness":43130,"medals_24h":13720,"strategy_points_24h":79,"random_good_of_next_age_24h":131},"SpaceAgeAsteroidBelt":{"population":-9370,"happiness":46870,"medals_24h":16140,"strategy_points_24h":82,"random_good_of_next_age_24h":136},"SpaceAgeVenus":{"population":-10130,"happiness":50640,"medals_24h":18560,"strategy_points_24h":85,"random_good_of_next_age_24h":141},"SpaceAgeJupiterMoon":{"population":-10910,"happiness":54550,"medals_24h":20980,"strategy_points_24h":88,"random_good_of_next_age_24h":146},"SpaceAgeTitan":{"population":-11700,"happiness":58500,"medals_24h":23400,"strategy_points_24h":91,"random_good_of_next_age_24h":151},"SpaceAgeSpaceHub":{"population":-12490,"happiness":62450,"medals_24h":25820,"strategy_points_24h":94,"random_good_of_next_age_24h":156}} },
+    "W_MultiAge_CARE24A6": { prod: {"BronzeAge":{"population":-220,"happiness":2930,"medals_24h":330,"strategy_points_24h":38,"random_good_of_next_age_24h":63},"IronAge":{"population":-470,"happiness":5040,"medals_24h":420,"strategy_points_24h":41,"random_good_of_next_age_24h":68},"EarlyMiddleAge":{"population":-720,"happiness":5580,"medals_24h":520,"strategy_points_24h":44,"random_good_of_next_age_24h":73},"HighMiddleAge":{"population":-1010,"happiness":6220,"medals_24h":610,"strategy_points_24h":47,"random_good_of_next_age_24h":78},"LateMiddleAge":{"population":-1330,"happiness":6940,"medals_24h":710,"strategy_points_24h":50,"random_good_of_next_age_24h":83},"ColonialAge":{"population":-1680,"happiness":8160,"medals_24h":850,"strategy_points_24h":53,"random_good_of_next_age_24h":88},"IndustrialAge":{"population":-2050,"happiness":9200,"medals_24h":1180,"strategy_points_24h":56,"random_good_of_next_age_24h":93},"ProgressiveEra":{"population":-2450,"happiness":10100,"medals_24h":1650,"strategy_points_24h":59,"random_good_of_next_age_24h":98},"ModernEra":{"population":-2870,"happiness":10810,"medals_24h":2350,"strategy_points_24h":62,"random_good_of_next_age_24h":103},"PostModernEra":{"population":-3310,"happiness":11260,"medals_24h":3290,"strategy_points_24h":65,"random_good_of_next_age_24h":108},"ContemporaryEra":{"population":-3770,"happiness":13080,"medals_24h":4710,"strategy_points_24h":68,"random_good_of_next_age_24h":113},"TomorrowEra":{"population":-4250,"happiness":15880,"medals_24h":6350,"strategy_points_24h":71,"random_good_of_next_age_24h":118},"FutureEra":{"population":-4750,"happiness":19030,"medals_24h":7770,"strategy_points_24h":74,"random_good_of_next_age_24h":123},"ArcticFuture":{"population":-5270,"happiness":22160,"medals_24h":9410,"strategy_points_24h":77,"random_good_of_next_age_24h":128},"OceanicFuture":{"population":-5810,"happiness":25570,"medals_24h":10830,"strategy_points_24h":80,"random_good_of_next_age_24h":133},"VirtualFuture":{"population":-6360,"happiness":30550,"medals_24h":13180,"strategy_points_24h":83,"random_good_of_next_age_24h":138},"SpaceAgeMars":{"population":-10070,"happiness":48880,"medals_24h":16000,"strategy_points_24h":86,"random_good_of_next_age_24h":143},"SpaceAgeAsteroidBelt":{"population":-10930,"happiness":53120,"medals_24h":18830,"strategy_points_24h":89,"random_good_of_next_age_24h":148},"SpaceAgeVenus":{"population":-11820,"happiness":57390,"medals_24h":21650,"strategy_points_24h":92,"random_good_of_next_age_24h":153},"SpaceAgeJupiterMoon":{"population":-12730,"happiness":61820,"medals_24h":24480,"strategy_points_24h":95,"random_good_of_next_age_24h":158},"SpaceAgeTitan":{"population":-13650,"happiness":66300,"medals_24h":27300,"strategy_points_24h":98,"random_good_of_next_age_24h":163},"SpaceAgeSpaceHub":{"population":-14570,"happiness":70780,"medals_24h":30120,"strategy_points_24h":101,"random_good_of_next_age_24h":168}} },
+    "W_MultiAge_CARE24A7": { prod: {"BronzeAge":{"population":-250,"happiness":3270,"medals_24h":380,"strategy_points_24h":45,"random_good_of_next_age_24h":75,"units_24h":10},"IronAge":{"population":-540,"happiness":5630,"medals_24h":480,"strategy_points_24h":48,"random_good_of_next_age_24h":80,"units_24h":10},"EarlyMiddleAge":{"population":-820,"happiness":6230,"medals_24h":590,"strategy_points_24h":51,"random_good_of_next_age_24h":85,"units_24h":10},"HighMiddleAge":{"population":-1160,"happiness":6950,"medals_24h":700,"strategy_points_24h":54,"random_good_of_next_age_24h":90,"units_24h":10},"LateMiddleAge":{"population":-1520,"happiness":7750,"medals_24h":810,"strategy_points_24h":57,"random_good_of_next_age_24h":95,"units_24h":10},"ColonialAge":{"population":-1920,"happiness":9120,"medals_24h":970,"strategy_points_24h":60,"random_good_of_next_age_24h":100,"units_24h":10},"IndustrialAge":{"population":-2350,"happiness":10280,"medals_24h":1340,"strategy_points_24h":63,"random_good_of_next_age_24h":105,"units_24h":10},"ProgressiveEra":{"population":-2800,"happiness":11290,"medals_24h":1880,"strategy_points_24h":66,"random_good_of_next_age_24h":110,"units_24h":10},"ModernEra":{"population":-3280,"happiness":12080,"medals_24h":2690,"strategy_points_24h":69,"random_good_of_next_age_24h":115,"units_24h":10},"PostModernEra":{"population":-3780,"happiness":12580,"medals_24h":3770,"strategy_points_24h":72,"random_good_of_next_age_24h":120,"units_24h":10},"ContemporaryEra":{"population":-4310,"happiness":14620,"medals_24h":5380,"strategy_points_24h":75,"random_good_of_next_age_24h":125,"units_24h":10},"TomorrowEra":{"population":-4860,"happiness":17750,"medals_24h":7260,"strategy_points_24h":78,"random_good_of_next_age_24h":130,"units_24h":10},"FutureEra":{"population":-5430,"happiness":21270,"medals_24h":8880,"strategy_points_24h":81,"random_good_of_next_age_24h":135,"units_24h":10},"ArcticFuture":{"population":-6020,"happiness":24770,"medals_24h":10760,"strategy_points_24h":84,"random_good_of_next_age_24h":140,"units_24h":10},"OceanicFuture":{"population":-6640,"happiness":28580,"medals_24h":12370,"strategy_points_24h":87,"random_good_of_next_age_24h":145,"units_24h":10},"VirtualFuture":{"population":-7270,"happiness":34140,"medals_24h":15060,"strategy_points_24h":90,"random_good_of_next_age_24h":150,"units_24h":10},"SpaceAgeMars":{"population":-11500,"happiness":54630,"medals_24h":18290,"strategy_points_24h":93,"random_good_of_next_age_24h":155,"units_24h":10},"SpaceAgeAsteroidBelt":{"population":-12490,"happiness":59370,"medals_24h":21520,"strategy_points_24h":96,"random_good_of_next_age_24h":160,"units_24h":10},"SpaceAgeVenus":{"population":-13510,"happiness":64140,"medals_24h":24740,"strategy_points_24h":99,"random_good_of_next_age_24h":165,"units_24h":10},"SpaceAgeJupiterMoon":{"population":-14540,"happiness":69090,"medals_24h":27970,"strategy_points_24h":102,"random_good_of_next_age_24h":170,"units_24h":10},"SpaceAgeTitan":{"population":-15600,"happiness":74100,"medals_24h":31200,"strategy_points_24h":105,"random_good_of_next_age_24h":175,"units_24h":10},"SpaceAgeSpaceHub":{"population":-16660,"happiness":79110,"medals_24h":34430,"strategy_points_24h":108,"random_good_of_next_age_24h":180,"units_24h":10}}, boosts: [{"type":"forge_points_production","value":1,"feature":"all"}] },
+    "W_MultiAge_CARE24A9": { prod: {"BronzeAge":{"population":-310,"happiness":3960,"medals_24h":470,"strategy_points_24h":85,"random_good_of_next_age_24h":115,"units_24h":30},"IronAge":{"population":-670,"happiness":6820,"medals_24h":610,"strategy_points_24h":88,"random_good_of_next_age_24h":120,"units_24h":30},"EarlyMiddleAge":{"population":-1030,"happiness":7540,"medals_24h":740,"strategy_points_24h":91,"random_good_of_next_age_24h":125,"units_24h":30},"HighMiddleAge":{"population":-1450,"happiness":8420,"medals_24h":870,"strategy_points_24h":94,"random_good_of_next_age_24h":130,"units_24h":30},"LateMiddleAge":{"population":-1900,"happiness":9390,"medals_24h":1010,"strategy_points_24h":97,"random_good_of_next_age_24h":135,"units_24h":30},"ColonialAge":{"population":-2400,"happiness":11040,"medals_24h":1210,"strategy_points_24h":100,"random_good_of_next_age_24h":140,"units_24h":30},"IndustrialAge":{"population":-2930,"happiness":12450,"medals_24h":1680,"strategy_points_24h":103,"random_good_of_next_age_24h":145,"units_24h":30},"ProgressiveEra":{"population":-3500,"happiness":13670,"medals_24h":2350,"strategy_points_24h":106,"random_good_of_next_age_24h":150,"units_24h":30},"ModernEra":{"population":-4100,"happiness":14620,"medals_24h":3360,"strategy_points_24h":109,"random_good_of_next_age_24h":155,"units_24h":30},"PostModernEra":{"population":-4730,"happiness":15230,"medals_24h":4710,"strategy_points_24h":112,"random_good_of_next_age_24h":160,"units_24h":30},"ContemporaryEra":{"population":-5390,"happiness":17700,"medals_24h":6720,"strategy_points_24h":115,"random_good_of_next_age_24h":165,"units_24h":30},"TomorrowEra":{"population":-6070,"happiness":21490,"medals_24h":9080,"strategy_points_24h":118,"random_good_of_next_age_24h":170,"units_24h":30},"FutureEra":{"population":-6790,"happiness":25750,"medals_24h":11090,"strategy_points_24h":121,"random_good_of_next_age_24h":175,"units_24h":30},"ArcticFuture":{"population":-7530,"happiness":29980,"medals_24h":13450,"strategy_points_24h":124,"random_good_of_next_age_24h":180,"units_24h":30},"OceanicFuture":{"population":-8300,"happiness":34600,"medals_24h":15470,"strategy_points_24h":127,"random_good_of_next_age_24h":185,"units_24h":30},"VirtualFuture":{"population":-9080,"happiness":41330,"medals_24h":18830,"strategy_points_24h":130,"random_good_of_next_age_24h":190,"units_24h":30},"SpaceAgeMars":{"population":-14380,"happiness":66130,"medals_24h":22860,"strategy_points_24h":133,"random_good_of_next_age_24h":195,"units_24h":30},"SpaceAgeAsteroidBelt":{"population":-15620,"happiness":71870,"medals_24h":26900,"strategy_points_24h":136,"random_good_of_next_age_24h":200,"units_24h":30},"SpaceAgeVenus":{"population":-16880,"happiness":77640,"medals_24h":30930,"strategy_points_24h":139,"random_good_of_next_age_24h":205,"units_24h":30},"SpaceAgeJupiterMoon":{"population":-18180,"happiness":83640,"medals_24h":34970,"strategy_points_24h":142,"random_good_of_next_age_24h":210,"units_24h":30},"SpaceAgeTitan":{"population":-19500,"happiness":89700,"medals_24h":39000,"strategy_points_24h":145,"random_good_of_next_age_24h":215,"units_24h":30},"SpaceAgeSpaceHub":{"population":-20820,"happiness":95760,"medals_24h":43030,"strategy_points_24h":148,"random_good_of_next_age_24h":220,"units_24h":30}}, boosts: [{"type":"forge_points_production","value":1,"feature":"all"}] },
+    "W_MultiAge_CARE24D1": { prod: {"AllAge":{"strategy_points_24h":75,"all_goods_of_age_24h":75},"BronzeAge":{"population":480,"demandHappiness":480},"IronAge":{"population":1030,"demandHappiness":1030},"EarlyMiddleAge":{"population":1590,"demandHappiness":1590},"HighMiddleAge":{"population":2230,"demandHappiness":2230},"LateMiddleAge":{"population":2920,"demandHappiness":2920},"ColonialAge":{"population":3690,"demandHappiness":3690},"IndustrialAge":{"population":4510,"demandHappiness":4510},"ProgressiveEra":{"population":5380,"demandHappiness":5380},"ModernEra":{"population":6310,"demandHappiness":6310},"PostModernEra":{"population":7270,"demandHappiness":7270},"ContemporaryEra":{"population":8290,"demandHappiness":8290},"TomorrowEra":{"population":9340,"demandHappiness":9340},"FutureEra":{"population":10450,"demandHappiness":10450},"ArcticFuture":{"population":11590,"demandHappiness":11590},"OceanicFuture":{"population":12760,"demandHappiness":12760},"VirtualFuture":{"population":13980,"demandHappiness":13980},"SpaceAgeMars":{"population":22120,"demandHappiness":22120},"SpaceAgeAsteroidBelt":{"population":24030,"demandHappiness":24030},"SpaceAgeVenus":{"population":25970,"demandHappiness":25970},"SpaceAgeJupiterMoon":{"population":27970,"demandHappiness":27970},"SpaceAgeTitan":{"population":30000,"demandHappiness":30000},"SpaceAgeSpaceHub":{"population":32030,"demandHappiness":32030}}, boosts: [{"type":"att_boost_attacker","value":90,"feature":"battleground"},{"type":"def_boost_attacker","value":105,"feature":"battleground"},{"type":"def_boost_defender","value":15,"feature":"guild_raids"}] },
+    "W_MultiAge_CARE24D2": { prod: {"AllAge":{"strategy_points_24h":90,"all_goods_of_age_24h":90},"BronzeAge":{"population":600,"demandHappiness":600},"IronAge":{"population":1290,"demandHappiness":1290},"EarlyMiddleAge":{"population":1980,"demandHappiness":1980},"HighMiddleAge":{"population":2790,"demandHappiness":2790},"LateMiddleAge":{"population":3650,"demandHappiness":3650},"ColonialAge":{"population":4610,"demandHappiness":4610},"IndustrialAge":{"population":5640,"demandHappiness":5640},"ProgressiveEra":{"population":6730,"demandHappiness":6730},"ModernEra":{"population":7890,"demandHappiness":7890},"PostModernEra":{"population":9090,"demandHappiness":9090},"ContemporaryEra":{"population":10360,"demandHappiness":10360},"TomorrowEra":{"population":11680,"demandHappiness":11680},"FutureEra":{"population":13060,"demandHappiness":13060},"ArcticFuture":{"population":14480,"demandHappiness":14480},"OceanicFuture":{"population":15950,"demandHappiness":15950},"VirtualFuture":{"population":17470,"demandHappiness":17470},"SpaceAgeMars":{"population":27650,"demandHappiness":27650},"SpaceAgeAsteroidBelt":{"population":30040,"demandHappiness":30040},"SpaceAgeVenus":{"population":32460,"demandHappiness":32460},"SpaceAgeJupiterMoon":{"population":34960,"demandHappiness":34960},"SpaceAgeTitan":{"population":37500,"demandHappiness":37500},"SpaceAgeSpaceHub":{"population":40040,"demandHappiness":40040}}, boosts: [{"type":"att_boost_attacker","value":105,"feature":"battleground"},{"type":"def_boost_attacker","value":120,"feature":"battleground"},{"type":"def_boost_defender","value":20,"feature":"guild_raids"}] },
+    "W_MultiAge_CARE24D3": { prod: {"AllAge":{"strategy_points_24h":105,"all_goods_of_age_24h":105},"BronzeAge":{"population":720,"demandHappiness":720},"IronAge":{"population":1550,"demandHappiness":1550},"EarlyMiddleAge":{"population":2380,"demandHappiness":2380},"HighMiddleAge":{"population":3340,"demandHappiness":3340},"LateMiddleAge":{"population":4390,"demandHappiness":4390},"ColonialAge":{"population":5530,"demandHappiness":5530},"IndustrialAge":{"population":6760,"demandHappiness":6760},"ProgressiveEra":{"population":8070,"demandHappiness":8070},"ModernEra":{"population":9470,"demandHappiness":9470},"PostModernEra":{"population":10910,"demandHappiness":10910},"ContemporaryEra":{"population":12430,"demandHappiness":12430},"TomorrowEra":{"population":14010,"demandHappiness":14010},"FutureEra":{"population":15670,"demandHappiness":15670},"ArcticFuture":{"population":17380,"demandHappiness":17380},"OceanicFuture":{"population":19140,"demandHappiness":19140},"VirtualFuture":{"population":20960,"demandHappiness":20960},"SpaceAgeMars":{"population":33180,"demandHappiness":33180},"SpaceAgeAsteroidBelt":{"population":36040,"demandHappiness":36040},"SpaceAgeVenus":{"population":38960,"demandHappiness":38960},"SpaceAgeJupiterMoon":{"population":41950,"demandHappiness":41950},"SpaceAgeTitan":{"population":45000,"demandHappiness":45000},"SpaceAgeSpaceHub":{"population":48050,"demandHappiness":48050}}, boosts: [{"type":"att_boost_attacker","value":120,"feature":"battleground"},{"type":"def_boost_attacker","value":135,"feature":"battleground"},{"type":"def_boost_defender","value":25,"feature":"guild_raids"}] },
+};
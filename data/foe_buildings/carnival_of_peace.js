@@ -0,0 +1,78 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 74 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_COP24J10TEMP": { prod: {"BronzeAge":{"money_24h":6316,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":6234},"IronAge":{"money_24h":6316,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":6234},"EarlyMiddleAge":{"money_24h":10304,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":10332},"HighMiddleAge":{"money_24h":14626,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":14430},"LateMiddleAge":{"money_24h":18947,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":19183},"ColonialAge":{"money_24h":29251,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":24280},"IndustrialAge":{"money_24h":36232,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":29515},"ProgressiveEra":{"money_24h":43877,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":34612},"ModernEra":{"money_24h":54846,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":40329},"PostModernEra":{"money_24h":68807,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":45909},"ContemporaryEra":{"money_24h":89416,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":51660},"TomorrowEra":{"money_24h":103709,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":57894},"FutureEra":{"money_24h":118999,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":63645},"ArcticFuture":{"money_24h":134954,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":69707},"OceanicFuture":{"money_24h":152239,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":76422},"VirtualFuture":{"money_24h":170521,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":82656},"SpaceAgeMars":{"money_24h":284867,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":133834},"SpaceAgeAsteroidBelt":{"money_24h":315448,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":143649},"SpaceAgeVenus":{"money_24h":348023,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":153981},"SpaceAgeJupiterMoon":{"money_24h":381928,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":163831},"SpaceAgeTitan":{"money_24h":419156,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":174301},"SpaceAgeSpaceHub":{"money_24h":456384,"strategy_points_24h":84,"random_good_of_previous_age_24h":630,"supplies_24h":184771}}, boosts: [{"type":"att_def_boost_attacker","value":93,"feature":"all"},{"type":"att_def_boost_attacker","value":46,"feature":"battleground"},{"type":"att_def_boost_attacker","value":46,"feature":"guild_expedition"},{"type":"att_def_boost_attacker","value":45,"feature":"guild_raids"}] },
+    "W_MultiAge_COP24J1": { prod: {"BronzeAge":{"money_24h":616,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":341,"units_24h":1},"IronAge":{"money_24h":616,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":341,"units_24h":1},"EarlyMiddleAge":{"money_24h":1004,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":565,"units_24h":1},"HighMiddleAge":{"money_24h":1426,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":789,"units_24h":1},"LateMiddleAge":{"money_24h":1847,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":1049,"units_24h":1},"ColonialAge":{"money_24h":2851,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":1328,"units_24h":1},"IndustrialAge":{"money_24h":3532,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":1615,"units_24h":1},"ProgressiveEra":{"money_24h":4277,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":1893,"units_24h":1},"ModernEra":{"money_24h":5346,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":2206,"units_24h":1},"PostModernEra":{"money_24h":6707,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":2511,"units_24h":1},"ContemporaryEra":{"money_24h":8716,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":2826,"units_24h":1},"TomorrowEra":{"money_24h":10109,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":3167,"units_24h":1},"FutureEra":{"money_24h":11599,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":3482,"units_24h":1},"ArcticFuture":{"money_24h":13154,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":3813,"units_24h":1},"OceanicFuture":{"money_24h":14839,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":4181,"units_24h":1},"VirtualFuture":{"money_24h":16621,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":4522,"units_24h":1},"SpaceAgeMars":{"money_24h":27767,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":7321,"units_24h":1},"SpaceAgeAsteroidBelt":{"money_24h":30748,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":7858,"units_24h":1},"SpaceAgeVenus":{"money_24h":33923,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":8423,"units_24h":1},"SpaceAgeJupiterMoon":{"money_24h":37228,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":8962,"units_24h":1},"SpaceAgeTitan":{"money_24h":40856,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":9535,"units_24h":1},"SpaceAgeSpaceHub":{"money_24h":44484,"strategy_points_24h":12,"random_good_of_previous_age_24h":65,"supplies_24h":10108,"units_24h":1}}, boosts: [{"type":"att_def_boost_attacker","value":9,"feature":"all"},{"type":"att_def_boost_attacker","value":5,"feature":"battleground"},{"type":"att_def_boost_attacker","value":5,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24J2": { prod: {"BronzeAge":{"money_24h":1186,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":934,"units_24h":3},"IronAge":{"money_24h":1186,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":934,"units_24h":3},"EarlyMiddleAge":{"money_24h":1934,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":1548,"units_24h":3},"HighMiddleAge":{"money_24h":2746,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":2162,"units_24h":3},"LateMiddleAge":{"money_24h":3557,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":2874,"units_24h":3},"ColonialAge":{"money_24h":5491,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":3638,"units_24h":3},"IndustrialAge":{"money_24h":6802,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":4422,"units_24h":3},"ProgressiveEra":{"money_24h":8237,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":5186,"units_24h":3},"ModernEra":{"money_24h":10296,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":6042,"units_24h":3},"PostModernEra":{"money_24h":12917,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":6878,"units_24h":3},"ContemporaryEra":{"money_24h":16786,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":7740,"units_24h":3},"TomorrowEra":{"money_24h":19469,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":8674,"units_24h":3},"FutureEra":{"money_24h":22339,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":9536,"units_24h":3},"ArcticFuture":{"money_24h":25334,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":10444,"units_24h":3},"OceanicFuture":{"money_24h":28579,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":11450,"units_24h":3},"VirtualFuture":{"money_24h":32011,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":12384,"units_24h":3},"SpaceAgeMars":{"money_24h":53477,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":20052,"units_24h":3},"SpaceAgeAsteroidBelt":{"money_24h":59218,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":21522,"units_24h":3},"SpaceAgeVenus":{"money_24h":65333,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":23070,"units_24h":3},"SpaceAgeJupiterMoon":{"money_24h":71698,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":24546,"units_24h":3},"SpaceAgeTitan":{"money_24h":78686,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":26115,"units_24h":3},"SpaceAgeSpaceHub":{"money_24h":85674,"strategy_points_24h":19,"random_good_of_previous_age_24h":120,"supplies_24h":27684,"units_24h":3}}, boosts: [{"type":"att_def_boost_attacker","value":18,"feature":"all"},{"type":"att_def_boost_attacker","value":9,"feature":"battleground"},{"type":"att_def_boost_attacker","value":9,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24J3": { prod: {"BronzeAge":{"money_24h":1767,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":1542,"units_24h":5},"IronAge":{"money_24h":1767,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":1542,"units_24h":5},"EarlyMiddleAge":{"money_24h":2883,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":2556,"units_24h":5},"HighMiddleAge":{"money_24h":4092,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":3570,"units_24h":5},"LateMiddleAge":{"money_24h":5301,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":4746,"units_24h":5},"ColonialAge":{"money_24h":8184,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":6007,"units_24h":5},"IndustrialAge":{"money_24h":10137,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":7302,"units_24h":5},"ProgressiveEra":{"money_24h":12276,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":8563,"units_24h":5},"ModernEra":{"money_24h":15345,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":9977,"units_24h":5},"PostModernEra":{"money_24h":19251,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":11357,"units_24h":5},"ContemporaryEra":{"money_24h":25017,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":12780,"units_24h":5},"TomorrowEra":{"money_24h":29016,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":14322,"units_24h":5},"FutureEra":{"money_24h":33294,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":15745,"units_24h":5},"ArcticFuture":{"money_24h":37758,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":17244,"units_24h":5},"OceanicFuture":{"money_24h":42594,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":18906,"units_24h":5},"VirtualFuture":{"money_24h":47709,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":20448,"units_24h":5},"SpaceAgeMars":{"money_24h":79701,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":33109,"units_24h":5},"SpaceAgeAsteroidBelt":{"money_24h":88257,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":35537,"units_24h":5},"SpaceAgeVenus":{"money_24h":97371,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":38093,"units_24h":5},"SpaceAgeJupiterMoon":{"money_24h":106857,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":40530,"units_24h":5},"SpaceAgeTitan":{"money_24h":117273,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":43120,"units_24h":5},"SpaceAgeSpaceHub":{"money_24h":127689,"strategy_points_24h":27,"random_good_of_previous_age_24h":180,"supplies_24h":45710,"units_24h":5}}, boosts: [{"type":"att_def_boost_attacker","value":26,"feature":"all"},{"type":"att_def_boost_attacker","value":13,"feature":"battleground"},{"type":"att_def_boost_attacker","value":13,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24J4": { prod: {"BronzeAge":{"money_24h":2360,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":2172,"units_24h":7},"IronAge":{"money_24h":2360,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":2172,"units_24h":7},"EarlyMiddleAge":{"money_24h":3850,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":3600,"units_24h":7},"HighMiddleAge":{"money_24h":5465,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":5028,"units_24h":7},"LateMiddleAge":{"money_24h":7079,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":6684,"units_24h":7},"ColonialAge":{"money_24h":10930,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":8460,"units_24h":7},"IndustrialAge":{"money_24h":13538,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":10284,"units_24h":7},"ProgressiveEra":{"money_24h":16394,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":12060,"units_24h":7},"ModernEra":{"money_24h":20493,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":14052,"units_24h":7},"PostModernEra":{"money_24h":25709,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":15996,"units_24h":7},"ContemporaryEra":{"money_24h":33410,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":18000,"units_24h":7},"TomorrowEra":{"money_24h":38750,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":20172,"units_24h":7},"FutureEra":{"money_24h":44464,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":22176,"units_24h":7},"ArcticFuture":{"money_24h":50425,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":24288,"units_24h":7},"OceanicFuture":{"money_24h":56884,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":26628,"units_24h":7},"VirtualFuture":{"money_24h":63715,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":28800,"units_24h":7},"SpaceAgeMars":{"money_24h":106439,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":46632,"units_24h":7},"SpaceAgeAsteroidBelt":{"money_24h":117866,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":50052,"units_24h":7},"SpaceAgeVenus":{"money_24h":130037,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":53652,"units_24h":7},"SpaceAgeJupiterMoon":{"money_24h":142706,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":57084,"units_24h":7},"SpaceAgeTitan":{"money_24h":156616,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":60732,"units_24h":7},"SpaceAgeSpaceHub":{"money_24h":170526,"strategy_points_24h":34,"random_good_of_previous_age_24h":235,"supplies_24h":64380,"units_24h":7}}, boosts: [{"type":"att_def_boost_attacker","value":35,"feature":"all"},{"type":"att_def_boost_attacker","value":17,"feature":"battleground"},{"type":"att_def_boost_attacker","value":17,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24J5": { prod: {"BronzeAge":{"money_24h":2930,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":2780,"units_24h":9},"IronAge":{"money_24h":2930,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":2780,"units_24h":9},"EarlyMiddleAge":{"money_24h":4780,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":4608,"units_24h":9},"HighMiddleAge":{"money_24h":6785,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":6436,"units_24h":9},"LateMiddleAge":{"money_24h":8789,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":8556,"units_24h":9},"ColonialAge":{"money_24h":13570,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":10829,"units_24h":9},"IndustrialAge":{"money_24h":16808,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":13164,"units_24h":9},"ProgressiveEra":{"money_24h":20354,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":15437,"units_24h":9},"ModernEra":{"money_24h":25443,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":17987,"units_24h":9},"PostModernEra":{"money_24h":31919,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":20475,"units_24h":9},"ContemporaryEra":{"money_24h":41480,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":23040,"units_24h":9},"TomorrowEra":{"money_24h":48110,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":25820,"units_24h":9},"FutureEra":{"money_24h":55204,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":28385,"units_24h":9},"ArcticFuture":{"money_24h":62605,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":31089,"units_24h":9},"OceanicFuture":{"money_24h":70624,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":34084,"units_24h":9},"VirtualFuture":{"money_24h":79105,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":36864,"units_24h":9},"SpaceAgeMars":{"money_24h":132149,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":59689,"units_24h":9},"SpaceAgeAsteroidBelt":{"money_24h":146336,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":64067,"units_24h":9},"SpaceAgeVenus":{"money_24h":161447,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":68675,"units_24h":9},"SpaceAgeJupiterMoon":{"money_24h":177176,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":73068,"units_24h":9},"SpaceAgeTitan":{"money_24h":194446,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":77737,"units_24h":9},"SpaceAgeSpaceHub":{"money_24h":211716,"strategy_points_24h":41,"random_good_of_previous_age_24h":295,"supplies_24h":82406,"units_24h":9}}, boosts: [{"type":"att_def_boost_attacker","value":43,"feature":"all"},{"type":"att_def_boost_attacker","value":22,"feature":"battleground"},{"type":"att_def_boost_attacker","value":22,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24J6": { prod: {"BronzeAge":{"money_24h":3511,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":3367,"units_24h":11},"IronAge":{"money_24h":3511,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":3367,"units_24h":11},"EarlyMiddleAge":{"money_24h":5729,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":5580,"units_24h":11},"HighMiddleAge":{"money_24h":8131,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":7793,"units_24h":11},"LateMiddleAge":{"money_24h":10534,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":10360,"units_24h":11},"ColonialAge":{"money_24h":16262,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":13113,"units_24h":11},"IndustrialAge":{"money_24h":20143,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":15940,"units_24h":11},"ProgressiveEra":{"money_24h":24394,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":18693,"units_24h":11},"ModernEra":{"money_24h":30492,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":21781,"units_24h":11},"PostModernEra":{"money_24h":38254,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":24794,"units_24h":11},"ContemporaryEra":{"money_24h":49711,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":27900,"units_24h":11},"TomorrowEra":{"money_24h":57658,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":31267,"units_24h":11},"FutureEra":{"money_24h":66158,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":34373,"units_24h":11},"ArcticFuture":{"money_24h":75029,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":37646,"units_24h":11},"OceanicFuture":{"money_24h":84638,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":41273,"units_24h":11},"VirtualFuture":{"money_24h":94802,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":44640,"units_24h":11},"SpaceAgeMars":{"money_24h":158374,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":72280,"units_24h":11},"SpaceAgeAsteroidBelt":{"money_24h":175375,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":77581,"units_24h":11},"SpaceAgeVenus":{"money_24h":193486,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":83161,"units_24h":11},"SpaceAgeJupiterMoon":{"money_24h":212335,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":88480,"units_24h":11},"SpaceAgeTitan":{"money_24h":233033,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":94135,"units_24h":11},"SpaceAgeSpaceHub":{"money_24h":253731,"strategy_points_24h":48,"random_good_of_previous_age_24h":350,"supplies_24h":99790,"units_24h":11}}, boosts: [{"type":"att_def_boost_attacker","value":52,"feature":"all"},{"type":"att_def_boost_attacker","value":26,"feature":"battleground"},{"type":"att_def_boost_attacker","value":26,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24J7": { prod: {"BronzeAge":{"money_24h":4104,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":3996,"units_24h":13},"IronAge":{"money_24h":4104,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":3996,"units_24h":13},"EarlyMiddleAge":{"money_24h":6696,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":6624,"units_24h":13},"HighMiddleAge":{"money_24h":9504,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":9252,"units_24h":13},"LateMiddleAge":{"money_24h":12312,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":12299,"units_24h":13},"ColonialAge":{"money_24h":19008,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":15566,"units_24h":13},"IndustrialAge":{"money_24h":23544,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":18923,"units_24h":13},"ProgressiveEra":{"money_24h":28512,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":22190,"units_24h":13},"ModernEra":{"money_24h":35640,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":25856,"units_24h":13},"PostModernEra":{"money_24h":44712,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":29433,"units_24h":13},"ContemporaryEra":{"money_24h":58104,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":33120,"units_24h":13},"TomorrowEra":{"money_24h":67392,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":37116,"units_24h":13},"FutureEra":{"money_24h":77328,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":40804,"units_24h":13},"ArcticFuture":{"money_24h":87696,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":44690,"units_24h":13},"OceanicFuture":{"money_24h":98928,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":48996,"units_24h":13},"VirtualFuture":{"money_24h":110808,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":52992,"units_24h":13},"SpaceAgeMars":{"money_24h":185112,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":85803,"units_24h":13},"SpaceAgeAsteroidBelt":{"money_24h":204984,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":92096,"units_24h":13},"SpaceAgeVenus":{"money_24h":226152,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":98720,"units_24h":13},"SpaceAgeJupiterMoon":{"money_24h":248184,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":105035,"units_24h":13},"SpaceAgeTitan":{"money_24h":272376,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":111747,"units_24h":13},"SpaceAgeSpaceHub":{"money_24h":296568,"strategy_points_24h":56,"random_good_of_previous_age_24h":410,"supplies_24h":118459,"units_24h":13}}, boosts: [{"type":"att_def_boost_attacker","value":60,"feature":"all"},{"type":"att_def_boost_attacker","value":30,"feature":"battleground"},{"type":"att_def_boost_attacker","value":30,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24J8": { prod: {"BronzeAge":{"money_24h":4674,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":4583,"units_24h":15},"IronAge":{"money_24h":4674,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":4583,"units_24h":15},"EarlyMiddleAge":{"money_24h":7626,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":7596,"units_24h":15},"HighMiddleAge":{"money_24h":10824,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":10609,"units_24h":15},"LateMiddleAge":{"money_24h":14022,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":14103,"units_24h":15},"ColonialAge":{"money_24h":21648,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":17851,"units_24h":15},"IndustrialAge":{"money_24h":26814,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":21699,"units_24h":15},"ProgressiveEra":{"money_24h":32472,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":25447,"units_24h":15},"ModernEra":{"money_24h":40590,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":29650,"units_24h":15},"PostModernEra":{"money_24h":50922,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":33752,"units_24h":15},"ContemporaryEra":{"money_24h":66174,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":37980,"units_24h":15},"TomorrowEra":{"money_24h":76752,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":42563,"units_24h":15},"FutureEra":{"money_24h":88068,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":46791,"units_24h":15},"ArcticFuture":{"money_24h":99876,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":51248,"units_24h":15},"OceanicFuture":{"money_24h":112668,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":56185,"units_24h":15},"VirtualFuture":{"money_24h":126198,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":60768,"units_24h":15},"SpaceAgeMars":{"money_24h":210822,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":98394,"units_24h":15},"SpaceAgeAsteroidBelt":{"money_24h":233454,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":105610,"units_24h":15},"SpaceAgeVenus":{"money_24h":257562,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":113206,"units_24h":15},"SpaceAgeJupiterMoon":{"money_24h":282654,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":120447,"units_24h":15},"SpaceAgeTitan":{"money_24h":310206,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":128145,"units_24h":15},"SpaceAgeSpaceHub":{"money_24h":337758,"strategy_points_24h":63,"random_good_of_previous_age_24h":465,"supplies_24h":135843,"units_24h":15}}, boosts: [{"type":"att_def_boost_attacker","value":69,"feature":"all"},{"type":"att_def_boost_attacker","value":34,"feature":"battleground"},{"type":"att_def_boost_attacker","value":34,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24J9": { prod: {"BronzeAge":{"money_24h":5267,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":5213,"units_24h":17},"IronAge":{"money_24h":5267,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":5213,"units_24h":17},"EarlyMiddleAge":{"money_24h":8593,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":8640,"units_24h":17},"HighMiddleAge":{"money_24h":12197,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":12067,"units_24h":17},"LateMiddleAge":{"money_24h":15800,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":16042,"units_24h":17},"ColonialAge":{"money_24h":24394,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":20304,"units_24h":17},"IndustrialAge":{"money_24h":30215,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":24682,"units_24h":17},"ProgressiveEra":{"money_24h":36590,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":28944,"units_24h":17},"ModernEra":{"money_24h":45738,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":33725,"units_24h":17},"PostModernEra":{"money_24h":57380,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":38390,"units_24h":17},"ContemporaryEra":{"money_24h":74567,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":43200,"units_24h":17},"TomorrowEra":{"money_24h":86486,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":48413,"units_24h":17},"FutureEra":{"money_24h":99238,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":53222,"units_24h":17},"ArcticFuture":{"money_24h":112543,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":58291,"units_24h":17},"OceanicFuture":{"money_24h":126958,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":63907,"units_24h":17},"VirtualFuture":{"money_24h":142204,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":69120,"units_24h":17},"SpaceAgeMars":{"money_24h":237560,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":111917,"units_24h":17},"SpaceAgeAsteroidBelt":{"money_24h":263063,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":120125,"units_24h":17},"SpaceAgeVenus":{"money_24h":290228,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":128765,"units_24h":17},"SpaceAgeJupiterMoon":{"money_24h":318503,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":137002,"units_24h":17},"SpaceAgeTitan":{"money_24h":349549,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":145757,"units_24h":17},"SpaceAgeSpaceHub":{"money_24h":380595,"strategy_points_24h":70,"random_good_of_previous_age_24h":525,"supplies_24h":154512,"units_24h":17}}, boosts: [{"type":"att_def_boost_attacker","value":77,"feature":"all"},{"type":"att_def_boost_attacker","value":38,"feature":"battleground"},{"type":"att_def_boost_attacker","value":38,"feature":"guild_expedition"},{"type":"att_def_boost_attacker","value":30,"feature":"guild_raids"}] },
+    "W_MultiAge_COP25KB1": { prod: {"BronzeAge":{"money_24h":30,"supplies_24h":350,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"IronAge":{"money_24h":60,"supplies_24h":840,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"EarlyMiddleAge":{"money_24h":100,"supplies_24h":1400,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"HighMiddleAge":{"money_24h":140,"supplies_24h":1960,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"LateMiddleAge":{"money_24h":190,"supplies_24h":2590,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"ColonialAge":{"money_24h":290,"supplies_24h":3290,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"IndustrialAge":{"money_24h":360,"supplies_24h":3990,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"ProgressiveEra":{"money_24h":440,"supplies_24h":4690,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"ModernEra":{"money_24h":540,"supplies_24h":5460,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"PostModernEra":{"money_24h":680,"supplies_24h":6230,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"ContemporaryEra":{"money_24h":890,"supplies_24h":7000,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"TomorrowEra":{"money_24h":1030,"supplies_24h":7840,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"FutureEra":{"money_24h":1180,"supplies_24h":8610,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"ArcticFuture":{"money_24h":1340,"supplies_24h":9450,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"OceanicFuture":{"money_24h":1510,"supplies_24h":10360,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"VirtualFuture":{"money_24h":1690,"supplies_24h":11200,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"SpaceAgeMars":{"money_24h":2830,"supplies_24h":18140,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"SpaceAgeAsteroidBelt":{"money_24h":3130,"supplies_24h":19470,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"SpaceAgeVenus":{"money_24h":3460,"supplies_24h":20870,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"SpaceAgeJupiterMoon":{"money_24h":3790,"supplies_24h":22200,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"SpaceAgeTitan":{"money_24h":4150,"supplies_24h":23600,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5},"SpaceAgeSpaceHub":{"money_24h":4500,"supplies_24h":25000,"strategy_points_24h":2,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":5,"all_goods_of_next_age_24h":5}}, boosts: [{"type":"att_boost_defender","value":5,"feature":"all"}] },
+    "W_MultiAge_COP25KB2": { prod: {"BronzeAge":{"money_24h":50,"supplies_24h":610,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"IronAge":{"money_24h":110,"supplies_24h":1470,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"EarlyMiddleAge":{"money_24h":190,"supplies_24h":2450,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"HighMiddleAge":{"money_24h":270,"supplies_24h":3430,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"LateMiddleAge":{"money_24h":350,"supplies_24h":4530,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"ColonialAge":{"money_24h":540,"supplies_24h":5760,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"IndustrialAge":{"money_24h":670,"supplies_24h":6990,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"ProgressiveEra":{"money_24h":810,"supplies_24h":8210,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"ModernEra":{"money_24h":1010,"supplies_24h":9560,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"PostModernEra":{"money_24h":1270,"supplies_24h":10910,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"ContemporaryEra":{"money_24h":1660,"supplies_24h":12250,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"TomorrowEra":{"money_24h":1920,"supplies_24h":13730,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"FutureEra":{"money_24h":2200,"supplies_24h":15070,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"ArcticFuture":{"money_24h":2500,"supplies_24h":16540,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"OceanicFuture":{"money_24h":2820,"supplies_24h":18140,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"VirtualFuture":{"money_24h":3150,"supplies_24h":19610,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"SpaceAgeMars":{"money_24h":5270,"supplies_24h":31740,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"SpaceAgeAsteroidBelt":{"money_24h":5830,"supplies_24h":34070,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"SpaceAgeVenus":{"money_24h":6430,"supplies_24h":36520,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"SpaceAgeJupiterMoon":{"money_24h":7060,"supplies_24h":38850,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"SpaceAgeTitan":{"money_24h":7720,"supplies_24h":41300,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5},"SpaceAgeSpaceHub":{"money_24h":8380,"supplies_24h":43750,"strategy_points_24h":4,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"all_goods_of_next_age_24h":5}}, boosts: [{"type":"att_boost_defender","value":10,"feature":"all"}] },
+    "W_MultiAge_COP25KB3": { prod: {"BronzeAge":{"money_24h":70,"supplies_24h":880,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"IronAge":{"money_24h":170,"supplies_24h":2100,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"EarlyMiddleAge":{"money_24h":280,"supplies_24h":3500,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"HighMiddleAge":{"money_24h":390,"supplies_24h":4900,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"LateMiddleAge":{"money_24h":520,"supplies_24h":6480,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"ColonialAge":{"money_24h":790,"supplies_24h":8230,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"IndustrialAge":{"money_24h":980,"supplies_24h":9980,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"ProgressiveEra":{"money_24h":1190,"supplies_24h":11730,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"ModernEra":{"money_24h":1480,"supplies_24h":13660,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"PostModernEra":{"money_24h":1860,"supplies_24h":15580,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"ContemporaryEra":{"money_24h":2420,"supplies_24h":17510,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"TomorrowEra":{"money_24h":2800,"supplies_24h":19610,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"FutureEra":{"money_24h":3210,"supplies_24h":21530,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"ArcticFuture":{"money_24h":3650,"supplies_24h":23630,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"OceanicFuture":{"money_24h":4120,"supplies_24h":25910,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"VirtualFuture":{"money_24h":4610,"supplies_24h":28010,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"SpaceAgeMars":{"money_24h":7700,"supplies_24h":45340,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"SpaceAgeAsteroidBelt":{"money_24h":8530,"supplies_24h":48670,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"SpaceAgeVenus":{"money_24h":9410,"supplies_24h":52170,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"SpaceAgeJupiterMoon":{"money_24h":10320,"supplies_24h":55500,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"SpaceAgeTitan":{"money_24h":11290,"supplies_24h":59000,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10},"SpaceAgeSpaceHub":{"money_24h":12250,"supplies_24h":62500,"strategy_points_24h":6,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"all_goods_of_next_age_24h":10}}, boosts: [{"type":"att_boost_defender","value":15,"feature":"all"}] },
+    "W_MultiAge_COP25KB4": { prod: {"BronzeAge":{"money_24h":90,"supplies_24h":1140,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"IronAge":{"money_24h":220,"supplies_24h":2730,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"EarlyMiddleAge":{"money_24h":370,"supplies_24h":4550,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"HighMiddleAge":{"money_24h":510,"supplies_24h":6370,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"LateMiddleAge":{"money_24h":680,"supplies_24h":8420,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"ColonialAge":{"money_24h":1030,"supplies_24h":10700,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"IndustrialAge":{"money_24h":1290,"supplies_24h":12970,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"ProgressiveEra":{"money_24h":1560,"supplies_24h":15250,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"ModernEra":{"money_24h":1950,"supplies_24h":17750,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"PostModernEra":{"money_24h":2450,"supplies_24h":20260,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"ContemporaryEra":{"money_24h":3190,"supplies_24h":22760,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"TomorrowEra":{"money_24h":3690,"supplies_24h":25490,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"FutureEra":{"money_24h":4230,"supplies_24h":27990,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"ArcticFuture":{"money_24h":4810,"supplies_24h":30720,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"OceanicFuture":{"money_24h":5420,"supplies_24h":33680,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"VirtualFuture":{"money_24h":6070,"supplies_24h":36410,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"SpaceAgeMars":{"money_24h":10140,"supplies_24h":58950,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"SpaceAgeAsteroidBelt":{"money_24h":11230,"supplies_24h":63270,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"SpaceAgeVenus":{"money_24h":12380,"supplies_24h":67820,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"SpaceAgeJupiterMoon":{"money_24h":13590,"supplies_24h":72150,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"SpaceAgeTitan":{"money_24h":14860,"supplies_24h":76700,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15},"SpaceAgeSpaceHub":{"money_24h":16130,"supplies_24h":81250,"strategy_points_24h":8,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":20,"all_goods_of_next_age_24h":15}}, boosts: [{"type":"att_boost_defender","value":20,"feature":"all"}] },
+    "W_MultiAge_COP25KB5": { prod: {"BronzeAge":{"money_24h":110,"supplies_24h":1400,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"IronAge":{"money_24h":270,"supplies_24h":3360,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"EarlyMiddleAge":{"money_24h":460,"supplies_24h":5600,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"HighMiddleAge":{"money_24h":640,"supplies_24h":7840,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"LateMiddleAge":{"money_24h":840,"supplies_24h":10360,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"ColonialAge":{"money_24h":1280,"supplies_24h":13170,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"IndustrialAge":{"money_24h":1600,"supplies_24h":15970,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"ProgressiveEra":{"money_24h":1940,"supplies_24h":18770,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"ModernEra":{"money_24h":2410,"supplies_24h":21850,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"PostModernEra":{"money_24h":3040,"supplies_24h":24930,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"ContemporaryEra":{"money_24h":3950,"supplies_24h":28010,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"TomorrowEra":{"money_24h":4580,"supplies_24h":31370,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"FutureEra":{"money_24h":5250,"supplies_24h":34450,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"ArcticFuture":{"money_24h":5960,"supplies_24h":37820,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"OceanicFuture":{"money_24h":6720,"supplies_24h":41460,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"VirtualFuture":{"money_24h":7530,"supplies_24h":44820,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"SpaceAgeMars":{"money_24h":12580,"supplies_24h":72550,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"SpaceAgeAsteroidBelt":{"money_24h":13930,"supplies_24h":77870,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"SpaceAgeVenus":{"money_24h":15360,"supplies_24h":83470,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"SpaceAgeJupiterMoon":{"money_24h":16860,"supplies_24h":88800,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"SpaceAgeTitan":{"money_24h":18430,"supplies_24h":94400,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20},"SpaceAgeSpaceHub":{"money_24h":20000,"supplies_24h":100000,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":25,"all_goods_of_next_age_24h":20}}, boosts: [{"type":"att_boost_defender","value":25,"feature":"all"}] },
+    "W_MultiAge_COP24D10TEMP": { prod: {"BronzeAge":{"money_24h":6327,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":6234},"IronAge":{"money_24h":6327,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":6234},"EarlyMiddleAge":{"money_24h":10323,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":10332},"HighMiddleAge":{"money_24h":14652,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":14430},"LateMiddleAge":{"money_24h":18981,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":19183},"ColonialAge":{"money_24h":29304,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":24280},"IndustrialAge":{"money_24h":36297,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":29515},"ProgressiveEra":{"money_24h":43956,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":34612},"ModernEra":{"money_24h":54945,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":40329},"PostModernEra":{"money_24h":68931,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":45909},"ContemporaryEra":{"money_24h":89577,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":51660},"TomorrowEra":{"money_24h":103896,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":57894},"FutureEra":{"money_24h":119214,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":63645},"ArcticFuture":{"money_24h":135198,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":69707},"OceanicFuture":{"money_24h":152514,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":76422},"VirtualFuture":{"money_24h":170829,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":82656},"SpaceAgeMars":{"money_24h":285381,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":133834},"SpaceAgeAsteroidBelt":{"money_24h":316017,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":143649},"SpaceAgeVenus":{"money_24h":348651,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":153981},"SpaceAgeJupiterMoon":{"money_24h":382617,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":163831},"SpaceAgeTitan":{"money_24h":419913,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":174301},"SpaceAgeSpaceHub":{"money_24h":457209,"strategy_points_24h":82,"random_good_of_age_24h":70,"random_good_of_previous_age_24h":375,"supplies_24h":184771}}, boosts: [{"type":"def_boost_attacker","value":152,"feature":"all"},{"type":"def_boost_attacker","value":76,"feature":"battleground"},{"type":"def_boost_attacker","value":76,"feature":"guild_expedition"},{"type":"def_boost_attacker","value":75,"feature":"guild_raids"}] },
+    "W_MultiAge_COP24B10TEMP": { prod: {"BronzeAge":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":5791,"supplies_24h":5756},"IronAge":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":5791,"supplies_24h":5756},"EarlyMiddleAge":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":9449,"supplies_24h":9540},"HighMiddleAge":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":13411,"supplies_24h":13324},"LateMiddleAge":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":17374,"supplies_24h":17713},"ColonialAge":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":26822,"supplies_24h":22419},"IndustrialAge":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":33223,"supplies_24h":27253},"ProgressiveEra":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":40234,"supplies_24h":31959},"ModernEra":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":50292,"supplies_24h":37238},"PostModernEra":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":63094,"supplies_24h":42389},"ContemporaryEra":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":81991,"supplies_24h":47700},"TomorrowEra":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":95098,"supplies_24h":53456},"FutureEra":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":109118,"supplies_24h":58766},"ArcticFuture":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":123749,"supplies_24h":64363},"OceanicFuture":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":139598,"supplies_24h":70564},"VirtualFuture":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":156362,"supplies_24h":76320},"SpaceAgeMars":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":261214,"supplies_24h":123575},"SpaceAgeAsteroidBelt":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":289255,"supplies_24h":132638},"SpaceAgeVenus":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":319126,"supplies_24h":142178},"SpaceAgeJupiterMoon":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":350215,"supplies_24h":151273},"SpaceAgeTitan":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":384353,"supplies_24h":160940},"SpaceAgeSpaceHub":{"strategy_points_24h":77,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":440,"money_24h":418491,"supplies_24h":170607}}, boosts: [{"type":"att_def_boost_defender","value":85,"feature":"all"},{"type":"att_def_boost_defender","value":42,"feature":"battleground"},{"type":"att_def_boost_defender","value":42,"feature":"guild_expedition"},{"type":"def_boost_defender","value":30,"feature":"guild_raids"},{"type":"att_boost_defender","value":60,"feature":"guild_raids"},{"type":"supply_production","value":180,"feature":"all"}] },
+    "W_MultiAge_COP24A10TEMP": { prod: {"BronzeAge":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":4874,"supplies_24h":4838,"medals_24h":702},"IronAge":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":4874,"supplies_24h":4838,"medals_24h":702},"EarlyMiddleAge":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":7952,"supplies_24h":8019,"medals_24h":772},"HighMiddleAge":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":11286,"supplies_24h":11200,"medals_24h":842},"LateMiddleAge":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":14621,"supplies_24h":14889,"medals_24h":913},"ColonialAge":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":22572,"supplies_24h":18845,"medals_24h":983},"IndustrialAge":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":27959,"supplies_24h":22908,"medals_24h":1053},"ProgressiveEra":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":33858,"supplies_24h":26864,"medals_24h":1123},"ModernEra":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":42323,"supplies_24h":31301,"medals_24h":1193},"PostModernEra":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":53096,"supplies_24h":35631,"medals_24h":1264},"ContemporaryEra":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":68999,"supplies_24h":40095,"medals_24h":1334},"TomorrowEra":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":80028,"supplies_24h":44933,"medals_24h":1404},"FutureEra":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":91827,"supplies_24h":49397,"medals_24h":1474},"ArcticFuture":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":104139,"supplies_24h":54102,"medals_24h":1544},"OceanicFuture":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":117477,"supplies_24h":59314,"medals_24h":1615},"VirtualFuture":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":131585,"supplies_24h":64152,"medals_24h":2106},"SpaceAgeMars":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":219821,"supplies_24h":103873,"medals_24h":2808},"SpaceAgeAsteroidBelt":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":243419,"supplies_24h":111491,"medals_24h":4212},"SpaceAgeVenus":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":268556,"supplies_24h":119510,"medals_24h":5616},"SpaceAgeJupiterMoon":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":294719,"supplies_24h":127155,"medals_24h":7020},"SpaceAgeTitan":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":323447,"supplies_24h":135281,"medals_24h":8424},"SpaceAgeSpaceHub":{"strategy_points_24h":41,"random_good_of_age_24h":115,"money_24h":352175,"supplies_24h":143407,"medals_24h":9828}}, boosts: [{"type":"att_boost_attacker","value":113,"feature":"all"},{"type":"att_boost_attacker","value":57,"feature":"battleground"},{"type":"att_boost_attacker","value":57,"feature":"guild_expedition"},{"type":"att_boost_attacker","value":75,"feature":"guild_raids"}] },
+    "W_MultiAge_COP25K10TEMP": { prod: {"BronzeAge":{"money_24h":970,"supplies_24h":8330,"medals_24h":280,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"IronAge":{"money_24h":2320,"supplies_24h":20000,"medals_24h":360,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"EarlyMiddleAge":{"money_24h":3870,"supplies_24h":33330,"medals_24h":440,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"HighMiddleAge":{"money_24h":5420,"supplies_24h":46670,"medals_24h":520,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"LateMiddleAge":{"money_24h":7160,"supplies_24h":61670,"medals_24h":600,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"ColonialAge":{"money_24h":10910,"supplies_24h":78330,"medals_24h":720,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"IndustrialAge":{"money_24h":13590,"supplies_24h":95000,"medals_24h":1000,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"ProgressiveEra":{"money_24h":16490,"supplies_24h":111670,"medals_24h":1390,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"ModernEra":{"money_24h":20520,"supplies_24h":130000,"medals_24h":1990,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"PostModernEra":{"money_24h":25810,"supplies_24h":148330,"medals_24h":2790,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"ContemporaryEra":{"money_24h":33600,"supplies_24h":166670,"medals_24h":3980,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"TomorrowEra":{"money_24h":38910,"supplies_24h":186670,"medals_24h":5380,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"FutureEra":{"money_24h":44600,"supplies_24h":205000,"medals_24h":6570,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"ArcticFuture":{"money_24h":50680,"supplies_24h":225000,"medals_24h":7970,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"OceanicFuture":{"money_24h":57140,"supplies_24h":246670,"medals_24h":9160,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"VirtualFuture":{"money_24h":64000,"supplies_24h":266670,"medals_24h":11160,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"SpaceAgeMars":{"money_24h":106910,"supplies_24h":431670,"medals_24h":13550,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"SpaceAgeAsteroidBelt":{"money_24h":118410,"supplies_24h":463330,"medals_24h":15940,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"SpaceAgeVenus":{"money_24h":130530,"supplies_24h":496670,"medals_24h":18330,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"SpaceAgeJupiterMoon":{"money_24h":143270,"supplies_24h":528330,"medals_24h":20720,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"SpaceAgeTitan":{"money_24h":156630,"supplies_24h":561670,"medals_24h":23110,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35},"SpaceAgeSpaceHub":{"money_24h":170000,"supplies_24h":595000,"medals_24h":25500,"strategy_points_24h":143,"random_good_of_age_24h":340,"random_special_good_up_to_age_24h":77,"units_24h":35}}, boosts: [{"type":"def_boost_attacker","value":306,"feature":"battleground"},{"type":"def_boost_attacker","value":306,"feature":"guild_expedition"},{"type":"def_boost_attacker","value":40,"feature":"guild_raids"},{"type":"att_def_boost_defender","value":697,"feature":"battleground"},{"type":"att_def_boost_defender","value":697,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":153,"feature":"guild_raids"},{"type":"supply_production","value":180,"feature":"all"}] },
+    "W_MultiAge_COP24C7TEMP": { prod: {"BronzeAge":{"money_24h":5791,"strategy_points_24h":90},"IronAge":{"money_24h":5791,"strategy_points_24h":90},"EarlyMiddleAge":{"money_24h":9449,"strategy_points_24h":90},"HighMiddleAge":{"money_24h":13411,"strategy_points_24h":90},"LateMiddleAge":{"money_24h":17374,"strategy_points_24h":90},"ColonialAge":{"money_24h":26822,"strategy_points_24h":90},"IndustrialAge":{"money_24h":33223,"strategy_points_24h":90},"ProgressiveEra":{"money_24h":40234,"strategy_points_24h":90},"ModernEra":{"money_24h":50292,"strategy_points_24h":90},"PostModernEra":{"money_24h":63094,"strategy_points_24h":90},"ContemporaryEra":{"money_24h":81991,"strategy_points_24h":90},"TomorrowEra":{"money_24h":95098,"strategy_points_24h":90},"FutureEra":{"money_24h":109118,"strategy_points_24h":90},"ArcticFuture":{"money_24h":123749,"strategy_points_24h":90},"OceanicFuture":{"money_24h":139598,"strategy_points_24h":90},"VirtualFuture":{"money_24h":156362,"strategy_points_24h":90},"SpaceAgeMars":{"money_24h":261214,"strategy_points_24h":90},"SpaceAgeAsteroidBelt":{"money_24h":289255,"strategy_points_24h":90},"SpaceAgeVenus":{"money_24h":319126,"strategy_points_24h":90},"SpaceAgeJupiterMoon":{"money_24h":350215,"strategy_points_24h":90},"SpaceAgeTitan":{"money_24h":384353,"strategy_points_24h":90},"SpaceAgeSpaceHub":{"money_24h":418491,"strategy_points_24h":90}}, boosts: [{"type":"att_def_boost_attacker","value":98,"feature":"all"},{"type":"att_def_boost_attacker","value":49,"feature":"battleground"},{"type":"att_def_boost_attacker","value":49,"feature":"guild_expedition"},{"type":"att_def_boost_attacker","value":30,"feature":"guild_raids"},{"type":"def_boost_defender","value":98,"feature":"all"},{"type":"def_boost_defender","value":49,"feature":"battleground"},{"type":"def_boost_defender","value":49,"feature":"guild_expedition"},{"type":"def_boost_defender","value":30,"feature":"guild_raids"},{"type":"att_boost_defender","value":140,"feature":"all"},{"type":"att_boost_defender","value":70,"feature":"battleground"},{"type":"att_boost_defender","value":70,"feature":"guild_expedition"},{"type":"att_boost_defender","value":90,"feature":"guild_raids"}] },
+    "W_MultiAge_COP24E7TEMP": { prod: {"BronzeAge":{"money_24h":8147,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":9036},"IronAge":{"money_24h":8147,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":9036},"EarlyMiddleAge":{"money_24h":13293,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":14976},"HighMiddleAge":{"money_24h":18867,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":20916},"LateMiddleAge":{"money_24h":24442,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":27805},"ColonialAge":{"money_24h":37734,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":35194},"IndustrialAge":{"money_24h":46739,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":42781},"ProgressiveEra":{"money_24h":56602,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":50170},"ModernEra":{"money_24h":70752,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":58456},"PostModernEra":{"money_24h":88762,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":66543},"ContemporaryEra":{"money_24h":115347,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":74880},"TomorrowEra":{"money_24h":133786,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":83916},"FutureEra":{"money_24h":153510,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":92252},"ArcticFuture":{"money_24h":174093,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":101038},"OceanicFuture":{"money_24h":196390,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":110772},"VirtualFuture":{"money_24h":219974,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":119808},"SpaceAgeMars":{"money_24h":367482,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":193989},"SpaceAgeAsteroidBelt":{"money_24h":406931,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":208216},"SpaceAgeVenus":{"money_24h":448954,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":223192},"SpaceAgeJupiterMoon":{"money_24h":492691,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":237469},"SpaceAgeTitan":{"money_24h":540717,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":252645},"SpaceAgeSpaceHub":{"money_24h":588743,"strategy_points_24h":130,"random_good_of_age_24h":210,"supplies_24h":267821}}, boosts: [{"type":"def_boost_defender","value":211,"feature":"all"},{"type":"def_boost_defender","value":106,"feature":"battleground"},{"type":"def_boost_defender","value":106,"feature":"guild_expedition"},{"type":"def_boost_defender","value":90,"feature":"guild_raids"},{"type":"coin_production","value":300,"feature":"all"}] },
+    "W_MultiAge_COP25K1": { prod: {"BronzeAge":{"money_24h":70,"supplies_24h":500,"medals_24h":20,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"IronAge":{"money_24h":180,"supplies_24h":1210,"medals_24h":20,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"EarlyMiddleAge":{"money_24h":300,"supplies_24h":2020,"medals_24h":30,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"HighMiddleAge":{"money_24h":410,"supplies_24h":2820,"medals_24h":30,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"LateMiddleAge":{"money_24h":550,"supplies_24h":3730,"medals_24h":40,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"ColonialAge":{"money_24h":830,"supplies_24h":4740,"medals_24h":40,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"IndustrialAge":{"money_24h":1040,"supplies_24h":5750,"medals_24h":60,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"ProgressiveEra":{"money_24h":1260,"supplies_24h":6760,"medals_24h":80,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"ModernEra":{"money_24h":1570,"supplies_24h":7870,"medals_24h":120,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"PostModernEra":{"money_24h":1970,"supplies_24h":8970,"medals_24h":160,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"ContemporaryEra":{"money_24h":2570,"supplies_24h":10080,"medals_24h":230,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"TomorrowEra":{"money_24h":2980,"supplies_24h":11290,"medals_24h":320,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"FutureEra":{"money_24h":3410,"supplies_24h":12400,"medals_24h":390,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"ArcticFuture":{"money_24h":3880,"supplies_24h":13610,"medals_24h":470,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"OceanicFuture":{"money_24h":4370,"supplies_24h":14920,"medals_24h":540,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"VirtualFuture":{"money_24h":4890,"supplies_24h":16130,"medals_24h":660,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"SpaceAgeMars":{"money_24h":8180,"supplies_24h":26120,"medals_24h":800,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"SpaceAgeAsteroidBelt":{"money_24h":9060,"supplies_24h":28030,"medals_24h":940,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"SpaceAgeVenus":{"money_24h":9980,"supplies_24h":30050,"medals_24h":1080,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"SpaceAgeJupiterMoon":{"money_24h":10960,"supplies_24h":31970,"medals_24h":1220,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"SpaceAgeTitan":{"money_24h":11980,"supplies_24h":33980,"medals_24h":1360,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5},"SpaceAgeSpaceHub":{"money_24h":13000,"supplies_24h":36000,"medals_24h":1500,"strategy_points_24h":10,"random_good_of_age_24h":25,"random_special_good_up_to_age_24h":5}}, boosts: [{"type":"def_boost_attacker","value":20,"feature":"battleground"},{"type":"def_boost_attacker","value":20,"feature":"guild_expedition"},{"type":"def_boost_attacker","value":4,"feature":"guild_raids"},{"type":"att_def_boost_defender","value":50,"feature":"battleground"},{"type":"att_def_boost_defender","value":50,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":10,"feature":"guild_raids"},{"type":"supply_production","value":20,"feature":"all"}] },
+    "W_MultiAge_COP25K2": { prod: {"BronzeAge":{"money_24h":140,"supplies_24h":1050,"medals_24h":30,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"IronAge":{"money_24h":330,"supplies_24h":2530,"medals_24h":40,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"EarlyMiddleAge":{"money_24h":540,"supplies_24h":4220,"medals_24h":50,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"HighMiddleAge":{"money_24h":760,"supplies_24h":5900,"medals_24h":60,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"LateMiddleAge":{"money_24h":1010,"supplies_24h":7800,"medals_24h":70,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"ColonialAge":{"money_24h":1530,"supplies_24h":9910,"medals_24h":90,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"IndustrialAge":{"money_24h":1910,"supplies_24h":12010,"medals_24h":120,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"ProgressiveEra":{"money_24h":2320,"supplies_24h":14120,"medals_24h":170,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"ModernEra":{"money_24h":2880,"supplies_24h":16440,"medals_24h":250,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"PostModernEra":{"money_24h":3630,"supplies_24h":18760,"medals_24h":350,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"ContemporaryEra":{"money_24h":4720,"supplies_24h":21080,"medals_24h":500,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"TomorrowEra":{"money_24h":5460,"supplies_24h":23610,"medals_24h":670,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"FutureEra":{"money_24h":6260,"supplies_24h":25930,"medals_24h":820,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"ArcticFuture":{"money_24h":7120,"supplies_24h":28460,"medals_24h":1000,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"OceanicFuture":{"money_24h":8020,"supplies_24h":31200,"medals_24h":1150,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"VirtualFuture":{"money_24h":8990,"supplies_24h":33730,"medals_24h":1390,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"SpaceAgeMars":{"money_24h":15010,"supplies_24h":54590,"medals_24h":1690,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"SpaceAgeAsteroidBelt":{"money_24h":16630,"supplies_24h":58600,"medals_24h":1990,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"SpaceAgeVenus":{"money_24h":18330,"supplies_24h":62810,"medals_24h":2290,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"SpaceAgeJupiterMoon":{"money_24h":20120,"supplies_24h":66820,"medals_24h":2590,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"SpaceAgeTitan":{"money_24h":22000,"supplies_24h":71030,"medals_24h":2890,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10},"SpaceAgeSpaceHub":{"money_24h":23880,"supplies_24h":75250,"medals_24h":3190,"strategy_points_24h":20,"random_good_of_age_24h":47,"random_special_good_up_to_age_24h":10}}, boosts: [{"type":"def_boost_attacker","value":40,"feature":"battleground"},{"type":"def_boost_attacker","value":40,"feature":"guild_expedition"},{"type":"def_boost_attacker","value":7,"feature":"guild_raids"},{"type":"att_def_boost_defender","value":95,"feature":"battleground"},{"type":"att_def_boost_defender","value":95,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":20,"feature":"guild_raids"},{"type":"supply_production","value":37,"feature":"all"}] },
+    "W_MultiAge_COP25K3": { prod: {"BronzeAge":{"money_24h":200,"supplies_24h":1600,"medals_24h":50,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"IronAge":{"money_24h":470,"supplies_24h":3850,"medals_24h":70,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"EarlyMiddleAge":{"money_24h":790,"supplies_24h":6410,"medals_24h":80,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"HighMiddleAge":{"money_24h":1110,"supplies_24h":8980,"medals_24h":100,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"LateMiddleAge":{"money_24h":1460,"supplies_24h":11870,"medals_24h":110,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"ColonialAge":{"money_24h":2230,"supplies_24h":15070,"medals_24h":140,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"IndustrialAge":{"money_24h":2780,"supplies_24h":18280,"medals_24h":190,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"ProgressiveEra":{"money_24h":3370,"supplies_24h":21490,"medals_24h":270,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"ModernEra":{"money_24h":4190,"supplies_24h":25020,"medals_24h":380,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"PostModernEra":{"money_24h":5280,"supplies_24h":28540,"medals_24h":530,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"ContemporaryEra":{"money_24h":6870,"supplies_24h":32070,"medals_24h":760,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"TomorrowEra":{"money_24h":7950,"supplies_24h":35920,"medals_24h":1030,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"FutureEra":{"money_24h":9120,"supplies_24h":39450,"medals_24h":1260,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"ArcticFuture":{"money_24h":10360,"supplies_24h":43300,"medals_24h":1520,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"OceanicFuture":{"money_24h":11680,"supplies_24h":47470,"medals_24h":1750,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"VirtualFuture":{"money_24h":13080,"supplies_24h":51320,"medals_24h":2130,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"SpaceAgeMars":{"money_24h":21850,"supplies_24h":83070,"medals_24h":2590,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"SpaceAgeAsteroidBelt":{"money_24h":24210,"supplies_24h":89160,"medals_24h":3050,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"SpaceAgeVenus":{"money_24h":26680,"supplies_24h":95580,"medals_24h":3500,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"SpaceAgeJupiterMoon":{"money_24h":29290,"supplies_24h":101670,"medals_24h":3960,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"SpaceAgeTitan":{"money_24h":32020,"supplies_24h":108090,"medals_24h":4420,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15},"SpaceAgeSpaceHub":{"money_24h":34750,"supplies_24h":114500,"medals_24h":4880,"strategy_points_24h":29,"random_good_of_age_24h":69,"random_special_good_up_to_age_24h":15}}, boosts: [{"type":"def_boost_attacker","value":60,"feature":"battleground"},{"type":"def_boost_attacker","value":60,"feature":"guild_expedition"},{"type":"def_boost_attacker","value":10,"feature":"guild_raids"},{"type":"att_def_boost_defender","value":140,"feature":"battleground"},{"type":"att_def_boost_defender","value":140,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":30,"feature":"guild_raids"},{"type":"supply_production","value":53,"feature":"all"}] },
+    "W_MultiAge_COP25K4": { prod: {"BronzeAge":{"money_24h":260,"supplies_24h":2150,"medals_24h":70,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"IronAge":{"money_24h":620,"supplies_24h":5170,"medals_24h":90,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"EarlyMiddleAge":{"money_24h":1040,"supplies_24h":8610,"medals_24h":110,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"HighMiddleAge":{"money_24h":1450,"supplies_24h":12060,"medals_24h":130,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"LateMiddleAge":{"money_24h":1920,"supplies_24h":15930,"medals_24h":150,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"ColonialAge":{"money_24h":2930,"supplies_24h":20240,"medals_24h":180,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"IndustrialAge":{"money_24h":3650,"supplies_24h":24550,"medals_24h":260,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"ProgressiveEra":{"money_24h":4430,"supplies_24h":28860,"medals_24h":360,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"ModernEra":{"money_24h":5510,"supplies_24h":33590,"medals_24h":510,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"PostModernEra":{"money_24h":6930,"supplies_24h":38330,"medals_24h":720,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"ContemporaryEra":{"money_24h":9020,"supplies_24h":43070,"medals_24h":1030,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"TomorrowEra":{"money_24h":10440,"supplies_24h":48240,"medals_24h":1380,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"FutureEra":{"money_24h":11970,"supplies_24h":52970,"medals_24h":1690,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"ArcticFuture":{"money_24h":13600,"supplies_24h":58140,"medals_24h":2050,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"OceanicFuture":{"money_24h":15340,"supplies_24h":63740,"medals_24h":2360,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"VirtualFuture":{"money_24h":17180,"supplies_24h":68910,"medals_24h":2870,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"SpaceAgeMars":{"money_24h":28690,"supplies_24h":111540,"medals_24h":3490,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"SpaceAgeAsteroidBelt":{"money_24h":31780,"supplies_24h":119730,"medals_24h":4100,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"SpaceAgeVenus":{"money_24h":35030,"supplies_24h":128340,"medals_24h":4720,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"SpaceAgeJupiterMoon":{"money_24h":38450,"supplies_24h":136520,"medals_24h":5330,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"SpaceAgeTitan":{"money_24h":42040,"supplies_24h":145140,"medals_24h":5950,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20},"SpaceAgeSpaceHub":{"money_24h":45630,"supplies_24h":153750,"medals_24h":6560,"strategy_points_24h":38,"random_good_of_age_24h":91,"random_special_good_up_to_age_24h":20}}, boosts: [{"type":"def_boost_attacker","value":80,"feature":"battleground"},{"type":"def_boost_attacker","value":80,"feature":"guild_expedition"},{"type":"def_boost_attacker","value":12,"feature":"guild_raids"},{"type":"att_def_boost_defender","value":185,"feature":"battleground"},{"type":"att_def_boost_defender","value":185,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":40,"feature":"guild_raids"},{"type":"supply_production","value":69,"feature":"all"}] },
+    "W_MultiAge_COP25K5": { prod: {"BronzeAge":{"money_24h":320,"supplies_24h":2700,"medals_24h":90,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"IronAge":{"money_24h":770,"supplies_24h":6490,"medals_24h":120,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"EarlyMiddleAge":{"money_24h":1290,"supplies_24h":10810,"medals_24h":140,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"HighMiddleAge":{"money_24h":1800,"supplies_24h":15140,"medals_24h":170,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"LateMiddleAge":{"money_24h":2380,"supplies_24h":20000,"medals_24h":190,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"ColonialAge":{"money_24h":3630,"supplies_24h":25410,"medals_24h":230,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"IndustrialAge":{"money_24h":4520,"supplies_24h":30820,"medals_24h":320,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"ProgressiveEra":{"money_24h":5480,"supplies_24h":36220,"medals_24h":450,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"ModernEra":{"money_24h":6820,"supplies_24h":42170,"medals_24h":640,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"PostModernEra":{"money_24h":8580,"supplies_24h":48110,"medals_24h":900,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"ContemporaryEra":{"money_24h":11170,"supplies_24h":54060,"medals_24h":1290,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"TomorrowEra":{"money_24h":12930,"supplies_24h":60550,"medals_24h":1740,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"FutureEra":{"money_24h":14820,"supplies_24h":66500,"medals_24h":2130,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"ArcticFuture":{"money_24h":16840,"supplies_24h":72980,"medals_24h":2580,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"OceanicFuture":{"money_24h":18990,"supplies_24h":80010,"medals_24h":2960,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"VirtualFuture":{"money_24h":21270,"supplies_24h":86500,"medals_24h":3610,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"SpaceAgeMars":{"money_24h":35530,"supplies_24h":140020,"medals_24h":4380,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"SpaceAgeAsteroidBelt":{"money_24h":39360,"supplies_24h":150290,"medals_24h":5160,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"SpaceAgeVenus":{"money_24h":43380,"supplies_24h":161100,"medals_24h":5930,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"SpaceAgeJupiterMoon":{"money_24h":47620,"supplies_24h":171380,"medals_24h":6700,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"SpaceAgeTitan":{"money_24h":52060,"supplies_24h":182190,"medals_24h":7480,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25},"SpaceAgeSpaceHub":{"money_24h":56500,"supplies_24h":193000,"medals_24h":8250,"strategy_points_24h":47,"random_good_of_age_24h":113,"random_special_good_up_to_age_24h":25}}, boosts: [{"type":"def_boost_attacker","value":100,"feature":"battleground"},{"type":"def_boost_attacker","value":100,"feature":"guild_expedition"},{"type":"def_boost_attacker","value":15,"feature":"guild_raids"},{"type":"att_def_boost_defender","value":230,"feature":"battleground"},{"type":"att_def_boost_defender","value":230,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":50,"feature":"guild_raids"},{"type":"supply_production","value":85,"feature":"all"}] },
+    "W_MultiAge_COP25K6": { prod: {"BronzeAge":{"money_24h":380,"supplies_24h":3250,"medals_24h":110,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"IronAge":{"money_24h":920,"supplies_24h":7810,"medals_24h":140,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"EarlyMiddleAge":{"money_24h":1530,"supplies_24h":13010,"medals_24h":170,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"HighMiddleAge":{"money_24h":2150,"supplies_24h":18220,"medals_24h":200,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"LateMiddleAge":{"money_24h":2840,"supplies_24h":24070,"medals_24h":230,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"ColonialAge":{"money_24h":4320,"supplies_24h":30580,"medals_24h":280,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"IndustrialAge":{"money_24h":5390,"supplies_24h":37080,"medals_24h":390,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"ProgressiveEra":{"money_24h":6540,"supplies_24h":43590,"medals_24h":540,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"ModernEra":{"money_24h":8130,"supplies_24h":50740,"medals_24h":780,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"PostModernEra":{"money_24h":10230,"supplies_24h":57900,"medals_24h":1090,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"ContemporaryEra":{"money_24h":13320,"supplies_24h":65060,"medals_24h":1550,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"TomorrowEra":{"money_24h":15420,"supplies_24h":72860,"medals_24h":2100,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"FutureEra":{"money_24h":17680,"supplies_24h":80020,"medals_24h":2560,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"ArcticFuture":{"money_24h":20080,"supplies_24h":87830,"medals_24h":3110,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"OceanicFuture":{"money_24h":22650,"supplies_24h":96280,"medals_24h":3570,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"VirtualFuture":{"money_24h":25370,"supplies_24h":104090,"medals_24h":4350,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"SpaceAgeMars":{"money_24h":42370,"supplies_24h":168500,"medals_24h":5280,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"SpaceAgeAsteroidBelt":{"money_24h":46930,"supplies_24h":180860,"medals_24h":6210,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"SpaceAgeVenus":{"money_24h":51730,"supplies_24h":193870,"medals_24h":7140,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"SpaceAgeJupiterMoon":{"money_24h":56780,"supplies_24h":206230,"medals_24h":8070,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"SpaceAgeTitan":{"money_24h":62080,"supplies_24h":219240,"medals_24h":9010,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30},"SpaceAgeSpaceHub":{"money_24h":67380,"supplies_24h":232250,"medals_24h":9940,"strategy_points_24h":57,"random_good_of_age_24h":135,"random_special_good_up_to_age_24h":30}}, boosts: [{"type":"def_boost_attacker","value":120,"feature":"battleground"},{"type":"def_boost_attacker","value":120,"feature":"guild_expedition"},{"type":"def_boost_attacker","value":18,"feature":"guild_raids"},{"type":"att_def_boost_defender","value":275,"feature":"battleground"},{"type":"att_def_boost_defender","value":275,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":60,"feature":"guild_raids"},{"type":"supply_production","value":102,"feature":"all"}] },
+    "W_MultiAge_COP25K7": { prod: {"BronzeAge":{"money_24h":450,"supplies_24h":3800,"medals_24h":130,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"IronAge":{"money_24h":1070,"supplies_24h":9130,"medals_24h":160,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"EarlyMiddleAge":{"money_24h":1780,"supplies_24h":15210,"medals_24h":200,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"HighMiddleAge":{"money_24h":2490,"supplies_24h":21290,"medals_24h":240,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"LateMiddleAge":{"money_24h":3300,"supplies_24h":28140,"medals_24h":270,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"ColonialAge":{"money_24h":5020,"supplies_24h":35740,"medals_24h":330,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"IndustrialAge":{"money_24h":6250,"supplies_24h":43350,"medals_24h":450,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"ProgressiveEra":{"money_24h":7590,"supplies_24h":50950,"medals_24h":640,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"ModernEra":{"money_24h":9440,"supplies_24h":59320,"medals_24h":910,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"PostModernEra":{"money_24h":11880,"supplies_24h":67680,"medals_24h":1270,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"ContemporaryEra":{"money_24h":15470,"supplies_24h":76050,"medals_24h":1820,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"TomorrowEra":{"money_24h":17910,"supplies_24h":85180,"medals_24h":2450,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"FutureEra":{"money_24h":20530,"supplies_24h":93540,"medals_24h":3000,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"ArcticFuture":{"money_24h":23330,"supplies_24h":102670,"medals_24h":3630,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"OceanicFuture":{"money_24h":26300,"supplies_24h":112550,"medals_24h":4180,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"VirtualFuture":{"money_24h":29460,"supplies_24h":121680,"medals_24h":5090,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"SpaceAgeMars":{"money_24h":49210,"supplies_24h":196970,"medals_24h":6180,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"SpaceAgeAsteroidBelt":{"money_24h":54510,"supplies_24h":211420,"medals_24h":7270,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"SpaceAgeVenus":{"money_24h":60080,"supplies_24h":226630,"medals_24h":8360,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"SpaceAgeJupiterMoon":{"money_24h":65950,"supplies_24h":241080,"medals_24h":9450,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"SpaceAgeTitan":{"money_24h":72100,"supplies_24h":256290,"medals_24h":10540,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35},"SpaceAgeSpaceHub":{"money_24h":78250,"supplies_24h":271500,"medals_24h":11630,"strategy_points_24h":66,"random_good_of_age_24h":157,"random_special_good_up_to_age_24h":35}}, boosts: [{"type":"def_boost_attacker","value":140,"feature":"battleground"},{"type":"def_boost_attacker","value":140,"feature":"guild_expedition"},{"type":"def_boost_attacker","value":20,"feature":"guild_raids"},{"type":"att_def_boost_defender","value":320,"feature":"battleground"},{"type":"att_def_boost_defender","value":320,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":70,"feature":"guild_raids"},{"type":"supply_production","value":118,"feature":"all"}] },
+    "W_MultiAge_COP25K8": { prod: {"BronzeAge":{"money_24h":510,"supplies_24h":4350,"medals_24h":150,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"IronAge":{"money_24h":1220,"supplies_24h":10450,"medals_24h":190,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"EarlyMiddleAge":{"money_24h":2030,"supplies_24h":17410,"medals_24h":230,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"HighMiddleAge":{"money_24h":2840,"supplies_24h":24370,"medals_24h":270,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"LateMiddleAge":{"money_24h":3750,"supplies_24h":32210,"medals_24h":310,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"ColonialAge":{"money_24h":5720,"supplies_24h":40910,"medals_24h":370,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"IndustrialAge":{"money_24h":7120,"supplies_24h":49620,"medals_24h":520,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"ProgressiveEra":{"money_24h":8650,"supplies_24h":58320,"medals_24h":730,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"ModernEra":{"money_24h":10760,"supplies_24h":67890,"medals_24h":1040,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"PostModernEra":{"money_24h":13530,"supplies_24h":77470,"medals_24h":1460,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"ContemporaryEra":{"money_24h":17620,"supplies_24h":87040,"medals_24h":2080,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"TomorrowEra":{"money_24h":20400,"supplies_24h":97490,"medals_24h":2810,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"FutureEra":{"money_24h":23380,"supplies_24h":107070,"medals_24h":3430,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"ArcticFuture":{"money_24h":26570,"supplies_24h":117510,"medals_24h":4160,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"OceanicFuture":{"money_24h":29960,"supplies_24h":128830,"medals_24h":4780,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"VirtualFuture":{"money_24h":33550,"supplies_24h":139270,"medals_24h":5820,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"SpaceAgeMars":{"money_24h":56050,"supplies_24h":225450,"medals_24h":7070,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"SpaceAgeAsteroidBelt":{"money_24h":62080,"supplies_24h":241980,"medals_24h":8320,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"SpaceAgeVenus":{"money_24h":68430,"supplies_24h":259390,"medals_24h":9570,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"SpaceAgeJupiterMoon":{"money_24h":75110,"supplies_24h":275930,"medals_24h":10820,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"SpaceAgeTitan":{"money_24h":82120,"supplies_24h":293340,"medals_24h":12060,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40},"SpaceAgeSpaceHub":{"money_24h":89130,"supplies_24h":310750,"medals_24h":13310,"strategy_points_24h":75,"random_good_of_age_24h":179,"random_special_good_up_to_age_24h":40}}, boosts: [{"type":"def_boost_attacker","value":160,"feature":"battleground"},{"type":"def_boost_attacker","value":160,"feature":"guild_expedition"},{"type":"def_boost_attacker","value":23,"feature":"guild_raids"},{"type":"att_def_boost_defender","value":365,"feature":"battleground"},{"type":"att_def_boost_defender","value":365,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":80,"feature":"guild_raids"},{"type":"supply_production","value":134,"feature":"all"}] },
+    "W_MultiAge_COP25K9": { prod: {"BronzeAge":{"money_24h":570,"supplies_24h":4900,"medals_24h":160,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"IronAge":{"money_24h":1370,"supplies_24h":11760,"medals_24h":210,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"EarlyMiddleAge":{"money_24h":2280,"supplies_24h":19610,"medals_24h":260,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"HighMiddleAge":{"money_24h":3190,"supplies_24h":27450,"medals_24h":300,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"LateMiddleAge":{"money_24h":4210,"supplies_24h":36270,"medals_24h":350,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"ColonialAge":{"money_24h":6420,"supplies_24h":46080,"medals_24h":420,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"IndustrialAge":{"money_24h":7990,"supplies_24h":55880,"medals_24h":590,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"ProgressiveEra":{"money_24h":9700,"supplies_24h":65690,"medals_24h":820,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"ModernEra":{"money_24h":12070,"supplies_24h":76470,"medals_24h":1170,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"PostModernEra":{"money_24h":15180,"supplies_24h":87250,"medals_24h":1640,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"ContemporaryEra":{"money_24h":19770,"supplies_24h":98040,"medals_24h":2340,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"TomorrowEra":{"money_24h":22890,"supplies_24h":109800,"medals_24h":3160,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"FutureEra":{"money_24h":26230,"supplies_24h":120590,"medals_24h":3870,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"ArcticFuture":{"money_24h":29810,"supplies_24h":132350,"medals_24h":4690,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"OceanicFuture":{"money_24h":33610,"supplies_24h":145100,"medals_24h":5390,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"VirtualFuture":{"money_24h":37650,"supplies_24h":156860,"medals_24h":6560,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"SpaceAgeMars":{"money_24h":62890,"supplies_24h":253920,"medals_24h":7970,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"SpaceAgeAsteroidBelt":{"money_24h":69660,"supplies_24h":272550,"medals_24h":9380,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"SpaceAgeVenus":{"money_24h":76780,"supplies_24h":292160,"medals_24h":10780,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"SpaceAgeJupiterMoon":{"money_24h":84280,"supplies_24h":310780,"medals_24h":12190,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"SpaceAgeTitan":{"money_24h":92140,"supplies_24h":330390,"medals_24h":13590,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20},"SpaceAgeSpaceHub":{"money_24h":100000,"supplies_24h":350000,"medals_24h":15000,"strategy_points_24h":84,"random_good_of_age_24h":200,"random_special_good_up_to_age_24h":45,"units_24h":20}}, boosts: [{"type":"def_boost_attacker","value":180,"feature":"battleground"},{"type":"def_boost_attacker","value":180,"feature":"guild_expedition"},{"type":"def_boost_attacker","value":25,"feature":"guild_raids"},{"type":"att_def_boost_defender","value":410,"feature":"battleground"},{"type":"att_def_boost_defender","value":410,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":90,"feature":"guild_raids"},{"type":"supply_production","value":150,"feature":"all"}] },
+    "W_MultiAge_COP24C1": { prod: {"BronzeAge":{"money_24h":764,"strategy_points_24h":12,"units_24h":2},"IronAge":{"money_24h":764,"strategy_points_24h":12,"units_24h":2},"EarlyMiddleAge":{"money_24h":1246,"strategy_points_24h":12,"units_24h":2},"HighMiddleAge":{"money_24h":1769,"strategy_points_24h":12,"units_24h":2},"LateMiddleAge":{"money_24h":2291,"strategy_points_24h":12,"units_24h":2},"ColonialAge":{"money_24h":3538,"strategy_points_24h":12,"units_24h":2},"IndustrialAge":{"money_24h":4382,"strategy_points_24h":12,"units_24h":2},"ProgressiveEra":{"money_24h":5306,"strategy_points_24h":12,"units_24h":2},"ModernEra":{"money_24h":6633,"strategy_points_24h":12,"units_24h":2},"PostModernEra":{"money_24h":8321,"strategy_points_24h":12,"units_24h":2},"ContemporaryEra":{"money_24h":10814,"strategy_points_24h":12,"units_24h":2},"TomorrowEra":{"money_24h":12542,"strategy_points_24h":12,"units_24h":2},"FutureEra":{"money_24h":14392,"strategy_points_24h":12,"units_24h":2},"ArcticFuture":{"money_24h":16321,"strategy_points_24h":12,"units_24h":2},"OceanicFuture":{"money_24h":18412,"strategy_points_24h":12,"units_24h":2},"VirtualFuture":{"money_24h":20623,"strategy_points_24h":12,"units_24h":2},"SpaceAgeMars":{"money_24h":34451,"strategy_points_24h":12,"units_24h":2},"SpaceAgeAsteroidBelt":{"money_24h":38150,"strategy_points_24h":12,"units_24h":2},"SpaceAgeVenus":{"money_24h":42089,"strategy_points_24h":12,"units_24h":2},"SpaceAgeJupiterMoon":{"money_24h":46190,"strategy_points_24h":12,"units_24h":2},"SpaceAgeTitan":{"money_24h":50692,"strategy_points_24h":12,"units_24h":2},"SpaceAgeSpaceHub":{"money_24h":55194,"strategy_points_24h":12,"units_24h":2}}, boosts: [{"type":"att_def_boost_attacker","value":12,"feature":"all"},{"type":"att_def_boost_attacker","value":7,"feature":"battleground"},{"type":"att_def_boost_attacker","value":7,"feature":"guild_expedition"},{"type":"def_boost_defender","value":12,"feature":"all"},{"type":"def_boost_defender","value":7,"feature":"battleground"},{"type":"def_boost_defender","value":7,"feature":"guild_expedition"},{"type":"att_boost_defender","value":17,"feature":"all"},{"type":"att_boost_defender","value":8,"feature":"battleground"},{"type":"att_boost_defender","value":8,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24C2": { prod: {"BronzeAge":{"money_24h":1573,"strategy_points_24h":24,"units_24h":6},"IronAge":{"money_24h":1573,"strategy_points_24h":24,"units_24h":6},"EarlyMiddleAge":{"money_24h":2567,"strategy_points_24h":24,"units_24h":6},"HighMiddleAge":{"money_24h":3643,"strategy_points_24h":24,"units_24h":6},"LateMiddleAge":{"money_24h":4720,"strategy_points_24h":24,"units_24h":6},"ColonialAge":{"money_24h":7286,"strategy_points_24h":24,"units_24h":6},"IndustrialAge":{"money_24h":9025,"strategy_points_24h":24,"units_24h":6},"ProgressiveEra":{"money_24h":10930,"strategy_points_24h":24,"units_24h":6},"ModernEra":{"money_24h":13662,"strategy_points_24h":24,"units_24h":6},"PostModernEra":{"money_24h":17140,"strategy_points_24h":24,"units_24h":6},"ContemporaryEra":{"money_24h":22273,"strategy_points_24h":24,"units_24h":6},"TomorrowEra":{"money_24h":25834,"strategy_points_24h":24,"units_24h":6},"FutureEra":{"money_24h":29642,"strategy_points_24h":24,"units_24h":6},"ArcticFuture":{"money_24h":33617,"strategy_points_24h":24,"units_24h":6},"OceanicFuture":{"money_24h":37922,"strategy_points_24h":24,"units_24h":6},"VirtualFuture":{"money_24h":42476,"strategy_points_24h":24,"units_24h":6},"SpaceAgeMars":{"money_24h":70960,"strategy_points_24h":24,"units_24h":6},"SpaceAgeAsteroidBelt":{"money_24h":78577,"strategy_points_24h":24,"units_24h":6},"SpaceAgeVenus":{"money_24h":86692,"strategy_points_24h":24,"units_24h":6},"SpaceAgeJupiterMoon":{"money_24h":95137,"strategy_points_24h":24,"units_24h":6},"SpaceAgeTitan":{"money_24h":104411,"strategy_points_24h":24,"units_24h":6},"SpaceAgeSpaceHub":{"money_24h":113685,"strategy_points_24h":24,"units_24h":6}}, boosts: [{"type":"att_def_boost_attacker","value":26,"feature":"all"},{"type":"att_def_boost_attacker","value":14,"feature":"battleground"},{"type":"att_def_boost_attacker","value":14,"feature":"guild_expedition"},{"type":"def_boost_defender","value":26,"feature":"all"},{"type":"def_boost_defender","value":14,"feature":"battleground"},{"type":"def_boost_defender","value":14,"feature":"guild_expedition"},{"type":"att_boost_defender","value":37,"feature":"all"},{"type":"att_boost_defender","value":18,"feature":"battleground"},{"type":"att_boost_defender","value":18,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24C3": { prod: {"BronzeAge":{"money_24h":2394,"strategy_points_24h":37,"units_24h":9},"IronAge":{"money_24h":2394,"strategy_points_24h":37,"units_24h":9},"EarlyMiddleAge":{"money_24h":3906,"strategy_points_24h":37,"units_24h":9},"HighMiddleAge":{"money_24h":5544,"strategy_points_24h":37,"units_24h":9},"LateMiddleAge":{"money_24h":7182,"strategy_points_24h":37,"units_24h":9},"ColonialAge":{"money_24h":11088,"strategy_points_24h":37,"units_24h":9},"IndustrialAge":{"money_24h":13734,"strategy_points_24h":37,"units_24h":9},"ProgressiveEra":{"money_24h":16632,"strategy_points_24h":37,"units_24h":9},"ModernEra":{"money_24h":20790,"strategy_points_24h":37,"units_24h":9},"PostModernEra":{"money_24h":26082,"strategy_points_24h":37,"units_24h":9},"ContemporaryEra":{"money_24h":33894,"strategy_points_24h":37,"units_24h":9},"TomorrowEra":{"money_24h":39312,"strategy_points_24h":37,"units_24h":9},"FutureEra":{"money_24h":45108,"strategy_points_24h":37,"units_24h":9},"ArcticFuture":{"money_24h":51156,"strategy_points_24h":37,"units_24h":9},"OceanicFuture":{"money_24h":57708,"strategy_points_24h":37,"units_24h":9},"VirtualFuture":{"money_24h":64638,"strategy_points_24h":37,"units_24h":9},"SpaceAgeMars":{"money_24h":107982,"strategy_points_24h":37,"units_24h":9},"SpaceAgeAsteroidBelt":{"money_24h":119574,"strategy_points_24h":37,"units_24h":9},"SpaceAgeVenus":{"money_24h":131922,"strategy_points_24h":37,"units_24h":9},"SpaceAgeJupiterMoon":{"money_24h":144774,"strategy_points_24h":37,"units_24h":9},"SpaceAgeTitan":{"money_24h":158886,"strategy_points_24h":37,"units_24h":9},"SpaceAgeSpaceHub":{"money_24h":172998,"strategy_points_24h":37,"units_24h":9}}, boosts: [{"type":"att_def_boost_attacker","value":40,"feature":"all"},{"type":"att_def_boost_attacker","value":20,"feature":"battleground"},{"type":"att_def_boost_attacker","value":20,"feature":"guild_expedition"},{"type":"def_boost_defender","value":40,"feature":"all"},{"type":"def_boost_defender","value":20,"feature":"battleground"},{"type":"def_boost_defender","value":20,"feature":"guild_expedition"},{"type":"att_boost_defender","value":57,"feature":"all"},{"type":"att_boost_defender","value":28,"feature":"battleground"},{"type":"att_boost_defender","value":28,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24C4": { prod: {"BronzeAge":{"money_24h":3203,"strategy_points_24h":49,"units_24h":13},"IronAge":{"money_24h":3203,"strategy_points_24h":49,"units_24h":13},"EarlyMiddleAge":{"money_24h":5227,"strategy_points_24h":49,"units_24h":13},"HighMiddleAge":{"money_24h":7418,"strategy_points_24h":49,"units_24h":13},"LateMiddleAge":{"money_24h":9610,"strategy_points_24h":49,"units_24h":13},"ColonialAge":{"money_24h":14837,"strategy_points_24h":49,"units_24h":13},"IndustrialAge":{"money_24h":18377,"strategy_points_24h":49,"units_24h":13},"ProgressiveEra":{"money_24h":22255,"strategy_points_24h":49,"units_24h":13},"ModernEra":{"money_24h":27819,"strategy_points_24h":49,"units_24h":13},"PostModernEra":{"money_24h":34900,"strategy_points_24h":49,"units_24h":13},"ContemporaryEra":{"money_24h":45353,"strategy_points_24h":49,"units_24h":13},"TomorrowEra":{"money_24h":52603,"strategy_points_24h":49,"units_24h":13},"FutureEra":{"money_24h":60359,"strategy_points_24h":49,"units_24h":13},"ArcticFuture":{"money_24h":68452,"strategy_points_24h":49,"units_24h":13},"OceanicFuture":{"money_24h":77219,"strategy_points_24h":49,"units_24h":13},"VirtualFuture":{"money_24h":86492,"strategy_points_24h":49,"units_24h":13},"SpaceAgeMars":{"money_24h":144490,"strategy_points_24h":49,"units_24h":13},"SpaceAgeAsteroidBelt":{"money_24h":160001,"strategy_points_24h":49,"units_24h":13},"SpaceAgeVenus":{"money_24h":176524,"strategy_points_24h":49,"units_24h":13},"SpaceAgeJupiterMoon":{"money_24h":193721,"strategy_points_24h":49,"units_24h":13},"SpaceAgeTitan":{"money_24h":212605,"strategy_points_24h":49,"units_24h":13},"SpaceAgeSpaceHub":{"money_24h":231489,"strategy_points_24h":49,"units_24h":13}}, boosts: [{"type":"att_def_boost_attacker","value":54,"feature":"all"},{"type":"att_def_boost_attacker","value":27,"feature":"battleground"},{"type":"att_def_boost_attacker","value":27,"feature":"guild_expedition"},{"type":"def_boost_defender","value":54,"feature":"all"},{"type":"def_boost_defender","value":27,"feature":"battleground"},{"type":"def_boost_defender","value":27,"feature":"guild_expedition"},{"type":"att_boost_defender","value":77,"feature":"all"},{"type":"att_boost_defender","value":38,"feature":"battleground"},{"type":"att_boost_defender","value":38,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24C5": { prod: {"BronzeAge":{"money_24h":4013,"strategy_points_24h":62,"units_24h":16},"IronAge":{"money_24h":4013,"strategy_points_24h":62,"units_24h":16},"EarlyMiddleAge":{"money_24h":6547,"strategy_points_24h":62,"units_24h":16},"HighMiddleAge":{"money_24h":9293,"strategy_points_24h":62,"units_24h":16},"LateMiddleAge":{"money_24h":12038,"strategy_points_24h":62,"units_24h":16},"ColonialAge":{"money_24h":18586,"strategy_points_24h":62,"units_24h":16},"IndustrialAge":{"money_24h":23021,"strategy_points_24h":62,"units_24h":16},"ProgressiveEra":{"money_24h":27878,"strategy_points_24h":62,"units_24h":16},"ModernEra":{"money_24h":34848,"strategy_points_24h":62,"units_24h":16},"PostModernEra":{"money_24h":43718,"strategy_points_24h":62,"units_24h":16},"ContemporaryEra":{"money_24h":56813,"strategy_points_24h":62,"units_24h":16},"TomorrowEra":{"money_24h":65894,"strategy_points_24h":62,"units_24h":16},"FutureEra":{"money_24h":75610,"strategy_points_24h":62,"units_24h":16},"ArcticFuture":{"money_24h":85747,"strategy_points_24h":62,"units_24h":16},"OceanicFuture":{"money_24h":96730,"strategy_points_24h":62,"units_24h":16},"VirtualFuture":{"money_24h":108346,"strategy_points_24h":62,"units_24h":16},"SpaceAgeMars":{"money_24h":180998,"strategy_points_24h":62,"units_24h":16},"SpaceAgeAsteroidBelt":{"money_24h":200429,"strategy_points_24h":62,"units_24h":16},"SpaceAgeVenus":{"money_24h":221126,"strategy_points_24h":62,"units_24h":16},"SpaceAgeJupiterMoon":{"money_24h":242669,"strategy_points_24h":62,"units_24h":16},"SpaceAgeTitan":{"money_24h":266323,"strategy_points_24h":62,"units_24h":16},"SpaceAgeSpaceHub":{"money_24h":289977,"strategy_points_24h":62,"units_24h":16}}, boosts: [{"type":"att_def_boost_attacker","value":68,"feature":"all"},{"type":"att_def_boost_attacker","value":34,"feature":"battleground"},{"type":"att_def_boost_attacker","value":34,"feature":"guild_expedition"},{"type":"def_boost_defender","value":68,"feature":"all"},{"type":"def_boost_defender","value":34,"feature":"battleground"},{"type":"def_boost_defender","value":34,"feature":"guild_expedition"},{"type":"att_boost_defender","value":97,"feature":"all"},{"type":"att_boost_defender","value":48,"feature":"battleground"},{"type":"att_boost_defender","value":48,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24C6": { prod: {"BronzeAge":{"money_24h":4822,"strategy_points_24h":74,"units_24h":20},"IronAge":{"money_24h":4822,"strategy_points_24h":74,"units_24h":20},"EarlyMiddleAge":{"money_24h":7868,"strategy_points_24h":74,"units_24h":20},"HighMiddleAge":{"money_24h":11167,"strategy_points_24h":74,"units_24h":20},"LateMiddleAge":{"money_24h":14467,"strategy_points_24h":74,"units_24h":20},"ColonialAge":{"money_24h":22334,"strategy_points_24h":74,"units_24h":20},"IndustrialAge":{"money_24h":27664,"strategy_points_24h":74,"units_24h":20},"ProgressiveEra":{"money_24h":33502,"strategy_points_24h":74,"units_24h":20},"ModernEra":{"money_24h":41877,"strategy_points_24h":74,"units_24h":20},"PostModernEra":{"money_24h":52537,"strategy_points_24h":74,"units_24h":20},"ContemporaryEra":{"money_24h":68272,"strategy_points_24h":74,"units_24h":20},"TomorrowEra":{"money_24h":79186,"strategy_points_24h":74,"units_24h":20},"FutureEra":{"money_24h":90860,"strategy_points_24h":74,"units_24h":20},"ArcticFuture":{"money_24h":103043,"strategy_points_24h":74,"units_24h":20},"OceanicFuture":{"money_24h":116240,"strategy_points_24h":74,"units_24h":20},"VirtualFuture":{"money_24h":130199,"strategy_points_24h":74,"units_24h":20},"SpaceAgeMars":{"money_24h":217507,"strategy_points_24h":74,"units_24h":20},"SpaceAgeAsteroidBelt":{"money_24h":240856,"strategy_points_24h":74,"units_24h":20},"SpaceAgeVenus":{"money_24h":265729,"strategy_points_24h":74,"units_24h":20},"SpaceAgeJupiterMoon":{"money_24h":291616,"strategy_points_24h":74,"units_24h":20},"SpaceAgeTitan":{"money_24h":320042,"strategy_points_24h":74,"units_24h":20},"SpaceAgeSpaceHub":{"money_24h":348468,"strategy_points_24h":74,"units_24h":20}}, boosts: [{"type":"att_def_boost_attacker","value":82,"feature":"all"},{"type":"att_def_boost_attacker","value":40,"feature":"battleground"},{"type":"att_def_boost_attacker","value":40,"feature":"guild_expedition"},{"type":"att_def_boost_attacker","value":20,"feature":"guild_raids"},{"type":"def_boost_defender","value":82,"feature":"all"},{"type":"def_boost_defender","value":40,"feature":"battleground"},{"type":"def_boost_defender","value":40,"feature":"guild_expedition"},{"type":"def_boost_defender","value":20,"feature":"guild_raids"},{"type":"att_boost_defender","value":117,"feature":"all"},{"type":"att_boost_defender","value":58,"feature":"battleground"},{"type":"att_boost_defender","value":58,"feature":"guild_expedition"},{"type":"att_boost_defender","value":60,"feature":"guild_raids"}] },
+    "W_MultiAge_COP24E1": { prod: {"BronzeAge":{"money_24h":2645,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":3939},"IronAge":{"money_24h":2645,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":3939},"EarlyMiddleAge":{"money_24h":4315,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":6528},"HighMiddleAge":{"money_24h":6125,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":9117},"LateMiddleAge":{"money_24h":7934,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":12120},"ColonialAge":{"money_24h":12250,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":15341},"IndustrialAge":{"money_24h":15173,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":18648},"ProgressiveEra":{"money_24h":18374,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":21869},"ModernEra":{"money_24h":22968,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":25481},"PostModernEra":{"money_24h":28814,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":29006},"ContemporaryEra":{"money_24h":37445,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":32640},"TomorrowEra":{"money_24h":43430,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":36579},"FutureEra":{"money_24h":49834,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":40212},"ArcticFuture":{"money_24h":56515,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":44042},"OceanicFuture":{"money_24h":63754,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":48285},"VirtualFuture":{"money_24h":71410,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":52224},"SpaceAgeMars":{"money_24h":119294,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":84559},"SpaceAgeAsteroidBelt":{"money_24h":132101,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":90761},"SpaceAgeVenus":{"money_24h":145742,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":97289},"SpaceAgeJupiterMoon":{"money_24h":159941,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":103512},"SpaceAgeTitan":{"money_24h":175531,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":110127},"SpaceAgeSpaceHub":{"money_24h":191121,"strategy_points_24h":20,"random_good_of_age_24h":25,"supplies_24h":116742}}, boosts: [{"type":"def_boost_defender","value":25,"feature":"all"},{"type":"def_boost_defender","value":15,"feature":"battleground"},{"type":"def_boost_defender","value":15,"feature":"guild_expedition"},{"type":"coin_production","value":50,"feature":"all"}] },
+    "W_MultiAge_COP24E2": { prod: {"BronzeAge":{"money_24h":3466,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":4663},"IronAge":{"money_24h":3466,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":4663},"EarlyMiddleAge":{"money_24h":5654,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":7728},"HighMiddleAge":{"money_24h":8026,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":10793},"LateMiddleAge":{"money_24h":10397,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":14348},"ColonialAge":{"money_24h":16051,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":18161},"IndustrialAge":{"money_24h":19882,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":22076},"ProgressiveEra":{"money_24h":24077,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":25889},"ModernEra":{"money_24h":30096,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":30165},"PostModernEra":{"money_24h":37757,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":34338},"ContemporaryEra":{"money_24h":49066,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":38640},"TomorrowEra":{"money_24h":56909,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":43303},"FutureEra":{"money_24h":65299,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":47604},"ArcticFuture":{"money_24h":74054,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":52138},"OceanicFuture":{"money_24h":83539,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":57161},"VirtualFuture":{"money_24h":93571,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":61824},"SpaceAgeMars":{"money_24h":156317,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":100103},"SpaceAgeAsteroidBelt":{"money_24h":173098,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":107445},"SpaceAgeVenus":{"money_24h":190973,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":115173},"SpaceAgeJupiterMoon":{"money_24h":209578,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":122540},"SpaceAgeTitan":{"money_24h":230006,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":130371},"SpaceAgeSpaceHub":{"money_24h":250434,"strategy_points_24h":38,"random_good_of_age_24h":50,"supplies_24h":138202}}, boosts: [{"type":"def_boost_defender","value":55,"feature":"all"},{"type":"def_boost_defender","value":30,"feature":"battleground"},{"type":"def_boost_defender","value":30,"feature":"guild_expedition"},{"type":"coin_production","value":90,"feature":"all"}] },
+    "W_MultiAge_COP24E3": { prod: {"BronzeAge":{"money_24h":4302,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":5387},"IronAge":{"money_24h":4302,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":5387},"EarlyMiddleAge":{"money_24h":7018,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":8928},"HighMiddleAge":{"money_24h":9962,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":12469},"LateMiddleAge":{"money_24h":12905,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":16576},"ColonialAge":{"money_24h":19923,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":20981},"IndustrialAge":{"money_24h":24678,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":25504},"ProgressiveEra":{"money_24h":29885,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":29909},"ModernEra":{"money_24h":37356,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":34849},"PostModernEra":{"money_24h":46865,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":39670},"ContemporaryEra":{"money_24h":60902,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":44640},"TomorrowEra":{"money_24h":70637,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":50027},"FutureEra":{"money_24h":81051,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":54996},"ArcticFuture":{"money_24h":91918,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":60234},"OceanicFuture":{"money_24h":103691,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":66037},"VirtualFuture":{"money_24h":116143,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":71424},"SpaceAgeMars":{"money_24h":194025,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":115647},"SpaceAgeAsteroidBelt":{"money_24h":214854,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":124129},"SpaceAgeVenus":{"money_24h":237041,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":133057},"SpaceAgeJupiterMoon":{"money_24h":260134,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":141568},"SpaceAgeTitan":{"money_24h":285490,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":150615},"SpaceAgeSpaceHub":{"money_24h":310846,"strategy_points_24h":55,"random_good_of_age_24h":75,"supplies_24h":159662}}, boosts: [{"type":"def_boost_defender","value":85,"feature":"all"},{"type":"def_boost_defender","value":44,"feature":"battleground"},{"type":"def_boost_defender","value":44,"feature":"guild_expedition"},{"type":"coin_production","value":130,"feature":"all"}] },
+    "W_MultiAge_COP24E4": { prod: {"BronzeAge":{"money_24h":5138,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":6082},"IronAge":{"money_24h":5138,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":6082},"EarlyMiddleAge":{"money_24h":8382,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":10080},"HighMiddleAge":{"money_24h":11898,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":14078},"LateMiddleAge":{"money_24h":15413,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":18715},"ColonialAge":{"money_24h":23795,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":23688},"IndustrialAge":{"money_24h":29474,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":28795},"ProgressiveEra":{"money_24h":35693,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":33768},"ModernEra":{"money_24h":44616,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":39346},"PostModernEra":{"money_24h":55973,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":44789},"ContemporaryEra":{"money_24h":72738,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":50400},"TomorrowEra":{"money_24h":84365,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":56482},"FutureEra":{"money_24h":96803,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":62093},"ArcticFuture":{"money_24h":109782,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":68006},"OceanicFuture":{"money_24h":123843,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":74558},"VirtualFuture":{"money_24h":138715,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":80640},"SpaceAgeMars":{"money_24h":231733,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":130570},"SpaceAgeAsteroidBelt":{"money_24h":256610,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":140146},"SpaceAgeVenus":{"money_24h":283109,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":150226},"SpaceAgeJupiterMoon":{"money_24h":310690,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":159835},"SpaceAgeTitan":{"money_24h":340974,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":170050},"SpaceAgeSpaceHub":{"money_24h":371258,"strategy_points_24h":73,"random_good_of_age_24h":105,"supplies_24h":180265}}, boosts: [{"type":"def_boost_defender","value":115,"feature":"all"},{"type":"def_boost_defender","value":59,"feature":"battleground"},{"type":"def_boost_defender","value":59,"feature":"guild_expedition"},{"type":"coin_production","value":170,"feature":"all"}] },
+    "W_MultiAge_COP24E5": { prod: {"BronzeAge":{"money_24h":5958,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":6806},"IronAge":{"money_24h":5958,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":6806},"EarlyMiddleAge":{"money_24h":9722,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":11280},"HighMiddleAge":{"money_24h":13798,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":15754},"LateMiddleAge":{"money_24h":17875,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":20943},"ColonialAge":{"money_24h":27597,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":26508},"IndustrialAge":{"money_24h":34182,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":32223},"ProgressiveEra":{"money_24h":41395,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":37788},"ModernEra":{"money_24h":51744,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":44030},"PostModernEra":{"money_24h":64915,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":50121},"ContemporaryEra":{"money_24h":84358,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":56400},"TomorrowEra":{"money_24h":97843,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":63206},"FutureEra":{"money_24h":112269,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":69485},"ArcticFuture":{"money_24h":127322,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":76102},"OceanicFuture":{"money_24h":143629,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":83434},"VirtualFuture":{"money_24h":160877,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":90240},"SpaceAgeMars":{"money_24h":268755,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":146114},"SpaceAgeAsteroidBelt":{"money_24h":297606,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":156830},"SpaceAgeVenus":{"money_24h":328339,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":168110},"SpaceAgeJupiterMoon":{"money_24h":360326,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":178863},"SpaceAgeTitan":{"money_24h":395450,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":190294},"SpaceAgeSpaceHub":{"money_24h":430574,"strategy_points_24h":91,"random_good_of_age_24h":130,"supplies_24h":201725}}, boosts: [{"type":"def_boost_defender","value":145,"feature":"all"},{"type":"def_boost_defender","value":73,"feature":"battleground"},{"type":"def_boost_defender","value":73,"feature":"guild_expedition"},{"type":"coin_production","value":210,"feature":"all"}] },
+    "W_MultiAge_COP24E6": { prod: {"BronzeAge":{"money_24h":6794,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":7530},"IronAge":{"money_24h":6794,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":7530},"EarlyMiddleAge":{"money_24h":11086,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":12480},"HighMiddleAge":{"money_24h":15734,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":17430},"LateMiddleAge":{"money_24h":20383,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":23171},"ColonialAge":{"money_24h":31469,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":29328},"IndustrialAge":{"money_24h":38978,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":35651},"ProgressiveEra":{"money_24h":47203,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":41808},"ModernEra":{"money_24h":59004,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":48714},"PostModernEra":{"money_24h":74023,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":55453},"ContemporaryEra":{"money_24h":96194,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":62400},"TomorrowEra":{"money_24h":111571,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":69930},"FutureEra":{"money_24h":128021,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":76877},"ArcticFuture":{"money_24h":145186,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":84198},"OceanicFuture":{"money_24h":163781,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":92310},"VirtualFuture":{"money_24h":183449,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":99840},"SpaceAgeMars":{"money_24h":306463,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":161658},"SpaceAgeAsteroidBelt":{"money_24h":339362,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":173514},"SpaceAgeVenus":{"money_24h":374407,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":185994},"SpaceAgeJupiterMoon":{"money_24h":410882,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":197891},"SpaceAgeTitan":{"money_24h":450934,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":210538},"SpaceAgeSpaceHub":{"money_24h":490986,"strategy_points_24h":108,"random_good_of_age_24h":175,"supplies_24h":223185}}, boosts: [{"type":"def_boost_defender","value":175,"feature":"all"},{"type":"def_boost_defender","value":88,"feature":"battleground"},{"type":"def_boost_defender","value":88,"feature":"guild_expedition"},{"type":"def_boost_defender","value":60,"feature":"guild_raids"},{"type":"coin_production","value":250,"feature":"all"}] },
+    "W_MultiAge_COP24JB3": { prod: {"BronzeAge":{"money_24h":380,"strategy_points_24h":2},"IronAge":{"money_24h":380,"strategy_points_24h":2},"EarlyMiddleAge":{"money_24h":620,"strategy_points_24h":2},"HighMiddleAge":{"money_24h":880,"strategy_points_24h":2},"LateMiddleAge":{"money_24h":1140,"strategy_points_24h":2},"ColonialAge":{"money_24h":1760,"strategy_points_24h":2},"IndustrialAge":{"money_24h":2180,"strategy_points_24h":2},"ProgressiveEra":{"money_24h":2640,"strategy_points_24h":2},"ModernEra":{"money_24h":3300,"strategy_points_24h":2},"PostModernEra":{"money_24h":4140,"strategy_points_24h":2},"ContemporaryEra":{"money_24h":5380,"strategy_points_24h":2},"TomorrowEra":{"money_24h":6240,"strategy_points_24h":2},"FutureEra":{"money_24h":7160,"strategy_points_24h":2},"ArcticFuture":{"money_24h":8120,"strategy_points_24h":2},"OceanicFuture":{"money_24h":9160,"strategy_points_24h":2},"VirtualFuture":{"money_24h":10260,"strategy_points_24h":2},"SpaceAgeMars":{"money_24h":17140,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"money_24h":18980,"strategy_points_24h":2},"SpaceAgeVenus":{"money_24h":20940,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"money_24h":22980,"strategy_points_24h":2},"SpaceAgeTitan":{"money_24h":25220,"strategy_points_24h":2},"SpaceAgeSpaceHub":{"money_24h":27460,"strategy_points_24h":2}}, boosts: [{"type":"att_def_boost_attacker","value":3,"feature":"all"}] },
+    "W_MultiAge_COP24JB4": { prod: {"BronzeAge":{"random_good_of_age_24h":5,"money_24h":456,"strategy_points_24h":2},"IronAge":{"random_good_of_age_24h":5,"money_24h":456,"strategy_points_24h":2},"EarlyMiddleAge":{"random_good_of_age_24h":5,"money_24h":744,"strategy_points_24h":2},"HighMiddleAge":{"random_good_of_age_24h":5,"money_24h":1056,"strategy_points_24h":2},"LateMiddleAge":{"random_good_of_age_24h":5,"money_24h":1368,"strategy_points_24h":2},"ColonialAge":{"random_good_of_age_24h":5,"money_24h":2112,"strategy_points_24h":2},"IndustrialAge":{"random_good_of_age_24h":5,"money_24h":2616,"strategy_points_24h":2},"ProgressiveEra":{"random_good_of_age_24h":5,"money_24h":3168,"strategy_points_24h":2},"ModernEra":{"random_good_of_age_24h":5,"money_24h":3960,"strategy_points_24h":2},"PostModernEra":{"random_good_of_age_24h":5,"money_24h":4968,"strategy_points_24h":2},"ContemporaryEra":{"random_good_of_age_24h":5,"money_24h":6456,"strategy_points_24h":2},"TomorrowEra":{"random_good_of_age_24h":5,"money_24h":7488,"strategy_points_24h":2},"FutureEra":{"random_good_of_age_24h":5,"money_24h":8592,"strategy_points_24h":2},"ArcticFuture":{"random_good_of_age_24h":5,"money_24h":9744,"strategy_points_24h":2},"OceanicFuture":{"random_good_of_age_24h":5,"money_24h":10992,"strategy_points_24h":2},"VirtualFuture":{"random_good_of_age_24h":5,"money_24h":12312,"strategy_points_24h":2},"SpaceAgeMars":{"random_good_of_age_24h":5,"money_24h":20568,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"random_good_of_age_24h":5,"money_24h":22776,"strategy_points_24h":2},"SpaceAgeVenus":{"random_good_of_age_24h":5,"money_24h":25128,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"random_good_of_age_24h":5,"money_24h":27576,"strategy_points_24h":2},"SpaceAgeTitan":{"random_good_of_age_24h":5,"money_24h":30264,"strategy_points_24h":2},"SpaceAgeSpaceHub":{"random_good_of_age_24h":5,"money_24h":32952,"strategy_points_24h":2}}, boosts: [{"type":"att_def_boost_attacker","value":4,"feature":"all"}] },
+    "W_MultiAge_COP24JB5": { prod: {"BronzeAge":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":608},"IronAge":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":608},"EarlyMiddleAge":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":992},"HighMiddleAge":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":1408},"LateMiddleAge":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":1824},"ColonialAge":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":2816},"IndustrialAge":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":3488},"ProgressiveEra":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":4224},"ModernEra":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":5280},"PostModernEra":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":6624},"ContemporaryEra":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":8608},"TomorrowEra":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":9984},"FutureEra":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":11456},"ArcticFuture":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":12992},"OceanicFuture":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":14656},"VirtualFuture":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":16416},"SpaceAgeMars":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":27424},"SpaceAgeAsteroidBelt":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":30368},"SpaceAgeVenus":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":33504},"SpaceAgeJupiterMoon":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":36768},"SpaceAgeTitan":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":40352},"SpaceAgeSpaceHub":{"strategy_points_24h":4,"random_good_of_age_24h":5,"money_24h":43936}}, boosts: [{"type":"att_def_boost_attacker","value":5,"feature":"all"}] },
+    "W_MultiAge_COP24JB1": { prod: {"BronzeAge":{"money_24h":228,"strategy_points_24h":1},"IronAge":{"money_24h":228,"strategy_points_24h":1},"EarlyMiddleAge":{"money_24h":372,"strategy_points_24h":1},"HighMiddleAge":{"money_24h":528,"strategy_points_24h":1},"LateMiddleAge":{"money_24h":684,"strategy_points_24h":1},"ColonialAge":{"money_24h":1056,"strategy_points_24h":1},"IndustrialAge":{"money_24h":1308,"strategy_points_24h":1},"ProgressiveEra":{"money_24h":1584,"strategy_points_24h":1},"ModernEra":{"money_24h":1980,"strategy_points_24h":1},"PostModernEra":{"money_24h":2484,"strategy_points_24h":1},"ContemporaryEra":{"money_24h":3228,"strategy_points_24h":1},"TomorrowEra":{"money_24h":3744,"strategy_points_24h":1},"FutureEra":{"money_24h":4296,"strategy_points_24h":1},"ArcticFuture":{"money_24h":4872,"strategy_points_24h":1},"OceanicFuture":{"money_24h":5496,"strategy_points_24h":1},"VirtualFuture":{"money_24h":6156,"strategy_points_24h":1},"SpaceAgeMars":{"money_24h":10284,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"money_24h":11388,"strategy_points_24h":1},"SpaceAgeVenus":{"money_24h":12564,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"money_24h":13788,"strategy_points_24h":1},"SpaceAgeTitan":{"money_24h":15132,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"money_24h":16476,"strategy_points_24h":1}}, boosts: [{"type":"att_def_boost_attacker","value":1,"feature":"all"}] },
+    "W_MultiAge_COP24JB2": { prod: {"BronzeAge":{"money_24h":304,"strategy_points_24h":1},"IronAge":{"money_24h":304,"strategy_points_24h":1},"EarlyMiddleAge":{"money_24h":496,"strategy_points_24h":1},"HighMiddleAge":{"money_24h":704,"strategy_points_24h":1},"LateMiddleAge":{"money_24h":912,"strategy_points_24h":1},"ColonialAge":{"money_24h":1408,"strategy_points_24h":1},"IndustrialAge":{"money_24h":1744,"strategy_points_24h":1},"ProgressiveEra":{"money_24h":2112,"strategy_points_24h":1},"ModernEra":{"money_24h":2640,"strategy_points_24h":1},"PostModernEra":{"money_24h":3312,"strategy_points_24h":1},"ContemporaryEra":{"money_24h":4304,"strategy_points_24h":1},"TomorrowEra":{"money_24h":4992,"strategy_points_24h":1},"FutureEra":{"money_24h":5728,"strategy_points_24h":1},"ArcticFuture":{"money_24h":6496,"strategy_points_24h":1},"OceanicFuture":{"money_24h":7328,"strategy_points_24h":1},"VirtualFuture":{"money_24h":8208,"strategy_points_24h":1},"SpaceAgeMars":{"money_24h":13712,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"money_24h":15184,"strategy_points_24h":1},"SpaceAgeVenus":{"money_24h":16752,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"money_24h":18384,"strategy_points_24h":1},"SpaceAgeTitan":{"money_24h":20176,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"money_24h":21968,"strategy_points_24h":1}}, boosts: [{"type":"att_def_boost_attacker","value":2,"feature":"all"}] },
+    "W_MultiAge_COP24D1": { prod: {"BronzeAge":{"money_24h":616,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":341},"IronAge":{"money_24h":616,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":341},"EarlyMiddleAge":{"money_24h":1004,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":565},"HighMiddleAge":{"money_24h":1426,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":789},"LateMiddleAge":{"money_24h":1847,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":1049},"ColonialAge":{"money_24h":2851,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":1328},"IndustrialAge":{"money_24h":3532,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":1615},"ProgressiveEra":{"money_24h":4277,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":1893},"ModernEra":{"money_24h":5346,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":2206},"PostModernEra":{"money_24h":6707,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":2511},"ContemporaryEra":{"money_24h":8716,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":2826},"TomorrowEra":{"money_24h":10109,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":3167},"FutureEra":{"money_24h":11599,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":3482},"ArcticFuture":{"money_24h":13154,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":3813},"OceanicFuture":{"money_24h":14839,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":4181},"VirtualFuture":{"money_24h":16621,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":4522},"SpaceAgeMars":{"money_24h":27767,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":7321},"SpaceAgeAsteroidBelt":{"money_24h":30748,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":7858},"SpaceAgeVenus":{"money_24h":33923,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":8423},"SpaceAgeJupiterMoon":{"money_24h":37228,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":8962},"SpaceAgeTitan":{"money_24h":40856,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":9535},"SpaceAgeSpaceHub":{"money_24h":44484,"strategy_points_24h":11,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":30,"supplies_24h":10108}}, boosts: [{"type":"def_boost_attacker","value":20,"feature":"all"},{"type":"def_boost_attacker","value":12,"feature":"battleground"},{"type":"def_boost_attacker","value":12,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24D2": { prod: {"BronzeAge":{"money_24h":1186,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":956},"IronAge":{"money_24h":1186,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":956},"EarlyMiddleAge":{"money_24h":1934,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":1584},"HighMiddleAge":{"money_24h":2746,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":2212},"LateMiddleAge":{"money_24h":3557,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":2941},"ColonialAge":{"money_24h":5491,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":3722},"IndustrialAge":{"money_24h":6802,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":4525},"ProgressiveEra":{"money_24h":8237,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":5306},"ModernEra":{"money_24h":10296,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":6183},"PostModernEra":{"money_24h":12917,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":7038},"ContemporaryEra":{"money_24h":16786,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":7920},"TomorrowEra":{"money_24h":19469,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":8876},"FutureEra":{"money_24h":22339,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":9757},"ArcticFuture":{"money_24h":25334,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":10687},"OceanicFuture":{"money_24h":28579,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":11716},"VirtualFuture":{"money_24h":32011,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":12672},"SpaceAgeMars":{"money_24h":53477,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":20518},"SpaceAgeAsteroidBelt":{"money_24h":59218,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":22023},"SpaceAgeVenus":{"money_24h":65333,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":23607},"SpaceAgeJupiterMoon":{"money_24h":71698,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":25117},"SpaceAgeTitan":{"money_24h":78686,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":26722},"SpaceAgeSpaceHub":{"money_24h":85674,"strategy_points_24h":18,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":65,"supplies_24h":28327}}, boosts: [{"type":"def_boost_attacker","value":33,"feature":"all"},{"type":"def_boost_attacker","value":18,"feature":"battleground"},{"type":"def_boost_attacker","value":18,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24D3": { prod: {"BronzeAge":{"money_24h":1767,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":1564},"IronAge":{"money_24h":1767,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":1564},"EarlyMiddleAge":{"money_24h":2883,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":2592},"HighMiddleAge":{"money_24h":4092,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":3620},"LateMiddleAge":{"money_24h":5301,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":4812},"ColonialAge":{"money_24h":8184,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":6091},"IndustrialAge":{"money_24h":10137,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":7404},"ProgressiveEra":{"money_24h":12276,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":8683},"ModernEra":{"money_24h":15345,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":10117},"PostModernEra":{"money_24h":19251,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":11517},"ContemporaryEra":{"money_24h":25017,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":12960},"TomorrowEra":{"money_24h":29016,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":14524},"FutureEra":{"money_24h":33294,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":15967},"ArcticFuture":{"money_24h":37758,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":17487},"OceanicFuture":{"money_24h":42594,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":19172},"VirtualFuture":{"money_24h":47709,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":20736},"SpaceAgeMars":{"money_24h":79701,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":33575},"SpaceAgeAsteroidBelt":{"money_24h":88257,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":36037},"SpaceAgeVenus":{"money_24h":97371,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":38629},"SpaceAgeJupiterMoon":{"money_24h":106857,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":41100},"SpaceAgeTitan":{"money_24h":117273,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":43727},"SpaceAgeSpaceHub":{"money_24h":127689,"strategy_points_24h":25,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":100,"supplies_24h":46354}}, boosts: [{"type":"def_boost_attacker","value":47,"feature":"all"},{"type":"def_boost_attacker","value":25,"feature":"battleground"},{"type":"def_boost_attacker","value":25,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24D4": { prod: {"BronzeAge":{"money_24h":2360,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":2172},"IronAge":{"money_24h":2360,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":2172},"EarlyMiddleAge":{"money_24h":3850,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":3600},"HighMiddleAge":{"money_24h":5465,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":5028},"LateMiddleAge":{"money_24h":7079,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":6684},"ColonialAge":{"money_24h":10930,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":8460},"IndustrialAge":{"money_24h":13538,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":10284},"ProgressiveEra":{"money_24h":16394,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":12060},"ModernEra":{"money_24h":20493,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":14052},"PostModernEra":{"money_24h":25709,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":15996},"ContemporaryEra":{"money_24h":33410,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":18000},"TomorrowEra":{"money_24h":38750,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":20172},"FutureEra":{"money_24h":44464,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":22176},"ArcticFuture":{"money_24h":50425,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":24288},"OceanicFuture":{"money_24h":56884,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":26628},"VirtualFuture":{"money_24h":63715,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":28800},"SpaceAgeMars":{"money_24h":106439,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":46632},"SpaceAgeAsteroidBelt":{"money_24h":117866,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":50052},"SpaceAgeVenus":{"money_24h":130037,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":53652},"SpaceAgeJupiterMoon":{"money_24h":142706,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":57084},"SpaceAgeTitan":{"money_24h":156616,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":60732},"SpaceAgeSpaceHub":{"money_24h":170526,"strategy_points_24h":32,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":135,"supplies_24h":64380}}, boosts: [{"type":"def_boost_attacker","value":60,"feature":"all"},{"type":"def_boost_attacker","value":31,"feature":"battleground"},{"type":"def_boost_attacker","value":31,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24D5": { prod: {"BronzeAge":{"money_24h":2930,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":2780},"IronAge":{"money_24h":2930,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":2780},"EarlyMiddleAge":{"money_24h":4780,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":4608},"HighMiddleAge":{"money_24h":6785,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":6436},"LateMiddleAge":{"money_24h":8789,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":8556},"ColonialAge":{"money_24h":13570,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":10829},"IndustrialAge":{"money_24h":16808,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":13164},"ProgressiveEra":{"money_24h":20354,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":15437},"ModernEra":{"money_24h":25443,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":17987},"PostModernEra":{"money_24h":31919,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":20475},"ContemporaryEra":{"money_24h":41480,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":23040},"TomorrowEra":{"money_24h":48110,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":25820},"FutureEra":{"money_24h":55204,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":28385},"ArcticFuture":{"money_24h":62605,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":31089},"OceanicFuture":{"money_24h":70624,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":34084},"VirtualFuture":{"money_24h":79105,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":36864},"SpaceAgeMars":{"money_24h":132149,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":59689},"SpaceAgeAsteroidBelt":{"money_24h":146336,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":64067},"SpaceAgeVenus":{"money_24h":161447,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":68675},"SpaceAgeJupiterMoon":{"money_24h":177176,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":73068},"SpaceAgeTitan":{"money_24h":194446,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":77737},"SpaceAgeSpaceHub":{"money_24h":211716,"strategy_points_24h":39,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":170,"supplies_24h":82406}}, boosts: [{"type":"def_boost_attacker","value":73,"feature":"all"},{"type":"def_boost_attacker","value":38,"feature":"battleground"},{"type":"def_boost_attacker","value":38,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24D6": { prod: {"BronzeAge":{"money_24h":3523,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":3367},"IronAge":{"money_24h":3523,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":3367},"EarlyMiddleAge":{"money_24h":5747,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":5580},"HighMiddleAge":{"money_24h":8158,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":7793},"LateMiddleAge":{"money_24h":10568,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":10360},"ColonialAge":{"money_24h":16315,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":13113},"IndustrialAge":{"money_24h":20209,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":15940},"ProgressiveEra":{"money_24h":24473,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":18693},"ModernEra":{"money_24h":30591,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":21781},"PostModernEra":{"money_24h":38378,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":24794},"ContemporaryEra":{"money_24h":49873,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":27900},"TomorrowEra":{"money_24h":57845,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":31267},"FutureEra":{"money_24h":66373,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":34373},"ArcticFuture":{"money_24h":75272,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":37646},"OceanicFuture":{"money_24h":84913,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":41273},"VirtualFuture":{"money_24h":95110,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":44640},"SpaceAgeMars":{"money_24h":158888,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":72280},"SpaceAgeAsteroidBelt":{"money_24h":175945,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":77581},"SpaceAgeVenus":{"money_24h":194114,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":83161},"SpaceAgeJupiterMoon":{"money_24h":213025,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":88480},"SpaceAgeTitan":{"money_24h":233789,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":94135},"SpaceAgeSpaceHub":{"money_24h":254553,"strategy_points_24h":47,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":205,"supplies_24h":99790}}, boosts: [{"type":"def_boost_attacker","value":86,"feature":"all"},{"type":"def_boost_attacker","value":44,"feature":"battleground"},{"type":"def_boost_attacker","value":44,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24D7": { prod: {"BronzeAge":{"money_24h":4104,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":3996},"IronAge":{"money_24h":4104,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":3996},"EarlyMiddleAge":{"money_24h":6696,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":6624},"HighMiddleAge":{"money_24h":9504,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":9252},"LateMiddleAge":{"money_24h":12312,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":12299},"ColonialAge":{"money_24h":19008,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":15566},"IndustrialAge":{"money_24h":23544,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":18923},"ProgressiveEra":{"money_24h":28512,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":22190},"ModernEra":{"money_24h":35640,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":25856},"PostModernEra":{"money_24h":44712,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":29433},"ContemporaryEra":{"money_24h":58104,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":33120},"TomorrowEra":{"money_24h":67392,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":37116},"FutureEra":{"money_24h":77328,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":40804},"ArcticFuture":{"money_24h":87696,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":44690},"OceanicFuture":{"money_24h":98928,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":48996},"VirtualFuture":{"money_24h":110808,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":52992},"SpaceAgeMars":{"money_24h":185112,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":85803},"SpaceAgeAsteroidBelt":{"money_24h":204984,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":92096},"SpaceAgeVenus":{"money_24h":226152,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":98720},"SpaceAgeJupiterMoon":{"money_24h":248184,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":105035},"SpaceAgeTitan":{"money_24h":272376,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":111747},"SpaceAgeSpaceHub":{"money_24h":296568,"strategy_points_24h":54,"random_good_of_age_24h":40,"random_good_of_previous_age_24h":240,"supplies_24h":118459}}, boosts: [{"type":"def_boost_attacker","value":100,"feature":"all"},{"type":"def_boost_attacker","value":50,"feature":"battleground"},{"type":"def_boost_attacker","value":50,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24D8": { prod: {"BronzeAge":{"money_24h":4674,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":4583},"IronAge":{"money_24h":4674,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":4583},"EarlyMiddleAge":{"money_24h":7626,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":7596},"HighMiddleAge":{"money_24h":10824,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":10609},"LateMiddleAge":{"money_24h":14022,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":14103},"ColonialAge":{"money_24h":21648,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":17851},"IndustrialAge":{"money_24h":26814,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":21699},"ProgressiveEra":{"money_24h":32472,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":25447},"ModernEra":{"money_24h":40590,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":29650},"PostModernEra":{"money_24h":50922,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":33752},"ContemporaryEra":{"money_24h":66174,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":37980},"TomorrowEra":{"money_24h":76752,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":42563},"FutureEra":{"money_24h":88068,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":46791},"ArcticFuture":{"money_24h":99876,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":51248},"OceanicFuture":{"money_24h":112668,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":56185},"VirtualFuture":{"money_24h":126198,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":60768},"SpaceAgeMars":{"money_24h":210822,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":98394},"SpaceAgeAsteroidBelt":{"money_24h":233454,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":105610},"SpaceAgeVenus":{"money_24h":257562,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":113206},"SpaceAgeJupiterMoon":{"money_24h":282654,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":120447},"SpaceAgeTitan":{"money_24h":310206,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":128145},"SpaceAgeSpaceHub":{"money_24h":337758,"strategy_points_24h":61,"random_good_of_age_24h":50,"random_good_of_previous_age_24h":275,"supplies_24h":135843}}, boosts: [{"type":"def_boost_attacker","value":113,"feature":"all"},{"type":"def_boost_attacker","value":57,"feature":"battleground"},{"type":"def_boost_attacker","value":57,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24D9": { prod: {"BronzeAge":{"money_24h":5267,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":5213},"IronAge":{"money_24h":5267,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":5213},"EarlyMiddleAge":{"money_24h":8593,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":8640},"HighMiddleAge":{"money_24h":12197,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":12067},"LateMiddleAge":{"money_24h":15800,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":16042},"ColonialAge":{"money_24h":24394,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":20304},"IndustrialAge":{"money_24h":30215,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":24682},"ProgressiveEra":{"money_24h":36590,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":28944},"ModernEra":{"money_24h":45738,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":33725},"PostModernEra":{"money_24h":57380,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":38390},"ContemporaryEra":{"money_24h":74567,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":43200},"TomorrowEra":{"money_24h":86486,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":48413},"FutureEra":{"money_24h":99238,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":53222},"ArcticFuture":{"money_24h":112543,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":58291},"OceanicFuture":{"money_24h":126958,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":63907},"VirtualFuture":{"money_24h":142204,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":69120},"SpaceAgeMars":{"money_24h":237560,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":111917},"SpaceAgeAsteroidBelt":{"money_24h":263063,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":120125},"SpaceAgeVenus":{"money_24h":290228,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":128765},"SpaceAgeJupiterMoon":{"money_24h":318503,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":137002},"SpaceAgeTitan":{"money_24h":349549,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":145757},"SpaceAgeSpaceHub":{"money_24h":380595,"strategy_points_24h":68,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":310,"supplies_24h":154512}}, boosts: [{"type":"def_boost_attacker","value":126,"feature":"all"},{"type":"def_boost_attacker","value":63,"feature":"battleground"},{"type":"def_boost_attacker","value":63,"feature":"guild_expedition"},{"type":"def_boost_attacker","value":50,"feature":"guild_raids"}] },
+    "W_MultiAge_COP24B1": { prod: {"BronzeAge":{"money_24h":906,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":341},"IronAge":{"money_24h":906,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":341},"EarlyMiddleAge":{"money_24h":1479,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":565},"HighMiddleAge":{"money_24h":2099,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":789},"LateMiddleAge":{"money_24h":2719,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":1049},"ColonialAge":{"money_24h":4198,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":1328},"IndustrialAge":{"money_24h":5199,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":1615},"ProgressiveEra":{"money_24h":6296,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":1893},"ModernEra":{"money_24h":7871,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":2206},"PostModernEra":{"money_24h":9874,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":2511},"ContemporaryEra":{"money_24h":12831,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":2826},"TomorrowEra":{"money_24h":14882,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":3167},"FutureEra":{"money_24h":17077,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":3482},"ArcticFuture":{"money_24h":19366,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":3813},"OceanicFuture":{"money_24h":21847,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":4181},"VirtualFuture":{"money_24h":24470,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":4522},"SpaceAgeMars":{"money_24h":40879,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":7321},"SpaceAgeAsteroidBelt":{"money_24h":45267,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":7858},"SpaceAgeVenus":{"money_24h":49942,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":8423},"SpaceAgeJupiterMoon":{"money_24h":54807,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":8962},"SpaceAgeTitan":{"money_24h":60150,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":9535},"SpaceAgeSpaceHub":{"money_24h":65493,"strategy_points_24h":10,"random_good_of_age_24h":5,"random_good_of_previous_age_24h":45,"supplies_24h":10108}}, boosts: [{"type":"att_def_boost_defender","value":8,"feature":"all"},{"type":"att_def_boost_defender","value":4,"feature":"battleground"},{"type":"att_def_boost_defender","value":4,"feature":"guild_expedition"},{"type":"supply_production","value":20,"feature":"all"}] },
+    "W_MultiAge_COP24B2": { prod: {"BronzeAge":{"money_24h":1391,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":891},"IronAge":{"money_24h":1391,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":891},"EarlyMiddleAge":{"money_24h":2269,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":1476},"HighMiddleAge":{"money_24h":3221,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":2061},"LateMiddleAge":{"money_24h":4172,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":2740},"ColonialAge":{"money_24h":6442,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":3469},"IndustrialAge":{"money_24h":7979,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":4216},"ProgressiveEra":{"money_24h":9662,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":4945},"ModernEra":{"money_24h":12078,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":5761},"PostModernEra":{"money_24h":15152,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":6558},"ContemporaryEra":{"money_24h":19691,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":7380},"TomorrowEra":{"money_24h":22838,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":8271},"FutureEra":{"money_24h":26206,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":9092},"ArcticFuture":{"money_24h":29719,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":9958},"OceanicFuture":{"money_24h":33526,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":10917},"VirtualFuture":{"money_24h":37552,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":11808},"SpaceAgeMars":{"money_24h":62732,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":19119},"SpaceAgeAsteroidBelt":{"money_24h":69467,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":20521},"SpaceAgeVenus":{"money_24h":76640,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":21997},"SpaceAgeJupiterMoon":{"money_24h":84107,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":23404},"SpaceAgeTitan":{"money_24h":92305,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":24900},"SpaceAgeSpaceHub":{"money_24h":100503,"strategy_points_24h":17,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":85,"supplies_24h":26396}}, boosts: [{"type":"att_def_boost_defender","value":16,"feature":"all"},{"type":"att_def_boost_defender","value":8,"feature":"battleground"},{"type":"att_def_boost_defender","value":8,"feature":"guild_expedition"},{"type":"supply_production","value":36,"feature":"all"}] },
+    "W_MultiAge_COP24B3": { prod: {"BronzeAge":{"money_24h":1892,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":1434},"IronAge":{"money_24h":1892,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":1434},"EarlyMiddleAge":{"money_24h":3088,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":2376},"HighMiddleAge":{"money_24h":4382,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":3318},"LateMiddleAge":{"money_24h":5677,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":4411},"ColonialAge":{"money_24h":8765,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":5584},"IndustrialAge":{"money_24h":10856,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":6787},"ProgressiveEra":{"money_24h":13147,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":7960},"ModernEra":{"money_24h":16434,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":9274},"PostModernEra":{"money_24h":20617,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":10557},"ContemporaryEra":{"money_24h":26792,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":11880},"TomorrowEra":{"money_24h":31075,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":13314},"FutureEra":{"money_24h":35657,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":14636},"ArcticFuture":{"money_24h":40438,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":16030},"OceanicFuture":{"money_24h":45617,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":17574},"VirtualFuture":{"money_24h":51095,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":19008},"SpaceAgeMars":{"money_24h":85357,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":30777},"SpaceAgeAsteroidBelt":{"money_24h":94520,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":33034},"SpaceAgeVenus":{"money_24h":104281,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":35410},"SpaceAgeJupiterMoon":{"money_24h":114440,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":37675},"SpaceAgeTitan":{"money_24h":125596,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":40083},"SpaceAgeSpaceHub":{"money_24h":136752,"strategy_points_24h":23,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":125,"supplies_24h":42491}}, boosts: [{"type":"att_def_boost_defender","value":24,"feature":"all"},{"type":"att_def_boost_defender","value":12,"feature":"battleground"},{"type":"att_def_boost_defender","value":12,"feature":"guild_expedition"},{"type":"supply_production","value":53,"feature":"all"}] },
+    "W_MultiAge_COP24B4": { prod: {"BronzeAge":{"money_24h":2371,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":1998},"IronAge":{"money_24h":2371,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":1998},"EarlyMiddleAge":{"money_24h":3869,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":3312},"HighMiddleAge":{"money_24h":5491,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":4626},"LateMiddleAge":{"money_24h":7114,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":6149},"ColonialAge":{"money_24h":10982,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":7783},"IndustrialAge":{"money_24h":13603,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":9461},"ProgressiveEra":{"money_24h":16474,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":11095},"ModernEra":{"money_24h":20592,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":12928},"PostModernEra":{"money_24h":25834,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":14716},"ContemporaryEra":{"money_24h":33571,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":16560},"TomorrowEra":{"money_24h":38938,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":18558},"FutureEra":{"money_24h":44678,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":20402},"ArcticFuture":{"money_24h":50669,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":22345},"OceanicFuture":{"money_24h":57158,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":24498},"VirtualFuture":{"money_24h":64022,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":26496},"SpaceAgeMars":{"money_24h":106954,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":42901},"SpaceAgeAsteroidBelt":{"money_24h":118435,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":46048},"SpaceAgeVenus":{"money_24h":130666,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":49360},"SpaceAgeJupiterMoon":{"money_24h":143395,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":52517},"SpaceAgeTitan":{"money_24h":157373,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":55873},"SpaceAgeSpaceHub":{"money_24h":171351,"strategy_points_24h":30,"random_good_of_age_24h":20,"random_good_of_previous_age_24h":165,"supplies_24h":59229}}, boosts: [{"type":"att_def_boost_defender","value":31,"feature":"all"},{"type":"att_def_boost_defender","value":15,"feature":"battleground"},{"type":"att_def_boost_defender","value":15,"feature":"guild_expedition"},{"type":"supply_production","value":69,"feature":"all"}] },
+    "W_MultiAge_COP24B5": { prod: {"BronzeAge":{"money_24h":2873,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":2563},"IronAge":{"money_24h":2873,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":2563},"EarlyMiddleAge":{"money_24h":4687,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":4248},"HighMiddleAge":{"money_24h":6653,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":5933},"LateMiddleAge":{"money_24h":8618,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":7887},"ColonialAge":{"money_24h":13306,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":9983},"IndustrialAge":{"money_24h":16481,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":12135},"ProgressiveEra":{"money_24h":19958,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":14231},"ModernEra":{"money_24h":24948,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":16581},"PostModernEra":{"money_24h":31298,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":18875},"ContemporaryEra":{"money_24h":40673,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":21240},"TomorrowEra":{"money_24h":47174,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":23803},"FutureEra":{"money_24h":54130,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":26168},"ArcticFuture":{"money_24h":61387,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":28660},"OceanicFuture":{"money_24h":69250,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":31421},"VirtualFuture":{"money_24h":77566,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":33984},"SpaceAgeMars":{"money_24h":129578,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":55026},"SpaceAgeAsteroidBelt":{"money_24h":143489,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":59061},"SpaceAgeVenus":{"money_24h":158306,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":63309},"SpaceAgeJupiterMoon":{"money_24h":173729,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":67359},"SpaceAgeTitan":{"money_24h":190663,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":71664},"SpaceAgeSpaceHub":{"money_24h":207597,"strategy_points_24h":37,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":205,"supplies_24h":75969}}, boosts: [{"type":"att_def_boost_defender","value":39,"feature":"all"},{"type":"att_def_boost_defender","value":19,"feature":"battleground"},{"type":"att_def_boost_defender","value":19,"feature":"guild_expedition"},{"type":"supply_production","value":85,"feature":"all"}] },
+    "W_MultiAge_COP24B6": { prod: {"BronzeAge":{"money_24h":3352,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":3084},"IronAge":{"money_24h":3352,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":3084},"EarlyMiddleAge":{"money_24h":5468,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":5112},"HighMiddleAge":{"money_24h":7762,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":7140},"LateMiddleAge":{"money_24h":10055,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":9491},"ColonialAge":{"money_24h":15523,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":12013},"IndustrialAge":{"money_24h":19228,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":14603},"ProgressiveEra":{"money_24h":23285,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":17125},"ModernEra":{"money_24h":29106,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":19954},"PostModernEra":{"money_24h":36515,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":22714},"ContemporaryEra":{"money_24h":47452,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":25560},"TomorrowEra":{"money_24h":55037,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":28644},"FutureEra":{"money_24h":63151,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":31490},"ArcticFuture":{"money_24h":71618,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":34489},"OceanicFuture":{"money_24h":80791,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":37812},"VirtualFuture":{"money_24h":90493,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":40896},"SpaceAgeMars":{"money_24h":151175,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":66217},"SpaceAgeAsteroidBelt":{"money_24h":167404,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":71074},"SpaceAgeVenus":{"money_24h":184691,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":76186},"SpaceAgeJupiterMoon":{"money_24h":202684,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":81059},"SpaceAgeTitan":{"money_24h":222440,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":86239},"SpaceAgeSpaceHub":{"money_24h":242196,"strategy_points_24h":44,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":245,"supplies_24h":91419}}, boosts: [{"type":"att_def_boost_defender","value":47,"feature":"all"},{"type":"att_def_boost_defender","value":23,"feature":"battleground"},{"type":"att_def_boost_defender","value":23,"feature":"guild_expedition"},{"type":"supply_production","value":101,"feature":"all"}] },
+    "W_MultiAge_COP24B7": { prod: {"BronzeAge":{"money_24h":3853,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":3649},"IronAge":{"money_24h":3853,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":3649},"EarlyMiddleAge":{"money_24h":6287,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":6048},"HighMiddleAge":{"money_24h":8923,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":8447},"LateMiddleAge":{"money_24h":11560,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":11229},"ColonialAge":{"money_24h":17846,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":14213},"IndustrialAge":{"money_24h":22105,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":17277},"ProgressiveEra":{"money_24h":26770,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":20261},"ModernEra":{"money_24h":33462,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":23607},"PostModernEra":{"money_24h":41980,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":26873},"ContemporaryEra":{"money_24h":54553,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":30240},"TomorrowEra":{"money_24h":63274,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":33889},"FutureEra":{"money_24h":72602,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":37256},"ArcticFuture":{"money_24h":82337,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":40804},"OceanicFuture":{"money_24h":92882,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":44735},"VirtualFuture":{"money_24h":104036,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":48384},"SpaceAgeMars":{"money_24h":173800,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":78342},"SpaceAgeAsteroidBelt":{"money_24h":192457,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":84087},"SpaceAgeVenus":{"money_24h":212332,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":90135},"SpaceAgeJupiterMoon":{"money_24h":233017,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":95901},"SpaceAgeTitan":{"money_24h":255731,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":102030},"SpaceAgeSpaceHub":{"money_24h":278445,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":285,"supplies_24h":108159}}, boosts: [{"type":"att_def_boost_defender","value":55,"feature":"all"},{"type":"att_def_boost_defender","value":27,"feature":"battleground"},{"type":"att_def_boost_defender","value":27,"feature":"guild_expedition"},{"type":"supply_production","value":118,"feature":"all"}] },
+    "W_MultiAge_COP24B8": { prod: {"BronzeAge":{"money_24h":4332,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":4192},"IronAge":{"money_24h":4332,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":4192},"EarlyMiddleAge":{"money_24h":7068,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":6948},"HighMiddleAge":{"money_24h":10032,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":9704},"LateMiddleAge":{"money_24h":12996,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":12900},"ColonialAge":{"money_24h":20064,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":16328},"IndustrialAge":{"money_24h":24852,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":19848},"ProgressiveEra":{"money_24h":30096,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":23276},"ModernEra":{"money_24h":37620,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":27120},"PostModernEra":{"money_24h":47196,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":30872},"ContemporaryEra":{"money_24h":61332,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":34740},"TomorrowEra":{"money_24h":71136,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":38932},"FutureEra":{"money_24h":81624,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":42800},"ArcticFuture":{"money_24h":92568,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":46876},"OceanicFuture":{"money_24h":104424,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":51392},"VirtualFuture":{"money_24h":116964,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":55584},"SpaceAgeMars":{"money_24h":195396,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":90000},"SpaceAgeAsteroidBelt":{"money_24h":216372,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":96600},"SpaceAgeVenus":{"money_24h":238716,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":103548},"SpaceAgeJupiterMoon":{"money_24h":261972,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":110172},"SpaceAgeTitan":{"money_24h":287508,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":117213},"SpaceAgeSpaceHub":{"money_24h":313044,"strategy_points_24h":57,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":325,"supplies_24h":124254}}, boosts: [{"type":"att_def_boost_defender","value":62,"feature":"all"},{"type":"att_def_boost_defender","value":31,"feature":"battleground"},{"type":"att_def_boost_defender","value":31,"feature":"guild_expedition"},{"type":"supply_production","value":134,"feature":"all"}] },
+    "W_MultiAge_COP24B9": { prod: {"BronzeAge":{"money_24h":4822,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":4778},"IronAge":{"money_24h":4822,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":4778},"EarlyMiddleAge":{"money_24h":7868,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":7920},"HighMiddleAge":{"money_24h":11167,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":11062},"LateMiddleAge":{"money_24h":14467,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":14705},"ColonialAge":{"money_24h":22334,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":18612},"IndustrialAge":{"money_24h":27664,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":22625},"ProgressiveEra":{"money_24h":33502,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":26532},"ModernEra":{"money_24h":41877,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":30914},"PostModernEra":{"money_24h":52537,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":35191},"ContemporaryEra":{"money_24h":68272,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":39600},"TomorrowEra":{"money_24h":79186,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":44378},"FutureEra":{"money_24h":90860,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":48787},"ArcticFuture":{"money_24h":103043,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":53434},"OceanicFuture":{"money_24h":116240,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":58582},"VirtualFuture":{"money_24h":130199,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":63360},"SpaceAgeMars":{"money_24h":217507,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":102590},"SpaceAgeAsteroidBelt":{"money_24h":240856,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":110114},"SpaceAgeVenus":{"money_24h":265729,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":118034},"SpaceAgeJupiterMoon":{"money_24h":291616,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":125585},"SpaceAgeTitan":{"money_24h":320042,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":133610},"SpaceAgeSpaceHub":{"money_24h":348468,"strategy_points_24h":64,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":365,"supplies_24h":141635}}, boosts: [{"type":"att_def_boost_defender","value":70,"feature":"all"},{"type":"att_def_boost_defender","value":35,"feature":"battleground"},{"type":"att_def_boost_defender","value":35,"feature":"guild_expedition"},{"type":"def_boost_defender","value":20,"feature":"guild_raids"},{"type":"att_boost_defender","value":40,"feature":"guild_raids"},{"type":"supply_production","value":150,"feature":"all"}] },
+    "W_MultiAge_COP24A1": { prod: {"BronzeAge":{"money_24h":151,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":342,"medals_24h":17},"IronAge":{"money_24h":151,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":342,"medals_24h":17},"EarlyMiddleAge":{"money_24h":247,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":567,"medals_24h":19},"HighMiddleAge":{"money_24h":350,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":792,"medals_24h":21},"LateMiddleAge":{"money_24h":454,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":1053,"medals_24h":22},"ColonialAge":{"money_24h":701,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":1332,"medals_24h":24},"IndustrialAge":{"money_24h":868,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":1620,"medals_24h":26},"ProgressiveEra":{"money_24h":1051,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":1899,"medals_24h":27},"ModernEra":{"money_24h":1314,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":2213,"medals_24h":29},"PostModernEra":{"money_24h":1649,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":2519,"medals_24h":31},"ContemporaryEra":{"money_24h":2143,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":2835,"medals_24h":32},"TomorrowEra":{"money_24h":2485,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":3177,"medals_24h":34},"FutureEra":{"money_24h":2851,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":3493,"medals_24h":36},"ArcticFuture":{"money_24h":3234,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":3825,"medals_24h":38},"OceanicFuture":{"money_24h":3648,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":4194,"medals_24h":39},"VirtualFuture":{"money_24h":4086,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":4536,"medals_24h":51},"SpaceAgeMars":{"money_24h":6826,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":7345,"medals_24h":68},"SpaceAgeAsteroidBelt":{"money_24h":7559,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":7883,"medals_24h":103},"SpaceAgeVenus":{"money_24h":8339,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":8450,"medals_24h":137},"SpaceAgeJupiterMoon":{"money_24h":9152,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":8991,"medals_24h":171},"SpaceAgeTitan":{"money_24h":10044,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":9565,"medals_24h":205},"SpaceAgeSpaceHub":{"money_24h":10936,"strategy_points_24h":4,"random_good_of_age_24h":15,"supplies_24h":10139,"medals_24h":239}}, boosts: [{"type":"att_boost_attacker","value":14,"feature":"all"},{"type":"att_boost_attacker","value":7,"feature":"battleground"},{"type":"att_boost_attacker","value":7,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24A2": { prod: {"BronzeAge":{"money_24h":641,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":815,"medals_24h":90},"IronAge":{"money_24h":641,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":815,"medals_24h":90},"EarlyMiddleAge":{"money_24h":1046,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":1350,"medals_24h":99},"HighMiddleAge":{"money_24h":1485,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":1886,"medals_24h":108},"LateMiddleAge":{"money_24h":1924,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":2507,"medals_24h":117},"ColonialAge":{"money_24h":2970,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":3173,"medals_24h":126},"IndustrialAge":{"money_24h":3679,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":3857,"medals_24h":135},"ProgressiveEra":{"money_24h":4455,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":4523,"medals_24h":144},"ModernEra":{"money_24h":5569,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":5270,"medals_24h":153},"PostModernEra":{"money_24h":6986,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":5999,"medals_24h":162},"ContemporaryEra":{"money_24h":9079,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":6750,"medals_24h":171},"TomorrowEra":{"money_24h":10530,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":7565,"medals_24h":180},"FutureEra":{"money_24h":12083,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":8316,"medals_24h":189},"ArcticFuture":{"money_24h":13703,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":9108,"medals_24h":198},"OceanicFuture":{"money_24h":15458,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":9986,"medals_24h":207},"VirtualFuture":{"money_24h":17314,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":10800,"medals_24h":270},"SpaceAgeMars":{"money_24h":28924,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":17487,"medals_24h":360},"SpaceAgeAsteroidBelt":{"money_24h":32029,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":18770,"medals_24h":540},"SpaceAgeVenus":{"money_24h":35336,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":20120,"medals_24h":720},"SpaceAgeJupiterMoon":{"money_24h":38779,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":21407,"medals_24h":900},"SpaceAgeTitan":{"money_24h":42559,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":22775,"medals_24h":1080},"SpaceAgeSpaceHub":{"money_24h":46339,"strategy_points_24h":8,"random_good_of_age_24h":25,"supplies_24h":24143,"medals_24h":1260}}, boosts: [{"type":"att_boost_attacker","value":24,"feature":"all"},{"type":"att_boost_attacker","value":12,"feature":"battleground"},{"type":"att_boost_attacker","value":12,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24A3": { prod: {"BronzeAge":{"money_24h":1129,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":1254,"medals_24h":162},"IronAge":{"money_24h":1129,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":1254,"medals_24h":162},"EarlyMiddleAge":{"money_24h":1841,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":2079,"medals_24h":178},"HighMiddleAge":{"money_24h":2614,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":2904,"medals_24h":194},"LateMiddleAge":{"money_24h":3386,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":3860,"medals_24h":211},"ColonialAge":{"money_24h":5227,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":4886,"medals_24h":227},"IndustrialAge":{"money_24h":6475,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":5939,"medals_24h":243},"ProgressiveEra":{"money_24h":7841,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":6965,"medals_24h":259},"ModernEra":{"money_24h":9801,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":8115,"medals_24h":275},"PostModernEra":{"money_24h":12296,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":9238,"medals_24h":292},"ContemporaryEra":{"money_24h":15979,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":10395,"medals_24h":308},"TomorrowEra":{"money_24h":18533,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":11649,"medals_24h":324},"FutureEra":{"money_24h":21265,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":12807,"medals_24h":340},"ArcticFuture":{"money_24h":24116,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":14026,"medals_24h":356},"OceanicFuture":{"money_24h":27205,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":15378,"medals_24h":373},"VirtualFuture":{"money_24h":30472,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":16632,"medals_24h":486},"SpaceAgeMars":{"money_24h":50906,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":26930,"medals_24h":648},"SpaceAgeAsteroidBelt":{"money_24h":56371,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":28905,"medals_24h":972},"SpaceAgeVenus":{"money_24h":62192,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":30984,"medals_24h":1296},"SpaceAgeJupiterMoon":{"money_24h":68251,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":32966,"medals_24h":1620},"SpaceAgeTitan":{"money_24h":74903,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":35073,"medals_24h":1944},"SpaceAgeSpaceHub":{"money_24h":81555,"strategy_points_24h":11,"random_good_of_age_24h":35,"supplies_24h":37180,"medals_24h":2268}}, boosts: [{"type":"att_boost_attacker","value":34,"feature":"all"},{"type":"att_boost_attacker","value":17,"feature":"battleground"},{"type":"att_boost_attacker","value":17,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24A4": { prod: {"BronzeAge":{"money_24h":1616,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":1727,"medals_24h":228},"IronAge":{"money_24h":1616,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":1727,"medals_24h":228},"EarlyMiddleAge":{"money_24h":2637,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":2862,"medals_24h":250},"HighMiddleAge":{"money_24h":3742,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":3997,"medals_24h":273},"LateMiddleAge":{"money_24h":4848,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":5314,"medals_24h":296},"ColonialAge":{"money_24h":7484,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":6726,"medals_24h":319},"IndustrialAge":{"money_24h":9270,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":8176,"medals_24h":342},"ProgressiveEra":{"money_24h":11227,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":9588,"medals_24h":364},"ModernEra":{"money_24h":14033,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":11171,"medals_24h":387},"PostModernEra":{"money_24h":17605,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":12717,"medals_24h":410},"ContemporaryEra":{"money_24h":22878,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":14310,"medals_24h":433},"TomorrowEra":{"money_24h":26536,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":16037,"medals_24h":455},"FutureEra":{"money_24h":30448,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":17630,"medals_24h":478},"ArcticFuture":{"money_24h":34530,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":19309,"medals_24h":501},"OceanicFuture":{"money_24h":38953,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":21169,"medals_24h":524},"VirtualFuture":{"money_24h":43631,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":22896,"medals_24h":683},"SpaceAgeMars":{"money_24h":72888,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":37072,"medals_24h":911},"SpaceAgeAsteroidBelt":{"money_24h":80712,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":39791,"medals_24h":1366},"SpaceAgeVenus":{"money_24h":89047,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":42653,"medals_24h":1822},"SpaceAgeJupiterMoon":{"money_24h":97722,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":45382,"medals_24h":2277},"SpaceAgeTitan":{"money_24h":107248,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":48282,"medals_24h":2732},"SpaceAgeSpaceHub":{"money_24h":116774,"strategy_points_24h":15,"random_good_of_age_24h":45,"supplies_24h":51182,"medals_24h":3187}}, boosts: [{"type":"att_boost_attacker","value":44,"feature":"all"},{"type":"att_boost_attacker","value":22,"feature":"battleground"},{"type":"att_boost_attacker","value":22,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24A5": { prod: {"BronzeAge":{"money_24h":2095,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":2150,"medals_24h":306},"IronAge":{"money_24h":2095,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":2150,"medals_24h":306},"EarlyMiddleAge":{"money_24h":3418,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":3564,"medals_24h":337},"HighMiddleAge":{"money_24h":4851,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":4978,"medals_24h":367},"LateMiddleAge":{"money_24h":6284,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":6617,"medals_24h":398},"ColonialAge":{"money_24h":9702,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":8375,"medals_24h":428},"IndustrialAge":{"money_24h":12017,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":10181,"medals_24h":459},"ProgressiveEra":{"money_24h":14553,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":11939,"medals_24h":490},"ModernEra":{"money_24h":18191,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":13911,"medals_24h":520},"PostModernEra":{"money_24h":22822,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":15836,"medals_24h":551},"ContemporaryEra":{"money_24h":29657,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":17820,"medals_24h":581},"TomorrowEra":{"money_24h":34398,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":19970,"medals_24h":612},"FutureEra":{"money_24h":39470,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":21954,"medals_24h":643},"ArcticFuture":{"money_24h":44762,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":24045,"medals_24h":673},"OceanicFuture":{"money_24h":50495,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":26362,"medals_24h":704},"VirtualFuture":{"money_24h":56558,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":28512,"medals_24h":918},"SpaceAgeMars":{"money_24h":94484,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":46166,"medals_24h":1224},"SpaceAgeAsteroidBelt":{"money_24h":104627,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":49551,"medals_24h":1836},"SpaceAgeVenus":{"money_24h":115432,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":53115,"medals_24h":2448},"SpaceAgeJupiterMoon":{"money_24h":126677,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":56513,"medals_24h":3060},"SpaceAgeTitan":{"money_24h":139025,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":60125,"medals_24h":3672},"SpaceAgeSpaceHub":{"money_24h":151373,"strategy_points_24h":19,"random_good_of_age_24h":55,"supplies_24h":63737,"medals_24h":4284}}, boosts: [{"type":"att_boost_attacker","value":54,"feature":"all"},{"type":"att_boost_attacker","value":27,"feature":"battleground"},{"type":"att_boost_attacker","value":27,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24A6": { prod: {"BronzeAge":{"money_24h":2599,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":2639,"medals_24h":369},"IronAge":{"money_24h":2599,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":2639,"medals_24h":369},"EarlyMiddleAge":{"money_24h":4241,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":4374,"medals_24h":406},"HighMiddleAge":{"money_24h":6019,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":6109,"medals_24h":443},"LateMiddleAge":{"money_24h":7798,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":8121,"medals_24h":480},"ColonialAge":{"money_24h":12038,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":10279,"medals_24h":517},"IndustrialAge":{"money_24h":14911,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":12495,"medals_24h":554},"ProgressiveEra":{"money_24h":18058,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":14653,"medals_24h":590},"ModernEra":{"money_24h":22572,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":17073,"medals_24h":627},"PostModernEra":{"money_24h":28318,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":19435,"medals_24h":664},"ContemporaryEra":{"money_24h":36799,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":21870,"medals_24h":701},"TomorrowEra":{"money_24h":42682,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":24509,"medals_24h":738},"FutureEra":{"money_24h":48974,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":26944,"medals_24h":775},"ArcticFuture":{"money_24h":55541,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":29510,"medals_24h":812},"OceanicFuture":{"money_24h":62654,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":32353,"medals_24h":849},"VirtualFuture":{"money_24h":70178,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":34992,"medals_24h":1107},"SpaceAgeMars":{"money_24h":117238,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":56658,"medals_24h":1476},"SpaceAgeAsteroidBelt":{"money_24h":129823,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":60813,"medals_24h":2214},"SpaceAgeVenus":{"money_24h":143230,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":65187,"medals_24h":2952},"SpaceAgeJupiterMoon":{"money_24h":157183,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":69357,"medals_24h":3690},"SpaceAgeTitan":{"money_24h":172505,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":73789,"medals_24h":4428},"SpaceAgeSpaceHub":{"money_24h":187827,"strategy_points_24h":23,"random_good_of_age_24h":65,"supplies_24h":78221,"medals_24h":5166}}, boosts: [{"type":"att_boost_attacker","value":64,"feature":"all"},{"type":"att_boost_attacker","value":32,"feature":"battleground"},{"type":"att_boost_attacker","value":32,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24A7": { prod: {"BronzeAge":{"money_24h":3078,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":3095,"medals_24h":446},"IronAge":{"money_24h":3078,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":3095,"medals_24h":446},"EarlyMiddleAge":{"money_24h":5022,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":5130,"medals_24h":490},"HighMiddleAge":{"money_24h":7128,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":7165,"medals_24h":535},"LateMiddleAge":{"money_24h":9234,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":9525,"medals_24h":579},"ColonialAge":{"money_24h":14256,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":12056,"medals_24h":624},"IndustrialAge":{"money_24h":17658,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":14655,"medals_24h":668},"ProgressiveEra":{"money_24h":21384,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":17186,"medals_24h":713},"ModernEra":{"money_24h":26730,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":20024,"medals_24h":757},"PostModernEra":{"money_24h":33534,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":22794,"medals_24h":802},"ContemporaryEra":{"money_24h":43578,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":25650,"medals_24h":846},"TomorrowEra":{"money_24h":50544,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":28745,"medals_24h":891},"FutureEra":{"money_24h":57996,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":31601,"medals_24h":936},"ArcticFuture":{"money_24h":65772,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":34610,"medals_24h":980},"OceanicFuture":{"money_24h":74196,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":37945,"medals_24h":1025},"VirtualFuture":{"money_24h":83106,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":41040,"medals_24h":1337},"SpaceAgeMars":{"money_24h":138834,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":66451,"medals_24h":1782},"SpaceAgeAsteroidBelt":{"money_24h":153738,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":71324,"medals_24h":2673},"SpaceAgeVenus":{"money_24h":169614,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":76454,"medals_24h":3564},"SpaceAgeJupiterMoon":{"money_24h":186138,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":81345,"medals_24h":4455},"SpaceAgeTitan":{"money_24h":204282,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":86543,"medals_24h":5346},"SpaceAgeSpaceHub":{"money_24h":222426,"strategy_points_24h":26,"random_good_of_age_24h":75,"supplies_24h":91741,"medals_24h":6237}}, boosts: [{"type":"att_boost_attacker","value":74,"feature":"all"},{"type":"att_boost_attacker","value":37,"feature":"battleground"},{"type":"att_boost_attacker","value":37,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24A8": { prod: {"BronzeAge":{"money_24h":3557,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":3551,"medals_24h":513},"IronAge":{"money_24h":3557,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":3551,"medals_24h":513},"EarlyMiddleAge":{"money_24h":5803,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":5886,"medals_24h":564},"HighMiddleAge":{"money_24h":8237,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":8221,"medals_24h":616},"LateMiddleAge":{"money_24h":10670,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":10928,"medals_24h":667},"ColonialAge":{"money_24h":16474,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":13832,"medals_24h":718},"IndustrialAge":{"money_24h":20405,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":16814,"medals_24h":770},"ProgressiveEra":{"money_24h":24710,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":19718,"medals_24h":821},"ModernEra":{"money_24h":30888,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":22975,"medals_24h":872},"PostModernEra":{"money_24h":38750,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":26153,"medals_24h":923},"ContemporaryEra":{"money_24h":50357,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":29430,"medals_24h":975},"TomorrowEra":{"money_24h":58406,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":32981,"medals_24h":1026},"FutureEra":{"money_24h":67018,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":36258,"medals_24h":1077},"ArcticFuture":{"money_24h":76003,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":39711,"medals_24h":1129},"OceanicFuture":{"money_24h":85738,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":43537,"medals_24h":1180},"VirtualFuture":{"money_24h":96034,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":47088,"medals_24h":1539},"SpaceAgeMars":{"money_24h":160430,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":76243,"medals_24h":2052},"SpaceAgeAsteroidBelt":{"money_24h":177653,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":81835,"medals_24h":3078},"SpaceAgeVenus":{"money_24h":195998,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":87721,"medals_24h":4104},"SpaceAgeJupiterMoon":{"money_24h":215093,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":93332,"medals_24h":5130},"SpaceAgeTitan":{"money_24h":236059,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":99297,"medals_24h":6156},"SpaceAgeSpaceHub":{"money_24h":257025,"strategy_points_24h":30,"random_good_of_age_24h":85,"supplies_24h":105262,"medals_24h":7182}}, boosts: [{"type":"att_boost_attacker","value":84,"feature":"all"},{"type":"att_boost_attacker","value":42,"feature":"battleground"},{"type":"att_boost_attacker","value":42,"feature":"guild_expedition"}] },
+    "W_MultiAge_COP24A9": { prod: {"BronzeAge":{"money_24h":4061,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":4007,"medals_24h":588},"IronAge":{"money_24h":4061,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":4007,"medals_24h":588},"EarlyMiddleAge":{"money_24h":6626,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":6642,"medals_24h":646},"HighMiddleAge":{"money_24h":9405,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":9277,"medals_24h":705},"LateMiddleAge":{"money_24h":12184,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":12332,"medals_24h":764},"ColonialAge":{"money_24h":18810,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":15609,"medals_24h":823},"IndustrialAge":{"money_24h":23299,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":18974,"medals_24h":881},"ProgressiveEra":{"money_24h":28215,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":22251,"medals_24h":940},"ModernEra":{"money_24h":35269,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":25926,"medals_24h":999},"PostModernEra":{"money_24h":44246,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":29513,"medals_24h":1058},"ContemporaryEra":{"money_24h":57499,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":33210,"medals_24h":1116},"TomorrowEra":{"money_24h":66690,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":37217,"medals_24h":1175},"FutureEra":{"money_24h":76523,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":40915,"medals_24h":1234},"ArcticFuture":{"money_24h":86783,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":44811,"medals_24h":1293},"OceanicFuture":{"money_24h":97898,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":49129,"medals_24h":1351},"VirtualFuture":{"money_24h":109654,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":53136,"medals_24h":1763},"SpaceAgeMars":{"money_24h":183184,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":86036,"medals_24h":2350},"SpaceAgeAsteroidBelt":{"money_24h":202849,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":92346,"medals_24h":3525},"SpaceAgeVenus":{"money_24h":223796,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":98988,"medals_24h":4700},"SpaceAgeJupiterMoon":{"money_24h":245599,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":105320,"medals_24h":5875},"SpaceAgeTitan":{"money_24h":269539,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":112051,"medals_24h":7050},"SpaceAgeSpaceHub":{"money_24h":293479,"strategy_points_24h":34,"random_good_of_age_24h":95,"supplies_24h":118782,"medals_24h":8225}}, boosts: [{"type":"att_boost_attacker","value":94,"feature":"all"},{"type":"att_boost_attacker","value":47,"feature":"battleground"},{"type":"att_boost_attacker","value":47,"feature":"guild_expedition"},{"type":"att_boost_attacker","value":50,"feature":"guild_raids"}] },
+};
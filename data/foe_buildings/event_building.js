@@ -0,0 +1,95 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 91 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_GuildRaidsEarlyMiddleAge_Galgen": { boosts: [{"type":"guild_raids_action_points_collection","value":60,"feature":"all"}] },
+    "W_GuildRaidsHighMiddleAge_Alchimist": { prod: {"AllAge":{"guild_raids_supplies_t36000s":14400,"guild_raids_chrono_alloy_t36000s":75}}, boosts: [{"type":"guild_raids_supplies_production","value":10,"feature":"all"}] },
+    "W_MultiAge_HIS25F1": { prod: {"BronzeAge":{"population":80,"demandHappiness":80,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"IronAge":{"population":160,"demandHappiness":160,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"EarlyMiddleAge":{"population":250,"demandHappiness":250,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"HighMiddleAge":{"population":350,"demandHappiness":350,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"LateMiddleAge":{"population":460,"demandHappiness":460,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"ColonialAge":{"population":580,"demandHappiness":580,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"IndustrialAge":{"population":700,"demandHappiness":700,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"ProgressiveEra":{"population":840,"demandHappiness":840,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"ModernEra":{"population":980,"demandHappiness":980,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"PostModernEra":{"population":1140,"demandHappiness":1140,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"ContemporaryEra":{"population":1290,"demandHappiness":1290,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"TomorrowEra":{"population":1460,"demandHappiness":1460,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"FutureEra":{"population":1630,"demandHappiness":1630,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"ArcticFuture":{"population":1810,"demandHappiness":1810,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"OceanicFuture":{"population":1990,"demandHappiness":1990,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"VirtualFuture":{"population":2180,"demandHappiness":2180,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"SpaceAgeMars":{"population":3450,"demandHappiness":3450,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"SpaceAgeAsteroidBelt":{"population":3750,"demandHappiness":3750,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"SpaceAgeVenus":{"population":4050,"demandHappiness":4050,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"SpaceAgeJupiterMoon":{"population":4370,"demandHappiness":4370,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"SpaceAgeTitan":{"population":4680,"demandHappiness":4680,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0},"SpaceAgeSpaceHub":{"population":5000,"demandHappiness":5000,"strategy_points_24h":5,"all_goods_of_age_24h":16.0,"all_goods_of_next_age_24h":2.0}} },
+    "W_MultiAge_HIS25F2": { prod: {"BronzeAge":{"population":140,"demandHappiness":140,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"IronAge":{"population":290,"demandHappiness":290,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"EarlyMiddleAge":{"population":450,"demandHappiness":450,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"HighMiddleAge":{"population":630,"demandHappiness":630,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"LateMiddleAge":{"population":820,"demandHappiness":820,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"ColonialAge":{"population":1040,"demandHappiness":1040,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"IndustrialAge":{"population":1270,"demandHappiness":1270,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"ProgressiveEra":{"population":1510,"demandHappiness":1510,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"ModernEra":{"population":1770,"demandHappiness":1770,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"PostModernEra":{"population":2040,"demandHappiness":2040,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"ContemporaryEra":{"population":2330,"demandHappiness":2330,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"TomorrowEra":{"population":2620,"demandHappiness":2620,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"FutureEra":{"population":2930,"demandHappiness":2930,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"ArcticFuture":{"population":3260,"demandHappiness":3260,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"OceanicFuture":{"population":3590,"demandHappiness":3590,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"VirtualFuture":{"population":3930,"demandHappiness":3930,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"SpaceAgeMars":{"population":6220,"demandHappiness":6220,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"SpaceAgeAsteroidBelt":{"population":6750,"demandHappiness":6750,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"SpaceAgeVenus":{"population":7300,"demandHappiness":7300,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"SpaceAgeJupiterMoon":{"population":7860,"demandHappiness":7860,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"SpaceAgeTitan":{"population":8430,"demandHappiness":8430,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0},"SpaceAgeSpaceHub":{"population":9000,"demandHappiness":9000,"strategy_points_24h":10,"all_goods_of_previous_age_24h":10,"all_goods_of_age_24h":20.0,"all_goods_of_next_age_24h":4.0}} },
+    "W_MultiAge_HIS25F4": { prod: {"BronzeAge":{"population":230,"demandHappiness":230,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"IronAge":{"population":480,"demandHappiness":480,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"EarlyMiddleAge":{"population":740,"demandHappiness":740,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"HighMiddleAge":{"population":1040,"demandHappiness":1040,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"LateMiddleAge":{"population":1370,"demandHappiness":1370,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"ColonialAge":{"population":1730,"demandHappiness":1730,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"IndustrialAge":{"population":2110,"demandHappiness":2110,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"ProgressiveEra":{"population":2520,"demandHappiness":2520,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"ModernEra":{"population":2950,"demandHappiness":2950,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"PostModernEra":{"population":3410,"demandHappiness":3410,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"ContemporaryEra":{"population":3880,"demandHappiness":3880,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"TomorrowEra":{"population":4370,"demandHappiness":4370,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"FutureEra":{"population":4890,"demandHappiness":4890,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"ArcticFuture":{"population":5430,"demandHappiness":5430,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"OceanicFuture":{"population":5980,"demandHappiness":5980,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"VirtualFuture":{"population":6540,"demandHappiness":6540,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"SpaceAgeMars":{"population":10360,"demandHappiness":10360,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"SpaceAgeAsteroidBelt":{"population":11250,"demandHappiness":11250,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"SpaceAgeVenus":{"population":12160,"demandHappiness":12160,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"SpaceAgeJupiterMoon":{"population":13100,"demandHappiness":13100,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"SpaceAgeTitan":{"population":14050,"demandHappiness":14050,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0},"SpaceAgeSpaceHub":{"population":15000,"demandHappiness":15000,"strategy_points_24h":25,"all_goods_of_previous_age_24h":20,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":10.0}} },
+    "W_MultiAge_HIS25F3": { prod: {"BronzeAge":{"population":180,"demandHappiness":180,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"IronAge":{"population":390,"demandHappiness":390,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"EarlyMiddleAge":{"population":590,"demandHappiness":590,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"HighMiddleAge":{"population":830,"demandHappiness":830,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"LateMiddleAge":{"population":1100,"demandHappiness":1100,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"ColonialAge":{"population":1380,"demandHappiness":1380,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"IndustrialAge":{"population":1690,"demandHappiness":1690,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"ProgressiveEra":{"population":2020,"demandHappiness":2020,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"ModernEra":{"population":2360,"demandHappiness":2360,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"PostModernEra":{"population":2720,"demandHappiness":2720,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"ContemporaryEra":{"population":3110,"demandHappiness":3110,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"TomorrowEra":{"population":3500,"demandHappiness":3500,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"FutureEra":{"population":3910,"demandHappiness":3910,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"ArcticFuture":{"population":4340,"demandHappiness":4340,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"OceanicFuture":{"population":4780,"demandHappiness":4780,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"VirtualFuture":{"population":5240,"demandHappiness":5240,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"SpaceAgeMars":{"population":8290,"demandHappiness":8290,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"SpaceAgeAsteroidBelt":{"population":9000,"demandHappiness":9000,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"SpaceAgeVenus":{"population":9730,"demandHappiness":9730,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"SpaceAgeJupiterMoon":{"population":10480,"demandHappiness":10480,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"SpaceAgeTitan":{"population":11240,"demandHappiness":11240,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5},"SpaceAgeSpaceHub":{"population":12000,"demandHappiness":12000,"strategy_points_24h":20,"all_goods_of_previous_age_24h":15,"all_goods_of_age_24h":25.0,"all_goods_of_next_age_24h":7.5}} },
+    "W_GuildRaidsLateMiddleAge_Barrelproducer": { prod: {"AllAge":{"guild_raids_supplies_t36000s":24000,"guild_raids_chrono_alloy_t36000s":250}}, boosts: [{"type":"guild_raids_supplies_production","value":20,"feature":"all"}] },
+    "W_GuildRaidsEarlyMiddleAge_Cypress": { boosts: [{"type":"att_def_boost_attacker","value":10,"feature":"guild_raids"}] },
+    "W_GuildRaidsIronAge_Residential2": { prod: {"AllAge":{"guild_raids_money_t36000s":12500}}, boosts: [{"type":"guild_raids_action_points_collection","value":100,"feature":"all"}] },
+    "W_GuildRaidsEarlyMiddleAge_Tannery": { prod: {"AllAge":{"guild_raids_supplies_t36000s":12000,"guild_raids_chrono_alloy_t36000s":10}} },
+    "W_GuildRaidsIronAge_Residential1": { prod: {"AllAge":{"guild_raids_money_t36000s":6250}}, boosts: [{"type":"guild_raids_action_points_collection","value":50,"feature":"all"}] },
+    "W_GuildRaidsEarlyMiddleAge_Residential3": { prod: {"AllAge":{"guild_raids_money_t36000s":130000,"guild_raids_chrono_alloy_t36000s":250}} },
+    "W_GuildRaidsIronAge_Victorypillar": { boosts: [{"type":"att_def_boost_attacker","value":5,"feature":"guild_raids"}] },
+    "W_MultiAge_HIS25E1": { prod: {"BronzeAge":{"population":270,"demandHappiness":270,"all_goods_of_age_24h":5,"all_goods_of_previous_age_24h":150},"IronAge":{"population":580,"demandHappiness":580,"all_goods_of_age_24h":5,"all_goods_of_previous_age_24h":150},"EarlyMiddleAge":{"population":890,"demandHappiness":890,"all_goods_of_age_24h":5,"all_goods_of_previous_age_24h":150},"HighMiddleAge":{"population":1250,"demandHappiness":1250,"all_goods_of_age_24h":10,"all_goods_of_previous_age_24h":150},"LateMiddleAge":{"population":1640,"demandHappiness":1640,"all_goods_of_age_24h":15,"all_goods_of_previous_age_24h":150},"ColonialAge":{"population":2070,"demandHappiness":2070,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":150},"IndustrialAge":{"population":2530,"demandHappiness":2530,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":150},"ProgressiveEra":{"population":3030,"demandHappiness":3030,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":150},"ModernEra":{"population":3550,"demandHappiness":3550,"all_goods_of_age_24h":35,"all_goods_of_previous_age_24h":150},"PostModernEra":{"population":4090,"demandHappiness":4090,"all_goods_of_age_24h":40,"all_goods_of_previous_age_24h":150},"ContemporaryEra":{"population":4660,"demandHappiness":4660,"all_goods_of_age_24h":45,"all_goods_of_previous_age_24h":150},"TomorrowEra":{"population":5250,"demandHappiness":5250,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":150},"FutureEra":{"population":5870,"demandHappiness":5870,"all_goods_of_age_24h":55,"all_goods_of_previous_age_24h":150},"ArcticFuture":{"population":6510,"demandHappiness":6510,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":150},"OceanicFuture":{"population":7170,"demandHappiness":7170,"all_goods_of_age_24h":65,"all_goods_of_previous_age_24h":150},"VirtualFuture":{"population":7850,"demandHappiness":7850,"all_goods_of_age_24h":70,"all_goods_of_previous_age_24h":150},"SpaceAgeMars":{"population":12430,"demandHappiness":12430,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":150},"SpaceAgeAsteroidBelt":{"population":13500,"demandHappiness":13500,"all_goods_of_age_24h":80,"all_goods_of_previous_age_24h":150},"SpaceAgeVenus":{"population":14590,"demandHappiness":14590,"all_goods_of_age_24h":85,"all_goods_of_previous_age_24h":150},"SpaceAgeJupiterMoon":{"population":15720,"demandHappiness":15720,"all_goods_of_age_24h":90,"all_goods_of_previous_age_24h":150},"SpaceAgeTitan":{"population":16860,"demandHappiness":16860,"all_goods_of_age_24h":95,"all_goods_of_previous_age_24h":150},"SpaceAgeSpaceHub":{"population":18000,"demandHappiness":18000,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":150}}, boosts: [{"type":"att_def_boost_attacker_defender","value":100,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":25,"feature":"guild_expedition"}] },
+    "W_MultiAge_HIS25B1": { prod: {"BronzeAge":{"population":-270,"medals_24h":130,"strategy_points_24h":10},"IronAge":{"population":-580,"medals_24h":170,"strategy_points_24h":10},"EarlyMiddleAge":{"population":-890,"medals_24h":210,"strategy_points_24h":10},"HighMiddleAge":{"population":-1250,"medals_24h":240,"strategy_points_24h":10},"LateMiddleAge":{"population":-1640,"medals_24h":280,"strategy_points_24h":10},"ColonialAge":{"population":-2070,"medals_24h":340,"strategy_points_24h":10},"IndustrialAge":{"population":-2530,"medals_24h":470,"strategy_points_24h":10},"ProgressiveEra":{"population":-3030,"medals_24h":660,"strategy_points_24h":10},"ModernEra":{"population":-3550,"medals_24h":940,"strategy_points_24h":10},"PostModernEra":{"population":-4090,"medals_24h":1310,"strategy_points_24h":10},"ContemporaryEra":{"population":-4660,"medals_24h":1880,"strategy_points_24h":10},"TomorrowEra":{"population":-5250,"medals_24h":2530,"strategy_points_24h":10},"FutureEra":{"population":-5870,"medals_24h":3090,"strategy_points_24h":10},"ArcticFuture":{"population":-6510,"medals_24h":3750,"strategy_points_24h":10},"OceanicFuture":{"population":-7170,"medals_24h":4310,"strategy_points_24h":10},"VirtualFuture":{"population":-7850,"medals_24h":5250,"strategy_points_24h":10},"SpaceAgeMars":{"population":-12430,"medals_24h":6380,"strategy_points_24h":10},"SpaceAgeAsteroidBelt":{"population":-13500,"medals_24h":7500,"strategy_points_24h":10},"SpaceAgeVenus":{"population":-14590,"medals_24h":8630,"strategy_points_24h":10},"SpaceAgeJupiterMoon":{"population":-15720,"medals_24h":9750,"strategy_points_24h":10},"SpaceAgeTitan":{"population":-16860,"medals_24h":10880,"strategy_points_24h":10},"SpaceAgeSpaceHub":{"population":-18000,"medals_24h":12000,"strategy_points_24h":10}}, boosts: [{"type":"att_def_boost_attacker","value":10,"feature":"all"},{"type":"att_def_boost_attacker","value":25,"feature":"battleground"}] },
+    "W_GuildRaidsLateMiddleAge_Treegroup": { boosts: [{"type":"att_def_boost_defender","value":45,"feature":"guild_raids"}] },
+    "W_GuildRaidsEarlyMiddleAge_Residential2": { prod: {"AllAge":{"guild_raids_money_t36000s":25000,"guild_raids_chrono_alloy_t36000s":75}} },
+    "W_MultiAge_HIS25B2": { prod: {"BronzeAge":{"population":-270,"medals_24h":130,"strategy_points_24h":65},"IronAge":{"population":-580,"medals_24h":170,"strategy_points_24h":65},"EarlyMiddleAge":{"population":-890,"medals_24h":210,"strategy_points_24h":65},"HighMiddleAge":{"population":-1250,"medals_24h":240,"strategy_points_24h":65},"LateMiddleAge":{"population":-1640,"medals_24h":280,"strategy_points_24h":65},"ColonialAge":{"population":-2070,"medals_24h":340,"strategy_points_24h":65},"IndustrialAge":{"population":-2530,"medals_24h":470,"strategy_points_24h":65},"ProgressiveEra":{"population":-3030,"medals_24h":660,"strategy_points_24h":65},"ModernEra":{"population":-3550,"medals_24h":940,"strategy_points_24h":65},"PostModernEra":{"population":-4090,"medals_24h":1310,"strategy_points_24h":65},"ContemporaryEra":{"population":-4660,"medals_24h":1880,"strategy_points_24h":65},"TomorrowEra":{"population":-5250,"medals_24h":2530,"strategy_points_24h":65},"FutureEra":{"population":-5870,"medals_24h":3090,"strategy_points_24h":65},"ArcticFuture":{"population":-6510,"medals_24h":3750,"strategy_points_24h":65},"OceanicFuture":{"population":-7170,"medals_24h":4310,"strategy_points_24h":65},"VirtualFuture":{"population":-7850,"medals_24h":5250,"strategy_points_24h":65},"SpaceAgeMars":{"population":-12430,"medals_24h":6380,"strategy_points_24h":65},"SpaceAgeAsteroidBelt":{"population":-13500,"medals_24h":7500,"strategy_points_24h":65},"SpaceAgeVenus":{"population":-14590,"medals_24h":8630,"strategy_points_24h":65},"SpaceAgeJupiterMoon":{"population":-15720,"medals_24h":9750,"strategy_points_24h":65},"SpaceAgeTitan":{"population":-16860,"medals_24h":10880,"strategy_points_24h":65},"SpaceAgeSpaceHub":{"population":-18000,"medals_24h":12000,"strategy_points_24h":65}}, boosts: [{"type":"att_def_boost_attacker","value":50,"feature":"all"},{"type":"att_def_boost_attacker","value":90,"feature":"battleground"},{"type":"att_def_boost_attacker","value":25,"feature":"guild_raids"},{"type":"guild_raids_supplies_start","value":20000,"feature":"all"},{"type":"guild_raids_units_start","value":5,"feature":"all"}] },
+    "W_MultiAge_HIS25C2": { prod: {"BronzeAge":{"population":-360,"happiness":990,"supplies_24h":3500,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"IronAge":{"population":-770,"happiness":1710,"supplies_24h":8400,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"EarlyMiddleAge":{"population":-1190,"happiness":1890,"supplies_24h":14010,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"HighMiddleAge":{"population":-1670,"happiness":2110,"supplies_24h":19610,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"LateMiddleAge":{"population":-2190,"happiness":2350,"supplies_24h":25910,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"ColonialAge":{"population":-2760,"happiness":2770,"supplies_24h":32910,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"IndustrialAge":{"population":-3380,"happiness":3120,"supplies_24h":39920,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"ProgressiveEra":{"population":-4030,"happiness":3430,"supplies_24h":46920,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"ModernEra":{"population":-4730,"happiness":3660,"supplies_24h":54620,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"PostModernEra":{"population":-5450,"happiness":3820,"supplies_24h":62320,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"ContemporaryEra":{"population":-6210,"happiness":4440,"supplies_24h":70030,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"TomorrowEra":{"population":-7000,"happiness":5390,"supplies_24h":78430,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"FutureEra":{"population":-7830,"happiness":6450,"supplies_24h":86130,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"ArcticFuture":{"population":-8680,"happiness":7510,"supplies_24h":94540,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"OceanicFuture":{"population":-9560,"happiness":8670,"supplies_24h":103640,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"VirtualFuture":{"population":-10470,"happiness":10360,"supplies_24h":112040,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"SpaceAgeMars":{"population":-16570,"happiness":16570,"supplies_24h":181370,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"SpaceAgeAsteroidBelt":{"population":-18000,"happiness":18010,"supplies_24h":194680,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"SpaceAgeVenus":{"population":-19460,"happiness":19460,"supplies_24h":208680,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"SpaceAgeJupiterMoon":{"population":-20950,"happiness":20960,"supplies_24h":221990,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"SpaceAgeTitan":{"population":-22480,"happiness":22480,"supplies_24h":235990,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100},"SpaceAgeSpaceHub":{"population":-24000,"happiness":24000,"supplies_24h":250000,"all_goods_of_age_24h":75,"all_goods_of_previous_age_24h":100}}, boosts: [{"type":"att_def_boost_defender","value":125,"feature":"battleground"},{"type":"att_def_boost_defender","value":100,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":25,"feature":"guild_raids"},{"type":"guild_raids_goods_start","value":10,"feature":"all"},{"type":"guild_raids_units_start","value":5,"feature":"all"}] },
+    "W_MultiAge_HIS25A11": { prod: {"BronzeAge":{"happiness":3310,"money_24h":3420,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":119.0},"IronAge":{"happiness":5700,"money_24h":8200,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":120.0},"EarlyMiddleAge":{"happiness":6300,"money_24h":13660,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":121.0},"HighMiddleAge":{"happiness":7030,"money_24h":19130,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":122.0},"LateMiddleAge":{"happiness":7840,"money_24h":25280,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":123.0},"ColonialAge":{"happiness":9220,"money_24h":38500,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":124.0},"IndustrialAge":{"happiness":10400,"money_24h":47960,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":125.0},"ProgressiveEra":{"happiness":11420,"money_24h":58210,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":126.0},"ModernEra":{"happiness":12220,"money_24h":72420,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":127.0},"PostModernEra":{"happiness":12730,"money_24h":91100,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":128.0},"ContemporaryEra":{"happiness":14790,"money_24h":118600,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":129.0},"TomorrowEra":{"happiness":17950,"money_24h":137320,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":130.0},"FutureEra":{"happiness":21510,"money_24h":157400,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":131.0},"ArcticFuture":{"happiness":25050,"money_24h":178860,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":132.0},"OceanicFuture":{"happiness":28900,"money_24h":201670,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":133.0},"VirtualFuture":{"happiness":34530,"money_24h":225890,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":134.0},"SpaceAgeMars":{"happiness":55250,"money_24h":377320,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":135.0},"SpaceAgeAsteroidBelt":{"happiness":60040,"money_24h":417930,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":136.0},"SpaceAgeVenus":{"happiness":64860,"money_24h":460700,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":137.0},"SpaceAgeJupiterMoon":{"happiness":69870,"money_24h":505650,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":138.0},"SpaceAgeTitan":{"happiness":74940,"money_24h":552830,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":139.0},"SpaceAgeSpaceHub":{"happiness":80000,"money_24h":600000,"all_goods_of_age_24h":150,"all_goods_of_next_age_24h":100,"strategy_points_24h":140.0}}, boosts: [{"type":"def_boost_defender","value":158,"feature":"all"},{"type":"def_boost_defender","value":133,"feature":"battleground"},{"type":"def_boost_defender","value":133,"feature":"guild_expedition"}] },
+    "W_MultiAge_HIS25A12": { prod: {"BronzeAge":{"happiness":4130,"money_24h":4270,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":159.0},"IronAge":{"happiness":7120,"money_24h":10250,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":160.0},"EarlyMiddleAge":{"happiness":7880,"money_24h":17080,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":161.0},"HighMiddleAge":{"happiness":8790,"money_24h":23910,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":162.0},"LateMiddleAge":{"happiness":9800,"money_24h":31600,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":163.0},"ColonialAge":{"happiness":11520,"money_24h":48120,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":164.0},"IndustrialAge":{"happiness":13000,"money_24h":59950,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":165.0},"ProgressiveEra":{"happiness":14270,"money_24h":72760,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":166.0},"ModernEra":{"happiness":15270,"money_24h":90520,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":167.0},"PostModernEra":{"happiness":15910,"money_24h":113880,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":168.0},"ContemporaryEra":{"happiness":18490,"money_24h":148250,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":169.0},"TomorrowEra":{"happiness":22440,"money_24h":171650,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":170.0},"FutureEra":{"happiness":26890,"money_24h":196750,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":171.0},"ArcticFuture":{"happiness":31310,"money_24h":223570,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":172.0},"OceanicFuture":{"happiness":36130,"money_24h":252090,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":173.0},"VirtualFuture":{"happiness":43160,"money_24h":282370,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":174.0},"SpaceAgeMars":{"happiness":69060,"money_24h":471650,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":175.0},"SpaceAgeAsteroidBelt":{"happiness":75050,"money_24h":522420,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":176.0},"SpaceAgeVenus":{"happiness":81080,"money_24h":575880,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":177.0},"SpaceAgeJupiterMoon":{"happiness":87340,"money_24h":632070,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":178.0},"SpaceAgeTitan":{"happiness":93670,"money_24h":691030,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":179.0},"SpaceAgeSpaceHub":{"happiness":100000,"money_24h":750000,"all_goods_of_age_24h":200,"all_goods_of_next_age_24h":175,"strategy_points_24h":180.0}}, boosts: [{"type":"def_boost_defender","value":308,"feature":"all"},{"type":"def_boost_defender","value":233,"feature":"battleground"},{"type":"def_boost_defender","value":233,"feature":"guild_expedition"}] },
+    "W_MultiAge_HIS25A1": { prod: {"BronzeAge":{"happiness":620,"money_24h":140,"strategy_points_24h":1},"IronAge":{"happiness":1070,"money_24h":340,"strategy_points_24h":1},"EarlyMiddleAge":{"happiness":1180,"money_24h":570,"strategy_points_24h":1},"HighMiddleAge":{"happiness":1320,"money_24h":800,"strategy_points_24h":1},"LateMiddleAge":{"happiness":1470,"money_24h":1050,"strategy_points_24h":1},"ColonialAge":{"happiness":1730,"money_24h":1600,"strategy_points_24h":1},"IndustrialAge":{"happiness":1950,"money_24h":2000,"strategy_points_24h":1},"ProgressiveEra":{"happiness":2140,"money_24h":2430,"strategy_points_24h":1},"ModernEra":{"happiness":2290,"money_24h":3020,"strategy_points_24h":1},"PostModernEra":{"happiness":2390,"money_24h":3800,"strategy_points_24h":1},"ContemporaryEra":{"happiness":2770,"money_24h":4940,"strategy_points_24h":1},"TomorrowEra":{"happiness":3370,"money_24h":5720,"strategy_points_24h":1},"FutureEra":{"happiness":4030,"money_24h":6560,"strategy_points_24h":1},"ArcticFuture":{"happiness":4700,"money_24h":7450,"strategy_points_24h":1},"OceanicFuture":{"happiness":5420,"money_24h":8400,"strategy_points_24h":1},"VirtualFuture":{"happiness":6470,"money_24h":9410,"strategy_points_24h":1},"SpaceAgeMars":{"happiness":10360,"money_24h":15720,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"happiness":11260,"money_24h":17410,"strategy_points_24h":1},"SpaceAgeVenus":{"happiness":12160,"money_24h":19200,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"happiness":13100,"money_24h":21070,"strategy_points_24h":3},"SpaceAgeTitan":{"happiness":14050,"money_24h":23030,"strategy_points_24h":4},"SpaceAgeSpaceHub":{"happiness":15000,"money_24h":25000,"strategy_points_24h":5}} },
+    "W_MultiAge_HIS25A10": { prod: {"BronzeAge":{"happiness":2480,"money_24h":2280,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":49.0},"IronAge":{"happiness":4270,"money_24h":5470,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":50.0},"EarlyMiddleAge":{"happiness":4730,"money_24h":9110,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":51.0},"HighMiddleAge":{"happiness":5270,"money_24h":12750,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":52.0},"LateMiddleAge":{"happiness":5880,"money_24h":16850,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":53.0},"ColonialAge":{"happiness":6910,"money_24h":25660,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":54.0},"IndustrialAge":{"happiness":7800,"money_24h":31970,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":55.0},"ProgressiveEra":{"happiness":8560,"money_24h":38800,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":56.0},"ModernEra":{"happiness":9160,"money_24h":48280,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":57.0},"PostModernEra":{"happiness":9550,"money_24h":60730,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":58.0},"ContemporaryEra":{"happiness":11090,"money_24h":79070,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":59.0},"TomorrowEra":{"happiness":13460,"money_24h":91550,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":60.0},"FutureEra":{"happiness":16130,"money_24h":104940,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":61.0},"ArcticFuture":{"happiness":18780,"money_24h":119240,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":62.0},"OceanicFuture":{"happiness":21680,"money_24h":134450,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":63.0},"VirtualFuture":{"happiness":25900,"money_24h":150590,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":64.0},"SpaceAgeMars":{"happiness":41440,"money_24h":251550,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":65.0},"SpaceAgeAsteroidBelt":{"happiness":45030,"money_24h":278620,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":66.0},"SpaceAgeVenus":{"happiness":48650,"money_24h":307130,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":67.0},"SpaceAgeJupiterMoon":{"happiness":52410,"money_24h":337100,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":68.0},"SpaceAgeTitan":{"happiness":56200,"money_24h":368550,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":69.0},"SpaceAgeSpaceHub":{"happiness":60000,"money_24h":400000,"all_goods_of_age_24h":100,"all_goods_of_next_age_24h":75,"strategy_points_24h":70.0}}, boosts: [{"type":"def_boost_defender","value":58,"feature":"all"},{"type":"def_boost_defender","value":33,"feature":"battleground"},{"type":"def_boost_defender","value":33,"feature":"guild_expedition"}] },
+    "W_MultiAge_HIS25A2": { prod: {"BronzeAge":{"happiness":830,"money_24h":280,"strategy_points_24h":1},"IronAge":{"happiness":1420,"money_24h":680,"strategy_points_24h":1},"EarlyMiddleAge":{"happiness":1580,"money_24h":1140,"strategy_points_24h":1},"HighMiddleAge":{"happiness":1760,"money_24h":1590,"strategy_points_24h":1},"LateMiddleAge":{"happiness":1960,"money_24h":2110,"strategy_points_24h":1},"ColonialAge":{"happiness":2300,"money_24h":3210,"strategy_points_24h":1},"IndustrialAge":{"happiness":2600,"money_24h":4000,"strategy_points_24h":1},"ProgressiveEra":{"happiness":2850,"money_24h":4850,"strategy_points_24h":1},"ModernEra":{"happiness":3050,"money_24h":6030,"strategy_points_24h":1},"PostModernEra":{"happiness":3180,"money_24h":7590,"strategy_points_24h":1},"ContemporaryEra":{"happiness":3700,"money_24h":9880,"strategy_points_24h":1},"TomorrowEra":{"happiness":4490,"money_24h":11440,"strategy_points_24h":1},"FutureEra":{"happiness":5380,"money_24h":13120,"strategy_points_24h":1},"ArcticFuture":{"happiness":6260,"money_24h":14900,"strategy_points_24h":1},"OceanicFuture":{"happiness":7230,"money_24h":16810,"strategy_points_24h":1},"VirtualFuture":{"happiness":8630,"money_24h":18820,"strategy_points_24h":2},"SpaceAgeMars":{"happiness":13810,"money_24h":31440,"strategy_points_24h":3},"SpaceAgeAsteroidBelt":{"happiness":15010,"money_24h":34830,"strategy_points_24h":4},"SpaceAgeVenus":{"happiness":16220,"money_24h":38390,"strategy_points_24h":5},"SpaceAgeJupiterMoon":{"happiness":17470,"money_24h":42140,"strategy_points_24h":6},"SpaceAgeTitan":{"happiness":18730,"money_24h":46070,"strategy_points_24h":7},"SpaceAgeSpaceHub":{"happiness":20000,"money_24h":50000,"strategy_points_24h":8}} },
+    "W_MultiAge_HIS25A3": { prod: {"BronzeAge":{"happiness":1030,"money_24h":430,"strategy_points_24h":1},"IronAge":{"happiness":1780,"money_24h":1020,"strategy_points_24h":1},"EarlyMiddleAge":{"happiness":1970,"money_24h":1710,"strategy_points_24h":1},"HighMiddleAge":{"happiness":2200,"money_24h":2390,"strategy_points_24h":1},"LateMiddleAge":{"happiness":2450,"money_24h":3160,"strategy_points_24h":1},"ColonialAge":{"happiness":2880,"money_24h":4810,"strategy_points_24h":1},"IndustrialAge":{"happiness":3250,"money_24h":5990,"strategy_points_24h":1},"ProgressiveEra":{"happiness":3570,"money_24h":7280,"strategy_points_24h":1},"ModernEra":{"happiness":3820,"money_24h":9050,"strategy_points_24h":1},"PostModernEra":{"happiness":3980,"money_24h":11390,"strategy_points_24h":1},"ContemporaryEra":{"happiness":4620,"money_24h":14820,"strategy_points_24h":1},"TomorrowEra":{"happiness":5610,"money_24h":17160,"strategy_points_24h":1},"FutureEra":{"happiness":6720,"money_24h":19680,"strategy_points_24h":1},"ArcticFuture":{"happiness":7830,"money_24h":22360,"strategy_points_24h":2},"OceanicFuture":{"happiness":9030,"money_24h":25210,"strategy_points_24h":3},"VirtualFuture":{"happiness":10790,"money_24h":28240,"strategy_points_24h":4},"SpaceAgeMars":{"happiness":17270,"money_24h":47160,"strategy_points_24h":5},"SpaceAgeAsteroidBelt":{"happiness":18760,"money_24h":52240,"strategy_points_24h":6},"SpaceAgeVenus":{"happiness":20270,"money_24h":57590,"strategy_points_24h":7},"SpaceAgeJupiterMoon":{"happiness":21840,"money_24h":63210,"strategy_points_24h":8},"SpaceAgeTitan":{"happiness":23420,"money_24h":69100,"strategy_points_24h":9},"SpaceAgeSpaceHub":{"happiness":25000,"money_24h":75000,"strategy_points_24h":10}} },
+    "W_MultiAge_HIS25A4": { prod: {"BronzeAge":{"happiness":1240,"money_24h":570,"strategy_points_24h":1},"IronAge":{"happiness":2140,"money_24h":1370,"strategy_points_24h":1},"EarlyMiddleAge":{"happiness":2360,"money_24h":2280,"strategy_points_24h":1},"HighMiddleAge":{"happiness":2640,"money_24h":3190,"strategy_points_24h":1},"LateMiddleAge":{"happiness":2940,"money_24h":4210,"strategy_points_24h":1},"ColonialAge":{"happiness":3460,"money_24h":6420,"strategy_points_24h":1},"IndustrialAge":{"happiness":3900,"money_24h":7990,"strategy_points_24h":1},"ProgressiveEra":{"happiness":4280,"money_24h":9700,"strategy_points_24h":1},"ModernEra":{"happiness":4580,"money_24h":12070,"strategy_points_24h":2},"PostModernEra":{"happiness":4770,"money_24h":15180,"strategy_points_24h":3},"ContemporaryEra":{"happiness":5550,"money_24h":19770,"strategy_points_24h":4},"TomorrowEra":{"happiness":6730,"money_24h":22890,"strategy_points_24h":5},"FutureEra":{"happiness":8070,"money_24h":26230,"strategy_points_24h":6},"ArcticFuture":{"happiness":9390,"money_24h":29810,"strategy_points_24h":7},"OceanicFuture":{"happiness":10840,"money_24h":33610,"strategy_points_24h":8},"VirtualFuture":{"happiness":12950,"money_24h":37650,"strategy_points_24h":9},"SpaceAgeMars":{"happiness":20720,"money_24h":62890,"strategy_points_24h":10},"SpaceAgeAsteroidBelt":{"happiness":22510,"money_24h":69660,"strategy_points_24h":11},"SpaceAgeVenus":{"happiness":24320,"money_24h":76780,"strategy_points_24h":12},"SpaceAgeJupiterMoon":{"happiness":26200,"money_24h":84280,"strategy_points_24h":13},"SpaceAgeTitan":{"happiness":28100,"money_24h":92140,"strategy_points_24h":14},"SpaceAgeSpaceHub":{"happiness":30000,"money_24h":100000,"strategy_points_24h":15}} },
+    "W_MultiAge_HIS25A5": { prod: {"BronzeAge":{"happiness":1450,"money_24h":850,"strategy_points_24h":1},"IronAge":{"happiness":2490,"money_24h":2050,"strategy_points_24h":1},"EarlyMiddleAge":{"happiness":2760,"money_24h":3420,"strategy_points_24h":1},"HighMiddleAge":{"happiness":3080,"money_24h":4780,"strategy_points_24h":2},"LateMiddleAge":{"happiness":3430,"money_24h":6320,"strategy_points_24h":3},"ColonialAge":{"happiness":4030,"money_24h":9620,"strategy_points_24h":4},"IndustrialAge":{"happiness":4550,"money_24h":11990,"strategy_points_24h":5},"ProgressiveEra":{"happiness":4990,"money_24h":14550,"strategy_points_24h":6},"ModernEra":{"happiness":5340,"money_24h":18100,"strategy_points_24h":7},"PostModernEra":{"happiness":5570,"money_24h":22780,"strategy_points_24h":8},"ContemporaryEra":{"happiness":6470,"money_24h":29650,"strategy_points_24h":9},"TomorrowEra":{"happiness":7850,"money_24h":34330,"strategy_points_24h":10},"FutureEra":{"happiness":9410,"money_24h":39350,"strategy_points_24h":11},"ArcticFuture":{"happiness":10960,"money_24h":44710,"strategy_points_24h":12},"OceanicFuture":{"happiness":12640,"money_24h":50420,"strategy_points_24h":13},"VirtualFuture":{"happiness":15110,"money_24h":56470,"strategy_points_24h":14},"SpaceAgeMars":{"happiness":24170,"money_24h":94330,"strategy_points_24h":15},"SpaceAgeAsteroidBelt":{"happiness":26270,"money_24h":104480,"strategy_points_24h":16},"SpaceAgeVenus":{"happiness":28380,"money_24h":115180,"strategy_points_24h":17},"SpaceAgeJupiterMoon":{"happiness":30570,"money_24h":126410,"strategy_points_24h":18},"SpaceAgeTitan":{"happiness":32790,"money_24h":138210,"strategy_points_24h":19},"SpaceAgeSpaceHub":{"happiness":35000,"money_24h":150000,"strategy_points_24h":20}} },
+    "W_MultiAge_HIS25A6": { prod: {"BronzeAge":{"happiness":1650,"money_24h":1140,"strategy_points_24h":4},"IronAge":{"happiness":2850,"money_24h":2730,"strategy_points_24h":5},"EarlyMiddleAge":{"happiness":3150,"money_24h":4550,"strategy_points_24h":6},"HighMiddleAge":{"happiness":3520,"money_24h":6380,"strategy_points_24h":7},"LateMiddleAge":{"happiness":3920,"money_24h":8430,"strategy_points_24h":8},"ColonialAge":{"happiness":4610,"money_24h":12830,"strategy_points_24h":9},"IndustrialAge":{"happiness":5200,"money_24h":15990,"strategy_points_24h":10},"ProgressiveEra":{"happiness":5710,"money_24h":19400,"strategy_points_24h":11},"ModernEra":{"happiness":6110,"money_24h":24140,"strategy_points_24h":12},"PostModernEra":{"happiness":6360,"money_24h":30370,"strategy_points_24h":13},"ContemporaryEra":{"happiness":7390,"money_24h":39530,"strategy_points_24h":14},"TomorrowEra":{"happiness":8980,"money_24h":45770,"strategy_points_24h":15},"FutureEra":{"happiness":10750,"money_24h":52470,"strategy_points_24h":16},"ArcticFuture":{"happiness":12520,"money_24h":59620,"strategy_points_24h":17},"OceanicFuture":{"happiness":14450,"money_24h":67220,"strategy_points_24h":18},"VirtualFuture":{"happiness":17260,"money_24h":75300,"strategy_points_24h":19},"SpaceAgeMars":{"happiness":27620,"money_24h":125770,"strategy_points_24h":20},"SpaceAgeAsteroidBelt":{"happiness":30020,"money_24h":139310,"strategy_points_24h":21},"SpaceAgeVenus":{"happiness":32430,"money_24h":153570,"strategy_points_24h":22},"SpaceAgeJupiterMoon":{"happiness":34940,"money_24h":168550,"strategy_points_24h":23},"SpaceAgeTitan":{"happiness":37470,"money_24h":184280,"strategy_points_24h":24},"SpaceAgeSpaceHub":{"happiness":40000,"money_24h":200000,"strategy_points_24h":25}} },
+    "W_MultiAge_HIS25A7": { prod: {"BronzeAge":{"happiness":1860,"money_24h":1420,"strategy_points_24h":9},"IronAge":{"happiness":3210,"money_24h":3420,"strategy_points_24h":10},"EarlyMiddleAge":{"happiness":3540,"money_24h":5690,"strategy_points_24h":11},"HighMiddleAge":{"happiness":3950,"money_24h":7970,"strategy_points_24h":12},"LateMiddleAge":{"happiness":4410,"money_24h":10530,"strategy_points_24h":13},"ColonialAge":{"happiness":5190,"money_24h":16040,"strategy_points_24h":14},"IndustrialAge":{"happiness":5850,"money_24h":19980,"strategy_points_24h":15},"ProgressiveEra":{"happiness":6420,"money_24h":24250,"strategy_points_24h":16},"ModernEra":{"happiness":6870,"money_24h":30170,"strategy_points_24h":17},"PostModernEra":{"happiness":7160,"money_24h":37960,"strategy_points_24h":18},"ContemporaryEra":{"happiness":8320,"money_24h":49420,"strategy_points_24h":19},"TomorrowEra":{"happiness":10100,"money_24h":57220,"strategy_points_24h":20},"FutureEra":{"happiness":12100,"money_24h":65580,"strategy_points_24h":21},"ArcticFuture":{"happiness":14090,"money_24h":74520,"strategy_points_24h":22},"OceanicFuture":{"happiness":16260,"money_24h":84030,"strategy_points_24h":23},"VirtualFuture":{"happiness":19420,"money_24h":94120,"strategy_points_24h":24},"SpaceAgeMars":{"happiness":31080,"money_24h":157220,"strategy_points_24h":25},"SpaceAgeAsteroidBelt":{"happiness":33770,"money_24h":174140,"strategy_points_24h":26},"SpaceAgeVenus":{"happiness":36490,"money_24h":191960,"strategy_points_24h":27},"SpaceAgeJupiterMoon":{"happiness":39300,"money_24h":210690,"strategy_points_24h":28},"SpaceAgeTitan":{"happiness":42150,"money_24h":230340,"strategy_points_24h":29},"SpaceAgeSpaceHub":{"happiness":45000,"money_24h":250000,"strategy_points_24h":30}} },
+    "W_MultiAge_HIS25A8": { prod: {"BronzeAge":{"happiness":2070,"money_24h":1710,"strategy_points_24h":14},"IronAge":{"happiness":3560,"money_24h":4100,"strategy_points_24h":15},"EarlyMiddleAge":{"happiness":3940,"money_24h":6830,"strategy_points_24h":16},"HighMiddleAge":{"happiness":4390,"money_24h":9560,"strategy_points_24h":17},"LateMiddleAge":{"happiness":4900,"money_24h":12640,"strategy_points_24h":18},"ColonialAge":{"happiness":5760,"money_24h":19250,"strategy_points_24h":19},"IndustrialAge":{"happiness":6500,"money_24h":23980,"strategy_points_24h":20},"ProgressiveEra":{"happiness":7140,"money_24h":29100,"strategy_points_24h":21},"ModernEra":{"happiness":7630,"money_24h":36210,"strategy_points_24h":22},"PostModernEra":{"happiness":7950,"money_24h":45550,"strategy_points_24h":23},"ContemporaryEra":{"happiness":9240,"money_24h":59300,"strategy_points_24h":24},"TomorrowEra":{"happiness":11220,"money_24h":68660,"strategy_points_24h":25},"FutureEra":{"happiness":13440,"money_24h":78700,"strategy_points_24h":26},"ArcticFuture":{"happiness":15650,"money_24h":89430,"strategy_points_24h":27},"OceanicFuture":{"happiness":18060,"money_24h":100840,"strategy_points_24h":28},"VirtualFuture":{"happiness":21580,"money_24h":112950,"strategy_points_24h":29},"SpaceAgeMars":{"happiness":34530,"money_24h":188660,"strategy_points_24h":30},"SpaceAgeAsteroidBelt":{"happiness":37520,"money_24h":208970,"strategy_points_24h":31},"SpaceAgeVenus":{"happiness":40540,"money_24h":230350,"strategy_points_24h":32},"SpaceAgeJupiterMoon":{"happiness":43670,"money_24h":252830,"strategy_points_24h":33},"SpaceAgeTitan":{"happiness":46840,"money_24h":276410,"strategy_points_24h":34},"SpaceAgeSpaceHub":{"happiness":50000,"money_24h":300000,"strategy_points_24h":35}}, boosts: [{"type":"def_boost_defender","value":1,"feature":"all"},{"type":"def_boost_defender","value":1,"feature":"battleground"}] },
+    "W_MultiAge_HIS25A9": { prod: {"BronzeAge":{"happiness":2270,"money_24h":1990,"strategy_points_24h":19},"IronAge":{"happiness":3920,"money_24h":4780,"strategy_points_24h":20},"EarlyMiddleAge":{"happiness":4330,"money_24h":7970,"strategy_points_24h":21},"HighMiddleAge":{"happiness":4830,"money_24h":11160,"strategy_points_24h":22},"LateMiddleAge":{"happiness":5390,"money_24h":14750,"strategy_points_24h":23},"ColonialAge":{"happiness":6340,"money_24h":22460,"strategy_points_24h":24},"IndustrialAge":{"happiness":7150,"money_24h":27980,"strategy_points_24h":25},"ProgressiveEra":{"happiness":7850,"money_24h":33950,"strategy_points_24h":26},"ModernEra":{"happiness":8400,"money_24h":42240,"strategy_points_24h":27},"PostModernEra":{"happiness":8750,"money_24h":53140,"strategy_points_24h":28},"ContemporaryEra":{"happiness":10170,"money_24h":69180,"strategy_points_24h":29},"TomorrowEra":{"happiness":12340,"money_24h":80100,"strategy_points_24h":30},"FutureEra":{"happiness":14790,"money_24h":91820,"strategy_points_24h":31},"ArcticFuture":{"happiness":17220,"money_24h":104330,"strategy_points_24h":32},"OceanicFuture":{"happiness":19870,"money_24h":117640,"strategy_points_24h":33},"VirtualFuture":{"happiness":23740,"money_24h":131770,"strategy_points_24h":34},"SpaceAgeMars":{"happiness":37980,"money_24h":220100,"strategy_points_24h":35},"SpaceAgeAsteroidBelt":{"happiness":41280,"money_24h":243790,"strategy_points_24h":36},"SpaceAgeVenus":{"happiness":44590,"money_24h":268740,"strategy_points_24h":37},"SpaceAgeJupiterMoon":{"happiness":48040,"money_24h":294960,"strategy_points_24h":38},"SpaceAgeTitan":{"happiness":51520,"money_24h":322480,"strategy_points_24h":39},"SpaceAgeSpaceHub":{"happiness":55000,"money_24h":350000,"strategy_points_24h":40}}, boosts: [{"type":"def_boost_defender","value":8,"feature":"all"},{"type":"def_boost_defender","value":1,"feature":"battleground"}] },
+    "W_GuildRaidsLateMiddleAge_Spicefarm": { prod: {"AllAge":{"guild_raids_supplies_t36000s":9600,"guild_raids_chrono_alloy_t36000s":75}}, boosts: [{"type":"guild_raids_supplies_production","value":20,"feature":"all"}] },
+    "W_GuildRaidsHighMiddleAge_Wheatfarm": { prod: {"AllAge":{"guild_raids_supplies_t36000s":7200,"guild_raids_chrono_alloy_t36000s":10}}, boosts: [{"type":"guild_raids_supplies_production","value":10,"feature":"all"}] },
+    "W_AllAge_CupBonus1": { prod: {"BronzeAge":{"medals_7d":7},"IronAge":{"medals_7d":9},"EarlyMiddleAge":{"medals_7d":11},"HighMiddleAge":{"medals_7d":13},"LateMiddleAge":{"medals_7d":15},"ColonialAge":{"medals_7d":18},"IndustrialAge":{"medals_7d":25},"ProgressiveEra":{"medals_7d":35},"ModernEra":{"medals_7d":50},"PostModernEra":{"medals_7d":70},"ContemporaryEra":{"medals_7d":100},"TomorrowEra":{"medals_7d":135},"FutureEra":{"medals_7d":180},"ArcticFuture":{"medals_7d":230},"OceanicFuture":{"medals_7d":280},"VirtualFuture":{"medals_7d":330},"SpaceAgeMars":{"medals_7d":380},"SpaceAgeAsteroidBelt":{"medals_7d":440},"SpaceAgeVenus":{"medals_7d":510},"SpaceAgeJupiterMoon":{"medals_7d":590},"SpaceAgeTitan":{"medals_7d":630},"SpaceAgeSpaceHub":{"medals_7d":690}} },
+    "W_AllAge_CupBonus2": { prod: {"BronzeAge":{"medals_7d":14},"IronAge":{"medals_7d":18},"EarlyMiddleAge":{"medals_7d":22},"HighMiddleAge":{"medals_7d":26},"LateMiddleAge":{"medals_7d":30},"ColonialAge":{"medals_7d":36},"IndustrialAge":{"medals_7d":50},"ProgressiveEra":{"medals_7d":70},"ModernEra":{"medals_7d":100},"PostModernEra":{"medals_7d":140},"ContemporaryEra":{"medals_7d":200},"TomorrowEra":{"medals_7d":270},"FutureEra":{"medals_7d":360},"ArcticFuture":{"medals_7d":460},"OceanicFuture":{"medals_7d":560},"VirtualFuture":{"medals_7d":660},"SpaceAgeMars":{"medals_7d":780},"SpaceAgeAsteroidBelt":{"medals_7d":880},"SpaceAgeVenus":{"medals_7d":1020},"SpaceAgeJupiterMoon":{"medals_7d":1200},"SpaceAgeTitan":{"medals_7d":1260},"SpaceAgeSpaceHub":{"medals_7d":1380}} },
+    "W_GuildRaidsEarlyMiddleAge_Pond": { boosts: [{"type":"att_def_boost_attacker","value":25,"feature":"guild_raids"},{"type":"att_def_boost_defender","value":25,"feature":"guild_raids"}] },
+    "W_MultiAge_HIS25D1": { prod: {"BronzeAge":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"IronAge":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"EarlyMiddleAge":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"HighMiddleAge":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"LateMiddleAge":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"ColonialAge":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"IndustrialAge":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"ProgressiveEra":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"ModernEra":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"PostModernEra":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"ContemporaryEra":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"TomorrowEra":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"FutureEra":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"ArcticFuture":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"OceanicFuture":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"VirtualFuture":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"SpaceAgeMars":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"SpaceAgeAsteroidBelt":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"SpaceAgeVenus":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"SpaceAgeJupiterMoon":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"SpaceAgeTitan":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50},"SpaceAgeSpaceHub":{"all_goods_of_age_24h":160,"all_goods_of_previous_age_24h":200,"all_goods_of_next_age_24h":50}}, boosts: [{"type":"att_boost_attacker","value":50,"feature":"guild_raids"},{"type":"def_boost_defender","value":50,"feature":"guild_expedition"},{"type":"att_def_boost_attacker_defender","value":140,"feature":"all"}] },
+    "W_SpaceAgeJupiterMoon_Residential1": { prod: {"AllAge":{"population":8240,"demandHappiness":8240,"money_4h":23680}} },
+    "W_GuildRaidsIronAge_Goatbreed": { prod: {"AllAge":{"guild_raids_supplies_t36000s":43750}} },
+    "W_AllAge_EasterBonus1Small": { prod: {"BronzeAge":{"premium_24h":0.5,"medals_24h":0.18,"strategy_points_24h":0.2,"money_24h":112.5,"supplies_24h":112.5,"random_good_of_age_24h":3.0},"IronAge":{"premium_24h":0.5,"medals_24h":0.27,"strategy_points_24h":0.2,"money_24h":270.0,"supplies_24h":270.0,"random_good_of_age_24h":3.0},"EarlyMiddleAge":{"premium_24h":0.5,"medals_24h":0.45,"strategy_points_24h":0.2,"money_24h":450.0,"supplies_24h":450.0,"random_good_of_age_24h":3.0},"HighMiddleAge":{"premium_24h":0.5,"medals_24h":0.9,"strategy_points_24h":0.2,"money_24h":630.0,"supplies_24h":625.0,"random_good_of_age_24h":3.0},"LateMiddleAge":{"premium_24h":0.5,"medals_24h":1.71,"strategy_points_24h":0.2,"money_24h":832.5,"supplies_24h":832.5,"random_good_of_age_24h":3.0},"ColonialAge":{"premium_24h":0.5,"medals_24h":2.79,"strategy_points_24h":0.2,"money_24h":1265.0,"supplies_24h":1282.5,"random_good_of_age_24h":3.0},"IndustrialAge":{"premium_24h":0.5,"medals_24h":4.41,"strategy_points_24h":0.2,"money_24h":1580.0,"supplies_24h":1555.0,"random_good_of_age_24h":3.0},"ProgressiveEra":{"premium_24h":0.5,"medals_24h":5.85,"strategy_points_24h":0.2,"money_24h":1917.5,"supplies_24h":1940.0,"random_good_of_age_24h":3.0},"ModernEra":{"premium_24h":0.5,"medals_24h":8.1,"strategy_points_24h":0.2,"money_24h":2385.0,"supplies_24h":2390.0,"random_good_of_age_24h":6.0},"PostModernEra":{"premium_24h":0.5,"medals_24h":10.8,"strategy_points_24h":0.2,"money_24h":3000.0,"supplies_24h":2750.0,"random_good_of_age_24h":6.0},"ContemporaryEra":{"premium_24h":0.5,"medals_24h":14.4,"strategy_points_24h":0.2,"money_24h":3905.0,"supplies_24h":3125.0,"random_good_of_age_24h":6.0},"TomorrowEra":{"premium_24h":0.5,"medals_24h":18.45,"strategy_points_24h":0.2,"money_24h":4522.5,"supplies_24h":3500.0,"random_good_of_age_24h":6.0},"FutureEra":{"premium_24h":0.5,"medals_24h":21.6,"strategy_points_24h":0.2,"money_24h":5275.0,"supplies_24h":4075.0,"random_good_of_age_24h":6.0},"ArcticFuture":{"premium_24h":0.5,"medals_24h":25.2,"strategy_points_24h":0.2,"money_24h":6125.0,"supplies_24h":4675.0,"random_good_of_age_24h":6.0},"OceanicFuture":{"premium_24h":0.5,"medals_24h":29.7,"strategy_points_24h":0.2,"money_24h":7050.0,"supplies_24h":5225.0,"random_good_of_age_24h":6.0},"VirtualFuture":{"premium_24h":0.5,"medals_24h":33.3,"strategy_points_24h":0.2,"money_24h":8050.0,"supplies_24h":5825.0,"random_good_of_age_24h":6.0},"SpaceAgeMars":{"premium_24h":0.5,"medals_24h":38.7,"strategy_points_24h":0.2,"money_24h":10062.5,"supplies_24h":7500.0,"random_good_of_age_24h":6.0},"SpaceAgeAsteroidBelt":{"premium_24h":0.5,"medals_24h":45.0,"strategy_points_24h":0.2,"money_24h":11700.0,"supplies_24h":8600.0,"random_good_of_age_24h":6.0},"SpaceAgeVenus":{"premium_24h":0.5,"medals_24h":51.3,"strategy_points_24h":0.2,"money_24h":13507.5,"supplies_24h":9810.0,"random_good_of_age_24h":6.0},"SpaceAgeJupiterMoon":{"premium_24h":0.5,"medals_24h":57.6,"strategy_points_24h":0.2,"money_24h":15485.0,"supplies_24h":11130.0,"random_good_of_age_24h":6.0},"SpaceAgeTitan":{"premium_24h":0.5,"medals_24h":63.9,"strategy_points_24h":0.2,"money_24h":17662.5,"supplies_24h":12357.5,"random_good_of_age_24h":6.0},"SpaceAgeSpaceHub":{"premium_24h":0.5,"medals_24h":70.2,"strategy_points_24h":0.2,"money_24h":20050.0,"supplies_24h":13872.5,"random_good_of_age_24h":6.0}} },
+    "W_SpaceAgeJupiterMoon_Workshop2": { prod: {"AllAge":{"population":-620}} },
+    "W_GuildRaidsHighMiddleAge_Doctor": { boosts: [{"type":"guild_raids_action_points_collection","value":260,"feature":"all"},{"type":"guild_raids_action_points_capacity","value":1000,"feature":"all"}] },
+    "W_AllAge_EasterBonus1": { prod: {"BronzeAge":{"premium_24h":0.5,"medals_24h":0.18,"strategy_points_24h":0.2,"money_24h":112.5,"supplies_24h":112.5,"random_good_of_age_24h":3.0},"IronAge":{"premium_24h":0.5,"medals_24h":0.27,"strategy_points_24h":0.2,"money_24h":270.0,"supplies_24h":270.0,"random_good_of_age_24h":3.0},"EarlyMiddleAge":{"premium_24h":0.5,"medals_24h":0.45,"strategy_points_24h":0.2,"money_24h":450.0,"supplies_24h":450.0,"random_good_of_age_24h":3.0},"HighMiddleAge":{"premium_24h":0.5,"medals_24h":0.9,"strategy_points_24h":0.2,"money_24h":630.0,"supplies_24h":625.0,"random_good_of_age_24h":3.0},"LateMiddleAge":{"premium_24h":0.5,"medals_24h":1.71,"strategy_points_24h":0.2,"money_24h":832.5,"supplies_24h":832.5,"random_good_of_age_24h":3.0},"ColonialAge":{"premium_24h":0.5,"medals_24h":2.79,"strategy_points_24h":0.2,"money_24h":1265.0,"supplies_24h":1282.5,"random_good_of_age_24h":3.0},"IndustrialAge":{"premium_24h":0.5,"medals_24h":4.41,"strategy_points_24h":0.2,"money_24h":1580.0,"supplies_24h":1555.0,"random_good_of_age_24h":3.0},"ProgressiveEra":{"premium_24h":0.5,"medals_24h":5.85,"strategy_points_24h":0.2,"money_24h":1917.5,"supplies_24h":1940.0,"random_good_of_age_24h":3.0},"ModernEra":{"premium_24h":0.5,"medals_24h":8.1,"strategy_points_24h":0.2,"money_24h":2385.0,"supplies_24h":2390.0,"random_good_of_age_24h":6.0},"PostModernEra":{"premium_24h":0.5,"medals_24h":10.8,"strategy_points_24h":0.2,"money_24h":3000.0,"supplies_24h":2750.0,"random_good_of_age_24h":6.0},"ContemporaryEra":{"premium_24h":0.5,"medals_24h":14.4,"strategy_points_24h":0.2,"money_24h":3905.0,"supplies_24h":3125.0,"random_good_of_age_24h":6.0},"TomorrowEra":{"premium_24h":0.5,"medals_24h":18.45,"strategy_points_24h":0.2,"money_24h":4522.5,"supplies_24h":3500.0,"random_good_of_age_24h":6.0},"FutureEra":{"premium_24h":0.5,"medals_24h":21.6,"strategy_points_24h":0.2,"money_24h":5275.0,"supplies_24h":4075.0,"random_good_of_age_24h":6.0},"ArcticFuture":{"premium_24h":0.5,"medals_24h":25.2,"strategy_points_24h":0.2,"money_24h":6125.0,"supplies_24h":4675.0,"random_good_of_age_24h":6.0},"OceanicFuture":{"premium_24h":0.5,"medals_24h":29.7,"strategy_points_24h":0.2,"money_24h":7050.0,"supplies_24h":5225.0,"random_good_of_age_24h":6.0},"VirtualFuture":{"premium_24h":0.5,"medals_24h":33.3,"strategy_points_24h":0.2,"money_24h":8050.0,"supplies_24h":5825.0,"random_good_of_age_24h":6.0},"SpaceAgeMars":{"premium_24h":0.5,"medals_24h":38.7,"strategy_points_24h":0.2,"money_24h":10062.5,"supplies_24h":7500.0,"random_good_of_age_24h":6.0},"SpaceAgeAsteroidBelt":{"premium_24h":0.5,"medals_24h":45.0,"strategy_points_24h":0.2,"money_24h":11700.0,"supplies_24h":8600.0,"random_good_of_age_24h":6.0},"SpaceAgeVenus":{"premium_24h":0.5,"medals_24h":51.3,"strategy_points_24h":0.2,"money_24h":13507.5,"supplies_24h":9810.0,"random_good_of_age_24h":6.0},"SpaceAgeJupiterMoon":{"premium_24h":0.5,"medals_24h":57.6,"strategy_points_24h":0.2,"money_24h":15485.0,"supplies_24h":11130.0,"random_good_of_age_24h":6.0},"SpaceAgeTitan":{"premium_24h":0.5,"medals_24h":63.9,"strategy_points_24h":0.2,"money_24h":17662.5,"supplies_24h":12357.5,"random_good_of_age_24h":6.0},"SpaceAgeSpaceHub":{"premium_24h":0.5,"medals_24h":70.2,"strategy_points_24h":0.2,"money_24h":20050.0,"supplies_24h":13872.5,"random_good_of_age_24h":6.0}} },
+    "W_GuildRaidsLateMiddleAge_Library": { boosts: [{"type":"guild_raids_action_points_collection","value":200,"feature":"all"},{"type":"guild_raids_action_points_capacity","value":2500,"feature":"all"}] },
+    "W_GuildRaidsLateMiddleAge_Residential1": { prod: {"AllAge":{"guild_raids_money_t36000s":3750,"guild_raids_chrono_alloy_t36000s":10}}, boosts: [{"type":"guild_raids_coins_production","value":20,"feature":"all"}] },
+    "W_GuildRaidsHighMiddleAge_Flag": { boosts: [{"type":"att_def_boost_attacker","value":20,"feature":"guild_raids"},{"type":"att_def_boost_defender","value":20,"feature":"guild_raids"}] },
+    "W_GuildRaidsIronAge_Butcher": { prod: {"AllAge":{"guild_raids_supplies_t36000s":6250}} },
+    "W_GuildRaidsHighMiddleAge_Printshop": { boosts: [{"type":"guild_raids_action_points_collection","value":130,"feature":"all"},{"type":"guild_raids_action_points_capacity","value":500,"feature":"all"}] },
+    "W_MultiAge_HIS25G3": { prod: {"BronzeAge":{"population":600,"happiness":8270,"demandHappiness":600,"money_24h":3700,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"IronAge":{"population":1290,"happiness":14250,"demandHappiness":1290,"money_24h":8880,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"EarlyMiddleAge":{"population":1980,"happiness":15750,"demandHappiness":1980,"money_24h":14800,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"HighMiddleAge":{"population":2780,"happiness":17580,"demandHappiness":2780,"money_24h":20720,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"LateMiddleAge":{"population":3650,"happiness":19600,"demandHappiness":3650,"money_24h":27380,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"ColonialAge":{"population":4610,"happiness":23050,"demandHappiness":4610,"money_24h":41710,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"IndustrialAge":{"population":5630,"happiness":25990,"demandHappiness":5630,"money_24h":51960,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"ProgressiveEra":{"population":6720,"happiness":28540,"demandHappiness":6720,"money_24h":63060,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"ModernEra":{"population":7880,"happiness":30540,"demandHappiness":7880,"money_24h":78450,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"PostModernEra":{"population":9080,"happiness":31820,"demandHappiness":9080,"money_24h":98690,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"ContemporaryEra":{"population":10350,"happiness":36970,"demandHappiness":10350,"money_24h":128480,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"TomorrowEra":{"population":11660,"happiness":44880,"demandHappiness":11660,"money_24h":148760,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"FutureEra":{"population":13040,"happiness":53770,"demandHappiness":13040,"money_24h":170520,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"ArcticFuture":{"population":14470,"happiness":62610,"demandHappiness":14470,"money_24h":193760,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"OceanicFuture":{"population":15940,"happiness":72260,"demandHappiness":15940,"money_24h":218480,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"VirtualFuture":{"population":17450,"happiness":86320,"demandHappiness":17450,"money_24h":244720,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"SpaceAgeMars":{"population":27620,"happiness":138120,"demandHappiness":27620,"money_24h":408760,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"SpaceAgeAsteroidBelt":{"population":30010,"happiness":150100,"demandHappiness":30010,"money_24h":452760,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"SpaceAgeVenus":{"population":32430,"happiness":162160,"demandHappiness":32430,"money_24h":499090,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"SpaceAgeJupiterMoon":{"population":34920,"happiness":174690,"demandHappiness":34920,"money_24h":547790,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"SpaceAgeTitan":{"population":37460,"happiness":187340,"demandHappiness":37460,"money_24h":598900,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0},"SpaceAgeSpaceHub":{"population":40000,"happiness":200000,"demandHappiness":40000,"money_24h":650000,"all_goods_of_next_age_24h":50,"strategy_points_24h":60.0,"all_goods_of_age_24h":75.0,"all_goods_of_previous_age_24h":40.0}}, boosts: [{"type":"att_boost_attacker","value":159,"feature":"all"},{"type":"att_boost_attacker","value":50,"feature":"guild_raids"}] },
+    "W_MultiAge_HIS25G1": { prod: {"BronzeAge":{"population":150,"happiness":3100,"demandHappiness":150,"money_24h":850,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"IronAge":{"population":320,"happiness":5340,"demandHappiness":320,"money_24h":2050,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"EarlyMiddleAge":{"population":500,"happiness":5910,"demandHappiness":500,"money_24h":3420,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"HighMiddleAge":{"population":700,"happiness":6590,"demandHappiness":700,"money_24h":4780,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"LateMiddleAge":{"population":910,"happiness":7350,"demandHappiness":910,"money_24h":6320,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"ColonialAge":{"population":1150,"happiness":8640,"demandHappiness":1150,"money_24h":9620,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"IndustrialAge":{"population":1410,"happiness":9750,"demandHappiness":1410,"money_24h":11990,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"ProgressiveEra":{"population":1680,"happiness":10700,"demandHappiness":1680,"money_24h":14550,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"ModernEra":{"population":1970,"happiness":11450,"demandHappiness":1970,"money_24h":18100,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"PostModernEra":{"population":2270,"happiness":11930,"demandHappiness":2270,"money_24h":22780,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"ContemporaryEra":{"population":2590,"happiness":13860,"demandHappiness":2590,"money_24h":29650,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"TomorrowEra":{"population":2920,"happiness":16830,"demandHappiness":2920,"money_24h":34330,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"FutureEra":{"population":3260,"happiness":20160,"demandHappiness":3260,"money_24h":39350,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"ArcticFuture":{"population":3620,"happiness":23480,"demandHappiness":3620,"money_24h":44710,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"OceanicFuture":{"population":3980,"happiness":27100,"demandHappiness":3980,"money_24h":50420,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"VirtualFuture":{"population":4360,"happiness":32370,"demandHappiness":4360,"money_24h":56470,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"SpaceAgeMars":{"population":6910,"happiness":51800,"demandHappiness":6910,"money_24h":94330,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"SpaceAgeAsteroidBelt":{"population":7500,"happiness":56290,"demandHappiness":7500,"money_24h":104480,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"SpaceAgeVenus":{"population":8110,"happiness":60810,"demandHappiness":8110,"money_24h":115180,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"SpaceAgeJupiterMoon":{"population":8730,"happiness":65510,"demandHappiness":8730,"money_24h":126410,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"SpaceAgeTitan":{"population":9370,"happiness":70250,"demandHappiness":9370,"money_24h":138210,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0},"SpaceAgeSpaceHub":{"population":10000,"happiness":75000,"demandHappiness":10000,"money_24h":150000,"strategy_points_24h":22.5,"all_goods_of_age_24h":25.0,"all_goods_of_previous_age_24h":15.0}}, boosts: [{"type":"att_boost_attacker","value":29,"feature":"all"}] },
+    "W_MultiAge_HIS25G2": { prod: {"BronzeAge":{"population":300,"happiness":6200,"demandHappiness":300,"money_24h":1710,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"IronAge":{"population":650,"happiness":10680,"demandHappiness":650,"money_24h":4100,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"EarlyMiddleAge":{"population":990,"happiness":11820,"demandHappiness":990,"money_24h":6830,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"HighMiddleAge":{"population":1390,"happiness":13180,"demandHappiness":1390,"money_24h":9560,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"LateMiddleAge":{"population":1830,"happiness":14700,"demandHappiness":1830,"money_24h":12640,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"ColonialAge":{"population":2300,"happiness":17290,"demandHappiness":2300,"money_24h":19250,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"IndustrialAge":{"population":2820,"happiness":19490,"demandHappiness":2820,"money_24h":23980,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"ProgressiveEra":{"population":3360,"happiness":21410,"demandHappiness":3360,"money_24h":29100,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"ModernEra":{"population":3940,"happiness":22900,"demandHappiness":3940,"money_24h":36210,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"PostModernEra":{"population":4540,"happiness":23860,"demandHappiness":4540,"money_24h":45550,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"ContemporaryEra":{"population":5180,"happiness":27730,"demandHappiness":5180,"money_24h":59300,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"TomorrowEra":{"population":5830,"happiness":33660,"demandHappiness":5830,"money_24h":68660,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"FutureEra":{"population":6520,"happiness":40330,"demandHappiness":6520,"money_24h":78700,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"ArcticFuture":{"population":7230,"happiness":46960,"demandHappiness":7230,"money_24h":89430,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"OceanicFuture":{"population":7970,"happiness":54190,"demandHappiness":7970,"money_24h":100840,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"VirtualFuture":{"population":8730,"happiness":64740,"demandHappiness":8730,"money_24h":112950,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"SpaceAgeMars":{"population":13810,"happiness":103590,"demandHappiness":13810,"money_24h":188660,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"SpaceAgeAsteroidBelt":{"population":15000,"happiness":112570,"demandHappiness":15000,"money_24h":208970,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"SpaceAgeVenus":{"population":16220,"happiness":121620,"demandHappiness":16220,"money_24h":230350,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"SpaceAgeJupiterMoon":{"population":17460,"happiness":131010,"demandHappiness":17460,"money_24h":252830,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"SpaceAgeTitan":{"population":18730,"happiness":140510,"demandHappiness":18730,"money_24h":276410,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0},"SpaceAgeSpaceHub":{"population":20000,"happiness":150000,"demandHappiness":20000,"money_24h":300000,"all_goods_of_next_age_24h":5,"strategy_points_24h":37.5,"all_goods_of_age_24h":37.5,"all_goods_of_previous_age_24h":20.0}}, boosts: [{"type":"att_boost_attacker","value":129,"feature":"all"},{"type":"att_boost_attacker","value":25,"feature":"guild_raids"}] },
+    "W_GuildRaidsLateMiddleAge_Palace": { boosts: [{"type":"guild_raids_action_points_collection","value":90,"feature":"all"},{"type":"guild_raids_action_points_capacity","value":1250,"feature":"all"}] },
+    "W_GuildRaidsEarlyMiddleAge_Pranger": { boosts: [{"type":"guild_raids_action_points_collection","value":120,"feature":"all"}] },
+    "W_GuildRaidsEarlyMiddleAge_Marketplace": { boosts: [{"type":"guild_raids_action_points_collection","value":50,"feature":"all"}] },
+    "W_GuildRaidsEarlyMiddleAge_Bakery": { prod: {"AllAge":{"guild_raids_supplies_t36000s":60000,"guild_raids_chrono_alloy_t36000s":250}} },
+    "W_GuildRaidsLateMiddleAge_Decayedtower": { boosts: [{"type":"att_def_boost_attacker","value":45,"feature":"guild_raids"}] },
+    "W_MultiAge_HIS25C1": { prod: {"BronzeAge":{"population":-360,"happiness":990,"supplies_24h":3500,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"IronAge":{"population":-770,"happiness":1710,"supplies_24h":8400,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"EarlyMiddleAge":{"population":-1190,"happiness":1890,"supplies_24h":14010,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"HighMiddleAge":{"population":-1670,"happiness":2110,"supplies_24h":19610,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"LateMiddleAge":{"population":-2190,"happiness":2350,"supplies_24h":25910,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"ColonialAge":{"population":-2760,"happiness":2770,"supplies_24h":32910,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"IndustrialAge":{"population":-3380,"happiness":3120,"supplies_24h":39920,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"ProgressiveEra":{"population":-4030,"happiness":3430,"supplies_24h":46920,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"ModernEra":{"population":-4730,"happiness":3660,"supplies_24h":54620,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"PostModernEra":{"population":-5450,"happiness":3820,"supplies_24h":62320,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"ContemporaryEra":{"population":-6210,"happiness":4440,"supplies_24h":70030,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"TomorrowEra":{"population":-7000,"happiness":5390,"supplies_24h":78430,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"FutureEra":{"population":-7830,"happiness":6450,"supplies_24h":86130,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"ArcticFuture":{"population":-8680,"happiness":7510,"supplies_24h":94540,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"OceanicFuture":{"population":-9560,"happiness":8670,"supplies_24h":103640,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"VirtualFuture":{"population":-10470,"happiness":10360,"supplies_24h":112040,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"SpaceAgeMars":{"population":-16570,"happiness":16570,"supplies_24h":181370,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"SpaceAgeAsteroidBelt":{"population":-18000,"happiness":18010,"supplies_24h":194680,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"SpaceAgeVenus":{"population":-19460,"happiness":19460,"supplies_24h":208680,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"SpaceAgeJupiterMoon":{"population":-20950,"happiness":20960,"supplies_24h":221990,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"SpaceAgeTitan":{"population":-22480,"happiness":22480,"supplies_24h":235990,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25},"SpaceAgeSpaceHub":{"population":-24000,"happiness":24000,"supplies_24h":250000,"all_goods_of_age_24h":25,"all_goods_of_previous_age_24h":25}}, boosts: [{"type":"att_def_boost_defender","value":30,"feature":"battleground"},{"type":"att_def_boost_defender","value":10,"feature":"guild_expedition"}] },
+    "W_GuildRaidsEarlyMiddleAge_Shoemaker": { prod: {"AllAge":{"guild_raids_supplies_t36000s":24000,"guild_raids_chrono_alloy_t36000s":75}} },
+    "W_GuildRaidsIronAge_Tailor": { prod: {"AllAge":{"guild_raids_supplies_t36000s":12500}} },
+    "W_GuildRaidsLateMiddleAge_Sailorstatue": { boosts: [{"type":"att_def_boost_attacker","value":30,"feature":"guild_raids"},{"type":"att_def_boost_defender","value":30,"feature":"guild_raids"}] },
+    "W_GuildRaidsIronAge_Statueonsocket": { boosts: [{"type":"att_def_boost_defender","value":5,"feature":"guild_raids"}] },
+    "W_GuildRaidsHighMiddleAge_Windmill": { prod: {"AllAge":{"guild_raids_supplies_t36000s":36000,"guild_raids_chrono_alloy_t36000s":250}}, boosts: [{"type":"guild_raids_supplies_production","value":10,"feature":"all"}] },
+    "W_GuildRaidsLateMiddleAge_Brewery": { prod: {"AllAge":{"guild_raids_supplies_t36000s":4800,"guild_raids_chrono_alloy_t36000s":10}}, boosts: [{"type":"guild_raids_supplies_production","value":20,"feature":"all"}] },
+    "W_GuildRaidsEarlyMiddleAge_Hedgewithflowers": { boosts: [{"type":"att_def_boost_defender","value":10,"feature":"guild_raids"}] },
+    "W_AllAge_ShahBonus17": { prod: {"BronzeAge":{"premium_t43200s":0.5,"medals_t43200s":0.18,"strategy_points_t43200s":0.2,"money_t43200s":112.5,"supplies_t43200s":112.5,"random_good_of_age_t43200s":3.0},"IronAge":{"premium_t43200s":0.5,"medals_t43200s":0.27,"strategy_points_t43200s":0.2,"money_t43200s":270.0,"supplies_t43200s":270.0,"random_good_of_age_t43200s":3.0},"EarlyMiddleAge":{"premium_t43200s":0.5,"medals_t43200s":0.45,"strategy_points_t43200s":0.2,"money_t43200s":450.0,"supplies_t43200s":450.0,"random_good_of_age_t43200s":3.0},"HighMiddleAge":{"premium_t43200s":0.5,"medals_t43200s":0.9,"strategy_points_t43200s":0.2,"money_t43200s":630.0,"supplies_t43200s":625.0,"random_good_of_age_t43200s":3.0},"LateMiddleAge":{"premium_t43200s":0.5,"medals_t43200s":1.71,"strategy_points_t43200s":0.2,"money_t43200s":832.5,"supplies_t43200s":832.5,"random_good_of_age_t43200s":3.0},"ColonialAge":{"premium_t43200s":0.5,"medals_t43200s":2.79,"strategy_points_t43200s":0.2,"money_t43200s":1265.0,"supplies_t43200s":1282.5,"random_good_of_age_t43200s":3.0},"IndustrialAge":{"premium_t43200s":0.5,"medals_t43200s":4.41,"strategy_points_t43200s":0.2,"money_t43200s":1580.0,"supplies_t43200s":1555.0,"random_good_of_age_t43200s":3.0},"ProgressiveEra":{"premium_t43200s":0.5,"medals_t43200s":5.85,"strategy_points_t43200s":0.2,"money_t43200s":1917.5,"supplies_t43200s":1940.0,"random_good_of_age_t43200s":3.0},"ModernEra":{"premium_t43200s":0.5,"medals_t43200s":8.1,"strategy_points_t43200s":0.2,"money_t43200s":2385.0,"supplies_t43200s":2390.0,"random_good_of_age_t43200s":6.0},"PostModernEra":{"premium_t43200s":0.5,"medals_t43200s":10.8,"strategy_points_t43200s":0.2,"money_t43200s":3000.0,"supplies_t43200s":2750.0,"random_good_of_age_t43200s":6.0},"ContemporaryEra":{"premium_t43200s":0.5,"medals_t43200s":14.4,"strategy_points_t43200s":0.2,"money_t43200s":3905.0,"supplies_t43200s":3125.0,"random_good_of_age_t43200s":6.0},"TomorrowEra":{"premium_t43200s":0.5,"medals_t43200s":18.45,"strategy_points_t43200s":0.2,"money_t43200s":4522.5,"supplies_t43200s":3500.0,"random_good_of_age_t43200s":6.0},"FutureEra":{"premium_t43200s":0.5,"medals_t43200s":21.6,"strategy_points_t43200s":0.2,"money_t43200s":5275.0,"supplies_t43200s":4075.0,"random_good_of_age_t43200s":6.0},"ArcticFuture":{"premium_t43200s":0.5,"medals_t43200s":25.2,"strategy_points_t43200s":0.2,"money_t43200s":6125.0,"supplies_t43200s":4675.0,"random_good_of_age_t43200s":6.0},"OceanicFuture":{"premium_t43200s":0.5,"medals_t43200s":29.7,"strategy_points_t43200s":0.2,"money_t43200s":7050.0,"supplies_t43200s":5225.0,"random_good_of_age_t43200s":6.0},"VirtualFuture":{"premium_t43200s":0.5,"medals_t43200s":33.3,"strategy_points_t43200s":0.2,"money_t43200s":8050.0,"supplies_t43200s":5825.0,"random_good_of_age_t43200s":6.0},"SpaceAgeMars":{"premium_t43200s":0.5,"medals_t43200s":38.7,"strategy_points_t43200s":0.2,"money_t43200s":10062.5,"supplies_t43200s":7500.0,"random_good_of_age_t43200s":6.0},"SpaceAgeAsteroidBelt":{"premium_t43200s":0.5,"medals_t43200s":45.0,"strategy_points_t43200s":0.2,"money_t43200s":11700.0,"supplies_t43200s":8600.0,"random_good_of_age_t43200s":6.0},"SpaceAgeVenus":{"premium_t43200s":0.5,"medals_t43200s":51.3,"strategy_points_t43200s":0.2,"money_t43200s":13507.5,"supplies_t43200s":9810.0,"random_good_of_age_t43200s":6.0},"SpaceAgeJupiterMoon":{"premium_t43200s":0.5,"medals_t43200s":57.6,"strategy_points_t43200s":0.2,"money_t43200s":15485.0,"supplies_t43200s":11130.0,"random_good_of_age_t43200s":6.0},"SpaceAgeTitan":{"premium_t43200s":0.5,"medals_t43200s":63.9,"strategy_points_t43200s":0.2,"money_t43200s":17662.5,"supplies_t43200s":12357.5,"random_good_of_age_t43200s":6.0},"SpaceAgeSpaceHub":{"premium_t43200s":0.5,"medals_t43200s":70.2,"strategy_points_t43200s":0.2,"money_t43200s":20050.0,"supplies_t43200s":13872.5,"random_good_of_age_t43200s":6.0}} },
+    "W_GuildRaidsHighMiddleAge_Church": { boosts: [{"type":"guild_raids_action_points_collection","value":50,"feature":"all"},{"type":"guild_raids_action_points_capacity","value":500,"feature":"all"}] },
+    "W_SpaceAgeJupiterMoon_Residential2": { prod: {"AllAge":{"population":7060,"demandHappiness":7060,"money_8h":27760}} },
+    "W_GuildRaidsLateMiddleAge_Cartographer": { boosts: [{"type":"guild_raids_action_points_collection","value":180,"feature":"all"},{"type":"guild_raids_action_points_capacity","value":750,"feature":"all"}] },
+    "W_GuildRaidsEarlyMiddleAge_Residential1": { prod: {"AllAge":{"guild_raids_money_t36000s":12500,"guild_raids_chrono_alloy_t36000s":10}} },
+    "W_GuildRaidsLateMiddleAge_Residential2": { prod: {"AllAge":{"guild_raids_money_t36000s":7500,"guild_raids_chrono_alloy_t36000s":75}}, boosts: [{"type":"guild_raids_coins_production","value":20,"feature":"all"}] },
+    "W_GuildRaidsLateMiddleAge_Residential3": { prod: {"AllAge":{"guild_raids_money_t36000s":39000,"guild_raids_chrono_alloy_t36000s":250}}, boosts: [{"type":"guild_raids_coins_production","value":20,"feature":"all"}] },
+    "W_MultiAge_Anw23A1": { prod: {"AllAge":{"strategy_points_24h":6,"random_good_of_age_24h":15}}, boosts: [{"type":"att_def_boost_attacker","value":8,"feature":"all"},{"type":"att_def_boost_defender","value":8,"feature":"all"}] },
+    "W_GuildRaidsIronAge_Residential3": { prod: {"AllAge":{"guild_raids_money_t36000s":25000}}, boosts: [{"type":"guild_raids_action_points_collection","value":200,"feature":"all"}] },
+    "W_GuildRaidsHighMiddleAge_Residential3": { prod: {"AllAge":{"guild_raids_money_t36000s":78000,"guild_raids_chrono_alloy_t36000s":250}}, boosts: [{"type":"guild_raids_coins_production","value":10,"feature":"all"}] },
+    "W_GuildRaidsHighMiddleAge_Gargoyle": { boosts: [{"type":"att_def_boost_defender","value":15,"feature":"guild_raids"}] },
+    "W_GuildRaidsIronAge_Aquaduct": { boosts: [{"type":"att_def_boost_attacker","value":10,"feature":"guild_raids"},{"type":"att_def_boost_defender","value":10,"feature":"guild_raids"}] },
+    "W_GuildRaidsHighMiddleAge_Residential2": { prod: {"AllAge":{"guild_raids_money_t36000s":15000,"guild_raids_chrono_alloy_t36000s":75}}, boosts: [{"type":"guild_raids_coins_production","value":10,"feature":"all"}] },
+    "W_MultiAge_LTE24A9": { prod: {"AllAge":{"strategy_points_24h":540,"all_goods_of_age_24h":600,"all_goods_of_previous_age_24h":600},"BronzeAge":{"population":4410,"demandHappiness":4410},"IronAge":{"population":9480,"demandHappiness":9480},"EarlyMiddleAge":{"population":14540,"demandHappiness":14540},"HighMiddleAge":{"population":20420,"demandHappiness":20420},"LateMiddleAge":{"population":26800,"demandHappiness":26800},"ColonialAge":{"population":33820,"demandHappiness":33820},"IndustrialAge":{"population":41340,"demandHappiness":41340},"ProgressiveEra":{"population":49350,"demandHappiness":49350},"ModernEra":{"population":57840,"demandHappiness":57840},"PostModernEra":{"population":66670,"demandHappiness":66670},"ContemporaryEra":{"population":75980,"demandHappiness":75980},"TomorrowEra":{"population":85620,"demandHappiness":85620},"FutureEra":{"population":95750,"demandHappiness":95750},"ArcticFuture":{"population":106210,"demandHappiness":106210},"OceanicFuture":{"population":116990,"demandHappiness":116990},"VirtualFuture":{"population":128100,"demandHappiness":128100},"SpaceAgeMars":{"population":202780,"demandHappiness":202780},"SpaceAgeAsteroidBelt":{"population":220260,"demandHappiness":220260},"SpaceAgeVenus":{"population":238070,"demandHappiness":238070},"SpaceAgeJupiterMoon":{"population":256370,"demandHappiness":256370},"SpaceAgeTitan":{"population":275000,"demandHappiness":275000},"SpaceAgeSpaceHub":{"population":293630,"demandHappiness":293630}}, boosts: [{"type":"att_def_boost_attacker_defender","value":214,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":216,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":216,"feature":"guild_expedition"},{"type":"att_def_boost_attacker_defender","value":20,"feature":"guild_raids"}] },
+    "W_MultiAge_LTE24A11": { prod: {"AllAge":{"each_special_goods_up_to_age_24h":90},"BronzeAge":{"population":4810,"demandHappiness":4810},"IronAge":{"population":10340,"demandHappiness":10340},"EarlyMiddleAge":{"population":15860,"demandHappiness":15860},"HighMiddleAge":{"population":22280,"demandHappiness":22280},"LateMiddleAge":{"population":29230,"demandHappiness":29230},"ColonialAge":{"population":36900,"demandHappiness":36900},"IndustrialAge":{"population":45100,"demandHappiness":45100},"ProgressiveEra":{"population":53830,"demandHappiness":53830},"ModernEra":{"population":63100,"demandHappiness":63100},"PostModernEra":{"population":72730,"demandHappiness":72730},"ContemporaryEra":{"population":82890,"demandHappiness":82890},"TomorrowEra":{"population":93400,"demandHappiness":93400},"FutureEra":{"population":104460,"demandHappiness":104460},"ArcticFuture":{"population":115860,"demandHappiness":115860},"OceanicFuture":{"population":127630,"demandHappiness":127630},"VirtualFuture":{"population":139750,"demandHappiness":139750},"SpaceAgeMars":{"population":221210,"demandHappiness":221210},"SpaceAgeAsteroidBelt":{"population":240290,"demandHappiness":240290},"SpaceAgeVenus":{"population":259710,"demandHappiness":259710},"SpaceAgeJupiterMoon":{"population":279680,"demandHappiness":279680},"SpaceAgeTitan":{"population":300000,"demandHappiness":300000},"SpaceAgeSpaceHub":{"population":320320,"demandHappiness":320320}}, boosts: [{"type":"att_def_boost_attacker_defender","value":324,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":432,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":432,"feature":"guild_expedition"},{"type":"att_def_boost_attacker_defender","value":100,"feature":"guild_raids"},{"type":"forge_points_production","value":30,"feature":"all"},{"type":"goods_production","value":30,"feature":"all"},{"type":"guild_raids_action_points_collection","value":400,"feature":"all"},{"type":"guild_raids_action_points_capacity","value":16000,"feature":"all"}] },
+    "W_MultiAge_LTE24A3": { prod: {"AllAge":{"strategy_points_24h":324,"all_goods_of_age_24h":420,"all_goods_of_previous_age_24h":420},"BronzeAge":{"population":2010,"demandHappiness":2010},"IronAge":{"population":4310,"demandHappiness":4310},"EarlyMiddleAge":{"population":6610,"demandHappiness":6610},"HighMiddleAge":{"population":9280,"demandHappiness":9280},"LateMiddleAge":{"population":12180,"demandHappiness":12180},"ColonialAge":{"population":15370,"demandHappiness":15370},"IndustrialAge":{"population":18790,"demandHappiness":18790},"ProgressiveEra":{"population":22430,"demandHappiness":22430},"ModernEra":{"population":26290,"demandHappiness":26290},"PostModernEra":{"population":30300,"demandHappiness":30300},"ContemporaryEra":{"population":34540,"demandHappiness":34540},"TomorrowEra":{"population":38920,"demandHappiness":38920},"FutureEra":{"population":43520,"demandHappiness":43520},"ArcticFuture":{"population":48280,"demandHappiness":48280},"OceanicFuture":{"population":53180,"demandHappiness":53180},"VirtualFuture":{"population":58230,"demandHappiness":58230},"SpaceAgeMars":{"population":92170,"demandHappiness":92170},"SpaceAgeAsteroidBelt":{"population":100120,"demandHappiness":100120},"SpaceAgeVenus":{"population":108210,"demandHappiness":108210},"SpaceAgeJupiterMoon":{"population":116530,"demandHappiness":116530},"SpaceAgeTitan":{"population":125000,"demandHappiness":125000},"SpaceAgeSpaceHub":{"population":133470,"demandHappiness":133470}}, boosts: [{"type":"att_def_boost_attacker","value":202,"feature":"all"},{"type":"att_boost_defender","value":202,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":5,"feature":"guild_raids"}] },
+    "W_MultiAge_LTE24A10": { prod: {"AllAge":{"strategy_points_24h":576,"all_goods_of_age_24h":630,"all_goods_of_previous_age_24h":630},"BronzeAge":{"population":4810,"demandHappiness":4810},"IronAge":{"population":10340,"demandHappiness":10340},"EarlyMiddleAge":{"population":15860,"demandHappiness":15860},"HighMiddleAge":{"population":22280,"demandHappiness":22280},"LateMiddleAge":{"population":29230,"demandHappiness":29230},"ColonialAge":{"population":36900,"demandHappiness":36900},"IndustrialAge":{"population":45100,"demandHappiness":45100},"ProgressiveEra":{"population":53830,"demandHappiness":53830},"ModernEra":{"population":63100,"demandHappiness":63100},"PostModernEra":{"population":72730,"demandHappiness":72730},"ContemporaryEra":{"population":82890,"demandHappiness":82890},"TomorrowEra":{"population":93400,"demandHappiness":93400},"FutureEra":{"population":104460,"demandHappiness":104460},"ArcticFuture":{"population":115860,"demandHappiness":115860},"OceanicFuture":{"population":127630,"demandHappiness":127630},"VirtualFuture":{"population":139750,"demandHappiness":139750},"SpaceAgeMars":{"population":221210,"demandHappiness":221210},"SpaceAgeAsteroidBelt":{"population":240290,"demandHappiness":240290},"SpaceAgeVenus":{"population":259710,"demandHappiness":259710},"SpaceAgeJupiterMoon":{"population":279680,"demandHappiness":279680},"SpaceAgeTitan":{"population":300000,"demandHappiness":300000},"SpaceAgeSpaceHub":{"population":320320,"demandHappiness":320320}}, boosts: [{"type":"att_def_boost_attacker_defender","value":216,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":252,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":252,"feature":"guild_expedition"},{"type":"att_def_boost_attacker_defender","value":25,"feature":"guild_raids"}] },
+    "W_MultiAge_LTE24A7": { prod: {"AllAge":{"strategy_points_24h":468,"all_goods_of_age_24h":540,"all_goods_of_previous_age_24h":540},"BronzeAge":{"population":3610,"demandHappiness":3610},"IronAge":{"population":7750,"demandHappiness":7750},"EarlyMiddleAge":{"population":11900,"demandHappiness":11900},"HighMiddleAge":{"population":16710,"demandHappiness":16710},"LateMiddleAge":{"population":21930,"demandHappiness":21930},"ColonialAge":{"population":27670,"demandHappiness":27670},"IndustrialAge":{"population":33820,"demandHappiness":33820},"ProgressiveEra":{"population":40370,"demandHappiness":40370},"ModernEra":{"population":47330,"demandHappiness":47330},"PostModernEra":{"population":54550,"demandHappiness":54550},"ContemporaryEra":{"population":62170,"demandHappiness":62170},"TomorrowEra":{"population":70050,"demandHappiness":70050},"FutureEra":{"population":78340,"demandHappiness":78340},"ArcticFuture":{"population":86900,"demandHappiness":86900},"OceanicFuture":{"population":95720,"demandHappiness":95720},"VirtualFuture":{"population":104810,"demandHappiness":104810},"SpaceAgeMars":{"population":165910,"demandHappiness":165910},"SpaceAgeAsteroidBelt":{"population":180210,"demandHappiness":180210},"SpaceAgeVenus":{"population":194790,"demandHappiness":194790},"SpaceAgeJupiterMoon":{"population":209760,"demandHappiness":209760},"SpaceAgeTitan":{"population":225000,"demandHappiness":225000},"SpaceAgeSpaceHub":{"population":240240,"demandHappiness":240240}}, boosts: [{"type":"att_def_boost_defender","value":144,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":210,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":144,"feature":"guild_expedition"},{"type":"att_def_boost_attacker_defender","value":15,"feature":"guild_raids"}] },
+    "W_MultiAge_LTE24A2": { prod: {"AllAge":{"strategy_points_24h":288,"all_goods_of_age_24h":390,"all_goods_of_previous_age_24h":390},"BronzeAge":{"population":1600,"demandHappiness":1600},"IronAge":{"population":3450,"demandHappiness":3450},"EarlyMiddleAge":{"population":5290,"demandHappiness":5290},"HighMiddleAge":{"population":7430,"demandHappiness":7430},"LateMiddleAge":{"population":9740,"demandHappiness":9740},"ColonialAge":{"population":12300,"demandHappiness":12300},"IndustrialAge":{"population":15030,"demandHappiness":15030},"ProgressiveEra":{"population":17940,"demandHappiness":17940},"ModernEra":{"population":21030,"demandHappiness":21030},"PostModernEra":{"population":24240,"demandHappiness":24240},"ContemporaryEra":{"population":27630,"demandHappiness":27630},"TomorrowEra":{"population":31130,"demandHappiness":31130},"FutureEra":{"population":34820,"demandHappiness":34820},"ArcticFuture":{"population":38620,"demandHappiness":38620},"OceanicFuture":{"population":42540,"demandHappiness":42540},"VirtualFuture":{"population":46580,"demandHappiness":46580},"SpaceAgeMars":{"population":73740,"demandHappiness":73740},"SpaceAgeAsteroidBelt":{"population":80100,"demandHappiness":80100},"SpaceAgeVenus":{"population":86570,"demandHappiness":86570},"SpaceAgeJupiterMoon":{"population":93230,"demandHappiness":93230},"SpaceAgeTitan":{"population":100000,"demandHappiness":100000},"SpaceAgeSpaceHub":{"population":106770,"demandHappiness":106770}}, boosts: [{"type":"att_boost_attacker","value":200,"feature":"all"},{"type":"att_boost_defender","value":200,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":5,"feature":"guild_raids"}] },
+    "W_MultiAge_LTE24A5": { prod: {"AllAge":{"strategy_points_24h":396,"all_goods_of_age_24h":480,"all_goods_of_previous_age_24h":480},"BronzeAge":{"population":2810,"demandHappiness":2810},"IronAge":{"population":6030,"demandHappiness":6030},"EarlyMiddleAge":{"population":9250,"demandHappiness":9250},"HighMiddleAge":{"population":13000,"demandHappiness":13000},"LateMiddleAge":{"population":17050,"demandHappiness":17050},"ColonialAge":{"population":21520,"demandHappiness":21520},"IndustrialAge":{"population":26310,"demandHappiness":26310},"ProgressiveEra":{"population":31400,"demandHappiness":31400},"ModernEra":{"population":36810,"demandHappiness":36810},"PostModernEra":{"population":42420,"demandHappiness":42420},"ContemporaryEra":{"population":48350,"demandHappiness":48350},"TomorrowEra":{"population":54490,"demandHappiness":54490},"FutureEra":{"population":60930,"demandHappiness":60930},"ArcticFuture":{"population":67590,"demandHappiness":67590},"OceanicFuture":{"population":74450,"demandHappiness":74450},"VirtualFuture":{"population":81520,"demandHappiness":81520},"SpaceAgeMars":{"population":129040,"demandHappiness":129040},"SpaceAgeAsteroidBelt":{"population":140170,"demandHappiness":140170},"SpaceAgeVenus":{"population":151500,"demandHappiness":151500},"SpaceAgeJupiterMoon":{"population":163150,"demandHappiness":163150},"SpaceAgeTitan":{"population":175000,"demandHappiness":175000},"SpaceAgeSpaceHub":{"population":186850,"demandHappiness":186850}}, boosts: [{"type":"att_def_boost_attacker","value":72,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":72,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":206,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":10,"feature":"guild_raids"}] },
+    "W_MultiAge_LTE24A1": { prod: {"AllAge":{"strategy_points_24h":252,"all_goods_of_previous_age_24h":360},"BronzeAge":{"population":1200,"demandHappiness":1200},"IronAge":{"population":2580,"demandHappiness":2580},"EarlyMiddleAge":{"population":3970,"demandHappiness":3970},"HighMiddleAge":{"population":5570,"demandHappiness":5570},"LateMiddleAge":{"population":7310,"demandHappiness":7310},"ColonialAge":{"population":9220,"demandHappiness":9220},"IndustrialAge":{"population":11270,"demandHappiness":11270},"ProgressiveEra":{"population":13460,"demandHappiness":13460},"ModernEra":{"population":15780,"demandHappiness":15780},"PostModernEra":{"population":18180,"demandHappiness":18180},"ContemporaryEra":{"population":20720,"demandHappiness":20720},"TomorrowEra":{"population":23350,"demandHappiness":23350},"FutureEra":{"population":26110,"demandHappiness":26110},"ArcticFuture":{"population":28970,"demandHappiness":28970},"OceanicFuture":{"population":31910,"demandHappiness":31910},"VirtualFuture":{"population":34940,"demandHappiness":34940},"SpaceAgeMars":{"population":55300,"demandHappiness":55300},"SpaceAgeAsteroidBelt":{"population":60070,"demandHappiness":60070},"SpaceAgeVenus":{"population":64930,"demandHappiness":64930},"SpaceAgeJupiterMoon":{"population":69920,"demandHappiness":69920},"SpaceAgeTitan":{"population":75000,"demandHappiness":75000},"SpaceAgeSpaceHub":{"population":80080,"demandHappiness":80080}}, boosts: [{"type":"att_boost_attacker","value":198,"feature":"all"},{"type":"att_boost_defender","value":198,"feature":"all"}] },
+    "W_MultiAge_LTE24A4": { prod: {"AllAge":{"strategy_points_24h":360,"all_goods_of_age_24h":450,"all_goods_of_previous_age_24h":450},"BronzeAge":{"population":2410,"demandHappiness":2410},"IronAge":{"population":5170,"demandHappiness":5170},"EarlyMiddleAge":{"population":7930,"demandHappiness":7930},"HighMiddleAge":{"population":11140,"demandHappiness":11140},"LateMiddleAge":{"population":14620,"demandHappiness":14620},"ColonialAge":{"population":18450,"demandHappiness":18450},"IndustrialAge":{"population":22550,"demandHappiness":22550},"ProgressiveEra":{"population":26920,"demandHappiness":26920},"ModernEra":{"population":31550,"demandHappiness":31550},"PostModernEra":{"population":36360,"demandHappiness":36360},"ContemporaryEra":{"population":41440,"demandHappiness":41440},"TomorrowEra":{"population":46700,"demandHappiness":46700},"FutureEra":{"population":52230,"demandHappiness":52230},"ArcticFuture":{"population":57930,"demandHappiness":57930},"OceanicFuture":{"population":63810,"demandHappiness":63810},"VirtualFuture":{"population":69880,"demandHappiness":69880},"SpaceAgeMars":{"population":110610,"demandHappiness":110610},"SpaceAgeAsteroidBelt":{"population":120140,"demandHappiness":120140},"SpaceAgeVenus":{"population":129860,"demandHappiness":129860},"SpaceAgeJupiterMoon":{"population":139840,"demandHappiness":139840},"SpaceAgeTitan":{"population":150000,"demandHappiness":150000},"SpaceAgeSpaceHub":{"population":160160,"demandHappiness":160160}}, boosts: [{"type":"att_def_boost_attacker","value":204,"feature":"all"},{"type":"att_def_boost_attacker","value":36,"feature":"guild_expedition"},{"type":"att_boost_defender","value":204,"feature":"all"},{"type":"att_def_boost_defender","value":36,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":10,"feature":"guild_raids"}] },
+    "W_MultiAge_LTE24A6": { prod: {"AllAge":{"strategy_points_24h":432,"all_goods_of_age_24h":510,"all_goods_of_previous_age_24h":510},"BronzeAge":{"population":3210,"demandHappiness":3210},"IronAge":{"population":6890,"demandHappiness":6890},"EarlyMiddleAge":{"population":10580,"demandHappiness":10580},"HighMiddleAge":{"population":14850,"demandHappiness":14850},"LateMiddleAge":{"population":19490,"demandHappiness":19490},"ColonialAge":{"population":24600,"demandHappiness":24600},"IndustrialAge":{"population":30070,"demandHappiness":30070},"ProgressiveEra":{"population":35890,"demandHappiness":35890},"ModernEra":{"population":42070,"demandHappiness":42070},"PostModernEra":{"population":48480,"demandHappiness":48480},"ContemporaryEra":{"population":55260,"demandHappiness":55260},"TomorrowEra":{"population":62270,"demandHappiness":62270},"FutureEra":{"population":69640,"demandHappiness":69640},"ArcticFuture":{"population":77240,"demandHappiness":77240},"OceanicFuture":{"population":85090,"demandHappiness":85090},"VirtualFuture":{"population":93170,"demandHappiness":93170},"SpaceAgeMars":{"population":147470,"demandHappiness":147470},"SpaceAgeAsteroidBelt":{"population":160190,"demandHappiness":160190},"SpaceAgeVenus":{"population":173140,"demandHappiness":173140},"SpaceAgeJupiterMoon":{"population":186450,"demandHappiness":186450},"SpaceAgeTitan":{"population":200000,"demandHappiness":200000},"SpaceAgeSpaceHub":{"population":213550,"demandHappiness":213550}}, boosts: [{"type":"att_def_boost_attacker","value":108,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":108,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":208,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":15,"feature":"guild_raids"}] },
+    "W_MultiAge_LTE24A8": { prod: {"AllAge":{"strategy_points_24h":504,"all_goods_of_age_24h":570,"all_goods_of_previous_age_24h":570},"BronzeAge":{"population":4010,"demandHappiness":4010},"IronAge":{"population":8620,"demandHappiness":8620},"EarlyMiddleAge":{"population":13220,"demandHappiness":13220},"HighMiddleAge":{"population":18570,"demandHappiness":18570},"LateMiddleAge":{"population":24360,"demandHappiness":24360},"ColonialAge":{"population":30750,"demandHappiness":30750},"IndustrialAge":{"population":37580,"demandHappiness":37580},"ProgressiveEra":{"population":44860,"demandHappiness":44860},"ModernEra":{"population":52580,"demandHappiness":52580},"PostModernEra":{"population":60610,"demandHappiness":60610},"ContemporaryEra":{"population":69070,"demandHappiness":69070},"TomorrowEra":{"population":77840,"demandHappiness":77840},"FutureEra":{"population":87050,"demandHappiness":87050},"ArcticFuture":{"population":96550,"demandHappiness":96550},"OceanicFuture":{"population":106360,"demandHappiness":106360},"VirtualFuture":{"population":116460,"demandHappiness":116460},"SpaceAgeMars":{"population":184340,"demandHappiness":184340},"SpaceAgeAsteroidBelt":{"population":200240,"demandHappiness":200240},"SpaceAgeVenus":{"population":216430,"demandHappiness":216430},"SpaceAgeJupiterMoon":{"population":233070,"demandHappiness":233070},"SpaceAgeTitan":{"population":250000,"demandHappiness":250000},"SpaceAgeSpaceHub":{"population":266930,"demandHappiness":266930}}, boosts: [{"type":"att_def_boost_defender","value":180,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":212,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":180,"feature":"guild_expedition"},{"type":"att_def_boost_attacker_defender","value":20,"feature":"guild_raids"}] },
+    "W_GuildRaidsHighMiddleAge_Residential1": { prod: {"AllAge":{"guild_raids_money_t36000s":7500,"guild_raids_chrono_alloy_t36000s":10}}, boosts: [{"type":"guild_raids_coins_production","value":10,"feature":"all"}] },
+    "W_GuildRaidsHighMiddleAge_Signpost": { boosts: [{"type":"att_def_boost_attacker","value":15,"feature":"guild_raids"}] },
+    "W_SpaceAgeJupiterMoon_Workshop1": { prod: {"AllAge":{"population":-2220}} },
+};
@@ -0,0 +1,93 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 89 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_FALL16A1": { prod: {"BronzeAge":{"population":-4},"IronAge":{"population":-7},"EarlyMiddleAge":{"population":-10},"HighMiddleAge":{"population":-13},"LateMiddleAge":{"population":-16},"ColonialAge":{"population":-20},"IndustrialAge":{"population":-22},"ProgressiveEra":{"population":-25},"ModernEra":{"population":-28},"PostModernEra":{"population":-31},"ContemporaryEra":{"population":-33},"TomorrowEra":{"population":-36},"FutureEra":{"population":-40},"ArcticFuture":{"population":-43},"OceanicFuture":{"population":-45},"VirtualFuture":{"population":-48},"SpaceAgeMars":{"population":-73},"SpaceAgeAsteroidBelt":{"population":-76},"SpaceAgeVenus":{"population":-80},"SpaceAgeJupiterMoon":{"population":-83},"SpaceAgeTitan":{"population":-87},"SpaceAgeSpaceHub":{"population":-90}} },
+    "W_MultiAge_FALL23F1": { prod: {"BronzeAge":{"strategy_points_24h":1},"IronAge":{"strategy_points_24h":1},"EarlyMiddleAge":{"strategy_points_24h":1},"HighMiddleAge":{"strategy_points_24h":1},"LateMiddleAge":{"strategy_points_24h":1},"ColonialAge":{"strategy_points_24h":1},"IndustrialAge":{"strategy_points_24h":1},"ProgressiveEra":{"strategy_points_24h":1},"ModernEra":{"strategy_points_24h":1},"PostModernEra":{"strategy_points_24h":1},"ContemporaryEra":{"strategy_points_24h":1},"TomorrowEra":{"strategy_points_24h":1},"FutureEra":{"strategy_points_24h":2},"ArcticFuture":{"strategy_points_24h":2},"OceanicFuture":{"strategy_points_24h":2},"VirtualFuture":{"strategy_points_24h":2},"SpaceAgeMars":{"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"strategy_points_24h":2},"SpaceAgeVenus":{"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"strategy_points_24h":2},"SpaceAgeTitan":{"strategy_points_24h":2},"SpaceAgeSpaceHub":{"strategy_points_24h":2}}, boosts: [{"type":"att_boost_defender","value":2,"feature":"all"},{"type":"def_boost_defender","value":2,"feature":"all"}] },
+    "W_MultiAge_FALL23F2": { prod: {"BronzeAge":{"strategy_points_24h":2},"IronAge":{"strategy_points_24h":2},"EarlyMiddleAge":{"strategy_points_24h":2},"HighMiddleAge":{"strategy_points_24h":2},"LateMiddleAge":{"strategy_points_24h":2},"ColonialAge":{"strategy_points_24h":2},"IndustrialAge":{"strategy_points_24h":2},"ProgressiveEra":{"strategy_points_24h":2},"ModernEra":{"strategy_points_24h":2},"PostModernEra":{"strategy_points_24h":2},"ContemporaryEra":{"strategy_points_24h":2},"TomorrowEra":{"strategy_points_24h":2},"FutureEra":{"strategy_points_24h":3},"ArcticFuture":{"strategy_points_24h":3},"OceanicFuture":{"strategy_points_24h":3},"VirtualFuture":{"strategy_points_24h":3},"SpaceAgeMars":{"strategy_points_24h":3},"SpaceAgeAsteroidBelt":{"strategy_points_24h":3},"SpaceAgeVenus":{"strategy_points_24h":3},"SpaceAgeJupiterMoon":{"strategy_points_24h":3},"SpaceAgeTitan":{"strategy_points_24h":3},"SpaceAgeSpaceHub":{"strategy_points_24h":3}}, boosts: [{"type":"att_boost_defender","value":3,"feature":"all"},{"type":"def_boost_defender","value":3,"feature":"all"}] },
+    "W_MultiAge_FALL25E1": { prod: {"BronzeAge":{"population":-180,"happiness":500,"medals_24h":30,"strategy_points_24h":40},"IronAge":{"population":-390,"happiness":850,"medals_24h":40,"strategy_points_24h":40},"EarlyMiddleAge":{"population":-590,"happiness":950,"medals_24h":40,"strategy_points_24h":40},"HighMiddleAge":{"population":-830,"happiness":1050,"medals_24h":50,"strategy_points_24h":40},"LateMiddleAge":{"population":-1100,"happiness":1180,"medals_24h":60,"strategy_points_24h":40},"ColonialAge":{"population":-1380,"happiness":1380,"medals_24h":70,"strategy_points_24h":40},"IndustrialAge":{"population":-1690,"happiness":1560,"medals_24h":100,"strategy_points_24h":40},"ProgressiveEra":{"population":-2020,"happiness":1710,"medals_24h":140,"strategy_points_24h":40},"ModernEra":{"population":-2360,"happiness":1830,"medals_24h":200,"strategy_points_24h":40},"PostModernEra":{"population":-2720,"happiness":1910,"medals_24h":270,"strategy_points_24h":40},"ContemporaryEra":{"population":-3110,"happiness":2220,"medals_24h":390,"strategy_points_24h":40},"TomorrowEra":{"population":-3500,"happiness":2690,"medals_24h":530,"strategy_points_24h":40},"FutureEra":{"population":-3910,"happiness":3230,"medals_24h":640,"strategy_points_24h":40},"ArcticFuture":{"population":-4340,"happiness":3760,"medals_24h":780,"strategy_points_24h":40},"OceanicFuture":{"population":-4780,"happiness":4340,"medals_24h":900,"strategy_points_24h":40},"VirtualFuture":{"population":-5240,"happiness":5180,"medals_24h":1090,"strategy_points_24h":40},"SpaceAgeMars":{"population":-8290,"happiness":8290,"medals_24h":1330,"strategy_points_24h":40},"SpaceAgeAsteroidBelt":{"population":-9000,"happiness":9010,"medals_24h":1560,"strategy_points_24h":40},"SpaceAgeVenus":{"population":-9730,"happiness":9730,"medals_24h":1800,"strategy_points_24h":40},"SpaceAgeJupiterMoon":{"population":-10480,"happiness":10480,"medals_24h":2030,"strategy_points_24h":40},"SpaceAgeTitan":{"population":-11240,"happiness":11240,"medals_24h":2270,"strategy_points_24h":40},"SpaceAgeSpaceHub":{"population":-12000,"happiness":12000,"medals_24h":2500,"strategy_points_24h":40}}, boosts: [{"type":"def_boost_attacker","value":40,"feature":"battleground"},{"type":"att_boost_defender","value":35,"feature":"guild_expedition"}] },
+    "W_MultiAge_FALL25F1": { prod: {"BronzeAge":{"population":-180,"happiness":500,"supplies_24h":2100,"random_good_of_age_24h":60},"IronAge":{"population":-390,"happiness":850,"supplies_24h":5040,"random_good_of_age_24h":60},"EarlyMiddleAge":{"population":-590,"happiness":950,"supplies_24h":8400,"random_good_of_age_24h":60},"HighMiddleAge":{"population":-830,"happiness":1050,"supplies_24h":11760,"random_good_of_age_24h":60},"LateMiddleAge":{"population":-1100,"happiness":1180,"supplies_24h":15550,"random_good_of_age_24h":60},"ColonialAge":{"population":-1380,"happiness":1380,"supplies_24h":19750,"random_good_of_age_24h":60},"IndustrialAge":{"population":-1690,"happiness":1560,"supplies_24h":23950,"random_good_of_age_24h":60},"ProgressiveEra":{"population":-2020,"happiness":1710,"supplies_24h":28150,"random_good_of_age_24h":60},"ModernEra":{"population":-2360,"happiness":1830,"supplies_24h":32770,"random_good_of_age_24h":60},"PostModernEra":{"population":-2720,"happiness":1910,"supplies_24h":37390,"random_good_of_age_24h":60},"ContemporaryEra":{"population":-3110,"happiness":2220,"supplies_24h":42020,"random_good_of_age_24h":60},"TomorrowEra":{"population":-3500,"happiness":2690,"supplies_24h":47060,"random_good_of_age_24h":60},"FutureEra":{"population":-3910,"happiness":3230,"supplies_24h":51680,"random_good_of_age_24h":60},"ArcticFuture":{"population":-4340,"happiness":3760,"supplies_24h":56720,"random_good_of_age_24h":60},"OceanicFuture":{"population":-4780,"happiness":4340,"supplies_24h":62180,"random_good_of_age_24h":60},"VirtualFuture":{"population":-5240,"happiness":5180,"supplies_24h":67230,"random_good_of_age_24h":60},"SpaceAgeMars":{"population":-8290,"happiness":8290,"supplies_24h":108820,"random_good_of_age_24h":60},"SpaceAgeAsteroidBelt":{"population":-9000,"happiness":9010,"supplies_24h":116810,"random_good_of_age_24h":60},"SpaceAgeVenus":{"population":-9730,"happiness":9730,"supplies_24h":125210,"random_good_of_age_24h":60},"SpaceAgeJupiterMoon":{"population":-10480,"happiness":10480,"supplies_24h":133190,"random_good_of_age_24h":60},"SpaceAgeTitan":{"population":-11240,"happiness":11240,"supplies_24h":141600,"random_good_of_age_24h":60},"SpaceAgeSpaceHub":{"population":-12000,"happiness":12000,"supplies_24h":150000,"random_good_of_age_24h":60}}, boosts: [{"type":"def_boost_attacker","value":50,"feature":"guild_expedition"},{"type":"def_boost_defender","value":60,"feature":"battleground"}] },
+    "W_MultiAge_FALL25C1": { prod: {"BronzeAge":{"happiness":4130},"IronAge":{"happiness":7120},"EarlyMiddleAge":{"happiness":7880},"HighMiddleAge":{"happiness":8790},"LateMiddleAge":{"happiness":9800},"ColonialAge":{"happiness":11520},"IndustrialAge":{"happiness":13000},"ProgressiveEra":{"happiness":14270},"ModernEra":{"happiness":15270},"PostModernEra":{"happiness":15910},"ContemporaryEra":{"happiness":18490},"TomorrowEra":{"happiness":22440},"FutureEra":{"happiness":26890},"ArcticFuture":{"happiness":31310},"OceanicFuture":{"happiness":36130},"VirtualFuture":{"happiness":43160},"SpaceAgeMars":{"happiness":69060},"SpaceAgeAsteroidBelt":{"happiness":75050},"SpaceAgeVenus":{"happiness":81080},"SpaceAgeJupiterMoon":{"happiness":87340},"SpaceAgeTitan":{"happiness":93670},"SpaceAgeSpaceHub":{"happiness":100000}} },
+    "W_MultiAge_FALL24A10": { prod: {"BronzeAge":{"population":560,"happiness":3530,"demandHappiness":560,"money_24h":3710,"all_goods_of_age_24h":110,"strategy_points_24h":65},"IronAge":{"population":1210,"happiness":6080,"demandHappiness":1210,"money_24h":8900,"all_goods_of_age_24h":110,"strategy_points_24h":65},"EarlyMiddleAge":{"population":1850,"happiness":6730,"demandHappiness":1850,"money_24h":14830,"all_goods_of_age_24h":110,"strategy_points_24h":66},"HighMiddleAge":{"population":2600,"happiness":7510,"demandHappiness":2600,"money_24h":20760,"all_goods_of_age_24h":110,"strategy_points_24h":66},"LateMiddleAge":{"population":3410,"happiness":8370,"demandHappiness":3410,"money_24h":27430,"all_goods_of_age_24h":110,"strategy_points_24h":67},"ColonialAge":{"population":4300,"happiness":9840,"demandHappiness":4300,"money_24h":41780,"all_goods_of_age_24h":110,"strategy_points_24h":67},"IndustrialAge":{"population":5260,"happiness":11100,"demandHappiness":5260,"money_24h":52050,"all_goods_of_age_24h":110,"strategy_points_24h":68},"ProgressiveEra":{"population":6280,"happiness":12190,"demandHappiness":6280,"money_24h":63170,"all_goods_of_age_24h":110,"strategy_points_24h":68},"ModernEra":{"population":7360,"happiness":13040,"demandHappiness":7360,"money_24h":78600,"all_goods_of_age_24h":110,"strategy_points_24h":69},"PostModernEra":{"population":8480,"happiness":13590,"demandHappiness":8480,"money_24h":98880,"all_goods_of_age_24h":110,"strategy_points_24h":69},"ContemporaryEra":{"population":9670,"happiness":15790,"demandHappiness":9670,"money_24h":128720,"all_goods_of_age_24h":110,"strategy_points_24h":70},"TomorrowEra":{"population":10900,"happiness":19160,"demandHappiness":10900,"money_24h":149040,"all_goods_of_age_24h":110,"strategy_points_24h":70},"FutureEra":{"population":12190,"happiness":22960,"demandHappiness":12190,"money_24h":170840,"all_goods_of_age_24h":110,"strategy_points_24h":71},"ArcticFuture":{"population":13520,"happiness":26740,"demandHappiness":13520,"money_24h":194120,"all_goods_of_age_24h":110,"strategy_points_24h":71},"OceanicFuture":{"population":14890,"happiness":30860,"demandHappiness":14890,"money_24h":218880,"all_goods_of_age_24h":110,"strategy_points_24h":72},"VirtualFuture":{"population":16300,"happiness":36860,"demandHappiness":16300,"money_24h":245170,"all_goods_of_age_24h":110,"strategy_points_24h":72},"SpaceAgeMars":{"population":25810,"happiness":58980,"demandHappiness":25810,"money_24h":409520,"all_goods_of_age_24h":110,"strategy_points_24h":73},"SpaceAgeAsteroidBelt":{"population":28030,"happiness":64100,"demandHappiness":28030,"money_24h":453600,"all_goods_of_age_24h":110,"strategy_points_24h":73},"SpaceAgeVenus":{"population":30300,"happiness":69250,"demandHappiness":30300,"money_24h":500010,"all_goods_of_age_24h":110,"strategy_points_24h":74},"SpaceAgeJupiterMoon":{"population":32630,"happiness":74600,"demandHappiness":32630,"money_24h":548800,"all_goods_of_age_24h":110,"strategy_points_24h":74},"SpaceAgeTitan":{"population":35000,"happiness":80000,"demandHappiness":35000,"money_24h":600000,"all_goods_of_age_24h":110,"strategy_points_24h":75},"SpaceAgeSpaceHub":{"population":37370,"happiness":85400,"demandHappiness":37370,"money_24h":651200,"all_goods_of_age_24h":110,"strategy_points_24h":75}}, boosts: [{"type":"def_boost_defender","value":80,"feature":"all"},{"type":"att_boost_defender","value":100,"feature":"all"}] },
+    "W_MultiAge_FALL23D1": { prod: {"BronzeAge":{"strategy_points_24h":3},"IronAge":{"strategy_points_24h":3},"EarlyMiddleAge":{"strategy_points_24h":3},"HighMiddleAge":{"strategy_points_24h":3},"LateMiddleAge":{"strategy_points_24h":3},"ColonialAge":{"strategy_points_24h":3},"IndustrialAge":{"strategy_points_24h":3},"ProgressiveEra":{"strategy_points_24h":3},"ModernEra":{"strategy_points_24h":3},"PostModernEra":{"strategy_points_24h":3},"ContemporaryEra":{"strategy_points_24h":3},"TomorrowEra":{"strategy_points_24h":3},"FutureEra":{"strategy_points_24h":4},"ArcticFuture":{"strategy_points_24h":4},"OceanicFuture":{"strategy_points_24h":4},"VirtualFuture":{"strategy_points_24h":4},"SpaceAgeMars":{"strategy_points_24h":4},"SpaceAgeAsteroidBelt":{"strategy_points_24h":4},"SpaceAgeVenus":{"strategy_points_24h":4},"SpaceAgeJupiterMoon":{"strategy_points_24h":4},"SpaceAgeTitan":{"strategy_points_24h":5},"SpaceAgeSpaceHub":{"strategy_points_24h":5}}, boosts: [{"type":"att_boost_attacker","value":5,"feature":"all"},{"type":"def_boost_attacker","value":9,"feature":"all"},{"type":"att_boost_defender","value":8,"feature":"all"}] },
+    "W_MultiAge_FALL24B1": { prod: {"BronzeAge":{"population":-170,"happiness":1160,"money_24h":460},"IronAge":{"population":-360,"happiness":2000,"money_24h":1110},"EarlyMiddleAge":{"population":-560,"happiness":2210,"money_24h":1850},"HighMiddleAge":{"population":-780,"happiness":2460,"money_24h":2600},"LateMiddleAge":{"population":-1020,"happiness":2750,"money_24h":3430},"ColonialAge":{"population":-1290,"happiness":3230,"money_24h":5220},"IndustrialAge":{"population":-1580,"happiness":3640,"money_24h":6510},"ProgressiveEra":{"population":-1880,"happiness":4000,"money_24h":7900},"ModernEra":{"population":-2210,"happiness":4280,"money_24h":9820},"PostModernEra":{"population":-2550,"happiness":4460,"money_24h":12360},"ContemporaryEra":{"population":-2900,"happiness":5180,"money_24h":16090},"TomorrowEra":{"population":-3270,"happiness":6290,"money_24h":18630},"FutureEra":{"population":-3660,"happiness":7530,"money_24h":21350},"ArcticFuture":{"population":-4060,"happiness":8770,"money_24h":24260},"OceanicFuture":{"population":-4470,"happiness":10120,"money_24h":27360},"VirtualFuture":{"population":-4890,"happiness":12090,"money_24h":30650},"SpaceAgeMars":{"population":-7740,"happiness":19350,"money_24h":51190},"SpaceAgeAsteroidBelt":{"population":-8410,"happiness":21030,"money_24h":56700},"SpaceAgeVenus":{"population":-9090,"happiness":22720,"money_24h":62500},"SpaceAgeJupiterMoon":{"population":-9790,"happiness":24480,"money_24h":68600},"SpaceAgeTitan":{"population":-10500,"happiness":26250,"money_24h":75000},"SpaceAgeSpaceHub":{"population":-11210,"happiness":28020,"money_24h":81400}}, boosts: [{"type":"att_def_boost_attacker","value":8,"feature":"all"},{"type":"def_boost_attacker","value":6,"feature":"all"},{"type":"coin_production","value":20,"feature":"all"},{"type":"guild_raids_coins_start","value":5000,"feature":"all"}] },
+    "W_MultiAge_FALL23C2": { prod: {"BronzeAge":{"population":-373,"happiness":-1254},"IronAge":{"population":-801,"happiness":-2151},"EarlyMiddleAge":{"population":-1229,"happiness":-2381},"HighMiddleAge":{"population":-1725,"happiness":-2645},"LateMiddleAge":{"population":-2264,"happiness":-2956},"ColonialAge":{"population":-2857,"happiness":-3473},"IndustrialAge":{"population":-3492,"happiness":-3910},"ProgressiveEra":{"population":-4168,"happiness":-4301},"ModernEra":{"population":-4886,"happiness":-4600},"PostModernEra":{"population":-5631,"happiness":-4796},"ContemporaryEra":{"population":-6417,"happiness":-5566},"TomorrowEra":{"population":-7232,"happiness":-6762},"FutureEra":{"population":-8087,"happiness":-8096},"ArcticFuture":{"population":-8970,"happiness":-9419},"OceanicFuture":{"population":-9881,"happiness":-10879},"VirtualFuture":{"population":-10820,"happiness":-12995},"SpaceAgeMars":{"population":-17126,"happiness":-20781},"SpaceAgeAsteroidBelt":{"population":-18603,"happiness":-22586},"SpaceAgeVenus":{"population":-20107,"happiness":-24403},"SpaceAgeJupiterMoon":{"population":-21653,"happiness":-26278},"SpaceAgeTitan":{"population":-23226,"happiness":-28187},"SpaceAgeSpaceHub":{"population":-24799,"happiness":-30096}}, boosts: [{"type":"att_boost_attacker","value":11,"feature":"all"},{"type":"att_boost_defender","value":7,"feature":"all"},{"type":"def_boost_defender","value":14,"feature":"all"}] },
+    "W_MultiAge_FALL25E2": { prod: {"BronzeAge":{"population":-180,"happiness":500,"medals_24h":50,"strategy_points_24h":90},"IronAge":{"population":-390,"happiness":850,"medals_24h":70,"strategy_points_24h":90},"EarlyMiddleAge":{"population":-590,"happiness":950,"medals_24h":90,"strategy_points_24h":90},"HighMiddleAge":{"population":-830,"happiness":1050,"medals_24h":100,"strategy_points_24h":90},"LateMiddleAge":{"population":-1100,"happiness":1180,"medals_24h":120,"strategy_points_24h":90},"ColonialAge":{"population":-1380,"happiness":1380,"medals_24h":140,"strategy_points_24h":90},"IndustrialAge":{"population":-1690,"happiness":1560,"medals_24h":200,"strategy_points_24h":90},"ProgressiveEra":{"population":-2020,"happiness":1710,"medals_24h":270,"strategy_points_24h":90},"ModernEra":{"population":-2360,"happiness":1830,"medals_24h":390,"strategy_points_24h":90},"PostModernEra":{"population":-2720,"happiness":1910,"medals_24h":550,"strategy_points_24h":90},"ContemporaryEra":{"population":-3110,"happiness":2220,"medals_24h":780,"strategy_points_24h":90},"TomorrowEra":{"population":-3500,"happiness":2690,"medals_24h":1050,"strategy_points_24h":90},"FutureEra":{"population":-3910,"happiness":3230,"medals_24h":1290,"strategy_points_24h":90},"ArcticFuture":{"population":-4340,"happiness":3760,"medals_24h":1560,"strategy_points_24h":90},"OceanicFuture":{"population":-4780,"happiness":4340,"medals_24h":1800,"strategy_points_24h":90},"VirtualFuture":{"population":-5240,"happiness":5180,"medals_24h":2190,"strategy_points_24h":90},"SpaceAgeMars":{"population":-8290,"happiness":8290,"medals_24h":2660,"strategy_points_24h":90},"SpaceAgeAsteroidBelt":{"population":-9000,"happiness":9010,"medals_24h":3130,"strategy_points_24h":90},"SpaceAgeVenus":{"population":-9730,"happiness":9730,"medals_24h":3590,"strategy_points_24h":90},"SpaceAgeJupiterMoon":{"population":-10480,"happiness":10480,"medals_24h":4060,"strategy_points_24h":90},"SpaceAgeTitan":{"population":-11240,"happiness":11240,"medals_24h":4530,"strategy_points_24h":90},"SpaceAgeSpaceHub":{"population":-12000,"happiness":12000,"medals_24h":5000,"strategy_points_24h":90}}, boosts: [{"type":"att_boost_attacker","value":20,"feature":"guild_raids"},{"type":"def_boost_attacker","value":100,"feature":"battleground"},{"type":"att_boost_defender","value":70,"feature":"guild_expedition"},{"type":"guild_raids_coins_start","value":20000,"feature":"all"},{"type":"guild_raids_coins_production","value":4,"feature":"all"},{"type":"guild_raids_units_start","value":5,"feature":"all"}] },
+    "W_MultiAge_FALL25F2": { prod: {"BronzeAge":{"population":-180,"happiness":500,"supplies_24h":2450,"random_good_of_age_24h":130},"IronAge":{"population":-390,"happiness":850,"supplies_24h":5880,"random_good_of_age_24h":130},"EarlyMiddleAge":{"population":-590,"happiness":950,"supplies_24h":9800,"random_good_of_age_24h":130},"HighMiddleAge":{"population":-830,"happiness":1050,"supplies_24h":13730,"random_good_of_age_24h":130},"LateMiddleAge":{"population":-1100,"happiness":1180,"supplies_24h":18140,"random_good_of_age_24h":130},"ColonialAge":{"population":-1380,"happiness":1380,"supplies_24h":23040,"random_good_of_age_24h":130},"IndustrialAge":{"population":-1690,"happiness":1560,"supplies_24h":27940,"random_good_of_age_24h":130},"ProgressiveEra":{"population":-2020,"happiness":1710,"supplies_24h":32840,"random_good_of_age_24h":130},"ModernEra":{"population":-2360,"happiness":1830,"supplies_24h":38240,"random_good_of_age_24h":130},"PostModernEra":{"population":-2720,"happiness":1910,"supplies_24h":43630,"random_good_of_age_24h":130},"ContemporaryEra":{"population":-3110,"happiness":2220,"supplies_24h":49020,"random_good_of_age_24h":130},"TomorrowEra":{"population":-3500,"happiness":2690,"supplies_24h":54900,"random_good_of_age_24h":130},"FutureEra":{"population":-3910,"happiness":3230,"supplies_24h":60290,"random_good_of_age_24h":130},"ArcticFuture":{"population":-4340,"happiness":3760,"supplies_24h":66180,"random_good_of_age_24h":130},"OceanicFuture":{"population":-4780,"happiness":4340,"supplies_24h":72550,"random_good_of_age_24h":130},"VirtualFuture":{"population":-5240,"happiness":5180,"supplies_24h":78430,"random_good_of_age_24h":130},"SpaceAgeMars":{"population":-8290,"happiness":8290,"supplies_24h":126960,"random_good_of_age_24h":130},"SpaceAgeAsteroidBelt":{"population":-9000,"happiness":9010,"supplies_24h":136270,"random_good_of_age_24h":130},"SpaceAgeVenus":{"population":-9730,"happiness":9730,"supplies_24h":146080,"random_good_of_age_24h":130},"SpaceAgeJupiterMoon":{"population":-10480,"happiness":10480,"supplies_24h":155390,"random_good_of_age_24h":130},"SpaceAgeTitan":{"population":-11240,"happiness":11240,"supplies_24h":165200,"random_good_of_age_24h":130},"SpaceAgeSpaceHub":{"population":-12000,"happiness":12000,"supplies_24h":175000,"random_good_of_age_24h":130}}, boosts: [{"type":"def_boost_attacker","value":120,"feature":"guild_expedition"},{"type":"att_boost_defender","value":20,"feature":"guild_raids"},{"type":"def_boost_defender","value":120,"feature":"battleground"},{"type":"guild_raids_supplies_start","value":20000,"feature":"all"},{"type":"guild_raids_supplies_production","value":4,"feature":"all"},{"type":"guild_raids_goods_start","value":20,"feature":"all"}] },
+    "W_MultiAge_FALL24B2": { prod: {"BronzeAge":{"population":-170,"happiness":1160,"money_24h":930,"all_goods_of_age_24h":40},"IronAge":{"population":-360,"happiness":2000,"money_24h":2220,"all_goods_of_age_24h":40},"EarlyMiddleAge":{"population":-560,"happiness":2210,"money_24h":3710,"all_goods_of_age_24h":40},"HighMiddleAge":{"population":-780,"happiness":2460,"money_24h":5190,"all_goods_of_age_24h":40},"LateMiddleAge":{"population":-1020,"happiness":2750,"money_24h":6860,"all_goods_of_age_24h":40},"ColonialAge":{"population":-1290,"happiness":3230,"money_24h":10450,"all_goods_of_age_24h":40},"IndustrialAge":{"population":-1580,"happiness":3640,"money_24h":13010,"all_goods_of_age_24h":40},"ProgressiveEra":{"population":-1880,"happiness":4000,"money_24h":15790,"all_goods_of_age_24h":40},"ModernEra":{"population":-2210,"happiness":4280,"money_24h":19650,"all_goods_of_age_24h":40},"PostModernEra":{"population":-2550,"happiness":4460,"money_24h":24720,"all_goods_of_age_24h":40},"ContemporaryEra":{"population":-2900,"happiness":5180,"money_24h":32180,"all_goods_of_age_24h":40},"TomorrowEra":{"population":-3270,"happiness":6290,"money_24h":37260,"all_goods_of_age_24h":40},"FutureEra":{"population":-3660,"happiness":7530,"money_24h":42710,"all_goods_of_age_24h":40},"ArcticFuture":{"population":-4060,"happiness":8770,"money_24h":48530,"all_goods_of_age_24h":40},"OceanicFuture":{"population":-4470,"happiness":10120,"money_24h":54720,"all_goods_of_age_24h":40},"VirtualFuture":{"population":-4890,"happiness":12090,"money_24h":61290,"all_goods_of_age_24h":40},"SpaceAgeMars":{"population":-7740,"happiness":19350,"money_24h":102380,"all_goods_of_age_24h":40},"SpaceAgeAsteroidBelt":{"population":-8410,"happiness":21030,"money_24h":113400,"all_goods_of_age_24h":40},"SpaceAgeVenus":{"population":-9090,"happiness":22720,"money_24h":125000,"all_goods_of_age_24h":40},"SpaceAgeJupiterMoon":{"population":-9790,"happiness":24480,"money_24h":137200,"all_goods_of_age_24h":40},"SpaceAgeTitan":{"population":-10500,"happiness":26250,"money_24h":150000,"all_goods_of_age_24h":40},"SpaceAgeSpaceHub":{"population":-11210,"happiness":28020,"money_24h":162800,"all_goods_of_age_24h":40}}, boosts: [{"type":"att_def_boost_attacker","value":12,"feature":"all"},{"type":"def_boost_attacker","value":10,"feature":"all"},{"type":"att_boost_attacker","value":6,"feature":"guild_raids"},{"type":"coin_production","value":40,"feature":"all"},{"type":"guild_raids_coins_start","value":10000,"feature":"all"},{"type":"guild_raids_coins_production","value":2,"feature":"all"}] },
+    "W_MultiAge_FALL24C2": { prod: {"BronzeAge":{"population":-240,"happiness":1540,"money_24h":930,"all_goods_of_age_24h":20},"IronAge":{"population":-520,"happiness":2660,"money_24h":2220,"all_goods_of_age_24h":20},"EarlyMiddleAge":{"population":-790,"happiness":2940,"money_24h":3710,"all_goods_of_age_24h":20},"HighMiddleAge":{"population":-1110,"happiness":3280,"money_24h":5190,"all_goods_of_age_24h":20},"LateMiddleAge":{"population":-1460,"happiness":3660,"money_24h":6860,"all_goods_of_age_24h":20},"ColonialAge":{"population":-1840,"happiness":4310,"money_24h":10450,"all_goods_of_age_24h":20},"IndustrialAge":{"population":-2250,"happiness":4860,"money_24h":13010,"all_goods_of_age_24h":20},"ProgressiveEra":{"population":-2690,"happiness":5330,"money_24h":15790,"all_goods_of_age_24h":20},"ModernEra":{"population":-3160,"happiness":5710,"money_24h":19650,"all_goods_of_age_24h":20},"PostModernEra":{"population":-3640,"happiness":5940,"money_24h":24720,"all_goods_of_age_24h":20},"ContemporaryEra":{"population":-4140,"happiness":6910,"money_24h":32180,"all_goods_of_age_24h":20},"TomorrowEra":{"population":-4670,"happiness":8380,"money_24h":37260,"all_goods_of_age_24h":20},"FutureEra":{"population":-5220,"happiness":10050,"money_24h":42710,"all_goods_of_age_24h":20},"ArcticFuture":{"population":-5790,"happiness":11700,"money_24h":48530,"all_goods_of_age_24h":20},"OceanicFuture":{"population":-6380,"happiness":13500,"money_24h":54720,"all_goods_of_age_24h":20},"VirtualFuture":{"population":-6990,"happiness":16130,"money_24h":61290,"all_goods_of_age_24h":20},"SpaceAgeMars":{"population":-11060,"happiness":25800,"money_24h":102380,"all_goods_of_age_24h":20},"SpaceAgeAsteroidBelt":{"population":-12010,"happiness":28040,"money_24h":113400,"all_goods_of_age_24h":20},"SpaceAgeVenus":{"population":-12990,"happiness":30300,"money_24h":125000,"all_goods_of_age_24h":20},"SpaceAgeJupiterMoon":{"population":-13980,"happiness":32640,"money_24h":137200,"all_goods_of_age_24h":20},"SpaceAgeTitan":{"population":-15000,"happiness":35000,"money_24h":150000,"all_goods_of_age_24h":20},"SpaceAgeSpaceHub":{"population":-16020,"happiness":37360,"money_24h":162800,"all_goods_of_age_24h":20}}, boosts: [{"type":"att_boost_defender","value":20,"feature":"all"},{"type":"def_boost_defender","value":20,"feature":"all"},{"type":"def_boost_defender","value":15,"feature":"guild_expedition"},{"type":"supply_production","value":40,"feature":"all"},{"type":"guild_raids_supplies_start","value":7000,"feature":"all"},{"type":"guild_raids_supplies_production","value":2,"feature":"all"}] },
+    "W_MultiAge_FALL23E1": { prod: {"BronzeAge":{"random_good_of_age_24h":5},"IronAge":{"random_good_of_age_24h":5},"EarlyMiddleAge":{"random_good_of_age_24h":5},"HighMiddleAge":{"random_good_of_age_24h":5},"LateMiddleAge":{"random_good_of_age_24h":5},"ColonialAge":{"random_good_of_age_24h":5},"IndustrialAge":{"random_good_of_age_24h":5},"ProgressiveEra":{"random_good_of_age_24h":5},"ModernEra":{"random_good_of_age_24h":5},"PostModernEra":{"random_good_of_age_24h":5},"ContemporaryEra":{"random_good_of_age_24h":5},"TomorrowEra":{"random_good_of_age_24h":5},"FutureEra":{"random_good_of_age_24h":6},"ArcticFuture":{"random_good_of_age_24h":6},"OceanicFuture":{"random_good_of_age_24h":6},"VirtualFuture":{"random_good_of_age_24h":6},"SpaceAgeMars":{"random_good_of_age_24h":6},"SpaceAgeAsteroidBelt":{"random_good_of_age_24h":6},"SpaceAgeVenus":{"random_good_of_age_24h":6},"SpaceAgeJupiterMoon":{"random_good_of_age_24h":6},"SpaceAgeTitan":{"random_good_of_age_24h":7},"SpaceAgeSpaceHub":{"random_good_of_age_24h":7}}, boosts: [{"type":"att_boost_attacker","value":1,"feature":"all"},{"type":"def_boost_attacker","value":2,"feature":"all"}] },
+    "W_MultiAge_FALL16A3": { prod: {"BronzeAge":{"population":-19},"IronAge":{"population":-37},"EarlyMiddleAge":{"population":-52},"HighMiddleAge":{"population":-67},"LateMiddleAge":{"population":-82},"ColonialAge":{"population":-98},"IndustrialAge":{"population":-112},"ProgressiveEra":{"population":-127},"ModernEra":{"population":-141},"PostModernEra":{"population":-154},"ContemporaryEra":{"population":-167},"TomorrowEra":{"population":-179},"FutureEra":{"population":-201},"ArcticFuture":{"population":-214},"OceanicFuture":{"population":-227},"VirtualFuture":{"population":-239},"SpaceAgeMars":{"population":-364},"SpaceAgeAsteroidBelt":{"population":-382},"SpaceAgeVenus":{"population":-400},"SpaceAgeJupiterMoon":{"population":-416},"SpaceAgeTitan":{"population":-433},"SpaceAgeSpaceHub":{"population":-448}} },
+    "W_MultiAge_FALL16A4": { prod: {"BronzeAge":{"population":-30},"IronAge":{"population":-59},"EarlyMiddleAge":{"population":-84},"HighMiddleAge":{"population":-109},"LateMiddleAge":{"population":-134},"ColonialAge":{"population":-159},"IndustrialAge":{"population":-182},"ProgressiveEra":{"population":-206},"ModernEra":{"population":-229},"PostModernEra":{"population":-251},"ContemporaryEra":{"population":-271},"TomorrowEra":{"population":-292},"FutureEra":{"population":-327},"ArcticFuture":{"population":-347},"OceanicFuture":{"population":-369},"VirtualFuture":{"population":-388},"SpaceAgeMars":{"population":-592},"SpaceAgeAsteroidBelt":{"population":-621},"SpaceAgeVenus":{"population":-649},"SpaceAgeJupiterMoon":{"population":-677},"SpaceAgeTitan":{"population":-704},"SpaceAgeSpaceHub":{"population":-728}} },
+    "W_MultiAge_FallBonus21a": { prod: {"BronzeAge":{"population":180,"happiness":960,"demandHappiness":180,"money_24h":1100},"IronAge":{"population":386,"happiness":1736,"demandHappiness":386,"money_24h":2600},"EarlyMiddleAge":{"population":593,"happiness":2083,"demandHappiness":593,"money_24h":4300},"HighMiddleAge":{"population":833,"happiness":2503,"demandHappiness":833,"money_24h":6100},"LateMiddleAge":{"population":1092,"happiness":2952,"demandHappiness":1092,"money_24h":8000},"ColonialAge":{"population":1379,"happiness":3569,"demandHappiness":1379,"money_24h":12200},"IndustrialAge":{"population":1685,"happiness":4145,"demandHappiness":1685,"money_24h":15200},"ProgressiveEra":{"population":2011,"happiness":4721,"demandHappiness":2011,"money_24h":18400},"ModernEra":{"population":2358,"happiness":5258,"demandHappiness":2358,"money_24h":22900},"PostModernEra":{"population":2717,"happiness":5737,"demandHappiness":2717,"money_24h":28800},"ContemporaryEra":{"population":3097,"happiness":6607,"demandHappiness":3097,"money_24h":37500},"TomorrowEra":{"population":3490,"happiness":7750,"demandHappiness":3490,"money_24h":43400},"FutureEra":{"population":3903,"happiness":9003,"demandHappiness":3903,"money_24h":49800},"ArcticFuture":{"population":4329,"happiness":10269,"demandHappiness":4329,"money_24h":56600},"OceanicFuture":{"population":4769,"happiness":11619,"demandHappiness":4769,"money_24h":63800},"VirtualFuture":{"population":5221,"happiness":13411,"demandHappiness":5221,"money_24h":71400},"SpaceAgeMars":{"population":8265,"happiness":21365,"demandHappiness":8265,"money_24h":119300},"SpaceAgeAsteroidBelt":{"population":8978,"happiness":23208,"demandHappiness":8978,"money_24h":132100},"SpaceAgeVenus":{"population":9704,"happiness":25084,"demandHappiness":9704,"money_24h":145700},"SpaceAgeJupiterMoon":{"population":10450,"happiness":27010,"demandHappiness":10450,"money_24h":159900},"SpaceAgeTitan":{"population":11254,"happiness":29085,"demandHappiness":11254,"money_24h":175484},"SpaceAgeSpaceHub":{"population":12058,"happiness":31160,"demandHappiness":12058,"money_24h":191068}} },
+    "W_MultiAge_FallBonus21b": { prod: {"BronzeAge":{"population":183,"happiness":993,"demandHappiness":183,"money_24h":1200,"supplies_24h":1190},"IronAge":{"population":393,"happiness":1793,"demandHappiness":393,"money_24h":2900,"supplies_24h":2050},"EarlyMiddleAge":{"population":603,"happiness":2153,"demandHappiness":603,"money_24h":4800,"supplies_24h":2270},"HighMiddleAge":{"population":848,"happiness":2568,"demandHappiness":848,"money_24h":6700,"supplies_24h":2530},"LateMiddleAge":{"population":1112,"happiness":3032,"demandHappiness":1112,"money_24h":8900,"supplies_24h":2820},"ColonialAge":{"population":1403,"happiness":3663,"demandHappiness":1403,"money_24h":13500,"supplies_24h":3320},"IndustrialAge":{"population":1715,"happiness":4265,"demandHappiness":1715,"money_24h":16900,"supplies_24h":3740},"ProgressiveEra":{"population":2048,"happiness":4848,"demandHappiness":2048,"money_24h":20500,"supplies_24h":4110},"ModernEra":{"population":2400,"happiness":5400,"demandHappiness":2400,"money_24h":25400,"supplies_24h":4390},"PostModernEra":{"population":2766,"happiness":5886,"demandHappiness":2766,"money_24h":32000,"supplies_24h":4580},"ContemporaryEra":{"population":3153,"happiness":6783,"demandHappiness":3153,"money_24h":41700,"supplies_24h":5320},"TomorrowEra":{"population":3553,"happiness":7953,"demandHappiness":3553,"money_24h":48200,"supplies_24h":6460},"FutureEra":{"population":3973,"happiness":9243,"demandHappiness":3973,"money_24h":55300,"supplies_24h":7740},"ArcticFuture":{"population":4407,"happiness":10547,"demandHappiness":4407,"money_24h":62800,"supplies_24h":9010},"OceanicFuture":{"population":4854,"happiness":11944,"demandHappiness":4854,"money_24h":70900,"supplies_24h":10400},"VirtualFuture":{"population":5316,"happiness":13786,"demandHappiness":5316,"money_24h":79400,"supplies_24h":12420},"SpaceAgeMars":{"population":8414,"happiness":21964,"demandHappiness":8414,"money_24h":132600,"supplies_24h":19870},"SpaceAgeAsteroidBelt":{"population":9139,"happiness":23859,"demandHappiness":9139,"money_24h":146800,"supplies_24h":21600},"SpaceAgeVenus":{"population":9878,"happiness":25788,"demandHappiness":9878,"money_24h":161800,"supplies_24h":23330},"SpaceAgeJupiterMoon":{"population":10638,"happiness":27778,"demandHappiness":10638,"money_24h":177600,"supplies_24h":25130},"SpaceAgeTitan":{"population":11457,"happiness":29923,"demandHappiness":11457,"money_24h":194943,"supplies_24h":27069},"SpaceAgeSpaceHub":{"population":12276,"happiness":32068,"demandHappiness":12276,"money_24h":212286,"supplies_24h":29008}} },
+    "W_MultiAge_FallBonus21c": { prod: {"BronzeAge":{"population":188,"happiness":1058,"demandHappiness":188,"money_24h":1300,"supplies_24h":1300,"random_good_of_age_24h":3},"IronAge":{"population":404,"happiness":1894,"demandHappiness":404,"money_24h":3200,"supplies_24h":2240,"random_good_of_age_24h":3},"EarlyMiddleAge":{"population":619,"happiness":2269,"demandHappiness":619,"money_24h":5300,"supplies_24h":2470,"random_good_of_age_24h":3},"HighMiddleAge":{"population":870,"happiness":2710,"demandHappiness":870,"money_24h":7400,"supplies_24h":2760,"random_good_of_age_24h":3},"LateMiddleAge":{"population":1141,"happiness":3191,"demandHappiness":1141,"money_24h":9800,"supplies_24h":3080,"random_good_of_age_24h":3},"ColonialAge":{"population":1441,"happiness":3851,"demandHappiness":1441,"money_24h":14900,"supplies_24h":3620,"random_good_of_age_24h":3},"IndustrialAge":{"population":1761,"happiness":4481,"demandHappiness":1761,"money_24h":18500,"supplies_24h":4080,"random_good_of_age_24h":3},"ProgressiveEra":{"population":2102,"happiness":5092,"demandHappiness":2102,"money_24h":22500,"supplies_24h":4480,"random_good_of_age_24h":3},"ModernEra":{"population":2464,"happiness":5664,"demandHappiness":2464,"money_24h":28000,"supplies_24h":4790,"random_good_of_age_24h":3},"PostModernEra":{"population":2840,"happiness":6170,"demandHappiness":2840,"money_24h":35200,"supplies_24h":4990,"random_good_of_age_24h":3},"ContemporaryEra":{"population":3236,"happiness":7106,"demandHappiness":3236,"money_24h":45800,"supplies_24h":5800,"random_good_of_age_24h":3},"TomorrowEra":{"population":3647,"happiness":8347,"demandHappiness":3647,"money_24h":53100,"supplies_24h":7040,"random_good_of_age_24h":3},"FutureEra":{"population":4079,"happiness":9709,"demandHappiness":4079,"money_24h":60800,"supplies_24h":8440,"random_good_of_age_24h":3},"ArcticFuture":{"population":4524,"happiness":11074,"demandHappiness":4524,"money_24h":69100,"supplies_24h":9830,"random_good_of_age_24h":3},"OceanicFuture":{"population":4983,"happiness":12543,"demandHappiness":4983,"money_24h":77900,"supplies_24h":11340,"random_good_of_age_24h":3},"VirtualFuture":{"population":5457,"happiness":14487,"demandHappiness":5457,"money_24h":87300,"supplies_24h":13550,"random_good_of_age_24h":3},"SpaceAgeMars":{"population":8637,"happiness":23087,"demandHappiness":8637,"money_24h":145800,"supplies_24h":21680,"random_good_of_age_24h":3},"SpaceAgeAsteroidBelt":{"population":9382,"happiness":25092,"demandHappiness":9382,"money_24h":161500,"supplies_24h":23560,"random_good_of_age_24h":3},"SpaceAgeVenus":{"population":10141,"happiness":27111,"demandHappiness":10141,"money_24h":178000,"supplies_24h":25450,"random_good_of_age_24h":3},"SpaceAgeJupiterMoon":{"population":10920,"happiness":29200,"demandHappiness":10920,"money_24h":195400,"supplies_24h":27420,"random_good_of_age_24h":3},"SpaceAgeTitan":{"population":11759,"happiness":31451,"demandHappiness":11759,"money_24h":214501,"supplies_24h":29543,"random_good_of_age_24h":3},"SpaceAgeSpaceHub":{"population":12598,"happiness":33702,"demandHappiness":12598,"money_24h":233602,"supplies_24h":31666,"random_good_of_age_24h":3}} },
+    "W_MultiAge_FallBonus21d": { prod: {"BronzeAge":{"population":194,"happiness":1114,"demandHappiness":194,"money_24h":1400,"supplies_24h":1410,"strategy_points_24h":1,"random_good_of_age_24h":5},"IronAge":{"population":418,"happiness":1998,"demandHappiness":418,"money_24h":3500,"supplies_24h":2420,"strategy_points_24h":1,"random_good_of_age_24h":5},"EarlyMiddleAge":{"population":641,"happiness":2391,"demandHappiness":641,"money_24h":5800,"supplies_24h":2680,"strategy_points_24h":1,"random_good_of_age_24h":5},"HighMiddleAge":{"population":900,"happiness":2850,"demandHappiness":900,"money_24h":8100,"supplies_24h":2990,"strategy_points_24h":1,"random_good_of_age_24h":5},"LateMiddleAge":{"population":1181,"happiness":3361,"demandHappiness":1181,"money_24h":10700,"supplies_24h":3330,"strategy_points_24h":1,"random_good_of_age_24h":5},"ColonialAge":{"population":1490,"happiness":4050,"demandHappiness":1490,"money_24h":16200,"supplies_24h":3920,"strategy_points_24h":1,"random_good_of_age_24h":5},"IndustrialAge":{"population":1822,"happiness":4712,"demandHappiness":1822,"money_24h":20200,"supplies_24h":4420,"strategy_points_24h":1,"random_good_of_age_24h":5},"ProgressiveEra":{"population":2174,"happiness":5344,"demandHappiness":2174,"money_24h":24500,"supplies_24h":4850,"strategy_points_24h":1,"random_good_of_age_24h":5},"ModernEra":{"population":2549,"happiness":5949,"demandHappiness":2549,"money_24h":30500,"supplies_24h":5190,"strategy_points_24h":1,"random_good_of_age_24h":5},"PostModernEra":{"population":2938,"happiness":6478,"demandHappiness":2938,"money_24h":38400,"supplies_24h":5410,"strategy_points_24h":1,"random_good_of_age_24h":5},"ContemporaryEra":{"population":3348,"happiness":7458,"demandHappiness":3348,"money_24h":50000,"supplies_24h":6290,"strategy_points_24h":1,"random_good_of_age_24h":5},"TomorrowEra":{"population":3773,"happiness":8763,"demandHappiness":3773,"money_24h":57900,"supplies_24h":7630,"strategy_points_24h":1,"random_good_of_age_24h":5},"FutureEra":{"population":4219,"happiness":10199,"demandHappiness":4219,"money_24h":66400,"supplies_24h":9140,"strategy_points_24h":1,"random_good_of_age_24h":5},"ArcticFuture":{"population":4680,"happiness":11640,"demandHappiness":4680,"money_24h":75400,"supplies_24h":10650,"strategy_points_24h":1,"random_good_of_age_24h":5},"OceanicFuture":{"population":5155,"happiness":13185,"demandHappiness":5155,"money_24h":85000,"supplies_24h":12290,"strategy_points_24h":1,"random_good_of_age_24h":5},"VirtualFuture":{"population":5645,"happiness":15245,"demandHappiness":5645,"money_24h":95200,"supplies_24h":14680,"strategy_points_24h":1,"random_good_of_age_24h":5},"SpaceAgeMars":{"population":8935,"happiness":24295,"demandHappiness":8935,"money_24h":159100,"supplies_24h":23490,"strategy_points_24h":1,"random_good_of_age_24h":5},"SpaceAgeAsteroidBelt":{"population":9706,"happiness":26396,"demandHappiness":9706,"money_24h":176200,"supplies_24h":25520,"strategy_points_24h":1,"random_good_of_age_24h":5},"SpaceAgeVenus":{"population":10490,"happiness":28520,"demandHappiness":10490,"money_24h":194200,"supplies_24h":27570,"strategy_points_24h":1,"random_good_of_age_24h":5},"SpaceAgeJupiterMoon":{"population":11297,"happiness":30717,"demandHappiness":11297,"money_24h":213200,"supplies_24h":29700,"strategy_points_24h":1,"random_good_of_age_24h":5},"SpaceAgeTitan":{"population":12167,"happiness":33085,"demandHappiness":12167,"money_24h":234059,"supplies_24h":31995,"strategy_points_24h":1,"random_good_of_age_24h":5},"SpaceAgeSpaceHub":{"population":13037,"happiness":35453,"demandHappiness":13037,"money_24h":254918,"supplies_24h":34290,"strategy_points_24h":1,"random_good_of_age_24h":5}} },
+    "W_MultiAge_FallBonus21e": { prod: {"BronzeAge":{"population":204,"happiness":1174,"demandHappiness":204,"money_24h":1600,"supplies_24h":1510,"strategy_points_24h":2,"random_good_of_age_24h":10},"IronAge":{"population":438,"happiness":2118,"demandHappiness":438,"money_24h":3700,"supplies_24h":2610,"strategy_points_24h":2,"random_good_of_age_24h":10},"EarlyMiddleAge":{"population":673,"happiness":2523,"demandHappiness":673,"money_24h":6200,"supplies_24h":2880,"strategy_points_24h":2,"random_good_of_age_24h":10},"HighMiddleAge":{"population":945,"happiness":3015,"demandHappiness":945,"money_24h":8700,"supplies_24h":3220,"strategy_points_24h":2,"random_good_of_age_24h":10},"LateMiddleAge":{"population":1240,"happiness":3550,"demandHappiness":1240,"money_24h":11500,"supplies_24h":3590,"strategy_points_24h":2,"random_good_of_age_24h":10},"ColonialAge":{"population":1565,"happiness":4275,"demandHappiness":1565,"money_24h":17600,"supplies_24h":4220,"strategy_points_24h":2,"random_good_of_age_24h":10},"IndustrialAge":{"population":1913,"happiness":4973,"demandHappiness":1913,"money_24h":21900,"supplies_24h":4760,"strategy_points_24h":2,"random_good_of_age_24h":10},"ProgressiveEra":{"population":2283,"happiness":5643,"demandHappiness":2283,"money_24h":26600,"supplies_24h":5230,"strategy_points_24h":2,"random_good_of_age_24h":10},"ModernEra":{"population":2676,"happiness":6266,"demandHappiness":2676,"money_24h":33100,"supplies_24h":5590,"strategy_points_24h":2,"random_good_of_age_24h":10},"PostModernEra":{"population":3084,"happiness":6834,"demandHappiness":3084,"money_24h":41600,"supplies_24h":5830,"strategy_points_24h":2,"random_good_of_age_24h":10},"ContemporaryEra":{"population":3515,"happiness":7865,"demandHappiness":3515,"money_24h":54200,"supplies_24h":6770,"strategy_points_24h":2,"random_good_of_age_24h":10},"TomorrowEra":{"population":3961,"happiness":9241,"demandHappiness":3961,"money_24h":62700,"supplies_24h":8220,"strategy_points_24h":2,"random_good_of_age_24h":10},"FutureEra":{"population":4430,"happiness":10760,"demandHappiness":4430,"money_24h":71900,"supplies_24h":9850,"strategy_points_24h":2,"random_good_of_age_24h":10},"ArcticFuture":{"population":4914,"happiness":12284,"demandHappiness":4914,"money_24h":81700,"supplies_24h":11470,"strategy_points_24h":2,"random_good_of_age_24h":10},"OceanicFuture":{"population":5413,"happiness":13923,"demandHappiness":5413,"money_24h":92100,"supplies_24h":13230,"strategy_points_24h":2,"random_good_of_age_24h":10},"VirtualFuture":{"population":5927,"happiness":16087,"demandHappiness":5927,"money_24h":103200,"supplies_24h":15810,"strategy_points_24h":2,"random_good_of_age_24h":10},"SpaceAgeMars":{"population":9382,"happiness":25642,"demandHappiness":9382,"money_24h":172300,"supplies_24h":25290,"strategy_points_24h":2,"random_good_of_age_24h":10},"SpaceAgeAsteroidBelt":{"population":10191,"happiness":27861,"demandHappiness":10191,"money_24h":190900,"supplies_24h":27490,"strategy_points_24h":2,"random_good_of_age_24h":10},"SpaceAgeVenus":{"population":11015,"happiness":30105,"demandHappiness":11015,"money_24h":210400,"supplies_24h":29690,"strategy_points_24h":2,"random_good_of_age_24h":10},"SpaceAgeJupiterMoon":{"population":11862,"happiness":32422,"demandHappiness":11862,"money_24h":230900,"supplies_24h":31990,"strategy_points_24h":2,"random_good_of_age_24h":10},"SpaceAgeTitan":{"population":12775,"happiness":34919,"demandHappiness":12775,"money_24h":253398,"supplies_24h":34469,"strategy_points_24h":2,"random_good_of_age_24h":10},"SpaceAgeSpaceHub":{"population":13688,"happiness":37416,"demandHappiness":13688,"money_24h":275896,"supplies_24h":36948,"strategy_points_24h":2,"random_good_of_age_24h":10}} },
+    "W_MultiAge_FallBonus21f": { prod: {"BronzeAge":{"population":217,"happiness":1247,"demandHappiness":217,"money_24h":1700,"supplies_24h":1620,"strategy_points_24h":3,"random_good_of_age_24h":15},"IronAge":{"population":466,"happiness":2236,"demandHappiness":466,"money_24h":4000,"supplies_24h":2790,"strategy_points_24h":3,"random_good_of_age_24h":15},"EarlyMiddleAge":{"population":716,"happiness":2676,"demandHappiness":716,"money_24h":6700,"supplies_24h":3090,"strategy_points_24h":3,"random_good_of_age_24h":15},"HighMiddleAge":{"population":1005,"happiness":3185,"demandHappiness":1005,"money_24h":9400,"supplies_24h":3450,"strategy_points_24h":3,"random_good_of_age_24h":15},"LateMiddleAge":{"population":1319,"happiness":3759,"demandHappiness":1319,"money_24h":12400,"supplies_24h":3850,"strategy_points_24h":3,"random_good_of_age_24h":15},"ColonialAge":{"population":1664,"happiness":4524,"demandHappiness":1664,"money_24h":18900,"supplies_24h":4520,"strategy_points_24h":3,"random_good_of_age_24h":15},"IndustrialAge":{"population":2034,"happiness":5264,"demandHappiness":2034,"money_24h":23600,"supplies_24h":5100,"strategy_points_24h":3,"random_good_of_age_24h":15},"ProgressiveEra":{"population":2428,"happiness":5978,"demandHappiness":2428,"money_24h":28600,"supplies_24h":5600,"strategy_points_24h":3,"random_good_of_age_24h":15},"ModernEra":{"population":2846,"happiness":6636,"demandHappiness":2846,"money_24h":35600,"supplies_24h":5990,"strategy_points_24h":3,"random_good_of_age_24h":15},"PostModernEra":{"population":3280,"happiness":7230,"demandHappiness":3280,"money_24h":44800,"supplies_24h":6240,"strategy_points_24h":3,"random_good_of_age_24h":15},"ContemporaryEra":{"population":3739,"happiness":8329,"demandHappiness":3739,"money_24h":58300,"supplies_24h":7250,"strategy_points_24h":3,"random_good_of_age_24h":15},"TomorrowEra":{"population":4213,"happiness":9793,"demandHappiness":4213,"money_24h":67500,"supplies_24h":8810,"strategy_points_24h":3,"random_good_of_age_24h":15},"FutureEra":{"population":4711,"happiness":11391,"demandHappiness":4711,"money_24h":77400,"supplies_24h":10550,"strategy_points_24h":3,"random_good_of_age_24h":15},"ArcticFuture":{"population":5226,"happiness":13006,"demandHappiness":5226,"money_24h":88000,"supplies_24h":12280,"strategy_points_24h":3,"random_good_of_age_24h":15},"OceanicFuture":{"population":5757,"happiness":14737,"demandHappiness":5757,"money_24h":99200,"supplies_24h":14180,"strategy_points_24h":3,"random_good_of_age_24h":15},"VirtualFuture":{"population":6303,"happiness":17033,"demandHappiness":6303,"money_24h":111100,"supplies_24h":16940,"strategy_points_24h":3,"random_good_of_age_24h":15},"SpaceAgeMars":{"population":9978,"happiness":27138,"demandHappiness":9978,"money_24h":185600,"supplies_24h":27100,"strategy_points_24h":3,"random_good_of_age_24h":15},"SpaceAgeAsteroidBelt":{"population":10838,"happiness":29488,"demandHappiness":10838,"money_24h":205600,"supplies_24h":29450,"strategy_points_24h":3,"random_good_of_age_24h":15},"SpaceAgeVenus":{"population":11714,"happiness":31864,"demandHappiness":11714,"money_24h":226600,"supplies_24h":31820,"strategy_points_24h":3,"random_good_of_age_24h":15},"SpaceAgeJupiterMoon":{"population":12615,"happiness":34325,"demandHappiness":12615,"money_24h":248700,"supplies_24h":34270,"strategy_points_24h":3,"random_good_of_age_24h":15},"SpaceAgeTitan":{"population":13586,"happiness":36977,"demandHappiness":13586,"money_24h":272956,"supplies_24h":36909,"strategy_points_24h":3,"random_good_of_age_24h":15},"SpaceAgeSpaceHub":{"population":14557,"happiness":39629,"demandHappiness":14557,"money_24h":297212,"supplies_24h":39548,"strategy_points_24h":3,"random_good_of_age_24h":15}}, boosts: [{"type":"supply_production","value":28,"feature":"all"}] },
+    "W_MultiAge_FallBonus21g": { prod: {"BronzeAge":{"population":233,"happiness":1313,"demandHappiness":233,"money_24h":1800,"supplies_24h":1730,"strategy_points_24h":4,"random_good_of_age_24h":20},"IronAge":{"population":501,"happiness":2361,"demandHappiness":501,"money_24h":4300,"supplies_24h":2980,"strategy_points_24h":4,"random_good_of_age_24h":20},"EarlyMiddleAge":{"population":769,"happiness":2829,"demandHappiness":769,"money_24h":7200,"supplies_24h":3300,"strategy_points_24h":4,"random_good_of_age_24h":20},"HighMiddleAge":{"population":1080,"happiness":3380,"demandHappiness":1080,"money_24h":10100,"supplies_24h":3680,"strategy_points_24h":4,"random_good_of_age_24h":20},"LateMiddleAge":{"population":1417,"happiness":3977,"demandHappiness":1417,"money_24h":13300,"supplies_24h":4100,"strategy_points_24h":4,"random_good_of_age_24h":20},"ColonialAge":{"population":1788,"happiness":4798,"demandHappiness":1788,"money_24h":20300,"supplies_24h":4820,"strategy_points_24h":4,"random_good_of_age_24h":20},"IndustrialAge":{"population":2186,"happiness":5586,"demandHappiness":2186,"money_24h":25300,"supplies_24h":5440,"strategy_points_24h":4,"random_good_of_age_24h":20},"ProgressiveEra":{"population":2609,"happiness":6339,"demandHappiness":2609,"money_24h":30700,"supplies_24h":5970,"strategy_points_24h":4,"random_good_of_age_24h":20},"ModernEra":{"population":3059,"happiness":7049,"demandHappiness":3059,"money_24h":38200,"supplies_24h":6390,"strategy_points_24h":4,"random_good_of_age_24h":20},"PostModernEra":{"population":3525,"happiness":7685,"demandHappiness":3525,"money_24h":48000,"supplies_24h":6660,"strategy_points_24h":4,"random_good_of_age_24h":20},"ContemporaryEra":{"population":4018,"happiness":8858,"demandHappiness":4018,"money_24h":62500,"supplies_24h":7740,"strategy_points_24h":4,"random_good_of_age_24h":20},"TomorrowEra":{"population":4527,"happiness":10397,"demandHappiness":4527,"money_24h":72400,"supplies_24h":9390,"strategy_points_24h":4,"random_good_of_age_24h":20},"FutureEra":{"population":5063,"happiness":12093,"demandHappiness":5063,"money_24h":82900,"supplies_24h":11250,"strategy_points_24h":4,"random_good_of_age_24h":20},"ArcticFuture":{"population":5616,"happiness":13806,"demandHappiness":5616,"money_24h":94300,"supplies_24h":13100,"strategy_points_24h":4,"random_good_of_age_24h":20},"OceanicFuture":{"population":6186,"happiness":15636,"demandHappiness":6186,"money_24h":106300,"supplies_24h":15120,"strategy_points_24h":4,"random_good_of_age_24h":20},"VirtualFuture":{"population":6774,"happiness":18064,"demandHappiness":6774,"money_24h":119000,"supplies_24h":18060,"strategy_points_24h":4,"random_good_of_age_24h":20},"SpaceAgeMars":{"population":10722,"happiness":28792,"demandHappiness":10722,"money_24h":198800,"supplies_24h":28900,"strategy_points_24h":4,"random_good_of_age_24h":20},"SpaceAgeAsteroidBelt":{"population":11647,"happiness":31277,"demandHappiness":11647,"money_24h":220200,"supplies_24h":31410,"strategy_points_24h":4,"random_good_of_age_24h":20},"SpaceAgeVenus":{"population":12588,"happiness":33798,"demandHappiness":12588,"money_24h":242800,"supplies_24h":33940,"strategy_points_24h":4,"random_good_of_age_24h":20},"SpaceAgeJupiterMoon":{"population":13556,"happiness":36406,"demandHappiness":13556,"money_24h":266500,"supplies_24h":36560,"strategy_points_24h":4,"random_good_of_age_24h":20},"SpaceAgeTitan":{"population":14599,"happiness":39216,"demandHappiness":14599,"money_24h":292514,"supplies_24h":39383,"strategy_points_24h":4,"random_good_of_age_24h":20},"SpaceAgeSpaceHub":{"population":15642,"happiness":42026,"demandHappiness":15642,"money_24h":318528,"supplies_24h":42206,"strategy_points_24h":4,"random_good_of_age_24h":20}}, boosts: [{"type":"supply_production","value":32,"feature":"all"}] },
+    "W_MultiAge_FallBonus21h": { prod: {"BronzeAge":{"population":253,"happiness":1443,"demandHappiness":253,"money_24h":1900,"supplies_24h":1840,"strategy_points_24h":6,"random_good_of_age_24h":25},"IronAge":{"population":543,"happiness":2593,"demandHappiness":543,"money_24h":4600,"supplies_24h":3170,"strategy_points_24h":6,"random_good_of_age_24h":25},"EarlyMiddleAge":{"population":833,"happiness":3103,"demandHappiness":833,"money_24h":7700,"supplies_24h":3500,"strategy_points_24h":6,"random_good_of_age_24h":25},"HighMiddleAge":{"population":1170,"happiness":3700,"demandHappiness":1170,"money_24h":10800,"supplies_24h":3910,"strategy_points_24h":6,"random_good_of_age_24h":25},"LateMiddleAge":{"population":1535,"happiness":4355,"demandHappiness":1535,"money_24h":14200,"supplies_24h":4360,"strategy_points_24h":6,"random_good_of_age_24h":25},"ColonialAge":{"population":1938,"happiness":5258,"demandHappiness":1938,"money_24h":21600,"supplies_24h":5120,"strategy_points_24h":6,"random_good_of_age_24h":25},"IndustrialAge":{"population":2368,"happiness":6108,"demandHappiness":2368,"money_24h":27000,"supplies_24h":5780,"strategy_points_24h":6,"random_good_of_age_24h":25},"ProgressiveEra":{"population":2827,"happiness":6937,"demandHappiness":2827,"money_24h":32700,"supplies_24h":6350,"strategy_points_24h":6,"random_good_of_age_24h":25},"ModernEra":{"population":3313,"happiness":7703,"demandHappiness":3313,"money_24h":40700,"supplies_24h":6790,"strategy_points_24h":6,"random_good_of_age_24h":25},"PostModernEra":{"population":3819,"happiness":8399,"demandHappiness":3819,"money_24h":51200,"supplies_24h":7070,"strategy_points_24h":6,"random_good_of_age_24h":25},"ContemporaryEra":{"population":4352,"happiness":9672,"demandHappiness":4352,"money_24h":66700,"supplies_24h":8220,"strategy_points_24h":6,"random_good_of_age_24h":25},"TomorrowEra":{"population":4905,"happiness":11365,"demandHappiness":4905,"money_24h":77200,"supplies_24h":9980,"strategy_points_24h":6,"random_good_of_age_24h":25},"FutureEra":{"population":5485,"happiness":13225,"demandHappiness":5485,"money_24h":88500,"supplies_24h":11960,"strategy_points_24h":6,"random_good_of_age_24h":25},"ArcticFuture":{"population":6084,"happiness":15094,"demandHappiness":6084,"money_24h":100500,"supplies_24h":13920,"strategy_points_24h":6,"random_good_of_age_24h":25},"OceanicFuture":{"population":6702,"happiness":17102,"demandHappiness":6702,"money_24h":113400,"supplies_24h":16070,"strategy_points_24h":6,"random_good_of_age_24h":25},"VirtualFuture":{"population":7338,"happiness":19758,"demandHappiness":7338,"money_24h":127000,"supplies_24h":19190,"strategy_points_24h":6,"random_good_of_age_24h":25},"SpaceAgeMars":{"population":11616,"happiness":31486,"demandHappiness":11616,"money_24h":212100,"supplies_24h":30710,"strategy_points_24h":6,"random_good_of_age_24h":25},"SpaceAgeAsteroidBelt":{"population":12617,"happiness":34217,"demandHappiness":12617,"money_24h":234900,"supplies_24h":33370,"strategy_points_24h":6,"random_good_of_age_24h":25},"SpaceAgeVenus":{"population":13638,"happiness":36968,"demandHappiness":13638,"money_24h":259000,"supplies_24h":36060,"strategy_points_24h":6,"random_good_of_age_24h":25},"SpaceAgeJupiterMoon":{"population":14686,"happiness":39816,"demandHappiness":14686,"money_24h":284200,"supplies_24h":38840,"strategy_points_24h":6,"random_good_of_age_24h":25},"SpaceAgeTitan":{"population":15815,"happiness":42884,"demandHappiness":15815,"money_24h":311852,"supplies_24h":41835,"strategy_points_24h":6,"random_good_of_age_24h":25},"SpaceAgeSpaceHub":{"population":16944,"happiness":45952,"demandHappiness":16944,"money_24h":339504,"supplies_24h":44830,"strategy_points_24h":6,"random_good_of_age_24h":25}}, boosts: [{"type":"supply_production","value":35,"feature":"all"}] },
+    "W_MultiAge_FallBonus21i": { prod: {"BronzeAge":{"population":275,"happiness":1575,"demandHappiness":275,"money_24h":2000,"supplies_24h":1920,"strategy_points_24h":9,"random_good_of_age_24h":30},"IronAge":{"population":592,"happiness":2832,"demandHappiness":592,"money_24h":4900,"supplies_24h":3320,"strategy_points_24h":9,"random_good_of_age_24h":30},"EarlyMiddleAge":{"population":908,"happiness":3378,"demandHappiness":908,"money_24h":8200,"supplies_24h":3670,"strategy_points_24h":9,"random_good_of_age_24h":30},"HighMiddleAge":{"population":1275,"happiness":4035,"demandHappiness":1275,"money_24h":11400,"supplies_24h":4090,"strategy_points_24h":9,"random_good_of_age_24h":30},"LateMiddleAge":{"population":1673,"happiness":4753,"demandHappiness":1673,"money_24h":15100,"supplies_24h":4560,"strategy_points_24h":9,"random_good_of_age_24h":30},"ColonialAge":{"population":2111,"happiness":5731,"demandHappiness":2111,"money_24h":23000,"supplies_24h":5370,"strategy_points_24h":9,"random_good_of_age_24h":30},"IndustrialAge":{"population":2581,"happiness":6661,"demandHappiness":2581,"money_24h":28600,"supplies_24h":6050,"strategy_points_24h":9,"random_good_of_age_24h":30},"ProgressiveEra":{"population":3080,"happiness":7560,"demandHappiness":3080,"money_24h":34800,"supplies_24h":6650,"strategy_points_24h":9,"random_good_of_age_24h":30},"ModernEra":{"population":3611,"happiness":8401,"demandHappiness":3611,"money_24h":43300,"supplies_24h":7110,"strategy_points_24h":9,"random_good_of_age_24h":30},"PostModernEra":{"population":4162,"happiness":9152,"demandHappiness":4162,"money_24h":54400,"supplies_24h":7410,"strategy_points_24h":9,"random_good_of_age_24h":30},"ContemporaryEra":{"population":4743,"happiness":10543,"demandHappiness":4743,"money_24h":70800,"supplies_24h":8610,"strategy_points_24h":9,"random_good_of_age_24h":30},"TomorrowEra":{"population":5345,"happiness":12385,"demandHappiness":5345,"money_24h":82000,"supplies_24h":10450,"strategy_points_24h":9,"random_good_of_age_24h":30},"FutureEra":{"population":5977,"happiness":14417,"demandHappiness":5977,"money_24h":94000,"supplies_24h":12520,"strategy_points_24h":9,"random_good_of_age_24h":30},"ArcticFuture":{"population":6630,"happiness":16460,"demandHappiness":6630,"money_24h":106800,"supplies_24h":14580,"strategy_points_24h":9,"random_good_of_age_24h":30},"OceanicFuture":{"population":7303,"happiness":18643,"demandHappiness":7303,"money_24h":120400,"supplies_24h":16820,"strategy_points_24h":9,"random_good_of_age_24h":30},"VirtualFuture":{"population":7997,"happiness":21547,"demandHappiness":7997,"money_24h":134900,"supplies_24h":20100,"strategy_points_24h":9,"random_good_of_age_24h":30},"SpaceAgeMars":{"population":12658,"happiness":34338,"demandHappiness":12658,"money_24h":225300,"supplies_24h":32160,"strategy_points_24h":9,"random_good_of_age_24h":30},"SpaceAgeAsteroidBelt":{"population":13750,"happiness":37310,"demandHappiness":13750,"money_24h":249600,"supplies_24h":34950,"strategy_points_24h":9,"random_good_of_age_24h":30},"SpaceAgeVenus":{"population":14861,"happiness":40311,"demandHappiness":14861,"money_24h":275100,"supplies_24h":37750,"strategy_points_24h":9,"random_good_of_age_24h":30},"SpaceAgeJupiterMoon":{"population":16004,"happiness":43424,"demandHappiness":16004,"money_24h":302000,"supplies_24h":40670,"strategy_points_24h":9,"random_good_of_age_24h":30},"SpaceAgeTitan":{"population":17235,"happiness":46778,"demandHappiness":17235,"money_24h":331531,"supplies_24h":43816,"strategy_points_24h":9,"random_good_of_age_24h":30},"SpaceAgeSpaceHub":{"population":18466,"happiness":50132,"demandHappiness":18466,"money_24h":361062,"supplies_24h":46962,"strategy_points_24h":9,"random_good_of_age_24h":30}}, boosts: [{"type":"supply_production","value":39,"feature":"all"}] },
+    "W_MultiAge_FALL16A10": { prod: {"BronzeAge":{"population":-30},"IronAge":{"population":-70},"EarlyMiddleAge":{"population":-110},"HighMiddleAge":{"population":-150},"LateMiddleAge":{"population":-200},"ColonialAge":{"population":-250},"IndustrialAge":{"population":-300},"ProgressiveEra":{"population":-360},"ModernEra":{"population":-420},"PostModernEra":{"population":-490},"ContemporaryEra":{"population":-560},"TomorrowEra":{"population":-630},"FutureEra":{"population":-700},"ArcticFuture":{"population":-780},"OceanicFuture":{"population":-860},"VirtualFuture":{"population":-940},"SpaceAgeMars":{"population":-1490},"SpaceAgeAsteroidBelt":{"population":-1610},"SpaceAgeVenus":{"population":-1740},"SpaceAgeJupiterMoon":{"population":-1880},"SpaceAgeTitan":{"population":-2020},"SpaceAgeSpaceHub":{"population":-2150}}, boosts: [{"type":"att_def_boost_attacker","value":33,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":33,"feature":"guild_expedition"}] },
+    "W_MultiAge_FALL23E2": { prod: {"BronzeAge":{"random_good_of_age_24h":6},"IronAge":{"random_good_of_age_24h":6},"EarlyMiddleAge":{"random_good_of_age_24h":6},"HighMiddleAge":{"random_good_of_age_24h":6},"LateMiddleAge":{"random_good_of_age_24h":6},"ColonialAge":{"random_good_of_age_24h":6},"IndustrialAge":{"random_good_of_age_24h":6},"ProgressiveEra":{"random_good_of_age_24h":6},"ModernEra":{"random_good_of_age_24h":6},"PostModernEra":{"random_good_of_age_24h":6},"ContemporaryEra":{"random_good_of_age_24h":6},"TomorrowEra":{"random_good_of_age_24h":6},"FutureEra":{"random_good_of_age_24h":7},"ArcticFuture":{"random_good_of_age_24h":7},"OceanicFuture":{"random_good_of_age_24h":7},"VirtualFuture":{"random_good_of_age_24h":7},"SpaceAgeMars":{"random_good_of_age_24h":7},"SpaceAgeAsteroidBelt":{"random_good_of_age_24h":7},"SpaceAgeVenus":{"random_good_of_age_24h":7},"SpaceAgeJupiterMoon":{"random_good_of_age_24h":7},"SpaceAgeTitan":{"random_good_of_age_24h":9},"SpaceAgeSpaceHub":{"random_good_of_age_24h":9}}, boosts: [{"type":"att_boost_attacker","value":2,"feature":"all"},{"type":"def_boost_attacker","value":3,"feature":"all"}] },
+    "W_MultiAge_FALL24A11": { prod: {"BronzeAge":{"population":640,"happiness":3970,"demandHappiness":640,"money_24h":4330,"all_goods_of_age_24h":140,"strategy_points_24h":90},"IronAge":{"population":1380,"happiness":6840,"demandHappiness":1380,"money_24h":10380,"all_goods_of_age_24h":140,"strategy_points_24h":90},"EarlyMiddleAge":{"population":2120,"happiness":7570,"demandHappiness":2120,"money_24h":17300,"all_goods_of_age_24h":140,"strategy_points_24h":91},"HighMiddleAge":{"population":2970,"happiness":8440,"demandHappiness":2970,"money_24h":24220,"all_goods_of_age_24h":140,"strategy_points_24h":91},"LateMiddleAge":{"population":3900,"happiness":9420,"demandHappiness":3900,"money_24h":32010,"all_goods_of_age_24h":140,"strategy_points_24h":92},"ColonialAge":{"population":4920,"happiness":11070,"demandHappiness":4920,"money_24h":48750,"all_goods_of_age_24h":140,"strategy_points_24h":92},"IndustrialAge":{"population":6010,"happiness":12490,"demandHappiness":6010,"money_24h":60730,"all_goods_of_age_24h":140,"strategy_points_24h":93},"ProgressiveEra":{"population":7180,"happiness":13710,"demandHappiness":7180,"money_24h":73700,"all_goods_of_age_24h":140,"strategy_points_24h":93},"ModernEra":{"population":8410,"happiness":14670,"demandHappiness":8410,"money_24h":91700,"all_goods_of_age_24h":140,"strategy_points_24h":94},"PostModernEra":{"population":9700,"happiness":15280,"demandHappiness":9700,"money_24h":115350,"all_goods_of_age_24h":140,"strategy_points_24h":94},"ContemporaryEra":{"population":11050,"happiness":17760,"demandHappiness":11050,"money_24h":150170,"all_goods_of_age_24h":140,"strategy_points_24h":95},"TomorrowEra":{"population":12450,"happiness":21560,"demandHappiness":12450,"money_24h":173880,"all_goods_of_age_24h":140,"strategy_points_24h":95},"FutureEra":{"population":13930,"happiness":25830,"demandHappiness":13930,"money_24h":199310,"all_goods_of_age_24h":140,"strategy_points_24h":96},"ArcticFuture":{"population":15450,"happiness":30080,"demandHappiness":15450,"money_24h":226470,"all_goods_of_age_24h":140,"strategy_points_24h":96},"OceanicFuture":{"population":17020,"happiness":34710,"demandHappiness":17020,"money_24h":255360,"all_goods_of_age_24h":140,"strategy_points_24h":97},"VirtualFuture":{"population":18630,"happiness":41470,"demandHappiness":18630,"money_24h":286030,"all_goods_of_age_24h":140,"strategy_points_24h":97},"SpaceAgeMars":{"population":29490,"happiness":66350,"demandHappiness":29490,"money_24h":477770,"all_goods_of_age_24h":140,"strategy_points_24h":98},"SpaceAgeAsteroidBelt":{"population":32040,"happiness":72110,"demandHappiness":32040,"money_24h":529200,"all_goods_of_age_24h":140,"strategy_points_24h":98},"SpaceAgeVenus":{"population":34630,"happiness":77900,"demandHappiness":34630,"money_24h":583350,"all_goods_of_age_24h":140,"strategy_points_24h":99},"SpaceAgeJupiterMoon":{"population":37290,"happiness":83920,"demandHappiness":37290,"money_24h":640270,"all_goods_of_age_24h":140,"strategy_points_24h":99},"SpaceAgeTitan":{"population":40000,"happiness":90000,"demandHappiness":40000,"money_24h":700000,"all_goods_of_age_24h":140,"strategy_points_24h":100},"SpaceAgeSpaceHub":{"population":42710,"happiness":96080,"demandHappiness":42710,"money_24h":759730,"all_goods_of_age_24h":140,"strategy_points_24h":100}}, boosts: [{"type":"def_boost_defender","value":100,"feature":"all"},{"type":"att_boost_defender","value":120,"feature":"all"},{"type":"forge_points_production","value":1,"feature":"all"}] },
+    "W_MultiAge_FALL16A6": { prod: {"BronzeAge":{"population":-52},"IronAge":{"population":-102},"EarlyMiddleAge":{"population":-144},"HighMiddleAge":{"population":-188},"LateMiddleAge":{"population":-230},"ColonialAge":{"population":-274},"IndustrialAge":{"population":-314},"ProgressiveEra":{"population":-354},"ModernEra":{"population":-395},"PostModernEra":{"population":-432},"ContemporaryEra":{"population":-467},"TomorrowEra":{"population":-502},"FutureEra":{"population":-563},"ArcticFuture":{"population":-598},"OceanicFuture":{"population":-635},"VirtualFuture":{"population":-669},"SpaceAgeMars":{"population":-1020},"SpaceAgeAsteroidBelt":{"population":-1070},"SpaceAgeVenus":{"population":-1119},"SpaceAgeJupiterMoon":{"population":-1166},"SpaceAgeTitan":{"population":-1213},"SpaceAgeSpaceHub":{"population":-1255}} },
+    "W_MultiAge_FALL23D2": { prod: {"BronzeAge":{"strategy_points_24h":4},"IronAge":{"strategy_points_24h":4},"EarlyMiddleAge":{"strategy_points_24h":4},"HighMiddleAge":{"strategy_points_24h":4},"LateMiddleAge":{"strategy_points_24h":4},"ColonialAge":{"strategy_points_24h":4},"IndustrialAge":{"strategy_points_24h":4},"ProgressiveEra":{"strategy_points_24h":4},"ModernEra":{"strategy_points_24h":4},"PostModernEra":{"strategy_points_24h":4},"ContemporaryEra":{"strategy_points_24h":4},"TomorrowEra":{"strategy_points_24h":4},"FutureEra":{"strategy_points_24h":5},"ArcticFuture":{"strategy_points_24h":5},"OceanicFuture":{"strategy_points_24h":5},"VirtualFuture":{"strategy_points_24h":5},"SpaceAgeMars":{"strategy_points_24h":5},"SpaceAgeAsteroidBelt":{"strategy_points_24h":5},"SpaceAgeVenus":{"strategy_points_24h":5},"SpaceAgeJupiterMoon":{"strategy_points_24h":5},"SpaceAgeTitan":{"strategy_points_24h":6},"SpaceAgeSpaceHub":{"strategy_points_24h":6}}, boosts: [{"type":"att_boost_attacker","value":6,"feature":"all"},{"type":"def_boost_attacker","value":11,"feature":"all"},{"type":"att_boost_defender","value":10,"feature":"all"}] },
+    "W_MultiAge_FALL22A11": { prod: {"BronzeAge":{"population":405,"happiness":1890,"demandHappiness":405,"money_24h":1800,"supplies_24h":2700,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"IronAge":{"population":870,"happiness":3260,"demandHappiness":870,"money_24h":4300,"supplies_24h":4660,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"EarlyMiddleAge":{"population":1335,"happiness":3610,"demandHappiness":1335,"money_24h":7200,"supplies_24h":5150,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"HighMiddleAge":{"population":1875,"happiness":4020,"demandHappiness":1875,"money_24h":10100,"supplies_24h":5750,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"LateMiddleAge":{"population":2460,"happiness":4490,"demandHappiness":2460,"money_24h":13300,"supplies_24h":6410,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"ColonialAge":{"population":3105,"happiness":5280,"demandHappiness":3105,"money_24h":20300,"supplies_24h":7540,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"IndustrialAge":{"population":3795,"happiness":5950,"demandHappiness":3795,"money_24h":25300,"supplies_24h":8500,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"ProgressiveEra":{"population":4530,"happiness":6530,"demandHappiness":4530,"money_24h":30700,"supplies_24h":9330,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"ModernEra":{"population":5310,"happiness":6990,"demandHappiness":5310,"money_24h":38200,"supplies_24h":9990,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"PostModernEra":{"population":6120,"happiness":7280,"demandHappiness":6120,"money_24h":48000,"supplies_24h":10400,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"ContemporaryEra":{"population":6975,"happiness":8460,"demandHappiness":6975,"money_24h":62500,"supplies_24h":12090,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"TomorrowEra":{"population":7860,"happiness":10270,"demandHappiness":7860,"money_24h":72400,"supplies_24h":14680,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"FutureEra":{"population":8790,"happiness":12310,"demandHappiness":8790,"money_24h":82900,"supplies_24h":17580,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"ArcticFuture":{"population":9750,"happiness":14330,"demandHappiness":9750,"money_24h":94300,"supplies_24h":20470,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"OceanicFuture":{"population":10740,"happiness":16540,"demandHappiness":10740,"money_24h":106300,"supplies_24h":23630,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"VirtualFuture":{"population":11760,"happiness":19760,"demandHappiness":11760,"money_24h":119000,"supplies_24h":28230,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"SpaceAgeMars":{"population":18615,"happiness":31610,"demandHappiness":18615,"money_24h":198800,"supplies_24h":45160,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"SpaceAgeAsteroidBelt":{"population":20220,"happiness":34360,"demandHappiness":20220,"money_24h":220200,"supplies_24h":49080,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"SpaceAgeVenus":{"population":21855,"happiness":37120,"demandHappiness":21855,"money_24h":242800,"supplies_24h":53030,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"SpaceAgeJupiterMoon":{"population":23535,"happiness":39980,"demandHappiness":23535,"money_24h":266500,"supplies_24h":57120,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"SpaceAgeTitan":{"population":25245,"happiness":42880,"demandHappiness":25245,"money_24h":291300,"supplies_24h":61260,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10},"SpaceAgeSpaceHub":{"population":26955,"happiness":45780,"demandHappiness":26955,"money_24h":316100,"supplies_24h":65400,"random_good_of_age_24h":100,"strategy_points_24h":35,"units_24h":10}}, boosts: [{"type":"att_boost_attacker","value":33,"feature":"all"},{"type":"def_boost_attacker","value":37,"feature":"all"},{"type":"att_def_boost_attacker","value":49,"feature":"all"},{"type":"supply_production","value":37,"feature":"all"}] },
+    "W_MultiAge_FALL25G1": { prod: {"AllAge":{"strategy_points_24h":250,"random_good_of_age_24h":150.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":150.0}}, boosts: [{"type":"att_def_boost_attacker_defender","value":175,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":175,"feature":"guild_expedition"},{"type":"att_def_boost_attacker_defender","value":20,"feature":"guild_raids"}] },
+    "W_MultiAge_FALL16A11": { prod: {"BronzeAge":{"population":-40},"IronAge":{"population":-80},"EarlyMiddleAge":{"population":-120},"HighMiddleAge":{"population":-170},"LateMiddleAge":{"population":-230},"ColonialAge":{"population":-290},"IndustrialAge":{"population":-350},"ProgressiveEra":{"population":-420},"ModernEra":{"population":-490},"PostModernEra":{"population":-570},"ContemporaryEra":{"population":-650},"TomorrowEra":{"population":-730},"FutureEra":{"population":-820},"ArcticFuture":{"population":-910},"OceanicFuture":{"population":-2000},"VirtualFuture":{"population":-1100},"SpaceAgeMars":{"population":-1730},"SpaceAgeAsteroidBelt":{"population":-1880},"SpaceAgeVenus":{"population":-2040},"SpaceAgeJupiterMoon":{"population":-2190},"SpaceAgeTitan":{"population":-2350},"SpaceAgeSpaceHub":{"population":-2510}}, boosts: [{"type":"att_boost_attacker","value":35,"feature":"all"},{"type":"att_def_boost_attacker","value":33,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":33,"feature":"guild_expedition"},{"type":"guild_raids_action_points_capacity","value":4000,"feature":"all"}] },
+    "W_MultiAge_FALL25D1": { prod: {"BronzeAge":{"happiness":4130},"IronAge":{"happiness":7120},"EarlyMiddleAge":{"happiness":7880},"HighMiddleAge":{"happiness":8790},"LateMiddleAge":{"happiness":9800},"ColonialAge":{"happiness":11520},"IndustrialAge":{"happiness":13000},"ProgressiveEra":{"happiness":14270},"ModernEra":{"happiness":15270},"PostModernEra":{"happiness":15910},"ContemporaryEra":{"happiness":18490},"TomorrowEra":{"happiness":22440},"FutureEra":{"happiness":26890},"ArcticFuture":{"happiness":31310},"OceanicFuture":{"happiness":36130},"VirtualFuture":{"happiness":43160},"SpaceAgeMars":{"happiness":69060},"SpaceAgeAsteroidBelt":{"happiness":75050},"SpaceAgeVenus":{"happiness":81080},"SpaceAgeJupiterMoon":{"happiness":87340},"SpaceAgeTitan":{"happiness":93670},"SpaceAgeSpaceHub":{"happiness":100000}} },
+    "W_MultiAge_FALL22A1": { prod: {"BronzeAge":{"population":194,"happiness":590,"demandHappiness":194,"money_24h":700},"IronAge":{"population":418,"happiness":1020,"demandHappiness":418,"money_24h":1600},"EarlyMiddleAge":{"population":641,"happiness":1130,"demandHappiness":641,"money_24h":2600},"HighMiddleAge":{"population":900,"happiness":1260,"demandHappiness":900,"money_24h":3700},"LateMiddleAge":{"population":1181,"happiness":1410,"demandHappiness":1181,"money_24h":4900},"ColonialAge":{"population":1490,"happiness":1660,"demandHappiness":1490,"money_24h":7400},"IndustrialAge":{"population":1822,"happiness":1870,"demandHappiness":1822,"money_24h":9300},"ProgressiveEra":{"population":2174,"happiness":2050,"demandHappiness":2174,"money_24h":11300},"ModernEra":{"population":2549,"happiness":2200,"demandHappiness":2549,"money_24h":14000},"PostModernEra":{"population":2938,"happiness":2290,"demandHappiness":2938,"money_24h":17600},"ContemporaryEra":{"population":3348,"happiness":2660,"demandHappiness":3348,"money_24h":22900},"TomorrowEra":{"population":3773,"happiness":3230,"demandHappiness":3773,"money_24h":26500},"FutureEra":{"population":4219,"happiness":3870,"demandHappiness":4219,"money_24h":30400},"ArcticFuture":{"population":4680,"happiness":4500,"demandHappiness":4680,"money_24h":34600},"OceanicFuture":{"population":5155,"happiness":5200,"demandHappiness":5155,"money_24h":39000},"VirtualFuture":{"population":5645,"happiness":6210,"demandHappiness":5645,"money_24h":43700},"SpaceAgeMars":{"population":8935,"happiness":9940,"demandHappiness":8935,"money_24h":72900},"SpaceAgeAsteroidBelt":{"population":9706,"happiness":10800,"demandHappiness":9706,"money_24h":80800},"SpaceAgeVenus":{"population":10490,"happiness":11670,"demandHappiness":10490,"money_24h":89000},"SpaceAgeJupiterMoon":{"population":11297,"happiness":12570,"demandHappiness":11297,"money_24h":97700},"SpaceAgeTitan":{"population":12118,"happiness":13480,"demandHappiness":12118,"money_24h":106800},"SpaceAgeSpaceHub":{"population":12939,"happiness":14390,"demandHappiness":12939,"money_24h":115900}} },
+    "W_MultiAge_FALL22A2": { prod: {"BronzeAge":{"population":203,"happiness":620,"demandHappiness":203,"money_24h":700,"supplies_24h":590},"IronAge":{"population":435,"happiness":1070,"demandHappiness":435,"money_24h":1700,"supplies_24h":1020},"EarlyMiddleAge":{"population":668,"happiness":1180,"demandHappiness":668,"money_24h":2800,"supplies_24h":1130},"HighMiddleAge":{"population":938,"happiness":1320,"demandHappiness":938,"money_24h":3900,"supplies_24h":1260},"LateMiddleAge":{"population":1230,"happiness":1470,"demandHappiness":1230,"money_24h":5100,"supplies_24h":1410},"ColonialAge":{"population":1553,"happiness":1730,"demandHappiness":1553,"money_24h":7800,"supplies_24h":1660},"IndustrialAge":{"population":1898,"happiness":1950,"demandHappiness":1898,"money_24h":9700,"supplies_24h":1870},"ProgressiveEra":{"population":2265,"happiness":2150,"demandHappiness":2265,"money_24h":11800,"supplies_24h":2050},"ModernEra":{"population":2655,"happiness":2300,"demandHappiness":2655,"money_24h":14600,"supplies_24h":2200},"PostModernEra":{"population":3060,"happiness":2390,"demandHappiness":3060,"money_24h":18400,"supplies_24h":2290},"ContemporaryEra":{"population":3488,"happiness":2780,"demandHappiness":3488,"money_24h":24000,"supplies_24h":2660},"TomorrowEra":{"population":3930,"happiness":3380,"demandHappiness":3930,"money_24h":27700,"supplies_24h":3230},"FutureEra":{"population":4395,"happiness":4040,"demandHappiness":4395,"money_24h":31800,"supplies_24h":3870},"ArcticFuture":{"population":4875,"happiness":4710,"demandHappiness":4875,"money_24h":36100,"supplies_24h":4500},"OceanicFuture":{"population":5370,"happiness":5430,"demandHappiness":5370,"money_24h":40700,"supplies_24h":5200},"VirtualFuture":{"population":5880,"happiness":6490,"demandHappiness":5880,"money_24h":45600,"supplies_24h":6210},"SpaceAgeMars":{"population":9308,"happiness":10390,"demandHappiness":9308,"money_24h":76200,"supplies_24h":9940},"SpaceAgeAsteroidBelt":{"population":10110,"happiness":11290,"demandHappiness":10110,"money_24h":84400,"supplies_24h":10800},"SpaceAgeVenus":{"population":10928,"happiness":12200,"demandHappiness":10928,"money_24h":93100,"supplies_24h":11670},"SpaceAgeJupiterMoon":{"population":11768,"happiness":13140,"demandHappiness":11768,"money_24h":102100,"supplies_24h":12570},"SpaceAgeTitan":{"population":12623,"happiness":14090,"demandHappiness":12623,"money_24h":111700,"supplies_24h":13480},"SpaceAgeSpaceHub":{"population":13478,"happiness":15040,"demandHappiness":13478,"money_24h":121300,"supplies_24h":14390}} },
+    "W_MultiAge_FALL22A3": { prod: {"BronzeAge":{"population":211,"happiness":650,"demandHappiness":211,"money_24h":700,"supplies_24h":650,"random_good_of_age_24h":1},"IronAge":{"population":452,"happiness":1120,"demandHappiness":452,"money_24h":1700,"supplies_24h":1120,"random_good_of_age_24h":1},"EarlyMiddleAge":{"population":694,"happiness":1240,"demandHappiness":694,"money_24h":2900,"supplies_24h":1240,"random_good_of_age_24h":1},"HighMiddleAge":{"population":975,"happiness":1380,"demandHappiness":975,"money_24h":4000,"supplies_24h":1380,"random_good_of_age_24h":1},"LateMiddleAge":{"population":1279,"happiness":1540,"demandHappiness":1279,"money_24h":5300,"supplies_24h":1540,"random_good_of_age_24h":1},"ColonialAge":{"population":1615,"happiness":1810,"demandHappiness":1615,"money_24h":8100,"supplies_24h":1810,"random_good_of_age_24h":1},"IndustrialAge":{"population":1973,"happiness":2040,"demandHappiness":1973,"money_24h":10100,"supplies_24h":2040,"random_good_of_age_24h":1},"ProgressiveEra":{"population":2356,"happiness":2240,"demandHappiness":2356,"money_24h":12300,"supplies_24h":2240,"random_good_of_age_24h":1},"ModernEra":{"population":2761,"happiness":2400,"demandHappiness":2761,"money_24h":15300,"supplies_24h":2400,"random_good_of_age_24h":1},"PostModernEra":{"population":3182,"happiness":2500,"demandHappiness":3182,"money_24h":19200,"supplies_24h":2500,"random_good_of_age_24h":1},"ContemporaryEra":{"population":3627,"happiness":2900,"demandHappiness":3627,"money_24h":25000,"supplies_24h":2900,"random_good_of_age_24h":1},"TomorrowEra":{"population":4087,"happiness":3520,"demandHappiness":4087,"money_24h":28900,"supplies_24h":3520,"random_good_of_age_24h":1},"FutureEra":{"population":4571,"happiness":4220,"demandHappiness":4571,"money_24h":33200,"supplies_24h":4220,"random_good_of_age_24h":1},"ArcticFuture":{"population":5070,"happiness":4910,"demandHappiness":5070,"money_24h":37700,"supplies_24h":4910,"random_good_of_age_24h":1},"OceanicFuture":{"population":5585,"happiness":5670,"demandHappiness":5585,"money_24h":42500,"supplies_24h":5670,"random_good_of_age_24h":1},"VirtualFuture":{"population":6115,"happiness":6770,"demandHappiness":6115,"money_24h":47600,"supplies_24h":6770,"random_good_of_age_24h":1},"SpaceAgeMars":{"population":9680,"happiness":10840,"demandHappiness":9680,"money_24h":79500,"supplies_24h":10840,"random_good_of_age_24h":1},"SpaceAgeAsteroidBelt":{"population":10514,"happiness":11780,"demandHappiness":10514,"money_24h":88100,"supplies_24h":11780,"random_good_of_age_24h":1},"SpaceAgeVenus":{"population":11365,"happiness":12730,"demandHappiness":11365,"money_24h":97100,"supplies_24h":12730,"random_good_of_age_24h":1},"SpaceAgeJupiterMoon":{"population":12238,"happiness":13710,"demandHappiness":12238,"money_24h":106600,"supplies_24h":13710,"random_good_of_age_24h":1},"SpaceAgeTitan":{"population":13127,"happiness":14700,"demandHappiness":13127,"money_24h":116500,"supplies_24h":14700,"random_good_of_age_24h":1},"SpaceAgeSpaceHub":{"population":14016,"happiness":15690,"demandHappiness":14016,"money_24h":126400,"supplies_24h":15690,"random_good_of_age_24h":1}} },
+    "W_MultiAge_FALL22A4": { prod: {"BronzeAge":{"population":219,"happiness":680,"demandHappiness":219,"money_24h":800,"supplies_24h":700,"random_good_of_age_24h":2,"strategy_points_24h":1},"IronAge":{"population":470,"happiness":1160,"demandHappiness":470,"money_24h":1800,"supplies_24h":1210,"random_good_of_age_24h":2,"strategy_points_24h":1},"EarlyMiddleAge":{"population":721,"happiness":1290,"demandHappiness":721,"money_24h":3000,"supplies_24h":1340,"random_good_of_age_24h":2,"strategy_points_24h":1},"HighMiddleAge":{"population":1013,"happiness":1440,"demandHappiness":1013,"money_24h":4200,"supplies_24h":1490,"random_good_of_age_24h":2,"strategy_points_24h":1},"LateMiddleAge":{"population":1328,"happiness":1600,"demandHappiness":1328,"money_24h":5600,"supplies_24h":1670,"random_good_of_age_24h":2,"strategy_points_24h":1},"ColonialAge":{"population":1677,"happiness":1880,"demandHappiness":1677,"money_24h":8500,"supplies_24h":1960,"random_good_of_age_24h":2,"strategy_points_24h":1},"IndustrialAge":{"population":2049,"happiness":2120,"demandHappiness":2049,"money_24h":10500,"supplies_24h":2210,"random_good_of_age_24h":2,"strategy_points_24h":1},"ProgressiveEra":{"population":2446,"happiness":2330,"demandHappiness":2446,"money_24h":12800,"supplies_24h":2430,"random_good_of_age_24h":2,"strategy_points_24h":1},"ModernEra":{"population":2867,"happiness":2500,"demandHappiness":2867,"money_24h":15900,"supplies_24h":2600,"random_good_of_age_24h":2,"strategy_points_24h":1},"PostModernEra":{"population":3305,"happiness":2600,"demandHappiness":3305,"money_24h":20000,"supplies_24h":2700,"random_good_of_age_24h":2,"strategy_points_24h":1},"ContemporaryEra":{"population":3767,"happiness":3020,"demandHappiness":3767,"money_24h":26000,"supplies_24h":3140,"random_good_of_age_24h":2,"strategy_points_24h":1},"TomorrowEra":{"population":4244,"happiness":3670,"demandHappiness":4244,"money_24h":30200,"supplies_24h":3820,"random_good_of_age_24h":2,"strategy_points_24h":1},"FutureEra":{"population":4747,"happiness":4400,"demandHappiness":4747,"money_24h":34600,"supplies_24h":4570,"random_good_of_age_24h":2,"strategy_points_24h":1},"ArcticFuture":{"population":5265,"happiness":5120,"demandHappiness":5265,"money_24h":39300,"supplies_24h":5320,"random_good_of_age_24h":2,"strategy_points_24h":1},"OceanicFuture":{"population":5800,"happiness":5910,"demandHappiness":5800,"money_24h":44300,"supplies_24h":6140,"random_good_of_age_24h":2,"strategy_points_24h":1},"VirtualFuture":{"population":6350,"happiness":7060,"demandHappiness":6350,"money_24h":49600,"supplies_24h":7340,"random_good_of_age_24h":2,"strategy_points_24h":1},"SpaceAgeMars":{"population":10052,"happiness":11290,"demandHappiness":10052,"money_24h":82900,"supplies_24h":11740,"random_good_of_age_24h":2,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"population":10919,"happiness":12270,"demandHappiness":10919,"money_24h":91800,"supplies_24h":12760,"random_good_of_age_24h":2,"strategy_points_24h":1},"SpaceAgeVenus":{"population":11802,"happiness":13260,"demandHappiness":11802,"money_24h":101200,"supplies_24h":13790,"random_good_of_age_24h":2,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"population":12709,"happiness":14280,"demandHappiness":12709,"money_24h":111000,"supplies_24h":14850,"random_good_of_age_24h":2,"strategy_points_24h":1},"SpaceAgeTitan":{"population":13632,"happiness":15310,"demandHappiness":13632,"money_24h":121400,"supplies_24h":15930,"random_good_of_age_24h":2,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"population":14555,"happiness":16340,"demandHappiness":14555,"money_24h":131800,"supplies_24h":17010,"random_good_of_age_24h":2,"strategy_points_24h":1}} },
+    "W_MultiAge_FALL22A5": { prod: {"BronzeAge":{"population":227,"happiness":700,"demandHappiness":227,"money_24h":800,"supplies_24h":760,"random_good_of_age_24h":3,"strategy_points_24h":2},"IronAge":{"population":487,"happiness":1210,"demandHappiness":487,"money_24h":1900,"supplies_24h":1300,"random_good_of_age_24h":3,"strategy_points_24h":2},"EarlyMiddleAge":{"population":748,"happiness":1340,"demandHappiness":748,"money_24h":3100,"supplies_24h":1440,"random_good_of_age_24h":3,"strategy_points_24h":2},"HighMiddleAge":{"population":1050,"happiness":1490,"demandHappiness":1050,"money_24h":4400,"supplies_24h":1610,"random_good_of_age_24h":3,"strategy_points_24h":2},"LateMiddleAge":{"population":1378,"happiness":1670,"demandHappiness":1378,"money_24h":5800,"supplies_24h":1790,"random_good_of_age_24h":3,"strategy_points_24h":2},"ColonialAge":{"population":1739,"happiness":1960,"demandHappiness":1739,"money_24h":8800,"supplies_24h":2110,"random_good_of_age_24h":3,"strategy_points_24h":2},"IndustrialAge":{"population":2125,"happiness":2210,"demandHappiness":2125,"money_24h":11000,"supplies_24h":2380,"random_good_of_age_24h":3,"strategy_points_24h":2},"ProgressiveEra":{"population":2537,"happiness":2430,"demandHappiness":2537,"money_24h":13300,"supplies_24h":2610,"random_good_of_age_24h":3,"strategy_points_24h":2},"ModernEra":{"population":2974,"happiness":2600,"demandHappiness":2974,"money_24h":16500,"supplies_24h":2800,"random_good_of_age_24h":3,"strategy_points_24h":2},"PostModernEra":{"population":3427,"happiness":2700,"demandHappiness":3427,"money_24h":20800,"supplies_24h":2910,"random_good_of_age_24h":3,"strategy_points_24h":2},"ContemporaryEra":{"population":3906,"happiness":3140,"demandHappiness":3906,"money_24h":27100,"supplies_24h":3390,"random_good_of_age_24h":3,"strategy_points_24h":2},"TomorrowEra":{"population":4402,"happiness":3820,"demandHappiness":4402,"money_24h":31400,"supplies_24h":4110,"random_good_of_age_24h":3,"strategy_points_24h":2},"FutureEra":{"population":4922,"happiness":4570,"demandHappiness":4922,"money_24h":35900,"supplies_24h":4920,"random_good_of_age_24h":3,"strategy_points_24h":2},"ArcticFuture":{"population":5460,"happiness":5320,"demandHappiness":5460,"money_24h":40800,"supplies_24h":5730,"random_good_of_age_24h":3,"strategy_points_24h":2},"OceanicFuture":{"population":6014,"happiness":6140,"demandHappiness":6014,"money_24h":46100,"supplies_24h":6620,"random_good_of_age_24h":3,"strategy_points_24h":2},"VirtualFuture":{"population":6586,"happiness":7340,"demandHappiness":6586,"money_24h":51600,"supplies_24h":7900,"random_good_of_age_24h":3,"strategy_points_24h":2},"SpaceAgeMars":{"population":10424,"happiness":11740,"demandHappiness":10424,"money_24h":86200,"supplies_24h":12650,"random_good_of_age_24h":3,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"population":11323,"happiness":12760,"demandHappiness":11323,"money_24h":95400,"supplies_24h":13740,"random_good_of_age_24h":3,"strategy_points_24h":2},"SpaceAgeVenus":{"population":12239,"happiness":13790,"demandHappiness":12239,"money_24h":105200,"supplies_24h":14850,"random_good_of_age_24h":3,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"population":13180,"happiness":14850,"demandHappiness":13180,"money_24h":115500,"supplies_24h":15990,"random_good_of_age_24h":3,"strategy_points_24h":2},"SpaceAgeTitan":{"population":14137,"happiness":15930,"demandHappiness":14137,"money_24h":126200,"supplies_24h":17150,"random_good_of_age_24h":3,"strategy_points_24h":2},"SpaceAgeSpaceHub":{"population":15094,"happiness":17010,"demandHappiness":15094,"money_24h":136900,"supplies_24h":18310,"random_good_of_age_24h":3,"strategy_points_24h":2}} },
+    "W_MultiAge_FALL22A6": { prod: {"BronzeAge":{"population":235,"happiness":730,"demandHappiness":235,"money_24h":800,"supplies_24h":810,"random_good_of_age_24h":6,"strategy_points_24h":3},"IronAge":{"population":505,"happiness":1260,"demandHappiness":505,"money_24h":1900,"supplies_24h":1400,"random_good_of_age_24h":6,"strategy_points_24h":3},"EarlyMiddleAge":{"population":774,"happiness":1390,"demandHappiness":774,"money_24h":3200,"supplies_24h":1550,"random_good_of_age_24h":6,"strategy_points_24h":3},"HighMiddleAge":{"population":1088,"happiness":1550,"demandHappiness":1088,"money_24h":4500,"supplies_24h":1720,"random_good_of_age_24h":6,"strategy_points_24h":3},"LateMiddleAge":{"population":1427,"happiness":1730,"demandHappiness":1427,"money_24h":6000,"supplies_24h":1920,"random_good_of_age_24h":6,"strategy_points_24h":3},"ColonialAge":{"population":1801,"happiness":2030,"demandHappiness":1801,"money_24h":9100,"supplies_24h":2260,"random_good_of_age_24h":6,"strategy_points_24h":3},"IndustrialAge":{"population":2201,"happiness":2290,"demandHappiness":2201,"money_24h":11400,"supplies_24h":2550,"random_good_of_age_24h":6,"strategy_points_24h":3},"ProgressiveEra":{"population":2627,"happiness":2520,"demandHappiness":2627,"money_24h":13800,"supplies_24h":2800,"random_good_of_age_24h":6,"strategy_points_24h":3},"ModernEra":{"population":3080,"happiness":2700,"demandHappiness":3080,"money_24h":17200,"supplies_24h":3000,"random_good_of_age_24h":6,"strategy_points_24h":3},"PostModernEra":{"population":3550,"happiness":2810,"demandHappiness":3550,"money_24h":21600,"supplies_24h":3120,"random_good_of_age_24h":6,"strategy_points_24h":3},"ContemporaryEra":{"population":4046,"happiness":3260,"demandHappiness":4046,"money_24h":28100,"supplies_24h":3630,"random_good_of_age_24h":6,"strategy_points_24h":3},"TomorrowEra":{"population":4559,"happiness":3960,"demandHappiness":4559,"money_24h":32600,"supplies_24h":4400,"random_good_of_age_24h":6,"strategy_points_24h":3},"FutureEra":{"population":5098,"happiness":4750,"demandHappiness":5098,"money_24h":37300,"supplies_24h":5270,"random_good_of_age_24h":6,"strategy_points_24h":3},"ArcticFuture":{"population":5655,"happiness":5530,"demandHappiness":5655,"money_24h":42400,"supplies_24h":6140,"random_good_of_age_24h":6,"strategy_points_24h":3},"OceanicFuture":{"population":6229,"happiness":6380,"demandHappiness":6229,"money_24h":47800,"supplies_24h":7090,"random_good_of_age_24h":6,"strategy_points_24h":3},"VirtualFuture":{"population":6821,"happiness":7620,"demandHappiness":6821,"money_24h":53600,"supplies_24h":8470,"random_good_of_age_24h":6,"strategy_points_24h":3},"SpaceAgeMars":{"population":10797,"happiness":12190,"demandHappiness":10797,"money_24h":89500,"supplies_24h":13550,"random_good_of_age_24h":6,"strategy_points_24h":3},"SpaceAgeAsteroidBelt":{"population":11728,"happiness":13250,"demandHappiness":11728,"money_24h":99100,"supplies_24h":14720,"random_good_of_age_24h":6,"strategy_points_24h":3},"SpaceAgeVenus":{"population":12676,"happiness":14320,"demandHappiness":12676,"money_24h":109200,"supplies_24h":15910,"random_good_of_age_24h":6,"strategy_points_24h":3},"SpaceAgeJupiterMoon":{"population":13650,"happiness":15420,"demandHappiness":13650,"money_24h":119900,"supplies_24h":17140,"random_good_of_age_24h":6,"strategy_points_24h":3},"SpaceAgeTitan":{"population":14642,"happiness":16540,"demandHappiness":14642,"money_24h":131100,"supplies_24h":18380,"random_good_of_age_24h":6,"strategy_points_24h":3},"SpaceAgeSpaceHub":{"population":15634,"happiness":17660,"demandHappiness":15634,"money_24h":142300,"supplies_24h":19620,"random_good_of_age_24h":6,"strategy_points_24h":3}} },
+    "W_MultiAge_FALL22A7": { prod: {"BronzeAge":{"population":243,"happiness":760,"demandHappiness":243,"money_24h":800,"supplies_24h":870,"random_good_of_age_24h":12,"strategy_points_24h":4},"IronAge":{"population":522,"happiness":1300,"demandHappiness":522,"money_24h":2000,"supplies_24h":1490,"random_good_of_age_24h":12,"strategy_points_24h":4},"EarlyMiddleAge":{"population":801,"happiness":1440,"demandHappiness":801,"money_24h":3400,"supplies_24h":1650,"random_good_of_age_24h":12,"strategy_points_24h":4},"HighMiddleAge":{"population":1125,"happiness":1610,"demandHappiness":1125,"money_24h":4700,"supplies_24h":1840,"random_good_of_age_24h":12,"strategy_points_24h":4},"LateMiddleAge":{"population":1476,"happiness":1790,"demandHappiness":1476,"money_24h":6200,"supplies_24h":2050,"random_good_of_age_24h":12,"strategy_points_24h":4},"ColonialAge":{"population":1863,"happiness":2110,"demandHappiness":1863,"money_24h":9500,"supplies_24h":2410,"random_good_of_age_24h":12,"strategy_points_24h":4},"IndustrialAge":{"population":2277,"happiness":2380,"demandHappiness":2277,"money_24h":11800,"supplies_24h":2720,"random_good_of_age_24h":12,"strategy_points_24h":4},"ProgressiveEra":{"population":2718,"happiness":2610,"demandHappiness":2718,"money_24h":14300,"supplies_24h":2990,"random_good_of_age_24h":12,"strategy_points_24h":4},"ModernEra":{"population":3186,"happiness":2800,"demandHappiness":3186,"money_24h":17800,"supplies_24h":3200,"random_good_of_age_24h":12,"strategy_points_24h":4},"PostModernEra":{"population":3672,"happiness":2910,"demandHappiness":3672,"money_24h":22400,"supplies_24h":3330,"random_good_of_age_24h":12,"strategy_points_24h":4},"ContemporaryEra":{"population":4185,"happiness":3390,"demandHappiness":4185,"money_24h":29200,"supplies_24h":3870,"random_good_of_age_24h":12,"strategy_points_24h":4},"TomorrowEra":{"population":4716,"happiness":4110,"demandHappiness":4716,"money_24h":33800,"supplies_24h":4700,"random_good_of_age_24h":12,"strategy_points_24h":4},"FutureEra":{"population":5274,"happiness":4920,"demandHappiness":5274,"money_24h":38700,"supplies_24h":5630,"random_good_of_age_24h":12,"strategy_points_24h":4},"ArcticFuture":{"population":5850,"happiness":5730,"demandHappiness":5850,"money_24h":44000,"supplies_24h":6550,"random_good_of_age_24h":12,"strategy_points_24h":4},"OceanicFuture":{"population":6444,"happiness":6620,"demandHappiness":6444,"money_24h":49600,"supplies_24h":7560,"random_good_of_age_24h":12,"strategy_points_24h":4},"VirtualFuture":{"population":7056,"happiness":7900,"demandHappiness":7056,"money_24h":55600,"supplies_24h":9030,"random_good_of_age_24h":12,"strategy_points_24h":4},"SpaceAgeMars":{"population":11169,"happiness":12650,"demandHappiness":11169,"money_24h":92800,"supplies_24h":14450,"random_good_of_age_24h":12,"strategy_points_24h":4},"SpaceAgeAsteroidBelt":{"population":12132,"happiness":13740,"demandHappiness":12132,"money_24h":102800,"supplies_24h":15710,"random_good_of_age_24h":12,"strategy_points_24h":4},"SpaceAgeVenus":{"population":13113,"happiness":14850,"demandHappiness":13113,"money_24h":113300,"supplies_24h":16970,"random_good_of_age_24h":12,"strategy_points_24h":4},"SpaceAgeJupiterMoon":{"population":14121,"happiness":15990,"demandHappiness":14121,"money_24h":124400,"supplies_24h":18280,"random_good_of_age_24h":12,"strategy_points_24h":4},"SpaceAgeTitan":{"population":15147,"happiness":17150,"demandHappiness":15147,"money_24h":136000,"supplies_24h":19600,"random_good_of_age_24h":12,"strategy_points_24h":4},"SpaceAgeSpaceHub":{"population":16173,"happiness":18310,"demandHappiness":16173,"money_24h":147600,"supplies_24h":20920,"random_good_of_age_24h":12,"strategy_points_24h":4}} },
+    "W_MultiAge_FALL22A8": { prod: {"BronzeAge":{"population":259,"happiness":810,"demandHappiness":259,"money_24h":900,"supplies_24h":970,"random_good_of_age_24h":12,"strategy_points_24h":8},"IronAge":{"population":557,"happiness":1400,"demandHappiness":557,"money_24h":2200,"supplies_24h":1680,"random_good_of_age_24h":12,"strategy_points_24h":8},"EarlyMiddleAge":{"population":854,"happiness":1550,"demandHappiness":854,"money_24h":3600,"supplies_24h":1850,"random_good_of_age_24h":12,"strategy_points_24h":8},"HighMiddleAge":{"population":1200,"happiness":1720,"demandHappiness":1200,"money_24h":5000,"supplies_24h":2070,"random_good_of_age_24h":12,"strategy_points_24h":8},"LateMiddleAge":{"population":1574,"happiness":1920,"demandHappiness":1574,"money_24h":6700,"supplies_24h":2310,"random_good_of_age_24h":12,"strategy_points_24h":8},"ColonialAge":{"population":1987,"happiness":2260,"demandHappiness":1987,"money_24h":10100,"supplies_24h":2710,"random_good_of_age_24h":12,"strategy_points_24h":8},"IndustrialAge":{"population":2429,"happiness":2550,"demandHappiness":2429,"money_24h":12600,"supplies_24h":3060,"random_good_of_age_24h":12,"strategy_points_24h":8},"ProgressiveEra":{"population":2899,"happiness":2800,"demandHappiness":2899,"money_24h":15300,"supplies_24h":3360,"random_good_of_age_24h":12,"strategy_points_24h":8},"ModernEra":{"population":3398,"happiness":3000,"demandHappiness":3398,"money_24h":19100,"supplies_24h":3590,"random_good_of_age_24h":12,"strategy_points_24h":8},"PostModernEra":{"population":3917,"happiness":3120,"demandHappiness":3917,"money_24h":24000,"supplies_24h":3750,"random_good_of_age_24h":12,"strategy_points_24h":8},"ContemporaryEra":{"population":4464,"happiness":3630,"demandHappiness":4464,"money_24h":31300,"supplies_24h":4350,"random_good_of_age_24h":12,"strategy_points_24h":8},"TomorrowEra":{"population":5030,"happiness":4400,"demandHappiness":5030,"money_24h":36200,"supplies_24h":5280,"random_good_of_age_24h":12,"strategy_points_24h":8},"FutureEra":{"population":5626,"happiness":5270,"demandHappiness":5626,"money_24h":41500,"supplies_24h":6330,"random_good_of_age_24h":12,"strategy_points_24h":8},"ArcticFuture":{"population":6240,"happiness":6140,"demandHappiness":6240,"money_24h":47100,"supplies_24h":7370,"random_good_of_age_24h":12,"strategy_points_24h":8},"OceanicFuture":{"population":6874,"happiness":7090,"demandHappiness":6874,"money_24h":53100,"supplies_24h":8510,"random_good_of_age_24h":12,"strategy_points_24h":8},"VirtualFuture":{"population":7526,"happiness":8470,"demandHappiness":7526,"money_24h":59500,"supplies_24h":10160,"random_good_of_age_24h":12,"strategy_points_24h":8},"SpaceAgeMars":{"population":11914,"happiness":13550,"demandHappiness":11914,"money_24h":99400,"supplies_24h":16260,"random_good_of_age_24h":12,"strategy_points_24h":8},"SpaceAgeAsteroidBelt":{"population":12941,"happiness":14720,"demandHappiness":12941,"money_24h":110100,"supplies_24h":17670,"random_good_of_age_24h":12,"strategy_points_24h":8},"SpaceAgeVenus":{"population":13987,"happiness":15910,"demandHappiness":13987,"money_24h":121400,"supplies_24h":19090,"random_good_of_age_24h":12,"strategy_points_24h":8},"SpaceAgeJupiterMoon":{"population":15062,"happiness":17140,"demandHappiness":15062,"money_24h":133200,"supplies_24h":20560,"random_good_of_age_24h":12,"strategy_points_24h":8},"SpaceAgeTitan":{"population":16157,"happiness":18380,"demandHappiness":16157,"money_24h":145700,"supplies_24h":22050,"random_good_of_age_24h":12,"strategy_points_24h":8},"SpaceAgeSpaceHub":{"population":17252,"happiness":19620,"demandHappiness":17252,"money_24h":158200,"supplies_24h":23540,"random_good_of_age_24h":12,"strategy_points_24h":8}} },
+    "W_MultiAge_FALL22A9": { prod: {"BronzeAge":{"population":324,"happiness":1080,"demandHappiness":324,"money_24h":1200,"supplies_24h":1620,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"IronAge":{"population":696,"happiness":1860,"demandHappiness":696,"money_24h":2900,"supplies_24h":2790,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"EarlyMiddleAge":{"population":1068,"happiness":2060,"demandHappiness":1068,"money_24h":4800,"supplies_24h":3090,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"HighMiddleAge":{"population":1500,"happiness":2300,"demandHappiness":1500,"money_24h":6700,"supplies_24h":3450,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"LateMiddleAge":{"population":1968,"happiness":2560,"demandHappiness":1968,"money_24h":8900,"supplies_24h":3850,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"ColonialAge":{"population":2484,"happiness":3010,"demandHappiness":2484,"money_24h":13500,"supplies_24h":4520,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"IndustrialAge":{"population":3036,"happiness":3400,"demandHappiness":3036,"money_24h":16900,"supplies_24h":5100,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"ProgressiveEra":{"population":3624,"happiness":3730,"demandHappiness":3624,"money_24h":20500,"supplies_24h":5600,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"ModernEra":{"population":4248,"happiness":3990,"demandHappiness":4248,"money_24h":25400,"supplies_24h":5990,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"PostModernEra":{"population":4896,"happiness":4160,"demandHappiness":4896,"money_24h":32000,"supplies_24h":6240,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"ContemporaryEra":{"population":5580,"happiness":4840,"demandHappiness":5580,"money_24h":41700,"supplies_24h":7250,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"TomorrowEra":{"population":6288,"happiness":5870,"demandHappiness":6288,"money_24h":48200,"supplies_24h":8810,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"FutureEra":{"population":7032,"happiness":7030,"demandHappiness":7032,"money_24h":55300,"supplies_24h":10550,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"ArcticFuture":{"population":7800,"happiness":8190,"demandHappiness":7800,"money_24h":62800,"supplies_24h":12280,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"OceanicFuture":{"population":8592,"happiness":9450,"demandHappiness":8592,"money_24h":70900,"supplies_24h":14180,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"VirtualFuture":{"population":9408,"happiness":11290,"demandHappiness":9408,"money_24h":79400,"supplies_24h":16940,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"SpaceAgeMars":{"population":14892,"happiness":18070,"demandHappiness":14892,"money_24h":132600,"supplies_24h":27100,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"SpaceAgeAsteroidBelt":{"population":16176,"happiness":19630,"demandHappiness":16176,"money_24h":146800,"supplies_24h":29450,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"SpaceAgeVenus":{"population":17484,"happiness":21210,"demandHappiness":17484,"money_24h":161800,"supplies_24h":31820,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"SpaceAgeJupiterMoon":{"population":18828,"happiness":22850,"demandHappiness":18828,"money_24h":177600,"supplies_24h":34270,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"SpaceAgeTitan":{"population":20196,"happiness":24500,"demandHappiness":20196,"money_24h":194200,"supplies_24h":36760,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3},"SpaceAgeSpaceHub":{"population":21564,"happiness":26150,"demandHappiness":21564,"money_24h":210800,"supplies_24h":39250,"random_good_of_age_24h":27,"strategy_points_24h":12,"units_24h":3}} },
+    "W_MultiAge_FALL16A9": { prod: {"BronzeAge":{"population":-20},"IronAge":{"population":-50},"EarlyMiddleAge":{"population":-70},"HighMiddleAge":{"population":-100},"LateMiddleAge":{"population":-130},"ColonialAge":{"population":-170},"IndustrialAge":{"population":-200},"ProgressiveEra":{"population":-240},"ModernEra":{"population":-290},"PostModernEra":{"population":-330},"ContemporaryEra":{"population":-380},"TomorrowEra":{"population":-420},"FutureEra":{"population":-470},"ArcticFuture":{"population":-530},"OceanicFuture":{"population":-580},"VirtualFuture":{"population":-640},"SpaceAgeMars":{"population":-1010},"SpaceAgeAsteroidBelt":{"population":-1090},"SpaceAgeVenus":{"population":-1180},"SpaceAgeJupiterMoon":{"population":-1270},"SpaceAgeTitan":{"population":-1360},"SpaceAgeSpaceHub":{"population":-1460}}, boosts: [{"type":"att_def_boost_defender","value":33,"feature":"guild_expedition"}] },
+    "W_MultiAge_FALL23A12": { prod: {"BronzeAge":{"population":348,"happiness":2220,"demandHappiness":348,"supplies_24h":2880,"money_24h":2160,"strategy_points_24h":30,"all_goods_of_age_24h":120,"units_24h":10},"IronAge":{"population":747,"happiness":3816,"demandHappiness":747,"supplies_24h":6840,"money_24h":5280,"strategy_points_24h":30,"all_goods_of_age_24h":120,"units_24h":10},"EarlyMiddleAge":{"population":1145,"happiness":4224,"demandHappiness":1145,"supplies_24h":11400,"money_24h":8880,"strategy_points_24h":31,"all_goods_of_age_24h":120,"units_24h":10},"HighMiddleAge":{"population":1607,"happiness":4716,"demandHappiness":1607,"supplies_24h":15840,"money_24h":12360,"strategy_points_24h":31,"all_goods_of_age_24h":120,"units_24h":10},"LateMiddleAge":{"population":2109,"happiness":5256,"demandHappiness":2109,"supplies_24h":21000,"money_24h":16320,"strategy_points_24h":32,"all_goods_of_age_24h":120,"units_24h":10},"ColonialAge":{"population":2661,"happiness":6180,"demandHappiness":2661,"supplies_24h":26640,"money_24h":24840,"strategy_points_24h":32,"all_goods_of_age_24h":120,"units_24h":10},"IndustrialAge":{"population":3252,"happiness":6972,"demandHappiness":3252,"supplies_24h":32280,"money_24h":30960,"strategy_points_24h":33,"all_goods_of_age_24h":120,"units_24h":10},"ProgressiveEra":{"population":3882,"happiness":7644,"demandHappiness":3882,"supplies_24h":38040,"money_24h":37560,"strategy_points_24h":33,"all_goods_of_age_24h":120,"units_24h":10},"ModernEra":{"population":4551,"happiness":8184,"demandHappiness":4551,"supplies_24h":44280,"money_24h":46800,"strategy_points_24h":34,"all_goods_of_age_24h":120,"units_24h":10},"PostModernEra":{"population":5244,"happiness":8532,"demandHappiness":5244,"supplies_24h":50520,"money_24h":58800,"strategy_points_24h":34,"all_goods_of_age_24h":120,"units_24h":10},"ContemporaryEra":{"population":5978,"happiness":9912,"demandHappiness":5978,"supplies_24h":56760,"money_24h":76560,"strategy_points_24h":35,"all_goods_of_age_24h":120,"units_24h":10},"TomorrowEra":{"population":6736,"happiness":12024,"demandHappiness":6736,"supplies_24h":63480,"money_24h":88680,"strategy_points_24h":35,"all_goods_of_age_24h":120,"units_24h":10},"FutureEra":{"population":7533,"happiness":14400,"demandHappiness":7533,"supplies_24h":69720,"money_24h":101640,"strategy_points_24h":36,"all_goods_of_age_24h":120,"units_24h":10},"ArcticFuture":{"population":8355,"happiness":16776,"demandHappiness":8355,"supplies_24h":76560,"money_24h":115440,"strategy_points_24h":36,"all_goods_of_age_24h":120,"units_24h":10},"OceanicFuture":{"population":9203,"happiness":19356,"demandHappiness":9203,"supplies_24h":83880,"money_24h":130200,"strategy_points_24h":37,"all_goods_of_age_24h":120,"units_24h":10},"VirtualFuture":{"population":10077,"happiness":23124,"demandHappiness":10077,"supplies_24h":90720,"money_24h":145800,"strategy_points_24h":37,"all_goods_of_age_24h":120,"units_24h":10},"SpaceAgeMars":{"population":15951,"happiness":36996,"demandHappiness":15951,"supplies_24h":146880,"money_24h":243600,"strategy_points_24h":38,"all_goods_of_age_24h":120,"units_24h":10},"SpaceAgeAsteroidBelt":{"population":17326,"happiness":40200,"demandHappiness":17326,"supplies_24h":157680,"money_24h":269760,"strategy_points_24h":38,"all_goods_of_age_24h":120,"units_24h":10},"SpaceAgeVenus":{"population":18726,"happiness":43428,"demandHappiness":18726,"supplies_24h":168960,"money_24h":297360,"strategy_points_24h":39,"all_goods_of_age_24h":120,"units_24h":10},"SpaceAgeJupiterMoon":{"population":20165,"happiness":46788,"demandHappiness":20165,"supplies_24h":179760,"money_24h":326400,"strategy_points_24h":39,"all_goods_of_age_24h":120,"units_24h":10},"SpaceAgeTitan":{"population":21630,"happiness":50172,"demandHappiness":21630,"supplies_24h":191040,"money_24h":356880,"strategy_points_24h":40,"all_goods_of_age_24h":120,"units_24h":10},"SpaceAgeSpaceHub":{"population":23095,"happiness":53556,"demandHappiness":23095,"supplies_24h":202320,"money_24h":387360,"strategy_points_24h":40,"all_goods_of_age_24h":120,"units_24h":10}}, boosts: [{"type":"att_boost_attacker","value":50,"feature":"all"},{"type":"att_boost_defender","value":50,"feature":"all"}] },
+    "W_MultiAge_FALL16A7": { prod: {"BronzeAge":{"population":-20},"IronAge":{"population":-40},"EarlyMiddleAge":{"population":-70},"HighMiddleAge":{"population":-90},"LateMiddleAge":{"population":-120},"ColonialAge":{"population":-150},"IndustrialAge":{"population":-190},"ProgressiveEra":{"population":-220},"ModernEra":{"population":-260},"PostModernEra":{"population":-300},"ContemporaryEra":{"population":-340},"TomorrowEra":{"population":-390},"FutureEra":{"population":-430},"ArcticFuture":{"population":-480},"OceanicFuture":{"population":-530},"VirtualFuture":{"population":-580},"SpaceAgeMars":{"population":-910},"SpaceAgeAsteroidBelt":{"population":-990},"SpaceAgeVenus":{"population":-1070},"SpaceAgeJupiterMoon":{"population":-1150},"SpaceAgeTitan":{"population":-1240},"SpaceAgeSpaceHub":{"population":-1320}} },
+    "W_MultiAge_FALL23A10": { prod: {"BronzeAge":{"population":267,"happiness":1710,"demandHappiness":267,"supplies_24h":2200,"money_24h":1700,"strategy_points_24h":19,"all_goods_of_age_24h":80,"units_24h":6},"IronAge":{"population":573,"happiness":2940,"demandHappiness":573,"supplies_24h":5200,"money_24h":4200,"strategy_points_24h":19,"all_goods_of_age_24h":80,"units_24h":6},"EarlyMiddleAge":{"population":879,"happiness":3250,"demandHappiness":879,"supplies_24h":8600,"money_24h":6900,"strategy_points_24h":19,"all_goods_of_age_24h":80,"units_24h":6},"HighMiddleAge":{"population":1234,"happiness":3630,"demandHappiness":1234,"supplies_24h":12100,"money_24h":9700,"strategy_points_24h":19,"all_goods_of_age_24h":80,"units_24h":6},"LateMiddleAge":{"population":1619,"happiness":4040,"demandHappiness":1619,"supplies_24h":15900,"money_24h":12800,"strategy_points_24h":19,"all_goods_of_age_24h":80,"units_24h":6},"ColonialAge":{"population":2044,"happiness":4750,"demandHappiness":2044,"supplies_24h":20200,"money_24h":19500,"strategy_points_24h":20,"all_goods_of_age_24h":80,"units_24h":6},"IndustrialAge":{"population":2498,"happiness":5360,"demandHappiness":2498,"supplies_24h":24500,"money_24h":24300,"strategy_points_24h":20,"all_goods_of_age_24h":80,"units_24h":6},"ProgressiveEra":{"population":2981,"happiness":5880,"demandHappiness":2981,"supplies_24h":28800,"money_24h":29500,"strategy_points_24h":20,"all_goods_of_age_24h":80,"units_24h":6},"ModernEra":{"population":3494,"happiness":6300,"demandHappiness":3494,"supplies_24h":33600,"money_24h":36700,"strategy_points_24h":20,"all_goods_of_age_24h":80,"units_24h":6},"PostModernEra":{"population":4027,"happiness":6560,"demandHappiness":4027,"supplies_24h":38300,"money_24h":46200,"strategy_points_24h":20,"all_goods_of_age_24h":80,"units_24h":6},"ContemporaryEra":{"population":4590,"happiness":7620,"demandHappiness":4590,"supplies_24h":43100,"money_24h":60200,"strategy_points_24h":21,"all_goods_of_age_24h":80,"units_24h":6},"TomorrowEra":{"population":5172,"happiness":9250,"demandHappiness":5172,"supplies_24h":48200,"money_24h":69700,"strategy_points_24h":21,"all_goods_of_age_24h":80,"units_24h":6},"FutureEra":{"population":5784,"happiness":11080,"demandHappiness":5784,"supplies_24h":53000,"money_24h":79800,"strategy_points_24h":21,"all_goods_of_age_24h":80,"units_24h":6},"ArcticFuture":{"population":6416,"happiness":12900,"demandHappiness":6416,"supplies_24h":58100,"money_24h":90700,"strategy_points_24h":21,"all_goods_of_age_24h":80,"units_24h":6},"OceanicFuture":{"population":7067,"happiness":14890,"demandHappiness":7067,"supplies_24h":63700,"money_24h":102300,"strategy_points_24h":21,"all_goods_of_age_24h":80,"units_24h":6},"VirtualFuture":{"population":7739,"happiness":17790,"demandHappiness":7739,"supplies_24h":68900,"money_24h":114600,"strategy_points_24h":22,"all_goods_of_age_24h":80,"units_24h":6},"SpaceAgeMars":{"population":12249,"happiness":28460,"demandHappiness":12249,"supplies_24h":111500,"money_24h":191400,"strategy_points_24h":22,"all_goods_of_age_24h":80,"units_24h":6},"SpaceAgeAsteroidBelt":{"population":13305,"happiness":30930,"demandHappiness":13305,"supplies_24h":119700,"money_24h":212000,"strategy_points_24h":22,"all_goods_of_age_24h":80,"units_24h":6},"SpaceAgeVenus":{"population":14381,"happiness":33410,"demandHappiness":14381,"supplies_24h":128300,"money_24h":233700,"strategy_points_24h":22,"all_goods_of_age_24h":80,"units_24h":6},"SpaceAgeJupiterMoon":{"population":15487,"happiness":35990,"demandHappiness":15487,"supplies_24h":136500,"money_24h":256500,"strategy_points_24h":22,"all_goods_of_age_24h":80,"units_24h":6},"SpaceAgeTitan":{"population":16612,"happiness":38600,"demandHappiness":16612,"supplies_24h":145100,"money_24h":280400,"strategy_points_24h":23,"all_goods_of_age_24h":80,"units_24h":6},"SpaceAgeSpaceHub":{"population":17737,"happiness":41210,"demandHappiness":17737,"supplies_24h":153700,"money_24h":304300,"strategy_points_24h":23,"all_goods_of_age_24h":80,"units_24h":6}}, boosts: [{"type":"att_boost_attacker","value":32,"feature":"all"},{"type":"att_boost_defender","value":33,"feature":"all"}] },
+    "W_MultiAge_FallBonus22donkey": { prod: {"BronzeAge":{"all_goods_of_age_24h":5,"random_good_of_age_24h":2,"units_24h":1},"IronAge":{"all_goods_of_age_24h":5,"random_good_of_age_24h":2,"units_24h":1},"EarlyMiddleAge":{"all_goods_of_age_24h":5,"random_good_of_age_24h":2,"units_24h":1},"HighMiddleAge":{"all_goods_of_age_24h":5,"random_good_of_age_24h":2,"units_24h":1},"LateMiddleAge":{"all_goods_of_age_24h":5,"random_good_of_age_24h":3,"units_24h":1},"ColonialAge":{"all_goods_of_age_24h":10,"random_good_of_age_24h":3,"units_24h":1},"IndustrialAge":{"all_goods_of_age_24h":10,"random_good_of_age_24h":3,"units_24h":1},"ProgressiveEra":{"all_goods_of_age_24h":10,"random_good_of_age_24h":3,"units_24h":1},"ModernEra":{"all_goods_of_age_24h":10,"random_good_of_age_24h":4,"units_24h":1},"PostModernEra":{"all_goods_of_age_24h":10,"random_good_of_age_24h":4,"units_24h":1},"ContemporaryEra":{"all_goods_of_age_24h":15,"random_good_of_age_24h":4,"units_24h":1},"TomorrowEra":{"all_goods_of_age_24h":15,"random_good_of_age_24h":4,"units_24h":1},"FutureEra":{"all_goods_of_age_24h":15,"random_good_of_age_24h":5,"units_24h":1},"ArcticFuture":{"all_goods_of_age_24h":15,"random_good_of_age_24h":5,"units_24h":1},"OceanicFuture":{"all_goods_of_age_24h":15,"random_good_of_age_24h":5,"units_24h":1},"VirtualFuture":{"all_goods_of_age_24h":20,"random_good_of_age_24h":5,"units_24h":1},"SpaceAgeMars":{"all_goods_of_age_24h":20,"random_good_of_age_24h":6,"units_24h":1},"SpaceAgeAsteroidBelt":{"all_goods_of_age_24h":20,"random_good_of_age_24h":6,"units_24h":1},"SpaceAgeVenus":{"all_goods_of_age_24h":20,"random_good_of_age_24h":6,"units_24h":1},"SpaceAgeJupiterMoon":{"all_goods_of_age_24h":20,"random_good_of_age_24h":6,"units_24h":1},"SpaceAgeTitan":{"all_goods_of_age_24h":25,"random_good_of_age_24h":7,"units_24h":1},"SpaceAgeSpaceHub":{"all_goods_of_age_24h":25,"random_good_of_age_24h":7,"units_24h":1}}, boosts: [{"type":"def_boost_attacker","value":6,"feature":"all"},{"type":"def_boost_defender","value":6,"feature":"all"}] },
+    "W_MultiAge_FALL24D1": { prod: {"BronzeAge":{"population":640,"happiness":3680,"demandHappiness":640,"supplies_24h":2450,"random_good_of_age_24h":100,"units_24h":5},"IronAge":{"population":1380,"happiness":6340,"demandHappiness":1380,"supplies_24h":5880,"random_good_of_age_24h":100,"units_24h":5},"EarlyMiddleAge":{"population":2120,"happiness":7010,"demandHappiness":2120,"supplies_24h":9790,"random_good_of_age_24h":100,"units_24h":5},"HighMiddleAge":{"population":2970,"happiness":7830,"demandHappiness":2970,"supplies_24h":13710,"random_good_of_age_24h":100,"units_24h":5},"LateMiddleAge":{"population":3900,"happiness":8730,"demandHappiness":3900,"supplies_24h":18120,"random_good_of_age_24h":100,"units_24h":5},"ColonialAge":{"population":4920,"happiness":10260,"demandHappiness":4920,"supplies_24h":23010,"random_good_of_age_24h":100,"units_24h":5},"IndustrialAge":{"population":6010,"happiness":11570,"demandHappiness":6010,"supplies_24h":27910,"random_good_of_age_24h":100,"units_24h":5},"ProgressiveEra":{"population":7180,"happiness":12710,"demandHappiness":7180,"supplies_24h":32800,"random_good_of_age_24h":100,"units_24h":5},"ModernEra":{"population":8410,"happiness":13600,"demandHappiness":8410,"supplies_24h":38190,"random_good_of_age_24h":100,"units_24h":5},"PostModernEra":{"population":9700,"happiness":14170,"demandHappiness":9700,"supplies_24h":43580,"random_good_of_age_24h":100,"units_24h":5},"ContemporaryEra":{"population":11050,"happiness":16460,"demandHappiness":11050,"supplies_24h":48960,"random_good_of_age_24h":100,"units_24h":5},"TomorrowEra":{"population":12450,"happiness":19980,"demandHappiness":12450,"supplies_24h":54840,"random_good_of_age_24h":100,"units_24h":5},"FutureEra":{"population":13930,"happiness":23940,"demandHappiness":13930,"supplies_24h":60220,"random_good_of_age_24h":100,"units_24h":5},"ArcticFuture":{"population":15450,"happiness":27880,"demandHappiness":15450,"supplies_24h":66100,"random_good_of_age_24h":100,"units_24h":5},"OceanicFuture":{"population":17020,"happiness":32170,"demandHappiness":17020,"supplies_24h":72460,"random_good_of_age_24h":100,"units_24h":5},"VirtualFuture":{"population":18630,"happiness":38440,"demandHappiness":18630,"supplies_24h":78340,"random_good_of_age_24h":100,"units_24h":5},"SpaceAgeMars":{"population":29490,"happiness":61500,"demandHappiness":29490,"supplies_24h":126810,"random_good_of_age_24h":100,"units_24h":5},"SpaceAgeAsteroidBelt":{"population":32040,"happiness":66840,"demandHappiness":32040,"supplies_24h":136110,"random_good_of_age_24h":100,"units_24h":5},"SpaceAgeVenus":{"population":34630,"happiness":72210,"demandHappiness":34630,"supplies_24h":145910,"random_good_of_age_24h":100,"units_24h":5},"SpaceAgeJupiterMoon":{"population":37290,"happiness":77780,"demandHappiness":37290,"supplies_24h":155210,"random_good_of_age_24h":100,"units_24h":5},"SpaceAgeTitan":{"population":40000,"happiness":83420,"demandHappiness":40000,"supplies_24h":165000,"random_good_of_age_24h":100,"units_24h":5},"SpaceAgeSpaceHub":{"population":42710,"happiness":89060,"demandHappiness":42710,"supplies_24h":174790,"random_good_of_age_24h":100,"units_24h":5}}, boosts: [{"type":"att_boost_attacker","value":110,"feature":"all"},{"type":"att_boost_attacker","value":25,"feature":"guild_raids"},{"type":"def_boost_attacker","value":115,"feature":"all"}] },
+    "W_MultiAge_FALL25A11": { prod: {"BronzeAge":{"happiness":4130,"medals_24h":820,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"IronAge":{"happiness":7120,"medals_24h":1050,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"EarlyMiddleAge":{"happiness":7880,"medals_24h":1290,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"HighMiddleAge":{"happiness":8790,"medals_24h":1520,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"LateMiddleAge":{"happiness":9800,"medals_24h":1760,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"ColonialAge":{"happiness":11520,"medals_24h":2110,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"IndustrialAge":{"happiness":13000,"medals_24h":2930,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"ProgressiveEra":{"happiness":14270,"medals_24h":4100,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"ModernEra":{"happiness":15270,"medals_24h":5860,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"PostModernEra":{"happiness":15910,"medals_24h":8200,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"ContemporaryEra":{"happiness":18490,"medals_24h":11720,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"TomorrowEra":{"happiness":22440,"medals_24h":15820,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"FutureEra":{"happiness":26890,"medals_24h":19340,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"ArcticFuture":{"happiness":31310,"medals_24h":23440,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"OceanicFuture":{"happiness":36130,"medals_24h":26950,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"VirtualFuture":{"happiness":43160,"medals_24h":32810,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"SpaceAgeMars":{"happiness":69060,"medals_24h":39840,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"SpaceAgeAsteroidBelt":{"happiness":75050,"medals_24h":46880,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"SpaceAgeVenus":{"happiness":81080,"medals_24h":53910,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"SpaceAgeJupiterMoon":{"happiness":87340,"medals_24h":60940,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"SpaceAgeTitan":{"happiness":93670,"medals_24h":67970,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0},"SpaceAgeSpaceHub":{"happiness":100000,"medals_24h":75000,"strategy_points_24h":270,"random_good_of_age_24h":250.0,"random_good_of_previous_age_24h":195.0,"random_good_of_next_age_24h":150.0}}, boosts: [{"type":"att_boost_attacker","value":403,"feature":"guild_expedition"},{"type":"def_boost_defender","value":498,"feature":"battleground"}] },
+    "W_MultiAge_FALL25A1": { prod: {"BronzeAge":{"happiness":210,"medals_24h":10,"strategy_points_24h":1},"IronAge":{"happiness":360,"medals_24h":10,"strategy_points_24h":1},"EarlyMiddleAge":{"happiness":390,"medals_24h":10,"strategy_points_24h":1},"HighMiddleAge":{"happiness":440,"medals_24h":10,"strategy_points_24h":1},"LateMiddleAge":{"happiness":490,"medals_24h":10,"strategy_points_24h":1},"ColonialAge":{"happiness":580,"medals_24h":10,"strategy_points_24h":1},"IndustrialAge":{"happiness":650,"medals_24h":20,"strategy_points_24h":1},"ProgressiveEra":{"happiness":710,"medals_24h":30,"strategy_points_24h":1},"ModernEra":{"happiness":760,"medals_24h":40,"strategy_points_24h":1},"PostModernEra":{"happiness":800,"medals_24h":50,"strategy_points_24h":1},"ContemporaryEra":{"happiness":920,"medals_24h":80,"strategy_points_24h":1},"TomorrowEra":{"happiness":1120,"medals_24h":110,"strategy_points_24h":1},"FutureEra":{"happiness":1340,"medals_24h":130,"strategy_points_24h":1},"ArcticFuture":{"happiness":1570,"medals_24h":160,"strategy_points_24h":1},"OceanicFuture":{"happiness":1810,"medals_24h":180,"strategy_points_24h":1},"VirtualFuture":{"happiness":2160,"medals_24h":220,"strategy_points_24h":1},"SpaceAgeMars":{"happiness":3450,"medals_24h":270,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"happiness":3750,"medals_24h":310,"strategy_points_24h":1},"SpaceAgeVenus":{"happiness":4050,"medals_24h":360,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"happiness":4370,"medals_24h":410,"strategy_points_24h":3},"SpaceAgeTitan":{"happiness":4680,"medals_24h":450,"strategy_points_24h":4},"SpaceAgeSpaceHub":{"happiness":5000,"medals_24h":500,"strategy_points_24h":5}} },
+    "W_MultiAge_FALL25A2": { prod: {"BronzeAge":{"happiness":410,"medals_24h":10,"strategy_points_24h":1},"IronAge":{"happiness":710,"medals_24h":10,"strategy_points_24h":1},"EarlyMiddleAge":{"happiness":790,"medals_24h":20,"strategy_points_24h":1},"HighMiddleAge":{"happiness":880,"medals_24h":20,"strategy_points_24h":1},"LateMiddleAge":{"happiness":980,"medals_24h":20,"strategy_points_24h":1},"ColonialAge":{"happiness":1150,"medals_24h":30,"strategy_points_24h":1},"IndustrialAge":{"happiness":1300,"medals_24h":40,"strategy_points_24h":1},"ProgressiveEra":{"happiness":1430,"medals_24h":50,"strategy_points_24h":1},"ModernEra":{"happiness":1530,"medals_24h":80,"strategy_points_24h":1},"PostModernEra":{"happiness":1590,"medals_24h":110,"strategy_points_24h":1},"ContemporaryEra":{"happiness":1850,"medals_24h":160,"strategy_points_24h":1},"TomorrowEra":{"happiness":2240,"medals_24h":210,"strategy_points_24h":1},"FutureEra":{"happiness":2690,"medals_24h":260,"strategy_points_24h":1},"ArcticFuture":{"happiness":3130,"medals_24h":310,"strategy_points_24h":2},"OceanicFuture":{"happiness":3610,"medals_24h":360,"strategy_points_24h":3},"VirtualFuture":{"happiness":4320,"medals_24h":440,"strategy_points_24h":4},"SpaceAgeMars":{"happiness":6910,"medals_24h":530,"strategy_points_24h":5},"SpaceAgeAsteroidBelt":{"happiness":7500,"medals_24h":630,"strategy_points_24h":6},"SpaceAgeVenus":{"happiness":8110,"medals_24h":720,"strategy_points_24h":7},"SpaceAgeJupiterMoon":{"happiness":8730,"medals_24h":810,"strategy_points_24h":8},"SpaceAgeTitan":{"happiness":9370,"medals_24h":910,"strategy_points_24h":9},"SpaceAgeSpaceHub":{"happiness":10000,"medals_24h":1000,"strategy_points_24h":10}} },
+    "W_MultiAge_FALL25A3": { prod: {"BronzeAge":{"happiness":830,"medals_24h":20,"strategy_points_24h":1},"IronAge":{"happiness":1420,"medals_24h":20,"strategy_points_24h":1},"EarlyMiddleAge":{"happiness":1580,"medals_24h":30,"strategy_points_24h":1},"HighMiddleAge":{"happiness":1760,"medals_24h":30,"strategy_points_24h":1},"LateMiddleAge":{"happiness":1960,"medals_24h":40,"strategy_points_24h":1},"ColonialAge":{"happiness":2300,"medals_24h":40,"strategy_points_24h":1},"IndustrialAge":{"happiness":2600,"medals_24h":60,"strategy_points_24h":1},"ProgressiveEra":{"happiness":2850,"medals_24h":80,"strategy_points_24h":1},"ModernEra":{"happiness":3050,"medals_24h":120,"strategy_points_24h":2},"PostModernEra":{"happiness":3180,"medals_24h":160,"strategy_points_24h":3},"ContemporaryEra":{"happiness":3700,"medals_24h":230,"strategy_points_24h":4},"TomorrowEra":{"happiness":4490,"medals_24h":320,"strategy_points_24h":5},"FutureEra":{"happiness":5380,"medals_24h":390,"strategy_points_24h":6},"ArcticFuture":{"happiness":6260,"medals_24h":470,"strategy_points_24h":7},"OceanicFuture":{"happiness":7230,"medals_24h":540,"strategy_points_24h":8},"VirtualFuture":{"happiness":8630,"medals_24h":660,"strategy_points_24h":9},"SpaceAgeMars":{"happiness":13810,"medals_24h":800,"strategy_points_24h":10},"SpaceAgeAsteroidBelt":{"happiness":15010,"medals_24h":940,"strategy_points_24h":11},"SpaceAgeVenus":{"happiness":16220,"medals_24h":1080,"strategy_points_24h":12},"SpaceAgeJupiterMoon":{"happiness":17470,"medals_24h":1220,"strategy_points_24h":13},"SpaceAgeTitan":{"happiness":18730,"medals_24h":1360,"strategy_points_24h":14},"SpaceAgeSpaceHub":{"happiness":20000,"medals_24h":1500,"strategy_points_24h":15}}, boosts: [{"type":"def_boost_defender","value":4,"feature":"battleground"}] },
+    "W_MultiAge_FALL25A4": { prod: {"BronzeAge":{"happiness":1240,"medals_24h":20,"strategy_points_24h":1},"IronAge":{"happiness":2140,"medals_24h":30,"strategy_points_24h":1},"EarlyMiddleAge":{"happiness":2360,"medals_24h":30,"strategy_points_24h":1},"HighMiddleAge":{"happiness":2640,"medals_24h":40,"strategy_points_24h":2},"LateMiddleAge":{"happiness":2940,"medals_24h":50,"strategy_points_24h":3},"ColonialAge":{"happiness":3460,"medals_24h":60,"strategy_points_24h":4},"IndustrialAge":{"happiness":3900,"medals_24h":80,"strategy_points_24h":5},"ProgressiveEra":{"happiness":4280,"medals_24h":110,"strategy_points_24h":6},"ModernEra":{"happiness":4580,"medals_24h":160,"strategy_points_24h":7},"PostModernEra":{"happiness":4770,"medals_24h":220,"strategy_points_24h":8},"ContemporaryEra":{"happiness":5550,"medals_24h":310,"strategy_points_24h":9},"TomorrowEra":{"happiness":6730,"medals_24h":420,"strategy_points_24h":10},"FutureEra":{"happiness":8070,"medals_24h":520,"strategy_points_24h":11},"ArcticFuture":{"happiness":9390,"medals_24h":630,"strategy_points_24h":12},"OceanicFuture":{"happiness":10840,"medals_24h":720,"strategy_points_24h":13},"VirtualFuture":{"happiness":12950,"medals_24h":880,"strategy_points_24h":14},"SpaceAgeMars":{"happiness":20720,"medals_24h":1060,"strategy_points_24h":15},"SpaceAgeAsteroidBelt":{"happiness":22510,"medals_24h":1250,"strategy_points_24h":16},"SpaceAgeVenus":{"happiness":24320,"medals_24h":1440,"strategy_points_24h":17},"SpaceAgeJupiterMoon":{"happiness":26200,"medals_24h":1630,"strategy_points_24h":18},"SpaceAgeTitan":{"happiness":28100,"medals_24h":1810,"strategy_points_24h":19},"SpaceAgeSpaceHub":{"happiness":30000,"medals_24h":2000,"strategy_points_24h":20}}, boosts: [{"type":"def_boost_defender","value":44,"feature":"battleground"}] },
+    "W_MultiAge_FALL25A5": { prod: {"BronzeAge":{"happiness":1650,"medals_24h":40,"strategy_points_24h":4},"IronAge":{"happiness":2850,"medals_24h":60,"strategy_points_24h":5},"EarlyMiddleAge":{"happiness":3150,"medals_24h":70,"strategy_points_24h":6},"HighMiddleAge":{"happiness":3520,"medals_24h":80,"strategy_points_24h":7},"LateMiddleAge":{"happiness":3920,"medals_24h":90,"strategy_points_24h":8},"ColonialAge":{"happiness":4610,"medals_24h":110,"strategy_points_24h":9},"IndustrialAge":{"happiness":5200,"medals_24h":160,"strategy_points_24h":10},"ProgressiveEra":{"happiness":5710,"medals_24h":220,"strategy_points_24h":11},"ModernEra":{"happiness":6110,"medals_24h":310,"strategy_points_24h":12},"PostModernEra":{"happiness":6360,"medals_24h":440,"strategy_points_24h":13},"ContemporaryEra":{"happiness":7390,"medals_24h":630,"strategy_points_24h":14},"TomorrowEra":{"happiness":8980,"medals_24h":840,"strategy_points_24h":15},"FutureEra":{"happiness":10750,"medals_24h":1030,"strategy_points_24h":16},"ArcticFuture":{"happiness":12520,"medals_24h":1250,"strategy_points_24h":17},"OceanicFuture":{"happiness":14450,"medals_24h":1440,"strategy_points_24h":18},"VirtualFuture":{"happiness":17260,"medals_24h":1750,"strategy_points_24h":19},"SpaceAgeMars":{"happiness":27620,"medals_24h":2130,"strategy_points_24h":20},"SpaceAgeAsteroidBelt":{"happiness":30020,"medals_24h":2500,"strategy_points_24h":21},"SpaceAgeVenus":{"happiness":32430,"medals_24h":2880,"strategy_points_24h":22},"SpaceAgeJupiterMoon":{"happiness":34940,"medals_24h":3250,"strategy_points_24h":23},"SpaceAgeTitan":{"happiness":37470,"medals_24h":3630,"strategy_points_24h":24},"SpaceAgeSpaceHub":{"happiness":40000,"medals_24h":4000,"strategy_points_24h":25}}, boosts: [{"type":"att_boost_attacker","value":14,"feature":"guild_expedition"},{"type":"def_boost_defender","value":94,"feature":"battleground"}] },
+    "W_MultiAge_FALL25A6": { prod: {"BronzeAge":{"happiness":2070,"medals_24h":70,"strategy_points_24h":8},"IronAge":{"happiness":3560,"medals_24h":80,"strategy_points_24h":10},"EarlyMiddleAge":{"happiness":3940,"medals_24h":100,"strategy_points_24h":12},"HighMiddleAge":{"happiness":4390,"medals_24h":120,"strategy_points_24h":14},"LateMiddleAge":{"happiness":4900,"medals_24h":140,"strategy_points_24h":16},"ColonialAge":{"happiness":5760,"medals_24h":170,"strategy_points_24h":18},"IndustrialAge":{"happiness":6500,"medals_24h":230,"strategy_points_24h":20},"ProgressiveEra":{"happiness":7140,"medals_24h":330,"strategy_points_24h":22},"ModernEra":{"happiness":7630,"medals_24h":470,"strategy_points_24h":24},"PostModernEra":{"happiness":7950,"medals_24h":660,"strategy_points_24h":26},"ContemporaryEra":{"happiness":9240,"medals_24h":940,"strategy_points_24h":28},"TomorrowEra":{"happiness":11220,"medals_24h":1270,"strategy_points_24h":30},"FutureEra":{"happiness":13440,"medals_24h":1550,"strategy_points_24h":32},"ArcticFuture":{"happiness":15650,"medals_24h":1880,"strategy_points_24h":34},"OceanicFuture":{"happiness":18060,"medals_24h":2160,"strategy_points_24h":36},"VirtualFuture":{"happiness":21580,"medals_24h":2630,"strategy_points_24h":38},"SpaceAgeMars":{"happiness":34530,"medals_24h":3190,"strategy_points_24h":40},"SpaceAgeAsteroidBelt":{"happiness":37520,"medals_24h":3750,"strategy_points_24h":42},"SpaceAgeVenus":{"happiness":40540,"medals_24h":4310,"strategy_points_24h":44},"SpaceAgeJupiterMoon":{"happiness":43670,"medals_24h":4880,"strategy_points_24h":46},"SpaceAgeTitan":{"happiness":46840,"medals_24h":5440,"strategy_points_24h":48},"SpaceAgeSpaceHub":{"happiness":50000,"medals_24h":6000,"strategy_points_24h":50}}, boosts: [{"type":"att_boost_attacker","value":29,"feature":"guild_expedition"},{"type":"def_boost_defender","value":224,"feature":"battleground"}] },
+    "W_MultiAge_FALL25A7": { prod: {"BronzeAge":{"happiness":2480,"medals_24h":90,"strategy_points_24h":12},"IronAge":{"happiness":4270,"medals_24h":110,"strategy_points_24h":15},"EarlyMiddleAge":{"happiness":4730,"medals_24h":140,"strategy_points_24h":18},"HighMiddleAge":{"happiness":5270,"medals_24h":160,"strategy_points_24h":21},"LateMiddleAge":{"happiness":5880,"medals_24h":190,"strategy_points_24h":24},"ColonialAge":{"happiness":6910,"medals_24h":230,"strategy_points_24h":27},"IndustrialAge":{"happiness":7800,"medals_24h":310,"strategy_points_24h":30},"ProgressiveEra":{"happiness":8560,"medals_24h":440,"strategy_points_24h":33},"ModernEra":{"happiness":9160,"medals_24h":630,"strategy_points_24h":36},"PostModernEra":{"happiness":9550,"medals_24h":880,"strategy_points_24h":39},"ContemporaryEra":{"happiness":11090,"medals_24h":1250,"strategy_points_24h":42},"TomorrowEra":{"happiness":13460,"medals_24h":1690,"strategy_points_24h":45},"FutureEra":{"happiness":16130,"medals_24h":2060,"strategy_points_24h":48},"ArcticFuture":{"happiness":18780,"medals_24h":2500,"strategy_points_24h":51},"OceanicFuture":{"happiness":21680,"medals_24h":2880,"strategy_points_24h":54},"VirtualFuture":{"happiness":25900,"medals_24h":3500,"strategy_points_24h":57},"SpaceAgeMars":{"happiness":41440,"medals_24h":4250,"strategy_points_24h":60},"SpaceAgeAsteroidBelt":{"happiness":45030,"medals_24h":5000,"strategy_points_24h":63},"SpaceAgeVenus":{"happiness":48650,"medals_24h":5750,"strategy_points_24h":66},"SpaceAgeJupiterMoon":{"happiness":52410,"medals_24h":6500,"strategy_points_24h":69},"SpaceAgeTitan":{"happiness":56200,"medals_24h":7250,"strategy_points_24h":72},"SpaceAgeSpaceHub":{"happiness":60000,"medals_24h":8000,"strategy_points_24h":75}}, boosts: [{"type":"att_boost_attacker","value":129,"feature":"guild_expedition"},{"type":"def_boost_defender","value":294,"feature":"battleground"}] },
+    "W_MultiAge_FALL25A8": { prod: {"BronzeAge":{"happiness":2890,"medals_24h":110,"strategy_points_24h":16},"IronAge":{"happiness":4990,"medals_24h":140,"strategy_points_24h":20},"EarlyMiddleAge":{"happiness":5510,"medals_24h":170,"strategy_points_24h":24},"HighMiddleAge":{"happiness":6150,"medals_24h":200,"strategy_points_24h":28},"LateMiddleAge":{"happiness":6860,"medals_24h":230,"strategy_points_24h":32},"ColonialAge":{"happiness":8070,"medals_24h":280,"strategy_points_24h":36},"IndustrialAge":{"happiness":9100,"medals_24h":390,"strategy_points_24h":40},"ProgressiveEra":{"happiness":9990,"medals_24h":550,"strategy_points_24h":44},"ModernEra":{"happiness":10690,"medals_24h":780,"strategy_points_24h":48},"PostModernEra":{"happiness":11140,"medals_24h":1090,"strategy_points_24h":52},"ContemporaryEra":{"happiness":12940,"medals_24h":1560,"strategy_points_24h":56},"TomorrowEra":{"happiness":15710,"medals_24h":2110,"strategy_points_24h":60},"FutureEra":{"happiness":18820,"medals_24h":2580,"strategy_points_24h":64},"ArcticFuture":{"happiness":21910,"medals_24h":3130,"strategy_points_24h":68},"OceanicFuture":{"happiness":25290,"medals_24h":3590,"strategy_points_24h":72},"VirtualFuture":{"happiness":30210,"medals_24h":4380,"strategy_points_24h":76},"SpaceAgeMars":{"happiness":48340,"medals_24h":5310,"strategy_points_24h":80},"SpaceAgeAsteroidBelt":{"happiness":52530,"medals_24h":6250,"strategy_points_24h":84},"SpaceAgeVenus":{"happiness":56760,"medals_24h":7190,"strategy_points_24h":88},"SpaceAgeJupiterMoon":{"happiness":61140,"medals_24h":8130,"strategy_points_24h":92},"SpaceAgeTitan":{"happiness":65570,"medals_24h":9060,"strategy_points_24h":96},"SpaceAgeSpaceHub":{"happiness":70000,"medals_24h":10000,"strategy_points_24h":100}}, boosts: [{"type":"att_boost_attacker","value":195,"feature":"guild_expedition"},{"type":"def_boost_defender","value":350,"feature":"battleground"}] },
+    "W_MultiAge_FALL25A9": { prod: {"BronzeAge":{"happiness":3310,"medals_24h":270,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"IronAge":{"happiness":5700,"medals_24h":350,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"EarlyMiddleAge":{"happiness":6300,"medals_24h":430,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"HighMiddleAge":{"happiness":7030,"medals_24h":510,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"LateMiddleAge":{"happiness":7840,"medals_24h":590,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"ColonialAge":{"happiness":9220,"medals_24h":700,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"IndustrialAge":{"happiness":10400,"medals_24h":980,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"ProgressiveEra":{"happiness":11420,"medals_24h":1370,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"ModernEra":{"happiness":12220,"medals_24h":1950,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"PostModernEra":{"happiness":12730,"medals_24h":2730,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"ContemporaryEra":{"happiness":14790,"medals_24h":3910,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"TomorrowEra":{"happiness":17950,"medals_24h":5270,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"FutureEra":{"happiness":21510,"medals_24h":6450,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"ArcticFuture":{"happiness":25050,"medals_24h":7810,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"OceanicFuture":{"happiness":28900,"medals_24h":8980,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"VirtualFuture":{"happiness":34530,"medals_24h":10940,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"SpaceAgeMars":{"happiness":55250,"medals_24h":13280,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"SpaceAgeAsteroidBelt":{"happiness":60040,"medals_24h":15630,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"SpaceAgeVenus":{"happiness":64860,"medals_24h":17970,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"SpaceAgeJupiterMoon":{"happiness":69870,"medals_24h":20310,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"SpaceAgeTitan":{"happiness":74940,"medals_24h":22660,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0},"SpaceAgeSpaceHub":{"happiness":80000,"medals_24h":25000,"strategy_points_24h":185,"random_good_of_age_24h":175.0,"random_good_of_previous_age_24h":150.0,"random_good_of_next_age_24h":120.0}}, boosts: [{"type":"att_boost_attacker","value":324,"feature":"guild_expedition"},{"type":"def_boost_defender","value":389,"feature":"battleground"}] },
+    "W_MultiAge_FALL25A10": { prod: {"BronzeAge":{"happiness":3720,"medals_24h":550,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"IronAge":{"happiness":6410,"medals_24h":700,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"EarlyMiddleAge":{"happiness":7090,"medals_24h":860,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"HighMiddleAge":{"happiness":7910,"medals_24h":1020,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"LateMiddleAge":{"happiness":8820,"medals_24h":1170,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"ColonialAge":{"happiness":10370,"medals_24h":1410,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"IndustrialAge":{"happiness":11700,"medals_24h":1950,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"ProgressiveEra":{"happiness":12840,"medals_24h":2730,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"ModernEra":{"happiness":13740,"medals_24h":3910,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"PostModernEra":{"happiness":14320,"medals_24h":5470,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"ContemporaryEra":{"happiness":16640,"medals_24h":7810,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"TomorrowEra":{"happiness":20200,"medals_24h":10550,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"FutureEra":{"happiness":24200,"medals_24h":12890,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"ArcticFuture":{"happiness":28180,"medals_24h":15630,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"OceanicFuture":{"happiness":32520,"medals_24h":17970,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"VirtualFuture":{"happiness":38840,"medals_24h":21880,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"SpaceAgeMars":{"happiness":62150,"medals_24h":26560,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"SpaceAgeAsteroidBelt":{"happiness":67540,"medals_24h":31250,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"SpaceAgeVenus":{"happiness":72970,"medals_24h":35940,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"SpaceAgeJupiterMoon":{"happiness":78610,"medals_24h":40630,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"SpaceAgeTitan":{"happiness":84300,"medals_24h":45310,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0},"SpaceAgeSpaceHub":{"happiness":90000,"medals_24h":50000,"strategy_points_24h":235,"random_good_of_age_24h":225.0,"random_good_of_previous_age_24h":180.0,"random_good_of_next_age_24h":140.0}}, boosts: [{"type":"att_boost_attacker","value":353,"feature":"guild_expedition"},{"type":"def_boost_defender","value":408,"feature":"battleground"}] },
+    "W_MultiAge_FALL24C1": { prod: {"BronzeAge":{"population":-240,"happiness":1540,"money_24h":460,"all_goods_of_age_24h":10},"IronAge":{"population":-520,"happiness":2660,"money_24h":1110,"all_goods_of_age_24h":10},"EarlyMiddleAge":{"population":-790,"happiness":2940,"money_24h":1850,"all_goods_of_age_24h":10},"HighMiddleAge":{"population":-1110,"happiness":3280,"money_24h":2600,"all_goods_of_age_24h":10},"LateMiddleAge":{"population":-1460,"happiness":3660,"money_24h":3430,"all_goods_of_age_24h":10},"ColonialAge":{"population":-1840,"happiness":4310,"money_24h":5220,"all_goods_of_age_24h":10},"IndustrialAge":{"population":-2250,"happiness":4860,"money_24h":6510,"all_goods_of_age_24h":10},"ProgressiveEra":{"population":-2690,"happiness":5330,"money_24h":7900,"all_goods_of_age_24h":10},"ModernEra":{"population":-3160,"happiness":5710,"money_24h":9820,"all_goods_of_age_24h":10},"PostModernEra":{"population":-3640,"happiness":5940,"money_24h":12360,"all_goods_of_age_24h":10},"ContemporaryEra":{"population":-4140,"happiness":6910,"money_24h":16090,"all_goods_of_age_24h":10},"TomorrowEra":{"population":-4670,"happiness":8380,"money_24h":18630,"all_goods_of_age_24h":10},"FutureEra":{"population":-5220,"happiness":10050,"money_24h":21350,"all_goods_of_age_24h":10},"ArcticFuture":{"population":-5790,"happiness":11700,"money_24h":24260,"all_goods_of_age_24h":10},"OceanicFuture":{"population":-6380,"happiness":13500,"money_24h":27360,"all_goods_of_age_24h":10},"VirtualFuture":{"population":-6990,"happiness":16130,"money_24h":30650,"all_goods_of_age_24h":10},"SpaceAgeMars":{"population":-11060,"happiness":25800,"money_24h":51190,"all_goods_of_age_24h":10},"SpaceAgeAsteroidBelt":{"population":-12010,"happiness":28040,"money_24h":56700,"all_goods_of_age_24h":10},"SpaceAgeVenus":{"population":-12990,"happiness":30300,"money_24h":62500,"all_goods_of_age_24h":10},"SpaceAgeJupiterMoon":{"population":-13980,"happiness":32640,"money_24h":68600,"all_goods_of_age_24h":10},"SpaceAgeTitan":{"population":-15000,"happiness":35000,"money_24h":75000,"all_goods_of_age_24h":10},"SpaceAgeSpaceHub":{"population":-16020,"happiness":37360,"money_24h":81400,"all_goods_of_age_24h":10}}, boosts: [{"type":"att_boost_defender","value":10,"feature":"all"},{"type":"def_boost_defender","value":15,"feature":"all"},{"type":"supply_production","value":20,"feature":"all"},{"type":"guild_raids_supplies_start","value":3500,"feature":"all"}] },
+    "W_MultiAge_FALL24A1": { prod: {"BronzeAge":{"population":100,"happiness":530,"demandHappiness":100,"money_24h":930},"IronAge":{"population":210,"happiness":910,"demandHappiness":210,"money_24h":2220},"EarlyMiddleAge":{"population":320,"happiness":1010,"demandHappiness":320,"money_24h":3710},"HighMiddleAge":{"population":450,"happiness":1130,"demandHappiness":450,"money_24h":5190},"LateMiddleAge":{"population":580,"happiness":1260,"demandHappiness":580,"money_24h":6860},"ColonialAge":{"population":740,"happiness":1480,"demandHappiness":740,"money_24h":10450},"IndustrialAge":{"population":900,"happiness":1660,"demandHappiness":900,"money_24h":13010},"ProgressiveEra":{"population":1080,"happiness":1830,"demandHappiness":1080,"money_24h":15790},"ModernEra":{"population":1260,"happiness":1960,"demandHappiness":1260,"money_24h":19650},"PostModernEra":{"population":1450,"happiness":2040,"demandHappiness":1450,"money_24h":24720},"ContemporaryEra":{"population":1660,"happiness":2370,"demandHappiness":1660,"money_24h":32180},"TomorrowEra":{"population":1870,"happiness":2870,"demandHappiness":1870,"money_24h":37260},"FutureEra":{"population":2090,"happiness":3440,"demandHappiness":2090,"money_24h":42710},"ArcticFuture":{"population":2320,"happiness":4010,"demandHappiness":2320,"money_24h":48530},"OceanicFuture":{"population":2550,"happiness":4630,"demandHappiness":2550,"money_24h":54720},"VirtualFuture":{"population":2800,"happiness":5530,"demandHappiness":2800,"money_24h":61290},"SpaceAgeMars":{"population":4420,"happiness":8850,"demandHappiness":4420,"money_24h":102380},"SpaceAgeAsteroidBelt":{"population":4810,"happiness":9610,"demandHappiness":4810,"money_24h":113400},"SpaceAgeVenus":{"population":5190,"happiness":10390,"demandHappiness":5190,"money_24h":125000},"SpaceAgeJupiterMoon":{"population":5590,"happiness":11190,"demandHappiness":5590,"money_24h":137200},"SpaceAgeTitan":{"population":6000,"happiness":12000,"demandHappiness":6000,"money_24h":150000},"SpaceAgeSpaceHub":{"population":6410,"happiness":12810,"demandHappiness":6410,"money_24h":162800}} },
+    "W_MultiAge_FALL24A2": { prod: {"BronzeAge":{"population":110,"happiness":660,"demandHappiness":110,"money_24h":900,"all_goods_of_age_24h":5},"IronAge":{"population":240,"happiness":1140,"demandHappiness":240,"money_24h":2100,"all_goods_of_age_24h":5},"EarlyMiddleAge":{"population":370,"happiness":1260,"demandHappiness":370,"money_24h":3600,"all_goods_of_age_24h":5},"HighMiddleAge":{"population":520,"happiness":1410,"demandHappiness":520,"money_24h":5000,"all_goods_of_age_24h":5},"LateMiddleAge":{"population":680,"happiness":1570,"demandHappiness":680,"money_24h":6600,"all_goods_of_age_24h":5},"ColonialAge":{"population":860,"happiness":1850,"demandHappiness":860,"money_24h":10100,"all_goods_of_age_24h":5},"IndustrialAge":{"population":1050,"happiness":2080,"demandHappiness":1050,"money_24h":12500,"all_goods_of_age_24h":5},"ProgressiveEra":{"population":1260,"happiness":2290,"demandHappiness":1260,"money_24h":15200,"all_goods_of_age_24h":5},"ModernEra":{"population":1470,"happiness":2450,"demandHappiness":1470,"money_24h":18900,"all_goods_of_age_24h":5},"PostModernEra":{"population":1700,"happiness":2550,"demandHappiness":1700,"money_24h":23800,"all_goods_of_age_24h":5},"ContemporaryEra":{"population":1930,"happiness":2960,"demandHappiness":1930,"money_24h":31000,"all_goods_of_age_24h":5},"TomorrowEra":{"population":2180,"happiness":3590,"demandHappiness":2180,"money_24h":35900,"all_goods_of_age_24h":5},"FutureEra":{"population":2440,"happiness":4310,"demandHappiness":2440,"money_24h":41100,"all_goods_of_age_24h":5},"ArcticFuture":{"population":2700,"happiness":5010,"demandHappiness":2700,"money_24h":46700,"all_goods_of_age_24h":5},"OceanicFuture":{"population":2980,"happiness":5790,"demandHappiness":2980,"money_24h":52700,"all_goods_of_age_24h":5},"VirtualFuture":{"population":3260,"happiness":6910,"demandHappiness":3260,"money_24h":59000,"all_goods_of_age_24h":5},"SpaceAgeMars":{"population":5160,"happiness":11060,"demandHappiness":5160,"money_24h":98600,"all_goods_of_age_24h":5},"SpaceAgeAsteroidBelt":{"population":5610,"happiness":12020,"demandHappiness":5610,"money_24h":109200,"all_goods_of_age_24h":5},"SpaceAgeVenus":{"population":6060,"happiness":12980,"demandHappiness":6060,"money_24h":120400,"all_goods_of_age_24h":5},"SpaceAgeJupiterMoon":{"population":6530,"happiness":13990,"demandHappiness":6530,"money_24h":132100,"all_goods_of_age_24h":5},"SpaceAgeTitan":{"population":7000,"happiness":15000,"demandHappiness":7000,"money_24h":144400,"all_goods_of_age_24h":5},"SpaceAgeSpaceHub":{"population":7470,"happiness":16010,"demandHappiness":7470,"money_24h":156700,"all_goods_of_age_24h":5}} },
+    "W_MultiAge_FALL24A3": { prod: {"BronzeAge":{"population":140,"happiness":880,"demandHappiness":140,"money_24h":1000,"all_goods_of_age_24h":10},"IronAge":{"population":290,"happiness":1520,"demandHappiness":290,"money_24h":2400,"all_goods_of_age_24h":10},"EarlyMiddleAge":{"population":450,"happiness":1680,"demandHappiness":450,"money_24h":4000,"all_goods_of_age_24h":10},"HighMiddleAge":{"population":630,"happiness":1880,"demandHappiness":630,"money_24h":5600,"all_goods_of_age_24h":10},"LateMiddleAge":{"population":830,"happiness":2090,"demandHappiness":830,"money_24h":7400,"all_goods_of_age_24h":10},"ColonialAge":{"population":1050,"happiness":2460,"demandHappiness":1050,"money_24h":11200,"all_goods_of_age_24h":10},"IndustrialAge":{"population":1280,"happiness":2770,"demandHappiness":1280,"money_24h":14000,"all_goods_of_age_24h":10},"ProgressiveEra":{"population":1530,"happiness":3050,"demandHappiness":1530,"money_24h":17000,"all_goods_of_age_24h":10},"ModernEra":{"population":1790,"happiness":3260,"demandHappiness":1790,"money_24h":21200,"all_goods_of_age_24h":10},"PostModernEra":{"population":2060,"happiness":3400,"demandHappiness":2060,"money_24h":26600,"all_goods_of_age_24h":10},"ContemporaryEra":{"population":2350,"happiness":3950,"demandHappiness":2350,"money_24h":34600,"all_goods_of_age_24h":10},"TomorrowEra":{"population":2650,"happiness":4790,"demandHappiness":2650,"money_24h":40100,"all_goods_of_age_24h":10},"FutureEra":{"population":2960,"happiness":5740,"demandHappiness":2960,"money_24h":46000,"all_goods_of_age_24h":10},"ArcticFuture":{"population":3280,"happiness":6680,"demandHappiness":3280,"money_24h":52200,"all_goods_of_age_24h":10},"OceanicFuture":{"population":3620,"happiness":7710,"demandHappiness":3620,"money_24h":58900,"all_goods_of_age_24h":10},"VirtualFuture":{"population":3960,"happiness":9220,"demandHappiness":3960,"money_24h":66000,"all_goods_of_age_24h":10},"SpaceAgeMars":{"population":6270,"happiness":14750,"demandHappiness":6270,"money_24h":110200,"all_goods_of_age_24h":10},"SpaceAgeAsteroidBelt":{"population":6810,"happiness":16020,"demandHappiness":6810,"money_24h":122000,"all_goods_of_age_24h":10},"SpaceAgeVenus":{"population":7360,"happiness":17310,"demandHappiness":7360,"money_24h":134500,"all_goods_of_age_24h":10},"SpaceAgeJupiterMoon":{"population":7920,"happiness":18650,"demandHappiness":7920,"money_24h":147700,"all_goods_of_age_24h":10},"SpaceAgeTitan":{"population":8500,"happiness":20000,"demandHappiness":8500,"money_24h":161400,"all_goods_of_age_24h":10},"SpaceAgeSpaceHub":{"population":9080,"happiness":21350,"demandHappiness":9080,"money_24h":175100,"all_goods_of_age_24h":10}} },
+    "W_MultiAge_FALL24A4": { prod: {"BronzeAge":{"population":160,"happiness":1100,"demandHappiness":160,"money_24h":1240,"all_goods_of_age_24h":15},"IronAge":{"population":340,"happiness":1900,"demandHappiness":340,"money_24h":2970,"all_goods_of_age_24h":15},"EarlyMiddleAge":{"population":530,"happiness":2100,"demandHappiness":530,"money_24h":4940,"all_goods_of_age_24h":15},"HighMiddleAge":{"population":740,"happiness":2350,"demandHappiness":740,"money_24h":6920,"all_goods_of_age_24h":15},"LateMiddleAge":{"population":970,"happiness":2620,"demandHappiness":970,"money_24h":9140,"all_goods_of_age_24h":15},"ColonialAge":{"population":1230,"happiness":3080,"demandHappiness":1230,"money_24h":13930,"all_goods_of_age_24h":15},"IndustrialAge":{"population":1500,"happiness":3470,"demandHappiness":1500,"money_24h":17350,"all_goods_of_age_24h":15},"ProgressiveEra":{"population":1790,"happiness":3810,"demandHappiness":1790,"money_24h":21060,"all_goods_of_age_24h":15},"ModernEra":{"population":2100,"happiness":4080,"demandHappiness":2100,"money_24h":26200,"all_goods_of_age_24h":15},"PostModernEra":{"population":2420,"happiness":4250,"demandHappiness":2420,"money_24h":32960,"all_goods_of_age_24h":15},"ContemporaryEra":{"population":2760,"happiness":4930,"demandHappiness":2760,"money_24h":42910,"all_goods_of_age_24h":15},"TomorrowEra":{"population":3110,"happiness":5990,"demandHappiness":3110,"money_24h":49680,"all_goods_of_age_24h":15},"FutureEra":{"population":3480,"happiness":7180,"demandHappiness":3480,"money_24h":56950,"all_goods_of_age_24h":15},"ArcticFuture":{"population":3860,"happiness":8360,"demandHappiness":3860,"money_24h":64710,"all_goods_of_age_24h":15},"OceanicFuture":{"population":4250,"happiness":9640,"demandHappiness":4250,"money_24h":72960,"all_goods_of_age_24h":15},"VirtualFuture":{"population":4660,"happiness":11520,"demandHappiness":4660,"money_24h":81720,"all_goods_of_age_24h":15},"SpaceAgeMars":{"population":7370,"happiness":18430,"demandHappiness":7370,"money_24h":136510,"all_goods_of_age_24h":15},"SpaceAgeAsteroidBelt":{"population":8010,"happiness":20030,"demandHappiness":8010,"money_24h":151200,"all_goods_of_age_24h":15},"SpaceAgeVenus":{"population":8660,"happiness":21640,"demandHappiness":8660,"money_24h":166670,"all_goods_of_age_24h":15},"SpaceAgeJupiterMoon":{"population":9320,"happiness":23310,"demandHappiness":9320,"money_24h":182930,"all_goods_of_age_24h":15},"SpaceAgeTitan":{"population":10000,"happiness":25000,"demandHappiness":10000,"money_24h":200000,"all_goods_of_age_24h":15},"SpaceAgeSpaceHub":{"population":10680,"happiness":26690,"demandHappiness":10680,"money_24h":217070,"all_goods_of_age_24h":15}} },
+    "W_MultiAge_FALL24A5": { prod: {"BronzeAge":{"population":200,"happiness":1320,"demandHappiness":200,"money_24h":1540,"all_goods_of_age_24h":20},"IronAge":{"population":430,"happiness":2280,"demandHappiness":430,"money_24h":3710,"all_goods_of_age_24h":20},"EarlyMiddleAge":{"population":660,"happiness":2520,"demandHappiness":660,"money_24h":6180,"all_goods_of_age_24h":20},"HighMiddleAge":{"population":930,"happiness":2810,"demandHappiness":930,"money_24h":8650,"all_goods_of_age_24h":20},"LateMiddleAge":{"population":1220,"happiness":3140,"demandHappiness":1220,"money_24h":11430,"all_goods_of_age_24h":20},"ColonialAge":{"population":1540,"happiness":3690,"demandHappiness":1540,"money_24h":17410,"all_goods_of_age_24h":20},"IndustrialAge":{"population":1880,"happiness":4160,"demandHappiness":1880,"money_24h":21690,"all_goods_of_age_24h":20},"ProgressiveEra":{"population":2240,"happiness":4570,"demandHappiness":2240,"money_24h":26320,"all_goods_of_age_24h":20},"ModernEra":{"population":2630,"happiness":4890,"demandHappiness":2630,"money_24h":32750,"all_goods_of_age_24h":20},"PostModernEra":{"population":3030,"happiness":5090,"demandHappiness":3030,"money_24h":41200,"all_goods_of_age_24h":20},"ContemporaryEra":{"population":3450,"happiness":5920,"demandHappiness":3450,"money_24h":53630,"all_goods_of_age_24h":20},"TomorrowEra":{"population":3890,"happiness":7190,"demandHappiness":3890,"money_24h":62100,"all_goods_of_age_24h":20},"FutureEra":{"population":4350,"happiness":8610,"demandHappiness":4350,"money_24h":71180,"all_goods_of_age_24h":20},"ArcticFuture":{"population":4830,"happiness":10030,"demandHappiness":4830,"money_24h":80880,"all_goods_of_age_24h":20},"OceanicFuture":{"population":5320,"happiness":11570,"demandHappiness":5320,"money_24h":91200,"all_goods_of_age_24h":20},"VirtualFuture":{"population":5820,"happiness":13820,"demandHappiness":5820,"money_24h":102150,"all_goods_of_age_24h":20},"SpaceAgeMars":{"population":9220,"happiness":22120,"demandHappiness":9220,"money_24h":170630,"all_goods_of_age_24h":20},"SpaceAgeAsteroidBelt":{"population":10010,"happiness":24040,"demandHappiness":10010,"money_24h":189000,"all_goods_of_age_24h":20},"SpaceAgeVenus":{"population":10820,"happiness":25970,"demandHappiness":10820,"money_24h":208340,"all_goods_of_age_24h":20},"SpaceAgeJupiterMoon":{"population":11650,"happiness":27970,"demandHappiness":11650,"money_24h":228670,"all_goods_of_age_24h":20},"SpaceAgeTitan":{"population":12500,"happiness":30000,"demandHappiness":12500,"money_24h":250000,"all_goods_of_age_24h":20},"SpaceAgeSpaceHub":{"population":13350,"happiness":32030,"demandHappiness":13350,"money_24h":271330,"all_goods_of_age_24h":20}} },
+    "W_MultiAge_FALL24A6": { prod: {"BronzeAge":{"population":240,"happiness":1540,"demandHappiness":240,"money_24h":1850,"all_goods_of_age_24h":25,"strategy_points_24h":5},"IronAge":{"population":520,"happiness":2660,"demandHappiness":520,"money_24h":4450,"all_goods_of_age_24h":25,"strategy_points_24h":5},"EarlyMiddleAge":{"population":790,"happiness":2940,"demandHappiness":790,"money_24h":7410,"all_goods_of_age_24h":25,"strategy_points_24h":6},"HighMiddleAge":{"population":1110,"happiness":3280,"demandHappiness":1110,"money_24h":10380,"all_goods_of_age_24h":25,"strategy_points_24h":6},"LateMiddleAge":{"population":1460,"happiness":3660,"demandHappiness":1460,"money_24h":13720,"all_goods_of_age_24h":25,"strategy_points_24h":6},"ColonialAge":{"population":1840,"happiness":4310,"demandHappiness":1840,"money_24h":20890,"all_goods_of_age_24h":25,"strategy_points_24h":6},"IndustrialAge":{"population":2250,"happiness":4860,"demandHappiness":2250,"money_24h":26030,"all_goods_of_age_24h":25,"strategy_points_24h":7},"ProgressiveEra":{"population":2690,"happiness":5330,"demandHappiness":2690,"money_24h":31590,"all_goods_of_age_24h":25,"strategy_points_24h":7},"ModernEra":{"population":3160,"happiness":5710,"demandHappiness":3160,"money_24h":39300,"all_goods_of_age_24h":25,"strategy_points_24h":7},"PostModernEra":{"population":3640,"happiness":5940,"demandHappiness":3640,"money_24h":49440,"all_goods_of_age_24h":25,"strategy_points_24h":7},"ContemporaryEra":{"population":4140,"happiness":6910,"demandHappiness":4140,"money_24h":64360,"all_goods_of_age_24h":25,"strategy_points_24h":8},"TomorrowEra":{"population":4670,"happiness":8380,"demandHappiness":4670,"money_24h":74520,"all_goods_of_age_24h":25,"strategy_points_24h":8},"FutureEra":{"population":5220,"happiness":10050,"demandHappiness":5220,"money_24h":85420,"all_goods_of_age_24h":25,"strategy_points_24h":8},"ArcticFuture":{"population":5790,"happiness":11700,"demandHappiness":5790,"money_24h":97060,"all_goods_of_age_24h":25,"strategy_points_24h":8},"OceanicFuture":{"population":6380,"happiness":13500,"demandHappiness":6380,"money_24h":109440,"all_goods_of_age_24h":25,"strategy_points_24h":9},"VirtualFuture":{"population":6990,"happiness":16130,"demandHappiness":6990,"money_24h":122580,"all_goods_of_age_24h":25,"strategy_points_24h":9},"SpaceAgeMars":{"population":11060,"happiness":25800,"demandHappiness":11060,"money_24h":204760,"all_goods_of_age_24h":25,"strategy_points_24h":9},"SpaceAgeAsteroidBelt":{"population":12010,"happiness":28040,"demandHappiness":12010,"money_24h":226800,"all_goods_of_age_24h":25,"strategy_points_24h":9},"SpaceAgeVenus":{"population":12990,"happiness":30300,"demandHappiness":12990,"money_24h":250010,"all_goods_of_age_24h":25,"strategy_points_24h":10},"SpaceAgeJupiterMoon":{"population":13980,"happiness":32640,"demandHappiness":13980,"money_24h":274400,"all_goods_of_age_24h":25,"strategy_points_24h":10},"SpaceAgeTitan":{"population":15000,"happiness":35000,"demandHappiness":15000,"money_24h":300000,"all_goods_of_age_24h":25,"strategy_points_24h":10},"SpaceAgeSpaceHub":{"population":16020,"happiness":37360,"demandHappiness":16020,"money_24h":325600,"all_goods_of_age_24h":25,"strategy_points_24h":10}} },
+    "W_MultiAge_FALL24A7": { prod: {"BronzeAge":{"population":320,"happiness":1770,"demandHappiness":320,"money_24h":2160,"all_goods_of_age_24h":30,"strategy_points_24h":10},"IronAge":{"population":690,"happiness":3040,"demandHappiness":690,"money_24h":5190,"all_goods_of_age_24h":30,"strategy_points_24h":10},"EarlyMiddleAge":{"population":1060,"happiness":3360,"demandHappiness":1060,"money_24h":8650,"all_goods_of_age_24h":30,"strategy_points_24h":11},"HighMiddleAge":{"population":1490,"happiness":3750,"demandHappiness":1490,"money_24h":12110,"all_goods_of_age_24h":30,"strategy_points_24h":11},"LateMiddleAge":{"population":1950,"happiness":4190,"demandHappiness":1950,"money_24h":16000,"all_goods_of_age_24h":30,"strategy_points_24h":11},"ColonialAge":{"population":2460,"happiness":4920,"demandHappiness":2460,"money_24h":24370,"all_goods_of_age_24h":30,"strategy_points_24h":12},"IndustrialAge":{"population":3010,"happiness":5550,"demandHappiness":3010,"money_24h":30360,"all_goods_of_age_24h":30,"strategy_points_24h":12},"ProgressiveEra":{"population":3590,"happiness":6090,"demandHappiness":3590,"money_24h":36850,"all_goods_of_age_24h":30,"strategy_points_24h":12},"ModernEra":{"population":4210,"happiness":6520,"demandHappiness":4210,"money_24h":45850,"all_goods_of_age_24h":30,"strategy_points_24h":13},"PostModernEra":{"population":4850,"happiness":6790,"demandHappiness":4850,"money_24h":57680,"all_goods_of_age_24h":30,"strategy_points_24h":13},"ContemporaryEra":{"population":5530,"happiness":7890,"demandHappiness":5530,"money_24h":75090,"all_goods_of_age_24h":30,"strategy_points_24h":14},"TomorrowEra":{"population":6230,"happiness":9580,"demandHappiness":6230,"money_24h":86940,"all_goods_of_age_24h":30,"strategy_points_24h":14},"FutureEra":{"population":6960,"happiness":11480,"demandHappiness":6960,"money_24h":99650,"all_goods_of_age_24h":30,"strategy_points_24h":15},"ArcticFuture":{"population":7720,"happiness":13370,"demandHappiness":7720,"money_24h":113240,"all_goods_of_age_24h":30,"strategy_points_24h":15},"OceanicFuture":{"population":8510,"happiness":15430,"demandHappiness":8510,"money_24h":127680,"all_goods_of_age_24h":30,"strategy_points_24h":16},"VirtualFuture":{"population":9320,"happiness":18430,"demandHappiness":9320,"money_24h":143010,"all_goods_of_age_24h":30,"strategy_points_24h":16},"SpaceAgeMars":{"population":14750,"happiness":29490,"demandHappiness":14750,"money_24h":238880,"all_goods_of_age_24h":30,"strategy_points_24h":17},"SpaceAgeAsteroidBelt":{"population":16020,"happiness":32050,"demandHappiness":16020,"money_24h":264600,"all_goods_of_age_24h":30,"strategy_points_24h":17},"SpaceAgeVenus":{"population":17310,"happiness":34620,"demandHappiness":17310,"money_24h":291670,"all_goods_of_age_24h":30,"strategy_points_24h":18},"SpaceAgeJupiterMoon":{"population":18650,"happiness":37300,"demandHappiness":18650,"money_24h":320130,"all_goods_of_age_24h":30,"strategy_points_24h":19},"SpaceAgeTitan":{"population":20000,"happiness":40000,"demandHappiness":20000,"money_24h":350000,"all_goods_of_age_24h":30,"strategy_points_24h":20},"SpaceAgeSpaceHub":{"population":21350,"happiness":42700,"demandHappiness":21350,"money_24h":379870,"all_goods_of_age_24h":30,"strategy_points_24h":21}}, boosts: [{"type":"def_boost_defender","value":7,"feature":"all"}] },
+    "W_MultiAge_FALL24A8": { prod: {"BronzeAge":{"population":370,"happiness":2210,"demandHappiness":370,"money_24h":2470,"all_goods_of_age_24h":35,"strategy_points_24h":15},"IronAge":{"population":790,"happiness":3800,"demandHappiness":790,"money_24h":5930,"all_goods_of_age_24h":35,"strategy_points_24h":16},"EarlyMiddleAge":{"population":1220,"happiness":4200,"demandHappiness":1220,"money_24h":9890,"all_goods_of_age_24h":35,"strategy_points_24h":16},"HighMiddleAge":{"population":1710,"happiness":4690,"demandHappiness":1710,"money_24h":13840,"all_goods_of_age_24h":35,"strategy_points_24h":17},"LateMiddleAge":{"population":2240,"happiness":5230,"demandHappiness":2240,"money_24h":18290,"all_goods_of_age_24h":35,"strategy_points_24h":17},"ColonialAge":{"population":2830,"happiness":6150,"demandHappiness":2830,"money_24h":27850,"all_goods_of_age_24h":35,"strategy_points_24h":18},"IndustrialAge":{"population":3460,"happiness":6940,"demandHappiness":3460,"money_24h":34700,"all_goods_of_age_24h":35,"strategy_points_24h":19},"ProgressiveEra":{"population":4130,"happiness":7620,"demandHappiness":4130,"money_24h":42120,"all_goods_of_age_24h":35,"strategy_points_24h":19},"ModernEra":{"population":4840,"happiness":8150,"demandHappiness":4840,"money_24h":52400,"all_goods_of_age_24h":35,"strategy_points_24h":20},"PostModernEra":{"population":5580,"happiness":8490,"demandHappiness":5580,"money_24h":65920,"all_goods_of_age_24h":35,"strategy_points_24h":20},"ContemporaryEra":{"population":6350,"happiness":9870,"demandHappiness":6350,"money_24h":85810,"all_goods_of_age_24h":35,"strategy_points_24h":21},"TomorrowEra":{"population":7160,"happiness":11980,"demandHappiness":7160,"money_24h":99360,"all_goods_of_age_24h":35,"strategy_points_24h":22},"FutureEra":{"population":8010,"happiness":14350,"demandHappiness":8010,"money_24h":113890,"all_goods_of_age_24h":35,"strategy_points_24h":22},"ArcticFuture":{"population":8880,"happiness":16710,"demandHappiness":8880,"money_24h":129410,"all_goods_of_age_24h":35,"strategy_points_24h":23},"OceanicFuture":{"population":9780,"happiness":19280,"demandHappiness":9780,"money_24h":145920,"all_goods_of_age_24h":35,"strategy_points_24h":23},"VirtualFuture":{"population":10710,"happiness":23040,"demandHappiness":10710,"money_24h":163450,"all_goods_of_age_24h":35,"strategy_points_24h":24},"SpaceAgeMars":{"population":16960,"happiness":36860,"demandHappiness":16960,"money_24h":273010,"all_goods_of_age_24h":35,"strategy_points_24h":25},"SpaceAgeAsteroidBelt":{"population":18420,"happiness":40060,"demandHappiness":18420,"money_24h":302400,"all_goods_of_age_24h":35,"strategy_points_24h":25},"SpaceAgeVenus":{"population":19910,"happiness":43280,"demandHappiness":19910,"money_24h":333340,"all_goods_of_age_24h":35,"strategy_points_24h":26},"SpaceAgeJupiterMoon":{"population":21440,"happiness":46620,"demandHappiness":21440,"money_24h":365870,"all_goods_of_age_24h":35,"strategy_points_24h":27},"SpaceAgeTitan":{"population":23000,"happiness":50000,"demandHappiness":23000,"money_24h":400000,"all_goods_of_age_24h":35,"strategy_points_24h":30},"SpaceAgeSpaceHub":{"population":24560,"happiness":53380,"demandHappiness":24560,"money_24h":434130,"all_goods_of_age_24h":35,"strategy_points_24h":33}}, boosts: [{"type":"def_boost_defender","value":11,"feature":"all"},{"type":"att_boost_defender","value":10,"feature":"all"}] },
+    "W_MultiAge_FALL24A9": { prod: {"BronzeAge":{"population":480,"happiness":3090,"demandHappiness":480,"money_24h":3090,"all_goods_of_age_24h":80,"strategy_points_24h":40},"IronAge":{"population":1030,"happiness":5320,"demandHappiness":1030,"money_24h":7410,"all_goods_of_age_24h":80,"strategy_points_24h":40},"EarlyMiddleAge":{"population":1590,"happiness":5890,"demandHappiness":1590,"money_24h":12360,"all_goods_of_age_24h":80,"strategy_points_24h":41},"HighMiddleAge":{"population":2230,"happiness":6570,"demandHappiness":2230,"money_24h":17300,"all_goods_of_age_24h":80,"strategy_points_24h":41},"LateMiddleAge":{"population":2920,"happiness":7320,"demandHappiness":2920,"money_24h":22860,"all_goods_of_age_24h":80,"strategy_points_24h":42},"ColonialAge":{"population":3690,"happiness":8610,"demandHappiness":3690,"money_24h":34820,"all_goods_of_age_24h":80,"strategy_points_24h":42},"IndustrialAge":{"population":4510,"happiness":9710,"demandHappiness":4510,"money_24h":43380,"all_goods_of_age_24h":80,"strategy_points_24h":43},"ProgressiveEra":{"population":5380,"happiness":10660,"demandHappiness":5380,"money_24h":52640,"all_goods_of_age_24h":80,"strategy_points_24h":43},"ModernEra":{"population":6310,"happiness":11410,"demandHappiness":6310,"money_24h":65500,"all_goods_of_age_24h":80,"strategy_points_24h":44},"PostModernEra":{"population":7270,"happiness":11890,"demandHappiness":7270,"money_24h":82400,"all_goods_of_age_24h":80,"strategy_points_24h":44},"ContemporaryEra":{"population":8290,"happiness":13810,"demandHappiness":8290,"money_24h":107270,"all_goods_of_age_24h":80,"strategy_points_24h":45},"TomorrowEra":{"population":9340,"happiness":16770,"demandHappiness":9340,"money_24h":124200,"all_goods_of_age_24h":80,"strategy_points_24h":45},"FutureEra":{"population":10450,"happiness":20090,"demandHappiness":10450,"money_24h":142360,"all_goods_of_age_24h":80,"strategy_points_24h":46},"ArcticFuture":{"population":11590,"happiness":23400,"demandHappiness":11590,"money_24h":161760,"all_goods_of_age_24h":80,"strategy_points_24h":46},"OceanicFuture":{"population":12760,"happiness":27000,"demandHappiness":12760,"money_24h":182400,"all_goods_of_age_24h":80,"strategy_points_24h":47},"VirtualFuture":{"population":13980,"happiness":32250,"demandHappiness":13980,"money_24h":204310,"all_goods_of_age_24h":80,"strategy_points_24h":47},"SpaceAgeMars":{"population":22120,"happiness":51610,"demandHappiness":22120,"money_24h":341260,"all_goods_of_age_24h":80,"strategy_points_24h":48},"SpaceAgeAsteroidBelt":{"population":24030,"happiness":56080,"demandHappiness":24030,"money_24h":378000,"all_goods_of_age_24h":80,"strategy_points_24h":48},"SpaceAgeVenus":{"population":25970,"happiness":60590,"demandHappiness":25970,"money_24h":416680,"all_goods_of_age_24h":80,"strategy_points_24h":49},"SpaceAgeJupiterMoon":{"population":27970,"happiness":65270,"demandHappiness":27970,"money_24h":457330,"all_goods_of_age_24h":80,"strategy_points_24h":49},"SpaceAgeTitan":{"population":30000,"happiness":70000,"demandHappiness":30000,"money_24h":500000,"all_goods_of_age_24h":80,"strategy_points_24h":50},"SpaceAgeSpaceHub":{"population":32030,"happiness":74730,"demandHappiness":32030,"money_24h":542670,"all_goods_of_age_24h":80,"strategy_points_24h":50}}, boosts: [{"type":"def_boost_defender","value":60,"feature":"all"},{"type":"att_boost_defender","value":70,"feature":"all"}] },
+    "W_MultiAge_FALL23B1": { prod: {"BronzeAge":{"strategy_points_24h":15,"random_good_of_age_24h":27},"IronAge":{"strategy_points_24h":15,"random_good_of_age_24h":27},"EarlyMiddleAge":{"strategy_points_24h":15,"random_good_of_age_24h":27},"HighMiddleAge":{"strategy_points_24h":15,"random_good_of_age_24h":27},"LateMiddleAge":{"strategy_points_24h":15,"random_good_of_age_24h":27},"ColonialAge":{"strategy_points_24h":15,"random_good_of_age_24h":27},"IndustrialAge":{"strategy_points_24h":15,"random_good_of_age_24h":27},"ProgressiveEra":{"strategy_points_24h":15,"random_good_of_age_24h":27},"ModernEra":{"strategy_points_24h":15,"random_good_of_age_24h":27},"PostModernEra":{"strategy_points_24h":15,"random_good_of_age_24h":27},"ContemporaryEra":{"strategy_points_24h":15,"random_good_of_age_24h":27},"TomorrowEra":{"strategy_points_24h":15,"random_good_of_age_24h":27},"FutureEra":{"strategy_points_24h":15,"random_good_of_age_24h":27},"ArcticFuture":{"strategy_points_24h":15,"random_good_of_age_24h":27},"OceanicFuture":{"strategy_points_24h":15,"random_good_of_age_24h":27},"VirtualFuture":{"strategy_points_24h":15,"random_good_of_age_24h":27},"SpaceAgeMars":{"strategy_points_24h":15,"random_good_of_age_24h":27},"SpaceAgeAsteroidBelt":{"strategy_points_24h":15,"random_good_of_age_24h":27},"SpaceAgeVenus":{"strategy_points_24h":15,"random_good_of_age_24h":27},"SpaceAgeJupiterMoon":{"strategy_points_24h":15,"random_good_of_age_24h":27},"SpaceAgeTitan":{"strategy_points_24h":15,"random_good_of_age_24h":27},"SpaceAgeSpaceHub":{"strategy_points_24h":15,"random_good_of_age_24h":27}}, boosts: [{"type":"att_boost_attacker","value":18,"feature":"all"},{"type":"att_boost_defender","value":24,"feature":"all"}] },
+    "W_MultiAge_FALL23B2": { prod: {"BronzeAge":{"strategy_points_24h":21,"random_good_of_age_24h":33},"IronAge":{"strategy_points_24h":21,"random_good_of_age_24h":33},"EarlyMiddleAge":{"strategy_points_24h":21,"random_good_of_age_24h":33},"HighMiddleAge":{"strategy_points_24h":21,"random_good_of_age_24h":33},"LateMiddleAge":{"strategy_points_24h":21,"random_good_of_age_24h":33},"ColonialAge":{"strategy_points_24h":21,"random_good_of_age_24h":33},"IndustrialAge":{"strategy_points_24h":21,"random_good_of_age_24h":33},"ProgressiveEra":{"strategy_points_24h":21,"random_good_of_age_24h":33},"ModernEra":{"strategy_points_24h":21,"random_good_of_age_24h":33},"PostModernEra":{"strategy_points_24h":21,"random_good_of_age_24h":33},"ContemporaryEra":{"strategy_points_24h":21,"random_good_of_age_24h":33},"TomorrowEra":{"strategy_points_24h":21,"random_good_of_age_24h":33},"FutureEra":{"strategy_points_24h":21,"random_good_of_age_24h":33},"ArcticFuture":{"strategy_points_24h":21,"random_good_of_age_24h":33},"OceanicFuture":{"strategy_points_24h":21,"random_good_of_age_24h":33},"VirtualFuture":{"strategy_points_24h":21,"random_good_of_age_24h":33},"SpaceAgeMars":{"strategy_points_24h":21,"random_good_of_age_24h":33},"SpaceAgeAsteroidBelt":{"strategy_points_24h":21,"random_good_of_age_24h":33},"SpaceAgeVenus":{"strategy_points_24h":21,"random_good_of_age_24h":33},"SpaceAgeJupiterMoon":{"strategy_points_24h":21,"random_good_of_age_24h":33},"SpaceAgeTitan":{"strategy_points_24h":21,"random_good_of_age_24h":33},"SpaceAgeSpaceHub":{"strategy_points_24h":21,"random_good_of_age_24h":33}}, boosts: [{"type":"att_boost_attacker","value":30,"feature":"all"},{"type":"att_boost_defender","value":36,"feature":"all"}] },
+    "W_MultiAge_FALL23C1": { prod: {"BronzeAge":{"population":-324,"happiness":-1090},"IronAge":{"population":-696,"happiness":-1870},"EarlyMiddleAge":{"population":-1068,"happiness":-2070},"HighMiddleAge":{"population":-1500,"happiness":-2300},"LateMiddleAge":{"population":-1968,"happiness":-2570},"ColonialAge":{"population":-2484,"happiness":-3020},"IndustrialAge":{"population":-3036,"happiness":-3400},"ProgressiveEra":{"population":-3624,"happiness":-3740},"ModernEra":{"population":-4248,"happiness":-4000},"PostModernEra":{"population":-4896,"happiness":-4170},"ContemporaryEra":{"population":-5580,"happiness":-4840},"TomorrowEra":{"population":-6288,"happiness":-5880},"FutureEra":{"population":-7032,"happiness":-7040},"ArcticFuture":{"population":-7800,"happiness":-8190},"OceanicFuture":{"population":-8592,"happiness":-9460},"VirtualFuture":{"population":-9408,"happiness":-11300},"SpaceAgeMars":{"population":-14892,"happiness":-18070},"SpaceAgeAsteroidBelt":{"population":-16176,"happiness":-19640},"SpaceAgeVenus":{"population":-17484,"happiness":-21220},"SpaceAgeJupiterMoon":{"population":-18828,"happiness":-22850},"SpaceAgeTitan":{"population":-20196,"happiness":-24510},"SpaceAgeSpaceHub":{"population":-21564,"happiness":-26170}}, boosts: [{"type":"att_boost_attacker","value":9,"feature":"all"},{"type":"att_boost_defender","value":6,"feature":"all"},{"type":"def_boost_defender","value":12,"feature":"all"}] },
+    "W_MultiAge_FALL25B1": { prod: {"BronzeAge":{"happiness":4130},"IronAge":{"happiness":7120},"EarlyMiddleAge":{"happiness":7880},"HighMiddleAge":{"happiness":8790},"LateMiddleAge":{"happiness":9800},"ColonialAge":{"happiness":11520},"IndustrialAge":{"happiness":13000},"ProgressiveEra":{"happiness":14270},"ModernEra":{"happiness":15270},"PostModernEra":{"happiness":15910},"ContemporaryEra":{"happiness":18490},"TomorrowEra":{"happiness":22440},"FutureEra":{"happiness":26890},"ArcticFuture":{"happiness":31310},"OceanicFuture":{"happiness":36130},"VirtualFuture":{"happiness":43160},"SpaceAgeMars":{"happiness":69060},"SpaceAgeAsteroidBelt":{"happiness":75050},"SpaceAgeVenus":{"happiness":81080},"SpaceAgeJupiterMoon":{"happiness":87340},"SpaceAgeTitan":{"happiness":93670},"SpaceAgeSpaceHub":{"happiness":100000}} },
+    "W_MultiAge_FALL16A2": { prod: {"BronzeAge":{"population":-10},"IronAge":{"population":-19},"EarlyMiddleAge":{"population":-27},"HighMiddleAge":{"population":-35},"LateMiddleAge":{"population":-43},"ColonialAge":{"population":-51},"IndustrialAge":{"population":-59},"ProgressiveEra":{"population":-66},"ModernEra":{"population":-74},"PostModernEra":{"population":-81},"ContemporaryEra":{"population":-88},"TomorrowEra":{"population":-94},"FutureEra":{"population":-106},"ArcticFuture":{"population":-112},"OceanicFuture":{"population":-119},"VirtualFuture":{"population":-125},"SpaceAgeMars":{"population":-191},"SpaceAgeAsteroidBelt":{"population":-201},"SpaceAgeVenus":{"population":-210},"SpaceAgeJupiterMoon":{"population":-219},"SpaceAgeTitan":{"population":-227},"SpaceAgeSpaceHub":{"population":-235}} },
+    "W_MultiAge_FALL22A10": { prod: {"BronzeAge":{"population":340,"happiness":1620,"demandHappiness":340,"money_24h":1500,"supplies_24h":2160,"random_good_of_age_24h":27,"strategy_points_24h":29,"units_24h":8},"IronAge":{"population":731,"happiness":2790,"demandHappiness":731,"money_24h":3600,"supplies_24h":3730,"random_good_of_age_24h":27,"strategy_points_24h":29,"units_24h":8},"EarlyMiddleAge":{"population":1121,"happiness":3090,"demandHappiness":1121,"money_24h":6000,"supplies_24h":4120,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"HighMiddleAge":{"population":1575,"happiness":3450,"demandHappiness":1575,"money_24h":8400,"supplies_24h":4600,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"LateMiddleAge":{"population":2066,"happiness":3850,"demandHappiness":2066,"money_24h":11100,"supplies_24h":5130,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"ColonialAge":{"population":2608,"happiness":4520,"demandHappiness":2608,"money_24h":16900,"supplies_24h":6030,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"IndustrialAge":{"population":3188,"happiness":5100,"demandHappiness":3188,"money_24h":21100,"supplies_24h":6800,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"ProgressiveEra":{"population":3805,"happiness":5600,"demandHappiness":3805,"money_24h":25600,"supplies_24h":7470,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"ModernEra":{"population":4460,"happiness":5990,"demandHappiness":4460,"money_24h":31800,"supplies_24h":7990,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"PostModernEra":{"population":5141,"happiness":6240,"demandHappiness":5141,"money_24h":40000,"supplies_24h":8320,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"ContemporaryEra":{"population":5859,"happiness":7250,"demandHappiness":5859,"money_24h":52100,"supplies_24h":9670,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"TomorrowEra":{"population":6602,"happiness":8810,"demandHappiness":6602,"money_24h":60300,"supplies_24h":11740,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"FutureEra":{"population":7384,"happiness":10550,"demandHappiness":7384,"money_24h":69100,"supplies_24h":14070,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"ArcticFuture":{"population":8190,"happiness":12280,"demandHappiness":8190,"money_24h":78500,"supplies_24h":16380,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"OceanicFuture":{"population":9022,"happiness":14180,"demandHappiness":9022,"money_24h":88600,"supplies_24h":18900,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"VirtualFuture":{"population":9878,"happiness":16940,"demandHappiness":9878,"money_24h":99200,"supplies_24h":22580,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"SpaceAgeMars":{"population":15637,"happiness":27100,"demandHappiness":15637,"money_24h":165700,"supplies_24h":36130,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"SpaceAgeAsteroidBelt":{"population":16985,"happiness":29450,"demandHappiness":16985,"money_24h":183500,"supplies_24h":39260,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"SpaceAgeVenus":{"population":18358,"happiness":31820,"demandHappiness":18358,"money_24h":202300,"supplies_24h":42420,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"SpaceAgeJupiterMoon":{"population":19769,"happiness":34270,"demandHappiness":19769,"money_24h":222100,"supplies_24h":45700,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"SpaceAgeTitan":{"population":21206,"happiness":36760,"demandHappiness":21206,"money_24h":242800,"supplies_24h":49010,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8},"SpaceAgeSpaceHub":{"population":22643,"happiness":39250,"demandHappiness":22643,"money_24h":263500,"supplies_24h":52320,"random_good_of_age_24h":82,"strategy_points_24h":29,"units_24h":8}}, boosts: [{"type":"att_boost_attacker","value":27,"feature":"all"},{"type":"supply_production","value":37,"feature":"all"}] },
+    "W_MultiAge_FALL23A11": { prod: {"BronzeAge":{"population":290,"happiness":1850,"demandHappiness":290,"supplies_24h":2400,"money_24h":1800,"strategy_points_24h":21,"all_goods_of_age_24h":90,"units_24h":10},"IronAge":{"population":622,"happiness":3180,"demandHappiness":622,"supplies_24h":5700,"money_24h":4400,"strategy_points_24h":21,"all_goods_of_age_24h":90,"units_24h":10},"EarlyMiddleAge":{"population":954,"happiness":3520,"demandHappiness":954,"supplies_24h":9500,"money_24h":7400,"strategy_points_24h":21,"all_goods_of_age_24h":90,"units_24h":10},"HighMiddleAge":{"population":1339,"happiness":3930,"demandHappiness":1339,"supplies_24h":13200,"money_24h":10300,"strategy_points_24h":21,"all_goods_of_age_24h":90,"units_24h":10},"LateMiddleAge":{"population":1757,"happiness":4380,"demandHappiness":1757,"supplies_24h":17500,"money_24h":13600,"strategy_points_24h":21,"all_goods_of_age_24h":90,"units_24h":10},"ColonialAge":{"population":2217,"happiness":5150,"demandHappiness":2217,"supplies_24h":22200,"money_24h":20700,"strategy_points_24h":22,"all_goods_of_age_24h":90,"units_24h":10},"IndustrialAge":{"population":2710,"happiness":5810,"demandHappiness":2710,"supplies_24h":26900,"money_24h":25800,"strategy_points_24h":22,"all_goods_of_age_24h":90,"units_24h":10},"ProgressiveEra":{"population":3235,"happiness":6370,"demandHappiness":3235,"supplies_24h":31700,"money_24h":31300,"strategy_points_24h":22,"all_goods_of_age_24h":90,"units_24h":10},"ModernEra":{"population":3792,"happiness":6820,"demandHappiness":3792,"supplies_24h":36900,"money_24h":39000,"strategy_points_24h":22,"all_goods_of_age_24h":90,"units_24h":10},"PostModernEra":{"population":4370,"happiness":7110,"demandHappiness":4370,"supplies_24h":42100,"money_24h":49000,"strategy_points_24h":22,"all_goods_of_age_24h":90,"units_24h":10},"ContemporaryEra":{"population":4981,"happiness":8260,"demandHappiness":4981,"supplies_24h":47300,"money_24h":63800,"strategy_points_24h":23,"all_goods_of_age_24h":90,"units_24h":10},"TomorrowEra":{"population":5613,"happiness":10020,"demandHappiness":5613,"supplies_24h":52900,"money_24h":73900,"strategy_points_24h":23,"all_goods_of_age_24h":90,"units_24h":10},"FutureEra":{"population":6277,"happiness":12000,"demandHappiness":6277,"supplies_24h":58100,"money_24h":84700,"strategy_points_24h":23,"all_goods_of_age_24h":90,"units_24h":10},"ArcticFuture":{"population":6962,"happiness":13980,"demandHappiness":6962,"supplies_24h":63800,"money_24h":96200,"strategy_points_24h":23,"all_goods_of_age_24h":90,"units_24h":10},"OceanicFuture":{"population":7669,"happiness":16130,"demandHappiness":7669,"supplies_24h":69900,"money_24h":108500,"strategy_points_24h":23,"all_goods_of_age_24h":90,"units_24h":10},"VirtualFuture":{"population":8397,"happiness":19270,"demandHappiness":8397,"supplies_24h":75600,"money_24h":121500,"strategy_points_24h":24,"all_goods_of_age_24h":90,"units_24h":10},"SpaceAgeMars":{"population":13292,"happiness":30830,"demandHappiness":13292,"supplies_24h":122400,"money_24h":203000,"strategy_points_24h":24,"all_goods_of_age_24h":90,"units_24h":10},"SpaceAgeAsteroidBelt":{"population":14438,"happiness":33500,"demandHappiness":14438,"supplies_24h":131400,"money_24h":224800,"strategy_points_24h":24,"all_goods_of_age_24h":90,"units_24h":10},"SpaceAgeVenus":{"population":15605,"happiness":36190,"demandHappiness":15605,"supplies_24h":140800,"money_24h":247800,"strategy_points_24h":24,"all_goods_of_age_24h":90,"units_24h":10},"SpaceAgeJupiterMoon":{"population":16804,"happiness":38990,"demandHappiness":16804,"supplies_24h":149800,"money_24h":272000,"strategy_points_24h":24,"all_goods_of_age_24h":90,"units_24h":10},"SpaceAgeTitan":{"population":18025,"happiness":41810,"demandHappiness":18025,"supplies_24h":159200,"money_24h":297400,"strategy_points_24h":25,"all_goods_of_age_24h":90,"units_24h":10},"SpaceAgeSpaceHub":{"population":19246,"happiness":44630,"demandHappiness":19246,"supplies_24h":168600,"money_24h":322800,"strategy_points_24h":25,"all_goods_of_age_24h":90,"units_24h":10}}, boosts: [{"type":"att_boost_attacker","value":38,"feature":"all"},{"type":"att_boost_defender","value":40,"feature":"all"}] },
+    "W_MultiAge_FALL16A5": { prod: {"BronzeAge":{"population":-45},"IronAge":{"population":-88},"EarlyMiddleAge":{"population":-124},"HighMiddleAge":{"population":-161},"LateMiddleAge":{"population":-197},"ColonialAge":{"population":-235},"IndustrialAge":{"population":-269},"ProgressiveEra":{"population":-304},"ModernEra":{"population":-338},"PostModernEra":{"population":-370},"ContemporaryEra":{"population":-400},"TomorrowEra":{"population":-431},"FutureEra":{"population":-482},"ArcticFuture":{"population":-513},"OceanicFuture":{"population":-544},"VirtualFuture":{"population":-573},"SpaceAgeMars":{"population":-874},"SpaceAgeAsteroidBelt":{"population":-917},"SpaceAgeVenus":{"population":-959},"SpaceAgeJupiterMoon":{"population":-999},"SpaceAgeTitan":{"population":-1040},"SpaceAgeSpaceHub":{"population":-1076}} },
+    "W_MultiAge_FALL16A8": { prod: {"BronzeAge":{"population":-20},"IronAge":{"population":-40},"EarlyMiddleAge":{"population":-70},"HighMiddleAge":{"population":-100},"LateMiddleAge":{"population":-130},"ColonialAge":{"population":-160},"IndustrialAge":{"population":-200},"ProgressiveEra":{"population":-230},"ModernEra":{"population":-270},"PostModernEra":{"population":-320},"ContemporaryEra":{"population":-360},"TomorrowEra":{"population":-410},"FutureEra":{"population":-450},"ArcticFuture":{"population":-500},"OceanicFuture":{"population":-550},"VirtualFuture":{"population":-610},"SpaceAgeMars":{"population":-960},"SpaceAgeAsteroidBelt":{"population":-1040},"SpaceAgeVenus":{"population":-1130},"SpaceAgeJupiterMoon":{"population":-1210},"SpaceAgeTitan":{"population":-1300},"SpaceAgeSpaceHub":{"population":-1390}} },
+    "W_MultiAge_FALL23A1": { prod: {"BronzeAge":{"population":63,"happiness":430,"demandHappiness":63,"money_24h":800},"IronAge":{"population":134,"happiness":740,"demandHappiness":134,"money_24h":1900},"EarlyMiddleAge":{"population":206,"happiness":820,"demandHappiness":206,"money_24h":3200},"HighMiddleAge":{"population":289,"happiness":910,"demandHappiness":289,"money_24h":4400},"LateMiddleAge":{"population":379,"happiness":1010,"demandHappiness":379,"money_24h":5800},"ColonialAge":{"population":479,"happiness":1190,"demandHappiness":479,"money_24h":8900},"IndustrialAge":{"population":585,"happiness":1340,"demandHappiness":585,"money_24h":11100},"ProgressiveEra":{"population":698,"happiness":1470,"demandHappiness":698,"money_24h":13400},"ModernEra":{"population":818,"happiness":1580,"demandHappiness":818,"money_24h":16700},"PostModernEra":{"population":943,"happiness":1640,"demandHappiness":943,"money_24h":21000},"ContemporaryEra":{"population":1075,"happiness":1910,"demandHappiness":1075,"money_24h":27300},"TomorrowEra":{"population":1211,"happiness":2320,"demandHappiness":1211,"money_24h":31700},"FutureEra":{"population":1354,"happiness":2770,"demandHappiness":1354,"money_24h":36300},"ArcticFuture":{"population":1502,"happiness":3230,"demandHappiness":1502,"money_24h":41200},"OceanicFuture":{"population":1654,"happiness":3730,"demandHappiness":1654,"money_24h":46500},"VirtualFuture":{"population":1812,"happiness":4450,"demandHappiness":1812,"money_24h":52100},"SpaceAgeMars":{"population":2867,"happiness":7120,"demandHappiness":2867,"money_24h":87000},"SpaceAgeAsteroidBelt":{"population":3114,"happiness":7740,"demandHappiness":3114,"money_24h":96400},"SpaceAgeVenus":{"population":3366,"happiness":8360,"demandHappiness":3366,"money_24h":106200},"SpaceAgeJupiterMoon":{"population":3625,"happiness":9000,"demandHappiness":3625,"money_24h":116600},"SpaceAgeTitan":{"population":3888,"happiness":9650,"demandHappiness":3888,"money_24h":127500},"SpaceAgeSpaceHub":{"population":4151,"happiness":10300,"demandHappiness":4151,"money_24h":138400}} },
+    "W_MultiAge_FALL23A2": { prod: {"BronzeAge":{"population":86,"happiness":570,"demandHappiness":86,"supplies_24h":500,"money_24h":900},"IronAge":{"population":183,"happiness":980,"demandHappiness":183,"supplies_24h":1100,"money_24h":2100},"EarlyMiddleAge":{"population":281,"happiness":1090,"demandHappiness":281,"supplies_24h":1900,"money_24h":3600},"HighMiddleAge":{"population":394,"happiness":1210,"demandHappiness":394,"supplies_24h":2700,"money_24h":5000},"LateMiddleAge":{"population":517,"happiness":1350,"demandHappiness":517,"supplies_24h":3500,"money_24h":6600},"ColonialAge":{"population":653,"happiness":1590,"demandHappiness":653,"supplies_24h":4400,"money_24h":10100},"IndustrialAge":{"population":797,"happiness":1790,"demandHappiness":797,"supplies_24h":5400,"money_24h":12500},"ProgressiveEra":{"population":952,"happiness":1960,"demandHappiness":952,"supplies_24h":6300,"money_24h":15200},"ModernEra":{"population":1116,"happiness":2100,"demandHappiness":1116,"supplies_24h":7400,"money_24h":18900},"PostModernEra":{"population":1286,"happiness":2190,"demandHappiness":1286,"supplies_24h":8400,"money_24h":23800},"ContemporaryEra":{"population":1465,"happiness":2540,"demandHappiness":1465,"supplies_24h":9500,"money_24h":31000},"TomorrowEra":{"population":1651,"happiness":3090,"demandHappiness":1651,"supplies_24h":10600,"money_24h":35900},"FutureEra":{"population":1846,"happiness":3700,"demandHappiness":1846,"supplies_24h":11600,"money_24h":41100},"ArcticFuture":{"population":2048,"happiness":4300,"demandHappiness":2048,"supplies_24h":12800,"money_24h":46700},"OceanicFuture":{"population":2256,"happiness":4970,"demandHappiness":2256,"supplies_24h":14000,"money_24h":52700},"VirtualFuture":{"population":2470,"happiness":5930,"demandHappiness":2470,"supplies_24h":15100,"money_24h":59000},"SpaceAgeMars":{"population":3910,"happiness":9490,"demandHappiness":3910,"supplies_24h":24500,"money_24h":98600},"SpaceAgeAsteroidBelt":{"population":4247,"happiness":10310,"demandHappiness":4247,"supplies_24h":26300,"money_24h":109200},"SpaceAgeVenus":{"population":4590,"happiness":11140,"demandHappiness":4590,"supplies_24h":28200,"money_24h":120400},"SpaceAgeJupiterMoon":{"population":4943,"happiness":12000,"demandHappiness":4943,"supplies_24h":30000,"money_24h":132100},"SpaceAgeTitan":{"population":5302,"happiness":12870,"demandHappiness":5302,"supplies_24h":31900,"money_24h":144400},"SpaceAgeSpaceHub":{"population":5661,"happiness":13740,"demandHappiness":5661,"supplies_24h":33800,"money_24h":156700}} },
+    "W_MultiAge_FALL23A3": { prod: {"BronzeAge":{"population":108,"happiness":710,"demandHappiness":108,"supplies_24h":700,"money_24h":1000,"all_goods_of_age_24h":10},"IronAge":{"population":232,"happiness":1230,"demandHappiness":232,"supplies_24h":1600,"money_24h":2400,"all_goods_of_age_24h":10},"EarlyMiddleAge":{"population":356,"happiness":1360,"demandHappiness":356,"supplies_24h":2700,"money_24h":4000,"all_goods_of_age_24h":10},"HighMiddleAge":{"population":499,"happiness":1510,"demandHappiness":499,"supplies_24h":3800,"money_24h":5600,"all_goods_of_age_24h":10},"LateMiddleAge":{"population":655,"happiness":1690,"demandHappiness":655,"supplies_24h":5100,"money_24h":7400,"all_goods_of_age_24h":10},"ColonialAge":{"population":826,"happiness":1980,"demandHappiness":826,"supplies_24h":6400,"money_24h":11200,"all_goods_of_age_24h":10},"IndustrialAge":{"population":1010,"happiness":2240,"demandHappiness":1010,"supplies_24h":7800,"money_24h":14000,"all_goods_of_age_24h":10},"ProgressiveEra":{"population":1205,"happiness":2450,"demandHappiness":1205,"supplies_24h":9200,"money_24h":17000,"all_goods_of_age_24h":10},"ModernEra":{"population":1413,"happiness":2630,"demandHappiness":1413,"supplies_24h":10700,"money_24h":21200,"all_goods_of_age_24h":10},"PostModernEra":{"population":1628,"happiness":2740,"demandHappiness":1628,"supplies_24h":12200,"money_24h":26600,"all_goods_of_age_24h":10},"ContemporaryEra":{"population":1856,"happiness":3180,"demandHappiness":1856,"supplies_24h":13700,"money_24h":34600,"all_goods_of_age_24h":10},"TomorrowEra":{"population":2091,"happiness":3860,"demandHappiness":2091,"supplies_24h":15300,"money_24h":40100,"all_goods_of_age_24h":10},"FutureEra":{"population":2339,"happiness":4620,"demandHappiness":2339,"supplies_24h":16800,"money_24h":46000,"all_goods_of_age_24h":10},"ArcticFuture":{"population":2594,"happiness":5380,"demandHappiness":2594,"supplies_24h":18400,"money_24h":52200,"all_goods_of_age_24h":10},"OceanicFuture":{"population":2857,"happiness":6210,"demandHappiness":2857,"supplies_24h":20200,"money_24h":58900,"all_goods_of_age_24h":10},"VirtualFuture":{"population":3129,"happiness":7410,"demandHappiness":3129,"supplies_24h":21800,"money_24h":66000,"all_goods_of_age_24h":10},"SpaceAgeMars":{"population":4952,"happiness":11860,"demandHappiness":4952,"supplies_24h":35400,"money_24h":110200,"all_goods_of_age_24h":10},"SpaceAgeAsteroidBelt":{"population":5379,"happiness":12890,"demandHappiness":5379,"supplies_24h":38000,"money_24h":122000,"all_goods_of_age_24h":10},"SpaceAgeVenus":{"population":5814,"happiness":13920,"demandHappiness":5814,"supplies_24h":40700,"money_24h":134500,"all_goods_of_age_24h":10},"SpaceAgeJupiterMoon":{"population":6261,"happiness":15000,"demandHappiness":6261,"supplies_24h":43300,"money_24h":147700,"all_goods_of_age_24h":10},"SpaceAgeTitan":{"population":6716,"happiness":16090,"demandHappiness":6716,"supplies_24h":46000,"money_24h":161400,"all_goods_of_age_24h":10},"SpaceAgeSpaceHub":{"population":7171,"happiness":17180,"demandHappiness":7171,"supplies_24h":48700,"money_24h":175100,"all_goods_of_age_24h":10}} },
+    "W_MultiAge_FALL23A4": { prod: {"BronzeAge":{"population":131,"happiness":860,"demandHappiness":131,"supplies_24h":900,"money_24h":1100,"all_goods_of_age_24h":20},"IronAge":{"population":281,"happiness":1470,"demandHappiness":281,"supplies_24h":2100,"money_24h":2700,"all_goods_of_age_24h":20},"EarlyMiddleAge":{"population":430,"happiness":1630,"demandHappiness":430,"supplies_24h":3600,"money_24h":4400,"all_goods_of_age_24h":20},"HighMiddleAge":{"population":604,"happiness":1820,"demandHappiness":604,"supplies_24h":5000,"money_24h":6200,"all_goods_of_age_24h":20},"LateMiddleAge":{"population":793,"happiness":2020,"demandHappiness":793,"supplies_24h":6600,"money_24h":8200,"all_goods_of_age_24h":20},"ColonialAge":{"population":1000,"happiness":2380,"demandHappiness":1000,"supplies_24h":8400,"money_24h":12400,"all_goods_of_age_24h":20},"IndustrialAge":{"population":1222,"happiness":2680,"demandHappiness":1222,"supplies_24h":10200,"money_24h":15500,"all_goods_of_age_24h":20},"ProgressiveEra":{"population":1459,"happiness":2940,"demandHappiness":1459,"supplies_24h":12000,"money_24h":18800,"all_goods_of_age_24h":20},"ModernEra":{"population":1710,"happiness":3150,"demandHappiness":1710,"supplies_24h":13900,"money_24h":23400,"all_goods_of_age_24h":20},"PostModernEra":{"population":1971,"happiness":3280,"demandHappiness":1971,"supplies_24h":15900,"money_24h":29400,"all_goods_of_age_24h":20},"ContemporaryEra":{"population":2246,"happiness":3810,"demandHappiness":2246,"supplies_24h":17900,"money_24h":38300,"all_goods_of_age_24h":20},"TomorrowEra":{"population":2531,"happiness":4630,"demandHappiness":2531,"supplies_24h":20000,"money_24h":44300,"all_goods_of_age_24h":20},"FutureEra":{"population":2831,"happiness":5540,"demandHappiness":2831,"supplies_24h":22000,"money_24h":50800,"all_goods_of_age_24h":20},"ArcticFuture":{"population":3140,"happiness":6450,"demandHappiness":3140,"supplies_24h":24100,"money_24h":57700,"all_goods_of_age_24h":20},"OceanicFuture":{"population":3459,"happiness":7450,"demandHappiness":3459,"supplies_24h":26400,"money_24h":65100,"all_goods_of_age_24h":20},"VirtualFuture":{"population":3787,"happiness":8900,"demandHappiness":3787,"supplies_24h":28600,"money_24h":72900,"all_goods_of_age_24h":20},"SpaceAgeMars":{"population":5995,"happiness":14230,"demandHappiness":5995,"supplies_24h":46200,"money_24h":121800,"all_goods_of_age_24h":20},"SpaceAgeAsteroidBelt":{"population":6511,"happiness":15470,"demandHappiness":6511,"supplies_24h":49600,"money_24h":134900,"all_goods_of_age_24h":20},"SpaceAgeVenus":{"population":7038,"happiness":16710,"demandHappiness":7038,"supplies_24h":53200,"money_24h":148700,"all_goods_of_age_24h":20},"SpaceAgeJupiterMoon":{"population":7579,"happiness":18000,"demandHappiness":7579,"supplies_24h":56600,"money_24h":163200,"all_goods_of_age_24h":20},"SpaceAgeTitan":{"population":8129,"happiness":19300,"demandHappiness":8129,"supplies_24h":60200,"money_24h":178400,"all_goods_of_age_24h":20},"SpaceAgeSpaceHub":{"population":8679,"happiness":20600,"demandHappiness":8679,"supplies_24h":63800,"money_24h":193600,"all_goods_of_age_24h":20}} },
+    "W_MultiAge_FALL23A5": { prod: {"BronzeAge":{"population":154,"happiness":1000,"demandHappiness":154,"supplies_24h":1100,"money_24h":1200,"strategy_points_24h":1,"all_goods_of_age_24h":30},"IronAge":{"population":329,"happiness":1720,"demandHappiness":329,"supplies_24h":2700,"money_24h":2900,"strategy_points_24h":1,"all_goods_of_age_24h":30},"EarlyMiddleAge":{"population":505,"happiness":1900,"demandHappiness":505,"supplies_24h":4400,"money_24h":4800,"strategy_points_24h":1,"all_goods_of_age_24h":30},"HighMiddleAge":{"population":709,"happiness":2120,"demandHappiness":709,"supplies_24h":6200,"money_24h":6800,"strategy_points_24h":1,"all_goods_of_age_24h":30},"LateMiddleAge":{"population":930,"happiness":2360,"demandHappiness":930,"supplies_24h":8200,"money_24h":8900,"strategy_points_24h":1,"all_goods_of_age_24h":30},"ColonialAge":{"population":1174,"happiness":2770,"demandHappiness":1174,"supplies_24h":10400,"money_24h":13600,"strategy_points_24h":1,"all_goods_of_age_24h":30},"IndustrialAge":{"population":1435,"happiness":3130,"demandHappiness":1435,"supplies_24h":12600,"money_24h":17000,"strategy_points_24h":1,"all_goods_of_age_24h":30},"ProgressiveEra":{"population":1713,"happiness":3430,"demandHappiness":1713,"supplies_24h":14800,"money_24h":20600,"strategy_points_24h":1,"all_goods_of_age_24h":30},"ModernEra":{"population":2008,"happiness":3670,"demandHappiness":2008,"supplies_24h":17200,"money_24h":25600,"strategy_points_24h":1,"all_goods_of_age_24h":30},"PostModernEra":{"population":2314,"happiness":3830,"demandHappiness":2314,"supplies_24h":19600,"money_24h":32200,"strategy_points_24h":1,"all_goods_of_age_24h":30},"ContemporaryEra":{"population":2637,"happiness":4450,"demandHappiness":2637,"supplies_24h":22100,"money_24h":41900,"strategy_points_24h":1,"all_goods_of_age_24h":30},"TomorrowEra":{"population":2972,"happiness":5400,"demandHappiness":2972,"supplies_24h":24700,"money_24h":48500,"strategy_points_24h":1,"all_goods_of_age_24h":30},"FutureEra":{"population":3323,"happiness":6470,"demandHappiness":3323,"supplies_24h":27100,"money_24h":55600,"strategy_points_24h":1,"all_goods_of_age_24h":30},"ArcticFuture":{"population":3686,"happiness":7530,"demandHappiness":3686,"supplies_24h":29800,"money_24h":63200,"strategy_points_24h":1,"all_goods_of_age_24h":30},"OceanicFuture":{"population":4060,"happiness":8690,"demandHappiness":4060,"supplies_24h":32600,"money_24h":71300,"strategy_points_24h":1,"all_goods_of_age_24h":30},"VirtualFuture":{"population":4446,"happiness":10380,"demandHappiness":4446,"supplies_24h":35300,"money_24h":79900,"strategy_points_24h":1,"all_goods_of_age_24h":30},"SpaceAgeMars":{"population":7037,"happiness":16600,"demandHappiness":7037,"supplies_24h":57100,"money_24h":133400,"strategy_points_24h":1,"all_goods_of_age_24h":30},"SpaceAgeAsteroidBelt":{"population":7644,"happiness":18040,"demandHappiness":7644,"supplies_24h":61300,"money_24h":147700,"strategy_points_24h":1,"all_goods_of_age_24h":30},"SpaceAgeVenus":{"population":8262,"happiness":19490,"demandHappiness":8262,"supplies_24h":65700,"money_24h":162900,"strategy_points_24h":1,"all_goods_of_age_24h":30},"SpaceAgeJupiterMoon":{"population":8897,"happiness":21000,"demandHappiness":8897,"supplies_24h":69900,"money_24h":178800,"strategy_points_24h":1,"all_goods_of_age_24h":30},"SpaceAgeTitan":{"population":9543,"happiness":22520,"demandHappiness":9543,"supplies_24h":74300,"money_24h":195400,"strategy_points_24h":2,"all_goods_of_age_24h":30},"SpaceAgeSpaceHub":{"population":10189,"happiness":24040,"demandHappiness":10189,"supplies_24h":78700,"money_24h":212000,"strategy_points_24h":2,"all_goods_of_age_24h":30}} },
+    "W_MultiAge_FALL23A6": { prod: {"BronzeAge":{"population":176,"happiness":1140,"demandHappiness":176,"supplies_24h":1300,"money_24h":1300,"strategy_points_24h":2,"all_goods_of_age_24h":40},"IronAge":{"population":378,"happiness":1960,"demandHappiness":378,"supplies_24h":3200,"money_24h":3200,"strategy_points_24h":2,"all_goods_of_age_24h":40},"EarlyMiddleAge":{"population":580,"happiness":2170,"demandHappiness":580,"supplies_24h":5300,"money_24h":5300,"strategy_points_24h":2,"all_goods_of_age_24h":40},"HighMiddleAge":{"population":814,"happiness":2420,"demandHappiness":814,"supplies_24h":7400,"money_24h":7400,"strategy_points_24h":2,"all_goods_of_age_24h":40},"LateMiddleAge":{"population":1068,"happiness":2700,"demandHappiness":1068,"supplies_24h":9700,"money_24h":9700,"strategy_points_24h":2,"all_goods_of_age_24h":40},"ColonialAge":{"population":1348,"happiness":3170,"demandHappiness":1348,"supplies_24h":12300,"money_24h":14800,"strategy_points_24h":3,"all_goods_of_age_24h":40},"IndustrialAge":{"population":1648,"happiness":3570,"demandHappiness":1648,"supplies_24h":15000,"money_24h":18400,"strategy_points_24h":3,"all_goods_of_age_24h":40},"ProgressiveEra":{"population":1967,"happiness":3920,"demandHappiness":1967,"supplies_24h":17600,"money_24h":22400,"strategy_points_24h":3,"all_goods_of_age_24h":40},"ModernEra":{"population":2305,"happiness":4200,"demandHappiness":2305,"supplies_24h":20500,"money_24h":27800,"strategy_points_24h":3,"all_goods_of_age_24h":40},"PostModernEra":{"population":2657,"happiness":4370,"demandHappiness":2657,"supplies_24h":23400,"money_24h":35000,"strategy_points_24h":3,"all_goods_of_age_24h":40},"ContemporaryEra":{"population":3028,"happiness":5080,"demandHappiness":3028,"supplies_24h":26300,"money_24h":45600,"strategy_points_24h":4,"all_goods_of_age_24h":40},"TomorrowEra":{"population":3412,"happiness":6170,"demandHappiness":3412,"supplies_24h":29400,"money_24h":52800,"strategy_points_24h":4,"all_goods_of_age_24h":40},"FutureEra":{"population":3815,"happiness":7390,"demandHappiness":3815,"supplies_24h":32300,"money_24h":60500,"strategy_points_24h":4,"all_goods_of_age_24h":40},"ArcticFuture":{"population":4232,"happiness":8600,"demandHappiness":4232,"supplies_24h":35400,"money_24h":68700,"strategy_points_24h":4,"all_goods_of_age_24h":40},"OceanicFuture":{"population":4662,"happiness":9930,"demandHappiness":4662,"supplies_24h":38900,"money_24h":77500,"strategy_points_24h":4,"all_goods_of_age_24h":40},"VirtualFuture":{"population":5104,"happiness":11860,"demandHappiness":5104,"supplies_24h":42000,"money_24h":86800,"strategy_points_24h":5,"all_goods_of_age_24h":40},"SpaceAgeMars":{"population":8079,"happiness":18970,"demandHappiness":8079,"supplies_24h":68000,"money_24h":145000,"strategy_points_24h":5,"all_goods_of_age_24h":40},"SpaceAgeAsteroidBelt":{"population":8776,"happiness":20620,"demandHappiness":8776,"supplies_24h":73000,"money_24h":160600,"strategy_points_24h":5,"all_goods_of_age_24h":40},"SpaceAgeVenus":{"population":9486,"happiness":22280,"demandHappiness":9486,"supplies_24h":78200,"money_24h":177000,"strategy_points_24h":5,"all_goods_of_age_24h":40},"SpaceAgeJupiterMoon":{"population":10215,"happiness":24000,"demandHappiness":10215,"supplies_24h":83200,"money_24h":194300,"strategy_points_24h":5,"all_goods_of_age_24h":40},"SpaceAgeTitan":{"population":10957,"happiness":25730,"demandHappiness":10957,"supplies_24h":88500,"money_24h":212400,"strategy_points_24h":6,"all_goods_of_age_24h":40},"SpaceAgeSpaceHub":{"population":11699,"happiness":27460,"demandHappiness":11699,"supplies_24h":93800,"money_24h":230500,"strategy_points_24h":6,"all_goods_of_age_24h":40}} },
+    "W_MultiAge_FALL23A7": { prod: {"BronzeAge":{"population":199,"happiness":1280,"demandHappiness":199,"supplies_24h":1500,"money_24h":1400,"strategy_points_24h":7,"all_goods_of_age_24h":50},"IronAge":{"population":427,"happiness":2210,"demandHappiness":427,"supplies_24h":3700,"money_24h":3400,"strategy_points_24h":7,"all_goods_of_age_24h":50},"EarlyMiddleAge":{"population":655,"happiness":2440,"demandHappiness":655,"supplies_24h":6100,"money_24h":5700,"strategy_points_24h":7,"all_goods_of_age_24h":50},"HighMiddleAge":{"population":919,"happiness":2720,"demandHappiness":919,"supplies_24h":8500,"money_24h":7900,"strategy_points_24h":7,"all_goods_of_age_24h":50},"LateMiddleAge":{"population":1206,"happiness":3030,"demandHappiness":1206,"supplies_24h":11300,"money_24h":10500,"strategy_points_24h":7,"all_goods_of_age_24h":50},"ColonialAge":{"population":1522,"happiness":3570,"demandHappiness":1522,"supplies_24h":14300,"money_24h":16000,"strategy_points_24h":8,"all_goods_of_age_24h":50},"IndustrialAge":{"population":1860,"happiness":4020,"demandHappiness":1860,"supplies_24h":17400,"money_24h":19900,"strategy_points_24h":8,"all_goods_of_age_24h":50},"ProgressiveEra":{"population":2220,"happiness":4410,"demandHappiness":2220,"supplies_24h":20400,"money_24h":24200,"strategy_points_24h":8,"all_goods_of_age_24h":50},"ModernEra":{"population":2602,"happiness":4720,"demandHappiness":2602,"supplies_24h":23800,"money_24h":30100,"strategy_points_24h":8,"all_goods_of_age_24h":50},"PostModernEra":{"population":2999,"happiness":4920,"demandHappiness":2999,"supplies_24h":27100,"money_24h":37800,"strategy_points_24h":8,"all_goods_of_age_24h":50},"ContemporaryEra":{"population":3418,"happiness":5720,"demandHappiness":3418,"supplies_24h":30500,"money_24h":49200,"strategy_points_24h":9,"all_goods_of_age_24h":50},"TomorrowEra":{"population":3852,"happiness":6940,"demandHappiness":3852,"supplies_24h":34100,"money_24h":57000,"strategy_points_24h":9,"all_goods_of_age_24h":50},"FutureEra":{"population":4308,"happiness":8310,"demandHappiness":4308,"supplies_24h":37500,"money_24h":65300,"strategy_points_24h":9,"all_goods_of_age_24h":50},"ArcticFuture":{"population":4778,"happiness":9680,"demandHappiness":4778,"supplies_24h":41100,"money_24h":74200,"strategy_points_24h":9,"all_goods_of_age_24h":50},"OceanicFuture":{"population":5263,"happiness":11170,"demandHappiness":5263,"supplies_24h":45100,"money_24h":83700,"strategy_points_24h":9,"all_goods_of_age_24h":50},"VirtualFuture":{"population":5763,"happiness":13340,"demandHappiness":5763,"supplies_24h":48700,"money_24h":93700,"strategy_points_24h":10,"all_goods_of_age_24h":50},"SpaceAgeMars":{"population":9122,"happiness":21340,"demandHappiness":9122,"supplies_24h":78900,"money_24h":156600,"strategy_points_24h":10,"all_goods_of_age_24h":50},"SpaceAgeAsteroidBelt":{"population":9908,"happiness":23200,"demandHappiness":9908,"supplies_24h":84700,"money_24h":173400,"strategy_points_24h":10,"all_goods_of_age_24h":50},"SpaceAgeVenus":{"population":10709,"happiness":25060,"demandHappiness":10709,"supplies_24h":90700,"money_24h":191200,"strategy_points_24h":10,"all_goods_of_age_24h":50},"SpaceAgeJupiterMoon":{"population":11533,"happiness":26990,"demandHappiness":11533,"supplies_24h":96500,"money_24h":209800,"strategy_points_24h":10,"all_goods_of_age_24h":50},"SpaceAgeTitan":{"population":12371,"happiness":28950,"demandHappiness":12371,"supplies_24h":102600,"money_24h":229400,"strategy_points_24h":11,"all_goods_of_age_24h":50},"SpaceAgeSpaceHub":{"population":13209,"happiness":30910,"demandHappiness":13209,"supplies_24h":108700,"money_24h":249000,"strategy_points_24h":11,"all_goods_of_age_24h":50}}, boosts: [{"type":"att_boost_defender","value":6,"feature":"all"}] },
+    "W_MultiAge_FALL23A8": { prod: {"BronzeAge":{"population":222,"happiness":1420,"demandHappiness":222,"supplies_24h":1700,"money_24h":1500,"strategy_points_24h":12,"all_goods_of_age_24h":60},"IronAge":{"population":476,"happiness":2450,"demandHappiness":476,"supplies_24h":4200,"money_24h":3700,"strategy_points_24h":12,"all_goods_of_age_24h":60},"EarlyMiddleAge":{"population":729,"happiness":2710,"demandHappiness":729,"supplies_24h":6900,"money_24h":6100,"strategy_points_24h":12,"all_goods_of_age_24h":60},"HighMiddleAge":{"population":1024,"happiness":3020,"demandHappiness":1024,"supplies_24h":9700,"money_24h":8500,"strategy_points_24h":12,"all_goods_of_age_24h":60},"LateMiddleAge":{"population":1344,"happiness":3370,"demandHappiness":1344,"supplies_24h":12800,"money_24h":11300,"strategy_points_24h":12,"all_goods_of_age_24h":60},"ColonialAge":{"population":1696,"happiness":3960,"demandHappiness":1696,"supplies_24h":16300,"money_24h":17200,"strategy_points_24h":13,"all_goods_of_age_24h":60},"IndustrialAge":{"population":2073,"happiness":4470,"demandHappiness":2073,"supplies_24h":19800,"money_24h":21400,"strategy_points_24h":13,"all_goods_of_age_24h":60},"ProgressiveEra":{"population":2474,"happiness":4900,"demandHappiness":2474,"supplies_24h":23200,"money_24h":25900,"strategy_points_24h":13,"all_goods_of_age_24h":60},"ModernEra":{"population":2900,"happiness":5250,"demandHappiness":2900,"supplies_24h":27000,"money_24h":32300,"strategy_points_24h":13,"all_goods_of_age_24h":60},"PostModernEra":{"population":3342,"happiness":5470,"demandHappiness":3342,"supplies_24h":30800,"money_24h":40600,"strategy_points_24h":13,"all_goods_of_age_24h":60},"ContemporaryEra":{"population":3809,"happiness":6350,"demandHappiness":3809,"supplies_24h":34700,"money_24h":52900,"strategy_points_24h":14,"all_goods_of_age_24h":60},"TomorrowEra":{"population":4292,"happiness":7710,"demandHappiness":4292,"supplies_24h":38800,"money_24h":61200,"strategy_points_24h":14,"all_goods_of_age_24h":60},"FutureEra":{"population":4800,"happiness":9240,"demandHappiness":4800,"supplies_24h":42600,"money_24h":70200,"strategy_points_24h":14,"all_goods_of_age_24h":60},"ArcticFuture":{"population":5324,"happiness":10750,"demandHappiness":5324,"supplies_24h":46800,"money_24h":79700,"strategy_points_24h":14,"all_goods_of_age_24h":60},"OceanicFuture":{"population":5865,"happiness":12410,"demandHappiness":5865,"supplies_24h":51300,"money_24h":89900,"strategy_points_24h":14,"all_goods_of_age_24h":60},"VirtualFuture":{"population":6421,"happiness":14820,"demandHappiness":6421,"supplies_24h":55400,"money_24h":100700,"strategy_points_24h":15,"all_goods_of_age_24h":60},"SpaceAgeMars":{"population":10164,"happiness":23720,"demandHappiness":10164,"supplies_24h":89700,"money_24h":168200,"strategy_points_24h":15,"all_goods_of_age_24h":60},"SpaceAgeAsteroidBelt":{"population":11041,"happiness":25770,"demandHappiness":11041,"supplies_24h":96300,"money_24h":186300,"strategy_points_24h":15,"all_goods_of_age_24h":60},"SpaceAgeVenus":{"population":11933,"happiness":27840,"demandHappiness":11933,"supplies_24h":103300,"money_24h":205300,"strategy_points_24h":15,"all_goods_of_age_24h":60},"SpaceAgeJupiterMoon":{"population":12851,"happiness":29990,"demandHappiness":12851,"supplies_24h":109800,"money_24h":225400,"strategy_points_24h":15,"all_goods_of_age_24h":60},"SpaceAgeTitan":{"population":13784,"happiness":32170,"demandHappiness":13784,"supplies_24h":116800,"money_24h":246400,"strategy_points_24h":16,"all_goods_of_age_24h":60},"SpaceAgeSpaceHub":{"population":14717,"happiness":34350,"demandHappiness":14717,"supplies_24h":123800,"money_24h":267400,"strategy_points_24h":16,"all_goods_of_age_24h":60}}, boosts: [{"type":"att_boost_attacker","value":11,"feature":"all"},{"type":"att_boost_defender","value":16,"feature":"all"}] },
+    "W_MultiAge_FALL23A9": { prod: {"BronzeAge":{"population":244,"happiness":1570,"demandHappiness":244,"supplies_24h":1900,"money_24h":1600,"strategy_points_24h":17,"all_goods_of_age_24h":70,"units_24h":3},"IronAge":{"population":524,"happiness":2700,"demandHappiness":524,"supplies_24h":4700,"money_24h":3900,"strategy_points_24h":17,"all_goods_of_age_24h":70,"units_24h":3},"EarlyMiddleAge":{"population":804,"happiness":2980,"demandHappiness":804,"supplies_24h":7800,"money_24h":6500,"strategy_points_24h":17,"all_goods_of_age_24h":70,"units_24h":3},"HighMiddleAge":{"population":1129,"happiness":3320,"demandHappiness":1129,"supplies_24h":10900,"money_24h":9100,"strategy_points_24h":17,"all_goods_of_age_24h":70,"units_24h":3},"LateMiddleAge":{"population":1481,"happiness":3710,"demandHappiness":1481,"supplies_24h":14400,"money_24h":12000,"strategy_points_24h":17,"all_goods_of_age_24h":70,"units_24h":3},"ColonialAge":{"population":1870,"happiness":4360,"demandHappiness":1870,"supplies_24h":18300,"money_24h":18300,"strategy_points_24h":18,"all_goods_of_age_24h":70,"units_24h":3},"IndustrialAge":{"population":2285,"happiness":4910,"demandHappiness":2285,"supplies_24h":22100,"money_24h":22900,"strategy_points_24h":18,"all_goods_of_age_24h":70,"units_24h":3},"ProgressiveEra":{"population":2728,"happiness":5390,"demandHappiness":2728,"supplies_24h":26000,"money_24h":27700,"strategy_points_24h":18,"all_goods_of_age_24h":70,"units_24h":3},"ModernEra":{"population":3197,"happiness":5770,"demandHappiness":3197,"supplies_24h":30300,"money_24h":34500,"strategy_points_24h":18,"all_goods_of_age_24h":70,"units_24h":3},"PostModernEra":{"population":3685,"happiness":6010,"demandHappiness":3685,"supplies_24h":34600,"money_24h":43400,"strategy_points_24h":18,"all_goods_of_age_24h":70,"units_24h":3},"ContemporaryEra":{"population":4199,"happiness":6990,"demandHappiness":4199,"supplies_24h":38900,"money_24h":56500,"strategy_points_24h":19,"all_goods_of_age_24h":70,"units_24h":3},"TomorrowEra":{"population":4732,"happiness":8480,"demandHappiness":4732,"supplies_24h":43500,"money_24h":65400,"strategy_points_24h":19,"all_goods_of_age_24h":70,"units_24h":3},"FutureEra":{"population":5292,"happiness":10160,"demandHappiness":5292,"supplies_24h":47800,"money_24h":75000,"strategy_points_24h":19,"all_goods_of_age_24h":70,"units_24h":3},"ArcticFuture":{"population":5870,"happiness":11830,"demandHappiness":5870,"supplies_24h":52500,"money_24h":85200,"strategy_points_24h":19,"all_goods_of_age_24h":70,"units_24h":3},"OceanicFuture":{"population":6466,"happiness":13650,"demandHappiness":6466,"supplies_24h":57500,"money_24h":96100,"strategy_points_24h":19,"all_goods_of_age_24h":70,"units_24h":3},"VirtualFuture":{"population":7080,"happiness":16310,"demandHappiness":7080,"supplies_24h":62200,"money_24h":107600,"strategy_points_24h":20,"all_goods_of_age_24h":70,"units_24h":3},"SpaceAgeMars":{"population":11207,"happiness":26090,"demandHappiness":11207,"supplies_24h":100600,"money_24h":179800,"strategy_points_24h":20,"all_goods_of_age_24h":70,"units_24h":3},"SpaceAgeAsteroidBelt":{"population":12173,"happiness":28350,"demandHappiness":12173,"supplies_24h":108000,"money_24h":199100,"strategy_points_24h":20,"all_goods_of_age_24h":70,"units_24h":3},"SpaceAgeVenus":{"population":13157,"happiness":30630,"demandHappiness":13157,"supplies_24h":115800,"money_24h":219500,"strategy_points_24h":20,"all_goods_of_age_24h":70,"units_24h":3},"SpaceAgeJupiterMoon":{"population":14169,"happiness":32990,"demandHappiness":14169,"supplies_24h":123200,"money_24h":240900,"strategy_points_24h":20,"all_goods_of_age_24h":70,"units_24h":3},"SpaceAgeTitan":{"population":15198,"happiness":35380,"demandHappiness":15198,"supplies_24h":130900,"money_24h":263400,"strategy_points_24h":21,"all_goods_of_age_24h":70,"units_24h":3},"SpaceAgeSpaceHub":{"population":16227,"happiness":37770,"demandHappiness":16227,"supplies_24h":138600,"money_24h":285900,"strategy_points_24h":21,"all_goods_of_age_24h":70,"units_24h":3}}, boosts: [{"type":"att_boost_attacker","value":26,"feature":"all"},{"type":"att_boost_defender","value":26,"feature":"all"}] },
+};
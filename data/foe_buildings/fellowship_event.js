@@ -0,0 +1,64 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 60 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_FELL24D1": { prod: {"BronzeAge":{"supplies_24h":7420,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"IronAge":{"supplies_24h":17800,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"EarlyMiddleAge":{"supplies_24h":29670,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"HighMiddleAge":{"supplies_24h":41540,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"LateMiddleAge":{"supplies_24h":54900,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"ColonialAge":{"supplies_24h":69730,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"IndustrialAge":{"supplies_24h":84570,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"ProgressiveEra":{"supplies_24h":99410,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"ModernEra":{"supplies_24h":115730,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"PostModernEra":{"supplies_24h":132050,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"ContemporaryEra":{"supplies_24h":148370,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"TomorrowEra":{"supplies_24h":166170,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"FutureEra":{"supplies_24h":182490,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"ArcticFuture":{"supplies_24h":200300,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"OceanicFuture":{"supplies_24h":219580,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"VirtualFuture":{"supplies_24h":237390,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"SpaceAgeMars":{"supplies_24h":384270,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"SpaceAgeAsteroidBelt":{"supplies_24h":412460,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"SpaceAgeVenus":{"supplies_24h":442140,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"SpaceAgeJupiterMoon":{"supplies_24h":470330,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"SpaceAgeTitan":{"supplies_24h":500000,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375},"SpaceAgeSpaceHub":{"supplies_24h":529670,"strategy_points_24h":170,"all_goods_of_previous_age_24h":375}}, boosts: [{"type":"att_def_boost_attacker","value":80,"feature":"all"},{"type":"att_def_boost_attacker","value":120,"feature":"battleground"},{"type":"att_boost_defender","value":25,"feature":"guild_raids"}] },
+    "W_MultiAge_FELL25B1": { prod: {"BronzeAge":{"population":-240,"happiness":830,"medals_24h":180,"strategy_points_24h":90},"IronAge":{"population":-520,"happiness":1420,"medals_24h":230,"strategy_points_24h":90},"EarlyMiddleAge":{"population":-790,"happiness":1580,"medals_24h":280,"strategy_points_24h":90},"HighMiddleAge":{"population":-1110,"happiness":1760,"medals_24h":330,"strategy_points_24h":90},"LateMiddleAge":{"population":-1460,"happiness":1960,"medals_24h":380,"strategy_points_24h":90},"ColonialAge":{"population":-1840,"happiness":2300,"medals_24h":450,"strategy_points_24h":90},"IndustrialAge":{"population":-2250,"happiness":2600,"medals_24h":630,"strategy_points_24h":90},"ProgressiveEra":{"population":-2690,"happiness":2850,"medals_24h":880,"strategy_points_24h":90},"ModernEra":{"population":-3150,"happiness":3050,"medals_24h":1250,"strategy_points_24h":90},"PostModernEra":{"population":-3630,"happiness":3180,"medals_24h":1750,"strategy_points_24h":90},"ContemporaryEra":{"population":-4140,"happiness":3700,"medals_24h":2500,"strategy_points_24h":90},"TomorrowEra":{"population":-4670,"happiness":4490,"medals_24h":3380,"strategy_points_24h":90},"FutureEra":{"population":-5220,"happiness":5380,"medals_24h":4130,"strategy_points_24h":90},"ArcticFuture":{"population":-5790,"happiness":6260,"medals_24h":5000,"strategy_points_24h":90},"OceanicFuture":{"population":-6380,"happiness":7230,"medals_24h":5750,"strategy_points_24h":90},"VirtualFuture":{"population":-6980,"happiness":8630,"medals_24h":7000,"strategy_points_24h":90},"SpaceAgeMars":{"population":-11050,"happiness":13810,"medals_24h":8500,"strategy_points_24h":90},"SpaceAgeAsteroidBelt":{"population":-12000,"happiness":15010,"medals_24h":10000,"strategy_points_24h":90},"SpaceAgeVenus":{"population":-12970,"happiness":16220,"medals_24h":11500,"strategy_points_24h":90},"SpaceAgeJupiterMoon":{"population":-13970,"happiness":17470,"medals_24h":13000,"strategy_points_24h":90},"SpaceAgeTitan":{"population":-14980,"happiness":18730,"medals_24h":14500,"strategy_points_24h":90},"SpaceAgeSpaceHub":{"population":-16000,"happiness":20000,"medals_24h":16000,"strategy_points_24h":90}}, boosts: [{"type":"def_boost_attacker","value":75,"feature":"guild_expedition"},{"type":"def_boost_defender","value":75,"feature":"guild_expedition"}] },
+    "W_MultiAge_FELL24E1": { prod: {"BronzeAge":{"population":450,"happiness":1850,"demandHappiness":450,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"IronAge":{"population":960,"happiness":3190,"demandHappiness":960,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"EarlyMiddleAge":{"population":1480,"happiness":3530,"demandHappiness":1480,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"HighMiddleAge":{"population":2080,"happiness":3940,"demandHappiness":2080,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"LateMiddleAge":{"population":2730,"happiness":4390,"demandHappiness":2730,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"ColonialAge":{"population":3440,"happiness":5170,"demandHappiness":3440,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"IndustrialAge":{"population":4210,"happiness":5830,"demandHappiness":4210,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"ProgressiveEra":{"population":5020,"happiness":6400,"demandHappiness":5020,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"ModernEra":{"population":5890,"happiness":6850,"demandHappiness":5890,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"PostModernEra":{"population":6790,"happiness":7130,"demandHappiness":6790,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"ContemporaryEra":{"population":7740,"happiness":8290,"demandHappiness":7740,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"TomorrowEra":{"population":8720,"happiness":10060,"demandHappiness":8720,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"FutureEra":{"population":9750,"happiness":12050,"demandHappiness":9750,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"ArcticFuture":{"population":10810,"happiness":14040,"demandHappiness":10810,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"OceanicFuture":{"population":11910,"happiness":16200,"demandHappiness":11910,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"VirtualFuture":{"population":13040,"happiness":19350,"demandHappiness":13040,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"SpaceAgeMars":{"population":20650,"happiness":30960,"demandHappiness":20650,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"SpaceAgeAsteroidBelt":{"population":22430,"happiness":33650,"demandHappiness":22430,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"SpaceAgeVenus":{"population":24240,"happiness":36350,"demandHappiness":24240,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"SpaceAgeJupiterMoon":{"population":26100,"happiness":39160,"demandHappiness":26100,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"SpaceAgeTitan":{"population":28000,"happiness":42000,"demandHappiness":28000,"strategy_points_24h":25,"all_goods_of_next_age_24h":50},"SpaceAgeSpaceHub":{"population":29900,"happiness":44840,"demandHappiness":29900,"strategy_points_24h":25,"all_goods_of_next_age_24h":50}}, boosts: [{"type":"att_boost_attacker","value":12,"feature":"battleground"},{"type":"def_boost_attacker","value":24,"feature":"battleground"},{"type":"att_def_boost_attacker","value":18,"feature":"all"},{"type":"guild_raids_action_points_collection","value":50,"feature":"all"}] },
+    "W_MultiAge_FELL25B2": { prod: {"BronzeAge":{"population":-240,"happiness":1820,"medals_24h":350,"strategy_points_24h":200},"IronAge":{"population":-520,"happiness":3130,"medals_24h":450,"strategy_points_24h":200},"EarlyMiddleAge":{"population":-790,"happiness":3470,"medals_24h":550,"strategy_points_24h":200},"HighMiddleAge":{"population":-1110,"happiness":3870,"medals_24h":650,"strategy_points_24h":200},"LateMiddleAge":{"population":-1460,"happiness":4310,"medals_24h":750,"strategy_points_24h":200},"ColonialAge":{"population":-1840,"happiness":5070,"medals_24h":900,"strategy_points_24h":200},"IndustrialAge":{"population":-2250,"happiness":5720,"medals_24h":1250,"strategy_points_24h":200},"ProgressiveEra":{"population":-2690,"happiness":6280,"medals_24h":1750,"strategy_points_24h":200},"ModernEra":{"population":-3150,"happiness":6720,"medals_24h":2500,"strategy_points_24h":200},"PostModernEra":{"population":-3630,"happiness":7000,"medals_24h":3500,"strategy_points_24h":200},"ContemporaryEra":{"population":-4140,"happiness":8130,"medals_24h":5000,"strategy_points_24h":200},"TomorrowEra":{"population":-4670,"happiness":9870,"medals_24h":6750,"strategy_points_24h":200},"FutureEra":{"population":-5220,"happiness":11830,"medals_24h":8250,"strategy_points_24h":200},"ArcticFuture":{"population":-5790,"happiness":13780,"medals_24h":10000,"strategy_points_24h":200},"OceanicFuture":{"population":-6380,"happiness":15900,"medals_24h":11500,"strategy_points_24h":200},"VirtualFuture":{"population":-6980,"happiness":18990,"medals_24h":14000,"strategy_points_24h":200},"SpaceAgeMars":{"population":-11050,"happiness":30390,"medals_24h":17000,"strategy_points_24h":200},"SpaceAgeAsteroidBelt":{"population":-12000,"happiness":33020,"medals_24h":20000,"strategy_points_24h":200},"SpaceAgeVenus":{"population":-12970,"happiness":35680,"medals_24h":23000,"strategy_points_24h":200},"SpaceAgeJupiterMoon":{"population":-13970,"happiness":38430,"medals_24h":26000,"strategy_points_24h":200},"SpaceAgeTitan":{"population":-14980,"happiness":41220,"medals_24h":29000,"strategy_points_24h":200},"SpaceAgeSpaceHub":{"population":-16000,"happiness":44000,"medals_24h":32000,"strategy_points_24h":200}}, boosts: [{"type":"def_boost_attacker","value":185,"feature":"guild_expedition"},{"type":"att_boost_defender","value":32,"feature":"guild_raids"},{"type":"def_boost_defender","value":185,"feature":"guild_expedition"},{"type":"guild_raids_coins_start","value":20000,"feature":"all"},{"type":"guild_raids_supplies_start","value":20000,"feature":"all"},{"type":"guild_raids_units_start","value":5,"feature":"all"}] },
+    "W_MultiAge_FELL24C2": { prod: {"BronzeAge":{"population":-190,"money_24h":2970,"strategy_points_24h":90,"random_good_of_age_24h":45},"IronAge":{"population":-410,"money_24h":7120,"strategy_points_24h":90,"random_good_of_age_24h":45},"EarlyMiddleAge":{"population":-630,"money_24h":11860,"strategy_points_24h":90,"random_good_of_age_24h":45},"HighMiddleAge":{"population":-890,"money_24h":16610,"strategy_points_24h":90,"random_good_of_age_24h":45},"LateMiddleAge":{"population":-1170,"money_24h":21950,"strategy_points_24h":90,"random_good_of_age_24h":45},"ColonialAge":{"population":-1480,"money_24h":33430,"strategy_points_24h":90,"random_good_of_age_24h":45},"IndustrialAge":{"population":-1800,"money_24h":41640,"strategy_points_24h":90,"random_good_of_age_24h":45},"ProgressiveEra":{"population":-2150,"money_24h":50540,"strategy_points_24h":90,"random_good_of_age_24h":45},"ModernEra":{"population":-2520,"money_24h":62880,"strategy_points_24h":90,"random_good_of_age_24h":45},"PostModernEra":{"population":-2910,"money_24h":79100,"strategy_points_24h":90,"random_good_of_age_24h":45},"ContemporaryEra":{"population":-3320,"money_24h":102980,"strategy_points_24h":90,"random_good_of_age_24h":45},"TomorrowEra":{"population":-3740,"money_24h":119230,"strategy_points_24h":90,"random_good_of_age_24h":45},"FutureEra":{"population":-4180,"money_24h":136670,"strategy_points_24h":90,"random_good_of_age_24h":45},"ArcticFuture":{"population":-4630,"money_24h":155290,"strategy_points_24h":90,"random_good_of_age_24h":45},"OceanicFuture":{"population":-5110,"money_24h":175110,"strategy_points_24h":90,"random_good_of_age_24h":45},"VirtualFuture":{"population":-5590,"money_24h":196130,"strategy_points_24h":90,"random_good_of_age_24h":45},"SpaceAgeMars":{"population":-8850,"money_24h":327610,"strategy_points_24h":90,"random_good_of_age_24h":45},"SpaceAgeAsteroidBelt":{"population":-9610,"money_24h":362880,"strategy_points_24h":90,"random_good_of_age_24h":45},"SpaceAgeVenus":{"population":-10390,"money_24h":400010,"strategy_points_24h":90,"random_good_of_age_24h":45},"SpaceAgeJupiterMoon":{"population":-11190,"money_24h":439040,"strategy_points_24h":90,"random_good_of_age_24h":45},"SpaceAgeTitan":{"population":-12000,"money_24h":480000,"strategy_points_24h":90,"random_good_of_age_24h":45},"SpaceAgeSpaceHub":{"population":-12810,"money_24h":520960,"strategy_points_24h":90,"random_good_of_age_24h":45}}, boosts: [{"type":"att_boost_attacker","value":80,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":90,"feature":"all"},{"type":"att_def_boost_defender","value":130,"feature":"guild_expedition"},{"type":"coin_production","value":36,"feature":"all"},{"type":"guild_raids_units_start","value":5,"feature":"all"},{"type":"guild_raids_coins_start","value":20000,"feature":"all"},{"type":"guild_raids_coins_production","value":4,"feature":"all"}] },
+    "W_MultiAge_FELL25C2": { prod: {"BronzeAge":{"population":-270,"medals_24h":390,"strategy_points_24h":200},"IronAge":{"population":-580,"medals_24h":510,"strategy_points_24h":200},"EarlyMiddleAge":{"population":-890,"medals_24h":620,"strategy_points_24h":200},"HighMiddleAge":{"population":-1250,"medals_24h":730,"strategy_points_24h":200},"LateMiddleAge":{"population":-1640,"medals_24h":840,"strategy_points_24h":200},"ColonialAge":{"population":-2070,"medals_24h":1010,"strategy_points_24h":200},"IndustrialAge":{"population":-2530,"medals_24h":1410,"strategy_points_24h":200},"ProgressiveEra":{"population":-3030,"medals_24h":1970,"strategy_points_24h":200},"ModernEra":{"population":-3550,"medals_24h":2810,"strategy_points_24h":200},"PostModernEra":{"population":-4090,"medals_24h":3940,"strategy_points_24h":200},"ContemporaryEra":{"population":-4660,"medals_24h":5630,"strategy_points_24h":200},"TomorrowEra":{"population":-5250,"medals_24h":7590,"strategy_points_24h":200},"FutureEra":{"population":-5870,"medals_24h":9280,"strategy_points_24h":200},"ArcticFuture":{"population":-6510,"medals_24h":11250,"strategy_points_24h":200},"OceanicFuture":{"population":-7170,"medals_24h":12940,"strategy_points_24h":200},"VirtualFuture":{"population":-7850,"medals_24h":15750,"strategy_points_24h":200},"SpaceAgeMars":{"population":-12430,"medals_24h":19130,"strategy_points_24h":200},"SpaceAgeAsteroidBelt":{"population":-13500,"medals_24h":22500,"strategy_points_24h":200},"SpaceAgeVenus":{"population":-14590,"medals_24h":25880,"strategy_points_24h":200},"SpaceAgeJupiterMoon":{"population":-15720,"medals_24h":29250,"strategy_points_24h":200},"SpaceAgeTitan":{"population":-16860,"medals_24h":32630,"strategy_points_24h":200},"SpaceAgeSpaceHub":{"population":-18000,"medals_24h":36000,"strategy_points_24h":200}}, boosts: [{"type":"att_def_boost_attacker","value":80,"feature":"battleground"},{"type":"def_boost_defender","value":45,"feature":"guild_raids"},{"type":"guild_raids_coins_production","value":5,"feature":"all"},{"type":"guild_raids_supplies_production","value":5,"feature":"all"},{"type":"guild_raids_goods_start","value":10,"feature":"all"}] },
+    "W_MultiAge_FELL24B2": { prod: {"BronzeAge":{"population":-190,"supplies_24h":3560,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"IronAge":{"population":-410,"supplies_24h":8550,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"EarlyMiddleAge":{"population":-630,"supplies_24h":14240,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"HighMiddleAge":{"population":-890,"supplies_24h":19940,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"LateMiddleAge":{"population":-1170,"supplies_24h":26350,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"ColonialAge":{"population":-1480,"supplies_24h":33470,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"IndustrialAge":{"population":-1800,"supplies_24h":40590,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"ProgressiveEra":{"population":-2150,"supplies_24h":47720,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"ModernEra":{"population":-2520,"supplies_24h":55550,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"PostModernEra":{"population":-2910,"supplies_24h":63380,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"ContemporaryEra":{"population":-3320,"supplies_24h":71220,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"TomorrowEra":{"population":-3740,"supplies_24h":79760,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"FutureEra":{"population":-4180,"supplies_24h":87600,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"ArcticFuture":{"population":-4630,"supplies_24h":96140,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"OceanicFuture":{"population":-5110,"supplies_24h":105400,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"VirtualFuture":{"population":-5590,"supplies_24h":113950,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"SpaceAgeMars":{"population":-8850,"supplies_24h":184450,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"SpaceAgeAsteroidBelt":{"population":-9610,"supplies_24h":197980,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"SpaceAgeVenus":{"population":-10390,"supplies_24h":212230,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"SpaceAgeJupiterMoon":{"population":-11190,"supplies_24h":225760,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"SpaceAgeTitan":{"population":-12000,"supplies_24h":240000,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120},"SpaceAgeSpaceHub":{"population":-12810,"supplies_24h":254240,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":120}}, boosts: [{"type":"att_boost_attacker","value":30,"feature":"all"},{"type":"att_boost_attacker","value":40,"feature":"battleground"},{"type":"att_boost_defender","value":60,"feature":"battleground"},{"type":"supply_production","value":36,"feature":"all"},{"type":"guild_raids_goods_start","value":10,"feature":"all"},{"type":"guild_raids_supplies_start","value":20000,"feature":"all"},{"type":"guild_raids_supplies_production","value":4,"feature":"all"}] },
+    "W_MultiAge_FELL23C1": { prod: {"BronzeAge":{"happiness":520,"strategy_points_24h":1},"IronAge":{"happiness":900,"strategy_points_24h":1},"EarlyMiddleAge":{"happiness":1000,"strategy_points_24h":1},"HighMiddleAge":{"happiness":1110,"strategy_points_24h":1},"LateMiddleAge":{"happiness":1240,"strategy_points_24h":1},"ColonialAge":{"happiness":1460,"strategy_points_24h":1},"IndustrialAge":{"happiness":1640,"strategy_points_24h":1},"ProgressiveEra":{"happiness":1800,"strategy_points_24h":1},"ModernEra":{"happiness":1930,"strategy_points_24h":1},"PostModernEra":{"happiness":2010,"strategy_points_24h":1},"ContemporaryEra":{"happiness":2340,"strategy_points_24h":1},"TomorrowEra":{"happiness":2840,"strategy_points_24h":1},"FutureEra":{"happiness":3400,"strategy_points_24h":1},"ArcticFuture":{"happiness":3960,"strategy_points_24h":1},"OceanicFuture":{"happiness":4570,"strategy_points_24h":1},"VirtualFuture":{"happiness":5460,"strategy_points_24h":1},"SpaceAgeMars":{"happiness":8730,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"happiness":9490,"strategy_points_24h":1},"SpaceAgeVenus":{"happiness":10250,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"happiness":11040,"strategy_points_24h":1},"SpaceAgeTitan":{"happiness":11891,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"happiness":12742,"strategy_points_24h":1}}, boosts: [{"type":"att_boost_attacker","value":7,"feature":"all"},{"type":"att_boost_defender","value":9,"feature":"all"}] },
+    "W_MultiAge_FELL22A1": { prod: {"BronzeAge":{"population":150,"happiness":630,"demandHappiness":150,"money_24h":900},"IronAge":{"population":322,"happiness":1080,"demandHappiness":322,"money_24h":2100},"EarlyMiddleAge":{"population":494,"happiness":1190,"demandHappiness":494,"money_24h":3500},"HighMiddleAge":{"population":694,"happiness":1330,"demandHappiness":694,"money_24h":4900},"LateMiddleAge":{"population":910,"happiness":1480,"demandHappiness":910,"money_24h":6500},"ColonialAge":{"population":1149,"happiness":1750,"demandHappiness":1149,"money_24h":9900},"IndustrialAge":{"population":1404,"happiness":1970,"demandHappiness":1404,"money_24h":12300},"ProgressiveEra":{"population":1676,"happiness":2160,"demandHappiness":1676,"money_24h":14900},"ModernEra":{"population":1965,"happiness":2310,"demandHappiness":1965,"money_24h":18600},"PostModernEra":{"population":2264,"happiness":2410,"demandHappiness":2264,"money_24h":23300},"ContemporaryEra":{"population":2581,"happiness":2800,"demandHappiness":2581,"money_24h":30400},"TomorrowEra":{"population":2908,"happiness":3400,"demandHappiness":2908,"money_24h":35200},"FutureEra":{"population":3252,"happiness":4070,"demandHappiness":3252,"money_24h":40300},"ArcticFuture":{"population":3608,"happiness":4740,"demandHappiness":3608,"money_24h":45800},"OceanicFuture":{"population":3974,"happiness":5470,"demandHappiness":3974,"money_24h":51700},"VirtualFuture":{"population":4351,"happiness":6540,"demandHappiness":4351,"money_24h":57900},"SpaceAgeMars":{"population":6888,"happiness":10460,"demandHappiness":6888,"money_24h":96700},"SpaceAgeAsteroidBelt":{"population":7481,"happiness":11370,"demandHappiness":7481,"money_24h":107100},"SpaceAgeVenus":{"population":8086,"happiness":12280,"demandHappiness":8086,"money_24h":118000},"SpaceAgeJupiterMoon":{"population":8708,"happiness":13230,"demandHappiness":8708,"money_24h":129500},"SpaceAgeTitan":{"population":9341,"happiness":14190,"demandHappiness":9341,"money_24h":141600},"SpaceAgeSpaceHub":{"population":9990,"happiness":15180,"demandHappiness":9990,"money_24h":154300}} },
+    "W_MultiAge_FELL22A10": { prod: {"BronzeAge":{"population":243,"happiness":990,"demandHappiness":243,"money_24h":1700,"strategy_points_24h":11},"IronAge":{"population":522,"happiness":1710,"demandHappiness":522,"money_24h":4100,"strategy_points_24h":11},"EarlyMiddleAge":{"population":801,"happiness":1890,"demandHappiness":801,"money_24h":6800,"strategy_points_24h":11},"HighMiddleAge":{"population":1125,"happiness":2110,"demandHappiness":1125,"money_24h":9500,"strategy_points_24h":11},"LateMiddleAge":{"population":1476,"happiness":2350,"demandHappiness":1476,"money_24h":12600,"strategy_points_24h":11},"ColonialAge":{"population":1863,"happiness":2760,"demandHappiness":1863,"money_24h":19200,"strategy_points_24h":11},"IndustrialAge":{"population":2277,"happiness":3120,"demandHappiness":2277,"money_24h":23900,"strategy_points_24h":11},"ProgressiveEra":{"population":2718,"happiness":3420,"demandHappiness":2718,"money_24h":29000,"strategy_points_24h":11},"ModernEra":{"population":3186,"happiness":3660,"demandHappiness":3186,"money_24h":36000,"strategy_points_24h":11},"PostModernEra":{"population":3672,"happiness":3810,"demandHappiness":3672,"money_24h":45300,"strategy_points_24h":11},"ContemporaryEra":{"population":4185,"happiness":4430,"demandHappiness":4185,"money_24h":59000,"strategy_points_24h":11},"TomorrowEra":{"population":4716,"happiness":5380,"demandHappiness":4716,"money_24h":68300,"strategy_points_24h":11},"FutureEra":{"population":5274,"happiness":6450,"demandHappiness":5274,"money_24h":78300,"strategy_points_24h":11},"ArcticFuture":{"population":5850,"happiness":7510,"demandHappiness":5850,"money_24h":89000,"strategy_points_24h":11},"OceanicFuture":{"population":6444,"happiness":8660,"demandHappiness":6444,"money_24h":100400,"strategy_points_24h":11},"VirtualFuture":{"population":7056,"happiness":10350,"demandHappiness":7056,"money_24h":112400,"strategy_points_24h":11},"SpaceAgeMars":{"population":11169,"happiness":16560,"demandHappiness":11169,"money_24h":187800,"strategy_points_24h":11},"SpaceAgeAsteroidBelt":{"population":12132,"happiness":18000,"demandHappiness":12132,"money_24h":208000,"strategy_points_24h":11},"SpaceAgeVenus":{"population":13113,"happiness":19440,"demandHappiness":13113,"money_24h":229300,"strategy_points_24h":11},"SpaceAgeJupiterMoon":{"population":14121,"happiness":20940,"demandHappiness":14121,"money_24h":251700,"strategy_points_24h":11},"SpaceAgeTitan":{"population":15147,"happiness":22460,"demandHappiness":15147,"money_24h":275100,"strategy_points_24h":11},"SpaceAgeSpaceHub":{"population":16200,"happiness":24030,"demandHappiness":16200,"money_24h":299700,"strategy_points_24h":11}}, boosts: [{"type":"att_boost_attacker","value":12,"feature":"all"},{"type":"def_boost_attacker","value":17,"feature":"all"}] },
+    "W_MultiAge_FELL22A2": { prod: {"BronzeAge":{"population":155,"happiness":650,"demandHappiness":155,"money_24h":900,"strategy_points_24h":1},"IronAge":{"population":334,"happiness":1130,"demandHappiness":334,"money_24h":2200,"strategy_points_24h":1},"EarlyMiddleAge":{"population":512,"happiness":1240,"demandHappiness":512,"money_24h":3600,"strategy_points_24h":1},"HighMiddleAge":{"population":719,"happiness":1390,"demandHappiness":719,"money_24h":5000,"strategy_points_24h":1},"LateMiddleAge":{"population":943,"happiness":1550,"demandHappiness":943,"money_24h":6700,"strategy_points_24h":1},"ColonialAge":{"population":1190,"happiness":1820,"demandHappiness":1190,"money_24h":10100,"strategy_points_24h":1},"IndustrialAge":{"population":1455,"happiness":2050,"demandHappiness":1455,"money_24h":12600,"strategy_points_24h":1},"ProgressiveEra":{"population":1737,"happiness":2260,"demandHappiness":1737,"money_24h":15300,"strategy_points_24h":1},"ModernEra":{"population":2036,"happiness":2410,"demandHappiness":2036,"money_24h":19100,"strategy_points_24h":1},"PostModernEra":{"population":2346,"happiness":2510,"demandHappiness":2346,"money_24h":24000,"strategy_points_24h":1},"ContemporaryEra":{"population":2674,"happiness":2920,"demandHappiness":2674,"money_24h":31300,"strategy_points_24h":1},"TomorrowEra":{"population":3013,"happiness":3550,"demandHappiness":3013,"money_24h":36200,"strategy_points_24h":1},"FutureEra":{"population":3370,"happiness":4250,"demandHappiness":3370,"money_24h":41500,"strategy_points_24h":1},"ArcticFuture":{"population":3738,"happiness":4950,"demandHappiness":3738,"money_24h":47100,"strategy_points_24h":1},"OceanicFuture":{"population":4117,"happiness":5710,"demandHappiness":4117,"money_24h":53100,"strategy_points_24h":1},"VirtualFuture":{"population":4508,"happiness":6820,"demandHappiness":4508,"money_24h":59500,"strategy_points_24h":1},"SpaceAgeMars":{"population":7136,"happiness":10910,"demandHappiness":7136,"money_24h":99400,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"population":7751,"happiness":11860,"demandHappiness":7751,"money_24h":110100,"strategy_points_24h":1},"SpaceAgeVenus":{"population":8378,"happiness":12810,"demandHappiness":8378,"money_24h":121400,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"population":9022,"happiness":13800,"demandHappiness":9022,"money_24h":133200,"strategy_points_24h":1},"SpaceAgeTitan":{"population":9677,"happiness":14800,"demandHappiness":9677,"money_24h":145700,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"population":10350,"happiness":15840,"demandHappiness":10350,"money_24h":158700,"strategy_points_24h":1}} },
+    "W_MultiAge_FELL22A3": { prod: {"BronzeAge":{"population":162,"happiness":650,"demandHappiness":162,"money_24h":1000,"strategy_points_24h":2},"IronAge":{"population":348,"happiness":1130,"demandHappiness":348,"money_24h":2300,"strategy_points_24h":2},"EarlyMiddleAge":{"population":534,"happiness":1240,"demandHappiness":534,"money_24h":3900,"strategy_points_24h":2},"HighMiddleAge":{"population":750,"happiness":1390,"demandHappiness":750,"money_24h":5500,"strategy_points_24h":2},"LateMiddleAge":{"population":984,"happiness":1550,"demandHappiness":984,"money_24h":7200,"strategy_points_24h":2},"ColonialAge":{"population":1242,"happiness":1820,"demandHappiness":1242,"money_24h":11000,"strategy_points_24h":2},"IndustrialAge":{"population":1518,"happiness":2050,"demandHappiness":1518,"money_24h":13700,"strategy_points_24h":2},"ProgressiveEra":{"population":1812,"happiness":2260,"demandHappiness":1812,"money_24h":16600,"strategy_points_24h":2},"ModernEra":{"population":2124,"happiness":2410,"demandHappiness":2124,"money_24h":20700,"strategy_points_24h":2},"PostModernEra":{"population":2448,"happiness":2510,"demandHappiness":2448,"money_24h":26000,"strategy_points_24h":2},"ContemporaryEra":{"population":2790,"happiness":2920,"demandHappiness":2790,"money_24h":33900,"strategy_points_24h":2},"TomorrowEra":{"population":3144,"happiness":3550,"demandHappiness":3144,"money_24h":39200,"strategy_points_24h":2},"FutureEra":{"population":3516,"happiness":4250,"demandHappiness":3516,"money_24h":44900,"strategy_points_24h":2},"ArcticFuture":{"population":3900,"happiness":4950,"demandHappiness":3900,"money_24h":51100,"strategy_points_24h":2},"OceanicFuture":{"population":4296,"happiness":5710,"demandHappiness":4296,"money_24h":57600,"strategy_points_24h":2},"VirtualFuture":{"population":4704,"happiness":6820,"demandHappiness":4704,"money_24h":64500,"strategy_points_24h":2},"SpaceAgeMars":{"population":7446,"happiness":10910,"demandHappiness":7446,"money_24h":107700,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"population":8088,"happiness":11860,"demandHappiness":8088,"money_24h":119300,"strategy_points_24h":2},"SpaceAgeVenus":{"population":8742,"happiness":12810,"demandHappiness":8742,"money_24h":131500,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"population":9414,"happiness":13800,"demandHappiness":9414,"money_24h":144300,"strategy_points_24h":2},"SpaceAgeTitan":{"population":10098,"happiness":14800,"demandHappiness":10098,"money_24h":157800,"strategy_points_24h":2},"SpaceAgeSpaceHub":{"population":10800,"happiness":15840,"demandHappiness":10800,"money_24h":171900,"strategy_points_24h":2}} },
+    "W_MultiAge_FELL22A4": { prod: {"BronzeAge":{"population":169,"happiness":690,"demandHappiness":169,"money_24h":1100,"strategy_points_24h":3},"IronAge":{"population":363,"happiness":1200,"demandHappiness":363,"money_24h":2500,"strategy_points_24h":3},"EarlyMiddleAge":{"population":556,"happiness":1320,"demandHappiness":556,"money_24h":4200,"strategy_points_24h":3},"HighMiddleAge":{"population":781,"happiness":1480,"demandHappiness":781,"money_24h":5900,"strategy_points_24h":3},"LateMiddleAge":{"population":1025,"happiness":1650,"demandHappiness":1025,"money_24h":7800,"strategy_points_24h":3},"ColonialAge":{"population":1294,"happiness":1930,"demandHappiness":1294,"money_24h":11800,"strategy_points_24h":3},"IndustrialAge":{"population":1581,"happiness":2180,"demandHappiness":1581,"money_24h":14700,"strategy_points_24h":3},"ProgressiveEra":{"population":1888,"happiness":2400,"demandHappiness":1888,"money_24h":17900,"strategy_points_24h":3},"ModernEra":{"population":2213,"happiness":2560,"demandHappiness":2213,"money_24h":22300,"strategy_points_24h":3},"PostModernEra":{"population":2550,"happiness":2670,"demandHappiness":2550,"money_24h":28000,"strategy_points_24h":3},"ContemporaryEra":{"population":2906,"happiness":3100,"demandHappiness":2906,"money_24h":36500,"strategy_points_24h":3},"TomorrowEra":{"population":3275,"happiness":3770,"demandHappiness":3275,"money_24h":42200,"strategy_points_24h":3},"FutureEra":{"population":3663,"happiness":4510,"demandHappiness":3663,"money_24h":48400,"strategy_points_24h":3},"ArcticFuture":{"population":4063,"happiness":5260,"demandHappiness":4063,"money_24h":55000,"strategy_points_24h":3},"OceanicFuture":{"population":4475,"happiness":6060,"demandHappiness":4475,"money_24h":62000,"strategy_points_24h":3},"VirtualFuture":{"population":4900,"happiness":7240,"demandHappiness":4900,"money_24h":69400,"strategy_points_24h":3},"SpaceAgeMars":{"population":7756,"happiness":11590,"demandHappiness":7756,"money_24h":116000,"strategy_points_24h":3},"SpaceAgeAsteroidBelt":{"population":8425,"happiness":12600,"demandHappiness":8425,"money_24h":128500,"strategy_points_24h":3},"SpaceAgeVenus":{"population":9106,"happiness":13610,"demandHappiness":9106,"money_24h":141600,"strategy_points_24h":3},"SpaceAgeJupiterMoon":{"population":9806,"happiness":14660,"demandHappiness":9806,"money_24h":155400,"strategy_points_24h":3},"SpaceAgeTitan":{"population":10519,"happiness":15720,"demandHappiness":10519,"money_24h":169900,"strategy_points_24h":3},"SpaceAgeSpaceHub":{"population":11250,"happiness":16820,"demandHappiness":11250,"money_24h":185100,"strategy_points_24h":3}} },
+    "W_MultiAge_FELL22A5": { prod: {"BronzeAge":{"population":176,"happiness":750,"demandHappiness":176,"money_24h":1200,"strategy_points_24h":4},"IronAge":{"population":377,"happiness":1300,"demandHappiness":377,"money_24h":2800,"strategy_points_24h":4},"EarlyMiddleAge":{"population":579,"happiness":1430,"demandHappiness":579,"money_24h":4700,"strategy_points_24h":4},"HighMiddleAge":{"population":813,"happiness":1600,"demandHappiness":813,"money_24h":6600,"strategy_points_24h":4},"LateMiddleAge":{"population":1066,"happiness":1780,"demandHappiness":1066,"money_24h":8700,"strategy_points_24h":4},"ColonialAge":{"population":1346,"happiness":2100,"demandHappiness":1346,"money_24h":13200,"strategy_points_24h":4},"IndustrialAge":{"population":1645,"happiness":2370,"demandHappiness":1645,"money_24h":16500,"strategy_points_24h":4},"ProgressiveEra":{"population":1963,"happiness":2600,"demandHappiness":1963,"money_24h":20000,"strategy_points_24h":4},"ModernEra":{"population":2301,"happiness":2780,"demandHappiness":2301,"money_24h":24900,"strategy_points_24h":4},"PostModernEra":{"population":2652,"happiness":2900,"demandHappiness":2652,"money_24h":31300,"strategy_points_24h":4},"ContemporaryEra":{"population":3023,"happiness":3360,"demandHappiness":3023,"money_24h":40800,"strategy_points_24h":4},"TomorrowEra":{"population":3406,"happiness":4080,"demandHappiness":3406,"money_24h":47200,"strategy_points_24h":4},"FutureEra":{"population":3809,"happiness":4890,"demandHappiness":3809,"money_24h":54100,"strategy_points_24h":4},"ArcticFuture":{"population":4225,"happiness":5700,"demandHappiness":4225,"money_24h":61500,"strategy_points_24h":4},"OceanicFuture":{"population":4654,"happiness":6580,"demandHappiness":4654,"money_24h":69400,"strategy_points_24h":4},"VirtualFuture":{"population":5096,"happiness":7860,"demandHappiness":5096,"money_24h":77700,"strategy_points_24h":4},"SpaceAgeMars":{"population":8067,"happiness":12570,"demandHappiness":8067,"money_24h":129800,"strategy_points_24h":4},"SpaceAgeAsteroidBelt":{"population":8762,"happiness":13660,"demandHappiness":8762,"money_24h":143800,"strategy_points_24h":4},"SpaceAgeVenus":{"population":9471,"happiness":14760,"demandHappiness":9471,"money_24h":158500,"strategy_points_24h":4},"SpaceAgeJupiterMoon":{"population":10199,"happiness":15900,"demandHappiness":10199,"money_24h":173900,"strategy_points_24h":4},"SpaceAgeTitan":{"population":10940,"happiness":17050,"demandHappiness":10940,"money_24h":190200,"strategy_points_24h":4},"SpaceAgeSpaceHub":{"population":11700,"happiness":18240,"demandHappiness":11700,"money_24h":207100,"strategy_points_24h":4}} },
+    "W_MultiAge_FELL22A6": { prod: {"BronzeAge":{"population":182,"happiness":770,"demandHappiness":182,"money_24h":1300,"strategy_points_24h":5},"IronAge":{"population":392,"happiness":1340,"demandHappiness":392,"money_24h":3100,"strategy_points_24h":5},"EarlyMiddleAge":{"population":601,"happiness":1480,"demandHappiness":601,"money_24h":5100,"strategy_points_24h":5},"HighMiddleAge":{"population":844,"happiness":1650,"demandHappiness":844,"money_24h":7100,"strategy_points_24h":5},"LateMiddleAge":{"population":1107,"happiness":1840,"demandHappiness":1107,"money_24h":9400,"strategy_points_24h":5},"ColonialAge":{"population":1397,"happiness":2160,"demandHappiness":1397,"money_24h":14400,"strategy_points_24h":5},"IndustrialAge":{"population":1708,"happiness":2440,"demandHappiness":1708,"money_24h":17900,"strategy_points_24h":5},"ProgressiveEra":{"population":2039,"happiness":2680,"demandHappiness":2039,"money_24h":21700,"strategy_points_24h":5},"ModernEra":{"population":2390,"happiness":2860,"demandHappiness":2390,"money_24h":27000,"strategy_points_24h":5},"PostModernEra":{"population":2754,"happiness":2980,"demandHappiness":2754,"money_24h":34000,"strategy_points_24h":5},"ContemporaryEra":{"population":3139,"happiness":3470,"demandHappiness":3139,"money_24h":44300,"strategy_points_24h":5},"TomorrowEra":{"population":3537,"happiness":4210,"demandHappiness":3537,"money_24h":51300,"strategy_points_24h":5},"FutureEra":{"population":3956,"happiness":5040,"demandHappiness":3956,"money_24h":58800,"strategy_points_24h":5},"ArcticFuture":{"population":4388,"happiness":5870,"demandHappiness":4388,"money_24h":66800,"strategy_points_24h":5},"OceanicFuture":{"population":4833,"happiness":6770,"demandHappiness":4833,"money_24h":75300,"strategy_points_24h":5},"VirtualFuture":{"population":5292,"happiness":8090,"demandHappiness":5292,"money_24h":84300,"strategy_points_24h":5},"SpaceAgeMars":{"population":8377,"happiness":12950,"demandHappiness":8377,"money_24h":140800,"strategy_points_24h":5},"SpaceAgeAsteroidBelt":{"population":9099,"happiness":14070,"demandHappiness":9099,"money_24h":156000,"strategy_points_24h":5},"SpaceAgeVenus":{"population":9835,"happiness":15200,"demandHappiness":9835,"money_24h":172000,"strategy_points_24h":5},"SpaceAgeJupiterMoon":{"population":10591,"happiness":16370,"demandHappiness":10591,"money_24h":188700,"strategy_points_24h":5},"SpaceAgeTitan":{"population":11360,"happiness":17560,"demandHappiness":11360,"money_24h":206400,"strategy_points_24h":5},"SpaceAgeSpaceHub":{"population":12150,"happiness":18790,"demandHappiness":12150,"money_24h":224800,"strategy_points_24h":5}}, boosts: [{"type":"def_boost_attacker","value":1,"feature":"all"}] },
+    "W_MultiAge_FELL22A7": { prod: {"BronzeAge":{"population":196,"happiness":840,"demandHappiness":196,"money_24h":1400,"strategy_points_24h":6},"IronAge":{"population":421,"happiness":1440,"demandHappiness":421,"money_24h":3200,"strategy_points_24h":6},"EarlyMiddleAge":{"population":645,"happiness":1600,"demandHappiness":645,"money_24h":5400,"strategy_points_24h":6},"HighMiddleAge":{"population":906,"happiness":1780,"demandHappiness":906,"money_24h":7600,"strategy_points_24h":6},"LateMiddleAge":{"population":1189,"happiness":1990,"demandHappiness":1189,"money_24h":10000,"strategy_points_24h":6},"ColonialAge":{"population":1501,"happiness":2340,"demandHappiness":1501,"money_24h":15200,"strategy_points_24h":6},"IndustrialAge":{"population":1834,"happiness":2630,"demandHappiness":1834,"money_24h":19000,"strategy_points_24h":6},"ProgressiveEra":{"population":2190,"happiness":2890,"demandHappiness":2190,"money_24h":23000,"strategy_points_24h":6},"ModernEra":{"population":2567,"happiness":3100,"demandHappiness":2567,"money_24h":28600,"strategy_points_24h":6},"PostModernEra":{"population":2958,"happiness":3230,"demandHappiness":2958,"money_24h":36000,"strategy_points_24h":6},"ContemporaryEra":{"population":3371,"happiness":3750,"demandHappiness":3371,"money_24h":46900,"strategy_points_24h":6},"TomorrowEra":{"population":3799,"happiness":4550,"demandHappiness":3799,"money_24h":54300,"strategy_points_24h":6},"FutureEra":{"population":4249,"happiness":5450,"demandHappiness":4249,"money_24h":62200,"strategy_points_24h":6},"ArcticFuture":{"population":4713,"happiness":6350,"demandHappiness":4713,"money_24h":70700,"strategy_points_24h":6},"OceanicFuture":{"population":5191,"happiness":7320,"demandHappiness":5191,"money_24h":79700,"strategy_points_24h":6},"VirtualFuture":{"population":5684,"happiness":8750,"demandHappiness":5684,"money_24h":89300,"strategy_points_24h":6},"SpaceAgeMars":{"population":8997,"happiness":14000,"demandHappiness":8997,"money_24h":149100,"strategy_points_24h":6},"SpaceAgeAsteroidBelt":{"population":9773,"happiness":15220,"demandHappiness":9773,"money_24h":165200,"strategy_points_24h":6},"SpaceAgeVenus":{"population":10563,"happiness":16440,"demandHappiness":10563,"money_24h":182100,"strategy_points_24h":6},"SpaceAgeJupiterMoon":{"population":11375,"happiness":17710,"demandHappiness":11375,"money_24h":199800,"strategy_points_24h":6},"SpaceAgeTitan":{"population":12202,"happiness":18990,"demandHappiness":12202,"money_24h":218500,"strategy_points_24h":6},"SpaceAgeSpaceHub":{"population":13050,"happiness":20310,"demandHappiness":13050,"money_24h":238000,"strategy_points_24h":6}}, boosts: [{"type":"def_boost_attacker","value":4,"feature":"all"}] },
+    "W_MultiAge_FELL22A8": { prod: {"BronzeAge":{"population":213,"happiness":900,"demandHappiness":213,"money_24h":1500,"strategy_points_24h":7},"IronAge":{"population":458,"happiness":1550,"demandHappiness":458,"money_24h":3500,"strategy_points_24h":7},"EarlyMiddleAge":{"population":703,"happiness":1720,"demandHappiness":703,"money_24h":5800,"strategy_points_24h":7},"HighMiddleAge":{"population":988,"happiness":1920,"demandHappiness":988,"money_24h":8100,"strategy_points_24h":7},"LateMiddleAge":{"population":1296,"happiness":2140,"demandHappiness":1296,"money_24h":10700,"strategy_points_24h":7},"ColonialAge":{"population":1635,"happiness":2510,"demandHappiness":1635,"money_24h":16300,"strategy_points_24h":7},"IndustrialAge":{"population":1999,"happiness":2830,"demandHappiness":1999,"money_24h":20400,"strategy_points_24h":7},"ProgressiveEra":{"population":2386,"happiness":3110,"demandHappiness":2386,"money_24h":24700,"strategy_points_24h":7},"ModernEra":{"population":2797,"happiness":3330,"demandHappiness":2797,"money_24h":30700,"strategy_points_24h":7},"PostModernEra":{"population":3223,"happiness":3470,"demandHappiness":3223,"money_24h":38700,"strategy_points_24h":7},"ContemporaryEra":{"population":3674,"happiness":4030,"demandHappiness":3674,"money_24h":50300,"strategy_points_24h":7},"TomorrowEra":{"population":4140,"happiness":4890,"demandHappiness":4140,"money_24h":58300,"strategy_points_24h":7},"FutureEra":{"population":4629,"happiness":5860,"demandHappiness":4629,"money_24h":66800,"strategy_points_24h":7},"ArcticFuture":{"population":5135,"happiness":6820,"demandHappiness":5135,"money_24h":75900,"strategy_points_24h":7},"OceanicFuture":{"population":5656,"happiness":7880,"demandHappiness":5656,"money_24h":85600,"strategy_points_24h":7},"VirtualFuture":{"population":6194,"happiness":9410,"demandHappiness":6194,"money_24h":95900,"strategy_points_24h":7},"SpaceAgeMars":{"population":9804,"happiness":15050,"demandHappiness":9804,"money_24h":160200,"strategy_points_24h":7},"SpaceAgeAsteroidBelt":{"population":10649,"happiness":16360,"demandHappiness":10649,"money_24h":177400,"strategy_points_24h":7},"SpaceAgeVenus":{"population":11510,"happiness":17680,"demandHappiness":11510,"money_24h":195600,"strategy_points_24h":7},"SpaceAgeJupiterMoon":{"population":12395,"happiness":19040,"demandHappiness":12395,"money_24h":214600,"strategy_points_24h":7},"SpaceAgeTitan":{"population":13296,"happiness":20420,"demandHappiness":13296,"money_24h":234700,"strategy_points_24h":7},"SpaceAgeSpaceHub":{"population":14220,"happiness":21840,"demandHappiness":14220,"money_24h":255600,"strategy_points_24h":7}}, boosts: [{"type":"att_boost_attacker","value":1,"feature":"all"},{"type":"def_boost_attacker","value":7,"feature":"all"}] },
+    "W_MultiAge_FELL22A9": { prod: {"BronzeAge":{"population":224,"happiness":960,"demandHappiness":224,"money_24h":1600,"strategy_points_24h":8},"IronAge":{"population":481,"happiness":1650,"demandHappiness":481,"money_24h":3700,"strategy_points_24h":8},"EarlyMiddleAge":{"population":739,"happiness":1820,"demandHappiness":739,"money_24h":6200,"strategy_points_24h":8},"HighMiddleAge":{"population":1038,"happiness":2030,"demandHappiness":1038,"money_24h":8700,"strategy_points_24h":8},"LateMiddleAge":{"population":1361,"happiness":2260,"demandHappiness":1361,"money_24h":11500,"strategy_points_24h":8},"ColonialAge":{"population":1718,"happiness":2660,"demandHappiness":1718,"money_24h":17500,"strategy_points_24h":8},"IndustrialAge":{"population":2100,"happiness":3000,"demandHappiness":2100,"money_24h":21800,"strategy_points_24h":8},"ProgressiveEra":{"population":2507,"happiness":3300,"demandHappiness":2507,"money_24h":26400,"strategy_points_24h":8},"ModernEra":{"population":2938,"happiness":3530,"demandHappiness":2938,"money_24h":32900,"strategy_points_24h":8},"PostModernEra":{"population":3386,"happiness":3680,"demandHappiness":3386,"money_24h":41300,"strategy_points_24h":8},"ContemporaryEra":{"population":3860,"happiness":4270,"demandHappiness":3860,"money_24h":53800,"strategy_points_24h":8},"TomorrowEra":{"population":4349,"happiness":5190,"demandHappiness":4349,"money_24h":62300,"strategy_points_24h":8},"FutureEra":{"population":4864,"happiness":6210,"demandHappiness":4864,"money_24h":71400,"strategy_points_24h":8},"ArcticFuture":{"population":5395,"happiness":7230,"demandHappiness":5395,"money_24h":81200,"strategy_points_24h":8},"OceanicFuture":{"population":5943,"happiness":8350,"demandHappiness":5943,"money_24h":91500,"strategy_points_24h":8},"VirtualFuture":{"population":6507,"happiness":9970,"demandHappiness":6507,"money_24h":102500,"strategy_points_24h":8},"SpaceAgeMars":{"population":10300,"happiness":15960,"demandHappiness":10300,"money_24h":171200,"strategy_points_24h":8},"SpaceAgeAsteroidBelt":{"population":11188,"happiness":17340,"demandHappiness":11188,"money_24h":189600,"strategy_points_24h":8},"SpaceAgeVenus":{"population":12093,"happiness":18740,"demandHappiness":12093,"money_24h":209100,"strategy_points_24h":8},"SpaceAgeJupiterMoon":{"population":13023,"happiness":20180,"demandHappiness":13023,"money_24h":229500,"strategy_points_24h":8},"SpaceAgeTitan":{"population":13969,"happiness":21640,"demandHappiness":13969,"money_24h":250900,"strategy_points_24h":8},"SpaceAgeSpaceHub":{"population":14940,"happiness":23150,"demandHappiness":14940,"money_24h":273300,"strategy_points_24h":8}}, boosts: [{"type":"att_boost_attacker","value":3,"feature":"all"},{"type":"def_boost_attacker","value":10,"feature":"all"}] },
+    "W_MultiAge_FELL22B2": { prod: {"BronzeAge":{"population":80,"happiness":330,"demandHappiness":80,"money_24h":310,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"IronAge":{"population":170,"happiness":570,"demandHappiness":170,"money_24h":740,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"EarlyMiddleAge":{"population":260,"happiness":630,"demandHappiness":260,"money_24h":1240,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"HighMiddleAge":{"population":370,"happiness":700,"demandHappiness":370,"money_24h":1730,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"LateMiddleAge":{"population":490,"happiness":780,"demandHappiness":490,"money_24h":2290,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"ColonialAge":{"population":610,"happiness":920,"demandHappiness":610,"money_24h":3480,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"IndustrialAge":{"population":750,"happiness":1040,"demandHappiness":750,"money_24h":4340,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"ProgressiveEra":{"population":900,"happiness":1140,"demandHappiness":900,"money_24h":5260,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"ModernEra":{"population":1050,"happiness":1220,"demandHappiness":1050,"money_24h":6550,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"PostModernEra":{"population":1210,"happiness":1270,"demandHappiness":1210,"money_24h":8240,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"ContemporaryEra":{"population":1380,"happiness":1480,"demandHappiness":1380,"money_24h":10730,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"TomorrowEra":{"population":1560,"happiness":1800,"demandHappiness":1560,"money_24h":12420,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"FutureEra":{"population":1740,"happiness":2150,"demandHappiness":1740,"money_24h":14240,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"ArcticFuture":{"population":1930,"happiness":2510,"demandHappiness":1930,"money_24h":16180,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"OceanicFuture":{"population":2130,"happiness":2890,"demandHappiness":2130,"money_24h":18240,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"VirtualFuture":{"population":2330,"happiness":3460,"demandHappiness":2330,"money_24h":20430,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"SpaceAgeMars":{"population":3690,"happiness":5530,"demandHappiness":3690,"money_24h":34130,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"SpaceAgeAsteroidBelt":{"population":4000,"happiness":6010,"demandHappiness":4000,"money_24h":37800,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"SpaceAgeVenus":{"population":4330,"happiness":6490,"demandHappiness":4330,"money_24h":41670,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"SpaceAgeJupiterMoon":{"population":4660,"happiness":6990,"demandHappiness":4660,"money_24h":45730,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"SpaceAgeTitan":{"population":5000,"happiness":7500,"demandHappiness":5000,"money_24h":50000,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8},"SpaceAgeSpaceHub":{"population":5340,"happiness":8010,"demandHappiness":5340,"money_24h":54270,"all_goods_of_age_24h":30,"all_goods_of_previous_age_24h":45,"all_goods_of_next_age_24h":15,"units_24h":8}} },
+    "W_MultiAge_FELL25A1": { prod: {"BronzeAge":{"population":230,"demandHappiness":230,"supplies_24h":1510,"money_24h":850},"IronAge":{"population":480,"demandHappiness":480,"supplies_24h":3630,"money_24h":2050},"EarlyMiddleAge":{"population":740,"demandHappiness":740,"supplies_24h":6050,"money_24h":3420},"HighMiddleAge":{"population":1040,"demandHappiness":1040,"supplies_24h":8470,"money_24h":4780},"LateMiddleAge":{"population":1370,"demandHappiness":1370,"supplies_24h":11190,"money_24h":6320},"ColonialAge":{"population":1730,"demandHappiness":1730,"supplies_24h":14220,"money_24h":9620},"IndustrialAge":{"population":2110,"demandHappiness":2110,"supplies_24h":17240,"money_24h":11990},"ProgressiveEra":{"population":2520,"demandHappiness":2520,"supplies_24h":20270,"money_24h":14550},"ModernEra":{"population":2950,"demandHappiness":2950,"supplies_24h":23600,"money_24h":18100},"PostModernEra":{"population":3410,"demandHappiness":3410,"supplies_24h":26920,"money_24h":22780},"ContemporaryEra":{"population":3880,"demandHappiness":3880,"supplies_24h":30250,"money_24h":29650},"TomorrowEra":{"population":4370,"demandHappiness":4370,"supplies_24h":33880,"money_24h":34330},"FutureEra":{"population":4890,"demandHappiness":4890,"supplies_24h":37210,"money_24h":39350},"ArcticFuture":{"population":5430,"demandHappiness":5430,"supplies_24h":40840,"money_24h":44710},"OceanicFuture":{"population":5980,"demandHappiness":5980,"supplies_24h":44770,"money_24h":50420},"VirtualFuture":{"population":6540,"demandHappiness":6540,"supplies_24h":48400,"money_24h":56470},"SpaceAgeMars":{"population":10360,"demandHappiness":10360,"supplies_24h":78350,"money_24h":94330},"SpaceAgeAsteroidBelt":{"population":11250,"demandHappiness":11250,"supplies_24h":84100,"money_24h":104480},"SpaceAgeVenus":{"population":12160,"demandHappiness":12160,"supplies_24h":90150,"money_24h":115180},"SpaceAgeJupiterMoon":{"population":13100,"demandHappiness":13100,"supplies_24h":95900,"money_24h":126410},"SpaceAgeTitan":{"population":14050,"demandHappiness":14050,"supplies_24h":101950,"money_24h":138210},"SpaceAgeSpaceHub":{"population":15000,"demandHappiness":15000,"supplies_24h":108000,"money_24h":150000}}, boosts: [{"type":"def_boost_attacker","value":5,"feature":"battleground"},{"type":"att_boost_defender","value":2,"feature":"battleground"}] },
+    "W_MultiAge_FELL25A2": { prod: {"BronzeAge":{"population":300,"demandHappiness":300,"supplies_24h":1580,"money_24h":1140},"IronAge":{"population":650,"demandHappiness":650,"supplies_24h":3800,"money_24h":2730},"EarlyMiddleAge":{"population":990,"demandHappiness":990,"supplies_24h":6330,"money_24h":4550},"HighMiddleAge":{"population":1390,"demandHappiness":1390,"supplies_24h":8860,"money_24h":6380},"LateMiddleAge":{"population":1830,"demandHappiness":1830,"supplies_24h":11710,"money_24h":8430},"ColonialAge":{"population":2300,"demandHappiness":2300,"supplies_24h":14880,"money_24h":12830},"IndustrialAge":{"population":2820,"demandHappiness":2820,"supplies_24h":18040,"money_24h":15990},"ProgressiveEra":{"population":3360,"demandHappiness":3360,"supplies_24h":21210,"money_24h":19400},"ModernEra":{"population":3940,"demandHappiness":3940,"supplies_24h":24690,"money_24h":24140},"PostModernEra":{"population":4540,"demandHappiness":4540,"supplies_24h":28170,"money_24h":30370},"ContemporaryEra":{"population":5180,"demandHappiness":5180,"supplies_24h":31650,"money_24h":39530},"TomorrowEra":{"population":5830,"demandHappiness":5830,"supplies_24h":35450,"money_24h":45770},"FutureEra":{"population":6520,"demandHappiness":6520,"supplies_24h":38930,"money_24h":52470},"ArcticFuture":{"population":7230,"demandHappiness":7230,"supplies_24h":42730,"money_24h":59620},"OceanicFuture":{"population":7970,"demandHappiness":7970,"supplies_24h":46850,"money_24h":67220},"VirtualFuture":{"population":8730,"demandHappiness":8730,"supplies_24h":50640,"money_24h":75300},"SpaceAgeMars":{"population":13810,"demandHappiness":13810,"supplies_24h":81980,"money_24h":125770},"SpaceAgeAsteroidBelt":{"population":15000,"demandHappiness":15000,"supplies_24h":87990,"money_24h":139310},"SpaceAgeVenus":{"population":16220,"demandHappiness":16220,"supplies_24h":94320,"money_24h":153570},"SpaceAgeJupiterMoon":{"population":17460,"demandHappiness":17460,"supplies_24h":100340,"money_24h":168550},"SpaceAgeTitan":{"population":18730,"demandHappiness":18730,"supplies_24h":106670,"money_24h":184280},"SpaceAgeSpaceHub":{"population":20000,"demandHappiness":20000,"supplies_24h":113000,"money_24h":200000}}, boosts: [{"type":"def_boost_attacker","value":35,"feature":"battleground"},{"type":"att_boost_defender","value":32,"feature":"battleground"}] },
+    "W_MultiAge_FELL25A3": { prod: {"BronzeAge":{"population":380,"demandHappiness":380,"supplies_24h":1650,"money_24h":1420},"IronAge":{"population":810,"demandHappiness":810,"supplies_24h":3970,"money_24h":3420},"EarlyMiddleAge":{"population":1240,"demandHappiness":1240,"supplies_24h":6610,"money_24h":5690},"HighMiddleAge":{"population":1740,"demandHappiness":1740,"supplies_24h":9250,"money_24h":7970},"LateMiddleAge":{"population":2280,"demandHappiness":2280,"supplies_24h":12230,"money_24h":10530},"ColonialAge":{"population":2880,"demandHappiness":2880,"supplies_24h":15540,"money_24h":16040},"IndustrialAge":{"population":3520,"demandHappiness":3520,"supplies_24h":18840,"money_24h":19980},"ProgressiveEra":{"population":4200,"demandHappiness":4200,"supplies_24h":22150,"money_24h":24250},"ModernEra":{"population":4920,"demandHappiness":4920,"supplies_24h":25780,"money_24h":30170},"PostModernEra":{"population":5680,"demandHappiness":5680,"supplies_24h":29420,"money_24h":37960},"ContemporaryEra":{"population":6470,"demandHappiness":6470,"supplies_24h":33050,"money_24h":49420},"TomorrowEra":{"population":7290,"demandHappiness":7290,"supplies_24h":37020,"money_24h":57220},"FutureEra":{"population":8150,"demandHappiness":8150,"supplies_24h":40660,"money_24h":65580},"ArcticFuture":{"population":9040,"demandHappiness":9040,"supplies_24h":44620,"money_24h":74520},"OceanicFuture":{"population":9960,"demandHappiness":9960,"supplies_24h":48920,"money_24h":84030},"VirtualFuture":{"population":10910,"demandHappiness":10910,"supplies_24h":52890,"money_24h":94120},"SpaceAgeMars":{"population":17260,"demandHappiness":17260,"supplies_24h":85610,"money_24h":157220},"SpaceAgeAsteroidBelt":{"population":18750,"demandHappiness":18750,"supplies_24h":91890,"money_24h":174140},"SpaceAgeVenus":{"population":20270,"demandHappiness":20270,"supplies_24h":98500,"money_24h":191960},"SpaceAgeJupiterMoon":{"population":21830,"demandHappiness":21830,"supplies_24h":104780,"money_24h":210690},"SpaceAgeTitan":{"population":23410,"demandHappiness":23410,"supplies_24h":111390,"money_24h":230340},"SpaceAgeSpaceHub":{"population":25000,"demandHappiness":25000,"supplies_24h":118000,"money_24h":250000}}, boosts: [{"type":"def_boost_attacker","value":65,"feature":"battleground"},{"type":"att_boost_defender","value":62,"feature":"battleground"}] },
+    "W_MultiAge_FELL25A4": { prod: {"BronzeAge":{"population":450,"demandHappiness":450,"supplies_24h":1720,"money_24h":1710,"strategy_points_24h":45},"IronAge":{"population":970,"demandHappiness":970,"supplies_24h":4130,"money_24h":4100,"strategy_points_24h":45},"EarlyMiddleAge":{"population":1490,"demandHappiness":1490,"supplies_24h":6890,"money_24h":6830,"strategy_points_24h":45},"HighMiddleAge":{"population":2090,"demandHappiness":2090,"supplies_24h":9650,"money_24h":9560,"strategy_points_24h":45},"LateMiddleAge":{"population":2740,"demandHappiness":2740,"supplies_24h":12750,"money_24h":12640,"strategy_points_24h":45},"ColonialAge":{"population":3460,"demandHappiness":3460,"supplies_24h":16190,"money_24h":19250,"strategy_points_24h":45},"IndustrialAge":{"population":4220,"demandHappiness":4220,"supplies_24h":19640,"money_24h":23980,"strategy_points_24h":45},"ProgressiveEra":{"population":5040,"demandHappiness":5040,"supplies_24h":23080,"money_24h":29100,"strategy_points_24h":45},"ModernEra":{"population":5910,"demandHappiness":5910,"supplies_24h":26870,"money_24h":36210,"strategy_points_24h":45},"PostModernEra":{"population":6810,"demandHappiness":6810,"supplies_24h":30660,"money_24h":45550,"strategy_points_24h":45},"ContemporaryEra":{"population":7760,"demandHappiness":7760,"supplies_24h":34450,"money_24h":59300,"strategy_points_24h":45},"TomorrowEra":{"population":8750,"demandHappiness":8750,"supplies_24h":38590,"money_24h":68660,"strategy_points_24h":45},"FutureEra":{"population":9780,"demandHappiness":9780,"supplies_24h":42380,"money_24h":78700,"strategy_points_24h":45},"ArcticFuture":{"population":10850,"demandHappiness":10850,"supplies_24h":46510,"money_24h":89430,"strategy_points_24h":45},"OceanicFuture":{"population":11950,"demandHappiness":11950,"supplies_24h":50990,"money_24h":100840,"strategy_points_24h":45},"VirtualFuture":{"population":13090,"demandHappiness":13090,"supplies_24h":55130,"money_24h":112950,"strategy_points_24h":45},"SpaceAgeMars":{"population":20720,"demandHappiness":20720,"supplies_24h":89240,"money_24h":188660,"strategy_points_24h":45},"SpaceAgeAsteroidBelt":{"population":22500,"demandHappiness":22500,"supplies_24h":95780,"money_24h":208970,"strategy_points_24h":45},"SpaceAgeVenus":{"population":24320,"demandHappiness":24320,"supplies_24h":102670,"money_24h":230350,"strategy_points_24h":45},"SpaceAgeJupiterMoon":{"population":26190,"demandHappiness":26190,"supplies_24h":109220,"money_24h":252830,"strategy_points_24h":45},"SpaceAgeTitan":{"population":28100,"demandHappiness":28100,"supplies_24h":116110,"money_24h":276410,"strategy_points_24h":45},"SpaceAgeSpaceHub":{"population":30000,"demandHappiness":30000,"supplies_24h":123000,"money_24h":300000,"strategy_points_24h":45}}, boosts: [{"type":"def_boost_attacker","value":95,"feature":"battleground"},{"type":"att_boost_defender","value":92,"feature":"battleground"}] },
+    "W_MultiAge_FELL25A5": { prod: {"BronzeAge":{"population":530,"demandHappiness":530,"supplies_24h":1790,"money_24h":1990,"strategy_points_24h":70},"IronAge":{"population":1130,"demandHappiness":1130,"supplies_24h":4300,"money_24h":4780,"strategy_points_24h":70},"EarlyMiddleAge":{"population":1730,"demandHappiness":1730,"supplies_24h":7170,"money_24h":7970,"strategy_points_24h":70},"HighMiddleAge":{"population":2430,"demandHappiness":2430,"supplies_24h":10040,"money_24h":11160,"strategy_points_24h":70},"LateMiddleAge":{"population":3190,"demandHappiness":3190,"supplies_24h":13270,"money_24h":14750,"strategy_points_24h":70},"ColonialAge":{"population":4030,"demandHappiness":4030,"supplies_24h":16850,"money_24h":22460,"strategy_points_24h":70},"IndustrialAge":{"population":4930,"demandHappiness":4930,"supplies_24h":20440,"money_24h":27980,"strategy_points_24h":70},"ProgressiveEra":{"population":5880,"demandHappiness":5880,"supplies_24h":24020,"money_24h":33950,"strategy_points_24h":70},"ModernEra":{"population":6890,"demandHappiness":6890,"supplies_24h":27970,"money_24h":42240,"strategy_points_24h":70},"PostModernEra":{"population":7950,"demandHappiness":7950,"supplies_24h":31910,"money_24h":53140,"strategy_points_24h":70},"ContemporaryEra":{"population":9060,"demandHappiness":9060,"supplies_24h":35850,"money_24h":69180,"strategy_points_24h":70},"TomorrowEra":{"population":10210,"demandHappiness":10210,"supplies_24h":40160,"money_24h":80100,"strategy_points_24h":70},"FutureEra":{"population":11410,"demandHappiness":11410,"supplies_24h":44100,"money_24h":91820,"strategy_points_24h":70},"ArcticFuture":{"population":12660,"demandHappiness":12660,"supplies_24h":48400,"money_24h":104330,"strategy_points_24h":70},"OceanicFuture":{"population":13950,"demandHappiness":13950,"supplies_24h":53060,"money_24h":117640,"strategy_points_24h":70},"VirtualFuture":{"population":15270,"demandHappiness":15270,"supplies_24h":57370,"money_24h":131770,"strategy_points_24h":70},"SpaceAgeMars":{"population":24170,"demandHappiness":24170,"supplies_24h":92860,"money_24h":220100,"strategy_points_24h":70},"SpaceAgeAsteroidBelt":{"population":26250,"demandHappiness":26250,"supplies_24h":99680,"money_24h":243790,"strategy_points_24h":70},"SpaceAgeVenus":{"population":28380,"demandHappiness":28380,"supplies_24h":106850,"money_24h":268740,"strategy_points_24h":70},"SpaceAgeJupiterMoon":{"population":30560,"demandHappiness":30560,"supplies_24h":113660,"money_24h":294960,"strategy_points_24h":70},"SpaceAgeTitan":{"population":32780,"demandHappiness":32780,"supplies_24h":120830,"money_24h":322480,"strategy_points_24h":70},"SpaceAgeSpaceHub":{"population":35000,"demandHappiness":35000,"supplies_24h":128000,"money_24h":350000,"strategy_points_24h":70}}, boosts: [{"type":"def_boost_attacker","value":125,"feature":"battleground"},{"type":"att_boost_defender","value":122,"feature":"battleground"}] },
+    "W_MultiAge_FELL25A6": { prod: {"BronzeAge":{"population":600,"demandHappiness":600,"supplies_24h":1860,"money_24h":2280,"strategy_points_24h":95},"IronAge":{"population":1290,"demandHappiness":1290,"supplies_24h":4470,"money_24h":5470,"strategy_points_24h":95},"EarlyMiddleAge":{"population":1980,"demandHappiness":1980,"supplies_24h":7450,"money_24h":9110,"strategy_points_24h":95},"HighMiddleAge":{"population":2780,"demandHappiness":2780,"supplies_24h":10430,"money_24h":12750,"strategy_points_24h":95},"LateMiddleAge":{"population":3650,"demandHappiness":3650,"supplies_24h":13780,"money_24h":16850,"strategy_points_24h":95},"ColonialAge":{"population":4610,"demandHappiness":4610,"supplies_24h":17510,"money_24h":25660,"strategy_points_24h":95},"IndustrialAge":{"population":5630,"demandHappiness":5630,"supplies_24h":21240,"money_24h":31970,"strategy_points_24h":95},"ProgressiveEra":{"population":6720,"demandHappiness":6720,"supplies_24h":24960,"money_24h":38800,"strategy_points_24h":95},"ModernEra":{"population":7880,"demandHappiness":7880,"supplies_24h":29060,"money_24h":48280,"strategy_points_24h":95},"PostModernEra":{"population":9080,"demandHappiness":9080,"supplies_24h":33160,"money_24h":60730,"strategy_points_24h":95},"ContemporaryEra":{"population":10350,"demandHappiness":10350,"supplies_24h":37250,"money_24h":79070,"strategy_points_24h":95},"TomorrowEra":{"population":11660,"demandHappiness":11660,"supplies_24h":41730,"money_24h":91550,"strategy_points_24h":95},"FutureEra":{"population":13040,"demandHappiness":13040,"supplies_24h":45820,"money_24h":104940,"strategy_points_24h":95},"ArcticFuture":{"population":14470,"demandHappiness":14470,"supplies_24h":50290,"money_24h":119240,"strategy_points_24h":95},"OceanicFuture":{"population":15940,"demandHappiness":15940,"supplies_24h":55140,"money_24h":134450,"strategy_points_24h":95},"VirtualFuture":{"population":17450,"demandHappiness":17450,"supplies_24h":59610,"money_24h":150590,"strategy_points_24h":95},"SpaceAgeMars":{"population":27620,"demandHappiness":27620,"supplies_24h":96490,"money_24h":251550,"strategy_points_24h":95},"SpaceAgeAsteroidBelt":{"population":30010,"demandHappiness":30010,"supplies_24h":103570,"money_24h":278620,"strategy_points_24h":95},"SpaceAgeVenus":{"population":32430,"demandHappiness":32430,"supplies_24h":111020,"money_24h":307130,"strategy_points_24h":95},"SpaceAgeJupiterMoon":{"population":34920,"demandHappiness":34920,"supplies_24h":118100,"money_24h":337100,"strategy_points_24h":95},"SpaceAgeTitan":{"population":37460,"demandHappiness":37460,"supplies_24h":125550,"money_24h":368550,"strategy_points_24h":95},"SpaceAgeSpaceHub":{"population":40000,"demandHappiness":40000,"supplies_24h":133000,"money_24h":400000,"strategy_points_24h":95}}, boosts: [{"type":"def_boost_attacker","value":155,"feature":"battleground"},{"type":"att_boost_defender","value":152,"feature":"battleground"}] },
+    "W_MultiAge_FELL25A7": { prod: {"BronzeAge":{"population":680,"demandHappiness":680,"supplies_24h":1930,"money_24h":2560,"strategy_points_24h":120},"IronAge":{"population":1450,"demandHappiness":1450,"supplies_24h":4640,"money_24h":6150,"strategy_points_24h":120},"EarlyMiddleAge":{"population":2230,"demandHappiness":2230,"supplies_24h":7730,"money_24h":10250,"strategy_points_24h":120},"HighMiddleAge":{"population":3130,"demandHappiness":3130,"supplies_24h":10820,"money_24h":14350,"strategy_points_24h":120},"LateMiddleAge":{"population":4110,"demandHappiness":4110,"supplies_24h":14300,"money_24h":18960,"strategy_points_24h":120},"ColonialAge":{"population":5180,"demandHappiness":5180,"supplies_24h":18170,"money_24h":28870,"strategy_points_24h":120},"IndustrialAge":{"population":6340,"demandHappiness":6340,"supplies_24h":22030,"money_24h":35970,"strategy_points_24h":120},"ProgressiveEra":{"population":7560,"demandHappiness":7560,"supplies_24h":25900,"money_24h":43650,"strategy_points_24h":120},"ModernEra":{"population":8860,"demandHappiness":8860,"supplies_24h":30150,"money_24h":54310,"strategy_points_24h":120},"PostModernEra":{"population":10220,"demandHappiness":10220,"supplies_24h":34400,"money_24h":68330,"strategy_points_24h":120},"ContemporaryEra":{"population":11640,"demandHappiness":11640,"supplies_24h":38660,"money_24h":88950,"strategy_points_24h":120},"TomorrowEra":{"population":13120,"demandHappiness":13120,"supplies_24h":43290,"money_24h":102990,"strategy_points_24h":120},"FutureEra":{"population":14670,"demandHappiness":14670,"supplies_24h":47550,"money_24h":118050,"strategy_points_24h":120},"ArcticFuture":{"population":16280,"demandHappiness":16280,"supplies_24h":52180,"money_24h":134140,"strategy_points_24h":120},"OceanicFuture":{"population":17930,"demandHappiness":17930,"supplies_24h":57210,"money_24h":151260,"strategy_points_24h":120},"VirtualFuture":{"population":19630,"demandHappiness":19630,"supplies_24h":61850,"money_24h":169420,"strategy_points_24h":120},"SpaceAgeMars":{"population":31080,"demandHappiness":31080,"supplies_24h":100120,"money_24h":282990,"strategy_points_24h":120},"SpaceAgeAsteroidBelt":{"population":33760,"demandHappiness":33760,"supplies_24h":107460,"money_24h":313450,"strategy_points_24h":120},"SpaceAgeVenus":{"population":36490,"demandHappiness":36490,"supplies_24h":115190,"money_24h":345530,"strategy_points_24h":120},"SpaceAgeJupiterMoon":{"population":39290,"demandHappiness":39290,"supplies_24h":122540,"money_24h":379240,"strategy_points_24h":120},"SpaceAgeTitan":{"population":42150,"demandHappiness":42150,"supplies_24h":130270,"money_24h":414620,"strategy_points_24h":120},"SpaceAgeSpaceHub":{"population":45000,"demandHappiness":45000,"supplies_24h":138000,"money_24h":450000,"strategy_points_24h":120}}, boosts: [{"type":"def_boost_attacker","value":185,"feature":"battleground"},{"type":"att_boost_defender","value":182,"feature":"battleground"}] },
+    "W_MultiAge_FELL25A8": { prod: {"BronzeAge":{"population":750,"demandHappiness":750,"supplies_24h":2000,"money_24h":2850,"strategy_points_24h":145},"IronAge":{"population":1610,"demandHappiness":1610,"supplies_24h":4810,"money_24h":6830,"strategy_points_24h":145},"EarlyMiddleAge":{"population":2480,"demandHappiness":2480,"supplies_24h":8010,"money_24h":11390,"strategy_points_24h":145},"HighMiddleAge":{"population":3480,"demandHappiness":3480,"supplies_24h":11220,"money_24h":15940,"strategy_points_24h":145},"LateMiddleAge":{"population":4560,"demandHappiness":4560,"supplies_24h":14820,"money_24h":21060,"strategy_points_24h":145},"ColonialAge":{"population":5760,"demandHappiness":5760,"supplies_24h":18830,"money_24h":32080,"strategy_points_24h":145},"IndustrialAge":{"population":7040,"demandHappiness":7040,"supplies_24h":22830,"money_24h":39970,"strategy_points_24h":145},"ProgressiveEra":{"population":8400,"demandHappiness":8400,"supplies_24h":26840,"money_24h":48510,"strategy_points_24h":145},"ModernEra":{"population":9850,"demandHappiness":9850,"supplies_24h":31240,"money_24h":60350,"strategy_points_24h":145},"PostModernEra":{"population":11350,"demandHappiness":11350,"supplies_24h":35650,"money_24h":75920,"strategy_points_24h":145},"ContemporaryEra":{"population":12940,"demandHappiness":12940,"supplies_24h":40060,"money_24h":98830,"strategy_points_24h":145},"TomorrowEra":{"population":14580,"demandHappiness":14580,"supplies_24h":44860,"money_24h":114430,"strategy_points_24h":145},"FutureEra":{"population":16300,"demandHappiness":16300,"supplies_24h":49270,"money_24h":131170,"strategy_points_24h":145},"ArcticFuture":{"population":18090,"demandHappiness":18090,"supplies_24h":54080,"money_24h":149050,"strategy_points_24h":145},"OceanicFuture":{"population":19920,"demandHappiness":19920,"supplies_24h":59280,"money_24h":168060,"strategy_points_24h":145},"VirtualFuture":{"population":21810,"demandHappiness":21810,"supplies_24h":64090,"money_24h":188240,"strategy_points_24h":145},"SpaceAgeMars":{"population":34530,"demandHappiness":34530,"supplies_24h":103750,"money_24h":314430,"strategy_points_24h":145},"SpaceAgeAsteroidBelt":{"population":37510,"demandHappiness":37510,"supplies_24h":111360,"money_24h":348280,"strategy_points_24h":145},"SpaceAgeVenus":{"population":40540,"demandHappiness":40540,"supplies_24h":119370,"money_24h":383920,"strategy_points_24h":145},"SpaceAgeJupiterMoon":{"population":43660,"demandHappiness":43660,"supplies_24h":126980,"money_24h":421380,"strategy_points_24h":145},"SpaceAgeTitan":{"population":46830,"demandHappiness":46830,"supplies_24h":134990,"money_24h":460690,"strategy_points_24h":145},"SpaceAgeSpaceHub":{"population":50000,"demandHappiness":50000,"supplies_24h":143000,"money_24h":500000,"strategy_points_24h":145}}, boosts: [{"type":"def_boost_attacker","value":215,"feature":"battleground"},{"type":"att_boost_defender","value":212,"feature":"battleground"}] },
+    "W_MultiAge_FELL25A10": { prod: {"BronzeAge":{"population":1050,"demandHappiness":1050,"supplies_24h":3820,"money_24h":3990,"strategy_points_24h":195},"IronAge":{"population":2260,"demandHappiness":2260,"supplies_24h":9180,"money_24h":9560,"strategy_points_24h":195},"EarlyMiddleAge":{"population":3470,"demandHappiness":3470,"supplies_24h":15290,"money_24h":15940,"strategy_points_24h":195},"HighMiddleAge":{"population":4870,"demandHappiness":4870,"supplies_24h":21410,"money_24h":22320,"strategy_points_24h":195},"LateMiddleAge":{"population":6390,"demandHappiness":6390,"supplies_24h":28290,"money_24h":29490,"strategy_points_24h":195},"ColonialAge":{"population":8060,"demandHappiness":8060,"supplies_24h":35940,"money_24h":44910,"strategy_points_24h":195},"IndustrialAge":{"population":9860,"demandHappiness":9860,"supplies_24h":43590,"money_24h":55950,"strategy_points_24h":195},"ProgressiveEra":{"population":11760,"demandHappiness":11760,"supplies_24h":51240,"money_24h":67910,"strategy_points_24h":195},"ModernEra":{"population":13790,"demandHappiness":13790,"supplies_24h":59650,"money_24h":84490,"strategy_points_24h":195},"PostModernEra":{"population":15890,"demandHappiness":15890,"supplies_24h":68060,"money_24h":106290,"strategy_points_24h":195},"ContemporaryEra":{"population":18110,"demandHappiness":18110,"supplies_24h":76470,"money_24h":138370,"strategy_points_24h":195},"TomorrowEra":{"population":20410,"demandHappiness":20410,"supplies_24h":85650,"money_24h":160200,"strategy_points_24h":195},"FutureEra":{"population":22830,"demandHappiness":22830,"supplies_24h":94060,"money_24h":183640,"strategy_points_24h":195},"ArcticFuture":{"population":25320,"demandHappiness":25320,"supplies_24h":103240,"money_24h":208660,"strategy_points_24h":195},"OceanicFuture":{"population":27890,"demandHappiness":27890,"supplies_24h":113180,"money_24h":235290,"strategy_points_24h":195},"VirtualFuture":{"population":30540,"demandHappiness":30540,"supplies_24h":122350,"money_24h":263540,"strategy_points_24h":195},"SpaceAgeMars":{"population":48340,"demandHappiness":48340,"supplies_24h":198060,"money_24h":440200,"strategy_points_24h":195},"SpaceAgeAsteroidBelt":{"population":52510,"demandHappiness":52510,"supplies_24h":212590,"money_24h":487590,"strategy_points_24h":195},"SpaceAgeVenus":{"population":56760,"demandHappiness":56760,"supplies_24h":227880,"money_24h":537480,"strategy_points_24h":195},"SpaceAgeJupiterMoon":{"population":61120,"demandHappiness":61120,"supplies_24h":242410,"money_24h":589930,"strategy_points_24h":195},"SpaceAgeTitan":{"population":65560,"demandHappiness":65560,"supplies_24h":257710,"money_24h":644960,"strategy_points_24h":195},"SpaceAgeSpaceHub":{"population":70000,"demandHappiness":70000,"supplies_24h":273000,"money_24h":700000,"strategy_points_24h":195}}, boosts: [{"type":"def_boost_attacker","value":255,"feature":"battleground"},{"type":"att_boost_defender","value":252,"feature":"battleground"}] },
+    "W_MultiAge_FELL25A9": { prod: {"BronzeAge":{"population":900,"demandHappiness":900,"supplies_24h":2730,"money_24h":3420,"strategy_points_24h":170},"IronAge":{"population":1940,"demandHappiness":1940,"supplies_24h":6550,"money_24h":8200,"strategy_points_24h":170},"EarlyMiddleAge":{"population":2970,"demandHappiness":2970,"supplies_24h":10920,"money_24h":13660,"strategy_points_24h":170},"HighMiddleAge":{"population":4170,"demandHappiness":4170,"supplies_24h":15290,"money_24h":19130,"strategy_points_24h":170},"LateMiddleAge":{"population":5480,"demandHappiness":5480,"supplies_24h":20210,"money_24h":25280,"strategy_points_24h":170},"ColonialAge":{"population":6910,"demandHappiness":6910,"supplies_24h":25670,"money_24h":38500,"strategy_points_24h":170},"IndustrialAge":{"population":8450,"demandHappiness":8450,"supplies_24h":31130,"money_24h":47960,"strategy_points_24h":170},"ProgressiveEra":{"population":10080,"demandHappiness":10080,"supplies_24h":36600,"money_24h":58210,"strategy_points_24h":170},"ModernEra":{"population":11820,"demandHappiness":11820,"supplies_24h":42610,"money_24h":72420,"strategy_points_24h":170},"PostModernEra":{"population":13620,"demandHappiness":13620,"supplies_24h":48610,"money_24h":91100,"strategy_points_24h":170},"ContemporaryEra":{"population":15530,"demandHappiness":15530,"supplies_24h":54620,"money_24h":118600,"strategy_points_24h":170},"TomorrowEra":{"population":17500,"demandHappiness":17500,"supplies_24h":61180,"money_24h":137320,"strategy_points_24h":170},"FutureEra":{"population":19570,"demandHappiness":19570,"supplies_24h":67180,"money_24h":157400,"strategy_points_24h":170},"ArcticFuture":{"population":21700,"demandHappiness":21700,"supplies_24h":73740,"money_24h":178860,"strategy_points_24h":170},"OceanicFuture":{"population":23910,"demandHappiness":23910,"supplies_24h":80840,"money_24h":201670,"strategy_points_24h":170},"VirtualFuture":{"population":26180,"demandHappiness":26180,"supplies_24h":87390,"money_24h":225890,"strategy_points_24h":170},"SpaceAgeMars":{"population":41440,"demandHappiness":41440,"supplies_24h":141470,"money_24h":377320,"strategy_points_24h":170},"SpaceAgeAsteroidBelt":{"population":45010,"demandHappiness":45010,"supplies_24h":151850,"money_24h":417930,"strategy_points_24h":170},"SpaceAgeVenus":{"population":48650,"demandHappiness":48650,"supplies_24h":162770,"money_24h":460700,"strategy_points_24h":170},"SpaceAgeJupiterMoon":{"population":52390,"demandHappiness":52390,"supplies_24h":173150,"money_24h":505650,"strategy_points_24h":170},"SpaceAgeTitan":{"population":56190,"demandHappiness":56190,"supplies_24h":184080,"money_24h":552830,"strategy_points_24h":170},"SpaceAgeSpaceHub":{"population":60000,"demandHappiness":60000,"supplies_24h":195000,"money_24h":600000,"strategy_points_24h":170}}, boosts: [{"type":"def_boost_attacker","value":245,"feature":"battleground"},{"type":"att_boost_defender","value":242,"feature":"battleground"}] },
+    "W_MultiAge_FELL24C1": { prod: {"BronzeAge":{"population":-190,"money_24h":1480,"strategy_points_24h":36,"random_good_of_age_24h":18},"IronAge":{"population":-410,"money_24h":3560,"strategy_points_24h":36,"random_good_of_age_24h":18},"EarlyMiddleAge":{"population":-630,"money_24h":5930,"strategy_points_24h":36,"random_good_of_age_24h":18},"HighMiddleAge":{"population":-890,"money_24h":8300,"strategy_points_24h":36,"random_good_of_age_24h":18},"LateMiddleAge":{"population":-1170,"money_24h":10970,"strategy_points_24h":36,"random_good_of_age_24h":18},"ColonialAge":{"population":-1480,"money_24h":16710,"strategy_points_24h":36,"random_good_of_age_24h":18},"IndustrialAge":{"population":-1800,"money_24h":20820,"strategy_points_24h":36,"random_good_of_age_24h":18},"ProgressiveEra":{"population":-2150,"money_24h":25270,"strategy_points_24h":36,"random_good_of_age_24h":18},"ModernEra":{"population":-2520,"money_24h":31440,"strategy_points_24h":36,"random_good_of_age_24h":18},"PostModernEra":{"population":-2910,"money_24h":39550,"strategy_points_24h":36,"random_good_of_age_24h":18},"ContemporaryEra":{"population":-3320,"money_24h":51490,"strategy_points_24h":36,"random_good_of_age_24h":18},"TomorrowEra":{"population":-3740,"money_24h":59610,"strategy_points_24h":36,"random_good_of_age_24h":18},"FutureEra":{"population":-4180,"money_24h":68330,"strategy_points_24h":36,"random_good_of_age_24h":18},"ArcticFuture":{"population":-4630,"money_24h":77650,"strategy_points_24h":36,"random_good_of_age_24h":18},"OceanicFuture":{"population":-5110,"money_24h":87550,"strategy_points_24h":36,"random_good_of_age_24h":18},"VirtualFuture":{"population":-5590,"money_24h":98070,"strategy_points_24h":36,"random_good_of_age_24h":18},"SpaceAgeMars":{"population":-8850,"money_24h":163810,"strategy_points_24h":36,"random_good_of_age_24h":18},"SpaceAgeAsteroidBelt":{"population":-9610,"money_24h":181440,"strategy_points_24h":36,"random_good_of_age_24h":18},"SpaceAgeVenus":{"population":-10390,"money_24h":200000,"strategy_points_24h":36,"random_good_of_age_24h":18},"SpaceAgeJupiterMoon":{"population":-11190,"money_24h":219520,"strategy_points_24h":36,"random_good_of_age_24h":18},"SpaceAgeTitan":{"population":-12000,"money_24h":240000,"strategy_points_24h":36,"random_good_of_age_24h":18},"SpaceAgeSpaceHub":{"population":-12810,"money_24h":260480,"strategy_points_24h":36,"random_good_of_age_24h":18}}, boosts: [{"type":"att_boost_attacker","value":40,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":45,"feature":"all"},{"type":"att_def_boost_defender","value":65,"feature":"guild_expedition"},{"type":"coin_production","value":18,"feature":"all"}] },
+    "W_MultiAge_FELL22A11": { prod: {"BronzeAge":{"population":257,"happiness":1040,"demandHappiness":257,"money_24h":1800,"strategy_points_24h":15,"random_good_of_age_24h":20},"IronAge":{"population":551,"happiness":1790,"demandHappiness":551,"money_24h":4200,"strategy_points_24h":15,"random_good_of_age_24h":20},"EarlyMiddleAge":{"population":846,"happiness":1970,"demandHappiness":846,"money_24h":7000,"strategy_points_24h":15,"random_good_of_age_24h":20},"HighMiddleAge":{"population":1188,"happiness":2200,"demandHappiness":1188,"money_24h":9800,"strategy_points_24h":15,"random_good_of_age_24h":25},"LateMiddleAge":{"population":1558,"happiness":2460,"demandHappiness":1558,"money_24h":13000,"strategy_points_24h":15,"random_good_of_age_24h":25},"ColonialAge":{"population":1967,"happiness":2890,"demandHappiness":1967,"money_24h":19700,"strategy_points_24h":15,"random_good_of_age_24h":25},"IndustrialAge":{"population":2404,"happiness":3260,"demandHappiness":2404,"money_24h":24600,"strategy_points_24h":15,"random_good_of_age_24h":30},"ProgressiveEra":{"population":2869,"happiness":3580,"demandHappiness":2869,"money_24h":29800,"strategy_points_24h":15,"random_good_of_age_24h":30},"ModernEra":{"population":3363,"happiness":3830,"demandHappiness":3363,"money_24h":37100,"strategy_points_24h":15,"random_good_of_age_24h":30},"PostModernEra":{"population":3876,"happiness":3990,"demandHappiness":3876,"money_24h":46700,"strategy_points_24h":15,"random_good_of_age_24h":35},"ContemporaryEra":{"population":4418,"happiness":4630,"demandHappiness":4418,"money_24h":60800,"strategy_points_24h":15,"random_good_of_age_24h":35},"TomorrowEra":{"population":4978,"happiness":5630,"demandHappiness":4978,"money_24h":70400,"strategy_points_24h":15,"random_good_of_age_24h":35},"FutureEra":{"population":5567,"happiness":6740,"demandHappiness":5567,"money_24h":80600,"strategy_points_24h":15,"random_good_of_age_24h":40},"ArcticFuture":{"population":6175,"happiness":7850,"demandHappiness":6175,"money_24h":91600,"strategy_points_24h":15,"random_good_of_age_24h":40},"OceanicFuture":{"population":6802,"happiness":9060,"demandHappiness":6802,"money_24h":103300,"strategy_points_24h":15,"random_good_of_age_24h":40},"VirtualFuture":{"population":7448,"happiness":10820,"demandHappiness":7448,"money_24h":115700,"strategy_points_24h":15,"random_good_of_age_24h":45},"SpaceAgeMars":{"population":11790,"happiness":17310,"demandHappiness":11790,"money_24h":193300,"strategy_points_24h":15,"random_good_of_age_24h":45},"SpaceAgeAsteroidBelt":{"population":12806,"happiness":18810,"demandHappiness":12806,"money_24h":214100,"strategy_points_24h":15,"random_good_of_age_24h":45},"SpaceAgeVenus":{"population":13842,"happiness":20330,"demandHappiness":13842,"money_24h":236000,"strategy_points_24h":15,"random_good_of_age_24h":50},"SpaceAgeJupiterMoon":{"population":14906,"happiness":21900,"demandHappiness":14906,"money_24h":259100,"strategy_points_24h":15,"random_good_of_age_24h":50},"SpaceAgeTitan":{"population":15989,"happiness":23480,"demandHappiness":15989,"money_24h":283200,"strategy_points_24h":15,"random_good_of_age_24h":50},"SpaceAgeSpaceHub":{"population":17100,"happiness":25120,"demandHappiness":17100,"money_24h":308500,"strategy_points_24h":15,"random_good_of_age_24h":55}}, boosts: [{"type":"att_boost_attacker","value":14,"feature":"all"},{"type":"def_boost_attacker","value":21,"feature":"all"},{"type":"att_boost_defender","value":14,"feature":"all"}] },
+    "W_MultiAge_FELL24A9": { prod: {"BronzeAge":{"happiness":4020,"medals_24h":300,"supplies_24h":3740,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"IronAge":{"happiness":6920,"medals_24h":390,"supplies_24h":8970,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"EarlyMiddleAge":{"happiness":7650,"medals_24h":480,"supplies_24h":14950,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"HighMiddleAge":{"happiness":8540,"medals_24h":560,"supplies_24h":20930,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"LateMiddleAge":{"happiness":9520,"medals_24h":650,"supplies_24h":27650,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"ColonialAge":{"happiness":11200,"medals_24h":780,"supplies_24h":35130,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"IndustrialAge":{"happiness":12630,"medals_24h":1090,"supplies_24h":42600,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"ProgressiveEra":{"happiness":13860,"medals_24h":1520,"supplies_24h":50080,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"ModernEra":{"happiness":14830,"medals_24h":2170,"supplies_24h":58300,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"PostModernEra":{"happiness":15450,"medals_24h":3040,"supplies_24h":66520,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"ContemporaryEra":{"happiness":17960,"medals_24h":4340,"supplies_24h":74740,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"TomorrowEra":{"happiness":21800,"medals_24h":5860,"supplies_24h":83710,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"FutureEra":{"happiness":26120,"medals_24h":7170,"supplies_24h":91930,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"ArcticFuture":{"happiness":30410,"medals_24h":8690,"supplies_24h":100900,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"OceanicFuture":{"happiness":35100,"medals_24h":9990,"supplies_24h":110620,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"VirtualFuture":{"happiness":41930,"medals_24h":12160,"supplies_24h":119580,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"SpaceAgeMars":{"happiness":67090,"medals_24h":14760,"supplies_24h":193580,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"SpaceAgeAsteroidBelt":{"happiness":72910,"medals_24h":17370,"supplies_24h":207780,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"SpaceAgeVenus":{"happiness":78770,"medals_24h":19980,"supplies_24h":222730,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"SpaceAgeJupiterMoon":{"happiness":84850,"medals_24h":22580,"supplies_24h":236930,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"SpaceAgeTitan":{"happiness":91000,"medals_24h":25190,"supplies_24h":251880,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0},"SpaceAgeSpaceHub":{"happiness":97150,"medals_24h":27790,"supplies_24h":266820,"strategy_points_24h":66.0,"all_goods_of_age_24h":150.0}}, boosts: [{"type":"def_boost_attacker","value":45,"feature":"all"},{"type":"att_def_boost_attacker","value":62,"feature":"battleground"}] },
+    "W_MultiAge_FELL22B1": { prod: {"BronzeAge":{"population":27,"happiness":90,"demandHappiness":27,"money_24h":300,"all_goods_of_age_24h":5,"units_24h":2},"IronAge":{"population":58,"happiness":160,"demandHappiness":58,"money_24h":600,"all_goods_of_age_24h":5,"units_24h":2},"EarlyMiddleAge":{"population":89,"happiness":170,"demandHappiness":89,"money_24h":1000,"all_goods_of_age_24h":5,"units_24h":2},"HighMiddleAge":{"population":125,"happiness":190,"demandHappiness":125,"money_24h":1400,"all_goods_of_age_24h":5,"units_24h":2},"LateMiddleAge":{"population":164,"happiness":210,"demandHappiness":164,"money_24h":1900,"all_goods_of_age_24h":5,"units_24h":2},"ColonialAge":{"population":207,"happiness":250,"demandHappiness":207,"money_24h":2800,"all_goods_of_age_24h":5,"units_24h":2},"IndustrialAge":{"population":253,"happiness":280,"demandHappiness":253,"money_24h":3500,"all_goods_of_age_24h":5,"units_24h":2},"ProgressiveEra":{"population":302,"happiness":310,"demandHappiness":302,"money_24h":4300,"all_goods_of_age_24h":5,"units_24h":2},"ModernEra":{"population":354,"happiness":330,"demandHappiness":354,"money_24h":5300,"all_goods_of_age_24h":5,"units_24h":2},"PostModernEra":{"population":408,"happiness":350,"demandHappiness":408,"money_24h":6700,"all_goods_of_age_24h":5,"units_24h":2},"ContemporaryEra":{"population":465,"happiness":400,"demandHappiness":465,"money_24h":8700,"all_goods_of_age_24h":5,"units_24h":2},"TomorrowEra":{"population":524,"happiness":490,"demandHappiness":524,"money_24h":10100,"all_goods_of_age_24h":5,"units_24h":2},"FutureEra":{"population":586,"happiness":590,"demandHappiness":586,"money_24h":11500,"all_goods_of_age_24h":5,"units_24h":2},"ArcticFuture":{"population":650,"happiness":680,"demandHappiness":650,"money_24h":13100,"all_goods_of_age_24h":5,"units_24h":2},"OceanicFuture":{"population":716,"happiness":790,"demandHappiness":716,"money_24h":14800,"all_goods_of_age_24h":5,"units_24h":2},"VirtualFuture":{"population":784,"happiness":940,"demandHappiness":784,"money_24h":16500,"all_goods_of_age_24h":5,"units_24h":2},"SpaceAgeMars":{"population":1241,"happiness":1510,"demandHappiness":1241,"money_24h":27600,"all_goods_of_age_24h":5,"units_24h":2},"SpaceAgeAsteroidBelt":{"population":1348,"happiness":1640,"demandHappiness":1348,"money_24h":30600,"all_goods_of_age_24h":5,"units_24h":2},"SpaceAgeVenus":{"population":1457,"happiness":1770,"demandHappiness":1457,"money_24h":33700,"all_goods_of_age_24h":5,"units_24h":2},"SpaceAgeJupiterMoon":{"population":1569,"happiness":1900,"demandHappiness":1569,"money_24h":37000,"all_goods_of_age_24h":5,"units_24h":2},"SpaceAgeTitan":{"population":1683,"happiness":2040,"demandHappiness":1683,"money_24h":40500,"all_goods_of_age_24h":5,"units_24h":2},"SpaceAgeSpaceHub":{"population":1800,"happiness":2180,"demandHappiness":1800,"money_24h":44100,"all_goods_of_age_24h":5,"units_24h":2}} },
+    "W_MultiAge_FELL22A12": { prod: {"BronzeAge":{"population":280,"happiness":1070,"demandHappiness":280,"money_24h":1770,"strategy_points_24h":35,"random_good_of_age_24h":50},"IronAge":{"population":610,"happiness":1840,"demandHappiness":610,"money_24h":4240,"strategy_points_24h":35,"random_good_of_age_24h":50},"EarlyMiddleAge":{"population":930,"happiness":2030,"demandHappiness":930,"money_24h":7070,"strategy_points_24h":35,"random_good_of_age_24h":50},"HighMiddleAge":{"population":1310,"happiness":2270,"demandHappiness":1310,"money_24h":9900,"strategy_points_24h":35,"random_good_of_age_24h":60},"LateMiddleAge":{"population":1720,"happiness":2530,"demandHappiness":1720,"money_24h":13080,"strategy_points_24h":35,"random_good_of_age_24h":60},"ColonialAge":{"population":2160,"happiness":2980,"demandHappiness":2160,"money_24h":19920,"strategy_points_24h":35,"random_good_of_age_24h":60},"IndustrialAge":{"population":2650,"happiness":3360,"demandHappiness":2650,"money_24h":24810,"strategy_points_24h":35,"random_good_of_age_24h":70},"ProgressiveEra":{"population":3160,"happiness":3690,"demandHappiness":3160,"money_24h":30110,"strategy_points_24h":35,"random_good_of_age_24h":70},"ModernEra":{"population":3700,"happiness":3940,"demandHappiness":3700,"money_24h":37460,"strategy_points_24h":35,"random_good_of_age_24h":70},"PostModernEra":{"population":4270,"happiness":4110,"demandHappiness":4270,"money_24h":47130,"strategy_points_24h":35,"random_good_of_age_24h":80},"ContemporaryEra":{"population":4860,"happiness":4780,"demandHappiness":4860,"money_24h":61360,"strategy_points_24h":35,"random_good_of_age_24h":80},"TomorrowEra":{"population":5480,"happiness":5800,"demandHappiness":5480,"money_24h":71040,"strategy_points_24h":35,"random_good_of_age_24h":80},"FutureEra":{"population":6130,"happiness":6950,"demandHappiness":6130,"money_24h":81430,"strategy_points_24h":35,"random_good_of_age_24h":90},"ArcticFuture":{"population":6800,"happiness":8090,"demandHappiness":6800,"money_24h":92530,"strategy_points_24h":35,"random_good_of_age_24h":90},"OceanicFuture":{"population":7490,"happiness":9330,"demandHappiness":7490,"money_24h":104330,"strategy_points_24h":35,"random_good_of_age_24h":90},"VirtualFuture":{"population":8200,"happiness":11150,"demandHappiness":8200,"money_24h":116860,"strategy_points_24h":35,"random_good_of_age_24h":100},"SpaceAgeMars":{"population":12980,"happiness":17840,"demandHappiness":12980,"money_24h":195200,"strategy_points_24h":35,"random_good_of_age_24h":100},"SpaceAgeAsteroidBelt":{"population":14100,"happiness":19390,"demandHappiness":14100,"money_24h":216210,"strategy_points_24h":35,"random_good_of_age_24h":100},"SpaceAgeVenus":{"population":15240,"happiness":20950,"demandHappiness":15240,"money_24h":238340,"strategy_points_24h":35,"random_good_of_age_24h":110},"SpaceAgeJupiterMoon":{"population":16410,"happiness":22570,"demandHappiness":16410,"money_24h":261600,"strategy_points_24h":35,"random_good_of_age_24h":110},"SpaceAgeTitan":{"population":17600,"happiness":24200,"demandHappiness":17600,"money_24h":286000,"strategy_points_24h":35,"random_good_of_age_24h":110},"SpaceAgeSpaceHub":{"population":18790,"happiness":25830,"demandHappiness":18790,"money_24h":310400,"strategy_points_24h":35,"random_good_of_age_24h":110}}, boosts: [{"type":"att_boost_attacker","value":25,"feature":"battleground"},{"type":"att_def_boost_attacker","value":25,"feature":"all"},{"type":"att_def_boost_defender","value":25,"feature":"all"},{"type":"att_boost_defender","value":30,"feature":"guild_raids"}] },
+    "W_MultiAge_FELL25C1": { prod: {"BronzeAge":{"population":-270,"medals_24h":200,"strategy_points_24h":80},"IronAge":{"population":-580,"medals_24h":250,"strategy_points_24h":80},"EarlyMiddleAge":{"population":-890,"medals_24h":310,"strategy_points_24h":80},"HighMiddleAge":{"population":-1250,"medals_24h":370,"strategy_points_24h":80},"LateMiddleAge":{"population":-1640,"medals_24h":420,"strategy_points_24h":80},"ColonialAge":{"population":-2070,"medals_24h":510,"strategy_points_24h":80},"IndustrialAge":{"population":-2530,"medals_24h":700,"strategy_points_24h":80},"ProgressiveEra":{"population":-3030,"medals_24h":980,"strategy_points_24h":80},"ModernEra":{"population":-3550,"medals_24h":1410,"strategy_points_24h":80},"PostModernEra":{"population":-4090,"medals_24h":1970,"strategy_points_24h":80},"ContemporaryEra":{"population":-4660,"medals_24h":2810,"strategy_points_24h":80},"TomorrowEra":{"population":-5250,"medals_24h":3800,"strategy_points_24h":80},"FutureEra":{"population":-5870,"medals_24h":4640,"strategy_points_24h":80},"ArcticFuture":{"population":-6510,"medals_24h":5630,"strategy_points_24h":80},"OceanicFuture":{"population":-7170,"medals_24h":6470,"strategy_points_24h":80},"VirtualFuture":{"population":-7850,"medals_24h":7880,"strategy_points_24h":80},"SpaceAgeMars":{"population":-12430,"medals_24h":9560,"strategy_points_24h":80},"SpaceAgeAsteroidBelt":{"population":-13500,"medals_24h":11250,"strategy_points_24h":80},"SpaceAgeVenus":{"population":-14590,"medals_24h":12940,"strategy_points_24h":80},"SpaceAgeJupiterMoon":{"population":-15720,"medals_24h":14630,"strategy_points_24h":80},"SpaceAgeTitan":{"population":-16860,"medals_24h":16310,"strategy_points_24h":80},"SpaceAgeSpaceHub":{"population":-18000,"medals_24h":18000,"strategy_points_24h":80}}, boosts: [{"type":"att_def_boost_attacker","value":35,"feature":"battleground"}] },
+    "W_MultiAge_FELL25E1": { prod: {"AllAge":{"strategy_points_24h":65,"random_good_of_age_24h":49,"random_good_of_previous_age_24h":65},"BronzeAge":{"population":-1520},"IronAge":{"population":-3270},"EarlyMiddleAge":{"population":-5010},"HighMiddleAge":{"population":-7040},"LateMiddleAge":{"population":-9240},"ColonialAge":{"population":-11660},"IndustrialAge":{"population":-14260},"ProgressiveEra":{"population":-17020},"ModernEra":{"population":-19950},"PostModernEra":{"population":-22990},"ContemporaryEra":{"population":-26200},"TomorrowEra":{"population":-29520},"FutureEra":{"population":-33020},"ArcticFuture":{"population":-36620},"OceanicFuture":{"population":-40340},"VirtualFuture":{"population":-44170},"SpaceAgeMars":{"population":-69920},"SpaceAgeAsteroidBelt":{"population":-75950},"SpaceAgeVenus":{"population":-82090},"SpaceAgeJupiterMoon":{"population":-88400},"SpaceAgeTitan":{"population":-94830},"SpaceAgeSpaceHub":{"population":-101250}}, boosts: [{"type":"att_def_boost_attacker_defender","value":73,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":73,"feature":"guild_expedition"}] },
+    "W_MultiAge_FELL25E2": { prod: {"AllAge":{"strategy_points_24h":108,"random_good_of_age_24h":81,"random_good_of_previous_age_24h":108},"BronzeAge":{"population":-1520},"IronAge":{"population":-3270},"EarlyMiddleAge":{"population":-5010},"HighMiddleAge":{"population":-7040},"LateMiddleAge":{"population":-9240},"ColonialAge":{"population":-11660},"IndustrialAge":{"population":-14260},"ProgressiveEra":{"population":-17020},"ModernEra":{"population":-19950},"PostModernEra":{"population":-22990},"ContemporaryEra":{"population":-26200},"TomorrowEra":{"population":-29520},"FutureEra":{"population":-33020},"ArcticFuture":{"population":-36620},"OceanicFuture":{"population":-40340},"VirtualFuture":{"population":-44170},"SpaceAgeMars":{"population":-69920},"SpaceAgeAsteroidBelt":{"population":-75950},"SpaceAgeVenus":{"population":-82090},"SpaceAgeJupiterMoon":{"population":-88400},"SpaceAgeTitan":{"population":-94830},"SpaceAgeSpaceHub":{"population":-101250}}, boosts: [{"type":"att_def_boost_attacker_defender","value":125,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":125,"feature":"guild_expedition"}] },
+    "W_MultiAge_FELL25D1": { prod: {"AllAge":{"strategy_points_24h":260,"all_goods_of_next_age_24h":120}}, boosts: [{"type":"att_def_boost_attacker_defender","value":200,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":25,"feature":"guild_raids"}] },
+    "W_MultiAge_FELL23A1": { prod: {"BronzeAge":{"happiness":520,"strategy_points_24h":1},"IronAge":{"happiness":900,"strategy_points_24h":1},"EarlyMiddleAge":{"happiness":1000,"strategy_points_24h":1},"HighMiddleAge":{"happiness":1110,"strategy_points_24h":1},"LateMiddleAge":{"happiness":1240,"strategy_points_24h":1},"ColonialAge":{"happiness":1460,"strategy_points_24h":1},"IndustrialAge":{"happiness":1640,"strategy_points_24h":1},"ProgressiveEra":{"happiness":1800,"strategy_points_24h":1},"ModernEra":{"happiness":1930,"strategy_points_24h":1},"PostModernEra":{"happiness":2010,"strategy_points_24h":1},"ContemporaryEra":{"happiness":2340,"strategy_points_24h":1},"TomorrowEra":{"happiness":2840,"strategy_points_24h":1},"FutureEra":{"happiness":3400,"strategy_points_24h":1},"ArcticFuture":{"happiness":3960,"strategy_points_24h":1},"OceanicFuture":{"happiness":4570,"strategy_points_24h":1},"VirtualFuture":{"happiness":5460,"strategy_points_24h":1},"SpaceAgeMars":{"happiness":8730,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"happiness":9490,"strategy_points_24h":1},"SpaceAgeVenus":{"happiness":10250,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"happiness":11040,"strategy_points_24h":1},"SpaceAgeTitan":{"happiness":11891,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"happiness":12742,"strategy_points_24h":1}} },
+    "W_MultiAge_FELL23A2": { prod: {"BronzeAge":{"happiness":540,"strategy_points_24h":1},"IronAge":{"happiness":930,"strategy_points_24h":1},"EarlyMiddleAge":{"happiness":1030,"strategy_points_24h":1},"HighMiddleAge":{"happiness":1150,"strategy_points_24h":1},"LateMiddleAge":{"happiness":1280,"strategy_points_24h":1},"ColonialAge":{"happiness":1510,"strategy_points_24h":1},"IndustrialAge":{"happiness":1700,"strategy_points_24h":1},"ProgressiveEra":{"happiness":1870,"strategy_points_24h":1},"ModernEra":{"happiness":2000,"strategy_points_24h":1},"PostModernEra":{"happiness":2080,"strategy_points_24h":1},"ContemporaryEra":{"happiness":2420,"strategy_points_24h":1},"TomorrowEra":{"happiness":2940,"strategy_points_24h":1},"FutureEra":{"happiness":3520,"strategy_points_24h":1},"ArcticFuture":{"happiness":4090,"strategy_points_24h":1},"OceanicFuture":{"happiness":4730,"strategy_points_24h":1},"VirtualFuture":{"happiness":5650,"strategy_points_24h":1},"SpaceAgeMars":{"happiness":9030,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"happiness":9820,"strategy_points_24h":1},"SpaceAgeVenus":{"happiness":10610,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"happiness":11420,"strategy_points_24h":1},"SpaceAgeTitan":{"happiness":12292,"strategy_points_24h":2},"SpaceAgeSpaceHub":{"happiness":13164,"strategy_points_24h":2}} },
+    "W_MultiAge_FELL23A3": { prod: {"BronzeAge":{"happiness":560,"strategy_points_24h":1},"IronAge":{"happiness":960,"strategy_points_24h":1},"EarlyMiddleAge":{"happiness":1060,"strategy_points_24h":1},"HighMiddleAge":{"happiness":1190,"strategy_points_24h":1},"LateMiddleAge":{"happiness":1320,"strategy_points_24h":1},"ColonialAge":{"happiness":1560,"strategy_points_24h":1},"IndustrialAge":{"happiness":1760,"strategy_points_24h":1},"ProgressiveEra":{"happiness":1930,"strategy_points_24h":1},"ModernEra":{"happiness":2060,"strategy_points_24h":1},"PostModernEra":{"happiness":2150,"strategy_points_24h":2},"ContemporaryEra":{"happiness":2500,"strategy_points_24h":2},"TomorrowEra":{"happiness":3030,"strategy_points_24h":2},"FutureEra":{"happiness":3630,"strategy_points_24h":2},"ArcticFuture":{"happiness":4230,"strategy_points_24h":2},"OceanicFuture":{"happiness":4880,"strategy_points_24h":2},"VirtualFuture":{"happiness":5830,"strategy_points_24h":2},"SpaceAgeMars":{"happiness":9330,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"happiness":10140,"strategy_points_24h":2},"SpaceAgeVenus":{"happiness":10960,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"happiness":11800,"strategy_points_24h":2},"SpaceAgeTitan":{"happiness":12705,"strategy_points_24h":3},"SpaceAgeSpaceHub":{"happiness":13610,"strategy_points_24h":3}} },
+    "W_MultiAge_FELL23A4": { prod: {"BronzeAge":{"happiness":580,"strategy_points_24h":1,"all_goods_of_age_24h":5},"IronAge":{"happiness":990,"strategy_points_24h":1,"all_goods_of_age_24h":5},"EarlyMiddleAge":{"happiness":1100,"strategy_points_24h":1,"all_goods_of_age_24h":5},"HighMiddleAge":{"happiness":1230,"strategy_points_24h":1,"all_goods_of_age_24h":5},"LateMiddleAge":{"happiness":1370,"strategy_points_24h":1,"all_goods_of_age_24h":5},"ColonialAge":{"happiness":1610,"strategy_points_24h":1,"all_goods_of_age_24h":5},"IndustrialAge":{"happiness":1810,"strategy_points_24h":1,"all_goods_of_age_24h":5},"ProgressiveEra":{"happiness":1990,"strategy_points_24h":1,"all_goods_of_age_24h":5},"ModernEra":{"happiness":2130,"strategy_points_24h":1,"all_goods_of_age_24h":5},"PostModernEra":{"happiness":2220,"strategy_points_24h":2,"all_goods_of_age_24h":5},"ContemporaryEra":{"happiness":2580,"strategy_points_24h":2,"all_goods_of_age_24h":5},"TomorrowEra":{"happiness":3130,"strategy_points_24h":2,"all_goods_of_age_24h":5},"FutureEra":{"happiness":3750,"strategy_points_24h":2,"all_goods_of_age_24h":5},"ArcticFuture":{"happiness":4370,"strategy_points_24h":2,"all_goods_of_age_24h":5},"OceanicFuture":{"happiness":5040,"strategy_points_24h":2,"all_goods_of_age_24h":5},"VirtualFuture":{"happiness":6020,"strategy_points_24h":2,"all_goods_of_age_24h":5},"SpaceAgeMars":{"happiness":9630,"strategy_points_24h":2,"all_goods_of_age_24h":5},"SpaceAgeAsteroidBelt":{"happiness":10470,"strategy_points_24h":2,"all_goods_of_age_24h":5},"SpaceAgeVenus":{"happiness":11310,"strategy_points_24h":2,"all_goods_of_age_24h":5},"SpaceAgeJupiterMoon":{"happiness":12190,"strategy_points_24h":2,"all_goods_of_age_24h":5},"SpaceAgeTitan":{"happiness":13139,"strategy_points_24h":3,"all_goods_of_age_24h":5},"SpaceAgeSpaceHub":{"happiness":14088,"strategy_points_24h":3,"all_goods_of_age_24h":5}} },
+    "W_MultiAge_FELL23A5": { prod: {"BronzeAge":{"happiness":590,"strategy_points_24h":1,"all_goods_of_age_24h":10},"IronAge":{"happiness":1020,"strategy_points_24h":1,"all_goods_of_age_24h":10},"EarlyMiddleAge":{"happiness":1130,"strategy_points_24h":1,"all_goods_of_age_24h":10},"HighMiddleAge":{"happiness":1260,"strategy_points_24h":1,"all_goods_of_age_24h":10},"LateMiddleAge":{"happiness":1410,"strategy_points_24h":1,"all_goods_of_age_24h":10},"ColonialAge":{"happiness":1660,"strategy_points_24h":1,"all_goods_of_age_24h":10},"IndustrialAge":{"happiness":1870,"strategy_points_24h":1,"all_goods_of_age_24h":10},"ProgressiveEra":{"happiness":2050,"strategy_points_24h":1,"all_goods_of_age_24h":10},"ModernEra":{"happiness":2200,"strategy_points_24h":1,"all_goods_of_age_24h":10},"PostModernEra":{"happiness":2290,"strategy_points_24h":2,"all_goods_of_age_24h":10},"ContemporaryEra":{"happiness":2660,"strategy_points_24h":2,"all_goods_of_age_24h":10},"TomorrowEra":{"happiness":3230,"strategy_points_24h":2,"all_goods_of_age_24h":10},"FutureEra":{"happiness":3870,"strategy_points_24h":2,"all_goods_of_age_24h":10},"ArcticFuture":{"happiness":4500,"strategy_points_24h":2,"all_goods_of_age_24h":10},"OceanicFuture":{"happiness":5200,"strategy_points_24h":2,"all_goods_of_age_24h":10},"VirtualFuture":{"happiness":6210,"strategy_points_24h":2,"all_goods_of_age_24h":10},"SpaceAgeMars":{"happiness":9940,"strategy_points_24h":2,"all_goods_of_age_24h":10},"SpaceAgeAsteroidBelt":{"happiness":10800,"strategy_points_24h":2,"all_goods_of_age_24h":10},"SpaceAgeVenus":{"happiness":11670,"strategy_points_24h":2,"all_goods_of_age_24h":10},"SpaceAgeJupiterMoon":{"happiness":12570,"strategy_points_24h":2,"all_goods_of_age_24h":10},"SpaceAgeTitan":{"happiness":13540,"strategy_points_24h":3,"all_goods_of_age_24h":10},"SpaceAgeSpaceHub":{"happiness":14510,"strategy_points_24h":3,"all_goods_of_age_24h":10}} },
+    "W_MultiAge_FELL23A6": { prod: {"BronzeAge":{"happiness":590,"strategy_points_24h":1,"all_goods_of_age_24h":15},"IronAge":{"happiness":1020,"strategy_points_24h":1,"all_goods_of_age_24h":15},"EarlyMiddleAge":{"happiness":1130,"strategy_points_24h":1,"all_goods_of_age_24h":15},"HighMiddleAge":{"happiness":1260,"strategy_points_24h":1,"all_goods_of_age_24h":15},"LateMiddleAge":{"happiness":1410,"strategy_points_24h":1,"all_goods_of_age_24h":15},"ColonialAge":{"happiness":1660,"strategy_points_24h":1,"all_goods_of_age_24h":15},"IndustrialAge":{"happiness":1870,"strategy_points_24h":1,"all_goods_of_age_24h":15},"ProgressiveEra":{"happiness":2050,"strategy_points_24h":1,"all_goods_of_age_24h":15},"ModernEra":{"happiness":2200,"strategy_points_24h":1,"all_goods_of_age_24h":15},"PostModernEra":{"happiness":2290,"strategy_points_24h":2,"all_goods_of_age_24h":15},"ContemporaryEra":{"happiness":2660,"strategy_points_24h":2,"all_goods_of_age_24h":15},"TomorrowEra":{"happiness":3230,"strategy_points_24h":2,"all_goods_of_age_24h":15},"FutureEra":{"happiness":3870,"strategy_points_24h":2,"all_goods_of_age_24h":15},"ArcticFuture":{"happiness":4500,"strategy_points_24h":2,"all_goods_of_age_24h":15},"OceanicFuture":{"happiness":5200,"strategy_points_24h":2,"all_goods_of_age_24h":15},"VirtualFuture":{"happiness":6210,"strategy_points_24h":2,"all_goods_of_age_24h":15},"SpaceAgeMars":{"happiness":9940,"strategy_points_24h":2,"all_goods_of_age_24h":15},"SpaceAgeAsteroidBelt":{"happiness":10800,"strategy_points_24h":2,"all_goods_of_age_24h":15},"SpaceAgeVenus":{"happiness":11670,"strategy_points_24h":2,"all_goods_of_age_24h":15},"SpaceAgeJupiterMoon":{"happiness":12570,"strategy_points_24h":2,"all_goods_of_age_24h":15},"SpaceAgeTitan":{"happiness":13540,"strategy_points_24h":3,"all_goods_of_age_24h":15},"SpaceAgeSpaceHub":{"happiness":14510,"strategy_points_24h":3,"all_goods_of_age_24h":15}} },
+    "W_MultiAge_FELL23A7": { prod: {"BronzeAge":{"happiness":630,"strategy_points_24h":1,"all_goods_of_age_24h":20},"IronAge":{"happiness":1090,"strategy_points_24h":1,"all_goods_of_age_24h":20},"EarlyMiddleAge":{"happiness":1200,"strategy_points_24h":1,"all_goods_of_age_24h":20},"HighMiddleAge":{"happiness":1340,"strategy_points_24h":1,"all_goods_of_age_24h":20},"LateMiddleAge":{"happiness":1500,"strategy_points_24h":1,"all_goods_of_age_24h":20},"ColonialAge":{"happiness":1760,"strategy_points_24h":1,"all_goods_of_age_24h":20},"IndustrialAge":{"happiness":1980,"strategy_points_24h":1,"all_goods_of_age_24h":20},"ProgressiveEra":{"happiness":2180,"strategy_points_24h":2,"all_goods_of_age_24h":20},"ModernEra":{"happiness":2330,"strategy_points_24h":2,"all_goods_of_age_24h":20},"PostModernEra":{"happiness":2430,"strategy_points_24h":2,"all_goods_of_age_24h":20},"ContemporaryEra":{"happiness":2820,"strategy_points_24h":2,"all_goods_of_age_24h":20},"TomorrowEra":{"happiness":3420,"strategy_points_24h":2,"all_goods_of_age_24h":20},"FutureEra":{"happiness":4100,"strategy_points_24h":2,"all_goods_of_age_24h":20},"ArcticFuture":{"happiness":4780,"strategy_points_24h":2,"all_goods_of_age_24h":20},"OceanicFuture":{"happiness":5510,"strategy_points_24h":3,"all_goods_of_age_24h":20},"VirtualFuture":{"happiness":6590,"strategy_points_24h":3,"all_goods_of_age_24h":20},"SpaceAgeMars":{"happiness":10540,"strategy_points_24h":3,"all_goods_of_age_24h":20},"SpaceAgeAsteroidBelt":{"happiness":11450,"strategy_points_24h":3,"all_goods_of_age_24h":20},"SpaceAgeVenus":{"happiness":12370,"strategy_points_24h":3,"all_goods_of_age_24h":20},"SpaceAgeJupiterMoon":{"happiness":13330,"strategy_points_24h":3,"all_goods_of_age_24h":20},"SpaceAgeTitan":{"happiness":14365,"strategy_points_24h":4,"all_goods_of_age_24h":20},"SpaceAgeSpaceHub":{"happiness":15400,"strategy_points_24h":4,"all_goods_of_age_24h":20}}, boosts: [{"type":"def_boost_defender","value":1,"feature":"all"}] },
+    "W_MultiAge_FELL23A8": { prod: {"BronzeAge":{"happiness":650,"strategy_points_24h":2,"all_goods_of_age_24h":25},"IronAge":{"happiness":1120,"strategy_points_24h":2,"all_goods_of_age_24h":25},"EarlyMiddleAge":{"happiness":1240,"strategy_points_24h":2,"all_goods_of_age_24h":25},"HighMiddleAge":{"happiness":1380,"strategy_points_24h":2,"all_goods_of_age_24h":25},"LateMiddleAge":{"happiness":1540,"strategy_points_24h":2,"all_goods_of_age_24h":25},"ColonialAge":{"happiness":1810,"strategy_points_24h":2,"all_goods_of_age_24h":25},"IndustrialAge":{"happiness":2040,"strategy_points_24h":2,"all_goods_of_age_24h":25},"ProgressiveEra":{"happiness":2240,"strategy_points_24h":3,"all_goods_of_age_24h":25},"ModernEra":{"happiness":2400,"strategy_points_24h":3,"all_goods_of_age_24h":25},"PostModernEra":{"happiness":2500,"strategy_points_24h":3,"all_goods_of_age_24h":25},"ContemporaryEra":{"happiness":2900,"strategy_points_24h":3,"all_goods_of_age_24h":25},"TomorrowEra":{"happiness":3520,"strategy_points_24h":3,"all_goods_of_age_24h":25},"FutureEra":{"happiness":4220,"strategy_points_24h":3,"all_goods_of_age_24h":25},"ArcticFuture":{"happiness":4910,"strategy_points_24h":3,"all_goods_of_age_24h":25},"OceanicFuture":{"happiness":5670,"strategy_points_24h":4,"all_goods_of_age_24h":25},"VirtualFuture":{"happiness":6770,"strategy_points_24h":4,"all_goods_of_age_24h":25},"SpaceAgeMars":{"happiness":10840,"strategy_points_24h":4,"all_goods_of_age_24h":25},"SpaceAgeAsteroidBelt":{"happiness":11780,"strategy_points_24h":4,"all_goods_of_age_24h":25},"SpaceAgeVenus":{"happiness":12730,"strategy_points_24h":4,"all_goods_of_age_24h":25},"SpaceAgeJupiterMoon":{"happiness":13710,"strategy_points_24h":4,"all_goods_of_age_24h":25},"SpaceAgeTitan":{"happiness":14766,"strategy_points_24h":5,"all_goods_of_age_24h":25},"SpaceAgeSpaceHub":{"happiness":15822,"strategy_points_24h":5,"all_goods_of_age_24h":25}}, boosts: [{"type":"def_boost_defender","value":3,"feature":"all"}] },
+    "W_MultiAge_FELL23A9": { prod: {"BronzeAge":{"happiness":670,"strategy_points_24h":4,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"IronAge":{"happiness":1150,"strategy_points_24h":4,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"EarlyMiddleAge":{"happiness":1270,"strategy_points_24h":4,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"HighMiddleAge":{"happiness":1420,"strategy_points_24h":4,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"LateMiddleAge":{"happiness":1580,"strategy_points_24h":5,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"ColonialAge":{"happiness":1860,"strategy_points_24h":5,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"IndustrialAge":{"happiness":2100,"strategy_points_24h":5,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"ProgressiveEra":{"happiness":2300,"strategy_points_24h":5,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"ModernEra":{"happiness":2460,"strategy_points_24h":6,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"PostModernEra":{"happiness":2570,"strategy_points_24h":6,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"ContemporaryEra":{"happiness":2980,"strategy_points_24h":6,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"TomorrowEra":{"happiness":3620,"strategy_points_24h":6,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"FutureEra":{"happiness":4340,"strategy_points_24h":7,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"ArcticFuture":{"happiness":5050,"strategy_points_24h":7,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"OceanicFuture":{"happiness":5830,"strategy_points_24h":7,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"VirtualFuture":{"happiness":6960,"strategy_points_24h":7,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"SpaceAgeMars":{"happiness":11140,"strategy_points_24h":8,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"SpaceAgeAsteroidBelt":{"happiness":12110,"strategy_points_24h":8,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"SpaceAgeVenus":{"happiness":13080,"strategy_points_24h":8,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"SpaceAgeJupiterMoon":{"happiness":14090,"strategy_points_24h":8,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"SpaceAgeTitan":{"happiness":15178,"strategy_points_24h":9,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5},"SpaceAgeSpaceHub":{"happiness":16266,"strategy_points_24h":9,"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":5}}, boosts: [{"type":"def_boost_defender","value":9,"feature":"all"},{"type":"att_boost_attacker","value":15,"feature":"all"}] },
+    "W_MultiAge_FELL23A10": { prod: {"BronzeAge":{"happiness":680,"strategy_points_24h":9,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"IronAge":{"happiness":1180,"strategy_points_24h":9,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"EarlyMiddleAge":{"happiness":1310,"strategy_points_24h":9,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"HighMiddleAge":{"happiness":1460,"strategy_points_24h":9,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"LateMiddleAge":{"happiness":1620,"strategy_points_24h":9,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"ColonialAge":{"happiness":1910,"strategy_points_24h":10,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"IndustrialAge":{"happiness":2150,"strategy_points_24h":10,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"ProgressiveEra":{"happiness":2360,"strategy_points_24h":10,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"ModernEra":{"happiness":2530,"strategy_points_24h":10,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"PostModernEra":{"happiness":2640,"strategy_points_24h":10,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"ContemporaryEra":{"happiness":3060,"strategy_points_24h":11,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"TomorrowEra":{"happiness":3720,"strategy_points_24h":11,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"FutureEra":{"happiness":4450,"strategy_points_24h":11,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"ArcticFuture":{"happiness":5190,"strategy_points_24h":11,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"OceanicFuture":{"happiness":5990,"strategy_points_24h":11,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"VirtualFuture":{"happiness":7150,"strategy_points_24h":12,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"SpaceAgeMars":{"happiness":11440,"strategy_points_24h":12,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"SpaceAgeAsteroidBelt":{"happiness":12430,"strategy_points_24h":12,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"SpaceAgeVenus":{"happiness":13430,"strategy_points_24h":12,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"SpaceAgeJupiterMoon":{"happiness":14470,"strategy_points_24h":12,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"SpaceAgeTitan":{"happiness":15591,"strategy_points_24h":13,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10},"SpaceAgeSpaceHub":{"happiness":16712,"strategy_points_24h":13,"all_goods_of_age_24h":40,"random_good_of_previous_age_24h":10}}, boosts: [{"type":"def_boost_defender","value":21,"feature":"all"},{"type":"att_boost_attacker","value":27,"feature":"all"},{"type":"att_boost_defender","value":15,"feature":"all"},{"type":"coin_production","value":30,"feature":"all"}] },
+    "W_MultiAge_FELL24A1": { prod: {"BronzeAge":{"happiness":1720,"medals_24h":70,"supplies_24h":840,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"IronAge":{"happiness":2970,"medals_24h":90,"supplies_24h":2030,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"EarlyMiddleAge":{"happiness":3280,"medals_24h":110,"supplies_24h":3380,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"HighMiddleAge":{"happiness":3660,"medals_24h":130,"supplies_24h":4730,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"LateMiddleAge":{"happiness":4080,"medals_24h":150,"supplies_24h":6240,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"ColonialAge":{"happiness":4800,"medals_24h":180,"supplies_24h":7930,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"IndustrialAge":{"happiness":5410,"medals_24h":250,"supplies_24h":9620,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"ProgressiveEra":{"happiness":5940,"medals_24h":340,"supplies_24h":11310,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"ModernEra":{"happiness":6360,"medals_24h":490,"supplies_24h":13160,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"PostModernEra":{"happiness":6620,"medals_24h":690,"supplies_24h":15020,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"ContemporaryEra":{"happiness":7700,"medals_24h":980,"supplies_24h":16880,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"TomorrowEra":{"happiness":9340,"medals_24h":1320,"supplies_24h":18900,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"FutureEra":{"happiness":11190,"medals_24h":1620,"supplies_24h":20760,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"ArcticFuture":{"happiness":13030,"medals_24h":1960,"supplies_24h":22780,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"OceanicFuture":{"happiness":15040,"medals_24h":2260,"supplies_24h":24980,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"VirtualFuture":{"happiness":17970,"medals_24h":2750,"supplies_24h":27000,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"SpaceAgeMars":{"happiness":28750,"medals_24h":3330,"supplies_24h":43710,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"SpaceAgeAsteroidBelt":{"happiness":31250,"medals_24h":3920,"supplies_24h":46920,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"SpaceAgeVenus":{"happiness":33760,"medals_24h":4510,"supplies_24h":50290,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"SpaceAgeJupiterMoon":{"happiness":36370,"medals_24h":5100,"supplies_24h":53500,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"SpaceAgeTitan":{"happiness":39000,"medals_24h":5690,"supplies_24h":56880,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0},"SpaceAgeSpaceHub":{"happiness":41630,"medals_24h":6280,"supplies_24h":60250,"strategy_points_24h":42.0,"all_goods_of_age_24h":30.0}} },
+    "W_MultiAge_FELL24A2": { prod: {"BronzeAge":{"happiness":2010,"medals_24h":100,"supplies_24h":1210,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"IronAge":{"happiness":3460,"medals_24h":130,"supplies_24h":2890,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"EarlyMiddleAge":{"happiness":3830,"medals_24h":150,"supplies_24h":4820,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"HighMiddleAge":{"happiness":4270,"medals_24h":180,"supplies_24h":6750,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"LateMiddleAge":{"happiness":4760,"medals_24h":210,"supplies_24h":8920,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"ColonialAge":{"happiness":5600,"medals_24h":250,"supplies_24h":11330,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"IndustrialAge":{"happiness":6310,"medals_24h":350,"supplies_24h":13740,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"ProgressiveEra":{"happiness":6930,"medals_24h":490,"supplies_24h":16150,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"ModernEra":{"happiness":7420,"medals_24h":700,"supplies_24h":18810,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"PostModernEra":{"happiness":7730,"medals_24h":980,"supplies_24h":21460,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"ContemporaryEra":{"happiness":8980,"medals_24h":1400,"supplies_24h":24110,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"TomorrowEra":{"happiness":10900,"medals_24h":1890,"supplies_24h":27000,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"FutureEra":{"happiness":13060,"medals_24h":2310,"supplies_24h":29660,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"ArcticFuture":{"happiness":15210,"medals_24h":2800,"supplies_24h":32550,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"OceanicFuture":{"happiness":17550,"medals_24h":3220,"supplies_24h":35680,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"VirtualFuture":{"happiness":20960,"medals_24h":3920,"supplies_24h":38580,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"SpaceAgeMars":{"happiness":33550,"medals_24h":4760,"supplies_24h":62440,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"SpaceAgeAsteroidBelt":{"happiness":36450,"medals_24h":5600,"supplies_24h":67030,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"SpaceAgeVenus":{"happiness":39380,"medals_24h":6440,"supplies_24h":71850,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"SpaceAgeJupiterMoon":{"happiness":42430,"medals_24h":7280,"supplies_24h":76430,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"SpaceAgeTitan":{"happiness":45500,"medals_24h":8130,"supplies_24h":81250,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0},"SpaceAgeSpaceHub":{"happiness":48570,"medals_24h":8970,"supplies_24h":86070,"strategy_points_24h":45.0,"all_goods_of_age_24h":45.0}} },
+    "W_MultiAge_FELL24A3": { prod: {"BronzeAge":{"happiness":2290,"medals_24h":130,"supplies_24h":1570,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"IronAge":{"happiness":3950,"medals_24h":160,"supplies_24h":3760,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"EarlyMiddleAge":{"happiness":4370,"medals_24h":200,"supplies_24h":6270,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"HighMiddleAge":{"happiness":4880,"medals_24h":240,"supplies_24h":8780,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"LateMiddleAge":{"happiness":5440,"medals_24h":270,"supplies_24h":11600,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"ColonialAge":{"happiness":6400,"medals_24h":330,"supplies_24h":14730,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"IndustrialAge":{"happiness":7210,"medals_24h":460,"supplies_24h":17870,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"ProgressiveEra":{"happiness":7920,"medals_24h":640,"supplies_24h":21000,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"ModernEra":{"happiness":8480,"medals_24h":910,"supplies_24h":24450,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"PostModernEra":{"happiness":8830,"medals_24h":1270,"supplies_24h":27900,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"ContemporaryEra":{"happiness":10260,"medals_24h":1820,"supplies_24h":31340,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"TomorrowEra":{"happiness":12460,"medals_24h":2460,"supplies_24h":35100,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"FutureEra":{"happiness":14920,"medals_24h":3000,"supplies_24h":38550,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"ArcticFuture":{"happiness":17380,"medals_24h":3640,"supplies_24h":42310,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"OceanicFuture":{"happiness":20060,"medals_24h":4190,"supplies_24h":46390,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"VirtualFuture":{"happiness":23960,"medals_24h":5100,"supplies_24h":50150,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"SpaceAgeMars":{"happiness":38340,"medals_24h":6190,"supplies_24h":81180,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"SpaceAgeAsteroidBelt":{"happiness":41660,"medals_24h":7280,"supplies_24h":87130,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"SpaceAgeVenus":{"happiness":45010,"medals_24h":8380,"supplies_24h":93400,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"SpaceAgeJupiterMoon":{"happiness":48490,"medals_24h":9470,"supplies_24h":99360,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"SpaceAgeTitan":{"happiness":52000,"medals_24h":10560,"supplies_24h":105630,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0},"SpaceAgeSpaceHub":{"happiness":55510,"medals_24h":11650,"supplies_24h":111890,"strategy_points_24h":48.0,"all_goods_of_age_24h":60.0}} },
+    "W_MultiAge_FELL24A4": { prod: {"BronzeAge":{"happiness":2580,"medals_24h":160,"supplies_24h":1930,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"IronAge":{"happiness":4450,"medals_24h":200,"supplies_24h":4630,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"EarlyMiddleAge":{"happiness":4920,"medals_24h":250,"supplies_24h":7720,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"HighMiddleAge":{"happiness":5490,"medals_24h":290,"supplies_24h":10800,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"LateMiddleAge":{"happiness":6120,"medals_24h":340,"supplies_24h":14270,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"ColonialAge":{"happiness":7200,"medals_24h":400,"supplies_24h":18130,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"IndustrialAge":{"happiness":8120,"medals_24h":560,"supplies_24h":21990,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"ProgressiveEra":{"happiness":8910,"medals_24h":780,"supplies_24h":25850,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"ModernEra":{"happiness":9540,"medals_24h":1120,"supplies_24h":30090,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"PostModernEra":{"happiness":9940,"medals_24h":1570,"supplies_24h":34330,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"ContemporaryEra":{"happiness":11550,"medals_24h":2240,"supplies_24h":38580,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"TomorrowEra":{"happiness":14010,"medals_24h":3030,"supplies_24h":43200,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"FutureEra":{"happiness":16790,"medals_24h":3700,"supplies_24h":47450,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"ArcticFuture":{"happiness":19550,"medals_24h":4480,"supplies_24h":52080,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"OceanicFuture":{"happiness":22560,"medals_24h":5160,"supplies_24h":57090,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"VirtualFuture":{"happiness":26950,"medals_24h":6280,"supplies_24h":61720,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"SpaceAgeMars":{"happiness":43130,"medals_24h":7620,"supplies_24h":99910,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"SpaceAgeAsteroidBelt":{"happiness":46870,"medals_24h":8970,"supplies_24h":107240,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"SpaceAgeVenus":{"happiness":50640,"medals_24h":10310,"supplies_24h":114960,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"SpaceAgeJupiterMoon":{"happiness":54550,"medals_24h":11660,"supplies_24h":122280,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"SpaceAgeTitan":{"happiness":58500,"medals_24h":13000,"supplies_24h":130000,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0},"SpaceAgeSpaceHub":{"happiness":62450,"medals_24h":14340,"supplies_24h":137720,"strategy_points_24h":51.0,"all_goods_of_age_24h":75.0}}, boosts: [{"type":"def_boost_attacker","value":2,"feature":"all"},{"type":"att_def_boost_attacker","value":3,"feature":"battleground"}] },
+    "W_MultiAge_FELL24A5": { prod: {"BronzeAge":{"happiness":2870,"medals_24h":190,"supplies_24h":2290,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"IronAge":{"happiness":4940,"medals_24h":240,"supplies_24h":5500,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"EarlyMiddleAge":{"happiness":5470,"medals_24h":290,"supplies_24h":9160,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"HighMiddleAge":{"happiness":6100,"medals_24h":350,"supplies_24h":12830,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"LateMiddleAge":{"happiness":6800,"medals_24h":400,"supplies_24h":16950,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"ColonialAge":{"happiness":8000,"medals_24h":480,"supplies_24h":21530,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"IndustrialAge":{"happiness":9020,"medals_24h":670,"supplies_24h":26110,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"ProgressiveEra":{"happiness":9900,"medals_24h":930,"supplies_24h":30690,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"ModernEra":{"happiness":10600,"medals_24h":1330,"supplies_24h":35730,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"PostModernEra":{"happiness":11040,"medals_24h":1860,"supplies_24h":40770,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"ContemporaryEra":{"happiness":12830,"medals_24h":2660,"supplies_24h":45810,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"TomorrowEra":{"happiness":15570,"medals_24h":3590,"supplies_24h":51310,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"FutureEra":{"happiness":18660,"medals_24h":4390,"supplies_24h":56340,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"ArcticFuture":{"happiness":21720,"medals_24h":5320,"supplies_24h":61840,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"OceanicFuture":{"happiness":25070,"medals_24h":6120,"supplies_24h":67800,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"VirtualFuture":{"happiness":29950,"medals_24h":7450,"supplies_24h":73290,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"SpaceAgeMars":{"happiness":47920,"medals_24h":9050,"supplies_24h":118640,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"SpaceAgeAsteroidBelt":{"happiness":52080,"medals_24h":10650,"supplies_24h":127350,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"SpaceAgeVenus":{"happiness":56260,"medals_24h":12240,"supplies_24h":136510,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"SpaceAgeJupiterMoon":{"happiness":60610,"medals_24h":13840,"supplies_24h":145210,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"SpaceAgeTitan":{"happiness":65000,"medals_24h":15440,"supplies_24h":154380,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0},"SpaceAgeSpaceHub":{"happiness":69390,"medals_24h":17030,"supplies_24h":163540,"strategy_points_24h":54.0,"all_goods_of_age_24h":90.0}}, boosts: [{"type":"def_boost_attacker","value":9,"feature":"all"},{"type":"att_def_boost_attacker","value":10,"feature":"battleground"}] },
+    "W_MultiAge_FELL24A6": { prod: {"BronzeAge":{"happiness":3160,"medals_24h":220,"supplies_24h":2650,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"IronAge":{"happiness":5440,"medals_24h":280,"supplies_24h":6360,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"EarlyMiddleAge":{"happiness":6010,"medals_24h":340,"supplies_24h":10610,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"HighMiddleAge":{"happiness":6710,"medals_24h":400,"supplies_24h":14850,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"LateMiddleAge":{"happiness":7480,"medals_24h":460,"supplies_24h":19630,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"ColonialAge":{"happiness":8800,"medals_24h":550,"supplies_24h":24930,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"IndustrialAge":{"happiness":9920,"medals_24h":770,"supplies_24h":30230,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"ProgressiveEra":{"happiness":10890,"medals_24h":1080,"supplies_24h":35540,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"ModernEra":{"happiness":11650,"medals_24h":1540,"supplies_24h":41370,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"PostModernEra":{"happiness":12140,"medals_24h":2160,"supplies_24h":47210,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"ContemporaryEra":{"happiness":14110,"medals_24h":3080,"supplies_24h":53040,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"TomorrowEra":{"happiness":17130,"medals_24h":4160,"supplies_24h":59410,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"FutureEra":{"happiness":20520,"medals_24h":5090,"supplies_24h":65240,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"ArcticFuture":{"happiness":23900,"medals_24h":6160,"supplies_24h":71610,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"OceanicFuture":{"happiness":27580,"medals_24h":7090,"supplies_24h":78500,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"VirtualFuture":{"happiness":32940,"medals_24h":8630,"supplies_24h":84870,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"SpaceAgeMars":{"happiness":52710,"medals_24h":10480,"supplies_24h":137380,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"SpaceAgeAsteroidBelt":{"happiness":57290,"medals_24h":12330,"supplies_24h":147460,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"SpaceAgeVenus":{"happiness":61890,"medals_24h":14180,"supplies_24h":158060,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"SpaceAgeJupiterMoon":{"happiness":66670,"medals_24h":16030,"supplies_24h":168140,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"SpaceAgeTitan":{"happiness":71500,"medals_24h":17880,"supplies_24h":178750,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0},"SpaceAgeSpaceHub":{"happiness":76330,"medals_24h":19720,"supplies_24h":189360,"strategy_points_24h":57.0,"all_goods_of_age_24h":105.0}}, boosts: [{"type":"def_boost_attacker","value":15,"feature":"all"},{"type":"att_def_boost_attacker","value":17,"feature":"battleground"}] },
+    "W_MultiAge_FELL24A7": { prod: {"BronzeAge":{"happiness":3440,"medals_24h":250,"supplies_24h":3010,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"IronAge":{"happiness":5930,"medals_24h":320,"supplies_24h":7230,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"EarlyMiddleAge":{"happiness":6560,"medals_24h":390,"supplies_24h":12050,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"HighMiddleAge":{"happiness":7320,"medals_24h":460,"supplies_24h":16880,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"LateMiddleAge":{"happiness":8160,"medals_24h":530,"supplies_24h":22300,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"ColonialAge":{"happiness":9600,"medals_24h":630,"supplies_24h":28330,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"IndustrialAge":{"happiness":10820,"medals_24h":880,"supplies_24h":34360,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"ProgressiveEra":{"happiness":11880,"medals_24h":1230,"supplies_24h":40380,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"ModernEra":{"happiness":12710,"medals_24h":1750,"supplies_24h":47010,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"PostModernEra":{"happiness":13250,"medals_24h":2450,"supplies_24h":53640,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"ContemporaryEra":{"happiness":15390,"medals_24h":3500,"supplies_24h":60270,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"TomorrowEra":{"happiness":18690,"medals_24h":4730,"supplies_24h":67510,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"FutureEra":{"happiness":22390,"medals_24h":5780,"supplies_24h":74140,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"ArcticFuture":{"happiness":26070,"medals_24h":7000,"supplies_24h":81370,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"OceanicFuture":{"happiness":30080,"medals_24h":8050,"supplies_24h":89210,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"VirtualFuture":{"happiness":35940,"medals_24h":9810,"supplies_24h":96440,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"SpaceAgeMars":{"happiness":57510,"medals_24h":11910,"supplies_24h":156110,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"SpaceAgeAsteroidBelt":{"happiness":62490,"medals_24h":14010,"supplies_24h":167560,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"SpaceAgeVenus":{"happiness":67520,"medals_24h":16110,"supplies_24h":179620,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"SpaceAgeJupiterMoon":{"happiness":72730,"medals_24h":18210,"supplies_24h":191070,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"SpaceAgeTitan":{"happiness":78000,"medals_24h":20310,"supplies_24h":203130,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0},"SpaceAgeSpaceHub":{"happiness":83270,"medals_24h":22410,"supplies_24h":215180,"strategy_points_24h":60.0,"all_goods_of_age_24h":120.0}}, boosts: [{"type":"def_boost_attacker","value":25,"feature":"all"},{"type":"att_def_boost_attacker","value":32,"feature":"battleground"}] },
+    "W_MultiAge_FELL24A8": { prod: {"BronzeAge":{"happiness":3730,"medals_24h":270,"supplies_24h":3380,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"IronAge":{"happiness":6430,"medals_24h":350,"supplies_24h":8100,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"EarlyMiddleAge":{"happiness":7110,"medals_24h":430,"supplies_24h":13500,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"HighMiddleAge":{"happiness":7930,"medals_24h":510,"supplies_24h":18900,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"LateMiddleAge":{"happiness":8840,"medals_24h":590,"supplies_24h":24980,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"ColonialAge":{"happiness":10400,"medals_24h":710,"supplies_24h":31730,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"IndustrialAge":{"happiness":11720,"medals_24h":980,"supplies_24h":38480,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"ProgressiveEra":{"happiness":12870,"medals_24h":1370,"supplies_24h":45230,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"ModernEra":{"happiness":13770,"medals_24h":1960,"supplies_24h":52660,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"PostModernEra":{"happiness":14350,"medals_24h":2750,"supplies_24h":60080,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"ContemporaryEra":{"happiness":16680,"medals_24h":3920,"supplies_24h":67510,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"TomorrowEra":{"happiness":20240,"medals_24h":5300,"supplies_24h":75610,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"FutureEra":{"happiness":24250,"medals_24h":6470,"supplies_24h":83030,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"ArcticFuture":{"happiness":28240,"medals_24h":7840,"supplies_24h":91140,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"OceanicFuture":{"happiness":32590,"medals_24h":9020,"supplies_24h":99910,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"VirtualFuture":{"happiness":38930,"medals_24h":10980,"supplies_24h":108010,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"SpaceAgeMars":{"happiness":62300,"medals_24h":13340,"supplies_24h":174840,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"SpaceAgeAsteroidBelt":{"happiness":67700,"medals_24h":15690,"supplies_24h":187670,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"SpaceAgeVenus":{"happiness":73140,"medals_24h":18040,"supplies_24h":201170,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"SpaceAgeJupiterMoon":{"happiness":78790,"medals_24h":20400,"supplies_24h":214000,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"SpaceAgeTitan":{"happiness":84500,"medals_24h":22750,"supplies_24h":227500,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0},"SpaceAgeSpaceHub":{"happiness":90210,"medals_24h":25100,"supplies_24h":241000,"strategy_points_24h":63.0,"all_goods_of_age_24h":135.0}}, boosts: [{"type":"def_boost_attacker","value":35,"feature":"all"},{"type":"att_def_boost_attacker","value":47,"feature":"battleground"}] },
+    "W_MultiAge_FELL23B1": { prod: {"BronzeAge":{"happiness":520,"all_goods_of_age_24h":10},"IronAge":{"happiness":900,"all_goods_of_age_24h":10},"EarlyMiddleAge":{"happiness":1000,"all_goods_of_age_24h":10},"HighMiddleAge":{"happiness":1110,"all_goods_of_age_24h":10},"LateMiddleAge":{"happiness":1240,"all_goods_of_age_24h":15},"ColonialAge":{"happiness":1460,"all_goods_of_age_24h":15},"IndustrialAge":{"happiness":1640,"all_goods_of_age_24h":15},"ProgressiveEra":{"happiness":1800,"all_goods_of_age_24h":15},"ModernEra":{"happiness":1930,"all_goods_of_age_24h":20},"PostModernEra":{"happiness":2010,"all_goods_of_age_24h":20},"ContemporaryEra":{"happiness":2340,"all_goods_of_age_24h":20},"TomorrowEra":{"happiness":2840,"all_goods_of_age_24h":20},"FutureEra":{"happiness":3400,"all_goods_of_age_24h":25},"ArcticFuture":{"happiness":3960,"all_goods_of_age_24h":25},"OceanicFuture":{"happiness":4570,"all_goods_of_age_24h":25},"VirtualFuture":{"happiness":5460,"all_goods_of_age_24h":25},"SpaceAgeMars":{"happiness":8730,"all_goods_of_age_24h":30},"SpaceAgeAsteroidBelt":{"happiness":9490,"all_goods_of_age_24h":30},"SpaceAgeVenus":{"happiness":10250,"all_goods_of_age_24h":30},"SpaceAgeJupiterMoon":{"happiness":11040,"all_goods_of_age_24h":30},"SpaceAgeTitan":{"happiness":11891,"all_goods_of_age_24h":35},"SpaceAgeSpaceHub":{"happiness":12742,"all_goods_of_age_24h":35}}, boosts: [{"type":"att_boost_defender","value":10,"feature":"all"},{"type":"def_boost_defender","value":17,"feature":"all"}] },
+    "W_MultiAge_FELL24B1": { prod: {"BronzeAge":{"population":-190,"supplies_24h":1780,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"IronAge":{"population":-410,"supplies_24h":4270,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"EarlyMiddleAge":{"population":-630,"supplies_24h":7120,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"HighMiddleAge":{"population":-890,"supplies_24h":9970,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"LateMiddleAge":{"population":-1170,"supplies_24h":13180,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"ColonialAge":{"population":-1480,"supplies_24h":16740,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"IndustrialAge":{"population":-1800,"supplies_24h":20300,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"ProgressiveEra":{"population":-2150,"supplies_24h":23860,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"ModernEra":{"population":-2520,"supplies_24h":27770,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"PostModernEra":{"population":-2910,"supplies_24h":31690,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"ContemporaryEra":{"population":-3320,"supplies_24h":35610,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"TomorrowEra":{"population":-3740,"supplies_24h":39880,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"FutureEra":{"population":-4180,"supplies_24h":43800,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"ArcticFuture":{"population":-4630,"supplies_24h":48070,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"OceanicFuture":{"population":-5110,"supplies_24h":52700,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"VirtualFuture":{"population":-5590,"supplies_24h":56970,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"SpaceAgeMars":{"population":-8850,"supplies_24h":92230,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"SpaceAgeAsteroidBelt":{"population":-9610,"supplies_24h":98990,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"SpaceAgeVenus":{"population":-10390,"supplies_24h":106110,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"SpaceAgeJupiterMoon":{"population":-11190,"supplies_24h":112880,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"SpaceAgeTitan":{"population":-12000,"supplies_24h":120000,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75},"SpaceAgeSpaceHub":{"population":-12810,"supplies_24h":127120,"strategy_points_24h":25,"all_goods_of_age_24h":60,"all_goods_of_previous_age_24h":75}}, boosts: [{"type":"att_boost_attacker","value":15,"feature":"all"},{"type":"att_boost_attacker","value":20,"feature":"battleground"},{"type":"att_boost_defender","value":30,"feature":"battleground"},{"type":"supply_production","value":18,"feature":"all"}] },
+    "W_MultiAge_FELL24A10": { prod: {"BronzeAge":{"happiness":4300,"medals_24h":330,"supplies_24h":4100,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"IronAge":{"happiness":7410,"medals_24h":430,"supplies_24h":9840,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"EarlyMiddleAge":{"happiness":8200,"medals_24h":520,"supplies_24h":16390,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"HighMiddleAge":{"happiness":9150,"medals_24h":620,"supplies_24h":22950,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"LateMiddleAge":{"happiness":10200,"medals_24h":710,"supplies_24h":30330,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"ColonialAge":{"happiness":11990,"medals_24h":860,"supplies_24h":38530,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"IndustrialAge":{"happiness":13530,"medals_24h":1190,"supplies_24h":46720,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"ProgressiveEra":{"happiness":14850,"medals_24h":1670,"supplies_24h":54920,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"ModernEra":{"happiness":15890,"medals_24h":2380,"supplies_24h":63940,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"PostModernEra":{"happiness":16560,"medals_24h":3330,"supplies_24h":72960,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"ContemporaryEra":{"happiness":19240,"medals_24h":4760,"supplies_24h":81970,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"TomorrowEra":{"happiness":23360,"medals_24h":6430,"supplies_24h":91810,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"FutureEra":{"happiness":27980,"medals_24h":7860,"supplies_24h":100830,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"ArcticFuture":{"happiness":32590,"medals_24h":9530,"supplies_24h":110660,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"OceanicFuture":{"happiness":37600,"medals_24h":10950,"supplies_24h":121320,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"VirtualFuture":{"happiness":44920,"medals_24h":13340,"supplies_24h":131160,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"SpaceAgeMars":{"happiness":71880,"medals_24h":16190,"supplies_24h":212310,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"SpaceAgeAsteroidBelt":{"happiness":78120,"medals_24h":19050,"supplies_24h":227890,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"SpaceAgeVenus":{"happiness":84400,"medals_24h":21910,"supplies_24h":244280,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"SpaceAgeJupiterMoon":{"happiness":90910,"medals_24h":24770,"supplies_24h":259860,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"SpaceAgeTitan":{"happiness":97500,"medals_24h":27630,"supplies_24h":276250,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0},"SpaceAgeSpaceHub":{"happiness":104090,"medals_24h":30480,"supplies_24h":292640,"strategy_points_24h":69.0,"all_goods_of_age_24h":165.0}}, boosts: [{"type":"def_boost_attacker","value":55,"feature":"all"},{"type":"att_def_boost_attacker","value":77,"feature":"battleground"}] },
+    "W_MultiAge_FELL23D1": { prod: {"BronzeAge":{"happiness":520,"strategy_points_24h":4,"random_good_of_age_24h":5},"IronAge":{"happiness":900,"strategy_points_24h":4,"random_good_of_age_24h":5},"EarlyMiddleAge":{"happiness":1000,"strategy_points_24h":4,"random_good_of_age_24h":5},"HighMiddleAge":{"happiness":1110,"strategy_points_24h":4,"random_good_of_age_24h":5},"LateMiddleAge":{"happiness":1240,"strategy_points_24h":4,"random_good_of_age_24h":5},"ColonialAge":{"happiness":1460,"strategy_points_24h":4,"random_good_of_age_24h":5},"IndustrialAge":{"happiness":1640,"strategy_points_24h":4,"random_good_of_age_24h":5},"ProgressiveEra":{"happiness":1800,"strategy_points_24h":4,"random_good_of_age_24h":5},"ModernEra":{"happiness":1930,"strategy_points_24h":4,"random_good_of_age_24h":5},"PostModernEra":{"happiness":2010,"strategy_points_24h":4,"random_good_of_age_24h":5},"ContemporaryEra":{"happiness":2340,"strategy_points_24h":4,"random_good_of_age_24h":5},"TomorrowEra":{"happiness":2840,"strategy_points_24h":4,"random_good_of_age_24h":5},"FutureEra":{"happiness":3400,"strategy_points_24h":4,"random_good_of_age_24h":5},"ArcticFuture":{"happiness":3960,"strategy_points_24h":4,"random_good_of_age_24h":5},"OceanicFuture":{"happiness":4570,"strategy_points_24h":4,"random_good_of_age_24h":5},"VirtualFuture":{"happiness":5460,"strategy_points_24h":4,"random_good_of_age_24h":5},"SpaceAgeMars":{"happiness":8730,"strategy_points_24h":4,"random_good_of_age_24h":5},"SpaceAgeAsteroidBelt":{"happiness":9490,"strategy_points_24h":4,"random_good_of_age_24h":5},"SpaceAgeVenus":{"happiness":10250,"strategy_points_24h":4,"random_good_of_age_24h":5},"SpaceAgeJupiterMoon":{"happiness":11040,"strategy_points_24h":4,"random_good_of_age_24h":5},"SpaceAgeTitan":{"happiness":11891,"strategy_points_24h":4,"random_good_of_age_24h":5},"SpaceAgeSpaceHub":{"happiness":12742,"strategy_points_24h":4,"random_good_of_age_24h":5}}, boosts: [{"type":"att_boost_attacker","value":3,"feature":"all"},{"type":"def_boost_attacker","value":3,"feature":"all"}] },
+};
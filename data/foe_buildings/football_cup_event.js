@@ -0,0 +1,47 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 43 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_CUP23C1": { prod: {"BronzeAge":{"strategy_points_24h":5,"random_good_of_previous_age_24h":10},"IronAge":{"strategy_points_24h":5,"random_good_of_previous_age_24h":10},"EarlyMiddleAge":{"strategy_points_24h":5,"random_good_of_previous_age_24h":11},"HighMiddleAge":{"strategy_points_24h":5,"random_good_of_previous_age_24h":11},"LateMiddleAge":{"strategy_points_24h":5,"random_good_of_previous_age_24h":12},"ColonialAge":{"strategy_points_24h":5,"random_good_of_previous_age_24h":12},"IndustrialAge":{"strategy_points_24h":5,"random_good_of_previous_age_24h":13},"ProgressiveEra":{"strategy_points_24h":5,"random_good_of_previous_age_24h":13},"ModernEra":{"strategy_points_24h":5,"random_good_of_previous_age_24h":14},"PostModernEra":{"strategy_points_24h":5,"random_good_of_previous_age_24h":14},"ContemporaryEra":{"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"TomorrowEra":{"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"FutureEra":{"strategy_points_24h":6,"random_good_of_previous_age_24h":16},"ArcticFuture":{"strategy_points_24h":6,"random_good_of_previous_age_24h":16},"OceanicFuture":{"strategy_points_24h":6,"random_good_of_previous_age_24h":17},"VirtualFuture":{"strategy_points_24h":6,"random_good_of_previous_age_24h":17},"SpaceAgeMars":{"strategy_points_24h":6,"random_good_of_previous_age_24h":18},"SpaceAgeAsteroidBelt":{"strategy_points_24h":6,"random_good_of_previous_age_24h":18},"SpaceAgeVenus":{"strategy_points_24h":6,"random_good_of_previous_age_24h":19},"SpaceAgeJupiterMoon":{"strategy_points_24h":7,"random_good_of_previous_age_24h":19},"SpaceAgeTitan":{"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"SpaceAgeSpaceHub":{"strategy_points_24h":7,"random_good_of_previous_age_24h":20}}, boosts: [{"type":"def_boost_attacker","value":4,"feature":"all"},{"type":"att_boost_defender","value":5,"feature":"all"},{"type":"coin_production","value":5,"feature":"all"}] },
+    "W_MultiAge_CUP22C1": { prod: {"BronzeAge":{"happiness":130},"IronAge":{"happiness":190},"EarlyMiddleAge":{"happiness":220},"HighMiddleAge":{"happiness":280},"LateMiddleAge":{"happiness":320},"ColonialAge":{"happiness":380},"IndustrialAge":{"happiness":420},"ProgressiveEra":{"happiness":470},"ModernEra":{"happiness":530},"PostModernEra":{"happiness":610},"ContemporaryEra":{"happiness":710},"TomorrowEra":{"happiness":880},"FutureEra":{"happiness":1050},"ArcticFuture":{"happiness":1190},"OceanicFuture":{"happiness":1340},"VirtualFuture":{"happiness":1690},"SpaceAgeMars":{"happiness":2630},"SpaceAgeAsteroidBelt":{"happiness":2860},"SpaceAgeVenus":{"happiness":3090},"SpaceAgeJupiterMoon":{"happiness":3330},"SpaceAgeTitan":{"happiness":3570},"SpaceAgeSpaceHub":{"happiness":3820}} },
+    "W_MultiAge_CUP23B1": { prod: {"BronzeAge":{"strategy_points_24h":6,"random_good_of_age_24h":20},"IronAge":{"strategy_points_24h":6,"random_good_of_age_24h":20},"EarlyMiddleAge":{"strategy_points_24h":6,"random_good_of_age_24h":21},"HighMiddleAge":{"strategy_points_24h":6,"random_good_of_age_24h":21},"LateMiddleAge":{"strategy_points_24h":6,"random_good_of_age_24h":22},"ColonialAge":{"strategy_points_24h":6,"random_good_of_age_24h":22},"IndustrialAge":{"strategy_points_24h":6,"random_good_of_age_24h":23},"ProgressiveEra":{"strategy_points_24h":6,"random_good_of_age_24h":23},"ModernEra":{"strategy_points_24h":6,"random_good_of_age_24h":24},"PostModernEra":{"strategy_points_24h":6,"random_good_of_age_24h":24},"ContemporaryEra":{"strategy_points_24h":6,"random_good_of_age_24h":25},"TomorrowEra":{"strategy_points_24h":6,"random_good_of_age_24h":25},"FutureEra":{"strategy_points_24h":6,"random_good_of_age_24h":26},"ArcticFuture":{"strategy_points_24h":7,"random_good_of_age_24h":26},"OceanicFuture":{"strategy_points_24h":7,"random_good_of_age_24h":27},"VirtualFuture":{"strategy_points_24h":7,"random_good_of_age_24h":27},"SpaceAgeMars":{"strategy_points_24h":7,"random_good_of_age_24h":28},"SpaceAgeAsteroidBelt":{"strategy_points_24h":7,"random_good_of_age_24h":28},"SpaceAgeVenus":{"strategy_points_24h":7,"random_good_of_age_24h":29},"SpaceAgeJupiterMoon":{"strategy_points_24h":8,"random_good_of_age_24h":29},"SpaceAgeTitan":{"strategy_points_24h":8,"random_good_of_age_24h":30},"SpaceAgeSpaceHub":{"strategy_points_24h":8,"random_good_of_age_24h":30}}, boosts: [{"type":"att_boost_attacker","value":7,"feature":"all"},{"type":"def_boost_defender","value":12,"feature":"all"}] },
+    "W_MultiAge_CUP20A1": { prod: {"BronzeAge":{"population":92,"happiness":220,"demandHappiness":92,"money_24h":500},"IronAge":{"population":197,"happiness":370,"demandHappiness":197,"money_24h":1200},"EarlyMiddleAge":{"population":302,"happiness":410,"demandHappiness":302,"money_24h":2050},"HighMiddleAge":{"population":424,"happiness":460,"demandHappiness":424,"money_24h":2850},"LateMiddleAge":{"population":556,"happiness":510,"demandHappiness":556,"money_24h":3800},"ColonialAge":{"population":702,"happiness":600,"demandHappiness":702,"money_24h":5800},"IndustrialAge":{"population":858,"happiness":680,"demandHappiness":858,"money_24h":7200},"ProgressiveEra":{"population":1024,"happiness":750,"demandHappiness":1024,"money_24h":8700},"ModernEra":{"population":1200,"happiness":800,"demandHappiness":1200,"money_24h":10800},"PostModernEra":{"population":1383,"happiness":830,"demandHappiness":1383,"money_24h":13600},"ContemporaryEra":{"population":1576,"happiness":970,"demandHappiness":1576,"money_24h":17700},"TomorrowEra":{"population":1776,"happiness":1170,"demandHappiness":1776,"money_24h":20500},"FutureEra":{"population":1987,"happiness":1410,"demandHappiness":1987,"money_24h":23500},"ArcticFuture":{"population":2204,"happiness":1640,"demandHappiness":2204,"money_24h":26700},"OceanicFuture":{"population":2427,"happiness":1890,"demandHappiness":2427,"money_24h":30100},"VirtualFuture":{"population":2658,"happiness":2260,"demandHappiness":2658,"money_24h":33700},"SpaceAgeMars":{"population":4207,"happiness":3610,"demandHappiness":4207,"money_24h":56300},"SpaceAgeAsteroidBelt":{"population":4570,"happiness":3930,"demandHappiness":4570,"money_24h":62400},"SpaceAgeVenus":{"population":4939,"happiness":4240,"demandHappiness":4939,"money_24h":68800},"SpaceAgeJupiterMoon":{"population":5319,"happiness":4570,"demandHappiness":5319,"money_24h":75500},"SpaceAgeTitan":{"population":5705,"happiness":4900,"demandHappiness":5705,"money_24h":82500},"SpaceAgeSpaceHub":{"population":6102,"happiness":5240,"demandHappiness":6102,"money_24h":89900}} },
+    "W_MultiAge_CUP20A2": { prod: {"BronzeAge":{"population":98,"happiness":250,"demandHappiness":98,"money_24h":600,"medals_24h":4,"strategy_points_24h":1},"IronAge":{"population":211,"happiness":430,"demandHappiness":211,"money_24h":1450,"medals_24h":5,"strategy_points_24h":1},"EarlyMiddleAge":{"population":323,"happiness":480,"demandHappiness":323,"money_24h":2400,"medals_24h":6,"strategy_points_24h":1},"HighMiddleAge":{"population":454,"happiness":540,"demandHappiness":454,"money_24h":3350,"medals_24h":7,"strategy_points_24h":1},"LateMiddleAge":{"population":595,"happiness":600,"demandHappiness":595,"money_24h":4400,"medals_24h":8,"strategy_points_24h":1},"ColonialAge":{"population":751,"happiness":700,"demandHappiness":751,"money_24h":6800,"medals_24h":10,"strategy_points_24h":1},"IndustrialAge":{"population":918,"happiness":790,"demandHappiness":918,"money_24h":8400,"medals_24h":13,"strategy_points_24h":1},"ProgressiveEra":{"population":1096,"happiness":870,"demandHappiness":1096,"money_24h":10200,"medals_24h":18,"strategy_points_24h":1},"ModernEra":{"population":1285,"happiness":930,"demandHappiness":1285,"money_24h":12700,"medals_24h":26,"strategy_points_24h":1},"PostModernEra":{"population":1481,"happiness":970,"demandHappiness":1481,"money_24h":16000,"medals_24h":36,"strategy_points_24h":1},"ContemporaryEra":{"population":1688,"happiness":1130,"demandHappiness":1688,"money_24h":20800,"medals_24h":52,"strategy_points_24h":1},"TomorrowEra":{"population":1902,"happiness":1370,"demandHappiness":1902,"money_24h":24100,"medals_24h":70,"strategy_points_24h":1},"FutureEra":{"population":2127,"happiness":1640,"demandHappiness":2127,"money_24h":27700,"medals_24h":85,"strategy_points_24h":1},"ArcticFuture":{"population":2360,"happiness":1910,"demandHappiness":2360,"money_24h":31400,"medals_24h":103,"strategy_points_24h":1},"OceanicFuture":{"population":2599,"happiness":2210,"demandHappiness":2599,"money_24h":35400,"medals_24h":119,"strategy_points_24h":1},"VirtualFuture":{"population":2846,"happiness":2630,"demandHappiness":2846,"money_24h":39700,"medals_24h":144,"strategy_points_24h":1},"SpaceAgeMars":{"population":4505,"happiness":4220,"demandHappiness":4505,"money_24h":66300,"medals_24h":175,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"population":4893,"happiness":4580,"demandHappiness":4893,"money_24h":73400,"medals_24h":206,"strategy_points_24h":1},"SpaceAgeVenus":{"population":5289,"happiness":4950,"demandHappiness":5289,"money_24h":80900,"medals_24h":237,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"population":5695,"happiness":5330,"demandHappiness":5695,"money_24h":88800,"medals_24h":268,"strategy_points_24h":1},"SpaceAgeTitan":{"population":6109,"happiness":5720,"demandHappiness":6109,"money_24h":97100,"medals_24h":299,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"population":6534,"happiness":6120,"demandHappiness":6534,"money_24h":105800,"medals_24h":330,"strategy_points_24h":1}} },
+    "W_MultiAge_CUP20A3": { prod: {"BronzeAge":{"population":109,"happiness":290,"demandHappiness":109,"money_24h":700,"medals_24h":6,"strategy_points_24h":2},"IronAge":{"population":235,"happiness":500,"demandHappiness":235,"money_24h":1650,"medals_24h":8,"strategy_points_24h":2},"EarlyMiddleAge":{"population":360,"happiness":550,"demandHappiness":360,"money_24h":2750,"medals_24h":10,"strategy_points_24h":2},"HighMiddleAge":{"population":506,"happiness":610,"demandHappiness":506,"money_24h":3850,"medals_24h":12,"strategy_points_24h":2},"LateMiddleAge":{"population":664,"happiness":680,"demandHappiness":664,"money_24h":5100,"medals_24h":13,"strategy_points_24h":2},"ColonialAge":{"population":838,"happiness":800,"demandHappiness":838,"money_24h":7800,"medals_24h":16,"strategy_points_24h":2},"IndustrialAge":{"population":1025,"happiness":910,"demandHappiness":1025,"money_24h":9700,"medals_24h":22,"strategy_points_24h":2},"ProgressiveEra":{"population":1223,"happiness":1000,"demandHappiness":1223,"money_24h":11800,"medals_24h":30,"strategy_points_24h":2},"ModernEra":{"population":1434,"happiness":1070,"demandHappiness":1434,"money_24h":14600,"medals_24h":43,"strategy_points_24h":2},"PostModernEra":{"population":1652,"happiness":1110,"demandHappiness":1652,"money_24h":18400,"medals_24h":60,"strategy_points_24h":2},"ContemporaryEra":{"population":1883,"happiness":1290,"demandHappiness":1883,"money_24h":24000,"medals_24h":86,"strategy_points_24h":2},"TomorrowEra":{"population":2122,"happiness":1570,"demandHappiness":2122,"money_24h":27700,"medals_24h":116,"strategy_points_24h":2},"FutureEra":{"population":2373,"happiness":1880,"demandHappiness":2373,"money_24h":31800,"medals_24h":142,"strategy_points_24h":2},"ArcticFuture":{"population":2633,"happiness":2180,"demandHappiness":2633,"money_24h":36100,"medals_24h":172,"strategy_points_24h":2},"OceanicFuture":{"population":2900,"happiness":2520,"demandHappiness":2900,"money_24h":40700,"medals_24h":198,"strategy_points_24h":2},"VirtualFuture":{"population":3175,"happiness":3010,"demandHappiness":3175,"money_24h":45600,"medals_24h":240,"strategy_points_24h":2},"SpaceAgeMars":{"population":5026,"happiness":4820,"demandHappiness":5026,"money_24h":76200,"medals_24h":292,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"population":5459,"happiness":5240,"demandHappiness":5459,"money_24h":84400,"medals_24h":343,"strategy_points_24h":2},"SpaceAgeVenus":{"population":5901,"happiness":5660,"demandHappiness":5901,"money_24h":93100,"medals_24h":395,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"population":6354,"happiness":6090,"demandHappiness":6354,"money_24h":102100,"medals_24h":446,"strategy_points_24h":2},"SpaceAgeTitan":{"population":6816,"happiness":6530,"demandHappiness":6816,"money_24h":111700,"medals_24h":498,"strategy_points_24h":2},"SpaceAgeSpaceHub":{"population":7290,"happiness":6990,"demandHappiness":7290,"money_24h":121600,"medals_24h":549,"strategy_points_24h":2}} },
+    "W_MultiAge_CUP20A4": { prod: {"BronzeAge":{"population":117,"happiness":320,"demandHappiness":117,"money_24h":800,"medals_24h":10,"strategy_points_24h":3,"all_goods_of_age_24h":5},"IronAge":{"population":251,"happiness":560,"demandHappiness":251,"money_24h":1850,"medals_24h":13,"strategy_points_24h":3,"all_goods_of_age_24h":5},"EarlyMiddleAge":{"population":384,"happiness":620,"demandHappiness":384,"money_24h":3100,"medals_24h":16,"strategy_points_24h":3,"all_goods_of_age_24h":5},"HighMiddleAge":{"population":540,"happiness":690,"demandHappiness":540,"money_24h":4350,"medals_24h":18,"strategy_points_24h":3,"all_goods_of_age_24h":5},"LateMiddleAge":{"population":708,"happiness":770,"demandHappiness":708,"money_24h":5800,"medals_24h":21,"strategy_points_24h":3,"all_goods_of_age_24h":5},"ColonialAge":{"population":894,"happiness":900,"demandHappiness":894,"money_24h":8800,"medals_24h":25,"strategy_points_24h":3,"all_goods_of_age_24h":5},"IndustrialAge":{"population":1093,"happiness":1020,"demandHappiness":1093,"money_24h":11000,"medals_24h":35,"strategy_points_24h":3,"all_goods_of_age_24h":5},"ProgressiveEra":{"population":1305,"happiness":1120,"demandHappiness":1305,"money_24h":13300,"medals_24h":48,"strategy_points_24h":3,"all_goods_of_age_24h":5},"ModernEra":{"population":1529,"happiness":1200,"demandHappiness":1529,"money_24h":16500,"medals_24h":69,"strategy_points_24h":3,"all_goods_of_age_24h":5},"PostModernEra":{"population":1763,"happiness":1250,"demandHappiness":1763,"money_24h":20800,"medals_24h":96,"strategy_points_24h":3,"all_goods_of_age_24h":5},"ContemporaryEra":{"population":2009,"happiness":1450,"demandHappiness":2009,"money_24h":27100,"medals_24h":138,"strategy_points_24h":3,"all_goods_of_age_24h":5},"TomorrowEra":{"population":2264,"happiness":1760,"demandHappiness":2264,"money_24h":31400,"medals_24h":186,"strategy_points_24h":3,"all_goods_of_age_24h":5},"FutureEra":{"population":2532,"happiness":2110,"demandHappiness":2532,"money_24h":35900,"medals_24h":227,"strategy_points_24h":3,"all_goods_of_age_24h":5},"ArcticFuture":{"population":2808,"happiness":2460,"demandHappiness":2808,"money_24h":40800,"medals_24h":275,"strategy_points_24h":3,"all_goods_of_age_24h":5},"OceanicFuture":{"population":3093,"happiness":2840,"demandHappiness":3093,"money_24h":46100,"medals_24h":316,"strategy_points_24h":3,"all_goods_of_age_24h":5},"VirtualFuture":{"population":3387,"happiness":3390,"demandHappiness":3387,"money_24h":51600,"medals_24h":384,"strategy_points_24h":3,"all_goods_of_age_24h":5},"SpaceAgeMars":{"population":5361,"happiness":5420,"demandHappiness":5361,"money_24h":86200,"medals_24h":467,"strategy_points_24h":3,"all_goods_of_age_24h":5},"SpaceAgeAsteroidBelt":{"population":5823,"happiness":5890,"demandHappiness":5823,"money_24h":95400,"medals_24h":549,"strategy_points_24h":3,"all_goods_of_age_24h":5},"SpaceAgeVenus":{"population":6294,"happiness":6360,"demandHappiness":6294,"money_24h":105200,"medals_24h":631,"strategy_points_24h":3,"all_goods_of_age_24h":5},"SpaceAgeJupiterMoon":{"population":6778,"happiness":6850,"demandHappiness":6778,"money_24h":115500,"medals_24h":714,"strategy_points_24h":3,"all_goods_of_age_24h":5},"SpaceAgeTitan":{"population":7271,"happiness":7350,"demandHappiness":7271,"money_24h":126200,"medals_24h":796,"strategy_points_24h":3,"all_goods_of_age_24h":5},"SpaceAgeSpaceHub":{"population":7776,"happiness":7860,"demandHappiness":7776,"money_24h":137500,"medals_24h":878,"strategy_points_24h":3,"all_goods_of_age_24h":5}} },
+    "W_MultiAge_CUP20A5": { prod: {"BronzeAge":{"population":126,"happiness":380,"demandHappiness":126,"money_24h":850,"medals_24h":14,"strategy_points_24h":4,"all_goods_of_age_24h":10},"IronAge":{"population":271,"happiness":650,"demandHappiness":271,"money_24h":2100,"medals_24h":17,"strategy_points_24h":4,"all_goods_of_age_24h":10},"EarlyMiddleAge":{"population":417,"happiness":720,"demandHappiness":417,"money_24h":3500,"medals_24h":21,"strategy_points_24h":4,"all_goods_of_age_24h":10},"HighMiddleAge":{"population":585,"happiness":800,"demandHappiness":585,"money_24h":4850,"medals_24h":25,"strategy_points_24h":4,"all_goods_of_age_24h":10},"LateMiddleAge":{"population":768,"happiness":900,"demandHappiness":768,"money_24h":6400,"medals_24h":29,"strategy_points_24h":4,"all_goods_of_age_24h":10},"ColonialAge":{"population":969,"happiness":1060,"demandHappiness":969,"money_24h":9800,"medals_24h":34,"strategy_points_24h":4,"all_goods_of_age_24h":10},"IndustrialAge":{"population":1184,"happiness":1190,"demandHappiness":1184,"money_24h":12200,"medals_24h":48,"strategy_points_24h":4,"all_goods_of_age_24h":10},"ProgressiveEra":{"population":1413,"happiness":1310,"demandHappiness":1413,"money_24h":14800,"medals_24h":66,"strategy_points_24h":4,"all_goods_of_age_24h":10},"ModernEra":{"population":1657,"happiness":1400,"demandHappiness":1657,"money_24h":18400,"medals_24h":95,"strategy_points_24h":4,"all_goods_of_age_24h":10},"PostModernEra":{"population":1909,"happiness":1460,"demandHappiness":1909,"money_24h":23200,"medals_24h":132,"strategy_points_24h":4,"all_goods_of_age_24h":10},"ContemporaryEra":{"population":2176,"happiness":1690,"demandHappiness":2176,"money_24h":30200,"medals_24h":189,"strategy_points_24h":4,"all_goods_of_age_24h":10},"TomorrowEra":{"population":2452,"happiness":2050,"demandHappiness":2452,"money_24h":35000,"medals_24h":255,"strategy_points_24h":4,"all_goods_of_age_24h":10},"FutureEra":{"population":2742,"happiness":2460,"demandHappiness":2742,"money_24h":40100,"medals_24h":312,"strategy_points_24h":4,"all_goods_of_age_24h":10},"ArcticFuture":{"population":3042,"happiness":2870,"demandHappiness":3042,"money_24h":45600,"medals_24h":378,"strategy_points_24h":4,"all_goods_of_age_24h":10},"OceanicFuture":{"population":3351,"happiness":3310,"demandHappiness":3351,"money_24h":51400,"medals_24h":434,"strategy_points_24h":4,"all_goods_of_age_24h":10},"VirtualFuture":{"population":3669,"happiness":3950,"demandHappiness":3669,"money_24h":57500,"medals_24h":528,"strategy_points_24h":4,"all_goods_of_age_24h":10},"SpaceAgeMars":{"population":5808,"happiness":6320,"demandHappiness":5808,"money_24h":96100,"medals_24h":642,"strategy_points_24h":4,"all_goods_of_age_24h":10},"SpaceAgeAsteroidBelt":{"population":6309,"happiness":6870,"demandHappiness":6309,"money_24h":106400,"medals_24h":755,"strategy_points_24h":4,"all_goods_of_age_24h":10},"SpaceAgeVenus":{"population":6819,"happiness":7420,"demandHappiness":6819,"money_24h":117300,"medals_24h":868,"strategy_points_24h":4,"all_goods_of_age_24h":10},"SpaceAgeJupiterMoon":{"population":7343,"happiness":8000,"demandHappiness":7343,"money_24h":128800,"medals_24h":981,"strategy_points_24h":4,"all_goods_of_age_24h":10},"SpaceAgeTitan":{"population":7876,"happiness":8580,"demandHappiness":7876,"money_24h":140800,"medals_24h":1094,"strategy_points_24h":4,"all_goods_of_age_24h":10},"SpaceAgeSpaceHub":{"population":8424,"happiness":9170,"demandHappiness":8424,"money_24h":153400,"medals_24h":1207,"strategy_points_24h":4,"all_goods_of_age_24h":10}} },
+    "W_MultiAge_CUP20A6": { prod: {"BronzeAge":{"population":133,"happiness":430,"demandHappiness":133,"money_24h":950,"medals_24h":17,"strategy_points_24h":6,"all_goods_of_age_24h":15},"IronAge":{"population":285,"happiness":750,"demandHappiness":285,"money_24h":2300,"medals_24h":22,"strategy_points_24h":6,"all_goods_of_age_24h":15},"EarlyMiddleAge":{"population":438,"happiness":820,"demandHappiness":438,"money_24h":3850,"medals_24h":27,"strategy_points_24h":6,"all_goods_of_age_24h":15},"HighMiddleAge":{"population":615,"happiness":920,"demandHappiness":615,"money_24h":5400,"medals_24h":32,"strategy_points_24h":6,"all_goods_of_age_24h":15},"LateMiddleAge":{"population":807,"happiness":1030,"demandHappiness":807,"money_24h":7100,"medals_24h":36,"strategy_points_24h":6,"all_goods_of_age_24h":15},"ColonialAge":{"population":1018,"happiness":1210,"demandHappiness":1018,"money_24h":10800,"medals_24h":44,"strategy_points_24h":6,"all_goods_of_age_24h":15},"IndustrialAge":{"population":1245,"happiness":1360,"demandHappiness":1245,"money_24h":13500,"medals_24h":60,"strategy_points_24h":6,"all_goods_of_age_24h":15},"ProgressiveEra":{"population":1486,"happiness":1490,"demandHappiness":1486,"money_24h":16400,"medals_24h":84,"strategy_points_24h":6,"all_goods_of_age_24h":15},"ModernEra":{"population":1742,"happiness":1600,"demandHappiness":1742,"money_24h":20400,"medals_24h":120,"strategy_points_24h":6,"all_goods_of_age_24h":15},"PostModernEra":{"population":2007,"happiness":1660,"demandHappiness":2007,"money_24h":25600,"medals_24h":168,"strategy_points_24h":6,"all_goods_of_age_24h":15},"ContemporaryEra":{"population":2288,"happiness":1930,"demandHappiness":2288,"money_24h":33300,"medals_24h":240,"strategy_points_24h":6,"all_goods_of_age_24h":15},"TomorrowEra":{"population":2578,"happiness":2350,"demandHappiness":2578,"money_24h":38600,"medals_24h":324,"strategy_points_24h":6,"all_goods_of_age_24h":15},"FutureEra":{"population":2883,"happiness":2810,"demandHappiness":2883,"money_24h":44200,"medals_24h":396,"strategy_points_24h":6,"all_goods_of_age_24h":15},"ArcticFuture":{"population":3198,"happiness":3280,"demandHappiness":3198,"money_24h":50300,"medals_24h":480,"strategy_points_24h":6,"all_goods_of_age_24h":15},"OceanicFuture":{"population":3523,"happiness":3780,"demandHappiness":3523,"money_24h":56700,"medals_24h":552,"strategy_points_24h":6,"all_goods_of_age_24h":15},"VirtualFuture":{"population":3857,"happiness":4520,"demandHappiness":3857,"money_24h":63500,"medals_24h":672,"strategy_points_24h":6,"all_goods_of_age_24h":15},"SpaceAgeMars":{"population":6106,"happiness":7230,"demandHappiness":6106,"money_24h":106000,"medals_24h":816,"strategy_points_24h":6,"all_goods_of_age_24h":15},"SpaceAgeAsteroidBelt":{"population":6632,"happiness":7850,"demandHappiness":6632,"money_24h":117500,"medals_24h":960,"strategy_points_24h":6,"all_goods_of_age_24h":15},"SpaceAgeVenus":{"population":7168,"happiness":8480,"demandHappiness":7168,"money_24h":129500,"medals_24h":1104,"strategy_points_24h":6,"all_goods_of_age_24h":15},"SpaceAgeJupiterMoon":{"population":7719,"happiness":9140,"demandHappiness":7719,"money_24h":142100,"medals_24h":1248,"strategy_points_24h":6,"all_goods_of_age_24h":15},"SpaceAgeTitan":{"population":8280,"happiness":9800,"demandHappiness":8280,"money_24h":155400,"medals_24h":1392,"strategy_points_24h":6,"all_goods_of_age_24h":15},"SpaceAgeSpaceHub":{"population":8856,"happiness":10480,"demandHappiness":8856,"money_24h":169200,"medals_24h":1536,"strategy_points_24h":6,"all_goods_of_age_24h":15}}, boosts: [{"type":"def_boost_attacker","value":8,"feature":"all"}] },
+    "W_MultiAge_CUP20B1": { prod: {"BronzeAge":{"population":120,"happiness":290,"demandHappiness":120,"money_24h":700},"IronAge":{"population":258,"happiness":500,"demandHappiness":258,"money_24h":1750},"EarlyMiddleAge":{"population":395,"happiness":550,"demandHappiness":395,"money_24h":2900},"HighMiddleAge":{"population":555,"happiness":610,"demandHappiness":555,"money_24h":4050},"LateMiddleAge":{"population":728,"happiness":680,"demandHappiness":728,"money_24h":5300},"ColonialAge":{"population":919,"happiness":800,"demandHappiness":919,"money_24h":8100},"IndustrialAge":{"population":1123,"happiness":910,"demandHappiness":1123,"money_24h":10100},"ProgressiveEra":{"population":1341,"happiness":1000,"demandHappiness":1341,"money_24h":12300},"ModernEra":{"population":1572,"happiness":1070,"demandHappiness":1572,"money_24h":15300},"PostModernEra":{"population":1812,"happiness":1110,"demandHappiness":1812,"money_24h":19200},"ContemporaryEra":{"population":2065,"happiness":1290,"demandHappiness":2065,"money_24h":25000},"TomorrowEra":{"population":2327,"happiness":1570,"demandHappiness":2327,"money_24h":28900},"FutureEra":{"population":2602,"happiness":1880,"demandHappiness":2602,"money_24h":33200},"ArcticFuture":{"population":2886,"happiness":2180,"demandHappiness":2886,"money_24h":37700},"OceanicFuture":{"population":3179,"happiness":2520,"demandHappiness":3179,"money_24h":42500},"VirtualFuture":{"population":3481,"happiness":3010,"demandHappiness":3481,"money_24h":47600},"SpaceAgeMars":{"population":5510,"happiness":4820,"demandHappiness":5510,"money_24h":79500},"SpaceAgeAsteroidBelt":{"population":5985,"happiness":5240,"demandHappiness":5985,"money_24h":88100},"SpaceAgeVenus":{"population":6469,"happiness":5660,"demandHappiness":6469,"money_24h":97100},"SpaceAgeJupiterMoon":{"population":6966,"happiness":6090,"demandHappiness":6966,"money_24h":106600},"SpaceAgeTitan":{"population":7473,"happiness":6530,"demandHappiness":7473,"money_24h":116500},"SpaceAgeSpaceHub":{"population":7992,"happiness":6990,"demandHappiness":7992,"money_24h":126900}} },
+    "W_MultiAge_CUP20B2": { prod: {"BronzeAge":{"population":133,"happiness":340,"demandHappiness":133,"money_24h":850,"supplies_24h":580,"random_good_of_age_24h":3},"IronAge":{"population":285,"happiness":580,"demandHappiness":285,"money_24h":2000,"supplies_24h":990,"random_good_of_age_24h":3},"EarlyMiddleAge":{"population":438,"happiness":640,"demandHappiness":438,"money_24h":3350,"supplies_24h":1100,"random_good_of_age_24h":3},"HighMiddleAge":{"population":615,"happiness":720,"demandHappiness":615,"money_24h":4700,"supplies_24h":1230,"random_good_of_age_24h":3},"LateMiddleAge":{"population":807,"happiness":800,"demandHappiness":807,"money_24h":6200,"supplies_24h":1370,"random_good_of_age_24h":3},"ColonialAge":{"population":1018,"happiness":940,"demandHappiness":1018,"money_24h":9500,"supplies_24h":1610,"random_good_of_age_24h":3},"IndustrialAge":{"population":1245,"happiness":1060,"demandHappiness":1245,"money_24h":11800,"supplies_24h":1810,"random_good_of_age_24h":3},"ProgressiveEra":{"population":1486,"happiness":1160,"demandHappiness":1486,"money_24h":14300,"supplies_24h":1990,"random_good_of_age_24h":3},"ModernEra":{"population":1742,"happiness":1240,"demandHappiness":1742,"money_24h":17800,"supplies_24h":2130,"random_good_of_age_24h":3},"PostModernEra":{"population":2007,"happiness":1290,"demandHappiness":2007,"money_24h":22400,"supplies_24h":2220,"random_good_of_age_24h":3},"ContemporaryEra":{"population":2288,"happiness":1500,"demandHappiness":2288,"money_24h":29200,"supplies_24h":2580,"random_good_of_age_24h":3},"TomorrowEra":{"population":2578,"happiness":1830,"demandHappiness":2578,"money_24h":33800,"supplies_24h":3130,"random_good_of_age_24h":3},"FutureEra":{"population":2883,"happiness":2190,"demandHappiness":2883,"money_24h":38700,"supplies_24h":3750,"random_good_of_age_24h":3},"ArcticFuture":{"population":3198,"happiness":2550,"demandHappiness":3198,"money_24h":44000,"supplies_24h":4370,"random_good_of_age_24h":3},"OceanicFuture":{"population":3523,"happiness":2940,"demandHappiness":3523,"money_24h":49600,"supplies_24h":5040,"random_good_of_age_24h":3},"VirtualFuture":{"population":3857,"happiness":3510,"demandHappiness":3857,"money_24h":55600,"supplies_24h":6020,"random_good_of_age_24h":3},"SpaceAgeMars":{"population":6106,"happiness":5620,"demandHappiness":6106,"money_24h":92800,"supplies_24h":9630,"random_good_of_age_24h":3},"SpaceAgeAsteroidBelt":{"population":6632,"happiness":6110,"demandHappiness":6632,"money_24h":102800,"supplies_24h":10470,"random_good_of_age_24h":3},"SpaceAgeVenus":{"population":7168,"happiness":6600,"demandHappiness":7168,"money_24h":113300,"supplies_24h":11310,"random_good_of_age_24h":3},"SpaceAgeJupiterMoon":{"population":7719,"happiness":7110,"demandHappiness":7719,"money_24h":124400,"supplies_24h":12190,"random_good_of_age_24h":3},"SpaceAgeTitan":{"population":8280,"happiness":7620,"demandHappiness":8280,"money_24h":136000,"supplies_24h":13070,"random_good_of_age_24h":3},"SpaceAgeSpaceHub":{"population":8856,"happiness":8150,"demandHappiness":8856,"money_24h":148100,"supplies_24h":13980,"random_good_of_age_24h":3}} },
+    "W_MultiAge_CUP20B3": { prod: {"BronzeAge":{"population":148,"happiness":380,"demandHappiness":148,"money_24h":950,"supplies_24h":680,"strategy_points_24h":1,"random_good_of_age_24h":6},"IronAge":{"population":318,"happiness":660,"demandHappiness":318,"money_24h":2300,"supplies_24h":1180,"strategy_points_24h":1,"random_good_of_age_24h":6},"EarlyMiddleAge":{"population":488,"happiness":730,"demandHappiness":488,"money_24h":3850,"supplies_24h":1310,"strategy_points_24h":1,"random_good_of_age_24h":6},"HighMiddleAge":{"population":685,"happiness":820,"demandHappiness":685,"money_24h":5400,"supplies_24h":1460,"strategy_points_24h":1,"random_good_of_age_24h":6},"LateMiddleAge":{"population":899,"happiness":910,"demandHappiness":899,"money_24h":7100,"supplies_24h":1620,"strategy_points_24h":1,"random_good_of_age_24h":6},"ColonialAge":{"population":1134,"happiness":1070,"demandHappiness":1134,"money_24h":10800,"supplies_24h":1910,"strategy_points_24h":1,"random_good_of_age_24h":6},"IndustrialAge":{"population":1386,"happiness":1210,"demandHappiness":1386,"money_24h":13500,"supplies_24h":2150,"strategy_points_24h":1,"random_good_of_age_24h":6},"ProgressiveEra":{"population":1655,"happiness":1330,"demandHappiness":1655,"money_24h":16400,"supplies_24h":2360,"strategy_points_24h":1,"random_good_of_age_24h":6},"ModernEra":{"population":1940,"happiness":1420,"demandHappiness":1940,"money_24h":20400,"supplies_24h":2530,"strategy_points_24h":1,"random_good_of_age_24h":6},"PostModernEra":{"population":2236,"happiness":1480,"demandHappiness":2236,"money_24h":25600,"supplies_24h":2640,"strategy_points_24h":1,"random_good_of_age_24h":6},"ContemporaryEra":{"population":2548,"happiness":1720,"demandHappiness":2548,"money_24h":33300,"supplies_24h":3060,"strategy_points_24h":1,"random_good_of_age_24h":6},"TomorrowEra":{"population":2872,"happiness":2090,"demandHappiness":2872,"money_24h":38600,"supplies_24h":3720,"strategy_points_24h":1,"random_good_of_age_24h":6},"FutureEra":{"population":3211,"happiness":2500,"demandHappiness":3211,"money_24h":44200,"supplies_24h":4450,"strategy_points_24h":1,"random_good_of_age_24h":6},"ArcticFuture":{"population":3562,"happiness":2910,"demandHappiness":3562,"money_24h":50300,"supplies_24h":5190,"strategy_points_24h":1,"random_good_of_age_24h":6},"OceanicFuture":{"population":3924,"happiness":3360,"demandHappiness":3924,"money_24h":56700,"supplies_24h":5990,"strategy_points_24h":1,"random_good_of_age_24h":6},"VirtualFuture":{"population":4296,"happiness":4010,"demandHappiness":4296,"money_24h":63500,"supplies_24h":7150,"strategy_points_24h":1,"random_good_of_age_24h":6},"SpaceAgeMars":{"population":6801,"happiness":6420,"demandHappiness":6801,"money_24h":106000,"supplies_24h":11440,"strategy_points_24h":1,"random_good_of_age_24h":6},"SpaceAgeAsteroidBelt":{"population":7387,"happiness":6980,"demandHappiness":7387,"money_24h":117500,"supplies_24h":12430,"strategy_points_24h":1,"random_good_of_age_24h":6},"SpaceAgeVenus":{"population":7984,"happiness":7540,"demandHappiness":7984,"money_24h":129500,"supplies_24h":13430,"strategy_points_24h":1,"random_good_of_age_24h":6},"SpaceAgeJupiterMoon":{"population":8598,"happiness":8120,"demandHappiness":8598,"money_24h":142100,"supplies_24h":14470,"strategy_points_24h":1,"random_good_of_age_24h":6},"SpaceAgeTitan":{"population":9223,"happiness":8710,"demandHappiness":9223,"money_24h":155400,"supplies_24h":15520,"strategy_points_24h":1,"random_good_of_age_24h":6},"SpaceAgeSpaceHub":{"population":9864,"happiness":9320,"demandHappiness":9864,"money_24h":169200,"supplies_24h":16600,"strategy_points_24h":1,"random_good_of_age_24h":6}} },
+    "W_MultiAge_CUP20B4": { prod: {"BronzeAge":{"population":153,"happiness":430,"demandHappiness":153,"money_24h":1100,"supplies_24h":790,"strategy_points_24h":3,"random_good_of_age_24h":9},"IronAge":{"population":329,"happiness":750,"demandHappiness":329,"money_24h":2600,"supplies_24h":1370,"strategy_points_24h":3,"random_good_of_age_24h":9},"EarlyMiddleAge":{"population":506,"happiness":820,"demandHappiness":506,"money_24h":4300,"supplies_24h":1510,"strategy_points_24h":3,"random_good_of_age_24h":9},"HighMiddleAge":{"population":710,"happiness":920,"demandHappiness":710,"money_24h":6050,"supplies_24h":1690,"strategy_points_24h":3,"random_good_of_age_24h":9},"LateMiddleAge":{"population":932,"happiness":1030,"demandHappiness":932,"money_24h":8000,"supplies_24h":1880,"strategy_points_24h":3,"random_good_of_age_24h":9},"ColonialAge":{"population":1176,"happiness":1210,"demandHappiness":1176,"money_24h":12200,"supplies_24h":2210,"strategy_points_24h":3,"random_good_of_age_24h":9},"IndustrialAge":{"population":1437,"happiness":1360,"demandHappiness":1437,"money_24h":15200,"supplies_24h":2490,"strategy_points_24h":3,"random_good_of_age_24h":9},"ProgressiveEra":{"population":1715,"happiness":1490,"demandHappiness":1715,"money_24h":18400,"supplies_24h":2740,"strategy_points_24h":3,"random_good_of_age_24h":9},"ModernEra":{"population":2011,"happiness":1600,"demandHappiness":2011,"money_24h":22900,"supplies_24h":2930,"strategy_points_24h":3,"random_good_of_age_24h":9},"PostModernEra":{"population":2317,"happiness":1660,"demandHappiness":2317,"money_24h":28800,"supplies_24h":3050,"strategy_points_24h":3,"random_good_of_age_24h":9},"ContemporaryEra":{"population":2641,"happiness":1930,"demandHappiness":2641,"money_24h":37500,"supplies_24h":3550,"strategy_points_24h":3,"random_good_of_age_24h":9},"TomorrowEra":{"population":2976,"happiness":2350,"demandHappiness":2976,"money_24h":43400,"supplies_24h":4300,"strategy_points_24h":3,"random_good_of_age_24h":9},"FutureEra":{"population":3328,"happiness":2810,"demandHappiness":3328,"money_24h":49800,"supplies_24h":5160,"strategy_points_24h":3,"random_good_of_age_24h":9},"ArcticFuture":{"population":3692,"happiness":3280,"demandHappiness":3692,"money_24h":56600,"supplies_24h":6010,"strategy_points_24h":3,"random_good_of_age_24h":9},"OceanicFuture":{"population":4067,"happiness":3780,"demandHappiness":4067,"money_24h":63800,"supplies_24h":6930,"strategy_points_24h":3,"random_good_of_age_24h":9},"VirtualFuture":{"population":4453,"happiness":4520,"demandHappiness":4453,"money_24h":71400,"supplies_24h":8280,"strategy_points_24h":3,"random_good_of_age_24h":9},"SpaceAgeMars":{"population":7049,"happiness":7230,"demandHappiness":7049,"money_24h":119300,"supplies_24h":13250,"strategy_points_24h":3,"random_good_of_age_24h":9},"SpaceAgeAsteroidBelt":{"population":7657,"happiness":7850,"demandHappiness":7657,"money_24h":132100,"supplies_24h":14400,"strategy_points_24h":3,"random_good_of_age_24h":9},"SpaceAgeVenus":{"population":8276,"happiness":8480,"demandHappiness":8276,"money_24h":145700,"supplies_24h":15550,"strategy_points_24h":3,"random_good_of_age_24h":9},"SpaceAgeJupiterMoon":{"population":8912,"happiness":9140,"demandHappiness":8912,"money_24h":159900,"supplies_24h":16760,"strategy_points_24h":3,"random_good_of_age_24h":9},"SpaceAgeTitan":{"population":9559,"happiness":9800,"demandHappiness":9559,"money_24h":174800,"supplies_24h":17970,"strategy_points_24h":3,"random_good_of_age_24h":9},"SpaceAgeSpaceHub":{"population":10224,"happiness":10480,"demandHappiness":10224,"money_24h":190400,"supplies_24h":19220,"strategy_points_24h":3,"random_good_of_age_24h":9}} },
+    "W_MultiAge_CUP20B5": { prod: {"BronzeAge":{"population":162,"happiness":500,"demandHappiness":162,"money_24h":1200,"supplies_24h":900,"strategy_points_24h":5,"random_good_of_age_24h":12},"IronAge":{"population":348,"happiness":870,"demandHappiness":348,"money_24h":2900,"supplies_24h":1550,"strategy_points_24h":5,"random_good_of_age_24h":12},"EarlyMiddleAge":{"population":534,"happiness":960,"demandHappiness":534,"money_24h":4800,"supplies_24h":1720,"strategy_points_24h":5,"random_good_of_age_24h":12},"HighMiddleAge":{"population":750,"happiness":1070,"demandHappiness":750,"money_24h":6700,"supplies_24h":1920,"strategy_points_24h":5,"random_good_of_age_24h":12},"LateMiddleAge":{"population":984,"happiness":1200,"demandHappiness":984,"money_24h":8900,"supplies_24h":2140,"strategy_points_24h":5,"random_good_of_age_24h":12},"ColonialAge":{"population":1242,"happiness":1410,"demandHappiness":1242,"money_24h":13500,"supplies_24h":2510,"strategy_points_24h":5,"random_good_of_age_24h":12},"IndustrialAge":{"population":1518,"happiness":1590,"demandHappiness":1518,"money_24h":16900,"supplies_24h":2830,"strategy_points_24h":5,"random_good_of_age_24h":12},"ProgressiveEra":{"population":1812,"happiness":1740,"demandHappiness":1812,"money_24h":20500,"supplies_24h":3110,"strategy_points_24h":5,"random_good_of_age_24h":12},"ModernEra":{"population":2124,"happiness":1860,"demandHappiness":2124,"money_24h":25400,"supplies_24h":3330,"strategy_points_24h":5,"random_good_of_age_24h":12},"PostModernEra":{"population":2448,"happiness":1940,"demandHappiness":2448,"money_24h":32000,"supplies_24h":3470,"strategy_points_24h":5,"random_good_of_age_24h":12},"ContemporaryEra":{"population":2790,"happiness":2260,"demandHappiness":2790,"money_24h":41700,"supplies_24h":4030,"strategy_points_24h":5,"random_good_of_age_24h":12},"TomorrowEra":{"population":3144,"happiness":2740,"demandHappiness":3144,"money_24h":48200,"supplies_24h":4890,"strategy_points_24h":5,"random_good_of_age_24h":12},"FutureEra":{"population":3516,"happiness":3280,"demandHappiness":3516,"money_24h":55300,"supplies_24h":5860,"strategy_points_24h":5,"random_good_of_age_24h":12},"ArcticFuture":{"population":3900,"happiness":3820,"demandHappiness":3900,"money_24h":62800,"supplies_24h":6820,"strategy_points_24h":5,"random_good_of_age_24h":12},"OceanicFuture":{"population":4296,"happiness":4410,"demandHappiness":4296,"money_24h":70900,"supplies_24h":7880,"strategy_points_24h":5,"random_good_of_age_24h":12},"VirtualFuture":{"population":4704,"happiness":5270,"demandHappiness":4704,"money_24h":79400,"supplies_24h":9410,"strategy_points_24h":5,"random_good_of_age_24h":12},"SpaceAgeMars":{"population":7446,"happiness":8430,"demandHappiness":7446,"money_24h":132600,"supplies_24h":15050,"strategy_points_24h":5,"random_good_of_age_24h":12},"SpaceAgeAsteroidBelt":{"population":8088,"happiness":9160,"demandHappiness":8088,"money_24h":146800,"supplies_24h":16360,"strategy_points_24h":5,"random_good_of_age_24h":12},"SpaceAgeVenus":{"population":8742,"happiness":9900,"demandHappiness":8742,"money_24h":161800,"supplies_24h":17680,"strategy_points_24h":5,"random_good_of_age_24h":12},"SpaceAgeJupiterMoon":{"population":9414,"happiness":10660,"demandHappiness":9414,"money_24h":177600,"supplies_24h":19040,"strategy_points_24h":5,"random_good_of_age_24h":12},"SpaceAgeTitan":{"population":10098,"happiness":11440,"demandHappiness":10098,"money_24h":194200,"supplies_24h":20420,"strategy_points_24h":5,"random_good_of_age_24h":12},"SpaceAgeSpaceHub":{"population":10800,"happiness":12230,"demandHappiness":10800,"money_24h":211600,"supplies_24h":21840,"strategy_points_24h":5,"random_good_of_age_24h":12}} },
+    "W_MultiAge_CUP20B6": { prod: {"BronzeAge":{"population":176,"happiness":580,"demandHappiness":176,"money_24h":1300,"supplies_24h":1010,"strategy_points_24h":8,"random_good_of_age_24h":15},"IronAge":{"population":378,"happiness":990,"demandHappiness":378,"money_24h":3150,"supplies_24h":1740,"strategy_points_24h":8,"random_good_of_age_24h":15},"EarlyMiddleAge":{"population":580,"happiness":1100,"demandHappiness":580,"money_24h":5300,"supplies_24h":1920,"strategy_points_24h":8,"random_good_of_age_24h":15},"HighMiddleAge":{"population":815,"happiness":1230,"demandHappiness":815,"money_24h":7400,"supplies_24h":2150,"strategy_points_24h":8,"random_good_of_age_24h":15},"LateMiddleAge":{"population":1069,"happiness":1370,"demandHappiness":1069,"money_24h":9800,"supplies_24h":2390,"strategy_points_24h":8,"random_good_of_age_24h":15},"ColonialAge":{"population":1350,"happiness":1610,"demandHappiness":1350,"money_24h":14900,"supplies_24h":2810,"strategy_points_24h":8,"random_good_of_age_24h":15},"IndustrialAge":{"population":1650,"happiness":1810,"demandHappiness":1650,"money_24h":18500,"supplies_24h":3170,"strategy_points_24h":8,"random_good_of_age_24h":15},"ProgressiveEra":{"population":1969,"happiness":1990,"demandHappiness":1969,"money_24h":22500,"supplies_24h":3480,"strategy_points_24h":8,"random_good_of_age_24h":15},"ModernEra":{"population":2308,"happiness":2130,"demandHappiness":2308,"money_24h":28000,"supplies_24h":3730,"strategy_points_24h":8,"random_good_of_age_24h":15},"PostModernEra":{"population":2660,"happiness":2220,"demandHappiness":2660,"money_24h":35200,"supplies_24h":3880,"strategy_points_24h":8,"random_good_of_age_24h":15},"ContemporaryEra":{"population":3032,"happiness":2580,"demandHappiness":3032,"money_24h":45800,"supplies_24h":4510,"strategy_points_24h":8,"random_good_of_age_24h":15},"TomorrowEra":{"population":3416,"happiness":3130,"demandHappiness":3416,"money_24h":53100,"supplies_24h":5480,"strategy_points_24h":8,"random_good_of_age_24h":15},"FutureEra":{"population":3821,"happiness":3750,"demandHappiness":3821,"money_24h":60800,"supplies_24h":6560,"strategy_points_24h":8,"random_good_of_age_24h":15},"ArcticFuture":{"population":4238,"happiness":4370,"demandHappiness":4238,"money_24h":69100,"supplies_24h":7640,"strategy_points_24h":8,"random_good_of_age_24h":15},"OceanicFuture":{"population":4668,"happiness":5040,"demandHappiness":4668,"money_24h":77900,"supplies_24h":8820,"strategy_points_24h":8,"random_good_of_age_24h":15},"VirtualFuture":{"population":5112,"happiness":6020,"demandHappiness":5112,"money_24h":87300,"supplies_24h":10540,"strategy_points_24h":8,"random_good_of_age_24h":15},"SpaceAgeMars":{"population":8091,"happiness":9630,"demandHappiness":8091,"money_24h":145800,"supplies_24h":16860,"strategy_points_24h":8,"random_good_of_age_24h":15},"SpaceAgeAsteroidBelt":{"population":8789,"happiness":10470,"demandHappiness":8789,"money_24h":161500,"supplies_24h":18320,"strategy_points_24h":8,"random_good_of_age_24h":15},"SpaceAgeVenus":{"population":9500,"happiness":11310,"demandHappiness":9500,"money_24h":178000,"supplies_24h":19800,"strategy_points_24h":8,"random_good_of_age_24h":15},"SpaceAgeJupiterMoon":{"population":10230,"happiness":12190,"demandHappiness":10230,"money_24h":195400,"supplies_24h":21320,"strategy_points_24h":8,"random_good_of_age_24h":15},"SpaceAgeTitan":{"population":10973,"happiness":13070,"demandHappiness":10973,"money_24h":213600,"supplies_24h":22870,"strategy_points_24h":8,"random_good_of_age_24h":15},"SpaceAgeSpaceHub":{"population":11736,"happiness":13980,"demandHappiness":11736,"money_24h":232700,"supplies_24h":24460,"strategy_points_24h":8,"random_good_of_age_24h":15}}, boosts: [{"type":"att_boost_defender","value":10,"feature":"all"}] },
+    "W_MultiAge_CUP22E1": { prod: {"BronzeAge":{"happiness":130},"IronAge":{"happiness":190},"EarlyMiddleAge":{"happiness":220},"HighMiddleAge":{"happiness":280},"LateMiddleAge":{"happiness":320},"ColonialAge":{"happiness":380},"IndustrialAge":{"happiness":420},"ProgressiveEra":{"happiness":470},"ModernEra":{"happiness":530},"PostModernEra":{"happiness":610},"ContemporaryEra":{"happiness":710},"TomorrowEra":{"happiness":880},"FutureEra":{"happiness":1050},"ArcticFuture":{"happiness":1190},"OceanicFuture":{"happiness":1340},"VirtualFuture":{"happiness":1690},"SpaceAgeMars":{"happiness":2630},"SpaceAgeAsteroidBelt":{"happiness":2860},"SpaceAgeVenus":{"happiness":3090},"SpaceAgeJupiterMoon":{"happiness":3330},"SpaceAgeTitan":{"happiness":3570},"SpaceAgeSpaceHub":{"happiness":3820}} },
+    "W_MultiAge_CUP20D1": { prod: {"BronzeAge":{"happiness":130},"IronAge":{"happiness":190},"EarlyMiddleAge":{"happiness":220},"HighMiddleAge":{"happiness":280},"LateMiddleAge":{"happiness":320},"ColonialAge":{"happiness":380},"IndustrialAge":{"happiness":420},"ProgressiveEra":{"happiness":470},"ModernEra":{"happiness":530},"PostModernEra":{"happiness":610},"ContemporaryEra":{"happiness":710},"TomorrowEra":{"happiness":880},"FutureEra":{"happiness":1050},"ArcticFuture":{"happiness":1190},"OceanicFuture":{"happiness":1340},"VirtualFuture":{"happiness":1690},"SpaceAgeMars":{"happiness":2630},"SpaceAgeAsteroidBelt":{"happiness":2860},"SpaceAgeVenus":{"happiness":3090},"SpaceAgeJupiterMoon":{"happiness":3330},"SpaceAgeTitan":{"happiness":3570},"SpaceAgeSpaceHub":{"happiness":3820}} },
+    "W_MultiAge_CUP22A9": { prod: {"BronzeAge":{"population":182,"happiness":900,"demandHappiness":182,"money_24h":1300,"supplies_24h":1130,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"IronAge":{"population":392,"happiness":1550,"demandHappiness":392,"money_24h":3000,"supplies_24h":1940,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"EarlyMiddleAge":{"population":601,"happiness":1720,"demandHappiness":601,"money_24h":5000,"supplies_24h":2150,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"HighMiddleAge":{"population":844,"happiness":1920,"demandHappiness":844,"money_24h":7000,"supplies_24h":2390,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"LateMiddleAge":{"population":1107,"happiness":2140,"demandHappiness":1107,"money_24h":9300,"supplies_24h":2670,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"ColonialAge":{"population":1397,"happiness":2510,"demandHappiness":1397,"money_24h":14100,"supplies_24h":3140,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"IndustrialAge":{"population":1708,"happiness":2830,"demandHappiness":1708,"money_24h":17600,"supplies_24h":3540,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"ProgressiveEra":{"population":2039,"happiness":3110,"demandHappiness":2039,"money_24h":21300,"supplies_24h":3890,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"ModernEra":{"population":2390,"happiness":3330,"demandHappiness":2390,"money_24h":26500,"supplies_24h":4160,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"PostModernEra":{"population":2754,"happiness":3470,"demandHappiness":2754,"money_24h":33300,"supplies_24h":4330,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"ContemporaryEra":{"population":3139,"happiness":4030,"demandHappiness":3139,"money_24h":43400,"supplies_24h":5040,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"TomorrowEra":{"population":3537,"happiness":4890,"demandHappiness":3537,"money_24h":50300,"supplies_24h":6110,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"FutureEra":{"population":3956,"happiness":5860,"demandHappiness":3956,"money_24h":57600,"supplies_24h":7330,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"ArcticFuture":{"population":4388,"happiness":6820,"demandHappiness":4388,"money_24h":65500,"supplies_24h":8530,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"OceanicFuture":{"population":4833,"happiness":7880,"demandHappiness":4833,"money_24h":73800,"supplies_24h":9840,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"VirtualFuture":{"population":5292,"happiness":9410,"demandHappiness":5292,"money_24h":82700,"supplies_24h":11760,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"SpaceAgeMars":{"population":8377,"happiness":15050,"demandHappiness":8377,"money_24h":138100,"supplies_24h":18820,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"SpaceAgeAsteroidBelt":{"population":9099,"happiness":16360,"demandHappiness":9099,"money_24h":152900,"supplies_24h":20450,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"SpaceAgeVenus":{"population":9835,"happiness":17680,"demandHappiness":9835,"money_24h":168600,"supplies_24h":22090,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"SpaceAgeJupiterMoon":{"population":10591,"happiness":19040,"demandHappiness":10591,"money_24h":185000,"supplies_24h":23800,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"SpaceAgeTitan":{"population":11360,"happiness":20420,"demandHappiness":11360,"money_24h":202300,"supplies_24h":25520,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5},"SpaceAgeSpaceHub":{"population":12150,"happiness":21840,"demandHappiness":12150,"money_24h":220400,"supplies_24h":27300,"strategy_points_24h":24,"all_goods_of_age_24h":21.0,"random_good_of_age_24h":37.5}}, boosts: [{"type":"def_boost_attacker","value":25,"feature":"all"},{"type":"att_boost_attacker","value":21,"feature":"all"}] },
+    "W_MultiAge_CUP22D1": { prod: {"BronzeAge":{"happiness":130},"IronAge":{"happiness":190},"EarlyMiddleAge":{"happiness":220},"HighMiddleAge":{"happiness":280},"LateMiddleAge":{"happiness":320},"ColonialAge":{"happiness":380},"IndustrialAge":{"happiness":420},"ProgressiveEra":{"happiness":470},"ModernEra":{"happiness":530},"PostModernEra":{"happiness":610},"ContemporaryEra":{"happiness":710},"TomorrowEra":{"happiness":880},"FutureEra":{"happiness":1050},"ArcticFuture":{"happiness":1190},"OceanicFuture":{"happiness":1340},"VirtualFuture":{"happiness":1690},"SpaceAgeMars":{"happiness":2630},"SpaceAgeAsteroidBelt":{"happiness":2860},"SpaceAgeVenus":{"happiness":3090},"SpaceAgeJupiterMoon":{"happiness":3330},"SpaceAgeTitan":{"happiness":3570},"SpaceAgeSpaceHub":{"happiness":3820}} },
+    "W_MultiAge_CUP20E1": { prod: {"BronzeAge":{"happiness":130},"IronAge":{"happiness":190},"EarlyMiddleAge":{"happiness":220},"HighMiddleAge":{"happiness":280},"LateMiddleAge":{"happiness":320},"ColonialAge":{"happiness":380},"IndustrialAge":{"happiness":420},"ProgressiveEra":{"happiness":470},"ModernEra":{"happiness":530},"PostModernEra":{"happiness":610},"ContemporaryEra":{"happiness":710},"TomorrowEra":{"happiness":880},"FutureEra":{"happiness":1050},"ArcticFuture":{"happiness":1190},"OceanicFuture":{"happiness":1340},"VirtualFuture":{"happiness":1690},"SpaceAgeMars":{"happiness":2630},"SpaceAgeAsteroidBelt":{"happiness":2860},"SpaceAgeVenus":{"happiness":3090},"SpaceAgeJupiterMoon":{"happiness":3330},"SpaceAgeTitan":{"happiness":3570},"SpaceAgeSpaceHub":{"happiness":3820}} },
+    "W_MultiAge_CUP22A1": { prod: {"BronzeAge":{"population":138,"happiness":540,"demandHappiness":138,"money_24h":500},"IronAge":{"population":296,"happiness":930,"demandHappiness":296,"money_24h":1200},"EarlyMiddleAge":{"population":454,"happiness":1030,"demandHappiness":454,"money_24h":2100},"HighMiddleAge":{"population":638,"happiness":1150,"demandHappiness":638,"money_24h":2900},"LateMiddleAge":{"population":836,"happiness":1280,"demandHappiness":836,"money_24h":3800},"ColonialAge":{"population":1056,"happiness":1510,"demandHappiness":1056,"money_24h":5800},"IndustrialAge":{"population":1290,"happiness":1700,"demandHappiness":1290,"money_24h":7200},"ProgressiveEra":{"population":1540,"happiness":1870,"demandHappiness":1540,"money_24h":8800},"ModernEra":{"population":1805,"happiness":2000,"demandHappiness":1805,"money_24h":10900},"PostModernEra":{"population":2081,"happiness":2080,"demandHappiness":2081,"money_24h":13700},"ContemporaryEra":{"population":2372,"happiness":2420,"demandHappiness":2372,"money_24h":17900},"TomorrowEra":{"population":2672,"happiness":2940,"demandHappiness":2672,"money_24h":20700},"FutureEra":{"population":2989,"happiness":3520,"demandHappiness":2989,"money_24h":23700},"ArcticFuture":{"population":3315,"happiness":4090,"demandHappiness":3315,"money_24h":27000},"OceanicFuture":{"population":3652,"happiness":4730,"demandHappiness":3652,"money_24h":30400},"VirtualFuture":{"population":3998,"happiness":5650,"demandHappiness":3998,"money_24h":34100},"SpaceAgeMars":{"population":6329,"happiness":9030,"demandHappiness":6329,"money_24h":56900},"SpaceAgeAsteroidBelt":{"population":6875,"happiness":9820,"demandHappiness":6875,"money_24h":63000},"SpaceAgeVenus":{"population":7431,"happiness":10610,"demandHappiness":7431,"money_24h":69500},"SpaceAgeJupiterMoon":{"population":8002,"happiness":11420,"demandHappiness":8002,"money_24h":76200},"SpaceAgeTitan":{"population":8583,"happiness":12250,"demandHappiness":8583,"money_24h":83400},"SpaceAgeSpaceHub":{"population":9180,"happiness":13110,"demandHappiness":9180,"money_24h":90800}} },
+    "W_MultiAge_CUP22A2": { prod: {"BronzeAge":{"population":142,"happiness":590,"demandHappiness":142,"money_24h":500},"IronAge":{"population":305,"happiness":1010,"demandHappiness":305,"money_24h":1300},"EarlyMiddleAge":{"population":467,"happiness":1120,"demandHappiness":467,"money_24h":2100},"HighMiddleAge":{"population":656,"happiness":1250,"demandHappiness":656,"money_24h":2900},"LateMiddleAge":{"population":861,"happiness":1390,"demandHappiness":861,"money_24h":3900},"ColonialAge":{"population":1087,"happiness":1630,"demandHappiness":1087,"money_24h":5900},"IndustrialAge":{"population":1328,"happiness":1840,"demandHappiness":1328,"money_24h":7300},"ProgressiveEra":{"population":1586,"happiness":2020,"demandHappiness":1586,"money_24h":8900},"ModernEra":{"population":1859,"happiness":2160,"demandHappiness":1859,"money_24h":11000},"PostModernEra":{"population":2142,"happiness":2250,"demandHappiness":2142,"money_24h":13900},"ContemporaryEra":{"population":2441,"happiness":2620,"demandHappiness":2441,"money_24h":18100},"TomorrowEra":{"population":2751,"happiness":3180,"demandHappiness":2751,"money_24h":20900},"FutureEra":{"population":3077,"happiness":3810,"demandHappiness":3077,"money_24h":24000},"ArcticFuture":{"population":3413,"happiness":4440,"demandHappiness":3413,"money_24h":27200},"OceanicFuture":{"population":3759,"happiness":5120,"demandHappiness":3759,"money_24h":30700},"VirtualFuture":{"population":4116,"happiness":6120,"demandHappiness":4116,"money_24h":34400},"SpaceAgeMars":{"population":6515,"happiness":9790,"demandHappiness":6515,"money_24h":57400},"SpaceAgeAsteroidBelt":{"population":7077,"happiness":10630,"demandHappiness":7077,"money_24h":63600},"SpaceAgeVenus":{"population":7649,"happiness":11490,"demandHappiness":7649,"money_24h":70100},"SpaceAgeJupiterMoon":{"population":8237,"happiness":12380,"demandHappiness":8237,"money_24h":77000},"SpaceAgeTitan":{"population":8836,"happiness":13270,"demandHappiness":8836,"money_24h":84200},"SpaceAgeSpaceHub":{"population":9450,"happiness":14200,"demandHappiness":9450,"money_24h":91700}} },
+    "W_MultiAge_CUP22A3": { prod: {"BronzeAge":{"population":146,"happiness":630,"demandHappiness":146,"money_24h":500,"supplies_24h":720},"IronAge":{"population":313,"happiness":1090,"demandHappiness":313,"money_24h":1300,"supplies_24h":1240},"EarlyMiddleAge":{"population":481,"happiness":1200,"demandHappiness":481,"money_24h":2100,"supplies_24h":1370},"HighMiddleAge":{"population":675,"happiness":1340,"demandHappiness":675,"money_24h":3000,"supplies_24h":1530},"LateMiddleAge":{"population":886,"happiness":1500,"demandHappiness":886,"money_24h":3900,"supplies_24h":1710},"ColonialAge":{"population":1118,"happiness":1760,"demandHappiness":1118,"money_24h":6000,"supplies_24h":2010},"IndustrialAge":{"population":1366,"happiness":1980,"demandHappiness":1366,"money_24h":7400,"supplies_24h":2270},"ProgressiveEra":{"population":1631,"happiness":2180,"demandHappiness":1631,"money_24h":9000,"supplies_24h":2490},"ModernEra":{"population":1912,"happiness":2330,"demandHappiness":1912,"money_24h":11200,"supplies_24h":2660},"PostModernEra":{"population":2203,"happiness":2430,"demandHappiness":2203,"money_24h":14100,"supplies_24h":2770},"ContemporaryEra":{"population":2511,"happiness":2820,"demandHappiness":2511,"money_24h":18400,"supplies_24h":3220},"TomorrowEra":{"population":2830,"happiness":3420,"demandHappiness":2830,"money_24h":21300,"supplies_24h":3910},"FutureEra":{"population":3164,"happiness":4100,"demandHappiness":3164,"money_24h":24400,"supplies_24h":4690},"ArcticFuture":{"population":3510,"happiness":4780,"demandHappiness":3510,"money_24h":27800,"supplies_24h":5460},"OceanicFuture":{"population":3866,"happiness":5510,"demandHappiness":3866,"money_24h":31300,"supplies_24h":6300},"VirtualFuture":{"population":4234,"happiness":6590,"demandHappiness":4234,"money_24h":35100,"supplies_24h":7530},"SpaceAgeMars":{"population":6701,"happiness":10540,"demandHappiness":6701,"money_24h":58500,"supplies_24h":12040},"SpaceAgeAsteroidBelt":{"population":7279,"happiness":11450,"demandHappiness":7279,"money_24h":64900,"supplies_24h":13090},"SpaceAgeVenus":{"population":7868,"happiness":12370,"demandHappiness":7868,"money_24h":71500,"supplies_24h":14140},"SpaceAgeJupiterMoon":{"population":8473,"happiness":13330,"demandHappiness":8473,"money_24h":78500,"supplies_24h":15230},"SpaceAgeTitan":{"population":9088,"happiness":14290,"demandHappiness":9088,"money_24h":85800,"supplies_24h":16340},"SpaceAgeSpaceHub":{"population":9720,"happiness":15290,"demandHappiness":9720,"money_24h":93400,"supplies_24h":17470}} },
+    "W_MultiAge_CUP22A4": { prod: {"BronzeAge":{"population":151,"happiness":680,"demandHappiness":151,"money_24h":500,"supplies_24h":770,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"IronAge":{"population":325,"happiness":1160,"demandHappiness":325,"money_24h":1300,"supplies_24h":1320,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"EarlyMiddleAge":{"population":498,"happiness":1290,"demandHappiness":498,"money_24h":2100,"supplies_24h":1460,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"HighMiddleAge":{"population":700,"happiness":1440,"demandHappiness":700,"money_24h":3000,"supplies_24h":1630,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"LateMiddleAge":{"population":918,"happiness":1600,"demandHappiness":918,"money_24h":4000,"supplies_24h":1820,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"ColonialAge":{"population":1159,"happiness":1880,"demandHappiness":1159,"money_24h":6000,"supplies_24h":2140,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"IndustrialAge":{"population":1417,"happiness":2120,"demandHappiness":1417,"money_24h":7500,"supplies_24h":2410,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"ProgressiveEra":{"population":1691,"happiness":2330,"demandHappiness":1691,"money_24h":9100,"supplies_24h":2640,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"ModernEra":{"population":1982,"happiness":2500,"demandHappiness":1982,"money_24h":11300,"supplies_24h":2830,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"PostModernEra":{"population":2285,"happiness":2600,"demandHappiness":2285,"money_24h":14300,"supplies_24h":2950,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"ContemporaryEra":{"population":2604,"happiness":3020,"demandHappiness":2604,"money_24h":18600,"supplies_24h":3430,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"TomorrowEra":{"population":2934,"happiness":3670,"demandHappiness":2934,"money_24h":21500,"supplies_24h":4160,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"FutureEra":{"population":3282,"happiness":4400,"demandHappiness":3282,"money_24h":24700,"supplies_24h":4980,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"ArcticFuture":{"population":3640,"happiness":5120,"demandHappiness":3640,"money_24h":28000,"supplies_24h":5800,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"OceanicFuture":{"population":4010,"happiness":5910,"demandHappiness":4010,"money_24h":31600,"supplies_24h":6690,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"VirtualFuture":{"population":4390,"happiness":7060,"demandHappiness":4390,"money_24h":35400,"supplies_24h":8000,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"SpaceAgeMars":{"population":6950,"happiness":11290,"demandHappiness":6950,"money_24h":59100,"supplies_24h":12800,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"SpaceAgeAsteroidBelt":{"population":7549,"happiness":12270,"demandHappiness":7549,"money_24h":65500,"supplies_24h":13910,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"SpaceAgeVenus":{"population":8159,"happiness":13260,"demandHappiness":8159,"money_24h":72200,"supplies_24h":15020,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"SpaceAgeJupiterMoon":{"population":8786,"happiness":14280,"demandHappiness":8786,"money_24h":79200,"supplies_24h":16180,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"SpaceAgeTitan":{"population":9425,"happiness":15310,"demandHappiness":9425,"money_24h":86600,"supplies_24h":17360,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"SpaceAgeSpaceHub":{"population":10080,"happiness":16380,"demandHappiness":10080,"money_24h":94300,"supplies_24h":18570,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5}} },
+    "W_MultiAge_CUP22A5": { prod: {"BronzeAge":{"population":157,"happiness":720,"demandHappiness":157,"money_24h":500,"supplies_24h":810,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"IronAge":{"population":336,"happiness":1240,"demandHappiness":336,"money_24h":1300,"supplies_24h":1400,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"EarlyMiddleAge":{"population":516,"happiness":1370,"demandHappiness":516,"money_24h":2200,"supplies_24h":1550,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"HighMiddleAge":{"population":725,"happiness":1530,"demandHappiness":725,"money_24h":3000,"supplies_24h":1720,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"LateMiddleAge":{"population":951,"happiness":1710,"demandHappiness":951,"money_24h":4000,"supplies_24h":1920,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"ColonialAge":{"population":1201,"happiness":2010,"demandHappiness":1201,"money_24h":6100,"supplies_24h":2260,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"IndustrialAge":{"population":1467,"happiness":2270,"demandHappiness":1467,"money_24h":7600,"supplies_24h":2550,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"ProgressiveEra":{"population":1752,"happiness":2490,"demandHappiness":1752,"money_24h":9200,"supplies_24h":2800,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"ModernEra":{"population":2053,"happiness":2660,"demandHappiness":2053,"money_24h":11500,"supplies_24h":3000,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"PostModernEra":{"population":2366,"happiness":2770,"demandHappiness":2366,"money_24h":14400,"supplies_24h":3120,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"ContemporaryEra":{"population":2697,"happiness":3220,"demandHappiness":2697,"money_24h":18800,"supplies_24h":3630,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"TomorrowEra":{"population":3039,"happiness":3910,"demandHappiness":3039,"money_24h":21700,"supplies_24h":4400,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"FutureEra":{"population":3399,"happiness":4690,"demandHappiness":3399,"money_24h":24900,"supplies_24h":5270,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"ArcticFuture":{"population":3770,"happiness":5460,"demandHappiness":3770,"money_24h":28300,"supplies_24h":6140,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"OceanicFuture":{"population":4153,"happiness":6300,"demandHappiness":4153,"money_24h":31900,"supplies_24h":7090,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"VirtualFuture":{"population":4547,"happiness":7530,"demandHappiness":4547,"money_24h":35700,"supplies_24h":8470,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"SpaceAgeMars":{"population":7198,"happiness":12040,"demandHappiness":7198,"money_24h":59700,"supplies_24h":13550,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"SpaceAgeAsteroidBelt":{"population":7818,"happiness":13090,"demandHappiness":7818,"money_24h":66100,"supplies_24h":14720,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"SpaceAgeVenus":{"population":8451,"happiness":14140,"demandHappiness":8451,"money_24h":72800,"supplies_24h":15910,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"SpaceAgeJupiterMoon":{"population":9100,"happiness":15230,"demandHappiness":9100,"money_24h":79900,"supplies_24h":17140,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"SpaceAgeTitan":{"population":9761,"happiness":16340,"demandHappiness":9761,"money_24h":87400,"supplies_24h":18380,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5},"SpaceAgeSpaceHub":{"population":10440,"happiness":17470,"demandHappiness":10440,"money_24h":95200,"supplies_24h":19660,"strategy_points_24h":3,"all_goods_of_age_24h":3.0,"random_good_of_age_24h":7.5}} },
+    "W_MultiAge_CUP22A6": { prod: {"BronzeAge":{"population":162,"happiness":770,"demandHappiness":162,"money_24h":600,"supplies_24h":860,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"IronAge":{"population":348,"happiness":1320,"demandHappiness":348,"money_24h":1300,"supplies_24h":1480,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"EarlyMiddleAge":{"population":534,"happiness":1460,"demandHappiness":534,"money_24h":2200,"supplies_24h":1630,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"HighMiddleAge":{"population":750,"happiness":1630,"demandHappiness":750,"money_24h":3100,"supplies_24h":1820,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"LateMiddleAge":{"population":984,"happiness":1820,"demandHappiness":984,"money_24h":4000,"supplies_24h":2030,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"ColonialAge":{"population":1242,"happiness":2140,"demandHappiness":1242,"money_24h":6100,"supplies_24h":2390,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"IndustrialAge":{"population":1518,"happiness":2410,"demandHappiness":1518,"money_24h":7700,"supplies_24h":2690,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"ProgressiveEra":{"population":1812,"happiness":2640,"demandHappiness":1812,"money_24h":9300,"supplies_24h":2960,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"ModernEra":{"population":2124,"happiness":2830,"demandHappiness":2124,"money_24h":11600,"supplies_24h":3160,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"PostModernEra":{"population":2448,"happiness":2950,"demandHappiness":2448,"money_24h":14500,"supplies_24h":3290,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"ContemporaryEra":{"population":2790,"happiness":3430,"demandHappiness":2790,"money_24h":18900,"supplies_24h":3830,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"TomorrowEra":{"population":3144,"happiness":4160,"demandHappiness":3144,"money_24h":21900,"supplies_24h":4650,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"FutureEra":{"population":3516,"happiness":4980,"demandHappiness":3516,"money_24h":25100,"supplies_24h":5570,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"ArcticFuture":{"population":3900,"happiness":5800,"demandHappiness":3900,"money_24h":28500,"supplies_24h":6480,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"OceanicFuture":{"population":4296,"happiness":6690,"demandHappiness":4296,"money_24h":32200,"supplies_24h":7480,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"VirtualFuture":{"population":4704,"happiness":8000,"demandHappiness":4704,"money_24h":36000,"supplies_24h":8940,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"SpaceAgeMars":{"population":7446,"happiness":12800,"demandHappiness":7446,"money_24h":60200,"supplies_24h":14300,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"SpaceAgeAsteroidBelt":{"population":8088,"happiness":13910,"demandHappiness":8088,"money_24h":66700,"supplies_24h":15540,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"SpaceAgeVenus":{"population":8742,"happiness":15020,"demandHappiness":8742,"money_24h":73500,"supplies_24h":16790,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"SpaceAgeJupiterMoon":{"population":9414,"happiness":16180,"demandHappiness":9414,"money_24h":80700,"supplies_24h":18090,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"SpaceAgeTitan":{"population":10098,"happiness":17360,"demandHappiness":10098,"money_24h":88200,"supplies_24h":19400,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"SpaceAgeSpaceHub":{"population":10800,"happiness":18570,"demandHappiness":10800,"money_24h":96100,"supplies_24h":20750,"strategy_points_24h":5,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0}} },
+    "W_MultiAge_CUP22A7": { prod: {"BronzeAge":{"population":169,"happiness":810,"demandHappiness":169,"money_24h":600,"supplies_24h":950,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"IronAge":{"population":363,"happiness":1400,"demandHappiness":363,"money_24h":1300,"supplies_24h":1630,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"EarlyMiddleAge":{"population":556,"happiness":1550,"demandHappiness":556,"money_24h":2200,"supplies_24h":1800,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"HighMiddleAge":{"population":781,"happiness":1720,"demandHappiness":781,"money_24h":3100,"supplies_24h":2010,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"LateMiddleAge":{"population":1025,"happiness":1920,"demandHappiness":1025,"money_24h":4100,"supplies_24h":2240,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"ColonialAge":{"population":1294,"happiness":2260,"demandHappiness":1294,"money_24h":6200,"supplies_24h":2640,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"IndustrialAge":{"population":1581,"happiness":2550,"demandHappiness":1581,"money_24h":7700,"supplies_24h":2970,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"ProgressiveEra":{"population":1888,"happiness":2800,"demandHappiness":1888,"money_24h":9300,"supplies_24h":3270,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"ModernEra":{"population":2213,"happiness":3000,"demandHappiness":2213,"money_24h":11600,"supplies_24h":3490,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"PostModernEra":{"population":2550,"happiness":3120,"demandHappiness":2550,"money_24h":14600,"supplies_24h":3640,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"ContemporaryEra":{"population":2906,"happiness":3630,"demandHappiness":2906,"money_24h":19000,"supplies_24h":4230,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"TomorrowEra":{"population":3275,"happiness":4400,"demandHappiness":3275,"money_24h":22000,"supplies_24h":5140,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"FutureEra":{"population":3663,"happiness":5270,"demandHappiness":3663,"money_24h":25200,"supplies_24h":6150,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"ArcticFuture":{"population":4063,"happiness":6140,"demandHappiness":4063,"money_24h":28700,"supplies_24h":7170,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"OceanicFuture":{"population":4475,"happiness":7090,"demandHappiness":4475,"money_24h":32300,"supplies_24h":8270,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"VirtualFuture":{"population":4900,"happiness":8470,"demandHappiness":4900,"money_24h":36200,"supplies_24h":9880,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"SpaceAgeMars":{"population":7756,"happiness":13550,"demandHappiness":7756,"money_24h":60500,"supplies_24h":15810,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"SpaceAgeAsteroidBelt":{"population":8425,"happiness":14720,"demandHappiness":8425,"money_24h":67000,"supplies_24h":17180,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"SpaceAgeVenus":{"population":9106,"happiness":15910,"demandHappiness":9106,"money_24h":73800,"supplies_24h":18560,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"SpaceAgeJupiterMoon":{"population":9806,"happiness":17140,"demandHappiness":9806,"money_24h":81100,"supplies_24h":19990,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"SpaceAgeTitan":{"population":10519,"happiness":18380,"demandHappiness":10519,"money_24h":88600,"supplies_24h":21440,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0},"SpaceAgeSpaceHub":{"population":11250,"happiness":19660,"demandHappiness":11250,"money_24h":96500,"supplies_24h":22940,"strategy_points_24h":7,"all_goods_of_age_24h":6.0,"random_good_of_age_24h":10.0}} },
+    "W_MultiAge_CUP22A8": { prod: {"BronzeAge":{"population":176,"happiness":860,"demandHappiness":176,"money_24h":1000,"supplies_24h":1040,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"IronAge":{"population":377,"happiness":1480,"demandHappiness":377,"money_24h":2400,"supplies_24h":1790,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"EarlyMiddleAge":{"population":579,"happiness":1630,"demandHappiness":579,"money_24h":4000,"supplies_24h":1970,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"HighMiddleAge":{"population":813,"happiness":1820,"demandHappiness":813,"money_24h":5600,"supplies_24h":2200,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"LateMiddleAge":{"population":1066,"happiness":2030,"demandHappiness":1066,"money_24h":7400,"supplies_24h":2460,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"ColonialAge":{"population":1346,"happiness":2390,"demandHappiness":1346,"money_24h":11300,"supplies_24h":2890,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"IndustrialAge":{"population":1645,"happiness":2690,"demandHappiness":1645,"money_24h":14000,"supplies_24h":3260,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"ProgressiveEra":{"population":1963,"happiness":2960,"demandHappiness":1963,"money_24h":17000,"supplies_24h":3580,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"ModernEra":{"population":2301,"happiness":3160,"demandHappiness":2301,"money_24h":21200,"supplies_24h":3830,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"PostModernEra":{"population":2652,"happiness":3290,"demandHappiness":2652,"money_24h":26700,"supplies_24h":3990,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"ContemporaryEra":{"population":3023,"happiness":3830,"demandHappiness":3023,"money_24h":34700,"supplies_24h":4630,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"TomorrowEra":{"population":3406,"happiness":4650,"demandHappiness":3406,"money_24h":40200,"supplies_24h":5630,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"FutureEra":{"population":3809,"happiness":5570,"demandHappiness":3809,"money_24h":46100,"supplies_24h":6740,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"ArcticFuture":{"population":4225,"happiness":6480,"demandHappiness":4225,"money_24h":52400,"supplies_24h":7850,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"OceanicFuture":{"population":4654,"happiness":7480,"demandHappiness":4654,"money_24h":59000,"supplies_24h":9060,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"VirtualFuture":{"population":5096,"happiness":8940,"demandHappiness":5096,"money_24h":66100,"supplies_24h":10820,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"SpaceAgeMars":{"population":8067,"happiness":14300,"demandHappiness":8067,"money_24h":110500,"supplies_24h":17310,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"SpaceAgeAsteroidBelt":{"population":8762,"happiness":15540,"demandHappiness":8762,"money_24h":122400,"supplies_24h":18810,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"SpaceAgeVenus":{"population":9471,"happiness":16790,"demandHappiness":9471,"money_24h":134900,"supplies_24h":20330,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"SpaceAgeJupiterMoon":{"population":10199,"happiness":18090,"demandHappiness":10199,"money_24h":148000,"supplies_24h":21900,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"SpaceAgeTitan":{"population":10940,"happiness":19400,"demandHappiness":10940,"money_24h":161800,"supplies_24h":23480,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5},"SpaceAgeSpaceHub":{"population":11700,"happiness":20750,"demandHappiness":11700,"money_24h":176300,"supplies_24h":25120,"strategy_points_24h":11,"all_goods_of_age_24h":9.0,"random_good_of_age_24h":12.5}}, boosts: [{"type":"def_boost_attacker","value":16,"feature":"all"}] },
+    "W_MultiAge_CUP20C1": { prod: {"BronzeAge":{"happiness":130},"IronAge":{"happiness":190},"EarlyMiddleAge":{"happiness":220},"HighMiddleAge":{"happiness":280},"LateMiddleAge":{"happiness":320},"ColonialAge":{"happiness":380},"IndustrialAge":{"happiness":420},"ProgressiveEra":{"happiness":470},"ModernEra":{"happiness":530},"PostModernEra":{"happiness":610},"ContemporaryEra":{"happiness":710},"TomorrowEra":{"happiness":880},"FutureEra":{"happiness":1050},"ArcticFuture":{"happiness":1190},"OceanicFuture":{"happiness":1340},"VirtualFuture":{"happiness":1690},"SpaceAgeMars":{"happiness":2630},"SpaceAgeAsteroidBelt":{"happiness":2860},"SpaceAgeVenus":{"happiness":3090},"SpaceAgeJupiterMoon":{"happiness":3330},"SpaceAgeTitan":{"happiness":3570},"SpaceAgeSpaceHub":{"happiness":3820}} },
+    "W_MultiAge_CUP22B1": { prod: {"BronzeAge":{"happiness":130},"IronAge":{"happiness":190},"EarlyMiddleAge":{"happiness":220},"HighMiddleAge":{"happiness":280},"LateMiddleAge":{"happiness":320},"ColonialAge":{"happiness":380},"IndustrialAge":{"happiness":420},"ProgressiveEra":{"happiness":470},"ModernEra":{"happiness":530},"PostModernEra":{"happiness":610},"ContemporaryEra":{"happiness":710},"TomorrowEra":{"happiness":880},"FutureEra":{"happiness":1050},"ArcticFuture":{"happiness":1190},"OceanicFuture":{"happiness":1340},"VirtualFuture":{"happiness":1690},"SpaceAgeMars":{"happiness":2630},"SpaceAgeAsteroidBelt":{"happiness":2860},"SpaceAgeVenus":{"happiness":3090},"SpaceAgeJupiterMoon":{"happiness":3330},"SpaceAgeTitan":{"happiness":3570},"SpaceAgeSpaceHub":{"happiness":3820}} },
+    "W_MultiAge_CUP23D1": { prod: {"BronzeAge":{"strategy_points_24h":6,"random_good_of_age_24h":12},"IronAge":{"strategy_points_24h":6,"random_good_of_age_24h":12},"EarlyMiddleAge":{"strategy_points_24h":6,"random_good_of_age_24h":12},"HighMiddleAge":{"strategy_points_24h":6,"random_good_of_age_24h":12},"LateMiddleAge":{"strategy_points_24h":6,"random_good_of_age_24h":12},"ColonialAge":{"strategy_points_24h":6,"random_good_of_age_24h":12},"IndustrialAge":{"strategy_points_24h":6,"random_good_of_age_24h":12},"ProgressiveEra":{"strategy_points_24h":6,"random_good_of_age_24h":12},"ModernEra":{"strategy_points_24h":6,"random_good_of_age_24h":12},"PostModernEra":{"strategy_points_24h":6,"random_good_of_age_24h":12},"ContemporaryEra":{"strategy_points_24h":6,"random_good_of_age_24h":12},"TomorrowEra":{"strategy_points_24h":6,"random_good_of_age_24h":12},"FutureEra":{"strategy_points_24h":6,"random_good_of_age_24h":12},"ArcticFuture":{"strategy_points_24h":6,"random_good_of_age_24h":12},"OceanicFuture":{"strategy_points_24h":6,"random_good_of_age_24h":12},"VirtualFuture":{"strategy_points_24h":6,"random_good_of_age_24h":12},"SpaceAgeMars":{"strategy_points_24h":6,"random_good_of_age_24h":12},"SpaceAgeAsteroidBelt":{"strategy_points_24h":6,"random_good_of_age_24h":12},"SpaceAgeVenus":{"strategy_points_24h":6,"random_good_of_age_24h":12},"SpaceAgeJupiterMoon":{"strategy_points_24h":6,"random_good_of_age_24h":12},"SpaceAgeTitan":{"strategy_points_24h":6,"random_good_of_age_24h":12},"SpaceAgeSpaceHub":{"strategy_points_24h":6,"random_good_of_age_24h":12}}, boosts: [{"type":"att_boost_attacker","value":9,"feature":"all"},{"type":"att_boost_defender","value":9,"feature":"all"},{"type":"def_boost_defender","value":9,"feature":"all"}] },
+    "W_MultiAge_CUP23A10b": { prod: {"BronzeAge":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":20,"strategy_points_24h":22.0},"IronAge":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":20,"strategy_points_24h":22.0},"EarlyMiddleAge":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":21,"strategy_points_24h":22.0},"HighMiddleAge":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":21,"strategy_points_24h":22.0},"LateMiddleAge":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":22,"strategy_points_24h":22.0},"ColonialAge":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":22,"strategy_points_24h":22.0},"IndustrialAge":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":23,"strategy_points_24h":22.0},"ProgressiveEra":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":23,"strategy_points_24h":22.0},"ModernEra":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":24,"strategy_points_24h":22.0},"PostModernEra":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":24,"strategy_points_24h":22.0},"ContemporaryEra":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":25,"strategy_points_24h":22.0},"TomorrowEra":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":25,"strategy_points_24h":22.0},"FutureEra":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":26,"strategy_points_24h":22.0},"ArcticFuture":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":26,"strategy_points_24h":22.0},"OceanicFuture":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":27,"strategy_points_24h":22.0},"VirtualFuture":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":27,"strategy_points_24h":22.0},"SpaceAgeMars":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":28,"strategy_points_24h":22.0},"SpaceAgeAsteroidBelt":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":28,"strategy_points_24h":22.0},"SpaceAgeVenus":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":29,"strategy_points_24h":22.0},"SpaceAgeJupiterMoon":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":29,"strategy_points_24h":22.0},"SpaceAgeTitan":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":30,"strategy_points_24h":22.0},"SpaceAgeSpaceHub":{"all_goods_of_age_24h":30,"random_good_of_previous_age_24h":30,"strategy_points_24h":22.0}}, boosts: [{"type":"att_boost_attacker","value":19,"feature":"all"},{"type":"def_boost_attacker","value":34,"feature":"all"},{"type":"def_boost_defender","value":39,"feature":"all"}] },
+    "W_MultiAge_CUP23A1": { prod: {"BronzeAge":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"IronAge":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"EarlyMiddleAge":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"HighMiddleAge":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"LateMiddleAge":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"ColonialAge":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"IndustrialAge":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"ProgressiveEra":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"ModernEra":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"PostModernEra":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"ContemporaryEra":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"TomorrowEra":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"FutureEra":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"ArcticFuture":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"OceanicFuture":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"VirtualFuture":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"SpaceAgeMars":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"SpaceAgeAsteroidBelt":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"SpaceAgeVenus":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"SpaceAgeJupiterMoon":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"SpaceAgeTitan":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5},"SpaceAgeSpaceHub":{"all_goods_of_age_24h":5,"strategy_points_24h":0.5}} },
+    "W_MultiAge_CUP23A2": { prod: {"BronzeAge":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"IronAge":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"EarlyMiddleAge":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"HighMiddleAge":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"LateMiddleAge":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"ColonialAge":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"IndustrialAge":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"ProgressiveEra":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"ModernEra":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"PostModernEra":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"ContemporaryEra":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"TomorrowEra":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"FutureEra":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"ArcticFuture":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"OceanicFuture":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"VirtualFuture":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"SpaceAgeMars":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"SpaceAgeAsteroidBelt":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"SpaceAgeVenus":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"SpaceAgeJupiterMoon":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"SpaceAgeTitan":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0},"SpaceAgeSpaceHub":{"all_goods_of_age_24h":5,"strategy_points_24h":1.0}} },
+    "W_MultiAge_CUP23A3": { prod: {"BronzeAge":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"IronAge":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"EarlyMiddleAge":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"HighMiddleAge":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"LateMiddleAge":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"ColonialAge":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"IndustrialAge":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"ProgressiveEra":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"ModernEra":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"PostModernEra":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"ContemporaryEra":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"TomorrowEra":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"FutureEra":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"ArcticFuture":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"OceanicFuture":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"VirtualFuture":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"SpaceAgeMars":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"SpaceAgeAsteroidBelt":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"SpaceAgeVenus":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"SpaceAgeJupiterMoon":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"SpaceAgeTitan":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5},"SpaceAgeSpaceHub":{"all_goods_of_age_24h":10,"strategy_points_24h":1.5}} },
+    "W_MultiAge_CUP23A4": { prod: {"BronzeAge":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"IronAge":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"EarlyMiddleAge":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"HighMiddleAge":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"LateMiddleAge":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"ColonialAge":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"IndustrialAge":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"ProgressiveEra":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"ModernEra":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"PostModernEra":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"ContemporaryEra":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"TomorrowEra":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"FutureEra":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"ArcticFuture":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"OceanicFuture":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"VirtualFuture":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"SpaceAgeMars":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"SpaceAgeAsteroidBelt":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"SpaceAgeVenus":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"SpaceAgeJupiterMoon":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"SpaceAgeTitan":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0},"SpaceAgeSpaceHub":{"all_goods_of_age_24h":10,"strategy_points_24h":2.0}}, boosts: [{"type":"def_boost_attacker","value":1,"feature":"all"}] },
+    "W_MultiAge_CUP23A5": { prod: {"BronzeAge":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"IronAge":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"EarlyMiddleAge":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"HighMiddleAge":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"LateMiddleAge":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"ColonialAge":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"IndustrialAge":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"ProgressiveEra":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"ModernEra":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"PostModernEra":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"ContemporaryEra":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"TomorrowEra":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"FutureEra":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"ArcticFuture":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"OceanicFuture":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"VirtualFuture":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"SpaceAgeMars":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"SpaceAgeAsteroidBelt":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"SpaceAgeVenus":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"SpaceAgeJupiterMoon":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"SpaceAgeTitan":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5},"SpaceAgeSpaceHub":{"all_goods_of_age_24h":15,"strategy_points_24h":2.5}}, boosts: [{"type":"def_boost_attacker","value":1,"feature":"all"}] },
+    "W_MultiAge_CUP23A6": { prod: {"BronzeAge":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"IronAge":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"EarlyMiddleAge":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"HighMiddleAge":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"LateMiddleAge":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"ColonialAge":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"IndustrialAge":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"ProgressiveEra":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"ModernEra":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"PostModernEra":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"ContemporaryEra":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"TomorrowEra":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"FutureEra":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"ArcticFuture":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"OceanicFuture":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"VirtualFuture":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"SpaceAgeMars":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"SpaceAgeAsteroidBelt":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"SpaceAgeVenus":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"SpaceAgeJupiterMoon":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"SpaceAgeTitan":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0},"SpaceAgeSpaceHub":{"all_goods_of_age_24h":15,"strategy_points_24h":3.0}}, boosts: [{"type":"def_boost_attacker","value":2,"feature":"all"}] },
+    "W_MultiAge_CUP23A7": { prod: {"BronzeAge":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"IronAge":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"EarlyMiddleAge":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"HighMiddleAge":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"LateMiddleAge":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"ColonialAge":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"IndustrialAge":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"ProgressiveEra":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"ModernEra":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"PostModernEra":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"ContemporaryEra":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"TomorrowEra":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"FutureEra":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"ArcticFuture":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"OceanicFuture":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"VirtualFuture":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"SpaceAgeMars":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"SpaceAgeAsteroidBelt":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"SpaceAgeVenus":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"SpaceAgeJupiterMoon":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"SpaceAgeTitan":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5},"SpaceAgeSpaceHub":{"all_goods_of_age_24h":20,"strategy_points_24h":3.5}}, boosts: [{"type":"def_boost_attacker","value":5,"feature":"all"},{"type":"def_boost_defender","value":5,"feature":"all"}] },
+    "W_MultiAge_CUP23A8": { prod: {"BronzeAge":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"IronAge":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"EarlyMiddleAge":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"HighMiddleAge":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"LateMiddleAge":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"ColonialAge":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"IndustrialAge":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"ProgressiveEra":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"ModernEra":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"PostModernEra":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"ContemporaryEra":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"TomorrowEra":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"FutureEra":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"ArcticFuture":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"OceanicFuture":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"VirtualFuture":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"SpaceAgeMars":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"SpaceAgeAsteroidBelt":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"SpaceAgeVenus":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"SpaceAgeJupiterMoon":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"SpaceAgeTitan":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5},"SpaceAgeSpaceHub":{"all_goods_of_age_24h":25,"strategy_points_24h":7.5}}, boosts: [{"type":"def_boost_attacker","value":10,"feature":"all"},{"type":"def_boost_defender","value":10,"feature":"all"}] },
+    "W_MultiAge_CUP23A9": { prod: {"BronzeAge":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"IronAge":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"EarlyMiddleAge":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"HighMiddleAge":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"LateMiddleAge":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"ColonialAge":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"IndustrialAge":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"ProgressiveEra":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"ModernEra":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"PostModernEra":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"ContemporaryEra":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"TomorrowEra":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"FutureEra":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"ArcticFuture":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"OceanicFuture":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"VirtualFuture":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"SpaceAgeMars":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"SpaceAgeAsteroidBelt":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"SpaceAgeVenus":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"SpaceAgeJupiterMoon":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"SpaceAgeTitan":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0},"SpaceAgeSpaceHub":{"all_goods_of_age_24h":30,"strategy_points_24h":15.0}}, boosts: [{"type":"def_boost_attacker","value":20,"feature":"all"},{"type":"def_boost_defender","value":20,"feature":"all"}] },
+    "W_MultiAge_CUP23A10a": { prod: {"BronzeAge":{"all_goods_of_age_24h":30,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"strategy_points_24h":20.0},"IronAge":{"all_goods_of_age_24h":30,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"strategy_points_24h":20.0},"EarlyMiddleAge":{"all_goods_of_age_24h":30,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"strategy_points_24h":20.0},"HighMiddleAge":{"all_goods_of_age_24h":30,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":10,"strategy_points_24h":20.0},"LateMiddleAge":{"all_goods_of_age_24h":30,"random_good_of_age_24h":11,"random_good_of_previous_age_24h":11,"strategy_points_24h":20.0},"ColonialAge":{"all_goods_of_age_24h":30,"random_good_of_age_24h":11,"random_good_of_previous_age_24h":11,"strategy_points_24h":20.0},"IndustrialAge":{"all_goods_of_age_24h":30,"random_good_of_age_24h":11,"random_good_of_previous_age_24h":11,"strategy_points_24h":20.0},"ProgressiveEra":{"all_goods_of_age_24h":30,"random_good_of_age_24h":11,"random_good_of_previous_age_24h":11,"strategy_points_24h":20.0},"ModernEra":{"all_goods_of_age_24h":30,"random_good_of_age_24h":12,"random_good_of_previous_age_24h":12,"strategy_points_24h":20.0},"PostModernEra":{"all_goods_of_age_24h":30,"random_good_of_age_24h":12,"random_good_of_previous_age_24h":12,"strategy_points_24h":20.0},"ContemporaryEra":{"all_goods_of_age_24h":30,"random_good_of_age_24h":12,"random_good_of_previous_age_24h":12,"strategy_points_24h":20.0},"TomorrowEra":{"all_goods_of_age_24h":30,"random_good_of_age_24h":12,"random_good_of_previous_age_24h":12,"strategy_points_24h":20.0},"FutureEra":{"all_goods_of_age_24h":30,"random_good_of_age_24h":13,"random_good_of_previous_age_24h":13,"strategy_points_24h":20.0},"ArcticFuture":{"all_goods_of_age_24h":30,"random_good_of_age_24h":13,"random_good_of_previous_age_24h":13,"strategy_points_24h":20.0},"OceanicFuture":{"all_goods_of_age_24h":30,"random_good_of_age_24h":13,"random_good_of_previous_age_24h":13,"strategy_points_24h":20.0},"VirtualFuture":{"all_goods_of_age_24h":30,"random_good_of_age_24h":13,"random_good_of_previous_age_24h":13,"strategy_points_24h":20.0},"SpaceAgeMars":{"all_goods_of_age_24h":30,"random_good_of_age_24h":14,"random_good_of_previous_age_24h":14,"strategy_points_24h":20.0},"SpaceAgeAsteroidBelt":{"all_goods_of_age_24h":30,"random_good_of_age_24h":14,"random_good_of_previous_age_24h":14,"strategy_points_24h":20.0},"SpaceAgeVenus":{"all_goods_of_age_24h":30,"random_good_of_age_24h":14,"random_good_of_previous_age_24h":14,"strategy_points_24h":20.0},"SpaceAgeJupiterMoon":{"all_goods_of_age_24h":30,"random_good_of_age_24h":14,"random_good_of_previous_age_24h":14,"strategy_points_24h":20.0},"SpaceAgeTitan":{"all_goods_of_age_24h":30,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"strategy_points_24h":20.0},"SpaceAgeSpaceHub":{"all_goods_of_age_24h":30,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":15,"strategy_points_24h":20.0}}, boosts: [{"type":"att_boost_attacker","value":14,"feature":"all"},{"type":"def_boost_attacker","value":34,"feature":"all"},{"type":"att_boost_defender","value":15,"feature":"all"},{"type":"def_boost_defender","value":39,"feature":"all"}] },
+    "W_MultiAge_CUP23A10c": { prod: {"BronzeAge":{"all_goods_of_age_24h":30,"random_good_of_age_24h":20,"strategy_points_24h":24.0},"IronAge":{"all_goods_of_age_24h":30,"random_good_of_age_24h":20,"strategy_points_24h":24.0},"EarlyMiddleAge":{"all_goods_of_age_24h":30,"random_good_of_age_24h":21,"strategy_points_24h":24.0},"HighMiddleAge":{"all_goods_of_age_24h":30,"random_good_of_age_24h":21,"strategy_points_24h":24.0},"LateMiddleAge":{"all_goods_of_age_24h":30,"random_good_of_age_24h":22,"strategy_points_24h":24.0},"ColonialAge":{"all_goods_of_age_24h":30,"random_good_of_age_24h":22,"strategy_points_24h":24.0},"IndustrialAge":{"all_goods_of_age_24h":30,"random_good_of_age_24h":23,"strategy_points_24h":24.0},"ProgressiveEra":{"all_goods_of_age_24h":30,"random_good_of_age_24h":23,"strategy_points_24h":24.0},"ModernEra":{"all_goods_of_age_24h":30,"random_good_of_age_24h":24,"strategy_points_24h":24.0},"PostModernEra":{"all_goods_of_age_24h":30,"random_good_of_age_24h":24,"strategy_points_24h":24.0},"ContemporaryEra":{"all_goods_of_age_24h":30,"random_good_of_age_24h":25,"strategy_points_24h":24.0},"TomorrowEra":{"all_goods_of_age_24h":30,"random_good_of_age_24h":25,"strategy_points_24h":24.0},"FutureEra":{"all_goods_of_age_24h":30,"random_good_of_age_24h":26,"strategy_points_24h":24.0},"ArcticFuture":{"all_goods_of_age_24h":30,"random_good_of_age_24h":26,"strategy_points_24h":24.0},"OceanicFuture":{"all_goods_of_age_24h":30,"random_good_of_age_24h":27,"strategy_points_24h":24.0},"VirtualFuture":{"all_goods_of_age_24h":30,"random_good_of_age_24h":27,"strategy_points_24h":24.0},"SpaceAgeMars":{"all_goods_of_age_24h":30,"random_good_of_age_24h":28,"strategy_points_24h":24.0},"SpaceAgeAsteroidBelt":{"all_goods_of_age_24h":30,"random_good_of_age_24h":28,"strategy_points_24h":24.0},"SpaceAgeVenus":{"all_goods_of_age_24h":30,"random_good_of_age_24h":29,"strategy_points_24h":24.0},"SpaceAgeJupiterMoon":{"all_goods_of_age_24h":30,"random_good_of_age_24h":29,"strategy_points_24h":24.0},"SpaceAgeTitan":{"all_goods_of_age_24h":30,"random_good_of_age_24h":30,"strategy_points_24h":24.0},"SpaceAgeSpaceHub":{"all_goods_of_age_24h":30,"random_good_of_age_24h":30,"strategy_points_24h":24.0}}, boosts: [{"type":"def_boost_attacker","value":34,"feature":"all"},{"type":"att_boost_defender","value":17,"feature":"all"},{"type":"def_boost_defender","value":39,"feature":"all"}] },
+};
@@ -0,0 +1,46 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 42 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_GBG25H1": { prod: {"BronzeAge":{"strategy_points_24h":8,"random_good_of_age_24h":16},"IronAge":{"strategy_points_24h":8,"random_good_of_age_24h":16},"EarlyMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":16},"HighMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":16},"LateMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":16},"ColonialAge":{"strategy_points_24h":8,"random_good_of_age_24h":16},"IndustrialAge":{"strategy_points_24h":9,"random_good_of_age_24h":17},"ProgressiveEra":{"strategy_points_24h":9,"random_good_of_age_24h":17},"ModernEra":{"strategy_points_24h":9,"random_good_of_age_24h":17},"PostModernEra":{"strategy_points_24h":9,"random_good_of_age_24h":17},"ContemporaryEra":{"strategy_points_24h":9,"random_good_of_age_24h":17},"TomorrowEra":{"strategy_points_24h":9,"random_good_of_age_24h":17},"FutureEra":{"strategy_points_24h":9,"random_good_of_age_24h":17},"ArcticFuture":{"strategy_points_24h":9,"random_good_of_age_24h":17},"OceanicFuture":{"strategy_points_24h":10,"random_good_of_age_24h":18},"VirtualFuture":{"strategy_points_24h":10,"random_good_of_age_24h":18},"SpaceAgeMars":{"strategy_points_24h":10,"random_good_of_age_24h":18},"SpaceAgeAsteroidBelt":{"strategy_points_24h":10,"random_good_of_age_24h":18},"SpaceAgeVenus":{"strategy_points_24h":10,"random_good_of_age_24h":18},"SpaceAgeJupiterMoon":{"strategy_points_24h":10,"random_good_of_age_24h":18},"SpaceAgeTitan":{"strategy_points_24h":10,"random_good_of_age_24h":18},"SpaceAgeSpaceHub":{"strategy_points_24h":10,"random_good_of_age_24h":18}}, boosts: [{"type":"att_def_boost_attacker_defender","value":18,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":24,"feature":"guild_expedition"},{"type":"att_boost_attacker","value":24,"feature":"battleground"}] },
+    "W_MultiAge_GBG25H2": { prod: {"BronzeAge":{"strategy_points_24h":12,"random_good_of_age_24h":24},"IronAge":{"strategy_points_24h":12,"random_good_of_age_24h":24},"EarlyMiddleAge":{"strategy_points_24h":12,"random_good_of_age_24h":24},"HighMiddleAge":{"strategy_points_24h":12,"random_good_of_age_24h":24},"LateMiddleAge":{"strategy_points_24h":13,"random_good_of_age_24h":25},"ColonialAge":{"strategy_points_24h":13,"random_good_of_age_24h":25},"IndustrialAge":{"strategy_points_24h":13,"random_good_of_age_24h":25},"ProgressiveEra":{"strategy_points_24h":13,"random_good_of_age_24h":25},"ModernEra":{"strategy_points_24h":13,"random_good_of_age_24h":25},"PostModernEra":{"strategy_points_24h":13,"random_good_of_age_24h":25},"ContemporaryEra":{"strategy_points_24h":14,"random_good_of_age_24h":26},"TomorrowEra":{"strategy_points_24h":14,"random_good_of_age_24h":26},"FutureEra":{"strategy_points_24h":14,"random_good_of_age_24h":26},"ArcticFuture":{"strategy_points_24h":14,"random_good_of_age_24h":26},"OceanicFuture":{"strategy_points_24h":14,"random_good_of_age_24h":26},"VirtualFuture":{"strategy_points_24h":15,"random_good_of_age_24h":27},"SpaceAgeMars":{"strategy_points_24h":15,"random_good_of_age_24h":27},"SpaceAgeAsteroidBelt":{"strategy_points_24h":15,"random_good_of_age_24h":27},"SpaceAgeVenus":{"strategy_points_24h":15,"random_good_of_age_24h":27},"SpaceAgeJupiterMoon":{"strategy_points_24h":15,"random_good_of_age_24h":27},"SpaceAgeTitan":{"strategy_points_24h":15,"random_good_of_age_24h":27},"SpaceAgeSpaceHub":{"strategy_points_24h":16,"random_good_of_age_24h":28}}, boosts: [{"type":"att_def_boost_attacker_defender","value":30,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":32,"feature":"guild_expedition"},{"type":"att_boost_attacker","value":36,"feature":"battleground"}] },
+    "W_MultiAge_GBG25G1": { prod: {"BronzeAge":{"strategy_points_24h":64},"IronAge":{"strategy_points_24h":64},"EarlyMiddleAge":{"strategy_points_24h":65},"HighMiddleAge":{"strategy_points_24h":66},"LateMiddleAge":{"strategy_points_24h":67},"ColonialAge":{"strategy_points_24h":68},"IndustrialAge":{"strategy_points_24h":69},"ProgressiveEra":{"strategy_points_24h":70},"ModernEra":{"strategy_points_24h":71},"PostModernEra":{"strategy_points_24h":72},"ContemporaryEra":{"strategy_points_24h":73},"TomorrowEra":{"strategy_points_24h":74},"FutureEra":{"strategy_points_24h":75},"ArcticFuture":{"strategy_points_24h":76},"OceanicFuture":{"strategy_points_24h":76},"VirtualFuture":{"strategy_points_24h":77},"SpaceAgeMars":{"strategy_points_24h":78},"SpaceAgeAsteroidBelt":{"strategy_points_24h":79},"SpaceAgeVenus":{"strategy_points_24h":80},"SpaceAgeJupiterMoon":{"strategy_points_24h":81},"SpaceAgeTitan":{"strategy_points_24h":82},"SpaceAgeSpaceHub":{"strategy_points_24h":83}}, boosts: [{"type":"att_def_boost_attacker_defender","value":100,"feature":"all"},{"type":"att_boost_attacker","value":160,"feature":"all"},{"type":"att_boost_defender","value":160,"feature":"all"},{"type":"guild_raids_action_points_capacity","value":8000,"feature":"all"}] },
+    "W_MultiAge_GBG25G2": { prod: {"BronzeAge":{"strategy_points_24h":96},"IronAge":{"strategy_points_24h":96},"EarlyMiddleAge":{"strategy_points_24h":97},"HighMiddleAge":{"strategy_points_24h":99},"LateMiddleAge":{"strategy_points_24h":100},"ColonialAge":{"strategy_points_24h":102},"IndustrialAge":{"strategy_points_24h":103},"ProgressiveEra":{"strategy_points_24h":105},"ModernEra":{"strategy_points_24h":106},"PostModernEra":{"strategy_points_24h":108},"ContemporaryEra":{"strategy_points_24h":109},"TomorrowEra":{"strategy_points_24h":110},"FutureEra":{"strategy_points_24h":112},"ArcticFuture":{"strategy_points_24h":113},"OceanicFuture":{"strategy_points_24h":115},"VirtualFuture":{"strategy_points_24h":116},"SpaceAgeMars":{"strategy_points_24h":118},"SpaceAgeAsteroidBelt":{"strategy_points_24h":119},"SpaceAgeVenus":{"strategy_points_24h":120},"SpaceAgeJupiterMoon":{"strategy_points_24h":122},"SpaceAgeTitan":{"strategy_points_24h":123},"SpaceAgeSpaceHub":{"strategy_points_24h":125}}, boosts: [{"type":"att_def_boost_attacker_defender","value":140,"feature":"all"},{"type":"att_boost_attacker","value":224,"feature":"all"},{"type":"att_boost_defender","value":224,"feature":"all"},{"type":"guild_raids_action_points_capacity","value":16000,"feature":"all"}] },
+    "W_MultiAge_GBGWatchtower2023C1": { prod: {"AllAge":{"strategy_points_24h":18}}, boosts: [{"type":"att_def_boost_attacker","value":24,"feature":"battleground"},{"type":"att_def_boost_attacker","value":16,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":24,"feature":"battleground"},{"type":"att_def_boost_defender","value":16,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBGWatchtower2023C2": { prod: {"AllAge":{"strategy_points_24h":40}}, boosts: [{"type":"att_def_boost_attacker","value":36,"feature":"battleground"},{"type":"att_def_boost_attacker","value":32,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":36,"feature":"battleground"},{"type":"att_def_boost_defender","value":32,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBGWatchtower2023A": { prod: {"BronzeAge":{"strategy_points_24h":18},"IronAge":{"strategy_points_24h":18},"EarlyMiddleAge":{"strategy_points_24h":18},"HighMiddleAge":{"strategy_points_24h":18},"LateMiddleAge":{"strategy_points_24h":18},"ColonialAge":{"strategy_points_24h":18},"IndustrialAge":{"strategy_points_24h":18},"ProgressiveEra":{"strategy_points_24h":18},"ModernEra":{"strategy_points_24h":18},"PostModernEra":{"strategy_points_24h":18},"ContemporaryEra":{"strategy_points_24h":18},"TomorrowEra":{"strategy_points_24h":18},"FutureEra":{"strategy_points_24h":18},"ArcticFuture":{"strategy_points_24h":18},"OceanicFuture":{"strategy_points_24h":18},"VirtualFuture":{"strategy_points_24h":18},"SpaceAgeMars":{"strategy_points_24h":18},"SpaceAgeAsteroidBelt":{"strategy_points_24h":18},"SpaceAgeVenus":{"strategy_points_24h":18},"SpaceAgeJupiterMoon":{"strategy_points_24h":18},"SpaceAgeTitan":{"strategy_points_24h":18},"SpaceAgeSpaceHub":{"strategy_points_24h":18}}, boosts: [{"type":"att_def_boost_attacker","value":12,"feature":"battleground"},{"type":"att_def_boost_attacker","value":36,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":12,"feature":"battleground"},{"type":"att_def_boost_defender","value":36,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBGWatchtower2023B": { prod: {"BronzeAge":{"strategy_points_24h":40},"IronAge":{"strategy_points_24h":40},"EarlyMiddleAge":{"strategy_points_24h":40},"HighMiddleAge":{"strategy_points_24h":40},"LateMiddleAge":{"strategy_points_24h":40},"ColonialAge":{"strategy_points_24h":40},"IndustrialAge":{"strategy_points_24h":40},"ProgressiveEra":{"strategy_points_24h":40},"ModernEra":{"strategy_points_24h":40},"PostModernEra":{"strategy_points_24h":40},"ContemporaryEra":{"strategy_points_24h":40},"TomorrowEra":{"strategy_points_24h":40},"FutureEra":{"strategy_points_24h":40},"ArcticFuture":{"strategy_points_24h":40},"OceanicFuture":{"strategy_points_24h":40},"VirtualFuture":{"strategy_points_24h":40},"SpaceAgeMars":{"strategy_points_24h":40},"SpaceAgeAsteroidBelt":{"strategy_points_24h":40},"SpaceAgeVenus":{"strategy_points_24h":40},"SpaceAgeJupiterMoon":{"strategy_points_24h":40},"SpaceAgeTitan":{"strategy_points_24h":40},"SpaceAgeSpaceHub":{"strategy_points_24h":40}}, boosts: [{"type":"att_def_boost_attacker","value":23,"feature":"battleground"},{"type":"att_def_boost_attacker","value":55,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":23,"feature":"battleground"},{"type":"att_def_boost_defender","value":55,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG25C1": { prod: {"BronzeAge":{"strategy_points_24h":100},"IronAge":{"strategy_points_24h":100},"EarlyMiddleAge":{"strategy_points_24h":102},"HighMiddleAge":{"strategy_points_24h":103},"LateMiddleAge":{"strategy_points_24h":105},"ColonialAge":{"strategy_points_24h":106},"IndustrialAge":{"strategy_points_24h":108},"ProgressiveEra":{"strategy_points_24h":109},"ModernEra":{"strategy_points_24h":111},"PostModernEra":{"strategy_points_24h":112},"ContemporaryEra":{"strategy_points_24h":114},"TomorrowEra":{"strategy_points_24h":115},"FutureEra":{"strategy_points_24h":117},"ArcticFuture":{"strategy_points_24h":118},"OceanicFuture":{"strategy_points_24h":120},"VirtualFuture":{"strategy_points_24h":121},"SpaceAgeMars":{"strategy_points_24h":123},"SpaceAgeAsteroidBelt":{"strategy_points_24h":124},"SpaceAgeVenus":{"strategy_points_24h":126},"SpaceAgeJupiterMoon":{"strategy_points_24h":127},"SpaceAgeTitan":{"strategy_points_24h":129},"SpaceAgeSpaceHub":{"strategy_points_24h":130}}, boosts: [{"type":"att_def_boost_attacker_defender","value":94,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":150,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG25C2": { prod: {"BronzeAge":{"strategy_points_24h":150},"IronAge":{"strategy_points_24h":150},"EarlyMiddleAge":{"strategy_points_24h":152},"HighMiddleAge":{"strategy_points_24h":155},"LateMiddleAge":{"strategy_points_24h":157},"ColonialAge":{"strategy_points_24h":159},"IndustrialAge":{"strategy_points_24h":161},"ProgressiveEra":{"strategy_points_24h":164},"ModernEra":{"strategy_points_24h":166},"PostModernEra":{"strategy_points_24h":168},"ContemporaryEra":{"strategy_points_24h":170},"TomorrowEra":{"strategy_points_24h":173},"FutureEra":{"strategy_points_24h":175},"ArcticFuture":{"strategy_points_24h":177},"OceanicFuture":{"strategy_points_24h":179},"VirtualFuture":{"strategy_points_24h":182},"SpaceAgeMars":{"strategy_points_24h":184},"SpaceAgeAsteroidBelt":{"strategy_points_24h":186},"SpaceAgeVenus":{"strategy_points_24h":188},"SpaceAgeJupiterMoon":{"strategy_points_24h":191},"SpaceAgeTitan":{"strategy_points_24h":193},"SpaceAgeSpaceHub":{"strategy_points_24h":195}}, boosts: [{"type":"att_def_boost_attacker_defender","value":125,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":200,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG25D1": { prod: {"BronzeAge":{"random_good_of_previous_age_24h":64},"IronAge":{"random_good_of_previous_age_24h":64},"EarlyMiddleAge":{"random_good_of_previous_age_24h":64},"HighMiddleAge":{"random_good_of_previous_age_24h":64},"LateMiddleAge":{"random_good_of_previous_age_24h":65},"ColonialAge":{"random_good_of_previous_age_24h":65},"IndustrialAge":{"random_good_of_previous_age_24h":65},"ProgressiveEra":{"random_good_of_previous_age_24h":65},"ModernEra":{"random_good_of_previous_age_24h":66},"PostModernEra":{"random_good_of_previous_age_24h":66},"ContemporaryEra":{"random_good_of_previous_age_24h":66},"TomorrowEra":{"random_good_of_previous_age_24h":66},"FutureEra":{"random_good_of_previous_age_24h":67},"ArcticFuture":{"random_good_of_previous_age_24h":67},"OceanicFuture":{"random_good_of_previous_age_24h":67},"VirtualFuture":{"random_good_of_previous_age_24h":67},"SpaceAgeMars":{"random_good_of_previous_age_24h":68},"SpaceAgeAsteroidBelt":{"random_good_of_previous_age_24h":68},"SpaceAgeVenus":{"random_good_of_previous_age_24h":68},"SpaceAgeJupiterMoon":{"random_good_of_previous_age_24h":68},"SpaceAgeTitan":{"random_good_of_previous_age_24h":69},"SpaceAgeSpaceHub":{"random_good_of_previous_age_24h":69}}, boosts: [{"type":"att_def_boost_attacker_defender","value":25,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":40,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG25D2": { prod: {"BronzeAge":{"random_good_of_previous_age_24h":96},"IronAge":{"random_good_of_previous_age_24h":96},"EarlyMiddleAge":{"random_good_of_previous_age_24h":96},"HighMiddleAge":{"random_good_of_previous_age_24h":97},"LateMiddleAge":{"random_good_of_previous_age_24h":97},"ColonialAge":{"random_good_of_previous_age_24h":97},"IndustrialAge":{"random_good_of_previous_age_24h":98},"ProgressiveEra":{"random_good_of_previous_age_24h":98},"ModernEra":{"random_good_of_previous_age_24h":99},"PostModernEra":{"random_good_of_previous_age_24h":99},"ContemporaryEra":{"random_good_of_previous_age_24h":99},"TomorrowEra":{"random_good_of_previous_age_24h":100},"FutureEra":{"random_good_of_previous_age_24h":100},"ArcticFuture":{"random_good_of_previous_age_24h":100},"OceanicFuture":{"random_good_of_previous_age_24h":101},"VirtualFuture":{"random_good_of_previous_age_24h":101},"SpaceAgeMars":{"random_good_of_previous_age_24h":101},"SpaceAgeAsteroidBelt":{"random_good_of_previous_age_24h":102},"SpaceAgeVenus":{"random_good_of_previous_age_24h":102},"SpaceAgeJupiterMoon":{"random_good_of_previous_age_24h":102},"SpaceAgeTitan":{"random_good_of_previous_age_24h":103},"SpaceAgeSpaceHub":{"random_good_of_previous_age_24h":103}}, boosts: [{"type":"att_def_boost_attacker_defender","value":35,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":56,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG24F1": { prod: {"BronzeAge":{"strategy_points_24h":15,"random_good_of_age_24h":96},"IronAge":{"strategy_points_24h":15,"random_good_of_age_24h":96},"EarlyMiddleAge":{"strategy_points_24h":15,"random_good_of_age_24h":97},"HighMiddleAge":{"strategy_points_24h":15,"random_good_of_age_24h":97},"LateMiddleAge":{"strategy_points_24h":15,"random_good_of_age_24h":98},"ColonialAge":{"strategy_points_24h":15,"random_good_of_age_24h":99},"IndustrialAge":{"strategy_points_24h":15,"random_good_of_age_24h":100},"ProgressiveEra":{"strategy_points_24h":15,"random_good_of_age_24h":100},"ModernEra":{"strategy_points_24h":15,"random_good_of_age_24h":101},"PostModernEra":{"strategy_points_24h":15,"random_good_of_age_24h":102},"ContemporaryEra":{"strategy_points_24h":15,"random_good_of_age_24h":102},"TomorrowEra":{"strategy_points_24h":15,"random_good_of_age_24h":103},"FutureEra":{"strategy_points_24h":15,"random_good_of_age_24h":104},"ArcticFuture":{"strategy_points_24h":15,"random_good_of_age_24h":105},"OceanicFuture":{"strategy_points_24h":15,"random_good_of_age_24h":105},"VirtualFuture":{"strategy_points_24h":15,"random_good_of_age_24h":106},"SpaceAgeMars":{"strategy_points_24h":15,"random_good_of_age_24h":107},"SpaceAgeAsteroidBelt":{"strategy_points_24h":15,"random_good_of_age_24h":108},"SpaceAgeVenus":{"strategy_points_24h":15,"random_good_of_age_24h":108},"SpaceAgeJupiterMoon":{"strategy_points_24h":15,"random_good_of_age_24h":109},"SpaceAgeTitan":{"strategy_points_24h":15,"random_good_of_age_24h":110},"SpaceAgeSpaceHub":{"strategy_points_24h":15,"random_good_of_age_24h":111}}, boosts: [{"type":"att_def_boost_attacker","value":20,"feature":"all"},{"type":"att_def_boost_defender","value":20,"feature":"all"}] },
+    "W_MultiAge_GBG24F2": { prod: {"BronzeAge":{"strategy_points_24h":25,"random_good_of_age_24h":128},"IronAge":{"strategy_points_24h":25,"random_good_of_age_24h":128},"EarlyMiddleAge":{"strategy_points_24h":25,"random_good_of_age_24h":129},"HighMiddleAge":{"strategy_points_24h":25,"random_good_of_age_24h":130},"LateMiddleAge":{"strategy_points_24h":25,"random_good_of_age_24h":131},"ColonialAge":{"strategy_points_24h":25,"random_good_of_age_24h":132},"IndustrialAge":{"strategy_points_24h":25,"random_good_of_age_24h":133},"ProgressiveEra":{"strategy_points_24h":25,"random_good_of_age_24h":134},"ModernEra":{"strategy_points_24h":25,"random_good_of_age_24h":135},"PostModernEra":{"strategy_points_24h":25,"random_good_of_age_24h":136},"ContemporaryEra":{"strategy_points_24h":25,"random_good_of_age_24h":137},"TomorrowEra":{"strategy_points_24h":25,"random_good_of_age_24h":138},"FutureEra":{"strategy_points_24h":25,"random_good_of_age_24h":139},"ArcticFuture":{"strategy_points_24h":25,"random_good_of_age_24h":140},"OceanicFuture":{"strategy_points_24h":25,"random_good_of_age_24h":140},"VirtualFuture":{"strategy_points_24h":25,"random_good_of_age_24h":141},"SpaceAgeMars":{"strategy_points_24h":25,"random_good_of_age_24h":142},"SpaceAgeAsteroidBelt":{"strategy_points_24h":25,"random_good_of_age_24h":143},"SpaceAgeVenus":{"strategy_points_24h":25,"random_good_of_age_24h":144},"SpaceAgeJupiterMoon":{"strategy_points_24h":25,"random_good_of_age_24h":145},"SpaceAgeTitan":{"strategy_points_24h":25,"random_good_of_age_24h":146},"SpaceAgeSpaceHub":{"strategy_points_24h":25,"random_good_of_age_24h":147}}, boosts: [{"type":"att_def_boost_attacker","value":25,"feature":"all"},{"type":"att_def_boost_defender","value":25,"feature":"all"}] },
+    "W_MultiAge_GBG24E1": { prod: {"BronzeAge":{"strategy_points_24h":35,"random_good_of_age_24h":129},"IronAge":{"strategy_points_24h":35,"random_good_of_age_24h":129},"EarlyMiddleAge":{"strategy_points_24h":35,"random_good_of_age_24h":130},"HighMiddleAge":{"strategy_points_24h":35,"random_good_of_age_24h":131},"LateMiddleAge":{"strategy_points_24h":35,"random_good_of_age_24h":132},"ColonialAge":{"strategy_points_24h":35,"random_good_of_age_24h":133},"IndustrialAge":{"strategy_points_24h":35,"random_good_of_age_24h":134},"ProgressiveEra":{"strategy_points_24h":35,"random_good_of_age_24h":135},"ModernEra":{"strategy_points_24h":35,"random_good_of_age_24h":136},"PostModernEra":{"strategy_points_24h":35,"random_good_of_age_24h":137},"ContemporaryEra":{"strategy_points_24h":35,"random_good_of_age_24h":138},"TomorrowEra":{"strategy_points_24h":35,"random_good_of_age_24h":139},"FutureEra":{"strategy_points_24h":35,"random_good_of_age_24h":140},"ArcticFuture":{"strategy_points_24h":35,"random_good_of_age_24h":140},"OceanicFuture":{"strategy_points_24h":35,"random_good_of_age_24h":141},"VirtualFuture":{"strategy_points_24h":35,"random_good_of_age_24h":142},"SpaceAgeMars":{"strategy_points_24h":35,"random_good_of_age_24h":143},"SpaceAgeAsteroidBelt":{"strategy_points_24h":35,"random_good_of_age_24h":144},"SpaceAgeVenus":{"strategy_points_24h":35,"random_good_of_age_24h":145},"SpaceAgeJupiterMoon":{"strategy_points_24h":35,"random_good_of_age_24h":146},"SpaceAgeTitan":{"strategy_points_24h":35,"random_good_of_age_24h":147},"SpaceAgeSpaceHub":{"strategy_points_24h":35,"random_good_of_age_24h":148}}, boosts: [{"type":"att_def_boost_attacker","value":45,"feature":"all"},{"type":"att_def_boost_attacker","value":20,"feature":"battleground"},{"type":"att_def_boost_attacker","value":32,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":45,"feature":"all"},{"type":"att_def_boost_defender","value":20,"feature":"battleground"},{"type":"att_def_boost_defender","value":32,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG24E2": { prod: {"BronzeAge":{"strategy_points_24h":70,"random_good_of_age_24h":258},"IronAge":{"strategy_points_24h":70,"random_good_of_age_24h":258},"EarlyMiddleAge":{"strategy_points_24h":70,"random_good_of_age_24h":260},"HighMiddleAge":{"strategy_points_24h":70,"random_good_of_age_24h":262},"LateMiddleAge":{"strategy_points_24h":70,"random_good_of_age_24h":264},"ColonialAge":{"strategy_points_24h":70,"random_good_of_age_24h":266},"IndustrialAge":{"strategy_points_24h":70,"random_good_of_age_24h":268},"ProgressiveEra":{"strategy_points_24h":70,"random_good_of_age_24h":269},"ModernEra":{"strategy_points_24h":70,"random_good_of_age_24h":271},"PostModernEra":{"strategy_points_24h":70,"random_good_of_age_24h":273},"ContemporaryEra":{"strategy_points_24h":70,"random_good_of_age_24h":275},"TomorrowEra":{"strategy_points_24h":70,"random_good_of_age_24h":277},"FutureEra":{"strategy_points_24h":70,"random_good_of_age_24h":279},"ArcticFuture":{"strategy_points_24h":70,"random_good_of_age_24h":281},"OceanicFuture":{"strategy_points_24h":70,"random_good_of_age_24h":283},"VirtualFuture":{"strategy_points_24h":70,"random_good_of_age_24h":285},"SpaceAgeMars":{"strategy_points_24h":70,"random_good_of_age_24h":287},"SpaceAgeAsteroidBelt":{"strategy_points_24h":70,"random_good_of_age_24h":289},"SpaceAgeVenus":{"strategy_points_24h":70,"random_good_of_age_24h":291},"SpaceAgeJupiterMoon":{"strategy_points_24h":70,"random_good_of_age_24h":292},"SpaceAgeTitan":{"strategy_points_24h":70,"random_good_of_age_24h":294},"SpaceAgeSpaceHub":{"strategy_points_24h":70,"random_good_of_age_24h":296}}, boosts: [{"type":"att_def_boost_attacker","value":51,"feature":"all"},{"type":"att_def_boost_attacker","value":32,"feature":"battleground"},{"type":"att_def_boost_attacker","value":49,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":51,"feature":"all"},{"type":"att_def_boost_defender","value":32,"feature":"battleground"},{"type":"att_def_boost_defender","value":49,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG25A1": { prod: {"BronzeAge":{"strategy_points_24h":64},"IronAge":{"strategy_points_24h":64},"EarlyMiddleAge":{"strategy_points_24h":65},"HighMiddleAge":{"strategy_points_24h":66},"LateMiddleAge":{"strategy_points_24h":67},"ColonialAge":{"strategy_points_24h":68},"IndustrialAge":{"strategy_points_24h":69},"ProgressiveEra":{"strategy_points_24h":70},"ModernEra":{"strategy_points_24h":71},"PostModernEra":{"strategy_points_24h":72},"ContemporaryEra":{"strategy_points_24h":73},"TomorrowEra":{"strategy_points_24h":74},"FutureEra":{"strategy_points_24h":75},"ArcticFuture":{"strategy_points_24h":76},"OceanicFuture":{"strategy_points_24h":76},"VirtualFuture":{"strategy_points_24h":77},"SpaceAgeMars":{"strategy_points_24h":78},"SpaceAgeAsteroidBelt":{"strategy_points_24h":79},"SpaceAgeVenus":{"strategy_points_24h":80},"SpaceAgeJupiterMoon":{"strategy_points_24h":81},"SpaceAgeTitan":{"strategy_points_24h":82},"SpaceAgeSpaceHub":{"strategy_points_24h":83}}, boosts: [{"type":"att_def_boost_attacker_defender","value":70,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":112,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG25A2": { prod: {"BronzeAge":{"strategy_points_24h":96},"IronAge":{"strategy_points_24h":96},"EarlyMiddleAge":{"strategy_points_24h":97},"HighMiddleAge":{"strategy_points_24h":99},"LateMiddleAge":{"strategy_points_24h":100},"ColonialAge":{"strategy_points_24h":102},"IndustrialAge":{"strategy_points_24h":103},"ProgressiveEra":{"strategy_points_24h":105},"ModernEra":{"strategy_points_24h":106},"PostModernEra":{"strategy_points_24h":108},"ContemporaryEra":{"strategy_points_24h":109},"TomorrowEra":{"strategy_points_24h":110},"FutureEra":{"strategy_points_24h":112},"ArcticFuture":{"strategy_points_24h":113},"OceanicFuture":{"strategy_points_24h":115},"VirtualFuture":{"strategy_points_24h":116},"SpaceAgeMars":{"strategy_points_24h":118},"SpaceAgeAsteroidBelt":{"strategy_points_24h":119},"SpaceAgeVenus":{"strategy_points_24h":120},"SpaceAgeJupiterMoon":{"strategy_points_24h":122},"SpaceAgeTitan":{"strategy_points_24h":123},"SpaceAgeSpaceHub":{"strategy_points_24h":125}}, boosts: [{"type":"att_def_boost_attacker_defender","value":100,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":160,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG25B1": { prod: {"BronzeAge":{"random_good_of_age_24h":24,"random_good_of_previous_age_24h":48},"IronAge":{"random_good_of_age_24h":24,"random_good_of_previous_age_24h":48},"EarlyMiddleAge":{"random_good_of_age_24h":24,"random_good_of_previous_age_24h":48},"HighMiddleAge":{"random_good_of_age_24h":24,"random_good_of_previous_age_24h":48},"LateMiddleAge":{"random_good_of_age_24h":25,"random_good_of_previous_age_24h":49},"ColonialAge":{"random_good_of_age_24h":25,"random_good_of_previous_age_24h":49},"IndustrialAge":{"random_good_of_age_24h":25,"random_good_of_previous_age_24h":49},"ProgressiveEra":{"random_good_of_age_24h":25,"random_good_of_previous_age_24h":49},"ModernEra":{"random_good_of_age_24h":25,"random_good_of_previous_age_24h":49},"PostModernEra":{"random_good_of_age_24h":25,"random_good_of_previous_age_24h":49},"ContemporaryEra":{"random_good_of_age_24h":26,"random_good_of_previous_age_24h":50},"TomorrowEra":{"random_good_of_age_24h":26,"random_good_of_previous_age_24h":50},"FutureEra":{"random_good_of_age_24h":26,"random_good_of_previous_age_24h":50},"ArcticFuture":{"random_good_of_age_24h":26,"random_good_of_previous_age_24h":50},"OceanicFuture":{"random_good_of_age_24h":26,"random_good_of_previous_age_24h":50},"VirtualFuture":{"random_good_of_age_24h":27,"random_good_of_previous_age_24h":51},"SpaceAgeMars":{"random_good_of_age_24h":27,"random_good_of_previous_age_24h":51},"SpaceAgeAsteroidBelt":{"random_good_of_age_24h":27,"random_good_of_previous_age_24h":51},"SpaceAgeVenus":{"random_good_of_age_24h":27,"random_good_of_previous_age_24h":51},"SpaceAgeJupiterMoon":{"random_good_of_age_24h":27,"random_good_of_previous_age_24h":51},"SpaceAgeTitan":{"random_good_of_age_24h":27,"random_good_of_previous_age_24h":51},"SpaceAgeSpaceHub":{"random_good_of_age_24h":28,"random_good_of_previous_age_24h":52}}, boosts: [{"type":"att_def_boost_attacker_defender","value":13,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":20,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG25B2": { prod: {"BronzeAge":{"random_good_of_age_24h":32,"random_good_of_previous_age_24h":64},"IronAge":{"random_good_of_age_24h":32,"random_good_of_previous_age_24h":64},"EarlyMiddleAge":{"random_good_of_age_24h":32,"random_good_of_previous_age_24h":64},"HighMiddleAge":{"random_good_of_age_24h":32,"random_good_of_previous_age_24h":64},"LateMiddleAge":{"random_good_of_age_24h":33,"random_good_of_previous_age_24h":65},"ColonialAge":{"random_good_of_age_24h":33,"random_good_of_previous_age_24h":65},"IndustrialAge":{"random_good_of_age_24h":33,"random_good_of_previous_age_24h":65},"ProgressiveEra":{"random_good_of_age_24h":33,"random_good_of_previous_age_24h":65},"ModernEra":{"random_good_of_age_24h":34,"random_good_of_previous_age_24h":66},"PostModernEra":{"random_good_of_age_24h":34,"random_good_of_previous_age_24h":66},"ContemporaryEra":{"random_good_of_age_24h":34,"random_good_of_previous_age_24h":66},"TomorrowEra":{"random_good_of_age_24h":34,"random_good_of_previous_age_24h":66},"FutureEra":{"random_good_of_age_24h":35,"random_good_of_previous_age_24h":67},"ArcticFuture":{"random_good_of_age_24h":35,"random_good_of_previous_age_24h":67},"OceanicFuture":{"random_good_of_age_24h":35,"random_good_of_previous_age_24h":67},"VirtualFuture":{"random_good_of_age_24h":35,"random_good_of_previous_age_24h":67},"SpaceAgeMars":{"random_good_of_age_24h":36,"random_good_of_previous_age_24h":68},"SpaceAgeAsteroidBelt":{"random_good_of_age_24h":36,"random_good_of_previous_age_24h":68},"SpaceAgeVenus":{"random_good_of_age_24h":36,"random_good_of_previous_age_24h":68},"SpaceAgeJupiterMoon":{"random_good_of_age_24h":36,"random_good_of_previous_age_24h":68},"SpaceAgeTitan":{"random_good_of_age_24h":37,"random_good_of_previous_age_24h":69},"SpaceAgeSpaceHub":{"random_good_of_age_24h":37,"random_good_of_previous_age_24h":69}}, boosts: [{"type":"att_def_boost_attacker_defender","value":18,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":28,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG24G1": { prod: {"BronzeAge":{"strategy_points_24h":32,"random_good_of_age_24h":224},"IronAge":{"strategy_points_24h":32,"random_good_of_age_24h":224},"EarlyMiddleAge":{"strategy_points_24h":32,"random_good_of_age_24h":226},"HighMiddleAge":{"strategy_points_24h":33,"random_good_of_age_24h":227},"LateMiddleAge":{"strategy_points_24h":33,"random_good_of_age_24h":229},"ColonialAge":{"strategy_points_24h":34,"random_good_of_age_24h":231},"IndustrialAge":{"strategy_points_24h":34,"random_good_of_age_24h":232},"ProgressiveEra":{"strategy_points_24h":35,"random_good_of_age_24h":234},"ModernEra":{"strategy_points_24h":35,"random_good_of_age_24h":236},"PostModernEra":{"strategy_points_24h":36,"random_good_of_age_24h":237},"ContemporaryEra":{"strategy_points_24h":36,"random_good_of_age_24h":239},"TomorrowEra":{"strategy_points_24h":37,"random_good_of_age_24h":241},"FutureEra":{"strategy_points_24h":37,"random_good_of_age_24h":242},"ArcticFuture":{"strategy_points_24h":38,"random_good_of_age_24h":244},"OceanicFuture":{"strategy_points_24h":38,"random_good_of_age_24h":246},"VirtualFuture":{"strategy_points_24h":39,"random_good_of_age_24h":248},"SpaceAgeMars":{"strategy_points_24h":39,"random_good_of_age_24h":249},"SpaceAgeAsteroidBelt":{"strategy_points_24h":40,"random_good_of_age_24h":251},"SpaceAgeVenus":{"strategy_points_24h":40,"random_good_of_age_24h":253},"SpaceAgeJupiterMoon":{"strategy_points_24h":41,"random_good_of_age_24h":254},"SpaceAgeTitan":{"strategy_points_24h":41,"random_good_of_age_24h":256},"SpaceAgeSpaceHub":{"strategy_points_24h":42,"random_good_of_age_24h":258}}, boosts: [{"type":"att_def_boost_attacker","value":46,"feature":"all"},{"type":"att_def_boost_attacker","value":22,"feature":"battleground"},{"type":"att_def_boost_attacker","value":38,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":46,"feature":"all"},{"type":"att_def_boost_defender","value":22,"feature":"battleground"},{"type":"att_def_boost_defender","value":38,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG24G2": { prod: {"BronzeAge":{"strategy_points_24h":48,"random_good_of_age_24h":320},"IronAge":{"strategy_points_24h":48,"random_good_of_age_24h":320},"EarlyMiddleAge":{"strategy_points_24h":49,"random_good_of_age_24h":322},"HighMiddleAge":{"strategy_points_24h":49,"random_good_of_age_24h":325},"LateMiddleAge":{"strategy_points_24h":50,"random_good_of_age_24h":327},"ColonialAge":{"strategy_points_24h":51,"random_good_of_age_24h":330},"IndustrialAge":{"strategy_points_24h":52,"random_good_of_age_24h":332},"ProgressiveEra":{"strategy_points_24h":52,"random_good_of_age_24h":334},"ModernEra":{"strategy_points_24h":53,"random_good_of_age_24h":337},"PostModernEra":{"strategy_points_24h":54,"random_good_of_age_24h":339},"ContemporaryEra":{"strategy_points_24h":54,"random_good_of_age_24h":342},"TomorrowEra":{"strategy_points_24h":55,"random_good_of_age_24h":344},"FutureEra":{"strategy_points_24h":56,"random_good_of_age_24h":346},"ArcticFuture":{"strategy_points_24h":57,"random_good_of_age_24h":349},"OceanicFuture":{"strategy_points_24h":57,"random_good_of_age_24h":351},"VirtualFuture":{"strategy_points_24h":58,"random_good_of_age_24h":354},"SpaceAgeMars":{"strategy_points_24h":59,"random_good_of_age_24h":356},"SpaceAgeAsteroidBelt":{"strategy_points_24h":60,"random_good_of_age_24h":358},"SpaceAgeVenus":{"strategy_points_24h":60,"random_good_of_age_24h":361},"SpaceAgeJupiterMoon":{"strategy_points_24h":61,"random_good_of_age_24h":363},"SpaceAgeTitan":{"strategy_points_24h":62,"random_good_of_age_24h":366},"SpaceAgeSpaceHub":{"strategy_points_24h":62,"random_good_of_age_24h":368}}, boosts: [{"type":"att_def_boost_attacker","value":54,"feature":"all"},{"type":"att_def_boost_attacker","value":36,"feature":"battleground"},{"type":"att_def_boost_attacker","value":54,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":54,"feature":"all"},{"type":"att_def_boost_defender","value":36,"feature":"battleground"},{"type":"att_def_boost_defender","value":54,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG24H1": { prod: {"BronzeAge":{"strategy_points_24h":10,"random_good_of_age_24h":32},"IronAge":{"strategy_points_24h":10,"random_good_of_age_24h":32},"EarlyMiddleAge":{"strategy_points_24h":10,"random_good_of_age_24h":32},"HighMiddleAge":{"strategy_points_24h":10,"random_good_of_age_24h":32},"LateMiddleAge":{"strategy_points_24h":10,"random_good_of_age_24h":33},"ColonialAge":{"strategy_points_24h":11,"random_good_of_age_24h":33},"IndustrialAge":{"strategy_points_24h":11,"random_good_of_age_24h":33},"ProgressiveEra":{"strategy_points_24h":11,"random_good_of_age_24h":33},"ModernEra":{"strategy_points_24h":11,"random_good_of_age_24h":34},"PostModernEra":{"strategy_points_24h":11,"random_good_of_age_24h":34},"ContemporaryEra":{"strategy_points_24h":11,"random_good_of_age_24h":34},"TomorrowEra":{"strategy_points_24h":12,"random_good_of_age_24h":34},"FutureEra":{"strategy_points_24h":12,"random_good_of_age_24h":35},"ArcticFuture":{"strategy_points_24h":12,"random_good_of_age_24h":35},"OceanicFuture":{"strategy_points_24h":12,"random_good_of_age_24h":35},"VirtualFuture":{"strategy_points_24h":12,"random_good_of_age_24h":35},"SpaceAgeMars":{"strategy_points_24h":12,"random_good_of_age_24h":36},"SpaceAgeAsteroidBelt":{"strategy_points_24h":12,"random_good_of_age_24h":36},"SpaceAgeVenus":{"strategy_points_24h":13,"random_good_of_age_24h":36},"SpaceAgeJupiterMoon":{"strategy_points_24h":13,"random_good_of_age_24h":36},"SpaceAgeTitan":{"strategy_points_24h":13,"random_good_of_age_24h":37},"SpaceAgeSpaceHub":{"strategy_points_24h":13,"random_good_of_age_24h":37}}, boosts: [{"type":"att_def_boost_attacker","value":13,"feature":"all"},{"type":"att_def_boost_defender","value":13,"feature":"all"}] },
+    "W_MultiAge_GBG24H2": { prod: {"BronzeAge":{"strategy_points_24h":12,"random_good_of_age_24h":48},"IronAge":{"strategy_points_24h":12,"random_good_of_age_24h":48},"EarlyMiddleAge":{"strategy_points_24h":12,"random_good_of_age_24h":48},"HighMiddleAge":{"strategy_points_24h":12,"random_good_of_age_24h":49},"LateMiddleAge":{"strategy_points_24h":13,"random_good_of_age_24h":49},"ColonialAge":{"strategy_points_24h":13,"random_good_of_age_24h":49},"IndustrialAge":{"strategy_points_24h":13,"random_good_of_age_24h":50},"ProgressiveEra":{"strategy_points_24h":13,"random_good_of_age_24h":50},"ModernEra":{"strategy_points_24h":13,"random_good_of_age_24h":51},"PostModernEra":{"strategy_points_24h":13,"random_good_of_age_24h":51},"ContemporaryEra":{"strategy_points_24h":14,"random_good_of_age_24h":51},"TomorrowEra":{"strategy_points_24h":14,"random_good_of_age_24h":52},"FutureEra":{"strategy_points_24h":14,"random_good_of_age_24h":52},"ArcticFuture":{"strategy_points_24h":14,"random_good_of_age_24h":52},"OceanicFuture":{"strategy_points_24h":14,"random_good_of_age_24h":53},"VirtualFuture":{"strategy_points_24h":15,"random_good_of_age_24h":53},"SpaceAgeMars":{"strategy_points_24h":15,"random_good_of_age_24h":53},"SpaceAgeAsteroidBelt":{"strategy_points_24h":15,"random_good_of_age_24h":54},"SpaceAgeVenus":{"strategy_points_24h":15,"random_good_of_age_24h":54},"SpaceAgeJupiterMoon":{"strategy_points_24h":15,"random_good_of_age_24h":54},"SpaceAgeTitan":{"strategy_points_24h":15,"random_good_of_age_24h":55},"SpaceAgeSpaceHub":{"strategy_points_24h":16,"random_good_of_age_24h":55}}, boosts: [{"type":"att_def_boost_attacker","value":15,"feature":"all"},{"type":"att_def_boost_defender","value":15,"feature":"all"}] },
+    "W_MultiAge_GBG2023A": { boosts: [{"type":"att_def_boost_attacker","value":30,"feature":"battleground"},{"type":"att_def_boost_attacker","value":73,"feature":"guild_expedition"},{"type":"att_def_boost_attacker","value":25,"feature":"guild_raids"},{"type":"att_def_boost_defender","value":30,"feature":"battleground"},{"type":"att_def_boost_defender","value":73,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":25,"feature":"guild_raids"}] },
+    "W_MultiAge_GBG2023ADecoration": { prod: {"AllAge":{"happiness":250}} },
+    "W_MultiAge_GBG25F1": { prod: {"BronzeAge":{"random_good_of_previous_age_24h":48},"IronAge":{"random_good_of_previous_age_24h":48},"EarlyMiddleAge":{"random_good_of_previous_age_24h":48},"HighMiddleAge":{"random_good_of_previous_age_24h":48},"LateMiddleAge":{"random_good_of_previous_age_24h":49},"ColonialAge":{"random_good_of_previous_age_24h":49},"IndustrialAge":{"random_good_of_previous_age_24h":49},"ProgressiveEra":{"random_good_of_previous_age_24h":49},"ModernEra":{"random_good_of_previous_age_24h":49},"PostModernEra":{"random_good_of_previous_age_24h":49},"ContemporaryEra":{"random_good_of_previous_age_24h":50},"TomorrowEra":{"random_good_of_previous_age_24h":50},"FutureEra":{"random_good_of_previous_age_24h":50},"ArcticFuture":{"random_good_of_previous_age_24h":50},"OceanicFuture":{"random_good_of_previous_age_24h":50},"VirtualFuture":{"random_good_of_previous_age_24h":51},"SpaceAgeMars":{"random_good_of_previous_age_24h":51},"SpaceAgeAsteroidBelt":{"random_good_of_previous_age_24h":51},"SpaceAgeVenus":{"random_good_of_previous_age_24h":51},"SpaceAgeJupiterMoon":{"random_good_of_previous_age_24h":51},"SpaceAgeTitan":{"random_good_of_previous_age_24h":51},"SpaceAgeSpaceHub":{"random_good_of_previous_age_24h":52}}, boosts: [{"type":"att_def_boost_attacker_defender","value":15,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":36,"feature":"guild_expedition"},{"type":"att_boost_defender","value":27,"feature":"battleground"}] },
+    "W_MultiAge_GBG25F2": { prod: {"BronzeAge":{"random_good_of_previous_age_24h":72},"IronAge":{"random_good_of_previous_age_24h":72},"EarlyMiddleAge":{"random_good_of_previous_age_24h":72},"HighMiddleAge":{"random_good_of_previous_age_24h":73},"LateMiddleAge":{"random_good_of_previous_age_24h":73},"ColonialAge":{"random_good_of_previous_age_24h":73},"IndustrialAge":{"random_good_of_previous_age_24h":73},"ProgressiveEra":{"random_good_of_previous_age_24h":74},"ModernEra":{"random_good_of_previous_age_24h":74},"PostModernEra":{"random_good_of_previous_age_24h":74},"ContemporaryEra":{"random_good_of_previous_age_24h":74},"TomorrowEra":{"random_good_of_previous_age_24h":75},"FutureEra":{"random_good_of_previous_age_24h":75},"ArcticFuture":{"random_good_of_previous_age_24h":75},"OceanicFuture":{"random_good_of_previous_age_24h":76},"VirtualFuture":{"random_good_of_previous_age_24h":76},"SpaceAgeMars":{"random_good_of_previous_age_24h":76},"SpaceAgeAsteroidBelt":{"random_good_of_previous_age_24h":76},"SpaceAgeVenus":{"random_good_of_previous_age_24h":77},"SpaceAgeJupiterMoon":{"random_good_of_previous_age_24h":77},"SpaceAgeTitan":{"random_good_of_previous_age_24h":77},"SpaceAgeSpaceHub":{"random_good_of_previous_age_24h":77}}, boosts: [{"type":"att_def_boost_attacker_defender","value":23,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":48,"feature":"guild_expedition"},{"type":"att_boost_defender","value":36,"feature":"battleground"}] },
+    "W_MultiAge_GBG25E1": { prod: {"BronzeAge":{"strategy_points_24h":40,"units_24h":40},"IronAge":{"strategy_points_24h":40,"units_24h":40},"EarlyMiddleAge":{"strategy_points_24h":41,"units_24h":40},"HighMiddleAge":{"strategy_points_24h":41,"units_24h":40},"LateMiddleAge":{"strategy_points_24h":42,"units_24h":40},"ColonialAge":{"strategy_points_24h":42,"units_24h":40},"IndustrialAge":{"strategy_points_24h":43,"units_24h":40},"ProgressiveEra":{"strategy_points_24h":44,"units_24h":40},"ModernEra":{"strategy_points_24h":44,"units_24h":40},"PostModernEra":{"strategy_points_24h":45,"units_24h":40},"ContemporaryEra":{"strategy_points_24h":45,"units_24h":40},"TomorrowEra":{"strategy_points_24h":46,"units_24h":40},"FutureEra":{"strategy_points_24h":47,"units_24h":40},"ArcticFuture":{"strategy_points_24h":47,"units_24h":40},"OceanicFuture":{"strategy_points_24h":48,"units_24h":40},"VirtualFuture":{"strategy_points_24h":48,"units_24h":40},"SpaceAgeMars":{"strategy_points_24h":49,"units_24h":40},"SpaceAgeAsteroidBelt":{"strategy_points_24h":50,"units_24h":40},"SpaceAgeVenus":{"strategy_points_24h":50,"units_24h":40},"SpaceAgeJupiterMoon":{"strategy_points_24h":51,"units_24h":40},"SpaceAgeTitan":{"strategy_points_24h":51,"units_24h":40},"SpaceAgeSpaceHub":{"strategy_points_24h":52,"units_24h":40}}, boosts: [{"type":"att_def_boost_attacker_defender","value":88,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":160,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG25E2": { prod: {"BronzeAge":{"strategy_points_24h":60,"units_24h":40},"IronAge":{"strategy_points_24h":60,"units_24h":40},"EarlyMiddleAge":{"strategy_points_24h":61,"units_24h":40},"HighMiddleAge":{"strategy_points_24h":62,"units_24h":40},"LateMiddleAge":{"strategy_points_24h":63,"units_24h":40},"ColonialAge":{"strategy_points_24h":64,"units_24h":40},"IndustrialAge":{"strategy_points_24h":65,"units_24h":40},"ProgressiveEra":{"strategy_points_24h":65,"units_24h":40},"ModernEra":{"strategy_points_24h":66,"units_24h":40},"PostModernEra":{"strategy_points_24h":67,"units_24h":40},"ContemporaryEra":{"strategy_points_24h":68,"units_24h":40},"TomorrowEra":{"strategy_points_24h":69,"units_24h":40},"FutureEra":{"strategy_points_24h":70,"units_24h":40},"ArcticFuture":{"strategy_points_24h":71,"units_24h":40},"OceanicFuture":{"strategy_points_24h":72,"units_24h":40},"VirtualFuture":{"strategy_points_24h":73,"units_24h":40},"SpaceAgeMars":{"strategy_points_24h":73,"units_24h":40},"SpaceAgeAsteroidBelt":{"strategy_points_24h":74,"units_24h":40},"SpaceAgeVenus":{"strategy_points_24h":75,"units_24h":40},"SpaceAgeJupiterMoon":{"strategy_points_24h":76,"units_24h":40},"SpaceAgeTitan":{"strategy_points_24h":77,"units_24h":40},"SpaceAgeSpaceHub":{"strategy_points_24h":78,"units_24h":40}}, boosts: [{"type":"att_def_boost_attacker_defender","value":113,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":200,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG24C1": { prod: {"BronzeAge":{"strategy_points_24h":40,"random_good_of_age_24h":80},"IronAge":{"strategy_points_24h":40,"random_good_of_age_24h":80},"EarlyMiddleAge":{"strategy_points_24h":40,"random_good_of_age_24h":81},"HighMiddleAge":{"strategy_points_24h":40,"random_good_of_age_24h":81},"LateMiddleAge":{"strategy_points_24h":40,"random_good_of_age_24h":82},"ColonialAge":{"strategy_points_24h":40,"random_good_of_age_24h":82},"IndustrialAge":{"strategy_points_24h":40,"random_good_of_age_24h":83},"ProgressiveEra":{"strategy_points_24h":40,"random_good_of_age_24h":84},"ModernEra":{"strategy_points_24h":40,"random_good_of_age_24h":84},"PostModernEra":{"strategy_points_24h":40,"random_good_of_age_24h":85},"ContemporaryEra":{"strategy_points_24h":40,"random_good_of_age_24h":85},"TomorrowEra":{"strategy_points_24h":40,"random_good_of_age_24h":86},"FutureEra":{"strategy_points_24h":40,"random_good_of_age_24h":87},"ArcticFuture":{"strategy_points_24h":40,"random_good_of_age_24h":87},"OceanicFuture":{"strategy_points_24h":40,"random_good_of_age_24h":88},"VirtualFuture":{"strategy_points_24h":40,"random_good_of_age_24h":88},"SpaceAgeMars":{"strategy_points_24h":40,"random_good_of_age_24h":89},"SpaceAgeAsteroidBelt":{"strategy_points_24h":40,"random_good_of_age_24h":90},"SpaceAgeVenus":{"strategy_points_24h":40,"random_good_of_age_24h":90},"SpaceAgeJupiterMoon":{"strategy_points_24h":40,"random_good_of_age_24h":91},"SpaceAgeTitan":{"strategy_points_24h":40,"random_good_of_age_24h":91},"SpaceAgeSpaceHub":{"strategy_points_24h":40,"random_good_of_age_24h":91}}, boosts: [{"type":"att_def_boost_attacker","value":35,"feature":"all"},{"type":"att_def_boost_attacker","value":18,"feature":"battleground"},{"type":"att_def_boost_attacker","value":13,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":35,"feature":"all"},{"type":"att_def_boost_defender","value":18,"feature":"battleground"},{"type":"att_def_boost_defender","value":13,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG24C2": { prod: {"BronzeAge":{"strategy_points_24h":80,"random_good_of_age_24h":160},"IronAge":{"strategy_points_24h":80,"random_good_of_age_24h":160},"EarlyMiddleAge":{"strategy_points_24h":80,"random_good_of_age_24h":161},"HighMiddleAge":{"strategy_points_24h":80,"random_good_of_age_24h":162},"LateMiddleAge":{"strategy_points_24h":80,"random_good_of_age_24h":164},"ColonialAge":{"strategy_points_24h":80,"random_good_of_age_24h":165},"IndustrialAge":{"strategy_points_24h":80,"random_good_of_age_24h":166},"ProgressiveEra":{"strategy_points_24h":80,"random_good_of_age_24h":167},"ModernEra":{"strategy_points_24h":80,"random_good_of_age_24h":168},"PostModernEra":{"strategy_points_24h":80,"random_good_of_age_24h":170},"ContemporaryEra":{"strategy_points_24h":80,"random_good_of_age_24h":171},"TomorrowEra":{"strategy_points_24h":80,"random_good_of_age_24h":172},"FutureEra":{"strategy_points_24h":80,"random_good_of_age_24h":173},"ArcticFuture":{"strategy_points_24h":80,"random_good_of_age_24h":174},"OceanicFuture":{"strategy_points_24h":80,"random_good_of_age_24h":176},"VirtualFuture":{"strategy_points_24h":80,"random_good_of_age_24h":177},"SpaceAgeMars":{"strategy_points_24h":80,"random_good_of_age_24h":178},"SpaceAgeAsteroidBelt":{"strategy_points_24h":80,"random_good_of_age_24h":179},"SpaceAgeVenus":{"strategy_points_24h":80,"random_good_of_age_24h":180},"SpaceAgeJupiterMoon":{"strategy_points_24h":80,"random_good_of_age_24h":182},"SpaceAgeTitan":{"strategy_points_24h":80,"random_good_of_age_24h":183},"SpaceAgeSpaceHub":{"strategy_points_24h":80,"random_good_of_age_24h":184}}, boosts: [{"type":"att_def_boost_attacker","value":50,"feature":"all"},{"type":"att_def_boost_attacker","value":30,"feature":"battleground"},{"type":"att_def_boost_attacker","value":26,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":50,"feature":"all"},{"type":"att_def_boost_defender","value":30,"feature":"battleground"},{"type":"att_def_boost_defender","value":26,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG24D1": { prod: {"BronzeAge":{"strategy_points_24h":20,"random_good_of_age_24h":36},"IronAge":{"strategy_points_24h":20,"random_good_of_age_24h":36},"EarlyMiddleAge":{"strategy_points_24h":20,"random_good_of_age_24h":36},"HighMiddleAge":{"strategy_points_24h":20,"random_good_of_age_24h":37},"LateMiddleAge":{"strategy_points_24h":20,"random_good_of_age_24h":37},"ColonialAge":{"strategy_points_24h":20,"random_good_of_age_24h":37},"IndustrialAge":{"strategy_points_24h":20,"random_good_of_age_24h":37},"ProgressiveEra":{"strategy_points_24h":20,"random_good_of_age_24h":38},"ModernEra":{"strategy_points_24h":20,"random_good_of_age_24h":38},"PostModernEra":{"strategy_points_24h":20,"random_good_of_age_24h":38},"ContemporaryEra":{"strategy_points_24h":20,"random_good_of_age_24h":38},"TomorrowEra":{"strategy_points_24h":20,"random_good_of_age_24h":39},"FutureEra":{"strategy_points_24h":20,"random_good_of_age_24h":39},"ArcticFuture":{"strategy_points_24h":20,"random_good_of_age_24h":39},"OceanicFuture":{"strategy_points_24h":20,"random_good_of_age_24h":40},"VirtualFuture":{"strategy_points_24h":20,"random_good_of_age_24h":40},"SpaceAgeMars":{"strategy_points_24h":20,"random_good_of_age_24h":40},"SpaceAgeAsteroidBelt":{"strategy_points_24h":20,"random_good_of_age_24h":40},"SpaceAgeVenus":{"strategy_points_24h":20,"random_good_of_age_24h":41},"SpaceAgeJupiterMoon":{"strategy_points_24h":20,"random_good_of_age_24h":41},"SpaceAgeTitan":{"strategy_points_24h":20,"random_good_of_age_24h":41},"SpaceAgeSpaceHub":{"strategy_points_24h":20,"random_good_of_age_24h":41}}, boosts: [{"type":"att_def_boost_attacker","value":17,"feature":"all"},{"type":"att_def_boost_defender","value":17,"feature":"all"}] },
+    "W_MultiAge_GBG24D2": { prod: {"BronzeAge":{"strategy_points_24h":30,"random_good_of_age_24h":60},"IronAge":{"strategy_points_24h":30,"random_good_of_age_24h":60},"EarlyMiddleAge":{"strategy_points_24h":30,"random_good_of_age_24h":60},"HighMiddleAge":{"strategy_points_24h":30,"random_good_of_age_24h":61},"LateMiddleAge":{"strategy_points_24h":30,"random_good_of_age_24h":61},"ColonialAge":{"strategy_points_24h":30,"random_good_of_age_24h":62},"IndustrialAge":{"strategy_points_24h":30,"random_good_of_age_24h":62},"ProgressiveEra":{"strategy_points_24h":30,"random_good_of_age_24h":63},"ModernEra":{"strategy_points_24h":30,"random_good_of_age_24h":63},"PostModernEra":{"strategy_points_24h":30,"random_good_of_age_24h":64},"ContemporaryEra":{"strategy_points_24h":30,"random_good_of_age_24h":64},"TomorrowEra":{"strategy_points_24h":30,"random_good_of_age_24h":65},"FutureEra":{"strategy_points_24h":30,"random_good_of_age_24h":65},"ArcticFuture":{"strategy_points_24h":30,"random_good_of_age_24h":65},"OceanicFuture":{"strategy_points_24h":30,"random_good_of_age_24h":66},"VirtualFuture":{"strategy_points_24h":30,"random_good_of_age_24h":66},"SpaceAgeMars":{"strategy_points_24h":30,"random_good_of_age_24h":67},"SpaceAgeAsteroidBelt":{"strategy_points_24h":30,"random_good_of_age_24h":67},"SpaceAgeVenus":{"strategy_points_24h":30,"random_good_of_age_24h":68},"SpaceAgeJupiterMoon":{"strategy_points_24h":30,"random_good_of_age_24h":68},"SpaceAgeTitan":{"strategy_points_24h":30,"random_good_of_age_24h":69},"SpaceAgeSpaceHub":{"strategy_points_24h":30,"random_good_of_age_24h":69}}, boosts: [{"type":"att_def_boost_attacker","value":21,"feature":"all"},{"type":"att_def_boost_defender","value":21,"feature":"all"}] },
+    "W_MultiAge_GBG26A1": { boosts: [{"type":"att_def_boost_attacker_defender","value":143,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":231,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":143,"feature":"all"}] },
+    "W_MultiAge_GBG26A2": { boosts: [{"type":"att_def_boost_attacker_defender","value":196,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":289,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":196,"feature":"all"}] },
+    "W_MultiAge_GBG26B1": { boosts: [{"type":"att_def_boost_attacker_defender","value":43,"feature":"all"}] },
+    "W_MultiAge_GBG26B2": { boosts: [{"type":"att_def_boost_attacker_defender","value":57,"feature":"all"}] },
+    "W_MultiAge_GBG24A1": { prod: {"AllAge":{"strategy_points_24h":22}}, boosts: [{"type":"att_def_boost_attacker","value":40,"feature":"all"},{"type":"att_def_boost_attacker","value":24,"feature":"battleground"},{"type":"att_def_boost_attacker","value":16,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":40,"feature":"all"},{"type":"att_def_boost_defender","value":24,"feature":"battleground"},{"type":"att_def_boost_defender","value":16,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG24A2": { prod: {"AllAge":{"strategy_points_24h":50}}, boosts: [{"type":"att_def_boost_attacker","value":60,"feature":"all"},{"type":"att_def_boost_attacker","value":36,"feature":"battleground"},{"type":"att_def_boost_attacker","value":32,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":60,"feature":"all"},{"type":"att_def_boost_defender","value":36,"feature":"battleground"},{"type":"att_def_boost_defender","value":32,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG24B1": { boosts: [{"type":"att_def_boost_attacker","value":17,"feature":"all"},{"type":"att_def_boost_attacker","value":9,"feature":"battleground"},{"type":"att_def_boost_defender","value":17,"feature":"all"},{"type":"att_def_boost_defender","value":12,"feature":"guild_expedition"}] },
+    "W_MultiAge_GBG24B2": { boosts: [{"type":"att_def_boost_attacker","value":21,"feature":"all"},{"type":"att_def_boost_attacker","value":14,"feature":"battleground"},{"type":"att_def_boost_defender","value":21,"feature":"all"},{"type":"att_def_boost_defender","value":18,"feature":"guild_expedition"}] },
+};
@@ -0,0 +1,16 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 12 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_AllAge_Expedition24Tiny": { prod: {"BronzeAge":{"premium_24h":0.5,"medals_24h":0.18,"strategy_points_24h":0.2,"money_24h":112.5,"supplies_24h":112.5,"random_good_of_age_24h":3.0},"IronAge":{"premium_24h":0.5,"medals_24h":0.27,"strategy_points_24h":0.2,"money_24h":270.0,"supplies_24h":270.0,"random_good_of_age_24h":3.0},"EarlyMiddleAge":{"premium_24h":0.5,"medals_24h":0.45,"strategy_points_24h":0.2,"money_24h":450.0,"supplies_24h":450.0,"random_good_of_age_24h":3.0},"HighMiddleAge":{"premium_24h":0.5,"medals_24h":0.9,"strategy_points_24h":0.2,"money_24h":630.0,"supplies_24h":625.0,"random_good_of_age_24h":3.0},"LateMiddleAge":{"premium_24h":0.5,"medals_24h":1.71,"strategy_points_24h":0.2,"money_24h":832.5,"supplies_24h":832.5,"random_good_of_age_24h":3.0},"ColonialAge":{"premium_24h":0.5,"medals_24h":2.79,"strategy_points_24h":0.2,"money_24h":1265.0,"supplies_24h":1282.5,"random_good_of_age_24h":3.0},"IndustrialAge":{"premium_24h":0.5,"medals_24h":4.41,"strategy_points_24h":0.2,"money_24h":1580.0,"supplies_24h":1555.0,"random_good_of_age_24h":3.0},"ProgressiveEra":{"premium_24h":0.5,"medals_24h":5.85,"strategy_points_24h":0.2,"money_24h":1917.5,"supplies_24h":1940.0,"random_good_of_age_24h":3.0},"ModernEra":{"premium_24h":0.5,"medals_24h":8.1,"strategy_points_24h":0.2,"money_24h":2385.0,"supplies_24h":2390.0,"random_good_of_age_24h":6.0},"PostModernEra":{"premium_24h":0.5,"medals_24h":10.8,"strategy_points_24h":0.2,"money_24h":3000.0,"supplies_24h":2750.0,"random_good_of_age_24h":6.0},"ContemporaryEra":{"premium_24h":0.5,"medals_24h":14.4,"strategy_points_24h":0.2,"money_24h":3905.0,"supplies_24h":3125.0,"random_good_of_age_24h":6.0},"TomorrowEra":{"premium_24h":0.5,"medals_24h":18.45,"strategy_points_24h":0.2,"money_24h":4522.5,"supplies_24h":3500.0,"random_good_of_age_24h":6.0},"FutureEra":{"premium_24h":0.5,"medals_24h":21.6,"strategy_points_24h":0.2,"money_24h":5275.0,"supplies_24h":4075.0,"random_good_of_age_24h":6.0},"ArcticFuture":{"premium_24h":0.5,"medals_24h":25.2,"strategy_points_24h":0.2,"money_24h":6125.0,"supplies_24h":4675.0,"random_good_of_age_24h":6.0},"OceanicFuture":{"premium_24h":0.5,"medals_24h":29.7,"strategy_points_24h":0.2,"money_24h":7050.0,"supplies_24h":5225.0,"random_good_of_age_24h":6.0},"VirtualFuture":{"premium_24h":0.5,"medals_24h":33.3,"strategy_points_24h":0.2,"money_24h":8050.0,"supplies_24h":5825.0,"random_good_of_age_24h":6.0},"SpaceAgeMars":{"premium_24h":0.5,"medals_24h":38.7,"strategy_points_24h":0.2,"money_24h":10062.5,"supplies_24h":7500.0,"random_good_of_age_24h":6.0},"SpaceAgeAsteroidBelt":{"premium_24h":0.5,"medals_24h":45.0,"strategy_points_24h":0.2,"money_24h":11700.0,"supplies_24h":8600.0,"random_good_of_age_24h":6.0},"SpaceAgeVenus":{"premium_24h":0.5,"medals_24h":51.3,"strategy_points_24h":0.2,"money_24h":13507.5,"supplies_24h":9810.0,"random_good_of_age_24h":6.0},"SpaceAgeJupiterMoon":{"premium_24h":0.5,"medals_24h":57.6,"strategy_points_24h":0.2,"money_24h":15485.0,"supplies_24h":11130.0,"random_good_of_age_24h":6.0},"SpaceAgeTitan":{"premium_24h":0.5,"medals_24h":63.9,"strategy_points_24h":0.2,"money_24h":17662.5,"supplies_24h":12357.5,"random_good_of_age_24h":6.0},"SpaceAgeSpaceHub":{"premium_24h":0.5,"medals_24h":70.2,"strategy_points_24h":0.2,"money_24h":20050.0,"supplies_24h":13872.5,"random_good_of_age_24h":6.0}} },
+    "W_AllAge_Expedition16": { prod: {"BronzeAge":{"premium_24h":0.5,"medals_24h":0.18,"strategy_points_24h":0.2,"money_24h":112.5,"supplies_24h":112.5,"random_good_of_age_24h":3.0},"IronAge":{"premium_24h":0.5,"medals_24h":0.27,"strategy_points_24h":0.2,"money_24h":270.0,"supplies_24h":270.0,"random_good_of_age_24h":3.0},"EarlyMiddleAge":{"premium_24h":0.5,"medals_24h":0.45,"strategy_points_24h":0.2,"money_24h":450.0,"supplies_24h":450.0,"random_good_of_age_24h":3.0},"HighMiddleAge":{"premium_24h":0.5,"medals_24h":0.9,"strategy_points_24h":0.2,"money_24h":630.0,"supplies_24h":625.0,"random_good_of_age_24h":3.0},"LateMiddleAge":{"premium_24h":0.5,"medals_24h":1.71,"strategy_points_24h":0.2,"money_24h":832.5,"supplies_24h":832.5,"random_good_of_age_24h":3.0},"ColonialAge":{"premium_24h":0.5,"medals_24h":2.79,"strategy_points_24h":0.2,"money_24h":1265.0,"supplies_24h":1282.5,"random_good_of_age_24h":3.0},"IndustrialAge":{"premium_24h":0.5,"medals_24h":4.41,"strategy_points_24h":0.2,"money_24h":1580.0,"supplies_24h":1555.0,"random_good_of_age_24h":3.0},"ProgressiveEra":{"premium_24h":0.5,"medals_24h":5.85,"strategy_points_24h":0.2,"money_24h":1917.5,"supplies_24h":1940.0,"random_good_of_age_24h":3.0},"ModernEra":{"premium_24h":0.5,"medals_24h":8.1,"strategy_points_24h":0.2,"money_24h":2385.0,"supplies_24h":2390.0,"random_good_of_age_24h":6.0},"PostModernEra":{"premium_24h":0.5,"medals_24h":10.8,"strategy_points_24h":0.2,"money_24h":3000.0,"supplies_24h":2750.0,"random_good_of_age_24h":6.0},"ContemporaryEra":{"premium_24h":0.5,"medals_24h":14.4,"strategy_points_24h":0.2,"money_24h":3905.0,"supplies_24h":3125.0,"random_good_of_age_24h":6.0},"TomorrowEra":{"premium_24h":0.5,"medals_24h":18.45,"strategy_points_24h":0.2,"money_24h":4522.5,"supplies_24h":3500.0,"random_good_of_age_24h":6.0},"FutureEra":{"premium_24h":0.5,"medals_24h":21.6,"strategy_points_24h":0.2,"money_24h":5275.0,"supplies_24h":4075.0,"random_good_of_age_24h":6.0},"ArcticFuture":{"premium_24h":0.5,"medals_24h":25.2,"strategy_points_24h":0.2,"money_24h":6125.0,"supplies_24h":4675.0,"random_good_of_age_24h":6.0},"OceanicFuture":{"premium_24h":0.5,"medals_24h":29.7,"strategy_points_24h":0.2,"money_24h":7050.0,"supplies_24h":5225.0,"random_good_of_age_24h":6.0},"VirtualFuture":{"premium_24h":0.5,"medals_24h":33.3,"strategy_points_24h":0.2,"money_24h":8050.0,"supplies_24h":5825.0,"random_good_of_age_24h":6.0},"SpaceAgeMars":{"premium_24h":0.5,"medals_24h":38.7,"strategy_points_24h":0.2,"money_24h":10062.5,"supplies_24h":7500.0,"random_good_of_age_24h":6.0},"SpaceAgeAsteroidBelt":{"premium_24h":0.5,"medals_24h":45.0,"strategy_points_24h":0.2,"money_24h":11700.0,"supplies_24h":8600.0,"random_good_of_age_24h":6.0},"SpaceAgeVenus":{"premium_24h":0.5,"medals_24h":51.3,"strategy_points_24h":0.2,"money_24h":13507.5,"supplies_24h":9810.0,"random_good_of_age_24h":6.0},"SpaceAgeJupiterMoon":{"premium_24h":0.5,"medals_24h":57.6,"strategy_points_24h":0.2,"money_24h":15485.0,"supplies_24h":11130.0,"random_good_of_age_24h":6.0},"SpaceAgeTitan":{"premium_24h":0.5,"medals_24h":63.9,"strategy_points_24h":0.2,"money_24h":17662.5,"supplies_24h":12357.5,"random_good_of_age_24h":6.0},"SpaceAgeSpaceHub":{"premium_24h":0.5,"medals_24h":70.2,"strategy_points_24h":0.2,"money_24h":20050.0,"supplies_24h":13872.5,"random_good_of_age_24h":6.0}} },
+    "W_MultiAge_Expedition16dGold": { prod: {"BronzeAge":{"population":117},"IronAge":{"population":241},"EarlyMiddleAge":{"population":338},"HighMiddleAge":{"population":436},"LateMiddleAge":{"population":533},"ColonialAge":{"population":637},"IndustrialAge":{"population":728},"ProgressiveEra":{"population":826},"ModernEra":{"population":917},"PostModernEra":{"population":1001},"ContemporaryEra":{"population":1086},"TomorrowEra":{"population":1164},"FutureEra":{"population":1307},"ArcticFuture":{"population":1391},"OceanicFuture":{"population":1476},"VirtualFuture":{"population":1554},"SpaceAgeMars":{"population":2366},"SpaceAgeAsteroidBelt":{"population":2483},"SpaceAgeVenus":{"population":2600},"SpaceAgeJupiterMoon":{"population":2704},"SpaceAgeTitan":{"population":2815},"SpaceAgeSpaceHub":{"population":2912}}, boosts: [{"type":"att_def_boost_attacker","value":35,"feature":"all"},{"type":"att_def_boost_attacker","value":55,"feature":"battleground"},{"type":"att_def_boost_defender","value":70,"feature":"all"},{"type":"att_def_boost_defender","value":120,"feature":"battleground"},{"type":"guild_raids_action_points_collection","value":100,"feature":"all"}] },
+    "W_MultiAge_Expedition22": { boosts: [{"type":"forge_points_production","value":20,"feature":"all"},{"type":"att_def_boost_attacker","value":50,"feature":"battleground"},{"type":"att_def_boost_attacker","value":40,"feature":"all"},{"type":"att_def_boost_attacker","value":50,"feature":"guild_raids"},{"type":"att_def_boost_defender","value":50,"feature":"battleground"},{"type":"att_def_boost_defender","value":50,"feature":"all"},{"type":"att_def_boost_defender","value":50,"feature":"guild_raids"}] },
+    "W_MultiAge_Expedition22Decoration": { prod: {"AllAge":{"happiness":250}} },
+    "W_MultiAge_Expedition16cSilver": { prod: {"BronzeAge":{"population":54},"IronAge":{"population":111},"EarlyMiddleAge":{"population":156},"HighMiddleAge":{"population":201},"LateMiddleAge":{"population":246},"ColonialAge":{"population":294},"IndustrialAge":{"population":336},"ProgressiveEra":{"population":381},"ModernEra":{"population":423},"PostModernEra":{"population":462},"ContemporaryEra":{"population":501},"TomorrowEra":{"population":537},"FutureEra":{"population":603},"ArcticFuture":{"population":642},"OceanicFuture":{"population":681},"VirtualFuture":{"population":717},"SpaceAgeMars":{"population":1092},"SpaceAgeAsteroidBelt":{"population":1146},"SpaceAgeVenus":{"population":1200},"SpaceAgeJupiterMoon":{"population":1248},"SpaceAgeTitan":{"population":1299},"SpaceAgeSpaceHub":{"population":1344}}, boosts: [{"type":"att_def_boost_attacker","value":30,"feature":"all"},{"type":"att_def_boost_attacker","value":47,"feature":"battleground"},{"type":"att_def_boost_defender","value":60,"feature":"all"},{"type":"att_def_boost_defender","value":102,"feature":"battleground"},{"type":"guild_raids_action_points_collection","value":50,"feature":"all"}] },
+    "W_AllAge_Expedition16Small": { prod: {"BronzeAge":{"premium_24h":0.5,"medals_24h":0.18,"strategy_points_24h":0.2,"money_24h":112.5,"supplies_24h":112.5,"random_good_of_age_24h":3.0},"IronAge":{"premium_24h":0.5,"medals_24h":0.27,"strategy_points_24h":0.2,"money_24h":270.0,"supplies_24h":270.0,"random_good_of_age_24h":3.0},"EarlyMiddleAge":{"premium_24h":0.5,"medals_24h":0.45,"strategy_points_24h":0.2,"money_24h":450.0,"supplies_24h":450.0,"random_good_of_age_24h":3.0},"HighMiddleAge":{"premium_24h":0.5,"medals_24h":0.9,"strategy_points_24h":0.2,"money_24h":630.0,"supplies_24h":625.0,"random_good_of_age_24h":3.0},"LateMiddleAge":{"premium_24h":0.5,"medals_24h":1.71,"strategy_points_24h":0.2,"money_24h":832.5,"supplies_24h":832.5,"random_good_of_age_24h":3.0},"ColonialAge":{"premium_24h":0.5,"medals_24h":2.79,"strategy_points_24h":0.2,"money_24h":1265.0,"supplies_24h":1282.5,"random_good_of_age_24h":3.0},"IndustrialAge":{"premium_24h":0.5,"medals_24h":4.41,"strategy_points_24h":0.2,"money_24h":1580.0,"supplies_24h":1555.0,"random_good_of_age_24h":3.0},"ProgressiveEra":{"premium_24h":0.5,"medals_24h":5.85,"strategy_points_24h":0.2,"money_24h":1917.5,"supplies_24h":1940.0,"random_good_of_age_24h":3.0},"ModernEra":{"premium_24h":0.5,"medals_24h":8.1,"strategy_points_24h":0.2,"money_24h":2385.0,"supplies_24h":2390.0,"random_good_of_age_24h":6.0},"PostModernEra":{"premium_24h":0.5,"medals_24h":10.8,"strategy_points_24h":0.2,"money_24h":3000.0,"supplies_24h":2750.0,"random_good_of_age_24h":6.0},"ContemporaryEra":{"premium_24h":0.5,"medals_24h":14.4,"strategy_points_24h":0.2,"money_24h":3905.0,"supplies_24h":3125.0,"random_good_of_age_24h":6.0},"TomorrowEra":{"premium_24h":0.5,"medals_24h":18.45,"strategy_points_24h":0.2,"money_24h":4522.5,"supplies_24h":3500.0,"random_good_of_age_24h":6.0},"FutureEra":{"premium_24h":0.5,"medals_24h":21.6,"strategy_points_24h":0.2,"money_24h":5275.0,"supplies_24h":4075.0,"random_good_of_age_24h":6.0},"ArcticFuture":{"premium_24h":0.5,"medals_24h":25.2,"strategy_points_24h":0.2,"money_24h":6125.0,"supplies_24h":4675.0,"random_good_of_age_24h":6.0},"OceanicFuture":{"premium_24h":0.5,"medals_24h":29.7,"strategy_points_24h":0.2,"money_24h":7050.0,"supplies_24h":5225.0,"random_good_of_age_24h":6.0},"VirtualFuture":{"premium_24h":0.5,"medals_24h":33.3,"strategy_points_24h":0.2,"money_24h":8050.0,"supplies_24h":5825.0,"random_good_of_age_24h":6.0},"SpaceAgeMars":{"premium_24h":0.5,"medals_24h":38.7,"strategy_points_24h":0.2,"money_24h":10062.5,"supplies_24h":7500.0,"random_good_of_age_24h":6.0},"SpaceAgeAsteroidBelt":{"premium_24h":0.5,"medals_24h":45.0,"strategy_points_24h":0.2,"money_24h":11700.0,"supplies_24h":8600.0,"random_good_of_age_24h":6.0},"SpaceAgeVenus":{"premium_24h":0.5,"medals_24h":51.3,"strategy_points_24h":0.2,"money_24h":13507.5,"supplies_24h":9810.0,"random_good_of_age_24h":6.0},"SpaceAgeJupiterMoon":{"premium_24h":0.5,"medals_24h":57.6,"strategy_points_24h":0.2,"money_24h":15485.0,"supplies_24h":11130.0,"random_good_of_age_24h":6.0},"SpaceAgeTitan":{"premium_24h":0.5,"medals_24h":63.9,"strategy_points_24h":0.2,"money_24h":17662.5,"supplies_24h":12357.5,"random_good_of_age_24h":6.0},"SpaceAgeSpaceHub":{"premium_24h":0.5,"medals_24h":70.2,"strategy_points_24h":0.2,"money_24h":20050.0,"supplies_24h":13872.5,"random_good_of_age_24h":6.0}} },
+    "W_MultiAge_Expedition16ePlatinum": { prod: {"BronzeAge":{"population":145},"IronAge":{"population":298},"EarlyMiddleAge":{"population":418},"HighMiddleAge":{"population":539},"LateMiddleAge":{"population":659},"ColonialAge":{"population":787},"IndustrialAge":{"population":900},"ProgressiveEra":{"population":1021},"ModernEra":{"population":1134},"PostModernEra":{"population":1237},"ContemporaryEra":{"population":1342},"TomorrowEra":{"population":1439},"FutureEra":{"population":1616},"ArcticFuture":{"population":1719},"OceanicFuture":{"population":1824},"VirtualFuture":{"population":1921},"SpaceAgeMars":{"population":2925},"SpaceAgeAsteroidBelt":{"population":3069},"SpaceAgeVenus":{"population":3214},"SpaceAgeJupiterMoon":{"population":3342},"SpaceAgeTitan":{"population":3480},"SpaceAgeSpaceHub":{"population":3600}}, boosts: [{"type":"att_def_boost_attacker","value":40,"feature":"all"},{"type":"att_def_boost_attacker","value":80,"feature":"battleground"},{"type":"att_def_boost_defender","value":80,"feature":"all"},{"type":"att_def_boost_defender","value":150,"feature":"battleground"},{"type":"guild_raids_action_points_collection","value":100,"feature":"all"}] },
+    "W_MultiAge_Expedition16aBase": { prod: {"BronzeAge":{"population":-140},"IronAge":{"population":-270},"EarlyMiddleAge":{"population":-390},"HighMiddleAge":{"population":-500},"LateMiddleAge":{"population":-620},"ColonialAge":{"population":-730},"IndustrialAge":{"population":-840},"ProgressiveEra":{"population":-950},"ModernEra":{"population":-1060},"PostModernEra":{"population":-1160},"ContemporaryEra":{"population":-1250},"TomorrowEra":{"population":-1350},"FutureEra":{"population":-1510},"ArcticFuture":{"population":-1600},"OceanicFuture":{"population":-1700},"VirtualFuture":{"population":-1790},"SpaceAgeMars":{"population":-2730},"SpaceAgeAsteroidBelt":{"population":-2870},"SpaceAgeVenus":{"population":-3000},"SpaceAgeJupiterMoon":{"population":-3120},"SpaceAgeTitan":{"population":-3250},"SpaceAgeSpaceHub":{"population":-3360}} },
+    "W_MultiAge_Expedition16bBase": { prod: {"BronzeAge":{"population":-180},"IronAge":{"population":-370},"EarlyMiddleAge":{"population":-520},"HighMiddleAge":{"population":-670},"LateMiddleAge":{"population":-820},"ColonialAge":{"population":-980},"IndustrialAge":{"population":-1120},"ProgressiveEra":{"population":-1270},"ModernEra":{"population":-1410},"PostModernEra":{"population":-1540},"ContemporaryEra":{"population":-1670},"TomorrowEra":{"population":-1790},"FutureEra":{"population":-2010},"ArcticFuture":{"population":-2140},"OceanicFuture":{"population":-2270},"VirtualFuture":{"population":-2390},"SpaceAgeMars":{"population":-3640},"SpaceAgeAsteroidBelt":{"population":-3820},"SpaceAgeVenus":{"population":-4000},"SpaceAgeJupiterMoon":{"population":-4160},"SpaceAgeTitan":{"population":-4330},"SpaceAgeSpaceHub":{"population":-4480}} },
+    "W_MultiAge_GEX24A2TEMP": { boosts: [{"type":"goods_production","value":20,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":150,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":100,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":50,"feature":"guild_raids"}] },
+    "W_MultiAge_GEX24A1Decoration": { prod: {"AllAge":{"happiness":250}} },
+};
@@ -0,0 +1,94 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 90 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_HAL15A4": { prod: {"AllAge":{"population":-2}}, boosts: [{"type":"guild_raids_action_points_collection","value":200,"feature":"all"}] },
+    "W_MultiAge_HAL15A3": { prod: {"AllAge":{"population":-2}} },
+    "W_MultiAge_HAL17A3": { prod: {"BronzeAge":{"population":750,"happiness":-2070,"demandHappiness":750,"money_24h":2280,"medals_24h":330,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"IronAge":{"population":1610,"happiness":-3560,"demandHappiness":1610,"money_24h":5470,"medals_24h":420,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"EarlyMiddleAge":{"population":2480,"happiness":-3940,"demandHappiness":2480,"money_24h":9110,"medals_24h":520,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"HighMiddleAge":{"population":3480,"happiness":-4390,"demandHappiness":3480,"money_24h":12750,"medals_24h":610,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"LateMiddleAge":{"population":4560,"happiness":-4900,"demandHappiness":4560,"money_24h":16850,"medals_24h":700,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"ColonialAge":{"population":5760,"happiness":-5760,"demandHappiness":5760,"money_24h":25660,"medals_24h":840,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"IndustrialAge":{"population":7040,"happiness":-6500,"demandHappiness":7040,"money_24h":31970,"medals_24h":1170,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"ProgressiveEra":{"population":8400,"happiness":-7140,"demandHappiness":8400,"money_24h":38800,"medals_24h":1640,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"ModernEra":{"population":9850,"happiness":-7630,"demandHappiness":9850,"money_24h":48280,"medals_24h":2340,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"PostModernEra":{"population":11350,"happiness":-7950,"demandHappiness":11350,"money_24h":60730,"medals_24h":3280,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"ContemporaryEra":{"population":12940,"happiness":-9240,"demandHappiness":12940,"money_24h":79070,"medals_24h":4690,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"TomorrowEra":{"population":14580,"happiness":-11220,"demandHappiness":14580,"money_24h":91550,"medals_24h":6330,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"FutureEra":{"population":16300,"happiness":-13440,"demandHappiness":16300,"money_24h":104940,"medals_24h":7730,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"ArcticFuture":{"population":18090,"happiness":-15650,"demandHappiness":18090,"money_24h":119240,"medals_24h":9380,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"OceanicFuture":{"population":19920,"happiness":-18060,"demandHappiness":19920,"money_24h":134450,"medals_24h":10780,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"VirtualFuture":{"population":21810,"happiness":-21580,"demandHappiness":21810,"money_24h":150590,"medals_24h":13130,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"SpaceAgeMars":{"population":34530,"happiness":-34530,"demandHappiness":34530,"money_24h":251550,"medals_24h":15940,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"SpaceAgeAsteroidBelt":{"population":37510,"happiness":-37520,"demandHappiness":37510,"money_24h":278620,"medals_24h":18750,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"SpaceAgeVenus":{"population":40540,"happiness":-40540,"demandHappiness":40540,"money_24h":307130,"medals_24h":21560,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"SpaceAgeJupiterMoon":{"population":43660,"happiness":-43670,"demandHappiness":43660,"money_24h":337100,"medals_24h":24380,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"SpaceAgeTitan":{"population":46830,"happiness":-46840,"demandHappiness":46830,"money_24h":368550,"medals_24h":27190,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0},"SpaceAgeSpaceHub":{"population":50000,"happiness":-50000,"demandHappiness":50000,"money_24h":400000,"medals_24h":30000,"strategy_points_24h":40,"all_goods_of_age_24h":100,"all_goods_of_previous_age_24h":50.0,"all_goods_of_next_age_24h":50.0}}, boosts: [{"type":"att_def_boost_attacker","value":100,"feature":"battleground"},{"type":"att_def_boost_attacker","value":100,"feature":"guild_expedition"},{"type":"att_boost_defender","value":15,"feature":"guild_raids"}] },
+    "W_MultiAge_HAL23E1": { prod: {"BronzeAge":{"population":-111,"happiness":-1080,"random_good_of_age_24h":20},"IronAge":{"population":-237,"happiness":-1860,"random_good_of_age_24h":20},"EarlyMiddleAge":{"population":-364,"happiness":-2060,"random_good_of_age_24h":20},"HighMiddleAge":{"population":-510,"happiness":-2300,"random_good_of_age_24h":20},"LateMiddleAge":{"population":-670,"happiness":-2560,"random_good_of_age_24h":21},"ColonialAge":{"population":-845,"happiness":-3010,"random_good_of_age_24h":21},"IndustrialAge":{"population":-1033,"happiness":-3400,"random_good_of_age_24h":21},"ProgressiveEra":{"population":-1233,"happiness":-3730,"random_good_of_age_24h":21},"ModernEra":{"population":-1445,"happiness":-3990,"random_good_of_age_24h":22},"PostModernEra":{"population":-1665,"happiness":-4160,"random_good_of_age_24h":22},"ContemporaryEra":{"population":-1898,"happiness":-4830,"random_good_of_age_24h":22},"TomorrowEra":{"population":-2138,"happiness":-5860,"random_good_of_age_24h":22},"FutureEra":{"population":-2391,"happiness":-7020,"random_good_of_age_24h":23},"ArcticFuture":{"population":-2652,"happiness":-8170,"random_good_of_age_24h":23},"OceanicFuture":{"population":-2922,"happiness":-9430,"random_good_of_age_24h":23},"VirtualFuture":{"population":-3199,"happiness":-11270,"random_good_of_age_24h":23},"SpaceAgeMars":{"population":-5064,"happiness":-18030,"random_good_of_age_24h":24},"SpaceAgeAsteroidBelt":{"population":-5500,"happiness":-19590,"random_good_of_age_24h":24},"SpaceAgeVenus":{"population":-5945,"happiness":-21160,"random_good_of_age_24h":24},"SpaceAgeJupiterMoon":{"population":-6402,"happiness":-22800,"random_good_of_age_24h":24},"SpaceAgeTitan":{"population":-6867,"happiness":-24450,"random_good_of_age_24h":25},"SpaceAgeSpaceHub":{"population":-7332,"happiness":-26100,"random_good_of_age_24h":25}}, boosts: [{"type":"def_boost_attacker","value":8,"feature":"all"},{"type":"att_boost_defender","value":14,"feature":"all"},{"type":"def_boost_defender","value":11,"feature":"all"}] },
+    "W_MultiAge_HAL25C1": { prod: {"BronzeAge":{"population":-180,"money_24h":570,"strategy_points_24h":30},"IronAge":{"population":-390,"money_24h":1370,"strategy_points_24h":30},"EarlyMiddleAge":{"population":-590,"money_24h":2280,"strategy_points_24h":30},"HighMiddleAge":{"population":-830,"money_24h":3190,"strategy_points_24h":30},"LateMiddleAge":{"population":-1100,"money_24h":4210,"strategy_points_24h":30},"ColonialAge":{"population":-1380,"money_24h":6420,"strategy_points_24h":30},"IndustrialAge":{"population":-1690,"money_24h":7990,"strategy_points_24h":30},"ProgressiveEra":{"population":-2020,"money_24h":9700,"strategy_points_24h":30},"ModernEra":{"population":-2360,"money_24h":12070,"strategy_points_24h":30},"PostModernEra":{"population":-2720,"money_24h":15180,"strategy_points_24h":30},"ContemporaryEra":{"population":-3110,"money_24h":19770,"strategy_points_24h":30},"TomorrowEra":{"population":-3500,"money_24h":22890,"strategy_points_24h":30},"FutureEra":{"population":-3910,"money_24h":26230,"strategy_points_24h":30},"ArcticFuture":{"population":-4340,"money_24h":29810,"strategy_points_24h":30},"OceanicFuture":{"population":-4780,"money_24h":33610,"strategy_points_24h":30},"VirtualFuture":{"population":-5240,"money_24h":37650,"strategy_points_24h":30},"SpaceAgeMars":{"population":-8290,"money_24h":62890,"strategy_points_24h":30},"SpaceAgeAsteroidBelt":{"population":-9000,"money_24h":69660,"strategy_points_24h":30},"SpaceAgeVenus":{"population":-9730,"money_24h":76780,"strategy_points_24h":30},"SpaceAgeJupiterMoon":{"population":-10480,"money_24h":84280,"strategy_points_24h":30},"SpaceAgeTitan":{"population":-11240,"money_24h":92140,"strategy_points_24h":30},"SpaceAgeSpaceHub":{"population":-12000,"money_24h":100000,"strategy_points_24h":30}}, boosts: [{"type":"att_def_boost_defender","value":50,"feature":"guild_expedition"}] },
+    "W_MultiAge_HAL25A11": { prod: {"BronzeAge":{"happiness":3720,"money_24h":2850,"strategy_points_24h":250},"IronAge":{"happiness":6410,"money_24h":6830,"strategy_points_24h":250},"EarlyMiddleAge":{"happiness":7090,"money_24h":11390,"strategy_points_24h":250},"HighMiddleAge":{"happiness":7910,"money_24h":15940,"strategy_points_24h":250},"LateMiddleAge":{"happiness":8820,"money_24h":21060,"strategy_points_24h":250},"ColonialAge":{"happiness":10370,"money_24h":32080,"strategy_points_24h":250},"IndustrialAge":{"happiness":11700,"money_24h":39970,"strategy_points_24h":250},"ProgressiveEra":{"happiness":12840,"money_24h":48510,"strategy_points_24h":250},"ModernEra":{"happiness":13740,"money_24h":60350,"strategy_points_24h":250},"PostModernEra":{"happiness":14320,"money_24h":75920,"strategy_points_24h":250},"ContemporaryEra":{"happiness":16640,"money_24h":98830,"strategy_points_24h":250},"TomorrowEra":{"happiness":20200,"money_24h":114430,"strategy_points_24h":250},"FutureEra":{"happiness":24200,"money_24h":131170,"strategy_points_24h":250},"ArcticFuture":{"happiness":28180,"money_24h":149050,"strategy_points_24h":250},"OceanicFuture":{"happiness":32520,"money_24h":168060,"strategy_points_24h":250},"VirtualFuture":{"happiness":38840,"money_24h":188240,"strategy_points_24h":250},"SpaceAgeMars":{"happiness":62150,"money_24h":314430,"strategy_points_24h":250},"SpaceAgeAsteroidBelt":{"happiness":67540,"money_24h":348280,"strategy_points_24h":250},"SpaceAgeVenus":{"happiness":72970,"money_24h":383920,"strategy_points_24h":250},"SpaceAgeJupiterMoon":{"happiness":78610,"money_24h":421380,"strategy_points_24h":250},"SpaceAgeTitan":{"happiness":84300,"money_24h":460690,"strategy_points_24h":250},"SpaceAgeSpaceHub":{"happiness":90000,"money_24h":500000,"strategy_points_24h":250}}, boosts: [{"type":"att_def_boost_attacker","value":238,"feature":"all"},{"type":"att_def_boost_attacker","value":358,"feature":"battleground"}] },
+    "W_MultiAge_HAL25A5": { prod: {"BronzeAge":{"happiness":1030,"money_24h":340,"strategy_points_24h":30},"IronAge":{"happiness":1780,"money_24h":820,"strategy_points_24h":30},"EarlyMiddleAge":{"happiness":1970,"money_24h":1370,"strategy_points_24h":30},"HighMiddleAge":{"happiness":2200,"money_24h":1910,"strategy_points_24h":30},"LateMiddleAge":{"happiness":2450,"money_24h":2530,"strategy_points_24h":30},"ColonialAge":{"happiness":2880,"money_24h":3850,"strategy_points_24h":30},"IndustrialAge":{"happiness":3250,"money_24h":4800,"strategy_points_24h":30},"ProgressiveEra":{"happiness":3570,"money_24h":5820,"strategy_points_24h":30},"ModernEra":{"happiness":3820,"money_24h":7240,"strategy_points_24h":30},"PostModernEra":{"happiness":3980,"money_24h":9110,"strategy_points_24h":30},"ContemporaryEra":{"happiness":4620,"money_24h":11860,"strategy_points_24h":30},"TomorrowEra":{"happiness":5610,"money_24h":13730,"strategy_points_24h":30},"FutureEra":{"happiness":6720,"money_24h":15740,"strategy_points_24h":30},"ArcticFuture":{"happiness":7830,"money_24h":17890,"strategy_points_24h":30},"OceanicFuture":{"happiness":9030,"money_24h":20170,"strategy_points_24h":30},"VirtualFuture":{"happiness":10790,"money_24h":22590,"strategy_points_24h":30},"SpaceAgeMars":{"happiness":17270,"money_24h":37730,"strategy_points_24h":30},"SpaceAgeAsteroidBelt":{"happiness":18760,"money_24h":41790,"strategy_points_24h":30},"SpaceAgeVenus":{"happiness":20270,"money_24h":46070,"strategy_points_24h":30},"SpaceAgeJupiterMoon":{"happiness":21840,"money_24h":50570,"strategy_points_24h":30},"SpaceAgeTitan":{"happiness":23420,"money_24h":55280,"strategy_points_24h":30},"SpaceAgeSpaceHub":{"happiness":25000,"money_24h":60000,"strategy_points_24h":30}}, boosts: [{"type":"att_def_boost_attacker","value":59,"feature":"all"},{"type":"att_def_boost_attacker","value":129,"feature":"battleground"}] },
+    "W_MultiAge_HAL25A1": { prod: {"BronzeAge":{"happiness":210,"money_24h":60,"strategy_points_24h":1},"IronAge":{"happiness":360,"money_24h":140,"strategy_points_24h":1},"EarlyMiddleAge":{"happiness":390,"money_24h":230,"strategy_points_24h":1},"HighMiddleAge":{"happiness":440,"money_24h":320,"strategy_points_24h":1},"LateMiddleAge":{"happiness":490,"money_24h":420,"strategy_points_24h":1},"ColonialAge":{"happiness":580,"money_24h":640,"strategy_points_24h":1},"IndustrialAge":{"happiness":650,"money_24h":800,"strategy_points_24h":1},"ProgressiveEra":{"happiness":710,"money_24h":970,"strategy_points_24h":1},"ModernEra":{"happiness":760,"money_24h":1210,"strategy_points_24h":1},"PostModernEra":{"happiness":800,"money_24h":1520,"strategy_points_24h":1},"ContemporaryEra":{"happiness":920,"money_24h":1980,"strategy_points_24h":1},"TomorrowEra":{"happiness":1120,"money_24h":2290,"strategy_points_24h":1},"FutureEra":{"happiness":1340,"money_24h":2620,"strategy_points_24h":1},"ArcticFuture":{"happiness":1570,"money_24h":2980,"strategy_points_24h":1},"OceanicFuture":{"happiness":1810,"money_24h":3360,"strategy_points_24h":1},"VirtualFuture":{"happiness":2160,"money_24h":3760,"strategy_points_24h":1},"SpaceAgeMars":{"happiness":3450,"money_24h":6290,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"happiness":3750,"money_24h":6970,"strategy_points_24h":1},"SpaceAgeVenus":{"happiness":4050,"money_24h":7680,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"happiness":4370,"money_24h":8430,"strategy_points_24h":1},"SpaceAgeTitan":{"happiness":4680,"money_24h":9210,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"happiness":5000,"money_24h":10000,"strategy_points_24h":1}} },
+    "W_MultiAge_HAL25A2": { prod: {"BronzeAge":{"happiness":410,"money_24h":110,"strategy_points_24h":5},"IronAge":{"happiness":710,"money_24h":270,"strategy_points_24h":5},"EarlyMiddleAge":{"happiness":790,"money_24h":460,"strategy_points_24h":5},"HighMiddleAge":{"happiness":880,"money_24h":640,"strategy_points_24h":5},"LateMiddleAge":{"happiness":980,"money_24h":840,"strategy_points_24h":5},"ColonialAge":{"happiness":1150,"money_24h":1280,"strategy_points_24h":5},"IndustrialAge":{"happiness":1300,"money_24h":1600,"strategy_points_24h":5},"ProgressiveEra":{"happiness":1430,"money_24h":1940,"strategy_points_24h":5},"ModernEra":{"happiness":1530,"money_24h":2410,"strategy_points_24h":5},"PostModernEra":{"happiness":1590,"money_24h":3040,"strategy_points_24h":5},"ContemporaryEra":{"happiness":1850,"money_24h":3950,"strategy_points_24h":5},"TomorrowEra":{"happiness":2240,"money_24h":4580,"strategy_points_24h":5},"FutureEra":{"happiness":2690,"money_24h":5250,"strategy_points_24h":5},"ArcticFuture":{"happiness":3130,"money_24h":5960,"strategy_points_24h":5},"OceanicFuture":{"happiness":3610,"money_24h":6720,"strategy_points_24h":5},"VirtualFuture":{"happiness":4320,"money_24h":7530,"strategy_points_24h":5},"SpaceAgeMars":{"happiness":6910,"money_24h":12580,"strategy_points_24h":5},"SpaceAgeAsteroidBelt":{"happiness":7500,"money_24h":13930,"strategy_points_24h":5},"SpaceAgeVenus":{"happiness":8110,"money_24h":15360,"strategy_points_24h":5},"SpaceAgeJupiterMoon":{"happiness":8730,"money_24h":16860,"strategy_points_24h":5},"SpaceAgeTitan":{"happiness":9370,"money_24h":18430,"strategy_points_24h":5},"SpaceAgeSpaceHub":{"happiness":10000,"money_24h":20000,"strategy_points_24h":5}}, boosts: [{"type":"att_def_boost_attacker","value":9,"feature":"all"},{"type":"att_def_boost_attacker","value":14,"feature":"battleground"}] },
+    "W_MultiAge_HAL25A3": { prod: {"BronzeAge":{"happiness":620,"money_24h":170,"strategy_points_24h":10},"IronAge":{"happiness":1070,"money_24h":410,"strategy_points_24h":10},"EarlyMiddleAge":{"happiness":1180,"money_24h":680,"strategy_points_24h":10},"HighMiddleAge":{"happiness":1320,"money_24h":960,"strategy_points_24h":10},"LateMiddleAge":{"happiness":1470,"money_24h":1260,"strategy_points_24h":10},"ColonialAge":{"happiness":1730,"money_24h":1920,"strategy_points_24h":10},"IndustrialAge":{"happiness":1950,"money_24h":2400,"strategy_points_24h":10},"ProgressiveEra":{"happiness":2140,"money_24h":2910,"strategy_points_24h":10},"ModernEra":{"happiness":2290,"money_24h":3620,"strategy_points_24h":10},"PostModernEra":{"happiness":2390,"money_24h":4560,"strategy_points_24h":10},"ContemporaryEra":{"happiness":2770,"money_24h":5930,"strategy_points_24h":10},"TomorrowEra":{"happiness":3370,"money_24h":6870,"strategy_points_24h":10},"FutureEra":{"happiness":4030,"money_24h":7870,"strategy_points_24h":10},"ArcticFuture":{"happiness":4700,"money_24h":8940,"strategy_points_24h":10},"OceanicFuture":{"happiness":5420,"money_24h":10080,"strategy_points_24h":10},"VirtualFuture":{"happiness":6470,"money_24h":11290,"strategy_points_24h":10},"SpaceAgeMars":{"happiness":10360,"money_24h":18870,"strategy_points_24h":10},"SpaceAgeAsteroidBelt":{"happiness":11260,"money_24h":20900,"strategy_points_24h":10},"SpaceAgeVenus":{"happiness":12160,"money_24h":23040,"strategy_points_24h":10},"SpaceAgeJupiterMoon":{"happiness":13100,"money_24h":25280,"strategy_points_24h":10},"SpaceAgeTitan":{"happiness":14050,"money_24h":27640,"strategy_points_24h":10},"SpaceAgeSpaceHub":{"happiness":15000,"money_24h":30000,"strategy_points_24h":10}}, boosts: [{"type":"att_def_boost_attacker","value":19,"feature":"all"},{"type":"att_def_boost_attacker","value":29,"feature":"battleground"}] },
+    "W_MultiAge_HAL25A4": { prod: {"BronzeAge":{"happiness":830,"money_24h":260,"strategy_points_24h":20},"IronAge":{"happiness":1420,"money_24h":610,"strategy_points_24h":20},"EarlyMiddleAge":{"happiness":1580,"money_24h":1020,"strategy_points_24h":20},"HighMiddleAge":{"happiness":1760,"money_24h":1430,"strategy_points_24h":20},"LateMiddleAge":{"happiness":1960,"money_24h":1900,"strategy_points_24h":20},"ColonialAge":{"happiness":2300,"money_24h":2890,"strategy_points_24h":20},"IndustrialAge":{"happiness":2600,"money_24h":3600,"strategy_points_24h":20},"ProgressiveEra":{"happiness":2850,"money_24h":4370,"strategy_points_24h":20},"ModernEra":{"happiness":3050,"money_24h":5430,"strategy_points_24h":20},"PostModernEra":{"happiness":3180,"money_24h":6830,"strategy_points_24h":20},"ContemporaryEra":{"happiness":3700,"money_24h":8890,"strategy_points_24h":20},"TomorrowEra":{"happiness":4490,"money_24h":10300,"strategy_points_24h":20},"FutureEra":{"happiness":5380,"money_24h":11810,"strategy_points_24h":20},"ArcticFuture":{"happiness":6260,"money_24h":13410,"strategy_points_24h":20},"OceanicFuture":{"happiness":7230,"money_24h":15130,"strategy_points_24h":20},"VirtualFuture":{"happiness":8630,"money_24h":16940,"strategy_points_24h":20},"SpaceAgeMars":{"happiness":13810,"money_24h":28300,"strategy_points_24h":20},"SpaceAgeAsteroidBelt":{"happiness":15010,"money_24h":31350,"strategy_points_24h":20},"SpaceAgeVenus":{"happiness":16220,"money_24h":34550,"strategy_points_24h":20},"SpaceAgeJupiterMoon":{"happiness":17470,"money_24h":37920,"strategy_points_24h":20},"SpaceAgeTitan":{"happiness":18730,"money_24h":41460,"strategy_points_24h":20},"SpaceAgeSpaceHub":{"happiness":20000,"money_24h":45000,"strategy_points_24h":20}}, boosts: [{"type":"att_def_boost_attacker","value":39,"feature":"all"},{"type":"att_def_boost_attacker","value":79,"feature":"battleground"}] },
+    "W_MultiAge_HAL25A6": { prod: {"BronzeAge":{"happiness":1240,"money_24h":460,"strategy_points_24h":40},"IronAge":{"happiness":2140,"money_24h":1090,"strategy_points_24h":40},"EarlyMiddleAge":{"happiness":2360,"money_24h":1820,"strategy_points_24h":40},"HighMiddleAge":{"happiness":2640,"money_24h":2550,"strategy_points_24h":40},"LateMiddleAge":{"happiness":2940,"money_24h":3370,"strategy_points_24h":40},"ColonialAge":{"happiness":3460,"money_24h":5130,"strategy_points_24h":40},"IndustrialAge":{"happiness":3900,"money_24h":6390,"strategy_points_24h":40},"ProgressiveEra":{"happiness":4280,"money_24h":7760,"strategy_points_24h":40},"ModernEra":{"happiness":4580,"money_24h":9660,"strategy_points_24h":40},"PostModernEra":{"happiness":4770,"money_24h":12150,"strategy_points_24h":40},"ContemporaryEra":{"happiness":5550,"money_24h":15810,"strategy_points_24h":40},"TomorrowEra":{"happiness":6730,"money_24h":18310,"strategy_points_24h":40},"FutureEra":{"happiness":8070,"money_24h":20990,"strategy_points_24h":40},"ArcticFuture":{"happiness":9390,"money_24h":23850,"strategy_points_24h":40},"OceanicFuture":{"happiness":10840,"money_24h":26890,"strategy_points_24h":40},"VirtualFuture":{"happiness":12950,"money_24h":30120,"strategy_points_24h":40},"SpaceAgeMars":{"happiness":20720,"money_24h":50310,"strategy_points_24h":40},"SpaceAgeAsteroidBelt":{"happiness":22510,"money_24h":55720,"strategy_points_24h":40},"SpaceAgeVenus":{"happiness":24320,"money_24h":61430,"strategy_points_24h":40},"SpaceAgeJupiterMoon":{"happiness":26200,"money_24h":67420,"strategy_points_24h":40},"SpaceAgeTitan":{"happiness":28100,"money_24h":73710,"strategy_points_24h":40},"SpaceAgeSpaceHub":{"happiness":30000,"money_24h":80000,"strategy_points_24h":40}}, boosts: [{"type":"att_def_boost_attacker","value":79,"feature":"all"},{"type":"att_def_boost_attacker","value":179,"feature":"battleground"}] },
+    "W_MultiAge_HAL25A7": { prod: {"BronzeAge":{"happiness":1450,"money_24h":570,"strategy_points_24h":50},"IronAge":{"happiness":2490,"money_24h":1370,"strategy_points_24h":50},"EarlyMiddleAge":{"happiness":2760,"money_24h":2280,"strategy_points_24h":50},"HighMiddleAge":{"happiness":3080,"money_24h":3190,"strategy_points_24h":50},"LateMiddleAge":{"happiness":3430,"money_24h":4210,"strategy_points_24h":50},"ColonialAge":{"happiness":4030,"money_24h":6420,"strategy_points_24h":50},"IndustrialAge":{"happiness":4550,"money_24h":7990,"strategy_points_24h":50},"ProgressiveEra":{"happiness":4990,"money_24h":9700,"strategy_points_24h":50},"ModernEra":{"happiness":5340,"money_24h":12070,"strategy_points_24h":50},"PostModernEra":{"happiness":5570,"money_24h":15180,"strategy_points_24h":50},"ContemporaryEra":{"happiness":6470,"money_24h":19770,"strategy_points_24h":50},"TomorrowEra":{"happiness":7850,"money_24h":22890,"strategy_points_24h":50},"FutureEra":{"happiness":9410,"money_24h":26230,"strategy_points_24h":50},"ArcticFuture":{"happiness":10960,"money_24h":29810,"strategy_points_24h":50},"OceanicFuture":{"happiness":12640,"money_24h":33610,"strategy_points_24h":50},"VirtualFuture":{"happiness":15110,"money_24h":37650,"strategy_points_24h":50},"SpaceAgeMars":{"happiness":24170,"money_24h":62890,"strategy_points_24h":50},"SpaceAgeAsteroidBelt":{"happiness":26270,"money_24h":69660,"strategy_points_24h":50},"SpaceAgeVenus":{"happiness":28380,"money_24h":76780,"strategy_points_24h":50},"SpaceAgeJupiterMoon":{"happiness":30570,"money_24h":84280,"strategy_points_24h":50},"SpaceAgeTitan":{"happiness":32790,"money_24h":92140,"strategy_points_24h":50},"SpaceAgeSpaceHub":{"happiness":35000,"money_24h":100000,"strategy_points_24h":50}}, boosts: [{"type":"att_def_boost_attacker","value":88,"feature":"all"},{"type":"att_def_boost_attacker","value":218,"feature":"battleground"}] },
+    "W_MultiAge_HAL25A8": { prod: {"BronzeAge":{"happiness":1860,"money_24h":1140,"strategy_points_24h":75},"IronAge":{"happiness":3210,"money_24h":2730,"strategy_points_24h":75},"EarlyMiddleAge":{"happiness":3540,"money_24h":4550,"strategy_points_24h":75},"HighMiddleAge":{"happiness":3950,"money_24h":6380,"strategy_points_24h":75},"LateMiddleAge":{"happiness":4410,"money_24h":8430,"strategy_points_24h":75},"ColonialAge":{"happiness":5190,"money_24h":12830,"strategy_points_24h":75},"IndustrialAge":{"happiness":5850,"money_24h":15990,"strategy_points_24h":75},"ProgressiveEra":{"happiness":6420,"money_24h":19400,"strategy_points_24h":75},"ModernEra":{"happiness":6870,"money_24h":24140,"strategy_points_24h":75},"PostModernEra":{"happiness":7160,"money_24h":30370,"strategy_points_24h":75},"ContemporaryEra":{"happiness":8320,"money_24h":39530,"strategy_points_24h":75},"TomorrowEra":{"happiness":10100,"money_24h":45770,"strategy_points_24h":75},"FutureEra":{"happiness":12100,"money_24h":52470,"strategy_points_24h":75},"ArcticFuture":{"happiness":14090,"money_24h":59620,"strategy_points_24h":75},"OceanicFuture":{"happiness":16260,"money_24h":67220,"strategy_points_24h":75},"VirtualFuture":{"happiness":19420,"money_24h":75300,"strategy_points_24h":75},"SpaceAgeMars":{"happiness":31080,"money_24h":125770,"strategy_points_24h":75},"SpaceAgeAsteroidBelt":{"happiness":33770,"money_24h":139310,"strategy_points_24h":75},"SpaceAgeVenus":{"happiness":36490,"money_24h":153570,"strategy_points_24h":75},"SpaceAgeJupiterMoon":{"happiness":39300,"money_24h":168550,"strategy_points_24h":75},"SpaceAgeTitan":{"happiness":42150,"money_24h":184280,"strategy_points_24h":75},"SpaceAgeSpaceHub":{"happiness":45000,"money_24h":200000,"strategy_points_24h":75}}, boosts: [{"type":"att_def_boost_attacker","value":118,"feature":"all"},{"type":"att_def_boost_attacker","value":268,"feature":"battleground"}] },
+    "W_MultiAge_HAL25A9": { prod: {"BronzeAge":{"happiness":2070,"money_24h":1710,"strategy_points_24h":150},"IronAge":{"happiness":3560,"money_24h":4100,"strategy_points_24h":150},"EarlyMiddleAge":{"happiness":3940,"money_24h":6830,"strategy_points_24h":150},"HighMiddleAge":{"happiness":4390,"money_24h":9560,"strategy_points_24h":150},"LateMiddleAge":{"happiness":4900,"money_24h":12640,"strategy_points_24h":150},"ColonialAge":{"happiness":5760,"money_24h":19250,"strategy_points_24h":150},"IndustrialAge":{"happiness":6500,"money_24h":23980,"strategy_points_24h":150},"ProgressiveEra":{"happiness":7140,"money_24h":29100,"strategy_points_24h":150},"ModernEra":{"happiness":7630,"money_24h":36210,"strategy_points_24h":150},"PostModernEra":{"happiness":7950,"money_24h":45550,"strategy_points_24h":150},"ContemporaryEra":{"happiness":9240,"money_24h":59300,"strategy_points_24h":150},"TomorrowEra":{"happiness":11220,"money_24h":68660,"strategy_points_24h":150},"FutureEra":{"happiness":13440,"money_24h":78700,"strategy_points_24h":150},"ArcticFuture":{"happiness":15650,"money_24h":89430,"strategy_points_24h":150},"OceanicFuture":{"happiness":18060,"money_24h":100840,"strategy_points_24h":150},"VirtualFuture":{"happiness":21580,"money_24h":112950,"strategy_points_24h":150},"SpaceAgeMars":{"happiness":34530,"money_24h":188660,"strategy_points_24h":150},"SpaceAgeAsteroidBelt":{"happiness":37520,"money_24h":208970,"strategy_points_24h":150},"SpaceAgeVenus":{"happiness":40540,"money_24h":230350,"strategy_points_24h":150},"SpaceAgeJupiterMoon":{"happiness":43670,"money_24h":252830,"strategy_points_24h":150},"SpaceAgeTitan":{"happiness":46840,"money_24h":276410,"strategy_points_24h":150},"SpaceAgeSpaceHub":{"happiness":50000,"money_24h":300000,"strategy_points_24h":150}}, boosts: [{"type":"att_def_boost_attacker","value":158,"feature":"all"},{"type":"att_def_boost_attacker","value":318,"feature":"battleground"}] },
+    "W_MultiAge_HAL25A10": { prod: {"BronzeAge":{"happiness":3100,"money_24h":2280,"strategy_points_24h":200},"IronAge":{"happiness":5340,"money_24h":5470,"strategy_points_24h":200},"EarlyMiddleAge":{"happiness":5910,"money_24h":9110,"strategy_points_24h":200},"HighMiddleAge":{"happiness":6590,"money_24h":12750,"strategy_points_24h":200},"LateMiddleAge":{"happiness":7350,"money_24h":16850,"strategy_points_24h":200},"ColonialAge":{"happiness":8640,"money_24h":25660,"strategy_points_24h":200},"IndustrialAge":{"happiness":9750,"money_24h":31970,"strategy_points_24h":200},"ProgressiveEra":{"happiness":10700,"money_24h":38800,"strategy_points_24h":200},"ModernEra":{"happiness":11450,"money_24h":48280,"strategy_points_24h":200},"PostModernEra":{"happiness":11930,"money_24h":60730,"strategy_points_24h":200},"ContemporaryEra":{"happiness":13860,"money_24h":79070,"strategy_points_24h":200},"TomorrowEra":{"happiness":16830,"money_24h":91550,"strategy_points_24h":200},"FutureEra":{"happiness":20160,"money_24h":104940,"strategy_points_24h":200},"ArcticFuture":{"happiness":23480,"money_24h":119240,"strategy_points_24h":200},"OceanicFuture":{"happiness":27100,"money_24h":134450,"strategy_points_24h":200},"VirtualFuture":{"happiness":32370,"money_24h":150590,"strategy_points_24h":200},"SpaceAgeMars":{"happiness":51800,"money_24h":251550,"strategy_points_24h":200},"SpaceAgeAsteroidBelt":{"happiness":56290,"money_24h":278620,"strategy_points_24h":200},"SpaceAgeVenus":{"happiness":60810,"money_24h":307130,"strategy_points_24h":200},"SpaceAgeJupiterMoon":{"happiness":65510,"money_24h":337100,"strategy_points_24h":200},"SpaceAgeTitan":{"happiness":70250,"money_24h":368550,"strategy_points_24h":200},"SpaceAgeSpaceHub":{"happiness":75000,"money_24h":400000,"strategy_points_24h":200}}, boosts: [{"type":"att_def_boost_attacker","value":188,"feature":"all"},{"type":"att_def_boost_attacker","value":333,"feature":"battleground"}] },
+    "W_MultiAge_HAL24D1": { prod: {"BronzeAge":{"population":150,"happiness":-129,"demandHappiness":150,"supplies_24h":3640,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"IronAge":{"population":325,"happiness":-264,"demandHappiness":325,"supplies_24h":8720,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"EarlyMiddleAge":{"population":500,"happiness":-399,"demandHappiness":500,"supplies_24h":14540,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"HighMiddleAge":{"population":675,"happiness":-534,"demandHappiness":675,"supplies_24h":20360,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"LateMiddleAge":{"population":850,"happiness":-669,"demandHappiness":850,"supplies_24h":26900,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"ColonialAge":{"population":1025,"happiness":-804,"demandHappiness":1025,"supplies_24h":34170,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"IndustrialAge":{"population":1200,"happiness":-939,"demandHappiness":1200,"supplies_24h":41440,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"ProgressiveEra":{"population":1375,"happiness":-1074,"demandHappiness":1375,"supplies_24h":48710,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"ModernEra":{"population":1550,"happiness":-1209,"demandHappiness":1550,"supplies_24h":56710,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"PostModernEra":{"population":1725,"happiness":-1344,"demandHappiness":1725,"supplies_24h":64700,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"ContemporaryEra":{"population":1900,"happiness":-1479,"demandHappiness":1900,"supplies_24h":72700,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"TomorrowEra":{"population":2075,"happiness":-1614,"demandHappiness":2075,"supplies_24h":81420,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"FutureEra":{"population":2250,"happiness":-1749,"demandHappiness":2250,"supplies_24h":89420,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"ArcticFuture":{"population":2425,"happiness":-1884,"demandHappiness":2425,"supplies_24h":98150,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"OceanicFuture":{"population":2600,"happiness":-2019,"demandHappiness":2600,"supplies_24h":107600,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"VirtualFuture":{"population":2775,"happiness":-2154,"demandHappiness":2775,"supplies_24h":116320,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"SpaceAgeMars":{"population":2950,"happiness":-2289,"demandHappiness":2950,"supplies_24h":188290,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"SpaceAgeAsteroidBelt":{"population":3125,"happiness":-2424,"demandHappiness":3125,"supplies_24h":202110,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"SpaceAgeVenus":{"population":3300,"happiness":-2559,"demandHappiness":3300,"supplies_24h":216650,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"SpaceAgeJupiterMoon":{"population":3475,"happiness":-2694,"demandHappiness":3475,"supplies_24h":230460,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"SpaceAgeTitan":{"population":3650,"happiness":-2829,"demandHappiness":3650,"supplies_24h":245000,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"SpaceAgeSpaceHub":{"population":4000,"happiness":-3095,"demandHappiness":4000,"supplies_24h":259550,"strategy_points_24h":120,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0}}, boosts: [{"type":"att_def_boost_attacker","value":130,"feature":"all"},{"type":"att_boost_attacker","value":25,"feature":"guild_raids"}] },
+    "W_MultiAge_HAL25E1": { prod: {"AllAge":{"strategy_points_24h":65,"random_good_of_previous_age_24h":20.0,"random_good_of_age_24h":20.0,"random_good_of_next_age_24h":5.0},"BronzeAge":{"population":-600},"IronAge":{"population":-1290},"EarlyMiddleAge":{"population":-1980},"HighMiddleAge":{"population":-2780},"LateMiddleAge":{"population":-3650},"ColonialAge":{"population":-4610},"IndustrialAge":{"population":-5630},"ProgressiveEra":{"population":-6720},"ModernEra":{"population":-7880},"PostModernEra":{"population":-9080},"ContemporaryEra":{"population":-10350},"TomorrowEra":{"population":-11660},"FutureEra":{"population":-13040},"ArcticFuture":{"population":-14470},"OceanicFuture":{"population":-15940},"VirtualFuture":{"population":-17450},"SpaceAgeMars":{"population":-27620},"SpaceAgeAsteroidBelt":{"population":-30010},"SpaceAgeVenus":{"population":-32430},"SpaceAgeJupiterMoon":{"population":-34920},"SpaceAgeTitan":{"population":-37460},"SpaceAgeSpaceHub":{"population":-40000}}, boosts: [{"type":"att_def_boost_attacker_defender","value":50,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":60,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":60,"feature":"guild_expedition"}] },
+    "W_MultiAge_HAL25E2": { prod: {"AllAge":{"strategy_points_24h":200,"random_good_of_previous_age_24h":60.0,"random_good_of_age_24h":60.0,"random_good_of_next_age_24h":20.0},"BronzeAge":{"population":-600},"IronAge":{"population":-1290},"EarlyMiddleAge":{"population":-1980},"HighMiddleAge":{"population":-2780},"LateMiddleAge":{"population":-3650},"ColonialAge":{"population":-4610},"IndustrialAge":{"population":-5630},"ProgressiveEra":{"population":-6720},"ModernEra":{"population":-7880},"PostModernEra":{"population":-9080},"ContemporaryEra":{"population":-10350},"TomorrowEra":{"population":-11660},"FutureEra":{"population":-13040},"ArcticFuture":{"population":-14470},"OceanicFuture":{"population":-15940},"VirtualFuture":{"population":-17450},"SpaceAgeMars":{"population":-27620},"SpaceAgeAsteroidBelt":{"population":-30010},"SpaceAgeVenus":{"population":-32430},"SpaceAgeJupiterMoon":{"population":-34920},"SpaceAgeTitan":{"population":-37460},"SpaceAgeSpaceHub":{"population":-40000}}, boosts: [{"type":"att_def_boost_attacker_defender","value":100,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":185,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":185,"feature":"guild_expedition"}] },
+    "W_MultiAge_HAL19A1": { prod: {"BronzeAge":{"population":1,"happiness":-110,"demandHappiness":1,"money_24h":1400},"IronAge":{"population":1,"happiness":-190,"demandHappiness":1,"money_24h":3300},"EarlyMiddleAge":{"population":1,"happiness":-210,"demandHappiness":1,"money_24h":5500},"HighMiddleAge":{"population":1,"happiness":-240,"demandHappiness":1,"money_24h":7700},"LateMiddleAge":{"population":1,"happiness":-270,"demandHappiness":1,"money_24h":10200},"ColonialAge":{"population":1,"happiness":-310,"demandHappiness":1,"money_24h":15500},"IndustrialAge":{"population":1,"happiness":-350,"demandHappiness":1,"money_24h":19300},"ProgressiveEra":{"population":1,"happiness":-390,"demandHappiness":1,"money_24h":23400},"ModernEra":{"population":1,"happiness":-420,"demandHappiness":1,"money_24h":29200},"PostModernEra":{"population":1,"happiness":-430,"demandHappiness":1,"money_24h":36700},"ContemporaryEra":{"population":1,"happiness":-500,"demandHappiness":1,"money_24h":47700},"TomorrowEra":{"population":1,"happiness":-610,"demandHappiness":1,"money_24h":55300},"FutureEra":{"population":1,"happiness":-730,"demandHappiness":1,"money_24h":63400},"ArcticFuture":{"population":1,"happiness":-850,"demandHappiness":1,"money_24h":72000},"OceanicFuture":{"population":1,"happiness":-980,"demandHappiness":1,"money_24h":81200},"VirtualFuture":{"population":1,"happiness":-1180,"demandHappiness":1,"money_24h":90900},"SpaceAgeMars":{"population":1,"happiness":-1880,"demandHappiness":1,"money_24h":151900},"SpaceAgeAsteroidBelt":{"population":1,"happiness":-2050,"demandHappiness":1,"money_24h":168200},"SpaceAgeVenus":{"population":1,"happiness":-2210,"demandHappiness":1,"money_24h":185500},"SpaceAgeJupiterMoon":{"population":1,"happiness":-2380,"demandHappiness":1,"money_24h":203500},"SpaceAgeTitan":{"population":1,"happiness":-2550,"demandHappiness":1,"money_24h":222500},"SpaceAgeSpaceHub":{"population":1,"happiness":-2730,"demandHappiness":1,"money_24h":242400}} },
+    "W_MultiAge_HAL19A2": { prod: {"BronzeAge":{"population":1,"happiness":-110,"demandHappiness":1,"money_24h":1400,"all_goods_of_age_24h":5},"IronAge":{"population":1,"happiness":-190,"demandHappiness":1,"money_24h":3500,"all_goods_of_age_24h":5},"EarlyMiddleAge":{"population":1,"happiness":-210,"demandHappiness":1,"money_24h":5800,"all_goods_of_age_24h":5},"HighMiddleAge":{"population":1,"happiness":-240,"demandHappiness":1,"money_24h":8100,"all_goods_of_age_24h":5},"LateMiddleAge":{"population":1,"happiness":-270,"demandHappiness":1,"money_24h":10600,"all_goods_of_age_24h":5},"ColonialAge":{"population":1,"happiness":-310,"demandHappiness":1,"money_24h":16200,"all_goods_of_age_24h":5},"IndustrialAge":{"population":1,"happiness":-350,"demandHappiness":1,"money_24h":20200,"all_goods_of_age_24h":5},"ProgressiveEra":{"population":1,"happiness":-390,"demandHappiness":1,"money_24h":24500,"all_goods_of_age_24h":5},"ModernEra":{"population":1,"happiness":-420,"demandHappiness":1,"money_24h":30500,"all_goods_of_age_24h":5},"PostModernEra":{"population":1,"happiness":-430,"demandHappiness":1,"money_24h":38300,"all_goods_of_age_24h":5},"ContemporaryEra":{"population":1,"happiness":-500,"demandHappiness":1,"money_24h":49900,"all_goods_of_age_24h":5},"TomorrowEra":{"population":1,"happiness":-610,"demandHappiness":1,"money_24h":57800,"all_goods_of_age_24h":5},"FutureEra":{"population":1,"happiness":-730,"demandHappiness":1,"money_24h":66200,"all_goods_of_age_24h":5},"ArcticFuture":{"population":1,"happiness":-850,"demandHappiness":1,"money_24h":75300,"all_goods_of_age_24h":5},"OceanicFuture":{"population":1,"happiness":-980,"demandHappiness":1,"money_24h":84900,"all_goods_of_age_24h":5},"VirtualFuture":{"population":1,"happiness":-1180,"demandHappiness":1,"money_24h":95100,"all_goods_of_age_24h":5},"SpaceAgeMars":{"population":1,"happiness":-1880,"demandHappiness":1,"money_24h":158800,"all_goods_of_age_24h":5},"SpaceAgeAsteroidBelt":{"population":1,"happiness":-2050,"demandHappiness":1,"money_24h":175900,"all_goods_of_age_24h":5},"SpaceAgeVenus":{"population":1,"happiness":-2210,"demandHappiness":1,"money_24h":193900,"all_goods_of_age_24h":5},"SpaceAgeJupiterMoon":{"population":1,"happiness":-2380,"demandHappiness":1,"money_24h":212800,"all_goods_of_age_24h":5},"SpaceAgeTitan":{"population":1,"happiness":-2550,"demandHappiness":1,"money_24h":232700,"all_goods_of_age_24h":5},"SpaceAgeSpaceHub":{"population":1,"happiness":-2730,"demandHappiness":1,"money_24h":253400,"all_goods_of_age_24h":5}} },
+    "W_MultiAge_HAL19A3": { prod: {"BronzeAge":{"population":1,"happiness":-110,"demandHappiness":1,"money_24h":1500,"all_goods_of_age_24h":5,"strategy_points_24h":1},"IronAge":{"population":1,"happiness":-190,"demandHappiness":1,"money_24h":3600,"all_goods_of_age_24h":5,"strategy_points_24h":1},"EarlyMiddleAge":{"population":1,"happiness":-210,"demandHappiness":1,"money_24h":6000,"all_goods_of_age_24h":5,"strategy_points_24h":1},"HighMiddleAge":{"population":1,"happiness":-240,"demandHappiness":1,"money_24h":8400,"all_goods_of_age_24h":5,"strategy_points_24h":1},"LateMiddleAge":{"population":1,"happiness":-270,"demandHappiness":1,"money_24h":11100,"all_goods_of_age_24h":5,"strategy_points_24h":1},"ColonialAge":{"population":1,"happiness":-310,"demandHappiness":1,"money_24h":16900,"all_goods_of_age_24h":5,"strategy_points_24h":1},"IndustrialAge":{"population":1,"happiness":-350,"demandHappiness":1,"money_24h":21100,"all_goods_of_age_24h":5,"strategy_points_24h":1},"ProgressiveEra":{"population":1,"happiness":-390,"demandHappiness":1,"money_24h":25600,"all_goods_of_age_24h":5,"strategy_points_24h":1},"ModernEra":{"population":1,"happiness":-420,"demandHappiness":1,"money_24h":31800,"all_goods_of_age_24h":5,"strategy_points_24h":1},"PostModernEra":{"population":1,"happiness":-430,"demandHappiness":1,"money_24h":40000,"all_goods_of_age_24h":5,"strategy_points_24h":1},"ContemporaryEra":{"population":1,"happiness":-500,"demandHappiness":1,"money_24h":52100,"all_goods_of_age_24h":5,"strategy_points_24h":1},"TomorrowEra":{"population":1,"happiness":-610,"demandHappiness":1,"money_24h":60300,"all_goods_of_age_24h":5,"strategy_points_24h":1},"FutureEra":{"population":1,"happiness":-730,"demandHappiness":1,"money_24h":69100,"all_goods_of_age_24h":5,"strategy_points_24h":1},"ArcticFuture":{"population":1,"happiness":-850,"demandHappiness":1,"money_24h":78500,"all_goods_of_age_24h":5,"strategy_points_24h":1},"OceanicFuture":{"population":1,"happiness":-980,"demandHappiness":1,"money_24h":88600,"all_goods_of_age_24h":5,"strategy_points_24h":1},"VirtualFuture":{"population":1,"happiness":-1180,"demandHappiness":1,"money_24h":99200,"all_goods_of_age_24h":5,"strategy_points_24h":1},"SpaceAgeMars":{"population":1,"happiness":-1880,"demandHappiness":1,"money_24h":165700,"all_goods_of_age_24h":5,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"population":1,"happiness":-2050,"demandHappiness":1,"money_24h":183500,"all_goods_of_age_24h":5,"strategy_points_24h":1},"SpaceAgeVenus":{"population":1,"happiness":-2210,"demandHappiness":1,"money_24h":202300,"all_goods_of_age_24h":5,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"population":1,"happiness":-2380,"demandHappiness":1,"money_24h":222100,"all_goods_of_age_24h":5,"strategy_points_24h":1},"SpaceAgeTitan":{"population":1,"happiness":-2550,"demandHappiness":1,"money_24h":242800,"all_goods_of_age_24h":5,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"population":1,"happiness":-2730,"demandHappiness":1,"money_24h":264400,"all_goods_of_age_24h":5,"strategy_points_24h":1}} },
+    "W_MultiAge_HAL19A4": { prod: {"BronzeAge":{"population":1,"happiness":-110,"demandHappiness":1,"money_24h":1600,"all_goods_of_age_24h":10,"strategy_points_24h":1},"IronAge":{"population":1,"happiness":-190,"demandHappiness":1,"money_24h":3800,"all_goods_of_age_24h":10,"strategy_points_24h":1},"EarlyMiddleAge":{"population":1,"happiness":-210,"demandHappiness":1,"money_24h":6300,"all_goods_of_age_24h":10,"strategy_points_24h":1},"HighMiddleAge":{"population":1,"happiness":-240,"demandHappiness":1,"money_24h":8800,"all_goods_of_age_24h":10,"strategy_points_24h":1},"LateMiddleAge":{"population":1,"happiness":-270,"demandHappiness":1,"money_24h":11600,"all_goods_of_age_24h":10,"strategy_points_24h":1},"ColonialAge":{"population":1,"happiness":-310,"demandHappiness":1,"money_24h":17600,"all_goods_of_age_24h":10,"strategy_points_24h":1},"IndustrialAge":{"population":1,"happiness":-350,"demandHappiness":1,"money_24h":21900,"all_goods_of_age_24h":10,"strategy_points_24h":1},"ProgressiveEra":{"population":1,"happiness":-390,"demandHappiness":1,"money_24h":26600,"all_goods_of_age_24h":10,"strategy_points_24h":1},"ModernEra":{"population":1,"happiness":-420,"demandHappiness":1,"money_24h":33100,"all_goods_of_age_24h":10,"strategy_points_24h":1},"PostModernEra":{"population":1,"happiness":-430,"demandHappiness":1,"money_24h":41700,"all_goods_of_age_24h":10,"strategy_points_24h":1},"ContemporaryEra":{"population":1,"happiness":-500,"demandHappiness":1,"money_24h":54300,"all_goods_of_age_24h":10,"strategy_points_24h":1},"TomorrowEra":{"population":1,"happiness":-610,"demandHappiness":1,"money_24h":62800,"all_goods_of_age_24h":10,"strategy_points_24h":1},"FutureEra":{"population":1,"happiness":-730,"demandHappiness":1,"money_24h":72000,"all_goods_of_age_24h":10,"strategy_points_24h":1},"ArcticFuture":{"population":1,"happiness":-850,"demandHappiness":1,"money_24h":81800,"all_goods_of_age_24h":10,"strategy_points_24h":1},"OceanicFuture":{"population":1,"happiness":-980,"demandHappiness":1,"money_24h":92300,"all_goods_of_age_24h":10,"strategy_points_24h":1},"VirtualFuture":{"population":1,"happiness":-1180,"demandHappiness":1,"money_24h":103300,"all_goods_of_age_24h":10,"strategy_points_24h":1},"SpaceAgeMars":{"population":1,"happiness":-1880,"demandHappiness":1,"money_24h":172600,"all_goods_of_age_24h":10,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"population":1,"happiness":-2050,"demandHappiness":1,"money_24h":191200,"all_goods_of_age_24h":10,"strategy_points_24h":1},"SpaceAgeVenus":{"population":1,"happiness":-2210,"demandHappiness":1,"money_24h":210700,"all_goods_of_age_24h":10,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"population":1,"happiness":-2380,"demandHappiness":1,"money_24h":231300,"all_goods_of_age_24h":10,"strategy_points_24h":1},"SpaceAgeTitan":{"population":1,"happiness":-2550,"demandHappiness":1,"money_24h":252900,"all_goods_of_age_24h":10,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"population":1,"happiness":-2730,"demandHappiness":1,"money_24h":275500,"all_goods_of_age_24h":10,"strategy_points_24h":1}} },
+    "W_MultiAge_HAL19A5": { prod: {"BronzeAge":{"population":1,"happiness":-110,"demandHappiness":1,"money_24h":1600,"all_goods_of_age_24h":10,"strategy_points_24h":3},"IronAge":{"population":1,"happiness":-190,"demandHappiness":1,"money_24h":3900,"all_goods_of_age_24h":10,"strategy_points_24h":3},"EarlyMiddleAge":{"population":1,"happiness":-210,"demandHappiness":1,"money_24h":6500,"all_goods_of_age_24h":10,"strategy_points_24h":3},"HighMiddleAge":{"population":1,"happiness":-240,"demandHappiness":1,"money_24h":9100,"all_goods_of_age_24h":10,"strategy_points_24h":3},"LateMiddleAge":{"population":1,"happiness":-270,"demandHappiness":1,"money_24h":12000,"all_goods_of_age_24h":10,"strategy_points_24h":3},"ColonialAge":{"population":1,"happiness":-310,"demandHappiness":1,"money_24h":18300,"all_goods_of_age_24h":10,"strategy_points_24h":3},"IndustrialAge":{"population":1,"happiness":-350,"demandHappiness":1,"money_24h":22800,"all_goods_of_age_24h":10,"strategy_points_24h":3},"ProgressiveEra":{"population":1,"happiness":-390,"demandHappiness":1,"money_24h":27700,"all_goods_of_age_24h":10,"strategy_points_24h":3},"ModernEra":{"population":1,"happiness":-420,"demandHappiness":1,"money_24h":34500,"all_goods_of_age_24h":10,"strategy_points_24h":3},"PostModernEra":{"population":1,"happiness":-430,"demandHappiness":1,"money_24h":43300,"all_goods_of_age_24h":10,"strategy_points_24h":3},"ContemporaryEra":{"population":1,"happiness":-500,"demandHappiness":1,"money_24h":56400,"all_goods_of_age_24h":10,"strategy_points_24h":3},"TomorrowEra":{"population":1,"happiness":-610,"demandHappiness":1,"money_24h":65300,"all_goods_of_age_24h":10,"strategy_points_24h":3},"FutureEra":{"population":1,"happiness":-730,"demandHappiness":1,"money_24h":74900,"all_goods_of_age_24h":10,"strategy_points_24h":3},"ArcticFuture":{"population":1,"happiness":-850,"demandHappiness":1,"money_24h":85100,"all_goods_of_age_24h":10,"strategy_points_24h":3},"OceanicFuture":{"population":1,"happiness":-980,"demandHappiness":1,"money_24h":95900,"all_goods_of_age_24h":10,"strategy_points_24h":3},"VirtualFuture":{"population":1,"happiness":-1180,"demandHappiness":1,"money_24h":107500,"all_goods_of_age_24h":10,"strategy_points_24h":3},"SpaceAgeMars":{"population":1,"happiness":-1880,"demandHappiness":1,"money_24h":179500,"all_goods_of_age_24h":10,"strategy_points_24h":3},"SpaceAgeAsteroidBelt":{"population":1,"happiness":-2050,"demandHappiness":1,"money_24h":198800,"all_goods_of_age_24h":10,"strategy_points_24h":3},"SpaceAgeVenus":{"population":1,"happiness":-2210,"demandHappiness":1,"money_24h":219200,"all_goods_of_age_24h":10,"strategy_points_24h":3},"SpaceAgeJupiterMoon":{"population":1,"happiness":-2380,"demandHappiness":1,"money_24h":240600,"all_goods_of_age_24h":10,"strategy_points_24h":3},"SpaceAgeTitan":{"population":1,"happiness":-2550,"demandHappiness":1,"money_24h":263000,"all_goods_of_age_24h":10,"strategy_points_24h":3},"SpaceAgeSpaceHub":{"population":1,"happiness":-2730,"demandHappiness":1,"money_24h":286500,"all_goods_of_age_24h":10,"strategy_points_24h":3}} },
+    "W_MultiAge_HAL19A6": { prod: {"BronzeAge":{"population":1,"happiness":-110,"demandHappiness":1,"money_24h":1700,"all_goods_of_age_24h":15,"strategy_points_24h":3},"IronAge":{"population":1,"happiness":-190,"demandHappiness":1,"money_24h":4100,"all_goods_of_age_24h":15,"strategy_points_24h":3},"EarlyMiddleAge":{"population":1,"happiness":-210,"demandHappiness":1,"money_24h":6800,"all_goods_of_age_24h":15,"strategy_points_24h":3},"HighMiddleAge":{"population":1,"happiness":-240,"demandHappiness":1,"money_24h":9500,"all_goods_of_age_24h":15,"strategy_points_24h":3},"LateMiddleAge":{"population":1,"happiness":-270,"demandHappiness":1,"money_24h":12500,"all_goods_of_age_24h":15,"strategy_points_24h":3},"ColonialAge":{"population":1,"happiness":-310,"demandHappiness":1,"money_24h":19000,"all_goods_of_age_24h":15,"strategy_points_24h":3},"IndustrialAge":{"population":1,"happiness":-350,"demandHappiness":1,"money_24h":23700,"all_goods_of_age_24h":15,"strategy_points_24h":3},"ProgressiveEra":{"population":1,"happiness":-390,"demandHappiness":1,"money_24h":28800,"all_goods_of_age_24h":15,"strategy_points_24h":3},"ModernEra":{"population":1,"happiness":-420,"demandHappiness":1,"money_24h":35800,"all_goods_of_age_24h":15,"strategy_points_24h":3},"PostModernEra":{"population":1,"happiness":-430,"demandHappiness":1,"money_24h":45000,"all_goods_of_age_24h":15,"strategy_points_24h":3},"ContemporaryEra":{"population":1,"happiness":-500,"demandHappiness":1,"money_24h":58600,"all_goods_of_age_24h":15,"strategy_points_24h":3},"TomorrowEra":{"population":1,"happiness":-610,"demandHappiness":1,"money_24h":67800,"all_goods_of_age_24h":15,"strategy_points_24h":3},"FutureEra":{"population":1,"happiness":-730,"demandHappiness":1,"money_24h":77800,"all_goods_of_age_24h":15,"strategy_points_24h":3},"ArcticFuture":{"population":1,"happiness":-850,"demandHappiness":1,"money_24h":88400,"all_goods_of_age_24h":15,"strategy_points_24h":3},"OceanicFuture":{"population":1,"happiness":-980,"demandHappiness":1,"money_24h":99600,"all_goods_of_age_24h":15,"strategy_points_24h":3},"VirtualFuture":{"population":1,"happiness":-1180,"demandHappiness":1,"money_24h":111600,"all_goods_of_age_24h":15,"strategy_points_24h":3},"SpaceAgeMars":{"population":1,"happiness":-1880,"demandHappiness":1,"money_24h":186400,"all_goods_of_age_24h":15,"strategy_points_24h":3},"SpaceAgeAsteroidBelt":{"population":1,"happiness":-2050,"demandHappiness":1,"money_24h":206500,"all_goods_of_age_24h":15,"strategy_points_24h":3},"SpaceAgeVenus":{"population":1,"happiness":-2210,"demandHappiness":1,"money_24h":227600,"all_goods_of_age_24h":15,"strategy_points_24h":3},"SpaceAgeJupiterMoon":{"population":1,"happiness":-2380,"demandHappiness":1,"money_24h":249800,"all_goods_of_age_24h":15,"strategy_points_24h":3},"SpaceAgeTitan":{"population":1,"happiness":-2550,"demandHappiness":1,"money_24h":273100,"all_goods_of_age_24h":15,"strategy_points_24h":3},"SpaceAgeSpaceHub":{"population":1,"happiness":-2730,"demandHappiness":1,"money_24h":297500,"all_goods_of_age_24h":15,"strategy_points_24h":3}} },
+    "W_MultiAge_HAL19A7": { prod: {"BronzeAge":{"population":1,"happiness":-110,"demandHappiness":1,"money_24h":1800,"all_goods_of_age_24h":15,"strategy_points_24h":6},"IronAge":{"population":1,"happiness":-190,"demandHappiness":1,"money_24h":4200,"all_goods_of_age_24h":15,"strategy_points_24h":6},"EarlyMiddleAge":{"population":1,"happiness":-210,"demandHappiness":1,"money_24h":7000,"all_goods_of_age_24h":15,"strategy_points_24h":6},"HighMiddleAge":{"population":1,"happiness":-240,"demandHappiness":1,"money_24h":9800,"all_goods_of_age_24h":15,"strategy_points_24h":6},"LateMiddleAge":{"population":1,"happiness":-270,"demandHappiness":1,"money_24h":13000,"all_goods_of_age_24h":15,"strategy_points_24h":6},"ColonialAge":{"population":1,"happiness":-310,"demandHappiness":1,"money_24h":19700,"all_goods_of_age_24h":15,"strategy_points_24h":6},"IndustrialAge":{"population":1,"happiness":-350,"demandHappiness":1,"money_24h":24600,"all_goods_of_age_24h":15,"strategy_points_24h":6},"ProgressiveEra":{"population":1,"happiness":-390,"demandHappiness":1,"money_24h":29800,"all_goods_of_age_24h":15,"strategy_points_24h":6},"ModernEra":{"population":1,"happiness":-420,"demandHappiness":1,"money_24h":37100,"all_goods_of_age_24h":15,"strategy_points_24h":6},"PostModernEra":{"population":1,"happiness":-430,"demandHappiness":1,"money_24h":46700,"all_goods_of_age_24h":15,"strategy_points_24h":6},"ContemporaryEra":{"population":1,"happiness":-500,"demandHappiness":1,"money_24h":60800,"all_goods_of_age_24h":15,"strategy_points_24h":6},"TomorrowEra":{"population":1,"happiness":-610,"demandHappiness":1,"money_24h":70400,"all_goods_of_age_24h":15,"strategy_points_24h":6},"FutureEra":{"population":1,"happiness":-730,"demandHappiness":1,"money_24h":80600,"all_goods_of_age_24h":15,"strategy_points_24h":6},"ArcticFuture":{"population":1,"happiness":-850,"demandHappiness":1,"money_24h":91600,"all_goods_of_age_24h":15,"strategy_points_24h":6},"OceanicFuture":{"population":1,"happiness":-980,"demandHappiness":1,"money_24h":103300,"all_goods_of_age_24h":15,"strategy_points_24h":6},"VirtualFuture":{"population":1,"happiness":-1180,"demandHappiness":1,"money_24h":115700,"all_goods_of_age_24h":15,"strategy_points_24h":6},"SpaceAgeMars":{"population":1,"happiness":-1880,"demandHappiness":1,"money_24h":193300,"all_goods_of_age_24h":15,"strategy_points_24h":6},"SpaceAgeAsteroidBelt":{"population":1,"happiness":-2050,"demandHappiness":1,"money_24h":214100,"all_goods_of_age_24h":15,"strategy_points_24h":6},"SpaceAgeVenus":{"population":1,"happiness":-2210,"demandHappiness":1,"money_24h":236000,"all_goods_of_age_24h":15,"strategy_points_24h":6},"SpaceAgeJupiterMoon":{"population":1,"happiness":-2380,"demandHappiness":1,"money_24h":259100,"all_goods_of_age_24h":15,"strategy_points_24h":6},"SpaceAgeTitan":{"population":1,"happiness":-2550,"demandHappiness":1,"money_24h":283200,"all_goods_of_age_24h":15,"strategy_points_24h":6},"SpaceAgeSpaceHub":{"population":1,"happiness":-2730,"demandHappiness":1,"money_24h":308500,"all_goods_of_age_24h":15,"strategy_points_24h":6}} },
+    "W_MultiAge_HAL19A8": { prod: {"BronzeAge":{"population":1,"happiness":-110,"demandHappiness":1,"money_24h":1800,"all_goods_of_age_24h":20,"strategy_points_24h":6},"IronAge":{"population":1,"happiness":-190,"demandHappiness":1,"money_24h":4400,"all_goods_of_age_24h":20,"strategy_points_24h":6},"EarlyMiddleAge":{"population":1,"happiness":-210,"demandHappiness":1,"money_24h":7300,"all_goods_of_age_24h":20,"strategy_points_24h":6},"HighMiddleAge":{"population":1,"happiness":-240,"demandHappiness":1,"money_24h":10200,"all_goods_of_age_24h":20,"strategy_points_24h":6},"LateMiddleAge":{"population":1,"happiness":-270,"demandHappiness":1,"money_24h":13400,"all_goods_of_age_24h":20,"strategy_points_24h":6},"ColonialAge":{"population":1,"happiness":-310,"demandHappiness":1,"money_24h":20400,"all_goods_of_age_24h":20,"strategy_points_24h":6},"IndustrialAge":{"population":1,"happiness":-350,"demandHappiness":1,"money_24h":25500,"all_goods_of_age_24h":20,"strategy_points_24h":6},"ProgressiveEra":{"population":1,"happiness":-390,"demandHappiness":1,"money_24h":30900,"all_goods_of_age_24h":20,"strategy_points_24h":6},"ModernEra":{"population":1,"happiness":-420,"demandHappiness":1,"money_24h":38400,"all_goods_of_age_24h":20,"strategy_points_24h":6},"PostModernEra":{"population":1,"happiness":-430,"demandHappiness":1,"money_24h":48300,"all_goods_of_age_24h":20,"strategy_points_24h":6},"ContemporaryEra":{"population":1,"happiness":-500,"demandHappiness":1,"money_24h":62900,"all_goods_of_age_24h":20,"strategy_points_24h":6},"TomorrowEra":{"population":1,"happiness":-610,"demandHappiness":1,"money_24h":72900,"all_goods_of_age_24h":20,"strategy_points_24h":6},"FutureEra":{"population":1,"happiness":-730,"demandHappiness":1,"money_24h":83500,"all_goods_of_age_24h":20,"strategy_points_24h":6},"ArcticFuture":{"population":1,"happiness":-850,"demandHappiness":1,"money_24h":94900,"all_goods_of_age_24h":20,"strategy_points_24h":6},"OceanicFuture":{"population":1,"happiness":-980,"demandHappiness":1,"money_24h":107000,"all_goods_of_age_24h":20,"strategy_points_24h":6},"VirtualFuture":{"population":1,"happiness":-1180,"demandHappiness":1,"money_24h":119900,"all_goods_of_age_24h":20,"strategy_points_24h":6},"SpaceAgeMars":{"population":1,"happiness":-1880,"demandHappiness":1,"money_24h":200200,"all_goods_of_age_24h":20,"strategy_points_24h":6},"SpaceAgeAsteroidBelt":{"population":1,"happiness":-2050,"demandHappiness":1,"money_24h":221800,"all_goods_of_age_24h":20,"strategy_points_24h":6},"SpaceAgeVenus":{"population":1,"happiness":-2210,"demandHappiness":1,"money_24h":244500,"all_goods_of_age_24h":20,"strategy_points_24h":6},"SpaceAgeJupiterMoon":{"population":1,"happiness":-2380,"demandHappiness":1,"money_24h":268300,"all_goods_of_age_24h":20,"strategy_points_24h":6},"SpaceAgeTitan":{"population":1,"happiness":-2550,"demandHappiness":1,"money_24h":293300,"all_goods_of_age_24h":20,"strategy_points_24h":6},"SpaceAgeSpaceHub":{"population":1,"happiness":-2730,"demandHappiness":1,"money_24h":319500,"all_goods_of_age_24h":20,"strategy_points_24h":6}} },
+    "W_MultiAge_HAL19A9": { prod: {"BronzeAge":{"population":1,"happiness":-110,"demandHappiness":1,"money_24h":1900,"all_goods_of_age_24h":20,"strategy_points_24h":11},"IronAge":{"population":1,"happiness":-190,"demandHappiness":1,"money_24h":4500,"all_goods_of_age_24h":20,"strategy_points_24h":11},"EarlyMiddleAge":{"population":1,"happiness":-210,"demandHappiness":1,"money_24h":7500,"all_goods_of_age_24h":20,"strategy_points_24h":11},"HighMiddleAge":{"population":1,"happiness":-240,"demandHappiness":1,"money_24h":10500,"all_goods_of_age_24h":20,"strategy_points_24h":11},"LateMiddleAge":{"population":1,"happiness":-270,"demandHappiness":1,"money_24h":13900,"all_goods_of_age_24h":20,"strategy_points_24h":11},"ColonialAge":{"population":1,"happiness":-310,"demandHappiness":1,"money_24h":21100,"all_goods_of_age_24h":20,"strategy_points_24h":11},"IndustrialAge":{"population":1,"happiness":-350,"demandHappiness":1,"money_24h":26300,"all_goods_of_age_24h":20,"strategy_points_24h":11},"ProgressiveEra":{"population":1,"happiness":-390,"demandHappiness":1,"money_24h":32000,"all_goods_of_age_24h":20,"strategy_points_24h":11},"ModernEra":{"population":1,"happiness":-420,"demandHappiness":1,"money_24h":39800,"all_goods_of_age_24h":20,"strategy_points_24h":11},"PostModernEra":{"population":1,"happiness":-430,"demandHappiness":1,"money_24h":50000,"all_goods_of_age_24h":20,"strategy_points_24h":11},"ContemporaryEra":{"population":1,"happiness":-500,"demandHappiness":1,"money_24h":65100,"all_goods_of_age_24h":20,"strategy_points_24h":11},"TomorrowEra":{"population":1,"happiness":-610,"demandHappiness":1,"money_24h":75400,"all_goods_of_age_24h":20,"strategy_points_24h":11},"FutureEra":{"population":1,"happiness":-730,"demandHappiness":1,"money_24h":86400,"all_goods_of_age_24h":20,"strategy_points_24h":11},"ArcticFuture":{"population":1,"happiness":-850,"demandHappiness":1,"money_24h":98200,"all_goods_of_age_24h":20,"strategy_points_24h":11},"OceanicFuture":{"population":1,"happiness":-980,"demandHappiness":1,"money_24h":110700,"all_goods_of_age_24h":20,"strategy_points_24h":11},"VirtualFuture":{"population":1,"happiness":-1180,"demandHappiness":1,"money_24h":124000,"all_goods_of_age_24h":20,"strategy_points_24h":11},"SpaceAgeMars":{"population":1,"happiness":-1880,"demandHappiness":1,"money_24h":207100,"all_goods_of_age_24h":20,"strategy_points_24h":11},"SpaceAgeAsteroidBelt":{"population":1,"happiness":-2050,"demandHappiness":1,"money_24h":229400,"all_goods_of_age_24h":20,"strategy_points_24h":11},"SpaceAgeVenus":{"population":1,"happiness":-2210,"demandHappiness":1,"money_24h":252900,"all_goods_of_age_24h":20,"strategy_points_24h":11},"SpaceAgeJupiterMoon":{"population":1,"happiness":-2380,"demandHappiness":1,"money_24h":277600,"all_goods_of_age_24h":20,"strategy_points_24h":11},"SpaceAgeTitan":{"population":1,"happiness":-2550,"demandHappiness":1,"money_24h":303500,"all_goods_of_age_24h":20,"strategy_points_24h":11},"SpaceAgeSpaceHub":{"population":1,"happiness":-2730,"demandHappiness":1,"money_24h":330500,"all_goods_of_age_24h":20,"strategy_points_24h":11}}, boosts: [{"type":"att_boost_attacker","value":16,"feature":"all"}] },
+    "W_MultiAge_HAL24E1": { prod: {"BronzeAge":{"population":450,"happiness":-225,"demandHappiness":450,"medals_24h":60,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"IronAge":{"population":960,"happiness":-480,"demandHappiness":960,"medals_24h":194,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"EarlyMiddleAge":{"population":1480,"happiness":-740,"demandHappiness":1480,"medals_24h":328,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"HighMiddleAge":{"population":2080,"happiness":-1040,"demandHappiness":2080,"medals_24h":462,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"LateMiddleAge":{"population":2730,"happiness":-1365,"demandHappiness":2730,"medals_24h":596,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"ColonialAge":{"population":3440,"happiness":-1720,"demandHappiness":3440,"medals_24h":730,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"IndustrialAge":{"population":4210,"happiness":-2105,"demandHappiness":4210,"medals_24h":864,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"ProgressiveEra":{"population":5020,"happiness":-2510,"demandHappiness":5020,"medals_24h":998,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"ModernEra":{"population":5890,"happiness":-2945,"demandHappiness":5890,"medals_24h":1132,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"PostModernEra":{"population":6790,"happiness":-3395,"demandHappiness":6790,"medals_24h":1266,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"ContemporaryEra":{"population":7740,"happiness":-3870,"demandHappiness":7740,"medals_24h":1400,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"TomorrowEra":{"population":8720,"happiness":-4360,"demandHappiness":8720,"medals_24h":1534,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"FutureEra":{"population":9750,"happiness":-4875,"demandHappiness":9750,"medals_24h":1668,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"ArcticFuture":{"population":10810,"happiness":-5405,"demandHappiness":10810,"medals_24h":1802,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"OceanicFuture":{"population":11910,"happiness":-5955,"demandHappiness":11910,"medals_24h":1936,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"VirtualFuture":{"population":13040,"happiness":-6520,"demandHappiness":13040,"medals_24h":2070,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"SpaceAgeMars":{"population":20650,"happiness":-10325,"demandHappiness":20650,"medals_24h":2204,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"SpaceAgeAsteroidBelt":{"population":22430,"happiness":-11215,"demandHappiness":22430,"medals_24h":2338,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"SpaceAgeVenus":{"population":24240,"happiness":-12120,"demandHappiness":24240,"medals_24h":2472,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"SpaceAgeJupiterMoon":{"population":26100,"happiness":-13050,"demandHappiness":26100,"medals_24h":2606,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"SpaceAgeTitan":{"population":28000,"happiness":-14000,"demandHappiness":28000,"medals_24h":2740,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0},"SpaceAgeSpaceHub":{"population":29900,"happiness":-14950,"demandHappiness":29900,"medals_24h":3000,"strategy_points_24h":30,"all_goods_of_age_24h":60.0,"all_goods_of_next_age_24h":10.0}}, boosts: [{"type":"att_boost_defender","value":80,"feature":"all"},{"type":"def_boost_defender","value":60,"feature":"all"},{"type":"def_boost_attacker","value":25,"feature":"battleground"},{"type":"guild_raids_action_points_collection","value":50,"feature":"all"}] },
+    "W_MultiAge_HAL19A11": { prod: {"BronzeAge":{"population":1,"happiness":-110,"demandHappiness":1,"money_24h":2900,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"IronAge":{"population":1,"happiness":-190,"demandHappiness":1,"money_24h":4900,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"EarlyMiddleAge":{"population":1,"happiness":-210,"demandHappiness":1,"money_24h":5930,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"HighMiddleAge":{"population":1,"happiness":-240,"demandHappiness":1,"money_24h":9890,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"LateMiddleAge":{"population":1,"happiness":-270,"demandHappiness":1,"money_24h":13840,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"ColonialAge":{"population":1,"happiness":-310,"demandHappiness":1,"money_24h":18290,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"IndustrialAge":{"population":1,"happiness":-350,"demandHappiness":1,"money_24h":27850,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"ProgressiveEra":{"population":1,"happiness":-390,"demandHappiness":1,"money_24h":34700,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"ModernEra":{"population":1,"happiness":-420,"demandHappiness":1,"money_24h":42120,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"PostModernEra":{"population":1,"happiness":-430,"demandHappiness":1,"money_24h":52400,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"ContemporaryEra":{"population":1,"happiness":-500,"demandHappiness":1,"money_24h":65920,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"TomorrowEra":{"population":1,"happiness":-610,"demandHappiness":1,"money_24h":85810,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"FutureEra":{"population":1,"happiness":-730,"demandHappiness":1,"money_24h":99360,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"ArcticFuture":{"population":1,"happiness":-850,"demandHappiness":1,"money_24h":113890,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"OceanicFuture":{"population":1,"happiness":-980,"demandHappiness":1,"money_24h":129410,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"VirtualFuture":{"population":1,"happiness":-1180,"demandHappiness":1,"money_24h":145920,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"SpaceAgeMars":{"population":1,"happiness":-1880,"demandHappiness":1,"money_24h":163450,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"SpaceAgeAsteroidBelt":{"population":1,"happiness":-2050,"demandHappiness":1,"money_24h":273010,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"SpaceAgeVenus":{"population":1,"happiness":-2210,"demandHappiness":1,"money_24h":302400,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"SpaceAgeJupiterMoon":{"population":1,"happiness":-2380,"demandHappiness":1,"money_24h":333340,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"SpaceAgeTitan":{"population":1,"happiness":-2550,"demandHappiness":1,"money_24h":365870,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50},"SpaceAgeSpaceHub":{"population":1,"happiness":-2730,"demandHappiness":1,"money_24h":400000,"all_goods_of_age_24h":120,"strategy_points_24h":75,"all_goods_of_next_age_24h":50}}, boosts: [{"type":"att_boost_attacker","value":50,"feature":"all"},{"type":"att_boost_attacker","value":10,"feature":"guild_expedition"},{"type":"att_boost_attacker","value":30,"feature":"guild_raids"},{"type":"def_boost_attacker","value":75,"feature":"all"}] },
+    "W_MultiAge_HAL17A1": { prod: {"BronzeAge":{"population":1,"happiness":-90,"demandHappiness":1,"money_24h":1300,"medals_24h":6,"strategy_points_24h":3,"all_goods_of_age_24h":5},"IronAge":{"population":1,"happiness":-190,"demandHappiness":1,"money_24h":2400,"medals_24h":8,"strategy_points_24h":3,"all_goods_of_age_24h":5},"EarlyMiddleAge":{"population":1,"happiness":-260,"demandHappiness":1,"money_24h":3200,"medals_24h":10,"strategy_points_24h":3,"all_goods_of_age_24h":5},"HighMiddleAge":{"population":1,"happiness":-380,"demandHappiness":1,"money_24h":4500,"medals_24h":12,"strategy_points_24h":3,"all_goods_of_age_24h":5},"LateMiddleAge":{"population":1,"happiness":-530,"demandHappiness":1,"money_24h":5900,"medals_24h":13,"strategy_points_24h":3,"all_goods_of_age_24h":5},"ColonialAge":{"population":1,"happiness":-750,"demandHappiness":1,"money_24h":9000,"medals_24h":16,"strategy_points_24h":3,"all_goods_of_age_24h":5},"IndustrialAge":{"population":1,"happiness":-850,"demandHappiness":1,"money_24h":11200,"medals_24h":22,"strategy_points_24h":3,"all_goods_of_age_24h":5},"ProgressiveEra":{"population":1,"happiness":-1090,"demandHappiness":1,"money_24h":13600,"medals_24h":30,"strategy_points_24h":3,"all_goods_of_age_24h":5},"ModernEra":{"population":1,"happiness":-1160,"demandHappiness":1,"money_24h":17000,"medals_24h":43,"strategy_points_24h":3,"all_goods_of_age_24h":5},"PostModernEra":{"population":1,"happiness":-1390,"demandHappiness":1,"money_24h":21300,"medals_24h":60,"strategy_points_24h":3,"all_goods_of_age_24h":5},"ContemporaryEra":{"population":1,"happiness":-1610,"demandHappiness":1,"money_24h":27800,"medals_24h":86,"strategy_points_24h":3,"all_goods_of_age_24h":5},"TomorrowEra":{"population":1,"happiness":-2200,"demandHappiness":1,"money_24h":32200,"medals_24h":116,"strategy_points_24h":3,"all_goods_of_age_24h":5},"FutureEra":{"population":1,"happiness":-2640,"demandHappiness":1,"money_24h":36900,"medals_24h":142,"strategy_points_24h":3,"all_goods_of_age_24h":5},"ArcticFuture":{"population":1,"happiness":-3410,"demandHappiness":1,"money_24h":41900,"medals_24h":172,"strategy_points_24h":3,"all_goods_of_age_24h":5},"OceanicFuture":{"population":1,"happiness":-3940,"demandHappiness":1,"money_24h":47200,"medals_24h":198,"strategy_points_24h":3,"all_goods_of_age_24h":5},"VirtualFuture":{"population":1,"happiness":-4700,"demandHappiness":1,"money_24h":52900,"medals_24h":240,"strategy_points_24h":3,"all_goods_of_age_24h":5},"SpaceAgeMars":{"population":1,"happiness":-7530,"demandHappiness":1,"money_24h":88400,"medals_24h":292,"strategy_points_24h":3,"all_goods_of_age_24h":5},"SpaceAgeAsteroidBelt":{"population":1,"happiness":-8180,"demandHappiness":1,"money_24h":97900,"medals_24h":343,"strategy_points_24h":3,"all_goods_of_age_24h":5},"SpaceAgeVenus":{"population":1,"happiness":-8840,"demandHappiness":1,"money_24h":107900,"medals_24h":395,"strategy_points_24h":3,"all_goods_of_age_24h":5},"SpaceAgeJupiterMoon":{"population":1,"happiness":-9520,"demandHappiness":1,"money_24h":118400,"medals_24h":446,"strategy_points_24h":3,"all_goods_of_age_24h":5},"SpaceAgeTitan":{"population":1,"happiness":-10210,"demandHappiness":1,"money_24h":129500,"medals_24h":498,"strategy_points_24h":3,"all_goods_of_age_24h":5},"SpaceAgeSpaceHub":{"population":1,"happiness":-10920,"demandHappiness":1,"money_24h":141000,"medals_24h":549,"strategy_points_24h":3,"all_goods_of_age_24h":5}} },
+    "W_MultiAge_HAL25C2": { prod: {"BronzeAge":{"population":-180,"money_24h":710,"strategy_points_24h":60},"IronAge":{"population":-390,"money_24h":1710,"strategy_points_24h":60},"EarlyMiddleAge":{"population":-590,"money_24h":2850,"strategy_points_24h":60},"HighMiddleAge":{"population":-830,"money_24h":3990,"strategy_points_24h":60},"LateMiddleAge":{"population":-1100,"money_24h":5270,"strategy_points_24h":60},"ColonialAge":{"population":-1380,"money_24h":8020,"strategy_points_24h":60},"IndustrialAge":{"population":-1690,"money_24h":9990,"strategy_points_24h":60},"ProgressiveEra":{"population":-2020,"money_24h":12130,"strategy_points_24h":60},"ModernEra":{"population":-2360,"money_24h":15090,"strategy_points_24h":60},"PostModernEra":{"population":-2720,"money_24h":18980,"strategy_points_24h":60},"ContemporaryEra":{"population":-3110,"money_24h":24710,"strategy_points_24h":60},"TomorrowEra":{"population":-3500,"money_24h":28610,"strategy_points_24h":60},"FutureEra":{"population":-3910,"money_24h":32790,"strategy_points_24h":60},"ArcticFuture":{"population":-4340,"money_24h":37260,"strategy_points_24h":60},"OceanicFuture":{"population":-4780,"money_24h":42020,"strategy_points_24h":60},"VirtualFuture":{"population":-5240,"money_24h":47060,"strategy_points_24h":60},"SpaceAgeMars":{"population":-8290,"money_24h":78610,"strategy_points_24h":60},"SpaceAgeAsteroidBelt":{"population":-9000,"money_24h":87070,"strategy_points_24h":60},"SpaceAgeVenus":{"population":-9730,"money_24h":95980,"strategy_points_24h":60},"SpaceAgeJupiterMoon":{"population":-10480,"money_24h":105340,"strategy_points_24h":60},"SpaceAgeTitan":{"population":-11240,"money_24h":115170,"strategy_points_24h":60},"SpaceAgeSpaceHub":{"population":-12000,"money_24h":125000,"strategy_points_24h":60}}, boosts: [{"type":"att_boost_attacker","value":25,"feature":"guild_raids"},{"type":"att_def_boost_defender","value":150,"feature":"guild_expedition"},{"type":"guild_raids_supplies_production","value":3,"feature":"all"}] },
+    "W_MultiAge_HAL25B2": { prod: {"BronzeAge":{"population":-120,"supplies_24h":1050,"random_good_of_previous_age_24h":15},"IronAge":{"population":-260,"supplies_24h":2520,"random_good_of_previous_age_24h":15},"EarlyMiddleAge":{"population":-400,"supplies_24h":4200,"random_good_of_previous_age_24h":15},"HighMiddleAge":{"population":-560,"supplies_24h":5880,"random_good_of_previous_age_24h":15},"LateMiddleAge":{"population":-730,"supplies_24h":7770,"random_good_of_previous_age_24h":15},"ColonialAge":{"population":-920,"supplies_24h":9870,"random_good_of_previous_age_24h":15},"IndustrialAge":{"population":-1130,"supplies_24h":11970,"random_good_of_previous_age_24h":15},"ProgressiveEra":{"population":-1340,"supplies_24h":14080,"random_good_of_previous_age_24h":15},"ModernEra":{"population":-1580,"supplies_24h":16390,"random_good_of_previous_age_24h":15},"PostModernEra":{"population":-1820,"supplies_24h":18700,"random_good_of_previous_age_24h":15},"ContemporaryEra":{"population":-2070,"supplies_24h":21010,"random_good_of_previous_age_24h":15},"TomorrowEra":{"population":-2330,"supplies_24h":23530,"random_good_of_previous_age_24h":15},"FutureEra":{"population":-2610,"supplies_24h":25840,"random_good_of_previous_age_24h":15},"ArcticFuture":{"population":-2890,"supplies_24h":28360,"random_good_of_previous_age_24h":15},"OceanicFuture":{"population":-3190,"supplies_24h":31090,"random_good_of_previous_age_24h":15},"VirtualFuture":{"population":-3490,"supplies_24h":33610,"random_good_of_previous_age_24h":15},"SpaceAgeMars":{"population":-5520,"supplies_24h":54410,"random_good_of_previous_age_24h":15},"SpaceAgeAsteroidBelt":{"population":-6000,"supplies_24h":58400,"random_good_of_previous_age_24h":15},"SpaceAgeVenus":{"population":-6490,"supplies_24h":62610,"random_good_of_previous_age_24h":15},"SpaceAgeJupiterMoon":{"population":-6980,"supplies_24h":66600,"random_good_of_previous_age_24h":15},"SpaceAgeTitan":{"population":-7490,"supplies_24h":70800,"random_good_of_previous_age_24h":15},"SpaceAgeSpaceHub":{"population":-8000,"supplies_24h":75000,"random_good_of_previous_age_24h":15}}, boosts: [{"type":"att_def_boost_defender","value":55,"feature":"battleground"},{"type":"att_def_boost_defender","value":15,"feature":"guild_raids"},{"type":"guild_raids_coins_production","value":2,"feature":"all"}] },
+    "W_MultiAge_HAL17A2": { prod: {"BronzeAge":{"population":380,"happiness":-1030,"demandHappiness":380,"money_24h":1710,"medals_24h":220,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"IronAge":{"population":810,"happiness":-1780,"demandHappiness":810,"money_24h":4100,"medals_24h":280,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"EarlyMiddleAge":{"population":1240,"happiness":-1970,"demandHappiness":1240,"money_24h":6830,"medals_24h":340,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"HighMiddleAge":{"population":1740,"happiness":-2200,"demandHappiness":1740,"money_24h":9560,"medals_24h":410,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"LateMiddleAge":{"population":2280,"happiness":-2450,"demandHappiness":2280,"money_24h":12640,"medals_24h":470,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"ColonialAge":{"population":2880,"happiness":-2880,"demandHappiness":2880,"money_24h":19250,"medals_24h":560,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"IndustrialAge":{"population":3520,"happiness":-3250,"demandHappiness":3520,"money_24h":23980,"medals_24h":780,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"ProgressiveEra":{"population":4200,"happiness":-3570,"demandHappiness":4200,"money_24h":29100,"medals_24h":1090,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"ModernEra":{"population":4920,"happiness":-3820,"demandHappiness":4920,"money_24h":36210,"medals_24h":1560,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"PostModernEra":{"population":5680,"happiness":-3980,"demandHappiness":5680,"money_24h":45550,"medals_24h":2190,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"ContemporaryEra":{"population":6470,"happiness":-4620,"demandHappiness":6470,"money_24h":59300,"medals_24h":3130,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"TomorrowEra":{"population":7290,"happiness":-5610,"demandHappiness":7290,"money_24h":68660,"medals_24h":4220,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"FutureEra":{"population":8150,"happiness":-6720,"demandHappiness":8150,"money_24h":78700,"medals_24h":5160,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"ArcticFuture":{"population":9040,"happiness":-7830,"demandHappiness":9040,"money_24h":89430,"medals_24h":6250,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"OceanicFuture":{"population":9960,"happiness":-9030,"demandHappiness":9960,"money_24h":100840,"medals_24h":7190,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"VirtualFuture":{"population":10910,"happiness":-10790,"demandHappiness":10910,"money_24h":112950,"medals_24h":8750,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"SpaceAgeMars":{"population":17260,"happiness":-17270,"demandHappiness":17260,"money_24h":188660,"medals_24h":10630,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"SpaceAgeAsteroidBelt":{"population":18750,"happiness":-18760,"demandHappiness":18750,"money_24h":208970,"medals_24h":12500,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"SpaceAgeVenus":{"population":20270,"happiness":-20270,"demandHappiness":20270,"money_24h":230350,"medals_24h":14380,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"SpaceAgeJupiterMoon":{"population":21830,"happiness":-21840,"demandHappiness":21830,"money_24h":252830,"medals_24h":16250,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"SpaceAgeTitan":{"population":23410,"happiness":-23420,"demandHappiness":23410,"money_24h":276410,"medals_24h":18130,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0},"SpaceAgeSpaceHub":{"population":25000,"happiness":-25000,"demandHappiness":25000,"money_24h":300000,"medals_24h":20000,"strategy_points_24h":40,"all_goods_of_age_24h":50,"all_goods_of_previous_age_24h":25.0,"all_goods_of_next_age_24h":25.0}}, boosts: [{"type":"att_boost_attacker","value":150,"feature":"guild_expedition"}] },
+    "W_MultiAge_HAL19A10": { prod: {"BronzeAge":{"population":1,"happiness":-110,"demandHappiness":1,"money_24h":2100,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"IronAge":{"population":1,"happiness":-190,"demandHappiness":1,"money_24h":4500,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"EarlyMiddleAge":{"population":1,"happiness":-210,"demandHappiness":1,"money_24h":5190,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"HighMiddleAge":{"population":1,"happiness":-240,"demandHappiness":1,"money_24h":8650,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"LateMiddleAge":{"population":1,"happiness":-270,"demandHappiness":1,"money_24h":12110,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"ColonialAge":{"population":1,"happiness":-310,"demandHappiness":1,"money_24h":16000,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"IndustrialAge":{"population":1,"happiness":-350,"demandHappiness":1,"money_24h":24370,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"ProgressiveEra":{"population":1,"happiness":-390,"demandHappiness":1,"money_24h":30360,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"ModernEra":{"population":1,"happiness":-420,"demandHappiness":1,"money_24h":36850,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"PostModernEra":{"population":1,"happiness":-430,"demandHappiness":1,"money_24h":45850,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"ContemporaryEra":{"population":1,"happiness":-500,"demandHappiness":1,"money_24h":57680,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"TomorrowEra":{"population":1,"happiness":-610,"demandHappiness":1,"money_24h":75090,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"FutureEra":{"population":1,"happiness":-730,"demandHappiness":1,"money_24h":86940,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"ArcticFuture":{"population":1,"happiness":-850,"demandHappiness":1,"money_24h":99650,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"OceanicFuture":{"population":1,"happiness":-980,"demandHappiness":1,"money_24h":113240,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"VirtualFuture":{"population":1,"happiness":-1180,"demandHappiness":1,"money_24h":127680,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"SpaceAgeMars":{"population":1,"happiness":-1880,"demandHappiness":1,"money_24h":143010,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"SpaceAgeAsteroidBelt":{"population":1,"happiness":-2050,"demandHappiness":1,"money_24h":238880,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"SpaceAgeVenus":{"population":1,"happiness":-2210,"demandHappiness":1,"money_24h":264600,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"SpaceAgeJupiterMoon":{"population":1,"happiness":-2380,"demandHappiness":1,"money_24h":291670,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"SpaceAgeTitan":{"population":1,"happiness":-2550,"demandHappiness":1,"money_24h":320130,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25},"SpaceAgeSpaceHub":{"population":1,"happiness":-2730,"demandHappiness":1,"money_24h":350000,"all_goods_of_age_24h":80,"strategy_points_24h":50,"all_goods_of_next_age_24h":25}}, boosts: [{"type":"att_boost_attacker","value":50,"feature":"all"},{"type":"att_boost_attacker","value":5,"feature":"guild_expedition"},{"type":"att_boost_attacker","value":20,"feature":"guild_raids"},{"type":"def_boost_attacker","value":75,"feature":"all"}] },
+    "W_MultiAge_HAL24A1": { prod: {"BronzeAge":{"population":62,"happiness":-74,"demandHappiness":62,"supplies_24h":54,"strategy_points_24h":10},"IronAge":{"population":135,"happiness":-162,"demandHappiness":135,"supplies_24h":128,"strategy_points_24h":10},"EarlyMiddleAge":{"population":218,"happiness":-262,"demandHappiness":218,"supplies_24h":214,"strategy_points_24h":10},"HighMiddleAge":{"population":301,"happiness":-361,"demandHappiness":301,"supplies_24h":299,"strategy_points_24h":10},"LateMiddleAge":{"population":393,"happiness":-472,"demandHappiness":393,"supplies_24h":395,"strategy_points_24h":10},"ColonialAge":{"population":497,"happiness":-596,"demandHappiness":497,"supplies_24h":502,"strategy_points_24h":10},"IndustrialAge":{"population":610,"happiness":-732,"demandHappiness":610,"supplies_24h":608,"strategy_points_24h":10},"ProgressiveEra":{"population":725,"happiness":-870,"demandHappiness":725,"supplies_24h":715,"strategy_points_24h":10},"ModernEra":{"population":849,"happiness":-1019,"demandHappiness":849,"supplies_24h":832,"strategy_points_24h":10},"PostModernEra":{"population":983,"happiness":-1180,"demandHappiness":983,"supplies_24h":950,"strategy_points_24h":10},"ContemporaryEra":{"population":1118,"happiness":-1342,"demandHappiness":1118,"supplies_24h":1067,"strategy_points_24h":10},"TomorrowEra":{"population":1253,"happiness":-1504,"demandHappiness":1253,"supplies_24h":1195,"strategy_points_24h":10},"FutureEra":{"population":1408,"happiness":-1690,"demandHappiness":1408,"supplies_24h":1312,"strategy_points_24h":10},"ArcticFuture":{"population":1562,"happiness":-1874,"demandHappiness":1562,"supplies_24h":1440,"strategy_points_24h":10},"OceanicFuture":{"population":1718,"happiness":-2062,"demandHappiness":1718,"supplies_24h":1579,"strategy_points_24h":10},"VirtualFuture":{"population":1884,"happiness":-2261,"demandHappiness":1884,"supplies_24h":1707,"strategy_points_24h":10},"SpaceAgeMars":{"population":2981,"happiness":-3577,"demandHappiness":2981,"supplies_24h":2763,"strategy_points_24h":10},"SpaceAgeAsteroidBelt":{"population":3229,"happiness":-3875,"demandHappiness":3229,"supplies_24h":2965,"strategy_points_24h":10},"SpaceAgeVenus":{"population":3498,"happiness":-4198,"demandHappiness":3498,"supplies_24h":3178,"strategy_points_24h":10},"SpaceAgeJupiterMoon":{"population":3767,"happiness":-4520,"demandHappiness":3767,"supplies_24h":3381,"strategy_points_24h":10},"SpaceAgeTitan":{"population":4037,"happiness":-4844,"demandHappiness":4037,"supplies_24h":3594,"strategy_points_24h":10},"SpaceAgeSpaceHub":{"population":4306,"happiness":-5167,"demandHappiness":4306,"supplies_24h":3807,"strategy_points_24h":10}} },
+    "W_MultiAge_HAL24A2": { prod: {"BronzeAge":{"population":83,"happiness":-100,"demandHappiness":83,"supplies_24h":107,"strategy_points_24h":12},"IronAge":{"population":179,"happiness":-215,"demandHappiness":179,"supplies_24h":256,"strategy_points_24h":12},"EarlyMiddleAge":{"population":290,"happiness":-348,"demandHappiness":290,"supplies_24h":427,"strategy_points_24h":12},"HighMiddleAge":{"population":400,"happiness":-480,"demandHappiness":400,"supplies_24h":598,"strategy_points_24h":12},"LateMiddleAge":{"population":524,"happiness":-629,"demandHappiness":524,"supplies_24h":790,"strategy_points_24h":12},"ColonialAge":{"population":662,"happiness":-794,"demandHappiness":662,"supplies_24h":1003,"strategy_points_24h":12},"IndustrialAge":{"population":814,"happiness":-977,"demandHappiness":814,"supplies_24h":1216,"strategy_points_24h":12},"ProgressiveEra":{"population":966,"happiness":-1159,"demandHappiness":966,"supplies_24h":1430,"strategy_points_24h":12},"ModernEra":{"population":1132,"happiness":-1358,"demandHappiness":1132,"supplies_24h":1664,"strategy_points_24h":12},"PostModernEra":{"population":1311,"happiness":-1573,"demandHappiness":1311,"supplies_24h":1899,"strategy_points_24h":12},"ContemporaryEra":{"population":1490,"happiness":-1788,"demandHappiness":1490,"supplies_24h":2133,"strategy_points_24h":12},"TomorrowEra":{"population":1670,"happiness":-2004,"demandHappiness":1670,"supplies_24h":2389,"strategy_points_24h":12},"FutureEra":{"population":1877,"happiness":-2252,"demandHappiness":1877,"supplies_24h":2624,"strategy_points_24h":12},"ArcticFuture":{"population":2084,"happiness":-2501,"demandHappiness":2084,"supplies_24h":2880,"strategy_points_24h":12},"OceanicFuture":{"population":2291,"happiness":-2749,"demandHappiness":2291,"supplies_24h":3157,"strategy_points_24h":12},"VirtualFuture":{"population":2512,"happiness":-3014,"demandHappiness":2512,"supplies_24h":3413,"strategy_points_24h":12},"SpaceAgeMars":{"population":3974,"happiness":-4769,"demandHappiness":3974,"supplies_24h":5525,"strategy_points_24h":12},"SpaceAgeAsteroidBelt":{"population":4306,"happiness":-5167,"demandHappiness":4306,"supplies_24h":5930,"strategy_points_24h":12},"SpaceAgeVenus":{"population":4664,"happiness":-5597,"demandHappiness":4664,"supplies_24h":6356,"strategy_points_24h":12},"SpaceAgeJupiterMoon":{"population":5023,"happiness":-6028,"demandHappiness":5023,"supplies_24h":6761,"strategy_points_24h":12},"SpaceAgeTitan":{"population":5382,"happiness":-6458,"demandHappiness":5382,"supplies_24h":7188,"strategy_points_24h":12},"SpaceAgeSpaceHub":{"population":5741,"happiness":-6889,"demandHappiness":5741,"supplies_24h":7615,"strategy_points_24h":12}} },
+    "W_MultiAge_HAL24A3": { prod: {"BronzeAge":{"population":124,"happiness":-149,"demandHappiness":124,"supplies_24h":214,"strategy_points_24h":14},"IronAge":{"population":276,"happiness":-331,"demandHappiness":276,"supplies_24h":512,"strategy_points_24h":14},"EarlyMiddleAge":{"population":428,"happiness":-514,"demandHappiness":428,"supplies_24h":854,"strategy_points_24h":14},"HighMiddleAge":{"population":593,"happiness":-712,"demandHappiness":593,"supplies_24h":1195,"strategy_points_24h":14},"LateMiddleAge":{"population":787,"happiness":-944,"demandHappiness":787,"supplies_24h":1579,"strategy_points_24h":14},"ColonialAge":{"population":994,"happiness":-1193,"demandHappiness":994,"supplies_24h":2005,"strategy_points_24h":14},"IndustrialAge":{"population":1214,"happiness":-1457,"demandHappiness":1214,"supplies_24h":2432,"strategy_points_24h":14},"ProgressiveEra":{"population":1449,"happiness":-1739,"demandHappiness":1449,"supplies_24h":2859,"strategy_points_24h":14},"ModernEra":{"population":1697,"happiness":-2036,"demandHappiness":1697,"supplies_24h":3327,"strategy_points_24h":14},"PostModernEra":{"population":1960,"happiness":-2352,"demandHappiness":1960,"supplies_24h":3797,"strategy_points_24h":14},"ContemporaryEra":{"population":2236,"happiness":-2683,"demandHappiness":2236,"supplies_24h":4266,"strategy_points_24h":14},"TomorrowEra":{"population":2512,"happiness":-3014,"demandHappiness":2512,"supplies_24h":4778,"strategy_points_24h":14},"FutureEra":{"population":2815,"happiness":-3378,"demandHappiness":2815,"supplies_24h":5247,"strategy_points_24h":14},"ArcticFuture":{"population":3119,"happiness":-3743,"demandHappiness":3119,"supplies_24h":5759,"strategy_points_24h":14},"OceanicFuture":{"population":3436,"happiness":-4123,"demandHappiness":3436,"supplies_24h":6314,"strategy_points_24h":14},"VirtualFuture":{"population":3767,"happiness":-4520,"demandHappiness":3767,"supplies_24h":6825,"strategy_points_24h":14},"SpaceAgeMars":{"population":5948,"happiness":-7138,"demandHappiness":5948,"supplies_24h":11049,"strategy_points_24h":14},"SpaceAgeAsteroidBelt":{"population":6472,"happiness":-7766,"demandHappiness":6472,"supplies_24h":11859,"strategy_points_24h":14},"SpaceAgeVenus":{"population":6983,"happiness":-8380,"demandHappiness":6983,"supplies_24h":12712,"strategy_points_24h":14},"SpaceAgeJupiterMoon":{"population":7521,"happiness":-9025,"demandHappiness":7521,"supplies_24h":13522,"strategy_points_24h":14},"SpaceAgeTitan":{"population":8073,"happiness":-9688,"demandHappiness":8073,"supplies_24h":14375,"strategy_points_24h":14},"SpaceAgeSpaceHub":{"population":8625,"happiness":-10350,"demandHappiness":8625,"supplies_24h":15228,"strategy_points_24h":14}} },
+    "W_MultiAge_HAL24A4": { prod: {"BronzeAge":{"population":179,"happiness":-215,"demandHappiness":179,"supplies_24h":427,"strategy_points_24h":16},"IronAge":{"population":373,"happiness":-448,"demandHappiness":373,"supplies_24h":1024,"strategy_points_24h":16},"EarlyMiddleAge":{"population":566,"happiness":-679,"demandHappiness":566,"supplies_24h":1707,"strategy_points_24h":16},"HighMiddleAge":{"population":800,"happiness":-960,"demandHappiness":800,"supplies_24h":2389,"strategy_points_24h":16},"LateMiddleAge":{"population":1049,"happiness":-1259,"demandHappiness":1049,"supplies_24h":3157,"strategy_points_24h":16},"ColonialAge":{"population":1325,"happiness":-1590,"demandHappiness":1325,"supplies_24h":4010,"strategy_points_24h":16},"IndustrialAge":{"population":1615,"happiness":-1938,"demandHappiness":1615,"supplies_24h":4863,"strategy_points_24h":16},"ProgressiveEra":{"population":1932,"happiness":-2318,"demandHappiness":1932,"supplies_24h":5717,"strategy_points_24h":16},"ModernEra":{"population":2263,"happiness":-2716,"demandHappiness":2263,"supplies_24h":6654,"strategy_points_24h":16},"PostModernEra":{"population":2608,"happiness":-3130,"demandHappiness":2608,"supplies_24h":7593,"strategy_points_24h":16},"ContemporaryEra":{"population":2981,"happiness":-3577,"demandHappiness":2981,"supplies_24h":8532,"strategy_points_24h":16},"TomorrowEra":{"population":3353,"happiness":-4024,"demandHappiness":3353,"supplies_24h":9555,"strategy_points_24h":16},"FutureEra":{"population":3754,"happiness":-4505,"demandHappiness":3754,"supplies_24h":10494,"strategy_points_24h":16},"ArcticFuture":{"population":4154,"happiness":-4985,"demandHappiness":4154,"supplies_24h":11518,"strategy_points_24h":16},"OceanicFuture":{"population":4582,"happiness":-5498,"demandHappiness":4582,"supplies_24h":12627,"strategy_points_24h":16},"VirtualFuture":{"population":5009,"happiness":-6011,"demandHappiness":5009,"supplies_24h":13650,"strategy_points_24h":16},"SpaceAgeMars":{"population":7935,"happiness":-9522,"demandHappiness":7935,"supplies_24h":22097,"strategy_points_24h":16},"SpaceAgeAsteroidBelt":{"population":8625,"happiness":-10350,"demandHappiness":8625,"supplies_24h":23717,"strategy_points_24h":16},"SpaceAgeVenus":{"population":9315,"happiness":-11178,"demandHappiness":9315,"supplies_24h":25423,"strategy_points_24h":16},"SpaceAgeJupiterMoon":{"population":10033,"happiness":-12040,"demandHappiness":10033,"supplies_24h":27044,"strategy_points_24h":16},"SpaceAgeTitan":{"population":10764,"happiness":-12917,"demandHappiness":10764,"supplies_24h":28750,"strategy_points_24h":16},"SpaceAgeSpaceHub":{"population":11495,"happiness":-13794,"demandHappiness":11495,"supplies_24h":30456,"strategy_points_24h":16}} },
+    "W_MultiAge_HAL24A5": { prod: {"BronzeAge":{"population":221,"happiness":-265,"demandHappiness":221,"supplies_24h":853,"strategy_points_24h":20},"IronAge":{"population":469,"happiness":-563,"demandHappiness":469,"supplies_24h":2048,"strategy_points_24h":20},"EarlyMiddleAge":{"population":718,"happiness":-862,"demandHappiness":718,"supplies_24h":3413,"strategy_points_24h":20},"HighMiddleAge":{"population":994,"happiness":-1193,"demandHappiness":994,"supplies_24h":4778,"strategy_points_24h":20},"LateMiddleAge":{"population":1311,"happiness":-1573,"demandHappiness":1311,"supplies_24h":6313,"strategy_points_24h":20},"ColonialAge":{"population":1656,"happiness":-1987,"demandHappiness":1656,"supplies_24h":8020,"strategy_points_24h":20},"IndustrialAge":{"population":2029,"happiness":-2435,"demandHappiness":2029,"supplies_24h":9725,"strategy_points_24h":20},"ProgressiveEra":{"population":2415,"happiness":-2898,"demandHappiness":2415,"supplies_24h":11433,"strategy_points_24h":20},"ModernEra":{"population":2829,"happiness":-3395,"demandHappiness":2829,"supplies_24h":13308,"strategy_points_24h":20},"PostModernEra":{"population":3257,"happiness":-3908,"demandHappiness":3257,"supplies_24h":15185,"strategy_points_24h":20},"ContemporaryEra":{"population":3712,"happiness":-4454,"demandHappiness":3712,"supplies_24h":17063,"strategy_points_24h":20},"TomorrowEra":{"population":4195,"happiness":-5034,"demandHappiness":4195,"supplies_24h":19110,"strategy_points_24h":20},"FutureEra":{"population":4678,"happiness":-5614,"demandHappiness":4678,"supplies_24h":20988,"strategy_points_24h":20},"ArcticFuture":{"population":5203,"happiness":-6244,"demandHappiness":5203,"supplies_24h":23035,"strategy_points_24h":20},"OceanicFuture":{"population":5727,"happiness":-6872,"demandHappiness":5727,"supplies_24h":25253,"strategy_points_24h":20},"VirtualFuture":{"population":6265,"happiness":-7518,"demandHappiness":6265,"supplies_24h":27300,"strategy_points_24h":20},"SpaceAgeMars":{"population":9922,"happiness":-11906,"demandHappiness":9922,"supplies_24h":44193,"strategy_points_24h":20},"SpaceAgeAsteroidBelt":{"population":10778,"happiness":-12934,"demandHappiness":10778,"supplies_24h":47433,"strategy_points_24h":20},"SpaceAgeVenus":{"population":11647,"happiness":-13976,"demandHappiness":11647,"supplies_24h":50845,"strategy_points_24h":20},"SpaceAgeJupiterMoon":{"population":12544,"happiness":-15053,"demandHappiness":12544,"supplies_24h":54088,"strategy_points_24h":20},"SpaceAgeTitan":{"population":13455,"happiness":-16146,"demandHappiness":13455,"supplies_24h":57500,"strategy_points_24h":20},"SpaceAgeSpaceHub":{"population":14366,"happiness":-17239,"demandHappiness":14366,"supplies_24h":60912,"strategy_points_24h":20}} },
+    "W_MultiAge_HAL24A6": { prod: {"BronzeAge":{"population":262,"happiness":-314,"demandHappiness":262,"supplies_24h":1705,"strategy_points_24h":25},"IronAge":{"population":552,"happiness":-662,"demandHappiness":552,"supplies_24h":4095,"strategy_points_24h":25},"EarlyMiddleAge":{"population":856,"happiness":-1027,"demandHappiness":856,"supplies_24h":6825,"strategy_points_24h":25},"HighMiddleAge":{"population":1201,"happiness":-1441,"demandHappiness":1201,"supplies_24h":9555,"strategy_points_24h":25},"LateMiddleAge":{"population":1573,"happiness":-1888,"demandHappiness":1573,"supplies_24h":12625,"strategy_points_24h":25},"ColonialAge":{"population":1987,"happiness":-2384,"demandHappiness":1987,"supplies_24h":16040,"strategy_points_24h":25},"IndustrialAge":{"population":2429,"happiness":-2915,"demandHappiness":2429,"supplies_24h":19450,"strategy_points_24h":25},"ProgressiveEra":{"population":2898,"happiness":-3478,"demandHappiness":2898,"supplies_24h":22865,"strategy_points_24h":25},"ModernEra":{"population":3395,"happiness":-4074,"demandHappiness":3395,"supplies_24h":26615,"strategy_points_24h":25},"PostModernEra":{"population":3919,"happiness":-4703,"demandHappiness":3919,"supplies_24h":30370,"strategy_points_24h":25},"ContemporaryEra":{"population":4457,"happiness":-5348,"demandHappiness":4457,"supplies_24h":34125,"strategy_points_24h":25},"TomorrowEra":{"population":5023,"happiness":-6028,"demandHappiness":5023,"supplies_24h":38220,"strategy_points_24h":25},"FutureEra":{"population":5617,"happiness":-6740,"demandHappiness":5617,"supplies_24h":41975,"strategy_points_24h":25},"ArcticFuture":{"population":6238,"happiness":-7486,"demandHappiness":6238,"supplies_24h":46070,"strategy_points_24h":25},"OceanicFuture":{"population":6872,"happiness":-8246,"demandHappiness":6872,"supplies_24h":50505,"strategy_points_24h":25},"VirtualFuture":{"population":7521,"happiness":-9025,"demandHappiness":7521,"supplies_24h":54600,"strategy_points_24h":25},"SpaceAgeMars":{"population":11909,"happiness":-14291,"demandHappiness":11909,"supplies_24h":88385,"strategy_points_24h":25},"SpaceAgeAsteroidBelt":{"population":12931,"happiness":-15517,"demandHappiness":12931,"supplies_24h":94865,"strategy_points_24h":25},"SpaceAgeVenus":{"population":13979,"happiness":-16775,"demandHappiness":13979,"supplies_24h":101690,"strategy_points_24h":25},"SpaceAgeJupiterMoon":{"population":15056,"happiness":-18067,"demandHappiness":15056,"supplies_24h":108175,"strategy_points_24h":25},"SpaceAgeTitan":{"population":16146,"happiness":-19375,"demandHappiness":16146,"supplies_24h":115000,"strategy_points_24h":25},"SpaceAgeSpaceHub":{"population":17236,"happiness":-20683,"demandHappiness":17236,"supplies_24h":121825,"strategy_points_24h":25}}, boosts: [{"type":"att_def_boost_attacker","value":5,"feature":"all"}] },
+    "W_MultiAge_HAL24A7": { prod: {"BronzeAge":{"population":304,"happiness":-365,"demandHappiness":304,"supplies_24h":3410,"strategy_points_24h":30},"IronAge":{"population":649,"happiness":-779,"demandHappiness":649,"supplies_24h":8190,"strategy_points_24h":30},"EarlyMiddleAge":{"population":994,"happiness":-1193,"demandHappiness":994,"supplies_24h":13650,"strategy_points_24h":30},"HighMiddleAge":{"population":1394,"happiness":-1673,"demandHappiness":1394,"supplies_24h":19110,"strategy_points_24h":30},"LateMiddleAge":{"population":1835,"happiness":-2202,"demandHappiness":1835,"supplies_24h":25250,"strategy_points_24h":30},"ColonialAge":{"population":2318,"happiness":-2782,"demandHappiness":2318,"supplies_24h":32080,"strategy_points_24h":30},"IndustrialAge":{"population":2829,"happiness":-3395,"demandHappiness":2829,"supplies_24h":38900,"strategy_points_24h":30},"ProgressiveEra":{"population":3381,"happiness":-4057,"demandHappiness":3381,"supplies_24h":45730,"strategy_points_24h":30},"ModernEra":{"population":3961,"happiness":-4753,"demandHappiness":3961,"supplies_24h":53230,"strategy_points_24h":30},"PostModernEra":{"population":4568,"happiness":-5482,"demandHappiness":4568,"supplies_24h":60740,"strategy_points_24h":30},"ContemporaryEra":{"population":5203,"happiness":-6244,"demandHappiness":5203,"supplies_24h":68250,"strategy_points_24h":30},"TomorrowEra":{"population":5865,"happiness":-7038,"demandHappiness":5865,"supplies_24h":76440,"strategy_points_24h":30},"FutureEra":{"population":6555,"happiness":-7866,"demandHappiness":6555,"supplies_24h":83950,"strategy_points_24h":30},"ArcticFuture":{"population":7273,"happiness":-8728,"demandHappiness":7273,"supplies_24h":92140,"strategy_points_24h":30},"OceanicFuture":{"population":8018,"happiness":-9622,"demandHappiness":8018,"supplies_24h":101010,"strategy_points_24h":30},"VirtualFuture":{"population":8777,"happiness":-10532,"demandHappiness":8777,"supplies_24h":109200,"strategy_points_24h":30},"SpaceAgeMars":{"population":13897,"happiness":-16676,"demandHappiness":13897,"supplies_24h":176770,"strategy_points_24h":30},"SpaceAgeAsteroidBelt":{"population":15083,"happiness":-18100,"demandHappiness":15083,"supplies_24h":189730,"strategy_points_24h":30},"SpaceAgeVenus":{"population":16312,"happiness":-19574,"demandHappiness":16312,"supplies_24h":203380,"strategy_points_24h":30},"SpaceAgeJupiterMoon":{"population":17567,"happiness":-21080,"demandHappiness":17567,"supplies_24h":216350,"strategy_points_24h":30},"SpaceAgeTitan":{"population":18837,"happiness":-22604,"demandHappiness":18837,"supplies_24h":230000,"strategy_points_24h":30},"SpaceAgeSpaceHub":{"population":20107,"happiness":-24128,"demandHappiness":20107,"supplies_24h":243650,"strategy_points_24h":30}}, boosts: [{"type":"att_def_boost_attacker","value":10,"feature":"all"}] },
+    "W_MultiAge_HAL24A8": { prod: {"BronzeAge":{"population":345,"happiness":-414,"demandHappiness":345,"supplies_24h":3640,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"IronAge":{"population":745,"happiness":-894,"demandHappiness":745,"supplies_24h":8720,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"EarlyMiddleAge":{"population":1132,"happiness":-1358,"demandHappiness":1132,"supplies_24h":14540,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"HighMiddleAge":{"population":1601,"happiness":-1921,"demandHappiness":1601,"supplies_24h":20360,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"LateMiddleAge":{"population":2098,"happiness":-2518,"demandHappiness":2098,"supplies_24h":26900,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"ColonialAge":{"population":2650,"happiness":-3180,"demandHappiness":2650,"supplies_24h":34170,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"IndustrialAge":{"population":3243,"happiness":-3892,"demandHappiness":3243,"supplies_24h":41440,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"ProgressiveEra":{"population":3864,"happiness":-4637,"demandHappiness":3864,"supplies_24h":48710,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"ModernEra":{"population":4526,"happiness":-5431,"demandHappiness":4526,"supplies_24h":56710,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"PostModernEra":{"population":5216,"happiness":-6259,"demandHappiness":5216,"supplies_24h":64700,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"ContemporaryEra":{"population":5948,"happiness":-7138,"demandHappiness":5948,"supplies_24h":72700,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"TomorrowEra":{"population":6707,"happiness":-8048,"demandHappiness":6707,"supplies_24h":81420,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"FutureEra":{"population":7493,"happiness":-8992,"demandHappiness":7493,"supplies_24h":89420,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"ArcticFuture":{"population":8308,"happiness":-9970,"demandHappiness":8308,"supplies_24h":98150,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"OceanicFuture":{"population":9163,"happiness":-10996,"demandHappiness":9163,"supplies_24h":107600,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"VirtualFuture":{"population":10033,"happiness":-12040,"demandHappiness":10033,"supplies_24h":116320,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"SpaceAgeMars":{"population":15870,"happiness":-19044,"demandHappiness":15870,"supplies_24h":188290,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"SpaceAgeAsteroidBelt":{"population":17236,"happiness":-20683,"demandHappiness":17236,"supplies_24h":202110,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"SpaceAgeVenus":{"population":18644,"happiness":-22373,"demandHappiness":18644,"supplies_24h":216650,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"SpaceAgeJupiterMoon":{"population":20065,"happiness":-24078,"demandHappiness":20065,"supplies_24h":230460,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"SpaceAgeTitan":{"population":21528,"happiness":-25834,"demandHappiness":21528,"supplies_24h":245000,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0},"SpaceAgeSpaceHub":{"population":22991,"happiness":-27589,"demandHappiness":22991,"supplies_24h":259540,"strategy_points_24h":35,"units_24h":1,"random_good_of_age_24h":50.0,"random_good_of_previous_age_24h":75.0}}, boosts: [{"type":"att_def_boost_attacker","value":30,"feature":"all"}] },
+    "W_MultiAge_HAL24A10": { prod: {"BronzeAge":{"population":428,"happiness":-514,"demandHappiness":428,"supplies_24h":3640,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"IronAge":{"population":925,"happiness":-1110,"demandHappiness":925,"supplies_24h":8720,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"EarlyMiddleAge":{"population":1421,"happiness":-1705,"demandHappiness":1421,"supplies_24h":14540,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"HighMiddleAge":{"population":2001,"happiness":-2401,"demandHappiness":2001,"supplies_24h":20360,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"LateMiddleAge":{"population":2622,"happiness":-3146,"demandHappiness":2622,"supplies_24h":26900,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"ColonialAge":{"population":3312,"happiness":-3974,"demandHappiness":3312,"supplies_24h":34170,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"IndustrialAge":{"population":4043,"happiness":-4852,"demandHappiness":4043,"supplies_24h":41440,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"ProgressiveEra":{"population":4830,"happiness":-5796,"demandHappiness":4830,"supplies_24h":48710,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"ModernEra":{"population":5658,"happiness":-6790,"demandHappiness":5658,"supplies_24h":56710,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"PostModernEra":{"population":6527,"happiness":-7832,"demandHappiness":6527,"supplies_24h":64700,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"ContemporaryEra":{"population":7438,"happiness":-8926,"demandHappiness":7438,"supplies_24h":72700,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"TomorrowEra":{"population":8377,"happiness":-10052,"demandHappiness":8377,"supplies_24h":81420,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"FutureEra":{"population":9370,"happiness":-11244,"demandHappiness":9370,"supplies_24h":89420,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"ArcticFuture":{"population":10391,"happiness":-12469,"demandHappiness":10391,"supplies_24h":98150,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"OceanicFuture":{"population":11454,"happiness":-13745,"demandHappiness":11454,"supplies_24h":107600,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"VirtualFuture":{"population":12530,"happiness":-15036,"demandHappiness":12530,"supplies_24h":116320,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"SpaceAgeMars":{"population":19844,"happiness":-23813,"demandHappiness":19844,"supplies_24h":188290,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"SpaceAgeAsteroidBelt":{"population":21556,"happiness":-25867,"demandHappiness":21556,"supplies_24h":202110,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"SpaceAgeVenus":{"population":23294,"happiness":-27953,"demandHappiness":23294,"supplies_24h":216650,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"SpaceAgeJupiterMoon":{"population":25088,"happiness":-30106,"demandHappiness":25088,"supplies_24h":230460,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"SpaceAgeTitan":{"population":26910,"happiness":-32292,"demandHappiness":26910,"supplies_24h":245000,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0},"SpaceAgeSpaceHub":{"population":28732,"happiness":-34478,"demandHappiness":28732,"supplies_24h":259550,"strategy_points_24h":75,"units_24h":8,"random_good_of_age_24h":100.0,"random_good_of_previous_age_24h":125.0}}, boosts: [{"type":"att_def_boost_attacker","value":30,"feature":"battleground"},{"type":"att_def_boost_attacker","value":80,"feature":"all"}] },
+    "W_MultiAge_HAL24A9": { prod: {"BronzeAge":{"population":386,"happiness":-463,"demandHappiness":386,"supplies_24h":3640,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"IronAge":{"population":828,"happiness":-994,"demandHappiness":828,"supplies_24h":8720,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"EarlyMiddleAge":{"population":1283,"happiness":-1540,"demandHappiness":1283,"supplies_24h":14540,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"HighMiddleAge":{"population":1794,"happiness":-2153,"demandHappiness":1794,"supplies_24h":20360,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"LateMiddleAge":{"population":2360,"happiness":-2832,"demandHappiness":2360,"supplies_24h":26900,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"ColonialAge":{"population":2981,"happiness":-3577,"demandHappiness":2981,"supplies_24h":34170,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"IndustrialAge":{"population":3643,"happiness":-4372,"demandHappiness":3643,"supplies_24h":41440,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"ProgressiveEra":{"population":4347,"happiness":-5216,"demandHappiness":4347,"supplies_24h":48710,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"ModernEra":{"population":5092,"happiness":-6110,"demandHappiness":5092,"supplies_24h":56710,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"PostModernEra":{"population":5865,"happiness":-7038,"demandHappiness":5865,"supplies_24h":64700,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"ContemporaryEra":{"population":6693,"happiness":-8032,"demandHappiness":6693,"supplies_24h":72700,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"TomorrowEra":{"population":7535,"happiness":-9042,"demandHappiness":7535,"supplies_24h":81420,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"FutureEra":{"population":8432,"happiness":-10118,"demandHappiness":8432,"supplies_24h":89420,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"ArcticFuture":{"population":9356,"happiness":-11227,"demandHappiness":9356,"supplies_24h":98150,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"OceanicFuture":{"population":10309,"happiness":-12371,"demandHappiness":10309,"supplies_24h":107600,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"VirtualFuture":{"population":11288,"happiness":-13546,"demandHappiness":11288,"supplies_24h":116320,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"SpaceAgeMars":{"population":17857,"happiness":-21428,"demandHappiness":17857,"supplies_24h":188290,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"SpaceAgeAsteroidBelt":{"population":19403,"happiness":-23284,"demandHappiness":19403,"supplies_24h":202110,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"SpaceAgeVenus":{"population":20962,"happiness":-25154,"demandHappiness":20962,"supplies_24h":216650,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"SpaceAgeJupiterMoon":{"population":22577,"happiness":-27092,"demandHappiness":22577,"supplies_24h":230460,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"SpaceAgeTitan":{"population":24219,"happiness":-29063,"demandHappiness":24219,"supplies_24h":245000,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0},"SpaceAgeSpaceHub":{"population":25861,"happiness":-31033,"demandHappiness":25861,"supplies_24h":259540,"strategy_points_24h":50,"units_24h":4,"random_good_of_age_24h":75.0,"random_good_of_previous_age_24h":100.0}}, boosts: [{"type":"att_def_boost_attacker","value":15,"feature":"battleground"},{"type":"att_def_boost_attacker","value":55,"feature":"all"}] },
+    "W_MultiAge_HalloweenBonus22b": { boosts: [{"type":"att_boost_attacker","value":50,"feature":"all"}] },
+    "W_MultiAge_HalloweenBonus22bDecoration": { prod: {"AllAge":{"happiness":250}} },
+    "W_MultiAge_HAL24F1": { prod: {"BronzeAge":{"population":150,"happiness":-300,"demandHappiness":150,"supplies_24h":3000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"IronAge":{"population":189,"happiness":-355,"demandHappiness":189,"supplies_24h":4000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"EarlyMiddleAge":{"population":228,"happiness":-410,"demandHappiness":228,"supplies_24h":5000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"HighMiddleAge":{"population":267,"happiness":-465,"demandHappiness":267,"supplies_24h":6000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"LateMiddleAge":{"population":306,"happiness":-520,"demandHappiness":306,"supplies_24h":7000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"ColonialAge":{"population":345,"happiness":-575,"demandHappiness":345,"supplies_24h":8000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"IndustrialAge":{"population":384,"happiness":-630,"demandHappiness":384,"supplies_24h":9000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"ProgressiveEra":{"population":423,"happiness":-685,"demandHappiness":423,"supplies_24h":10000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"ModernEra":{"population":462,"happiness":-740,"demandHappiness":462,"supplies_24h":11000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"PostModernEra":{"population":501,"happiness":-795,"demandHappiness":501,"supplies_24h":12000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"ContemporaryEra":{"population":540,"happiness":-850,"demandHappiness":540,"supplies_24h":13000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"TomorrowEra":{"population":579,"happiness":-905,"demandHappiness":579,"supplies_24h":14000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"FutureEra":{"population":618,"happiness":-960,"demandHappiness":618,"supplies_24h":15000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"ArcticFuture":{"population":657,"happiness":-1015,"demandHappiness":657,"supplies_24h":16000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"OceanicFuture":{"population":696,"happiness":-1070,"demandHappiness":696,"supplies_24h":17000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"VirtualFuture":{"population":735,"happiness":-1125,"demandHappiness":735,"supplies_24h":18000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"SpaceAgeMars":{"population":774,"happiness":-1180,"demandHappiness":774,"supplies_24h":19000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"SpaceAgeAsteroidBelt":{"population":813,"happiness":-1235,"demandHappiness":813,"supplies_24h":20000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"SpaceAgeVenus":{"population":852,"happiness":-1290,"demandHappiness":852,"supplies_24h":21000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"SpaceAgeJupiterMoon":{"population":891,"happiness":-1345,"demandHappiness":891,"supplies_24h":22000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"SpaceAgeTitan":{"population":930,"happiness":-1400,"demandHappiness":930,"supplies_24h":23000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15},"SpaceAgeSpaceHub":{"population":1000,"happiness":-1500,"demandHappiness":1000,"supplies_24h":25000,"strategy_points_24h":10,"random_good_of_age_24h":10,"random_good_of_previous_age_24h":15}}, boosts: [{"type":"att_boost_attacker","value":10,"feature":"all"}] },
+    "W_MultiAge_HAL24F2": { prod: {"BronzeAge":{"population":150,"happiness":-300,"demandHappiness":150,"supplies_24h":4000,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"IronAge":{"population":189,"happiness":-355,"demandHappiness":189,"supplies_24h":5182,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"EarlyMiddleAge":{"population":228,"happiness":-410,"demandHappiness":228,"supplies_24h":6364,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"HighMiddleAge":{"population":267,"happiness":-465,"demandHappiness":267,"supplies_24h":7546,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"LateMiddleAge":{"population":306,"happiness":-520,"demandHappiness":306,"supplies_24h":8728,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"ColonialAge":{"population":345,"happiness":-575,"demandHappiness":345,"supplies_24h":9910,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"IndustrialAge":{"population":384,"happiness":-630,"demandHappiness":384,"supplies_24h":11092,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"ProgressiveEra":{"population":423,"happiness":-685,"demandHappiness":423,"supplies_24h":12274,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"ModernEra":{"population":462,"happiness":-740,"demandHappiness":462,"supplies_24h":13456,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"PostModernEra":{"population":501,"happiness":-795,"demandHappiness":501,"supplies_24h":14638,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"ContemporaryEra":{"population":540,"happiness":-850,"demandHappiness":540,"supplies_24h":15820,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"TomorrowEra":{"population":579,"happiness":-905,"demandHappiness":579,"supplies_24h":17002,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"FutureEra":{"population":618,"happiness":-960,"demandHappiness":618,"supplies_24h":18184,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"ArcticFuture":{"population":657,"happiness":-1015,"demandHappiness":657,"supplies_24h":19366,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"OceanicFuture":{"population":696,"happiness":-1070,"demandHappiness":696,"supplies_24h":20548,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"VirtualFuture":{"population":735,"happiness":-1125,"demandHappiness":735,"supplies_24h":21730,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"SpaceAgeMars":{"population":774,"happiness":-1180,"demandHappiness":774,"supplies_24h":22912,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"SpaceAgeAsteroidBelt":{"population":813,"happiness":-1235,"demandHappiness":813,"supplies_24h":24094,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"SpaceAgeVenus":{"population":852,"happiness":-1290,"demandHappiness":852,"supplies_24h":25276,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"SpaceAgeJupiterMoon":{"population":891,"happiness":-1345,"demandHappiness":891,"supplies_24h":26458,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"SpaceAgeTitan":{"population":930,"happiness":-1400,"demandHappiness":930,"supplies_24h":27640,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30},"SpaceAgeSpaceHub":{"population":1000,"happiness":-1500,"demandHappiness":1000,"supplies_24h":30000,"strategy_points_24h":15,"random_good_of_age_24h":15,"random_good_of_previous_age_24h":30}}, boosts: [{"type":"att_boost_attacker","value":25,"feature":"all"},{"type":"att_boost_attacker","value":5,"feature":"battleground"}] },
+    "W_MultiAge_HAL24F3": { prod: {"BronzeAge":{"population":150,"happiness":-300,"demandHappiness":150,"supplies_24h":5000,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"IronAge":{"population":189,"happiness":-355,"demandHappiness":189,"supplies_24h":6591,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"EarlyMiddleAge":{"population":228,"happiness":-410,"demandHappiness":228,"supplies_24h":8182,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"HighMiddleAge":{"population":267,"happiness":-465,"demandHappiness":267,"supplies_24h":9773,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"LateMiddleAge":{"population":306,"happiness":-520,"demandHappiness":306,"supplies_24h":11364,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"ColonialAge":{"population":345,"happiness":-575,"demandHappiness":345,"supplies_24h":12955,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"IndustrialAge":{"population":384,"happiness":-630,"demandHappiness":384,"supplies_24h":14546,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"ProgressiveEra":{"population":423,"happiness":-685,"demandHappiness":423,"supplies_24h":16137,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"ModernEra":{"population":462,"happiness":-740,"demandHappiness":462,"supplies_24h":17728,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"PostModernEra":{"population":501,"happiness":-795,"demandHappiness":501,"supplies_24h":19319,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"ContemporaryEra":{"population":540,"happiness":-850,"demandHappiness":540,"supplies_24h":20910,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"TomorrowEra":{"population":579,"happiness":-905,"demandHappiness":579,"supplies_24h":22501,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"FutureEra":{"population":618,"happiness":-960,"demandHappiness":618,"supplies_24h":24092,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"ArcticFuture":{"population":657,"happiness":-1015,"demandHappiness":657,"supplies_24h":25683,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"OceanicFuture":{"population":696,"happiness":-1070,"demandHappiness":696,"supplies_24h":27274,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"VirtualFuture":{"population":735,"happiness":-1125,"demandHappiness":735,"supplies_24h":28865,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"SpaceAgeMars":{"population":774,"happiness":-1180,"demandHappiness":774,"supplies_24h":30456,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"SpaceAgeAsteroidBelt":{"population":813,"happiness":-1235,"demandHappiness":813,"supplies_24h":32047,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"SpaceAgeVenus":{"population":852,"happiness":-1290,"demandHappiness":852,"supplies_24h":33638,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"SpaceAgeJupiterMoon":{"population":891,"happiness":-1345,"demandHappiness":891,"supplies_24h":35229,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"SpaceAgeTitan":{"population":930,"happiness":-1400,"demandHappiness":930,"supplies_24h":36820,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45},"SpaceAgeSpaceHub":{"population":1000,"happiness":-1500,"demandHappiness":1000,"supplies_24h":40000,"strategy_points_24h":25,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":45}}, boosts: [{"type":"att_boost_attacker","value":30,"feature":"all"},{"type":"att_boost_attacker","value":8,"feature":"battleground"},{"type":"att_boost_attacker","value":5,"feature":"guild_expedition"}] },
+    "W_MultiAge_HAL25B1": { prod: {"BronzeAge":{"population":-120,"supplies_24h":700,"random_good_of_previous_age_24h":10},"IronAge":{"population":-260,"supplies_24h":1680,"random_good_of_previous_age_24h":10},"EarlyMiddleAge":{"population":-400,"supplies_24h":2800,"random_good_of_previous_age_24h":10},"HighMiddleAge":{"population":-560,"supplies_24h":3920,"random_good_of_previous_age_24h":10},"LateMiddleAge":{"population":-730,"supplies_24h":5180,"random_good_of_previous_age_24h":10},"ColonialAge":{"population":-920,"supplies_24h":6580,"random_good_of_previous_age_24h":10},"IndustrialAge":{"population":-1130,"supplies_24h":7980,"random_good_of_previous_age_24h":10},"ProgressiveEra":{"population":-1340,"supplies_24h":9380,"random_good_of_previous_age_24h":10},"ModernEra":{"population":-1580,"supplies_24h":10920,"random_good_of_previous_age_24h":10},"PostModernEra":{"population":-1820,"supplies_24h":12460,"random_good_of_previous_age_24h":10},"ContemporaryEra":{"population":-2070,"supplies_24h":14010,"random_good_of_previous_age_24h":10},"TomorrowEra":{"population":-2330,"supplies_24h":15690,"random_good_of_previous_age_24h":10},"FutureEra":{"population":-2610,"supplies_24h":17230,"random_good_of_previous_age_24h":10},"ArcticFuture":{"population":-2890,"supplies_24h":18910,"random_good_of_previous_age_24h":10},"OceanicFuture":{"population":-3190,"supplies_24h":20730,"random_good_of_previous_age_24h":10},"VirtualFuture":{"population":-3490,"supplies_24h":22410,"random_good_of_previous_age_24h":10},"SpaceAgeMars":{"population":-5520,"supplies_24h":36270,"random_good_of_previous_age_24h":10},"SpaceAgeAsteroidBelt":{"population":-6000,"supplies_24h":38940,"random_good_of_previous_age_24h":10},"SpaceAgeVenus":{"population":-6490,"supplies_24h":41740,"random_good_of_previous_age_24h":10},"SpaceAgeJupiterMoon":{"population":-6980,"supplies_24h":44400,"random_good_of_previous_age_24h":10},"SpaceAgeTitan":{"population":-7490,"supplies_24h":47200,"random_good_of_previous_age_24h":10},"SpaceAgeSpaceHub":{"population":-8000,"supplies_24h":50000,"random_good_of_previous_age_24h":10}}, boosts: [{"type":"att_def_boost_defender","value":25,"feature":"battleground"}] },
+    "W_MultiAge_HalloweenBonus22a": { prod: {"AllAge":{"strategy_points_24h":20}} },
+    "W_MultiAge_HalloweenBonus22aDecoration": { prod: {"AllAge":{"happiness":250}} },
+    "W_MultiAge_HAL23G1": { prod: {"AllAge":{"strategy_points_24h":12,"random_good_of_previous_age_24h":18}}, boosts: [{"type":"att_boost_attacker","value":15,"feature":"all"},{"type":"def_boost_attacker","value":18,"feature":"all"},{"type":"att_boost_defender","value":15,"feature":"all"}] },
+    "W_MultiAge_HalloweenBonusGP22m": { prod: {"BronzeAge":{"population":150,"happiness":-90,"demandHappiness":150,"money_24h":1500,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"IronAge":{"population":320,"happiness":-160,"demandHappiness":320,"money_24h":3500,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"EarlyMiddleAge":{"population":493,"happiness":-170,"demandHappiness":493,"money_24h":6000,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"HighMiddleAge":{"population":692,"happiness":-190,"demandHappiness":692,"money_24h":8500,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"LateMiddleAge":{"population":906,"happiness":-210,"demandHappiness":906,"money_24h":11100,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"ColonialAge":{"population":1145,"happiness":-250,"demandHappiness":1145,"money_24h":16900,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"IndustrialAge":{"population":1399,"happiness":-280,"demandHappiness":1399,"money_24h":21000,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"ProgressiveEra":{"population":1669,"happiness":-310,"demandHappiness":1669,"money_24h":25500,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"ModernEra":{"population":1956,"happiness":-330,"demandHappiness":1956,"money_24h":31900,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"PostModernEra":{"population":2254,"happiness":-350,"demandHappiness":2254,"money_24h":39900,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"ContemporaryEra":{"population":2570,"happiness":-400,"demandHappiness":2570,"money_24h":52100,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"TomorrowEra":{"population":2895,"happiness":-490,"demandHappiness":2895,"money_24h":60300,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"FutureEra":{"population":3238,"happiness":-590,"demandHappiness":3238,"money_24h":69200,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"ArcticFuture":{"population":3591,"happiness":-680,"demandHappiness":3591,"money_24h":78500,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"OceanicFuture":{"population":3956,"happiness":-790,"demandHappiness":3956,"money_24h":88600,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"VirtualFuture":{"population":4332,"happiness":-940,"demandHappiness":4332,"money_24h":99100,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"SpaceAgeMars":{"population":6858,"happiness":-1510,"demandHappiness":6858,"money_24h":165600,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"SpaceAgeAsteroidBelt":{"population":7448,"happiness":-1640,"demandHappiness":7448,"money_24h":183600,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"SpaceAgeVenus":{"population":8051,"happiness":-1770,"demandHappiness":8051,"money_24h":202200,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"SpaceAgeJupiterMoon":{"population":8670,"happiness":-1900,"demandHappiness":8670,"money_24h":222000,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"SpaceAgeTitan":{"population":9337,"happiness":-2040,"demandHappiness":9337,"money_24h":243740,"strategy_points_24h":23,"random_good_of_previous_age_24h":70},"SpaceAgeSpaceHub":{"population":10004,"happiness":-2180,"demandHappiness":10004,"money_24h":265480,"strategy_points_24h":23,"random_good_of_previous_age_24h":70}}, boosts: [{"type":"att_boost_attacker","value":29,"feature":"all"},{"type":"def_boost_attacker","value":27,"feature":"all"},{"type":"att_boost_defender","value":28,"feature":"all"}] },
+    "W_MultiAge_HAL25D1": { prod: {"AllAge":{"strategy_points_24h":200,"random_good_of_previous_age_24h":100.0,"random_good_of_age_24h":100.0,"random_good_of_next_age_24h":50.0}}, boosts: [{"type":"att_def_boost_attacker_defender","value":110,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":125,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":20,"feature":"guild_raids"},{"type":"guild_goods_production","value":2,"feature":"all"}] },
+    "W_MultiAge_HAL24B1": { prod: {"BronzeAge":{"population":100,"happiness":-129,"demandHappiness":100,"medals_24h":40,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"IronAge":{"population":232,"happiness":-264,"demandHappiness":232,"medals_24h":152,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"EarlyMiddleAge":{"population":364,"happiness":-399,"demandHappiness":364,"medals_24h":264,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"HighMiddleAge":{"population":496,"happiness":-534,"demandHappiness":496,"medals_24h":376,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"LateMiddleAge":{"population":628,"happiness":-669,"demandHappiness":628,"medals_24h":488,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"ColonialAge":{"population":760,"happiness":-804,"demandHappiness":760,"medals_24h":600,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"IndustrialAge":{"population":892,"happiness":-939,"demandHappiness":892,"medals_24h":712,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"ProgressiveEra":{"population":1024,"happiness":-1074,"demandHappiness":1024,"medals_24h":824,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"ModernEra":{"population":1156,"happiness":-1209,"demandHappiness":1156,"medals_24h":936,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"PostModernEra":{"population":1288,"happiness":-1344,"demandHappiness":1288,"medals_24h":1048,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"ContemporaryEra":{"population":1420,"happiness":-1479,"demandHappiness":1420,"medals_24h":1160,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"TomorrowEra":{"population":1552,"happiness":-1614,"demandHappiness":1552,"medals_24h":1272,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"FutureEra":{"population":1684,"happiness":-1749,"demandHappiness":1684,"medals_24h":1384,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"ArcticFuture":{"population":1816,"happiness":-1884,"demandHappiness":1816,"medals_24h":1496,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"OceanicFuture":{"population":1948,"happiness":-2019,"demandHappiness":1948,"medals_24h":1608,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"VirtualFuture":{"population":2080,"happiness":-2154,"demandHappiness":2080,"medals_24h":1720,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"SpaceAgeMars":{"population":2212,"happiness":-2289,"demandHappiness":2212,"medals_24h":1832,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"SpaceAgeAsteroidBelt":{"population":2344,"happiness":-2424,"demandHappiness":2344,"medals_24h":1944,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"SpaceAgeVenus":{"population":2476,"happiness":-2559,"demandHappiness":2476,"medals_24h":2056,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"SpaceAgeJupiterMoon":{"population":2608,"happiness":-2694,"demandHappiness":2608,"medals_24h":2168,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"SpaceAgeTitan":{"population":2740,"happiness":-2829,"demandHappiness":2740,"medals_24h":2280,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2},"SpaceAgeSpaceHub":{"population":3000,"happiness":-3095,"demandHappiness":3000,"medals_24h":2500,"strategy_points_24h":30,"random_good_of_age_24h":10,"units_24h":2}}, boosts: [{"type":"att_def_boost_defender","value":55,"feature":"all"},{"type":"def_boost_attacker","value":15,"feature":"guild_expedition"}] },
+    "W_MultiAge_HAL17A4": { prod: {"BronzeAge":{"population":750,"happiness":-2070,"demandHappiness":750,"money_24h":2850,"medals_24h":550,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"IronAge":{"population":1610,"happiness":-3560,"demandHappiness":1610,"money_24h":6830,"medals_24h":700,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"EarlyMiddleAge":{"population":2480,"happiness":-3940,"demandHappiness":2480,"money_24h":11390,"medals_24h":860,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"HighMiddleAge":{"population":3480,"happiness":-4390,"demandHappiness":3480,"money_24h":15940,"medals_24h":1020,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"LateMiddleAge":{"population":4560,"happiness":-4900,"demandHappiness":4560,"money_24h":21060,"medals_24h":1170,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"ColonialAge":{"population":5760,"happiness":-5760,"demandHappiness":5760,"money_24h":32080,"medals_24h":1410,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"IndustrialAge":{"population":7040,"happiness":-6500,"demandHappiness":7040,"money_24h":39970,"medals_24h":1950,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"ProgressiveEra":{"population":8400,"happiness":-7140,"demandHappiness":8400,"money_24h":48510,"medals_24h":2730,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"ModernEra":{"population":9850,"happiness":-7630,"demandHappiness":9850,"money_24h":60350,"medals_24h":3910,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"PostModernEra":{"population":11350,"happiness":-7950,"demandHappiness":11350,"money_24h":75920,"medals_24h":5470,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"ContemporaryEra":{"population":12940,"happiness":-9240,"demandHappiness":12940,"money_24h":98830,"medals_24h":7810,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"TomorrowEra":{"population":14580,"happiness":-11220,"demandHappiness":14580,"money_24h":114430,"medals_24h":10550,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"FutureEra":{"population":16300,"happiness":-13440,"demandHappiness":16300,"money_24h":131170,"medals_24h":12890,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"ArcticFuture":{"population":18090,"happiness":-15650,"demandHappiness":18090,"money_24h":149050,"medals_24h":15630,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"OceanicFuture":{"population":19920,"happiness":-18060,"demandHappiness":19920,"money_24h":168060,"medals_24h":17970,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"VirtualFuture":{"population":21810,"happiness":-21580,"demandHappiness":21810,"money_24h":188240,"medals_24h":21880,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"SpaceAgeMars":{"population":34530,"happiness":-34530,"demandHappiness":34530,"money_24h":314430,"medals_24h":26560,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"SpaceAgeAsteroidBelt":{"population":37510,"happiness":-37520,"demandHappiness":37510,"money_24h":348280,"medals_24h":31250,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"SpaceAgeVenus":{"population":40540,"happiness":-40540,"demandHappiness":40540,"money_24h":383920,"medals_24h":35940,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"SpaceAgeJupiterMoon":{"population":43660,"happiness":-43670,"demandHappiness":43660,"money_24h":421380,"medals_24h":40630,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"SpaceAgeTitan":{"population":46830,"happiness":-46840,"demandHappiness":46830,"money_24h":460690,"medals_24h":45310,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0},"SpaceAgeSpaceHub":{"population":50000,"happiness":-50000,"demandHappiness":50000,"money_24h":500000,"medals_24h":50000,"strategy_points_24h":150,"all_goods_of_age_24h":300,"all_goods_of_previous_age_24h":150.0,"all_goods_of_next_age_24h":150.0}}, boosts: [{"type":"att_def_boost_attacker","value":410,"feature":"battleground"},{"type":"att_def_boost_attacker","value":410,"feature":"guild_expedition"},{"type":"att_boost_defender","value":35,"feature":"guild_raids"},{"type":"guild_raids_action_points_capacity","value":8000,"feature":"all"}] },
+    "W_MultiAge_HAL23C1": { prod: {"BronzeAge":{"happiness":820,"random_good_of_previous_age_24h":21,"strategy_points_24h":1},"IronAge":{"happiness":1400,"random_good_of_previous_age_24h":21,"strategy_points_24h":1},"EarlyMiddleAge":{"happiness":1550,"random_good_of_previous_age_24h":21,"strategy_points_24h":1},"HighMiddleAge":{"happiness":1730,"random_good_of_previous_age_24h":21,"strategy_points_24h":1},"LateMiddleAge":{"happiness":1930,"random_good_of_previous_age_24h":21,"strategy_points_24h":1},"ColonialAge":{"happiness":2270,"random_good_of_previous_age_24h":22,"strategy_points_24h":2},"IndustrialAge":{"happiness":2550,"random_good_of_previous_age_24h":22,"strategy_points_24h":2},"ProgressiveEra":{"happiness":2800,"random_good_of_previous_age_24h":22,"strategy_points_24h":2},"ModernEra":{"happiness":3000,"random_good_of_previous_age_24h":22,"strategy_points_24h":2},"PostModernEra":{"happiness":3130,"random_good_of_previous_age_24h":22,"strategy_points_24h":2},"ContemporaryEra":{"happiness":3630,"random_good_of_previous_age_24h":23,"strategy_points_24h":3},"TomorrowEra":{"happiness":4410,"random_good_of_previous_age_24h":23,"strategy_points_24h":3},"FutureEra":{"happiness":5280,"random_good_of_previous_age_24h":23,"strategy_points_24h":3},"ArcticFuture":{"happiness":6150,"random_good_of_previous_age_24h":23,"strategy_points_24h":3},"OceanicFuture":{"happiness":7090,"random_good_of_previous_age_24h":23,"strategy_points_24h":3},"VirtualFuture":{"happiness":8470,"random_good_of_previous_age_24h":24,"strategy_points_24h":4},"SpaceAgeMars":{"happiness":13550,"random_good_of_previous_age_24h":24,"strategy_points_24h":4},"SpaceAgeAsteroidBelt":{"happiness":14730,"random_good_of_previous_age_24h":24,"strategy_points_24h":4},"SpaceAgeVenus":{"happiness":15910,"random_good_of_previous_age_24h":24,"strategy_points_24h":4},"SpaceAgeJupiterMoon":{"happiness":17140,"random_good_of_previous_age_24h":24,"strategy_points_24h":4},"SpaceAgeTitan":{"happiness":18380,"random_good_of_previous_age_24h":25,"strategy_points_24h":5},"SpaceAgeSpaceHub":{"happiness":19620,"random_good_of_previous_age_24h":25,"strategy_points_24h":5}}, boosts: [{"type":"att_boost_attacker","value":8,"feature":"all"},{"type":"def_boost_attacker","value":10,"feature":"all"}] },
+    "W_MultiAge_HAL23B3": { prod: {"AllAge":{"random_good_of_age_24h":1,"strategy_points_24h":1.2},"BronzeAge":{"population":-23,"happiness":-160},"IronAge":{"population":-49,"happiness":-260},"EarlyMiddleAge":{"population":-74,"happiness":-290},"HighMiddleAge":{"population":-104,"happiness":-320},"LateMiddleAge":{"population":-137,"happiness":-360},"ColonialAge":{"population":-172,"happiness":-420},"IndustrialAge":{"population":-210,"happiness":-480},"ProgressiveEra":{"population":-251,"happiness":-520},"ModernEra":{"population":-294,"happiness":-560},"PostModernEra":{"population":-339,"happiness":-580},"ContemporaryEra":{"population":-386,"happiness":-680},"TomorrowEra":{"population":-435,"happiness":-820},"FutureEra":{"population":-487,"happiness":-980},"ArcticFuture":{"population":-540,"happiness":-1140},"OceanicFuture":{"population":-595,"happiness":-1320},"VirtualFuture":{"population":-651,"happiness":-1570},"SpaceAgeMars":{"population":-1031,"happiness":-2510},"SpaceAgeAsteroidBelt":{"population":-1119,"happiness":-2730},"SpaceAgeVenus":{"population":-1210,"happiness":-2950},"SpaceAgeJupiterMoon":{"population":-1303,"happiness":-3180},"SpaceAgeTitan":{"population":-1397,"happiness":-3400},"SpaceAgeSpaceHub":{"population":-1491,"happiness":-3620}}, boosts: [{"type":"att_boost_attacker","value":5,"feature":"all"}] },
+    "W_MultiAge_HAL23B4": { prod: {"AllAge":{"random_good_of_age_24h":1,"strategy_points_24h":1.2},"BronzeAge":{"population":-28,"happiness":-180},"IronAge":{"population":-60,"happiness":-310},"EarlyMiddleAge":{"population":-91,"happiness":-350},"HighMiddleAge":{"population":-128,"happiness":-390},"LateMiddleAge":{"population":-168,"happiness":-430},"ColonialAge":{"population":-212,"happiness":-510},"IndustrialAge":{"population":-259,"happiness":-570},"ProgressiveEra":{"population":-309,"happiness":-630},"ModernEra":{"population":-362,"happiness":-670},"PostModernEra":{"population":-417,"happiness":-700},"ContemporaryEra":{"population":-475,"happiness":-810},"TomorrowEra":{"population":-535,"happiness":-980},"FutureEra":{"population":-598,"happiness":-1170},"ArcticFuture":{"population":-663,"happiness":-1370},"OceanicFuture":{"population":-731,"happiness":-1580},"VirtualFuture":{"population":-800,"happiness":-1880},"SpaceAgeMars":{"population":-1266,"happiness":-3010},"SpaceAgeAsteroidBelt":{"population":-1375,"happiness":-3270},"SpaceAgeVenus":{"population":-1487,"happiness":-3530},"SpaceAgeJupiterMoon":{"population":-1601,"happiness":-3800},"SpaceAgeTitan":{"population":-1717,"happiness":-4080},"SpaceAgeSpaceHub":{"population":-1833,"happiness":-4360}}, boosts: [{"type":"att_boost_attacker","value":6,"feature":"all"}] },
+    "W_MultiAge_HAL23B1": { prod: {"AllAge":{"random_good_of_age_24h":1,"strategy_points_24h":1.2},"BronzeAge":{"population":-13,"happiness":-100},"IronAge":{"population":-27,"happiness":-160},"EarlyMiddleAge":{"population":-41,"happiness":-180},"HighMiddleAge":{"population":-57,"happiness":-200},"LateMiddleAge":{"population":-74,"happiness":-220},"ColonialAge":{"population":-94,"happiness":-260},"IndustrialAge":{"population":-114,"happiness":-290},"ProgressiveEra":{"population":-136,"happiness":-320},"ModernEra":{"population":-160,"happiness":-340},"PostModernEra":{"population":-184,"happiness":-350},"ContemporaryEra":{"population":-210,"happiness":-410},"TomorrowEra":{"population":-236,"happiness":-500},"FutureEra":{"population":-264,"happiness":-590},"ArcticFuture":{"population":-293,"happiness":-690},"OceanicFuture":{"population":-323,"happiness":-800},"VirtualFuture":{"population":-353,"happiness":-950},"SpaceAgeMars":{"population":-559,"happiness":-1520},"SpaceAgeAsteroidBelt":{"population":-607,"happiness":-1650},"SpaceAgeVenus":{"population":-656,"happiness":-1780},"SpaceAgeJupiterMoon":{"population":-707,"happiness":-1920},"SpaceAgeTitan":{"population":-758,"happiness":-2060},"SpaceAgeSpaceHub":{"population":-809,"happiness":-2200}}, boosts: [{"type":"att_boost_attacker","value":3,"feature":"all"}] },
+    "W_MultiAge_HAL23B2": { prod: {"AllAge":{"random_good_of_age_24h":1,"strategy_points_24h":1.2},"BronzeAge":{"population":-18,"happiness":-130},"IronAge":{"population":-38,"happiness":-210},"EarlyMiddleAge":{"population":-57,"happiness":-230},"HighMiddleAge":{"population":-80,"happiness":-260},"LateMiddleAge":{"population":-105,"happiness":-290},"ColonialAge":{"population":-133,"happiness":-340},"IndustrialAge":{"population":-162,"happiness":-380},"ProgressiveEra":{"population":-194,"happiness":-420},"ModernEra":{"population":-227,"happiness":-450},"PostModernEra":{"population":-262,"happiness":-470},"ContemporaryEra":{"population":-298,"happiness":-540},"TomorrowEra":{"population":-336,"happiness":-660},"FutureEra":{"population":-376,"happiness":-790},"ArcticFuture":{"population":-416,"happiness":-920},"OceanicFuture":{"population":-459,"happiness":-1060},"VirtualFuture":{"population":-502,"happiness":-1260},"SpaceAgeMars":{"population":-795,"happiness":-2010},"SpaceAgeAsteroidBelt":{"population":-863,"happiness":-2190},"SpaceAgeVenus":{"population":-933,"happiness":-2360},"SpaceAgeJupiterMoon":{"population":-1005,"happiness":-2550},"SpaceAgeTitan":{"population":-1078,"happiness":-2730},"SpaceAgeSpaceHub":{"population":-1151,"happiness":-2910}}, boosts: [{"type":"att_boost_attacker","value":4,"feature":"all"}] },
+    "W_MultiAge_HAL23F1": { prod: {"BronzeAge":{"population":-83,"happiness":-360,"strategy_points_24h":2},"IronAge":{"population":-178,"happiness":-620,"strategy_points_24h":2},"EarlyMiddleAge":{"population":-273,"happiness":-690,"strategy_points_24h":2},"HighMiddleAge":{"population":-383,"happiness":-770,"strategy_points_24h":2},"LateMiddleAge":{"population":-502,"happiness":-860,"strategy_points_24h":2},"ColonialAge":{"population":-634,"happiness":-1010,"strategy_points_24h":2},"IndustrialAge":{"population":-775,"happiness":-1140,"strategy_points_24h":2},"ProgressiveEra":{"population":-925,"happiness":-1250,"strategy_points_24h":2},"ModernEra":{"population":-1084,"happiness":-1330,"strategy_points_24h":2},"PostModernEra":{"population":-1249,"happiness":-1390,"strategy_points_24h":2},"ContemporaryEra":{"population":-1423,"happiness":-1610,"strategy_points_24h":2},"TomorrowEra":{"population":-1604,"happiness":-1960,"strategy_points_24h":2},"FutureEra":{"population":-1794,"happiness":-2340,"strategy_points_24h":2},"ArcticFuture":{"population":-1989,"happiness":-2730,"strategy_points_24h":2},"OceanicFuture":{"population":-2191,"happiness":-3150,"strategy_points_24h":2},"VirtualFuture":{"population":-2400,"happiness":-3760,"strategy_points_24h":2},"SpaceAgeMars":{"population":-3798,"happiness":-6010,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"population":-4125,"happiness":-6530,"strategy_points_24h":2},"SpaceAgeVenus":{"population":-4459,"happiness":-7060,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"population":-4802,"happiness":-7600,"strategy_points_24h":2},"SpaceAgeTitan":{"population":-5150,"happiness":-8150,"strategy_points_24h":3},"SpaceAgeSpaceHub":{"population":-5498,"happiness":-8700,"strategy_points_24h":3}}, boosts: [{"type":"att_boost_attacker","value":3,"feature":"all"},{"type":"def_boost_attacker","value":3,"feature":"all"},{"type":"def_boost_defender","value":4,"feature":"all"}] },
+    "W_MultiAge_HAL23D1": { prod: {"BronzeAge":{"population":168,"demandHappiness":168,"strategy_points_24h":6,"random_good_of_age_24h":10},"IronAge":{"population":361,"demandHappiness":361,"strategy_points_24h":6,"random_good_of_age_24h":10},"EarlyMiddleAge":{"population":553,"demandHappiness":553,"strategy_points_24h":6,"random_good_of_age_24h":10},"HighMiddleAge":{"population":777,"demandHappiness":777,"strategy_points_24h":6,"random_good_of_age_24h":10},"LateMiddleAge":{"population":1019,"demandHappiness":1019,"strategy_points_24h":6,"random_good_of_age_24h":10},"ColonialAge":{"population":1286,"demandHappiness":1286,"strategy_points_24h":7,"random_good_of_age_24h":11},"IndustrialAge":{"population":1572,"demandHappiness":1572,"strategy_points_24h":7,"random_good_of_age_24h":11},"ProgressiveEra":{"population":1876,"demandHappiness":1876,"strategy_points_24h":7,"random_good_of_age_24h":11},"ModernEra":{"population":2199,"demandHappiness":2199,"strategy_points_24h":7,"random_good_of_age_24h":11},"PostModernEra":{"population":2534,"demandHappiness":2534,"strategy_points_24h":7,"random_good_of_age_24h":11},"ContemporaryEra":{"population":2888,"demandHappiness":2888,"strategy_points_24h":8,"random_good_of_age_24h":12},"TomorrowEra":{"population":3255,"demandHappiness":3255,"strategy_points_24h":8,"random_good_of_age_24h":12},"FutureEra":{"population":3640,"demandHappiness":3640,"strategy_points_24h":8,"random_good_of_age_24h":12},"ArcticFuture":{"population":4037,"demandHappiness":4037,"strategy_points_24h":8,"random_good_of_age_24h":12},"OceanicFuture":{"population":4447,"demandHappiness":4447,"strategy_points_24h":8,"random_good_of_age_24h":12},"VirtualFuture":{"population":4869,"demandHappiness":4869,"strategy_points_24h":9,"random_good_of_age_24h":13},"SpaceAgeMars":{"population":7707,"demandHappiness":7707,"strategy_points_24h":9,"random_good_of_age_24h":13},"SpaceAgeAsteroidBelt":{"population":8372,"demandHappiness":8372,"strategy_points_24h":9,"random_good_of_age_24h":13},"SpaceAgeVenus":{"population":9048,"demandHappiness":9048,"strategy_points_24h":9,"random_good_of_age_24h":13},"SpaceAgeJupiterMoon":{"population":9744,"demandHappiness":9744,"strategy_points_24h":9,"random_good_of_age_24h":13},"SpaceAgeTitan":{"population":10452,"demandHappiness":10452,"strategy_points_24h":10,"random_good_of_age_24h":14},"SpaceAgeSpaceHub":{"population":11160,"demandHappiness":11160,"strategy_points_24h":10,"random_good_of_age_24h":14}}, boosts: [{"type":"att_boost_defender","value":11,"feature":"all"},{"type":"def_boost_defender","value":18,"feature":"all"}] },
+    "W_MultiAge_HAL23A9": { prod: {"BronzeAge":{"medals_24h":180,"strategy_points_24h":23,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":68},"IronAge":{"medals_24h":232,"strategy_points_24h":23,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":68},"EarlyMiddleAge":{"medals_24h":283,"strategy_points_24h":23,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":68},"HighMiddleAge":{"medals_24h":335,"strategy_points_24h":23,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":68},"LateMiddleAge":{"medals_24h":386,"strategy_points_24h":23,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":68},"ColonialAge":{"medals_24h":463,"strategy_points_24h":23,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":68},"IndustrialAge":{"medals_24h":643,"strategy_points_24h":23,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":68},"ProgressiveEra":{"medals_24h":900,"strategy_points_24h":23,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":68},"ModernEra":{"medals_24h":1286,"strategy_points_24h":23,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":68},"PostModernEra":{"medals_24h":1800,"strategy_points_24h":23,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":68},"ContemporaryEra":{"medals_24h":2572,"strategy_points_24h":23,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":68},"TomorrowEra":{"medals_24h":3472,"strategy_points_24h":23,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":68},"FutureEra":{"medals_24h":4243,"strategy_points_24h":23,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":68},"ArcticFuture":{"medals_24h":5143,"strategy_points_24h":23,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":68},"OceanicFuture":{"medals_24h":5915,"strategy_points_24h":23,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":68},"VirtualFuture":{"medals_24h":7200,"strategy_points_24h":23,"random_good_of_age_24h":28,"random_good_of_previous_age_24h":68},"SpaceAgeMars":{"medals_24h":8743,"strategy_points_24h":24,"random_good_of_age_24h":29,"random_good_of_previous_age_24h":69},"SpaceAgeAsteroidBelt":{"medals_24h":10286,"strategy_points_24h":24,"random_good_of_age_24h":29,"random_good_of_previous_age_24h":69},"SpaceAgeVenus":{"medals_24h":11829,"strategy_points_24h":24,"random_good_of_age_24h":29,"random_good_of_previous_age_24h":69},"SpaceAgeJupiterMoon":{"medals_24h":13372,"strategy_points_24h":24,"random_good_of_age_24h":29,"random_good_of_previous_age_24h":69},"SpaceAgeTitan":{"medals_24h":14915,"strategy_points_24h":25,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":70},"SpaceAgeSpaceHub":{"medals_24h":16458,"strategy_points_24h":25,"random_good_of_age_24h":30,"random_good_of_previous_age_24h":70}}, boosts: [{"type":"att_boost_attacker","value":34,"feature":"all"},{"type":"def_boost_attacker","value":17,"feature":"all"},{"type":"att_boost_defender","value":35,"feature":"all"},{"type":"def_boost_defender","value":18,"feature":"all"}] },
+    "W_MultiAge_HAL23A1": { prod: {"BronzeAge":{"medals_24h":20},"IronAge":{"medals_24h":26},"EarlyMiddleAge":{"medals_24h":32},"HighMiddleAge":{"medals_24h":38},"LateMiddleAge":{"medals_24h":43},"ColonialAge":{"medals_24h":52},"IndustrialAge":{"medals_24h":72},"ProgressiveEra":{"medals_24h":100},"ModernEra":{"medals_24h":143},"PostModernEra":{"medals_24h":200},"ContemporaryEra":{"medals_24h":286},"TomorrowEra":{"medals_24h":386},"FutureEra":{"medals_24h":472},"ArcticFuture":{"medals_24h":572},"OceanicFuture":{"medals_24h":658},"VirtualFuture":{"medals_24h":800},"SpaceAgeMars":{"medals_24h":972},"SpaceAgeAsteroidBelt":{"medals_24h":1143},"SpaceAgeVenus":{"medals_24h":1315},"SpaceAgeJupiterMoon":{"medals_24h":1486},"SpaceAgeTitan":{"medals_24h":1658},"SpaceAgeSpaceHub":{"medals_24h":1830}} },
+    "W_MultiAge_HAL23A2": { prod: {"BronzeAge":{"medals_24h":40,"random_good_of_previous_age_24h":5},"IronAge":{"medals_24h":52,"random_good_of_previous_age_24h":5},"EarlyMiddleAge":{"medals_24h":63,"random_good_of_previous_age_24h":5},"HighMiddleAge":{"medals_24h":75,"random_good_of_previous_age_24h":5},"LateMiddleAge":{"medals_24h":86,"random_good_of_previous_age_24h":5},"ColonialAge":{"medals_24h":103,"random_good_of_previous_age_24h":5},"IndustrialAge":{"medals_24h":143,"random_good_of_previous_age_24h":5},"ProgressiveEra":{"medals_24h":200,"random_good_of_previous_age_24h":5},"ModernEra":{"medals_24h":286,"random_good_of_previous_age_24h":5},"PostModernEra":{"medals_24h":400,"random_good_of_previous_age_24h":5},"ContemporaryEra":{"medals_24h":572,"random_good_of_previous_age_24h":5},"TomorrowEra":{"medals_24h":772,"random_good_of_previous_age_24h":5},"FutureEra":{"medals_24h":943,"random_good_of_previous_age_24h":5},"ArcticFuture":{"medals_24h":1143,"random_good_of_previous_age_24h":5},"OceanicFuture":{"medals_24h":1315,"random_good_of_previous_age_24h":5},"VirtualFuture":{"medals_24h":1600,"random_good_of_previous_age_24h":5},"SpaceAgeMars":{"medals_24h":1943,"random_good_of_previous_age_24h":6},"SpaceAgeAsteroidBelt":{"medals_24h":2286,"random_good_of_previous_age_24h":6},"SpaceAgeVenus":{"medals_24h":2629,"random_good_of_previous_age_24h":6},"SpaceAgeJupiterMoon":{"medals_24h":2972,"random_good_of_previous_age_24h":6},"SpaceAgeTitan":{"medals_24h":3315,"random_good_of_previous_age_24h":7},"SpaceAgeSpaceHub":{"medals_24h":3658,"random_good_of_previous_age_24h":7}} },
+    "W_MultiAge_HAL23A3": { prod: {"BronzeAge":{"medals_24h":60,"strategy_points_24h":1,"random_good_of_previous_age_24h":12},"IronAge":{"medals_24h":78,"strategy_points_24h":1,"random_good_of_previous_age_24h":12},"EarlyMiddleAge":{"medals_24h":95,"strategy_points_24h":1,"random_good_of_previous_age_24h":12},"HighMiddleAge":{"medals_24h":112,"strategy_points_24h":1,"random_good_of_previous_age_24h":12},"LateMiddleAge":{"medals_24h":129,"strategy_points_24h":1,"random_good_of_previous_age_24h":12},"ColonialAge":{"medals_24h":155,"strategy_points_24h":1,"random_good_of_previous_age_24h":12},"IndustrialAge":{"medals_24h":215,"strategy_points_24h":1,"random_good_of_previous_age_24h":12},"ProgressiveEra":{"medals_24h":300,"strategy_points_24h":1,"random_good_of_previous_age_24h":12},"ModernEra":{"medals_24h":429,"strategy_points_24h":1,"random_good_of_previous_age_24h":12},"PostModernEra":{"medals_24h":600,"strategy_points_24h":1,"random_good_of_previous_age_24h":12},"ContemporaryEra":{"medals_24h":858,"strategy_points_24h":1,"random_good_of_previous_age_24h":12},"TomorrowEra":{"medals_24h":1158,"strategy_points_24h":1,"random_good_of_previous_age_24h":12},"FutureEra":{"medals_24h":1415,"strategy_points_24h":1,"random_good_of_previous_age_24h":12},"ArcticFuture":{"medals_24h":1715,"strategy_points_24h":1,"random_good_of_previous_age_24h":12},"OceanicFuture":{"medals_24h":1972,"strategy_points_24h":1,"random_good_of_previous_age_24h":12},"VirtualFuture":{"medals_24h":2400,"strategy_points_24h":1,"random_good_of_previous_age_24h":12},"SpaceAgeMars":{"medals_24h":2915,"strategy_points_24h":2,"random_good_of_previous_age_24h":13},"SpaceAgeAsteroidBelt":{"medals_24h":3429,"strategy_points_24h":2,"random_good_of_previous_age_24h":13},"SpaceAgeVenus":{"medals_24h":3943,"strategy_points_24h":2,"random_good_of_previous_age_24h":13},"SpaceAgeJupiterMoon":{"medals_24h":4458,"strategy_points_24h":2,"random_good_of_previous_age_24h":13},"SpaceAgeTitan":{"medals_24h":4972,"strategy_points_24h":3,"random_good_of_previous_age_24h":14},"SpaceAgeSpaceHub":{"medals_24h":5486,"strategy_points_24h":3,"random_good_of_previous_age_24h":14}} },
+    "W_MultiAge_HAL23A4": { prod: {"BronzeAge":{"medals_24h":80,"strategy_points_24h":4,"random_good_of_previous_age_24h":19},"IronAge":{"medals_24h":103,"strategy_points_24h":4,"random_good_of_previous_age_24h":19},"EarlyMiddleAge":{"medals_24h":126,"strategy_points_24h":4,"random_good_of_previous_age_24h":19},"HighMiddleAge":{"medals_24h":149,"strategy_points_24h":4,"random_good_of_previous_age_24h":19},"LateMiddleAge":{"medals_24h":172,"strategy_points_24h":4,"random_good_of_previous_age_24h":19},"ColonialAge":{"medals_24h":206,"strategy_points_24h":4,"random_good_of_previous_age_24h":19},"IndustrialAge":{"medals_24h":286,"strategy_points_24h":4,"random_good_of_previous_age_24h":19},"ProgressiveEra":{"medals_24h":400,"strategy_points_24h":4,"random_good_of_previous_age_24h":19},"ModernEra":{"medals_24h":572,"strategy_points_24h":4,"random_good_of_previous_age_24h":19},"PostModernEra":{"medals_24h":800,"strategy_points_24h":4,"random_good_of_previous_age_24h":19},"ContemporaryEra":{"medals_24h":1143,"strategy_points_24h":4,"random_good_of_previous_age_24h":19},"TomorrowEra":{"medals_24h":1543,"strategy_points_24h":4,"random_good_of_previous_age_24h":19},"FutureEra":{"medals_24h":1886,"strategy_points_24h":4,"random_good_of_previous_age_24h":19},"ArcticFuture":{"medals_24h":2286,"strategy_points_24h":4,"random_good_of_previous_age_24h":19},"OceanicFuture":{"medals_24h":2629,"strategy_points_24h":4,"random_good_of_previous_age_24h":19},"VirtualFuture":{"medals_24h":3200,"strategy_points_24h":4,"random_good_of_previous_age_24h":19},"SpaceAgeMars":{"medals_24h":3886,"strategy_points_24h":5,"random_good_of_previous_age_24h":20},"SpaceAgeAsteroidBelt":{"medals_24h":4572,"strategy_points_24h":5,"random_good_of_previous_age_24h":20},"SpaceAgeVenus":{"medals_24h":5258,"strategy_points_24h":5,"random_good_of_previous_age_24h":20},"SpaceAgeJupiterMoon":{"medals_24h":5943,"strategy_points_24h":5,"random_good_of_previous_age_24h":20},"SpaceAgeTitan":{"medals_24h":6629,"strategy_points_24h":6,"random_good_of_previous_age_24h":21},"SpaceAgeSpaceHub":{"medals_24h":7315,"strategy_points_24h":6,"random_good_of_previous_age_24h":21}}, boosts: [{"type":"def_boost_defender","value":1,"feature":"all"}] },
+    "W_MultiAge_HAL23A5": { prod: {"BronzeAge":{"medals_24h":100,"strategy_points_24h":7,"random_good_of_previous_age_24h":26},"IronAge":{"medals_24h":129,"strategy_points_24h":7,"random_good_of_previous_age_24h":26},"EarlyMiddleAge":{"medals_24h":158,"strategy_points_24h":7,"random_good_of_previous_age_24h":26},"HighMiddleAge":{"medals_24h":186,"strategy_points_24h":7,"random_good_of_previous_age_24h":26},"LateMiddleAge":{"medals_24h":215,"strategy_points_24h":7,"random_good_of_previous_age_24h":26},"ColonialAge":{"medals_24h":258,"strategy_points_24h":7,"random_good_of_previous_age_24h":26},"IndustrialAge":{"medals_24h":358,"strategy_points_24h":7,"random_good_of_previous_age_24h":26},"ProgressiveEra":{"medals_24h":500,"strategy_points_24h":7,"random_good_of_previous_age_24h":26},"ModernEra":{"medals_24h":715,"strategy_points_24h":7,"random_good_of_previous_age_24h":26},"PostModernEra":{"medals_24h":1000,"strategy_points_24h":7,"random_good_of_previous_age_24h":26},"ContemporaryEra":{"medals_24h":1429,"strategy_points_24h":7,"random_good_of_previous_age_24h":26},"TomorrowEra":{"medals_24h":1929,"strategy_points_24h":7,"random_good_of_previous_age_24h":26},"FutureEra":{"medals_24h":2358,"strategy_points_24h":7,"random_good_of_previous_age_24h":26},"ArcticFuture":{"medals_24h":2858,"strategy_points_24h":7,"random_good_of_previous_age_24h":26},"OceanicFuture":{"medals_24h":3286,"strategy_points_24h":7,"random_good_of_previous_age_24h":26},"VirtualFuture":{"medals_24h":4000,"strategy_points_24h":7,"random_good_of_previous_age_24h":26},"SpaceAgeMars":{"medals_24h":4858,"strategy_points_24h":8,"random_good_of_previous_age_24h":27},"SpaceAgeAsteroidBelt":{"medals_24h":5715,"strategy_points_24h":8,"random_good_of_previous_age_24h":27},"SpaceAgeVenus":{"medals_24h":6572,"strategy_points_24h":8,"random_good_of_previous_age_24h":27},"SpaceAgeJupiterMoon":{"medals_24h":7429,"strategy_points_24h":8,"random_good_of_previous_age_24h":27},"SpaceAgeTitan":{"medals_24h":8286,"strategy_points_24h":9,"random_good_of_previous_age_24h":28},"SpaceAgeSpaceHub":{"medals_24h":9143,"strategy_points_24h":9,"random_good_of_previous_age_24h":28}}, boosts: [{"type":"def_boost_attacker","value":1,"feature":"all"},{"type":"def_boost_defender","value":2,"feature":"all"}] },
+    "W_MultiAge_HAL23A6": { prod: {"BronzeAge":{"medals_24h":120,"strategy_points_24h":10,"random_good_of_previous_age_24h":33},"IronAge":{"medals_24h":155,"strategy_points_24h":10,"random_good_of_previous_age_24h":33},"EarlyMiddleAge":{"medals_24h":189,"strategy_points_24h":10,"random_good_of_previous_age_24h":33},"HighMiddleAge":{"medals_24h":223,"strategy_points_24h":10,"random_good_of_previous_age_24h":33},"LateMiddleAge":{"medals_24h":258,"strategy_points_24h":10,"random_good_of_previous_age_24h":33},"ColonialAge":{"medals_24h":309,"strategy_points_24h":10,"random_good_of_previous_age_24h":33},"IndustrialAge":{"medals_24h":429,"strategy_points_24h":10,"random_good_of_previous_age_24h":33},"ProgressiveEra":{"medals_24h":600,"strategy_points_24h":10,"random_good_of_previous_age_24h":33},"ModernEra":{"medals_24h":858,"strategy_points_24h":10,"random_good_of_previous_age_24h":33},"PostModernEra":{"medals_24h":1200,"strategy_points_24h":10,"random_good_of_previous_age_24h":33},"ContemporaryEra":{"medals_24h":1715,"strategy_points_24h":10,"random_good_of_previous_age_24h":33},"TomorrowEra":{"medals_24h":2315,"strategy_points_24h":10,"random_good_of_previous_age_24h":33},"FutureEra":{"medals_24h":2829,"strategy_points_24h":10,"random_good_of_previous_age_24h":33},"ArcticFuture":{"medals_24h":3429,"strategy_points_24h":10,"random_good_of_previous_age_24h":33},"OceanicFuture":{"medals_24h":3943,"strategy_points_24h":10,"random_good_of_previous_age_24h":33},"VirtualFuture":{"medals_24h":4800,"strategy_points_24h":10,"random_good_of_previous_age_24h":33},"SpaceAgeMars":{"medals_24h":5829,"strategy_points_24h":11,"random_good_of_previous_age_24h":34},"SpaceAgeAsteroidBelt":{"medals_24h":6858,"strategy_points_24h":11,"random_good_of_previous_age_24h":34},"SpaceAgeVenus":{"medals_24h":7886,"strategy_points_24h":11,"random_good_of_previous_age_24h":34},"SpaceAgeJupiterMoon":{"medals_24h":8915,"strategy_points_24h":11,"random_good_of_previous_age_24h":34},"SpaceAgeTitan":{"medals_24h":9943,"strategy_points_24h":12,"random_good_of_previous_age_24h":35},"SpaceAgeSpaceHub":{"medals_24h":10971,"strategy_points_24h":12,"random_good_of_previous_age_24h":35}}, boosts: [{"type":"def_boost_attacker","value":4,"feature":"all"},{"type":"att_boost_defender","value":6,"feature":"all"},{"type":"def_boost_defender","value":6,"feature":"all"}] },
+    "W_MultiAge_HAL23A7": { prod: {"BronzeAge":{"medals_24h":140,"strategy_points_24h":13,"random_good_of_previous_age_24h":40},"IronAge":{"medals_24h":180,"strategy_points_24h":13,"random_good_of_previous_age_24h":40},"EarlyMiddleAge":{"medals_24h":220,"strategy_points_24h":13,"random_good_of_previous_age_24h":40},"HighMiddleAge":{"medals_24h":260,"strategy_points_24h":13,"random_good_of_previous_age_24h":40},"LateMiddleAge":{"medals_24h":300,"strategy_points_24h":13,"random_good_of_previous_age_24h":40},"ColonialAge":{"medals_24h":360,"strategy_points_24h":13,"random_good_of_previous_age_24h":40},"IndustrialAge":{"medals_24h":500,"strategy_points_24h":13,"random_good_of_previous_age_24h":40},"ProgressiveEra":{"medals_24h":700,"strategy_points_24h":13,"random_good_of_previous_age_24h":40},"ModernEra":{"medals_24h":1000,"strategy_points_24h":13,"random_good_of_previous_age_24h":40},"PostModernEra":{"medals_24h":1400,"strategy_points_24h":13,"random_good_of_previous_age_24h":40},"ContemporaryEra":{"medals_24h":2000,"strategy_points_24h":13,"random_good_of_previous_age_24h":40},"TomorrowEra":{"medals_24h":2700,"strategy_points_24h":13,"random_good_of_previous_age_24h":40},"FutureEra":{"medals_24h":3300,"strategy_points_24h":13,"random_good_of_previous_age_24h":40},"ArcticFuture":{"medals_24h":4000,"strategy_points_24h":13,"random_good_of_previous_age_24h":40},"OceanicFuture":{"medals_24h":4600,"strategy_points_24h":13,"random_good_of_previous_age_24h":40},"VirtualFuture":{"medals_24h":5600,"strategy_points_24h":13,"random_good_of_previous_age_24h":40},"SpaceAgeMars":{"medals_24h":6800,"strategy_points_24h":14,"random_good_of_previous_age_24h":41},"SpaceAgeAsteroidBelt":{"medals_24h":8000,"strategy_points_24h":14,"random_good_of_previous_age_24h":41},"SpaceAgeVenus":{"medals_24h":9200,"strategy_points_24h":14,"random_good_of_previous_age_24h":41},"SpaceAgeJupiterMoon":{"medals_24h":10400,"strategy_points_24h":14,"random_good_of_previous_age_24h":41},"SpaceAgeTitan":{"medals_24h":11600,"strategy_points_24h":15,"random_good_of_previous_age_24h":42},"SpaceAgeSpaceHub":{"medals_24h":12800,"strategy_points_24h":15,"random_good_of_previous_age_24h":42}}, boosts: [{"type":"att_boost_attacker","value":13,"feature":"all"},{"type":"def_boost_attacker","value":7,"feature":"all"},{"type":"att_boost_defender","value":14,"feature":"all"},{"type":"def_boost_defender","value":8,"feature":"all"}] },
+    "W_MultiAge_HAL23A8": { prod: {"BronzeAge":{"medals_24h":160,"strategy_points_24h":21,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":61},"IronAge":{"medals_24h":206,"strategy_points_24h":21,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":61},"EarlyMiddleAge":{"medals_24h":252,"strategy_points_24h":21,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":61},"HighMiddleAge":{"medals_24h":298,"strategy_points_24h":21,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":61},"LateMiddleAge":{"medals_24h":343,"strategy_points_24h":21,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":61},"ColonialAge":{"medals_24h":412,"strategy_points_24h":21,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":61},"IndustrialAge":{"medals_24h":572,"strategy_points_24h":21,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":61},"ProgressiveEra":{"medals_24h":800,"strategy_points_24h":21,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":61},"ModernEra":{"medals_24h":1143,"strategy_points_24h":21,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":61},"PostModernEra":{"medals_24h":1600,"strategy_points_24h":21,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":61},"ContemporaryEra":{"medals_24h":2286,"strategy_points_24h":21,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":61},"TomorrowEra":{"medals_24h":3086,"strategy_points_24h":21,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":61},"FutureEra":{"medals_24h":3772,"strategy_points_24h":21,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":61},"ArcticFuture":{"medals_24h":4572,"strategy_points_24h":21,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":61},"OceanicFuture":{"medals_24h":5258,"strategy_points_24h":21,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":61},"VirtualFuture":{"medals_24h":6400,"strategy_points_24h":21,"random_good_of_age_24h":25,"random_good_of_previous_age_24h":61},"SpaceAgeMars":{"medals_24h":7772,"strategy_points_24h":22,"random_good_of_age_24h":26,"random_good_of_previous_age_24h":62},"SpaceAgeAsteroidBelt":{"medals_24h":9143,"strategy_points_24h":22,"random_good_of_age_24h":26,"random_good_of_previous_age_24h":62},"SpaceAgeVenus":{"medals_24h":10515,"strategy_points_24h":22,"random_good_of_age_24h":26,"random_good_of_previous_age_24h":62},"SpaceAgeJupiterMoon":{"medals_24h":11886,"strategy_points_24h":22,"random_good_of_age_24h":26,"random_good_of_previous_age_24h":62},"SpaceAgeTitan":{"medals_24h":13258,"strategy_points_24h":23,"random_good_of_age_24h":27,"random_good_of_previous_age_24h":63},"SpaceAgeSpaceHub":{"medals_24h":14630,"strategy_points_24h":23,"random_good_of_age_24h":27,"random_good_of_previous_age_24h":63}}, boosts: [{"type":"att_boost_attacker","value":29,"feature":"all"},{"type":"def_boost_attacker","value":15,"feature":"all"},{"type":"att_boost_defender","value":30,"feature":"all"},{"type":"def_boost_defender","value":16,"feature":"all"}] },
+    "W_MultiAge_HAL23A10": { prod: {"BronzeAge":{"medals_24h":200,"strategy_points_24h":25,"random_good_of_age_24h":31,"random_good_of_previous_age_24h":75},"IronAge":{"medals_24h":258,"strategy_points_24h":25,"random_good_of_age_24h":31,"random_good_of_previous_age_24h":75},"EarlyMiddleAge":{"medals_24h":315,"strategy_points_24h":25,"random_good_of_age_24h":31,"random_good_of_previous_age_24h":75},"HighMiddleAge":{"medals_24h":372,"strategy_points_24h":25,"random_good_of_age_24h":31,"random_good_of_previous_age_24h":75},"LateMiddleAge":{"medals_24h":429,"strategy_points_24h":25,"random_good_of_age_24h":31,"random_good_of_previous_age_24h":75},"ColonialAge":{"medals_24h":515,"strategy_points_24h":25,"random_good_of_age_24h":31,"random_good_of_previous_age_24h":75},"IndustrialAge":{"medals_24h":715,"strategy_points_24h":25,"random_good_of_age_24h":31,"random_good_of_previous_age_24h":75},"ProgressiveEra":{"medals_24h":1000,"strategy_points_24h":25,"random_good_of_age_24h":31,"random_good_of_previous_age_24h":75},"ModernEra":{"medals_24h":1429,"strategy_points_24h":25,"random_good_of_age_24h":31,"random_good_of_previous_age_24h":75},"PostModernEra":{"medals_24h":2000,"strategy_points_24h":25,"random_good_of_age_24h":31,"random_good_of_previous_age_24h":75},"ContemporaryEra":{"medals_24h":2858,"strategy_points_24h":25,"random_good_of_age_24h":31,"random_good_of_previous_age_24h":75},"TomorrowEra":{"medals_24h":3858,"strategy_points_24h":25,"random_good_of_age_24h":31,"random_good_of_previous_age_24h":75},"FutureEra":{"medals_24h":4715,"strategy_points_24h":25,"random_good_of_age_24h":31,"random_good_of_previous_age_24h":75},"ArcticFuture":{"medals_24h":5715,"strategy_points_24h":25,"random_good_of_age_24h":31,"random_good_of_previous_age_24h":75},"OceanicFuture":{"medals_24h":6572,"strategy_points_24h":25,"random_good_of_age_24h":31,"random_good_of_previous_age_24h":75},"VirtualFuture":{"medals_24h":8000,"strategy_points_24h":25,"random_good_of_age_24h":31,"random_good_of_previous_age_24h":75},"SpaceAgeMars":{"medals_24h":9715,"strategy_points_24h":26,"random_good_of_age_24h":32,"random_good_of_previous_age_24h":76},"SpaceAgeAsteroidBelt":{"medals_24h":11429,"strategy_points_24h":26,"random_good_of_age_24h":32,"random_good_of_previous_age_24h":76},"SpaceAgeVenus":{"medals_24h":13143,"strategy_points_24h":26,"random_good_of_age_24h":32,"random_good_of_previous_age_24h":76},"SpaceAgeJupiterMoon":{"medals_24h":14858,"strategy_points_24h":26,"random_good_of_age_24h":32,"random_good_of_previous_age_24h":76},"SpaceAgeTitan":{"medals_24h":16572,"strategy_points_24h":27,"random_good_of_age_24h":33,"random_good_of_previous_age_24h":77},"SpaceAgeSpaceHub":{"medals_24h":18286,"strategy_points_24h":27,"random_good_of_age_24h":33,"random_good_of_previous_age_24h":77}}, boosts: [{"type":"att_boost_attacker","value":39,"feature":"all"},{"type":"def_boost_attacker","value":19,"feature":"all"},{"type":"att_boost_defender","value":40,"feature":"all"},{"type":"def_boost_defender","value":20,"feature":"all"}] },
+    "W_MultiAge_HalloweenBonusGP22a": { prod: {"BronzeAge":{"population":136,"happiness":-90,"demandHappiness":136,"money_24h":900},"IronAge":{"population":293,"happiness":-160,"demandHappiness":293,"money_24h":2200},"EarlyMiddleAge":{"population":449,"happiness":-170,"demandHappiness":449,"money_24h":3600},"HighMiddleAge":{"population":631,"happiness":-190,"demandHappiness":631,"money_24h":5000},"LateMiddleAge":{"population":828,"happiness":-210,"demandHappiness":828,"money_24h":6700},"ColonialAge":{"population":1045,"happiness":-250,"demandHappiness":1045,"money_24h":10100},"IndustrialAge":{"population":1278,"happiness":-280,"demandHappiness":1278,"money_24h":12600},"ProgressiveEra":{"population":1525,"happiness":-310,"demandHappiness":1525,"money_24h":15300},"ModernEra":{"population":1788,"happiness":-330,"demandHappiness":1788,"money_24h":19100},"PostModernEra":{"population":2060,"happiness":-350,"demandHappiness":2060,"money_24h":24000},"ContemporaryEra":{"population":2348,"happiness":-400,"demandHappiness":2348,"money_24h":31300},"TomorrowEra":{"population":2646,"happiness":-490,"demandHappiness":2646,"money_24h":36200},"FutureEra":{"population":2959,"happiness":-590,"demandHappiness":2959,"money_24h":41500},"ArcticFuture":{"population":3283,"happiness":-680,"demandHappiness":3283,"money_24h":47100},"OceanicFuture":{"population":3616,"happiness":-790,"demandHappiness":3616,"money_24h":53100},"VirtualFuture":{"population":3959,"happiness":-940,"demandHappiness":3959,"money_24h":59500},"SpaceAgeMars":{"population":6267,"happiness":-1510,"demandHappiness":6267,"money_24h":99400},"SpaceAgeAsteroidBelt":{"population":6807,"happiness":-1640,"demandHappiness":6807,"money_24h":110100},"SpaceAgeVenus":{"population":7358,"happiness":-1770,"demandHappiness":7358,"money_24h":121400},"SpaceAgeJupiterMoon":{"population":7923,"happiness":-1900,"demandHappiness":7923,"money_24h":133200},"SpaceAgeTitan":{"population":8532,"happiness":-2040,"demandHappiness":8532,"money_24h":146147},"SpaceAgeSpaceHub":{"population":9141,"happiness":-2180,"demandHappiness":9141,"money_24h":159094}} },
+    "W_MultiAge_HalloweenBonusGP22j": { prod: {"BronzeAge":{"population":147,"happiness":-90,"demandHappiness":147,"money_24h":1400,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"IronAge":{"population":316,"happiness":-160,"demandHappiness":316,"money_24h":3400,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"EarlyMiddleAge":{"population":485,"happiness":-170,"demandHappiness":485,"money_24h":5700,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"HighMiddleAge":{"population":681,"happiness":-190,"demandHappiness":681,"money_24h":8000,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"LateMiddleAge":{"population":894,"happiness":-210,"demandHappiness":894,"money_24h":10600,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"ColonialAge":{"population":1128,"happiness":-250,"demandHappiness":1128,"money_24h":16100,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"IndustrialAge":{"population":1379,"happiness":-280,"demandHappiness":1379,"money_24h":20000,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"ProgressiveEra":{"population":1646,"happiness":-310,"demandHappiness":1646,"money_24h":24300,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"ModernEra":{"population":1929,"happiness":-330,"demandHappiness":1929,"money_24h":30200,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"PostModernEra":{"population":2224,"happiness":-350,"demandHappiness":2224,"money_24h":38000,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"ContemporaryEra":{"population":2534,"happiness":-400,"demandHappiness":2534,"money_24h":49500,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"TomorrowEra":{"population":2856,"happiness":-490,"demandHappiness":2856,"money_24h":57300,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"FutureEra":{"population":3194,"happiness":-590,"demandHappiness":3194,"money_24h":65700,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"ArcticFuture":{"population":3543,"happiness":-680,"demandHappiness":3543,"money_24h":74600,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"OceanicFuture":{"population":3902,"happiness":-790,"demandHappiness":3902,"money_24h":84100,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"VirtualFuture":{"population":4273,"happiness":-940,"demandHappiness":4273,"money_24h":94200,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"SpaceAgeMars":{"population":6763,"happiness":-1510,"demandHappiness":6763,"money_24h":157400,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"SpaceAgeAsteroidBelt":{"population":7347,"happiness":-1640,"demandHappiness":7347,"money_24h":174400,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"SpaceAgeVenus":{"population":7941,"happiness":-1770,"demandHappiness":7941,"money_24h":192200,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"SpaceAgeJupiterMoon":{"population":8551,"happiness":-1900,"demandHappiness":8551,"money_24h":210900,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"SpaceAgeTitan":{"population":9208,"happiness":-2040,"demandHappiness":9208,"money_24h":231420,"strategy_points_24h":5,"random_good_of_previous_age_24h":15},"SpaceAgeSpaceHub":{"population":9865,"happiness":-2180,"demandHappiness":9865,"money_24h":251940,"strategy_points_24h":5,"random_good_of_previous_age_24h":15}} },
+    "W_MultiAge_HalloweenBonusGP22k": { prod: {"BronzeAge":{"population":148,"happiness":-90,"demandHappiness":148,"money_24h":1500,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"IronAge":{"population":318,"happiness":-160,"demandHappiness":318,"money_24h":3500,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"EarlyMiddleAge":{"population":487,"happiness":-170,"demandHappiness":487,"money_24h":5800,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"HighMiddleAge":{"population":684,"happiness":-190,"demandHappiness":684,"money_24h":8100,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"LateMiddleAge":{"population":898,"happiness":-210,"demandHappiness":898,"money_24h":10700,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"ColonialAge":{"population":1133,"happiness":-250,"demandHappiness":1133,"money_24h":16300,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"IndustrialAge":{"population":1385,"happiness":-280,"demandHappiness":1385,"money_24h":20400,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"ProgressiveEra":{"population":1653,"happiness":-310,"demandHappiness":1653,"money_24h":24700,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"ModernEra":{"population":1938,"happiness":-330,"demandHappiness":1938,"money_24h":30700,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"PostModernEra":{"population":2234,"happiness":-350,"demandHappiness":2234,"money_24h":38700,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"ContemporaryEra":{"population":2546,"happiness":-400,"demandHappiness":2546,"money_24h":50300,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"TomorrowEra":{"population":2869,"happiness":-490,"demandHappiness":2869,"money_24h":58300,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"FutureEra":{"population":3208,"happiness":-590,"demandHappiness":3208,"money_24h":66800,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"ArcticFuture":{"population":3559,"happiness":-680,"demandHappiness":3559,"money_24h":75900,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"OceanicFuture":{"population":3920,"happiness":-790,"demandHappiness":3920,"money_24h":85600,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"VirtualFuture":{"population":4292,"happiness":-940,"demandHappiness":4292,"money_24h":95900,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"SpaceAgeMars":{"population":6794,"happiness":-1510,"demandHappiness":6794,"money_24h":160200,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"SpaceAgeAsteroidBelt":{"population":7380,"happiness":-1640,"demandHappiness":7380,"money_24h":177400,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"SpaceAgeVenus":{"population":7977,"happiness":-1770,"demandHappiness":7977,"money_24h":195600,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"SpaceAgeJupiterMoon":{"population":8590,"happiness":-1900,"demandHappiness":8590,"money_24h":214600,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"SpaceAgeTitan":{"population":9251,"happiness":-2040,"demandHappiness":9251,"money_24h":235446,"strategy_points_24h":7,"random_good_of_previous_age_24h":20},"SpaceAgeSpaceHub":{"population":9912,"happiness":-2180,"demandHappiness":9912,"money_24h":256292,"strategy_points_24h":7,"random_good_of_previous_age_24h":20}}, boosts: [{"type":"att_boost_attacker","value":8,"feature":"all"}] },
+    "W_MultiAge_HalloweenBonusGP22l": { prod: {"BronzeAge":{"population":149,"happiness":-90,"demandHappiness":149,"money_24h":1500,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"IronAge":{"population":319,"happiness":-160,"demandHappiness":319,"money_24h":3500,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"EarlyMiddleAge":{"population":490,"happiness":-170,"demandHappiness":490,"money_24h":5900,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"HighMiddleAge":{"population":688,"happiness":-190,"demandHappiness":688,"money_24h":8300,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"LateMiddleAge":{"population":902,"happiness":-210,"demandHappiness":902,"money_24h":10900,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"ColonialAge":{"population":1139,"happiness":-250,"demandHappiness":1139,"money_24h":16600,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"IndustrialAge":{"population":1392,"happiness":-280,"demandHappiness":1392,"money_24h":20700,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"ProgressiveEra":{"population":1661,"happiness":-310,"demandHappiness":1661,"money_24h":25100,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"ModernEra":{"population":1947,"happiness":-330,"demandHappiness":1947,"money_24h":31300,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"PostModernEra":{"population":2244,"happiness":-350,"demandHappiness":2244,"money_24h":39300,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"ContemporaryEra":{"population":2558,"happiness":-400,"demandHappiness":2558,"money_24h":51200,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"TomorrowEra":{"population":2882,"happiness":-490,"demandHappiness":2882,"money_24h":59300,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"FutureEra":{"population":3223,"happiness":-590,"demandHappiness":3223,"money_24h":68000,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"ArcticFuture":{"population":3575,"happiness":-680,"demandHappiness":3575,"money_24h":77200,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"OceanicFuture":{"population":3938,"happiness":-790,"demandHappiness":3938,"money_24h":87100,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"VirtualFuture":{"population":4312,"happiness":-940,"demandHappiness":4312,"money_24h":97500,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"SpaceAgeMars":{"population":6826,"happiness":-1510,"demandHappiness":6826,"money_24h":162900,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"SpaceAgeAsteroidBelt":{"population":7414,"happiness":-1640,"demandHappiness":7414,"money_24h":180500,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"SpaceAgeVenus":{"population":8014,"happiness":-1770,"demandHappiness":8014,"money_24h":198900,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"SpaceAgeJupiterMoon":{"population":8630,"happiness":-1900,"demandHappiness":8630,"money_24h":218300,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"SpaceAgeTitan":{"population":9294,"happiness":-2040,"demandHappiness":9294,"money_24h":239593,"strategy_points_24h":10,"random_good_of_previous_age_24h":35},"SpaceAgeSpaceHub":{"population":9958,"happiness":-2180,"demandHappiness":9958,"money_24h":260886,"strategy_points_24h":10,"random_good_of_previous_age_24h":35}}, boosts: [{"type":"att_boost_attacker","value":19,"feature":"all"}] },
+    "W_MultiAge_HalloweenBonusGP22b": { prod: {"BronzeAge":{"population":138,"happiness":-90,"demandHappiness":138,"money_24h":1000},"IronAge":{"population":296,"happiness":-160,"demandHappiness":296,"money_24h":2400},"EarlyMiddleAge":{"population":454,"happiness":-170,"demandHappiness":454,"money_24h":4000},"HighMiddleAge":{"population":638,"happiness":-190,"demandHappiness":638,"money_24h":5600},"LateMiddleAge":{"population":836,"happiness":-210,"demandHappiness":836,"money_24h":7400},"ColonialAge":{"population":1056,"happiness":-250,"demandHappiness":1056,"money_24h":11300},"IndustrialAge":{"population":1290,"happiness":-280,"demandHappiness":1290,"money_24h":14000},"ProgressiveEra":{"population":1540,"happiness":-310,"demandHappiness":1540,"money_24h":17000},"ModernEra":{"population":1805,"happiness":-330,"demandHappiness":1805,"money_24h":21200},"PostModernEra":{"population":2081,"happiness":-350,"demandHappiness":2081,"money_24h":26700},"ContemporaryEra":{"population":2372,"happiness":-400,"demandHappiness":2372,"money_24h":34700},"TomorrowEra":{"population":2672,"happiness":-490,"demandHappiness":2672,"money_24h":40200},"FutureEra":{"population":2989,"happiness":-590,"demandHappiness":2989,"money_24h":46100},"ArcticFuture":{"population":3315,"happiness":-680,"demandHappiness":3315,"money_24h":52400},"OceanicFuture":{"population":3652,"happiness":-790,"demandHappiness":3652,"money_24h":59000},"VirtualFuture":{"population":3998,"happiness":-940,"demandHappiness":3998,"money_24h":66100},"SpaceAgeMars":{"population":6329,"happiness":-1510,"demandHappiness":6329,"money_24h":110500},"SpaceAgeAsteroidBelt":{"population":6875,"happiness":-1640,"demandHappiness":6875,"money_24h":122400},"SpaceAgeVenus":{"population":7431,"happiness":-1770,"demandHappiness":7431,"money_24h":134900},"SpaceAgeJupiterMoon":{"population":8002,"happiness":-1900,"demandHappiness":8002,"money_24h":148000},"SpaceAgeTitan":{"population":8617,"happiness":-2040,"demandHappiness":8617,"money_24h":162373},"SpaceAgeSpaceHub":{"population":9232,"happiness":-2180,"demandHappiness":9232,"money_24h":176746}} },
+    "W_MultiAge_HalloweenBonusGP22c": { prod: {"BronzeAge":{"population":139,"happiness":-90,"demandHappiness":139,"money_24h":1100},"IronAge":{"population":299,"happiness":-160,"demandHappiness":299,"money_24h":2600},"EarlyMiddleAge":{"population":458,"happiness":-170,"demandHappiness":458,"money_24h":4400},"HighMiddleAge":{"population":644,"happiness":-190,"demandHappiness":644,"money_24h":6200},"LateMiddleAge":{"population":845,"happiness":-210,"demandHappiness":845,"money_24h":8100},"ColonialAge":{"population":1066,"happiness":-250,"demandHappiness":1066,"money_24h":12400},"IndustrialAge":{"population":1303,"happiness":-280,"demandHappiness":1303,"money_24h":15400},"ProgressiveEra":{"population":1555,"happiness":-310,"demandHappiness":1555,"money_24h":18700},"ModernEra":{"population":1823,"happiness":-330,"demandHappiness":1823,"money_24h":23300},"PostModernEra":{"population":2101,"happiness":-350,"demandHappiness":2101,"money_24h":29300},"ContemporaryEra":{"population":2395,"happiness":-400,"demandHappiness":2395,"money_24h":38200},"TomorrowEra":{"population":2699,"happiness":-490,"demandHappiness":2699,"money_24h":44200},"FutureEra":{"population":3018,"happiness":-590,"demandHappiness":3018,"money_24h":50700},"ArcticFuture":{"population":3348,"happiness":-680,"demandHappiness":3348,"money_24h":57600},"OceanicFuture":{"population":3687,"happiness":-790,"demandHappiness":3687,"money_24h":64900},"VirtualFuture":{"population":4038,"happiness":-940,"demandHappiness":4038,"money_24h":72700},"SpaceAgeMars":{"population":6391,"happiness":-1510,"demandHappiness":6391,"money_24h":121500},"SpaceAgeAsteroidBelt":{"population":6942,"happiness":-1640,"demandHappiness":6942,"money_24h":134600},"SpaceAgeVenus":{"population":7504,"happiness":-1770,"demandHappiness":7504,"money_24h":148400},"SpaceAgeJupiterMoon":{"population":8080,"happiness":-1900,"demandHappiness":8080,"money_24h":162800},"SpaceAgeTitan":{"population":8701,"happiness":-2040,"demandHappiness":8701,"money_24h":178598},"SpaceAgeSpaceHub":{"population":9322,"happiness":-2180,"demandHappiness":9322,"money_24h":194396}} },
+    "W_MultiAge_HalloweenBonusGP22d": { prod: {"BronzeAge":{"population":140,"happiness":-90,"demandHappiness":140,"money_24h":1200},"IronAge":{"population":302,"happiness":-160,"demandHappiness":302,"money_24h":2900},"EarlyMiddleAge":{"population":463,"happiness":-170,"demandHappiness":463,"money_24h":4800},"HighMiddleAge":{"population":650,"happiness":-190,"demandHappiness":650,"money_24h":6700},"LateMiddleAge":{"population":853,"happiness":-210,"demandHappiness":853,"money_24h":8900},"ColonialAge":{"population":1076,"happiness":-250,"demandHappiness":1076,"money_24h":13500},"IndustrialAge":{"population":1316,"happiness":-280,"demandHappiness":1316,"money_24h":16900},"ProgressiveEra":{"population":1570,"happiness":-310,"demandHappiness":1570,"money_24h":20500},"ModernEra":{"population":1841,"happiness":-330,"demandHappiness":1841,"money_24h":25400},"PostModernEra":{"population":2122,"happiness":-350,"demandHappiness":2122,"money_24h":32000},"ContemporaryEra":{"population":2418,"happiness":-400,"demandHappiness":2418,"money_24h":41700},"TomorrowEra":{"population":2725,"happiness":-490,"demandHappiness":2725,"money_24h":48200},"FutureEra":{"population":3047,"happiness":-590,"demandHappiness":3047,"money_24h":55300},"ArcticFuture":{"population":3380,"happiness":-680,"demandHappiness":3380,"money_24h":62800},"OceanicFuture":{"population":3723,"happiness":-790,"demandHappiness":3723,"money_24h":70900},"VirtualFuture":{"population":4077,"happiness":-940,"demandHappiness":4077,"money_24h":79400},"SpaceAgeMars":{"population":6453,"happiness":-1510,"demandHappiness":6453,"money_24h":132600},"SpaceAgeAsteroidBelt":{"population":7010,"happiness":-1640,"demandHappiness":7010,"money_24h":146800},"SpaceAgeVenus":{"population":7576,"happiness":-1770,"demandHappiness":7576,"money_24h":161800},"SpaceAgeJupiterMoon":{"population":8159,"happiness":-1900,"demandHappiness":8159,"money_24h":177600},"SpaceAgeTitan":{"population":8787,"happiness":-2040,"demandHappiness":8787,"money_24h":194943},"SpaceAgeSpaceHub":{"population":9415,"happiness":-2180,"demandHappiness":9415,"money_24h":212286}} },
+    "W_MultiAge_HalloweenBonusGP22e": { prod: {"BronzeAge":{"population":142,"happiness":-90,"demandHappiness":142,"money_24h":1300},"IronAge":{"population":305,"happiness":-160,"demandHappiness":305,"money_24h":3000},"EarlyMiddleAge":{"population":467,"happiness":-170,"demandHappiness":467,"money_24h":5000},"HighMiddleAge":{"population":656,"happiness":-190,"demandHappiness":656,"money_24h":7000},"LateMiddleAge":{"population":861,"happiness":-210,"demandHappiness":861,"money_24h":9300},"ColonialAge":{"population":1087,"happiness":-250,"demandHappiness":1087,"money_24h":14100},"IndustrialAge":{"population":1328,"happiness":-280,"demandHappiness":1328,"money_24h":17600},"ProgressiveEra":{"population":1586,"happiness":-310,"demandHappiness":1586,"money_24h":21300},"ModernEra":{"population":1859,"happiness":-330,"demandHappiness":1859,"money_24h":26500},"PostModernEra":{"population":2142,"happiness":-350,"demandHappiness":2142,"money_24h":33300},"ContemporaryEra":{"population":2441,"happiness":-400,"demandHappiness":2441,"money_24h":43400},"TomorrowEra":{"population":2751,"happiness":-490,"demandHappiness":2751,"money_24h":50300},"FutureEra":{"population":3077,"happiness":-590,"demandHappiness":3077,"money_24h":57600},"ArcticFuture":{"population":3413,"happiness":-680,"demandHappiness":3413,"money_24h":65500},"OceanicFuture":{"population":3759,"happiness":-790,"demandHappiness":3759,"money_24h":73800},"VirtualFuture":{"population":4116,"happiness":-940,"demandHappiness":4116,"money_24h":82700},"SpaceAgeMars":{"population":6515,"happiness":-1510,"demandHappiness":6515,"money_24h":138100},"SpaceAgeAsteroidBelt":{"population":7077,"happiness":-1640,"demandHappiness":7077,"money_24h":152900},"SpaceAgeVenus":{"population":7649,"happiness":-1770,"demandHappiness":7649,"money_24h":168600},"SpaceAgeJupiterMoon":{"population":8237,"happiness":-1900,"demandHappiness":8237,"money_24h":185000},"SpaceAgeTitan":{"population":8871,"happiness":-2040,"demandHappiness":8871,"money_24h":202996},"SpaceAgeSpaceHub":{"population":9505,"happiness":-2180,"demandHappiness":9505,"money_24h":220992}} },
+    "W_MultiAge_HalloweenBonusGP22f": { prod: {"BronzeAge":{"population":143,"happiness":-90,"demandHappiness":143,"money_24h":1300},"IronAge":{"population":307,"happiness":-160,"demandHappiness":307,"money_24h":3100},"EarlyMiddleAge":{"population":472,"happiness":-170,"demandHappiness":472,"money_24h":5200},"HighMiddleAge":{"population":663,"happiness":-190,"demandHappiness":663,"money_24h":7300},"LateMiddleAge":{"population":869,"happiness":-210,"demandHappiness":869,"money_24h":9600},"ColonialAge":{"population":1097,"happiness":-250,"demandHappiness":1097,"money_24h":14700},"IndustrialAge":{"population":1341,"happiness":-280,"demandHappiness":1341,"money_24h":18300},"ProgressiveEra":{"population":1601,"happiness":-310,"demandHappiness":1601,"money_24h":22200},"ModernEra":{"population":1876,"happiness":-330,"demandHappiness":1876,"money_24h":27600},"PostModernEra":{"population":2162,"happiness":-350,"demandHappiness":2162,"money_24h":34700},"ContemporaryEra":{"population":2465,"happiness":-400,"demandHappiness":2465,"money_24h":45100},"TomorrowEra":{"population":2777,"happiness":-490,"demandHappiness":2777,"money_24h":52300},"FutureEra":{"population":3106,"happiness":-590,"demandHappiness":3106,"money_24h":59900},"ArcticFuture":{"population":3445,"happiness":-680,"demandHappiness":3445,"money_24h":68100},"OceanicFuture":{"population":3795,"happiness":-790,"demandHappiness":3795,"money_24h":76800},"VirtualFuture":{"population":4155,"happiness":-940,"demandHappiness":4155,"money_24h":86000},"SpaceAgeMars":{"population":6577,"happiness":-1510,"demandHappiness":6577,"money_24h":143600},"SpaceAgeAsteroidBelt":{"population":7144,"happiness":-1640,"demandHappiness":7144,"money_24h":159100},"SpaceAgeVenus":{"population":7722,"happiness":-1770,"demandHappiness":7722,"money_24h":175300},"SpaceAgeJupiterMoon":{"population":8316,"happiness":-1900,"demandHappiness":8316,"money_24h":192400},"SpaceAgeTitan":{"population":8956,"happiness":-2040,"demandHappiness":8956,"money_24h":211169},"SpaceAgeSpaceHub":{"population":9596,"happiness":-2180,"demandHappiness":9596,"money_24h":229938}} },
+    "W_MultiAge_HalloweenBonusGP22g": { prod: {"BronzeAge":{"population":144,"happiness":-90,"demandHappiness":144,"money_24h":1400},"IronAge":{"population":310,"happiness":-160,"demandHappiness":310,"money_24h":3200},"EarlyMiddleAge":{"population":476,"happiness":-170,"demandHappiness":476,"money_24h":5400},"HighMiddleAge":{"population":669,"happiness":-190,"demandHappiness":669,"money_24h":7600},"LateMiddleAge":{"population":877,"happiness":-210,"demandHappiness":877,"money_24h":10000},"ColonialAge":{"population":1107,"happiness":-250,"demandHappiness":1107,"money_24h":15200},"IndustrialAge":{"population":1354,"happiness":-280,"demandHappiness":1354,"money_24h":19000},"ProgressiveEra":{"population":1616,"happiness":-310,"demandHappiness":1616,"money_24h":23000},"ModernEra":{"population":1894,"happiness":-330,"demandHappiness":1894,"money_24h":28600},"PostModernEra":{"population":2183,"happiness":-350,"demandHappiness":2183,"money_24h":36000},"ContemporaryEra":{"population":2488,"happiness":-400,"demandHappiness":2488,"money_24h":46900},"TomorrowEra":{"population":2803,"happiness":-490,"demandHappiness":2803,"money_24h":54300},"FutureEra":{"population":3135,"happiness":-590,"demandHappiness":3135,"money_24h":62200},"ArcticFuture":{"population":3478,"happiness":-680,"demandHappiness":3478,"money_24h":70700},"OceanicFuture":{"population":3831,"happiness":-790,"demandHappiness":3831,"money_24h":79700},"VirtualFuture":{"population":4194,"happiness":-940,"demandHappiness":4194,"money_24h":89300},"SpaceAgeMars":{"population":6639,"happiness":-1510,"demandHappiness":6639,"money_24h":149100},"SpaceAgeAsteroidBelt":{"population":7212,"happiness":-1640,"demandHappiness":7212,"money_24h":165200},"SpaceAgeVenus":{"population":7795,"happiness":-1770,"demandHappiness":7795,"money_24h":182100},"SpaceAgeJupiterMoon":{"population":8394,"happiness":-1900,"demandHappiness":8394,"money_24h":199800},"SpaceAgeTitan":{"population":9040,"happiness":-2040,"demandHappiness":9040,"money_24h":219221},"SpaceAgeSpaceHub":{"population":9686,"happiness":-2180,"demandHappiness":9686,"money_24h":238642}} },
+    "W_MultiAge_HalloweenBonusGP22h": { prod: {"BronzeAge":{"population":146,"happiness":-90,"demandHappiness":146,"money_24h":1400,"random_good_of_previous_age_24h":5},"IronAge":{"population":313,"happiness":-160,"demandHappiness":313,"money_24h":3300,"random_good_of_previous_age_24h":5},"EarlyMiddleAge":{"population":481,"happiness":-170,"demandHappiness":481,"money_24h":5500,"random_good_of_previous_age_24h":5},"HighMiddleAge":{"population":675,"happiness":-190,"demandHappiness":675,"money_24h":7700,"random_good_of_previous_age_24h":5},"LateMiddleAge":{"population":886,"happiness":-210,"demandHappiness":886,"money_24h":10200,"random_good_of_previous_age_24h":5},"ColonialAge":{"population":1118,"happiness":-250,"demandHappiness":1118,"money_24h":15500,"random_good_of_previous_age_24h":5},"IndustrialAge":{"population":1366,"happiness":-280,"demandHappiness":1366,"money_24h":19300,"random_good_of_previous_age_24h":5},"ProgressiveEra":{"population":1631,"happiness":-310,"demandHappiness":1631,"money_24h":23400,"random_good_of_previous_age_24h":5},"ModernEra":{"population":1912,"happiness":-330,"demandHappiness":1912,"money_24h":29200,"random_good_of_previous_age_24h":5},"PostModernEra":{"population":2203,"happiness":-350,"demandHappiness":2203,"money_24h":36700,"random_good_of_previous_age_24h":5},"ContemporaryEra":{"population":2511,"happiness":-400,"demandHappiness":2511,"money_24h":47700,"random_good_of_previous_age_24h":5},"TomorrowEra":{"population":2830,"happiness":-490,"demandHappiness":2830,"money_24h":55300,"random_good_of_previous_age_24h":5},"FutureEra":{"population":3164,"happiness":-590,"demandHappiness":3164,"money_24h":63400,"random_good_of_previous_age_24h":5},"ArcticFuture":{"population":3510,"happiness":-680,"demandHappiness":3510,"money_24h":72000,"random_good_of_previous_age_24h":5},"OceanicFuture":{"population":3866,"happiness":-790,"demandHappiness":3866,"money_24h":81200,"random_good_of_previous_age_24h":5},"VirtualFuture":{"population":4234,"happiness":-940,"demandHappiness":4234,"money_24h":90900,"random_good_of_previous_age_24h":5},"SpaceAgeMars":{"population":6701,"happiness":-1510,"demandHappiness":6701,"money_24h":151900,"random_good_of_previous_age_24h":5},"SpaceAgeAsteroidBelt":{"population":7279,"happiness":-1640,"demandHappiness":7279,"money_24h":168200,"random_good_of_previous_age_24h":5},"SpaceAgeVenus":{"population":7868,"happiness":-1770,"demandHappiness":7868,"money_24h":185500,"random_good_of_previous_age_24h":5},"SpaceAgeJupiterMoon":{"population":8473,"happiness":-1900,"demandHappiness":8473,"money_24h":203500,"random_good_of_previous_age_24h":5},"SpaceAgeTitan":{"population":9125,"happiness":-2040,"demandHappiness":9125,"money_24h":223247,"random_good_of_previous_age_24h":5},"SpaceAgeSpaceHub":{"population":9777,"happiness":-2180,"demandHappiness":9777,"money_24h":242994,"random_good_of_previous_age_24h":5}} },
+    "W_MultiAge_HalloweenBonusGP22i": { prod: {"BronzeAge":{"population":146,"happiness":-90,"demandHappiness":146,"money_24h":1400,"random_good_of_previous_age_24h":10},"IronAge":{"population":315,"happiness":-160,"demandHappiness":315,"money_24h":3400,"random_good_of_previous_age_24h":10},"EarlyMiddleAge":{"population":483,"happiness":-170,"demandHappiness":483,"money_24h":5600,"random_good_of_previous_age_24h":10},"HighMiddleAge":{"population":678,"happiness":-190,"demandHappiness":678,"money_24h":7800,"random_good_of_previous_age_24h":10},"LateMiddleAge":{"population":890,"happiness":-210,"demandHappiness":890,"money_24h":10400,"random_good_of_previous_age_24h":10},"ColonialAge":{"population":1123,"happiness":-250,"demandHappiness":1123,"money_24h":15800,"random_good_of_previous_age_24h":10},"IndustrialAge":{"population":1373,"happiness":-280,"demandHappiness":1373,"money_24h":19700,"random_good_of_previous_age_24h":10},"ProgressiveEra":{"population":1638,"happiness":-310,"demandHappiness":1638,"money_24h":23900,"random_good_of_previous_age_24h":10},"ModernEra":{"population":1920,"happiness":-330,"demandHappiness":1920,"money_24h":29700,"random_good_of_previous_age_24h":10},"PostModernEra":{"population":2213,"happiness":-350,"demandHappiness":2213,"money_24h":37300,"random_good_of_previous_age_24h":10},"ContemporaryEra":{"population":2523,"happiness":-400,"demandHappiness":2523,"money_24h":48600,"random_good_of_previous_age_24h":10},"TomorrowEra":{"population":2843,"happiness":-490,"demandHappiness":2843,"money_24h":56300,"random_good_of_previous_age_24h":10},"FutureEra":{"population":3179,"happiness":-590,"demandHappiness":3179,"money_24h":64500,"random_good_of_previous_age_24h":10},"ArcticFuture":{"population":3526,"happiness":-680,"demandHappiness":3526,"money_24h":73300,"random_good_of_previous_age_24h":10},"OceanicFuture":{"population":3884,"happiness":-790,"demandHappiness":3884,"money_24h":82700,"random_good_of_previous_age_24h":10},"VirtualFuture":{"population":4253,"happiness":-940,"demandHappiness":4253,"money_24h":92600,"random_good_of_previous_age_24h":10},"SpaceAgeMars":{"population":6732,"happiness":-1510,"demandHappiness":6732,"money_24h":154600,"random_good_of_previous_age_24h":10},"SpaceAgeAsteroidBelt":{"population":7313,"happiness":-1640,"demandHappiness":7313,"money_24h":171300,"random_good_of_previous_age_24h":10},"SpaceAgeVenus":{"population":7904,"happiness":-1770,"demandHappiness":7904,"money_24h":188800,"random_good_of_previous_age_24h":10},"SpaceAgeJupiterMoon":{"population":8512,"happiness":-1900,"demandHappiness":8512,"money_24h":207200,"random_good_of_previous_age_24h":10},"SpaceAgeTitan":{"population":9167,"happiness":-2040,"demandHappiness":9167,"money_24h":227394,"random_good_of_previous_age_24h":10},"SpaceAgeSpaceHub":{"population":9822,"happiness":-2180,"demandHappiness":9822,"money_24h":247588,"random_good_of_previous_age_24h":10}} },
+    "W_MultiAge_HAL24C1": { prod: {"BronzeAge":{"population":150,"happiness":-129,"demandHappiness":150,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"IronAge":{"population":325,"happiness":-264,"demandHappiness":325,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"EarlyMiddleAge":{"population":500,"happiness":-399,"demandHappiness":500,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"HighMiddleAge":{"population":675,"happiness":-534,"demandHappiness":675,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"LateMiddleAge":{"population":850,"happiness":-669,"demandHappiness":850,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"ColonialAge":{"population":1025,"happiness":-804,"demandHappiness":1025,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"IndustrialAge":{"population":1200,"happiness":-939,"demandHappiness":1200,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"ProgressiveEra":{"population":1375,"happiness":-1074,"demandHappiness":1375,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"ModernEra":{"population":1550,"happiness":-1209,"demandHappiness":1550,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"PostModernEra":{"population":1725,"happiness":-1344,"demandHappiness":1725,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"ContemporaryEra":{"population":1900,"happiness":-1479,"demandHappiness":1900,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"TomorrowEra":{"population":2075,"happiness":-1614,"demandHappiness":2075,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"FutureEra":{"population":2250,"happiness":-1749,"demandHappiness":2250,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"ArcticFuture":{"population":2425,"happiness":-1884,"demandHappiness":2425,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"OceanicFuture":{"population":2600,"happiness":-2019,"demandHappiness":2600,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"VirtualFuture":{"population":2775,"happiness":-2154,"demandHappiness":2775,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"SpaceAgeMars":{"population":2950,"happiness":-2289,"demandHappiness":2950,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"SpaceAgeAsteroidBelt":{"population":3125,"happiness":-2424,"demandHappiness":3125,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"SpaceAgeVenus":{"population":3300,"happiness":-2559,"demandHappiness":3300,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"SpaceAgeJupiterMoon":{"population":3475,"happiness":-2694,"demandHappiness":3475,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"SpaceAgeTitan":{"population":3650,"happiness":-2829,"demandHappiness":3650,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4},"SpaceAgeSpaceHub":{"population":4000,"happiness":-3095,"demandHappiness":4000,"strategy_points_24h":75,"random_good_of_age_24h":25,"units_24h":4}}, boosts: [{"type":"att_def_boost_attacker","value":55,"feature":"all"},{"type":"att_boost_attacker","value":20,"feature":"battleground"},{"type":"guild_raids_action_points_collection","value":50,"feature":"all"}] },
+    "W_MultiAge_HAL15A2": { prod: {"AllAge":{"population":-2}} },
+    "W_MultiAge_HAL15A1": { prod: {"AllAge":{"population":-2}} },
+};
@@ -0,0 +1,26 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 22 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_HERO24H1": { prod: {"BronzeAge":{"population":-40,"medals_24h":5,"random_good_of_age_24h":1},"IronAge":{"population":-90,"medals_24h":10,"random_good_of_age_24h":1},"EarlyMiddleAge":{"population":-130,"medals_24h":10,"random_good_of_age_24h":1},"HighMiddleAge":{"population":-190,"medals_24h":10,"random_good_of_age_24h":1},"LateMiddleAge":{"population":-240,"medals_24h":10,"random_good_of_age_24h":1},"ColonialAge":{"population":-310,"medals_24h":20,"random_good_of_age_24h":1},"IndustrialAge":{"population":-380,"medals_24h":20,"random_good_of_age_24h":1},"ProgressiveEra":{"population":-450,"medals_24h":30,"random_good_of_age_24h":1},"ModernEra":{"population":-530,"medals_24h":40,"random_good_of_age_24h":1},"PostModernEra":{"population":-610,"medals_24h":60,"random_good_of_age_24h":1},"ContemporaryEra":{"population":-690,"medals_24h":90,"random_good_of_age_24h":1},"TomorrowEra":{"population":-780,"medals_24h":120,"random_good_of_age_24h":1},"FutureEra":{"population":-870,"medals_24h":140,"random_good_of_age_24h":1},"ArcticFuture":{"population":-970,"medals_24h":170,"random_good_of_age_24h":1},"OceanicFuture":{"population":-1060,"medals_24h":200,"random_good_of_age_24h":1},"VirtualFuture":{"population":-1160,"medals_24h":240,"random_good_of_age_24h":1},"SpaceAgeMars":{"population":-1840,"medals_24h":290,"random_good_of_age_24h":1},"SpaceAgeAsteroidBelt":{"population":-2000,"medals_24h":340,"random_good_of_age_24h":1},"SpaceAgeVenus":{"population":-2160,"medals_24h":400,"random_good_of_age_24h":1},"SpaceAgeJupiterMoon":{"population":-2330,"medals_24h":450,"random_good_of_age_24h":1},"SpaceAgeTitan":{"population":-2500,"medals_24h":500,"random_good_of_age_24h":1},"SpaceAgeSpaceHub":{"population":-2670,"medals_24h":550,"random_good_of_age_24h":1}}, boosts: [{"type":"att_boost_attacker","value":1,"feature":"all"},{"type":"def_boost_defender","value":1,"feature":"guild_expedition"}] },
+    "W_MultiAge_HERO24H2": { prod: {"BronzeAge":{"population":-30,"medals_24h":10,"random_good_of_age_24h":1},"IronAge":{"population":-70,"medals_24h":10,"random_good_of_age_24h":1},"EarlyMiddleAge":{"population":-110,"medals_24h":10,"random_good_of_age_24h":1},"HighMiddleAge":{"population":-150,"medals_24h":10,"random_good_of_age_24h":1},"LateMiddleAge":{"population":-190,"medals_24h":20,"random_good_of_age_24h":1},"ColonialAge":{"population":-250,"medals_24h":20,"random_good_of_age_24h":1},"IndustrialAge":{"population":-300,"medals_24h":30,"random_good_of_age_24h":1},"ProgressiveEra":{"population":-360,"medals_24h":40,"random_good_of_age_24h":1},"ModernEra":{"population":-420,"medals_24h":50,"random_good_of_age_24h":1},"PostModernEra":{"population":-480,"medals_24h":70,"random_good_of_age_24h":1},"ContemporaryEra":{"population":-550,"medals_24h":100,"random_good_of_age_24h":1},"TomorrowEra":{"population":-620,"medals_24h":140,"random_good_of_age_24h":1},"FutureEra":{"population":-700,"medals_24h":170,"random_good_of_age_24h":1},"ArcticFuture":{"population":-770,"medals_24h":210,"random_good_of_age_24h":1},"OceanicFuture":{"population":-850,"medals_24h":240,"random_good_of_age_24h":1},"VirtualFuture":{"population":-930,"medals_24h":290,"random_good_of_age_24h":1},"SpaceAgeMars":{"population":-1470,"medals_24h":350,"random_good_of_age_24h":1},"SpaceAgeAsteroidBelt":{"population":-1600,"medals_24h":410,"random_good_of_age_24h":1},"SpaceAgeVenus":{"population":-1730,"medals_24h":480,"random_good_of_age_24h":1},"SpaceAgeJupiterMoon":{"population":-1860,"medals_24h":540,"random_good_of_age_24h":1},"SpaceAgeTitan":{"population":-2000,"medals_24h":600,"random_good_of_age_24h":1},"SpaceAgeSpaceHub":{"population":-2140,"medals_24h":660,"random_good_of_age_24h":1}}, boosts: [{"type":"att_boost_attacker","value":2,"feature":"all"},{"type":"att_boost_attacker","value":1,"feature":"battleground"},{"type":"def_boost_defender","value":2,"feature":"guild_expedition"}] },
+    "W_MultiAge_HERO24H4": { prod: {"BronzeAge":{"population":-20,"medals_24h":10,"random_good_of_age_24h":4},"IronAge":{"population":-30,"medals_24h":20,"random_good_of_age_24h":4},"EarlyMiddleAge":{"population":-50,"medals_24h":20,"random_good_of_age_24h":4},"HighMiddleAge":{"population":-70,"medals_24h":20,"random_good_of_age_24h":4},"LateMiddleAge":{"population":-100,"medals_24h":30,"random_good_of_age_24h":4},"ColonialAge":{"population":-120,"medals_24h":30,"random_good_of_age_24h":4},"IndustrialAge":{"population":-150,"medals_24h":40,"random_good_of_age_24h":4},"ProgressiveEra":{"population":-180,"medals_24h":60,"random_good_of_age_24h":4},"ModernEra":{"population":-210,"medals_24h":90,"random_good_of_age_24h":4},"PostModernEra":{"population":-240,"medals_24h":120,"random_good_of_age_24h":4},"ContemporaryEra":{"population":-280,"medals_24h":170,"random_good_of_age_24h":4},"TomorrowEra":{"population":-310,"medals_24h":230,"random_good_of_age_24h":4},"FutureEra":{"population":-350,"medals_24h":280,"random_good_of_age_24h":4},"ArcticFuture":{"population":-390,"medals_24h":340,"random_good_of_age_24h":4},"OceanicFuture":{"population":-430,"medals_24h":400,"random_good_of_age_24h":4},"VirtualFuture":{"population":-470,"medals_24h":480,"random_good_of_age_24h":4},"SpaceAgeMars":{"population":-740,"medals_24h":590,"random_good_of_age_24h":4},"SpaceAgeAsteroidBelt":{"population":-800,"medals_24h":690,"random_good_of_age_24h":4},"SpaceAgeVenus":{"population":-870,"medals_24h":790,"random_good_of_age_24h":4},"SpaceAgeJupiterMoon":{"population":-930,"medals_24h":900,"random_good_of_age_24h":4},"SpaceAgeTitan":{"population":-1000,"medals_24h":1000,"random_good_of_age_24h":4},"SpaceAgeSpaceHub":{"population":-1070,"medals_24h":1100,"random_good_of_age_24h":4}}, boosts: [{"type":"att_boost_attacker","value":4,"feature":"all"},{"type":"att_boost_attacker","value":4,"feature":"battleground"},{"type":"att_boost_attacker","value":5,"feature":"guild_expedition"},{"type":"def_boost_defender","value":3,"feature":"all"},{"type":"def_boost_defender","value":6,"feature":"guild_expedition"}] },
+    "W_MultiAge_HERO24E1": { prod: {"BronzeAge":{"population":-400,"medals_24h":40,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"IronAge":{"population":-860,"medals_24h":80,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"EarlyMiddleAge":{"population":-1320,"medals_24h":90,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"HighMiddleAge":{"population":-1860,"medals_24h":110,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"LateMiddleAge":{"population":-2440,"medals_24h":130,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"ColonialAge":{"population":-3070,"medals_24h":160,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"IndustrialAge":{"population":-3760,"medals_24h":220,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"ProgressiveEra":{"population":-4490,"medals_24h":300,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"ModernEra":{"population":-5260,"medals_24h":430,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"PostModernEra":{"population":-6060,"medals_24h":600,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"ContemporaryEra":{"population":-6910,"medals_24h":860,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"TomorrowEra":{"population":-7780,"medals_24h":1160,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"FutureEra":{"population":-8700,"medals_24h":1420,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"ArcticFuture":{"population":-9660,"medals_24h":1720,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"OceanicFuture":{"population":-10640,"medals_24h":1980,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"VirtualFuture":{"population":-11650,"medals_24h":2410,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"SpaceAgeMars":{"population":-18430,"medals_24h":2930,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"SpaceAgeAsteroidBelt":{"population":-20020,"medals_24h":3450,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"SpaceAgeVenus":{"population":-21640,"medals_24h":3970,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"SpaceAgeJupiterMoon":{"population":-23310,"medals_24h":4480,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"SpaceAgeTitan":{"population":-25000,"medals_24h":5000,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10},"SpaceAgeSpaceHub":{"population":-26690,"medals_24h":5520,"strategy_points_24h":10,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":10}}, boosts: [{"type":"att_boost_attacker","value":25,"feature":"all"},{"type":"def_boost_defender","value":25,"feature":"all"},{"type":"def_boost_defender","value":35,"feature":"guild_expedition"},{"type":"def_boost_attacker","value":45,"feature":"guild_expedition"}] },
+    "W_MultiAge_HERO24G1": { prod: {"BronzeAge":{"medals_24h":90,"random_good_of_age_24h":25},"IronAge":{"medals_24h":170,"random_good_of_age_24h":25},"EarlyMiddleAge":{"medals_24h":210,"random_good_of_age_24h":25},"HighMiddleAge":{"medals_24h":250,"random_good_of_age_24h":25},"LateMiddleAge":{"medals_24h":280,"random_good_of_age_24h":25},"ColonialAge":{"medals_24h":340,"random_good_of_age_24h":25},"IndustrialAge":{"medals_24h":470,"random_good_of_age_24h":25},"ProgressiveEra":{"medals_24h":660,"random_good_of_age_24h":25},"ModernEra":{"medals_24h":950,"random_good_of_age_24h":25},"PostModernEra":{"medals_24h":1330,"random_good_of_age_24h":25},"ContemporaryEra":{"medals_24h":1900,"random_good_of_age_24h":25},"TomorrowEra":{"medals_24h":2560,"random_good_of_age_24h":25},"FutureEra":{"medals_24h":3130,"random_good_of_age_24h":25},"ArcticFuture":{"medals_24h":3790,"random_good_of_age_24h":25},"OceanicFuture":{"medals_24h":4360,"random_good_of_age_24h":25},"VirtualFuture":{"medals_24h":5310,"random_good_of_age_24h":25},"SpaceAgeMars":{"medals_24h":6450,"random_good_of_age_24h":25},"SpaceAgeAsteroidBelt":{"medals_24h":7590,"random_good_of_age_24h":25},"SpaceAgeVenus":{"medals_24h":8720,"random_good_of_age_24h":25},"SpaceAgeJupiterMoon":{"medals_24h":9860,"random_good_of_age_24h":25},"SpaceAgeTitan":{"medals_24h":11000,"random_good_of_age_24h":25},"SpaceAgeSpaceHub":{"medals_24h":12140,"random_good_of_age_24h":25}}, boosts: [{"type":"att_boost_attacker","value":50,"feature":"all"},{"type":"att_boost_attacker","value":25,"feature":"guild_raids"},{"type":"def_boost_attacker","value":20,"feature":"all"},{"type":"def_boost_defender","value":60,"feature":"all"}] },
+    "W_MultiAge_HERO24H3": { prod: {"BronzeAge":{"population":-20,"medals_24h":10,"random_good_of_age_24h":2},"IronAge":{"population":-50,"medals_24h":10,"random_good_of_age_24h":2},"EarlyMiddleAge":{"population":-80,"medals_24h":10,"random_good_of_age_24h":2},"HighMiddleAge":{"population":-110,"medals_24h":20,"random_good_of_age_24h":2},"LateMiddleAge":{"population":-150,"medals_24h":20,"random_good_of_age_24h":2},"ColonialAge":{"population":-180,"medals_24h":20,"random_good_of_age_24h":2},"IndustrialAge":{"population":-230,"medals_24h":30,"random_good_of_age_24h":2},"ProgressiveEra":{"population":-270,"medals_24h":50,"random_good_of_age_24h":2},"ModernEra":{"population":-320,"medals_24h":60,"random_good_of_age_24h":2},"PostModernEra":{"population":-360,"medals_24h":90,"random_good_of_age_24h":2},"ContemporaryEra":{"population":-410,"medals_24h":130,"random_good_of_age_24h":2},"TomorrowEra":{"population":-470,"medals_24h":170,"random_good_of_age_24h":2},"FutureEra":{"population":-520,"medals_24h":210,"random_good_of_age_24h":2},"ArcticFuture":{"population":-580,"medals_24h":260,"random_good_of_age_24h":2},"OceanicFuture":{"population":-640,"medals_24h":300,"random_good_of_age_24h":2},"VirtualFuture":{"population":-700,"medals_24h":360,"random_good_of_age_24h":2},"SpaceAgeMars":{"population":-1110,"medals_24h":440,"random_good_of_age_24h":2},"SpaceAgeAsteroidBelt":{"population":-1200,"medals_24h":520,"random_good_of_age_24h":2},"SpaceAgeVenus":{"population":-1300,"medals_24h":590,"random_good_of_age_24h":2},"SpaceAgeJupiterMoon":{"population":-1400,"medals_24h":670,"random_good_of_age_24h":2},"SpaceAgeTitan":{"population":-1500,"medals_24h":750,"random_good_of_age_24h":2},"SpaceAgeSpaceHub":{"population":-1600,"medals_24h":830,"random_good_of_age_24h":2}}, boosts: [{"type":"att_boost_attacker","value":3,"feature":"all"},{"type":"att_boost_attacker","value":2,"feature":"battleground"},{"type":"def_boost_defender","value":1,"feature":"all"},{"type":"def_boost_defender","value":3,"feature":"guild_expedition"}] },
+    "W_MultiAge_HERO24A1": { prod: {"BronzeAge":{"money_24h":1000},"IronAge":{"money_24h":2390},"EarlyMiddleAge":{"money_24h":3990},"HighMiddleAge":{"money_24h":5580},"LateMiddleAge":{"money_24h":7380},"ColonialAge":{"money_24h":11240},"IndustrialAge":{"money_24h":14000},"ProgressiveEra":{"money_24h":16990},"ModernEra":{"money_24h":21140},"PostModernEra":{"money_24h":26600},"ContemporaryEra":{"money_24h":34630},"TomorrowEra":{"money_24h":40090},"FutureEra":{"money_24h":45950},"ArcticFuture":{"money_24h":52220},"OceanicFuture":{"money_24h":58880},"VirtualFuture":{"money_24h":65950},"SpaceAgeMars":{"money_24h":110160},"SpaceAgeAsteroidBelt":{"money_24h":122020},"SpaceAgeVenus":{"money_24h":134500},"SpaceAgeJupiterMoon":{"money_24h":147630},"SpaceAgeTitan":{"money_24h":161400},"SpaceAgeSpaceHub":{"money_24h":175170}} },
+    "W_MultiAge_HERO24A2": { prod: {"BronzeAge":{"money_24h":1100,"medals_24h":42},"IronAge":{"money_24h":2650,"medals_24h":54},"EarlyMiddleAge":{"money_24h":4410,"medals_24h":66},"HighMiddleAge":{"money_24h":6170,"medals_24h":78},"LateMiddleAge":{"money_24h":8160,"medals_24h":90},"ColonialAge":{"money_24h":12420,"medals_24h":108},"IndustrialAge":{"money_24h":15480,"medals_24h":150},"ProgressiveEra":{"money_24h":18780,"medals_24h":210},"ModernEra":{"money_24h":23370,"medals_24h":300},"PostModernEra":{"money_24h":29400,"medals_24h":420},"ContemporaryEra":{"money_24h":38270,"medals_24h":600},"TomorrowEra":{"money_24h":44310,"medals_24h":810},"FutureEra":{"money_24h":50800,"medals_24h":990},"ArcticFuture":{"money_24h":57720,"medals_24h":1200},"OceanicFuture":{"money_24h":65080,"medals_24h":1380},"VirtualFuture":{"money_24h":72900,"medals_24h":1680},"SpaceAgeMars":{"money_24h":121760,"medals_24h":2040},"SpaceAgeAsteroidBelt":{"money_24h":134870,"medals_24h":2400},"SpaceAgeVenus":{"money_24h":148670,"medals_24h":2760},"SpaceAgeJupiterMoon":{"money_24h":163180,"medals_24h":3120},"SpaceAgeTitan":{"money_24h":178400,"medals_24h":3527},"SpaceAgeSpaceHub":{"money_24h":193620,"medals_24h":3934}} },
+    "W_MultiAge_HERO24A3": { prod: {"BronzeAge":{"money_24h":1210,"medals_24h":45,"random_good_of_previous_age_24h":5},"IronAge":{"money_24h":2900,"medals_24h":57,"random_good_of_previous_age_24h":5},"EarlyMiddleAge":{"money_24h":4830,"medals_24h":70,"random_good_of_previous_age_24h":5},"HighMiddleAge":{"money_24h":6760,"medals_24h":82,"random_good_of_previous_age_24h":5},"LateMiddleAge":{"money_24h":8930,"medals_24h":95,"random_good_of_previous_age_24h":5},"ColonialAge":{"money_24h":13610,"medals_24h":114,"random_good_of_previous_age_24h":5},"IndustrialAge":{"money_24h":16950,"medals_24h":158,"random_good_of_previous_age_24h":5},"ProgressiveEra":{"money_24h":20570,"medals_24h":221,"random_good_of_previous_age_24h":5},"ModernEra":{"money_24h":25600,"medals_24h":315,"random_good_of_previous_age_24h":5},"PostModernEra":{"money_24h":32200,"medals_24h":441,"random_good_of_previous_age_24h":5},"ContemporaryEra":{"money_24h":41920,"medals_24h":630,"random_good_of_previous_age_24h":5},"TomorrowEra":{"money_24h":48540,"medals_24h":851,"random_good_of_previous_age_24h":5},"FutureEra":{"money_24h":55640,"medals_24h":1040,"random_good_of_previous_age_24h":5},"ArcticFuture":{"money_24h":63220,"medals_24h":1260,"random_good_of_previous_age_24h":5},"OceanicFuture":{"money_24h":71280,"medals_24h":1449,"random_good_of_previous_age_24h":5},"VirtualFuture":{"money_24h":79840,"medals_24h":1764,"random_good_of_previous_age_24h":5},"SpaceAgeMars":{"money_24h":133370,"medals_24h":2142,"random_good_of_previous_age_24h":5},"SpaceAgeAsteroidBelt":{"money_24h":147720,"medals_24h":2520,"random_good_of_previous_age_24h":5},"SpaceAgeVenus":{"money_24h":162840,"medals_24h":2898,"random_good_of_previous_age_24h":5},"SpaceAgeJupiterMoon":{"money_24h":178730,"medals_24h":3276,"random_good_of_previous_age_24h":5},"SpaceAgeTitan":{"money_24h":195400,"medals_24h":3704,"random_good_of_previous_age_24h":5},"SpaceAgeSpaceHub":{"money_24h":212070,"medals_24h":4132,"random_good_of_previous_age_24h":5}} },
+    "W_MultiAge_HERO24A4": { prod: {"BronzeAge":{"money_24h":1310,"medals_24h":47,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"IronAge":{"money_24h":3150,"medals_24h":60,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"EarlyMiddleAge":{"money_24h":5250,"medals_24h":73,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"HighMiddleAge":{"money_24h":7350,"medals_24h":86,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"LateMiddleAge":{"money_24h":9710,"medals_24h":99,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"ColonialAge":{"money_24h":14790,"medals_24h":119,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"IndustrialAge":{"money_24h":18430,"medals_24h":165,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"ProgressiveEra":{"money_24h":22360,"medals_24h":231,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"ModernEra":{"money_24h":27820,"medals_24h":330,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"PostModernEra":{"money_24h":35000,"medals_24h":462,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"ContemporaryEra":{"money_24h":45570,"medals_24h":660,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"TomorrowEra":{"money_24h":52760,"medals_24h":891,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"FutureEra":{"money_24h":60480,"medals_24h":1089,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"ArcticFuture":{"money_24h":68720,"medals_24h":1320,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"OceanicFuture":{"money_24h":77480,"medals_24h":1518,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"VirtualFuture":{"money_24h":86790,"medals_24h":1848,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"SpaceAgeMars":{"money_24h":144970,"medals_24h":2244,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"SpaceAgeAsteroidBelt":{"money_24h":160570,"medals_24h":2640,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"SpaceAgeVenus":{"money_24h":177000,"medals_24h":3036,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"SpaceAgeJupiterMoon":{"money_24h":194280,"medals_24h":3432,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"SpaceAgeTitan":{"money_24h":212400,"medals_24h":3880,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"SpaceAgeSpaceHub":{"money_24h":230520,"medals_24h":4328,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5}} },
+    "W_MultiAge_HERO24A5": { prod: {"BronzeAge":{"money_24h":1420,"medals_24h":49,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"IronAge":{"money_24h":3400,"medals_24h":63,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"EarlyMiddleAge":{"money_24h":5670,"medals_24h":76,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"HighMiddleAge":{"money_24h":7940,"medals_24h":90,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"LateMiddleAge":{"money_24h":10490,"medals_24h":104,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"ColonialAge":{"money_24h":15970,"medals_24h":125,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"IndustrialAge":{"money_24h":19900,"medals_24h":173,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"ProgressiveEra":{"money_24h":24150,"medals_24h":242,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"ModernEra":{"money_24h":30050,"medals_24h":345,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"PostModernEra":{"money_24h":37800,"medals_24h":483,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"ContemporaryEra":{"money_24h":49210,"medals_24h":690,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"TomorrowEra":{"money_24h":56980,"medals_24h":932,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"FutureEra":{"money_24h":65320,"medals_24h":1139,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"ArcticFuture":{"money_24h":74220,"medals_24h":1380,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"OceanicFuture":{"money_24h":83690,"medals_24h":1587,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"VirtualFuture":{"money_24h":93740,"medals_24h":1932,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"SpaceAgeMars":{"money_24h":156570,"medals_24h":2346,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"money_24h":173420,"medals_24h":2760,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"SpaceAgeVenus":{"money_24h":191170,"medals_24h":3174,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"money_24h":209830,"medals_24h":3588,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"SpaceAgeTitan":{"money_24h":229400,"medals_24h":4056,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2},"SpaceAgeSpaceHub":{"money_24h":248970,"medals_24h":4524,"random_good_of_previous_age_24h":15,"random_good_of_age_24h":10,"strategy_points_24h":2}} },
+    "W_MultiAge_HERO24A6": { prod: {"BronzeAge":{"money_24h":1520,"medals_24h":51,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"IronAge":{"money_24h":3650,"medals_24h":65,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"EarlyMiddleAge":{"money_24h":6090,"medals_24h":80,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"HighMiddleAge":{"money_24h":8530,"medals_24h":94,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"LateMiddleAge":{"money_24h":11270,"medals_24h":108,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"ColonialAge":{"money_24h":17160,"medals_24h":130,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"IndustrialAge":{"money_24h":21380,"medals_24h":180,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"ProgressiveEra":{"money_24h":25940,"medals_24h":252,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"ModernEra":{"money_24h":32280,"medals_24h":360,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"PostModernEra":{"money_24h":40600,"medals_24h":504,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"ContemporaryEra":{"money_24h":52860,"medals_24h":720,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"TomorrowEra":{"money_24h":61200,"medals_24h":972,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"FutureEra":{"money_24h":70160,"medals_24h":1188,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"ArcticFuture":{"money_24h":79720,"medals_24h":1440,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"OceanicFuture":{"money_24h":89890,"medals_24h":1656,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"VirtualFuture":{"money_24h":100680,"medals_24h":2016,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"SpaceAgeMars":{"money_24h":168170,"medals_24h":2448,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"SpaceAgeAsteroidBelt":{"money_24h":186280,"medals_24h":2880,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"SpaceAgeVenus":{"money_24h":205340,"medals_24h":3312,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"SpaceAgeJupiterMoon":{"money_24h":225370,"medals_24h":3744,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"SpaceAgeTitan":{"money_24h":246400,"medals_24h":4233,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4},"SpaceAgeSpaceHub":{"money_24h":267430,"medals_24h":4722,"random_good_of_previous_age_24h":20,"random_good_of_age_24h":15,"strategy_points_24h":4}}, boosts: [{"type":"att_boost_attacker","value":5,"feature":"guild_expedition"},{"type":"def_boost_defender","value":10,"feature":"guild_expedition"}] },
+    "W_MultiAge_HERO24A7": { prod: {"BronzeAge":{"money_24h":1630,"medals_24h":59,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"IronAge":{"money_24h":3910,"medals_24h":76,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"EarlyMiddleAge":{"money_24h":6510,"medals_24h":93,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"HighMiddleAge":{"money_24h":9110,"medals_24h":110,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"LateMiddleAge":{"money_24h":12040,"medals_24h":126,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"ColonialAge":{"money_24h":18340,"medals_24h":152,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"IndustrialAge":{"money_24h":22850,"medals_24h":210,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"ProgressiveEra":{"money_24h":27730,"medals_24h":294,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"ModernEra":{"money_24h":34500,"medals_24h":420,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"PostModernEra":{"money_24h":43410,"medals_24h":588,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"ContemporaryEra":{"money_24h":56510,"medals_24h":840,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"TomorrowEra":{"money_24h":65430,"medals_24h":1134,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"FutureEra":{"money_24h":75000,"medals_24h":1386,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"ArcticFuture":{"money_24h":85220,"medals_24h":1680,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"OceanicFuture":{"money_24h":96090,"medals_24h":1932,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"VirtualFuture":{"money_24h":107630,"medals_24h":2352,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"SpaceAgeMars":{"money_24h":179780,"medals_24h":2856,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"SpaceAgeAsteroidBelt":{"money_24h":199130,"medals_24h":3360,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"SpaceAgeVenus":{"money_24h":219510,"medals_24h":3864,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"SpaceAgeJupiterMoon":{"money_24h":240920,"medals_24h":4368,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"SpaceAgeTitan":{"money_24h":263400,"medals_24h":4938,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20},"SpaceAgeSpaceHub":{"money_24h":285880,"medals_24h":5508,"random_good_of_previous_age_24h":40,"random_good_of_age_24h":50,"strategy_points_24h":20}}, boosts: [{"type":"att_boost_attacker","value":45,"feature":"guild_expedition"},{"type":"att_boost_attacker","value":30,"feature":"all"},{"type":"def_boost_defender","value":60,"feature":"guild_expedition"},{"type":"def_boost_defender","value":25,"feature":"all"}] },
+    "W_MultiAge_HERO24A8": { prod: {"BronzeAge":{"money_24h":1730,"medals_24h":61,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"IronAge":{"money_24h":4160,"medals_24h":79,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"EarlyMiddleAge":{"money_24h":6930,"medals_24h":96,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"HighMiddleAge":{"money_24h":9700,"medals_24h":114,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"LateMiddleAge":{"money_24h":12820,"medals_24h":131,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"ColonialAge":{"money_24h":19530,"medals_24h":157,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"IndustrialAge":{"money_24h":24330,"medals_24h":218,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"ProgressiveEra":{"money_24h":29520,"medals_24h":305,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"ModernEra":{"money_24h":36730,"medals_24h":435,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"PostModernEra":{"money_24h":46210,"medals_24h":609,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"ContemporaryEra":{"money_24h":60160,"medals_24h":870,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"TomorrowEra":{"money_24h":69650,"medals_24h":1175,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"FutureEra":{"money_24h":79840,"medals_24h":1436,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"ArcticFuture":{"money_24h":90720,"medals_24h":1740,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"OceanicFuture":{"money_24h":102290,"medals_24h":2001,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"VirtualFuture":{"money_24h":114580,"medals_24h":2436,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"SpaceAgeMars":{"money_24h":191380,"medals_24h":2958,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"SpaceAgeAsteroidBelt":{"money_24h":211980,"medals_24h":3480,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"SpaceAgeVenus":{"money_24h":233670,"medals_24h":4002,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"SpaceAgeJupiterMoon":{"money_24h":256470,"medals_24h":4524,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"SpaceAgeTitan":{"money_24h":280400,"medals_24h":5115,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25},"SpaceAgeSpaceHub":{"money_24h":304330,"medals_24h":5706,"random_good_of_previous_age_24h":50,"random_good_of_age_24h":70,"strategy_points_24h":25}}, boosts: [{"type":"att_boost_attacker","value":60,"feature":"guild_expedition"},{"type":"att_boost_attacker","value":40,"feature":"all"},{"type":"def_boost_defender","value":70,"feature":"guild_expedition"},{"type":"def_boost_defender","value":30,"feature":"all"}] },
+    "W_MultiAge_HERO24D2TEMP": { prod: {"BronzeAge":{"population":-320,"money_24h":1240,"random_good_of_age_24h":25},"IronAge":{"population":-690,"money_24h":2970,"random_good_of_age_24h":25},"EarlyMiddleAge":{"population":-1060,"money_24h":4940,"random_good_of_age_24h":25},"HighMiddleAge":{"population":-1490,"money_24h":6920,"random_good_of_age_24h":25},"LateMiddleAge":{"population":-1950,"money_24h":9140,"random_good_of_age_24h":25},"ColonialAge":{"population":-2460,"money_24h":13930,"random_good_of_age_24h":25},"IndustrialAge":{"population":-3010,"money_24h":17350,"random_good_of_age_24h":25},"ProgressiveEra":{"population":-3590,"money_24h":21060,"random_good_of_age_24h":25},"ModernEra":{"population":-4210,"money_24h":26200,"random_good_of_age_24h":25},"PostModernEra":{"population":-4850,"money_24h":32960,"random_good_of_age_24h":25},"ContemporaryEra":{"population":-5530,"money_24h":42910,"random_good_of_age_24h":25},"TomorrowEra":{"population":-6230,"money_24h":49680,"random_good_of_age_24h":25},"FutureEra":{"population":-6960,"money_24h":56950,"random_good_of_age_24h":25},"ArcticFuture":{"population":-7720,"money_24h":64710,"random_good_of_age_24h":25},"OceanicFuture":{"population":-8510,"money_24h":72960,"random_good_of_age_24h":25},"VirtualFuture":{"population":-9320,"money_24h":81720,"random_good_of_age_24h":25},"SpaceAgeMars":{"population":-14750,"money_24h":136510,"random_good_of_age_24h":25},"SpaceAgeAsteroidBelt":{"population":-16020,"money_24h":151200,"random_good_of_age_24h":25},"SpaceAgeVenus":{"population":-17310,"money_24h":166670,"random_good_of_age_24h":25},"SpaceAgeJupiterMoon":{"population":-18650,"money_24h":182930,"random_good_of_age_24h":25},"SpaceAgeTitan":{"population":-20000,"money_24h":200000,"random_good_of_age_24h":25},"SpaceAgeSpaceHub":{"population":-21350,"money_24h":217070,"random_good_of_age_24h":25}}, boosts: [{"type":"att_boost_attacker","value":8,"feature":"all"},{"type":"att_boost_attacker","value":30,"feature":"battleground"},{"type":"att_boost_attacker","value":10,"feature":"guild_raids"},{"type":"att_boost_defender","value":10,"feature":"guild_raids"},{"type":"def_boost_attacker","value":10,"feature":"all"}] },
+    "W_MultiAge_HERO24D1REG": { prod: {"BronzeAge":{"population":-320,"money_24h":1110,"random_good_of_age_24h":15},"IronAge":{"population":-690,"money_24h":2670,"random_good_of_age_24h":15},"EarlyMiddleAge":{"population":-1060,"money_24h":4450,"random_good_of_age_24h":15},"HighMiddleAge":{"population":-1490,"money_24h":6230,"random_good_of_age_24h":15},"LateMiddleAge":{"population":-1950,"money_24h":8230,"random_good_of_age_24h":15},"ColonialAge":{"population":-2460,"money_24h":12530,"random_good_of_age_24h":15},"IndustrialAge":{"population":-3010,"money_24h":15620,"random_good_of_age_24h":15},"ProgressiveEra":{"population":-3590,"money_24h":18950,"random_good_of_age_24h":15},"ModernEra":{"population":-4210,"money_24h":23580,"random_good_of_age_24h":15},"PostModernEra":{"population":-4850,"money_24h":29660,"random_good_of_age_24h":15},"ContemporaryEra":{"population":-5530,"money_24h":38620,"random_good_of_age_24h":15},"TomorrowEra":{"population":-6230,"money_24h":44710,"random_good_of_age_24h":15},"FutureEra":{"population":-6960,"money_24h":51250,"random_good_of_age_24h":15},"ArcticFuture":{"population":-7720,"money_24h":58240,"random_good_of_age_24h":15},"OceanicFuture":{"population":-8510,"money_24h":65660,"random_good_of_age_24h":15},"VirtualFuture":{"population":-9320,"money_24h":73550,"random_good_of_age_24h":15},"SpaceAgeMars":{"population":-14750,"money_24h":122850,"random_good_of_age_24h":15},"SpaceAgeAsteroidBelt":{"population":-16020,"money_24h":136080,"random_good_of_age_24h":15},"SpaceAgeVenus":{"population":-17310,"money_24h":150000,"random_good_of_age_24h":15},"SpaceAgeJupiterMoon":{"population":-18650,"money_24h":164640,"random_good_of_age_24h":15},"SpaceAgeTitan":{"population":-20000,"money_24h":180000,"random_good_of_age_24h":15},"SpaceAgeSpaceHub":{"population":-21350,"money_24h":195360,"random_good_of_age_24h":15}}, boosts: [{"type":"att_boost_attacker","value":5,"feature":"all"},{"type":"att_boost_attacker","value":15,"feature":"battleground"},{"type":"def_boost_attacker","value":4,"feature":"all"}] },
+    "W_MultiAge_HERO24A9": { prod: {"BronzeAge":{"money_24h":1840,"medals_24h":84,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"IronAge":{"money_24h":4410,"medals_24h":108,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"EarlyMiddleAge":{"money_24h":7350,"medals_24h":132,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"HighMiddleAge":{"money_24h":10290,"medals_24h":156,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"LateMiddleAge":{"money_24h":13600,"medals_24h":180,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"ColonialAge":{"money_24h":20710,"medals_24h":216,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"IndustrialAge":{"money_24h":25800,"medals_24h":300,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"ProgressiveEra":{"money_24h":31310,"medals_24h":420,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"ModernEra":{"money_24h":38960,"medals_24h":600,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"PostModernEra":{"money_24h":49010,"medals_24h":840,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"ContemporaryEra":{"money_24h":63800,"medals_24h":1200,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"TomorrowEra":{"money_24h":73870,"medals_24h":1620,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"FutureEra":{"money_24h":84680,"medals_24h":1980,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"ArcticFuture":{"money_24h":96220,"medals_24h":2400,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"OceanicFuture":{"money_24h":108490,"medals_24h":2760,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"VirtualFuture":{"money_24h":121520,"medals_24h":3360,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"SpaceAgeMars":{"money_24h":202980,"medals_24h":4080,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"SpaceAgeAsteroidBelt":{"money_24h":224830,"medals_24h":4800,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"SpaceAgeVenus":{"money_24h":247840,"medals_24h":5520,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"SpaceAgeJupiterMoon":{"money_24h":272020,"medals_24h":6240,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"SpaceAgeTitan":{"money_24h":297400,"medals_24h":7054,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30},"SpaceAgeSpaceHub":{"money_24h":322780,"medals_24h":7868,"random_good_of_previous_age_24h":60,"random_good_of_age_24h":80,"strategy_points_24h":30}}, boosts: [{"type":"att_boost_attacker","value":80,"feature":"guild_expedition"},{"type":"att_boost_attacker","value":50,"feature":"all"},{"type":"def_boost_defender","value":80,"feature":"guild_expedition"},{"type":"def_boost_defender","value":30,"feature":"all"}] },
+    "W_MultiAge_HERO24B1REG": { prod: {"BronzeAge":{"population":-320,"money_24h":1110,"random_good_of_age_24h":10,"strategy_points_24h":8},"IronAge":{"population":-690,"money_24h":2670,"random_good_of_age_24h":10,"strategy_points_24h":8},"EarlyMiddleAge":{"population":-1060,"money_24h":4450,"random_good_of_age_24h":10,"strategy_points_24h":8},"HighMiddleAge":{"population":-1490,"money_24h":6230,"random_good_of_age_24h":10,"strategy_points_24h":8},"LateMiddleAge":{"population":-1950,"money_24h":8230,"random_good_of_age_24h":10,"strategy_points_24h":8},"ColonialAge":{"population":-2460,"money_24h":12530,"random_good_of_age_24h":10,"strategy_points_24h":8},"IndustrialAge":{"population":-3010,"money_24h":15620,"random_good_of_age_24h":10,"strategy_points_24h":8},"ProgressiveEra":{"population":-3590,"money_24h":18950,"random_good_of_age_24h":10,"strategy_points_24h":8},"ModernEra":{"population":-4210,"money_24h":23580,"random_good_of_age_24h":10,"strategy_points_24h":8},"PostModernEra":{"population":-4850,"money_24h":29660,"random_good_of_age_24h":10,"strategy_points_24h":8},"ContemporaryEra":{"population":-5530,"money_24h":38620,"random_good_of_age_24h":10,"strategy_points_24h":8},"TomorrowEra":{"population":-6230,"money_24h":44710,"random_good_of_age_24h":10,"strategy_points_24h":8},"FutureEra":{"population":-6960,"money_24h":51250,"random_good_of_age_24h":10,"strategy_points_24h":8},"ArcticFuture":{"population":-7720,"money_24h":58240,"random_good_of_age_24h":10,"strategy_points_24h":8},"OceanicFuture":{"population":-8510,"money_24h":65660,"random_good_of_age_24h":10,"strategy_points_24h":8},"VirtualFuture":{"population":-9320,"money_24h":73550,"random_good_of_age_24h":10,"strategy_points_24h":8},"SpaceAgeMars":{"population":-14750,"money_24h":122850,"random_good_of_age_24h":10,"strategy_points_24h":8},"SpaceAgeAsteroidBelt":{"population":-16020,"money_24h":136080,"random_good_of_age_24h":10,"strategy_points_24h":8},"SpaceAgeVenus":{"population":-17310,"money_24h":150000,"random_good_of_age_24h":10,"strategy_points_24h":8},"SpaceAgeJupiterMoon":{"population":-18650,"money_24h":164640,"random_good_of_age_24h":10,"strategy_points_24h":8},"SpaceAgeTitan":{"population":-20000,"money_24h":180000,"random_good_of_age_24h":10,"strategy_points_24h":8},"SpaceAgeSpaceHub":{"population":-21350,"money_24h":195360,"random_good_of_age_24h":10,"strategy_points_24h":8}}, boosts: [{"type":"att_def_boost_attacker","value":3,"feature":"all"},{"type":"att_boost_defender","value":10,"feature":"guild_expedition"}] },
+    "W_MultiAge_HERO24B2TEMP": { prod: {"BronzeAge":{"population":-320,"money_24h":1240,"random_good_of_age_24h":20,"strategy_points_24h":12},"IronAge":{"population":-690,"money_24h":2970,"random_good_of_age_24h":20,"strategy_points_24h":12},"EarlyMiddleAge":{"population":-1060,"money_24h":4940,"random_good_of_age_24h":20,"strategy_points_24h":12},"HighMiddleAge":{"population":-1490,"money_24h":6920,"random_good_of_age_24h":20,"strategy_points_24h":12},"LateMiddleAge":{"population":-1950,"money_24h":9140,"random_good_of_age_24h":20,"strategy_points_24h":12},"ColonialAge":{"population":-2460,"money_24h":13930,"random_good_of_age_24h":20,"strategy_points_24h":12},"IndustrialAge":{"population":-3010,"money_24h":17350,"random_good_of_age_24h":20,"strategy_points_24h":12},"ProgressiveEra":{"population":-3590,"money_24h":21060,"random_good_of_age_24h":20,"strategy_points_24h":12},"ModernEra":{"population":-4210,"money_24h":26200,"random_good_of_age_24h":20,"strategy_points_24h":12},"PostModernEra":{"population":-4850,"money_24h":32960,"random_good_of_age_24h":20,"strategy_points_24h":12},"ContemporaryEra":{"population":-5530,"money_24h":42910,"random_good_of_age_24h":20,"strategy_points_24h":12},"TomorrowEra":{"population":-6230,"money_24h":49680,"random_good_of_age_24h":20,"strategy_points_24h":12},"FutureEra":{"population":-6960,"money_24h":56950,"random_good_of_age_24h":20,"strategy_points_24h":12},"ArcticFuture":{"population":-7720,"money_24h":64710,"random_good_of_age_24h":20,"strategy_points_24h":12},"OceanicFuture":{"population":-8510,"money_24h":72960,"random_good_of_age_24h":20,"strategy_points_24h":12},"VirtualFuture":{"population":-9320,"money_24h":81720,"random_good_of_age_24h":20,"strategy_points_24h":12},"SpaceAgeMars":{"population":-14750,"money_24h":136510,"random_good_of_age_24h":20,"strategy_points_24h":12},"SpaceAgeAsteroidBelt":{"population":-16020,"money_24h":151200,"random_good_of_age_24h":20,"strategy_points_24h":12},"SpaceAgeVenus":{"population":-17310,"money_24h":166670,"random_good_of_age_24h":20,"strategy_points_24h":12},"SpaceAgeJupiterMoon":{"population":-18650,"money_24h":182930,"random_good_of_age_24h":20,"strategy_points_24h":12},"SpaceAgeTitan":{"population":-20000,"money_24h":200000,"random_good_of_age_24h":20,"strategy_points_24h":12},"SpaceAgeSpaceHub":{"population":-21350,"money_24h":217070,"random_good_of_age_24h":20,"strategy_points_24h":12}}, boosts: [{"type":"att_def_boost_attacker","value":12,"feature":"all"},{"type":"att_def_boost_attacker","value":20,"feature":"guild_raids"},{"type":"att_boost_defender","value":20,"feature":"guild_expedition"}] },
+    "W_MultiAge_HERO24F1": { prod: {"BronzeAge":{"population":-320,"medals_24h":90,"strategy_points_24h":12,"random_good_of_age_24h":20},"IronAge":{"population":-690,"medals_24h":160,"strategy_points_24h":12,"random_good_of_age_24h":20},"EarlyMiddleAge":{"population":-1060,"medals_24h":190,"strategy_points_24h":12,"random_good_of_age_24h":20},"HighMiddleAge":{"population":-1490,"medals_24h":220,"strategy_points_24h":12,"random_good_of_age_24h":20},"LateMiddleAge":{"population":-1950,"medals_24h":260,"strategy_points_24h":12,"random_good_of_age_24h":20},"ColonialAge":{"population":-2460,"medals_24h":310,"strategy_points_24h":12,"random_good_of_age_24h":20},"IndustrialAge":{"population":-3010,"medals_24h":430,"strategy_points_24h":12,"random_good_of_age_24h":20},"ProgressiveEra":{"population":-3590,"medals_24h":600,"strategy_points_24h":12,"random_good_of_age_24h":20},"ModernEra":{"population":-4210,"medals_24h":860,"strategy_points_24h":12,"random_good_of_age_24h":20},"PostModernEra":{"population":-4850,"medals_24h":1210,"strategy_points_24h":12,"random_good_of_age_24h":20},"ContemporaryEra":{"population":-5530,"medals_24h":1720,"strategy_points_24h":12,"random_good_of_age_24h":20},"TomorrowEra":{"population":-6230,"medals_24h":2330,"strategy_points_24h":12,"random_good_of_age_24h":20},"FutureEra":{"population":-6960,"medals_24h":2840,"strategy_points_24h":12,"random_good_of_age_24h":20},"ArcticFuture":{"population":-7720,"medals_24h":3450,"strategy_points_24h":12,"random_good_of_age_24h":20},"OceanicFuture":{"population":-8510,"medals_24h":3970,"strategy_points_24h":12,"random_good_of_age_24h":20},"VirtualFuture":{"population":-9320,"medals_24h":4830,"strategy_points_24h":12,"random_good_of_age_24h":20},"SpaceAgeMars":{"population":-14750,"medals_24h":5860,"strategy_points_24h":12,"random_good_of_age_24h":20},"SpaceAgeAsteroidBelt":{"population":-16020,"medals_24h":6900,"strategy_points_24h":12,"random_good_of_age_24h":20},"SpaceAgeVenus":{"population":-17310,"medals_24h":7930,"strategy_points_24h":12,"random_good_of_age_24h":20},"SpaceAgeJupiterMoon":{"population":-18650,"medals_24h":8970,"strategy_points_24h":12,"random_good_of_age_24h":20},"SpaceAgeTitan":{"population":-20000,"medals_24h":10000,"strategy_points_24h":12,"random_good_of_age_24h":20},"SpaceAgeSpaceHub":{"population":-21350,"medals_24h":11030,"strategy_points_24h":12,"random_good_of_age_24h":20}}, boosts: [{"type":"att_boost_attacker","value":20,"feature":"all"},{"type":"att_boost_attacker","value":30,"feature":"battleground"},{"type":"def_boost_defender","value":25,"feature":"all"},{"type":"att_def_boost_attacker","value":35,"feature":"battleground"}] },
+    "W_MultiAge_HERO24C1REG": { prod: {"BronzeAge":{"population":-320,"money_24h":1110},"IronAge":{"population":-690,"money_24h":2670},"EarlyMiddleAge":{"population":-1060,"money_24h":4450},"HighMiddleAge":{"population":-1490,"money_24h":6230},"LateMiddleAge":{"population":-1950,"money_24h":8230},"ColonialAge":{"population":-2460,"money_24h":12530},"IndustrialAge":{"population":-3010,"money_24h":15620},"ProgressiveEra":{"population":-3590,"money_24h":18950},"ModernEra":{"population":-4210,"money_24h":23580},"PostModernEra":{"population":-4850,"money_24h":29660},"ContemporaryEra":{"population":-5530,"money_24h":38620},"TomorrowEra":{"population":-6230,"money_24h":44710},"FutureEra":{"population":-6960,"money_24h":51250},"ArcticFuture":{"population":-7720,"money_24h":58240},"OceanicFuture":{"population":-8510,"money_24h":65660},"VirtualFuture":{"population":-9320,"money_24h":73550},"SpaceAgeMars":{"population":-14750,"money_24h":122850},"SpaceAgeAsteroidBelt":{"population":-16020,"money_24h":136080},"SpaceAgeVenus":{"population":-17310,"money_24h":150000},"SpaceAgeJupiterMoon":{"population":-18650,"money_24h":164640},"SpaceAgeTitan":{"population":-20000,"money_24h":180000},"SpaceAgeSpaceHub":{"population":-21350,"money_24h":195360}}, boosts: [{"type":"def_boost_defender","value":6,"feature":"all"},{"type":"def_boost_defender","value":20,"feature":"guild_expedition"}] },
+    "W_MultiAge_HERO24C2TEMP": { prod: {"BronzeAge":{"population":-320,"money_24h":1240,"strategy_points_24h":5},"IronAge":{"population":-690,"money_24h":2970,"strategy_points_24h":5},"EarlyMiddleAge":{"population":-1060,"money_24h":4940,"strategy_points_24h":5},"HighMiddleAge":{"population":-1490,"money_24h":6920,"strategy_points_24h":5},"LateMiddleAge":{"population":-1950,"money_24h":9140,"strategy_points_24h":5},"ColonialAge":{"population":-2460,"money_24h":13930,"strategy_points_24h":5},"IndustrialAge":{"population":-3010,"money_24h":17350,"strategy_points_24h":5},"ProgressiveEra":{"population":-3590,"money_24h":21060,"strategy_points_24h":5},"ModernEra":{"population":-4210,"money_24h":26200,"strategy_points_24h":5},"PostModernEra":{"population":-4850,"money_24h":32960,"strategy_points_24h":5},"ContemporaryEra":{"population":-5530,"money_24h":42910,"strategy_points_24h":5},"TomorrowEra":{"population":-6230,"money_24h":49680,"strategy_points_24h":5},"FutureEra":{"population":-6960,"money_24h":56950,"strategy_points_24h":5},"ArcticFuture":{"population":-7720,"money_24h":64710,"strategy_points_24h":5},"OceanicFuture":{"population":-8510,"money_24h":72960,"strategy_points_24h":5},"VirtualFuture":{"population":-9320,"money_24h":81720,"strategy_points_24h":5},"SpaceAgeMars":{"population":-14750,"money_24h":136510,"strategy_points_24h":5},"SpaceAgeAsteroidBelt":{"population":-16020,"money_24h":151200,"strategy_points_24h":5},"SpaceAgeVenus":{"population":-17310,"money_24h":166670,"strategy_points_24h":5},"SpaceAgeJupiterMoon":{"population":-18650,"money_24h":182930,"strategy_points_24h":5},"SpaceAgeTitan":{"population":-20000,"money_24h":200000,"strategy_points_24h":5},"SpaceAgeSpaceHub":{"population":-21350,"money_24h":217070,"strategy_points_24h":5}}, boosts: [{"type":"def_boost_defender","value":20,"feature":"all"},{"type":"def_boost_defender","value":40,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":15,"feature":"guild_raids"}] },
+};
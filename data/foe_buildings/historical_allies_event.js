@@ -0,0 +1,5 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 1 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_HistoricalAlliesStarter24A": { prod: {"AllAge":{"strategy_points_24h":10,"all_goods_of_age_24h":10,"all_goods_of_previous_age_24h":10,"random_good_of_next_age_24h":10},"BronzeAge":{"happiness":440},"IronAge":{"happiness":760},"EarlyMiddleAge":{"happiness":840},"HighMiddleAge":{"happiness":940},"LateMiddleAge":{"happiness":1050},"ColonialAge":{"happiness":1230},"IndustrialAge":{"happiness":1390},"ProgressiveEra":{"happiness":1520},"ModernEra":{"happiness":1630},"PostModernEra":{"happiness":1700},"ContemporaryEra":{"happiness":1970},"TomorrowEra":{"happiness":2400},"FutureEra":{"happiness":2870},"ArcticFuture":{"happiness":3340},"OceanicFuture":{"happiness":3860},"VirtualFuture":{"happiness":4610},"SpaceAgeMars":{"happiness":7370},"SpaceAgeAsteroidBelt":{"happiness":8010},"SpaceAgeVenus":{"happiness":8660},"SpaceAgeJupiterMoon":{"happiness":9320},"SpaceAgeTitan":{"happiness":10000},"SpaceAgeSpaceHub":{"happiness":10680}} },
+};
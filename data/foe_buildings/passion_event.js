@@ -0,0 +1,99 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 95 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_PAT24B1": { prod: {"AllAge":{"strategy_points_24h":30,"all_goods_of_age_24h":40}}, boosts: [{"type":"att_boost_attacker","value":27,"feature":"all"},{"type":"def_boost_attacker","value":27,"feature":"all"},{"type":"att_boost_defender","value":27,"feature":"all"},{"type":"def_boost_defender","value":27,"feature":"all"}] },
+    "W_MultiAge_PAT24B2": { prod: {"AllAge":{"strategy_points_24h":30,"all_goods_of_age_24h":45}}, boosts: [{"type":"att_boost_attacker","value":36,"feature":"all"},{"type":"def_boost_attacker","value":36,"feature":"all"},{"type":"att_boost_defender","value":36,"feature":"all"},{"type":"def_boost_defender","value":36,"feature":"all"}] },
+    "W_MultiAge_PAT24B3": { prod: {"AllAge":{"strategy_points_24h":30,"all_goods_of_age_24h":50}}, boosts: [{"type":"att_boost_attacker","value":45,"feature":"all"},{"type":"def_boost_attacker","value":45,"feature":"all"},{"type":"att_boost_defender","value":45,"feature":"all"},{"type":"def_boost_defender","value":45,"feature":"all"}] },
+    "W_MultiAge_PAT25D1": { prod: {"AllAge":{"strategy_points_24h":180}}, boosts: [{"type":"att_def_boost_attacker_defender","value":222,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":25,"feature":"guild_raids"}] },
+    "W_MultiAge_PAT23B1": { prod: {"BronzeAge":{"money_24h":30,"strategy_points_24h":2.0},"IronAge":{"money_24h":80,"strategy_points_24h":2.0},"EarlyMiddleAge":{"money_24h":130,"strategy_points_24h":2.0},"HighMiddleAge":{"money_24h":190,"strategy_points_24h":2.0},"LateMiddleAge":{"money_24h":250,"strategy_points_24h":2.0},"ColonialAge":{"money_24h":380,"strategy_points_24h":2.0},"IndustrialAge":{"money_24h":470,"strategy_points_24h":2.0},"ProgressiveEra":{"money_24h":570,"strategy_points_24h":2.0},"ModernEra":{"money_24h":710,"strategy_points_24h":2.0},"PostModernEra":{"money_24h":890,"strategy_points_24h":2.0},"ContemporaryEra":{"money_24h":1160,"strategy_points_24h":2.0},"TomorrowEra":{"money_24h":1340,"strategy_points_24h":2.0},"FutureEra":{"money_24h":1540,"strategy_points_24h":2.0},"ArcticFuture":{"money_24h":1750,"strategy_points_24h":2.0},"OceanicFuture":{"money_24h":1970,"strategy_points_24h":2.0},"VirtualFuture":{"money_24h":2200,"strategy_points_24h":2.0},"SpaceAgeMars":{"money_24h":3680,"strategy_points_24h":2.0},"SpaceAgeAsteroidBelt":{"money_24h":4080,"strategy_points_24h":2.0},"SpaceAgeVenus":{"money_24h":4500,"strategy_points_24h":2.0},"SpaceAgeJupiterMoon":{"money_24h":4930,"strategy_points_24h":2.0},"SpaceAgeTitan":{"money_24h":5402,"strategy_points_24h":2.0},"SpaceAgeSpaceHub":{"money_24h":5874,"strategy_points_24h":2.0}}, boosts: [{"type":"att_boost_attacker","value":1,"feature":"all"},{"type":"att_boost_defender","value":2,"feature":"all"}] },
+    "W_MultiAge_PAT23B2": { prod: {"BronzeAge":{"money_24h":60,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"IronAge":{"money_24h":160,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"EarlyMiddleAge":{"money_24h":260,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"HighMiddleAge":{"money_24h":380,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"LateMiddleAge":{"money_24h":500,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"ColonialAge":{"money_24h":760,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"IndustrialAge":{"money_24h":940,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"ProgressiveEra":{"money_24h":1140,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"ModernEra":{"money_24h":1420,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"PostModernEra":{"money_24h":1780,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"ContemporaryEra":{"money_24h":2320,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"TomorrowEra":{"money_24h":2680,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"FutureEra":{"money_24h":3080,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"ArcticFuture":{"money_24h":3500,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"OceanicFuture":{"money_24h":3940,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"VirtualFuture":{"money_24h":4400,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"SpaceAgeMars":{"money_24h":7360,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"SpaceAgeAsteroidBelt":{"money_24h":8160,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"SpaceAgeVenus":{"money_24h":9000,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"SpaceAgeJupiterMoon":{"money_24h":9860,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"SpaceAgeTitan":{"money_24h":10804,"random_good_of_age_24h":4,"strategy_points_24h":3.0},"SpaceAgeSpaceHub":{"money_24h":11748,"random_good_of_age_24h":4,"strategy_points_24h":3.0}}, boosts: [{"type":"att_boost_attacker","value":1,"feature":"all"},{"type":"att_boost_attacker","value":2,"feature":"battleground"},{"type":"att_boost_defender","value":2,"feature":"all"},{"type":"att_boost_defender","value":1,"feature":"guild_expedition"}] },
+    "W_MultiAge_PAT23C1": { prod: {"BronzeAge":{"money_24h":30,"strategy_points_24h":0.75},"IronAge":{"money_24h":80,"strategy_points_24h":0.75},"EarlyMiddleAge":{"money_24h":130,"strategy_points_24h":0.75},"HighMiddleAge":{"money_24h":190,"strategy_points_24h":0.75},"LateMiddleAge":{"money_24h":250,"strategy_points_24h":0.75},"ColonialAge":{"money_24h":380,"strategy_points_24h":0.75},"IndustrialAge":{"money_24h":470,"strategy_points_24h":0.75},"ProgressiveEra":{"money_24h":570,"strategy_points_24h":0.75},"ModernEra":{"money_24h":710,"strategy_points_24h":0.75},"PostModernEra":{"money_24h":890,"strategy_points_24h":0.75},"ContemporaryEra":{"money_24h":1160,"strategy_points_24h":0.75},"TomorrowEra":{"money_24h":1340,"strategy_points_24h":0.75},"FutureEra":{"money_24h":1540,"strategy_points_24h":0.75},"ArcticFuture":{"money_24h":1750,"strategy_points_24h":0.75},"OceanicFuture":{"money_24h":1970,"strategy_points_24h":0.75},"VirtualFuture":{"money_24h":2200,"strategy_points_24h":0.75},"SpaceAgeMars":{"money_24h":3680,"strategy_points_24h":0.75},"SpaceAgeAsteroidBelt":{"money_24h":4080,"strategy_points_24h":0.75},"SpaceAgeVenus":{"money_24h":4500,"strategy_points_24h":0.75},"SpaceAgeJupiterMoon":{"money_24h":4930,"strategy_points_24h":0.75},"SpaceAgeTitan":{"money_24h":5402,"strategy_points_24h":0.75},"SpaceAgeSpaceHub":{"money_24h":5874,"strategy_points_24h":0.75}}, boosts: [{"type":"def_boost_defender","value":1,"feature":"all"}] },
+    "W_MultiAge_PAT23C2": { prod: {"BronzeAge":{"money_24h":60,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"IronAge":{"money_24h":160,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"EarlyMiddleAge":{"money_24h":260,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"HighMiddleAge":{"money_24h":380,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"LateMiddleAge":{"money_24h":500,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"ColonialAge":{"money_24h":760,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"IndustrialAge":{"money_24h":940,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"ProgressiveEra":{"money_24h":1140,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"ModernEra":{"money_24h":1420,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"PostModernEra":{"money_24h":1780,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"ContemporaryEra":{"money_24h":2320,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"TomorrowEra":{"money_24h":2680,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"FutureEra":{"money_24h":3080,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"ArcticFuture":{"money_24h":3500,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"OceanicFuture":{"money_24h":3940,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"VirtualFuture":{"money_24h":4400,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"SpaceAgeMars":{"money_24h":7360,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"SpaceAgeAsteroidBelt":{"money_24h":8160,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"SpaceAgeVenus":{"money_24h":9000,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"SpaceAgeJupiterMoon":{"money_24h":9860,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"SpaceAgeTitan":{"money_24h":10804,"all_goods_of_age_24h":5,"strategy_points_24h":2.0},"SpaceAgeSpaceHub":{"money_24h":11748,"all_goods_of_age_24h":5,"strategy_points_24h":2.0}}, boosts: [{"type":"def_boost_attacker","value":1,"feature":"all"},{"type":"def_boost_attacker","value":1,"feature":"battleground"},{"type":"def_boost_defender","value":1,"feature":"all"},{"type":"def_boost_defender","value":2,"feature":"guild_expedition"}] },
+    "W_MultiAge_PAT23D1": { prod: {"BronzeAge":{"money_24h":30,"strategy_points_24h":1},"IronAge":{"money_24h":80,"strategy_points_24h":1},"EarlyMiddleAge":{"money_24h":130,"strategy_points_24h":1},"HighMiddleAge":{"money_24h":190,"strategy_points_24h":1},"LateMiddleAge":{"money_24h":250,"strategy_points_24h":1},"ColonialAge":{"money_24h":380,"strategy_points_24h":1},"IndustrialAge":{"money_24h":470,"strategy_points_24h":1},"ProgressiveEra":{"money_24h":570,"strategy_points_24h":1},"ModernEra":{"money_24h":710,"strategy_points_24h":1},"PostModernEra":{"money_24h":890,"strategy_points_24h":1},"ContemporaryEra":{"money_24h":1160,"strategy_points_24h":1},"TomorrowEra":{"money_24h":1340,"strategy_points_24h":1},"FutureEra":{"money_24h":1540,"strategy_points_24h":1},"ArcticFuture":{"money_24h":1750,"strategy_points_24h":1},"OceanicFuture":{"money_24h":1970,"strategy_points_24h":1},"VirtualFuture":{"money_24h":2200,"strategy_points_24h":1},"SpaceAgeMars":{"money_24h":3680,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"money_24h":4080,"strategy_points_24h":1},"SpaceAgeVenus":{"money_24h":4500,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"money_24h":4930,"strategy_points_24h":1},"SpaceAgeTitan":{"money_24h":5402,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"money_24h":5874,"strategy_points_24h":1}}, boosts: [{"type":"att_boost_attacker","value":1,"feature":"all"},{"type":"def_boost_attacker","value":1,"feature":"all"}] },
+    "W_MultiAge_PAT23D2": { prod: {"BronzeAge":{"money_24h":60,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"IronAge":{"money_24h":160,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"EarlyMiddleAge":{"money_24h":260,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"HighMiddleAge":{"money_24h":380,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"LateMiddleAge":{"money_24h":500,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"ColonialAge":{"money_24h":760,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"IndustrialAge":{"money_24h":940,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"ProgressiveEra":{"money_24h":1140,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"ModernEra":{"money_24h":1420,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"PostModernEra":{"money_24h":1780,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"ContemporaryEra":{"money_24h":2320,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"TomorrowEra":{"money_24h":2680,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"FutureEra":{"money_24h":3080,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"ArcticFuture":{"money_24h":3500,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"OceanicFuture":{"money_24h":3940,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"VirtualFuture":{"money_24h":4400,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"SpaceAgeMars":{"money_24h":7360,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"SpaceAgeAsteroidBelt":{"money_24h":8160,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"SpaceAgeVenus":{"money_24h":9000,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"SpaceAgeJupiterMoon":{"money_24h":9860,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"SpaceAgeTitan":{"money_24h":10804,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0},"SpaceAgeSpaceHub":{"money_24h":11748,"all_goods_of_previous_age_24h":10,"strategy_points_24h":2.0}}, boosts: [{"type":"att_boost_attacker","value":1,"feature":"all"},{"type":"def_boost_attacker","value":1,"feature":"all"},{"type":"att_boost_defender","value":1,"feature":"all"},{"type":"def_boost_defender","value":1,"feature":"all"}] },
+    "W_MultiAge_PAT23A1": { prod: {"BronzeAge":{"money_24h":30},"IronAge":{"money_24h":80},"EarlyMiddleAge":{"money_24h":130},"HighMiddleAge":{"money_24h":190},"LateMiddleAge":{"money_24h":250},"ColonialAge":{"money_24h":380},"IndustrialAge":{"money_24h":470},"ProgressiveEra":{"money_24h":570},"ModernEra":{"money_24h":710},"PostModernEra":{"money_24h":890},"ContemporaryEra":{"money_24h":1160},"TomorrowEra":{"money_24h":1340},"FutureEra":{"money_24h":1540},"ArcticFuture":{"money_24h":1750},"OceanicFuture":{"money_24h":1970},"VirtualFuture":{"money_24h":2200},"SpaceAgeMars":{"money_24h":3680},"SpaceAgeAsteroidBelt":{"money_24h":4080},"SpaceAgeVenus":{"money_24h":4500},"SpaceAgeJupiterMoon":{"money_24h":4930},"SpaceAgeTitan":{"money_24h":5402},"SpaceAgeSpaceHub":{"money_24h":5874}} },
+    "W_MultiAge_PAT23A2": { prod: {"BronzeAge":{"money_24h":30},"IronAge":{"money_24h":80},"EarlyMiddleAge":{"money_24h":130},"HighMiddleAge":{"money_24h":190},"LateMiddleAge":{"money_24h":250},"ColonialAge":{"money_24h":380},"IndustrialAge":{"money_24h":470},"ProgressiveEra":{"money_24h":570},"ModernEra":{"money_24h":710},"PostModernEra":{"money_24h":890},"ContemporaryEra":{"money_24h":1160},"TomorrowEra":{"money_24h":1340},"FutureEra":{"money_24h":1540},"ArcticFuture":{"money_24h":1750},"OceanicFuture":{"money_24h":1970},"VirtualFuture":{"money_24h":2200},"SpaceAgeMars":{"money_24h":3680},"SpaceAgeAsteroidBelt":{"money_24h":4080},"SpaceAgeVenus":{"money_24h":4500},"SpaceAgeJupiterMoon":{"money_24h":4930},"SpaceAgeTitan":{"money_24h":5402},"SpaceAgeSpaceHub":{"money_24h":5874}} },
+    "W_MultiAge_PAT23A3": { prod: {"BronzeAge":{"money_24h":40,"strategy_points_24h":1},"IronAge":{"money_24h":90,"strategy_points_24h":1},"EarlyMiddleAge":{"money_24h":150,"strategy_points_24h":1},"HighMiddleAge":{"money_24h":210,"strategy_points_24h":1},"LateMiddleAge":{"money_24h":270,"strategy_points_24h":1},"ColonialAge":{"money_24h":410,"strategy_points_24h":1},"IndustrialAge":{"money_24h":510,"strategy_points_24h":1},"ProgressiveEra":{"money_24h":620,"strategy_points_24h":1},"ModernEra":{"money_24h":780,"strategy_points_24h":1},"PostModernEra":{"money_24h":980,"strategy_points_24h":1},"ContemporaryEra":{"money_24h":1270,"strategy_points_24h":1},"TomorrowEra":{"money_24h":1470,"strategy_points_24h":1},"FutureEra":{"money_24h":1690,"strategy_points_24h":1},"ArcticFuture":{"money_24h":1920,"strategy_points_24h":1},"OceanicFuture":{"money_24h":2160,"strategy_points_24h":1},"VirtualFuture":{"money_24h":2420,"strategy_points_24h":1},"SpaceAgeMars":{"money_24h":4050,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"money_24h":4490,"strategy_points_24h":1},"SpaceAgeVenus":{"money_24h":4950,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"money_24h":5430,"strategy_points_24h":1},"SpaceAgeTitan":{"money_24h":5957,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"money_24h":6484,"strategy_points_24h":1}} },
+    "W_MultiAge_PAT23A4": { prod: {"BronzeAge":{"money_24h":40,"strategy_points_24h":1},"IronAge":{"money_24h":90,"strategy_points_24h":1},"EarlyMiddleAge":{"money_24h":150,"strategy_points_24h":1},"HighMiddleAge":{"money_24h":210,"strategy_points_24h":1},"LateMiddleAge":{"money_24h":270,"strategy_points_24h":1},"ColonialAge":{"money_24h":410,"strategy_points_24h":1},"IndustrialAge":{"money_24h":510,"strategy_points_24h":1},"ProgressiveEra":{"money_24h":620,"strategy_points_24h":1},"ModernEra":{"money_24h":780,"strategy_points_24h":1},"PostModernEra":{"money_24h":980,"strategy_points_24h":1},"ContemporaryEra":{"money_24h":1270,"strategy_points_24h":1},"TomorrowEra":{"money_24h":1470,"strategy_points_24h":1},"FutureEra":{"money_24h":1690,"strategy_points_24h":1},"ArcticFuture":{"money_24h":1920,"strategy_points_24h":1},"OceanicFuture":{"money_24h":2160,"strategy_points_24h":1},"VirtualFuture":{"money_24h":2420,"strategy_points_24h":1},"SpaceAgeMars":{"money_24h":4050,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"money_24h":4490,"strategy_points_24h":1},"SpaceAgeVenus":{"money_24h":4950,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"money_24h":5430,"strategy_points_24h":1},"SpaceAgeTitan":{"money_24h":5957,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"money_24h":6484,"strategy_points_24h":1}} },
+    "W_MultiAge_PAT23A5": { prod: {"BronzeAge":{"money_24h":40,"strategy_points_24h":2},"IronAge":{"money_24h":90,"strategy_points_24h":2},"EarlyMiddleAge":{"money_24h":150,"strategy_points_24h":2},"HighMiddleAge":{"money_24h":210,"strategy_points_24h":2},"LateMiddleAge":{"money_24h":280,"strategy_points_24h":2},"ColonialAge":{"money_24h":430,"strategy_points_24h":2},"IndustrialAge":{"money_24h":540,"strategy_points_24h":2},"ProgressiveEra":{"money_24h":650,"strategy_points_24h":2},"ModernEra":{"money_24h":810,"strategy_points_24h":2},"PostModernEra":{"money_24h":1020,"strategy_points_24h":2},"ContemporaryEra":{"money_24h":1330,"strategy_points_24h":2},"TomorrowEra":{"money_24h":1540,"strategy_points_24h":2},"FutureEra":{"money_24h":1770,"strategy_points_24h":2},"ArcticFuture":{"money_24h":2010,"strategy_points_24h":2},"OceanicFuture":{"money_24h":2260,"strategy_points_24h":2},"VirtualFuture":{"money_24h":2530,"strategy_points_24h":2},"SpaceAgeMars":{"money_24h":4230,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"money_24h":4690,"strategy_points_24h":2},"SpaceAgeVenus":{"money_24h":5170,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"money_24h":5670,"strategy_points_24h":2},"SpaceAgeTitan":{"money_24h":6219,"strategy_points_24h":2},"SpaceAgeSpaceHub":{"money_24h":6768,"strategy_points_24h":2}} },
+    "W_MultiAge_PAT23A6": { prod: {"BronzeAge":{"money_24h":40,"strategy_points_24h":2},"IronAge":{"money_24h":90,"strategy_points_24h":2},"EarlyMiddleAge":{"money_24h":150,"strategy_points_24h":2},"HighMiddleAge":{"money_24h":210,"strategy_points_24h":2},"LateMiddleAge":{"money_24h":280,"strategy_points_24h":2},"ColonialAge":{"money_24h":430,"strategy_points_24h":2},"IndustrialAge":{"money_24h":540,"strategy_points_24h":2},"ProgressiveEra":{"money_24h":650,"strategy_points_24h":2},"ModernEra":{"money_24h":810,"strategy_points_24h":2},"PostModernEra":{"money_24h":1020,"strategy_points_24h":2},"ContemporaryEra":{"money_24h":1330,"strategy_points_24h":2},"TomorrowEra":{"money_24h":1540,"strategy_points_24h":2},"FutureEra":{"money_24h":1770,"strategy_points_24h":2},"ArcticFuture":{"money_24h":2010,"strategy_points_24h":2},"OceanicFuture":{"money_24h":2260,"strategy_points_24h":2},"VirtualFuture":{"money_24h":2530,"strategy_points_24h":2},"SpaceAgeMars":{"money_24h":4230,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"money_24h":4690,"strategy_points_24h":2},"SpaceAgeVenus":{"money_24h":5170,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"money_24h":5670,"strategy_points_24h":2},"SpaceAgeTitan":{"money_24h":6219,"strategy_points_24h":2},"SpaceAgeSpaceHub":{"money_24h":6768,"strategy_points_24h":2}} },
+    "W_MultiAge_PAT23A7": { prod: {"BronzeAge":{"money_24h":40,"strategy_points_24h":3},"IronAge":{"money_24h":100,"strategy_points_24h":3},"EarlyMiddleAge":{"money_24h":160,"strategy_points_24h":3},"HighMiddleAge":{"money_24h":220,"strategy_points_24h":3},"LateMiddleAge":{"money_24h":300,"strategy_points_24h":3},"ColonialAge":{"money_24h":450,"strategy_points_24h":3},"IndustrialAge":{"money_24h":560,"strategy_points_24h":3},"ProgressiveEra":{"money_24h":680,"strategy_points_24h":3},"ModernEra":{"money_24h":850,"strategy_points_24h":3},"PostModernEra":{"money_24h":1070,"strategy_points_24h":3},"ContemporaryEra":{"money_24h":1390,"strategy_points_24h":3},"TomorrowEra":{"money_24h":1610,"strategy_points_24h":3},"FutureEra":{"money_24h":1840,"strategy_points_24h":3},"ArcticFuture":{"money_24h":2090,"strategy_points_24h":3},"OceanicFuture":{"money_24h":2360,"strategy_points_24h":3},"VirtualFuture":{"money_24h":2650,"strategy_points_24h":3},"SpaceAgeMars":{"money_24h":4420,"strategy_points_24h":3},"SpaceAgeAsteroidBelt":{"money_24h":4890,"strategy_points_24h":3},"SpaceAgeVenus":{"money_24h":5390,"strategy_points_24h":3},"SpaceAgeJupiterMoon":{"money_24h":5920,"strategy_points_24h":3},"SpaceAgeTitan":{"money_24h":6503,"strategy_points_24h":3},"SpaceAgeSpaceHub":{"money_24h":7086,"strategy_points_24h":3}} },
+    "W_MultiAge_PAT23A8": { prod: {"BronzeAge":{"money_24h":40,"strategy_points_24h":3},"IronAge":{"money_24h":100,"strategy_points_24h":3},"EarlyMiddleAge":{"money_24h":170,"strategy_points_24h":3},"HighMiddleAge":{"money_24h":230,"strategy_points_24h":3},"LateMiddleAge":{"money_24h":310,"strategy_points_24h":3},"ColonialAge":{"money_24h":470,"strategy_points_24h":3},"IndustrialAge":{"money_24h":590,"strategy_points_24h":3},"ProgressiveEra":{"money_24h":710,"strategy_points_24h":3},"ModernEra":{"money_24h":880,"strategy_points_24h":3},"PostModernEra":{"money_24h":1110,"strategy_points_24h":3},"ContemporaryEra":{"money_24h":1450,"strategy_points_24h":3},"TomorrowEra":{"money_24h":1680,"strategy_points_24h":3},"FutureEra":{"money_24h":1920,"strategy_points_24h":3},"ArcticFuture":{"money_24h":2180,"strategy_points_24h":3},"OceanicFuture":{"money_24h":2460,"strategy_points_24h":3},"VirtualFuture":{"money_24h":2760,"strategy_points_24h":3},"SpaceAgeMars":{"money_24h":4600,"strategy_points_24h":3},"SpaceAgeAsteroidBelt":{"money_24h":5100,"strategy_points_24h":3},"SpaceAgeVenus":{"money_24h":5620,"strategy_points_24h":3},"SpaceAgeJupiterMoon":{"money_24h":6170,"strategy_points_24h":3},"SpaceAgeTitan":{"money_24h":6774,"strategy_points_24h":3},"SpaceAgeSpaceHub":{"money_24h":7378,"strategy_points_24h":3}} },
+    "W_MultiAge_PAT23A9": { prod: {"BronzeAge":{"money_24h":50,"strategy_points_24h":7},"IronAge":{"money_24h":120,"strategy_points_24h":7},"EarlyMiddleAge":{"money_24h":200,"strategy_points_24h":7},"HighMiddleAge":{"money_24h":280,"strategy_points_24h":7},"LateMiddleAge":{"money_24h":370,"strategy_points_24h":7},"ColonialAge":{"money_24h":560,"strategy_points_24h":7},"IndustrialAge":{"money_24h":700,"strategy_points_24h":7},"ProgressiveEra":{"money_24h":850,"strategy_points_24h":7},"ModernEra":{"money_24h":1060,"strategy_points_24h":7},"PostModernEra":{"money_24h":1330,"strategy_points_24h":7},"ContemporaryEra":{"money_24h":1740,"strategy_points_24h":7},"TomorrowEra":{"money_24h":2010,"strategy_points_24h":7},"FutureEra":{"money_24h":2300,"strategy_points_24h":7},"ArcticFuture":{"money_24h":2620,"strategy_points_24h":7},"OceanicFuture":{"money_24h":2950,"strategy_points_24h":7},"VirtualFuture":{"money_24h":3310,"strategy_points_24h":7},"SpaceAgeMars":{"money_24h":5520,"strategy_points_24h":7},"SpaceAgeAsteroidBelt":{"money_24h":6120,"strategy_points_24h":7},"SpaceAgeVenus":{"money_24h":6740,"strategy_points_24h":7},"SpaceAgeJupiterMoon":{"money_24h":7400,"strategy_points_24h":7},"SpaceAgeTitan":{"money_24h":8125,"strategy_points_24h":7},"SpaceAgeSpaceHub":{"money_24h":8850,"strategy_points_24h":7}}, boosts: [{"type":"att_boost_attacker","value":9,"feature":"all"},{"type":"def_boost_attacker","value":14,"feature":"all"}] },
+    "W_MultiAge_PAT21A1": { prod: {"BronzeAge":{"population":150,"demandHappiness":150,"money_24h":650.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":2.0,"supplies_24h":50.0},"IronAge":{"population":320,"demandHappiness":320,"money_24h":1600.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":8.0,"supplies_24h":200.0},"EarlyMiddleAge":{"population":490,"demandHappiness":490,"money_24h":2800.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":16.0,"supplies_24h":400.0},"HighMiddleAge":{"population":690,"demandHappiness":690,"money_24h":4100.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":28.0,"supplies_24h":700.0},"LateMiddleAge":{"population":900,"demandHappiness":900,"money_24h":5450.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":42.0,"supplies_24h":1100.0},"ColonialAge":{"population":1140,"demandHappiness":1140,"money_24h":8300.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":60.0,"supplies_24h":1550.0},"IndustrialAge":{"population":1390,"demandHappiness":1390,"money_24h":10400.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":80.0,"supplies_24h":2050.0},"ProgressiveEra":{"population":1660,"demandHappiness":1660,"money_24h":12800.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":104.0,"supplies_24h":2650.0},"ModernEra":{"population":1950,"demandHappiness":1950,"money_24h":15950.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":130.0,"supplies_24h":3300.0},"PostModernEra":{"population":2240,"demandHappiness":2240,"money_24h":19950.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":158.0,"supplies_24h":4050.0},"ContemporaryEra":{"population":2560,"demandHappiness":2560,"money_24h":25550.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":190.0,"supplies_24h":4900.0},"TomorrowEra":{"population":2880,"demandHappiness":2880,"money_24h":29700.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":224.0,"supplies_24h":5750.0},"FutureEra":{"population":3220,"demandHappiness":3220,"money_24h":34250.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":262.0,"supplies_24h":6700.0},"ArcticFuture":{"population":3580,"demandHappiness":3580,"money_24h":38950.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":302.0,"supplies_24h":7750.0},"OceanicFuture":{"population":3940,"demandHappiness":3940,"money_24h":44000.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":344.0,"supplies_24h":8800.0},"VirtualFuture":{"population":4310,"demandHappiness":4310,"money_24h":49400.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":388.0,"supplies_24h":9950.0},"SpaceAgeMars":{"population":6830,"demandHappiness":6830,"money_24h":77200.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":436.0,"supplies_24h":11200.0},"SpaceAgeAsteroidBelt":{"population":7410,"demandHappiness":7410,"money_24h":85550.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":486.0,"supplies_24h":12500.0},"SpaceAgeVenus":{"population":8010,"demandHappiness":8010,"money_24h":94350.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":538.0,"supplies_24h":13850.0},"SpaceAgeJupiterMoon":{"population":8630,"demandHappiness":8630,"money_24h":103600.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":592.0,"supplies_24h":15250.0},"SpaceAgeTitan":{"population":9260,"demandHappiness":9260,"money_24h":113350.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":650.0,"supplies_24h":16750.0},"SpaceAgeSpaceHub":{"population":9900,"demandHappiness":9900,"money_24h":123550.0,"random_good_of_age_24h":3.0,"strategy_points_24h":0.4,"medals_24h":710.0,"supplies_24h":18300.0}} },
+    "W_MultiAge_PAT21A10": { prod: {"BronzeAge":{"population":230,"demandHappiness":230,"money_24h":1500,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":22.5,"supplies_24h":62.5},"IronAge":{"population":490,"demandHappiness":490,"money_24h":3600,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":90.0,"supplies_24h":250.0},"EarlyMiddleAge":{"population":760,"demandHappiness":760,"money_24h":6000,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":157.5,"supplies_24h":500.0},"HighMiddleAge":{"population":1060,"demandHappiness":1060,"money_24h":8400,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":270.0,"supplies_24h":875.0},"LateMiddleAge":{"population":1390,"demandHappiness":1390,"money_24h":11100,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":405.0,"supplies_24h":1375.0},"ColonialAge":{"population":1760,"demandHappiness":1760,"money_24h":16900,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":585.0,"supplies_24h":1937.5},"IndustrialAge":{"population":2150,"demandHappiness":2150,"money_24h":21100,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":765.0,"supplies_24h":2625.0},"ProgressiveEra":{"population":2570,"demandHappiness":2570,"money_24h":25600,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":967.5,"supplies_24h":3375.0},"ModernEra":{"population":3010,"demandHappiness":3010,"money_24h":31800,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":1192.5,"supplies_24h":4250.0},"PostModernEra":{"population":3470,"demandHappiness":3470,"money_24h":40000,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":1462.5,"supplies_24h":5187.5},"ContemporaryEra":{"population":3950,"demandHappiness":3950,"money_24h":52100,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":1732.5,"supplies_24h":6250.0},"TomorrowEra":{"population":4450,"demandHappiness":4450,"money_24h":60300,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":2025.0,"supplies_24h":7375.0},"FutureEra":{"population":4980,"demandHappiness":4980,"money_24h":69100,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":2340.0,"supplies_24h":8625.0},"ArcticFuture":{"population":5530,"demandHappiness":5530,"money_24h":78500,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":2677.5,"supplies_24h":9937.5},"OceanicFuture":{"population":6090,"demandHappiness":6090,"money_24h":88600,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":3037.5,"supplies_24h":11312.5},"VirtualFuture":{"population":6660,"demandHappiness":6660,"money_24h":99200,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":3397.5,"supplies_24h":12812.5},"SpaceAgeMars":{"population":10550,"demandHappiness":10550,"money_24h":165700,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":3802.5,"supplies_24h":14375.0},"SpaceAgeAsteroidBelt":{"population":11460,"demandHappiness":11460,"money_24h":183500,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":4207.5,"supplies_24h":16062.5},"SpaceAgeVenus":{"population":12380,"demandHappiness":12380,"money_24h":202300,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":4635.0,"supplies_24h":17812.5},"SpaceAgeJupiterMoon":{"population":13340,"demandHappiness":13340,"money_24h":222100,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":5085.0,"supplies_24h":19687.5},"SpaceAgeTitan":{"population":14310,"demandHappiness":14310,"money_24h":242800,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":5557.5,"supplies_24h":21625.0},"SpaceAgeSpaceHub":{"population":15300,"demandHappiness":15300,"money_24h":264400,"random_good_of_age_24h":30.0,"strategy_points_24h":10.0,"medals_24h":6052.5,"supplies_24h":23625.0}}, boosts: [{"type":"def_boost_attacker","value":14,"feature":"all"}] },
+    "W_MultiAge_PAT21A2": { prod: {"BronzeAge":{"population":160,"demandHappiness":160,"money_24h":750.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":2.0,"supplies_24h":50.0},"IronAge":{"population":330,"demandHappiness":330,"money_24h":1900.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":8.0,"supplies_24h":200.0},"EarlyMiddleAge":{"population":510,"demandHappiness":510,"money_24h":3200.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":20.0,"supplies_24h":450.0},"HighMiddleAge":{"population":720,"demandHappiness":720,"money_24h":4650.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":34.0,"supplies_24h":750.0},"LateMiddleAge":{"population":940,"demandHappiness":940,"money_24h":6300.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":56.0,"supplies_24h":1150.0},"ColonialAge":{"population":1190,"demandHappiness":1190,"money_24h":9500.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":80.0,"supplies_24h":1650.0},"IndustrialAge":{"population":1450,"demandHappiness":1450,"money_24h":11950.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":110.0,"supplies_24h":2200.0},"ProgressiveEra":{"population":1740,"demandHappiness":1740,"money_24h":14650.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":146.0,"supplies_24h":2900.0},"ModernEra":{"population":2040,"demandHappiness":2040,"money_24h":18250.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":184.0,"supplies_24h":3650.0},"PostModernEra":{"population":2350,"demandHappiness":2350,"money_24h":22950.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":230.0,"supplies_24h":4450.0},"ContemporaryEra":{"population":2670,"demandHappiness":2670,"money_24h":29400.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":280.0,"supplies_24h":5350.0},"TomorrowEra":{"population":3010,"demandHappiness":3010,"money_24h":34150.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":334.0,"supplies_24h":6350.0},"FutureEra":{"population":3370,"demandHappiness":3370,"money_24h":39350.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":394.0,"supplies_24h":7450.0},"ArcticFuture":{"population":3740,"demandHappiness":3740,"money_24h":44850.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":460.0,"supplies_24h":8600.0},"OceanicFuture":{"population":4120,"demandHappiness":4120,"money_24h":50600.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":530.0,"supplies_24h":9850.0},"VirtualFuture":{"population":4510,"demandHappiness":4510,"money_24h":56850.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":604.0,"supplies_24h":11150.0},"SpaceAgeMars":{"population":7140,"demandHappiness":7140,"money_24h":89150.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":686.0,"supplies_24h":12550.0},"SpaceAgeAsteroidBelt":{"population":7750,"demandHappiness":7750,"money_24h":98950.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":770.0,"supplies_24h":14000.0},"SpaceAgeVenus":{"population":8380,"demandHappiness":8380,"money_24h":109100.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":862.0,"supplies_24h":15600.0},"SpaceAgeJupiterMoon":{"population":9020,"demandHappiness":9020,"money_24h":119800.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":958.0,"supplies_24h":17200.0},"SpaceAgeTitan":{"population":9680,"demandHappiness":9680,"money_24h":131100.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":1058.0,"supplies_24h":18950.0},"SpaceAgeSpaceHub":{"population":10350,"demandHappiness":10350,"money_24h":142900.0,"random_good_of_age_24h":5.0,"strategy_points_24h":1.0,"medals_24h":1166.0,"supplies_24h":20750.0}} },
+    "W_MultiAge_PAT21A3": { prod: {"BronzeAge":{"population":160,"demandHappiness":160,"money_24h":875.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":5.0,"supplies_24h":75.0},"IronAge":{"population":350,"demandHappiness":350,"money_24h":2200.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":20.0,"supplies_24h":300.0},"EarlyMiddleAge":{"population":530,"demandHappiness":530,"money_24h":3800.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":45.0,"supplies_24h":600.0},"HighMiddleAge":{"population":750,"demandHappiness":750,"money_24h":5475.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":80.0,"supplies_24h":975.0},"LateMiddleAge":{"population":980,"demandHappiness":980,"money_24h":7400.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":120.0,"supplies_24h":1500.0},"ColonialAge":{"population":1240,"demandHappiness":1240,"money_24h":11100.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":175.0,"supplies_24h":2175.0},"IndustrialAge":{"population":1520,"demandHappiness":1520,"money_24h":13975.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":235.0,"supplies_24h":2850.0},"ProgressiveEra":{"population":1810,"demandHappiness":1810,"money_24h":17200.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":305.0,"supplies_24h":3675.0},"ModernEra":{"population":2120,"demandHappiness":2120,"money_24h":21500.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":390.0,"supplies_24h":4575.0},"PostModernEra":{"population":2450,"demandHappiness":2450,"money_24h":26700.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":475.0,"supplies_24h":5550.0},"ContemporaryEra":{"population":2790,"demandHappiness":2790,"money_24h":34250.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":575.0,"supplies_24h":6675.0},"TomorrowEra":{"population":3140,"demandHappiness":3140,"money_24h":39850.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":685.0,"supplies_24h":7800.0},"FutureEra":{"population":3520,"demandHappiness":3520,"money_24h":45750.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":805.0,"supplies_24h":9075.0},"ArcticFuture":{"population":3900,"demandHappiness":3900,"money_24h":52025.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":930.0,"supplies_24h":10425.0},"OceanicFuture":{"population":4300,"demandHappiness":4300,"money_24h":58750.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":1065.0,"supplies_24h":11850.0},"VirtualFuture":{"population":4700,"demandHappiness":4700,"money_24h":65950.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":1210.0,"supplies_24h":13425.0},"SpaceAgeMars":{"population":7450,"demandHappiness":7450,"money_24h":102950.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":1365.0,"supplies_24h":15000.0},"SpaceAgeAsteroidBelt":{"population":8090,"demandHappiness":8090,"money_24h":114100.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":1530.0,"supplies_24h":16725.0},"SpaceAgeVenus":{"population":8740,"demandHappiness":8740,"money_24h":125825.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":1700.0,"supplies_24h":18450.0},"SpaceAgeJupiterMoon":{"population":9410,"demandHappiness":9410,"money_24h":138125.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":1885.0,"supplies_24h":20325.0},"SpaceAgeTitan":{"population":10100,"demandHappiness":10100,"money_24h":151100.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":2075.0,"supplies_24h":22275.0},"SpaceAgeSpaceHub":{"population":10800,"demandHappiness":10800,"money_24h":164550.0,"random_good_of_age_24h":8.5,"strategy_points_24h":1.25,"medals_24h":2275.0,"supplies_24h":24300.0}} },
+    "W_MultiAge_PAT21A4": { prod: {"BronzeAge":{"population":170,"demandHappiness":170,"money_24h":975.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":5.0,"supplies_24h":75.0},"IronAge":{"population":360,"demandHappiness":360,"money_24h":2500.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":20.0,"supplies_24h":300.0},"EarlyMiddleAge":{"population":560,"demandHappiness":560,"money_24h":4200.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":50.0,"supplies_24h":600.0},"HighMiddleAge":{"population":780,"demandHappiness":780,"money_24h":6050.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":90.0,"supplies_24h":1050.0},"LateMiddleAge":{"population":1030,"demandHappiness":1030,"money_24h":8350.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":145.0,"supplies_24h":1650.0},"ColonialAge":{"population":1290,"demandHappiness":1290,"money_24h":12425.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":215.0,"supplies_24h":2325.0},"IndustrialAge":{"population":1580,"demandHappiness":1580,"money_24h":15675.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":300.0,"supplies_24h":3150.0},"ProgressiveEra":{"population":1890,"demandHappiness":1890,"money_24h":19275.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":395.0,"supplies_24h":4050.0},"ModernEra":{"population":2210,"demandHappiness":2210,"money_24h":24050.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":505.0,"supplies_24h":5100.0},"PostModernEra":{"population":2550,"demandHappiness":2550,"money_24h":30075.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":630.0,"supplies_24h":6225.0},"ContemporaryEra":{"population":2910,"demandHappiness":2910,"money_24h":38650.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":770.0,"supplies_24h":7500.0},"TomorrowEra":{"population":3280,"demandHappiness":3280,"money_24h":44825.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":925.0,"supplies_24h":8850.0},"FutureEra":{"population":3660,"demandHappiness":3660,"money_24h":51550.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":1090.0,"supplies_24h":10350.0},"ArcticFuture":{"population":4060,"demandHappiness":4060,"money_24h":58725.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":1275.0,"supplies_24h":11925.0},"OceanicFuture":{"population":4480,"demandHappiness":4480,"money_24h":66300.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":1475.0,"supplies_24h":13575.0},"VirtualFuture":{"population":4900,"demandHappiness":4900,"money_24h":74425.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":1690.0,"supplies_24h":15375.0},"SpaceAgeMars":{"population":7760,"demandHappiness":7760,"money_24h":116200.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":1920.0,"supplies_24h":17250.0},"SpaceAgeAsteroidBelt":{"population":8430,"demandHappiness":8430,"money_24h":128850.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":2165.0,"supplies_24h":19275.0},"SpaceAgeVenus":{"population":9110,"demandHappiness":9110,"money_24h":142175.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":2425.0,"supplies_24h":21375.0},"SpaceAgeJupiterMoon":{"population":9810,"demandHappiness":9810,"money_24h":156075.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":2700.0,"supplies_24h":23625.0},"SpaceAgeTitan":{"population":10520,"demandHappiness":10520,"money_24h":170825.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":2990.0,"supplies_24h":25950.0},"SpaceAgeSpaceHub":{"population":11250,"demandHappiness":11250,"money_24h":186150.0,"random_good_of_age_24h":10.5,"strategy_points_24h":2.5,"medals_24h":3295.0,"supplies_24h":28350.0}} },
+    "W_MultiAge_PAT21A5": { prod: {"BronzeAge":{"population":180,"demandHappiness":180,"money_24h":1075.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":7.5,"supplies_24h":75.0},"IronAge":{"population":380,"demandHappiness":380,"money_24h":2700.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":30.0,"supplies_24h":300.0},"EarlyMiddleAge":{"population":580,"demandHappiness":580,"money_24h":4600.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":67.5,"supplies_24h":600.0},"HighMiddleAge":{"population":810,"demandHappiness":810,"money_24h":6650.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":120.0,"supplies_24h":1050.0},"LateMiddleAge":{"population":1070,"demandHappiness":1070,"money_24h":8975.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":187.5,"supplies_24h":1575.0},"ColonialAge":{"population":1350,"demandHappiness":1350,"money_24h":13550.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":270.0,"supplies_24h":2250.0},"IndustrialAge":{"population":1640,"demandHappiness":1640,"money_24h":17000.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":367.5,"supplies_24h":3000.0},"ProgressiveEra":{"population":1960,"demandHappiness":1960,"money_24h":20900.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":480.0,"supplies_24h":3900.0},"ModernEra":{"population":2300,"demandHappiness":2300,"money_24h":26075.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":607.5,"supplies_24h":4875.0},"PostModernEra":{"population":2650,"demandHappiness":2650,"money_24h":32625.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":750.0,"supplies_24h":5925.0},"ContemporaryEra":{"population":3020,"demandHappiness":3020,"money_24h":41825.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":907.5,"supplies_24h":7125.0},"TomorrowEra":{"population":3410,"demandHappiness":3410,"money_24h":48600.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":1080.0,"supplies_24h":8400.0},"FutureEra":{"population":3810,"demandHappiness":3810,"money_24h":55925.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":1267.5,"supplies_24h":9825.0},"ArcticFuture":{"population":4230,"demandHappiness":4230,"money_24h":63725.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":1470.0,"supplies_24h":11325.0},"OceanicFuture":{"population":4650,"demandHappiness":4650,"money_24h":71900.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":1687.5,"supplies_24h":12900.0},"VirtualFuture":{"population":5100,"demandHappiness":5100,"money_24h":80650.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":1920.0,"supplies_24h":14550.0},"SpaceAgeMars":{"population":8070,"demandHappiness":8070,"money_24h":126850.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":2167.5,"supplies_24h":16350.0},"SpaceAgeAsteroidBelt":{"population":8760,"demandHappiness":8760,"money_24h":140625.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":2430.0,"supplies_24h":18225.0},"SpaceAgeVenus":{"population":9470,"demandHappiness":9470,"money_24h":155075.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":2707.5,"supplies_24h":20175.0},"SpaceAgeJupiterMoon":{"population":10200,"demandHappiness":10200,"money_24h":170200.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":3000.0,"supplies_24h":22200.0},"SpaceAgeTitan":{"population":10940,"demandHappiness":10940,"money_24h":186175.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":3307.5,"supplies_24h":24375.0},"SpaceAgeSpaceHub":{"population":11700,"demandHappiness":11700,"money_24h":202925.0,"random_good_of_age_24h":14.5,"strategy_points_24h":3.5,"medals_24h":3630.0,"supplies_24h":26625.0}} },
+    "W_MultiAge_PAT21A6": { prod: {"BronzeAge":{"population":180,"demandHappiness":180,"money_24h":1137.5,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":7.5,"supplies_24h":75.0},"IronAge":{"population":390,"demandHappiness":390,"money_24h":2750.0,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":30.0,"supplies_24h":300.0},"EarlyMiddleAge":{"population":600,"demandHappiness":600,"money_24h":4700.0,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":67.5,"supplies_24h":600.0},"HighMiddleAge":{"population":840,"demandHappiness":840,"money_24h":6762.5,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":127.5,"supplies_24h":1125.0},"LateMiddleAge":{"population":1110,"demandHappiness":1110,"money_24h":8962.5,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":195.0,"supplies_24h":1725.0},"ColonialAge":{"population":1400,"demandHappiness":1400,"money_24h":13600.0,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":285.0,"supplies_24h":2400.0},"IndustrialAge":{"population":1710,"demandHappiness":1710,"money_24h":17050.0,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":390.0,"supplies_24h":3300.0},"ProgressiveEra":{"population":2040,"demandHappiness":2040,"money_24h":20800.0,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":510.0,"supplies_24h":4200.0},"ModernEra":{"population":2390,"demandHappiness":2390,"money_24h":25962.5,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":652.5,"supplies_24h":5325.0},"PostModernEra":{"population":2750,"demandHappiness":2750,"money_24h":32562.5,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":802.5,"supplies_24h":6525.0},"ContemporaryEra":{"population":3140,"demandHappiness":3140,"money_24h":42137.5,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":975.0,"supplies_24h":7875.0},"TomorrowEra":{"population":3540,"demandHappiness":3540,"money_24h":48850.0,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":1162.5,"supplies_24h":9300.0},"FutureEra":{"population":3960,"demandHappiness":3960,"money_24h":56137.5,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":1372.5,"supplies_24h":10875.0},"ArcticFuture":{"population":4390,"demandHappiness":4390,"money_24h":63862.5,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":1590.0,"supplies_24h":12525.0},"OceanicFuture":{"population":4830,"demandHappiness":4830,"money_24h":72062.5,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":1830.0,"supplies_24h":14325.0},"VirtualFuture":{"population":5290,"demandHappiness":5290,"money_24h":80837.5,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":2085.0,"supplies_24h":16275.0},"SpaceAgeMars":{"population":8380,"demandHappiness":8380,"money_24h":130650.0,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":2362.5,"supplies_24h":18300.0},"SpaceAgeAsteroidBelt":{"population":9100,"demandHappiness":9100,"money_24h":144800.0,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":2647.5,"supplies_24h":20400.0},"SpaceAgeVenus":{"population":9830,"demandHappiness":9830,"money_24h":159762.5,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":2955.0,"supplies_24h":22725.0},"SpaceAgeJupiterMoon":{"population":10590,"demandHappiness":10590,"money_24h":175325.0,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":3285.0,"supplies_24h":25050.0},"SpaceAgeTitan":{"population":11360,"demandHappiness":11360,"money_24h":191762.5,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":3622.5,"supplies_24h":27525.0},"SpaceAgeSpaceHub":{"population":12150,"demandHappiness":12150,"money_24h":208975.0,"random_good_of_age_24h":17.25,"strategy_points_24h":5.25,"medals_24h":3982.5,"supplies_24h":30150.0}} },
+    "W_MultiAge_PAT21A7": { prod: {"BronzeAge":{"population":190,"demandHappiness":190,"money_24h":1200,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":15.0,"supplies_24h":50.0},"IronAge":{"population":410,"demandHappiness":410,"money_24h":2900,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":45.0,"supplies_24h":200.0},"EarlyMiddleAge":{"population":620,"demandHappiness":620,"money_24h":4800,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":105.0,"supplies_24h":400.0},"HighMiddleAge":{"population":880,"demandHappiness":880,"money_24h":6700,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":180.0,"supplies_24h":700.0},"LateMiddleAge":{"population":1150,"demandHappiness":1150,"money_24h":8900,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":270.0,"supplies_24h":1050.0},"ColonialAge":{"population":1450,"demandHappiness":1450,"money_24h":13500,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":375.0,"supplies_24h":1450.0},"IndustrialAge":{"population":1770,"demandHappiness":1770,"money_24h":16900,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":495.0,"supplies_24h":1950.0},"ProgressiveEra":{"population":2110,"demandHappiness":2110,"money_24h":20500,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":630.0,"supplies_24h":2500.0},"ModernEra":{"population":2480,"demandHappiness":2480,"money_24h":25400,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":780.0,"supplies_24h":3100.0},"PostModernEra":{"population":2860,"demandHappiness":2860,"money_24h":32000,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":945.0,"supplies_24h":3800.0},"ContemporaryEra":{"population":3260,"demandHappiness":3260,"money_24h":41700,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":1125.0,"supplies_24h":4550.0},"TomorrowEra":{"population":3670,"demandHappiness":3670,"money_24h":48200,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":1320.0,"supplies_24h":5350.0},"FutureEra":{"population":4100,"demandHappiness":4100,"money_24h":55300,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":1515.0,"supplies_24h":6200.0},"ArcticFuture":{"population":4550,"demandHappiness":4550,"money_24h":62800,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":1740.0,"supplies_24h":7150.0},"OceanicFuture":{"population":5010,"demandHappiness":5010,"money_24h":70900,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":1965.0,"supplies_24h":8150.0},"VirtualFuture":{"population":5490,"demandHappiness":5490,"money_24h":79400,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":2205.0,"supplies_24h":9200.0},"SpaceAgeMars":{"population":8690,"demandHappiness":8690,"money_24h":132600,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":2460.0,"supplies_24h":10300.0},"SpaceAgeAsteroidBelt":{"population":9440,"demandHappiness":9440,"money_24h":146800,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":2730.0,"supplies_24h":11450.0},"SpaceAgeVenus":{"population":10200,"demandHappiness":10200,"money_24h":161800,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":3000.0,"supplies_24h":12700.0},"SpaceAgeJupiterMoon":{"population":10980,"demandHappiness":10980,"money_24h":177600,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":3300.0,"supplies_24h":13950.0},"SpaceAgeTitan":{"population":11780,"demandHappiness":11780,"money_24h":194200,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":3600.0,"supplies_24h":15300.0},"SpaceAgeSpaceHub":{"population":12600,"demandHappiness":12600,"money_24h":211600,"random_good_of_age_24h":22.0,"strategy_points_24h":6.0,"medals_24h":3915.0,"supplies_24h":16700.0}}, boosts: [{"type":"def_boost_attacker","value":2,"feature":"all"}] },
+    "W_MultiAge_PAT21A8": { prod: {"BronzeAge":{"population":200,"demandHappiness":200,"money_24h":1300,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":15.0,"supplies_24h":50.0},"IronAge":{"population":420,"demandHappiness":420,"money_24h":3100,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":60.0,"supplies_24h":200.0},"EarlyMiddleAge":{"population":650,"demandHappiness":650,"money_24h":5200,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":105.0,"supplies_24h":400.0},"HighMiddleAge":{"population":910,"demandHappiness":910,"money_24h":7300,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":195.0,"supplies_24h":700.0},"LateMiddleAge":{"population":1190,"demandHappiness":1190,"money_24h":9600,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":285.0,"supplies_24h":1100.0},"ColonialAge":{"population":1500,"demandHappiness":1500,"money_24h":14700,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":405.0,"supplies_24h":1550.0},"IndustrialAge":{"population":1830,"demandHappiness":1830,"money_24h":18300,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":525.0,"supplies_24h":2100.0},"ProgressiveEra":{"population":2190,"demandHappiness":2190,"money_24h":22200,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":675.0,"supplies_24h":2700.0},"ModernEra":{"population":2570,"demandHappiness":2570,"money_24h":27600,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":840.0,"supplies_24h":3400.0},"PostModernEra":{"population":2960,"demandHappiness":2960,"money_24h":34700,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":1020.0,"supplies_24h":4150.0},"ContemporaryEra":{"population":3370,"demandHappiness":3370,"money_24h":45100,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":1200.0,"supplies_24h":5000.0},"TomorrowEra":{"population":3800,"demandHappiness":3800,"money_24h":52300,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":1410.0,"supplies_24h":5900.0},"FutureEra":{"population":4250,"demandHappiness":4250,"money_24h":59900,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":1635.0,"supplies_24h":6900.0},"ArcticFuture":{"population":4710,"demandHappiness":4710,"money_24h":68100,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":1875.0,"supplies_24h":7950.0},"OceanicFuture":{"population":5190,"demandHappiness":5190,"money_24h":76800,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":2130.0,"supplies_24h":9050.0},"VirtualFuture":{"population":5680,"demandHappiness":5680,"money_24h":86000,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":2400.0,"supplies_24h":10250.0},"SpaceAgeMars":{"population":9000,"demandHappiness":9000,"money_24h":143600,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":2685.0,"supplies_24h":11500.0},"SpaceAgeAsteroidBelt":{"population":9770,"demandHappiness":9770,"money_24h":159100,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":2970.0,"supplies_24h":12850.0},"SpaceAgeVenus":{"population":10560,"demandHappiness":10560,"money_24h":175300,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":3285.0,"supplies_24h":14250.0},"SpaceAgeJupiterMoon":{"population":11380,"demandHappiness":11380,"money_24h":192400,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":3600.0,"supplies_24h":15750.0},"SpaceAgeTitan":{"population":12200,"demandHappiness":12200,"money_24h":210400,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":3945.0,"supplies_24h":17300.0},"SpaceAgeSpaceHub":{"population":13050,"demandHappiness":13050,"money_24h":229200,"random_good_of_age_24h":24.0,"strategy_points_24h":8.0,"medals_24h":4290.0,"supplies_24h":18900.0}}, boosts: [{"type":"def_boost_attacker","value":6,"feature":"all"}] },
+    "W_MultiAge_PAT21A9": { prod: {"BronzeAge":{"population":210,"demandHappiness":210,"money_24h":1400,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":22.5,"supplies_24h":62.5},"IronAge":{"population":450,"demandHappiness":450,"money_24h":3400,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":67.5,"supplies_24h":250.0},"EarlyMiddleAge":{"population":690,"demandHappiness":690,"money_24h":5600,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":157.5,"supplies_24h":500.0},"HighMiddleAge":{"population":970,"demandHappiness":970,"money_24h":7800,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":247.5,"supplies_24h":875.0},"LateMiddleAge":{"population":1270,"demandHappiness":1270,"money_24h":10400,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":382.5,"supplies_24h":1312.5},"ColonialAge":{"population":1600,"demandHappiness":1600,"money_24h":15800,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":517.5,"supplies_24h":1812.5},"IndustrialAge":{"population":1960,"demandHappiness":1960,"money_24h":19700,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":675.0,"supplies_24h":2437.5},"ProgressiveEra":{"population":2340,"demandHappiness":2340,"money_24h":23900,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":855.0,"supplies_24h":3125.0},"ModernEra":{"population":2740,"demandHappiness":2740,"money_24h":29700,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":1057.5,"supplies_24h":3875.0},"PostModernEra":{"population":3160,"demandHappiness":3160,"money_24h":37300,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":1260.0,"supplies_24h":4750.0},"ContemporaryEra":{"population":3600,"demandHappiness":3600,"money_24h":48600,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":1485.0,"supplies_24h":5687.5},"TomorrowEra":{"population":4060,"demandHappiness":4060,"money_24h":56300,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":1732.5,"supplies_24h":6687.5},"FutureEra":{"population":4540,"demandHappiness":4540,"money_24h":64500,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":2002.5,"supplies_24h":7750.0},"ArcticFuture":{"population":5040,"demandHappiness":5040,"money_24h":73300,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":2272.5,"supplies_24h":8937.5},"OceanicFuture":{"population":5550,"demandHappiness":5550,"money_24h":82700,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":2565.0,"supplies_24h":10187.5},"VirtualFuture":{"population":6080,"demandHappiness":6080,"money_24h":92600,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":2880.0,"supplies_24h":11500.0},"SpaceAgeMars":{"population":9620,"demandHappiness":9620,"money_24h":154600,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":3195.0,"supplies_24h":12875.0},"SpaceAgeAsteroidBelt":{"population":10450,"demandHappiness":10450,"money_24h":171300,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":3532.5,"supplies_24h":14312.5},"SpaceAgeVenus":{"population":11290,"demandHappiness":11290,"money_24h":188800,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":3892.5,"supplies_24h":15875.0},"SpaceAgeJupiterMoon":{"population":12160,"demandHappiness":12160,"money_24h":207200,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":4252.5,"supplies_24h":17437.5},"SpaceAgeTitan":{"population":13040,"demandHappiness":13040,"money_24h":226600,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":4635.0,"supplies_24h":19125.0},"SpaceAgeSpaceHub":{"population":13950,"demandHappiness":13950,"money_24h":246800,"random_good_of_age_24h":28.0,"strategy_points_24h":8.0,"medals_24h":5017.5,"supplies_24h":20875.0}}, boosts: [{"type":"def_boost_attacker","value":10,"feature":"all"}] },
+    "W_MultiAge_PAT21A11": { prod: {"BronzeAge":{"population":480,"demandHappiness":480,"money_24h":1850,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":40.95,"supplies_24h":143.75},"IronAge":{"population":1030,"demandHappiness":1030,"money_24h":4430,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":122.85,"supplies_24h":575.0},"EarlyMiddleAge":{"population":1580,"demandHappiness":1580,"money_24h":7390,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":286.65,"supplies_24h":1150.0},"HighMiddleAge":{"population":2230,"demandHappiness":2230,"money_24h":10340,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":491.4,"supplies_24h":2012.5},"LateMiddleAge":{"population":2920,"demandHappiness":2920,"money_24h":13670,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":737.1,"supplies_24h":3018.75},"ColonialAge":{"population":3690,"demandHappiness":3690,"money_24h":20810,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":1023.75,"supplies_24h":4312.5},"IndustrialAge":{"population":4510,"demandHappiness":4510,"money_24h":25930,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":1351.35,"supplies_24h":5750.0},"ProgressiveEra":{"population":5380,"demandHappiness":5380,"money_24h":31470,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":1719.9,"supplies_24h":7475.0},"ModernEra":{"population":6300,"demandHappiness":6300,"money_24h":39150,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":2129.4,"supplies_24h":9343.75},"PostModernEra":{"population":7270,"demandHappiness":7270,"money_24h":49260,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":2579.85,"supplies_24h":11356.25},"ContemporaryEra":{"population":8280,"demandHappiness":8280,"money_24h":64120,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":3071.25,"supplies_24h":13656.25},"TomorrowEra":{"population":9330,"demandHappiness":9330,"money_24h":74240,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":3603.6,"supplies_24h":16100.0},"FutureEra":{"population":10440,"demandHappiness":10440,"money_24h":85100,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":4135.95,"supplies_24h":18831.25},"ArcticFuture":{"population":11570,"demandHappiness":11570,"money_24h":96700,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":4750.2,"supplies_24h":21706.25},"OceanicFuture":{"population":12750,"demandHappiness":12750,"money_24h":109040,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":5364.45,"supplies_24h":24725.0},"VirtualFuture":{"population":13960,"demandHappiness":13960,"money_24h":122130,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":6019.65,"supplies_24h":27887.5},"SpaceAgeMars":{"population":22100,"demandHappiness":22100,"money_24h":204000,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":6715.8,"supplies_24h":31337.5},"SpaceAgeAsteroidBelt":{"population":24000,"demandHappiness":24000,"money_24h":225960,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":7452.9,"supplies_24h":34931.25},"SpaceAgeVenus":{"population":25950,"demandHappiness":25950,"money_24h":249090,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":8190.0,"supplies_24h":38668.75},"SpaceAgeJupiterMoon":{"population":27940,"demandHappiness":27940,"money_24h":273390,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":9009.0,"supplies_24h":42550.0},"SpaceAgeTitan":{"population":29970,"demandHappiness":29970,"money_24h":298890,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":9828.0,"supplies_24h":46718.75},"SpaceAgeSpaceHub":{"population":32000,"demandHappiness":32000,"money_24h":324400,"random_good_of_age_24h":72.0,"strategy_points_24h":20.0,"medals_24h":10687.95,"supplies_24h":51031.25}}, boosts: [{"type":"def_boost_attacker","value":3,"feature":"all"},{"type":"att_boost_defender","value":10,"feature":"guild_raids"}] },
+    "W_MultiAge_PAT22A11": { prod: {"BronzeAge":{"population":520,"happiness":2150,"demandHappiness":520,"money_24h":2010,"strategy_points_24h":60,"all_goods_of_age_24h":100},"IronAge":{"population":1120,"happiness":3710,"demandHappiness":1120,"money_24h":4820,"strategy_points_24h":60,"all_goods_of_age_24h":100},"EarlyMiddleAge":{"population":1720,"happiness":4100,"demandHappiness":1720,"money_24h":8030,"strategy_points_24h":60,"all_goods_of_age_24h":100},"HighMiddleAge":{"population":2410,"happiness":4570,"demandHappiness":2410,"money_24h":11250,"strategy_points_24h":60,"all_goods_of_age_24h":100},"LateMiddleAge":{"population":3170,"happiness":5100,"demandHappiness":3170,"money_24h":14860,"strategy_points_24h":60,"all_goods_of_age_24h":100},"ColonialAge":{"population":4000,"happiness":6000,"demandHappiness":4000,"money_24h":22630,"strategy_points_24h":60,"all_goods_of_age_24h":100},"IndustrialAge":{"population":4890,"happiness":6760,"demandHappiness":4890,"money_24h":28190,"strategy_points_24h":60,"all_goods_of_age_24h":100},"ProgressiveEra":{"population":5830,"happiness":7430,"demandHappiness":5830,"money_24h":34220,"strategy_points_24h":60,"all_goods_of_age_24h":100},"ModernEra":{"population":6840,"happiness":7950,"demandHappiness":6840,"money_24h":42570,"strategy_points_24h":60,"all_goods_of_age_24h":100},"PostModernEra":{"population":7880,"happiness":8280,"demandHappiness":7880,"money_24h":53560,"strategy_points_24h":60,"all_goods_of_age_24h":100},"ContemporaryEra":{"population":8980,"happiness":9620,"demandHappiness":8980,"money_24h":69720,"strategy_points_24h":60,"all_goods_of_age_24h":100},"TomorrowEra":{"population":10120,"happiness":11680,"demandHappiness":10120,"money_24h":80730,"strategy_points_24h":60,"all_goods_of_age_24h":100},"FutureEra":{"population":11320,"happiness":13990,"demandHappiness":11320,"money_24h":92540,"strategy_points_24h":60,"all_goods_of_age_24h":100},"ArcticFuture":{"population":12550,"happiness":16290,"demandHappiness":12550,"money_24h":105150,"strategy_points_24h":60,"all_goods_of_age_24h":100},"OceanicFuture":{"population":13830,"happiness":18800,"demandHappiness":13830,"money_24h":118560,"strategy_points_24h":60,"all_goods_of_age_24h":100},"VirtualFuture":{"population":15140,"happiness":22460,"demandHappiness":15140,"money_24h":132800,"strategy_points_24h":60,"all_goods_of_age_24h":100},"SpaceAgeMars":{"population":23960,"happiness":35940,"demandHappiness":23960,"money_24h":221820,"strategy_points_24h":60,"all_goods_of_age_24h":100},"SpaceAgeAsteroidBelt":{"population":26030,"happiness":39060,"demandHappiness":26030,"money_24h":245700,"strategy_points_24h":60,"all_goods_of_age_24h":100},"SpaceAgeVenus":{"population":28140,"happiness":42200,"demandHappiness":28140,"money_24h":270840,"strategy_points_24h":60,"all_goods_of_age_24h":100},"SpaceAgeJupiterMoon":{"population":30300,"happiness":45460,"demandHappiness":30300,"money_24h":297270,"strategy_points_24h":60,"all_goods_of_age_24h":100},"SpaceAgeTitan":{"population":32500,"happiness":48750,"demandHappiness":32500,"money_24h":325000,"strategy_points_24h":60,"all_goods_of_age_24h":100},"SpaceAgeSpaceHub":{"population":34700,"happiness":52040,"demandHappiness":34700,"money_24h":352730,"strategy_points_24h":60,"all_goods_of_age_24h":100}}, boosts: [{"type":"att_boost_attacker","value":10,"feature":"guild_raids"},{"type":"att_def_boost_attacker","value":16,"feature":"all"},{"type":"att_def_boost_attacker","value":36,"feature":"battleground"}] },
+    "W_MultiAge_PAT24A8": { prod: {"BronzeAge":{"population":650,"happiness":2560,"demandHappiness":650,"supplies_24h":3640,"strategy_points_24h":33,"random_good_of_age_24h":90},"IronAge":{"population":1400,"happiness":4410,"demandHappiness":1400,"supplies_24h":8720,"strategy_points_24h":33,"random_good_of_age_24h":90},"EarlyMiddleAge":{"population":2150,"happiness":4880,"demandHappiness":2150,"supplies_24h":14540,"strategy_points_24h":33,"random_good_of_age_24h":90},"HighMiddleAge":{"population":3020,"happiness":5440,"demandHappiness":3020,"supplies_24h":20360,"strategy_points_24h":33,"random_good_of_age_24h":90},"LateMiddleAge":{"population":3960,"happiness":6070,"demandHappiness":3960,"supplies_24h":26900,"strategy_points_24h":33,"random_good_of_age_24h":90},"ColonialAge":{"population":5000,"happiness":7140,"demandHappiness":5000,"supplies_24h":34170,"strategy_points_24h":34,"random_good_of_age_24h":90},"IndustrialAge":{"population":6110,"happiness":8050,"demandHappiness":6110,"supplies_24h":41440,"strategy_points_24h":34,"random_good_of_age_24h":90},"ProgressiveEra":{"population":7290,"happiness":8840,"demandHappiness":7290,"supplies_24h":48710,"strategy_points_24h":34,"random_good_of_age_24h":90},"ModernEra":{"population":8550,"happiness":9450,"demandHappiness":8550,"supplies_24h":56710,"strategy_points_24h":34,"random_good_of_age_24h":90},"PostModernEra":{"population":9850,"happiness":9850,"demandHappiness":9850,"supplies_24h":64700,"strategy_points_24h":34,"random_good_of_age_24h":90},"ContemporaryEra":{"population":11220,"happiness":11450,"demandHappiness":11220,"supplies_24h":72700,"strategy_points_24h":35,"random_good_of_age_24h":90},"TomorrowEra":{"population":12650,"happiness":13890,"demandHappiness":12650,"supplies_24h":81420,"strategy_points_24h":35,"random_good_of_age_24h":90},"FutureEra":{"population":14150,"happiness":16650,"demandHappiness":14150,"supplies_24h":89420,"strategy_points_24h":35,"random_good_of_age_24h":90},"ArcticFuture":{"population":15690,"happiness":19380,"demandHappiness":15690,"supplies_24h":98150,"strategy_points_24h":35,"random_good_of_age_24h":90},"OceanicFuture":{"population":17280,"happiness":22370,"demandHappiness":17280,"supplies_24h":107600,"strategy_points_24h":35,"random_good_of_age_24h":90},"VirtualFuture":{"population":18920,"happiness":26720,"demandHappiness":18920,"supplies_24h":116320,"strategy_points_24h":36,"random_good_of_age_24h":90},"SpaceAgeMars":{"population":29960,"happiness":42760,"demandHappiness":29960,"supplies_24h":188290,"strategy_points_24h":36,"random_good_of_age_24h":90},"SpaceAgeAsteroidBelt":{"population":32540,"happiness":46470,"demandHappiness":32540,"supplies_24h":202110,"strategy_points_24h":36,"random_good_of_age_24h":90},"SpaceAgeVenus":{"population":35170,"happiness":50200,"demandHappiness":35170,"supplies_24h":216650,"strategy_points_24h":36,"random_good_of_age_24h":90},"SpaceAgeJupiterMoon":{"population":37870,"happiness":54080,"demandHappiness":37870,"supplies_24h":230460,"strategy_points_24h":36,"random_good_of_age_24h":90},"SpaceAgeTitan":{"population":40625,"happiness":58000,"demandHappiness":40625,"supplies_24h":245000,"strategy_points_24h":37,"random_good_of_age_24h":90},"SpaceAgeSpaceHub":{"population":43380,"happiness":61920,"demandHappiness":43380,"supplies_24h":259540,"strategy_points_24h":37,"random_good_of_age_24h":90}}, boosts: [{"type":"def_boost_attacker","value":55,"feature":"all"},{"type":"def_boost_attacker","value":10,"feature":"battleground"},{"type":"att_boost_defender","value":15,"feature":"all"},{"type":"att_boost_defender","value":45,"feature":"guild_expedition"},{"type":"def_boost_defender","value":25,"feature":"all"},{"type":"def_boost_defender","value":80,"feature":"guild_expedition"},{"type":"coin_production","value":50,"feature":"all"},{"type":"supply_production","value":50,"feature":"all"}] },
+    "W_MultiAge_PAT21A12": { prod: {"BronzeAge":{"population":1250,"demandHappiness":1250,"money_24h":2530,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":81.9,"supplies_24h":287.5},"IronAge":{"population":2680,"demandHappiness":2680,"money_24h":6070,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":245.7,"supplies_24h":1150.0},"EarlyMiddleAge":{"population":4110,"demandHappiness":4110,"money_24h":10120,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":573.3,"supplies_24h":2300.0},"HighMiddleAge":{"population":5770,"demandHappiness":5770,"money_24h":14170,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":982.8,"supplies_24h":4025.0},"LateMiddleAge":{"population":7570,"demandHappiness":7570,"money_24h":18720,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":1474.2,"supplies_24h":6037.5},"ColonialAge":{"population":9560,"demandHappiness":9560,"money_24h":28510,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":2047.5,"supplies_24h":8625.0},"IndustrialAge":{"population":11690,"demandHappiness":11690,"money_24h":35520,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":2702.7,"supplies_24h":11500.0},"ProgressiveEra":{"population":13950,"demandHappiness":13950,"money_24h":43110,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":3439.8,"supplies_24h":14950.0},"ModernEra":{"population":16350,"demandHappiness":16350,"money_24h":53640,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":4258.8,"supplies_24h":18687.5},"PostModernEra":{"population":18840,"demandHappiness":18840,"money_24h":67480,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":5159.7,"supplies_24h":22712.5},"ContemporaryEra":{"population":21480,"demandHappiness":21480,"money_24h":87840,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":6142.5,"supplies_24h":27312.5},"TomorrowEra":{"population":24200,"demandHappiness":24200,"money_24h":101710,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":7207.2,"supplies_24h":32200.0},"FutureEra":{"population":27070,"demandHappiness":27070,"money_24h":116580,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":8271.9,"supplies_24h":37662.5},"ArcticFuture":{"population":30020,"demandHappiness":30020,"money_24h":132470,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":9500.4,"supplies_24h":43412.5},"OceanicFuture":{"population":33070,"demandHappiness":33070,"money_24h":149370,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":10728.9,"supplies_24h":49450.0},"VirtualFuture":{"population":36210,"demandHappiness":36210,"money_24h":167310,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":12039.3,"supplies_24h":55775.0},"SpaceAgeMars":{"population":57320,"demandHappiness":57320,"money_24h":279470,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":13431.6,"supplies_24h":62675.0},"SpaceAgeAsteroidBelt":{"population":62260,"demandHappiness":62260,"money_24h":309550,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":14905.8,"supplies_24h":69862.5},"SpaceAgeVenus":{"population":67300,"demandHappiness":67300,"money_24h":341230,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":16380.0,"supplies_24h":77337.5},"SpaceAgeJupiterMoon":{"population":72470,"demandHappiness":72470,"money_24h":374520,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":18018.0,"supplies_24h":85100.0},"SpaceAgeTitan":{"population":77730,"demandHappiness":77730,"money_24h":409460,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":19656.0,"supplies_24h":93437.5},"SpaceAgeSpaceHub":{"population":83000,"demandHappiness":83000,"money_24h":444400,"random_good_of_age_24h":132.0,"strategy_points_24h":60.0,"medals_24h":21375.9,"supplies_24h":102062.5}}, boosts: [{"type":"def_boost_attacker","value":78,"feature":"all"},{"type":"att_boost_defender","value":30,"feature":"guild_raids"}] },
+    "W_MultiAge_PAT26B2": { prod: {"BronzeAge":{"population":-450,"money_24h":1370,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"IronAge":{"population":-970,"money_24h":3280,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"EarlyMiddleAge":{"population":-1490,"money_24h":5470,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"HighMiddleAge":{"population":-2090,"money_24h":7650,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"LateMiddleAge":{"population":-2740,"money_24h":10110,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"ColonialAge":{"population":-3460,"money_24h":15400,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"IndustrialAge":{"population":-4220,"money_24h":19180,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"ProgressiveEra":{"population":-5040,"money_24h":23280,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"ModernEra":{"population":-5910,"money_24h":28970,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"PostModernEra":{"population":-6810,"money_24h":36440,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"ContemporaryEra":{"population":-7760,"money_24h":47440,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"TomorrowEra":{"population":-8750,"money_24h":54930,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"FutureEra":{"population":-9780,"money_24h":62960,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"ArcticFuture":{"population":-10850,"money_24h":71540,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"OceanicFuture":{"population":-11950,"money_24h":80670,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"VirtualFuture":{"population":-13090,"money_24h":90360,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"SpaceAgeMars":{"population":-20720,"money_24h":150930,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"SpaceAgeAsteroidBelt":{"population":-22500,"money_24h":167170,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"SpaceAgeVenus":{"population":-24320,"money_24h":184280,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"SpaceAgeJupiterMoon":{"population":-26190,"money_24h":202260,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"SpaceAgeTitan":{"population":-28100,"money_24h":221130,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65},"SpaceAgeSpaceHub":{"population":-30000,"money_24h":240000,"random_good_of_age_24h":85,"all_goods_of_next_age_24h":65}}, boosts: [{"type":"att_boost_attacker","value":24,"feature":"guild_raids"},{"type":"att_def_boost_attacker","value":58,"feature":"battleground"},{"type":"att_def_boost_attacker","value":87,"feature":"guild_expedition"},{"type":"guild_raids_coins_production","value":3,"feature":"all"},{"type":"guild_raids_supplies_production","value":4,"feature":"all"},{"type":"guild_raids_units_start","value":5,"feature":"all"}] },
+    "W_MultiAge_PAT26C2": { prod: {"BronzeAge":{"population":-300,"money_24h":570,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"IronAge":{"population":-650,"money_24h":1370,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"EarlyMiddleAge":{"population":-990,"money_24h":2280,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"HighMiddleAge":{"population":-1390,"money_24h":3190,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"LateMiddleAge":{"population":-1830,"money_24h":4210,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"ColonialAge":{"population":-2300,"money_24h":6420,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"IndustrialAge":{"population":-2820,"money_24h":7990,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"ProgressiveEra":{"population":-3360,"money_24h":9700,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"ModernEra":{"population":-3940,"money_24h":12070,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"PostModernEra":{"population":-4540,"money_24h":15180,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"ContemporaryEra":{"population":-5180,"money_24h":19770,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"TomorrowEra":{"population":-5830,"money_24h":22890,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"FutureEra":{"population":-6520,"money_24h":26230,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"ArcticFuture":{"population":-7230,"money_24h":29810,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"OceanicFuture":{"population":-7970,"money_24h":33610,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"VirtualFuture":{"population":-8730,"money_24h":37650,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"SpaceAgeMars":{"population":-13810,"money_24h":62890,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"SpaceAgeAsteroidBelt":{"population":-15000,"money_24h":69660,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"SpaceAgeVenus":{"population":-16220,"money_24h":76780,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"SpaceAgeJupiterMoon":{"population":-17460,"money_24h":84280,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"SpaceAgeTitan":{"population":-18730,"money_24h":92140,"strategy_points_24h":60,"random_good_of_previous_age_24h":60},"SpaceAgeSpaceHub":{"population":-20000,"money_24h":100000,"strategy_points_24h":60,"random_good_of_previous_age_24h":60}}, boosts: [{"type":"att_boost_attacker","value":29,"feature":"all"},{"type":"def_boost_attacker","value":78,"feature":"battleground"},{"type":"att_boost_defender","value":20,"feature":"guild_raids"},{"type":"guild_raids_coins_start","value":10500,"feature":"all"},{"type":"guild_raids_supplies_start","value":20000,"feature":"all"},{"type":"guild_raids_goods_start","value":5,"feature":"all"}] },
+    "W_MultiAge_PAT25C2": { prod: {"AllAge":{"all_goods_of_age_24h":80,"all_goods_of_previous_age_24h":80,"all_goods_of_next_age_24h":80},"BronzeAge":{"population":-290},"IronAge":{"population":-620},"EarlyMiddleAge":{"population":-950},"HighMiddleAge":{"population":-1340},"LateMiddleAge":{"population":-1750},"ColonialAge":{"population":-2210},"IndustrialAge":{"population":-2710},"ProgressiveEra":{"population":-3230},"ModernEra":{"population":-3790},"PostModernEra":{"population":-4360},"ContemporaryEra":{"population":-4970},"TomorrowEra":{"population":-5600},"FutureEra":{"population":-6270},"ArcticFuture":{"population":-6950},"OceanicFuture":{"population":-7660},"VirtualFuture":{"population":-8390},"SpaceAgeMars":{"population":-13270},"SpaceAgeAsteroidBelt":{"population":-14420},"SpaceAgeVenus":{"population":-15580},"SpaceAgeJupiterMoon":{"population":-16780},"SpaceAgeTitan":{"population":-18000},"SpaceAgeSpaceHub":{"population":-19220}}, boosts: [{"type":"guild_raids_coins_production","value":4,"feature":"all"},{"type":"guild_raids_supplies_production","value":4,"feature":"all"},{"type":"guild_raids_goods_start","value":10,"feature":"all"}] },
+    "W_MultiAge_PAT25B2": { prod: {"AllAge":{"strategy_points_24h":42,"units_24h":18},"BronzeAge":{"population":-190},"IronAge":{"population":-410},"EarlyMiddleAge":{"population":-630},"HighMiddleAge":{"population":-890},"LateMiddleAge":{"population":-1170},"ColonialAge":{"population":-1480},"IndustrialAge":{"population":-1800},"ProgressiveEra":{"population":-2150},"ModernEra":{"population":-2520},"PostModernEra":{"population":-2910},"ContemporaryEra":{"population":-3320},"TomorrowEra":{"population":-3740},"FutureEra":{"population":-4180},"ArcticFuture":{"population":-4630},"OceanicFuture":{"population":-5110},"VirtualFuture":{"population":-5590},"SpaceAgeMars":{"population":-8850},"SpaceAgeAsteroidBelt":{"population":-9610},"SpaceAgeVenus":{"population":-10390},"SpaceAgeJupiterMoon":{"population":-11190},"SpaceAgeTitan":{"population":-12000},"SpaceAgeSpaceHub":{"population":-12810}}, boosts: [{"type":"att_boost_defender","value":28,"feature":"all"},{"type":"att_def_boost_defender","value":28,"feature":"battleground"},{"type":"guild_raids_units_start","value":5,"feature":"all"}] },
+    "W_MultiAge_PAT25A13": { prod: {"BronzeAge":{"population":990,"happiness":3110,"demandHappiness":990,"money_24h":3600,"strategy_points_24h":185.0},"IronAge":{"population":2140,"happiness":5350,"demandHappiness":2140,"money_24h":8650,"strategy_points_24h":185.0},"EarlyMiddleAge":{"population":3280,"happiness":5920,"demandHappiness":3280,"money_24h":14410,"strategy_points_24h":185.0},"HighMiddleAge":{"population":4600,"happiness":6610,"demandHappiness":4600,"money_24h":20170,"strategy_points_24h":185.0},"LateMiddleAge":{"population":6040,"happiness":7370,"demandHappiness":6040,"money_24h":26660,"strategy_points_24h":185.0},"ColonialAge":{"population":7620,"happiness":8660,"demandHappiness":7620,"money_24h":40600,"strategy_points_24h":185.0},"IndustrialAge":{"population":9320,"happiness":9770,"demandHappiness":9320,"money_24h":50580,"strategy_points_24h":185.0},"ProgressiveEra":{"population":11120,"happiness":10730,"demandHappiness":11120,"money_24h":61380,"strategy_points_24h":185.0},"ModernEra":{"population":13040,"happiness":11480,"demandHappiness":13040,"money_24h":76370,"strategy_points_24h":185.0},"PostModernEra":{"population":15020,"happiness":11960,"demandHappiness":15020,"money_24h":96070,"strategy_points_24h":185.0},"ContemporaryEra":{"population":17120,"happiness":13890,"demandHappiness":17120,"money_24h":125070,"strategy_points_24h":185.0},"TomorrowEra":{"population":19290,"happiness":16870,"demandHappiness":19290,"money_24h":144810,"strategy_points_24h":185.0},"FutureEra":{"population":21580,"happiness":20210,"demandHappiness":21580,"money_24h":166000,"strategy_points_24h":185.0},"ArcticFuture":{"population":23930,"happiness":23530,"demandHappiness":23930,"money_24h":188620,"strategy_points_24h":185.0},"OceanicFuture":{"population":26360,"happiness":27150,"demandHappiness":26360,"money_24h":212680,"strategy_points_24h":185.0},"VirtualFuture":{"population":28870,"happiness":32440,"demandHappiness":28870,"money_24h":238220,"strategy_points_24h":185.0},"SpaceAgeMars":{"population":45700,"happiness":51910,"demandHappiness":45700,"money_24h":397910,"strategy_points_24h":185.0},"SpaceAgeAsteroidBelt":{"population":49640,"happiness":56410,"demandHappiness":49640,"money_24h":440750,"strategy_points_24h":185.0},"SpaceAgeVenus":{"population":53650,"happiness":60940,"demandHappiness":53650,"money_24h":485850,"strategy_points_24h":185.0},"SpaceAgeJupiterMoon":{"population":57770,"happiness":65650,"demandHappiness":57770,"money_24h":533250,"strategy_points_24h":185.0},"SpaceAgeTitan":{"population":61970,"happiness":70400,"demandHappiness":61970,"money_24h":583000,"strategy_points_24h":185.0},"SpaceAgeSpaceHub":{"population":66170,"happiness":75160,"demandHappiness":66170,"money_24h":632750,"strategy_points_24h":185.0}}, boosts: [{"type":"def_boost_attacker","value":323,"feature":"all"},{"type":"att_def_boost_attacker","value":279,"feature":"battleground"},{"type":"att_def_boost_defender","value":294,"feature":"all"},{"type":"guild_raids_action_points_collection","value":200,"feature":"all"},{"type":"guild_raids_action_points_capacity","value":8000,"feature":"all"}] },
+    "W_MultiAge_PAT24E1": { prod: {"BronzeAge":{"population":-50,"money_24h":370,"strategy_points_24h":5,"all_goods_of_age_24h":15},"IronAge":{"population":-100,"money_24h":890,"strategy_points_24h":5,"all_goods_of_age_24h":15},"EarlyMiddleAge":{"population":-160,"money_24h":1480,"strategy_points_24h":5,"all_goods_of_age_24h":15},"HighMiddleAge":{"population":-220,"money_24h":2080,"strategy_points_24h":5,"all_goods_of_age_24h":15},"LateMiddleAge":{"population":-290,"money_24h":2740,"strategy_points_24h":5,"all_goods_of_age_24h":15},"ColonialAge":{"population":-370,"money_24h":4180,"strategy_points_24h":5,"all_goods_of_age_24h":15},"IndustrialAge":{"population":-450,"money_24h":5210,"strategy_points_24h":5,"all_goods_of_age_24h":15},"ProgressiveEra":{"population":-540,"money_24h":6320,"strategy_points_24h":5,"all_goods_of_age_24h":15},"ModernEra":{"population":-630,"money_24h":7860,"strategy_points_24h":5,"all_goods_of_age_24h":15},"PostModernEra":{"population":-730,"money_24h":9890,"strategy_points_24h":5,"all_goods_of_age_24h":15},"ContemporaryEra":{"population":-830,"money_24h":12870,"strategy_points_24h":5,"all_goods_of_age_24h":15},"TomorrowEra":{"population":-930,"money_24h":14900,"strategy_points_24h":5,"all_goods_of_age_24h":15},"FutureEra":{"population":-1040,"money_24h":17080,"strategy_points_24h":5,"all_goods_of_age_24h":15},"ArcticFuture":{"population":-1160,"money_24h":19410,"strategy_points_24h":6,"all_goods_of_age_24h":15},"OceanicFuture":{"population":-1280,"money_24h":21890,"strategy_points_24h":6,"all_goods_of_age_24h":15},"VirtualFuture":{"population":-1400,"money_24h":24520,"strategy_points_24h":6,"all_goods_of_age_24h":15},"SpaceAgeMars":{"population":-2210,"money_24h":40950,"strategy_points_24h":6,"all_goods_of_age_24h":15},"SpaceAgeAsteroidBelt":{"population":-2400,"money_24h":45360,"strategy_points_24h":6,"all_goods_of_age_24h":15},"SpaceAgeVenus":{"population":-2600,"money_24h":50000,"strategy_points_24h":6,"all_goods_of_age_24h":15},"SpaceAgeJupiterMoon":{"population":-2800,"money_24h":54880,"strategy_points_24h":6,"all_goods_of_age_24h":15},"SpaceAgeTitan":{"population":-3000,"money_24h":60000,"strategy_points_24h":6,"all_goods_of_age_24h":15},"SpaceAgeSpaceHub":{"population":-3200,"money_24h":65120,"strategy_points_24h":6,"all_goods_of_age_24h":15}}, boosts: [{"type":"att_boost_attacker","value":10,"feature":"all"},{"type":"def_boost_defender","value":14,"feature":"all"}] },
+    "W_MultiAge_PAT25A1": { prod: {"BronzeAge":{"population":350,"happiness":1940,"demandHappiness":350,"money_24h":2790,"strategy_points_24h":22.0},"IronAge":{"population":760,"happiness":3350,"demandHappiness":760,"money_24h":6690,"strategy_points_24h":22.0},"EarlyMiddleAge":{"population":1160,"happiness":3700,"demandHappiness":1160,"money_24h":11150,"strategy_points_24h":22.0},"HighMiddleAge":{"population":1630,"happiness":4130,"demandHappiness":1630,"money_24h":15610,"strategy_points_24h":22.0},"LateMiddleAge":{"population":2140,"happiness":4600,"demandHappiness":2140,"money_24h":20620,"strategy_points_24h":22.0},"ColonialAge":{"population":2710,"happiness":5410,"demandHappiness":2710,"money_24h":31410,"strategy_points_24h":22.0},"IndustrialAge":{"population":3310,"happiness":6100,"demandHappiness":3310,"money_24h":39130,"strategy_points_24h":22.0},"ProgressiveEra":{"population":3950,"happiness":6700,"demandHappiness":3950,"money_24h":47490,"strategy_points_24h":22.0},"ModernEra":{"population":4630,"happiness":7170,"demandHappiness":4630,"money_24h":59080,"strategy_points_24h":22.0},"PostModernEra":{"population":5330,"happiness":7470,"demandHappiness":5330,"money_24h":74320,"strategy_points_24h":22.0},"ContemporaryEra":{"population":6080,"happiness":8680,"demandHappiness":6080,"money_24h":96750,"strategy_points_24h":22.0},"TomorrowEra":{"population":6850,"happiness":10540,"demandHappiness":6850,"money_24h":112030,"strategy_points_24h":22.0},"FutureEra":{"population":7660,"happiness":12630,"demandHappiness":7660,"money_24h":128410,"strategy_points_24h":22.0},"ArcticFuture":{"population":8500,"happiness":14710,"demandHappiness":8500,"money_24h":145910,"strategy_points_24h":22.0},"OceanicFuture":{"population":9360,"happiness":16970,"demandHappiness":9360,"money_24h":164530,"strategy_points_24h":22.0},"VirtualFuture":{"population":10250,"happiness":20270,"demandHappiness":10250,"money_24h":184280,"strategy_points_24h":22.0},"SpaceAgeMars":{"population":16220,"happiness":32440,"demandHappiness":16220,"money_24h":307820,"strategy_points_24h":22.0},"SpaceAgeAsteroidBelt":{"population":17620,"happiness":35250,"demandHappiness":17620,"money_24h":340950,"strategy_points_24h":22.0},"SpaceAgeVenus":{"population":19050,"happiness":38090,"demandHappiness":19050,"money_24h":375840,"strategy_points_24h":22.0},"SpaceAgeJupiterMoon":{"population":20510,"happiness":41030,"demandHappiness":20510,"money_24h":412520,"strategy_points_24h":22.0},"SpaceAgeTitan":{"population":22000,"happiness":44000,"demandHappiness":22000,"money_24h":451000,"strategy_points_24h":22.0},"SpaceAgeSpaceHub":{"population":23490,"happiness":46970,"demandHappiness":23490,"money_24h":489480,"strategy_points_24h":22.0}}, boosts: [{"type":"def_boost_attacker","value":49,"feature":"all"},{"type":"att_def_boost_defender","value":6,"feature":"all"}] },
+    "W_MultiAge_PAT25A2": { prod: {"BronzeAge":{"population":370,"happiness":2040,"demandHappiness":370,"money_24h":2850,"strategy_points_24h":33.0},"IronAge":{"population":800,"happiness":3510,"demandHappiness":800,"money_24h":6850,"strategy_points_24h":33.0},"EarlyMiddleAge":{"population":1220,"happiness":3880,"demandHappiness":1220,"money_24h":11420,"strategy_points_24h":33.0},"HighMiddleAge":{"population":1720,"happiness":4330,"demandHappiness":1720,"money_24h":15990,"strategy_points_24h":33.0},"LateMiddleAge":{"population":2250,"happiness":4830,"demandHappiness":2250,"money_24h":21120,"strategy_points_24h":33.0},"ColonialAge":{"population":2840,"happiness":5680,"demandHappiness":2840,"money_24h":32170,"strategy_points_24h":33.0},"IndustrialAge":{"population":3470,"happiness":6410,"demandHappiness":3470,"money_24h":40080,"strategy_points_24h":33.0},"ProgressiveEra":{"population":4150,"happiness":7040,"demandHappiness":4150,"money_24h":48640,"strategy_points_24h":33.0},"ModernEra":{"population":4860,"happiness":7530,"demandHappiness":4860,"money_24h":60520,"strategy_points_24h":33.0},"PostModernEra":{"population":5600,"happiness":7850,"demandHappiness":5600,"money_24h":76130,"strategy_points_24h":33.0},"ContemporaryEra":{"population":6380,"happiness":9120,"demandHappiness":6380,"money_24h":99110,"strategy_points_24h":33.0},"TomorrowEra":{"population":7190,"happiness":11070,"demandHappiness":7190,"money_24h":114760,"strategy_points_24h":33.0},"FutureEra":{"population":8040,"happiness":13260,"demandHappiness":8040,"money_24h":131540,"strategy_points_24h":33.0},"ArcticFuture":{"population":8920,"happiness":15440,"demandHappiness":8920,"money_24h":149470,"strategy_points_24h":33.0},"OceanicFuture":{"population":9830,"happiness":17820,"demandHappiness":9830,"money_24h":168540,"strategy_points_24h":33.0},"VirtualFuture":{"population":10760,"happiness":21290,"demandHappiness":10760,"money_24h":188780,"strategy_points_24h":33.0},"SpaceAgeMars":{"population":17030,"happiness":34060,"demandHappiness":17030,"money_24h":315330,"strategy_points_24h":33.0},"SpaceAgeAsteroidBelt":{"population":18500,"happiness":37020,"demandHappiness":18500,"money_24h":349270,"strategy_points_24h":33.0},"SpaceAgeVenus":{"population":20000,"happiness":39990,"demandHappiness":20000,"money_24h":385010,"strategy_points_24h":33.0},"SpaceAgeJupiterMoon":{"population":21540,"happiness":43080,"demandHappiness":21540,"money_24h":422580,"strategy_points_24h":33.0},"SpaceAgeTitan":{"population":23100,"happiness":46200,"demandHappiness":23100,"money_24h":462000,"strategy_points_24h":33.0},"SpaceAgeSpaceHub":{"population":24660,"happiness":49320,"demandHappiness":24660,"money_24h":501420,"strategy_points_24h":33.0}}, boosts: [{"type":"def_boost_attacker","value":51,"feature":"all"},{"type":"att_def_boost_defender","value":10,"feature":"all"}] },
+    "W_MultiAge_PAT25A3": { prod: {"BronzeAge":{"population":390,"happiness":2140,"demandHappiness":390,"money_24h":2920,"strategy_points_24h":44.0},"IronAge":{"population":830,"happiness":3680,"demandHappiness":830,"money_24h":7010,"strategy_points_24h":44.0},"EarlyMiddleAge":{"population":1280,"happiness":4070,"demandHappiness":1280,"money_24h":11690,"strategy_points_24h":44.0},"HighMiddleAge":{"population":1800,"happiness":4540,"demandHappiness":1800,"money_24h":16370,"strategy_points_24h":44.0},"LateMiddleAge":{"population":2360,"happiness":5060,"demandHappiness":2360,"money_24h":21630,"strategy_points_24h":44.0},"ColonialAge":{"population":2980,"happiness":5950,"demandHappiness":2980,"money_24h":32940,"strategy_points_24h":44.0},"IndustrialAge":{"population":3640,"happiness":6720,"demandHappiness":3640,"money_24h":41030,"strategy_points_24h":44.0},"ProgressiveEra":{"population":4340,"happiness":7370,"demandHappiness":4340,"money_24h":49800,"strategy_points_24h":44.0},"ModernEra":{"population":5090,"happiness":7890,"demandHappiness":5090,"money_24h":61960,"strategy_points_24h":44.0},"PostModernEra":{"population":5870,"happiness":8220,"demandHappiness":5870,"money_24h":77950,"strategy_points_24h":44.0},"ContemporaryEra":{"population":6690,"happiness":9550,"demandHappiness":6690,"money_24h":101470,"strategy_points_24h":44.0},"TomorrowEra":{"population":7530,"happiness":11590,"demandHappiness":7530,"money_24h":117490,"strategy_points_24h":44.0},"FutureEra":{"population":8430,"happiness":13890,"demandHappiness":8430,"money_24h":134680,"strategy_points_24h":44.0},"ArcticFuture":{"population":9350,"happiness":16180,"demandHappiness":9350,"money_24h":153030,"strategy_points_24h":44.0},"OceanicFuture":{"population":10300,"happiness":18670,"demandHappiness":10300,"money_24h":172550,"strategy_points_24h":44.0},"VirtualFuture":{"population":11270,"happiness":22300,"demandHappiness":11270,"money_24h":193270,"strategy_points_24h":44.0},"SpaceAgeMars":{"population":17840,"happiness":35680,"demandHappiness":17840,"money_24h":322830,"strategy_points_24h":44.0},"SpaceAgeAsteroidBelt":{"population":19380,"happiness":38780,"demandHappiness":19380,"money_24h":357580,"strategy_points_24h":44.0},"SpaceAgeVenus":{"population":20950,"happiness":41890,"demandHappiness":20950,"money_24h":394180,"strategy_points_24h":44.0},"SpaceAgeJupiterMoon":{"population":22560,"happiness":45130,"demandHappiness":22560,"money_24h":432640,"strategy_points_24h":44.0},"SpaceAgeTitan":{"population":24200,"happiness":48400,"demandHappiness":24200,"money_24h":473000,"strategy_points_24h":44.0},"SpaceAgeSpaceHub":{"population":25840,"happiness":51670,"demandHappiness":25840,"money_24h":513360,"strategy_points_24h":44.0}}, boosts: [{"type":"def_boost_attacker","value":53,"feature":"all"},{"type":"att_def_boost_defender","value":14,"feature":"all"}] },
+    "W_MultiAge_PAT25A4": { prod: {"BronzeAge":{"population":410,"happiness":2230,"demandHappiness":410,"money_24h":2990,"strategy_points_24h":55.0},"IronAge":{"population":870,"happiness":3850,"demandHappiness":870,"money_24h":7180,"strategy_points_24h":55.0},"EarlyMiddleAge":{"population":1340,"happiness":4250,"demandHappiness":1340,"money_24h":11960,"strategy_points_24h":55.0},"HighMiddleAge":{"population":1880,"happiness":4750,"demandHappiness":1880,"money_24h":16750,"strategy_points_24h":55.0},"LateMiddleAge":{"population":2470,"happiness":5290,"demandHappiness":2470,"money_24h":22130,"strategy_points_24h":55.0},"ColonialAge":{"population":3110,"happiness":6230,"demandHappiness":3110,"money_24h":33700,"strategy_points_24h":55.0},"IndustrialAge":{"population":3800,"happiness":7020,"demandHappiness":3800,"money_24h":41990,"strategy_points_24h":55.0},"ProgressiveEra":{"population":4540,"happiness":7710,"demandHappiness":4540,"money_24h":50960,"strategy_points_24h":55.0},"ModernEra":{"population":5320,"happiness":8250,"demandHappiness":5320,"money_24h":63400,"strategy_points_24h":55.0},"PostModernEra":{"population":6130,"happiness":8590,"demandHappiness":6130,"money_24h":79760,"strategy_points_24h":55.0},"ContemporaryEra":{"population":6990,"happiness":9990,"demandHappiness":6990,"money_24h":103830,"strategy_points_24h":55.0},"TomorrowEra":{"population":7880,"happiness":12120,"demandHappiness":7880,"money_24h":120220,"strategy_points_24h":55.0},"FutureEra":{"population":8810,"happiness":14520,"demandHappiness":8810,"money_24h":137810,"strategy_points_24h":55.0},"ArcticFuture":{"population":9770,"happiness":16910,"demandHappiness":9770,"money_24h":156590,"strategy_points_24h":55.0},"OceanicFuture":{"population":10760,"happiness":19520,"demandHappiness":10760,"money_24h":176570,"strategy_points_24h":55.0},"VirtualFuture":{"population":11790,"happiness":23310,"demandHappiness":11790,"money_24h":197770,"strategy_points_24h":55.0},"SpaceAgeMars":{"population":18660,"happiness":37310,"demandHappiness":18660,"money_24h":330340,"strategy_points_24h":55.0},"SpaceAgeAsteroidBelt":{"population":20260,"happiness":40540,"demandHappiness":20260,"money_24h":365900,"strategy_points_24h":55.0},"SpaceAgeVenus":{"population":21900,"happiness":43800,"demandHappiness":21900,"money_24h":403340,"strategy_points_24h":55.0},"SpaceAgeJupiterMoon":{"population":23590,"happiness":47180,"demandHappiness":23590,"money_24h":442700,"strategy_points_24h":55.0},"SpaceAgeTitan":{"population":25300,"happiness":50600,"demandHappiness":25300,"money_24h":484000,"strategy_points_24h":55.0},"SpaceAgeSpaceHub":{"population":27010,"happiness":54020,"demandHappiness":27010,"money_24h":525300,"strategy_points_24h":55.0}}, boosts: [{"type":"def_boost_attacker","value":55,"feature":"all"},{"type":"att_def_boost_defender","value":18,"feature":"all"}] },
+    "W_MultiAge_PAT25A5": { prod: {"BronzeAge":{"population":420,"happiness":2330,"demandHappiness":420,"money_24h":3060,"strategy_points_24h":66.0},"IronAge":{"population":910,"happiness":4020,"demandHappiness":910,"money_24h":7340,"strategy_points_24h":66.0},"EarlyMiddleAge":{"population":1400,"happiness":4440,"demandHappiness":1400,"money_24h":12230,"strategy_points_24h":66.0},"HighMiddleAge":{"population":1960,"happiness":4950,"demandHappiness":1960,"money_24h":17130,"strategy_points_24h":66.0},"LateMiddleAge":{"population":2570,"happiness":5520,"demandHappiness":2570,"money_24h":22630,"strategy_points_24h":66.0},"ColonialAge":{"population":3250,"happiness":6500,"demandHappiness":3250,"money_24h":34470,"strategy_points_24h":66.0},"IndustrialAge":{"population":3970,"happiness":7330,"demandHappiness":3970,"money_24h":42940,"strategy_points_24h":66.0},"ProgressiveEra":{"population":4740,"happiness":8040,"demandHappiness":4740,"money_24h":52120,"strategy_points_24h":66.0},"ModernEra":{"population":5550,"happiness":8610,"demandHappiness":5550,"money_24h":64840,"strategy_points_24h":66.0},"PostModernEra":{"population":6400,"happiness":8970,"demandHappiness":6400,"money_24h":81570,"strategy_points_24h":66.0},"ContemporaryEra":{"population":7290,"happiness":10420,"demandHappiness":7290,"money_24h":106190,"strategy_points_24h":66.0},"TomorrowEra":{"population":8220,"happiness":12650,"demandHappiness":8220,"money_24h":122950,"strategy_points_24h":66.0},"FutureEra":{"population":9190,"happiness":15150,"demandHappiness":9190,"money_24h":140940,"strategy_points_24h":66.0},"ArcticFuture":{"population":10200,"happiness":17650,"demandHappiness":10200,"money_24h":160150,"strategy_points_24h":66.0},"OceanicFuture":{"population":11230,"happiness":20360,"demandHappiness":11230,"money_24h":180580,"strategy_points_24h":66.0},"VirtualFuture":{"population":12300,"happiness":24330,"demandHappiness":12300,"money_24h":202260,"strategy_points_24h":66.0},"SpaceAgeMars":{"population":19470,"happiness":38930,"demandHappiness":19470,"money_24h":337850,"strategy_points_24h":66.0},"SpaceAgeAsteroidBelt":{"population":21150,"happiness":42300,"demandHappiness":21150,"money_24h":374220,"strategy_points_24h":66.0},"SpaceAgeVenus":{"population":22850,"happiness":45700,"demandHappiness":22850,"money_24h":412510,"strategy_points_24h":66.0},"SpaceAgeJupiterMoon":{"population":24610,"happiness":49230,"demandHappiness":24610,"money_24h":452760,"strategy_points_24h":66.0},"SpaceAgeTitan":{"population":26400,"happiness":52800,"demandHappiness":26400,"money_24h":495000,"strategy_points_24h":66.0},"SpaceAgeSpaceHub":{"population":28190,"happiness":56370,"demandHappiness":28190,"money_24h":537240,"strategy_points_24h":66.0}}, boosts: [{"type":"def_boost_attacker","value":57,"feature":"all"},{"type":"att_def_boost_attacker","value":2,"feature":"battleground"},{"type":"att_def_boost_defender","value":22,"feature":"all"}] },
+    "W_MultiAge_PAT25A6": { prod: {"BronzeAge":{"population":440,"happiness":2430,"demandHappiness":440,"money_24h":3130,"strategy_points_24h":77.0},"IronAge":{"population":950,"happiness":4180,"demandHappiness":950,"money_24h":7500,"strategy_points_24h":77.0},"EarlyMiddleAge":{"population":1450,"happiness":4620,"demandHappiness":1450,"money_24h":12510,"strategy_points_24h":77.0},"HighMiddleAge":{"population":2040,"happiness":5160,"demandHappiness":2040,"money_24h":17510,"strategy_points_24h":77.0},"LateMiddleAge":{"population":2680,"happiness":5750,"demandHappiness":2680,"money_24h":23140,"strategy_points_24h":77.0},"ColonialAge":{"population":3380,"happiness":6770,"demandHappiness":3380,"money_24h":35240,"strategy_points_24h":77.0},"IndustrialAge":{"population":4130,"happiness":7630,"demandHappiness":4130,"money_24h":43900,"strategy_points_24h":77.0},"ProgressiveEra":{"population":4930,"happiness":8380,"demandHappiness":4930,"money_24h":53280,"strategy_points_24h":77.0},"ModernEra":{"population":5780,"happiness":8970,"demandHappiness":5780,"money_24h":66280,"strategy_points_24h":77.0},"PostModernEra":{"population":6670,"happiness":9340,"demandHappiness":6670,"money_24h":83380,"strategy_points_24h":77.0},"ContemporaryEra":{"population":7600,"happiness":10850,"demandHappiness":7600,"money_24h":108550,"strategy_points_24h":77.0},"TomorrowEra":{"population":8560,"happiness":13180,"demandHappiness":8560,"money_24h":125690,"strategy_points_24h":77.0},"FutureEra":{"population":9580,"happiness":15790,"demandHappiness":9580,"money_24h":144070,"strategy_points_24h":77.0},"ArcticFuture":{"population":10620,"happiness":18380,"demandHappiness":10620,"money_24h":163710,"strategy_points_24h":77.0},"OceanicFuture":{"population":11700,"happiness":21210,"demandHappiness":11700,"money_24h":184590,"strategy_points_24h":77.0},"VirtualFuture":{"population":12810,"happiness":25340,"demandHappiness":12810,"money_24h":206760,"strategy_points_24h":77.0},"SpaceAgeMars":{"population":20280,"happiness":40550,"demandHappiness":20280,"money_24h":345360,"strategy_points_24h":77.0},"SpaceAgeAsteroidBelt":{"population":22030,"happiness":44070,"demandHappiness":22030,"money_24h":382530,"strategy_points_24h":77.0},"SpaceAgeVenus":{"population":23810,"happiness":47610,"demandHappiness":23810,"money_24h":421680,"strategy_points_24h":77.0},"SpaceAgeJupiterMoon":{"population":25640,"happiness":51280,"demandHappiness":25640,"money_24h":462820,"strategy_points_24h":77.0},"SpaceAgeTitan":{"population":27500,"happiness":55000,"demandHappiness":27500,"money_24h":506000,"strategy_points_24h":77.0},"SpaceAgeSpaceHub":{"population":29360,"happiness":58720,"demandHappiness":29360,"money_24h":549180,"strategy_points_24h":77.0}}, boosts: [{"type":"def_boost_attacker","value":59,"feature":"all"},{"type":"att_def_boost_attacker","value":4,"feature":"battleground"},{"type":"att_def_boost_defender","value":26,"feature":"all"}] },
+    "W_MultiAge_PAT25A7": { prod: {"BronzeAge":{"population":460,"happiness":2520,"demandHappiness":460,"money_24h":3190,"strategy_points_24h":88.0},"IronAge":{"population":990,"happiness":4350,"demandHappiness":990,"money_24h":7670,"strategy_points_24h":88.0},"EarlyMiddleAge":{"population":1510,"happiness":4810,"demandHappiness":1510,"money_24h":12780,"strategy_points_24h":88.0},"HighMiddleAge":{"population":2120,"happiness":5370,"demandHappiness":2120,"money_24h":17890,"strategy_points_24h":88.0},"LateMiddleAge":{"population":2790,"happiness":5990,"demandHappiness":2790,"money_24h":23640,"strategy_points_24h":88.0},"ColonialAge":{"population":3520,"happiness":7040,"demandHappiness":3520,"money_24h":36000,"strategy_points_24h":88.0},"IndustrialAge":{"population":4300,"happiness":7940,"demandHappiness":4300,"money_24h":44850,"strategy_points_24h":88.0},"ProgressiveEra":{"population":5130,"happiness":8710,"demandHappiness":5130,"money_24h":54430,"strategy_points_24h":88.0},"ModernEra":{"population":6020,"happiness":9320,"demandHappiness":6020,"money_24h":67720,"strategy_points_24h":88.0},"PostModernEra":{"population":6930,"happiness":9710,"demandHappiness":6930,"money_24h":85200,"strategy_points_24h":88.0},"ContemporaryEra":{"population":7900,"happiness":11290,"demandHappiness":7900,"money_24h":110910,"strategy_points_24h":88.0},"TomorrowEra":{"population":8900,"happiness":13700,"demandHappiness":8900,"money_24h":128420,"strategy_points_24h":88.0},"FutureEra":{"population":9960,"happiness":16420,"demandHappiness":9960,"money_24h":147200,"strategy_points_24h":88.0},"ArcticFuture":{"population":11050,"happiness":19120,"demandHappiness":11050,"money_24h":167260,"strategy_points_24h":88.0},"OceanicFuture":{"population":12170,"happiness":22060,"demandHappiness":12170,"money_24h":188600,"strategy_points_24h":88.0},"VirtualFuture":{"population":13320,"happiness":26360,"demandHappiness":13320,"money_24h":211250,"strategy_points_24h":88.0},"SpaceAgeMars":{"population":21090,"happiness":42170,"demandHappiness":21090,"money_24h":352870,"strategy_points_24h":88.0},"SpaceAgeAsteroidBelt":{"population":22910,"happiness":45830,"demandHappiness":22910,"money_24h":390850,"strategy_points_24h":88.0},"SpaceAgeVenus":{"population":24760,"happiness":49510,"demandHappiness":24760,"money_24h":430840,"strategy_points_24h":88.0},"SpaceAgeJupiterMoon":{"population":26660,"happiness":53340,"demandHappiness":26660,"money_24h":472880,"strategy_points_24h":88.0},"SpaceAgeTitan":{"population":28600,"happiness":57200,"demandHappiness":28600,"money_24h":517000,"strategy_points_24h":88.0},"SpaceAgeSpaceHub":{"population":30540,"happiness":61060,"demandHappiness":30540,"money_24h":561120,"strategy_points_24h":88.0}}, boosts: [{"type":"def_boost_attacker","value":61,"feature":"all"},{"type":"att_def_boost_attacker","value":6,"feature":"battleground"},{"type":"att_def_boost_defender","value":30,"feature":"all"}] },
+    "W_MultiAge_PAT25A8": { prod: {"BronzeAge":{"population":480,"happiness":2620,"demandHappiness":480,"money_24h":3260,"strategy_points_24h":99.0},"IronAge":{"population":1020,"happiness":4520,"demandHappiness":1020,"money_24h":7830,"strategy_points_24h":99.0},"EarlyMiddleAge":{"population":1570,"happiness":4990,"demandHappiness":1570,"money_24h":13050,"strategy_points_24h":99.0},"HighMiddleAge":{"population":2210,"happiness":5570,"demandHappiness":2210,"money_24h":18270,"strategy_points_24h":99.0},"LateMiddleAge":{"population":2890,"happiness":6220,"demandHappiness":2890,"money_24h":24140,"strategy_points_24h":99.0},"ColonialAge":{"population":3650,"happiness":7310,"demandHappiness":3650,"money_24h":36770,"strategy_points_24h":99.0},"IndustrialAge":{"population":4460,"happiness":8240,"demandHappiness":4460,"money_24h":45810,"strategy_points_24h":99.0},"ProgressiveEra":{"population":5330,"happiness":9050,"demandHappiness":5330,"money_24h":55590,"strategy_points_24h":99.0},"ModernEra":{"population":6250,"happiness":9680,"demandHappiness":6250,"money_24h":69160,"strategy_points_24h":99.0},"PostModernEra":{"population":7200,"happiness":10090,"demandHappiness":7200,"money_24h":87010,"strategy_points_24h":99.0},"ContemporaryEra":{"population":8210,"happiness":11720,"demandHappiness":8210,"money_24h":113270,"strategy_points_24h":99.0},"TomorrowEra":{"population":9250,"happiness":14230,"demandHappiness":9250,"money_24h":131150,"strategy_points_24h":99.0},"FutureEra":{"population":10340,"happiness":17050,"demandHappiness":10340,"money_24h":150340,"strategy_points_24h":99.0},"ArcticFuture":{"population":11470,"happiness":19850,"demandHappiness":11470,"money_24h":170820,"strategy_points_24h":99.0},"OceanicFuture":{"population":12640,"happiness":22910,"demandHappiness":12640,"money_24h":192620,"strategy_points_24h":99.0},"VirtualFuture":{"population":13840,"happiness":27370,"demandHappiness":13840,"money_24h":215750,"strategy_points_24h":99.0},"SpaceAgeMars":{"population":21900,"happiness":43790,"demandHappiness":21900,"money_24h":360370,"strategy_points_24h":99.0},"SpaceAgeAsteroidBelt":{"population":23790,"happiness":47590,"demandHappiness":23790,"money_24h":399160,"strategy_points_24h":99.0},"SpaceAgeVenus":{"population":25710,"happiness":51420,"demandHappiness":25710,"money_24h":440010,"strategy_points_24h":99.0},"SpaceAgeJupiterMoon":{"population":27690,"happiness":55390,"demandHappiness":27690,"money_24h":482950,"strategy_points_24h":99.0},"SpaceAgeTitan":{"population":29700,"happiness":59400,"demandHappiness":29700,"money_24h":528000,"strategy_points_24h":99.0},"SpaceAgeSpaceHub":{"population":31710,"happiness":63410,"demandHappiness":31710,"money_24h":573050,"strategy_points_24h":99.0}}, boosts: [{"type":"def_boost_attacker","value":63,"feature":"all"},{"type":"att_def_boost_attacker","value":8,"feature":"battleground"},{"type":"att_def_boost_defender","value":34,"feature":"all"}] },
+    "W_MultiAge_PAT25A9": { prod: {"BronzeAge":{"population":490,"happiness":2720,"demandHappiness":490,"money_24h":3330,"strategy_points_24h":110.0},"IronAge":{"population":1060,"happiness":4680,"demandHappiness":1060,"money_24h":7990,"strategy_points_24h":110.0},"EarlyMiddleAge":{"population":1630,"happiness":5180,"demandHappiness":1630,"money_24h":13320,"strategy_points_24h":110.0},"HighMiddleAge":{"population":2290,"happiness":5780,"demandHappiness":2290,"money_24h":18650,"strategy_points_24h":110.0},"LateMiddleAge":{"population":3000,"happiness":6450,"demandHappiness":3000,"money_24h":24650,"strategy_points_24h":110.0},"ColonialAge":{"population":3790,"happiness":7580,"demandHappiness":3790,"money_24h":37530,"strategy_points_24h":110.0},"IndustrialAge":{"population":4630,"happiness":8550,"demandHappiness":4630,"money_24h":46760,"strategy_points_24h":110.0},"ProgressiveEra":{"population":5530,"happiness":9390,"demandHappiness":5530,"money_24h":56750,"strategy_points_24h":110.0},"ModernEra":{"population":6480,"happiness":10040,"demandHappiness":6480,"money_24h":70610,"strategy_points_24h":110.0},"PostModernEra":{"population":7470,"happiness":10460,"demandHappiness":7470,"money_24h":88820,"strategy_points_24h":110.0},"ContemporaryEra":{"population":8510,"happiness":12160,"demandHappiness":8510,"money_24h":115630,"strategy_points_24h":110.0},"TomorrowEra":{"population":9590,"happiness":14760,"demandHappiness":9590,"money_24h":133880,"strategy_points_24h":110.0},"FutureEra":{"population":10720,"happiness":17680,"demandHappiness":10720,"money_24h":153470,"strategy_points_24h":110.0},"ArcticFuture":{"population":11900,"happiness":20590,"demandHappiness":11900,"money_24h":174380,"strategy_points_24h":110.0},"OceanicFuture":{"population":13100,"happiness":23760,"demandHappiness":13100,"money_24h":196630,"strategy_points_24h":110.0},"VirtualFuture":{"population":14350,"happiness":28380,"demandHappiness":14350,"money_24h":220240,"strategy_points_24h":110.0},"SpaceAgeMars":{"population":22710,"happiness":45420,"demandHappiness":22710,"money_24h":367880,"strategy_points_24h":110.0},"SpaceAgeAsteroidBelt":{"population":24670,"happiness":49350,"demandHappiness":24670,"money_24h":407480,"strategy_points_24h":110.0},"SpaceAgeVenus":{"population":26660,"happiness":53320,"demandHappiness":26660,"money_24h":449180,"strategy_points_24h":110.0},"SpaceAgeJupiterMoon":{"population":28710,"happiness":57440,"demandHappiness":28710,"money_24h":493010,"strategy_points_24h":110.0},"SpaceAgeTitan":{"population":30800,"happiness":61600,"demandHappiness":30800,"money_24h":539000,"strategy_points_24h":110.0},"SpaceAgeSpaceHub":{"population":32890,"happiness":65760,"demandHappiness":32890,"money_24h":584990,"strategy_points_24h":110.0}}, boosts: [{"type":"def_boost_attacker","value":65,"feature":"all"},{"type":"att_def_boost_attacker","value":10,"feature":"battleground"},{"type":"att_def_boost_defender","value":38,"feature":"all"}] },
+    "W_MultiAge_PAT22A1": { prod: {"BronzeAge":{"population":223,"happiness":840,"demandHappiness":223,"money_24h":900},"IronAge":{"population":479,"happiness":1460,"demandHappiness":479,"money_24h":2200},"EarlyMiddleAge":{"population":734,"happiness":1610,"demandHappiness":734,"money_24h":3600},"HighMiddleAge":{"population":1031,"happiness":1800,"demandHappiness":1031,"money_24h":5000},"LateMiddleAge":{"population":1353,"happiness":2000,"demandHappiness":1353,"money_24h":6700},"ColonialAge":{"population":1708,"happiness":2360,"demandHappiness":1708,"money_24h":10100},"IndustrialAge":{"population":2087,"happiness":2660,"demandHappiness":2087,"money_24h":12600},"ProgressiveEra":{"population":2492,"happiness":2920,"demandHappiness":2492,"money_24h":15300},"ModernEra":{"population":2921,"happiness":3120,"demandHappiness":2921,"money_24h":19100},"PostModernEra":{"population":3366,"happiness":3250,"demandHappiness":3366,"money_24h":24000},"ContemporaryEra":{"population":3836,"happiness":3780,"demandHappiness":3836,"money_24h":31300},"TomorrowEra":{"population":4323,"happiness":4590,"demandHappiness":4323,"money_24h":36200},"FutureEra":{"population":4835,"happiness":5490,"demandHappiness":4835,"money_24h":41500},"ArcticFuture":{"population":5363,"happiness":6400,"demandHappiness":5363,"money_24h":47100},"OceanicFuture":{"population":5907,"happiness":7380,"demandHappiness":5907,"money_24h":53100},"VirtualFuture":{"population":6468,"happiness":8820,"demandHappiness":6468,"money_24h":59500},"SpaceAgeMars":{"population":10238,"happiness":14110,"demandHappiness":10238,"money_24h":99400},"SpaceAgeAsteroidBelt":{"population":11121,"happiness":15340,"demandHappiness":11121,"money_24h":110100},"SpaceAgeVenus":{"population":12020,"happiness":16570,"demandHappiness":12020,"money_24h":121400},"SpaceAgeJupiterMoon":{"population":12944,"happiness":17850,"demandHappiness":12944,"money_24h":133200},"SpaceAgeTitan":{"population":13885,"happiness":19140,"demandHappiness":13885,"money_24h":145700},"SpaceAgeSpaceHub":{"population":14850,"happiness":20480,"demandHappiness":14850,"money_24h":158700}} },
+    "W_MultiAge_PAT22A10": { prod: {"BronzeAge":{"population":385,"happiness":1160,"demandHappiness":385,"money_24h":1500,"strategy_points_24h":13,"all_goods_of_age_24h":25},"IronAge":{"population":827,"happiness":1990,"demandHappiness":827,"money_24h":3600,"strategy_points_24h":13,"all_goods_of_age_24h":25},"EarlyMiddleAge":{"population":1268,"happiness":2200,"demandHappiness":1268,"money_24h":6000,"strategy_points_24h":13,"all_goods_of_age_24h":25},"HighMiddleAge":{"population":1781,"happiness":2460,"demandHappiness":1781,"money_24h":8400,"strategy_points_24h":13,"all_goods_of_age_24h":25},"LateMiddleAge":{"population":2337,"happiness":2740,"demandHappiness":2337,"money_24h":11100,"strategy_points_24h":13,"all_goods_of_age_24h":25},"ColonialAge":{"population":2950,"happiness":3220,"demandHappiness":2950,"money_24h":16900,"strategy_points_24h":13,"all_goods_of_age_24h":25},"IndustrialAge":{"population":3605,"happiness":3630,"demandHappiness":3605,"money_24h":21100,"strategy_points_24h":13,"all_goods_of_age_24h":25},"ProgressiveEra":{"population":4304,"happiness":3990,"demandHappiness":4304,"money_24h":25600,"strategy_points_24h":13,"all_goods_of_age_24h":25},"ModernEra":{"population":5045,"happiness":4270,"demandHappiness":5045,"money_24h":31800,"strategy_points_24h":13,"all_goods_of_age_24h":25},"PostModernEra":{"population":5814,"happiness":4450,"demandHappiness":5814,"money_24h":40000,"strategy_points_24h":13,"all_goods_of_age_24h":25},"ContemporaryEra":{"population":6626,"happiness":5170,"demandHappiness":6626,"money_24h":52100,"strategy_points_24h":13,"all_goods_of_age_24h":25},"TomorrowEra":{"population":7467,"happiness":6270,"demandHappiness":7467,"money_24h":60300,"strategy_points_24h":13,"all_goods_of_age_24h":25},"FutureEra":{"population":8351,"happiness":7520,"demandHappiness":8351,"money_24h":69100,"strategy_points_24h":13,"all_goods_of_age_24h":25},"ArcticFuture":{"population":9263,"happiness":8750,"demandHappiness":9263,"money_24h":78500,"strategy_points_24h":13,"all_goods_of_age_24h":25},"OceanicFuture":{"population":10203,"happiness":10100,"demandHappiness":10203,"money_24h":88600,"strategy_points_24h":13,"all_goods_of_age_24h":25},"VirtualFuture":{"population":11172,"happiness":12070,"demandHappiness":11172,"money_24h":99200,"strategy_points_24h":13,"all_goods_of_age_24h":25},"SpaceAgeMars":{"population":17684,"happiness":19310,"demandHappiness":17684,"money_24h":165700,"strategy_points_24h":13,"all_goods_of_age_24h":25},"SpaceAgeAsteroidBelt":{"population":19209,"happiness":20980,"demandHappiness":19209,"money_24h":183500,"strategy_points_24h":13,"all_goods_of_age_24h":25},"SpaceAgeVenus":{"population":20762,"happiness":22670,"demandHappiness":20762,"money_24h":202300,"strategy_points_24h":13,"all_goods_of_age_24h":25},"SpaceAgeJupiterMoon":{"population":22358,"happiness":24420,"demandHappiness":22358,"money_24h":222100,"strategy_points_24h":13,"all_goods_of_age_24h":25},"SpaceAgeTitan":{"population":23983,"happiness":26190,"demandHappiness":23983,"money_24h":242800,"strategy_points_24h":13,"all_goods_of_age_24h":25},"SpaceAgeSpaceHub":{"population":25650,"happiness":28010,"demandHappiness":25650,"money_24h":264400,"strategy_points_24h":13,"all_goods_of_age_24h":25}}, boosts: [{"type":"att_boost_attacker","value":15,"feature":"all"}] },
+    "W_MultiAge_PAT22A2": { prod: {"BronzeAge":{"population":225,"happiness":880,"demandHappiness":225,"money_24h":900},"IronAge":{"population":483,"happiness":1510,"demandHappiness":483,"money_24h":2200},"EarlyMiddleAge":{"population":741,"happiness":1670,"demandHappiness":741,"money_24h":3600},"HighMiddleAge":{"population":1041,"happiness":1870,"demandHappiness":1041,"money_24h":5100},"LateMiddleAge":{"population":1365,"happiness":2080,"demandHappiness":1365,"money_24h":6700},"ColonialAge":{"population":1723,"happiness":2450,"demandHappiness":1723,"money_24h":10200},"IndustrialAge":{"population":2106,"happiness":2760,"demandHappiness":2106,"money_24h":12700},"ProgressiveEra":{"population":2514,"happiness":3030,"demandHappiness":2514,"money_24h":15500},"ModernEra":{"population":2947,"happiness":3250,"demandHappiness":2947,"money_24h":19200},"PostModernEra":{"population":3397,"happiness":3380,"demandHappiness":3397,"money_24h":24200},"ContemporaryEra":{"population":3871,"happiness":3930,"demandHappiness":3871,"money_24h":31500},"TomorrowEra":{"population":4362,"happiness":4770,"demandHappiness":4362,"money_24h":36500},"FutureEra":{"population":4878,"happiness":5710,"demandHappiness":4878,"money_24h":41800},"ArcticFuture":{"population":5411,"happiness":6650,"demandHappiness":5411,"money_24h":47500},"OceanicFuture":{"population":5961,"happiness":7680,"demandHappiness":5961,"money_24h":53600},"VirtualFuture":{"population":6527,"happiness":9170,"demandHappiness":6527,"money_24h":60000},"SpaceAgeMars":{"population":10331,"happiness":14680,"demandHappiness":10331,"money_24h":100200},"SpaceAgeAsteroidBelt":{"population":11222,"happiness":15950,"demandHappiness":11222,"money_24h":111000},"SpaceAgeVenus":{"population":12130,"happiness":17230,"demandHappiness":12130,"money_24h":122400},"SpaceAgeJupiterMoon":{"population":13062,"happiness":18560,"demandHappiness":13062,"money_24h":134300},"SpaceAgeTitan":{"population":14011,"happiness":19910,"demandHappiness":14011,"money_24h":146900},"SpaceAgeSpaceHub":{"population":14985,"happiness":21300,"demandHappiness":14985,"money_24h":160000}} },
+    "W_MultiAge_PAT22A3": { prod: {"BronzeAge":{"population":243,"happiness":910,"demandHappiness":243,"money_24h":1000,"all_goods_of_age_24h":5},"IronAge":{"population":522,"happiness":1570,"demandHappiness":522,"money_24h":2300,"all_goods_of_age_24h":5},"EarlyMiddleAge":{"population":801,"happiness":1740,"demandHappiness":801,"money_24h":3900,"all_goods_of_age_24h":5},"HighMiddleAge":{"population":1125,"happiness":1940,"demandHappiness":1125,"money_24h":5500,"all_goods_of_age_24h":5},"LateMiddleAge":{"population":1476,"happiness":2160,"demandHappiness":1476,"money_24h":7200,"all_goods_of_age_24h":5},"ColonialAge":{"population":1863,"happiness":2540,"demandHappiness":1863,"money_24h":11000,"all_goods_of_age_24h":5},"IndustrialAge":{"population":2277,"happiness":2870,"demandHappiness":2277,"money_24h":13700,"all_goods_of_age_24h":5},"ProgressiveEra":{"population":2718,"happiness":3150,"demandHappiness":2718,"money_24h":16600,"all_goods_of_age_24h":5},"ModernEra":{"population":3186,"happiness":3370,"demandHappiness":3186,"money_24h":20700,"all_goods_of_age_24h":5},"PostModernEra":{"population":3672,"happiness":3510,"demandHappiness":3672,"money_24h":26000,"all_goods_of_age_24h":5},"ContemporaryEra":{"population":4185,"happiness":4080,"demandHappiness":4185,"money_24h":33900,"all_goods_of_age_24h":5},"TomorrowEra":{"population":4716,"happiness":4950,"demandHappiness":4716,"money_24h":39200,"all_goods_of_age_24h":5},"FutureEra":{"population":5274,"happiness":5930,"demandHappiness":5274,"money_24h":44900,"all_goods_of_age_24h":5},"ArcticFuture":{"population":5850,"happiness":6910,"demandHappiness":5850,"money_24h":51100,"all_goods_of_age_24h":5},"OceanicFuture":{"population":6444,"happiness":7970,"demandHappiness":6444,"money_24h":57600,"all_goods_of_age_24h":5},"VirtualFuture":{"population":7056,"happiness":9530,"demandHappiness":7056,"money_24h":64500,"all_goods_of_age_24h":5},"SpaceAgeMars":{"population":11169,"happiness":15240,"demandHappiness":11169,"money_24h":107700,"all_goods_of_age_24h":5},"SpaceAgeAsteroidBelt":{"population":12132,"happiness":16560,"demandHappiness":12132,"money_24h":119300,"all_goods_of_age_24h":5},"SpaceAgeVenus":{"population":13113,"happiness":17900,"demandHappiness":13113,"money_24h":131500,"all_goods_of_age_24h":5},"SpaceAgeJupiterMoon":{"population":14121,"happiness":19280,"demandHappiness":14121,"money_24h":144300,"all_goods_of_age_24h":5},"SpaceAgeTitan":{"population":15147,"happiness":20670,"demandHappiness":15147,"money_24h":157800,"all_goods_of_age_24h":5},"SpaceAgeSpaceHub":{"population":16200,"happiness":22120,"demandHappiness":16200,"money_24h":171900,"all_goods_of_age_24h":5}} },
+    "W_MultiAge_PAT22A4": { prod: {"BronzeAge":{"population":263,"happiness":950,"demandHappiness":263,"money_24h":1100,"strategy_points_24h":1,"all_goods_of_age_24h":10},"IronAge":{"population":566,"happiness":1630,"demandHappiness":566,"money_24h":2500,"strategy_points_24h":1,"all_goods_of_age_24h":10},"EarlyMiddleAge":{"population":868,"happiness":1800,"demandHappiness":868,"money_24h":4200,"strategy_points_24h":1,"all_goods_of_age_24h":10},"HighMiddleAge":{"population":1219,"happiness":2010,"demandHappiness":1219,"money_24h":5900,"strategy_points_24h":1,"all_goods_of_age_24h":10},"LateMiddleAge":{"population":1599,"happiness":2240,"demandHappiness":1599,"money_24h":7800,"strategy_points_24h":1,"all_goods_of_age_24h":10},"ColonialAge":{"population":2018,"happiness":2640,"demandHappiness":2018,"money_24h":11800,"strategy_points_24h":1,"all_goods_of_age_24h":10},"IndustrialAge":{"population":2467,"happiness":2970,"demandHappiness":2467,"money_24h":14700,"strategy_points_24h":1,"all_goods_of_age_24h":10},"ProgressiveEra":{"population":2945,"happiness":3270,"demandHappiness":2945,"money_24h":17900,"strategy_points_24h":1,"all_goods_of_age_24h":10},"ModernEra":{"population":3452,"happiness":3490,"demandHappiness":3452,"money_24h":22300,"strategy_points_24h":1,"all_goods_of_age_24h":10},"PostModernEra":{"population":3978,"happiness":3640,"demandHappiness":3978,"money_24h":28000,"strategy_points_24h":1,"all_goods_of_age_24h":10},"ContemporaryEra":{"population":4534,"happiness":4230,"demandHappiness":4534,"money_24h":36500,"strategy_points_24h":1,"all_goods_of_age_24h":10},"TomorrowEra":{"population":5109,"happiness":5140,"demandHappiness":5109,"money_24h":42200,"strategy_points_24h":1,"all_goods_of_age_24h":10},"FutureEra":{"population":5714,"happiness":6150,"demandHappiness":5714,"money_24h":48400,"strategy_points_24h":1,"all_goods_of_age_24h":10},"ArcticFuture":{"population":6338,"happiness":7170,"demandHappiness":6338,"money_24h":55000,"strategy_points_24h":1,"all_goods_of_age_24h":10},"OceanicFuture":{"population":6981,"happiness":8270,"demandHappiness":6981,"money_24h":62000,"strategy_points_24h":1,"all_goods_of_age_24h":10},"VirtualFuture":{"population":7644,"happiness":9880,"demandHappiness":7644,"money_24h":69400,"strategy_points_24h":1,"all_goods_of_age_24h":10},"SpaceAgeMars":{"population":12100,"happiness":15810,"demandHappiness":12100,"money_24h":116000,"strategy_points_24h":1,"all_goods_of_age_24h":10},"SpaceAgeAsteroidBelt":{"population":13143,"happiness":17180,"demandHappiness":13143,"money_24h":128500,"strategy_points_24h":1,"all_goods_of_age_24h":10},"SpaceAgeVenus":{"population":14206,"happiness":18560,"demandHappiness":14206,"money_24h":141600,"strategy_points_24h":1,"all_goods_of_age_24h":10},"SpaceAgeJupiterMoon":{"population":15298,"happiness":19990,"demandHappiness":15298,"money_24h":155400,"strategy_points_24h":1,"all_goods_of_age_24h":10},"SpaceAgeTitan":{"population":16409,"happiness":21440,"demandHappiness":16409,"money_24h":169900,"strategy_points_24h":1,"all_goods_of_age_24h":10},"SpaceAgeSpaceHub":{"population":17550,"happiness":22940,"demandHappiness":17550,"money_24h":185100,"strategy_points_24h":1,"all_goods_of_age_24h":10}} },
+    "W_MultiAge_PAT22A5": { prod: {"BronzeAge":{"population":284,"happiness":980,"demandHappiness":284,"money_24h":1100,"strategy_points_24h":2,"all_goods_of_age_24h":10},"IronAge":{"population":609,"happiness":1690,"demandHappiness":609,"money_24h":2700,"strategy_points_24h":2,"all_goods_of_age_24h":10},"EarlyMiddleAge":{"population":935,"happiness":1870,"demandHappiness":935,"money_24h":4500,"strategy_points_24h":2,"all_goods_of_age_24h":10},"HighMiddleAge":{"population":1313,"happiness":2080,"demandHappiness":1313,"money_24h":6300,"strategy_points_24h":2,"all_goods_of_age_24h":10},"LateMiddleAge":{"population":1722,"happiness":2320,"demandHappiness":1722,"money_24h":8300,"strategy_points_24h":2,"all_goods_of_age_24h":10},"ColonialAge":{"population":2174,"happiness":2730,"demandHappiness":2174,"money_24h":12700,"strategy_points_24h":2,"all_goods_of_age_24h":10},"IndustrialAge":{"population":2657,"happiness":3080,"demandHappiness":2657,"money_24h":15800,"strategy_points_24h":2,"all_goods_of_age_24h":10},"ProgressiveEra":{"population":3171,"happiness":3380,"demandHappiness":3171,"money_24h":19200,"strategy_points_24h":2,"all_goods_of_age_24h":10},"ModernEra":{"population":3717,"happiness":3620,"demandHappiness":3717,"money_24h":23900,"strategy_points_24h":2,"all_goods_of_age_24h":10},"PostModernEra":{"population":4284,"happiness":3770,"demandHappiness":4284,"money_24h":30000,"strategy_points_24h":2,"all_goods_of_age_24h":10},"ContemporaryEra":{"population":4883,"happiness":4380,"demandHappiness":4883,"money_24h":39100,"strategy_points_24h":2,"all_goods_of_age_24h":10},"TomorrowEra":{"population":5502,"happiness":5320,"demandHappiness":5502,"money_24h":45200,"strategy_points_24h":2,"all_goods_of_age_24h":10},"FutureEra":{"population":6153,"happiness":6370,"demandHappiness":6153,"money_24h":51800,"strategy_points_24h":2,"all_goods_of_age_24h":10},"ArcticFuture":{"population":6825,"happiness":7420,"demandHappiness":6825,"money_24h":58900,"strategy_points_24h":2,"all_goods_of_age_24h":10},"OceanicFuture":{"population":7518,"happiness":8560,"demandHappiness":7518,"money_24h":66400,"strategy_points_24h":2,"all_goods_of_age_24h":10},"VirtualFuture":{"population":8232,"happiness":10230,"demandHappiness":8232,"money_24h":74400,"strategy_points_24h":2,"all_goods_of_age_24h":10},"SpaceAgeMars":{"population":13031,"happiness":16370,"demandHappiness":13031,"money_24h":124300,"strategy_points_24h":2,"all_goods_of_age_24h":10},"SpaceAgeAsteroidBelt":{"population":14154,"happiness":17790,"demandHappiness":14154,"money_24h":137600,"strategy_points_24h":2,"all_goods_of_age_24h":10},"SpaceAgeVenus":{"population":15299,"happiness":19220,"demandHappiness":15299,"money_24h":151700,"strategy_points_24h":2,"all_goods_of_age_24h":10},"SpaceAgeJupiterMoon":{"population":16475,"happiness":20710,"demandHappiness":16475,"money_24h":166500,"strategy_points_24h":2,"all_goods_of_age_24h":10},"SpaceAgeTitan":{"population":17672,"happiness":22210,"demandHappiness":17672,"money_24h":182100,"strategy_points_24h":2,"all_goods_of_age_24h":10},"SpaceAgeSpaceHub":{"population":18900,"happiness":23750,"demandHappiness":18900,"money_24h":198300,"strategy_points_24h":2,"all_goods_of_age_24h":10}} },
+    "W_MultiAge_PAT22A6": { prod: {"BronzeAge":{"population":304,"happiness":1010,"demandHappiness":304,"money_24h":1200,"strategy_points_24h":4,"all_goods_of_age_24h":15},"IronAge":{"population":653,"happiness":1750,"demandHappiness":653,"money_24h":2900,"strategy_points_24h":4,"all_goods_of_age_24h":15},"EarlyMiddleAge":{"population":1001,"happiness":1930,"demandHappiness":1001,"money_24h":4800,"strategy_points_24h":4,"all_goods_of_age_24h":15},"HighMiddleAge":{"population":1406,"happiness":2160,"demandHappiness":1406,"money_24h":6700,"strategy_points_24h":4,"all_goods_of_age_24h":15},"LateMiddleAge":{"population":1845,"happiness":2400,"demandHappiness":1845,"money_24h":8900,"strategy_points_24h":4,"all_goods_of_age_24h":15},"ColonialAge":{"population":2329,"happiness":2830,"demandHappiness":2329,"money_24h":13500,"strategy_points_24h":4,"all_goods_of_age_24h":15},"IndustrialAge":{"population":2846,"happiness":3190,"demandHappiness":2846,"money_24h":16900,"strategy_points_24h":4,"all_goods_of_age_24h":15},"ProgressiveEra":{"population":3398,"happiness":3500,"demandHappiness":3398,"money_24h":20500,"strategy_points_24h":4,"all_goods_of_age_24h":15},"ModernEra":{"population":3983,"happiness":3740,"demandHappiness":3983,"money_24h":25400,"strategy_points_24h":4,"all_goods_of_age_24h":15},"PostModernEra":{"population":4590,"happiness":3900,"demandHappiness":4590,"money_24h":32000,"strategy_points_24h":4,"all_goods_of_age_24h":15},"ContemporaryEra":{"population":5231,"happiness":4530,"demandHappiness":5231,"money_24h":41700,"strategy_points_24h":4,"all_goods_of_age_24h":15},"TomorrowEra":{"population":5895,"happiness":5500,"demandHappiness":5895,"money_24h":48200,"strategy_points_24h":4,"all_goods_of_age_24h":15},"FutureEra":{"population":6593,"happiness":6590,"demandHappiness":6593,"money_24h":55300,"strategy_points_24h":4,"all_goods_of_age_24h":15},"ArcticFuture":{"population":7313,"happiness":7680,"demandHappiness":7313,"money_24h":62800,"strategy_points_24h":4,"all_goods_of_age_24h":15},"OceanicFuture":{"population":8055,"happiness":8860,"demandHappiness":8055,"money_24h":70900,"strategy_points_24h":4,"all_goods_of_age_24h":15},"VirtualFuture":{"population":8820,"happiness":10580,"demandHappiness":8820,"money_24h":79400,"strategy_points_24h":4,"all_goods_of_age_24h":15},"SpaceAgeMars":{"population":13961,"happiness":16940,"demandHappiness":13961,"money_24h":132600,"strategy_points_24h":4,"all_goods_of_age_24h":15},"SpaceAgeAsteroidBelt":{"population":15165,"happiness":18410,"demandHappiness":15165,"money_24h":146800,"strategy_points_24h":4,"all_goods_of_age_24h":15},"SpaceAgeVenus":{"population":16391,"happiness":19880,"demandHappiness":16391,"money_24h":161800,"strategy_points_24h":4,"all_goods_of_age_24h":15},"SpaceAgeJupiterMoon":{"population":17651,"happiness":21420,"demandHappiness":17651,"money_24h":177600,"strategy_points_24h":4,"all_goods_of_age_24h":15},"SpaceAgeTitan":{"population":18934,"happiness":22970,"demandHappiness":18934,"money_24h":194200,"strategy_points_24h":4,"all_goods_of_age_24h":15},"SpaceAgeSpaceHub":{"population":20250,"happiness":24570,"demandHappiness":20250,"money_24h":211600,"strategy_points_24h":4,"all_goods_of_age_24h":15}} },
+    "W_MultiAge_PAT22A7": { prod: {"BronzeAge":{"population":324,"happiness":1050,"demandHappiness":324,"money_24h":1300,"strategy_points_24h":6,"all_goods_of_age_24h":15},"IronAge":{"population":696,"happiness":1810,"demandHappiness":696,"money_24h":3100,"strategy_points_24h":6,"all_goods_of_age_24h":15},"EarlyMiddleAge":{"population":1068,"happiness":2000,"demandHappiness":1068,"money_24h":5100,"strategy_points_24h":6,"all_goods_of_age_24h":15},"HighMiddleAge":{"population":1500,"happiness":2230,"demandHappiness":1500,"money_24h":7100,"strategy_points_24h":6,"all_goods_of_age_24h":15},"LateMiddleAge":{"population":1968,"happiness":2480,"demandHappiness":1968,"money_24h":9400,"strategy_points_24h":6,"all_goods_of_age_24h":15},"ColonialAge":{"population":2484,"happiness":2920,"demandHappiness":2484,"money_24h":14400,"strategy_points_24h":6,"all_goods_of_age_24h":15},"IndustrialAge":{"population":3036,"happiness":3290,"demandHappiness":3036,"money_24h":17900,"strategy_points_24h":6,"all_goods_of_age_24h":15},"ProgressiveEra":{"population":3624,"happiness":3620,"demandHappiness":3624,"money_24h":21700,"strategy_points_24h":6,"all_goods_of_age_24h":15},"ModernEra":{"population":4248,"happiness":3870,"demandHappiness":4248,"money_24h":27000,"strategy_points_24h":6,"all_goods_of_age_24h":15},"PostModernEra":{"population":4896,"happiness":4030,"demandHappiness":4896,"money_24h":34000,"strategy_points_24h":6,"all_goods_of_age_24h":15},"ContemporaryEra":{"population":5580,"happiness":4680,"demandHappiness":5580,"money_24h":44300,"strategy_points_24h":6,"all_goods_of_age_24h":15},"TomorrowEra":{"population":6288,"happiness":5690,"demandHappiness":6288,"money_24h":51300,"strategy_points_24h":6,"all_goods_of_age_24h":15},"FutureEra":{"population":7032,"happiness":6810,"demandHappiness":7032,"money_24h":58800,"strategy_points_24h":6,"all_goods_of_age_24h":15},"ArcticFuture":{"population":7800,"happiness":7930,"demandHappiness":7800,"money_24h":66800,"strategy_points_24h":6,"all_goods_of_age_24h":15},"OceanicFuture":{"population":8592,"happiness":9160,"demandHappiness":8592,"money_24h":75300,"strategy_points_24h":6,"all_goods_of_age_24h":15},"VirtualFuture":{"population":9408,"happiness":10940,"demandHappiness":9408,"money_24h":84300,"strategy_points_24h":6,"all_goods_of_age_24h":15},"SpaceAgeMars":{"population":14892,"happiness":17500,"demandHappiness":14892,"money_24h":140800,"strategy_points_24h":6,"all_goods_of_age_24h":15},"SpaceAgeAsteroidBelt":{"population":16176,"happiness":19020,"demandHappiness":16176,"money_24h":156000,"strategy_points_24h":6,"all_goods_of_age_24h":15},"SpaceAgeVenus":{"population":17484,"happiness":20550,"demandHappiness":17484,"money_24h":172000,"strategy_points_24h":6,"all_goods_of_age_24h":15},"SpaceAgeJupiterMoon":{"population":18828,"happiness":22130,"demandHappiness":18828,"money_24h":188700,"strategy_points_24h":6,"all_goods_of_age_24h":15},"SpaceAgeTitan":{"population":20196,"happiness":23740,"demandHappiness":20196,"money_24h":206400,"strategy_points_24h":6,"all_goods_of_age_24h":15},"SpaceAgeSpaceHub":{"population":21600,"happiness":25390,"demandHappiness":21600,"money_24h":224800,"strategy_points_24h":6,"all_goods_of_age_24h":15}}, boosts: [{"type":"att_boost_attacker","value":7,"feature":"all"}] },
+    "W_MultiAge_PAT22A8": { prod: {"BronzeAge":{"population":344,"happiness":1080,"demandHappiness":344,"money_24h":1400,"strategy_points_24h":8,"all_goods_of_age_24h":20},"IronAge":{"population":740,"happiness":1860,"demandHappiness":740,"money_24h":3200,"strategy_points_24h":8,"all_goods_of_age_24h":20},"EarlyMiddleAge":{"population":1135,"happiness":2060,"demandHappiness":1135,"money_24h":5400,"strategy_points_24h":8,"all_goods_of_age_24h":20},"HighMiddleAge":{"population":1594,"happiness":2300,"demandHappiness":1594,"money_24h":7600,"strategy_points_24h":8,"all_goods_of_age_24h":20},"LateMiddleAge":{"population":2091,"happiness":2560,"demandHappiness":2091,"money_24h":10000,"strategy_points_24h":8,"all_goods_of_age_24h":20},"ColonialAge":{"population":2639,"happiness":3010,"demandHappiness":2639,"money_24h":15200,"strategy_points_24h":8,"all_goods_of_age_24h":20},"IndustrialAge":{"population":3226,"happiness":3400,"demandHappiness":3226,"money_24h":19000,"strategy_points_24h":8,"all_goods_of_age_24h":20},"ProgressiveEra":{"population":3851,"happiness":3730,"demandHappiness":3851,"money_24h":23000,"strategy_points_24h":8,"all_goods_of_age_24h":20},"ModernEra":{"population":4514,"happiness":3990,"demandHappiness":4514,"money_24h":28600,"strategy_points_24h":8,"all_goods_of_age_24h":20},"PostModernEra":{"population":5202,"happiness":4160,"demandHappiness":5202,"money_24h":36000,"strategy_points_24h":8,"all_goods_of_age_24h":20},"ContemporaryEra":{"population":5929,"happiness":4840,"demandHappiness":5929,"money_24h":46900,"strategy_points_24h":8,"all_goods_of_age_24h":20},"TomorrowEra":{"population":6681,"happiness":5870,"demandHappiness":6681,"money_24h":54300,"strategy_points_24h":8,"all_goods_of_age_24h":20},"FutureEra":{"population":7472,"happiness":7030,"demandHappiness":7472,"money_24h":62200,"strategy_points_24h":8,"all_goods_of_age_24h":20},"ArcticFuture":{"population":8288,"happiness":8190,"demandHappiness":8288,"money_24h":70700,"strategy_points_24h":8,"all_goods_of_age_24h":20},"OceanicFuture":{"population":9129,"happiness":9450,"demandHappiness":9129,"money_24h":79700,"strategy_points_24h":8,"all_goods_of_age_24h":20},"VirtualFuture":{"population":9996,"happiness":11290,"demandHappiness":9996,"money_24h":89300,"strategy_points_24h":8,"all_goods_of_age_24h":20},"SpaceAgeMars":{"population":15823,"happiness":18070,"demandHappiness":15823,"money_24h":149100,"strategy_points_24h":8,"all_goods_of_age_24h":20},"SpaceAgeAsteroidBelt":{"population":17187,"happiness":19630,"demandHappiness":17187,"money_24h":165200,"strategy_points_24h":8,"all_goods_of_age_24h":20},"SpaceAgeVenus":{"population":18577,"happiness":21210,"demandHappiness":18577,"money_24h":182100,"strategy_points_24h":8,"all_goods_of_age_24h":20},"SpaceAgeJupiterMoon":{"population":20005,"happiness":22850,"demandHappiness":20005,"money_24h":199800,"strategy_points_24h":8,"all_goods_of_age_24h":20},"SpaceAgeTitan":{"population":21458,"happiness":24500,"demandHappiness":21458,"money_24h":218500,"strategy_points_24h":8,"all_goods_of_age_24h":20},"SpaceAgeSpaceHub":{"population":22950,"happiness":26210,"demandHappiness":22950,"money_24h":238000,"strategy_points_24h":8,"all_goods_of_age_24h":20}}, boosts: [{"type":"att_boost_attacker","value":9,"feature":"all"}] },
+    "W_MultiAge_PAT22A9": { prod: {"BronzeAge":{"population":365,"happiness":1120,"demandHappiness":365,"money_24h":1400,"strategy_points_24h":11,"all_goods_of_age_24h":20},"IronAge":{"population":783,"happiness":1920,"demandHappiness":783,"money_24h":3400,"strategy_points_24h":11,"all_goods_of_age_24h":20},"EarlyMiddleAge":{"population":1202,"happiness":2120,"demandHappiness":1202,"money_24h":5700,"strategy_points_24h":11,"all_goods_of_age_24h":20},"HighMiddleAge":{"population":1688,"happiness":2370,"demandHappiness":1688,"money_24h":8000,"strategy_points_24h":11,"all_goods_of_age_24h":20},"LateMiddleAge":{"population":2214,"happiness":2640,"demandHappiness":2214,"money_24h":10600,"strategy_points_24h":11,"all_goods_of_age_24h":20},"ColonialAge":{"population":2795,"happiness":3110,"demandHappiness":2795,"money_24h":16100,"strategy_points_24h":11,"all_goods_of_age_24h":20},"IndustrialAge":{"population":3416,"happiness":3510,"demandHappiness":3416,"money_24h":20000,"strategy_points_24h":11,"all_goods_of_age_24h":20},"ProgressiveEra":{"population":4077,"happiness":3850,"demandHappiness":4077,"money_24h":24300,"strategy_points_24h":11,"all_goods_of_age_24h":20},"ModernEra":{"population":4779,"happiness":4120,"demandHappiness":4779,"money_24h":30200,"strategy_points_24h":11,"all_goods_of_age_24h":20},"PostModernEra":{"population":5508,"happiness":4290,"demandHappiness":5508,"money_24h":38000,"strategy_points_24h":11,"all_goods_of_age_24h":20},"ContemporaryEra":{"population":6278,"happiness":4990,"demandHappiness":6278,"money_24h":49500,"strategy_points_24h":11,"all_goods_of_age_24h":20},"TomorrowEra":{"population":7074,"happiness":6050,"demandHappiness":7074,"money_24h":57300,"strategy_points_24h":11,"all_goods_of_age_24h":20},"FutureEra":{"population":7911,"happiness":7250,"demandHappiness":7911,"money_24h":65700,"strategy_points_24h":11,"all_goods_of_age_24h":20},"ArcticFuture":{"population":8775,"happiness":8450,"demandHappiness":8775,"money_24h":74600,"strategy_points_24h":11,"all_goods_of_age_24h":20},"OceanicFuture":{"population":9666,"happiness":9750,"demandHappiness":9666,"money_24h":84100,"strategy_points_24h":11,"all_goods_of_age_24h":20},"VirtualFuture":{"population":10584,"happiness":11640,"demandHappiness":10584,"money_24h":94200,"strategy_points_24h":11,"all_goods_of_age_24h":20},"SpaceAgeMars":{"population":16754,"happiness":18630,"demandHappiness":16754,"money_24h":157400,"strategy_points_24h":11,"all_goods_of_age_24h":20},"SpaceAgeAsteroidBelt":{"population":18198,"happiness":20250,"demandHappiness":18198,"money_24h":174400,"strategy_points_24h":11,"all_goods_of_age_24h":20},"SpaceAgeVenus":{"population":19670,"happiness":21870,"demandHappiness":19670,"money_24h":192200,"strategy_points_24h":11,"all_goods_of_age_24h":20},"SpaceAgeJupiterMoon":{"population":21182,"happiness":23560,"demandHappiness":21182,"money_24h":210900,"strategy_points_24h":11,"all_goods_of_age_24h":20},"SpaceAgeTitan":{"population":22721,"happiness":25270,"demandHappiness":22721,"money_24h":230600,"strategy_points_24h":11,"all_goods_of_age_24h":20},"SpaceAgeSpaceHub":{"population":24300,"happiness":27030,"demandHappiness":24300,"money_24h":251200,"strategy_points_24h":11,"all_goods_of_age_24h":20}}, boosts: [{"type":"att_boost_attacker","value":12,"feature":"all"}] },
+    "W_MultiAge_PAT24A2": { prod: {"BronzeAge":{"population":17,"happiness":65,"demandHappiness":17,"supplies_24h":107,"random_good_of_age_24h":30},"IronAge":{"population":35,"happiness":111,"demandHappiness":35,"supplies_24h":256,"random_good_of_age_24h":30},"EarlyMiddleAge":{"population":54,"happiness":122,"demandHappiness":54,"supplies_24h":427,"random_good_of_age_24h":30},"HighMiddleAge":{"population":76,"happiness":136,"demandHappiness":76,"supplies_24h":598,"random_good_of_age_24h":30},"LateMiddleAge":{"population":100,"happiness":152,"demandHappiness":100,"supplies_24h":790,"random_good_of_age_24h":30},"ColonialAge":{"population":125,"happiness":179,"demandHappiness":125,"supplies_24h":1003,"random_good_of_age_24h":30},"IndustrialAge":{"population":153,"happiness":202,"demandHappiness":153,"supplies_24h":1216,"random_good_of_age_24h":30},"ProgressiveEra":{"population":183,"happiness":221,"demandHappiness":183,"supplies_24h":1430,"random_good_of_age_24h":30},"ModernEra":{"population":214,"happiness":237,"demandHappiness":214,"supplies_24h":1664,"random_good_of_age_24h":30},"PostModernEra":{"population":247,"happiness":247,"demandHappiness":247,"supplies_24h":1899,"random_good_of_age_24h":30},"ContemporaryEra":{"population":281,"happiness":287,"demandHappiness":281,"supplies_24h":2133,"random_good_of_age_24h":30},"TomorrowEra":{"population":317,"happiness":348,"demandHappiness":317,"supplies_24h":2389,"random_good_of_age_24h":30},"FutureEra":{"population":354,"happiness":417,"demandHappiness":354,"supplies_24h":2624,"random_good_of_age_24h":30},"ArcticFuture":{"population":393,"happiness":485,"demandHappiness":393,"supplies_24h":2880,"random_good_of_age_24h":30},"OceanicFuture":{"population":433,"happiness":560,"demandHappiness":433,"supplies_24h":3157,"random_good_of_age_24h":30},"VirtualFuture":{"population":474,"happiness":669,"demandHappiness":474,"supplies_24h":3413,"random_good_of_age_24h":30},"SpaceAgeMars":{"population":749,"happiness":1070,"demandHappiness":749,"supplies_24h":5525,"random_good_of_age_24h":30},"SpaceAgeAsteroidBelt":{"population":814,"happiness":1162,"demandHappiness":814,"supplies_24h":5930,"random_good_of_age_24h":30},"SpaceAgeVenus":{"population":880,"happiness":1255,"demandHappiness":880,"supplies_24h":6356,"random_good_of_age_24h":30},"SpaceAgeJupiterMoon":{"population":947,"happiness":1353,"demandHappiness":947,"supplies_24h":6761,"random_good_of_age_24h":30},"SpaceAgeTitan":{"population":1016,"happiness":1450,"demandHappiness":1016,"supplies_24h":7188,"random_good_of_age_24h":30},"SpaceAgeSpaceHub":{"population":1085,"happiness":1547,"demandHappiness":1085,"supplies_24h":7615,"random_good_of_age_24h":30}}, boosts: [{"type":"def_boost_defender","value":10,"feature":"all"}] },
+    "W_MultiAge_PAT24A1": { prod: {"BronzeAge":{"population":9,"happiness":33,"demandHappiness":9,"supplies_24h":54,"random_good_of_age_24h":20},"IronAge":{"population":18,"happiness":56,"demandHappiness":18,"supplies_24h":128,"random_good_of_age_24h":20},"EarlyMiddleAge":{"population":27,"happiness":61,"demandHappiness":27,"supplies_24h":214,"random_good_of_age_24h":20},"HighMiddleAge":{"population":38,"happiness":68,"demandHappiness":38,"supplies_24h":299,"random_good_of_age_24h":20},"LateMiddleAge":{"population":50,"happiness":76,"demandHappiness":50,"supplies_24h":395,"random_good_of_age_24h":20},"ColonialAge":{"population":63,"happiness":90,"demandHappiness":63,"supplies_24h":502,"random_good_of_age_24h":20},"IndustrialAge":{"population":77,"happiness":101,"demandHappiness":77,"supplies_24h":608,"random_good_of_age_24h":20},"ProgressiveEra":{"population":92,"happiness":111,"demandHappiness":92,"supplies_24h":715,"random_good_of_age_24h":20},"ModernEra":{"population":107,"happiness":119,"demandHappiness":107,"supplies_24h":832,"random_good_of_age_24h":20},"PostModernEra":{"population":124,"happiness":124,"demandHappiness":124,"supplies_24h":950,"random_good_of_age_24h":20},"ContemporaryEra":{"population":141,"happiness":144,"demandHappiness":141,"supplies_24h":1067,"random_good_of_age_24h":20},"TomorrowEra":{"population":159,"happiness":174,"demandHappiness":159,"supplies_24h":1195,"random_good_of_age_24h":20},"FutureEra":{"population":177,"happiness":209,"demandHappiness":177,"supplies_24h":1312,"random_good_of_age_24h":20},"ArcticFuture":{"population":197,"happiness":243,"demandHappiness":197,"supplies_24h":1440,"random_good_of_age_24h":20},"OceanicFuture":{"population":217,"happiness":280,"demandHappiness":217,"supplies_24h":1579,"random_good_of_age_24h":20},"VirtualFuture":{"population":237,"happiness":335,"demandHappiness":237,"supplies_24h":1707,"random_good_of_age_24h":20},"SpaceAgeMars":{"population":375,"happiness":535,"demandHappiness":375,"supplies_24h":2763,"random_good_of_age_24h":20},"SpaceAgeAsteroidBelt":{"population":407,"happiness":581,"demandHappiness":407,"supplies_24h":2965,"random_good_of_age_24h":20},"SpaceAgeVenus":{"population":440,"happiness":628,"demandHappiness":440,"supplies_24h":3178,"random_good_of_age_24h":20},"SpaceAgeJupiterMoon":{"population":474,"happiness":677,"demandHappiness":474,"supplies_24h":3381,"random_good_of_age_24h":20},"SpaceAgeTitan":{"population":508,"happiness":725,"demandHappiness":508,"supplies_24h":3594,"random_good_of_age_24h":20},"SpaceAgeSpaceHub":{"population":542,"happiness":773,"demandHappiness":542,"supplies_24h":3807,"random_good_of_age_24h":20}} },
+    "W_MultiAge_PAT24A3": { prod: {"BronzeAge":{"population":33,"happiness":129,"demandHappiness":33,"supplies_24h":214,"random_good_of_age_24h":40},"IronAge":{"population":70,"happiness":221,"demandHappiness":70,"supplies_24h":512,"random_good_of_age_24h":40},"EarlyMiddleAge":{"population":108,"happiness":244,"demandHappiness":108,"supplies_24h":854,"random_good_of_age_24h":40},"HighMiddleAge":{"population":151,"happiness":272,"demandHappiness":151,"supplies_24h":1195,"random_good_of_age_24h":40},"LateMiddleAge":{"population":199,"happiness":304,"demandHappiness":199,"supplies_24h":1579,"random_good_of_age_24h":40},"ColonialAge":{"population":250,"happiness":357,"demandHappiness":250,"supplies_24h":2005,"random_good_of_age_24h":40},"IndustrialAge":{"population":306,"happiness":403,"demandHappiness":306,"supplies_24h":2432,"random_good_of_age_24h":40},"ProgressiveEra":{"population":365,"happiness":442,"demandHappiness":365,"supplies_24h":2859,"random_good_of_age_24h":40},"ModernEra":{"population":428,"happiness":473,"demandHappiness":428,"supplies_24h":3327,"random_good_of_age_24h":40},"PostModernEra":{"population":493,"happiness":493,"demandHappiness":493,"supplies_24h":3797,"random_good_of_age_24h":40},"ContemporaryEra":{"population":562,"happiness":573,"demandHappiness":562,"supplies_24h":4266,"random_good_of_age_24h":40},"TomorrowEra":{"population":633,"happiness":695,"demandHappiness":633,"supplies_24h":4778,"random_good_of_age_24h":40},"FutureEra":{"population":708,"happiness":833,"demandHappiness":708,"supplies_24h":5247,"random_good_of_age_24h":40},"ArcticFuture":{"population":785,"happiness":970,"demandHappiness":785,"supplies_24h":5759,"random_good_of_age_24h":40},"OceanicFuture":{"population":865,"happiness":1119,"demandHappiness":865,"supplies_24h":6314,"random_good_of_age_24h":40},"VirtualFuture":{"population":947,"happiness":1337,"demandHappiness":947,"supplies_24h":6825,"random_good_of_age_24h":40},"SpaceAgeMars":{"population":1498,"happiness":2139,"demandHappiness":1498,"supplies_24h":11049,"random_good_of_age_24h":40},"SpaceAgeAsteroidBelt":{"population":1627,"happiness":2324,"demandHappiness":1627,"supplies_24h":11859,"random_good_of_age_24h":40},"SpaceAgeVenus":{"population":1759,"happiness":2510,"demandHappiness":1759,"supplies_24h":12712,"random_good_of_age_24h":40},"SpaceAgeJupiterMoon":{"population":1894,"happiness":2705,"demandHappiness":1894,"supplies_24h":13522,"random_good_of_age_24h":40},"SpaceAgeTitan":{"population":2032,"happiness":2900,"demandHappiness":2032,"supplies_24h":14375,"random_good_of_age_24h":40},"SpaceAgeSpaceHub":{"population":2170,"happiness":3095,"demandHappiness":2170,"supplies_24h":15228,"random_good_of_age_24h":40}}, boosts: [{"type":"att_boost_defender","value":7,"feature":"all"},{"type":"def_boost_defender","value":13,"feature":"all"}] },
+    "W_MultiAge_PAT24A4": { prod: {"BronzeAge":{"population":65,"happiness":257,"demandHappiness":65,"supplies_24h":427,"random_good_of_age_24h":50},"IronAge":{"population":140,"happiness":442,"demandHappiness":140,"supplies_24h":1024,"random_good_of_age_24h":50},"EarlyMiddleAge":{"population":215,"happiness":488,"demandHappiness":215,"supplies_24h":1707,"random_good_of_age_24h":50},"HighMiddleAge":{"population":302,"happiness":544,"demandHappiness":302,"supplies_24h":2389,"random_good_of_age_24h":50},"LateMiddleAge":{"population":397,"happiness":608,"demandHappiness":397,"supplies_24h":3157,"random_good_of_age_24h":50},"ColonialAge":{"population":500,"happiness":714,"demandHappiness":500,"supplies_24h":4010,"random_good_of_age_24h":50},"IndustrialAge":{"population":612,"happiness":805,"demandHappiness":612,"supplies_24h":4863,"random_good_of_age_24h":50},"ProgressiveEra":{"population":729,"happiness":884,"demandHappiness":729,"supplies_24h":5717,"random_good_of_age_24h":50},"ModernEra":{"population":855,"happiness":945,"demandHappiness":855,"supplies_24h":6654,"random_good_of_age_24h":50},"PostModernEra":{"population":985,"happiness":985,"demandHappiness":985,"supplies_24h":7593,"random_good_of_age_24h":50},"ContemporaryEra":{"population":1123,"happiness":1145,"demandHappiness":1123,"supplies_24h":8532,"random_good_of_age_24h":50},"TomorrowEra":{"population":1265,"happiness":1390,"demandHappiness":1265,"supplies_24h":9555,"random_good_of_age_24h":50},"FutureEra":{"population":1415,"happiness":1665,"demandHappiness":1415,"supplies_24h":10494,"random_good_of_age_24h":50},"ArcticFuture":{"population":1569,"happiness":1939,"demandHappiness":1569,"supplies_24h":11518,"random_good_of_age_24h":50},"OceanicFuture":{"population":1729,"happiness":2238,"demandHappiness":1729,"supplies_24h":12627,"random_good_of_age_24h":50},"VirtualFuture":{"population":1893,"happiness":2673,"demandHappiness":1893,"supplies_24h":13650,"random_good_of_age_24h":50},"SpaceAgeMars":{"population":2995,"happiness":4277,"demandHappiness":2995,"supplies_24h":22097,"random_good_of_age_24h":50},"SpaceAgeAsteroidBelt":{"population":3254,"happiness":4648,"demandHappiness":3254,"supplies_24h":23717,"random_good_of_age_24h":50},"SpaceAgeVenus":{"population":3518,"happiness":5020,"demandHappiness":3518,"supplies_24h":25423,"random_good_of_age_24h":50},"SpaceAgeJupiterMoon":{"population":3788,"happiness":5409,"demandHappiness":3788,"supplies_24h":27044,"random_good_of_age_24h":50},"SpaceAgeTitan":{"population":4063,"happiness":5800,"demandHappiness":4063,"supplies_24h":28750,"random_good_of_age_24h":50},"SpaceAgeSpaceHub":{"population":4338,"happiness":6191,"demandHappiness":4338,"supplies_24h":30456,"random_good_of_age_24h":50}}, boosts: [{"type":"def_boost_attacker","value":10,"feature":"all"},{"type":"att_boost_defender","value":9,"feature":"all"},{"type":"def_boost_defender","value":16,"feature":"all"}] },
+    "W_MultiAge_PAT24A5": { prod: {"BronzeAge":{"population":130,"happiness":513,"demandHappiness":130,"supplies_24h":853,"strategy_points_24h":10,"random_good_of_age_24h":60},"IronAge":{"population":280,"happiness":883,"demandHappiness":280,"supplies_24h":2048,"strategy_points_24h":10,"random_good_of_age_24h":60},"EarlyMiddleAge":{"population":430,"happiness":975,"demandHappiness":430,"supplies_24h":3413,"strategy_points_24h":10,"random_good_of_age_24h":60},"HighMiddleAge":{"population":603,"happiness":1088,"demandHappiness":603,"supplies_24h":4778,"strategy_points_24h":10,"random_good_of_age_24h":60},"LateMiddleAge":{"population":793,"happiness":1215,"demandHappiness":793,"supplies_24h":6313,"strategy_points_24h":10,"random_good_of_age_24h":60},"ColonialAge":{"population":1000,"happiness":1428,"demandHappiness":1000,"supplies_24h":8020,"strategy_points_24h":11,"random_good_of_age_24h":60},"IndustrialAge":{"population":1223,"happiness":1610,"demandHappiness":1223,"supplies_24h":9725,"strategy_points_24h":11,"random_good_of_age_24h":60},"ProgressiveEra":{"population":1458,"happiness":1768,"demandHappiness":1458,"supplies_24h":11433,"strategy_points_24h":11,"random_good_of_age_24h":60},"ModernEra":{"population":1710,"happiness":1890,"demandHappiness":1710,"supplies_24h":13308,"strategy_points_24h":11,"random_good_of_age_24h":60},"PostModernEra":{"population":1970,"happiness":1970,"demandHappiness":1970,"supplies_24h":15185,"strategy_points_24h":11,"random_good_of_age_24h":60},"ContemporaryEra":{"population":2245,"happiness":2290,"demandHappiness":2245,"supplies_24h":17063,"strategy_points_24h":12,"random_good_of_age_24h":60},"TomorrowEra":{"population":2530,"happiness":2780,"demandHappiness":2530,"supplies_24h":19110,"strategy_points_24h":12,"random_good_of_age_24h":60},"FutureEra":{"population":2830,"happiness":3330,"demandHappiness":2830,"supplies_24h":20988,"strategy_points_24h":12,"random_good_of_age_24h":60},"ArcticFuture":{"population":3138,"happiness":3878,"demandHappiness":3138,"supplies_24h":23035,"strategy_points_24h":12,"random_good_of_age_24h":60},"OceanicFuture":{"population":3458,"happiness":4475,"demandHappiness":3458,"supplies_24h":25253,"strategy_points_24h":12,"random_good_of_age_24h":60},"VirtualFuture":{"population":3785,"happiness":5345,"demandHappiness":3785,"supplies_24h":27300,"strategy_points_24h":13,"random_good_of_age_24h":60},"SpaceAgeMars":{"population":5990,"happiness":8553,"demandHappiness":5990,"supplies_24h":44193,"strategy_points_24h":13,"random_good_of_age_24h":60},"SpaceAgeAsteroidBelt":{"population":6508,"happiness":9295,"demandHappiness":6508,"supplies_24h":47433,"strategy_points_24h":13,"random_good_of_age_24h":60},"SpaceAgeVenus":{"population":7035,"happiness":10040,"demandHappiness":7035,"supplies_24h":50845,"strategy_points_24h":13,"random_good_of_age_24h":60},"SpaceAgeJupiterMoon":{"population":7575,"happiness":10818,"demandHappiness":7575,"supplies_24h":54088,"strategy_points_24h":13,"random_good_of_age_24h":60},"SpaceAgeTitan":{"population":8125,"happiness":11600,"demandHappiness":8125,"supplies_24h":57500,"strategy_points_24h":14,"random_good_of_age_24h":60},"SpaceAgeSpaceHub":{"population":8675,"happiness":12382,"demandHappiness":8675,"supplies_24h":60912,"strategy_points_24h":14,"random_good_of_age_24h":60}}, boosts: [{"type":"def_boost_attacker","value":25,"feature":"all"},{"type":"att_boost_defender","value":11,"feature":"all"},{"type":"def_boost_defender","value":19,"feature":"all"}] },
+    "W_MultiAge_PAT24A6": { prod: {"BronzeAge":{"population":260,"happiness":1025,"demandHappiness":260,"supplies_24h":1705,"strategy_points_24h":20,"random_good_of_age_24h":70},"IronAge":{"population":560,"happiness":1765,"demandHappiness":560,"supplies_24h":4095,"strategy_points_24h":20,"random_good_of_age_24h":70},"EarlyMiddleAge":{"population":860,"happiness":1950,"demandHappiness":860,"supplies_24h":6825,"strategy_points_24h":20,"random_good_of_age_24h":70},"HighMiddleAge":{"population":1205,"happiness":2175,"demandHappiness":1205,"supplies_24h":9555,"strategy_points_24h":20,"random_good_of_age_24h":70},"LateMiddleAge":{"population":1585,"happiness":2430,"demandHappiness":1585,"supplies_24h":12625,"strategy_points_24h":20,"random_good_of_age_24h":70},"ColonialAge":{"population":2000,"happiness":2855,"demandHappiness":2000,"supplies_24h":16040,"strategy_points_24h":21,"random_good_of_age_24h":70},"IndustrialAge":{"population":2445,"happiness":3220,"demandHappiness":2445,"supplies_24h":19450,"strategy_points_24h":21,"random_good_of_age_24h":70},"ProgressiveEra":{"population":2915,"happiness":3535,"demandHappiness":2915,"supplies_24h":22865,"strategy_points_24h":21,"random_good_of_age_24h":70},"ModernEra":{"population":3420,"happiness":3780,"demandHappiness":3420,"supplies_24h":26615,"strategy_points_24h":21,"random_good_of_age_24h":70},"PostModernEra":{"population":3940,"happiness":3940,"demandHappiness":3940,"supplies_24h":30370,"strategy_points_24h":21,"random_good_of_age_24h":70},"ContemporaryEra":{"population":4490,"happiness":4580,"demandHappiness":4490,"supplies_24h":34125,"strategy_points_24h":22,"random_good_of_age_24h":70},"TomorrowEra":{"population":5060,"happiness":5560,"demandHappiness":5060,"supplies_24h":38220,"strategy_points_24h":22,"random_good_of_age_24h":70},"FutureEra":{"population":5660,"happiness":6660,"demandHappiness":5660,"supplies_24h":41975,"strategy_points_24h":22,"random_good_of_age_24h":70},"ArcticFuture":{"population":6275,"happiness":7755,"demandHappiness":6275,"supplies_24h":46070,"strategy_points_24h":22,"random_good_of_age_24h":70},"OceanicFuture":{"population":6915,"happiness":8950,"demandHappiness":6915,"supplies_24h":50505,"strategy_points_24h":22,"random_good_of_age_24h":70},"VirtualFuture":{"population":7570,"happiness":10690,"demandHappiness":7570,"supplies_24h":54600,"strategy_points_24h":23,"random_good_of_age_24h":70},"SpaceAgeMars":{"population":11980,"happiness":17105,"demandHappiness":11980,"supplies_24h":88385,"strategy_points_24h":23,"random_good_of_age_24h":70},"SpaceAgeAsteroidBelt":{"population":13015,"happiness":18590,"demandHappiness":13015,"supplies_24h":94865,"strategy_points_24h":23,"random_good_of_age_24h":70},"SpaceAgeVenus":{"population":14070,"happiness":20080,"demandHappiness":14070,"supplies_24h":101690,"strategy_points_24h":23,"random_good_of_age_24h":70},"SpaceAgeJupiterMoon":{"population":15150,"happiness":21635,"demandHappiness":15150,"supplies_24h":108175,"strategy_points_24h":23,"random_good_of_age_24h":70},"SpaceAgeTitan":{"population":16250,"happiness":23200,"demandHappiness":16250,"supplies_24h":115000,"strategy_points_24h":24,"random_good_of_age_24h":70},"SpaceAgeSpaceHub":{"population":17350,"happiness":24765,"demandHappiness":17350,"supplies_24h":121825,"strategy_points_24h":24,"random_good_of_age_24h":70}}, boosts: [{"type":"def_boost_attacker","value":40,"feature":"all"},{"type":"att_boost_defender","value":13,"feature":"all"},{"type":"def_boost_defender","value":22,"feature":"all"},{"type":"coin_production","value":20,"feature":"all"},{"type":"supply_production","value":20,"feature":"all"}] },
+    "W_MultiAge_PAT24A7": { prod: {"BronzeAge":{"population":520,"happiness":2050,"demandHappiness":520,"supplies_24h":3410,"strategy_points_24h":30,"random_good_of_age_24h":80},"IronAge":{"population":1120,"happiness":3530,"demandHappiness":1120,"supplies_24h":8190,"strategy_points_24h":30,"random_good_of_age_24h":80},"EarlyMiddleAge":{"population":1720,"happiness":3900,"demandHappiness":1720,"supplies_24h":13650,"strategy_points_24h":30,"random_good_of_age_24h":80},"HighMiddleAge":{"population":2410,"happiness":4350,"demandHappiness":2410,"supplies_24h":19110,"strategy_points_24h":30,"random_good_of_age_24h":80},"LateMiddleAge":{"population":3170,"happiness":4860,"demandHappiness":3170,"supplies_24h":25250,"strategy_points_24h":30,"random_good_of_age_24h":80},"ColonialAge":{"population":4000,"happiness":5710,"demandHappiness":4000,"supplies_24h":32080,"strategy_points_24h":31,"random_good_of_age_24h":80},"IndustrialAge":{"population":4890,"happiness":6440,"demandHappiness":4890,"supplies_24h":38900,"strategy_points_24h":31,"random_good_of_age_24h":80},"ProgressiveEra":{"population":5830,"happiness":7070,"demandHappiness":5830,"supplies_24h":45730,"strategy_points_24h":31,"random_good_of_age_24h":80},"ModernEra":{"population":6840,"happiness":7560,"demandHappiness":6840,"supplies_24h":53230,"strategy_points_24h":31,"random_good_of_age_24h":80},"PostModernEra":{"population":7880,"happiness":7880,"demandHappiness":7880,"supplies_24h":60740,"strategy_points_24h":31,"random_good_of_age_24h":80},"ContemporaryEra":{"population":8980,"happiness":9160,"demandHappiness":8980,"supplies_24h":68250,"strategy_points_24h":32,"random_good_of_age_24h":80},"TomorrowEra":{"population":10120,"happiness":11120,"demandHappiness":10120,"supplies_24h":76440,"strategy_points_24h":32,"random_good_of_age_24h":80},"FutureEra":{"population":11320,"happiness":13320,"demandHappiness":11320,"supplies_24h":83950,"strategy_points_24h":32,"random_good_of_age_24h":80},"ArcticFuture":{"population":12550,"happiness":15510,"demandHappiness":12550,"supplies_24h":92140,"strategy_points_24h":32,"random_good_of_age_24h":80},"OceanicFuture":{"population":13830,"happiness":17900,"demandHappiness":13830,"supplies_24h":101010,"strategy_points_24h":32,"random_good_of_age_24h":80},"VirtualFuture":{"population":15140,"happiness":21380,"demandHappiness":15140,"supplies_24h":109200,"strategy_points_24h":33,"random_good_of_age_24h":80},"SpaceAgeMars":{"population":23960,"happiness":34210,"demandHappiness":23960,"supplies_24h":176770,"strategy_points_24h":33,"random_good_of_age_24h":80},"SpaceAgeAsteroidBelt":{"population":26030,"happiness":37180,"demandHappiness":26030,"supplies_24h":189730,"strategy_points_24h":33,"random_good_of_age_24h":80},"SpaceAgeVenus":{"population":28140,"happiness":40160,"demandHappiness":28140,"supplies_24h":203380,"strategy_points_24h":33,"random_good_of_age_24h":80},"SpaceAgeJupiterMoon":{"population":30300,"happiness":43270,"demandHappiness":30300,"supplies_24h":216350,"strategy_points_24h":33,"random_good_of_age_24h":80},"SpaceAgeTitan":{"population":32500,"happiness":46400,"demandHappiness":32500,"supplies_24h":230000,"strategy_points_24h":34,"random_good_of_age_24h":80},"SpaceAgeSpaceHub":{"population":34700,"happiness":49530,"demandHappiness":34700,"supplies_24h":243650,"strategy_points_24h":34,"random_good_of_age_24h":80}}, boosts: [{"type":"def_boost_attacker","value":55,"feature":"all"},{"type":"att_boost_defender","value":15,"feature":"all"},{"type":"att_boost_defender","value":35,"feature":"guild_expedition"},{"type":"def_boost_defender","value":25,"feature":"all"},{"type":"def_boost_defender","value":60,"feature":"guild_expedition"},{"type":"coin_production","value":35,"feature":"all"},{"type":"supply_production","value":35,"feature":"all"}] },
+    "W_MultiAge_PAT24C1": { prod: {"BronzeAge":{"happiness":220,"medals_24h":20,"strategy_points_24h":5,"random_good_of_age_24h":16},"IronAge":{"happiness":380,"medals_24h":25,"strategy_points_24h":5,"random_good_of_age_24h":16},"EarlyMiddleAge":{"happiness":420,"medals_24h":30,"strategy_points_24h":5,"random_good_of_age_24h":16},"HighMiddleAge":{"happiness":470,"medals_24h":35,"strategy_points_24h":5,"random_good_of_age_24h":16},"LateMiddleAge":{"happiness":525,"medals_24h":40,"strategy_points_24h":5,"random_good_of_age_24h":16},"ColonialAge":{"happiness":615,"medals_24h":45,"strategy_points_24h":5,"random_good_of_age_24h":16},"IndustrialAge":{"happiness":695,"medals_24h":65,"strategy_points_24h":5,"random_good_of_age_24h":16},"ProgressiveEra":{"happiness":760,"medals_24h":90,"strategy_points_24h":5,"random_good_of_age_24h":16},"ModernEra":{"happiness":815,"medals_24h":130,"strategy_points_24h":5,"random_good_of_age_24h":16},"PostModernEra":{"happiness":850,"medals_24h":180,"strategy_points_24h":5,"random_good_of_age_24h":16},"ContemporaryEra":{"happiness":985,"medals_24h":260,"strategy_points_24h":5,"random_good_of_age_24h":16},"TomorrowEra":{"happiness":1200,"medals_24h":350,"strategy_points_24h":5,"random_good_of_age_24h":16},"FutureEra":{"happiness":1435,"medals_24h":425,"strategy_points_24h":5,"random_good_of_age_24h":16},"ArcticFuture":{"happiness":1670,"medals_24h":515,"strategy_points_24h":5,"random_good_of_age_24h":16},"OceanicFuture":{"happiness":1930,"medals_24h":595,"strategy_points_24h":5,"random_good_of_age_24h":16},"VirtualFuture":{"happiness":2305,"medals_24h":725,"strategy_points_24h":5,"random_good_of_age_24h":16},"SpaceAgeMars":{"happiness":3685,"medals_24h":880,"strategy_points_24h":5,"random_good_of_age_24h":16},"SpaceAgeAsteroidBelt":{"happiness":4005,"medals_24h":1035,"strategy_points_24h":5,"random_good_of_age_24h":16},"SpaceAgeVenus":{"happiness":4330,"medals_24h":1190,"strategy_points_24h":5,"random_good_of_age_24h":16},"SpaceAgeJupiterMoon":{"happiness":4660,"medals_24h":1345,"strategy_points_24h":5,"random_good_of_age_24h":16},"SpaceAgeTitan":{"happiness":5000,"medals_24h":1500,"strategy_points_24h":5,"random_good_of_age_24h":16},"SpaceAgeSpaceHub":{"happiness":5340,"medals_24h":1655,"strategy_points_24h":5,"random_good_of_age_24h":16}}, boosts: [{"type":"att_boost_attacker","value":6,"feature":"all"},{"type":"att_boost_defender","value":9,"feature":"all"},{"type":"def_boost_defender","value":14,"feature":"all"}] },
+    "W_MultiAge_PAT24C2": { prod: {"BronzeAge":{"happiness":440,"medals_24h":40,"strategy_points_24h":6,"random_good_of_age_24h":20},"IronAge":{"happiness":760,"medals_24h":50,"strategy_points_24h":6,"random_good_of_age_24h":20},"EarlyMiddleAge":{"happiness":840,"medals_24h":60,"strategy_points_24h":6,"random_good_of_age_24h":20},"HighMiddleAge":{"happiness":940,"medals_24h":70,"strategy_points_24h":6,"random_good_of_age_24h":20},"LateMiddleAge":{"happiness":1050,"medals_24h":80,"strategy_points_24h":6,"random_good_of_age_24h":20},"ColonialAge":{"happiness":1230,"medals_24h":90,"strategy_points_24h":6,"random_good_of_age_24h":20},"IndustrialAge":{"happiness":1390,"medals_24h":130,"strategy_points_24h":6,"random_good_of_age_24h":20},"ProgressiveEra":{"happiness":1520,"medals_24h":180,"strategy_points_24h":6,"random_good_of_age_24h":20},"ModernEra":{"happiness":1630,"medals_24h":260,"strategy_points_24h":6,"random_good_of_age_24h":20},"PostModernEra":{"happiness":1700,"medals_24h":360,"strategy_points_24h":6,"random_good_of_age_24h":20},"ContemporaryEra":{"happiness":1970,"medals_24h":520,"strategy_points_24h":6,"random_good_of_age_24h":20},"TomorrowEra":{"happiness":2400,"medals_24h":700,"strategy_points_24h":6,"random_good_of_age_24h":20},"FutureEra":{"happiness":2870,"medals_24h":850,"strategy_points_24h":6,"random_good_of_age_24h":20},"ArcticFuture":{"happiness":3340,"medals_24h":1030,"strategy_points_24h":6,"random_good_of_age_24h":20},"OceanicFuture":{"happiness":3860,"medals_24h":1190,"strategy_points_24h":6,"random_good_of_age_24h":20},"VirtualFuture":{"happiness":4610,"medals_24h":1450,"strategy_points_24h":6,"random_good_of_age_24h":20},"SpaceAgeMars":{"happiness":7370,"medals_24h":1760,"strategy_points_24h":6,"random_good_of_age_24h":20},"SpaceAgeAsteroidBelt":{"happiness":8010,"medals_24h":2070,"strategy_points_24h":6,"random_good_of_age_24h":20},"SpaceAgeVenus":{"happiness":8660,"medals_24h":2380,"strategy_points_24h":6,"random_good_of_age_24h":20},"SpaceAgeJupiterMoon":{"happiness":9320,"medals_24h":2690,"strategy_points_24h":6,"random_good_of_age_24h":20},"SpaceAgeTitan":{"happiness":10000,"medals_24h":3000,"strategy_points_24h":6,"random_good_of_age_24h":20},"SpaceAgeSpaceHub":{"happiness":10680,"medals_24h":3310,"strategy_points_24h":6,"random_good_of_age_24h":20}}, boosts: [{"type":"att_boost_attacker","value":10,"feature":"all"},{"type":"att_boost_defender","value":13,"feature":"all"},{"type":"def_boost_defender","value":18,"feature":"all"}] },
+    "W_MultiAge_PAT26A10": { prod: {"BronzeAge":{"population":750,"demandHappiness":750,"supplies_24h":6160,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"IronAge":{"population":1610,"demandHappiness":1610,"supplies_24h":14790,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"EarlyMiddleAge":{"population":2480,"demandHappiness":2480,"supplies_24h":24650,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"HighMiddleAge":{"population":3480,"demandHappiness":3480,"supplies_24h":34510,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"LateMiddleAge":{"population":4560,"demandHappiness":4560,"supplies_24h":45600,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"ColonialAge":{"population":5760,"demandHappiness":5760,"supplies_24h":57930,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"IndustrialAge":{"population":7040,"demandHappiness":7040,"supplies_24h":70250,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"ProgressiveEra":{"population":8400,"demandHappiness":8400,"supplies_24h":82580,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"ModernEra":{"population":9850,"demandHappiness":9850,"supplies_24h":96130,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"PostModernEra":{"population":11350,"demandHappiness":11350,"supplies_24h":109690,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"ContemporaryEra":{"population":12940,"demandHappiness":12940,"supplies_24h":123250,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"TomorrowEra":{"population":14580,"demandHappiness":14580,"supplies_24h":138040,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"FutureEra":{"population":16300,"demandHappiness":16300,"supplies_24h":151600,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"ArcticFuture":{"population":18090,"demandHappiness":18090,"supplies_24h":166390,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"OceanicFuture":{"population":19920,"demandHappiness":19920,"supplies_24h":182410,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"VirtualFuture":{"population":21810,"demandHappiness":21810,"supplies_24h":197200,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"SpaceAgeMars":{"population":34530,"demandHappiness":34530,"supplies_24h":319220,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"SpaceAgeAsteroidBelt":{"population":37510,"demandHappiness":37510,"supplies_24h":342630,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"SpaceAgeVenus":{"population":40540,"demandHappiness":40540,"supplies_24h":367280,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"SpaceAgeJupiterMoon":{"population":43660,"demandHappiness":43660,"supplies_24h":390700,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"SpaceAgeTitan":{"population":46830,"demandHappiness":46830,"supplies_24h":415350,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230},"SpaceAgeSpaceHub":{"population":50000,"demandHappiness":50000,"supplies_24h":440000,"strategy_points_24h":220,"random_good_of_age_24h":280,"random_good_of_previous_age_24h":230}}, boosts: [{"type":"att_boost_attacker","value":197,"feature":"battleground"},{"type":"att_boost_defender","value":306,"feature":"battleground"}] },
+    "W_MultiAge_PAT26A1": { prod: {"BronzeAge":{"population":140,"demandHappiness":140,"supplies_24h":180,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"IronAge":{"population":290,"demandHappiness":290,"supplies_24h":440,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"EarlyMiddleAge":{"population":450,"demandHappiness":450,"supplies_24h":730,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"HighMiddleAge":{"population":630,"demandHappiness":630,"supplies_24h":1020,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"LateMiddleAge":{"population":820,"demandHappiness":820,"supplies_24h":1350,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"ColonialAge":{"population":1040,"demandHappiness":1040,"supplies_24h":1710,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"IndustrialAge":{"population":1270,"demandHappiness":1270,"supplies_24h":2080,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"ProgressiveEra":{"population":1510,"demandHappiness":1510,"supplies_24h":2440,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"ModernEra":{"population":1770,"demandHappiness":1770,"supplies_24h":2840,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"PostModernEra":{"population":2040,"demandHappiness":2040,"supplies_24h":3240,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"ContemporaryEra":{"population":2330,"demandHappiness":2330,"supplies_24h":3640,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"TomorrowEra":{"population":2620,"demandHappiness":2620,"supplies_24h":4080,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"FutureEra":{"population":2930,"demandHappiness":2930,"supplies_24h":4480,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"ArcticFuture":{"population":3260,"demandHappiness":3260,"supplies_24h":4920,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"OceanicFuture":{"population":3590,"demandHappiness":3590,"supplies_24h":5390,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"VirtualFuture":{"population":3930,"demandHappiness":3930,"supplies_24h":5830,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"SpaceAgeMars":{"population":6220,"demandHappiness":6220,"supplies_24h":9430,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"SpaceAgeAsteroidBelt":{"population":6750,"demandHappiness":6750,"supplies_24h":10120,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"SpaceAgeVenus":{"population":7300,"demandHappiness":7300,"supplies_24h":10850,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"SpaceAgeJupiterMoon":{"population":7860,"demandHappiness":7860,"supplies_24h":11540,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"SpaceAgeTitan":{"population":8430,"demandHappiness":8430,"supplies_24h":12270,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50},"SpaceAgeSpaceHub":{"population":9000,"demandHappiness":9000,"supplies_24h":13000,"strategy_points_24h":40,"random_good_of_age_24h":60,"random_good_of_previous_age_24h":50}}, boosts: [{"type":"att_boost_attacker","value":17,"feature":"battleground"},{"type":"att_boost_defender","value":1,"feature":"battleground"}] },
+    "W_MultiAge_PAT26A2": { prod: {"BronzeAge":{"population":180,"demandHappiness":180,"supplies_24h":210,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"IronAge":{"population":390,"demandHappiness":390,"supplies_24h":500,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"EarlyMiddleAge":{"population":590,"demandHappiness":590,"supplies_24h":840,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"HighMiddleAge":{"population":830,"demandHappiness":830,"supplies_24h":1180,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"LateMiddleAge":{"population":1100,"demandHappiness":1100,"supplies_24h":1550,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"ColonialAge":{"population":1380,"demandHappiness":1380,"supplies_24h":1970,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"IndustrialAge":{"population":1690,"demandHappiness":1690,"supplies_24h":2390,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"ProgressiveEra":{"population":2020,"demandHappiness":2020,"supplies_24h":2820,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"ModernEra":{"population":2360,"demandHappiness":2360,"supplies_24h":3280,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"PostModernEra":{"population":2720,"demandHappiness":2720,"supplies_24h":3740,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"ContemporaryEra":{"population":3110,"demandHappiness":3110,"supplies_24h":4200,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"TomorrowEra":{"population":3500,"demandHappiness":3500,"supplies_24h":4710,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"FutureEra":{"population":3910,"demandHappiness":3910,"supplies_24h":5170,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"ArcticFuture":{"population":4340,"demandHappiness":4340,"supplies_24h":5670,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"OceanicFuture":{"population":4780,"demandHappiness":4780,"supplies_24h":6220,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"VirtualFuture":{"population":5240,"demandHappiness":5240,"supplies_24h":6720,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"SpaceAgeMars":{"population":8290,"demandHappiness":8290,"supplies_24h":10880,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"SpaceAgeAsteroidBelt":{"population":9000,"demandHappiness":9000,"supplies_24h":11680,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"SpaceAgeVenus":{"population":9730,"demandHappiness":9730,"supplies_24h":12520,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"SpaceAgeJupiterMoon":{"population":10480,"demandHappiness":10480,"supplies_24h":13320,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"SpaceAgeTitan":{"population":11240,"demandHappiness":11240,"supplies_24h":14160,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70},"SpaceAgeSpaceHub":{"population":12000,"demandHappiness":12000,"supplies_24h":15000,"strategy_points_24h":60,"random_good_of_age_24h":80,"random_good_of_previous_age_24h":70}}, boosts: [{"type":"att_boost_attacker","value":37,"feature":"battleground"},{"type":"att_boost_defender","value":26,"feature":"battleground"}] },
+    "W_MultiAge_PAT26A3": { prod: {"BronzeAge":{"population":230,"demandHappiness":230,"supplies_24h":240,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"IronAge":{"population":480,"demandHappiness":480,"supplies_24h":570,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"EarlyMiddleAge":{"population":740,"demandHappiness":740,"supplies_24h":950,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"HighMiddleAge":{"population":1040,"demandHappiness":1040,"supplies_24h":1330,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"LateMiddleAge":{"population":1370,"demandHappiness":1370,"supplies_24h":1760,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"ColonialAge":{"population":1730,"demandHappiness":1730,"supplies_24h":2240,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"IndustrialAge":{"population":2110,"demandHappiness":2110,"supplies_24h":2710,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"ProgressiveEra":{"population":2520,"demandHappiness":2520,"supplies_24h":3190,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"ModernEra":{"population":2950,"demandHappiness":2950,"supplies_24h":3710,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"PostModernEra":{"population":3410,"demandHappiness":3410,"supplies_24h":4240,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"ContemporaryEra":{"population":3880,"demandHappiness":3880,"supplies_24h":4760,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"TomorrowEra":{"population":4370,"demandHappiness":4370,"supplies_24h":5330,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"FutureEra":{"population":4890,"demandHappiness":4890,"supplies_24h":5860,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"ArcticFuture":{"population":5430,"demandHappiness":5430,"supplies_24h":6430,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"OceanicFuture":{"population":5980,"demandHappiness":5980,"supplies_24h":7050,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"VirtualFuture":{"population":6540,"demandHappiness":6540,"supplies_24h":7620,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"SpaceAgeMars":{"population":10360,"demandHappiness":10360,"supplies_24h":12330,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"SpaceAgeAsteroidBelt":{"population":11250,"demandHappiness":11250,"supplies_24h":13240,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"SpaceAgeVenus":{"population":12160,"demandHappiness":12160,"supplies_24h":14190,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"SpaceAgeJupiterMoon":{"population":13100,"demandHappiness":13100,"supplies_24h":15100,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"SpaceAgeTitan":{"population":14050,"demandHappiness":14050,"supplies_24h":16050,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90},"SpaceAgeSpaceHub":{"population":15000,"demandHappiness":15000,"supplies_24h":17000,"strategy_points_24h":80,"random_good_of_age_24h":100,"random_good_of_previous_age_24h":90}}, boosts: [{"type":"att_boost_attacker","value":57,"feature":"battleground"},{"type":"att_boost_defender","value":61,"feature":"battleground"}] },
+    "W_MultiAge_PAT26A4": { prod: {"BronzeAge":{"population":270,"demandHappiness":270,"supplies_24h":270,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"IronAge":{"population":580,"demandHappiness":580,"supplies_24h":640,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"EarlyMiddleAge":{"population":890,"demandHappiness":890,"supplies_24h":1060,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"HighMiddleAge":{"population":1250,"demandHappiness":1250,"supplies_24h":1490,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"LateMiddleAge":{"population":1640,"demandHappiness":1640,"supplies_24h":1970,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"ColonialAge":{"population":2070,"demandHappiness":2070,"supplies_24h":2500,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"IndustrialAge":{"population":2530,"demandHappiness":2530,"supplies_24h":3030,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"ProgressiveEra":{"population":3030,"demandHappiness":3030,"supplies_24h":3570,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"ModernEra":{"population":3550,"demandHappiness":3550,"supplies_24h":4150,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"PostModernEra":{"population":4090,"demandHappiness":4090,"supplies_24h":4740,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"ContemporaryEra":{"population":4660,"demandHappiness":4660,"supplies_24h":5320,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"TomorrowEra":{"population":5250,"demandHappiness":5250,"supplies_24h":5960,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"FutureEra":{"population":5870,"demandHappiness":5870,"supplies_24h":6550,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"ArcticFuture":{"population":6510,"demandHappiness":6510,"supplies_24h":7180,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"OceanicFuture":{"population":7170,"demandHappiness":7170,"supplies_24h":7880,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"VirtualFuture":{"population":7850,"demandHappiness":7850,"supplies_24h":8520,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"SpaceAgeMars":{"population":12430,"demandHappiness":12430,"supplies_24h":13780,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"SpaceAgeAsteroidBelt":{"population":13500,"demandHappiness":13500,"supplies_24h":14800,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"SpaceAgeVenus":{"population":14590,"demandHappiness":14590,"supplies_24h":15860,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"SpaceAgeJupiterMoon":{"population":15720,"demandHappiness":15720,"supplies_24h":16870,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"SpaceAgeTitan":{"population":16860,"demandHappiness":16860,"supplies_24h":17940,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110},"SpaceAgeSpaceHub":{"population":18000,"demandHappiness":18000,"supplies_24h":19000,"strategy_points_24h":100,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":110}}, boosts: [{"type":"att_boost_attacker","value":77,"feature":"battleground"},{"type":"att_boost_defender","value":96,"feature":"battleground"}] },
+    "W_MultiAge_PAT26A5": { prod: {"BronzeAge":{"population":320,"demandHappiness":320,"supplies_24h":290,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"IronAge":{"population":680,"demandHappiness":680,"supplies_24h":710,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"EarlyMiddleAge":{"population":1040,"demandHappiness":1040,"supplies_24h":1180,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"HighMiddleAge":{"population":1460,"demandHappiness":1460,"supplies_24h":1650,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"LateMiddleAge":{"population":1920,"demandHappiness":1920,"supplies_24h":2180,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"ColonialAge":{"population":2420,"demandHappiness":2420,"supplies_24h":2760,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"IndustrialAge":{"population":2960,"demandHappiness":2960,"supplies_24h":3350,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"ProgressiveEra":{"population":3530,"demandHappiness":3530,"supplies_24h":3940,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"ModernEra":{"population":4140,"demandHappiness":4140,"supplies_24h":4590,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"PostModernEra":{"population":4770,"demandHappiness":4770,"supplies_24h":5240,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"ContemporaryEra":{"population":5430,"demandHappiness":5430,"supplies_24h":5880,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"TomorrowEra":{"population":6120,"demandHappiness":6120,"supplies_24h":6590,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"FutureEra":{"population":6850,"demandHappiness":6850,"supplies_24h":7240,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"ArcticFuture":{"population":7600,"demandHappiness":7600,"supplies_24h":7940,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"OceanicFuture":{"population":8370,"demandHappiness":8370,"supplies_24h":8710,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"VirtualFuture":{"population":9160,"demandHappiness":9160,"supplies_24h":9410,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"SpaceAgeMars":{"population":14500,"demandHappiness":14500,"supplies_24h":15240,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"SpaceAgeAsteroidBelt":{"population":15750,"demandHappiness":15750,"supplies_24h":16350,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"SpaceAgeVenus":{"population":17030,"demandHappiness":17030,"supplies_24h":17530,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"SpaceAgeJupiterMoon":{"population":18340,"demandHappiness":18340,"supplies_24h":18650,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"SpaceAgeTitan":{"population":19670,"demandHappiness":19670,"supplies_24h":19820,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130},"SpaceAgeSpaceHub":{"population":21000,"demandHappiness":21000,"supplies_24h":21000,"strategy_points_24h":120,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":130}}, boosts: [{"type":"att_boost_attacker","value":97,"feature":"battleground"},{"type":"att_boost_defender","value":131,"feature":"battleground"}] },
+    "W_MultiAge_PAT26A6": { prod: {"BronzeAge":{"population":360,"demandHappiness":360,"supplies_24h":320,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"IronAge":{"population":770,"demandHappiness":770,"supplies_24h":770,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"EarlyMiddleAge":{"population":1190,"demandHappiness":1190,"supplies_24h":1290,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"HighMiddleAge":{"population":1670,"demandHappiness":1670,"supplies_24h":1800,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"LateMiddleAge":{"population":2190,"demandHappiness":2190,"supplies_24h":2380,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"ColonialAge":{"population":2760,"demandHappiness":2760,"supplies_24h":3030,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"IndustrialAge":{"population":3380,"demandHappiness":3380,"supplies_24h":3670,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"ProgressiveEra":{"population":4030,"demandHappiness":4030,"supplies_24h":4320,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"ModernEra":{"population":4730,"demandHappiness":4730,"supplies_24h":5030,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"PostModernEra":{"population":5450,"demandHappiness":5450,"supplies_24h":5730,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"ContemporaryEra":{"population":6210,"demandHappiness":6210,"supplies_24h":6440,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"TomorrowEra":{"population":7000,"demandHappiness":7000,"supplies_24h":7220,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"FutureEra":{"population":7830,"demandHappiness":7830,"supplies_24h":7920,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"ArcticFuture":{"population":8680,"demandHappiness":8680,"supplies_24h":8700,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"OceanicFuture":{"population":9560,"demandHappiness":9560,"supplies_24h":9540,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"VirtualFuture":{"population":10470,"demandHappiness":10470,"supplies_24h":10310,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"SpaceAgeMars":{"population":16570,"demandHappiness":16570,"supplies_24h":16690,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"SpaceAgeAsteroidBelt":{"population":18000,"demandHappiness":18000,"supplies_24h":17910,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"SpaceAgeVenus":{"population":19460,"demandHappiness":19460,"supplies_24h":19200,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"SpaceAgeJupiterMoon":{"population":20950,"demandHappiness":20950,"supplies_24h":20420,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"SpaceAgeTitan":{"population":22480,"demandHappiness":22480,"supplies_24h":21710,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150},"SpaceAgeSpaceHub":{"population":24000,"demandHappiness":24000,"supplies_24h":23000,"strategy_points_24h":140,"random_good_of_age_24h":160,"random_good_of_previous_age_24h":150}}, boosts: [{"type":"att_boost_attacker","value":117,"feature":"battleground"},{"type":"att_boost_defender","value":166,"feature":"battleground"}] },
+    "W_MultiAge_PAT26A7": { prod: {"BronzeAge":{"population":410,"demandHappiness":410,"supplies_24h":350,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"IronAge":{"population":870,"demandHappiness":870,"supplies_24h":840,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"EarlyMiddleAge":{"population":1340,"demandHappiness":1340,"supplies_24h":1400,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"HighMiddleAge":{"population":1880,"demandHappiness":1880,"supplies_24h":1960,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"LateMiddleAge":{"population":2460,"demandHappiness":2460,"supplies_24h":2590,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"ColonialAge":{"population":3110,"demandHappiness":3110,"supplies_24h":3290,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"IndustrialAge":{"population":3800,"demandHappiness":3800,"supplies_24h":3990,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"ProgressiveEra":{"population":4540,"demandHappiness":4540,"supplies_24h":4690,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"ModernEra":{"population":5320,"demandHappiness":5320,"supplies_24h":5460,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"PostModernEra":{"population":6130,"demandHappiness":6130,"supplies_24h":6230,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"ContemporaryEra":{"population":6990,"demandHappiness":6990,"supplies_24h":7000,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"TomorrowEra":{"population":7870,"demandHappiness":7870,"supplies_24h":7840,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"FutureEra":{"population":8800,"demandHappiness":8800,"supplies_24h":8610,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"ArcticFuture":{"population":9770,"demandHappiness":9770,"supplies_24h":9450,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"OceanicFuture":{"population":10760,"demandHappiness":10760,"supplies_24h":10360,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"VirtualFuture":{"population":11780,"demandHappiness":11780,"supplies_24h":11200,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"SpaceAgeMars":{"population":18650,"demandHappiness":18650,"supplies_24h":18140,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"SpaceAgeAsteroidBelt":{"population":20250,"demandHappiness":20250,"supplies_24h":19470,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"SpaceAgeVenus":{"population":21890,"demandHappiness":21890,"supplies_24h":20870,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"SpaceAgeJupiterMoon":{"population":23570,"demandHappiness":23570,"supplies_24h":22200,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"SpaceAgeTitan":{"population":25290,"demandHappiness":25290,"supplies_24h":23600,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170},"SpaceAgeSpaceHub":{"population":27000,"demandHappiness":27000,"supplies_24h":25000,"strategy_points_24h":160,"random_good_of_age_24h":180,"random_good_of_previous_age_24h":170}}, boosts: [{"type":"att_boost_attacker","value":137,"feature":"battleground"},{"type":"att_boost_defender","value":201,"feature":"battleground"}] },
+    "W_MultiAge_PAT26A8": { prod: {"BronzeAge":{"population":450,"demandHappiness":450,"supplies_24h":3920,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"IronAge":{"population":970,"demandHappiness":970,"supplies_24h":9410,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"EarlyMiddleAge":{"population":1490,"demandHappiness":1490,"supplies_24h":15690,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"HighMiddleAge":{"population":2090,"demandHappiness":2090,"supplies_24h":21960,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"LateMiddleAge":{"population":2740,"demandHappiness":2740,"supplies_24h":29020,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"ColonialAge":{"population":3460,"demandHappiness":3460,"supplies_24h":36860,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"IndustrialAge":{"population":4220,"demandHappiness":4220,"supplies_24h":44710,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"ProgressiveEra":{"population":5040,"demandHappiness":5040,"supplies_24h":52550,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"ModernEra":{"population":5910,"demandHappiness":5910,"supplies_24h":61180,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"PostModernEra":{"population":6810,"demandHappiness":6810,"supplies_24h":69800,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"ContemporaryEra":{"population":7760,"demandHappiness":7760,"supplies_24h":78430,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"TomorrowEra":{"population":8750,"demandHappiness":8750,"supplies_24h":87840,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"FutureEra":{"population":9780,"demandHappiness":9780,"supplies_24h":96470,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"ArcticFuture":{"population":10850,"demandHappiness":10850,"supplies_24h":105880,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"OceanicFuture":{"population":11950,"demandHappiness":11950,"supplies_24h":116080,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"VirtualFuture":{"population":13090,"demandHappiness":13090,"supplies_24h":125490,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"SpaceAgeMars":{"population":20720,"demandHappiness":20720,"supplies_24h":203140,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"SpaceAgeAsteroidBelt":{"population":22500,"demandHappiness":22500,"supplies_24h":218040,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"SpaceAgeVenus":{"population":24320,"demandHappiness":24320,"supplies_24h":233730,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"SpaceAgeJupiterMoon":{"population":26190,"demandHappiness":26190,"supplies_24h":248630,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"SpaceAgeTitan":{"population":28100,"demandHappiness":28100,"supplies_24h":264310,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190},"SpaceAgeSpaceHub":{"population":30000,"demandHappiness":30000,"supplies_24h":280000,"strategy_points_24h":180,"random_good_of_age_24h":200,"random_good_of_previous_age_24h":190}}, boosts: [{"type":"att_boost_attacker","value":157,"feature":"battleground"},{"type":"att_boost_defender","value":236,"feature":"battleground"}] },
+    "W_MultiAge_PAT25E1": { prod: {"AllAge":{"strategy_points_24h":40},"BronzeAge":{"happiness":1770},"IronAge":{"happiness":3040},"EarlyMiddleAge":{"happiness":3360},"HighMiddleAge":{"happiness":3750},"LateMiddleAge":{"happiness":4190},"ColonialAge":{"happiness":4920},"IndustrialAge":{"happiness":5550},"ProgressiveEra":{"happiness":6090},"ModernEra":{"happiness":6520},"PostModernEra":{"happiness":6790},"ContemporaryEra":{"happiness":7890},"TomorrowEra":{"happiness":9580},"FutureEra":{"happiness":11480},"ArcticFuture":{"happiness":13370},"OceanicFuture":{"happiness":15430},"VirtualFuture":{"happiness":18430},"SpaceAgeMars":{"happiness":29490},"SpaceAgeAsteroidBelt":{"happiness":32050},"SpaceAgeVenus":{"happiness":34620},"SpaceAgeJupiterMoon":{"happiness":37300},"SpaceAgeTitan":{"happiness":40000},"SpaceAgeSpaceHub":{"happiness":42700}}, boosts: [{"type":"att_def_boost_attacker_defender","value":5,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":14,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":11,"feature":"guild_expedition"}] },
+    "W_MultiAge_PAT25E2": { prod: {"AllAge":{"strategy_points_24h":80},"BronzeAge":{"happiness":3530},"IronAge":{"happiness":6080},"EarlyMiddleAge":{"happiness":6730},"HighMiddleAge":{"happiness":7510},"LateMiddleAge":{"happiness":8370},"ColonialAge":{"happiness":9840},"IndustrialAge":{"happiness":11100},"ProgressiveEra":{"happiness":12190},"ModernEra":{"happiness":13040},"PostModernEra":{"happiness":13590},"ContemporaryEra":{"happiness":15790},"TomorrowEra":{"happiness":19160},"FutureEra":{"happiness":22960},"ArcticFuture":{"happiness":26740},"OceanicFuture":{"happiness":30860},"VirtualFuture":{"happiness":36860},"SpaceAgeMars":{"happiness":58980},"SpaceAgeAsteroidBelt":{"happiness":64100},"SpaceAgeVenus":{"happiness":69250},"SpaceAgeJupiterMoon":{"happiness":74600},"SpaceAgeTitan":{"happiness":80000},"SpaceAgeSpaceHub":{"happiness":85400}}, boosts: [{"type":"att_def_boost_attacker_defender","value":11,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":28,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":22,"feature":"guild_expedition"},{"type":"guild_raids_coins_start","value":20000,"feature":"all"},{"type":"guild_raids_supplies_start","value":20000,"feature":"all"}] },
+    "W_MultiAge_PAT26D1": { prod: {"BronzeAge":{"strategy_points_24h":114},"IronAge":{"strategy_points_24h":114},"EarlyMiddleAge":{"strategy_points_24h":114},"HighMiddleAge":{"strategy_points_24h":114},"LateMiddleAge":{"strategy_points_24h":114},"ColonialAge":{"strategy_points_24h":114},"IndustrialAge":{"strategy_points_24h":114},"ProgressiveEra":{"strategy_points_24h":114},"ModernEra":{"strategy_points_24h":114},"PostModernEra":{"strategy_points_24h":114},"ContemporaryEra":{"strategy_points_24h":114},"TomorrowEra":{"strategy_points_24h":114},"FutureEra":{"strategy_points_24h":114},"ArcticFuture":{"strategy_points_24h":114},"OceanicFuture":{"strategy_points_24h":114},"VirtualFuture":{"strategy_points_24h":114},"SpaceAgeMars":{"strategy_points_24h":114},"SpaceAgeAsteroidBelt":{"strategy_points_24h":114},"SpaceAgeVenus":{"strategy_points_24h":114},"SpaceAgeJupiterMoon":{"strategy_points_24h":114},"SpaceAgeTitan":{"strategy_points_24h":114},"SpaceAgeSpaceHub":{"strategy_points_24h":114}}, boosts: [{"type":"att_boost_attacker","value":33,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":30,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":20,"feature":"guild_raids"}] },
+    "W_MultiAge_PAT26E1": { prod: {"BronzeAge":{"population":-680,"strategy_points_24h":75},"IronAge":{"population":-1450,"strategy_points_24h":75},"EarlyMiddleAge":{"population":-2230,"strategy_points_24h":75},"HighMiddleAge":{"population":-3130,"strategy_points_24h":75},"LateMiddleAge":{"population":-4110,"strategy_points_24h":75},"ColonialAge":{"population":-5180,"strategy_points_24h":75},"IndustrialAge":{"population":-6340,"strategy_points_24h":75},"ProgressiveEra":{"population":-7560,"strategy_points_24h":75},"ModernEra":{"population":-8860,"strategy_points_24h":75},"PostModernEra":{"population":-10220,"strategy_points_24h":75},"ContemporaryEra":{"population":-11640,"strategy_points_24h":75},"TomorrowEra":{"population":-13120,"strategy_points_24h":75},"FutureEra":{"population":-14670,"strategy_points_24h":75},"ArcticFuture":{"population":-16280,"strategy_points_24h":75},"OceanicFuture":{"population":-17930,"strategy_points_24h":75},"VirtualFuture":{"population":-19630,"strategy_points_24h":75},"SpaceAgeMars":{"population":-31080,"strategy_points_24h":75},"SpaceAgeAsteroidBelt":{"population":-33760,"strategy_points_24h":75},"SpaceAgeVenus":{"population":-36490,"strategy_points_24h":75},"SpaceAgeJupiterMoon":{"population":-39290,"strategy_points_24h":75},"SpaceAgeTitan":{"population":-42150,"strategy_points_24h":75},"SpaceAgeSpaceHub":{"population":-45000,"strategy_points_24h":75}}, boosts: [{"type":"att_def_boost_attacker_defender","value":19,"feature":"all"}] },
+    "W_MultiAge_PAT26E2": { prod: {"BronzeAge":{"population":-680,"strategy_points_24h":105},"IronAge":{"population":-1450,"strategy_points_24h":105},"EarlyMiddleAge":{"population":-2230,"strategy_points_24h":105},"HighMiddleAge":{"population":-3130,"strategy_points_24h":105},"LateMiddleAge":{"population":-4110,"strategy_points_24h":105},"ColonialAge":{"population":-5180,"strategy_points_24h":105},"IndustrialAge":{"population":-6340,"strategy_points_24h":105},"ProgressiveEra":{"population":-7560,"strategy_points_24h":105},"ModernEra":{"population":-8860,"strategy_points_24h":105},"PostModernEra":{"population":-10220,"strategy_points_24h":105},"ContemporaryEra":{"population":-11640,"strategy_points_24h":105},"TomorrowEra":{"population":-13120,"strategy_points_24h":105},"FutureEra":{"population":-14670,"strategy_points_24h":105},"ArcticFuture":{"population":-16280,"strategy_points_24h":105},"OceanicFuture":{"population":-17930,"strategy_points_24h":105},"VirtualFuture":{"population":-19630,"strategy_points_24h":105},"SpaceAgeMars":{"population":-31080,"strategy_points_24h":105},"SpaceAgeAsteroidBelt":{"population":-33760,"strategy_points_24h":105},"SpaceAgeVenus":{"population":-36490,"strategy_points_24h":105},"SpaceAgeJupiterMoon":{"population":-39290,"strategy_points_24h":105},"SpaceAgeTitan":{"population":-42150,"strategy_points_24h":105},"SpaceAgeSpaceHub":{"population":-45000,"strategy_points_24h":105}}, boosts: [{"type":"def_boost_attacker","value":18,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":32,"feature":"all"}] },
+    "W_MultiAge_PAT25A11": { prod: {"BronzeAge":{"population":530,"happiness":2910,"demandHappiness":530,"money_24h":3470,"strategy_points_24h":132.0},"IronAge":{"population":1140,"happiness":5020,"demandHappiness":1140,"money_24h":8320,"strategy_points_24h":132.0},"EarlyMiddleAge":{"population":1750,"happiness":5550,"demandHappiness":1750,"money_24h":13870,"strategy_points_24h":132.0},"HighMiddleAge":{"population":2450,"happiness":6190,"demandHappiness":2450,"money_24h":19410,"strategy_points_24h":132.0},"LateMiddleAge":{"population":3220,"happiness":6910,"demandHappiness":3220,"money_24h":25650,"strategy_points_24h":132.0},"ColonialAge":{"population":4060,"happiness":8120,"demandHappiness":4060,"money_24h":39070,"strategy_points_24h":132.0},"IndustrialAge":{"population":4960,"happiness":9160,"demandHappiness":4960,"money_24h":48670,"strategy_points_24h":132.0},"ProgressiveEra":{"population":5920,"happiness":10060,"demandHappiness":5920,"money_24h":59070,"strategy_points_24h":132.0},"ModernEra":{"population":6940,"happiness":10760,"demandHappiness":6940,"money_24h":73490,"strategy_points_24h":132.0},"PostModernEra":{"population":8000,"happiness":11210,"demandHappiness":8000,"money_24h":92450,"strategy_points_24h":132.0},"ContemporaryEra":{"population":9120,"happiness":13030,"demandHappiness":9120,"money_24h":120350,"strategy_points_24h":132.0},"TomorrowEra":{"population":10270,"happiness":15810,"demandHappiness":10270,"money_24h":139350,"strategy_points_24h":132.0},"FutureEra":{"population":11490,"happiness":18940,"demandHappiness":11490,"money_24h":159730,"strategy_points_24h":132.0},"ArcticFuture":{"population":12750,"happiness":22060,"demandHappiness":12750,"money_24h":181500,"strategy_points_24h":132.0},"OceanicFuture":{"population":14040,"happiness":25460,"demandHappiness":14040,"money_24h":204660,"strategy_points_24h":132.0},"VirtualFuture":{"population":15370,"happiness":30410,"demandHappiness":15370,"money_24h":229230,"strategy_points_24h":132.0},"SpaceAgeMars":{"population":24330,"happiness":48660,"demandHappiness":24330,"money_24h":382900,"strategy_points_24h":132.0},"SpaceAgeAsteroidBelt":{"population":26430,"happiness":52880,"demandHappiness":26430,"money_24h":424110,"strategy_points_24h":132.0},"SpaceAgeVenus":{"population":28570,"happiness":57130,"demandHappiness":28570,"money_24h":467510,"strategy_points_24h":132.0},"SpaceAgeJupiterMoon":{"population":30760,"happiness":61540,"demandHappiness":30760,"money_24h":513130,"strategy_points_24h":132.0},"SpaceAgeTitan":{"population":33000,"happiness":66000,"demandHappiness":33000,"money_24h":561000,"strategy_points_24h":132.0},"SpaceAgeSpaceHub":{"population":35240,"happiness":70460,"demandHappiness":35240,"money_24h":608870,"strategy_points_24h":132.0}}, boosts: [{"type":"def_boost_attacker","value":69,"feature":"all"},{"type":"att_def_boost_attacker","value":22,"feature":"battleground"},{"type":"att_def_boost_defender","value":46,"feature":"all"}] },
+    "W_MultiAge_PAT26A9": { prod: {"BronzeAge":{"population":600,"demandHappiness":600,"supplies_24h":5320,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"IronAge":{"population":1290,"demandHappiness":1290,"supplies_24h":12770,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"EarlyMiddleAge":{"population":1980,"demandHappiness":1980,"supplies_24h":21290,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"HighMiddleAge":{"population":2780,"demandHappiness":2780,"supplies_24h":29800,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"LateMiddleAge":{"population":3650,"demandHappiness":3650,"supplies_24h":39380,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"ColonialAge":{"population":4610,"demandHappiness":4610,"supplies_24h":50030,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"IndustrialAge":{"population":5630,"demandHappiness":5630,"supplies_24h":60670,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"ProgressiveEra":{"population":6720,"demandHappiness":6720,"supplies_24h":71320,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"ModernEra":{"population":7880,"demandHappiness":7880,"supplies_24h":83030,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"PostModernEra":{"population":9080,"demandHappiness":9080,"supplies_24h":94730,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"ContemporaryEra":{"population":10350,"demandHappiness":10350,"supplies_24h":106440,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"TomorrowEra":{"population":11660,"demandHappiness":11660,"supplies_24h":119220,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"FutureEra":{"population":13040,"demandHappiness":13040,"supplies_24h":130920,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"ArcticFuture":{"population":14470,"demandHappiness":14470,"supplies_24h":143700,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"OceanicFuture":{"population":15940,"demandHappiness":15940,"supplies_24h":157540,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"VirtualFuture":{"population":17450,"demandHappiness":17450,"supplies_24h":170310,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"SpaceAgeMars":{"population":27620,"demandHappiness":27620,"supplies_24h":275690,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"SpaceAgeAsteroidBelt":{"population":30010,"demandHappiness":30010,"supplies_24h":295910,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"SpaceAgeVenus":{"population":32430,"demandHappiness":32430,"supplies_24h":317200,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"SpaceAgeJupiterMoon":{"population":34920,"demandHappiness":34920,"supplies_24h":337420,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"SpaceAgeTitan":{"population":37460,"demandHappiness":37460,"supplies_24h":358710,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210},"SpaceAgeSpaceHub":{"population":40000,"demandHappiness":40000,"supplies_24h":380000,"strategy_points_24h":200,"random_good_of_age_24h":240,"random_good_of_previous_age_24h":210}}, boosts: [{"type":"att_boost_attacker","value":177,"feature":"battleground"},{"type":"att_boost_defender","value":271,"feature":"battleground"}] },
+    "W_MultiAge_PAT22A12": { prod: {"BronzeAge":{"population":780,"happiness":3230,"demandHappiness":780,"money_24h":2510,"strategy_points_24h":75,"all_goods_of_age_24h":135},"IronAge":{"population":1680,"happiness":5560,"demandHappiness":1680,"money_24h":6020,"strategy_points_24h":75,"all_goods_of_age_24h":135},"EarlyMiddleAge":{"population":2580,"happiness":6150,"demandHappiness":2580,"money_24h":10040,"strategy_points_24h":75,"all_goods_of_age_24h":135},"HighMiddleAge":{"population":3620,"happiness":6860,"demandHappiness":3620,"money_24h":14060,"strategy_points_24h":75,"all_goods_of_age_24h":135},"LateMiddleAge":{"population":4750,"happiness":7650,"demandHappiness":4750,"money_24h":18580,"strategy_points_24h":75,"all_goods_of_age_24h":135},"ColonialAge":{"population":6000,"happiness":9000,"demandHappiness":6000,"money_24h":28290,"strategy_points_24h":75,"all_goods_of_age_24h":135},"IndustrialAge":{"population":7330,"happiness":10150,"demandHappiness":7330,"money_24h":35240,"strategy_points_24h":75,"all_goods_of_age_24h":135},"ProgressiveEra":{"population":8750,"happiness":11140,"demandHappiness":8750,"money_24h":42770,"strategy_points_24h":75,"all_goods_of_age_24h":135},"ModernEra":{"population":10250,"happiness":11920,"demandHappiness":10250,"money_24h":53220,"strategy_points_24h":75,"all_goods_of_age_24h":135},"PostModernEra":{"population":11820,"happiness":12420,"demandHappiness":11820,"money_24h":66950,"strategy_points_24h":75,"all_goods_of_age_24h":135},"ContemporaryEra":{"population":13470,"happiness":14430,"demandHappiness":13470,"money_24h":87150,"strategy_points_24h":75,"all_goods_of_age_24h":135},"TomorrowEra":{"population":15180,"happiness":17520,"demandHappiness":15180,"money_24h":100910,"strategy_points_24h":75,"all_goods_of_age_24h":135},"FutureEra":{"population":16970,"happiness":20990,"demandHappiness":16970,"money_24h":115670,"strategy_points_24h":75,"all_goods_of_age_24h":135},"ArcticFuture":{"population":18830,"happiness":24440,"demandHappiness":18830,"money_24h":131430,"strategy_points_24h":75,"all_goods_of_age_24h":135},"OceanicFuture":{"population":20740,"happiness":28200,"demandHappiness":20740,"money_24h":148200,"strategy_points_24h":75,"all_goods_of_age_24h":135},"VirtualFuture":{"population":22710,"happiness":33690,"demandHappiness":22710,"money_24h":166000,"strategy_points_24h":75,"all_goods_of_age_24h":135},"SpaceAgeMars":{"population":35950,"happiness":53910,"demandHappiness":35950,"money_24h":277280,"strategy_points_24h":75,"all_goods_of_age_24h":135},"SpaceAgeAsteroidBelt":{"population":39050,"happiness":58590,"demandHappiness":39050,"money_24h":307120,"strategy_points_24h":75,"all_goods_of_age_24h":135},"SpaceAgeVenus":{"population":42200,"happiness":63300,"demandHappiness":42200,"money_24h":338550,"strategy_points_24h":75,"all_goods_of_age_24h":135},"SpaceAgeJupiterMoon":{"population":45450,"happiness":68180,"demandHappiness":45450,"money_24h":371580,"strategy_points_24h":75,"all_goods_of_age_24h":135},"SpaceAgeTitan":{"population":48750,"happiness":73130,"demandHappiness":48750,"money_24h":406250,"strategy_points_24h":75,"all_goods_of_age_24h":135},"SpaceAgeSpaceHub":{"population":52050,"happiness":78070,"demandHappiness":52050,"money_24h":440920,"strategy_points_24h":75,"all_goods_of_age_24h":135}}, boosts: [{"type":"att_boost_attacker","value":20,"feature":"guild_raids"},{"type":"att_def_boost_attacker","value":26,"feature":"all"},{"type":"att_def_boost_attacker","value":51,"feature":"battleground"}] },
+    "W_MultiAge_PAT24A9": { prod: {"BronzeAge":{"population":780,"happiness":3070,"demandHappiness":780,"supplies_24h":3860,"strategy_points_24h":36,"random_good_of_age_24h":100},"IronAge":{"population":1680,"happiness":5290,"demandHappiness":1680,"supplies_24h":9260,"strategy_points_24h":36,"random_good_of_age_24h":100},"EarlyMiddleAge":{"population":2580,"happiness":5850,"demandHappiness":2580,"supplies_24h":15430,"strategy_points_24h":36,"random_good_of_age_24h":100},"HighMiddleAge":{"population":3620,"happiness":6530,"demandHappiness":3620,"supplies_24h":21600,"strategy_points_24h":36,"random_good_of_age_24h":100},"LateMiddleAge":{"population":4750,"happiness":7280,"demandHappiness":4750,"supplies_24h":28550,"strategy_points_24h":36,"random_good_of_age_24h":100},"ColonialAge":{"population":6000,"happiness":8560,"demandHappiness":6000,"supplies_24h":36260,"strategy_points_24h":37,"random_good_of_age_24h":100},"IndustrialAge":{"population":7330,"happiness":9650,"demandHappiness":7330,"supplies_24h":43980,"strategy_points_24h":37,"random_good_of_age_24h":100},"ProgressiveEra":{"population":8750,"happiness":10600,"demandHappiness":8750,"supplies_24h":51690,"strategy_points_24h":37,"random_good_of_age_24h":100},"ModernEra":{"population":10250,"happiness":11340,"demandHappiness":10250,"supplies_24h":60180,"strategy_points_24h":37,"random_good_of_age_24h":100},"PostModernEra":{"population":11820,"happiness":11820,"demandHappiness":11820,"supplies_24h":68660,"strategy_points_24h":37,"random_good_of_age_24h":100},"ContemporaryEra":{"population":13470,"happiness":13730,"demandHappiness":13470,"supplies_24h":77150,"strategy_points_24h":38,"random_good_of_age_24h":100},"TomorrowEra":{"population":15180,"happiness":16670,"demandHappiness":15180,"supplies_24h":86410,"strategy_points_24h":38,"random_good_of_age_24h":100},"FutureEra":{"population":16970,"happiness":19970,"demandHappiness":16970,"supplies_24h":94900,"strategy_points_24h":38,"random_good_of_age_24h":100},"ArcticFuture":{"population":18830,"happiness":23250,"demandHappiness":18830,"supplies_24h":104150,"strategy_points_24h":38,"random_good_of_age_24h":100},"OceanicFuture":{"population":20740,"happiness":26830,"demandHappiness":20740,"supplies_24h":114180,"strategy_points_24h":38,"random_good_of_age_24h":100},"VirtualFuture":{"population":22710,"happiness":32060,"demandHappiness":22710,"supplies_24h":123440,"strategy_points_24h":39,"random_good_of_age_24h":100},"SpaceAgeMars":{"population":35950,"happiness":51290,"demandHappiness":35950,"supplies_24h":199820,"strategy_points_24h":39,"random_good_of_age_24h":100},"SpaceAgeAsteroidBelt":{"population":39050,"happiness":55740,"demandHappiness":39050,"supplies_24h":214480,"strategy_points_24h":39,"random_good_of_age_24h":100},"SpaceAgeVenus":{"population":42200,"happiness":60220,"demandHappiness":42200,"supplies_24h":229910,"strategy_points_24h":39,"random_good_of_age_24h":100},"SpaceAgeJupiterMoon":{"population":45450,"happiness":64870,"demandHappiness":45450,"supplies_24h":244570,"strategy_points_24h":39,"random_good_of_age_24h":100},"SpaceAgeTitan":{"population":48750,"happiness":69570,"demandHappiness":48750,"supplies_24h":260000,"strategy_points_24h":40,"random_good_of_age_24h":100},"SpaceAgeSpaceHub":{"population":52050,"happiness":74270,"demandHappiness":52050,"supplies_24h":275430,"strategy_points_24h":40,"random_good_of_age_24h":100}}, boosts: [{"type":"def_boost_attacker","value":55,"feature":"all"},{"type":"def_boost_attacker","value":20,"feature":"battleground"},{"type":"att_boost_defender","value":15,"feature":"all"},{"type":"att_boost_defender","value":55,"feature":"guild_expedition"},{"type":"def_boost_defender","value":25,"feature":"all"},{"type":"def_boost_defender","value":100,"feature":"guild_expedition"},{"type":"coin_production","value":65,"feature":"all"},{"type":"supply_production","value":65,"feature":"all"}] },
+    "W_MultiAge_PAT26B1": { prod: {"BronzeAge":{"population":-450,"money_24h":680,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"IronAge":{"population":-970,"money_24h":1640,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"EarlyMiddleAge":{"population":-1490,"money_24h":2730,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"HighMiddleAge":{"population":-2090,"money_24h":3830,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"LateMiddleAge":{"population":-2740,"money_24h":5060,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"ColonialAge":{"population":-3460,"money_24h":7700,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"IndustrialAge":{"population":-4220,"money_24h":9590,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"ProgressiveEra":{"population":-5040,"money_24h":11640,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"ModernEra":{"population":-5910,"money_24h":14480,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"PostModernEra":{"population":-6810,"money_24h":18220,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"ContemporaryEra":{"population":-7760,"money_24h":23720,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"TomorrowEra":{"population":-8750,"money_24h":27460,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"FutureEra":{"population":-9780,"money_24h":31480,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"ArcticFuture":{"population":-10850,"money_24h":35770,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"OceanicFuture":{"population":-11950,"money_24h":40330,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"VirtualFuture":{"population":-13090,"money_24h":45180,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"SpaceAgeMars":{"population":-20720,"money_24h":75460,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"SpaceAgeAsteroidBelt":{"population":-22500,"money_24h":83590,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"SpaceAgeVenus":{"population":-24320,"money_24h":92140,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"SpaceAgeJupiterMoon":{"population":-26190,"money_24h":101130,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"SpaceAgeTitan":{"population":-28100,"money_24h":110570,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40},"SpaceAgeSpaceHub":{"population":-30000,"money_24h":120000,"random_good_of_age_24h":50,"all_goods_of_next_age_24h":40}}, boosts: [{"type":"att_def_boost_attacker","value":8,"feature":"battleground"},{"type":"att_def_boost_attacker","value":12,"feature":"guild_expedition"}] },
+    "W_MultiAge_PAT26C1": { prod: {"BronzeAge":{"population":-300,"money_24h":470,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"IronAge":{"population":-650,"money_24h":1130,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"EarlyMiddleAge":{"population":-990,"money_24h":1890,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"HighMiddleAge":{"population":-1390,"money_24h":2650,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"LateMiddleAge":{"population":-1830,"money_24h":3500,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"ColonialAge":{"population":-2300,"money_24h":5330,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"IndustrialAge":{"population":-2820,"money_24h":6630,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"ProgressiveEra":{"population":-3360,"money_24h":8050,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"ModernEra":{"population":-3940,"money_24h":10020,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"PostModernEra":{"population":-4540,"money_24h":12600,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"ContemporaryEra":{"population":-5180,"money_24h":16410,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"TomorrowEra":{"population":-5830,"money_24h":19000,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"FutureEra":{"population":-6520,"money_24h":21770,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"ArcticFuture":{"population":-7230,"money_24h":24740,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"OceanicFuture":{"population":-7970,"money_24h":27900,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"VirtualFuture":{"population":-8730,"money_24h":31250,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"SpaceAgeMars":{"population":-13810,"money_24h":52200,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"SpaceAgeAsteroidBelt":{"population":-15000,"money_24h":57810,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"SpaceAgeVenus":{"population":-16220,"money_24h":63730,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"SpaceAgeJupiterMoon":{"population":-17460,"money_24h":69950,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"SpaceAgeTitan":{"population":-18730,"money_24h":76470,"strategy_points_24h":40,"random_good_of_previous_age_24h":40},"SpaceAgeSpaceHub":{"population":-20000,"money_24h":83000,"strategy_points_24h":40,"random_good_of_previous_age_24h":40}}, boosts: [{"type":"att_boost_attacker","value":4,"feature":"all"},{"type":"def_boost_attacker","value":18,"feature":"battleground"}] },
+    "W_MultiAge_PAT24D1": { prod: {"BronzeAge":{"population":-60,"random_good_of_age_24h":15,"strategy_points_24h":6},"IronAge":{"population":-120,"random_good_of_age_24h":15,"strategy_points_24h":6},"EarlyMiddleAge":{"population":-190,"random_good_of_age_24h":15,"strategy_points_24h":6},"HighMiddleAge":{"population":-260,"random_good_of_age_24h":15,"strategy_points_24h":6},"LateMiddleAge":{"population":-340,"random_good_of_age_24h":16,"strategy_points_24h":6},"ColonialAge":{"population":-430,"random_good_of_age_24h":16,"strategy_points_24h":6},"IndustrialAge":{"population":-530,"random_good_of_age_24h":16,"strategy_points_24h":6},"ProgressiveEra":{"population":-630,"random_good_of_age_24h":16,"strategy_points_24h":6},"ModernEra":{"population":-740,"random_good_of_age_24h":17,"strategy_points_24h":6},"PostModernEra":{"population":-850,"random_good_of_age_24h":17,"strategy_points_24h":6},"ContemporaryEra":{"population":-970,"random_good_of_age_24h":17,"strategy_points_24h":6},"TomorrowEra":{"population":-1090,"random_good_of_age_24h":17,"strategy_points_24h":6},"FutureEra":{"population":-1220,"random_good_of_age_24h":18,"strategy_points_24h":6},"ArcticFuture":{"population":-1350,"random_good_of_age_24h":18,"strategy_points_24h":6},"OceanicFuture":{"population":-1490,"random_good_of_age_24h":18,"strategy_points_24h":6},"VirtualFuture":{"population":-1630,"random_good_of_age_24h":18,"strategy_points_24h":6},"SpaceAgeMars":{"population":-2580,"random_good_of_age_24h":19,"strategy_points_24h":6},"SpaceAgeAsteroidBelt":{"population":-2800,"random_good_of_age_24h":19,"strategy_points_24h":6},"SpaceAgeVenus":{"population":-3030,"random_good_of_age_24h":19,"strategy_points_24h":6},"SpaceAgeJupiterMoon":{"population":-3260,"random_good_of_age_24h":19,"strategy_points_24h":6},"SpaceAgeTitan":{"population":-3500,"random_good_of_age_24h":20,"strategy_points_24h":6},"SpaceAgeSpaceHub":{"population":-3740,"random_good_of_age_24h":20,"strategy_points_24h":6}}, boosts: [{"type":"def_boost_attacker","value":15,"feature":"all"},{"type":"att_boost_defender","value":12,"feature":"all"}] },
+    "W_MultiAge_PAT25C1": { prod: {"AllAge":{"all_goods_of_age_24h":40,"all_goods_of_previous_age_24h":40,"all_goods_of_next_age_24h":40},"BronzeAge":{"population":-290},"IronAge":{"population":-620},"EarlyMiddleAge":{"population":-950},"HighMiddleAge":{"population":-1340},"LateMiddleAge":{"population":-1750},"ColonialAge":{"population":-2210},"IndustrialAge":{"population":-2710},"ProgressiveEra":{"population":-3230},"ModernEra":{"population":-3790},"PostModernEra":{"population":-4360},"ContemporaryEra":{"population":-4970},"TomorrowEra":{"population":-5600},"FutureEra":{"population":-6270},"ArcticFuture":{"population":-6950},"OceanicFuture":{"population":-7660},"VirtualFuture":{"population":-8390},"SpaceAgeMars":{"population":-13270},"SpaceAgeAsteroidBelt":{"population":-14420},"SpaceAgeVenus":{"population":-15580},"SpaceAgeJupiterMoon":{"population":-16780},"SpaceAgeTitan":{"population":-18000},"SpaceAgeSpaceHub":{"population":-19220}} },
+    "W_MultiAge_PAT22A13": { prod: {"BronzeAge":{"population":1040,"happiness":4300,"demandHappiness":1040,"money_24h":3010,"strategy_points_24h":90,"all_goods_of_age_24h":170},"IronAge":{"population":2240,"happiness":7410,"demandHappiness":2240,"money_24h":7230,"strategy_points_24h":90,"all_goods_of_age_24h":170},"EarlyMiddleAge":{"population":3440,"happiness":8200,"demandHappiness":3440,"money_24h":12050,"strategy_points_24h":90,"all_goods_of_age_24h":170},"HighMiddleAge":{"population":4830,"happiness":9150,"demandHappiness":4830,"money_24h":16870,"strategy_points_24h":90,"all_goods_of_age_24h":170},"LateMiddleAge":{"population":6330,"happiness":10200,"demandHappiness":6330,"money_24h":22290,"strategy_points_24h":90,"all_goods_of_age_24h":170},"ColonialAge":{"population":7990,"happiness":11990,"demandHappiness":7990,"money_24h":33950,"strategy_points_24h":90,"all_goods_of_age_24h":170},"IndustrialAge":{"population":9770,"happiness":13530,"demandHappiness":9770,"money_24h":42290,"strategy_points_24h":90,"all_goods_of_age_24h":170},"ProgressiveEra":{"population":11660,"happiness":14850,"demandHappiness":11660,"money_24h":51330,"strategy_points_24h":90,"all_goods_of_age_24h":170},"ModernEra":{"population":13670,"happiness":15890,"demandHappiness":13670,"money_24h":63860,"strategy_points_24h":90,"all_goods_of_age_24h":170},"PostModernEra":{"population":15760,"happiness":16560,"demandHappiness":15760,"money_24h":80340,"strategy_points_24h":90,"all_goods_of_age_24h":170},"ContemporaryEra":{"population":17960,"happiness":19240,"demandHappiness":17960,"money_24h":104580,"strategy_points_24h":90,"all_goods_of_age_24h":170},"TomorrowEra":{"population":20240,"happiness":23360,"demandHappiness":20240,"money_24h":121090,"strategy_points_24h":90,"all_goods_of_age_24h":170},"FutureEra":{"population":22630,"happiness":27980,"demandHappiness":22630,"money_24h":138800,"strategy_points_24h":90,"all_goods_of_age_24h":170},"ArcticFuture":{"population":25100,"happiness":32590,"demandHappiness":25100,"money_24h":157720,"strategy_points_24h":90,"all_goods_of_age_24h":170},"OceanicFuture":{"population":27650,"happiness":37600,"demandHappiness":27650,"money_24h":177840,"strategy_points_24h":90,"all_goods_of_age_24h":170},"VirtualFuture":{"population":30280,"happiness":44920,"demandHappiness":30280,"money_24h":199200,"strategy_points_24h":90,"all_goods_of_age_24h":170},"SpaceAgeMars":{"population":47930,"happiness":71880,"demandHappiness":47930,"money_24h":332730,"strategy_points_24h":90,"all_goods_of_age_24h":170},"SpaceAgeAsteroidBelt":{"population":52060,"happiness":78120,"demandHappiness":52060,"money_24h":368550,"strategy_points_24h":90,"all_goods_of_age_24h":170},"SpaceAgeVenus":{"population":56270,"happiness":84400,"demandHappiness":56270,"money_24h":406260,"strategy_points_24h":90,"all_goods_of_age_24h":170},"SpaceAgeJupiterMoon":{"population":60600,"happiness":90910,"demandHappiness":60600,"money_24h":445900,"strategy_points_24h":90,"all_goods_of_age_24h":170},"SpaceAgeTitan":{"population":65000,"happiness":97500,"demandHappiness":65000,"money_24h":487500,"strategy_points_24h":90,"all_goods_of_age_24h":170},"SpaceAgeSpaceHub":{"population":69400,"happiness":104090,"demandHappiness":69400,"money_24h":529100,"strategy_points_24h":90,"all_goods_of_age_24h":170}}, boosts: [{"type":"att_boost_attacker","value":30,"feature":"guild_raids"},{"type":"att_def_boost_attacker","value":36,"feature":"all"},{"type":"att_def_boost_attacker","value":66,"feature":"battleground"}] },
+    "W_MultiAge_PAT23A11": { prod: {"BronzeAge":{"money_24h":140,"strategy_points_24h":24,"all_goods_of_age_24h":55},"IronAge":{"money_24h":320,"strategy_points_24h":24,"all_goods_of_age_24h":55},"EarlyMiddleAge":{"money_24h":540,"strategy_points_24h":24,"all_goods_of_age_24h":55},"HighMiddleAge":{"money_24h":740,"strategy_points_24h":24,"all_goods_of_age_24h":55},"LateMiddleAge":{"money_24h":980,"strategy_points_24h":24,"all_goods_of_age_24h":55},"ColonialAge":{"money_24h":1500,"strategy_points_24h":24,"all_goods_of_age_24h":55},"IndustrialAge":{"money_24h":1880,"strategy_points_24h":24,"all_goods_of_age_24h":55},"ProgressiveEra":{"money_24h":2280,"strategy_points_24h":24,"all_goods_of_age_24h":55},"ModernEra":{"money_24h":2820,"strategy_points_24h":24,"all_goods_of_age_24h":55},"PostModernEra":{"money_24h":3560,"strategy_points_24h":24,"all_goods_of_age_24h":55},"ContemporaryEra":{"money_24h":4620,"strategy_points_24h":24,"all_goods_of_age_24h":55},"TomorrowEra":{"money_24h":5360,"strategy_points_24h":24,"all_goods_of_age_24h":55},"FutureEra":{"money_24h":6140,"strategy_points_24h":24,"all_goods_of_age_24h":55},"ArcticFuture":{"money_24h":6980,"strategy_points_24h":24,"all_goods_of_age_24h":55},"OceanicFuture":{"money_24h":7880,"strategy_points_24h":24,"all_goods_of_age_24h":55},"VirtualFuture":{"money_24h":8820,"strategy_points_24h":24,"all_goods_of_age_24h":55},"SpaceAgeMars":{"money_24h":14720,"strategy_points_24h":24,"all_goods_of_age_24h":55},"SpaceAgeAsteroidBelt":{"money_24h":16320,"strategy_points_24h":24,"all_goods_of_age_24h":55},"SpaceAgeVenus":{"money_24h":17980,"strategy_points_24h":24,"all_goods_of_age_24h":55},"SpaceAgeJupiterMoon":{"money_24h":19740,"strategy_points_24h":24,"all_goods_of_age_24h":55},"SpaceAgeTitan":{"money_24h":21674,"strategy_points_24h":24,"all_goods_of_age_24h":55},"SpaceAgeSpaceHub":{"money_24h":23608,"strategy_points_24h":24,"all_goods_of_age_24h":55}}, boosts: [{"type":"att_boost_attacker","value":12,"feature":"all"},{"type":"att_boost_attacker","value":12,"feature":"battleground"},{"type":"def_boost_attacker","value":18,"feature":"all"},{"type":"def_boost_attacker","value":18,"feature":"battleground"},{"type":"def_boost_defender","value":22,"feature":"all"},{"type":"def_boost_defender","value":22,"feature":"guild_expedition"}] },
+    "W_MultiAge_PAT25A10": { prod: {"BronzeAge":{"population":510,"happiness":2820,"demandHappiness":510,"money_24h":3400,"strategy_points_24h":121.0},"IronAge":{"population":1100,"happiness":4850,"demandHappiness":1100,"money_24h":8160,"strategy_points_24h":121.0},"EarlyMiddleAge":{"population":1690,"happiness":5360,"demandHappiness":1690,"money_24h":13590,"strategy_points_24h":121.0},"HighMiddleAge":{"population":2370,"happiness":5990,"demandHappiness":2370,"money_24h":19030,"strategy_points_24h":121.0},"LateMiddleAge":{"population":3110,"happiness":6680,"demandHappiness":3110,"money_24h":25150,"strategy_points_24h":121.0},"ColonialAge":{"population":3920,"happiness":7850,"demandHappiness":3920,"money_24h":38300,"strategy_points_24h":121.0},"IndustrialAge":{"population":4800,"happiness":8850,"demandHappiness":4800,"money_24h":47710,"strategy_points_24h":121.0},"ProgressiveEra":{"population":5720,"happiness":9720,"demandHappiness":5720,"money_24h":57910,"strategy_points_24h":121.0},"ModernEra":{"population":6710,"happiness":10400,"demandHappiness":6710,"money_24h":72050,"strategy_points_24h":121.0},"PostModernEra":{"population":7730,"happiness":10840,"demandHappiness":7730,"money_24h":90640,"strategy_points_24h":121.0},"ContemporaryEra":{"population":8810,"happiness":12590,"demandHappiness":8810,"money_24h":117990,"strategy_points_24h":121.0},"TomorrowEra":{"population":9930,"happiness":15280,"demandHappiness":9930,"money_24h":136620,"strategy_points_24h":121.0},"FutureEra":{"population":11110,"happiness":18310,"demandHappiness":11110,"money_24h":156600,"strategy_points_24h":121.0},"ArcticFuture":{"population":12320,"happiness":21320,"demandHappiness":12320,"money_24h":177940,"strategy_points_24h":121.0},"OceanicFuture":{"population":13570,"happiness":24610,"demandHappiness":13570,"money_24h":200640,"strategy_points_24h":121.0},"VirtualFuture":{"population":14860,"happiness":29400,"demandHappiness":14860,"money_24h":224740,"strategy_points_24h":121.0},"SpaceAgeMars":{"population":23520,"happiness":47040,"demandHappiness":23520,"money_24h":375390,"strategy_points_24h":121.0},"SpaceAgeAsteroidBelt":{"population":25550,"happiness":51120,"demandHappiness":25550,"money_24h":415800,"strategy_points_24h":121.0},"SpaceAgeVenus":{"population":27620,"happiness":55220,"demandHappiness":27620,"money_24h":458340,"strategy_points_24h":121.0},"SpaceAgeJupiterMoon":{"population":29740,"happiness":59490,"demandHappiness":29740,"money_24h":503070,"strategy_points_24h":121.0},"SpaceAgeTitan":{"population":31900,"happiness":63800,"demandHappiness":31900,"money_24h":550000,"strategy_points_24h":121.0},"SpaceAgeSpaceHub":{"population":34060,"happiness":68110,"demandHappiness":34060,"money_24h":596930,"strategy_points_24h":121.0}}, boosts: [{"type":"def_boost_attacker","value":67,"feature":"all"},{"type":"att_def_boost_attacker","value":16,"feature":"battleground"},{"type":"att_def_boost_defender","value":42,"feature":"all"}] },
+    "W_MultiAge_PAT25B1": { prod: {"AllAge":{"strategy_points_24h":21,"units_24h":9},"BronzeAge":{"population":-190},"IronAge":{"population":-410},"EarlyMiddleAge":{"population":-630},"HighMiddleAge":{"population":-890},"LateMiddleAge":{"population":-1170},"ColonialAge":{"population":-1480},"IndustrialAge":{"population":-1800},"ProgressiveEra":{"population":-2150},"ModernEra":{"population":-2520},"PostModernEra":{"population":-2910},"ContemporaryEra":{"population":-3320},"TomorrowEra":{"population":-3740},"FutureEra":{"population":-4180},"ArcticFuture":{"population":-4630},"OceanicFuture":{"population":-5110},"VirtualFuture":{"population":-5590},"SpaceAgeMars":{"population":-8850},"SpaceAgeAsteroidBelt":{"population":-9610},"SpaceAgeVenus":{"population":-10390},"SpaceAgeJupiterMoon":{"population":-11190},"SpaceAgeTitan":{"population":-12000},"SpaceAgeSpaceHub":{"population":-12810}}, boosts: [{"type":"att_boost_defender","value":14,"feature":"all"},{"type":"att_def_boost_defender","value":14,"feature":"battleground"}] },
+    "W_MultiAge_PAT25A12": { prod: {"BronzeAge":{"population":990,"happiness":3010,"demandHappiness":990,"money_24h":3530,"strategy_points_24h":153.0},"IronAge":{"population":2140,"happiness":5190,"demandHappiness":2140,"money_24h":8480,"strategy_points_24h":153.0},"EarlyMiddleAge":{"population":3280,"happiness":5740,"demandHappiness":3280,"money_24h":14140,"strategy_points_24h":153.0},"HighMiddleAge":{"population":4600,"happiness":6400,"demandHappiness":4600,"money_24h":19790,"strategy_points_24h":153.0},"LateMiddleAge":{"population":6040,"happiness":7140,"demandHappiness":6040,"money_24h":26150,"strategy_points_24h":153.0},"ColonialAge":{"population":7620,"happiness":8390,"demandHappiness":7620,"money_24h":39830,"strategy_points_24h":153.0},"IndustrialAge":{"population":9320,"happiness":9460,"demandHappiness":9320,"money_24h":49620,"strategy_points_24h":153.0},"ProgressiveEra":{"population":11120,"happiness":10390,"demandHappiness":11120,"money_24h":60230,"strategy_points_24h":153.0},"ModernEra":{"population":13040,"happiness":11120,"demandHappiness":13040,"money_24h":74930,"strategy_points_24h":153.0},"PostModernEra":{"population":15020,"happiness":11580,"demandHappiness":15020,"money_24h":94260,"strategy_points_24h":153.0},"ContemporaryEra":{"population":17120,"happiness":13460,"demandHappiness":17120,"money_24h":122710,"strategy_points_24h":153.0},"TomorrowEra":{"population":19290,"happiness":16340,"demandHappiness":19290,"money_24h":142080,"strategy_points_24h":153.0},"FutureEra":{"population":21580,"happiness":19580,"demandHappiness":21580,"money_24h":162860,"strategy_points_24h":153.0},"ArcticFuture":{"population":23930,"happiness":22790,"demandHappiness":23930,"money_24h":185060,"strategy_points_24h":153.0},"OceanicFuture":{"population":26360,"happiness":26300,"demandHappiness":26360,"money_24h":208670,"strategy_points_24h":153.0},"VirtualFuture":{"population":28870,"happiness":31420,"demandHappiness":28870,"money_24h":233730,"strategy_points_24h":153.0},"SpaceAgeMars":{"population":45700,"happiness":50280,"demandHappiness":45700,"money_24h":390410,"strategy_points_24h":153.0},"SpaceAgeAsteroidBelt":{"population":49640,"happiness":54640,"demandHappiness":49640,"money_24h":432430,"strategy_points_24h":153.0},"SpaceAgeVenus":{"population":53650,"happiness":59040,"demandHappiness":53650,"money_24h":476680,"strategy_points_24h":153.0},"SpaceAgeJupiterMoon":{"population":57770,"happiness":63590,"demandHappiness":57770,"money_24h":523190,"strategy_points_24h":153.0},"SpaceAgeTitan":{"population":61970,"happiness":68200,"demandHappiness":61970,"money_24h":572000,"strategy_points_24h":153.0},"SpaceAgeSpaceHub":{"population":66170,"happiness":72810,"demandHappiness":66170,"money_24h":620810,"strategy_points_24h":153.0}}, boosts: [{"type":"def_boost_attacker","value":108,"feature":"all"},{"type":"att_def_boost_attacker","value":79,"feature":"battleground"},{"type":"att_def_boost_defender","value":84,"feature":"all"}] },
+    "W_MultiAge_PAT23A10": { prod: {"BronzeAge":{"money_24h":70,"strategy_points_24h":12},"IronAge":{"money_24h":160,"strategy_points_24h":12},"EarlyMiddleAge":{"money_24h":270,"strategy_points_24h":12},"HighMiddleAge":{"money_24h":370,"strategy_points_24h":12},"LateMiddleAge":{"money_24h":490,"strategy_points_24h":12},"ColonialAge":{"money_24h":750,"strategy_points_24h":12},"IndustrialAge":{"money_24h":940,"strategy_points_24h":12},"ProgressiveEra":{"money_24h":1140,"strategy_points_24h":12},"ModernEra":{"money_24h":1410,"strategy_points_24h":12},"PostModernEra":{"money_24h":1780,"strategy_points_24h":12},"ContemporaryEra":{"money_24h":2310,"strategy_points_24h":12},"TomorrowEra":{"money_24h":2680,"strategy_points_24h":12},"FutureEra":{"money_24h":3070,"strategy_points_24h":12},"ArcticFuture":{"money_24h":3490,"strategy_points_24h":12},"OceanicFuture":{"money_24h":3940,"strategy_points_24h":12},"VirtualFuture":{"money_24h":4410,"strategy_points_24h":12},"SpaceAgeMars":{"money_24h":7360,"strategy_points_24h":12},"SpaceAgeAsteroidBelt":{"money_24h":8160,"strategy_points_24h":12},"SpaceAgeVenus":{"money_24h":8990,"strategy_points_24h":12},"SpaceAgeJupiterMoon":{"money_24h":9870,"strategy_points_24h":12},"SpaceAgeTitan":{"money_24h":10837,"strategy_points_24h":12},"SpaceAgeSpaceHub":{"money_24h":11804,"strategy_points_24h":12}}, boosts: [{"type":"att_boost_attacker","value":12,"feature":"all"},{"type":"def_boost_attacker","value":18,"feature":"all"}] },
+};
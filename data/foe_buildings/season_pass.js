@@ -0,0 +1,8 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 4 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_PassBonus22a": { prod: {"AllAge":{"happiness":250}}, boosts: [{"type":"forge_points_production","value":10,"feature":"all"}] },
+    "W_MultiAge_PassBonus22aDecoration": { prod: {"AllAge":{"happiness":250}} },
+    "W_MultiAge_PassBonus22b": { prod: {"AllAge":{"happiness":250,"strategy_points_24h":1}} },
+    "W_MultiAge_PassBonus22bDecoration": { prod: {"AllAge":{"happiness":250}} },
+};
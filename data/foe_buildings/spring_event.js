@@ -0,0 +1,70 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 66 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_SPR21A10": { prod: {"BronzeAge":{"medals_24h":51,"supplies_24h":700,"strategy_points_24h":1},"IronAge":{"medals_24h":65,"supplies_24h":1800,"strategy_points_24h":1},"EarlyMiddleAge":{"medals_24h":80,"supplies_24h":2900,"strategy_points_24h":1},"HighMiddleAge":{"medals_24h":94,"supplies_24h":4100,"strategy_points_24h":1},"LateMiddleAge":{"medals_24h":108,"supplies_24h":5400,"strategy_points_24h":1},"ColonialAge":{"medals_24h":130,"supplies_24h":6900,"strategy_points_24h":1},"IndustrialAge":{"medals_24h":180,"supplies_24h":8400,"strategy_points_24h":1},"ProgressiveEra":{"medals_24h":252,"supplies_24h":9900,"strategy_points_24h":1},"ModernEra":{"medals_24h":360,"supplies_24h":11500,"strategy_points_24h":1},"PostModernEra":{"medals_24h":504,"supplies_24h":13100,"strategy_points_24h":1},"ContemporaryEra":{"medals_24h":720,"supplies_24h":14700,"strategy_points_24h":1},"TomorrowEra":{"medals_24h":972,"supplies_24h":16500,"strategy_points_24h":1},"FutureEra":{"medals_24h":1188,"supplies_24h":18100,"strategy_points_24h":1},"ArcticFuture":{"medals_24h":1440,"supplies_24h":19900,"strategy_points_24h":2},"OceanicFuture":{"medals_24h":1656,"supplies_24h":21800,"strategy_points_24h":2},"VirtualFuture":{"medals_24h":2016,"supplies_24h":23500,"strategy_points_24h":2},"SpaceAgeMars":{"medals_24h":2448,"supplies_24h":38100,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"medals_24h":2880,"supplies_24h":40900,"strategy_points_24h":2},"SpaceAgeVenus":{"medals_24h":3312,"supplies_24h":43800,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"medals_24h":3744,"supplies_24h":46600,"strategy_points_24h":3},"SpaceAgeTitan":{"medals_24h":4233,"supplies_24h":49579,"strategy_points_24h":3},"SpaceAgeSpaceHub":{"medals_24h":4722,"supplies_24h":52558,"strategy_points_24h":3}} },
+    "W_MultiAge_SPR21A11": { prod: {"BronzeAge":{"medals_24h":51,"supplies_24h":700,"strategy_points_24h":1},"IronAge":{"medals_24h":65,"supplies_24h":1800,"strategy_points_24h":1},"EarlyMiddleAge":{"medals_24h":80,"supplies_24h":2900,"strategy_points_24h":1},"HighMiddleAge":{"medals_24h":94,"supplies_24h":4100,"strategy_points_24h":1},"LateMiddleAge":{"medals_24h":108,"supplies_24h":5400,"strategy_points_24h":1},"ColonialAge":{"medals_24h":130,"supplies_24h":6900,"strategy_points_24h":1},"IndustrialAge":{"medals_24h":180,"supplies_24h":8400,"strategy_points_24h":1},"ProgressiveEra":{"medals_24h":252,"supplies_24h":9900,"strategy_points_24h":1},"ModernEra":{"medals_24h":360,"supplies_24h":11500,"strategy_points_24h":1},"PostModernEra":{"medals_24h":504,"supplies_24h":13100,"strategy_points_24h":1},"ContemporaryEra":{"medals_24h":720,"supplies_24h":14700,"strategy_points_24h":1},"TomorrowEra":{"medals_24h":972,"supplies_24h":16500,"strategy_points_24h":1},"FutureEra":{"medals_24h":1188,"supplies_24h":18100,"strategy_points_24h":1},"ArcticFuture":{"medals_24h":1440,"supplies_24h":19900,"strategy_points_24h":2},"OceanicFuture":{"medals_24h":1656,"supplies_24h":21800,"strategy_points_24h":2},"VirtualFuture":{"medals_24h":2016,"supplies_24h":23500,"strategy_points_24h":2},"SpaceAgeMars":{"medals_24h":2448,"supplies_24h":38100,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"medals_24h":2880,"supplies_24h":40900,"strategy_points_24h":2},"SpaceAgeVenus":{"medals_24h":3312,"supplies_24h":43800,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"medals_24h":3744,"supplies_24h":46600,"strategy_points_24h":3},"SpaceAgeTitan":{"medals_24h":4233,"supplies_24h":49579,"strategy_points_24h":3},"SpaceAgeSpaceHub":{"medals_24h":4722,"supplies_24h":52558,"strategy_points_24h":3}} },
+    "W_MultiAge_SPR21A12": { prod: {"BronzeAge":{"medals_24h":51,"supplies_24h":700,"strategy_points_24h":1},"IronAge":{"medals_24h":65,"supplies_24h":1800,"strategy_points_24h":1},"EarlyMiddleAge":{"medals_24h":80,"supplies_24h":2900,"strategy_points_24h":1},"HighMiddleAge":{"medals_24h":94,"supplies_24h":4100,"strategy_points_24h":1},"LateMiddleAge":{"medals_24h":108,"supplies_24h":5400,"strategy_points_24h":1},"ColonialAge":{"medals_24h":130,"supplies_24h":6900,"strategy_points_24h":1},"IndustrialAge":{"medals_24h":180,"supplies_24h":8400,"strategy_points_24h":1},"ProgressiveEra":{"medals_24h":252,"supplies_24h":9900,"strategy_points_24h":1},"ModernEra":{"medals_24h":360,"supplies_24h":11500,"strategy_points_24h":1},"PostModernEra":{"medals_24h":504,"supplies_24h":13100,"strategy_points_24h":1},"ContemporaryEra":{"medals_24h":720,"supplies_24h":14700,"strategy_points_24h":1},"TomorrowEra":{"medals_24h":972,"supplies_24h":16500,"strategy_points_24h":1},"FutureEra":{"medals_24h":1188,"supplies_24h":18100,"strategy_points_24h":1},"ArcticFuture":{"medals_24h":1440,"supplies_24h":19900,"strategy_points_24h":2},"OceanicFuture":{"medals_24h":1656,"supplies_24h":21800,"strategy_points_24h":2},"VirtualFuture":{"medals_24h":2016,"supplies_24h":23500,"strategy_points_24h":2},"SpaceAgeMars":{"medals_24h":2448,"supplies_24h":38100,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"medals_24h":2880,"supplies_24h":40900,"strategy_points_24h":2},"SpaceAgeVenus":{"medals_24h":3312,"supplies_24h":43800,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"medals_24h":3744,"supplies_24h":46600,"strategy_points_24h":3},"SpaceAgeTitan":{"medals_24h":4233,"supplies_24h":49579,"strategy_points_24h":3},"SpaceAgeSpaceHub":{"medals_24h":4722,"supplies_24h":52558,"strategy_points_24h":3}} },
+    "W_MultiAge_GR23A1": { prod: {"BronzeAge":{"strategy_points_24h":6,"random_good_of_age_24h":48},"IronAge":{"strategy_points_24h":6,"random_good_of_age_24h":48},"EarlyMiddleAge":{"strategy_points_24h":7,"random_good_of_age_24h":49},"HighMiddleAge":{"strategy_points_24h":7,"random_good_of_age_24h":49},"LateMiddleAge":{"strategy_points_24h":7,"random_good_of_age_24h":49},"ColonialAge":{"strategy_points_24h":7,"random_good_of_age_24h":50},"IndustrialAge":{"strategy_points_24h":7,"random_good_of_age_24h":50},"ProgressiveEra":{"strategy_points_24h":7,"random_good_of_age_24h":51},"ModernEra":{"strategy_points_24h":7,"random_good_of_age_24h":51},"PostModernEra":{"strategy_points_24h":7,"random_good_of_age_24h":51},"ContemporaryEra":{"strategy_points_24h":7,"random_good_of_age_24h":52},"TomorrowEra":{"strategy_points_24h":7,"random_good_of_age_24h":52},"FutureEra":{"strategy_points_24h":8,"random_good_of_age_24h":52},"ArcticFuture":{"strategy_points_24h":8,"random_good_of_age_24h":53},"OceanicFuture":{"strategy_points_24h":8,"random_good_of_age_24h":53},"VirtualFuture":{"strategy_points_24h":8,"random_good_of_age_24h":53},"SpaceAgeMars":{"strategy_points_24h":8,"random_good_of_age_24h":54},"SpaceAgeAsteroidBelt":{"strategy_points_24h":8,"random_good_of_age_24h":54},"SpaceAgeVenus":{"strategy_points_24h":8,"random_good_of_age_24h":54},"SpaceAgeJupiterMoon":{"strategy_points_24h":8,"random_good_of_age_24h":55},"SpaceAgeTitan":{"strategy_points_24h":8,"random_good_of_age_24h":55},"SpaceAgeSpaceHub":{"strategy_points_24h":8,"random_good_of_age_24h":55}}, boosts: [{"type":"att_def_boost_attacker","value":10,"feature":"battleground"},{"type":"att_def_boost_defender","value":10,"feature":"battleground"}] },
+    "W_MultiAge_GR23A10": { prod: {"BronzeAge":{"strategy_points_24h":24,"random_good_of_age_24h":160},"IronAge":{"strategy_points_24h":24,"random_good_of_age_24h":161},"EarlyMiddleAge":{"strategy_points_24h":25,"random_good_of_age_24h":162},"HighMiddleAge":{"strategy_points_24h":25,"random_good_of_age_24h":164},"LateMiddleAge":{"strategy_points_24h":25,"random_good_of_age_24h":165},"ColonialAge":{"strategy_points_24h":26,"random_good_of_age_24h":166},"IndustrialAge":{"strategy_points_24h":26,"random_good_of_age_24h":167},"ProgressiveEra":{"strategy_points_24h":27,"random_good_of_age_24h":168},"ModernEra":{"strategy_points_24h":27,"random_good_of_age_24h":170},"PostModernEra":{"strategy_points_24h":27,"random_good_of_age_24h":171},"ContemporaryEra":{"strategy_points_24h":28,"random_good_of_age_24h":172},"TomorrowEra":{"strategy_points_24h":28,"random_good_of_age_24h":173},"FutureEra":{"strategy_points_24h":28,"random_good_of_age_24h":174},"ArcticFuture":{"strategy_points_24h":29,"random_good_of_age_24h":176},"OceanicFuture":{"strategy_points_24h":29,"random_good_of_age_24h":177},"VirtualFuture":{"strategy_points_24h":29,"random_good_of_age_24h":178},"SpaceAgeMars":{"strategy_points_24h":30,"random_good_of_age_24h":179},"SpaceAgeAsteroidBelt":{"strategy_points_24h":30,"random_good_of_age_24h":180},"SpaceAgeVenus":{"strategy_points_24h":30,"random_good_of_age_24h":182},"SpaceAgeJupiterMoon":{"strategy_points_24h":31,"random_good_of_age_24h":183},"SpaceAgeTitan":{"strategy_points_24h":31,"random_good_of_age_24h":184},"SpaceAgeSpaceHub":{"strategy_points_24h":31,"random_good_of_age_24h":185}}, boosts: [{"type":"att_def_boost_attacker","value":32,"feature":"all"},{"type":"att_def_boost_attacker","value":31,"feature":"battleground"},{"type":"att_def_boost_attacker","value":42,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":32,"feature":"all"},{"type":"att_def_boost_defender","value":31,"feature":"battleground"},{"type":"att_def_boost_defender","value":42,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR23A11": { prod: {"BronzeAge":{"strategy_points_24h":28,"random_good_of_age_24h":192},"IronAge":{"strategy_points_24h":28,"random_good_of_age_24h":192},"EarlyMiddleAge":{"strategy_points_24h":28,"random_good_of_age_24h":193},"HighMiddleAge":{"strategy_points_24h":29,"random_good_of_age_24h":195},"LateMiddleAge":{"strategy_points_24h":29,"random_good_of_age_24h":196},"ColonialAge":{"strategy_points_24h":30,"random_good_of_age_24h":198},"IndustrialAge":{"strategy_points_24h":30,"random_good_of_age_24h":199},"ProgressiveEra":{"strategy_points_24h":31,"random_good_of_age_24h":201},"ModernEra":{"strategy_points_24h":31,"random_good_of_age_24h":202},"PostModernEra":{"strategy_points_24h":31,"random_good_of_age_24h":204},"ContemporaryEra":{"strategy_points_24h":32,"random_good_of_age_24h":205},"TomorrowEra":{"strategy_points_24h":32,"random_good_of_age_24h":206},"FutureEra":{"strategy_points_24h":33,"random_good_of_age_24h":208},"ArcticFuture":{"strategy_points_24h":33,"random_good_of_age_24h":209},"OceanicFuture":{"strategy_points_24h":33,"random_good_of_age_24h":211},"VirtualFuture":{"strategy_points_24h":34,"random_good_of_age_24h":212},"SpaceAgeMars":{"strategy_points_24h":34,"random_good_of_age_24h":214},"SpaceAgeAsteroidBelt":{"strategy_points_24h":35,"random_good_of_age_24h":215},"SpaceAgeVenus":{"strategy_points_24h":35,"random_good_of_age_24h":216},"SpaceAgeJupiterMoon":{"strategy_points_24h":36,"random_good_of_age_24h":218},"SpaceAgeTitan":{"strategy_points_24h":36,"random_good_of_age_24h":219},"SpaceAgeSpaceHub":{"strategy_points_24h":36,"random_good_of_age_24h":221}}, boosts: [{"type":"att_def_boost_attacker","value":45,"feature":"all"},{"type":"att_def_boost_attacker","value":42,"feature":"battleground"},{"type":"att_def_boost_attacker","value":56,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":45,"feature":"all"},{"type":"att_def_boost_defender","value":42,"feature":"battleground"},{"type":"att_def_boost_defender","value":56,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR23A2": { prod: {"BronzeAge":{"strategy_points_24h":6,"random_good_of_age_24h":48},"IronAge":{"strategy_points_24h":6,"random_good_of_age_24h":48},"EarlyMiddleAge":{"strategy_points_24h":7,"random_good_of_age_24h":49},"HighMiddleAge":{"strategy_points_24h":7,"random_good_of_age_24h":49},"LateMiddleAge":{"strategy_points_24h":7,"random_good_of_age_24h":49},"ColonialAge":{"strategy_points_24h":7,"random_good_of_age_24h":50},"IndustrialAge":{"strategy_points_24h":7,"random_good_of_age_24h":50},"ProgressiveEra":{"strategy_points_24h":7,"random_good_of_age_24h":51},"ModernEra":{"strategy_points_24h":7,"random_good_of_age_24h":51},"PostModernEra":{"strategy_points_24h":7,"random_good_of_age_24h":51},"ContemporaryEra":{"strategy_points_24h":7,"random_good_of_age_24h":52},"TomorrowEra":{"strategy_points_24h":7,"random_good_of_age_24h":52},"FutureEra":{"strategy_points_24h":8,"random_good_of_age_24h":52},"ArcticFuture":{"strategy_points_24h":8,"random_good_of_age_24h":53},"OceanicFuture":{"strategy_points_24h":8,"random_good_of_age_24h":53},"VirtualFuture":{"strategy_points_24h":8,"random_good_of_age_24h":53},"SpaceAgeMars":{"strategy_points_24h":8,"random_good_of_age_24h":54},"SpaceAgeAsteroidBelt":{"strategy_points_24h":8,"random_good_of_age_24h":54},"SpaceAgeVenus":{"strategy_points_24h":8,"random_good_of_age_24h":54},"SpaceAgeJupiterMoon":{"strategy_points_24h":8,"random_good_of_age_24h":55},"SpaceAgeTitan":{"strategy_points_24h":8,"random_good_of_age_24h":55},"SpaceAgeSpaceHub":{"strategy_points_24h":8,"random_good_of_age_24h":55}}, boosts: [{"type":"att_def_boost_attacker","value":10,"feature":"battleground"},{"type":"att_def_boost_attacker","value":13,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":10,"feature":"battleground"},{"type":"att_def_boost_defender","value":13,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR23A3": { prod: {"BronzeAge":{"strategy_points_24h":8,"random_good_of_age_24h":48},"IronAge":{"strategy_points_24h":8,"random_good_of_age_24h":48},"EarlyMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":49},"HighMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":49},"LateMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":49},"ColonialAge":{"strategy_points_24h":9,"random_good_of_age_24h":50},"IndustrialAge":{"strategy_points_24h":9,"random_good_of_age_24h":50},"ProgressiveEra":{"strategy_points_24h":9,"random_good_of_age_24h":51},"ModernEra":{"strategy_points_24h":9,"random_good_of_age_24h":51},"PostModernEra":{"strategy_points_24h":9,"random_good_of_age_24h":51},"ContemporaryEra":{"strategy_points_24h":9,"random_good_of_age_24h":52},"TomorrowEra":{"strategy_points_24h":9,"random_good_of_age_24h":52},"FutureEra":{"strategy_points_24h":9,"random_good_of_age_24h":52},"ArcticFuture":{"strategy_points_24h":10,"random_good_of_age_24h":53},"OceanicFuture":{"strategy_points_24h":10,"random_good_of_age_24h":53},"VirtualFuture":{"strategy_points_24h":10,"random_good_of_age_24h":53},"SpaceAgeMars":{"strategy_points_24h":10,"random_good_of_age_24h":54},"SpaceAgeAsteroidBelt":{"strategy_points_24h":10,"random_good_of_age_24h":54},"SpaceAgeVenus":{"strategy_points_24h":10,"random_good_of_age_24h":54},"SpaceAgeJupiterMoon":{"strategy_points_24h":10,"random_good_of_age_24h":55},"SpaceAgeTitan":{"strategy_points_24h":10,"random_good_of_age_24h":55},"SpaceAgeSpaceHub":{"strategy_points_24h":10,"random_good_of_age_24h":55}}, boosts: [{"type":"att_def_boost_attacker","value":14,"feature":"battleground"},{"type":"att_def_boost_attacker","value":13,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":14,"feature":"battleground"},{"type":"att_def_boost_defender","value":13,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR23A4": { prod: {"BronzeAge":{"strategy_points_24h":8,"random_good_of_age_24h":64},"IronAge":{"strategy_points_24h":8,"random_good_of_age_24h":64},"EarlyMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":65},"HighMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":65},"LateMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":66},"ColonialAge":{"strategy_points_24h":9,"random_good_of_age_24h":66},"IndustrialAge":{"strategy_points_24h":9,"random_good_of_age_24h":67},"ProgressiveEra":{"strategy_points_24h":9,"random_good_of_age_24h":67},"ModernEra":{"strategy_points_24h":9,"random_good_of_age_24h":68},"PostModernEra":{"strategy_points_24h":9,"random_good_of_age_24h":68},"ContemporaryEra":{"strategy_points_24h":9,"random_good_of_age_24h":69},"TomorrowEra":{"strategy_points_24h":9,"random_good_of_age_24h":69},"FutureEra":{"strategy_points_24h":9,"random_good_of_age_24h":70},"ArcticFuture":{"strategy_points_24h":10,"random_good_of_age_24h":70},"OceanicFuture":{"strategy_points_24h":10,"random_good_of_age_24h":71},"VirtualFuture":{"strategy_points_24h":10,"random_good_of_age_24h":71},"SpaceAgeMars":{"strategy_points_24h":10,"random_good_of_age_24h":72},"SpaceAgeAsteroidBelt":{"strategy_points_24h":10,"random_good_of_age_24h":72},"SpaceAgeVenus":{"strategy_points_24h":10,"random_good_of_age_24h":73},"SpaceAgeJupiterMoon":{"strategy_points_24h":10,"random_good_of_age_24h":73},"SpaceAgeTitan":{"strategy_points_24h":10,"random_good_of_age_24h":74},"SpaceAgeSpaceHub":{"strategy_points_24h":10,"random_good_of_age_24h":74}}, boosts: [{"type":"att_def_boost_attacker","value":14,"feature":"battleground"},{"type":"att_def_boost_attacker","value":19,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":14,"feature":"battleground"},{"type":"att_def_boost_defender","value":19,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR23A5": { prod: {"BronzeAge":{"strategy_points_24h":8,"random_good_of_age_24h":64},"IronAge":{"strategy_points_24h":8,"random_good_of_age_24h":64},"EarlyMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":65},"HighMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":65},"LateMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":66},"ColonialAge":{"strategy_points_24h":9,"random_good_of_age_24h":66},"IndustrialAge":{"strategy_points_24h":9,"random_good_of_age_24h":67},"ProgressiveEra":{"strategy_points_24h":9,"random_good_of_age_24h":67},"ModernEra":{"strategy_points_24h":9,"random_good_of_age_24h":68},"PostModernEra":{"strategy_points_24h":9,"random_good_of_age_24h":68},"ContemporaryEra":{"strategy_points_24h":9,"random_good_of_age_24h":69},"TomorrowEra":{"strategy_points_24h":9,"random_good_of_age_24h":69},"FutureEra":{"strategy_points_24h":9,"random_good_of_age_24h":70},"ArcticFuture":{"strategy_points_24h":10,"random_good_of_age_24h":70},"OceanicFuture":{"strategy_points_24h":10,"random_good_of_age_24h":71},"VirtualFuture":{"strategy_points_24h":10,"random_good_of_age_24h":71},"SpaceAgeMars":{"strategy_points_24h":10,"random_good_of_age_24h":72},"SpaceAgeAsteroidBelt":{"strategy_points_24h":10,"random_good_of_age_24h":72},"SpaceAgeVenus":{"strategy_points_24h":10,"random_good_of_age_24h":73},"SpaceAgeJupiterMoon":{"strategy_points_24h":10,"random_good_of_age_24h":73},"SpaceAgeTitan":{"strategy_points_24h":10,"random_good_of_age_24h":74},"SpaceAgeSpaceHub":{"strategy_points_24h":10,"random_good_of_age_24h":74}}, boosts: [{"type":"att_def_boost_attacker","value":20,"feature":"all"},{"type":"att_def_boost_attacker","value":14,"feature":"battleground"},{"type":"att_def_boost_attacker","value":19,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":20,"feature":"all"},{"type":"att_def_boost_defender","value":14,"feature":"battleground"},{"type":"att_def_boost_defender","value":19,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR23A6": { prod: {"BronzeAge":{"strategy_points_24h":8,"random_good_of_age_24h":64},"IronAge":{"strategy_points_24h":8,"random_good_of_age_24h":64},"EarlyMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":65},"HighMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":65},"LateMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":66},"ColonialAge":{"strategy_points_24h":9,"random_good_of_age_24h":66},"IndustrialAge":{"strategy_points_24h":9,"random_good_of_age_24h":67},"ProgressiveEra":{"strategy_points_24h":9,"random_good_of_age_24h":67},"ModernEra":{"strategy_points_24h":9,"random_good_of_age_24h":68},"PostModernEra":{"strategy_points_24h":9,"random_good_of_age_24h":68},"ContemporaryEra":{"strategy_points_24h":9,"random_good_of_age_24h":69},"TomorrowEra":{"strategy_points_24h":9,"random_good_of_age_24h":69},"FutureEra":{"strategy_points_24h":9,"random_good_of_age_24h":70},"ArcticFuture":{"strategy_points_24h":10,"random_good_of_age_24h":70},"OceanicFuture":{"strategy_points_24h":10,"random_good_of_age_24h":71},"VirtualFuture":{"strategy_points_24h":10,"random_good_of_age_24h":71},"SpaceAgeMars":{"strategy_points_24h":10,"random_good_of_age_24h":72},"SpaceAgeAsteroidBelt":{"strategy_points_24h":10,"random_good_of_age_24h":72},"SpaceAgeVenus":{"strategy_points_24h":10,"random_good_of_age_24h":73},"SpaceAgeJupiterMoon":{"strategy_points_24h":10,"random_good_of_age_24h":73},"SpaceAgeTitan":{"strategy_points_24h":10,"random_good_of_age_24h":74},"SpaceAgeSpaceHub":{"strategy_points_24h":10,"random_good_of_age_24h":74}}, boosts: [{"type":"att_def_boost_attacker","value":24,"feature":"all"},{"type":"att_def_boost_attacker","value":14,"feature":"battleground"},{"type":"att_def_boost_attacker","value":19,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":24,"feature":"all"},{"type":"att_def_boost_defender","value":14,"feature":"battleground"},{"type":"att_def_boost_defender","value":19,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR23A7": { prod: {"BronzeAge":{"strategy_points_24h":13,"random_good_of_age_24h":80},"IronAge":{"strategy_points_24h":13,"random_good_of_age_24h":81},"EarlyMiddleAge":{"strategy_points_24h":13,"random_good_of_age_24h":81},"HighMiddleAge":{"strategy_points_24h":13,"random_good_of_age_24h":82},"LateMiddleAge":{"strategy_points_24h":14,"random_good_of_age_24h":82},"ColonialAge":{"strategy_points_24h":14,"random_good_of_age_24h":83},"IndustrialAge":{"strategy_points_24h":14,"random_good_of_age_24h":84},"ProgressiveEra":{"strategy_points_24h":14,"random_good_of_age_24h":84},"ModernEra":{"strategy_points_24h":14,"random_good_of_age_24h":85},"PostModernEra":{"strategy_points_24h":15,"random_good_of_age_24h":85},"ContemporaryEra":{"strategy_points_24h":15,"random_good_of_age_24h":86},"TomorrowEra":{"strategy_points_24h":15,"random_good_of_age_24h":87},"FutureEra":{"strategy_points_24h":15,"random_good_of_age_24h":87},"ArcticFuture":{"strategy_points_24h":15,"random_good_of_age_24h":88},"OceanicFuture":{"strategy_points_24h":15,"random_good_of_age_24h":88},"VirtualFuture":{"strategy_points_24h":16,"random_good_of_age_24h":89},"SpaceAgeMars":{"strategy_points_24h":16,"random_good_of_age_24h":90},"SpaceAgeAsteroidBelt":{"strategy_points_24h":16,"random_good_of_age_24h":90},"SpaceAgeVenus":{"strategy_points_24h":16,"random_good_of_age_24h":91},"SpaceAgeJupiterMoon":{"strategy_points_24h":16,"random_good_of_age_24h":91},"SpaceAgeTitan":{"strategy_points_24h":17,"random_good_of_age_24h":92},"SpaceAgeSpaceHub":{"strategy_points_24h":17,"random_good_of_age_24h":92}}, boosts: [{"type":"att_def_boost_attacker","value":24,"feature":"all"},{"type":"att_def_boost_attacker","value":14,"feature":"battleground"},{"type":"att_def_boost_attacker","value":19,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":24,"feature":"all"},{"type":"att_def_boost_defender","value":14,"feature":"battleground"},{"type":"att_def_boost_defender","value":19,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR23A8": { prod: {"BronzeAge":{"strategy_points_24h":18,"random_good_of_age_24h":96},"IronAge":{"strategy_points_24h":18,"random_good_of_age_24h":97},"EarlyMiddleAge":{"strategy_points_24h":18,"random_good_of_age_24h":97},"HighMiddleAge":{"strategy_points_24h":18,"random_good_of_age_24h":98},"LateMiddleAge":{"strategy_points_24h":19,"random_good_of_age_24h":99},"ColonialAge":{"strategy_points_24h":19,"random_good_of_age_24h":100},"IndustrialAge":{"strategy_points_24h":19,"random_good_of_age_24h":100},"ProgressiveEra":{"strategy_points_24h":19,"random_good_of_age_24h":101},"ModernEra":{"strategy_points_24h":20,"random_good_of_age_24h":102},"PostModernEra":{"strategy_points_24h":20,"random_good_of_age_24h":102},"ContemporaryEra":{"strategy_points_24h":20,"random_good_of_age_24h":103},"TomorrowEra":{"strategy_points_24h":21,"random_good_of_age_24h":104},"FutureEra":{"strategy_points_24h":21,"random_good_of_age_24h":105},"ArcticFuture":{"strategy_points_24h":21,"random_good_of_age_24h":105},"OceanicFuture":{"strategy_points_24h":21,"random_good_of_age_24h":106},"VirtualFuture":{"strategy_points_24h":22,"random_good_of_age_24h":107},"SpaceAgeMars":{"strategy_points_24h":22,"random_good_of_age_24h":108},"SpaceAgeAsteroidBelt":{"strategy_points_24h":22,"random_good_of_age_24h":108},"SpaceAgeVenus":{"strategy_points_24h":22,"random_good_of_age_24h":109},"SpaceAgeJupiterMoon":{"strategy_points_24h":23,"random_good_of_age_24h":110},"SpaceAgeTitan":{"strategy_points_24h":23,"random_good_of_age_24h":110},"SpaceAgeSpaceHub":{"strategy_points_24h":23,"random_good_of_age_24h":110}}, boosts: [{"type":"att_def_boost_attacker","value":28,"feature":"all"},{"type":"att_def_boost_attacker","value":19,"feature":"battleground"},{"type":"att_def_boost_attacker","value":26,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":28,"feature":"all"},{"type":"att_def_boost_defender","value":19,"feature":"battleground"},{"type":"att_def_boost_defender","value":26,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR23A9": { prod: {"BronzeAge":{"strategy_points_24h":19,"random_good_of_age_24h":128},"IronAge":{"strategy_points_24h":19,"random_good_of_age_24h":129},"EarlyMiddleAge":{"strategy_points_24h":20,"random_good_of_age_24h":130},"HighMiddleAge":{"strategy_points_24h":20,"random_good_of_age_24h":131},"LateMiddleAge":{"strategy_points_24h":20,"random_good_of_age_24h":132},"ColonialAge":{"strategy_points_24h":21,"random_good_of_age_24h":133},"IndustrialAge":{"strategy_points_24h":21,"random_good_of_age_24h":134},"ProgressiveEra":{"strategy_points_24h":21,"random_good_of_age_24h":135},"ModernEra":{"strategy_points_24h":22,"random_good_of_age_24h":136},"PostModernEra":{"strategy_points_24h":22,"random_good_of_age_24h":137},"ContemporaryEra":{"strategy_points_24h":22,"random_good_of_age_24h":138},"TomorrowEra":{"strategy_points_24h":22,"random_good_of_age_24h":139},"FutureEra":{"strategy_points_24h":23,"random_good_of_age_24h":140},"ArcticFuture":{"strategy_points_24h":23,"random_good_of_age_24h":140},"OceanicFuture":{"strategy_points_24h":23,"random_good_of_age_24h":141},"VirtualFuture":{"strategy_points_24h":24,"random_good_of_age_24h":142},"SpaceAgeMars":{"strategy_points_24h":24,"random_good_of_age_24h":143},"SpaceAgeAsteroidBelt":{"strategy_points_24h":24,"random_good_of_age_24h":144},"SpaceAgeVenus":{"strategy_points_24h":24,"random_good_of_age_24h":145},"SpaceAgeJupiterMoon":{"strategy_points_24h":25,"random_good_of_age_24h":146},"SpaceAgeTitan":{"strategy_points_24h":25,"random_good_of_age_24h":147},"SpaceAgeSpaceHub":{"strategy_points_24h":25,"random_good_of_age_24h":148}}, boosts: [{"type":"att_def_boost_attacker","value":30,"feature":"all"},{"type":"att_def_boost_attacker","value":24,"feature":"battleground"},{"type":"att_def_boost_attacker","value":32,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":30,"feature":"all"},{"type":"att_def_boost_defender","value":24,"feature":"battleground"},{"type":"att_def_boost_defender","value":32,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR25C9b": { prod: {"BronzeAge":{"strategy_points_24h":120,"random_good_of_age_24h":240,"units_24h":40},"IronAge":{"strategy_points_24h":120,"random_good_of_age_24h":240,"units_24h":40},"EarlyMiddleAge":{"strategy_points_24h":122,"random_good_of_age_24h":242,"units_24h":40},"HighMiddleAge":{"strategy_points_24h":124,"random_good_of_age_24h":244,"units_24h":40},"LateMiddleAge":{"strategy_points_24h":125,"random_good_of_age_24h":245,"units_24h":40},"ColonialAge":{"strategy_points_24h":127,"random_good_of_age_24h":247,"units_24h":40},"IndustrialAge":{"strategy_points_24h":129,"random_good_of_age_24h":249,"units_24h":40},"ProgressiveEra":{"strategy_points_24h":131,"random_good_of_age_24h":251,"units_24h":40},"ModernEra":{"strategy_points_24h":133,"random_good_of_age_24h":253,"units_24h":40},"PostModernEra":{"strategy_points_24h":134,"random_good_of_age_24h":254,"units_24h":40},"ContemporaryEra":{"strategy_points_24h":136,"random_good_of_age_24h":256,"units_24h":40},"TomorrowEra":{"strategy_points_24h":138,"random_good_of_age_24h":258,"units_24h":40},"FutureEra":{"strategy_points_24h":140,"random_good_of_age_24h":260,"units_24h":40},"ArcticFuture":{"strategy_points_24h":142,"random_good_of_age_24h":262,"units_24h":40},"OceanicFuture":{"strategy_points_24h":143,"random_good_of_age_24h":263,"units_24h":40},"VirtualFuture":{"strategy_points_24h":145,"random_good_of_age_24h":265,"units_24h":40},"SpaceAgeMars":{"strategy_points_24h":147,"random_good_of_age_24h":267,"units_24h":40},"SpaceAgeAsteroidBelt":{"strategy_points_24h":149,"random_good_of_age_24h":269,"units_24h":40},"SpaceAgeVenus":{"strategy_points_24h":151,"random_good_of_age_24h":271,"units_24h":40},"SpaceAgeJupiterMoon":{"strategy_points_24h":152,"random_good_of_age_24h":272,"units_24h":40},"SpaceAgeTitan":{"strategy_points_24h":154,"random_good_of_age_24h":274,"units_24h":40},"SpaceAgeSpaceHub":{"strategy_points_24h":156,"random_good_of_age_24h":276,"units_24h":40}}, boosts: [{"type":"att_def_boost_attacker_defender","value":200,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":200,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR25C10b": { prod: {"BronzeAge":{"strategy_points_24h":140,"random_good_of_age_24h":280,"units_24h":60},"IronAge":{"strategy_points_24h":140,"random_good_of_age_24h":280,"units_24h":60},"EarlyMiddleAge":{"strategy_points_24h":142,"random_good_of_age_24h":282,"units_24h":60},"HighMiddleAge":{"strategy_points_24h":144,"random_good_of_age_24h":284,"units_24h":60},"LateMiddleAge":{"strategy_points_24h":146,"random_good_of_age_24h":286,"units_24h":60},"ColonialAge":{"strategy_points_24h":148,"random_good_of_age_24h":288,"units_24h":60},"IndustrialAge":{"strategy_points_24h":151,"random_good_of_age_24h":291,"units_24h":60},"ProgressiveEra":{"strategy_points_24h":153,"random_good_of_age_24h":293,"units_24h":60},"ModernEra":{"strategy_points_24h":155,"random_good_of_age_24h":295,"units_24h":60},"PostModernEra":{"strategy_points_24h":157,"random_good_of_age_24h":297,"units_24h":60},"ContemporaryEra":{"strategy_points_24h":159,"random_good_of_age_24h":299,"units_24h":60},"TomorrowEra":{"strategy_points_24h":161,"random_good_of_age_24h":301,"units_24h":60},"FutureEra":{"strategy_points_24h":163,"random_good_of_age_24h":303,"units_24h":60},"ArcticFuture":{"strategy_points_24h":165,"random_good_of_age_24h":305,"units_24h":60},"OceanicFuture":{"strategy_points_24h":167,"random_good_of_age_24h":307,"units_24h":60},"VirtualFuture":{"strategy_points_24h":169,"random_good_of_age_24h":309,"units_24h":60},"SpaceAgeMars":{"strategy_points_24h":172,"random_good_of_age_24h":312,"units_24h":60},"SpaceAgeAsteroidBelt":{"strategy_points_24h":174,"random_good_of_age_24h":314,"units_24h":60},"SpaceAgeVenus":{"strategy_points_24h":176,"random_good_of_age_24h":316,"units_24h":60},"SpaceAgeJupiterMoon":{"strategy_points_24h":178,"random_good_of_age_24h":318,"units_24h":60},"SpaceAgeTitan":{"strategy_points_24h":180,"random_good_of_age_24h":320,"units_24h":60},"SpaceAgeSpaceHub":{"strategy_points_24h":182,"random_good_of_age_24h":322,"units_24h":60}}, boosts: [{"type":"att_def_boost_attacker_defender","value":225,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":320,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR25F1": { prod: {"BronzeAge":{"random_good_of_age_24h":24},"IronAge":{"random_good_of_age_24h":24},"EarlyMiddleAge":{"random_good_of_age_24h":24},"HighMiddleAge":{"random_good_of_age_24h":24},"LateMiddleAge":{"random_good_of_age_24h":25},"ColonialAge":{"random_good_of_age_24h":25},"IndustrialAge":{"random_good_of_age_24h":25},"ProgressiveEra":{"random_good_of_age_24h":25},"ModernEra":{"random_good_of_age_24h":25},"PostModernEra":{"random_good_of_age_24h":25},"ContemporaryEra":{"random_good_of_age_24h":26},"TomorrowEra":{"random_good_of_age_24h":26},"FutureEra":{"random_good_of_age_24h":26},"ArcticFuture":{"random_good_of_age_24h":26},"OceanicFuture":{"random_good_of_age_24h":26},"VirtualFuture":{"random_good_of_age_24h":27},"SpaceAgeMars":{"random_good_of_age_24h":27},"SpaceAgeAsteroidBelt":{"random_good_of_age_24h":27},"SpaceAgeVenus":{"random_good_of_age_24h":27},"SpaceAgeJupiterMoon":{"random_good_of_age_24h":27},"SpaceAgeTitan":{"random_good_of_age_24h":27},"SpaceAgeSpaceHub":{"random_good_of_age_24h":28}}, boosts: [{"type":"att_def_boost_attacker_defender","value":19,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":27,"feature":"battleground"},{"type":"att_def_boost_defender","value":27,"feature":"battleground"}] },
+    "W_MultiAge_GR25F2": { prod: {"BronzeAge":{"random_good_of_age_24h":36},"IronAge":{"random_good_of_age_24h":36},"EarlyMiddleAge":{"random_good_of_age_24h":36},"HighMiddleAge":{"random_good_of_age_24h":37},"LateMiddleAge":{"random_good_of_age_24h":37},"ColonialAge":{"random_good_of_age_24h":37},"IndustrialAge":{"random_good_of_age_24h":37},"ProgressiveEra":{"random_good_of_age_24h":38},"ModernEra":{"random_good_of_age_24h":38},"PostModernEra":{"random_good_of_age_24h":38},"ContemporaryEra":{"random_good_of_age_24h":38},"TomorrowEra":{"random_good_of_age_24h":39},"FutureEra":{"random_good_of_age_24h":39},"ArcticFuture":{"random_good_of_age_24h":39},"OceanicFuture":{"random_good_of_age_24h":40},"VirtualFuture":{"random_good_of_age_24h":40},"SpaceAgeMars":{"random_good_of_age_24h":40},"SpaceAgeAsteroidBelt":{"random_good_of_age_24h":40},"SpaceAgeVenus":{"random_good_of_age_24h":41},"SpaceAgeJupiterMoon":{"random_good_of_age_24h":41},"SpaceAgeTitan":{"random_good_of_age_24h":41},"SpaceAgeSpaceHub":{"random_good_of_age_24h":41}}, boosts: [{"type":"att_def_boost_attacker_defender","value":23,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":32,"feature":"battleground"},{"type":"att_def_boost_defender","value":32,"feature":"battleground"}] },
+    "W_MultiAge_GR25C9a": { prod: {"BronzeAge":{"strategy_points_24h":120,"random_good_of_age_24h":240,"units_24h":40},"IronAge":{"strategy_points_24h":120,"random_good_of_age_24h":240,"units_24h":40},"EarlyMiddleAge":{"strategy_points_24h":122,"random_good_of_age_24h":242,"units_24h":40},"HighMiddleAge":{"strategy_points_24h":124,"random_good_of_age_24h":244,"units_24h":40},"LateMiddleAge":{"strategy_points_24h":125,"random_good_of_age_24h":245,"units_24h":40},"ColonialAge":{"strategy_points_24h":127,"random_good_of_age_24h":247,"units_24h":40},"IndustrialAge":{"strategy_points_24h":129,"random_good_of_age_24h":249,"units_24h":40},"ProgressiveEra":{"strategy_points_24h":131,"random_good_of_age_24h":251,"units_24h":40},"ModernEra":{"strategy_points_24h":133,"random_good_of_age_24h":253,"units_24h":40},"PostModernEra":{"strategy_points_24h":134,"random_good_of_age_24h":254,"units_24h":40},"ContemporaryEra":{"strategy_points_24h":136,"random_good_of_age_24h":256,"units_24h":40},"TomorrowEra":{"strategy_points_24h":138,"random_good_of_age_24h":258,"units_24h":40},"FutureEra":{"strategy_points_24h":140,"random_good_of_age_24h":260,"units_24h":40},"ArcticFuture":{"strategy_points_24h":142,"random_good_of_age_24h":262,"units_24h":40},"OceanicFuture":{"strategy_points_24h":143,"random_good_of_age_24h":263,"units_24h":40},"VirtualFuture":{"strategy_points_24h":145,"random_good_of_age_24h":265,"units_24h":40},"SpaceAgeMars":{"strategy_points_24h":147,"random_good_of_age_24h":267,"units_24h":40},"SpaceAgeAsteroidBelt":{"strategy_points_24h":149,"random_good_of_age_24h":269,"units_24h":40},"SpaceAgeVenus":{"strategy_points_24h":151,"random_good_of_age_24h":271,"units_24h":40},"SpaceAgeJupiterMoon":{"strategy_points_24h":152,"random_good_of_age_24h":272,"units_24h":40},"SpaceAgeTitan":{"strategy_points_24h":154,"random_good_of_age_24h":274,"units_24h":40},"SpaceAgeSpaceHub":{"strategy_points_24h":156,"random_good_of_age_24h":276,"units_24h":40}}, boosts: [{"type":"att_def_boost_attacker_defender","value":200,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":90,"feature":"battleground"}] },
+    "W_MultiAge_GR25C10a": { prod: {"BronzeAge":{"strategy_points_24h":140,"random_good_of_age_24h":280,"units_24h":60},"IronAge":{"strategy_points_24h":140,"random_good_of_age_24h":280,"units_24h":60},"EarlyMiddleAge":{"strategy_points_24h":142,"random_good_of_age_24h":282,"units_24h":60},"HighMiddleAge":{"strategy_points_24h":144,"random_good_of_age_24h":284,"units_24h":60},"LateMiddleAge":{"strategy_points_24h":146,"random_good_of_age_24h":286,"units_24h":60},"ColonialAge":{"strategy_points_24h":148,"random_good_of_age_24h":288,"units_24h":60},"IndustrialAge":{"strategy_points_24h":151,"random_good_of_age_24h":291,"units_24h":60},"ProgressiveEra":{"strategy_points_24h":153,"random_good_of_age_24h":293,"units_24h":60},"ModernEra":{"strategy_points_24h":155,"random_good_of_age_24h":295,"units_24h":60},"PostModernEra":{"strategy_points_24h":157,"random_good_of_age_24h":297,"units_24h":60},"ContemporaryEra":{"strategy_points_24h":159,"random_good_of_age_24h":299,"units_24h":60},"TomorrowEra":{"strategy_points_24h":161,"random_good_of_age_24h":301,"units_24h":60},"FutureEra":{"strategy_points_24h":163,"random_good_of_age_24h":303,"units_24h":60},"ArcticFuture":{"strategy_points_24h":165,"random_good_of_age_24h":305,"units_24h":60},"OceanicFuture":{"strategy_points_24h":167,"random_good_of_age_24h":307,"units_24h":60},"VirtualFuture":{"strategy_points_24h":169,"random_good_of_age_24h":309,"units_24h":60},"SpaceAgeMars":{"strategy_points_24h":172,"random_good_of_age_24h":312,"units_24h":60},"SpaceAgeAsteroidBelt":{"strategy_points_24h":174,"random_good_of_age_24h":314,"units_24h":60},"SpaceAgeVenus":{"strategy_points_24h":176,"random_good_of_age_24h":316,"units_24h":60},"SpaceAgeJupiterMoon":{"strategy_points_24h":178,"random_good_of_age_24h":318,"units_24h":60},"SpaceAgeTitan":{"strategy_points_24h":180,"random_good_of_age_24h":320,"units_24h":60},"SpaceAgeSpaceHub":{"strategy_points_24h":182,"random_good_of_age_24h":322,"units_24h":60}}, boosts: [{"type":"att_def_boost_attacker_defender","value":225,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":143,"feature":"battleground"}] },
+    "W_MultiAge_GR26A1": { prod: {"BronzeAge":{"strategy_points_24h":61},"IronAge":{"strategy_points_24h":61},"EarlyMiddleAge":{"strategy_points_24h":62},"HighMiddleAge":{"strategy_points_24h":63},"LateMiddleAge":{"strategy_points_24h":64},"ColonialAge":{"strategy_points_24h":65},"IndustrialAge":{"strategy_points_24h":66},"ProgressiveEra":{"strategy_points_24h":67},"ModernEra":{"strategy_points_24h":68},"PostModernEra":{"strategy_points_24h":69},"ContemporaryEra":{"strategy_points_24h":69},"TomorrowEra":{"strategy_points_24h":70},"FutureEra":{"strategy_points_24h":71},"ArcticFuture":{"strategy_points_24h":72},"OceanicFuture":{"strategy_points_24h":73},"VirtualFuture":{"strategy_points_24h":74},"SpaceAgeMars":{"strategy_points_24h":75},"SpaceAgeAsteroidBelt":{"strategy_points_24h":76},"SpaceAgeVenus":{"strategy_points_24h":77},"SpaceAgeJupiterMoon":{"strategy_points_24h":78},"SpaceAgeTitan":{"strategy_points_24h":79},"SpaceAgeSpaceHub":{"strategy_points_24h":80}}, boosts: [{"type":"att_def_boost_attacker","value":57,"feature":"all"},{"type":"att_def_boost_attacker","value":61,"feature":"battleground"},{"type":"att_def_boost_attacker","value":115,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR26A2": { prod: {"BronzeAge":{"strategy_points_24h":73},"IronAge":{"strategy_points_24h":73},"EarlyMiddleAge":{"strategy_points_24h":74},"HighMiddleAge":{"strategy_points_24h":75},"LateMiddleAge":{"strategy_points_24h":76},"ColonialAge":{"strategy_points_24h":77},"IndustrialAge":{"strategy_points_24h":78},"ProgressiveEra":{"strategy_points_24h":79},"ModernEra":{"strategy_points_24h":81},"PostModernEra":{"strategy_points_24h":82},"ContemporaryEra":{"strategy_points_24h":83},"TomorrowEra":{"strategy_points_24h":84},"FutureEra":{"strategy_points_24h":85},"ArcticFuture":{"strategy_points_24h":86},"OceanicFuture":{"strategy_points_24h":87},"VirtualFuture":{"strategy_points_24h":88},"SpaceAgeMars":{"strategy_points_24h":89},"SpaceAgeAsteroidBelt":{"strategy_points_24h":90},"SpaceAgeVenus":{"strategy_points_24h":91},"SpaceAgeJupiterMoon":{"strategy_points_24h":93},"SpaceAgeTitan":{"strategy_points_24h":94},"SpaceAgeSpaceHub":{"strategy_points_24h":95}}, boosts: [{"type":"att_def_boost_attacker","value":71,"feature":"all"},{"type":"att_def_boost_attacker","value":78,"feature":"battleground"},{"type":"att_def_boost_attacker","value":135,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR25C1": { prod: {"BronzeAge":{"strategy_points_24h":20,"random_good_of_age_24h":40},"IronAge":{"strategy_points_24h":20,"random_good_of_age_24h":40},"EarlyMiddleAge":{"strategy_points_24h":20,"random_good_of_age_24h":40},"HighMiddleAge":{"strategy_points_24h":21,"random_good_of_age_24h":41},"LateMiddleAge":{"strategy_points_24h":21,"random_good_of_age_24h":41},"ColonialAge":{"strategy_points_24h":21,"random_good_of_age_24h":41},"IndustrialAge":{"strategy_points_24h":22,"random_good_of_age_24h":42},"ProgressiveEra":{"strategy_points_24h":22,"random_good_of_age_24h":42},"ModernEra":{"strategy_points_24h":22,"random_good_of_age_24h":42},"PostModernEra":{"strategy_points_24h":22,"random_good_of_age_24h":42},"ContemporaryEra":{"strategy_points_24h":23,"random_good_of_age_24h":43},"TomorrowEra":{"strategy_points_24h":23,"random_good_of_age_24h":43},"FutureEra":{"strategy_points_24h":23,"random_good_of_age_24h":43},"ArcticFuture":{"strategy_points_24h":24,"random_good_of_age_24h":44},"OceanicFuture":{"strategy_points_24h":24,"random_good_of_age_24h":44},"VirtualFuture":{"strategy_points_24h":24,"random_good_of_age_24h":44},"SpaceAgeMars":{"strategy_points_24h":25,"random_good_of_age_24h":45},"SpaceAgeAsteroidBelt":{"strategy_points_24h":25,"random_good_of_age_24h":45},"SpaceAgeVenus":{"strategy_points_24h":25,"random_good_of_age_24h":45},"SpaceAgeJupiterMoon":{"strategy_points_24h":25,"random_good_of_age_24h":45},"SpaceAgeTitan":{"strategy_points_24h":26,"random_good_of_age_24h":46},"SpaceAgeSpaceHub":{"strategy_points_24h":26,"random_good_of_age_24h":46}}, boosts: [{"type":"att_def_boost_attacker_defender","value":25,"feature":"all"}] },
+    "W_MultiAge_GR25C2": { prod: {"BronzeAge":{"strategy_points_24h":30,"random_good_of_age_24h":60},"IronAge":{"strategy_points_24h":30,"random_good_of_age_24h":60},"EarlyMiddleAge":{"strategy_points_24h":30,"random_good_of_age_24h":60},"HighMiddleAge":{"strategy_points_24h":31,"random_good_of_age_24h":61},"LateMiddleAge":{"strategy_points_24h":31,"random_good_of_age_24h":61},"ColonialAge":{"strategy_points_24h":32,"random_good_of_age_24h":62},"IndustrialAge":{"strategy_points_24h":32,"random_good_of_age_24h":62},"ProgressiveEra":{"strategy_points_24h":33,"random_good_of_age_24h":63},"ModernEra":{"strategy_points_24h":33,"random_good_of_age_24h":63},"PostModernEra":{"strategy_points_24h":34,"random_good_of_age_24h":64},"ContemporaryEra":{"strategy_points_24h":34,"random_good_of_age_24h":64},"TomorrowEra":{"strategy_points_24h":35,"random_good_of_age_24h":65},"FutureEra":{"strategy_points_24h":35,"random_good_of_age_24h":65},"ArcticFuture":{"strategy_points_24h":35,"random_good_of_age_24h":65},"OceanicFuture":{"strategy_points_24h":36,"random_good_of_age_24h":66},"VirtualFuture":{"strategy_points_24h":36,"random_good_of_age_24h":66},"SpaceAgeMars":{"strategy_points_24h":37,"random_good_of_age_24h":67},"SpaceAgeAsteroidBelt":{"strategy_points_24h":37,"random_good_of_age_24h":67},"SpaceAgeVenus":{"strategy_points_24h":38,"random_good_of_age_24h":68},"SpaceAgeJupiterMoon":{"strategy_points_24h":38,"random_good_of_age_24h":68},"SpaceAgeTitan":{"strategy_points_24h":39,"random_good_of_age_24h":69},"SpaceAgeSpaceHub":{"strategy_points_24h":39,"random_good_of_age_24h":69}}, boosts: [{"type":"att_def_boost_attacker_defender","value":38,"feature":"all"}] },
+    "W_MultiAge_GR25C3": { prod: {"BronzeAge":{"strategy_points_24h":40,"random_good_of_age_24h":80},"IronAge":{"strategy_points_24h":40,"random_good_of_age_24h":80},"EarlyMiddleAge":{"strategy_points_24h":41,"random_good_of_age_24h":81},"HighMiddleAge":{"strategy_points_24h":41,"random_good_of_age_24h":81},"LateMiddleAge":{"strategy_points_24h":42,"random_good_of_age_24h":82},"ColonialAge":{"strategy_points_24h":42,"random_good_of_age_24h":82},"IndustrialAge":{"strategy_points_24h":43,"random_good_of_age_24h":83},"ProgressiveEra":{"strategy_points_24h":44,"random_good_of_age_24h":84},"ModernEra":{"strategy_points_24h":44,"random_good_of_age_24h":84},"PostModernEra":{"strategy_points_24h":45,"random_good_of_age_24h":85},"ContemporaryEra":{"strategy_points_24h":45,"random_good_of_age_24h":85},"TomorrowEra":{"strategy_points_24h":46,"random_good_of_age_24h":86},"FutureEra":{"strategy_points_24h":47,"random_good_of_age_24h":87},"ArcticFuture":{"strategy_points_24h":47,"random_good_of_age_24h":87},"OceanicFuture":{"strategy_points_24h":48,"random_good_of_age_24h":88},"VirtualFuture":{"strategy_points_24h":48,"random_good_of_age_24h":88},"SpaceAgeMars":{"strategy_points_24h":49,"random_good_of_age_24h":89},"SpaceAgeAsteroidBelt":{"strategy_points_24h":50,"random_good_of_age_24h":90},"SpaceAgeVenus":{"strategy_points_24h":50,"random_good_of_age_24h":90},"SpaceAgeJupiterMoon":{"strategy_points_24h":51,"random_good_of_age_24h":91},"SpaceAgeTitan":{"strategy_points_24h":51,"random_good_of_age_24h":91},"SpaceAgeSpaceHub":{"strategy_points_24h":52,"random_good_of_age_24h":92}}, boosts: [{"type":"att_def_boost_attacker_defender","value":50,"feature":"all"}] },
+    "W_MultiAge_GR25C4": { prod: {"BronzeAge":{"strategy_points_24h":50,"random_good_of_age_24h":100},"IronAge":{"strategy_points_24h":50,"random_good_of_age_24h":100},"EarlyMiddleAge":{"strategy_points_24h":51,"random_good_of_age_24h":101},"HighMiddleAge":{"strategy_points_24h":52,"random_good_of_age_24h":102},"LateMiddleAge":{"strategy_points_24h":52,"random_good_of_age_24h":102},"ColonialAge":{"strategy_points_24h":53,"random_good_of_age_24h":103},"IndustrialAge":{"strategy_points_24h":54,"random_good_of_age_24h":104},"ProgressiveEra":{"strategy_points_24h":55,"random_good_of_age_24h":105},"ModernEra":{"strategy_points_24h":55,"random_good_of_age_24h":105},"PostModernEra":{"strategy_points_24h":56,"random_good_of_age_24h":106},"ContemporaryEra":{"strategy_points_24h":57,"random_good_of_age_24h":107},"TomorrowEra":{"strategy_points_24h":57,"random_good_of_age_24h":108},"FutureEra":{"strategy_points_24h":58,"random_good_of_age_24h":108},"ArcticFuture":{"strategy_points_24h":59,"random_good_of_age_24h":109},"OceanicFuture":{"strategy_points_24h":60,"random_good_of_age_24h":110},"VirtualFuture":{"strategy_points_24h":60,"random_good_of_age_24h":111},"SpaceAgeMars":{"strategy_points_24h":61,"random_good_of_age_24h":111},"SpaceAgeAsteroidBelt":{"strategy_points_24h":62,"random_good_of_age_24h":112},"SpaceAgeVenus":{"strategy_points_24h":63,"random_good_of_age_24h":113},"SpaceAgeJupiterMoon":{"strategy_points_24h":63,"random_good_of_age_24h":114},"SpaceAgeTitan":{"strategy_points_24h":64,"random_good_of_age_24h":114},"SpaceAgeSpaceHub":{"strategy_points_24h":65,"random_good_of_age_24h":115}}, boosts: [{"type":"att_def_boost_attacker_defender","value":63,"feature":"all"}] },
+    "W_MultiAge_GR25C5": { prod: {"BronzeAge":{"strategy_points_24h":60,"random_good_of_age_24h":120,"units_24h":10},"IronAge":{"strategy_points_24h":60,"random_good_of_age_24h":120,"units_24h":10},"EarlyMiddleAge":{"strategy_points_24h":61,"random_good_of_age_24h":121,"units_24h":10},"HighMiddleAge":{"strategy_points_24h":62,"random_good_of_age_24h":122,"units_24h":10},"LateMiddleAge":{"strategy_points_24h":63,"random_good_of_age_24h":123,"units_24h":10},"ColonialAge":{"strategy_points_24h":64,"random_good_of_age_24h":124,"units_24h":10},"IndustrialAge":{"strategy_points_24h":65,"random_good_of_age_24h":125,"units_24h":10},"ProgressiveEra":{"strategy_points_24h":65,"random_good_of_age_24h":125,"units_24h":10},"ModernEra":{"strategy_points_24h":66,"random_good_of_age_24h":126,"units_24h":10},"PostModernEra":{"strategy_points_24h":67,"random_good_of_age_24h":127,"units_24h":10},"ContemporaryEra":{"strategy_points_24h":68,"random_good_of_age_24h":128,"units_24h":10},"TomorrowEra":{"strategy_points_24h":69,"random_good_of_age_24h":129,"units_24h":10},"FutureEra":{"strategy_points_24h":70,"random_good_of_age_24h":130,"units_24h":10},"ArcticFuture":{"strategy_points_24h":71,"random_good_of_age_24h":131,"units_24h":10},"OceanicFuture":{"strategy_points_24h":72,"random_good_of_age_24h":132,"units_24h":10},"VirtualFuture":{"strategy_points_24h":73,"random_good_of_age_24h":133,"units_24h":10},"SpaceAgeMars":{"strategy_points_24h":73,"random_good_of_age_24h":134,"units_24h":10},"SpaceAgeAsteroidBelt":{"strategy_points_24h":74,"random_good_of_age_24h":134,"units_24h":10},"SpaceAgeVenus":{"strategy_points_24h":75,"random_good_of_age_24h":135,"units_24h":10},"SpaceAgeJupiterMoon":{"strategy_points_24h":76,"random_good_of_age_24h":136,"units_24h":10},"SpaceAgeTitan":{"strategy_points_24h":77,"random_good_of_age_24h":137,"units_24h":10},"SpaceAgeSpaceHub":{"strategy_points_24h":78,"random_good_of_age_24h":138,"units_24h":10}}, boosts: [{"type":"att_def_boost_attacker_defender","value":75,"feature":"all"}] },
+    "W_MultiAge_GR25C6": { prod: {"BronzeAge":{"strategy_points_24h":70,"random_good_of_age_24h":140,"units_24h":15},"IronAge":{"strategy_points_24h":70,"random_good_of_age_24h":140,"units_24h":15},"EarlyMiddleAge":{"strategy_points_24h":71,"random_good_of_age_24h":141,"units_24h":15},"HighMiddleAge":{"strategy_points_24h":72,"random_good_of_age_24h":142,"units_24h":15},"LateMiddleAge":{"strategy_points_24h":73,"random_good_of_age_24h":143,"units_24h":15},"ColonialAge":{"strategy_points_24h":74,"random_good_of_age_24h":144,"units_24h":15},"IndustrialAge":{"strategy_points_24h":75,"random_good_of_age_24h":145,"units_24h":15},"ProgressiveEra":{"strategy_points_24h":76,"random_good_of_age_24h":146,"units_24h":15},"ModernEra":{"strategy_points_24h":77,"random_good_of_age_24h":147,"units_24h":15},"PostModernEra":{"strategy_points_24h":78,"random_good_of_age_24h":148,"units_24h":15},"ContemporaryEra":{"strategy_points_24h":79,"random_good_of_age_24h":149,"units_24h":15},"TomorrowEra":{"strategy_points_24h":80,"random_good_of_age_24h":151,"units_24h":15},"FutureEra":{"strategy_points_24h":82,"random_good_of_age_24h":152,"units_24h":15},"ArcticFuture":{"strategy_points_24h":83,"random_good_of_age_24h":153,"units_24h":15},"OceanicFuture":{"strategy_points_24h":84,"random_good_of_age_24h":154,"units_24h":15},"VirtualFuture":{"strategy_points_24h":85,"random_good_of_age_24h":155,"units_24h":15},"SpaceAgeMars":{"strategy_points_24h":86,"random_good_of_age_24h":156,"units_24h":15},"SpaceAgeAsteroidBelt":{"strategy_points_24h":87,"random_good_of_age_24h":157,"units_24h":15},"SpaceAgeVenus":{"strategy_points_24h":88,"random_good_of_age_24h":158,"units_24h":15},"SpaceAgeJupiterMoon":{"strategy_points_24h":89,"random_good_of_age_24h":159,"units_24h":15},"SpaceAgeTitan":{"strategy_points_24h":90,"random_good_of_age_24h":160,"units_24h":15},"SpaceAgeSpaceHub":{"strategy_points_24h":91,"random_good_of_age_24h":161,"units_24h":15}}, boosts: [{"type":"att_def_boost_attacker_defender","value":88,"feature":"all"}] },
+    "W_MultiAge_GR25C7": { prod: {"BronzeAge":{"strategy_points_24h":80,"random_good_of_age_24h":160,"units_24h":20},"IronAge":{"strategy_points_24h":80,"random_good_of_age_24h":160,"units_24h":20},"EarlyMiddleAge":{"strategy_points_24h":81,"random_good_of_age_24h":161,"units_24h":20},"HighMiddleAge":{"strategy_points_24h":82,"random_good_of_age_24h":162,"units_24h":20},"LateMiddleAge":{"strategy_points_24h":84,"random_good_of_age_24h":164,"units_24h":20},"ColonialAge":{"strategy_points_24h":85,"random_good_of_age_24h":165,"units_24h":20},"IndustrialAge":{"strategy_points_24h":86,"random_good_of_age_24h":166,"units_24h":20},"ProgressiveEra":{"strategy_points_24h":87,"random_good_of_age_24h":167,"units_24h":20},"ModernEra":{"strategy_points_24h":88,"random_good_of_age_24h":168,"units_24h":20},"PostModernEra":{"strategy_points_24h":90,"random_good_of_age_24h":170,"units_24h":20},"ContemporaryEra":{"strategy_points_24h":91,"random_good_of_age_24h":171,"units_24h":20},"TomorrowEra":{"strategy_points_24h":92,"random_good_of_age_24h":172,"units_24h":20},"FutureEra":{"strategy_points_24h":93,"random_good_of_age_24h":173,"units_24h":20},"ArcticFuture":{"strategy_points_24h":94,"random_good_of_age_24h":174,"units_24h":20},"OceanicFuture":{"strategy_points_24h":96,"random_good_of_age_24h":176,"units_24h":20},"VirtualFuture":{"strategy_points_24h":97,"random_good_of_age_24h":177,"units_24h":20},"SpaceAgeMars":{"strategy_points_24h":98,"random_good_of_age_24h":178,"units_24h":20},"SpaceAgeAsteroidBelt":{"strategy_points_24h":99,"random_good_of_age_24h":179,"units_24h":20},"SpaceAgeVenus":{"strategy_points_24h":100,"random_good_of_age_24h":180,"units_24h":20},"SpaceAgeJupiterMoon":{"strategy_points_24h":102,"random_good_of_age_24h":182,"units_24h":20},"SpaceAgeTitan":{"strategy_points_24h":103,"random_good_of_age_24h":183,"units_24h":20},"SpaceAgeSpaceHub":{"strategy_points_24h":104,"random_good_of_age_24h":184,"units_24h":20}}, boosts: [{"type":"att_def_boost_attacker_defender","value":100,"feature":"all"}] },
+    "W_MultiAge_GR25C8": { prod: {"BronzeAge":{"strategy_points_24h":100,"random_good_of_age_24h":200,"units_24h":40},"IronAge":{"strategy_points_24h":100,"random_good_of_age_24h":200,"units_24h":40},"EarlyMiddleAge":{"strategy_points_24h":102,"random_good_of_age_24h":202,"units_24h":40},"HighMiddleAge":{"strategy_points_24h":103,"random_good_of_age_24h":203,"units_24h":40},"LateMiddleAge":{"strategy_points_24h":105,"random_good_of_age_24h":205,"units_24h":40},"ColonialAge":{"strategy_points_24h":106,"random_good_of_age_24h":206,"units_24h":40},"IndustrialAge":{"strategy_points_24h":108,"random_good_of_age_24h":208,"units_24h":40},"ProgressiveEra":{"strategy_points_24h":109,"random_good_of_age_24h":209,"units_24h":40},"ModernEra":{"strategy_points_24h":111,"random_good_of_age_24h":211,"units_24h":40},"PostModernEra":{"strategy_points_24h":112,"random_good_of_age_24h":212,"units_24h":40},"ContemporaryEra":{"strategy_points_24h":114,"random_good_of_age_24h":214,"units_24h":40},"TomorrowEra":{"strategy_points_24h":115,"random_good_of_age_24h":215,"units_24h":40},"FutureEra":{"strategy_points_24h":117,"random_good_of_age_24h":217,"units_24h":40},"ArcticFuture":{"strategy_points_24h":118,"random_good_of_age_24h":218,"units_24h":40},"OceanicFuture":{"strategy_points_24h":120,"random_good_of_age_24h":220,"units_24h":40},"VirtualFuture":{"strategy_points_24h":121,"random_good_of_age_24h":221,"units_24h":40},"SpaceAgeMars":{"strategy_points_24h":123,"random_good_of_age_24h":223,"units_24h":40},"SpaceAgeAsteroidBelt":{"strategy_points_24h":124,"random_good_of_age_24h":224,"units_24h":40},"SpaceAgeVenus":{"strategy_points_24h":126,"random_good_of_age_24h":226,"units_24h":40},"SpaceAgeJupiterMoon":{"strategy_points_24h":127,"random_good_of_age_24h":227,"units_24h":40},"SpaceAgeTitan":{"strategy_points_24h":129,"random_good_of_age_24h":229,"units_24h":40},"SpaceAgeSpaceHub":{"strategy_points_24h":130,"random_good_of_age_24h":230,"units_24h":40}}, boosts: [{"type":"att_def_boost_attacker_defender","value":125,"feature":"all"}] },
+    "W_MultiAge_GR23D1": { prod: {"BronzeAge":{"strategy_points_24h":3,"random_good_of_previous_age_24h":45},"IronAge":{"strategy_points_24h":3,"random_good_of_previous_age_24h":45},"EarlyMiddleAge":{"strategy_points_24h":3,"random_good_of_previous_age_24h":46},"HighMiddleAge":{"strategy_points_24h":3,"random_good_of_previous_age_24h":46},"LateMiddleAge":{"strategy_points_24h":3,"random_good_of_previous_age_24h":46},"ColonialAge":{"strategy_points_24h":3,"random_good_of_previous_age_24h":47},"IndustrialAge":{"strategy_points_24h":3,"random_good_of_previous_age_24h":47},"ProgressiveEra":{"strategy_points_24h":3,"random_good_of_previous_age_24h":47},"ModernEra":{"strategy_points_24h":3,"random_good_of_previous_age_24h":48},"PostModernEra":{"strategy_points_24h":3,"random_good_of_previous_age_24h":48},"ContemporaryEra":{"strategy_points_24h":3,"random_good_of_previous_age_24h":48},"TomorrowEra":{"strategy_points_24h":3,"random_good_of_previous_age_24h":49},"FutureEra":{"strategy_points_24h":3,"random_good_of_previous_age_24h":49},"ArcticFuture":{"strategy_points_24h":3,"random_good_of_previous_age_24h":49},"OceanicFuture":{"strategy_points_24h":3,"random_good_of_previous_age_24h":50},"VirtualFuture":{"strategy_points_24h":3,"random_good_of_previous_age_24h":50},"SpaceAgeMars":{"strategy_points_24h":3,"random_good_of_previous_age_24h":50},"SpaceAgeAsteroidBelt":{"strategy_points_24h":3,"random_good_of_previous_age_24h":51},"SpaceAgeVenus":{"strategy_points_24h":3,"random_good_of_previous_age_24h":51},"SpaceAgeJupiterMoon":{"strategy_points_24h":3,"random_good_of_previous_age_24h":51},"SpaceAgeTitan":{"strategy_points_24h":3,"random_good_of_previous_age_24h":52},"SpaceAgeSpaceHub":{"strategy_points_24h":3,"random_good_of_previous_age_24h":52}}, boosts: [{"type":"att_def_boost_attacker","value":12,"feature":"all"},{"type":"att_def_boost_attacker","value":12,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":18,"feature":"all"},{"type":"att_def_boost_defender","value":18,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR23D2": { prod: {"BronzeAge":{"strategy_points_24h":11,"random_good_of_previous_age_24h":72},"IronAge":{"strategy_points_24h":11,"random_good_of_previous_age_24h":73},"EarlyMiddleAge":{"strategy_points_24h":11,"random_good_of_previous_age_24h":73},"HighMiddleAge":{"strategy_points_24h":11,"random_good_of_previous_age_24h":74},"LateMiddleAge":{"strategy_points_24h":11,"random_good_of_previous_age_24h":74},"ColonialAge":{"strategy_points_24h":11,"random_good_of_previous_age_24h":75},"IndustrialAge":{"strategy_points_24h":12,"random_good_of_previous_age_24h":75},"ProgressiveEra":{"strategy_points_24h":12,"random_good_of_previous_age_24h":76},"ModernEra":{"strategy_points_24h":12,"random_good_of_previous_age_24h":76},"PostModernEra":{"strategy_points_24h":12,"random_good_of_previous_age_24h":77},"ContemporaryEra":{"strategy_points_24h":12,"random_good_of_previous_age_24h":77},"TomorrowEra":{"strategy_points_24h":12,"random_good_of_previous_age_24h":78},"FutureEra":{"strategy_points_24h":13,"random_good_of_previous_age_24h":78},"ArcticFuture":{"strategy_points_24h":13,"random_good_of_previous_age_24h":79},"OceanicFuture":{"strategy_points_24h":13,"random_good_of_previous_age_24h":80},"VirtualFuture":{"strategy_points_24h":13,"random_good_of_previous_age_24h":80},"SpaceAgeMars":{"strategy_points_24h":13,"random_good_of_previous_age_24h":81},"SpaceAgeAsteroidBelt":{"strategy_points_24h":13,"random_good_of_previous_age_24h":81},"SpaceAgeVenus":{"strategy_points_24h":14,"random_good_of_previous_age_24h":82},"SpaceAgeJupiterMoon":{"strategy_points_24h":14,"random_good_of_previous_age_24h":82},"SpaceAgeTitan":{"strategy_points_24h":14,"random_good_of_previous_age_24h":83},"SpaceAgeSpaceHub":{"strategy_points_24h":14,"random_good_of_previous_age_24h":83}}, boosts: [{"type":"att_def_boost_attacker","value":16,"feature":"all"},{"type":"att_def_boost_attacker","value":16,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":22,"feature":"all"},{"type":"att_def_boost_defender","value":22,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR25D1": { prod: {"BronzeAge":{"random_good_of_age_24h":40,"strategy_points_24h":20},"IronAge":{"random_good_of_age_24h":40,"strategy_points_24h":20},"EarlyMiddleAge":{"random_good_of_age_24h":40,"strategy_points_24h":20},"HighMiddleAge":{"random_good_of_age_24h":41,"strategy_points_24h":21},"LateMiddleAge":{"random_good_of_age_24h":41,"strategy_points_24h":21},"ColonialAge":{"random_good_of_age_24h":41,"strategy_points_24h":21},"IndustrialAge":{"random_good_of_age_24h":42,"strategy_points_24h":22},"ProgressiveEra":{"random_good_of_age_24h":42,"strategy_points_24h":22},"ModernEra":{"random_good_of_age_24h":42,"strategy_points_24h":22},"PostModernEra":{"random_good_of_age_24h":42,"strategy_points_24h":22},"ContemporaryEra":{"random_good_of_age_24h":43,"strategy_points_24h":23},"TomorrowEra":{"random_good_of_age_24h":43,"strategy_points_24h":23},"FutureEra":{"random_good_of_age_24h":43,"strategy_points_24h":23},"ArcticFuture":{"random_good_of_age_24h":44,"strategy_points_24h":24},"OceanicFuture":{"random_good_of_age_24h":44,"strategy_points_24h":24},"VirtualFuture":{"random_good_of_age_24h":44,"strategy_points_24h":24},"SpaceAgeMars":{"random_good_of_age_24h":45,"strategy_points_24h":25},"SpaceAgeAsteroidBelt":{"random_good_of_age_24h":45,"strategy_points_24h":25},"SpaceAgeVenus":{"random_good_of_age_24h":45,"strategy_points_24h":25},"SpaceAgeJupiterMoon":{"random_good_of_age_24h":45,"strategy_points_24h":25},"SpaceAgeTitan":{"random_good_of_age_24h":46,"strategy_points_24h":26},"SpaceAgeSpaceHub":{"random_good_of_age_24h":46,"strategy_points_24h":26}}, boosts: [{"type":"att_def_boost_attacker","value":40,"feature":"all"},{"type":"att_def_boost_defender","value":35,"feature":"all"}] },
+    "W_MultiAge_GR25D2": { prod: {"BronzeAge":{"random_good_of_age_24h":48,"strategy_points_24h":24},"IronAge":{"random_good_of_age_24h":48,"strategy_points_24h":24},"EarlyMiddleAge":{"random_good_of_age_24h":48,"strategy_points_24h":24},"HighMiddleAge":{"random_good_of_age_24h":49,"strategy_points_24h":25},"LateMiddleAge":{"random_good_of_age_24h":49,"strategy_points_24h":25},"ColonialAge":{"random_good_of_age_24h":49,"strategy_points_24h":25},"IndustrialAge":{"random_good_of_age_24h":50,"strategy_points_24h":26},"ProgressiveEra":{"random_good_of_age_24h":50,"strategy_points_24h":26},"ModernEra":{"random_good_of_age_24h":51,"strategy_points_24h":27},"PostModernEra":{"random_good_of_age_24h":51,"strategy_points_24h":27},"ContemporaryEra":{"random_good_of_age_24h":51,"strategy_points_24h":27},"TomorrowEra":{"random_good_of_age_24h":52,"strategy_points_24h":28},"FutureEra":{"random_good_of_age_24h":52,"strategy_points_24h":28},"ArcticFuture":{"random_good_of_age_24h":52,"strategy_points_24h":28},"OceanicFuture":{"random_good_of_age_24h":53,"strategy_points_24h":29},"VirtualFuture":{"random_good_of_age_24h":53,"strategy_points_24h":29},"SpaceAgeMars":{"random_good_of_age_24h":53,"strategy_points_24h":29},"SpaceAgeAsteroidBelt":{"random_good_of_age_24h":54,"strategy_points_24h":30},"SpaceAgeVenus":{"random_good_of_age_24h":54,"strategy_points_24h":30},"SpaceAgeJupiterMoon":{"random_good_of_age_24h":54,"strategy_points_24h":30},"SpaceAgeTitan":{"random_good_of_age_24h":55,"strategy_points_24h":31},"SpaceAgeSpaceHub":{"random_good_of_age_24h":55,"strategy_points_24h":31}}, boosts: [{"type":"att_def_boost_attacker","value":45,"feature":"all"},{"type":"att_def_boost_defender","value":40,"feature":"all"}] },
+    "W_MultiAge_GR26D1": { boosts: [{"type":"att_def_boost_attacker_defender","value":52,"feature":"all"},{"type":"att_def_boost_attacker","value":61,"feature":"battleground"},{"type":"att_def_boost_defender","value":81,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR26D2": { boosts: [{"type":"att_def_boost_attacker_defender","value":61,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":81,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":108,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR23B1": { prod: {"BronzeAge":{"strategy_points_24h":6,"random_good_of_age_24h":36},"IronAge":{"strategy_points_24h":6,"random_good_of_age_24h":36},"EarlyMiddleAge":{"strategy_points_24h":6,"random_good_of_age_24h":37},"HighMiddleAge":{"strategy_points_24h":7,"random_good_of_age_24h":37},"LateMiddleAge":{"strategy_points_24h":7,"random_good_of_age_24h":37},"ColonialAge":{"strategy_points_24h":7,"random_good_of_age_24h":37},"IndustrialAge":{"strategy_points_24h":7,"random_good_of_age_24h":38},"ProgressiveEra":{"strategy_points_24h":7,"random_good_of_age_24h":38},"ModernEra":{"strategy_points_24h":7,"random_good_of_age_24h":38},"PostModernEra":{"strategy_points_24h":7,"random_good_of_age_24h":38},"ContemporaryEra":{"strategy_points_24h":7,"random_good_of_age_24h":39},"TomorrowEra":{"strategy_points_24h":7,"random_good_of_age_24h":39},"FutureEra":{"strategy_points_24h":7,"random_good_of_age_24h":39},"ArcticFuture":{"strategy_points_24h":8,"random_good_of_age_24h":40},"OceanicFuture":{"strategy_points_24h":8,"random_good_of_age_24h":40},"VirtualFuture":{"strategy_points_24h":8,"random_good_of_age_24h":40},"SpaceAgeMars":{"strategy_points_24h":8,"random_good_of_age_24h":40},"SpaceAgeAsteroidBelt":{"strategy_points_24h":8,"random_good_of_age_24h":41},"SpaceAgeVenus":{"strategy_points_24h":8,"random_good_of_age_24h":41},"SpaceAgeJupiterMoon":{"strategy_points_24h":8,"random_good_of_age_24h":41},"SpaceAgeTitan":{"strategy_points_24h":8,"random_good_of_age_24h":41},"SpaceAgeSpaceHub":{"strategy_points_24h":8,"random_good_of_age_24h":41}}, boosts: [{"type":"att_def_boost_attacker","value":10,"feature":"all"},{"type":"att_def_boost_attacker","value":10,"feature":"battleground"},{"type":"att_def_boost_defender","value":14,"feature":"all"},{"type":"att_def_boost_defender","value":14,"feature":"battleground"}] },
+    "W_MultiAge_GR23B2": { prod: {"BronzeAge":{"strategy_points_24h":13,"random_good_of_age_24h":63},"IronAge":{"strategy_points_24h":13,"random_good_of_age_24h":63},"EarlyMiddleAge":{"strategy_points_24h":13,"random_good_of_age_24h":64},"HighMiddleAge":{"strategy_points_24h":13,"random_good_of_age_24h":64},"LateMiddleAge":{"strategy_points_24h":13,"random_good_of_age_24h":65},"ColonialAge":{"strategy_points_24h":13,"random_good_of_age_24h":65},"IndustrialAge":{"strategy_points_24h":14,"random_good_of_age_24h":66},"ProgressiveEra":{"strategy_points_24h":14,"random_good_of_age_24h":66},"ModernEra":{"strategy_points_24h":14,"random_good_of_age_24h":67},"PostModernEra":{"strategy_points_24h":14,"random_good_of_age_24h":67},"ContemporaryEra":{"strategy_points_24h":14,"random_good_of_age_24h":68},"TomorrowEra":{"strategy_points_24h":14,"random_good_of_age_24h":68},"FutureEra":{"strategy_points_24h":15,"random_good_of_age_24h":69},"ArcticFuture":{"strategy_points_24h":15,"random_good_of_age_24h":69},"OceanicFuture":{"strategy_points_24h":15,"random_good_of_age_24h":70},"VirtualFuture":{"strategy_points_24h":15,"random_good_of_age_24h":70},"SpaceAgeMars":{"strategy_points_24h":15,"random_good_of_age_24h":71},"SpaceAgeAsteroidBelt":{"strategy_points_24h":16,"random_good_of_age_24h":71},"SpaceAgeVenus":{"strategy_points_24h":16,"random_good_of_age_24h":72},"SpaceAgeJupiterMoon":{"strategy_points_24h":16,"random_good_of_age_24h":72},"SpaceAgeTitan":{"strategy_points_24h":16,"random_good_of_age_24h":72},"SpaceAgeSpaceHub":{"strategy_points_24h":16,"random_good_of_age_24h":72}}, boosts: [{"type":"att_def_boost_attacker","value":15,"feature":"all"},{"type":"att_def_boost_attacker","value":15,"feature":"battleground"},{"type":"att_def_boost_defender","value":16,"feature":"all"},{"type":"att_def_boost_defender","value":16,"feature":"battleground"}] },
+    "W_MultiAge_GR25E1": { prod: {"BronzeAge":{"population":390,"demandHappiness":390,"strategy_points_24h":24},"IronAge":{"population":390,"demandHappiness":390,"strategy_points_24h":24},"EarlyMiddleAge":{"population":600,"demandHappiness":600,"strategy_points_24h":24},"HighMiddleAge":{"population":840,"demandHappiness":840,"strategy_points_24h":25},"LateMiddleAge":{"population":1080,"demandHappiness":1080,"strategy_points_24h":25},"ColonialAge":{"population":1380,"demandHappiness":1380,"strategy_points_24h":25},"IndustrialAge":{"population":1680,"demandHappiness":1680,"strategy_points_24h":26},"ProgressiveEra":{"population":2010,"demandHappiness":2010,"strategy_points_24h":26},"ModernEra":{"population":2400,"demandHappiness":2400,"strategy_points_24h":27},"PostModernEra":{"population":2700,"demandHappiness":2700,"strategy_points_24h":27},"ContemporaryEra":{"population":3090,"demandHappiness":3090,"strategy_points_24h":27},"TomorrowEra":{"population":3480,"demandHappiness":3480,"strategy_points_24h":28},"FutureEra":{"population":3900,"demandHappiness":3900,"strategy_points_24h":28},"ArcticFuture":{"population":4320,"demandHappiness":4320,"strategy_points_24h":28},"OceanicFuture":{"population":4740,"demandHappiness":4740,"strategy_points_24h":29},"VirtualFuture":{"population":5220,"demandHappiness":5220,"strategy_points_24h":29},"SpaceAgeMars":{"population":8220,"demandHappiness":8220,"strategy_points_24h":29},"SpaceAgeAsteroidBelt":{"population":8940,"demandHappiness":8940,"strategy_points_24h":30},"SpaceAgeVenus":{"population":9660,"demandHappiness":9660,"strategy_points_24h":30},"SpaceAgeJupiterMoon":{"population":10380,"demandHappiness":10380,"strategy_points_24h":30},"SpaceAgeTitan":{"population":11160,"demandHappiness":11160,"strategy_points_24h":31},"SpaceAgeSpaceHub":{"population":11910,"demandHappiness":11910,"strategy_points_24h":31}}, boosts: [{"type":"att_def_boost_attacker_defender","value":25,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":40,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR25E2": { prod: {"BronzeAge":{"population":520,"demandHappiness":520,"strategy_points_24h":28},"IronAge":{"population":520,"demandHappiness":520,"strategy_points_24h":28},"EarlyMiddleAge":{"population":800,"demandHappiness":800,"strategy_points_24h":28},"HighMiddleAge":{"population":1120,"demandHappiness":1120,"strategy_points_24h":29},"LateMiddleAge":{"population":1440,"demandHappiness":1440,"strategy_points_24h":29},"ColonialAge":{"population":1840,"demandHappiness":1840,"strategy_points_24h":30},"IndustrialAge":{"population":2240,"demandHappiness":2240,"strategy_points_24h":30},"ProgressiveEra":{"population":2680,"demandHappiness":2680,"strategy_points_24h":31},"ModernEra":{"population":3200,"demandHappiness":3200,"strategy_points_24h":31},"PostModernEra":{"population":3600,"demandHappiness":3600,"strategy_points_24h":31},"ContemporaryEra":{"population":4120,"demandHappiness":4120,"strategy_points_24h":32},"TomorrowEra":{"population":4640,"demandHappiness":4640,"strategy_points_24h":32},"FutureEra":{"population":5200,"demandHappiness":5200,"strategy_points_24h":33},"ArcticFuture":{"population":5760,"demandHappiness":5760,"strategy_points_24h":33},"OceanicFuture":{"population":6320,"demandHappiness":6320,"strategy_points_24h":33},"VirtualFuture":{"population":6960,"demandHappiness":6960,"strategy_points_24h":34},"SpaceAgeMars":{"population":10960,"demandHappiness":10960,"strategy_points_24h":34},"SpaceAgeAsteroidBelt":{"population":11920,"demandHappiness":11920,"strategy_points_24h":35},"SpaceAgeVenus":{"population":12880,"demandHappiness":12880,"strategy_points_24h":35},"SpaceAgeJupiterMoon":{"population":13840,"demandHappiness":13840,"strategy_points_24h":36},"SpaceAgeTitan":{"population":14880,"demandHappiness":14880,"strategy_points_24h":36},"SpaceAgeSpaceHub":{"population":15880,"demandHappiness":15880,"strategy_points_24h":36}}, boosts: [{"type":"att_def_boost_attacker_defender","value":30,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":48,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR24C1": { prod: {"BronzeAge":{"strategy_points_24h":5,"random_good_of_age_24h":25},"IronAge":{"strategy_points_24h":5,"random_good_of_age_24h":25},"EarlyMiddleAge":{"strategy_points_24h":5,"random_good_of_age_24h":25},"HighMiddleAge":{"strategy_points_24h":5,"random_good_of_age_24h":25},"LateMiddleAge":{"strategy_points_24h":5,"random_good_of_age_24h":25},"ColonialAge":{"strategy_points_24h":5,"random_good_of_age_24h":25},"IndustrialAge":{"strategy_points_24h":5,"random_good_of_age_24h":25},"ProgressiveEra":{"strategy_points_24h":5,"random_good_of_age_24h":25},"ModernEra":{"strategy_points_24h":5,"random_good_of_age_24h":25},"PostModernEra":{"strategy_points_24h":5,"random_good_of_age_24h":25},"ContemporaryEra":{"strategy_points_24h":5,"random_good_of_age_24h":25},"TomorrowEra":{"strategy_points_24h":5,"random_good_of_age_24h":25},"FutureEra":{"strategy_points_24h":5,"random_good_of_age_24h":25},"ArcticFuture":{"strategy_points_24h":5,"random_good_of_age_24h":25},"OceanicFuture":{"strategy_points_24h":5,"random_good_of_age_24h":25},"VirtualFuture":{"strategy_points_24h":5,"random_good_of_age_24h":25},"SpaceAgeMars":{"strategy_points_24h":5,"random_good_of_age_24h":25},"SpaceAgeAsteroidBelt":{"strategy_points_24h":5,"random_good_of_age_24h":25},"SpaceAgeVenus":{"strategy_points_24h":5,"random_good_of_age_24h":25},"SpaceAgeJupiterMoon":{"strategy_points_24h":5,"random_good_of_age_24h":25},"SpaceAgeTitan":{"strategy_points_24h":5,"random_good_of_age_24h":25},"SpaceAgeSpaceHub":{"strategy_points_24h":5,"random_good_of_age_24h":25}}, boosts: [{"type":"att_def_boost_attacker","value":9,"feature":"all"},{"type":"att_def_boost_attacker","value":9,"feature":"battleground"},{"type":"att_def_boost_defender","value":9,"feature":"all"},{"type":"att_def_boost_defender","value":9,"feature":"battleground"}] },
+    "W_MultiAge_GR24C2": { prod: {"BronzeAge":{"strategy_points_24h":10,"random_good_of_age_24h":50},"IronAge":{"strategy_points_24h":10,"random_good_of_age_24h":50},"EarlyMiddleAge":{"strategy_points_24h":10,"random_good_of_age_24h":50},"HighMiddleAge":{"strategy_points_24h":10,"random_good_of_age_24h":50},"LateMiddleAge":{"strategy_points_24h":10,"random_good_of_age_24h":50},"ColonialAge":{"strategy_points_24h":10,"random_good_of_age_24h":50},"IndustrialAge":{"strategy_points_24h":10,"random_good_of_age_24h":50},"ProgressiveEra":{"strategy_points_24h":10,"random_good_of_age_24h":50},"ModernEra":{"strategy_points_24h":10,"random_good_of_age_24h":50},"PostModernEra":{"strategy_points_24h":10,"random_good_of_age_24h":50},"ContemporaryEra":{"strategy_points_24h":10,"random_good_of_age_24h":50},"TomorrowEra":{"strategy_points_24h":10,"random_good_of_age_24h":50},"FutureEra":{"strategy_points_24h":10,"random_good_of_age_24h":50},"ArcticFuture":{"strategy_points_24h":10,"random_good_of_age_24h":50},"OceanicFuture":{"strategy_points_24h":10,"random_good_of_age_24h":50},"VirtualFuture":{"strategy_points_24h":10,"random_good_of_age_24h":50},"SpaceAgeMars":{"strategy_points_24h":10,"random_good_of_age_24h":50},"SpaceAgeAsteroidBelt":{"strategy_points_24h":10,"random_good_of_age_24h":50},"SpaceAgeVenus":{"strategy_points_24h":10,"random_good_of_age_24h":50},"SpaceAgeJupiterMoon":{"strategy_points_24h":10,"random_good_of_age_24h":50},"SpaceAgeTitan":{"strategy_points_24h":10,"random_good_of_age_24h":50},"SpaceAgeSpaceHub":{"strategy_points_24h":10,"random_good_of_age_24h":50}}, boosts: [{"type":"att_def_boost_attacker","value":12,"feature":"all"},{"type":"att_def_boost_attacker","value":12,"feature":"battleground"},{"type":"att_def_boost_defender","value":12,"feature":"all"},{"type":"att_def_boost_defender","value":12,"feature":"battleground"}] },
+    "W_MultiAge_GR24D1": { prod: {"BronzeAge":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"IronAge":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"EarlyMiddleAge":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"HighMiddleAge":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"LateMiddleAge":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"ColonialAge":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"IndustrialAge":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"ProgressiveEra":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"ModernEra":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"PostModernEra":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"ContemporaryEra":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"TomorrowEra":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"FutureEra":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"ArcticFuture":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"OceanicFuture":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"VirtualFuture":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"SpaceAgeMars":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"SpaceAgeAsteroidBelt":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"SpaceAgeVenus":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"SpaceAgeJupiterMoon":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"SpaceAgeTitan":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50},"SpaceAgeSpaceHub":{"strategy_points_24h":5,"random_good_of_previous_age_24h":50}}, boosts: [{"type":"att_def_boost_attacker","value":9,"feature":"all"},{"type":"att_def_boost_attacker","value":9,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":9,"feature":"all"},{"type":"att_def_boost_defender","value":9,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR24D2": { prod: {"BronzeAge":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"IronAge":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"EarlyMiddleAge":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"HighMiddleAge":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"LateMiddleAge":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"ColonialAge":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"IndustrialAge":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"ProgressiveEra":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"ModernEra":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"PostModernEra":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"ContemporaryEra":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"TomorrowEra":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"FutureEra":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"ArcticFuture":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"OceanicFuture":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"VirtualFuture":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"SpaceAgeMars":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"SpaceAgeAsteroidBelt":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"SpaceAgeVenus":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"SpaceAgeJupiterMoon":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"SpaceAgeTitan":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100},"SpaceAgeSpaceHub":{"strategy_points_24h":10,"random_good_of_previous_age_24h":100}}, boosts: [{"type":"att_def_boost_attacker","value":12,"feature":"all"},{"type":"att_def_boost_attacker","value":12,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":12,"feature":"all"},{"type":"att_def_boost_defender","value":12,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR25B1": { prod: {"BronzeAge":{"strategy_points_24h":18},"IronAge":{"strategy_points_24h":18},"EarlyMiddleAge":{"strategy_points_24h":18},"HighMiddleAge":{"strategy_points_24h":18},"LateMiddleAge":{"strategy_points_24h":18},"ColonialAge":{"strategy_points_24h":18},"IndustrialAge":{"strategy_points_24h":18},"ProgressiveEra":{"strategy_points_24h":18},"ModernEra":{"strategy_points_24h":18},"PostModernEra":{"strategy_points_24h":18},"ContemporaryEra":{"strategy_points_24h":18},"TomorrowEra":{"strategy_points_24h":18},"FutureEra":{"strategy_points_24h":18},"ArcticFuture":{"strategy_points_24h":18},"OceanicFuture":{"strategy_points_24h":18},"VirtualFuture":{"strategy_points_24h":18},"SpaceAgeMars":{"strategy_points_24h":18},"SpaceAgeAsteroidBelt":{"strategy_points_24h":18},"SpaceAgeVenus":{"strategy_points_24h":18},"SpaceAgeJupiterMoon":{"strategy_points_24h":18},"SpaceAgeTitan":{"strategy_points_24h":18},"SpaceAgeSpaceHub":{"strategy_points_24h":18}}, boosts: [{"type":"att_def_boost_attacker_defender","value":25,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":48,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR25B2": { prod: {"BronzeAge":{"strategy_points_24h":23},"IronAge":{"strategy_points_24h":23},"EarlyMiddleAge":{"strategy_points_24h":23},"HighMiddleAge":{"strategy_points_24h":23},"LateMiddleAge":{"strategy_points_24h":23},"ColonialAge":{"strategy_points_24h":23},"IndustrialAge":{"strategy_points_24h":23},"ProgressiveEra":{"strategy_points_24h":23},"ModernEra":{"strategy_points_24h":23},"PostModernEra":{"strategy_points_24h":23},"ContemporaryEra":{"strategy_points_24h":23},"TomorrowEra":{"strategy_points_24h":23},"FutureEra":{"strategy_points_24h":23},"ArcticFuture":{"strategy_points_24h":23},"OceanicFuture":{"strategy_points_24h":23},"VirtualFuture":{"strategy_points_24h":23},"SpaceAgeMars":{"strategy_points_24h":23},"SpaceAgeAsteroidBelt":{"strategy_points_24h":23},"SpaceAgeVenus":{"strategy_points_24h":23},"SpaceAgeJupiterMoon":{"strategy_points_24h":23},"SpaceAgeTitan":{"strategy_points_24h":23},"SpaceAgeSpaceHub":{"strategy_points_24h":23}}, boosts: [{"type":"att_def_boost_attacker_defender","value":30,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":56,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR25J2": { prod: {"BronzeAge":{"strategy_points_24h":60,"units_24h":60},"IronAge":{"strategy_points_24h":60,"units_24h":60},"EarlyMiddleAge":{"strategy_points_24h":61,"units_24h":60},"HighMiddleAge":{"strategy_points_24h":62,"units_24h":60},"LateMiddleAge":{"strategy_points_24h":63,"units_24h":60},"ColonialAge":{"strategy_points_24h":64,"units_24h":60},"IndustrialAge":{"strategy_points_24h":65,"units_24h":60},"ProgressiveEra":{"strategy_points_24h":65,"units_24h":60},"ModernEra":{"strategy_points_24h":66,"units_24h":60},"PostModernEra":{"strategy_points_24h":67,"units_24h":60},"ContemporaryEra":{"strategy_points_24h":68,"units_24h":60},"TomorrowEra":{"strategy_points_24h":69,"units_24h":60},"FutureEra":{"strategy_points_24h":70,"units_24h":60},"ArcticFuture":{"strategy_points_24h":71,"units_24h":60},"OceanicFuture":{"strategy_points_24h":72,"units_24h":60},"VirtualFuture":{"strategy_points_24h":73,"units_24h":60},"SpaceAgeMars":{"strategy_points_24h":73,"units_24h":60},"SpaceAgeAsteroidBelt":{"strategy_points_24h":74,"units_24h":60},"SpaceAgeVenus":{"strategy_points_24h":75,"units_24h":60},"SpaceAgeJupiterMoon":{"strategy_points_24h":76,"units_24h":60},"SpaceAgeTitan":{"strategy_points_24h":77,"units_24h":60},"SpaceAgeSpaceHub":{"strategy_points_24h":78,"units_24h":60}}, boosts: [{"type":"def_boost_attacker","value":96,"feature":"all"},{"type":"def_boost_defender","value":125,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":100,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR25J1": { prod: {"BronzeAge":{"strategy_points_24h":48,"units_24h":40},"IronAge":{"strategy_points_24h":48,"units_24h":40},"EarlyMiddleAge":{"strategy_points_24h":49,"units_24h":40},"HighMiddleAge":{"strategy_points_24h":49,"units_24h":40},"LateMiddleAge":{"strategy_points_24h":50,"units_24h":40},"ColonialAge":{"strategy_points_24h":51,"units_24h":40},"IndustrialAge":{"strategy_points_24h":52,"units_24h":40},"ProgressiveEra":{"strategy_points_24h":52,"units_24h":40},"ModernEra":{"strategy_points_24h":53,"units_24h":40},"PostModernEra":{"strategy_points_24h":54,"units_24h":40},"ContemporaryEra":{"strategy_points_24h":54,"units_24h":40},"TomorrowEra":{"strategy_points_24h":55,"units_24h":40},"FutureEra":{"strategy_points_24h":56,"units_24h":40},"ArcticFuture":{"strategy_points_24h":57,"units_24h":40},"OceanicFuture":{"strategy_points_24h":57,"units_24h":40},"VirtualFuture":{"strategy_points_24h":58,"units_24h":40},"SpaceAgeMars":{"strategy_points_24h":59,"units_24h":40},"SpaceAgeAsteroidBelt":{"strategy_points_24h":60,"units_24h":40},"SpaceAgeVenus":{"strategy_points_24h":60,"units_24h":40},"SpaceAgeJupiterMoon":{"strategy_points_24h":61,"units_24h":40},"SpaceAgeTitan":{"strategy_points_24h":62,"units_24h":40},"SpaceAgeSpaceHub":{"strategy_points_24h":62,"units_24h":40}}, boosts: [{"type":"def_boost_attacker","value":72,"feature":"all"},{"type":"def_boost_defender","value":108,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":77,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR23C1": { prod: {"BronzeAge":{"strategy_points_24h":9},"IronAge":{"strategy_points_24h":9},"EarlyMiddleAge":{"strategy_points_24h":9},"HighMiddleAge":{"strategy_points_24h":9},"LateMiddleAge":{"strategy_points_24h":10},"ColonialAge":{"strategy_points_24h":10},"IndustrialAge":{"strategy_points_24h":10},"ProgressiveEra":{"strategy_points_24h":10},"ModernEra":{"strategy_points_24h":10},"PostModernEra":{"strategy_points_24h":10},"ContemporaryEra":{"strategy_points_24h":10},"TomorrowEra":{"strategy_points_24h":10},"FutureEra":{"strategy_points_24h":11},"ArcticFuture":{"strategy_points_24h":11},"OceanicFuture":{"strategy_points_24h":11},"VirtualFuture":{"strategy_points_24h":11},"SpaceAgeMars":{"strategy_points_24h":11},"SpaceAgeAsteroidBelt":{"strategy_points_24h":11},"SpaceAgeVenus":{"strategy_points_24h":11},"SpaceAgeJupiterMoon":{"strategy_points_24h":12},"SpaceAgeTitan":{"strategy_points_24h":12},"SpaceAgeSpaceHub":{"strategy_points_24h":12}}, boosts: [{"type":"att_def_boost_attacker","value":8,"feature":"all"},{"type":"att_def_boost_attacker","value":18,"feature":"battleground"},{"type":"att_def_boost_defender","value":24,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":8,"feature":"all"}] },
+    "W_MultiAge_GR23C2": { prod: {"BronzeAge":{"strategy_points_24h":12},"IronAge":{"strategy_points_24h":12},"EarlyMiddleAge":{"strategy_points_24h":12},"HighMiddleAge":{"strategy_points_24h":13},"LateMiddleAge":{"strategy_points_24h":13},"ColonialAge":{"strategy_points_24h":13},"IndustrialAge":{"strategy_points_24h":13},"ProgressiveEra":{"strategy_points_24h":13},"ModernEra":{"strategy_points_24h":13},"PostModernEra":{"strategy_points_24h":14},"ContemporaryEra":{"strategy_points_24h":14},"TomorrowEra":{"strategy_points_24h":14},"FutureEra":{"strategy_points_24h":14},"ArcticFuture":{"strategy_points_24h":14},"OceanicFuture":{"strategy_points_24h":15},"VirtualFuture":{"strategy_points_24h":15},"SpaceAgeMars":{"strategy_points_24h":15},"SpaceAgeAsteroidBelt":{"strategy_points_24h":15},"SpaceAgeVenus":{"strategy_points_24h":15},"SpaceAgeJupiterMoon":{"strategy_points_24h":15},"SpaceAgeTitan":{"strategy_points_24h":16},"SpaceAgeSpaceHub":{"strategy_points_24h":16}}, boosts: [{"type":"att_def_boost_attacker","value":11,"feature":"all"},{"type":"att_def_boost_attacker","value":23,"feature":"battleground"},{"type":"att_def_boost_defender","value":30,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":11,"feature":"all"}] },
+    "W_MultiAge_GR26C1": { prod: {"BronzeAge":{"strategy_points_24h":16,"random_good_of_previous_age_24h":56},"IronAge":{"strategy_points_24h":16,"random_good_of_previous_age_24h":56},"EarlyMiddleAge":{"strategy_points_24h":16,"random_good_of_previous_age_24h":56},"HighMiddleAge":{"strategy_points_24h":16,"random_good_of_previous_age_24h":56},"LateMiddleAge":{"strategy_points_24h":17,"random_good_of_previous_age_24h":57},"ColonialAge":{"strategy_points_24h":17,"random_good_of_previous_age_24h":57},"IndustrialAge":{"strategy_points_24h":17,"random_good_of_previous_age_24h":57},"ProgressiveEra":{"strategy_points_24h":17,"random_good_of_previous_age_24h":57},"ModernEra":{"strategy_points_24h":18,"random_good_of_previous_age_24h":57},"PostModernEra":{"strategy_points_24h":18,"random_good_of_previous_age_24h":58},"ContemporaryEra":{"strategy_points_24h":18,"random_good_of_previous_age_24h":58},"TomorrowEra":{"strategy_points_24h":18,"random_good_of_previous_age_24h":58},"FutureEra":{"strategy_points_24h":19,"random_good_of_previous_age_24h":58},"ArcticFuture":{"strategy_points_24h":19,"random_good_of_previous_age_24h":59},"OceanicFuture":{"strategy_points_24h":19,"random_good_of_previous_age_24h":59},"VirtualFuture":{"strategy_points_24h":19,"random_good_of_previous_age_24h":59},"SpaceAgeMars":{"strategy_points_24h":20,"random_good_of_previous_age_24h":59},"SpaceAgeAsteroidBelt":{"strategy_points_24h":20,"random_good_of_previous_age_24h":59},"SpaceAgeVenus":{"strategy_points_24h":20,"random_good_of_previous_age_24h":60},"SpaceAgeJupiterMoon":{"strategy_points_24h":20,"random_good_of_previous_age_24h":60},"SpaceAgeTitan":{"strategy_points_24h":21,"random_good_of_previous_age_24h":60},"SpaceAgeSpaceHub":{"strategy_points_24h":21,"random_good_of_previous_age_24h":60}}, boosts: [{"type":"att_def_boost_attacker_defender","value":13,"feature":"all"},{"type":"att_def_boost_defender","value":24,"feature":"battleground"},{"type":"att_def_boost_attacker","value":32,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR26C2": { prod: {"BronzeAge":{"strategy_points_24h":20,"random_good_of_previous_age_24h":72},"IronAge":{"strategy_points_24h":20,"random_good_of_previous_age_24h":72},"EarlyMiddleAge":{"strategy_points_24h":20,"random_good_of_previous_age_24h":72},"HighMiddleAge":{"strategy_points_24h":21,"random_good_of_previous_age_24h":73},"LateMiddleAge":{"strategy_points_24h":21,"random_good_of_previous_age_24h":73},"ColonialAge":{"strategy_points_24h":21,"random_good_of_previous_age_24h":73},"IndustrialAge":{"strategy_points_24h":22,"random_good_of_previous_age_24h":73},"ProgressiveEra":{"strategy_points_24h":22,"random_good_of_previous_age_24h":74},"ModernEra":{"strategy_points_24h":22,"random_good_of_previous_age_24h":74},"PostModernEra":{"strategy_points_24h":22,"random_good_of_previous_age_24h":74},"ContemporaryEra":{"strategy_points_24h":23,"random_good_of_previous_age_24h":74},"TomorrowEra":{"strategy_points_24h":23,"random_good_of_previous_age_24h":75},"FutureEra":{"strategy_points_24h":23,"random_good_of_previous_age_24h":75},"ArcticFuture":{"strategy_points_24h":24,"random_good_of_previous_age_24h":75},"OceanicFuture":{"strategy_points_24h":24,"random_good_of_previous_age_24h":76},"VirtualFuture":{"strategy_points_24h":24,"random_good_of_previous_age_24h":76},"SpaceAgeMars":{"strategy_points_24h":25,"random_good_of_previous_age_24h":76},"SpaceAgeAsteroidBelt":{"strategy_points_24h":25,"random_good_of_previous_age_24h":76},"SpaceAgeVenus":{"strategy_points_24h":25,"random_good_of_previous_age_24h":77},"SpaceAgeJupiterMoon":{"strategy_points_24h":25,"random_good_of_previous_age_24h":77},"SpaceAgeTitan":{"strategy_points_24h":26,"random_good_of_previous_age_24h":77},"SpaceAgeSpaceHub":{"strategy_points_24h":26,"random_good_of_previous_age_24h":77}}, boosts: [{"type":"att_def_boost_attacker_defender","value":17,"feature":"all"},{"type":"att_def_boost_defender","value":30,"feature":"battleground"},{"type":"att_def_boost_attacker","value":40,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR25H1": { boosts: [{"type":"att_def_boost_attacker_defender","value":64,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR25H2": { boosts: [{"type":"att_def_boost_attacker_defender","value":88,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR25A1": { boosts: [{"type":"att_def_boost_attacker_defender","value":34,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":47,"feature":"battleground"}] },
+    "W_MultiAge_GR25A2": { boosts: [{"type":"att_def_boost_attacker_defender","value":45,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":61,"feature":"battleground"}] },
+    "W_MultiAge_GR24A1": { prod: {"BronzeAge":{"strategy_points_24h":4,"random_good_of_age_24h":5},"IronAge":{"strategy_points_24h":4,"random_good_of_age_24h":5},"EarlyMiddleAge":{"strategy_points_24h":4,"random_good_of_age_24h":5},"HighMiddleAge":{"strategy_points_24h":4,"random_good_of_age_24h":5},"LateMiddleAge":{"strategy_points_24h":4,"random_good_of_age_24h":5},"ColonialAge":{"strategy_points_24h":4,"random_good_of_age_24h":5},"IndustrialAge":{"strategy_points_24h":4,"random_good_of_age_24h":5},"ProgressiveEra":{"strategy_points_24h":4,"random_good_of_age_24h":5},"ModernEra":{"strategy_points_24h":4,"random_good_of_age_24h":5},"PostModernEra":{"strategy_points_24h":4,"random_good_of_age_24h":5},"ContemporaryEra":{"strategy_points_24h":5,"random_good_of_age_24h":5},"TomorrowEra":{"strategy_points_24h":5,"random_good_of_age_24h":5},"FutureEra":{"strategy_points_24h":5,"random_good_of_age_24h":5},"ArcticFuture":{"strategy_points_24h":5,"random_good_of_age_24h":5},"OceanicFuture":{"strategy_points_24h":5,"random_good_of_age_24h":5},"VirtualFuture":{"strategy_points_24h":5,"random_good_of_age_24h":6},"SpaceAgeMars":{"strategy_points_24h":5,"random_good_of_age_24h":6},"SpaceAgeAsteroidBelt":{"strategy_points_24h":5,"random_good_of_age_24h":6},"SpaceAgeVenus":{"strategy_points_24h":5,"random_good_of_age_24h":6},"SpaceAgeJupiterMoon":{"strategy_points_24h":5,"random_good_of_age_24h":6},"SpaceAgeTitan":{"strategy_points_24h":5,"random_good_of_age_24h":6},"SpaceAgeSpaceHub":{"strategy_points_24h":5,"random_good_of_age_24h":6}}, boosts: [{"type":"att_def_boost_defender","value":4,"feature":"all"},{"type":"att_def_boost_defender","value":3,"feature":"battleground"},{"type":"att_def_boost_defender","value":4,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR24A2": { prod: {"BronzeAge":{"strategy_points_24h":8,"random_good_of_age_24h":10},"IronAge":{"strategy_points_24h":8,"random_good_of_age_24h":10},"EarlyMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":10},"HighMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":10},"LateMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":10},"ColonialAge":{"strategy_points_24h":8,"random_good_of_age_24h":10},"IndustrialAge":{"strategy_points_24h":9,"random_good_of_age_24h":10},"ProgressiveEra":{"strategy_points_24h":9,"random_good_of_age_24h":10},"ModernEra":{"strategy_points_24h":9,"random_good_of_age_24h":11},"PostModernEra":{"strategy_points_24h":9,"random_good_of_age_24h":11},"ContemporaryEra":{"strategy_points_24h":9,"random_good_of_age_24h":11},"TomorrowEra":{"strategy_points_24h":9,"random_good_of_age_24h":11},"FutureEra":{"strategy_points_24h":9,"random_good_of_age_24h":11},"ArcticFuture":{"strategy_points_24h":9,"random_good_of_age_24h":11},"OceanicFuture":{"strategy_points_24h":10,"random_good_of_age_24h":11},"VirtualFuture":{"strategy_points_24h":10,"random_good_of_age_24h":11},"SpaceAgeMars":{"strategy_points_24h":10,"random_good_of_age_24h":11},"SpaceAgeAsteroidBelt":{"strategy_points_24h":10,"random_good_of_age_24h":11},"SpaceAgeVenus":{"strategy_points_24h":10,"random_good_of_age_24h":11},"SpaceAgeJupiterMoon":{"strategy_points_24h":10,"random_good_of_age_24h":11},"SpaceAgeTitan":{"strategy_points_24h":10,"random_good_of_age_24h":11},"SpaceAgeSpaceHub":{"strategy_points_24h":10,"random_good_of_age_24h":11}}, boosts: [{"type":"att_def_boost_defender","value":6,"feature":"all"},{"type":"att_def_boost_defender","value":6,"feature":"battleground"},{"type":"att_def_boost_defender","value":8,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR26B1": { prod: {"BronzeAge":{"strategy_points_24h":44,"random_good_of_previous_age_24h":144},"IronAge":{"strategy_points_24h":44,"random_good_of_previous_age_24h":144},"EarlyMiddleAge":{"strategy_points_24h":44,"random_good_of_previous_age_24h":145},"HighMiddleAge":{"strategy_points_24h":45,"random_good_of_previous_age_24h":145},"LateMiddleAge":{"strategy_points_24h":46,"random_good_of_previous_age_24h":146},"ColonialAge":{"strategy_points_24h":46,"random_good_of_previous_age_24h":146},"IndustrialAge":{"strategy_points_24h":47,"random_good_of_previous_age_24h":147},"ProgressiveEra":{"strategy_points_24h":48,"random_good_of_previous_age_24h":147},"ModernEra":{"strategy_points_24h":48,"random_good_of_previous_age_24h":148},"PostModernEra":{"strategy_points_24h":49,"random_good_of_previous_age_24h":148},"ContemporaryEra":{"strategy_points_24h":50,"random_good_of_previous_age_24h":149},"TomorrowEra":{"strategy_points_24h":50,"random_good_of_previous_age_24h":149},"FutureEra":{"strategy_points_24h":51,"random_good_of_previous_age_24h":150},"ArcticFuture":{"strategy_points_24h":52,"random_good_of_previous_age_24h":150},"OceanicFuture":{"strategy_points_24h":52,"random_good_of_previous_age_24h":151},"VirtualFuture":{"strategy_points_24h":53,"random_good_of_previous_age_24h":152},"SpaceAgeMars":{"strategy_points_24h":53,"random_good_of_previous_age_24h":152},"SpaceAgeAsteroidBelt":{"strategy_points_24h":54,"random_good_of_previous_age_24h":153},"SpaceAgeVenus":{"strategy_points_24h":55,"random_good_of_previous_age_24h":153},"SpaceAgeJupiterMoon":{"strategy_points_24h":55,"random_good_of_previous_age_24h":154},"SpaceAgeTitan":{"strategy_points_24h":56,"random_good_of_previous_age_24h":154},"SpaceAgeSpaceHub":{"strategy_points_24h":57,"random_good_of_previous_age_24h":155}}, boosts: [{"type":"att_def_boost_defender","value":53,"feature":"all"},{"type":"att_def_boost_defender","value":64,"feature":"battleground"},{"type":"att_def_boost_defender","value":73,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR26B2": { prod: {"BronzeAge":{"strategy_points_24h":53,"random_good_of_previous_age_24h":180},"IronAge":{"strategy_points_24h":53,"random_good_of_previous_age_24h":180},"EarlyMiddleAge":{"strategy_points_24h":53,"random_good_of_previous_age_24h":181},"HighMiddleAge":{"strategy_points_24h":54,"random_good_of_previous_age_24h":181},"LateMiddleAge":{"strategy_points_24h":55,"random_good_of_previous_age_24h":182},"ColonialAge":{"strategy_points_24h":56,"random_good_of_previous_age_24h":183},"IndustrialAge":{"strategy_points_24h":57,"random_good_of_previous_age_24h":183},"ProgressiveEra":{"strategy_points_24h":57,"random_good_of_previous_age_24h":184},"ModernEra":{"strategy_points_24h":58,"random_good_of_previous_age_24h":185},"PostModernEra":{"strategy_points_24h":59,"random_good_of_previous_age_24h":185},"ContemporaryEra":{"strategy_points_24h":60,"random_good_of_previous_age_24h":186},"TomorrowEra":{"strategy_points_24h":61,"random_good_of_previous_age_24h":187},"FutureEra":{"strategy_points_24h":61,"random_good_of_previous_age_24h":187},"ArcticFuture":{"strategy_points_24h":62,"random_good_of_previous_age_24h":188},"OceanicFuture":{"strategy_points_24h":63,"random_good_of_previous_age_24h":189},"VirtualFuture":{"strategy_points_24h":64,"random_good_of_previous_age_24h":189},"SpaceAgeMars":{"strategy_points_24h":64,"random_good_of_previous_age_24h":190},"SpaceAgeAsteroidBelt":{"strategy_points_24h":65,"random_good_of_previous_age_24h":191},"SpaceAgeVenus":{"strategy_points_24h":66,"random_good_of_previous_age_24h":191},"SpaceAgeJupiterMoon":{"strategy_points_24h":67,"random_good_of_previous_age_24h":192},"SpaceAgeTitan":{"strategy_points_24h":68,"random_good_of_previous_age_24h":193},"SpaceAgeSpaceHub":{"strategy_points_24h":68,"random_good_of_previous_age_24h":194}}, boosts: [{"type":"att_def_boost_defender","value":65,"feature":"all"},{"type":"att_def_boost_defender","value":78,"feature":"battleground"},{"type":"att_def_boost_defender","value":91,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR25G1": { prod: {"BronzeAge":{"strategy_points_24h":45},"IronAge":{"strategy_points_24h":45},"EarlyMiddleAge":{"strategy_points_24h":46},"HighMiddleAge":{"strategy_points_24h":46},"LateMiddleAge":{"strategy_points_24h":47},"ColonialAge":{"strategy_points_24h":48},"IndustrialAge":{"strategy_points_24h":48},"ProgressiveEra":{"strategy_points_24h":49},"ModernEra":{"strategy_points_24h":50},"PostModernEra":{"strategy_points_24h":50},"ContemporaryEra":{"strategy_points_24h":51},"TomorrowEra":{"strategy_points_24h":52},"FutureEra":{"strategy_points_24h":52},"ArcticFuture":{"strategy_points_24h":53},"OceanicFuture":{"strategy_points_24h":54},"VirtualFuture":{"strategy_points_24h":54},"SpaceAgeMars":{"strategy_points_24h":55},"SpaceAgeAsteroidBelt":{"strategy_points_24h":56},"SpaceAgeVenus":{"strategy_points_24h":56},"SpaceAgeJupiterMoon":{"strategy_points_24h":57},"SpaceAgeTitan":{"strategy_points_24h":58},"SpaceAgeSpaceHub":{"strategy_points_24h":58}}, boosts: [{"type":"att_def_boost_attacker_defender","value":54,"feature":"battleground"}] },
+    "W_MultiAge_GR25G2": { prod: {"BronzeAge":{"strategy_points_24h":63},"IronAge":{"strategy_points_24h":63},"EarlyMiddleAge":{"strategy_points_24h":64},"HighMiddleAge":{"strategy_points_24h":65},"LateMiddleAge":{"strategy_points_24h":66},"ColonialAge":{"strategy_points_24h":67},"IndustrialAge":{"strategy_points_24h":68},"ProgressiveEra":{"strategy_points_24h":69},"ModernEra":{"strategy_points_24h":70},"PostModernEra":{"strategy_points_24h":71},"ContemporaryEra":{"strategy_points_24h":72},"TomorrowEra":{"strategy_points_24h":72},"FutureEra":{"strategy_points_24h":73},"ArcticFuture":{"strategy_points_24h":74},"OceanicFuture":{"strategy_points_24h":75},"VirtualFuture":{"strategy_points_24h":76},"SpaceAgeMars":{"strategy_points_24h":77},"SpaceAgeAsteroidBelt":{"strategy_points_24h":78},"SpaceAgeVenus":{"strategy_points_24h":79},"SpaceAgeJupiterMoon":{"strategy_points_24h":80},"SpaceAgeTitan":{"strategy_points_24h":81},"SpaceAgeSpaceHub":{"strategy_points_24h":82}}, boosts: [{"type":"att_def_boost_attacker_defender","value":95,"feature":"battleground"}] },
+    "W_MultiAge_GR25I1": { prod: {"BronzeAge":{"random_good_of_previous_age_24h":48,"strategy_points_24h":12},"IronAge":{"random_good_of_previous_age_24h":48,"strategy_points_24h":12},"EarlyMiddleAge":{"random_good_of_previous_age_24h":48,"strategy_points_24h":12},"HighMiddleAge":{"random_good_of_previous_age_24h":48,"strategy_points_24h":12},"LateMiddleAge":{"random_good_of_previous_age_24h":49,"strategy_points_24h":13},"ColonialAge":{"random_good_of_previous_age_24h":49,"strategy_points_24h":13},"IndustrialAge":{"random_good_of_previous_age_24h":49,"strategy_points_24h":13},"ProgressiveEra":{"random_good_of_previous_age_24h":49,"strategy_points_24h":13},"ModernEra":{"random_good_of_previous_age_24h":49,"strategy_points_24h":13},"PostModernEra":{"random_good_of_previous_age_24h":49,"strategy_points_24h":13},"ContemporaryEra":{"random_good_of_previous_age_24h":50,"strategy_points_24h":14},"TomorrowEra":{"random_good_of_previous_age_24h":50,"strategy_points_24h":14},"FutureEra":{"random_good_of_previous_age_24h":50,"strategy_points_24h":14},"ArcticFuture":{"random_good_of_previous_age_24h":50,"strategy_points_24h":14},"OceanicFuture":{"random_good_of_previous_age_24h":50,"strategy_points_24h":14},"VirtualFuture":{"random_good_of_previous_age_24h":51,"strategy_points_24h":15},"SpaceAgeMars":{"random_good_of_previous_age_24h":51,"strategy_points_24h":15},"SpaceAgeAsteroidBelt":{"random_good_of_previous_age_24h":51,"strategy_points_24h":15},"SpaceAgeVenus":{"random_good_of_previous_age_24h":51,"strategy_points_24h":15},"SpaceAgeJupiterMoon":{"random_good_of_previous_age_24h":51,"strategy_points_24h":15},"SpaceAgeTitan":{"random_good_of_previous_age_24h":51,"strategy_points_24h":15},"SpaceAgeSpaceHub":{"random_good_of_previous_age_24h":52,"strategy_points_24h":16}}, boosts: [{"type":"att_boost_attacker","value":18,"feature":"all"},{"type":"att_boost_defender","value":36,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":25,"feature":"battleground"}] },
+    "W_MultiAge_GR25I2": { prod: {"BronzeAge":{"random_good_of_previous_age_24h":60,"strategy_points_24h":15},"IronAge":{"random_good_of_previous_age_24h":60,"strategy_points_24h":15},"EarlyMiddleAge":{"random_good_of_previous_age_24h":60,"strategy_points_24h":15},"HighMiddleAge":{"random_good_of_previous_age_24h":60,"strategy_points_24h":15},"LateMiddleAge":{"random_good_of_previous_age_24h":61,"strategy_points_24h":16},"ColonialAge":{"random_good_of_previous_age_24h":61,"strategy_points_24h":16},"IndustrialAge":{"random_good_of_previous_age_24h":61,"strategy_points_24h":16},"ProgressiveEra":{"random_good_of_previous_age_24h":61,"strategy_points_24h":16},"ModernEra":{"random_good_of_previous_age_24h":62,"strategy_points_24h":17},"PostModernEra":{"random_good_of_previous_age_24h":62,"strategy_points_24h":17},"ContemporaryEra":{"random_good_of_previous_age_24h":62,"strategy_points_24h":17},"TomorrowEra":{"random_good_of_previous_age_24h":62,"strategy_points_24h":17},"FutureEra":{"random_good_of_previous_age_24h":62,"strategy_points_24h":17},"ArcticFuture":{"random_good_of_previous_age_24h":63,"strategy_points_24h":18},"OceanicFuture":{"random_good_of_previous_age_24h":63,"strategy_points_24h":18},"VirtualFuture":{"random_good_of_previous_age_24h":63,"strategy_points_24h":18},"SpaceAgeMars":{"random_good_of_previous_age_24h":63,"strategy_points_24h":18},"SpaceAgeAsteroidBelt":{"random_good_of_previous_age_24h":64,"strategy_points_24h":19},"SpaceAgeVenus":{"random_good_of_previous_age_24h":64,"strategy_points_24h":19},"SpaceAgeJupiterMoon":{"random_good_of_previous_age_24h":64,"strategy_points_24h":19},"SpaceAgeTitan":{"random_good_of_previous_age_24h":64,"strategy_points_24h":19},"SpaceAgeSpaceHub":{"random_good_of_previous_age_24h":64,"strategy_points_24h":20}}, boosts: [{"type":"att_boost_attacker","value":24,"feature":"all"},{"type":"att_boost_defender","value":52,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":29,"feature":"battleground"}] },
+    "W_MultiAge_GR24B1": { prod: {"BronzeAge":{"strategy_points_24h":4,"random_good_of_age_24h":5},"IronAge":{"strategy_points_24h":4,"random_good_of_age_24h":5},"EarlyMiddleAge":{"strategy_points_24h":4,"random_good_of_age_24h":5},"HighMiddleAge":{"strategy_points_24h":4,"random_good_of_age_24h":5},"LateMiddleAge":{"strategy_points_24h":4,"random_good_of_age_24h":5},"ColonialAge":{"strategy_points_24h":4,"random_good_of_age_24h":5},"IndustrialAge":{"strategy_points_24h":4,"random_good_of_age_24h":5},"ProgressiveEra":{"strategy_points_24h":4,"random_good_of_age_24h":5},"ModernEra":{"strategy_points_24h":4,"random_good_of_age_24h":5},"PostModernEra":{"strategy_points_24h":4,"random_good_of_age_24h":5},"ContemporaryEra":{"strategy_points_24h":5,"random_good_of_age_24h":5},"TomorrowEra":{"strategy_points_24h":5,"random_good_of_age_24h":5},"FutureEra":{"strategy_points_24h":5,"random_good_of_age_24h":5},"ArcticFuture":{"strategy_points_24h":5,"random_good_of_age_24h":5},"OceanicFuture":{"strategy_points_24h":5,"random_good_of_age_24h":5},"VirtualFuture":{"strategy_points_24h":5,"random_good_of_age_24h":6},"SpaceAgeMars":{"strategy_points_24h":5,"random_good_of_age_24h":6},"SpaceAgeAsteroidBelt":{"strategy_points_24h":5,"random_good_of_age_24h":6},"SpaceAgeVenus":{"strategy_points_24h":5,"random_good_of_age_24h":6},"SpaceAgeJupiterMoon":{"strategy_points_24h":5,"random_good_of_age_24h":6},"SpaceAgeTitan":{"strategy_points_24h":5,"random_good_of_age_24h":6},"SpaceAgeSpaceHub":{"strategy_points_24h":5,"random_good_of_age_24h":6}}, boosts: [{"type":"att_def_boost_attacker","value":4,"feature":"all"},{"type":"att_def_boost_attacker","value":3,"feature":"battleground"},{"type":"att_def_boost_attacker","value":4,"feature":"guild_expedition"}] },
+    "W_MultiAge_GR24B2": { prod: {"BronzeAge":{"strategy_points_24h":8,"random_good_of_age_24h":10},"IronAge":{"strategy_points_24h":8,"random_good_of_age_24h":10},"EarlyMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":10},"HighMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":10},"LateMiddleAge":{"strategy_points_24h":8,"random_good_of_age_24h":10},"ColonialAge":{"strategy_points_24h":8,"random_good_of_age_24h":10},"IndustrialAge":{"strategy_points_24h":9,"random_good_of_age_24h":10},"ProgressiveEra":{"strategy_points_24h":9,"random_good_of_age_24h":10},"ModernEra":{"strategy_points_24h":9,"random_good_of_age_24h":11},"PostModernEra":{"strategy_points_24h":9,"random_good_of_age_24h":11},"ContemporaryEra":{"strategy_points_24h":9,"random_good_of_age_24h":11},"TomorrowEra":{"strategy_points_24h":9,"random_good_of_age_24h":11},"FutureEra":{"strategy_points_24h":9,"random_good_of_age_24h":11},"ArcticFuture":{"strategy_points_24h":9,"random_good_of_age_24h":11},"OceanicFuture":{"strategy_points_24h":10,"random_good_of_age_24h":11},"VirtualFuture":{"strategy_points_24h":10,"random_good_of_age_24h":11},"SpaceAgeMars":{"strategy_points_24h":10,"random_good_of_age_24h":11},"SpaceAgeAsteroidBelt":{"strategy_points_24h":10,"random_good_of_age_24h":11},"SpaceAgeVenus":{"strategy_points_24h":10,"random_good_of_age_24h":11},"SpaceAgeJupiterMoon":{"strategy_points_24h":10,"random_good_of_age_24h":11},"SpaceAgeTitan":{"strategy_points_24h":10,"random_good_of_age_24h":11},"SpaceAgeSpaceHub":{"strategy_points_24h":10,"random_good_of_age_24h":11}}, boosts: [{"type":"att_def_boost_attacker","value":6,"feature":"all"},{"type":"att_def_boost_attacker","value":6,"feature":"battleground"},{"type":"att_def_boost_attacker","value":8,"feature":"guild_expedition"}] },
+};
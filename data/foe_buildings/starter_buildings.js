@@ -0,0 +1,5 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 1 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_ONBOARD25A1": { prod: {"AllAge":{"happiness":101}} },
+};
@@ -0,0 +1,106 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 102 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_SUM25B2": { prod: {"BronzeAge":{"population":-90,"money_24h":680,"strategy_points_24h":12,"random_good_of_age_24h":18},"IronAge":{"population":-190,"money_24h":1640,"strategy_points_24h":12,"random_good_of_age_24h":18},"EarlyMiddleAge":{"population":-300,"money_24h":2730,"strategy_points_24h":12,"random_good_of_age_24h":18},"HighMiddleAge":{"population":-420,"money_24h":3830,"strategy_points_24h":12,"random_good_of_age_24h":18},"LateMiddleAge":{"population":-550,"money_24h":5060,"strategy_points_24h":12,"random_good_of_age_24h":18},"ColonialAge":{"population":-690,"money_24h":7700,"strategy_points_24h":12,"random_good_of_age_24h":18},"IndustrialAge":{"population":-840,"money_24h":9590,"strategy_points_24h":12,"random_good_of_age_24h":18},"ProgressiveEra":{"population":-1010,"money_24h":11640,"strategy_points_24h":12,"random_good_of_age_24h":18},"ModernEra":{"population":-1180,"money_24h":14480,"strategy_points_24h":12,"random_good_of_age_24h":18},"PostModernEra":{"population":-1360,"money_24h":18220,"strategy_points_24h":12,"random_good_of_age_24h":18},"ContemporaryEra":{"population":-1550,"money_24h":23720,"strategy_points_24h":12,"random_good_of_age_24h":18},"TomorrowEra":{"population":-1750,"money_24h":27460,"strategy_points_24h":12,"random_good_of_age_24h":18},"FutureEra":{"population":-1960,"money_24h":31480,"strategy_points_24h":12,"random_good_of_age_24h":18},"ArcticFuture":{"population":-2170,"money_24h":35770,"strategy_points_24h":12,"random_good_of_age_24h":18},"OceanicFuture":{"population":-2390,"money_24h":40330,"strategy_points_24h":12,"random_good_of_age_24h":18},"VirtualFuture":{"population":-2620,"money_24h":45180,"strategy_points_24h":12,"random_good_of_age_24h":18},"SpaceAgeMars":{"population":-4140,"money_24h":75460,"strategy_points_24h":12,"random_good_of_age_24h":18},"SpaceAgeAsteroidBelt":{"population":-4500,"money_24h":83590,"strategy_points_24h":12,"random_good_of_age_24h":18},"SpaceAgeVenus":{"population":-4860,"money_24h":92140,"strategy_points_24h":12,"random_good_of_age_24h":18},"SpaceAgeJupiterMoon":{"population":-5240,"money_24h":101130,"strategy_points_24h":12,"random_good_of_age_24h":18},"SpaceAgeTitan":{"population":-5620,"money_24h":110570,"strategy_points_24h":12,"random_good_of_age_24h":18},"SpaceAgeSpaceHub":{"population":-6000,"money_24h":120000,"strategy_points_24h":12,"random_good_of_age_24h":18}}, boosts: [{"type":"att_def_boost_attacker","value":3,"feature":"all"},{"type":"att_def_boost_attacker","value":6,"feature":"guild_expedition"},{"type":"att_def_boost_attacker","value":15,"feature":"guild_raids"},{"type":"guild_raids_supplies_start","value":20000,"feature":"all"}] },
+    "W_MultiAge_SUM25E1": { prod: {"AllAge":{"strategy_points_24h":400}}, boosts: [{"type":"att_def_boost_attacker_defender","value":60,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":180,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":25,"feature":"guild_raids"},{"type":"special_goods_production","value":5,"feature":"all"}] },
+    "W_MultiAge_SUM24B1": { prod: {"BronzeAge":{"population":-20,"random_good_of_age_24h":3,"strategy_points_24h":1},"IronAge":{"population":-30,"random_good_of_age_24h":3,"strategy_points_24h":1},"EarlyMiddleAge":{"population":-50,"random_good_of_age_24h":3,"strategy_points_24h":1},"HighMiddleAge":{"population":-70,"random_good_of_age_24h":3,"strategy_points_24h":1},"LateMiddleAge":{"population":-100,"random_good_of_age_24h":3,"strategy_points_24h":1},"ColonialAge":{"population":-120,"random_good_of_age_24h":3,"strategy_points_24h":1},"IndustrialAge":{"population":-150,"random_good_of_age_24h":3,"strategy_points_24h":1},"ProgressiveEra":{"population":-180,"random_good_of_age_24h":3,"strategy_points_24h":1},"ModernEra":{"population":-210,"random_good_of_age_24h":3,"strategy_points_24h":1},"PostModernEra":{"population":-240,"random_good_of_age_24h":3,"strategy_points_24h":1},"ContemporaryEra":{"population":-280,"random_good_of_age_24h":3,"strategy_points_24h":1},"TomorrowEra":{"population":-310,"random_good_of_age_24h":3,"strategy_points_24h":1},"FutureEra":{"population":-350,"random_good_of_age_24h":3,"strategy_points_24h":1},"ArcticFuture":{"population":-390,"random_good_of_age_24h":3,"strategy_points_24h":1},"OceanicFuture":{"population":-430,"random_good_of_age_24h":3,"strategy_points_24h":1},"VirtualFuture":{"population":-470,"random_good_of_age_24h":3,"strategy_points_24h":1},"SpaceAgeMars":{"population":-740,"random_good_of_age_24h":3,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"population":-800,"random_good_of_age_24h":3,"strategy_points_24h":1},"SpaceAgeVenus":{"population":-870,"random_good_of_age_24h":3,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"population":-930,"random_good_of_age_24h":3,"strategy_points_24h":1},"SpaceAgeTitan":{"population":-1000,"random_good_of_age_24h":3,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"population":-1070,"random_good_of_age_24h":3,"strategy_points_24h":1}}, boosts: [{"type":"att_boost_attacker","value":1,"feature":"battleground"},{"type":"def_boost_defender","value":1,"feature":"guild_expedition"}] },
+    "W_MultiAge_SUM24B2": { prod: {"BronzeAge":{"population":-20,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"IronAge":{"population":-30,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"EarlyMiddleAge":{"population":-50,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"HighMiddleAge":{"population":-70,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"LateMiddleAge":{"population":-100,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"ColonialAge":{"population":-120,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"IndustrialAge":{"population":-150,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"ProgressiveEra":{"population":-180,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"ModernEra":{"population":-210,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"PostModernEra":{"population":-240,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"ContemporaryEra":{"population":-280,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"TomorrowEra":{"population":-310,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"FutureEra":{"population":-350,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"ArcticFuture":{"population":-390,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"OceanicFuture":{"population":-430,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"VirtualFuture":{"population":-470,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"SpaceAgeMars":{"population":-740,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"SpaceAgeAsteroidBelt":{"population":-800,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"SpaceAgeVenus":{"population":-870,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"SpaceAgeJupiterMoon":{"population":-930,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"SpaceAgeTitan":{"population":-1000,"random_good_of_age_24h":4,"strategy_points_24h":1.32},"SpaceAgeSpaceHub":{"population":-1070,"random_good_of_age_24h":4,"strategy_points_24h":1.32}}, boosts: [{"type":"att_boost_attacker","value":3,"feature":"battleground"},{"type":"def_boost_defender","value":3,"feature":"guild_expedition"}] },
+    "W_MultiAge_SUM24E1": { prod: {"AllAge":{"random_good_of_age_24h":108,"random_good_of_previous_age_24h":120,"strategy_points_24h":96},"BronzeAge":{"happiness":1850},"IronAge":{"happiness":3190},"EarlyMiddleAge":{"happiness":3530},"HighMiddleAge":{"happiness":3940},"LateMiddleAge":{"happiness":4390},"ColonialAge":{"happiness":5170},"IndustrialAge":{"happiness":5830},"ProgressiveEra":{"happiness":6400},"ModernEra":{"happiness":6850},"PostModernEra":{"happiness":7130},"ContemporaryEra":{"happiness":8290},"TomorrowEra":{"happiness":10060},"FutureEra":{"happiness":12050},"ArcticFuture":{"happiness":14040},"OceanicFuture":{"happiness":16200},"VirtualFuture":{"happiness":19350},"SpaceAgeMars":{"happiness":30960},"SpaceAgeAsteroidBelt":{"happiness":33650},"SpaceAgeVenus":{"happiness":36350},"SpaceAgeJupiterMoon":{"happiness":39160},"SpaceAgeTitan":{"happiness":42000},"SpaceAgeSpaceHub":{"happiness":44840}}, boosts: [{"type":"att_boost_attacker","value":84,"feature":"guild_expedition"},{"type":"def_boost_attacker","value":84,"feature":"guild_expedition"},{"type":"att_boost_defender","value":25,"feature":"guild_raids"},{"type":"att_boost_defender","value":96,"feature":"guild_expedition"},{"type":"def_boost_defender","value":96,"feature":"guild_expedition"},{"type":"supply_production","value":60,"feature":"all"}] },
+    "W_MultiAge_SUM24A11": { prod: {"BronzeAge":{"population":420,"happiness":1720,"demandHappiness":420,"money_24h":2410,"strategy_points_24h":35,"random_good_of_age_24h":104},"IronAge":{"population":900,"happiness":2970,"demandHappiness":900,"money_24h":5780,"strategy_points_24h":35,"random_good_of_age_24h":104},"EarlyMiddleAge":{"population":1370,"happiness":3280,"demandHappiness":1370,"money_24h":9640,"strategy_points_24h":35,"random_good_of_age_24h":104},"HighMiddleAge":{"population":1930,"happiness":3660,"demandHappiness":1930,"money_24h":13490,"strategy_points_24h":35,"random_good_of_age_24h":104},"LateMiddleAge":{"population":2530,"happiness":4080,"demandHappiness":2530,"money_24h":17830,"strategy_points_24h":35,"random_good_of_age_24h":104},"ColonialAge":{"population":3200,"happiness":4800,"demandHappiness":3200,"money_24h":27160,"strategy_points_24h":35,"random_good_of_age_24h":104},"IndustrialAge":{"population":3910,"happiness":5410,"demandHappiness":3910,"money_24h":33830,"strategy_points_24h":35,"random_good_of_age_24h":104},"ProgressiveEra":{"population":4670,"happiness":5940,"demandHappiness":4670,"money_24h":41060,"strategy_points_24h":35,"random_good_of_age_24h":104},"ModernEra":{"population":5470,"happiness":6360,"demandHappiness":5470,"money_24h":51090,"strategy_points_24h":35,"random_good_of_age_24h":104},"PostModernEra":{"population":6300,"happiness":6620,"demandHappiness":6300,"money_24h":64270,"strategy_points_24h":35,"random_good_of_age_24h":104},"ContemporaryEra":{"population":7180,"happiness":7700,"demandHappiness":7180,"money_24h":83670,"strategy_points_24h":35,"random_good_of_age_24h":104},"TomorrowEra":{"population":8100,"happiness":9340,"demandHappiness":8100,"money_24h":96870,"strategy_points_24h":35,"random_good_of_age_24h":104},"FutureEra":{"population":9050,"happiness":11190,"demandHappiness":9050,"money_24h":111040,"strategy_points_24h":35,"random_good_of_age_24h":104},"ArcticFuture":{"population":10040,"happiness":13030,"demandHappiness":10040,"money_24h":126180,"strategy_points_24h":35,"random_good_of_age_24h":104},"OceanicFuture":{"population":11060,"happiness":15040,"demandHappiness":11060,"money_24h":142270,"strategy_points_24h":35,"random_good_of_age_24h":104},"VirtualFuture":{"population":12110,"happiness":17970,"demandHappiness":12110,"money_24h":159360,"strategy_points_24h":35,"random_good_of_age_24h":104},"SpaceAgeMars":{"population":19170,"happiness":28750,"demandHappiness":19170,"money_24h":266190,"strategy_points_24h":35,"random_good_of_age_24h":104},"SpaceAgeAsteroidBelt":{"population":20820,"happiness":31250,"demandHappiness":20820,"money_24h":294840,"strategy_points_24h":35,"random_good_of_age_24h":104},"SpaceAgeVenus":{"population":22510,"happiness":33760,"demandHappiness":22510,"money_24h":325010,"strategy_points_24h":35,"random_good_of_age_24h":104},"SpaceAgeJupiterMoon":{"population":24240,"happiness":36370,"demandHappiness":24240,"money_24h":356720,"strategy_points_24h":35,"random_good_of_age_24h":104},"SpaceAgeTitan":{"population":26000,"happiness":39000,"demandHappiness":26000,"money_24h":390000,"strategy_points_24h":35,"random_good_of_age_24h":104},"SpaceAgeSpaceHub":{"population":27760,"happiness":41630,"demandHappiness":27760,"money_24h":423280,"strategy_points_24h":35,"random_good_of_age_24h":104}}, boosts: [{"type":"att_boost_attacker","value":26,"feature":"all"},{"type":"att_boost_attacker","value":12,"feature":"battleground"},{"type":"def_boost_attacker","value":39,"feature":"all"},{"type":"def_boost_attacker","value":25,"feature":"battleground"},{"type":"coin_production","value":26,"feature":"all"}] },
+    "W_MultiAge_SUM21B1": { prod: {"BronzeAge":{"happiness":330},"IronAge":{"happiness":470},"EarlyMiddleAge":{"happiness":560},"HighMiddleAge":{"happiness":690},"LateMiddleAge":{"happiness":800},"ColonialAge":{"happiness":940},"IndustrialAge":{"happiness":1060},"ProgressiveEra":{"happiness":1170},"ModernEra":{"happiness":1330},"PostModernEra":{"happiness":1520},"ContemporaryEra":{"happiness":1760},"TomorrowEra":{"happiness":2200},"FutureEra":{"happiness":2640},"ArcticFuture":{"happiness":2990},"OceanicFuture":{"happiness":3350},"VirtualFuture":{"happiness":4230},"SpaceAgeMars":{"happiness":6590},"SpaceAgeAsteroidBelt":{"happiness":7160},"SpaceAgeVenus":{"happiness":7730},"SpaceAgeJupiterMoon":{"happiness":8330},"SpaceAgeTitan":{"happiness":8930},"SpaceAgeSpaceHub":{"happiness":9560}} },
+    "W_MultiAge_SUM24A10": { prod: {"BronzeAge":{"population":380,"happiness":1550,"demandHappiness":380,"money_24h":2250,"strategy_points_24h":32,"random_good_of_age_24h":91},"IronAge":{"population":810,"happiness":2670,"demandHappiness":810,"money_24h":5400,"strategy_points_24h":32,"random_good_of_age_24h":91},"EarlyMiddleAge":{"population":1240,"happiness":2950,"demandHappiness":1240,"money_24h":9000,"strategy_points_24h":32,"random_good_of_age_24h":91},"HighMiddleAge":{"population":1740,"happiness":3290,"demandHappiness":1740,"money_24h":12600,"strategy_points_24h":32,"random_good_of_age_24h":91},"LateMiddleAge":{"population":2280,"happiness":3670,"demandHappiness":2280,"money_24h":16640,"strategy_points_24h":32,"random_good_of_age_24h":91},"ColonialAge":{"population":2880,"happiness":4320,"demandHappiness":2880,"money_24h":25350,"strategy_points_24h":32,"random_good_of_age_24h":91},"IndustrialAge":{"population":3520,"happiness":4870,"demandHappiness":3520,"money_24h":31580,"strategy_points_24h":32,"random_good_of_age_24h":91},"ProgressiveEra":{"population":4200,"happiness":5350,"demandHappiness":4200,"money_24h":38330,"strategy_points_24h":32,"random_good_of_age_24h":91},"ModernEra":{"population":4920,"happiness":5720,"demandHappiness":4920,"money_24h":47680,"strategy_points_24h":32,"random_good_of_age_24h":91},"PostModernEra":{"population":5670,"happiness":5960,"demandHappiness":5670,"money_24h":59980,"strategy_points_24h":32,"random_good_of_age_24h":91},"ContemporaryEra":{"population":6470,"happiness":6930,"demandHappiness":6470,"money_24h":78090,"strategy_points_24h":32,"random_good_of_age_24h":91},"TomorrowEra":{"population":7290,"happiness":8410,"demandHappiness":7290,"money_24h":90420,"strategy_points_24h":32,"random_good_of_age_24h":91},"FutureEra":{"population":8150,"happiness":10070,"demandHappiness":8150,"money_24h":103640,"strategy_points_24h":32,"random_good_of_age_24h":91},"ArcticFuture":{"population":9040,"happiness":11730,"demandHappiness":9040,"money_24h":117760,"strategy_points_24h":32,"random_good_of_age_24h":91},"OceanicFuture":{"population":9960,"happiness":13540,"demandHappiness":9960,"money_24h":132790,"strategy_points_24h":32,"random_good_of_age_24h":91},"VirtualFuture":{"population":10900,"happiness":16170,"demandHappiness":10900,"money_24h":148740,"strategy_points_24h":32,"random_good_of_age_24h":91},"SpaceAgeMars":{"population":17250,"happiness":25880,"demandHappiness":17250,"money_24h":248440,"strategy_points_24h":32,"random_good_of_age_24h":91},"SpaceAgeAsteroidBelt":{"population":18740,"happiness":28120,"demandHappiness":18740,"money_24h":275180,"strategy_points_24h":32,"random_good_of_age_24h":91},"SpaceAgeVenus":{"population":20260,"happiness":30380,"demandHappiness":20260,"money_24h":303340,"strategy_points_24h":32,"random_good_of_age_24h":91},"SpaceAgeJupiterMoon":{"population":21810,"happiness":32730,"demandHappiness":21810,"money_24h":332940,"strategy_points_24h":32,"random_good_of_age_24h":91},"SpaceAgeTitan":{"population":23400,"happiness":35100,"demandHappiness":23400,"money_24h":364000,"strategy_points_24h":32,"random_good_of_age_24h":91},"SpaceAgeSpaceHub":{"population":24990,"happiness":37470,"demandHappiness":24990,"money_24h":395060,"strategy_points_24h":32,"random_good_of_age_24h":91}}, boosts: [{"type":"att_boost_attacker","value":22,"feature":"all"},{"type":"att_boost_attacker","value":3,"feature":"battleground"},{"type":"def_boost_attacker","value":35,"feature":"all"},{"type":"def_boost_attacker","value":16,"feature":"battleground"},{"type":"coin_production","value":23,"feature":"all"}] },
+    "W_MultiAge_SUM25D1": { prod: {"AllAge":{"strategy_points_24h":250}}, boosts: [{"type":"att_def_boost_attacker_defender","value":110,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":375,"feature":"guild_expedition"},{"type":"att_def_boost_attacker_defender","value":25,"feature":"guild_raids"}] },
+    "W_MultiAge_SUM24C3": { prod: {"BronzeAge":{"population":-20,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"IronAge":{"population":-30,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"EarlyMiddleAge":{"population":-50,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"HighMiddleAge":{"population":-70,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"LateMiddleAge":{"population":-100,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"ColonialAge":{"population":-120,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"IndustrialAge":{"population":-150,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"ProgressiveEra":{"population":-180,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"ModernEra":{"population":-210,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"PostModernEra":{"population":-240,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"ContemporaryEra":{"population":-280,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"TomorrowEra":{"population":-310,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"FutureEra":{"population":-350,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"ArcticFuture":{"population":-390,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"OceanicFuture":{"population":-430,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"VirtualFuture":{"population":-470,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"SpaceAgeMars":{"population":-740,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"SpaceAgeAsteroidBelt":{"population":-800,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"SpaceAgeVenus":{"population":-870,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"SpaceAgeJupiterMoon":{"population":-930,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"SpaceAgeTitan":{"population":-1000,"strategy_points_24h":2,"random_good_of_next_age_24h":5},"SpaceAgeSpaceHub":{"population":-1070,"strategy_points_24h":2,"random_good_of_next_age_24h":5}}, boosts: [{"type":"att_boost_attacker","value":3,"feature":"guild_raids"},{"type":"def_boost_attacker","value":3,"feature":"battleground"},{"type":"att_boost_defender","value":6,"feature":"guild_expedition"},{"type":"guild_raids_supplies_production","value":1,"feature":"all"}] },
+    "W_MultiAge_SUM24B3": { prod: {"BronzeAge":{"population":-20,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"IronAge":{"population":-30,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"EarlyMiddleAge":{"population":-50,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"HighMiddleAge":{"population":-70,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"LateMiddleAge":{"population":-100,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"ColonialAge":{"population":-120,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"IndustrialAge":{"population":-150,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"ProgressiveEra":{"population":-180,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"ModernEra":{"population":-210,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"PostModernEra":{"population":-240,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"ContemporaryEra":{"population":-280,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"TomorrowEra":{"population":-310,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"FutureEra":{"population":-350,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"ArcticFuture":{"population":-390,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"OceanicFuture":{"population":-430,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"VirtualFuture":{"population":-470,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"SpaceAgeMars":{"population":-740,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"SpaceAgeAsteroidBelt":{"population":-800,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"SpaceAgeVenus":{"population":-870,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"SpaceAgeJupiterMoon":{"population":-930,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"SpaceAgeTitan":{"population":-1000,"random_good_of_age_24h":5,"strategy_points_24h":2.64},"SpaceAgeSpaceHub":{"population":-1070,"random_good_of_age_24h":5,"strategy_points_24h":2.64}}, boosts: [{"type":"att_boost_attacker","value":3,"feature":"battleground"},{"type":"att_boost_defender","value":4,"feature":"guild_raids"},{"type":"def_boost_defender","value":3,"feature":"guild_expedition"},{"type":"guild_raids_coins_production","value":1,"feature":"all"}] },
+    "W_MultiAge_SUM25C2": { prod: {"BronzeAge":{"population":-90,"medals_24h":130,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"IronAge":{"population":-190,"medals_24h":170,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"EarlyMiddleAge":{"population":-300,"medals_24h":210,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"HighMiddleAge":{"population":-420,"medals_24h":240,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"LateMiddleAge":{"population":-550,"medals_24h":280,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"ColonialAge":{"population":-690,"medals_24h":340,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"IndustrialAge":{"population":-840,"medals_24h":470,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"ProgressiveEra":{"population":-1010,"medals_24h":660,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"ModernEra":{"population":-1180,"medals_24h":940,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"PostModernEra":{"population":-1360,"medals_24h":1310,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"ContemporaryEra":{"population":-1550,"medals_24h":1880,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"TomorrowEra":{"population":-1750,"medals_24h":2530,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"FutureEra":{"population":-1960,"medals_24h":3090,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"ArcticFuture":{"population":-2170,"medals_24h":3750,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"OceanicFuture":{"population":-2390,"medals_24h":4310,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"VirtualFuture":{"population":-2620,"medals_24h":5250,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"SpaceAgeMars":{"population":-4140,"medals_24h":6380,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"SpaceAgeAsteroidBelt":{"population":-4500,"medals_24h":7500,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"SpaceAgeVenus":{"population":-4860,"medals_24h":8630,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"SpaceAgeJupiterMoon":{"population":-5240,"medals_24h":9750,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"SpaceAgeTitan":{"population":-5620,"medals_24h":10880,"strategy_points_24h":18,"random_good_of_previous_age_24h":21},"SpaceAgeSpaceHub":{"population":-6000,"medals_24h":12000,"strategy_points_24h":18,"random_good_of_previous_age_24h":21}}, boosts: [{"type":"att_def_boost_defender","value":1,"feature":"all"},{"type":"att_def_boost_defender","value":5,"feature":"battleground"},{"type":"att_def_boost_defender","value":15,"feature":"guild_raids"},{"type":"guild_raids_coins_start","value":20000,"feature":"all"}] },
+    "W_MultiAge_SummerBonus22Deadman": { prod: {"BronzeAge":{"population":162,"happiness":882,"demandHappiness":162,"money_24h":1100,"medals_24h":28,"random_good_of_age_24h":18},"IronAge":{"population":348,"happiness":1588,"demandHappiness":348,"money_24h":2700,"medals_24h":35,"random_good_of_age_24h":18},"EarlyMiddleAge":{"population":534,"happiness":1904,"demandHappiness":534,"money_24h":4500,"medals_24h":43,"random_good_of_age_24h":18},"HighMiddleAge":{"population":750,"happiness":2280,"demandHappiness":750,"money_24h":6300,"medals_24h":51,"random_good_of_age_24h":18},"LateMiddleAge":{"population":984,"happiness":2694,"demandHappiness":984,"money_24h":8300,"medals_24h":59,"random_good_of_age_24h":18},"ColonialAge":{"population":1242,"happiness":3252,"demandHappiness":1242,"money_24h":12600,"medals_24h":70,"random_good_of_age_24h":18},"IndustrialAge":{"population":1518,"happiness":3788,"demandHappiness":1518,"money_24h":15700,"medals_24h":98,"random_good_of_age_24h":18},"ProgressiveEra":{"population":1812,"happiness":4302,"demandHappiness":1812,"money_24h":19100,"medals_24h":136,"random_good_of_age_24h":18},"ModernEra":{"population":2124,"happiness":4784,"demandHappiness":2124,"money_24h":23700,"medals_24h":195,"random_good_of_age_24h":18},"PostModernEra":{"population":2448,"happiness":5218,"demandHappiness":2448,"money_24h":29900,"medals_24h":272,"random_good_of_age_24h":18},"ContemporaryEra":{"population":2790,"happiness":6010,"demandHappiness":2790,"money_24h":38900,"medals_24h":389,"random_good_of_age_24h":18},"TomorrowEra":{"population":3144,"happiness":7054,"demandHappiness":3144,"money_24h":45000,"medals_24h":525,"random_good_of_age_24h":18},"FutureEra":{"population":3516,"happiness":8206,"demandHappiness":3516,"money_24h":51600,"medals_24h":642,"random_good_of_age_24h":18},"ArcticFuture":{"population":3900,"happiness":9360,"demandHappiness":3900,"money_24h":58600,"medals_24h":778,"random_good_of_age_24h":18},"OceanicFuture":{"population":4296,"happiness":10596,"demandHappiness":4296,"money_24h":66100,"medals_24h":894,"random_good_of_age_24h":18},"VirtualFuture":{"population":4704,"happiness":12234,"demandHappiness":4704,"money_24h":74100,"medals_24h":1088,"random_good_of_age_24h":18},"SpaceAgeMars":{"population":7446,"happiness":19486,"demandHappiness":7446,"money_24h":123700,"medals_24h":1322,"random_good_of_age_24h":18},"SpaceAgeAsteroidBelt":{"population":8088,"happiness":21178,"demandHappiness":8088,"money_24h":137000,"medals_24h":1555,"random_good_of_age_24h":18},"SpaceAgeVenus":{"population":8742,"happiness":22882,"demandHappiness":8742,"money_24h":151100,"medals_24h":1788,"random_good_of_age_24h":18},"SpaceAgeJupiterMoon":{"population":9414,"happiness":24644,"demandHappiness":9414,"money_24h":165800,"medals_24h":2021,"random_good_of_age_24h":18},"SpaceAgeTitan":{"population":10138,"happiness":26543,"demandHappiness":10138,"money_24h":181931,"medals_24h":2285,"random_good_of_age_24h":18},"SpaceAgeSpaceHub":{"population":10862,"happiness":28442,"demandHappiness":10862,"money_24h":198062,"medals_24h":2549,"random_good_of_age_24h":18}}, boosts: [{"type":"att_boost_attacker","value":8,"feature":"all"},{"type":"def_boost_defender","value":13,"feature":"all"}] },
+    "W_MultiAge_SUM21D1": { prod: {"BronzeAge":{"happiness":330},"IronAge":{"happiness":470},"EarlyMiddleAge":{"happiness":560},"HighMiddleAge":{"happiness":690},"LateMiddleAge":{"happiness":800},"ColonialAge":{"happiness":940},"IndustrialAge":{"happiness":1060},"ProgressiveEra":{"happiness":1170},"ModernEra":{"happiness":1330},"PostModernEra":{"happiness":1520},"ContemporaryEra":{"happiness":1760},"TomorrowEra":{"happiness":2200},"FutureEra":{"happiness":2640},"ArcticFuture":{"happiness":2990},"OceanicFuture":{"happiness":3350},"VirtualFuture":{"happiness":4230},"SpaceAgeMars":{"happiness":6590},"SpaceAgeAsteroidBelt":{"happiness":7160},"SpaceAgeVenus":{"happiness":7730},"SpaceAgeJupiterMoon":{"happiness":8330},"SpaceAgeTitan":{"happiness":8930},"SpaceAgeSpaceHub":{"happiness":9560}} },
+    "W_MultiAge_SUM20A10": { prod: {"BronzeAge":{"population":284,"happiness":1420,"demandHappiness":284,"money_24h":2000,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"IronAge":{"population":609,"happiness":2450,"demandHappiness":609,"money_24h":4900,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"EarlyMiddleAge":{"population":935,"happiness":2700,"demandHappiness":935,"money_24h":8100,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"HighMiddleAge":{"population":1313,"happiness":3020,"demandHappiness":1313,"money_24h":11300,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"LateMiddleAge":{"population":1722,"happiness":3370,"demandHappiness":1722,"money_24h":15000,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"ColonialAge":{"population":2174,"happiness":3960,"demandHappiness":2174,"money_24h":22800,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"IndustrialAge":{"population":2657,"happiness":4460,"demandHappiness":2657,"money_24h":28400,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"ProgressiveEra":{"population":3171,"happiness":4900,"demandHappiness":3171,"money_24h":34500,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"ModernEra":{"population":3717,"happiness":5240,"demandHappiness":3717,"money_24h":42900,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"PostModernEra":{"population":4284,"happiness":5460,"demandHappiness":4284,"money_24h":54000,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"ContemporaryEra":{"population":4883,"happiness":6350,"demandHappiness":4883,"money_24h":70300,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"TomorrowEra":{"population":5502,"happiness":7700,"demandHappiness":5502,"money_24h":81400,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"FutureEra":{"population":6153,"happiness":9230,"demandHappiness":6153,"money_24h":93300,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"ArcticFuture":{"population":6825,"happiness":10750,"demandHappiness":6825,"money_24h":106000,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"OceanicFuture":{"population":7518,"happiness":12400,"demandHappiness":7518,"money_24h":119600,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"VirtualFuture":{"population":8232,"happiness":14820,"demandHappiness":8232,"money_24h":133900,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"SpaceAgeMars":{"population":13031,"happiness":23710,"demandHappiness":13031,"money_24h":223700,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"SpaceAgeAsteroidBelt":{"population":14154,"happiness":25770,"demandHappiness":14154,"money_24h":247800,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"SpaceAgeVenus":{"population":15299,"happiness":27840,"demandHappiness":15299,"money_24h":273100,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"SpaceAgeJupiterMoon":{"population":16475,"happiness":29990,"demandHappiness":16475,"money_24h":299800,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"SpaceAgeTitan":{"population":17672,"happiness":32160,"demandHappiness":17672,"money_24h":327700,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5},"SpaceAgeSpaceHub":{"population":18900,"happiness":34400,"demandHappiness":18900,"money_24h":357000,"strategy_points_24h":12,"random_good_of_age_24h":45,"units_24h":5}}, boosts: [{"type":"att_boost_attacker","value":21,"feature":"all"},{"type":"att_boost_defender","value":11,"feature":"all"},{"type":"def_boost_defender","value":11,"feature":"all"}] },
+    "W_MultiAge_SUM24D1": { prod: {"AllAge":{"strategy_points_24h":72,"random_good_of_age_24h":96},"BronzeAge":{"population":390,"demandHappiness":390},"IronAge":{"population":830,"demandHappiness":830},"EarlyMiddleAge":{"population":1270,"demandHappiness":1270},"HighMiddleAge":{"population":1780,"demandHappiness":1780},"LateMiddleAge":{"population":2340,"demandHappiness":2340},"ColonialAge":{"population":2950,"demandHappiness":2950},"IndustrialAge":{"population":3610,"demandHappiness":3610},"ProgressiveEra":{"population":4310,"demandHappiness":4310},"ModernEra":{"population":5050,"demandHappiness":5050},"PostModernEra":{"population":5820,"demandHappiness":5820},"ContemporaryEra":{"population":6630,"demandHappiness":6630},"TomorrowEra":{"population":7470,"demandHappiness":7470},"FutureEra":{"population":8360,"demandHappiness":8360},"ArcticFuture":{"population":9270,"demandHappiness":9270},"OceanicFuture":{"population":10210,"demandHappiness":10210},"VirtualFuture":{"population":11180,"demandHappiness":11180},"SpaceAgeMars":{"population":17700,"demandHappiness":17700},"SpaceAgeAsteroidBelt":{"population":19220,"demandHappiness":19220},"SpaceAgeVenus":{"population":20780,"demandHappiness":20780},"SpaceAgeJupiterMoon":{"population":22370,"demandHappiness":22370},"SpaceAgeTitan":{"population":24000,"demandHappiness":24000},"SpaceAgeSpaceHub":{"population":25630,"demandHappiness":25630}}, boosts: [{"type":"att_boost_attacker","value":96,"feature":"battleground"},{"type":"def_boost_attacker","value":96,"feature":"battleground"},{"type":"def_boost_attacker","value":25,"feature":"guild_raids"},{"type":"att_boost_defender","value":84,"feature":"battleground"},{"type":"def_boost_defender","value":84,"feature":"battleground"},{"type":"coin_production","value":60,"feature":"all"}] },
+    "W_MultiAge_SUM25C1": { prod: {"BronzeAge":{"population":-90,"medals_24h":70,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"IronAge":{"population":-190,"medals_24h":80,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"EarlyMiddleAge":{"population":-300,"medals_24h":100,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"HighMiddleAge":{"population":-420,"medals_24h":120,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"LateMiddleAge":{"population":-550,"medals_24h":140,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"ColonialAge":{"population":-690,"medals_24h":170,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"IndustrialAge":{"population":-840,"medals_24h":230,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"ProgressiveEra":{"population":-1010,"medals_24h":330,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"ModernEra":{"population":-1180,"medals_24h":470,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"PostModernEra":{"population":-1360,"medals_24h":660,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"ContemporaryEra":{"population":-1550,"medals_24h":940,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"TomorrowEra":{"population":-1750,"medals_24h":1270,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"FutureEra":{"population":-1960,"medals_24h":1550,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"ArcticFuture":{"population":-2170,"medals_24h":1880,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"OceanicFuture":{"population":-2390,"medals_24h":2160,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"VirtualFuture":{"population":-2620,"medals_24h":2630,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"SpaceAgeMars":{"population":-4140,"medals_24h":3190,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"SpaceAgeAsteroidBelt":{"population":-4500,"medals_24h":3750,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"SpaceAgeVenus":{"population":-4860,"medals_24h":4310,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"SpaceAgeJupiterMoon":{"population":-5240,"medals_24h":4880,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"SpaceAgeTitan":{"population":-5620,"medals_24h":5440,"strategy_points_24h":12,"random_good_of_previous_age_24h":9},"SpaceAgeSpaceHub":{"population":-6000,"medals_24h":6000,"strategy_points_24h":12,"random_good_of_previous_age_24h":9}}, boosts: [{"type":"att_def_boost_defender","value":1,"feature":"all"},{"type":"att_def_boost_defender","value":5,"feature":"battleground"}] },
+    "W_MultiAge_SummerBonus22a": { prod: {"BronzeAge":{"population":140,"happiness":660,"demandHappiness":140,"money_24h":400},"IronAge":{"population":302,"happiness":1202,"demandHappiness":302,"money_24h":1100},"EarlyMiddleAge":{"population":463,"happiness":1463,"demandHappiness":463,"money_24h":1800},"HighMiddleAge":{"population":650,"happiness":1760,"demandHappiness":650,"money_24h":2500},"LateMiddleAge":{"population":853,"happiness":2093,"demandHappiness":853,"money_24h":3300},"ColonialAge":{"population":1076,"happiness":2536,"demandHappiness":1076,"money_24h":5000},"IndustrialAge":{"population":1316,"happiness":2956,"demandHappiness":1316,"money_24h":6200},"ProgressiveEra":{"population":1570,"happiness":3370,"demandHappiness":1570,"money_24h":7600},"ModernEra":{"population":1841,"happiness":3771,"demandHappiness":1841,"money_24h":9400},"PostModernEra":{"population":2122,"happiness":4132,"demandHappiness":2122,"money_24h":11800},"ContemporaryEra":{"population":2418,"happiness":4758,"demandHappiness":2418,"money_24h":15400},"TomorrowEra":{"population":2725,"happiness":5565,"demandHappiness":2725,"money_24h":17900},"FutureEra":{"population":3047,"happiness":6447,"demandHappiness":3047,"money_24h":20500},"ArcticFuture":{"population":3380,"happiness":7340,"demandHappiness":3380,"money_24h":23300},"OceanicFuture":{"population":3723,"happiness":8293,"demandHappiness":3723,"money_24h":26200},"VirtualFuture":{"population":4077,"happiness":9537,"demandHappiness":4077,"money_24h":29400},"SpaceAgeMars":{"population":6453,"happiness":15183,"demandHappiness":6453,"money_24h":49000},"SpaceAgeAsteroidBelt":{"population":7010,"happiness":16500,"demandHappiness":7010,"money_24h":54300},"SpaceAgeVenus":{"population":7576,"happiness":17826,"demandHappiness":7576,"money_24h":59900},"SpaceAgeJupiterMoon":{"population":8159,"happiness":19199,"demandHappiness":8159,"money_24h":65700},"SpaceAgeTitan":{"population":8787,"happiness":20678,"demandHappiness":8787,"money_24h":72062},"SpaceAgeSpaceHub":{"population":9415,"happiness":22157,"demandHappiness":9415,"money_24h":78424}} },
+    "W_MultiAge_SummerBonus22j": { prod: {"BronzeAge":{"population":160,"happiness":840,"demandHappiness":160,"money_24h":800,"medals_24h":24,"random_good_of_age_24h":14},"IronAge":{"population":343,"happiness":1523,"demandHappiness":343,"money_24h":1900,"medals_24h":31,"random_good_of_age_24h":14},"EarlyMiddleAge":{"population":527,"happiness":1837,"demandHappiness":527,"money_24h":3100,"medals_24h":38,"random_good_of_age_24h":14},"HighMiddleAge":{"population":740,"happiness":2200,"demandHappiness":740,"money_24h":4400,"medals_24h":45,"random_good_of_age_24h":14},"LateMiddleAge":{"population":971,"happiness":2591,"demandHappiness":971,"money_24h":5700,"medals_24h":52,"random_good_of_age_24h":14},"ColonialAge":{"population":1225,"happiness":3135,"demandHappiness":1225,"money_24h":8800,"medals_24h":62,"random_good_of_age_24h":14},"IndustrialAge":{"population":1498,"happiness":3648,"demandHappiness":1498,"money_24h":10900,"medals_24h":86,"random_good_of_age_24h":14},"ProgressiveEra":{"population":1788,"happiness":4148,"demandHappiness":1788,"money_24h":13200,"medals_24h":120,"random_good_of_age_24h":14},"ModernEra":{"population":2096,"happiness":4626,"demandHappiness":2096,"money_24h":16500,"medals_24h":172,"random_good_of_age_24h":14},"PostModernEra":{"population":2415,"happiness":5055,"demandHappiness":2415,"money_24h":20700,"medals_24h":240,"random_good_of_age_24h":14},"ContemporaryEra":{"population":2753,"happiness":5813,"demandHappiness":2753,"money_24h":26900,"medals_24h":343,"random_good_of_age_24h":14},"TomorrowEra":{"population":3102,"happiness":6822,"demandHappiness":3102,"money_24h":31200,"medals_24h":463,"random_good_of_age_24h":14},"FutureEra":{"population":3469,"happiness":7919,"demandHappiness":3469,"money_24h":35800,"medals_24h":566,"random_good_of_age_24h":14},"ArcticFuture":{"population":3848,"happiness":9038,"demandHappiness":3848,"money_24h":40600,"medals_24h":686,"random_good_of_age_24h":14},"OceanicFuture":{"population":4239,"happiness":10229,"demandHappiness":4239,"money_24h":45800,"medals_24h":789,"random_good_of_age_24h":14},"VirtualFuture":{"population":4641,"happiness":11791,"demandHappiness":4641,"money_24h":51300,"medals_24h":960,"random_good_of_age_24h":14},"SpaceAgeMars":{"population":7347,"happiness":18787,"demandHappiness":7347,"money_24h":85700,"medals_24h":1166,"random_good_of_age_24h":14},"SpaceAgeAsteroidBelt":{"population":7980,"happiness":20410,"demandHappiness":7980,"money_24h":94900,"medals_24h":1372,"random_good_of_age_24h":14},"SpaceAgeVenus":{"population":8625,"happiness":22055,"demandHappiness":8625,"money_24h":104700,"medals_24h":1578,"random_good_of_age_24h":14},"SpaceAgeJupiterMoon":{"population":9288,"happiness":23758,"demandHappiness":9288,"money_24h":114900,"medals_24h":1783,"random_good_of_age_24h":14},"SpaceAgeTitan":{"population":10002,"happiness":25593,"demandHappiness":10002,"money_24h":126094,"medals_24h":2015,"random_good_of_age_24h":14},"SpaceAgeSpaceHub":{"population":10716,"happiness":27428,"demandHappiness":10716,"money_24h":137288,"medals_24h":2247,"random_good_of_age_24h":14}} },
+    "W_MultiAge_SummerBonus22b": { prod: {"BronzeAge":{"population":143,"happiness":683,"demandHappiness":143,"money_24h":500,"medals_24h":8},"IronAge":{"population":306,"happiness":1236,"demandHappiness":306,"money_24h":1100,"medals_24h":11},"EarlyMiddleAge":{"population":470,"happiness":1500,"demandHappiness":470,"money_24h":1800,"medals_24h":13},"HighMiddleAge":{"population":660,"happiness":1810,"demandHappiness":660,"money_24h":2500,"medals_24h":15},"LateMiddleAge":{"population":866,"happiness":2146,"demandHappiness":866,"money_24h":3300,"medals_24h":18},"ColonialAge":{"population":1093,"happiness":2603,"demandHappiness":1093,"money_24h":5100,"medals_24h":21},"IndustrialAge":{"population":1336,"happiness":3036,"demandHappiness":1336,"money_24h":6400,"medals_24h":29},"ProgressiveEra":{"population":1595,"happiness":3465,"demandHappiness":1595,"money_24h":7700,"medals_24h":40},"ModernEra":{"population":1869,"happiness":3869,"demandHappiness":1869,"money_24h":9600,"medals_24h":58},"PostModernEra":{"population":2154,"happiness":4234,"demandHappiness":2154,"money_24h":12100,"medals_24h":80},"ContemporaryEra":{"population":2455,"happiness":4875,"demandHappiness":2455,"money_24h":15700,"medals_24h":115},"TomorrowEra":{"population":2767,"happiness":5707,"demandHappiness":2767,"money_24h":18200,"medals_24h":155},"FutureEra":{"population":3094,"happiness":6614,"demandHappiness":3094,"money_24h":20800,"medals_24h":189},"ArcticFuture":{"population":3432,"happiness":7522,"demandHappiness":3432,"money_24h":23700,"medals_24h":229},"OceanicFuture":{"population":3780,"happiness":8510,"demandHappiness":3780,"money_24h":26700,"medals_24h":263},"VirtualFuture":{"population":4140,"happiness":9790,"demandHappiness":4140,"money_24h":29900,"medals_24h":320},"SpaceAgeMars":{"population":6552,"happiness":15582,"demandHappiness":6552,"money_24h":49900,"medals_24h":389},"SpaceAgeAsteroidBelt":{"population":7117,"happiness":16937,"demandHappiness":7117,"money_24h":55300,"medals_24h":458},"SpaceAgeVenus":{"population":7693,"happiness":18303,"demandHappiness":7693,"money_24h":61000,"medals_24h":526},"SpaceAgeJupiterMoon":{"population":8284,"happiness":19704,"demandHappiness":8284,"money_24h":66900,"medals_24h":595},"SpaceAgeTitan":{"population":8921,"happiness":21213,"demandHappiness":8921,"money_24h":73371,"medals_24h":674},"SpaceAgeSpaceHub":{"population":9558,"happiness":22722,"demandHappiness":9558,"money_24h":79842,"medals_24h":753}} },
+    "W_MultiAge_SummerBonus22c": { prod: {"BronzeAge":{"population":145,"happiness":705,"demandHappiness":145,"money_24h":500,"medals_24h":10,"random_good_of_age_24h":1},"IronAge":{"population":311,"happiness":1271,"demandHappiness":311,"money_24h":1100,"medals_24h":13,"random_good_of_age_24h":1},"EarlyMiddleAge":{"population":477,"happiness":1537,"demandHappiness":477,"money_24h":1900,"medals_24h":16,"random_good_of_age_24h":1},"HighMiddleAge":{"population":670,"happiness":1860,"demandHappiness":670,"money_24h":2600,"medals_24h":18,"random_good_of_age_24h":1},"LateMiddleAge":{"population":879,"happiness":2199,"demandHappiness":879,"money_24h":3400,"medals_24h":21,"random_good_of_age_24h":1},"ColonialAge":{"population":1110,"happiness":2670,"demandHappiness":1110,"money_24h":5200,"medals_24h":25,"random_good_of_age_24h":1},"IndustrialAge":{"population":1356,"happiness":3116,"demandHappiness":1356,"money_24h":6500,"medals_24h":35,"random_good_of_age_24h":1},"ProgressiveEra":{"population":1619,"happiness":3549,"demandHappiness":1619,"money_24h":7900,"medals_24h":48,"random_good_of_age_24h":1},"ModernEra":{"population":1897,"happiness":3957,"demandHappiness":1897,"money_24h":9800,"medals_24h":69,"random_good_of_age_24h":1},"PostModernEra":{"population":2187,"happiness":4337,"demandHappiness":2187,"money_24h":12400,"medals_24h":96,"random_good_of_age_24h":1},"ContemporaryEra":{"population":2492,"happiness":4992,"demandHappiness":2492,"money_24h":16100,"medals_24h":138,"random_good_of_age_24h":1},"TomorrowEra":{"population":2809,"happiness":5839,"demandHappiness":2809,"money_24h":18700,"medals_24h":186,"random_good_of_age_24h":1},"FutureEra":{"population":3141,"happiness":6771,"demandHappiness":3141,"money_24h":21400,"medals_24h":227,"random_good_of_age_24h":1},"ArcticFuture":{"population":3484,"happiness":7714,"demandHappiness":3484,"money_24h":24300,"medals_24h":275,"random_good_of_age_24h":1},"OceanicFuture":{"population":3838,"happiness":8718,"demandHappiness":3838,"money_24h":27400,"medals_24h":316,"random_good_of_age_24h":1},"VirtualFuture":{"population":4202,"happiness":10032,"demandHappiness":4202,"money_24h":30700,"medals_24h":384,"random_good_of_age_24h":1},"SpaceAgeMars":{"population":6652,"happiness":15982,"demandHappiness":6652,"money_24h":51300,"medals_24h":467,"random_good_of_age_24h":1},"SpaceAgeAsteroidBelt":{"population":7225,"happiness":17365,"demandHappiness":7225,"money_24h":56800,"medals_24h":549,"random_good_of_age_24h":1},"SpaceAgeVenus":{"population":7810,"happiness":18770,"demandHappiness":7810,"money_24h":62600,"medals_24h":631,"random_good_of_age_24h":1},"SpaceAgeJupiterMoon":{"population":8410,"happiness":20210,"demandHappiness":8410,"money_24h":68700,"medals_24h":714,"random_good_of_age_24h":1},"SpaceAgeTitan":{"population":9057,"happiness":21762,"demandHappiness":9057,"money_24h":75395,"medals_24h":808,"random_good_of_age_24h":1},"SpaceAgeSpaceHub":{"population":9704,"happiness":23314,"demandHappiness":9704,"money_24h":82090,"medals_24h":902,"random_good_of_age_24h":1}} },
+    "W_MultiAge_SummerBonus22d": { prod: {"BronzeAge":{"population":147,"happiness":727,"demandHappiness":147,"money_24h":500,"medals_24h":12,"random_good_of_age_24h":2},"IronAge":{"population":316,"happiness":1306,"demandHappiness":316,"money_24h":1200,"medals_24h":15,"random_good_of_age_24h":2},"EarlyMiddleAge":{"population":484,"happiness":1584,"demandHappiness":484,"money_24h":1900,"medals_24h":18,"random_good_of_age_24h":2},"HighMiddleAge":{"population":680,"happiness":1910,"demandHappiness":680,"money_24h":2700,"medals_24h":21,"random_good_of_age_24h":2},"LateMiddleAge":{"population":892,"happiness":2262,"demandHappiness":892,"money_24h":3600,"medals_24h":24,"random_good_of_age_24h":2},"ColonialAge":{"population":1126,"happiness":2736,"demandHappiness":1126,"money_24h":5400,"medals_24h":29,"random_good_of_age_24h":2},"IndustrialAge":{"population":1376,"happiness":3186,"demandHappiness":1376,"money_24h":6700,"medals_24h":40,"random_good_of_age_24h":2},"ProgressiveEra":{"population":1643,"happiness":3633,"demandHappiness":1643,"money_24h":8200,"medals_24h":56,"random_good_of_age_24h":2},"ModernEra":{"population":1926,"happiness":4056,"demandHappiness":1926,"money_24h":10200,"medals_24h":80,"random_good_of_age_24h":2},"PostModernEra":{"population":2220,"happiness":4440,"demandHappiness":2220,"money_24h":12800,"medals_24h":112,"random_good_of_age_24h":2},"ContemporaryEra":{"population":2530,"happiness":5110,"demandHappiness":2530,"money_24h":16700,"medals_24h":160,"random_good_of_age_24h":2},"TomorrowEra":{"population":2851,"happiness":5981,"demandHappiness":2851,"money_24h":19300,"medals_24h":216,"random_good_of_age_24h":2},"FutureEra":{"population":3188,"happiness":6938,"demandHappiness":3188,"money_24h":22100,"medals_24h":264,"random_good_of_age_24h":2},"ArcticFuture":{"population":3536,"happiness":7906,"demandHappiness":3536,"money_24h":25100,"medals_24h":320,"random_good_of_age_24h":2},"OceanicFuture":{"population":3895,"happiness":8935,"demandHappiness":3895,"money_24h":28300,"medals_24h":368,"random_good_of_age_24h":2},"VirtualFuture":{"population":4265,"happiness":10285,"demandHappiness":4265,"money_24h":31700,"medals_24h":448,"random_good_of_age_24h":2},"SpaceAgeMars":{"population":6751,"happiness":16381,"demandHappiness":6751,"money_24h":53000,"medals_24h":544,"random_good_of_age_24h":2},"SpaceAgeAsteroidBelt":{"population":7333,"happiness":17803,"demandHappiness":7333,"money_24h":58700,"medals_24h":640,"random_good_of_age_24h":2},"SpaceAgeVenus":{"population":7926,"happiness":19236,"demandHappiness":7926,"money_24h":64700,"medals_24h":736,"random_good_of_age_24h":2},"SpaceAgeJupiterMoon":{"population":8535,"happiness":20725,"demandHappiness":8535,"money_24h":71100,"medals_24h":832,"random_good_of_age_24h":2},"SpaceAgeTitan":{"population":9191,"happiness":22330,"demandHappiness":9191,"money_24h":78134,"medals_24h":941,"random_good_of_age_24h":2},"SpaceAgeSpaceHub":{"population":9847,"happiness":23935,"demandHappiness":9847,"money_24h":85168,"medals_24h":1050,"random_good_of_age_24h":2}} },
+    "W_MultiAge_SummerBonus22e": { prod: {"BronzeAge":{"population":149,"happiness":739,"demandHappiness":149,"money_24h":500,"medals_24h":13,"random_good_of_age_24h":3},"IronAge":{"population":320,"happiness":1340,"demandHappiness":320,"money_24h":1200,"medals_24h":17,"random_good_of_age_24h":3},"EarlyMiddleAge":{"population":491,"happiness":1621,"demandHappiness":491,"money_24h":2000,"medals_24h":21,"random_good_of_age_24h":3},"HighMiddleAge":{"population":690,"happiness":1950,"demandHappiness":690,"money_24h":2800,"medals_24h":24,"random_good_of_age_24h":3},"LateMiddleAge":{"population":905,"happiness":2315,"demandHappiness":905,"money_24h":3700,"medals_24h":28,"random_good_of_age_24h":3},"ColonialAge":{"population":1143,"happiness":2803,"demandHappiness":1143,"money_24h":5700,"medals_24h":33,"random_good_of_age_24h":3},"IndustrialAge":{"population":1397,"happiness":3267,"demandHappiness":1397,"money_24h":7100,"medals_24h":46,"random_good_of_age_24h":3},"ProgressiveEra":{"population":1667,"happiness":3717,"demandHappiness":1667,"money_24h":8600,"medals_24h":64,"random_good_of_age_24h":3},"ModernEra":{"population":1954,"happiness":4154,"demandHappiness":1954,"money_24h":10700,"medals_24h":92,"random_good_of_age_24h":3},"PostModernEra":{"population":2252,"happiness":4542,"demandHappiness":2252,"money_24h":13400,"medals_24h":128,"random_good_of_age_24h":3},"ContemporaryEra":{"population":2567,"happiness":5227,"demandHappiness":2567,"money_24h":17500,"medals_24h":183,"random_good_of_age_24h":3},"TomorrowEra":{"population":2892,"happiness":6122,"demandHappiness":2892,"money_24h":20300,"medals_24h":247,"random_good_of_age_24h":3},"FutureEra":{"population":3235,"happiness":7105,"demandHappiness":3235,"money_24h":23200,"medals_24h":302,"random_good_of_age_24h":3},"ArcticFuture":{"population":3588,"happiness":8088,"demandHappiness":3588,"money_24h":26400,"medals_24h":366,"random_good_of_age_24h":3},"OceanicFuture":{"population":3952,"happiness":9152,"demandHappiness":3952,"money_24h":29800,"medals_24h":421,"random_good_of_age_24h":3},"VirtualFuture":{"population":4328,"happiness":10538,"demandHappiness":4328,"money_24h":33300,"medals_24h":512,"random_good_of_age_24h":3},"SpaceAgeMars":{"population":6850,"happiness":16790,"demandHappiness":6850,"money_24h":55700,"medals_24h":622,"random_good_of_age_24h":3},"SpaceAgeAsteroidBelt":{"population":7441,"happiness":18241,"demandHappiness":7441,"money_24h":61700,"medals_24h":732,"random_good_of_age_24h":3},"SpaceAgeVenus":{"population":8043,"happiness":19713,"demandHappiness":8043,"money_24h":68000,"medals_24h":842,"random_good_of_age_24h":3},"SpaceAgeJupiterMoon":{"population":8661,"happiness":21231,"demandHappiness":8661,"money_24h":74600,"medals_24h":951,"random_good_of_age_24h":3},"SpaceAgeTitan":{"population":9327,"happiness":22867,"demandHappiness":9327,"money_24h":81841,"medals_24h":1075,"random_good_of_age_24h":3},"SpaceAgeSpaceHub":{"population":9993,"happiness":24503,"demandHappiness":9993,"money_24h":89082,"medals_24h":1199,"random_good_of_age_24h":3}} },
+    "W_MultiAge_SummerBonus22f": { prod: {"BronzeAge":{"population":151,"happiness":761,"demandHappiness":151,"money_24h":500,"medals_24h":15,"random_good_of_age_24h":5},"IronAge":{"population":325,"happiness":1385,"demandHappiness":325,"money_24h":1300,"medals_24h":19,"random_good_of_age_24h":5},"EarlyMiddleAge":{"population":498,"happiness":1668,"demandHappiness":498,"money_24h":2100,"medals_24h":23,"random_good_of_age_24h":5},"HighMiddleAge":{"population":700,"happiness":2000,"demandHappiness":700,"money_24h":3000,"medals_24h":27,"random_good_of_age_24h":5},"LateMiddleAge":{"population":918,"happiness":2368,"demandHappiness":918,"money_24h":4000,"medals_24h":31,"random_good_of_age_24h":5},"ColonialAge":{"population":1159,"happiness":2869,"demandHappiness":1159,"money_24h":6000,"medals_24h":38,"random_good_of_age_24h":5},"IndustrialAge":{"population":1417,"happiness":3347,"demandHappiness":1417,"money_24h":7500,"medals_24h":52,"random_good_of_age_24h":5},"ProgressiveEra":{"population":1691,"happiness":3811,"demandHappiness":1691,"money_24h":9100,"medals_24h":72,"random_good_of_age_24h":5},"ModernEra":{"population":1982,"happiness":4242,"demandHappiness":1982,"money_24h":11400,"medals_24h":103,"random_good_of_age_24h":5},"PostModernEra":{"population":2285,"happiness":4645,"demandHappiness":2285,"money_24h":14300,"medals_24h":144,"random_good_of_age_24h":5},"ContemporaryEra":{"population":2604,"happiness":5344,"demandHappiness":2604,"money_24h":18600,"medals_24h":206,"random_good_of_age_24h":5},"TomorrowEra":{"population":2934,"happiness":6264,"demandHappiness":2934,"money_24h":21600,"medals_24h":278,"random_good_of_age_24h":5},"FutureEra":{"population":3282,"happiness":7272,"demandHappiness":3282,"money_24h":24700,"medals_24h":340,"random_good_of_age_24h":5},"ArcticFuture":{"population":3640,"happiness":8280,"demandHappiness":3640,"money_24h":28100,"medals_24h":412,"random_good_of_age_24h":5},"OceanicFuture":{"population":4010,"happiness":9370,"demandHappiness":4010,"money_24h":31700,"medals_24h":474,"random_good_of_age_24h":5},"VirtualFuture":{"population":4390,"happiness":10790,"demandHappiness":4390,"money_24h":35500,"medals_24h":576,"random_good_of_age_24h":5},"SpaceAgeMars":{"population":6950,"happiness":17190,"demandHappiness":6950,"money_24h":59200,"medals_24h":700,"random_good_of_age_24h":5},"SpaceAgeAsteroidBelt":{"population":7549,"happiness":18669,"demandHappiness":7549,"money_24h":65600,"medals_24h":823,"random_good_of_age_24h":5},"SpaceAgeVenus":{"population":8159,"happiness":20179,"demandHappiness":8159,"money_24h":72300,"medals_24h":947,"random_good_of_age_24h":5},"SpaceAgeJupiterMoon":{"population":8786,"happiness":21736,"demandHappiness":8786,"money_24h":79300,"medals_24h":1070,"random_good_of_age_24h":5},"SpaceAgeTitan":{"population":9462,"happiness":23414,"demandHappiness":9462,"money_24h":86978,"medals_24h":1209,"random_good_of_age_24h":5},"SpaceAgeSpaceHub":{"population":10138,"happiness":25092,"demandHappiness":10138,"money_24h":94656,"medals_24h":1348,"random_good_of_age_24h":5}} },
+    "W_MultiAge_SummerBonus22g": { prod: {"BronzeAge":{"population":153,"happiness":783,"demandHappiness":153,"money_24h":600,"medals_24h":16,"random_good_of_age_24h":8},"IronAge":{"population":329,"happiness":1419,"demandHappiness":329,"money_24h":1400,"medals_24h":21,"random_good_of_age_24h":8},"EarlyMiddleAge":{"population":506,"happiness":1706,"demandHappiness":506,"money_24h":2300,"medals_24h":26,"random_good_of_age_24h":8},"HighMiddleAge":{"population":710,"happiness":2050,"demandHappiness":710,"money_24h":3200,"medals_24h":30,"random_good_of_age_24h":8},"LateMiddleAge":{"population":932,"happiness":2432,"demandHappiness":932,"money_24h":4300,"medals_24h":35,"random_good_of_age_24h":8},"ColonialAge":{"population":1176,"happiness":2936,"demandHappiness":1176,"money_24h":6500,"medals_24h":42,"random_good_of_age_24h":8},"IndustrialAge":{"population":1437,"happiness":3417,"demandHappiness":1437,"money_24h":8100,"medals_24h":58,"random_good_of_age_24h":8},"ProgressiveEra":{"population":1715,"happiness":3895,"demandHappiness":1715,"money_24h":9800,"medals_24h":80,"random_good_of_age_24h":8},"ModernEra":{"population":2011,"happiness":4341,"demandHappiness":2011,"money_24h":12200,"medals_24h":115,"random_good_of_age_24h":8},"PostModernEra":{"population":2317,"happiness":4747,"demandHappiness":2317,"money_24h":15400,"medals_24h":160,"random_good_of_age_24h":8},"ContemporaryEra":{"population":2641,"happiness":5461,"demandHappiness":2641,"money_24h":20000,"medals_24h":229,"random_good_of_age_24h":8},"TomorrowEra":{"population":2976,"happiness":6396,"demandHappiness":2976,"money_24h":23200,"medals_24h":309,"random_good_of_age_24h":8},"FutureEra":{"population":3328,"happiness":7428,"demandHappiness":3328,"money_24h":26500,"medals_24h":378,"random_good_of_age_24h":8},"ArcticFuture":{"population":3692,"happiness":8472,"demandHappiness":3692,"money_24h":30200,"medals_24h":458,"random_good_of_age_24h":8},"OceanicFuture":{"population":4067,"happiness":9577,"demandHappiness":4067,"money_24h":34000,"medals_24h":526,"random_good_of_age_24h":8},"VirtualFuture":{"population":4453,"happiness":11043,"demandHappiness":4453,"money_24h":38100,"medals_24h":640,"random_good_of_age_24h":8},"SpaceAgeMars":{"population":7049,"happiness":17589,"demandHappiness":7049,"money_24h":63600,"medals_24h":778,"random_good_of_age_24h":8},"SpaceAgeAsteroidBelt":{"population":7657,"happiness":19107,"demandHappiness":7657,"money_24h":70500,"medals_24h":915,"random_good_of_age_24h":8},"SpaceAgeVenus":{"population":8276,"happiness":20646,"demandHappiness":8276,"money_24h":77700,"medals_24h":1052,"random_good_of_age_24h":8},"SpaceAgeJupiterMoon":{"population":8912,"happiness":22242,"demandHappiness":8912,"money_24h":85300,"medals_24h":1189,"random_good_of_age_24h":8},"SpaceAgeTitan":{"population":9597,"happiness":23962,"demandHappiness":9597,"money_24h":93644,"medals_24h":1344,"random_good_of_age_24h":8},"SpaceAgeSpaceHub":{"population":10282,"happiness":25682,"demandHappiness":10282,"money_24h":101988,"medals_24h":1499,"random_good_of_age_24h":8}} },
+    "W_MultiAge_SummerBonus22h": { prod: {"BronzeAge":{"population":156,"happiness":806,"demandHappiness":156,"money_24h":600,"medals_24h":18,"random_good_of_age_24h":10},"IronAge":{"population":334,"happiness":1454,"demandHappiness":334,"money_24h":1500,"medals_24h":23,"random_good_of_age_24h":10},"EarlyMiddleAge":{"population":513,"happiness":1753,"demandHappiness":513,"money_24h":2500,"medals_24h":28,"random_good_of_age_24h":10},"HighMiddleAge":{"population":720,"happiness":2100,"demandHappiness":720,"money_24h":3500,"medals_24h":33,"random_good_of_age_24h":10},"LateMiddleAge":{"population":945,"happiness":2485,"demandHappiness":945,"money_24h":4600,"medals_24h":38,"random_good_of_age_24h":10},"ColonialAge":{"population":1192,"happiness":3002,"demandHappiness":1192,"money_24h":7000,"medals_24h":46,"random_good_of_age_24h":10},"IndustrialAge":{"population":1457,"happiness":3497,"demandHappiness":1457,"money_24h":8800,"medals_24h":63,"random_good_of_age_24h":10},"ProgressiveEra":{"population":1740,"happiness":3980,"demandHappiness":1740,"money_24h":10600,"medals_24h":88,"random_good_of_age_24h":10},"ModernEra":{"population":2039,"happiness":4439,"demandHappiness":2039,"money_24h":13200,"medals_24h":126,"random_good_of_age_24h":10},"PostModernEra":{"population":2350,"happiness":4850,"demandHappiness":2350,"money_24h":16600,"medals_24h":176,"random_good_of_age_24h":10},"ContemporaryEra":{"population":2678,"happiness":5578,"demandHappiness":2678,"money_24h":21700,"medals_24h":252,"random_good_of_age_24h":10},"TomorrowEra":{"population":3018,"happiness":6538,"demandHappiness":3018,"money_24h":25100,"medals_24h":340,"random_good_of_age_24h":10},"FutureEra":{"population":3375,"happiness":7595,"demandHappiness":3375,"money_24h":28800,"medals_24h":415,"random_good_of_age_24h":10},"ArcticFuture":{"population":3744,"happiness":8654,"demandHappiness":3744,"money_24h":32700,"medals_24h":503,"random_good_of_age_24h":10},"OceanicFuture":{"population":4124,"happiness":9794,"demandHappiness":4124,"money_24h":36800,"medals_24h":579,"random_good_of_age_24h":10},"VirtualFuture":{"population":4516,"happiness":11286,"demandHappiness":4516,"money_24h":41300,"medals_24h":704,"random_good_of_age_24h":10},"SpaceAgeMars":{"population":7148,"happiness":17988,"demandHappiness":7148,"money_24h":68900,"medals_24h":855,"random_good_of_age_24h":10},"SpaceAgeAsteroidBelt":{"population":7764,"happiness":19544,"demandHappiness":7764,"money_24h":76400,"medals_24h":1006,"random_good_of_age_24h":10},"SpaceAgeVenus":{"population":8392,"happiness":21122,"demandHappiness":8392,"money_24h":84200,"medals_24h":1157,"random_good_of_age_24h":10},"SpaceAgeJupiterMoon":{"population":9037,"happiness":22747,"demandHappiness":9037,"money_24h":92400,"medals_24h":1308,"random_good_of_age_24h":10},"SpaceAgeTitan":{"population":9732,"happiness":24498,"demandHappiness":9732,"money_24h":101399,"medals_24h":1479,"random_good_of_age_24h":10},"SpaceAgeSpaceHub":{"population":10427,"happiness":26249,"demandHappiness":10427,"money_24h":110398,"medals_24h":1650,"random_good_of_age_24h":10}} },
+    "W_MultiAge_SummerBonus22i": { prod: {"BronzeAge":{"population":158,"happiness":828,"demandHappiness":158,"money_24h":700,"medals_24h":21,"random_good_of_age_24h":12},"IronAge":{"population":339,"happiness":1489,"demandHappiness":339,"money_24h":1600,"medals_24h":27,"random_good_of_age_24h":12},"EarlyMiddleAge":{"population":520,"happiness":1790,"demandHappiness":520,"money_24h":2700,"medals_24h":33,"random_good_of_age_24h":12},"HighMiddleAge":{"population":730,"happiness":2150,"demandHappiness":730,"money_24h":3800,"medals_24h":39,"random_good_of_age_24h":12},"LateMiddleAge":{"population":958,"happiness":2538,"demandHappiness":958,"money_24h":5000,"medals_24h":45,"random_good_of_age_24h":12},"ColonialAge":{"population":1209,"happiness":3069,"demandHappiness":1209,"money_24h":7700,"medals_24h":54,"random_good_of_age_24h":12},"IndustrialAge":{"population":1478,"happiness":3578,"demandHappiness":1478,"money_24h":9600,"medals_24h":75,"random_good_of_age_24h":12},"ProgressiveEra":{"population":1764,"happiness":4064,"demandHappiness":1764,"money_24h":11600,"medals_24h":104,"random_good_of_age_24h":12},"ModernEra":{"population":2067,"happiness":4527,"demandHappiness":2067,"money_24h":14400,"medals_24h":149,"random_good_of_age_24h":12},"PostModernEra":{"population":2383,"happiness":4953,"demandHappiness":2383,"money_24h":18100,"medals_24h":208,"random_good_of_age_24h":12},"ContemporaryEra":{"population":2716,"happiness":5696,"demandHappiness":2716,"money_24h":23600,"medals_24h":298,"random_good_of_age_24h":12},"TomorrowEra":{"population":3060,"happiness":6680,"demandHappiness":3060,"money_24h":27300,"medals_24h":402,"random_good_of_age_24h":12},"FutureEra":{"population":3422,"happiness":7762,"demandHappiness":3422,"money_24h":31300,"medals_24h":491,"random_good_of_age_24h":12},"ArcticFuture":{"population":3796,"happiness":8846,"demandHappiness":3796,"money_24h":35600,"medals_24h":595,"random_good_of_age_24h":12},"OceanicFuture":{"population":4181,"happiness":10011,"demandHappiness":4181,"money_24h":40200,"medals_24h":684,"random_good_of_age_24h":12},"VirtualFuture":{"population":4579,"happiness":11539,"demandHappiness":4579,"money_24h":45000,"medals_24h":832,"random_good_of_age_24h":12},"SpaceAgeMars":{"population":7247,"happiness":18387,"demandHappiness":7247,"money_24h":75100,"medals_24h":1011,"random_good_of_age_24h":12},"SpaceAgeAsteroidBelt":{"population":7872,"happiness":19982,"demandHappiness":7872,"money_24h":83200,"medals_24h":1189,"random_good_of_age_24h":12},"SpaceAgeVenus":{"population":8509,"happiness":21589,"demandHappiness":8509,"money_24h":91700,"medals_24h":1367,"random_good_of_age_24h":12},"SpaceAgeJupiterMoon":{"population":9163,"happiness":23253,"demandHappiness":9163,"money_24h":100700,"medals_24h":1546,"random_good_of_age_24h":12},"SpaceAgeTitan":{"population":9868,"happiness":25046,"demandHappiness":9868,"money_24h":110584,"medals_24h":1749,"random_good_of_age_24h":12},"SpaceAgeSpaceHub":{"population":10573,"happiness":26839,"demandHappiness":10573,"money_24h":120468,"medals_24h":1952,"random_good_of_age_24h":12}} },
+    "W_MultiAge_SUM20A12": { prod: {"BronzeAge":{"population":450,"happiness":2480,"demandHappiness":450,"money_24h":5120,"strategy_points_24h":100,"random_good_of_age_24h":250},"IronAge":{"population":970,"happiness":4270,"demandHappiness":970,"money_24h":12300,"strategy_points_24h":100,"random_good_of_age_24h":250},"EarlyMiddleAge":{"population":1490,"happiness":4730,"demandHappiness":1490,"money_24h":20500,"strategy_points_24h":100,"random_good_of_age_24h":250},"HighMiddleAge":{"population":2090,"happiness":5270,"demandHappiness":2090,"money_24h":28690,"strategy_points_24h":100,"random_good_of_age_24h":250},"LateMiddleAge":{"population":2740,"happiness":5880,"demandHappiness":2740,"money_24h":37920,"strategy_points_24h":100,"random_good_of_age_24h":250},"ColonialAge":{"population":3460,"happiness":6910,"demandHappiness":3460,"money_24h":57750,"strategy_points_24h":100,"random_good_of_age_24h":250},"IndustrialAge":{"population":4220,"happiness":7800,"demandHappiness":4220,"money_24h":71940,"strategy_points_24h":100,"random_good_of_age_24h":250},"ProgressiveEra":{"population":5040,"happiness":8560,"demandHappiness":5040,"money_24h":87310,"strategy_points_24h":100,"random_good_of_age_24h":250},"ModernEra":{"population":5910,"happiness":9160,"demandHappiness":5910,"money_24h":108630,"strategy_points_24h":100,"random_good_of_age_24h":250},"PostModernEra":{"population":6810,"happiness":9550,"demandHappiness":6810,"money_24h":136650,"strategy_points_24h":100,"random_good_of_age_24h":250},"ContemporaryEra":{"population":7760,"happiness":11090,"demandHappiness":7760,"money_24h":177900,"strategy_points_24h":100,"random_good_of_age_24h":250},"TomorrowEra":{"population":8750,"happiness":13460,"demandHappiness":8750,"money_24h":205980,"strategy_points_24h":100,"random_good_of_age_24h":250},"FutureEra":{"population":9780,"happiness":16130,"demandHappiness":9780,"money_24h":236110,"strategy_points_24h":100,"random_good_of_age_24h":250},"ArcticFuture":{"population":10850,"happiness":18780,"demandHappiness":10850,"money_24h":268280,"strategy_points_24h":100,"random_good_of_age_24h":250},"OceanicFuture":{"population":11950,"happiness":21680,"demandHappiness":11950,"money_24h":302510,"strategy_points_24h":100,"random_good_of_age_24h":250},"VirtualFuture":{"population":13090,"happiness":25900,"demandHappiness":13090,"money_24h":338840,"strategy_points_24h":100,"random_good_of_age_24h":250},"SpaceAgeMars":{"population":20720,"happiness":41440,"demandHappiness":20720,"money_24h":565980,"strategy_points_24h":100,"random_good_of_age_24h":250},"SpaceAgeAsteroidBelt":{"population":22500,"happiness":45030,"demandHappiness":22500,"money_24h":626900,"strategy_points_24h":100,"random_good_of_age_24h":250},"SpaceAgeVenus":{"population":24320,"happiness":48650,"demandHappiness":24320,"money_24h":691050,"strategy_points_24h":100,"random_good_of_age_24h":250},"SpaceAgeJupiterMoon":{"population":26190,"happiness":52410,"demandHappiness":26190,"money_24h":758480,"strategy_points_24h":100,"random_good_of_age_24h":250},"SpaceAgeTitan":{"population":28100,"happiness":56200,"demandHappiness":28100,"money_24h":829240,"strategy_points_24h":100,"random_good_of_age_24h":250},"SpaceAgeSpaceHub":{"population":30000,"happiness":60000,"demandHappiness":30000,"money_24h":900000,"strategy_points_24h":100,"random_good_of_age_24h":250}}, boosts: [{"type":"att_def_boost_defender","value":30,"feature":"guild_raids"},{"type":"att_def_boost_attacker_defender","value":72,"feature":"all"},{"type":"forge_points_production","value":3,"feature":"all"},{"type":"goods_production","value":1,"feature":"all"}] },
+    "W_MultiAge_SUM21A1": { prod: {"BronzeAge":{"population":207,"happiness":810,"demandHappiness":207,"money_24h":1400},"IronAge":{"population":444,"happiness":1400,"demandHappiness":444,"money_24h":3200},"EarlyMiddleAge":{"population":681,"happiness":1550,"demandHappiness":681,"money_24h":5400},"HighMiddleAge":{"population":956,"happiness":1720,"demandHappiness":956,"money_24h":7600},"LateMiddleAge":{"population":1255,"happiness":1920,"demandHappiness":1255,"money_24h":10000},"ColonialAge":{"population":1584,"happiness":2260,"demandHappiness":1584,"money_24h":15200},"IndustrialAge":{"population":1935,"happiness":2550,"demandHappiness":1935,"money_24h":19000},"ProgressiveEra":{"population":2310,"happiness":2800,"demandHappiness":2310,"money_24h":23000},"ModernEra":{"population":2708,"happiness":3000,"demandHappiness":2708,"money_24h":28600},"PostModernEra":{"population":3121,"happiness":3120,"demandHappiness":3121,"money_24h":36000},"ContemporaryEra":{"population":3557,"happiness":3630,"demandHappiness":3557,"money_24h":46900},"TomorrowEra":{"population":4009,"happiness":4400,"demandHappiness":4009,"money_24h":54300},"FutureEra":{"population":4483,"happiness":5270,"demandHappiness":4483,"money_24h":62200},"ArcticFuture":{"population":4973,"happiness":6140,"demandHappiness":4973,"money_24h":70700},"OceanicFuture":{"population":5477,"happiness":7090,"demandHappiness":5477,"money_24h":79700},"VirtualFuture":{"population":5998,"happiness":8470,"demandHappiness":5998,"money_24h":89300},"SpaceAgeMars":{"population":9494,"happiness":13550,"demandHappiness":9494,"money_24h":149100},"SpaceAgeAsteroidBelt":{"population":10312,"happiness":14720,"demandHappiness":10312,"money_24h":165200},"SpaceAgeVenus":{"population":11146,"happiness":15910,"demandHappiness":11146,"money_24h":182100},"SpaceAgeJupiterMoon":{"population":12003,"happiness":17140,"demandHappiness":12003,"money_24h":199800},"SpaceAgeTitan":{"population":12875,"happiness":18380,"demandHappiness":12875,"money_24h":218500},"SpaceAgeSpaceHub":{"population":13770,"happiness":19660,"demandHappiness":13770,"money_24h":238000}} },
+    "W_MultiAge_SUM21A2": { prod: {"BronzeAge":{"population":213,"happiness":880,"demandHappiness":213,"money_24h":1400},"IronAge":{"population":457,"happiness":1510,"demandHappiness":457,"money_24h":3400},"EarlyMiddleAge":{"population":701,"happiness":1670,"demandHappiness":701,"money_24h":5700},"HighMiddleAge":{"population":984,"happiness":1870,"demandHappiness":984,"money_24h":8000},"LateMiddleAge":{"population":1292,"happiness":2080,"demandHappiness":1292,"money_24h":10600},"ColonialAge":{"population":1630,"happiness":2450,"demandHappiness":1630,"money_24h":16100},"IndustrialAge":{"population":1992,"happiness":2760,"demandHappiness":1992,"money_24h":20000},"ProgressiveEra":{"population":2378,"happiness":3030,"demandHappiness":2378,"money_24h":24300},"ModernEra":{"population":2788,"happiness":3250,"demandHappiness":2788,"money_24h":30200},"PostModernEra":{"population":3213,"happiness":3380,"demandHappiness":3213,"money_24h":38000},"ContemporaryEra":{"population":3662,"happiness":3930,"demandHappiness":3662,"money_24h":49500},"TomorrowEra":{"population":4127,"happiness":4770,"demandHappiness":4127,"money_24h":57300},"FutureEra":{"population":4615,"happiness":5710,"demandHappiness":4615,"money_24h":65700},"ArcticFuture":{"population":5119,"happiness":6650,"demandHappiness":5119,"money_24h":74600},"OceanicFuture":{"population":5639,"happiness":7680,"demandHappiness":5639,"money_24h":84100},"VirtualFuture":{"population":6174,"happiness":9170,"demandHappiness":6174,"money_24h":94200},"SpaceAgeMars":{"population":9773,"happiness":14680,"demandHappiness":9773,"money_24h":157400},"SpaceAgeAsteroidBelt":{"population":10616,"happiness":15950,"demandHappiness":10616,"money_24h":174400},"SpaceAgeVenus":{"population":11474,"happiness":17230,"demandHappiness":11474,"money_24h":192200},"SpaceAgeJupiterMoon":{"population":12356,"happiness":18560,"demandHappiness":12356,"money_24h":210900},"SpaceAgeTitan":{"population":13254,"happiness":19910,"demandHappiness":13254,"money_24h":230600},"SpaceAgeSpaceHub":{"population":14175,"happiness":21300,"demandHappiness":14175,"money_24h":251200}} },
+    "W_MultiAge_SUM21A3": { prod: {"BronzeAge":{"population":219,"happiness":950,"demandHappiness":219,"money_24h":1500,"random_good_of_age_24h":0.25},"IronAge":{"population":470,"happiness":1630,"demandHappiness":470,"money_24h":3600,"random_good_of_age_24h":0.25},"EarlyMiddleAge":{"population":721,"happiness":1800,"demandHappiness":721,"money_24h":6000,"random_good_of_age_24h":0.25},"HighMiddleAge":{"population":1013,"happiness":2010,"demandHappiness":1013,"money_24h":8400,"random_good_of_age_24h":0.25},"LateMiddleAge":{"population":1328,"happiness":2240,"demandHappiness":1328,"money_24h":11100,"random_good_of_age_24h":0.25},"ColonialAge":{"population":1677,"happiness":2640,"demandHappiness":1677,"money_24h":16900,"random_good_of_age_24h":0.25},"IndustrialAge":{"population":2049,"happiness":2970,"demandHappiness":2049,"money_24h":21100,"random_good_of_age_24h":0.25},"ProgressiveEra":{"population":2446,"happiness":3270,"demandHappiness":2446,"money_24h":25600,"random_good_of_age_24h":0.25},"ModernEra":{"population":2867,"happiness":3490,"demandHappiness":2867,"money_24h":31800,"random_good_of_age_24h":0.25},"PostModernEra":{"population":3305,"happiness":3640,"demandHappiness":3305,"money_24h":40000,"random_good_of_age_24h":0.25},"ContemporaryEra":{"population":3767,"happiness":4230,"demandHappiness":3767,"money_24h":52100,"random_good_of_age_24h":0.25},"TomorrowEra":{"population":4244,"happiness":5140,"demandHappiness":4244,"money_24h":60300,"random_good_of_age_24h":0.25},"FutureEra":{"population":4747,"happiness":6150,"demandHappiness":4747,"money_24h":69100,"random_good_of_age_24h":0.25},"ArcticFuture":{"population":5265,"happiness":7170,"demandHappiness":5265,"money_24h":78500,"random_good_of_age_24h":0.25},"OceanicFuture":{"population":5800,"happiness":8270,"demandHappiness":5800,"money_24h":88600,"random_good_of_age_24h":0.25},"VirtualFuture":{"population":6350,"happiness":9880,"demandHappiness":6350,"money_24h":99200,"random_good_of_age_24h":0.25},"SpaceAgeMars":{"population":10052,"happiness":15810,"demandHappiness":10052,"money_24h":165700,"random_good_of_age_24h":0.25},"SpaceAgeAsteroidBelt":{"population":10919,"happiness":17180,"demandHappiness":10919,"money_24h":183500,"random_good_of_age_24h":0.25},"SpaceAgeVenus":{"population":11802,"happiness":18560,"demandHappiness":11802,"money_24h":202300,"random_good_of_age_24h":0.25},"SpaceAgeJupiterMoon":{"population":12709,"happiness":19990,"demandHappiness":12709,"money_24h":222100,"random_good_of_age_24h":0.25},"SpaceAgeTitan":{"population":13632,"happiness":21440,"demandHappiness":13632,"money_24h":242800,"random_good_of_age_24h":0.25},"SpaceAgeSpaceHub":{"population":14580,"happiness":22940,"demandHappiness":14580,"money_24h":264400,"random_good_of_age_24h":0.25}} },
+    "W_MultiAge_SUM21A4": { prod: {"BronzeAge":{"population":227,"happiness":1010,"demandHappiness":227,"money_24h":1600,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"IronAge":{"population":487,"happiness":1750,"demandHappiness":487,"money_24h":3800,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"EarlyMiddleAge":{"population":748,"happiness":1930,"demandHappiness":748,"money_24h":6300,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"HighMiddleAge":{"population":1050,"happiness":2160,"demandHappiness":1050,"money_24h":8800,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"LateMiddleAge":{"population":1378,"happiness":2400,"demandHappiness":1378,"money_24h":11700,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"ColonialAge":{"population":1739,"happiness":2830,"demandHappiness":1739,"money_24h":17800,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"IndustrialAge":{"population":2125,"happiness":3190,"demandHappiness":2125,"money_24h":22100,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"ProgressiveEra":{"population":2537,"happiness":3500,"demandHappiness":2537,"money_24h":26800,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"ModernEra":{"population":2974,"happiness":3740,"demandHappiness":2974,"money_24h":33400,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"PostModernEra":{"population":3427,"happiness":3900,"demandHappiness":3427,"money_24h":42000,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"ContemporaryEra":{"population":3906,"happiness":4530,"demandHappiness":3906,"money_24h":54700,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"TomorrowEra":{"population":4402,"happiness":5500,"demandHappiness":4402,"money_24h":63300,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"FutureEra":{"population":4922,"happiness":6590,"demandHappiness":4922,"money_24h":72600,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"ArcticFuture":{"population":5460,"happiness":7680,"demandHappiness":5460,"money_24h":82500,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"OceanicFuture":{"population":6014,"happiness":8860,"demandHappiness":6014,"money_24h":93000,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"VirtualFuture":{"population":6586,"happiness":10580,"demandHappiness":6586,"money_24h":104200,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"SpaceAgeMars":{"population":10424,"happiness":16940,"demandHappiness":10424,"money_24h":174000,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"SpaceAgeAsteroidBelt":{"population":11323,"happiness":18410,"demandHappiness":11323,"money_24h":192700,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"SpaceAgeVenus":{"population":12239,"happiness":19880,"demandHappiness":12239,"money_24h":212400,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"SpaceAgeJupiterMoon":{"population":13180,"happiness":21420,"demandHappiness":13180,"money_24h":233200,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"SpaceAgeTitan":{"population":14137,"happiness":22970,"demandHappiness":14137,"money_24h":254900,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75},"SpaceAgeSpaceHub":{"population":15120,"happiness":24570,"demandHappiness":15120,"money_24h":277700,"strategy_points_24h":0.15,"random_good_of_age_24h":0.75}} },
+    "W_MultiAge_SUM21A5": { prod: {"BronzeAge":{"population":235,"happiness":1080,"demandHappiness":235,"money_24h":1700,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"IronAge":{"population":505,"happiness":1860,"demandHappiness":505,"money_24h":4000,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"EarlyMiddleAge":{"population":774,"happiness":2060,"demandHappiness":774,"money_24h":6600,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"HighMiddleAge":{"population":1088,"happiness":2300,"demandHappiness":1088,"money_24h":9200,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"LateMiddleAge":{"population":1427,"happiness":2560,"demandHappiness":1427,"money_24h":12200,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"ColonialAge":{"population":1801,"happiness":3010,"demandHappiness":1801,"money_24h":18600,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"IndustrialAge":{"population":2201,"happiness":3400,"demandHappiness":2201,"money_24h":23200,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"ProgressiveEra":{"population":2627,"happiness":3730,"demandHappiness":2627,"money_24h":28100,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"ModernEra":{"population":3080,"happiness":3990,"demandHappiness":3080,"money_24h":35000,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"PostModernEra":{"population":3550,"happiness":4160,"demandHappiness":3550,"money_24h":44000,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"ContemporaryEra":{"population":4046,"happiness":4840,"demandHappiness":4046,"money_24h":57300,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"TomorrowEra":{"population":4559,"happiness":5870,"demandHappiness":4559,"money_24h":66300,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"FutureEra":{"population":5098,"happiness":7030,"demandHappiness":5098,"money_24h":76000,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"ArcticFuture":{"population":5655,"happiness":8190,"demandHappiness":5655,"money_24h":86400,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"OceanicFuture":{"population":6229,"happiness":9450,"demandHappiness":6229,"money_24h":97400,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"VirtualFuture":{"population":6821,"happiness":11290,"demandHappiness":6821,"money_24h":109100,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"SpaceAgeMars":{"population":10797,"happiness":18070,"demandHappiness":10797,"money_24h":182300,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"SpaceAgeAsteroidBelt":{"population":11728,"happiness":19630,"demandHappiness":11728,"money_24h":201900,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"SpaceAgeVenus":{"population":12676,"happiness":21210,"demandHappiness":12676,"money_24h":222500,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"SpaceAgeJupiterMoon":{"population":13650,"happiness":22850,"demandHappiness":13650,"money_24h":244300,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"SpaceAgeTitan":{"population":14642,"happiness":24500,"demandHappiness":14642,"money_24h":267000,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5},"SpaceAgeSpaceHub":{"population":15660,"happiness":26210,"demandHappiness":15660,"money_24h":290900,"strategy_points_24h":0.6,"random_good_of_age_24h":2.5}} },
+    "W_MultiAge_SUM21A6": { prod: {"BronzeAge":{"population":243,"happiness":1150,"demandHappiness":243,"money_24h":1700,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"IronAge":{"population":522,"happiness":1980,"demandHappiness":522,"money_24h":4100,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"EarlyMiddleAge":{"population":801,"happiness":2190,"demandHappiness":801,"money_24h":6900,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"HighMiddleAge":{"population":1125,"happiness":2440,"demandHappiness":1125,"money_24h":9700,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"LateMiddleAge":{"population":1476,"happiness":2720,"demandHappiness":1476,"money_24h":12800,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"ColonialAge":{"population":1863,"happiness":3200,"demandHappiness":1863,"money_24h":19400,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"IndustrialAge":{"population":2277,"happiness":3610,"demandHappiness":2277,"money_24h":24200,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"ProgressiveEra":{"population":2718,"happiness":3970,"demandHappiness":2718,"money_24h":29400,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"ModernEra":{"population":3186,"happiness":4240,"demandHappiness":3186,"money_24h":36600,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"PostModernEra":{"population":3672,"happiness":4420,"demandHappiness":3672,"money_24h":46000,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"ContemporaryEra":{"population":4185,"happiness":5140,"demandHappiness":4185,"money_24h":59900,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"TomorrowEra":{"population":4716,"happiness":6240,"demandHappiness":4716,"money_24h":69400,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"FutureEra":{"population":5274,"happiness":7470,"demandHappiness":5274,"money_24h":79500,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"ArcticFuture":{"population":5850,"happiness":8700,"demandHappiness":5850,"money_24h":90300,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"OceanicFuture":{"population":6444,"happiness":10040,"demandHappiness":6444,"money_24h":101800,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"VirtualFuture":{"population":7056,"happiness":12000,"demandHappiness":7056,"money_24h":114100,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"SpaceAgeMars":{"population":11169,"happiness":19190,"demandHappiness":11169,"money_24h":190500,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"SpaceAgeAsteroidBelt":{"population":12132,"happiness":20860,"demandHappiness":12132,"money_24h":211100,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"SpaceAgeVenus":{"population":13113,"happiness":22540,"demandHappiness":13113,"money_24h":232700,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"SpaceAgeJupiterMoon":{"population":14121,"happiness":24280,"demandHappiness":14121,"money_24h":255400,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"SpaceAgeTitan":{"population":15147,"happiness":26040,"demandHappiness":15147,"money_24h":279200,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2},"SpaceAgeSpaceHub":{"population":16200,"happiness":27850,"demandHappiness":16200,"money_24h":304100,"strategy_points_24h":2.04,"random_good_of_age_24h":7.2}} },
+    "W_MultiAge_SUM21A7": { prod: {"BronzeAge":{"population":253,"happiness":1220,"demandHappiness":253,"money_24h":1800,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"IronAge":{"population":544,"happiness":2100,"demandHappiness":544,"money_24h":4300,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"EarlyMiddleAge":{"population":834,"happiness":2320,"demandHappiness":834,"money_24h":7200,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"HighMiddleAge":{"population":1172,"happiness":2590,"demandHappiness":1172,"money_24h":10100,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"LateMiddleAge":{"population":1538,"happiness":2880,"demandHappiness":1538,"money_24h":13300,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"ColonialAge":{"population":1941,"happiness":3390,"demandHappiness":1941,"money_24h":20300,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"IndustrialAge":{"population":2372,"happiness":3820,"demandHappiness":2372,"money_24h":25300,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"ProgressiveEra":{"population":2831,"happiness":4200,"demandHappiness":2831,"money_24h":30700,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"ModernEra":{"population":3319,"happiness":4490,"demandHappiness":3319,"money_24h":38200,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"PostModernEra":{"population":3825,"happiness":4680,"demandHappiness":3825,"money_24h":48000,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"ContemporaryEra":{"population":4359,"happiness":5440,"demandHappiness":4359,"money_24h":62500,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"TomorrowEra":{"population":4913,"happiness":6600,"demandHappiness":4913,"money_24h":72400,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"FutureEra":{"population":5494,"happiness":7910,"demandHappiness":5494,"money_24h":82900,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"ArcticFuture":{"population":6094,"happiness":9210,"demandHappiness":6094,"money_24h":94300,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"OceanicFuture":{"population":6713,"happiness":10630,"demandHappiness":6713,"money_24h":106300,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"VirtualFuture":{"population":7350,"happiness":12700,"demandHappiness":7350,"money_24h":119000,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"SpaceAgeMars":{"population":11634,"happiness":20320,"demandHappiness":11634,"money_24h":198800,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"SpaceAgeAsteroidBelt":{"population":12638,"happiness":22090,"demandHappiness":12638,"money_24h":220200,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"SpaceAgeVenus":{"population":13659,"happiness":23860,"demandHappiness":13659,"money_24h":242800,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"SpaceAgeJupiterMoon":{"population":14709,"happiness":25700,"demandHappiness":14709,"money_24h":266500,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"SpaceAgeTitan":{"population":15778,"happiness":27570,"demandHappiness":15778,"money_24h":291300,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75},"SpaceAgeSpaceHub":{"population":16875,"happiness":29490,"demandHappiness":16875,"money_24h":317300,"strategy_points_24h":5.0,"random_good_of_age_24h":13.75}}, boosts: [{"type":"att_boost_attacker","value":5,"feature":"all"}] },
+    "W_MultiAge_SUM21A8": { prod: {"BronzeAge":{"population":263,"happiness":1280,"demandHappiness":263,"money_24h":1900,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"IronAge":{"population":566,"happiness":2210,"demandHappiness":566,"money_24h":4500,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"EarlyMiddleAge":{"population":868,"happiness":2450,"demandHappiness":868,"money_24h":7500,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"HighMiddleAge":{"population":1219,"happiness":2730,"demandHappiness":1219,"money_24h":10500,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"LateMiddleAge":{"population":1599,"happiness":3040,"demandHappiness":1599,"money_24h":13900,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"ColonialAge":{"population":2018,"happiness":3580,"demandHappiness":2018,"money_24h":21100,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"IndustrialAge":{"population":2467,"happiness":4040,"demandHappiness":2467,"money_24h":26300,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"ProgressiveEra":{"population":2945,"happiness":4430,"demandHappiness":2945,"money_24h":32000,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"ModernEra":{"population":3452,"happiness":4740,"demandHappiness":3452,"money_24h":39800,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"PostModernEra":{"population":3978,"happiness":4940,"demandHappiness":3978,"money_24h":50000,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"ContemporaryEra":{"population":4534,"happiness":5740,"demandHappiness":4534,"money_24h":65100,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"TomorrowEra":{"population":5109,"happiness":6970,"demandHappiness":5109,"money_24h":75400,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"FutureEra":{"population":5714,"happiness":8350,"demandHappiness":5714,"money_24h":86400,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"ArcticFuture":{"population":6338,"happiness":9730,"demandHappiness":6338,"money_24h":98200,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"OceanicFuture":{"population":6981,"happiness":11220,"demandHappiness":6981,"money_24h":110700,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"VirtualFuture":{"population":7644,"happiness":13410,"demandHappiness":7644,"money_24h":124000,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"SpaceAgeMars":{"population":12100,"happiness":21450,"demandHappiness":12100,"money_24h":207100,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"SpaceAgeAsteroidBelt":{"population":13143,"happiness":23310,"demandHappiness":13143,"money_24h":229400,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"SpaceAgeVenus":{"population":14206,"happiness":25190,"demandHappiness":14206,"money_24h":252900,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"SpaceAgeJupiterMoon":{"population":15298,"happiness":27130,"demandHappiness":15298,"money_24h":277600,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"SpaceAgeTitan":{"population":16409,"happiness":29100,"demandHappiness":16409,"money_24h":303500,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6},"SpaceAgeSpaceHub":{"population":17550,"happiness":31130,"demandHappiness":17550,"money_24h":330500,"strategy_points_24h":10.5,"random_good_of_age_24h":19.6}}, boosts: [{"type":"att_boost_attacker","value":11,"feature":"all"}] },
+    "W_MultiAge_SUM21A9": { prod: {"BronzeAge":{"population":273,"happiness":1350,"demandHappiness":273,"money_24h":2000,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"IronAge":{"population":587,"happiness":2330,"demandHappiness":587,"money_24h":4700,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"EarlyMiddleAge":{"population":901,"happiness":2580,"demandHappiness":901,"money_24h":7800,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"HighMiddleAge":{"population":1266,"happiness":2870,"demandHappiness":1266,"money_24h":10900,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"LateMiddleAge":{"population":1661,"happiness":3200,"demandHappiness":1661,"money_24h":14400,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"ColonialAge":{"population":2096,"happiness":3770,"demandHappiness":2096,"money_24h":22000,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"IndustrialAge":{"population":2562,"happiness":4250,"demandHappiness":2562,"money_24h":27400,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"ProgressiveEra":{"population":3058,"happiness":4670,"demandHappiness":3058,"money_24h":33200,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"ModernEra":{"population":3584,"happiness":4990,"demandHappiness":3584,"money_24h":41300,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"PostModernEra":{"population":4131,"happiness":5200,"demandHappiness":4131,"money_24h":52000,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"ContemporaryEra":{"population":4708,"happiness":6040,"demandHappiness":4708,"money_24h":67700,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"TomorrowEra":{"population":5306,"happiness":7340,"demandHappiness":5306,"money_24h":78400,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"FutureEra":{"population":5933,"happiness":8790,"demandHappiness":5933,"money_24h":89900,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"ArcticFuture":{"population":6581,"happiness":10240,"demandHappiness":6581,"money_24h":102100,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"OceanicFuture":{"population":7250,"happiness":11810,"demandHappiness":7250,"money_24h":115100,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"VirtualFuture":{"population":7938,"happiness":14110,"demandHappiness":7938,"money_24h":129000,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"SpaceAgeMars":{"population":12565,"happiness":22580,"demandHappiness":12565,"money_24h":215400,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"SpaceAgeAsteroidBelt":{"population":13649,"happiness":24540,"demandHappiness":13649,"money_24h":238600,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"SpaceAgeVenus":{"population":14752,"happiness":26510,"demandHappiness":14752,"money_24h":263000,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"SpaceAgeJupiterMoon":{"population":15886,"happiness":28560,"demandHappiness":15886,"money_24h":288700,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"SpaceAgeTitan":{"population":17040,"happiness":30630,"demandHappiness":17040,"money_24h":315600,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2},"SpaceAgeSpaceHub":{"population":18225,"happiness":32760,"demandHappiness":18225,"money_24h":343800,"strategy_points_24h":16.0,"random_good_of_age_24h":27.2}}, boosts: [{"type":"att_boost_attacker","value":17,"feature":"all"}] },
+    "W_MultiAge_SUM25B1": { prod: {"BronzeAge":{"population":-90,"money_24h":340,"strategy_points_24h":12,"random_good_of_age_24h":18},"IronAge":{"population":-190,"money_24h":820,"strategy_points_24h":12,"random_good_of_age_24h":18},"EarlyMiddleAge":{"population":-300,"money_24h":1370,"strategy_points_24h":12,"random_good_of_age_24h":18},"HighMiddleAge":{"population":-420,"money_24h":1910,"strategy_points_24h":12,"random_good_of_age_24h":18},"LateMiddleAge":{"population":-550,"money_24h":2530,"strategy_points_24h":12,"random_good_of_age_24h":18},"ColonialAge":{"population":-690,"money_24h":3850,"strategy_points_24h":12,"random_good_of_age_24h":18},"IndustrialAge":{"population":-840,"money_24h":4800,"strategy_points_24h":12,"random_good_of_age_24h":18},"ProgressiveEra":{"population":-1010,"money_24h":5820,"strategy_points_24h":12,"random_good_of_age_24h":18},"ModernEra":{"population":-1180,"money_24h":7240,"strategy_points_24h":12,"random_good_of_age_24h":18},"PostModernEra":{"population":-1360,"money_24h":9110,"strategy_points_24h":12,"random_good_of_age_24h":18},"ContemporaryEra":{"population":-1550,"money_24h":11860,"strategy_points_24h":12,"random_good_of_age_24h":18},"TomorrowEra":{"population":-1750,"money_24h":13730,"strategy_points_24h":12,"random_good_of_age_24h":18},"FutureEra":{"population":-1960,"money_24h":15740,"strategy_points_24h":12,"random_good_of_age_24h":18},"ArcticFuture":{"population":-2170,"money_24h":17890,"strategy_points_24h":12,"random_good_of_age_24h":18},"OceanicFuture":{"population":-2390,"money_24h":20170,"strategy_points_24h":12,"random_good_of_age_24h":18},"VirtualFuture":{"population":-2620,"money_24h":22590,"strategy_points_24h":12,"random_good_of_age_24h":18},"SpaceAgeMars":{"population":-4140,"money_24h":37730,"strategy_points_24h":12,"random_good_of_age_24h":18},"SpaceAgeAsteroidBelt":{"population":-4500,"money_24h":41790,"strategy_points_24h":12,"random_good_of_age_24h":18},"SpaceAgeVenus":{"population":-4860,"money_24h":46070,"strategy_points_24h":12,"random_good_of_age_24h":18},"SpaceAgeJupiterMoon":{"population":-5240,"money_24h":50570,"strategy_points_24h":12,"random_good_of_age_24h":18},"SpaceAgeTitan":{"population":-5620,"money_24h":55280,"strategy_points_24h":12,"random_good_of_age_24h":18},"SpaceAgeSpaceHub":{"population":-6000,"money_24h":60000,"strategy_points_24h":12,"random_good_of_age_24h":18}}, boosts: [{"type":"att_def_boost_attacker","value":1,"feature":"all"},{"type":"att_def_boost_attacker","value":4,"feature":"guild_expedition"}] },
+    "W_MultiAge_SUM21C1": { prod: {"BronzeAge":{"happiness":330},"IronAge":{"happiness":470},"EarlyMiddleAge":{"happiness":560},"HighMiddleAge":{"happiness":690},"LateMiddleAge":{"happiness":800},"ColonialAge":{"happiness":940},"IndustrialAge":{"happiness":1060},"ProgressiveEra":{"happiness":1170},"ModernEra":{"happiness":1330},"PostModernEra":{"happiness":1520},"ContemporaryEra":{"happiness":1760},"TomorrowEra":{"happiness":2200},"FutureEra":{"happiness":2640},"ArcticFuture":{"happiness":2990},"OceanicFuture":{"happiness":3350},"VirtualFuture":{"happiness":4230},"SpaceAgeMars":{"happiness":6590},"SpaceAgeAsteroidBelt":{"happiness":7160},"SpaceAgeVenus":{"happiness":7730},"SpaceAgeJupiterMoon":{"happiness":8330},"SpaceAgeTitan":{"happiness":8930},"SpaceAgeSpaceHub":{"happiness":9560}} },
+    "W_MultiAge_SUM23A1": { prod: {"BronzeAge":{"population":140,"happiness":660,"demandHappiness":140,"money_24h":400},"IronAge":{"population":302,"happiness":1202,"demandHappiness":302,"money_24h":1100},"EarlyMiddleAge":{"population":463,"happiness":1463,"demandHappiness":463,"money_24h":1800},"HighMiddleAge":{"population":650,"happiness":1760,"demandHappiness":650,"money_24h":2500},"LateMiddleAge":{"population":853,"happiness":2093,"demandHappiness":853,"money_24h":3300},"ColonialAge":{"population":1076,"happiness":2536,"demandHappiness":1076,"money_24h":5000},"IndustrialAge":{"population":1316,"happiness":2956,"demandHappiness":1316,"money_24h":6200},"ProgressiveEra":{"population":1570,"happiness":3370,"demandHappiness":1570,"money_24h":7600},"ModernEra":{"population":1841,"happiness":3771,"demandHappiness":1841,"money_24h":9400},"PostModernEra":{"population":2122,"happiness":4132,"demandHappiness":2122,"money_24h":11800},"ContemporaryEra":{"population":2418,"happiness":4758,"demandHappiness":2418,"money_24h":15400},"TomorrowEra":{"population":2725,"happiness":5565,"demandHappiness":2725,"money_24h":17900},"FutureEra":{"population":3047,"happiness":6447,"demandHappiness":3047,"money_24h":20500},"ArcticFuture":{"population":3380,"happiness":7340,"demandHappiness":3380,"money_24h":23300},"OceanicFuture":{"population":3723,"happiness":8293,"demandHappiness":3723,"money_24h":26200},"VirtualFuture":{"population":4077,"happiness":9537,"demandHappiness":4077,"money_24h":29400},"SpaceAgeMars":{"population":6453,"happiness":15183,"demandHappiness":6453,"money_24h":49000},"SpaceAgeAsteroidBelt":{"population":7010,"happiness":16500,"demandHappiness":7010,"money_24h":54300},"SpaceAgeVenus":{"population":7576,"happiness":17826,"demandHappiness":7576,"money_24h":59900},"SpaceAgeJupiterMoon":{"population":8159,"happiness":19199,"demandHappiness":8159,"money_24h":65700},"SpaceAgeTitan":{"population":8787,"happiness":20678,"demandHappiness":8787,"money_24h":72062},"SpaceAgeSpaceHub":{"population":9415,"happiness":22157,"demandHappiness":9415,"money_24h":78424}} },
+    "W_MultiAge_SUM23A2": { prod: {"BronzeAge":{"population":143,"happiness":683,"demandHappiness":143,"money_24h":500,"strategy_points_24h":1,"random_good_of_age_24h":1},"IronAge":{"population":306,"happiness":1236,"demandHappiness":306,"money_24h":1100,"strategy_points_24h":1,"random_good_of_age_24h":1},"EarlyMiddleAge":{"population":470,"happiness":1500,"demandHappiness":470,"money_24h":1800,"strategy_points_24h":1,"random_good_of_age_24h":1},"HighMiddleAge":{"population":660,"happiness":1810,"demandHappiness":660,"money_24h":2500,"strategy_points_24h":1,"random_good_of_age_24h":1},"LateMiddleAge":{"population":866,"happiness":2146,"demandHappiness":866,"money_24h":3300,"strategy_points_24h":1,"random_good_of_age_24h":1},"ColonialAge":{"population":1093,"happiness":2603,"demandHappiness":1093,"money_24h":5100,"strategy_points_24h":1,"random_good_of_age_24h":1},"IndustrialAge":{"population":1336,"happiness":3036,"demandHappiness":1336,"money_24h":6400,"strategy_points_24h":1,"random_good_of_age_24h":1},"ProgressiveEra":{"population":1595,"happiness":3465,"demandHappiness":1595,"money_24h":7700,"strategy_points_24h":1,"random_good_of_age_24h":1},"ModernEra":{"population":1869,"happiness":3869,"demandHappiness":1869,"money_24h":9600,"strategy_points_24h":1,"random_good_of_age_24h":1},"PostModernEra":{"population":2154,"happiness":4234,"demandHappiness":2154,"money_24h":12100,"strategy_points_24h":1,"random_good_of_age_24h":1},"ContemporaryEra":{"population":2455,"happiness":4875,"demandHappiness":2455,"money_24h":15700,"strategy_points_24h":1,"random_good_of_age_24h":2},"TomorrowEra":{"population":2767,"happiness":5707,"demandHappiness":2767,"money_24h":18200,"strategy_points_24h":1,"random_good_of_age_24h":2},"FutureEra":{"population":3094,"happiness":6614,"demandHappiness":3094,"money_24h":20800,"strategy_points_24h":1,"random_good_of_age_24h":2},"ArcticFuture":{"population":3432,"happiness":7522,"demandHappiness":3432,"money_24h":23700,"strategy_points_24h":1,"random_good_of_age_24h":2},"OceanicFuture":{"population":3780,"happiness":8510,"demandHappiness":3780,"money_24h":26700,"strategy_points_24h":1,"random_good_of_age_24h":2},"VirtualFuture":{"population":4140,"happiness":9790,"demandHappiness":4140,"money_24h":29900,"strategy_points_24h":1,"random_good_of_age_24h":2},"SpaceAgeMars":{"population":6552,"happiness":15582,"demandHappiness":6552,"money_24h":49900,"strategy_points_24h":1,"random_good_of_age_24h":2},"SpaceAgeAsteroidBelt":{"population":7117,"happiness":16937,"demandHappiness":7117,"money_24h":55300,"strategy_points_24h":1,"random_good_of_age_24h":2},"SpaceAgeVenus":{"population":7693,"happiness":18303,"demandHappiness":7693,"money_24h":61000,"strategy_points_24h":1,"random_good_of_age_24h":2},"SpaceAgeJupiterMoon":{"population":8284,"happiness":19704,"demandHappiness":8284,"money_24h":66900,"strategy_points_24h":1,"random_good_of_age_24h":2},"SpaceAgeTitan":{"population":8921,"happiness":21213,"demandHappiness":8921,"money_24h":73371,"strategy_points_24h":1,"random_good_of_age_24h":3},"SpaceAgeSpaceHub":{"population":9558,"happiness":22722,"demandHappiness":9558,"money_24h":79842,"strategy_points_24h":1,"random_good_of_age_24h":3}} },
+    "W_MultiAge_SUM23A3": { prod: {"BronzeAge":{"population":145,"happiness":705,"demandHappiness":145,"money_24h":500,"strategy_points_24h":1,"random_good_of_age_24h":3},"IronAge":{"population":311,"happiness":1271,"demandHappiness":311,"money_24h":1100,"strategy_points_24h":1,"random_good_of_age_24h":3},"EarlyMiddleAge":{"population":477,"happiness":1537,"demandHappiness":477,"money_24h":1900,"strategy_points_24h":1,"random_good_of_age_24h":3},"HighMiddleAge":{"population":670,"happiness":1860,"demandHappiness":670,"money_24h":2600,"strategy_points_24h":1,"random_good_of_age_24h":3},"LateMiddleAge":{"population":879,"happiness":2199,"demandHappiness":879,"money_24h":3400,"strategy_points_24h":1,"random_good_of_age_24h":3},"ColonialAge":{"population":1110,"happiness":2670,"demandHappiness":1110,"money_24h":5200,"strategy_points_24h":1,"random_good_of_age_24h":3},"IndustrialAge":{"population":1356,"happiness":3116,"demandHappiness":1356,"money_24h":6500,"strategy_points_24h":1,"random_good_of_age_24h":3},"ProgressiveEra":{"population":1619,"happiness":3549,"demandHappiness":1619,"money_24h":7900,"strategy_points_24h":1,"random_good_of_age_24h":3},"ModernEra":{"population":1897,"happiness":3957,"demandHappiness":1897,"money_24h":9800,"strategy_points_24h":1,"random_good_of_age_24h":3},"PostModernEra":{"population":2187,"happiness":4337,"demandHappiness":2187,"money_24h":12400,"strategy_points_24h":1,"random_good_of_age_24h":3},"ContemporaryEra":{"population":2492,"happiness":4992,"demandHappiness":2492,"money_24h":16100,"strategy_points_24h":2,"random_good_of_age_24h":4},"TomorrowEra":{"population":2809,"happiness":5839,"demandHappiness":2809,"money_24h":18700,"strategy_points_24h":2,"random_good_of_age_24h":4},"FutureEra":{"population":3141,"happiness":6771,"demandHappiness":3141,"money_24h":21400,"strategy_points_24h":2,"random_good_of_age_24h":4},"ArcticFuture":{"population":3484,"happiness":7714,"demandHappiness":3484,"money_24h":24300,"strategy_points_24h":2,"random_good_of_age_24h":4},"OceanicFuture":{"population":3838,"happiness":8718,"demandHappiness":3838,"money_24h":27400,"strategy_points_24h":2,"random_good_of_age_24h":4},"VirtualFuture":{"population":4202,"happiness":10032,"demandHappiness":4202,"money_24h":30700,"strategy_points_24h":2,"random_good_of_age_24h":4},"SpaceAgeMars":{"population":6652,"happiness":15982,"demandHappiness":6652,"money_24h":51300,"strategy_points_24h":2,"random_good_of_age_24h":4},"SpaceAgeAsteroidBelt":{"population":7225,"happiness":17365,"demandHappiness":7225,"money_24h":56800,"strategy_points_24h":2,"random_good_of_age_24h":4},"SpaceAgeVenus":{"population":7810,"happiness":18770,"demandHappiness":7810,"money_24h":62600,"strategy_points_24h":2,"random_good_of_age_24h":4},"SpaceAgeJupiterMoon":{"population":8410,"happiness":20210,"demandHappiness":8410,"money_24h":68700,"strategy_points_24h":2,"random_good_of_age_24h":4},"SpaceAgeTitan":{"population":9057,"happiness":21761,"demandHappiness":9057,"money_24h":75395,"strategy_points_24h":3,"random_good_of_age_24h":5},"SpaceAgeSpaceHub":{"population":9704,"happiness":23312,"demandHappiness":9704,"money_24h":82090,"strategy_points_24h":3,"random_good_of_age_24h":5}} },
+    "W_MultiAge_SUM23A4": { prod: {"BronzeAge":{"population":147,"happiness":727,"demandHappiness":147,"money_24h":500,"strategy_points_24h":2,"random_good_of_age_24h":5},"IronAge":{"population":316,"happiness":1306,"demandHappiness":316,"money_24h":1200,"strategy_points_24h":2,"random_good_of_age_24h":5},"EarlyMiddleAge":{"population":484,"happiness":1584,"demandHappiness":484,"money_24h":1900,"strategy_points_24h":2,"random_good_of_age_24h":5},"HighMiddleAge":{"population":680,"happiness":1910,"demandHappiness":680,"money_24h":2700,"strategy_points_24h":2,"random_good_of_age_24h":5},"LateMiddleAge":{"population":892,"happiness":2262,"demandHappiness":892,"money_24h":3600,"strategy_points_24h":2,"random_good_of_age_24h":5},"ColonialAge":{"population":1126,"happiness":2736,"demandHappiness":1126,"money_24h":5400,"strategy_points_24h":2,"random_good_of_age_24h":5},"IndustrialAge":{"population":1376,"happiness":3186,"demandHappiness":1376,"money_24h":6700,"strategy_points_24h":2,"random_good_of_age_24h":5},"ProgressiveEra":{"population":1643,"happiness":3633,"demandHappiness":1643,"money_24h":8200,"strategy_points_24h":2,"random_good_of_age_24h":5},"ModernEra":{"population":1926,"happiness":4056,"demandHappiness":1926,"money_24h":10200,"strategy_points_24h":2,"random_good_of_age_24h":5},"PostModernEra":{"population":2220,"happiness":4440,"demandHappiness":2220,"money_24h":12800,"strategy_points_24h":2,"random_good_of_age_24h":5},"ContemporaryEra":{"population":2530,"happiness":5110,"demandHappiness":2530,"money_24h":16700,"strategy_points_24h":3,"random_good_of_age_24h":6},"TomorrowEra":{"population":2851,"happiness":5981,"demandHappiness":2851,"money_24h":19300,"strategy_points_24h":3,"random_good_of_age_24h":6},"FutureEra":{"population":3188,"happiness":6938,"demandHappiness":3188,"money_24h":22100,"strategy_points_24h":3,"random_good_of_age_24h":6},"ArcticFuture":{"population":3536,"happiness":7906,"demandHappiness":3536,"money_24h":25100,"strategy_points_24h":3,"random_good_of_age_24h":6},"OceanicFuture":{"population":3895,"happiness":8935,"demandHappiness":3895,"money_24h":28300,"strategy_points_24h":3,"random_good_of_age_24h":6},"VirtualFuture":{"population":4265,"happiness":10285,"demandHappiness":4265,"money_24h":31700,"strategy_points_24h":3,"random_good_of_age_24h":6},"SpaceAgeMars":{"population":6751,"happiness":16381,"demandHappiness":6751,"money_24h":53000,"strategy_points_24h":3,"random_good_of_age_24h":6},"SpaceAgeAsteroidBelt":{"population":7333,"happiness":17803,"demandHappiness":7333,"money_24h":58700,"strategy_points_24h":3,"random_good_of_age_24h":6},"SpaceAgeVenus":{"population":7926,"happiness":19236,"demandHappiness":7926,"money_24h":64700,"strategy_points_24h":3,"random_good_of_age_24h":6},"SpaceAgeJupiterMoon":{"population":8535,"happiness":20725,"demandHappiness":8535,"money_24h":71100,"strategy_points_24h":3,"random_good_of_age_24h":6},"SpaceAgeTitan":{"population":9191,"happiness":22330,"demandHappiness":9191,"money_24h":78134,"strategy_points_24h":4,"random_good_of_age_24h":7},"SpaceAgeSpaceHub":{"population":9847,"happiness":23935,"demandHappiness":9847,"money_24h":85168,"strategy_points_24h":4,"random_good_of_age_24h":7}} },
+    "W_MultiAge_SUM23A5": { prod: {"BronzeAge":{"population":149,"happiness":739,"demandHappiness":149,"money_24h":500,"strategy_points_24h":3,"random_good_of_age_24h":7},"IronAge":{"population":320,"happiness":1340,"demandHappiness":320,"money_24h":1200,"strategy_points_24h":3,"random_good_of_age_24h":7},"EarlyMiddleAge":{"population":491,"happiness":1621,"demandHappiness":491,"money_24h":2000,"strategy_points_24h":3,"random_good_of_age_24h":7},"HighMiddleAge":{"population":690,"happiness":1950,"demandHappiness":690,"money_24h":2800,"strategy_points_24h":3,"random_good_of_age_24h":7},"LateMiddleAge":{"population":905,"happiness":2315,"demandHappiness":905,"money_24h":3700,"strategy_points_24h":3,"random_good_of_age_24h":7},"ColonialAge":{"population":1143,"happiness":2803,"demandHappiness":1143,"money_24h":5700,"strategy_points_24h":3,"random_good_of_age_24h":7},"IndustrialAge":{"population":1397,"happiness":3267,"demandHappiness":1397,"money_24h":7100,"strategy_points_24h":3,"random_good_of_age_24h":7},"ProgressiveEra":{"population":1667,"happiness":3717,"demandHappiness":1667,"money_24h":8600,"strategy_points_24h":3,"random_good_of_age_24h":7},"ModernEra":{"population":1954,"happiness":4154,"demandHappiness":1954,"money_24h":10700,"strategy_points_24h":3,"random_good_of_age_24h":7},"PostModernEra":{"population":2252,"happiness":4542,"demandHappiness":2252,"money_24h":13400,"strategy_points_24h":3,"random_good_of_age_24h":7},"ContemporaryEra":{"population":2567,"happiness":5227,"demandHappiness":2567,"money_24h":17500,"strategy_points_24h":4,"random_good_of_age_24h":8},"TomorrowEra":{"population":2892,"happiness":6122,"demandHappiness":2892,"money_24h":20300,"strategy_points_24h":4,"random_good_of_age_24h":8},"FutureEra":{"population":3235,"happiness":7105,"demandHappiness":3235,"money_24h":23200,"strategy_points_24h":4,"random_good_of_age_24h":8},"ArcticFuture":{"population":3588,"happiness":8088,"demandHappiness":3588,"money_24h":26400,"strategy_points_24h":4,"random_good_of_age_24h":8},"OceanicFuture":{"population":3952,"happiness":9152,"demandHappiness":3952,"money_24h":29800,"strategy_points_24h":4,"random_good_of_age_24h":8},"VirtualFuture":{"population":4328,"happiness":10538,"demandHappiness":4328,"money_24h":33300,"strategy_points_24h":4,"random_good_of_age_24h":8},"SpaceAgeMars":{"population":6850,"happiness":16790,"demandHappiness":6850,"money_24h":55700,"strategy_points_24h":4,"random_good_of_age_24h":8},"SpaceAgeAsteroidBelt":{"population":7441,"happiness":18241,"demandHappiness":7441,"money_24h":61700,"strategy_points_24h":4,"random_good_of_age_24h":8},"SpaceAgeVenus":{"population":8043,"happiness":19713,"demandHappiness":8043,"money_24h":68000,"strategy_points_24h":4,"random_good_of_age_24h":8},"SpaceAgeJupiterMoon":{"population":8661,"happiness":21231,"demandHappiness":8661,"money_24h":74600,"strategy_points_24h":4,"random_good_of_age_24h":8},"SpaceAgeTitan":{"population":9327,"happiness":22866,"demandHappiness":9327,"money_24h":81841,"strategy_points_24h":5,"random_good_of_age_24h":9},"SpaceAgeSpaceHub":{"population":9993,"happiness":24501,"demandHappiness":9993,"money_24h":89082,"strategy_points_24h":5,"random_good_of_age_24h":9}} },
+    "W_MultiAge_SUM23A6": { prod: {"BronzeAge":{"population":151,"happiness":761,"demandHappiness":151,"money_24h":500,"strategy_points_24h":4,"random_good_of_age_24h":9},"IronAge":{"population":325,"happiness":1385,"demandHappiness":325,"money_24h":1300,"strategy_points_24h":4,"random_good_of_age_24h":9},"EarlyMiddleAge":{"population":498,"happiness":1668,"demandHappiness":498,"money_24h":2100,"strategy_points_24h":4,"random_good_of_age_24h":9},"HighMiddleAge":{"population":700,"happiness":2000,"demandHappiness":700,"money_24h":3000,"strategy_points_24h":4,"random_good_of_age_24h":9},"LateMiddleAge":{"population":918,"happiness":2368,"demandHappiness":918,"money_24h":4000,"strategy_points_24h":4,"random_good_of_age_24h":9},"ColonialAge":{"population":1159,"happiness":2869,"demandHappiness":1159,"money_24h":6000,"strategy_points_24h":4,"random_good_of_age_24h":9},"IndustrialAge":{"population":1417,"happiness":3347,"demandHappiness":1417,"money_24h":7500,"strategy_points_24h":4,"random_good_of_age_24h":9},"ProgressiveEra":{"population":1691,"happiness":3811,"demandHappiness":1691,"money_24h":9100,"strategy_points_24h":4,"random_good_of_age_24h":10},"ModernEra":{"population":1982,"happiness":4242,"demandHappiness":1982,"money_24h":11400,"strategy_points_24h":4,"random_good_of_age_24h":10},"PostModernEra":{"population":2285,"happiness":4645,"demandHappiness":2285,"money_24h":14300,"strategy_points_24h":4,"random_good_of_age_24h":10},"ContemporaryEra":{"population":2604,"happiness":5344,"demandHappiness":2604,"money_24h":18600,"strategy_points_24h":5,"random_good_of_age_24h":10},"TomorrowEra":{"population":2934,"happiness":6264,"demandHappiness":2934,"money_24h":21600,"strategy_points_24h":5,"random_good_of_age_24h":10},"FutureEra":{"population":3282,"happiness":7272,"demandHappiness":3282,"money_24h":24700,"strategy_points_24h":5,"random_good_of_age_24h":10},"ArcticFuture":{"population":3640,"happiness":8280,"demandHappiness":3640,"money_24h":28100,"strategy_points_24h":5,"random_good_of_age_24h":10},"OceanicFuture":{"population":4010,"happiness":9370,"demandHappiness":4010,"money_24h":31700,"strategy_points_24h":5,"random_good_of_age_24h":11},"VirtualFuture":{"population":4390,"happiness":10790,"demandHappiness":4390,"money_24h":35500,"strategy_points_24h":5,"random_good_of_age_24h":11},"SpaceAgeMars":{"population":6950,"happiness":17190,"demandHappiness":6950,"money_24h":59200,"strategy_points_24h":5,"random_good_of_age_24h":11},"SpaceAgeAsteroidBelt":{"population":7549,"happiness":18669,"demandHappiness":7549,"money_24h":65600,"strategy_points_24h":5,"random_good_of_age_24h":11},"SpaceAgeVenus":{"population":8159,"happiness":20179,"demandHappiness":8159,"money_24h":72300,"strategy_points_24h":5,"random_good_of_age_24h":11},"SpaceAgeJupiterMoon":{"population":8786,"happiness":21736,"demandHappiness":8786,"money_24h":79300,"strategy_points_24h":5,"random_good_of_age_24h":11},"SpaceAgeTitan":{"population":9462,"happiness":23414,"demandHappiness":9462,"money_24h":86978,"strategy_points_24h":6,"random_good_of_age_24h":12},"SpaceAgeSpaceHub":{"population":10138,"happiness":25092,"demandHappiness":10138,"money_24h":94656,"strategy_points_24h":6,"random_good_of_age_24h":12}}, boosts: [{"type":"def_boost_attacker","value":1,"feature":"all"}] },
+    "W_MultiAge_SUM23A7": { prod: {"BronzeAge":{"population":153,"happiness":783,"demandHappiness":153,"money_24h":600,"strategy_points_24h":5,"random_good_of_age_24h":12},"IronAge":{"population":329,"happiness":1419,"demandHappiness":329,"money_24h":1400,"strategy_points_24h":5,"random_good_of_age_24h":12},"EarlyMiddleAge":{"population":506,"happiness":1706,"demandHappiness":506,"money_24h":2300,"strategy_points_24h":5,"random_good_of_age_24h":12},"HighMiddleAge":{"population":710,"happiness":2050,"demandHappiness":710,"money_24h":3200,"strategy_points_24h":5,"random_good_of_age_24h":12},"LateMiddleAge":{"population":932,"happiness":2432,"demandHappiness":932,"money_24h":4300,"strategy_points_24h":5,"random_good_of_age_24h":12},"ColonialAge":{"population":1176,"happiness":2936,"demandHappiness":1176,"money_24h":6500,"strategy_points_24h":5,"random_good_of_age_24h":12},"IndustrialAge":{"population":1437,"happiness":3417,"demandHappiness":1437,"money_24h":8100,"strategy_points_24h":5,"random_good_of_age_24h":12},"ProgressiveEra":{"population":1715,"happiness":3895,"demandHappiness":1715,"money_24h":9800,"strategy_points_24h":5,"random_good_of_age_24h":13},"ModernEra":{"population":2011,"happiness":4341,"demandHappiness":2011,"money_24h":12200,"strategy_points_24h":5,"random_good_of_age_24h":13},"PostModernEra":{"population":2317,"happiness":4747,"demandHappiness":2317,"money_24h":15400,"strategy_points_24h":5,"random_good_of_age_24h":13},"ContemporaryEra":{"population":2641,"happiness":5461,"demandHappiness":2641,"money_24h":20000,"strategy_points_24h":6,"random_good_of_age_24h":13},"TomorrowEra":{"population":2976,"happiness":6396,"demandHappiness":2976,"money_24h":23200,"strategy_points_24h":6,"random_good_of_age_24h":13},"FutureEra":{"population":3328,"happiness":7428,"demandHappiness":3328,"money_24h":26500,"strategy_points_24h":6,"random_good_of_age_24h":13},"ArcticFuture":{"population":3692,"happiness":8472,"demandHappiness":3692,"money_24h":30200,"strategy_points_24h":6,"random_good_of_age_24h":13},"OceanicFuture":{"population":4067,"happiness":9577,"demandHappiness":4067,"money_24h":34000,"strategy_points_24h":6,"random_good_of_age_24h":14},"VirtualFuture":{"population":4453,"happiness":11043,"demandHappiness":4453,"money_24h":38100,"strategy_points_24h":6,"random_good_of_age_24h":14},"SpaceAgeMars":{"population":7049,"happiness":17589,"demandHappiness":7049,"money_24h":63600,"strategy_points_24h":6,"random_good_of_age_24h":14},"SpaceAgeAsteroidBelt":{"population":7657,"happiness":19107,"demandHappiness":7657,"money_24h":70500,"strategy_points_24h":6,"random_good_of_age_24h":14},"SpaceAgeVenus":{"population":8276,"happiness":20646,"demandHappiness":8276,"money_24h":77700,"strategy_points_24h":6,"random_good_of_age_24h":14},"SpaceAgeJupiterMoon":{"population":8912,"happiness":22242,"demandHappiness":8912,"money_24h":85300,"strategy_points_24h":6,"random_good_of_age_24h":14},"SpaceAgeTitan":{"population":9597,"happiness":23962,"demandHappiness":9597,"money_24h":93644,"strategy_points_24h":7,"random_good_of_age_24h":15},"SpaceAgeSpaceHub":{"population":10282,"happiness":25682,"demandHappiness":10282,"money_24h":101988,"strategy_points_24h":7,"random_good_of_age_24h":15}}, boosts: [{"type":"def_boost_attacker","value":6,"feature":"all"},{"type":"att_boost_defender","value":1,"feature":"all"}] },
+    "W_MultiAge_SUM23A8": { prod: {"BronzeAge":{"population":156,"happiness":806,"demandHappiness":156,"money_24h":600,"strategy_points_24h":7,"random_good_of_age_24h":15},"IronAge":{"population":334,"happiness":1454,"demandHappiness":334,"money_24h":1500,"strategy_points_24h":7,"random_good_of_age_24h":15},"EarlyMiddleAge":{"population":513,"happiness":1753,"demandHappiness":513,"money_24h":2500,"strategy_points_24h":7,"random_good_of_age_24h":15},"HighMiddleAge":{"population":720,"happiness":2100,"demandHappiness":720,"money_24h":3500,"strategy_points_24h":7,"random_good_of_age_24h":15},"LateMiddleAge":{"population":945,"happiness":2485,"demandHappiness":945,"money_24h":4600,"strategy_points_24h":7,"random_good_of_age_24h":15},"ColonialAge":{"population":1192,"happiness":3002,"demandHappiness":1192,"money_24h":7000,"strategy_points_24h":7,"random_good_of_age_24h":15},"IndustrialAge":{"population":1457,"happiness":3497,"demandHappiness":1457,"money_24h":8800,"strategy_points_24h":7,"random_good_of_age_24h":15},"ProgressiveEra":{"population":1740,"happiness":3980,"demandHappiness":1740,"money_24h":10600,"strategy_points_24h":7,"random_good_of_age_24h":16},"ModernEra":{"population":2039,"happiness":4439,"demandHappiness":2039,"money_24h":13200,"strategy_points_24h":7,"random_good_of_age_24h":16},"PostModernEra":{"population":2350,"happiness":4850,"demandHappiness":2350,"money_24h":16600,"strategy_points_24h":7,"random_good_of_age_24h":16},"ContemporaryEra":{"population":2678,"happiness":5578,"demandHappiness":2678,"money_24h":21700,"strategy_points_24h":8,"random_good_of_age_24h":16},"TomorrowEra":{"population":3018,"happiness":6538,"demandHappiness":3018,"money_24h":25100,"strategy_points_24h":8,"random_good_of_age_24h":16},"FutureEra":{"population":3375,"happiness":7595,"demandHappiness":3375,"money_24h":28800,"strategy_points_24h":8,"random_good_of_age_24h":16},"ArcticFuture":{"population":3744,"happiness":8654,"demandHappiness":3744,"money_24h":32700,"strategy_points_24h":8,"random_good_of_age_24h":16},"OceanicFuture":{"population":4124,"happiness":9794,"demandHappiness":4124,"money_24h":36800,"strategy_points_24h":8,"random_good_of_age_24h":17},"VirtualFuture":{"population":4516,"happiness":11286,"demandHappiness":4516,"money_24h":41300,"strategy_points_24h":8,"random_good_of_age_24h":17},"SpaceAgeMars":{"population":7148,"happiness":17988,"demandHappiness":7148,"money_24h":68900,"strategy_points_24h":8,"random_good_of_age_24h":17},"SpaceAgeAsteroidBelt":{"population":7764,"happiness":19544,"demandHappiness":7764,"money_24h":76400,"strategy_points_24h":8,"random_good_of_age_24h":17},"SpaceAgeVenus":{"population":8392,"happiness":21122,"demandHappiness":8392,"money_24h":84200,"strategy_points_24h":8,"random_good_of_age_24h":17},"SpaceAgeJupiterMoon":{"population":9037,"happiness":22747,"demandHappiness":9037,"money_24h":92400,"strategy_points_24h":8,"random_good_of_age_24h":17},"SpaceAgeTitan":{"population":9732,"happiness":24498,"demandHappiness":9732,"money_24h":101399,"strategy_points_24h":9,"random_good_of_age_24h":18},"SpaceAgeSpaceHub":{"population":10427,"happiness":26249,"demandHappiness":10427,"money_24h":110398,"strategy_points_24h":9,"random_good_of_age_24h":18}}, boosts: [{"type":"def_boost_attacker","value":13,"feature":"all"},{"type":"att_boost_defender","value":8,"feature":"all"}] },
+    "W_MultiAge_SUM23A9": { prod: {"BronzeAge":{"population":158,"happiness":828,"demandHappiness":158,"money_24h":700,"strategy_points_24h":10,"random_good_of_age_24h":21},"IronAge":{"population":339,"happiness":1489,"demandHappiness":339,"money_24h":1600,"strategy_points_24h":10,"random_good_of_age_24h":21},"EarlyMiddleAge":{"population":520,"happiness":1790,"demandHappiness":520,"money_24h":2700,"strategy_points_24h":10,"random_good_of_age_24h":21},"HighMiddleAge":{"population":730,"happiness":2150,"demandHappiness":730,"money_24h":3800,"strategy_points_24h":10,"random_good_of_age_24h":21},"LateMiddleAge":{"population":958,"happiness":2538,"demandHappiness":958,"money_24h":5000,"strategy_points_24h":11,"random_good_of_age_24h":21},"ColonialAge":{"population":1209,"happiness":3069,"demandHappiness":1209,"money_24h":7700,"strategy_points_24h":11,"random_good_of_age_24h":22},"IndustrialAge":{"population":1478,"happiness":3578,"demandHappiness":1478,"money_24h":9600,"strategy_points_24h":11,"random_good_of_age_24h":22},"ProgressiveEra":{"population":1764,"happiness":4064,"demandHappiness":1764,"money_24h":11600,"strategy_points_24h":11,"random_good_of_age_24h":22},"ModernEra":{"population":2067,"happiness":4527,"demandHappiness":2067,"money_24h":14400,"strategy_points_24h":12,"random_good_of_age_24h":22},"PostModernEra":{"population":2383,"happiness":4953,"demandHappiness":2383,"money_24h":18100,"strategy_points_24h":12,"random_good_of_age_24h":22},"ContemporaryEra":{"population":2716,"happiness":5696,"demandHappiness":2716,"money_24h":23600,"strategy_points_24h":12,"random_good_of_age_24h":23},"TomorrowEra":{"population":3060,"happiness":6680,"demandHappiness":3060,"money_24h":27300,"strategy_points_24h":12,"random_good_of_age_24h":23},"FutureEra":{"population":3422,"happiness":7762,"demandHappiness":3422,"money_24h":31300,"strategy_points_24h":13,"random_good_of_age_24h":23},"ArcticFuture":{"population":3796,"happiness":8846,"demandHappiness":3796,"money_24h":35600,"strategy_points_24h":13,"random_good_of_age_24h":23},"OceanicFuture":{"population":4181,"happiness":10011,"demandHappiness":4181,"money_24h":40200,"strategy_points_24h":13,"random_good_of_age_24h":23},"VirtualFuture":{"population":4579,"happiness":11539,"demandHappiness":4579,"money_24h":45000,"strategy_points_24h":13,"random_good_of_age_24h":24},"SpaceAgeMars":{"population":7247,"happiness":18387,"demandHappiness":7247,"money_24h":75100,"strategy_points_24h":14,"random_good_of_age_24h":24},"SpaceAgeAsteroidBelt":{"population":7872,"happiness":19982,"demandHappiness":7872,"money_24h":83200,"strategy_points_24h":14,"random_good_of_age_24h":24},"SpaceAgeVenus":{"population":8509,"happiness":21589,"demandHappiness":8509,"money_24h":91700,"strategy_points_24h":14,"random_good_of_age_24h":24},"SpaceAgeJupiterMoon":{"population":9163,"happiness":23253,"demandHappiness":9163,"money_24h":100700,"strategy_points_24h":14,"random_good_of_age_24h":24},"SpaceAgeTitan":{"population":9868,"happiness":25046,"demandHappiness":9868,"money_24h":110584,"strategy_points_24h":15,"random_good_of_age_24h":25},"SpaceAgeSpaceHub":{"population":10573,"happiness":26839,"demandHappiness":10573,"money_24h":120468,"strategy_points_24h":15,"random_good_of_age_24h":25}}, boosts: [{"type":"att_boost_attacker","value":15,"feature":"all"},{"type":"def_boost_attacker","value":25,"feature":"all"},{"type":"att_boost_defender","value":26,"feature":"all"}] },
+    "W_MultiAge_SUM25F3": { prod: {"BronzeAge":{"population":270,"demandHappiness":270,"money_24h":1420,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"IronAge":{"population":580,"demandHappiness":580,"money_24h":3420,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"EarlyMiddleAge":{"population":890,"demandHappiness":890,"money_24h":5690,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"HighMiddleAge":{"population":1250,"demandHappiness":1250,"money_24h":7970,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"LateMiddleAge":{"population":1640,"demandHappiness":1640,"money_24h":10530,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"ColonialAge":{"population":2070,"demandHappiness":2070,"money_24h":16040,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"IndustrialAge":{"population":2530,"demandHappiness":2530,"money_24h":19980,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"ProgressiveEra":{"population":3030,"demandHappiness":3030,"money_24h":24250,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"ModernEra":{"population":3550,"demandHappiness":3550,"money_24h":30170,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"PostModernEra":{"population":4090,"demandHappiness":4090,"money_24h":37960,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"ContemporaryEra":{"population":4660,"demandHappiness":4660,"money_24h":49420,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"TomorrowEra":{"population":5250,"demandHappiness":5250,"money_24h":57220,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"FutureEra":{"population":5870,"demandHappiness":5870,"money_24h":65580,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"ArcticFuture":{"population":6510,"demandHappiness":6510,"money_24h":74520,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"OceanicFuture":{"population":7170,"demandHappiness":7170,"money_24h":84030,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"VirtualFuture":{"population":7850,"demandHappiness":7850,"money_24h":94120,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"SpaceAgeMars":{"population":12430,"demandHappiness":12430,"money_24h":157220,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"SpaceAgeAsteroidBelt":{"population":13500,"demandHappiness":13500,"money_24h":174140,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"SpaceAgeVenus":{"population":14590,"demandHappiness":14590,"money_24h":191960,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"SpaceAgeJupiterMoon":{"population":15720,"demandHappiness":15720,"money_24h":210690,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"SpaceAgeTitan":{"population":16860,"demandHappiness":16860,"money_24h":230340,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60},"SpaceAgeSpaceHub":{"population":18000,"demandHappiness":18000,"money_24h":250000,"all_goods_of_age_24h":60,"all_goods_of_next_age_24h":60}}, boosts: [{"type":"att_def_boost_attacker","value":12,"feature":"battleground"},{"type":"att_def_boost_attacker","value":49,"feature":"guild_expedition"}] },
+    "W_MultiAge_SUM23C1": { prod: {"BronzeAge":{"strategy_points_24h":5},"IronAge":{"strategy_points_24h":5},"EarlyMiddleAge":{"strategy_points_24h":5},"HighMiddleAge":{"strategy_points_24h":5},"LateMiddleAge":{"strategy_points_24h":5},"ColonialAge":{"strategy_points_24h":5},"IndustrialAge":{"strategy_points_24h":5},"ProgressiveEra":{"strategy_points_24h":5},"ModernEra":{"strategy_points_24h":5},"PostModernEra":{"strategy_points_24h":5},"ContemporaryEra":{"strategy_points_24h":6},"TomorrowEra":{"strategy_points_24h":6},"FutureEra":{"strategy_points_24h":6},"ArcticFuture":{"strategy_points_24h":6},"OceanicFuture":{"strategy_points_24h":6},"VirtualFuture":{"strategy_points_24h":6},"SpaceAgeMars":{"strategy_points_24h":6},"SpaceAgeAsteroidBelt":{"strategy_points_24h":6},"SpaceAgeVenus":{"strategy_points_24h":6},"SpaceAgeJupiterMoon":{"strategy_points_24h":6},"SpaceAgeTitan":{"strategy_points_24h":7},"SpaceAgeSpaceHub":{"strategy_points_24h":7}}, boosts: [{"type":"att_boost_attacker","value":11,"feature":"all"},{"type":"att_boost_defender","value":11,"feature":"all"}] },
+    "W_MultiAge_SUM20A1": { prod: {"BronzeAge":{"population":207,"happiness":810,"demandHappiness":207,"money_24h":1400,"random_good_of_age_24h":3},"IronAge":{"population":444,"happiness":1400,"demandHappiness":444,"money_24h":3200,"random_good_of_age_24h":3},"EarlyMiddleAge":{"population":681,"happiness":1550,"demandHappiness":681,"money_24h":5400,"random_good_of_age_24h":3},"HighMiddleAge":{"population":956,"happiness":1720,"demandHappiness":956,"money_24h":7600,"random_good_of_age_24h":3},"LateMiddleAge":{"population":1255,"happiness":1920,"demandHappiness":1255,"money_24h":10000,"random_good_of_age_24h":3},"ColonialAge":{"population":1584,"happiness":2260,"demandHappiness":1584,"money_24h":15200,"random_good_of_age_24h":3},"IndustrialAge":{"population":1935,"happiness":2550,"demandHappiness":1935,"money_24h":19000,"random_good_of_age_24h":3},"ProgressiveEra":{"population":2310,"happiness":2800,"demandHappiness":2310,"money_24h":23000,"random_good_of_age_24h":3},"ModernEra":{"population":2708,"happiness":3000,"demandHappiness":2708,"money_24h":28600,"random_good_of_age_24h":3},"PostModernEra":{"population":3121,"happiness":3120,"demandHappiness":3121,"money_24h":36000,"random_good_of_age_24h":3},"ContemporaryEra":{"population":3557,"happiness":3630,"demandHappiness":3557,"money_24h":46900,"random_good_of_age_24h":3},"TomorrowEra":{"population":4009,"happiness":4400,"demandHappiness":4009,"money_24h":54300,"random_good_of_age_24h":3},"FutureEra":{"population":4483,"happiness":5270,"demandHappiness":4483,"money_24h":62200,"random_good_of_age_24h":3},"ArcticFuture":{"population":4973,"happiness":6140,"demandHappiness":4973,"money_24h":70700,"random_good_of_age_24h":3},"OceanicFuture":{"population":5477,"happiness":7090,"demandHappiness":5477,"money_24h":79700,"random_good_of_age_24h":3},"VirtualFuture":{"population":5998,"happiness":8470,"demandHappiness":5998,"money_24h":89300,"random_good_of_age_24h":3},"SpaceAgeMars":{"population":9494,"happiness":13550,"demandHappiness":9494,"money_24h":149100,"random_good_of_age_24h":3},"SpaceAgeAsteroidBelt":{"population":10312,"happiness":14720,"demandHappiness":10312,"money_24h":165200,"random_good_of_age_24h":3},"SpaceAgeVenus":{"population":11146,"happiness":15910,"demandHappiness":11146,"money_24h":182100,"random_good_of_age_24h":3},"SpaceAgeJupiterMoon":{"population":12003,"happiness":17140,"demandHappiness":12003,"money_24h":199800,"random_good_of_age_24h":3},"SpaceAgeTitan":{"population":12875,"happiness":18380,"demandHappiness":12875,"money_24h":218500,"random_good_of_age_24h":3},"SpaceAgeSpaceHub":{"population":13770,"happiness":19660,"demandHappiness":13770,"money_24h":238000,"random_good_of_age_24h":3}} },
+    "W_MultiAge_SUM20A2": { prod: {"BronzeAge":{"population":213,"happiness":880,"demandHappiness":213,"money_24h":1400,"random_good_of_age_24h":5},"IronAge":{"population":457,"happiness":1510,"demandHappiness":457,"money_24h":3400,"random_good_of_age_24h":5},"EarlyMiddleAge":{"population":701,"happiness":1670,"demandHappiness":701,"money_24h":5700,"random_good_of_age_24h":5},"HighMiddleAge":{"population":984,"happiness":1870,"demandHappiness":984,"money_24h":8000,"random_good_of_age_24h":5},"LateMiddleAge":{"population":1292,"happiness":2080,"demandHappiness":1292,"money_24h":10600,"random_good_of_age_24h":5},"ColonialAge":{"population":1630,"happiness":2450,"demandHappiness":1630,"money_24h":16100,"random_good_of_age_24h":5},"IndustrialAge":{"population":1992,"happiness":2760,"demandHappiness":1992,"money_24h":20000,"random_good_of_age_24h":5},"ProgressiveEra":{"population":2378,"happiness":3030,"demandHappiness":2378,"money_24h":24300,"random_good_of_age_24h":5},"ModernEra":{"population":2788,"happiness":3250,"demandHappiness":2788,"money_24h":30200,"random_good_of_age_24h":5},"PostModernEra":{"population":3213,"happiness":3380,"demandHappiness":3213,"money_24h":38000,"random_good_of_age_24h":5},"ContemporaryEra":{"population":3662,"happiness":3930,"demandHappiness":3662,"money_24h":49500,"random_good_of_age_24h":5},"TomorrowEra":{"population":4127,"happiness":4770,"demandHappiness":4127,"money_24h":57300,"random_good_of_age_24h":5},"FutureEra":{"population":4615,"happiness":5710,"demandHappiness":4615,"money_24h":65700,"random_good_of_age_24h":5},"ArcticFuture":{"population":5119,"happiness":6650,"demandHappiness":5119,"money_24h":74600,"random_good_of_age_24h":5},"OceanicFuture":{"population":5639,"happiness":7680,"demandHappiness":5639,"money_24h":84100,"random_good_of_age_24h":5},"VirtualFuture":{"population":6174,"happiness":9170,"demandHappiness":6174,"money_24h":94200,"random_good_of_age_24h":5},"SpaceAgeMars":{"population":9773,"happiness":14680,"demandHappiness":9773,"money_24h":157400,"random_good_of_age_24h":5},"SpaceAgeAsteroidBelt":{"population":10616,"happiness":15950,"demandHappiness":10616,"money_24h":174400,"random_good_of_age_24h":5},"SpaceAgeVenus":{"population":11474,"happiness":17230,"demandHappiness":11474,"money_24h":192200,"random_good_of_age_24h":5},"SpaceAgeJupiterMoon":{"population":12356,"happiness":18560,"demandHappiness":12356,"money_24h":210900,"random_good_of_age_24h":5},"SpaceAgeTitan":{"population":13254,"happiness":19910,"demandHappiness":13254,"money_24h":230600,"random_good_of_age_24h":5},"SpaceAgeSpaceHub":{"population":14175,"happiness":21300,"demandHappiness":14175,"money_24h":251200,"random_good_of_age_24h":5}} },
+    "W_MultiAge_SUM20A3": { prod: {"BronzeAge":{"population":219,"happiness":950,"demandHappiness":219,"money_24h":1500,"random_good_of_age_24h":8},"IronAge":{"population":470,"happiness":1630,"demandHappiness":470,"money_24h":3600,"random_good_of_age_24h":8},"EarlyMiddleAge":{"population":721,"happiness":1800,"demandHappiness":721,"money_24h":6000,"random_good_of_age_24h":8},"HighMiddleAge":{"population":1013,"happiness":2010,"demandHappiness":1013,"money_24h":8400,"random_good_of_age_24h":8},"LateMiddleAge":{"population":1328,"happiness":2240,"demandHappiness":1328,"money_24h":11100,"random_good_of_age_24h":8},"ColonialAge":{"population":1677,"happiness":2640,"demandHappiness":1677,"money_24h":16900,"random_good_of_age_24h":8},"IndustrialAge":{"population":2049,"happiness":2970,"demandHappiness":2049,"money_24h":21100,"random_good_of_age_24h":8},"ProgressiveEra":{"population":2446,"happiness":3270,"demandHappiness":2446,"money_24h":25600,"random_good_of_age_24h":8},"ModernEra":{"population":2867,"happiness":3490,"demandHappiness":2867,"money_24h":31800,"random_good_of_age_24h":8},"PostModernEra":{"population":3305,"happiness":3640,"demandHappiness":3305,"money_24h":40000,"random_good_of_age_24h":8},"ContemporaryEra":{"population":3767,"happiness":4230,"demandHappiness":3767,"money_24h":52100,"random_good_of_age_24h":8},"TomorrowEra":{"population":4244,"happiness":5140,"demandHappiness":4244,"money_24h":60300,"random_good_of_age_24h":8},"FutureEra":{"population":4747,"happiness":6150,"demandHappiness":4747,"money_24h":69100,"random_good_of_age_24h":8},"ArcticFuture":{"population":5265,"happiness":7170,"demandHappiness":5265,"money_24h":78500,"random_good_of_age_24h":8},"OceanicFuture":{"population":5800,"happiness":8270,"demandHappiness":5800,"money_24h":88600,"random_good_of_age_24h":8},"VirtualFuture":{"population":6350,"happiness":9880,"demandHappiness":6350,"money_24h":99200,"random_good_of_age_24h":8},"SpaceAgeMars":{"population":10052,"happiness":15810,"demandHappiness":10052,"money_24h":165700,"random_good_of_age_24h":8},"SpaceAgeAsteroidBelt":{"population":10919,"happiness":17180,"demandHappiness":10919,"money_24h":183500,"random_good_of_age_24h":8},"SpaceAgeVenus":{"population":11802,"happiness":18560,"demandHappiness":11802,"money_24h":202300,"random_good_of_age_24h":8},"SpaceAgeJupiterMoon":{"population":12709,"happiness":19990,"demandHappiness":12709,"money_24h":222100,"random_good_of_age_24h":8},"SpaceAgeTitan":{"population":13632,"happiness":21440,"demandHappiness":13632,"money_24h":242800,"random_good_of_age_24h":8},"SpaceAgeSpaceHub":{"population":14580,"happiness":22940,"demandHappiness":14580,"money_24h":264400,"random_good_of_age_24h":8}} },
+    "W_MultiAge_SUM20A4": { prod: {"BronzeAge":{"population":227,"happiness":1010,"demandHappiness":227,"money_24h":1600,"random_good_of_age_24h":12,"units_24h":1},"IronAge":{"population":487,"happiness":1750,"demandHappiness":487,"money_24h":3800,"random_good_of_age_24h":12,"units_24h":1},"EarlyMiddleAge":{"population":748,"happiness":1930,"demandHappiness":748,"money_24h":6300,"random_good_of_age_24h":12,"units_24h":1},"HighMiddleAge":{"population":1050,"happiness":2160,"demandHappiness":1050,"money_24h":8800,"random_good_of_age_24h":12,"units_24h":1},"LateMiddleAge":{"population":1378,"happiness":2400,"demandHappiness":1378,"money_24h":11700,"random_good_of_age_24h":12,"units_24h":1},"ColonialAge":{"population":1739,"happiness":2830,"demandHappiness":1739,"money_24h":17800,"random_good_of_age_24h":12,"units_24h":1},"IndustrialAge":{"population":2125,"happiness":3190,"demandHappiness":2125,"money_24h":22100,"random_good_of_age_24h":12,"units_24h":1},"ProgressiveEra":{"population":2537,"happiness":3500,"demandHappiness":2537,"money_24h":26800,"random_good_of_age_24h":12,"units_24h":1},"ModernEra":{"population":2974,"happiness":3740,"demandHappiness":2974,"money_24h":33400,"random_good_of_age_24h":12,"units_24h":1},"PostModernEra":{"population":3427,"happiness":3900,"demandHappiness":3427,"money_24h":42000,"random_good_of_age_24h":12,"units_24h":1},"ContemporaryEra":{"population":3906,"happiness":4530,"demandHappiness":3906,"money_24h":54700,"random_good_of_age_24h":12,"units_24h":1},"TomorrowEra":{"population":4402,"happiness":5500,"demandHappiness":4402,"money_24h":63300,"random_good_of_age_24h":12,"units_24h":1},"FutureEra":{"population":4922,"happiness":6590,"demandHappiness":4922,"money_24h":72600,"random_good_of_age_24h":12,"units_24h":1},"ArcticFuture":{"population":5460,"happiness":7680,"demandHappiness":5460,"money_24h":82500,"random_good_of_age_24h":12,"units_24h":1},"OceanicFuture":{"population":6014,"happiness":8860,"demandHappiness":6014,"money_24h":93000,"random_good_of_age_24h":12,"units_24h":1},"VirtualFuture":{"population":6586,"happiness":10580,"demandHappiness":6586,"money_24h":104200,"random_good_of_age_24h":12,"units_24h":1},"SpaceAgeMars":{"population":10424,"happiness":16940,"demandHappiness":10424,"money_24h":174000,"random_good_of_age_24h":12,"units_24h":1},"SpaceAgeAsteroidBelt":{"population":11323,"happiness":18410,"demandHappiness":11323,"money_24h":192700,"random_good_of_age_24h":12,"units_24h":1},"SpaceAgeVenus":{"population":12239,"happiness":19880,"demandHappiness":12239,"money_24h":212400,"random_good_of_age_24h":12,"units_24h":1},"SpaceAgeJupiterMoon":{"population":13180,"happiness":21420,"demandHappiness":13180,"money_24h":233200,"random_good_of_age_24h":12,"units_24h":1},"SpaceAgeTitan":{"population":14137,"happiness":22970,"demandHappiness":14137,"money_24h":254900,"random_good_of_age_24h":12,"units_24h":1},"SpaceAgeSpaceHub":{"population":15120,"happiness":24570,"demandHappiness":15120,"money_24h":277700,"random_good_of_age_24h":12,"units_24h":1}} },
+    "W_MultiAge_SUM20A5": { prod: {"BronzeAge":{"population":235,"happiness":1080,"demandHappiness":235,"money_24h":1700,"random_good_of_age_24h":15,"units_24h":1},"IronAge":{"population":505,"happiness":1860,"demandHappiness":505,"money_24h":4000,"random_good_of_age_24h":15,"units_24h":1},"EarlyMiddleAge":{"population":774,"happiness":2060,"demandHappiness":774,"money_24h":6600,"random_good_of_age_24h":15,"units_24h":1},"HighMiddleAge":{"population":1088,"happiness":2300,"demandHappiness":1088,"money_24h":9200,"random_good_of_age_24h":15,"units_24h":1},"LateMiddleAge":{"population":1427,"happiness":2560,"demandHappiness":1427,"money_24h":12200,"random_good_of_age_24h":15,"units_24h":1},"ColonialAge":{"population":1801,"happiness":3010,"demandHappiness":1801,"money_24h":18600,"random_good_of_age_24h":15,"units_24h":1},"IndustrialAge":{"population":2201,"happiness":3400,"demandHappiness":2201,"money_24h":23200,"random_good_of_age_24h":15,"units_24h":1},"ProgressiveEra":{"population":2627,"happiness":3730,"demandHappiness":2627,"money_24h":28100,"random_good_of_age_24h":15,"units_24h":1},"ModernEra":{"population":3080,"happiness":3990,"demandHappiness":3080,"money_24h":35000,"random_good_of_age_24h":15,"units_24h":1},"PostModernEra":{"population":3550,"happiness":4160,"demandHappiness":3550,"money_24h":44000,"random_good_of_age_24h":15,"units_24h":1},"ContemporaryEra":{"population":4046,"happiness":4840,"demandHappiness":4046,"money_24h":57300,"random_good_of_age_24h":15,"units_24h":1},"TomorrowEra":{"population":4559,"happiness":5870,"demandHappiness":4559,"money_24h":66300,"random_good_of_age_24h":15,"units_24h":1},"FutureEra":{"population":5098,"happiness":7030,"demandHappiness":5098,"money_24h":76000,"random_good_of_age_24h":15,"units_24h":1},"ArcticFuture":{"population":5655,"happiness":8190,"demandHappiness":5655,"money_24h":86400,"random_good_of_age_24h":15,"units_24h":1},"OceanicFuture":{"population":6229,"happiness":9450,"demandHappiness":6229,"money_24h":97400,"random_good_of_age_24h":15,"units_24h":1},"VirtualFuture":{"population":6821,"happiness":11290,"demandHappiness":6821,"money_24h":109100,"random_good_of_age_24h":15,"units_24h":1},"SpaceAgeMars":{"population":10797,"happiness":18070,"demandHappiness":10797,"money_24h":182300,"random_good_of_age_24h":15,"units_24h":1},"SpaceAgeAsteroidBelt":{"population":11728,"happiness":19630,"demandHappiness":11728,"money_24h":201900,"random_good_of_age_24h":15,"units_24h":1},"SpaceAgeVenus":{"population":12676,"happiness":21210,"demandHappiness":12676,"money_24h":222500,"random_good_of_age_24h":15,"units_24h":1},"SpaceAgeJupiterMoon":{"population":13650,"happiness":22850,"demandHappiness":13650,"money_24h":244300,"random_good_of_age_24h":15,"units_24h":1},"SpaceAgeTitan":{"population":14642,"happiness":24500,"demandHappiness":14642,"money_24h":267000,"random_good_of_age_24h":15,"units_24h":1},"SpaceAgeSpaceHub":{"population":15660,"happiness":26210,"demandHappiness":15660,"money_24h":290900,"random_good_of_age_24h":15,"units_24h":1}}, boosts: [{"type":"att_boost_attacker","value":4,"feature":"all"}] },
+    "W_MultiAge_SUM20A6": { prod: {"BronzeAge":{"population":243,"happiness":1150,"demandHappiness":243,"money_24h":1700,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"IronAge":{"population":522,"happiness":1980,"demandHappiness":522,"money_24h":4100,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"EarlyMiddleAge":{"population":801,"happiness":2190,"demandHappiness":801,"money_24h":6900,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"HighMiddleAge":{"population":1125,"happiness":2440,"demandHappiness":1125,"money_24h":9700,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"LateMiddleAge":{"population":1476,"happiness":2720,"demandHappiness":1476,"money_24h":12800,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"ColonialAge":{"population":1863,"happiness":3200,"demandHappiness":1863,"money_24h":19400,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"IndustrialAge":{"population":2277,"happiness":3610,"demandHappiness":2277,"money_24h":24200,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"ProgressiveEra":{"population":2718,"happiness":3970,"demandHappiness":2718,"money_24h":29400,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"ModernEra":{"population":3186,"happiness":4240,"demandHappiness":3186,"money_24h":36600,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"PostModernEra":{"population":3672,"happiness":4420,"demandHappiness":3672,"money_24h":46000,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"ContemporaryEra":{"population":4185,"happiness":5140,"demandHappiness":4185,"money_24h":59900,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"TomorrowEra":{"population":4716,"happiness":6240,"demandHappiness":4716,"money_24h":69400,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"FutureEra":{"population":5274,"happiness":7470,"demandHappiness":5274,"money_24h":79500,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"ArcticFuture":{"population":5850,"happiness":8700,"demandHappiness":5850,"money_24h":90300,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"OceanicFuture":{"population":6444,"happiness":10040,"demandHappiness":6444,"money_24h":101800,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"VirtualFuture":{"population":7056,"happiness":12000,"demandHappiness":7056,"money_24h":114100,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"SpaceAgeMars":{"population":11169,"happiness":19190,"demandHappiness":11169,"money_24h":190500,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"SpaceAgeAsteroidBelt":{"population":12132,"happiness":20860,"demandHappiness":12132,"money_24h":211100,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"SpaceAgeVenus":{"population":13113,"happiness":22540,"demandHappiness":13113,"money_24h":232700,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"SpaceAgeJupiterMoon":{"population":14121,"happiness":24280,"demandHappiness":14121,"money_24h":255400,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"SpaceAgeTitan":{"population":15147,"happiness":26040,"demandHappiness":15147,"money_24h":279200,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1},"SpaceAgeSpaceHub":{"population":16200,"happiness":27850,"demandHappiness":16200,"money_24h":304100,"strategy_points_24h":2,"random_good_of_age_24h":20,"units_24h":1}}, boosts: [{"type":"att_boost_attacker","value":4,"feature":"all"}] },
+    "W_MultiAge_SUM20A7": { prod: {"BronzeAge":{"population":253,"happiness":1220,"demandHappiness":253,"money_24h":1800,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"IronAge":{"population":544,"happiness":2100,"demandHappiness":544,"money_24h":4300,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"EarlyMiddleAge":{"population":834,"happiness":2320,"demandHappiness":834,"money_24h":7200,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"HighMiddleAge":{"population":1172,"happiness":2590,"demandHappiness":1172,"money_24h":10100,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"LateMiddleAge":{"population":1538,"happiness":2880,"demandHappiness":1538,"money_24h":13300,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"ColonialAge":{"population":1941,"happiness":3390,"demandHappiness":1941,"money_24h":20300,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"IndustrialAge":{"population":2372,"happiness":3820,"demandHappiness":2372,"money_24h":25300,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"ProgressiveEra":{"population":2831,"happiness":4200,"demandHappiness":2831,"money_24h":30700,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"ModernEra":{"population":3319,"happiness":4490,"demandHappiness":3319,"money_24h":38200,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"PostModernEra":{"population":3825,"happiness":4680,"demandHappiness":3825,"money_24h":48000,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"ContemporaryEra":{"population":4359,"happiness":5440,"demandHappiness":4359,"money_24h":62500,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"TomorrowEra":{"population":4913,"happiness":6600,"demandHappiness":4913,"money_24h":72400,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"FutureEra":{"population":5494,"happiness":7910,"demandHappiness":5494,"money_24h":82900,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"ArcticFuture":{"population":6094,"happiness":9210,"demandHappiness":6094,"money_24h":94300,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"OceanicFuture":{"population":6713,"happiness":10630,"demandHappiness":6713,"money_24h":106300,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"VirtualFuture":{"population":7350,"happiness":12700,"demandHappiness":7350,"money_24h":119000,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"SpaceAgeMars":{"population":11634,"happiness":20320,"demandHappiness":11634,"money_24h":198800,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"SpaceAgeAsteroidBelt":{"population":12638,"happiness":22090,"demandHappiness":12638,"money_24h":220200,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"SpaceAgeVenus":{"population":13659,"happiness":23860,"demandHappiness":13659,"money_24h":242800,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"SpaceAgeJupiterMoon":{"population":14709,"happiness":25700,"demandHappiness":14709,"money_24h":266500,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"SpaceAgeTitan":{"population":15778,"happiness":27570,"demandHappiness":15778,"money_24h":291300,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2},"SpaceAgeSpaceHub":{"population":16875,"happiness":29490,"demandHappiness":16875,"money_24h":317300,"strategy_points_24h":4,"random_good_of_age_24h":25,"units_24h":2}}, boosts: [{"type":"att_boost_attacker","value":10,"feature":"all"}] },
+    "W_MultiAge_SUM20A8": { prod: {"BronzeAge":{"population":263,"happiness":1280,"demandHappiness":263,"money_24h":1900,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"IronAge":{"population":566,"happiness":2210,"demandHappiness":566,"money_24h":4500,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"EarlyMiddleAge":{"population":868,"happiness":2450,"demandHappiness":868,"money_24h":7500,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"HighMiddleAge":{"population":1219,"happiness":2730,"demandHappiness":1219,"money_24h":10500,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"LateMiddleAge":{"population":1599,"happiness":3040,"demandHappiness":1599,"money_24h":13900,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"ColonialAge":{"population":2018,"happiness":3580,"demandHappiness":2018,"money_24h":21100,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"IndustrialAge":{"population":2467,"happiness":4040,"demandHappiness":2467,"money_24h":26300,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"ProgressiveEra":{"population":2945,"happiness":4430,"demandHappiness":2945,"money_24h":32000,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"ModernEra":{"population":3452,"happiness":4740,"demandHappiness":3452,"money_24h":39800,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"PostModernEra":{"population":3978,"happiness":4940,"demandHappiness":3978,"money_24h":50000,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"ContemporaryEra":{"population":4534,"happiness":5740,"demandHappiness":4534,"money_24h":65100,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"TomorrowEra":{"population":5109,"happiness":6970,"demandHappiness":5109,"money_24h":75400,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"FutureEra":{"population":5714,"happiness":8350,"demandHappiness":5714,"money_24h":86400,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"ArcticFuture":{"population":6338,"happiness":9730,"demandHappiness":6338,"money_24h":98200,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"OceanicFuture":{"population":6981,"happiness":11220,"demandHappiness":6981,"money_24h":110700,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"VirtualFuture":{"population":7644,"happiness":13410,"demandHappiness":7644,"money_24h":124000,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"SpaceAgeMars":{"population":12100,"happiness":21450,"demandHappiness":12100,"money_24h":207100,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"SpaceAgeAsteroidBelt":{"population":13143,"happiness":23310,"demandHappiness":13143,"money_24h":229400,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"SpaceAgeVenus":{"population":14206,"happiness":25190,"demandHappiness":14206,"money_24h":252900,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"SpaceAgeJupiterMoon":{"population":15298,"happiness":27130,"demandHappiness":15298,"money_24h":277600,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"SpaceAgeTitan":{"population":16409,"happiness":29100,"demandHappiness":16409,"money_24h":303500,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3},"SpaceAgeSpaceHub":{"population":17550,"happiness":31130,"demandHappiness":17550,"money_24h":330500,"strategy_points_24h":6,"random_good_of_age_24h":30,"units_24h":3}}, boosts: [{"type":"att_boost_attacker","value":10,"feature":"all"}] },
+    "W_MultiAge_SUM20A9": { prod: {"BronzeAge":{"population":273,"happiness":1350,"demandHappiness":273,"money_24h":2000,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"IronAge":{"population":587,"happiness":2330,"demandHappiness":587,"money_24h":4700,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"EarlyMiddleAge":{"population":901,"happiness":2580,"demandHappiness":901,"money_24h":7800,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"HighMiddleAge":{"population":1266,"happiness":2870,"demandHappiness":1266,"money_24h":10900,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"LateMiddleAge":{"population":1661,"happiness":3200,"demandHappiness":1661,"money_24h":14400,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"ColonialAge":{"population":2096,"happiness":3770,"demandHappiness":2096,"money_24h":22000,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"IndustrialAge":{"population":2562,"happiness":4250,"demandHappiness":2562,"money_24h":27400,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"ProgressiveEra":{"population":3058,"happiness":4670,"demandHappiness":3058,"money_24h":33200,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"ModernEra":{"population":3584,"happiness":4990,"demandHappiness":3584,"money_24h":41300,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"PostModernEra":{"population":4131,"happiness":5200,"demandHappiness":4131,"money_24h":52000,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"ContemporaryEra":{"population":4708,"happiness":6040,"demandHappiness":4708,"money_24h":67700,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"TomorrowEra":{"population":5306,"happiness":7340,"demandHappiness":5306,"money_24h":78400,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"FutureEra":{"population":5933,"happiness":8790,"demandHappiness":5933,"money_24h":89900,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"ArcticFuture":{"population":6581,"happiness":10240,"demandHappiness":6581,"money_24h":102100,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"OceanicFuture":{"population":7250,"happiness":11810,"demandHappiness":7250,"money_24h":115100,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"VirtualFuture":{"population":7938,"happiness":14110,"demandHappiness":7938,"money_24h":129000,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"SpaceAgeMars":{"population":12565,"happiness":22580,"demandHappiness":12565,"money_24h":215400,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"SpaceAgeAsteroidBelt":{"population":13649,"happiness":24540,"demandHappiness":13649,"money_24h":238600,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"SpaceAgeVenus":{"population":14752,"happiness":26510,"demandHappiness":14752,"money_24h":263000,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"SpaceAgeJupiterMoon":{"population":15886,"happiness":28560,"demandHappiness":15886,"money_24h":288700,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"SpaceAgeTitan":{"population":17040,"happiness":30630,"demandHappiness":17040,"money_24h":315600,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4},"SpaceAgeSpaceHub":{"population":18225,"happiness":32760,"demandHappiness":18225,"money_24h":343800,"strategy_points_24h":8,"random_good_of_age_24h":35,"units_24h":4}}, boosts: [{"type":"att_boost_attacker","value":16,"feature":"all"}] },
+    "W_MultiAge_SUM20A11": { prod: {"BronzeAge":{"population":450,"happiness":2480,"demandHappiness":450,"money_24h":2560,"strategy_points_24h":100,"random_good_of_age_24h":250},"IronAge":{"population":970,"happiness":4270,"demandHappiness":970,"money_24h":6150,"strategy_points_24h":100,"random_good_of_age_24h":250},"EarlyMiddleAge":{"population":1490,"happiness":4730,"demandHappiness":1490,"money_24h":10250,"strategy_points_24h":100,"random_good_of_age_24h":250},"HighMiddleAge":{"population":2090,"happiness":5270,"demandHappiness":2090,"money_24h":14350,"strategy_points_24h":100,"random_good_of_age_24h":250},"LateMiddleAge":{"population":2740,"happiness":5880,"demandHappiness":2740,"money_24h":18960,"strategy_points_24h":100,"random_good_of_age_24h":250},"ColonialAge":{"population":3460,"happiness":6910,"demandHappiness":3460,"money_24h":28870,"strategy_points_24h":100,"random_good_of_age_24h":250},"IndustrialAge":{"population":4220,"happiness":7800,"demandHappiness":4220,"money_24h":35970,"strategy_points_24h":100,"random_good_of_age_24h":250},"ProgressiveEra":{"population":5040,"happiness":8560,"demandHappiness":5040,"money_24h":43650,"strategy_points_24h":100,"random_good_of_age_24h":250},"ModernEra":{"population":5910,"happiness":9160,"demandHappiness":5910,"money_24h":54310,"strategy_points_24h":100,"random_good_of_age_24h":250},"PostModernEra":{"population":6810,"happiness":9550,"demandHappiness":6810,"money_24h":68330,"strategy_points_24h":100,"random_good_of_age_24h":250},"ContemporaryEra":{"population":7760,"happiness":11090,"demandHappiness":7760,"money_24h":88950,"strategy_points_24h":100,"random_good_of_age_24h":250},"TomorrowEra":{"population":8750,"happiness":13460,"demandHappiness":8750,"money_24h":102990,"strategy_points_24h":100,"random_good_of_age_24h":250},"FutureEra":{"population":9780,"happiness":16130,"demandHappiness":9780,"money_24h":118050,"strategy_points_24h":100,"random_good_of_age_24h":250},"ArcticFuture":{"population":10850,"happiness":18780,"demandHappiness":10850,"money_24h":134140,"strategy_points_24h":100,"random_good_of_age_24h":250},"OceanicFuture":{"population":11950,"happiness":21680,"demandHappiness":11950,"money_24h":151260,"strategy_points_24h":100,"random_good_of_age_24h":250},"VirtualFuture":{"population":13090,"happiness":25900,"demandHappiness":13090,"money_24h":169420,"strategy_points_24h":100,"random_good_of_age_24h":250},"SpaceAgeMars":{"population":20720,"happiness":41440,"demandHappiness":20720,"money_24h":282990,"strategy_points_24h":100,"random_good_of_age_24h":250},"SpaceAgeAsteroidBelt":{"population":22500,"happiness":45030,"demandHappiness":22500,"money_24h":313450,"strategy_points_24h":100,"random_good_of_age_24h":250},"SpaceAgeVenus":{"population":24320,"happiness":48650,"demandHappiness":24320,"money_24h":345530,"strategy_points_24h":100,"random_good_of_age_24h":250},"SpaceAgeJupiterMoon":{"population":26190,"happiness":52410,"demandHappiness":26190,"money_24h":379240,"strategy_points_24h":100,"random_good_of_age_24h":250},"SpaceAgeTitan":{"population":28100,"happiness":56200,"demandHappiness":28100,"money_24h":414620,"strategy_points_24h":100,"random_good_of_age_24h":250},"SpaceAgeSpaceHub":{"population":30000,"happiness":60000,"demandHappiness":30000,"money_24h":450000,"strategy_points_24h":100,"random_good_of_age_24h":250}}, boosts: [{"type":"def_boost_defender","value":30,"feature":"guild_raids"},{"type":"att_def_boost_attacker_defender","value":36,"feature":"all"}] },
+    "W_MultiAge_SUM25A18": { prod: {"BronzeAge":{"population":950,"demandHappiness":950,"supplies_24h":3080,"strategy_points_24h":170},"IronAge":{"population":2040,"demandHappiness":2040,"supplies_24h":7390,"strategy_points_24h":170},"EarlyMiddleAge":{"population":3130,"demandHappiness":3130,"supplies_24h":12320,"strategy_points_24h":170},"HighMiddleAge":{"population":4400,"demandHappiness":4400,"supplies_24h":17250,"strategy_points_24h":170},"LateMiddleAge":{"population":5770,"demandHappiness":5770,"supplies_24h":22800,"strategy_points_24h":170},"ColonialAge":{"population":7290,"demandHappiness":7290,"supplies_24h":28960,"strategy_points_24h":170},"IndustrialAge":{"population":8900,"demandHappiness":8900,"supplies_24h":35130,"strategy_points_24h":170},"ProgressiveEra":{"population":10630,"demandHappiness":10630,"supplies_24h":41290,"strategy_points_24h":170},"ModernEra":{"population":12460,"demandHappiness":12460,"supplies_24h":48070,"strategy_points_24h":170},"PostModernEra":{"population":14360,"demandHappiness":14360,"supplies_24h":54850,"strategy_points_24h":170},"ContemporaryEra":{"population":16370,"demandHappiness":16370,"supplies_24h":61620,"strategy_points_24h":170},"TomorrowEra":{"population":18440,"demandHappiness":18440,"supplies_24h":69020,"strategy_points_24h":170},"FutureEra":{"population":20630,"demandHappiness":20630,"supplies_24h":75800,"strategy_points_24h":170},"ArcticFuture":{"population":22880,"demandHappiness":22880,"supplies_24h":83190,"strategy_points_24h":170},"OceanicFuture":{"population":25200,"demandHappiness":25200,"supplies_24h":91200,"strategy_points_24h":170},"VirtualFuture":{"population":27590,"demandHappiness":27590,"supplies_24h":98600,"strategy_points_24h":170},"SpaceAgeMars":{"population":43680,"demandHappiness":43680,"supplies_24h":159610,"strategy_points_24h":170},"SpaceAgeAsteroidBelt":{"population":47450,"demandHappiness":47450,"supplies_24h":171320,"strategy_points_24h":170},"SpaceAgeVenus":{"population":51280,"demandHappiness":51280,"supplies_24h":183640,"strategy_points_24h":170},"SpaceAgeJupiterMoon":{"population":55220,"demandHappiness":55220,"supplies_24h":195350,"strategy_points_24h":170},"SpaceAgeTitan":{"population":59240,"demandHappiness":59240,"supplies_24h":207680,"strategy_points_24h":170},"SpaceAgeSpaceHub":{"population":63250,"demandHappiness":63250,"supplies_24h":220000,"strategy_points_24h":170}}, boosts: [{"type":"def_boost_attacker","value":265,"feature":"guild_expedition"},{"type":"def_boost_defender","value":265,"feature":"battleground"}] },
+    "W_MultiAge_SUM25A17": { prod: {"BronzeAge":{"population":830,"demandHappiness":830,"supplies_24h":2980,"strategy_points_24h":140},"IronAge":{"population":1780,"demandHappiness":1780,"supplies_24h":7160,"strategy_points_24h":140},"EarlyMiddleAge":{"population":2720,"demandHappiness":2720,"supplies_24h":11940,"strategy_points_24h":140},"HighMiddleAge":{"population":3830,"demandHappiness":3830,"supplies_24h":16720,"strategy_points_24h":140},"LateMiddleAge":{"population":5020,"demandHappiness":5020,"supplies_24h":22090,"strategy_points_24h":140},"ColonialAge":{"population":6340,"demandHappiness":6340,"supplies_24h":28060,"strategy_points_24h":140},"IndustrialAge":{"population":7740,"demandHappiness":7740,"supplies_24h":34030,"strategy_points_24h":140},"ProgressiveEra":{"population":9240,"demandHappiness":9240,"supplies_24h":40000,"strategy_points_24h":140},"ModernEra":{"population":10830,"demandHappiness":10830,"supplies_24h":46570,"strategy_points_24h":140},"PostModernEra":{"population":12490,"demandHappiness":12490,"supplies_24h":53130,"strategy_points_24h":140},"ContemporaryEra":{"population":14230,"demandHappiness":14230,"supplies_24h":59700,"strategy_points_24h":140},"TomorrowEra":{"population":16040,"demandHappiness":16040,"supplies_24h":66860,"strategy_points_24h":140},"FutureEra":{"population":17940,"demandHappiness":17940,"supplies_24h":73430,"strategy_points_24h":140},"ArcticFuture":{"population":19890,"demandHappiness":19890,"supplies_24h":80590,"strategy_points_24h":140},"OceanicFuture":{"population":21910,"demandHappiness":21910,"supplies_24h":88350,"strategy_points_24h":140},"VirtualFuture":{"population":24000,"demandHappiness":24000,"supplies_24h":95520,"strategy_points_24h":140},"SpaceAgeMars":{"population":37980,"demandHappiness":37980,"supplies_24h":154620,"strategy_points_24h":140},"SpaceAgeAsteroidBelt":{"population":41260,"demandHappiness":41260,"supplies_24h":165960,"strategy_points_24h":140},"SpaceAgeVenus":{"population":44590,"demandHappiness":44590,"supplies_24h":177900,"strategy_points_24h":140},"SpaceAgeJupiterMoon":{"population":48020,"demandHappiness":48020,"supplies_24h":189250,"strategy_points_24h":140},"SpaceAgeTitan":{"population":51510,"demandHappiness":51510,"supplies_24h":201190,"strategy_points_24h":140},"SpaceAgeSpaceHub":{"population":55000,"demandHappiness":55000,"supplies_24h":213130,"strategy_points_24h":140}}, boosts: [{"type":"def_boost_attacker","value":225,"feature":"guild_expedition"},{"type":"def_boost_defender","value":245,"feature":"battleground"}] },
+    "W_MultiAge_SUM25A1": { prod: {"BronzeAge":{"population":80,"demandHappiness":80,"supplies_24h":1440,"strategy_points_24h":10},"IronAge":{"population":180,"demandHappiness":180,"supplies_24h":3470,"strategy_points_24h":10},"EarlyMiddleAge":{"population":270,"demandHappiness":270,"supplies_24h":5780,"strategy_points_24h":10},"HighMiddleAge":{"population":380,"demandHappiness":380,"supplies_24h":8090,"strategy_points_24h":10},"LateMiddleAge":{"population":500,"demandHappiness":500,"supplies_24h":10690,"strategy_points_24h":10},"ColonialAge":{"population":630,"demandHappiness":630,"supplies_24h":13580,"strategy_points_24h":10},"IndustrialAge":{"population":770,"demandHappiness":770,"supplies_24h":16470,"strategy_points_24h":10},"ProgressiveEra":{"population":920,"demandHappiness":920,"supplies_24h":19350,"strategy_points_24h":10},"ModernEra":{"population":1080,"demandHappiness":1080,"supplies_24h":22530,"strategy_points_24h":10},"PostModernEra":{"population":1250,"demandHappiness":1250,"supplies_24h":25710,"strategy_points_24h":10},"ContemporaryEra":{"population":1420,"demandHappiness":1420,"supplies_24h":28890,"strategy_points_24h":10},"TomorrowEra":{"population":1600,"demandHappiness":1600,"supplies_24h":32350,"strategy_points_24h":10},"FutureEra":{"population":1790,"demandHappiness":1790,"supplies_24h":35530,"strategy_points_24h":10},"ArcticFuture":{"population":1990,"demandHappiness":1990,"supplies_24h":39000,"strategy_points_24h":10},"OceanicFuture":{"population":2190,"demandHappiness":2190,"supplies_24h":42750,"strategy_points_24h":10},"VirtualFuture":{"population":2400,"demandHappiness":2400,"supplies_24h":46220,"strategy_points_24h":10},"SpaceAgeMars":{"population":3800,"demandHappiness":3800,"supplies_24h":74820,"strategy_points_24h":10},"SpaceAgeAsteroidBelt":{"population":4130,"demandHappiness":4130,"supplies_24h":80300,"strategy_points_24h":10},"SpaceAgeVenus":{"population":4460,"demandHappiness":4460,"supplies_24h":86080,"strategy_points_24h":10},"SpaceAgeJupiterMoon":{"population":4800,"demandHappiness":4800,"supplies_24h":91570,"strategy_points_24h":10},"SpaceAgeTitan":{"population":5150,"demandHappiness":5150,"supplies_24h":97350,"strategy_points_24h":10},"SpaceAgeSpaceHub":{"population":5500,"demandHappiness":5500,"supplies_24h":103130,"strategy_points_24h":10}}, boosts: [{"type":"def_boost_defender","value":9,"feature":"battleground"}] },
+    "W_MultiAge_SUM25A10": { prod: {"BronzeAge":{"population":450,"demandHappiness":450,"supplies_24h":2310,"strategy_points_24h":55},"IronAge":{"population":980,"demandHappiness":980,"supplies_24h":5550,"strategy_points_24h":55},"EarlyMiddleAge":{"population":1500,"demandHappiness":1500,"supplies_24h":9240,"strategy_points_24h":55},"HighMiddleAge":{"population":2100,"demandHappiness":2100,"supplies_24h":12940,"strategy_points_24h":55},"LateMiddleAge":{"population":2760,"demandHappiness":2760,"supplies_24h":17100,"strategy_points_24h":55},"ColonialAge":{"population":3480,"demandHappiness":3480,"supplies_24h":21720,"strategy_points_24h":55},"IndustrialAge":{"population":4260,"demandHappiness":4260,"supplies_24h":26340,"strategy_points_24h":55},"ProgressiveEra":{"population":5080,"demandHappiness":5080,"supplies_24h":30970,"strategy_points_24h":55},"ModernEra":{"population":5960,"demandHappiness":5960,"supplies_24h":36050,"strategy_points_24h":55},"PostModernEra":{"population":6870,"demandHappiness":6870,"supplies_24h":41130,"strategy_points_24h":55},"ContemporaryEra":{"population":7830,"demandHappiness":7830,"supplies_24h":46220,"strategy_points_24h":55},"TomorrowEra":{"population":8820,"demandHappiness":8820,"supplies_24h":51760,"strategy_points_24h":55},"FutureEra":{"population":9860,"demandHappiness":9860,"supplies_24h":56850,"strategy_points_24h":55},"ArcticFuture":{"population":10940,"demandHappiness":10940,"supplies_24h":62390,"strategy_points_24h":55},"OceanicFuture":{"population":12050,"demandHappiness":12050,"supplies_24h":68400,"strategy_points_24h":55},"VirtualFuture":{"population":13200,"demandHappiness":13200,"supplies_24h":73950,"strategy_points_24h":55},"SpaceAgeMars":{"population":20890,"demandHappiness":20890,"supplies_24h":119710,"strategy_points_24h":55},"SpaceAgeAsteroidBelt":{"population":22690,"demandHappiness":22690,"supplies_24h":128490,"strategy_points_24h":55},"SpaceAgeVenus":{"population":24530,"demandHappiness":24530,"supplies_24h":137730,"strategy_points_24h":55},"SpaceAgeJupiterMoon":{"population":26410,"demandHappiness":26410,"supplies_24h":146510,"strategy_points_24h":55},"SpaceAgeTitan":{"population":28330,"demandHappiness":28330,"supplies_24h":155760,"strategy_points_24h":55},"SpaceAgeSpaceHub":{"population":30250,"demandHappiness":30250,"supplies_24h":165000,"strategy_points_24h":55}}, boosts: [{"type":"def_boost_attacker","value":8,"feature":"guild_expedition"},{"type":"def_boost_defender","value":105,"feature":"battleground"}] },
+    "W_MultiAge_SUM25A11": { prod: {"BronzeAge":{"population":500,"demandHappiness":500,"supplies_24h":2410,"strategy_points_24h":60},"IronAge":{"population":1070,"demandHappiness":1070,"supplies_24h":5780,"strategy_points_24h":60},"EarlyMiddleAge":{"population":1630,"demandHappiness":1630,"supplies_24h":9630,"strategy_points_24h":60},"HighMiddleAge":{"population":2300,"demandHappiness":2300,"supplies_24h":13480,"strategy_points_24h":60},"LateMiddleAge":{"population":3010,"demandHappiness":3010,"supplies_24h":17810,"strategy_points_24h":60},"ColonialAge":{"population":3800,"demandHappiness":3800,"supplies_24h":22630,"strategy_points_24h":60},"IndustrialAge":{"population":4650,"demandHappiness":4650,"supplies_24h":27440,"strategy_points_24h":60},"ProgressiveEra":{"population":5550,"demandHappiness":5550,"supplies_24h":32260,"strategy_points_24h":60},"ModernEra":{"population":6500,"demandHappiness":6500,"supplies_24h":37550,"strategy_points_24h":60},"PostModernEra":{"population":7490,"demandHappiness":7490,"supplies_24h":42850,"strategy_points_24h":60},"ContemporaryEra":{"population":8540,"demandHappiness":8540,"supplies_24h":48140,"strategy_points_24h":60},"TomorrowEra":{"population":9620,"demandHappiness":9620,"supplies_24h":53920,"strategy_points_24h":60},"FutureEra":{"population":10760,"demandHappiness":10760,"supplies_24h":59220,"strategy_points_24h":60},"ArcticFuture":{"population":11940,"demandHappiness":11940,"supplies_24h":64990,"strategy_points_24h":60},"OceanicFuture":{"population":13150,"demandHappiness":13150,"supplies_24h":71250,"strategy_points_24h":60},"VirtualFuture":{"population":14400,"demandHappiness":14400,"supplies_24h":77030,"strategy_points_24h":60},"SpaceAgeMars":{"population":22790,"demandHappiness":22790,"supplies_24h":124690,"strategy_points_24h":60},"SpaceAgeAsteroidBelt":{"population":24750,"demandHappiness":24750,"supplies_24h":133840,"strategy_points_24h":60},"SpaceAgeVenus":{"population":26760,"demandHappiness":26760,"supplies_24h":143470,"strategy_points_24h":60},"SpaceAgeJupiterMoon":{"population":28810,"demandHappiness":28810,"supplies_24h":152620,"strategy_points_24h":60},"SpaceAgeTitan":{"population":30910,"demandHappiness":30910,"supplies_24h":162250,"strategy_points_24h":60},"SpaceAgeSpaceHub":{"population":33000,"demandHappiness":33000,"supplies_24h":171880,"strategy_points_24h":60}}, boosts: [{"type":"def_boost_attacker","value":27,"feature":"guild_expedition"},{"type":"def_boost_defender","value":125,"feature":"battleground"}] },
+    "W_MultiAge_SUM25A12": { prod: {"BronzeAge":{"population":540,"demandHappiness":540,"supplies_24h":2500,"strategy_points_24h":65},"IronAge":{"population":1150,"demandHappiness":1150,"supplies_24h":6010,"strategy_points_24h":65},"EarlyMiddleAge":{"population":1770,"demandHappiness":1770,"supplies_24h":10010,"strategy_points_24h":65},"HighMiddleAge":{"population":2490,"demandHappiness":2490,"supplies_24h":14020,"strategy_points_24h":65},"LateMiddleAge":{"population":3260,"demandHappiness":3260,"supplies_24h":18530,"strategy_points_24h":65},"ColonialAge":{"population":4120,"demandHappiness":4120,"supplies_24h":23530,"strategy_points_24h":65},"IndustrialAge":{"population":5030,"demandHappiness":5030,"supplies_24h":28540,"strategy_points_24h":65},"ProgressiveEra":{"population":6010,"demandHappiness":6010,"supplies_24h":33550,"strategy_points_24h":65},"ModernEra":{"population":7040,"demandHappiness":7040,"supplies_24h":39050,"strategy_points_24h":65},"PostModernEra":{"population":8120,"demandHappiness":8120,"supplies_24h":44560,"strategy_points_24h":65},"ContemporaryEra":{"population":9250,"demandHappiness":9250,"supplies_24h":50070,"strategy_points_24h":65},"TomorrowEra":{"population":10420,"demandHappiness":10420,"supplies_24h":56080,"strategy_points_24h":65},"FutureEra":{"population":11660,"demandHappiness":11660,"supplies_24h":61590,"strategy_points_24h":65},"ArcticFuture":{"population":12930,"demandHappiness":12930,"supplies_24h":67590,"strategy_points_24h":65},"OceanicFuture":{"population":14240,"demandHappiness":14240,"supplies_24h":74100,"strategy_points_24h":65},"VirtualFuture":{"population":15600,"demandHappiness":15600,"supplies_24h":80110,"strategy_points_24h":65},"SpaceAgeMars":{"population":24690,"demandHappiness":24690,"supplies_24h":129680,"strategy_points_24h":65},"SpaceAgeAsteroidBelt":{"population":26820,"demandHappiness":26820,"supplies_24h":139190,"strategy_points_24h":65},"SpaceAgeVenus":{"population":28990,"demandHappiness":28990,"supplies_24h":149210,"strategy_points_24h":65},"SpaceAgeJupiterMoon":{"population":31210,"demandHappiness":31210,"supplies_24h":158720,"strategy_points_24h":65},"SpaceAgeTitan":{"population":33480,"demandHappiness":33480,"supplies_24h":168740,"strategy_points_24h":65},"SpaceAgeSpaceHub":{"population":35750,"demandHappiness":35750,"supplies_24h":178750,"strategy_points_24h":65}}, boosts: [{"type":"def_boost_attacker","value":46,"feature":"guild_expedition"},{"type":"def_boost_defender","value":145,"feature":"battleground"}] },
+    "W_MultiAge_SUM25A13": { prod: {"BronzeAge":{"population":580,"demandHappiness":580,"supplies_24h":2600,"strategy_points_24h":70},"IronAge":{"population":1240,"demandHappiness":1240,"supplies_24h":6240,"strategy_points_24h":70},"EarlyMiddleAge":{"population":1910,"demandHappiness":1910,"supplies_24h":10400,"strategy_points_24h":70},"HighMiddleAge":{"population":2680,"demandHappiness":2680,"supplies_24h":14560,"strategy_points_24h":70},"LateMiddleAge":{"population":3510,"demandHappiness":3510,"supplies_24h":19240,"strategy_points_24h":70},"ColonialAge":{"population":4430,"demandHappiness":4430,"supplies_24h":24440,"strategy_points_24h":70},"IndustrialAge":{"population":5420,"demandHappiness":5420,"supplies_24h":29640,"strategy_points_24h":70},"ProgressiveEra":{"population":6470,"demandHappiness":6470,"supplies_24h":34840,"strategy_points_24h":70},"ModernEra":{"population":7580,"demandHappiness":7580,"supplies_24h":40560,"strategy_points_24h":70},"PostModernEra":{"population":8740,"demandHappiness":8740,"supplies_24h":46280,"strategy_points_24h":70},"ContemporaryEra":{"population":9960,"demandHappiness":9960,"supplies_24h":52000,"strategy_points_24h":70},"TomorrowEra":{"population":11230,"demandHappiness":11230,"supplies_24h":58240,"strategy_points_24h":70},"FutureEra":{"population":12550,"demandHappiness":12550,"supplies_24h":63950,"strategy_points_24h":70},"ArcticFuture":{"population":13930,"demandHappiness":13930,"supplies_24h":70190,"strategy_points_24h":70},"OceanicFuture":{"population":15340,"demandHappiness":15340,"supplies_24h":76950,"strategy_points_24h":70},"VirtualFuture":{"population":16800,"demandHappiness":16800,"supplies_24h":83190,"strategy_points_24h":70},"SpaceAgeMars":{"population":26590,"demandHappiness":26590,"supplies_24h":134670,"strategy_points_24h":70},"SpaceAgeAsteroidBelt":{"population":28880,"demandHappiness":28880,"supplies_24h":144550,"strategy_points_24h":70},"SpaceAgeVenus":{"population":31220,"demandHappiness":31220,"supplies_24h":154950,"strategy_points_24h":70},"SpaceAgeJupiterMoon":{"population":33620,"demandHappiness":33620,"supplies_24h":164830,"strategy_points_24h":70},"SpaceAgeTitan":{"population":36060,"demandHappiness":36060,"supplies_24h":175230,"strategy_points_24h":70},"SpaceAgeSpaceHub":{"population":38500,"demandHappiness":38500,"supplies_24h":185630,"strategy_points_24h":70}}, boosts: [{"type":"def_boost_attacker","value":65,"feature":"guild_expedition"},{"type":"def_boost_defender","value":165,"feature":"battleground"}] },
+    "W_MultiAge_SUM25A14": { prod: {"BronzeAge":{"population":620,"demandHappiness":620,"supplies_24h":2700,"strategy_points_24h":75},"IronAge":{"population":1330,"demandHappiness":1330,"supplies_24h":6470,"strategy_points_24h":75},"EarlyMiddleAge":{"population":2040,"demandHappiness":2040,"supplies_24h":10780,"strategy_points_24h":75},"HighMiddleAge":{"population":2870,"demandHappiness":2870,"supplies_24h":15100,"strategy_points_24h":75},"LateMiddleAge":{"population":3760,"demandHappiness":3760,"supplies_24h":19950,"strategy_points_24h":75},"ColonialAge":{"population":4750,"demandHappiness":4750,"supplies_24h":25340,"strategy_points_24h":75},"IndustrialAge":{"population":5810,"demandHappiness":5810,"supplies_24h":30740,"strategy_points_24h":75},"ProgressiveEra":{"population":6930,"demandHappiness":6930,"supplies_24h":36130,"strategy_points_24h":75},"ModernEra":{"population":8130,"demandHappiness":8130,"supplies_24h":42060,"strategy_points_24h":75},"PostModernEra":{"population":9370,"demandHappiness":9370,"supplies_24h":47990,"strategy_points_24h":75},"ContemporaryEra":{"population":10670,"demandHappiness":10670,"supplies_24h":53920,"strategy_points_24h":75},"TomorrowEra":{"population":12030,"demandHappiness":12030,"supplies_24h":60390,"strategy_points_24h":75},"FutureEra":{"population":13450,"demandHappiness":13450,"supplies_24h":66320,"strategy_points_24h":75},"ArcticFuture":{"population":14920,"demandHappiness":14920,"supplies_24h":72790,"strategy_points_24h":75},"OceanicFuture":{"population":16440,"demandHappiness":16440,"supplies_24h":79800,"strategy_points_24h":75},"VirtualFuture":{"population":18000,"demandHappiness":18000,"supplies_24h":86270,"strategy_points_24h":75},"SpaceAgeMars":{"population":28490,"demandHappiness":28490,"supplies_24h":139660,"strategy_points_24h":75},"SpaceAgeAsteroidBelt":{"population":30940,"demandHappiness":30940,"supplies_24h":149900,"strategy_points_24h":75},"SpaceAgeVenus":{"population":33450,"demandHappiness":33450,"supplies_24h":160690,"strategy_points_24h":75},"SpaceAgeJupiterMoon":{"population":36020,"demandHappiness":36020,"supplies_24h":170930,"strategy_points_24h":75},"SpaceAgeTitan":{"population":38630,"demandHappiness":38630,"supplies_24h":181720,"strategy_points_24h":75},"SpaceAgeSpaceHub":{"population":41250,"demandHappiness":41250,"supplies_24h":192500,"strategy_points_24h":75}}, boosts: [{"type":"def_boost_attacker","value":105,"feature":"guild_expedition"},{"type":"def_boost_defender","value":185,"feature":"battleground"}] },
+    "W_MultiAge_SUM25A15": { prod: {"BronzeAge":{"population":660,"demandHappiness":660,"supplies_24h":2790,"strategy_points_24h":80},"IronAge":{"population":1420,"demandHappiness":1420,"supplies_24h":6700,"strategy_points_24h":80},"EarlyMiddleAge":{"population":2180,"demandHappiness":2180,"supplies_24h":11170,"strategy_points_24h":80},"HighMiddleAge":{"population":3060,"demandHappiness":3060,"supplies_24h":15640,"strategy_points_24h":80},"LateMiddleAge":{"population":4020,"demandHappiness":4020,"supplies_24h":20660,"strategy_points_24h":80},"ColonialAge":{"population":5070,"demandHappiness":5070,"supplies_24h":26250,"strategy_points_24h":80},"IndustrialAge":{"population":6190,"demandHappiness":6190,"supplies_24h":31830,"strategy_points_24h":80},"ProgressiveEra":{"population":7390,"demandHappiness":7390,"supplies_24h":37420,"strategy_points_24h":80},"ModernEra":{"population":8670,"demandHappiness":8670,"supplies_24h":43560,"strategy_points_24h":80},"PostModernEra":{"population":9990,"demandHappiness":9990,"supplies_24h":49700,"strategy_points_24h":80},"ContemporaryEra":{"population":11390,"demandHappiness":11390,"supplies_24h":55850,"strategy_points_24h":80},"TomorrowEra":{"population":12830,"demandHappiness":12830,"supplies_24h":62550,"strategy_points_24h":80},"FutureEra":{"population":14350,"demandHappiness":14350,"supplies_24h":68690,"strategy_points_24h":80},"ArcticFuture":{"population":15920,"demandHappiness":15920,"supplies_24h":75390,"strategy_points_24h":80},"OceanicFuture":{"population":17530,"demandHappiness":17530,"supplies_24h":82650,"strategy_points_24h":80},"VirtualFuture":{"population":19200,"demandHappiness":19200,"supplies_24h":89360,"strategy_points_24h":80},"SpaceAgeMars":{"population":30390,"demandHappiness":30390,"supplies_24h":144640,"strategy_points_24h":80},"SpaceAgeAsteroidBelt":{"population":33010,"demandHappiness":33010,"supplies_24h":155260,"strategy_points_24h":80},"SpaceAgeVenus":{"population":35680,"demandHappiness":35680,"supplies_24h":166430,"strategy_points_24h":80},"SpaceAgeJupiterMoon":{"population":38420,"demandHappiness":38420,"supplies_24h":177040,"strategy_points_24h":80},"SpaceAgeTitan":{"population":41210,"demandHappiness":41210,"supplies_24h":188210,"strategy_points_24h":80},"SpaceAgeSpaceHub":{"population":44000,"demandHappiness":44000,"supplies_24h":199380,"strategy_points_24h":80}}, boosts: [{"type":"def_boost_attacker","value":145,"feature":"guild_expedition"},{"type":"def_boost_defender","value":205,"feature":"battleground"}] },
+    "W_MultiAge_SUM25A16": { prod: {"BronzeAge":{"population":700,"demandHappiness":700,"supplies_24h":2890,"strategy_points_24h":110},"IronAge":{"population":1510,"demandHappiness":1510,"supplies_24h":6930,"strategy_points_24h":110},"EarlyMiddleAge":{"population":2320,"demandHappiness":2320,"supplies_24h":11550,"strategy_points_24h":110},"HighMiddleAge":{"population":3250,"demandHappiness":3250,"supplies_24h":16180,"strategy_points_24h":110},"LateMiddleAge":{"population":4270,"demandHappiness":4270,"supplies_24h":21380,"strategy_points_24h":110},"ColonialAge":{"population":5390,"demandHappiness":5390,"supplies_24h":27150,"strategy_points_24h":110},"IndustrialAge":{"population":6580,"demandHappiness":6580,"supplies_24h":32930,"strategy_points_24h":110},"ProgressiveEra":{"population":7860,"demandHappiness":7860,"supplies_24h":38710,"strategy_points_24h":110},"ModernEra":{"population":9210,"demandHappiness":9210,"supplies_24h":45060,"strategy_points_24h":110},"PostModernEra":{"population":10610,"demandHappiness":10610,"supplies_24h":51420,"strategy_points_24h":110},"ContemporaryEra":{"population":12100,"demandHappiness":12100,"supplies_24h":57770,"strategy_points_24h":110},"TomorrowEra":{"population":13630,"demandHappiness":13630,"supplies_24h":64710,"strategy_points_24h":110},"FutureEra":{"population":15250,"demandHappiness":15250,"supplies_24h":71060,"strategy_points_24h":110},"ArcticFuture":{"population":16910,"demandHappiness":16910,"supplies_24h":77990,"strategy_points_24h":110},"OceanicFuture":{"population":18630,"demandHappiness":18630,"supplies_24h":85500,"strategy_points_24h":110},"VirtualFuture":{"population":20400,"demandHappiness":20400,"supplies_24h":92440,"strategy_points_24h":110},"SpaceAgeMars":{"population":32290,"demandHappiness":32290,"supplies_24h":149630,"strategy_points_24h":110},"SpaceAgeAsteroidBelt":{"population":35070,"demandHappiness":35070,"supplies_24h":160610,"strategy_points_24h":110},"SpaceAgeVenus":{"population":37900,"demandHappiness":37900,"supplies_24h":172160,"strategy_points_24h":110},"SpaceAgeJupiterMoon":{"population":40820,"demandHappiness":40820,"supplies_24h":183140,"strategy_points_24h":110},"SpaceAgeTitan":{"population":43780,"demandHappiness":43780,"supplies_24h":194700,"strategy_points_24h":110},"SpaceAgeSpaceHub":{"population":46750,"demandHappiness":46750,"supplies_24h":206250,"strategy_points_24h":110}}, boosts: [{"type":"def_boost_attacker","value":185,"feature":"guild_expedition"},{"type":"def_boost_defender","value":225,"feature":"battleground"}] },
+    "W_MultiAge_SUM25A2": { prod: {"BronzeAge":{"population":120,"demandHappiness":120,"supplies_24h":1540,"strategy_points_24h":15},"IronAge":{"population":270,"demandHappiness":270,"supplies_24h":3700,"strategy_points_24h":15},"EarlyMiddleAge":{"population":410,"demandHappiness":410,"supplies_24h":6160,"strategy_points_24h":15},"HighMiddleAge":{"population":570,"demandHappiness":570,"supplies_24h":8630,"strategy_points_24h":15},"LateMiddleAge":{"population":750,"demandHappiness":750,"supplies_24h":11400,"strategy_points_24h":15},"ColonialAge":{"population":950,"demandHappiness":950,"supplies_24h":14480,"strategy_points_24h":15},"IndustrialAge":{"population":1160,"demandHappiness":1160,"supplies_24h":17560,"strategy_points_24h":15},"ProgressiveEra":{"population":1390,"demandHappiness":1390,"supplies_24h":20640,"strategy_points_24h":15},"ModernEra":{"population":1630,"demandHappiness":1630,"supplies_24h":24030,"strategy_points_24h":15},"PostModernEra":{"population":1870,"demandHappiness":1870,"supplies_24h":27420,"strategy_points_24h":15},"ContemporaryEra":{"population":2130,"demandHappiness":2130,"supplies_24h":30810,"strategy_points_24h":15},"TomorrowEra":{"population":2410,"demandHappiness":2410,"supplies_24h":34510,"strategy_points_24h":15},"FutureEra":{"population":2690,"demandHappiness":2690,"supplies_24h":37900,"strategy_points_24h":15},"ArcticFuture":{"population":2980,"demandHappiness":2980,"supplies_24h":41600,"strategy_points_24h":15},"OceanicFuture":{"population":3290,"demandHappiness":3290,"supplies_24h":45600,"strategy_points_24h":15},"VirtualFuture":{"population":3600,"demandHappiness":3600,"supplies_24h":49300,"strategy_points_24h":15},"SpaceAgeMars":{"population":5700,"demandHappiness":5700,"supplies_24h":79800,"strategy_points_24h":15},"SpaceAgeAsteroidBelt":{"population":6190,"demandHappiness":6190,"supplies_24h":85660,"strategy_points_24h":15},"SpaceAgeVenus":{"population":6690,"demandHappiness":6690,"supplies_24h":91820,"strategy_points_24h":15},"SpaceAgeJupiterMoon":{"population":7200,"demandHappiness":7200,"supplies_24h":97680,"strategy_points_24h":15},"SpaceAgeTitan":{"population":7730,"demandHappiness":7730,"supplies_24h":103840,"strategy_points_24h":15},"SpaceAgeSpaceHub":{"population":8250,"demandHappiness":8250,"supplies_24h":110000,"strategy_points_24h":15}}, boosts: [{"type":"def_boost_defender","value":18,"feature":"battleground"}] },
+    "W_MultiAge_SUM25A3": { prod: {"BronzeAge":{"population":170,"demandHappiness":170,"supplies_24h":1640,"strategy_points_24h":20},"IronAge":{"population":360,"demandHappiness":360,"supplies_24h":3930,"strategy_points_24h":20},"EarlyMiddleAge":{"population":540,"demandHappiness":540,"supplies_24h":6550,"strategy_points_24h":20},"HighMiddleAge":{"population":770,"demandHappiness":770,"supplies_24h":9170,"strategy_points_24h":20},"LateMiddleAge":{"population":1000,"demandHappiness":1000,"supplies_24h":12110,"strategy_points_24h":20},"ColonialAge":{"population":1270,"demandHappiness":1270,"supplies_24h":15390,"strategy_points_24h":20},"IndustrialAge":{"population":1550,"demandHappiness":1550,"supplies_24h":18660,"strategy_points_24h":20},"ProgressiveEra":{"population":1850,"demandHappiness":1850,"supplies_24h":21930,"strategy_points_24h":20},"ModernEra":{"population":2170,"demandHappiness":2170,"supplies_24h":25540,"strategy_points_24h":20},"PostModernEra":{"population":2500,"demandHappiness":2500,"supplies_24h":29140,"strategy_points_24h":20},"ContemporaryEra":{"population":2850,"demandHappiness":2850,"supplies_24h":32740,"strategy_points_24h":20},"TomorrowEra":{"population":3210,"demandHappiness":3210,"supplies_24h":36670,"strategy_points_24h":20},"FutureEra":{"population":3590,"demandHappiness":3590,"supplies_24h":40270,"strategy_points_24h":20},"ArcticFuture":{"population":3980,"demandHappiness":3980,"supplies_24h":44200,"strategy_points_24h":20},"OceanicFuture":{"population":4380,"demandHappiness":4380,"supplies_24h":48450,"strategy_points_24h":20},"VirtualFuture":{"population":4800,"demandHappiness":4800,"supplies_24h":52380,"strategy_points_24h":20},"SpaceAgeMars":{"population":7600,"demandHappiness":7600,"supplies_24h":84790,"strategy_points_24h":20},"SpaceAgeAsteroidBelt":{"population":8250,"demandHappiness":8250,"supplies_24h":91010,"strategy_points_24h":20},"SpaceAgeVenus":{"population":8920,"demandHappiness":8920,"supplies_24h":97560,"strategy_points_24h":20},"SpaceAgeJupiterMoon":{"population":9600,"demandHappiness":9600,"supplies_24h":103780,"strategy_points_24h":20},"SpaceAgeTitan":{"population":10300,"demandHappiness":10300,"supplies_24h":110330,"strategy_points_24h":20},"SpaceAgeSpaceHub":{"population":11000,"demandHappiness":11000,"supplies_24h":116880,"strategy_points_24h":20}}, boosts: [{"type":"def_boost_defender","value":28,"feature":"battleground"}] },
+    "W_MultiAge_SUM25A4": { prod: {"BronzeAge":{"population":210,"demandHappiness":210,"supplies_24h":1730,"strategy_points_24h":25},"IronAge":{"population":440,"demandHappiness":440,"supplies_24h":4160,"strategy_points_24h":25},"EarlyMiddleAge":{"population":680,"demandHappiness":680,"supplies_24h":6930,"strategy_points_24h":25},"HighMiddleAge":{"population":960,"demandHappiness":960,"supplies_24h":9710,"strategy_points_24h":25},"LateMiddleAge":{"population":1250,"demandHappiness":1250,"supplies_24h":12830,"strategy_points_24h":25},"ColonialAge":{"population":1580,"demandHappiness":1580,"supplies_24h":16290,"strategy_points_24h":25},"IndustrialAge":{"population":1940,"demandHappiness":1940,"supplies_24h":19760,"strategy_points_24h":25},"ProgressiveEra":{"population":2310,"demandHappiness":2310,"supplies_24h":23220,"strategy_points_24h":25},"ModernEra":{"population":2710,"demandHappiness":2710,"supplies_24h":27040,"strategy_points_24h":25},"PostModernEra":{"population":3120,"demandHappiness":3120,"supplies_24h":30850,"strategy_points_24h":25},"ContemporaryEra":{"population":3560,"demandHappiness":3560,"supplies_24h":34660,"strategy_points_24h":25},"TomorrowEra":{"population":4010,"demandHappiness":4010,"supplies_24h":38820,"strategy_points_24h":25},"FutureEra":{"population":4480,"demandHappiness":4480,"supplies_24h":42640,"strategy_points_24h":25},"ArcticFuture":{"population":4970,"demandHappiness":4970,"supplies_24h":46800,"strategy_points_24h":25},"OceanicFuture":{"population":5480,"demandHappiness":5480,"supplies_24h":51300,"strategy_points_24h":25},"VirtualFuture":{"population":6000,"demandHappiness":6000,"supplies_24h":55460,"strategy_points_24h":25},"SpaceAgeMars":{"population":9500,"demandHappiness":9500,"supplies_24h":89780,"strategy_points_24h":25},"SpaceAgeAsteroidBelt":{"population":10310,"demandHappiness":10310,"supplies_24h":96370,"strategy_points_24h":25},"SpaceAgeVenus":{"population":11150,"demandHappiness":11150,"supplies_24h":103300,"strategy_points_24h":25},"SpaceAgeJupiterMoon":{"population":12010,"demandHappiness":12010,"supplies_24h":109880,"strategy_points_24h":25},"SpaceAgeTitan":{"population":12880,"demandHappiness":12880,"supplies_24h":116820,"strategy_points_24h":25},"SpaceAgeSpaceHub":{"population":13750,"demandHappiness":13750,"supplies_24h":123750,"strategy_points_24h":25}}, boosts: [{"type":"def_boost_defender","value":37,"feature":"battleground"}] },
+    "W_MultiAge_SUM25A5": { prod: {"BronzeAge":{"population":250,"demandHappiness":250,"supplies_24h":1830,"strategy_points_24h":30},"IronAge":{"population":530,"demandHappiness":530,"supplies_24h":4390,"strategy_points_24h":30},"EarlyMiddleAge":{"population":820,"demandHappiness":820,"supplies_24h":7320,"strategy_points_24h":30},"HighMiddleAge":{"population":1150,"demandHappiness":1150,"supplies_24h":10250,"strategy_points_24h":30},"LateMiddleAge":{"population":1510,"demandHappiness":1510,"supplies_24h":13540,"strategy_points_24h":30},"ColonialAge":{"population":1900,"demandHappiness":1900,"supplies_24h":17200,"strategy_points_24h":30},"IndustrialAge":{"population":2320,"demandHappiness":2320,"supplies_24h":20860,"strategy_points_24h":30},"ProgressiveEra":{"population":2770,"demandHappiness":2770,"supplies_24h":24520,"strategy_points_24h":30},"ModernEra":{"population":3250,"demandHappiness":3250,"supplies_24h":28540,"strategy_points_24h":30},"PostModernEra":{"population":3750,"demandHappiness":3750,"supplies_24h":32560,"strategy_points_24h":30},"ContemporaryEra":{"population":4270,"demandHappiness":4270,"supplies_24h":36590,"strategy_points_24h":30},"TomorrowEra":{"population":4810,"demandHappiness":4810,"supplies_24h":40980,"strategy_points_24h":30},"FutureEra":{"population":5380,"demandHappiness":5380,"supplies_24h":45010,"strategy_points_24h":30},"ArcticFuture":{"population":5970,"demandHappiness":5970,"supplies_24h":49400,"strategy_points_24h":30},"OceanicFuture":{"population":6570,"demandHappiness":6570,"supplies_24h":54150,"strategy_points_24h":30},"VirtualFuture":{"population":7200,"demandHappiness":7200,"supplies_24h":58540,"strategy_points_24h":30},"SpaceAgeMars":{"population":11390,"demandHappiness":11390,"supplies_24h":94770,"strategy_points_24h":30},"SpaceAgeAsteroidBelt":{"population":12380,"demandHappiness":12380,"supplies_24h":101720,"strategy_points_24h":30},"SpaceAgeVenus":{"population":13380,"demandHappiness":13380,"supplies_24h":109040,"strategy_points_24h":30},"SpaceAgeJupiterMoon":{"population":14410,"demandHappiness":14410,"supplies_24h":115990,"strategy_points_24h":30},"SpaceAgeTitan":{"population":15450,"demandHappiness":15450,"supplies_24h":123310,"strategy_points_24h":30},"SpaceAgeSpaceHub":{"population":16500,"demandHappiness":16500,"supplies_24h":130630,"strategy_points_24h":30}}, boosts: [{"type":"def_boost_defender","value":47,"feature":"battleground"}] },
+    "W_MultiAge_SUM25A6": { prod: {"BronzeAge":{"population":290,"demandHappiness":290,"supplies_24h":1930,"strategy_points_24h":35},"IronAge":{"population":620,"demandHappiness":620,"supplies_24h":4620,"strategy_points_24h":35},"EarlyMiddleAge":{"population":950,"demandHappiness":950,"supplies_24h":7700,"strategy_points_24h":35},"HighMiddleAge":{"population":1340,"demandHappiness":1340,"supplies_24h":10780,"strategy_points_24h":35},"LateMiddleAge":{"population":1760,"demandHappiness":1760,"supplies_24h":14250,"strategy_points_24h":35},"ColonialAge":{"population":2220,"demandHappiness":2220,"supplies_24h":18100,"strategy_points_24h":35},"IndustrialAge":{"population":2710,"demandHappiness":2710,"supplies_24h":21950,"strategy_points_24h":35},"ProgressiveEra":{"population":3240,"demandHappiness":3240,"supplies_24h":25810,"strategy_points_24h":35},"ModernEra":{"population":3790,"demandHappiness":3790,"supplies_24h":30040,"strategy_points_24h":35},"PostModernEra":{"population":4370,"demandHappiness":4370,"supplies_24h":34280,"strategy_points_24h":35},"ContemporaryEra":{"population":4980,"demandHappiness":4980,"supplies_24h":38520,"strategy_points_24h":35},"TomorrowEra":{"population":5610,"demandHappiness":5610,"supplies_24h":43140,"strategy_points_24h":35},"FutureEra":{"population":6280,"demandHappiness":6280,"supplies_24h":47370,"strategy_points_24h":35},"ArcticFuture":{"population":6960,"demandHappiness":6960,"supplies_24h":52000,"strategy_points_24h":35},"OceanicFuture":{"population":7670,"demandHappiness":7670,"supplies_24h":57000,"strategy_points_24h":35},"VirtualFuture":{"population":8400,"demandHappiness":8400,"supplies_24h":61620,"strategy_points_24h":35},"SpaceAgeMars":{"population":13290,"demandHappiness":13290,"supplies_24h":99750,"strategy_points_24h":35},"SpaceAgeAsteroidBelt":{"population":14440,"demandHappiness":14440,"supplies_24h":107070,"strategy_points_24h":35},"SpaceAgeVenus":{"population":15610,"demandHappiness":15610,"supplies_24h":114780,"strategy_points_24h":35},"SpaceAgeJupiterMoon":{"population":16810,"demandHappiness":16810,"supplies_24h":122090,"strategy_points_24h":35},"SpaceAgeTitan":{"population":18030,"demandHappiness":18030,"supplies_24h":129800,"strategy_points_24h":35},"SpaceAgeSpaceHub":{"population":19250,"demandHappiness":19250,"supplies_24h":137500,"strategy_points_24h":35}}, boosts: [{"type":"def_boost_defender","value":56,"feature":"battleground"}] },
+    "W_MultiAge_SUM25A7": { prod: {"BronzeAge":{"population":330,"demandHappiness":330,"supplies_24h":2020,"strategy_points_24h":40},"IronAge":{"population":710,"demandHappiness":710,"supplies_24h":4850,"strategy_points_24h":40},"EarlyMiddleAge":{"population":1090,"demandHappiness":1090,"supplies_24h":8090,"strategy_points_24h":40},"HighMiddleAge":{"population":1530,"demandHappiness":1530,"supplies_24h":11320,"strategy_points_24h":40},"LateMiddleAge":{"population":2010,"demandHappiness":2010,"supplies_24h":14960,"strategy_points_24h":40},"ColonialAge":{"population":2530,"demandHappiness":2530,"supplies_24h":19010,"strategy_points_24h":40},"IndustrialAge":{"population":3100,"demandHappiness":3100,"supplies_24h":23050,"strategy_points_24h":40},"ProgressiveEra":{"population":3700,"demandHappiness":3700,"supplies_24h":27100,"strategy_points_24h":40},"ModernEra":{"population":4330,"demandHappiness":4330,"supplies_24h":31540,"strategy_points_24h":40},"PostModernEra":{"population":4990,"demandHappiness":4990,"supplies_24h":35990,"strategy_points_24h":40},"ContemporaryEra":{"population":5690,"demandHappiness":5690,"supplies_24h":40440,"strategy_points_24h":40},"TomorrowEra":{"population":6420,"demandHappiness":6420,"supplies_24h":45290,"strategy_points_24h":40},"FutureEra":{"population":7170,"demandHappiness":7170,"supplies_24h":49740,"strategy_points_24h":40},"ArcticFuture":{"population":7960,"demandHappiness":7960,"supplies_24h":54600,"strategy_points_24h":40},"OceanicFuture":{"population":8770,"demandHappiness":8770,"supplies_24h":59850,"strategy_points_24h":40},"VirtualFuture":{"population":9600,"demandHappiness":9600,"supplies_24h":64710,"strategy_points_24h":40},"SpaceAgeMars":{"population":15190,"demandHappiness":15190,"supplies_24h":104740,"strategy_points_24h":40},"SpaceAgeAsteroidBelt":{"population":16500,"demandHappiness":16500,"supplies_24h":112430,"strategy_points_24h":40},"SpaceAgeVenus":{"population":17840,"demandHappiness":17840,"supplies_24h":120510,"strategy_points_24h":40},"SpaceAgeJupiterMoon":{"population":19210,"demandHappiness":19210,"supplies_24h":128200,"strategy_points_24h":40},"SpaceAgeTitan":{"population":20600,"demandHappiness":20600,"supplies_24h":136290,"strategy_points_24h":40},"SpaceAgeSpaceHub":{"population":22000,"demandHappiness":22000,"supplies_24h":144380,"strategy_points_24h":40}}, boosts: [{"type":"def_boost_defender","value":66,"feature":"battleground"}] },
+    "W_MultiAge_SUM25A8": { prod: {"BronzeAge":{"population":370,"demandHappiness":370,"supplies_24h":2120,"strategy_points_24h":45},"IronAge":{"population":800,"demandHappiness":800,"supplies_24h":5080,"strategy_points_24h":45},"EarlyMiddleAge":{"population":1230,"demandHappiness":1230,"supplies_24h":8470,"strategy_points_24h":45},"HighMiddleAge":{"population":1720,"demandHappiness":1720,"supplies_24h":11860,"strategy_points_24h":45},"LateMiddleAge":{"population":2260,"demandHappiness":2260,"supplies_24h":15680,"strategy_points_24h":45},"ColonialAge":{"population":2850,"demandHappiness":2850,"supplies_24h":19910,"strategy_points_24h":45},"IndustrialAge":{"population":3480,"demandHappiness":3480,"supplies_24h":24150,"strategy_points_24h":45},"ProgressiveEra":{"population":4160,"demandHappiness":4160,"supplies_24h":28390,"strategy_points_24h":45},"ModernEra":{"population":4880,"demandHappiness":4880,"supplies_24h":33050,"strategy_points_24h":45},"PostModernEra":{"population":5620,"demandHappiness":5620,"supplies_24h":37710,"strategy_points_24h":45},"ContemporaryEra":{"population":6400,"demandHappiness":6400,"supplies_24h":42370,"strategy_points_24h":45},"TomorrowEra":{"population":7220,"demandHappiness":7220,"supplies_24h":47450,"strategy_points_24h":45},"FutureEra":{"population":8070,"demandHappiness":8070,"supplies_24h":52110,"strategy_points_24h":45},"ArcticFuture":{"population":8950,"demandHappiness":8950,"supplies_24h":57200,"strategy_points_24h":45},"OceanicFuture":{"population":9860,"demandHappiness":9860,"supplies_24h":62700,"strategy_points_24h":45},"VirtualFuture":{"population":10800,"demandHappiness":10800,"supplies_24h":67790,"strategy_points_24h":45},"SpaceAgeMars":{"population":17090,"demandHappiness":17090,"supplies_24h":109730,"strategy_points_24h":45},"SpaceAgeAsteroidBelt":{"population":18570,"demandHappiness":18570,"supplies_24h":117780,"strategy_points_24h":45},"SpaceAgeVenus":{"population":20070,"demandHappiness":20070,"supplies_24h":126250,"strategy_points_24h":45},"SpaceAgeJupiterMoon":{"population":21610,"demandHappiness":21610,"supplies_24h":134300,"strategy_points_24h":45},"SpaceAgeTitan":{"population":23180,"demandHappiness":23180,"supplies_24h":142780,"strategy_points_24h":45},"SpaceAgeSpaceHub":{"population":24750,"demandHappiness":24750,"supplies_24h":151250,"strategy_points_24h":45}}, boosts: [{"type":"def_boost_defender","value":75,"feature":"battleground"}] },
+    "W_MultiAge_SUM25A9": { prod: {"BronzeAge":{"population":410,"demandHappiness":410,"supplies_24h":2210,"strategy_points_24h":50},"IronAge":{"population":890,"demandHappiness":890,"supplies_24h":5320,"strategy_points_24h":50},"EarlyMiddleAge":{"population":1360,"demandHappiness":1360,"supplies_24h":8860,"strategy_points_24h":50},"HighMiddleAge":{"population":1910,"demandHappiness":1910,"supplies_24h":12400,"strategy_points_24h":50},"LateMiddleAge":{"population":2510,"demandHappiness":2510,"supplies_24h":16390,"strategy_points_24h":50},"ColonialAge":{"population":3170,"demandHappiness":3170,"supplies_24h":20820,"strategy_points_24h":50},"IndustrialAge":{"population":3870,"demandHappiness":3870,"supplies_24h":25250,"strategy_points_24h":50},"ProgressiveEra":{"population":4620,"demandHappiness":4620,"supplies_24h":29680,"strategy_points_24h":50},"ModernEra":{"population":5420,"demandHappiness":5420,"supplies_24h":34550,"strategy_points_24h":50},"PostModernEra":{"population":6240,"demandHappiness":6240,"supplies_24h":39420,"strategy_points_24h":50},"ContemporaryEra":{"population":7120,"demandHappiness":7120,"supplies_24h":44290,"strategy_points_24h":50},"TomorrowEra":{"population":8020,"demandHappiness":8020,"supplies_24h":49610,"strategy_points_24h":50},"FutureEra":{"population":8970,"demandHappiness":8970,"supplies_24h":54480,"strategy_points_24h":50},"ArcticFuture":{"population":9950,"demandHappiness":9950,"supplies_24h":59800,"strategy_points_24h":50},"OceanicFuture":{"population":10960,"demandHappiness":10960,"supplies_24h":65550,"strategy_points_24h":50},"VirtualFuture":{"population":12000,"demandHappiness":12000,"supplies_24h":70870,"strategy_points_24h":50},"SpaceAgeMars":{"population":18990,"demandHappiness":18990,"supplies_24h":114720,"strategy_points_24h":50},"SpaceAgeAsteroidBelt":{"population":20630,"demandHappiness":20630,"supplies_24h":123130,"strategy_points_24h":50},"SpaceAgeVenus":{"population":22300,"demandHappiness":22300,"supplies_24h":131990,"strategy_points_24h":50},"SpaceAgeJupiterMoon":{"population":24010,"demandHappiness":24010,"supplies_24h":140410,"strategy_points_24h":50},"SpaceAgeTitan":{"population":25760,"demandHappiness":25760,"supplies_24h":149270,"strategy_points_24h":50},"SpaceAgeSpaceHub":{"population":27500,"demandHappiness":27500,"supplies_24h":158130,"strategy_points_24h":50}}, boosts: [{"type":"def_boost_attacker","value":4,"feature":"guild_expedition"},{"type":"def_boost_defender","value":85,"feature":"battleground"}] },
+    "W_MultiAge_SummerBonus22Buccaneer": { prod: {"BronzeAge":{"population":162,"happiness":882,"demandHappiness":162,"money_24h":1100,"medals_24h":28,"random_good_of_age_24h":20},"IronAge":{"population":348,"happiness":1588,"demandHappiness":348,"money_24h":2700,"medals_24h":35,"random_good_of_age_24h":20},"EarlyMiddleAge":{"population":534,"happiness":1904,"demandHappiness":534,"money_24h":4500,"medals_24h":43,"random_good_of_age_24h":20},"HighMiddleAge":{"population":750,"happiness":2280,"demandHappiness":750,"money_24h":6300,"medals_24h":51,"random_good_of_age_24h":20},"LateMiddleAge":{"population":984,"happiness":2694,"demandHappiness":984,"money_24h":8300,"medals_24h":59,"random_good_of_age_24h":20},"ColonialAge":{"population":1242,"happiness":3252,"demandHappiness":1242,"money_24h":12600,"medals_24h":70,"random_good_of_age_24h":20},"IndustrialAge":{"population":1518,"happiness":3788,"demandHappiness":1518,"money_24h":15700,"medals_24h":98,"random_good_of_age_24h":20},"ProgressiveEra":{"population":1812,"happiness":4302,"demandHappiness":1812,"money_24h":19100,"medals_24h":136,"random_good_of_age_24h":20},"ModernEra":{"population":2124,"happiness":4784,"demandHappiness":2124,"money_24h":23700,"medals_24h":195,"random_good_of_age_24h":20},"PostModernEra":{"population":2448,"happiness":5218,"demandHappiness":2448,"money_24h":29900,"medals_24h":272,"random_good_of_age_24h":20},"ContemporaryEra":{"population":2790,"happiness":6010,"demandHappiness":2790,"money_24h":38900,"medals_24h":389,"random_good_of_age_24h":20},"TomorrowEra":{"population":3144,"happiness":7054,"demandHappiness":3144,"money_24h":45000,"medals_24h":525,"random_good_of_age_24h":20},"FutureEra":{"population":3516,"happiness":8206,"demandHappiness":3516,"money_24h":51600,"medals_24h":642,"random_good_of_age_24h":20},"ArcticFuture":{"population":3900,"happiness":9360,"demandHappiness":3900,"money_24h":58600,"medals_24h":778,"random_good_of_age_24h":20},"OceanicFuture":{"population":4296,"happiness":10596,"demandHappiness":4296,"money_24h":66100,"medals_24h":894,"random_good_of_age_24h":20},"VirtualFuture":{"population":4704,"happiness":12234,"demandHappiness":4704,"money_24h":74100,"medals_24h":1088,"random_good_of_age_24h":20},"SpaceAgeMars":{"population":7446,"happiness":19486,"demandHappiness":7446,"money_24h":123700,"medals_24h":1322,"random_good_of_age_24h":20},"SpaceAgeAsteroidBelt":{"population":8088,"happiness":21178,"demandHappiness":8088,"money_24h":137000,"medals_24h":1555,"random_good_of_age_24h":20},"SpaceAgeVenus":{"population":8742,"happiness":22882,"demandHappiness":8742,"money_24h":151100,"medals_24h":1788,"random_good_of_age_24h":20},"SpaceAgeJupiterMoon":{"population":9414,"happiness":24644,"demandHappiness":9414,"money_24h":165800,"medals_24h":2021,"random_good_of_age_24h":20},"SpaceAgeTitan":{"population":10138,"happiness":26543,"demandHappiness":10138,"money_24h":181931,"medals_24h":2285,"random_good_of_age_24h":20},"SpaceAgeSpaceHub":{"population":10862,"happiness":28442,"demandHappiness":10862,"money_24h":198062,"medals_24h":2549,"random_good_of_age_24h":20}}, boosts: [{"type":"def_boost_attacker","value":12,"feature":"all"},{"type":"att_boost_defender","value":12,"feature":"all"}] },
+    "W_MultiAge_SUM23A10": { prod: {"BronzeAge":{"population":160,"happiness":840,"demandHappiness":160,"money_24h":800,"strategy_points_24h":14,"random_good_of_age_24h":26},"IronAge":{"population":343,"happiness":1523,"demandHappiness":343,"money_24h":1900,"strategy_points_24h":14,"random_good_of_age_24h":26},"EarlyMiddleAge":{"population":527,"happiness":1837,"demandHappiness":527,"money_24h":3100,"strategy_points_24h":14,"random_good_of_age_24h":26},"HighMiddleAge":{"population":740,"happiness":2200,"demandHappiness":740,"money_24h":4400,"strategy_points_24h":14,"random_good_of_age_24h":26},"LateMiddleAge":{"population":971,"happiness":2591,"demandHappiness":971,"money_24h":5700,"strategy_points_24h":15,"random_good_of_age_24h":27},"ColonialAge":{"population":1225,"happiness":3135,"demandHappiness":1225,"money_24h":8800,"strategy_points_24h":15,"random_good_of_age_24h":27},"IndustrialAge":{"population":1498,"happiness":3648,"demandHappiness":1498,"money_24h":10900,"strategy_points_24h":15,"random_good_of_age_24h":27},"ProgressiveEra":{"population":1788,"happiness":4148,"demandHappiness":1788,"money_24h":13200,"strategy_points_24h":15,"random_good_of_age_24h":27},"ModernEra":{"population":2096,"happiness":4626,"demandHappiness":2096,"money_24h":16500,"strategy_points_24h":16,"random_good_of_age_24h":28},"PostModernEra":{"population":2415,"happiness":5055,"demandHappiness":2415,"money_24h":20700,"strategy_points_24h":16,"random_good_of_age_24h":28},"ContemporaryEra":{"population":2753,"happiness":5813,"demandHappiness":2753,"money_24h":26900,"strategy_points_24h":16,"random_good_of_age_24h":28},"TomorrowEra":{"population":3102,"happiness":6822,"demandHappiness":3102,"money_24h":31200,"strategy_points_24h":16,"random_good_of_age_24h":28},"FutureEra":{"population":3469,"happiness":7919,"demandHappiness":3469,"money_24h":35800,"strategy_points_24h":17,"random_good_of_age_24h":29},"ArcticFuture":{"population":3848,"happiness":9038,"demandHappiness":3848,"money_24h":40600,"strategy_points_24h":17,"random_good_of_age_24h":29},"OceanicFuture":{"population":4239,"happiness":10229,"demandHappiness":4239,"money_24h":45800,"strategy_points_24h":17,"random_good_of_age_24h":29},"VirtualFuture":{"population":4641,"happiness":11791,"demandHappiness":4641,"money_24h":51300,"strategy_points_24h":17,"random_good_of_age_24h":29},"SpaceAgeMars":{"population":7347,"happiness":18787,"demandHappiness":7347,"money_24h":85700,"strategy_points_24h":18,"random_good_of_age_24h":30},"SpaceAgeAsteroidBelt":{"population":7980,"happiness":20410,"demandHappiness":7980,"money_24h":94900,"strategy_points_24h":18,"random_good_of_age_24h":30},"SpaceAgeVenus":{"population":8625,"happiness":22055,"demandHappiness":8625,"money_24h":104700,"strategy_points_24h":18,"random_good_of_age_24h":30},"SpaceAgeJupiterMoon":{"population":9288,"happiness":23758,"demandHappiness":9288,"money_24h":114900,"strategy_points_24h":18,"random_good_of_age_24h":30},"SpaceAgeTitan":{"population":10002,"happiness":25593,"demandHappiness":10002,"money_24h":126094,"strategy_points_24h":19,"random_good_of_age_24h":31},"SpaceAgeSpaceHub":{"population":10716,"happiness":27428,"demandHappiness":10716,"money_24h":137288,"strategy_points_24h":19,"random_good_of_age_24h":31}}, boosts: [{"type":"att_boost_attacker","value":20,"feature":"all"},{"type":"def_boost_attacker","value":35,"feature":"all"},{"type":"att_boost_defender","value":36,"feature":"all"}] },
+    "W_MultiAge_SUM23E1": { boosts: [{"type":"def_boost_defender","value":1,"feature":"all"}] },
+    "W_MultiAge_SUM23D1": { prod: {"BronzeAge":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"IronAge":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"EarlyMiddleAge":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"HighMiddleAge":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"LateMiddleAge":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"ColonialAge":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"IndustrialAge":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"ProgressiveEra":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"ModernEra":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"PostModernEra":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"ContemporaryEra":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"TomorrowEra":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"FutureEra":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"ArcticFuture":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"OceanicFuture":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"VirtualFuture":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"SpaceAgeMars":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"SpaceAgeVenus":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"SpaceAgeTitan":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"random_good_of_age_24h":3,"random_good_of_previous_age_24h":2,"strategy_points_24h":1}}, boosts: [{"type":"def_boost_attacker","value":1,"feature":"all"}] },
+    "W_MultiAge_SUM23F1": { boosts: [{"type":"att_boost_defender","value":1,"feature":"all"}] },
+    "W_MultiAge_SUM25F4": { prod: {"BronzeAge":{"population":300,"demandHappiness":300,"money_24h":1710,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"IronAge":{"population":650,"demandHappiness":650,"money_24h":4100,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"EarlyMiddleAge":{"population":990,"demandHappiness":990,"money_24h":6830,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"HighMiddleAge":{"population":1390,"demandHappiness":1390,"money_24h":9560,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"LateMiddleAge":{"population":1830,"demandHappiness":1830,"money_24h":12640,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"ColonialAge":{"population":2300,"demandHappiness":2300,"money_24h":19250,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"IndustrialAge":{"population":2820,"demandHappiness":2820,"money_24h":23980,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"ProgressiveEra":{"population":3360,"demandHappiness":3360,"money_24h":29100,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"ModernEra":{"population":3940,"demandHappiness":3940,"money_24h":36210,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"PostModernEra":{"population":4540,"demandHappiness":4540,"money_24h":45550,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"ContemporaryEra":{"population":5180,"demandHappiness":5180,"money_24h":59300,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"TomorrowEra":{"population":5830,"demandHappiness":5830,"money_24h":68660,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"FutureEra":{"population":6520,"demandHappiness":6520,"money_24h":78700,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"ArcticFuture":{"population":7230,"demandHappiness":7230,"money_24h":89430,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"OceanicFuture":{"population":7970,"demandHappiness":7970,"money_24h":100840,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"VirtualFuture":{"population":8730,"demandHappiness":8730,"money_24h":112950,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"SpaceAgeMars":{"population":13810,"demandHappiness":13810,"money_24h":188660,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"SpaceAgeAsteroidBelt":{"population":15000,"demandHappiness":15000,"money_24h":208970,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"SpaceAgeVenus":{"population":16220,"demandHappiness":16220,"money_24h":230350,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"SpaceAgeJupiterMoon":{"population":17460,"demandHappiness":17460,"money_24h":252830,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"SpaceAgeTitan":{"population":18730,"demandHappiness":18730,"money_24h":276410,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70},"SpaceAgeSpaceHub":{"population":20000,"demandHappiness":20000,"money_24h":300000,"all_goods_of_age_24h":70,"all_goods_of_next_age_24h":70}}, boosts: [{"type":"att_def_boost_attacker","value":14,"feature":"battleground"},{"type":"att_def_boost_attacker","value":59,"feature":"guild_expedition"}] },
+    "W_MultiAge_SUM25F1": { prod: {"BronzeAge":{"population":210,"demandHappiness":210,"money_24h":850,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"IronAge":{"population":450,"demandHappiness":450,"money_24h":2050,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"EarlyMiddleAge":{"population":690,"demandHappiness":690,"money_24h":3420,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"HighMiddleAge":{"population":970,"demandHappiness":970,"money_24h":4780,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"LateMiddleAge":{"population":1280,"demandHappiness":1280,"money_24h":6320,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"ColonialAge":{"population":1610,"demandHappiness":1610,"money_24h":9620,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"IndustrialAge":{"population":1970,"demandHappiness":1970,"money_24h":11990,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"ProgressiveEra":{"population":2350,"demandHappiness":2350,"money_24h":14550,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"ModernEra":{"population":2760,"demandHappiness":2760,"money_24h":18100,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"PostModernEra":{"population":3180,"demandHappiness":3180,"money_24h":22780,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"ContemporaryEra":{"population":3620,"demandHappiness":3620,"money_24h":29650,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"TomorrowEra":{"population":4080,"demandHappiness":4080,"money_24h":34330,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"FutureEra":{"population":4570,"demandHappiness":4570,"money_24h":39350,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"ArcticFuture":{"population":5060,"demandHappiness":5060,"money_24h":44710,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"OceanicFuture":{"population":5580,"demandHappiness":5580,"money_24h":50420,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"VirtualFuture":{"population":6110,"demandHappiness":6110,"money_24h":56470,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"SpaceAgeMars":{"population":9670,"demandHappiness":9670,"money_24h":94330,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"SpaceAgeAsteroidBelt":{"population":10500,"demandHappiness":10500,"money_24h":104480,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"SpaceAgeVenus":{"population":11350,"demandHappiness":11350,"money_24h":115180,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"SpaceAgeJupiterMoon":{"population":12220,"demandHappiness":12220,"money_24h":126410,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"SpaceAgeTitan":{"population":13110,"demandHappiness":13110,"money_24h":138210,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40},"SpaceAgeSpaceHub":{"population":14000,"demandHappiness":14000,"money_24h":150000,"all_goods_of_age_24h":40,"all_goods_of_next_age_24h":40}}, boosts: [{"type":"att_def_boost_attacker","value":8,"feature":"battleground"},{"type":"att_def_boost_attacker","value":29,"feature":"guild_expedition"}] },
+    "W_MultiAge_SUM25F2": { prod: {"BronzeAge":{"population":240,"demandHappiness":240,"money_24h":1140,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"IronAge":{"population":520,"demandHappiness":520,"money_24h":2730,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"EarlyMiddleAge":{"population":790,"demandHappiness":790,"money_24h":4550,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"HighMiddleAge":{"population":1110,"demandHappiness":1110,"money_24h":6380,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"LateMiddleAge":{"population":1460,"demandHappiness":1460,"money_24h":8430,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"ColonialAge":{"population":1840,"demandHappiness":1840,"money_24h":12830,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"IndustrialAge":{"population":2250,"demandHappiness":2250,"money_24h":15990,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"ProgressiveEra":{"population":2690,"demandHappiness":2690,"money_24h":19400,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"ModernEra":{"population":3150,"demandHappiness":3150,"money_24h":24140,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"PostModernEra":{"population":3630,"demandHappiness":3630,"money_24h":30370,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"ContemporaryEra":{"population":4140,"demandHappiness":4140,"money_24h":39530,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"TomorrowEra":{"population":4670,"demandHappiness":4670,"money_24h":45770,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"FutureEra":{"population":5220,"demandHappiness":5220,"money_24h":52470,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"ArcticFuture":{"population":5790,"demandHappiness":5790,"money_24h":59620,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"OceanicFuture":{"population":6380,"demandHappiness":6380,"money_24h":67220,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"VirtualFuture":{"population":6980,"demandHappiness":6980,"money_24h":75300,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"SpaceAgeMars":{"population":11050,"demandHappiness":11050,"money_24h":125770,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"SpaceAgeAsteroidBelt":{"population":12000,"demandHappiness":12000,"money_24h":139310,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"SpaceAgeVenus":{"population":12970,"demandHappiness":12970,"money_24h":153570,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"SpaceAgeJupiterMoon":{"population":13970,"demandHappiness":13970,"money_24h":168550,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"SpaceAgeTitan":{"population":14980,"demandHappiness":14980,"money_24h":184280,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50},"SpaceAgeSpaceHub":{"population":16000,"demandHappiness":16000,"money_24h":200000,"all_goods_of_age_24h":50,"all_goods_of_next_age_24h":50}}, boosts: [{"type":"att_def_boost_attacker","value":10,"feature":"battleground"},{"type":"att_def_boost_attacker","value":39,"feature":"guild_expedition"}] },
+    "W_MultiAge_SUM24A1": { prod: {"BronzeAge":{"population":20,"happiness":90,"demandHappiness":20,"money_24h":800,"strategy_points_24h":5},"IronAge":{"population":40,"happiness":150,"demandHappiness":40,"money_24h":1930,"strategy_points_24h":5},"EarlyMiddleAge":{"population":70,"happiness":160,"demandHappiness":70,"money_24h":3210,"strategy_points_24h":5},"HighMiddleAge":{"population":100,"happiness":180,"demandHappiness":100,"money_24h":4500,"strategy_points_24h":5},"LateMiddleAge":{"population":130,"happiness":200,"demandHappiness":130,"money_24h":5940,"strategy_points_24h":5},"ColonialAge":{"population":160,"happiness":240,"demandHappiness":160,"money_24h":9050,"strategy_points_24h":5},"IndustrialAge":{"population":200,"happiness":270,"demandHappiness":200,"money_24h":11280,"strategy_points_24h":5},"ProgressiveEra":{"population":230,"happiness":300,"demandHappiness":230,"money_24h":13690,"strategy_points_24h":5},"ModernEra":{"population":270,"happiness":320,"demandHappiness":270,"money_24h":17030,"strategy_points_24h":5},"PostModernEra":{"population":320,"happiness":330,"demandHappiness":320,"money_24h":21420,"strategy_points_24h":5},"ContemporaryEra":{"population":360,"happiness":380,"demandHappiness":360,"money_24h":27890,"strategy_points_24h":5},"TomorrowEra":{"population":400,"happiness":470,"demandHappiness":400,"money_24h":32290,"strategy_points_24h":5},"FutureEra":{"population":450,"happiness":560,"demandHappiness":450,"money_24h":37010,"strategy_points_24h":5},"ArcticFuture":{"population":500,"happiness":650,"demandHappiness":500,"money_24h":42060,"strategy_points_24h":5},"OceanicFuture":{"population":550,"happiness":750,"demandHappiness":550,"money_24h":47420,"strategy_points_24h":5},"VirtualFuture":{"population":610,"happiness":900,"demandHappiness":610,"money_24h":53120,"strategy_points_24h":5},"SpaceAgeMars":{"population":960,"happiness":1440,"demandHappiness":960,"money_24h":88730,"strategy_points_24h":5},"SpaceAgeAsteroidBelt":{"population":1040,"happiness":1560,"demandHappiness":1040,"money_24h":98280,"strategy_points_24h":5},"SpaceAgeVenus":{"population":1130,"happiness":1690,"demandHappiness":1130,"money_24h":108340,"strategy_points_24h":5},"SpaceAgeJupiterMoon":{"population":1210,"happiness":1820,"demandHappiness":1210,"money_24h":118910,"strategy_points_24h":5},"SpaceAgeTitan":{"population":1300,"happiness":1950,"demandHappiness":1300,"money_24h":130000,"strategy_points_24h":5},"SpaceAgeSpaceHub":{"population":1390,"happiness":2080,"demandHappiness":1390,"money_24h":141090,"strategy_points_24h":5}}, boosts: [{"type":"att_boost_attacker","value":2,"feature":"all"},{"type":"def_boost_attacker","value":7,"feature":"all"}] },
+    "W_MultiAge_SUM24A2": { prod: {"BronzeAge":{"population":40,"happiness":170,"demandHappiness":40,"money_24h":960,"strategy_points_24h":8},"IronAge":{"population":90,"happiness":300,"demandHappiness":90,"money_24h":2310,"strategy_points_24h":8},"EarlyMiddleAge":{"population":140,"happiness":330,"demandHappiness":140,"money_24h":3860,"strategy_points_24h":8},"HighMiddleAge":{"population":190,"happiness":370,"demandHappiness":190,"money_24h":5400,"strategy_points_24h":8},"LateMiddleAge":{"population":250,"happiness":410,"demandHappiness":250,"money_24h":7130,"strategy_points_24h":8},"ColonialAge":{"population":320,"happiness":480,"demandHappiness":320,"money_24h":10860,"strategy_points_24h":8},"IndustrialAge":{"population":390,"happiness":540,"demandHappiness":390,"money_24h":13530,"strategy_points_24h":8},"ProgressiveEra":{"population":470,"happiness":590,"demandHappiness":470,"money_24h":16430,"strategy_points_24h":8},"ModernEra":{"population":550,"happiness":640,"demandHappiness":550,"money_24h":20430,"strategy_points_24h":8},"PostModernEra":{"population":630,"happiness":660,"demandHappiness":630,"money_24h":25710,"strategy_points_24h":8},"ContemporaryEra":{"population":720,"happiness":770,"demandHappiness":720,"money_24h":33470,"strategy_points_24h":8},"TomorrowEra":{"population":810,"happiness":930,"demandHappiness":810,"money_24h":38750,"strategy_points_24h":8},"FutureEra":{"population":910,"happiness":1120,"demandHappiness":910,"money_24h":44420,"strategy_points_24h":8},"ArcticFuture":{"population":1000,"happiness":1300,"demandHappiness":1000,"money_24h":50470,"strategy_points_24h":8},"OceanicFuture":{"population":1110,"happiness":1500,"demandHappiness":1110,"money_24h":56910,"strategy_points_24h":8},"VirtualFuture":{"population":1210,"happiness":1800,"demandHappiness":1210,"money_24h":63740,"strategy_points_24h":8},"SpaceAgeMars":{"population":1920,"happiness":2880,"demandHappiness":1920,"money_24h":106470,"strategy_points_24h":8},"SpaceAgeAsteroidBelt":{"population":2080,"happiness":3120,"demandHappiness":2080,"money_24h":117930,"strategy_points_24h":8},"SpaceAgeVenus":{"population":2250,"happiness":3380,"demandHappiness":2250,"money_24h":130000,"strategy_points_24h":8},"SpaceAgeJupiterMoon":{"population":2420,"happiness":3640,"demandHappiness":2420,"money_24h":142690,"strategy_points_24h":8},"SpaceAgeTitan":{"population":2600,"happiness":3900,"demandHappiness":2600,"money_24h":156000,"strategy_points_24h":8},"SpaceAgeSpaceHub":{"population":2780,"happiness":4160,"demandHappiness":2780,"money_24h":169310,"strategy_points_24h":8}}, boosts: [{"type":"att_boost_attacker","value":3,"feature":"all"},{"type":"def_boost_attacker","value":9,"feature":"all"}] },
+    "W_MultiAge_SUM24A3": { prod: {"BronzeAge":{"population":80,"happiness":340,"demandHappiness":80,"money_24h":1120,"strategy_points_24h":11},"IronAge":{"population":180,"happiness":590,"demandHappiness":180,"money_24h":2700,"strategy_points_24h":11},"EarlyMiddleAge":{"population":270,"happiness":660,"demandHappiness":270,"money_24h":4500,"strategy_points_24h":11},"HighMiddleAge":{"population":390,"happiness":730,"demandHappiness":390,"money_24h":6300,"strategy_points_24h":11},"LateMiddleAge":{"population":510,"happiness":820,"demandHappiness":510,"money_24h":8320,"strategy_points_24h":11},"ColonialAge":{"population":640,"happiness":960,"demandHappiness":640,"money_24h":12670,"strategy_points_24h":11},"IndustrialAge":{"population":780,"happiness":1080,"demandHappiness":780,"money_24h":15790,"strategy_points_24h":11},"ProgressiveEra":{"population":930,"happiness":1190,"demandHappiness":930,"money_24h":19160,"strategy_points_24h":11},"ModernEra":{"population":1090,"happiness":1270,"demandHappiness":1090,"money_24h":23840,"strategy_points_24h":11},"PostModernEra":{"population":1260,"happiness":1320,"demandHappiness":1260,"money_24h":29990,"strategy_points_24h":11},"ContemporaryEra":{"population":1440,"happiness":1540,"demandHappiness":1440,"money_24h":39040,"strategy_points_24h":11},"TomorrowEra":{"population":1620,"happiness":1870,"demandHappiness":1620,"money_24h":45210,"strategy_points_24h":11},"FutureEra":{"population":1810,"happiness":2240,"demandHappiness":1810,"money_24h":51820,"strategy_points_24h":11},"ArcticFuture":{"population":2010,"happiness":2610,"demandHappiness":2010,"money_24h":58880,"strategy_points_24h":11},"OceanicFuture":{"population":2210,"happiness":3010,"demandHappiness":2210,"money_24h":66390,"strategy_points_24h":11},"VirtualFuture":{"population":2420,"happiness":3590,"demandHappiness":2420,"money_24h":74370,"strategy_points_24h":11},"SpaceAgeMars":{"population":3830,"happiness":5750,"demandHappiness":3830,"money_24h":124220,"strategy_points_24h":11},"SpaceAgeAsteroidBelt":{"population":4160,"happiness":6250,"demandHappiness":4160,"money_24h":137590,"strategy_points_24h":11},"SpaceAgeVenus":{"population":4500,"happiness":6750,"demandHappiness":4500,"money_24h":151670,"strategy_points_24h":11},"SpaceAgeJupiterMoon":{"population":4850,"happiness":7270,"demandHappiness":4850,"money_24h":166470,"strategy_points_24h":11},"SpaceAgeTitan":{"population":5200,"happiness":7800,"demandHappiness":5200,"money_24h":182000,"strategy_points_24h":11},"SpaceAgeSpaceHub":{"population":5550,"happiness":8330,"demandHappiness":5550,"money_24h":197530,"strategy_points_24h":11}}, boosts: [{"type":"att_boost_attacker","value":4,"feature":"all"},{"type":"def_boost_attacker","value":11,"feature":"all"},{"type":"coin_production","value":2,"feature":"all"}] },
+    "W_MultiAge_SUM24A4": { prod: {"BronzeAge":{"population":130,"happiness":520,"demandHappiness":130,"money_24h":1290,"strategy_points_24h":14,"random_good_of_age_24h":13},"IronAge":{"population":270,"happiness":890,"demandHappiness":270,"money_24h":3080,"strategy_points_24h":14,"random_good_of_age_24h":13},"EarlyMiddleAge":{"population":410,"happiness":980,"demandHappiness":410,"money_24h":5140,"strategy_points_24h":14,"random_good_of_age_24h":13},"HighMiddleAge":{"population":580,"happiness":1100,"demandHappiness":580,"money_24h":7200,"strategy_points_24h":14,"random_good_of_age_24h":13},"LateMiddleAge":{"population":760,"happiness":1220,"demandHappiness":760,"money_24h":9510,"strategy_points_24h":14,"random_good_of_age_24h":13},"ColonialAge":{"population":960,"happiness":1440,"demandHappiness":960,"money_24h":14480,"strategy_points_24h":14,"random_good_of_age_24h":13},"IndustrialAge":{"population":1170,"happiness":1620,"demandHappiness":1170,"money_24h":18040,"strategy_points_24h":14,"random_good_of_age_24h":13},"ProgressiveEra":{"population":1400,"happiness":1780,"demandHappiness":1400,"money_24h":21900,"strategy_points_24h":14,"random_good_of_age_24h":13},"ModernEra":{"population":1640,"happiness":1910,"demandHappiness":1640,"money_24h":27250,"strategy_points_24h":14,"random_good_of_age_24h":13},"PostModernEra":{"population":1890,"happiness":1990,"demandHappiness":1890,"money_24h":34280,"strategy_points_24h":14,"random_good_of_age_24h":13},"ContemporaryEra":{"population":2160,"happiness":2310,"demandHappiness":2160,"money_24h":44620,"strategy_points_24h":14,"random_good_of_age_24h":13},"TomorrowEra":{"population":2430,"happiness":2800,"demandHappiness":2430,"money_24h":51670,"strategy_points_24h":14,"random_good_of_age_24h":13},"FutureEra":{"population":2720,"happiness":3360,"demandHappiness":2720,"money_24h":59220,"strategy_points_24h":14,"random_good_of_age_24h":13},"ArcticFuture":{"population":3010,"happiness":3910,"demandHappiness":3010,"money_24h":67290,"strategy_points_24h":14,"random_good_of_age_24h":13},"OceanicFuture":{"population":3320,"happiness":4510,"demandHappiness":3320,"money_24h":75880,"strategy_points_24h":14,"random_good_of_age_24h":13},"VirtualFuture":{"population":3630,"happiness":5390,"demandHappiness":3630,"money_24h":84990,"strategy_points_24h":14,"random_good_of_age_24h":13},"SpaceAgeMars":{"population":5750,"happiness":8630,"demandHappiness":5750,"money_24h":141970,"strategy_points_24h":14,"random_good_of_age_24h":13},"SpaceAgeAsteroidBelt":{"population":6250,"happiness":9370,"demandHappiness":6250,"money_24h":157250,"strategy_points_24h":14,"random_good_of_age_24h":13},"SpaceAgeVenus":{"population":6750,"happiness":10130,"demandHappiness":6750,"money_24h":173340,"strategy_points_24h":14,"random_good_of_age_24h":13},"SpaceAgeJupiterMoon":{"population":7270,"happiness":10910,"demandHappiness":7270,"money_24h":190250,"strategy_points_24h":14,"random_good_of_age_24h":13},"SpaceAgeTitan":{"population":7800,"happiness":11700,"demandHappiness":7800,"money_24h":208000,"strategy_points_24h":14,"random_good_of_age_24h":13},"SpaceAgeSpaceHub":{"population":8330,"happiness":12490,"demandHappiness":8330,"money_24h":225750,"strategy_points_24h":14,"random_good_of_age_24h":13}}, boosts: [{"type":"att_boost_attacker","value":5,"feature":"all"},{"type":"def_boost_attacker","value":13,"feature":"all"},{"type":"coin_production","value":5,"feature":"all"}] },
+    "W_MultiAge_SUM24A5": { prod: {"BronzeAge":{"population":170,"happiness":690,"demandHappiness":170,"money_24h":1450,"strategy_points_24h":17,"random_good_of_age_24h":26},"IronAge":{"population":360,"happiness":1190,"demandHappiness":360,"money_24h":3470,"strategy_points_24h":17,"random_good_of_age_24h":26},"EarlyMiddleAge":{"population":550,"happiness":1310,"demandHappiness":550,"money_24h":5780,"strategy_points_24h":17,"random_good_of_age_24h":26},"HighMiddleAge":{"population":770,"happiness":1460,"demandHappiness":770,"money_24h":8100,"strategy_points_24h":17,"random_good_of_age_24h":26},"LateMiddleAge":{"population":1010,"happiness":1630,"demandHappiness":1010,"money_24h":10700,"strategy_points_24h":17,"random_good_of_age_24h":26},"ColonialAge":{"population":1280,"happiness":1920,"demandHappiness":1280,"money_24h":16290,"strategy_points_24h":17,"random_good_of_age_24h":26},"IndustrialAge":{"population":1560,"happiness":2160,"demandHappiness":1560,"money_24h":20300,"strategy_points_24h":17,"random_good_of_age_24h":26},"ProgressiveEra":{"population":1870,"happiness":2380,"demandHappiness":1870,"money_24h":24640,"strategy_points_24h":17,"random_good_of_age_24h":26},"ModernEra":{"population":2190,"happiness":2540,"demandHappiness":2190,"money_24h":30650,"strategy_points_24h":17,"random_good_of_age_24h":26},"PostModernEra":{"population":2520,"happiness":2650,"demandHappiness":2520,"money_24h":38560,"strategy_points_24h":17,"random_good_of_age_24h":26},"ContemporaryEra":{"population":2870,"happiness":3080,"demandHappiness":2870,"money_24h":50200,"strategy_points_24h":17,"random_good_of_age_24h":26},"TomorrowEra":{"population":3240,"happiness":3740,"demandHappiness":3240,"money_24h":58120,"strategy_points_24h":17,"random_good_of_age_24h":26},"FutureEra":{"population":3620,"happiness":4480,"demandHappiness":3620,"money_24h":66630,"strategy_points_24h":17,"random_good_of_age_24h":26},"ArcticFuture":{"population":4020,"happiness":5210,"demandHappiness":4020,"money_24h":75710,"strategy_points_24h":17,"random_good_of_age_24h":26},"OceanicFuture":{"population":4420,"happiness":6020,"demandHappiness":4420,"money_24h":85360,"strategy_points_24h":17,"random_good_of_age_24h":26},"VirtualFuture":{"population":4840,"happiness":7190,"demandHappiness":4840,"money_24h":95620,"strategy_points_24h":17,"random_good_of_age_24h":26},"SpaceAgeMars":{"population":7670,"happiness":11500,"demandHappiness":7670,"money_24h":159710,"strategy_points_24h":17,"random_good_of_age_24h":26},"SpaceAgeAsteroidBelt":{"population":8330,"happiness":12500,"demandHappiness":8330,"money_24h":176900,"strategy_points_24h":17,"random_good_of_age_24h":26},"SpaceAgeVenus":{"population":9000,"happiness":13500,"demandHappiness":9000,"money_24h":195000,"strategy_points_24h":17,"random_good_of_age_24h":26},"SpaceAgeJupiterMoon":{"population":9700,"happiness":14550,"demandHappiness":9700,"money_24h":214030,"strategy_points_24h":17,"random_good_of_age_24h":26},"SpaceAgeTitan":{"population":10400,"happiness":15600,"demandHappiness":10400,"money_24h":234000,"strategy_points_24h":17,"random_good_of_age_24h":26},"SpaceAgeSpaceHub":{"population":11100,"happiness":16650,"demandHappiness":11100,"money_24h":253970,"strategy_points_24h":17,"random_good_of_age_24h":26}}, boosts: [{"type":"att_boost_attacker","value":6,"feature":"all"},{"type":"def_boost_attacker","value":15,"feature":"all"},{"type":"coin_production","value":8,"feature":"all"}] },
+    "W_MultiAge_SUM24A6": { prod: {"BronzeAge":{"population":210,"happiness":860,"demandHappiness":210,"money_24h":1610,"strategy_points_24h":20,"random_good_of_age_24h":39},"IronAge":{"population":450,"happiness":1480,"demandHappiness":450,"money_24h":3860,"strategy_points_24h":20,"random_good_of_age_24h":39},"EarlyMiddleAge":{"population":690,"happiness":1640,"demandHappiness":690,"money_24h":6430,"strategy_points_24h":20,"random_good_of_age_24h":39},"HighMiddleAge":{"population":970,"happiness":1830,"demandHappiness":970,"money_24h":9000,"strategy_points_24h":20,"random_good_of_age_24h":39},"LateMiddleAge":{"population":1270,"happiness":2040,"demandHappiness":1270,"money_24h":11890,"strategy_points_24h":20,"random_good_of_age_24h":39},"ColonialAge":{"population":1600,"happiness":2400,"demandHappiness":1600,"money_24h":18110,"strategy_points_24h":20,"random_good_of_age_24h":39},"IndustrialAge":{"population":1950,"happiness":2710,"demandHappiness":1950,"money_24h":22560,"strategy_points_24h":20,"random_good_of_age_24h":39},"ProgressiveEra":{"population":2330,"happiness":2970,"demandHappiness":2330,"money_24h":27380,"strategy_points_24h":20,"random_good_of_age_24h":39},"ModernEra":{"population":2730,"happiness":3180,"demandHappiness":2730,"money_24h":34060,"strategy_points_24h":20,"random_good_of_age_24h":39},"PostModernEra":{"population":3150,"happiness":3310,"demandHappiness":3150,"money_24h":42850,"strategy_points_24h":20,"random_good_of_age_24h":39},"ContemporaryEra":{"population":3590,"happiness":3850,"demandHappiness":3590,"money_24h":55780,"strategy_points_24h":20,"random_good_of_age_24h":39},"TomorrowEra":{"population":4050,"happiness":4670,"demandHappiness":4050,"money_24h":64580,"strategy_points_24h":20,"random_good_of_age_24h":39},"FutureEra":{"population":4530,"happiness":5600,"demandHappiness":4530,"money_24h":74030,"strategy_points_24h":20,"random_good_of_age_24h":39},"ArcticFuture":{"population":5020,"happiness":6520,"demandHappiness":5020,"money_24h":84120,"strategy_points_24h":20,"random_good_of_age_24h":39},"OceanicFuture":{"population":5530,"happiness":7520,"demandHappiness":5530,"money_24h":94850,"strategy_points_24h":20,"random_good_of_age_24h":39},"VirtualFuture":{"population":6060,"happiness":8980,"demandHappiness":6060,"money_24h":106240,"strategy_points_24h":20,"random_good_of_age_24h":39},"SpaceAgeMars":{"population":9590,"happiness":14380,"demandHappiness":9590,"money_24h":177460,"strategy_points_24h":20,"random_good_of_age_24h":39},"SpaceAgeAsteroidBelt":{"population":10410,"happiness":15620,"demandHappiness":10410,"money_24h":196560,"strategy_points_24h":20,"random_good_of_age_24h":39},"SpaceAgeVenus":{"population":11250,"happiness":16880,"demandHappiness":11250,"money_24h":216670,"strategy_points_24h":20,"random_good_of_age_24h":39},"SpaceAgeJupiterMoon":{"population":12120,"happiness":18180,"demandHappiness":12120,"money_24h":237810,"strategy_points_24h":20,"random_good_of_age_24h":39},"SpaceAgeTitan":{"population":13000,"happiness":19500,"demandHappiness":13000,"money_24h":260000,"strategy_points_24h":20,"random_good_of_age_24h":39},"SpaceAgeSpaceHub":{"population":13880,"happiness":20820,"demandHappiness":13880,"money_24h":282190,"strategy_points_24h":20,"random_good_of_age_24h":39}}, boosts: [{"type":"att_boost_attacker","value":9,"feature":"all"},{"type":"def_boost_attacker","value":19,"feature":"all"},{"type":"coin_production","value":11,"feature":"all"}] },
+    "W_MultiAge_SUM24A7": { prod: {"BronzeAge":{"population":250,"happiness":1030,"demandHappiness":250,"money_24h":1770,"strategy_points_24h":23,"random_good_of_age_24h":52},"IronAge":{"population":540,"happiness":1780,"demandHappiness":540,"money_24h":4240,"strategy_points_24h":23,"random_good_of_age_24h":52},"EarlyMiddleAge":{"population":820,"happiness":1970,"demandHappiness":820,"money_24h":7070,"strategy_points_24h":23,"random_good_of_age_24h":52},"HighMiddleAge":{"population":1160,"happiness":2200,"demandHappiness":1160,"money_24h":9900,"strategy_points_24h":23,"random_good_of_age_24h":52},"LateMiddleAge":{"population":1520,"happiness":2450,"demandHappiness":1520,"money_24h":13080,"strategy_points_24h":23,"random_good_of_age_24h":52},"ColonialAge":{"population":1920,"happiness":2880,"demandHappiness":1920,"money_24h":19920,"strategy_points_24h":23,"random_good_of_age_24h":52},"IndustrialAge":{"population":2350,"happiness":3250,"demandHappiness":2350,"money_24h":24810,"strategy_points_24h":23,"random_good_of_age_24h":52},"ProgressiveEra":{"population":2800,"happiness":3570,"demandHappiness":2800,"money_24h":30110,"strategy_points_24h":23,"random_good_of_age_24h":52},"ModernEra":{"population":3280,"happiness":3810,"demandHappiness":3280,"money_24h":37460,"strategy_points_24h":23,"random_good_of_age_24h":52},"PostModernEra":{"population":3780,"happiness":3970,"demandHappiness":3780,"money_24h":47130,"strategy_points_24h":23,"random_good_of_age_24h":52},"ContemporaryEra":{"population":4310,"happiness":4620,"demandHappiness":4310,"money_24h":61360,"strategy_points_24h":23,"random_good_of_age_24h":52},"TomorrowEra":{"population":4860,"happiness":5610,"demandHappiness":4860,"money_24h":71040,"strategy_points_24h":23,"random_good_of_age_24h":52},"FutureEra":{"population":5430,"happiness":6720,"demandHappiness":5430,"money_24h":81430,"strategy_points_24h":23,"random_good_of_age_24h":52},"ArcticFuture":{"population":6020,"happiness":7820,"demandHappiness":6020,"money_24h":92530,"strategy_points_24h":23,"random_good_of_age_24h":52},"OceanicFuture":{"population":6640,"happiness":9030,"demandHappiness":6640,"money_24h":104330,"strategy_points_24h":23,"random_good_of_age_24h":52},"VirtualFuture":{"population":7270,"happiness":10780,"demandHappiness":7270,"money_24h":116860,"strategy_points_24h":23,"random_good_of_age_24h":52},"SpaceAgeMars":{"population":11500,"happiness":17250,"demandHappiness":11500,"money_24h":195200,"strategy_points_24h":23,"random_good_of_age_24h":52},"SpaceAgeAsteroidBelt":{"population":12490,"happiness":18750,"demandHappiness":12490,"money_24h":216210,"strategy_points_24h":23,"random_good_of_age_24h":52},"SpaceAgeVenus":{"population":13510,"happiness":20250,"demandHappiness":13510,"money_24h":238340,"strategy_points_24h":23,"random_good_of_age_24h":52},"SpaceAgeJupiterMoon":{"population":14540,"happiness":21820,"demandHappiness":14540,"money_24h":261600,"strategy_points_24h":23,"random_good_of_age_24h":52},"SpaceAgeTitan":{"population":15600,"happiness":23400,"demandHappiness":15600,"money_24h":286000,"strategy_points_24h":23,"random_good_of_age_24h":52},"SpaceAgeSpaceHub":{"population":16660,"happiness":24980,"demandHappiness":16660,"money_24h":310400,"strategy_points_24h":23,"random_good_of_age_24h":52}}, boosts: [{"type":"att_boost_attacker","value":12,"feature":"all"},{"type":"def_boost_attacker","value":23,"feature":"all"},{"type":"coin_production","value":14,"feature":"all"}] },
+    "W_MultiAge_SUM24A8": { prod: {"BronzeAge":{"population":290,"happiness":1200,"demandHappiness":290,"money_24h":1930,"strategy_points_24h":26,"random_good_of_age_24h":65},"IronAge":{"population":630,"happiness":2080,"demandHappiness":630,"money_24h":4630,"strategy_points_24h":26,"random_good_of_age_24h":65},"EarlyMiddleAge":{"population":960,"happiness":2300,"demandHappiness":960,"money_24h":7710,"strategy_points_24h":26,"random_good_of_age_24h":65},"HighMiddleAge":{"population":1350,"happiness":2560,"demandHappiness":1350,"money_24h":10800,"strategy_points_24h":26,"random_good_of_age_24h":65},"LateMiddleAge":{"population":1770,"happiness":2860,"demandHappiness":1770,"money_24h":14270,"strategy_points_24h":26,"random_good_of_age_24h":65},"ColonialAge":{"population":2240,"happiness":3360,"demandHappiness":2240,"money_24h":21730,"strategy_points_24h":26,"random_good_of_age_24h":65},"IndustrialAge":{"population":2740,"happiness":3790,"demandHappiness":2740,"money_24h":27070,"strategy_points_24h":26,"random_good_of_age_24h":65},"ProgressiveEra":{"population":3270,"happiness":4160,"demandHappiness":3270,"money_24h":32850,"strategy_points_24h":26,"random_good_of_age_24h":65},"ModernEra":{"population":3830,"happiness":4450,"demandHappiness":3830,"money_24h":40870,"strategy_points_24h":26,"random_good_of_age_24h":65},"PostModernEra":{"population":4410,"happiness":4640,"demandHappiness":4410,"money_24h":51420,"strategy_points_24h":26,"random_good_of_age_24h":65},"ContemporaryEra":{"population":5030,"happiness":5390,"demandHappiness":5030,"money_24h":66930,"strategy_points_24h":26,"random_good_of_age_24h":65},"TomorrowEra":{"population":5670,"happiness":6540,"demandHappiness":5670,"money_24h":77500,"strategy_points_24h":26,"random_good_of_age_24h":65},"FutureEra":{"population":6340,"happiness":7840,"demandHappiness":6340,"money_24h":88830,"strategy_points_24h":26,"random_good_of_age_24h":65},"ArcticFuture":{"population":7030,"happiness":9120,"demandHappiness":7030,"money_24h":100940,"strategy_points_24h":26,"random_good_of_age_24h":65},"OceanicFuture":{"population":7740,"happiness":10530,"demandHappiness":7740,"money_24h":113820,"strategy_points_24h":26,"random_good_of_age_24h":65},"VirtualFuture":{"population":8480,"happiness":12580,"demandHappiness":8480,"money_24h":127490,"strategy_points_24h":26,"random_good_of_age_24h":65},"SpaceAgeMars":{"population":13420,"happiness":20130,"demandHappiness":13420,"money_24h":212950,"strategy_points_24h":26,"random_good_of_age_24h":65},"SpaceAgeAsteroidBelt":{"population":14580,"happiness":21870,"demandHappiness":14580,"money_24h":235870,"strategy_points_24h":26,"random_good_of_age_24h":65},"SpaceAgeVenus":{"population":15760,"happiness":23630,"demandHappiness":15760,"money_24h":260010,"strategy_points_24h":26,"random_good_of_age_24h":65},"SpaceAgeJupiterMoon":{"population":16970,"happiness":25460,"demandHappiness":16970,"money_24h":285380,"strategy_points_24h":26,"random_good_of_age_24h":65},"SpaceAgeTitan":{"population":18200,"happiness":27300,"demandHappiness":18200,"money_24h":312000,"strategy_points_24h":26,"random_good_of_age_24h":65},"SpaceAgeSpaceHub":{"population":19430,"happiness":29140,"demandHappiness":19430,"money_24h":338620,"strategy_points_24h":26,"random_good_of_age_24h":65}}, boosts: [{"type":"att_boost_attacker","value":15,"feature":"all"},{"type":"def_boost_attacker","value":27,"feature":"all"},{"type":"coin_production","value":17,"feature":"all"}] },
+    "W_MultiAge_SUM24A9": { prod: {"BronzeAge":{"population":330,"happiness":1380,"demandHappiness":330,"money_24h":2090,"strategy_points_24h":29,"random_good_of_age_24h":78},"IronAge":{"population":720,"happiness":2370,"demandHappiness":720,"money_24h":5010,"strategy_points_24h":29,"random_good_of_age_24h":78},"EarlyMiddleAge":{"population":1100,"happiness":2620,"demandHappiness":1100,"money_24h":8350,"strategy_points_24h":29,"random_good_of_age_24h":78},"HighMiddleAge":{"population":1540,"happiness":2930,"demandHappiness":1540,"money_24h":11700,"strategy_points_24h":29,"random_good_of_age_24h":78},"LateMiddleAge":{"population":2030,"happiness":3260,"demandHappiness":2030,"money_24h":15450,"strategy_points_24h":29,"random_good_of_age_24h":78},"ColonialAge":{"population":2560,"happiness":3840,"demandHappiness":2560,"money_24h":23540,"strategy_points_24h":29,"random_good_of_age_24h":78},"IndustrialAge":{"population":3130,"happiness":4330,"demandHappiness":3130,"money_24h":29320,"strategy_points_24h":29,"random_good_of_age_24h":78},"ProgressiveEra":{"population":3730,"happiness":4750,"demandHappiness":3730,"money_24h":35590,"strategy_points_24h":29,"random_good_of_age_24h":78},"ModernEra":{"population":4380,"happiness":5090,"demandHappiness":4380,"money_24h":44280,"strategy_points_24h":29,"random_good_of_age_24h":78},"PostModernEra":{"population":5040,"happiness":5300,"demandHappiness":5040,"money_24h":55700,"strategy_points_24h":29,"random_good_of_age_24h":78},"ContemporaryEra":{"population":5750,"happiness":6160,"demandHappiness":5750,"money_24h":72510,"strategy_points_24h":29,"random_good_of_age_24h":78},"TomorrowEra":{"population":6480,"happiness":7470,"demandHappiness":6480,"money_24h":83960,"strategy_points_24h":29,"random_good_of_age_24h":78},"FutureEra":{"population":7240,"happiness":8950,"demandHappiness":7240,"money_24h":96240,"strategy_points_24h":29,"random_good_of_age_24h":78},"ArcticFuture":{"population":8030,"happiness":10430,"demandHappiness":8030,"money_24h":109350,"strategy_points_24h":29,"random_good_of_age_24h":78},"OceanicFuture":{"population":8850,"happiness":12030,"demandHappiness":8850,"money_24h":123300,"strategy_points_24h":29,"random_good_of_age_24h":78},"VirtualFuture":{"population":9690,"happiness":14380,"demandHappiness":9690,"money_24h":138110,"strategy_points_24h":29,"random_good_of_age_24h":78},"SpaceAgeMars":{"population":15340,"happiness":23000,"demandHappiness":15340,"money_24h":230690,"strategy_points_24h":29,"random_good_of_age_24h":78},"SpaceAgeAsteroidBelt":{"population":16660,"happiness":25000,"demandHappiness":16660,"money_24h":255530,"strategy_points_24h":29,"random_good_of_age_24h":78},"SpaceAgeVenus":{"population":18010,"happiness":27010,"demandHappiness":18010,"money_24h":281670,"strategy_points_24h":29,"random_good_of_age_24h":78},"SpaceAgeJupiterMoon":{"population":19390,"happiness":29090,"demandHappiness":19390,"money_24h":309160,"strategy_points_24h":29,"random_good_of_age_24h":78},"SpaceAgeTitan":{"population":20800,"happiness":31200,"demandHappiness":20800,"money_24h":338000,"strategy_points_24h":29,"random_good_of_age_24h":78},"SpaceAgeSpaceHub":{"population":22210,"happiness":33310,"demandHappiness":22210,"money_24h":366840,"strategy_points_24h":29,"random_good_of_age_24h":78}}, boosts: [{"type":"att_boost_attacker","value":18,"feature":"all"},{"type":"att_boost_attacker","value":1,"feature":"battleground"},{"type":"def_boost_attacker","value":31,"feature":"all"},{"type":"def_boost_attacker","value":7,"feature":"battleground"},{"type":"coin_production","value":20,"feature":"all"}] },
+    "W_MultiAge_SUM23B1": { prod: {"BronzeAge":{"strategy_points_24h":6},"IronAge":{"strategy_points_24h":6},"EarlyMiddleAge":{"strategy_points_24h":6},"HighMiddleAge":{"strategy_points_24h":6},"LateMiddleAge":{"strategy_points_24h":6},"ColonialAge":{"strategy_points_24h":6},"IndustrialAge":{"strategy_points_24h":7},"ProgressiveEra":{"strategy_points_24h":7},"ModernEra":{"strategy_points_24h":7},"PostModernEra":{"strategy_points_24h":7},"ContemporaryEra":{"strategy_points_24h":7},"TomorrowEra":{"strategy_points_24h":7},"FutureEra":{"strategy_points_24h":7},"ArcticFuture":{"strategy_points_24h":8},"OceanicFuture":{"strategy_points_24h":8},"VirtualFuture":{"strategy_points_24h":8},"SpaceAgeMars":{"strategy_points_24h":8},"SpaceAgeAsteroidBelt":{"strategy_points_24h":8},"SpaceAgeVenus":{"strategy_points_24h":8},"SpaceAgeJupiterMoon":{"strategy_points_24h":8},"SpaceAgeTitan":{"strategy_points_24h":9},"SpaceAgeSpaceHub":{"strategy_points_24h":9}}, boosts: [{"type":"att_boost_attacker","value":10,"feature":"all"}] },
+    "W_MultiAge_SUM24F1": { prod: {"BronzeAge":{"happiness":440,"supplies_24h":450,"all_goods_of_previous_age_24h":40},"IronAge":{"happiness":760,"supplies_24h":1070,"all_goods_of_previous_age_24h":40},"EarlyMiddleAge":{"happiness":840,"supplies_24h":1780,"all_goods_of_previous_age_24h":40},"HighMiddleAge":{"happiness":940,"supplies_24h":2490,"all_goods_of_previous_age_24h":40},"LateMiddleAge":{"happiness":1050,"supplies_24h":3290,"all_goods_of_previous_age_24h":40},"ColonialAge":{"happiness":1230,"supplies_24h":4180,"all_goods_of_previous_age_24h":40},"IndustrialAge":{"happiness":1390,"supplies_24h":5070,"all_goods_of_previous_age_24h":40},"ProgressiveEra":{"happiness":1520,"supplies_24h":5960,"all_goods_of_previous_age_24h":40},"ModernEra":{"happiness":1630,"supplies_24h":6940,"all_goods_of_previous_age_24h":40},"PostModernEra":{"happiness":1700,"supplies_24h":7920,"all_goods_of_previous_age_24h":40},"ContemporaryEra":{"happiness":1970,"supplies_24h":8900,"all_goods_of_previous_age_24h":40},"TomorrowEra":{"happiness":2400,"supplies_24h":9970,"all_goods_of_previous_age_24h":40},"FutureEra":{"happiness":2870,"supplies_24h":10950,"all_goods_of_previous_age_24h":40},"ArcticFuture":{"happiness":3340,"supplies_24h":12020,"all_goods_of_previous_age_24h":40},"OceanicFuture":{"happiness":3860,"supplies_24h":13180,"all_goods_of_previous_age_24h":40},"VirtualFuture":{"happiness":4610,"supplies_24h":14240,"all_goods_of_previous_age_24h":40},"SpaceAgeMars":{"happiness":7370,"supplies_24h":23060,"all_goods_of_previous_age_24h":40},"SpaceAgeAsteroidBelt":{"happiness":8010,"supplies_24h":24750,"all_goods_of_previous_age_24h":40},"SpaceAgeVenus":{"happiness":8660,"supplies_24h":26530,"all_goods_of_previous_age_24h":40},"SpaceAgeJupiterMoon":{"happiness":9320,"supplies_24h":28220,"all_goods_of_previous_age_24h":40},"SpaceAgeTitan":{"happiness":10000,"supplies_24h":30000,"all_goods_of_previous_age_24h":40},"SpaceAgeSpaceHub":{"happiness":10680,"supplies_24h":31780,"all_goods_of_previous_age_24h":40}}, boosts: [{"type":"att_boost_attacker","value":2,"feature":"guild_expedition"},{"type":"att_boost_defender","value":11,"feature":"guild_expedition"}] },
+    "W_MultiAge_SUM24F2": { prod: {"BronzeAge":{"happiness":440,"supplies_24h":450,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"IronAge":{"happiness":760,"supplies_24h":1070,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"EarlyMiddleAge":{"happiness":840,"supplies_24h":1780,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"HighMiddleAge":{"happiness":940,"supplies_24h":2490,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"LateMiddleAge":{"happiness":1050,"supplies_24h":3290,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"ColonialAge":{"happiness":1230,"supplies_24h":4180,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"IndustrialAge":{"happiness":1390,"supplies_24h":5070,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"ProgressiveEra":{"happiness":1520,"supplies_24h":5960,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"ModernEra":{"happiness":1630,"supplies_24h":6940,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"PostModernEra":{"happiness":1700,"supplies_24h":7920,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"ContemporaryEra":{"happiness":1970,"supplies_24h":8900,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"TomorrowEra":{"happiness":2400,"supplies_24h":9970,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"FutureEra":{"happiness":2870,"supplies_24h":10950,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"ArcticFuture":{"happiness":3340,"supplies_24h":12020,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"OceanicFuture":{"happiness":3860,"supplies_24h":13180,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"VirtualFuture":{"happiness":4610,"supplies_24h":14240,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"SpaceAgeMars":{"happiness":7370,"supplies_24h":23060,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"SpaceAgeAsteroidBelt":{"happiness":8010,"supplies_24h":24750,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"SpaceAgeVenus":{"happiness":8660,"supplies_24h":26530,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"SpaceAgeJupiterMoon":{"happiness":9320,"supplies_24h":28220,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"SpaceAgeTitan":{"happiness":10000,"supplies_24h":30000,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40},"SpaceAgeSpaceHub":{"happiness":10680,"supplies_24h":31780,"strategy_points_24h":9,"all_goods_of_previous_age_24h":40}}, boosts: [{"type":"att_boost_attacker","value":2,"feature":"guild_expedition"},{"type":"att_boost_defender","value":11,"feature":"guild_expedition"}] },
+    "W_MultiAge_SUM24F4": { prod: {"BronzeAge":{"happiness":440,"supplies_24h":450,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"IronAge":{"happiness":760,"supplies_24h":1070,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"EarlyMiddleAge":{"happiness":840,"supplies_24h":1780,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"HighMiddleAge":{"happiness":940,"supplies_24h":2490,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"LateMiddleAge":{"happiness":1050,"supplies_24h":3290,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"ColonialAge":{"happiness":1230,"supplies_24h":4180,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"IndustrialAge":{"happiness":1390,"supplies_24h":5070,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"ProgressiveEra":{"happiness":1520,"supplies_24h":5960,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"ModernEra":{"happiness":1630,"supplies_24h":6940,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"PostModernEra":{"happiness":1700,"supplies_24h":7920,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"ContemporaryEra":{"happiness":1970,"supplies_24h":8900,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"TomorrowEra":{"happiness":2400,"supplies_24h":9970,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"FutureEra":{"happiness":2870,"supplies_24h":10950,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"ArcticFuture":{"happiness":3340,"supplies_24h":12020,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"OceanicFuture":{"happiness":3860,"supplies_24h":13180,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"VirtualFuture":{"happiness":4610,"supplies_24h":14240,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"SpaceAgeMars":{"happiness":7370,"supplies_24h":23060,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"SpaceAgeAsteroidBelt":{"happiness":8010,"supplies_24h":24750,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"SpaceAgeVenus":{"happiness":8660,"supplies_24h":26530,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"SpaceAgeJupiterMoon":{"happiness":9320,"supplies_24h":28220,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"SpaceAgeTitan":{"happiness":10000,"supplies_24h":30000,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"SpaceAgeSpaceHub":{"happiness":10680,"supplies_24h":31780,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40}}, boosts: [{"type":"att_boost_attacker","value":5,"feature":"battleground"},{"type":"att_boost_attacker","value":2,"feature":"guild_expedition"},{"type":"att_boost_defender","value":8,"feature":"battleground"},{"type":"att_boost_defender","value":11,"feature":"guild_expedition"}] },
+    "W_MultiAge_SUM24F3": { prod: {"BronzeAge":{"happiness":440,"supplies_24h":450,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"IronAge":{"happiness":760,"supplies_24h":1070,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"EarlyMiddleAge":{"happiness":840,"supplies_24h":1780,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"HighMiddleAge":{"happiness":940,"supplies_24h":2490,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"LateMiddleAge":{"happiness":1050,"supplies_24h":3290,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"ColonialAge":{"happiness":1230,"supplies_24h":4180,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"IndustrialAge":{"happiness":1390,"supplies_24h":5070,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"ProgressiveEra":{"happiness":1520,"supplies_24h":5960,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"ModernEra":{"happiness":1630,"supplies_24h":6940,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"PostModernEra":{"happiness":1700,"supplies_24h":7920,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"ContemporaryEra":{"happiness":1970,"supplies_24h":8900,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"TomorrowEra":{"happiness":2400,"supplies_24h":9970,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"FutureEra":{"happiness":2870,"supplies_24h":10950,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"ArcticFuture":{"happiness":3340,"supplies_24h":12020,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"OceanicFuture":{"happiness":3860,"supplies_24h":13180,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"VirtualFuture":{"happiness":4610,"supplies_24h":14240,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"SpaceAgeMars":{"happiness":7370,"supplies_24h":23060,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"SpaceAgeAsteroidBelt":{"happiness":8010,"supplies_24h":24750,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"SpaceAgeVenus":{"happiness":8660,"supplies_24h":26530,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"SpaceAgeJupiterMoon":{"happiness":9320,"supplies_24h":28220,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"SpaceAgeTitan":{"happiness":10000,"supplies_24h":30000,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40},"SpaceAgeSpaceHub":{"happiness":10680,"supplies_24h":31780,"strategy_points_24h":9,"all_goods_of_age_24h":20,"all_goods_of_previous_age_24h":40}}, boosts: [{"type":"att_boost_attacker","value":2,"feature":"guild_expedition"},{"type":"att_boost_defender","value":11,"feature":"guild_expedition"}] },
+    "W_MultiAge_SUM24C1": { prod: {"BronzeAge":{"population":-20,"strategy_points_24h":2},"IronAge":{"population":-30,"strategy_points_24h":2},"EarlyMiddleAge":{"population":-50,"strategy_points_24h":2},"HighMiddleAge":{"population":-70,"strategy_points_24h":2},"LateMiddleAge":{"population":-100,"strategy_points_24h":2},"ColonialAge":{"population":-120,"strategy_points_24h":2},"IndustrialAge":{"population":-150,"strategy_points_24h":2},"ProgressiveEra":{"population":-180,"strategy_points_24h":2},"ModernEra":{"population":-210,"strategy_points_24h":2},"PostModernEra":{"population":-240,"strategy_points_24h":2},"ContemporaryEra":{"population":-280,"strategy_points_24h":2},"TomorrowEra":{"population":-310,"strategy_points_24h":2},"FutureEra":{"population":-350,"strategy_points_24h":2},"ArcticFuture":{"population":-390,"strategy_points_24h":2},"OceanicFuture":{"population":-430,"strategy_points_24h":2},"VirtualFuture":{"population":-470,"strategy_points_24h":2},"SpaceAgeMars":{"population":-740,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"population":-800,"strategy_points_24h":2},"SpaceAgeVenus":{"population":-870,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"population":-930,"strategy_points_24h":2},"SpaceAgeTitan":{"population":-1000,"strategy_points_24h":2},"SpaceAgeSpaceHub":{"population":-1070,"strategy_points_24h":2}}, boosts: [{"type":"def_boost_attacker","value":1,"feature":"battleground"},{"type":"att_boost_defender","value":3,"feature":"guild_expedition"}] },
+    "W_MultiAge_SUM24C2": { prod: {"BronzeAge":{"population":-20,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"IronAge":{"population":-30,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"EarlyMiddleAge":{"population":-50,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"HighMiddleAge":{"population":-70,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"LateMiddleAge":{"population":-100,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"ColonialAge":{"population":-120,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"IndustrialAge":{"population":-150,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"ProgressiveEra":{"population":-180,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"ModernEra":{"population":-210,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"PostModernEra":{"population":-240,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"ContemporaryEra":{"population":-280,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"TomorrowEra":{"population":-310,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"FutureEra":{"population":-350,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"ArcticFuture":{"population":-390,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"OceanicFuture":{"population":-430,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"VirtualFuture":{"population":-470,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"SpaceAgeMars":{"population":-740,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"SpaceAgeAsteroidBelt":{"population":-800,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"SpaceAgeVenus":{"population":-870,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"SpaceAgeJupiterMoon":{"population":-930,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"SpaceAgeTitan":{"population":-1000,"strategy_points_24h":2,"random_good_of_next_age_24h":3},"SpaceAgeSpaceHub":{"population":-1070,"strategy_points_24h":2,"random_good_of_next_age_24h":3}}, boosts: [{"type":"def_boost_attacker","value":1,"feature":"battleground"},{"type":"att_boost_defender","value":3,"feature":"guild_expedition"}] },
+};
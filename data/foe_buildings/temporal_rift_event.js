@@ -0,0 +1,7 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 3 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_TEMP24GR": { boosts: [{"type":"guild_raids_coins_start","value":40000,"feature":"all"},{"type":"guild_raids_supplies_start","value":40000,"feature":"all"},{"type":"guild_raids_goods_start","value":20,"feature":"all"},{"type":"guild_raids_units_start","value":10,"feature":"all"}] },
+    "W_MultiAge_TEMP24GRDecoration": { prod: {"AllAge":{"happiness":250}} },
+    "W_MultiAge_TEMP24WWDecoration": { prod: {"AllAge":{"happiness":250}} },
+};
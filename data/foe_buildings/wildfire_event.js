@@ -0,0 +1,102 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 98 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_WILD24D1": { prod: {"BronzeAge":{"population":-110,"random_good_of_age_24h":30,"strategy_points_24h":5},"IronAge":{"population":-240,"random_good_of_age_24h":30,"strategy_points_24h":5},"EarlyMiddleAge":{"population":-370,"random_good_of_age_24h":30,"strategy_points_24h":5},"HighMiddleAge":{"population":-520,"random_good_of_age_24h":30,"strategy_points_24h":5},"LateMiddleAge":{"population":-680,"random_good_of_age_24h":30,"strategy_points_24h":6},"ColonialAge":{"population":-860,"random_good_of_age_24h":30,"strategy_points_24h":6},"IndustrialAge":{"population":-1050,"random_good_of_age_24h":30,"strategy_points_24h":6},"ProgressiveEra":{"population":-1260,"random_good_of_age_24h":30,"strategy_points_24h":6},"ModernEra":{"population":-1470,"random_good_of_age_24h":30,"strategy_points_24h":7},"PostModernEra":{"population":-1700,"random_good_of_age_24h":30,"strategy_points_24h":7},"ContemporaryEra":{"population":-1930,"random_good_of_age_24h":30,"strategy_points_24h":7},"TomorrowEra":{"population":-2180,"random_good_of_age_24h":30,"strategy_points_24h":7},"FutureEra":{"population":-2440,"random_good_of_age_24h":30,"strategy_points_24h":8},"ArcticFuture":{"population":-2700,"random_good_of_age_24h":30,"strategy_points_24h":8},"OceanicFuture":{"population":-2980,"random_good_of_age_24h":30,"strategy_points_24h":8},"VirtualFuture":{"population":-3260,"random_good_of_age_24h":30,"strategy_points_24h":8},"SpaceAgeMars":{"population":-5160,"random_good_of_age_24h":30,"strategy_points_24h":9},"SpaceAgeAsteroidBelt":{"population":-5610,"random_good_of_age_24h":30,"strategy_points_24h":9},"SpaceAgeVenus":{"population":-6060,"random_good_of_age_24h":30,"strategy_points_24h":9},"SpaceAgeJupiterMoon":{"population":-6530,"random_good_of_age_24h":30,"strategy_points_24h":9},"SpaceAgeTitan":{"population":-7000,"random_good_of_age_24h":30,"strategy_points_24h":10},"SpaceAgeSpaceHub":{"population":-7470,"random_good_of_age_24h":30,"strategy_points_24h":10}}, boosts: [{"type":"def_boost_attacker","value":25,"feature":"all"},{"type":"def_boost_defender","value":32,"feature":"all"}] },
+    "W_MultiAge_WILD24D2": { prod: {"BronzeAge":{"population":-110,"random_good_of_age_24h":40,"strategy_points_24h":8},"IronAge":{"population":-240,"random_good_of_age_24h":40,"strategy_points_24h":8},"EarlyMiddleAge":{"population":-370,"random_good_of_age_24h":40,"strategy_points_24h":8},"HighMiddleAge":{"population":-520,"random_good_of_age_24h":40,"strategy_points_24h":8},"LateMiddleAge":{"population":-680,"random_good_of_age_24h":40,"strategy_points_24h":9},"ColonialAge":{"population":-860,"random_good_of_age_24h":40,"strategy_points_24h":9},"IndustrialAge":{"population":-1050,"random_good_of_age_24h":40,"strategy_points_24h":9},"ProgressiveEra":{"population":-1260,"random_good_of_age_24h":40,"strategy_points_24h":9},"ModernEra":{"population":-1470,"random_good_of_age_24h":40,"strategy_points_24h":10},"PostModernEra":{"population":-1700,"random_good_of_age_24h":40,"strategy_points_24h":10},"ContemporaryEra":{"population":-1930,"random_good_of_age_24h":40,"strategy_points_24h":10},"TomorrowEra":{"population":-2180,"random_good_of_age_24h":40,"strategy_points_24h":10},"FutureEra":{"population":-2440,"random_good_of_age_24h":40,"strategy_points_24h":11},"ArcticFuture":{"population":-2700,"random_good_of_age_24h":40,"strategy_points_24h":11},"OceanicFuture":{"population":-2980,"random_good_of_age_24h":40,"strategy_points_24h":11},"VirtualFuture":{"population":-3260,"random_good_of_age_24h":40,"strategy_points_24h":11},"SpaceAgeMars":{"population":-5160,"random_good_of_age_24h":40,"strategy_points_24h":12},"SpaceAgeAsteroidBelt":{"population":-5610,"random_good_of_age_24h":40,"strategy_points_24h":12},"SpaceAgeVenus":{"population":-6060,"random_good_of_age_24h":40,"strategy_points_24h":12},"SpaceAgeJupiterMoon":{"population":-6530,"random_good_of_age_24h":40,"strategy_points_24h":12},"SpaceAgeTitan":{"population":-7000,"random_good_of_age_24h":40,"strategy_points_24h":13},"SpaceAgeSpaceHub":{"population":-7470,"random_good_of_age_24h":40,"strategy_points_24h":13}}, boosts: [{"type":"def_boost_attacker","value":30,"feature":"all"},{"type":"def_boost_defender","value":37,"feature":"all"}] },
+    "W_MultiAge_WILD23G": { prod: {"AllAge":{"happiness":250}} },
+    "W_MultiAge_WILD23B1": { prod: {"BronzeAge":{"happiness":260},"IronAge":{"happiness":370},"EarlyMiddleAge":{"happiness":450},"HighMiddleAge":{"happiness":560},"LateMiddleAge":{"happiness":640},"ColonialAge":{"happiness":750},"IndustrialAge":{"happiness":850},"ProgressiveEra":{"happiness":930},"ModernEra":{"happiness":1070},"PostModernEra":{"happiness":1210},"ContemporaryEra":{"happiness":1410},"TomorrowEra":{"happiness":1760},"FutureEra":{"happiness":2110},"ArcticFuture":{"happiness":2390},"OceanicFuture":{"happiness":2680},"VirtualFuture":{"happiness":3390},"SpaceAgeMars":{"happiness":5270},"SpaceAgeAsteroidBelt":{"happiness":5730},"SpaceAgeVenus":{"happiness":6190},"SpaceAgeJupiterMoon":{"happiness":6660},"SpaceAgeTitan":{"happiness":7150},"SpaceAgeSpaceHub":{"happiness":7650}} },
+    "W_MultiAge_WILD24A12": { prod: {"BronzeAge":{"happiness":1940,"strategy_points_24h":15,"all_goods_of_age_24h":50},"IronAge":{"happiness":3350,"strategy_points_24h":15,"all_goods_of_age_24h":50},"EarlyMiddleAge":{"happiness":3700,"strategy_points_24h":16,"all_goods_of_age_24h":50},"HighMiddleAge":{"happiness":4130,"strategy_points_24h":16,"all_goods_of_age_24h":50},"LateMiddleAge":{"happiness":4600,"strategy_points_24h":17,"all_goods_of_age_24h":50},"ColonialAge":{"happiness":5410,"strategy_points_24h":17,"all_goods_of_age_24h":55},"IndustrialAge":{"happiness":6100,"strategy_points_24h":18,"all_goods_of_age_24h":55},"ProgressiveEra":{"happiness":6700,"strategy_points_24h":18,"all_goods_of_age_24h":55},"ModernEra":{"happiness":7170,"strategy_points_24h":19,"all_goods_of_age_24h":55},"PostModernEra":{"happiness":7470,"strategy_points_24h":19,"all_goods_of_age_24h":55},"ContemporaryEra":{"happiness":8680,"strategy_points_24h":20,"all_goods_of_age_24h":60},"TomorrowEra":{"happiness":10540,"strategy_points_24h":20,"all_goods_of_age_24h":60},"FutureEra":{"happiness":12630,"strategy_points_24h":21,"all_goods_of_age_24h":60},"ArcticFuture":{"happiness":14710,"strategy_points_24h":21,"all_goods_of_age_24h":60},"OceanicFuture":{"happiness":16970,"strategy_points_24h":22,"all_goods_of_age_24h":60},"VirtualFuture":{"happiness":20270,"strategy_points_24h":22,"all_goods_of_age_24h":65},"SpaceAgeMars":{"happiness":32440,"strategy_points_24h":23,"all_goods_of_age_24h":65},"SpaceAgeAsteroidBelt":{"happiness":35250,"strategy_points_24h":23,"all_goods_of_age_24h":65},"SpaceAgeVenus":{"happiness":38090,"strategy_points_24h":24,"all_goods_of_age_24h":65},"SpaceAgeJupiterMoon":{"happiness":41030,"strategy_points_24h":24,"all_goods_of_age_24h":65},"SpaceAgeTitan":{"happiness":44000,"strategy_points_24h":25,"all_goods_of_age_24h":70},"SpaceAgeSpaceHub":{"happiness":46970,"strategy_points_24h":25,"all_goods_of_age_24h":70}}, boosts: [{"type":"att_boost_attacker","value":15,"feature":"all"},{"type":"att_boost_attacker","value":15,"feature":"battleground"},{"type":"def_boost_attacker","value":20,"feature":"all"},{"type":"def_boost_attacker","value":20,"feature":"battleground"}] },
+    "W_MultiAge_WILD24A13": { prod: {"BronzeAge":{"happiness":2430,"strategy_points_24h":17,"all_goods_of_age_24h":60},"IronAge":{"happiness":4180,"strategy_points_24h":17,"all_goods_of_age_24h":60},"EarlyMiddleAge":{"happiness":4620,"strategy_points_24h":18,"all_goods_of_age_24h":60},"HighMiddleAge":{"happiness":5160,"strategy_points_24h":18,"all_goods_of_age_24h":60},"LateMiddleAge":{"happiness":5750,"strategy_points_24h":19,"all_goods_of_age_24h":60},"ColonialAge":{"happiness":6770,"strategy_points_24h":19,"all_goods_of_age_24h":65},"IndustrialAge":{"happiness":7630,"strategy_points_24h":20,"all_goods_of_age_24h":65},"ProgressiveEra":{"happiness":8380,"strategy_points_24h":20,"all_goods_of_age_24h":65},"ModernEra":{"happiness":8970,"strategy_points_24h":21,"all_goods_of_age_24h":65},"PostModernEra":{"happiness":9340,"strategy_points_24h":21,"all_goods_of_age_24h":65},"ContemporaryEra":{"happiness":10850,"strategy_points_24h":22,"all_goods_of_age_24h":70},"TomorrowEra":{"happiness":13180,"strategy_points_24h":22,"all_goods_of_age_24h":70},"FutureEra":{"happiness":15790,"strategy_points_24h":23,"all_goods_of_age_24h":70},"ArcticFuture":{"happiness":18380,"strategy_points_24h":23,"all_goods_of_age_24h":70},"OceanicFuture":{"happiness":21210,"strategy_points_24h":24,"all_goods_of_age_24h":70},"VirtualFuture":{"happiness":25340,"strategy_points_24h":24,"all_goods_of_age_24h":75},"SpaceAgeMars":{"happiness":40550,"strategy_points_24h":25,"all_goods_of_age_24h":75},"SpaceAgeAsteroidBelt":{"happiness":44070,"strategy_points_24h":25,"all_goods_of_age_24h":75},"SpaceAgeVenus":{"happiness":47610,"strategy_points_24h":26,"all_goods_of_age_24h":75},"SpaceAgeJupiterMoon":{"happiness":51280,"strategy_points_24h":26,"all_goods_of_age_24h":75},"SpaceAgeTitan":{"happiness":55000,"strategy_points_24h":27,"all_goods_of_age_24h":80},"SpaceAgeSpaceHub":{"happiness":58720,"strategy_points_24h":27,"all_goods_of_age_24h":80}}, boosts: [{"type":"att_boost_attacker","value":20,"feature":"all"},{"type":"att_boost_attacker","value":20,"feature":"battleground"},{"type":"def_boost_attacker","value":25,"feature":"all"},{"type":"def_boost_attacker","value":25,"feature":"battleground"}] },
+    "W_MultiAge_WILD21A8a": { prod: {"BronzeAge":{"population":420,"happiness":1720,"demandHappiness":420,"money_24h":2410,"medals_24h":30,"strategy_points_24h":26,"random_good_of_age_24h":52},"IronAge":{"population":900,"happiness":2970,"demandHappiness":900,"money_24h":5780,"medals_24h":40,"strategy_points_24h":26,"random_good_of_age_24h":52},"EarlyMiddleAge":{"population":1370,"happiness":3280,"demandHappiness":1370,"money_24h":9640,"medals_24h":50,"strategy_points_24h":26,"random_good_of_age_24h":52},"HighMiddleAge":{"population":1930,"happiness":3660,"demandHappiness":1930,"money_24h":13490,"medals_24h":60,"strategy_points_24h":26,"random_good_of_age_24h":52},"LateMiddleAge":{"population":2530,"happiness":4080,"demandHappiness":2530,"money_24h":17830,"medals_24h":70,"strategy_points_24h":26,"random_good_of_age_24h":52},"ColonialAge":{"population":3200,"happiness":4800,"demandHappiness":3200,"money_24h":27160,"medals_24h":80,"strategy_points_24h":26,"random_good_of_age_24h":52},"IndustrialAge":{"population":3910,"happiness":5410,"demandHappiness":3910,"money_24h":33830,"medals_24h":110,"strategy_points_24h":26,"random_good_of_age_24h":52},"ProgressiveEra":{"population":4670,"happiness":5940,"demandHappiness":4670,"money_24h":41060,"medals_24h":160,"strategy_points_24h":26,"random_good_of_age_24h":52},"ModernEra":{"population":5470,"happiness":6360,"demandHappiness":5470,"money_24h":51090,"medals_24h":220,"strategy_points_24h":26,"random_good_of_age_24h":52},"PostModernEra":{"population":6300,"happiness":6620,"demandHappiness":6300,"money_24h":64270,"medals_24h":310,"strategy_points_24h":26,"random_good_of_age_24h":52},"ContemporaryEra":{"population":7180,"happiness":7700,"demandHappiness":7180,"money_24h":83670,"medals_24h":450,"strategy_points_24h":26,"random_good_of_age_24h":52},"TomorrowEra":{"population":8100,"happiness":9340,"demandHappiness":8100,"money_24h":96870,"medals_24h":610,"strategy_points_24h":26,"random_good_of_age_24h":52},"FutureEra":{"population":9050,"happiness":11190,"demandHappiness":9050,"money_24h":111040,"medals_24h":740,"strategy_points_24h":26,"random_good_of_age_24h":52},"ArcticFuture":{"population":10040,"happiness":13030,"demandHappiness":10040,"money_24h":126180,"medals_24h":900,"strategy_points_24h":26,"random_good_of_age_24h":52},"OceanicFuture":{"population":11060,"happiness":15040,"demandHappiness":11060,"money_24h":142270,"medals_24h":1030,"strategy_points_24h":26,"random_good_of_age_24h":52},"VirtualFuture":{"population":12110,"happiness":17970,"demandHappiness":12110,"money_24h":159360,"medals_24h":1260,"strategy_points_24h":26,"random_good_of_age_24h":52},"SpaceAgeMars":{"population":19170,"happiness":28750,"demandHappiness":19170,"money_24h":266190,"medals_24h":1520,"strategy_points_24h":26,"random_good_of_age_24h":52},"SpaceAgeAsteroidBelt":{"population":20820,"happiness":31250,"demandHappiness":20820,"money_24h":294840,"medals_24h":1790,"strategy_points_24h":26,"random_good_of_age_24h":52},"SpaceAgeVenus":{"population":22510,"happiness":33760,"demandHappiness":22510,"money_24h":325010,"medals_24h":2060,"strategy_points_24h":26,"random_good_of_age_24h":52},"SpaceAgeJupiterMoon":{"population":24240,"happiness":36370,"demandHappiness":24240,"money_24h":356720,"medals_24h":2330,"strategy_points_24h":26,"random_good_of_age_24h":52},"SpaceAgeTitan":{"population":26000,"happiness":39000,"demandHappiness":26000,"money_24h":390000,"medals_24h":2600,"strategy_points_24h":26,"random_good_of_age_24h":52},"SpaceAgeSpaceHub":{"population":27760,"happiness":41630,"demandHappiness":27760,"money_24h":423280,"medals_24h":2870,"strategy_points_24h":26,"random_good_of_age_24h":52}}, boosts: [{"type":"att_def_boost_defender","value":44,"feature":"all"},{"type":"att_def_boost_defender","value":44,"feature":"battleground"},{"type":"att_def_boost_defender","value":15,"feature":"guild_raids"},{"type":"guild_raids_action_points_collection","value":200,"feature":"all"}] },
+    "W_MultiAge_WILD21A8b": { prod: {"BronzeAge":{"population":420,"happiness":1720,"demandHappiness":420,"money_24h":2410,"medals_24h":30,"strategy_points_24h":26,"random_good_of_age_24h":52},"IronAge":{"population":900,"happiness":2970,"demandHappiness":900,"money_24h":5780,"medals_24h":40,"strategy_points_24h":26,"random_good_of_age_24h":52},"EarlyMiddleAge":{"population":1370,"happiness":3280,"demandHappiness":1370,"money_24h":9640,"medals_24h":50,"strategy_points_24h":26,"random_good_of_age_24h":52},"HighMiddleAge":{"population":1930,"happiness":3660,"demandHappiness":1930,"money_24h":13490,"medals_24h":60,"strategy_points_24h":26,"random_good_of_age_24h":52},"LateMiddleAge":{"population":2530,"happiness":4080,"demandHappiness":2530,"money_24h":17830,"medals_24h":70,"strategy_points_24h":26,"random_good_of_age_24h":52},"ColonialAge":{"population":3200,"happiness":4800,"demandHappiness":3200,"money_24h":27160,"medals_24h":80,"strategy_points_24h":26,"random_good_of_age_24h":52},"IndustrialAge":{"population":3910,"happiness":5410,"demandHappiness":3910,"money_24h":33830,"medals_24h":110,"strategy_points_24h":26,"random_good_of_age_24h":52},"ProgressiveEra":{"population":4670,"happiness":5940,"demandHappiness":4670,"money_24h":41060,"medals_24h":160,"strategy_points_24h":26,"random_good_of_age_24h":52},"ModernEra":{"population":5470,"happiness":6360,"demandHappiness":5470,"money_24h":51090,"medals_24h":220,"strategy_points_24h":26,"random_good_of_age_24h":52},"PostModernEra":{"population":6300,"happiness":6620,"demandHappiness":6300,"money_24h":64270,"medals_24h":310,"strategy_points_24h":26,"random_good_of_age_24h":52},"ContemporaryEra":{"population":7180,"happiness":7700,"demandHappiness":7180,"money_24h":83670,"medals_24h":450,"strategy_points_24h":26,"random_good_of_age_24h":52},"TomorrowEra":{"population":8100,"happiness":9340,"demandHappiness":8100,"money_24h":96870,"medals_24h":610,"strategy_points_24h":26,"random_good_of_age_24h":52},"FutureEra":{"population":9050,"happiness":11190,"demandHappiness":9050,"money_24h":111040,"medals_24h":740,"strategy_points_24h":26,"random_good_of_age_24h":52},"ArcticFuture":{"population":10040,"happiness":13030,"demandHappiness":10040,"money_24h":126180,"medals_24h":900,"strategy_points_24h":26,"random_good_of_age_24h":52},"OceanicFuture":{"population":11060,"happiness":15040,"demandHappiness":11060,"money_24h":142270,"medals_24h":1030,"strategy_points_24h":26,"random_good_of_age_24h":52},"VirtualFuture":{"population":12110,"happiness":17970,"demandHappiness":12110,"money_24h":159360,"medals_24h":1260,"strategy_points_24h":26,"random_good_of_age_24h":52},"SpaceAgeMars":{"population":19170,"happiness":28750,"demandHappiness":19170,"money_24h":266190,"medals_24h":1520,"strategy_points_24h":26,"random_good_of_age_24h":52},"SpaceAgeAsteroidBelt":{"population":20820,"happiness":31250,"demandHappiness":20820,"money_24h":294840,"medals_24h":1790,"strategy_points_24h":26,"random_good_of_age_24h":52},"SpaceAgeVenus":{"population":22510,"happiness":33760,"demandHappiness":22510,"money_24h":325010,"medals_24h":2060,"strategy_points_24h":26,"random_good_of_age_24h":52},"SpaceAgeJupiterMoon":{"population":24240,"happiness":36370,"demandHappiness":24240,"money_24h":356720,"medals_24h":2330,"strategy_points_24h":26,"random_good_of_age_24h":52},"SpaceAgeTitan":{"population":26000,"happiness":39000,"demandHappiness":26000,"money_24h":390000,"medals_24h":2600,"strategy_points_24h":26,"random_good_of_age_24h":52},"SpaceAgeSpaceHub":{"population":27760,"happiness":41630,"demandHappiness":27760,"money_24h":423280,"medals_24h":2870,"strategy_points_24h":26,"random_good_of_age_24h":52}}, boosts: [{"type":"att_def_boost_attacker","value":44,"feature":"all"},{"type":"att_def_boost_attacker","value":44,"feature":"battleground"},{"type":"att_def_boost_attacker","value":15,"feature":"guild_raids"},{"type":"guild_raids_action_points_collection","value":200,"feature":"all"}] },
+    "W_MultiAge_WILD21A8c": { prod: {"BronzeAge":{"population":830,"happiness":3440,"demandHappiness":830,"money_24h":4020,"supplies_24h":3860,"medals_24h":310,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"IronAge":{"population":1790,"happiness":5930,"demandHappiness":1790,"money_24h":9640,"supplies_24h":9260,"medals_24h":400,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"EarlyMiddleAge":{"population":2750,"happiness":6560,"demandHappiness":2750,"money_24h":16070,"supplies_24h":15430,"medals_24h":490,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"HighMiddleAge":{"population":3860,"happiness":7320,"demandHappiness":3860,"money_24h":22490,"supplies_24h":21600,"medals_24h":580,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"LateMiddleAge":{"population":5070,"happiness":8160,"demandHappiness":5070,"money_24h":29720,"supplies_24h":28550,"medals_24h":670,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"ColonialAge":{"population":6400,"happiness":9600,"demandHappiness":6400,"money_24h":45260,"supplies_24h":36260,"medals_24h":810,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"IndustrialAge":{"population":7820,"happiness":10820,"demandHappiness":7820,"money_24h":56390,"supplies_24h":43980,"medals_24h":1120,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"ProgressiveEra":{"population":9330,"happiness":11880,"demandHappiness":9330,"money_24h":68440,"supplies_24h":51690,"medals_24h":1570,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"ModernEra":{"population":10940,"happiness":12710,"demandHappiness":10940,"money_24h":85150,"supplies_24h":60180,"medals_24h":2240,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"PostModernEra":{"population":12610,"happiness":13250,"demandHappiness":12610,"money_24h":107120,"supplies_24h":68660,"medals_24h":3140,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"ContemporaryEra":{"population":14370,"happiness":15390,"demandHappiness":14370,"money_24h":139450,"supplies_24h":77150,"medals_24h":4480,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"TomorrowEra":{"population":16190,"happiness":18690,"demandHappiness":16190,"money_24h":161460,"supplies_24h":86410,"medals_24h":6050,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"FutureEra":{"population":18110,"happiness":22390,"demandHappiness":18110,"money_24h":185070,"supplies_24h":94900,"medals_24h":7400,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"ArcticFuture":{"population":20080,"happiness":26070,"demandHappiness":20080,"money_24h":210290,"supplies_24h":104150,"medals_24h":8970,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"OceanicFuture":{"population":22120,"happiness":30080,"demandHappiness":22120,"money_24h":237120,"supplies_24h":114180,"medals_24h":10310,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"VirtualFuture":{"population":24220,"happiness":35940,"demandHappiness":24220,"money_24h":265600,"supplies_24h":123440,"medals_24h":12550,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"SpaceAgeMars":{"population":38340,"happiness":57510,"demandHappiness":38340,"money_24h":443640,"supplies_24h":199820,"medals_24h":15240,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"SpaceAgeAsteroidBelt":{"population":41650,"happiness":62490,"demandHappiness":41650,"money_24h":491400,"supplies_24h":214480,"medals_24h":17930,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"SpaceAgeVenus":{"population":45020,"happiness":67520,"demandHappiness":45020,"money_24h":541680,"supplies_24h":229910,"medals_24h":20620,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"SpaceAgeJupiterMoon":{"population":48480,"happiness":72730,"demandHappiness":48480,"money_24h":594530,"supplies_24h":244570,"medals_24h":23310,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"SpaceAgeTitan":{"population":52000,"happiness":78000,"demandHappiness":52000,"money_24h":650000,"supplies_24h":260000,"medals_24h":26000,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130},"SpaceAgeSpaceHub":{"population":55520,"happiness":83270,"demandHappiness":55520,"money_24h":705470,"supplies_24h":275430,"medals_24h":28690,"strategy_points_24h":130,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":130}}, boosts: [{"type":"att_boost_attacker","value":15,"feature":"guild_raids"},{"type":"att_boost_defender","value":15,"feature":"guild_raids"},{"type":"guild_raids_action_points_collection","value":200,"feature":"all"},{"type":"coin_production","value":44,"feature":"all"},{"type":"supply_production","value":44,"feature":"all"}] },
+    "W_MultiAge_WILD22A10": { prod: {"BronzeAge":{"population":413,"happiness":1950,"demandHappiness":413,"money_24h":2000,"medals_24h":234,"random_good_of_age_24h":20,"strategy_points_24h":20},"IronAge":{"population":887,"happiness":3350,"demandHappiness":887,"money_24h":4800,"medals_24h":301,"random_good_of_age_24h":22,"strategy_points_24h":20},"EarlyMiddleAge":{"population":1362,"happiness":3710,"demandHappiness":1362,"money_24h":7900,"medals_24h":368,"random_good_of_age_24h":24,"strategy_points_24h":20},"HighMiddleAge":{"population":1913,"happiness":4140,"demandHappiness":1913,"money_24h":11100,"medals_24h":435,"random_good_of_age_24h":26,"strategy_points_24h":20},"LateMiddleAge":{"population":2509,"happiness":4620,"demandHappiness":2509,"money_24h":14700,"medals_24h":502,"random_good_of_age_24h":28,"strategy_points_24h":20},"ColonialAge":{"population":3167,"happiness":5430,"demandHappiness":3167,"money_24h":22300,"medals_24h":602,"random_good_of_age_24h":30,"strategy_points_24h":20},"IndustrialAge":{"population":3871,"happiness":6120,"demandHappiness":3871,"money_24h":27800,"medals_24h":836,"random_good_of_age_24h":32,"strategy_points_24h":20},"ProgressiveEra":{"population":4621,"happiness":6720,"demandHappiness":4621,"money_24h":33700,"medals_24h":1170,"random_good_of_age_24h":34,"strategy_points_24h":20},"ModernEra":{"population":5416,"happiness":7190,"demandHappiness":5416,"money_24h":42000,"medals_24h":1672,"random_good_of_age_24h":36,"strategy_points_24h":20},"PostModernEra":{"population":6242,"happiness":7490,"demandHappiness":6242,"money_24h":52800,"medals_24h":2340,"random_good_of_age_24h":38,"strategy_points_24h":20},"ContemporaryEra":{"population":7115,"happiness":8700,"demandHappiness":7115,"money_24h":68800,"medals_24h":3343,"random_good_of_age_24h":40,"strategy_points_24h":20},"TomorrowEra":{"population":8017,"happiness":10570,"demandHappiness":8017,"money_24h":79600,"medals_24h":4513,"random_good_of_age_24h":42,"strategy_points_24h":20},"FutureEra":{"population":8966,"happiness":12660,"demandHappiness":8966,"money_24h":91200,"medals_24h":5516,"random_good_of_age_24h":44,"strategy_points_24h":20},"ArcticFuture":{"population":9945,"happiness":14740,"demandHappiness":9945,"money_24h":103700,"medals_24h":6686,"random_good_of_age_24h":46,"strategy_points_24h":20},"OceanicFuture":{"population":10955,"happiness":17010,"demandHappiness":10955,"money_24h":116900,"medals_24h":7689,"random_good_of_age_24h":48,"strategy_points_24h":20},"VirtualFuture":{"population":11995,"happiness":20320,"demandHappiness":11995,"money_24h":130900,"medals_24h":9360,"random_good_of_age_24h":50,"strategy_points_24h":20},"SpaceAgeMars":{"population":18987,"happiness":32520,"demandHappiness":18987,"money_24h":218700,"medals_24h":11366,"random_good_of_age_24h":52,"strategy_points_24h":20},"SpaceAgeAsteroidBelt":{"population":20624,"happiness":35340,"demandHappiness":20624,"money_24h":242300,"medals_24h":13372,"random_good_of_age_24h":54,"strategy_points_24h":20},"SpaceAgeVenus":{"population":22292,"happiness":38180,"demandHappiness":22292,"money_24h":267000,"medals_24h":15378,"random_good_of_age_24h":56,"strategy_points_24h":20},"SpaceAgeJupiterMoon":{"population":24006,"happiness":41130,"demandHappiness":24006,"money_24h":293100,"medals_24h":17383,"random_good_of_age_24h":58,"strategy_points_24h":20},"SpaceAgeTitan":{"population":25750,"happiness":44110,"demandHappiness":25750,"money_24h":320400,"medals_24h":19389,"random_good_of_age_24h":60,"strategy_points_24h":20},"SpaceAgeSpaceHub":{"population":27540,"happiness":47180,"demandHappiness":27540,"money_24h":349100,"medals_24h":21395,"random_good_of_age_24h":62,"strategy_points_24h":20}}, boosts: [{"type":"att_boost_attacker","value":23,"feature":"all"},{"type":"att_boost_defender","value":24,"feature":"all"},{"type":"def_boost_defender","value":32,"feature":"all"}] },
+    "W_MultiAge_WILD26A11": { prod: {"BronzeAge":{"population":540,"demandHappiness":540,"medals_24h":380,"strategy_points_24h":200},"IronAge":{"population":1160,"demandHappiness":1160,"medals_24h":490,"strategy_points_24h":200},"EarlyMiddleAge":{"population":1780,"demandHappiness":1780,"medals_24h":600,"strategy_points_24h":200},"HighMiddleAge":{"population":2500,"demandHappiness":2500,"medals_24h":710,"strategy_points_24h":200},"LateMiddleAge":{"population":3290,"demandHappiness":3290,"medals_24h":820,"strategy_points_24h":200},"ColonialAge":{"population":4150,"demandHappiness":4150,"medals_24h":980,"strategy_points_24h":200},"IndustrialAge":{"population":5070,"demandHappiness":5070,"medals_24h":1370,"strategy_points_24h":200},"ProgressiveEra":{"population":6050,"demandHappiness":6050,"medals_24h":1910,"strategy_points_24h":200},"ModernEra":{"population":7090,"demandHappiness":7090,"medals_24h":2730,"strategy_points_24h":200},"PostModernEra":{"population":8170,"demandHappiness":8170,"medals_24h":3830,"strategy_points_24h":200},"ContemporaryEra":{"population":9320,"demandHappiness":9320,"medals_24h":5470,"strategy_points_24h":200},"TomorrowEra":{"population":10500,"demandHappiness":10500,"medals_24h":7380,"strategy_points_24h":200},"FutureEra":{"population":11740,"demandHappiness":11740,"medals_24h":9020,"strategy_points_24h":200},"ArcticFuture":{"population":13020,"demandHappiness":13020,"medals_24h":10940,"strategy_points_24h":200},"OceanicFuture":{"population":14340,"demandHappiness":14340,"medals_24h":12580,"strategy_points_24h":200},"VirtualFuture":{"population":15710,"demandHappiness":15710,"medals_24h":15310,"strategy_points_24h":200},"SpaceAgeMars":{"population":24860,"demandHappiness":24860,"medals_24h":18590,"strategy_points_24h":200},"SpaceAgeAsteroidBelt":{"population":27010,"demandHappiness":27010,"medals_24h":21880,"strategy_points_24h":200},"SpaceAgeVenus":{"population":29190,"demandHappiness":29190,"medals_24h":25160,"strategy_points_24h":200},"SpaceAgeJupiterMoon":{"population":31430,"demandHappiness":31430,"medals_24h":28440,"strategy_points_24h":200},"SpaceAgeTitan":{"population":33720,"demandHappiness":33720,"medals_24h":31720,"strategy_points_24h":200},"SpaceAgeSpaceHub":{"population":36000,"demandHappiness":36000,"medals_24h":35000,"strategy_points_24h":200}}, boosts: [{"type":"att_def_boost_attacker","value":280,"feature":"battleground"},{"type":"att_def_boost_attacker","value":200,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD26A1": { prod: {"BronzeAge":{"population":90,"demandHappiness":90,"medals_24h":150},"IronAge":{"population":190,"demandHappiness":190,"medals_24h":200},"EarlyMiddleAge":{"population":300,"demandHappiness":300,"medals_24h":240},"HighMiddleAge":{"population":420,"demandHappiness":420,"medals_24h":280},"LateMiddleAge":{"population":550,"demandHappiness":550,"medals_24h":330},"ColonialAge":{"population":690,"demandHappiness":690,"medals_24h":390},"IndustrialAge":{"population":840,"demandHappiness":840,"medals_24h":550},"ProgressiveEra":{"population":1010,"demandHappiness":1010,"medals_24h":770},"ModernEra":{"population":1180,"demandHappiness":1180,"medals_24h":1090},"PostModernEra":{"population":1360,"demandHappiness":1360,"medals_24h":1530},"ContemporaryEra":{"population":1550,"demandHappiness":1550,"medals_24h":2190},"TomorrowEra":{"population":1750,"demandHappiness":1750,"medals_24h":2950},"FutureEra":{"population":1960,"demandHappiness":1960,"medals_24h":3610},"ArcticFuture":{"population":2170,"demandHappiness":2170,"medals_24h":4380},"OceanicFuture":{"population":2390,"demandHappiness":2390,"medals_24h":5030},"VirtualFuture":{"population":2620,"demandHappiness":2620,"medals_24h":6130},"SpaceAgeMars":{"population":4140,"demandHappiness":4140,"medals_24h":7440},"SpaceAgeAsteroidBelt":{"population":4500,"demandHappiness":4500,"medals_24h":8750},"SpaceAgeVenus":{"population":4860,"demandHappiness":4860,"medals_24h":10060},"SpaceAgeJupiterMoon":{"population":5240,"demandHappiness":5240,"medals_24h":11380},"SpaceAgeTitan":{"population":5620,"demandHappiness":5620,"medals_24h":12690},"SpaceAgeSpaceHub":{"population":6000,"demandHappiness":6000,"medals_24h":14000}} },
+    "W_MultiAge_WILD26A2": { prod: {"BronzeAge":{"population":140,"demandHappiness":140,"medals_24h":180},"IronAge":{"population":290,"demandHappiness":290,"medals_24h":230},"EarlyMiddleAge":{"population":450,"demandHappiness":450,"medals_24h":280},"HighMiddleAge":{"population":630,"demandHappiness":630,"medals_24h":330},"LateMiddleAge":{"population":820,"demandHappiness":820,"medals_24h":380},"ColonialAge":{"population":1040,"demandHappiness":1040,"medals_24h":450},"IndustrialAge":{"population":1270,"demandHappiness":1270,"medals_24h":630},"ProgressiveEra":{"population":1510,"demandHappiness":1510,"medals_24h":880},"ModernEra":{"population":1770,"demandHappiness":1770,"medals_24h":1250},"PostModernEra":{"population":2040,"demandHappiness":2040,"medals_24h":1750},"ContemporaryEra":{"population":2330,"demandHappiness":2330,"medals_24h":2500},"TomorrowEra":{"population":2620,"demandHappiness":2620,"medals_24h":3380},"FutureEra":{"population":2930,"demandHappiness":2930,"medals_24h":4130},"ArcticFuture":{"population":3260,"demandHappiness":3260,"medals_24h":5000},"OceanicFuture":{"population":3590,"demandHappiness":3590,"medals_24h":5750},"VirtualFuture":{"population":3930,"demandHappiness":3930,"medals_24h":7000},"SpaceAgeMars":{"population":6220,"demandHappiness":6220,"medals_24h":8500},"SpaceAgeAsteroidBelt":{"population":6750,"demandHappiness":6750,"medals_24h":10000},"SpaceAgeVenus":{"population":7300,"demandHappiness":7300,"medals_24h":11500},"SpaceAgeJupiterMoon":{"population":7860,"demandHappiness":7860,"medals_24h":13000},"SpaceAgeTitan":{"population":8430,"demandHappiness":8430,"medals_24h":14500},"SpaceAgeSpaceHub":{"population":9000,"demandHappiness":9000,"medals_24h":16000}}, boosts: [{"type":"att_def_boost_attacker","value":30,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD26A3": { prod: {"BronzeAge":{"population":180,"demandHappiness":180,"medals_24h":200},"IronAge":{"population":390,"demandHappiness":390,"medals_24h":250},"EarlyMiddleAge":{"population":590,"demandHappiness":590,"medals_24h":310},"HighMiddleAge":{"population":830,"demandHappiness":830,"medals_24h":370},"LateMiddleAge":{"population":1100,"demandHappiness":1100,"medals_24h":420},"ColonialAge":{"population":1380,"demandHappiness":1380,"medals_24h":510},"IndustrialAge":{"population":1690,"demandHappiness":1690,"medals_24h":700},"ProgressiveEra":{"population":2020,"demandHappiness":2020,"medals_24h":980},"ModernEra":{"population":2360,"demandHappiness":2360,"medals_24h":1410},"PostModernEra":{"population":2720,"demandHappiness":2720,"medals_24h":1970},"ContemporaryEra":{"population":3110,"demandHappiness":3110,"medals_24h":2810},"TomorrowEra":{"population":3500,"demandHappiness":3500,"medals_24h":3800},"FutureEra":{"population":3910,"demandHappiness":3910,"medals_24h":4640},"ArcticFuture":{"population":4340,"demandHappiness":4340,"medals_24h":5630},"OceanicFuture":{"population":4780,"demandHappiness":4780,"medals_24h":6470},"VirtualFuture":{"population":5240,"demandHappiness":5240,"medals_24h":7880},"SpaceAgeMars":{"population":8290,"demandHappiness":8290,"medals_24h":9560},"SpaceAgeAsteroidBelt":{"population":9000,"demandHappiness":9000,"medals_24h":11250},"SpaceAgeVenus":{"population":9730,"demandHappiness":9730,"medals_24h":12940},"SpaceAgeJupiterMoon":{"population":10480,"demandHappiness":10480,"medals_24h":14630},"SpaceAgeTitan":{"population":11240,"demandHappiness":11240,"medals_24h":16310},"SpaceAgeSpaceHub":{"population":12000,"demandHappiness":12000,"medals_24h":18000}}, boosts: [{"type":"att_def_boost_attacker","value":50,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD26A5": { prod: {"BronzeAge":{"population":270,"demandHappiness":270,"medals_24h":240,"strategy_points_24h":5},"IronAge":{"population":580,"demandHappiness":580,"medals_24h":310,"strategy_points_24h":5},"EarlyMiddleAge":{"population":890,"demandHappiness":890,"medals_24h":380,"strategy_points_24h":5},"HighMiddleAge":{"population":1250,"demandHappiness":1250,"medals_24h":450,"strategy_points_24h":5},"LateMiddleAge":{"population":1640,"demandHappiness":1640,"medals_24h":520,"strategy_points_24h":5},"ColonialAge":{"population":2070,"demandHappiness":2070,"medals_24h":620,"strategy_points_24h":5},"IndustrialAge":{"population":2530,"demandHappiness":2530,"medals_24h":860,"strategy_points_24h":5},"ProgressiveEra":{"population":3030,"demandHappiness":3030,"medals_24h":1200,"strategy_points_24h":5},"ModernEra":{"population":3550,"demandHappiness":3550,"medals_24h":1720,"strategy_points_24h":5},"PostModernEra":{"population":4090,"demandHappiness":4090,"medals_24h":2410,"strategy_points_24h":5},"ContemporaryEra":{"population":4660,"demandHappiness":4660,"medals_24h":3440,"strategy_points_24h":5},"TomorrowEra":{"population":5250,"demandHappiness":5250,"medals_24h":4640,"strategy_points_24h":5},"FutureEra":{"population":5870,"demandHappiness":5870,"medals_24h":5670,"strategy_points_24h":5},"ArcticFuture":{"population":6510,"demandHappiness":6510,"medals_24h":6880,"strategy_points_24h":5},"OceanicFuture":{"population":7170,"demandHappiness":7170,"medals_24h":7910,"strategy_points_24h":5},"VirtualFuture":{"population":7850,"demandHappiness":7850,"medals_24h":9630,"strategy_points_24h":5},"SpaceAgeMars":{"population":12430,"demandHappiness":12430,"medals_24h":11690,"strategy_points_24h":5},"SpaceAgeAsteroidBelt":{"population":13500,"demandHappiness":13500,"medals_24h":13750,"strategy_points_24h":5},"SpaceAgeVenus":{"population":14590,"demandHappiness":14590,"medals_24h":15810,"strategy_points_24h":5},"SpaceAgeJupiterMoon":{"population":15720,"demandHappiness":15720,"medals_24h":17880,"strategy_points_24h":5},"SpaceAgeTitan":{"population":16860,"demandHappiness":16860,"medals_24h":19940,"strategy_points_24h":5},"SpaceAgeSpaceHub":{"population":18000,"demandHappiness":18000,"medals_24h":22000,"strategy_points_24h":5}}, boosts: [{"type":"att_def_boost_attacker","value":50,"feature":"battleground"},{"type":"att_def_boost_attacker","value":90,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD26A6": { prod: {"BronzeAge":{"population":320,"demandHappiness":320,"medals_24h":260,"strategy_points_24h":10},"IronAge":{"population":680,"demandHappiness":680,"medals_24h":340,"strategy_points_24h":10},"EarlyMiddleAge":{"population":1040,"demandHappiness":1040,"medals_24h":410,"strategy_points_24h":10},"HighMiddleAge":{"population":1460,"demandHappiness":1460,"medals_24h":490,"strategy_points_24h":10},"LateMiddleAge":{"population":1920,"demandHappiness":1920,"medals_24h":560,"strategy_points_24h":10},"ColonialAge":{"population":2420,"demandHappiness":2420,"medals_24h":680,"strategy_points_24h":10},"IndustrialAge":{"population":2960,"demandHappiness":2960,"medals_24h":940,"strategy_points_24h":10},"ProgressiveEra":{"population":3530,"demandHappiness":3530,"medals_24h":1310,"strategy_points_24h":10},"ModernEra":{"population":4140,"demandHappiness":4140,"medals_24h":1880,"strategy_points_24h":10},"PostModernEra":{"population":4770,"demandHappiness":4770,"medals_24h":2630,"strategy_points_24h":10},"ContemporaryEra":{"population":5430,"demandHappiness":5430,"medals_24h":3750,"strategy_points_24h":10},"TomorrowEra":{"population":6120,"demandHappiness":6120,"medals_24h":5060,"strategy_points_24h":10},"FutureEra":{"population":6850,"demandHappiness":6850,"medals_24h":6190,"strategy_points_24h":10},"ArcticFuture":{"population":7600,"demandHappiness":7600,"medals_24h":7500,"strategy_points_24h":10},"OceanicFuture":{"population":8370,"demandHappiness":8370,"medals_24h":8630,"strategy_points_24h":10},"VirtualFuture":{"population":9160,"demandHappiness":9160,"medals_24h":10500,"strategy_points_24h":10},"SpaceAgeMars":{"population":14500,"demandHappiness":14500,"medals_24h":12750,"strategy_points_24h":10},"SpaceAgeAsteroidBelt":{"population":15750,"demandHappiness":15750,"medals_24h":15000,"strategy_points_24h":10},"SpaceAgeVenus":{"population":17030,"demandHappiness":17030,"medals_24h":17250,"strategy_points_24h":10},"SpaceAgeJupiterMoon":{"population":18340,"demandHappiness":18340,"medals_24h":19500,"strategy_points_24h":10},"SpaceAgeTitan":{"population":19670,"demandHappiness":19670,"medals_24h":21750,"strategy_points_24h":10},"SpaceAgeSpaceHub":{"population":21000,"demandHappiness":21000,"medals_24h":24000,"strategy_points_24h":10}}, boosts: [{"type":"att_def_boost_attacker","value":100,"feature":"battleground"},{"type":"att_def_boost_attacker","value":110,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD26A8": { prod: {"BronzeAge":{"population":410,"demandHappiness":410,"medals_24h":310,"strategy_points_24h":50},"IronAge":{"population":870,"demandHappiness":870,"medals_24h":390,"strategy_points_24h":50},"EarlyMiddleAge":{"population":1340,"demandHappiness":1340,"medals_24h":480,"strategy_points_24h":50},"HighMiddleAge":{"population":1880,"demandHappiness":1880,"medals_24h":570,"strategy_points_24h":50},"LateMiddleAge":{"population":2460,"demandHappiness":2460,"medals_24h":660,"strategy_points_24h":50},"ColonialAge":{"population":3110,"demandHappiness":3110,"medals_24h":790,"strategy_points_24h":50},"IndustrialAge":{"population":3800,"demandHappiness":3800,"medals_24h":1090,"strategy_points_24h":50},"ProgressiveEra":{"population":4540,"demandHappiness":4540,"medals_24h":1530,"strategy_points_24h":50},"ModernEra":{"population":5320,"demandHappiness":5320,"medals_24h":2190,"strategy_points_24h":50},"PostModernEra":{"population":6130,"demandHappiness":6130,"medals_24h":3060,"strategy_points_24h":50},"ContemporaryEra":{"population":6990,"demandHappiness":6990,"medals_24h":4380,"strategy_points_24h":50},"TomorrowEra":{"population":7870,"demandHappiness":7870,"medals_24h":5910,"strategy_points_24h":50},"FutureEra":{"population":8800,"demandHappiness":8800,"medals_24h":7220,"strategy_points_24h":50},"ArcticFuture":{"population":9770,"demandHappiness":9770,"medals_24h":8750,"strategy_points_24h":50},"OceanicFuture":{"population":10760,"demandHappiness":10760,"medals_24h":10060,"strategy_points_24h":50},"VirtualFuture":{"population":11780,"demandHappiness":11780,"medals_24h":12250,"strategy_points_24h":50},"SpaceAgeMars":{"population":18650,"demandHappiness":18650,"medals_24h":14880,"strategy_points_24h":50},"SpaceAgeAsteroidBelt":{"population":20250,"demandHappiness":20250,"medals_24h":17500,"strategy_points_24h":50},"SpaceAgeVenus":{"population":21890,"demandHappiness":21890,"medals_24h":20130,"strategy_points_24h":50},"SpaceAgeJupiterMoon":{"population":23570,"demandHappiness":23570,"medals_24h":22750,"strategy_points_24h":50},"SpaceAgeTitan":{"population":25290,"demandHappiness":25290,"medals_24h":25380,"strategy_points_24h":50},"SpaceAgeSpaceHub":{"population":27000,"demandHappiness":27000,"medals_24h":28000,"strategy_points_24h":50}}, boosts: [{"type":"att_def_boost_attacker","value":180,"feature":"battleground"},{"type":"att_def_boost_attacker","value":140,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD26A9": { prod: {"BronzeAge":{"population":450,"demandHappiness":450,"medals_24h":330,"strategy_points_24h":100},"IronAge":{"population":970,"demandHappiness":970,"medals_24h":420,"strategy_points_24h":100},"EarlyMiddleAge":{"population":1490,"demandHappiness":1490,"medals_24h":520,"strategy_points_24h":100},"HighMiddleAge":{"population":2090,"demandHappiness":2090,"medals_24h":610,"strategy_points_24h":100},"LateMiddleAge":{"population":2740,"demandHappiness":2740,"medals_24h":700,"strategy_points_24h":100},"ColonialAge":{"population":3460,"demandHappiness":3460,"medals_24h":840,"strategy_points_24h":100},"IndustrialAge":{"population":4220,"demandHappiness":4220,"medals_24h":1170,"strategy_points_24h":100},"ProgressiveEra":{"population":5040,"demandHappiness":5040,"medals_24h":1640,"strategy_points_24h":100},"ModernEra":{"population":5910,"demandHappiness":5910,"medals_24h":2340,"strategy_points_24h":100},"PostModernEra":{"population":6810,"demandHappiness":6810,"medals_24h":3280,"strategy_points_24h":100},"ContemporaryEra":{"population":7760,"demandHappiness":7760,"medals_24h":4690,"strategy_points_24h":100},"TomorrowEra":{"population":8750,"demandHappiness":8750,"medals_24h":6330,"strategy_points_24h":100},"FutureEra":{"population":9780,"demandHappiness":9780,"medals_24h":7730,"strategy_points_24h":100},"ArcticFuture":{"population":10850,"demandHappiness":10850,"medals_24h":9380,"strategy_points_24h":100},"OceanicFuture":{"population":11950,"demandHappiness":11950,"medals_24h":10780,"strategy_points_24h":100},"VirtualFuture":{"population":13090,"demandHappiness":13090,"medals_24h":13130,"strategy_points_24h":100},"SpaceAgeMars":{"population":20720,"demandHappiness":20720,"medals_24h":15940,"strategy_points_24h":100},"SpaceAgeAsteroidBelt":{"population":22500,"demandHappiness":22500,"medals_24h":18750,"strategy_points_24h":100},"SpaceAgeVenus":{"population":24320,"demandHappiness":24320,"medals_24h":21560,"strategy_points_24h":100},"SpaceAgeJupiterMoon":{"population":26190,"demandHappiness":26190,"medals_24h":24380,"strategy_points_24h":100},"SpaceAgeTitan":{"population":28100,"demandHappiness":28100,"medals_24h":27190,"strategy_points_24h":100},"SpaceAgeSpaceHub":{"population":30000,"demandHappiness":30000,"medals_24h":30000,"strategy_points_24h":100}}, boosts: [{"type":"att_def_boost_attacker","value":200,"feature":"battleground"},{"type":"att_def_boost_attacker","value":150,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD26A4": { prod: {"BronzeAge":{"population":230,"demandHappiness":230,"medals_24h":220},"IronAge":{"population":480,"demandHappiness":480,"medals_24h":280},"EarlyMiddleAge":{"population":740,"demandHappiness":740,"medals_24h":340},"HighMiddleAge":{"population":1040,"demandHappiness":1040,"medals_24h":410},"LateMiddleAge":{"population":1370,"demandHappiness":1370,"medals_24h":470},"ColonialAge":{"population":1730,"demandHappiness":1730,"medals_24h":560},"IndustrialAge":{"population":2110,"demandHappiness":2110,"medals_24h":780},"ProgressiveEra":{"population":2520,"demandHappiness":2520,"medals_24h":1090},"ModernEra":{"population":2950,"demandHappiness":2950,"medals_24h":1560},"PostModernEra":{"population":3410,"demandHappiness":3410,"medals_24h":2190},"ContemporaryEra":{"population":3880,"demandHappiness":3880,"medals_24h":3130},"TomorrowEra":{"population":4370,"demandHappiness":4370,"medals_24h":4220},"FutureEra":{"population":4890,"demandHappiness":4890,"medals_24h":5160},"ArcticFuture":{"population":5430,"demandHappiness":5430,"medals_24h":6250},"OceanicFuture":{"population":5980,"demandHappiness":5980,"medals_24h":7190},"VirtualFuture":{"population":6540,"demandHappiness":6540,"medals_24h":8750},"SpaceAgeMars":{"population":10360,"demandHappiness":10360,"medals_24h":10630},"SpaceAgeAsteroidBelt":{"population":11250,"demandHappiness":11250,"medals_24h":12500},"SpaceAgeVenus":{"population":12160,"demandHappiness":12160,"medals_24h":14380},"SpaceAgeJupiterMoon":{"population":13100,"demandHappiness":13100,"medals_24h":16250},"SpaceAgeTitan":{"population":14050,"demandHappiness":14050,"medals_24h":18130},"SpaceAgeSpaceHub":{"population":15000,"demandHappiness":15000,"medals_24h":20000}}, boosts: [{"type":"att_def_boost_attacker","value":25,"feature":"battleground"},{"type":"att_def_boost_attacker","value":70,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD26A7": { prod: {"BronzeAge":{"population":360,"demandHappiness":360,"medals_24h":280,"strategy_points_24h":25},"IronAge":{"population":770,"demandHappiness":770,"medals_24h":370,"strategy_points_24h":25},"EarlyMiddleAge":{"population":1190,"demandHappiness":1190,"medals_24h":450,"strategy_points_24h":25},"HighMiddleAge":{"population":1670,"demandHappiness":1670,"medals_24h":530,"strategy_points_24h":25},"LateMiddleAge":{"population":2190,"demandHappiness":2190,"medals_24h":610,"strategy_points_24h":25},"ColonialAge":{"population":2760,"demandHappiness":2760,"medals_24h":730,"strategy_points_24h":25},"IndustrialAge":{"population":3380,"demandHappiness":3380,"medals_24h":1020,"strategy_points_24h":25},"ProgressiveEra":{"population":4030,"demandHappiness":4030,"medals_24h":1420,"strategy_points_24h":25},"ModernEra":{"population":4730,"demandHappiness":4730,"medals_24h":2030,"strategy_points_24h":25},"PostModernEra":{"population":5450,"demandHappiness":5450,"medals_24h":2840,"strategy_points_24h":25},"ContemporaryEra":{"population":6210,"demandHappiness":6210,"medals_24h":4060,"strategy_points_24h":25},"TomorrowEra":{"population":7000,"demandHappiness":7000,"medals_24h":5480,"strategy_points_24h":25},"FutureEra":{"population":7830,"demandHappiness":7830,"medals_24h":6700,"strategy_points_24h":25},"ArcticFuture":{"population":8680,"demandHappiness":8680,"medals_24h":8130,"strategy_points_24h":25},"OceanicFuture":{"population":9560,"demandHappiness":9560,"medals_24h":9340,"strategy_points_24h":25},"VirtualFuture":{"population":10470,"demandHappiness":10470,"medals_24h":11380,"strategy_points_24h":25},"SpaceAgeMars":{"population":16570,"demandHappiness":16570,"medals_24h":13810,"strategy_points_24h":25},"SpaceAgeAsteroidBelt":{"population":18000,"demandHappiness":18000,"medals_24h":16250,"strategy_points_24h":25},"SpaceAgeVenus":{"population":19460,"demandHappiness":19460,"medals_24h":18690,"strategy_points_24h":25},"SpaceAgeJupiterMoon":{"population":20950,"demandHappiness":20950,"medals_24h":21130,"strategy_points_24h":25},"SpaceAgeTitan":{"population":22480,"demandHappiness":22480,"medals_24h":23560,"strategy_points_24h":25},"SpaceAgeSpaceHub":{"population":24000,"demandHappiness":24000,"medals_24h":26000,"strategy_points_24h":25}}, boosts: [{"type":"att_def_boost_attacker","value":150,"feature":"battleground"},{"type":"att_def_boost_attacker","value":130,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD26A10": { prod: {"BronzeAge":{"population":500,"demandHappiness":500,"medals_24h":350,"strategy_points_24h":150},"IronAge":{"population":1070,"demandHappiness":1070,"medals_24h":450,"strategy_points_24h":150},"EarlyMiddleAge":{"population":1630,"demandHappiness":1630,"medals_24h":550,"strategy_points_24h":150},"HighMiddleAge":{"population":2300,"demandHappiness":2300,"medals_24h":650,"strategy_points_24h":150},"LateMiddleAge":{"population":3010,"demandHappiness":3010,"medals_24h":750,"strategy_points_24h":150},"ColonialAge":{"population":3800,"demandHappiness":3800,"medals_24h":900,"strategy_points_24h":150},"IndustrialAge":{"population":4650,"demandHappiness":4650,"medals_24h":1250,"strategy_points_24h":150},"ProgressiveEra":{"population":5550,"demandHappiness":5550,"medals_24h":1750,"strategy_points_24h":150},"ModernEra":{"population":6500,"demandHappiness":6500,"medals_24h":2500,"strategy_points_24h":150},"PostModernEra":{"population":7490,"demandHappiness":7490,"medals_24h":3500,"strategy_points_24h":150},"ContemporaryEra":{"population":8540,"demandHappiness":8540,"medals_24h":5000,"strategy_points_24h":150},"TomorrowEra":{"population":9620,"demandHappiness":9620,"medals_24h":6750,"strategy_points_24h":150},"FutureEra":{"population":10760,"demandHappiness":10760,"medals_24h":8250,"strategy_points_24h":150},"ArcticFuture":{"population":11940,"demandHappiness":11940,"medals_24h":10000,"strategy_points_24h":150},"OceanicFuture":{"population":13150,"demandHappiness":13150,"medals_24h":11500,"strategy_points_24h":150},"VirtualFuture":{"population":14400,"demandHappiness":14400,"medals_24h":14000,"strategy_points_24h":150},"SpaceAgeMars":{"population":22790,"demandHappiness":22790,"medals_24h":17000,"strategy_points_24h":150},"SpaceAgeAsteroidBelt":{"population":24750,"demandHappiness":24750,"medals_24h":20000,"strategy_points_24h":150},"SpaceAgeVenus":{"population":26760,"demandHappiness":26760,"medals_24h":23000,"strategy_points_24h":150},"SpaceAgeJupiterMoon":{"population":28810,"demandHappiness":28810,"medals_24h":26000,"strategy_points_24h":150},"SpaceAgeTitan":{"population":30910,"demandHappiness":30910,"medals_24h":29000,"strategy_points_24h":150},"SpaceAgeSpaceHub":{"population":33000,"demandHappiness":33000,"medals_24h":32000,"strategy_points_24h":150}}, boosts: [{"type":"att_def_boost_attacker","value":250,"feature":"battleground"},{"type":"att_def_boost_attacker","value":170,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD25B2": { prod: {"BronzeAge":{"population":-290,"happiness":1320},"IronAge":{"population":-620,"happiness":2280},"EarlyMiddleAge":{"population":-950,"happiness":2520},"HighMiddleAge":{"population":-1340,"happiness":2810},"LateMiddleAge":{"population":-1750,"happiness":3140},"ColonialAge":{"population":-2210,"happiness":3690},"IndustrialAge":{"population":-2710,"happiness":4160},"ProgressiveEra":{"population":-3230,"happiness":4570},"ModernEra":{"population":-3790,"happiness":4890},"PostModernEra":{"population":-4360,"happiness":5090},"ContemporaryEra":{"population":-4970,"happiness":5920},"TomorrowEra":{"population":-5600,"happiness":7190},"FutureEra":{"population":-6270,"happiness":8610},"ArcticFuture":{"population":-6950,"happiness":10030},"OceanicFuture":{"population":-7660,"happiness":11570},"VirtualFuture":{"population":-8390,"happiness":13820},"SpaceAgeMars":{"population":-13270,"happiness":22120},"SpaceAgeAsteroidBelt":{"population":-14420,"happiness":24040},"SpaceAgeVenus":{"population":-15580,"happiness":25970},"SpaceAgeJupiterMoon":{"population":-16780,"happiness":27970},"SpaceAgeTitan":{"population":-18000,"happiness":30000},"SpaceAgeSpaceHub":{"population":-19220,"happiness":32030}}, boosts: [{"type":"att_boost_attacker","value":12,"feature":"guild_raids"},{"type":"def_boost_attacker","value":16,"feature":"all"},{"type":"att_def_boost_defender","value":16,"feature":"all"},{"type":"att_def_boost_defender","value":22,"feature":"battleground"},{"type":"guild_raids_coins_production","value":4,"feature":"all"},{"type":"guild_raids_supplies_production","value":4,"feature":"all"},{"type":"guild_raids_coins_start","value":20000,"feature":"all"},{"type":"guild_raids_supplies_start","value":20000,"feature":"all"}] },
+    "W_MultiAge_WILD26B2": { prod: {"BronzeAge":{"population":-300,"medals_24h":50,"strategy_points_24h":45},"IronAge":{"population":-650,"medals_24h":70,"strategy_points_24h":45},"EarlyMiddleAge":{"population":-990,"medals_24h":90,"strategy_points_24h":45},"HighMiddleAge":{"population":-1390,"medals_24h":100,"strategy_points_24h":45},"LateMiddleAge":{"population":-1830,"medals_24h":120,"strategy_points_24h":45},"ColonialAge":{"population":-2300,"medals_24h":140,"strategy_points_24h":45},"IndustrialAge":{"population":-2820,"medals_24h":200,"strategy_points_24h":45},"ProgressiveEra":{"population":-3360,"medals_24h":270,"strategy_points_24h":45},"ModernEra":{"population":-3940,"medals_24h":390,"strategy_points_24h":45},"PostModernEra":{"population":-4540,"medals_24h":550,"strategy_points_24h":45},"ContemporaryEra":{"population":-5180,"medals_24h":780,"strategy_points_24h":45},"TomorrowEra":{"population":-5830,"medals_24h":1050,"strategy_points_24h":45},"FutureEra":{"population":-6520,"medals_24h":1290,"strategy_points_24h":45},"ArcticFuture":{"population":-7230,"medals_24h":1560,"strategy_points_24h":45},"OceanicFuture":{"population":-7970,"medals_24h":1800,"strategy_points_24h":45},"VirtualFuture":{"population":-8730,"medals_24h":2190,"strategy_points_24h":45},"SpaceAgeMars":{"population":-13810,"medals_24h":2660,"strategy_points_24h":45},"SpaceAgeAsteroidBelt":{"population":-15000,"medals_24h":3130,"strategy_points_24h":45},"SpaceAgeVenus":{"population":-16220,"medals_24h":3590,"strategy_points_24h":45},"SpaceAgeJupiterMoon":{"population":-17460,"medals_24h":4060,"strategy_points_24h":45},"SpaceAgeTitan":{"population":-18730,"medals_24h":4530,"strategy_points_24h":45},"SpaceAgeSpaceHub":{"population":-20000,"medals_24h":5000,"strategy_points_24h":45}}, boosts: [{"type":"att_def_boost_defender","value":42,"feature":"all"},{"type":"att_def_boost_defender","value":42,"feature":"guild_expedition"},{"type":"att_def_boost_defender","value":20,"feature":"guild_raids"},{"type":"guild_raids_coins_start","value":20000,"feature":"all"},{"type":"guild_raids_units_start","value":5,"feature":"all"}] },
+    "W_MultiAge_WILD25C2": { prod: {"AllAge":{"all_goods_of_age_24h":29.8},"BronzeAge":{"population":-100},"IronAge":{"population":-210},"EarlyMiddleAge":{"population":-320},"HighMiddleAge":{"population":-450},"LateMiddleAge":{"population":-580},"ColonialAge":{"population":-740},"IndustrialAge":{"population":-900},"ProgressiveEra":{"population":-1080},"ModernEra":{"population":-1260},"PostModernEra":{"population":-1450},"ContemporaryEra":{"population":-1660},"TomorrowEra":{"population":-1870},"FutureEra":{"population":-2090},"ArcticFuture":{"population":-2320},"OceanicFuture":{"population":-2550},"VirtualFuture":{"population":-2800},"SpaceAgeMars":{"population":-4420},"SpaceAgeAsteroidBelt":{"population":-4810},"SpaceAgeVenus":{"population":-5190},"SpaceAgeJupiterMoon":{"population":-5590},"SpaceAgeTitan":{"population":-6000},"SpaceAgeSpaceHub":{"population":-6410}}, boosts: [{"type":"att_boost_attacker","value":4,"feature":"battleground"},{"type":"att_def_boost_attacker","value":4,"feature":"all"},{"type":"att_def_boost_attacker","value":10,"feature":"guild_expedition"},{"type":"guild_raids_goods_start","value":10,"feature":"all"},{"type":"guild_raids_units_start","value":5,"feature":"all"}] },
+    "W_MultiAge_WILD26C2": { prod: {"BronzeAge":{"population":-300,"medals_24h":50,"strategy_points_24h":60},"IronAge":{"population":-650,"medals_24h":70,"strategy_points_24h":60},"EarlyMiddleAge":{"population":-990,"medals_24h":90,"strategy_points_24h":60},"HighMiddleAge":{"population":-1390,"medals_24h":100,"strategy_points_24h":60},"LateMiddleAge":{"population":-1830,"medals_24h":120,"strategy_points_24h":60},"ColonialAge":{"population":-2300,"medals_24h":140,"strategy_points_24h":60},"IndustrialAge":{"population":-2820,"medals_24h":200,"strategy_points_24h":60},"ProgressiveEra":{"population":-3360,"medals_24h":270,"strategy_points_24h":60},"ModernEra":{"population":-3940,"medals_24h":390,"strategy_points_24h":60},"PostModernEra":{"population":-4540,"medals_24h":550,"strategy_points_24h":60},"ContemporaryEra":{"population":-5180,"medals_24h":780,"strategy_points_24h":60},"TomorrowEra":{"population":-5830,"medals_24h":1050,"strategy_points_24h":60},"FutureEra":{"population":-6520,"medals_24h":1290,"strategy_points_24h":60},"ArcticFuture":{"population":-7230,"medals_24h":1560,"strategy_points_24h":60},"OceanicFuture":{"population":-7970,"medals_24h":1800,"strategy_points_24h":60},"VirtualFuture":{"population":-8730,"medals_24h":2190,"strategy_points_24h":60},"SpaceAgeMars":{"population":-13810,"medals_24h":2660,"strategy_points_24h":60},"SpaceAgeAsteroidBelt":{"population":-15000,"medals_24h":3130,"strategy_points_24h":60},"SpaceAgeVenus":{"population":-16220,"medals_24h":3590,"strategy_points_24h":60},"SpaceAgeJupiterMoon":{"population":-17460,"medals_24h":4060,"strategy_points_24h":60},"SpaceAgeTitan":{"population":-18730,"medals_24h":4530,"strategy_points_24h":60},"SpaceAgeSpaceHub":{"population":-20000,"medals_24h":5000,"strategy_points_24h":60}}, boosts: [{"type":"def_boost_attacker","value":60,"feature":"battleground"},{"type":"def_boost_attacker","value":25,"feature":"guild_raids"},{"type":"att_boost_defender","value":60,"feature":"battleground"},{"type":"guild_raids_supplies_start","value":20000,"feature":"all"},{"type":"guild_raids_supplies_production","value":2,"feature":"all"},{"type":"guild_raids_goods_start","value":5,"feature":"all"}] },
+    "W_MultiAge_WILD22A12": { prod: {"BronzeAge":{"population":450,"happiness":2480,"demandHappiness":450,"money_24h":2560,"medals_24h":330,"strategy_points_24h":250,"random_good_of_age_24h":108,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"IronAge":{"population":970,"happiness":4270,"demandHappiness":970,"money_24h":6150,"medals_24h":420,"strategy_points_24h":250,"random_good_of_age_24h":110,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"EarlyMiddleAge":{"population":1490,"happiness":4730,"demandHappiness":1490,"money_24h":10250,"medals_24h":520,"strategy_points_24h":250,"random_good_of_age_24h":112,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"HighMiddleAge":{"population":2090,"happiness":5270,"demandHappiness":2090,"money_24h":14350,"medals_24h":610,"strategy_points_24h":250,"random_good_of_age_24h":114,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"LateMiddleAge":{"population":2740,"happiness":5880,"demandHappiness":2740,"money_24h":18960,"medals_24h":700,"strategy_points_24h":250,"random_good_of_age_24h":116,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"ColonialAge":{"population":3460,"happiness":6910,"demandHappiness":3460,"money_24h":28870,"medals_24h":840,"strategy_points_24h":250,"random_good_of_age_24h":118,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"IndustrialAge":{"population":4220,"happiness":7800,"demandHappiness":4220,"money_24h":35970,"medals_24h":1170,"strategy_points_24h":250,"random_good_of_age_24h":120,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"ProgressiveEra":{"population":5040,"happiness":8560,"demandHappiness":5040,"money_24h":43650,"medals_24h":1640,"strategy_points_24h":250,"random_good_of_age_24h":122,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"ModernEra":{"population":5910,"happiness":9160,"demandHappiness":5910,"money_24h":54310,"medals_24h":2340,"strategy_points_24h":250,"random_good_of_age_24h":124,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"PostModernEra":{"population":6810,"happiness":9550,"demandHappiness":6810,"money_24h":68330,"medals_24h":3280,"strategy_points_24h":250,"random_good_of_age_24h":126,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"ContemporaryEra":{"population":7760,"happiness":11090,"demandHappiness":7760,"money_24h":88950,"medals_24h":4690,"strategy_points_24h":250,"random_good_of_age_24h":128,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"TomorrowEra":{"population":8750,"happiness":13460,"demandHappiness":8750,"money_24h":102990,"medals_24h":6330,"strategy_points_24h":250,"random_good_of_age_24h":130,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"FutureEra":{"population":9780,"happiness":16130,"demandHappiness":9780,"money_24h":118050,"medals_24h":7730,"strategy_points_24h":250,"random_good_of_age_24h":132,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"ArcticFuture":{"population":10850,"happiness":18780,"demandHappiness":10850,"money_24h":134140,"medals_24h":9380,"strategy_points_24h":250,"random_good_of_age_24h":134,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"OceanicFuture":{"population":11950,"happiness":21680,"demandHappiness":11950,"money_24h":151260,"medals_24h":10780,"strategy_points_24h":250,"random_good_of_age_24h":136,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"VirtualFuture":{"population":13090,"happiness":25900,"demandHappiness":13090,"money_24h":169420,"medals_24h":13130,"strategy_points_24h":250,"random_good_of_age_24h":138,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"SpaceAgeMars":{"population":20720,"happiness":41440,"demandHappiness":20720,"money_24h":282990,"medals_24h":15940,"strategy_points_24h":250,"random_good_of_age_24h":140,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"SpaceAgeAsteroidBelt":{"population":22500,"happiness":45030,"demandHappiness":22500,"money_24h":313450,"medals_24h":18750,"strategy_points_24h":250,"random_good_of_age_24h":142,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"SpaceAgeVenus":{"population":24320,"happiness":48650,"demandHappiness":24320,"money_24h":345530,"medals_24h":21560,"strategy_points_24h":250,"random_good_of_age_24h":144,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"SpaceAgeJupiterMoon":{"population":26190,"happiness":52410,"demandHappiness":26190,"money_24h":379240,"medals_24h":24380,"strategy_points_24h":250,"random_good_of_age_24h":146,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"SpaceAgeTitan":{"population":28100,"happiness":56200,"demandHappiness":28100,"money_24h":414620,"medals_24h":27190,"strategy_points_24h":250,"random_good_of_age_24h":148,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0},"SpaceAgeSpaceHub":{"population":30000,"happiness":60000,"demandHappiness":30000,"money_24h":450000,"medals_24h":30000,"strategy_points_24h":250,"random_good_of_age_24h":150,"random_good_of_previous_age_24h":100.0,"random_good_of_next_age_24h":100.0}}, boosts: [{"type":"att_def_boost_defender","value":25,"feature":"guild_raids"},{"type":"att_def_boost_attacker_defender","value":229,"feature":"all"},{"type":"guild_raids_action_points_capacity","value":4000,"feature":"all"}] },
+    "W_MultiAge_WILD24A1": { prod: {"BronzeAge":{"happiness":130,"strategy_points_24h":1},"IronAge":{"happiness":230,"strategy_points_24h":1},"EarlyMiddleAge":{"happiness":250,"strategy_points_24h":2},"HighMiddleAge":{"happiness":280,"strategy_points_24h":2},"LateMiddleAge":{"happiness":310,"strategy_points_24h":3},"ColonialAge":{"happiness":370,"strategy_points_24h":3},"IndustrialAge":{"happiness":420,"strategy_points_24h":4},"ProgressiveEra":{"happiness":460,"strategy_points_24h":4},"ModernEra":{"happiness":490,"strategy_points_24h":5},"PostModernEra":{"happiness":510,"strategy_points_24h":5},"ContemporaryEra":{"happiness":590,"strategy_points_24h":6},"TomorrowEra":{"happiness":720,"strategy_points_24h":6},"FutureEra":{"happiness":860,"strategy_points_24h":7},"ArcticFuture":{"happiness":1000,"strategy_points_24h":7},"OceanicFuture":{"happiness":1160,"strategy_points_24h":8},"VirtualFuture":{"happiness":1380,"strategy_points_24h":8},"SpaceAgeMars":{"happiness":2210,"strategy_points_24h":9},"SpaceAgeAsteroidBelt":{"happiness":2400,"strategy_points_24h":9},"SpaceAgeVenus":{"happiness":2600,"strategy_points_24h":10},"SpaceAgeJupiterMoon":{"happiness":2800,"strategy_points_24h":10},"SpaceAgeTitan":{"happiness":3000,"strategy_points_24h":11},"SpaceAgeSpaceHub":{"happiness":3200,"strategy_points_24h":11}} },
+    "W_MultiAge_WILD24A10": { prod: {"BronzeAge":{"happiness":1320,"strategy_points_24h":11,"all_goods_of_age_24h":30},"IronAge":{"happiness":2280,"strategy_points_24h":11,"all_goods_of_age_24h":30},"EarlyMiddleAge":{"happiness":2520,"strategy_points_24h":12,"all_goods_of_age_24h":30},"HighMiddleAge":{"happiness":2810,"strategy_points_24h":12,"all_goods_of_age_24h":30},"LateMiddleAge":{"happiness":3140,"strategy_points_24h":13,"all_goods_of_age_24h":30},"ColonialAge":{"happiness":3690,"strategy_points_24h":13,"all_goods_of_age_24h":35},"IndustrialAge":{"happiness":4160,"strategy_points_24h":14,"all_goods_of_age_24h":35},"ProgressiveEra":{"happiness":4570,"strategy_points_24h":14,"all_goods_of_age_24h":35},"ModernEra":{"happiness":4890,"strategy_points_24h":15,"all_goods_of_age_24h":35},"PostModernEra":{"happiness":5090,"strategy_points_24h":15,"all_goods_of_age_24h":35},"ContemporaryEra":{"happiness":5920,"strategy_points_24h":16,"all_goods_of_age_24h":40},"TomorrowEra":{"happiness":7190,"strategy_points_24h":16,"all_goods_of_age_24h":40},"FutureEra":{"happiness":8610,"strategy_points_24h":17,"all_goods_of_age_24h":40},"ArcticFuture":{"happiness":10030,"strategy_points_24h":17,"all_goods_of_age_24h":40},"OceanicFuture":{"happiness":11570,"strategy_points_24h":18,"all_goods_of_age_24h":40},"VirtualFuture":{"happiness":13820,"strategy_points_24h":18,"all_goods_of_age_24h":45},"SpaceAgeMars":{"happiness":22120,"strategy_points_24h":19,"all_goods_of_age_24h":45},"SpaceAgeAsteroidBelt":{"happiness":24040,"strategy_points_24h":19,"all_goods_of_age_24h":45},"SpaceAgeVenus":{"happiness":25970,"strategy_points_24h":20,"all_goods_of_age_24h":45},"SpaceAgeJupiterMoon":{"happiness":27970,"strategy_points_24h":20,"all_goods_of_age_24h":45},"SpaceAgeTitan":{"happiness":30000,"strategy_points_24h":21,"all_goods_of_age_24h":50},"SpaceAgeSpaceHub":{"happiness":32030,"strategy_points_24h":21,"all_goods_of_age_24h":50}}, boosts: [{"type":"att_boost_attacker","value":8,"feature":"all"},{"type":"def_boost_attacker","value":13,"feature":"all"}] },
+    "W_MultiAge_WILD24A11": { prod: {"BronzeAge":{"happiness":1460,"strategy_points_24h":13,"all_goods_of_age_24h":40},"IronAge":{"happiness":2510,"strategy_points_24h":13,"all_goods_of_age_24h":40},"EarlyMiddleAge":{"happiness":2770,"strategy_points_24h":14,"all_goods_of_age_24h":40},"HighMiddleAge":{"happiness":3100,"strategy_points_24h":14,"all_goods_of_age_24h":40},"LateMiddleAge":{"happiness":3450,"strategy_points_24h":15,"all_goods_of_age_24h":40},"ColonialAge":{"happiness":4060,"strategy_points_24h":15,"all_goods_of_age_24h":45},"IndustrialAge":{"happiness":4580,"strategy_points_24h":16,"all_goods_of_age_24h":45},"ProgressiveEra":{"happiness":5030,"strategy_points_24h":16,"all_goods_of_age_24h":45},"ModernEra":{"happiness":5380,"strategy_points_24h":17,"all_goods_of_age_24h":45},"PostModernEra":{"happiness":5600,"strategy_points_24h":17,"all_goods_of_age_24h":45},"ContemporaryEra":{"happiness":6510,"strategy_points_24h":18,"all_goods_of_age_24h":50},"TomorrowEra":{"happiness":7910,"strategy_points_24h":18,"all_goods_of_age_24h":50},"FutureEra":{"happiness":9470,"strategy_points_24h":19,"all_goods_of_age_24h":50},"ArcticFuture":{"happiness":11030,"strategy_points_24h":19,"all_goods_of_age_24h":50},"OceanicFuture":{"happiness":12730,"strategy_points_24h":20,"all_goods_of_age_24h":50},"VirtualFuture":{"happiness":15210,"strategy_points_24h":20,"all_goods_of_age_24h":55},"SpaceAgeMars":{"happiness":24330,"strategy_points_24h":21,"all_goods_of_age_24h":55},"SpaceAgeAsteroidBelt":{"happiness":26440,"strategy_points_24h":21,"all_goods_of_age_24h":55},"SpaceAgeVenus":{"happiness":28560,"strategy_points_24h":22,"all_goods_of_age_24h":55},"SpaceAgeJupiterMoon":{"happiness":30770,"strategy_points_24h":22,"all_goods_of_age_24h":55},"SpaceAgeTitan":{"happiness":33000,"strategy_points_24h":23,"all_goods_of_age_24h":60},"SpaceAgeSpaceHub":{"happiness":35230,"strategy_points_24h":23,"all_goods_of_age_24h":60}}, boosts: [{"type":"att_boost_attacker","value":10,"feature":"all"},{"type":"att_boost_attacker","value":10,"feature":"battleground"},{"type":"def_boost_attacker","value":15,"feature":"all"},{"type":"def_boost_attacker","value":15,"feature":"battleground"}] },
+    "W_MultiAge_WILD24A2": { prod: {"BronzeAge":{"happiness":260,"strategy_points_24h":2},"IronAge":{"happiness":460,"strategy_points_24h":2},"EarlyMiddleAge":{"happiness":500,"strategy_points_24h":3},"HighMiddleAge":{"happiness":560,"strategy_points_24h":3},"LateMiddleAge":{"happiness":630,"strategy_points_24h":4},"ColonialAge":{"happiness":740,"strategy_points_24h":4},"IndustrialAge":{"happiness":830,"strategy_points_24h":5},"ProgressiveEra":{"happiness":910,"strategy_points_24h":5},"ModernEra":{"happiness":980,"strategy_points_24h":6},"PostModernEra":{"happiness":1020,"strategy_points_24h":6},"ContemporaryEra":{"happiness":1180,"strategy_points_24h":7},"TomorrowEra":{"happiness":1440,"strategy_points_24h":7},"FutureEra":{"happiness":1720,"strategy_points_24h":8},"ArcticFuture":{"happiness":2010,"strategy_points_24h":8},"OceanicFuture":{"happiness":2310,"strategy_points_24h":9},"VirtualFuture":{"happiness":2760,"strategy_points_24h":9},"SpaceAgeMars":{"happiness":4420,"strategy_points_24h":10},"SpaceAgeAsteroidBelt":{"happiness":4810,"strategy_points_24h":10},"SpaceAgeVenus":{"happiness":5190,"strategy_points_24h":11},"SpaceAgeJupiterMoon":{"happiness":5590,"strategy_points_24h":11},"SpaceAgeTitan":{"happiness":6000,"strategy_points_24h":12},"SpaceAgeSpaceHub":{"happiness":6410,"strategy_points_24h":12}} },
+    "W_MultiAge_WILD24A3": { prod: {"BronzeAge":{"happiness":400,"strategy_points_24h":3},"IronAge":{"happiness":680,"strategy_points_24h":3},"EarlyMiddleAge":{"happiness":760,"strategy_points_24h":4},"HighMiddleAge":{"happiness":840,"strategy_points_24h":4},"LateMiddleAge":{"happiness":940,"strategy_points_24h":5},"ColonialAge":{"happiness":1110,"strategy_points_24h":5},"IndustrialAge":{"happiness":1250,"strategy_points_24h":6},"ProgressiveEra":{"happiness":1370,"strategy_points_24h":6},"ModernEra":{"happiness":1470,"strategy_points_24h":7},"PostModernEra":{"happiness":1530,"strategy_points_24h":7},"ContemporaryEra":{"happiness":1780,"strategy_points_24h":8},"TomorrowEra":{"happiness":2160,"strategy_points_24h":8},"FutureEra":{"happiness":2580,"strategy_points_24h":9},"ArcticFuture":{"happiness":3010,"strategy_points_24h":9},"OceanicFuture":{"happiness":3470,"strategy_points_24h":10},"VirtualFuture":{"happiness":4150,"strategy_points_24h":10},"SpaceAgeMars":{"happiness":6640,"strategy_points_24h":11},"SpaceAgeAsteroidBelt":{"happiness":7210,"strategy_points_24h":11},"SpaceAgeVenus":{"happiness":7790,"strategy_points_24h":12},"SpaceAgeJupiterMoon":{"happiness":8390,"strategy_points_24h":12},"SpaceAgeTitan":{"happiness":9000,"strategy_points_24h":13},"SpaceAgeSpaceHub":{"happiness":9610,"strategy_points_24h":13}} },
+    "W_MultiAge_WILD24A4": { prod: {"BronzeAge":{"happiness":530,"strategy_points_24h":4},"IronAge":{"happiness":910,"strategy_points_24h":4},"EarlyMiddleAge":{"happiness":1010,"strategy_points_24h":5},"HighMiddleAge":{"happiness":1130,"strategy_points_24h":5},"LateMiddleAge":{"happiness":1260,"strategy_points_24h":6},"ColonialAge":{"happiness":1480,"strategy_points_24h":6},"IndustrialAge":{"happiness":1660,"strategy_points_24h":7},"ProgressiveEra":{"happiness":1830,"strategy_points_24h":7},"ModernEra":{"happiness":1960,"strategy_points_24h":8},"PostModernEra":{"happiness":2040,"strategy_points_24h":8},"ContemporaryEra":{"happiness":2370,"strategy_points_24h":9},"TomorrowEra":{"happiness":2870,"strategy_points_24h":9},"FutureEra":{"happiness":3440,"strategy_points_24h":10},"ArcticFuture":{"happiness":4010,"strategy_points_24h":10},"OceanicFuture":{"happiness":4630,"strategy_points_24h":11},"VirtualFuture":{"happiness":5530,"strategy_points_24h":11},"SpaceAgeMars":{"happiness":8850,"strategy_points_24h":12},"SpaceAgeAsteroidBelt":{"happiness":9610,"strategy_points_24h":12},"SpaceAgeVenus":{"happiness":10390,"strategy_points_24h":13},"SpaceAgeJupiterMoon":{"happiness":11190,"strategy_points_24h":13},"SpaceAgeTitan":{"happiness":12000,"strategy_points_24h":14},"SpaceAgeSpaceHub":{"happiness":12810,"strategy_points_24h":14}}, boosts: [{"type":"def_boost_attacker","value":1,"feature":"all"}] },
+    "W_MultiAge_WILD24A5": { prod: {"BronzeAge":{"happiness":660,"strategy_points_24h":5,"all_goods_of_age_24h":5},"IronAge":{"happiness":1140,"strategy_points_24h":5,"all_goods_of_age_24h":5},"EarlyMiddleAge":{"happiness":1260,"strategy_points_24h":6,"all_goods_of_age_24h":5},"HighMiddleAge":{"happiness":1410,"strategy_points_24h":6,"all_goods_of_age_24h":5},"LateMiddleAge":{"happiness":1570,"strategy_points_24h":7,"all_goods_of_age_24h":5},"ColonialAge":{"happiness":1850,"strategy_points_24h":7,"all_goods_of_age_24h":10},"IndustrialAge":{"happiness":2080,"strategy_points_24h":8,"all_goods_of_age_24h":10},"ProgressiveEra":{"happiness":2290,"strategy_points_24h":8,"all_goods_of_age_24h":10},"ModernEra":{"happiness":2450,"strategy_points_24h":9,"all_goods_of_age_24h":10},"PostModernEra":{"happiness":2550,"strategy_points_24h":9,"all_goods_of_age_24h":10},"ContemporaryEra":{"happiness":2960,"strategy_points_24h":10,"all_goods_of_age_24h":15},"TomorrowEra":{"happiness":3590,"strategy_points_24h":10,"all_goods_of_age_24h":15},"FutureEra":{"happiness":4310,"strategy_points_24h":11,"all_goods_of_age_24h":15},"ArcticFuture":{"happiness":5010,"strategy_points_24h":11,"all_goods_of_age_24h":15},"OceanicFuture":{"happiness":5790,"strategy_points_24h":12,"all_goods_of_age_24h":15},"VirtualFuture":{"happiness":6910,"strategy_points_24h":12,"all_goods_of_age_24h":20},"SpaceAgeMars":{"happiness":11060,"strategy_points_24h":13,"all_goods_of_age_24h":20},"SpaceAgeAsteroidBelt":{"happiness":12020,"strategy_points_24h":13,"all_goods_of_age_24h":20},"SpaceAgeVenus":{"happiness":12980,"strategy_points_24h":14,"all_goods_of_age_24h":20},"SpaceAgeJupiterMoon":{"happiness":13990,"strategy_points_24h":14,"all_goods_of_age_24h":20},"SpaceAgeTitan":{"happiness":15000,"strategy_points_24h":15,"all_goods_of_age_24h":25},"SpaceAgeSpaceHub":{"happiness":16010,"strategy_points_24h":15,"all_goods_of_age_24h":25}}, boosts: [{"type":"def_boost_attacker","value":3,"feature":"all"}] },
+    "W_MultiAge_WILD24A6": { prod: {"BronzeAge":{"happiness":790,"strategy_points_24h":6,"all_goods_of_age_24h":10},"IronAge":{"happiness":1370,"strategy_points_24h":6,"all_goods_of_age_24h":10},"EarlyMiddleAge":{"happiness":1510,"strategy_points_24h":7,"all_goods_of_age_24h":10},"HighMiddleAge":{"happiness":1690,"strategy_points_24h":7,"all_goods_of_age_24h":10},"LateMiddleAge":{"happiness":1880,"strategy_points_24h":8,"all_goods_of_age_24h":10},"ColonialAge":{"happiness":2210,"strategy_points_24h":8,"all_goods_of_age_24h":15},"IndustrialAge":{"happiness":2500,"strategy_points_24h":9,"all_goods_of_age_24h":15},"ProgressiveEra":{"happiness":2740,"strategy_points_24h":9,"all_goods_of_age_24h":15},"ModernEra":{"happiness":2930,"strategy_points_24h":10,"all_goods_of_age_24h":15},"PostModernEra":{"happiness":3060,"strategy_points_24h":10,"all_goods_of_age_24h":15},"ContemporaryEra":{"happiness":3550,"strategy_points_24h":11,"all_goods_of_age_24h":20},"TomorrowEra":{"happiness":4310,"strategy_points_24h":11,"all_goods_of_age_24h":20},"FutureEra":{"happiness":5170,"strategy_points_24h":12,"all_goods_of_age_24h":20},"ArcticFuture":{"happiness":6020,"strategy_points_24h":12,"all_goods_of_age_24h":20},"OceanicFuture":{"happiness":6940,"strategy_points_24h":13,"all_goods_of_age_24h":20},"VirtualFuture":{"happiness":8290,"strategy_points_24h":13,"all_goods_of_age_24h":25},"SpaceAgeMars":{"happiness":13270,"strategy_points_24h":14,"all_goods_of_age_24h":25},"SpaceAgeAsteroidBelt":{"happiness":14420,"strategy_points_24h":14,"all_goods_of_age_24h":25},"SpaceAgeVenus":{"happiness":15580,"strategy_points_24h":15,"all_goods_of_age_24h":25},"SpaceAgeJupiterMoon":{"happiness":16780,"strategy_points_24h":15,"all_goods_of_age_24h":25},"SpaceAgeTitan":{"happiness":18000,"strategy_points_24h":16,"all_goods_of_age_24h":30},"SpaceAgeSpaceHub":{"happiness":19220,"strategy_points_24h":16,"all_goods_of_age_24h":30}}, boosts: [{"type":"def_boost_attacker","value":5,"feature":"all"}] },
+    "W_MultiAge_WILD24A7": { prod: {"BronzeAge":{"happiness":930,"strategy_points_24h":7,"all_goods_of_age_24h":15},"IronAge":{"happiness":1600,"strategy_points_24h":7,"all_goods_of_age_24h":15},"EarlyMiddleAge":{"happiness":1770,"strategy_points_24h":8,"all_goods_of_age_24h":15},"HighMiddleAge":{"happiness":1970,"strategy_points_24h":8,"all_goods_of_age_24h":15},"LateMiddleAge":{"happiness":2200,"strategy_points_24h":9,"all_goods_of_age_24h":15},"ColonialAge":{"happiness":2580,"strategy_points_24h":9,"all_goods_of_age_24h":20},"IndustrialAge":{"happiness":2910,"strategy_points_24h":10,"all_goods_of_age_24h":20},"ProgressiveEra":{"happiness":3200,"strategy_points_24h":10,"all_goods_of_age_24h":20},"ModernEra":{"happiness":3420,"strategy_points_24h":11,"all_goods_of_age_24h":20},"PostModernEra":{"happiness":3570,"strategy_points_24h":11,"all_goods_of_age_24h":20},"ContemporaryEra":{"happiness":4140,"strategy_points_24h":12,"all_goods_of_age_24h":25},"TomorrowEra":{"happiness":5030,"strategy_points_24h":12,"all_goods_of_age_24h":25},"FutureEra":{"happiness":6030,"strategy_points_24h":13,"all_goods_of_age_24h":25},"ArcticFuture":{"happiness":7020,"strategy_points_24h":13,"all_goods_of_age_24h":25},"OceanicFuture":{"happiness":8100,"strategy_points_24h":14,"all_goods_of_age_24h":25},"VirtualFuture":{"happiness":9680,"strategy_points_24h":14,"all_goods_of_age_24h":30},"SpaceAgeMars":{"happiness":15480,"strategy_points_24h":15,"all_goods_of_age_24h":30},"SpaceAgeAsteroidBelt":{"happiness":16830,"strategy_points_24h":15,"all_goods_of_age_24h":30},"SpaceAgeVenus":{"happiness":18180,"strategy_points_24h":16,"all_goods_of_age_24h":30},"SpaceAgeJupiterMoon":{"happiness":19580,"strategy_points_24h":16,"all_goods_of_age_24h":30},"SpaceAgeTitan":{"happiness":21000,"strategy_points_24h":17,"all_goods_of_age_24h":35},"SpaceAgeSpaceHub":{"happiness":22420,"strategy_points_24h":17,"all_goods_of_age_24h":35}}, boosts: [{"type":"att_boost_attacker","value":2,"feature":"all"},{"type":"def_boost_attacker","value":7,"feature":"all"}] },
+    "W_MultiAge_WILD24A8": { prod: {"BronzeAge":{"happiness":1060,"strategy_points_24h":8,"all_goods_of_age_24h":20},"IronAge":{"happiness":1830,"strategy_points_24h":8,"all_goods_of_age_24h":20},"EarlyMiddleAge":{"happiness":2020,"strategy_points_24h":9,"all_goods_of_age_24h":20},"HighMiddleAge":{"happiness":2250,"strategy_points_24h":9,"all_goods_of_age_24h":20},"LateMiddleAge":{"happiness":2510,"strategy_points_24h":10,"all_goods_of_age_24h":20},"ColonialAge":{"happiness":2950,"strategy_points_24h":10,"all_goods_of_age_24h":25},"IndustrialAge":{"happiness":3330,"strategy_points_24h":11,"all_goods_of_age_24h":25},"ProgressiveEra":{"happiness":3660,"strategy_points_24h":11,"all_goods_of_age_24h":25},"ModernEra":{"happiness":3910,"strategy_points_24h":12,"all_goods_of_age_24h":25},"PostModernEra":{"happiness":4080,"strategy_points_24h":12,"all_goods_of_age_24h":25},"ContemporaryEra":{"happiness":4740,"strategy_points_24h":13,"all_goods_of_age_24h":30},"TomorrowEra":{"happiness":5750,"strategy_points_24h":13,"all_goods_of_age_24h":30},"FutureEra":{"happiness":6890,"strategy_points_24h":14,"all_goods_of_age_24h":30},"ArcticFuture":{"happiness":8020,"strategy_points_24h":14,"all_goods_of_age_24h":30},"OceanicFuture":{"happiness":9260,"strategy_points_24h":15,"all_goods_of_age_24h":30},"VirtualFuture":{"happiness":11060,"strategy_points_24h":15,"all_goods_of_age_24h":35},"SpaceAgeMars":{"happiness":17690,"strategy_points_24h":16,"all_goods_of_age_24h":35},"SpaceAgeAsteroidBelt":{"happiness":19230,"strategy_points_24h":16,"all_goods_of_age_24h":35},"SpaceAgeVenus":{"happiness":20770,"strategy_points_24h":17,"all_goods_of_age_24h":35},"SpaceAgeJupiterMoon":{"happiness":22380,"strategy_points_24h":17,"all_goods_of_age_24h":35},"SpaceAgeTitan":{"happiness":24000,"strategy_points_24h":18,"all_goods_of_age_24h":40},"SpaceAgeSpaceHub":{"happiness":25620,"strategy_points_24h":18,"all_goods_of_age_24h":40}}, boosts: [{"type":"att_boost_attacker","value":4,"feature":"all"},{"type":"def_boost_attacker","value":9,"feature":"all"}] },
+    "W_MultiAge_WILD24A9": { prod: {"BronzeAge":{"happiness":1190,"strategy_points_24h":9,"all_goods_of_age_24h":25},"IronAge":{"happiness":2050,"strategy_points_24h":9,"all_goods_of_age_24h":25},"EarlyMiddleAge":{"happiness":2270,"strategy_points_24h":10,"all_goods_of_age_24h":25},"HighMiddleAge":{"happiness":2530,"strategy_points_24h":10,"all_goods_of_age_24h":25},"LateMiddleAge":{"happiness":2830,"strategy_points_24h":11,"all_goods_of_age_24h":25},"ColonialAge":{"happiness":3320,"strategy_points_24h":11,"all_goods_of_age_24h":30},"IndustrialAge":{"happiness":3750,"strategy_points_24h":12,"all_goods_of_age_24h":30},"ProgressiveEra":{"happiness":4110,"strategy_points_24h":12,"all_goods_of_age_24h":30},"ModernEra":{"happiness":4400,"strategy_points_24h":13,"all_goods_of_age_24h":30},"PostModernEra":{"happiness":4590,"strategy_points_24h":13,"all_goods_of_age_24h":30},"ContemporaryEra":{"happiness":5330,"strategy_points_24h":14,"all_goods_of_age_24h":35},"TomorrowEra":{"happiness":6470,"strategy_points_24h":14,"all_goods_of_age_24h":35},"FutureEra":{"happiness":7750,"strategy_points_24h":15,"all_goods_of_age_24h":35},"ArcticFuture":{"happiness":9020,"strategy_points_24h":15,"all_goods_of_age_24h":35},"OceanicFuture":{"happiness":10410,"strategy_points_24h":16,"all_goods_of_age_24h":35},"VirtualFuture":{"happiness":12440,"strategy_points_24h":16,"all_goods_of_age_24h":40},"SpaceAgeMars":{"happiness":19910,"strategy_points_24h":17,"all_goods_of_age_24h":40},"SpaceAgeAsteroidBelt":{"happiness":21630,"strategy_points_24h":17,"all_goods_of_age_24h":40},"SpaceAgeVenus":{"happiness":23370,"strategy_points_24h":18,"all_goods_of_age_24h":40},"SpaceAgeJupiterMoon":{"happiness":25180,"strategy_points_24h":18,"all_goods_of_age_24h":40},"SpaceAgeTitan":{"happiness":27000,"strategy_points_24h":19,"all_goods_of_age_24h":45},"SpaceAgeSpaceHub":{"happiness":28820,"strategy_points_24h":19,"all_goods_of_age_24h":45}}, boosts: [{"type":"att_boost_attacker","value":6,"feature":"all"},{"type":"def_boost_attacker","value":11,"feature":"all"}] },
+    "W_MultiAge_WILD22A11": { prod: {"BronzeAge":{"population":450,"happiness":2480,"demandHappiness":450,"money_24h":2280,"medals_24h":260,"strategy_points_24h":50,"random_good_of_age_24h":33,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"IronAge":{"population":970,"happiness":4270,"demandHappiness":970,"money_24h":5470,"medals_24h":340,"strategy_points_24h":50,"random_good_of_age_24h":35,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"EarlyMiddleAge":{"population":1490,"happiness":4730,"demandHappiness":1490,"money_24h":9110,"medals_24h":410,"strategy_points_24h":50,"random_good_of_age_24h":37,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"HighMiddleAge":{"population":2090,"happiness":5270,"demandHappiness":2090,"money_24h":12750,"medals_24h":490,"strategy_points_24h":50,"random_good_of_age_24h":39,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"LateMiddleAge":{"population":2740,"happiness":5880,"demandHappiness":2740,"money_24h":16850,"medals_24h":560,"strategy_points_24h":50,"random_good_of_age_24h":41,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"ColonialAge":{"population":3460,"happiness":6910,"demandHappiness":3460,"money_24h":25660,"medals_24h":680,"strategy_points_24h":50,"random_good_of_age_24h":43,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"IndustrialAge":{"population":4220,"happiness":7800,"demandHappiness":4220,"money_24h":31970,"medals_24h":940,"strategy_points_24h":50,"random_good_of_age_24h":45,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"ProgressiveEra":{"population":5040,"happiness":8560,"demandHappiness":5040,"money_24h":38800,"medals_24h":1310,"strategy_points_24h":50,"random_good_of_age_24h":47,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"ModernEra":{"population":5910,"happiness":9160,"demandHappiness":5910,"money_24h":48280,"medals_24h":1880,"strategy_points_24h":50,"random_good_of_age_24h":49,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"PostModernEra":{"population":6810,"happiness":9550,"demandHappiness":6810,"money_24h":60730,"medals_24h":2630,"strategy_points_24h":50,"random_good_of_age_24h":51,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"ContemporaryEra":{"population":7760,"happiness":11090,"demandHappiness":7760,"money_24h":79070,"medals_24h":3750,"strategy_points_24h":50,"random_good_of_age_24h":53,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"TomorrowEra":{"population":8750,"happiness":13460,"demandHappiness":8750,"money_24h":91550,"medals_24h":5060,"strategy_points_24h":50,"random_good_of_age_24h":55,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"FutureEra":{"population":9780,"happiness":16130,"demandHappiness":9780,"money_24h":104940,"medals_24h":6190,"strategy_points_24h":50,"random_good_of_age_24h":57,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"ArcticFuture":{"population":10850,"happiness":18780,"demandHappiness":10850,"money_24h":119240,"medals_24h":7500,"strategy_points_24h":50,"random_good_of_age_24h":59,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"OceanicFuture":{"population":11950,"happiness":21680,"demandHappiness":11950,"money_24h":134450,"medals_24h":8630,"strategy_points_24h":50,"random_good_of_age_24h":61,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"VirtualFuture":{"population":13090,"happiness":25900,"demandHappiness":13090,"money_24h":150590,"medals_24h":10500,"strategy_points_24h":50,"random_good_of_age_24h":63,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"SpaceAgeMars":{"population":20720,"happiness":41440,"demandHappiness":20720,"money_24h":251550,"medals_24h":12750,"strategy_points_24h":50,"random_good_of_age_24h":65,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"SpaceAgeAsteroidBelt":{"population":22500,"happiness":45030,"demandHappiness":22500,"money_24h":278620,"medals_24h":15000,"strategy_points_24h":50,"random_good_of_age_24h":67,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"SpaceAgeVenus":{"population":24320,"happiness":48650,"demandHappiness":24320,"money_24h":307130,"medals_24h":17250,"strategy_points_24h":50,"random_good_of_age_24h":69,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"SpaceAgeJupiterMoon":{"population":26190,"happiness":52410,"demandHappiness":26190,"money_24h":337100,"medals_24h":19500,"strategy_points_24h":50,"random_good_of_age_24h":71,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"SpaceAgeTitan":{"population":28100,"happiness":56200,"demandHappiness":28100,"money_24h":368550,"medals_24h":21750,"strategy_points_24h":50,"random_good_of_age_24h":73,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5},"SpaceAgeSpaceHub":{"population":30000,"happiness":60000,"demandHappiness":30000,"money_24h":400000,"medals_24h":24000,"strategy_points_24h":50,"random_good_of_age_24h":75,"random_good_of_previous_age_24h":37.5,"random_good_of_next_age_24h":12.5}}, boosts: [{"type":"att_def_boost_defender","value":5,"feature":"guild_raids"},{"type":"att_def_boost_attacker_defender","value":94,"feature":"all"}] },
+    "W_MultiAge_WILD21A1": { prod: {"BronzeAge":{"population":235,"happiness":700,"demandHappiness":235,"money_24h":1100},"IronAge":{"population":505,"happiness":1210,"demandHappiness":505,"money_24h":2700},"EarlyMiddleAge":{"population":774,"happiness":1340,"demandHappiness":774,"money_24h":4600},"HighMiddleAge":{"population":1088,"happiness":1490,"demandHappiness":1088,"money_24h":6400},"LateMiddleAge":{"population":1427,"happiness":1670,"demandHappiness":1427,"money_24h":8400},"ColonialAge":{"population":1801,"happiness":1960,"demandHappiness":1801,"money_24h":12900},"IndustrialAge":{"population":2201,"happiness":2210,"demandHappiness":2201,"money_24h":16000},"ProgressiveEra":{"population":2627,"happiness":2430,"demandHappiness":2627,"money_24h":19400},"ModernEra":{"population":3080,"happiness":2600,"demandHappiness":3080,"money_24h":24200},"PostModernEra":{"population":3550,"happiness":2700,"demandHappiness":3550,"money_24h":30400},"ContemporaryEra":{"population":4046,"happiness":3140,"demandHappiness":4046,"money_24h":39600},"TomorrowEra":{"population":4559,"happiness":3820,"demandHappiness":4559,"money_24h":45800},"FutureEra":{"population":5098,"happiness":4570,"demandHappiness":5098,"money_24h":52500},"ArcticFuture":{"population":5655,"happiness":5320,"demandHappiness":5655,"money_24h":59700},"OceanicFuture":{"population":6229,"happiness":6140,"demandHappiness":6229,"money_24h":67300},"VirtualFuture":{"population":6821,"happiness":7340,"demandHappiness":6821,"money_24h":75400},"SpaceAgeMars":{"population":10797,"happiness":11740,"demandHappiness":10797,"money_24h":125900},"SpaceAgeAsteroidBelt":{"population":11728,"happiness":12760,"demandHappiness":11728,"money_24h":139500},"SpaceAgeVenus":{"population":12676,"happiness":13790,"demandHappiness":12676,"money_24h":153800},"SpaceAgeJupiterMoon":{"population":13650,"happiness":14850,"demandHappiness":13650,"money_24h":168800},"SpaceAgeTitan":{"population":14642,"happiness":15930,"demandHappiness":14642,"money_24h":184500},"SpaceAgeSpaceHub":{"population":15660,"happiness":17040,"demandHappiness":15660,"money_24h":201000}} },
+    "W_MultiAge_WILD21A2": { prod: {"BronzeAge":{"population":248,"happiness":810,"demandHappiness":248,"money_24h":1300,"medals_24h":3},"IronAge":{"population":532,"happiness":1400,"demandHappiness":532,"money_24h":3100,"medals_24h":4},"EarlyMiddleAge":{"population":817,"happiness":1550,"demandHappiness":817,"money_24h":5200,"medals_24h":4},"HighMiddleAge":{"population":1148,"happiness":1720,"demandHappiness":1148,"money_24h":7200,"medals_24h":5},"LateMiddleAge":{"population":1506,"happiness":1920,"demandHappiness":1506,"money_24h":9600,"medals_24h":6},"ColonialAge":{"population":1900,"happiness":2260,"demandHappiness":1900,"money_24h":14500,"medals_24h":7},"IndustrialAge":{"population":2323,"happiness":2550,"demandHappiness":2323,"money_24h":18100,"medals_24h":9},"ProgressiveEra":{"population":2772,"happiness":2800,"demandHappiness":2772,"money_24h":22000,"medals_24h":12},"ModernEra":{"population":3250,"happiness":3000,"demandHappiness":3250,"money_24h":27400,"medals_24h":18},"PostModernEra":{"population":3745,"happiness":3120,"demandHappiness":3745,"money_24h":34400,"medals_24h":24},"ContemporaryEra":{"population":4269,"happiness":3630,"demandHappiness":4269,"money_24h":44800,"medals_24h":35},"TomorrowEra":{"population":4810,"happiness":4400,"demandHappiness":4810,"money_24h":51900,"medals_24h":47},"FutureEra":{"population":5379,"happiness":5270,"demandHappiness":5379,"money_24h":59400,"medals_24h":57},"ArcticFuture":{"population":5967,"happiness":6140,"demandHappiness":5967,"money_24h":67500,"medals_24h":69},"OceanicFuture":{"population":6573,"happiness":7090,"demandHappiness":6573,"money_24h":76200,"medals_24h":79},"VirtualFuture":{"population":7197,"happiness":8470,"demandHappiness":7197,"money_24h":85300,"medals_24h":96},"SpaceAgeMars":{"population":11392,"happiness":13550,"demandHappiness":11392,"money_24h":142500,"medals_24h":117},"SpaceAgeAsteroidBelt":{"population":12375,"happiness":14720,"demandHappiness":12375,"money_24h":157800,"medals_24h":138},"SpaceAgeVenus":{"population":13375,"happiness":15910,"demandHappiness":13375,"money_24h":174000,"medals_24h":158},"SpaceAgeJupiterMoon":{"population":14403,"happiness":17140,"demandHappiness":14403,"money_24h":191000,"medals_24h":179},"SpaceAgeTitan":{"population":15450,"happiness":18380,"demandHappiness":15450,"money_24h":208800,"medals_24h":199},"SpaceAgeSpaceHub":{"population":16524,"happiness":19660,"demandHappiness":16524,"money_24h":227400,"medals_24h":220}} },
+    "W_MultiAge_WILD21A3": { prod: {"BronzeAge":{"population":260,"happiness":910,"demandHappiness":260,"money_24h":1400,"medals_24h":5,"random_good_of_age_24h":5},"IronAge":{"population":559,"happiness":1570,"demandHappiness":559,"money_24h":3400,"medals_24h":7,"random_good_of_age_24h":5},"EarlyMiddleAge":{"population":857,"happiness":1730,"demandHappiness":857,"money_24h":5700,"medals_24h":8,"random_good_of_age_24h":5},"HighMiddleAge":{"population":1204,"happiness":1930,"demandHappiness":1204,"money_24h":8000,"medals_24h":9,"random_good_of_age_24h":5},"LateMiddleAge":{"population":1579,"happiness":2150,"demandHappiness":1579,"money_24h":10600,"medals_24h":11,"random_good_of_age_24h":5},"ColonialAge":{"population":1993,"happiness":2530,"demandHappiness":1993,"money_24h":16100,"medals_24h":13,"random_good_of_age_24h":5},"IndustrialAge":{"population":2436,"happiness":2860,"demandHappiness":2436,"money_24h":20000,"medals_24h":18,"random_good_of_age_24h":5},"ProgressiveEra":{"population":2908,"happiness":3140,"demandHappiness":2908,"money_24h":24300,"medals_24h":24,"random_good_of_age_24h":5},"ModernEra":{"population":3409,"happiness":3360,"demandHappiness":3409,"money_24h":30200,"medals_24h":35,"random_good_of_age_24h":5},"PostModernEra":{"population":3929,"happiness":3500,"demandHappiness":3929,"money_24h":38000,"medals_24h":48,"random_good_of_age_24h":5},"ContemporaryEra":{"population":4478,"happiness":4060,"demandHappiness":4478,"money_24h":49500,"medals_24h":69,"random_good_of_age_24h":5},"TomorrowEra":{"population":5046,"happiness":4930,"demandHappiness":5046,"money_24h":57300,"medals_24h":93,"random_good_of_age_24h":5},"FutureEra":{"population":5643,"happiness":5910,"demandHappiness":5643,"money_24h":65700,"medals_24h":114,"random_good_of_age_24h":5},"ArcticFuture":{"population":6260,"happiness":6880,"demandHappiness":6260,"money_24h":74600,"medals_24h":138,"random_good_of_age_24h":5},"OceanicFuture":{"population":6895,"happiness":7940,"demandHappiness":6895,"money_24h":84100,"medals_24h":158,"random_good_of_age_24h":5},"VirtualFuture":{"population":7550,"happiness":9480,"demandHappiness":7550,"money_24h":94200,"medals_24h":192,"random_good_of_age_24h":5},"SpaceAgeMars":{"population":11951,"happiness":15180,"demandHappiness":11951,"money_24h":157400,"medals_24h":234,"random_good_of_age_24h":5},"SpaceAgeAsteroidBelt":{"population":12981,"happiness":16490,"demandHappiness":12981,"money_24h":174400,"medals_24h":275,"random_good_of_age_24h":5},"SpaceAgeVenus":{"population":14031,"happiness":17820,"demandHappiness":14031,"money_24h":192200,"medals_24h":316,"random_good_of_age_24h":5},"SpaceAgeJupiterMoon":{"population":15109,"happiness":19190,"demandHappiness":15109,"money_24h":210900,"medals_24h":357,"random_good_of_age_24h":5},"SpaceAgeTitan":{"population":16207,"happiness":20580,"demandHappiness":16207,"money_24h":230600,"medals_24h":398,"random_good_of_age_24h":5},"SpaceAgeSpaceHub":{"population":17334,"happiness":22020,"demandHappiness":17334,"money_24h":251200,"medals_24h":439,"random_good_of_age_24h":5}} },
+    "W_MultiAge_WILD21A4": { prod: {"BronzeAge":{"population":274,"happiness":1000,"demandHappiness":274,"money_24h":1600,"medals_24h":10,"strategy_points_24h":2,"random_good_of_age_24h":10},"IronAge":{"population":588,"happiness":1720,"demandHappiness":588,"money_24h":3700,"medals_24h":13,"strategy_points_24h":2,"random_good_of_age_24h":10},"EarlyMiddleAge":{"population":902,"happiness":1910,"demandHappiness":902,"money_24h":6200,"medals_24h":16,"strategy_points_24h":2,"random_good_of_age_24h":10},"HighMiddleAge":{"population":1268,"happiness":2130,"demandHappiness":1268,"money_24h":8700,"medals_24h":18,"strategy_points_24h":2,"random_good_of_age_24h":10},"LateMiddleAge":{"population":1663,"happiness":2370,"demandHappiness":1663,"money_24h":11500,"medals_24h":21,"strategy_points_24h":2,"random_good_of_age_24h":10},"ColonialAge":{"population":2099,"happiness":2790,"demandHappiness":2099,"money_24h":17600,"medals_24h":25,"strategy_points_24h":2,"random_good_of_age_24h":10},"IndustrialAge":{"population":2565,"happiness":3140,"demandHappiness":2565,"money_24h":21900,"medals_24h":35,"strategy_points_24h":2,"random_good_of_age_24h":10},"ProgressiveEra":{"population":3062,"happiness":3450,"demandHappiness":3062,"money_24h":26600,"medals_24h":48,"strategy_points_24h":2,"random_good_of_age_24h":10},"ModernEra":{"population":3590,"happiness":3690,"demandHappiness":3590,"money_24h":33100,"medals_24h":69,"strategy_points_24h":2,"random_good_of_age_24h":10},"PostModernEra":{"population":4137,"happiness":3850,"demandHappiness":4137,"money_24h":41600,"medals_24h":96,"strategy_points_24h":2,"random_good_of_age_24h":10},"ContemporaryEra":{"population":4715,"happiness":4470,"demandHappiness":4715,"money_24h":54200,"medals_24h":138,"strategy_points_24h":2,"random_good_of_age_24h":10},"TomorrowEra":{"population":5313,"happiness":5430,"demandHappiness":5313,"money_24h":62700,"medals_24h":186,"strategy_points_24h":2,"random_good_of_age_24h":10},"FutureEra":{"population":5942,"happiness":6510,"demandHappiness":5942,"money_24h":71900,"medals_24h":227,"strategy_points_24h":2,"random_good_of_age_24h":10},"ArcticFuture":{"population":6591,"happiness":7580,"demandHappiness":6591,"money_24h":81700,"medals_24h":275,"strategy_points_24h":2,"random_good_of_age_24h":10},"OceanicFuture":{"population":7260,"happiness":8740,"demandHappiness":7260,"money_24h":92100,"medals_24h":316,"strategy_points_24h":2,"random_good_of_age_24h":10},"VirtualFuture":{"population":7950,"happiness":10440,"demandHappiness":7950,"money_24h":103200,"medals_24h":384,"strategy_points_24h":2,"random_good_of_age_24h":10},"SpaceAgeMars":{"population":12584,"happiness":16710,"demandHappiness":12584,"money_24h":172300,"medals_24h":467,"strategy_points_24h":2,"random_good_of_age_24h":10},"SpaceAgeAsteroidBelt":{"population":13669,"happiness":18160,"demandHappiness":13669,"money_24h":190900,"medals_24h":549,"strategy_points_24h":2,"random_good_of_age_24h":10},"SpaceAgeVenus":{"population":14774,"happiness":19620,"demandHappiness":14774,"money_24h":210400,"medals_24h":631,"strategy_points_24h":2,"random_good_of_age_24h":10},"SpaceAgeJupiterMoon":{"population":15910,"happiness":21130,"demandHappiness":15910,"money_24h":230900,"medals_24h":714,"strategy_points_24h":2,"random_good_of_age_24h":10},"SpaceAgeTitan":{"population":17066,"happiness":22670,"demandHappiness":17066,"money_24h":252500,"medals_24h":796,"strategy_points_24h":2,"random_good_of_age_24h":10},"SpaceAgeSpaceHub":{"population":18252,"happiness":24250,"demandHappiness":18252,"money_24h":275000,"medals_24h":878,"strategy_points_24h":2,"random_good_of_age_24h":10}} },
+    "W_MultiAge_WILD21A5": { prod: {"BronzeAge":{"population":284,"happiness":1100,"demandHappiness":284,"money_24h":1700,"medals_24h":15,"strategy_points_24h":5,"random_good_of_age_24h":15},"IronAge":{"population":609,"happiness":1900,"demandHappiness":609,"money_24h":4100,"medals_24h":19,"strategy_points_24h":5,"random_good_of_age_24h":15},"EarlyMiddleAge":{"population":935,"happiness":2100,"demandHappiness":935,"money_24h":6800,"medals_24h":23,"strategy_points_24h":5,"random_good_of_age_24h":15},"HighMiddleAge":{"population":1313,"happiness":2340,"demandHappiness":1313,"money_24h":9600,"medals_24h":27,"strategy_points_24h":5,"random_good_of_age_24h":15},"LateMiddleAge":{"population":1722,"happiness":2620,"demandHappiness":1722,"money_24h":12700,"medals_24h":31,"strategy_points_24h":5,"random_good_of_age_24h":15},"ColonialAge":{"population":2174,"happiness":3070,"demandHappiness":2174,"money_24h":19300,"medals_24h":38,"strategy_points_24h":5,"random_good_of_age_24h":15},"IndustrialAge":{"population":2657,"happiness":3470,"demandHappiness":2657,"money_24h":24000,"medals_24h":52,"strategy_points_24h":5,"random_good_of_age_24h":15},"ProgressiveEra":{"population":3171,"happiness":3810,"demandHappiness":3171,"money_24h":29100,"medals_24h":72,"strategy_points_24h":5,"random_good_of_age_24h":15},"ModernEra":{"population":3717,"happiness":4070,"demandHappiness":3717,"money_24h":36300,"medals_24h":103,"strategy_points_24h":5,"random_good_of_age_24h":15},"PostModernEra":{"population":4284,"happiness":4240,"demandHappiness":4284,"money_24h":45600,"medals_24h":144,"strategy_points_24h":5,"random_good_of_age_24h":15},"ContemporaryEra":{"population":4883,"happiness":4930,"demandHappiness":4883,"money_24h":59400,"medals_24h":206,"strategy_points_24h":5,"random_good_of_age_24h":15},"TomorrowEra":{"population":5502,"happiness":5990,"demandHappiness":5502,"money_24h":68700,"medals_24h":278,"strategy_points_24h":5,"random_good_of_age_24h":15},"FutureEra":{"population":6153,"happiness":7170,"demandHappiness":6153,"money_24h":78800,"medals_24h":340,"strategy_points_24h":5,"random_good_of_age_24h":15},"ArcticFuture":{"population":6825,"happiness":8350,"demandHappiness":6825,"money_24h":89500,"medals_24h":412,"strategy_points_24h":5,"random_good_of_age_24h":15},"OceanicFuture":{"population":7518,"happiness":9640,"demandHappiness":7518,"money_24h":101000,"medals_24h":474,"strategy_points_24h":5,"random_good_of_age_24h":15},"VirtualFuture":{"population":8232,"happiness":11520,"demandHappiness":8232,"money_24h":113100,"medals_24h":576,"strategy_points_24h":5,"random_good_of_age_24h":15},"SpaceAgeMars":{"population":13031,"happiness":18430,"demandHappiness":13031,"money_24h":188900,"medals_24h":700,"strategy_points_24h":5,"random_good_of_age_24h":15},"SpaceAgeAsteroidBelt":{"population":14154,"happiness":20020,"demandHappiness":14154,"money_24h":209200,"medals_24h":823,"strategy_points_24h":5,"random_good_of_age_24h":15},"SpaceAgeVenus":{"population":15299,"happiness":21630,"demandHappiness":15299,"money_24h":230600,"medals_24h":947,"strategy_points_24h":5,"random_good_of_age_24h":15},"SpaceAgeJupiterMoon":{"population":16475,"happiness":23310,"demandHappiness":16475,"money_24h":253100,"medals_24h":1070,"strategy_points_24h":5,"random_good_of_age_24h":15},"SpaceAgeTitan":{"population":17672,"happiness":24990,"demandHappiness":17672,"money_24h":276800,"medals_24h":1194,"strategy_points_24h":5,"random_good_of_age_24h":15},"SpaceAgeSpaceHub":{"population":18900,"happiness":26740,"demandHappiness":18900,"money_24h":301500,"medals_24h":1317,"strategy_points_24h":5,"random_good_of_age_24h":15}} },
+    "W_MultiAge_WILD21A6": { prod: {"BronzeAge":{"population":298,"happiness":1190,"demandHappiness":298,"money_24h":1800,"medals_24h":20,"strategy_points_24h":8,"random_good_of_age_24h":20},"IronAge":{"population":640,"happiness":2050,"demandHappiness":640,"money_24h":4300,"medals_24h":25,"strategy_points_24h":8,"random_good_of_age_24h":20},"EarlyMiddleAge":{"population":983,"happiness":2270,"demandHappiness":983,"money_24h":7200,"medals_24h":31,"strategy_points_24h":8,"random_good_of_age_24h":20},"HighMiddleAge":{"population":1380,"happiness":2530,"demandHappiness":1380,"money_24h":10100,"medals_24h":36,"strategy_points_24h":8,"random_good_of_age_24h":20},"LateMiddleAge":{"population":1811,"happiness":2820,"demandHappiness":1811,"money_24h":13300,"medals_24h":42,"strategy_points_24h":8,"random_good_of_age_24h":20},"ColonialAge":{"population":2285,"happiness":3320,"demandHappiness":2285,"money_24h":20300,"medals_24h":50,"strategy_points_24h":8,"random_good_of_age_24h":20},"IndustrialAge":{"population":2793,"happiness":3740,"demandHappiness":2793,"money_24h":25300,"medals_24h":69,"strategy_points_24h":8,"random_good_of_age_24h":20},"ProgressiveEra":{"population":3334,"happiness":4110,"demandHappiness":3334,"money_24h":30700,"medals_24h":96,"strategy_points_24h":8,"random_good_of_age_24h":20},"ModernEra":{"population":3908,"happiness":4390,"demandHappiness":3908,"money_24h":38200,"medals_24h":138,"strategy_points_24h":8,"random_good_of_age_24h":20},"PostModernEra":{"population":4504,"happiness":4580,"demandHappiness":4504,"money_24h":48000,"medals_24h":192,"strategy_points_24h":8,"random_good_of_age_24h":20},"ContemporaryEra":{"population":5134,"happiness":5320,"demandHappiness":5134,"money_24h":62500,"medals_24h":275,"strategy_points_24h":8,"random_good_of_age_24h":20},"TomorrowEra":{"population":5785,"happiness":6460,"demandHappiness":5785,"money_24h":72400,"medals_24h":371,"strategy_points_24h":8,"random_good_of_age_24h":20},"FutureEra":{"population":6469,"happiness":7740,"demandHappiness":6469,"money_24h":82900,"medals_24h":453,"strategy_points_24h":8,"random_good_of_age_24h":20},"ArcticFuture":{"population":7176,"happiness":9010,"demandHappiness":7176,"money_24h":94300,"medals_24h":549,"strategy_points_24h":8,"random_good_of_age_24h":20},"OceanicFuture":{"population":7905,"happiness":10400,"demandHappiness":7905,"money_24h":106300,"medals_24h":631,"strategy_points_24h":8,"random_good_of_age_24h":20},"VirtualFuture":{"population":8655,"happiness":12420,"demandHappiness":8655,"money_24h":119000,"medals_24h":768,"strategy_points_24h":8,"random_good_of_age_24h":20},"SpaceAgeMars":{"population":13701,"happiness":19870,"demandHappiness":13701,"money_24h":198800,"medals_24h":933,"strategy_points_24h":8,"random_good_of_age_24h":20},"SpaceAgeAsteroidBelt":{"population":14882,"happiness":21600,"demandHappiness":14882,"money_24h":220200,"medals_24h":1098,"strategy_points_24h":8,"random_good_of_age_24h":20},"SpaceAgeVenus":{"population":16085,"happiness":23330,"demandHappiness":16085,"money_24h":242800,"medals_24h":1262,"strategy_points_24h":8,"random_good_of_age_24h":20},"SpaceAgeJupiterMoon":{"population":17322,"happiness":25130,"demandHappiness":17322,"money_24h":266500,"medals_24h":1427,"strategy_points_24h":8,"random_good_of_age_24h":20},"SpaceAgeTitan":{"population":18580,"happiness":26950,"demandHappiness":18580,"money_24h":291300,"medals_24h":1591,"strategy_points_24h":8,"random_good_of_age_24h":20},"SpaceAgeSpaceHub":{"population":19872,"happiness":28830,"demandHappiness":19872,"money_24h":317300,"medals_24h":1756,"strategy_points_24h":8,"random_good_of_age_24h":20}} },
+    "W_MultiAge_WILD23E1": { prod: {"BronzeAge":{"all_goods_of_age_24h":5},"IronAge":{"all_goods_of_age_24h":5},"EarlyMiddleAge":{"all_goods_of_age_24h":5},"HighMiddleAge":{"all_goods_of_age_24h":5},"LateMiddleAge":{"all_goods_of_age_24h":5},"ColonialAge":{"all_goods_of_age_24h":5},"IndustrialAge":{"all_goods_of_age_24h":5},"ProgressiveEra":{"all_goods_of_age_24h":5},"ModernEra":{"all_goods_of_age_24h":5},"PostModernEra":{"all_goods_of_age_24h":5},"ContemporaryEra":{"all_goods_of_age_24h":5},"TomorrowEra":{"all_goods_of_age_24h":5},"FutureEra":{"all_goods_of_age_24h":5},"ArcticFuture":{"all_goods_of_age_24h":5},"OceanicFuture":{"all_goods_of_age_24h":5},"VirtualFuture":{"all_goods_of_age_24h":5},"SpaceAgeMars":{"all_goods_of_age_24h":5},"SpaceAgeAsteroidBelt":{"all_goods_of_age_24h":5},"SpaceAgeVenus":{"all_goods_of_age_24h":5},"SpaceAgeJupiterMoon":{"all_goods_of_age_24h":5},"SpaceAgeTitan":{"all_goods_of_age_24h":5},"SpaceAgeSpaceHub":{"all_goods_of_age_24h":5}}, boosts: [{"type":"att_boost_attacker","value":1,"feature":"all"},{"type":"att_boost_defender","value":1,"feature":"all"}] },
+    "W_MultiAge_WILD23E2": { prod: {"BronzeAge":{"all_goods_of_age_24h":10},"IronAge":{"all_goods_of_age_24h":10},"EarlyMiddleAge":{"all_goods_of_age_24h":10},"HighMiddleAge":{"all_goods_of_age_24h":10},"LateMiddleAge":{"all_goods_of_age_24h":10},"ColonialAge":{"all_goods_of_age_24h":10},"IndustrialAge":{"all_goods_of_age_24h":10},"ProgressiveEra":{"all_goods_of_age_24h":10},"ModernEra":{"all_goods_of_age_24h":10},"PostModernEra":{"all_goods_of_age_24h":10},"ContemporaryEra":{"all_goods_of_age_24h":15},"TomorrowEra":{"all_goods_of_age_24h":15},"FutureEra":{"all_goods_of_age_24h":15},"ArcticFuture":{"all_goods_of_age_24h":15},"OceanicFuture":{"all_goods_of_age_24h":15},"VirtualFuture":{"all_goods_of_age_24h":15},"SpaceAgeMars":{"all_goods_of_age_24h":15},"SpaceAgeAsteroidBelt":{"all_goods_of_age_24h":15},"SpaceAgeVenus":{"all_goods_of_age_24h":15},"SpaceAgeJupiterMoon":{"all_goods_of_age_24h":15},"SpaceAgeTitan":{"all_goods_of_age_24h":20},"SpaceAgeSpaceHub":{"all_goods_of_age_24h":20}}, boosts: [{"type":"att_boost_attacker","value":2,"feature":"all"},{"type":"att_boost_defender","value":2,"feature":"all"}] },
+    "W_MultiAge_WILD25D1": { prod: {"AllAge":{"strategy_points_24h":105,"random_good_of_age_24h":135},"BronzeAge":{"happiness":9930},"IronAge":{"happiness":17110},"EarlyMiddleAge":{"happiness":18920},"HighMiddleAge":{"happiness":21110},"LateMiddleAge":{"happiness":23540},"ColonialAge":{"happiness":27680},"IndustrialAge":{"happiness":31220},"ProgressiveEra":{"happiness":34280},"ModernEra":{"happiness":36680},"PostModernEra":{"happiness":38210},"ContemporaryEra":{"happiness":44400},"TomorrowEra":{"happiness":53900},"FutureEra":{"happiness":64580},"ArcticFuture":{"happiness":75200},"OceanicFuture":{"happiness":86780},"VirtualFuture":{"happiness":103670},"SpaceAgeMars":{"happiness":165880},"SpaceAgeAsteroidBelt":{"happiness":180270},"SpaceAgeVenus":{"happiness":194760},"SpaceAgeJupiterMoon":{"happiness":209800},"SpaceAgeTitan":{"happiness":225000},"SpaceAgeSpaceHub":{"happiness":240200}}, boosts: [{"type":"att_def_boost_defender","value":90,"feature":"all"},{"type":"att_def_boost_defender","value":120,"feature":"battleground"},{"type":"att_def_boost_defender","value":25,"feature":"guild_raids"}] },
+    "W_MultiAge_WILD25B1": { prod: {"BronzeAge":{"population":-290,"happiness":660},"IronAge":{"population":-620,"happiness":1140},"EarlyMiddleAge":{"population":-950,"happiness":1260},"HighMiddleAge":{"population":-1340,"happiness":1410},"LateMiddleAge":{"population":-1750,"happiness":1570},"ColonialAge":{"population":-2210,"happiness":1850},"IndustrialAge":{"population":-2710,"happiness":2080},"ProgressiveEra":{"population":-3230,"happiness":2290},"ModernEra":{"population":-3790,"happiness":2450},"PostModernEra":{"population":-4360,"happiness":2550},"ContemporaryEra":{"population":-4970,"happiness":2960},"TomorrowEra":{"population":-5600,"happiness":3590},"FutureEra":{"population":-6270,"happiness":4310},"ArcticFuture":{"population":-6950,"happiness":5010},"OceanicFuture":{"population":-7660,"happiness":5790},"VirtualFuture":{"population":-8390,"happiness":6910},"SpaceAgeMars":{"population":-13270,"happiness":11060},"SpaceAgeAsteroidBelt":{"population":-14420,"happiness":12020},"SpaceAgeVenus":{"population":-15580,"happiness":12980},"SpaceAgeJupiterMoon":{"population":-16780,"happiness":13990},"SpaceAgeTitan":{"population":-18000,"happiness":15000},"SpaceAgeSpaceHub":{"population":-19220,"happiness":16010}}, boosts: [{"type":"def_boost_attacker","value":7,"feature":"all"},{"type":"att_def_boost_defender","value":7,"feature":"all"},{"type":"att_def_boost_defender","value":10,"feature":"battleground"}] },
+    "W_MultiAge_WILD23C1": { prod: {"BronzeAge":{"happiness":260},"IronAge":{"happiness":370},"EarlyMiddleAge":{"happiness":450},"HighMiddleAge":{"happiness":560},"LateMiddleAge":{"happiness":640},"ColonialAge":{"happiness":750},"IndustrialAge":{"happiness":850},"ProgressiveEra":{"happiness":930},"ModernEra":{"happiness":1070},"PostModernEra":{"happiness":1210},"ContemporaryEra":{"happiness":1410},"TomorrowEra":{"happiness":1760},"FutureEra":{"happiness":2110},"ArcticFuture":{"happiness":2390},"OceanicFuture":{"happiness":2680},"VirtualFuture":{"happiness":3390},"SpaceAgeMars":{"happiness":5270},"SpaceAgeAsteroidBelt":{"happiness":5730},"SpaceAgeVenus":{"happiness":6190},"SpaceAgeJupiterMoon":{"happiness":6660},"SpaceAgeTitan":{"happiness":7150},"SpaceAgeSpaceHub":{"happiness":7650}} },
+    "W_MultiAge_WILD23D1": { prod: {"BronzeAge":{"happiness":260},"IronAge":{"happiness":370},"EarlyMiddleAge":{"happiness":450},"HighMiddleAge":{"happiness":560},"LateMiddleAge":{"happiness":640},"ColonialAge":{"happiness":750},"IndustrialAge":{"happiness":850},"ProgressiveEra":{"happiness":930},"ModernEra":{"happiness":1070},"PostModernEra":{"happiness":1210},"ContemporaryEra":{"happiness":1410},"TomorrowEra":{"happiness":1760},"FutureEra":{"happiness":2110},"ArcticFuture":{"happiness":2390},"OceanicFuture":{"happiness":2680},"VirtualFuture":{"happiness":3390},"SpaceAgeMars":{"happiness":5270},"SpaceAgeAsteroidBelt":{"happiness":5730},"SpaceAgeVenus":{"happiness":6190},"SpaceAgeJupiterMoon":{"happiness":6660},"SpaceAgeTitan":{"happiness":7150},"SpaceAgeSpaceHub":{"happiness":7650}} },
+    "W_MultiAge_WILD21A7a": { prod: {"BronzeAge":{"population":308,"happiness":1300,"demandHappiness":308,"money_24h":2000,"medals_24h":29,"strategy_points_24h":11,"random_good_of_age_24h":26},"IronAge":{"population":661,"happiness":2240,"demandHappiness":661,"money_24h":4800,"medals_24h":38,"strategy_points_24h":11,"random_good_of_age_24h":26},"EarlyMiddleAge":{"population":1015,"happiness":2470,"demandHappiness":1015,"money_24h":7900,"medals_24h":46,"strategy_points_24h":11,"random_good_of_age_24h":26},"HighMiddleAge":{"population":1425,"happiness":2760,"demandHappiness":1425,"money_24h":11100,"medals_24h":54,"strategy_points_24h":11,"random_good_of_age_24h":26},"LateMiddleAge":{"population":1870,"happiness":3080,"demandHappiness":1870,"money_24h":14700,"medals_24h":62,"strategy_points_24h":11,"random_good_of_age_24h":26},"ColonialAge":{"population":2360,"happiness":3620,"demandHappiness":2360,"money_24h":22300,"medals_24h":75,"strategy_points_24h":11,"random_good_of_age_24h":26},"IndustrialAge":{"population":2884,"happiness":4080,"demandHappiness":2884,"money_24h":27800,"medals_24h":103,"strategy_points_24h":11,"random_good_of_age_24h":26},"ProgressiveEra":{"population":3443,"happiness":4480,"demandHappiness":3443,"money_24h":33700,"medals_24h":144,"strategy_points_24h":11,"random_good_of_age_24h":26},"ModernEra":{"population":4036,"happiness":4790,"demandHappiness":4036,"money_24h":42000,"medals_24h":206,"strategy_points_24h":11,"random_good_of_age_24h":26},"PostModernEra":{"population":4651,"happiness":4990,"demandHappiness":4651,"money_24h":52800,"medals_24h":288,"strategy_points_24h":11,"random_good_of_age_24h":26},"ContemporaryEra":{"population":5301,"happiness":5800,"demandHappiness":5301,"money_24h":68800,"medals_24h":412,"strategy_points_24h":11,"random_good_of_age_24h":26},"TomorrowEra":{"population":5974,"happiness":7040,"demandHappiness":5974,"money_24h":79600,"medals_24h":556,"strategy_points_24h":11,"random_good_of_age_24h":26},"FutureEra":{"population":6680,"happiness":8440,"demandHappiness":6680,"money_24h":91200,"medals_24h":679,"strategy_points_24h":11,"random_good_of_age_24h":26},"ArcticFuture":{"population":7410,"happiness":9830,"demandHappiness":7410,"money_24h":103700,"medals_24h":823,"strategy_points_24h":11,"random_good_of_age_24h":26},"OceanicFuture":{"population":8162,"happiness":11340,"demandHappiness":8162,"money_24h":116900,"medals_24h":947,"strategy_points_24h":11,"random_good_of_age_24h":26},"VirtualFuture":{"population":8938,"happiness":13550,"demandHappiness":8938,"money_24h":130900,"medals_24h":1152,"strategy_points_24h":11,"random_good_of_age_24h":26},"SpaceAgeMars":{"population":14147,"happiness":21680,"demandHappiness":14147,"money_24h":218700,"medals_24h":1399,"strategy_points_24h":11,"random_good_of_age_24h":26},"SpaceAgeAsteroidBelt":{"population":15367,"happiness":23560,"demandHappiness":15367,"money_24h":242300,"medals_24h":1646,"strategy_points_24h":11,"random_good_of_age_24h":26},"SpaceAgeVenus":{"population":16610,"happiness":25450,"demandHappiness":16610,"money_24h":267000,"medals_24h":1893,"strategy_points_24h":11,"random_good_of_age_24h":26},"SpaceAgeJupiterMoon":{"population":17887,"happiness":27420,"demandHappiness":17887,"money_24h":293100,"medals_24h":2140,"strategy_points_24h":11,"random_good_of_age_24h":26},"SpaceAgeTitan":{"population":19186,"happiness":29400,"demandHappiness":19186,"money_24h":320400,"medals_24h":2387,"strategy_points_24h":11,"random_good_of_age_24h":26},"SpaceAgeSpaceHub":{"population":20520,"happiness":31450,"demandHappiness":20520,"money_24h":349100,"medals_24h":2634,"strategy_points_24h":11,"random_good_of_age_24h":26}}, boosts: [{"type":"att_boost_defender","value":18,"feature":"all"},{"type":"def_boost_defender","value":21,"feature":"all"}] },
+    "W_MultiAge_WILD25A10": { prod: {"BronzeAge":{"population":650,"happiness":2700,"demandHappiness":650,"supplies_24h":3500,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"IronAge":{"population":1410,"happiness":4650,"demandHappiness":1410,"supplies_24h":8400,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"EarlyMiddleAge":{"population":2160,"happiness":5150,"demandHappiness":2160,"supplies_24h":14000,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"HighMiddleAge":{"population":3030,"happiness":5740,"demandHappiness":3030,"supplies_24h":19600,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"LateMiddleAge":{"population":3980,"happiness":6400,"demandHappiness":3980,"supplies_24h":25900,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"ColonialAge":{"population":5020,"happiness":7530,"demandHappiness":5020,"supplies_24h":32900,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"IndustrialAge":{"population":6130,"happiness":8490,"demandHappiness":6130,"supplies_24h":39900,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"ProgressiveEra":{"population":7320,"happiness":9320,"demandHappiness":7320,"supplies_24h":46900,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"ModernEra":{"population":8580,"happiness":9980,"demandHappiness":8580,"supplies_24h":54590,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"PostModernEra":{"population":9890,"happiness":10390,"demandHappiness":9890,"supplies_24h":62290,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"ContemporaryEra":{"population":11270,"happiness":12080,"demandHappiness":11270,"supplies_24h":69990,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"TomorrowEra":{"population":12700,"happiness":14660,"demandHappiness":12700,"supplies_24h":78390,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"FutureEra":{"population":14210,"happiness":17570,"demandHappiness":14210,"supplies_24h":86090,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"ArcticFuture":{"population":15760,"happiness":20450,"demandHappiness":15760,"supplies_24h":94490,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"OceanicFuture":{"population":17360,"happiness":23600,"demandHappiness":17360,"supplies_24h":103590,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"VirtualFuture":{"population":19010,"happiness":28200,"demandHappiness":19010,"supplies_24h":111990,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"SpaceAgeMars":{"population":30080,"happiness":45120,"demandHappiness":30080,"supplies_24h":181280,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"SpaceAgeAsteroidBelt":{"population":32680,"happiness":49030,"demandHappiness":32680,"supplies_24h":194580,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"SpaceAgeVenus":{"population":35320,"happiness":52970,"demandHappiness":35320,"supplies_24h":208580,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"SpaceAgeJupiterMoon":{"population":38040,"happiness":57070,"demandHappiness":38040,"supplies_24h":221880,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"SpaceAgeTitan":{"population":40800,"happiness":61200,"demandHappiness":40800,"supplies_24h":235880,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0},"SpaceAgeSpaceHub":{"population":43560,"happiness":65330,"demandHappiness":43560,"supplies_24h":249870,"strategy_points_24h":48,"random_good_of_previous_age_24h":93.0,"random_good_of_next_age_24h":93.0}}, boosts: [{"type":"att_def_boost_defender","value":50,"feature":"all"},{"type":"att_def_boost_defender","value":46,"feature":"battleground"},{"type":"att_def_boost_defender","value":48,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD25A11": { prod: {"BronzeAge":{"population":720,"happiness":2950,"demandHappiness":720,"supplies_24h":3780,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"IronAge":{"population":1540,"happiness":5090,"demandHappiness":1540,"supplies_24h":9080,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"EarlyMiddleAge":{"population":2360,"happiness":5630,"demandHappiness":2360,"supplies_24h":15130,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"HighMiddleAge":{"population":3310,"happiness":6280,"demandHappiness":3310,"supplies_24h":21190,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"LateMiddleAge":{"population":4350,"happiness":7000,"demandHappiness":4350,"supplies_24h":28000,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"ColonialAge":{"population":5490,"happiness":8230,"demandHappiness":5490,"supplies_24h":35560,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"IndustrialAge":{"population":6710,"happiness":9290,"demandHappiness":6710,"supplies_24h":43130,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"ProgressiveEra":{"population":8010,"happiness":10200,"demandHappiness":8010,"supplies_24h":50700,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"ModernEra":{"population":9390,"happiness":10910,"demandHappiness":9390,"supplies_24h":59020,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"PostModernEra":{"population":10820,"happiness":11370,"demandHappiness":10820,"supplies_24h":67340,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"ContemporaryEra":{"population":12330,"happiness":13210,"demandHappiness":12330,"supplies_24h":75670,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"TomorrowEra":{"population":13890,"happiness":16040,"demandHappiness":13890,"supplies_24h":84750,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"FutureEra":{"population":15540,"happiness":19210,"demandHappiness":15540,"supplies_24h":93070,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"ArcticFuture":{"population":17230,"happiness":22370,"demandHappiness":17230,"supplies_24h":102150,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"OceanicFuture":{"population":18980,"happiness":25820,"demandHappiness":18980,"supplies_24h":111990,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"VirtualFuture":{"population":20790,"happiness":30840,"demandHappiness":20790,"supplies_24h":121070,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"SpaceAgeMars":{"population":32910,"happiness":49350,"demandHappiness":32910,"supplies_24h":195980,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"SpaceAgeAsteroidBelt":{"population":35740,"happiness":53630,"demandHappiness":35740,"supplies_24h":210360,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"SpaceAgeVenus":{"population":38630,"happiness":57940,"demandHappiness":38630,"supplies_24h":225490,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"SpaceAgeJupiterMoon":{"population":41600,"happiness":62420,"demandHappiness":41600,"supplies_24h":239870,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"SpaceAgeTitan":{"population":44630,"happiness":66940,"demandHappiness":44630,"supplies_24h":255000,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0},"SpaceAgeSpaceHub":{"population":47650,"happiness":71460,"demandHappiness":47650,"supplies_24h":270130,"strategy_points_24h":51,"random_good_of_previous_age_24h":102.0,"random_good_of_next_age_24h":102.0}}, boosts: [{"type":"att_def_boost_defender","value":56,"feature":"all"},{"type":"att_def_boost_defender","value":52,"feature":"battleground"},{"type":"att_def_boost_defender","value":54,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD24E1": { prod: {"BronzeAge":{"population":40,"demandHappiness":40,"money_24h":220,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"IronAge":{"population":100,"demandHappiness":100,"money_24h":520,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"EarlyMiddleAge":{"population":150,"demandHappiness":150,"money_24h":870,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"HighMiddleAge":{"population":210,"demandHappiness":210,"money_24h":1210,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"LateMiddleAge":{"population":270,"demandHappiness":270,"money_24h":1600,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"ColonialAge":{"population":340,"demandHappiness":340,"money_24h":2440,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"IndustrialAge":{"population":420,"demandHappiness":420,"money_24h":3040,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"ProgressiveEra":{"population":500,"demandHappiness":500,"money_24h":3690,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"ModernEra":{"population":590,"demandHappiness":590,"money_24h":4580,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"PostModernEra":{"population":680,"demandHappiness":680,"money_24h":5770,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"ContemporaryEra":{"population":770,"demandHappiness":770,"money_24h":7510,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"TomorrowEra":{"population":870,"demandHappiness":870,"money_24h":8690,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"FutureEra":{"population":970,"demandHappiness":970,"money_24h":9970,"random_good_of_previous_age_24h":10,"random_good_of_age_24h":5},"ArcticFuture":{"population":1080,"demandHappiness":1080,"money_24h":11320,"random_good_of_previous_age_24h":12,"random_good_of_age_24h":6},"OceanicFuture":{"population":1190,"demandHappiness":1190,"money_24h":12770,"random_good_of_previous_age_24h":12,"random_good_of_age_24h":6},"VirtualFuture":{"population":1300,"demandHappiness":1300,"money_24h":14300,"random_good_of_previous_age_24h":12,"random_good_of_age_24h":6},"SpaceAgeMars":{"population":2060,"demandHappiness":2060,"money_24h":23890,"random_good_of_previous_age_24h":12,"random_good_of_age_24h":6},"SpaceAgeAsteroidBelt":{"population":2240,"demandHappiness":2240,"money_24h":26460,"random_good_of_previous_age_24h":12,"random_good_of_age_24h":6},"SpaceAgeVenus":{"population":2420,"demandHappiness":2420,"money_24h":29170,"random_good_of_previous_age_24h":12,"random_good_of_age_24h":6},"SpaceAgeJupiterMoon":{"population":2610,"demandHappiness":2610,"money_24h":32010,"random_good_of_previous_age_24h":12,"random_good_of_age_24h":6},"SpaceAgeTitan":{"population":2800,"demandHappiness":2800,"money_24h":35000,"random_good_of_previous_age_24h":14,"random_good_of_age_24h":7},"SpaceAgeSpaceHub":{"population":2990,"demandHappiness":2990,"money_24h":37990,"random_good_of_previous_age_24h":14,"random_good_of_age_24h":7}}, boosts: [{"type":"att_boost_attacker","value":2,"feature":"all"},{"type":"att_boost_attacker","value":2,"feature":"battleground"},{"type":"att_boost_defender","value":2,"feature":"all"},{"type":"att_boost_defender","value":2,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD23GDecoration": { prod: {"AllAge":{"happiness":250}} },
+    "W_MultiAge_WILD23A1": { prod: {"BronzeAge":{"population":25,"happiness":50,"demandHappiness":25,"money_24h":85},"IronAge":{"population":50,"happiness":100,"demandHappiness":50,"money_24h":175},"EarlyMiddleAge":{"population":100,"happiness":200,"demandHappiness":100,"money_24h":350},"HighMiddleAge":{"population":200,"happiness":400,"demandHappiness":200,"money_24h":700},"LateMiddleAge":{"population":250,"happiness":500,"demandHappiness":250,"money_24h":875},"ColonialAge":{"population":300,"happiness":600,"demandHappiness":300,"money_24h":1050},"IndustrialAge":{"population":350,"happiness":700,"demandHappiness":350,"money_24h":1225},"ProgressiveEra":{"population":400,"happiness":800,"demandHappiness":400,"money_24h":1400},"ModernEra":{"population":450,"happiness":900,"demandHappiness":450,"money_24h":1575},"PostModernEra":{"population":500,"happiness":1000,"demandHappiness":500,"money_24h":1750},"ContemporaryEra":{"population":550,"happiness":1100,"demandHappiness":550,"money_24h":1925},"TomorrowEra":{"population":600,"happiness":1200,"demandHappiness":600,"money_24h":2100},"FutureEra":{"population":650,"happiness":1300,"demandHappiness":650,"money_24h":2275},"ArcticFuture":{"population":700,"happiness":1400,"demandHappiness":700,"money_24h":2450},"OceanicFuture":{"population":750,"happiness":1500,"demandHappiness":750,"money_24h":2625},"VirtualFuture":{"population":800,"happiness":1600,"demandHappiness":800,"money_24h":2800},"SpaceAgeMars":{"population":850,"happiness":1700,"demandHappiness":850,"money_24h":2975},"SpaceAgeAsteroidBelt":{"population":900,"happiness":1800,"demandHappiness":900,"money_24h":3150},"SpaceAgeVenus":{"population":950,"happiness":1900,"demandHappiness":950,"money_24h":3325},"SpaceAgeJupiterMoon":{"population":1000,"happiness":2000,"demandHappiness":1000,"money_24h":3500},"SpaceAgeTitan":{"population":1050,"happiness":2100,"demandHappiness":1050,"money_24h":3675},"SpaceAgeSpaceHub":{"population":1100,"happiness":2200,"demandHappiness":1100,"money_24h":3850}} },
+    "W_MultiAge_WILD23A2": { prod: {"BronzeAge":{"population":32,"happiness":63,"demandHappiness":32,"money_24h":107,"medals_24h":8},"IronAge":{"population":63,"happiness":125,"demandHappiness":63,"money_24h":219,"medals_24h":11},"EarlyMiddleAge":{"population":125,"happiness":250,"demandHappiness":125,"money_24h":438,"medals_24h":13},"HighMiddleAge":{"population":250,"happiness":500,"demandHappiness":250,"money_24h":875,"medals_24h":15},"LateMiddleAge":{"population":313,"happiness":625,"demandHappiness":313,"money_24h":1094,"medals_24h":18},"ColonialAge":{"population":375,"happiness":750,"demandHappiness":375,"money_24h":1313,"medals_24h":21},"IndustrialAge":{"population":438,"happiness":875,"demandHappiness":438,"money_24h":1532,"medals_24h":29},"ProgressiveEra":{"population":500,"happiness":1000,"demandHappiness":500,"money_24h":1750,"medals_24h":40},"ModernEra":{"population":563,"happiness":1125,"demandHappiness":563,"money_24h":1969,"medals_24h":58},"PostModernEra":{"population":625,"happiness":1250,"demandHappiness":625,"money_24h":2188,"medals_24h":80},"ContemporaryEra":{"population":688,"happiness":1375,"demandHappiness":688,"money_24h":2407,"medals_24h":115},"TomorrowEra":{"population":750,"happiness":1500,"demandHappiness":750,"money_24h":2625,"medals_24h":155},"FutureEra":{"population":813,"happiness":1625,"demandHappiness":813,"money_24h":2844,"medals_24h":189},"ArcticFuture":{"population":875,"happiness":1750,"demandHappiness":875,"money_24h":3063,"medals_24h":229},"OceanicFuture":{"population":938,"happiness":1875,"demandHappiness":938,"money_24h":3282,"medals_24h":263},"VirtualFuture":{"population":1000,"happiness":2000,"demandHappiness":1000,"money_24h":3500,"medals_24h":320},"SpaceAgeMars":{"population":1063,"happiness":2125,"demandHappiness":1063,"money_24h":3719,"medals_24h":389},"SpaceAgeAsteroidBelt":{"population":1125,"happiness":2250,"demandHappiness":1125,"money_24h":3938,"medals_24h":458},"SpaceAgeVenus":{"population":1188,"happiness":2375,"demandHappiness":1188,"money_24h":4157,"medals_24h":526},"SpaceAgeJupiterMoon":{"population":1250,"happiness":2500,"demandHappiness":1250,"money_24h":4375,"medals_24h":595},"SpaceAgeTitan":{"population":1312,"happiness":2625,"demandHappiness":1312,"money_24h":4593,"medals_24h":664},"SpaceAgeSpaceHub":{"population":1374,"happiness":2750,"demandHappiness":1374,"money_24h":4811,"medals_24h":733}} },
+    "W_MultiAge_WILD23A3": { prod: {"BronzeAge":{"population":38,"happiness":75,"demandHappiness":38,"money_24h":128,"medals_24h":9},"IronAge":{"population":75,"happiness":150,"demandHappiness":75,"money_24h":263,"medals_24h":12},"EarlyMiddleAge":{"population":150,"happiness":300,"demandHappiness":150,"money_24h":525,"medals_24h":15},"HighMiddleAge":{"population":300,"happiness":600,"demandHappiness":300,"money_24h":1050,"medals_24h":17},"LateMiddleAge":{"population":375,"happiness":750,"demandHappiness":375,"money_24h":1313,"medals_24h":20},"ColonialAge":{"population":450,"happiness":900,"demandHappiness":450,"money_24h":1575,"medals_24h":24},"IndustrialAge":{"population":525,"happiness":1050,"demandHappiness":525,"money_24h":1838,"medals_24h":33},"ProgressiveEra":{"population":600,"happiness":1200,"demandHappiness":600,"money_24h":2100,"medals_24h":45},"ModernEra":{"population":675,"happiness":1350,"demandHappiness":675,"money_24h":2363,"medals_24h":65},"PostModernEra":{"population":750,"happiness":1500,"demandHappiness":750,"money_24h":2625,"medals_24h":90},"ContemporaryEra":{"population":825,"happiness":1650,"demandHappiness":825,"money_24h":2888,"medals_24h":129},"TomorrowEra":{"population":900,"happiness":1800,"demandHappiness":900,"money_24h":3150,"medals_24h":174},"FutureEra":{"population":975,"happiness":1950,"demandHappiness":975,"money_24h":3413,"medals_24h":213},"ArcticFuture":{"population":1050,"happiness":2100,"demandHappiness":1050,"money_24h":3675,"medals_24h":258},"OceanicFuture":{"population":1125,"happiness":2250,"demandHappiness":1125,"money_24h":3938,"medals_24h":296},"VirtualFuture":{"population":1200,"happiness":2400,"demandHappiness":1200,"money_24h":4200,"medals_24h":360},"SpaceAgeMars":{"population":1275,"happiness":2550,"demandHappiness":1275,"money_24h":4463,"medals_24h":438},"SpaceAgeAsteroidBelt":{"population":1350,"happiness":2700,"demandHappiness":1350,"money_24h":4725,"medals_24h":515},"SpaceAgeVenus":{"population":1425,"happiness":2850,"demandHappiness":1425,"money_24h":4988,"medals_24h":592},"SpaceAgeJupiterMoon":{"population":1500,"happiness":3000,"demandHappiness":1500,"money_24h":5250,"medals_24h":669},"SpaceAgeTitan":{"population":1575,"happiness":3150,"demandHappiness":1575,"money_24h":5512,"medals_24h":746},"SpaceAgeSpaceHub":{"population":1650,"happiness":3300,"demandHappiness":1650,"money_24h":5774,"medals_24h":823}} },
+    "W_MultiAge_WILD23A4": { prod: {"BronzeAge":{"population":50,"happiness":100,"demandHappiness":50,"money_24h":170,"medals_24h":11,"random_good_of_age_24h":5},"IronAge":{"population":100,"happiness":200,"demandHappiness":100,"money_24h":350,"medals_24h":14,"random_good_of_age_24h":5},"EarlyMiddleAge":{"population":200,"happiness":400,"demandHappiness":200,"money_24h":700,"medals_24h":17,"random_good_of_age_24h":5},"HighMiddleAge":{"population":400,"happiness":800,"demandHappiness":400,"money_24h":1400,"medals_24h":21,"random_good_of_age_24h":5},"LateMiddleAge":{"population":500,"happiness":1000,"demandHappiness":500,"money_24h":1750,"medals_24h":24,"random_good_of_age_24h":5},"ColonialAge":{"population":600,"happiness":1200,"demandHappiness":600,"money_24h":2100,"medals_24h":28,"random_good_of_age_24h":5},"IndustrialAge":{"population":700,"happiness":1400,"demandHappiness":700,"money_24h":2450,"medals_24h":39,"random_good_of_age_24h":5},"ProgressiveEra":{"population":800,"happiness":1600,"demandHappiness":800,"money_24h":2800,"medals_24h":54,"random_good_of_age_24h":5},"ModernEra":{"population":900,"happiness":1800,"demandHappiness":900,"money_24h":3150,"medals_24h":78,"random_good_of_age_24h":5},"PostModernEra":{"population":1000,"happiness":2000,"demandHappiness":1000,"money_24h":3500,"medals_24h":108,"random_good_of_age_24h":5},"ContemporaryEra":{"population":1100,"happiness":2200,"demandHappiness":1100,"money_24h":3850,"medals_24h":155,"random_good_of_age_24h":5},"TomorrowEra":{"population":1200,"happiness":2400,"demandHappiness":1200,"money_24h":4200,"medals_24h":209,"random_good_of_age_24h":5},"FutureEra":{"population":1300,"happiness":2600,"demandHappiness":1300,"money_24h":4550,"medals_24h":255,"random_good_of_age_24h":5},"ArcticFuture":{"population":1400,"happiness":2800,"demandHappiness":1400,"money_24h":4900,"medals_24h":309,"random_good_of_age_24h":5},"OceanicFuture":{"population":1500,"happiness":3000,"demandHappiness":1500,"money_24h":5250,"medals_24h":355,"random_good_of_age_24h":5},"VirtualFuture":{"population":1600,"happiness":3200,"demandHappiness":1600,"money_24h":5600,"medals_24h":432,"random_good_of_age_24h":5},"SpaceAgeMars":{"population":1700,"happiness":3400,"demandHappiness":1700,"money_24h":5950,"medals_24h":525,"random_good_of_age_24h":5},"SpaceAgeAsteroidBelt":{"population":1800,"happiness":3600,"demandHappiness":1800,"money_24h":6300,"medals_24h":618,"random_good_of_age_24h":5},"SpaceAgeVenus":{"population":1900,"happiness":3800,"demandHappiness":1900,"money_24h":6650,"medals_24h":710,"random_good_of_age_24h":5},"SpaceAgeJupiterMoon":{"population":2000,"happiness":4000,"demandHappiness":2000,"money_24h":7000,"medals_24h":803,"random_good_of_age_24h":5},"SpaceAgeTitan":{"population":2100,"happiness":4200,"demandHappiness":2100,"money_24h":7350,"medals_24h":896,"random_good_of_age_24h":5},"SpaceAgeSpaceHub":{"population":2200,"happiness":4400,"demandHappiness":2200,"money_24h":7700,"medals_24h":989,"random_good_of_age_24h":5}} },
+    "W_MultiAge_WILD23A5": { prod: {"BronzeAge":{"population":63,"happiness":125,"demandHappiness":63,"money_24h":213,"medals_24h":13,"random_good_of_age_24h":10},"IronAge":{"population":125,"happiness":250,"demandHappiness":125,"money_24h":438,"medals_24h":17,"random_good_of_age_24h":10},"EarlyMiddleAge":{"population":250,"happiness":500,"demandHappiness":250,"money_24h":875,"medals_24h":20,"random_good_of_age_24h":10},"HighMiddleAge":{"population":500,"happiness":1000,"demandHappiness":500,"money_24h":1750,"medals_24h":24,"random_good_of_age_24h":10},"LateMiddleAge":{"population":625,"happiness":1250,"demandHappiness":625,"money_24h":2188,"medals_24h":27,"random_good_of_age_24h":10},"ColonialAge":{"population":750,"happiness":1500,"demandHappiness":750,"money_24h":2625,"medals_24h":33,"random_good_of_age_24h":10},"IndustrialAge":{"population":875,"happiness":1750,"demandHappiness":875,"money_24h":3063,"medals_24h":45,"random_good_of_age_24h":10},"ProgressiveEra":{"population":1000,"happiness":2000,"demandHappiness":1000,"money_24h":3500,"medals_24h":63,"random_good_of_age_24h":10},"ModernEra":{"population":1125,"happiness":2250,"demandHappiness":1125,"money_24h":3938,"medals_24h":90,"random_good_of_age_24h":10},"PostModernEra":{"population":1250,"happiness":2500,"demandHappiness":1250,"money_24h":4375,"medals_24h":126,"random_good_of_age_24h":10},"ContemporaryEra":{"population":1375,"happiness":2750,"demandHappiness":1375,"money_24h":4813,"medals_24h":180,"random_good_of_age_24h":10},"TomorrowEra":{"population":1500,"happiness":3000,"demandHappiness":1500,"money_24h":5250,"medals_24h":243,"random_good_of_age_24h":10},"FutureEra":{"population":1625,"happiness":3250,"demandHappiness":1625,"money_24h":5688,"medals_24h":297,"random_good_of_age_24h":10},"ArcticFuture":{"population":1750,"happiness":3500,"demandHappiness":1750,"money_24h":6125,"medals_24h":360,"random_good_of_age_24h":10},"OceanicFuture":{"population":1875,"happiness":3750,"demandHappiness":1875,"money_24h":6563,"medals_24h":414,"random_good_of_age_24h":10},"VirtualFuture":{"population":2000,"happiness":4000,"demandHappiness":2000,"money_24h":7000,"medals_24h":504,"random_good_of_age_24h":10},"SpaceAgeMars":{"population":2125,"happiness":4250,"demandHappiness":2125,"money_24h":7438,"medals_24h":612,"random_good_of_age_24h":15},"SpaceAgeAsteroidBelt":{"population":2250,"happiness":4500,"demandHappiness":2250,"money_24h":7875,"medals_24h":720,"random_good_of_age_24h":15},"SpaceAgeVenus":{"population":2375,"happiness":4750,"demandHappiness":2375,"money_24h":8313,"medals_24h":828,"random_good_of_age_24h":15},"SpaceAgeJupiterMoon":{"population":2500,"happiness":5000,"demandHappiness":2500,"money_24h":8750,"medals_24h":936,"random_good_of_age_24h":15},"SpaceAgeTitan":{"population":2625,"happiness":5250,"demandHappiness":2625,"money_24h":9187,"medals_24h":1044,"random_good_of_age_24h":15},"SpaceAgeSpaceHub":{"population":2750,"happiness":5500,"demandHappiness":2750,"money_24h":9624,"medals_24h":1152,"random_good_of_age_24h":15}} },
+    "W_MultiAge_WILD23A6": { prod: {"BronzeAge":{"population":75,"happiness":150,"demandHappiness":75,"money_24h":255,"medals_24h":15,"random_good_of_age_24h":15,"strategy_points_24h":1},"IronAge":{"population":150,"happiness":300,"demandHappiness":150,"money_24h":525,"medals_24h":19,"random_good_of_age_24h":15,"strategy_points_24h":1},"EarlyMiddleAge":{"population":300,"happiness":600,"demandHappiness":300,"money_24h":1050,"medals_24h":23,"random_good_of_age_24h":15,"strategy_points_24h":1},"HighMiddleAge":{"population":600,"happiness":1200,"demandHappiness":600,"money_24h":2100,"medals_24h":27,"random_good_of_age_24h":15,"strategy_points_24h":1},"LateMiddleAge":{"population":750,"happiness":1500,"demandHappiness":750,"money_24h":2625,"medals_24h":31,"random_good_of_age_24h":15,"strategy_points_24h":1},"ColonialAge":{"population":900,"happiness":1800,"demandHappiness":900,"money_24h":3150,"medals_24h":38,"random_good_of_age_24h":15,"strategy_points_24h":1},"IndustrialAge":{"population":1050,"happiness":2100,"demandHappiness":1050,"money_24h":3675,"medals_24h":52,"random_good_of_age_24h":15,"strategy_points_24h":1},"ProgressiveEra":{"population":1200,"happiness":2400,"demandHappiness":1200,"money_24h":4200,"medals_24h":72,"random_good_of_age_24h":15,"strategy_points_24h":1},"ModernEra":{"population":1350,"happiness":2700,"demandHappiness":1350,"money_24h":4725,"medals_24h":103,"random_good_of_age_24h":15,"strategy_points_24h":1},"PostModernEra":{"population":1500,"happiness":3000,"demandHappiness":1500,"money_24h":5250,"medals_24h":144,"random_good_of_age_24h":15,"strategy_points_24h":1},"ContemporaryEra":{"population":1650,"happiness":3300,"demandHappiness":1650,"money_24h":5775,"medals_24h":206,"random_good_of_age_24h":15,"strategy_points_24h":1},"TomorrowEra":{"population":1800,"happiness":3600,"demandHappiness":1800,"money_24h":6300,"medals_24h":278,"random_good_of_age_24h":15,"strategy_points_24h":1},"FutureEra":{"population":1950,"happiness":3900,"demandHappiness":1950,"money_24h":6825,"medals_24h":340,"random_good_of_age_24h":15,"strategy_points_24h":1},"ArcticFuture":{"population":2100,"happiness":4200,"demandHappiness":2100,"money_24h":7350,"medals_24h":412,"random_good_of_age_24h":15,"strategy_points_24h":1},"OceanicFuture":{"population":2250,"happiness":4500,"demandHappiness":2250,"money_24h":7875,"medals_24h":474,"random_good_of_age_24h":15,"strategy_points_24h":1},"VirtualFuture":{"population":2400,"happiness":4800,"demandHappiness":2400,"money_24h":8400,"medals_24h":576,"random_good_of_age_24h":15,"strategy_points_24h":1},"SpaceAgeMars":{"population":2550,"happiness":5100,"demandHappiness":2550,"money_24h":8925,"medals_24h":700,"random_good_of_age_24h":20,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"population":2700,"happiness":5400,"demandHappiness":2700,"money_24h":9450,"medals_24h":823,"random_good_of_age_24h":20,"strategy_points_24h":1},"SpaceAgeVenus":{"population":2850,"happiness":5700,"demandHappiness":2850,"money_24h":9975,"medals_24h":947,"random_good_of_age_24h":20,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"population":3000,"happiness":6000,"demandHappiness":3000,"money_24h":10500,"medals_24h":1070,"random_good_of_age_24h":20,"strategy_points_24h":1},"SpaceAgeTitan":{"population":3150,"happiness":6300,"demandHappiness":3150,"money_24h":11025,"medals_24h":1193,"random_good_of_age_24h":20,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"population":3300,"happiness":6600,"demandHappiness":3300,"money_24h":11550,"medals_24h":1316,"random_good_of_age_24h":20,"strategy_points_24h":1}} },
+    "W_MultiAge_WILD23A7": { prod: {"BronzeAge":{"population":88,"happiness":175,"demandHappiness":88,"money_24h":298,"medals_24h":17,"random_good_of_age_24h":20,"strategy_points_24h":2},"IronAge":{"population":175,"happiness":350,"demandHappiness":175,"money_24h":613,"medals_24h":21,"random_good_of_age_24h":20,"strategy_points_24h":2},"EarlyMiddleAge":{"population":350,"happiness":700,"demandHappiness":350,"money_24h":1225,"medals_24h":26,"random_good_of_age_24h":20,"strategy_points_24h":2},"HighMiddleAge":{"population":700,"happiness":1400,"demandHappiness":700,"money_24h":2450,"medals_24h":31,"random_good_of_age_24h":20,"strategy_points_24h":2},"LateMiddleAge":{"population":875,"happiness":1750,"demandHappiness":875,"money_24h":3063,"medals_24h":35,"random_good_of_age_24h":20,"strategy_points_24h":2},"ColonialAge":{"population":1050,"happiness":2100,"demandHappiness":1050,"money_24h":3675,"medals_24h":42,"random_good_of_age_24h":20,"strategy_points_24h":2},"IndustrialAge":{"population":1225,"happiness":2450,"demandHappiness":1225,"money_24h":4288,"medals_24h":58,"random_good_of_age_24h":20,"strategy_points_24h":3},"ProgressiveEra":{"population":1400,"happiness":2800,"demandHappiness":1400,"money_24h":4900,"medals_24h":81,"random_good_of_age_24h":20,"strategy_points_24h":3},"ModernEra":{"population":1575,"happiness":3150,"demandHappiness":1575,"money_24h":5513,"medals_24h":116,"random_good_of_age_24h":20,"strategy_points_24h":3},"PostModernEra":{"population":1750,"happiness":3500,"demandHappiness":1750,"money_24h":6125,"medals_24h":162,"random_good_of_age_24h":20,"strategy_points_24h":3},"ContemporaryEra":{"population":1925,"happiness":3850,"demandHappiness":1925,"money_24h":6738,"medals_24h":232,"random_good_of_age_24h":20,"strategy_points_24h":3},"TomorrowEra":{"population":2100,"happiness":4200,"demandHappiness":2100,"money_24h":7350,"medals_24h":313,"random_good_of_age_24h":20,"strategy_points_24h":3},"FutureEra":{"population":2275,"happiness":4550,"demandHappiness":2275,"money_24h":7963,"medals_24h":382,"random_good_of_age_24h":20,"strategy_points_24h":4},"ArcticFuture":{"population":2450,"happiness":4900,"demandHappiness":2450,"money_24h":8575,"medals_24h":463,"random_good_of_age_24h":20,"strategy_points_24h":4},"OceanicFuture":{"population":2625,"happiness":5250,"demandHappiness":2625,"money_24h":9188,"medals_24h":533,"random_good_of_age_24h":20,"strategy_points_24h":4},"VirtualFuture":{"population":2800,"happiness":5600,"demandHappiness":2800,"money_24h":9800,"medals_24h":648,"random_good_of_age_24h":20,"strategy_points_24h":4},"SpaceAgeMars":{"population":2975,"happiness":5950,"demandHappiness":2975,"money_24h":10413,"medals_24h":787,"random_good_of_age_24h":25,"strategy_points_24h":5},"SpaceAgeAsteroidBelt":{"population":3150,"happiness":6300,"demandHappiness":3150,"money_24h":11025,"medals_24h":926,"random_good_of_age_24h":25,"strategy_points_24h":5},"SpaceAgeVenus":{"population":3325,"happiness":6650,"demandHappiness":3325,"money_24h":11638,"medals_24h":1065,"random_good_of_age_24h":25,"strategy_points_24h":5},"SpaceAgeJupiterMoon":{"population":3500,"happiness":7000,"demandHappiness":3500,"money_24h":12250,"medals_24h":1204,"random_good_of_age_24h":25,"strategy_points_24h":6},"SpaceAgeTitan":{"population":3675,"happiness":7350,"demandHappiness":3675,"money_24h":12862,"medals_24h":1343,"random_good_of_age_24h":25,"strategy_points_24h":6},"SpaceAgeSpaceHub":{"population":3850,"happiness":7700,"demandHappiness":3850,"money_24h":13474,"medals_24h":1482,"random_good_of_age_24h":25,"strategy_points_24h":6}} },
+    "W_MultiAge_WILD23A8": { prod: {"BronzeAge":{"population":113,"happiness":225,"demandHappiness":113,"money_24h":383,"medals_24h":18,"random_good_of_age_24h":25,"strategy_points_24h":4},"IronAge":{"population":225,"happiness":450,"demandHappiness":225,"money_24h":788,"medals_24h":24,"random_good_of_age_24h":25,"strategy_points_24h":4},"EarlyMiddleAge":{"population":450,"happiness":900,"demandHappiness":450,"money_24h":1575,"medals_24h":29,"random_good_of_age_24h":25,"strategy_points_24h":4},"HighMiddleAge":{"population":900,"happiness":1800,"demandHappiness":900,"money_24h":3150,"medals_24h":34,"random_good_of_age_24h":25,"strategy_points_24h":4},"LateMiddleAge":{"population":1125,"happiness":2250,"demandHappiness":1125,"money_24h":3938,"medals_24h":39,"random_good_of_age_24h":25,"strategy_points_24h":5},"ColonialAge":{"population":1350,"happiness":2700,"demandHappiness":1350,"money_24h":4725,"medals_24h":47,"random_good_of_age_24h":25,"strategy_points_24h":5},"IndustrialAge":{"population":1575,"happiness":3150,"demandHappiness":1575,"money_24h":5513,"medals_24h":65,"random_good_of_age_24h":25,"strategy_points_24h":5},"ProgressiveEra":{"population":1800,"happiness":3600,"demandHappiness":1800,"money_24h":6300,"medals_24h":90,"random_good_of_age_24h":25,"strategy_points_24h":5},"ModernEra":{"population":2025,"happiness":4050,"demandHappiness":2025,"money_24h":7088,"medals_24h":129,"random_good_of_age_24h":25,"strategy_points_24h":6},"PostModernEra":{"population":2250,"happiness":4500,"demandHappiness":2250,"money_24h":7875,"medals_24h":180,"random_good_of_age_24h":25,"strategy_points_24h":6},"ContemporaryEra":{"population":2475,"happiness":4950,"demandHappiness":2475,"money_24h":8663,"medals_24h":258,"random_good_of_age_24h":25,"strategy_points_24h":6},"TomorrowEra":{"population":2700,"happiness":5400,"demandHappiness":2700,"money_24h":9450,"medals_24h":348,"random_good_of_age_24h":25,"strategy_points_24h":6},"FutureEra":{"population":2925,"happiness":5850,"demandHappiness":2925,"money_24h":10238,"medals_24h":425,"random_good_of_age_24h":25,"strategy_points_24h":7},"ArcticFuture":{"population":3150,"happiness":6300,"demandHappiness":3150,"money_24h":11025,"medals_24h":515,"random_good_of_age_24h":25,"strategy_points_24h":7},"OceanicFuture":{"population":3375,"happiness":6750,"demandHappiness":3375,"money_24h":11813,"medals_24h":592,"random_good_of_age_24h":25,"strategy_points_24h":7},"VirtualFuture":{"population":3600,"happiness":7200,"demandHappiness":3600,"money_24h":12600,"medals_24h":720,"random_good_of_age_24h":25,"strategy_points_24h":8},"SpaceAgeMars":{"population":3825,"happiness":7650,"demandHappiness":3825,"money_24h":13388,"medals_24h":875,"random_good_of_age_24h":30,"strategy_points_24h":8},"SpaceAgeAsteroidBelt":{"population":4050,"happiness":8100,"demandHappiness":4050,"money_24h":14175,"medals_24h":1029,"random_good_of_age_24h":30,"strategy_points_24h":9},"SpaceAgeVenus":{"population":4275,"happiness":8550,"demandHappiness":4275,"money_24h":14963,"medals_24h":1183,"random_good_of_age_24h":30,"strategy_points_24h":9},"SpaceAgeJupiterMoon":{"population":4500,"happiness":9000,"demandHappiness":4500,"money_24h":15750,"medals_24h":1338,"random_good_of_age_24h":30,"strategy_points_24h":10},"SpaceAgeTitan":{"population":4725,"happiness":9450,"demandHappiness":4725,"money_24h":16537,"medals_24h":1493,"random_good_of_age_24h":30,"strategy_points_24h":10},"SpaceAgeSpaceHub":{"population":4950,"happiness":9900,"demandHappiness":4950,"money_24h":17324,"medals_24h":1648,"random_good_of_age_24h":30,"strategy_points_24h":11}}, boosts: [{"type":"att_boost_attacker","value":8,"feature":"all"}] },
+    "W_MultiAge_WILD23A9": { prod: {"BronzeAge":{"population":150,"happiness":300,"demandHappiness":150,"money_24h":510,"medals_24h":20,"random_good_of_age_24h":30,"strategy_points_24h":8,"units_24h":1},"IronAge":{"population":300,"happiness":600,"demandHappiness":300,"money_24h":1050,"medals_24h":26,"random_good_of_age_24h":30,"strategy_points_24h":8,"units_24h":1},"EarlyMiddleAge":{"population":600,"happiness":1200,"demandHappiness":600,"money_24h":2100,"medals_24h":32,"random_good_of_age_24h":30,"strategy_points_24h":8,"units_24h":1},"HighMiddleAge":{"population":1200,"happiness":2400,"demandHappiness":1200,"money_24h":4200,"medals_24h":37,"random_good_of_age_24h":30,"strategy_points_24h":9,"units_24h":1},"LateMiddleAge":{"population":1500,"happiness":3000,"demandHappiness":1500,"money_24h":5250,"medals_24h":43,"random_good_of_age_24h":30,"strategy_points_24h":9,"units_24h":1},"ColonialAge":{"population":1800,"happiness":3600,"demandHappiness":1800,"money_24h":6300,"medals_24h":51,"random_good_of_age_24h":30,"strategy_points_24h":9,"units_24h":1},"IndustrialAge":{"population":2100,"happiness":4200,"demandHappiness":2100,"money_24h":7350,"medals_24h":71,"random_good_of_age_24h":30,"strategy_points_24h":10,"units_24h":1},"ProgressiveEra":{"population":2400,"happiness":4800,"demandHappiness":2400,"money_24h":8400,"medals_24h":99,"random_good_of_age_24h":30,"strategy_points_24h":10,"units_24h":1},"ModernEra":{"population":2700,"happiness":5400,"demandHappiness":2700,"money_24h":9450,"medals_24h":142,"random_good_of_age_24h":30,"strategy_points_24h":10,"units_24h":1},"PostModernEra":{"population":3000,"happiness":6000,"demandHappiness":3000,"money_24h":10500,"medals_24h":198,"random_good_of_age_24h":30,"strategy_points_24h":11,"units_24h":1},"ContemporaryEra":{"population":3300,"happiness":6600,"demandHappiness":3300,"money_24h":11550,"medals_24h":283,"random_good_of_age_24h":30,"strategy_points_24h":11,"units_24h":1},"TomorrowEra":{"population":3600,"happiness":7200,"demandHappiness":3600,"money_24h":12600,"medals_24h":382,"random_good_of_age_24h":30,"strategy_points_24h":11,"units_24h":1},"FutureEra":{"population":3900,"happiness":7800,"demandHappiness":3900,"money_24h":13650,"medals_24h":467,"random_good_of_age_24h":30,"strategy_points_24h":12,"units_24h":1},"ArcticFuture":{"population":4200,"happiness":8400,"demandHappiness":4200,"money_24h":14700,"medals_24h":566,"random_good_of_age_24h":30,"strategy_points_24h":12,"units_24h":1},"OceanicFuture":{"population":4500,"happiness":9000,"demandHappiness":4500,"money_24h":15750,"medals_24h":651,"random_good_of_age_24h":30,"strategy_points_24h":12,"units_24h":1},"VirtualFuture":{"population":4800,"happiness":9600,"demandHappiness":4800,"money_24h":16800,"medals_24h":792,"random_good_of_age_24h":30,"strategy_points_24h":13,"units_24h":1},"SpaceAgeMars":{"population":5100,"happiness":10200,"demandHappiness":5100,"money_24h":17850,"medals_24h":962,"random_good_of_age_24h":35,"strategy_points_24h":13,"units_24h":1},"SpaceAgeAsteroidBelt":{"population":5400,"happiness":10800,"demandHappiness":5400,"money_24h":18900,"medals_24h":1132,"random_good_of_age_24h":35,"strategy_points_24h":13,"units_24h":1},"SpaceAgeVenus":{"population":5700,"happiness":11400,"demandHappiness":5700,"money_24h":19950,"medals_24h":1302,"random_good_of_age_24h":35,"strategy_points_24h":14,"units_24h":1},"SpaceAgeJupiterMoon":{"population":6000,"happiness":12000,"demandHappiness":6000,"money_24h":21000,"medals_24h":1471,"random_good_of_age_24h":35,"strategy_points_24h":14,"units_24h":1},"SpaceAgeTitan":{"population":6300,"happiness":12600,"demandHappiness":6300,"money_24h":22050,"medals_24h":1640,"random_good_of_age_24h":35,"strategy_points_24h":14,"units_24h":1},"SpaceAgeSpaceHub":{"population":6600,"happiness":13200,"demandHappiness":6600,"money_24h":23100,"medals_24h":1809,"random_good_of_age_24h":35,"strategy_points_24h":15,"units_24h":1}}, boosts: [{"type":"att_boost_attacker","value":12,"feature":"all"},{"type":"att_boost_defender","value":5,"feature":"all"}] },
+    "W_MultiAge_WILD23A10": { prod: {"BronzeAge":{"population":250,"happiness":500,"demandHappiness":250,"money_24h":850,"medals_24h":24,"random_good_of_age_24h":40,"strategy_points_24h":12,"units_24h":3},"IronAge":{"population":500,"happiness":1000,"demandHappiness":500,"money_24h":1750,"medals_24h":31,"random_good_of_age_24h":40,"strategy_points_24h":12,"units_24h":3},"EarlyMiddleAge":{"population":1000,"happiness":2000,"demandHappiness":1000,"money_24h":3500,"medals_24h":37,"random_good_of_age_24h":45,"strategy_points_24h":13,"units_24h":3},"HighMiddleAge":{"population":2000,"happiness":4000,"demandHappiness":2000,"money_24h":7000,"medals_24h":44,"random_good_of_age_24h":45,"strategy_points_24h":13,"units_24h":3},"LateMiddleAge":{"population":2500,"happiness":5000,"demandHappiness":2500,"money_24h":8750,"medals_24h":51,"random_good_of_age_24h":45,"strategy_points_24h":13,"units_24h":3},"ColonialAge":{"population":3000,"happiness":6000,"demandHappiness":3000,"money_24h":10500,"medals_24h":61,"random_good_of_age_24h":50,"strategy_points_24h":15,"units_24h":3},"IndustrialAge":{"population":3500,"happiness":7000,"demandHappiness":3500,"money_24h":12250,"medals_24h":84,"random_good_of_age_24h":50,"strategy_points_24h":15,"units_24h":3},"ProgressiveEra":{"population":4000,"happiness":8000,"demandHappiness":4000,"money_24h":14000,"medals_24h":117,"random_good_of_age_24h":50,"strategy_points_24h":15,"units_24h":3},"ModernEra":{"population":4500,"happiness":9000,"demandHappiness":4500,"money_24h":15750,"medals_24h":168,"random_good_of_age_24h":55,"strategy_points_24h":16,"units_24h":3},"PostModernEra":{"population":5000,"happiness":10000,"demandHappiness":5000,"money_24h":17500,"medals_24h":234,"random_good_of_age_24h":55,"strategy_points_24h":16,"units_24h":3},"ContemporaryEra":{"population":5500,"happiness":11000,"demandHappiness":5500,"money_24h":19250,"medals_24h":335,"random_good_of_age_24h":55,"strategy_points_24h":16,"units_24h":3},"TomorrowEra":{"population":6000,"happiness":12000,"demandHappiness":6000,"money_24h":21000,"medals_24h":452,"random_good_of_age_24h":60,"strategy_points_24h":16,"units_24h":3},"FutureEra":{"population":6500,"happiness":13000,"demandHappiness":6500,"money_24h":22750,"medals_24h":552,"random_good_of_age_24h":60,"strategy_points_24h":17,"units_24h":3},"ArcticFuture":{"population":7000,"happiness":14000,"demandHappiness":7000,"money_24h":24500,"medals_24h":669,"random_good_of_age_24h":60,"strategy_points_24h":17,"units_24h":3},"OceanicFuture":{"population":7500,"happiness":15000,"demandHappiness":7500,"money_24h":26250,"medals_24h":769,"random_good_of_age_24h":65,"strategy_points_24h":17,"units_24h":3},"VirtualFuture":{"population":8000,"happiness":16000,"demandHappiness":8000,"money_24h":28000,"medals_24h":936,"random_good_of_age_24h":65,"strategy_points_24h":17,"units_24h":3},"SpaceAgeMars":{"population":8500,"happiness":17000,"demandHappiness":8500,"money_24h":29750,"medals_24h":1137,"random_good_of_age_24h":65,"strategy_points_24h":18,"units_24h":3},"SpaceAgeAsteroidBelt":{"population":9000,"happiness":18000,"demandHappiness":9000,"money_24h":31500,"medals_24h":1338,"random_good_of_age_24h":70,"strategy_points_24h":18,"units_24h":3},"SpaceAgeVenus":{"population":9500,"happiness":19000,"demandHappiness":9500,"money_24h":33250,"medals_24h":1538,"random_good_of_age_24h":70,"strategy_points_24h":18,"units_24h":3},"SpaceAgeJupiterMoon":{"population":10000,"happiness":20000,"demandHappiness":10000,"money_24h":35000,"medals_24h":1739,"random_good_of_age_24h":70,"strategy_points_24h":18,"units_24h":3},"SpaceAgeTitan":{"population":10500,"happiness":21000,"demandHappiness":10500,"money_24h":36750,"medals_24h":1940,"random_good_of_age_24h":75,"strategy_points_24h":19,"units_24h":3},"SpaceAgeSpaceHub":{"population":11000,"happiness":22000,"demandHappiness":11000,"money_24h":38500,"medals_24h":2141,"random_good_of_age_24h":75,"strategy_points_24h":19,"units_24h":3}}, boosts: [{"type":"att_boost_attacker","value":18,"feature":"all"},{"type":"att_boost_defender","value":12,"feature":"all"}] },
+    "W_MultiAge_WILD23F1": { prod: {"BronzeAge":{"strategy_points_24h":1},"IronAge":{"strategy_points_24h":1},"EarlyMiddleAge":{"strategy_points_24h":1},"HighMiddleAge":{"strategy_points_24h":1},"LateMiddleAge":{"strategy_points_24h":1},"ColonialAge":{"strategy_points_24h":1},"IndustrialAge":{"strategy_points_24h":2},"ProgressiveEra":{"strategy_points_24h":2},"ModernEra":{"strategy_points_24h":2},"PostModernEra":{"strategy_points_24h":2},"ContemporaryEra":{"strategy_points_24h":2},"TomorrowEra":{"strategy_points_24h":2},"FutureEra":{"strategy_points_24h":2},"ArcticFuture":{"strategy_points_24h":3},"OceanicFuture":{"strategy_points_24h":3},"VirtualFuture":{"strategy_points_24h":3},"SpaceAgeMars":{"strategy_points_24h":3},"SpaceAgeAsteroidBelt":{"strategy_points_24h":3},"SpaceAgeVenus":{"strategy_points_24h":3},"SpaceAgeJupiterMoon":{"strategy_points_24h":3},"SpaceAgeTitan":{"strategy_points_24h":4},"SpaceAgeSpaceHub":{"strategy_points_24h":4}}, boosts: [{"type":"def_boost_attacker","value":8,"feature":"all"},{"type":"def_boost_defender","value":8,"feature":"all"}] },
+    "W_MultiAge_WILD23F2": { prod: {"BronzeAge":{"strategy_points_24h":2},"IronAge":{"strategy_points_24h":2},"EarlyMiddleAge":{"strategy_points_24h":2},"HighMiddleAge":{"strategy_points_24h":2},"LateMiddleAge":{"strategy_points_24h":2},"ColonialAge":{"strategy_points_24h":3},"IndustrialAge":{"strategy_points_24h":3},"ProgressiveEra":{"strategy_points_24h":3},"ModernEra":{"strategy_points_24h":3},"PostModernEra":{"strategy_points_24h":3},"ContemporaryEra":{"strategy_points_24h":4},"TomorrowEra":{"strategy_points_24h":4},"FutureEra":{"strategy_points_24h":4},"ArcticFuture":{"strategy_points_24h":4},"OceanicFuture":{"strategy_points_24h":4},"VirtualFuture":{"strategy_points_24h":5},"SpaceAgeMars":{"strategy_points_24h":5},"SpaceAgeAsteroidBelt":{"strategy_points_24h":5},"SpaceAgeVenus":{"strategy_points_24h":5},"SpaceAgeJupiterMoon":{"strategy_points_24h":5},"SpaceAgeTitan":{"strategy_points_24h":6},"SpaceAgeSpaceHub":{"strategy_points_24h":6}}, boosts: [{"type":"def_boost_attacker","value":10,"feature":"all"},{"type":"def_boost_defender","value":10,"feature":"all"}] },
+    "W_MultiAge_WILD21A7b": { prod: {"BronzeAge":{"population":308,"happiness":1300,"demandHappiness":308,"money_24h":2100,"medals_24h":27,"strategy_points_24h":10,"random_good_of_age_24h":23},"IronAge":{"population":661,"happiness":2240,"demandHappiness":661,"money_24h":5000,"medals_24h":34,"strategy_points_24h":10,"random_good_of_age_24h":23},"EarlyMiddleAge":{"population":1015,"happiness":2470,"demandHappiness":1015,"money_24h":8400,"medals_24h":42,"strategy_points_24h":10,"random_good_of_age_24h":23},"HighMiddleAge":{"population":1425,"happiness":2760,"demandHappiness":1425,"money_24h":11800,"medals_24h":49,"strategy_points_24h":10,"random_good_of_age_24h":23},"LateMiddleAge":{"population":1870,"happiness":3080,"demandHappiness":1870,"money_24h":15500,"medals_24h":57,"strategy_points_24h":10,"random_good_of_age_24h":23},"ColonialAge":{"population":2360,"happiness":3620,"demandHappiness":2360,"money_24h":23700,"medals_24h":68,"strategy_points_24h":10,"random_good_of_age_24h":23},"IndustrialAge":{"population":2884,"happiness":4080,"demandHappiness":2884,"money_24h":29500,"medals_24h":94,"strategy_points_24h":10,"random_good_of_age_24h":23},"ProgressiveEra":{"population":3443,"happiness":4480,"demandHappiness":3443,"money_24h":35800,"medals_24h":131,"strategy_points_24h":10,"random_good_of_age_24h":23},"ModernEra":{"population":4036,"happiness":4790,"demandHappiness":4036,"money_24h":44500,"medals_24h":187,"strategy_points_24h":10,"random_good_of_age_24h":23},"PostModernEra":{"population":4651,"happiness":4990,"demandHappiness":4651,"money_24h":56000,"medals_24h":262,"strategy_points_24h":10,"random_good_of_age_24h":23},"ContemporaryEra":{"population":5301,"happiness":5800,"demandHappiness":5301,"money_24h":72900,"medals_24h":374,"strategy_points_24h":10,"random_good_of_age_24h":23},"TomorrowEra":{"population":5974,"happiness":7040,"demandHappiness":5974,"money_24h":84400,"medals_24h":505,"strategy_points_24h":10,"random_good_of_age_24h":23},"FutureEra":{"population":6680,"happiness":8440,"demandHappiness":6680,"money_24h":96800,"medals_24h":617,"strategy_points_24h":10,"random_good_of_age_24h":23},"ArcticFuture":{"population":7410,"happiness":9830,"demandHappiness":7410,"money_24h":110000,"medals_24h":748,"strategy_points_24h":10,"random_good_of_age_24h":23},"OceanicFuture":{"population":8162,"happiness":11340,"demandHappiness":8162,"money_24h":124000,"medals_24h":860,"strategy_points_24h":10,"random_good_of_age_24h":23},"VirtualFuture":{"population":8938,"happiness":13550,"demandHappiness":8938,"money_24h":138900,"medals_24h":1047,"strategy_points_24h":10,"random_good_of_age_24h":23},"SpaceAgeMars":{"population":14147,"happiness":21680,"demandHappiness":14147,"money_24h":232000,"medals_24h":1271,"strategy_points_24h":10,"random_good_of_age_24h":23},"SpaceAgeAsteroidBelt":{"population":15367,"happiness":23560,"demandHappiness":15367,"money_24h":256900,"medals_24h":1495,"strategy_points_24h":10,"random_good_of_age_24h":23},"SpaceAgeVenus":{"population":16610,"happiness":25450,"demandHappiness":16610,"money_24h":283200,"medals_24h":1720,"strategy_points_24h":10,"random_good_of_age_24h":23},"SpaceAgeJupiterMoon":{"population":17887,"happiness":27420,"demandHappiness":17887,"money_24h":310900,"medals_24h":1944,"strategy_points_24h":10,"random_good_of_age_24h":23},"SpaceAgeTitan":{"population":19186,"happiness":29400,"demandHappiness":19186,"money_24h":339900,"medals_24h":2168,"strategy_points_24h":10,"random_good_of_age_24h":23},"SpaceAgeSpaceHub":{"population":20520,"happiness":31450,"demandHappiness":20520,"money_24h":370200,"medals_24h":2392,"strategy_points_24h":10,"random_good_of_age_24h":23}}, boosts: [{"type":"att_boost_attacker","value":14,"feature":"all"},{"type":"def_boost_attacker","value":19,"feature":"all"}] },
+    "W_MultiAge_WILD26B1": { prod: {"BronzeAge":{"population":-300,"medals_24h":50,"strategy_points_24h":40},"IronAge":{"population":-650,"medals_24h":70,"strategy_points_24h":40},"EarlyMiddleAge":{"population":-990,"medals_24h":90,"strategy_points_24h":40},"HighMiddleAge":{"population":-1390,"medals_24h":100,"strategy_points_24h":40},"LateMiddleAge":{"population":-1830,"medals_24h":120,"strategy_points_24h":40},"ColonialAge":{"population":-2300,"medals_24h":140,"strategy_points_24h":40},"IndustrialAge":{"population":-2820,"medals_24h":200,"strategy_points_24h":40},"ProgressiveEra":{"population":-3360,"medals_24h":270,"strategy_points_24h":40},"ModernEra":{"population":-3940,"medals_24h":390,"strategy_points_24h":40},"PostModernEra":{"population":-4540,"medals_24h":550,"strategy_points_24h":40},"ContemporaryEra":{"population":-5180,"medals_24h":780,"strategy_points_24h":40},"TomorrowEra":{"population":-5830,"medals_24h":1050,"strategy_points_24h":40},"FutureEra":{"population":-6520,"medals_24h":1290,"strategy_points_24h":40},"ArcticFuture":{"population":-7230,"medals_24h":1560,"strategy_points_24h":40},"OceanicFuture":{"population":-7970,"medals_24h":1800,"strategy_points_24h":40},"VirtualFuture":{"population":-8730,"medals_24h":2190,"strategy_points_24h":40},"SpaceAgeMars":{"population":-13810,"medals_24h":2660,"strategy_points_24h":40},"SpaceAgeAsteroidBelt":{"population":-15000,"medals_24h":3130,"strategy_points_24h":40},"SpaceAgeVenus":{"population":-16220,"medals_24h":3590,"strategy_points_24h":40},"SpaceAgeJupiterMoon":{"population":-17460,"medals_24h":4060,"strategy_points_24h":40},"SpaceAgeTitan":{"population":-18730,"medals_24h":4530,"strategy_points_24h":40},"SpaceAgeSpaceHub":{"population":-20000,"medals_24h":5000,"strategy_points_24h":40}}, boosts: [{"type":"att_def_boost_defender","value":32,"feature":"all"},{"type":"att_def_boost_defender","value":32,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD25A1": { prod: {"BronzeAge":{"population":100,"happiness":420,"demandHappiness":100,"supplies_24h":950,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"IronAge":{"population":220,"happiness":730,"demandHappiness":220,"supplies_24h":2270,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"EarlyMiddleAge":{"population":340,"happiness":800,"demandHappiness":340,"supplies_24h":3780,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"HighMiddleAge":{"population":470,"happiness":900,"demandHappiness":470,"supplies_24h":5300,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"LateMiddleAge":{"population":620,"happiness":1000,"demandHappiness":620,"supplies_24h":7000,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"ColonialAge":{"population":780,"happiness":1180,"demandHappiness":780,"supplies_24h":8890,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"IndustrialAge":{"population":960,"happiness":1330,"demandHappiness":960,"supplies_24h":10780,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"ProgressiveEra":{"population":1140,"happiness":1460,"demandHappiness":1140,"supplies_24h":12670,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"ModernEra":{"population":1340,"happiness":1560,"demandHappiness":1340,"supplies_24h":14760,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"PostModernEra":{"population":1550,"happiness":1620,"demandHappiness":1550,"supplies_24h":16840,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"ContemporaryEra":{"population":1760,"happiness":1890,"demandHappiness":1760,"supplies_24h":18920,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"TomorrowEra":{"population":1980,"happiness":2290,"demandHappiness":1980,"supplies_24h":21190,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"FutureEra":{"population":2220,"happiness":2740,"demandHappiness":2220,"supplies_24h":23270,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"ArcticFuture":{"population":2460,"happiness":3200,"demandHappiness":2460,"supplies_24h":25540,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"OceanicFuture":{"population":2710,"happiness":3690,"demandHappiness":2710,"supplies_24h":28000,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"VirtualFuture":{"population":2970,"happiness":4410,"demandHappiness":2970,"supplies_24h":30270,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"SpaceAgeMars":{"population":4700,"happiness":7050,"demandHappiness":4700,"supplies_24h":48990,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"SpaceAgeAsteroidBelt":{"population":5110,"happiness":7660,"demandHappiness":5110,"supplies_24h":52590,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"SpaceAgeVenus":{"population":5520,"happiness":8280,"demandHappiness":5520,"supplies_24h":56370,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"SpaceAgeJupiterMoon":{"population":5940,"happiness":8920,"demandHappiness":5940,"supplies_24h":59970,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"SpaceAgeTitan":{"population":6380,"happiness":9560,"demandHappiness":6380,"supplies_24h":63750,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0},"SpaceAgeSpaceHub":{"population":6810,"happiness":10210,"demandHappiness":6810,"supplies_24h":67530,"strategy_points_24h":21,"random_good_of_previous_age_24h":12.0,"random_good_of_next_age_24h":12.0}}, boosts: [{"type":"att_def_boost_defender","value":6,"feature":"all"},{"type":"att_def_boost_defender","value":2,"feature":"battleground"},{"type":"att_def_boost_defender","value":4,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD25A2": { prod: {"BronzeAge":{"population":160,"happiness":680,"demandHappiness":160,"supplies_24h":1230,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"IronAge":{"population":350,"happiness":1160,"demandHappiness":350,"supplies_24h":2950,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"EarlyMiddleAge":{"population":540,"happiness":1290,"demandHappiness":540,"supplies_24h":4920,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"HighMiddleAge":{"population":760,"happiness":1440,"demandHappiness":760,"supplies_24h":6890,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"LateMiddleAge":{"population":990,"happiness":1600,"demandHappiness":990,"supplies_24h":9100,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"ColonialAge":{"population":1250,"happiness":1880,"demandHappiness":1250,"supplies_24h":11560,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"IndustrialAge":{"population":1530,"happiness":2120,"demandHappiness":1530,"supplies_24h":14020,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"ProgressiveEra":{"population":1830,"happiness":2330,"demandHappiness":1830,"supplies_24h":16480,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"ModernEra":{"population":2150,"happiness":2490,"demandHappiness":2150,"supplies_24h":19180,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"PostModernEra":{"population":2470,"happiness":2600,"demandHappiness":2470,"supplies_24h":21890,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"ContemporaryEra":{"population":2820,"happiness":3020,"demandHappiness":2820,"supplies_24h":24590,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"TomorrowEra":{"population":3180,"happiness":3670,"demandHappiness":3180,"supplies_24h":27540,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"FutureEra":{"population":3550,"happiness":4390,"demandHappiness":3550,"supplies_24h":30250,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"ArcticFuture":{"population":3940,"happiness":5110,"demandHappiness":3940,"supplies_24h":33200,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"OceanicFuture":{"population":4340,"happiness":5900,"demandHappiness":4340,"supplies_24h":36400,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"VirtualFuture":{"population":4750,"happiness":7050,"demandHappiness":4750,"supplies_24h":39350,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"SpaceAgeMars":{"population":7520,"happiness":11280,"demandHappiness":7520,"supplies_24h":63690,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"SpaceAgeAsteroidBelt":{"population":8170,"happiness":12260,"demandHappiness":8170,"supplies_24h":68370,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"SpaceAgeVenus":{"population":8830,"happiness":13240,"demandHappiness":8830,"supplies_24h":73280,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"SpaceAgeJupiterMoon":{"population":9510,"happiness":14270,"demandHappiness":9510,"supplies_24h":77960,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"SpaceAgeTitan":{"population":10200,"happiness":15300,"demandHappiness":10200,"supplies_24h":82880,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0},"SpaceAgeSpaceHub":{"population":10890,"happiness":16330,"demandHappiness":10890,"supplies_24h":87790,"strategy_points_24h":24,"random_good_of_previous_age_24h":21.0,"random_good_of_next_age_24h":21.0}}, boosts: [{"type":"att_def_boost_defender","value":10,"feature":"all"},{"type":"att_def_boost_defender","value":6,"feature":"battleground"},{"type":"att_def_boost_defender","value":8,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD25A3": { prod: {"BronzeAge":{"population":230,"happiness":930,"demandHappiness":230,"supplies_24h":1510,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"IronAge":{"population":480,"happiness":1600,"demandHappiness":480,"supplies_24h":3630,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"EarlyMiddleAge":{"population":740,"happiness":1770,"demandHappiness":740,"supplies_24h":6050,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"HighMiddleAge":{"population":1040,"happiness":1970,"demandHappiness":1040,"supplies_24h":8470,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"LateMiddleAge":{"population":1370,"happiness":2200,"demandHappiness":1370,"supplies_24h":11200,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"ColonialAge":{"population":1730,"happiness":2590,"demandHappiness":1730,"supplies_24h":14230,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"IndustrialAge":{"population":2110,"happiness":2920,"demandHappiness":2110,"supplies_24h":17250,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"ProgressiveEra":{"population":2520,"happiness":3210,"demandHappiness":2520,"supplies_24h":20280,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"ModernEra":{"population":2950,"happiness":3430,"demandHappiness":2950,"supplies_24h":23610,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"PostModernEra":{"population":3400,"happiness":3570,"demandHappiness":3400,"supplies_24h":26940,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"ContemporaryEra":{"population":3880,"happiness":4150,"demandHappiness":3880,"supplies_24h":30270,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"TomorrowEra":{"population":4370,"happiness":5040,"demandHappiness":4370,"supplies_24h":33900,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"FutureEra":{"population":4880,"happiness":6040,"demandHappiness":4880,"supplies_24h":37230,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"ArcticFuture":{"population":5420,"happiness":7030,"demandHappiness":5420,"supplies_24h":40860,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"OceanicFuture":{"population":5970,"happiness":8110,"demandHappiness":5970,"supplies_24h":44800,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"VirtualFuture":{"population":6530,"happiness":9690,"demandHappiness":6530,"supplies_24h":48430,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"SpaceAgeMars":{"population":10340,"happiness":15510,"demandHappiness":10340,"supplies_24h":78390,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"SpaceAgeAsteroidBelt":{"population":11230,"happiness":16860,"demandHappiness":11230,"supplies_24h":84140,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"SpaceAgeVenus":{"population":12140,"happiness":18210,"demandHappiness":12140,"supplies_24h":90200,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"SpaceAgeJupiterMoon":{"population":13080,"happiness":19620,"demandHappiness":13080,"supplies_24h":95950,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"SpaceAgeTitan":{"population":14030,"happiness":21040,"demandHappiness":14030,"supplies_24h":102000,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0},"SpaceAgeSpaceHub":{"population":14980,"happiness":22460,"demandHappiness":14980,"supplies_24h":108050,"strategy_points_24h":27,"random_good_of_previous_age_24h":30.0,"random_good_of_next_age_24h":30.0}}, boosts: [{"type":"att_def_boost_defender","value":14,"feature":"all"},{"type":"att_def_boost_defender","value":10,"feature":"battleground"},{"type":"att_def_boost_defender","value":12,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD25A4": { prod: {"BronzeAge":{"population":290,"happiness":1180,"demandHappiness":290,"supplies_24h":1800,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"IronAge":{"population":620,"happiness":2040,"demandHappiness":620,"supplies_24h":4310,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"EarlyMiddleAge":{"population":940,"happiness":2250,"demandHappiness":940,"supplies_24h":7190,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"HighMiddleAge":{"population":1330,"happiness":2510,"demandHappiness":1330,"supplies_24h":10060,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"LateMiddleAge":{"population":1740,"happiness":2800,"demandHappiness":1740,"supplies_24h":13300,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"ColonialAge":{"population":2200,"happiness":3290,"demandHappiness":2200,"supplies_24h":16890,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"IndustrialAge":{"population":2680,"happiness":3710,"demandHappiness":2680,"supplies_24h":20490,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"ProgressiveEra":{"population":3200,"happiness":4080,"demandHappiness":3200,"supplies_24h":24080,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"ModernEra":{"population":3750,"happiness":4360,"demandHappiness":3750,"supplies_24h":28030,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"PostModernEra":{"population":4330,"happiness":4550,"demandHappiness":4330,"supplies_24h":31990,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"ContemporaryEra":{"population":4930,"happiness":5280,"demandHappiness":4930,"supplies_24h":35940,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"TomorrowEra":{"population":5560,"happiness":6410,"demandHappiness":5560,"supplies_24h":40260,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"FutureEra":{"population":6220,"happiness":7680,"demandHappiness":6220,"supplies_24h":44210,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"ArcticFuture":{"population":6890,"happiness":8950,"demandHappiness":6890,"supplies_24h":48520,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"OceanicFuture":{"population":7590,"happiness":10330,"demandHappiness":7590,"supplies_24h":53190,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"VirtualFuture":{"population":8320,"happiness":12340,"demandHappiness":8320,"supplies_24h":57510,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"SpaceAgeMars":{"population":13160,"happiness":19740,"demandHappiness":13160,"supplies_24h":93090,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"SpaceAgeAsteroidBelt":{"population":14300,"happiness":21450,"demandHappiness":14300,"supplies_24h":99920,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"SpaceAgeVenus":{"population":15450,"happiness":23180,"demandHappiness":15450,"supplies_24h":107110,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"SpaceAgeJupiterMoon":{"population":16640,"happiness":24970,"demandHappiness":16640,"supplies_24h":113940,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"SpaceAgeTitan":{"population":17850,"happiness":26780,"demandHappiness":17850,"supplies_24h":121130,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0},"SpaceAgeSpaceHub":{"population":19060,"happiness":28580,"demandHappiness":19060,"supplies_24h":128310,"strategy_points_24h":30,"random_good_of_previous_age_24h":39.0,"random_good_of_next_age_24h":39.0}}, boosts: [{"type":"att_def_boost_defender","value":18,"feature":"all"},{"type":"att_def_boost_defender","value":14,"feature":"battleground"},{"type":"att_def_boost_defender","value":16,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD25A5": { prod: {"BronzeAge":{"population":350,"happiness":1430,"demandHappiness":350,"supplies_24h":2080,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"IronAge":{"population":750,"happiness":2470,"demandHappiness":750,"supplies_24h":4990,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"EarlyMiddleAge":{"population":1150,"happiness":2730,"demandHappiness":1150,"supplies_24h":8320,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"HighMiddleAge":{"population":1610,"happiness":3050,"demandHappiness":1610,"supplies_24h":11650,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"LateMiddleAge":{"population":2110,"happiness":3400,"demandHappiness":2110,"supplies_24h":15400,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"ColonialAge":{"population":2670,"happiness":4000,"demandHappiness":2670,"supplies_24h":19560,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"IndustrialAge":{"population":3260,"happiness":4510,"demandHappiness":3260,"supplies_24h":23720,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"ProgressiveEra":{"population":3890,"happiness":4950,"demandHappiness":3890,"supplies_24h":27880,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"ModernEra":{"population":4560,"happiness":5300,"demandHappiness":4560,"supplies_24h":32460,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"PostModernEra":{"population":5250,"happiness":5520,"demandHappiness":5250,"supplies_24h":37040,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"ContemporaryEra":{"population":5990,"happiness":6420,"demandHappiness":5990,"supplies_24h":41620,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"TomorrowEra":{"population":6750,"happiness":7790,"demandHappiness":6750,"supplies_24h":46610,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"FutureEra":{"population":7550,"happiness":9330,"demandHappiness":7550,"supplies_24h":51190,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"ArcticFuture":{"population":8370,"happiness":10870,"demandHappiness":8370,"supplies_24h":56180,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"OceanicFuture":{"population":9220,"happiness":12540,"demandHappiness":9220,"supplies_24h":61590,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"VirtualFuture":{"population":10100,"happiness":14980,"demandHappiness":10100,"supplies_24h":66590,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"SpaceAgeMars":{"population":15980,"happiness":23970,"demandHappiness":15980,"supplies_24h":107790,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"SpaceAgeAsteroidBelt":{"population":17360,"happiness":26050,"demandHappiness":17360,"supplies_24h":115700,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"SpaceAgeVenus":{"population":18760,"happiness":28140,"demandHappiness":18760,"supplies_24h":124020,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"SpaceAgeJupiterMoon":{"population":20210,"happiness":30320,"demandHappiness":20210,"supplies_24h":131930,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"SpaceAgeTitan":{"population":21680,"happiness":32510,"demandHappiness":21680,"supplies_24h":140250,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0},"SpaceAgeSpaceHub":{"population":23140,"happiness":34710,"demandHappiness":23140,"supplies_24h":148570,"strategy_points_24h":33,"random_good_of_previous_age_24h":48.0,"random_good_of_next_age_24h":48.0}}, boosts: [{"type":"att_def_boost_defender","value":22,"feature":"all"},{"type":"att_def_boost_defender","value":18,"feature":"battleground"},{"type":"att_def_boost_defender","value":20,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD25A6": { prod: {"BronzeAge":{"population":410,"happiness":1690,"demandHappiness":410,"supplies_24h":2360,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"IronAge":{"population":880,"happiness":2910,"demandHappiness":880,"supplies_24h":5680,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"EarlyMiddleAge":{"population":1350,"happiness":3220,"demandHappiness":1350,"supplies_24h":9460,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"HighMiddleAge":{"population":1890,"happiness":3590,"demandHappiness":1890,"supplies_24h":13240,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"LateMiddleAge":{"population":2480,"happiness":4000,"demandHappiness":2480,"supplies_24h":17500,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"ColonialAge":{"population":3140,"happiness":4710,"demandHappiness":3140,"supplies_24h":22230,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"IndustrialAge":{"population":3830,"happiness":5310,"demandHappiness":3830,"supplies_24h":26960,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"ProgressiveEra":{"population":4580,"happiness":5830,"demandHappiness":4580,"supplies_24h":31690,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"ModernEra":{"population":5360,"happiness":6230,"demandHappiness":5360,"supplies_24h":36890,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"PostModernEra":{"population":6180,"happiness":6500,"demandHappiness":6180,"supplies_24h":42090,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"ContemporaryEra":{"population":7050,"happiness":7550,"demandHappiness":7050,"supplies_24h":47290,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"TomorrowEra":{"population":7940,"happiness":9160,"demandHappiness":7940,"supplies_24h":52970,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"FutureEra":{"population":8880,"happiness":10980,"demandHappiness":8880,"supplies_24h":58170,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"ArcticFuture":{"population":9850,"happiness":12780,"demandHappiness":9850,"supplies_24h":63840,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"OceanicFuture":{"population":10850,"happiness":14750,"demandHappiness":10850,"supplies_24h":69990,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"VirtualFuture":{"population":11880,"happiness":17620,"demandHappiness":11880,"supplies_24h":75670,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"SpaceAgeMars":{"population":18800,"happiness":28200,"demandHappiness":18800,"supplies_24h":122490,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"SpaceAgeAsteroidBelt":{"population":20420,"happiness":30650,"demandHappiness":20420,"supplies_24h":131470,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"SpaceAgeVenus":{"population":22080,"happiness":33110,"demandHappiness":22080,"supplies_24h":140930,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"SpaceAgeJupiterMoon":{"population":23770,"happiness":35670,"demandHappiness":23770,"supplies_24h":149920,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"SpaceAgeTitan":{"population":25500,"happiness":38250,"demandHappiness":25500,"supplies_24h":159380,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0},"SpaceAgeSpaceHub":{"population":27230,"happiness":40830,"demandHappiness":27230,"supplies_24h":168830,"strategy_points_24h":36,"random_good_of_previous_age_24h":57.0,"random_good_of_next_age_24h":57.0}}, boosts: [{"type":"att_def_boost_defender","value":26,"feature":"all"},{"type":"att_def_boost_defender","value":22,"feature":"battleground"},{"type":"att_def_boost_defender","value":24,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD25A7": { prod: {"BronzeAge":{"population":470,"happiness":1940,"demandHappiness":470,"supplies_24h":2650,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"IronAge":{"population":1010,"happiness":3340,"demandHappiness":1010,"supplies_24h":6360,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"EarlyMiddleAge":{"population":1550,"happiness":3700,"demandHappiness":1550,"supplies_24h":10590,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"HighMiddleAge":{"population":2180,"happiness":4130,"demandHappiness":2180,"supplies_24h":14830,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"LateMiddleAge":{"population":2860,"happiness":4600,"demandHappiness":2860,"supplies_24h":19600,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"ColonialAge":{"population":3610,"happiness":5410,"demandHappiness":3610,"supplies_24h":24890,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"IndustrialAge":{"population":4410,"happiness":6100,"demandHappiness":4410,"supplies_24h":30190,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"ProgressiveEra":{"population":5260,"happiness":6700,"demandHappiness":5260,"supplies_24h":35490,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"ModernEra":{"population":6170,"happiness":7170,"demandHappiness":6170,"supplies_24h":41310,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"PostModernEra":{"population":7110,"happiness":7470,"demandHappiness":7110,"supplies_24h":47140,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"ContemporaryEra":{"population":8100,"happiness":8680,"demandHappiness":8100,"supplies_24h":52970,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"TomorrowEra":{"population":9130,"happiness":10540,"demandHappiness":9130,"supplies_24h":59320,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"FutureEra":{"population":10210,"happiness":12630,"demandHappiness":10210,"supplies_24h":65150,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"ArcticFuture":{"population":11330,"happiness":14700,"demandHappiness":11330,"supplies_24h":71510,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"OceanicFuture":{"population":12480,"happiness":16970,"demandHappiness":12480,"supplies_24h":78390,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"VirtualFuture":{"population":13660,"happiness":20270,"demandHappiness":13660,"supplies_24h":84750,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"SpaceAgeMars":{"population":21620,"happiness":32430,"demandHappiness":21620,"supplies_24h":137190,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"SpaceAgeAsteroidBelt":{"population":23490,"happiness":35240,"demandHappiness":23490,"supplies_24h":147250,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"SpaceAgeVenus":{"population":25390,"happiness":38080,"demandHappiness":25390,"supplies_24h":157840,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"SpaceAgeJupiterMoon":{"population":27340,"happiness":41020,"demandHappiness":27340,"supplies_24h":167910,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"SpaceAgeTitan":{"population":29330,"happiness":43990,"demandHappiness":29330,"supplies_24h":178500,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0},"SpaceAgeSpaceHub":{"population":31310,"happiness":46960,"demandHappiness":31310,"supplies_24h":189090,"strategy_points_24h":39,"random_good_of_previous_age_24h":66.0,"random_good_of_next_age_24h":66.0}}, boosts: [{"type":"att_def_boost_defender","value":32,"feature":"all"},{"type":"att_def_boost_defender","value":28,"feature":"battleground"},{"type":"att_def_boost_defender","value":30,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD25A8": { prod: {"BronzeAge":{"population":530,"happiness":2190,"demandHappiness":530,"supplies_24h":2930,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"IronAge":{"population":1140,"happiness":3780,"demandHappiness":1140,"supplies_24h":7040,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"EarlyMiddleAge":{"population":1750,"happiness":4180,"demandHappiness":1750,"supplies_24h":11730,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"HighMiddleAge":{"population":2460,"happiness":4670,"demandHappiness":2460,"supplies_24h":16420,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"LateMiddleAge":{"population":3230,"happiness":5200,"demandHappiness":3230,"supplies_24h":21700,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"ColonialAge":{"population":4080,"happiness":6120,"demandHappiness":4080,"supplies_24h":27560,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"IndustrialAge":{"population":4980,"happiness":6900,"demandHappiness":4980,"supplies_24h":33430,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"ProgressiveEra":{"population":5950,"happiness":7580,"demandHappiness":5950,"supplies_24h":39290,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"ModernEra":{"population":6970,"happiness":8110,"demandHappiness":6970,"supplies_24h":45740,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"PostModernEra":{"population":8040,"happiness":8440,"demandHappiness":8040,"supplies_24h":52190,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"ContemporaryEra":{"population":9160,"happiness":9810,"demandHappiness":9160,"supplies_24h":58640,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"TomorrowEra":{"population":10320,"happiness":11910,"demandHappiness":10320,"supplies_24h":65680,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"FutureEra":{"population":11540,"happiness":14270,"demandHappiness":11540,"supplies_24h":72130,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"ArcticFuture":{"population":12800,"happiness":16620,"demandHappiness":12800,"supplies_24h":79170,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"OceanicFuture":{"population":14100,"happiness":19180,"demandHappiness":14100,"supplies_24h":86790,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"VirtualFuture":{"population":15440,"happiness":22910,"demandHappiness":15440,"supplies_24h":93830,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"SpaceAgeMars":{"population":24440,"happiness":36660,"demandHappiness":24440,"supplies_24h":151880,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"SpaceAgeAsteroidBelt":{"population":26550,"happiness":39840,"demandHappiness":26550,"supplies_24h":163030,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"SpaceAgeVenus":{"population":28700,"happiness":43040,"demandHappiness":28700,"supplies_24h":174750,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"SpaceAgeJupiterMoon":{"population":30900,"happiness":46370,"demandHappiness":30900,"supplies_24h":185900,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"SpaceAgeTitan":{"population":33150,"happiness":49730,"demandHappiness":33150,"supplies_24h":197630,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0},"SpaceAgeSpaceHub":{"population":35400,"happiness":53080,"demandHappiness":35400,"supplies_24h":209350,"strategy_points_24h":42,"random_good_of_previous_age_24h":75.0,"random_good_of_next_age_24h":75.0}}, boosts: [{"type":"att_def_boost_defender","value":38,"feature":"all"},{"type":"att_def_boost_defender","value":34,"feature":"battleground"},{"type":"att_def_boost_defender","value":36,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD25A9": { prod: {"BronzeAge":{"population":590,"happiness":2450,"demandHappiness":590,"supplies_24h":3220,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"IronAge":{"population":1270,"happiness":4220,"demandHappiness":1270,"supplies_24h":7720,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"EarlyMiddleAge":{"population":1960,"happiness":4660,"demandHappiness":1960,"supplies_24h":12860,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"HighMiddleAge":{"population":2750,"happiness":5200,"demandHappiness":2750,"supplies_24h":18010,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"LateMiddleAge":{"population":3600,"happiness":5800,"demandHappiness":3600,"supplies_24h":23800,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"ColonialAge":{"population":4550,"happiness":6820,"demandHappiness":4550,"supplies_24h":30230,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"IndustrialAge":{"population":5560,"happiness":7700,"demandHappiness":5560,"supplies_24h":36660,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"ProgressiveEra":{"population":6630,"happiness":8450,"demandHappiness":6630,"supplies_24h":43090,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"ModernEra":{"population":7780,"happiness":9040,"demandHappiness":7780,"supplies_24h":50170,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"PostModernEra":{"population":8960,"happiness":9420,"demandHappiness":8960,"supplies_24h":57240,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"ContemporaryEra":{"population":10220,"happiness":10950,"demandHappiness":10220,"supplies_24h":64320,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"TomorrowEra":{"population":11510,"happiness":13290,"demandHappiness":11510,"supplies_24h":72040,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"FutureEra":{"population":12870,"happiness":15920,"demandHappiness":12870,"supplies_24h":79110,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"ArcticFuture":{"population":14280,"happiness":18540,"demandHappiness":14280,"supplies_24h":86830,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"OceanicFuture":{"population":15730,"happiness":21390,"demandHappiness":15730,"supplies_24h":95190,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"VirtualFuture":{"population":17220,"happiness":25560,"demandHappiness":17220,"supplies_24h":102910,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"SpaceAgeMars":{"population":27260,"happiness":40890,"demandHappiness":27260,"supplies_24h":166580,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"SpaceAgeAsteroidBelt":{"population":29620,"happiness":44440,"demandHappiness":29620,"supplies_24h":178800,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"SpaceAgeVenus":{"population":32010,"happiness":48010,"demandHappiness":32010,"supplies_24h":191670,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"SpaceAgeJupiterMoon":{"population":34470,"happiness":51720,"demandHappiness":34470,"supplies_24h":203890,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"SpaceAgeTitan":{"population":36980,"happiness":55460,"demandHappiness":36980,"supplies_24h":216750,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0},"SpaceAgeSpaceHub":{"population":39480,"happiness":59210,"demandHappiness":39480,"supplies_24h":229610,"strategy_points_24h":45,"random_good_of_previous_age_24h":84.0,"random_good_of_next_age_24h":84.0}}, boosts: [{"type":"att_def_boost_defender","value":44,"feature":"all"},{"type":"att_def_boost_defender","value":40,"feature":"battleground"},{"type":"att_def_boost_defender","value":42,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD24A15": { prod: {"BronzeAge":{"happiness":3400,"strategy_points_24h":245,"random_good_of_age_24h":295,"all_goods_of_next_age_24h":245},"IronAge":{"happiness":5860,"strategy_points_24h":250,"random_good_of_age_24h":300,"all_goods_of_next_age_24h":250},"EarlyMiddleAge":{"happiness":6480,"strategy_points_24h":255,"random_good_of_age_24h":305,"all_goods_of_next_age_24h":255},"HighMiddleAge":{"happiness":7230,"strategy_points_24h":260,"random_good_of_age_24h":310,"all_goods_of_next_age_24h":260},"LateMiddleAge":{"happiness":8060,"strategy_points_24h":265,"random_good_of_age_24h":315,"all_goods_of_next_age_24h":265},"ColonialAge":{"happiness":9480,"strategy_points_24h":270,"random_good_of_age_24h":320,"all_goods_of_next_age_24h":270},"IndustrialAge":{"happiness":10690,"strategy_points_24h":275,"random_good_of_age_24h":325,"all_goods_of_next_age_24h":275},"ProgressiveEra":{"happiness":11740,"strategy_points_24h":280,"random_good_of_age_24h":330,"all_goods_of_next_age_24h":280},"ModernEra":{"happiness":12560,"strategy_points_24h":285,"random_good_of_age_24h":335,"all_goods_of_next_age_24h":285},"PostModernEra":{"happiness":13090,"strategy_points_24h":290,"random_good_of_age_24h":340,"all_goods_of_next_age_24h":290},"ContemporaryEra":{"happiness":15210,"strategy_points_24h":295,"random_good_of_age_24h":345,"all_goods_of_next_age_24h":295},"TomorrowEra":{"happiness":18460,"strategy_points_24h":300,"random_good_of_age_24h":350,"all_goods_of_next_age_24h":300},"FutureEra":{"happiness":22120,"strategy_points_24h":305,"random_good_of_age_24h":355,"all_goods_of_next_age_24h":305},"ArcticFuture":{"happiness":25750,"strategy_points_24h":310,"random_good_of_age_24h":360,"all_goods_of_next_age_24h":310},"OceanicFuture":{"happiness":29720,"strategy_points_24h":315,"random_good_of_age_24h":365,"all_goods_of_next_age_24h":315},"VirtualFuture":{"happiness":35500,"strategy_points_24h":320,"random_good_of_age_24h":370,"all_goods_of_next_age_24h":320},"SpaceAgeMars":{"happiness":56810,"strategy_points_24h":325,"random_good_of_age_24h":375,"all_goods_of_next_age_24h":325},"SpaceAgeAsteroidBelt":{"happiness":61740,"strategy_points_24h":330,"random_good_of_age_24h":380,"all_goods_of_next_age_24h":330},"SpaceAgeVenus":{"happiness":66700,"strategy_points_24h":335,"random_good_of_age_24h":385,"all_goods_of_next_age_24h":335},"SpaceAgeJupiterMoon":{"happiness":71850,"strategy_points_24h":340,"random_good_of_age_24h":390,"all_goods_of_next_age_24h":340},"SpaceAgeTitan":{"happiness":77050,"strategy_points_24h":345,"random_good_of_age_24h":395,"all_goods_of_next_age_24h":345},"SpaceAgeSpaceHub":{"happiness":82260,"strategy_points_24h":350,"random_good_of_age_24h":400,"all_goods_of_next_age_24h":350}}, boosts: [{"type":"att_def_boost_attacker","value":205,"feature":"all"},{"type":"att_def_boost_attacker","value":245,"feature":"battleground"},{"type":"att_def_boost_attacker","value":25,"feature":"guild_raids"},{"type":"guild_raids_action_points_collection","value":200,"feature":"all"}] },
+    "W_MultiAge_WILD21A7c": { prod: {"BronzeAge":{"population":308,"happiness":1300,"demandHappiness":308,"money_24h":2100,"medals_24h":34,"strategy_points_24h":13,"random_good_of_age_24h":32},"IronAge":{"population":661,"happiness":2240,"demandHappiness":661,"money_24h":5000,"medals_24h":44,"strategy_points_24h":13,"random_good_of_age_24h":32},"EarlyMiddleAge":{"population":1015,"happiness":2470,"demandHappiness":1015,"money_24h":8400,"medals_24h":53,"strategy_points_24h":13,"random_good_of_age_24h":32},"HighMiddleAge":{"population":1425,"happiness":2760,"demandHappiness":1425,"money_24h":11800,"medals_24h":63,"strategy_points_24h":13,"random_good_of_age_24h":32},"LateMiddleAge":{"population":1870,"happiness":3080,"demandHappiness":1870,"money_24h":15500,"medals_24h":72,"strategy_points_24h":13,"random_good_of_age_24h":32},"ColonialAge":{"population":2360,"happiness":3620,"demandHappiness":2360,"money_24h":23700,"medals_24h":87,"strategy_points_24h":13,"random_good_of_age_24h":32},"IndustrialAge":{"population":2884,"happiness":4080,"demandHappiness":2884,"money_24h":29500,"medals_24h":120,"strategy_points_24h":13,"random_good_of_age_24h":32},"ProgressiveEra":{"population":3443,"happiness":4480,"demandHappiness":3443,"money_24h":35800,"medals_24h":168,"strategy_points_24h":13,"random_good_of_age_24h":32},"ModernEra":{"population":4036,"happiness":4790,"demandHappiness":4036,"money_24h":44500,"medals_24h":240,"strategy_points_24h":13,"random_good_of_age_24h":32},"PostModernEra":{"population":4651,"happiness":4990,"demandHappiness":4651,"money_24h":56000,"medals_24h":336,"strategy_points_24h":13,"random_good_of_age_24h":32},"ContemporaryEra":{"population":5301,"happiness":5800,"demandHappiness":5301,"money_24h":72900,"medals_24h":480,"strategy_points_24h":13,"random_good_of_age_24h":32},"TomorrowEra":{"population":5974,"happiness":7040,"demandHappiness":5974,"money_24h":84400,"medals_24h":648,"strategy_points_24h":13,"random_good_of_age_24h":32},"FutureEra":{"population":6680,"happiness":8440,"demandHappiness":6680,"money_24h":96800,"medals_24h":792,"strategy_points_24h":13,"random_good_of_age_24h":32},"ArcticFuture":{"population":7410,"happiness":9830,"demandHappiness":7410,"money_24h":110000,"medals_24h":960,"strategy_points_24h":13,"random_good_of_age_24h":32},"OceanicFuture":{"population":8162,"happiness":11340,"demandHappiness":8162,"money_24h":124000,"medals_24h":1104,"strategy_points_24h":13,"random_good_of_age_24h":32},"VirtualFuture":{"population":8938,"happiness":13550,"demandHappiness":8938,"money_24h":138900,"medals_24h":1344,"strategy_points_24h":13,"random_good_of_age_24h":32},"SpaceAgeMars":{"population":14147,"happiness":21680,"demandHappiness":14147,"money_24h":232000,"medals_24h":1632,"strategy_points_24h":13,"random_good_of_age_24h":32},"SpaceAgeAsteroidBelt":{"population":15367,"happiness":23560,"demandHappiness":15367,"money_24h":256900,"medals_24h":1920,"strategy_points_24h":13,"random_good_of_age_24h":32},"SpaceAgeVenus":{"population":16610,"happiness":25450,"demandHappiness":16610,"money_24h":283200,"medals_24h":2208,"strategy_points_24h":13,"random_good_of_age_24h":32},"SpaceAgeJupiterMoon":{"population":17887,"happiness":27420,"demandHappiness":17887,"money_24h":310900,"medals_24h":2496,"strategy_points_24h":13,"random_good_of_age_24h":32},"SpaceAgeTitan":{"population":19186,"happiness":29400,"demandHappiness":19186,"money_24h":339900,"medals_24h":2784,"strategy_points_24h":13,"random_good_of_age_24h":32},"SpaceAgeSpaceHub":{"population":20520,"happiness":31450,"demandHappiness":20520,"money_24h":370200,"medals_24h":3072,"strategy_points_24h":13,"random_good_of_age_24h":32}}, boosts: [{"type":"supply_production","value":35,"feature":"all"}] },
+    "W_MultiAge_WILD24A14": { prod: {"BronzeAge":{"happiness":2910,"strategy_points_24h":45,"random_good_of_age_24h":145,"all_goods_of_next_age_24h":95},"IronAge":{"happiness":5020,"strategy_points_24h":50,"random_good_of_age_24h":150,"all_goods_of_next_age_24h":100},"EarlyMiddleAge":{"happiness":5550,"strategy_points_24h":55,"random_good_of_age_24h":155,"all_goods_of_next_age_24h":105},"HighMiddleAge":{"happiness":6190,"strategy_points_24h":60,"random_good_of_age_24h":160,"all_goods_of_next_age_24h":110},"LateMiddleAge":{"happiness":6910,"strategy_points_24h":65,"random_good_of_age_24h":165,"all_goods_of_next_age_24h":115},"ColonialAge":{"happiness":8120,"strategy_points_24h":70,"random_good_of_age_24h":170,"all_goods_of_next_age_24h":120},"IndustrialAge":{"happiness":9160,"strategy_points_24h":75,"random_good_of_age_24h":175,"all_goods_of_next_age_24h":125},"ProgressiveEra":{"happiness":10060,"strategy_points_24h":80,"random_good_of_age_24h":180,"all_goods_of_next_age_24h":130},"ModernEra":{"happiness":10760,"strategy_points_24h":85,"random_good_of_age_24h":185,"all_goods_of_next_age_24h":135},"PostModernEra":{"happiness":11210,"strategy_points_24h":90,"random_good_of_age_24h":190,"all_goods_of_next_age_24h":140},"ContemporaryEra":{"happiness":13030,"strategy_points_24h":95,"random_good_of_age_24h":195,"all_goods_of_next_age_24h":145},"TomorrowEra":{"happiness":15820,"strategy_points_24h":100,"random_good_of_age_24h":200,"all_goods_of_next_age_24h":150},"FutureEra":{"happiness":18950,"strategy_points_24h":105,"random_good_of_age_24h":205,"all_goods_of_next_age_24h":155},"ArcticFuture":{"happiness":22070,"strategy_points_24h":110,"random_good_of_age_24h":210,"all_goods_of_next_age_24h":160},"OceanicFuture":{"happiness":25470,"strategy_points_24h":115,"random_good_of_age_24h":215,"all_goods_of_next_age_24h":165},"VirtualFuture":{"happiness":30420,"strategy_points_24h":120,"random_good_of_age_24h":220,"all_goods_of_next_age_24h":170},"SpaceAgeMars":{"happiness":48680,"strategy_points_24h":125,"random_good_of_age_24h":225,"all_goods_of_next_age_24h":175},"SpaceAgeAsteroidBelt":{"happiness":52900,"strategy_points_24h":130,"random_good_of_age_24h":230,"all_goods_of_next_age_24h":180},"SpaceAgeVenus":{"happiness":57150,"strategy_points_24h":135,"random_good_of_age_24h":235,"all_goods_of_next_age_24h":185},"SpaceAgeJupiterMoon":{"happiness":61570,"strategy_points_24h":140,"random_good_of_age_24h":240,"all_goods_of_next_age_24h":190},"SpaceAgeTitan":{"happiness":66030,"strategy_points_24h":145,"random_good_of_age_24h":245,"all_goods_of_next_age_24h":195},"SpaceAgeSpaceHub":{"happiness":70490,"strategy_points_24h":150,"random_good_of_age_24h":250,"all_goods_of_next_age_24h":200}}, boosts: [{"type":"att_def_boost_attacker","value":45,"feature":"all"},{"type":"att_def_boost_attacker","value":95,"feature":"battleground"},{"type":"att_def_boost_attacker","value":5,"feature":"guild_raids"}] },
+    "W_MultiAge_WILD26D1": { prod: {"BronzeAge":{"strategy_points_24h":200},"IronAge":{"strategy_points_24h":200},"EarlyMiddleAge":{"strategy_points_24h":200},"HighMiddleAge":{"strategy_points_24h":200},"LateMiddleAge":{"strategy_points_24h":200},"ColonialAge":{"strategy_points_24h":200},"IndustrialAge":{"strategy_points_24h":200},"ProgressiveEra":{"strategy_points_24h":200},"ModernEra":{"strategy_points_24h":200},"PostModernEra":{"strategy_points_24h":200},"ContemporaryEra":{"strategy_points_24h":200},"TomorrowEra":{"strategy_points_24h":200},"FutureEra":{"strategy_points_24h":200},"ArcticFuture":{"strategy_points_24h":200},"OceanicFuture":{"strategy_points_24h":200},"VirtualFuture":{"strategy_points_24h":200},"SpaceAgeMars":{"strategy_points_24h":200},"SpaceAgeAsteroidBelt":{"strategy_points_24h":200},"SpaceAgeVenus":{"strategy_points_24h":200},"SpaceAgeJupiterMoon":{"strategy_points_24h":200},"SpaceAgeTitan":{"strategy_points_24h":200},"SpaceAgeSpaceHub":{"strategy_points_24h":200}}, boosts: [{"type":"att_def_boost_attacker_defender","value":150,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":100,"feature":"guild_expedition"},{"type":"att_def_boost_attacker_defender","value":20,"feature":"guild_raids"}] },
+    "W_MultiAge_WILD24C1": { prod: {"BronzeAge":{"population":-30,"random_good_of_age_24h":4,"strategy_points_24h":1},"IronAge":{"population":-70,"random_good_of_age_24h":4,"strategy_points_24h":1},"EarlyMiddleAge":{"population":-110,"random_good_of_age_24h":4,"strategy_points_24h":1},"HighMiddleAge":{"population":-150,"random_good_of_age_24h":4,"strategy_points_24h":1},"LateMiddleAge":{"population":-190,"random_good_of_age_24h":4,"strategy_points_24h":1},"ColonialAge":{"population":-250,"random_good_of_age_24h":4,"strategy_points_24h":1},"IndustrialAge":{"population":-300,"random_good_of_age_24h":4,"strategy_points_24h":1},"ProgressiveEra":{"population":-360,"random_good_of_age_24h":4,"strategy_points_24h":1},"ModernEra":{"population":-420,"random_good_of_age_24h":4,"strategy_points_24h":1},"PostModernEra":{"population":-480,"random_good_of_age_24h":4,"strategy_points_24h":1},"ContemporaryEra":{"population":-550,"random_good_of_age_24h":4,"strategy_points_24h":1},"TomorrowEra":{"population":-620,"random_good_of_age_24h":4,"strategy_points_24h":1},"FutureEra":{"population":-700,"random_good_of_age_24h":4,"strategy_points_24h":1},"ArcticFuture":{"population":-770,"random_good_of_age_24h":5,"strategy_points_24h":2},"OceanicFuture":{"population":-850,"random_good_of_age_24h":5,"strategy_points_24h":2},"VirtualFuture":{"population":-930,"random_good_of_age_24h":5,"strategy_points_24h":2},"SpaceAgeMars":{"population":-1470,"random_good_of_age_24h":5,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"population":-1600,"random_good_of_age_24h":5,"strategy_points_24h":2},"SpaceAgeVenus":{"population":-1730,"random_good_of_age_24h":5,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"population":-1860,"random_good_of_age_24h":5,"strategy_points_24h":2},"SpaceAgeTitan":{"population":-2000,"random_good_of_age_24h":6,"strategy_points_24h":3},"SpaceAgeSpaceHub":{"population":-2140,"random_good_of_age_24h":6,"strategy_points_24h":3}}, boosts: [{"type":"att_boost_attacker","value":3,"feature":"all"},{"type":"att_boost_defender","value":5,"feature":"all"}] },
+    "W_MultiAge_WILD24C2": { prod: {"BronzeAge":{"population":-30,"random_good_of_age_24h":6,"strategy_points_24h":2},"IronAge":{"population":-70,"random_good_of_age_24h":6,"strategy_points_24h":2},"EarlyMiddleAge":{"population":-110,"random_good_of_age_24h":6,"strategy_points_24h":2},"HighMiddleAge":{"population":-150,"random_good_of_age_24h":6,"strategy_points_24h":2},"LateMiddleAge":{"population":-190,"random_good_of_age_24h":6,"strategy_points_24h":2},"ColonialAge":{"population":-250,"random_good_of_age_24h":6,"strategy_points_24h":2},"IndustrialAge":{"population":-300,"random_good_of_age_24h":6,"strategy_points_24h":2},"ProgressiveEra":{"population":-360,"random_good_of_age_24h":6,"strategy_points_24h":2},"ModernEra":{"population":-420,"random_good_of_age_24h":6,"strategy_points_24h":2},"PostModernEra":{"population":-480,"random_good_of_age_24h":6,"strategy_points_24h":2},"ContemporaryEra":{"population":-550,"random_good_of_age_24h":6,"strategy_points_24h":2},"TomorrowEra":{"population":-620,"random_good_of_age_24h":6,"strategy_points_24h":2},"FutureEra":{"population":-700,"random_good_of_age_24h":6,"strategy_points_24h":2},"ArcticFuture":{"population":-770,"random_good_of_age_24h":7,"strategy_points_24h":3},"OceanicFuture":{"population":-850,"random_good_of_age_24h":7,"strategy_points_24h":3},"VirtualFuture":{"population":-930,"random_good_of_age_24h":7,"strategy_points_24h":3},"SpaceAgeMars":{"population":-1470,"random_good_of_age_24h":7,"strategy_points_24h":3},"SpaceAgeAsteroidBelt":{"population":-1600,"random_good_of_age_24h":7,"strategy_points_24h":3},"SpaceAgeVenus":{"population":-1730,"random_good_of_age_24h":7,"strategy_points_24h":3},"SpaceAgeJupiterMoon":{"population":-1860,"random_good_of_age_24h":7,"strategy_points_24h":3},"SpaceAgeTitan":{"population":-2000,"random_good_of_age_24h":8,"strategy_points_24h":4},"SpaceAgeSpaceHub":{"population":-2140,"random_good_of_age_24h":8,"strategy_points_24h":4}}, boosts: [{"type":"att_boost_attacker","value":5,"feature":"all"},{"type":"att_boost_defender","value":7,"feature":"all"}] },
+    "W_MultiAge_WILD25C1": { prod: {"AllAge":{"all_goods_of_age_24h":14.9},"BronzeAge":{"population":-100},"IronAge":{"population":-210},"EarlyMiddleAge":{"population":-320},"HighMiddleAge":{"population":-450},"LateMiddleAge":{"population":-580},"ColonialAge":{"population":-740},"IndustrialAge":{"population":-900},"ProgressiveEra":{"population":-1080},"ModernEra":{"population":-1260},"PostModernEra":{"population":-1450},"ContemporaryEra":{"population":-1660},"TomorrowEra":{"population":-1870},"FutureEra":{"population":-2090},"ArcticFuture":{"population":-2320},"OceanicFuture":{"population":-2550},"VirtualFuture":{"population":-2800},"SpaceAgeMars":{"population":-4420},"SpaceAgeAsteroidBelt":{"population":-4810},"SpaceAgeVenus":{"population":-5190},"SpaceAgeJupiterMoon":{"population":-5590},"SpaceAgeTitan":{"population":-6000},"SpaceAgeSpaceHub":{"population":-6410}}, boosts: [{"type":"att_boost_attacker","value":1,"feature":"battleground"},{"type":"att_def_boost_attacker","value":1,"feature":"all"},{"type":"att_def_boost_attacker","value":4,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD24G1": { prod: {"AllAge":{"strategy_points_24h":2},"BronzeAge":{"population":20,"demandHappiness":20},"IronAge":{"population":50,"demandHappiness":50},"EarlyMiddleAge":{"population":80,"demandHappiness":80},"HighMiddleAge":{"population":110,"demandHappiness":110},"LateMiddleAge":{"population":150,"demandHappiness":150},"ColonialAge":{"population":180,"demandHappiness":180},"IndustrialAge":{"population":230,"demandHappiness":230},"ProgressiveEra":{"population":270,"demandHappiness":270},"ModernEra":{"population":320,"demandHappiness":320},"PostModernEra":{"population":360,"demandHappiness":360},"ContemporaryEra":{"population":410,"demandHappiness":410},"TomorrowEra":{"population":470,"demandHappiness":470},"FutureEra":{"population":520,"demandHappiness":520},"ArcticFuture":{"population":580,"demandHappiness":580},"OceanicFuture":{"population":640,"demandHappiness":640},"VirtualFuture":{"population":700,"demandHappiness":700},"SpaceAgeMars":{"population":1110,"demandHappiness":1110},"SpaceAgeAsteroidBelt":{"population":1200,"demandHappiness":1200},"SpaceAgeVenus":{"population":1300,"demandHappiness":1300},"SpaceAgeJupiterMoon":{"population":1400,"demandHappiness":1400},"SpaceAgeTitan":{"population":1500,"demandHappiness":1500},"SpaceAgeSpaceHub":{"population":1600,"demandHappiness":1600}}, boosts: [{"type":"att_boost_attacker","value":1,"feature":"all"},{"type":"att_boost_attacker","value":2,"feature":"battleground"},{"type":"def_boost_attacker","value":2,"feature":"all"},{"type":"def_boost_attacker","value":2,"feature":"battleground"}] },
+    "W_MultiAge_WILD26C1": { prod: {"BronzeAge":{"population":-300,"medals_24h":50,"strategy_points_24h":45},"IronAge":{"population":-650,"medals_24h":70,"strategy_points_24h":45},"EarlyMiddleAge":{"population":-990,"medals_24h":90,"strategy_points_24h":45},"HighMiddleAge":{"population":-1390,"medals_24h":100,"strategy_points_24h":45},"LateMiddleAge":{"population":-1830,"medals_24h":120,"strategy_points_24h":45},"ColonialAge":{"population":-2300,"medals_24h":140,"strategy_points_24h":45},"IndustrialAge":{"population":-2820,"medals_24h":200,"strategy_points_24h":45},"ProgressiveEra":{"population":-3360,"medals_24h":270,"strategy_points_24h":45},"ModernEra":{"population":-3940,"medals_24h":390,"strategy_points_24h":45},"PostModernEra":{"population":-4540,"medals_24h":550,"strategy_points_24h":45},"ContemporaryEra":{"population":-5180,"medals_24h":780,"strategy_points_24h":45},"TomorrowEra":{"population":-5830,"medals_24h":1050,"strategy_points_24h":45},"FutureEra":{"population":-6520,"medals_24h":1290,"strategy_points_24h":45},"ArcticFuture":{"population":-7230,"medals_24h":1560,"strategy_points_24h":45},"OceanicFuture":{"population":-7970,"medals_24h":1800,"strategy_points_24h":45},"VirtualFuture":{"population":-8730,"medals_24h":2190,"strategy_points_24h":45},"SpaceAgeMars":{"population":-13810,"medals_24h":2660,"strategy_points_24h":45},"SpaceAgeAsteroidBelt":{"population":-15000,"medals_24h":3130,"strategy_points_24h":45},"SpaceAgeVenus":{"population":-16220,"medals_24h":3590,"strategy_points_24h":45},"SpaceAgeJupiterMoon":{"population":-17460,"medals_24h":4060,"strategy_points_24h":45},"SpaceAgeTitan":{"population":-18730,"medals_24h":4530,"strategy_points_24h":45},"SpaceAgeSpaceHub":{"population":-20000,"medals_24h":5000,"strategy_points_24h":45}}, boosts: [{"type":"def_boost_attacker","value":54,"feature":"battleground"},{"type":"att_boost_defender","value":54,"feature":"battleground"}] },
+    "W_MultiAge_WILD22A1": { prod: {"BronzeAge":{"population":135,"happiness":590,"demandHappiness":135,"money_24h":800},"IronAge":{"population":290,"happiness":1010,"demandHappiness":290,"money_24h":1900},"EarlyMiddleAge":{"population":445,"happiness":1120,"demandHappiness":445,"money_24h":3200},"HighMiddleAge":{"population":624,"happiness":1250,"demandHappiness":624,"money_24h":4500},"LateMiddleAge":{"population":819,"happiness":1390,"demandHappiness":819,"money_24h":6000},"ColonialAge":{"population":1034,"happiness":1640,"demandHappiness":1034,"money_24h":9100},"IndustrialAge":{"population":1264,"happiness":1850,"demandHappiness":1264,"money_24h":11400},"ProgressiveEra":{"population":1508,"happiness":2030,"demandHappiness":1508,"money_24h":13800},"ModernEra":{"population":1768,"happiness":2170,"demandHappiness":1768,"money_24h":17200},"PostModernEra":{"population":2038,"happiness":2260,"demandHappiness":2038,"money_24h":21600},"ContemporaryEra":{"population":2323,"happiness":2630,"demandHappiness":2323,"money_24h":28100},"TomorrowEra":{"population":2617,"happiness":3190,"demandHappiness":2617,"money_24h":32600},"FutureEra":{"population":2927,"happiness":3820,"demandHappiness":2927,"money_24h":37300},"ArcticFuture":{"population":3247,"happiness":4450,"demandHappiness":3247,"money_24h":42400},"OceanicFuture":{"population":3576,"happiness":5140,"demandHappiness":3576,"money_24h":47800},"VirtualFuture":{"population":3916,"happiness":6140,"demandHappiness":3916,"money_24h":53600},"SpaceAgeMars":{"population":6199,"happiness":9820,"demandHappiness":6199,"money_24h":89500},"SpaceAgeAsteroidBelt":{"population":6733,"happiness":10680,"demandHappiness":6733,"money_24h":99100},"SpaceAgeVenus":{"population":7278,"happiness":11530,"demandHappiness":7278,"money_24h":109200},"SpaceAgeJupiterMoon":{"population":7837,"happiness":12420,"demandHappiness":7837,"money_24h":119900},"SpaceAgeTitan":{"population":8407,"happiness":13320,"demandHappiness":8407,"money_24h":131100},"SpaceAgeSpaceHub":{"population":8991,"happiness":14250,"demandHappiness":8991,"money_24h":142800}} },
+    "W_MultiAge_WILD22A2": { prod: {"BronzeAge":{"population":137,"happiness":610,"demandHappiness":137,"money_24h":900,"medals_24h":9},"IronAge":{"population":295,"happiness":1050,"demandHappiness":295,"money_24h":2200,"medals_24h":12},"EarlyMiddleAge":{"population":453,"happiness":1160,"demandHappiness":453,"money_24h":3600,"medals_24h":15},"HighMiddleAge":{"population":636,"happiness":1290,"demandHappiness":636,"money_24h":5000,"medals_24h":17},"LateMiddleAge":{"population":834,"happiness":1440,"demandHappiness":834,"money_24h":6700,"medals_24h":20},"ColonialAge":{"population":1053,"happiness":1700,"demandHappiness":1053,"money_24h":10100,"medals_24h":24},"IndustrialAge":{"population":1287,"happiness":1910,"demandHappiness":1287,"money_24h":12600,"medals_24h":33},"ProgressiveEra":{"population":1536,"happiness":2100,"demandHappiness":1536,"money_24h":15300,"medals_24h":45},"ModernEra":{"population":1800,"happiness":2250,"demandHappiness":1800,"money_24h":19100,"medals_24h":65},"PostModernEra":{"population":2075,"happiness":2340,"demandHappiness":2075,"money_24h":24000,"medals_24h":90},"ContemporaryEra":{"population":2365,"happiness":2720,"demandHappiness":2365,"money_24h":31300,"medals_24h":129},"TomorrowEra":{"population":2665,"happiness":3300,"demandHappiness":2665,"money_24h":36200,"medals_24h":174},"FutureEra":{"population":2980,"happiness":3960,"demandHappiness":2980,"money_24h":41500,"medals_24h":213},"ArcticFuture":{"population":3305,"happiness":4610,"demandHappiness":3305,"money_24h":47100,"medals_24h":258},"OceanicFuture":{"population":3641,"happiness":5320,"demandHappiness":3641,"money_24h":53100,"medals_24h":296},"VirtualFuture":{"population":3987,"happiness":6350,"demandHappiness":3987,"money_24h":59500,"medals_24h":360},"SpaceAgeMars":{"population":6310,"happiness":10160,"demandHappiness":6310,"money_24h":99400,"medals_24h":438},"SpaceAgeAsteroidBelt":{"population":6855,"happiness":11040,"demandHappiness":6855,"money_24h":110100,"medals_24h":515},"SpaceAgeVenus":{"population":7409,"happiness":11930,"demandHappiness":7409,"money_24h":121400,"medals_24h":592},"SpaceAgeJupiterMoon":{"population":7978,"happiness":12850,"demandHappiness":7978,"money_24h":133200,"medals_24h":669},"SpaceAgeTitan":{"population":8558,"happiness":13780,"demandHappiness":8558,"money_24h":145700,"medals_24h":746},"SpaceAgeSpaceHub":{"population":9153,"happiness":14740,"demandHappiness":9153,"money_24h":158700,"medals_24h":823}} },
+    "W_MultiAge_WILD22A3": { prod: {"BronzeAge":{"population":141,"happiness":650,"demandHappiness":141,"money_24h":1000,"medals_24h":11,"strategy_points_24h":1},"IronAge":{"population":303,"happiness":1120,"demandHappiness":303,"money_24h":2400,"medals_24h":14,"strategy_points_24h":1},"EarlyMiddleAge":{"population":465,"happiness":1240,"demandHappiness":465,"money_24h":4000,"medals_24h":17,"strategy_points_24h":1},"HighMiddleAge":{"population":653,"happiness":1380,"demandHappiness":653,"money_24h":5500,"medals_24h":21,"strategy_points_24h":1},"LateMiddleAge":{"population":856,"happiness":1540,"demandHappiness":856,"money_24h":7300,"medals_24h":24,"strategy_points_24h":1},"ColonialAge":{"population":1081,"happiness":1810,"demandHappiness":1081,"money_24h":11200,"medals_24h":28,"strategy_points_24h":1},"IndustrialAge":{"population":1321,"happiness":2040,"demandHappiness":1321,"money_24h":13900,"medals_24h":39,"strategy_points_24h":1},"ProgressiveEra":{"population":1576,"happiness":2240,"demandHappiness":1576,"money_24h":16900,"medals_24h":54,"strategy_points_24h":1},"ModernEra":{"population":1848,"happiness":2400,"demandHappiness":1848,"money_24h":21000,"medals_24h":78,"strategy_points_24h":1},"PostModernEra":{"population":2130,"happiness":2500,"demandHappiness":2130,"money_24h":26400,"medals_24h":108,"strategy_points_24h":1},"ContemporaryEra":{"population":2427,"happiness":2900,"demandHappiness":2427,"money_24h":34400,"medals_24h":155,"strategy_points_24h":1},"TomorrowEra":{"population":2735,"happiness":3520,"demandHappiness":2735,"money_24h":39800,"medals_24h":209,"strategy_points_24h":1},"FutureEra":{"population":3059,"happiness":4220,"demandHappiness":3059,"money_24h":45600,"medals_24h":255,"strategy_points_24h":1},"ArcticFuture":{"population":3393,"happiness":4910,"demandHappiness":3393,"money_24h":51800,"medals_24h":309,"strategy_points_24h":1},"OceanicFuture":{"population":3738,"happiness":5670,"demandHappiness":3738,"money_24h":58500,"medals_24h":355,"strategy_points_24h":1},"VirtualFuture":{"population":4092,"happiness":6770,"demandHappiness":4092,"money_24h":65500,"medals_24h":432,"strategy_points_24h":1},"SpaceAgeMars":{"population":6478,"happiness":10840,"demandHappiness":6478,"money_24h":109400,"medals_24h":525,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"population":7037,"happiness":11780,"demandHappiness":7037,"money_24h":121100,"medals_24h":618,"strategy_points_24h":1},"SpaceAgeVenus":{"population":7606,"happiness":12730,"demandHappiness":7606,"money_24h":133500,"medals_24h":710,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"population":8190,"happiness":13710,"demandHappiness":8190,"money_24h":146600,"medals_24h":803,"strategy_points_24h":1},"SpaceAgeTitan":{"population":8785,"happiness":14700,"demandHappiness":8785,"money_24h":160200,"medals_24h":895,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"population":9396,"happiness":15730,"demandHappiness":9396,"money_24h":174500,"medals_24h":988,"strategy_points_24h":1}} },
+    "W_MultiAge_WILD22A4": { prod: {"BronzeAge":{"population":146,"happiness":690,"demandHappiness":146,"money_24h":1100,"medals_24h":13,"strategy_points_24h":2},"IronAge":{"population":313,"happiness":1190,"demandHappiness":313,"money_24h":2600,"medals_24h":17,"strategy_points_24h":2},"EarlyMiddleAge":{"population":481,"happiness":1310,"demandHappiness":481,"money_24h":4300,"medals_24h":20,"strategy_points_24h":2},"HighMiddleAge":{"population":675,"happiness":1470,"demandHappiness":675,"money_24h":6100,"medals_24h":24,"strategy_points_24h":2},"LateMiddleAge":{"population":886,"happiness":1630,"demandHappiness":886,"money_24h":8000,"medals_24h":27,"strategy_points_24h":2},"ColonialAge":{"population":1118,"happiness":1920,"demandHappiness":1118,"money_24h":12200,"medals_24h":33,"strategy_points_24h":2},"IndustrialAge":{"population":1366,"happiness":2170,"demandHappiness":1366,"money_24h":15200,"medals_24h":45,"strategy_points_24h":2},"ProgressiveEra":{"population":1631,"happiness":2380,"demandHappiness":1631,"money_24h":18400,"medals_24h":63,"strategy_points_24h":2},"ModernEra":{"population":1912,"happiness":2550,"demandHappiness":1912,"money_24h":22900,"medals_24h":90,"strategy_points_24h":2},"PostModernEra":{"population":2203,"happiness":2650,"demandHappiness":2203,"money_24h":28800,"medals_24h":126,"strategy_points_24h":2},"ContemporaryEra":{"population":2511,"happiness":3080,"demandHappiness":2511,"money_24h":37500,"medals_24h":180,"strategy_points_24h":2},"TomorrowEra":{"population":2830,"happiness":3740,"demandHappiness":2830,"money_24h":43400,"medals_24h":243,"strategy_points_24h":2},"FutureEra":{"population":3164,"happiness":4480,"demandHappiness":3164,"money_24h":49800,"medals_24h":297,"strategy_points_24h":2},"ArcticFuture":{"population":3510,"happiness":5220,"demandHappiness":3510,"money_24h":56600,"medals_24h":360,"strategy_points_24h":2},"OceanicFuture":{"population":3866,"happiness":6020,"demandHappiness":3866,"money_24h":63800,"medals_24h":414,"strategy_points_24h":2},"VirtualFuture":{"population":4234,"happiness":7200,"demandHappiness":4234,"money_24h":71400,"medals_24h":504,"strategy_points_24h":2},"SpaceAgeMars":{"population":6701,"happiness":11520,"demandHappiness":6701,"money_24h":119300,"medals_24h":612,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"population":7279,"happiness":12520,"demandHappiness":7279,"money_24h":132100,"medals_24h":720,"strategy_points_24h":2},"SpaceAgeVenus":{"population":7868,"happiness":13520,"demandHappiness":7868,"money_24h":145700,"medals_24h":828,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"population":8473,"happiness":14570,"demandHappiness":8473,"money_24h":159900,"medals_24h":936,"strategy_points_24h":2},"SpaceAgeTitan":{"population":9088,"happiness":15620,"demandHappiness":9088,"money_24h":174800,"medals_24h":1044,"strategy_points_24h":2},"SpaceAgeSpaceHub":{"population":9720,"happiness":16710,"demandHappiness":9720,"money_24h":190400,"medals_24h":1152,"strategy_points_24h":2}} },
+    "W_MultiAge_WILD22A5": { prod: {"BronzeAge":{"population":153,"happiness":730,"demandHappiness":153,"money_24h":1200,"medals_24h":15,"strategy_points_24h":3},"IronAge":{"population":329,"happiness":1260,"demandHappiness":329,"money_24h":2800,"medals_24h":19,"strategy_points_24h":3},"EarlyMiddleAge":{"population":505,"happiness":1390,"demandHappiness":505,"money_24h":4700,"medals_24h":23,"strategy_points_24h":3},"HighMiddleAge":{"population":709,"happiness":1550,"demandHappiness":709,"money_24h":6600,"medals_24h":27,"strategy_points_24h":3},"LateMiddleAge":{"population":930,"happiness":1730,"demandHappiness":930,"money_24h":8700,"medals_24h":31,"strategy_points_24h":3},"ColonialAge":{"population":1174,"happiness":2030,"demandHappiness":1174,"money_24h":13200,"medals_24h":38,"strategy_points_24h":3},"IndustrialAge":{"population":1435,"happiness":2290,"demandHappiness":1435,"money_24h":16400,"medals_24h":52,"strategy_points_24h":3},"ProgressiveEra":{"population":1712,"happiness":2520,"demandHappiness":1712,"money_24h":19900,"medals_24h":72,"strategy_points_24h":3},"ModernEra":{"population":2007,"happiness":2700,"demandHappiness":2007,"money_24h":24800,"medals_24h":103,"strategy_points_24h":3},"PostModernEra":{"population":2313,"happiness":2810,"demandHappiness":2313,"money_24h":31200,"medals_24h":144,"strategy_points_24h":3},"ContemporaryEra":{"population":2637,"happiness":3260,"demandHappiness":2637,"money_24h":40600,"medals_24h":206,"strategy_points_24h":3},"TomorrowEra":{"population":2971,"happiness":3960,"demandHappiness":2971,"money_24h":47000,"medals_24h":278,"strategy_points_24h":3},"FutureEra":{"population":3323,"happiness":4750,"demandHappiness":3323,"money_24h":53900,"medals_24h":340,"strategy_points_24h":3},"ArcticFuture":{"population":3686,"happiness":5530,"demandHappiness":3686,"money_24h":61300,"medals_24h":412,"strategy_points_24h":3},"OceanicFuture":{"population":4060,"happiness":6380,"demandHappiness":4060,"money_24h":69100,"medals_24h":474,"strategy_points_24h":3},"VirtualFuture":{"population":4445,"happiness":7620,"demandHappiness":4445,"money_24h":77400,"medals_24h":576,"strategy_points_24h":3},"SpaceAgeMars":{"population":7036,"happiness":12190,"demandHappiness":7036,"money_24h":129200,"medals_24h":700,"strategy_points_24h":3},"SpaceAgeAsteroidBelt":{"population":7643,"happiness":13250,"demandHappiness":7643,"money_24h":143200,"medals_24h":823,"strategy_points_24h":3},"SpaceAgeVenus":{"population":8261,"happiness":14320,"demandHappiness":8261,"money_24h":157800,"medals_24h":947,"strategy_points_24h":3},"SpaceAgeJupiterMoon":{"population":8896,"happiness":15420,"demandHappiness":8896,"money_24h":173200,"medals_24h":1070,"strategy_points_24h":3},"SpaceAgeTitan":{"population":9543,"happiness":16540,"demandHappiness":9543,"money_24h":189400,"medals_24h":1194,"strategy_points_24h":3},"SpaceAgeSpaceHub":{"population":10206,"happiness":17690,"demandHappiness":10206,"money_24h":206300,"medals_24h":1317,"strategy_points_24h":3}} },
+    "W_MultiAge_WILD22A6": { prod: {"BronzeAge":{"population":163,"happiness":770,"demandHappiness":163,"money_24h":1300,"medals_24h":17,"strategy_points_24h":4},"IronAge":{"population":350,"happiness":1330,"demandHappiness":350,"money_24h":3000,"medals_24h":21,"strategy_points_24h":4},"EarlyMiddleAge":{"population":537,"happiness":1470,"demandHappiness":537,"money_24h":5000,"medals_24h":26,"strategy_points_24h":4},"HighMiddleAge":{"population":754,"happiness":1640,"demandHappiness":754,"money_24h":7100,"medals_24h":31,"strategy_points_24h":4},"LateMiddleAge":{"population":989,"happiness":1830,"demandHappiness":989,"money_24h":9300,"medals_24h":35,"strategy_points_24h":4},"ColonialAge":{"population":1248,"happiness":2150,"demandHappiness":1248,"money_24h":14200,"medals_24h":42,"strategy_points_24h":4},"IndustrialAge":{"population":1526,"happiness":2420,"demandHappiness":1526,"money_24h":17700,"medals_24h":58,"strategy_points_24h":4},"ProgressiveEra":{"population":1821,"happiness":2660,"demandHappiness":1821,"money_24h":21500,"medals_24h":81,"strategy_points_24h":4},"ModernEra":{"population":2135,"happiness":2850,"demandHappiness":2135,"money_24h":26700,"medals_24h":116,"strategy_points_24h":4},"PostModernEra":{"population":2460,"happiness":2970,"demandHappiness":2460,"money_24h":33600,"medals_24h":162,"strategy_points_24h":4},"ContemporaryEra":{"population":2804,"happiness":3450,"demandHappiness":2804,"money_24h":43800,"medals_24h":232,"strategy_points_24h":4},"TomorrowEra":{"population":3160,"happiness":4180,"demandHappiness":3160,"money_24h":50700,"medals_24h":313,"strategy_points_24h":4},"FutureEra":{"population":3534,"happiness":5010,"demandHappiness":3534,"money_24h":58100,"medals_24h":382,"strategy_points_24h":4},"ArcticFuture":{"population":3920,"happiness":5840,"demandHappiness":3920,"money_24h":66000,"medals_24h":463,"strategy_points_24h":4},"OceanicFuture":{"population":4317,"happiness":6730,"demandHappiness":4317,"money_24h":74400,"medals_24h":533,"strategy_points_24h":4},"VirtualFuture":{"population":4728,"happiness":8040,"demandHappiness":4728,"money_24h":83300,"medals_24h":648,"strategy_points_24h":4},"SpaceAgeMars":{"population":7483,"happiness":12870,"demandHappiness":7483,"money_24h":139200,"medals_24h":787,"strategy_points_24h":4},"SpaceAgeAsteroidBelt":{"population":8128,"happiness":13990,"demandHappiness":8128,"money_24h":154200,"medals_24h":926,"strategy_points_24h":4},"SpaceAgeVenus":{"population":8786,"happiness":15110,"demandHappiness":8786,"money_24h":169900,"medals_24h":1065,"strategy_points_24h":4},"SpaceAgeJupiterMoon":{"population":9461,"happiness":16280,"demandHappiness":9461,"money_24h":186500,"medals_24h":1204,"strategy_points_24h":4},"SpaceAgeTitan":{"population":10148,"happiness":17460,"demandHappiness":10148,"money_24h":203900,"medals_24h":1343,"strategy_points_24h":4},"SpaceAgeSpaceHub":{"population":10854,"happiness":18680,"demandHappiness":10854,"money_24h":222100,"medals_24h":1482,"strategy_points_24h":4}} },
+    "W_MultiAge_WILD22A7": { prod: {"BronzeAge":{"population":175,"happiness":810,"demandHappiness":175,"money_24h":1400,"medals_24h":18,"strategy_points_24h":5},"IronAge":{"population":376,"happiness":1400,"demandHappiness":376,"money_24h":3200,"medals_24h":24,"strategy_points_24h":5},"EarlyMiddleAge":{"population":577,"happiness":1550,"demandHappiness":577,"money_24h":5400,"medals_24h":29,"strategy_points_24h":5},"HighMiddleAge":{"population":810,"happiness":1720,"demandHappiness":810,"money_24h":7600,"medals_24h":34,"strategy_points_24h":5},"LateMiddleAge":{"population":1063,"happiness":1920,"demandHappiness":1063,"money_24h":10000,"medals_24h":39,"strategy_points_24h":5},"ColonialAge":{"population":1341,"happiness":2260,"demandHappiness":1341,"money_24h":15200,"medals_24h":47,"strategy_points_24h":5},"IndustrialAge":{"population":1639,"happiness":2550,"demandHappiness":1639,"money_24h":19000,"medals_24h":65,"strategy_points_24h":5},"ProgressiveEra":{"population":1957,"happiness":2800,"demandHappiness":1957,"money_24h":23000,"medals_24h":90,"strategy_points_24h":5},"ModernEra":{"population":2294,"happiness":3000,"demandHappiness":2294,"money_24h":28600,"medals_24h":129,"strategy_points_24h":5},"PostModernEra":{"population":2644,"happiness":3120,"demandHappiness":2644,"money_24h":36000,"medals_24h":180,"strategy_points_24h":5},"ContemporaryEra":{"population":3013,"happiness":3630,"demandHappiness":3013,"money_24h":46900,"medals_24h":258,"strategy_points_24h":5},"TomorrowEra":{"population":3396,"happiness":4400,"demandHappiness":3396,"money_24h":54300,"medals_24h":348,"strategy_points_24h":5},"FutureEra":{"population":3797,"happiness":5270,"demandHappiness":3797,"money_24h":62200,"medals_24h":425,"strategy_points_24h":5},"ArcticFuture":{"population":4212,"happiness":6140,"demandHappiness":4212,"money_24h":70700,"medals_24h":515,"strategy_points_24h":5},"OceanicFuture":{"population":4640,"happiness":7090,"demandHappiness":4640,"money_24h":79700,"medals_24h":592,"strategy_points_24h":5},"VirtualFuture":{"population":5080,"happiness":8470,"demandHappiness":5080,"money_24h":89300,"medals_24h":720,"strategy_points_24h":5},"SpaceAgeMars":{"population":8042,"happiness":13550,"demandHappiness":8042,"money_24h":149100,"medals_24h":875,"strategy_points_24h":5},"SpaceAgeAsteroidBelt":{"population":8735,"happiness":14720,"demandHappiness":8735,"money_24h":165200,"medals_24h":1029,"strategy_points_24h":5},"SpaceAgeVenus":{"population":9441,"happiness":15910,"demandHappiness":9441,"money_24h":182100,"medals_24h":1183,"strategy_points_24h":5},"SpaceAgeJupiterMoon":{"population":10167,"happiness":17140,"demandHappiness":10167,"money_24h":199800,"medals_24h":1338,"strategy_points_24h":5},"SpaceAgeTitan":{"population":10906,"happiness":18380,"demandHappiness":10906,"money_24h":218500,"medals_24h":1492,"strategy_points_24h":5},"SpaceAgeSpaceHub":{"population":11664,"happiness":19660,"demandHappiness":11664,"money_24h":238000,"medals_24h":1646,"strategy_points_24h":5}} },
+    "W_MultiAge_WILD22A8": { prod: {"BronzeAge":{"population":190,"happiness":890,"demandHappiness":190,"money_24h":1400,"medals_24h":20,"strategy_points_24h":7},"IronAge":{"population":407,"happiness":1540,"demandHappiness":407,"money_24h":3500,"medals_24h":26,"strategy_points_24h":7},"EarlyMiddleAge":{"population":625,"happiness":1700,"demandHappiness":625,"money_24h":5800,"medals_24h":32,"strategy_points_24h":7},"HighMiddleAge":{"population":878,"happiness":1900,"demandHappiness":878,"money_24h":8100,"medals_24h":37,"strategy_points_24h":7},"LateMiddleAge":{"population":1151,"happiness":2120,"demandHappiness":1151,"money_24h":10700,"medals_24h":43,"strategy_points_24h":7},"ColonialAge":{"population":1453,"happiness":2490,"demandHappiness":1453,"money_24h":16200,"medals_24h":51,"strategy_points_24h":7},"IndustrialAge":{"population":1776,"happiness":2800,"demandHappiness":1776,"money_24h":20200,"medals_24h":71,"strategy_points_24h":7},"ProgressiveEra":{"population":2120,"happiness":3080,"demandHappiness":2120,"money_24h":24500,"medals_24h":99,"strategy_points_24h":7},"ModernEra":{"population":2485,"happiness":3300,"demandHappiness":2485,"money_24h":30500,"medals_24h":142,"strategy_points_24h":7},"PostModernEra":{"population":2864,"happiness":3430,"demandHappiness":2864,"money_24h":38400,"medals_24h":198,"strategy_points_24h":7},"ContemporaryEra":{"population":3264,"happiness":3990,"demandHappiness":3264,"money_24h":50000,"medals_24h":283,"strategy_points_24h":7},"TomorrowEra":{"population":3678,"happiness":4840,"demandHappiness":3678,"money_24h":57900,"medals_24h":382,"strategy_points_24h":7},"FutureEra":{"population":4114,"happiness":5800,"demandHappiness":4114,"money_24h":66400,"medals_24h":467,"strategy_points_24h":7},"ArcticFuture":{"population":4563,"happiness":6760,"demandHappiness":4563,"money_24h":75400,"medals_24h":566,"strategy_points_24h":7},"OceanicFuture":{"population":5026,"happiness":7800,"demandHappiness":5026,"money_24h":85000,"medals_24h":651,"strategy_points_24h":7},"VirtualFuture":{"population":5504,"happiness":9310,"demandHappiness":5504,"money_24h":95200,"medals_24h":792,"strategy_points_24h":7},"SpaceAgeMars":{"population":8712,"happiness":14900,"demandHappiness":8712,"money_24h":159100,"medals_24h":962,"strategy_points_24h":7},"SpaceAgeAsteroidBelt":{"population":9463,"happiness":16200,"demandHappiness":9463,"money_24h":176200,"medals_24h":1132,"strategy_points_24h":7},"SpaceAgeVenus":{"population":10228,"happiness":17500,"demandHappiness":10228,"money_24h":194200,"medals_24h":1302,"strategy_points_24h":7},"SpaceAgeJupiterMoon":{"population":11014,"happiness":18850,"demandHappiness":11014,"money_24h":213200,"medals_24h":1471,"strategy_points_24h":7},"SpaceAgeTitan":{"population":11815,"happiness":20220,"demandHappiness":11815,"money_24h":233100,"medals_24h":1641,"strategy_points_24h":7},"SpaceAgeSpaceHub":{"population":12636,"happiness":21620,"demandHappiness":12636,"money_24h":253900,"medals_24h":1811,"strategy_points_24h":7}}, boosts: [{"type":"att_boost_attacker","value":1,"feature":"all"}] },
+    "W_MultiAge_WILD22A9": { prod: {"BronzeAge":{"population":207,"happiness":970,"demandHappiness":207,"money_24h":1500,"medals_24h":24,"strategy_points_24h":10},"IronAge":{"population":444,"happiness":1680,"demandHappiness":444,"money_24h":3700,"medals_24h":31,"strategy_points_24h":10},"EarlyMiddleAge":{"population":681,"happiness":1850,"demandHappiness":681,"money_24h":6100,"medals_24h":37,"strategy_points_24h":10},"HighMiddleAge":{"population":956,"happiness":2070,"demandHappiness":956,"money_24h":8600,"medals_24h":44,"strategy_points_24h":10},"LateMiddleAge":{"population":1255,"happiness":2310,"demandHappiness":1255,"money_24h":11300,"medals_24h":51,"strategy_points_24h":10},"ColonialAge":{"population":1584,"happiness":2710,"demandHappiness":1584,"money_24h":17200,"medals_24h":61,"strategy_points_24h":10},"IndustrialAge":{"population":1935,"happiness":3060,"demandHappiness":1935,"money_24h":21500,"medals_24h":84,"strategy_points_24h":10},"ProgressiveEra":{"population":2310,"happiness":3360,"demandHappiness":2310,"money_24h":26100,"medals_24h":117,"strategy_points_24h":10},"ModernEra":{"population":2708,"happiness":3590,"demandHappiness":2708,"money_24h":32400,"medals_24h":168,"strategy_points_24h":10},"PostModernEra":{"population":3121,"happiness":3750,"demandHappiness":3121,"money_24h":40800,"medals_24h":234,"strategy_points_24h":10},"ContemporaryEra":{"population":3557,"happiness":4350,"demandHappiness":3557,"money_24h":53100,"medals_24h":335,"strategy_points_24h":10},"TomorrowEra":{"population":4009,"happiness":5280,"demandHappiness":4009,"money_24h":61500,"medals_24h":452,"strategy_points_24h":10},"FutureEra":{"population":4483,"happiness":6330,"demandHappiness":4483,"money_24h":70500,"medals_24h":552,"strategy_points_24h":10},"ArcticFuture":{"population":4973,"happiness":7370,"demandHappiness":4973,"money_24h":80100,"medals_24h":669,"strategy_points_24h":10},"OceanicFuture":{"population":5477,"happiness":8510,"demandHappiness":5477,"money_24h":90300,"medals_24h":769,"strategy_points_24h":10},"VirtualFuture":{"population":5998,"happiness":10160,"demandHappiness":5998,"money_24h":101200,"medals_24h":936,"strategy_points_24h":10},"SpaceAgeMars":{"population":9494,"happiness":16260,"demandHappiness":9494,"money_24h":169000,"medals_24h":1137,"strategy_points_24h":10},"SpaceAgeAsteroidBelt":{"population":10312,"happiness":17670,"demandHappiness":10312,"money_24h":187200,"medals_24h":1338,"strategy_points_24h":10},"SpaceAgeVenus":{"population":11146,"happiness":19090,"demandHappiness":11146,"money_24h":206400,"medals_24h":1538,"strategy_points_24h":10},"SpaceAgeJupiterMoon":{"population":12003,"happiness":20560,"demandHappiness":12003,"money_24h":226500,"medals_24h":1739,"strategy_points_24h":10},"SpaceAgeTitan":{"population":12875,"happiness":22050,"demandHappiness":12875,"money_24h":247600,"medals_24h":1939,"strategy_points_24h":10},"SpaceAgeSpaceHub":{"population":13770,"happiness":23590,"demandHappiness":13770,"money_24h":269700,"medals_24h":2140,"strategy_points_24h":10}}, boosts: [{"type":"att_boost_attacker","value":12,"feature":"all"}] },
+    "W_MultiAge_WILD24F1": { prod: {"BronzeAge":{"population":100,"demandHappiness":100,"random_good_of_age_24h":16,"strategy_points_24h":3},"IronAge":{"population":210,"demandHappiness":210,"random_good_of_age_24h":16,"strategy_points_24h":3},"EarlyMiddleAge":{"population":320,"demandHappiness":320,"random_good_of_age_24h":16,"strategy_points_24h":3},"HighMiddleAge":{"population":450,"demandHappiness":450,"random_good_of_age_24h":16,"strategy_points_24h":3},"LateMiddleAge":{"population":580,"demandHappiness":580,"random_good_of_age_24h":16,"strategy_points_24h":3},"ColonialAge":{"population":740,"demandHappiness":740,"random_good_of_age_24h":16,"strategy_points_24h":3},"IndustrialAge":{"population":900,"demandHappiness":900,"random_good_of_age_24h":16,"strategy_points_24h":3},"ProgressiveEra":{"population":1080,"demandHappiness":1080,"random_good_of_age_24h":16,"strategy_points_24h":3},"ModernEra":{"population":1260,"demandHappiness":1260,"random_good_of_age_24h":16,"strategy_points_24h":3},"PostModernEra":{"population":1450,"demandHappiness":1450,"random_good_of_age_24h":16,"strategy_points_24h":3},"ContemporaryEra":{"population":1660,"demandHappiness":1660,"random_good_of_age_24h":16,"strategy_points_24h":3},"TomorrowEra":{"population":1870,"demandHappiness":1870,"random_good_of_age_24h":16,"strategy_points_24h":3},"FutureEra":{"population":2090,"demandHappiness":2090,"random_good_of_age_24h":16,"strategy_points_24h":3},"ArcticFuture":{"population":2320,"demandHappiness":2320,"random_good_of_age_24h":16,"strategy_points_24h":4},"OceanicFuture":{"population":2550,"demandHappiness":2550,"random_good_of_age_24h":17,"strategy_points_24h":4},"VirtualFuture":{"population":2800,"demandHappiness":2800,"random_good_of_age_24h":17,"strategy_points_24h":4},"SpaceAgeMars":{"population":4420,"demandHappiness":4420,"random_good_of_age_24h":17,"strategy_points_24h":4},"SpaceAgeAsteroidBelt":{"population":4810,"demandHappiness":4810,"random_good_of_age_24h":17,"strategy_points_24h":4},"SpaceAgeVenus":{"population":5190,"demandHappiness":5190,"random_good_of_age_24h":17,"strategy_points_24h":4},"SpaceAgeJupiterMoon":{"population":5590,"demandHappiness":5590,"random_good_of_age_24h":17,"strategy_points_24h":4},"SpaceAgeTitan":{"population":6000,"demandHappiness":6000,"random_good_of_age_24h":18,"strategy_points_24h":5},"SpaceAgeSpaceHub":{"population":6410,"demandHappiness":6410,"random_good_of_age_24h":18,"strategy_points_24h":5}}, boosts: [{"type":"att_boost_defender","value":6,"feature":"all"},{"type":"att_boost_defender","value":3,"feature":"guild_expedition"},{"type":"def_boost_defender","value":10,"feature":"all"},{"type":"def_boost_defender","value":3,"feature":"guild_expedition"}] },
+    "W_MultiAge_WILD24B1": { prod: {"AllAge":{"strategy_points_24h":80,"all_goods_of_age_24h":140},"BronzeAge":{"population":800,"happiness":3310,"demandHappiness":800},"IronAge":{"population":1720,"happiness":5700,"demandHappiness":1720},"EarlyMiddleAge":{"population":2640,"happiness":6310,"demandHappiness":2640},"HighMiddleAge":{"population":3710,"happiness":7040,"demandHappiness":3710},"LateMiddleAge":{"population":4870,"happiness":7850,"demandHappiness":4870},"ColonialAge":{"population":6150,"happiness":9230,"demandHappiness":6150},"IndustrialAge":{"population":7520,"happiness":10410,"demandHappiness":7520},"ProgressiveEra":{"population":8970,"happiness":11430,"demandHappiness":8970},"ModernEra":{"population":10520,"happiness":12230,"demandHappiness":10520},"PostModernEra":{"population":12120,"happiness":12740,"demandHappiness":12120},"ContemporaryEra":{"population":13810,"happiness":14800,"demandHappiness":13810},"TomorrowEra":{"population":15570,"happiness":17970,"demandHappiness":15570},"FutureEra":{"population":17410,"happiness":21530,"demandHappiness":17410},"ArcticFuture":{"population":19310,"happiness":25070,"demandHappiness":19310},"OceanicFuture":{"population":21270,"happiness":28930,"demandHappiness":21270},"VirtualFuture":{"population":23290,"happiness":34560,"demandHappiness":23290},"SpaceAgeMars":{"population":36870,"happiness":55290,"demandHappiness":36870},"SpaceAgeAsteroidBelt":{"population":40050,"happiness":60090,"demandHappiness":40050},"SpaceAgeVenus":{"population":43290,"happiness":64920,"demandHappiness":43290},"SpaceAgeJupiterMoon":{"population":46610,"happiness":69930,"demandHappiness":46610},"SpaceAgeTitan":{"population":50000,"happiness":75000,"demandHappiness":50000},"SpaceAgeSpaceHub":{"population":53390,"happiness":80070,"demandHappiness":53390}}, boosts: [{"type":"att_boost_attacker","value":100,"feature":"all"},{"type":"def_boost_attacker","value":100,"feature":"all"}] },
+};
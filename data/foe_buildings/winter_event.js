@@ -0,0 +1,104 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// prod/boosts for 100 buildings; merged into the index on demand.
+export const PAYLOAD = {
+    "W_MultiAge_WIN25D1": { prod: {"AllAge":{"strategy_points_24h":105}}, boosts: [{"type":"att_def_boost_attacker_defender","value":84,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":25,"feature":"guild_raids"},{"type":"medal_production","value":25,"feature":"all"}] },
+    "W_MultiAge_WIN19A9c": { prod: {"BronzeAge":{"population":213,"happiness":660,"demandHappiness":213,"money_24h":1150,"supplies_24h":1180,"medals_24h":30,"strategy_points_24h":4,"all_goods_of_age_24h":20},"IronAge":{"population":457,"happiness":1140,"demandHappiness":457,"money_24h":2750,"supplies_24h":2040,"medals_24h":38,"strategy_points_24h":4,"all_goods_of_age_24h":20},"EarlyMiddleAge":{"population":701,"happiness":1260,"demandHappiness":701,"money_24h":4600,"supplies_24h":2250,"medals_24h":47,"strategy_points_24h":4,"all_goods_of_age_24h":20},"HighMiddleAge":{"population":984,"happiness":1410,"demandHappiness":984,"money_24h":6450,"supplies_24h":2510,"medals_24h":55,"strategy_points_24h":4,"all_goods_of_age_24h":20},"LateMiddleAge":{"population":1292,"happiness":1570,"demandHappiness":1292,"money_24h":8600,"supplies_24h":2800,"medals_24h":63,"strategy_points_24h":4,"all_goods_of_age_24h":20},"ColonialAge":{"population":1630,"happiness":1850,"demandHappiness":1630,"money_24h":13000,"supplies_24h":3300,"medals_24h":76,"strategy_points_24h":4,"all_goods_of_age_24h":20},"IndustrialAge":{"population":1992,"happiness":2080,"demandHappiness":1992,"money_24h":16200,"supplies_24h":3720,"medals_24h":105,"strategy_points_24h":4,"all_goods_of_age_24h":20},"ProgressiveEra":{"population":2378,"happiness":2290,"demandHappiness":2378,"money_24h":19700,"supplies_24h":4080,"medals_24h":147,"strategy_points_24h":4,"all_goods_of_age_24h":20},"ModernEra":{"population":2788,"happiness":2450,"demandHappiness":2788,"money_24h":24500,"supplies_24h":4370,"medals_24h":210,"strategy_points_24h":4,"all_goods_of_age_24h":20},"PostModernEra":{"population":3213,"happiness":2550,"demandHappiness":3213,"money_24h":30800,"supplies_24h":4550,"medals_24h":294,"strategy_points_24h":4,"all_goods_of_age_24h":20},"ContemporaryEra":{"population":3662,"happiness":2960,"demandHappiness":3662,"money_24h":40100,"supplies_24h":5290,"medals_24h":420,"strategy_points_24h":4,"all_goods_of_age_24h":20},"TomorrowEra":{"population":4127,"happiness":3600,"demandHappiness":4127,"money_24h":46400,"supplies_24h":6420,"medals_24h":567,"strategy_points_24h":4,"all_goods_of_age_24h":20},"FutureEra":{"population":4615,"happiness":4310,"demandHappiness":4615,"money_24h":53200,"supplies_24h":7690,"medals_24h":693,"strategy_points_24h":4,"all_goods_of_age_24h":20},"ArcticFuture":{"population":5119,"happiness":5020,"demandHappiness":5119,"money_24h":60500,"supplies_24h":8960,"medals_24h":840,"strategy_points_24h":4,"all_goods_of_age_24h":20},"OceanicFuture":{"population":5639,"happiness":5790,"demandHappiness":5639,"money_24h":68200,"supplies_24h":10340,"medals_24h":966,"strategy_points_24h":4,"all_goods_of_age_24h":20},"VirtualFuture":{"population":6174,"happiness":6920,"demandHappiness":6174,"money_24h":76400,"supplies_24h":12350,"medals_24h":1176,"strategy_points_24h":4,"all_goods_of_age_24h":20},"SpaceAgeMars":{"population":9773,"happiness":11070,"demandHappiness":9773,"money_24h":127600,"supplies_24h":19760,"medals_24h":1428,"strategy_points_24h":4,"all_goods_of_age_24h":20},"SpaceAgeAsteroidBelt":{"population":10616,"happiness":12020,"demandHappiness":10616,"money_24h":141300,"supplies_24h":21470,"medals_24h":1680,"strategy_points_24h":4,"all_goods_of_age_24h":20},"SpaceAgeVenus":{"population":11474,"happiness":12990,"demandHappiness":11474,"money_24h":155800,"supplies_24h":23200,"medals_24h":1932,"strategy_points_24h":4,"all_goods_of_age_24h":20},"SpaceAgeJupiterMoon":{"population":12356,"happiness":13990,"demandHappiness":12356,"money_24h":171000,"supplies_24h":24990,"medals_24h":2184,"strategy_points_24h":4,"all_goods_of_age_24h":20},"SpaceAgeTitan":{"population":13254,"happiness":15010,"demandHappiness":13254,"money_24h":186900,"supplies_24h":26800,"medals_24h":2436,"strategy_points_24h":4,"all_goods_of_age_24h":20},"SpaceAgeSpaceHub":{"population":14175,"happiness":16050,"demandHappiness":14175,"money_24h":203600,"supplies_24h":28670,"medals_24h":2688,"strategy_points_24h":4,"all_goods_of_age_24h":20}}, boosts: [{"type":"supply_production","value":12,"feature":"all"}] },
+    "W_MultiAge_WIN19A10c": { prod: {"BronzeAge":{"population":300,"happiness":1030,"demandHappiness":300,"money_24h":1710,"supplies_24h":3500,"medals_24h":220,"strategy_points_24h":135,"all_goods_of_age_24h":360},"IronAge":{"population":650,"happiness":1780,"demandHappiness":650,"money_24h":4100,"supplies_24h":8400,"medals_24h":280,"strategy_points_24h":135,"all_goods_of_age_24h":360},"EarlyMiddleAge":{"population":990,"happiness":1970,"demandHappiness":990,"money_24h":6830,"supplies_24h":14010,"medals_24h":340,"strategy_points_24h":135,"all_goods_of_age_24h":360},"HighMiddleAge":{"population":1390,"happiness":2200,"demandHappiness":1390,"money_24h":9560,"supplies_24h":19610,"medals_24h":410,"strategy_points_24h":135,"all_goods_of_age_24h":360},"LateMiddleAge":{"population":1830,"happiness":2450,"demandHappiness":1830,"money_24h":12640,"supplies_24h":25910,"medals_24h":470,"strategy_points_24h":135,"all_goods_of_age_24h":360},"ColonialAge":{"population":2300,"happiness":2880,"demandHappiness":2300,"money_24h":19250,"supplies_24h":32910,"medals_24h":560,"strategy_points_24h":135,"all_goods_of_age_24h":360},"IndustrialAge":{"population":2820,"happiness":3250,"demandHappiness":2820,"money_24h":23980,"supplies_24h":39920,"medals_24h":780,"strategy_points_24h":135,"all_goods_of_age_24h":360},"ProgressiveEra":{"population":3360,"happiness":3570,"demandHappiness":3360,"money_24h":29100,"supplies_24h":46920,"medals_24h":1090,"strategy_points_24h":135,"all_goods_of_age_24h":360},"ModernEra":{"population":3940,"happiness":3820,"demandHappiness":3940,"money_24h":36210,"supplies_24h":54620,"medals_24h":1560,"strategy_points_24h":135,"all_goods_of_age_24h":360},"PostModernEra":{"population":4540,"happiness":3980,"demandHappiness":4540,"money_24h":45550,"supplies_24h":62320,"medals_24h":2190,"strategy_points_24h":135,"all_goods_of_age_24h":360},"ContemporaryEra":{"population":5180,"happiness":4620,"demandHappiness":5180,"money_24h":59300,"supplies_24h":70030,"medals_24h":3130,"strategy_points_24h":135,"all_goods_of_age_24h":360},"TomorrowEra":{"population":5830,"happiness":5610,"demandHappiness":5830,"money_24h":68660,"supplies_24h":78430,"medals_24h":4220,"strategy_points_24h":135,"all_goods_of_age_24h":360},"FutureEra":{"population":6520,"happiness":6720,"demandHappiness":6520,"money_24h":78700,"supplies_24h":86130,"medals_24h":5160,"strategy_points_24h":135,"all_goods_of_age_24h":360},"ArcticFuture":{"population":7230,"happiness":7830,"demandHappiness":7230,"money_24h":89430,"supplies_24h":94540,"medals_24h":6250,"strategy_points_24h":135,"all_goods_of_age_24h":360},"OceanicFuture":{"population":7970,"happiness":9030,"demandHappiness":7970,"money_24h":100840,"supplies_24h":103640,"medals_24h":7190,"strategy_points_24h":135,"all_goods_of_age_24h":360},"VirtualFuture":{"population":8730,"happiness":10790,"demandHappiness":8730,"money_24h":112950,"supplies_24h":112040,"medals_24h":8750,"strategy_points_24h":135,"all_goods_of_age_24h":360},"SpaceAgeMars":{"population":13810,"happiness":17270,"demandHappiness":13810,"money_24h":188660,"supplies_24h":181370,"medals_24h":10630,"strategy_points_24h":135,"all_goods_of_age_24h":360},"SpaceAgeAsteroidBelt":{"population":15000,"happiness":18760,"demandHappiness":15000,"money_24h":208970,"supplies_24h":194680,"medals_24h":12500,"strategy_points_24h":135,"all_goods_of_age_24h":360},"SpaceAgeVenus":{"population":16220,"happiness":20270,"demandHappiness":16220,"money_24h":230350,"supplies_24h":208680,"medals_24h":14380,"strategy_points_24h":135,"all_goods_of_age_24h":360},"SpaceAgeJupiterMoon":{"population":17460,"happiness":21840,"demandHappiness":17460,"money_24h":252830,"supplies_24h":221990,"medals_24h":16250,"strategy_points_24h":135,"all_goods_of_age_24h":360},"SpaceAgeTitan":{"population":18730,"happiness":23420,"demandHappiness":18730,"money_24h":276410,"supplies_24h":235990,"medals_24h":18130,"strategy_points_24h":135,"all_goods_of_age_24h":360},"SpaceAgeSpaceHub":{"population":20000,"happiness":25000,"demandHappiness":20000,"money_24h":300000,"supplies_24h":250000,"medals_24h":20000,"strategy_points_24h":135,"all_goods_of_age_24h":360}}, boosts: [{"type":"att_def_boost_attacker","value":68,"feature":"all"},{"type":"att_def_boost_attacker","value":168,"feature":"battleground"},{"type":"supply_production","value":24,"feature":"all"}] },
+    "W_MultiAge_WIN19A9a": { prod: {"BronzeAge":{"population":213,"happiness":660,"demandHappiness":213,"money_24h":1150,"supplies_24h":1180,"medals_24h":30,"strategy_points_24h":5,"all_goods_of_age_24h":15},"IronAge":{"population":457,"happiness":1140,"demandHappiness":457,"money_24h":2750,"supplies_24h":2040,"medals_24h":38,"strategy_points_24h":5,"all_goods_of_age_24h":15},"EarlyMiddleAge":{"population":701,"happiness":1260,"demandHappiness":701,"money_24h":4600,"supplies_24h":2250,"medals_24h":47,"strategy_points_24h":5,"all_goods_of_age_24h":15},"HighMiddleAge":{"population":984,"happiness":1410,"demandHappiness":984,"money_24h":6450,"supplies_24h":2510,"medals_24h":55,"strategy_points_24h":5,"all_goods_of_age_24h":15},"LateMiddleAge":{"population":1292,"happiness":1570,"demandHappiness":1292,"money_24h":8600,"supplies_24h":2800,"medals_24h":63,"strategy_points_24h":5,"all_goods_of_age_24h":15},"ColonialAge":{"population":1630,"happiness":1850,"demandHappiness":1630,"money_24h":13000,"supplies_24h":3300,"medals_24h":76,"strategy_points_24h":5,"all_goods_of_age_24h":15},"IndustrialAge":{"population":1992,"happiness":2080,"demandHappiness":1992,"money_24h":16200,"supplies_24h":3720,"medals_24h":105,"strategy_points_24h":5,"all_goods_of_age_24h":15},"ProgressiveEra":{"population":2378,"happiness":2290,"demandHappiness":2378,"money_24h":19700,"supplies_24h":4080,"medals_24h":147,"strategy_points_24h":5,"all_goods_of_age_24h":15},"ModernEra":{"population":2788,"happiness":2450,"demandHappiness":2788,"money_24h":24500,"supplies_24h":4370,"medals_24h":210,"strategy_points_24h":5,"all_goods_of_age_24h":15},"PostModernEra":{"population":3213,"happiness":2550,"demandHappiness":3213,"money_24h":30800,"supplies_24h":4550,"medals_24h":294,"strategy_points_24h":5,"all_goods_of_age_24h":15},"ContemporaryEra":{"population":3662,"happiness":2960,"demandHappiness":3662,"money_24h":40100,"supplies_24h":5290,"medals_24h":420,"strategy_points_24h":5,"all_goods_of_age_24h":15},"TomorrowEra":{"population":4127,"happiness":3600,"demandHappiness":4127,"money_24h":46400,"supplies_24h":6420,"medals_24h":567,"strategy_points_24h":5,"all_goods_of_age_24h":15},"FutureEra":{"population":4615,"happiness":4310,"demandHappiness":4615,"money_24h":53200,"supplies_24h":7690,"medals_24h":693,"strategy_points_24h":5,"all_goods_of_age_24h":15},"ArcticFuture":{"population":5119,"happiness":5020,"demandHappiness":5119,"money_24h":60500,"supplies_24h":8960,"medals_24h":840,"strategy_points_24h":5,"all_goods_of_age_24h":15},"OceanicFuture":{"population":5639,"happiness":5790,"demandHappiness":5639,"money_24h":68200,"supplies_24h":10340,"medals_24h":966,"strategy_points_24h":5,"all_goods_of_age_24h":15},"VirtualFuture":{"population":6174,"happiness":6920,"demandHappiness":6174,"money_24h":76400,"supplies_24h":12350,"medals_24h":1176,"strategy_points_24h":5,"all_goods_of_age_24h":15},"SpaceAgeMars":{"population":9773,"happiness":11070,"demandHappiness":9773,"money_24h":127600,"supplies_24h":19760,"medals_24h":1428,"strategy_points_24h":5,"all_goods_of_age_24h":15},"SpaceAgeAsteroidBelt":{"population":10616,"happiness":12020,"demandHappiness":10616,"money_24h":141300,"supplies_24h":21470,"medals_24h":1680,"strategy_points_24h":5,"all_goods_of_age_24h":15},"SpaceAgeVenus":{"population":11474,"happiness":12990,"demandHappiness":11474,"money_24h":155800,"supplies_24h":23200,"medals_24h":1932,"strategy_points_24h":5,"all_goods_of_age_24h":15},"SpaceAgeJupiterMoon":{"population":12356,"happiness":13990,"demandHappiness":12356,"money_24h":171000,"supplies_24h":24990,"medals_24h":2184,"strategy_points_24h":5,"all_goods_of_age_24h":15},"SpaceAgeTitan":{"population":13254,"happiness":15010,"demandHappiness":13254,"money_24h":186900,"supplies_24h":26800,"medals_24h":2436,"strategy_points_24h":5,"all_goods_of_age_24h":15},"SpaceAgeSpaceHub":{"population":14175,"happiness":16050,"demandHappiness":14175,"money_24h":203600,"supplies_24h":28670,"medals_24h":2688,"strategy_points_24h":5,"all_goods_of_age_24h":15}}, boosts: [{"type":"att_boost_attacker","value":10,"feature":"all"}] },
+    "W_MultiAge_WIN19A10a": { prod: {"BronzeAge":{"population":300,"happiness":1030,"demandHappiness":300,"money_24h":1710,"supplies_24h":3500,"medals_24h":220,"strategy_points_24h":180,"all_goods_of_age_24h":290},"IronAge":{"population":650,"happiness":1780,"demandHappiness":650,"money_24h":4100,"supplies_24h":8400,"medals_24h":280,"strategy_points_24h":180,"all_goods_of_age_24h":290},"EarlyMiddleAge":{"population":990,"happiness":1970,"demandHappiness":990,"money_24h":6830,"supplies_24h":14010,"medals_24h":340,"strategy_points_24h":180,"all_goods_of_age_24h":290},"HighMiddleAge":{"population":1390,"happiness":2200,"demandHappiness":1390,"money_24h":9560,"supplies_24h":19610,"medals_24h":410,"strategy_points_24h":180,"all_goods_of_age_24h":290},"LateMiddleAge":{"population":1830,"happiness":2450,"demandHappiness":1830,"money_24h":12640,"supplies_24h":25910,"medals_24h":470,"strategy_points_24h":180,"all_goods_of_age_24h":290},"ColonialAge":{"population":2300,"happiness":2880,"demandHappiness":2300,"money_24h":19250,"supplies_24h":32910,"medals_24h":560,"strategy_points_24h":180,"all_goods_of_age_24h":290},"IndustrialAge":{"population":2820,"happiness":3250,"demandHappiness":2820,"money_24h":23980,"supplies_24h":39920,"medals_24h":780,"strategy_points_24h":180,"all_goods_of_age_24h":290},"ProgressiveEra":{"population":3360,"happiness":3570,"demandHappiness":3360,"money_24h":29100,"supplies_24h":46920,"medals_24h":1090,"strategy_points_24h":180,"all_goods_of_age_24h":290},"ModernEra":{"population":3940,"happiness":3820,"demandHappiness":3940,"money_24h":36210,"supplies_24h":54620,"medals_24h":1560,"strategy_points_24h":180,"all_goods_of_age_24h":290},"PostModernEra":{"population":4540,"happiness":3980,"demandHappiness":4540,"money_24h":45550,"supplies_24h":62320,"medals_24h":2190,"strategy_points_24h":180,"all_goods_of_age_24h":290},"ContemporaryEra":{"population":5180,"happiness":4620,"demandHappiness":5180,"money_24h":59300,"supplies_24h":70030,"medals_24h":3130,"strategy_points_24h":180,"all_goods_of_age_24h":290},"TomorrowEra":{"population":5830,"happiness":5610,"demandHappiness":5830,"money_24h":68660,"supplies_24h":78430,"medals_24h":4220,"strategy_points_24h":180,"all_goods_of_age_24h":290},"FutureEra":{"population":6520,"happiness":6720,"demandHappiness":6520,"money_24h":78700,"supplies_24h":86130,"medals_24h":5160,"strategy_points_24h":180,"all_goods_of_age_24h":290},"ArcticFuture":{"population":7230,"happiness":7830,"demandHappiness":7230,"money_24h":89430,"supplies_24h":94540,"medals_24h":6250,"strategy_points_24h":180,"all_goods_of_age_24h":290},"OceanicFuture":{"population":7970,"happiness":9030,"demandHappiness":7970,"money_24h":100840,"supplies_24h":103640,"medals_24h":7190,"strategy_points_24h":180,"all_goods_of_age_24h":290},"VirtualFuture":{"population":8730,"happiness":10790,"demandHappiness":8730,"money_24h":112950,"supplies_24h":112040,"medals_24h":8750,"strategy_points_24h":180,"all_goods_of_age_24h":290},"SpaceAgeMars":{"population":13810,"happiness":17270,"demandHappiness":13810,"money_24h":188660,"supplies_24h":181370,"medals_24h":10630,"strategy_points_24h":180,"all_goods_of_age_24h":290},"SpaceAgeAsteroidBelt":{"population":15000,"happiness":18760,"demandHappiness":15000,"money_24h":208970,"supplies_24h":194680,"medals_24h":12500,"strategy_points_24h":180,"all_goods_of_age_24h":290},"SpaceAgeVenus":{"population":16220,"happiness":20270,"demandHappiness":16220,"money_24h":230350,"supplies_24h":208680,"medals_24h":14380,"strategy_points_24h":180,"all_goods_of_age_24h":290},"SpaceAgeJupiterMoon":{"population":17460,"happiness":21840,"demandHappiness":17460,"money_24h":252830,"supplies_24h":221990,"medals_24h":16250,"strategy_points_24h":180,"all_goods_of_age_24h":290},"SpaceAgeTitan":{"population":18730,"happiness":23420,"demandHappiness":18730,"money_24h":276410,"supplies_24h":235990,"medals_24h":18130,"strategy_points_24h":180,"all_goods_of_age_24h":290},"SpaceAgeSpaceHub":{"population":20000,"happiness":25000,"demandHappiness":20000,"money_24h":300000,"supplies_24h":250000,"medals_24h":20000,"strategy_points_24h":180,"all_goods_of_age_24h":290}}, boosts: [{"type":"att_def_boost_attacker_defender","value":108,"feature":"all"}] },
+    "W_MultiAge_WIN19A10b": { prod: {"BronzeAge":{"population":300,"happiness":1030,"demandHappiness":300,"money_24h":1710,"supplies_24h":3500,"medals_24h":220,"strategy_points_24h":225,"all_goods_of_age_24h":215},"IronAge":{"population":650,"happiness":1780,"demandHappiness":650,"money_24h":4100,"supplies_24h":8400,"medals_24h":280,"strategy_points_24h":225,"all_goods_of_age_24h":215},"EarlyMiddleAge":{"population":990,"happiness":1970,"demandHappiness":990,"money_24h":6830,"supplies_24h":14010,"medals_24h":340,"strategy_points_24h":225,"all_goods_of_age_24h":215},"HighMiddleAge":{"population":1390,"happiness":2200,"demandHappiness":1390,"money_24h":9560,"supplies_24h":19610,"medals_24h":410,"strategy_points_24h":225,"all_goods_of_age_24h":215},"LateMiddleAge":{"population":1830,"happiness":2450,"demandHappiness":1830,"money_24h":12640,"supplies_24h":25910,"medals_24h":470,"strategy_points_24h":225,"all_goods_of_age_24h":215},"ColonialAge":{"population":2300,"happiness":2880,"demandHappiness":2300,"money_24h":19250,"supplies_24h":32910,"medals_24h":560,"strategy_points_24h":225,"all_goods_of_age_24h":215},"IndustrialAge":{"population":2820,"happiness":3250,"demandHappiness":2820,"money_24h":23980,"supplies_24h":39920,"medals_24h":780,"strategy_points_24h":225,"all_goods_of_age_24h":215},"ProgressiveEra":{"population":3360,"happiness":3570,"demandHappiness":3360,"money_24h":29100,"supplies_24h":46920,"medals_24h":1090,"strategy_points_24h":225,"all_goods_of_age_24h":215},"ModernEra":{"population":3940,"happiness":3820,"demandHappiness":3940,"money_24h":36210,"supplies_24h":54620,"medals_24h":1560,"strategy_points_24h":225,"all_goods_of_age_24h":215},"PostModernEra":{"population":4540,"happiness":3980,"demandHappiness":4540,"money_24h":45550,"supplies_24h":62320,"medals_24h":2190,"strategy_points_24h":225,"all_goods_of_age_24h":215},"ContemporaryEra":{"population":5180,"happiness":4620,"demandHappiness":5180,"money_24h":59300,"supplies_24h":70030,"medals_24h":3130,"strategy_points_24h":225,"all_goods_of_age_24h":215},"TomorrowEra":{"population":5830,"happiness":5610,"demandHappiness":5830,"money_24h":68660,"supplies_24h":78430,"medals_24h":4220,"strategy_points_24h":225,"all_goods_of_age_24h":215},"FutureEra":{"population":6520,"happiness":6720,"demandHappiness":6520,"money_24h":78700,"supplies_24h":86130,"medals_24h":5160,"strategy_points_24h":225,"all_goods_of_age_24h":215},"ArcticFuture":{"population":7230,"happiness":7830,"demandHappiness":7230,"money_24h":89430,"supplies_24h":94540,"medals_24h":6250,"strategy_points_24h":225,"all_goods_of_age_24h":215},"OceanicFuture":{"population":7970,"happiness":9030,"demandHappiness":7970,"money_24h":100840,"supplies_24h":103640,"medals_24h":7190,"strategy_points_24h":225,"all_goods_of_age_24h":215},"VirtualFuture":{"population":8730,"happiness":10790,"demandHappiness":8730,"money_24h":112950,"supplies_24h":112040,"medals_24h":8750,"strategy_points_24h":225,"all_goods_of_age_24h":215},"SpaceAgeMars":{"population":13810,"happiness":17270,"demandHappiness":13810,"money_24h":188660,"supplies_24h":181370,"medals_24h":10630,"strategy_points_24h":225,"all_goods_of_age_24h":215},"SpaceAgeAsteroidBelt":{"population":15000,"happiness":18760,"demandHappiness":15000,"money_24h":208970,"supplies_24h":194680,"medals_24h":12500,"strategy_points_24h":225,"all_goods_of_age_24h":215},"SpaceAgeVenus":{"population":16220,"happiness":20270,"demandHappiness":16220,"money_24h":230350,"supplies_24h":208680,"medals_24h":14380,"strategy_points_24h":225,"all_goods_of_age_24h":215},"SpaceAgeJupiterMoon":{"population":17460,"happiness":21840,"demandHappiness":17460,"money_24h":252830,"supplies_24h":221990,"medals_24h":16250,"strategy_points_24h":225,"all_goods_of_age_24h":215},"SpaceAgeTitan":{"population":18730,"happiness":23420,"demandHappiness":18730,"money_24h":276410,"supplies_24h":235990,"medals_24h":18130,"strategy_points_24h":225,"all_goods_of_age_24h":215},"SpaceAgeSpaceHub":{"population":20000,"happiness":25000,"demandHappiness":20000,"money_24h":300000,"supplies_24h":250000,"medals_24h":20000,"strategy_points_24h":225,"all_goods_of_age_24h":215}}, boosts: [{"type":"att_def_boost_defender","value":68,"feature":"all"},{"type":"att_def_boost_defender","value":168,"feature":"battleground"},{"type":"coin_production","value":24,"feature":"all"}] },
+    "W_MultiAge_WIN19A9b": { prod: {"BronzeAge":{"population":213,"happiness":660,"demandHappiness":213,"money_24h":1150,"supplies_24h":1180,"medals_24h":30,"strategy_points_24h":8,"all_goods_of_age_24h":10},"IronAge":{"population":457,"happiness":1140,"demandHappiness":457,"money_24h":2750,"supplies_24h":2040,"medals_24h":38,"strategy_points_24h":8,"all_goods_of_age_24h":10},"EarlyMiddleAge":{"population":701,"happiness":1260,"demandHappiness":701,"money_24h":4600,"supplies_24h":2250,"medals_24h":47,"strategy_points_24h":8,"all_goods_of_age_24h":10},"HighMiddleAge":{"population":984,"happiness":1410,"demandHappiness":984,"money_24h":6450,"supplies_24h":2510,"medals_24h":55,"strategy_points_24h":8,"all_goods_of_age_24h":10},"LateMiddleAge":{"population":1292,"happiness":1570,"demandHappiness":1292,"money_24h":8600,"supplies_24h":2800,"medals_24h":63,"strategy_points_24h":8,"all_goods_of_age_24h":10},"ColonialAge":{"population":1630,"happiness":1850,"demandHappiness":1630,"money_24h":13000,"supplies_24h":3300,"medals_24h":76,"strategy_points_24h":8,"all_goods_of_age_24h":10},"IndustrialAge":{"population":1992,"happiness":2080,"demandHappiness":1992,"money_24h":16200,"supplies_24h":3720,"medals_24h":105,"strategy_points_24h":8,"all_goods_of_age_24h":10},"ProgressiveEra":{"population":2378,"happiness":2290,"demandHappiness":2378,"money_24h":19700,"supplies_24h":4080,"medals_24h":147,"strategy_points_24h":8,"all_goods_of_age_24h":10},"ModernEra":{"population":2788,"happiness":2450,"demandHappiness":2788,"money_24h":24500,"supplies_24h":4370,"medals_24h":210,"strategy_points_24h":8,"all_goods_of_age_24h":10},"PostModernEra":{"population":3213,"happiness":2550,"demandHappiness":3213,"money_24h":30800,"supplies_24h":4550,"medals_24h":294,"strategy_points_24h":8,"all_goods_of_age_24h":10},"ContemporaryEra":{"population":3662,"happiness":2960,"demandHappiness":3662,"money_24h":40100,"supplies_24h":5290,"medals_24h":420,"strategy_points_24h":8,"all_goods_of_age_24h":10},"TomorrowEra":{"population":4127,"happiness":3600,"demandHappiness":4127,"money_24h":46400,"supplies_24h":6420,"medals_24h":567,"strategy_points_24h":8,"all_goods_of_age_24h":10},"FutureEra":{"population":4615,"happiness":4310,"demandHappiness":4615,"money_24h":53200,"supplies_24h":7690,"medals_24h":693,"strategy_points_24h":8,"all_goods_of_age_24h":10},"ArcticFuture":{"population":5119,"happiness":5020,"demandHappiness":5119,"money_24h":60500,"supplies_24h":8960,"medals_24h":840,"strategy_points_24h":8,"all_goods_of_age_24h":10},"OceanicFuture":{"population":5639,"happiness":5790,"demandHappiness":5639,"money_24h":68200,"supplies_24h":10340,"medals_24h":966,"strategy_points_24h":8,"all_goods_of_age_24h":10},"VirtualFuture":{"population":6174,"happiness":6920,"demandHappiness":6174,"money_24h":76400,"supplies_24h":12350,"medals_24h":1176,"strategy_points_24h":8,"all_goods_of_age_24h":10},"SpaceAgeMars":{"population":9773,"happiness":11070,"demandHappiness":9773,"money_24h":127600,"supplies_24h":19760,"medals_24h":1428,"strategy_points_24h":8,"all_goods_of_age_24h":10},"SpaceAgeAsteroidBelt":{"population":10616,"happiness":12020,"demandHappiness":10616,"money_24h":141300,"supplies_24h":21470,"medals_24h":1680,"strategy_points_24h":8,"all_goods_of_age_24h":10},"SpaceAgeVenus":{"population":11474,"happiness":12990,"demandHappiness":11474,"money_24h":155800,"supplies_24h":23200,"medals_24h":1932,"strategy_points_24h":8,"all_goods_of_age_24h":10},"SpaceAgeJupiterMoon":{"population":12356,"happiness":13990,"demandHappiness":12356,"money_24h":171000,"supplies_24h":24990,"medals_24h":2184,"strategy_points_24h":8,"all_goods_of_age_24h":10},"SpaceAgeTitan":{"population":13254,"happiness":15010,"demandHappiness":13254,"money_24h":186900,"supplies_24h":26800,"medals_24h":2436,"strategy_points_24h":8,"all_goods_of_age_24h":10},"SpaceAgeSpaceHub":{"population":14175,"happiness":16050,"demandHappiness":14175,"money_24h":203600,"supplies_24h":28670,"medals_24h":2688,"strategy_points_24h":8,"all_goods_of_age_24h":10}}, boosts: [{"type":"coin_production","value":12,"feature":"all"}] },
+    "W_MultiAge_WIN25C1": { prod: {"BronzeAge":{"population":-90,"money_24h":110,"strategy_points_24h":10},"IronAge":{"population":-190,"money_24h":270,"strategy_points_24h":10},"EarlyMiddleAge":{"population":-300,"money_24h":460,"strategy_points_24h":10},"HighMiddleAge":{"population":-420,"money_24h":640,"strategy_points_24h":10},"LateMiddleAge":{"population":-550,"money_24h":840,"strategy_points_24h":10},"ColonialAge":{"population":-690,"money_24h":1280,"strategy_points_24h":10},"IndustrialAge":{"population":-840,"money_24h":1600,"strategy_points_24h":10},"ProgressiveEra":{"population":-1010,"money_24h":1940,"strategy_points_24h":10},"ModernEra":{"population":-1180,"money_24h":2410,"strategy_points_24h":10},"PostModernEra":{"population":-1360,"money_24h":3040,"strategy_points_24h":10},"ContemporaryEra":{"population":-1550,"money_24h":3950,"strategy_points_24h":10},"TomorrowEra":{"population":-1750,"money_24h":4580,"strategy_points_24h":10},"FutureEra":{"population":-1960,"money_24h":5250,"strategy_points_24h":10},"ArcticFuture":{"population":-2170,"money_24h":5960,"strategy_points_24h":10},"OceanicFuture":{"population":-2390,"money_24h":6720,"strategy_points_24h":10},"VirtualFuture":{"population":-2620,"money_24h":7530,"strategy_points_24h":10},"SpaceAgeMars":{"population":-4140,"money_24h":12580,"strategy_points_24h":10},"SpaceAgeAsteroidBelt":{"population":-4500,"money_24h":13930,"strategy_points_24h":10},"SpaceAgeVenus":{"population":-4860,"money_24h":15360,"strategy_points_24h":10},"SpaceAgeJupiterMoon":{"population":-5240,"money_24h":16860,"strategy_points_24h":10},"SpaceAgeTitan":{"population":-5620,"money_24h":18430,"strategy_points_24h":10},"SpaceAgeSpaceHub":{"population":-6000,"money_24h":20000,"strategy_points_24h":10}}, boosts: [{"type":"att_def_boost_attacker_defender","value":3,"feature":"all"}] },
+    "W_MultiAge_WIN22A1": { prod: {"BronzeAge":{"happiness":520,"strategy_points_24h":1,"random_good_of_age_24h":1},"IronAge":{"happiness":900,"strategy_points_24h":1,"random_good_of_age_24h":1},"EarlyMiddleAge":{"happiness":1000,"strategy_points_24h":1,"random_good_of_age_24h":1},"HighMiddleAge":{"happiness":1110,"strategy_points_24h":1,"random_good_of_age_24h":1},"LateMiddleAge":{"happiness":1240,"strategy_points_24h":1,"random_good_of_age_24h":1},"ColonialAge":{"happiness":1460,"strategy_points_24h":1,"random_good_of_age_24h":1},"IndustrialAge":{"happiness":1640,"strategy_points_24h":1,"random_good_of_age_24h":1},"ProgressiveEra":{"happiness":1800,"strategy_points_24h":1,"random_good_of_age_24h":1},"ModernEra":{"happiness":1930,"strategy_points_24h":1,"random_good_of_age_24h":1},"PostModernEra":{"happiness":2010,"strategy_points_24h":1,"random_good_of_age_24h":1},"ContemporaryEra":{"happiness":2340,"strategy_points_24h":1,"random_good_of_age_24h":1},"TomorrowEra":{"happiness":2840,"strategy_points_24h":1,"random_good_of_age_24h":1},"FutureEra":{"happiness":3400,"strategy_points_24h":1,"random_good_of_age_24h":1},"ArcticFuture":{"happiness":3960,"strategy_points_24h":1,"random_good_of_age_24h":1},"OceanicFuture":{"happiness":4570,"strategy_points_24h":1,"random_good_of_age_24h":1},"VirtualFuture":{"happiness":5460,"strategy_points_24h":1,"random_good_of_age_24h":1},"SpaceAgeMars":{"happiness":8730,"strategy_points_24h":1,"random_good_of_age_24h":1},"SpaceAgeAsteroidBelt":{"happiness":9490,"strategy_points_24h":1,"random_good_of_age_24h":1},"SpaceAgeVenus":{"happiness":10250,"strategy_points_24h":1,"random_good_of_age_24h":1},"SpaceAgeJupiterMoon":{"happiness":11040,"strategy_points_24h":1,"random_good_of_age_24h":1},"SpaceAgeTitan":{"happiness":11891,"strategy_points_24h":1,"random_good_of_age_24h":1},"SpaceAgeSpaceHub":{"happiness":12742,"strategy_points_24h":1,"random_good_of_age_24h":1}}, boosts: [{"type":"def_boost_attacker","value":1,"feature":"all"}] },
+    "W_MultiAge_WIN22A10": { prod: {"BronzeAge":{"happiness":680,"strategy_points_24h":4,"random_good_of_age_24h":10},"IronAge":{"happiness":1180,"strategy_points_24h":4,"random_good_of_age_24h":10},"EarlyMiddleAge":{"happiness":1310,"strategy_points_24h":4,"random_good_of_age_24h":10},"HighMiddleAge":{"happiness":1460,"strategy_points_24h":4,"random_good_of_age_24h":10},"LateMiddleAge":{"happiness":1620,"strategy_points_24h":4,"random_good_of_age_24h":10},"ColonialAge":{"happiness":1910,"strategy_points_24h":4,"random_good_of_age_24h":10},"IndustrialAge":{"happiness":2150,"strategy_points_24h":4,"random_good_of_age_24h":10},"ProgressiveEra":{"happiness":2360,"strategy_points_24h":4,"random_good_of_age_24h":10},"ModernEra":{"happiness":2530,"strategy_points_24h":4,"random_good_of_age_24h":10},"PostModernEra":{"happiness":2640,"strategy_points_24h":4,"random_good_of_age_24h":10},"ContemporaryEra":{"happiness":3060,"strategy_points_24h":4,"random_good_of_age_24h":10},"TomorrowEra":{"happiness":3720,"strategy_points_24h":4,"random_good_of_age_24h":10},"FutureEra":{"happiness":4450,"strategy_points_24h":4,"random_good_of_age_24h":10},"ArcticFuture":{"happiness":5190,"strategy_points_24h":4,"random_good_of_age_24h":10},"OceanicFuture":{"happiness":5990,"strategy_points_24h":4,"random_good_of_age_24h":10},"VirtualFuture":{"happiness":7150,"strategy_points_24h":4,"random_good_of_age_24h":10},"SpaceAgeMars":{"happiness":11440,"strategy_points_24h":4,"random_good_of_age_24h":10},"SpaceAgeAsteroidBelt":{"happiness":12430,"strategy_points_24h":4,"random_good_of_age_24h":10},"SpaceAgeVenus":{"happiness":13430,"strategy_points_24h":4,"random_good_of_age_24h":10},"SpaceAgeJupiterMoon":{"happiness":14470,"strategy_points_24h":4,"random_good_of_age_24h":10},"SpaceAgeTitan":{"happiness":15591,"strategy_points_24h":4,"random_good_of_age_24h":10},"SpaceAgeSpaceHub":{"happiness":16712,"strategy_points_24h":4,"random_good_of_age_24h":10}}, boosts: [{"type":"att_boost_attacker","value":4,"feature":"all"},{"type":"def_boost_attacker","value":5,"feature":"all"}] },
+    "W_MultiAge_WIN22A2": { prod: {"BronzeAge":{"happiness":540,"strategy_points_24h":1,"random_good_of_age_24h":2},"IronAge":{"happiness":930,"strategy_points_24h":1,"random_good_of_age_24h":2},"EarlyMiddleAge":{"happiness":1030,"strategy_points_24h":1,"random_good_of_age_24h":2},"HighMiddleAge":{"happiness":1150,"strategy_points_24h":1,"random_good_of_age_24h":2},"LateMiddleAge":{"happiness":1280,"strategy_points_24h":1,"random_good_of_age_24h":2},"ColonialAge":{"happiness":1510,"strategy_points_24h":1,"random_good_of_age_24h":2},"IndustrialAge":{"happiness":1700,"strategy_points_24h":1,"random_good_of_age_24h":2},"ProgressiveEra":{"happiness":1870,"strategy_points_24h":1,"random_good_of_age_24h":2},"ModernEra":{"happiness":2000,"strategy_points_24h":1,"random_good_of_age_24h":2},"PostModernEra":{"happiness":2080,"strategy_points_24h":1,"random_good_of_age_24h":2},"ContemporaryEra":{"happiness":2420,"strategy_points_24h":1,"random_good_of_age_24h":2},"TomorrowEra":{"happiness":2940,"strategy_points_24h":1,"random_good_of_age_24h":2},"FutureEra":{"happiness":3520,"strategy_points_24h":1,"random_good_of_age_24h":2},"ArcticFuture":{"happiness":4090,"strategy_points_24h":1,"random_good_of_age_24h":2},"OceanicFuture":{"happiness":4730,"strategy_points_24h":1,"random_good_of_age_24h":2},"VirtualFuture":{"happiness":5650,"strategy_points_24h":1,"random_good_of_age_24h":2},"SpaceAgeMars":{"happiness":9030,"strategy_points_24h":1,"random_good_of_age_24h":2},"SpaceAgeAsteroidBelt":{"happiness":9820,"strategy_points_24h":1,"random_good_of_age_24h":2},"SpaceAgeVenus":{"happiness":10610,"strategy_points_24h":1,"random_good_of_age_24h":2},"SpaceAgeJupiterMoon":{"happiness":11420,"strategy_points_24h":1,"random_good_of_age_24h":2},"SpaceAgeTitan":{"happiness":12292,"strategy_points_24h":1,"random_good_of_age_24h":2},"SpaceAgeSpaceHub":{"happiness":13164,"strategy_points_24h":1,"random_good_of_age_24h":2}}, boosts: [{"type":"def_boost_attacker","value":1,"feature":"all"}] },
+    "W_MultiAge_WIN22A3": { prod: {"BronzeAge":{"happiness":560,"strategy_points_24h":1,"random_good_of_age_24h":3},"IronAge":{"happiness":960,"strategy_points_24h":1,"random_good_of_age_24h":3},"EarlyMiddleAge":{"happiness":1060,"strategy_points_24h":1,"random_good_of_age_24h":3},"HighMiddleAge":{"happiness":1190,"strategy_points_24h":1,"random_good_of_age_24h":3},"LateMiddleAge":{"happiness":1320,"strategy_points_24h":1,"random_good_of_age_24h":3},"ColonialAge":{"happiness":1560,"strategy_points_24h":1,"random_good_of_age_24h":3},"IndustrialAge":{"happiness":1760,"strategy_points_24h":1,"random_good_of_age_24h":3},"ProgressiveEra":{"happiness":1930,"strategy_points_24h":1,"random_good_of_age_24h":3},"ModernEra":{"happiness":2060,"strategy_points_24h":1,"random_good_of_age_24h":3},"PostModernEra":{"happiness":2150,"strategy_points_24h":1,"random_good_of_age_24h":3},"ContemporaryEra":{"happiness":2500,"strategy_points_24h":1,"random_good_of_age_24h":3},"TomorrowEra":{"happiness":3030,"strategy_points_24h":1,"random_good_of_age_24h":3},"FutureEra":{"happiness":3630,"strategy_points_24h":1,"random_good_of_age_24h":3},"ArcticFuture":{"happiness":4230,"strategy_points_24h":1,"random_good_of_age_24h":3},"OceanicFuture":{"happiness":4880,"strategy_points_24h":1,"random_good_of_age_24h":3},"VirtualFuture":{"happiness":5830,"strategy_points_24h":1,"random_good_of_age_24h":3},"SpaceAgeMars":{"happiness":9330,"strategy_points_24h":1,"random_good_of_age_24h":3},"SpaceAgeAsteroidBelt":{"happiness":10140,"strategy_points_24h":1,"random_good_of_age_24h":3},"SpaceAgeVenus":{"happiness":10960,"strategy_points_24h":1,"random_good_of_age_24h":3},"SpaceAgeJupiterMoon":{"happiness":11800,"strategy_points_24h":1,"random_good_of_age_24h":3},"SpaceAgeTitan":{"happiness":12705,"strategy_points_24h":1,"random_good_of_age_24h":3},"SpaceAgeSpaceHub":{"happiness":13610,"strategy_points_24h":1,"random_good_of_age_24h":3}}, boosts: [{"type":"att_boost_attacker","value":1,"feature":"all"},{"type":"def_boost_attacker","value":1,"feature":"all"}] },
+    "W_MultiAge_WIN22A4": { prod: {"BronzeAge":{"happiness":580,"strategy_points_24h":2,"random_good_of_age_24h":4},"IronAge":{"happiness":990,"strategy_points_24h":2,"random_good_of_age_24h":4},"EarlyMiddleAge":{"happiness":1100,"strategy_points_24h":2,"random_good_of_age_24h":4},"HighMiddleAge":{"happiness":1230,"strategy_points_24h":2,"random_good_of_age_24h":4},"LateMiddleAge":{"happiness":1370,"strategy_points_24h":2,"random_good_of_age_24h":4},"ColonialAge":{"happiness":1610,"strategy_points_24h":2,"random_good_of_age_24h":4},"IndustrialAge":{"happiness":1810,"strategy_points_24h":2,"random_good_of_age_24h":4},"ProgressiveEra":{"happiness":1990,"strategy_points_24h":2,"random_good_of_age_24h":4},"ModernEra":{"happiness":2130,"strategy_points_24h":2,"random_good_of_age_24h":4},"PostModernEra":{"happiness":2220,"strategy_points_24h":2,"random_good_of_age_24h":4},"ContemporaryEra":{"happiness":2580,"strategy_points_24h":2,"random_good_of_age_24h":4},"TomorrowEra":{"happiness":3130,"strategy_points_24h":2,"random_good_of_age_24h":4},"FutureEra":{"happiness":3750,"strategy_points_24h":2,"random_good_of_age_24h":4},"ArcticFuture":{"happiness":4370,"strategy_points_24h":2,"random_good_of_age_24h":4},"OceanicFuture":{"happiness":5040,"strategy_points_24h":2,"random_good_of_age_24h":4},"VirtualFuture":{"happiness":6020,"strategy_points_24h":2,"random_good_of_age_24h":4},"SpaceAgeMars":{"happiness":9630,"strategy_points_24h":2,"random_good_of_age_24h":4},"SpaceAgeAsteroidBelt":{"happiness":10470,"strategy_points_24h":2,"random_good_of_age_24h":4},"SpaceAgeVenus":{"happiness":11310,"strategy_points_24h":2,"random_good_of_age_24h":4},"SpaceAgeJupiterMoon":{"happiness":12190,"strategy_points_24h":2,"random_good_of_age_24h":4},"SpaceAgeTitan":{"happiness":13139,"strategy_points_24h":2,"random_good_of_age_24h":4},"SpaceAgeSpaceHub":{"happiness":14088,"strategy_points_24h":2,"random_good_of_age_24h":4}}, boosts: [{"type":"att_boost_attacker","value":1,"feature":"all"},{"type":"def_boost_attacker","value":1,"feature":"all"}] },
+    "W_MultiAge_WIN22A5": { prod: {"BronzeAge":{"happiness":590,"strategy_points_24h":2,"random_good_of_age_24h":5},"IronAge":{"happiness":1020,"strategy_points_24h":2,"random_good_of_age_24h":5},"EarlyMiddleAge":{"happiness":1130,"strategy_points_24h":2,"random_good_of_age_24h":5},"HighMiddleAge":{"happiness":1260,"strategy_points_24h":2,"random_good_of_age_24h":5},"LateMiddleAge":{"happiness":1410,"strategy_points_24h":2,"random_good_of_age_24h":5},"ColonialAge":{"happiness":1660,"strategy_points_24h":2,"random_good_of_age_24h":5},"IndustrialAge":{"happiness":1870,"strategy_points_24h":2,"random_good_of_age_24h":5},"ProgressiveEra":{"happiness":2050,"strategy_points_24h":2,"random_good_of_age_24h":5},"ModernEra":{"happiness":2200,"strategy_points_24h":2,"random_good_of_age_24h":5},"PostModernEra":{"happiness":2290,"strategy_points_24h":2,"random_good_of_age_24h":5},"ContemporaryEra":{"happiness":2660,"strategy_points_24h":2,"random_good_of_age_24h":5},"TomorrowEra":{"happiness":3230,"strategy_points_24h":2,"random_good_of_age_24h":5},"FutureEra":{"happiness":3870,"strategy_points_24h":2,"random_good_of_age_24h":5},"ArcticFuture":{"happiness":4500,"strategy_points_24h":2,"random_good_of_age_24h":5},"OceanicFuture":{"happiness":5200,"strategy_points_24h":2,"random_good_of_age_24h":5},"VirtualFuture":{"happiness":6210,"strategy_points_24h":2,"random_good_of_age_24h":5},"SpaceAgeMars":{"happiness":9940,"strategy_points_24h":2,"random_good_of_age_24h":5},"SpaceAgeAsteroidBelt":{"happiness":10800,"strategy_points_24h":2,"random_good_of_age_24h":5},"SpaceAgeVenus":{"happiness":11670,"strategy_points_24h":2,"random_good_of_age_24h":5},"SpaceAgeJupiterMoon":{"happiness":12570,"strategy_points_24h":2,"random_good_of_age_24h":5},"SpaceAgeTitan":{"happiness":13540,"strategy_points_24h":2,"random_good_of_age_24h":5},"SpaceAgeSpaceHub":{"happiness":14510,"strategy_points_24h":2,"random_good_of_age_24h":5}}, boosts: [{"type":"att_boost_attacker","value":2,"feature":"all"},{"type":"def_boost_attacker","value":3,"feature":"all"}] },
+    "W_MultiAge_WIN22A6": { prod: {"BronzeAge":{"happiness":610,"strategy_points_24h":2,"random_good_of_age_24h":6},"IronAge":{"happiness":1060,"strategy_points_24h":2,"random_good_of_age_24h":6},"EarlyMiddleAge":{"happiness":1170,"strategy_points_24h":2,"random_good_of_age_24h":6},"HighMiddleAge":{"happiness":1300,"strategy_points_24h":2,"random_good_of_age_24h":6},"LateMiddleAge":{"happiness":1450,"strategy_points_24h":2,"random_good_of_age_24h":6},"ColonialAge":{"happiness":1710,"strategy_points_24h":2,"random_good_of_age_24h":6},"IndustrialAge":{"happiness":1930,"strategy_points_24h":2,"random_good_of_age_24h":6},"ProgressiveEra":{"happiness":2120,"strategy_points_24h":2,"random_good_of_age_24h":6},"ModernEra":{"happiness":2260,"strategy_points_24h":2,"random_good_of_age_24h":6},"PostModernEra":{"happiness":2360,"strategy_points_24h":2,"random_good_of_age_24h":6},"ContemporaryEra":{"happiness":2740,"strategy_points_24h":2,"random_good_of_age_24h":6},"TomorrowEra":{"happiness":3330,"strategy_points_24h":2,"random_good_of_age_24h":6},"FutureEra":{"happiness":3990,"strategy_points_24h":2,"random_good_of_age_24h":6},"ArcticFuture":{"happiness":4640,"strategy_points_24h":2,"random_good_of_age_24h":6},"OceanicFuture":{"happiness":5360,"strategy_points_24h":2,"random_good_of_age_24h":6},"VirtualFuture":{"happiness":6400,"strategy_points_24h":2,"random_good_of_age_24h":6},"SpaceAgeMars":{"happiness":10240,"strategy_points_24h":2,"random_good_of_age_24h":6},"SpaceAgeAsteroidBelt":{"happiness":11120,"strategy_points_24h":2,"random_good_of_age_24h":6},"SpaceAgeVenus":{"happiness":12020,"strategy_points_24h":2,"random_good_of_age_24h":6},"SpaceAgeJupiterMoon":{"happiness":12950,"strategy_points_24h":2,"random_good_of_age_24h":6},"SpaceAgeTitan":{"happiness":13952,"strategy_points_24h":2,"random_good_of_age_24h":6},"SpaceAgeSpaceHub":{"happiness":14954,"strategy_points_24h":2,"random_good_of_age_24h":6}}, boosts: [{"type":"att_boost_attacker","value":2,"feature":"all"},{"type":"def_boost_attacker","value":3,"feature":"all"}] },
+    "W_MultiAge_WIN22A7": { prod: {"BronzeAge":{"happiness":630,"strategy_points_24h":3,"random_good_of_age_24h":7},"IronAge":{"happiness":1090,"strategy_points_24h":3,"random_good_of_age_24h":7},"EarlyMiddleAge":{"happiness":1200,"strategy_points_24h":3,"random_good_of_age_24h":7},"HighMiddleAge":{"happiness":1340,"strategy_points_24h":3,"random_good_of_age_24h":7},"LateMiddleAge":{"happiness":1500,"strategy_points_24h":3,"random_good_of_age_24h":7},"ColonialAge":{"happiness":1760,"strategy_points_24h":3,"random_good_of_age_24h":7},"IndustrialAge":{"happiness":1980,"strategy_points_24h":3,"random_good_of_age_24h":7},"ProgressiveEra":{"happiness":2180,"strategy_points_24h":3,"random_good_of_age_24h":7},"ModernEra":{"happiness":2330,"strategy_points_24h":3,"random_good_of_age_24h":7},"PostModernEra":{"happiness":2430,"strategy_points_24h":3,"random_good_of_age_24h":7},"ContemporaryEra":{"happiness":2820,"strategy_points_24h":3,"random_good_of_age_24h":7},"TomorrowEra":{"happiness":3420,"strategy_points_24h":3,"random_good_of_age_24h":7},"FutureEra":{"happiness":4100,"strategy_points_24h":3,"random_good_of_age_24h":7},"ArcticFuture":{"happiness":4780,"strategy_points_24h":3,"random_good_of_age_24h":7},"OceanicFuture":{"happiness":5510,"strategy_points_24h":3,"random_good_of_age_24h":7},"VirtualFuture":{"happiness":6590,"strategy_points_24h":3,"random_good_of_age_24h":7},"SpaceAgeMars":{"happiness":10540,"strategy_points_24h":3,"random_good_of_age_24h":7},"SpaceAgeAsteroidBelt":{"happiness":11450,"strategy_points_24h":3,"random_good_of_age_24h":7},"SpaceAgeVenus":{"happiness":12370,"strategy_points_24h":3,"random_good_of_age_24h":7},"SpaceAgeJupiterMoon":{"happiness":13330,"strategy_points_24h":3,"random_good_of_age_24h":7},"SpaceAgeTitan":{"happiness":14365,"strategy_points_24h":3,"random_good_of_age_24h":7},"SpaceAgeSpaceHub":{"happiness":15400,"strategy_points_24h":3,"random_good_of_age_24h":7}}, boosts: [{"type":"att_boost_attacker","value":3,"feature":"all"},{"type":"def_boost_attacker","value":4,"feature":"all"}] },
+    "W_MultiAge_WIN22A8": { prod: {"BronzeAge":{"happiness":650,"strategy_points_24h":3,"random_good_of_age_24h":8},"IronAge":{"happiness":1120,"strategy_points_24h":3,"random_good_of_age_24h":8},"EarlyMiddleAge":{"happiness":1240,"strategy_points_24h":3,"random_good_of_age_24h":8},"HighMiddleAge":{"happiness":1380,"strategy_points_24h":3,"random_good_of_age_24h":8},"LateMiddleAge":{"happiness":1540,"strategy_points_24h":3,"random_good_of_age_24h":8},"ColonialAge":{"happiness":1810,"strategy_points_24h":3,"random_good_of_age_24h":8},"IndustrialAge":{"happiness":2040,"strategy_points_24h":3,"random_good_of_age_24h":8},"ProgressiveEra":{"happiness":2240,"strategy_points_24h":3,"random_good_of_age_24h":8},"ModernEra":{"happiness":2400,"strategy_points_24h":3,"random_good_of_age_24h":8},"PostModernEra":{"happiness":2500,"strategy_points_24h":3,"random_good_of_age_24h":8},"ContemporaryEra":{"happiness":2900,"strategy_points_24h":3,"random_good_of_age_24h":8},"TomorrowEra":{"happiness":3520,"strategy_points_24h":3,"random_good_of_age_24h":8},"FutureEra":{"happiness":4220,"strategy_points_24h":3,"random_good_of_age_24h":8},"ArcticFuture":{"happiness":4910,"strategy_points_24h":3,"random_good_of_age_24h":8},"OceanicFuture":{"happiness":5670,"strategy_points_24h":3,"random_good_of_age_24h":8},"VirtualFuture":{"happiness":6770,"strategy_points_24h":3,"random_good_of_age_24h":8},"SpaceAgeMars":{"happiness":10840,"strategy_points_24h":3,"random_good_of_age_24h":8},"SpaceAgeAsteroidBelt":{"happiness":11780,"strategy_points_24h":3,"random_good_of_age_24h":8},"SpaceAgeVenus":{"happiness":12730,"strategy_points_24h":3,"random_good_of_age_24h":8},"SpaceAgeJupiterMoon":{"happiness":13710,"strategy_points_24h":3,"random_good_of_age_24h":8},"SpaceAgeTitan":{"happiness":14766,"strategy_points_24h":3,"random_good_of_age_24h":8},"SpaceAgeSpaceHub":{"happiness":15822,"strategy_points_24h":3,"random_good_of_age_24h":8}}, boosts: [{"type":"att_boost_attacker","value":3,"feature":"all"},{"type":"def_boost_attacker","value":4,"feature":"all"}] },
+    "W_MultiAge_WIN22A9": { prod: {"BronzeAge":{"happiness":670,"strategy_points_24h":3,"random_good_of_age_24h":9},"IronAge":{"happiness":1150,"strategy_points_24h":3,"random_good_of_age_24h":9},"EarlyMiddleAge":{"happiness":1270,"strategy_points_24h":3,"random_good_of_age_24h":9},"HighMiddleAge":{"happiness":1420,"strategy_points_24h":3,"random_good_of_age_24h":9},"LateMiddleAge":{"happiness":1580,"strategy_points_24h":3,"random_good_of_age_24h":9},"ColonialAge":{"happiness":1860,"strategy_points_24h":3,"random_good_of_age_24h":9},"IndustrialAge":{"happiness":2100,"strategy_points_24h":3,"random_good_of_age_24h":9},"ProgressiveEra":{"happiness":2300,"strategy_points_24h":3,"random_good_of_age_24h":9},"ModernEra":{"happiness":2460,"strategy_points_24h":3,"random_good_of_age_24h":9},"PostModernEra":{"happiness":2570,"strategy_points_24h":3,"random_good_of_age_24h":9},"ContemporaryEra":{"happiness":2980,"strategy_points_24h":3,"random_good_of_age_24h":9},"TomorrowEra":{"happiness":3620,"strategy_points_24h":3,"random_good_of_age_24h":9},"FutureEra":{"happiness":4340,"strategy_points_24h":3,"random_good_of_age_24h":9},"ArcticFuture":{"happiness":5050,"strategy_points_24h":3,"random_good_of_age_24h":9},"OceanicFuture":{"happiness":5830,"strategy_points_24h":3,"random_good_of_age_24h":9},"VirtualFuture":{"happiness":6960,"strategy_points_24h":3,"random_good_of_age_24h":9},"SpaceAgeMars":{"happiness":11140,"strategy_points_24h":3,"random_good_of_age_24h":9},"SpaceAgeAsteroidBelt":{"happiness":12110,"strategy_points_24h":3,"random_good_of_age_24h":9},"SpaceAgeVenus":{"happiness":13080,"strategy_points_24h":3,"random_good_of_age_24h":9},"SpaceAgeJupiterMoon":{"happiness":14090,"strategy_points_24h":3,"random_good_of_age_24h":9},"SpaceAgeTitan":{"happiness":15178,"strategy_points_24h":3,"random_good_of_age_24h":9},"SpaceAgeSpaceHub":{"happiness":16266,"strategy_points_24h":3,"random_good_of_age_24h":9}}, boosts: [{"type":"att_boost_attacker","value":4,"feature":"all"},{"type":"def_boost_attacker","value":5,"feature":"all"}] },
+    "W_MultiAge_WIN24F4": { prod: {"AllAge":{"random_good_of_age_24h":12,"strategy_points_24h":6,"random_special_good_up_to_age_24h":10},"BronzeAge":{"population":80,"happiness":440,"demandHappiness":80},"IronAge":{"population":170,"happiness":760,"demandHappiness":170},"EarlyMiddleAge":{"population":260,"happiness":840,"demandHappiness":260},"HighMiddleAge":{"population":370,"happiness":940,"demandHappiness":370},"LateMiddleAge":{"population":490,"happiness":1050,"demandHappiness":490},"ColonialAge":{"population":610,"happiness":1230,"demandHappiness":610},"IndustrialAge":{"population":750,"happiness":1390,"demandHappiness":750},"ProgressiveEra":{"population":900,"happiness":1520,"demandHappiness":900},"ModernEra":{"population":1050,"happiness":1630,"demandHappiness":1050},"PostModernEra":{"population":1210,"happiness":1700,"demandHappiness":1210},"ContemporaryEra":{"population":1380,"happiness":1970,"demandHappiness":1380},"TomorrowEra":{"population":1560,"happiness":2400,"demandHappiness":1560},"FutureEra":{"population":1740,"happiness":2870,"demandHappiness":1740},"ArcticFuture":{"population":1930,"happiness":3340,"demandHappiness":1930},"OceanicFuture":{"population":2130,"happiness":3860,"demandHappiness":2130},"VirtualFuture":{"population":2330,"happiness":4610,"demandHappiness":2330},"SpaceAgeMars":{"population":3690,"happiness":7370,"demandHappiness":3690},"SpaceAgeAsteroidBelt":{"population":4000,"happiness":8010,"demandHappiness":4000},"SpaceAgeVenus":{"population":4330,"happiness":8660,"demandHappiness":4330},"SpaceAgeJupiterMoon":{"population":4660,"happiness":9320,"demandHappiness":4660},"SpaceAgeTitan":{"population":5000,"happiness":10000,"demandHappiness":5000},"SpaceAgeSpaceHub":{"population":5340,"happiness":10680,"demandHappiness":5340}}, boosts: [{"type":"att_def_boost_attacker","value":9,"feature":"all"},{"type":"att_def_boost_defender","value":9,"feature":"all"}] },
+    "W_MultiAge_WIN24F3": { prod: {"AllAge":{"random_good_of_age_24h":12,"strategy_points_24h":6},"BronzeAge":{"population":60,"happiness":350,"demandHappiness":60},"IronAge":{"population":140,"happiness":610,"demandHappiness":140},"EarlyMiddleAge":{"population":210,"happiness":670,"demandHappiness":210},"HighMiddleAge":{"population":300,"happiness":750,"demandHappiness":300},"LateMiddleAge":{"population":390,"happiness":840,"demandHappiness":390},"ColonialAge":{"population":490,"happiness":980,"demandHappiness":490},"IndustrialAge":{"population":600,"happiness":1110,"demandHappiness":600},"ProgressiveEra":{"population":720,"happiness":1220,"demandHappiness":720},"ModernEra":{"population":840,"happiness":1300,"demandHappiness":840},"PostModernEra":{"population":970,"happiness":1360,"demandHappiness":970},"ContemporaryEra":{"population":1110,"happiness":1580,"demandHappiness":1110},"TomorrowEra":{"population":1250,"happiness":1920,"demandHappiness":1250},"FutureEra":{"population":1390,"happiness":2300,"demandHappiness":1390},"ArcticFuture":{"population":1540,"happiness":2670,"demandHappiness":1540},"OceanicFuture":{"population":1700,"happiness":3090,"demandHappiness":1700},"VirtualFuture":{"population":1860,"happiness":3690,"demandHappiness":1860},"SpaceAgeMars":{"population":2950,"happiness":5900,"demandHappiness":2950},"SpaceAgeAsteroidBelt":{"population":3200,"happiness":6410,"demandHappiness":3200},"SpaceAgeVenus":{"population":3460,"happiness":6920,"demandHappiness":3460},"SpaceAgeJupiterMoon":{"population":3730,"happiness":7460,"demandHappiness":3730},"SpaceAgeTitan":{"population":4000,"happiness":8000,"demandHappiness":4000},"SpaceAgeSpaceHub":{"population":4270,"happiness":8540,"demandHappiness":4270}}, boosts: [{"type":"def_boost_attacker","value":9,"feature":"all"},{"type":"att_def_boost_defender","value":9,"feature":"all"}] },
+    "W_MultiAge_WIN24F1": { prod: {"AllAge":{"random_good_of_age_24h":12},"BronzeAge":{"population":30,"happiness":180,"demandHappiness":30},"IronAge":{"population":70,"happiness":300,"demandHappiness":70},"EarlyMiddleAge":{"population":110,"happiness":340,"demandHappiness":110},"HighMiddleAge":{"population":150,"happiness":380,"demandHappiness":150},"LateMiddleAge":{"population":190,"happiness":420,"demandHappiness":190},"ColonialAge":{"population":250,"happiness":490,"demandHappiness":250},"IndustrialAge":{"population":300,"happiness":550,"demandHappiness":300},"ProgressiveEra":{"population":360,"happiness":610,"demandHappiness":360},"ModernEra":{"population":420,"happiness":650,"demandHappiness":420},"PostModernEra":{"population":480,"happiness":680,"demandHappiness":480},"ContemporaryEra":{"population":550,"happiness":790,"demandHappiness":550},"TomorrowEra":{"population":620,"happiness":960,"demandHappiness":620},"FutureEra":{"population":700,"happiness":1150,"demandHappiness":700},"ArcticFuture":{"population":770,"happiness":1340,"demandHappiness":770},"OceanicFuture":{"population":850,"happiness":1540,"demandHappiness":850},"VirtualFuture":{"population":930,"happiness":1840,"demandHappiness":930},"SpaceAgeMars":{"population":1470,"happiness":2950,"demandHappiness":1470},"SpaceAgeAsteroidBelt":{"population":1600,"happiness":3200,"demandHappiness":1600},"SpaceAgeVenus":{"population":1730,"happiness":3460,"demandHappiness":1730},"SpaceAgeJupiterMoon":{"population":1860,"happiness":3730,"demandHappiness":1860},"SpaceAgeTitan":{"population":2000,"happiness":4000,"demandHappiness":2000},"SpaceAgeSpaceHub":{"population":2140,"happiness":4270,"demandHappiness":2140}}, boosts: [{"type":"def_boost_attacker","value":9,"feature":"all"},{"type":"def_boost_defender","value":9,"feature":"all"}] },
+    "W_MultiAge_WIN24F2": { prod: {"AllAge":{"random_good_of_age_24h":12},"BronzeAge":{"population":50,"happiness":260,"demandHappiness":50},"IronAge":{"population":100,"happiness":460,"demandHappiness":100},"EarlyMiddleAge":{"population":160,"happiness":500,"demandHappiness":160},"HighMiddleAge":{"population":220,"happiness":560,"demandHappiness":220},"LateMiddleAge":{"population":290,"happiness":630,"demandHappiness":290},"ColonialAge":{"population":370,"happiness":740,"demandHappiness":370},"IndustrialAge":{"population":450,"happiness":830,"demandHappiness":450},"ProgressiveEra":{"population":540,"happiness":910,"demandHappiness":540},"ModernEra":{"population":630,"happiness":980,"demandHappiness":630},"PostModernEra":{"population":730,"happiness":1020,"demandHappiness":730},"ContemporaryEra":{"population":830,"happiness":1180,"demandHappiness":830},"TomorrowEra":{"population":930,"happiness":1440,"demandHappiness":930},"FutureEra":{"population":1040,"happiness":1720,"demandHappiness":1040},"ArcticFuture":{"population":1160,"happiness":2010,"demandHappiness":1160},"OceanicFuture":{"population":1280,"happiness":2310,"demandHappiness":1280},"VirtualFuture":{"population":1400,"happiness":2760,"demandHappiness":1400},"SpaceAgeMars":{"population":2210,"happiness":4420,"demandHappiness":2210},"SpaceAgeAsteroidBelt":{"population":2400,"happiness":4810,"demandHappiness":2400},"SpaceAgeVenus":{"population":2600,"happiness":5190,"demandHappiness":2600},"SpaceAgeJupiterMoon":{"population":2800,"happiness":5590,"demandHappiness":2800},"SpaceAgeTitan":{"population":3000,"happiness":6000,"demandHappiness":3000},"SpaceAgeSpaceHub":{"population":3200,"happiness":6410,"demandHappiness":3200}}, boosts: [{"type":"def_boost_attacker","value":9,"feature":"all"},{"type":"att_def_boost_defender","value":9,"feature":"all"}] },
+    "W_MultiAge_WIN22B2": { prod: {"BronzeAge":{"strategy_points_24h":6},"IronAge":{"strategy_points_24h":6},"EarlyMiddleAge":{"strategy_points_24h":6},"HighMiddleAge":{"strategy_points_24h":6},"LateMiddleAge":{"strategy_points_24h":6},"ColonialAge":{"strategy_points_24h":6},"IndustrialAge":{"strategy_points_24h":6},"ProgressiveEra":{"strategy_points_24h":6},"ModernEra":{"strategy_points_24h":6},"PostModernEra":{"strategy_points_24h":6},"ContemporaryEra":{"strategy_points_24h":6},"TomorrowEra":{"strategy_points_24h":6},"FutureEra":{"strategy_points_24h":6},"ArcticFuture":{"strategy_points_24h":6},"OceanicFuture":{"strategy_points_24h":6},"VirtualFuture":{"strategy_points_24h":6},"SpaceAgeMars":{"strategy_points_24h":6},"SpaceAgeAsteroidBelt":{"strategy_points_24h":6},"SpaceAgeVenus":{"strategy_points_24h":6},"SpaceAgeJupiterMoon":{"strategy_points_24h":6},"SpaceAgeTitan":{"strategy_points_24h":6},"SpaceAgeSpaceHub":{"strategy_points_24h":6}}, boosts: [{"type":"att_boost_attacker","value":8,"feature":"all"},{"type":"def_boost_attacker","value":12,"feature":"all"}] },
+    "W_MultiAge_WIN22B1": { prod: {"BronzeAge":{"strategy_points_24h":3},"IronAge":{"strategy_points_24h":3},"EarlyMiddleAge":{"strategy_points_24h":3},"HighMiddleAge":{"strategy_points_24h":3},"LateMiddleAge":{"strategy_points_24h":3},"ColonialAge":{"strategy_points_24h":3},"IndustrialAge":{"strategy_points_24h":3},"ProgressiveEra":{"strategy_points_24h":3},"ModernEra":{"strategy_points_24h":3},"PostModernEra":{"strategy_points_24h":3},"ContemporaryEra":{"strategy_points_24h":3},"TomorrowEra":{"strategy_points_24h":3},"FutureEra":{"strategy_points_24h":3},"ArcticFuture":{"strategy_points_24h":3},"OceanicFuture":{"strategy_points_24h":3},"VirtualFuture":{"strategy_points_24h":3},"SpaceAgeMars":{"strategy_points_24h":3},"SpaceAgeAsteroidBelt":{"strategy_points_24h":3},"SpaceAgeVenus":{"strategy_points_24h":3},"SpaceAgeJupiterMoon":{"strategy_points_24h":3},"SpaceAgeTitan":{"strategy_points_24h":3},"SpaceAgeSpaceHub":{"strategy_points_24h":3}}, boosts: [{"type":"att_boost_attacker","value":3,"feature":"all"},{"type":"def_boost_attacker","value":5,"feature":"all"}] },
+    "W_MultiAge_WIN23C4": { prod: {"BronzeAge":{"population":-248,"happiness":-1620,"strategy_points_24h":13,"random_good_of_age_24h":34},"IronAge":{"population":-533,"happiness":-2790,"strategy_points_24h":13,"random_good_of_age_24h":34},"EarlyMiddleAge":{"population":-818,"happiness":-3090,"strategy_points_24h":13,"random_good_of_age_24h":34},"HighMiddleAge":{"population":-1148,"happiness":-3440,"strategy_points_24h":13,"random_good_of_age_24h":34},"LateMiddleAge":{"population":-1506,"happiness":-3840,"strategy_points_24h":13,"random_good_of_age_24h":34},"ColonialAge":{"population":-1901,"happiness":-4520,"strategy_points_24h":13,"random_good_of_age_24h":36},"IndustrialAge":{"population":-2323,"happiness":-5090,"strategy_points_24h":13,"random_good_of_age_24h":36},"ProgressiveEra":{"population":-2773,"happiness":-5590,"strategy_points_24h":13,"random_good_of_age_24h":36},"ModernEra":{"population":-3250,"happiness":-5980,"strategy_points_24h":13,"random_good_of_age_24h":36},"PostModernEra":{"population":-3746,"happiness":-6230,"strategy_points_24h":13,"random_good_of_age_24h":36},"ContemporaryEra":{"population":-4269,"happiness":-7240,"strategy_points_24h":14,"random_good_of_age_24h":38},"TomorrowEra":{"population":-4811,"happiness":-8790,"strategy_points_24h":14,"random_good_of_age_24h":38},"FutureEra":{"population":-5380,"happiness":-10530,"strategy_points_24h":14,"random_good_of_age_24h":38},"ArcticFuture":{"population":-5967,"happiness":-12260,"strategy_points_24h":14,"random_good_of_age_24h":38},"OceanicFuture":{"population":-6573,"happiness":-14150,"strategy_points_24h":14,"random_good_of_age_24h":38},"VirtualFuture":{"population":-7198,"happiness":-16900,"strategy_points_24h":14,"random_good_of_age_24h":40},"SpaceAgeMars":{"population":-11393,"happiness":-27040,"strategy_points_24h":14,"random_good_of_age_24h":40},"SpaceAgeAsteroidBelt":{"population":-12375,"happiness":-29380,"strategy_points_24h":14,"random_good_of_age_24h":40},"SpaceAgeVenus":{"population":-13376,"happiness":-31740,"strategy_points_24h":14,"random_good_of_age_24h":40},"SpaceAgeJupiterMoon":{"population":-14404,"happiness":-34190,"strategy_points_24h":14,"random_good_of_age_24h":40},"SpaceAgeTitan":{"population":-15450,"happiness":-36670,"strategy_points_24h":15,"random_good_of_age_24h":42},"SpaceAgeSpaceHub":{"population":-16496,"happiness":-39150,"strategy_points_24h":15,"random_good_of_age_24h":42}}, boosts: [{"type":"att_boost_attacker","value":25,"feature":"all"},{"type":"att_boost_defender","value":34,"feature":"all"}] },
+    "W_MultiAge_WIN23C3": { prod: {"BronzeAge":{"happiness":-1360,"strategy_points_24h":11,"random_good_of_age_24h":22},"IronAge":{"happiness":-2330,"strategy_points_24h":11,"random_good_of_age_24h":22},"EarlyMiddleAge":{"happiness":-2580,"strategy_points_24h":11,"random_good_of_age_24h":22},"HighMiddleAge":{"happiness":-2880,"strategy_points_24h":11,"random_good_of_age_24h":22},"LateMiddleAge":{"happiness":-3210,"strategy_points_24h":11,"random_good_of_age_24h":22},"ColonialAge":{"happiness":-3770,"strategy_points_24h":11,"random_good_of_age_24h":24},"IndustrialAge":{"happiness":-4250,"strategy_points_24h":11,"random_good_of_age_24h":24},"ProgressiveEra":{"happiness":-4670,"strategy_points_24h":11,"random_good_of_age_24h":24},"ModernEra":{"happiness":-4990,"strategy_points_24h":11,"random_good_of_age_24h":24},"PostModernEra":{"happiness":-5200,"strategy_points_24h":11,"random_good_of_age_24h":24},"ContemporaryEra":{"happiness":-6040,"strategy_points_24h":12,"random_good_of_age_24h":26},"TomorrowEra":{"happiness":-7340,"strategy_points_24h":12,"random_good_of_age_24h":26},"FutureEra":{"happiness":-8790,"strategy_points_24h":12,"random_good_of_age_24h":26},"ArcticFuture":{"happiness":-10230,"strategy_points_24h":12,"random_good_of_age_24h":26},"OceanicFuture":{"happiness":-11810,"strategy_points_24h":12,"random_good_of_age_24h":26},"VirtualFuture":{"happiness":-14100,"strategy_points_24h":12,"random_good_of_age_24h":28},"SpaceAgeMars":{"happiness":-22560,"strategy_points_24h":12,"random_good_of_age_24h":28},"SpaceAgeAsteroidBelt":{"happiness":-24520,"strategy_points_24h":12,"random_good_of_age_24h":28},"SpaceAgeVenus":{"happiness":-26490,"strategy_points_24h":12,"random_good_of_age_24h":28},"SpaceAgeJupiterMoon":{"happiness":-28540,"strategy_points_24h":12,"random_good_of_age_24h":28},"SpaceAgeTitan":{"happiness":-30600,"strategy_points_24h":13,"random_good_of_age_24h":30},"SpaceAgeSpaceHub":{"happiness":-32660,"strategy_points_24h":13,"random_good_of_age_24h":30}}, boosts: [{"type":"att_boost_attacker","value":23,"feature":"all"},{"type":"att_boost_defender","value":32,"feature":"all"}] },
+    "W_MultiAge_WIN23C1": { prod: {"BronzeAge":{"strategy_points_24h":11},"IronAge":{"strategy_points_24h":11},"EarlyMiddleAge":{"strategy_points_24h":11},"HighMiddleAge":{"strategy_points_24h":11},"LateMiddleAge":{"strategy_points_24h":11},"ColonialAge":{"strategy_points_24h":11},"IndustrialAge":{"strategy_points_24h":11},"ProgressiveEra":{"strategy_points_24h":11},"ModernEra":{"strategy_points_24h":11},"PostModernEra":{"strategy_points_24h":11},"ContemporaryEra":{"strategy_points_24h":12},"TomorrowEra":{"strategy_points_24h":12},"FutureEra":{"strategy_points_24h":12},"ArcticFuture":{"strategy_points_24h":12},"OceanicFuture":{"strategy_points_24h":12},"VirtualFuture":{"strategy_points_24h":12},"SpaceAgeMars":{"strategy_points_24h":12},"SpaceAgeAsteroidBelt":{"strategy_points_24h":12},"SpaceAgeVenus":{"strategy_points_24h":12},"SpaceAgeJupiterMoon":{"strategy_points_24h":12},"SpaceAgeTitan":{"strategy_points_24h":13},"SpaceAgeSpaceHub":{"strategy_points_24h":13}}, boosts: [{"type":"att_boost_attacker","value":23,"feature":"all"}] },
+    "W_MultiAge_WIN23C2": { prod: {"BronzeAge":{"strategy_points_24h":11,"random_good_of_age_24h":22},"IronAge":{"strategy_points_24h":11,"random_good_of_age_24h":22},"EarlyMiddleAge":{"strategy_points_24h":11,"random_good_of_age_24h":22},"HighMiddleAge":{"strategy_points_24h":11,"random_good_of_age_24h":22},"LateMiddleAge":{"strategy_points_24h":11,"random_good_of_age_24h":22},"ColonialAge":{"strategy_points_24h":11,"random_good_of_age_24h":24},"IndustrialAge":{"strategy_points_24h":11,"random_good_of_age_24h":24},"ProgressiveEra":{"strategy_points_24h":11,"random_good_of_age_24h":24},"ModernEra":{"strategy_points_24h":11,"random_good_of_age_24h":24},"PostModernEra":{"strategy_points_24h":11,"random_good_of_age_24h":24},"ContemporaryEra":{"strategy_points_24h":12,"random_good_of_age_24h":26},"TomorrowEra":{"strategy_points_24h":12,"random_good_of_age_24h":26},"FutureEra":{"strategy_points_24h":12,"random_good_of_age_24h":26},"ArcticFuture":{"strategy_points_24h":12,"random_good_of_age_24h":26},"OceanicFuture":{"strategy_points_24h":12,"random_good_of_age_24h":26},"VirtualFuture":{"strategy_points_24h":12,"random_good_of_age_24h":28},"SpaceAgeMars":{"strategy_points_24h":12,"random_good_of_age_24h":28},"SpaceAgeAsteroidBelt":{"strategy_points_24h":12,"random_good_of_age_24h":28},"SpaceAgeVenus":{"strategy_points_24h":12,"random_good_of_age_24h":28},"SpaceAgeJupiterMoon":{"strategy_points_24h":12,"random_good_of_age_24h":28},"SpaceAgeTitan":{"strategy_points_24h":13,"random_good_of_age_24h":30},"SpaceAgeSpaceHub":{"strategy_points_24h":13,"random_good_of_age_24h":30}}, boosts: [{"type":"att_boost_attacker","value":23,"feature":"all"}] },
+    "W_MultiAge_WIN25C2": { prod: {"BronzeAge":{"population":-90,"money_24h":230,"strategy_points_24h":30},"IronAge":{"population":-190,"money_24h":550,"strategy_points_24h":30},"EarlyMiddleAge":{"population":-300,"money_24h":910,"strategy_points_24h":30},"HighMiddleAge":{"population":-420,"money_24h":1280,"strategy_points_24h":30},"LateMiddleAge":{"population":-550,"money_24h":1690,"strategy_points_24h":30},"ColonialAge":{"population":-690,"money_24h":2570,"strategy_points_24h":30},"IndustrialAge":{"population":-840,"money_24h":3200,"strategy_points_24h":30},"ProgressiveEra":{"population":-1010,"money_24h":3880,"strategy_points_24h":30},"ModernEra":{"population":-1180,"money_24h":4830,"strategy_points_24h":30},"PostModernEra":{"population":-1360,"money_24h":6070,"strategy_points_24h":30},"ContemporaryEra":{"population":-1550,"money_24h":7910,"strategy_points_24h":30},"TomorrowEra":{"population":-1750,"money_24h":9150,"strategy_points_24h":30},"FutureEra":{"population":-1960,"money_24h":10490,"strategy_points_24h":30},"ArcticFuture":{"population":-2170,"money_24h":11920,"strategy_points_24h":30},"OceanicFuture":{"population":-2390,"money_24h":13440,"strategy_points_24h":30},"VirtualFuture":{"population":-2620,"money_24h":15060,"strategy_points_24h":30},"SpaceAgeMars":{"population":-4140,"money_24h":25150,"strategy_points_24h":30},"SpaceAgeAsteroidBelt":{"population":-4500,"money_24h":27860,"strategy_points_24h":30},"SpaceAgeVenus":{"population":-4860,"money_24h":30710,"strategy_points_24h":30},"SpaceAgeJupiterMoon":{"population":-5240,"money_24h":33710,"strategy_points_24h":30},"SpaceAgeTitan":{"population":-5620,"money_24h":36860,"strategy_points_24h":30},"SpaceAgeSpaceHub":{"population":-6000,"money_24h":40000,"strategy_points_24h":30}}, boosts: [{"type":"att_def_boost_attacker_defender","value":7,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":3,"feature":"guild_raids"},{"type":"guild_raids_coins_start","value":2750,"feature":"all"},{"type":"guild_raids_supplies_start","value":2750,"feature":"all"}] },
+    "W_MultiAge_WIN24B2": { prod: {"AllAge":{"random_good_of_age_24h":64,"random_good_of_previous_age_24h":128},"BronzeAge":{"population":-260},"IronAge":{"population":-550},"EarlyMiddleAge":{"population":-850},"HighMiddleAge":{"population":-1190},"LateMiddleAge":{"population":-1560},"ColonialAge":{"population":-1970},"IndustrialAge":{"population":-2410},"ProgressiveEra":{"population":-2870},"ModernEra":{"population":-3370},"PostModernEra":{"population":-3880},"ContemporaryEra":{"population":-4420},"TomorrowEra":{"population":-4980},"FutureEra":{"population":-5570},"ArcticFuture":{"population":-6180},"OceanicFuture":{"population":-6810},"VirtualFuture":{"population":-7450},"SpaceAgeMars":{"population":-11800},"SpaceAgeAsteroidBelt":{"population":-12820},"SpaceAgeVenus":{"population":-13850},"SpaceAgeJupiterMoon":{"population":-14920},"SpaceAgeTitan":{"population":-16000},"SpaceAgeSpaceHub":{"population":-17080}}, boosts: [{"type":"def_boost_attacker","value":23,"feature":"all"},{"type":"def_boost_defender","value":35,"feature":"all"},{"type":"guild_raids_coins_production","value":4,"feature":"all"},{"type":"guild_raids_supplies_production","value":4,"feature":"all"}] },
+    "W_MultiAge_WIN25B2": { prod: {"BronzeAge":{"population":-810,"money_24h":2050,"strategy_points_24h":270},"IronAge":{"population":-1740,"money_24h":4920,"strategy_points_24h":270},"EarlyMiddleAge":{"population":-2670,"money_24h":8200,"strategy_points_24h":270},"HighMiddleAge":{"population":-3760,"money_24h":11480,"strategy_points_24h":270},"LateMiddleAge":{"population":-4930,"money_24h":15170,"strategy_points_24h":270},"ColonialAge":{"population":-6220,"money_24h":23100,"strategy_points_24h":270},"IndustrialAge":{"population":-7600,"money_24h":28780,"strategy_points_24h":270},"ProgressiveEra":{"population":-9080,"money_24h":34920,"strategy_points_24h":270},"ModernEra":{"population":-10640,"money_24h":43450,"strategy_points_24h":270},"PostModernEra":{"population":-12260,"money_24h":54660,"strategy_points_24h":270},"ContemporaryEra":{"population":-13970,"money_24h":71160,"strategy_points_24h":270},"TomorrowEra":{"population":-15750,"money_24h":82390,"strategy_points_24h":270},"FutureEra":{"population":-17610,"money_24h":94440,"strategy_points_24h":270},"ArcticFuture":{"population":-19530,"money_24h":107310,"strategy_points_24h":270},"OceanicFuture":{"population":-21520,"money_24h":121000,"strategy_points_24h":270},"VirtualFuture":{"population":-23560,"money_24h":135540,"strategy_points_24h":270},"SpaceAgeMars":{"population":-37290,"money_24h":226390,"strategy_points_24h":270},"SpaceAgeAsteroidBelt":{"population":-40510,"money_24h":250760,"strategy_points_24h":270},"SpaceAgeVenus":{"population":-43780,"money_24h":276420,"strategy_points_24h":270},"SpaceAgeJupiterMoon":{"population":-47150,"money_24h":303390,"strategy_points_24h":270},"SpaceAgeTitan":{"population":-50570,"money_24h":331700,"strategy_points_24h":270},"SpaceAgeSpaceHub":{"population":-54000,"money_24h":360000,"strategy_points_24h":270}}, boosts: [{"type":"att_def_boost_attacker_defender","value":87,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":27,"feature":"guild_raids"},{"type":"guild_raids_coins_start","value":24750,"feature":"all"},{"type":"guild_raids_supplies_start","value":24750,"feature":"all"}] },
+    "W_MultiAge_WIN24C2": { prod: {"AllAge":{"strategy_points_24h":23},"BronzeAge":{"population":-190},"IronAge":{"population":-410},"EarlyMiddleAge":{"population":-630},"HighMiddleAge":{"population":-890},"LateMiddleAge":{"population":-1170},"ColonialAge":{"population":-1480},"IndustrialAge":{"population":-1800},"ProgressiveEra":{"population":-2150},"ModernEra":{"population":-2520},"PostModernEra":{"population":-2910},"ContemporaryEra":{"population":-3320},"TomorrowEra":{"population":-3740},"FutureEra":{"population":-4180},"ArcticFuture":{"population":-4630},"OceanicFuture":{"population":-5110},"VirtualFuture":{"population":-5590},"SpaceAgeMars":{"population":-8850},"SpaceAgeAsteroidBelt":{"population":-9610},"SpaceAgeVenus":{"population":-10390},"SpaceAgeJupiterMoon":{"population":-11190},"SpaceAgeTitan":{"population":-12000},"SpaceAgeSpaceHub":{"population":-12810}}, boosts: [{"type":"att_def_boost_attacker","value":16,"feature":"all"},{"type":"att_def_boost_attacker","value":16,"feature":"battleground"},{"type":"guild_raids_goods_start","value":10,"feature":"all"},{"type":"guild_raids_units_start","value":5,"feature":"all"}] },
+    "W_MultiAge_WIN24B1": { prod: {"AllAge":{"random_good_of_age_24h":32,"random_good_of_previous_age_24h":64},"BronzeAge":{"population":-260},"IronAge":{"population":-550},"EarlyMiddleAge":{"population":-850},"HighMiddleAge":{"population":-1190},"LateMiddleAge":{"population":-1560},"ColonialAge":{"population":-1970},"IndustrialAge":{"population":-2410},"ProgressiveEra":{"population":-2870},"ModernEra":{"population":-3370},"PostModernEra":{"population":-3880},"ContemporaryEra":{"population":-4420},"TomorrowEra":{"population":-4980},"FutureEra":{"population":-5570},"ArcticFuture":{"population":-6180},"OceanicFuture":{"population":-6810},"VirtualFuture":{"population":-7450},"SpaceAgeMars":{"population":-11800},"SpaceAgeAsteroidBelt":{"population":-12820},"SpaceAgeVenus":{"population":-13850},"SpaceAgeJupiterMoon":{"population":-14920},"SpaceAgeTitan":{"population":-16000},"SpaceAgeSpaceHub":{"population":-17080}}, boosts: [{"type":"def_boost_attacker","value":22,"feature":"all"},{"type":"def_boost_defender","value":30,"feature":"all"}] },
+    "W_MultiAge_WIN19C1": { prod: {"BronzeAge":{"happiness":200},"IronAge":{"happiness":280},"EarlyMiddleAge":{"happiness":330},"HighMiddleAge":{"happiness":420},"LateMiddleAge":{"happiness":480},"ColonialAge":{"happiness":570},"IndustrialAge":{"happiness":640},"ProgressiveEra":{"happiness":700},"ModernEra":{"happiness":800},"PostModernEra":{"happiness":910},"ContemporaryEra":{"happiness":1060},"TomorrowEra":{"happiness":1320},"FutureEra":{"happiness":1580},"ArcticFuture":{"happiness":1790},"OceanicFuture":{"happiness":2010},"VirtualFuture":{"happiness":2540},"SpaceAgeMars":{"happiness":3950},"SpaceAgeAsteroidBelt":{"happiness":4290},"SpaceAgeVenus":{"happiness":4640},"SpaceAgeJupiterMoon":{"happiness":5000},"SpaceAgeTitan":{"happiness":5360},"SpaceAgeSpaceHub":{"happiness":5730}} },
+    "W_MultiAge_WIN19C2": { prod: {"BronzeAge":{"happiness":410},"IronAge":{"happiness":710},"EarlyMiddleAge":{"happiness":790},"HighMiddleAge":{"happiness":880},"LateMiddleAge":{"happiness":980},"ColonialAge":{"happiness":1150},"IndustrialAge":{"happiness":1300},"ProgressiveEra":{"happiness":1430},"ModernEra":{"happiness":1530},"PostModernEra":{"happiness":1590},"ContemporaryEra":{"happiness":1850},"TomorrowEra":{"happiness":2240},"FutureEra":{"happiness":2690},"ArcticFuture":{"happiness":3130},"OceanicFuture":{"happiness":3610},"VirtualFuture":{"happiness":4320},"SpaceAgeMars":{"happiness":6910},"SpaceAgeAsteroidBelt":{"happiness":7500},"SpaceAgeVenus":{"happiness":8110},"SpaceAgeJupiterMoon":{"happiness":8730},"SpaceAgeTitan":{"happiness":9370},"SpaceAgeSpaceHub":{"happiness":10000}} },
+    "W_MultiAge_WIN25B1": { prod: {"BronzeAge":{"population":-810,"money_24h":1020,"strategy_points_24h":90},"IronAge":{"population":-1740,"money_24h":2460,"strategy_points_24h":90},"EarlyMiddleAge":{"population":-2670,"money_24h":4100,"strategy_points_24h":90},"HighMiddleAge":{"population":-3760,"money_24h":5740,"strategy_points_24h":90},"LateMiddleAge":{"population":-4930,"money_24h":7580,"strategy_points_24h":90},"ColonialAge":{"population":-6220,"money_24h":11550,"strategy_points_24h":90},"IndustrialAge":{"population":-7600,"money_24h":14390,"strategy_points_24h":90},"ProgressiveEra":{"population":-9080,"money_24h":17460,"strategy_points_24h":90},"ModernEra":{"population":-10640,"money_24h":21730,"strategy_points_24h":90},"PostModernEra":{"population":-12260,"money_24h":27330,"strategy_points_24h":90},"ContemporaryEra":{"population":-13970,"money_24h":35580,"strategy_points_24h":90},"TomorrowEra":{"population":-15750,"money_24h":41200,"strategy_points_24h":90},"FutureEra":{"population":-17610,"money_24h":47220,"strategy_points_24h":90},"ArcticFuture":{"population":-19530,"money_24h":53660,"strategy_points_24h":90},"OceanicFuture":{"population":-21520,"money_24h":60500,"strategy_points_24h":90},"VirtualFuture":{"population":-23560,"money_24h":67770,"strategy_points_24h":90},"SpaceAgeMars":{"population":-37290,"money_24h":113200,"strategy_points_24h":90},"SpaceAgeAsteroidBelt":{"population":-40510,"money_24h":125380,"strategy_points_24h":90},"SpaceAgeVenus":{"population":-43780,"money_24h":138210,"strategy_points_24h":90},"SpaceAgeJupiterMoon":{"population":-47150,"money_24h":151700,"strategy_points_24h":90},"SpaceAgeTitan":{"population":-50570,"money_24h":165850,"strategy_points_24h":90},"SpaceAgeSpaceHub":{"population":-54000,"money_24h":180000,"strategy_points_24h":90}}, boosts: [{"type":"att_def_boost_attacker_defender","value":33,"feature":"all"}] },
+    "W_MultiAge_WIN23E1": { prod: {"BronzeAge":{"population":-248,"happiness":-1080,"random_good_of_previous_age_24h":30},"IronAge":{"population":-533,"happiness":-1860,"random_good_of_previous_age_24h":30},"EarlyMiddleAge":{"population":-818,"happiness":-2060,"random_good_of_previous_age_24h":30},"HighMiddleAge":{"population":-1148,"happiness":-2300,"random_good_of_previous_age_24h":30},"LateMiddleAge":{"population":-1506,"happiness":-2560,"random_good_of_previous_age_24h":30},"ColonialAge":{"population":-1901,"happiness":-3010,"random_good_of_previous_age_24h":32},"IndustrialAge":{"population":-2323,"happiness":-3400,"random_good_of_previous_age_24h":32},"ProgressiveEra":{"population":-2773,"happiness":-3730,"random_good_of_previous_age_24h":32},"ModernEra":{"population":-3250,"happiness":-3990,"random_good_of_previous_age_24h":34},"PostModernEra":{"population":-3746,"happiness":-4160,"random_good_of_previous_age_24h":34},"ContemporaryEra":{"population":-4269,"happiness":-4830,"random_good_of_previous_age_24h":34},"TomorrowEra":{"population":-4811,"happiness":-5860,"random_good_of_previous_age_24h":36},"FutureEra":{"population":-5380,"happiness":-7020,"random_good_of_previous_age_24h":36},"ArcticFuture":{"population":-5967,"happiness":-8170,"random_good_of_previous_age_24h":36},"OceanicFuture":{"population":-6573,"happiness":-9430,"random_good_of_previous_age_24h":38},"VirtualFuture":{"population":-7198,"happiness":-11270,"random_good_of_previous_age_24h":38},"SpaceAgeMars":{"population":-11393,"happiness":-18030,"random_good_of_previous_age_24h":38},"SpaceAgeAsteroidBelt":{"population":-12375,"happiness":-19590,"random_good_of_previous_age_24h":40},"SpaceAgeVenus":{"population":-13376,"happiness":-21160,"random_good_of_previous_age_24h":40},"SpaceAgeJupiterMoon":{"population":-14404,"happiness":-22800,"random_good_of_previous_age_24h":40},"SpaceAgeTitan":{"population":-15450,"happiness":-24450,"random_good_of_previous_age_24h":42},"SpaceAgeSpaceHub":{"population":-16496,"happiness":-26100,"random_good_of_previous_age_24h":42}}, boosts: [{"type":"att_boost_attacker","value":6,"feature":"all"},{"type":"def_boost_attacker","value":8,"feature":"all"},{"type":"att_boost_defender","value":21,"feature":"all"}] },
+    "W_MultiAge_WIN22A11b": { prod: {"BronzeAge":{"happiness":720,"strategy_points_24h":14,"random_good_of_age_24h":10},"IronAge":{"happiness":1240,"strategy_points_24h":14,"random_good_of_age_24h":10},"EarlyMiddleAge":{"happiness":1370,"strategy_points_24h":14,"random_good_of_age_24h":10},"HighMiddleAge":{"happiness":1530,"strategy_points_24h":14,"random_good_of_age_24h":10},"LateMiddleAge":{"happiness":1710,"strategy_points_24h":14,"random_good_of_age_24h":10},"ColonialAge":{"happiness":2010,"strategy_points_24h":14,"random_good_of_age_24h":10},"IndustrialAge":{"happiness":2270,"strategy_points_24h":14,"random_good_of_age_24h":10},"ProgressiveEra":{"happiness":2490,"strategy_points_24h":14,"random_good_of_age_24h":10},"ModernEra":{"happiness":2660,"strategy_points_24h":14,"random_good_of_age_24h":10},"PostModernEra":{"happiness":2770,"strategy_points_24h":14,"random_good_of_age_24h":10},"ContemporaryEra":{"happiness":3220,"strategy_points_24h":14,"random_good_of_age_24h":10},"TomorrowEra":{"happiness":3910,"strategy_points_24h":14,"random_good_of_age_24h":10},"FutureEra":{"happiness":4690,"strategy_points_24h":14,"random_good_of_age_24h":10},"ArcticFuture":{"happiness":5460,"strategy_points_24h":14,"random_good_of_age_24h":10},"OceanicFuture":{"happiness":6300,"strategy_points_24h":14,"random_good_of_age_24h":10},"VirtualFuture":{"happiness":7530,"strategy_points_24h":14,"random_good_of_age_24h":10},"SpaceAgeMars":{"happiness":12040,"strategy_points_24h":14,"random_good_of_age_24h":10},"SpaceAgeAsteroidBelt":{"happiness":13090,"strategy_points_24h":14,"random_good_of_age_24h":10},"SpaceAgeVenus":{"happiness":14140,"strategy_points_24h":14,"random_good_of_age_24h":10},"SpaceAgeJupiterMoon":{"happiness":15230,"strategy_points_24h":14,"random_good_of_age_24h":10},"SpaceAgeTitan":{"happiness":16405,"strategy_points_24h":14,"random_good_of_age_24h":10},"SpaceAgeSpaceHub":{"happiness":17580,"strategy_points_24h":14,"random_good_of_age_24h":10}}, boosts: [{"type":"att_boost_attacker","value":4,"feature":"all"},{"type":"def_boost_attacker","value":21,"feature":"all"}] },
+    "W_MultiAge_WIN22A12b": { prod: {"BronzeAge":{"happiness":760,"strategy_points_24h":28,"random_good_of_age_24h":20},"IronAge":{"happiness":1300,"strategy_points_24h":28,"random_good_of_age_24h":20},"EarlyMiddleAge":{"happiness":1430,"strategy_points_24h":28,"random_good_of_age_24h":20},"HighMiddleAge":{"happiness":1600,"strategy_points_24h":28,"random_good_of_age_24h":20},"LateMiddleAge":{"happiness":1800,"strategy_points_24h":28,"random_good_of_age_24h":20},"ColonialAge":{"happiness":2110,"strategy_points_24h":28,"random_good_of_age_24h":20},"IndustrialAge":{"happiness":2390,"strategy_points_24h":28,"random_good_of_age_24h":20},"ProgressiveEra":{"happiness":2620,"strategy_points_24h":28,"random_good_of_age_24h":20},"ModernEra":{"happiness":2790,"strategy_points_24h":28,"random_good_of_age_24h":20},"PostModernEra":{"happiness":2900,"strategy_points_24h":28,"random_good_of_age_24h":20},"ContemporaryEra":{"happiness":3380,"strategy_points_24h":28,"random_good_of_age_24h":20},"TomorrowEra":{"happiness":4100,"strategy_points_24h":28,"random_good_of_age_24h":20},"FutureEra":{"happiness":4930,"strategy_points_24h":28,"random_good_of_age_24h":20},"ArcticFuture":{"happiness":5730,"strategy_points_24h":28,"random_good_of_age_24h":20},"OceanicFuture":{"happiness":6610,"strategy_points_24h":28,"random_good_of_age_24h":20},"VirtualFuture":{"happiness":7910,"strategy_points_24h":28,"random_good_of_age_24h":20},"SpaceAgeMars":{"happiness":12640,"strategy_points_24h":28,"random_good_of_age_24h":20},"SpaceAgeAsteroidBelt":{"happiness":13750,"strategy_points_24h":28,"random_good_of_age_24h":20},"SpaceAgeVenus":{"happiness":14850,"strategy_points_24h":28,"random_good_of_age_24h":20},"SpaceAgeJupiterMoon":{"happiness":15990,"strategy_points_24h":28,"random_good_of_age_24h":20},"SpaceAgeTitan":{"happiness":17219,"strategy_points_24h":28,"random_good_of_age_24h":20},"SpaceAgeSpaceHub":{"happiness":18448,"strategy_points_24h":28,"random_good_of_age_24h":20}}, boosts: [{"type":"att_boost_attacker","value":8,"feature":"all"},{"type":"def_boost_attacker","value":33,"feature":"all"},{"type":"att_boost_defender","value":16,"feature":"all"},{"type":"def_boost_defender","value":6,"feature":"all"}] },
+    "W_MultiAge_WIN25A9": { prod: {"BronzeAge":{"happiness":2980,"supplies_24h":2520,"strategy_points_24h":180},"IronAge":{"happiness":5130,"supplies_24h":6050,"strategy_points_24h":180},"EarlyMiddleAge":{"happiness":5670,"supplies_24h":10080,"strategy_points_24h":180},"HighMiddleAge":{"happiness":6330,"supplies_24h":14120,"strategy_points_24h":180},"LateMiddleAge":{"happiness":7060,"supplies_24h":18660,"strategy_points_24h":180},"ColonialAge":{"happiness":8300,"supplies_24h":23700,"strategy_points_24h":180},"IndustrialAge":{"happiness":9360,"supplies_24h":28740,"strategy_points_24h":180},"ProgressiveEra":{"happiness":10280,"supplies_24h":33780,"strategy_points_24h":180},"ModernEra":{"happiness":10990,"supplies_24h":39330,"strategy_points_24h":180},"PostModernEra":{"happiness":11450,"supplies_24h":44870,"strategy_points_24h":180},"ContemporaryEra":{"happiness":13310,"supplies_24h":50420,"strategy_points_24h":180},"TomorrowEra":{"happiness":16160,"supplies_24h":56470,"strategy_points_24h":180},"FutureEra":{"happiness":19360,"supplies_24h":62020,"strategy_points_24h":180},"ArcticFuture":{"happiness":22540,"supplies_24h":68070,"strategy_points_24h":180},"OceanicFuture":{"happiness":26010,"supplies_24h":74620,"strategy_points_24h":180},"VirtualFuture":{"happiness":31080,"supplies_24h":80670,"strategy_points_24h":180},"SpaceAgeMars":{"happiness":49720,"supplies_24h":130590,"strategy_points_24h":180},"SpaceAgeAsteroidBelt":{"happiness":54040,"supplies_24h":140170,"strategy_points_24h":180},"SpaceAgeVenus":{"happiness":58380,"supplies_24h":150250,"strategy_points_24h":180},"SpaceAgeJupiterMoon":{"happiness":62890,"supplies_24h":159830,"strategy_points_24h":180},"SpaceAgeTitan":{"happiness":67440,"supplies_24h":169920,"strategy_points_24h":180},"SpaceAgeSpaceHub":{"happiness":72000,"supplies_24h":180000,"strategy_points_24h":180}}, boosts: [{"type":"att_def_boost_defender","value":39,"feature":"all"},{"type":"att_def_boost_defender","value":96,"feature":"battleground"}] },
+    "W_MultiAge_WIN24E1": { prod: {"AllAge":{"all_goods_of_age_24h":120,"strategy_points_24h":120,"all_goods_of_previous_age_24h":240,"random_special_good_up_to_age_24h":120}}, boosts: [{"type":"att_def_boost_defender","value":25,"feature":"guild_raids"}] },
+    "W_MultiAge_WIN23D1": { prod: {"AllAge":{"strategy_points_24h":36,"all_goods_of_age_24h":25,"random_good_of_previous_age_24h":24}}, boosts: [{"type":"att_boost_attacker","value":44,"feature":"all"},{"type":"def_boost_attacker","value":60,"feature":"all"},{"type":"att_boost_defender","value":57,"feature":"all"}] },
+    "W_MultiAge_WIN23F1": { prod: {"BronzeAge":{"population":-166,"happiness":-1620,"strategy_points_24h":3},"IronAge":{"population":-355,"happiness":-2790,"strategy_points_24h":3},"EarlyMiddleAge":{"population":-545,"happiness":-3090,"strategy_points_24h":3},"HighMiddleAge":{"population":-765,"happiness":-3440,"strategy_points_24h":3},"LateMiddleAge":{"population":-1004,"happiness":-3840,"strategy_points_24h":3},"ColonialAge":{"population":-1267,"happiness":-4520,"strategy_points_24h":4},"IndustrialAge":{"population":-1549,"happiness":-5090,"strategy_points_24h":4},"ProgressiveEra":{"population":-1849,"happiness":-5590,"strategy_points_24h":4},"ModernEra":{"population":-2167,"happiness":-5980,"strategy_points_24h":5},"PostModernEra":{"population":-2497,"happiness":-6230,"strategy_points_24h":5},"ContemporaryEra":{"population":-2846,"happiness":-7240,"strategy_points_24h":5},"TomorrowEra":{"population":-3207,"happiness":-8790,"strategy_points_24h":6},"FutureEra":{"population":-3587,"happiness":-10530,"strategy_points_24h":6},"ArcticFuture":{"population":-3978,"happiness":-12260,"strategy_points_24h":6},"OceanicFuture":{"population":-4382,"happiness":-14150,"strategy_points_24h":7},"VirtualFuture":{"population":-4799,"happiness":-16900,"strategy_points_24h":7},"SpaceAgeMars":{"population":-7595,"happiness":-27040,"strategy_points_24h":7},"SpaceAgeAsteroidBelt":{"population":-8250,"happiness":-29380,"strategy_points_24h":8},"SpaceAgeVenus":{"population":-8917,"happiness":-31740,"strategy_points_24h":8},"SpaceAgeJupiterMoon":{"population":-9603,"happiness":-34190,"strategy_points_24h":8},"SpaceAgeTitan":{"population":-10300,"happiness":-36670,"strategy_points_24h":9},"SpaceAgeSpaceHub":{"population":-10997,"happiness":-39150,"strategy_points_24h":9}}, boosts: [{"type":"att_boost_attacker","value":12,"feature":"all"},{"type":"att_boost_defender","value":4,"feature":"all"},{"type":"def_boost_defender","value":9,"feature":"all"}] },
+    "W_MultiAge_WIN25A8": { prod: {"BronzeAge":{"happiness":2680,"supplies_24h":2270,"strategy_points_24h":162},"IronAge":{"happiness":4620,"supplies_24h":5450,"strategy_points_24h":162},"EarlyMiddleAge":{"happiness":5100,"supplies_24h":9080,"strategy_points_24h":162},"HighMiddleAge":{"happiness":5690,"supplies_24h":12710,"strategy_points_24h":162},"LateMiddleAge":{"happiness":6350,"supplies_24h":16790,"strategy_points_24h":162},"ColonialAge":{"happiness":7470,"supplies_24h":21330,"strategy_points_24h":162},"IndustrialAge":{"happiness":8420,"supplies_24h":25870,"strategy_points_24h":162},"ProgressiveEra":{"happiness":9250,"supplies_24h":30400,"strategy_points_24h":162},"ModernEra":{"happiness":9890,"supplies_24h":35390,"strategy_points_24h":162},"PostModernEra":{"happiness":10310,"supplies_24h":40390,"strategy_points_24h":162},"ContemporaryEra":{"happiness":11980,"supplies_24h":45380,"strategy_points_24h":162},"TomorrowEra":{"happiness":14540,"supplies_24h":50820,"strategy_points_24h":162},"FutureEra":{"happiness":17420,"supplies_24h":55820,"strategy_points_24h":162},"ArcticFuture":{"happiness":20290,"supplies_24h":61260,"strategy_points_24h":162},"OceanicFuture":{"happiness":23410,"supplies_24h":67160,"strategy_points_24h":162},"VirtualFuture":{"happiness":27970,"supplies_24h":72610,"strategy_points_24h":162},"SpaceAgeMars":{"happiness":44750,"supplies_24h":117530,"strategy_points_24h":162},"SpaceAgeAsteroidBelt":{"happiness":48630,"supplies_24h":126150,"strategy_points_24h":162},"SpaceAgeVenus":{"happiness":52540,"supplies_24h":135230,"strategy_points_24h":162},"SpaceAgeJupiterMoon":{"happiness":56600,"supplies_24h":143850,"strategy_points_24h":162},"SpaceAgeTitan":{"happiness":60700,"supplies_24h":152920,"strategy_points_24h":162},"SpaceAgeSpaceHub":{"happiness":64800,"supplies_24h":162000,"strategy_points_24h":162}}, boosts: [{"type":"att_def_boost_defender","value":34,"feature":"all"},{"type":"att_def_boost_defender","value":86,"feature":"battleground"}] },
+    "W_MultiAge_WIN23A12": { prod: {"BronzeAge":{"population":238,"demandHappiness":238,"supplies_24h":2000,"strategy_points_24h":16,"random_good_of_age_24h":45,"units_24h":12},"IronAge":{"population":511,"demandHappiness":511,"supplies_24h":4800,"strategy_points_24h":16,"random_good_of_age_24h":45,"units_24h":12},"EarlyMiddleAge":{"population":784,"demandHappiness":784,"supplies_24h":8000,"strategy_points_24h":16,"random_good_of_age_24h":45,"units_24h":12},"HighMiddleAge":{"population":1100,"demandHappiness":1100,"supplies_24h":11200,"strategy_points_24h":16,"random_good_of_age_24h":45,"units_24h":12},"LateMiddleAge":{"population":1444,"demandHappiness":1444,"supplies_24h":14800,"strategy_points_24h":16,"random_good_of_age_24h":45,"units_24h":12},"ColonialAge":{"population":1822,"demandHappiness":1822,"supplies_24h":18800,"strategy_points_24h":16,"random_good_of_age_24h":45,"units_24h":12},"IndustrialAge":{"population":2227,"demandHappiness":2227,"supplies_24h":22800,"strategy_points_24h":16,"random_good_of_age_24h":45,"units_24h":12},"ProgressiveEra":{"population":2658,"demandHappiness":2658,"supplies_24h":26800,"strategy_points_24h":16,"random_good_of_age_24h":45,"units_24h":12},"ModernEra":{"population":3116,"demandHappiness":3116,"supplies_24h":31200,"strategy_points_24h":16,"random_good_of_age_24h":45,"units_24h":12},"PostModernEra":{"population":3591,"demandHappiness":3591,"supplies_24h":35600,"strategy_points_24h":16,"random_good_of_age_24h":45,"units_24h":12},"ContemporaryEra":{"population":4092,"demandHappiness":4092,"supplies_24h":40000,"strategy_points_24h":16,"random_good_of_age_24h":45,"units_24h":12},"TomorrowEra":{"population":4612,"demandHappiness":4612,"supplies_24h":44800,"strategy_points_24h":16,"random_good_of_age_24h":45,"units_24h":12},"FutureEra":{"population":5157,"demandHappiness":5157,"supplies_24h":49200,"strategy_points_24h":17,"random_good_of_age_24h":46,"units_24h":12},"ArcticFuture":{"population":5720,"demandHappiness":5720,"supplies_24h":54000,"strategy_points_24h":17,"random_good_of_age_24h":46,"units_24h":12},"OceanicFuture":{"population":6301,"demandHappiness":6301,"supplies_24h":59200,"strategy_points_24h":17,"random_good_of_age_24h":46,"units_24h":12},"VirtualFuture":{"population":6900,"demandHappiness":6900,"supplies_24h":64000,"strategy_points_24h":17,"random_good_of_age_24h":46,"units_24h":12},"SpaceAgeMars":{"population":10921,"demandHappiness":10921,"supplies_24h":103600,"strategy_points_24h":18,"random_good_of_age_24h":47,"units_24h":12},"SpaceAgeAsteroidBelt":{"population":11863,"demandHappiness":11863,"supplies_24h":111200,"strategy_points_24h":18,"random_good_of_age_24h":47,"units_24h":12},"SpaceAgeVenus":{"population":12822,"demandHappiness":12822,"supplies_24h":119200,"strategy_points_24h":18,"random_good_of_age_24h":47,"units_24h":12},"SpaceAgeJupiterMoon":{"population":13808,"demandHappiness":13808,"supplies_24h":126800,"strategy_points_24h":18,"random_good_of_age_24h":47,"units_24h":12},"SpaceAgeTitan":{"population":14811,"demandHappiness":14811,"supplies_24h":134800,"strategy_points_24h":19,"random_good_of_age_24h":48,"units_24h":12},"SpaceAgeSpaceHub":{"population":15814,"demandHappiness":15814,"supplies_24h":142800,"strategy_points_24h":19,"random_good_of_age_24h":48,"units_24h":12}}, boosts: [{"type":"att_boost_attacker","value":26,"feature":"all"},{"type":"att_boost_attacker","value":5,"feature":"battleground"},{"type":"att_boost_defender","value":29,"feature":"all"},{"type":"att_boost_defender","value":9,"feature":"guild_expedition"}] },
+    "W_MultiAge_WIN25E1": { prod: {"AllAge":{"strategy_points_24h":495}}, boosts: [{"type":"att_def_boost_attacker_defender","value":110,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":240,"feature":"battleground"},{"type":"att_def_boost_attacker_defender","value":25,"feature":"guild_raids"}] },
+    "W_MultiAge_WIN24D1": { prod: {"BronzeAge":{"happiness":2210,"medals_24h":1210},"IronAge":{"happiness":3800,"medals_24h":1550},"EarlyMiddleAge":{"happiness":4200,"medals_24h":1900},"HighMiddleAge":{"happiness":4690,"medals_24h":2240},"LateMiddleAge":{"happiness":5230,"medals_24h":2590},"ColonialAge":{"happiness":6150,"medals_24h":3100},"IndustrialAge":{"happiness":6940,"medals_24h":4310},"ProgressiveEra":{"happiness":7620,"medals_24h":6030},"ModernEra":{"happiness":8150,"medals_24h":8620},"PostModernEra":{"happiness":8490,"medals_24h":12070},"ContemporaryEra":{"happiness":9870,"medals_24h":17240},"TomorrowEra":{"happiness":11980,"medals_24h":23280},"FutureEra":{"happiness":14350,"medals_24h":28450},"ArcticFuture":{"happiness":16710,"medals_24h":34480},"OceanicFuture":{"happiness":19280,"medals_24h":39660},"VirtualFuture":{"happiness":23040,"medals_24h":48280},"SpaceAgeMars":{"happiness":36860,"medals_24h":58620},"SpaceAgeAsteroidBelt":{"happiness":40060,"medals_24h":68970},"SpaceAgeVenus":{"happiness":43280,"medals_24h":79310},"SpaceAgeJupiterMoon":{"happiness":46620,"medals_24h":89660},"SpaceAgeTitan":{"happiness":50000,"medals_24h":100000},"SpaceAgeSpaceHub":{"happiness":53380,"medals_24h":110340}}, boosts: [{"type":"att_def_boost_attacker","value":32,"feature":"all"},{"type":"att_def_boost_attacker","value":25,"feature":"guild_raids"},{"type":"att_def_boost_defender","value":32,"feature":"all"},{"type":"medal_production","value":25,"feature":"all"},{"type":"goods_production","value":1,"feature":"all"}] },
+    "W_MultiAge_WIN21B1": { prod: {"BronzeAge":{"happiness":200},"IronAge":{"happiness":280},"EarlyMiddleAge":{"happiness":330},"HighMiddleAge":{"happiness":420},"LateMiddleAge":{"happiness":480},"ColonialAge":{"happiness":570},"IndustrialAge":{"happiness":640},"ProgressiveEra":{"happiness":700},"ModernEra":{"happiness":800},"PostModernEra":{"happiness":910},"ContemporaryEra":{"happiness":1060},"TomorrowEra":{"happiness":1320},"FutureEra":{"happiness":1580},"ArcticFuture":{"happiness":1790},"OceanicFuture":{"happiness":2010},"VirtualFuture":{"happiness":2540},"SpaceAgeMars":{"happiness":3950},"SpaceAgeAsteroidBelt":{"happiness":4290},"SpaceAgeVenus":{"happiness":4640},"SpaceAgeJupiterMoon":{"happiness":5000},"SpaceAgeTitan":{"happiness":5360},"SpaceAgeSpaceHub":{"happiness":5730}} },
+    "W_MultiAge_WIN21B2": { prod: {"BronzeAge":{"happiness":410},"IronAge":{"happiness":710},"EarlyMiddleAge":{"happiness":790},"HighMiddleAge":{"happiness":880},"LateMiddleAge":{"happiness":980},"ColonialAge":{"happiness":1150},"IndustrialAge":{"happiness":1300},"ProgressiveEra":{"happiness":1430},"ModernEra":{"happiness":1530},"PostModernEra":{"happiness":1590},"ContemporaryEra":{"happiness":1850},"TomorrowEra":{"happiness":2240},"FutureEra":{"happiness":2690},"ArcticFuture":{"happiness":3130},"OceanicFuture":{"happiness":3610},"VirtualFuture":{"happiness":4320},"SpaceAgeMars":{"happiness":6910},"SpaceAgeAsteroidBelt":{"happiness":7500},"SpaceAgeVenus":{"happiness":8110},"SpaceAgeJupiterMoon":{"happiness":8730},"SpaceAgeTitan":{"happiness":9370},"SpaceAgeSpaceHub":{"happiness":10000}} },
+    "W_MultiAge_WIN24C1": { prod: {"AllAge":{"strategy_points_24h":15},"BronzeAge":{"population":-190},"IronAge":{"population":-410},"EarlyMiddleAge":{"population":-630},"HighMiddleAge":{"population":-890},"LateMiddleAge":{"population":-1170},"ColonialAge":{"population":-1480},"IndustrialAge":{"population":-1800},"ProgressiveEra":{"population":-2150},"ModernEra":{"population":-2520},"PostModernEra":{"population":-2910},"ContemporaryEra":{"population":-3320},"TomorrowEra":{"population":-3740},"FutureEra":{"population":-4180},"ArcticFuture":{"population":-4630},"OceanicFuture":{"population":-5110},"VirtualFuture":{"population":-5590},"SpaceAgeMars":{"population":-8850},"SpaceAgeAsteroidBelt":{"population":-9610},"SpaceAgeVenus":{"population":-10390},"SpaceAgeJupiterMoon":{"population":-11190},"SpaceAgeTitan":{"population":-12000},"SpaceAgeSpaceHub":{"population":-12810}}, boosts: [{"type":"att_def_boost_attacker","value":8,"feature":"all"},{"type":"att_def_boost_attacker","value":8,"feature":"battleground"}] },
+    "W_MultiAge_WIN18B1": { prod: {"BronzeAge":{"population":-10},"IronAge":{"population":-30},"EarlyMiddleAge":{"population":-40},"HighMiddleAge":{"population":-50},"LateMiddleAge":{"population":-70},"ColonialAge":{"population":-80},"IndustrialAge":{"population":-90},"ProgressiveEra":{"population":-100},"ModernEra":{"population":-110},"PostModernEra":{"population":-120},"ContemporaryEra":{"population":-130},"TomorrowEra":{"population":-140},"FutureEra":{"population":-160},"ArcticFuture":{"population":-170},"OceanicFuture":{"population":-180},"VirtualFuture":{"population":-190},"SpaceAgeMars":{"population":-290},"SpaceAgeAsteroidBelt":{"population":-310},"SpaceAgeVenus":{"population":-320},"SpaceAgeJupiterMoon":{"population":-330},"SpaceAgeTitan":{"population":-350},"SpaceAgeSpaceHub":{"population":-360}} },
+    "W_MultiAge_WIN18B2": { prod: {"BronzeAge":{"population":-290},"IronAge":{"population":-620},"EarlyMiddleAge":{"population":-950},"HighMiddleAge":{"population":-1340},"LateMiddleAge":{"population":-1750},"ColonialAge":{"population":-2210},"IndustrialAge":{"population":-2710},"ProgressiveEra":{"population":-3230},"ModernEra":{"population":-3790},"PostModernEra":{"population":-4360},"ContemporaryEra":{"population":-4970},"TomorrowEra":{"population":-5600},"FutureEra":{"population":-6270},"ArcticFuture":{"population":-6950},"OceanicFuture":{"population":-7660},"VirtualFuture":{"population":-8390},"SpaceAgeMars":{"population":-13270},"SpaceAgeAsteroidBelt":{"population":-14420},"SpaceAgeVenus":{"population":-15580},"SpaceAgeJupiterMoon":{"population":-16780},"SpaceAgeTitan":{"population":-18000},"SpaceAgeSpaceHub":{"population":-19220}}, boosts: [{"type":"att_def_boost_attacker","value":8,"feature":"all"},{"type":"att_def_boost_attacker","value":8,"feature":"battleground"}] },
+    "W_MultiAge_WIN22A11a": { prod: {"BronzeAge":{"happiness":720,"strategy_points_24h":4,"random_good_of_age_24h":32},"IronAge":{"happiness":1240,"strategy_points_24h":4,"random_good_of_age_24h":32},"EarlyMiddleAge":{"happiness":1370,"strategy_points_24h":4,"random_good_of_age_24h":32},"HighMiddleAge":{"happiness":1530,"strategy_points_24h":4,"random_good_of_age_24h":32},"LateMiddleAge":{"happiness":1710,"strategy_points_24h":4,"random_good_of_age_24h":32},"ColonialAge":{"happiness":2010,"strategy_points_24h":4,"random_good_of_age_24h":32},"IndustrialAge":{"happiness":2270,"strategy_points_24h":4,"random_good_of_age_24h":32},"ProgressiveEra":{"happiness":2490,"strategy_points_24h":4,"random_good_of_age_24h":32},"ModernEra":{"happiness":2660,"strategy_points_24h":4,"random_good_of_age_24h":32},"PostModernEra":{"happiness":2770,"strategy_points_24h":4,"random_good_of_age_24h":32},"ContemporaryEra":{"happiness":3220,"strategy_points_24h":4,"random_good_of_age_24h":32},"TomorrowEra":{"happiness":3910,"strategy_points_24h":4,"random_good_of_age_24h":32},"FutureEra":{"happiness":4690,"strategy_points_24h":4,"random_good_of_age_24h":32},"ArcticFuture":{"happiness":5460,"strategy_points_24h":4,"random_good_of_age_24h":32},"OceanicFuture":{"happiness":6300,"strategy_points_24h":4,"random_good_of_age_24h":32},"VirtualFuture":{"happiness":7530,"strategy_points_24h":4,"random_good_of_age_24h":32},"SpaceAgeMars":{"happiness":12040,"strategy_points_24h":4,"random_good_of_age_24h":32},"SpaceAgeAsteroidBelt":{"happiness":13090,"strategy_points_24h":4,"random_good_of_age_24h":32},"SpaceAgeVenus":{"happiness":14140,"strategy_points_24h":4,"random_good_of_age_24h":32},"SpaceAgeJupiterMoon":{"happiness":15230,"strategy_points_24h":4,"random_good_of_age_24h":32},"SpaceAgeTitan":{"happiness":16405,"strategy_points_24h":4,"random_good_of_age_24h":32},"SpaceAgeSpaceHub":{"happiness":17580,"strategy_points_24h":4,"random_good_of_age_24h":32}}, boosts: [{"type":"att_boost_attacker","value":16,"feature":"all"},{"type":"def_boost_attacker","value":5,"feature":"all"}] },
+    "W_MultiAge_WIN22A12a": { prod: {"BronzeAge":{"happiness":760,"strategy_points_24h":8,"random_good_of_age_24h":64},"IronAge":{"happiness":1300,"strategy_points_24h":8,"random_good_of_age_24h":64},"EarlyMiddleAge":{"happiness":1430,"strategy_points_24h":8,"random_good_of_age_24h":64},"HighMiddleAge":{"happiness":1600,"strategy_points_24h":8,"random_good_of_age_24h":64},"LateMiddleAge":{"happiness":1800,"strategy_points_24h":8,"random_good_of_age_24h":64},"ColonialAge":{"happiness":2110,"strategy_points_24h":8,"random_good_of_age_24h":64},"IndustrialAge":{"happiness":2390,"strategy_points_24h":8,"random_good_of_age_24h":64},"ProgressiveEra":{"happiness":2620,"strategy_points_24h":8,"random_good_of_age_24h":64},"ModernEra":{"happiness":2790,"strategy_points_24h":8,"random_good_of_age_24h":64},"PostModernEra":{"happiness":2900,"strategy_points_24h":8,"random_good_of_age_24h":64},"ContemporaryEra":{"happiness":3380,"strategy_points_24h":8,"random_good_of_age_24h":64},"TomorrowEra":{"happiness":4100,"strategy_points_24h":8,"random_good_of_age_24h":64},"FutureEra":{"happiness":4930,"strategy_points_24h":8,"random_good_of_age_24h":64},"ArcticFuture":{"happiness":5730,"strategy_points_24h":8,"random_good_of_age_24h":64},"OceanicFuture":{"happiness":6610,"strategy_points_24h":8,"random_good_of_age_24h":64},"VirtualFuture":{"happiness":7910,"strategy_points_24h":8,"random_good_of_age_24h":64},"SpaceAgeMars":{"happiness":12640,"strategy_points_24h":8,"random_good_of_age_24h":64},"SpaceAgeAsteroidBelt":{"happiness":13750,"strategy_points_24h":8,"random_good_of_age_24h":64},"SpaceAgeVenus":{"happiness":14850,"strategy_points_24h":8,"random_good_of_age_24h":64},"SpaceAgeJupiterMoon":{"happiness":15990,"strategy_points_24h":8,"random_good_of_age_24h":64},"SpaceAgeTitan":{"happiness":17219,"strategy_points_24h":8,"random_good_of_age_24h":64},"SpaceAgeSpaceHub":{"happiness":18448,"strategy_points_24h":8,"random_good_of_age_24h":64}}, boosts: [{"type":"att_boost_attacker","value":28,"feature":"all"},{"type":"def_boost_attacker","value":9,"feature":"all"},{"type":"att_boost_defender","value":5,"feature":"all"},{"type":"def_boost_defender","value":23,"feature":"all"}] },
+    "W_MultiAge_WIN19D1": { prod: {"BronzeAge":{"happiness":200},"IronAge":{"happiness":280},"EarlyMiddleAge":{"happiness":330},"HighMiddleAge":{"happiness":420},"LateMiddleAge":{"happiness":480},"ColonialAge":{"happiness":570},"IndustrialAge":{"happiness":640},"ProgressiveEra":{"happiness":700},"ModernEra":{"happiness":800},"PostModernEra":{"happiness":910},"ContemporaryEra":{"happiness":1060},"TomorrowEra":{"happiness":1320},"FutureEra":{"happiness":1580},"ArcticFuture":{"happiness":1790},"OceanicFuture":{"happiness":2010},"VirtualFuture":{"happiness":2540},"SpaceAgeMars":{"happiness":3950},"SpaceAgeAsteroidBelt":{"happiness":4290},"SpaceAgeVenus":{"happiness":4640},"SpaceAgeJupiterMoon":{"happiness":5000},"SpaceAgeTitan":{"happiness":5360},"SpaceAgeSpaceHub":{"happiness":5730}} },
+    "W_MultiAge_WIN19D2": { prod: {"BronzeAge":{"happiness":410},"IronAge":{"happiness":710},"EarlyMiddleAge":{"happiness":790},"HighMiddleAge":{"happiness":880},"LateMiddleAge":{"happiness":980},"ColonialAge":{"happiness":1150},"IndustrialAge":{"happiness":1300},"ProgressiveEra":{"happiness":1430},"ModernEra":{"happiness":1530},"PostModernEra":{"happiness":1590},"ContemporaryEra":{"happiness":1850},"TomorrowEra":{"happiness":2240},"FutureEra":{"happiness":2690},"ArcticFuture":{"happiness":3130},"OceanicFuture":{"happiness":3610},"VirtualFuture":{"happiness":4320},"SpaceAgeMars":{"happiness":6910},"SpaceAgeAsteroidBelt":{"happiness":7500},"SpaceAgeVenus":{"happiness":8110},"SpaceAgeJupiterMoon":{"happiness":8730},"SpaceAgeTitan":{"happiness":9370},"SpaceAgeSpaceHub":{"happiness":10000}} },
+    "W_MultiAge_WIN23A1": { prod: {"BronzeAge":{"population":96,"demandHappiness":96,"supplies_24h":700},"IronAge":{"population":205,"demandHappiness":205,"supplies_24h":1600},"EarlyMiddleAge":{"population":314,"demandHappiness":314,"supplies_24h":2700},"HighMiddleAge":{"population":440,"demandHappiness":440,"supplies_24h":3800},"LateMiddleAge":{"population":578,"demandHappiness":578,"supplies_24h":5000},"ColonialAge":{"population":729,"demandHappiness":729,"supplies_24h":6400},"IndustrialAge":{"population":891,"demandHappiness":891,"supplies_24h":7800},"ProgressiveEra":{"population":1064,"demandHappiness":1064,"supplies_24h":9100},"ModernEra":{"population":1247,"demandHappiness":1247,"supplies_24h":10600},"PostModernEra":{"population":1437,"demandHappiness":1437,"supplies_24h":12100},"ContemporaryEra":{"population":1637,"demandHappiness":1637,"supplies_24h":13600},"TomorrowEra":{"population":1845,"demandHappiness":1845,"supplies_24h":15200},"FutureEra":{"population":2063,"demandHappiness":2063,"supplies_24h":16700},"ArcticFuture":{"population":2288,"demandHappiness":2288,"supplies_24h":18400},"OceanicFuture":{"population":2521,"demandHappiness":2521,"supplies_24h":20100},"VirtualFuture":{"population":2760,"demandHappiness":2760,"supplies_24h":21800},"SpaceAgeMars":{"population":4369,"demandHappiness":4369,"supplies_24h":35200},"SpaceAgeAsteroidBelt":{"population":4745,"demandHappiness":4745,"supplies_24h":37800},"SpaceAgeVenus":{"population":5129,"demandHappiness":5129,"supplies_24h":40500},"SpaceAgeJupiterMoon":{"population":5523,"demandHappiness":5523,"supplies_24h":43100},"SpaceAgeTitan":{"population":5925,"demandHappiness":5925,"supplies_24h":45800},"SpaceAgeSpaceHub":{"population":6327,"demandHappiness":6327,"supplies_24h":48500}} },
+    "W_MultiAge_WIN23A10": { prod: {"BronzeAge":{"population":212,"demandHappiness":212,"supplies_24h":1800,"strategy_points_24h":10,"random_good_of_age_24h":13,"units_24h":10},"IronAge":{"population":455,"demandHappiness":455,"supplies_24h":4200,"strategy_points_24h":10,"random_good_of_age_24h":13,"units_24h":10},"EarlyMiddleAge":{"population":698,"demandHappiness":698,"supplies_24h":7000,"strategy_points_24h":10,"random_good_of_age_24h":13,"units_24h":10},"HighMiddleAge":{"population":980,"demandHappiness":980,"supplies_24h":9900,"strategy_points_24h":10,"random_good_of_age_24h":13,"units_24h":10},"LateMiddleAge":{"population":1286,"demandHappiness":1286,"supplies_24h":13000,"strategy_points_24h":10,"random_good_of_age_24h":13,"units_24h":10},"ColonialAge":{"population":1623,"demandHappiness":1623,"supplies_24h":16500,"strategy_points_24h":10,"random_good_of_age_24h":13,"units_24h":10},"IndustrialAge":{"population":1984,"demandHappiness":1984,"supplies_24h":20100,"strategy_points_24h":10,"random_good_of_age_24h":13,"units_24h":10},"ProgressiveEra":{"population":2368,"demandHappiness":2368,"supplies_24h":23600,"strategy_points_24h":10,"random_good_of_age_24h":13,"units_24h":10},"ModernEra":{"population":2776,"demandHappiness":2776,"supplies_24h":27500,"strategy_points_24h":10,"random_good_of_age_24h":13,"units_24h":10},"PostModernEra":{"population":3199,"demandHappiness":3199,"supplies_24h":31300,"strategy_points_24h":10,"random_good_of_age_24h":13,"units_24h":10},"ContemporaryEra":{"population":3646,"demandHappiness":3646,"supplies_24h":35200,"strategy_points_24h":10,"random_good_of_age_24h":13,"units_24h":10},"TomorrowEra":{"population":4109,"demandHappiness":4109,"supplies_24h":39400,"strategy_points_24h":10,"random_good_of_age_24h":13,"units_24h":10},"FutureEra":{"population":4595,"demandHappiness":4595,"supplies_24h":43300,"strategy_points_24h":11,"random_good_of_age_24h":14,"units_24h":10},"ArcticFuture":{"population":5096,"demandHappiness":5096,"supplies_24h":47500,"strategy_points_24h":11,"random_good_of_age_24h":14,"units_24h":10},"OceanicFuture":{"population":5614,"demandHappiness":5614,"supplies_24h":52100,"strategy_points_24h":11,"random_good_of_age_24h":14,"units_24h":10},"VirtualFuture":{"population":6147,"demandHappiness":6147,"supplies_24h":56300,"strategy_points_24h":11,"random_good_of_age_24h":14,"units_24h":10},"SpaceAgeMars":{"population":9730,"demandHappiness":9730,"supplies_24h":91200,"strategy_points_24h":12,"random_good_of_age_24h":15,"units_24h":10},"SpaceAgeAsteroidBelt":{"population":10569,"demandHappiness":10569,"supplies_24h":97900,"strategy_points_24h":12,"random_good_of_age_24h":15,"units_24h":10},"SpaceAgeVenus":{"population":11423,"demandHappiness":11423,"supplies_24h":104900,"strategy_points_24h":12,"random_good_of_age_24h":15,"units_24h":10},"SpaceAgeJupiterMoon":{"population":12301,"demandHappiness":12301,"supplies_24h":111600,"strategy_points_24h":12,"random_good_of_age_24h":15,"units_24h":10},"SpaceAgeTitan":{"population":13195,"demandHappiness":13195,"supplies_24h":118600,"strategy_points_24h":13,"random_good_of_age_24h":16,"units_24h":10},"SpaceAgeSpaceHub":{"population":14089,"demandHappiness":14089,"supplies_24h":125600,"strategy_points_24h":13,"random_good_of_age_24h":16,"units_24h":10}}, boosts: [{"type":"att_boost_attacker","value":22,"feature":"all"},{"type":"att_boost_defender","value":23,"feature":"all"}] },
+    "W_MultiAge_WIN23A2": { prod: {"BronzeAge":{"population":108,"demandHappiness":108,"supplies_24h":800},"IronAge":{"population":232,"demandHappiness":232,"supplies_24h":1900},"EarlyMiddleAge":{"population":356,"demandHappiness":356,"supplies_24h":3200},"HighMiddleAge":{"population":500,"demandHappiness":500,"supplies_24h":4500},"LateMiddleAge":{"population":656,"demandHappiness":656,"supplies_24h":5900},"ColonialAge":{"population":828,"demandHappiness":828,"supplies_24h":7500},"IndustrialAge":{"population":1012,"demandHappiness":1012,"supplies_24h":9100},"ProgressiveEra":{"population":1208,"demandHappiness":1208,"supplies_24h":10700},"ModernEra":{"population":1416,"demandHappiness":1416,"supplies_24h":12500},"PostModernEra":{"population":1632,"demandHappiness":1632,"supplies_24h":14200},"ContemporaryEra":{"population":1860,"demandHappiness":1860,"supplies_24h":16000},"TomorrowEra":{"population":2096,"demandHappiness":2096,"supplies_24h":17900},"FutureEra":{"population":2344,"demandHappiness":2344,"supplies_24h":19700},"ArcticFuture":{"population":2600,"demandHappiness":2600,"supplies_24h":21600},"OceanicFuture":{"population":2864,"demandHappiness":2864,"supplies_24h":23700},"VirtualFuture":{"population":3136,"demandHappiness":3136,"supplies_24h":25600},"SpaceAgeMars":{"population":4964,"demandHappiness":4964,"supplies_24h":41400},"SpaceAgeAsteroidBelt":{"population":5392,"demandHappiness":5392,"supplies_24h":44500},"SpaceAgeVenus":{"population":5828,"demandHappiness":5828,"supplies_24h":47700},"SpaceAgeJupiterMoon":{"population":6276,"demandHappiness":6276,"supplies_24h":50700},"SpaceAgeTitan":{"population":6732,"demandHappiness":6732,"supplies_24h":53900},"SpaceAgeSpaceHub":{"population":7188,"demandHappiness":7188,"supplies_24h":57100}} },
+    "W_MultiAge_WIN23A3": { prod: {"BronzeAge":{"population":121,"demandHappiness":121,"supplies_24h":900,"strategy_points_24h":1},"IronAge":{"population":260,"demandHappiness":260,"supplies_24h":2200,"strategy_points_24h":1},"EarlyMiddleAge":{"population":399,"demandHappiness":399,"supplies_24h":3700,"strategy_points_24h":1},"HighMiddleAge":{"population":560,"demandHappiness":560,"supplies_24h":5200,"strategy_points_24h":1},"LateMiddleAge":{"population":735,"demandHappiness":735,"supplies_24h":6800,"strategy_points_24h":1},"ColonialAge":{"population":928,"demandHappiness":928,"supplies_24h":8700,"strategy_points_24h":1},"IndustrialAge":{"population":1134,"demandHappiness":1134,"supplies_24h":10500,"strategy_points_24h":1},"ProgressiveEra":{"population":1353,"demandHappiness":1353,"supplies_24h":12300,"strategy_points_24h":1},"ModernEra":{"population":1586,"demandHappiness":1586,"supplies_24h":14400,"strategy_points_24h":1},"PostModernEra":{"population":1828,"demandHappiness":1828,"supplies_24h":16400,"strategy_points_24h":1},"ContemporaryEra":{"population":2084,"demandHappiness":2084,"supplies_24h":18400,"strategy_points_24h":1},"TomorrowEra":{"population":2348,"demandHappiness":2348,"supplies_24h":20600,"strategy_points_24h":1},"FutureEra":{"population":2626,"demandHappiness":2626,"supplies_24h":22600,"strategy_points_24h":2},"ArcticFuture":{"population":2912,"demandHappiness":2912,"supplies_24h":24800,"strategy_points_24h":2},"OceanicFuture":{"population":3208,"demandHappiness":3208,"supplies_24h":27200,"strategy_points_24h":2},"VirtualFuture":{"population":3513,"demandHappiness":3513,"supplies_24h":29400,"strategy_points_24h":2},"SpaceAgeMars":{"population":5560,"demandHappiness":5560,"supplies_24h":47700,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"population":6040,"demandHappiness":6040,"supplies_24h":51200,"strategy_points_24h":2},"SpaceAgeVenus":{"population":6528,"demandHappiness":6528,"supplies_24h":54800,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"population":7030,"demandHappiness":7030,"supplies_24h":58300,"strategy_points_24h":2},"SpaceAgeTitan":{"population":7540,"demandHappiness":7540,"supplies_24h":62000,"strategy_points_24h":3},"SpaceAgeSpaceHub":{"population":8050,"demandHappiness":8050,"supplies_24h":65700,"strategy_points_24h":3}} },
+    "W_MultiAge_WIN23A4": { prod: {"BronzeAge":{"population":134,"demandHappiness":134,"supplies_24h":1000,"strategy_points_24h":2},"IronAge":{"population":288,"demandHappiness":288,"supplies_24h":2500,"strategy_points_24h":2},"EarlyMiddleAge":{"population":442,"demandHappiness":442,"supplies_24h":4200,"strategy_points_24h":2},"HighMiddleAge":{"population":620,"demandHappiness":620,"supplies_24h":5800,"strategy_points_24h":2},"LateMiddleAge":{"population":814,"demandHappiness":814,"supplies_24h":7700,"strategy_points_24h":2},"ColonialAge":{"population":1027,"demandHappiness":1027,"supplies_24h":9800,"strategy_points_24h":2},"IndustrialAge":{"population":1255,"demandHappiness":1255,"supplies_24h":11900,"strategy_points_24h":2},"ProgressiveEra":{"population":1498,"demandHappiness":1498,"supplies_24h":13900,"strategy_points_24h":2},"ModernEra":{"population":1756,"demandHappiness":1756,"supplies_24h":16200,"strategy_points_24h":2},"PostModernEra":{"population":2024,"demandHappiness":2024,"supplies_24h":18500,"strategy_points_24h":2},"ContemporaryEra":{"population":2307,"demandHappiness":2307,"supplies_24h":20800,"strategy_points_24h":2},"TomorrowEra":{"population":2600,"demandHappiness":2600,"supplies_24h":23300,"strategy_points_24h":2},"FutureEra":{"population":2907,"demandHappiness":2907,"supplies_24h":25600,"strategy_points_24h":2},"ArcticFuture":{"population":3224,"demandHappiness":3224,"supplies_24h":28100,"strategy_points_24h":2},"OceanicFuture":{"population":3552,"demandHappiness":3552,"supplies_24h":30800,"strategy_points_24h":2},"VirtualFuture":{"population":3889,"demandHappiness":3889,"supplies_24h":33300,"strategy_points_24h":2},"SpaceAgeMars":{"population":6156,"demandHappiness":6156,"supplies_24h":53900,"strategy_points_24h":3},"SpaceAgeAsteroidBelt":{"population":6687,"demandHappiness":6687,"supplies_24h":57800,"strategy_points_24h":3},"SpaceAgeVenus":{"population":7227,"demandHappiness":7227,"supplies_24h":62000,"strategy_points_24h":3},"SpaceAgeJupiterMoon":{"population":7783,"demandHappiness":7783,"supplies_24h":65900,"strategy_points_24h":3},"SpaceAgeTitan":{"population":8348,"demandHappiness":8348,"supplies_24h":70100,"strategy_points_24h":4},"SpaceAgeSpaceHub":{"population":8913,"demandHappiness":8913,"supplies_24h":74300,"strategy_points_24h":4}} },
+    "W_MultiAge_WIN23A5": { prod: {"BronzeAge":{"population":147,"demandHappiness":147,"supplies_24h":1200,"strategy_points_24h":2},"IronAge":{"population":316,"demandHappiness":316,"supplies_24h":2800,"strategy_points_24h":2},"EarlyMiddleAge":{"population":485,"demandHappiness":485,"supplies_24h":4600,"strategy_points_24h":2},"HighMiddleAge":{"population":680,"demandHappiness":680,"supplies_24h":6500,"strategy_points_24h":2},"LateMiddleAge":{"population":893,"demandHappiness":893,"supplies_24h":8600,"strategy_points_24h":2},"ColonialAge":{"population":1127,"demandHappiness":1127,"supplies_24h":10900,"strategy_points_24h":2},"IndustrialAge":{"population":1377,"demandHappiness":1377,"supplies_24h":13200,"strategy_points_24h":2},"ProgressiveEra":{"population":1643,"demandHappiness":1643,"supplies_24h":15500,"strategy_points_24h":2},"ModernEra":{"population":1926,"demandHappiness":1926,"supplies_24h":18100,"strategy_points_24h":2},"PostModernEra":{"population":2220,"demandHappiness":2220,"supplies_24h":20700,"strategy_points_24h":2},"ContemporaryEra":{"population":2530,"demandHappiness":2530,"supplies_24h":23200,"strategy_points_24h":2},"TomorrowEra":{"population":2851,"demandHappiness":2851,"supplies_24h":26000,"strategy_points_24h":2},"FutureEra":{"population":3188,"demandHappiness":3188,"supplies_24h":28500,"strategy_points_24h":3},"ArcticFuture":{"population":3536,"demandHappiness":3536,"supplies_24h":31300,"strategy_points_24h":3},"OceanicFuture":{"population":3896,"demandHappiness":3896,"supplies_24h":34300,"strategy_points_24h":3},"VirtualFuture":{"population":4265,"demandHappiness":4265,"supplies_24h":37100,"strategy_points_24h":3},"SpaceAgeMars":{"population":6752,"demandHappiness":6752,"supplies_24h":60100,"strategy_points_24h":4},"SpaceAgeAsteroidBelt":{"population":7334,"demandHappiness":7334,"supplies_24h":64500,"strategy_points_24h":4},"SpaceAgeVenus":{"population":7927,"demandHappiness":7927,"supplies_24h":69100,"strategy_points_24h":4},"SpaceAgeJupiterMoon":{"population":8536,"demandHappiness":8536,"supplies_24h":73500,"strategy_points_24h":4},"SpaceAgeTitan":{"population":9156,"demandHappiness":9156,"supplies_24h":78200,"strategy_points_24h":5},"SpaceAgeSpaceHub":{"population":9776,"demandHappiness":9776,"supplies_24h":82900,"strategy_points_24h":5}}, boosts: [{"type":"att_boost_attacker","value":1,"feature":"all"}] },
+    "W_MultiAge_WIN23A6": { prod: {"BronzeAge":{"population":160,"demandHappiness":160,"supplies_24h":1300,"strategy_points_24h":3},"IronAge":{"population":344,"demandHappiness":344,"supplies_24h":3100,"strategy_points_24h":3},"EarlyMiddleAge":{"population":527,"demandHappiness":527,"supplies_24h":5100,"strategy_points_24h":3},"HighMiddleAge":{"population":740,"demandHappiness":740,"supplies_24h":7200,"strategy_points_24h":3},"LateMiddleAge":{"population":971,"demandHappiness":971,"supplies_24h":9500,"strategy_points_24h":3},"ColonialAge":{"population":1226,"demandHappiness":1226,"supplies_24h":12000,"strategy_points_24h":3},"IndustrialAge":{"population":1498,"demandHappiness":1498,"supplies_24h":14600,"strategy_points_24h":3},"ProgressiveEra":{"population":1788,"demandHappiness":1788,"supplies_24h":17200,"strategy_points_24h":3},"ModernEra":{"population":2096,"demandHappiness":2096,"supplies_24h":20000,"strategy_points_24h":3},"PostModernEra":{"population":2416,"demandHappiness":2416,"supplies_24h":22800,"strategy_points_24h":3},"ContemporaryEra":{"population":2753,"demandHappiness":2753,"supplies_24h":25600,"strategy_points_24h":3},"TomorrowEra":{"population":3103,"demandHappiness":3103,"supplies_24h":28700,"strategy_points_24h":3},"FutureEra":{"population":3470,"demandHappiness":3470,"supplies_24h":31500,"strategy_points_24h":4},"ArcticFuture":{"population":3848,"demandHappiness":3848,"supplies_24h":34600,"strategy_points_24h":4},"OceanicFuture":{"population":4239,"demandHappiness":4239,"supplies_24h":37900,"strategy_points_24h":4},"VirtualFuture":{"population":4642,"demandHappiness":4642,"supplies_24h":41000,"strategy_points_24h":4},"SpaceAgeMars":{"population":7347,"demandHappiness":7347,"supplies_24h":66300,"strategy_points_24h":5},"SpaceAgeAsteroidBelt":{"population":7981,"demandHappiness":7981,"supplies_24h":71200,"strategy_points_24h":5},"SpaceAgeVenus":{"population":8626,"demandHappiness":8626,"supplies_24h":76300,"strategy_points_24h":5},"SpaceAgeJupiterMoon":{"population":9289,"demandHappiness":9289,"supplies_24h":81200,"strategy_points_24h":5},"SpaceAgeTitan":{"population":9964,"demandHappiness":9964,"supplies_24h":86300,"strategy_points_24h":6},"SpaceAgeSpaceHub":{"population":10639,"demandHappiness":10639,"supplies_24h":91400,"strategy_points_24h":6}}, boosts: [{"type":"att_boost_attacker","value":5,"feature":"all"}] },
+    "W_MultiAge_WIN23A7": { prod: {"BronzeAge":{"population":173,"demandHappiness":173,"supplies_24h":1400,"strategy_points_24h":4,"random_good_of_age_24h":1},"IronAge":{"population":372,"demandHappiness":372,"supplies_24h":3400,"strategy_points_24h":4,"random_good_of_age_24h":1},"EarlyMiddleAge":{"population":570,"demandHappiness":570,"supplies_24h":5600,"strategy_points_24h":4,"random_good_of_age_24h":1},"HighMiddleAge":{"population":800,"demandHappiness":800,"supplies_24h":7800,"strategy_points_24h":4,"random_good_of_age_24h":1},"LateMiddleAge":{"population":1050,"demandHappiness":1050,"supplies_24h":10400,"strategy_points_24h":4,"random_good_of_age_24h":1},"ColonialAge":{"population":1325,"demandHappiness":1325,"supplies_24h":13200,"strategy_points_24h":4,"random_good_of_age_24h":1},"IndustrialAge":{"population":1620,"demandHappiness":1620,"supplies_24h":16000,"strategy_points_24h":4,"random_good_of_age_24h":1},"ProgressiveEra":{"population":1933,"demandHappiness":1933,"supplies_24h":18800,"strategy_points_24h":4,"random_good_of_age_24h":1},"ModernEra":{"population":2266,"demandHappiness":2266,"supplies_24h":21800,"strategy_points_24h":4,"random_good_of_age_24h":1},"PostModernEra":{"population":2612,"demandHappiness":2612,"supplies_24h":24900,"strategy_points_24h":4,"random_good_of_age_24h":1},"ContemporaryEra":{"population":2976,"demandHappiness":2976,"supplies_24h":28000,"strategy_points_24h":4,"random_good_of_age_24h":1},"TomorrowEra":{"population":3354,"demandHappiness":3354,"supplies_24h":31400,"strategy_points_24h":4,"random_good_of_age_24h":1},"FutureEra":{"population":3751,"demandHappiness":3751,"supplies_24h":34400,"strategy_points_24h":5,"random_good_of_age_24h":1},"ArcticFuture":{"population":4160,"demandHappiness":4160,"supplies_24h":37800,"strategy_points_24h":5,"random_good_of_age_24h":1},"OceanicFuture":{"population":4583,"demandHappiness":4583,"supplies_24h":41400,"strategy_points_24h":5,"random_good_of_age_24h":1},"VirtualFuture":{"population":5018,"demandHappiness":5018,"supplies_24h":44800,"strategy_points_24h":5,"random_good_of_age_24h":1},"SpaceAgeMars":{"population":7943,"demandHappiness":7943,"supplies_24h":72500,"strategy_points_24h":6,"random_good_of_age_24h":1},"SpaceAgeAsteroidBelt":{"population":8628,"demandHappiness":8628,"supplies_24h":77800,"strategy_points_24h":6,"random_good_of_age_24h":1},"SpaceAgeVenus":{"population":9325,"demandHappiness":9325,"supplies_24h":83400,"strategy_points_24h":6,"random_good_of_age_24h":1},"SpaceAgeJupiterMoon":{"population":10042,"demandHappiness":10042,"supplies_24h":88800,"strategy_points_24h":6,"random_good_of_age_24h":1},"SpaceAgeTitan":{"population":10772,"demandHappiness":10772,"supplies_24h":94400,"strategy_points_24h":7,"random_good_of_age_24h":2},"SpaceAgeSpaceHub":{"population":11502,"demandHappiness":11502,"supplies_24h":100000,"strategy_points_24h":7,"random_good_of_age_24h":2}}, boosts: [{"type":"att_boost_attacker","value":9,"feature":"all"}] },
+    "W_MultiAge_WIN23A8": { prod: {"BronzeAge":{"population":186,"demandHappiness":186,"supplies_24h":1500,"strategy_points_24h":5,"random_good_of_age_24h":2},"IronAge":{"population":400,"demandHappiness":400,"supplies_24h":3700,"strategy_points_24h":5,"random_good_of_age_24h":2},"EarlyMiddleAge":{"population":613,"demandHappiness":613,"supplies_24h":6100,"strategy_points_24h":5,"random_good_of_age_24h":2},"HighMiddleAge":{"population":860,"demandHappiness":860,"supplies_24h":8500,"strategy_points_24h":5,"random_good_of_age_24h":2},"LateMiddleAge":{"population":1129,"demandHappiness":1129,"supplies_24h":11300,"strategy_points_24h":5,"random_good_of_age_24h":2},"ColonialAge":{"population":1425,"demandHappiness":1425,"supplies_24h":14300,"strategy_points_24h":5,"random_good_of_age_24h":2},"IndustrialAge":{"population":1741,"demandHappiness":1741,"supplies_24h":17300,"strategy_points_24h":5,"random_good_of_age_24h":2},"ProgressiveEra":{"population":2078,"demandHappiness":2078,"supplies_24h":20400,"strategy_points_24h":5,"random_good_of_age_24h":2},"ModernEra":{"population":2436,"demandHappiness":2436,"supplies_24h":23700,"strategy_points_24h":5,"random_good_of_age_24h":2},"PostModernEra":{"population":2808,"demandHappiness":2808,"supplies_24h":27100,"strategy_points_24h":5,"random_good_of_age_24h":2},"ContemporaryEra":{"population":3200,"demandHappiness":3200,"supplies_24h":30400,"strategy_points_24h":5,"random_good_of_age_24h":2},"TomorrowEra":{"population":3606,"demandHappiness":3606,"supplies_24h":34100,"strategy_points_24h":5,"random_good_of_age_24h":2},"FutureEra":{"population":4032,"demandHappiness":4032,"supplies_24h":37400,"strategy_points_24h":6,"random_good_of_age_24h":2},"ArcticFuture":{"population":4472,"demandHappiness":4472,"supplies_24h":41000,"strategy_points_24h":6,"random_good_of_age_24h":2},"OceanicFuture":{"population":4927,"demandHappiness":4927,"supplies_24h":45000,"strategy_points_24h":6,"random_good_of_age_24h":2},"VirtualFuture":{"population":5394,"demandHappiness":5394,"supplies_24h":48600,"strategy_points_24h":6,"random_good_of_age_24h":2},"SpaceAgeMars":{"population":8539,"demandHappiness":8539,"supplies_24h":78700,"strategy_points_24h":7,"random_good_of_age_24h":3},"SpaceAgeAsteroidBelt":{"population":9275,"demandHappiness":9275,"supplies_24h":84500,"strategy_points_24h":7,"random_good_of_age_24h":3},"SpaceAgeVenus":{"population":10025,"demandHappiness":10025,"supplies_24h":90600,"strategy_points_24h":7,"random_good_of_age_24h":3},"SpaceAgeJupiterMoon":{"population":10795,"demandHappiness":10795,"supplies_24h":96400,"strategy_points_24h":7,"random_good_of_age_24h":3},"SpaceAgeTitan":{"population":11580,"demandHappiness":11580,"supplies_24h":102500,"strategy_points_24h":8,"random_good_of_age_24h":4},"SpaceAgeSpaceHub":{"population":12365,"demandHappiness":12365,"supplies_24h":108600,"strategy_points_24h":8,"random_good_of_age_24h":4}}, boosts: [{"type":"att_boost_attacker","value":13,"feature":"all"}] },
+    "W_MultiAge_WIN23A9": { prod: {"BronzeAge":{"population":199,"demandHappiness":199,"supplies_24h":1600,"strategy_points_24h":7,"random_good_of_age_24h":5},"IronAge":{"population":427,"demandHappiness":427,"supplies_24h":3900,"strategy_points_24h":7,"random_good_of_age_24h":5},"EarlyMiddleAge":{"population":656,"demandHappiness":656,"supplies_24h":6600,"strategy_points_24h":7,"random_good_of_age_24h":5},"HighMiddleAge":{"population":920,"demandHappiness":920,"supplies_24h":9200,"strategy_points_24h":7,"random_good_of_age_24h":5},"LateMiddleAge":{"population":1208,"demandHappiness":1208,"supplies_24h":12100,"strategy_points_24h":7,"random_good_of_age_24h":5},"ColonialAge":{"population":1524,"demandHappiness":1524,"supplies_24h":15400,"strategy_points_24h":7,"random_good_of_age_24h":5},"IndustrialAge":{"population":1863,"demandHappiness":1863,"supplies_24h":18700,"strategy_points_24h":7,"random_good_of_age_24h":5},"ProgressiveEra":{"population":2223,"demandHappiness":2223,"supplies_24h":22000,"strategy_points_24h":7,"random_good_of_age_24h":5},"ModernEra":{"population":2606,"demandHappiness":2606,"supplies_24h":25600,"strategy_points_24h":7,"random_good_of_age_24h":5},"PostModernEra":{"population":3003,"demandHappiness":3003,"supplies_24h":29200,"strategy_points_24h":7,"random_good_of_age_24h":5},"ContemporaryEra":{"population":3423,"demandHappiness":3423,"supplies_24h":32800,"strategy_points_24h":7,"random_good_of_age_24h":5},"TomorrowEra":{"population":3857,"demandHappiness":3857,"supplies_24h":36700,"strategy_points_24h":7,"random_good_of_age_24h":5},"FutureEra":{"population":4313,"demandHappiness":4313,"supplies_24h":40300,"strategy_points_24h":8,"random_good_of_age_24h":6},"ArcticFuture":{"population":4784,"demandHappiness":4784,"supplies_24h":44300,"strategy_points_24h":8,"random_good_of_age_24h":6},"OceanicFuture":{"population":5270,"demandHappiness":5270,"supplies_24h":48500,"strategy_points_24h":8,"random_good_of_age_24h":6},"VirtualFuture":{"population":5771,"demandHappiness":5771,"supplies_24h":52500,"strategy_points_24h":8,"random_good_of_age_24h":6},"SpaceAgeMars":{"population":9134,"demandHappiness":9134,"supplies_24h":85000,"strategy_points_24h":9,"random_good_of_age_24h":7},"SpaceAgeAsteroidBelt":{"population":9922,"demandHappiness":9922,"supplies_24h":91200,"strategy_points_24h":9,"random_good_of_age_24h":7},"SpaceAgeVenus":{"population":10724,"demandHappiness":10724,"supplies_24h":97700,"strategy_points_24h":9,"random_good_of_age_24h":7},"SpaceAgeJupiterMoon":{"population":11548,"demandHappiness":11548,"supplies_24h":104000,"strategy_points_24h":9,"random_good_of_age_24h":7},"SpaceAgeTitan":{"population":12387,"demandHappiness":12387,"supplies_24h":110500,"strategy_points_24h":10,"random_good_of_age_24h":8},"SpaceAgeSpaceHub":{"population":13226,"demandHappiness":13226,"supplies_24h":117000,"strategy_points_24h":10,"random_good_of_age_24h":8}}, boosts: [{"type":"att_boost_attacker","value":17,"feature":"all"},{"type":"att_boost_defender","value":10,"feature":"all"}] },
+    "W_MultiAge_WIN19A1": { prod: {"BronzeAge":{"population":162,"happiness":410,"demandHappiness":162,"money_24h":650},"IronAge":{"population":347,"happiness":710,"demandHappiness":347,"money_24h":1550},"EarlyMiddleAge":{"population":533,"happiness":780,"demandHappiness":533,"money_24h":2600},"HighMiddleAge":{"population":748,"happiness":870,"demandHappiness":748,"money_24h":3650},"LateMiddleAge":{"population":982,"happiness":970,"demandHappiness":982,"money_24h":4800},"ColonialAge":{"population":1239,"happiness":1140,"demandHappiness":1239,"money_24h":7300},"IndustrialAge":{"population":1514,"happiness":1290,"demandHappiness":1514,"money_24h":9100},"ProgressiveEra":{"population":1807,"happiness":1420,"demandHappiness":1807,"money_24h":11100},"ModernEra":{"population":2119,"happiness":1510,"demandHappiness":2119,"money_24h":13800},"PostModernEra":{"population":2442,"happiness":1580,"demandHappiness":2442,"money_24h":17400},"ContemporaryEra":{"population":2783,"happiness":1830,"demandHappiness":2783,"money_24h":22600},"TomorrowEra":{"population":3136,"happiness":2230,"demandHappiness":3136,"money_24h":26200},"FutureEra":{"population":3507,"happiness":2670,"demandHappiness":3507,"money_24h":30000},"ArcticFuture":{"population":3890,"happiness":3110,"demandHappiness":3890,"money_24h":34100},"OceanicFuture":{"population":4285,"happiness":3580,"demandHappiness":4285,"money_24h":38400},"VirtualFuture":{"population":4692,"happiness":4280,"demandHappiness":4692,"money_24h":43100},"SpaceAgeMars":{"population":7427,"happiness":6850,"demandHappiness":7427,"money_24h":71900},"SpaceAgeAsteroidBelt":{"population":8068,"happiness":7440,"demandHappiness":8068,"money_24h":79700},"SpaceAgeVenus":{"population":8720,"happiness":8040,"demandHappiness":8720,"money_24h":87800},"SpaceAgeJupiterMoon":{"population":9390,"happiness":8660,"demandHappiness":9390,"money_24h":96400},"SpaceAgeTitan":{"population":10073,"happiness":9290,"demandHappiness":10073,"money_24h":105400},"SpaceAgeSpaceHub":{"population":10773,"happiness":9940,"demandHappiness":10773,"money_24h":114800}} },
+    "W_MultiAge_WIN19A2": { prod: {"BronzeAge":{"population":167,"happiness":440,"demandHappiness":167,"money_24h":700,"supplies_24h":760},"IronAge":{"population":359,"happiness":760,"demandHappiness":359,"money_24h":1700,"supplies_24h":1300},"EarlyMiddleAge":{"population":551,"happiness":840,"demandHappiness":551,"money_24h":2850,"supplies_24h":1440},"HighMiddleAge":{"population":774,"happiness":940,"demandHappiness":774,"money_24h":4000,"supplies_24h":1610},"LateMiddleAge":{"population":1016,"happiness":1050,"demandHappiness":1016,"money_24h":5300,"supplies_24h":1790},"ColonialAge":{"population":1282,"happiness":1230,"demandHappiness":1282,"money_24h":8100,"supplies_24h":2110},"IndustrialAge":{"population":1567,"happiness":1390,"demandHappiness":1567,"money_24h":10000,"supplies_24h":2380},"ProgressiveEra":{"population":1871,"happiness":1520,"demandHappiness":1871,"money_24h":12200,"supplies_24h":2610},"ModernEra":{"population":2193,"happiness":1630,"demandHappiness":2193,"money_24h":15100,"supplies_24h":2800},"PostModernEra":{"population":2528,"happiness":1700,"demandHappiness":2528,"money_24h":19000,"supplies_24h":2910},"ContemporaryEra":{"population":2881,"happiness":1970,"demandHappiness":2881,"money_24h":24800,"supplies_24h":3390},"TomorrowEra":{"population":3246,"happiness":2400,"demandHappiness":3246,"money_24h":28700,"supplies_24h":4110},"FutureEra":{"population":3630,"happiness":2870,"demandHappiness":3630,"money_24h":32900,"supplies_24h":4920},"ArcticFuture":{"population":4027,"happiness":3340,"demandHappiness":4027,"money_24h":37400,"supplies_24h":5730},"OceanicFuture":{"population":4436,"happiness":3860,"demandHappiness":4436,"money_24h":42200,"supplies_24h":6620},"VirtualFuture":{"population":4857,"happiness":4610,"demandHappiness":4857,"money_24h":47200,"supplies_24h":7900},"SpaceAgeMars":{"population":7688,"happiness":7380,"demandHappiness":7688,"money_24h":78900,"supplies_24h":12650},"SpaceAgeAsteroidBelt":{"population":8351,"happiness":8020,"demandHappiness":8351,"money_24h":87400,"supplies_24h":13740},"SpaceAgeVenus":{"population":9026,"happiness":8660,"demandHappiness":9026,"money_24h":96300,"supplies_24h":14850},"SpaceAgeJupiterMoon":{"population":9720,"happiness":9330,"demandHappiness":9720,"money_24h":105700,"supplies_24h":15990},"SpaceAgeTitan":{"population":10426,"happiness":10010,"demandHappiness":10426,"money_24h":115600,"supplies_24h":17150},"SpaceAgeSpaceHub":{"population":11151,"happiness":10700,"demandHappiness":11151,"money_24h":125900,"supplies_24h":18350}} },
+    "W_MultiAge_WIN19A3": { prod: {"BronzeAge":{"population":173,"happiness":470,"demandHappiness":173,"money_24h":750,"supplies_24h":760,"medals_24h":5},"IronAge":{"population":371,"happiness":820,"demandHappiness":371,"money_24h":1800,"supplies_24h":1300,"medals_24h":6},"EarlyMiddleAge":{"population":570,"happiness":900,"demandHappiness":570,"money_24h":3000,"supplies_24h":1440,"medals_24h":7},"HighMiddleAge":{"population":801,"happiness":1010,"demandHappiness":801,"money_24h":4150,"supplies_24h":1610,"medals_24h":8},"LateMiddleAge":{"population":1050,"happiness":1120,"demandHappiness":1050,"money_24h":5500,"supplies_24h":1790,"medals_24h":9},"ColonialAge":{"population":1326,"happiness":1320,"demandHappiness":1326,"money_24h":8400,"supplies_24h":2110,"medals_24h":11},"IndustrialAge":{"population":1620,"happiness":1490,"demandHappiness":1620,"money_24h":10500,"supplies_24h":2380,"medals_24h":15},"ProgressiveEra":{"population":1934,"happiness":1630,"demandHappiness":1934,"money_24h":12700,"supplies_24h":2610,"medals_24h":21},"ModernEra":{"population":2267,"happiness":1750,"demandHappiness":2267,"money_24h":15800,"supplies_24h":2800,"medals_24h":30},"PostModernEra":{"population":2613,"happiness":1820,"demandHappiness":2613,"money_24h":19900,"supplies_24h":2910,"medals_24h":42},"ContemporaryEra":{"population":2978,"happiness":2120,"demandHappiness":2978,"money_24h":25900,"supplies_24h":3390,"medals_24h":60},"TomorrowEra":{"population":3356,"happiness":2570,"demandHappiness":3356,"money_24h":30000,"supplies_24h":4110,"medals_24h":81},"FutureEra":{"population":3753,"happiness":3080,"demandHappiness":3753,"money_24h":34400,"supplies_24h":4920,"medals_24h":99},"ArcticFuture":{"population":4163,"happiness":3580,"demandHappiness":4163,"money_24h":39000,"supplies_24h":5730,"medals_24h":120},"OceanicFuture":{"population":4586,"happiness":4130,"demandHappiness":4586,"money_24h":44000,"supplies_24h":6620,"medals_24h":138},"VirtualFuture":{"population":5022,"happiness":4940,"demandHappiness":5022,"money_24h":49300,"supplies_24h":7900,"medals_24h":168},"SpaceAgeMars":{"population":7949,"happiness":7900,"demandHappiness":7949,"money_24h":82400,"supplies_24h":12650,"medals_24h":204},"SpaceAgeAsteroidBelt":{"population":8634,"happiness":8590,"demandHappiness":8634,"money_24h":91200,"supplies_24h":13740,"medals_24h":240},"SpaceAgeVenus":{"population":9332,"happiness":9280,"demandHappiness":9332,"money_24h":100600,"supplies_24h":14850,"medals_24h":276},"SpaceAgeJupiterMoon":{"population":10049,"happiness":10000,"demandHappiness":10049,"money_24h":110400,"supplies_24h":15990,"medals_24h":312},"SpaceAgeTitan":{"population":10780,"happiness":10720,"demandHappiness":10780,"money_24h":120700,"supplies_24h":17150,"medals_24h":348},"SpaceAgeSpaceHub":{"population":11529,"happiness":11470,"demandHappiness":11529,"money_24h":131400,"supplies_24h":18350,"medals_24h":384}} },
+    "W_MultiAge_WIN19A4": { prod: {"BronzeAge":{"population":179,"happiness":500,"demandHappiness":179,"money_24h":800,"supplies_24h":760,"medals_24h":9,"strategy_points_24h":1},"IronAge":{"population":384,"happiness":870,"demandHappiness":384,"money_24h":1900,"supplies_24h":1300,"medals_24h":11,"strategy_points_24h":1},"EarlyMiddleAge":{"population":589,"happiness":960,"demandHappiness":589,"money_24h":3150,"supplies_24h":1440,"medals_24h":14,"strategy_points_24h":1},"HighMiddleAge":{"population":827,"happiness":1070,"demandHappiness":827,"money_24h":4400,"supplies_24h":1610,"medals_24h":16,"strategy_points_24h":1},"LateMiddleAge":{"population":1085,"happiness":1200,"demandHappiness":1085,"money_24h":5800,"supplies_24h":1790,"medals_24h":18,"strategy_points_24h":1},"ColonialAge":{"population":1369,"happiness":1410,"demandHappiness":1369,"money_24h":8900,"supplies_24h":2110,"medals_24h":22,"strategy_points_24h":1},"IndustrialAge":{"population":1674,"happiness":1590,"demandHappiness":1674,"money_24h":11100,"supplies_24h":2380,"medals_24h":30,"strategy_points_24h":1},"ProgressiveEra":{"population":1998,"happiness":1740,"demandHappiness":1998,"money_24h":13400,"supplies_24h":2610,"medals_24h":42,"strategy_points_24h":1},"ModernEra":{"population":2342,"happiness":1860,"demandHappiness":2342,"money_24h":16700,"supplies_24h":2800,"medals_24h":60,"strategy_points_24h":1},"PostModernEra":{"population":2699,"happiness":1940,"demandHappiness":2699,"money_24h":21000,"supplies_24h":2910,"medals_24h":84,"strategy_points_24h":1},"ContemporaryEra":{"population":3076,"happiness":2260,"demandHappiness":3076,"money_24h":27300,"supplies_24h":3390,"medals_24h":120,"strategy_points_24h":1},"TomorrowEra":{"population":3466,"happiness":2740,"demandHappiness":3466,"money_24h":31700,"supplies_24h":4110,"medals_24h":162,"strategy_points_24h":1},"FutureEra":{"population":3876,"happiness":3280,"demandHappiness":3876,"money_24h":36300,"supplies_24h":4920,"medals_24h":198,"strategy_points_24h":1},"ArcticFuture":{"population":4300,"happiness":3820,"demandHappiness":4300,"money_24h":41200,"supplies_24h":5730,"medals_24h":240,"strategy_points_24h":1},"OceanicFuture":{"population":4736,"happiness":4410,"demandHappiness":4736,"money_24h":46500,"supplies_24h":6620,"medals_24h":276,"strategy_points_24h":1},"VirtualFuture":{"population":5186,"happiness":5270,"demandHappiness":5186,"money_24h":52100,"supplies_24h":7900,"medals_24h":336,"strategy_points_24h":1},"SpaceAgeMars":{"population":8209,"happiness":8430,"demandHappiness":8209,"money_24h":87000,"supplies_24h":12650,"medals_24h":408,"strategy_points_24h":1},"SpaceAgeAsteroidBelt":{"population":8917,"happiness":9160,"demandHappiness":8917,"money_24h":96400,"supplies_24h":13740,"medals_24h":480,"strategy_points_24h":1},"SpaceAgeVenus":{"population":9638,"happiness":9900,"demandHappiness":9638,"money_24h":106200,"supplies_24h":14850,"medals_24h":552,"strategy_points_24h":1},"SpaceAgeJupiterMoon":{"population":10379,"happiness":10660,"demandHappiness":10379,"money_24h":116600,"supplies_24h":15990,"medals_24h":624,"strategy_points_24h":1},"SpaceAgeTitan":{"population":11133,"happiness":11440,"demandHappiness":11133,"money_24h":127500,"supplies_24h":17150,"medals_24h":696,"strategy_points_24h":1},"SpaceAgeSpaceHub":{"population":11907,"happiness":12230,"demandHappiness":11907,"money_24h":138800,"supplies_24h":18350,"medals_24h":768,"strategy_points_24h":1}} },
+    "W_MultiAge_WIN19A5": { prod: {"BronzeAge":{"population":184,"happiness":540,"demandHappiness":184,"money_24h":850,"supplies_24h":760,"medals_24h":13,"strategy_points_24h":2},"IronAge":{"population":396,"happiness":920,"demandHappiness":396,"money_24h":2050,"supplies_24h":1300,"medals_24h":17,"strategy_points_24h":2},"EarlyMiddleAge":{"population":607,"happiness":1020,"demandHappiness":607,"money_24h":3400,"supplies_24h":1440,"medals_24h":20,"strategy_points_24h":2},"HighMiddleAge":{"population":853,"happiness":1140,"demandHappiness":853,"money_24h":4750,"supplies_24h":1610,"medals_24h":24,"strategy_points_24h":2},"LateMiddleAge":{"population":1119,"happiness":1270,"demandHappiness":1119,"money_24h":6300,"supplies_24h":1790,"medals_24h":27,"strategy_points_24h":2},"ColonialAge":{"population":1413,"happiness":1490,"demandHappiness":1413,"money_24h":9500,"supplies_24h":2110,"medals_24h":33,"strategy_points_24h":2},"IndustrialAge":{"population":1727,"happiness":1690,"demandHappiness":1727,"money_24h":11900,"supplies_24h":2380,"medals_24h":45,"strategy_points_24h":2},"ProgressiveEra":{"population":2061,"happiness":1850,"demandHappiness":2061,"money_24h":14400,"supplies_24h":2610,"medals_24h":63,"strategy_points_24h":2},"ModernEra":{"population":2416,"happiness":1980,"demandHappiness":2416,"money_24h":17900,"supplies_24h":2800,"medals_24h":90,"strategy_points_24h":2},"PostModernEra":{"population":2785,"happiness":2060,"demandHappiness":2785,"money_24h":22500,"supplies_24h":2910,"medals_24h":126,"strategy_points_24h":2},"ContemporaryEra":{"population":3174,"happiness":2400,"demandHappiness":3174,"money_24h":29400,"supplies_24h":3390,"medals_24h":180,"strategy_points_24h":2},"TomorrowEra":{"population":3576,"happiness":2910,"demandHappiness":3576,"money_24h":34000,"supplies_24h":4110,"medals_24h":243,"strategy_points_24h":2},"FutureEra":{"population":3999,"happiness":3490,"demandHappiness":3999,"money_24h":39000,"supplies_24h":4920,"medals_24h":297,"strategy_points_24h":2},"ArcticFuture":{"population":4436,"happiness":4060,"demandHappiness":4436,"money_24h":44300,"supplies_24h":5730,"medals_24h":360,"strategy_points_24h":2},"OceanicFuture":{"population":4887,"happiness":4690,"demandHappiness":4887,"money_24h":49900,"supplies_24h":6620,"medals_24h":414,"strategy_points_24h":2},"VirtualFuture":{"population":5351,"happiness":5600,"demandHappiness":5351,"money_24h":55900,"supplies_24h":7900,"medals_24h":504,"strategy_points_24h":2},"SpaceAgeMars":{"population":8470,"happiness":8960,"demandHappiness":8470,"money_24h":93400,"supplies_24h":12650,"medals_24h":612,"strategy_points_24h":2},"SpaceAgeAsteroidBelt":{"population":9200,"happiness":9730,"demandHappiness":9200,"money_24h":103400,"supplies_24h":13740,"medals_24h":720,"strategy_points_24h":2},"SpaceAgeVenus":{"population":9944,"happiness":10520,"demandHappiness":9944,"money_24h":114000,"supplies_24h":14850,"medals_24h":828,"strategy_points_24h":2},"SpaceAgeJupiterMoon":{"population":10708,"happiness":11330,"demandHappiness":10708,"money_24h":125100,"supplies_24h":15990,"medals_24h":936,"strategy_points_24h":2},"SpaceAgeTitan":{"population":11486,"happiness":12150,"demandHappiness":11486,"money_24h":136800,"supplies_24h":17150,"medals_24h":1044,"strategy_points_24h":2},"SpaceAgeSpaceHub":{"population":12285,"happiness":13000,"demandHappiness":12285,"money_24h":149000,"supplies_24h":18350,"medals_24h":1152,"strategy_points_24h":2}} },
+    "W_MultiAge_WIN19A6": { prod: {"BronzeAge":{"population":190,"happiness":570,"demandHappiness":190,"money_24h":900,"supplies_24h":760,"medals_24h":17,"strategy_points_24h":2,"all_goods_of_age_24h":5},"IronAge":{"population":408,"happiness":980,"demandHappiness":408,"money_24h":2200,"supplies_24h":1300,"medals_24h":22,"strategy_points_24h":2,"all_goods_of_age_24h":5},"EarlyMiddleAge":{"population":626,"happiness":1080,"demandHappiness":626,"money_24h":3700,"supplies_24h":1440,"medals_24h":27,"strategy_points_24h":2,"all_goods_of_age_24h":5},"HighMiddleAge":{"population":879,"happiness":1210,"demandHappiness":879,"money_24h":5150,"supplies_24h":1610,"medals_24h":32,"strategy_points_24h":2,"all_goods_of_age_24h":5},"LateMiddleAge":{"population":1154,"happiness":1350,"demandHappiness":1154,"money_24h":6800,"supplies_24h":1790,"medals_24h":36,"strategy_points_24h":2,"all_goods_of_age_24h":5},"ColonialAge":{"population":1456,"happiness":1580,"demandHappiness":1456,"money_24h":10400,"supplies_24h":2110,"medals_24h":44,"strategy_points_24h":2,"all_goods_of_age_24h":5},"IndustrialAge":{"population":1780,"happiness":1780,"demandHappiness":1780,"money_24h":13000,"supplies_24h":2380,"medals_24h":60,"strategy_points_24h":2,"all_goods_of_age_24h":5},"ProgressiveEra":{"population":2125,"happiness":1960,"demandHappiness":2125,"money_24h":15700,"supplies_24h":2610,"medals_24h":84,"strategy_points_24h":2,"all_goods_of_age_24h":5},"ModernEra":{"population":2490,"happiness":2100,"demandHappiness":2490,"money_24h":19600,"supplies_24h":2800,"medals_24h":120,"strategy_points_24h":2,"all_goods_of_age_24h":5},"PostModernEra":{"population":2870,"happiness":2180,"demandHappiness":2870,"money_24h":24600,"supplies_24h":2910,"medals_24h":168,"strategy_points_24h":2,"all_goods_of_age_24h":5},"ContemporaryEra":{"population":3271,"happiness":2540,"demandHappiness":3271,"money_24h":32100,"supplies_24h":3390,"medals_24h":240,"strategy_points_24h":2,"all_goods_of_age_24h":5},"TomorrowEra":{"population":3686,"happiness":3080,"demandHappiness":3686,"money_24h":37100,"supplies_24h":4110,"medals_24h":324,"strategy_points_24h":2,"all_goods_of_age_24h":5},"FutureEra":{"population":4123,"happiness":3690,"demandHappiness":4123,"money_24h":42600,"supplies_24h":4920,"medals_24h":396,"strategy_points_24h":2,"all_goods_of_age_24h":5},"ArcticFuture":{"population":4573,"happiness":4300,"demandHappiness":4573,"money_24h":48400,"supplies_24h":5730,"medals_24h":480,"strategy_points_24h":2,"all_goods_of_age_24h":5},"OceanicFuture":{"population":5037,"happiness":4960,"demandHappiness":5037,"money_24h":54600,"supplies_24h":6620,"medals_24h":552,"strategy_points_24h":2,"all_goods_of_age_24h":5},"VirtualFuture":{"population":5515,"happiness":5930,"demandHappiness":5515,"money_24h":61100,"supplies_24h":7900,"medals_24h":672,"strategy_points_24h":2,"all_goods_of_age_24h":5},"SpaceAgeMars":{"population":8730,"happiness":9480,"demandHappiness":8730,"money_24h":102100,"supplies_24h":12650,"medals_24h":816,"strategy_points_24h":2,"all_goods_of_age_24h":5},"SpaceAgeAsteroidBelt":{"population":9483,"happiness":10310,"demandHappiness":9483,"money_24h":113100,"supplies_24h":13740,"medals_24h":960,"strategy_points_24h":2,"all_goods_of_age_24h":5},"SpaceAgeVenus":{"population":10250,"happiness":11140,"demandHappiness":10250,"money_24h":124600,"supplies_24h":14850,"medals_24h":1104,"strategy_points_24h":2,"all_goods_of_age_24h":5},"SpaceAgeJupiterMoon":{"population":11038,"happiness":12000,"demandHappiness":11038,"money_24h":136800,"supplies_24h":15990,"medals_24h":1248,"strategy_points_24h":2,"all_goods_of_age_24h":5},"SpaceAgeTitan":{"population":11840,"happiness":12860,"demandHappiness":11840,"money_24h":149500,"supplies_24h":17150,"medals_24h":1392,"strategy_points_24h":2,"all_goods_of_age_24h":5},"SpaceAgeSpaceHub":{"population":12663,"happiness":13760,"demandHappiness":12663,"money_24h":162900,"supplies_24h":18350,"medals_24h":1536,"strategy_points_24h":2,"all_goods_of_age_24h":5}} },
+    "W_MultiAge_WIN19A7": { prod: {"BronzeAge":{"population":196,"happiness":600,"demandHappiness":196,"money_24h":950,"supplies_24h":760,"medals_24h":21,"strategy_points_24h":4,"all_goods_of_age_24h":5},"IronAge":{"population":420,"happiness":1030,"demandHappiness":420,"money_24h":2300,"supplies_24h":1300,"medals_24h":27,"strategy_points_24h":4,"all_goods_of_age_24h":5},"EarlyMiddleAge":{"population":645,"happiness":1140,"demandHappiness":645,"money_24h":3850,"supplies_24h":1440,"medals_24h":33,"strategy_points_24h":4,"all_goods_of_age_24h":5},"HighMiddleAge":{"population":906,"happiness":1270,"demandHappiness":906,"money_24h":5400,"supplies_24h":1610,"medals_24h":39,"strategy_points_24h":4,"all_goods_of_age_24h":5},"LateMiddleAge":{"population":1188,"happiness":1420,"demandHappiness":1188,"money_24h":7200,"supplies_24h":1790,"medals_24h":45,"strategy_points_24h":4,"all_goods_of_age_24h":5},"ColonialAge":{"population":1500,"happiness":1670,"demandHappiness":1500,"money_24h":10900,"supplies_24h":2110,"medals_24h":54,"strategy_points_24h":4,"all_goods_of_age_24h":5},"IndustrialAge":{"population":1833,"happiness":1880,"demandHappiness":1833,"money_24h":13600,"supplies_24h":2380,"medals_24h":75,"strategy_points_24h":4,"all_goods_of_age_24h":5},"ProgressiveEra":{"population":2188,"happiness":2070,"demandHappiness":2188,"money_24h":16500,"supplies_24h":2610,"medals_24h":105,"strategy_points_24h":4,"all_goods_of_age_24h":5},"ModernEra":{"population":2565,"happiness":2210,"demandHappiness":2565,"money_24h":20500,"supplies_24h":2800,"medals_24h":150,"strategy_points_24h":4,"all_goods_of_age_24h":5},"PostModernEra":{"population":2956,"happiness":2310,"demandHappiness":2956,"money_24h":25800,"supplies_24h":2910,"medals_24h":210,"strategy_points_24h":4,"all_goods_of_age_24h":5},"ContemporaryEra":{"population":3369,"happiness":2680,"demandHappiness":3369,"money_24h":33500,"supplies_24h":3390,"medals_24h":300,"strategy_points_24h":4,"all_goods_of_age_24h":5},"TomorrowEra":{"population":3796,"happiness":3250,"demandHappiness":3796,"money_24h":38800,"supplies_24h":4110,"medals_24h":405,"strategy_points_24h":4,"all_goods_of_age_24h":5},"FutureEra":{"population":4246,"happiness":3900,"demandHappiness":4246,"money_24h":44500,"supplies_24h":4920,"medals_24h":495,"strategy_points_24h":4,"all_goods_of_age_24h":5},"ArcticFuture":{"population":4709,"happiness":4540,"demandHappiness":4709,"money_24h":50600,"supplies_24h":5730,"medals_24h":600,"strategy_points_24h":4,"all_goods_of_age_24h":5},"OceanicFuture":{"population":5187,"happiness":5240,"demandHappiness":5187,"money_24h":57000,"supplies_24h":6620,"medals_24h":690,"strategy_points_24h":4,"all_goods_of_age_24h":5},"VirtualFuture":{"population":5680,"happiness":6260,"demandHappiness":5680,"money_24h":63900,"supplies_24h":7900,"medals_24h":840,"strategy_points_24h":4,"all_goods_of_age_24h":5},"SpaceAgeMars":{"population":8991,"happiness":10010,"demandHappiness":8991,"money_24h":106700,"supplies_24h":12650,"medals_24h":1020,"strategy_points_24h":4,"all_goods_of_age_24h":5},"SpaceAgeAsteroidBelt":{"population":9766,"happiness":10880,"demandHappiness":9766,"money_24h":118200,"supplies_24h":13740,"medals_24h":1200,"strategy_points_24h":4,"all_goods_of_age_24h":5},"SpaceAgeVenus":{"population":10556,"happiness":11750,"demandHappiness":10556,"money_24h":130300,"supplies_24h":14850,"medals_24h":1380,"strategy_points_24h":4,"all_goods_of_age_24h":5},"SpaceAgeJupiterMoon":{"population":11367,"happiness":12660,"demandHappiness":11367,"money_24h":143000,"supplies_24h":15990,"medals_24h":1560,"strategy_points_24h":4,"all_goods_of_age_24h":5},"SpaceAgeTitan":{"population":12193,"happiness":13580,"demandHappiness":12193,"money_24h":156300,"supplies_24h":17150,"medals_24h":1740,"strategy_points_24h":4,"all_goods_of_age_24h":5},"SpaceAgeSpaceHub":{"population":13041,"happiness":14530,"demandHappiness":13041,"money_24h":170300,"supplies_24h":18350,"medals_24h":1920,"strategy_points_24h":4,"all_goods_of_age_24h":5}} },
+    "W_MultiAge_WIN19A8": { prod: {"BronzeAge":{"population":201,"happiness":630,"demandHappiness":201,"money_24h":1050,"supplies_24h":760,"medals_24h":24,"strategy_points_24h":4,"all_goods_of_age_24h":10},"IronAge":{"population":432,"happiness":1090,"demandHappiness":432,"money_24h":2500,"supplies_24h":1300,"medals_24h":30,"strategy_points_24h":4,"all_goods_of_age_24h":10},"EarlyMiddleAge":{"population":663,"happiness":1200,"demandHappiness":663,"money_24h":4200,"supplies_24h":1440,"medals_24h":37,"strategy_points_24h":4,"all_goods_of_age_24h":10},"HighMiddleAge":{"population":932,"happiness":1340,"demandHappiness":932,"money_24h":5900,"supplies_24h":1610,"medals_24h":43,"strategy_points_24h":4,"all_goods_of_age_24h":10},"LateMiddleAge":{"population":1223,"happiness":1500,"demandHappiness":1223,"money_24h":7800,"supplies_24h":1790,"medals_24h":50,"strategy_points_24h":4,"all_goods_of_age_24h":10},"ColonialAge":{"population":1543,"happiness":1760,"demandHappiness":1543,"money_24h":11800,"supplies_24h":2110,"medals_24h":60,"strategy_points_24h":4,"all_goods_of_age_24h":10},"IndustrialAge":{"population":1886,"happiness":1980,"demandHappiness":1886,"money_24h":14700,"supplies_24h":2380,"medals_24h":83,"strategy_points_24h":4,"all_goods_of_age_24h":10},"ProgressiveEra":{"population":2251,"happiness":2180,"demandHappiness":2251,"money_24h":17900,"supplies_24h":2610,"medals_24h":116,"strategy_points_24h":4,"all_goods_of_age_24h":10},"ModernEra":{"population":2639,"happiness":2330,"demandHappiness":2639,"money_24h":22300,"supplies_24h":2800,"medals_24h":165,"strategy_points_24h":4,"all_goods_of_age_24h":10},"PostModernEra":{"population":3042,"happiness":2430,"demandHappiness":3042,"money_24h":28000,"supplies_24h":2910,"medals_24h":231,"strategy_points_24h":4,"all_goods_of_age_24h":10},"ContemporaryEra":{"population":3467,"happiness":2820,"demandHappiness":3467,"money_24h":36500,"supplies_24h":3390,"medals_24h":330,"strategy_points_24h":4,"all_goods_of_age_24h":10},"TomorrowEra":{"population":3906,"happiness":3420,"demandHappiness":3906,"money_24h":42200,"supplies_24h":4110,"medals_24h":446,"strategy_points_24h":4,"all_goods_of_age_24h":10},"FutureEra":{"population":4369,"happiness":4100,"demandHappiness":4369,"money_24h":48400,"supplies_24h":4920,"medals_24h":545,"strategy_points_24h":4,"all_goods_of_age_24h":10},"ArcticFuture":{"population":4846,"happiness":4780,"demandHappiness":4846,"money_24h":55000,"supplies_24h":5730,"medals_24h":660,"strategy_points_24h":4,"all_goods_of_age_24h":10},"OceanicFuture":{"population":5338,"happiness":5510,"demandHappiness":5338,"money_24h":62000,"supplies_24h":6620,"medals_24h":759,"strategy_points_24h":4,"all_goods_of_age_24h":10},"VirtualFuture":{"population":5845,"happiness":6590,"demandHappiness":5845,"money_24h":69400,"supplies_24h":7900,"medals_24h":924,"strategy_points_24h":4,"all_goods_of_age_24h":10},"SpaceAgeMars":{"population":9252,"happiness":10540,"demandHappiness":9252,"money_24h":116000,"supplies_24h":12650,"medals_24h":1122,"strategy_points_24h":4,"all_goods_of_age_24h":10},"SpaceAgeAsteroidBelt":{"population":10049,"happiness":11450,"demandHappiness":10049,"money_24h":128500,"supplies_24h":13740,"medals_24h":1320,"strategy_points_24h":4,"all_goods_of_age_24h":10},"SpaceAgeVenus":{"population":10862,"happiness":12370,"demandHappiness":10862,"money_24h":141600,"supplies_24h":14850,"medals_24h":1518,"strategy_points_24h":4,"all_goods_of_age_24h":10},"SpaceAgeJupiterMoon":{"population":11697,"happiness":13330,"demandHappiness":11697,"money_24h":155400,"supplies_24h":15990,"medals_24h":1716,"strategy_points_24h":4,"all_goods_of_age_24h":10},"SpaceAgeTitan":{"population":12547,"happiness":14290,"demandHappiness":12547,"money_24h":169900,"supplies_24h":17150,"medals_24h":1914,"strategy_points_24h":4,"all_goods_of_age_24h":10},"SpaceAgeSpaceHub":{"population":13419,"happiness":15290,"demandHappiness":13419,"money_24h":185100,"supplies_24h":18350,"medals_24h":2112,"strategy_points_24h":4,"all_goods_of_age_24h":10}} },
+    "W_MultiAge_WIN24A12": { prod: {"BronzeAge":{"population":580,"demandHappiness":580,"medals_24h":540,"strategy_points_24h":88},"IronAge":{"population":1240,"demandHappiness":1240,"medals_24h":700,"strategy_points_24h":89},"EarlyMiddleAge":{"population":1900,"demandHappiness":1900,"medals_24h":850,"strategy_points_24h":90},"HighMiddleAge":{"population":2670,"demandHappiness":2670,"medals_24h":1010,"strategy_points_24h":91},"LateMiddleAge":{"population":3510,"demandHappiness":3510,"medals_24h":1160,"strategy_points_24h":92},"ColonialAge":{"population":4430,"demandHappiness":4430,"medals_24h":1400,"strategy_points_24h":93},"IndustrialAge":{"population":5410,"demandHappiness":5410,"medals_24h":1940,"strategy_points_24h":94},"ProgressiveEra":{"population":6460,"demandHappiness":6460,"medals_24h":2720,"strategy_points_24h":95},"ModernEra":{"population":7570,"demandHappiness":7570,"medals_24h":3880,"strategy_points_24h":96},"PostModernEra":{"population":8730,"demandHappiness":8730,"medals_24h":5430,"strategy_points_24h":97},"ContemporaryEra":{"population":9950,"demandHappiness":9950,"medals_24h":7760,"strategy_points_24h":98},"TomorrowEra":{"population":11210,"demandHappiness":11210,"medals_24h":10470,"strategy_points_24h":99},"FutureEra":{"population":12530,"demandHappiness":12530,"medals_24h":12800,"strategy_points_24h":100},"ArcticFuture":{"population":13900,"demandHappiness":13900,"medals_24h":15520,"strategy_points_24h":101},"OceanicFuture":{"population":15320,"demandHappiness":15320,"medals_24h":17840,"strategy_points_24h":102},"VirtualFuture":{"population":16770,"demandHappiness":16770,"medals_24h":21720,"strategy_points_24h":103},"SpaceAgeMars":{"population":26550,"demandHappiness":26550,"medals_24h":26380,"strategy_points_24h":104},"SpaceAgeAsteroidBelt":{"population":28830,"demandHappiness":28830,"medals_24h":31030,"strategy_points_24h":105},"SpaceAgeVenus":{"population":31170,"demandHappiness":31170,"medals_24h":35690,"strategy_points_24h":106},"SpaceAgeJupiterMoon":{"population":33560,"demandHappiness":33560,"medals_24h":40340,"strategy_points_24h":107},"SpaceAgeTitan":{"population":36000,"demandHappiness":36000,"medals_24h":45000,"strategy_points_24h":108},"SpaceAgeSpaceHub":{"population":38440,"demandHappiness":38440,"medals_24h":49660,"strategy_points_24h":109}}, boosts: [{"type":"att_boost_attacker","value":61,"feature":"all"},{"type":"att_def_boost_attacker","value":15,"feature":"guild_raids"},{"type":"att_boost_defender","value":61,"feature":"all"},{"type":"guild_raids_action_points_collection","value":200,"feature":"all"}] },
+    "W_MultiAge_WIN24A14": { prod: {"BronzeAge":{"population":580,"demandHappiness":580,"medals_24h":540,"strategy_points_24h":218},"IronAge":{"population":1240,"demandHappiness":1240,"medals_24h":700,"strategy_points_24h":218},"EarlyMiddleAge":{"population":1900,"demandHappiness":1900,"medals_24h":850,"strategy_points_24h":218},"HighMiddleAge":{"population":2670,"demandHappiness":2670,"medals_24h":1010,"strategy_points_24h":218},"LateMiddleAge":{"population":3510,"demandHappiness":3510,"medals_24h":1160,"strategy_points_24h":218},"ColonialAge":{"population":4430,"demandHappiness":4430,"medals_24h":1400,"strategy_points_24h":218},"IndustrialAge":{"population":5410,"demandHappiness":5410,"medals_24h":1940,"strategy_points_24h":218},"ProgressiveEra":{"population":6460,"demandHappiness":6460,"medals_24h":2720,"strategy_points_24h":218},"ModernEra":{"population":7570,"demandHappiness":7570,"medals_24h":3880,"strategy_points_24h":218},"PostModernEra":{"population":8730,"demandHappiness":8730,"medals_24h":5430,"strategy_points_24h":218},"ContemporaryEra":{"population":9950,"demandHappiness":9950,"medals_24h":7760,"strategy_points_24h":218},"TomorrowEra":{"population":11210,"demandHappiness":11210,"medals_24h":10480,"strategy_points_24h":218},"FutureEra":{"population":12540,"demandHappiness":12540,"medals_24h":12800,"strategy_points_24h":218},"ArcticFuture":{"population":13900,"demandHappiness":13900,"medals_24h":15520,"strategy_points_24h":218},"OceanicFuture":{"population":15320,"demandHappiness":15320,"medals_24h":17850,"strategy_points_24h":218},"VirtualFuture":{"population":16770,"demandHappiness":16770,"medals_24h":21730,"strategy_points_24h":218},"SpaceAgeMars":{"population":26550,"demandHappiness":26550,"medals_24h":26380,"strategy_points_24h":218},"SpaceAgeAsteroidBelt":{"population":28840,"demandHappiness":28840,"medals_24h":31040,"strategy_points_24h":218},"SpaceAgeVenus":{"population":31170,"demandHappiness":31170,"medals_24h":35690,"strategy_points_24h":218},"SpaceAgeJupiterMoon":{"population":33560,"demandHappiness":33560,"medals_24h":40350,"strategy_points_24h":218},"SpaceAgeTitan":{"population":36000,"demandHappiness":36000,"medals_24h":45000,"strategy_points_24h":218},"SpaceAgeSpaceHub":{"population":38440,"demandHappiness":38440,"medals_24h":49660,"strategy_points_24h":218}}, boosts: [{"type":"att_boost_attacker","value":82,"feature":"all"},{"type":"att_boost_defender","value":82,"feature":"all"},{"type":"att_def_boost_attacker_defender","value":15,"feature":"guild_raids"},{"type":"guild_raids_action_points_collection","value":200,"feature":"all"},{"type":"guild_raids_action_points_capacity","value":8000,"feature":"all"}] },
+    "W_MultiAge_WIN24A13": { prod: {"BronzeAge":{"population":580,"demandHappiness":580,"medals_24h":540,"strategy_points_24h":109},"IronAge":{"population":1240,"demandHappiness":1240,"medals_24h":700,"strategy_points_24h":109},"EarlyMiddleAge":{"population":1900,"demandHappiness":1900,"medals_24h":850,"strategy_points_24h":109},"HighMiddleAge":{"population":2670,"demandHappiness":2670,"medals_24h":1010,"strategy_points_24h":109},"LateMiddleAge":{"population":3510,"demandHappiness":3510,"medals_24h":1160,"strategy_points_24h":109},"ColonialAge":{"population":4430,"demandHappiness":4430,"medals_24h":1400,"strategy_points_24h":109},"IndustrialAge":{"population":5410,"demandHappiness":5410,"medals_24h":1940,"strategy_points_24h":109},"ProgressiveEra":{"population":6460,"demandHappiness":6460,"medals_24h":2720,"strategy_points_24h":109},"ModernEra":{"population":7570,"demandHappiness":7570,"medals_24h":3880,"strategy_points_24h":109},"PostModernEra":{"population":8730,"demandHappiness":8730,"medals_24h":5430,"strategy_points_24h":109},"ContemporaryEra":{"population":9950,"demandHappiness":9950,"medals_24h":7760,"strategy_points_24h":109},"TomorrowEra":{"population":11210,"demandHappiness":11210,"medals_24h":10480,"strategy_points_24h":109},"FutureEra":{"population":12540,"demandHappiness":12540,"medals_24h":12800,"strategy_points_24h":109},"ArcticFuture":{"population":13900,"demandHappiness":13900,"medals_24h":15520,"strategy_points_24h":109},"OceanicFuture":{"population":15320,"demandHappiness":15320,"medals_24h":17850,"strategy_points_24h":109},"VirtualFuture":{"population":16770,"demandHappiness":16770,"medals_24h":21730,"strategy_points_24h":109},"SpaceAgeMars":{"population":26550,"demandHappiness":26550,"medals_24h":26380,"strategy_points_24h":109},"SpaceAgeAsteroidBelt":{"population":28840,"demandHappiness":28840,"medals_24h":31040,"strategy_points_24h":109},"SpaceAgeVenus":{"population":31170,"demandHappiness":31170,"medals_24h":35690,"strategy_points_24h":109},"SpaceAgeJupiterMoon":{"population":33560,"demandHappiness":33560,"medals_24h":40350,"strategy_points_24h":109},"SpaceAgeTitan":{"population":36000,"demandHappiness":36000,"medals_24h":45000,"strategy_points_24h":109},"SpaceAgeSpaceHub":{"population":38440,"demandHappiness":38440,"medals_24h":49660,"strategy_points_24h":109}}, boosts: [{"type":"att_boost_attacker","value":82,"feature":"all"},{"type":"att_def_boost_attacker","value":15,"feature":"guild_raids"},{"type":"att_boost_defender","value":82,"feature":"all"},{"type":"guild_raids_action_points_collection","value":200,"feature":"all"}] },
+    "W_MultiAge_WIN24A11": { prod: {"BronzeAge":{"population":580,"demandHappiness":580,"medals_24h":540,"strategy_points_24h":88},"IronAge":{"population":1240,"demandHappiness":1240,"medals_24h":700,"strategy_points_24h":89},"EarlyMiddleAge":{"population":1900,"demandHappiness":1900,"medals_24h":850,"strategy_points_24h":90},"HighMiddleAge":{"population":2670,"demandHappiness":2670,"medals_24h":1010,"strategy_points_24h":91},"LateMiddleAge":{"population":3510,"demandHappiness":3510,"medals_24h":1160,"strategy_points_24h":92},"ColonialAge":{"population":4430,"demandHappiness":4430,"medals_24h":1400,"strategy_points_24h":93},"IndustrialAge":{"population":5410,"demandHappiness":5410,"medals_24h":1940,"strategy_points_24h":94},"ProgressiveEra":{"population":6460,"demandHappiness":6460,"medals_24h":2720,"strategy_points_24h":95},"ModernEra":{"population":7570,"demandHappiness":7570,"medals_24h":3880,"strategy_points_24h":96},"PostModernEra":{"population":8730,"demandHappiness":8730,"medals_24h":5430,"strategy_points_24h":97},"ContemporaryEra":{"population":9950,"demandHappiness":9950,"medals_24h":7760,"strategy_points_24h":98},"TomorrowEra":{"population":11210,"demandHappiness":11210,"medals_24h":10470,"strategy_points_24h":99},"FutureEra":{"population":12530,"demandHappiness":12530,"medals_24h":12800,"strategy_points_24h":100},"ArcticFuture":{"population":13900,"demandHappiness":13900,"medals_24h":15520,"strategy_points_24h":101},"OceanicFuture":{"population":15320,"demandHappiness":15320,"medals_24h":17840,"strategy_points_24h":102},"VirtualFuture":{"population":16770,"demandHappiness":16770,"medals_24h":21720,"strategy_points_24h":103},"SpaceAgeMars":{"population":26550,"demandHappiness":26550,"medals_24h":26380,"strategy_points_24h":104},"SpaceAgeAsteroidBelt":{"population":28830,"demandHappiness":28830,"medals_24h":31030,"strategy_points_24h":105},"SpaceAgeVenus":{"population":31170,"demandHappiness":31170,"medals_24h":35690,"strategy_points_24h":106},"SpaceAgeJupiterMoon":{"population":33560,"demandHappiness":33560,"medals_24h":40340,"strategy_points_24h":107},"SpaceAgeTitan":{"population":36000,"demandHappiness":36000,"medals_24h":45000,"strategy_points_24h":108},"SpaceAgeSpaceHub":{"population":38440,"demandHappiness":38440,"medals_24h":49660,"strategy_points_24h":109}}, boosts: [{"type":"att_boost_attacker","value":61,"feature":"all"},{"type":"def_boost_attacker","value":15,"feature":"guild_raids"},{"type":"att_boost_defender","value":61,"feature":"all"},{"type":"guild_raids_action_points_collection","value":100,"feature":"all"}] },
+    "W_MultiAge_WIN24A1": { prod: {"BronzeAge":{"population":300,"demandHappiness":300,"medals_24h":50,"strategy_points_24h":34},"IronAge":{"population":640,"demandHappiness":640,"medals_24h":70,"strategy_points_24h":35},"EarlyMiddleAge":{"population":980,"demandHappiness":980,"medals_24h":90,"strategy_points_24h":36},"HighMiddleAge":{"population":1370,"demandHappiness":1370,"medals_24h":100,"strategy_points_24h":37},"LateMiddleAge":{"population":1800,"demandHappiness":1800,"medals_24h":120,"strategy_points_24h":38},"ColonialAge":{"population":2270,"demandHappiness":2270,"medals_24h":140,"strategy_points_24h":39},"IndustrialAge":{"population":2770,"demandHappiness":2770,"medals_24h":190,"strategy_points_24h":40},"ProgressiveEra":{"population":3310,"demandHappiness":3310,"medals_24h":270,"strategy_points_24h":41},"ModernEra":{"population":3880,"demandHappiness":3880,"medals_24h":390,"strategy_points_24h":42},"PostModernEra":{"population":4470,"demandHappiness":4470,"medals_24h":540,"strategy_points_24h":43},"ContemporaryEra":{"population":5100,"demandHappiness":5100,"medals_24h":780,"strategy_points_24h":44},"TomorrowEra":{"population":5740,"demandHappiness":5740,"medals_24h":1050,"strategy_points_24h":45},"FutureEra":{"population":6420,"demandHappiness":6420,"medals_24h":1280,"strategy_points_24h":46},"ArcticFuture":{"population":7130,"demandHappiness":7130,"medals_24h":1550,"strategy_points_24h":47},"OceanicFuture":{"population":7850,"demandHappiness":7850,"medals_24h":1780,"strategy_points_24h":48},"VirtualFuture":{"population":8590,"demandHappiness":8590,"medals_24h":2170,"strategy_points_24h":49},"SpaceAgeMars":{"population":13600,"demandHappiness":13600,"medals_24h":2640,"strategy_points_24h":50},"SpaceAgeAsteroidBelt":{"population":14780,"demandHappiness":14780,"medals_24h":3100,"strategy_points_24h":51},"SpaceAgeVenus":{"population":15970,"demandHappiness":15970,"medals_24h":3570,"strategy_points_24h":52},"SpaceAgeJupiterMoon":{"population":17200,"demandHappiness":17200,"medals_24h":4030,"strategy_points_24h":53},"SpaceAgeTitan":{"population":18450,"demandHappiness":18450,"medals_24h":4500,"strategy_points_24h":54},"SpaceAgeSpaceHub":{"population":19700,"demandHappiness":19700,"medals_24h":4970,"strategy_points_24h":55}}, boosts: [{"type":"att_boost_attacker","value":16,"feature":"all"},{"type":"att_boost_defender","value":16,"feature":"all"}] },
+    "W_MultiAge_WIN24A10": { prod: {"BronzeAge":{"population":580,"demandHappiness":580,"medals_24h":540,"strategy_points_24h":88},"IronAge":{"population":1240,"demandHappiness":1240,"medals_24h":700,"strategy_points_24h":89},"EarlyMiddleAge":{"population":1900,"demandHappiness":1900,"medals_24h":850,"strategy_points_24h":90},"HighMiddleAge":{"population":2670,"demandHappiness":2670,"medals_24h":1010,"strategy_points_24h":91},"LateMiddleAge":{"population":3510,"demandHappiness":3510,"medals_24h":1160,"strategy_points_24h":92},"ColonialAge":{"population":4430,"demandHappiness":4430,"medals_24h":1400,"strategy_points_24h":93},"IndustrialAge":{"population":5410,"demandHappiness":5410,"medals_24h":1940,"strategy_points_24h":94},"ProgressiveEra":{"population":6460,"demandHappiness":6460,"medals_24h":2720,"strategy_points_24h":95},"ModernEra":{"population":7570,"demandHappiness":7570,"medals_24h":3880,"strategy_points_24h":96},"PostModernEra":{"population":8730,"demandHappiness":8730,"medals_24h":5430,"strategy_points_24h":97},"ContemporaryEra":{"population":9950,"demandHappiness":9950,"medals_24h":7760,"strategy_points_24h":98},"TomorrowEra":{"population":11210,"demandHappiness":11210,"medals_24h":10470,"strategy_points_24h":99},"FutureEra":{"population":12530,"demandHappiness":12530,"medals_24h":12800,"strategy_points_24h":100},"ArcticFuture":{"population":13900,"demandHappiness":13900,"medals_24h":15520,"strategy_points_24h":101},"OceanicFuture":{"population":15320,"demandHappiness":15320,"medals_24h":17840,"strategy_points_24h":102},"VirtualFuture":{"population":16770,"demandHappiness":16770,"medals_24h":21720,"strategy_points_24h":103},"SpaceAgeMars":{"population":26550,"demandHappiness":26550,"medals_24h":26380,"strategy_points_24h":104},"SpaceAgeAsteroidBelt":{"population":28830,"demandHappiness":28830,"medals_24h":31030,"strategy_points_24h":105},"SpaceAgeVenus":{"population":31170,"demandHappiness":31170,"medals_24h":35690,"strategy_points_24h":106},"SpaceAgeJupiterMoon":{"population":33560,"demandHappiness":33560,"medals_24h":40340,"strategy_points_24h":107},"SpaceAgeTitan":{"population":36000,"demandHappiness":36000,"medals_24h":45000,"strategy_points_24h":108},"SpaceAgeSpaceHub":{"population":38440,"demandHappiness":38440,"medals_24h":49660,"strategy_points_24h":109}}, boosts: [{"type":"att_boost_attacker","value":61,"feature":"all"},{"type":"att_boost_defender","value":61,"feature":"all"}] },
+    "W_MultiAge_WIN24A2": { prod: {"BronzeAge":{"population":320,"demandHappiness":320,"medals_24h":110,"strategy_points_24h":40},"IronAge":{"population":680,"demandHappiness":680,"medals_24h":140,"strategy_points_24h":41},"EarlyMiddleAge":{"population":1050,"demandHappiness":1050,"medals_24h":170,"strategy_points_24h":42},"HighMiddleAge":{"population":1470,"demandHappiness":1470,"medals_24h":200,"strategy_points_24h":43},"LateMiddleAge":{"population":1930,"demandHappiness":1930,"medals_24h":230,"strategy_points_24h":44},"ColonialAge":{"population":2440,"demandHappiness":2440,"medals_24h":280,"strategy_points_24h":45},"IndustrialAge":{"population":2980,"demandHappiness":2980,"medals_24h":390,"strategy_points_24h":46},"ProgressiveEra":{"population":3550,"demandHappiness":3550,"medals_24h":540,"strategy_points_24h":47},"ModernEra":{"population":4160,"demandHappiness":4160,"medals_24h":780,"strategy_points_24h":48},"PostModernEra":{"population":4800,"demandHappiness":4800,"medals_24h":1090,"strategy_points_24h":49},"ContemporaryEra":{"population":5470,"demandHappiness":5470,"medals_24h":1550,"strategy_points_24h":50},"TomorrowEra":{"population":6160,"demandHappiness":6160,"medals_24h":2090,"strategy_points_24h":51},"FutureEra":{"population":6890,"demandHappiness":6890,"medals_24h":2560,"strategy_points_24h":52},"ArcticFuture":{"population":7650,"demandHappiness":7650,"medals_24h":3100,"strategy_points_24h":53},"OceanicFuture":{"population":8420,"demandHappiness":8420,"medals_24h":3570,"strategy_points_24h":54},"VirtualFuture":{"population":9220,"demandHappiness":9220,"medals_24h":4340,"strategy_points_24h":55},"SpaceAgeMars":{"population":14600,"demandHappiness":14600,"medals_24h":5280,"strategy_points_24h":56},"SpaceAgeAsteroidBelt":{"population":15860,"demandHappiness":15860,"medals_24h":6210,"strategy_points_24h":57},"SpaceAgeVenus":{"population":17140,"demandHappiness":17140,"medals_24h":7140,"strategy_points_24h":58},"SpaceAgeJupiterMoon":{"population":18460,"demandHappiness":18460,"medals_24h":8070,"strategy_points_24h":59},"SpaceAgeTitan":{"population":19800,"demandHappiness":19800,"medals_24h":9000,"strategy_points_24h":60},"SpaceAgeSpaceHub":{"population":21140,"demandHappiness":21140,"medals_24h":9930,"strategy_points_24h":61}}, boosts: [{"type":"att_boost_attacker","value":21,"feature":"all"},{"type":"att_boost_defender","value":21,"feature":"all"}] },
+    "W_MultiAge_WIN24A3": { prod: {"BronzeAge":{"population":340,"demandHappiness":340,"medals_24h":160,"strategy_points_24h":46},"IronAge":{"population":730,"demandHappiness":730,"medals_24h":210,"strategy_points_24h":47},"EarlyMiddleAge":{"population":1120,"demandHappiness":1120,"medals_24h":260,"strategy_points_24h":48},"HighMiddleAge":{"population":1570,"demandHappiness":1570,"medals_24h":300,"strategy_points_24h":49},"LateMiddleAge":{"population":2060,"demandHappiness":2060,"medals_24h":350,"strategy_points_24h":50},"ColonialAge":{"population":2600,"demandHappiness":2600,"medals_24h":420,"strategy_points_24h":51},"IndustrialAge":{"population":3180,"demandHappiness":3180,"medals_24h":580,"strategy_points_24h":52},"ProgressiveEra":{"population":3800,"demandHappiness":3800,"medals_24h":810,"strategy_points_24h":53},"ModernEra":{"population":4450,"demandHappiness":4450,"medals_24h":1160,"strategy_points_24h":54},"PostModernEra":{"population":5130,"demandHappiness":5130,"medals_24h":1630,"strategy_points_24h":55},"ContemporaryEra":{"population":5840,"demandHappiness":5840,"medals_24h":2330,"strategy_points_24h":56},"TomorrowEra":{"population":6590,"demandHappiness":6590,"medals_24h":3140,"strategy_points_24h":57},"FutureEra":{"population":7360,"demandHappiness":7360,"medals_24h":3840,"strategy_points_24h":58},"ArcticFuture":{"population":8170,"demandHappiness":8170,"medals_24h":4660,"strategy_points_24h":59},"OceanicFuture":{"population":9000,"demandHappiness":9000,"medals_24h":5350,"strategy_points_24h":60},"VirtualFuture":{"population":9850,"demandHappiness":9850,"medals_24h":6520,"strategy_points_24h":61},"SpaceAgeMars":{"population":15600,"demandHappiness":15600,"medals_24h":7910,"strategy_points_24h":62},"SpaceAgeAsteroidBelt":{"population":16940,"demandHappiness":16940,"medals_24h":9310,"strategy_points_24h":63},"SpaceAgeVenus":{"population":18310,"demandHappiness":18310,"medals_24h":10710,"strategy_points_24h":64},"SpaceAgeJupiterMoon":{"population":19720,"demandHappiness":19720,"medals_24h":12100,"strategy_points_24h":65},"SpaceAgeTitan":{"population":21150,"demandHappiness":21150,"medals_24h":13500,"strategy_points_24h":66},"SpaceAgeSpaceHub":{"population":22580,"demandHappiness":22580,"medals_24h":14900,"strategy_points_24h":67}}, boosts: [{"type":"att_boost_attacker","value":26,"feature":"all"},{"type":"att_boost_defender","value":26,"feature":"all"}] },
+    "W_MultiAge_WIN24A4": { prod: {"BronzeAge":{"population":360,"demandHappiness":360,"medals_24h":220,"strategy_points_24h":52},"IronAge":{"population":780,"demandHappiness":780,"medals_24h":280,"strategy_points_24h":53},"EarlyMiddleAge":{"population":1190,"demandHappiness":1190,"medals_24h":340,"strategy_points_24h":54},"HighMiddleAge":{"population":1670,"demandHappiness":1670,"medals_24h":400,"strategy_points_24h":55},"LateMiddleAge":{"population":2190,"demandHappiness":2190,"medals_24h":470,"strategy_points_24h":56},"ColonialAge":{"population":2770,"demandHappiness":2770,"medals_24h":560,"strategy_points_24h":57},"IndustrialAge":{"population":3380,"demandHappiness":3380,"medals_24h":780,"strategy_points_24h":58},"ProgressiveEra":{"population":4040,"demandHappiness":4040,"medals_24h":1090,"strategy_points_24h":59},"ModernEra":{"population":4730,"demandHappiness":4730,"medals_24h":1550,"strategy_points_24h":60},"PostModernEra":{"population":5450,"demandHappiness":5450,"medals_24h":2170,"strategy_points_24h":61},"ContemporaryEra":{"population":6220,"demandHappiness":6220,"medals_24h":3100,"strategy_points_24h":62},"TomorrowEra":{"population":7010,"demandHappiness":7010,"medals_24h":4190,"strategy_points_24h":63},"FutureEra":{"population":7830,"demandHappiness":7830,"medals_24h":5120,"strategy_points_24h":64},"ArcticFuture":{"population":8690,"demandHappiness":8690,"medals_24h":6210,"strategy_points_24h":65},"OceanicFuture":{"population":9570,"demandHappiness":9570,"medals_24h":7140,"strategy_points_24h":66},"VirtualFuture":{"population":10480,"demandHappiness":10480,"medals_24h":8690,"strategy_points_24h":67},"SpaceAgeMars":{"population":16590,"demandHappiness":16590,"medals_24h":10550,"strategy_points_24h":68},"SpaceAgeAsteroidBelt":{"population":18020,"demandHappiness":18020,"medals_24h":12410,"strategy_points_24h":69},"SpaceAgeVenus":{"population":19480,"demandHappiness":19480,"medals_24h":14280,"strategy_points_24h":70},"SpaceAgeJupiterMoon":{"population":20980,"demandHappiness":20980,"medals_24h":16140,"strategy_points_24h":71},"SpaceAgeTitan":{"population":22500,"demandHappiness":22500,"medals_24h":18000,"strategy_points_24h":72},"SpaceAgeSpaceHub":{"population":24020,"demandHappiness":24020,"medals_24h":19860,"strategy_points_24h":73}}, boosts: [{"type":"att_boost_attacker","value":31,"feature":"all"},{"type":"att_boost_defender","value":31,"feature":"all"}] },
+    "W_MultiAge_WIN24A5": { prod: {"BronzeAge":{"population":380,"demandHappiness":380,"medals_24h":270,"strategy_points_24h":58},"IronAge":{"population":820,"demandHappiness":820,"medals_24h":350,"strategy_points_24h":59},"EarlyMiddleAge":{"population":1260,"demandHappiness":1260,"medals_24h":430,"strategy_points_24h":60},"HighMiddleAge":{"population":1770,"demandHappiness":1770,"medals_24h":500,"strategy_points_24h":61},"LateMiddleAge":{"population":2320,"demandHappiness":2320,"medals_24h":580,"strategy_points_24h":62},"ColonialAge":{"population":2930,"demandHappiness":2930,"medals_24h":700,"strategy_points_24h":63},"IndustrialAge":{"population":3590,"demandHappiness":3590,"medals_24h":970,"strategy_points_24h":64},"ProgressiveEra":{"population":4280,"demandHappiness":4280,"medals_24h":1360,"strategy_points_24h":65},"ModernEra":{"population":5020,"demandHappiness":5020,"medals_24h":1940,"strategy_points_24h":66},"PostModernEra":{"population":5780,"demandHappiness":5780,"medals_24h":2720,"strategy_points_24h":67},"ContemporaryEra":{"population":6590,"demandHappiness":6590,"medals_24h":3880,"strategy_points_24h":68},"TomorrowEra":{"population":7430,"demandHappiness":7430,"medals_24h":5240,"strategy_points_24h":69},"FutureEra":{"population":8300,"demandHappiness":8300,"medals_24h":6400,"strategy_points_24h":70},"ArcticFuture":{"population":9210,"demandHappiness":9210,"medals_24h":7760,"strategy_points_24h":71},"OceanicFuture":{"population":10150,"demandHappiness":10150,"medals_24h":8920,"strategy_points_24h":72},"VirtualFuture":{"population":11110,"demandHappiness":11110,"medals_24h":10860,"strategy_points_24h":73},"SpaceAgeMars":{"population":17590,"demandHappiness":17590,"medals_24h":13190,"strategy_points_24h":74},"SpaceAgeAsteroidBelt":{"population":19100,"demandHappiness":19100,"medals_24h":15520,"strategy_points_24h":75},"SpaceAgeVenus":{"population":20650,"demandHappiness":20650,"medals_24h":17840,"strategy_points_24h":76},"SpaceAgeJupiterMoon":{"population":22230,"demandHappiness":22230,"medals_24h":20170,"strategy_points_24h":77},"SpaceAgeTitan":{"population":23850,"demandHappiness":23850,"medals_24h":22500,"strategy_points_24h":78},"SpaceAgeSpaceHub":{"population":25470,"demandHappiness":25470,"medals_24h":24830,"strategy_points_24h":79}}, boosts: [{"type":"att_boost_attacker","value":36,"feature":"all"},{"type":"att_boost_defender","value":36,"feature":"all"}] },
+    "W_MultiAge_WIN24A6": { prod: {"BronzeAge":{"population":400,"demandHappiness":400,"medals_24h":330,"strategy_points_24h":64},"IronAge":{"population":870,"demandHappiness":870,"medals_24h":420,"strategy_points_24h":65},"EarlyMiddleAge":{"population":1330,"demandHappiness":1330,"medals_24h":510,"strategy_points_24h":66},"HighMiddleAge":{"population":1870,"demandHappiness":1870,"medals_24h":610,"strategy_points_24h":67},"LateMiddleAge":{"population":2460,"demandHappiness":2460,"medals_24h":700,"strategy_points_24h":68},"ColonialAge":{"population":3100,"demandHappiness":3100,"medals_24h":840,"strategy_points_24h":69},"IndustrialAge":{"population":3790,"demandHappiness":3790,"medals_24h":1160,"strategy_points_24h":70},"ProgressiveEra":{"population":4520,"demandHappiness":4520,"medals_24h":1630,"strategy_points_24h":71},"ModernEra":{"population":5300,"demandHappiness":5300,"medals_24h":2330,"strategy_points_24h":72},"PostModernEra":{"population":6110,"demandHappiness":6110,"medals_24h":3260,"strategy_points_24h":73},"ContemporaryEra":{"population":6960,"demandHappiness":6960,"medals_24h":4660,"strategy_points_24h":74},"TomorrowEra":{"population":7850,"demandHappiness":7850,"medals_24h":6280,"strategy_points_24h":75},"FutureEra":{"population":8770,"demandHappiness":8770,"medals_24h":7680,"strategy_points_24h":76},"ArcticFuture":{"population":9730,"demandHappiness":9730,"medals_24h":9310,"strategy_points_24h":77},"OceanicFuture":{"population":10720,"demandHappiness":10720,"medals_24h":10710,"strategy_points_24h":78},"VirtualFuture":{"population":11740,"demandHappiness":11740,"medals_24h":13030,"strategy_points_24h":79},"SpaceAgeMars":{"population":18580,"demandHappiness":18580,"medals_24h":15830,"strategy_points_24h":80},"SpaceAgeAsteroidBelt":{"population":20180,"demandHappiness":20180,"medals_24h":18620,"strategy_points_24h":81},"SpaceAgeVenus":{"population":21820,"demandHappiness":21820,"medals_24h":21410,"strategy_points_24h":82},"SpaceAgeJupiterMoon":{"population":23490,"demandHappiness":23490,"medals_24h":24210,"strategy_points_24h":83},"SpaceAgeTitan":{"population":25200,"demandHappiness":25200,"medals_24h":27000,"strategy_points_24h":84},"SpaceAgeSpaceHub":{"population":26910,"demandHappiness":26910,"medals_24h":29790,"strategy_points_24h":85}}, boosts: [{"type":"att_boost_attacker","value":41,"feature":"all"},{"type":"att_boost_defender","value":41,"feature":"all"}] },
+    "W_MultiAge_WIN24A7": { prod: {"BronzeAge":{"population":430,"demandHappiness":430,"medals_24h":380,"strategy_points_24h":70},"IronAge":{"population":910,"demandHappiness":910,"medals_24h":490,"strategy_points_24h":71},"EarlyMiddleAge":{"population":1400,"demandHappiness":1400,"medals_24h":600,"strategy_points_24h":72},"HighMiddleAge":{"population":1970,"demandHappiness":1970,"medals_24h":710,"strategy_points_24h":73},"LateMiddleAge":{"population":2590,"demandHappiness":2590,"medals_24h":810,"strategy_points_24h":74},"ColonialAge":{"population":3270,"demandHappiness":3270,"medals_24h":980,"strategy_points_24h":75},"IndustrialAge":{"population":3990,"demandHappiness":3990,"medals_24h":1360,"strategy_points_24h":76},"ProgressiveEra":{"population":4760,"demandHappiness":4760,"medals_24h":1900,"strategy_points_24h":77},"ModernEra":{"population":5580,"demandHappiness":5580,"medals_24h":2720,"strategy_points_24h":78},"PostModernEra":{"population":6440,"demandHappiness":6440,"medals_24h":3800,"strategy_points_24h":79},"ContemporaryEra":{"population":7340,"demandHappiness":7340,"medals_24h":5430,"strategy_points_24h":80},"TomorrowEra":{"population":8270,"demandHappiness":8270,"medals_24h":7330,"strategy_points_24h":81},"FutureEra":{"population":9240,"demandHappiness":9240,"medals_24h":8960,"strategy_points_24h":82},"ArcticFuture":{"population":10250,"demandHappiness":10250,"medals_24h":10860,"strategy_points_24h":83},"OceanicFuture":{"population":11300,"demandHappiness":11300,"medals_24h":12490,"strategy_points_24h":84},"VirtualFuture":{"population":12370,"demandHappiness":12370,"medals_24h":15210,"strategy_points_24h":85},"SpaceAgeMars":{"population":19580,"demandHappiness":19580,"medals_24h":18470,"strategy_points_24h":86},"SpaceAgeAsteroidBelt":{"population":21270,"demandHappiness":21270,"medals_24h":21720,"strategy_points_24h":87},"SpaceAgeVenus":{"population":22980,"demandHappiness":22980,"medals_24h":24980,"strategy_points_24h":88},"SpaceAgeJupiterMoon":{"population":24750,"demandHappiness":24750,"medals_24h":28240,"strategy_points_24h":89},"SpaceAgeTitan":{"population":26550,"demandHappiness":26550,"medals_24h":31500,"strategy_points_24h":90},"SpaceAgeSpaceHub":{"population":28350,"demandHappiness":28350,"medals_24h":34760,"strategy_points_24h":91}}, boosts: [{"type":"att_boost_attacker","value":46,"feature":"all"},{"type":"att_boost_defender","value":46,"feature":"all"}] },
+    "W_MultiAge_WIN24A8": { prod: {"BronzeAge":{"population":450,"demandHappiness":450,"medals_24h":430,"strategy_points_24h":76},"IronAge":{"population":960,"demandHappiness":960,"medals_24h":560,"strategy_points_24h":77},"EarlyMiddleAge":{"population":1480,"demandHappiness":1480,"medals_24h":680,"strategy_points_24h":78},"HighMiddleAge":{"population":2070,"demandHappiness":2070,"medals_24h":810,"strategy_points_24h":79},"LateMiddleAge":{"population":2720,"demandHappiness":2720,"medals_24h":930,"strategy_points_24h":80},"ColonialAge":{"population":3430,"demandHappiness":3430,"medals_24h":1120,"strategy_points_24h":81},"IndustrialAge":{"population":4190,"demandHappiness":4190,"medals_24h":1550,"strategy_points_24h":82},"ProgressiveEra":{"population":5010,"demandHappiness":5010,"medals_24h":2170,"strategy_points_24h":83},"ModernEra":{"population":5870,"demandHappiness":5870,"medals_24h":3100,"strategy_points_24h":84},"PostModernEra":{"population":6760,"demandHappiness":6760,"medals_24h":4340,"strategy_points_24h":85},"ContemporaryEra":{"population":7710,"demandHappiness":7710,"medals_24h":6210,"strategy_points_24h":86},"TomorrowEra":{"population":8690,"demandHappiness":8690,"medals_24h":8380,"strategy_points_24h":87},"FutureEra":{"population":9710,"demandHappiness":9710,"medals_24h":10240,"strategy_points_24h":88},"ArcticFuture":{"population":10780,"demandHappiness":10780,"medals_24h":12410,"strategy_points_24h":89},"OceanicFuture":{"population":11870,"demandHappiness":11870,"medals_24h":14280,"strategy_points_24h":90},"VirtualFuture":{"population":13000,"demandHappiness":13000,"medals_24h":17380,"strategy_points_24h":91},"SpaceAgeMars":{"population":20570,"demandHappiness":20570,"medals_24h":21100,"strategy_points_24h":92},"SpaceAgeAsteroidBelt":{"population":22350,"demandHappiness":22350,"medals_24h":24830,"strategy_points_24h":93},"SpaceAgeVenus":{"population":24150,"demandHappiness":24150,"medals_24h":28550,"strategy_points_24h":94},"SpaceAgeJupiterMoon":{"population":26010,"demandHappiness":26010,"medals_24h":32280,"strategy_points_24h":95},"SpaceAgeTitan":{"population":27900,"demandHappiness":27900,"medals_24h":36000,"strategy_points_24h":96},"SpaceAgeSpaceHub":{"population":29790,"demandHappiness":29790,"medals_24h":39720,"strategy_points_24h":97}}, boosts: [{"type":"att_boost_attacker","value":51,"feature":"all"},{"type":"att_boost_defender","value":51,"feature":"all"}] },
+    "W_MultiAge_WIN24A9": { prod: {"BronzeAge":{"population":530,"demandHappiness":530,"medals_24h":490,"strategy_points_24h":82},"IronAge":{"population":1150,"demandHappiness":1150,"medals_24h":630,"strategy_points_24h":83},"EarlyMiddleAge":{"population":1760,"demandHappiness":1760,"medals_24h":770,"strategy_points_24h":84},"HighMiddleAge":{"population":2470,"demandHappiness":2470,"medals_24h":910,"strategy_points_24h":85},"LateMiddleAge":{"population":3240,"demandHappiness":3240,"medals_24h":1050,"strategy_points_24h":86},"ColonialAge":{"population":4100,"demandHappiness":4100,"medals_24h":1260,"strategy_points_24h":87},"IndustrialAge":{"population":5010,"demandHappiness":5010,"medals_24h":1750,"strategy_points_24h":88},"ProgressiveEra":{"population":5980,"demandHappiness":5980,"medals_24h":2440,"strategy_points_24h":89},"ModernEra":{"population":7000,"demandHappiness":7000,"medals_24h":3490,"strategy_points_24h":90},"PostModernEra":{"population":8070,"demandHappiness":8070,"medals_24h":4890,"strategy_points_24h":91},"ContemporaryEra":{"population":9200,"demandHappiness":9200,"medals_24h":6980,"strategy_points_24h":92},"TomorrowEra":{"population":10370,"demandHappiness":10370,"medals_24h":9430,"strategy_points_24h":93},"FutureEra":{"population":11590,"demandHappiness":11590,"medals_24h":11520,"strategy_points_24h":94},"ArcticFuture":{"population":12860,"demandHappiness":12860,"medals_24h":13970,"strategy_points_24h":95},"OceanicFuture":{"population":14170,"demandHappiness":14170,"medals_24h":16060,"strategy_points_24h":96},"VirtualFuture":{"population":15510,"demandHappiness":15510,"medals_24h":19550,"strategy_points_24h":97},"SpaceAgeMars":{"population":24550,"demandHappiness":24550,"medals_24h":23740,"strategy_points_24h":98},"SpaceAgeAsteroidBelt":{"population":26670,"demandHappiness":26670,"medals_24h":27930,"strategy_points_24h":99},"SpaceAgeVenus":{"population":28830,"demandHappiness":28830,"medals_24h":32120,"strategy_points_24h":100},"SpaceAgeJupiterMoon":{"population":31040,"demandHappiness":31040,"medals_24h":36310,"strategy_points_24h":101},"SpaceAgeTitan":{"population":33300,"demandHappiness":33300,"medals_24h":40500,"strategy_points_24h":102},"SpaceAgeSpaceHub":{"population":35560,"demandHappiness":35560,"medals_24h":44690,"strategy_points_24h":103}}, boosts: [{"type":"att_boost_attacker","value":56,"feature":"all"},{"type":"att_boost_defender","value":56,"feature":"all"}] },
+    "W_MultiAge_WIN23B1": { prod: {"AllAge":{"strategy_points_24h":31,"random_good_of_age_24h":27,"random_good_of_previous_age_24h":27}}, boosts: [{"type":"att_boost_attacker","value":45,"feature":"all"},{"type":"att_boost_defender","value":56,"feature":"all"},{"type":"def_boost_defender","value":75,"feature":"all"}] },
+    "W_MultiAge_WIN25A3": { prod: {"BronzeAge":{"happiness":1190,"supplies_24h":1010,"strategy_points_24h":72},"IronAge":{"happiness":2050,"supplies_24h":2420,"strategy_points_24h":72},"EarlyMiddleAge":{"happiness":2270,"supplies_24h":4030,"strategy_points_24h":72},"HighMiddleAge":{"happiness":2530,"supplies_24h":5650,"strategy_points_24h":72},"LateMiddleAge":{"happiness":2820,"supplies_24h":7460,"strategy_points_24h":72},"ColonialAge":{"happiness":3320,"supplies_24h":9480,"strategy_points_24h":72},"IndustrialAge":{"happiness":3740,"supplies_24h":11500,"strategy_points_24h":72},"ProgressiveEra":{"happiness":4110,"supplies_24h":13510,"strategy_points_24h":72},"ModernEra":{"happiness":4400,"supplies_24h":15730,"strategy_points_24h":72},"PostModernEra":{"happiness":4580,"supplies_24h":17950,"strategy_points_24h":72},"ContemporaryEra":{"happiness":5320,"supplies_24h":20170,"strategy_points_24h":72},"TomorrowEra":{"happiness":6460,"supplies_24h":22590,"strategy_points_24h":72},"FutureEra":{"happiness":7740,"supplies_24h":24810,"strategy_points_24h":72},"ArcticFuture":{"happiness":9020,"supplies_24h":27230,"strategy_points_24h":72},"OceanicFuture":{"happiness":10400,"supplies_24h":29850,"strategy_points_24h":72},"VirtualFuture":{"happiness":12430,"supplies_24h":32270,"strategy_points_24h":72},"SpaceAgeMars":{"happiness":19890,"supplies_24h":52240,"strategy_points_24h":72},"SpaceAgeAsteroidBelt":{"happiness":21610,"supplies_24h":56070,"strategy_points_24h":72},"SpaceAgeVenus":{"happiness":23350,"supplies_24h":60100,"strategy_points_24h":72},"SpaceAgeJupiterMoon":{"happiness":25150,"supplies_24h":63930,"strategy_points_24h":72},"SpaceAgeTitan":{"happiness":26980,"supplies_24h":67970,"strategy_points_24h":72},"SpaceAgeSpaceHub":{"happiness":28800,"supplies_24h":72000,"strategy_points_24h":72}}, boosts: [{"type":"att_def_boost_defender","value":9,"feature":"all"},{"type":"att_def_boost_defender","value":36,"feature":"battleground"}] },
+    "W_MultiAge_WIN25A6": { prod: {"BronzeAge":{"happiness":2080,"supplies_24h":1760,"strategy_points_24h":126},"IronAge":{"happiness":3590,"supplies_24h":4240,"strategy_points_24h":126},"EarlyMiddleAge":{"happiness":3970,"supplies_24h":7060,"strategy_points_24h":126},"HighMiddleAge":{"happiness":4430,"supplies_24h":9880,"strategy_points_24h":126},"LateMiddleAge":{"happiness":4940,"supplies_24h":13060,"strategy_points_24h":126},"ColonialAge":{"happiness":5810,"supplies_24h":16590,"strategy_points_24h":126},"IndustrialAge":{"happiness":6550,"supplies_24h":20120,"strategy_points_24h":126},"ProgressiveEra":{"happiness":7190,"supplies_24h":23650,"strategy_points_24h":126},"ModernEra":{"happiness":7700,"supplies_24h":27530,"strategy_points_24h":126},"PostModernEra":{"happiness":8020,"supplies_24h":31410,"strategy_points_24h":126},"ContemporaryEra":{"happiness":9320,"supplies_24h":35290,"strategy_points_24h":126},"TomorrowEra":{"happiness":11310,"supplies_24h":39530,"strategy_points_24h":126},"FutureEra":{"happiness":13550,"supplies_24h":43410,"strategy_points_24h":126},"ArcticFuture":{"happiness":15780,"supplies_24h":47650,"strategy_points_24h":126},"OceanicFuture":{"happiness":18210,"supplies_24h":52240,"strategy_points_24h":126},"VirtualFuture":{"happiness":21750,"supplies_24h":56470,"strategy_points_24h":126},"SpaceAgeMars":{"happiness":34810,"supplies_24h":91410,"strategy_points_24h":126},"SpaceAgeAsteroidBelt":{"happiness":37820,"supplies_24h":98120,"strategy_points_24h":126},"SpaceAgeVenus":{"happiness":40860,"supplies_24h":105180,"strategy_points_24h":126},"SpaceAgeJupiterMoon":{"happiness":44020,"supplies_24h":111880,"strategy_points_24h":126},"SpaceAgeTitan":{"happiness":47210,"supplies_24h":118940,"strategy_points_24h":126},"SpaceAgeSpaceHub":{"happiness":50400,"supplies_24h":126000,"strategy_points_24h":126}}, boosts: [{"type":"att_def_boost_defender","value":24,"feature":"all"},{"type":"att_def_boost_defender","value":66,"feature":"battleground"}] },
+    "W_MultiAge_WIN25A7": { prod: {"BronzeAge":{"happiness":2380,"supplies_24h":2020,"strategy_points_24h":144},"IronAge":{"happiness":4100,"supplies_24h":4840,"strategy_points_24h":144},"EarlyMiddleAge":{"happiness":4540,"supplies_24h":8070,"strategy_points_24h":144},"HighMiddleAge":{"happiness":5060,"supplies_24h":11290,"strategy_points_24h":144},"LateMiddleAge":{"happiness":5650,"supplies_24h":14920,"strategy_points_24h":144},"ColonialAge":{"happiness":6640,"supplies_24h":18960,"strategy_points_24h":144},"IndustrialAge":{"happiness":7490,"supplies_24h":22990,"strategy_points_24h":144},"ProgressiveEra":{"happiness":8220,"supplies_24h":27030,"strategy_points_24h":144},"ModernEra":{"happiness":8790,"supplies_24h":31460,"strategy_points_24h":144},"PostModernEra":{"happiness":9160,"supplies_24h":35900,"strategy_points_24h":144},"ContemporaryEra":{"happiness":10650,"supplies_24h":40340,"strategy_points_24h":144},"TomorrowEra":{"happiness":12930,"supplies_24h":45180,"strategy_points_24h":144},"FutureEra":{"happiness":15490,"supplies_24h":49610,"strategy_points_24h":144},"ArcticFuture":{"happiness":18030,"supplies_24h":54450,"strategy_points_24h":144},"OceanicFuture":{"happiness":20810,"supplies_24h":59700,"strategy_points_24h":144},"VirtualFuture":{"happiness":24860,"supplies_24h":64540,"strategy_points_24h":144},"SpaceAgeMars":{"happiness":39780,"supplies_24h":104470,"strategy_points_24h":144},"SpaceAgeAsteroidBelt":{"happiness":43230,"supplies_24h":112130,"strategy_points_24h":144},"SpaceAgeVenus":{"happiness":46700,"supplies_24h":120200,"strategy_points_24h":144},"SpaceAgeJupiterMoon":{"happiness":50310,"supplies_24h":127870,"strategy_points_24h":144},"SpaceAgeTitan":{"happiness":53950,"supplies_24h":135930,"strategy_points_24h":144},"SpaceAgeSpaceHub":{"happiness":57600,"supplies_24h":144000,"strategy_points_24h":144}}, boosts: [{"type":"att_def_boost_defender","value":29,"feature":"all"},{"type":"att_def_boost_defender","value":76,"feature":"battleground"}] },
+    "W_MultiAge_WIN25A1": { prod: {"BronzeAge":{"happiness":600,"supplies_24h":500,"strategy_points_24h":36},"IronAge":{"happiness":1030,"supplies_24h":1210,"strategy_points_24h":36},"EarlyMiddleAge":{"happiness":1130,"supplies_24h":2020,"strategy_points_24h":36},"HighMiddleAge":{"happiness":1270,"supplies_24h":2820,"strategy_points_24h":36},"LateMiddleAge":{"happiness":1410,"supplies_24h":3730,"strategy_points_24h":36},"ColonialAge":{"happiness":1660,"supplies_24h":4740,"strategy_points_24h":36},"IndustrialAge":{"happiness":1870,"supplies_24h":5750,"strategy_points_24h":36},"ProgressiveEra":{"happiness":2060,"supplies_24h":6760,"strategy_points_24h":36},"ModernEra":{"happiness":2200,"supplies_24h":7870,"strategy_points_24h":36},"PostModernEra":{"happiness":2290,"supplies_24h":8970,"strategy_points_24h":36},"ContemporaryEra":{"happiness":2660,"supplies_24h":10080,"strategy_points_24h":36},"TomorrowEra":{"happiness":3230,"supplies_24h":11290,"strategy_points_24h":36},"FutureEra":{"happiness":3870,"supplies_24h":12400,"strategy_points_24h":36},"ArcticFuture":{"happiness":4510,"supplies_24h":13610,"strategy_points_24h":36},"OceanicFuture":{"happiness":5200,"supplies_24h":14920,"strategy_points_24h":36},"VirtualFuture":{"happiness":6220,"supplies_24h":16130,"strategy_points_24h":36},"SpaceAgeMars":{"happiness":9940,"supplies_24h":26120,"strategy_points_24h":36},"SpaceAgeAsteroidBelt":{"happiness":10810,"supplies_24h":28030,"strategy_points_24h":36},"SpaceAgeVenus":{"happiness":11680,"supplies_24h":30050,"strategy_points_24h":36},"SpaceAgeJupiterMoon":{"happiness":12580,"supplies_24h":31970,"strategy_points_24h":36},"SpaceAgeTitan":{"happiness":13490,"supplies_24h":33980,"strategy_points_24h":36},"SpaceAgeSpaceHub":{"happiness":14400,"supplies_24h":36000,"strategy_points_24h":36}}, boosts: [{"type":"att_def_boost_defender","value":9,"feature":"all"},{"type":"att_def_boost_defender","value":16,"feature":"battleground"}] },
+    "W_MultiAge_WIN25A2": { prod: {"BronzeAge":{"happiness":890,"supplies_24h":760,"strategy_points_24h":54},"IronAge":{"happiness":1540,"supplies_24h":1820,"strategy_points_24h":54},"EarlyMiddleAge":{"happiness":1700,"supplies_24h":3030,"strategy_points_24h":54},"HighMiddleAge":{"happiness":1900,"supplies_24h":4240,"strategy_points_24h":54},"LateMiddleAge":{"happiness":2120,"supplies_24h":5600,"strategy_points_24h":54},"ColonialAge":{"happiness":2490,"supplies_24h":7110,"strategy_points_24h":54},"IndustrialAge":{"happiness":2810,"supplies_24h":8620,"strategy_points_24h":54},"ProgressiveEra":{"happiness":3080,"supplies_24h":10130,"strategy_points_24h":54},"ModernEra":{"happiness":3300,"supplies_24h":11800,"strategy_points_24h":54},"PostModernEra":{"happiness":3440,"supplies_24h":13460,"strategy_points_24h":54},"ContemporaryEra":{"happiness":3990,"supplies_24h":15130,"strategy_points_24h":54},"TomorrowEra":{"happiness":4850,"supplies_24h":16940,"strategy_points_24h":54},"FutureEra":{"happiness":5810,"supplies_24h":18610,"strategy_points_24h":54},"ArcticFuture":{"happiness":6760,"supplies_24h":20420,"strategy_points_24h":54},"OceanicFuture":{"happiness":7800,"supplies_24h":22390,"strategy_points_24h":54},"VirtualFuture":{"happiness":9320,"supplies_24h":24200,"strategy_points_24h":54},"SpaceAgeMars":{"happiness":14920,"supplies_24h":39180,"strategy_points_24h":54},"SpaceAgeAsteroidBelt":{"happiness":16210,"supplies_24h":42050,"strategy_points_24h":54},"SpaceAgeVenus":{"happiness":17510,"supplies_24h":45080,"strategy_points_24h":54},"SpaceAgeJupiterMoon":{"happiness":18870,"supplies_24h":47950,"strategy_points_24h":54},"SpaceAgeTitan":{"happiness":20230,"supplies_24h":50970,"strategy_points_24h":54},"SpaceAgeSpaceHub":{"happiness":21600,"supplies_24h":54000,"strategy_points_24h":54}}, boosts: [{"type":"att_def_boost_defender","value":9,"feature":"all"},{"type":"att_def_boost_defender","value":26,"feature":"battleground"}] },
+    "W_MultiAge_WIN25A4": { prod: {"BronzeAge":{"happiness":1490,"supplies_24h":1260,"strategy_points_24h":90},"IronAge":{"happiness":2560,"supplies_24h":3030,"strategy_points_24h":90},"EarlyMiddleAge":{"happiness":2840,"supplies_24h":5040,"strategy_points_24h":90},"HighMiddleAge":{"happiness":3160,"supplies_24h":7060,"strategy_points_24h":90},"LateMiddleAge":{"happiness":3530,"supplies_24h":9330,"strategy_points_24h":90},"ColonialAge":{"happiness":4150,"supplies_24h":11850,"strategy_points_24h":90},"IndustrialAge":{"happiness":4680,"supplies_24h":14370,"strategy_points_24h":90},"ProgressiveEra":{"happiness":5140,"supplies_24h":16890,"strategy_points_24h":90},"ModernEra":{"happiness":5500,"supplies_24h":19660,"strategy_points_24h":90},"PostModernEra":{"happiness":5730,"supplies_24h":22440,"strategy_points_24h":90},"ContemporaryEra":{"happiness":6660,"supplies_24h":25210,"strategy_points_24h":90},"TomorrowEra":{"happiness":8080,"supplies_24h":28240,"strategy_points_24h":90},"FutureEra":{"happiness":9680,"supplies_24h":31010,"strategy_points_24h":90},"ArcticFuture":{"happiness":11270,"supplies_24h":34030,"strategy_points_24h":90},"OceanicFuture":{"happiness":13010,"supplies_24h":37310,"strategy_points_24h":90},"VirtualFuture":{"happiness":15540,"supplies_24h":40340,"strategy_points_24h":90},"SpaceAgeMars":{"happiness":24860,"supplies_24h":65290,"strategy_points_24h":90},"SpaceAgeAsteroidBelt":{"happiness":27020,"supplies_24h":70080,"strategy_points_24h":90},"SpaceAgeVenus":{"happiness":29190,"supplies_24h":75130,"strategy_points_24h":90},"SpaceAgeJupiterMoon":{"happiness":31440,"supplies_24h":79920,"strategy_points_24h":90},"SpaceAgeTitan":{"happiness":33720,"supplies_24h":84960,"strategy_points_24h":90},"SpaceAgeSpaceHub":{"happiness":36000,"supplies_24h":90000,"strategy_points_24h":90}}, boosts: [{"type":"att_def_boost_defender","value":14,"feature":"all"},{"type":"att_def_boost_defender","value":46,"feature":"battleground"}] },
+    "W_MultiAge_WIN25A5": { prod: {"BronzeAge":{"happiness":1790,"supplies_24h":1510,"strategy_points_24h":108},"IronAge":{"happiness":3080,"supplies_24h":3630,"strategy_points_24h":108},"EarlyMiddleAge":{"happiness":3400,"supplies_24h":6050,"strategy_points_24h":108},"HighMiddleAge":{"happiness":3800,"supplies_24h":8470,"strategy_points_24h":108},"LateMiddleAge":{"happiness":4230,"supplies_24h":11190,"strategy_points_24h":108},"ColonialAge":{"happiness":4980,"supplies_24h":14220,"strategy_points_24h":108},"IndustrialAge":{"happiness":5610,"supplies_24h":17240,"strategy_points_24h":108},"ProgressiveEra":{"happiness":6170,"supplies_24h":20270,"strategy_points_24h":108},"ModernEra":{"happiness":6600,"supplies_24h":23600,"strategy_points_24h":108},"PostModernEra":{"happiness":6870,"supplies_24h":26920,"strategy_points_24h":108},"ContemporaryEra":{"happiness":7990,"supplies_24h":30250,"strategy_points_24h":108},"TomorrowEra":{"happiness":9690,"supplies_24h":33880,"strategy_points_24h":108},"FutureEra":{"happiness":11610,"supplies_24h":37210,"strategy_points_24h":108},"ArcticFuture":{"happiness":13520,"supplies_24h":40840,"strategy_points_24h":108},"OceanicFuture":{"happiness":15610,"supplies_24h":44770,"strategy_points_24h":108},"VirtualFuture":{"happiness":18650,"supplies_24h":48400,"strategy_points_24h":108},"SpaceAgeMars":{"happiness":29830,"supplies_24h":78350,"strategy_points_24h":108},"SpaceAgeAsteroidBelt":{"happiness":32420,"supplies_24h":84100,"strategy_points_24h":108},"SpaceAgeVenus":{"happiness":35030,"supplies_24h":90150,"strategy_points_24h":108},"SpaceAgeJupiterMoon":{"happiness":37730,"supplies_24h":95900,"strategy_points_24h":108},"SpaceAgeTitan":{"happiness":40470,"supplies_24h":101950,"strategy_points_24h":108},"SpaceAgeSpaceHub":{"happiness":43200,"supplies_24h":108000,"strategy_points_24h":108}}, boosts: [{"type":"att_def_boost_defender","value":19,"feature":"all"},{"type":"att_def_boost_defender","value":56,"feature":"battleground"}] },
+    "W_MultiAge_WIN25F1": { prod: {"AllAge":{"strategy_points_24h":98,"random_special_good_up_to_age_24h":80}}, boosts: [{"type":"att_boost_attacker","value":98,"feature":"battleground"},{"type":"att_boost_defender","value":98,"feature":"battleground"}] },
+    "W_MultiAge_WIN19B1": { prod: {"BronzeAge":{"happiness":200},"IronAge":{"happiness":280},"EarlyMiddleAge":{"happiness":330},"HighMiddleAge":{"happiness":420},"LateMiddleAge":{"happiness":480},"ColonialAge":{"happiness":570},"IndustrialAge":{"happiness":640},"ProgressiveEra":{"happiness":700},"ModernEra":{"happiness":800},"PostModernEra":{"happiness":910},"ContemporaryEra":{"happiness":1060},"TomorrowEra":{"happiness":1320},"FutureEra":{"happiness":1580},"ArcticFuture":{"happiness":1790},"OceanicFuture":{"happiness":2010},"VirtualFuture":{"happiness":2540},"SpaceAgeMars":{"happiness":3950},"SpaceAgeAsteroidBelt":{"happiness":4290},"SpaceAgeVenus":{"happiness":4640},"SpaceAgeJupiterMoon":{"happiness":5000},"SpaceAgeTitan":{"happiness":5360},"SpaceAgeSpaceHub":{"happiness":5730}} },
+    "W_MultiAge_WIN19B2": { prod: {"BronzeAge":{"happiness":410},"IronAge":{"happiness":710},"EarlyMiddleAge":{"happiness":790},"HighMiddleAge":{"happiness":880},"LateMiddleAge":{"happiness":980},"ColonialAge":{"happiness":1150},"IndustrialAge":{"happiness":1300},"ProgressiveEra":{"happiness":1430},"ModernEra":{"happiness":1530},"PostModernEra":{"happiness":1590},"ContemporaryEra":{"happiness":1850},"TomorrowEra":{"happiness":2240},"FutureEra":{"happiness":2690},"ArcticFuture":{"happiness":3130},"OceanicFuture":{"happiness":3610},"VirtualFuture":{"happiness":4320},"SpaceAgeMars":{"happiness":6910},"SpaceAgeAsteroidBelt":{"happiness":7500},"SpaceAgeVenus":{"happiness":8110},"SpaceAgeJupiterMoon":{"happiness":8730},"SpaceAgeTitan":{"happiness":9370},"SpaceAgeSpaceHub":{"happiness":10000}} },
+    "W_MultiAge_WIN23A11": { prod: {"BronzeAge":{"population":225,"demandHappiness":225,"supplies_24h":1900,"strategy_points_24h":13,"random_good_of_age_24h":29,"units_24h":11},"IronAge":{"population":483,"demandHappiness":483,"supplies_24h":4500,"strategy_points_24h":13,"random_good_of_age_24h":29,"units_24h":11},"EarlyMiddleAge":{"population":741,"demandHappiness":741,"supplies_24h":7500,"strategy_points_24h":13,"random_good_of_age_24h":29,"units_24h":11},"HighMiddleAge":{"population":1040,"demandHappiness":1040,"supplies_24h":10500,"strategy_points_24h":13,"random_good_of_age_24h":29,"units_24h":11},"LateMiddleAge":{"population":1365,"demandHappiness":1365,"supplies_24h":13900,"strategy_points_24h":13,"random_good_of_age_24h":29,"units_24h":11},"ColonialAge":{"population":1723,"demandHappiness":1723,"supplies_24h":17700,"strategy_points_24h":13,"random_good_of_age_24h":29,"units_24h":11},"IndustrialAge":{"population":2105,"demandHappiness":2105,"supplies_24h":21400,"strategy_points_24h":13,"random_good_of_age_24h":29,"units_24h":11},"ProgressiveEra":{"population":2513,"demandHappiness":2513,"supplies_24h":25200,"strategy_points_24h":13,"random_good_of_age_24h":29,"units_24h":11},"ModernEra":{"population":2946,"demandHappiness":2946,"supplies_24h":29300,"strategy_points_24h":13,"random_good_of_age_24h":29,"units_24h":11},"PostModernEra":{"population":3395,"demandHappiness":3395,"supplies_24h":33500,"strategy_points_24h":13,"random_good_of_age_24h":29,"units_24h":11},"ContemporaryEra":{"population":3869,"demandHappiness":3869,"supplies_24h":37600,"strategy_points_24h":13,"random_good_of_age_24h":29,"units_24h":11},"TomorrowEra":{"population":4360,"demandHappiness":4360,"supplies_24h":42100,"strategy_points_24h":13,"random_good_of_age_24h":29,"units_24h":11},"FutureEra":{"population":4876,"demandHappiness":4876,"supplies_24h":46300,"strategy_points_24h":14,"random_good_of_age_24h":30,"units_24h":11},"ArcticFuture":{"population":5408,"demandHappiness":5408,"supplies_24h":50800,"strategy_points_24h":14,"random_good_of_age_24h":30,"units_24h":11},"OceanicFuture":{"population":5958,"demandHappiness":5958,"supplies_24h":55700,"strategy_points_24h":14,"random_good_of_age_24h":30,"units_24h":11},"VirtualFuture":{"population":6523,"demandHappiness":6523,"supplies_24h":60200,"strategy_points_24h":14,"random_good_of_age_24h":30,"units_24h":11},"SpaceAgeMars":{"population":10326,"demandHappiness":10326,"supplies_24h":97400,"strategy_points_24h":15,"random_good_of_age_24h":31,"units_24h":11},"SpaceAgeAsteroidBelt":{"population":11216,"demandHappiness":11216,"supplies_24h":104500,"strategy_points_24h":15,"random_good_of_age_24h":31,"units_24h":11},"SpaceAgeVenus":{"population":12123,"demandHappiness":12123,"supplies_24h":112100,"strategy_points_24h":15,"random_good_of_age_24h":31,"units_24h":11},"SpaceAgeJupiterMoon":{"population":13055,"demandHappiness":13055,"supplies_24h":119200,"strategy_points_24h":15,"random_good_of_age_24h":31,"units_24h":11},"SpaceAgeTitan":{"population":14003,"demandHappiness":14003,"supplies_24h":126700,"strategy_points_24h":16,"random_good_of_age_24h":32,"units_24h":11},"SpaceAgeSpaceHub":{"population":14951,"demandHappiness":14951,"supplies_24h":134200,"strategy_points_24h":16,"random_good_of_age_24h":32,"units_24h":11}}, boosts: [{"type":"att_boost_attacker","value":24,"feature":"all"},{"type":"att_boost_attacker","value":1,"feature":"battleground"},{"type":"att_boost_defender","value":26,"feature":"all"}] },
+};
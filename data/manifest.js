@@ -0,0 +1,10 @@
+// Auto-generated by tools/build_database.py — do not edit by hand.
+// The ?v= hashes let server.py serve these modules as immutable;
+// re-run `python tools/build_database.py --manifest` after editing data by hand.
+export { NAME_TABLES } from './building_names.js?v=643c938a4a33';
+export { COLONY_BUILDINGS } from './colony_buildings_database.js?v=b4d46a31bceb';
+export { DB_META } from './db_meta.js?v=55959e4ca6c5';
+export { BUILDINGS, RATE_KEYS, BUILDING_SHARDS } from './foe_buildings_database.js?v=29ea33765fd0';
+export { GB_BONUSES } from './gb_bonuses.js?v=22ed0899647c';
+export { QI_BUILDINGS } from './qi_buildings_database.js?v=857f9974a8bd';
+export { SETTLEMENT_BUILDINGS } from './settlement_buildings_database.js?v=33294a8d899a';
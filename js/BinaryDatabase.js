@@ -0,0 +1,111 @@
+/**
+ * BinaryDatabase — decoder for data/foe_buildings_database.bin, the compact
+ * columnar export written by `python tools/build_database.py --binary`.
+ *
+ * The file is a string table plus typed-array columns; see write_binary() in
+ * tools/build_database.py for the exact layout. Decoding is plain typed-array
+ * reads (no eval / module parse) and yields the same shape as BUILDINGS with
+ * prod/boosts already merged in. Deduplicated prod and boost records are
+ * decoded once and shared between buildings, so treat them as read-only.
+ */
+
+const MAGIC   = 0x42454f46; // 'FOEB' read as little-endian u32
+const VERSION = 1;
+const HEADER_FIELDS = 15;
+
+/** Fetch and decode the binary database. */
+export async function loadBinaryDatabase(url) {
+    const res = await fetch(url);
+    if (!res.ok) throw new Error(`${url}: HTTP ${res.status}`);
+    return decodeBinaryDatabase(await res.arrayBuffer());
+}
+
+/** Decode an ArrayBuffer in the write_binary() format into { id: building }. */
+export function decodeBinaryDatabase(buffer) {
+    const head = new Uint32Array(buffer, 0, 1 + HEADER_FIELDS);
+    if (head[0] !== MAGIC) throw new Error('Not a FoE building database');
+    const [version, count, nStrings, stringBytes, nValues, nStats, nStatPairs,
+           nProds, nProdPairs, nBoostSets, nBoosts, nTypes, nAges, nColors] = head.subarray(1);
+    if (version !== VERSION) throw new Error(`Unsupported database version ${version}`);
+
+    let offset = (1 + HEADER_FIELDS) * 4;
+    const take = (Type, length) => {
+        const view = new Type(buffer, offset, length);
+        offset += view.byteLength;
+        return view;
+    };
+
+    const values       = take(Float64Array, nValues);
+    const strOffsets   = take(Uint32Array, nStrings + 1);
+    const idCol        = take(Uint32Array, count);
+    const nameCol      = take(Uint32Array, count);
+    const statStart    = take(Uint32Array, nStats + 1);
+    const statValue    = take(Uint32Array, nStatPairs);
+    const prodStart    = take(Uint32Array, nProds + 1);
+    const prodStat     = take(Uint32Array, nProdPairs);
+    const boostStart   = take(Uint32Array, nBoostSets + 1);
+    const boostValue   = take(Uint32Array, nBoosts);
+    const prodRef      = take(Int32Array, count);
+    const boostRef     = take(Int32Array, count);
+    const statKey      = take(Uint16Array, nStatPairs);
+    const prodEra      = take(Uint16Array, nProdPairs);
+    const boostType    = take(Uint16Array, nBoosts);
+    const boostFeature = take(Uint16Array, nBoosts);
+    const typeTable    = take(Uint16Array, nTypes);
+    const ageTable     = take(Uint16Array, nAges);
+    const colorTable   = take(Uint16Array, nColors);
+    const width        = take(Uint8Array, count);
+    const height       = take(Uint8Array, count);
+    const typeCol      = take(Uint8Array, count);
+    const ageCol       = take(Uint8Array, count);
+    const colorCol     = take(Uint8Array, count);
+    const needsRoad    = take(Uint8Array, count);
+    const stringBlob   = take(Uint8Array, stringBytes);
+
+    const decoder = new TextDecoder();
+    const strings = new Array(nStrings);
+    for (let i = 0; i < nStrings; i++) {
+        strings[i] = decoder.decode(stringBlob.subarray(strOffsets[i], strOffsets[i + 1]));
+    }
+
+    const stats = new Array(nStats);
+    const statRecord = (i) => {
+        if (stats[i]) return stats[i];
+        const rec = {};
+        for (let j = statStart[i]; j < statStart[i + 1]; j++) rec[strings[statKey[j]]] = values[statValue[j]];
+        return (stats[i] = rec);
+    };
+    const prods = new Array(nProds);
+    const prodRecord = (i) => {
+        if (prods[i]) return prods[i];
+        const rec = {};
+        for (let j = prodStart[i]; j < prodStart[i + 1]; j++) rec[strings[prodEra[j]]] = statRecord(prodStat[j]);
+        return (prods[i] = rec);
+    };
+    const boostSets = new Array(nBoostSets);
+    const boostRecord = (i) => {
+        if (boostSets[i]) return boostSets[i];
+        const list = [];
+        for (let j = boostStart[i]; j < boostStart[i + 1]; j++) {
+            list.push({ type: strings[boostType[j]], value: values[boostValue[j]], feature: strings[boostFeature[j]] });
+        }
+        return (boostSets[i] = list);
+    };
+
+    const buildings = {};
+    for (let i = 0; i < count; i++) {
+        const b = {
+            name:      strings[nameCol[i]],
+            width:     width[i],
+            height:    height[i],
+            type:      strings[typeTable[typeCol[i]]],
+            age:       strings[ageTable[ageCol[i]]],
+            color:     strings[colorTable[colorCol[i]]],
+            needsRoad: needsRoad[i],
+        };
+        if (prodRef[i] >= 0)  b.prod   = prodRecord(prodRef[i]);
+        if (boostRef[i] >= 0) b.boosts = boostRecord(boostRef[i]);
+        buildings[strings[idCol[i]]] = b;
+    }
+    return buildings;
+}
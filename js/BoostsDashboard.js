@@ -243,7 +243,8 @@ export class BoostsDashboard {
             ${military}${econ}${qiHtml}`;
     }
 
-    show() {
+    async show() {
+        await this.planner.buildingShards.ensureForCity();
         document.getElementById('boostsDashboardBody').innerHTML = this.render();
         this.planner.showModal('boostsDashboardModal');
     }
@@ -0,0 +1,155 @@
+import { CellGrid } from './CellGrid.js';
+
+/**
+ * Cell → building occupancy index over planner.buildings, so hit-testing and
+ * overlap checks cost O(footprint) instead of a scan over every building.
+ *
+ * The index follows the buildings array on its own: a new array (undo,
+ * import, optimizer, filter-removals) is re-indexed in full on the next
+ * query, and buildings pushed onto the same array are indexed incrementally.
+ * The one change it cannot see is a building moved in place, so anything
+ * that changes a placed building's x/y goes through move(). Undo/redo,
+ * which swap in a patched copy of the array, say what changed through
+ * remove() / adopt() so only those buildings are re-indexed.
+ *
+ * Occupancy is a CellGrid layer, like planner.roads: each cell holds the
+ * slot (+1) of the building covering it, 0 when free.
+ */
+export class BuildingIndex {
+    constructor(planner) {
+        this.p = planner;
+        this._cells  = new CellGrid(null, Int32Array);
+        this._slots  = [];          // building of each slot
+        this._slotOf = new Map();   // building → its cell value (slot + 1)
+        this._source = null;        // the buildings array last indexed
+        this._count  = 0;           // how many of its entries are indexed
+        this._shared = false;       // some cell is covered by two buildings
+        this._adopting = null;      // the array remove() was called against
+        this._version = 0;
+        this.rebuilds = 0;
+    }
+
+    /**
+     * Changes whenever a building is indexed, moved or dropped, so caches
+     * derived from the layout (QISimulator's cycle plan) can tell it changed.
+     */
+    get version() {
+        this._sync();
+        return this._version;
+    }
+
+    /** Building covering grid cell (x, y), or null. Overlaps resolve to the earlier building. */
+    at(x, y) {
+        this._sync();
+        const slot = this._cells.get(x, y);
+        return slot ? this._slots[slot - 1] : null;
+    }
+
+    /** First building (other than exclude) covering any cell of the w×h area at (x, y), or null. */
+    overlapping(x, y, width, height, exclude = null) {
+        this._sync();
+        for (let cy = y; cy < y + height; cy++) {
+            for (let cx = x; cx < x + width; cx++) {
+                const slot = this._cells.get(cx, cy);
+                if (slot && this._slots[slot - 1] !== exclude) return this._slots[slot - 1];
+            }
+        }
+        // A cell two buildings share only remembers one of them
+        if (this._shared && exclude) {
+            return this.p.buildings.find(b => b !== exclude &&
+                !(x + width <= b.x || x >= b.x + b.width || y + height <= b.y || y >= b.y + b.height)) || null;
+        }
+        return null;
+    }
+
+    /** Move a placed building to (x, y), keeping the index in step. */
+    move(building, x, y) {
+        this._sync();
+        if (this._shared) {
+            building.x = x;
+            building.y = y;
+            this.rebuild();
+            return;
+        }
+        this._clear(building);
+        building.x = x;
+        building.y = y;
+        this._fill(building);
+    }
+
+    /**
+     * Un-index buildings about to leave planner.buildings. Call before
+     * swapping in the patched array, then move() what stays and adopt() the
+     * new array.
+     */
+    remove(buildings) {
+        this._sync();
+        this._adopting = this._source;
+        if (this._shared) return;   // adopt() re-indexes in full
+        for (const b of buildings) this._clear(b);
+    }
+
+    /**
+     * planner.buildings is now the array remove() saw, minus the buildings
+     * removed, plus these: index just them.
+     */
+    adopt(buildings) {
+        const from = this._adopting;
+        this._adopting = null;
+        if (this._shared || this._source !== from) {
+            this.rebuild();
+            return;
+        }
+        this._source = this.p.buildings;
+        for (const b of buildings) this._fill(b);
+        this._count = this._source.length;
+    }
+
+    /** Re-index planner.buildings from scratch. */
+    rebuild() {
+        this._cells.clear();
+        this._slots  = [];
+        this._slotOf = new Map();
+        this._shared = false;
+        this._source = this.p.buildings;
+        this._count  = 0;
+        this._version++;
+        this.rebuilds++;
+        this._sync();
+    }
+
+    _sync() {
+        const list = this.p.buildings;
+        if (list !== this._source || list.length < this._count) {
+            this.rebuild();
+            return;
+        }
+        for (let i = this._count; i < list.length; i++) this._fill(list[i]);
+        this._count = list.length;
+    }
+
+    _fill(b) {
+        this._version++;
+        let slot = this._slotOf.get(b);
+        if (slot === undefined) {
+            slot = this._slots.push(b);
+            this._slotOf.set(b, slot);
+        }
+        for (let dy = 0; dy < b.height; dy++) {
+            for (let dx = 0; dx < b.width; dx++) {
+                if (this._cells.get(b.x + dx, b.y + dy)) this._shared = true;
+                else this._cells.set(b.x + dx, b.y + dy, slot);
+            }
+        }
+    }
+
+    _clear(b) {
+        this._version++;
+        const slot = this._slotOf.get(b);
+        for (let dy = 0; dy < b.height; dy++) {
+            for (let dx = 0; dx < b.width; dx++) {
+                if (this._cells.get(b.x + dx, b.y + dy) === slot) this._cells.set(b.x + dx, b.y + dy, 0);
+            }
+        }
+    }
+}
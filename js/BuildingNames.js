@@ -0,0 +1,71 @@
+/**
+ * BuildingNames — building names in the active language.
+ *
+ * The databases carry the names of the dump they were built from. With
+ * --locale, tools/build_database.py also writes one name table per language
+ * under data/names/; this class imports only the active locale's table (on
+ * startup and on every language switch) and relabels the templates and the
+ * active city's buildings with it. Locales without a table, and buildings a
+ * table lacks, keep the database names.
+ */
+import { NAME_TABLES } from '../data/manifest.js';
+import { getLocale } from './i18n.js';
+
+export class BuildingNames {
+    constructor(planner) {
+        this.planner = planner;
+        this._tables = new Map(); // locale -> Promise of its NAMES (null if it failed)
+        this._base   = null;      // template id -> database name, kept once a table is applied
+    }
+
+    /** Import the locale's table (once) and relabel with it; resolves when done. */
+    apply(locale = getLocale()) {
+        return this._load(locale).then(names => {
+            if (locale !== getLocale()) return;   // switched again while loading
+            this._relabel(names);
+        });
+    }
+
+    _load(locale) {
+        if (!NAME_TABLES[locale]) return Promise.resolve(null);
+        if (this._tables.has(locale)) return this._tables.get(locale);
+
+        const promise = NAME_TABLES[locale]().then(({ NAMES }) => NAMES).catch(err => {
+            // Allow a retry on the next switch (e.g. after a network blip)
+            this._tables.delete(locale);
+            console.warn(`Failed to load building names for "${locale}":`, err);
+            return null;
+        });
+        this._tables.set(locale, promise);
+        return promise;
+    }
+
+    _relabel(names) {
+        const p = this.planner;
+        const templates = p.buildingTemplates;
+        if (!this._base) {
+            if (!names) return;   // still on the database names
+            this._base = {};
+            for (const [id, tmpl] of Object.entries(templates)) this._base[id] = tmpl.name;
+        }
+
+        const renamed = new Map(); // id -> [old name, new name]
+        for (const [id, tmpl] of Object.entries(templates)) {
+            const name = (names && names[id]) || this._base[id];
+            if (name === undefined || name === tmpl.name) continue;
+            renamed.set(id, [tmpl.name, name]);
+            tmpl.name = name;
+        }
+        if (!renamed.size) return;
+
+        // Placed and pooled buildings copy the template name; leave any other name alone
+        for (const b of [...p.buildings, ...(p.buildingPool || [])]) {
+            const change = renamed.get(b.id);
+            if (change && b.name === change[0]) b.name = change[1];
+        }
+        p.updateBuildingList();
+        p.updatePoolPanel();
+        p.renderer.invalidate('buildings');
+        p.renderer.drawFrame();
+    }
+}
@@ -0,0 +1,74 @@
+/**
+ * BuildingShards — on-demand loading of the heavy building payloads.
+ *
+ * data/foe_buildings_database.js only carries what the palette and canvas
+ * need (name, size, type, age, color). The prod/boosts data lives in one
+ * module per age under data/foe_buildings/, and templates that have some
+ * point at it via `template.shard`. This class imports a shard the first
+ * time something needs it and merges its payload into planner.buildingTemplates.
+ */
+import { BUILDING_SHARDS } from '../data/manifest.js';
+
+export class BuildingShards {
+    constructor(planner) {
+        this.planner  = planner;
+        this._pending = new Map(); // shard name -> Promise (resolved once merged)
+        this._loaded  = new Set(); // shard names already merged
+    }
+
+    /** True if the template for id has no payload left to fetch. */
+    isLoaded(id) {
+        const tmpl = this.planner.buildingTemplates[id];
+        return !tmpl || !tmpl.shard || this._loaded.has(tmpl.shard);
+    }
+
+    /** Import one shard (once) and merge its payloads into the templates. */
+    load(shard) {
+        if (!shard || !BUILDING_SHARDS[shard]) return Promise.resolve();
+        if (this._pending.has(shard)) return this._pending.get(shard);
+
+        const promise = BUILDING_SHARDS[shard]().then(({ PAYLOAD }) => {
+            const templates = this.planner.buildingTemplates;
+            for (const [id, payload] of Object.entries(PAYLOAD)) {
+                const tmpl = templates[id];
+                if (!tmpl) continue;
+                // Imported efficiency data may already have set boosts; don't clobber it.
+                if (payload.prod && !tmpl.prod)     tmpl.prod   = payload.prod;
+                if (payload.boosts && !tmpl.boosts) tmpl.boosts = payload.boosts;
+            }
+            this._loaded.add(shard);
+            this.planner.productionOverview.invalidate();
+        }).catch(err => {
+            // Allow a retry on the next request (e.g. after a network blip)
+            this._pending.delete(shard);
+            console.warn(`Failed to load building shard "${shard}":`, err);
+        });
+        this._pending.set(shard, promise);
+        return promise;
+    }
+
+    /** Load every shard needed by the given template ids. */
+    ensure(ids) {
+        const templates = this.planner.buildingTemplates;
+        const shards = new Set();
+        for (const id of ids) {
+            const shard = id && templates[id] && templates[id].shard;
+            if (shard) shards.add(shard);
+        }
+        return Promise.all([...shards].map(s => this.load(s)));
+    }
+
+    /** Load the shards for everything placed or pooled in the active city. */
+    ensureForCity() {
+        const p = this.planner;
+        return this.ensure([...p.buildings, ...(p.buildingPool || [])].map(b => b.id));
+    }
+
+    /** Shard holding the payloads for a palette age group, if any. */
+    shardForAge(age) {
+        for (const tmpl of Object.values(this.planner.buildingTemplates)) {
+            if (tmpl.age === age && tmpl.shard) return tmpl.shard;
+        }
+        return null;
+    }
+}
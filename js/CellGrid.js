@@ -0,0 +1,228 @@
+/**
+ * A layer of per-cell values over the city grid in a typed array, indexed
+ * like the optimizer's grid: (y - y0) * width + (x - x0) over the bounding
+ * box [x0, x0 + width) × [y0, y0 + height). The box grows (with slack)
+ * when a non-zero value lands outside it; reads outside it are 0.
+ *
+ * The planner keeps roads, wide-road anchors and unlocked cells as flag
+ * grids (Uint8Array, 1 = set) and BuildingIndex keeps occupancy as an
+ * Int32Array of building slots. Hot paths use the integer API (hasCell,
+ * addCell, deleteCell, forEachCell, get/set); the "x,y" string API (has, add,
+ * delete, iteration, size) mirrors a Set of keys, which is what saved plans,
+ * snapshots and selection state store, so those convert through it.
+ *
+ * `version` changes on every edit, so caches can tell whether a grid changed
+ * without diffing it, and changesSince() lists the cells behind the latest
+ * edits, so followers (RoadConnectivity) can catch up in O(change).
+ */
+const GROW_SLACK = 16;   // cells of headroom added on each side when the box grows
+const LOG_LIMIT  = 4096; // edits changesSince() can look back over
+
+export class CellGrid {
+    constructor(keys = null, ArrayType = Uint8Array) {
+        this.ArrayType = ArrayType;
+        this.x0 = 0;
+        this.y0 = 0;
+        this.width  = 0;
+        this.height = 0;
+        this.cells  = new ArrayType(0);
+        this.size    = 0;   // number of non-zero cells
+        this.version = 0;
+        this._log    = [];  // x, y of the cell each of the latest edits changed, oldest first
+        if (keys) for (const key of keys) this.add(key);
+    }
+
+    /** A flag grid of the given "x,y" keys (a saved plan's roads, say). */
+    static from(keys) {
+        return new CellGrid(keys);
+    }
+
+    /**
+     * A flag grid of the cells of an optimizer-style grid (row-major, W wide,
+     * origin at offX/offY) holding value.
+     */
+    static fromLayer(grid, W, offX, offY, value) {
+        const out = new CellGrid();
+        const H = Math.ceil(grid.length / W);
+        out._resize(offX, offY, W, H);
+        for (let i = 0; i < grid.length; i++) {
+            if (grid[i] === value) {
+                out.cells[i] = 1;
+                out.size++;
+            }
+        }
+        out.version++;
+        return out;
+    }
+
+    // ── Integer API ──────────────────────────────────────────────────────
+
+    get(x, y) {
+        x -= this.x0;
+        y -= this.y0;
+        if (x < 0 || y < 0 || x >= this.width || y >= this.height) return 0;
+        return this.cells[y * this.width + x];
+    }
+
+    set(x, y, value) {
+        if (x < this.x0 || y < this.y0 || x >= this.x0 + this.width || y >= this.y0 + this.height) {
+            if (!value) return;
+            this._grow(x, y);
+        }
+        const i = (y - this.y0) * this.width + (x - this.x0);
+        const old = this.cells[i];
+        if (old === value) return;
+        this.cells[i] = value;
+        if (!old) this.size++;
+        else if (!value) this.size--;
+        this.version++;
+        this._log.push(x, y);
+        if (this._log.length > 2 * LOG_LIMIT) this._log.splice(0, LOG_LIMIT);
+    }
+
+    hasCell(x, y)    { return this.get(x, y) !== 0; }
+    addCell(x, y)    { this.set(x, y, 1); }
+    deleteCell(x, y) { this.set(x, y, 0); }
+
+    /** fn(x, y, value) for every non-zero cell, row by row. */
+    forEachCell(fn) {
+        const { cells, width, x0, y0 } = this;
+        for (let i = 0; i < cells.length; i++) {
+            if (cells[i]) fn(x0 + i % width, y0 + Math.floor(i / width), cells[i]);
+        }
+    }
+
+    /** forEachCell limited to [x0, x1) × [y0, y1), e.g. the visible part of the city. */
+    forEachCellIn(x0, y0, x1, y1, fn) {
+        const { cells, width } = this;
+        x0 = Math.max(x0, this.x0);
+        y0 = Math.max(y0, this.y0);
+        x1 = Math.min(x1, this.x0 + width);
+        y1 = Math.min(y1, this.y0 + this.height);
+        for (let y = y0; y < y1; y++) {
+            const row = (y - this.y0) * width - this.x0;
+            for (let x = x0; x < x1; x++) {
+                if (cells[row + x]) fn(x, y, cells[row + x]);
+            }
+        }
+    }
+
+    /**
+     * The cells of the w×h window at (x, y) as a row-major typed array, in
+     * the optimizer's layout: copied a row at a time, no per-cell lookups.
+     */
+    window(x, y, w, h) {
+        const out = new this.ArrayType(w * h);
+        const left = Math.max(x, this.x0), right = Math.min(x + w, this.x0 + this.width);
+        if (left >= right) return out;
+        for (let row = Math.max(y, this.y0); row < Math.min(y + h, this.y0 + this.height); row++) {
+            const from = (row - this.y0) * this.width - this.x0;
+            out.set(this.cells.subarray(from + left, from + right), (row - y) * w + left - x);
+        }
+        return out;
+    }
+
+    clone() {
+        const out = new CellGrid(null, this.ArrayType);
+        out.x0 = this.x0;
+        out.y0 = this.y0;
+        out.width  = this.width;
+        out.height = this.height;
+        out.cells  = this.cells.slice();
+        out.size   = this.size;
+        return out;
+    }
+
+    /** Cells set in this grid but not in other, as packed [x, y, x, y, …]. */
+    missingFrom(other) {
+        const out = [];
+        if (other.x0 === this.x0 && other.y0 === this.y0 && other.width === this.width && other.height === this.height) {
+            // Same box (a clone, typically): compare the arrays directly
+            const a = this.cells, b = other.cells, w = this.width;
+            for (let i = 0; i < a.length; i++) {
+                if (a[i] && !b[i]) out.push(this.x0 + i % w, this.y0 + Math.floor(i / w));
+            }
+        } else {
+            this.forEachCell((x, y) => { if (!other.hasCell(x, y)) out.push(x, y); });
+        }
+        return Int32Array.from(out);
+    }
+
+    /**
+     * Packed [x, y, …] of the cells changed since `version` (repeats
+     * possible), or null when that is too far back to tell, e.g. across a
+     * clear(). The caller reads the cells' current values.
+     */
+    changesSince(version) {
+        const count = this.version - version;
+        if (count < 0 || 2 * count > this._log.length) return null;
+        return this._log.slice(this._log.length - 2 * count);
+    }
+
+    clear() {
+        if (!this.size) return;
+        this.cells.fill(0);
+        this.size = 0;
+        this.version++;
+        this._log = [];
+    }
+
+    // ── "x,y" key API (Set-compatible) ───────────────────────────────────
+
+    has(key)    { const [x, y] = parseKey(key); return this.hasCell(x, y); }
+    add(key)    { const [x, y] = parseKey(key); this.addCell(x, y); return this; }
+    delete(key) {
+        const [x, y] = parseKey(key);
+        if (!this.hasCell(x, y)) return false;
+        this.deleteCell(x, y);
+        return true;
+    }
+
+    *keys() {
+        const { cells, width, x0, y0 } = this;
+        for (let i = 0; i < cells.length; i++) {
+            if (cells[i]) yield `${x0 + i % width},${y0 + Math.floor(i / width)}`;
+        }
+    }
+
+    [Symbol.iterator]() { return this.keys(); }
+
+    /** Saved plans store roads as an array of "x,y" keys. */
+    toJSON() { return [...this.keys()]; }
+
+    // ── Internals ────────────────────────────────────────────────────────
+
+    _grow(x, y) {
+        if (!this.width) {
+            this._resize(x - GROW_SLACK, y - GROW_SLACK, 2 * GROW_SLACK + 1, 2 * GROW_SLACK + 1);
+            return;
+        }
+        // Extend the side that needs it by half the current size, so filling
+        // a large area a cell at a time only copies the array a few times
+        const padX = Math.max(GROW_SLACK, this.width >> 1), padY = Math.max(GROW_SLACK, this.height >> 1);
+        const x0 = x < this.x0 ? x - padX : this.x0;
+        const y0 = y < this.y0 ? y - padY : this.y0;
+        const x1 = x >= this.x0 + this.width  ? x + padX + 1 : this.x0 + this.width;
+        const y1 = y >= this.y0 + this.height ? y + padY + 1 : this.y0 + this.height;
+        this._resize(x0, y0, x1 - x0, y1 - y0);
+    }
+
+    _resize(x0, y0, width, height) {
+        const cells = new this.ArrayType(width * height);
+        for (let row = 0; row < this.height; row++) {
+            const from = row * this.width;
+            cells.set(this.cells.subarray(from, from + this.width),
+                      (row + this.y0 - y0) * width + this.x0 - x0);
+        }
+        this.x0 = x0;
+        this.y0 = y0;
+        this.width  = width;
+        this.height = height;
+        this.cells  = cells;
+    }
+}
+
+function parseKey(key) {
+    const comma = key.indexOf(',');
+    return [+key.slice(0, comma), +key.slice(comma + 1)];
+}
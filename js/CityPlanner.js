@@ -10,12 +10,21 @@ import { Optimizer }          from './Optimizer.js';
 import { UndoHistory }        from './UndoHistory.js';
 import { ProductionOverview } from './ProductionOverview.js';
 import { BoostsDashboard } from './BoostsDashboard.js';
-import { DB_META } from '../data/db_meta.js';
 import { QISimulator }        from './QISimulator.js';
-import { BUILDINGS }          from '../data/foe_buildings_database.js';
-import { QI_BUILDINGS }       from '../data/qi_buildings_database.js';
-import { SETTLEMENT_BUILDINGS } from '../data/settlement_buildings_database.js';
-import { COLONY_BUILDINGS }    from '../data/colony_buildings_database.js';
+import { BuildingShards }     from './BuildingShards.js';
+import { BuildingNames }      from './BuildingNames.js';
+import { BuildingIndex }      from './BuildingIndex.js';
+import { RoadConnectivity }   from './RoadConnectivity.js';
+import { CellGrid }           from './CellGrid.js';
+// Data modules go through the manifest so their URLs carry a content hash (cacheable forever)
+import { DB_META, BUILDINGS, QI_BUILDINGS, SETTLEMENT_BUILDINGS, COLONY_BUILDINGS } from '../data/manifest.js';
+
+// Controls that change the layout, inert while the optimizer runs (see setEditingLocked)
+const EDIT_CONTROLS = [
+    '.city-tab[data-city]', '#importFoeBtn', '#loadBtn', '#clearBtn',
+    '#settlementTypeGrid', '#colonyTypeGrid', '#buildingContent .tool-btn', '#buildingList', '#poolList',
+    '#resizeBtn', '#fitToContentBtn', '#undoBtn', '#redoBtn', '#undoOptimizeBtn',
+].join(', ');
 
 export class CityPlanner {
     constructor() {
@@ -49,10 +58,10 @@ export class CityPlanner {
 
         // City state
         this.buildings     = [];
-        this.roads         = new Set();
-        this.wideRoads     = new Set(); // anchors ("x,y") of 2×2 CarStreet road blocks
+        this.roads         = new CellGrid();
+        this.wideRoads     = new CellGrid(); // anchors of 2×2 CarStreet road blocks
         this.unlockedAreas = [];
-        this.unlockedCells = null; // Set of "x,y" strings, or null when whole grid is open
+        this.unlockedCells = null; // CellGrid of playable cells, or null when whole grid is open
         this.cityMetadata  = null;
         this.buildingPool  = [];
 
@@ -63,6 +72,7 @@ export class CityPlanner {
         this.isPaintingWideRoad = false;
         this._roadPaintErase  = false;
         this.showMinimap      = true;
+        this.editingLocked    = false;
         this.placingExpansion = false;
         this.selectedTemplate = null;
         this.selectedBuilding = null;
@@ -93,6 +103,10 @@ export class CityPlanner {
         this.renderMode  = 'normal'; // 'normal' | 'expiry'
 
         // Sub-systems
+        this.buildingShards   = new BuildingShards(this);
+        this.buildingNames    = new BuildingNames(this);
+        this.buildingIndex    = new BuildingIndex(this);
+        this.roadConnectivity = new RoadConnectivity(this);
         this.renderer         = new Renderer(this);
         this.events           = new EventHandler(this);
         this.importer         = new FoeImporter(this);
@@ -119,9 +133,11 @@ export class CityPlanner {
         applyDOM();
         this.renderColorLegend();
         this.renderHelpModal();
+        this.buildingNames.apply();
         // Re-render on language change
         window.addEventListener('localechange', () => {
             applyDOM();
+            this.buildingNames.apply();
             this.renderColorLegend();
             this.renderHelpModal();
             this.updatePoolPanel();
@@ -160,18 +176,15 @@ export class CityPlanner {
 
 /** Delete road at (x,y) without capturing its own snapshot — caller does that once. */
     eraseRoadAt(x, y) {
-        const anchor = this._getWideRoadAnchor(x, y);
+        const anchor = this._wideRoadAnchorCell(x, y);
         if (anchor) {
-            this.wideRoads.delete(anchor);
-            const [ax, ay] = anchor.split(',').map(Number);
-            for (let dy = 0; dy < 2; dy++)
-                for (let dx = 0; dx < 2; dx++)
-                    this.roads.delete(`${ax + dx},${ay + dy}`);
+            this._removeWideRoad(...anchor);
             if (this.selectedRoad) this.selectedRoad = null;
         } else {
-            this.roads.delete(`${x},${y}`);
+            this.roads.deleteCell(x, y);
         }
-        this.renderer.draw();
+        this.renderer.invalidate('roads');
+        this.renderer.drawFrame();
         this.importer.updateCityInfoPanel();
     }
 
@@ -213,13 +226,13 @@ export class CityPlanner {
                 if (this.isBuildingAt(x + dx, y + dy)) return;
             }
         }
-        const anchor = `${x},${y}`;
-        if (this.wideRoads.has(anchor)) return; // already placed
-        this.wideRoads.add(anchor);
+        if (this.wideRoads.hasCell(x, y)) return; // already placed
+        this.wideRoads.addCell(x, y);
         for (let dy = 0; dy < 2; dy++)
             for (let dx = 0; dx < 2; dx++)
-                this.roads.add(`${x + dx},${y + dy}`);
-        this.renderer.draw();
+                this.roads.addCell(x + dx, y + dy);
+        this.renderer.invalidate('roads');
+        this.renderer.drawFrame();
         this.importer.updateCityInfoPanel();
     }
 
@@ -228,31 +241,41 @@ export class CityPlanner {
      * or null if that cell is not part of any wide road.
      */
     _getWideRoadAnchor(x, y) {
+        const anchor = this._wideRoadAnchorCell(x, y);
+        return anchor ? `${anchor[0]},${anchor[1]}` : null;
+    }
+
+    /** [x, y] of the wide road block anchor covering cell (x,y), or null. */
+    _wideRoadAnchorCell(x, y) {
+        if (!this.wideRoads.size) return null;
         // A 2×2 block's anchor can be at (x,y), (x-1,y), (x,y-1), or (x-1,y-1)
         for (let dy = 0; dy < 2; dy++) {
             for (let dx = 0; dx < 2; dx++) {
-                const key = `${x - dx},${y - dy}`;
-                if (this.wideRoads.has(key)) return key;
+                if (this.wideRoads.hasCell(x - dx, y - dy)) return [x - dx, y - dy];
             }
         }
         return null;
     }
 
+    /** Remove the wide road block anchored at (ax, ay), all four of its cells. */
+    _removeWideRoad(ax, ay) {
+        this.wideRoads.deleteCell(ax, ay);
+        for (let dy = 0; dy < 2; dy++)
+            for (let dx = 0; dx < 2; dx++)
+                this.roads.deleteCell(ax + dx, ay + dy);
+    }
+
     /**
      * Remove the road (narrow or wide) at the given cell.
      * For wide roads, removes the entire 2×2 block.
      */
     removeRoadAt(x, y) {
         this.captureSnapshot();
-        const anchor = this._getWideRoadAnchor(x, y);
+        const anchor = this._wideRoadAnchorCell(x, y);
         if (anchor) {
-            this.wideRoads.delete(anchor);
-            const [ax, ay] = anchor.split(',').map(Number);
-            for (let dy = 0; dy < 2; dy++)
-                for (let dx = 0; dx < 2; dx++)
-                    this.roads.delete(`${ax + dx},${ay + dy}`);
+            this._removeWideRoad(...anchor);
         } else {
-            this.roads.delete(`${x},${y}`);
+            this.roads.deleteCell(x, y);
         }
         if (this.selectedRoad === `${x},${y}` || anchor) {
             this.selectedRoad = null;
@@ -263,6 +286,7 @@ export class CityPlanner {
 
     enterBuildingPlacement(template) {
         this.selectedTemplate = template;
+        this.buildingShards.ensure([template.id]); // prefetch prod/boosts before it is placed
         this.placingRoad = false;
         this.placingWideRoad = false;
         this.placingExpansion = false;
@@ -346,7 +370,7 @@ export class CityPlanner {
             this._recomputeGridBounds();
             return;
         }
-        this.unlockedCells = new Set();
+        this.unlockedCells = new CellGrid();
         for (const area of this.unlockedAreas) {
             const x0 = area.x      || 0;
             const y0 = area.y      || 0;
@@ -354,7 +378,7 @@ export class CityPlanner {
             const y1 = y0 + (area.length || 0);
             for (let cy = y0; cy < y1; cy++)
                 for (let cx = x0; cx < x1; cx++)
-                    this.unlockedCells.add(`${cx},${cy}`);
+                    this.unlockedCells.addCell(cx, cy);
         }
         this._recomputeGridBounds();
     }
@@ -386,12 +410,12 @@ export class CityPlanner {
 
     isCellUnlocked(x, y) {
         if (!this.unlockedCells) return true;
-        return this.unlockedCells.has(`${x},${y}`);
+        return this.unlockedCells.hasCell(x, y);
     }
 
     /** True if (x,y) is inside the visible/playable grid area. */
     isCellInGrid(x, y) {
-        if (this.unlockedCells) return this.unlockedCells.has(`${x},${y}`);
+        if (this.unlockedCells) return this.unlockedCells.hasCell(x, y);
         return x >= this.gridOffsetX && x < this.gridOffsetX + this.gridWidth &&
                y >= this.gridOffsetY && y < this.gridOffsetY + this.gridHeight;
     }
@@ -404,7 +428,7 @@ export class CityPlanner {
         if (this.unlockedCells) {
             for (let by = y; by < y + height; by++)
                 for (let bx = x; bx < x + width; bx++)
-                    if (!this.unlockedCells.has(`${bx},${by}`)) return false;
+                    if (!this.unlockedCells.hasCell(bx, by)) return false;
         } else {
             // No expansions: restrict to the default rectangular grid
             const minX = this.gridOffsetX, minY = this.gridOffsetY;
@@ -413,33 +437,69 @@ export class CityPlanner {
                 y + height > minY + this.gridHeight) return false;
         }
 
-        for (const b of this.buildings) {
-            if (b === excludeBuilding) continue;
-            if (!(x + width <= b.x || x >= b.x + b.width || y + height <= b.y || y >= b.y + b.height))
-                return false;
-        }
+        if (this.buildingIndex.overlapping(x, y, width, height, excludeBuilding)) return false;
 
         for (let by = y; by < y + height; by++)
             for (let bx = x; bx < x + width; bx++)
-                if (this.roads.has(`${bx},${by}`)) return false;
+                if (this.roads.hasCell(bx, by)) return false;
 
         return true;
     }
 
+    /** The placed building covering grid cell (x, y), or null. */
+    buildingAt(x, y) {
+        return this.buildingIndex.at(x, y);
+    }
+
     isBuildingAt(x, y) {
-        return this.buildings.some(b =>
-            x >= b.x && x < b.x + b.width &&
-            y >= b.y && y < b.y + b.height
-        );
+        return this.buildingIndex.at(x, y) !== null;
+    }
+
+    /** Move a placed building; goes through the index so hit-testing stays current. */
+    moveBuilding(building, x, y) {
+        this.buildingIndex.move(building, x, y);
     }
 
     captureSnapshot() { this.undoHistory.capture(); }
 
+    /**
+     * Make the layout read-only while the optimizer runs. Its previews stand
+     * in for the layout and its result replaces them at the end, so an edit
+     * or undo made meanwhile would be silently lost. Panning, zooming and
+     * Stop keep working; EventHandler swallows everything else.
+     */
+    setEditingLocked(locked) {
+        this.editingLocked = locked;
+        document.querySelectorAll(EDIT_CONTROLS).forEach(el => el.classList.toggle('edit-locked', locked));
+        if (!locked) return;
+
+        this.selectedTemplate   = null;
+        this.selectedBuilding   = null;
+        this.selectedRoad       = null;
+        this.placingRoad        = false;
+        this.isPaintingRoad     = false;
+        this.placingWideRoad    = false;
+        this.isPaintingWideRoad = false;
+        this.placingExpansion   = false;
+        this.hoverPos           = null;
+        this._clearActiveBuildingBtn();
+        this._setActiveToolBtn(null);
+        this.hideModeBanner();
+        this.events._hideContextMenu();
+        this.events._hidePoolContextMenu();
+        this.events._hideListContextMenu();
+        this.events._hideExpansionContextMenu();
+    }
+
     // ========================================
     // BUILDING OPERATIONS
     // ========================================
     placeBuilding(gridPos) {
-        const { id, width, height, name, color, type, age, needsRoad = 1, boosts, prod } = this.selectedTemplate;
+        const { id, width, height, name, color, type, age, needsRoad = 1 } = this.selectedTemplate;
+        // The payload shard may have arrived after the template was selected
+        const live   = this.buildingTemplates[id] || {};
+        const boosts = this.selectedTemplate.boosts || live.boosts;
+        const prod   = this.selectedTemplate.prod   || live.prod;
         if (this.canPlaceBuilding(gridPos.x, gridPos.y, width, height)) {
             if (this.activeCityType === 'quantum' && this.qiSimulator.enabled && !this.qiSimulator.canAffordBuilding({ id })) {
                 this.showToast(t('qiSim.cantAffordBuilding', { name }));
@@ -471,20 +531,16 @@ export class CityPlanner {
         const { x, y } = gridPos;
         if (x < 0 || y < 0 || x >= this.gridWidth || y >= this.gridHeight) return;
         if (this.isCellUnlocked(x, y) && !this.isBuildingAt(x, y)) {
-            this.roads.add(`${x},${y}`);
-            this.renderer.draw();
+            this.roads.addCell(x, y);
+            this.renderer.invalidate('roads');
+            this.renderer.drawFrame();
             this.importer.updateCityInfoPanel();
         }
     }
 
     selectAtPosition(gridPos) {
         // Try selecting building
-        const building = this.buildings.find(b =>
-            gridPos.x >= b.x &&
-            gridPos.x < b.x + b.width &&
-            gridPos.y >= b.y &&
-            gridPos.y < b.y + b.height
-        );
+        const building = this.buildingAt(gridPos.x, gridPos.y);
 
         if (building) {
             this.selectedBuilding = building;
@@ -495,10 +551,9 @@ export class CityPlanner {
         }
 
         // Try selecting road
-        const roadKey = `${gridPos.x},${gridPos.y}`;
-        if (this.roads.has(roadKey)) {
+        if (this.roads.hasCell(gridPos.x, gridPos.y)) {
             this.selectedBuilding = null;
-            this.selectedRoad = roadKey;
+            this.selectedRoad = `${gridPos.x},${gridPos.y}`;
             this.updateSelectionBanner();
             this.renderer.draw();
             return;
@@ -517,54 +572,25 @@ export class CityPlanner {
     }
 
     /**
-     * BFS through road cells starting from cells adjacent to the Town Hall.
-     * Returns a Set of "x,y" road-cell keys reachable from the Town Hall,
-     * or null if no Town Hall is on the grid.
+     * Road cells connected to the Town Hall as a CellGrid, or null if no Town
+     * Hall is on the grid. RoadConnectivity keeps it current as roads change,
+     * so asking again is cheap; the grid is updated in place.
      */
     computeRoadConnectivity() {
-        const th = this.buildings.find(b => this.isTownhall(b));
-        if (!th) return null;
-
-        const DIRS = [[-1,0],[1,0],[0,-1],[0,1]];
-        const reachable = new Set();
-        const queue = [];
-
-        // Seed with all road cells orthogonally adjacent to the TH footprint
-        for (let bx = th.x; bx < th.x + th.width; bx++) {
-            for (let by = th.y; by < th.y + th.height; by++) {
-                for (const [dx, dy] of DIRS) {
-                    const key = `${bx + dx},${by + dy}`;
-                    if (this.roads.has(key) && !reachable.has(key)) {
-                        reachable.add(key);
-                        queue.push(key);
-                    }
-                }
-            }
-        }
-
-        // BFS through the road network
-        while (queue.length) {
-            const key = queue.shift();
-            const [cx, cy] = key.split(',').map(Number);
-            for (const [dx, dy] of DIRS) {
-                const nk = `${cx + dx},${cy + dy}`;
-                if (this.roads.has(nk) && !reachable.has(nk)) {
-                    reachable.add(nk);
-                    queue.push(nk);
-                }
-            }
-        }
-
-        return reachable;
+        return this.roadConnectivity.reachable();
     }
 
-    /** Returns true if any road cell adjacent to the building's footprint is in reachableRoads. */
+    /**
+     * Returns true if any road cell adjacent to the building's footprint is in
+     * reachableRoads (computeRoadConnectivity(), by default).
+     */
     isBuildingRoadConnected(building, reachableRoads) {
+        if (!reachableRoads) return this.roadConnectivity.isConnected(building);
         const DIRS = [[-1,0],[1,0],[0,-1],[0,1]];
         for (let bx = building.x; bx < building.x + building.width; bx++) {
             for (let by = building.y; by < building.y + building.height; by++) {
                 for (const [dx, dy] of DIRS) {
-                    if (reachableRoads.has(`${bx + dx},${by + dy}`)) return true;
+                    if (reachableRoads.hasCell(bx + dx, by + dy)) return true;
                 }
             }
         }
@@ -1127,7 +1153,10 @@ export class CityPlanner {
                 `${era}<span class="age-group-count">(${list.length})</span>`;
             header.addEventListener('click', () => {
                 if (this.expandedEras.has(era)) this.expandedEras.delete(era);
-                else this.expandedEras.add(era);
+                else {
+                    this.expandedEras.add(era);
+                    this.buildingShards.load(this.buildingShards.shardForAge(era));
+                }
                 this.updateBuildingList();
             });
             container.appendChild(header);
@@ -1375,6 +1404,7 @@ export class CityPlanner {
             }
         }
 
+        this.productionOverview.invalidate(); // templates gained efficiency stats
         this.updatePoolPanel();
         this.updateBuildingList(); // refresh palette so template changes take effect
 
@@ -1481,7 +1511,7 @@ export class CityPlanner {
             octx.fillStyle = 'rgba(40,40,40,0.45)';
             for (let cy = this.gridOffsetY; cy < this.gridOffsetY + this.gridHeight; cy++)
                 for (let cx = this.gridOffsetX; cx < this.gridOffsetX + this.gridWidth; cx++)
-                    if (!this.unlockedCells.has(`${cx},${cy}`))
+                    if (!this.unlockedCells.hasCell(cx, cy))
                         octx.fillRect(cx * cellPx, cy * cellPx, cellPx, cellPx);
         }
 
@@ -1502,14 +1532,13 @@ export class CityPlanner {
         }
 
         // Roads
-        for (const roadKey of this.roads) {
-            const [rx, ry] = roadKey.split(',').map(Number);
+        this.roads.forEachCell((rx, ry) => {
             octx.fillStyle = '#808080';
             octx.fillRect(rx * cellPx, ry * cellPx, cellPx, cellPx);
             octx.strokeStyle = '#555';
             octx.lineWidth = 1;
             octx.strokeRect(rx * cellPx, ry * cellPx, cellPx, cellPx);
-        }
+        });
 
         // Buildings
         for (const b of this.buildings) {
@@ -2360,13 +2389,15 @@ export class CityPlanner {
     clearAll() {
         if (!confirm(t('alert.clearConfirm'))) return;
         this.buildings   = [];
-        this.roads       = new Set();
-        this.wideRoads   = new Set();
+        this.roads       = new CellGrid();
+        this.wideRoads   = new CellGrid();
         this.buildingPool = [];
         this.cityMetadata = null;
         this.importer.updateCityInfoPanel();
         document.getElementById('undoOptimizeBtn').style.display = 'none';
+        document.getElementById('continueOptimizeBtn').style.display = 'none';
         this.optimizer._snapshot = null;
+        this.optimizer._resume = null;
         this.updatePoolPanel();
         this.renderer.draw();
         this.updateCityTabs();
@@ -2380,8 +2411,8 @@ export class CityPlanner {
     getSnapshot() {
         const snap = {
             buildings:     JSON.parse(JSON.stringify(this.buildings)),
-            roads:         Array.from(this.roads),
-            wideRoads:     Array.from(this.wideRoads),
+            roads:         this.roads.toJSON(),       // saved as "x,y" keys
+            wideRoads:     this.wideRoads.toJSON(),
             unlockedAreas: JSON.parse(JSON.stringify(this.unlockedAreas)),
             buildingPool:  JSON.parse(JSON.stringify(this.buildingPool)),
             gridWidth:     this.gridWidth,
@@ -2398,8 +2429,8 @@ export class CityPlanner {
     restoreSnapshot(snap) {
         if (snap) {
             this.buildings     = snap.buildings     || [];
-            this.roads         = new Set(snap.roads || []);
-            this.wideRoads     = new Set(snap.wideRoads || []);
+            this.roads         = CellGrid.from(snap.roads || []);
+            this.wideRoads     = CellGrid.from(snap.wideRoads || []);
             this.unlockedAreas = snap.unlockedAreas || [];
             this.buildingPool  = snap.buildingPool  || [];
             this.cityMetadata  = snap.cityMetadata  || null;
@@ -2416,6 +2447,7 @@ export class CityPlanner {
             this._initEmptyCityState();
         }
         this.rebuildUnlockedCells();
+        this.buildingShards.ensureForCity(); // warm prod/boosts for tooltips and overviews
         document.getElementById('gridWidth').value  = this.gridWidth;
         document.getElementById('gridHeight').value = this.gridHeight;
         this.resizeCanvas();
@@ -2442,8 +2474,8 @@ export class CityPlanner {
     /** Reset city-state properties to blank defaults (does NOT re-render). */
     _initEmptyCityState() {
         this.buildings     = [];
-        this.roads         = new Set();
-        this.wideRoads     = new Set();
+        this.roads         = new CellGrid();
+        this.wideRoads     = new CellGrid();
         this.unlockedAreas = [];
         this.unlockedCells = null;
         this.buildingPool  = [];
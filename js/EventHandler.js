@@ -1,10 +1,13 @@
 import { CONSTANTS, CITY_TYPES } from './constants.js';
 import { track } from './analytics.js';
 import { Utils } from './utils.js';
-import { GB_BONUSES } from '../data/gb_bonuses.js';
+import { GB_BONUSES } from '../data/manifest.js';
 import { FoeImporter } from './FoeImporter.js';
 import { t } from './i18n.js';
 
+// Shortcuts that only move the view; the rest are ignored while the optimizer runs
+const VIEW_KEYS = new Set(['+', '=', '-', '0', 'm', 'M', 'Escape']);
+
 export class EventHandler {
     constructor(planner) {
         this.p = planner;
@@ -36,6 +39,17 @@ export class EventHandler {
         document.getElementById('cancelAddBtn').addEventListener('click',    () => p.hideModal('addBuildingModal'));
         document.getElementById('addBuildingForm').addEventListener('submit', e => p.handleAddBuilding(e));
 
+        // While the optimizer runs, clicks on layout controls (marked by
+        // CityPlanner.setEditingLocked) never reach their handlers
+        for (const type of ['click', 'mousedown', 'touchstart', 'contextmenu']) {
+            document.addEventListener(type, e => {
+                if (p.editingLocked && e.target.closest?.('.edit-locked')) {
+                    e.preventDefault();
+                    e.stopPropagation();
+                }
+            }, { capture: true, passive: false });
+        }
+
         // City tabs
         document.querySelectorAll('.city-tab').forEach(btn =>
             btn.addEventListener('click', () => p.switchCity(btn.dataset.city))
@@ -129,6 +143,8 @@ export class EventHandler {
         // Optimizer
         document.getElementById('optimizeBtn').addEventListener('click',     () => { track('optimizer-run', 'Optimizer Run'); p.optimizer.run(); });
         document.getElementById('undoOptimizeBtn').addEventListener('click', () => p.optimizer.undo());
+        document.getElementById('stopOptimizeBtn').addEventListener('click', () => p.optimizer.stop());
+        document.getElementById('continueOptimizeBtn').addEventListener('click', () => p.optimizer.resume());
 
         // Production overview
         document.getElementById('prodOverviewBtn').addEventListener('click',
@@ -543,6 +559,9 @@ export class EventHandler {
         // Ignore shortcuts when typing in an input/textarea
         if (['INPUT', 'TEXTAREA', 'SELECT'].includes(e.target.tagName)) return;
 
+        // Only the view shortcuts while the optimizer owns the layout
+        if (p.editingLocked && !VIEW_KEYS.has(e.key)) return;
+
         // Ctrl+Z — undo
         if ((e.ctrlKey || e.metaKey) && e.key === 'z' && !e.shiftKey) {
             e.preventDefault();
@@ -641,8 +660,7 @@ export class EventHandler {
             const nx = b.x + dx, ny = b.y + dy;
             if (p.canPlaceBuilding(nx, ny, b.width, b.height, b)) {
                 p.captureSnapshot();
-                b.x = nx;
-                b.y = ny;
+                p.moveBuilding(b, nx, ny);
                 p.renderer.draw();
             }
             return;
@@ -696,7 +714,7 @@ export class EventHandler {
         p.zoom = newZoom;
 
         p.updateStatus(t('status.zoom', { pct: Math.round(p.zoom * 100) }));
-        p.renderer.draw();
+        p.renderer.drawFrame();
     }
 
     handleMouseDown(e) {
@@ -721,17 +739,18 @@ export class EventHandler {
             const gy = (cy - mm.top)  / mm.height * gridHeight + gridOffsetY;
             p.panX = p.canvas.width  / 2 - gx * cellSize * zoom;
             p.panY = p.canvas.height / 2 - gy * cellSize * zoom;
-            p.renderer.draw();
+            p.renderer.drawFrame();
             return;
         }
 
         const gridPos = p.getGridCoords(e.clientX, e.clientY);
 
         // Left-click drag outside the playable grid → pan the camera
-        // (only in default mode; tool-active modes still get their click on out-of-grid cells)
-        if (e.button === 0 &&
+        // (only in default mode; tool-active modes still get their click on out-of-grid cells).
+        // While the optimizer runs the layout is read-only and a drag anywhere pans.
+        if (e.button === 0 && (p.editingLocked ||
             !p.placingRoad && !p.placingWideRoad && !p.placingExpansion && !p.selectedTemplate &&
-            !p.isCellInGrid(gridPos.x, gridPos.y)) {
+            !p.isCellInGrid(gridPos.x, gridPos.y))) {
             p.isPanning = true;
             p.lastPanX  = e.clientX;
             p.lastPanY  = e.clientY;
@@ -743,8 +762,7 @@ export class EventHandler {
         if (p.placingRoad) {
             p.captureSnapshot();
             p.isPaintingRoad = true;
-            const key = `${gridPos.x},${gridPos.y}`;
-            p._roadPaintErase = p.roads.has(key) || !!p._getWideRoadAnchor(gridPos.x, gridPos.y);
+            p._roadPaintErase = p.roads.hasCell(gridPos.x, gridPos.y) || !!p._wideRoadAnchorCell(gridPos.x, gridPos.y);
             if (p._roadPaintErase) p.eraseRoadAt(gridPos.x, gridPos.y);
             else p.placeRoad(gridPos);
             return;
@@ -774,10 +792,7 @@ export class EventHandler {
 
         // Default: select/move
         // Check if clicking any building — select it and start dragging immediately
-        const clickedBuilding = p.buildings.find(b =>
-            gridPos.x >= b.x && gridPos.x < b.x + b.width &&
-            gridPos.y >= b.y && gridPos.y < b.y + b.height
-        );
+        const clickedBuilding = p.buildingAt(gridPos.x, gridPos.y);
         if (clickedBuilding) {
             p.captureSnapshot();
             p.selectedBuilding = clickedBuilding;
@@ -793,29 +808,25 @@ export class EventHandler {
         }
 
         // Check if clicking on any road — select and start drag
-        const roadKey = `${gridPos.x},${gridPos.y}`;
-        if (p.roads.has(roadKey)) {
+        if (p.roads.hasCell(gridPos.x, gridPos.y)) {
             p.captureSnapshot();
             p.selectedBuilding = null;
-            const wideAnchor = p._getWideRoadAnchor(gridPos.x, gridPos.y);
+            const wideAnchor = p._wideRoadAnchorCell(gridPos.x, gridPos.y);
             if (wideAnchor) {
-                const [ax, ay] = wideAnchor.split(',').map(Number);
-                p.selectedRoad = wideAnchor;
-                // Remove from sets for the duration of the drag
-                p.wideRoads.delete(wideAnchor);
-                for (let dy = 0; dy < 2; dy++)
-                    for (let dx = 0; dx < 2; dx++)
-                        p.roads.delete(`${ax + dx},${ay + dy}`);
+                const [ax, ay] = wideAnchor;
+                p.selectedRoad = `${ax},${ay}`;
+                // Remove from the grids for the duration of the drag
+                p._removeWideRoad(ax, ay);
                 p.draggingWideRoad  = { x: ax, y: ay };
                 p.wideRoadDragStart = { x: ax, y: ay };
                 p.wideRoadDragPixelX = e.clientX;
                 p.wideRoadDragPixelY = e.clientY;
             } else {
                 // Narrow road drag
-                p.selectedRoad  = roadKey;
+                p.selectedRoad  = `${gridPos.x},${gridPos.y}`;
                 p.draggingRoad  = { x: gridPos.x, y: gridPos.y };
                 p.roadDragStart = { x: gridPos.x, y: gridPos.y };
-                p.roads.delete(roadKey);
+                p.roads.deleteCell(gridPos.x, gridPos.y);
                 p.roadDragPixelX = e.clientX;
                 p.roadDragPixelY = e.clientY;
             }
@@ -834,7 +845,7 @@ export class EventHandler {
         if (p.draggingBuilding) {
             p.dragPixelX = e.clientX;
             p.dragPixelY = e.clientY;
-            p.renderer.draw();
+            p.renderer.drawFrame();
             this._hideTooltip();
             return;
         }
@@ -842,7 +853,7 @@ export class EventHandler {
         if (p.draggingRoad) {
             p.roadDragPixelX = e.clientX;
             p.roadDragPixelY = e.clientY;
-            p.renderer.draw();
+            p.renderer.drawFrame();
             this._hideTooltip();
             return;
         }
@@ -850,7 +861,7 @@ export class EventHandler {
         if (p.draggingWideRoad) {
             p.wideRoadDragPixelX = e.clientX;
             p.wideRoadDragPixelY = e.clientY;
-            p.renderer.draw();
+            p.renderer.drawFrame();
             this._hideTooltip();
             return;
         }
@@ -860,7 +871,7 @@ export class EventHandler {
             p.panY += e.clientY - p.lastPanY;
             p.lastPanX = e.clientX;
             p.lastPanY = e.clientY;
-            p.renderer.draw();
+            p.renderer.drawFrame();
             this._hideTooltip();
             return;
         }
@@ -882,7 +893,7 @@ export class EventHandler {
 
         if (p.selectedTemplate || p.placingExpansion || p.placingWideRoad) {
             p.hoverPos = gridPos;
-            p.renderer.draw();
+            p.renderer.drawFrame();
         }
 
         this._updateCursorForHover(gridPos);
@@ -907,12 +918,12 @@ export class EventHandler {
                 newX < p.gridOffsetX + p.gridWidth && newY < p.gridOffsetY + p.gridHeight &&
                 p.isCellUnlocked(newX, newY) && !p.isBuildingAt(newX, newY)
             ) {
-                p.roads.add(`${newX},${newY}`);
+                p.roads.addCell(newX, newY);
                 if (newX === rsx && newY === rsy) p.undoHistory.discard(); // no net change
             } else {
                 // Restore original position — no net change
                 p.undoHistory.discard();
-                p.roads.add(`${rsx},${rsy}`);
+                p.roads.addCell(rsx, rsy);
             }
             p.draggingRoad = null;
             p.roadDragStart = null;
@@ -931,23 +942,21 @@ export class EventHandler {
                 for (let dx = 0; dx < 2 && canPlace; dx++)
                     if (!p.isCellUnlocked(newX + dx, newY + dy) || p.isBuildingAt(newX + dx, newY + dy))
                         canPlace = false;
-            const newAnchor = `${newX},${newY}`;
-            if (canPlace && !p.wideRoads.has(newAnchor)) {
-                p.wideRoads.add(newAnchor);
+            if (canPlace && !p.wideRoads.hasCell(newX, newY)) {
+                p.wideRoads.addCell(newX, newY);
                 for (let dy = 0; dy < 2; dy++)
                     for (let dx = 0; dx < 2; dx++)
-                        p.roads.add(`${newX + dx},${newY + dy}`);
-                p.selectedRoad = newAnchor;
+                        p.roads.addCell(newX + dx, newY + dy);
+                p.selectedRoad = `${newX},${newY}`;
                 if (newX === sx && newY === sy) p.undoHistory.discard(); // no net change
             } else {
                 // Restore original position — no net change
                 p.undoHistory.discard();
-                const origAnchor = `${sx},${sy}`;
-                p.wideRoads.add(origAnchor);
+                p.wideRoads.addCell(sx, sy);
                 for (let dy = 0; dy < 2; dy++)
                     for (let dx = 0; dx < 2; dx++)
-                        p.roads.add(`${sx + dx},${sy + dy}`);
-                p.selectedRoad = origAnchor;
+                        p.roads.addCell(sx + dx, sy + dy);
+                p.selectedRoad = `${sx},${sy}`;
             }
             p.draggingWideRoad  = null;
             p.wideRoadDragStart = null;
@@ -971,8 +980,7 @@ export class EventHandler {
 
             // Snap to grid from final mouse position
             const snapPos = p.getGridCoords(e.clientX, e.clientY);
-            b.x = snapPos.x - p.dragOffset.x;
-            b.y = snapPos.y - p.dragOffset.y;
+            p.moveBuilding(b, snapPos.x - p.dragOffset.x, snapPos.y - p.dragOffset.y);
 
             const offGrid =
                 b.x < p.gridOffsetX || b.y < p.gridOffsetY ||
@@ -983,7 +991,7 @@ export class EventHandler {
             const onLockedArea = !offGrid && p.unlockedCells && (() => {
                 for (let dy = 0; dy < b.height; dy++)
                     for (let dx = 0; dx < b.width; dx++)
-                        if (!p.unlockedCells.has(`${b.x + dx},${b.y + dy}`)) return true;
+                        if (!p.unlockedCells.hasCell(b.x + dx, b.y + dy)) return true;
                 return false;
             })();
 
@@ -994,8 +1002,7 @@ export class EventHandler {
             } else if (!p.canPlaceBuilding(b.x, b.y, b.width, b.height, b)) {
                 // Snapped back — no net change, discard the captured snapshot
                 p.undoHistory.discard();
-                b.x = p.dragStartPos.x;
-                b.y = p.dragStartPos.y;
+                p.moveBuilding(b, p.dragStartPos.x, p.dragStartPos.y);
                 p.updateStatus(t('status.invalidPlacement'));
                 setTimeout(() => p.updateStatus(t('status.selectMove')), 2000);
             } else if (b.x === p.dragStartPos.x && b.y === p.dragStartPos.y) {
@@ -1016,18 +1023,17 @@ export class EventHandler {
 
         // Restore roads if dragged off-canvas
         if (p.draggingRoad) {
-            p.roads.add(`${p.roadDragStart.x},${p.roadDragStart.y}`);
+            p.roads.addCell(p.roadDragStart.x, p.roadDragStart.y);
             p.draggingRoad  = null;
             p.roadDragStart = null;
         }
         if (p.draggingWideRoad) {
             const { x: sx, y: sy } = p.wideRoadDragStart;
-            const origAnchor = `${sx},${sy}`;
-            p.wideRoads.add(origAnchor);
+            p.wideRoads.addCell(sx, sy);
             for (let dy = 0; dy < 2; dy++)
                 for (let dx = 0; dx < 2; dx++)
-                    p.roads.add(`${sx + dx},${sy + dy}`);
-            p.selectedRoad      = origAnchor;
+                    p.roads.addCell(sx + dx, sy + dy);
+            p.selectedRoad      = `${sx},${sy}`;
             p.draggingWideRoad  = null;
             p.wideRoadDragStart = null;
         }
@@ -1039,11 +1045,9 @@ export class EventHandler {
     handleContextMenu(e) {
         e.preventDefault();
         const p = this.p;
+        if (p.editingLocked) return;
         const gridPos = p.getGridCoords(e.clientX, e.clientY);
-        const building = p.buildings.find(b =>
-            gridPos.x >= b.x && gridPos.x < b.x + b.width &&
-            gridPos.y >= b.y && gridPos.y < b.y + b.height
-        );
+        const building = p.buildingAt(gridPos.x, gridPos.y);
 
         // No building — check if we're over a removable (manual) expansion block
         if (!building) {
@@ -1175,7 +1179,7 @@ export class EventHandler {
                 p.hoverPos = null;
                 p._poolDragTemplate = null;
             }
-            p.renderer.draw();
+            p.renderer.drawFrame();
         };
 
         const up = (ev) => {
@@ -1247,7 +1251,7 @@ export class EventHandler {
             p.canvas.classList.toggle('pool-drag-over', over);
             if (over) { p.hoverPos = p.getGridCoords(cx, cy); p._poolDragTemplate = building; }
             else      { p.hoverPos = null; p._poolDragTemplate = null; }
-            p.renderer.draw();
+            p.renderer.drawFrame();
             if (ev.touches) ev.preventDefault();
         };
 
@@ -1291,11 +1295,7 @@ export class EventHandler {
 
     _updateCursorForHover(gridPos) {
         const p = this.p;
-        const hovering = p.buildings.some(b =>
-            gridPos.x >= b.x && gridPos.x < b.x + b.width &&
-            gridPos.y >= b.y && gridPos.y < b.y + b.height
-        );
-        if (hovering) {
+        if (p.isBuildingAt(gridPos.x, gridPos.y)) {
             p.canvas.style.cursor = 'grab';
             return;
         }
@@ -1318,10 +1318,7 @@ export class EventHandler {
         const el = document.getElementById('buildingTooltip');
         if (!el) return;
 
-        const building = p.buildings.find(b =>
-            gridPos.x >= b.x && gridPos.x < b.x + b.width &&
-            gridPos.y >= b.y && gridPos.y < b.y + b.height
-        );
+        const building = p.buildingAt(gridPos.x, gridPos.y);
 
         if (!building) {
             el.style.display = 'none';
@@ -1329,6 +1326,8 @@ export class EventHandler {
         }
 
         const template = p.buildingTemplates[building.id] || {};
+        // Payload not fetched yet: start loading it, the next mousemove shows the stats
+        if (!p.buildingShards.isLoaded(building.id)) p.buildingShards.ensure([building.id]);
         el.innerHTML = this._buildTooltipHTML(building, template);
 
         // Position: follow cursor with a small offset, flip if near right/bottom edge
@@ -1452,8 +1451,9 @@ export class EventHandler {
             }
         }
 
-        // Military boosts
-        if (building.boosts && building.boosts.length > 0) {
+        // Military boosts (placed before its shard loaded → fall back to the template)
+        const boosts = building.boosts?.length ? building.boosts : template.boosts;
+        if (boosts && boosts.length > 0) {
             const BOOST_LABELS = {
                 att_boost_attacker:              ['⚔️',    'Attack (Attacker)'],
                 att_boost_defender:              ['⚔️',    'Attack (Defender)'],
@@ -1468,7 +1468,7 @@ export class EventHandler {
                 guild_expedition: ' [GE]', guild_raids: ' [GR]',
             };
             html += `<div class="tt-section">${t('tooltip.militaryBonuses')}</div>`;
-            for (const b of building.boosts) {
+            for (const b of boosts) {
                 const [icon, label] = BOOST_LABELS[b.type] || ['⚔️', b.type];
                 const feature = FEATURE_LABELS[b.feature] ?? ` [${b.feature}]`;
                 html += `<div class="tt-stat">
@@ -1681,7 +1681,7 @@ export class EventHandler {
             this._prevPinchDist = dist;
             this._prevPinchMidX = midX;
             this._prevPinchMidY = midY;
-            p.renderer.draw();
+            p.renderer.drawFrame();
             return;
         }
 
@@ -1,6 +1,7 @@
 import { CONSTANTS } from './constants.js';
 import { track } from './analytics.js';
 import { t } from './i18n.js';
+import { CellGrid } from './CellGrid.js';
 
 export class FoeImporter {
     constructor(planner) {
@@ -62,7 +63,7 @@ export class FoeImporter {
 
         // Reset temp state
         p.buildings    = [];
-        p.roads        = new Set();
+        p.roads        = new CellGrid();
         p.buildingPool = [];
         p.unlockedAreas = [];
         p.cityMetadata  = null;
@@ -217,15 +218,14 @@ export class FoeImporter {
                     // Determine block size from meta (should be 2×2), default to 2
                     const bw = (width  >= 2) ? width  : 2;
                     const bh = (height >= 2) ? height : 2;
-                    const anchor = `${x},${y}`;
-                    if (!p.wideRoads.has(anchor)) {
-                        p.wideRoads.add(anchor);
+                    if (!p.wideRoads.hasCell(x, y)) {
+                        p.wideRoads.addCell(x, y);
                         for (let dy = 0; dy < bh; dy++)
                             for (let dx = 0; dx < bw; dx++)
-                                p.roads.add(`${x + dx},${y + dy}`);
+                                p.roads.addCell(x + dx, y + dy);
                     }
                 } else {
-                    p.roads.add(`${x},${y}`);
+                    p.roads.addCell(x, y);
                 }
                 streetsUsed++;
                 return;
@@ -0,0 +1,1168 @@
+/**
+ * OptimizerSearch — the DOM-free half of the layout optimizer: snake road
+ * configs and strategies plus the flat-grid (Uint8Array) placement helpers.
+ * Optimizer extends it on the main thread and OptimizerWorker runs it in Web
+ * Workers, so nothing in here may touch the document, i18n or the planner.
+ */
+
+// Grid cell constants for Uint8Array
+export const FREE = 0, BUILDING = 1, ROAD = 2, TOWNHALL = 3, BLOCKED = 4;
+
+export const MEDIUM_TIME_LIMIT = 30_000; // ms, medium-building retry
+
+/**
+ * Summed-area tables over a flat optimizer grid. Each table holds, for every
+ * (x, y), the number of matching cells in the rectangle [0, x) × [0, y), so
+ * "is this footprint free" or "how many road cells border it" is four reads
+ * instead of a loop over the footprint or perimeter.
+ *
+ * Tables: occ (any non-FREE cell), road, building and townhall. The index is
+ * a snapshot: building it is one O(W·H) pass, so make a new one after the
+ * grid changes rather than patching it (a placement shifts every prefix sum
+ * below and right of it anyway).
+ */
+export class GridIndex {
+    constructor(grid, W, H) {
+        this.W = W;
+        this.H = H;
+        const S = W + 1, size = S * (H + 1);
+        const occ = this.occ = new Int32Array(size);
+        const road = this.road = new Int32Array(size);
+        const building = this.building = new Int32Array(size);
+        const townhall = this.townhall = new Int32Array(size);
+
+        for (let y = 0; y < H; y++) {
+            let o = 0, r = 0, bl = 0, th = 0;
+            const row = (y + 1) * S, above = y * S;
+            for (let x = 0; x < W; x++) {
+                const v = grid[y * W + x];
+                if (v !== FREE)     o++;
+                if (v === ROAD)     r++;
+                if (v === BUILDING) bl++;
+                if (v === TOWNHALL) th++;
+                const i = row + x + 1, j = above + x + 1;
+                occ[i]      = occ[j] + o;
+                road[i]     = road[j] + r;
+                building[i] = building[j] + bl;
+                townhall[i] = townhall[j] + th;
+            }
+        }
+    }
+
+    /** Matching cells of table in the w×h rectangle at (x, y); parts off the grid count 0. */
+    sum(table, x, y, w, h) {
+        let x2 = x + w, y2 = y + h;
+        if (x < 0) x = 0;
+        if (y < 0) y = 0;
+        if (x2 > this.W) x2 = this.W;
+        if (y2 > this.H) y2 = this.H;
+        if (x2 <= x || y2 <= y) return 0;
+        const S = this.W + 1;
+        return table[y2 * S + x2] - table[y * S + x2] - table[y2 * S + x] + table[y * S + x];
+    }
+
+    /** Matching cells of table edge-adjacent to the w×h footprint at (lx, ly) (corners excluded). */
+    border(table, lx, ly, w, h) {
+        return this.sum(table, lx, ly - 1, w, 1) + this.sum(table, lx, ly + h, w, 1)
+             + this.sum(table, lx - 1, ly, 1, h) + this.sum(table, lx + w, ly, 1, h);
+    }
+
+    /**
+     * Top-left corners (as ly * W + lx, unordered) of every free w×h footprint
+     * with a connectedRoads cell on one of its faces: the only places a
+     * road-requiring building can go, found from the road side instead of by
+     * scanning the whole grid.
+     */
+    frontage(connectedRoads, w, h) {
+        const { W, H, occ } = this;
+        const seen = new Uint8Array(W * H), out = [];
+        const add = (lx, ly) => {
+            if (lx < 0 || ly < 0 || lx > W - w || ly > H - h) return;
+            const i = ly * W + lx;
+            if (seen[i]) return;
+            seen[i] = 1;
+            if (this.sum(occ, lx, ly, w, h) === 0) out.push(i);
+        };
+        for (const ci of connectedRoads) {
+            const rx = ci % W, ry = (ci - rx) / W;
+            for (let lx = rx - w + 1; lx <= rx; lx++) { add(lx, ry + 1); add(lx, ry - h); }
+            for (let ly = ry - h + 1; ly <= ry; ly++) { add(rx + 1, ly); add(rx - w, ly); }
+        }
+        return out;
+    }
+}
+
+/**
+ * Zobrist keys: a fixed pseudo-random 64-bit value (two uint32 halves) per
+ * slot. The key of a set of slots is the XOR of theirs, so it does not
+ * depend on the order the slots were filled and can be updated one slot at
+ * a time. The seed is fixed, so every worker derives the same keys.
+ */
+export class Zobrist {
+    constructor(size) {
+        this.lo = new Uint32Array(size);
+        this.hi = new Uint32Array(size);
+        let x = 0x9E3779B9;
+        const next = () => { x ^= x << 13; x ^= x >>> 17; x ^= x << 5; return x >>> 0; }; // xorshift32
+        for (let i = 0; i < size; i++) {
+            this.lo[i] = next();
+            this.hi[i] = next();
+        }
+    }
+}
+
+/** Bounded LRU set of state keys (Map insertion order is the recency order). */
+export class TranspositionTable {
+    constructor(limit = 4096) {
+        this.limit = limit;
+        this.map   = new Map();
+        this.hits  = 0;
+    }
+
+    get size() { return this.map.size; }
+
+    keys() { return [...this.map.keys()]; }
+
+    /** True if key is stored; a hit becomes the most recently used entry. */
+    has(key) {
+        if (!this.map.has(key)) return false;
+        const value = this.map.get(key);
+        this.map.delete(key);
+        this.map.set(key, value);
+        this.hits++;
+        return true;
+    }
+
+    add(key, value = true) {
+        this.map.delete(key);
+        this.map.set(key, value);
+        if (this.map.size > this.limit) this.map.delete(this.map.keys().next().value);
+    }
+}
+
+export class OptimizerSearch {
+    _isBetterResult(a, b) {
+        if (!b) return true;
+        if (a.buildingsPlaced !== b.buildingsPlaced) return a.buildingsPlaced > b.buildingsPlaced;
+        if (a.roadCount !== b.roadCount) return a.roadCount < b.roadCount;
+        // Tie: the earlier config wins, as in a serial run (results arrive out of order from workers)
+        return a.configIndex < b.configIndex;
+    }
+
+    // ========================================================================
+    // SNAKE STRATEGY — configs
+    // ========================================================================
+
+    _generateSnakeConfigs(roadBuildings) {
+        const { medium: medBlds } = this._classifyBuildings(roadBuildings);
+
+        // Split medium buildings by orientation:
+        //   Wide  (width > height): HEIGHT is the perpendicular corridor for H roads → prefer H
+        //   Tall  (height > width): WIDTH  is the perpendicular corridor for V roads → prefer V
+        //   Square: neutral — split half weight to each axis
+        const tallMed = medBlds.filter(b => b.height > b.width);
+        const wideMed = medBlds.filter(b => b.width  > b.height);
+        const sqMed   = medBlds.filter(b => b.width === b.height);
+
+        // H/V demand via perpendicular-corridor sums:
+        //   hDemand = sum of heights of wide buildings (their H-road perpendicular = height)
+        //   vDemand = sum of widths  of tall buildings (their V-road perpendicular = width)
+        // More demand on an axis → explore more configs of that axis.
+        const hShortSum = wideMed.reduce((s, b) => s + b.height,        0)
+                        + sqMed  .reduce((s, b) => s + b.height * 0.5,  0);
+        const vShortSum = tallMed.reduce((s, b) => s + b.width,         0)
+                        + sqMed  .reduce((s, b) => s + b.width  * 0.5,  0);
+        const wTot = hShortSum + vShortSum;
+
+        let hReps = 1, vReps = 1;
+        if (wTot > 0) {
+            const r = hShortSum / wTot;
+            if      (r >= 0.75) { hReps = 3; vReps = 1; }
+            else if (r >= 0.60) { hReps = 2; vReps = 1; }
+            else if (r <= 0.25) { hReps = 1; vReps = 3; }
+            else if (r <= 0.40) { hReps = 1; vReps = 2; }
+        }
+
+        // Orientation-specific spacings.
+        // segSpacing = corridor depth + 1 road cell, so it must exceed the building's
+        // perpendicular dimension (the dim extending away from the road).
+        //   H snake: buildings sit above/below → perpendicular dim = height → use wide building heights
+        //   V snake: buildings sit left/right  → perpendicular dim = width  → use tall building widths
+        const hPerpDims = [...wideMed.map(b => b.height), ...sqMed.map(b => b.height)]
+            .sort((a, b) => a - b);
+        const vPerpDims = [...tallMed.map(b => b.width),  ...sqMed.map(b => b.width)]
+            .sort((a, b) => a - b);
+
+        // Build a spacing list from a set of perpendicular dims; fall back to allMinDims.
+        const allMinDims = medBlds.map(b => Math.min(b.width, b.height)).sort((a, b) => a - b);
+        const makeSpacings = dims => {
+            const src = dims.length > 0 ? dims : (allMinDims.length > 0 ? allMinDims : [4]);
+            const med = src[Math.floor(src.length / 2)];
+            const max = src[src.length - 1];
+            return [...new Set([
+                med + 1, med + 2,
+                max + 1, max + 2, max + 3, max + 4,
+            ])].filter(s => s >= 2).sort((a, b) => a - b);
+        };
+
+        const hSnakeSpacings = makeSpacings(hPerpDims);
+        const vSnakeSpacings = makeSpacings(vPerpDims);
+
+        const hConfigs = [], vConfigs = [];
+        for (const thQuadrant of [0, 1, 2, 3]) {
+            for (const sp of hSnakeSpacings) {
+                hConfigs.push({ name: `h-q${thQuadrant}-sp${sp}`, snakeAxis: 'h', thQuadrant, segSpacing: sp });
+                hConfigs.push({ name: `h-br${thQuadrant}-sp${sp}`, snakeAxis: 'h', thQuadrant, segSpacing: sp, thMode: 'branch' });
+            }
+            for (const sp of vSnakeSpacings) {
+                vConfigs.push({ name: `v-q${thQuadrant}-sp${sp}`, snakeAxis: 'v', thQuadrant, segSpacing: sp });
+                vConfigs.push({ name: `v-br${thQuadrant}-sp${sp}`, snakeAxis: 'v', thQuadrant, segSpacing: sp, thMode: 'branch' });
+            }
+        }
+
+        // Interleave h and v configs according to the computed ratio.
+        const configs = [];
+        let hi = 0, vi = 0;
+        while (hi < hConfigs.length || vi < vConfigs.length) {
+            for (let r = 0; r < hReps && hi < hConfigs.length; r++) configs.push(hConfigs[hi++]);
+            for (let r = 0; r < vReps && vi < vConfigs.length; r++) configs.push(vConfigs[vi++]);
+        }
+        return configs;
+    }
+
+    _findConnectedRoads(grid, W, H, thLX, thLY, thW, thH) {
+        const connected = new Set();
+        const queue = [];
+        const DX = [1, -1, 0, 0], DY = [0, 0, 1, -1];
+
+        for (let dx = 0; dx < thW; dx++) {
+            const ty = thLY - 1;
+            if (ty >= 0 && grid[ty * W + thLX + dx] === ROAD) {
+                const idx = ty * W + thLX + dx; connected.add(idx); queue.push(idx);
+            }
+            const by = thLY + thH;
+            if (by < H && grid[by * W + thLX + dx] === ROAD) {
+                const idx = by * W + thLX + dx; connected.add(idx); queue.push(idx);
+            }
+        }
+        for (let dy = 0; dy < thH; dy++) {
+            if (thLX - 1 >= 0 && grid[(thLY + dy) * W + thLX - 1] === ROAD) {
+                const idx = (thLY + dy) * W + thLX - 1; connected.add(idx); queue.push(idx);
+            }
+            if (thLX + thW < W && grid[(thLY + dy) * W + thLX + thW] === ROAD) {
+                const idx = (thLY + dy) * W + thLX + thW; connected.add(idx); queue.push(idx);
+            }
+        }
+
+        let head = 0;
+        while (head < queue.length) {
+            const ci = queue[head++];
+            const cx = ci % W, cy = (ci - cx) / W;
+            for (let d = 0; d < 4; d++) {
+                const nx = cx + DX[d], ny = cy + DY[d];
+                if (nx < 0 || ny < 0 || nx >= W || ny >= H) continue;
+                const ni = ny * W + nx;
+                if (connected.has(ni)) continue;
+                if (grid[ni] === ROAD) { connected.add(ni); queue.push(ni); }
+            }
+        }
+        return connected;
+    }
+
+    _findBestRoadAdjacentPos(grid, W, H, b, centerLX, centerLY, connectedRoads, strictShortSide = false) {
+        const bw = b.width, bh = b.height;
+        const index = new GridIndex(grid, W, H);
+        const { road, building } = index;
+        let bestPos = null, bestScore = Infinity, bestAt = Infinity;
+
+        // Free footprints touching a connected road. They come unordered, so ties
+        // go to the first in row-major order, as with a scan over the whole grid.
+        for (const at of index.frontage(connectedRoads, bw, bh)) {
+            const lx = at % W, ly = (at - lx) / W;
+            // Road cells along each face (top/bottom span bw, left/right span bh)
+            const topRoads    = index.sum(road, lx, ly - 1, bw, 1);
+            const bottomRoads = index.sum(road, lx, ly + bh, bw, 1);
+            const leftRoads   = index.sum(road, lx - 1, ly, 1, bh);
+            const rightRoads  = index.sum(road, lx + bw, ly, 1, bh);
+            const roadTouchCount = topRoads + bottomRoads + leftRoads + rightRoads;
+            const isLgRF = Math.min(bw, bh) > 5;
+            if (isLgRF && roadTouchCount > 2) continue; // large: max 2 touches (road tip only)
+            if (!isLgRF && roadTouchCount > Math.max(bw, bh) + 2) continue;
+
+            const packCount = index.border(building, lx, ly, bw, bh);
+
+            const distToCenter = Math.abs(lx + bw / 2 - centerLX)
+                               + Math.abs(ly + bh / 2 - centerLY);
+
+            // Corner-aware scoring
+            const touchesH = topRoads > 0 || bottomRoads > 0; // road on top or bottom face (spans bw)
+            const touchesV = leftRoads > 0 || rightRoads > 0; // road on left or right face (spans bh)
+
+            // Strict short-side filter: only accept positions where the shorter
+            // edge of the building faces the road (used in first pass of retry)
+            if (strictShortSide && bw !== bh) {
+                const shortFace = bw < bh ? touchesH : touchesV;
+                if (!shortFace) continue;
+            }
+
+            const isIC = touchesH && touchesV;
+            const minS = Math.min(bw, bh);
+            let posScore = 0;
+            if (minS > 5  && !isIC) posScore = -500; // bonus for outer/road-end
+            if (minS > 5  && isIC)  posScore =  3000; // strong penalty for inner corners
+            // Medium buildings: strongly prefer short face toward road
+            if (minS >= 3 && minS <= 5 && bw !== bh && (touchesH !== touchesV)) {
+                const shortFaceToRoad = bw < bh ? touchesH : touchesV;
+                if (shortFaceToRoad) posScore -= 5000;
+            }
+
+            const score = distToCenter * 10 - packCount * 30 + posScore;
+            if (score < bestScore || (score === bestScore && at < bestAt)) {
+                bestScore = score;
+                bestAt = at;
+                bestPos = [lx, ly];
+            }
+        }
+        return bestPos;
+    }
+
+    _expandConnectedRoads(grid, W, H, lx, ly, bw, bh, connectedRoads) {
+        const DX = [1, -1, 0, 0], DY = [0, 0, 1, -1];
+        const toCheck = [];
+
+        for (let dx = 0; dx < bw; dx++) {
+            if (ly > 0) toCheck.push((ly - 1) * W + lx + dx);
+            if (ly + bh < H) toCheck.push((ly + bh) * W + lx + dx);
+        }
+        for (let dy = 0; dy < bh; dy++) {
+            if (lx > 0) toCheck.push((ly + dy) * W + lx - 1);
+            if (lx + bw < W) toCheck.push((ly + dy) * W + lx + bw);
+        }
+
+        const queue = [];
+        for (const idx of toCheck) {
+            if (grid[idx] === ROAD && !connectedRoads.has(idx)) {
+                const x = idx % W, y = (idx - x) / W;
+                for (let d = 0; d < 4; d++) {
+                    const nx = x + DX[d], ny = y + DY[d];
+                    if (nx < 0 || ny < 0 || nx >= W || ny >= H) continue;
+                    const ni = ny * W + nx;
+                    if (connectedRoads.has(ni) || grid[ni] === TOWNHALL) {
+                        connectedRoads.add(idx);
+                        queue.push(idx);
+                        break;
+                    }
+                }
+            }
+        }
+
+        let head = 0;
+        while (head < queue.length) {
+            const ci = queue[head++];
+            const cx = ci % W, cy = (ci - cx) / W;
+            for (let d = 0; d < 4; d++) {
+                const nx = cx + DX[d], ny = cy + DY[d];
+                if (nx < 0 || ny < 0 || nx >= W || ny >= H) continue;
+                const ni = ny * W + nx;
+                if (connectedRoads.has(ni)) continue;
+                if (grid[ni] === ROAD) { connectedRoads.add(ni); queue.push(ni); }
+            }
+        }
+    }
+
+    // ========================================================================
+    _classifyBuildings(buildings) {
+        const large = [], medium = [], small = [];
+        for (const b of buildings) {
+            const minDim = Math.min(b.width, b.height);
+            const maxDim = Math.max(b.width, b.height);
+            if (minDim > 5) large.push(b);        // large: shorter side > 5
+            else if (maxDim <= 2) small.push(b);  // small: both sides ≤ 2
+            else medium.push(b);
+        }
+        large.sort((a, b) => (b.width * b.height) - (a.width * a.height));
+        medium.sort((a, b) => (b.width * b.height) - (a.width * a.height));
+        small.sort((a, b) => (b.width * b.height) - (a.width * a.height));
+        return { large, medium, small };
+    }
+
+    /**
+     * Compute variable corridor widths for the snake layout.
+     * Each corridor is sized for its tallest building PLUS room for a smaller
+     * building on the opposite side of the road (minPerp).
+     *
+     * Formula: width[i] = (segSpacing - maxPerp + minPerp) + groupPerp[i]
+     * Corridor 0 (widest) = segSpacing + minPerp  (wider than constant spacing).
+     * Subsequent corridors shrink proportionally to their building dimensions.
+     */
+    _computeCorridorWidths(roadBuildings, maxCorridors, isHoriz, maxWidth) {
+        if (maxCorridors <= 0) return [];
+
+        // Only medium buildings drive corridor width; large go to corners, small fit anywhere
+        const perpDims = roadBuildings
+            .filter(b => Math.min(b.width, b.height) <= 5 && Math.max(b.width, b.height) > 2)
+            .map(b => isHoriz ? b.height : b.width)
+            .sort((a, b) => b - a); // descending
+
+        if (perpDims.length === 0) {
+            return Array(maxCorridors).fill(Math.min(maxWidth, 4));
+        }
+
+        const maxPerp = perpDims[0];
+        const minPerp = perpDims[perpDims.length - 1];
+        // base = config margin + opposite-side building allowance + extra clearance
+        const base = maxWidth - maxPerp + minPerp + 2;
+        const groupSize = Math.ceil(perpDims.length / maxCorridors);
+        const widths = [];
+        for (let c = 0; c < maxCorridors; c++) {
+            const start = c * groupSize;
+            if (start >= perpDims.length) {
+                widths.push(Math.max(3, base + minPerp));
+                continue;
+            }
+            // Corridor width = base margin + this group's tallest perpendicular dim
+            widths.push(Math.max(3, base + perpDims[start]));
+        }
+
+        return widths;
+    }
+
+    /**
+     * Snake/zigzag road strategy.
+     *
+     * Generates a single continuous path (no branches) that snakes across the grid:
+     *   - snakeAxis='h': horizontal segments connected by 1-column vertical connectors
+     *   - snakeAxis='v': vertical segments connected by 1-row horizontal connectors
+     *
+     * Number of segments is derived from roadBudget / segmentLength:
+     *   - 2–3 segs → U/C shape
+     *   - 4–6 segs → zigzag
+     *
+     * Config: { snakeAxis: 'h'|'v', thQuadrant: 0-3, segSpacing }
+     *
+     * With ctx.seenRoads (a TranspositionTable) and ctx.zobrist (a Zobrist
+     * over 2·W·H slots: road cells, then TH anchors), a config whose road
+     * layout was already evaluated returns null; the layout's key is left in
+     * ctx.roadKey either way.
+     *
+     * With ctx.bound (the best result so far, or just its score), placement
+     * stops and null is returned as soon as the buildings placed plus those
+     * still to try fall below bound.buildingsPlaced: the config can no longer
+     * win. ctx.pruned tells this apart from the other nulls.
+     */
+    _snakeRoadStrategy(roadBuildings, config, ctx) {
+        const { W, H, offX, offY, templateGrid, thEntry } = ctx;
+        const thW = thEntry.width, thH = thEntry.height;
+        const grid = new Uint8Array(templateGrid);
+        ctx.roadKey = null;
+        ctx.pruned = false;
+
+        const roadBudget = roadBuildings.reduce((s, b) => s + Math.min(b.width, b.height), 0);
+        // Target road cells = sum(min(w,h)) / 2 — each road cell serves both sides
+        const targetRoads = Math.max(1, Math.floor(roadBudget / 2));
+        const { thQuadrant, segSpacing, snakeAxis } = config;
+        const isHoriz = snakeAxis === 'h';
+
+        // Border margin — snake stays inside, leaving these cells free on each edge for buildings
+        const BORDER = 9;
+        const iX1 = BORDER, iX2 = W - 1 - BORDER;
+        const iY1 = BORDER, iY2 = H - 1 - BORDER;
+        if (iX2 - iX1 < 4 || iY2 - iY1 < 4) return null; // grid too small
+
+        const isBranch = config.thMode === 'branch';
+        let thLX, thLY;
+
+        if (isBranch) {
+            // TH at edge center — frees corners for large building placement.
+            // A short branch road will connect TH to the nearest snake segment.
+            if (isHoriz) {
+                thLX = Math.floor(W / 2 - thW / 2);
+                thLY = thQuadrant < 2 ? 0 : H - thH;
+            } else {
+                thLX = thQuadrant % 2 === 0 ? 0 : W - thW;
+                thLY = Math.floor(H / 2 - thH / 2);
+            }
+            if (!this._isAreaFreeFG(grid, W, H, thLX, thLY, thW, thH)) {
+                const found = this._findNearestFreeFG(grid, W, H, thW, thH, thLX, thLY);
+                if (!found) return null;
+                [thLX, thLY] = found;
+            }
+        } else {
+            // Corner position — used for seg0 span calculations
+            const qx = thQuadrant % 2 === 0 ? 0 : W - thW;
+            const qy = thQuadrant < 2 ? 0 : H - thH;
+            const cornerThLX = Math.max(0, Math.min(W - thW, qx));
+            const cornerThLY = Math.max(0, Math.min(H - thH, qy));
+
+            // Try placing TH at the first bend of the snake instead of the corner.
+            const goDown  = thQuadrant < 2;
+            const goRight = thQuadrant % 2 === 0;
+            const bendSeg0Y = goDown  ? cornerThLY + thH : cornerThLY - 1;
+            const bendSeg0X = goRight ? cornerThLX + thW : cornerThLX - 1;
+            let thLX_b, thLY_b;
+            if (isHoriz) {
+                const connXb = goRight ? iX2 : iX1;
+                thLX_b = goRight ? connXb + 1     : connXb - thW;
+                thLY_b = goDown  ? bendSeg0Y - thH + 1 : bendSeg0Y;
+            } else {
+                const connYb = thQuadrant < 2 ? iY2 : iY1;
+                thLX_b = goRight ? bendSeg0X - thW + 1 : bendSeg0X;
+                thLY_b = thQuadrant < 2 ? connYb + 1   : connYb - thH;
+            }
+            const bendOK = thLX_b >= 0 && thLY_b >= 0
+                        && thLX_b + thW <= W && thLY_b + thH <= H
+                        && this._isAreaFreeFG(grid, W, H, thLX_b, thLY_b, thW, thH);
+
+            if (bendOK) {
+                thLX = thLX_b;
+                thLY = thLY_b;
+            } else {
+                thLX = cornerThLX;
+                thLY = cornerThLY;
+                if (!this._isAreaFreeFG(grid, W, H, thLX, thLY, thW, thH)) {
+                    const found = this._findNearestFreeFG(grid, W, H, thW, thH, thLX, thLY);
+                    if (!found) return null;
+                    [thLX, thLY] = found;
+                }
+            }
+        }
+        for (let dy = 0; dy < thH; dy++)
+            for (let dx = 0; dx < thW; dx++)
+                grid[(thLY + dy) * W + (thLX + dx)] = TOWNHALL;
+
+        // Road cells must stay at least this many cells away from any blocked cell
+        const BLOCKED_MARGIN = 5;
+        const isAwayFromBlocked = (x, y) => {
+            for (let dy = -BLOCKED_MARGIN; dy <= BLOCKED_MARGIN; dy++)
+                for (let dx = -BLOCKED_MARGIN; dx <= BLOCKED_MARGIN; dx++) {
+                    const nx = x + dx, ny = y + dy;
+                    if (nx >= 0 && ny >= 0 && nx < W && ny < H && grid[ny * W + nx] === BLOCKED) return false;
+                }
+            return true;
+        };
+
+        let roadCount = 0;
+        const layRoad = (x, y) => {
+            if (roadCount >= targetRoads) return false;
+            if (x >= 0 && y >= 0 && x < W && y < H && grid[y * W + x] === FREE && isAwayFromBlocked(x, y)) {
+                grid[y * W + x] = ROAD;
+                roadCount++;
+            }
+            return roadCount < targetRoads;
+        };
+
+        // Segment cost within inner bounds; connectors span (segSpacing-1) cells
+        const innerSegLen = isHoriz ? (iX2 - iX1 + 1) : (iY2 - iY1 + 1);
+        const segCost = innerSegLen + (segSpacing - 1);
+        // Need enough outer corners (= numSegs-1) so each large building can go to an outer side
+        const { large: _lgForSegs } = this._classifyBuildings(roadBuildings);
+        const requiredCorners = Math.ceil(_lgForSegs.length / 2);
+        const numSegs = Math.min(8, Math.max(2, Math.ceil(targetRoads / segCost), requiredCorners + 1));
+
+        // Variable corridor widths — each corridor sized to its building content
+        const corridorWidths = this._computeCorridorWidths(
+            roadBuildings, numSegs - 1, isHoriz, segSpacing);
+
+        // How much to trim the dead-end of the last snake segment so a large building
+        // can sit there touching only the tip road cell (no connector on that side).
+        // The BORDER gives 9 free cells beyond iX1/iY1; we shorten to extend that pocket.
+        const _maxLargeDim = _lgForSegs.length > 0
+            ? Math.max(..._lgForSegs.map(b => Math.max(b.width, b.height))) : 0;
+        const DEAD_END_SHORTEN = Math.min(
+            Math.floor(innerSegLen / 3),          // never remove more than 1/3 of a segment
+            Math.max(0, _maxLargeDim - BORDER + 1) // enough room (+1 margin) for widest large bld
+        );
+
+        // Extend connectors for buildings that don't match the snake orientation.
+        // V snake: wide buildings (w > h) need H road → extend H connectors.
+        // H snake: tall buildings (h > w) need V road → extend V connectors.
+        // Uses road budget from segments, keeping total road count the same.
+        const medBldsMix = roadBuildings.filter(b =>
+            Math.min(b.width, b.height) <= 5 && Math.max(b.width, b.height) > 2);
+        const unmatchedArea = (isHoriz
+            ? medBldsMix.filter(b => b.height > b.width)
+            : medBldsMix.filter(b => b.width > b.height)
+        ).reduce((s, b) => s + b.width * b.height, 0);
+        const totalMedArea = medBldsMix.reduce((s, b) => s + b.width * b.height, 0);
+        const unmatchedRatio = totalMedArea > 0 ? unmatchedArea / totalMedArea : 0;
+        const connExtend = Math.min(
+            Math.floor(innerSegLen / 3),
+            Math.round(unmatchedRatio * innerSegLen * 0.4)
+        );
+
+        // junctions[]: connector info used to seed corner fill zones
+        // horiz: { connX, y1, y2 }   vert: { connY, x1, x2 }
+        const junctions = [];
+        if (isHoriz) {
+            const goDown = thQuadrant < 2;
+            const signY = goDown ? 1 : -1;
+            const seg0Y = isBranch
+                ? (goDown ? iY1 : iY2)
+                : (goDown ? thLY + thH : thLY - 1);
+            if (seg0Y < 0 || seg0Y >= H) return null;
+
+            // First segment
+            if (isBranch) {
+                // Branch mode: full inner bounds (TH is at edge center, not corner)
+                for (let x = iX1; x <= iX2; x++) { if (!layRoad(x, seg0Y)) break; }
+            } else {
+                // Corner/bend mode: from TH's x edge to the far inner bound
+                const fs_x1 = thQuadrant % 2 === 0 ? thLX : iX1;
+                const fs_x2 = thQuadrant % 2 === 0 ? iX2   : thLX + thW - 1;
+                for (let x = fs_x1; x <= fs_x2; x++) { if (!layRoad(x, seg0Y)) break; }
+            }
+
+            let prevY = seg0Y;
+            // Connector starts on the inner-bound side opposite TH
+            let connX = thQuadrant % 2 === 0 ? iX2 : iX1;
+            let lastConnX = -1; // connector column used in the last full segment
+
+            let cumOffsetH = 0;
+            for (let s = 1; s < numSegs && roadCount < targetRoads; s++) {
+                cumOffsetH += corridorWidths[s - 1];
+                const segY = seg0Y + cumOffsetH * signY;
+                if (segY < iY1 || segY > iY2) break;
+
+                // Connector (extended for unmatched buildings)
+                const y1 = Math.max(iY1, Math.min(prevY, segY) - connExtend);
+                const y2 = Math.min(iY2, Math.max(prevY, segY) + connExtend);
+                for (let y = y1; y <= y2; y++) { if (!layRoad(connX, y)) break; }
+                junctions.push({ connX, y1, y2 });
+
+                // Segment within inner bounds
+                for (let x = iX1; x <= iX2; x++) { if (!layRoad(x, segY)) break; }
+
+                lastConnX = connX; // record connector side before swapping
+                prevY = segY;
+                connX = connX === iX2 ? iX1 : iX2;
+            }
+
+            // Trim the dead-end (connector-free) side of the last segment so a large
+            // building can sit in the wider pocket created between the new tip and the wall.
+            if (DEAD_END_SHORTEN > 0 && lastConnX >= 0) {
+                const deadEndX = lastConnX === iX2 ? iX1 : iX2;
+                const step = deadEndX === iX1 ? 1 : -1;
+                let removed = 0;
+                for (let x = deadEndX; removed < DEAD_END_SHORTEN && x >= iX1 && x <= iX2; x += step) {
+                    if (grid[prevY * W + x] === ROAD) { grid[prevY * W + x] = FREE; roadCount--; removed++; }
+                }
+            }
+
+            // L-shaped branch: road along TH interior edge + vertical connector to seg0.
+            // Creates building frontage around TH and a corner for large building placement.
+            if (isBranch) {
+                const intY = goDown ? thLY + thH : thLY - 1;
+                const sideRight = thQuadrant % 2 === 0;
+                const sideX = sideRight ? thLX + thW : thLX - 1;
+
+                // Horizontal road along TH interior edge
+                for (let x = thLX; x < thLX + thW; x++) {
+                    if (intY >= 0 && intY < H && x >= 0 && x < W && grid[intY * W + x] === FREE) {
+                        grid[intY * W + x] = ROAD; roadCount++;
+                    }
+                }
+
+                // Vertical connector from corner of L to seg0
+                const vY1 = Math.min(intY, seg0Y);
+                const vY2 = Math.max(intY, seg0Y);
+                for (let y = vY1; y <= vY2; y++) {
+                    if (sideX >= 0 && sideX < W && y >= 0 && y < H && grid[y * W + sideX] === FREE) {
+                        grid[y * W + sideX] = ROAD; roadCount++;
+                    }
+                }
+            }
+        } else {
+            const goRight = thQuadrant % 2 === 0;
+            const signX = goRight ? 1 : -1;
+            const seg0X = isBranch
+                ? (goRight ? iX1 : iX2)
+                : (goRight ? thLX + thW : thLX - 1);
+            if (seg0X < 0 || seg0X >= W) return null;
+
+            // First segment
+            if (isBranch) {
+                for (let y = iY1; y <= iY2; y++) { if (!layRoad(seg0X, y)) break; }
+            } else {
+                const fs_y1 = thQuadrant < 2 ? thLY : iY1;
+                const fs_y2 = thQuadrant < 2 ? iY2   : thLY + thH - 1;
+                for (let y = fs_y1; y <= fs_y2; y++) { if (!layRoad(seg0X, y)) break; }
+            }
+
+            let prevX = seg0X;
+            let connY = thQuadrant < 2 ? iY2 : iY1;
+            let lastConnY = -1; // connector row used in the last full segment
+
+            let cumOffsetV = 0;
+            for (let s = 1; s < numSegs && roadCount < targetRoads; s++) {
+                cumOffsetV += corridorWidths[s - 1];
+                const segX = seg0X + cumOffsetV * signX;
+                if (segX < iX1 || segX > iX2) break;
+
+                // Connector (extended for unmatched buildings)
+                const x1 = Math.max(iX1, Math.min(prevX, segX) - connExtend);
+                const x2 = Math.min(iX2, Math.max(prevX, segX) + connExtend);
+                for (let x = x1; x <= x2; x++) { if (!layRoad(x, connY)) break; }
+                junctions.push({ connY, x1, x2 });
+
+                // Segment within inner bounds
+                for (let y = iY1; y <= iY2; y++) { if (!layRoad(segX, y)) break; }
+
+                lastConnY = connY; // record connector side before swapping
+                prevX = segX;
+                connY = connY === iY2 ? iY1 : iY2;
+            }
+
+            // Trim the dead-end side of the last segment (vertical axis equivalent).
+            if (DEAD_END_SHORTEN > 0 && lastConnY >= 0) {
+                const deadEndY = lastConnY === iY2 ? iY1 : iY2;
+                const step = deadEndY === iY1 ? 1 : -1;
+                let removed = 0;
+                for (let y = deadEndY; removed < DEAD_END_SHORTEN && y >= iY1 && y <= iY2; y += step) {
+                    if (grid[y * W + prevX] === ROAD) { grid[y * W + prevX] = FREE; roadCount--; removed++; }
+                }
+            }
+
+            // L-shaped branch: road along TH interior edge + horizontal connector to seg0.
+            if (isBranch) {
+                const intX = goRight ? thLX + thW : thLX - 1;
+                const sideBottom = thQuadrant < 2;
+                const sideY = sideBottom ? thLY + thH : thLY - 1;
+
+                // Vertical road along TH interior edge
+                for (let y = thLY; y < thLY + thH; y++) {
+                    if (intX >= 0 && intX < W && y >= 0 && y < H && grid[y * W + intX] === FREE) {
+                        grid[y * W + intX] = ROAD; roadCount++;
+                    }
+                }
+
+                // Horizontal connector from corner of L to seg0
+                const hX1 = Math.min(intX, seg0X);
+                const hX2 = Math.max(intX, seg0X);
+                for (let x = hX1; x <= hX2; x++) {
+                    if (sideY >= 0 && sideY < H && x >= 0 && x < W && grid[sideY * W + x] === FREE) {
+                        grid[sideY * W + x] = ROAD; roadCount++;
+                    }
+                }
+            }
+        }
+
+        // Verify connectivity and strip disconnected roads, keying the remaining
+        // road layout (plus the TH position) as we go
+        const connectedRoads = this._findConnectedRoads(grid, W, H, thLX, thLY, thW, thH);
+        const zobrist = ctx.zobrist;
+        let keyLo = 0, keyHi = 0;
+        if (zobrist) {
+            keyLo = zobrist.lo[W * H + thLY * W + thLX];
+            keyHi = zobrist.hi[W * H + thLY * W + thLX];
+        }
+        for (let y = 0; y < H; y++)
+            for (let x = 0; x < W; x++)
+                if (grid[y * W + x] === ROAD) {
+                    if (!connectedRoads.has(y * W + x)) grid[y * W + x] = FREE;
+                    else if (zobrist) { keyLo ^= zobrist.lo[y * W + x]; keyHi ^= zobrist.hi[y * W + x]; }
+                }
+
+        // Everything below depends only on this road layout, so a layout an
+        // earlier config already produced gives the same result: skip it.
+        // (Different spacings often clip to the same snake.)
+        if (ctx.seenRoads) {
+            ctx.roadKey = `${keyLo >>> 0}:${keyHi >>> 0}`;
+            if (ctx.seenRoads.has(ctx.roadKey)) return null;
+            ctx.seenRoads.add(ctx.roadKey);
+        }
+
+        const buildings = [{ ...thEntry, x: thLX + offX, y: thLY + offY }];
+        let buildingsPlaced = 0;
+        const centerLX = thLX + thW / 2;
+        const centerLY = thLY + thH / 2;
+
+        // Phase A: place large buildings at road corner outer slots (exactly 1 road touch each)
+        const { large: lgBlds } = this._classifyBuildings(roadBuildings);
+        const lgFirst = [...lgBlds].sort((a, b) => (b.width * b.height) - (a.width * a.height));
+        buildingsPlaced += this._placeAtCorners(grid, W, H, connectedRoads, buildings, lgFirst, offX, offY);
+        // Most this config can still place; each failed placement lowers it
+        let reachable = roadBuildings.length;
+        const target = ctx.bound ? ctx.bound.buildingsPlaced : 0;
+
+        // Phase B: place remaining buildings road-adjacent — large/medium first, small (≤2) last
+        const sorted = [...roadBuildings].sort((a, b) => {
+            const tier = x => {
+                if (Math.max(x.width, x.height) <= 2) return 2; // small → last
+                if (Math.min(x.width, x.height) > 5)  return 0; // large → first
+                return 1;                                         // medium → middle
+            };
+            if (tier(a) !== tier(b)) return tier(a) - tier(b);
+            return (b.width * b.height) - (a.width * a.height);
+        });
+        for (const b of sorted) {
+            if (reachable < target) break;
+            if (b._snakePlaced || b._cornerPlaced) continue;
+            const pos = this._findBestRoadAdjacentPos(grid, W, H, b, centerLX, centerLY, connectedRoads);
+            if (pos) {
+                const [lx, ly] = pos;
+                this._stampBuilding(grid, W, lx, ly, b, buildings, offX, offY);
+                buildingsPlaced++;
+                b._snakePlaced = true;
+                this._expandConnectedRoads(grid, W, H, lx, ly, b.width, b.height, connectedRoads);
+            } else {
+                reachable--;
+            }
+        }
+
+        for (const b of roadBuildings) { delete b._snakePlaced; delete b._cornerPlaced; }
+        if (reachable < target) {
+            ctx.pruned = true;
+            return null;
+        }
+
+        roadCount = this._pruneDeadEndRoads(grid, W, H, buildings, offX, offY);
+        return { grid, buildings, roadCount, buildingsPlaced, thLX, thLY };
+    }
+
+    /**
+
+
+    /**
+     * Scan every road cell for corners (exactly 1 horizontal + 1 vertical road neighbour).
+     * For each corner, compute two outer-quadrant slot positions where a large building
+     * can be placed touching exactly 1 road cell (the corner cell itself).
+     *
+     * Slot A — building's edge runs parallel to the horizontal road arm:
+     *   the building's innermost row is flush with the corner row (cy),
+     *   so only the corner cell touches the building's perpendicular edge.
+     *
+     * Slot B — building's edge runs parallel to the vertical road arm:
+     *   the building's innermost column is flush with the corner column (cx),
+     *   so only the corner cell touches the building's perpendicular edge.
+     *
+     * Buildings are tried largest-area first; one per corner.
+     * Placed buildings are marked with b._cornerPlaced = true.
+     * Returns the count of newly placed buildings.
+     */
+    _placeAtCorners(grid, W, H, connectedRoads, buildings, largeSorted, offX, offY) {
+        const DX = [1, -1, 0, 0], DY = [0, 0, 1, -1];
+        const isH = d => d < 2;
+        let placed = 0;
+
+        for (let cy = 0; cy < H; cy++) {
+            for (let cx = 0; cx < W; cx++) {
+                if (grid[cy * W + cx] !== ROAD) continue;
+
+                // Collect road/TH neighbours
+                const roadDirs = [];
+                for (let d = 0; d < 4; d++) {
+                    const nx = cx + DX[d], ny = cy + DY[d];
+                    if (nx < 0 || ny < 0 || nx >= W || ny >= H) continue;
+                    const v = grid[ny * W + nx];
+                    if (v === ROAD || v === TOWNHALL) roadDirs.push(d);
+                }
+                // Corner = exactly 2 neighbours on perpendicular axes
+                if (roadDirs.length !== 2) continue;
+                const [da, db] = roadDirs;
+                if (isH(da) === isH(db)) continue; // both horizontal or both vertical → straight
+
+                const hDir = isH(da) ? da : db; // 0 = right (+x), 1 = left (−x)
+                const vDir = isH(da) ? db : da; // 2 = down (+y), 3 = up  (−y)
+
+                // Outer quadrant: opposite to both road arms
+                const odx = -DX[hDir]; // road→right  ⇒ outer←left  (odx=−1), vice-versa
+                const ody = -DY[vDir]; // road→down   ⇒ outer↑up    (ody=−1), vice-versa
+
+                for (const b of largeSorted) {
+                    if (b._cornerPlaced) continue;
+                    const bw = b.width, bh = b.height;
+
+                    // Slot B (preferred): building fully in outer quadrant, face-to-face with road.
+                    //   Building's right/left column = cx (includes corner col), fully above/below road.
+                    //   odx=−1 → lxB = cx−bw+1  (right col = cx)
+                    //   odx=+1 → lxB = cx        (left  col = cx)
+                    //   ody=−1 → lyB = cy−bh     (bottom row = cy−1, fully above road)
+                    //   ody=+1 → lyB = cy+1       (top    row = cy+1, fully below road)
+                    const lxB = odx === -1 ? cx - bw + 1 : cx;
+                    const lyB = ody === -1 ? cy - bh      : cy + 1;
+
+                    // Slot A (fallback): building's side face touches corner — bottom/top row at cy.
+                    //   odx=−1 → lxA = cx−bw  (right col = cx−1, side-adjacent to corner col)
+                    //   odx=+1 → lxA = cx+1   (left  col = cx+1, side-adjacent to corner col)
+                    //   ody=−1 → lyA = cy−bh+1 (bottom row = cy, at road level)
+                    //   ody=+1 → lyA = cy       (top    row = cy, at road level)
+                    const lxA = odx === -1 ? cx - bw     : cx + 1;
+                    const lyA = ody === -1 ? cy - bh + 1 : cy;
+
+                    let didPlace = false;
+                    for (const [lx, ly] of [[lxB, lyB], [lxA, lyA]]) {
+                        if (this._tryPlaceBuilding(grid, W, H, lx, ly, b, connectedRoads, buildings, offX, offY)) {
+                            placed++;
+                            b._cornerPlaced = true;
+                            this._expandConnectedRoads(grid, W, H, lx, ly, bw, bh, connectedRoads);
+                            didPlace = true;
+                            break;
+                        }
+                    }
+                    if (didPlace) break; // one large building per corner
+                }
+            }
+        }
+        return placed;
+    }
+
+    _tryPlaceBuilding(grid, W, H, lx, ly, b, connectedRoads, buildings, offX, offY) {
+        const bw = b.width, bh = b.height;
+        if (!this._isAreaFreeFG(grid, W, H, lx, ly, bw, bh)) return false;
+        if (!this._touchesConnectedRoad(grid, W, H, lx, ly, bw, bh, connectedRoads)) return false;
+
+        let roadTouchCount = 0;
+        for (let dx = 0; dx < bw; dx++) {
+            if (ly > 0 && grid[(ly - 1) * W + lx + dx] === ROAD) roadTouchCount++;
+            if (ly + bh < H && grid[(ly + bh) * W + lx + dx] === ROAD) roadTouchCount++;
+        }
+        for (let dy = 0; dy < bh; dy++) {
+            if (lx > 0 && grid[(ly + dy) * W + lx - 1] === ROAD) roadTouchCount++;
+            if (lx + bw < W && grid[(ly + dy) * W + lx + bw] === ROAD) roadTouchCount++;
+        }
+        const isLargeBld = Math.min(bw, bh) > 5;
+        if (isLargeBld && roadTouchCount > 2) return false; // large: max 2 touches (road tip, not alongside)
+        if (!isLargeBld && roadTouchCount > Math.min(bw, bh) + 1) return false;
+        if (roadTouchCount > 6) return false;
+
+        this._stampBuilding(grid, W, lx, ly, b, buildings, offX, offY);
+        return true;
+    }
+
+    _stampBuilding(grid, W, lx, ly, b, buildings, offX, offY) {
+        for (let dy = 0; dy < b.height; dy++)
+            for (let dx = 0; dx < b.width; dx++)
+                grid[(ly + dy) * W + (lx + dx)] = BUILDING;
+        buildings.push({ ...b, x: lx + offX, y: ly + offY });
+    }
+
+    _touchesConnectedRoad(grid, W, H, lx, ly, bw, bh, connectedRoads) {
+        for (let dx = 0; dx < bw; dx++) {
+            if (ly > 0 && connectedRoads.has((ly - 1) * W + lx + dx)) return true;
+            if (ly + bh < H && connectedRoads.has((ly + bh) * W + lx + dx)) return true;
+        }
+        for (let dy = 0; dy < bh; dy++) {
+            if (lx > 0 && connectedRoads.has((ly + dy) * W + lx - 1)) return true;
+            if (lx + bw < W && connectedRoads.has((ly + dy) * W + lx + bw)) return true;
+        }
+        return false;
+    }
+
+    _pruneDeadEndRoads(grid, W, H, buildings, offX, offY) {
+        const buildingAdj = new Set();
+        for (const placed of buildings) {
+            const blx = placed.x - offX, bly = placed.y - offY;
+            const pw = placed.width, ph = placed.height;
+            for (let dx = 0; dx < pw; dx++) {
+                if (bly - 1 >= 0)    buildingAdj.add((bly - 1) * W + blx + dx);
+                if (bly + ph < H)    buildingAdj.add((bly + ph) * W + blx + dx);
+            }
+            for (let dy = 0; dy < ph; dy++) {
+                if (blx - 1 >= 0)    buildingAdj.add((bly + dy) * W + blx - 1);
+                if (blx + pw < W)    buildingAdj.add((bly + dy) * W + blx + pw);
+            }
+        }
+
+        let roadCells = [];
+        for (let y = 0; y < H; y++)
+            for (let x = 0; x < W; x++)
+                if (grid[y * W + x] === ROAD) roadCells.push(y * W + x);
+
+        const DX = [1, -1, 0, 0], DY = [0, 0, 1, -1];
+        let changed = true;
+        while (changed) {
+            changed = false;
+            const kept = [];
+            for (const idx of roadCells) {
+                if (grid[idx] !== ROAD) continue;
+                if (buildingAdj.has(idx)) { kept.push(idx); continue; }
+                const rx = idx % W, ry = (idx - rx) / W;
+                let neighbors = 0;
+                for (let d = 0; d < 4; d++) {
+                    const nx = rx + DX[d], ny = ry + DY[d];
+                    if (nx >= 0 && ny >= 0 && nx < W && ny < H) {
+                        const nv = grid[ny * W + nx];
+                        if (nv === ROAD || nv === TOWNHALL) neighbors++;
+                    }
+                }
+                if (neighbors <= 1) { grid[idx] = FREE; changed = true; }
+                else { kept.push(idx); }
+            }
+            roadCells = kept;
+        }
+        return roadCells.length;
+    }
+
+    // ========================================================================
+    // FLAT GRID HELPERS
+    // ========================================================================
+
+    _isAreaFreeFG(grid, W, H, lx, ly, w, h) {
+        if (lx < 0 || ly < 0 || lx + w > W || ly + h > H) return false;
+        for (let dy = 0; dy < h; dy++)
+            for (let dx = 0; dx < w; dx++)
+                if (grid[(ly + dy) * W + (lx + dx)] !== FREE) return false;
+        return true;
+    }
+
+    _findNearestFreeFG(grid, W, H, w, h, targetLX, targetLY) {
+        const maxDist = W + H;
+        for (let d = 0; d <= maxDist; d++) {
+            for (let dy = -d; dy <= d; dy++) {
+                const dxRange = d - Math.abs(dy);
+                for (const dx of (dxRange === 0 ? [0] : [-dxRange, dxRange])) {
+                    const lx = targetLX + dx, ly = targetLY + dy;
+                    if (this._isAreaFreeFG(grid, W, H, lx, ly, w, h)) return [lx, ly];
+                }
+            }
+        }
+        return null;
+    }
+
+    // ========================================================================
+    // MEDIUM RETRY / GAP FILL
+    // ========================================================================
+
+    // Try to place all medium buildings road-adjacent, retrying with shuffled
+    // orderings until all are placed or the deadline passes. Returns the best
+    // result found, and done once there is nothing left to try. Passing the
+    // same state object again continues from the previous call, so the retry
+    // can run in short slices.
+    _placeMediumBuildingsRetry(gridBase, connRoadsBase, W, H, medBuildings, offX, offY, centerLX, centerLY,
+                               deadline = Date.now() + MEDIUM_TIME_LIMIT, state = {}) {
+        if (medBuildings.length === 0)
+            return { placed: [], grid: new Uint8Array(gridBase), connectedRoads: new Set(connRoadsBase), done: true };
+
+        if (!state.order) {
+            state.bestCount = -1;
+            state.bestPlaced = [];
+            state.bestGrid = new Uint8Array(gridBase);
+            state.bestConnRoads = new Set(connRoadsBase);
+            state.order = [...medBuildings];
+            // Placement only looks at sizes, so orders that differ just by swapping
+            // same-sized buildings are the same attempt. Skip repeats, and stop once
+            // every distinct order has been tried (few buildings, or many alike).
+            state.tried = new TranspositionTable();
+            state.distinctOrders = this._distinctOrders(medBuildings, state.tried.limit);
+            state.done = false;
+        }
+        const { order, tried, distinctOrders } = state;
+
+        while (!state.done) {
+            const orderKey = order.map(b => `${b.width}x${b.height}`).join(',');
+            if (tried.has(orderKey)) {
+                if (tried.size >= distinctOrders) { state.done = true; break; }
+                if (Date.now() >= deadline) break;
+                this._shuffle(order);
+                continue;
+            }
+            tried.add(orderKey);
+
+            const grid = new Uint8Array(gridBase);
+            const connectedRoads = new Set(connRoadsBase);
+            const placed = [];
+            const tempBuildings = []; // throwaway — _stampBuilding needs an array param
+
+            // Pass 1: place buildings with their shorter side facing the road
+            const placedSet = new Set();
+            for (const b of order) {
+                const pos = this._findBestRoadAdjacentPos(grid, W, H, b, centerLX, centerLY, connectedRoads, true);
+                if (pos) {
+                    const [lx, ly] = pos;
+                    this._stampBuilding(grid, W, lx, ly, b, tempBuildings, offX, offY);
+                    this._expandConnectedRoads(grid, W, H, lx, ly, b.width, b.height, connectedRoads);
+                    placed.push({ b, lx, ly });
+                    placedSet.add(b);
+                }
+            }
+            // Pass 2: remaining buildings with any orientation
+            for (const b of order) {
+                if (placedSet.has(b)) continue;
+                const pos = this._findBestRoadAdjacentPos(grid, W, H, b, centerLX, centerLY, connectedRoads);
+                if (pos) {
+                    const [lx, ly] = pos;
+                    this._stampBuilding(grid, W, lx, ly, b, tempBuildings, offX, offY);
+                    this._expandConnectedRoads(grid, W, H, lx, ly, b.width, b.height, connectedRoads);
+                    placed.push({ b, lx, ly });
+                }
+            }
+
+            if (placed.length > state.bestCount) {
+                // Each attempt works on fresh copies, so keep them rather than cloning again
+                state.bestCount = placed.length;
+                state.bestPlaced = placed;
+                state.bestGrid = grid;
+                state.bestConnRoads = connectedRoads;
+            }
+
+            if (placed.length === medBuildings.length) state.done = true; // all placed — success
+            else if (tried.size >= distinctOrders) state.done = true; // nothing new left to try
+            if (state.done || Date.now() >= deadline) break; // timeout — use best so far
+
+            this._shuffle(order);
+        }
+
+        return { placed: state.bestPlaced, grid: state.bestGrid, connectedRoads: state.bestConnRoads, done: state.done };
+    }
+
+    /** Fisher-Yates shuffle in place. */
+    _shuffle(order) {
+        for (let i = order.length - 1; i > 0; i--) {
+            const j = Math.floor(Math.random() * (i + 1));
+            [order[i], order[j]] = [order[j], order[i]];
+        }
+    }
+
+    /** Distinct size sequences of buildings (a multinomial), or Infinity above limit. */
+    _distinctOrders(buildings, limit) {
+        const counts = new Map();
+        let orders = 1;
+        buildings.forEach((b, i) => {
+            const key = `${b.width}x${b.height}`;
+            const c = (counts.get(key) || 0) + 1;
+            counts.set(key, c);
+            orders = orders * (i + 1) / c;
+        });
+        return orders <= limit ? Math.round(orders) : Infinity;
+    }
+
+    /**
+     * Fill small road-adjacent gaps with unplaced small buildings (max(w,h) <= 2).
+     * Prefers positions surrounded by more buildings (true gap-filling).
+     * Operates on the flat Uint8Array grid. Returns the count of newly placed buildings.
+     */
+    _gapFillSmallBuildings(grid, W, H, connectedRoads, buildings, smallPool, offX, offY) {
+        const candidates = smallPool
+            .filter(b => !b._snakePlaced && !b._cornerPlaced && !b._gapFilled)
+            .sort((a, b) => (b.width * b.height) - (a.width * a.height)); // 2x2 > 2x1 > 1x1
+
+        let placed = 0;
+        for (const b of candidates) {
+            const bw = b.width, bh = b.height;
+            const index = new GridIndex(grid, W, H);
+            const { building, townhall } = index;
+            let bestPos = null, bestScore = Infinity, bestAt = Infinity;
+
+            for (const at of index.frontage(connectedRoads, bw, bh)) {
+                const lx = at % W, ly = (at - lx) / W;
+                // Count adjacent building/TH cells — more neighbors = tighter gap fill
+                const adj = index.border(building, lx, ly, bw, bh) + index.border(townhall, lx, ly, bw, bh);
+
+                const score = -adj; // lower = better (more neighbors)
+                if (score < bestScore || (score === bestScore && at < bestAt)) {
+                    bestScore = score;
+                    bestAt = at;
+                    bestPos = [lx, ly];
+                }
+            }
+
+            if (bestPos) {
+                this._stampBuilding(grid, W, bestPos[0], bestPos[1], b, buildings, offX, offY);
+                this._expandConnectedRoads(grid, W, H, bestPos[0], bestPos[1], bw, bh, connectedRoads);
+                b._gapFilled = true;
+                placed++;
+            }
+        }
+        return placed;
+    }
+}
@@ -0,0 +1,50 @@
+/**
+ * OptimizerWorker — evaluates snake configs for Optimizer off the main thread.
+ *
+ * Optimizer starts one of these per core and hands out config indices one at
+ * a time, so every worker takes a disjoint share of the configs.
+ *
+ * In:  { type: 'init', roadBuildings, configs, ctx, seen }   once, before any run
+ *      { type: 'run', index }                                evaluate configs[index]
+ *      { type: 'best', best }                                pool-wide best score so far
+ *      { type: 'roads', key }                                road layout another worker evaluated
+ * Out: { index, roadKey, result? } per run. The pool-wide best is the search's
+ *      bound: a config stops placing buildings once it cannot reach the best
+ *      count, and only a layout that beats the best is sent back, so losing
+ *      configs cost neither the rest of their search nor copying. roadKey
+ *      lets the pool skip configs with the same roads; seen carries the keys
+ *      evaluated before a resumed run.
+ */
+import { OptimizerSearch, Zobrist, TranspositionTable } from './OptimizerSearch.js';
+
+const search = new OptimizerSearch();
+let roadBuildings = [], configs = [], ctx = null, best = null;
+
+self.onmessage = ({ data: msg }) => {
+    switch (msg.type) {
+        case 'init':
+            ({ roadBuildings, configs, ctx } = msg);
+            ctx.zobrist = new Zobrist(ctx.W * ctx.H * 2);
+            ctx.seenRoads = new TranspositionTable();
+            for (const key of msg.seen || []) ctx.seenRoads.add(key);
+            ctx.bound = best = null;
+            break;
+        case 'roads':
+            ctx.seenRoads.add(msg.key);
+            break;
+        case 'best':
+            ctx.bound = best = msg.best;
+            break;
+        case 'run': {
+            const result = search._snakeRoadStrategy(roadBuildings, configs[msg.index], ctx);
+            if (result) result.configIndex = msg.index;
+            const roadKey = ctx.roadKey;
+            if (result && search._isBetterResult(result, best)) {
+                self.postMessage({ index: msg.index, roadKey, result }, [result.grid.buffer]);
+            } else {
+                self.postMessage({ index: msg.index, roadKey });
+            }
+            break;
+        }
+    }
+};
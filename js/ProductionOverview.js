@@ -14,9 +14,14 @@
  *
  * Era codes: 'BronzeAge', 'IronAge', …, 'SpaceAgeSpaceHub'
  * Multi-age buildings have entries for every era; fixed-era buildings only their own.
+ *
+ * Per-day totals sum one dense row per building over RATE_KEYS, the resource
+ * dictionary build_database.py exports with the main-city index. Rows are
+ * derived from a stat vector once and shared by every copy of the building.
  */
 
 import { t } from './i18n.js';
+import { RATE_KEYS } from '../data/manifest.js';
 
 // ── Era code list (newest last) ────────────────────────────────────────────
 const ERA_CODES = [
@@ -75,9 +80,15 @@ const TIMER_LABELS = {
     '5m': '5 min', '15m': '15 min', '1h': '1 hr',
     '4h': '4 hr',  '8h': '8 hr',   '10h': '10 hr', '24h': '24 hr',
     't36000s': '10 hr', // QI cycle (36 000 s = 10 h)
+    '2d': '2 days', '7d': '7 days',
 };
 
-const TIMERS_ORDERED = ['5m', '15m', '1h', '4h', '8h', '10h', 't36000s', '24h'];
+const TIMERS_ORDERED = ['5m', '15m', '1h', '4h', '8h', '10h', 't36000s', '24h', '2d', '7d'];
+
+const TIMER_SECONDS = {
+    '5m': 300, '15m': 900, '1h': 3600, '4h': 14400, '8h': 28800, '10h': 36000,
+    '24h': 86400, '2d': 172800, '7d': 604800,
+};
 
 // ── Key parsing ────────────────────────────────────────────────────────────
 function parseResourceKey(key) {
@@ -86,19 +97,201 @@ function parseResourceKey(key) {
             return { resource: key.slice(0, -(timer.length + 1)), timer };
         }
     }
+    const odd = /^(.+)_(t\d+s)$/.exec(key);   // other cycle lengths, in seconds
+    if (odd) return { resource: odd[1], timer: odd[2] };
     return { resource: key, timer: null };
 }
 
+/** Timer length in seconds ('t36000s' → 36000), or null for untimed stats. */
+function timerSeconds(timer) {
+    if (!timer) return null;
+    const odd = /^t(\d+)s$/.exec(timer);
+    return odd ? Number(odd[1]) : TIMER_SECONDS[timer] || null;
+}
+
 function resourceLabel(resource) {
     if (RESOURCE_LABELS[resource]) return RESOURCE_LABELS[resource];
     // Make unknown keys more readable: replace underscores, capitalise
     return '🔹 ' + resource.replace(/_/g, ' ').replace(/\b\w/g, c => c.toUpperCase());
 }
 
+// Sums are kept by adding and subtracting contributions; drop float dust
+const clean = v => Math.round(v * 1e6) / 1e6;
+
+function addTo(sums, entries, sign) {
+    for (const [key, val] of entries) {
+        const next = (sums[key] || 0) + sign * val;
+        if (sign < 0 && Math.abs(next) < 1e-9) delete sums[key];
+        else sums[key] = next;
+    }
+}
+
+const cleaned = sums => Object.fromEntries(Object.entries(sums).map(([k, v]) => [k, clean(v)]));
+
 // ── Main class ─────────────────────────────────────────────────────────────
 export class ProductionOverview {
     constructor(planner) {
         this.planner = planner;
+        // Stat vectors per stats source object (prod / efficiencyStats / boosts / items),
+        // shared by every copy of a building: source → Map(eraCode → [[key, value]])
+        this._vectors = new WeakMap();
+        this._contrib = new Map();   // building → its contribution to _agg
+        // Per-day rows are indexed by resource: RATE_KEYS, then any resource
+        // only seen in efficiency or QI stats (appended as it turns up)
+        this._rateKeys = [...RATE_KEYS];
+        this._rateSlots = new Map(RATE_KEYS.map((key, i) => [key, i]));
+        this._rows = new WeakMap();  // stat vector → its per-day row
+        this._templates = null;      // planner.buildingTemplates the contributions were made from
+        this._gen = 0;
+        this._agg = null;
+    }
+
+    /**
+     * Drop all contributions, e.g. after template payloads (prod, boosts,
+     * efficiency stats) changed. The next calculate() re-adds every building.
+     */
+    invalidate() {
+        this._templates = null;
+    }
+
+    /**
+     * Bring the running aggregate up to date with planner.buildings and the
+     * pool. Buildings and the pool are edited in place from many places, so
+     * this walks both lists comparing references only: buildings that were
+     * already counted cost a Map lookup, and only the ones that came, went
+     * or moved between canvas and pool have their contribution added or
+     * subtracted.
+     */
+    _sync() {
+        const p = this.planner;
+        if (this._templates !== p.buildingTemplates) {
+            this._agg = {
+                totals: {}, daily: new Float64Array(this._rateKeys.length),
+                buildingCounts: {}, poolCounts: {}, prodBuildings: 0, military: {}, items: {},
+            };
+            this._contrib.clear();
+            this._templates = p.buildingTemplates;
+        }
+        const gen = ++this._gen;
+        const visit = (b, counts) => {
+            let c = this._contrib.get(b);
+            if (c && c.gen === gen) return;   // the same object listed twice counts once
+            if (c && c.counts !== counts) {
+                this._remove(b);
+                c = null;
+            }
+            if (!c) c = this._add(b, counts);
+            c.gen = gen;
+        };
+        for (const b of p.buildings)             visit(b, 'buildingCounts');
+        for (const b of (p.buildingPool || []))  visit(b, 'poolCounts');
+        for (const [b, c] of this._contrib) {
+            if (c.gen !== gen) this._remove(b);
+        }
+    }
+
+    /** A building's contribution: its type, stat vector, per-day row, boosts and items. */
+    _contribution(b, counts) {
+        const template = b.id ? this.planner.buildingTemplates[b.id] : null;
+        let stats = null;
+        // Stat source priority: see calculate()
+        const effStats = b.efficiencyStats || (template && template.efficiencyStats) || null;
+        if (effStats) {
+            stats = this._vector(effStats, '', () => effStats);
+        } else {
+            const prod = (template && template.prod) || b.prod;
+            if (prod) {
+                const code = b.eraCode || this._eraCodeFromId(b.id) || '';
+                stats = this._vector(prod, code, () => this._getStats(b.id, prod, b.eraCode));
+            }
+        }
+        const daily = stats && this._dailyRow(stats);
+
+        let boosts = b.boosts;
+        if (!boosts || boosts.length === 0) boosts = template && template.boosts;
+        let items = b.items;
+        if (!items || items.length === 0) items = template && template.items;
+
+        return {
+            counts,
+            type: b.type || 'unknown',
+            stats,
+            daily,
+            boosts: boosts ? this._vector(boosts, '', () => boosts.map(bt => [`${bt.type}|${bt.feature || 'all'}`, bt.value || 0])) : [],
+            items:  items  ? this._vector(items,  '', () => items.map(it => [it.name, it.qty || 0])) : [],
+        };
+    }
+
+    /** Memoized [[key, value]] for one stats source and era; null if it has no stats. */
+    _vector(source, code, resolve) {
+        let byEra = this._vectors.get(source);
+        if (!byEra) this._vectors.set(source, byEra = new Map());
+        if (!byEra.has(code)) {
+            const stats = resolve();
+            byEra.set(code, !stats ? null
+                : Array.isArray(stats) ? stats
+                : Object.entries(stats).map(([key, val]) => [key, val || 0]));
+        }
+        return byEra.get(code);
+    }
+
+    /**
+     * Per-day row for a stat vector: timed values scaled to 24h, by the same
+     * rules as build_database.py's split_stat_key(). Memoized per vector, so
+     * a template's prod is parsed once per era however many copies are placed.
+     */
+    _dailyRow(stats) {
+        if (this._rows.has(stats)) return this._rows.get(stats);
+        const best = new Map();
+        for (const [key, val] of stats) {
+            const { resource, timer } = parseResourceKey(key);
+            const seconds = timerSeconds(timer);
+            const rate = seconds ? val * 86400 / seconds : val;
+            // Several timers for one resource are alternative production options
+            best.set(resource, best.has(resource) ? Math.max(best.get(resource), rate) : rate);
+        }
+        for (const resource of best.keys()) {
+            if (!this._rateSlots.has(resource)) {
+                this._rateSlots.set(resource, this._rateKeys.length);
+                this._rateKeys.push(resource);
+            }
+        }
+        const row = new Float64Array(this._rateKeys.length);
+        for (const [resource, rate] of best) row[this._rateSlots.get(resource)] = rate;
+        this._rows.set(stats, row);
+        return row;
+    }
+
+    _add(b, counts) {
+        const c = this._contribution(b, counts);
+        this._contrib.set(b, c);
+        this._apply(c, 1);
+        return c;
+    }
+
+    _remove(b) {
+        this._apply(this._contrib.get(b), -1);
+        this._contrib.delete(b);
+    }
+
+    _apply(c, sign) {
+        const agg = this._agg;
+        addTo(agg[c.counts], [[c.type, 1]], sign);
+        if (c.stats) {
+            agg.prodBuildings += sign;
+            addTo(agg.totals, c.stats, sign);
+        }
+        if (c.daily) {
+            if (agg.daily.length < c.daily.length) {
+                const grown = new Float64Array(this._rateKeys.length);
+                grown.set(agg.daily);
+                agg.daily = grown;
+            }
+            const daily = agg.daily, row = c.daily;
+            for (let i = 0; i < row.length; i++) daily[i] += sign * row[i];
+        }
+        addTo(agg.military, c.boosts, sign);
+        addTo(agg.items, c.items, sign);
     }
 
     /**
@@ -151,44 +344,17 @@ export class ProductionOverview {
      *   3. b.prod / template.prod    (classic database-derived production)
      */
     calculate() {
-        const totals = {};
-        const buildingCounts = {};
-        const poolCounts = {};
-        let hasProdData = false;
-
-        const processBuilding = (b, counts) => {
-            const type = b.type || 'unknown';
-            counts[type] = (counts[type] || 0) + 1;
-
-            const templateKey = (b.id && this.planner.buildingTemplates[b.id]) ? b.id : null;
-            const template = templateKey ? this.planner.buildingTemplates[templateKey] : null;
-
-            // ── Choose stat source ────────────────────────────────────────
-            // 1. efficiencyStats directly on the building (efficiency rating import)
-            const effStats = b.efficiencyStats || (template && template.efficiencyStats) || null;
-            if (effStats) {
-                hasProdData = true;
-                for (const [key, val] of Object.entries(effStats)) {
-                    totals[key] = (totals[key] || 0) + (val || 0);
-                }
-                return;
-            }
-
-            // 2. Classic prod from database/template
-            const prod = (template && template.prod) || b.prod;
-            if (!prod) return;
-            const stats = this._getStats(templateKey || b.id, prod, b.eraCode);
-            if (!stats) return;
-            hasProdData = true;
-            for (const [key, val] of Object.entries(stats)) {
-                totals[key] = (totals[key] || 0) + (val || 0);
-            }
+        this._sync();
+        const agg = this._agg;
+        const daily = {};
+        agg.daily.forEach((v, i) => { if (Math.abs(v) > 1e-9) daily[this._rateKeys[i]] = clean(v); });
+        return {
+            totals:         cleaned(agg.totals),
+            daily,
+            buildingCounts: { ...agg.buildingCounts },
+            poolCounts:     { ...agg.poolCounts },
+            hasProdData:    agg.prodBuildings > 0,
         };
-
-        for (const b of this.planner.buildings)            processBuilding(b, buildingCounts);
-        for (const b of (this.planner.buildingPool || [])) processBuilding(b, poolCounts);
-
-        return { totals, buildingCounts, poolCounts, hasProdData };
     }
 
     /** Format large numbers with thousands separators */
@@ -203,21 +369,8 @@ export class ProductionOverview {
      *   - template.boosts[]     (from the updated database after re-running build_database.py)
      */
     _calculateMilitary() {
-        const sums = {};
-        const all = [...this.planner.buildings, ...(this.planner.buildingPool || [])];
-        for (const b of all) {
-            // Resolve boosts: building-level first, then template fallback
-            let boostSource = b.boosts;
-            if (!boostSource || boostSource.length === 0) {
-                const tmpl = b.id && this.planner.buildingTemplates[b.id];
-                boostSource = tmpl && tmpl.boosts;
-            }
-            for (const boost of boostSource || []) {
-                const key = `${boost.type}|${boost.feature || 'all'}`;
-                sums[key] = (sums[key] || 0) + (boost.value || 0);
-            }
-        }
-        return sums;
+        this._sync();
+        return cleaned(this._agg.military);
     }
 
     /**
@@ -225,24 +378,13 @@ export class ProductionOverview {
      * Returns { itemName: totalQty }
      */
     _calculateItems() {
-        const sums = {};
-        const all = [...this.planner.buildings, ...(this.planner.buildingPool || [])];
-        for (const b of all) {
-            let items = b.items;
-            if (!items || items.length === 0) {
-                const tmpl = b.id && this.planner.buildingTemplates[b.id];
-                items = tmpl && tmpl.items;
-            }
-            for (const it of items || []) {
-                sums[it.name] = (sums[it.name] || 0) + (it.qty || 0);
-            }
-        }
-        return sums;
+        this._sync();
+        return cleaned(this._agg.items);
     }
 
     /** Build the inner HTML for the modal */
     render() {
-        const { totals, buildingCounts, poolCounts, hasProdData } = this.calculate();
+        const { totals, daily, buildingCounts, poolCounts, hasProdData } = this.calculate();
         const buildingCount = this.planner.buildings.length;
         const poolCount = (this.planner.buildingPool || []).length;
 
@@ -298,18 +440,26 @@ export class ProductionOverview {
         // ── Render resource rows ───────────────────────────────────────────
         const resourceSections = sortedResources.map(resource => {
             const timerMap = groups[resource];
-            const rows = TIMERS_ORDERED
+            const timers = Object.keys(timerMap)
                 .filter(tm => timerMap[tm])
+                .sort((a, b) => timerSeconds(a) - timerSeconds(b));
+            const rows = timers
                 .map(tm => `
                     <div class="prod-row">
                         <span class="prod-timer">${TIMER_LABELS[tm] || tm}</span>
                         <span class="prod-value">${this._fmt(timerMap[tm])}</span>
                     </div>`)
                 .join('');
+            // Mixed or non-daily timers: also show what they come to per day
+            const perDay = timers.some(tm => tm !== '24h') && daily[resource] ? `
+                    <div class="prod-row prod-row-total">
+                        <span class="prod-timer">${t('prodModal.perDay')}</span>
+                        <span class="prod-value">${this._fmt(daily[resource])}</span>
+                    </div>` : '';
             return `
                 <div class="prod-resource-group">
                     <div class="prod-resource-label">${resourceLabel(resource)}</div>
-                    ${rows}
+                    ${rows}${perDay}
                 </div>`;
         }).join('');
 
@@ -471,7 +621,8 @@ export class ProductionOverview {
         `;
     }
 
-    show() {
+    async show() {
+        await this.planner.buildingShards.ensureForCity();
         document.getElementById('prodOverviewBody').innerHTML = this.render();
         this.planner.showModal('prodOverviewModal');
     }
@@ -1,4 +1,7 @@
 import { t } from './i18n.js';
+import { BuildingIndex } from './BuildingIndex.js';
+import { RoadConnectivity } from './RoadConnectivity.js';
+import { CellGrid } from './CellGrid.js';
 
 // Production boost types — % multiplier on resource production
 const PROD_BOOST_TYPES = {
@@ -9,6 +12,14 @@ const PROD_BOOST_TYPES = {
 // Flat per-cycle accumulation (not %)
 const FLAT_BOOST_TYPES = ['guild_raids_action_points_collection'];
 
+// Boost types summed over the whole city (calculateAutoBoosts)
+const CITY_BOOST_TYPES = new Set([
+    ...Object.keys(PROD_BOOST_TYPES), ...FLAT_BOOST_TYPES,
+    'guild_raids_action_points_capacity', 'att_def_boost_attacker', 'att_def_boost_defender',
+]);
+
+const NO_BOOSTS = { sums: [], apCollection: 0 };
+
 // Base QA cap — extendable by guild_raids_action_points_capacity boosts
 const QA_BASE_CAP = 200_000;
 
@@ -216,6 +227,12 @@ function stripTimerSuffix(key) {
     return key.replace(/_t\d+s$/, '');
 }
 
+function sameBoosts(a, b) {
+    const keys = Object.keys(a);
+    if (keys.length !== Object.keys(b).length) return false;
+    return keys.every(k => a[k] === b[k]);
+}
+
 export class QISimulator {
     constructor(planner) {
         this.planner = planner;
@@ -229,6 +246,12 @@ export class QISimulator {
         this.externalBoostOverrides = {};
         this.euphoriaPercent        = 100;
         this.expansionsBought       = 0;
+
+        // Cycle evaluation caches, see _livePlan()
+        this._prodRows  = new WeakMap();  // prod object → [[resource, boostType, value]]
+        this._boostRows = new WeakMap();  // boosts array → { sums: [[type, value]], apCollection }
+        this._live = null;                // plan of the current layout + what it was built from
+        this._memo = null;                // last calculateOneCycle() result + its settings
     }
 
     // ── Euphoria ───────────────────────────────────────────────────────────
@@ -256,23 +279,7 @@ export class QISimulator {
     // ── Boost calculation ──────────────────────────────────────────────────
 
     calculateAutoBoosts() {
-        const sums = {};
-        for (const b of this.planner.buildings) {
-            const boosts = b.boosts || this._getTemplateBoosts(b.id);
-            for (const boost of (boosts || [])) {
-                const type = boost.type;
-                if (
-                    type in PROD_BOOST_TYPES ||
-                    FLAT_BOOST_TYPES.includes(type) ||
-                    type === 'guild_raids_action_points_capacity' ||
-                    type === 'att_def_boost_attacker' ||
-                    type === 'att_def_boost_defender'
-                ) {
-                    sums[type] = (sums[type] || 0) + (boost.value || 0);
-                }
-            }
-        }
-        return sums;
+        return { ...this._livePlan().autoBoosts };
     }
 
     _getTemplateBoosts(id) {
@@ -281,69 +288,147 @@ export class QISimulator {
     }
 
     getEffectiveBoosts() {
-        const auto   = this.calculateAutoBoosts();
-        const result = { ...auto };
-        for (const [type, val] of Object.entries(this.externalBoostOverrides)) {
+        return this._effectiveBoosts(this._livePlan(), this.externalBoostOverrides);
+    }
+
+    _effectiveBoosts(plan, overrides) {
+        const result = { ...plan.autoBoosts };
+        for (const [type, val] of Object.entries(overrides)) {
             result[type] = (result[type] || 0) + (val || 0);
         }
         return result;
     }
 
     // ── Production calculation ─────────────────────────────────────────────
+    //
+    // A cycle's yield splits into what the layout decides (which buildings
+    // are road-connected, their base production, the boosts they grant) and
+    // what the settings decide (euphoria, external boosts). The layout part
+    // is a "plan" built once per layout; a cycle evaluates a plan under the
+    // settings. The live plan is rebuilt only when buildings, roads or
+    // templates change, and the last result is kept until the settings do.
 
     calculateOneCycle() {
-        const deltas  = {};
-        const boosts  = this.getEffectiveBoosts();
-        const euphMult = this._getEuphoriaInfo(this.euphoriaPercent).mult;
-        const reachableRoads = this.planner.computeRoadConnectivity();
-
-        // Town hall production (values are per 10h cycle; flat — not affected by euphoria)
-        deltas['guild_raids_money']         = 50_000;
-        deltas['guild_raids_supplies']      = 50_000;
-        deltas['guild_raids_chrono_alloy']  =     15;
-        // Base AP regeneration: 50,000 per cycle (flat — not affected by euphoria)
-        deltas['guild_raids_action_points'] = 50_000;
+        const plan = this._livePlan();
+        const memo = this._memo;
+        if (memo && memo.plan === plan && memo.euphoriaPercent === this.euphoriaPercent &&
+            sameBoosts(memo.overrides, this.externalBoostOverrides)) {
+            return { ...memo.deltas };
+        }
+        const deltas = this._evaluatePlan(plan, this.euphoriaPercent, this.externalBoostOverrides);
+        this._memo = {
+            plan, euphoriaPercent: this.euphoriaPercent,
+            overrides: { ...this.externalBoostOverrides }, deltas,
+        };
+        return { ...deltas };
+    }
 
-        for (const building of this.planner.buildings) {
-            if (building.type === 'main_building') continue; // town hall handled above as flat
+    /** The plan of the layout on the grid, rebuilt when it changed since the last call. */
+    _livePlan() {
+        const p = this.planner;
+        const live = this._live;
+        const layout = p.buildingIndex.version;
+        if (live && live.buildings === p.buildings && live.layout === layout &&
+            live.roads === p.roads && live.roadsVersion === p.roads.version &&
+            live.templates === p.buildingTemplates) {
+            return live.plan;
+        }
+        this._live = {
+            buildings: p.buildings, layout, roads: p.roads, roadsVersion: p.roads.version,
+            templates: p.buildingTemplates,
+            plan: this._layoutPlan(p.buildings, p.computeRoadConnectivity()),
+        };
+        return this._live.plan;
+    }
 
+    /**
+     * What a layout contributes to every cycle: the city-wide boost sums, the
+     * AP collected by connected buildings, and per produced resource the base
+     * values of the connected buildings making it. Rounding is per building,
+     * so the values stay separate rather than summed.
+     */
+    _layoutPlan(buildings, reachableRoads) {
+        const autoBoosts = {};
+        const groups = new Map();   // resource → { resource, boostType, values }
+        let apCollection = 0;
+        for (const building of buildings) {
+            const boosts = this._boostRow(building.boosts || this._getTemplateBoosts(building.id));
+            for (const [type, value] of boosts.sums) autoBoosts[type] = (autoBoosts[type] || 0) + value;
+
+            if (building.type === 'main_building') continue; // town hall produces a flat amount, see _evaluatePlan
             if (building.needsRoad) {
                 if (!reachableRoads || !this.planner.isBuildingRoadConnected(building, reachableRoads)) {
                     continue;
                 }
             }
-
-            // Euphoria multiplies all prod-stat resources from non-main buildings
-            const prod  = building.prod || this._getTemplateProd(building.id);
-            if (prod) {
-                const stats = prod['AllAge'] || prod['GuildRaids'] || Object.values(prod)[0];
-                if (stats) {
-                    for (const [rawKey, val] of Object.entries(stats)) {
-                        const resource  = stripTimerSuffix(rawKey);
-                        const boostType = this._getBoostTypeForResource(resource);
-                        // Game formula (verified against FoE Helper citymap.js):
-                        //   production = base × (euphoriaMult + totalBoost/100), rounded per building.
-                        // Euphoria and the summed % boosts are ADDITIVE. Resources without a
-                        // % boost type (chrono alloy) get the euphoria multiplier only.
-                        const finalMult = euphMult + (boostType ? (boosts[boostType] || 0) / 100 : 0);
-                        deltas[resource] = (deltas[resource] || 0) + Math.round(val * finalMult);
-                    }
-                }
-            }
-
-            // AP collection from cultural buildings (boost value is per hour × 10h cycle)
-            const buildingBoosts = building.boosts || this._getTemplateBoosts(building.id);
-            for (const boost of (buildingBoosts || [])) {
-                if (boost.type === 'guild_raids_action_points_collection') {
-                    deltas['guild_raids_action_points'] =
-                        (deltas['guild_raids_action_points'] || 0) + (boost.value || 0) * 10;
-                }
+            for (const [resource, boostType, value] of this._prodRow(building.prod || this._getTemplateProd(building.id))) {
+                let group = groups.get(resource);
+                if (!group) groups.set(resource, group = { resource, boostType, values: [] });
+                group.values.push(value);
             }
+            apCollection += boosts.apCollection;
         }
+        return { autoBoosts, apCollection, groups: [...groups.values()] };
+    }
+
+    /** One cycle's deltas for a plan under the given euphoria % and external boosts. */
+    _evaluatePlan(plan, euphoriaPercent, overrides) {
+        const boosts   = this._effectiveBoosts(plan, overrides);
+        const euphMult = this._getEuphoriaInfo(euphoriaPercent).mult;
+        const deltas   = {};
 
+        // Town hall production (values are per 10h cycle; flat — not affected by euphoria)
+        deltas['guild_raids_money']         = 50_000;
+        deltas['guild_raids_supplies']      = 50_000;
+        deltas['guild_raids_chrono_alloy']  =     15;
+        // Base AP regeneration: 50,000 per cycle (flat — not affected by euphoria),
+        // plus AP collection from cultural buildings
+        deltas['guild_raids_action_points'] = 50_000 + plan.apCollection;
+
+        // Euphoria multiplies all prod-stat resources from non-main buildings
+        for (const { resource, boostType, values } of plan.groups) {
+            // Game formula (verified against FoE Helper citymap.js):
+            //   production = base × (euphoriaMult + totalBoost/100), rounded per building.
+            // Euphoria and the summed % boosts are ADDITIVE. Resources without a
+            // % boost type (chrono alloy) get the euphoria multiplier only.
+            const finalMult = euphMult + (boostType ? (boosts[boostType] || 0) / 100 : 0);
+            let sum = deltas[resource] || 0;
+            for (const val of values) sum += Math.round(val * finalMult);
+            deltas[resource] = sum;
+        }
         return deltas;
     }
 
+    /** A prod object's QI stats as [resource, boostType, value] rows, parsed once per object. */
+    _prodRow(prod) {
+        if (!prod) return [];
+        let rows = this._prodRows.get(prod);
+        if (rows) return rows;
+        rows = [];
+        const stats = prod['AllAge'] || prod['GuildRaids'] || Object.values(prod)[0];
+        for (const [rawKey, val] of Object.entries(stats || {})) {
+            const resource = stripTimerSuffix(rawKey);
+            rows.push([resource, this._getBoostTypeForResource(resource), val]);
+        }
+        this._prodRows.set(prod, rows);
+        return rows;
+    }
+
+    /** A boosts list's city-wide sums and per-cycle AP collection, computed once per list. */
+    _boostRow(boosts) {
+        if (!boosts.length) return NO_BOOSTS;
+        let row = this._boostRows.get(boosts);
+        if (row) return row;
+        row = { sums: [], apCollection: 0 };
+        for (const boost of boosts) {
+            if (CITY_BOOST_TYPES.has(boost.type)) row.sums.push([boost.type, boost.value || 0]);
+            // AP collection boost value is per hour × 10h cycle
+            if (boost.type === 'guild_raids_action_points_collection') row.apCollection += (boost.value || 0) * 10;
+        }
+        this._boostRows.set(boosts, row);
+        return row;
+    }
+
     _getTemplateProd(id) {
         const tmpl = id && this.planner.buildingTemplates[id];
         return tmpl ? tmpl.prod : null;
@@ -356,6 +441,72 @@ export class QISimulator {
         return null;
     }
 
+    // ── Scenario sweeps ────────────────────────────────────────────────────
+
+    /**
+     * Evaluate many what-ifs over `cycles` collections in one call, leaving
+     * the running simulation untouched, e.g. to rank candidate QI plans.
+     * Each scenario may set
+     *
+     *   buildings, roads    a candidate layout (roads as a CellGrid or "x,y"
+     *                       keys, as saved plans store them); default: the grid
+     *   euphoriaPercent     default: the current setting
+     *   boosts              external boost overrides; default: the current ones
+     *   startingResources   default: the configured starting resources
+     *
+     * and gets back { deltas, resources, euphoria }: one cycle's deltas, the
+     * stockpile after paying the layout's build costs and collecting `cycles`
+     * times (QA capped every cycle, as collectProduction does), and the
+     * euphoria state. Scenarios sharing a layout share its plan, so sweeping
+     * euphoria or boosts over one layout costs no more than the evaluation.
+     */
+    evaluateScenarios(scenarios, cycles = 1) {
+        const plans = new Map();   // buildings array → Map(roads → plan)
+        return scenarios.map(sc => {
+            const buildings = sc.buildings || this.planner.buildings;
+            const plan = this._scenarioPlan(plans, buildings, sc.roads || this.planner.roads);
+            const euphoriaPercent = sc.euphoriaPercent ?? this.euphoriaPercent;
+            const deltas = this._evaluatePlan(plan, euphoriaPercent, sc.boosts || this.externalBoostOverrides);
+
+            const resources = { ...(sc.startingResources || this.startingResources) };
+            for (const building of buildings) {
+                for (const [res, amount] of Object.entries(QI_BUILDING_COSTS[building.id] || {})) {
+                    resources[res] = (resources[res] || 0) - amount;
+                }
+            }
+            for (const [key, val] of Object.entries(deltas)) {
+                if (key !== 'guild_raids_action_points') resources[key] = (resources[key] || 0) + val * cycles;
+            }
+            const cap = QA_BASE_CAP + (plan.autoBoosts.guild_raids_action_points_capacity || 0);
+            let qa = resources.guild_raids_action_points || 0;
+            for (let i = 0; i < cycles; i++) qa = Math.min(cap, qa + deltas.guild_raids_action_points);
+            resources.guild_raids_action_points = qa;
+
+            return { deltas, resources, euphoria: this._getEuphoriaInfo(euphoriaPercent).state };
+        });
+    }
+
+    /** The plan of a scenario's layout: the live one, or built once per call for a candidate. */
+    _scenarioPlan(plans, buildings, roads) {
+        const p = this.planner;
+        if (buildings === p.buildings && roads === p.roads) return this._livePlan();
+        let byRoads = plans.get(buildings);
+        if (!byRoads) plans.set(buildings, byRoads = new Map());
+        let plan = byRoads.get(roads);
+        if (!plan) {
+            // A stand-in planner, so the candidate gets its own index and connectivity
+            const view = {
+                buildings, roads: roads instanceof CellGrid ? roads : CellGrid.from(roads),
+                isTownhall: b => p.isTownhall(b),
+            };
+            view.buildingIndex = new BuildingIndex(view);
+            const connectivity = new RoadConnectivity(view);
+            plan = this._layoutPlan(buildings, connectivity.reachable());
+            byRoads.set(roads, plan);
+        }
+        return plan;
+    }
+
     // ── Simulation operations ──────────────────────────────────────────────
 
     enable() {
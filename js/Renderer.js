@@ -1,11 +1,42 @@
 import { CONSTANTS } from './constants.js';
 import { t } from './i18n.js';
 
+// Static layers, bottom to top. Each is cached in an offscreen canvas that
+// covers the viewport plus LAYER_MARGIN on every side, and is redrawn only
+// when invalidated, when what it shows changes, or when the view leaves it.
+const LAYERS = ['base', 'roads', 'buildings'];
+const LAYER_MARGIN = 256;  // px; pans shorter than this just shift the cached layers
+const STATS_FRAMES = 120;  // frame times kept for the ?renderstats readout
+
+function makeCanvas(width, height) {
+    if (typeof OffscreenCanvas !== 'undefined') return new OffscreenCanvas(width, height);
+    const canvas = document.createElement('canvas');
+    canvas.width  = width;
+    canvas.height = height;
+    return canvas;
+}
+
 export class Renderer {
     constructor(planner) {
         this.p = planner;
         this._animations = []; // { building, startTime, duration }
         this._rafId = null;
+
+        this._target = null;   // context the draw* methods paint into while a layer is built
+        this._cull   = null;   // { x0, y0, x1, y1 } grid cells a layer covers, or null for all
+        this._layers = Object.fromEntries(LAYERS.map(name => [name, { canvas: null, dirty: true, key: '', refs: [] }]));
+        this._view   = null;   // { panX, panY, zoom, width, height } the layers were drawn for
+        this._reachableRoads = null;
+        this._minimap = { canvas: null, dirty: true, key: '' };
+
+        this.stats = {
+            frames: 0,
+            layerRedraws: Object.fromEntries(LAYERS.map(name => [name, 0])),
+            layerMs: Object.fromEntries(LAYERS.map(name => [name, 0])),
+            frameMs: [],     // last STATS_FRAMES frame times
+        };
+        this._showStats = typeof location !== 'undefined' &&
+            new URLSearchParams(location.search).has('renderstats');
     }
 
     /** Trigger a pop animation on a newly placed building. */
@@ -17,7 +48,7 @@ export class Renderer {
     _startAnimLoop() {
         if (this._rafId) return;
         const tick = () => {
-            this.draw();
+            this.drawFrame();
             const now = performance.now();
             this._animations = this._animations.filter(a => now - a.startTime < a.duration);
             if (this._animations.length > 0) {
@@ -58,31 +89,187 @@ export class Renderer {
         }
     }
 
-    get ctx() { return this.p.ctx; }
+    get ctx() { return this._target || this.p.ctx; }
 
     get isDark() { return document.body.classList.contains('dark'); }
 
+    /**
+     * Redraw after the city changed in some way: every cached layer is
+     * rebuilt. When the change is known, invalidate() just the affected
+     * layers and call drawFrame(); when only the view or an overlay (hover,
+     * drag, animation) moved, drawFrame() alone reuses all layers.
+     */
     draw() {
+        this.invalidate();
+        this.drawFrame();
+    }
+
+    /** Mark layers ('base', 'roads', 'buildings'; all if none given) for rebuilding. */
+    invalidate(...names) {
+        if (names.length === 0) names = LAYERS;
+        // In roads mode building colours show road connectivity
+        if (names.includes('roads') && this.p.renderMode === 'roads') names = [...names, 'buildings'];
+        for (const name of names) this._layers[name].dirty = true;
+        if (names.includes('roads') || names.includes('buildings')) this._minimap.dirty = true;
+    }
+
+    /** Composite the cached layers and draw the per-frame overlays on top. */
+    drawFrame() {
+        const start = performance.now();
         const { ctx, canvas, panX, panY, zoom } = this.p;
 
         ctx.fillStyle = this.isDark ? '#12121e' : '#fff';
         ctx.fillRect(0, 0, canvas.width, canvas.height);
 
-        ctx.save();
-        ctx.translate(panX, panY);
-        ctx.scale(zoom, zoom);
+        this._syncLayers();
+        const dx = panX - this._view.panX - LAYER_MARGIN;
+        const dy = panY - this._view.panY - LAYER_MARGIN;
+        const overlay = (fn) => {
+            ctx.save();
+            ctx.translate(panX, panY);
+            ctx.scale(zoom, zoom);
+            fn();
+            ctx.restore();
+        };
 
-        this.drawBackground();
-        this.drawGrid();
-        this.drawPlacementCrosshair();
-        this.drawRoads();
-        this.drawBuildings();
-        this._drawAnimations();
-        this.drawHoverPreview();
+        ctx.drawImage(this._layers.base.canvas, dx, dy);
+        overlay(() => this.drawPlacementCrosshair());
+        ctx.drawImage(this._layers.roads.canvas, dx, dy);
+        overlay(() => this._drawRoadDragGhosts());
+        ctx.drawImage(this._layers.buildings.canvas, dx, dy);
+        overlay(() => {
+            if (this.p.draggingBuilding) this._drawBuilding(this.p.draggingBuilding, this._reachableRoads);
+            this._drawAnimations();
+            this.drawHoverPreview();
+        });
 
-        ctx.restore();
         if (this.p.showMinimap) this.drawMinimap();
         this._drawEmptyState();
+
+        const frameMs = this.stats.frameMs;
+        frameMs.push(performance.now() - start);
+        if (frameMs.length > STATS_FRAMES) frameMs.shift();
+        this.stats.frames++;
+        if (this._showStats) this._drawStats();
+    }
+
+    /**
+     * Bring the layers up to date: move them to the current view if it has
+     * left the cached area, pick up changes nobody invalidated (cheap keys
+     * over what each layer shows) and rebuild the dirty ones.
+     */
+    _syncLayers() {
+        const p = this.p;
+        const { canvas, panX, panY, zoom } = p;
+        const view = this._view;
+        if (!view || view.zoom !== zoom || view.width !== canvas.width || view.height !== canvas.height ||
+            Math.abs(panX - view.panX) > LAYER_MARGIN || Math.abs(panY - view.panY) > LAYER_MARGIN) {
+            this._view = { panX, panY, zoom, width: canvas.width, height: canvas.height };
+            this.invalidate();
+        }
+
+        const dark = this.isDark;
+        const content = {
+            base:      [[p.gridWidth, p.gridHeight, p.gridOffsetX, p.gridOffsetY, p.cellSize, dark,
+                         p.unlockedAreas?.length, p.unlockedCells?.version], [p.unlockedCells, p.unlockedAreas]],
+            roads:     [[p.renderMode, p.selectedRoad, dark, p.cellSize, p.roads.version, p.wideRoads.version],
+                        [p.roads, p.wideRoads]],
+            buildings: [[p.renderMode, dark, p.cellSize, p.buildings.length,
+                         p.renderMode === 'roads' ? p.roads.version : 0],
+                        [p.buildings, p.selectedBuilding, p.draggingBuilding]],
+        };
+        for (const name of LAYERS) {
+            const layer = this._layers[name];
+            const [values, refs] = content[name];
+            const key = values.join('|');
+            if (key !== layer.key || refs.some((ref, i) => ref !== layer.refs[i])) {
+                layer.key  = key;
+                layer.refs = refs;
+                this.invalidate(name);
+            }
+        }
+        for (const name of LAYERS) {
+            if (this._layers[name].dirty) this._buildLayer(name);
+        }
+    }
+
+    _buildLayer(name) {
+        const start = performance.now();
+        const layer = this._layers[name];
+        const { panX, panY, zoom, width, height } = this._view;
+        const w = width + 2 * LAYER_MARGIN, h = height + 2 * LAYER_MARGIN;
+        if (!layer.canvas) layer.canvas = makeCanvas(w, h);
+        if (layer.canvas.width !== w || layer.canvas.height !== h) {
+            layer.canvas.width  = w;
+            layer.canvas.height = h;
+        }
+
+        const ctx = layer.canvas.getContext('2d');
+        ctx.setTransform(1, 0, 0, 1, 0, 0);
+        ctx.clearRect(0, 0, w, h);
+        ctx.translate(panX + LAYER_MARGIN, panY + LAYER_MARGIN);
+        ctx.scale(zoom, zoom);
+
+        // Grid cells the layer covers, so off-screen cells are skipped
+        const cell = this.p.cellSize * zoom;
+        this._cull = {
+            x0: Math.floor((-LAYER_MARGIN - panX) / cell) - 1,
+            y0: Math.floor((-LAYER_MARGIN - panY) / cell) - 1,
+            x1: Math.ceil((width  + LAYER_MARGIN - panX) / cell) + 1,
+            y1: Math.ceil((height + LAYER_MARGIN - panY) / cell) + 1,
+        };
+        this._target = ctx;
+        try {
+            if (name === 'base') {
+                this.drawBackground();
+                this.drawGrid();
+            } else if (name === 'roads') {
+                this.drawRoads();
+            } else {
+                this.drawBuildings();
+            }
+        } finally {
+            this._target = null;
+            this._cull = null;
+        }
+        layer.dirty = false;
+        this.stats.layerRedraws[name]++;
+        this.stats.layerMs[name] = performance.now() - start;
+    }
+
+    /** True if a w×h rect at grid (x, y) lies outside the layer being built. */
+    _culled(x, y, w, h) {
+        const c = this._cull;
+        return c !== null && (x + w < c.x0 || y + h < c.y0 || x > c.x1 || y > c.y1);
+    }
+
+    /** Average / max frame time and layer rebuilds, for the console or the readout. */
+    statsSummary() {
+        const ms = this.stats.frameMs;
+        const avg = ms.length ? ms.reduce((a, b) => a + b, 0) / ms.length : 0;
+        return {
+            frames: this.stats.frames,
+            avgMs: avg,
+            maxMs: ms.length ? Math.max(...ms) : 0,
+            layerRedraws: { ...this.stats.layerRedraws },
+            layerMs: { ...this.stats.layerMs },
+        };
+    }
+
+    _drawStats() {
+        const { ctx } = this.p;
+        const s = this.statsSummary();
+        const layers = LAYERS.map(n => `${n} ${s.layerRedraws[n]}× ${s.layerMs[n].toFixed(1)}ms`).join('  ');
+        ctx.save();
+        ctx.font = '11px monospace';
+        ctx.textAlign = 'left';
+        ctx.textBaseline = 'top';
+        ctx.fillStyle = 'rgba(0,0,0,0.6)';
+        ctx.fillRect(6, 6, 420, 34);
+        ctx.fillStyle = '#fff';
+        ctx.fillText(`frame ${s.avgMs.toFixed(2)} ms avg, ${s.maxMs.toFixed(2)} max (last ${STATS_FRAMES}) · ${s.frames} frames`, 12, 10);
+        ctx.fillText(layers, 12, 24);
+        ctx.restore();
     }
 
     _drawEmptyState() {
@@ -120,7 +307,7 @@ export class Renderer {
 
     drawMinimap() {
         const { ctx, canvas, gridWidth, gridHeight, gridOffsetX, gridOffsetY,
-                cellSize, buildings, roads, panX, panY, zoom, renderMode } = this.p;
+                cellSize, panX, panY, zoom, renderMode } = this.p;
 
         const { left: mmL, top: mmT, width: mmW, height: mmH } = this._minimapBounds();
         const scaleX = mmW / gridWidth;
@@ -132,6 +319,47 @@ export class Renderer {
         ctx.rect(mmL, mmT, mmW, mmH);
         ctx.clip();
 
+        // Background, roads and buildings only change with the city: cached
+        const mm = this._minimap;
+        const mmKey = [mmW, mmH, gridWidth, gridHeight, gridOffsetX, gridOffsetY, renderMode, this.isDark].join('|');
+        if (mm.dirty || mm.key !== mmKey || !mm.canvas) {
+            if (!mm.canvas) mm.canvas = makeCanvas(mmW, mmH);
+            mm.canvas.width  = mmW;
+            mm.canvas.height = mmH;
+            this._target = mm.canvas.getContext('2d');
+            try {
+                this._drawMinimapContent(mmW, mmH, scaleX, scaleY);
+            } finally {
+                this._target = null;
+            }
+            mm.key = mmKey;
+            mm.dirty = false;
+        }
+        ctx.drawImage(mm.canvas, mmL, mmT);
+
+        // Viewport rectangle (clipped automatically by the save/clip above)
+        const vl = (0             - panX) / zoom / cellSize - gridOffsetX;
+        const vt = (0             - panY) / zoom / cellSize - gridOffsetY;
+        const vr = (canvas.width  - panX) / zoom / cellSize - gridOffsetX;
+        const vb = (canvas.height - panY) / zoom / cellSize - gridOffsetY;
+        ctx.strokeStyle = 'rgba(255,255,255,0.85)';
+        ctx.lineWidth = 1.5;
+        ctx.strokeRect(mmL + vl * scaleX, mmT + vt * scaleY, (vr - vl) * scaleX, (vb - vt) * scaleY);
+
+        ctx.restore();
+
+        // Border drawn after restore so it's always crisp on top
+        ctx.strokeStyle = this.isDark ? 'rgba(255,255,255,0.18)' : 'rgba(0,0,0,0.25)';
+        ctx.lineWidth = 1;
+        ctx.strokeRect(mmL + 0.5, mmT + 0.5, mmW - 1, mmH - 1);
+    }
+
+    /** Minimap background, roads and buildings at (0, 0), into the current target. */
+    _drawMinimapContent(mmW, mmH, scaleX, scaleY) {
+        const { gridOffsetX, gridOffsetY, buildings, roads, renderMode } = this.p;
+        const ctx = this.ctx;
+        const mmL = 0, mmT = 0;
+
         // Background
         ctx.fillStyle = this.isDark ? 'rgba(15,15,28,0.88)' : 'rgba(220,225,232,0.92)';
         ctx.fillRect(mmL, mmT, mmW, mmH);
@@ -142,15 +370,14 @@ export class Renderer {
 
         // Roads
         const roadColor = isRoads ? '#26C6DA' : (this.isDark ? '#555' : '#999');
-        for (const key of roads) {
-            const [rx, ry] = key.split(',').map(Number);
+        roads.forEachCell((rx, ry) => {
             ctx.fillStyle = roadColor;
             ctx.fillRect(
                 mmL + (rx - gridOffsetX) * scaleX,
                 mmT + (ry - gridOffsetY) * scaleY,
                 Math.max(1, scaleX), Math.max(1, scaleY)
             );
-        }
+        });
 
         // Buildings
         for (const b of buildings) {
@@ -172,26 +399,11 @@ export class Renderer {
                 Math.max(1, b.height * scaleY)
             );
         }
-
-        // Viewport rectangle (clipped automatically by the save/clip above)
-        const vl = (0             - panX) / zoom / cellSize - gridOffsetX;
-        const vt = (0             - panY) / zoom / cellSize - gridOffsetY;
-        const vr = (canvas.width  - panX) / zoom / cellSize - gridOffsetX;
-        const vb = (canvas.height - panY) / zoom / cellSize - gridOffsetY;
-        ctx.strokeStyle = 'rgba(255,255,255,0.85)';
-        ctx.lineWidth = 1.5;
-        ctx.strokeRect(mmL + vl * scaleX, mmT + vt * scaleY, (vr - vl) * scaleX, (vb - vt) * scaleY);
-
-        ctx.restore();
-
-        // Border drawn after restore so it's always crisp on top
-        ctx.strokeStyle = this.isDark ? 'rgba(255,255,255,0.18)' : 'rgba(0,0,0,0.25)';
-        ctx.lineWidth = 1;
-        ctx.strokeRect(mmL + 0.5, mmT + 0.5, mmW - 1, mmH - 1);
     }
 
     drawBackground() {
-        const { ctx, gridWidth, gridHeight, gridOffsetX, gridOffsetY, cellSize } = this.p;
+        const { gridWidth, gridHeight, gridOffsetX, gridOffsetY, cellSize } = this.p;
+        const ctx = this.ctx;
         const ox = gridOffsetX * cellSize;
         const oy = gridOffsetY * cellSize;
         const w  = gridWidth   * cellSize;
@@ -215,8 +427,9 @@ export class Renderer {
         ctx.fillRect(ox, oy, w, h);
 
         ctx.fillStyle = this.isDark ? 'rgba(255,255,255,0.03)' : 'rgba(150, 150, 150, 0.08)';
-        for (let x = gridOffsetX; x < gridOffsetX + gridWidth; x++) {
-            for (let y = gridOffsetY; y < gridOffsetY + gridHeight; y++) {
+        const [x0, y0, x1, y1] = this._cellRange();
+        for (let x = x0; x < x1; x++) {
+            for (let y = y0; y < y1; y++) {
                 if ((x + y) % 2 === 0) {
                     ctx.fillRect(
                         x * cellSize + cellSize / 2 - 1,
@@ -228,8 +441,21 @@ export class Renderer {
         }
     }
 
+    /** Grid cells to draw: [x0, y0, x1, y1), limited to the layer being built. */
+    _cellRange() {
+        const { gridWidth, gridHeight, gridOffsetX, gridOffsetY } = this.p;
+        const c = this._cull;
+        let x0 = gridOffsetX, y0 = gridOffsetY, x1 = gridOffsetX + gridWidth, y1 = gridOffsetY + gridHeight;
+        if (c) {
+            x0 = Math.max(x0, c.x0); y0 = Math.max(y0, c.y0);
+            x1 = Math.min(x1, c.x1); y1 = Math.min(y1, c.y1);
+        }
+        return [x0, y0, x1, y1];
+    }
+
     drawGrid() {
-        const { ctx, gridWidth, gridHeight, gridOffsetX, gridOffsetY, cellSize, unlockedCells } = this.p;
+        const { gridWidth, gridHeight, gridOffsetX, gridOffsetY, cellSize, unlockedCells } = this.p;
+        const ctx = this.ctx;
         const ox = gridOffsetX * cellSize;
         const oy = gridOffsetY * cellSize;
         const w  = gridWidth   * cellSize;
@@ -238,9 +464,10 @@ export class Renderer {
         // Shade locked cells dark so the non-rectangular city shape is visible.
         if (unlockedCells) {
             ctx.fillStyle = this.isDark ? 'rgba(0,0,0,0.65)' : 'rgba(40,40,40,0.55)';
-            for (let cy = gridOffsetY; cy < gridOffsetY + gridHeight; cy++) {
-                for (let cx = gridOffsetX; cx < gridOffsetX + gridWidth; cx++) {
-                    if (!unlockedCells.has(`${cx},${cy}`)) {
+            const [x0, y0, x1, y1] = this._cellRange();
+            for (let cy = y0; cy < y1; cy++) {
+                for (let cx = x0; cx < x1; cx++) {
+                    if (!unlockedCells.hasCell(cx, cy)) {
                         ctx.fillRect(cx * cellSize, cy * cellSize, cellSize, cellSize);
                     }
                 }
@@ -316,16 +543,17 @@ export class Renderer {
     }
 
     drawRoads() {
-        const { ctx, roads, wideRoads, cellSize, hoverPos, selectedRoad, renderMode } = this.p;
+        const { roads, wideRoads, cellSize, selectedRoad, renderMode } = this.p;
+        const ctx = this.ctx;
         const isRoadsMode = renderMode === 'roads';
         const roadColor     = isRoadsMode ? '#26C6DA' : CONSTANTS.COLORS.ROAD;
         const wideRoadColor = isRoadsMode ? '#0097A7' : (CONSTANTS.COLORS.WIDE_ROAD || '#6b6b6b');
+        const [selX, selY] = selectedRoad ? selectedRoad.split(',').map(Number) : [NaN, NaN];
+        const selectedWide = selectedRoad ? this.p._wideRoadAnchorCell(selX, selY) : null;
 
-        for (const roadPos of roads) {
-            const [x, y] = roadPos.split(',').map(Number);
-
+        const drawRoad = (x, y) => {
             // Wide road: only draw from the anchor cell to avoid duplicate draws
-            if (wideRoads.has(roadPos)) {
+            if (wideRoads.hasCell(x, y)) {
                 // This IS the anchor — draw a 2×2 block
                 const px = x * cellSize;
                 const py = y * cellSize;
@@ -355,10 +583,8 @@ export class Renderer {
                 ctx.strokeRect(px + 0.5, py + 0.5, bw - 1, bh - 1);
 
                 // Selection highlight — also inset
-                const isSelectedWide = selectedRoad && this.p._getWideRoadAnchor(
-                    ...selectedRoad.split(',').map(Number)
-                ) === roadPos;
-                if (isSelectedWide || selectedRoad === roadPos) {
+                const isSelectedWide = selectedWide && selectedWide[0] === x && selectedWide[1] === y;
+                if (isSelectedWide || (x === selX && y === selY)) {
                     ctx.strokeStyle = '#FFD700';
                     ctx.lineWidth = 3;
                     ctx.strokeRect(px + 2, py + 2, bw - 4, bh - 4);
@@ -367,16 +593,16 @@ export class Renderer {
                     ctx.strokeRect(px + 2, py + 2, bw - 4, bh - 4);
                     ctx.shadowBlur = 0;
                 }
-                continue;
+                return;
             }
 
             // Skip non-anchor cells that belong to a wide road (already drawn above)
-            if (this.p._getWideRoadAnchor(x, y) !== null) continue;
+            if (this.p._wideRoadAnchorCell(x, y) !== null) return;
 
             // Normal 1×1 road
             const px = x * cellSize;
             const py = y * cellSize;
-            const isSelected = roadPos === selectedRoad;
+            const isSelected = x === selX && y === selY;
 
             ctx.fillStyle = roadColor;
             ctx.fillRect(px, py, cellSize, cellSize);
@@ -394,7 +620,17 @@ export class Renderer {
                 ctx.strokeRect(px + 1.5, py + 1.5, cellSize - 3, cellSize - 3);
                 ctx.shadowBlur = 0;
             }
-        }
+        };
+
+        // Only the cells the layer covers (plus wide road anchors just before it)
+        const c = this._cull;
+        if (c) roads.forEachCellIn(c.x0 - 2, c.y0 - 2, c.x1 + 1, c.y1 + 1, drawRoad);
+        else roads.forEachCell(drawRoad);
+    }
+
+    /** Road being dragged: snap preview plus a ghost following the cursor. */
+    _drawRoadDragGhosts() {
+        const { ctx, cellSize } = this.p;
 
         // Draw narrow road drag ghost — free pixel position, snap preview on release
         if (this.p.draggingRoad) {
@@ -480,109 +716,119 @@ export class Renderer {
         return                                 { color: '#2E7D32', label: '> 90 days' };   // dark green
     }
 
+    /** Every building except the one being dragged (drawn per frame on top). */
     drawBuildings() {
-        const { ctx, buildings, cellSize, draggingBuilding, selectedBuilding, renderMode } = this.p;
-        const isExpiry = renderMode === 'expiry';
-        const isRoads  = renderMode === 'roads';
+        const { buildings, draggingBuilding, renderMode } = this.p;
 
         // Pre-compute road connectivity once per draw when in roads mode
-        const reachableRoads = isRoads ? this.p.computeRoadConnectivity() : null;
+        const reachableRoads = renderMode === 'roads' ? this.p.computeRoadConnectivity() : null;
+        this._reachableRoads = reachableRoads;
 
         for (const building of buildings) {
-            const w = building.width  * cellSize;
-            const h = building.height * cellSize;
-
-            const isDragging = draggingBuilding === building;
-            const isSelected = selectedBuilding === building;
-            const isRoadless = building.needsRoad === 0;
+            if (building === draggingBuilding) continue;
+            if (this._culled(building.x, building.y, building.width, building.height)) continue;
+            this._drawBuilding(building, reachableRoads);
+        }
+    }
 
-            let fillColor;
-            if (isExpiry) {
-                fillColor = Renderer.expiryColor(building.expiration).color;
-            } else if (isRoads) {
-                if (isRoadless) {
-                    fillColor = '#78909C'; // no road required
-                } else if (reachableRoads && this.p.isBuildingRoadConnected(building, reachableRoads)) {
-                    fillColor = '#43A047'; // connected
-                } else {
-                    fillColor = '#E53935'; // disconnected
-                }
-            } else if (isRoadless) {
-                fillColor = this.isDark ? CONSTANTS.DARK_COLORS.roadless : CONSTANTS.COLORS.ROADLESS;
+    _drawBuilding(building, reachableRoads) {
+        const ctx = this.ctx;
+        const { cellSize, draggingBuilding, selectedBuilding, renderMode } = this.p;
+        const isExpiry = renderMode === 'expiry';
+        const isRoads  = renderMode === 'roads';
+        const w = building.width  * cellSize;
+        const h = building.height * cellSize;
+
+        const isDragging = draggingBuilding === building;
+        const isSelected = selectedBuilding === building;
+        const isRoadless = building.needsRoad === 0;
+
+        let fillColor;
+        if (isExpiry) {
+            fillColor = Renderer.expiryColor(building.expiration).color;
+        } else if (isRoads) {
+            if (isRoadless) {
+                fillColor = '#78909C'; // no road required
+            } else if (reachableRoads && this.p.isBuildingRoadConnected(building, reachableRoads)) {
+                fillColor = '#43A047'; // connected
             } else {
-                fillColor = this.isDark ? (CONSTANTS.DARK_COLORS[building.type] || building.color) : building.color;
-            }
-
-            // Free-drag: follow cursor in pixel space, snap only on release
-            let x = building.x * cellSize;
-            let y = building.y * cellSize;
-            if (isDragging) {
-                const rect = this.p.canvas.getBoundingClientRect();
-                const { panX, panY, zoom, dragPixelX, dragPixelY, dragOffset } = this.p;
-                x = (dragPixelX - rect.left - panX) / zoom - dragOffset.x * cellSize;
-                y = (dragPixelY - rect.top  - panY) / zoom - dragOffset.y * cellSize;
-
-                // Faint snap ghost so the user can see where it will land
-                const snapGX = Math.floor((dragPixelX - rect.left - panX) / zoom / cellSize) - dragOffset.x;
-                const snapGY = Math.floor((dragPixelY - rect.top  - panY) / zoom / cellSize) - dragOffset.y;
-                const snapX = snapGX * cellSize;
-                const snapY = snapGY * cellSize;
-                const canDrop = this.p.canPlaceBuilding(snapGX, snapGY, building.width, building.height, building);
-                ctx.globalAlpha = 0.25;
-                ctx.fillStyle = canDrop ? '#00cc44' : '#ff3333';
-                ctx.fillRect(snapX, snapY, w, h);
-                ctx.globalAlpha = 1.0;
+                fillColor = '#E53935'; // disconnected
             }
+        } else if (isRoadless) {
+            fillColor = this.isDark ? CONSTANTS.DARK_COLORS.roadless : CONSTANTS.COLORS.ROADLESS;
+        } else {
+            fillColor = this.isDark ? (CONSTANTS.DARK_COLORS[building.type] || building.color) : building.color;
+        }
 
-            if (isDragging) ctx.globalAlpha = 0.75;
+        // Free-drag: follow cursor in pixel space, snap only on release
+        let x = building.x * cellSize;
+        let y = building.y * cellSize;
+        if (isDragging) {
+            const rect = this.p.canvas.getBoundingClientRect();
+            const { panX, panY, zoom, dragPixelX, dragPixelY, dragOffset } = this.p;
+            x = (dragPixelX - rect.left - panX) / zoom - dragOffset.x * cellSize;
+            y = (dragPixelY - rect.top  - panY) / zoom - dragOffset.y * cellSize;
+
+            // Faint snap ghost so the user can see where it will land
+            const snapGX = Math.floor((dragPixelX - rect.left - panX) / zoom / cellSize) - dragOffset.x;
+            const snapGY = Math.floor((dragPixelY - rect.top  - panY) / zoom / cellSize) - dragOffset.y;
+            const snapX = snapGX * cellSize;
+            const snapY = snapGY * cellSize;
+            const canDrop = this.p.canPlaceBuilding(snapGX, snapGY, building.width, building.height, building);
+            ctx.globalAlpha = 0.25;
+            ctx.fillStyle = canDrop ? '#00cc44' : '#ff3333';
+            ctx.fillRect(snapX, snapY, w, h);
+            ctx.globalAlpha = 1.0;
+        }
 
-            if (isRoadless && !isDragging && !isExpiry && !isRoads) {
-                this.drawRoadlessBuilding(x, y, w, h, fillColor);
-            } else {
-                ctx.fillStyle = fillColor;
-                ctx.fillRect(x, y, w, h);
-            }
+        if (isDragging) ctx.globalAlpha = 0.75;
 
-            // All borders inset so they never bleed onto neighbouring cells
-            if (isRoadless && !isExpiry && !isRoads) {
-                ctx.strokeStyle = '#2E7D32';
-                ctx.lineWidth = 2;
-                ctx.setLineDash([8, 4]);
-                ctx.strokeRect(x + 1, y + 1, w - 2, h - 2);
-                ctx.setLineDash([]);
-            } else {
-                ctx.strokeStyle = (isExpiry || isRoads)
-                    ? 'rgba(0,0,0,0.35)'
-                    : (this.isDark ? 'rgba(255,255,255,0.20)' : 'rgba(0,0,0,0.45)');
-                ctx.lineWidth = 1;
-                ctx.strokeRect(x + 0.5, y + 0.5, w - 1, h - 1);
-            }
+        if (isRoadless && !isDragging && !isExpiry && !isRoads) {
+            this.drawRoadlessBuilding(x, y, w, h, fillColor);
+        } else {
+            ctx.fillStyle = fillColor;
+            ctx.fillRect(x, y, w, h);
+        }
 
-            if (isSelected && !isDragging) {
-                ctx.strokeStyle = '#FFD700';
-                ctx.lineWidth = 3;
-                ctx.strokeRect(x + 2, y + 2, w - 4, h - 4);
-                ctx.shadowColor = '#FFD700';
-                ctx.shadowBlur = 8;
-                ctx.strokeRect(x + 2, y + 2, w - 4, h - 4);
-                ctx.shadowBlur = 0;
-            }
+        // All borders inset so they never bleed onto neighbouring cells
+        if (isRoadless && !isExpiry && !isRoads) {
+            ctx.strokeStyle = '#2E7D32';
+            ctx.lineWidth = 2;
+            ctx.setLineDash([8, 4]);
+            ctx.strokeRect(x + 1, y + 1, w - 2, h - 2);
+            ctx.setLineDash([]);
+        } else {
+            ctx.strokeStyle = (isExpiry || isRoads)
+                ? 'rgba(0,0,0,0.35)'
+                : (this.isDark ? 'rgba(255,255,255,0.20)' : 'rgba(0,0,0,0.45)');
+            ctx.lineWidth = 1;
+            ctx.strokeRect(x + 0.5, y + 0.5, w - 1, h - 1);
+        }
 
-            if (isDragging) {
-                ctx.strokeStyle = '#00FF00';
-                ctx.lineWidth = 2;
-                ctx.setLineDash([8, 4]);
-                ctx.strokeRect(x + 1, y + 1, w - 2, h - 2);
-                ctx.setLineDash([]);
-            }
+        if (isSelected && !isDragging) {
+            ctx.strokeStyle = '#FFD700';
+            ctx.lineWidth = 3;
+            ctx.strokeRect(x + 2, y + 2, w - 4, h - 4);
+            ctx.shadowColor = '#FFD700';
+            ctx.shadowBlur = 8;
+            ctx.strokeRect(x + 2, y + 2, w - 4, h - 4);
+            ctx.shadowBlur = 0;
+        }
 
-            ctx.globalAlpha = 1.0;
-            this.drawBuildingText(building, x, y, w, h);
+        if (isDragging) {
+            ctx.strokeStyle = '#00FF00';
+            ctx.lineWidth = 2;
+            ctx.setLineDash([8, 4]);
+            ctx.strokeRect(x + 1, y + 1, w - 2, h - 2);
+            ctx.setLineDash([]);
         }
+
+        ctx.globalAlpha = 1.0;
+        this.drawBuildingText(building, x, y, w, h);
     }
 
     drawRoadlessBuilding(x, y, w, h, color) {
-        const { ctx } = this.p;
+        const ctx = this.ctx;
 
         ctx.save();
         ctx.beginPath();
@@ -612,7 +858,7 @@ export class Renderer {
     }
 
     drawBuildingText(building, x, y, w, h) {
-        const { ctx } = this.p;
+        const ctx = this.ctx;
         if (this.isDark) {
             ctx.fillStyle = '#ffffff';
             ctx.shadowColor = 'rgba(0,0,0,0.8)';
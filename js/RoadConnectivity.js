@@ -0,0 +1,219 @@
+import { CellGrid } from './CellGrid.js';
+
+const DX = [-1, 1, 0, 0];
+const DY = [0, 0, -1, 1];
+
+/**
+ * Which road cells connect to the Town Hall, kept up to date as roads change
+ * instead of re-running a BFS over the whole network on every query.
+ *
+ * Each connected road cell holds its BFS distance from the Town Hall in a
+ * CellGrid (1 = next to it, 0 = not connected). Like BuildingIndex, it
+ * follows planner.roads on its own: each query replays the cells changed
+ * since the last one (CellGrid.changesSince), where
+ *
+ *   - an added road takes its nearest neighbour's distance + 1 and passes
+ *     the improvement on, touching only cells that got closer;
+ *   - a removed road drops just the cells whose every shortest path ran
+ *     through it, which then take distances from the intact cells around
+ *     them, or stay 0 when they were cut off.
+ *
+ * Distances rather than union-find, since roads are deleted as often as
+ * they are drawn. A new roads grid, a moved Town Hall or a change log that
+ * no longer reaches back far enough fall back to a full BFS.
+ */
+export class RoadConnectivity {
+    constructor(planner) {
+        this.p = planner;
+        this._dist    = new CellGrid(null, Int32Array);
+        this._roads   = null;   // the roads grid last synced
+        this._version = 0;      // its version then
+        this._th      = null;
+        this._thKey   = '';
+        this.stats = { rebuilds: 0, updates: 0 };
+    }
+
+    /**
+     * Road cells connected to the Town Hall as a CellGrid (hasCell / has /
+     * size), or null without a Town Hall. Owned by this object and updated
+     * in place, so read it rather than keep it.
+     */
+    reachable() {
+        return this._sync() ? this._dist : null;
+    }
+
+    /** Returns true if a road connected to the Town Hall touches the building's footprint. */
+    isConnected(building) {
+        if (!this._sync()) return false;
+        const dist = this._dist;
+        const { x, y, width, height } = building;
+        for (let bx = x; bx < x + width; bx++) {
+            if (dist.get(bx, y - 1) || dist.get(bx, y + height)) return true;
+        }
+        for (let by = y; by < y + height; by++) {
+            if (dist.get(x - 1, by) || dist.get(x + width, by)) return true;
+        }
+        return false;
+    }
+
+    _sync() {
+        const p = this.p;
+        let th = this._th;
+        if (!th || p.buildingIndex.at(th.x, th.y) !== th) {
+            th = p.buildings.find(b => p.isTownhall(b)) || null;
+        }
+        if (!th) {
+            this._th = null;
+            return false;
+        }
+        const roads = p.roads;
+        const thKey = `${th.x},${th.y},${th.width},${th.height}`;
+        if (th !== this._th || thKey !== this._thKey || roads !== this._roads) {
+            this._th = th;
+            this._thKey = thKey;
+            this._roads = roads;
+            this._rebuild();
+        } else if (roads.version !== this._version) {
+            const changes = roads.changesSince(this._version);
+            if (changes) this._update(changes);
+            else this._rebuild();
+        }
+        this._version = roads.version;
+        return true;
+    }
+
+    /** Whether (x, y) is orthogonally next to the Town Hall footprint. */
+    _isSeed(x, y) {
+        const { x: tx, y: ty, width: w, height: h } = this._th;
+        return (x >= tx && x < tx + w && y >= ty - 1 && y <= ty + h) ||
+               (y >= ty && y < ty + h && x >= tx - 1 && x <= tx + w);
+    }
+
+    _rebuild() {
+        this.stats.rebuilds++;
+        this._dist.clear();
+        const { x, y, width, height } = this._th;
+        const buckets = [];
+        for (let bx = x; bx < x + width; bx++) {
+            push(buckets, 1, bx, y - 1);
+            push(buckets, 1, bx, y + height);
+        }
+        for (let by = y; by < y + height; by++) {
+            push(buckets, 1, x - 1, by);
+            push(buckets, 1, x + width, by);
+        }
+        this._relax(buckets);
+    }
+
+    /** Catch up with the roads changed at the packed cells (current values are in p.roads). */
+    _update(changes) {
+        this.stats.updates++;
+        const roads = this.p.roads, dist = this._dist;
+        const removed = [], added = [];
+        for (let i = 0; i < changes.length; i += 2) {
+            const x = changes[i], y = changes[i + 1];
+            if (!roads.hasCell(x, y)) {
+                if (dist.get(x, y)) removed.push(x, y);
+            } else if (!dist.get(x, y)) {
+                added.push(x, y);
+            }
+        }
+        const buckets = removed.length ? this._detach(removed) : [];
+        for (let i = 0; i < added.length; i += 2) this._offer(buckets, added[i], added[i + 1]);
+        this._relax(buckets);
+    }
+
+    /**
+     * Clear the removed cells and every cell that only reached the Town Hall
+     * through them, and return buckets re-offering each of those cells the
+     * best distance its remaining neighbours give it.
+     */
+    _detach(removed) {
+        const dist = this._dist;
+        const lost = new CellGrid();
+        const lostCells = [];
+        const check = [];   // distance → packed cells that may have lost their last parent
+        const watchChildren = (x, y, d) => {
+            for (let k = 0; k < 4; k++) {
+                if (dist.get(x + DX[k], y + DY[k]) === d + 1) push(check, d + 1, x + DX[k], y + DY[k]);
+            }
+        };
+        for (let i = 0; i < removed.length; i += 2) {
+            const x = removed[i], y = removed[i + 1];
+            const d = dist.get(x, y);
+            if (!d) continue;   // listed twice
+            dist.set(x, y, 0);
+            watchChildren(x, y, d);
+        }
+
+        // Nearest first, so a cell's possible parents are settled before it
+        for (let d = 1; d < check.length; d++) {
+            const cells = check[d];
+            if (!cells) continue;
+            for (let i = 0; i < cells.length; i += 2) {
+                const x = cells[i], y = cells[i + 1];
+                if (dist.get(x, y) !== d || lost.hasCell(x, y) || this._hasParent(x, y, d, lost)) continue;
+                lost.addCell(x, y);
+                lostCells.push(x, y);
+                watchChildren(x, y, d);
+            }
+        }
+
+        for (let i = 0; i < lostCells.length; i += 2) dist.set(lostCells[i], lostCells[i + 1], 0);
+        const buckets = [];
+        for (let i = 0; i < lostCells.length; i += 2) this._offer(buckets, lostCells[i], lostCells[i + 1]);
+        return buckets;
+    }
+
+    /** Whether road (x, y) at distance d still has a way in at d - 1 outside lost. */
+    _hasParent(x, y, d, lost) {
+        if (d === 1) return this._isSeed(x, y);
+        const dist = this._dist;
+        for (let k = 0; k < 4; k++) {
+            const nx = x + DX[k], ny = y + DY[k];
+            if (dist.get(nx, ny) === d - 1 && !lost.hasCell(nx, ny)) return true;
+        }
+        return false;
+    }
+
+    /** Queue road (x, y) at the distance its connected neighbours give it, if any. */
+    _offer(buckets, x, y) {
+        if (this._isSeed(x, y)) {
+            push(buckets, 1, x, y);
+            return;
+        }
+        const dist = this._dist;
+        let best = 0;
+        for (let k = 0; k < 4; k++) {
+            const d = dist.get(x + DX[k], y + DY[k]);
+            if (d && (!best || d < best)) best = d;
+        }
+        if (best) push(buckets, best + 1, x, y);
+    }
+
+    /** Settle the queued cells in distance order and spread any improvement along the roads. */
+    _relax(buckets) {
+        const roads = this.p.roads, dist = this._dist;
+        for (let d = 1; d < buckets.length; d++) {
+            const cells = buckets[d];
+            if (!cells) continue;
+            for (let i = 0; i < cells.length; i += 2) {
+                const x = cells[i], y = cells[i + 1];
+                const cur = dist.get(x, y);
+                if ((cur && cur <= d) || !roads.hasCell(x, y)) continue;
+                dist.set(x, y, d);
+                for (let k = 0; k < 4; k++) {
+                    const nx = x + DX[k], ny = y + DY[k];
+                    if (!roads.hasCell(nx, ny)) continue;
+                    const nd = dist.get(nx, ny);
+                    if (!nd || nd > d + 1) push(buckets, d + 1, nx, ny);
+                }
+            }
+            buckets[d] = null;
+        }
+    }
+}
+
+function push(buckets, d, x, y) {
+    (buckets[d] ||= []).push(x, y);
+}
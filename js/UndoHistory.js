@@ -1,65 +1,161 @@
 import { t } from './i18n.js';
+import { CellGrid } from './CellGrid.js';
 
 const MAX_HISTORY = 50;
 
+/**
+ * Undo/redo as a stack of transactions, each holding only what changed:
+ *
+ *   buildings / pool / areas   { removed: [[index, obj]], added: [[index, obj]] }
+ *   moved                      [[building, fromX, fromY, toX, toY]] (placed both before and after)
+ *   reset                      the same, for entries that left the city or the pool
+ *   roads / wideRoads          { removed: Int32Array [x, y, …], added: Int32Array [x, y, …] }
+ *
+ * capture() closes the open transaction and opens the next one, so the
+ * many places that edit p.buildings, p.roads etc. directly need no hooks:
+ *
+ *   - the road grids are followed through their change logs (GridTrack),
+ *     so a step costs O(cells changed) rather than a copy of every road;
+ *   - the lists are baselined as arrays of references plus packed
+ *     positions and diffed by identity when the step closes.
+ *
+ * Only the diff is kept, so history memory follows the size of the edits
+ * rather than the city. Undo/redo patch it back in place, and re-index just
+ * the buildings it moved, removed or restored.
+ */
 export class UndoHistory {
     constructor(planner) {
         this.p = planner;
         this._undoStack = [];
         this._redoStack = [];
+        this._open = null;     // baseline of the transaction in progress
+        this._roads     = new GridTrack(() => planner.roads);
+        this._wideRoads = new GridTrack(() => planner.wideRoads);
     }
 
-    /** Save current state to undo stack, clearing the redo stack. */
+    /** Start a new undo step: everything changed from here on undoes together. */
     capture() {
-        this._undoStack.push(this._snapshot());
-        if (this._undoStack.length > MAX_HISTORY) this._undoStack.shift();
+        this._close();
         this._redoStack = [];
+        this._open = this._baseline(true);
         this._updateButtons();
     }
 
-    /** Discard the most recently captured snapshot (e.g. when a drag cancelled with no net change). */
+    /** Close the current step when the action turned out to change nothing (e.g. a cancelled drag). */
     discard() {
-        this._undoStack.pop();
+        this._close();
+        this._open = this._baseline(false);
         this._updateButtons();
     }
 
     undo() {
+        this._close();
         if (!this._undoStack.length) return;
-        this._redoStack.push(this._snapshot());
-        this._restore(this._undoStack.pop());
+        const tx = this._undoStack.pop();
+        this._apply(tx, true);
+        this._redoStack.push(tx);
+        this._open = this._baseline(false);
         this._updateButtons();
         this._flashStatus(t('status.undo'));
     }
 
     redo() {
+        this._close();
         if (!this._redoStack.length) return;
-        this._undoStack.push(this._snapshot());
-        this._restore(this._redoStack.pop());
+        const tx = this._redoStack.pop();
+        this._apply(tx, false);
+        this._undoStack.push(tx);
+        this._open = this._baseline(false);
         this._updateButtons();
         this._flashStatus(t('status.redo'));
     }
 
-    _snapshot() {
+    _baseline(captured) {
         const p = this.p;
+        const buildings    = p.buildings.slice();
+        const buildingPool = p.buildingPool.slice();
+        // Catch the road copies up with whatever happened outside a step (an undo's own patch)
+        this._roads.diff();
+        this._wideRoads.diff();
         return {
-            buildings:    JSON.parse(JSON.stringify(p.buildings)),
-            roads:        new Set(p.roads),
-            wideRoads:    new Set(p.wideRoads),
-            buildingPool: JSON.parse(JSON.stringify(p.buildingPool)),
-            unlockedAreas: JSON.parse(JSON.stringify(p.unlockedAreas)),
+            captured,
+            buildings,    pos:     positions(buildings),
+            buildingPool, poolPos: positions(buildingPool),
+            unlockedAreas: p.unlockedAreas.slice(),
         };
     }
 
-    _restore(snapshot) {
+    /** Diff the open transaction against the current state and push it if anything changed. */
+    _close() {
+        const base = this._open;
+        if (!base) return;
+        this._open = null;
         const p = this.p;
-        p.buildings    = snapshot.buildings;
-        p.roads        = snapshot.roads;
-        p.wideRoads    = snapshot.wideRoads;
-        p.buildingPool = snapshot.buildingPool;
-        p.unlockedAreas = snapshot.unlockedAreas;
+
+        const buildings = diffList(base.buildings, p.buildings);
+        const moved = [];
+        const gone = new Set(buildings.removed.map(([, b]) => b));
+        base.buildings.forEach((b, i) => {
+            const x = base.pos[2 * i], y = base.pos[2 * i + 1];
+            if ((b.x !== x || b.y !== y) && !gone.has(b)) moved.push([b, x, y, b.x, b.y]);
+        });
+        const reset = [];
+        const tx = {
+            buildings,
+            moved,
+            reset,
+            buildingPool:  diffList(base.buildingPool, p.buildingPool),
+            unlockedAreas: diffList(base.unlockedAreas, p.unlockedAreas),
+            roads:         this._roads.diff(),
+            wideRoads:     this._wideRoads.diff(),
+        };
+        // Entries that left the city or the pool get back the position they had
+        for (const [list, pos] of [[buildings.removed, base.pos], [tx.buildingPool.removed, base.poolPos]]) {
+            for (const [i, b] of list) {
+                const x = pos[2 * i], y = pos[2 * i + 1];
+                if (b.x !== x || b.y !== y) reset.push([b, x, y, b.x, b.y]);
+            }
+        }
+
+        const empty = !moved.length && !reset.length &&
+            [tx.buildings, tx.buildingPool, tx.unlockedAreas, tx.roads, tx.wideRoads]
+            .every(d => !d.removed.length && !d.added.length);
+        if (empty) return;
+        this._undoStack.push(tx);
+        if (this._undoStack.length > MAX_HISTORY) this._undoStack.shift();
+        if (!base.captured) this._redoStack = [];  // an untracked edit after undo: the redo branch is gone
+    }
+
+    _apply(tx, inverse) {
+        const p = this.p, index = p.buildingIndex;
+        const leaving  = (inverse ? tx.buildings.added : tx.buildings.removed).map(([, b]) => b);
+        const arriving = (inverse ? tx.buildings.removed : tx.buildings.added).map(([, b]) => b);
+        // Keep BuildingIndex in step building by building instead of a full re-index
+        index.remove(leaving);
+        const swapped = new Set([...leaving, ...arriving]);  // overlaps moved when a list was recorded whole
+        for (const [b, fromX, fromY, toX, toY] of tx.moved) {
+            const x = inverse ? fromX : toX, y = inverse ? fromY : toY;
+            if (swapped.has(b)) {
+                b.x = x;
+                b.y = y;
+            } else {
+                index.move(b, x, y);
+            }
+        }
+        for (const [b, fromX, fromY, toX, toY] of tx.reset) {
+            b.x = inverse ? fromX : toX;
+            b.y = inverse ? fromY : toY;
+        }
+        p.buildings     = patchList(p.buildings, tx.buildings, inverse);
+        index.adopt(arriving);
+        p.buildingPool  = patchList(p.buildingPool, tx.buildingPool, inverse);
+        p.unlockedAreas = patchList(p.unlockedAreas, tx.unlockedAreas, inverse);
+        patchGrid(p.roads, tx.roads, inverse);
+        patchGrid(p.wideRoads, tx.wideRoads, inverse);
+
         p.selectedBuilding = null;
         p.selectedRoad     = null;
-        p.rebuildUnlockedCells();
+        if (tx.unlockedAreas.removed.length || tx.unlockedAreas.added.length) p.rebuildUnlockedCells();
         p.updatePoolPanel();
         p.updateSelectionBanner();
         p.importer.updateCityInfoPanel();
@@ -79,7 +175,106 @@ export class UndoHistory {
     _updateButtons() {
         const undoBtn = document.getElementById('undoBtn');
         const redoBtn = document.getElementById('redoBtn');
-        if (undoBtn) undoBtn.disabled = this._undoStack.length === 0;
+        if (undoBtn) undoBtn.disabled = this._undoStack.length === 0 && !this._open?.captured;
         if (redoBtn) redoBtn.disabled = this._redoStack.length === 0;
     }
 }
+
+/** x, y of every entry, packed. */
+function positions(list) {
+    const pos = new Int32Array(list.length * 2);
+    list.forEach((b, i) => { pos[2 * i] = b.x; pos[2 * i + 1] = b.y; });
+    return pos;
+}
+
+/**
+ * Entries removed from / added to a list, with their indices in before / after.
+ * Edits filter, push and splice, so the entries both lists share normally
+ * keep their relative order and re-inserting by ascending index rebuilds
+ * either side. If the shared entries were reordered (an entry left and came
+ * back within one step), the whole list is recorded instead.
+ */
+function diffList(before, after) {
+    // Most steps only push (or change nothing): before is a prefix of after
+    let n = 0;
+    while (n < before.length && n < after.length && before[n] === after[n]) n++;
+    if (n === before.length) {
+        return { removed: [], added: after.slice(n).map((x, k) => [n + k, x]) };
+    }
+
+    const inAfter  = new Set(after);
+    const inBefore = new Set(before);
+    const removed = [], added = [];
+    before.forEach((x, i) => { if (!inAfter.has(x))  removed.push([i, x]); });
+    after.forEach((x, i)  => { if (!inBefore.has(x)) added.push([i, x]); });
+
+    let j = 0;
+    for (const x of before) {
+        if (!inAfter.has(x)) continue;
+        while (!inBefore.has(after[j])) j++;
+        if (after[j++] !== x) {
+            return { removed: before.map((y, i) => [i, y]), added: after.map((y, i) => [i, y]) };
+        }
+    }
+    return { removed, added };
+}
+
+/** Undo (inverse) or redo a diffList on list; returns a new array. */
+function patchList(list, diff, inverse) {
+    const drop = inverse ? diff.added : diff.removed;
+    const put  = inverse ? diff.removed : diff.added;
+    if (!drop.length && !put.length) return list;
+    const gone = new Set(drop.map(([, x]) => x));
+    const out = list.filter(x => !gone.has(x));
+    for (const [i, x] of put) out.splice(i, 0, x);
+    return out;
+}
+
+/**
+ * Follows one of the planner's road grids through CellGrid.changesSince,
+ * like RoadConnectivity does, with a private copy of its cells as of the
+ * last diff(). A replaced or cleared grid (load, import, optimizer) falls
+ * back to diffing the whole copy once.
+ */
+class GridTrack {
+    constructor(getGrid) {
+        this.getGrid = getGrid;
+        this.grid    = null;   // the grid last followed
+        this.version = 0;      // its version then
+        this.copy    = new CellGrid();
+    }
+
+    /** Cells cleared / set since the last call, as packed x, y pairs. */
+    diff() {
+        const grid = this.getGrid(), copy = this.copy;
+        const changes = grid === this.grid ? grid.changesSince(this.version) : null;
+        let removed, added;
+        if (changes) {
+            removed = [];
+            added   = [];
+            for (let i = 0; i < changes.length; i += 2) {
+                const x = changes[i], y = changes[i + 1];
+                const now = grid.get(x, y);
+                if (copy.get(x, y) === now) continue;   // net no-op, or a repeat already taken
+                (now ? added : removed).push(x, y);
+                copy.set(x, y, now);
+            }
+            removed = Int32Array.from(removed);
+            added   = Int32Array.from(added);
+        } else {
+            removed = copy.missingFrom(grid);
+            added   = grid.missingFrom(copy);
+            this.copy = grid.clone();
+        }
+        this.grid    = grid;
+        this.version = grid.version;
+        return { removed, added };
+    }
+}
+
+function patchGrid(grid, diff, inverse) {
+    const clear = inverse ? diff.added : diff.removed;
+    const set   = inverse ? diff.removed : diff.added;
+    for (let i = 0; i < clear.length; i += 2) grid.deleteCell(clear[i], clear[i + 1]);
+    for (let i = 0; i < set.length; i += 2)   grid.addCell(set[i], set[i + 1]);
+}
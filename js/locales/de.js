@@ -40,6 +40,12 @@ export const DE = {
     'sidebar.optimizeBtn':   '⚡ Layout optimieren',
     'sidebar.comingSoon':    'Demnächst',
     'sidebar.undoOptimize':  '↩️ Optimierung rückgängig',
+    'sidebar.optimizeTime':  'Zeitbudget',
+    'sidebar.optimizeTarget': 'Stopp bei platziert',
+    'sidebar.optimizeTargetTitle': 'Suche beenden, sobald dieser Anteil der Straßengebäude platziert ist',
+    'sidebar.targetNone':    '— (ganze Zeit)',
+    'sidebar.stopOptimize':  '⏹ Stopp & Bestes behalten',
+    'sidebar.continueOptimize': '▶ Weiter optimieren',
     'sidebar.initializing':  'Initialisierung...',
     'sidebar.prodOverview':  '📊 Produktionsübersicht',
     'sidebar.boostsDashboard': '⚡ Boost-Übersicht',
@@ -169,6 +175,7 @@ export const DE = {
     'prodModal.colCount':          'Anzahl',
     'prodModal.noBuildings':       'Keine Gebäude platziert',
     'prodModal.production':        'Produktion (pro Gebäude-Timer-Option)',
+    'prodModal.perDay':            'Pro Tag',
     'prodModal.passiveBoosts':     'Passive % Boni',
     'prodModal.itemDrops':         '🧩 Gegenstände',
 
@@ -40,6 +40,12 @@ export const EN = {
     'sidebar.optimizeBtn':   '⚡ Optimize Layout',
     'sidebar.comingSoon':    'Coming Soon',
     'sidebar.undoOptimize':  '↩️ Undo Optimization',
+    'sidebar.optimizeTime':  'Time budget',
+    'sidebar.optimizeTarget': 'Stop when placed',
+    'sidebar.optimizeTargetTitle': 'Stop searching once this share of road buildings is placed',
+    'sidebar.targetNone':    '— (use all time)',
+    'sidebar.stopOptimize':  '⏹ Stop & Keep Best',
+    'sidebar.continueOptimize': '▶ Continue Optimizing',
     'sidebar.initializing':  'Initializing...',
     'sidebar.prodOverview':  '📊 Production Overview',
     'sidebar.boostsDashboard': '⚡ Boosts Dashboard',
@@ -169,6 +175,7 @@ export const EN = {
     'prodModal.colCount':          'Count',
     'prodModal.noBuildings':       'No buildings placed',
     'prodModal.production':        'Production (per building timer option)',
+    'prodModal.perDay':            'Per day',
     'prodModal.passiveBoosts':     'Passive % Boosts',
     'prodModal.itemDrops':         '🧩 Item Drops',
 
@@ -40,6 +40,12 @@ export const ES = {
     'sidebar.optimizeBtn':   '⚡ Optimizar plan',
     'sidebar.comingSoon':    'Próximamente',
     'sidebar.undoOptimize':  '↩️ Deshacer optimización',
+    'sidebar.optimizeTime':  'Tiempo',
+    'sidebar.optimizeTarget': 'Parar al colocar',
+    'sidebar.optimizeTargetTitle': 'Dejar de buscar cuando esta parte de los edificios con carretera esté colocada',
+    'sidebar.targetNone':    '— (todo el tiempo)',
+    'sidebar.stopOptimize':  '⏹ Parar y conservar',
+    'sidebar.continueOptimize': '▶ Seguir optimizando',
     'sidebar.initializing':  'Inicializando...',
     'sidebar.prodOverview':  '📊 Vista de producción',
     'sidebar.boostsDashboard': '⚡ Panel de bonificaciones',
@@ -169,6 +175,7 @@ export const ES = {
     'prodModal.colCount':          'Cantidad',
     'prodModal.noBuildings':       'No hay edificios colocados',
     'prodModal.production':        'Producción (por opción de temporizador)',
+    'prodModal.perDay':            'Por día',
     'prodModal.passiveBoosts':     'Bonificaciones pasivas %',
     'prodModal.itemDrops':         '🧩 Objetos',
 
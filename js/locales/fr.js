@@ -40,6 +40,12 @@ export const FR = {
     'sidebar.optimizeBtn':   '⚡ Optimiser le plan',
     'sidebar.comingSoon':    'Bientôt disponible',
     'sidebar.undoOptimize':  '↩️ Annuler l\'optimisation',
+    'sidebar.optimizeTime':  'Durée',
+    'sidebar.optimizeTarget': 'Arrêter à',
+    'sidebar.optimizeTargetTitle': 'Arrêter la recherche dès que cette part des bâtiments à route est placée',
+    'sidebar.targetNone':    '— (tout le temps)',
+    'sidebar.stopOptimize':  '⏹ Arrêter et garder',
+    'sidebar.continueOptimize': '▶ Continuer l\'optimisation',
     'sidebar.initializing':  'Initialisation...',
     'sidebar.prodOverview':  '📊 Aperçu de la production',
     'sidebar.boostsDashboard': '⚡ Tableau des bonus',
@@ -169,6 +175,7 @@ export const FR = {
     'prodModal.colCount':          'Nombre',
     'prodModal.noBuildings':       'Aucun bâtiment placé',
     'prodModal.production':        'Production (par option de minuterie)',
+    'prodModal.perDay':            'Par jour',
     'prodModal.passiveBoosts':     'Bonus passifs %',
     'prodModal.itemDrops':         '🧩 Objets',
 
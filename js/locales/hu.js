@@ -40,6 +40,12 @@ export const HU = {
     'sidebar.optimizeBtn':   '⚡ Elrendezés optimalizálása',
     'sidebar.comingSoon':    'Hamarosan',
     'sidebar.undoOptimize':  '↩️ Optimalizálás visszavonása',
+    'sidebar.optimizeTime':  'Időkeret',
+    'sidebar.optimizeTarget': 'Leállás elhelyezéskor',
+    'sidebar.optimizeTargetTitle': 'A keresés leáll, ha az utat igénylő épületek ekkora része elhelyezve',
+    'sidebar.targetNone':    '— (teljes idő)',
+    'sidebar.stopOptimize':  '⏹ Leállítás, legjobb megtartása',
+    'sidebar.continueOptimize': '▶ Optimalizálás folytatása',
     'sidebar.initializing':  'Inicializálás...',
     'sidebar.prodOverview':  '📊 Termelési áttekintő',
     'sidebar.boostsDashboard': '⚡ Bónusz áttekintő',
@@ -169,6 +175,7 @@ export const HU = {
     'prodModal.colCount':          'Darab',
     'prodModal.noBuildings':       'Nincs lehelyezett épület',
     'prodModal.production':        'Termelés (épület időzítő opciónként)',
+    'prodModal.perDay':            'Naponta',
     'prodModal.passiveBoosts':     'Passzív % bónuszok',
     'prodModal.itemDrops':         '🧩 Töredékek',
 
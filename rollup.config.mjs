@@ -1,29 +1,56 @@
 import terser from '@rollup/plugin-terser';
 import obfuscator from 'rollup-plugin-obfuscator';
 
-export default {
-    input: 'js/main.js',
-    output: {
-        file: 'dist/bundle.js',
-        format: 'iife',
-        name: 'FoeCityPlanner',
+// data/manifest.js imports './<file>.js?v=<hash>' for HTTP caching; chunk file
+// names carry their own content hash, so resolve those specifiers to the plain file.
+const stripVersionQuery = {
+    name: 'strip-version-query',
+    resolveId(source, importer) {
+        const q = source.indexOf('?');
+        if (q === -1) return null;
+        return this.resolve(source.slice(0, q), importer, { skipSelf: true });
     },
-    plugins: [
-        terser(),
-        obfuscator({
-            // Only obfuscate the logic files, skip the large data databases
-            include: ['js/*.js'],
-            global: false,
-            options: {
-                compact: true,
-                controlFlowFlattening: false,
-                identifierNamesGenerator: 'hexadecimal',
-                stringArray: true,
-                stringArrayEncoding: ['base64'],
-                stringArrayThreshold: 0.75,
-                transformObjectKeys: true,
-                unicodeEscapeSequence: false,
-            },
-        }),
-    ],
 };
+
+const plugins = () => [
+    stripVersionQuery,
+    terser(),
+    obfuscator({
+        // Only obfuscate the logic files, skip the large data databases
+        include: ['js/*.js'],
+        global: false,
+        options: {
+            compact: true,
+            controlFlowFlattening: false,
+            identifierNamesGenerator: 'hexadecimal',
+            stringArray: true,
+            stringArrayEncoding: ['base64'],
+            stringArrayThreshold: 0.75,
+            transformObjectKeys: true,
+            unicodeEscapeSequence: false,
+        },
+    }),
+];
+
+export default [
+    {
+        input: 'js/main.js',
+        output: {
+            // ES chunks so the lazily imported data (building payload shards,
+            // per-locale name tables) stays out of main.js and is only fetched
+            // when the app asks for it.
+            dir: 'dist',
+            format: 'es',
+            entryFileNames: '[name].js',
+            chunkFileNames: 'chunks/[name]-[hash].js',
+        },
+        plugins: plugins(),
+    },
+    {
+        // Optimizer starts it as new Worker(new URL('./OptimizerWorker.js', import.meta.url),
+        // { type: 'module' }), which resolves next to main.js
+        input: 'js/OptimizerWorker.js',
+        output: { file: 'dist/OptimizerWorker.js', format: 'es' },
+        plugins: plugins(),
+    },
+];
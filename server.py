@@ -1,15 +1,428 @@
+"""
+Local static server for the FoE City Planner.
+
+Usage:
+    python server.py                      # thread pool, HTTP/1.1 keep-alive
+    python server.py --threads 32         # bigger pool for a shared host
+    python server.py --legacy             # old single-threaded TCPServer (for comparison)
+    python server.py --port 9000 --directory dist
+
+Requests are handled by a fixed-size thread pool, so one slow client pulling
+data/foe_buildings_database.js no longer blocks everyone else. Connections are
+kept alive (HTTP/1.1), but a worker only holds one for the length of a
+request: between requests the socket waits in a selector, which hands it back
+to the pool when the next request arrives and closes it after --keepalive
+idle seconds. A browser's six idle connections therefore cost no workers.
+Ctrl+C / SIGTERM stop accepting new connections and let in-flight requests
+finish before exiting.
+
+Files with precompressed siblings (foo.js.br / foo.js.gz, written by
+tools/build_database.py) are served in the best encoding the client accepts,
+with Content-Encoding and Vary: Accept-Encoding set. Nothing is compressed
+per request; a sibling older than its source is ignored.
+
+Every file gets a strong ETag (content hash) and Last-Modified, and
+conditional requests are answered with 304. Plain URLs are sent with
+Cache-Control: no-cache (always revalidate); '?v=<hash>' URLs from
+data/manifest.js whose hash matches the file are sent as immutable.
+
+Scripts, including the optimizer's module Web Worker, are always sent as
+application/javascript, whatever the platform's MIME table says.
+"""
+
+import argparse
+import datetime
+import email.utils
+import hashlib
 import http.server
-import socketserver
 import mimetypes
+import os
+import selectors
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import parse_qs, urlsplit
 
 PORT = 8080
+DEFAULT_THREADS = 16
+DEFAULT_KEEPALIVE = 15  # seconds an idle keep-alive connection is kept open
+IDLE_SWEEP = 0.5        # how often idle connections are checked for expiry
 
+# Browsers refuse module scripts and module workers (js/OptimizerWorker.js)
+# served with a non-JavaScript type, and the platform table can be wrong
+# (the Windows registry often maps .js to text/plain), so pin these.
 mimetypes.add_type('application/javascript', '.js')
+mimetypes.add_type('application/javascript', '.mjs')
 mimetypes.add_type('text/css', '.css')
 mimetypes.add_type('text/html', '.html')
 
-Handler = http.server.SimpleHTTPRequestHandler
+# Precompressed sibling suffixes in order of preference.
+PRECOMPRESSED = (('br', '.br'), ('gzip', '.gz'))
+
+# Sent for '?v=<content hash>' URLs whose hash matches the file on disk.
+IMMUTABLE = 'public, max-age=31536000, immutable'
+
+_hash_cache = {}
+_hash_lock = threading.Lock()
+
+
+def file_content_hash(path):
+    """
+    Short sha256 of a file's bytes, cached by (mtime, size).
+    Must match content_hash() in tools/build_database.py, which writes the
+    ?v= values into data/manifest.js.
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    with _hash_lock:
+        cached = _hash_cache.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    digest = h.hexdigest()[:12]
+    with _hash_lock:
+        _hash_cache[path] = (key, digest)
+    return digest
+
+
+def accepted_encodings(header):
+    """Parse an Accept-Encoding header into the set of acceptable codings."""
+    accepted = set()
+    for part in (header or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            accepted.add(coding)
+    if '*' in accepted:
+        accepted.update(enc for enc, _ in PRECOMPRESSED)
+    return accepted
+
+
+class PlannerRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """SimpleHTTPRequestHandler speaking HTTP/1.1 so connections are reused."""
+
+    protocol_version = 'HTTP/1.1'
+    timeout = DEFAULT_KEEPALIVE
+
+    def handle(self):
+        # One request per pool task: a kept-alive connection goes back to the
+        # server's idle selector between requests instead of holding a worker.
+        self.handle_one_request()
+
+    def finish(self):
+        if self.close_connection:
+            super().finish()
+        else:
+            self.wfile.flush()   # rfile/wfile stay open for the next request
+
+    def pending_input(self):
+        """True if the client already sent (part of) another request."""
+        sock = self.connection
+        sock.setblocking(False)
+        try:
+            return bool(self.rfile.peek(1))
+        except OSError:
+            return True   # let the next handle() see the error and close
+        finally:
+            sock.settimeout(self.timeout)
+
+    def send_head(self):
+        self._extra_headers = []
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            return super().send_head()
+
+        encoding, sibling = None, None
+        siblings = self._precompressed_siblings(path)
+        if siblings:
+            self._extra_headers.append(('Vary', 'Accept-Encoding'))
+            accepted = accepted_encodings(self.headers.get('Accept-Encoding'))
+            encoding, sibling = next(((e, s) for e, s in siblings if e in accepted), (None, None))
+
+        # Strong validator per representation: the encoded variants get their own tag.
+        digest = file_content_hash(path)
+        etag = f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+        version = parse_qs(urlsplit(self.path).query).get('v', [None])[0]
+        self._extra_headers.append(('ETag', etag))
+        self._extra_headers.append(('Cache-Control', IMMUTABLE if version == digest else 'no-cache'))
+
+        if self._not_modified(etag, os.stat(path).st_mtime):
+            self.send_response(304)
+            self.end_headers()
+            return None
+        if encoding:
+            return self._send_precompressed(path, sibling, encoding)
+        return super().send_head()
+
+    def _not_modified(self, etag, mtime):
+        """RFC 9110 conditional GET: If-None-Match wins over If-Modified-Since."""
+        inm = self.headers.get('If-None-Match')
+        if inm is not None:
+            tags = [t.strip() for t in inm.split(',')]
+            return '*' in tags or any(t.removeprefix('W/') == etag for t in tags)
+        ims = self.headers.get('If-Modified-Since')
+        if ims:
+            try:
+                since = email.utils.parsedate_to_datetime(ims)
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=datetime.timezone.utc)
+            return int(mtime) <= since.timestamp()
+        return False
+
+    @staticmethod
+    def _precompressed_siblings(path):
+        """[(encoding, sibling_path)] for up-to-date siblings of path."""
+        try:
+            src_mtime = os.stat(path).st_mtime
+        except OSError:
+            return []
+        found = []
+        for encoding, suffix in PRECOMPRESSED:
+            try:
+                if os.stat(path + suffix).st_mtime >= src_mtime:
+                    found.append((encoding, path + suffix))
+            except OSError:
+                pass
+        return found
+
+    def _send_precompressed(self, path, sibling, encoding):
+        try:
+            f = open(sibling, 'rb')
+        except OSError:
+            return super().send_head()
+        try:
+            fs = os.fstat(f.fileno())
+            self.send_response(200)
+            self.send_header('Content-Type', self.guess_type(path))
+            self.send_header('Content-Encoding', encoding)
+            self.send_header('Content-Length', str(fs.st_size))
+            self.send_header('Last-Modified', self.date_time_string(os.stat(path).st_mtime))
+            self.end_headers()
+            return f
+        except Exception:
+            f.close()
+            raise
+
+    def end_headers(self):
+        for key, value in getattr(self, '_extra_headers', ()):
+            self.send_header(key, value)
+        self._extra_headers = []
+        super().end_headers()
+
+    def copyfile(self, source, outputfile):
+        # socket.sendfile() uses os.sendfile() where available: the kernel copies
+        # the file straight to the socket without holding the GIL, which is what
+        # lets several workers stream the 3.6 MB database at once.
+        # socket.sendfile() falls back to a plain send() loop on its own.
+        self.wfile.flush()
+        self.connection.sendfile(source)
+
+    def log_message(self, format, *args):
+        # Default logging goes through stderr on every request; keep it, but
+        # make it cheap to silence with --quiet.
+        if not getattr(self.server, 'quiet', False):
+            super().log_message(format, *args)
+
+
+class LegacyRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """The original HTTP/1.0 handler (one request per connection)."""
+
+    log_message = PlannerRequestHandler.log_message
+
+
+class ThreadPoolMixIn:
+    """Dispatch each request to a bounded ThreadPoolExecutor.
+
+    socketserver.ThreadingMixIn starts an unbounded thread per connection;
+    a fixed pool keeps memory predictable on a small shared host. Workers
+    serve one request at a time: a connection kept alive afterwards is
+    parked in a selector (watched by one thread) and re-submitted when the
+    client sends its next request, so idle sockets never tie up the pool.
+    """
+
+    pool_size = DEFAULT_THREADS
+    keepalive = DEFAULT_KEEPALIVE
+
+    def process_request(self, request, client_address):
+        self._pool.submit(self._serve, None, request, client_address)
+
+    def finish_request(self, request, client_address):
+        return self.RequestHandlerClass(request, client_address, self)
+
+    def _serve(self, handler, request, client_address):
+        """Serve one request: a new connection's first (handler None) or a parked one's next."""
+        close = True
+        try:
+            if handler is None:
+                handler = self.finish_request(request, client_address)
+            else:
+                try:
+                    handler.handle()
+                finally:
+                    handler.finish()
+            close = handler.close_connection
+        except Exception:
+            self.handle_error(request, client_address)
+        if close:
+            self.shutdown_request(request)
+        elif handler.pending_input():
+            self._pool.submit(self._serve, handler, request, client_address)
+        else:
+            self._park(handler)
+
+    def _park(self, handler):
+        with self._idle_lock:
+            if self._closing:
+                self.shutdown_request(handler.request)
+                return
+            self._parking.append(handler)
+        self._wake_w.send(b'\0')
+
+    def _watch_idle(self):
+        """Hand parked connections back to the pool when readable; close expired ones."""
+        sel = self._idle
+        while True:
+            for key, _ in sel.select(timeout=IDLE_SWEEP):
+                if key.fileobj is self._wake_r:
+                    self._wake_r.recv(4096)
+                    continue
+                sel.unregister(key.fileobj)
+                handler = key.data[0]
+                self._pool.submit(self._serve, handler, handler.request, handler.client_address)
+            now = time.monotonic()
+            with self._idle_lock:
+                parking, self._parking = self._parking, []
+                closing = self._closing
+            for handler in parking:
+                sel.register(handler.request, selectors.EVENT_READ, (handler, now + self.keepalive))
+            for key in list(sel.get_map().values()):
+                if key.data and (closing or key.data[1] <= now):
+                    sel.unregister(key.fileobj)
+                    self.shutdown_request(key.fileobj)
+            if closing:
+                sel.close()
+                return
+
+    def server_activate(self):
+        self._pool = ThreadPoolExecutor(max_workers=self.pool_size,
+                                        thread_name_prefix='planner-http')
+        self._idle = selectors.DefaultSelector()
+        self._idle_lock = threading.Lock()
+        self._parking = []
+        self._closing = False
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._idle.register(self._wake_r, selectors.EVENT_READ)
+        self._watcher = threading.Thread(target=self._watch_idle, name='planner-idle', daemon=True)
+        self._watcher.start()
+        super().server_activate()
+
+    def server_close(self):
+        super().server_close()
+        # Wait for in-flight requests, then close the idle keep-alive sockets.
+        self._pool.shutdown(wait=True)
+        with self._idle_lock:
+            self._closing = True
+        self._wake_w.send(b'\0')
+        self._watcher.join()
+        self._wake_r.close()
+        self._wake_w.close()
+
+
+class PooledHTTPServer(ThreadPoolMixIn, http.server.HTTPServer):
+    allow_reuse_address = True
+
+    def handle_error(self, request, client_address):
+        # Browsers routinely drop keep-alive sockets mid-response; not worth a traceback.
+        if isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            return
+        super().handle_error(request, client_address)
+
+
+class LegacyHTTPServer(socketserver.TCPServer):
+    """The original single-threaded server, kept for load-test comparisons."""
+    allow_reuse_address = True
+
+
+def make_server(port=PORT, threads=DEFAULT_THREADS, keepalive=DEFAULT_KEEPALIVE,
+                directory=None, legacy=False, quiet=False, bind=''):
+    """Build (but do not start) a server instance."""
+    directory = directory or os.getcwd()
+    if legacy:
+        handler = partial(LegacyRequestHandler, directory=directory)
+        httpd = LegacyHTTPServer((bind, port), handler)
+    else:
+        handler_cls = type('Handler', (PlannerRequestHandler,), {'timeout': keepalive})
+        handler = partial(handler_cls, directory=directory)
+        server_cls = type('Server', (PooledHTTPServer,), {'pool_size': threads, 'keepalive': keepalive})
+        httpd = server_cls((bind, port), handler)
+    httpd.quiet = quiet
+    return httpd
+
+
+def serve(httpd):
+    """Run httpd until SIGINT/SIGTERM, then shut down gracefully."""
+    stop = threading.Event()
+
+    def request_stop(signum, frame):
+        if stop.is_set():
+            return
+        stop.set()
+        # shutdown() blocks until serve_forever() returns, so call it off-thread.
+        threading.Thread(target=httpd.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGINT, request_stop)
+    if hasattr(signal, 'SIGTERM'):
+        signal.signal(signal.SIGTERM, request_stop)
+
+    try:
+        httpd.serve_forever()
+    finally:
+        print('Shutting down, waiting for in-flight requests...')
+        httpd.server_close()
+        print('Stopped.')
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Serve the FoE City Planner locally.')
+    ap.add_argument('--port', type=int, default=PORT)
+    ap.add_argument('--bind', default='', help='address to bind (default: all interfaces)')
+    ap.add_argument('--directory', default=None, help='directory to serve (default: cwd)')
+    ap.add_argument('--threads', type=int, default=DEFAULT_THREADS,
+                    help=f'worker thread pool size (default: {DEFAULT_THREADS})')
+    ap.add_argument('--keepalive', type=float, default=DEFAULT_KEEPALIVE,
+                    help=f'seconds an idle keep-alive connection is kept open (default: {DEFAULT_KEEPALIVE})')
+    ap.add_argument('--legacy', action='store_true',
+                    help='use the old single-threaded TCPServer')
+    ap.add_argument('--quiet', action='store_true', help='do not log each request')
+    args = ap.parse_args(argv)
+
+    httpd = make_server(port=args.port, threads=args.threads, keepalive=args.keepalive,
+                        directory=args.directory, legacy=args.legacy, quiet=args.quiet,
+                        bind=args.bind)
+    mode = 'single-threaded (legacy)' if args.legacy else f'{args.threads} threads, keep-alive'
+    print(f"Serving FoE City Planner at http://localhost:{args.port} ({mode})")
+    serve(httpd)
+
 
-with socketserver.TCPServer(("", PORT), Handler) as httpd:
-    print(f"Serving FoE City Planner at http://localhost:{PORT}")
-    httpd.serve_forever()
+if __name__ == '__main__':
+    main()
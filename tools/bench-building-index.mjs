@@ -0,0 +1,111 @@
+#!/usr/bin/env node
+/**
+ * Stress benchmark for BuildingIndex: hit-testing and drag-time overlap checks
+ * against the linear buildings.find / buildings.some scans they replaced, on
+ * cities packed with thousands of 1×1 decorations around a core of regular
+ * buildings. Both must agree on every query.
+ *
+ *     node tools/bench-building-index.mjs [decorations...] [--queries N]
+ *     node tools/bench-building-index.mjs 1000 5000 20000 --queries 50000
+ */
+
+import { BuildingIndex } from '../js/BuildingIndex.js';
+
+const args = process.argv.slice(2);
+const queriesAt = args.indexOf('--queries');
+const QUERIES = queriesAt >= 0 ? parseInt(args.splice(queriesAt, 2)[1], 10) : 20000;
+const COUNTS  = args.length ? args.map(Number) : [1000, 4000, 10000];
+const CORE    = 300;   // regular 2×2 .. 6×6 buildings next to the decorations
+
+function mulberry32(seed) {
+    return () => {
+        seed |= 0; seed = seed + 0x6D2B79F5 | 0;
+        let t = Math.imul(seed ^ seed >>> 15, 1 | seed);
+        t = t + Math.imul(t ^ t >>> 7, 61 | t) ^ t;
+        return ((t ^ t >>> 14) >>> 0) / 4294967296;
+    };
+}
+
+/** A square city just large enough for CORE buildings plus `decorations` 1×1s. */
+function makeCity(decorations, rand) {
+    const side = Math.ceil(Math.sqrt((CORE * 16 + decorations) * 1.6));
+    const taken = new Set();
+    const buildings = [];
+    const place = (w, h) => {
+        for (let tries = 0; tries < 200; tries++) {
+            const x = Math.floor(rand() * (side - w)), y = Math.floor(rand() * (side - h));
+            let free = true;
+            for (let dy = 0; dy < h && free; dy++)
+                for (let dx = 0; dx < w && free; dx++) if (taken.has(`${x + dx},${y + dy}`)) free = false;
+            if (!free) continue;
+            for (let dy = 0; dy < h; dy++) for (let dx = 0; dx < w; dx++) taken.add(`${x + dx},${y + dy}`);
+            buildings.push({ id: `B${buildings.length}`, x, y, width: w, height: h });
+            return;
+        }
+    };
+    for (let i = 0; i < CORE; i++) place(2 + Math.floor(rand() * 5), 2 + Math.floor(rand() * 5));
+    for (let i = 0; i < decorations; i++) place(1, 1);
+    return { side, buildings };
+}
+
+// The scans CityPlanner and EventHandler used before the index
+const scanAt = (buildings, x, y) => buildings.find(b =>
+    x >= b.x && x < b.x + b.width && y >= b.y && y < b.y + b.height) || null;
+const scanOverlaps = (buildings, x, y, w, h, exclude) => {
+    for (const b of buildings) {
+        if (b === exclude) continue;
+        if (!(x + w <= b.x || x >= b.x + b.width || y + h <= b.y || y >= b.y + b.height)) return true;
+    }
+    return false;
+};
+
+function time(fn) {
+    const t = performance.now();
+    const out = fn();
+    return [performance.now() - t, out];
+}
+
+let mismatches = 0;
+console.log(`${'decorations'.padEnd(12)}${'buildings'.padStart(10)}${'build'.padStart(9)}` +
+            `${'hit scan'.padStart(11)}${'hit index'.padStart(11)}${'speedup'.padStart(9)}` +
+            `${'drag scan'.padStart(11)}${'drag index'.padStart(12)}${'speedup'.padStart(9)}   (${QUERIES} queries)`);
+for (const count of COUNTS) {
+    const rand = mulberry32(count);
+    const { side, buildings } = makeCity(count, rand);
+    const planner = { buildings };
+    const index = new BuildingIndex(planner);
+    const [buildMs] = time(() => index.rebuild());
+
+    // Hit-testing: the building under the cursor on every mousemove
+    const cells = Array.from({ length: QUERIES }, () => [Math.floor(rand() * side), Math.floor(rand() * side)]);
+    const [hitScanMs, hitScan] = time(() => cells.map(([x, y]) => scanAt(buildings, x, y)));
+    const [hitIdxMs, hitIdx] = time(() => cells.map(([x, y]) => index.at(x, y)));
+    for (let i = 0; i < QUERIES; i++) if (hitScan[i] !== hitIdx[i]) mismatches++;
+
+    // Dragging: overlap check for a held building at every cell it passes over
+    const held = buildings[Math.floor(rand() * CORE)];
+    const [dragScanMs, dragScan] = time(() => cells.map(([x, y]) => scanOverlaps(buildings, x, y, held.width, held.height, held)));
+    const [dragIdxMs, dragIdx] = time(() => cells.map(([x, y]) => index.overlapping(x, y, held.width, held.height, held) !== null));
+    for (let i = 0; i < QUERIES; i++) if (dragScan[i] !== dragIdx[i]) mismatches++;
+
+    // Drops keep the index current without a rebuild
+    const rebuilds = index.rebuilds;
+    for (let i = 0; i < 1000; i++) {
+        const [x, y] = cells[i];
+        if (!index.overlapping(x, y, held.width, held.height, held)) index.move(held, x, y);
+    }
+    for (let i = 0; i < 2000; i++) {
+        const [x, y] = cells[i];
+        if (scanAt(buildings, x, y) !== index.at(x, y)) mismatches++;
+    }
+    if (index.rebuilds !== rebuilds) mismatches++;
+
+    console.log(`${String(count).padEnd(12)}${String(buildings.length).padStart(10)}${`${buildMs.toFixed(1)} ms`.padStart(9)}` +
+                `${`${hitScanMs.toFixed(1)} ms`.padStart(11)}${`${hitIdxMs.toFixed(1)} ms`.padStart(11)}${`x${(hitScanMs / hitIdxMs).toFixed(0)}`.padStart(9)}` +
+                `${`${dragScanMs.toFixed(1)} ms`.padStart(11)}${`${dragIdxMs.toFixed(1)} ms`.padStart(12)}${`x${(dragScanMs / dragIdxMs).toFixed(0)}`.padStart(9)}`);
+}
+if (mismatches) {
+    console.error(`${mismatches} queries disagree with the linear scan`);
+    process.exit(1);
+}
+console.log('Index and scans agree.');
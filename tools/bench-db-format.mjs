@@ -0,0 +1,64 @@
+#!/usr/bin/env node
+/**
+ * Compares loading the building database as JS modules (index + every
+ * payload shard) with decoding the binary export, and checks that both give
+ * the same buildings. Run by `python tools/build_database.py --binary`, or:
+ *
+ *     node tools/bench-db-format.mjs [data/foe_buildings_database.bin] [runs]
+ */
+
+import { readFileSync } from 'fs';
+import { isDeepStrictEqual } from 'util';
+import { pathToFileURL } from 'url';
+import { join, dirname } from 'path';
+import { decodeBinaryDatabase } from '../js/BinaryDatabase.js';
+
+const ROOT    = join(dirname(new URL(import.meta.url).pathname), '..');
+const binPath = process.argv[2] || join(ROOT, 'data/foe_buildings_database.bin');
+const runs    = parseInt(process.argv[3] || '5', 10);
+const index   = pathToFileURL(join(ROOT, 'data/foe_buildings_database.js')).href;
+
+/** Import the index and all shards as fresh modules; return merged buildings. */
+async function loadJs(run) {
+    const { BUILDINGS, BUILDING_SHARDS } = await import(`${index}?bench=${run}`);
+    const merged = {};
+    for (const [id, b] of Object.entries(BUILDINGS)) {
+        const { shard, ...rest } = b;
+        merged[id] = rest;
+    }
+    // Shard loaders carry their own ?v= query, so re-import them by file URL
+    for (const loader of Object.values(BUILDING_SHARDS)) {
+        const spec = loader.toString().match(/import\('([^'?]+)/)[1];
+        const { PAYLOAD } = await import(`${new URL(spec, index).href}?bench=${run}`);
+        for (const [id, payload] of Object.entries(PAYLOAD)) Object.assign(merged[id], payload);
+    }
+    return merged;
+}
+
+function loadBinary() {
+    const bytes = readFileSync(binPath);
+    return decodeBinaryDatabase(bytes.buffer.slice(bytes.byteOffset, bytes.byteOffset + bytes.byteLength));
+}
+
+const median = (xs) => [...xs].sort((a, b) => a - b)[Math.floor(xs.length / 2)];
+
+const jsTimes = [], binTimes = [];
+let fromJs, fromBin;
+for (let run = 0; run < runs; run++) {
+    let t = performance.now();
+    fromJs = await loadJs(run);
+    jsTimes.push(performance.now() - t);
+
+    t = performance.now();
+    fromBin = loadBinary();
+    binTimes.push(performance.now() - t);
+}
+
+const js = median(jsTimes), bin = median(binTimes);
+console.log(`  Load+parse (median of ${runs}): JS modules ${js.toFixed(1)} ms, ` +
+            `binary ${bin.toFixed(1)} ms  (x${(js / bin).toFixed(1)} faster)`);
+if (!isDeepStrictEqual(fromJs, fromBin)) {
+    console.error('  MISMATCH: binary decode differs from the JS modules');
+    process.exit(1);
+}
+console.log(`  Round-trip OK: ${Object.keys(fromBin).length} buildings identical`);
@@ -0,0 +1,158 @@
+#!/usr/bin/env node
+/**
+ * Micro-benchmark for the optimizer's placement search: the GridIndex
+ * (summed-area table) version of _findBestRoadAdjacentPos against the
+ * per-cell footprint/perimeter scan it replaced, on large unlocked maps with
+ * a snake of roads and a partly built-up grid. Both must pick the same
+ * position for every building size.
+ *
+ *     node tools/bench-optimizer-index.mjs [sizes...] [--runs N]
+ *     node tools/bench-optimizer-index.mjs 64 128 200 --runs 5
+ */
+
+import { OptimizerSearch, FREE, BUILDING, ROAD, TOWNHALL } from '../js/OptimizerSearch.js';
+
+const args  = process.argv.slice(2);
+const runsAt = args.indexOf('--runs');
+const runs  = runsAt >= 0 ? parseInt(args.splice(runsAt, 2)[1], 10) : 3;
+const sizes = args.length ? args.map(Number) : [64, 96, 128];
+const FOOTPRINTS = [[1, 1], [2, 2], [2, 3], [4, 3], [5, 5], [7, 7]];
+
+/** The scan _findBestRoadAdjacentPos did before GridIndex (kept as the reference). */
+function scanBestPos(grid, W, H, b, centerLX, centerLY, connectedRoads, strictShortSide = false) {
+    const bw = b.width, bh = b.height;
+    let bestPos = null, bestScore = Infinity;
+    for (let ly = 0; ly <= H - bh; ly++) {
+        for (let lx = 0; lx <= W - bw; lx++) {
+            let free = true;
+            for (let dy = 0; dy < bh && free; dy++)
+                for (let dx = 0; dx < bw; dx++)
+                    if (grid[(ly + dy) * W + lx + dx] !== FREE) { free = false; break; }
+            if (!free) continue;
+
+            let touchesRoad = false;
+            for (let dx = 0; dx < bw && !touchesRoad; dx++) {
+                if (ly > 0 && connectedRoads.has((ly - 1) * W + lx + dx)) touchesRoad = true;
+                if (ly + bh < H && connectedRoads.has((ly + bh) * W + lx + dx)) touchesRoad = true;
+            }
+            for (let dy = 0; dy < bh && !touchesRoad; dy++) {
+                if (lx > 0 && connectedRoads.has((ly + dy) * W + lx - 1)) touchesRoad = true;
+                if (lx + bw < W && connectedRoads.has((ly + dy) * W + lx + bw)) touchesRoad = true;
+            }
+            if (!touchesRoad) continue;
+
+            let roadTouchCount = 0, packCount = 0;
+            let trRoad = false, brRoad = false, lrRoad = false, rrRoad = false;
+            for (let dx = 0; dx < bw; dx++) {
+                const t = ly > 0 ? grid[(ly - 1) * W + lx + dx] : -1;
+                const u = ly + bh < H ? grid[(ly + bh) * W + lx + dx] : -1;
+                if (t === ROAD) { roadTouchCount++; trRoad = true; }
+                if (u === ROAD) { roadTouchCount++; brRoad = true; }
+                if (t === BUILDING) packCount++;
+                if (u === BUILDING) packCount++;
+            }
+            for (let dy = 0; dy < bh; dy++) {
+                const l = lx > 0 ? grid[(ly + dy) * W + lx - 1] : -1;
+                const r = lx + bw < W ? grid[(ly + dy) * W + lx + bw] : -1;
+                if (l === ROAD) { roadTouchCount++; lrRoad = true; }
+                if (r === ROAD) { roadTouchCount++; rrRoad = true; }
+                if (l === BUILDING) packCount++;
+                if (r === BUILDING) packCount++;
+            }
+            const isLgRF = Math.min(bw, bh) > 5;
+            if (isLgRF && roadTouchCount > 2) continue;
+            if (!isLgRF && roadTouchCount > Math.max(bw, bh) + 2) continue;
+
+            const distToCenter = Math.abs(lx + bw / 2 - centerLX) + Math.abs(ly + bh / 2 - centerLY);
+            const touchesH = trRoad || brRoad, touchesV = lrRoad || rrRoad;
+            if (strictShortSide && bw !== bh && !(bw < bh ? touchesH : touchesV)) continue;
+            const isIC = touchesH && touchesV;
+            const minS = Math.min(bw, bh);
+            let posScore = 0;
+            if (minS > 5 && !isIC) posScore = -500;
+            if (minS > 5 && isIC)  posScore = 3000;
+            if (minS >= 3 && minS <= 5 && bw !== bh && (touchesH !== touchesV)) {
+                if (bw < bh ? touchesH : touchesV) posScore -= 5000;
+            }
+            const score = distToCenter * 10 - packCount * 30 + posScore;
+            if (score < bestScore) { bestScore = score; bestPos = [lx, ly]; }
+        }
+    }
+    return bestPos;
+}
+
+/** Deterministic PRNG so every run benchmarks the same grids. */
+function mulberry32(seed) {
+    return () => {
+        seed |= 0; seed = seed + 0x6D2B79F5 | 0;
+        let t = Math.imul(seed ^ seed >>> 15, 1 | seed);
+        t = t + Math.imul(t ^ t >>> 7, 61 | t) ^ t;
+        return ((t ^ t >>> 14) >>> 0) / 4294967296;
+    };
+}
+
+/**
+ * An N×N unlocked grid: TH in a corner and a horizontal snake road over the
+ * top-left quarter (the optimizer's road budget covers the building pool,
+ * not the whole unlocked area), with part of the road frontage built up.
+ */
+function makeGrid(search, N, seed) {
+    const rand = mulberry32(seed);
+    const grid = new Uint8Array(N * N);
+    const span = Math.floor(N / 2);
+    for (let y = 0; y < 6; y++) for (let x = 0; x < 6; x++) grid[y * N + x] = TOWNHALL;
+    let right = true;
+    for (let y = 6; y < span; y += 7) {
+        for (let x = 2; x < span; x++) grid[y * N + x] = ROAD;
+        const cx = right ? span - 1 : 2;
+        for (let dy = 1; dy < 7 && y + dy < span; dy++) grid[(y + dy) * N + cx] = ROAD;
+        right = !right;
+    }
+    for (let y = 0; y < 6; y++) grid[y * N + 6] = ROAD; // TH -> snake
+    const conn = search._findConnectedRoads(grid, N, N, 0, 0, 6, 6);
+    for (let i = 0; i < span * span / 6; i++) {
+        const [w, h] = FOOTPRINTS[Math.floor(rand() * 4)];
+        const lx = Math.floor(rand() * (span - w)), ly = Math.floor(rand() * (span - h));
+        if (search._isAreaFreeFG(grid, N, N, lx, ly, w, h) && search._touchesConnectedRoad(grid, N, N, lx, ly, w, h, conn)) {
+            for (let dy = 0; dy < h; dy++) for (let dx = 0; dx < w; dx++) grid[(ly + dy) * N + lx + dx] = BUILDING;
+        }
+    }
+    return { grid, conn };
+}
+
+function time(fn) {
+    const best = [];
+    let out;
+    for (let r = 0; r < runs; r++) {
+        const t = performance.now();
+        out = fn();
+        best.push(performance.now() - t);
+    }
+    return [Math.min(...best), out];
+}
+
+const search = new OptimizerSearch();
+let mismatches = 0;
+{   // let the JIT settle so the first map size is not penalised
+    const { grid, conn } = makeGrid(search, 48, 1);
+    for (let i = 0; i < 20; i++) {
+        scanBestPos(grid, 48, 48, { width: 3, height: 4 }, 3, 3, conn);
+        search._findBestRoadAdjacentPos(grid, 48, 48, { width: 3, height: 4 }, 3, 3, conn);
+    }
+}
+console.log(`${'map'.padEnd(9)}${'scan'.padStart(11)}${'GridIndex'.padStart(11)}${'speedup'.padStart(9)}  (best of ${runs}, all ${FOOTPRINTS.length} footprints, normal + strict pass)`);
+for (const N of sizes) {
+    const { grid, conn } = makeGrid(search, N, N);
+    const queries = FOOTPRINTS.flatMap(([w, h]) => [[{ width: w, height: h }, false], [{ width: w, height: h }, true]]);
+    const [scanMs, scanOut] = time(() => queries.map(([b, strict]) => scanBestPos(grid, N, N, b, 3, 3, conn, strict)));
+    const [idxMs, idxOut] = time(() => queries.map(([b, strict]) => search._findBestRoadAdjacentPos(grid, N, N, b, 3, 3, conn, strict)));
+    for (let i = 0; i < queries.length; i++) {
+        if (String(scanOut[i]) !== String(idxOut[i])) {
+            mismatches++;
+            console.error(`  MISMATCH ${N}x${N} ${queries[i][0].width}x${queries[i][0].height}: scan ${scanOut[i]} vs index ${idxOut[i]}`);
+        }
+    }
+    console.log(`${`${N}x${N}`.padEnd(9)}${`${scanMs.toFixed(1)} ms`.padStart(11)}${`${idxMs.toFixed(1)} ms`.padStart(11)}${`x${(scanMs / idxMs).toFixed(1)}`.padStart(9)}`);
+}
+if (mismatches) process.exit(1);
+console.log('Positions identical.');
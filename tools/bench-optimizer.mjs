@@ -0,0 +1,213 @@
+#!/usr/bin/env node
+/**
+ * Headless optimizer benchmark: runs Optimizer._core on every fixture written
+ * by tools/gen_optimizer_fixtures.py and prints wall time, buildings placed,
+ * road tiles and a score per fixture. Save a run with --out and pass it to
+ * --compare on another commit to get a side-by-side table.
+ *
+ *     node tools/bench-optimizer.mjs [fixtures...] [--runs N] [--out FILE] [--compare FILE]
+ *     node tools/bench-optimizer.mjs --out /tmp/before.json          # on the old commit
+ *     node tools/bench-optimizer.mjs --compare /tmp/before.json      # on the new one
+ *
+ * score = building tiles placed − road tiles: placing more and paving less
+ * both raise it. Layouts are checked too (overlaps, tiles outside the
+ * unlocked area, road buildings not reachable from the Town Hall) and any
+ * problem makes the script exit 1.
+ *
+ * Math.random is seeded per fixture so the medium-building retry shuffles the
+ * same way every run. Node has no Web Worker, so this measures the
+ * main-thread search.
+ */
+
+import { readFileSync, writeFileSync, readdirSync, statSync } from 'fs';
+import { join, dirname, basename } from 'path';
+import { execSync } from 'child_process';
+
+const ROOT = join(dirname(new URL(import.meta.url).pathname), '..');
+
+// The optimizer's modules expect a browser page (i18n reads localStorage on import)
+const store = {};
+globalThis.localStorage ??= { getItem: k => store[k] ?? null, setItem: (k, v) => { store[k] = String(v); }, removeItem: k => { delete store[k]; } };
+globalThis.navigator ??= { language: 'en' };
+globalThis.document ??= {
+    getElementById: () => ({ style: {}, classList: { add() {}, remove() {} }, textContent: '', value: '' }),
+    querySelectorAll: () => [],
+};
+const { Optimizer } = await import('../js/Optimizer.js');
+const { CellGrid } = await import('../js/CellGrid.js');
+
+const args = process.argv.slice(2);
+const option = (name, fallback) => {
+    const at = args.indexOf(name);
+    return at >= 0 ? args.splice(at, 2)[1] : fallback;
+};
+const runs    = parseInt(option('--runs', '1'), 10);
+const outPath = option('--out', null);
+const basePath = option('--compare', null);
+const fixtureDir = join(ROOT, 'tools/fixtures/optimizer');
+const paths = (args.length ? args : [fixtureDir]).flatMap(p =>
+    statSync(p).isDirectory()
+        ? readdirSync(p).filter(f => f.endsWith('.json')).sort().map(f => join(p, f))
+        : [p]);
+
+/** Deterministic PRNG for Math.random during a run. */
+function mulberry32(seed) {
+    return () => {
+        seed |= 0; seed = seed + 0x6D2B79F5 | 0;
+        let t = Math.imul(seed ^ seed >>> 15, 1 | seed);
+        t = t + Math.imul(t ^ t >>> 7, 61 | t) ^ t;
+        return ((t ^ t >>> 14) >>> 0) / 4294967296;
+    };
+}
+
+function seedOf(text) {
+    let h = 2166136261;
+    for (const ch of text) h = Math.imul(h ^ ch.charCodeAt(0), 16777619);
+    return h >>> 0;
+}
+
+/** The slice of CityPlanner that Optimizer uses, set up from a fixture. */
+function makePlanner(fx) {
+    const S = fx.expansionSize;
+    const unlockedCells = new CellGrid();
+    for (const [bx, by] of fx.unlocked)
+        for (let dy = 0; dy < S; dy++)
+            for (let dx = 0; dx < S; dx++) unlockedCells.addCell(bx * S + dx, by * S + dy);
+    return {
+        buildings:    [{ ...fx.townhall, x: 0, y: 0 }],
+        buildingPool: fx.buildings.map(b => ({ ...b, x: 0, y: 0 })),
+        roads: new CellGrid(), wideRoads: new CellGrid(),
+        gridOffsetX: 0, gridOffsetY: 0, gridWidth: fx.gridWidth, gridHeight: fx.gridHeight,
+        activeCityType: 'main', unlockedCells,
+        isCellUnlocked(x, y) { return unlockedCells.hasCell(x, y); },
+        isTownhall: b => b.type === 'townhall' || b.type === 'main_building',
+        resizeCanvas() {}, updatePoolPanel() {}, renderer: { draw() {} },
+    };
+}
+
+/** Overlaps, off-area tiles and road buildings with no road path to the Town Hall. */
+function checkLayout(p) {
+    const taken = new Set();
+    let overlaps = 0, outside = 0, unconnected = 0;
+    for (const b of p.buildings)
+        for (let dy = 0; dy < b.height; dy++)
+            for (let dx = 0; dx < b.width; dx++) {
+                const key = `${b.x + dx},${b.y + dy}`;
+                if (taken.has(key)) overlaps++;
+                if (!p.isCellUnlocked(b.x + dx, b.y + dy)) outside++;
+                taken.add(key);
+            }
+    for (const key of p.roads) {
+        if (taken.has(key)) overlaps++;
+        const [x, y] = key.split(',').map(Number);
+        if (!p.isCellUnlocked(x, y)) outside++;
+    }
+
+    const edge = (b) => {
+        const cells = [];
+        for (let dx = 0; dx < b.width; dx++) cells.push([b.x + dx, b.y - 1], [b.x + dx, b.y + b.height]);
+        for (let dy = 0; dy < b.height; dy++) cells.push([b.x - 1, b.y + dy], [b.x + b.width, b.y + dy]);
+        return cells.map(([x, y]) => `${x},${y}`);
+    };
+    const th = p.buildings.find(b => p.isTownhall(b));
+    const reached = new Set(edge(th).filter(k => p.roads.has(k)));
+    const queue = [...reached];
+    while (queue.length) {
+        const [x, y] = queue.pop().split(',').map(Number);
+        for (const k of [`${x + 1},${y}`, `${x - 1},${y}`, `${x},${y + 1}`, `${x},${y - 1}`]) {
+            if (p.roads.has(k) && !reached.has(k)) { reached.add(k); queue.push(k); }
+        }
+    }
+    for (const b of p.buildings)
+        if (b !== th && b.needsRoad && !edge(b).some(k => reached.has(k))) unconnected++;
+    return { overlaps, outside, unconnected };
+}
+
+async function runFixture(fx) {
+    const times = [];
+    let row;
+    for (let r = 0; r < runs; r++) {
+        const p = makePlanner(fx);
+        const opt = new Optimizer(p);
+        opt.setProgress = () => {};
+        opt.yieldUI = () => Promise.resolve();
+
+        const random = Math.random;
+        Math.random = mulberry32(seedOf(fx.name));
+        const t = performance.now();
+        try {
+            await opt._core();
+        } finally {
+            Math.random = random;
+        }
+        times.push(performance.now() - t);
+
+        const placed = p.buildings.filter(b => !p.isTownhall(b));
+        const area = placed.reduce((s, b) => s + b.width * b.height, 0);
+        row = {
+            placed: placed.length,
+            total: fx.buildings.length,
+            roads: p.roads.size,
+            score: area - p.roads.size,
+            ...checkLayout(p),
+        };
+    }
+    return { ...row, ms: [...times].sort((a, b) => a - b)[Math.floor(times.length / 2)] };
+}
+
+function rev() {
+    try {
+        const head = execSync('git rev-parse --short HEAD', { cwd: ROOT, stdio: ['ignore', 'pipe', 'ignore'] }).toString().trim();
+        const dirty = execSync('git status --porcelain -- js', { cwd: ROOT, stdio: ['ignore', 'pipe', 'ignore'] }).toString().trim();
+        return dirty ? `${head}+` : head;
+    } catch {
+        return 'unknown';
+    }
+}
+
+const base = basePath ? JSON.parse(readFileSync(basePath, 'utf8')) : null;
+const results = {};
+let problems = 0;
+
+const delta = (now, was, digits = 0) => {
+    if (was === undefined) return '';
+    const d = now - was;
+    return d === 0 ? '=' : `${d > 0 ? '+' : ''}${d.toFixed(digits)}`;
+};
+const header = ['fixture'.padEnd(20), 'time'.padStart(9), 'placed'.padStart(9), 'roads'.padStart(6), 'score'.padStart(7)];
+if (base) header.push(`  vs ${base.rev}:`, 'time'.padStart(7), 'placed'.padStart(7), 'roads'.padStart(6), 'score'.padStart(6));
+console.log(`${header.join(' ')}   (${rev()}, median of ${runs})`);
+
+for (const path of paths) {
+    const fx = JSON.parse(readFileSync(path, 'utf8'));
+    const name = fx.name || basename(path, '.json');
+    const row = await runFixture(fx);
+    results[name] = row;
+
+    const cols = [
+        name.padEnd(20),
+        `${(row.ms / 1000).toFixed(2)} s`.padStart(9),
+        `${row.placed}/${row.total}`.padStart(9),
+        String(row.roads).padStart(6),
+        String(row.score).padStart(7),
+    ];
+    const was = base?.fixtures[name];
+    if (was) {
+        cols.push(' '.repeat(`  vs ${base.rev}:`.length),
+            `x${(was.ms / row.ms).toFixed(2)}`.padStart(7),
+            delta(row.placed, was.placed).padStart(7),
+            delta(row.roads, was.roads).padStart(6),
+            delta(row.score, was.score).padStart(6));
+    }
+    console.log(cols.join(' '));
+    if (row.overlaps || row.outside || row.unconnected) {
+        problems++;
+        console.error(`  INVALID ${name}: ${row.overlaps} overlapping, ${row.outside} outside, ${row.unconnected} unconnected tiles/buildings`);
+    }
+}
+
+if (outPath) {
+    writeFileSync(outPath, JSON.stringify({ rev: rev(), runs, fixtures: results }, null, 1) + '\n');
+    console.log(`Results written to ${outPath}`);
+}
+if (problems) process.exit(1);
@@ -0,0 +1,139 @@
+#!/usr/bin/env node
+/**
+ * QISimulator benchmark on synthetic QI cities built from the QI building
+ * database: the cost of a collection on an unchanged layout (first call
+ * builds the layout plan, later calls reuse it), and ranking candidate
+ * layouts under several euphoria settings one at a time (load the layout,
+ * set euphoria, run the cycles, as clicking through them does) against one
+ * evaluateScenarios() call. Both rankings must agree.
+ *
+ *     node tools/bench-qi-simulator.mjs [--buildings N] [--layouts N] [--cycles N]
+ */
+
+const args = process.argv.slice(2);
+const option = (name, fallback) => {
+    const at = args.indexOf(name);
+    return at >= 0 ? parseInt(args.splice(at, 2)[1], 10) : fallback;
+};
+const BUILDINGS = option('--buildings', 120);
+const LAYOUTS   = option('--layouts', 40);
+const CYCLES    = option('--cycles', 20);
+const EUPHORIA  = [60, 100, 130, 180, 220];
+const SIZE      = 72;
+
+globalThis.localStorage ??= { getItem: () => null, setItem() {}, removeItem() {} };
+globalThis.navigator ??= { language: 'en' };
+globalThis.document ??= { getElementById: () => null, querySelectorAll: () => [] };
+
+const { QISimulator } = await import('../js/QISimulator.js');
+const { CellGrid } = await import('../js/CellGrid.js');
+const { BuildingIndex } = await import('../js/BuildingIndex.js');
+const { RoadConnectivity } = await import('../js/RoadConnectivity.js');
+const { QI_BUILDINGS } = await import('../data/qi_buildings_database.js');
+
+function mulberry32(seed) {
+    return () => {
+        seed |= 0; seed = seed + 0x6D2B79F5 | 0;
+        let t = Math.imul(seed ^ seed >>> 15, 1 | seed);
+        t = t + Math.imul(t ^ t >>> 7, 61 | t) ^ t;
+        return ((t ^ t >>> 14) >>> 0) / 4294967296;
+    };
+}
+
+const ids = Object.keys(QI_BUILDINGS).filter(id => QI_BUILDINGS[id].type !== 'impediment');
+
+/** A road every 6 rows and columns, the Town Hall in the middle, QI buildings packed in between. */
+function makeLayout(rand) {
+    const roads = new CellGrid();
+    for (let i = 0; i < SIZE; i++) {
+        for (let j = 0; j < SIZE; j += 6) {
+            roads.addCell(i, j);
+            roads.addCell(j, i);
+        }
+    }
+    const buildings = [{ id: 'TH', type: 'main_building', x: 31, y: 31, width: 5, height: 5 }];
+    const taken = new CellGrid();
+    for (let tries = 0; buildings.length <= BUILDINGS && tries < 50 * BUILDINGS; tries++) {
+        const id = ids[Math.floor(rand() * ids.length)], tmpl = QI_BUILDINGS[id];
+        const x = Math.floor(rand() * (SIZE - tmpl.width)), y = Math.floor(rand() * (SIZE - tmpl.height));
+        let free = true;
+        for (let dy = 0; dy < tmpl.height && free; dy++)
+            for (let dx = 0; dx < tmpl.width && free; dx++)
+                if (roads.hasCell(x + dx, y + dy) || taken.hasCell(x + dx, y + dy) ||
+                    (x + dx >= 31 && x + dx < 36 && y + dy >= 31 && y + dy < 36)) free = false;
+        if (!free) continue;
+        for (let dy = 0; dy < tmpl.height; dy++) for (let dx = 0; dx < tmpl.width; dx++) taken.addCell(x + dx, y + dy);
+        buildings.push({ id, type: tmpl.type, x, y, width: tmpl.width, height: tmpl.height, needsRoad: rand() < 0.6 ? 1 : 0 });
+    }
+    return { buildings, roads };
+}
+
+function makePlanner({ buildings, roads }) {
+    const p = {
+        buildingTemplates: QI_BUILDINGS, buildings, roads, unlockedAreas: [],
+        isTownhall: b => b.type === 'main_building',
+        computeRoadConnectivity: () => p.roadConnectivity.reachable(),
+        isBuildingRoadConnected: (b, reachable) => {
+            for (let bx = b.x; bx < b.x + b.width; bx++) {
+                if (reachable.hasCell(bx, b.y - 1) || reachable.hasCell(bx, b.y + b.height)) return true;
+            }
+            for (let by = b.y; by < b.y + b.height; by++) {
+                if (reachable.hasCell(b.x - 1, by) || reachable.hasCell(b.x + b.width, by)) return true;
+            }
+            return false;
+        },
+    };
+    p.buildingIndex = new BuildingIndex(p);
+    p.roadConnectivity = new RoadConnectivity(p);
+    return p;
+}
+
+const time = (fn) => { const t = performance.now(); const out = fn(); return [performance.now() - t, out]; };
+
+const rand = mulberry32(BUILDINGS);
+const layouts = Array.from({ length: LAYOUTS }, () => makeLayout(rand));
+const planner = makePlanner(layouts[0]);
+const sim = new QISimulator(planner);
+planner.qiSimulator = sim;
+
+// Repeated collections on one layout
+const [firstMs] = time(() => sim.calculateOneCycle());
+const [warmMs] = time(() => { for (let i = 0; i < 1000; i++) sim.calculateOneCycle(); });
+const [euphMs] = time(() => { for (let i = 0; i < 1000; i++) { sim.euphoriaPercent = i % 240; sim.calculateOneCycle(); } });
+sim.euphoriaPercent = 100;
+console.log(`${planner.buildings.length} buildings: first cycle ${firstMs.toFixed(3)} ms, ` +
+            `unchanged ${(warmMs / 1000).toFixed(4)} ms, euphoria changed ${(euphMs / 1000).toFixed(4)} ms`);
+
+// Ranking layouts × euphoria settings by QI supplies after CYCLES collections
+const oneByOne = () => {
+    const out = [];
+    for (const layout of layouts) {
+        for (const euphoriaPercent of EUPHORIA) {
+            const p = makePlanner(layout);
+            const s = new QISimulator(p);
+            p.qiSimulator = s;
+            s.euphoriaPercent = euphoriaPercent;
+            s.reset();
+            for (let c = 0; c < CYCLES; c++) s.collectProduction();
+            out.push(s.resources.guild_raids_supplies || 0);
+        }
+    }
+    return out;
+};
+const batch = () => sim.evaluateScenarios(
+    layouts.flatMap(layout => EUPHORIA.map(euphoriaPercent => ({ ...layout, euphoriaPercent }))), CYCLES,
+).map(r => r.resources.guild_raids_supplies || 0);
+
+oneByOne(); batch();   // warm up the JIT
+const [oneMs, one] = time(oneByOne);
+const [batchMs, all] = time(batch);
+const scenarios = LAYOUTS * EUPHORIA.length;
+console.log(`${scenarios} scenarios (${LAYOUTS} layouts x ${EUPHORIA.length} euphoria) over ${CYCLES} cycles: ` +
+            `one by one ${oneMs.toFixed(1)} ms, evaluateScenarios ${batchMs.toFixed(1)} ms (x${(oneMs / batchMs).toFixed(1)})`);
+
+const mismatches = one.filter((v, i) => v !== all[i]).length;
+if (mismatches) {
+    console.error(`${mismatches} scenarios disagree`);
+    process.exit(1);
+}
+console.log('Batch and one-by-one results agree.');
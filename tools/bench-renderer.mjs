@@ -0,0 +1,212 @@
+#!/usr/bin/env node
+/**
+ * Renderer benchmark: per-frame cost of the layered Renderer against a full
+ * scene repaint (what every draw() did before the layers), on a synthetic
+ * late-game city. The 2D context is a stub that counts canvas calls, so the
+ * numbers are the planner's own JS work plus a call count that stands in for
+ * what the browser would rasterise.
+ *
+ *     node tools/bench-renderer.mjs [--frames N] [--size N] [--zoom Z]
+ *
+ * Scenarios, each run for --frames frames:
+ *
+ *     hover      moving a building template over the grid (hover preview)
+ *     pan        dragging the view a few pixels per frame
+ *     road       painting a road, one new tile per frame
+ *     drag       dragging a placed building across the grid
+ */
+
+const args = process.argv.slice(2);
+const option = (name, fallback) => {
+    const at = args.indexOf(name);
+    return at >= 0 ? args.splice(at, 2)[1] : fallback;
+};
+const FRAMES = parseInt(option('--frames', '100'), 10);
+const SIZE   = parseInt(option('--size', '120'), 10);
+const ZOOM   = parseFloat(option('--zoom', '1'));
+
+// ── Browser stand-ins ────────────────────────────────────────────────────────
+
+let calls = 0;
+
+/** A 2D context whose every method is a no-op that bumps the call counter. */
+function stubContext() {
+    const state = {
+        measureText: (text) => { calls++; return { width: String(text).length * 6 }; },
+        createLinearGradient: () => { calls++; return { addColorStop() {} }; },
+        getImageData: () => ({ data: new Uint8ClampedArray(4) }),
+    };
+    return new Proxy(state, {
+        get(target, prop) {
+            if (prop in target) return target[prop];
+            return () => { calls++; };
+        },
+    });
+}
+
+class StubCanvas {
+    constructor(width = 0, height = 0) {
+        this.width = width;
+        this.height = height;
+        this._ctx = stubContext();
+    }
+    getContext() { return this._ctx; }
+    getBoundingClientRect() { return { left: 0, top: 0, right: this.width, bottom: this.height }; }
+}
+
+const store = {};
+globalThis.localStorage ??= { getItem: k => store[k] ?? null, setItem: (k, v) => { store[k] = String(v); }, removeItem: k => { delete store[k]; } };
+globalThis.navigator ??= { language: 'en' };
+globalThis.OffscreenCanvas = StubCanvas;
+globalThis.document ??= {
+    body: { classList: { contains: () => false } },
+    createElement: () => new StubCanvas(),
+    getElementById: () => null,
+    querySelectorAll: () => [],
+};
+
+const { Renderer } = await import('../js/Renderer.js');
+const { CellGrid } = await import('../js/CellGrid.js');
+
+// ── Synthetic city ───────────────────────────────────────────────────────────
+
+function mulberry32(seed) {
+    return () => {
+        seed |= 0; seed = seed + 0x6D2B79F5 | 0;
+        let t = Math.imul(seed ^ seed >>> 15, 1 | seed);
+        t = t + Math.imul(t ^ t >>> 7, 61 | t) ^ t;
+        return ((t ^ t >>> 14) >>> 0) / 4294967296;
+    };
+}
+
+/** A SIZE×SIZE city: roads every 8 rows and columns, blocks packed with buildings. */
+function makePlanner() {
+    const rand = mulberry32(SIZE);
+    const roads = new CellGrid();
+    const taken = new Set();
+    for (let i = 0; i < SIZE; i++) {
+        for (let j = 0; j < SIZE; j += 8) {
+            roads.addCell(i, j);
+            roads.addCell(j, i);
+        }
+    }
+    const buildings = [];
+    const types = ['residential', 'production', 'goods', 'culture', 'military', 'event'];
+    for (let y = 1; y < SIZE; y++) {
+        for (let x = 1; x < SIZE; x++) {
+            const w = 1 + Math.floor(rand() * 4), h = 1 + Math.floor(rand() * 4);
+            let free = x + w <= SIZE && y + h <= SIZE;
+            for (let dy = 0; dy < h && free; dy++)
+                for (let dx = 0; dx < w && free; dx++)
+                    if (roads.hasCell(x + dx, y + dy) || taken.has(`${x + dx},${y + dy}`)) free = false;
+            if (!free) continue;
+            for (let dy = 0; dy < h; dy++)
+                for (let dx = 0; dx < w; dx++) taken.add(`${x + dx},${y + dy}`);
+            buildings.push({
+                id: `B${buildings.length}`, name: `Building ${buildings.length}`,
+                x, y, width: w, height: h, type: types[buildings.length % types.length],
+                color: '#8BC34A', needsRoad: rand() < 0.9 ? 1 : 0,
+            });
+        }
+    }
+    const unlockedCells = new CellGrid();
+    for (let y = 0; y < SIZE; y++) for (let x = 0; x < SIZE; x++) unlockedCells.addCell(x, y);
+
+    const canvas = new StubCanvas(1600, 900);
+    return {
+        canvas, ctx: canvas.getContext('2d'),
+        cellSize: 20, zoom: ZOOM, panX: 0, panY: 0,
+        gridWidth: SIZE, gridHeight: SIZE, gridOffsetX: 0, gridOffsetY: 0,
+        unlockedCells, unlockedAreas: [],
+        buildings, roads, wideRoads: new CellGrid(),
+        renderMode: 'normal', showMinimap: true,
+        selectedBuilding: null, selectedRoad: null, selectedTemplate: null,
+        draggingBuilding: null, hoverPos: null,
+        _getWideRoadAnchor: () => null,
+        _wideRoadAnchorCell: () => null,
+        computeRoadConnectivity: () => roads,
+        isBuildingRoadConnected: () => true,
+        canPlaceBuilding: () => true,
+        isBuildingAt: (x, y) => taken.has(`${x},${y}`),
+        isCellUnlocked: (x, y) => unlockedCells.hasCell(x, y),
+    };
+}
+
+/** The single-pass repaint draw() did before layers: everything, every frame. */
+function fullRepaint(r) {
+    const { ctx, canvas, panX, panY, zoom } = r.p;
+    ctx.fillStyle = '#fff';
+    ctx.fillRect(0, 0, canvas.width, canvas.height);
+    ctx.save();
+    ctx.translate(panX, panY);
+    ctx.scale(zoom, zoom);
+    r.drawBackground();
+    r.drawGrid();
+    r.drawPlacementCrosshair();
+    r.drawRoads();
+    r._drawRoadDragGhosts();
+    r.drawBuildings();
+    if (r.p.draggingBuilding) r._drawBuilding(r.p.draggingBuilding, null);
+    r._drawAnimations();
+    r.drawHoverPreview();
+    ctx.restore();
+    r._minimap.dirty = true;
+    r.drawMinimap();
+}
+
+const SCENARIOS = {
+    hover(p, i) {
+        p.selectedTemplate = { width: 3, height: 3 };
+        p.hoverPos = { x: 10 + (i % 40), y: 10 + Math.floor(i / 40) % 30 };
+    },
+    pan(p, i) {
+        p.panX = -(i * 7) % 2000;
+        p.panY = -(i * 3) % 1000;
+    },
+    road(p, i, r, layered) {
+        p.roads.addCell(1 + i % (SIZE - 2), 4 + Math.floor(i / (SIZE - 2)) * 8);
+        if (layered) r.invalidate('roads');
+    },
+    drag(p, i, r) {
+        if (i === 0) {
+            p.draggingBuilding = p.buildings[Math.floor(p.buildings.length / 3)];
+            p.dragOffset = { x: 0, y: 0 };
+        }
+        p.dragPixelX = 200 + i * 2;
+        p.dragPixelY = 150 + i;
+    },
+};
+
+function run(name, layered) {
+    const p = makePlanner();
+    const r = new Renderer(p);
+    p.renderer = r;
+    if (layered) r.draw();
+    else fullRepaint(r);
+
+    calls = 0;
+    const start = performance.now();
+    for (let i = 0; i < FRAMES; i++) {
+        SCENARIOS[name](p, i, r, layered);
+        if (layered) r.drawFrame();
+        else fullRepaint(r);
+    }
+    const ms = (performance.now() - start) / FRAMES;
+    return { ms, calls: calls / FRAMES, redraws: r.stats.layerRedraws };
+}
+
+const p0 = makePlanner();
+console.log(`${SIZE}x${SIZE} city, ${p0.buildings.length} buildings, ${p0.roads.size} road tiles, ` +
+            `zoom ${ZOOM}, ${FRAMES} frames per scenario`);
+console.log(`${'scenario'.padEnd(10)}${'full ms'.padStart(10)}${'layered ms'.padStart(12)}${'speedup'.padStart(9)}` +
+            `${'full calls'.padStart(12)}${'layered calls'.padStart(15)}   layer rebuilds (base/roads/buildings)`);
+for (const name of Object.keys(SCENARIOS)) {
+    run(name, false); run(name, true);   // warm up the JIT
+    const full = run(name, false);
+    const layered = run(name, true);
+    const { base, roads, buildings } = layered.redraws;
+    console.log(`${name.padEnd(10)}${full.ms.toFixed(3).padStart(10)}${layered.ms.toFixed(3).padStart(12)}` +
+                `${`x${(full.ms / layered.ms).toFixed(1)}`.padStart(9)}` +
+                `${Math.round(full.calls).toString().padStart(12)}${Math.round(layered.calls).toString().padStart(15)}` +
+                `   ${base - 1}/${roads - 1}/${buildings - 1}`);
+}
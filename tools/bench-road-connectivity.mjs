@@ -0,0 +1,188 @@
+#!/usr/bin/env node
+/**
+ * Benchmark for RoadConnectivity: keeping Town Hall connectivity current as
+ * roads are painted and erased, against the full BFS computeRoadConnectivity
+ * ran on every call before, on road-dense cities (a road lattice every few
+ * cells with buildings in between). Every step is checked against a BFS from
+ * scratch, distances included.
+ *
+ *     node tools/bench-road-connectivity.mjs [sizes...] [--steps N] [--batch N]
+ *     node tools/bench-road-connectivity.mjs 80 160 320 --steps 2000
+ *
+ * Each step toggles --batch road cells (erase a road, or pave an empty cell)
+ * and then asks for the connected road cells, as a QI cycle or a roads-mode
+ * frame does; the per-building checks that follow are the same either way,
+ * so they run outside the timing (but must agree too).
+ */
+
+import { CellGrid } from '../js/CellGrid.js';
+import { BuildingIndex } from '../js/BuildingIndex.js';
+import { RoadConnectivity } from '../js/RoadConnectivity.js';
+
+const args = process.argv.slice(2);
+const option = (name, fallback) => {
+    const at = args.indexOf(name);
+    return at >= 0 ? parseInt(args.splice(at, 2)[1], 10) : fallback;
+};
+const STEPS = option('--steps', 1000);
+const BATCH = option('--batch', 1);
+const SIZES = args.length ? args.map(Number) : [80, 160, 320];
+const PITCH = 4;   // a road row / column every PITCH cells
+
+function mulberry32(seed) {
+    return () => {
+        seed |= 0; seed = seed + 0x6D2B79F5 | 0;
+        let t = Math.imul(seed ^ seed >>> 15, 1 | seed);
+        t = t + Math.imul(t ^ t >>> 7, 61 | t) ^ t;
+        return ((t ^ t >>> 14) >>> 0) / 4294967296;
+    };
+}
+
+/** A size×size road lattice with 3×3 buildings in the blocks and the Town Hall in the middle. */
+function makeCity(size) {
+    const roads = new CellGrid();
+    for (let i = 0; i < size; i++) {
+        for (let j = 0; j < size; j += PITCH) {
+            roads.addCell(i, j);
+            roads.addCell(j, i);
+        }
+    }
+    const mid = Math.floor(size / PITCH / 2) * PITCH + 1;
+    const buildings = [{ id: 'TH', type: 'main_building', x: mid, y: mid, width: PITCH - 1, height: PITCH - 1 }];
+    for (let y = 1; y < size; y += PITCH) {
+        for (let x = 1; x < size; x += PITCH) {
+            if (x === mid && y === mid) continue;
+            buildings.push({ id: `B${buildings.length}`, type: 'production', x, y, width: PITCH - 1, height: PITCH - 1 });
+        }
+    }
+    const planner = { buildings, roads, isTownhall: b => b.type === 'main_building' };
+    planner.buildingIndex = new BuildingIndex(planner);
+    return planner;
+}
+
+const DIRS = [[-1, 0], [1, 0], [0, -1], [0, 1]];
+
+/** What computeRoadConnectivity did on every call before: a BFS from the Town Hall. */
+function fullBfs(p) {
+    const th = p.buildings.find(b => p.isTownhall(b));
+    const reachable = new CellGrid(null, Int32Array);
+    const queue = [];
+    const visit = (x, y, d) => {
+        if (p.roads.hasCell(x, y) && !reachable.hasCell(x, y)) {
+            reachable.set(x, y, d);
+            queue.push(x, y);
+        }
+    };
+    for (let bx = th.x; bx < th.x + th.width; bx++) {
+        for (let by = th.y; by < th.y + th.height; by++) {
+            for (const [dx, dy] of DIRS) visit(bx + dx, by + dy, 1);
+        }
+    }
+    for (let head = 0; head < queue.length; head += 2) {
+        const cx = queue[head], cy = queue[head + 1];
+        const d = reachable.get(cx, cy);
+        for (const [dx, dy] of DIRS) visit(cx + dx, cy + dy, d + 1);
+    }
+    return reachable;
+}
+
+function connectedCount(p, reachable) {
+    let n = 0;
+    for (const b of p.buildings) {
+        if (p.isTownhall(b)) continue;
+        let hit = false;
+        for (let bx = b.x; bx < b.x + b.width && !hit; bx++) {
+            for (let by = b.y; by < b.y + b.height && !hit; by++) {
+                for (const [dx, dy] of DIRS) if (reachable.hasCell(bx + dx, by + dy)) { hit = true; break; }
+            }
+        }
+        if (hit) n++;
+    }
+    return n;
+}
+
+/** Road edits for one run: erase a random road or pave a random free cell. */
+function makeEdits(p, size, rand) {
+    const edits = [];
+    const roads = p.roads.clone();
+    for (let i = 0; i < STEPS * BATCH; i++) {
+        const x = Math.floor(rand() * size), y = Math.floor(rand() * size);
+        if (p.buildingIndex.at(x, y)) { i--; continue; }
+        edits.push(x, y, roads.hasCell(x, y) ? 0 : 1);
+        roads.set(x, y, roads.hasCell(x, y) ? 0 : 1);
+    }
+    return edits;
+}
+
+function run(size, incremental, check) {
+    const p = makeCity(size);
+    const conn = new RoadConnectivity(p);
+    const edits = makeEdits(p, size, mulberry32(size));
+    const query = incremental ? () => conn.reachable() : () => fullBfs(p);
+    let mismatches = 0, connected = 0;
+    query();
+    let ms = 0;
+    for (let s = 0, e = 0; s < STEPS; s++) {
+        const start = performance.now();
+        for (let b = 0; b < BATCH; b++, e += 3) p.roads.set(edits[e], edits[e + 1], edits[e + 2]);
+        const reachable = query();
+        ms += performance.now() - start;
+        connected += connectedCount(p, reachable);
+        if (check) {
+            const ref = fullBfs(p);
+            if (ref.size !== reachable.size) mismatches++;
+            else ref.forEachCell((x, y, d) => { if (reachable.get(x, y) !== d) mismatches++; });
+        }
+    }
+    return { ms: ms / STEPS, mismatches, connected, p, conn };
+}
+
+let mismatches = 0;
+console.log(`road lattice every ${PITCH} cells, ${STEPS} steps of ${BATCH} road edit(s) + query`);
+console.log(`${'size'.padEnd(8)}${'roads'.padStart(8)}${'buildings'.padStart(11)}` +
+            `${'full BFS'.padStart(12)}${'incremental'.padStart(14)}${'speedup'.padStart(9)}   rebuilds/updates`);
+for (const size of SIZES) {
+    const checked = run(size, true, true);
+    mismatches += checked.mismatches;
+
+    run(size, false, false); run(size, true, false);   // warm up the JIT
+    const full = run(size, false, false);
+    const inc  = run(size, true, false);
+    if (full.connected !== inc.connected) mismatches++;
+    const { rebuilds, updates } = inc.conn.stats;
+    console.log(`${String(size).padEnd(8)}${String(inc.p.roads.size).padStart(8)}${String(inc.p.buildings.length).padStart(11)}` +
+                `${`${full.ms.toFixed(3)} ms`.padStart(12)}${`${inc.ms.toFixed(3)} ms`.padStart(14)}` +
+                `${`x${(full.ms / inc.ms).toFixed(1)}`.padStart(9)}   ${rebuilds}/${updates}`);
+}
+
+// Edits the change log cannot cover, a moved and a removed Town Hall
+{
+    const p = makeCity(80);
+    const conn = new RoadConnectivity(p);
+    const same = () => {
+        const ref = fullBfs(p), got = conn.reachable();
+        if (ref.size !== got.size) return false;
+        let ok = true;
+        ref.forEachCell((x, y, d) => { if (got.get(x, y) !== d) ok = false; });
+        return ok;
+    };
+    if (!same()) mismatches++;
+    for (let y = 0; y < 80; y++) for (let x = 0; x < 80; x++) if (!p.buildingIndex.at(x, y)) p.roads.addCell(x, y);
+    if (!same()) mismatches++;
+    p.roads.clear();
+    for (let i = 0; i < 80; i += PITCH) p.roads.addCell(i, 0);
+    if (!same()) mismatches++;
+    p.roads = makeCity(80).roads;
+    if (!same()) mismatches++;
+    p.buildingIndex.move(p.buildings[0], 1, 1);
+    p.buildingIndex.move(p.buildings[1], 41, 41);
+    if (!same()) mismatches++;
+    p.buildings = p.buildings.slice(1);
+    if (conn.reachable() !== null) mismatches++;
+}
+
+if (mismatches) {
+    console.error(`${mismatches} steps disagree with a BFS from scratch`);
+    process.exit(1);
+}
+console.log('Incremental connectivity and BFS agree.');
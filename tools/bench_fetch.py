@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+build_database.py dump cache / fetch benchmark
+==============================================
+Serves a synthetic city_entities dump from a local HTTP stand-in for the
+game CDN and runs fetch_dump() against it with a throwaway DumpCache:
+
+    cold       first download of a hashed URL (after injected 503s, retried)
+    hashed     the same URL again: served from the cache, no request at all
+    revalidate an unhashed URL twice: the second is a conditional 304
+    changed    the unhashed URL after the dump changed: downloaded again
+    refresh    a hashed URL with refresh=True (--refresh): revalidated
+    offline    the server is gone: replayed from the cache
+    errors     a 404 fails at once, a server that keeps failing after
+               FETCH_ATTEMPTS tries
+    truncated  a connection dropped mid-body is retried, leaving no .part file
+    disk error an error writing the cache is not retried
+    deflate    an unasked-for Content-Encoding is refused, not cached
+
+Every cached dump must parse to the same entities as the served one. The
+stand-in counts requests and bytes sent, and times each step.
+
+Usage:
+    python tools/bench_fetch.py                  # 6000 entities
+    python tools/bench_fetch.py --entities 20000
+"""
+
+import argparse
+import gzip
+import hashlib
+import io
+import sys
+import tempfile
+import threading
+import time
+from contextlib import redirect_stdout
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+TOOLS = Path(__file__).resolve().parent
+sys.path.insert(0, str(TOOLS))
+
+import build_database as bd  # noqa: E402
+from bench_ingest import write_dump  # noqa: E402
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """CDN stand-in: one gzipped dump under any path, with ETag / Last-Modified."""
+
+    body = b''
+    etag = ''
+    modified = ''
+    fail_next = 0      # answer this many requests with 503 first
+    truncate_next = 0  # send only half the body (and close) this many times
+    missing = False    # answer everything with 404
+    encoding = 'gzip'  # Content-Encoding sent
+    accept = ''        # Accept-Encoding of the last request
+    requests = 0
+    sent = 0
+
+    def do_GET(self):
+        cls = type(self)
+        cls.requests += 1
+        cls.accept = self.headers.get('Accept-Encoding', '')
+        if cls.missing:
+            self.send_error(404)
+            return
+        if cls.fail_next:
+            cls.fail_next -= 1
+            self.send_error(503)
+            return
+        if self.headers.get('If-None-Match') == cls.etag or \
+                self.headers.get('If-Modified-Since') == cls.modified:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = cls.body
+        if cls.truncate_next:
+            cls.truncate_next -= 1
+            body = body[:len(body) // 2]
+            self.close_connection = True
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Encoding', cls.encoding)
+        self.send_header('Content-Length', str(len(cls.body)))
+        self.send_header('ETag', cls.etag)
+        self.send_header('Last-Modified', cls.modified)
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            return   # the client gave up on this response (refused or failed to store it)
+        cls.sent += len(body)
+
+    def log_message(self, *args):
+        pass
+
+    @classmethod
+    def serve(cls, dump):
+        cls.body = dump.read_bytes()
+        cls.etag = '"' + hashlib.sha1(cls.body).hexdigest() + '"'
+        cls.modified = formatdate(time.time(), usegmt=True)
+
+
+def entity_digest(path):
+    """Digest of the entities in a dump, as build_database.py streams them."""
+    h = hashlib.sha256()
+    with redirect_stdout(io.StringIO()):
+        for _, text in bd.iter_entities(str(path), with_text=True):
+            h.update(text.encode('utf-8'))
+    return h.hexdigest()
+
+
+class DiskError(bd.DumpCache):
+    """A cache whose entries land in a directory that does not exist: every write fails."""
+
+    def path(self, key):
+        return self.root / 'missing' / f'{key}.json.gz'
+
+
+def step(name, fn):
+    """Run fn quietly and print its time, requests and bytes; return (result or 'exit N', requests)."""
+    requests, sent = StandIn.requests, StandIn.sent
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        try:
+            result = fn()
+        except SystemExit as e:
+            result = f'exit {e.code}'
+        except OSError as e:
+            result = type(e).__name__
+    seconds = time.perf_counter() - start
+    print(f'{name:<12}{seconds * 1000:>10.1f} ms{StandIn.requests - requests:>10}'
+          f'{(StandIn.sent - sent) / 1e6:>12.2f} MB')
+    return result, StandIn.requests - requests
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Exercise the raw-dump cache against a local CDN stand-in.')
+    ap.add_argument('--entities', type=int, default=6000, help='synthetic dump size (default: 6000)')
+    args = ap.parse_args(argv)
+    bd.FETCH_BACKOFF = 0.05   # keep the retry tests quick
+
+    failures = []
+    def expect(ok, what):
+        if not ok:
+            failures.append(what)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        dump, dump2 = tmp / 'served.json.gz', tmp / 'served2.json.gz'
+        write_dump(dump, args.entities, seed=1)
+        write_dump(dump2, args.entities, seed=2)
+        digest, digest2 = entity_digest(dump), entity_digest(dump2)
+        StandIn.serve(dump)
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), StandIn)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f'http://127.0.0.1:{server.server_port}'
+        hashed = f'{base}/city_entities-0123abcd.json'
+        unhashed = f'{base}/latest/city_entities.json'
+        cache = bd.DumpCache(tmp / 'dumps')
+
+        print(f'{args.entities:,} entities, {len(StandIn.body) / 1e6:.2f} MB gzipped')
+        print(f'{"step":<12}{"time":>13}{"requests":>10}{"sent":>15}')
+
+        StandIn.fail_next = 2
+        path, n = step('cold', lambda: bd.fetch_dump(hashed, cache))
+        expect(n == 3 and entity_digest(path) == digest, 'cold download after two 503s')
+        path, n = step('hashed', lambda: bd.fetch_dump(hashed, cache))
+        expect(n == 0 and entity_digest(path) == digest, 'hashed URL served from the cache')
+
+        step('unhashed', lambda: bd.fetch_dump(unhashed, cache))
+        path, n = step('revalidate', lambda: bd.fetch_dump(unhashed, cache))
+        expect(n == 1 and entity_digest(path) == digest, 'conditional request answered 304')
+        expect(cache.meta(bd.dump_key(unhashed)).get('etag') == StandIn.etag, 'ETag kept in the sidecar')
+
+        StandIn.serve(dump2)
+        path, n = step('changed', lambda: bd.fetch_dump(unhashed, cache))
+        expect(n == 1 and entity_digest(path) == digest2, 'changed dump downloaded again')
+        StandIn.truncate_next = 1
+        path, n = step('truncated', lambda: bd.fetch_dump(f'{base}/city_entities-d00d.json', cache))
+        expect(n == 2 and entity_digest(path) == digest2, 'a dropped connection is retried')
+        expect(not list(cache.root.glob('*.part')), 'no .part file left behind')
+        result, n = step('disk error', lambda: bd.fetch_dump(f'{base}/city_entities-dead.json', DiskError(tmp / 'dumps')))
+        expect(result == 'FileNotFoundError' and n == 1, 'cache write errors are not retried')
+        StandIn.encoding = 'deflate'
+        result, n = step('deflate', lambda: bd.fetch_dump(f'{base}/city_entities-abba.json', cache))
+        expect(result == 'exit 1' and n == 1, 'an unsupported Content-Encoding is refused')
+        expect(not cache.path(bd.dump_key(f'{base}/city_entities-abba.json')).exists(), 'and not cached')
+        StandIn.encoding = 'gzip'
+        path, n = step('refresh', lambda: bd.fetch_dump(hashed, cache, refresh=True))
+        expect(n == 1 and entity_digest(path) == digest2, '--refresh revalidates a hashed URL')
+
+        StandIn.missing = True
+        result, n = step('404', lambda: bd.fetch_dump(f'{base}/city_entities-feed.json', cache))
+        expect(result == 'exit 1' and n == 1, '404 is not retried')
+        StandIn.missing = False
+        StandIn.fail_next = bd.FETCH_ATTEMPTS
+        result, n = step('503 x4', lambda: bd.fetch_dump(f'{base}/city_entities-beef.json', cache))
+        expect(result == 'exit 1' and n == bd.FETCH_ATTEMPTS, 'retries are bounded')
+        StandIn.fail_next = 0
+        expect(StandIn.accept == 'gzip', 'only gzip is asked for')
+
+
+        server.shutdown()
+        server.server_close()
+        path, n = step('offline', lambda: bd.fetch_dump(hashed, cache, offline=True))
+        expect(entity_digest(path) == digest2, 'offline replay from the cache')
+        result, _ = step('offline miss', lambda: bd.fetch_dump(f'{base}/city_entities-cafe.json', cache, offline=True))
+        expect(result == 'exit 1', 'offline without a cached dump fails')
+        expect(cache.latest() == bd.dump_key(hashed), 'latest() is the last one fetched or revalidated')
+        expect(gzip.open(cache.path(bd.dump_key(hashed))).read(1) == b'[', 'cached dumps are gzipped')
+
+    if failures:
+        print('FAILED: ' + '; '.join(failures))
+        sys.exit(1)
+    print('All fetch / cache checks passed.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+city_entities ingestion benchmark
+=================================
+Builds a large synthetic city_entities dump and compares peak memory and
+time of the two ingestion paths in tools/build_database.py:
+
+    in-memory   load_data() + convert() + convert_qi()   (--in-memory)
+    streaming   convert_all(iter_entities())             (default)
+
+Each path runs in its own subprocess so peak RSS (ru_maxrss) is measured
+cleanly; an import-only child is subtracted as the interpreter baseline.
+Both paths must produce identical databases.
+
+Usage:
+    python tools/bench_ingest.py                     # 10000 entities (~100 MB JSON), gzipped
+    python tools/bench_ingest.py --entities 100000
+    python tools/bench_ingest.py --dump my.json.gz   # use an existing dump
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+TOOLS = Path(__file__).resolve().parent
+sys.path.insert(0, str(TOOLS))
+
+import build_database as bd  # noqa: E402
+
+ERAS = [era for era in bd.ERA_MAP if era not in ('AllAge', 'MultiAge', 'NoAge')]
+RESOURCES = ['money', 'supplies', 'medals', 'strategy_points', 'premium', 'all_goods_of_age']
+
+
+def _residential(i, rng):
+    era = rng.choice(ERAS)
+    return {
+        'id': f'R_{era}_Residential{i}', 'name': f'House {i}', 'type': 'residential',
+        '__class__': 'CityEntity', 'width': rng.randint(2, 4), 'length': rng.randint(2, 4),
+        'requirements': {'min_era': era, 'street_connection_level': 1},
+        'entity_levels': [
+            {'era': e, 'provided_population': rng.randint(10, 900),
+             'demand_for_happiness': rng.randint(10, 900), 'produced_money': rng.randint(50, 9000)}
+            for e in ERAS
+        ],
+    }
+
+
+def _event(i, rng):
+    """GenericCityEntity with per-era components, production and boosts (the big ones)."""
+    components = {}
+    for era in ERAS:
+        components[era] = {
+            'staticResources': {'resources': {'resources': {'population': rng.randint(0, 500)}}},
+            'happiness': {'provided': rng.randint(0, 2000)},
+            'production': {'autoStart': True, 'time': 86400, 'options': [{
+                'time': 86400,
+                'products': [
+                    {'type': 'resources',
+                     'playerResources': {'resources': {r: rng.randint(1, 5000)
+                                                       for r in rng.sample(RESOURCES, 3)}}},
+                    {'type': 'random', 'products': [
+                        {'dropChance': 0.25, 'product': {'playerResources': {'resources': {'premium': 5}}}},
+                    ]},
+                ],
+            }]},
+            'boosts': {'boosts': [{'type': 'att_boost_attacker', 'value': rng.randint(1, 40),
+                                   'targetedFeature': 'battleground'}]},
+            'description': 'x' * rng.randint(50, 400),
+        }
+    components['AllAge'] = {
+        'placement': {'size': {'x': rng.randint(1, 6), 'y': rng.randint(1, 6)}},
+        'streetConnectionRequirement': {'requiredLevel': 1},
+    }
+    return {'id': f'W_MultiAge_WIN{i}', 'name': f'Event {i}', 'type': '',
+            '__class__': 'GenericCityEntity', 'components': components}
+
+
+def _qi(i, rng):
+    world = rng.choice(sorted(bd.QI_WORLDS))
+    return {'id': f'W_{world}_Residential{i}', 'name': f'QI {i}', 'type': '',
+            '__class__': 'GenericCityEntity',
+            'components': {'AllAge': {'placement': {'size': {'x': 2, 'y': 2}}}}}
+
+
+def _street(i, rng):
+    return {'id': f'S_{rng.choice(ERAS)}_Street{i}', 'name': 'Road', 'type': 'street',
+            'width': 1, 'length': 1}
+
+
+def write_dump(path, entities, seed=1):
+    """Stream a synthetic dump to path (gzipped when it ends in .gz)."""
+    rng = random.Random(seed)
+    makers = [(_event, 5), (_residential, 3), (_qi, 1), (_street, 1)]
+    pool = [m for m, weight in makers for _ in range(weight)]
+    opener = gzip.open if path.suffix == '.gz' else open
+    with opener(path, 'wt', encoding='utf-8') as f:
+        f.write('[')
+        for i in range(entities):
+            if i:
+                f.write(',')
+            f.write(json.dumps(rng.choice(pool)(i, rng)))
+        f.write(']')
+
+
+def _child(mode, dump):
+    """Run one ingestion path and print its result as JSON (subprocess side)."""
+    start = time.perf_counter()
+    if mode == 'baseline':
+        result = None
+    elif mode == 'in-memory':
+        data = bd.load_data(str(dump))
+        buildings, _ = bd.convert(data)
+        qi_buildings, _ = bd.convert_qi(data)
+        result = (buildings, qi_buildings)
+    else:
+        buildings, _, qi_buildings, _ = bd.convert_all(bd.iter_entities(str(dump)))
+        result = (buildings, qi_buildings)
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is KiB on Linux, bytes on macOS; read it before hashing adds its own peak
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+    digest = hashlib.sha256(json.dumps(result, sort_keys=True).encode()).hexdigest() if result else ''
+    print(json.dumps({
+        'seconds': elapsed,
+        'peak_rss': peak,
+        'digest': digest,
+        'count': len(result[0]) if result else 0,
+    }))
+
+
+def _run(mode, dump):
+    out = subprocess.run([sys.executable, __file__, '--child', mode, str(dump)],
+                         check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Compare in-memory vs streaming ingestion.')
+    ap.add_argument('--entities', type=int, default=10000, help='synthetic dump size (default: 10000)')
+    ap.add_argument('--dump', type=Path, help='use this dump instead of generating one')
+    ap.add_argument('--plain', action='store_true', help='write the synthetic dump uncompressed')
+    ap.add_argument('--child', nargs=2, metavar=('MODE', 'DUMP'), help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.child:
+        _child(args.child[0], Path(args.child[1]))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dump = args.dump
+        if dump is None:
+            dump = Path(tmp) / ('city_entities.json' if args.plain else 'city_entities.json.gz')
+            print(f'Generating {args.entities:,} synthetic entities ...')
+            write_dump(dump, args.entities)
+        raw_size = dump.stat().st_size
+        if dump.suffix == '.gz':
+            with gzip.open(dump, 'rb') as f:
+                unpacked = sum(len(chunk) for chunk in iter(lambda: f.read(1 << 20), b''))
+            print(f'Dump: {raw_size / 1e6:.1f} MB gzip, {unpacked / 1e6:.1f} MB JSON')
+        else:
+            print(f'Dump: {raw_size / 1e6:.1f} MB JSON')
+
+        base = _run('baseline', dump)
+        results = {mode: _run(mode, dump) for mode in ('in-memory', 'streaming')}
+
+    print(f'{"path":<10} {"time":>8}  {"peak RSS":>10}  {"above baseline":>14}')
+    for mode, r in results.items():
+        print(f'{mode:<10} {r["seconds"]:>7.2f}s  {r["peak_rss"] / 1e6:>8.1f}MB  '
+              f'{(r["peak_rss"] - base["peak_rss"]) / 1e6:>12.1f}MB')
+
+    old, new = results['in-memory'], results['streaming']
+    old_mem = old['peak_rss'] - base['peak_rss']
+    new_mem = new['peak_rss'] - base['peak_rss']
+    if new_mem > 0:
+        print(f'\nstreaming uses {old_mem / new_mem:.1f}x less memory '
+              f'(time x{new["seconds"] / old["seconds"]:.2f})')
+    if old['digest'] != new['digest']:
+        print('MISMATCH: the two paths produced different databases')
+        sys.exit(1)
+    print(f'Outputs identical ({new["count"]:,} main-city buildings).')
+
+
+if __name__ == '__main__':
+    main()
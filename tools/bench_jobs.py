@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+build_database.py --jobs scaling benchmark
+==========================================
+Converts a synthetic city_entities dump with 1, 2, 4, ... worker processes
+(up to the CPU count), prints the speedup over the serial run and checks
+that every run writes byte-identical database files.
+
+Usage:
+    python tools/bench_jobs.py                       # 6000 entities, jobs 1..cpu_count
+    python tools/bench_jobs.py --entities 20000 --jobs 1 2 4 8
+    python tools/bench_jobs.py --dump my.json.gz
+
+Parsing and the sinks stay in the main process; only the derived data
+(sizes, production stats, boosts) is computed by the pool, so the speedup
+is bounded by that share of the work. The benchmark measures the
+parse-only time too and prints the resulting ideal (Amdahl) speedups,
+which is the useful number on a machine with few cores. The entity cache
+is off.
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+TOOLS = Path(__file__).resolve().parent
+sys.path.insert(0, str(TOOLS))
+
+import build_database as bd  # noqa: E402
+from bench_ingest import write_dump  # noqa: E402
+
+
+def convert_and_write(dump, jobs, out_dir):
+    """Run main + QI conversion with jobs workers; return (seconds, output digest)."""
+    start = time.perf_counter()
+    main_sink, qi_sink = bd.run_pipeline(bd.iter_entities(str(dump), with_text=True),
+                                         [bd.MainCitySink(), bd.QISink()], jobs=jobs)
+    elapsed = time.perf_counter() - start
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    bd.write_js(main_sink.buildings, out_dir / 'main.js', shard_dir=out_dir / 'shards')
+    bd.write_js(qi_sink.buildings, out_dir / 'qi.js', export_name='QI_BUILDINGS')
+    digest = hashlib.sha256()
+    for path in sorted(out_dir.rglob('*.js')):
+        digest.update(path.relative_to(out_dir).as_posix().encode())
+        digest.update(path.read_bytes())
+    return elapsed, digest.hexdigest()
+
+
+def parse_only(dump):
+    """Seconds spent just streaming and parsing the dump (the serial part)."""
+    start = time.perf_counter()
+    for _ in bd.iter_entities(str(dump), with_text=True):
+        pass
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    cpus = os.cpu_count() or 1
+    default_jobs = [1]
+    while default_jobs[-1] * 2 <= cpus:
+        default_jobs.append(default_jobs[-1] * 2)
+    if default_jobs[-1] != cpus:
+        default_jobs.append(cpus)
+
+    ap = argparse.ArgumentParser(description='Measure --jobs speedup of the database build.')
+    ap.add_argument('--entities', type=int, default=6000, help='synthetic dump size (default: 6000)')
+    ap.add_argument('--dump', type=Path, help='use this dump instead of generating one')
+    ap.add_argument('--jobs', type=int, nargs='+', default=default_jobs,
+                    help=f'worker counts to try (default: {" ".join(map(str, default_jobs))})')
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        dump = args.dump
+        if dump is None:
+            dump = tmp / 'city_entities.json.gz'
+            print(f'Generating {args.entities:,} synthetic entities ...')
+            write_dump(dump, args.entities)
+
+        print(f'{cpus} CPU(s) available.')
+        print(f'{"jobs":>4} {"time":>9} {"speedup":>8}  output')
+        results = {}
+        for jobs in [1] + [j for j in args.jobs if j != 1]:
+            # build_database prints a line per written file; keep the table readable
+            with open(os.devnull, 'w') as quiet:
+                stdout, sys.stdout = sys.stdout, quiet
+                try:
+                    results[jobs] = convert_and_write(dump, jobs, tmp / f'out{jobs}')
+                finally:
+                    sys.stdout = stdout
+            seconds, digest = results[jobs]
+            same = 'identical' if digest == results[1][1] else 'DIFFERENT'
+            print(f'{jobs:>4} {seconds:>8.2f}s {results[1][0] / seconds:>7.2f}x  {same}')
+
+        # Amdahl: parsing stays in the main process, the rest can spread out
+        with open(os.devnull, 'w') as quiet:
+            stdout, sys.stdout = sys.stdout, quiet
+            try:
+                serial = parse_only(dump)
+            finally:
+                sys.stdout = stdout
+        total = results[1][0]
+        share = max(0.0, 1 - serial / total)
+        print(f'\nParsing is {serial:.2f}s of the {total:.2f}s serial run; '
+              f'{share:.0%} of the work can run in the pool.')
+        print('Ideal speedup: ' + ', '.join(
+            f'{n} cores {1 / ((1 - share) + share / n):.2f}x' for n in (2, 4, 8, 16)))
+
+    if any(digest != results[1][1] for _, digest in results.values()):
+        print('MISMATCH: parallel output differs from the serial run')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
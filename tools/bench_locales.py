@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+build_database.py --locale benchmark
+====================================
+Serves a synthetic city_entities dump and translated copies of it (same
+entities, names prefixed with the locale) from a local HTTP stand-in for
+the game CDN that answers each request after --latency seconds, then
+builds a throwaway data/ directory twice:
+
+    serial      the main dump, then each locale dump fetched and parsed in
+                turn (one build per language server, as before)
+    concurrent  build(..., locales=...): the locale dumps download in worker
+                threads while the main dump converts; with --jobs they are
+                parsed in the build's process pool, otherwise in the threads
+
+The parse is pure Python, so in threads it takes as long as in turn and only
+the download waits overlap: expect a gain from --latency, and from the parse
+only with --jobs on a machine with that many cores.
+
+Both must write the same databases as a build without --locale, and every
+name table must hold the translated name of each main city / QI building.
+
+Usage:
+    python tools/bench_locales.py                         # 6000 entities, de/fr/es
+    python tools/bench_locales.py --entities 20000 --latency 1 --locales de fr es pl
+    python tools/bench_locales.py --jobs 4                # parse in 4 processes
+"""
+
+import argparse
+import gzip
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+TOOLS = Path(__file__).resolve().parent
+sys.path.insert(0, str(TOOLS))
+
+import build_database as bd  # noqa: E402
+from bench_ingest import write_dump  # noqa: E402
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """CDN stand-in: /<locale>/city_entities.json after a fixed delay, no validators."""
+
+    bodies = {}     # locale -> gzipped dump
+    latency = 0.0
+
+    def do_GET(self):
+        body = self.bodies.get(self.path.split('/')[1])
+        time.sleep(self.latency)
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def translate(dump, code):
+    """The dump with every name prefixed with [code], gzipped."""
+    out = io.BytesIO()
+    with redirect_stdout(io.StringIO()), gzip.open(out, 'wt', encoding='utf-8') as f:
+        f.write('[')
+        for i, entity in enumerate(bd.iter_entities(str(dump))):
+            if 'name' in entity:
+                entity = {**entity, 'name': f'[{code}] {entity["name"]}'}
+            f.write((',' if i else '') + json.dumps(entity))
+        f.write(']')
+    return out.getvalue()
+
+
+def outputs(data_dir):
+    """Databases written by a build (everything but the locale-specific files)."""
+    skip = {bd.NAME_TABLES_NAME, bd.MANIFEST_NAME, 'db_meta.js'}
+    return {p.relative_to(data_dir).as_posix(): p.read_bytes()
+            for p in sorted(data_dir.rglob('*.js'))
+            if p.name not in skip and bd.NAMES_DIR_NAME not in p.relative_to(data_dir).parts}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Compare serial and concurrent multi-locale builds.')
+    ap.add_argument('--entities', type=int, default=6000, help='synthetic dump size (default: 6000)')
+    ap.add_argument('--latency', type=float, default=0.5, help='seconds before each response (default: 0.5)')
+    ap.add_argument('--locales', nargs='+', default=['de', 'fr', 'es'], help='locale codes (default: de fr es)')
+    ap.add_argument('--jobs', type=int, default=1, help='build worker processes (default: 1)')
+    args = ap.parse_args(argv)
+
+    failures = []
+    def expect(ok, what):
+        if not ok:
+            failures.append(what)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        # Keep the real dump cache out of this: a fresh one per build
+        bd.DumpCache.__init__.__defaults__ = (tmp / 'dumps-plain',)
+        dump = tmp / 'main.json.gz'
+        write_dump(dump, args.entities, seed=1)
+        StandIn.bodies = {code: translate(dump, code) for code in args.locales}
+        StandIn.latency = args.latency
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), StandIn)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f'http://127.0.0.1:{server.server_port}'
+        locales = [(code, f'{base}/{code}/city_entities.json') for code in args.locales]
+
+        plain = tmp / 'plain'
+        with redirect_stdout(io.StringIO()):
+            bd.build(str(dump), plain, use_cache=False)
+
+        serial_dir = tmp / 'serial'
+        bd.DumpCache.__init__.__defaults__ = (tmp / 'dumps-serial',)
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            bd.build(str(dump), serial_dir, use_cache=False, jobs=args.jobs)
+            serial_names = {code: bd.locale_names(src) for code, src in locales}
+        serial = time.perf_counter() - start
+
+        data_dir = tmp / 'concurrent'
+        bd.DumpCache.__init__.__defaults__ = (tmp / 'dumps-concurrent',)
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            bd.build(str(dump), data_dir, use_cache=False, jobs=args.jobs, locales=locales)
+        concurrent = time.perf_counter() - start
+        server.shutdown()
+        server.server_close()
+
+        print(f'{args.entities:,} entities, {len(args.locales)} locales, '
+              f'{args.latency:.2f} s latency per request, {args.jobs} job(s), {os.cpu_count()} CPU(s)')
+        print(f'serial      {serial:>8.2f} s')
+        print(f'concurrent  {concurrent:>8.2f} s  (x{serial / concurrent:.2f})')
+
+        expect(outputs(data_dir) == outputs(plain), 'databases match a build without --locale')
+        main_db = bd.read_js(data_dir / 'foe_buildings_database.js', data_dir / bd.SHARD_DIR_NAME)
+        qi_db = bd.read_js(data_dir / 'qi_buildings_database.js')
+        ids = main_db.keys() | qi_db.keys()
+        index = (data_dir / bd.NAME_TABLES_NAME).read_text(encoding='utf-8')
+        expect(sorted(re.findall(r'^    "([\w-]+)": \(\) => import', index, re.M)) == sorted(args.locales),
+               'NAME_TABLES lists every locale')
+        expect('NAME_TABLES' in (data_dir / bd.MANIFEST_NAME).read_text(encoding='utf-8'),
+               'the manifest re-exports NAME_TABLES')
+        for code in args.locales:
+            table = dict(re.findall(r'^    ("(?:[^"\\]|\\.)*"): ("(?:[^"\\]|\\.)*"),$',
+                                    (data_dir / bd.NAMES_DIR_NAME / f'{code}.js').read_text(encoding='utf-8'), re.M))
+            table = {json.loads(k): json.loads(v) for k, v in table.items()}
+            expect(table.keys() == ids, f'{code} table covers the main city and QI buildings')
+            expect(all(table[i] == serial_names[code][i] for i in ids), f'{code} names match a serial parse')
+            expect(all(table[i].startswith(f'[{code}] ') for i in ids), f'{code} names are translated')
+
+    if failures:
+        print('FAILED: ' + '; '.join(failures))
+        sys.exit(1)
+    print('All multi-locale build checks passed.')
+
+
+if __name__ == '__main__':
+    main()
@@ -9,12 +9,58 @@ Usage:
     # Fetch directly from the game CDN URL:
     python tools/build_database.py <url>
 
-    # Or from a locally saved JSON file:
+    # Or from a locally saved JSON file (optionally gzipped):
     python tools/build_database.py <local_file.json>
 
+    # The dump is streamed and parsed one entity at a time; to load it
+    # whole instead (the old, memory-hungry path):
+    python tools/build_database.py --in-memory <url-or-file>
+
+    # Rebuilds are incremental: entities whose raw JSON is unchanged reuse
+    # their converted data from tools/.cache/, files are only rewritten when
+    # their content changes, and a diff of added/removed/changed building
+    # ids is printed at the end. To convert everything from scratch:
+    python tools/build_database.py --no-cache <url-or-file>
+
+    # Compute production stats in N worker processes (0 = one per CPU);
+    # the output is byte-identical to a serial run:
+    python tools/build_database.py --jobs 4 <url-or-file>
+
+    # Time each stage (download, fetch, decompress, parse, convert, convert_qi,
+    # write_js, write_meta, ...) and report peak memory; optionally also
+    # write a JSON report for CI and/or a cProfile dump with hot functions:
+    python tools/build_database.py --profile <url-or-file>
+    python tools/build_database.py --profile-json profile.json --pstats build.pstats <url-or-file>
+
     # Only check whether the databases are outdated (no rebuild):
     python tools/build_database.py --check <url>
 
+    # Downloaded dumps are kept gzipped in tools/.cache/dumps/, keyed by the
+    # city_entities-<hash> in their URL, so rebuilding from the same URL
+    # (or experimenting with the converter) never hits the network again.
+    # URLs without a hash are revalidated with If-None-Match /
+    # If-Modified-Since; --refresh does that for hashed URLs too. Downloads
+    # are retried with backoff. To rebuild from the cache only (from the
+    # given URL's dump, or from the most recent one):
+    python tools/build_database.py --offline [<url>]
+
+    # Building names come in the language of the dump. Pass dumps captured
+    # from other language servers to also write a name table per locale
+    # (data/names/<locale>.js); only their names are used. They download
+    # while the main dump converts; with --jobs they are also parsed in the
+    # worker processes (without, the parse shares the main build's CPU):
+    python tools/build_database.py <url> --jobs 4 --locale en=<en-url> --locale de=<de-url>
+
+    # (Re)write the .gz/.br siblings of the existing data/*.js files only:
+    python tools/build_database.py --compress
+
+    # (Re)write data/manifest.js after editing a data file by hand:
+    python tools/build_database.py --manifest
+
+    # Also write the compact binary database (with a source: from the fresh
+    # dump; alone: from the existing data/*.js), plus a size/parse report:
+    python tools/build_database.py --binary [<url>]
+
 How to get the URL (no DevTools needed):
     1. Create a bookmark with this URL (a "bookmarklet"):
 
@@ -27,24 +73,70 @@ How to get the URL (no DevTools needed):
      "city_entities" -> right-click request -> Copy URL.)
 
 Output:
-    data/foe_buildings_database.js   (main city buildings)
+    data/foe_buildings_database.js   (main city buildings: light index + shard loaders)
+    data/foe_buildings/<age>.js      (prod/boosts payloads, one shard per age, loaded on demand)
     data/qi_buildings_database.js    (Quantum Incursion / Guild Raids buildings)
+    data/names/<locale>.js           (--locale only: id -> name for main city + QI buildings)
+    data/building_names.js           (NAME_TABLES: locale -> lazy import of its name table)
     data/db_meta.js                  (generation date + source hash, shown in-app)
+    data/manifest.js                 (re-exports every data module by content hash)
+    data/foe_buildings_database.bin  (--binary only: columnar format, see write_binary)
+
+    Each entity is read once and offered to every registered sink (see
+    run_pipeline): main city, QI, and a settlement check that compares the
+    hand-curated settlement database with the game's footprints.
+
+    Every written file also gets precompressed siblings (<file>.gz, and
+    <file>.br when the optional `brotli` package is installed) that
+    server.py serves to clients sending a matching Accept-Encoding.
+
+    The app imports the databases through data/manifest.js, which points at
+    './<file>.js?v=<content hash>'. server.py answers those versioned URLs
+    with Cache-Control: immutable, so a repeat visit only revalidates the
+    tiny manifest (304) and re-downloads nothing else until a hash changes.
 
 Note:
-    Building names will be in the language of the server you captured from.
-    Use an English-language server URL for English names.
+    The databases carry the building names of the dump you build from.
+    For names in the app's other languages, add --locale <code>=<url> with a
+    dump captured from that language's server: the app then loads the
+    matching data/names/<code>.js table when that language is selected, and
+    keeps the database names for languages without one.
     The hash in the metadata URL changes with every game data update, so
     --check can tell whether your databases are stale without rebuilding.
 """
 
 import gzip
+import hashlib
+import io
 import json
+import os
 import re
+import shutil
+import struct
+import subprocess
 import sys
+import threading
+import time
+import http.client
+import urllib.error
 import urllib.request
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import cached_property, wraps
 from pathlib import Path
 
+try:
+    import brotli  # optional: pip install brotli
+except ImportError:
+    brotli = None
+
+try:
+    import resource  # Unix only: peak RSS for --profile
+except ImportError:
+    resource = None
+
 
 # ── Type mapping: game type -> (app type, hex color) ─────────────────────────
 TYPE_MAP = {
@@ -379,6 +471,40 @@ def get_production_stats(entity):
     return None
 
 
+# ── Normalised production rates ───────────────────────────────────────────────
+# The sharded main-city index exports RATE_KEYS, one shared resource
+# dictionary for the app's per-day production rows: timed outputs scaled to a
+# 24h rate, with the untimed stats (population, happiness, demand) kept as
+# they are. The rows themselves are not shipped, since they would repeat
+# prod (+80% gzipped shards). ProductionOverview derives each one from prod
+# once per template and era, by the rules of split_stat_key, and sums them as
+# dense arrays. Keys are ordered by how many stats use them, so the common
+# resources get the low slots.
+RATE_STATIC_KEYS = ('population', 'happiness', 'demandHappiness')
+TIMER_SECONDS = {suffix: secs for secs, suffix in TIMER_SUFFIX_MAP.items()}
+_ODD_TIMER_RE = re.compile(r'^t(\d+)s$')
+
+
+def split_stat_key(key):
+    """'supplies_8h' -> ('supplies', 28800), 'x_t36000s' -> ('x', 36000); untimed -> (key, None)."""
+    resource, _, suffix = key.rpartition('_')
+    if resource:
+        if suffix in TIMER_SECONDS:
+            return resource, TIMER_SECONDS[suffix]
+        m = _ODD_TIMER_RE.match(suffix)
+        if m and int(m.group(1)):
+            return resource, int(m.group(1))
+    return key, None
+
+
+def rate_keys(buildings):
+    """The shared resource dictionary: untimed stats first, then the rest, most used first."""
+    uses = Counter(split_stat_key(key)[0]
+                   for b in buildings.values() for stats in (b.get('prod') or {}).values() for key in stats)
+    static = [k for k in RATE_STATIC_KEYS if k in uses]
+    return static + sorted(set(uses) - set(static), key=lambda k: (-uses[k], k))
+
+
 MILITARY_BOOST_TYPES = {
     'att_boost_attacker', 'att_boost_defender',
     'def_boost_attacker', 'def_boost_defender',
@@ -420,111 +546,485 @@ def get_boosts(entity):
     return boosts if boosts else None
 
 
-def load_data(source):
-    """Load JSON from a URL or local file path."""
-    if source.startswith('http://') or source.startswith('https://'):
-        print(f'Fetching {source} ...')
-        req = urllib.request.Request(source, headers={
-            'User-Agent': 'Mozilla/5.0',
-            'Accept-Encoding': 'gzip, deflate',
-        })
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            raw = resp.read()
-        # Decompress if gzip
-        if raw[:2] == b'\x1f\x8b':
-            raw = gzip.decompress(raw)
-        return json.loads(raw)
-    else:
-        path = Path(source)
-        if not path.exists():
-            print(f'Error: file not found: {source}')
-            sys.exit(1)
-        print(f'Reading {source} ...')
-        return json.loads(path.read_text(encoding='utf-8'))
+# ── Build profiling (--profile) ──────────────────────────────────────────────
 
+PROFILE = None  # the active BuildProfile while --profile is on
 
-def get_size(entity):
-    """Return (width, height) or None if size cannot be determined."""
-    if 'width' in entity and 'length' in entity:
-        return entity['width'], entity['length']
-    # Fallback: components-based size (used by GenericCityEntity)
-    try:
-        size = entity['components']['AllAge']['placement']['size']
-        return size['x'], size['y']
-    except (KeyError, TypeError):
+# Report order. The ingest sub-stages (indented in the report) run
+# interleaved, entity by entity, inside 'ingest' when the dump is streamed.
+PROFILE_STAGES = ('ingest', 'download', 'fetch', 'decompress', 'parse', 'cache', 'derive_pool',
+                  'convert', 'convert_qi', 'check_settlement',
+                  'locale_names', 'read_js', 'write_js', 'write_names', 'write_binary',
+                  'write_meta', 'write_manifest', 'cache_save')
+INGEST_STAGES = {'download', 'fetch', 'decompress', 'parse', 'cache', 'derive_pool',
+                 'convert', 'convert_qi', 'check_settlement'}
+
+
+def peak_rss():
+    """Peak resident set size of this process in bytes, or None if unknown."""
+    if resource is None:
         return None
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024
 
 
-def convert(data):
-    """Convert the raw list of game entities to the database dict."""
-    buildings = {}
-    stats = {'skipped_type': 0, 'skipped_world': 0, 'skipped_no_size': 0, 'included': 0}
+class BuildProfile:
+    """
+    Wall time, call count and peak memory per build stage.
+
+    Whole stages (write_js, write_meta, ...) are timed with stage(), which
+    also records the process's peak RSS when the stage ends. The streamed
+    ingest stages are many short calls timed with call(); they only get
+    time and calls, their memory is the peak of 'ingest' as a whole.
+    Derived data (production stats, boosts) is computed lazily by the first
+    sink that asks for it, so it counts towards 'convert'.
+    """
 
-    for entity in data:
-        raw_type = entity.get('type', '')
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages  = {}
 
-        if raw_type in SKIP_TYPES:
-            stats['skipped_type'] += 1
-            continue
+    def add(self, name, seconds, calls=1):
+        stage = self.stages.setdefault(name, {'seconds': 0.0, 'calls': 0, 'peak_rss': None})
+        stage['seconds'] += seconds
+        stage['calls']   += calls
 
-        # Skip cultural settlement and guild raid buildings by ID world segment
-        id_parts = entity.get('id', '').split('_')
-        if len(id_parts) >= 2 and id_parts[1] in NON_MAIN_CITY_WORLDS:
-            stats['skipped_world'] += 1
-            continue
+    def call(self, name, fn, *args):
+        """Return fn(*args), adding its run time to stage name."""
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self.add(name, time.perf_counter() - start)
 
-        size = get_size(entity)
-        if size is None or size[0] <= 0 or size[1] <= 0:
-            stats['skipped_no_size'] += 1
-            continue
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+            self.stages[name]['peak_rss'] = peak_rss()
+
+    def finalize(self):
+        """Turn the raw text-read time into 'decompress' (read minus fetch)."""
+        read = self.stages.pop('read', None)
+        if read is not None:
+            fetch = self.stages.get('fetch', {}).get('seconds', 0.0)
+            read['seconds'] = max(0.0, read['seconds'] - fetch)
+            self.add('decompress', read['seconds'], read['calls'])
+        self.total = time.perf_counter() - self.started
+
+    def ordered(self):
+        known = [name for name in PROFILE_STAGES if name in self.stages]
+        return known + sorted(set(self.stages) - set(known))
+
+    def report(self):
+        print()
+        print('Build profile (peak RSS = process high-water mark when the stage ended):')
+        print(f'  {"stage":<20}{"seconds":>9}{"calls":>10}{"peak RSS":>12}')
+        nested = 'ingest' in self.stages
+        for name in self.ordered():
+            stage = self.stages[name]
+            label = f'  {name}' if nested and name in INGEST_STAGES else name
+            rss = f'{stage["peak_rss"] / 1e6:.1f} MB' if stage['peak_rss'] else '-'
+            print(f'  {label:<20}{stage["seconds"]:>9.3f}{stage["calls"]:>10,}{rss:>12}')
+        rss = peak_rss()
+        print(f'  {"total":<20}{self.total:>9.3f}{"":>10}'
+              f'{f"{rss / 1e6:.1f} MB" if rss else "-":>12}')
+
+    def as_dict(self):
+        return {
+            'total_seconds': round(self.total, 6),
+            'peak_rss': peak_rss(),
+            'stages': {name: {**self.stages[name], 'seconds': round(self.stages[name]['seconds'], 6)}
+                       for name in self.ordered()},
+        }
 
-        width, height = size
 
-        req = entity.get('requirements', {}) or {}
+def active_profile():
+    """
+    PROFILE on the main thread, None elsewhere: --locale dumps are fetched
+    (and, without --jobs, parsed) by worker threads alongside the main
+    build, and their time
+    would otherwise land in the main build's stages. The main thread's wait
+    for them is timed as 'locale_names' instead.
+    """
+    return PROFILE if threading.current_thread() is threading.main_thread() else None
 
-        # GenericCityEntity (W_* ids, empty type) are event/special buildings
-        entity_id = entity.get('id', '')
-        if raw_type == '' and entity.get('__class__') == 'GenericCityEntity':
-            app_type = 'event'
-            color    = EVENT_COLOR
-            age      = get_event_name(entity_id)
+
+def stage(name):
+    """Context manager timing a build stage while --profile is on (else a no-op)."""
+    prof = active_profile()
+    return prof.stage(name) if prof is not None else _no_stage()
+
+
+@contextmanager
+def _no_stage():
+    yield
+
+
+def profiled(name):
+    """Decorator: time every call of the function as build stage name."""
+    def decorate(fn):
+        @wraps(fn)
+        def timed(*args, **kwargs):
+            with stage(name):
+                return fn(*args, **kwargs)
+        return timed
+    return decorate
+
+
+class TimedReader(io.RawIOBase):
+    """Raw stream wrapper that books the time spent reading the source as 'fetch'."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return PROFILE.call('fetch', self.stream.readinto, b)
+
+    def close(self):
+        self.stream.close()
+        super().close()
+
+
+def hot_functions(profiler, limit=15):
+    """Top functions of a cProfile run by own time, as report-ready dicts."""
+    import pstats
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, func), (_, calls, tottime, cumtime, _) in stats.stats.items():
+        rows.append({'function': f'{Path(filename).name}:{line}({func})', 'calls': calls,
+                     'tottime': round(tottime, 6), 'cumtime': round(cumtime, 6)})
+    rows.sort(key=lambda r: -r['tottime'])
+    return rows[:limit]
+
+
+def print_hot_functions(rows):
+    print()
+    print('Hot functions (own time, cProfile):')
+    print(f'  {"tottime":>9}{"cumtime":>9}{"calls":>11}  function')
+    for r in rows:
+        print(f'  {r["tottime"]:>9.3f}{r["cumtime"]:>9.3f}{r["calls"]:>11,}  {r["function"]}')
+
+
+# ── Raw dump cache ───────────────────────────────────────────────────────────
+DUMP_CACHE_DIR  = Path(__file__).resolve().parent / '.cache' / 'dumps'
+DUMP_CACHE_KEEP = 5      # dumps kept; older ones are pruned after a download
+FETCH_TIMEOUT   = 60     # seconds per attempt
+FETCH_ATTEMPTS  = 4
+FETCH_BACKOFF   = 1.0    # seconds before the first retry, doubled after each
+STREAM_CHUNK    = 1 << 16  # bytes copied / characters decoded per read while streaming
+
+
+def is_url(source):
+    return source.startswith('http://') or source.startswith('https://')
+
+
+def dump_key(url):
+    """Cache key of a dump URL: its city_entities-<hash>, else a hash of the URL."""
+    h = source_hash(url)
+    return f'city_entities-{h}' if h else 'url-' + hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]
+
+
+class DumpCache:
+    """
+    Raw city_entities dumps as downloaded, stored gzipped under <key>.json.gz
+    with a <key>.meta.json sidecar (URL, ETag, Last-Modified) for
+    conditional refreshes. A hashed URL always names the same content, so
+    its entry is used as is; the rest are revalidated.
+
+    Locale dumps are fetched from several threads: each key is fetched under
+    its own lock, and dumps used by this run are never pruned.
+    """
+
+    pinned = set()                 # keys used by this process
+    _locks = {}                    # key -> threading.Lock
+    _guard = threading.Lock()      # for _locks and pruning
+
+    def __init__(self, root=DUMP_CACHE_DIR):
+        self.root = root
+
+    def path(self, key):
+        return self.root / f'{key}.json.gz'
+
+    @classmethod
+    def lock(cls, key):
+        with cls._guard:
+            cls.pinned.add(key)
+            return cls._locks.setdefault(key, threading.Lock())
+
+    def meta(self, key):
+        try:
+            return json.loads((self.root / f'{key}.meta.json').read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+    def latest(self):
+        """Key of the most recently fetched or revalidated dump, or None."""
+        dumps = sorted(self.root.glob('*.json.gz'), key=lambda p: p.stat().st_mtime) \
+            if self.root.exists() else []
+        return dumps[-1].name[:-len('.json.gz')] if dumps else None
+
+    def store(self, key, url, resp):
+        """Stream an HTTP response into the cache (gzipping it unless it already is)."""
+        encoding = (resp.headers.get('Content-Encoding') or 'identity').lower()
+        if encoding not in ('identity', 'gzip'):
+            # Only gzip is asked for; anything else would be cached as a corrupt dump
+            print(f'Error: {url} was sent with unsupported Content-Encoding {encoding!r}.')
+            sys.exit(1)
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.path(key)
+        part = path.with_name(path.name + '.part')
+        try:
+            with open(part, 'wb') as out:
+                chunk = resp.read(STREAM_CHUNK)
+                sink = out if chunk[:2] == b'\x1f\x8b' else \
+                    gzip.GzipFile(fileobj=out, mode='wb', compresslevel=6, mtime=0)
+                while chunk:
+                    sink.write(chunk)
+                    chunk = resp.read(STREAM_CHUNK)
+                if sink is not out:
+                    sink.close()
+        except BaseException:
+            part.unlink(missing_ok=True)
+            raise
+        os.replace(part, path)   # a failed download never leaves a truncated entry
+        meta = {'url': url, 'etag': resp.headers.get('ETag'),
+                'last_modified': resp.headers.get('Last-Modified')}
+        (self.root / f'{key}.meta.json').write_text(json.dumps(meta, indent=1) + '\n', encoding='utf-8')
+        print(f'Cached dump {path.name} ({path.stat().st_size:,} bytes)')
+        self.prune()
+
+    def prune(self, keep=DUMP_CACHE_KEEP):
+        with self._guard:
+            dumps = sorted(self.root.glob('*.json.gz'), key=lambda p: p.stat().st_mtime)
+            for old in dumps[:-keep]:
+                key = old.name[:-len('.json.gz')]
+                if key not in self.pinned:
+                    old.unlink()
+                    (self.root / f'{key}.meta.json').unlink(missing_ok=True)
+
+
+class FetchError(Exception):
+    """A network failure while reading a response body (retried, unlike local I/O errors)."""
+
+
+class NetworkReads:
+    """
+    The response as on_response sees it: read() failures (timeouts, dropped
+    connections) become FetchError, so fetch_with_retry can tell them from
+    errors writing the cache (disk full, permissions), which are not retried.
+    """
+
+    def __init__(self, resp):
+        self.resp = resp
+        self.headers = resp.headers
+        self.status = resp.status
+
+    def read(self, size=-1):
+        try:
+            data = self.resp.read(size)
+        except (http.client.HTTPException, OSError) as e:
+            raise FetchError(str(e) or type(e).__name__) from e
+        # read(size) returns b'' rather than raising when the connection drops early
+        left = getattr(self.resp, 'length', None)
+        if not data and size and left:
+            raise FetchError(f'connection closed with {left:,} bytes to go')
+        return data
+
+
+def fetch_with_retry(url, headers, on_response):
+    """
+    GET url, passing the response to on_response; returns the HTTP status
+    (304 when a conditional request found nothing new). Timeouts, dropped
+    connections, 429 and 5xx are retried FETCH_ATTEMPTS times with
+    exponential backoff; other errors end the build. Errors raised by
+    on_response itself (writing the cache) are not network errors and
+    propagate at once.
+    """
+    req = urllib.request.Request(url, headers=headers)
+    for attempt in range(1, FETCH_ATTEMPTS + 1):
+        try:
+            resp = urllib.request.urlopen(req, timeout=FETCH_TIMEOUT)
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return 304
+            if e.code != 429 and e.code < 500:
+                print(f'Error: could not fetch {url}: HTTP {e.code} {e.reason}')
+                sys.exit(1)
+            error = f'HTTP {e.code}'
+        except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
+            error = str(getattr(e, 'reason', e)) or type(e).__name__
         else:
-            app_type, color = TYPE_MAP.get(raw_type, ('culture', '#6B8E7F'))
-            min_era = req.get('min_era', '') or ''
-            age     = ERA_MAP.get(min_era, 'All Ages')
+            with resp:
+                try:
+                    on_response(NetworkReads(resp))
+                    return resp.status
+                except FetchError as e:
+                    error = str(e)
+        if attempt == FETCH_ATTEMPTS:
+            print(f'Error: could not fetch {url} after {attempt} attempts ({error}).')
+            sys.exit(1)
+        delay = FETCH_BACKOFF * 2 ** (attempt - 1)
+        print(f'  attempt {attempt} failed ({error}), retrying in {delay:g} s ...')
+        time.sleep(delay)
 
-        needs_road = req.get('street_connection_level', 0)
-        # GenericCityEntity (event buildings) store road requirement in components
-        if not needs_road:
-            try:
-                needs_road = entity['components']['AllAge']['streetConnectionRequirement']['requiredLevel']
-            except (KeyError, TypeError):
-                pass
 
-        # Roadless buildings get a distinct color
-        if not needs_road:
-            color = ROADLESS_COLOR
+def fetch_dump(url, cache=None, offline=False, refresh=False):
+    """
+    Path of the cached raw dump for url, downloading or revalidating it
+    first when needed (see DumpCache); offline never touches the network.
+    """
+    cache = cache or DumpCache()
+    key = dump_key(url)
+    with cache.lock(key):
+        return _fetch_dump(cache, key, url, offline, refresh)
 
-        prod_stats  = get_production_stats(entity)
-        boost_stats = get_boosts(entity)
 
-        key = entity['id']
-        buildings[key] = {
-            'name':      entity.get('name', key),
-            'width':     width,
-            'height':    height,
-            'type':      app_type,
-            'age':       age,
-            'color':     color,
-            'needsRoad': needs_road,
-        }
-        if prod_stats:
-            buildings[key]['prod'] = prod_stats
-        if boost_stats:
-            buildings[key]['boosts'] = boost_stats
-        stats['included'] += 1
+def _fetch_dump(cache, key, url, offline, refresh):
+    path = cache.path(key)
+    if offline:
+        if not path.exists():
+            print(f'Error: --offline, and no cached dump for {url} ({path.name}).')
+            sys.exit(1)
+        print(f'Offline: replaying {path.name} from the dump cache.')
+        return path
+    if path.exists() and source_hash(url) and not refresh:
+        print(f'Using cached dump {path.name}.')
+        return path
+
+    headers = {'User-Agent': 'Mozilla/5.0', 'Accept-Encoding': 'gzip'}
+    meta = cache.meta(key) if path.exists() else {}
+    if meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        headers['If-Modified-Since'] = meta['last_modified']
+    print(f'Fetching {url} ...')
+    with stage('download'):
+        status = fetch_with_retry(url, headers, lambda resp: cache.store(key, url, resp))
+    if status == 304:
+        print(f'Not modified, using cached dump {path.name}.')
+        os.utime(path)   # counts as recent for latest() and pruning
+    return path
 
-    return buildings, stats
+
+def load_data(source):
+    """Load JSON from a URL (through the dump cache) or local file path."""
+    path = fetch_dump(source) if is_url(source) else Path(source)
+    if not path.exists():
+        print(f'Error: file not found: {source}')
+        sys.exit(1)
+    print(f'Reading {path} ...')
+    with stage('fetch'):
+        raw = path.read_bytes()
+    # Decompress if gzip
+    if raw[:2] == b'\x1f\x8b':
+        with stage('decompress'):
+            raw = gzip.decompress(raw)
+    with stage('parse'):
+        return json.loads(raw)
+
+
+def open_source(source):
+    """
+    Open a URL (through the dump cache) or local file as a binary stream,
+    transparently gunzipping it (gzip is detected by its magic bytes, so
+    .json and .json.gz both work).
+    """
+    path = fetch_dump(source) if is_url(source) else Path(source)
+    if not path.exists():
+        print(f'Error: file not found: {source}')
+        sys.exit(1)
+    print(f'Reading {path} ...')
+    stream = open(path, 'rb')
+    if active_profile() is not None:
+        stream = io.BufferedReader(TimedReader(stream))
+    if stream.peek(2)[:2] == b'\x1f\x8b':
+        return gzip.GzipFile(fileobj=stream, mode='rb')
+    return stream
+
+
+def iter_entities(source, with_text=False):
+    """
+    Yield the elements of the top-level JSON array in source one at a time
+    (as (element, raw JSON text) pairs with with_text).
+
+    The stream is decompressed and decoded incrementally and each element is
+    parsed with JSONDecoder.raw_decode as soon as it is complete, so peak
+    memory is one read chunk plus the largest entity instead of the whole
+    dump (compressed + raw + parsed) at once.
+    """
+    decoder = json.JSONDecoder()
+    prof = active_profile()
+    decode = decoder.raw_decode if prof is None else \
+        (lambda s, idx: prof.call('parse', decoder.raw_decode, s, idx))
+    with open_source(source) as raw, io.TextIOWrapper(raw, encoding='utf-8') as text:
+        buf, pos, eof = '', 0, False
+
+        def fill():
+            nonlocal buf, pos, eof
+            # 'read' becomes 'decompress' (gunzip + UTF-8) once fetch is subtracted
+            chunk = text.read(STREAM_CHUNK) if prof is None else prof.call('read', text.read, STREAM_CHUNK)
+            if not chunk:
+                eof = True
+            buf = buf[pos:] + chunk
+            pos = 0
+
+        def skip_ws():
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in ' \t\r\n':
+                    pos += 1
+                if pos < len(buf) or eof:
+                    return
+                fill()
+
+        skip_ws()
+        if buf[pos:pos + 1] != '[':
+            raise ValueError('expected a JSON array of entities')
+        pos += 1
+        skip_ws()
+        if buf[pos:pos + 1] == ']':
+            return
+        while True:
+            try:
+                entity, end = decode(buf, pos)
+                # A scalar ending exactly at the buffer edge may continue in the next chunk.
+                if end == len(buf) and not eof and not isinstance(entity, (dict, list)):
+                    raise json.JSONDecodeError('truncated', buf, end)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                fill()
+                continue
+            yield (entity, buf[pos:end]) if with_text else entity
+            pos = end
+            skip_ws()
+            sep = buf[pos:pos + 1]
+            pos += 1
+            if sep == ']':
+                return
+            if sep != ',':
+                raise ValueError(f'unexpected {sep!r} between array elements')
+            skip_ws()
+
+
+def get_size(entity):
+    """Return (width, height) or None if size cannot be determined."""
+    if 'width' in entity and 'length' in entity:
+        return entity['width'], entity['length']
+    # Fallback: components-based size (used by GenericCityEntity)
+    try:
+        size = entity['components']['AllAge']['placement']['size']
+        return size['x'], size['y']
+    except (KeyError, TypeError):
+        return None
 
 
 def infer_qi_type(id_parts, raw_type):
@@ -556,86 +1056,487 @@ def infer_qi_type(id_parts, raw_type):
     return app_type, color
 
 
-def convert_qi(data):
+# ── Conversion pipeline ───────────────────────────────────────────────────────
+# Every entity is wrapped in an EntityInfo once and offered to each registered
+# sink. Derived data (ID split, size, road level, prod stats, boosts) is
+# computed lazily on the EntityInfo, so however many sinks look at an entity
+# it is only worked out once. A new game mode is one more Sink subclass
+# decorated with @register_sink.
+
+class EntityInfo:
+    """One city_entities entry plus the derived data shared by all sinks."""
+
+    def __init__(self, entity, text=None):
+        self.entity   = entity
+        self.text     = text  # raw JSON as it appeared in the dump, when streamed
+        self.id       = entity.get('id', '')
+        self.id_parts = self.id.split('_')
+        self.world    = self.id_parts[1] if len(self.id_parts) >= 2 else ''
+        self.raw_type = entity.get('type', '')
+
+    @cached_property
+    def requirements(self):
+        return self.entity.get('requirements', {}) or {}
+
+    @cached_property
+    def size(self):
+        """(width, height), or None when missing or not positive."""
+        size = get_size(self.entity)
+        if size is None or size[0] <= 0 or size[1] <= 0:
+            return None
+        return size
+
+    @cached_property
+    def needs_road(self):
+        needs_road = self.requirements.get('street_connection_level', 0)
+        # GenericCityEntity (event buildings) store road requirement in components
+        if not needs_road:
+            try:
+                needs_road = self.entity['components']['AllAge']['streetConnectionRequirement']['requiredLevel']
+            except (KeyError, TypeError):
+                pass
+        return needs_road
+
+    @cached_property
+    def prod(self):
+        return get_production_stats(self.entity)
+
+    @cached_property
+    def boosts(self):
+        return get_boosts(self.entity)
+
+    def record(self, app_type, age, color):
+        """Database entry for this entity with the sink-specific fields filled in."""
+        width, height = self.size
+        entry = {
+            'name':      self.entity.get('name', self.id),
+            'width':     width,
+            'height':    height,
+            'type':      app_type,
+            'age':       age,
+            'color':     color,
+            'needsRoad': self.needs_road,
+        }
+        if self.prod:
+            entry['prod'] = self.prod
+        if self.boosts:
+            entry['boosts'] = self.boosts
+        return entry
+
+
+class Sink:
+    """
+    A conversion target. add() sees every entity and keeps or counts it;
+    finish() writes the output and prints a summary. Subclasses set name,
+    title and the stats counters they report.
     """
-    Convert QI (Guild Raids) entities to the database dict.
-    Similar to convert() but:
-      - only processes entities whose world segment is in QI_WORLDS
+
+    name  = ''
+    title = ''
+    stage = ''  # --profile stage for add(); defaults to the sink name
+    stat_keys = ('skipped_type', 'skipped_world', 'skipped_no_size', 'included')
+
+    def __init__(self):
+        self.buildings = {}
+        self.stats = dict.fromkeys(self.stat_keys, 0)
+
+    def add(self, info):
+        raise NotImplementedError
+
+    def finish(self, data_dir):
+        pass
+
+    def print_stats(self, labels):
+        print()
+        print(f'{self.title}:')
+        for key, label in labels:
+            print(f'  {label:<31}{self.stats[key]}')
+
+
+SINKS = {}
+
+
+def register_sink(cls):
+    """Class decorator: make a Sink available to the pipeline under cls.name."""
+    SINKS[cls.name] = cls
+    return cls
+
+
+def run_pipeline(entities, sinks, cache=None, jobs=1, pool=None):
+    """
+    Classify each entity once and offer it to every sink, in a single pass.
+    With an EntityCache, unchanged entities reuse their derived data.
+    With jobs > 1 the derived data is computed in a process pool (see
+    parallel_infos; pool, if given, is used instead of a fresh one); sinks
+    still see entities in dump order, so the output is identical to a
+    serial run.
+    """
+    infos = entity_infos(entities, cache)
+    if jobs > 1:
+        infos = parallel_infos(infos, jobs, pool=pool)
+    prof = PROFILE
+    for info in infos:
+        for sink in sinks:
+            if prof is None:
+                sink.add(info)
+            else:
+                prof.call(sink.stage or sink.name, sink.add, info)
+        if cache is not None:
+            cache.store(info)
+    return sinks
+
+
+def entity_infos(entities, cache=None):
+    """
+    Wrap entities (dicts, or (dict, raw text) pairs from
+    iter_entities(with_text=True)) in EntityInfo, pre-filled from the cache
+    where possible.
+    """
+    for entity in entities:
+        info = EntityInfo(*entity) if isinstance(entity, tuple) else EntityInfo(entity)
+        if cache is None:
+            info.primed = False
+        elif PROFILE is None:
+            info.primed = cache.prime(info)
+        else:
+            info.primed = PROFILE.call('cache', cache.prime, info)
+        yield info
+
+
+PARALLEL_CHUNK = 64  # entities per pool task: big enough to amortise the IPC
+
+
+def derive_chunk(texts):
+    """Pool worker: parse each raw entity and return its EntityCache.FIELDS, in order."""
+    out = []
+    for text in texts:
+        info = EntityInfo(json.loads(text))
+        out.append({f: getattr(info, f) for f in EntityCache.FIELDS})
+    return out
+
+
+def parallel_infos(infos, jobs, chunk_size=PARALLEL_CHUNK, pool=None):
+    """
+    Yield infos in their original order with the expensive derived data
+    (get_production_stats and friends) computed by a ProcessPoolExecutor.
+    Workers get the raw JSON text and parse it themselves: pickling a str is
+    nearly free, pickling the parsed dict costs more than deriving from it.
+    At most 2 × jobs chunks are in flight, so a streamed dump still is not
+    held in memory. Cache hits are not sent to the pool. A pool passed in
+    is left running for its owner.
+    """
+    with nullcontext(pool) if pool is not None else ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+
+        def submit(chunk):
+            todo = [info for info in chunk if not info.primed]
+            texts = [info.text if info.text is not None else json.dumps(info.entity) for info in todo]
+            future = pool.submit(derive_chunk, texts) if todo else None
+            pending.append((chunk, todo, future))
+
+        def drain():
+            chunk, todo, future = pending.popleft()
+            if future is not None:
+                # Time spent waiting on the workers (the main process is idle)
+                results = future.result() if PROFILE is None else PROFILE.call('derive_pool', future.result)
+                for info, derived in zip(todo, results):
+                    info.__dict__.update(derived)
+            return chunk
+
+        chunk = []
+        for info in infos:
+            chunk.append(info)
+            if len(chunk) == chunk_size:
+                submit(chunk)
+                chunk = []
+                if len(pending) >= 2 * jobs:
+                    yield from drain()
+        if chunk:
+            submit(chunk)
+        while pending:
+            yield from drain()
+
+
+CACHE_PATH = Path(__file__).resolve().parent / '.cache' / 'entities.json.gz'
+
+
+class EntityCache:
+    """
+    Derived data (size, road level, prod, boosts) of previously converted
+    entities, keyed by a hash of each raw entity's JSON (as it appears in a
+    streamed dump; canonical JSON for --in-memory). The cache is
+    dropped whenever this script changes, since conversion rules may have.
+    Only entities seen in the current run are saved back.
+    """
+
+    FIELDS = ('size', 'needs_road', 'prod', 'boosts')
+
+    def __init__(self, path=CACHE_PATH):
+        self.path    = path
+        self.version = content_hash(Path(__file__))
+        self.entries = {}
+        self.fresh   = {}
+        self.hits = self.misses = 0
+        try:
+            blob = json.loads(gzip.decompress(path.read_bytes()))
+            if blob.get('version') == self.version:
+                self.entries = blob['entities']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    @staticmethod
+    def key(info):
+        # The raw text when streamed (no re-serialisation), else canonical JSON
+        text = info.text if info.text is not None else \
+            json.dumps(info.entity, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+    def prime(self, info):
+        """Pre-fill info's cached properties from a previous run; True on a hit."""
+        info.cache_key = self.key(info)
+        cached = self.entries.get(info.cache_key)
+        if cached is None:
+            self.misses += 1
+            return False
+        self.hits += 1
+        info.__dict__.update(cached)
+        if info.__dict__.get('size') is not None:
+            info.size = tuple(info.size)
+        return True
+
+    def store(self, info):
+        # Only what the sinks actually needed (skipped streets never compute prod)
+        self.fresh[info.cache_key] = {f: info.__dict__[f] for f in self.FIELDS if f in info.__dict__}
+
+    @profiled('cache_save')
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        blob = json.dumps({'version': self.version, 'entities': self.fresh}, separators=(',', ':'))
+        self.path.write_bytes(gzip.compress(blob.encode('utf-8'), compresslevel=6, mtime=0))
+        print(f'Entity cache: {self.hits} reused, {self.misses} converted '
+              f'({self.path.stat().st_size:,} bytes)')
+
+
+def diff_buildings(old, new):
+    """(added, removed, changed) building ids between two database dicts."""
+    added   = sorted(new.keys() - old.keys())
+    removed = sorted(old.keys() - new.keys())
+    changed = sorted(k for k in new.keys() & old.keys() if new[k] != old[k])
+    return added, removed, changed
+
+
+def print_diff(title, old, new, limit=20):
+    """Print a short added/removed/changed summary of a rebuilt database."""
+    added, removed, changed = diff_buildings(old, new)
+    print(f'{title}: {len(added)} added, {len(removed)} removed, {len(changed)} changed'
+          + ('' if added or removed or changed else ' (no changes)'))
+    for label, ids in (('+', added), ('-', removed), ('~', changed)):
+        for key in ids[:limit]:
+            print(f'  {label} {key}  {(new.get(key) or old.get(key))["name"]}')
+        if len(ids) > limit:
+            print(f'  {label} ... and {len(ids) - limit} more')
+
+
+@register_sink
+class MainCitySink(Sink):
+    """Main city buildings → data/foe_buildings_database.js (+ payload shards)."""
+
+    name  = 'main'
+    title = 'Main city buildings'
+    stage = 'convert'
+
+    def add(self, info):
+        if info.raw_type in SKIP_TYPES:
+            self.stats['skipped_type'] += 1
+            return
+        # Skip cultural settlement and guild raid buildings by ID world segment
+        if info.world in NON_MAIN_CITY_WORLDS:
+            self.stats['skipped_world'] += 1
+            return
+        if info.size is None:
+            self.stats['skipped_no_size'] += 1
+            return
+
+        # GenericCityEntity (W_* ids, empty type) are event/special buildings
+        if info.raw_type == '' and info.entity.get('__class__') == 'GenericCityEntity':
+            app_type = 'event'
+            color    = EVENT_COLOR
+            age      = get_event_name(info.id)
+        else:
+            app_type, color = TYPE_MAP.get(info.raw_type, ('culture', '#6B8E7F'))
+            min_era = info.requirements.get('min_era', '') or ''
+            age     = ERA_MAP.get(min_era, 'All Ages')
+
+        # Roadless buildings get a distinct color
+        if not info.needs_road:
+            color = ROADLESS_COLOR
+
+        self.buildings[info.id] = info.record(app_type, age, color)
+        self.stats['included'] += 1
+
+    def finish(self, data_dir):
+        write_js(self.buildings, data_dir / 'foe_buildings_database.js',
+                 export_name='BUILDINGS', shard_dir=data_dir / SHARD_DIR_NAME)
+        self.print_stats([
+            ('included',        'Included:'),
+            ('skipped_type',    'Skipped (non-placeable type):'),
+            ('skipped_world',   'Skipped (settlement/QI):'),
+            ('skipped_no_size', 'Skipped (no size data):'),
+        ])
+
+
+@register_sink
+class QISink(Sink):
+    """
+    Quantum Incursion (Guild Raids) buildings → data/qi_buildings_database.js.
+    Unlike the main city:
+      - only entities whose world segment is in QI_WORLDS
       - allows main_building and impediment types
       - forces age = 'Quantum Incursion' for all entries
       - infers building type from ID prefix/suffix (QI buildings are GenericCityEntity)
       - deduplicates impediments by size (keeps first occurrence per (w,h))
     """
-    buildings = {}
-    seen_impediment_sizes = set()
-    stats = {'skipped_type': 0, 'skipped_world': 0, 'skipped_no_size': 0,
-             'skipped_impediment_dup': 0, 'included': 0}
 
-    for entity in data:
-        id_parts = entity.get('id', '').split('_')
-        if len(id_parts) < 2 or id_parts[1] not in QI_WORLDS:
-            stats['skipped_world'] += 1
-            continue
+    name  = 'qi'
+    title = 'Quantum Incursion buildings'
+    stage = 'convert_qi'
+    stat_keys = ('skipped_type', 'skipped_world', 'skipped_no_size',
+                 'skipped_impediment_dup', 'included')
+
+    def __init__(self):
+        super().__init__()
+        self.seen_impediment_sizes = set()
+
+    def add(self, info):
+        if info.world not in QI_WORLDS:
+            self.stats['skipped_world'] += 1
+            return
+        if info.raw_type in QI_SKIP_TYPES:
+            self.stats['skipped_type'] += 1
+            return
+        if info.size is None:
+            self.stats['skipped_no_size'] += 1
+            return
+
+        app_type, color = infer_qi_type(info.id_parts, info.raw_type)
 
-        raw_type = entity.get('type', '')
-        if raw_type in QI_SKIP_TYPES:
-            stats['skipped_type'] += 1
-            continue
+        # Deduplicate impediments: keep only the first occurrence of each (w, h)
+        if app_type == 'impediment':
+            if info.size in self.seen_impediment_sizes:
+                self.stats['skipped_impediment_dup'] += 1
+                return
+            self.seen_impediment_sizes.add(info.size)
+
+        self.buildings[info.id] = info.record(app_type, 'Quantum Incursion', color)
+        self.stats['included'] += 1
+
+    def finish(self, data_dir):
+        write_js(self.buildings, data_dir / 'qi_buildings_database.js', export_name='QI_BUILDINGS')
+        self.print_stats([
+            ('included',               'Included:'),
+            ('skipped_type',           'Skipped (non-placeable type):'),
+            ('skipped_world',          'Skipped (not QI world):'),
+            ('skipped_no_size',        'Skipped (no size data):'),
+            ('skipped_impediment_dup', 'Skipped (impediment duplicate):'),
+        ])
+
+
+# Dump world segment -> SETTLEMENT_TYPES id (js/constants.js)
+SETTLEMENT_WORLDS = {
+    'Vikings':   'vikings',
+    'Japanese':  'feudal_japan',
+    'Feudal':    'feudal_japan',
+    'Egyptians': 'egypt',
+    'Aztecs':    'aztecs',
+    'Mughals':   'mughal',
+    'Mughal':    'mughal',
+    'Polynesia': 'polynesia',
+    'Pirates':   'pirates',
+}
 
-        size = get_size(entity)
-        if size is None or size[0] <= 0 or size[1] <= 0:
-            stats['skipped_no_size'] += 1
-            continue
 
-        width, height = size
-        app_type, color = infer_qi_type(id_parts, raw_type)
+@register_sink
+class SettlementCheckSink(Sink):
+    """
+    Cultural settlements. data/settlement_buildings_database.js is curated by
+    hand (wiki names, its own IDs), so this sink does not rewrite it; it
+    cross-checks the curated footprints against the dump by building name
+    and reports size mismatches and dump buildings the planner lacks.
+    """
 
-        # Deduplicate impediments: keep only the first occurrence of each (w, h)
-        if app_type == 'impediment':
-            if (width, height) in seen_impediment_sizes:
-                stats['skipped_impediment_dup'] += 1
+    name  = 'settlement'
+    title = 'Cultural settlements (check against curated database)'
+    stage = 'check_settlement'
+    stat_keys = ('seen', 'matched', 'size_mismatch', 'missing')
+
+    _CURATED_RE = re.compile(
+        r"name:\s*'((?:[^'\\]|\\.)*)',\s*width:\s*(\d+),\s*height:\s*(\d+),"
+        r".*?settlementType:\s*'(\w+)'", re.S)
+
+    def add(self, info):
+        settlement = SETTLEMENT_WORLDS.get(info.world)
+        if settlement is None or info.raw_type in SKIP_TYPES or info.size is None:
+            return
+        self.stats['seen'] += 1
+        name = info.entity.get('name', info.id).strip().lower()
+        self.buildings[(settlement, name)] = (info.id, info.size)
+
+    def finish(self, data_dir):
+        curated_path = data_dir / 'settlement_buildings_database.js'
+        if not self.buildings or not curated_path.exists():
+            return
+        curated = {}
+        for name, width, height, settlement in self._CURATED_RE.findall(
+                curated_path.read_text(encoding='utf-8')):
+            curated[(settlement, name.replace("\\'", "'").lower())] = (int(width), int(height))
+
+        problems = []
+        for key, (entity_id, size) in sorted(self.buildings.items()):
+            if key not in curated:
+                self.stats['missing'] += 1
+                problems.append(f'  missing  {key[0]:<13} {entity_id} {size[0]}x{size[1]}')
                 continue
-            seen_impediment_sizes.add((width, height))
+            self.stats['matched'] += 1
+            if set(curated[key]) != set(size):  # either orientation is fine
+                self.stats['size_mismatch'] += 1
+                problems.append(f'  size     {key[0]:<13} {entity_id}: curated '
+                                f'{curated[key][0]}x{curated[key][1]}, game {size[0]}x{size[1]}')
+        self.print_stats([
+            ('seen',          'Placeable in dump:'),
+            ('matched',       'Matched by name:'),
+            ('size_mismatch', 'Footprint differs:'),
+            ('missing',       'Not in curated database:'),
+        ])
+        if self.stats['matched'] == 0:
+            print('  (no names matched: the dump is probably not from an English server)')
+        else:
+            for line in problems:
+                print(line)
 
-        req = entity.get('requirements', {}) or {}
-        needs_road = req.get('street_connection_level', 0)
-        if not needs_road:
-            try:
-                needs_road = entity['components']['AllAge']['streetConnectionRequirement']['requiredLevel']
-            except (KeyError, TypeError):
-                pass
 
-        prod_stats  = get_production_stats(entity)
-        boost_stats = get_boosts(entity)
+def convert(data):
+    """Convert the raw list of game entities to the main city database dict."""
+    sink, = run_pipeline(data, [MainCitySink()])
+    return sink.buildings, sink.stats
 
-        key = entity['id']
-        buildings[key] = {
-            'name':      entity.get('name', key),
-            'width':     width,
-            'height':    height,
-            'type':      app_type,
-            'age':       'Quantum Incursion',
-            'color':     color,
-            'needsRoad': needs_road,
-        }
-        if prod_stats:
-            buildings[key]['prod'] = prod_stats
-        if boost_stats:
-            buildings[key]['boosts'] = boost_stats
-        stats['included'] += 1
 
-    return buildings, stats
+def convert_qi(data):
+    """Convert QI (Guild Raids) entities to the database dict (see QISink)."""
+    sink, = run_pipeline(data, [QISink()])
+    return sink.buildings, sink.stats
 
 
-def write_js(buildings, out_path, export_name='BUILDINGS'):
-    """Write the buildings dict as an ES module JS file."""
-    lines = [
-        '// Auto-generated by tools/build_database.py — do not edit by hand.',
-        f'// Total buildings: {len(buildings)}',
-        f'export const {export_name} = {{',
-    ]
+def convert_all(entities):
+    """
+    Run the main city and QI conversions over entities in a single pass.
+    Returns (buildings, stats, qi_buildings, qi_stats).
+    """
+    main_sink, qi_sink = run_pipeline(entities, [MainCitySink(), QISink()])
+    return main_sink.buildings, main_sink.stats, qi_sink.buildings, qi_sink.stats
 
-    # Sort by era order, then name
+
+def sorted_buildings(buildings):
+    """(id, building) pairs in output order: era order, then name."""
     era_order = list(ERA_MAP.values())
     def sort_key(item):
         b = item[1]
@@ -644,29 +1545,446 @@ def write_js(buildings, out_path, export_name='BUILDINGS'):
         except ValueError:
             era_idx = 999
         return (era_idx, b['name'])
+    return sorted(buildings.items(), key=sort_key)
+
+
+def shard_slug(age):
+    """File-name slug for an age label: 'Space Age Mars' -> 'space_age_mars'."""
+    return re.sub(r'[^a-z0-9]+', '_', age.lower()).strip('_') or 'other'
+
+
+@profiled('write_js')
+def write_js(buildings, out_path, export_name='BUILDINGS', shard_dir=None):
+    """
+    Write the buildings dict as an ES module JS file.
+
+    With shard_dir, out_path becomes a light index (name, size, type, age,
+    color, needsRoad, plus the `shard` holding the rest) and the heavy
+    prod/boosts payloads go to one <shard_dir>/<age slug>.js per age. The
+    index also exports BUILDING_SHARDS, a map of shard -> dynamic import,
+    so the app only downloads and parses the ages it actually needs, and
+    RATE_KEYS, the resource dictionary of the app's per-day production rows
+    (see rate_keys).
+    """
+    lines = [
+        '// Auto-generated by tools/build_database.py — do not edit by hand.',
+        f'// Total buildings: {len(buildings)}',
+        f'export const {export_name} = {{',
+    ]
 
-    for key, b in sorted(buildings.items(), key=sort_key):
-        prod_str   = ''
-        boosts_str = ''
+    shards = {}  # slug -> [payload lines]
+    for key, b in sorted_buildings(buildings):
+        payload = ''
         if 'prod' in b:
-            prod_str = f', prod: {json.dumps(b["prod"], separators=(",", ":"))}'
+            payload += f', prod: {json.dumps(b["prod"], separators=(",", ":"))}'
         if 'boosts' in b:
-            boosts_str = f', boosts: {json.dumps(b["boosts"], separators=(",", ":"))}'
+            payload += f', boosts: {json.dumps(b["boosts"], separators=(",", ":"))}'
+        if shard_dir is not None and payload:
+            slug = shard_slug(b['age'])
+            shards.setdefault(slug, []).append(f'    {json.dumps(key)}: {{{payload[1:]} }},')
+            payload = f', shard: {json.dumps(slug)}'
         lines.append(
             f'    {json.dumps(key)}: {{'
             f' name: {json.dumps(b["name"])},'
             f' width: {b["width"]}, height: {b["height"]},'
             f' type: {json.dumps(b["type"])}, age: {json.dumps(b["age"])},'
             f' color: {json.dumps(b["color"])}, needsRoad: {b["needsRoad"]}'
-            f'{prod_str}{boosts_str} }},'
+            f'{payload} }},'
         )
 
     lines.append('};')
     lines.append('')
 
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text('\n'.join(lines), encoding='utf-8')
-    print(f'Wrote {out_path}')
+    if shard_dir is not None:
+        lines.append('// Resource dictionary for per-day production rows: one 24h-normalised value')
+        lines.append('// per key, per era (population / happiness / demandHappiness are not timed).')
+        lines.append(f'export const RATE_KEYS = {json.dumps(rate_keys(buildings))};')
+        lines.append('')
+        loaders = write_shards(shards, shard_dir)
+        rel = shard_dir.relative_to(out_path.parent).as_posix()
+        lines.append('// Lazily imported prod/boosts payloads, one module per age (see js/BuildingShards.js).')
+        lines.append('export const BUILDING_SHARDS = {')
+        for slug, digest in loaders:
+            # Literal specifiers so bundlers can see (and inline) every shard.
+            lines.append(f"    {json.dumps(slug)}: () => import('./{rel}/{slug}.js?v={digest}'),")
+        lines.append('};')
+        lines.append('')
+
+    write_output(out_path, '\n'.join(lines))
+
+
+def write_shards(shards, shard_dir):
+    """
+    Write one payload module per shard, drop stale ones, and print a size
+    report. Returns [(slug, content hash)] for the index's loader map.
+    """
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    for stale in shard_dir.glob('*.js*'):
+        if stale.name.split('.', 1)[0] not in shards:
+            stale.unlink()
+
+    loaders = []
+    total = 0
+    print(f'Payload shards in {shard_dir} (* = rewritten):')
+    for slug in sorted(shards):
+        path = shard_dir / f'{slug}.js'
+        body = [
+            '// Auto-generated by tools/build_database.py — do not edit by hand.',
+            f'// prod/boosts for {len(shards[slug])} buildings; merged into the index on demand.',
+            'export const PAYLOAD = {',
+            *shards[slug],
+            '};',
+            '',
+        ]
+        changed = write_output(path, '\n'.join(body), verbose=False)
+        gz = len(gzip.compress(path.read_bytes(), compresslevel=9, mtime=0))
+        size = path.stat().st_size
+        total += size
+        print(f'{"*" if changed else " "} {slug:<28} {len(shards[slug]):>5} buildings  '
+              f'{size:>10,} bytes  ({gz:,} gzip)')
+        loaders.append((slug, content_hash(path)))
+    print(f'  {"total":<28} {sum(len(v) for v in shards.values()):>5} buildings  {total:>10,} bytes')
+    return loaders
+
+
+_JS_ENTRY_RE = re.compile(r'^    ("(?:[^"\\]|\\.)*"): \{ (.*) \},$')
+_JS_FIELD_RE = re.compile(r'(^|, )(name|width|height|type|age|color|needsRoad|shard|prod|boosts): ')
+
+
+@profiled('read_js')
+def read_js(out_path, shard_dir=None):
+    """
+    Read a database written by write_js() back into a buildings dict
+    (payload shards are merged back in). Used to re-export the committed
+    data without a fresh city_entities dump.
+    """
+    def entries(path):
+        for line in path.read_text(encoding='utf-8').splitlines():
+            m = _JS_ENTRY_RE.match(line)
+            if m:
+                yield json.loads(m.group(1)), json.loads('{' + _JS_FIELD_RE.sub(r'\1"\2": ', m.group(2)) + '}')
+
+    buildings = dict(entries(out_path))
+    if shard_dir is not None and shard_dir.is_dir():
+        for path in sorted(shard_dir.glob('*.js')):
+            for key, payload in entries(path):
+                if key in buildings:
+                    buildings[key].update(payload)
+    for b in buildings.values():
+        b.pop('shard', None)
+    return buildings
+
+
+# ── Binary (columnar) export ──────────────────────────────────────────────────
+# Layout, all little-endian; decoded by js/BinaryDatabase.js:
+#   header   'FOEB', then 15 × u32: version, count, nStrings, stringBytes,
+#            nValues, nStats, nStatPairs, nProds, nProdPairs, nBoostSets,
+#            nBoosts, nTypes, nAges, nColors, reserved (64 bytes in total)
+#   f64      values[nValues]                   distinct stat/boost values
+#   u32      strOffsets[nStrings+1], id[count], name[count],
+#            statStart[nStats+1], statValue[nStatPairs],
+#            prodStart[nProds+1], prodStat[nProdPairs],
+#            boostStart[nBoostSets+1], boostValue[nBoosts]
+#   i32      prodRef[count], boostRef[count]   -1 = none
+#   u16      statKey[nStatPairs], prodEra[nProdPairs], boostType[nBoosts],
+#            boostFeature[nBoosts], typeTable[nTypes], ageTable[nAges],
+#            colorTable[nColors]               string indices
+#   u8       width, height, type, age, color, needsRoad [count each],
+#            strings[stringBytes]              UTF-8, sliced by strOffsets
+# Sections are ordered by element size so every typed array stays aligned.
+# Identical per-era stat dicts, prod dicts and boost lists are stored once.
+BINARY_NAME    = 'foe_buildings_database.bin'
+BINARY_MAGIC   = b'FOEB'
+BINARY_VERSION = 1
+
+
+@profiled('write_binary')
+def write_binary(buildings, out_path):
+    """Write buildings in the columnar binary format described above."""
+    strings, string_idx = [], {}
+    def intern(text):
+        if text not in string_idx:
+            string_idx[text] = len(strings)
+            strings.append(text)
+        return string_idx[text]
+
+    ordered = sorted_buildings(buildings)
+
+    # Small vocabularies first so their indices fit in u16 columns.
+    for _, b in ordered:
+        for era, stats in (b.get('prod') or {}).items():
+            intern(era)
+            for k in stats:
+                intern(k)
+        for boost in b.get('boosts') or []:
+            intern(boost['type'])
+            intern(boost['feature'])
+    codes = {}
+    for field in ('type', 'age', 'color'):
+        table = list(dict.fromkeys(b[field] for _, b in ordered))
+        if len(table) > 255:
+            raise ValueError(f'too many distinct {field} values for a u8 column')
+        codes[field] = ({v: i for i, v in enumerate(table)}, array('H', map(intern, table)))
+    if len(strings) > 0xFFFF:
+        raise ValueError('vocabulary does not fit u16 string indices')
+
+    values, value_idx = array('d'), {}
+    def value(v):
+        if v not in value_idx:
+            value_idx[v] = len(values)
+            values.append(v)
+        return value_idx[v]
+
+    stat_start, stat_key, stat_value, stat_idx = array('I', [0]), array('H'), array('I'), {}
+    prod_start, prod_era, prod_stat, prod_idx  = array('I', [0]), array('H'), array('I'), {}
+    boost_start, boost_type, boost_feature, boost_value, boost_idx = (
+        array('I', [0]), array('H'), array('H'), array('I'), {})
+
+    def stat_record(stats):
+        # Key order is kept: tooltips list stats in database order.
+        sig = tuple(stats.items())
+        if sig not in stat_idx:
+            stat_idx[sig] = len(stat_start) - 1
+            for k, v in sig:
+                stat_key.append(string_idx[k])
+                stat_value.append(value(v))
+            stat_start.append(len(stat_key))
+        return stat_idx[sig]
+
+    def prod_record(prod):
+        sig = tuple((era, stat_record(stats)) for era, stats in prod.items())
+        if sig not in prod_idx:
+            prod_idx[sig] = len(prod_start) - 1
+            for era, ref in sig:
+                prod_era.append(string_idx[era])
+                prod_stat.append(ref)
+            prod_start.append(len(prod_era))
+        return prod_idx[sig]
+
+    def boost_record(boosts):
+        sig = tuple((x['type'], x['feature'], x['value']) for x in boosts)
+        if sig not in boost_idx:
+            boost_idx[sig] = len(boost_start) - 1
+            for btype, feature, bval in sig:
+                boost_type.append(string_idx[btype])
+                boost_feature.append(string_idx[feature])
+                boost_value.append(value(bval))
+            boost_start.append(len(boost_type))
+        return boost_idx[sig]
+
+    ids, names, prod_ref, boost_ref = array('I'), array('I'), array('i'), array('i')
+    small = {f: array('B') for f in ('width', 'height', 'type', 'age', 'color', 'needsRoad')}
+    for key, b in ordered:
+        ids.append(intern(key))
+        names.append(intern(b['name']))
+        prod_ref.append(prod_record(b['prod']) if b.get('prod') else -1)
+        boost_ref.append(boost_record(b['boosts']) if b.get('boosts') else -1)
+        small['width'].append(b['width'])
+        small['height'].append(b['height'])
+        small['needsRoad'].append(b['needsRoad'])
+        for field in ('type', 'age', 'color'):
+            small[field].append(codes[field][0][b[field]])
+
+    blobs = [s.encode('utf-8') for s in strings]
+    offsets = array('I', [0])
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+
+    header = struct.pack('<4s15I', BINARY_MAGIC, BINARY_VERSION, len(ordered), len(strings),
+                         offsets[-1], len(values), len(stat_start) - 1, len(stat_key),
+                         len(prod_start) - 1, len(prod_era), len(boost_start) - 1,
+                         len(boost_type), len(codes['type'][1]), len(codes['age'][1]),
+                         len(codes['color'][1]), 0)
+    sections = [
+        values,
+        offsets, ids, names, stat_start, stat_value, prod_start, prod_stat,
+        boost_start, boost_value,
+        prod_ref, boost_ref,
+        stat_key, prod_era, boost_type, boost_feature,
+        codes['type'][1], codes['age'][1], codes['color'][1],
+        small['width'], small['height'], small['type'], small['age'], small['color'],
+        small['needsRoad'],
+    ]
+    if sys.byteorder == 'big':
+        for section in sections:
+            section.byteswap()
+    write_output(out_path, header + b''.join(a.tobytes() for a in sections) + b''.join(blobs))
+    print(f'  {len(strings):,} strings, {len(values):,} values, {len(stat_start) - 1:,} stat / '
+          f'{len(prod_start) - 1:,} prod / {len(boost_start) - 1:,} boost records')
+
+
+def report_binary(js_paths, bin_path):
+    """Print the size (and, with node on PATH, decode-time) win over the JS modules."""
+    js_raw = sum(p.stat().st_size for p in js_paths)
+    js_gz  = sum(len(gzip.compress(p.read_bytes(), compresslevel=9, mtime=0)) for p in js_paths)
+    bin_raw = bin_path.stat().st_size
+    bin_gz  = len(gzip.compress(bin_path.read_bytes(), compresslevel=9, mtime=0))
+    print()
+    print('Binary vs JS module database:')
+    print(f'  JS modules ({len(js_paths)} files): {js_raw:>11,} bytes  {js_gz:>9,} gzip')
+    print(f'  Binary:                {bin_raw:>11,} bytes  {bin_gz:>9,} gzip'
+          f'  ({bin_raw / js_raw:.0%} / {bin_gz / js_gz:.0%})')
+
+    node = shutil.which('node')
+    bench = Path(__file__).resolve().parent / 'bench-db-format.mjs'
+    if not node:
+        print('  (install node to also compare parse times)')
+        return
+    subprocess.run([node, '--no-warnings', str(bench), str(bin_path)], check=False)
+
+
+def write_output(path, content, verbose=True):
+    """
+    Write content (str or bytes) to path only if it differs from what is
+    already there, so unchanged outputs keep their mtime, ETag and git
+    state. Precompressed siblings are refreshed along with the file (or
+    when missing). Returns True if the file was written.
+    """
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    if path.exists() and path.read_bytes() == data:
+        if not path.with_name(path.name + '.gz').exists():
+            write_compressed(path, verbose)
+        if verbose:
+            print(f'Unchanged {path}')
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    if verbose:
+        print(f'Wrote {path}  ({len(data):,} bytes)')
+    write_compressed(path, verbose)
+    return True
+
+
+def write_compressed(path, verbose=True):
+    """
+    Write precompressed siblings of path (path.gz, and path.br if brotli is
+    installed) so the server never has to compress per request.
+    gzip mtime is pinned to 0 so unchanged input gives byte-identical output.
+    """
+    raw = path.read_bytes()
+    variants = [('.gz', gzip.compress(raw, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append(('.br', brotli.compress(raw, quality=11)))
+    for suffix, blob in variants:
+        out = path.with_name(path.name + suffix)
+        out.write_bytes(blob)
+        if verbose:
+            print(f'Wrote {out}  ({len(blob):,} bytes, {len(blob) / max(len(raw), 1):.1%} of {len(raw):,})')
+
+
+MANIFEST_NAME = 'manifest.js'
+SHARD_DIR_NAME = 'foe_buildings'  # data/foe_buildings/<age>.js payload shards
+
+
+def content_hash(path):
+    """Short content hash used in manifest URLs (server.py computes the same)."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:12]
+
+
+@profiled('write_manifest')
+def write_manifest(data_dir):
+    """
+    Write data/manifest.js: one re-export per data module, addressed as
+    './<file>.js?v=<content hash>' so changed data gets a new URL and
+    unchanged data can be cached forever.
+    """
+    lines = [
+        '// Auto-generated by tools/build_database.py — do not edit by hand.',
+        '// The ?v= hashes let server.py serve these modules as immutable;',
+        '// re-run `python tools/build_database.py --manifest` after editing data by hand.',
+    ]
+    for path in sorted(data_dir.glob('*.js')):
+        if path.name == MANIFEST_NAME:
+            continue
+        names = re.findall(r'^export const (\w+)', path.read_text(encoding='utf-8'), re.M)
+        if names:
+            lines.append(f"export {{ {', '.join(names)} }} from './{path.name}?v={content_hash(path)}';")
+    lines.append('')
+    write_output(data_dir / MANIFEST_NAME, '\n'.join(lines))
+
+
+# ── Localised names (--locale) ────────────────────────────────────────────────
+# The game serves the same city_entities dump per language server, differing
+# only in the display strings. Geometry, production and boosts come from the
+# main dump; other locales contribute their names alone, as one small module
+# per locale that the app imports when that language is active.
+
+NAMES_DIR_NAME   = 'names'              # data/names/<locale>.js name tables
+NAME_TABLES_NAME = 'building_names.js'  # data/building_names.js: locale -> loader
+
+_LOCALE_RE = re.compile(r'^[a-z]{2}(?:-[A-Z]{2})?$')
+
+
+def parse_locale(value):
+    """Split a --locale CODE=SOURCE value into (code, source)."""
+    code, sep, source = value.partition('=')
+    if not sep or not source or not _LOCALE_RE.match(code):
+        print(f'--locale needs CODE=SOURCE (e.g. de=<url or file>), got {value!r}.')
+        sys.exit(2)
+    return code, source
+
+
+def locale_names(source, offline=False, refresh=False, procs=None):
+    """
+    {id: name} for every entity in a localised dump. Runs in a worker
+    thread so the download overlaps the main build. The parse is pure
+    Python and holds the GIL, so in a thread it only competes with the
+    main build; with procs (build's --jobs process pool) it runs there.
+    """
+    path = str(fetch_dump(source, offline=offline, refresh=refresh)) if is_url(source) else source
+    if procs is not None:
+        return procs.submit(parse_names, path, source).result()
+    return parse_names(path, source)
+
+
+def parse_names(path, source):
+    """{id: name} from a dump on disk (source names it in errors); also a pool worker."""
+    names = {}
+    try:
+        for entity in iter_entities(path):
+            if isinstance(entity, dict) and 'id' in entity:
+                names[entity['id']] = entity.get('name', entity['id'])
+    except ValueError as e:  # includes json.JSONDecodeError
+        print(f'Error: could not parse {source}: {e}')
+        sys.exit(1)
+    return names
+
+
+@profiled('write_names')
+def write_name_tables(tables, data_dir):
+    """
+    Write data/names/<locale>.js (export const NAMES = {id: name}) for each
+    locale in tables, then data/building_names.js with NAME_TABLES, a map of
+    locale -> dynamic import of every table on disk (see js/BuildingNames.js).
+    Tables of locales not passed this time are kept.
+    """
+    names_dir = data_dir / NAMES_DIR_NAME
+    names_dir.mkdir(parents=True, exist_ok=True)
+    print(f'Name tables in {names_dir} (* = rewritten):')
+    for code in sorted(tables):
+        path = names_dir / f'{code}.js'
+        body = [
+            '// Auto-generated by tools/build_database.py — do not edit by hand.',
+            f'// Building names for locale {code}: {len(tables[code])} buildings.',
+            'export const NAMES = {',
+            *(f'    {json.dumps(k)}: {json.dumps(v, ensure_ascii=False)},' for k, v in sorted(tables[code].items())),
+            '};',
+            '',
+        ]
+        changed = write_output(path, '\n'.join(body), verbose=False)
+        print(f'{"*" if changed else " "} {code:<8} {len(tables[code]):>5} names  {path.stat().st_size:>10,} bytes')
+
+    lines = [
+        '// Auto-generated by tools/build_database.py — do not edit by hand.',
+        '// Lazily imported building-name tables, one module per locale (see js/BuildingNames.js).',
+        'export const NAME_TABLES = {',
+    ]
+    for path in sorted(names_dir.glob('*.js')):
+        code = path.name[:-len('.js')]
+        lines.append(f"    {json.dumps(code)}: () => import('./{NAMES_DIR_NAME}/{code}.js?v={content_hash(path)}'),")
+    lines.append('};')
+    lines.append('')
+    write_output(data_dir / NAME_TABLES_NAME, '\n'.join(lines))
 
 
 def source_hash(source):
@@ -684,33 +2002,197 @@ def read_stored_hash(data_dir):
     return m.group(1) if m else None
 
 
-def write_meta(data_dir, src_hash, main_count, qi_count):
-    """Write data/db_meta.js so the app can display database freshness."""
+@profiled('write_meta')
+def write_meta(data_dir, src_hash, main_count, qi_count, changed=True):
+    """
+    Write data/db_meta.js so the app can display database freshness.
+    generatedAt only moves when something else in the file changes or the
+    databases themselves changed (changed=True), so a no-op rebuild leaves
+    the file alone.
+    """
     from datetime import date
     meta_path = data_dir / 'db_meta.js'
-    meta_path.write_text(
-        '// Auto-generated by tools/build_database.py — do not edit by hand.\n'
-        'export const DB_META = {\n'
-        f"    generatedAt: '{date.today().isoformat()}',\n"
-        f"    sourceHash:  '{src_hash or 'local-file'}',\n"
-        f'    mainCount:   {main_count},\n'
-        f'    qiCount:     {qi_count},\n'
-        '};\n',
-        encoding='utf-8')
-    print(f'Wrote {meta_path}')
+    def render(day):
+        return ('// Auto-generated by tools/build_database.py — do not edit by hand.\n'
+                'export const DB_META = {\n'
+                f"    generatedAt: '{day}',\n"
+                f"    sourceHash:  '{src_hash or 'local-file'}',\n"
+                f'    mainCount:   {main_count},\n'
+                f'    qiCount:     {qi_count},\n'
+                '};\n')
+    day = date.today().isoformat()
+    if not changed and meta_path.exists():
+        m = re.search(r"generatedAt:\s*'([^']*)'", meta_path.read_text(encoding='utf-8'))
+        if m and meta_path.read_text(encoding='utf-8') == render(m.group(1)):
+            day = m.group(1)
+    write_output(meta_path, render(day))
+
+
+def pop_option(argv, name):
+    """Remove `name VALUE` from argv and return VALUE (None if name is absent)."""
+    if name not in argv:
+        return None
+    i = argv.index(name)
+    if i + 1 >= len(argv):
+        print(f'{name} needs a value.')
+        sys.exit(2)
+    value = argv[i + 1]
+    del argv[i:i + 2]
+    return value
+
+
+def binary_js_paths(data_dir):
+    return [data_dir / 'foe_buildings_database.js',
+            *sorted((data_dir / SHARD_DIR_NAME).glob('*.js'))]
+
+
+def build(source, data_dir, in_memory=False, use_cache=True, jobs=1, binary=False,
+          offline=False, refresh=False, locales=()):
+    """
+    Convert source into the data/ databases; return a summary dict for
+    --profile-json. locales is [(code, source)] of localised dumps to take
+    name tables from; they are fetched in threads meanwhile and, with
+    jobs > 1, parsed in the same process pool as the main dump.
+    """
+    procs = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    pool = ThreadPoolExecutor(max_workers=len(locales)) if locales else None
+    pending = {code: pool.submit(locale_names, src, offline, refresh, procs) for code, src in locales}
+    with stage('ingest'):
+        path = str(fetch_dump(source, offline=offline, refresh=refresh)) if is_url(source) else source
+        if in_memory:
+            data = load_data(path)
+            if not isinstance(data, list):
+                print(f'Error: expected a JSON array, got {type(data).__name__}')
+                sys.exit(1)
+        else:
+            data = iter_entities(path, with_text=True)
+        sinks = [cls() for cls in SINKS.values()]
+        cache = EntityCache() if use_cache else None
+        try:
+            run_pipeline(data, sinks, cache, jobs=jobs, pool=procs)
+        except ValueError as e:  # includes json.JSONDecodeError
+            print(f'Error: could not parse {source}: {e}')
+            sys.exit(1)
+    if cache is not None:
+        cache.save()
+    by_name = {sink.name: sink for sink in sinks}
+    buildings    = by_name['main'].buildings
+    qi_buildings = by_name['qi'].buildings
+
+    # Previous databases, for the diff summary (read before they are overwritten)
+    old_main = read_js(data_dir / 'foe_buildings_database.js', data_dir / SHARD_DIR_NAME) \
+        if (data_dir / 'foe_buildings_database.js').exists() else {}
+    old_qi = read_js(data_dir / 'qi_buildings_database.js') \
+        if (data_dir / 'qi_buildings_database.js').exists() else {}
+
+    # Every entity lands in exactly one main-city bucket
+    entities = sum(by_name['main'].stats.values())
+    print(f'Loaded {entities} entities.')
+
+    for sink in sinks:
+        sink.finish(data_dir)
+    print()
+
+    if pending:
+        with stage('locale_names'):
+            tables = {code: future.result() for code, future in pending.items()}
+        pool.shutdown()
+        ids = buildings.keys() | qi_buildings.keys()
+        tables = {code: {i: names[i] for i in ids if i in names} for code, names in tables.items()}
+        for code, names in tables.items():
+            if len(names) < len(ids):
+                print(f'Note: the {code} dump lacks {len(ids) - len(names)} of {len(ids)} buildings; '
+                      f'the app keeps their database names.')
+        write_name_tables(tables, data_dir)
+        print()
+    if procs is not None:
+        procs.shutdown()
+
+    out_bin = data_dir / BINARY_NAME
+    if binary:
+        write_binary(buildings, out_bin)
+        report_binary(binary_js_paths(data_dir), out_bin)
+
+    changed = old_main != buildings or old_qi != qi_buildings
+    write_meta(data_dir, source_hash(source), len(buildings), len(qi_buildings), changed=changed)
+    write_manifest(data_dir)
+
+    print()
+    print_diff('Main city database', old_main, buildings)
+    print_diff('QI database', old_qi, qi_buildings)
+    return {
+        'source_hash': source_hash(source),
+        'entities': entities,
+        'main_count': len(buildings),
+        'qi_count': len(qi_buildings),
+        'locales': sorted(pending),
+        'changed': changed,
+    }
 
 
 def main():
-    args = [a for a in sys.argv[1:] if a != '--check']
-    check_only = '--check' in sys.argv[1:]
+    global PROFILE
+    flags = {'--check', '--compress', '--manifest', '--binary', '--in-memory', '--no-cache',
+             '--profile', '--offline', '--refresh'}
+    argv = sys.argv[1:]
+    jobs = pop_option(argv, '--jobs')
+    if jobs is not None:
+        try:
+            jobs = int(jobs)
+        except ValueError:
+            print('--jobs needs a number (0 = one per CPU).')
+            sys.exit(2)
+        jobs = jobs or os.cpu_count() or 1
+    else:
+        jobs = 1
+    locales = []
+    while '--locale' in argv:
+        locales.append(parse_locale(pop_option(argv, '--locale')))
+    profile_json = pop_option(argv, '--profile-json')
+    pstats_path  = pop_option(argv, '--pstats')
+    args = [a for a in argv if a not in flags]
+    check_only    = '--check' in argv
+    compress_only = '--compress' in argv
+    manifest_only = '--manifest' in argv
+    binary        = '--binary' in argv
+    in_memory     = '--in-memory' in argv
+    use_cache     = '--no-cache' not in argv
+    offline       = '--offline' in argv
+    refresh       = '--refresh' in argv
+    profile       = bool('--profile' in argv or profile_json or pstats_path)
+    data_dir = Path(__file__).resolve().parent.parent / 'data'
+    out_bin  = data_dir / BINARY_NAME
+
+    if manifest_only:
+        write_manifest(data_dir)
+        sys.exit(0)
+
+    if compress_only:
+        if brotli is None:
+            print('Note: brotli not installed, writing .gz only (pip install brotli for .br).')
+        for path in sorted(data_dir.rglob('*.js')):
+            write_compressed(path)
+        sys.exit(0)
+
+    if binary and not args:
+        buildings = read_js(data_dir / 'foe_buildings_database.js', data_dir / SHARD_DIR_NAME)
+        write_binary(buildings, out_bin)
+        report_binary(binary_js_paths(data_dir), out_bin)
+        sys.exit(0)
+
+    if not args and offline:
+        cache = DumpCache()
+        key = cache.latest()
+        if key is None:
+            print(f'Error: --offline, and the dump cache ({cache.root}) is empty.')
+            sys.exit(1)
+        args = [cache.meta(key).get('url') or str(cache.path(key))]
+
     if not args:
         print(__doc__)
         sys.exit(1)
 
     source = args[0]
-    data_dir = Path(__file__).resolve().parent.parent / 'data'
-    out_main = data_dir / 'foe_buildings_database.js'
-    out_qi   = data_dir / 'qi_buildings_database.js'
 
     if check_only:
         new_hash    = source_hash(source)
@@ -726,37 +2208,41 @@ def main():
         print('Re-run without --check to rebuild.')
         sys.exit(1)
 
-    data = load_data(source)
-    if not isinstance(data, list):
-        print(f'Error: expected a JSON array, got {type(data).__name__}')
-        sys.exit(1)
-
-    print(f'Loaded {len(data)} entities.')
-
-    # ── Main city buildings ───────────────────────────────────────────────────
-    buildings, stats = convert(data)
-    write_js(buildings, out_main, export_name='BUILDINGS')
+    if not profile:
+        build(source, data_dir, in_memory, use_cache, jobs, binary, offline, refresh, locales)
+        return
 
-    print()
-    print('Main city buildings:')
-    print(f'  Included:                      {stats["included"]}')
-    print(f'  Skipped (non-placeable type):  {stats["skipped_type"]}')
-    print(f'  Skipped (settlement/QI):       {stats["skipped_world"]}')
-    print(f'  Skipped (no size data):        {stats["skipped_no_size"]}')
-
-    # ── Quantum Incursion buildings ───────────────────────────────────────────
-    qi_buildings, qi_stats = convert_qi(data)
-    write_js(qi_buildings, out_qi, export_name='QI_BUILDINGS')
-
-    print()
-    print('Quantum Incursion buildings:')
-    print(f'  Included:                      {qi_stats["included"]}')
-    print(f'  Skipped (non-placeable type):  {qi_stats["skipped_type"]}')
-    print(f'  Skipped (not QI world):        {qi_stats["skipped_world"]}')
-    print(f'  Skipped (no size data):        {qi_stats["skipped_no_size"]}')
-    print(f'  Skipped (impediment duplicate):{qi_stats["skipped_impediment_dup"]}')
-
-    write_meta(data_dir, source_hash(source), len(buildings), len(qi_buildings))
+    PROFILE = BuildProfile()
+    profiler = None
+    if pstats_path:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        summary = build(source, data_dir, in_memory, use_cache, jobs, binary, offline, refresh, locales)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+    PROFILE.finalize()
+    PROFILE.report()
+    report = {
+        'source': source,
+        'python': sys.version.split()[0],
+        'jobs': jobs,
+        'in_memory': in_memory,
+        'cache': use_cache,
+        'offline': offline,
+        **summary,
+        **PROFILE.as_dict(),
+    }
+    if profiler is not None:
+        profiler.dump_stats(pstats_path)
+        report['hot_functions'] = hot_functions(profiler)
+        print_hot_functions(report['hot_functions'])
+        print(f'cProfile stats written to {pstats_path} (python -m pstats {pstats_path})')
+    if profile_json:
+        Path(profile_json).write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+        print(f'Profile report written to {profile_json}')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,58 @@
+#!/usr/bin/env node
+/**
+ * dist/ lazy-chunk checker — run after the rollup build (build.mjs does, and so
+ * does CI before deploying).
+ *
+ * Every data module that the app imports lazily (building shards, name tables)
+ * must be its own chunk, and none of those chunks may be reachable through the
+ * static imports of dist/main.js; either mistake means the data is downloaded
+ * and parsed at startup again. Exits with code 1 if any module is inlined or
+ * statically imported.
+ */
+import { existsSync, readFileSync, readdirSync } from 'fs';
+import { dirname, join, posix } from 'path';
+import { fileURLToPath } from 'url';
+
+const ROOT = join(dirname(fileURLToPath(import.meta.url)), '..');
+const DIST = join(ROOT, 'dist');
+const LAZY_DIRS = ['data/foe_buildings', 'data/names'];
+
+// import {a} from "./x.js" / import "./x.js" / export {a} from "./x.js" — not import("./x.js")
+const STATIC_IMPORT = /\b(?:import|export)\s*(?:[\w$*{}\s,]+?\s*from\s*)?["']([^"']+)["']/g;
+
+if (!existsSync(join(DIST, 'main.js'))) {
+    console.error('dist/main.js not found — run the build first.');
+    process.exit(1);
+}
+
+const chunks = existsSync(join(DIST, 'chunks')) ? readdirSync(join(DIST, 'chunks')) : [];
+const lazy = LAZY_DIRS
+    .filter(dir => existsSync(join(ROOT, dir)))
+    .flatMap(dir => readdirSync(join(ROOT, dir)).filter(f => f.endsWith('.js')).map(f => `${dir}/${f}`));
+
+const chunkOf = new Map(); // data module -> its chunk file (relative to dist/)
+const inlined = [];
+for (const path of lazy) {
+    const name = path.slice(path.lastIndexOf('/') + 1, -'.js'.length);
+    const chunk = chunks.find(c => c.startsWith(`${name}-`));
+    if (chunk) chunkOf.set(path, `chunks/${chunk}`);
+    else inlined.push(path);
+}
+
+// Everything main.js pulls in before it runs
+const eager = new Set();
+const queue = ['main.js'];
+while (queue.length) {
+    const file = queue.pop();
+    if (eager.has(file) || !existsSync(join(DIST, file))) continue;
+    eager.add(file);
+    for (const [, spec] of readFileSync(join(DIST, file), 'utf8').matchAll(STATIC_IMPORT)) {
+        if (spec.startsWith('.')) queue.push(posix.normalize(posix.join(posix.dirname(file), spec)));
+    }
+}
+const loadedEagerly = [...chunkOf].filter(([, chunk]) => eager.has(chunk)).map(([path]) => path);
+
+if (inlined.length) console.error(`Not split into chunks (would load at startup): ${inlined.join(', ')}`);
+if (loadedEagerly.length) console.error(`Statically imported from main.js (would load at startup): ${loadedEagerly.join(', ')}`);
+if (inlined.length || loadedEagerly.length) process.exit(1);
+console.log(`${lazy.length} data modules split into lazy chunks.`);
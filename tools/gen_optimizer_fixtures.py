@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Optimizer benchmark fixtures
+============================
+Samples realistic main-city building pools from data/foe_buildings_database.js
+and writes them, with an unlocked area to plan in, as fixed-seed JSON files
+for tools/bench-optimizer.mjs.
+
+Each fixture picks buildings of its era and below (plus All Ages and event
+buildings) by a type mix, so sizes and needsRoad follow the real database
+distribution. The unlocked area is made of 4×4 expansions in one of three
+shapes:
+
+    rect     a near-square block of expansions
+    l        a larger rectangle with one quadrant missing
+    ragged   grown one expansion at a time from the middle, like a real city
+
+and sized to the pool's footprint times a slack factor, leaving room for
+roads.
+
+Usage:
+    python tools/gen_optimizer_fixtures.py                 # default corpus
+    python tools/gen_optimizer_fixtures.py --seed 7 --out /tmp/fixtures
+    python tools/gen_optimizer_fixtures.py --only colonial-l spacehub-l
+
+The same seed and database always give the same files. The corpus is
+committed under tools/fixtures/optimizer so results stay comparable across
+commits even after a database rebuild; regenerate it deliberately.
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+TOOLS = Path(__file__).resolve().parent
+sys.path.insert(0, str(TOOLS))
+
+import build_database as bd  # noqa: E402
+
+ROOT = TOOLS.parent
+DEFAULT_OUT = TOOLS / 'fixtures' / 'optimizer'
+EXPANSION = 4                     # expansions are 4×4 tiles
+TOWNHALL = {'id': 'H_TownHall', 'name': 'Town Hall', 'width': 6, 'height': 6,
+            'type': 'townhall', 'color': '#FFD700', 'needsRoad': 0}
+
+# Share of the pool per building type; unique types are drawn without repeats
+TYPE_MIX = {
+    'residential': 0.26, 'production': 0.12, 'goods': 0.10, 'culture': 0.12,
+    'military': 0.08, 'great': 0.08, 'event': 0.24,
+}
+EVENT_MIX = {
+    'residential': 0.14, 'production': 0.06, 'goods': 0.06, 'culture': 0.06,
+    'military': 0.04, 'great': 0.10, 'event': 0.54,
+}
+UNIQUE_TYPES = {'great'}
+
+# name, era, buildings, shape, type mix, slack (unlocked tiles per footprint tile)
+CORPUS = [
+    ('bronze-rect',        'BronzeAge',        35, 'rect',   TYPE_MIX,  1.8),
+    ('colonial-l',         'ColonialAge',      55, 'l',      TYPE_MIX,  1.7),
+    ('progressive-ragged', 'ProgressiveEra',   70, 'ragged', TYPE_MIX,  1.7),
+    ('contemporary-rect',  'ContemporaryEra',  85, 'rect',   TYPE_MIX,  1.6),
+    ('oceanic-ragged',     'OceanicFuture',   100, 'ragged', TYPE_MIX,  1.6),
+    ('virtual-events',     'VirtualFuture',    90, 'ragged', EVENT_MIX, 1.5),
+    ('spacehub-l',         'SpaceAgeSpaceHub', 120, 'l',     TYPE_MIX,  1.6),
+]
+
+STANDARD_ERAS = [bd.ERA_MAP[e] for e in bd.ERA_ORDER if e not in ('AllAge', 'MultiAge', 'NoAge')]
+
+
+def load_templates(path=ROOT / 'data' / 'foe_buildings_database.js'):
+    """Index entries only: geometry, type, age and needsRoad are all we sample."""
+    return bd.read_js(path)
+
+
+def population(templates, era):
+    """Building ids by type for a city in era: its era and below, plus ageless ones."""
+    allowed = set(STANDARD_ERAS[:STANDARD_ERAS.index(bd.ERA_MAP[era]) + 1])
+    by_type = {}
+    for bid, t in sorted(templates.items()):
+        if t['age'] in STANDARD_ERAS and t['age'] not in allowed:
+            continue
+        by_type.setdefault(t['type'], []).append(bid)
+    return by_type
+
+
+def sample_pool(rng, templates, era, count, mix):
+    """count buildings drawn by type weight, then uniformly within the type."""
+    by_type = population(templates, era)
+    types = [t for t in mix if by_type.get(t)]
+    weights = [mix[t] for t in types]
+    used = set()
+    pool = []
+    while len(pool) < count:
+        kind = rng.choices(types, weights)[0]
+        choices = [b for b in by_type[kind] if kind not in UNIQUE_TYPES or b not in used]
+        if not choices:
+            continue
+        bid = rng.choice(choices)
+        used.add(bid)
+        t = templates[bid]
+        pool.append({'id': bid, 'name': t['name'], 'width': t['width'], 'height': t['height'],
+                     'type': t['type'], 'age': t['age'], 'color': t['color'],
+                     'needsRoad': t['needsRoad']})
+    return pool
+
+
+def expansion_shape(rng, shape, blocks):
+    """At least blocks 4×4 expansions as [bx, by] block coordinates, top-left at 0,0."""
+    if shape == 'rect':
+        w = math.ceil(math.sqrt(blocks))
+        h = math.ceil(blocks / w)
+        cells = [(x, y) for y in range(h) for x in range(w)]
+    elif shape == 'l':
+        # a rectangle a third larger, minus its top-right quadrant
+        w = math.ceil(math.sqrt(blocks * 4 / 3))
+        h = math.ceil(blocks * 4 / 3 / w)
+        cells = [(x, y) for y in range(h) for x in range(w) if not (x >= w // 2 and y < h // 2)]
+    elif shape == 'ragged':
+        cells = [(0, 0)]
+        taken = {(0, 0)}
+        while len(cells) < blocks:
+            x, y = rng.choice(cells)
+            nxt = rng.choice([(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)])
+            if nxt not in taken:
+                taken.add(nxt)
+                cells.append(nxt)
+    else:
+        raise ValueError(f'unknown shape {shape!r}')
+    min_x = min(x for x, _ in cells)
+    min_y = min(y for _, y in cells)
+    return sorted([x - min_x, y - min_y] for x, y in cells)
+
+
+def make_fixture(templates, name, era, count, shape, mix, slack, seed):
+    rng = random.Random(f'{seed}:{name}')
+    pool = sample_pool(rng, templates, era, count, mix)
+    footprint = sum(b['width'] * b['height'] for b in pool) + TOWNHALL['width'] * TOWNHALL['height']
+    blocks = math.ceil(footprint * slack / EXPANSION ** 2)
+    unlocked = expansion_shape(rng, shape, blocks)
+    return {
+        'name': name,
+        'seed': seed,
+        'era': bd.ERA_MAP[era],
+        'shape': shape,
+        'gridWidth': (max(x for x, _ in unlocked) + 1) * EXPANSION,
+        'gridHeight': (max(y for _, y in unlocked) + 1) * EXPANSION,
+        'expansionSize': EXPANSION,
+        'unlocked': unlocked,
+        'townhall': dict(TOWNHALL),
+        'buildings': pool,
+    }
+
+
+def describe(fx):
+    roads = Counter(b['needsRoad'] for b in fx['buildings'])
+    area = sum(b['width'] * b['height'] for b in fx['buildings'])
+    tiles = len(fx['unlocked']) * fx['expansionSize'] ** 2
+    return (f"{fx['name']:<20} {fx['era']:<20} {len(fx['buildings']):>4} buildings "
+            f"({roads[1]} road, {roads[2]} two-lane, {roads[0]} roadless), "
+            f"{fx['gridWidth']}x{fx['gridHeight']} {fx['shape']}, "
+            f"footprint {area / tiles:.0%} of {tiles} tiles")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Write fixed-seed optimizer benchmark fixtures.')
+    ap.add_argument('--out', type=Path, default=DEFAULT_OUT, help=f'output directory (default: {DEFAULT_OUT.relative_to(ROOT)})')
+    ap.add_argument('--seed', type=int, default=1, help='corpus seed (default: 1)')
+    ap.add_argument('--only', nargs='+', metavar='NAME', help='write just these fixtures')
+    args = ap.parse_args(argv)
+
+    names = [c[0] for c in CORPUS]
+    unknown = set(args.only or []) - set(names)
+    if unknown:
+        ap.error(f'unknown fixture(s): {", ".join(sorted(unknown))} (have: {", ".join(names)})')
+
+    templates = load_templates()
+    args.out.mkdir(parents=True, exist_ok=True)
+    for name, era, count, shape, mix, slack in CORPUS:
+        if args.only and name not in args.only:
+            continue
+        fx = make_fixture(templates, name, era, count, shape, mix, slack, args.seed)
+        path = args.out / f'{name}.json'
+        path.write_text(json.dumps(fx, indent=1, ensure_ascii=False) + '\n', encoding='utf-8')
+        print(describe(fx))
+
+
+if __name__ == '__main__':
+    main()
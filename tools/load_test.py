@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Static server load test
+=======================
+Hammers a running planner server with concurrent keep-alive clients and
+reports requests/sec plus latency percentiles.
+
+Usage:
+    # Against an already running server:
+    python tools/load_test.py http://localhost:8080 --clients 32 --duration 10
+
+    # Start the legacy and the pooled server (as subprocesses) and compare them:
+    python tools/load_test.py --compare
+
+    # Add one deliberately slow reader (the "shared host" scenario) so you can
+    # see how much it hurts everybody else:
+    python tools/load_test.py --compare --slow-clients 1
+
+    # Park more idle keep-alive connections than the pool has workers (a few
+    # browser tabs left open) and check the active clients still get served:
+    python tools/load_test.py --compare --threads 4 --idle-clients 24
+
+Paths default to the files a first page load fetches (index.html, the CSS,
+the main module and the big building database); override with --path.
+"""
+
+import argparse
+import http.client
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_PATHS = [
+    '/index.html',
+    '/css/styles.css',
+    '/js/CityPlanner.js',
+    '/data/foe_buildings_database.js',
+]
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[k]
+
+
+def _client(host, port, paths, deadline, keepalive, latencies, errors, lock):
+    conn = None
+    i = 0
+    local = []
+    local_errors = 0
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        if conn is None:
+            conn = http.client.HTTPConnection(host, port, timeout=30)
+        start = time.perf_counter()
+        try:
+            conn.request('GET', path, headers={} if keepalive else {'Connection': 'close'})
+            resp = conn.getresponse()
+            resp.read()
+            local.append(time.perf_counter() - start)
+            if resp.status >= 400:
+                local_errors += 1
+            if not keepalive or resp.will_close:
+                conn.close()
+                conn = None
+        except (OSError, http.client.HTTPException):
+            local_errors += 1
+            if conn is not None:
+                conn.close()
+            conn = None
+    if conn is not None:
+        conn.close()
+    with lock:
+        latencies.extend(local)
+        errors[0] += local_errors
+
+
+def _slow_client(host, port, path, deadline, chunk=4096, delay=0.05):
+    """Request a large file and read it very slowly, holding the connection."""
+    while time.perf_counter() < deadline:
+        try:
+            conn = http.client.HTTPConnection(host, port, timeout=60)
+            conn.request('GET', path, headers={'Connection': 'close'})
+            resp = conn.getresponse()
+            while time.perf_counter() < deadline and resp.read(chunk):
+                time.sleep(delay)
+            conn.close()
+        except (OSError, http.client.HTTPException):
+            time.sleep(delay)
+
+
+def _idle_client(host, port, path, ready, done):
+    """Make one keep-alive request, then hold the connection open without using it."""
+    try:
+        conn = http.client.HTTPConnection(host, port, timeout=60)
+        conn.request('GET', path)
+        conn.getresponse().read()
+    except (OSError, http.client.HTTPException):
+        return
+    finally:
+        ready.release()
+    done.wait()
+    conn.close()
+
+
+def run_load(url, clients=16, duration=5.0, paths=None, keepalive=True, slow_clients=0,
+             idle_clients=0):
+    """Run the load test and return a result dict."""
+    parts = urlsplit(url)
+    host, port = parts.hostname or 'localhost', parts.port or 80
+    paths = paths or DEFAULT_PATHS
+
+    latencies, errors, lock = [], [0], threading.Lock()
+    # Idle connections are all open (one request served each) before timing starts.
+    ready, done = threading.Semaphore(0), threading.Event()
+    for _ in range(idle_clients):
+        threading.Thread(target=_idle_client, args=(host, port, paths[0], ready, done),
+                         daemon=True).start()
+    for _ in range(idle_clients):
+        ready.acquire()
+
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(target=_slow_client, args=(host, port, paths[-1], deadline), daemon=True)
+        for _ in range(slow_clients)
+    ]
+    for t in threads:
+        t.start()
+    # Give the slow readers a head start so they already hold a connection.
+    if slow_clients:
+        time.sleep(0.2)
+
+    started = time.perf_counter()
+    workers = [
+        threading.Thread(target=_client,
+                         args=(host, port, paths, deadline, keepalive, latencies, errors, lock))
+        for _ in range(clients)
+    ]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - started
+    done.set()
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors':   errors[0],
+        'elapsed':  elapsed,
+        'rps':      len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms':   percentile(latencies, 50) * 1000,
+        'p99_ms':   percentile(latencies, 99) * 1000,
+        'max_ms':   (latencies[-1] * 1000) if latencies else 0.0,
+        'mean_ms':  (statistics.fmean(latencies) * 1000) if latencies else 0.0,
+    }
+
+
+def print_result(label, r):
+    print(f'{label:<10} {r["requests"]:>8} req  {r["rps"]:>9.1f} req/s  '
+          f'p50 {r["p50_ms"]:>8.2f} ms  p99 {r["p99_ms"]:>8.2f} ms  '
+          f'max {r["max_ms"]:>8.2f} ms  errors {r["errors"]}')
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _start_server(extra_args):
+    """Launch server.py in a subprocess and wait until it accepts connections."""
+    port = _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, str(ROOT / 'server.py'), '--port', str(port), '--bind', '127.0.0.1',
+         '--directory', str(ROOT), '--quiet', *extra_args],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.perf_counter() + 10
+    while time.perf_counter() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return proc, port
+        except OSError:
+            time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError('server.py did not start listening within 10 s')
+
+
+def compare(args):
+    """Start the legacy and the pooled server as subprocesses and load both.
+
+    Running them out of process keeps the load generator's threads from
+    competing with the server for the GIL.
+    """
+    results = {}
+    for label, extra in (('legacy', ['--legacy']), ('pooled', ['--threads', str(args.threads)])):
+        proc, port = _start_server(extra)
+        try:
+            results[label] = run_load(f'http://127.0.0.1:{port}', clients=args.clients,
+                                      duration=args.duration, paths=args.path,
+                                      slow_clients=args.slow_clients,
+                                      idle_clients=args.idle_clients)
+        finally:
+            proc.send_signal(signal.SIGINT)
+            try:
+                proc.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        print_result(label, results[label])
+
+    old, new = results['legacy'], results['pooled']
+    if old['rps'] and old['p99_ms']:
+        print(f'\nthroughput x{new["rps"] / old["rps"]:.2f}, '
+              f'p99 x{new["p99_ms"] / old["p99_ms"]:.2f} (lower is better)')
+    return results
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Load-test the planner static server.')
+    ap.add_argument('url', nargs='?', default='http://localhost:8080')
+    ap.add_argument('--clients', type=int, default=16, help='concurrent clients (default: 16)')
+    ap.add_argument('--duration', type=float, default=5.0, help='seconds per run (default: 5)')
+    ap.add_argument('--path', action='append', help='request path (repeatable)')
+    ap.add_argument('--no-keepalive', action='store_true', help='one request per connection')
+    ap.add_argument('--slow-clients', type=int, default=0,
+                    help='extra clients that trickle-read the largest file')
+    ap.add_argument('--idle-clients', type=int, default=0,
+                    help='extra keep-alive connections that make one request, then stay idle')
+    ap.add_argument('--compare', action='store_true',
+                    help='start legacy and pooled servers locally and compare them')
+    ap.add_argument('--threads', type=int, default=16, help='pool size for --compare')
+    args = ap.parse_args(argv)
+
+    if args.compare:
+        compare(args)
+        return
+
+    r = run_load(args.url, clients=args.clients, duration=args.duration, paths=args.path,
+                 keepalive=not args.no_keepalive, slow_clients=args.slow_clients,
+                 idle_clients=args.idle_clients)
+    print_result('result', r)
+
+
+if __name__ == '__main__':
+    main()